@@ -21,6 +21,9 @@ __author__ = 'Nathan Woodrow'
 __date__ = 'May 2014'
 __copyright__ = '(C) 2014, Nathan Woodrow'
 
+from qgis.core.additions.importprofiler import start_import_profile as _start_import_profile
+_import_profile = _start_import_profile('qgis._3d')
+
 from PyQt5 import QtCore
 from qgis._3d_p import *
 
@@ -420,3 +423,6 @@ QgsPoint3DSymbol.Model = _Qgis.Point3DShape.Model
 QgsPoint3DSymbol.Model.is_monkey_patched = True
 QgsPoint3DSymbol.Billboard = _Qgis.Point3DShape.Billboard
 QgsPoint3DSymbol.Billboard.is_monkey_patched = True
+
+if _import_profile is not None:
+    _import_profile.finish()
@@ -0,0 +1,118 @@
+# The PEP 484 type hints stub file for the _core._3d module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsPropertyDefinition
+from .pointcloud import QgsPointCloudRenderer
+from .project import QgsProject
+from .vector import QgsPropertyCollection, QgsReadWriteContext, QgsVectorLayer
+
+
+class Qgs3DRendererAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'Qgs3DRendererAbstractMetadata') -> None: ...
+
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsAbstract3DRenderer']: ...
+    def type(self) -> str: ...
+
+
+class Qgs3DRendererRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'Qgs3DRendererRegistry') -> None: ...
+
+    def renderersList(self) -> list[str]: ...
+    def rendererMetadata(self, type: typing.Optional[str]) -> typing.Optional[Qgs3DRendererAbstractMetadata]: ...
+    def removeRenderer(self, type: typing.Optional[str]) -> None: ...
+    def addRenderer(self, metadata: typing.Optional[Qgs3DRendererAbstractMetadata]) -> None: ...
+
+
+class Qgs3DSymbolAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: typing.Optional[str], visibleName: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'Qgs3DSymbolAbstractMetadata') -> None: ...
+
+    def create(self) -> typing.Optional['QgsAbstract3DSymbol']: ...
+    def visibleName(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class Qgs3DSymbolRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def defaultSymbolForGeometryType(self, type: Qgis.GeometryType) -> typing.Optional['QgsAbstract3DSymbol']: ...
+    def createSymbol(self, type: typing.Optional[str]) -> typing.Optional['QgsAbstract3DSymbol']: ...
+    def addSymbolType(self, metadata: typing.Optional[Qgs3DSymbolAbstractMetadata]) -> bool: ...
+    def symbolTypes(self) -> list[str]: ...
+    def symbolMetadata(self, type: typing.Optional[str]) -> typing.Optional[Qgs3DSymbolAbstractMetadata]: ...
+
+
+class QgsAbstract3DSymbol(PyQt5.sip.wrapper):
+
+    class Property(int):
+        Height = ... # type: QgsAbstract3DSymbol.Property
+        ExtrusionHeight = ... # type: QgsAbstract3DSymbol.Property
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstract3DSymbol') -> None: ...
+
+    def copyBaseSettings(self, destination: typing.Optional['QgsAbstract3DSymbol']) -> None: ...
+    def setDefaultPropertiesFromLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    def compatibleGeometryTypes(self) -> list[Qgis.GeometryType]: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsAbstract3DSymbol']: ...
+    def type(self) -> str: ...
+    PropertyHeight: QgsAbstract3DSymbol.Property
+    PropertyExtrusionHeight: QgsAbstract3DSymbol.Property
+
+
+class QgsAbstract3DRenderer(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def resolveReferences(self, project: 'QgsProject') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsAbstract3DRenderer']: ...
+    def type(self) -> str: ...
+
+
+class QgsAbstractPointCloud3DRenderer(QgsAbstract3DRenderer):
+
+    def __init__(self) -> None: ...
+
+    def convertFrom2DRenderer(self, renderer: typing.Optional['QgsPointCloudRenderer']) -> bool: ...
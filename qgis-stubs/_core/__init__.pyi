@@ -0,0 +1,1240 @@
+# The PEP 484 type hints stub file for the _core module.
+#
+# Re-exports the group shards split from _core.pyi by scripts/split_stub_by_group.py.
+
+from ._3d import (
+    Qgs3DRendererAbstractMetadata as Qgs3DRendererAbstractMetadata,
+    Qgs3DRendererRegistry as Qgs3DRendererRegistry,
+    Qgs3DSymbolAbstractMetadata as Qgs3DSymbolAbstractMetadata,
+    Qgs3DSymbolRegistry as Qgs3DSymbolRegistry,
+    QgsAbstract3DRenderer as QgsAbstract3DRenderer,
+    QgsAbstract3DSymbol as QgsAbstract3DSymbol,
+    QgsAbstractPointCloud3DRenderer as QgsAbstractPointCloud3DRenderer,
+)
+from ._ungrouped import (
+    GEOCRS_ID as GEOCRS_ID, GEOSRID as GEOSRID,
+    GEO_EPSG_CRS_ID as GEO_EPSG_CRS_ID, PYQT_OPENGL_ARRAY as PYQT_OPENGL_ARRAY,
+    PYQT_OPENGL_BOUND_ARRAY as PYQT_OPENGL_BOUND_ARRAY,
+    PYQT_SIGNAL as PYQT_SIGNAL, PYQT_SLOT as PYQT_SLOT, Qgis as Qgis,
+    QgsAbstractContentCacheBase as QgsAbstractContentCacheBase,
+    QgsAbstractContentCacheEntry as QgsAbstractContentCacheEntry,
+    QgsAlignRasterData as QgsAlignRasterData,
+    QgsAnimatedIcon as QgsAnimatedIcon, QgsArchive as QgsArchive,
+    QgsAttributeTableConfig as QgsAttributeTableConfig,
+    QgsBlockingProcess as QgsBlockingProcess,
+    QgsColorBrewerColorRamp as QgsColorBrewerColorRamp,
+    QgsColorRamp as QgsColorRamp, QgsColorScheme as QgsColorScheme,
+    QgsColorSchemeRegistry as QgsColorSchemeRegistry,
+    QgsCommandLineUtils as QgsCommandLineUtils,
+    QgsCptCityColorRamp as QgsCptCityColorRamp,
+    QgsCredentials as QgsCredentials,
+    QgsCredentialsConsole as QgsCredentialsConsole,
+    QgsCredentialsNone as QgsCredentialsNone,
+    QgsCustomColorScheme as QgsCustomColorScheme,
+    QgsDartMeasurement as QgsDartMeasurement,
+    QgsDataProviderElevationProperties as QgsDataProviderElevationProperties,
+    QgsDataProviderTemporalCapabilities as QgsDataProviderTemporalCapabilities,
+    QgsDatabaseFilterProxyModel as QgsDatabaseFilterProxyModel,
+    QgsDatabaseQueryLog as QgsDatabaseQueryLog,
+    QgsDatabaseQueryLogEntry as QgsDatabaseQueryLogEntry,
+    QgsDateRange as QgsDateRange, QgsDateTimeRange as QgsDateTimeRange,
+    QgsDateTimeStatisticalSummary as QgsDateTimeStatisticalSummary,
+    QgsDefaultValue as QgsDefaultValue,
+    QgsDiagramInterpolationSettings as QgsDiagramInterpolationSettings,
+    QgsDoubleRange as QgsDoubleRange,
+    QgsEditorWidgetSetup as QgsEditorWidgetSetup,
+    QgsElevationMap as QgsElevationMap, QgsError as QgsError,
+    QgsErrorMessage as QgsErrorMessage, QgsFeedback as QgsFeedback,
+    QgsField as QgsField, QgsFieldConstraints as QgsFieldConstraints,
+    QgsFields as QgsFields, QgsFileFilterGenerator as QgsFileFilterGenerator,
+    QgsFileUtils as QgsFileUtils, QgsFontUtils as QgsFontUtils,
+    QgsGmlFeatureClass as QgsGmlFeatureClass, QgsGmlSchema as QgsGmlSchema,
+    QgsGplColorScheme as QgsGplColorScheme,
+    QgsGradientColorRamp as QgsGradientColorRamp,
+    QgsGradientStop as QgsGradientStop, QgsHstoreUtils as QgsHstoreUtils,
+    QgsHtmlUtils as QgsHtmlUtils, QgsIdentifyContext as QgsIdentifyContext,
+    QgsImageCache as QgsImageCache, QgsIntRange as QgsIntRange,
+    QgsInterval as QgsInterval,
+    QgsLimitedRandomColorRamp as QgsLimitedRandomColorRamp,
+    QgsLocalizedDataPathRegistry as QgsLocalizedDataPathRegistry,
+    QgsLogger as QgsLogger, QgsMapLayerDependency as QgsMapLayerDependency,
+    QgsMargins as QgsMargins, QgsMaskRenderSettings as QgsMaskRenderSettings,
+    QgsMatrix4x4 as QgsMatrix4x4, QgsMessageLog as QgsMessageLog,
+    QgsMessageLogConsole as QgsMessageLogConsole,
+    QgsMessageLogNotifyBlocker as QgsMessageLogNotifyBlocker,
+    QgsMessageOutput as QgsMessageOutput,
+    QgsMessageOutputConsole as QgsMessageOutputConsole,
+    QgsMultiPointXY as QgsMultiPointXY, QgsMultiPolygonXY as QgsMultiPolygonXY,
+    QgsMultiPolylineXY as QgsMultiPolylineXY,
+    QgsObjectCustomProperties as QgsObjectCustomProperties,
+    QgsOfflineEditing as QgsOfflineEditing, QgsPathResolver as QgsPathResolver,
+    QgsPointSequence as QgsPointSequence, QgsPolygonXY as QgsPolygonXY,
+    QgsPolyline as QgsPolyline, QgsPolylineXY as QgsPolylineXY,
+    QgsPostgresStringUtils as QgsPostgresStringUtils,
+    QgsPresetSchemeColorRamp as QgsPresetSchemeColorRamp,
+    QgsProjectArchive as QgsProjectArchive,
+    QgsProjectColorScheme as QgsProjectColorScheme,
+    QgsPropertyDefinition as QgsPropertyDefinition,
+    QgsProviderConnectionModel as QgsProviderConnectionModel,
+    QgsPythonRunner as QgsPythonRunner,
+    QgsRandomColorRamp as QgsRandomColorRamp,
+    QgsRangedoubleBase as QgsRangedoubleBase,
+    QgsRangeintBase as QgsRangeintBase,
+    QgsReadWriteLocker as QgsReadWriteLocker,
+    QgsRecentColorScheme as QgsRecentColorScheme,
+    QgsRunProcess as QgsRunProcess, QgsRuntimeProfiler as QgsRuntimeProfiler,
+    QgsSQLStatement as QgsSQLStatement,
+    QgsSQLStatementFragment as QgsSQLStatementFragment,
+    QgsScaleUtils as QgsScaleUtils, QgsScopeLogger as QgsScopeLogger,
+    QgsScopedProxyProgressTask as QgsScopedProxyProgressTask,
+    QgsScopedRuntimeProfile as QgsScopedRuntimeProfile,
+    QgsSelectionContext as QgsSelectionContext,
+    QgsSingleItemModel as QgsSingleItemModel, QgsSipUtils as QgsSipUtils,
+    QgsSldExportContext as QgsSldExportContext,
+    QgsSourceCache as QgsSourceCache, QgsSqliteUtils as QgsSqliteUtils,
+    QgsStatisticalSummary as QgsStatisticalSummary,
+    QgsStoredExpression as QgsStoredExpression,
+    QgsStoredExpressionManager as QgsStoredExpressionManager,
+    QgsStringReplacement as QgsStringReplacement,
+    QgsStringReplacementCollection as QgsStringReplacementCollection,
+    QgsStringStatisticalSummary as QgsStringStatisticalSummary,
+    QgsStringUtils as QgsStringUtils,
+    QgsTemporalController as QgsTemporalController,
+    QgsTemporalProperty as QgsTemporalProperty,
+    QgsTemporalRangeObject as QgsTemporalRangeObject,
+    QgsTileRange as QgsTileRange, QgsTileXYZ as QgsTileXYZ,
+    QgsUnitTypes as QgsUnitTypes,
+    QgsUnsetAttributeValue as QgsUnsetAttributeValue,
+    QgsUserColorScheme as QgsUserColorScheme, QgsUserProfile as QgsUserProfile,
+    QgsUserProfileManager as QgsUserProfileManager,
+    QgsVariantUtils as QgsVariantUtils, QgsVector as QgsVector,
+    QgsVector3D as QgsVector3D,
+    QgsVectorSimplifyMethod as QgsVectorSimplifyMethod,
+    QgsVirtualLayerDefinition as QgsVirtualLayerDefinition,
+    QgsZipUtils as QgsZipUtils, compareWkt as compareWkt, qHash as qHash,
+    qgsDoubleNear as qgsDoubleNear, qgsDoubleNearSig as qgsDoubleNearSig,
+    qgsDoubleToString as qgsDoubleToString, qgsFloatNear as qgsFloatNear,
+    qgsNanCompatibleEquals as qgsNanCompatibleEquals,
+    qgsPermissiveToDouble as qgsPermissiveToDouble,
+    qgsPermissiveToInt as qgsPermissiveToInt,
+    qgsPermissiveToLongLong as qgsPermissiveToLongLong, qgsRound as qgsRound,
+    qgsVariantCompare as qgsVariantCompare, qgsVariantEqual as qgsVariantEqual,
+    qgsVariantGreaterThan as qgsVariantGreaterThan,
+    qgsVariantLessThan as qgsVariantLessThan, qgsVsiPrefix as qgsVsiPrefix,
+    stringToSymbolLayerReferenceList as stringToSymbolLayerReferenceList,
+    symbolLayerReferenceListToString as symbolLayerReferenceListToString,
+)
+from .actions import (
+    QgsAction as QgsAction, QgsActionManager as QgsActionManager,
+    QgsActionScope as QgsActionScope,
+    QgsActionScopeRegistry as QgsActionScopeRegistry,
+)
+from .annotations import (
+
+    QgsAbstractAnnotationItemEditOperation as QgsAbstractAnnotationItemEditOperation,
+    QgsAnnotation as QgsAnnotation, QgsAnnotationItem as QgsAnnotationItem,
+    QgsAnnotationItemAbstractMetadata as QgsAnnotationItemAbstractMetadata,
+    QgsAnnotationItemEditContext as QgsAnnotationItemEditContext,
+    QgsAnnotationItemEditOperationAddNode as QgsAnnotationItemEditOperationAddNode,
+    QgsAnnotationItemEditOperationDeleteNode as QgsAnnotationItemEditOperationDeleteNode,
+    QgsAnnotationItemEditOperationMoveNode as QgsAnnotationItemEditOperationMoveNode,
+    QgsAnnotationItemEditOperationTransientResults as QgsAnnotationItemEditOperationTransientResults,
+    QgsAnnotationItemEditOperationTranslateItem as QgsAnnotationItemEditOperationTranslateItem,
+    QgsAnnotationItemNode as QgsAnnotationItemNode,
+    QgsAnnotationItemRegistry as QgsAnnotationItemRegistry,
+    QgsAnnotationLayer as QgsAnnotationLayer,
+    QgsAnnotationLineItem as QgsAnnotationLineItem,
+    QgsAnnotationLineTextItem as QgsAnnotationLineTextItem,
+    QgsAnnotationManager as QgsAnnotationManager,
+    QgsAnnotationMarkerItem as QgsAnnotationMarkerItem,
+    QgsAnnotationPictureItem as QgsAnnotationPictureItem,
+    QgsAnnotationPointTextItem as QgsAnnotationPointTextItem,
+    QgsAnnotationPolygonItem as QgsAnnotationPolygonItem,
+    QgsAnnotationRectItem as QgsAnnotationRectItem,
+    QgsAnnotationRectangleTextItem as QgsAnnotationRectangleTextItem,
+    QgsHtmlAnnotation as QgsHtmlAnnotation,
+    QgsRenderedAnnotationItemDetails as QgsRenderedAnnotationItemDetails,
+    QgsRenderedItemDetails as QgsRenderedItemDetails,
+    QgsRenderedLayerStatistics as QgsRenderedLayerStatistics,
+    QgsSvgAnnotation as QgsSvgAnnotation,
+    QgsTextAnnotation as QgsTextAnnotation,
+)
+from .auth import (
+    QgsAuthCertUtils as QgsAuthCertUtils,
+    QgsAuthConfigSslServer as QgsAuthConfigSslServer,
+    QgsAuthConfigurationStorage as QgsAuthConfigurationStorage,
+    QgsAuthConfigurationStorageDb as QgsAuthConfigurationStorageDb,
+    QgsAuthConfigurationStorageRegistry as QgsAuthConfigurationStorageRegistry,
+    QgsAuthManager as QgsAuthManager, QgsAuthMethod as QgsAuthMethod,
+    QgsAuthMethodConfig as QgsAuthMethodConfig, QgsPkiBundle as QgsPkiBundle,
+    QgsPkiConfigBundle as QgsPkiConfigBundle,
+)
+from .browser import (
+    QgsBrowserModel as QgsBrowserModel,
+    QgsBrowserProxyModel as QgsBrowserProxyModel,
+    QgsConnectionsRootItem as QgsConnectionsRootItem,
+    QgsDataCollectionItem as QgsDataCollectionItem, QgsDataItem as QgsDataItem,
+    QgsDataItemProvider as QgsDataItemProvider,
+    QgsDataItemProviderRegistry as QgsDataItemProviderRegistry,
+    QgsDatabaseSchemaItem as QgsDatabaseSchemaItem,
+    QgsDirectoryItem as QgsDirectoryItem,
+    QgsDirectoryParamWidget as QgsDirectoryParamWidget,
+    QgsErrorItem as QgsErrorItem, QgsFavoritesItem as QgsFavoritesItem,
+    QgsFieldDomainItem as QgsFieldDomainItem,
+    QgsFieldDomainsItem as QgsFieldDomainsItem, QgsFieldItem as QgsFieldItem,
+    QgsFieldsItem as QgsFieldsItem, QgsLayerItem as QgsLayerItem,
+    QgsMimeDataUtils as QgsMimeDataUtils, QgsProjectItem as QgsProjectItem,
+    QgsRelationshipItem as QgsRelationshipItem,
+    QgsRelationshipsItem as QgsRelationshipsItem,
+    QgsWeakRelation as QgsWeakRelation, QgsZipItem as QgsZipItem,
+)
+from .callouts import (
+    QgsBalloonCallout as QgsBalloonCallout, QgsCallout as QgsCallout,
+    QgsCalloutAbstractMetadata as QgsCalloutAbstractMetadata,
+    QgsCalloutMetadata as QgsCalloutMetadata,
+    QgsCalloutRegistry as QgsCalloutRegistry,
+    QgsCurvedLineCallout as QgsCurvedLineCallout,
+    QgsManhattanLineCallout as QgsManhattanLineCallout,
+    QgsSimpleLineCallout as QgsSimpleLineCallout,
+)
+from .classification import (
+    QgsClassificationCustom as QgsClassificationCustom,
+    QgsClassificationEqualInterval as QgsClassificationEqualInterval,
+    QgsClassificationFixedInterval as QgsClassificationFixedInterval,
+    QgsClassificationJenks as QgsClassificationJenks,
+    QgsClassificationLogarithmic as QgsClassificationLogarithmic,
+    QgsClassificationMethod as QgsClassificationMethod,
+    QgsClassificationMethodRegistry as QgsClassificationMethodRegistry,
+    QgsClassificationPrettyBreaks as QgsClassificationPrettyBreaks,
+    QgsClassificationQuantile as QgsClassificationQuantile,
+    QgsClassificationRange as QgsClassificationRange,
+    QgsClassificationStandardDeviation as QgsClassificationStandardDeviation,
+)
+from .diagram import (
+    QgsDiagram as QgsDiagram, QgsDiagramSettings as QgsDiagramSettings,
+    QgsHistogramDiagram as QgsHistogramDiagram,
+    QgsMapUnitScale as QgsMapUnitScale, QgsPieDiagram as QgsPieDiagram,
+    QgsStackedBarDiagram as QgsStackedBarDiagram,
+    QgsStackedDiagram as QgsStackedDiagram, QgsTextDiagram as QgsTextDiagram,
+)
+from .dxf import (
+    QgsDxfExport as QgsDxfExport,
+    QgsElevationShadingRenderer as QgsElevationShadingRenderer,
+    QgsLabelBlockingRegion as QgsLabelBlockingRegion,
+    QgsLayoutChecker as QgsLayoutChecker, QgsMapHitTest as QgsMapHitTest,
+    QgsMapSettings as QgsMapSettings, QgsMapToPixel as QgsMapToPixel,
+    QgsMultiRenderChecker as QgsMultiRenderChecker,
+    QgsRenderChecker as QgsRenderChecker,
+    QgsRenderedFeatureHandlerInterface as QgsRenderedFeatureHandlerInterface,
+)
+from .editform import (
+    QgsAttributeEditorAction as QgsAttributeEditorAction,
+    QgsAttributeEditorContainer as QgsAttributeEditorContainer,
+    QgsAttributeEditorElement as QgsAttributeEditorElement,
+    QgsAttributeEditorField as QgsAttributeEditorField,
+    QgsAttributeEditorHtmlElement as QgsAttributeEditorHtmlElement,
+    QgsAttributeEditorQmlElement as QgsAttributeEditorQmlElement,
+    QgsAttributeEditorRelation as QgsAttributeEditorRelation,
+    QgsAttributeEditorSpacerElement as QgsAttributeEditorSpacerElement,
+    QgsAttributeEditorTextElement as QgsAttributeEditorTextElement,
+    QgsEditFormConfig as QgsEditFormConfig,
+    QgsOptionalExpression as QgsOptionalExpression,
+    QgsOptionalQgsExpressionBase as QgsOptionalQgsExpressionBase,
+    QgsRelationManager as QgsRelationManager,
+)
+from .effects import (
+    QgsBlurEffect as QgsBlurEffect, QgsColorEffect as QgsColorEffect,
+    QgsDrawSourceEffect as QgsDrawSourceEffect,
+    QgsDropShadowEffect as QgsDropShadowEffect,
+    QgsEffectPainter as QgsEffectPainter, QgsEffectStack as QgsEffectStack,
+    QgsGlowEffect as QgsGlowEffect, QgsImageOperation as QgsImageOperation,
+    QgsInnerGlowEffect as QgsInnerGlowEffect,
+    QgsInnerShadowEffect as QgsInnerShadowEffect,
+    QgsOuterGlowEffect as QgsOuterGlowEffect, QgsPaintEffect as QgsPaintEffect,
+    QgsPaintEffectAbstractMetadata as QgsPaintEffectAbstractMetadata,
+    QgsPaintEffectRegistry as QgsPaintEffectRegistry,
+    QgsShadowEffect as QgsShadowEffect,
+    QgsTransformEffect as QgsTransformEffect,
+)
+from .elevation import (
+    QgsAbstractProfileGenerator as QgsAbstractProfileGenerator,
+    QgsAbstractProfileResults as QgsAbstractProfileResults,
+    QgsAbstractProfileSource as QgsAbstractProfileSource,
+    QgsAbstractTerrainProvider as QgsAbstractTerrainProvider,
+    QgsCopyFileTask as QgsCopyFileTask,
+    QgsFlatTerrainProvider as QgsFlatTerrainProvider,
+    QgsMapHitTestTask as QgsMapHitTestTask,
+    QgsMeshTerrainProvider as QgsMeshTerrainProvider,
+    QgsProfileExporter as QgsProfileExporter,
+    QgsProfileExporterTask as QgsProfileExporterTask,
+    QgsProfileGenerationContext as QgsProfileGenerationContext,
+    QgsProfileIdentifyContext as QgsProfileIdentifyContext,
+    QgsProfileIdentifyResults as QgsProfileIdentifyResults,
+    QgsProfilePlotRenderer as QgsProfilePlotRenderer,
+    QgsProfilePoint as QgsProfilePoint,
+    QgsProfileRenderContext as QgsProfileRenderContext,
+    QgsProfileRequest as QgsProfileRequest,
+    QgsProfileSnapContext as QgsProfileSnapContext,
+    QgsProfileSnapResult as QgsProfileSnapResult,
+    QgsProfileSourceRegistry as QgsProfileSourceRegistry,
+    QgsProxyProgressTask as QgsProxyProgressTask,
+    QgsRasterDemTerrainProvider as QgsRasterDemTerrainProvider,
+    QgsTask as QgsTask, QgsTaskWithSerialSubTasks as QgsTaskWithSerialSubTasks,
+    QgsVectorFileWriterTask as QgsVectorFileWriterTask,
+    QgsVirtualLayerTask as QgsVirtualLayerTask,
+)
+from .expression import (
+    QgsCadUtils as QgsCadUtils, QgsDistanceArea as QgsDistanceArea,
+    QgsExpression as QgsExpression,
+    QgsExpressionContextUtils as QgsExpressionContextUtils,
+    QgsExpressionFieldBuffer as QgsExpressionFieldBuffer,
+    QgsExpressionFunction as QgsExpressionFunction,
+    QgsExpressionNode as QgsExpressionNode,
+    QgsExpressionNodeBetweenOperator as QgsExpressionNodeBetweenOperator,
+    QgsExpressionNodeBinaryOperator as QgsExpressionNodeBinaryOperator,
+    QgsExpressionNodeColumnRef as QgsExpressionNodeColumnRef,
+    QgsExpressionNodeCondition as QgsExpressionNodeCondition,
+    QgsExpressionNodeFunction as QgsExpressionNodeFunction,
+    QgsExpressionNodeInOperator as QgsExpressionNodeInOperator,
+    QgsExpressionNodeIndexOperator as QgsExpressionNodeIndexOperator,
+    QgsExpressionNodeLiteral as QgsExpressionNodeLiteral,
+    QgsExpressionNodeUnaryOperator as QgsExpressionNodeUnaryOperator,
+    QgsPointLocator as QgsPointLocator,
+    QgsScopedExpressionFunction as QgsScopedExpressionFunction,
+    QgsSnappingUtils as QgsSnappingUtils,
+)
+from .externalstorage import (
+    QgsExternalStorage as QgsExternalStorage,
+    QgsExternalStorageContent as QgsExternalStorageContent,
+    QgsExternalStorageFetchedContent as QgsExternalStorageFetchedContent,
+    QgsExternalStorageRegistry as QgsExternalStorageRegistry,
+    QgsExternalStorageStoredContent as QgsExternalStorageStoredContent,
+)
+from .fieldformatter import (
+    QgsCheckBoxFieldFormatter as QgsCheckBoxFieldFormatter,
+    QgsDateTimeFieldFormatter as QgsDateTimeFieldFormatter,
+    QgsFallbackFieldFormatter as QgsFallbackFieldFormatter,
+    QgsFieldFormatter as QgsFieldFormatter,
+    QgsFieldFormatterContext as QgsFieldFormatterContext,
+    QgsKeyValueFieldFormatter as QgsKeyValueFieldFormatter,
+    QgsListFieldFormatter as QgsListFieldFormatter,
+    QgsRangeFieldFormatter as QgsRangeFieldFormatter,
+    QgsRelationReferenceFieldFormatter as QgsRelationReferenceFieldFormatter,
+    QgsValueMapFieldFormatter as QgsValueMapFieldFormatter,
+    QgsValueRelationFieldFormatter as QgsValueRelationFieldFormatter,
+)
+from .geocoding import (
+    QgsAbstractGeocoderLocatorFilter as QgsAbstractGeocoderLocatorFilter,
+    QgsGeocoderContext as QgsGeocoderContext,
+    QgsGeocoderInterface as QgsGeocoderInterface,
+    QgsGeocoderResult as QgsGeocoderResult,
+    QgsGoogleMapsGeocoder as QgsGoogleMapsGeocoder,
+    QgsNominatimGeocoder as QgsNominatimGeocoder,
+)
+from .geometry import (
+    QgsAbstractGeometry as QgsAbstractGeometry,
+    QgsAbstractGeometrySimplifier as QgsAbstractGeometrySimplifier,
+    QgsAbstractGeometryTransformer as QgsAbstractGeometryTransformer,
+    QgsBox3D as QgsBox3D, QgsCircle as QgsCircle,
+    QgsCircularString as QgsCircularString, QgsClipper as QgsClipper,
+    QgsCompoundCurve as QgsCompoundCurve, QgsConstWkbPtr as QgsConstWkbPtr,
+    QgsCurve as QgsCurve, QgsCurvePolygon as QgsCurvePolygon,
+    QgsEllipse as QgsEllipse, QgsGeometry as QgsGeometry,
+    QgsGeometryCollection as QgsGeometryCollection,
+    QgsGeometryConstPartIterator as QgsGeometryConstPartIterator,
+    QgsGeometryEngine as QgsGeometryEngine,
+    QgsGeometryParameters as QgsGeometryParameters,
+    QgsGeometryPartIterator as QgsGeometryPartIterator,
+    QgsGeometryUtils as QgsGeometryUtils,
+    QgsGeometryUtilsBase as QgsGeometryUtilsBase,
+    QgsGeometryValidator as QgsGeometryValidator, QgsGeos as QgsGeos,
+    QgsJsonUtils as QgsJsonUtils, QgsLineSegment2D as QgsLineSegment2D,
+    QgsLineString as QgsLineString, QgsMapSettingsUtils as QgsMapSettingsUtils,
+    QgsMapToPixelSimplifier as QgsMapToPixelSimplifier,
+    QgsMultiCurve as QgsMultiCurve, QgsMultiLineString as QgsMultiLineString,
+    QgsMultiPoint as QgsMultiPoint, QgsMultiPolygon as QgsMultiPolygon,
+    QgsMultiSurface as QgsMultiSurface, QgsOrientedBox3D as QgsOrientedBox3D,
+    QgsPoint as QgsPoint, QgsPolygon as QgsPolygon,
+    QgsPolyhedralSurface as QgsPolyhedralSurface,
+    QgsQuadrilateral as QgsQuadrilateral, QgsRay3D as QgsRay3D,
+    QgsRectangle as QgsRectangle,
+    QgsReferencedGeometry as QgsReferencedGeometry,
+    QgsReferencedGeometryBase as QgsReferencedGeometryBase,
+    QgsReferencedPointXY as QgsReferencedPointXY,
+    QgsReferencedRectangle as QgsReferencedRectangle,
+    QgsRegularPolygon as QgsRegularPolygon,
+    QgsScaleCalculator as QgsScaleCalculator, QgsSphere as QgsSphere,
+    QgsSurface as QgsSurface, QgsTessellator as QgsTessellator,
+    QgsTopologyPreservingSimplifier as QgsTopologyPreservingSimplifier,
+    QgsTriangle as QgsTriangle,
+    QgsTriangulatedSurface as QgsTriangulatedSurface,
+    QgsVertexId as QgsVertexId, QgsVertexIterator as QgsVertexIterator,
+    QgsWkbPtr as QgsWkbPtr, QgsWkbTypes as QgsWkbTypes,
+    QgsXmlUtils as QgsXmlUtils,
+)
+from .gps import (
+    QgsAbstractBabelFormat as QgsAbstractBabelFormat,
+    QgsBabelFormatRegistry as QgsBabelFormatRegistry,
+    QgsBabelGpsDeviceFormat as QgsBabelGpsDeviceFormat,
+    QgsBabelSimpleImportFormat as QgsBabelSimpleImportFormat,
+    QgsGpsConnection as QgsGpsConnection,
+    QgsGpsConnectionRegistry as QgsGpsConnectionRegistry,
+    QgsGpsDetector as QgsGpsDetector, QgsGpsInformation as QgsGpsInformation,
+    QgsGpsLogger as QgsGpsLogger, QgsGpsdConnection as QgsGpsdConnection,
+    QgsNmeaConnection as QgsNmeaConnection,
+    QgsQtLocationConnection as QgsQtLocationConnection,
+    QgsSatelliteInfo as QgsSatelliteInfo,
+    QgsVectorLayerGpsLogger as QgsVectorLayerGpsLogger,
+)
+from .labeling import (
+    QgsAbstractLabelingEngineRule as QgsAbstractLabelingEngineRule,
+    QgsAbstractLabelingEngineRuleDistanceFromFeature as QgsAbstractLabelingEngineRuleDistanceFromFeature,
+    QgsAbstractVectorLayerLabeling as QgsAbstractVectorLayerLabeling,
+    QgsCalloutPosition as QgsCalloutPosition,
+    QgsLabelCandidate as QgsLabelCandidate,
+    QgsLabelLineSettings as QgsLabelLineSettings,
+    QgsLabelObstacleSettings as QgsLabelObstacleSettings,
+    QgsLabelPlacementSettings as QgsLabelPlacementSettings,
+    QgsLabelPointSettings as QgsLabelPointSettings,
+    QgsLabelPosition as QgsLabelPosition,
+    QgsLabelSearchTree as QgsLabelSearchTree,
+    QgsLabelThinningSettings as QgsLabelThinningSettings,
+    QgsLabeling as QgsLabeling,
+    QgsLabelingEngineContext as QgsLabelingEngineContext,
+    QgsLabelingEngineRuleAvoidLabelOverlapWithFeature as QgsLabelingEngineRuleAvoidLabelOverlapWithFeature,
+    QgsLabelingEngineRuleMaximumDistanceLabelToFeature as QgsLabelingEngineRuleMaximumDistanceLabelToFeature,
+    QgsLabelingEngineRuleMinimumDistanceLabelToFeature as QgsLabelingEngineRuleMinimumDistanceLabelToFeature,
+    QgsLabelingEngineRuleMinimumDistanceLabelToLabel as QgsLabelingEngineRuleMinimumDistanceLabelToLabel,
+    QgsLabelingEngineRuleRegistry as QgsLabelingEngineRuleRegistry,
+    QgsLabelingEngineSettings as QgsLabelingEngineSettings,
+    QgsLabelingResults as QgsLabelingResults, QgsPalLabeling as QgsPalLabeling,
+    QgsPalLayerSettings as QgsPalLayerSettings,
+    QgsRuleBasedLabeling as QgsRuleBasedLabeling,
+    QgsScreenProperties as QgsScreenProperties,
+    QgsVectorLayerSimpleLabeling as QgsVectorLayerSimpleLabeling,
+)
+from .layertree import (
+    QgsColorRampLegendNode as QgsColorRampLegendNode,
+    QgsColorRampLegendNodeSettings as QgsColorRampLegendNodeSettings,
+    QgsColorRampTransformer as QgsColorRampTransformer,
+    QgsCurveTransform as QgsCurveTransform,
+    QgsDataDefinedSizeLegend as QgsDataDefinedSizeLegend,
+    QgsDataDefinedSizeLegendNode as QgsDataDefinedSizeLegendNode,
+    QgsGenericNumericTransformer as QgsGenericNumericTransformer,
+    QgsImageLegendNode as QgsImageLegendNode, QgsLayerTree as QgsLayerTree,
+    QgsLayerTreeFilterProxyModel as QgsLayerTreeFilterProxyModel,
+    QgsLayerTreeFilterSettings as QgsLayerTreeFilterSettings,
+    QgsLayerTreeGroup as QgsLayerTreeGroup,
+    QgsLayerTreeLayer as QgsLayerTreeLayer,
+    QgsLayerTreeModel as QgsLayerTreeModel,
+    QgsLayerTreeModelLegendNode as QgsLayerTreeModelLegendNode,
+    QgsLayerTreeNode as QgsLayerTreeNode,
+    QgsLayerTreeRegistryBridge as QgsLayerTreeRegistryBridge,
+    QgsLayerTreeUtils as QgsLayerTreeUtils,
+    QgsLegendPatchShape as QgsLegendPatchShape,
+    QgsLegendRenderer as QgsLegendRenderer,
+    QgsLegendSettings as QgsLegendSettings, QgsLegendStyle as QgsLegendStyle,
+    QgsMapLayerLegendUtils as QgsMapLayerLegendUtils,
+    QgsProperty as QgsProperty,
+    QgsPropertyTransformer as QgsPropertyTransformer,
+    QgsRasterSymbolLegendNode as QgsRasterSymbolLegendNode,
+    QgsSimpleLegendNode as QgsSimpleLegendNode,
+    QgsSizeScaleTransformer as QgsSizeScaleTransformer,
+    QgsSymbolLegendNode as QgsSymbolLegendNode,
+    QgsVectorLabelLegendNode as QgsVectorLabelLegendNode,
+    QgsWmsLegendNode as QgsWmsLegendNode,
+)
+from .layout import (
+    QgsAbstractLayoutIterator as QgsAbstractLayoutIterator,
+    QgsAbstractLayoutUndoCommand as QgsAbstractLayoutUndoCommand,
+    QgsAbstractReportSection as QgsAbstractReportSection,
+    QgsConditionalStyle as QgsConditionalStyle,
+    QgsFeatureFilterProvider as QgsFeatureFilterProvider,
+    QgsLayout as QgsLayout, QgsLayoutAligner as QgsLayoutAligner,
+    QgsLayoutAtlas as QgsLayoutAtlas, QgsLayoutEffect as QgsLayoutEffect,
+    QgsLayoutExporter as QgsLayoutExporter, QgsLayoutFrame as QgsLayoutFrame,
+    QgsLayoutGridSettings as QgsLayoutGridSettings,
+    QgsLayoutGuide as QgsLayoutGuide,
+    QgsLayoutGuideCollection as QgsLayoutGuideCollection,
+    QgsLayoutGuideProxyModel as QgsLayoutGuideProxyModel,
+    QgsLayoutItem as QgsLayoutItem,
+    QgsLayoutItemAbstractMetadata as QgsLayoutItemAbstractMetadata,
+    QgsLayoutItemAttributeTable as QgsLayoutItemAttributeTable,
+    QgsLayoutItemElevationProfile as QgsLayoutItemElevationProfile,
+    QgsLayoutItemGroup as QgsLayoutItemGroup,
+    QgsLayoutItemHtml as QgsLayoutItemHtml,
+    QgsLayoutItemLabel as QgsLayoutItemLabel,
+    QgsLayoutItemLegend as QgsLayoutItemLegend,
+    QgsLayoutItemManualTable as QgsLayoutItemManualTable,
+    QgsLayoutItemMap as QgsLayoutItemMap,
+    QgsLayoutItemMapAtlasClippingSettings as QgsLayoutItemMapAtlasClippingSettings,
+    QgsLayoutItemMapGrid as QgsLayoutItemMapGrid,
+    QgsLayoutItemMapGridStack as QgsLayoutItemMapGridStack,
+    QgsLayoutItemMapItem as QgsLayoutItemMapItem,
+    QgsLayoutItemMapItemClipPathSettings as QgsLayoutItemMapItemClipPathSettings,
+    QgsLayoutItemMapItemStack as QgsLayoutItemMapItemStack,
+    QgsLayoutItemMapOverview as QgsLayoutItemMapOverview,
+    QgsLayoutItemMapOverviewStack as QgsLayoutItemMapOverviewStack,
+    QgsLayoutItemMarker as QgsLayoutItemMarker,
+    QgsLayoutItemPage as QgsLayoutItemPage,
+    QgsLayoutItemPicture as QgsLayoutItemPicture,
+    QgsLayoutItemPolygon as QgsLayoutItemPolygon,
+    QgsLayoutItemPolyline as QgsLayoutItemPolyline,
+    QgsLayoutItemRegistry as QgsLayoutItemRegistry,
+    QgsLayoutItemRenderContext as QgsLayoutItemRenderContext,
+    QgsLayoutItemScaleBar as QgsLayoutItemScaleBar,
+    QgsLayoutItemShape as QgsLayoutItemShape,
+    QgsLayoutItemTextTable as QgsLayoutItemTextTable,
+    QgsLayoutManager as QgsLayoutManager,
+    QgsLayoutManagerModel as QgsLayoutManagerModel,
+    QgsLayoutManagerProxyModel as QgsLayoutManagerProxyModel,
+    QgsLayoutMeasurement as QgsLayoutMeasurement,
+    QgsLayoutMeasurementConverter as QgsLayoutMeasurementConverter,
+    QgsLayoutModel as QgsLayoutModel,
+    QgsLayoutMultiFrame as QgsLayoutMultiFrame,
+    QgsLayoutMultiFrameAbstractMetadata as QgsLayoutMultiFrameAbstractMetadata,
+    QgsLayoutNodesItem as QgsLayoutNodesItem,
+    QgsLayoutNorthArrowHandler as QgsLayoutNorthArrowHandler,
+    QgsLayoutObject as QgsLayoutObject,
+    QgsLayoutPageCollection as QgsLayoutPageCollection,
+    QgsLayoutPoint as QgsLayoutPoint,
+    QgsLayoutProxyModel as QgsLayoutProxyModel,
+    QgsLayoutRenderContext as QgsLayoutRenderContext,
+    QgsLayoutReportContext as QgsLayoutReportContext,
+    QgsLayoutSerializableObject as QgsLayoutSerializableObject,
+    QgsLayoutSize as QgsLayoutSize, QgsLayoutSnapper as QgsLayoutSnapper,
+    QgsLayoutTable as QgsLayoutTable,
+    QgsLayoutTableColumn as QgsLayoutTableColumn,
+    QgsLayoutTableStyle as QgsLayoutTableStyle,
+    QgsLayoutUndoObjectInterface as QgsLayoutUndoObjectInterface,
+    QgsLayoutUndoStack as QgsLayoutUndoStack, QgsLayoutUtils as QgsLayoutUtils,
+    QgsLegendModel as QgsLegendModel,
+    QgsMapClippingRegion as QgsMapClippingRegion,
+    QgsMapClippingUtils as QgsMapClippingUtils,
+    QgsMasterLayoutInterface as QgsMasterLayoutInterface,
+    QgsPageSize as QgsPageSize, QgsPageSizeRegistry as QgsPageSizeRegistry,
+    QgsPrintLayout as QgsPrintLayout, QgsReport as QgsReport,
+    QgsReportSectionContext as QgsReportSectionContext,
+    QgsReportSectionFieldGroup as QgsReportSectionFieldGroup,
+    QgsReportSectionLayout as QgsReportSectionLayout,
+)
+from .locator import (
+    QgsLocator as QgsLocator,
+    QgsLocatorAutomaticModel as QgsLocatorAutomaticModel,
+    QgsLocatorContext as QgsLocatorContext,
+    QgsLocatorFilter as QgsLocatorFilter, QgsLocatorModel as QgsLocatorModel,
+    QgsLocatorModelBridge as QgsLocatorModelBridge,
+    QgsLocatorProxyModel as QgsLocatorProxyModel,
+    QgsLocatorResult as QgsLocatorResult,
+)
+from .maprenderer import (
+    QgsMapDecoration as QgsMapDecoration,
+    QgsMapRendererAbstractCustomPainterJob as QgsMapRendererAbstractCustomPainterJob,
+    QgsMapRendererCache as QgsMapRendererCache,
+    QgsMapRendererCustomPainterJob as QgsMapRendererCustomPainterJob,
+    QgsMapRendererJob as QgsMapRendererJob,
+    QgsMapRendererParallelJob as QgsMapRendererParallelJob,
+    QgsMapRendererQImageJob as QgsMapRendererQImageJob,
+    QgsMapRendererSequentialJob as QgsMapRendererSequentialJob,
+    QgsMapRendererTask as QgsMapRendererTask,
+    QgsRenderedItemResults as QgsRenderedItemResults,
+    QgsTemporalUtils as QgsTemporalUtils,
+)
+from .mesh import (
+    QgsAbstractMeshLayerLabeling as QgsAbstractMeshLayerLabeling,
+    QgsMesh as QgsMesh, QgsMesh3DAveragingMethod as QgsMesh3DAveragingMethod,
+    QgsMesh3DDataBlock as QgsMesh3DDataBlock,
+    QgsMeshAdvancedEditing as QgsMeshAdvancedEditing,
+    QgsMeshCalculator as QgsMeshCalculator,
+    QgsMeshDataBlock as QgsMeshDataBlock,
+    QgsMeshDataProvider as QgsMeshDataProvider,
+    QgsMeshDataProviderTemporalCapabilities as QgsMeshDataProviderTemporalCapabilities,
+    QgsMeshDataSourceInterface as QgsMeshDataSourceInterface,
+    QgsMeshDataset as QgsMeshDataset,
+    QgsMeshDatasetGroup as QgsMeshDatasetGroup,
+    QgsMeshDatasetGroupMetadata as QgsMeshDatasetGroupMetadata,
+    QgsMeshDatasetGroupTreeItem as QgsMeshDatasetGroupTreeItem,
+    QgsMeshDatasetIndex as QgsMeshDatasetIndex,
+    QgsMeshDatasetMetadata as QgsMeshDatasetMetadata,
+    QgsMeshDatasetSourceInterface as QgsMeshDatasetSourceInterface,
+    QgsMeshDatasetValue as QgsMeshDatasetValue,
+    QgsMeshEditForceByLine as QgsMeshEditForceByLine,
+    QgsMeshEditForceByPolylines as QgsMeshEditForceByPolylines,
+    QgsMeshEditRefineFaces as QgsMeshEditRefineFaces,
+    QgsMeshEditingError as QgsMeshEditingError, QgsMeshEditor as QgsMeshEditor,
+    QgsMeshElevationAveragingMethod as QgsMeshElevationAveragingMethod,
+    QgsMeshLayer as QgsMeshLayer,
+    QgsMeshLayerElevationProperties as QgsMeshLayerElevationProperties,
+    QgsMeshLayerSimpleLabeling as QgsMeshLayerSimpleLabeling,
+    QgsMeshLayerTemporalProperties as QgsMeshLayerTemporalProperties,
+    QgsMeshMultiLevelsAveragingMethod as QgsMeshMultiLevelsAveragingMethod,
+    QgsMeshRelativeHeightAveragingMethod as QgsMeshRelativeHeightAveragingMethod,
+    QgsMeshRendererMeshSettings as QgsMeshRendererMeshSettings,
+    QgsMeshRendererScalarSettings as QgsMeshRendererScalarSettings,
+    QgsMeshRendererSettings as QgsMeshRendererSettings,
+    QgsMeshRendererVectorArrowSettings as QgsMeshRendererVectorArrowSettings,
+    QgsMeshRendererVectorSettings as QgsMeshRendererVectorSettings,
+    QgsMeshRendererVectorStreamlineSettings as QgsMeshRendererVectorStreamlineSettings,
+    QgsMeshRendererVectorTracesSettings as QgsMeshRendererVectorTracesSettings,
+    QgsMeshRendererVectorWindBarbSettings as QgsMeshRendererVectorWindBarbSettings,
+    QgsMeshSigmaAveragingMethod as QgsMeshSigmaAveragingMethod,
+    QgsMeshSpatialIndex as QgsMeshSpatialIndex,
+    QgsMeshTimeSettings as QgsMeshTimeSettings,
+    QgsMeshTransformVerticesByExpression as QgsMeshTransformVerticesByExpression,
+    QgsMeshUtils as QgsMeshUtils,
+    QgsMeshVectorTraceAnimationGenerator as QgsMeshVectorTraceAnimationGenerator,
+    QgsTopologicalMesh as QgsTopologicalMesh,
+)
+from .metadata import (
+    QgsAbstractLayerMetadataProvider as QgsAbstractLayerMetadataProvider,
+    QgsAbstractMetadataBase as QgsAbstractMetadataBase,
+    QgsAbstractMetadataBaseValidator as QgsAbstractMetadataBaseValidator,
+    QgsLayerMetadata as QgsLayerMetadata,
+    QgsLayerMetadataFormatter as QgsLayerMetadataFormatter,
+    QgsLayerMetadataProviderRegistry as QgsLayerMetadataProviderRegistry,
+    QgsLayerMetadataProviderResult as QgsLayerMetadataProviderResult,
+    QgsLayerMetadataSearchResults as QgsLayerMetadataSearchResults,
+    QgsMetadataSearchContext as QgsMetadataSearchContext,
+    QgsMetadataUtils as QgsMetadataUtils,
+    QgsNativeMetadataBaseValidator as QgsNativeMetadataBaseValidator,
+    QgsNativeMetadataValidator as QgsNativeMetadataValidator,
+    QgsNativeProjectMetadataValidator as QgsNativeProjectMetadataValidator,
+    QgsProjectMetadata as QgsProjectMetadata,
+)
+from .network import (
+    QgsBlockingNetworkRequest as QgsBlockingNetworkRequest,
+    QgsFetchedContent as QgsFetchedContent,
+    QgsFileDownloader as QgsFileDownloader, QgsHttpHeaders as QgsHttpHeaders,
+    QgsNetworkAccessManager as QgsNetworkAccessManager,
+    QgsNetworkContentFetcher as QgsNetworkContentFetcher,
+    QgsNetworkContentFetcherRegistry as QgsNetworkContentFetcherRegistry,
+    QgsNetworkContentFetcherTask as QgsNetworkContentFetcherTask,
+    QgsNetworkReplyContent as QgsNetworkReplyContent,
+    QgsNetworkRequestParameters as QgsNetworkRequestParameters,
+    QgsNewsFeedModel as QgsNewsFeedModel,
+    QgsNewsFeedParser as QgsNewsFeedParser,
+    QgsNewsFeedProxyModel as QgsNewsFeedProxyModel,
+)
+from .numericformats import (
+    QgsBasicNumericFormat as QgsBasicNumericFormat,
+    QgsBearingNumericFormat as QgsBearingNumericFormat,
+    QgsCurrencyNumericFormat as QgsCurrencyNumericFormat,
+    QgsExpressionBasedNumericFormat as QgsExpressionBasedNumericFormat,
+    QgsFallbackNumericFormat as QgsFallbackNumericFormat,
+    QgsFractionNumericFormat as QgsFractionNumericFormat,
+    QgsGeographicCoordinateNumericFormat as QgsGeographicCoordinateNumericFormat,
+    QgsLocalDefaultSettings as QgsLocalDefaultSettings,
+    QgsNumericFormat as QgsNumericFormat,
+    QgsNumericFormatContext as QgsNumericFormatContext,
+    QgsNumericFormatRegistry as QgsNumericFormatRegistry,
+    QgsPercentageNumericFormat as QgsPercentageNumericFormat,
+    QgsScientificNumericFormat as QgsScientificNumericFormat,
+)
+from .painting import (
+    QgsGeometryPaintDevice as QgsGeometryPaintDevice,
+    QgsMaskPaintDevice as QgsMaskPaintDevice,
+    QgsNullPaintDevice as QgsNullPaintDevice,
+    QgsPaintEngineHack as QgsPaintEngineHack, QgsPainting as QgsPainting,
+)
+from .pdf import QgsPdfRenderer as QgsPdfRenderer
+from .plot import (
+    Qgs2DPlot as Qgs2DPlot, QgsPlot as QgsPlot, QgsPlotAxis as QgsPlotAxis,
+    QgsPlotDefaultSettings as QgsPlotDefaultSettings,
+)
+from .pointcloud import (
+    QgsPointCloudAttribute as QgsPointCloudAttribute,
+    QgsPointCloudAttributeByRampRenderer as QgsPointCloudAttributeByRampRenderer,
+    QgsPointCloudAttributeCollection as QgsPointCloudAttributeCollection,
+    QgsPointCloudAttributeModel as QgsPointCloudAttributeModel,
+    QgsPointCloudAttributeProxyModel as QgsPointCloudAttributeProxyModel,
+    QgsPointCloudAttributeStatistics as QgsPointCloudAttributeStatistics,
+    QgsPointCloudBlock as QgsPointCloudBlock,
+    QgsPointCloudCategory as QgsPointCloudCategory,
+    QgsPointCloudClassifiedRenderer as QgsPointCloudClassifiedRenderer,
+    QgsPointCloudDataProvider as QgsPointCloudDataProvider,
+    QgsPointCloudExtentRenderer as QgsPointCloudExtentRenderer,
+    QgsPointCloudIndex as QgsPointCloudIndex,
+    QgsPointCloudLayer as QgsPointCloudLayer,
+    QgsPointCloudLayerElevationProperties as QgsPointCloudLayerElevationProperties,
+    QgsPointCloudLayerExporter as QgsPointCloudLayerExporter,
+    QgsPointCloudLayerExporterTask as QgsPointCloudLayerExporterTask,
+    QgsPointCloudNode as QgsPointCloudNode,
+    QgsPointCloudNodeId as QgsPointCloudNodeId,
+    QgsPointCloudRenderContext as QgsPointCloudRenderContext,
+    QgsPointCloudRenderer as QgsPointCloudRenderer,
+    QgsPointCloudRendererAbstractMetadata as QgsPointCloudRendererAbstractMetadata,
+    QgsPointCloudRendererMetadata as QgsPointCloudRendererMetadata,
+    QgsPointCloudRendererRegistry as QgsPointCloudRendererRegistry,
+    QgsPointCloudRgbRenderer as QgsPointCloudRgbRenderer,
+    QgsPointCloudStatistics as QgsPointCloudStatistics,
+    QgsVectorFileWriter as QgsVectorFileWriter,
+)
+from .processing import (
+    QgsProcessing as QgsProcessing,
+    QgsProcessingAlgRunnerTask as QgsProcessingAlgRunnerTask,
+    QgsProcessingAlgorithm as QgsProcessingAlgorithm,
+    QgsProcessingAlgorithmInformation as QgsProcessingAlgorithmInformation,
+    QgsProcessingBatchFeedback as QgsProcessingBatchFeedback,
+    QgsProcessingContext as QgsProcessingContext,
+    QgsProcessingDestinationParameter as QgsProcessingDestinationParameter,
+    QgsProcessingFeatureBasedAlgorithm as QgsProcessingFeatureBasedAlgorithm,
+    QgsProcessingFeatureSource as QgsProcessingFeatureSource,
+    QgsProcessingFeatureSourceDefinition as QgsProcessingFeatureSourceDefinition,
+    QgsProcessingFeedback as QgsProcessingFeedback,
+    QgsProcessingLayerPostProcessorInterface as QgsProcessingLayerPostProcessorInterface,
+    QgsProcessingModelAlgorithm as QgsProcessingModelAlgorithm,
+    QgsProcessingModelChildAlgorithm as QgsProcessingModelChildAlgorithm,
+    QgsProcessingModelChildAlgorithmResult as QgsProcessingModelChildAlgorithmResult,
+    QgsProcessingModelChildDependency as QgsProcessingModelChildDependency,
+    QgsProcessingModelChildParameterSource as QgsProcessingModelChildParameterSource,
+    QgsProcessingModelComment as QgsProcessingModelComment,
+    QgsProcessingModelComponent as QgsProcessingModelComponent,
+    QgsProcessingModelGroupBox as QgsProcessingModelGroupBox,
+    QgsProcessingModelOutput as QgsProcessingModelOutput,
+    QgsProcessingModelParameter as QgsProcessingModelParameter,
+    QgsProcessingModelResult as QgsProcessingModelResult,
+    QgsProcessingMultiStepFeedback as QgsProcessingMultiStepFeedback,
+    QgsProcessingOutputBoolean as QgsProcessingOutputBoolean,
+    QgsProcessingOutputConditionalBranch as QgsProcessingOutputConditionalBranch,
+    QgsProcessingOutputDefinition as QgsProcessingOutputDefinition,
+    QgsProcessingOutputFile as QgsProcessingOutputFile,
+    QgsProcessingOutputFolder as QgsProcessingOutputFolder,
+    QgsProcessingOutputHtml as QgsProcessingOutputHtml,
+    QgsProcessingOutputLayerDefinition as QgsProcessingOutputLayerDefinition,
+    QgsProcessingOutputMapLayer as QgsProcessingOutputMapLayer,
+    QgsProcessingOutputMultipleLayers as QgsProcessingOutputMultipleLayers,
+    QgsProcessingOutputNumber as QgsProcessingOutputNumber,
+    QgsProcessingOutputPointCloudLayer as QgsProcessingOutputPointCloudLayer,
+    QgsProcessingOutputRasterLayer as QgsProcessingOutputRasterLayer,
+    QgsProcessingOutputString as QgsProcessingOutputString,
+    QgsProcessingOutputVariant as QgsProcessingOutputVariant,
+    QgsProcessingOutputVectorLayer as QgsProcessingOutputVectorLayer,
+    QgsProcessingOutputVectorTileLayer as QgsProcessingOutputVectorTileLayer,
+    QgsProcessingParameterAggregate as QgsProcessingParameterAggregate,
+    QgsProcessingParameterAlignRasterLayers as QgsProcessingParameterAlignRasterLayers,
+    QgsProcessingParameterAnnotationLayer as QgsProcessingParameterAnnotationLayer,
+    QgsProcessingParameterArea as QgsProcessingParameterArea,
+    QgsProcessingParameterAuthConfig as QgsProcessingParameterAuthConfig,
+    QgsProcessingParameterBand as QgsProcessingParameterBand,
+    QgsProcessingParameterBoolean as QgsProcessingParameterBoolean,
+    QgsProcessingParameterColor as QgsProcessingParameterColor,
+    QgsProcessingParameterCoordinateOperation as QgsProcessingParameterCoordinateOperation,
+    QgsProcessingParameterCrs as QgsProcessingParameterCrs,
+    QgsProcessingParameterDatabaseSchema as QgsProcessingParameterDatabaseSchema,
+    QgsProcessingParameterDatabaseTable as QgsProcessingParameterDatabaseTable,
+    QgsProcessingParameterDateTime as QgsProcessingParameterDateTime,
+    QgsProcessingParameterDefinition as QgsProcessingParameterDefinition,
+    QgsProcessingParameterDistance as QgsProcessingParameterDistance,
+    QgsProcessingParameterDuration as QgsProcessingParameterDuration,
+    QgsProcessingParameterDxfLayers as QgsProcessingParameterDxfLayers,
+    QgsProcessingParameterEnum as QgsProcessingParameterEnum,
+    QgsProcessingParameterExpression as QgsProcessingParameterExpression,
+    QgsProcessingParameterExtent as QgsProcessingParameterExtent,
+    QgsProcessingParameterFeatureSink as QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource as QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterField as QgsProcessingParameterField,
+    QgsProcessingParameterFieldMapping as QgsProcessingParameterFieldMapping,
+    QgsProcessingParameterFile as QgsProcessingParameterFile,
+    QgsProcessingParameterFileDestination as QgsProcessingParameterFileDestination,
+    QgsProcessingParameterFolderDestination as QgsProcessingParameterFolderDestination,
+    QgsProcessingParameterGeometry as QgsProcessingParameterGeometry,
+    QgsProcessingParameterLayout as QgsProcessingParameterLayout,
+    QgsProcessingParameterLayoutItem as QgsProcessingParameterLayoutItem,
+    QgsProcessingParameterLimitedDataTypes as QgsProcessingParameterLimitedDataTypes,
+    QgsProcessingParameterMapLayer as QgsProcessingParameterMapLayer,
+    QgsProcessingParameterMapTheme as QgsProcessingParameterMapTheme,
+    QgsProcessingParameterMatrix as QgsProcessingParameterMatrix,
+    QgsProcessingParameterMeshDatasetGroups as QgsProcessingParameterMeshDatasetGroups,
+    QgsProcessingParameterMeshDatasetTime as QgsProcessingParameterMeshDatasetTime,
+    QgsProcessingParameterMeshLayer as QgsProcessingParameterMeshLayer,
+    QgsProcessingParameterMultipleLayers as QgsProcessingParameterMultipleLayers,
+    QgsProcessingParameterNumber as QgsProcessingParameterNumber,
+    QgsProcessingParameterPoint as QgsProcessingParameterPoint,
+    QgsProcessingParameterPointCloudAttribute as QgsProcessingParameterPointCloudAttribute,
+    QgsProcessingParameterPointCloudDestination as QgsProcessingParameterPointCloudDestination,
+    QgsProcessingParameterPointCloudLayer as QgsProcessingParameterPointCloudLayer,
+    QgsProcessingParameterProviderConnection as QgsProcessingParameterProviderConnection,
+    QgsProcessingParameterRange as QgsProcessingParameterRange,
+    QgsProcessingParameterRasterDestination as QgsProcessingParameterRasterDestination,
+    QgsProcessingParameterRasterLayer as QgsProcessingParameterRasterLayer,
+    QgsProcessingParameterScale as QgsProcessingParameterScale,
+    QgsProcessingParameterString as QgsProcessingParameterString,
+    QgsProcessingParameterTinInputLayers as QgsProcessingParameterTinInputLayers,
+    QgsProcessingParameterType as QgsProcessingParameterType,
+    QgsProcessingParameterVectorDestination as QgsProcessingParameterVectorDestination,
+    QgsProcessingParameterVectorLayer as QgsProcessingParameterVectorLayer,
+    QgsProcessingParameterVectorTileDestination as QgsProcessingParameterVectorTileDestination,
+    QgsProcessingParameterVectorTileWriterLayers as QgsProcessingParameterVectorTileWriterLayers,
+    QgsProcessingParameterVolume as QgsProcessingParameterVolume,
+    QgsProcessingParameters as QgsProcessingParameters,
+    QgsProcessingProvider as QgsProcessingProvider,
+    QgsProcessingRegistry as QgsProcessingRegistry,
+    QgsProcessingUtils as QgsProcessingUtils,
+    QgsRemappingSinkDefinition as QgsRemappingSinkDefinition,
+)
+from .proj import (
+    QgsBearingUtils as QgsBearingUtils, QgsCelestialBody as QgsCelestialBody,
+    QgsCoordinateReferenceSystem as QgsCoordinateReferenceSystem,
+    QgsCoordinateReferenceSystemRegistry as QgsCoordinateReferenceSystemRegistry,
+    QgsCoordinateReferenceSystemUtils as QgsCoordinateReferenceSystemUtils,
+    QgsCoordinateTransform as QgsCoordinateTransform,
+    QgsCoordinateTransformContext as QgsCoordinateTransformContext,
+    QgsDatumEnsemble as QgsDatumEnsemble,
+    QgsDatumEnsembleMember as QgsDatumEnsembleMember,
+    QgsDatumTransform as QgsDatumTransform,
+    QgsEllipsoidUtils as QgsEllipsoidUtils, QgsGml as QgsGml,
+    QgsMapLayerFactory as QgsMapLayerFactory,
+    QgsProjOperation as QgsProjOperation, QgsProjUtils as QgsProjUtils,
+    QgsProjectionFactors as QgsProjectionFactors,
+)
+from .project import (
+    QgsApplication as QgsApplication, QgsBookmark as QgsBookmark,
+    QgsBookmarkManager as QgsBookmarkManager,
+    QgsBookmarkManagerModel as QgsBookmarkManagerModel,
+    QgsBookmarkManagerProxyModel as QgsBookmarkManagerProxyModel,
+    QgsConnectionRegistry as QgsConnectionRegistry,
+    QgsFieldFormatterRegistry as QgsFieldFormatterRegistry,
+    QgsMapLayerModel as QgsMapLayerModel,
+    QgsMapThemeCollection as QgsMapThemeCollection,
+    QgsMapViewsManager as QgsMapViewsManager,
+    QgsPluginLayerRegistry as QgsPluginLayerRegistry,
+    QgsPluginLayerType as QgsPluginLayerType, QgsProject as QgsProject,
+    QgsProjectBadLayerHandler as QgsProjectBadLayerHandler,
+    QgsProjectDirtyBlocker as QgsProjectDirtyBlocker,
+    QgsProjectDisplaySettings as QgsProjectDisplaySettings,
+    QgsProjectElevationProperties as QgsProjectElevationProperties,
+    QgsProjectFileTransform as QgsProjectFileTransform,
+    QgsProjectGpsSettings as QgsProjectGpsSettings,
+    QgsProjectProperty as QgsProjectProperty,
+    QgsProjectPropertyKey as QgsProjectPropertyKey,
+    QgsProjectPropertyValue as QgsProjectPropertyValue,
+    QgsProjectServerValidator as QgsProjectServerValidator,
+    QgsProjectStorage as QgsProjectStorage,
+    QgsProjectStorageRegistry as QgsProjectStorageRegistry,
+    QgsProjectStyleDatabaseModel as QgsProjectStyleDatabaseModel,
+    QgsProjectStyleDatabaseProxyModel as QgsProjectStyleDatabaseProxyModel,
+    QgsProjectStyleSettings as QgsProjectStyleSettings,
+    QgsProjectTimeSettings as QgsProjectTimeSettings,
+    QgsProjectTranslator as QgsProjectTranslator,
+    QgsProjectUtils as QgsProjectUtils, QgsProjectVersion as QgsProjectVersion,
+    QgsProjectViewSettings as QgsProjectViewSettings,
+    QgsRecentStyleHandler as QgsRecentStyleHandler,
+    QgsSnappingConfig as QgsSnappingConfig, QgsTaskManager as QgsTaskManager,
+    QgsTransactionGroup as QgsTransactionGroup,
+    QgsTranslationContext as QgsTranslationContext,
+)
+from .providers import (
+
+    QgsAbstractDatabaseProviderConnection as QgsAbstractDatabaseProviderConnection,
+    QgsAbstractDbTableModel as QgsAbstractDbTableModel,
+    QgsAbstractProviderConnection as QgsAbstractProviderConnection,
+    QgsArcGisPortalUtils as QgsArcGisPortalUtils,
+    QgsArcGisRestContext as QgsArcGisRestContext,
+    QgsArcGisRestUtils as QgsArcGisRestUtils,
+    QgsDataProvider as QgsDataProvider,
+    QgsDatabaseSchemaModel as QgsDatabaseSchemaModel,
+    QgsDatabaseTableModel as QgsDatabaseTableModel,
+    QgsMemoryProviderUtils as QgsMemoryProviderUtils,
+    QgsMeshDriverMetadata as QgsMeshDriverMetadata,
+    QgsProviderMetadata as QgsProviderMetadata,
+    QgsProviderRegistry as QgsProviderRegistry,
+    QgsProviderSqlQueryBuilder as QgsProviderSqlQueryBuilder,
+    QgsProviderSublayerDetails as QgsProviderSublayerDetails,
+    QgsProviderSublayerModel as QgsProviderSublayerModel,
+    QgsProviderSublayerProxyModel as QgsProviderSublayerProxyModel,
+    QgsProviderSublayerTask as QgsProviderSublayerTask,
+    QgsProviderUtils as QgsProviderUtils,
+    QgsQueryResultModel as QgsQueryResultModel,
+    QgsSensorThingsExpansionDefinition as QgsSensorThingsExpansionDefinition,
+    QgsSensorThingsUtils as QgsSensorThingsUtils,
+    QgsTransaction as QgsTransaction,
+)
+from .raster import (
+    QgsAbstractRasterLayerLabeling as QgsAbstractRasterLayerLabeling,
+    QgsBilinearRasterResampler as QgsBilinearRasterResampler,
+    QgsBrightnessContrastFilter as QgsBrightnessContrastFilter,
+    QgsClipToMinMaxEnhancement as QgsClipToMinMaxEnhancement,
+    QgsColorRampShader as QgsColorRampShader,
+    QgsContrastEnhancement as QgsContrastEnhancement,
+    QgsContrastEnhancementFunction as QgsContrastEnhancementFunction,
+    QgsCubicRasterResampler as QgsCubicRasterResampler,
+    QgsExifTools as QgsExifTools, QgsHillshadeRenderer as QgsHillshadeRenderer,
+    QgsHueSaturationFilter as QgsHueSaturationFilter,
+    QgsImageFetcher as QgsImageFetcher,
+    QgsLinearMinMaxEnhancement as QgsLinearMinMaxEnhancement,
+    QgsLinearMinMaxEnhancementWithClip as QgsLinearMinMaxEnhancementWithClip,
+    QgsMultiBandColorRenderer as QgsMultiBandColorRenderer,
+    QgsPalettedRasterRenderer as QgsPalettedRasterRenderer,
+    QgsRaster as QgsRaster, QgsRasterAttributeTable as QgsRasterAttributeTable,
+    QgsRasterBandStats as QgsRasterBandStats, QgsRasterBlock as QgsRasterBlock,
+    QgsRasterBlockFeedback as QgsRasterBlockFeedback,
+    QgsRasterChecker as QgsRasterChecker,
+    QgsRasterContourRenderer as QgsRasterContourRenderer,
+    QgsRasterDataProvider as QgsRasterDataProvider,
+    QgsRasterDataProviderElevationProperties as QgsRasterDataProviderElevationProperties,
+    QgsRasterDataProviderTemporalCapabilities as QgsRasterDataProviderTemporalCapabilities,
+    QgsRasterDrawer as QgsRasterDrawer,
+    QgsRasterFileWriter as QgsRasterFileWriter,
+    QgsRasterFileWriterTask as QgsRasterFileWriterTask,
+    QgsRasterHistogram as QgsRasterHistogram,
+    QgsRasterIdentifyResult as QgsRasterIdentifyResult,
+    QgsRasterInterface as QgsRasterInterface,
+    QgsRasterIterator as QgsRasterIterator, QgsRasterLayer as QgsRasterLayer,
+    QgsRasterLayerElevationProperties as QgsRasterLayerElevationProperties,
+    QgsRasterLayerSimpleLabeling as QgsRasterLayerSimpleLabeling,
+    QgsRasterLayerTemporalProperties as QgsRasterLayerTemporalProperties,
+    QgsRasterLayerUtils as QgsRasterLayerUtils,
+    QgsRasterMinMaxOrigin as QgsRasterMinMaxOrigin,
+    QgsRasterNuller as QgsRasterNuller, QgsRasterPipe as QgsRasterPipe,
+    QgsRasterProjector as QgsRasterProjector,
+    QgsRasterPyramid as QgsRasterPyramid, QgsRasterRange as QgsRasterRange,
+    QgsRasterRenderer as QgsRasterRenderer,
+    QgsRasterRendererRegistry as QgsRasterRendererRegistry,
+    QgsRasterRendererUtils as QgsRasterRendererUtils,
+    QgsRasterResampleFilter as QgsRasterResampleFilter,
+    QgsRasterResampler as QgsRasterResampler,
+    QgsRasterResamplerV2 as QgsRasterResamplerV2,
+    QgsRasterShader as QgsRasterShader,
+    QgsRasterShaderFunction as QgsRasterShaderFunction,
+    QgsRasterSingleColorRenderer as QgsRasterSingleColorRenderer,
+    QgsRasterTransparency as QgsRasterTransparency,
+    QgsRasterViewPort as QgsRasterViewPort,
+    QgsSingleBandColorDataRenderer as QgsSingleBandColorDataRenderer,
+    QgsSingleBandGrayRenderer as QgsSingleBandGrayRenderer,
+    QgsSingleBandPseudoColorRenderer as QgsSingleBandPseudoColorRenderer,
+)
+from .scalebar import (
+    QgsDoubleBoxScaleBarRenderer as QgsDoubleBoxScaleBarRenderer,
+    QgsHollowScaleBarRenderer as QgsHollowScaleBarRenderer,
+    QgsNumericScaleBarRenderer as QgsNumericScaleBarRenderer,
+    QgsScaleBarRenderer as QgsScaleBarRenderer,
+    QgsScaleBarRendererRegistry as QgsScaleBarRendererRegistry,
+    QgsScaleBarSettings as QgsScaleBarSettings,
+    QgsSingleBoxScaleBarRenderer as QgsSingleBoxScaleBarRenderer,
+    QgsSteppedLineScaleBarRenderer as QgsSteppedLineScaleBarRenderer,
+    QgsTicksScaleBarRenderer as QgsTicksScaleBarRenderer,
+)
+from .sensor import (
+    QgsAbstractSensor as QgsAbstractSensor,
+    QgsIODeviceSensor as QgsIODeviceSensor,
+    QgsSensorAbstractMetadata as QgsSensorAbstractMetadata,
+    QgsSensorManager as QgsSensorManager, QgsSensorModel as QgsSensorModel,
+    QgsSensorRegistry as QgsSensorRegistry,
+    QgsSerialPortSensor as QgsSerialPortSensor,
+    QgsTcpSocketSensor as QgsTcpSocketSensor,
+    QgsUdpSocketSensor as QgsUdpSocketSensor,
+)
+from .settings import (
+    QgsSettings as QgsSettings, QgsSettingsEntryBase as QgsSettingsEntryBase,
+    QgsSettingsEntryBaseTemplateQColorBase as QgsSettingsEntryBaseTemplateQColorBase,
+    QgsSettingsEntryBaseTemplateQStringBase as QgsSettingsEntryBaseTemplateQStringBase,
+    QgsSettingsEntryBaseTemplateQStringListBase as QgsSettingsEntryBaseTemplateQStringListBase,
+    QgsSettingsEntryBaseTemplateQVariantBase as QgsSettingsEntryBaseTemplateQVariantBase,
+    QgsSettingsEntryBaseTemplateQVariantMapBase as QgsSettingsEntryBaseTemplateQVariantMapBase,
+    QgsSettingsEntryBaseTemplateboolBase as QgsSettingsEntryBaseTemplateboolBase,
+    QgsSettingsEntryBaseTemplatedoubleBase as QgsSettingsEntryBaseTemplatedoubleBase,
+    QgsSettingsEntryBaseTemplateintBase as QgsSettingsEntryBaseTemplateintBase,
+    QgsSettingsEntryBool as QgsSettingsEntryBool,
+    QgsSettingsEntryColor as QgsSettingsEntryColor,
+    QgsSettingsEntryDouble as QgsSettingsEntryDouble,
+    QgsSettingsEntryGroup as QgsSettingsEntryGroup,
+    QgsSettingsEntryInteger as QgsSettingsEntryInteger,
+    QgsSettingsEntryString as QgsSettingsEntryString,
+    QgsSettingsEntryStringList as QgsSettingsEntryStringList,
+    QgsSettingsEntryVariant as QgsSettingsEntryVariant,
+    QgsSettingsEntryVariantMap as QgsSettingsEntryVariantMap,
+    QgsSettingsRegistry as QgsSettingsRegistry,
+    QgsSettingsRegistryCore as QgsSettingsRegistryCore,
+    QgsSettingsTree as QgsSettingsTree,
+    QgsSettingsTreeNamedListNode as QgsSettingsTreeNamedListNode,
+    QgsSettingsTreeNode as QgsSettingsTreeNode,
+)
+from .stac import (
+    QgsStacAsset as QgsStacAsset, QgsStacCatalog as QgsStacCatalog,
+    QgsStacCollection as QgsStacCollection,
+    QgsStacCollectionList as QgsStacCollectionList,
+    QgsStacConnection as QgsStacConnection,
+    QgsStacController as QgsStacController, QgsStacExtent as QgsStacExtent,
+    QgsStacItem as QgsStacItem, QgsStacItemCollection as QgsStacItemCollection,
+    QgsStacLink as QgsStacLink, QgsStacObject as QgsStacObject,
+    QgsStacParser as QgsStacParser, QgsStacProvider as QgsStacProvider,
+)
+from .symbology import (
+    Qgs25DRenderer as Qgs25DRenderer,
+    QgsAbstractBrushedLineSymbolLayer as QgsAbstractBrushedLineSymbolLayer,
+    QgsAnimatedMarkerSymbolLayer as QgsAnimatedMarkerSymbolLayer,
+    QgsArrowSymbolLayer as QgsArrowSymbolLayer,
+    QgsCategorizedSymbolRenderer as QgsCategorizedSymbolRenderer,
+    QgsCentroidFillSymbolLayer as QgsCentroidFillSymbolLayer,
+    QgsColorBrewerPalette as QgsColorBrewerPalette,
+    QgsCombinedStyleModel as QgsCombinedStyleModel,
+    QgsCptCityAllRampsItem as QgsCptCityAllRampsItem,
+    QgsCptCityArchive as QgsCptCityArchive,
+    QgsCptCityBrowserModel as QgsCptCityBrowserModel,
+    QgsCptCityCollectionItem as QgsCptCityCollectionItem,
+    QgsCptCityColorRampItem as QgsCptCityColorRampItem,
+    QgsCptCityDataItem as QgsCptCityDataItem,
+    QgsCptCityDirectoryItem as QgsCptCityDirectoryItem,
+    QgsCptCitySelectionItem as QgsCptCitySelectionItem,
+    QgsEllipseSymbolLayer as QgsEllipseSymbolLayer,
+    QgsEmbeddedSymbolRenderer as QgsEmbeddedSymbolRenderer,
+    QgsFeatureRenderer as QgsFeatureRenderer,
+    QgsFeatureRendererGenerator as QgsFeatureRendererGenerator,
+    QgsFillSymbol as QgsFillSymbol, QgsFillSymbolLayer as QgsFillSymbolLayer,
+    QgsFilledLineSymbolLayer as QgsFilledLineSymbolLayer,
+    QgsFilledMarkerSymbolLayer as QgsFilledMarkerSymbolLayer,
+    QgsFontMarkerSymbolLayer as QgsFontMarkerSymbolLayer,
+    QgsGeometryGeneratorSymbolLayer as QgsGeometryGeneratorSymbolLayer,
+    QgsGradientFillSymbolLayer as QgsGradientFillSymbolLayer,
+    QgsGraduatedSymbolRenderer as QgsGraduatedSymbolRenderer,
+    QgsHashedLineSymbolLayer as QgsHashedLineSymbolLayer,
+    QgsHeatmapRenderer as QgsHeatmapRenderer,
+    QgsImageFillSymbolLayer as QgsImageFillSymbolLayer,
+    QgsInterpolatedLineColor as QgsInterpolatedLineColor,
+    QgsInterpolatedLineRenderer as QgsInterpolatedLineRenderer,
+    QgsInterpolatedLineSymbolLayer as QgsInterpolatedLineSymbolLayer,
+    QgsInterpolatedLineWidth as QgsInterpolatedLineWidth,
+    QgsInvertedPolygonRenderer as QgsInvertedPolygonRenderer,
+    QgsLegendSymbolItem as QgsLegendSymbolItem,
+    QgsLinePatternFillSymbolLayer as QgsLinePatternFillSymbolLayer,
+    QgsLineSymbol as QgsLineSymbol, QgsLineSymbolLayer as QgsLineSymbolLayer,
+    QgsLinearReferencingSymbolLayer as QgsLinearReferencingSymbolLayer,
+    QgsLineburstSymbolLayer as QgsLineburstSymbolLayer,
+    QgsMapInfoSymbolConversionContext as QgsMapInfoSymbolConversionContext,
+    QgsMapInfoSymbolConverter as QgsMapInfoSymbolConverter,
+    QgsMarkerLineSymbolLayer as QgsMarkerLineSymbolLayer,
+    QgsMarkerSymbol as QgsMarkerSymbol,
+    QgsMarkerSymbolLayer as QgsMarkerSymbolLayer,
+    QgsMaskMarkerSymbolLayer as QgsMaskMarkerSymbolLayer,
+    QgsMergedFeatureRenderer as QgsMergedFeatureRenderer,
+    QgsNullSymbolRenderer as QgsNullSymbolRenderer,
+    QgsPointClusterRenderer as QgsPointClusterRenderer,
+    QgsPointDisplacementRenderer as QgsPointDisplacementRenderer,
+    QgsPointDistanceRenderer as QgsPointDistanceRenderer,
+    QgsPointPatternFillSymbolLayer as QgsPointPatternFillSymbolLayer,
+    QgsRandomMarkerFillSymbolLayer as QgsRandomMarkerFillSymbolLayer,
+    QgsRasterFillSymbolLayer as QgsRasterFillSymbolLayer,
+    QgsRasterLineSymbolLayer as QgsRasterLineSymbolLayer,
+    QgsRasterMarkerSymbolLayer as QgsRasterMarkerSymbolLayer,
+    QgsRendererAbstractMetadata as QgsRendererAbstractMetadata,
+    QgsRendererCategory as QgsRendererCategory,
+    QgsRendererMetadata as QgsRendererMetadata,
+    QgsRendererRange as QgsRendererRange,
+    QgsRendererRangeLabelFormat as QgsRendererRangeLabelFormat,
+    QgsRendererRegistry as QgsRendererRegistry,
+    QgsRuleBasedRenderer as QgsRuleBasedRenderer,
+    QgsSVGFillSymbolLayer as QgsSVGFillSymbolLayer,
+    QgsShapeburstFillSymbolLayer as QgsShapeburstFillSymbolLayer,
+    QgsSimpleFillSymbolLayer as QgsSimpleFillSymbolLayer,
+    QgsSimpleLineSymbolLayer as QgsSimpleLineSymbolLayer,
+    QgsSimpleMarkerSymbolLayer as QgsSimpleMarkerSymbolLayer,
+    QgsSimpleMarkerSymbolLayerBase as QgsSimpleMarkerSymbolLayerBase,
+    QgsSingleSymbolRenderer as QgsSingleSymbolRenderer, QgsStyle as QgsStyle,
+    QgsStyleColorRampEntity as QgsStyleColorRampEntity,
+    QgsStyleEntityInterface as QgsStyleEntityInterface,
+    QgsStyleEntityVisitorInterface as QgsStyleEntityVisitorInterface,
+    QgsStyleLabelSettingsEntity as QgsStyleLabelSettingsEntity,
+    QgsStyleLegendPatchShapeEntity as QgsStyleLegendPatchShapeEntity,
+    QgsStyleModel as QgsStyleModel, QgsStyleProxyModel as QgsStyleProxyModel,
+    QgsStyleSymbol3DEntity as QgsStyleSymbol3DEntity,
+    QgsStyleSymbolEntity as QgsStyleSymbolEntity,
+    QgsStyleTextFormatEntity as QgsStyleTextFormatEntity,
+    QgsSvgCache as QgsSvgCache,
+    QgsSvgMarkerSymbolLayer as QgsSvgMarkerSymbolLayer, QgsSymbol as QgsSymbol,
+    QgsSymbolAnimationSettings as QgsSymbolAnimationSettings,
+    QgsSymbolBufferSettings as QgsSymbolBufferSettings,
+    QgsSymbolLayer as QgsSymbolLayer,
+    QgsSymbolLayerAbstractMetadata as QgsSymbolLayerAbstractMetadata,
+    QgsSymbolLayerId as QgsSymbolLayerId,
+    QgsSymbolLayerMetadata as QgsSymbolLayerMetadata,
+    QgsSymbolLayerReference as QgsSymbolLayerReference,
+    QgsSymbolLayerRegistry as QgsSymbolLayerRegistry,
+    QgsSymbolLayerUtils as QgsSymbolLayerUtils,
+    QgsSymbolLevelItem as QgsSymbolLevelItem,
+    QgsSymbolRenderContext as QgsSymbolRenderContext,
+    QgsTemplatedLineSymbolLayerBase as QgsTemplatedLineSymbolLayerBase,
+    QgsVectorFieldSymbolLayer as QgsVectorFieldSymbolLayer,
+)
+from .textrenderer import (
+    QgsFontDownloadDetails as QgsFontDownloadDetails,
+    QgsFontManager as QgsFontManager,
+    QgsTextBackgroundSettings as QgsTextBackgroundSettings,
+    QgsTextBlock as QgsTextBlock, QgsTextBlockFormat as QgsTextBlockFormat,
+    QgsTextBufferSettings as QgsTextBufferSettings,
+    QgsTextCharacterFormat as QgsTextCharacterFormat,
+    QgsTextDocument as QgsTextDocument,
+    QgsTextDocumentMetrics as QgsTextDocumentMetrics,
+    QgsTextDocumentRenderContext as QgsTextDocumentRenderContext,
+    QgsTextFormat as QgsTextFormat, QgsTextFragment as QgsTextFragment,
+    QgsTextMaskSettings as QgsTextMaskSettings,
+    QgsTextRenderer as QgsTextRenderer,
+    QgsTextRendererUtils as QgsTextRendererUtils,
+    QgsTextShadowSettings as QgsTextShadowSettings,
+)
+from .tiledscene import (
+    QgsCesiumUtils as QgsCesiumUtils,
+    QgsTiledSceneBoundingVolume as QgsTiledSceneBoundingVolume,
+    QgsTiledSceneDataProvider as QgsTiledSceneDataProvider,
+    QgsTiledSceneIndex as QgsTiledSceneIndex,
+    QgsTiledSceneLayer as QgsTiledSceneLayer,
+    QgsTiledSceneLayerElevationProperties as QgsTiledSceneLayerElevationProperties,
+    QgsTiledSceneRenderContext as QgsTiledSceneRenderContext,
+    QgsTiledSceneRenderer as QgsTiledSceneRenderer,
+    QgsTiledSceneRendererAbstractMetadata as QgsTiledSceneRendererAbstractMetadata,
+    QgsTiledSceneRendererMetadata as QgsTiledSceneRendererMetadata,
+    QgsTiledSceneRendererRegistry as QgsTiledSceneRendererRegistry,
+    QgsTiledSceneRequest as QgsTiledSceneRequest,
+    QgsTiledSceneTextureRenderer as QgsTiledSceneTextureRenderer,
+    QgsTiledSceneTile as QgsTiledSceneTile,
+    QgsTiledSceneWireframeRenderer as QgsTiledSceneWireframeRenderer,
+)
+from .validity import (
+    QgsAbstractValidityCheck as QgsAbstractValidityCheck,
+    QgsLayoutValidityCheckContext as QgsLayoutValidityCheckContext,
+    QgsValidityCheckContext as QgsValidityCheckContext,
+    QgsValidityCheckRegistry as QgsValidityCheckRegistry,
+    QgsValidityCheckResult as QgsValidityCheckResult,
+)
+from .vector import (
+    QgsAbstractCacheIndex as QgsAbstractCacheIndex,
+    QgsAbstractFeatureIterator as QgsAbstractFeatureIterator,
+    QgsAbstractFeatureIteratorFromSourceQgsVectorLayerFeatureSourceBase as QgsAbstractFeatureIteratorFromSourceQgsVectorLayerFeatureSourceBase,
+    QgsAbstractFeatureSource as QgsAbstractFeatureSource,
+    QgsAbstractPropertyCollection as QgsAbstractPropertyCollection,
+    QgsAggregateCalculator as QgsAggregateCalculator,
+    QgsAuxiliaryLayer as QgsAuxiliaryLayer,
+    QgsAuxiliaryStorage as QgsAuxiliaryStorage,
+    QgsCacheIndexFeatureId as QgsCacheIndexFeatureId,
+    QgsCachedFeatureIterator as QgsCachedFeatureIterator,
+    QgsCachedFeatureWriterIterator as QgsCachedFeatureWriterIterator,
+    QgsCodedFieldDomain as QgsCodedFieldDomain, QgsCodedValue as QgsCodedValue,
+    QgsColorUtils as QgsColorUtils,
+    QgsConditionalLayerStyles as QgsConditionalLayerStyles,
+    QgsCoordinateFormatter as QgsCoordinateFormatter,
+    QgsDataSourceUri as QgsDataSourceUri,
+    QgsDefaultMeshLayerLegend as QgsDefaultMeshLayerLegend,
+    QgsDefaultPointCloudLayerLegend as QgsDefaultPointCloudLayerLegend,
+    QgsDefaultRasterLayerLegend as QgsDefaultRasterLayerLegend,
+    QgsDefaultVectorLayerLegend as QgsDefaultVectorLayerLegend,
+    QgsDiagramLayerSettings as QgsDiagramLayerSettings,
+    QgsDiagramRenderer as QgsDiagramRenderer,
+    QgsElevationUtils as QgsElevationUtils,
+    QgsExpressionContext as QgsExpressionContext,
+    QgsExpressionContextGenerator as QgsExpressionContextGenerator,
+    QgsExpressionContextScope as QgsExpressionContextScope,
+    QgsExpressionContextScopeGenerator as QgsExpressionContextScopeGenerator,
+    QgsFeature as QgsFeature, QgsFeatureFilterModel as QgsFeatureFilterModel,
+    QgsFeatureIterator as QgsFeatureIterator,
+    QgsFeaturePickerModel as QgsFeaturePickerModel,
+    QgsFeaturePickerModelBase as QgsFeaturePickerModelBase,
+    QgsFeatureRequest as QgsFeatureRequest, QgsFeatureSink as QgsFeatureSink,
+    QgsFeatureSource as QgsFeatureSource, QgsFeatureStore as QgsFeatureStore,
+    QgsFieldDomain as QgsFieldDomain, QgsFieldModel as QgsFieldModel,
+    QgsFieldProxyModel as QgsFieldProxyModel,
+    QgsGeometryOptions as QgsGeometryOptions,
+    QgsGlobFieldDomain as QgsGlobFieldDomain, QgsGroupLayer as QgsGroupLayer,
+    QgsHistogram as QgsHistogram, QgsIconUtils as QgsIconUtils,
+    QgsJsonExporter as QgsJsonExporter,
+    QgsLayerDefinition as QgsLayerDefinition,
+    QgsLayerNotesUtils as QgsLayerNotesUtils,
+    QgsLinearlyInterpolatedDiagramRenderer as QgsLinearlyInterpolatedDiagramRenderer,
+    QgsMapLayer as QgsMapLayer,
+    QgsMapLayerElevationProperties as QgsMapLayerElevationProperties,
+    QgsMapLayerLegend as QgsMapLayerLegend,
+    QgsMapLayerProxyModel as QgsMapLayerProxyModel,
+    QgsMapLayerRenderer as QgsMapLayerRenderer,
+    QgsMapLayerSelectionProperties as QgsMapLayerSelectionProperties,
+    QgsMapLayerServerProperties as QgsMapLayerServerProperties,
+    QgsMapLayerStore as QgsMapLayerStore, QgsMapLayerStyle as QgsMapLayerStyle,
+    QgsMapLayerStyleManager as QgsMapLayerStyleManager,
+    QgsMapLayerStyleOverride as QgsMapLayerStyleOverride,
+    QgsMapLayerTemporalProperties as QgsMapLayerTemporalProperties,
+    QgsMapLayerUtils as QgsMapLayerUtils,
+    QgsMaskIdProvider as QgsMaskIdProvider, QgsOgcUtils as QgsOgcUtils,
+    QgsOwsConnection as QgsOwsConnection, QgsPluginLayer as QgsPluginLayer,
+    QgsPointXY as QgsPointXY, QgsPolymorphicRelation as QgsPolymorphicRelation,
+    QgsPropertyCollection as QgsPropertyCollection,
+    QgsPropertyCollectionStack as QgsPropertyCollectionStack,
+    QgsProxyFeatureSink as QgsProxyFeatureSink,
+    QgsRangeFieldDomain as QgsRangeFieldDomain,
+    QgsReadWriteContext as QgsReadWriteContext,
+    QgsReadWriteContextCategoryPopper as QgsReadWriteContextCategoryPopper,
+    QgsRelation as QgsRelation, QgsRelationContext as QgsRelationContext,
+    QgsRemappingProxyFeatureSink as QgsRemappingProxyFeatureSink,
+    QgsRenderContext as QgsRenderContext,
+    QgsServerMetadataUrlProperties as QgsServerMetadataUrlProperties,
+    QgsServerWmsDimensionProperties as QgsServerWmsDimensionProperties,
+    QgsSimplifyMethod as QgsSimplifyMethod,
+    QgsSingleCategoryDiagramRenderer as QgsSingleCategoryDiagramRenderer,
+    QgsSpatialIndex as QgsSpatialIndex,
+    QgsSpatialIndexKDBush as QgsSpatialIndexKDBush,
+    QgsSpatialIndexKDBushData as QgsSpatialIndexKDBushData,
+    QgsStackedDiagramRenderer as QgsStackedDiagramRenderer,
+    QgsTableCell as QgsTableCell,
+    QgsTemporalNavigationObject as QgsTemporalNavigationObject,
+    QgsTestUtils as QgsTestUtils, QgsTolerance as QgsTolerance,
+    QgsTracer as QgsTracer,
+    QgsTrackedVectorLayerTools as QgsTrackedVectorLayerTools,
+    QgsVectorDataProvider as QgsVectorDataProvider,
+    QgsVectorDataProviderTemporalCapabilities as QgsVectorDataProviderTemporalCapabilities,
+    QgsVectorLayer as QgsVectorLayer,
+    QgsVectorLayerCache as QgsVectorLayerCache,
+    QgsVectorLayerEditBuffer as QgsVectorLayerEditBuffer,
+    QgsVectorLayerEditBufferGroup as QgsVectorLayerEditBufferGroup,
+    QgsVectorLayerEditPassthrough as QgsVectorLayerEditPassthrough,
+    QgsVectorLayerEditUtils as QgsVectorLayerEditUtils,
+    QgsVectorLayerElevationProperties as QgsVectorLayerElevationProperties,
+    QgsVectorLayerExporter as QgsVectorLayerExporter,
+    QgsVectorLayerExporterTask as QgsVectorLayerExporterTask,
+    QgsVectorLayerFeatureCounter as QgsVectorLayerFeatureCounter,
+    QgsVectorLayerFeatureIterator as QgsVectorLayerFeatureIterator,
+    QgsVectorLayerFeatureSource as QgsVectorLayerFeatureSource,
+    QgsVectorLayerJoinBuffer as QgsVectorLayerJoinBuffer,
+    QgsVectorLayerJoinInfo as QgsVectorLayerJoinInfo,
+    QgsVectorLayerSelectedFeatureSource as QgsVectorLayerSelectedFeatureSource,
+    QgsVectorLayerSelectionProperties as QgsVectorLayerSelectionProperties,
+    QgsVectorLayerServerProperties as QgsVectorLayerServerProperties,
+    QgsVectorLayerTemporalContext as QgsVectorLayerTemporalContext,
+    QgsVectorLayerTemporalProperties as QgsVectorLayerTemporalProperties,
+    QgsVectorLayerTools as QgsVectorLayerTools,
+    QgsVectorLayerToolsContext as QgsVectorLayerToolsContext,
+    QgsVectorLayerUndoCommand as QgsVectorLayerUndoCommand,
+    QgsVectorLayerUndoCommandAddAttribute as QgsVectorLayerUndoCommandAddAttribute,
+    QgsVectorLayerUndoCommandAddFeature as QgsVectorLayerUndoCommandAddFeature,
+    QgsVectorLayerUndoCommandChangeAttribute as QgsVectorLayerUndoCommandChangeAttribute,
+    QgsVectorLayerUndoCommandChangeGeometry as QgsVectorLayerUndoCommandChangeGeometry,
+    QgsVectorLayerUndoCommandDeleteAttribute as QgsVectorLayerUndoCommandDeleteAttribute,
+    QgsVectorLayerUndoCommandDeleteFeature as QgsVectorLayerUndoCommandDeleteFeature,
+    QgsVectorLayerUndoCommandRenameAttribute as QgsVectorLayerUndoCommandRenameAttribute,
+    QgsVectorLayerUndoPassthroughCommand as QgsVectorLayerUndoPassthroughCommand,
+    QgsVectorLayerUndoPassthroughCommandAddAttribute as QgsVectorLayerUndoPassthroughCommandAddAttribute,
+    QgsVectorLayerUndoPassthroughCommandAddFeatures as QgsVectorLayerUndoPassthroughCommandAddFeatures,
+    QgsVectorLayerUndoPassthroughCommandChangeAttribute as QgsVectorLayerUndoPassthroughCommandChangeAttribute,
+    QgsVectorLayerUndoPassthroughCommandChangeAttributes as QgsVectorLayerUndoPassthroughCommandChangeAttributes,
+    QgsVectorLayerUndoPassthroughCommandChangeGeometry as QgsVectorLayerUndoPassthroughCommandChangeGeometry,
+    QgsVectorLayerUndoPassthroughCommandDeleteAttribute as QgsVectorLayerUndoPassthroughCommandDeleteAttribute,
+    QgsVectorLayerUndoPassthroughCommandDeleteFeatures as QgsVectorLayerUndoPassthroughCommandDeleteFeatures,
+    QgsVectorLayerUndoPassthroughCommandRenameAttribute as QgsVectorLayerUndoPassthroughCommandRenameAttribute,
+    QgsVectorLayerUndoPassthroughCommandUpdate as QgsVectorLayerUndoPassthroughCommandUpdate,
+    QgsVectorLayerUtils as QgsVectorLayerUtils,
+    QgsVirtualLayerDefinitionUtils as QgsVirtualLayerDefinitionUtils,
+)
+from .vectortile import (
+    QgsMapBoxGlStyleAbstractSource as QgsMapBoxGlStyleAbstractSource,
+    QgsMapBoxGlStyleConversionContext as QgsMapBoxGlStyleConversionContext,
+    QgsMapBoxGlStyleConverter as QgsMapBoxGlStyleConverter,
+    QgsMapBoxGlStyleRasterSource as QgsMapBoxGlStyleRasterSource,
+    QgsMapBoxGlStyleRasterSubLayer as QgsMapBoxGlStyleRasterSubLayer,
+    QgsTileMatrix as QgsTileMatrix, QgsTileMatrixSet as QgsTileMatrixSet,
+    QgsVectorTileBasicLabeling as QgsVectorTileBasicLabeling,
+    QgsVectorTileBasicLabelingStyle as QgsVectorTileBasicLabelingStyle,
+    QgsVectorTileBasicRenderer as QgsVectorTileBasicRenderer,
+    QgsVectorTileBasicRendererStyle as QgsVectorTileBasicRendererStyle,
+    QgsVectorTileLabeling as QgsVectorTileLabeling,
+    QgsVectorTileLayer as QgsVectorTileLayer,
+    QgsVectorTileMatrixSet as QgsVectorTileMatrixSet,
+    QgsVectorTileRenderer as QgsVectorTileRenderer,
+    QgsVectorTileRendererData as QgsVectorTileRendererData,
+    QgsVectorTileUtils as QgsVectorTileUtils,
+    QgsVectorTileWriter as QgsVectorTileWriter, QgsVtpkTiles as QgsVtpkTiles,
+)
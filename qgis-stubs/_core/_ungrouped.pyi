@@ -0,0 +1,7534 @@
+# The PEP 484 type hints stub file for the _core._ungrouped module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from .geometry import QgsPoint
+from .pointcloud import QgsPointCloudNodeId
+from .symbology import QgsSymbolLayerId, QgsSymbolLayerReference
+from .vector import QgsPointXY
+
+
+QgsMultiPointXY = typing.List['QgsPointXY']
+QgsPolylineXY = typing.List['QgsPointXY']
+QgsPolygonXY = typing.List[QgsPolylineXY]
+QgsMultiPolygonXY = typing.List[QgsPolygonXY]
+QgsMultiPolylineXY = typing.List[QgsPolylineXY]
+QgsPointSequence = typing.List['QgsPoint']
+QgsPolyline = QgsPointSequence
+
+
+PYQT_SIGNAL = typing.Union[QtCore.pyqtSignal, QtCore.pyqtBoundSignal]
+PYQT_SLOT = typing.Union[typing.Callable[..., Any], QtCore.pyqtBoundSignal]
+
+
+PYQT_OPENGL_ARRAY = typing.Union[typing.Sequence[int], typing.Sequence[float],
+        PyQt5.sip.Buffer, None]
+PYQT_OPENGL_BOUND_ARRAY = typing.Union[typing.Sequence[int],
+        typing.Sequence[float], PyQt5.sip.Buffer, int, None]
+
+
+class Qgis(PyQt5.sip.wrapper):
+
+    class StacObjectType(int):
+        Unknown = ... # type: Qgis.StacObjectType
+        Catalog = ... # type: Qgis.StacObjectType
+        Collection = ... # type: Qgis.StacObjectType
+        Item = ... # type: Qgis.StacObjectType
+
+    class SegmentCalculationMethod(int):
+        Standard = ... # type: Qgis.SegmentCalculationMethod
+        Adaptive = ... # type: Qgis.SegmentCalculationMethod
+        AreaError = ... # type: Qgis.SegmentCalculationMethod
+        ConstantDensity = ... # type: Qgis.SegmentCalculationMethod
+
+    class PointCloudZoomOutRenderBehavior(int):
+        RenderExtents = ... # type: Qgis.PointCloudZoomOutRenderBehavior
+        RenderOverview = ... # type: Qgis.PointCloudZoomOutRenderBehavior
+        RenderOverviewAndExtents = ... # type: Qgis.PointCloudZoomOutRenderBehavior
+
+    class PointCloudAccessType(int):
+        Local = ... # type: Qgis.PointCloudAccessType
+        Remote = ... # type: Qgis.PointCloudAccessType
+
+    class MeshRangeExtent(int):
+        WholeMesh = ... # type: Qgis.MeshRangeExtent
+        FixedCanvas = ... # type: Qgis.MeshRangeExtent
+        UpdatedCanvas = ... # type: Qgis.MeshRangeExtent
+
+    class MeshRangeLimit(int):
+        NotSet = ... # type: Qgis.MeshRangeLimit
+        MinimumMaximum = ... # type: Qgis.MeshRangeLimit
+
+    class MouseHandlesAction(int):
+        MoveItem = ... # type: Qgis.MouseHandlesAction
+        ResizeUp = ... # type: Qgis.MouseHandlesAction
+        ResizeDown = ... # type: Qgis.MouseHandlesAction
+        ResizeLeft = ... # type: Qgis.MouseHandlesAction
+        ResizeRight = ... # type: Qgis.MouseHandlesAction
+        ResizeLeftUp = ... # type: Qgis.MouseHandlesAction
+        ResizeRightUp = ... # type: Qgis.MouseHandlesAction
+        ResizeLeftDown = ... # type: Qgis.MouseHandlesAction
+        ResizeRightDown = ... # type: Qgis.MouseHandlesAction
+        SelectItem = ... # type: Qgis.MouseHandlesAction
+        NoAction = ... # type: Qgis.MouseHandlesAction
+
+    class DocumentationBrowser(int):
+        DeveloperToolsPanel = ... # type: Qgis.DocumentationBrowser
+        SystemWebBrowser = ... # type: Qgis.DocumentationBrowser
+
+    class DocumentationApi(int):
+        PyQgis = ... # type: Qgis.DocumentationApi
+        PyQgisSearch = ... # type: Qgis.DocumentationApi
+        CppQgis = ... # type: Qgis.DocumentationApi
+        Qt = ... # type: Qgis.DocumentationApi
+
+    class ColorModel(int):
+        Rgb = ... # type: Qgis.ColorModel
+        Cmyk = ... # type: Qgis.ColorModel
+
+    class SensorThingsEntity(int):
+        Invalid = ... # type: Qgis.SensorThingsEntity
+        Thing = ... # type: Qgis.SensorThingsEntity
+        Location = ... # type: Qgis.SensorThingsEntity
+        HistoricalLocation = ... # type: Qgis.SensorThingsEntity
+        Datastream = ... # type: Qgis.SensorThingsEntity
+        Sensor = ... # type: Qgis.SensorThingsEntity
+        ObservedProperty = ... # type: Qgis.SensorThingsEntity
+        Observation = ... # type: Qgis.SensorThingsEntity
+        FeatureOfInterest = ... # type: Qgis.SensorThingsEntity
+        MultiDatastream = ... # type: Qgis.SensorThingsEntity
+
+    class RasterBandStatistic(int):
+        NoStatistic = ... # type: Qgis.RasterBandStatistic
+        Min = ... # type: Qgis.RasterBandStatistic
+        Max = ... # type: Qgis.RasterBandStatistic
+        Range = ... # type: Qgis.RasterBandStatistic
+        Sum = ... # type: Qgis.RasterBandStatistic
+        Mean = ... # type: Qgis.RasterBandStatistic
+        StdDev = ... # type: Qgis.RasterBandStatistic
+        SumOfSquares = ... # type: Qgis.RasterBandStatistic
+        All = ... # type: Qgis.RasterBandStatistic
+
+    class StringStatistic(int):
+        Count = ... # type: Qgis.StringStatistic
+        CountDistinct = ... # type: Qgis.StringStatistic
+        CountMissing = ... # type: Qgis.StringStatistic
+        Min = ... # type: Qgis.StringStatistic
+        Max = ... # type: Qgis.StringStatistic
+        MinimumLength = ... # type: Qgis.StringStatistic
+        MaximumLength = ... # type: Qgis.StringStatistic
+        MeanLength = ... # type: Qgis.StringStatistic
+        Minority = ... # type: Qgis.StringStatistic
+        Majority = ... # type: Qgis.StringStatistic
+        All = ... # type: Qgis.StringStatistic
+
+    class DateTimeStatistic(int):
+        Count = ... # type: Qgis.DateTimeStatistic
+        CountDistinct = ... # type: Qgis.DateTimeStatistic
+        CountMissing = ... # type: Qgis.DateTimeStatistic
+        Min = ... # type: Qgis.DateTimeStatistic
+        Max = ... # type: Qgis.DateTimeStatistic
+        Range = ... # type: Qgis.DateTimeStatistic
+        All = ... # type: Qgis.DateTimeStatistic
+
+    class Statistic(int):
+        Count = ... # type: Qgis.Statistic
+        CountMissing = ... # type: Qgis.Statistic
+        Sum = ... # type: Qgis.Statistic
+        Mean = ... # type: Qgis.Statistic
+        Median = ... # type: Qgis.Statistic
+        StDev = ... # type: Qgis.Statistic
+        StDevSample = ... # type: Qgis.Statistic
+        Min = ... # type: Qgis.Statistic
+        Max = ... # type: Qgis.Statistic
+        Range = ... # type: Qgis.Statistic
+        Minority = ... # type: Qgis.Statistic
+        Majority = ... # type: Qgis.Statistic
+        Variety = ... # type: Qgis.Statistic
+        FirstQuartile = ... # type: Qgis.Statistic
+        ThirdQuartile = ... # type: Qgis.Statistic
+        InterQuartileRange = ... # type: Qgis.Statistic
+        First = ... # type: Qgis.Statistic
+        Last = ... # type: Qgis.Statistic
+        All = ... # type: Qgis.Statistic
+
+    class Aggregate(int):
+        Count = ... # type: Qgis.Aggregate
+        CountDistinct = ... # type: Qgis.Aggregate
+        CountMissing = ... # type: Qgis.Aggregate
+        Min = ... # type: Qgis.Aggregate
+        Max = ... # type: Qgis.Aggregate
+        Sum = ... # type: Qgis.Aggregate
+        Mean = ... # type: Qgis.Aggregate
+        Median = ... # type: Qgis.Aggregate
+        StDev = ... # type: Qgis.Aggregate
+        StDevSample = ... # type: Qgis.Aggregate
+        Range = ... # type: Qgis.Aggregate
+        Minority = ... # type: Qgis.Aggregate
+        Majority = ... # type: Qgis.Aggregate
+        FirstQuartile = ... # type: Qgis.Aggregate
+        ThirdQuartile = ... # type: Qgis.Aggregate
+        InterQuartileRange = ... # type: Qgis.Aggregate
+        StringMinimumLength = ... # type: Qgis.Aggregate
+        StringMaximumLength = ... # type: Qgis.Aggregate
+        StringConcatenate = ... # type: Qgis.Aggregate
+        GeometryCollect = ... # type: Qgis.Aggregate
+        ArrayAggregate = ... # type: Qgis.Aggregate
+        StringConcatenateUnique = ... # type: Qgis.Aggregate
+
+    class ZonalStatisticResult(int):
+        Success = ... # type: Qgis.ZonalStatisticResult
+        LayerTypeWrong = ... # type: Qgis.ZonalStatisticResult
+        LayerInvalid = ... # type: Qgis.ZonalStatisticResult
+        RasterInvalid = ... # type: Qgis.ZonalStatisticResult
+        RasterBandInvalid = ... # type: Qgis.ZonalStatisticResult
+        FailedToCreateField = ... # type: Qgis.ZonalStatisticResult
+        Canceled = ... # type: Qgis.ZonalStatisticResult
+
+    class ZonalStatistic(int):
+        Count = ... # type: Qgis.ZonalStatistic
+        Sum = ... # type: Qgis.ZonalStatistic
+        Mean = ... # type: Qgis.ZonalStatistic
+        Median = ... # type: Qgis.ZonalStatistic
+        StDev = ... # type: Qgis.ZonalStatistic
+        Min = ... # type: Qgis.ZonalStatistic
+        Max = ... # type: Qgis.ZonalStatistic
+        Range = ... # type: Qgis.ZonalStatistic
+        Minority = ... # type: Qgis.ZonalStatistic
+        Majority = ... # type: Qgis.ZonalStatistic
+        Variety = ... # type: Qgis.ZonalStatistic
+        Variance = ... # type: Qgis.ZonalStatistic
+        MinimumPoint = ... # type: Qgis.ZonalStatistic
+        MaximumPoint = ... # type: Qgis.ZonalStatistic
+        All = ... # type: Qgis.ZonalStatistic
+        AllNumeric = ... # type: Qgis.ZonalStatistic
+        Default = ... # type: Qgis.ZonalStatistic
+
+    class VsiHandlerType(int):
+        Invalid = ... # type: Qgis.VsiHandlerType
+        Archive = ... # type: Qgis.VsiHandlerType
+        Network = ... # type: Qgis.VsiHandlerType
+        Cloud = ... # type: Qgis.VsiHandlerType
+        Memory = ... # type: Qgis.VsiHandlerType
+        Other = ... # type: Qgis.VsiHandlerType
+
+    class GdalResampleAlgorithm(int):
+        RA_NearestNeighbour = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Bilinear = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Cubic = ... # type: Qgis.GdalResampleAlgorithm
+        RA_CubicSpline = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Lanczos = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Average = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Mode = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Max = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Min = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Median = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Q1 = ... # type: Qgis.GdalResampleAlgorithm
+        RA_Q3 = ... # type: Qgis.GdalResampleAlgorithm
+
+    class TiledSceneRendererFlag(int):
+        RequiresTextures = ... # type: Qgis.TiledSceneRendererFlag
+        ForceRasterRender = ... # type: Qgis.TiledSceneRendererFlag
+        RendersTriangles = ... # type: Qgis.TiledSceneRendererFlag
+        RendersLines = ... # type: Qgis.TiledSceneRendererFlag
+
+    class TiledSceneRequestFlag(int):
+        NoHierarchyFetch = ... # type: Qgis.TiledSceneRequestFlag
+
+    class TileChildrenAvailability(int):
+        NoChildren = ... # type: Qgis.TileChildrenAvailability
+        Available = ... # type: Qgis.TileChildrenAvailability
+        NeedFetching = ... # type: Qgis.TileChildrenAvailability
+
+    class TileRefinementProcess(int):
+        Replacement = ... # type: Qgis.TileRefinementProcess
+        Additive = ... # type: Qgis.TileRefinementProcess
+
+    class TiledSceneBoundingVolumeType(int):
+        Region = ... # type: Qgis.TiledSceneBoundingVolumeType
+        OrientedBox = ... # type: Qgis.TiledSceneBoundingVolumeType
+        Sphere = ... # type: Qgis.TiledSceneBoundingVolumeType
+
+    class TiledSceneProviderCapability(int):
+        ReadLayerMetadata = ... # type: Qgis.TiledSceneProviderCapability
+
+    class TileAvailability(int):
+        Available = ... # type: Qgis.TileAvailability
+        NotAvailable = ... # type: Qgis.TileAvailability
+        AvailableNoChildren = ... # type: Qgis.TileAvailability
+        UseLowerZoomLevelTile = ... # type: Qgis.TileAvailability
+
+    class VectorTileProviderCapability(int):
+        ReadLayerMetadata = ... # type: Qgis.VectorTileProviderCapability
+
+    class VectorTileProviderFlag(int):
+        AlwaysUseTileMatrixSetFromProvider = ... # type: Qgis.VectorTileProviderFlag
+
+    class FeatureSymbologyExport(int):
+        NoSymbology = ... # type: Qgis.FeatureSymbologyExport
+        PerFeature = ... # type: Qgis.FeatureSymbologyExport
+        PerSymbolLayer = ... # type: Qgis.FeatureSymbologyExport
+
+    class ExpressionType(int):
+        Qgis = ... # type: Qgis.ExpressionType
+        PointCloud = ... # type: Qgis.ExpressionType
+        RasterCalculator = ... # type: Qgis.ExpressionType
+
+    class AttributeFormPythonInitCodeSource(int):
+        NoSource = ... # type: Qgis.AttributeFormPythonInitCodeSource
+        File = ... # type: Qgis.AttributeFormPythonInitCodeSource
+        Dialog = ... # type: Qgis.AttributeFormPythonInitCodeSource
+        Environment = ... # type: Qgis.AttributeFormPythonInitCodeSource
+
+    class AttributeFormSuppression(int):
+        Default = ... # type: Qgis.AttributeFormSuppression
+        On = ... # type: Qgis.AttributeFormSuppression
+        Off = ... # type: Qgis.AttributeFormSuppression
+
+    class AttributeFormLayout(int):
+        AutoGenerated = ... # type: Qgis.AttributeFormLayout
+        DragAndDrop = ... # type: Qgis.AttributeFormLayout
+        UiFile = ... # type: Qgis.AttributeFormLayout
+
+    class AttributeEditorContainerType(int):
+        GroupBox = ... # type: Qgis.AttributeEditorContainerType
+        Tab = ... # type: Qgis.AttributeEditorContainerType
+        Row = ... # type: Qgis.AttributeEditorContainerType
+
+    class AttributeEditorType(int):
+        Container = ... # type: Qgis.AttributeEditorType
+        Field = ... # type: Qgis.AttributeEditorType
+        Relation = ... # type: Qgis.AttributeEditorType
+        QmlElement = ... # type: Qgis.AttributeEditorType
+        HtmlElement = ... # type: Qgis.AttributeEditorType
+        Action = ... # type: Qgis.AttributeEditorType
+        TextElement = ... # type: Qgis.AttributeEditorType
+        SpacerElement = ... # type: Qgis.AttributeEditorType
+        Invalid = ... # type: Qgis.AttributeEditorType
+
+    class UserProfileSelectionPolicy(int):
+        LastProfile = ... # type: Qgis.UserProfileSelectionPolicy
+        DefaultProfile = ... # type: Qgis.UserProfileSelectionPolicy
+        AskUser = ... # type: Qgis.UserProfileSelectionPolicy
+
+    class ProviderStyleStorageCapability(int):
+        SaveToDatabase = ... # type: Qgis.ProviderStyleStorageCapability
+        LoadFromDatabase = ... # type: Qgis.ProviderStyleStorageCapability
+        DeleteFromDatabase = ... # type: Qgis.ProviderStyleStorageCapability
+
+    class DatabaseProviderTableImportCapability(int):
+        SetGeometryColumnName = ... # type: Qgis.DatabaseProviderTableImportCapability
+        SetPrimaryKeyName = ... # type: Qgis.DatabaseProviderTableImportCapability
+
+    class DatabaseProviderConnectionCapability2(int):
+        SetFieldComment = ... # type: Qgis.DatabaseProviderConnectionCapability2
+        SetFieldAlias = ... # type: Qgis.DatabaseProviderConnectionCapability2
+        SetTableComment = ... # type: Qgis.DatabaseProviderConnectionCapability2
+
+    class PostgresRelKind(int):
+        NotSet = ... # type: Qgis.PostgresRelKind
+        Unknown = ... # type: Qgis.PostgresRelKind
+        OrdinaryTable = ... # type: Qgis.PostgresRelKind
+        Index = ... # type: Qgis.PostgresRelKind
+        Sequence = ... # type: Qgis.PostgresRelKind
+        View = ... # type: Qgis.PostgresRelKind
+        MaterializedView = ... # type: Qgis.PostgresRelKind
+        CompositeType = ... # type: Qgis.PostgresRelKind
+        ToastTable = ... # type: Qgis.PostgresRelKind
+        ForeignTable = ... # type: Qgis.PostgresRelKind
+        PartitionedTable = ... # type: Qgis.PostgresRelKind
+
+    class InputControllerType(int):
+        Map2D = ... # type: Qgis.InputControllerType
+        Map3D = ... # type: Qgis.InputControllerType
+
+    class ScaleBarDistanceLabelHorizontalPlacement(int):
+        CenteredEdge = ... # type: Qgis.ScaleBarDistanceLabelHorizontalPlacement
+        CenteredSegment = ... # type: Qgis.ScaleBarDistanceLabelHorizontalPlacement
+
+    class ScaleBarDistanceLabelVerticalPlacement(int):
+        AboveSegment = ... # type: Qgis.ScaleBarDistanceLabelVerticalPlacement
+        BelowSegment = ... # type: Qgis.ScaleBarDistanceLabelVerticalPlacement
+
+    class ScaleBarSegmentSizeMode(int):
+        Fixed = ... # type: Qgis.ScaleBarSegmentSizeMode
+        FitWidth = ... # type: Qgis.ScaleBarSegmentSizeMode
+
+    class ScaleBarAlignment(int):
+        Left = ... # type: Qgis.ScaleBarAlignment
+        Middle = ... # type: Qgis.ScaleBarAlignment
+        Right = ... # type: Qgis.ScaleBarAlignment
+
+    class ScaleCalculationMethod(int):
+        HorizontalTop = ... # type: Qgis.ScaleCalculationMethod
+        HorizontalMiddle = ... # type: Qgis.ScaleCalculationMethod
+        HorizontalBottom = ... # type: Qgis.ScaleCalculationMethod
+        HorizontalAverage = ... # type: Qgis.ScaleCalculationMethod
+        AtEquator = ... # type: Qgis.ScaleCalculationMethod
+
+    class PictureFormat(int):
+        SVG = ... # type: Qgis.PictureFormat
+        Raster = ... # type: Qgis.PictureFormat
+        Unknown = ... # type: Qgis.PictureFormat
+
+    class LayoutRenderFlag(int):
+        Debug = ... # type: Qgis.LayoutRenderFlag
+        OutlineOnly = ... # type: Qgis.LayoutRenderFlag
+        Antialiasing = ... # type: Qgis.LayoutRenderFlag
+        UseAdvancedEffects = ... # type: Qgis.LayoutRenderFlag
+        ForceVectorOutput = ... # type: Qgis.LayoutRenderFlag
+        HideCoverageLayer = ... # type: Qgis.LayoutRenderFlag
+        DrawSelection = ... # type: Qgis.LayoutRenderFlag
+        DisableTiledRasterLayerRenders = ... # type: Qgis.LayoutRenderFlag
+        RenderLabelsByMapLayer = ... # type: Qgis.LayoutRenderFlag
+        LosslessImageRendering = ... # type: Qgis.LayoutRenderFlag
+        SynchronousLegendGraphics = ... # type: Qgis.LayoutRenderFlag
+        AlwaysUseGlobalMasks = ... # type: Qgis.LayoutRenderFlag
+
+    class LayoutUnitType(int):
+        PaperUnits = ... # type: Qgis.LayoutUnitType
+        ScreenUnits = ... # type: Qgis.LayoutUnitType
+
+    class LayoutUnit(int):
+        Millimeters = ... # type: Qgis.LayoutUnit
+        Centimeters = ... # type: Qgis.LayoutUnit
+        Meters = ... # type: Qgis.LayoutUnit
+        Inches = ... # type: Qgis.LayoutUnit
+        Feet = ... # type: Qgis.LayoutUnit
+        Points = ... # type: Qgis.LayoutUnit
+        Picas = ... # type: Qgis.LayoutUnit
+        Pixels = ... # type: Qgis.LayoutUnit
+
+    class RenderUnit(int):
+        Millimeters = ... # type: Qgis.RenderUnit
+        MapUnits = ... # type: Qgis.RenderUnit
+        Pixels = ... # type: Qgis.RenderUnit
+        Percentage = ... # type: Qgis.RenderUnit
+        Points = ... # type: Qgis.RenderUnit
+        Inches = ... # type: Qgis.RenderUnit
+        Unknown = ... # type: Qgis.RenderUnit
+        MetersInMapUnits = ... # type: Qgis.RenderUnit
+
+    class TemporalUnit(int):
+        Milliseconds = ... # type: Qgis.TemporalUnit
+        Seconds = ... # type: Qgis.TemporalUnit
+        Minutes = ... # type: Qgis.TemporalUnit
+        Hours = ... # type: Qgis.TemporalUnit
+        Days = ... # type: Qgis.TemporalUnit
+        Weeks = ... # type: Qgis.TemporalUnit
+        Months = ... # type: Qgis.TemporalUnit
+        Years = ... # type: Qgis.TemporalUnit
+        Decades = ... # type: Qgis.TemporalUnit
+        Centuries = ... # type: Qgis.TemporalUnit
+        IrregularStep = ... # type: Qgis.TemporalUnit
+        Unknown = ... # type: Qgis.TemporalUnit
+
+    class AngleUnit(int):
+        Degrees = ... # type: Qgis.AngleUnit
+        Radians = ... # type: Qgis.AngleUnit
+        Gon = ... # type: Qgis.AngleUnit
+        MinutesOfArc = ... # type: Qgis.AngleUnit
+        SecondsOfArc = ... # type: Qgis.AngleUnit
+        Turn = ... # type: Qgis.AngleUnit
+        MilliradiansSI = ... # type: Qgis.AngleUnit
+        MilNATO = ... # type: Qgis.AngleUnit
+        Unknown = ... # type: Qgis.AngleUnit
+
+    class VolumeUnit(int):
+        CubicMeters = ... # type: Qgis.VolumeUnit
+        CubicFeet = ... # type: Qgis.VolumeUnit
+        CubicYards = ... # type: Qgis.VolumeUnit
+        Barrel = ... # type: Qgis.VolumeUnit
+        CubicDecimeter = ... # type: Qgis.VolumeUnit
+        Liters = ... # type: Qgis.VolumeUnit
+        GallonUS = ... # type: Qgis.VolumeUnit
+        CubicInch = ... # type: Qgis.VolumeUnit
+        CubicCentimeter = ... # type: Qgis.VolumeUnit
+        CubicDegrees = ... # type: Qgis.VolumeUnit
+        Unknown = ... # type: Qgis.VolumeUnit
+
+    class AreaUnit(int):
+        SquareMeters = ... # type: Qgis.AreaUnit
+        SquareKilometers = ... # type: Qgis.AreaUnit
+        SquareFeet = ... # type: Qgis.AreaUnit
+        SquareYards = ... # type: Qgis.AreaUnit
+        SquareMiles = ... # type: Qgis.AreaUnit
+        Hectares = ... # type: Qgis.AreaUnit
+        Acres = ... # type: Qgis.AreaUnit
+        SquareNauticalMiles = ... # type: Qgis.AreaUnit
+        SquareDegrees = ... # type: Qgis.AreaUnit
+        SquareCentimeters = ... # type: Qgis.AreaUnit
+        SquareMillimeters = ... # type: Qgis.AreaUnit
+        SquareInches = ... # type: Qgis.AreaUnit
+        Unknown = ... # type: Qgis.AreaUnit
+
+    class DistanceUnitType(int):
+        Standard = ... # type: Qgis.DistanceUnitType
+        Geographic = ... # type: Qgis.DistanceUnitType
+        Unknown = ... # type: Qgis.DistanceUnitType
+
+    class DistanceUnit(int):
+        Meters = ... # type: Qgis.DistanceUnit
+        Kilometers = ... # type: Qgis.DistanceUnit
+        Feet = ... # type: Qgis.DistanceUnit
+        NauticalMiles = ... # type: Qgis.DistanceUnit
+        Yards = ... # type: Qgis.DistanceUnit
+        Miles = ... # type: Qgis.DistanceUnit
+        Degrees = ... # type: Qgis.DistanceUnit
+        Centimeters = ... # type: Qgis.DistanceUnit
+        Millimeters = ... # type: Qgis.DistanceUnit
+        Inches = ... # type: Qgis.DistanceUnit
+        ChainsInternational = ... # type: Qgis.DistanceUnit
+        ChainsBritishBenoit1895A = ... # type: Qgis.DistanceUnit
+        ChainsBritishBenoit1895B = ... # type: Qgis.DistanceUnit
+        ChainsBritishSears1922Truncated = ... # type: Qgis.DistanceUnit
+        ChainsBritishSears1922 = ... # type: Qgis.DistanceUnit
+        ChainsClarkes = ... # type: Qgis.DistanceUnit
+        ChainsUSSurvey = ... # type: Qgis.DistanceUnit
+        FeetBritish1865 = ... # type: Qgis.DistanceUnit
+        FeetBritish1936 = ... # type: Qgis.DistanceUnit
+        FeetBritishBenoit1895A = ... # type: Qgis.DistanceUnit
+        FeetBritishBenoit1895B = ... # type: Qgis.DistanceUnit
+        FeetBritishSears1922Truncated = ... # type: Qgis.DistanceUnit
+        FeetBritishSears1922 = ... # type: Qgis.DistanceUnit
+        FeetClarkes = ... # type: Qgis.DistanceUnit
+        FeetGoldCoast = ... # type: Qgis.DistanceUnit
+        FeetIndian = ... # type: Qgis.DistanceUnit
+        FeetIndian1937 = ... # type: Qgis.DistanceUnit
+        FeetIndian1962 = ... # type: Qgis.DistanceUnit
+        FeetIndian1975 = ... # type: Qgis.DistanceUnit
+        FeetUSSurvey = ... # type: Qgis.DistanceUnit
+        LinksInternational = ... # type: Qgis.DistanceUnit
+        LinksBritishBenoit1895A = ... # type: Qgis.DistanceUnit
+        LinksBritishBenoit1895B = ... # type: Qgis.DistanceUnit
+        LinksBritishSears1922Truncated = ... # type: Qgis.DistanceUnit
+        LinksBritishSears1922 = ... # type: Qgis.DistanceUnit
+        LinksClarkes = ... # type: Qgis.DistanceUnit
+        LinksUSSurvey = ... # type: Qgis.DistanceUnit
+        YardsBritishBenoit1895A = ... # type: Qgis.DistanceUnit
+        YardsBritishBenoit1895B = ... # type: Qgis.DistanceUnit
+        YardsBritishSears1922Truncated = ... # type: Qgis.DistanceUnit
+        YardsBritishSears1922 = ... # type: Qgis.DistanceUnit
+        YardsClarkes = ... # type: Qgis.DistanceUnit
+        YardsIndian = ... # type: Qgis.DistanceUnit
+        YardsIndian1937 = ... # type: Qgis.DistanceUnit
+        YardsIndian1962 = ... # type: Qgis.DistanceUnit
+        YardsIndian1975 = ... # type: Qgis.DistanceUnit
+        MilesUSSurvey = ... # type: Qgis.DistanceUnit
+        Fathoms = ... # type: Qgis.DistanceUnit
+        MetersGermanLegal = ... # type: Qgis.DistanceUnit
+        Unknown = ... # type: Qgis.DistanceUnit
+
+    class UnitType(int):
+        Distance = ... # type: Qgis.UnitType
+        Area = ... # type: Qgis.UnitType
+        Volume = ... # type: Qgis.UnitType
+        Unknown = ... # type: Qgis.UnitType
+        Temporal = ... # type: Qgis.UnitType
+
+    class MapToolUnit(int):
+        Layer = ... # type: Qgis.MapToolUnit
+        Pixels = ... # type: Qgis.MapToolUnit
+        Project = ... # type: Qgis.MapToolUnit
+
+    class SystemOfMeasurement(int):
+        Unknown = ... # type: Qgis.SystemOfMeasurement
+        Metric = ... # type: Qgis.SystemOfMeasurement
+        Imperial = ... # type: Qgis.SystemOfMeasurement
+        USCS = ... # type: Qgis.SystemOfMeasurement
+
+    class BlendMode(int):
+        Normal = ... # type: Qgis.BlendMode
+        Lighten = ... # type: Qgis.BlendMode
+        Screen = ... # type: Qgis.BlendMode
+        Dodge = ... # type: Qgis.BlendMode
+        Addition = ... # type: Qgis.BlendMode
+        Darken = ... # type: Qgis.BlendMode
+        Multiply = ... # type: Qgis.BlendMode
+        Burn = ... # type: Qgis.BlendMode
+        Overlay = ... # type: Qgis.BlendMode
+        SoftLight = ... # type: Qgis.BlendMode
+        HardLight = ... # type: Qgis.BlendMode
+        Difference = ... # type: Qgis.BlendMode
+        Subtract = ... # type: Qgis.BlendMode
+        Source = ... # type: Qgis.BlendMode
+        DestinationOver = ... # type: Qgis.BlendMode
+        Clear = ... # type: Qgis.BlendMode
+        Destination = ... # type: Qgis.BlendMode
+        SourceIn = ... # type: Qgis.BlendMode
+        DestinationIn = ... # type: Qgis.BlendMode
+        SourceOut = ... # type: Qgis.BlendMode
+        DestinationOut = ... # type: Qgis.BlendMode
+        SourceAtop = ... # type: Qgis.BlendMode
+        DestinationAtop = ... # type: Qgis.BlendMode
+        Xor = ... # type: Qgis.BlendMode
+
+    class ElevationMapCombineMethod(int):
+        HighestElevation = ... # type: Qgis.ElevationMapCombineMethod
+        NewerElevation = ... # type: Qgis.ElevationMapCombineMethod
+
+    class RasterProviderCapability(int):
+        NoProviderCapabilities = ... # type: Qgis.RasterProviderCapability
+        ReadLayerMetadata = ... # type: Qgis.RasterProviderCapability
+        WriteLayerMetadata = ... # type: Qgis.RasterProviderCapability
+        ProviderHintBenefitsFromResampling = ... # type: Qgis.RasterProviderCapability
+        ProviderHintCanPerformProviderResampling = ... # type: Qgis.RasterProviderCapability
+        ReloadData = ... # type: Qgis.RasterProviderCapability
+        DpiDependentData = ... # type: Qgis.RasterProviderCapability
+        NativeRasterAttributeTable = ... # type: Qgis.RasterProviderCapability
+        BuildPyramids = ... # type: Qgis.RasterProviderCapability
+
+    class RasterInterfaceCapability(int):
+        NoCapabilities = ... # type: Qgis.RasterInterfaceCapability
+        Size = ... # type: Qgis.RasterInterfaceCapability
+        Create = ... # type: Qgis.RasterInterfaceCapability
+        Remove = ... # type: Qgis.RasterInterfaceCapability
+        BuildPyramids = ... # type: Qgis.RasterInterfaceCapability
+        Identify = ... # type: Qgis.RasterInterfaceCapability
+        IdentifyValue = ... # type: Qgis.RasterInterfaceCapability
+        IdentifyText = ... # type: Qgis.RasterInterfaceCapability
+        IdentifyHtml = ... # type: Qgis.RasterInterfaceCapability
+        IdentifyFeature = ... # type: Qgis.RasterInterfaceCapability
+        Prefetch = ... # type: Qgis.RasterInterfaceCapability
+
+    class RasterIdentifyFormat(int):
+        Undefined = ... # type: Qgis.RasterIdentifyFormat
+        Value = ... # type: Qgis.RasterIdentifyFormat
+        Text = ... # type: Qgis.RasterIdentifyFormat
+        Html = ... # type: Qgis.RasterIdentifyFormat
+        Feature = ... # type: Qgis.RasterIdentifyFormat
+
+    class RasterBuildPyramidOption(int):
+        No = ... # type: Qgis.RasterBuildPyramidOption
+        Yes = ... # type: Qgis.RasterBuildPyramidOption
+        CopyExisting = ... # type: Qgis.RasterBuildPyramidOption
+
+    class RasterPyramidFormat(int):
+        GeoTiff = ... # type: Qgis.RasterPyramidFormat
+        Internal = ... # type: Qgis.RasterPyramidFormat
+        Erdas = ... # type: Qgis.RasterPyramidFormat
+
+    class RasterDrawingStyle(int):
+        Undefined = ... # type: Qgis.RasterDrawingStyle
+        SingleBandGray = ... # type: Qgis.RasterDrawingStyle
+        SingleBandPseudoColor = ... # type: Qgis.RasterDrawingStyle
+        PalettedColor = ... # type: Qgis.RasterDrawingStyle
+        PalettedSingleBandGray = ... # type: Qgis.RasterDrawingStyle
+        PalettedSingleBandPseudoColor = ... # type: Qgis.RasterDrawingStyle
+        PalettedMultiBandColor = ... # type: Qgis.RasterDrawingStyle
+        MultiBandSingleBandGray = ... # type: Qgis.RasterDrawingStyle
+        MultiBandSingleBandPseudoColor = ... # type: Qgis.RasterDrawingStyle
+        MultiBandColor = ... # type: Qgis.RasterDrawingStyle
+        SingleBandColorData = ... # type: Qgis.RasterDrawingStyle
+
+    class RasterLayerType(int):
+        GrayOrUndefined = ... # type: Qgis.RasterLayerType
+        Palette = ... # type: Qgis.RasterLayerType
+        MultiBand = ... # type: Qgis.RasterLayerType
+        SingleBandColorData = ... # type: Qgis.RasterLayerType
+
+    class RasterColorInterpretation(int):
+        Undefined = ... # type: Qgis.RasterColorInterpretation
+        GrayIndex = ... # type: Qgis.RasterColorInterpretation
+        PaletteIndex = ... # type: Qgis.RasterColorInterpretation
+        RedBand = ... # type: Qgis.RasterColorInterpretation
+        GreenBand = ... # type: Qgis.RasterColorInterpretation
+        BlueBand = ... # type: Qgis.RasterColorInterpretation
+        AlphaBand = ... # type: Qgis.RasterColorInterpretation
+        HueBand = ... # type: Qgis.RasterColorInterpretation
+        SaturationBand = ... # type: Qgis.RasterColorInterpretation
+        LightnessBand = ... # type: Qgis.RasterColorInterpretation
+        CyanBand = ... # type: Qgis.RasterColorInterpretation
+        MagentaBand = ... # type: Qgis.RasterColorInterpretation
+        YellowBand = ... # type: Qgis.RasterColorInterpretation
+        BlackBand = ... # type: Qgis.RasterColorInterpretation
+        YCbCr_YBand = ... # type: Qgis.RasterColorInterpretation
+        YCbCr_CbBand = ... # type: Qgis.RasterColorInterpretation
+        YCbCr_CrBand = ... # type: Qgis.RasterColorInterpretation
+        ContinuousPalette = ... # type: Qgis.RasterColorInterpretation
+        PanBand = ... # type: Qgis.RasterColorInterpretation
+        CoastalBand = ... # type: Qgis.RasterColorInterpretation
+        RedEdgeBand = ... # type: Qgis.RasterColorInterpretation
+        NIRBand = ... # type: Qgis.RasterColorInterpretation
+        SWIRBand = ... # type: Qgis.RasterColorInterpretation
+        MWIRBand = ... # type: Qgis.RasterColorInterpretation
+        LWIRBand = ... # type: Qgis.RasterColorInterpretation
+        TIRBand = ... # type: Qgis.RasterColorInterpretation
+        OtherIRBand = ... # type: Qgis.RasterColorInterpretation
+        SAR_Ka_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_K_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_Ku_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_X_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_C_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_S_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_L_Band = ... # type: Qgis.RasterColorInterpretation
+        SAR_P_Band = ... # type: Qgis.RasterColorInterpretation
+
+    class MetadataDateType(int):
+        Created = ... # type: Qgis.MetadataDateType
+        Published = ... # type: Qgis.MetadataDateType
+        Revised = ... # type: Qgis.MetadataDateType
+        Superseded = ... # type: Qgis.MetadataDateType
+
+    class AttributeActionType(int):
+        Generic = ... # type: Qgis.AttributeActionType
+        GenericPython = ... # type: Qgis.AttributeActionType
+        Mac = ... # type: Qgis.AttributeActionType
+        Windows = ... # type: Qgis.AttributeActionType
+        Unix = ... # type: Qgis.AttributeActionType
+        OpenUrl = ... # type: Qgis.AttributeActionType
+        SubmitUrlEncoded = ... # type: Qgis.AttributeActionType
+        SubmitUrlMultipart = ... # type: Qgis.AttributeActionType
+
+    class MapLayerActionFlag(int):
+        EnabledOnlyWhenEditable = ... # type: Qgis.MapLayerActionFlag
+        EnableOnlyWhenHasGeometry = ... # type: Qgis.MapLayerActionFlag
+
+    class MapLayerActionTarget(int):
+        Layer = ... # type: Qgis.MapLayerActionTarget
+        SingleFeature = ... # type: Qgis.MapLayerActionTarget
+        MultipleFeatures = ... # type: Qgis.MapLayerActionTarget
+        AllActions = ... # type: Qgis.MapLayerActionTarget
+
+    class ActionType(int):
+        Invalid = ... # type: Qgis.ActionType
+        MapLayerAction = ... # type: Qgis.ActionType
+        AttributeAction = ... # type: Qgis.ActionType
+
+    class LegendJsonRenderFlag(int):
+        ShowRuleDetails = ... # type: Qgis.LegendJsonRenderFlag
+
+    class LegendComponent(int):
+        Undefined = ... # type: Qgis.LegendComponent
+        Hidden = ... # type: Qgis.LegendComponent
+        Title = ... # type: Qgis.LegendComponent
+        Group = ... # type: Qgis.LegendComponent
+        Subgroup = ... # type: Qgis.LegendComponent
+        Symbol = ... # type: Qgis.LegendComponent
+        SymbolLabel = ... # type: Qgis.LegendComponent
+
+    class LayerTreeFilterFlag(int):
+        SkipVisibilityCheck = ... # type: Qgis.LayerTreeFilterFlag
+
+    class LayerTreeInsertionMethod(int):
+        AboveInsertionPoint = ... # type: Qgis.LayerTreeInsertionMethod
+        TopOfTree = ... # type: Qgis.LayerTreeInsertionMethod
+        OptimalInInsertionGroup = ... # type: Qgis.LayerTreeInsertionMethod
+
+    class ScriptLanguageCapability(int):
+        Reformat = ... # type: Qgis.ScriptLanguageCapability
+        CheckSyntax = ... # type: Qgis.ScriptLanguageCapability
+        ToggleComment = ... # type: Qgis.ScriptLanguageCapability
+
+    class ScriptLanguage(int):
+        Css = ... # type: Qgis.ScriptLanguage
+        QgisExpression = ... # type: Qgis.ScriptLanguage
+        Html = ... # type: Qgis.ScriptLanguage
+        JavaScript = ... # type: Qgis.ScriptLanguage
+        Json = ... # type: Qgis.ScriptLanguage
+        Python = ... # type: Qgis.ScriptLanguage
+        R = ... # type: Qgis.ScriptLanguage
+        Sql = ... # type: Qgis.ScriptLanguage
+        Batch = ... # type: Qgis.ScriptLanguage
+        Bash = ... # type: Qgis.ScriptLanguage
+        Unknown = ... # type: Qgis.ScriptLanguage
+
+    class SettingsOrigin(int):
+        Any = ... # type: Qgis.SettingsOrigin
+        Global = ... # type: Qgis.SettingsOrigin
+        Local = ... # type: Qgis.SettingsOrigin
+
+    class CoordinateDisplayType(int):
+        MapCrs = ... # type: Qgis.CoordinateDisplayType
+        MapGeographic = ... # type: Qgis.CoordinateDisplayType
+        CustomCrs = ... # type: Qgis.CoordinateDisplayType
+
+    class RelationshipCapability(int):
+        MultipleFieldKeys = ... # type: Qgis.RelationshipCapability
+        ForwardPathLabel = ... # type: Qgis.RelationshipCapability
+        BackwardPathLabel = ... # type: Qgis.RelationshipCapability
+
+    class RelationshipCardinality(int):
+        OneToOne = ... # type: Qgis.RelationshipCardinality
+        OneToMany = ... # type: Qgis.RelationshipCardinality
+        ManyToOne = ... # type: Qgis.RelationshipCardinality
+        ManyToMany = ... # type: Qgis.RelationshipCardinality
+
+    class RelationshipStrength(int):
+        Association = ... # type: Qgis.RelationshipStrength
+        Composition = ... # type: Qgis.RelationshipStrength
+
+    class RelationshipType(int):
+        Normal = ... # type: Qgis.RelationshipType
+        Generated = ... # type: Qgis.RelationshipType
+
+    class ArcGisRestServiceType(int):
+        FeatureServer = ... # type: Qgis.ArcGisRestServiceType
+        MapServer = ... # type: Qgis.ArcGisRestServiceType
+        ImageServer = ... # type: Qgis.ArcGisRestServiceType
+        GlobeServer = ... # type: Qgis.ArcGisRestServiceType
+        GPServer = ... # type: Qgis.ArcGisRestServiceType
+        GeocodeServer = ... # type: Qgis.ArcGisRestServiceType
+        Unknown = ... # type: Qgis.ArcGisRestServiceType
+
+    class MapBoxGlStyleSourceType(int):
+        Vector = ... # type: Qgis.MapBoxGlStyleSourceType
+        Raster = ... # type: Qgis.MapBoxGlStyleSourceType
+        RasterDem = ... # type: Qgis.MapBoxGlStyleSourceType
+        GeoJson = ... # type: Qgis.MapBoxGlStyleSourceType
+        Image = ... # type: Qgis.MapBoxGlStyleSourceType
+        Video = ... # type: Qgis.MapBoxGlStyleSourceType
+        Unknown = ... # type: Qgis.MapBoxGlStyleSourceType
+
+    class ProjectCapability(int):
+        ProjectStyles = ... # type: Qgis.ProjectCapability
+
+    class ProjectReadFlag(int):
+        DontResolveLayers = ... # type: Qgis.ProjectReadFlag
+        DontLoadLayouts = ... # type: Qgis.ProjectReadFlag
+        TrustLayerMetadata = ... # type: Qgis.ProjectReadFlag
+        DontStoreOriginalStyles = ... # type: Qgis.ProjectReadFlag
+        DontLoad3DViews = ... # type: Qgis.ProjectReadFlag
+        DontLoadProjectStyles = ... # type: Qgis.ProjectReadFlag
+        ForceReadOnlyLayers = ... # type: Qgis.ProjectReadFlag
+        DontUpgradeAnnotations = ... # type: Qgis.ProjectReadFlag
+
+    class ProjectFileFormat(int):
+        Qgz = ... # type: Qgis.ProjectFileFormat
+        Qgs = ... # type: Qgis.ProjectFileFormat
+
+    class AvoidIntersectionsMode(int):
+        AllowIntersections = ... # type: Qgis.AvoidIntersectionsMode
+        AvoidIntersectionsCurrentLayer = ... # type: Qgis.AvoidIntersectionsMode
+        AvoidIntersectionsLayers = ... # type: Qgis.AvoidIntersectionsMode
+
+    class PointCloudDrawOrder(int):
+        Default = ... # type: Qgis.PointCloudDrawOrder
+        BottomToTop = ... # type: Qgis.PointCloudDrawOrder
+        TopToBottom = ... # type: Qgis.PointCloudDrawOrder
+
+    class PointCloudSymbol(int):
+        Square = ... # type: Qgis.PointCloudSymbol
+        Circle = ... # type: Qgis.PointCloudSymbol
+
+    class ProfileExportType(int):
+        Features3D = ... # type: Qgis.ProfileExportType
+        Profile2D = ... # type: Qgis.ProfileExportType
+        DistanceVsElevationTable = ... # type: Qgis.ProfileExportType
+
+    class ProfileGeneratorFlag(int):
+        RespectsMaximumErrorMapUnit = ... # type: Qgis.ProfileGeneratorFlag
+        RespectsDistanceRange = ... # type: Qgis.ProfileGeneratorFlag
+        RespectsElevationRange = ... # type: Qgis.ProfileGeneratorFlag
+
+    class VectorProfileType(int):
+        IndividualFeatures = ... # type: Qgis.VectorProfileType
+        ContinuousSurface = ... # type: Qgis.VectorProfileType
+
+    class ProfileSurfaceSymbology(int):
+        Line = ... # type: Qgis.ProfileSurfaceSymbology
+        FillBelow = ... # type: Qgis.ProfileSurfaceSymbology
+        FillAbove = ... # type: Qgis.ProfileSurfaceSymbology
+
+    class VerticalAxisInversion(int):
+        Never = ... # type: Qgis.VerticalAxisInversion
+        WhenDragging = ... # type: Qgis.VerticalAxisInversion
+        Always = ... # type: Qgis.VerticalAxisInversion
+
+    class SceneMode(int):
+        Local = ... # type: Qgis.SceneMode
+        Globe = ... # type: Qgis.SceneMode
+
+    class NavigationMode(int):
+        TerrainBased = ... # type: Qgis.NavigationMode
+        Walk = ... # type: Qgis.NavigationMode
+        GlobeTerrainBased = ... # type: Qgis.NavigationMode
+
+    class LightSourceType(int):
+        Point = ... # type: Qgis.LightSourceType
+        Directional = ... # type: Qgis.LightSourceType
+
+    class Point3DShape(int):
+        Cylinder = ... # type: Qgis.Point3DShape
+        Sphere = ... # type: Qgis.Point3DShape
+        Cone = ... # type: Qgis.Point3DShape
+        Cube = ... # type: Qgis.Point3DShape
+        Torus = ... # type: Qgis.Point3DShape
+        Plane = ... # type: Qgis.Point3DShape
+        ExtrudedText = ... # type: Qgis.Point3DShape
+        Model = ... # type: Qgis.Point3DShape
+        Billboard = ... # type: Qgis.Point3DShape
+
+    class PlotToolFlag(int):
+        ShowContextMenu = ... # type: Qgis.PlotToolFlag
+
+    class ProjectFlag(int):
+        EvaluateDefaultValuesOnProviderSide = ... # type: Qgis.ProjectFlag
+        TrustStoredLayerStatistics = ... # type: Qgis.ProjectFlag
+        RememberLayerEditStatusBetweenSessions = ... # type: Qgis.ProjectFlag
+        RememberAttributeTableWindowsBetweenSessions = ... # type: Qgis.ProjectFlag
+
+    class CadConstraintType(int):
+        Generic = ... # type: Qgis.CadConstraintType
+        Angle = ... # type: Qgis.CadConstraintType
+        Distance = ... # type: Qgis.CadConstraintType
+        XCoordinate = ... # type: Qgis.CadConstraintType
+        YCoordinate = ... # type: Qgis.CadConstraintType
+        ZValue = ... # type: Qgis.CadConstraintType
+        MValue = ... # type: Qgis.CadConstraintType
+
+    class LineExtensionSide(int):
+        BeforeVertex = ... # type: Qgis.LineExtensionSide
+        AfterVertex = ... # type: Qgis.LineExtensionSide
+        NoVertex = ... # type: Qgis.LineExtensionSide
+
+    class BetweenLineConstraint(int):
+        NoConstraint = ... # type: Qgis.BetweenLineConstraint
+        Perpendicular = ... # type: Qgis.BetweenLineConstraint
+        Parallel = ... # type: Qgis.BetweenLineConstraint
+
+    class MeshElevationMode(int):
+        FixedElevationRange = ... # type: Qgis.MeshElevationMode
+        FromVertices = ... # type: Qgis.MeshElevationMode
+        FixedRangePerGroup = ... # type: Qgis.MeshElevationMode
+
+    class RasterElevationMode(int):
+        FixedElevationRange = ... # type: Qgis.RasterElevationMode
+        RepresentsElevationSurface = ... # type: Qgis.RasterElevationMode
+        FixedRangePerBand = ... # type: Qgis.RasterElevationMode
+        DynamicRangePerBand = ... # type: Qgis.RasterElevationMode
+
+    class RangeLimits(int):
+        IncludeBoth = ... # type: Qgis.RangeLimits
+        IncludeLowerExcludeUpper = ... # type: Qgis.RangeLimits
+        ExcludeLowerIncludeUpper = ... # type: Qgis.RangeLimits
+        ExcludeBoth = ... # type: Qgis.RangeLimits
+
+    class AltitudeBinding(int):
+        Vertex = ... # type: Qgis.AltitudeBinding
+        Centroid = ... # type: Qgis.AltitudeBinding
+
+    class AltitudeClamping(int):
+        Absolute = ... # type: Qgis.AltitudeClamping
+        Relative = ... # type: Qgis.AltitudeClamping
+        Terrain = ... # type: Qgis.AltitudeClamping
+
+    class TransactionMode(int):
+        Disabled = ... # type: Qgis.TransactionMode
+        AutomaticGroups = ... # type: Qgis.TransactionMode
+        BufferedGroups = ... # type: Qgis.TransactionMode
+
+    class FieldDomainType(int):
+        Coded = ... # type: Qgis.FieldDomainType
+        Range = ... # type: Qgis.FieldDomainType
+        Glob = ... # type: Qgis.FieldDomainType
+
+    class FieldDuplicatePolicy(int):
+        DefaultValue = ... # type: Qgis.FieldDuplicatePolicy
+        Duplicate = ... # type: Qgis.FieldDuplicatePolicy
+        UnsetField = ... # type: Qgis.FieldDuplicatePolicy
+
+    class FieldDomainMergePolicy(int):
+        DefaultValue = ... # type: Qgis.FieldDomainMergePolicy
+        Sum = ... # type: Qgis.FieldDomainMergePolicy
+        GeometryWeighted = ... # type: Qgis.FieldDomainMergePolicy
+        UnsetField = ... # type: Qgis.FieldDomainMergePolicy
+        LargestGeometry = ... # type: Qgis.FieldDomainMergePolicy
+        MinimumValue = ... # type: Qgis.FieldDomainMergePolicy
+        MaximumValue = ... # type: Qgis.FieldDomainMergePolicy
+        SetToNull = ... # type: Qgis.FieldDomainMergePolicy
+
+    class FieldDomainSplitPolicy(int):
+        DefaultValue = ... # type: Qgis.FieldDomainSplitPolicy
+        Duplicate = ... # type: Qgis.FieldDomainSplitPolicy
+        GeometryRatio = ... # type: Qgis.FieldDomainSplitPolicy
+        UnsetField = ... # type: Qgis.FieldDomainSplitPolicy
+
+    class CrsDefinitionFormat(int):
+        Wkt = ... # type: Qgis.CrsDefinitionFormat
+        Proj = ... # type: Qgis.CrsDefinitionFormat
+
+    class ProcessingTinInputLayerType(int):
+        Vertices = ... # type: Qgis.ProcessingTinInputLayerType
+        StructureLines = ... # type: Qgis.ProcessingTinInputLayerType
+        BreakLines = ... # type: Qgis.ProcessingTinInputLayerType
+
+    class ProcessingModelChildAlgorithmExecutionStatus(int):
+        NotExecuted = ... # type: Qgis.ProcessingModelChildAlgorithmExecutionStatus
+        Success = ... # type: Qgis.ProcessingModelChildAlgorithmExecutionStatus
+        Failed = ... # type: Qgis.ProcessingModelChildAlgorithmExecutionStatus
+
+    class ProcessingModelChildParameterSource(int):
+        ModelParameter = ... # type: Qgis.ProcessingModelChildParameterSource
+        ChildOutput = ... # type: Qgis.ProcessingModelChildParameterSource
+        StaticValue = ... # type: Qgis.ProcessingModelChildParameterSource
+        Expression = ... # type: Qgis.ProcessingModelChildParameterSource
+        ExpressionText = ... # type: Qgis.ProcessingModelChildParameterSource
+        ModelOutput = ... # type: Qgis.ProcessingModelChildParameterSource
+
+    class ProcessingDateTimeParameterDataType(int):
+        DateTime = ... # type: Qgis.ProcessingDateTimeParameterDataType
+        Date = ... # type: Qgis.ProcessingDateTimeParameterDataType
+        Time = ... # type: Qgis.ProcessingDateTimeParameterDataType
+
+    class ProcessingFieldParameterDataType(int):
+        Any = ... # type: Qgis.ProcessingFieldParameterDataType
+        Numeric = ... # type: Qgis.ProcessingFieldParameterDataType
+        String = ... # type: Qgis.ProcessingFieldParameterDataType
+        DateTime = ... # type: Qgis.ProcessingFieldParameterDataType
+        Binary = ... # type: Qgis.ProcessingFieldParameterDataType
+        Boolean = ... # type: Qgis.ProcessingFieldParameterDataType
+
+    class ProcessingNumberParameterType(int):
+        Integer = ... # type: Qgis.ProcessingNumberParameterType
+        Double = ... # type: Qgis.ProcessingNumberParameterType
+
+    class ProcessingFileParameterBehavior(int):
+        File = ... # type: Qgis.ProcessingFileParameterBehavior
+        Folder = ... # type: Qgis.ProcessingFileParameterBehavior
+
+    class ProcessingParameterFlag(int):
+        Advanced = ... # type: Qgis.ProcessingParameterFlag
+        Hidden = ... # type: Qgis.ProcessingParameterFlag
+        Optional = ... # type: Qgis.ProcessingParameterFlag
+        IsModelOutput = ... # type: Qgis.ProcessingParameterFlag
+
+    class ProcessingParameterTypeFlag(int):
+        ExposeToModeler = ... # type: Qgis.ProcessingParameterTypeFlag
+
+    class ProcessingFeatureSourceFlag(int):
+        SkipGeometryValidityChecks = ... # type: Qgis.ProcessingFeatureSourceFlag
+
+    class ProcessingFeatureSourceDefinitionFlag(int):
+        OverrideDefaultGeometryCheck = ... # type: Qgis.ProcessingFeatureSourceDefinitionFlag
+        CreateIndividualOutputPerInputFeature = ... # type: Qgis.ProcessingFeatureSourceDefinitionFlag
+
+    class ProcessingMode(int):
+        Standard = ... # type: Qgis.ProcessingMode
+        Batch = ... # type: Qgis.ProcessingMode
+        Modeler = ... # type: Qgis.ProcessingMode
+
+    class ProcessingLogLevel(int):
+        DefaultLevel = ... # type: Qgis.ProcessingLogLevel
+        Verbose = ... # type: Qgis.ProcessingLogLevel
+        ModelDebug = ... # type: Qgis.ProcessingLogLevel
+
+    class ProcessingPropertyAvailability(int):
+        NotAvailable = ... # type: Qgis.ProcessingPropertyAvailability
+        Available = ... # type: Qgis.ProcessingPropertyAvailability
+
+    class ProcessingAlgorithmDocumentationFlag(int):
+        RegeneratesPrimaryKey = ... # type: Qgis.ProcessingAlgorithmDocumentationFlag
+        RegeneratesPrimaryKeyInSomeScenarios = ... # type: Qgis.ProcessingAlgorithmDocumentationFlag
+
+    class ProcessingAlgorithmFlag(int):
+        HideFromToolbox = ... # type: Qgis.ProcessingAlgorithmFlag
+        HideFromModeler = ... # type: Qgis.ProcessingAlgorithmFlag
+        SupportsBatch = ... # type: Qgis.ProcessingAlgorithmFlag
+        CanCancel = ... # type: Qgis.ProcessingAlgorithmFlag
+        RequiresMatchingCrs = ... # type: Qgis.ProcessingAlgorithmFlag
+        NoThreading = ... # type: Qgis.ProcessingAlgorithmFlag
+        DisplayNameIsLiteral = ... # type: Qgis.ProcessingAlgorithmFlag
+        SupportsInPlaceEdits = ... # type: Qgis.ProcessingAlgorithmFlag
+        KnownIssues = ... # type: Qgis.ProcessingAlgorithmFlag
+        CustomException = ... # type: Qgis.ProcessingAlgorithmFlag
+        PruneModelBranchesBasedOnAlgorithmResults = ... # type: Qgis.ProcessingAlgorithmFlag
+        SkipGenericModelLogging = ... # type: Qgis.ProcessingAlgorithmFlag
+        NotAvailableInStandaloneTool = ... # type: Qgis.ProcessingAlgorithmFlag
+        RequiresProject = ... # type: Qgis.ProcessingAlgorithmFlag
+        SecurityRisk = ... # type: Qgis.ProcessingAlgorithmFlag
+        Deprecated = ... # type: Qgis.ProcessingAlgorithmFlag
+
+    class ProcessingProviderFlag(int):
+        DeemphasiseSearchResults = ... # type: Qgis.ProcessingProviderFlag
+        CompatibleWithVirtualRaster = ... # type: Qgis.ProcessingProviderFlag
+
+    class ProcessingSourceType(int):
+        MapLayer = ... # type: Qgis.ProcessingSourceType
+        VectorAnyGeometry = ... # type: Qgis.ProcessingSourceType
+        VectorPoint = ... # type: Qgis.ProcessingSourceType
+        VectorLine = ... # type: Qgis.ProcessingSourceType
+        VectorPolygon = ... # type: Qgis.ProcessingSourceType
+        Raster = ... # type: Qgis.ProcessingSourceType
+        File = ... # type: Qgis.ProcessingSourceType
+        Vector = ... # type: Qgis.ProcessingSourceType
+        Mesh = ... # type: Qgis.ProcessingSourceType
+        Plugin = ... # type: Qgis.ProcessingSourceType
+        PointCloud = ... # type: Qgis.ProcessingSourceType
+        Annotation = ... # type: Qgis.ProcessingSourceType
+        VectorTile = ... # type: Qgis.ProcessingSourceType
+        TiledScene = ... # type: Qgis.ProcessingSourceType
+
+    class QueryStorageBackend(int):
+        LocalProfile = ... # type: Qgis.QueryStorageBackend
+        CurrentProject = ... # type: Qgis.QueryStorageBackend
+
+    class HistoryProviderBackend(int):
+        LocalProfile = ... # type: Qgis.HistoryProviderBackend
+
+    class MapRecenteringMode(int):
+        Always = ... # type: Qgis.MapRecenteringMode
+        WhenOutsideVisibleExtent = ... # type: Qgis.MapRecenteringMode
+        Never = ... # type: Qgis.MapRecenteringMode
+
+    class ViewSyncModeFlag(int):
+        Sync3DTo2D = ... # type: Qgis.ViewSyncModeFlag
+        Sync2DTo3D = ... # type: Qgis.ViewSyncModeFlag
+
+    class MapCanvasFlag(int):
+        ShowMainAnnotationLayer = ... # type: Qgis.MapCanvasFlag
+
+    class RendererUsage(int):
+        View = ... # type: Qgis.RendererUsage
+        Export = ... # type: Qgis.RendererUsage
+        Unknown = ... # type: Qgis.RendererUsage
+
+    class AngularDirection(int):
+        Clockwise = ... # type: Qgis.AngularDirection
+        CounterClockwise = ... # type: Qgis.AngularDirection
+        NoOrientation = ... # type: Qgis.AngularDirection
+
+    class ScaleToTileZoomLevelMethod(int):
+        MapBox = ... # type: Qgis.ScaleToTileZoomLevelMethod
+        Esri = ... # type: Qgis.ScaleToTileZoomLevelMethod
+
+    class TextRendererFlag(int):
+        WrapLines = ... # type: Qgis.TextRendererFlag
+
+    class Capitalization(int):
+        MixedCase = ... # type: Qgis.Capitalization
+        AllUppercase = ... # type: Qgis.Capitalization
+        AllLowercase = ... # type: Qgis.Capitalization
+        ForceFirstLetterToCapital = ... # type: Qgis.Capitalization
+        SmallCaps = ... # type: Qgis.Capitalization
+        TitleCase = ... # type: Qgis.Capitalization
+        UpperCamelCase = ... # type: Qgis.Capitalization
+        AllSmallCaps = ... # type: Qgis.Capitalization
+
+    class TilePixelRatio(int):
+        Undefined = ... # type: Qgis.TilePixelRatio
+        StandardDpi = ... # type: Qgis.TilePixelRatio
+        HighDpi = ... # type: Qgis.TilePixelRatio
+
+    class DpiMode(int):
+        All = ... # type: Qgis.DpiMode
+        Off = ... # type: Qgis.DpiMode
+        QGIS = ... # type: Qgis.DpiMode
+        UMN = ... # type: Qgis.DpiMode
+        GeoServer = ... # type: Qgis.DpiMode
+
+    class PlotAxisSuffixPlacement(int):
+        NoLabels = ... # type: Qgis.PlotAxisSuffixPlacement
+        EveryLabel = ... # type: Qgis.PlotAxisSuffixPlacement
+        FirstLabel = ... # type: Qgis.PlotAxisSuffixPlacement
+        LastLabel = ... # type: Qgis.PlotAxisSuffixPlacement
+        FirstAndLastLabels = ... # type: Qgis.PlotAxisSuffixPlacement
+
+    class GraduatedMethod(int):
+        Color = ... # type: Qgis.GraduatedMethod
+        Size = ... # type: Qgis.GraduatedMethod
+
+    class DashPatternSizeAdjustment(int):
+        ScaleBothDashAndGap = ... # type: Qgis.DashPatternSizeAdjustment
+        ScaleDashOnly = ... # type: Qgis.DashPatternSizeAdjustment
+        ScaleGapOnly = ... # type: Qgis.DashPatternSizeAdjustment
+
+    class DashPatternLineEndingRule(int):
+        NoRule = ... # type: Qgis.DashPatternLineEndingRule
+        FullDash = ... # type: Qgis.DashPatternLineEndingRule
+        HalfDash = ... # type: Qgis.DashPatternLineEndingRule
+        FullGap = ... # type: Qgis.DashPatternLineEndingRule
+        HalfGap = ... # type: Qgis.DashPatternLineEndingRule
+
+    class LineClipMode(int):
+        ClipPainterOnly = ... # type: Qgis.LineClipMode
+        ClipToIntersection = ... # type: Qgis.LineClipMode
+        NoClipping = ... # type: Qgis.LineClipMode
+
+    class MarkerClipMode(int):
+        NoClipping = ... # type: Qgis.MarkerClipMode
+        Shape = ... # type: Qgis.MarkerClipMode
+        CentroidWithin = ... # type: Qgis.MarkerClipMode
+        CompletelyWithin = ... # type: Qgis.MarkerClipMode
+
+    class PointCountMethod(int):
+        Absolute = ... # type: Qgis.PointCountMethod
+        DensityBased = ... # type: Qgis.PointCountMethod
+
+    class GradientSpread(int):
+        Pad = ... # type: Qgis.GradientSpread
+        Reflect = ... # type: Qgis.GradientSpread
+        Repeat = ... # type: Qgis.GradientSpread
+
+    class SymbolCoordinateReference(int):
+        Feature = ... # type: Qgis.SymbolCoordinateReference
+        Viewport = ... # type: Qgis.SymbolCoordinateReference
+
+    class GradientType(int):
+        Linear = ... # type: Qgis.GradientType
+        Radial = ... # type: Qgis.GradientType
+        Conical = ... # type: Qgis.GradientType
+
+    class GradientColorSource(int):
+        SimpleTwoColor = ... # type: Qgis.GradientColorSource
+        ColorRamp = ... # type: Qgis.GradientColorSource
+
+    class LinearReferencingLabelSource(int):
+        CartesianDistance2D = ... # type: Qgis.LinearReferencingLabelSource
+        Z = ... # type: Qgis.LinearReferencingLabelSource
+        M = ... # type: Qgis.LinearReferencingLabelSource
+
+    class LinearReferencingPlacement(int):
+        IntervalCartesian2D = ... # type: Qgis.LinearReferencingPlacement
+        IntervalZ = ... # type: Qgis.LinearReferencingPlacement
+        IntervalM = ... # type: Qgis.LinearReferencingPlacement
+        Vertex = ... # type: Qgis.LinearReferencingPlacement
+
+    class MarkerLinePlacement(int):
+        Interval = ... # type: Qgis.MarkerLinePlacement
+        Vertex = ... # type: Qgis.MarkerLinePlacement
+        LastVertex = ... # type: Qgis.MarkerLinePlacement
+        FirstVertex = ... # type: Qgis.MarkerLinePlacement
+        CentralPoint = ... # type: Qgis.MarkerLinePlacement
+        CurvePoint = ... # type: Qgis.MarkerLinePlacement
+        SegmentCenter = ... # type: Qgis.MarkerLinePlacement
+        InnerVertices = ... # type: Qgis.MarkerLinePlacement
+
+    class MarkerShape(int):
+        Square = ... # type: Qgis.MarkerShape
+        Diamond = ... # type: Qgis.MarkerShape
+        Pentagon = ... # type: Qgis.MarkerShape
+        Hexagon = ... # type: Qgis.MarkerShape
+        Triangle = ... # type: Qgis.MarkerShape
+        EquilateralTriangle = ... # type: Qgis.MarkerShape
+        Star = ... # type: Qgis.MarkerShape
+        Arrow = ... # type: Qgis.MarkerShape
+        Circle = ... # type: Qgis.MarkerShape
+        Cross = ... # type: Qgis.MarkerShape
+        CrossFill = ... # type: Qgis.MarkerShape
+        Cross2 = ... # type: Qgis.MarkerShape
+        Line = ... # type: Qgis.MarkerShape
+        ArrowHead = ... # type: Qgis.MarkerShape
+        ArrowHeadFilled = ... # type: Qgis.MarkerShape
+        SemiCircle = ... # type: Qgis.MarkerShape
+        ThirdCircle = ... # type: Qgis.MarkerShape
+        QuarterCircle = ... # type: Qgis.MarkerShape
+        QuarterSquare = ... # type: Qgis.MarkerShape
+        HalfSquare = ... # type: Qgis.MarkerShape
+        DiagonalHalfSquare = ... # type: Qgis.MarkerShape
+        RightHalfTriangle = ... # type: Qgis.MarkerShape
+        LeftHalfTriangle = ... # type: Qgis.MarkerShape
+        Octagon = ... # type: Qgis.MarkerShape
+        SquareWithCorners = ... # type: Qgis.MarkerShape
+        AsteriskFill = ... # type: Qgis.MarkerShape
+        HalfArc = ... # type: Qgis.MarkerShape
+        ThirdArc = ... # type: Qgis.MarkerShape
+        QuarterArc = ... # type: Qgis.MarkerShape
+        ParallelogramRight = ... # type: Qgis.MarkerShape
+        ParallelogramLeft = ... # type: Qgis.MarkerShape
+        Trapezoid = ... # type: Qgis.MarkerShape
+        Shield = ... # type: Qgis.MarkerShape
+        DiamondStar = ... # type: Qgis.MarkerShape
+        Heart = ... # type: Qgis.MarkerShape
+        Decagon = ... # type: Qgis.MarkerShape
+        RoundedSquare = ... # type: Qgis.MarkerShape
+
+    class VertexType(int):
+        Segment = ... # type: Qgis.VertexType
+        Curve = ... # type: Qgis.VertexType
+
+    class RenderSubcomponentProperty(int):
+        Generic = ... # type: Qgis.RenderSubcomponentProperty
+        ShadowOffset = ... # type: Qgis.RenderSubcomponentProperty
+        BlurSize = ... # type: Qgis.RenderSubcomponentProperty
+        GlowSpread = ... # type: Qgis.RenderSubcomponentProperty
+
+    class VectorRenderingSimplificationFlag(int):
+        NoSimplification = ... # type: Qgis.VectorRenderingSimplificationFlag
+        GeometrySimplification = ... # type: Qgis.VectorRenderingSimplificationFlag
+        AntialiasingSimplification = ... # type: Qgis.VectorRenderingSimplificationFlag
+        FullSimplification = ... # type: Qgis.VectorRenderingSimplificationFlag
+
+    class VectorSimplificationAlgorithm(int):
+        Distance = ... # type: Qgis.VectorSimplificationAlgorithm
+        SnapToGrid = ... # type: Qgis.VectorSimplificationAlgorithm
+        Visvalingam = ... # type: Qgis.VectorSimplificationAlgorithm
+        SnappedToGridGlobal = ... # type: Qgis.VectorSimplificationAlgorithm
+
+    class CurvedTextFlag(int):
+        TruncateStringWhenLineIsTooShort = ... # type: Qgis.CurvedTextFlag
+        UseBaselinePlacement = ... # type: Qgis.CurvedTextFlag
+        UprightCharactersOnly = ... # type: Qgis.CurvedTextFlag
+        ExtendLineToFitText = ... # type: Qgis.CurvedTextFlag
+
+    class TextCharacterVerticalAlignment(int):
+        Normal = ... # type: Qgis.TextCharacterVerticalAlignment
+        SuperScript = ... # type: Qgis.TextCharacterVerticalAlignment
+        SubScript = ... # type: Qgis.TextCharacterVerticalAlignment
+
+    class TextVerticalAlignment(int):
+        Top = ... # type: Qgis.TextVerticalAlignment
+        VerticalCenter = ... # type: Qgis.TextVerticalAlignment
+        Bottom = ... # type: Qgis.TextVerticalAlignment
+
+    class TextHorizontalAlignment(int):
+        Left = ... # type: Qgis.TextHorizontalAlignment
+        Center = ... # type: Qgis.TextHorizontalAlignment
+        Right = ... # type: Qgis.TextHorizontalAlignment
+        Justify = ... # type: Qgis.TextHorizontalAlignment
+
+    class TextComponent(int):
+        Text = ... # type: Qgis.TextComponent
+        Buffer = ... # type: Qgis.TextComponent
+        Background = ... # type: Qgis.TextComponent
+        Shadow = ... # type: Qgis.TextComponent
+
+    class TextLayoutMode(int):
+        Rectangle = ... # type: Qgis.TextLayoutMode
+        Point = ... # type: Qgis.TextLayoutMode
+        Labeling = ... # type: Qgis.TextLayoutMode
+        RectangleCapHeightBased = ... # type: Qgis.TextLayoutMode
+        RectangleAscentBased = ... # type: Qgis.TextLayoutMode
+
+    class TextOrientation(int):
+        Horizontal = ... # type: Qgis.TextOrientation
+        Vertical = ... # type: Qgis.TextOrientation
+        RotationBased = ... # type: Qgis.TextOrientation
+
+    class LabelPlacementEngineVersion(int):
+        Version1 = ... # type: Qgis.LabelPlacementEngineVersion
+        Version2 = ... # type: Qgis.LabelPlacementEngineVersion
+
+    class LabelingFlag(int):
+        UseAllLabels = ... # type: Qgis.LabelingFlag
+        UsePartialCandidates = ... # type: Qgis.LabelingFlag
+        RenderOutlineLabels = ... # type: Qgis.LabelingFlag
+        DrawLabelRectOnly = ... # type: Qgis.LabelingFlag
+        DrawCandidates = ... # type: Qgis.LabelingFlag
+        DrawUnplacedLabels = ... # type: Qgis.LabelingFlag
+        CollectUnplacedLabels = ... # type: Qgis.LabelingFlag
+        DrawLabelMetrics = ... # type: Qgis.LabelingFlag
+
+    class TextRenderFormat(int):
+        AlwaysOutlines = ... # type: Qgis.TextRenderFormat
+        AlwaysText = ... # type: Qgis.TextRenderFormat
+        PreferText = ... # type: Qgis.TextRenderFormat
+
+    class PaintEffectFlag(int):
+        RequiresRasterization = ... # type: Qgis.PaintEffectFlag
+
+    class MapLayerRendererFlag(int):
+        RenderPartialOutputs = ... # type: Qgis.MapLayerRendererFlag
+        RenderPartialOutputOverPreviousCachedImage = ... # type: Qgis.MapLayerRendererFlag
+        AffectsLabeling = ... # type: Qgis.MapLayerRendererFlag
+
+    class RenderContextFlag(int):
+        DrawEditingInfo = ... # type: Qgis.RenderContextFlag
+        ForceVectorOutput = ... # type: Qgis.RenderContextFlag
+        UseAdvancedEffects = ... # type: Qgis.RenderContextFlag
+        UseRenderingOptimization = ... # type: Qgis.RenderContextFlag
+        DrawSelection = ... # type: Qgis.RenderContextFlag
+        DrawSymbolBounds = ... # type: Qgis.RenderContextFlag
+        RenderMapTile = ... # type: Qgis.RenderContextFlag
+        Antialiasing = ... # type: Qgis.RenderContextFlag
+        RenderPartialOutput = ... # type: Qgis.RenderContextFlag
+        RenderPreviewJob = ... # type: Qgis.RenderContextFlag
+        RenderBlocking = ... # type: Qgis.RenderContextFlag
+        RenderSymbolPreview = ... # type: Qgis.RenderContextFlag
+        LosslessImageRendering = ... # type: Qgis.RenderContextFlag
+        ApplyScalingWorkaroundForTextRendering = ... # type: Qgis.RenderContextFlag
+        Render3DMap = ... # type: Qgis.RenderContextFlag
+        ApplyClipAfterReprojection = ... # type: Qgis.RenderContextFlag
+        RenderingSubSymbol = ... # type: Qgis.RenderContextFlag
+        HighQualityImageTransforms = ... # type: Qgis.RenderContextFlag
+        SkipSymbolRendering = ... # type: Qgis.RenderContextFlag
+        RecordProfile = ... # type: Qgis.RenderContextFlag
+        AlwaysUseGlobalMasks = ... # type: Qgis.RenderContextFlag
+        DisableSymbolClippingToExtent = ... # type: Qgis.RenderContextFlag
+        RenderLayerTree = ... # type: Qgis.RenderContextFlag
+
+    class MapSettingsFlag(int):
+        Antialiasing = ... # type: Qgis.MapSettingsFlag
+        DrawEditingInfo = ... # type: Qgis.MapSettingsFlag
+        ForceVectorOutput = ... # type: Qgis.MapSettingsFlag
+        UseAdvancedEffects = ... # type: Qgis.MapSettingsFlag
+        DrawLabeling = ... # type: Qgis.MapSettingsFlag
+        UseRenderingOptimization = ... # type: Qgis.MapSettingsFlag
+        DrawSelection = ... # type: Qgis.MapSettingsFlag
+        DrawSymbolBounds = ... # type: Qgis.MapSettingsFlag
+        RenderMapTile = ... # type: Qgis.MapSettingsFlag
+        RenderPartialOutput = ... # type: Qgis.MapSettingsFlag
+        RenderPreviewJob = ... # type: Qgis.MapSettingsFlag
+        RenderBlocking = ... # type: Qgis.MapSettingsFlag
+        LosslessImageRendering = ... # type: Qgis.MapSettingsFlag
+        Render3DMap = ... # type: Qgis.MapSettingsFlag
+        HighQualityImageTransforms = ... # type: Qgis.MapSettingsFlag
+        SkipSymbolRendering = ... # type: Qgis.MapSettingsFlag
+        ForceRasterMasks = ... # type: Qgis.MapSettingsFlag
+        RecordProfile = ... # type: Qgis.MapSettingsFlag
+        AlwaysUseGlobalMasks = ... # type: Qgis.MapSettingsFlag
+
+    class RasterizedRenderingPolicy(int):
+        Default = ... # type: Qgis.RasterizedRenderingPolicy
+        PreferVector = ... # type: Qgis.RasterizedRenderingPolicy
+        ForceVector = ... # type: Qgis.RasterizedRenderingPolicy
+
+    class CoordinateTransformationFlag(int):
+        BallparkTransformsAreAppropriate = ... # type: Qgis.CoordinateTransformationFlag
+        IgnoreImpossibleTransformations = ... # type: Qgis.CoordinateTransformationFlag
+
+    class TransformDirection(int):
+        Forward = ... # type: Qgis.TransformDirection
+        Reverse = ... # type: Qgis.TransformDirection
+
+    class RasterTemporalCapabilityFlag(int):
+        RequestedTimesMustExactlyMatchAllAvailableTemporalRanges = ... # type: Qgis.RasterTemporalCapabilityFlag
+
+    class TemporalIntervalMatchMethod(int):
+        MatchUsingWholeRange = ... # type: Qgis.TemporalIntervalMatchMethod
+        MatchExactUsingStartOfRange = ... # type: Qgis.TemporalIntervalMatchMethod
+        MatchExactUsingEndOfRange = ... # type: Qgis.TemporalIntervalMatchMethod
+        FindClosestMatchToStartOfRange = ... # type: Qgis.TemporalIntervalMatchMethod
+        FindClosestMatchToEndOfRange = ... # type: Qgis.TemporalIntervalMatchMethod
+
+    class RasterTemporalMode(int):
+        FixedTemporalRange = ... # type: Qgis.RasterTemporalMode
+        TemporalRangeFromDataProvider = ... # type: Qgis.RasterTemporalMode
+        RedrawLayerOnly = ... # type: Qgis.RasterTemporalMode
+        FixedRangePerBand = ... # type: Qgis.RasterTemporalMode
+        RepresentsTemporalValues = ... # type: Qgis.RasterTemporalMode
+        FixedDateTime = ... # type: Qgis.RasterTemporalMode
+
+    class VectorDataProviderTemporalMode(int):
+        HasFixedTemporalRange = ... # type: Qgis.VectorDataProviderTemporalMode
+        StoresFeatureDateTimeInstantInField = ... # type: Qgis.VectorDataProviderTemporalMode
+        StoresFeatureDateTimeStartAndEndInSeparateFields = ... # type: Qgis.VectorDataProviderTemporalMode
+
+    class VectorTemporalLimitMode(int):
+        IncludeBeginExcludeEnd = ... # type: Qgis.VectorTemporalLimitMode
+        IncludeBeginIncludeEnd = ... # type: Qgis.VectorTemporalLimitMode
+
+    class VectorTemporalMode(int):
+        FixedTemporalRange = ... # type: Qgis.VectorTemporalMode
+        FeatureDateTimeInstantFromField = ... # type: Qgis.VectorTemporalMode
+        FeatureDateTimeStartAndEndFromFields = ... # type: Qgis.VectorTemporalMode
+        FeatureDateTimeStartAndDurationFromFields = ... # type: Qgis.VectorTemporalMode
+        FeatureDateTimeStartAndEndFromExpressions = ... # type: Qgis.VectorTemporalMode
+        RedrawLayerOnly = ... # type: Qgis.VectorTemporalMode
+
+    class PlaybackOperation(int):
+        SkipToStart = ... # type: Qgis.PlaybackOperation
+        PreviousFrame = ... # type: Qgis.PlaybackOperation
+        PlayReverse = ... # type: Qgis.PlaybackOperation
+        Pause = ... # type: Qgis.PlaybackOperation
+        PlayForward = ... # type: Qgis.PlaybackOperation
+        NextFrame = ... # type: Qgis.PlaybackOperation
+        SkipToEnd = ... # type: Qgis.PlaybackOperation
+
+    class AnimationState(int):
+        Forward = ... # type: Qgis.AnimationState
+        Reverse = ... # type: Qgis.AnimationState
+        Idle = ... # type: Qgis.AnimationState
+
+    class TemporalNavigationMode(int):
+        Disabled = ... # type: Qgis.TemporalNavigationMode
+        Animated = ... # type: Qgis.TemporalNavigationMode
+        FixedRange = ... # type: Qgis.TemporalNavigationMode
+        Movie = ... # type: Qgis.TemporalNavigationMode
+
+    class AnnotationItemEditOperationResult(int):
+        Success = ... # type: Qgis.AnnotationItemEditOperationResult
+        Invalid = ... # type: Qgis.AnnotationItemEditOperationResult
+        ItemCleared = ... # type: Qgis.AnnotationItemEditOperationResult
+
+    class AnnotationItemNodeType(int):
+        VertexHandle = ... # type: Qgis.AnnotationItemNodeType
+        CalloutHandle = ... # type: Qgis.AnnotationItemNodeType
+
+    class AnnotationItemGuiFlag(int):
+        FlagNoCreationTools = ... # type: Qgis.AnnotationItemGuiFlag
+
+    class AnnotationPlacementMode(int):
+        SpatialBounds = ... # type: Qgis.AnnotationPlacementMode
+        FixedSize = ... # type: Qgis.AnnotationPlacementMode
+        RelativeToMapFrame = ... # type: Qgis.AnnotationPlacementMode
+
+    class AnnotationItemFlag(int):
+        ScaleDependentBoundingBox = ... # type: Qgis.AnnotationItemFlag
+        SupportsReferenceScale = ... # type: Qgis.AnnotationItemFlag
+        SupportsCallouts = ... # type: Qgis.AnnotationItemFlag
+
+    class Axis(int):
+        X = ... # type: Qgis.Axis
+        Y = ... # type: Qgis.Axis
+        Z = ... # type: Qgis.Axis
+
+    class CrsWktVariant(int):
+        Wkt1Gdal = ... # type: Qgis.CrsWktVariant
+        Wkt1Esri = ... # type: Qgis.CrsWktVariant
+        Wkt2_2015 = ... # type: Qgis.CrsWktVariant
+        Wkt2_2015Simplified = ... # type: Qgis.CrsWktVariant
+        Wkt2_2019 = ... # type: Qgis.CrsWktVariant
+        Wkt2_2019Simplified = ... # type: Qgis.CrsWktVariant
+        Preferred = ... # type: Qgis.CrsWktVariant
+        PreferredSimplified = ... # type: Qgis.CrsWktVariant
+        PreferredGdal = ... # type: Qgis.CrsWktVariant
+
+    class CrsIdentifierType(int):
+        ShortString = ... # type: Qgis.CrsIdentifierType
+        MediumString = ... # type: Qgis.CrsIdentifierType
+        FullString = ... # type: Qgis.CrsIdentifierType
+
+    class CoordinateOrder(int):
+        Default = ... # type: Qgis.CoordinateOrder
+        XY = ... # type: Qgis.CoordinateOrder
+        YX = ... # type: Qgis.CoordinateOrder
+
+    class CrsAxisDirection(int):
+        North = ... # type: Qgis.CrsAxisDirection
+        NorthNorthEast = ... # type: Qgis.CrsAxisDirection
+        NorthEast = ... # type: Qgis.CrsAxisDirection
+        EastNorthEast = ... # type: Qgis.CrsAxisDirection
+        East = ... # type: Qgis.CrsAxisDirection
+        EastSouthEast = ... # type: Qgis.CrsAxisDirection
+        SouthEast = ... # type: Qgis.CrsAxisDirection
+        SouthSouthEast = ... # type: Qgis.CrsAxisDirection
+        South = ... # type: Qgis.CrsAxisDirection
+        SouthSouthWest = ... # type: Qgis.CrsAxisDirection
+        SouthWest = ... # type: Qgis.CrsAxisDirection
+        WestSouthWest = ... # type: Qgis.CrsAxisDirection
+        West = ... # type: Qgis.CrsAxisDirection
+        WestNorthWest = ... # type: Qgis.CrsAxisDirection
+        NorthWest = ... # type: Qgis.CrsAxisDirection
+        NorthNorthWest = ... # type: Qgis.CrsAxisDirection
+        GeocentricX = ... # type: Qgis.CrsAxisDirection
+        GeocentricY = ... # type: Qgis.CrsAxisDirection
+        GeocentricZ = ... # type: Qgis.CrsAxisDirection
+        Up = ... # type: Qgis.CrsAxisDirection
+        Down = ... # type: Qgis.CrsAxisDirection
+        Forward = ... # type: Qgis.CrsAxisDirection
+        Aft = ... # type: Qgis.CrsAxisDirection
+        Port = ... # type: Qgis.CrsAxisDirection
+        Starboard = ... # type: Qgis.CrsAxisDirection
+        Clockwise = ... # type: Qgis.CrsAxisDirection
+        CounterClockwise = ... # type: Qgis.CrsAxisDirection
+        ColumnPositive = ... # type: Qgis.CrsAxisDirection
+        ColumnNegative = ... # type: Qgis.CrsAxisDirection
+        RowPositive = ... # type: Qgis.CrsAxisDirection
+        RowNegative = ... # type: Qgis.CrsAxisDirection
+        DisplayRight = ... # type: Qgis.CrsAxisDirection
+        DisplayLeft = ... # type: Qgis.CrsAxisDirection
+        DisplayUp = ... # type: Qgis.CrsAxisDirection
+        DisplayDown = ... # type: Qgis.CrsAxisDirection
+        Future = ... # type: Qgis.CrsAxisDirection
+        Past = ... # type: Qgis.CrsAxisDirection
+        Towards = ... # type: Qgis.CrsAxisDirection
+        AwayFrom = ... # type: Qgis.CrsAxisDirection
+        Unspecified = ... # type: Qgis.CrsAxisDirection
+
+    class CrsType(int):
+        Unknown = ... # type: Qgis.CrsType
+        Geodetic = ... # type: Qgis.CrsType
+        Geocentric = ... # type: Qgis.CrsType
+        Geographic2d = ... # type: Qgis.CrsType
+        Geographic3d = ... # type: Qgis.CrsType
+        Vertical = ... # type: Qgis.CrsType
+        Projected = ... # type: Qgis.CrsType
+        Compound = ... # type: Qgis.CrsType
+        Temporal = ... # type: Qgis.CrsType
+        Engineering = ... # type: Qgis.CrsType
+        Bound = ... # type: Qgis.CrsType
+        Other = ... # type: Qgis.CrsType
+        DerivedProjected = ... # type: Qgis.CrsType
+
+    class DataProviderFlag(int):
+        IsBasemapSource = ... # type: Qgis.DataProviderFlag
+        FastExtent2D = ... # type: Qgis.DataProviderFlag
+        FastExtent3D = ... # type: Qgis.DataProviderFlag
+        Is3DBasemapSource = ... # type: Qgis.DataProviderFlag
+
+    class AutoRefreshMode(int):
+        Disabled = ... # type: Qgis.AutoRefreshMode
+        ReloadData = ... # type: Qgis.AutoRefreshMode
+        RedrawOnly = ... # type: Qgis.AutoRefreshMode
+
+    class MapLayerProperty(int):
+        UsersCannotToggleEditing = ... # type: Qgis.MapLayerProperty
+        IsBasemapLayer = ... # type: Qgis.MapLayerProperty
+        Is3DBasemapLayer = ... # type: Qgis.MapLayerProperty
+
+    class FileOperationFlag(int):
+        IncludeMetadataFile = ... # type: Qgis.FileOperationFlag
+        IncludeStyleFile = ... # type: Qgis.FileOperationFlag
+
+    class SpatialFilterType(int):
+        NoFilter = ... # type: Qgis.SpatialFilterType
+        BoundingBox = ... # type: Qgis.SpatialFilterType
+        DistanceWithin = ... # type: Qgis.SpatialFilterType
+
+    class InvalidGeometryCheck(int):
+        NoCheck = ... # type: Qgis.InvalidGeometryCheck
+        SkipInvalid = ... # type: Qgis.InvalidGeometryCheck
+        AbortOnInvalid = ... # type: Qgis.InvalidGeometryCheck
+
+    class FeatureRequestFilterType(int):
+        NoFilter = ... # type: Qgis.FeatureRequestFilterType
+        Fid = ... # type: Qgis.FeatureRequestFilterType
+        Expression = ... # type: Qgis.FeatureRequestFilterType
+        Fids = ... # type: Qgis.FeatureRequestFilterType
+
+    class FeatureRequestFlag(int):
+        NoFlags = ... # type: Qgis.FeatureRequestFlag
+        NoGeometry = ... # type: Qgis.FeatureRequestFlag
+        SubsetOfAttributes = ... # type: Qgis.FeatureRequestFlag
+        ExactIntersect = ... # type: Qgis.FeatureRequestFlag
+        IgnoreStaticNodesDuringExpressionCompilation = ... # type: Qgis.FeatureRequestFlag
+        EmbeddedSymbols = ... # type: Qgis.FeatureRequestFlag
+
+    class MakeValidMethod(int):
+        Linework = ... # type: Qgis.MakeValidMethod
+        Structure = ... # type: Qgis.MakeValidMethod
+
+    class CoverageValidityResult(int):
+        Invalid = ... # type: Qgis.CoverageValidityResult
+        Valid = ... # type: Qgis.CoverageValidityResult
+        Error = ... # type: Qgis.CoverageValidityResult
+
+    class GeosCreationFlag(int):
+        RejectOnInvalidSubGeometry = ... # type: Qgis.GeosCreationFlag
+        SkipEmptyInteriorRings = ... # type: Qgis.GeosCreationFlag
+
+    class JoinStyle(int):
+        Round = ... # type: Qgis.JoinStyle
+        Miter = ... # type: Qgis.JoinStyle
+        Bevel = ... # type: Qgis.JoinStyle
+
+    class EndCapStyle(int):
+        Round = ... # type: Qgis.EndCapStyle
+        Flat = ... # type: Qgis.EndCapStyle
+        Square = ... # type: Qgis.EndCapStyle
+
+    class BufferSide(int):
+        Left = ... # type: Qgis.BufferSide
+        Right = ... # type: Qgis.BufferSide
+
+    class GeometryValidationEngine(int):
+        QgisInternal = ... # type: Qgis.GeometryValidationEngine
+        Geos = ... # type: Qgis.GeometryValidationEngine
+
+    class GeometryValidityFlag(int):
+        AllowSelfTouchingHoles = ... # type: Qgis.GeometryValidityFlag
+
+    class GeometryOperationResult(int):
+        Success = ... # type: Qgis.GeometryOperationResult
+        NothingHappened = ... # type: Qgis.GeometryOperationResult
+        InvalidBaseGeometry = ... # type: Qgis.GeometryOperationResult
+        InvalidInputGeometryType = ... # type: Qgis.GeometryOperationResult
+        SelectionIsEmpty = ... # type: Qgis.GeometryOperationResult
+        SelectionIsGreaterThanOne = ... # type: Qgis.GeometryOperationResult
+        GeometryEngineError = ... # type: Qgis.GeometryOperationResult
+        LayerNotEditable = ... # type: Qgis.GeometryOperationResult
+        AddPartSelectedGeometryNotFound = ... # type: Qgis.GeometryOperationResult
+        AddPartNotMultiGeometry = ... # type: Qgis.GeometryOperationResult
+        AddRingNotClosed = ... # type: Qgis.GeometryOperationResult
+        AddRingNotValid = ... # type: Qgis.GeometryOperationResult
+        AddRingCrossesExistingRings = ... # type: Qgis.GeometryOperationResult
+        AddRingNotInExistingFeature = ... # type: Qgis.GeometryOperationResult
+        SplitCannotSplitPoint = ... # type: Qgis.GeometryOperationResult
+        GeometryTypeHasChanged = ... # type: Qgis.GeometryOperationResult
+
+    class GpsFeatureType(int):
+        Waypoint = ... # type: Qgis.GpsFeatureType
+        Route = ... # type: Qgis.GpsFeatureType
+        Track = ... # type: Qgis.GpsFeatureType
+
+    class BabelCommandFlag(int):
+        QuoteFilePaths = ... # type: Qgis.BabelCommandFlag
+
+    class BabelFormatCapability(int):
+        Import = ... # type: Qgis.BabelFormatCapability
+        Export = ... # type: Qgis.BabelFormatCapability
+        Waypoints = ... # type: Qgis.BabelFormatCapability
+        Routes = ... # type: Qgis.BabelFormatCapability
+        Tracks = ... # type: Qgis.BabelFormatCapability
+
+    class GpsInformationComponent(int):
+        Location = ... # type: Qgis.GpsInformationComponent
+        Altitude = ... # type: Qgis.GpsInformationComponent
+        GroundSpeed = ... # type: Qgis.GpsInformationComponent
+        Bearing = ... # type: Qgis.GpsInformationComponent
+        TotalTrackLength = ... # type: Qgis.GpsInformationComponent
+        TrackDistanceFromStart = ... # type: Qgis.GpsInformationComponent
+        Pdop = ... # type: Qgis.GpsInformationComponent
+        Hdop = ... # type: Qgis.GpsInformationComponent
+        Vdop = ... # type: Qgis.GpsInformationComponent
+        HorizontalAccuracy = ... # type: Qgis.GpsInformationComponent
+        VerticalAccuracy = ... # type: Qgis.GpsInformationComponent
+        HvAccuracy = ... # type: Qgis.GpsInformationComponent
+        SatellitesUsed = ... # type: Qgis.GpsInformationComponent
+        Timestamp = ... # type: Qgis.GpsInformationComponent
+        TrackStartTime = ... # type: Qgis.GpsInformationComponent
+        TrackEndTime = ... # type: Qgis.GpsInformationComponent
+        TrackDistanceSinceLastPoint = ... # type: Qgis.GpsInformationComponent
+        TrackTimeSinceLastPoint = ... # type: Qgis.GpsInformationComponent
+        GeoidalSeparation = ... # type: Qgis.GpsInformationComponent
+        EllipsoidAltitude = ... # type: Qgis.GpsInformationComponent
+
+    class GpsNavigationStatus(int):
+        NotValid = ... # type: Qgis.GpsNavigationStatus
+        Safe = ... # type: Qgis.GpsNavigationStatus
+        Caution = ... # type: Qgis.GpsNavigationStatus
+        Unsafe = ... # type: Qgis.GpsNavigationStatus
+
+    class GpsQualityIndicator(int):
+        Unknown = ... # type: Qgis.GpsQualityIndicator
+        Invalid = ... # type: Qgis.GpsQualityIndicator
+        GPS = ... # type: Qgis.GpsQualityIndicator
+        DGPS = ... # type: Qgis.GpsQualityIndicator
+        PPS = ... # type: Qgis.GpsQualityIndicator
+        RTK = ... # type: Qgis.GpsQualityIndicator
+        FloatRTK = ... # type: Qgis.GpsQualityIndicator
+        Estimated = ... # type: Qgis.GpsQualityIndicator
+        Manual = ... # type: Qgis.GpsQualityIndicator
+        Simulation = ... # type: Qgis.GpsQualityIndicator
+
+    class GnssConstellation(int):
+        Unknown = ... # type: Qgis.GnssConstellation
+        Gps = ... # type: Qgis.GnssConstellation
+        Glonass = ... # type: Qgis.GnssConstellation
+        Galileo = ... # type: Qgis.GnssConstellation
+        BeiDou = ... # type: Qgis.GnssConstellation
+        Qzss = ... # type: Qgis.GnssConstellation
+        Navic = ... # type: Qgis.GnssConstellation
+        Sbas = ... # type: Qgis.GnssConstellation
+
+    class GpsFixStatus(int):
+        NoData = ... # type: Qgis.GpsFixStatus
+        NoFix = ... # type: Qgis.GpsFixStatus
+        Fix2D = ... # type: Qgis.GpsFixStatus
+        Fix3D = ... # type: Qgis.GpsFixStatus
+
+    class DeviceConnectionStatus(int):
+        Disconnected = ... # type: Qgis.DeviceConnectionStatus
+        Connecting = ... # type: Qgis.DeviceConnectionStatus
+        Connected = ... # type: Qgis.DeviceConnectionStatus
+
+    class GpsConnectionType(int):
+        Automatic = ... # type: Qgis.GpsConnectionType
+        Internal = ... # type: Qgis.GpsConnectionType
+        Serial = ... # type: Qgis.GpsConnectionType
+        Gpsd = ... # type: Qgis.GpsConnectionType
+
+    class ContentStatus(int):
+        NotStarted = ... # type: Qgis.ContentStatus
+        Running = ... # type: Qgis.ContentStatus
+        Finished = ... # type: Qgis.ContentStatus
+        Failed = ... # type: Qgis.ContentStatus
+        Canceled = ... # type: Qgis.ContentStatus
+
+    class VertexMarkerType(int):
+        SemiTransparentCircle = ... # type: Qgis.VertexMarkerType
+        Cross = ... # type: Qgis.VertexMarkerType
+        NoMarker = ... # type: Qgis.VertexMarkerType
+
+    class VectorEditResult(int):
+        Success = ... # type: Qgis.VectorEditResult
+        EmptyGeometry = ... # type: Qgis.VectorEditResult
+        EditFailed = ... # type: Qgis.VectorEditResult
+        FetchFeatureFailed = ... # type: Qgis.VectorEditResult
+        InvalidLayer = ... # type: Qgis.VectorEditResult
+
+    class SelectionFlag(int):
+        SingleFeatureSelection = ... # type: Qgis.SelectionFlag
+        ToggleSelection = ... # type: Qgis.SelectionFlag
+
+    class SelectGeometryRelationship(int):
+        Intersect = ... # type: Qgis.SelectGeometryRelationship
+        Within = ... # type: Qgis.SelectGeometryRelationship
+
+    class SelectBehavior(int):
+        SetSelection = ... # type: Qgis.SelectBehavior
+        AddToSelection = ... # type: Qgis.SelectBehavior
+        IntersectSelection = ... # type: Qgis.SelectBehavior
+        RemoveFromSelection = ... # type: Qgis.SelectBehavior
+
+    class SelectionRenderingMode(int):
+        Default = ... # type: Qgis.SelectionRenderingMode
+        CustomColor = ... # type: Qgis.SelectionRenderingMode
+        CustomSymbol = ... # type: Qgis.SelectionRenderingMode
+
+    class FieldMetadataProperty(int):
+        GeometryCrs = ... # type: Qgis.FieldMetadataProperty
+        GeometryWkbType = ... # type: Qgis.FieldMetadataProperty
+        CustomProperty = ... # type: Qgis.FieldMetadataProperty
+
+    class FieldConfigurationFlag(int):
+        NoFlag = ... # type: Qgis.FieldConfigurationFlag
+        NotSearchable = ... # type: Qgis.FieldConfigurationFlag
+        HideFromWms = ... # type: Qgis.FieldConfigurationFlag
+        HideFromWfs = ... # type: Qgis.FieldConfigurationFlag
+
+    class FieldOrigin(int):
+        Unknown = ... # type: Qgis.FieldOrigin
+        Provider = ... # type: Qgis.FieldOrigin
+        Join = ... # type: Qgis.FieldOrigin
+        Edit = ... # type: Qgis.FieldOrigin
+        Expression = ... # type: Qgis.FieldOrigin
+
+    class SublayerPromptMode(int):
+        AlwaysAsk = ... # type: Qgis.SublayerPromptMode
+        AskExcludingRasterBands = ... # type: Qgis.SublayerPromptMode
+        NeverAskSkip = ... # type: Qgis.SublayerPromptMode
+        NeverAskLoadAll = ... # type: Qgis.SublayerPromptMode
+
+    class FilePathType(int):
+        Absolute = ... # type: Qgis.FilePathType
+        Relative = ... # type: Qgis.FilePathType
+
+    class MeshEditingErrorType(int):
+        NoError = ... # type: Qgis.MeshEditingErrorType
+        InvalidFace = ... # type: Qgis.MeshEditingErrorType
+        TooManyVerticesInFace = ... # type: Qgis.MeshEditingErrorType
+        FlatFace = ... # type: Qgis.MeshEditingErrorType
+        UniqueSharedVertex = ... # type: Qgis.MeshEditingErrorType
+        InvalidVertex = ... # type: Qgis.MeshEditingErrorType
+        ManifoldFace = ... # type: Qgis.MeshEditingErrorType
+
+    class RasterFileWriterResult(int):
+        Success = ... # type: Qgis.RasterFileWriterResult
+        SourceProviderError = ... # type: Qgis.RasterFileWriterResult
+        DestinationProviderError = ... # type: Qgis.RasterFileWriterResult
+        CreateDatasourceError = ... # type: Qgis.RasterFileWriterResult
+        WriteError = ... # type: Qgis.RasterFileWriterResult
+        NoDataConflict = ... # type: Qgis.RasterFileWriterResult
+        Canceled = ... # type: Qgis.RasterFileWriterResult
+
+    class RasterExportType(int):
+        Raw = ... # type: Qgis.RasterExportType
+        RenderedImage = ... # type: Qgis.RasterExportType
+
+    class RasterAttributeTableType(int):
+        Thematic = ... # type: Qgis.RasterAttributeTableType
+        Athematic = ... # type: Qgis.RasterAttributeTableType
+
+    class RasterAttributeTableFieldUsage(int):
+        Generic = ... # type: Qgis.RasterAttributeTableFieldUsage
+        PixelCount = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Name = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Min = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Max = ... # type: Qgis.RasterAttributeTableFieldUsage
+        MinMax = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Red = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Green = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Blue = ... # type: Qgis.RasterAttributeTableFieldUsage
+        Alpha = ... # type: Qgis.RasterAttributeTableFieldUsage
+        RedMin = ... # type: Qgis.RasterAttributeTableFieldUsage
+        GreenMin = ... # type: Qgis.RasterAttributeTableFieldUsage
+        BlueMin = ... # type: Qgis.RasterAttributeTableFieldUsage
+        AlphaMin = ... # type: Qgis.RasterAttributeTableFieldUsage
+        RedMax = ... # type: Qgis.RasterAttributeTableFieldUsage
+        GreenMax = ... # type: Qgis.RasterAttributeTableFieldUsage
+        BlueMax = ... # type: Qgis.RasterAttributeTableFieldUsage
+        AlphaMax = ... # type: Qgis.RasterAttributeTableFieldUsage
+        MaxCount = ... # type: Qgis.RasterAttributeTableFieldUsage
+
+    class RasterRangeAccuracy(int):
+        Exact = ... # type: Qgis.RasterRangeAccuracy
+        Estimated = ... # type: Qgis.RasterRangeAccuracy
+
+    class RasterRangeExtent(int):
+        WholeRaster = ... # type: Qgis.RasterRangeExtent
+        FixedCanvas = ... # type: Qgis.RasterRangeExtent
+        UpdatedCanvas = ... # type: Qgis.RasterRangeExtent
+
+    class RasterRangeLimit(int):
+        NotSet = ... # type: Qgis.RasterRangeLimit
+        MinimumMaximum = ... # type: Qgis.RasterRangeLimit
+        StdDev = ... # type: Qgis.RasterRangeLimit
+        CumulativeCut = ... # type: Qgis.RasterRangeLimit
+
+    class RasterRendererCapability(int):
+        UsesMultipleBands = ... # type: Qgis.RasterRendererCapability
+
+    class RasterRendererFlag(int):
+        InternalLayerOpacityHandling = ... # type: Qgis.RasterRendererFlag
+        UseNoDataForOutOfRangePixels = ... # type: Qgis.RasterRendererFlag
+
+    class RasterResamplingMethod(int):
+        Nearest = ... # type: Qgis.RasterResamplingMethod
+        Bilinear = ... # type: Qgis.RasterResamplingMethod
+        Cubic = ... # type: Qgis.RasterResamplingMethod
+        CubicSpline = ... # type: Qgis.RasterResamplingMethod
+        Lanczos = ... # type: Qgis.RasterResamplingMethod
+        Average = ... # type: Qgis.RasterResamplingMethod
+        Mode = ... # type: Qgis.RasterResamplingMethod
+        Gauss = ... # type: Qgis.RasterResamplingMethod
+
+    class RasterResamplingStage(int):
+        ResampleFilter = ... # type: Qgis.RasterResamplingStage
+        Provider = ... # type: Qgis.RasterResamplingStage
+
+    class RasterPipeInterfaceRole(int):
+        Unknown = ... # type: Qgis.RasterPipeInterfaceRole
+        Provider = ... # type: Qgis.RasterPipeInterfaceRole
+        Renderer = ... # type: Qgis.RasterPipeInterfaceRole
+        Brightness = ... # type: Qgis.RasterPipeInterfaceRole
+        Resampler = ... # type: Qgis.RasterPipeInterfaceRole
+        Projector = ... # type: Qgis.RasterPipeInterfaceRole
+        Nuller = ... # type: Qgis.RasterPipeInterfaceRole
+        HueSaturation = ... # type: Qgis.RasterPipeInterfaceRole
+
+    class ShaderClassificationMethod(int):
+        Continuous = ... # type: Qgis.ShaderClassificationMethod
+        EqualInterval = ... # type: Qgis.ShaderClassificationMethod
+        Quantile = ... # type: Qgis.ShaderClassificationMethod
+
+    class ShaderInterpolationMethod(int):
+        Linear = ... # type: Qgis.ShaderInterpolationMethod
+        Discrete = ... # type: Qgis.ShaderInterpolationMethod
+        Exact = ... # type: Qgis.ShaderInterpolationMethod
+
+    class SublayerFlag(int):
+        SystemTable = ... # type: Qgis.SublayerFlag
+
+    class SublayerQueryFlag(int):
+        FastScan = ... # type: Qgis.SublayerQueryFlag
+        ResolveGeometryType = ... # type: Qgis.SublayerQueryFlag
+        CountFeatures = ... # type: Qgis.SublayerQueryFlag
+        IncludeSystemTables = ... # type: Qgis.SublayerQueryFlag
+        OpenLayersToResolveDescriptions = ... # type: Qgis.SublayerQueryFlag
+
+    class UriCleaningFlag(int):
+        RemoveCredentials = ... # type: Qgis.UriCleaningFlag
+        RedactCredentials = ... # type: Qgis.UriCleaningFlag
+
+    class FileFilterType(int):
+        Vector = ... # type: Qgis.FileFilterType
+        Raster = ... # type: Qgis.FileFilterType
+        Mesh = ... # type: Qgis.FileFilterType
+        MeshDataset = ... # type: Qgis.FileFilterType
+        PointCloud = ... # type: Qgis.FileFilterType
+        VectorTile = ... # type: Qgis.FileFilterType
+        TiledScene = ... # type: Qgis.FileFilterType
+
+    class LabelMultiLineAlignment(int):
+        Left = ... # type: Qgis.LabelMultiLineAlignment
+        Center = ... # type: Qgis.LabelMultiLineAlignment
+        Right = ... # type: Qgis.LabelMultiLineAlignment
+        FollowPlacement = ... # type: Qgis.LabelMultiLineAlignment
+        Justify = ... # type: Qgis.LabelMultiLineAlignment
+
+    class UpsideDownLabelHandling(int):
+        FlipUpsideDownLabels = ... # type: Qgis.UpsideDownLabelHandling
+        AllowUpsideDownWhenRotationIsDefined = ... # type: Qgis.UpsideDownLabelHandling
+        AlwaysAllowUpsideDown = ... # type: Qgis.UpsideDownLabelHandling
+
+    class LabelPolygonPlacementFlag(int):
+        AllowPlacementOutsideOfPolygon = ... # type: Qgis.LabelPolygonPlacementFlag
+        AllowPlacementInsideOfPolygon = ... # type: Qgis.LabelPolygonPlacementFlag
+
+    class LabelLinePlacementFlag(int):
+        OnLine = ... # type: Qgis.LabelLinePlacementFlag
+        AboveLine = ... # type: Qgis.LabelLinePlacementFlag
+        BelowLine = ... # type: Qgis.LabelLinePlacementFlag
+        MapOrientation = ... # type: Qgis.LabelLinePlacementFlag
+
+    class LabelQuadrantPosition(int):
+        AboveLeft = ... # type: Qgis.LabelQuadrantPosition
+        Above = ... # type: Qgis.LabelQuadrantPosition
+        AboveRight = ... # type: Qgis.LabelQuadrantPosition
+        Left = ... # type: Qgis.LabelQuadrantPosition
+        Over = ... # type: Qgis.LabelQuadrantPosition
+        Right = ... # type: Qgis.LabelQuadrantPosition
+        BelowLeft = ... # type: Qgis.LabelQuadrantPosition
+        Below = ... # type: Qgis.LabelQuadrantPosition
+        BelowRight = ... # type: Qgis.LabelQuadrantPosition
+
+    class LabelOffsetType(int):
+        FromPoint = ... # type: Qgis.LabelOffsetType
+        FromSymbolBounds = ... # type: Qgis.LabelOffsetType
+
+    class LabelPredefinedPointPosition(int):
+        TopLeft = ... # type: Qgis.LabelPredefinedPointPosition
+        TopSlightlyLeft = ... # type: Qgis.LabelPredefinedPointPosition
+        TopMiddle = ... # type: Qgis.LabelPredefinedPointPosition
+        TopSlightlyRight = ... # type: Qgis.LabelPredefinedPointPosition
+        TopRight = ... # type: Qgis.LabelPredefinedPointPosition
+        MiddleLeft = ... # type: Qgis.LabelPredefinedPointPosition
+        MiddleRight = ... # type: Qgis.LabelPredefinedPointPosition
+        BottomLeft = ... # type: Qgis.LabelPredefinedPointPosition
+        BottomSlightlyLeft = ... # type: Qgis.LabelPredefinedPointPosition
+        BottomMiddle = ... # type: Qgis.LabelPredefinedPointPosition
+        BottomSlightlyRight = ... # type: Qgis.LabelPredefinedPointPosition
+        BottomRight = ... # type: Qgis.LabelPredefinedPointPosition
+        OverPoint = ... # type: Qgis.LabelPredefinedPointPosition
+
+    class LabelPlacement(int):
+        AroundPoint = ... # type: Qgis.LabelPlacement
+        OverPoint = ... # type: Qgis.LabelPlacement
+        Line = ... # type: Qgis.LabelPlacement
+        Curved = ... # type: Qgis.LabelPlacement
+        Horizontal = ... # type: Qgis.LabelPlacement
+        Free = ... # type: Qgis.LabelPlacement
+        OrderedPositionsAroundPoint = ... # type: Qgis.LabelPlacement
+        PerimeterCurved = ... # type: Qgis.LabelPlacement
+        OutsidePolygons = ... # type: Qgis.LabelPlacement
+
+    class LabelPrioritization(int):
+        PreferCloser = ... # type: Qgis.LabelPrioritization
+        PreferPositionOrdering = ... # type: Qgis.LabelPrioritization
+
+    class LabelOverlapHandling(int):
+        PreventOverlap = ... # type: Qgis.LabelOverlapHandling
+        AllowOverlapIfRequired = ... # type: Qgis.LabelOverlapHandling
+        AllowOverlapAtNoCost = ... # type: Qgis.LabelOverlapHandling
+
+    class UnplacedLabelVisibility(int):
+        FollowEngineSetting = ... # type: Qgis.UnplacedLabelVisibility
+        NeverShow = ... # type: Qgis.UnplacedLabelVisibility
+
+    class ActionStart(int):
+        Deferred = ... # type: Qgis.ActionStart
+        Immediate = ... # type: Qgis.ActionStart
+
+    class DriveType(int):
+        Unknown = ... # type: Qgis.DriveType
+        Invalid = ... # type: Qgis.DriveType
+        Removable = ... # type: Qgis.DriveType
+        Fixed = ... # type: Qgis.DriveType
+        Remote = ... # type: Qgis.DriveType
+        CdRom = ... # type: Qgis.DriveType
+        RamDisk = ... # type: Qgis.DriveType
+        Cloud = ... # type: Qgis.DriveType
+
+    class SqlKeywordCategory(int):
+        Keyword = ... # type: Qgis.SqlKeywordCategory
+        Constant = ... # type: Qgis.SqlKeywordCategory
+        Function = ... # type: Qgis.SqlKeywordCategory
+        Geospatial = ... # type: Qgis.SqlKeywordCategory
+        Operator = ... # type: Qgis.SqlKeywordCategory
+        Math = ... # type: Qgis.SqlKeywordCategory
+        Aggregate = ... # type: Qgis.SqlKeywordCategory
+        String = ... # type: Qgis.SqlKeywordCategory
+        Identifier = ... # type: Qgis.SqlKeywordCategory
+
+    class SqlLayerDefinitionCapability(int):
+        SubsetStringFilter = ... # type: Qgis.SqlLayerDefinitionCapability
+        GeometryColumn = ... # type: Qgis.SqlLayerDefinitionCapability
+        PrimaryKeys = ... # type: Qgis.SqlLayerDefinitionCapability
+        UnstableFeatureIds = ... # type: Qgis.SqlLayerDefinitionCapability
+
+    class VectorFileWriterCapability(int):
+        FieldAliases = ... # type: Qgis.VectorFileWriterCapability
+        FieldComments = ... # type: Qgis.VectorFileWriterCapability
+
+    class VectorExportResult(int):
+        Success = ... # type: Qgis.VectorExportResult
+        ErrorCreatingDataSource = ... # type: Qgis.VectorExportResult
+        ErrorCreatingLayer = ... # type: Qgis.VectorExportResult
+        ErrorAttributeTypeUnsupported = ... # type: Qgis.VectorExportResult
+        ErrorAttributeCreationFailed = ... # type: Qgis.VectorExportResult
+        ErrorProjectingFeatures = ... # type: Qgis.VectorExportResult
+        ErrorFeatureWriteFailed = ... # type: Qgis.VectorExportResult
+        ErrorInvalidLayer = ... # type: Qgis.VectorExportResult
+        ErrorInvalidProvider = ... # type: Qgis.VectorExportResult
+        ErrorProviderUnsupportedFeature = ... # type: Qgis.VectorExportResult
+        ErrorConnectionFailed = ... # type: Qgis.VectorExportResult
+        UserCanceled = ... # type: Qgis.VectorExportResult
+
+    class HttpMethod(int):
+        Get = ... # type: Qgis.HttpMethod
+        Post = ... # type: Qgis.HttpMethod
+        Head = ... # type: Qgis.HttpMethod
+        Put = ... # type: Qgis.HttpMethod
+        Delete = ... # type: Qgis.HttpMethod
+
+    class BrowserDirectoryMonitoring(int):
+        Default = ... # type: Qgis.BrowserDirectoryMonitoring
+        NeverMonitor = ... # type: Qgis.BrowserDirectoryMonitoring
+        AlwaysMonitor = ... # type: Qgis.BrowserDirectoryMonitoring
+
+    class BrowserLayerType(int):
+        NoType = ... # type: Qgis.BrowserLayerType
+        Vector = ... # type: Qgis.BrowserLayerType
+        Raster = ... # type: Qgis.BrowserLayerType
+        Point = ... # type: Qgis.BrowserLayerType
+        Line = ... # type: Qgis.BrowserLayerType
+        Polygon = ... # type: Qgis.BrowserLayerType
+        TableLayer = ... # type: Qgis.BrowserLayerType
+        Database = ... # type: Qgis.BrowserLayerType
+        Table = ... # type: Qgis.BrowserLayerType
+        Plugin = ... # type: Qgis.BrowserLayerType
+        Mesh = ... # type: Qgis.BrowserLayerType
+        VectorTile = ... # type: Qgis.BrowserLayerType
+        PointCloud = ... # type: Qgis.BrowserLayerType
+        TiledScene = ... # type: Qgis.BrowserLayerType
+
+    class DataItemProviderCapability(int):
+        NoCapabilities = ... # type: Qgis.DataItemProviderCapability
+        Files = ... # type: Qgis.DataItemProviderCapability
+        Directories = ... # type: Qgis.DataItemProviderCapability
+        Databases = ... # type: Qgis.DataItemProviderCapability
+        NetworkSources = ... # type: Qgis.DataItemProviderCapability
+
+    class BrowserItemCapability(int):
+        NoCapabilities = ... # type: Qgis.BrowserItemCapability
+        SetCrs = ... # type: Qgis.BrowserItemCapability
+        Fertile = ... # type: Qgis.BrowserItemCapability
+        Fast = ... # type: Qgis.BrowserItemCapability
+        Collapse = ... # type: Qgis.BrowserItemCapability
+        Rename = ... # type: Qgis.BrowserItemCapability
+        Delete = ... # type: Qgis.BrowserItemCapability
+        ItemRepresentsFile = ... # type: Qgis.BrowserItemCapability
+        RefreshChildrenWhenItemIsRefreshed = ... # type: Qgis.BrowserItemCapability
+        ReadOnly = ... # type: Qgis.BrowserItemCapability
+
+    class BrowserItemState(int):
+        NotPopulated = ... # type: Qgis.BrowserItemState
+        Populating = ... # type: Qgis.BrowserItemState
+        Populated = ... # type: Qgis.BrowserItemState
+
+    class BrowserItemType(int):
+        Collection = ... # type: Qgis.BrowserItemType
+        Directory = ... # type: Qgis.BrowserItemType
+        Layer = ... # type: Qgis.BrowserItemType
+        Error = ... # type: Qgis.BrowserItemType
+        Favorites = ... # type: Qgis.BrowserItemType
+        Project = ... # type: Qgis.BrowserItemType
+        Custom = ... # type: Qgis.BrowserItemType
+        Fields = ... # type: Qgis.BrowserItemType
+        Field = ... # type: Qgis.BrowserItemType
+
+    class SymbolLayerUserFlag(int):
+        DisableSelectionRecoloring = ... # type: Qgis.SymbolLayerUserFlag
+
+    class SymbolLayerFlag(int):
+        DisableFeatureClipping = ... # type: Qgis.SymbolLayerFlag
+        CanCalculateMaskGeometryPerFeature = ... # type: Qgis.SymbolLayerFlag
+        AffectsLabeling = ... # type: Qgis.SymbolLayerFlag
+
+    class SymbolPreviewFlag(int):
+        FlagIncludeCrosshairsForMarkerSymbols = ... # type: Qgis.SymbolPreviewFlag
+
+    class SymbolFlag(int):
+        RendererShouldUseSymbolLevels = ... # type: Qgis.SymbolFlag
+        AffectsLabeling = ... # type: Qgis.SymbolFlag
+
+    class FeatureRendererFlag(int):
+        AffectsLabeling = ... # type: Qgis.FeatureRendererFlag
+
+    class VerticalAnchorPoint(int):
+        Top = ... # type: Qgis.VerticalAnchorPoint
+        Center = ... # type: Qgis.VerticalAnchorPoint
+        Bottom = ... # type: Qgis.VerticalAnchorPoint
+        Baseline = ... # type: Qgis.VerticalAnchorPoint
+
+    class HorizontalAnchorPoint(int):
+        Left = ... # type: Qgis.HorizontalAnchorPoint
+        Center = ... # type: Qgis.HorizontalAnchorPoint
+        Right = ... # type: Qgis.HorizontalAnchorPoint
+
+    class SymbolRotationMode(int):
+        RespectMapRotation = ... # type: Qgis.SymbolRotationMode
+        IgnoreMapRotation = ... # type: Qgis.SymbolRotationMode
+
+    class SymbolRenderHint(int):
+        DynamicRotation = ... # type: Qgis.SymbolRenderHint
+        IsSymbolLayerSubSymbol = ... # type: Qgis.SymbolRenderHint
+        ForceVectorRendering = ... # type: Qgis.SymbolRenderHint
+        ExcludeSymbolBuffers = ... # type: Qgis.SymbolRenderHint
+
+    class SnappingType(int):
+        NoSnap = ... # type: Qgis.SnappingType
+        Vertex = ... # type: Qgis.SnappingType
+        Segment = ... # type: Qgis.SnappingType
+        Area = ... # type: Qgis.SnappingType
+        Centroid = ... # type: Qgis.SnappingType
+        MiddleOfSegment = ... # type: Qgis.SnappingType
+        LineEndpoint = ... # type: Qgis.SnappingType
+
+    class SnappingMode(int):
+        ActiveLayer = ... # type: Qgis.SnappingMode
+        AllLayers = ... # type: Qgis.SnappingMode
+        AdvancedConfiguration = ... # type: Qgis.SnappingMode
+
+    class SettingsOption(int):
+        SaveFormerValue = ... # type: Qgis.SettingsOption
+        SaveEnumFlagAsInt = ... # type: Qgis.SettingsOption
+
+    class SldExportVendorExtension(int):
+        NoVendorExtension = ... # type: Qgis.SldExportVendorExtension
+        GeoServerVendorExtension = ... # type: Qgis.SldExportVendorExtension
+        DeegreeVendorExtension = ... # type: Qgis.SldExportVendorExtension
+
+    class SldExportOption(int):
+        NoOptions = ... # type: Qgis.SldExportOption
+        Svg = ... # type: Qgis.SldExportOption
+        Png = ... # type: Qgis.SldExportOption
+
+    class PropertyType(int):
+        Invalid = ... # type: Qgis.PropertyType
+        Static = ... # type: Qgis.PropertyType
+        Field = ... # type: Qgis.PropertyType
+        Expression = ... # type: Qgis.PropertyType
+
+    class SettingsTreeNodeOption(int):
+        NamedListSelectedItemSetting = ... # type: Qgis.SettingsTreeNodeOption
+
+    class SettingsTreeNodeType(int):
+        Root = ... # type: Qgis.SettingsTreeNodeType
+        Standard = ... # type: Qgis.SettingsTreeNodeType
+        NamedList = ... # type: Qgis.SettingsTreeNodeType
+
+    class SettingsType(int):
+        Custom = ... # type: Qgis.SettingsType
+        Variant = ... # type: Qgis.SettingsType
+        String = ... # type: Qgis.SettingsType
+        StringList = ... # type: Qgis.SettingsType
+        VariantMap = ... # type: Qgis.SettingsType
+        Bool = ... # type: Qgis.SettingsType
+        Integer = ... # type: Qgis.SettingsType
+        Double = ... # type: Qgis.SettingsType
+        EnumFlag = ... # type: Qgis.SettingsType
+        Color = ... # type: Qgis.SettingsType
+
+    class ScaleMethod(int):
+        ScaleArea = ... # type: Qgis.ScaleMethod
+        ScaleDiameter = ... # type: Qgis.ScaleMethod
+
+    class SymbolType(int):
+        Marker = ... # type: Qgis.SymbolType
+        Line = ... # type: Qgis.SymbolType
+        Fill = ... # type: Qgis.SymbolType
+        Hybrid = ... # type: Qgis.SymbolType
+
+    class VectorDataProviderAttributeEditCapability(int):
+        EditAlias = ... # type: Qgis.VectorDataProviderAttributeEditCapability
+        EditComment = ... # type: Qgis.VectorDataProviderAttributeEditCapability
+
+    class FeatureAvailability(int):
+        NoFeaturesAvailable = ... # type: Qgis.FeatureAvailability
+        FeaturesAvailable = ... # type: Qgis.FeatureAvailability
+        FeaturesMaybeAvailable = ... # type: Qgis.FeatureAvailability
+
+    class SpatialIndexPresence(int):
+        Unknown = ... # type: Qgis.SpatialIndexPresence
+        NotPresent = ... # type: Qgis.SpatialIndexPresence
+        Present = ... # type: Qgis.SpatialIndexPresence
+
+    class FeatureCountState(int):
+        Uncounted = ... # type: Qgis.FeatureCountState
+        UnknownCount = ... # type: Qgis.FeatureCountState
+
+    class VectorProviderCapability(int):
+        NoCapabilities = ... # type: Qgis.VectorProviderCapability
+        AddFeatures = ... # type: Qgis.VectorProviderCapability
+        DeleteFeatures = ... # type: Qgis.VectorProviderCapability
+        ChangeAttributeValues = ... # type: Qgis.VectorProviderCapability
+        AddAttributes = ... # type: Qgis.VectorProviderCapability
+        DeleteAttributes = ... # type: Qgis.VectorProviderCapability
+        CreateSpatialIndex = ... # type: Qgis.VectorProviderCapability
+        SelectAtId = ... # type: Qgis.VectorProviderCapability
+        ChangeGeometries = ... # type: Qgis.VectorProviderCapability
+        SelectEncoding = ... # type: Qgis.VectorProviderCapability
+        CreateAttributeIndex = ... # type: Qgis.VectorProviderCapability
+        SimplifyGeometries = ... # type: Qgis.VectorProviderCapability
+        SimplifyGeometriesWithTopologicalValidation = ... # type: Qgis.VectorProviderCapability
+        TransactionSupport = ... # type: Qgis.VectorProviderCapability
+        CircularGeometries = ... # type: Qgis.VectorProviderCapability
+        ChangeFeatures = ... # type: Qgis.VectorProviderCapability
+        RenameAttributes = ... # type: Qgis.VectorProviderCapability
+        FastTruncate = ... # type: Qgis.VectorProviderCapability
+        ReadLayerMetadata = ... # type: Qgis.VectorProviderCapability
+        WriteLayerMetadata = ... # type: Qgis.VectorProviderCapability
+        CancelSupport = ... # type: Qgis.VectorProviderCapability
+        CreateRenderer = ... # type: Qgis.VectorProviderCapability
+        CreateLabeling = ... # type: Qgis.VectorProviderCapability
+        ReloadData = ... # type: Qgis.VectorProviderCapability
+        FeatureSymbology = ... # type: Qgis.VectorProviderCapability
+        EditingCapabilities = ... # type: Qgis.VectorProviderCapability
+
+    class DataProviderReadFlag(int):
+        TrustDataSource = ... # type: Qgis.DataProviderReadFlag
+        SkipFeatureCount = ... # type: Qgis.DataProviderReadFlag
+        LoadDefaultStyle = ... # type: Qgis.DataProviderReadFlag
+        SkipGetExtent = ... # type: Qgis.DataProviderReadFlag
+        SkipFullScan = ... # type: Qgis.DataProviderReadFlag
+        ForceReadOnly = ... # type: Qgis.DataProviderReadFlag
+        SkipCredentialsRequest = ... # type: Qgis.DataProviderReadFlag
+        ParallelThreadLoading = ... # type: Qgis.DataProviderReadFlag
+
+    class PythonEmbeddedType(int):
+        Macro = ... # type: Qgis.PythonEmbeddedType
+        ExpressionFunction = ... # type: Qgis.PythonEmbeddedType
+
+    class PythonEmbeddedMode(int):
+        Never = ... # type: Qgis.PythonEmbeddedMode
+        Ask = ... # type: Qgis.PythonEmbeddedMode
+        SessionOnly = ... # type: Qgis.PythonEmbeddedMode
+        Always = ... # type: Qgis.PythonEmbeddedMode
+        NotForThisSession = ... # type: Qgis.PythonEmbeddedMode
+
+    class VectorLayerTypeFlag(int):
+        SqlQuery = ... # type: Qgis.VectorLayerTypeFlag
+
+    class CaptureTechnique(int):
+        StraightSegments = ... # type: Qgis.CaptureTechnique
+        CircularString = ... # type: Qgis.CaptureTechnique
+        Streaming = ... # type: Qgis.CaptureTechnique
+        Shape = ... # type: Qgis.CaptureTechnique
+
+    class DataType(int):
+        UnknownDataType = ... # type: Qgis.DataType
+        Byte = ... # type: Qgis.DataType
+        Int8 = ... # type: Qgis.DataType
+        UInt16 = ... # type: Qgis.DataType
+        Int16 = ... # type: Qgis.DataType
+        UInt32 = ... # type: Qgis.DataType
+        Int32 = ... # type: Qgis.DataType
+        Float32 = ... # type: Qgis.DataType
+        Float64 = ... # type: Qgis.DataType
+        CInt16 = ... # type: Qgis.DataType
+        CInt32 = ... # type: Qgis.DataType
+        CFloat32 = ... # type: Qgis.DataType
+        CFloat64 = ... # type: Qgis.DataType
+        ARGB32 = ... # type: Qgis.DataType
+        ARGB32_Premultiplied = ... # type: Qgis.DataType
+
+    class GeometryType(int):
+        Point = ... # type: Qgis.GeometryType
+        Line = ... # type: Qgis.GeometryType
+        Polygon = ... # type: Qgis.GeometryType
+        Unknown = ... # type: Qgis.GeometryType
+        Null = ... # type: Qgis.GeometryType
+
+    class WkbType(int):
+        Unknown = ... # type: Qgis.WkbType
+        Point = ... # type: Qgis.WkbType
+        LineString = ... # type: Qgis.WkbType
+        Polygon = ... # type: Qgis.WkbType
+        Triangle = ... # type: Qgis.WkbType
+        MultiPoint = ... # type: Qgis.WkbType
+        MultiLineString = ... # type: Qgis.WkbType
+        MultiPolygon = ... # type: Qgis.WkbType
+        GeometryCollection = ... # type: Qgis.WkbType
+        CircularString = ... # type: Qgis.WkbType
+        CompoundCurve = ... # type: Qgis.WkbType
+        CurvePolygon = ... # type: Qgis.WkbType
+        MultiCurve = ... # type: Qgis.WkbType
+        MultiSurface = ... # type: Qgis.WkbType
+        PolyhedralSurface = ... # type: Qgis.WkbType
+        TIN = ... # type: Qgis.WkbType
+        NoGeometry = ... # type: Qgis.WkbType
+        PointZ = ... # type: Qgis.WkbType
+        LineStringZ = ... # type: Qgis.WkbType
+        PolygonZ = ... # type: Qgis.WkbType
+        TriangleZ = ... # type: Qgis.WkbType
+        MultiPointZ = ... # type: Qgis.WkbType
+        MultiLineStringZ = ... # type: Qgis.WkbType
+        MultiPolygonZ = ... # type: Qgis.WkbType
+        GeometryCollectionZ = ... # type: Qgis.WkbType
+        CircularStringZ = ... # type: Qgis.WkbType
+        CompoundCurveZ = ... # type: Qgis.WkbType
+        CurvePolygonZ = ... # type: Qgis.WkbType
+        MultiCurveZ = ... # type: Qgis.WkbType
+        MultiSurfaceZ = ... # type: Qgis.WkbType
+        PolyhedralSurfaceZ = ... # type: Qgis.WkbType
+        TINZ = ... # type: Qgis.WkbType
+        PointM = ... # type: Qgis.WkbType
+        LineStringM = ... # type: Qgis.WkbType
+        PolygonM = ... # type: Qgis.WkbType
+        TriangleM = ... # type: Qgis.WkbType
+        MultiPointM = ... # type: Qgis.WkbType
+        MultiLineStringM = ... # type: Qgis.WkbType
+        MultiPolygonM = ... # type: Qgis.WkbType
+        GeometryCollectionM = ... # type: Qgis.WkbType
+        CircularStringM = ... # type: Qgis.WkbType
+        CompoundCurveM = ... # type: Qgis.WkbType
+        CurvePolygonM = ... # type: Qgis.WkbType
+        MultiCurveM = ... # type: Qgis.WkbType
+        MultiSurfaceM = ... # type: Qgis.WkbType
+        PolyhedralSurfaceM = ... # type: Qgis.WkbType
+        TINM = ... # type: Qgis.WkbType
+        PointZM = ... # type: Qgis.WkbType
+        LineStringZM = ... # type: Qgis.WkbType
+        PolygonZM = ... # type: Qgis.WkbType
+        MultiPointZM = ... # type: Qgis.WkbType
+        MultiLineStringZM = ... # type: Qgis.WkbType
+        MultiPolygonZM = ... # type: Qgis.WkbType
+        GeometryCollectionZM = ... # type: Qgis.WkbType
+        CircularStringZM = ... # type: Qgis.WkbType
+        CompoundCurveZM = ... # type: Qgis.WkbType
+        CurvePolygonZM = ... # type: Qgis.WkbType
+        MultiCurveZM = ... # type: Qgis.WkbType
+        MultiSurfaceZM = ... # type: Qgis.WkbType
+        PolyhedralSurfaceZM = ... # type: Qgis.WkbType
+        TINZM = ... # type: Qgis.WkbType
+        TriangleZM = ... # type: Qgis.WkbType
+        Point25D = ... # type: Qgis.WkbType
+        LineString25D = ... # type: Qgis.WkbType
+        Polygon25D = ... # type: Qgis.WkbType
+        MultiPoint25D = ... # type: Qgis.WkbType
+        MultiLineString25D = ... # type: Qgis.WkbType
+        MultiPolygon25D = ... # type: Qgis.WkbType
+
+    class LoadStyleFlag(int):
+        IgnoreMissingStyleErrors = ... # type: Qgis.LoadStyleFlag
+
+    class LayerFilter(int):
+        RasterLayer = ... # type: Qgis.LayerFilter
+        NoGeometry = ... # type: Qgis.LayerFilter
+        PointLayer = ... # type: Qgis.LayerFilter
+        LineLayer = ... # type: Qgis.LayerFilter
+        PolygonLayer = ... # type: Qgis.LayerFilter
+        HasGeometry = ... # type: Qgis.LayerFilter
+        VectorLayer = ... # type: Qgis.LayerFilter
+        PluginLayer = ... # type: Qgis.LayerFilter
+        WritableLayer = ... # type: Qgis.LayerFilter
+        MeshLayer = ... # type: Qgis.LayerFilter
+        VectorTileLayer = ... # type: Qgis.LayerFilter
+        PointCloudLayer = ... # type: Qgis.LayerFilter
+        AnnotationLayer = ... # type: Qgis.LayerFilter
+        TiledSceneLayer = ... # type: Qgis.LayerFilter
+        All = ... # type: Qgis.LayerFilter
+        SpatialLayer = ... # type: Qgis.LayerFilter
+
+    class LayerType(int):
+        Vector = ... # type: Qgis.LayerType
+        Raster = ... # type: Qgis.LayerType
+        Plugin = ... # type: Qgis.LayerType
+        Mesh = ... # type: Qgis.LayerType
+        VectorTile = ... # type: Qgis.LayerType
+        Annotation = ... # type: Qgis.LayerType
+        PointCloud = ... # type: Qgis.LayerType
+        Group = ... # type: Qgis.LayerType
+        TiledScene = ... # type: Qgis.LayerType
+
+    class MessageLevel(int):
+        Info = ... # type: Qgis.MessageLevel
+        Warning = ... # type: Qgis.MessageLevel
+        Critical = ... # type: Qgis.MessageLevel
+        Success = ... # type: Qgis.MessageLevel
+        NoLevel = ... # type: Qgis.MessageLevel
+
+    class AuthConfigurationStorageCapability(int):
+        ClearStorage = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadConfiguration = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateConfiguration = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteConfiguration = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateConfiguration = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadCertificateIdentity = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateCertificateIdentity = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteCertificateIdentity = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateCertificateIdentity = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadSslCertificateCustomConfig = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateSslCertificateCustomConfig = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteSslCertificateCustomConfig = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateSslCertificateCustomConfig = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadCertificateAuthority = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateCertificateAuthority = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteCertificateAuthority = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateCertificateAuthority = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadCertificateTrustPolicy = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateCertificateTrustPolicy = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteCertificateTrustPolicy = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateCertificateTrustPolicy = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadMasterPassword = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateMasterPassword = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteMasterPassword = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateMasterPassword = ... # type: Qgis.AuthConfigurationStorageCapability
+        ReadSetting = ... # type: Qgis.AuthConfigurationStorageCapability
+        UpdateSetting = ... # type: Qgis.AuthConfigurationStorageCapability
+        DeleteSetting = ... # type: Qgis.AuthConfigurationStorageCapability
+        CreateSetting = ... # type: Qgis.AuthConfigurationStorageCapability
+
+    class AuthConfigurationStorageCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.AuthConfigurationStorageCapabilities', 'Qgis.AuthConfigurationStorageCapability']) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __invert__(self) -> 'Qgis.AuthConfigurationStorageCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LayerFilters(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __xor__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __ior__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __or__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __iand__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __and__(self, f: typing.Union['Qgis.LayerFilters', 'Qgis.LayerFilter']) -> 'Qgis.LayerFilters': ...
+        def __invert__(self) -> 'Qgis.LayerFilters': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LoadStyleFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LoadStyleFlags', 'Qgis.LoadStyleFlag']) -> 'Qgis.LoadStyleFlags': ...
+        def __invert__(self) -> 'Qgis.LoadStyleFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorLayerTypeFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __or__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __and__(self, f: typing.Union['Qgis.VectorLayerTypeFlags', 'Qgis.VectorLayerTypeFlag']) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __invert__(self) -> 'Qgis.VectorLayerTypeFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DataProviderReadFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __or__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __and__(self, f: typing.Union['Qgis.DataProviderReadFlags', 'Qgis.DataProviderReadFlag']) -> 'Qgis.DataProviderReadFlags': ...
+        def __invert__(self) -> 'Qgis.DataProviderReadFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.VectorProviderCapabilities', 'Qgis.VectorProviderCapability']) -> 'Qgis.VectorProviderCapabilities': ...
+        def __invert__(self) -> 'Qgis.VectorProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorDataProviderAttributeEditCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.VectorDataProviderAttributeEditCapabilities', 'Qgis.VectorDataProviderAttributeEditCapability']) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __invert__(self) -> 'Qgis.VectorDataProviderAttributeEditCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SettingsTreeNodeOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __xor__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __ior__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __or__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __iand__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __and__(self, f: typing.Union['Qgis.SettingsTreeNodeOptions', 'Qgis.SettingsTreeNodeOption']) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __invert__(self) -> 'Qgis.SettingsTreeNodeOptions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SldExportOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __xor__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __ior__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __or__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __iand__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __and__(self, f: typing.Union['Qgis.SldExportOptions', 'Qgis.SldExportOption']) -> 'Qgis.SldExportOptions': ...
+        def __invert__(self) -> 'Qgis.SldExportOptions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SettingsOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __xor__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __ior__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __or__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __iand__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __and__(self, f: typing.Union['Qgis.SettingsOptions', 'Qgis.SettingsOption']) -> 'Qgis.SettingsOptions': ...
+        def __invert__(self) -> 'Qgis.SettingsOptions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SnappingTypes(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __xor__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __ior__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __or__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __iand__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __and__(self, f: typing.Union['Qgis.SnappingTypes', 'Qgis.SnappingType']) -> 'Qgis.SnappingTypes': ...
+        def __invert__(self) -> 'Qgis.SnappingTypes': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SymbolRenderHints(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __xor__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __ior__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __or__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __iand__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __and__(self, f: typing.Union['Qgis.SymbolRenderHints', 'Qgis.SymbolRenderHint']) -> 'Qgis.SymbolRenderHints': ...
+        def __invert__(self) -> 'Qgis.SymbolRenderHints': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FeatureRendererFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __or__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __and__(self, f: typing.Union['Qgis.FeatureRendererFlags', 'Qgis.FeatureRendererFlag']) -> 'Qgis.FeatureRendererFlags': ...
+        def __invert__(self) -> 'Qgis.FeatureRendererFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SymbolFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SymbolFlags', 'Qgis.SymbolFlag']) -> 'Qgis.SymbolFlags': ...
+        def __invert__(self) -> 'Qgis.SymbolFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SymbolPreviewFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SymbolPreviewFlags', 'Qgis.SymbolPreviewFlag']) -> 'Qgis.SymbolPreviewFlags': ...
+        def __invert__(self) -> 'Qgis.SymbolPreviewFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SymbolLayerFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SymbolLayerFlags', 'Qgis.SymbolLayerFlag']) -> 'Qgis.SymbolLayerFlags': ...
+        def __invert__(self) -> 'Qgis.SymbolLayerFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SymbolLayerUserFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SymbolLayerUserFlags', 'Qgis.SymbolLayerUserFlag']) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __invert__(self) -> 'Qgis.SymbolLayerUserFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class BrowserItemCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.BrowserItemCapabilities', 'Qgis.BrowserItemCapability']) -> 'Qgis.BrowserItemCapabilities': ...
+        def __invert__(self) -> 'Qgis.BrowserItemCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DataItemProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.DataItemProviderCapabilities', 'Qgis.DataItemProviderCapability']) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __invert__(self) -> 'Qgis.DataItemProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorFileWriterCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.VectorFileWriterCapabilities', 'Qgis.VectorFileWriterCapability']) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __invert__(self) -> 'Qgis.VectorFileWriterCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SqlLayerDefinitionCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.SqlLayerDefinitionCapabilities', 'Qgis.SqlLayerDefinitionCapability']) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __invert__(self) -> 'Qgis.SqlLayerDefinitionCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LabelLinePlacementFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LabelLinePlacementFlags', 'Qgis.LabelLinePlacementFlag']) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __invert__(self) -> 'Qgis.LabelLinePlacementFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LabelPolygonPlacementFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LabelPolygonPlacementFlags', 'Qgis.LabelPolygonPlacementFlag']) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __invert__(self) -> 'Qgis.LabelPolygonPlacementFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class UriCleaningFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __or__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __and__(self, f: typing.Union['Qgis.UriCleaningFlags', 'Qgis.UriCleaningFlag']) -> 'Qgis.UriCleaningFlags': ...
+        def __invert__(self) -> 'Qgis.UriCleaningFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SublayerQueryFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SublayerQueryFlags', 'Qgis.SublayerQueryFlag']) -> 'Qgis.SublayerQueryFlags': ...
+        def __invert__(self) -> 'Qgis.SublayerQueryFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SublayerFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SublayerFlags', 'Qgis.SublayerFlag']) -> 'Qgis.SublayerFlags': ...
+        def __invert__(self) -> 'Qgis.SublayerFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterRendererFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __or__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __and__(self, f: typing.Union['Qgis.RasterRendererFlags', 'Qgis.RasterRendererFlag']) -> 'Qgis.RasterRendererFlags': ...
+        def __invert__(self) -> 'Qgis.RasterRendererFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterRendererCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.RasterRendererCapabilities', 'Qgis.RasterRendererCapability']) -> 'Qgis.RasterRendererCapabilities': ...
+        def __invert__(self) -> 'Qgis.RasterRendererCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FieldConfigurationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.FieldConfigurationFlags', 'Qgis.FieldConfigurationFlag']) -> 'Qgis.FieldConfigurationFlags': ...
+        def __invert__(self) -> 'Qgis.FieldConfigurationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SelectionFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __or__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __and__(self, f: typing.Union['Qgis.SelectionFlags', 'Qgis.SelectionFlag']) -> 'Qgis.SelectionFlags': ...
+        def __invert__(self) -> 'Qgis.SelectionFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class GpsInformationComponents(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __xor__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __ior__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __or__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __iand__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __and__(self, f: typing.Union['Qgis.GpsInformationComponents', 'Qgis.GpsInformationComponent']) -> 'Qgis.GpsInformationComponents': ...
+        def __invert__(self) -> 'Qgis.GpsInformationComponents': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class BabelFormatCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.BabelFormatCapabilities', 'Qgis.BabelFormatCapability']) -> 'Qgis.BabelFormatCapabilities': ...
+        def __invert__(self) -> 'Qgis.BabelFormatCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class BabelCommandFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __or__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __and__(self, f: typing.Union['Qgis.BabelCommandFlags', 'Qgis.BabelCommandFlag']) -> 'Qgis.BabelCommandFlags': ...
+        def __invert__(self) -> 'Qgis.BabelCommandFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class GeometryValidityFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __or__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __and__(self, f: typing.Union['Qgis.GeometryValidityFlags', 'Qgis.GeometryValidityFlag']) -> 'Qgis.GeometryValidityFlags': ...
+        def __invert__(self) -> 'Qgis.GeometryValidityFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class GeosCreationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.GeosCreationFlags', 'Qgis.GeosCreationFlag']) -> 'Qgis.GeosCreationFlags': ...
+        def __invert__(self) -> 'Qgis.GeosCreationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FeatureRequestFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __or__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __and__(self, f: typing.Union['Qgis.FeatureRequestFlags', 'Qgis.FeatureRequestFlag']) -> 'Qgis.FeatureRequestFlags': ...
+        def __invert__(self) -> 'Qgis.FeatureRequestFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FileOperationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.FileOperationFlags', 'Qgis.FileOperationFlag']) -> 'Qgis.FileOperationFlags': ...
+        def __invert__(self) -> 'Qgis.FileOperationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapLayerProperties(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __xor__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __ior__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __or__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __iand__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __and__(self, f: typing.Union['Qgis.MapLayerProperties', 'Qgis.MapLayerProperty']) -> 'Qgis.MapLayerProperties': ...
+        def __invert__(self) -> 'Qgis.MapLayerProperties': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DataProviderFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __or__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __and__(self, f: typing.Union['Qgis.DataProviderFlags', 'Qgis.DataProviderFlag']) -> 'Qgis.DataProviderFlags': ...
+        def __invert__(self) -> 'Qgis.DataProviderFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class AnnotationItemFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __or__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __and__(self, f: typing.Union['Qgis.AnnotationItemFlags', 'Qgis.AnnotationItemFlag']) -> 'Qgis.AnnotationItemFlags': ...
+        def __invert__(self) -> 'Qgis.AnnotationItemFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class AnnotationItemGuiFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __or__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __and__(self, f: typing.Union['Qgis.AnnotationItemGuiFlags', 'Qgis.AnnotationItemGuiFlag']) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __invert__(self) -> 'Qgis.AnnotationItemGuiFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterTemporalCapabilityFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __or__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __and__(self, f: typing.Union['Qgis.RasterTemporalCapabilityFlags', 'Qgis.RasterTemporalCapabilityFlag']) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __invert__(self) -> 'Qgis.RasterTemporalCapabilityFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class CoordinateTransformationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.CoordinateTransformationFlags', 'Qgis.CoordinateTransformationFlag']) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __invert__(self) -> 'Qgis.CoordinateTransformationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapSettingsFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __or__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __and__(self, f: typing.Union['Qgis.MapSettingsFlags', 'Qgis.MapSettingsFlag']) -> 'Qgis.MapSettingsFlags': ...
+        def __invert__(self) -> 'Qgis.MapSettingsFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RenderContextFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __or__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __and__(self, f: typing.Union['Qgis.RenderContextFlags', 'Qgis.RenderContextFlag']) -> 'Qgis.RenderContextFlags': ...
+        def __invert__(self) -> 'Qgis.RenderContextFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapLayerRendererFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __or__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __and__(self, f: typing.Union['Qgis.MapLayerRendererFlags', 'Qgis.MapLayerRendererFlag']) -> 'Qgis.MapLayerRendererFlags': ...
+        def __invert__(self) -> 'Qgis.MapLayerRendererFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class PaintEffectFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __or__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __and__(self, f: typing.Union['Qgis.PaintEffectFlags', 'Qgis.PaintEffectFlag']) -> 'Qgis.PaintEffectFlags': ...
+        def __invert__(self) -> 'Qgis.PaintEffectFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LabelingFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LabelingFlags', 'Qgis.LabelingFlag']) -> 'Qgis.LabelingFlags': ...
+        def __invert__(self) -> 'Qgis.LabelingFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class TextComponents(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __xor__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __ior__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __or__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __iand__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __and__(self, f: typing.Union['Qgis.TextComponents', 'Qgis.TextComponent']) -> 'Qgis.TextComponents': ...
+        def __invert__(self) -> 'Qgis.TextComponents': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class CurvedTextFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __or__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __and__(self, f: typing.Union['Qgis.CurvedTextFlags', 'Qgis.CurvedTextFlag']) -> 'Qgis.CurvedTextFlags': ...
+        def __invert__(self) -> 'Qgis.CurvedTextFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorRenderingSimplificationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.VectorRenderingSimplificationFlags', 'Qgis.VectorRenderingSimplificationFlag']) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __invert__(self) -> 'Qgis.VectorRenderingSimplificationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MarkerLinePlacements(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __xor__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __ior__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __or__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __iand__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __and__(self, f: typing.Union['Qgis.MarkerLinePlacements', 'Qgis.MarkerLinePlacement']) -> 'Qgis.MarkerLinePlacements': ...
+        def __invert__(self) -> 'Qgis.MarkerLinePlacements': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class TextRendererFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __or__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __and__(self, f: typing.Union['Qgis.TextRendererFlags', 'Qgis.TextRendererFlag']) -> 'Qgis.TextRendererFlags': ...
+        def __invert__(self) -> 'Qgis.TextRendererFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapCanvasFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __or__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __and__(self, f: typing.Union['Qgis.MapCanvasFlags', 'Qgis.MapCanvasFlag']) -> 'Qgis.MapCanvasFlags': ...
+        def __invert__(self) -> 'Qgis.MapCanvasFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ViewSyncModeFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ViewSyncModeFlags', 'Qgis.ViewSyncModeFlag']) -> 'Qgis.ViewSyncModeFlags': ...
+        def __invert__(self) -> 'Qgis.ViewSyncModeFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class HistoryProviderBackends(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __xor__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __ior__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __or__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __iand__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __and__(self, f: typing.Union['Qgis.HistoryProviderBackends', 'Qgis.HistoryProviderBackend']) -> 'Qgis.HistoryProviderBackends': ...
+        def __invert__(self) -> 'Qgis.HistoryProviderBackends': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingProviderFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingProviderFlags', 'Qgis.ProcessingProviderFlag']) -> 'Qgis.ProcessingProviderFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingProviderFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingAlgorithmFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingAlgorithmFlags', 'Qgis.ProcessingAlgorithmFlag']) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingAlgorithmFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingAlgorithmDocumentationFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingAlgorithmDocumentationFlags', 'Qgis.ProcessingAlgorithmDocumentationFlag']) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingAlgorithmDocumentationFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingFeatureSourceDefinitionFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingFeatureSourceDefinitionFlags', 'Qgis.ProcessingFeatureSourceDefinitionFlag']) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingFeatureSourceDefinitionFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingFeatureSourceFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingFeatureSourceFlags', 'Qgis.ProcessingFeatureSourceFlag']) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingFeatureSourceFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingParameterTypeFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingParameterTypeFlags', 'Qgis.ProcessingParameterTypeFlag']) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingParameterTypeFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProcessingParameterFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProcessingParameterFlags', 'Qgis.ProcessingParameterFlag']) -> 'Qgis.ProcessingParameterFlags': ...
+        def __invert__(self) -> 'Qgis.ProcessingParameterFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProjectFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProjectFlags', 'Qgis.ProjectFlag']) -> 'Qgis.ProjectFlags': ...
+        def __invert__(self) -> 'Qgis.ProjectFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class PlotToolFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __or__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __and__(self, f: typing.Union['Qgis.PlotToolFlags', 'Qgis.PlotToolFlag']) -> 'Qgis.PlotToolFlags': ...
+        def __invert__(self) -> 'Qgis.PlotToolFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProfileGeneratorFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProfileGeneratorFlags', 'Qgis.ProfileGeneratorFlag']) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __invert__(self) -> 'Qgis.ProfileGeneratorFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProjectReadFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __or__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __and__(self, f: typing.Union['Qgis.ProjectReadFlags', 'Qgis.ProjectReadFlag']) -> 'Qgis.ProjectReadFlags': ...
+        def __invert__(self) -> 'Qgis.ProjectReadFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProjectCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.ProjectCapabilities', 'Qgis.ProjectCapability']) -> 'Qgis.ProjectCapabilities': ...
+        def __invert__(self) -> 'Qgis.ProjectCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RelationshipCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.RelationshipCapabilities', 'Qgis.RelationshipCapability']) -> 'Qgis.RelationshipCapabilities': ...
+        def __invert__(self) -> 'Qgis.RelationshipCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ScriptLanguageCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.ScriptLanguageCapabilities', 'Qgis.ScriptLanguageCapability']) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __invert__(self) -> 'Qgis.ScriptLanguageCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LayerTreeFilterFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LayerTreeFilterFlags', 'Qgis.LayerTreeFilterFlag']) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __invert__(self) -> 'Qgis.LayerTreeFilterFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LegendJsonRenderFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LegendJsonRenderFlags', 'Qgis.LegendJsonRenderFlag']) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __invert__(self) -> 'Qgis.LegendJsonRenderFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapLayerActionTargets(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __xor__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __ior__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __or__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __iand__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __and__(self, f: typing.Union['Qgis.MapLayerActionTargets', 'Qgis.MapLayerActionTarget']) -> 'Qgis.MapLayerActionTargets': ...
+        def __invert__(self) -> 'Qgis.MapLayerActionTargets': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class MapLayerActionFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __or__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __and__(self, f: typing.Union['Qgis.MapLayerActionFlags', 'Qgis.MapLayerActionFlag']) -> 'Qgis.MapLayerActionFlags': ...
+        def __invert__(self) -> 'Qgis.MapLayerActionFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterInterfaceCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.RasterInterfaceCapabilities', 'Qgis.RasterInterfaceCapability']) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __invert__(self) -> 'Qgis.RasterInterfaceCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.RasterProviderCapabilities', 'Qgis.RasterProviderCapability']) -> 'Qgis.RasterProviderCapabilities': ...
+        def __invert__(self) -> 'Qgis.RasterProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LayoutRenderFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __or__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __and__(self, f: typing.Union['Qgis.LayoutRenderFlags', 'Qgis.LayoutRenderFlag']) -> 'Qgis.LayoutRenderFlags': ...
+        def __invert__(self) -> 'Qgis.LayoutRenderFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DatabaseProviderConnectionCapabilities2(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __xor__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __ior__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __or__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __iand__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __and__(self, f: typing.Union['Qgis.DatabaseProviderConnectionCapabilities2', 'Qgis.DatabaseProviderConnectionCapability2']) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __invert__(self) -> 'Qgis.DatabaseProviderConnectionCapabilities2': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DatabaseProviderTableImportCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.DatabaseProviderTableImportCapabilities', 'Qgis.DatabaseProviderTableImportCapability']) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __invert__(self) -> 'Qgis.DatabaseProviderTableImportCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProviderStyleStorageCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.ProviderStyleStorageCapabilities', 'Qgis.ProviderStyleStorageCapability']) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __invert__(self) -> 'Qgis.ProviderStyleStorageCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorTileProviderFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __or__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __and__(self, f: typing.Union['Qgis.VectorTileProviderFlags', 'Qgis.VectorTileProviderFlag']) -> 'Qgis.VectorTileProviderFlags': ...
+        def __invert__(self) -> 'Qgis.VectorTileProviderFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorTileProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.VectorTileProviderCapabilities', 'Qgis.VectorTileProviderCapability']) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __invert__(self) -> 'Qgis.VectorTileProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class TiledSceneProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __or__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __and__(self, f: typing.Union['Qgis.TiledSceneProviderCapabilities', 'Qgis.TiledSceneProviderCapability']) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __invert__(self) -> 'Qgis.TiledSceneProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class TiledSceneRequestFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __or__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __and__(self, f: typing.Union['Qgis.TiledSceneRequestFlags', 'Qgis.TiledSceneRequestFlag']) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __invert__(self) -> 'Qgis.TiledSceneRequestFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class TiledSceneRendererFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __xor__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __ior__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __or__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __iand__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __and__(self, f: typing.Union['Qgis.TiledSceneRendererFlags', 'Qgis.TiledSceneRendererFlag']) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __invert__(self) -> 'Qgis.TiledSceneRendererFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ZonalStatistics(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __xor__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __ior__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __or__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __iand__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __and__(self, f: typing.Union['Qgis.ZonalStatistics', 'Qgis.ZonalStatistic']) -> 'Qgis.ZonalStatistics': ...
+        def __invert__(self) -> 'Qgis.ZonalStatistics': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class Statistics(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __xor__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __ior__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __or__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __iand__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __and__(self, f: typing.Union['Qgis.Statistics', 'Qgis.Statistic']) -> 'Qgis.Statistics': ...
+        def __invert__(self) -> 'Qgis.Statistics': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DateTimeStatistics(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __xor__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __ior__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __or__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __iand__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __and__(self, f: typing.Union['Qgis.DateTimeStatistics', 'Qgis.DateTimeStatistic']) -> 'Qgis.DateTimeStatistics': ...
+        def __invert__(self) -> 'Qgis.DateTimeStatistics': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class StringStatistics(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __xor__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __ior__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __or__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __iand__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __and__(self, f: typing.Union['Qgis.StringStatistics', 'Qgis.StringStatistic']) -> 'Qgis.StringStatistics': ...
+        def __invert__(self) -> 'Qgis.StringStatistics': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class RasterBandStatistics(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __xor__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __ior__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __or__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __iand__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __and__(self, f: typing.Union['Qgis.RasterBandStatistics', 'Qgis.RasterBandStatistic']) -> 'Qgis.RasterBandStatistics': ...
+        def __invert__(self) -> 'Qgis.RasterBandStatistics': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    DEFAULT_HIGHLIGHT_BUFFER_MM = ... # type: float
+    DEFAULT_HIGHLIGHT_COLOR = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    DEFAULT_HIGHLIGHT_MIN_WIDTH_MM = ... # type: float
+    DEFAULT_LINE_WIDTH = ... # type: float
+    DEFAULT_MAPTOPIXEL_THRESHOLD = ... # type: float
+    DEFAULT_M_COORDINATE = ... # type: float
+    DEFAULT_POINT_SIZE = ... # type: float
+    DEFAULT_SEARCH_RADIUS_MM = ... # type: float
+    DEFAULT_SEGMENT_EPSILON = ... # type: float
+    DEFAULT_SNAP_TOLERANCE = ... # type: float
+    DEFAULT_SNAP_UNITS = ... # type: 'Qgis.MapToolUnit'
+    DEFAULT_Z_COORDINATE = ... # type: float
+    QGIS_DEV_VERSION = ... # type: str
+    SCALE_PRECISION = ... # type: float
+    UI_SCALE_FACTOR = ... # type: float
+    USER_CRS_START_ID = ... # type: int
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'Qgis') -> None: ...
+
+    @staticmethod
+    def geoProj4() -> str: ...
+    @staticmethod
+    def geoWkt() -> str: ...
+    @staticmethod
+    def geographicCrsAuthId() -> str: ...
+    @staticmethod
+    def geoNone() -> str: ...
+    @staticmethod
+    def geosVersion() -> str: ...
+    @staticmethod
+    def geosVersionPatch() -> int: ...
+    @staticmethod
+    def geosVersionMinor() -> int: ...
+    @staticmethod
+    def geosVersionMajor() -> int: ...
+    @staticmethod
+    def geosVersionInt() -> int: ...
+    @staticmethod
+    def defaultProjectScales() -> str: ...
+    @staticmethod
+    def devVersion() -> str: ...
+    @staticmethod
+    def releaseName() -> str: ...
+    @staticmethod
+    def versionInt() -> int: ...
+    @staticmethod
+    def version() -> str: ...
+    UnknownDataType: Qgis.DataType
+    Byte: Qgis.DataType
+    Int8: Qgis.DataType
+    UInt16: Qgis.DataType
+    Int16: Qgis.DataType
+    UInt32: Qgis.DataType
+    Int32: Qgis.DataType
+    Float32: Qgis.DataType
+    Float64: Qgis.DataType
+    CInt16: Qgis.DataType
+    CInt32: Qgis.DataType
+    CFloat32: Qgis.DataType
+    CFloat64: Qgis.DataType
+    ARGB32: Qgis.DataType
+    ARGB32_Premultiplied: Qgis.DataType
+    PythonMacroMode: typing.Type[Qgis.PythonEmbeddedMode]
+    Never: Qgis.PythonEmbeddedMode
+    Ask: Qgis.PythonEmbeddedMode
+    SessionOnly: Qgis.PythonEmbeddedMode
+    Always: Qgis.PythonEmbeddedMode
+    NotForThisSession: Qgis.PythonEmbeddedMode
+    GpsConnectionStatus: typing.Type[Qgis.DeviceConnectionStatus]
+    Disconnected: Qgis.DeviceConnectionStatus
+    Connecting: Qgis.DeviceConnectionStatus
+    Connected: Qgis.DeviceConnectionStatus
+    NoConstraint: Qgis.BetweenLineConstraint
+    Perpendicular: Qgis.BetweenLineConstraint
+    Parallel: Qgis.BetweenLineConstraint
+
+
+class QgsAbstractContentCacheEntry(PyQt5.sip.wrapper):
+
+    fileModified = ... # type: typing.Union[QtCore.QDateTime, datetime.datetime]
+    fileModifiedLastCheckTimer = ... # type: QtCore.QElapsedTimer
+    mFileModifiedCheckTimeout = ... # type: int
+    nextEntry = ... # type: 'QgsAbstractContentCacheEntry'
+    path = ... # type: typing.Optional[str]
+    previousEntry = ... # type: 'QgsAbstractContentCacheEntry'
+
+    def __init__(self, path: typing.Optional[str]) -> None: ...
+
+    def __ne__(self, other: object): ...
+    def isEqual(self, other: typing.Optional['QgsAbstractContentCacheEntry']) -> bool: ...
+    def dump(self) -> None: ...
+    def dataSize(self) -> int: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsAbstractContentCacheBase(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def onRemoteContentFetched(self, url: typing.Optional[str], success: bool) -> None: ...
+    def checkReply(self, reply: typing.Optional[QtNetwork.QNetworkReply], path: typing.Optional[str]) -> bool: ...
+    remoteContentFetched: typing.ClassVar[QtCore.pyqtSignal]
+    def invalidateCacheEntry(self, path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def isBase64Data(path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def parseEmbeddedStringData(path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str], typing.Optional[str]]: ...
+    @staticmethod
+    def parseBase64DataUrl(path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str], typing.Optional[str]]: ...
+
+
+class QgsAlignRasterData(PyQt5.sip.wrapper):
+
+    class RasterItem(PyQt5.sip.wrapper):
+
+        inputFilename = ... # type: typing.Optional[str]
+        outputFilename = ... # type: typing.Optional[str]
+        resampleMethod = ... # type: Qgis.GdalResampleAlgorithm
+        rescaleValues = ... # type: bool
+        srcCellSizeInDestCRS = ... # type: float
+
+        @typing.overload
+        def __init__(self, input: typing.Optional[str], output: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAlignRasterData.RasterItem') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAlignRasterData') -> None: ...
+
+
+class QgsAnimatedIcon(QtCore.QObject):
+
+    def __init__(self, iconPath: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    frameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def height(self) -> int: ...
+    def width(self) -> int: ...
+    def disconnectFrameChanged(self, receiver: typing.Optional[QtCore.QObject], method: typing.Optional[str]) -> bool: ...
+    def connectFrameChanged(self, receiver: typing.Optional[QtCore.QObject], method: typing.Optional[str]) -> bool: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def setIconPath(self, iconPath: typing.Optional[str]) -> None: ...
+    def iconPath(self) -> str: ...
+
+
+class QgsArchive(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsArchive') -> None: ...
+
+    def exists(self) -> bool: ...
+    def dir(self) -> str: ...
+    def files(self) -> list[str]: ...
+    def removeFile(self, filename: typing.Optional[str]) -> bool: ...
+    def addFile(self, filename: typing.Optional[str]) -> None: ...
+    def clear(self) -> None: ...
+    def unzip(self, zipFilename: typing.Optional[str]) -> bool: ...
+    def zip(self, zipFilename: typing.Optional[str]) -> bool: ...
+
+
+class QgsProjectArchive(QgsArchive):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectArchive') -> None: ...
+
+    def auxiliaryStorageFile(self) -> str: ...
+    def clearProjectFile(self) -> bool: ...
+    def projectFile(self) -> str: ...
+    def unzip(self, zipFilename: typing.Optional[str]) -> bool: ...
+
+
+class QgsAttributeTableConfig(PyQt5.sip.wrapper):
+
+    class ActionWidgetStyle(int):
+        ButtonList = ... # type: QgsAttributeTableConfig.ActionWidgetStyle
+        DropDown = ... # type: QgsAttributeTableConfig.ActionWidgetStyle
+
+    class Type(int):
+        Field = ... # type: QgsAttributeTableConfig.Type
+        Action = ... # type: QgsAttributeTableConfig.Type
+
+    class ColumnConfig(PyQt5.sip.wrapper):
+
+        hidden = ... # type: bool
+        name = ... # type: typing.Optional[str]
+        type = ... # type: 'QgsAttributeTableConfig.Type'
+        width = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAttributeTableConfig.ColumnConfig') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeTableConfig') -> None: ...
+
+    def __eq__(self, other: object): ...
+    def __ne__(self, other: object): ...
+    def hasSameColumns(self, other: 'QgsAttributeTableConfig') -> bool: ...
+    def setSortOrder(self, sortOrder: QtCore.Qt.SortOrder) -> None: ...
+    def sortOrder(self) -> QtCore.Qt.SortOrder: ...
+    def setColumnHidden(self, column: int, hidden: bool) -> None: ...
+    def columnHidden(self, column: int) -> bool: ...
+    def setColumnWidth(self, column: int, width: int) -> None: ...
+    def columnWidth(self, column: int) -> int: ...
+    def setSortExpression(self, sortExpression: typing.Optional[str]) -> None: ...
+    def sortExpression(self) -> str: ...
+    def readXml(self, node: QtXml.QDomNode) -> None: ...
+    def writeXml(self, node: QtXml.QDomNode) -> None: ...
+    def setActionWidgetStyle(self, actionWidgetStyle: 'QgsAttributeTableConfig.ActionWidgetStyle') -> None: ...
+    def actionWidgetStyle(self) -> 'QgsAttributeTableConfig.ActionWidgetStyle': ...
+    def setActionWidgetVisible(self, visible: bool) -> None: ...
+    def actionWidgetVisible(self) -> bool: ...
+    def update(self, fields: 'QgsFields') -> None: ...
+    def setColumns(self, columns: collections.abc.Iterable['QgsAttributeTableConfig.ColumnConfig']) -> None: ...
+    def mapVisibleColumnToIndex(self, visibleColumn: int) -> int: ...
+    def __len__(self) -> int: ...
+    def size(self) -> int: ...
+    def isEmpty(self) -> bool: ...
+    def columns(self) -> list['QgsAttributeTableConfig.ColumnConfig']: ...
+
+
+class QgsCommandLineUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCommandLineUtils') -> None: ...
+
+    @staticmethod
+    def allVersions() -> str: ...
+
+
+class QgsColorRamp(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorRamp') -> None: ...
+
+    @staticmethod
+    def rampTypes() -> list[tuple[str, str]]: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsColorRamp']: ...
+    def invert(self) -> None: ...
+    def type(self) -> str: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    def count(self) -> int: ...
+
+
+class QgsGradientStop(PyQt5.sip.wrapper):
+
+    color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    offset = ... # type: float
+
+    @typing.overload
+    def __init__(self, offset: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGradientStop') -> None: ...
+
+    def setDirection(self, direction: Qgis.AngularDirection) -> None: ...
+    def direction(self) -> Qgis.AngularDirection: ...
+    def setColorSpec(self, spec: QtGui.QColor.Spec) -> None: ...
+    def colorSpec(self) -> QtGui.QColor.Spec: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsGradientColorRamp(QgsColorRamp):
+
+    @typing.overload
+    def __init__(self, color1: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., discrete: bool = ..., stops: collections.abc.Iterable[QgsGradientStop] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGradientColorRamp') -> None: ...
+
+    def setDirection(self, direction: Qgis.AngularDirection) -> None: ...
+    def direction(self) -> Qgis.AngularDirection: ...
+    def setColorSpec(self, spec: QtGui.QColor.Spec) -> None: ...
+    def colorSpec(self) -> QtGui.QColor.Spec: ...
+    def addStopsToGradient(self, gradient: typing.Optional[QtGui.QGradient], opacity: float = ...) -> None: ...
+    def setInfo(self, info: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def info(self) -> dict[str, str]: ...
+    def stops(self) -> list[QgsGradientStop]: ...
+    def setStops(self, stops: collections.abc.Iterable[QgsGradientStop]) -> None: ...
+    def convertToDiscrete(self, discrete: bool) -> None: ...
+    def setDiscrete(self, discrete: bool) -> None: ...
+    def isDiscrete(self) -> bool: ...
+    def setColor2(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setColor1(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color2(self) -> QtGui.QColor: ...
+    def color1(self) -> QtGui.QColor: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsGradientColorRamp']: ...
+    def invert(self) -> None: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    def count(self) -> int: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsColorRamp]: ...
+
+
+class QgsLimitedRandomColorRamp(QgsColorRamp):
+
+    @typing.overload
+    def __init__(self, count: int = ..., hueMin: int = ..., hueMax: int = ..., satMin: int = ..., satMax: int = ..., valMin: int = ..., valMax: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLimitedRandomColorRamp') -> None: ...
+
+    def setValMax(self, val: int) -> None: ...
+    def setValMin(self, val: int) -> None: ...
+    def setSatMax(self, val: int) -> None: ...
+    def setSatMin(self, val: int) -> None: ...
+    def setHueMax(self, val: int) -> None: ...
+    def setHueMin(self, val: int) -> None: ...
+    def setCount(self, val: int) -> None: ...
+    def valMax(self) -> int: ...
+    def valMin(self) -> int: ...
+    def satMax(self) -> int: ...
+    def satMin(self) -> int: ...
+    def hueMax(self) -> int: ...
+    def hueMin(self) -> int: ...
+    def updateColors(self) -> None: ...
+    @staticmethod
+    def randomColors(count: int, hueMax: int = ..., hueMin: int = ..., satMax: int = ..., satMin: int = ..., valMax: int = ..., valMin: int = ...) -> list[QtGui.QColor]: ...
+    def count(self) -> int: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsLimitedRandomColorRamp']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsColorRamp]: ...
+
+
+class QgsRandomColorRamp(QgsColorRamp):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRandomColorRamp') -> None: ...
+
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsRandomColorRamp']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    def setTotalColorCount(self, colorCount: int) -> None: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    def count(self) -> int: ...
+
+
+class QgsColorScheme(PyQt5.sip.wrapper):
+
+    class SchemeFlag(int):
+        ShowInColorDialog = ... # type: QgsColorScheme.SchemeFlag
+        ShowInColorButtonMenu = ... # type: QgsColorScheme.SchemeFlag
+        ShowInAllContexts = ... # type: QgsColorScheme.SchemeFlag
+
+    class SchemeFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __xor__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __ior__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __or__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __iand__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __and__(self, f: typing.Union['QgsColorScheme.SchemeFlags', 'QgsColorScheme.SchemeFlag']) -> 'QgsColorScheme.SchemeFlags': ...
+        def __invert__(self) -> 'QgsColorScheme.SchemeFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorScheme') -> None: ...
+
+    def clone(self) -> typing.Optional['QgsColorScheme']: ...
+    def setColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+    def flags(self) -> 'QgsColorScheme.SchemeFlags': ...
+    def schemeName(self) -> str: ...
+
+
+class QgsPresetSchemeColorRamp(QgsColorRamp, QgsColorScheme):
+
+    @typing.overload
+    def __init__(self, colors: collections.abc.Iterable[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPresetSchemeColorRamp') -> None: ...
+
+    def isEditable(self) -> bool: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+    def schemeName(self) -> str: ...
+    def count(self) -> int: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsPresetSchemeColorRamp']: ...
+    def invert(self) -> None: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    def colors(self) -> list[QtGui.QColor]: ...
+    def setColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], a1: typing.Optional[str] = ..., a2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> bool: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsColorRamp]: ...
+
+
+class QgsColorBrewerColorRamp(QgsColorRamp):
+
+    @typing.overload
+    def __init__(self, schemeName: typing.Optional[str] = ..., colors: int = ..., inverted: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorBrewerColorRamp') -> None: ...
+
+    def loadPalette(self) -> None: ...
+    @staticmethod
+    def listSchemeVariants(schemeName: typing.Optional[str]) -> list[int]: ...
+    @staticmethod
+    def listSchemeNames() -> list[str]: ...
+    def setColors(self, colors: int) -> None: ...
+    def setSchemeName(self, schemeName: typing.Optional[str]) -> None: ...
+    def colors(self) -> int: ...
+    def schemeName(self) -> str: ...
+    def count(self) -> int: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsColorBrewerColorRamp']: ...
+    def invert(self) -> None: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def value(self, index: int) -> float: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsColorRamp]: ...
+
+
+class QgsCptCityColorRamp(QgsGradientColorRamp):
+
+    @typing.overload
+    def __init__(self, schemeName: typing.Optional[str] = ..., variantName: typing.Optional[str] = ..., inverted: bool = ..., doLoadFile: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, schemeName: typing.Optional[str], variantList: collections.abc.Iterable[typing.Optional[str]], variantName: typing.Optional[str] = ..., inverted: bool = ..., doLoadFile: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCptCityColorRamp') -> None: ...
+
+    def copyingInfo(self) -> dict[str, str]: ...
+    def descFileName(self) -> str: ...
+    def copyingFileName(self) -> str: ...
+    def fileLoaded(self) -> bool: ...
+    def loadFile(self) -> bool: ...
+    def fileName(self) -> str: ...
+    def hasMultiStops(self) -> bool: ...
+    def loadPalette(self) -> None: ...
+    def setName(self, schemeName: typing.Optional[str], variantName: typing.Optional[str] = ..., variantList: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def setVariantList(self, variantList: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setVariantName(self, variantName: typing.Optional[str]) -> None: ...
+    def setSchemeName(self, schemeName: typing.Optional[str]) -> None: ...
+    def variantList(self) -> list[str]: ...
+    def variantName(self) -> str: ...
+    def schemeName(self) -> str: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def cloneGradientRamp(self) -> typing.Optional[QgsGradientColorRamp]: ...
+    def copy(self, other: typing.Optional['QgsCptCityColorRamp']) -> None: ...
+    def clone(self) -> typing.Optional['QgsCptCityColorRamp']: ...
+    def invert(self) -> None: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeString() -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsColorRamp]: ...
+
+
+class QgsGplColorScheme(QgsColorScheme):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGplColorScheme') -> None: ...
+
+    def gplFilePath(self) -> str: ...
+    def setColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> bool: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+
+
+class QgsUserColorScheme(QgsGplColorScheme):
+
+    @typing.overload
+    def __init__(self, filename: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsUserColorScheme') -> None: ...
+
+    def gplFilePath(self) -> str: ...
+    def setShowSchemeInMenu(self, show: bool) -> None: ...
+    def erase(self) -> bool: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def flags(self) -> QgsColorScheme.SchemeFlags: ...
+    def isEditable(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsUserColorScheme']: ...
+    def schemeName(self) -> str: ...
+
+
+class QgsRecentColorScheme(QgsColorScheme):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRecentColorScheme') -> None: ...
+
+    @staticmethod
+    def lastUsedColor() -> QtGui.QColor: ...
+    @staticmethod
+    def addRecentColor(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def clone(self) -> typing.Optional['QgsRecentColorScheme']: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+    def flags(self) -> QgsColorScheme.SchemeFlags: ...
+    def schemeName(self) -> str: ...
+
+
+class QgsCustomColorScheme(QgsColorScheme):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCustomColorScheme') -> None: ...
+
+    def clone(self) -> typing.Optional['QgsCustomColorScheme']: ...
+    def setColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+    def flags(self) -> QgsColorScheme.SchemeFlags: ...
+    def schemeName(self) -> str: ...
+
+
+class QgsProjectColorScheme(QgsColorScheme):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectColorScheme') -> None: ...
+
+    def clone(self) -> typing.Optional['QgsProjectColorScheme']: ...
+    def setColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def fetchColors(self, context: typing.Optional[str] = ..., baseColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> list[tuple[QtGui.QColor, str]]: ...
+    def flags(self) -> QgsColorScheme.SchemeFlags: ...
+    def schemeName(self) -> str: ...
+
+
+class QgsColorSchemeRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorSchemeRegistry') -> None: ...
+
+    def fetchRandomStyleColor(self) -> QtGui.QColor: ...
+    def randomStyleColorScheme(self) -> typing.Optional[QgsColorScheme]: ...
+    def setRandomStyleColorScheme(self, scheme: typing.Optional[QgsColorScheme]) -> None: ...
+    @typing.overload
+    def schemes(self) -> list[QgsColorScheme]: ...
+    @typing.overload
+    def schemes(self, flag: QgsColorScheme.SchemeFlag) -> list[QgsColorScheme]: ...
+    def removeColorScheme(self, scheme: typing.Optional[QgsColorScheme]) -> bool: ...
+    def addColorScheme(self, scheme: typing.Optional[QgsColorScheme]) -> None: ...
+    def addUserSchemes(self) -> None: ...
+    def initStyleScheme(self) -> None: ...
+    def addDefaultSchemes(self) -> None: ...
+    def populateFromInstance(self) -> None: ...
+
+
+class QgsCredentials(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def setInstance(self, instance: typing.Optional['QgsCredentials']) -> None: ...
+    def requestMasterPassword(self, password: typing.Optional[str], stored: bool = ...) -> typing.Tuple[bool, str]: ...
+    def request(self, realm: typing.Optional[str], username: typing.Optional[str], password: typing.Optional[str], message: typing.Optional[str] = ...) -> typing.Tuple[bool, str, str]: ...
+    def mutex(self) -> typing.Optional[QtCore.QMutex]: ...
+    def unlock(self) -> None: ...
+    def lock(self) -> None: ...
+    @staticmethod
+    def instance() -> typing.Optional['QgsCredentials']: ...
+    def getMasterPassword(self, password: typing.Optional[str], stored: bool = ...) -> typing.Tuple[bool, str]: ...
+    def put(self, realm: typing.Optional[str], username: typing.Optional[str], password: typing.Optional[str]) -> None: ...
+    def get(self, realm: typing.Optional[str], username: typing.Optional[str], password: typing.Optional[str], message: typing.Optional[str] = ..., requestCredentials: bool = ...) -> typing.Tuple[bool, str, str]: ...
+
+
+class QgsCredentialsNone(QtCore.QObject, QgsCredentials):
+
+    def __init__(self) -> None: ...
+
+    def requestMasterPassword(self, password: typing.Optional[str], stored: bool = ...) -> typing.Tuple[bool, str]: ...
+    def request(self, realm: typing.Optional[str], username: typing.Optional[str], password: typing.Optional[str], message: typing.Optional[str] = ...) -> typing.Tuple[bool, str, str]: ...
+    destroyed: typing.ClassVar[QtCore.pyqtSignal]
+
+
+class QgsCredentialsConsole(QtCore.QObject, QgsCredentials):
+
+    def __init__(self) -> None: ...
+
+    def requestMasterPassword(self, password: typing.Optional[str], stored: bool = ...) -> typing.Tuple[bool, str]: ...
+    def request(self, realm: typing.Optional[str], username: typing.Optional[str], password: typing.Optional[str], message: typing.Optional[str] = ...) -> typing.Tuple[bool, str, str]: ...
+    destroyed: typing.ClassVar[QtCore.pyqtSignal]
+
+
+class QgsDartMeasurement(PyQt5.sip.wrapper):
+
+    class Type(int):
+        Text = ... # type: QgsDartMeasurement.Type
+        ImagePng = ... # type: QgsDartMeasurement.Type
+        Integer = ... # type: QgsDartMeasurement.Type
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], type: 'QgsDartMeasurement.Type', value: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDartMeasurement') -> None: ...
+
+    @staticmethod
+    def typeToString(type: 'QgsDartMeasurement.Type') -> str: ...
+    def send(self) -> None: ...
+    def toString(self) -> str: ...
+
+
+class QgsDataProviderElevationProperties(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDataProviderElevationProperties') -> None: ...
+
+    def setContainsElevationData(self, contains: bool) -> None: ...
+    def containsElevationData(self) -> bool: ...
+
+
+class QgsDataProviderTemporalCapabilities(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, available: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDataProviderTemporalCapabilities') -> None: ...
+
+    def setHasTemporalCapabilities(self, available: bool) -> None: ...
+    def hasTemporalCapabilities(self) -> bool: ...
+
+
+class QgsDateTimeStatisticalSummary(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, stats: typing.Union[Qgis.DateTimeStatistics, Qgis.DateTimeStatistic] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDateTimeStatisticalSummary') -> None: ...
+
+    @staticmethod
+    def displayName(statistic: Qgis.DateTimeStatistic) -> str: ...
+    def range(self) -> 'QgsInterval': ...
+    def max(self) -> QtCore.QDateTime: ...
+    def min(self) -> QtCore.QDateTime: ...
+    def countMissing(self) -> int: ...
+    def distinctValues(self) -> set[QtCore.QDateTime]: ...
+    def countDistinct(self) -> int: ...
+    def count(self) -> int: ...
+    def statistic(self, stat: Qgis.DateTimeStatistic) -> typing.Any: ...
+    def finalize(self) -> None: ...
+    def addValue(self, value: typing.Any) -> None: ...
+    def calculate(self, values: collections.abc.Iterable[typing.Any]) -> None: ...
+    def reset(self) -> None: ...
+    def setStatistics(self, stats: typing.Union[Qgis.DateTimeStatistics, Qgis.DateTimeStatistic]) -> None: ...
+    def statistics(self) -> Qgis.DateTimeStatistics: ...
+    Statistic: typing.Type[Qgis.DateTimeStatistic]
+    Count: Qgis.DateTimeStatistic
+    CountDistinct: Qgis.DateTimeStatistic
+    CountMissing: Qgis.DateTimeStatistic
+    Min: Qgis.DateTimeStatistic
+    Max: Qgis.DateTimeStatistic
+    Range: Qgis.DateTimeStatistic
+    All: Qgis.DateTimeStatistic
+    Statistics: typing.Type[Qgis.DateTimeStatistics]
+
+
+@deprecated("")
+class QgsDatabaseFilterProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def filterAcceptsRow(self, row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def _setFilterRegExp(self, pattern: typing.Optional[str]) -> None: ...
+    def _setFilterWildcard(self, pattern: typing.Optional[str]) -> None: ...
+
+
+class QgsDatabaseQueryLogEntry(PyQt5.sip.wrapper):
+
+    canceled = ... # type: bool
+    error = ... # type: typing.Optional[str]
+    fetchedRows = ... # type: int
+    finishedTime = ... # type: int
+    initiatorClass = ... # type: typing.Optional[str]
+    origin = ... # type: typing.Optional[str]
+    provider = ... # type: typing.Optional[str]
+    query = ... # type: typing.Optional[str]
+    queryId = ... # type: int
+    startedTime = ... # type: int
+    uri = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self, query: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDatabaseQueryLogEntry') -> None: ...
+
+
+class QgsDatabaseQueryLog(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    @staticmethod
+    def finished(query: QgsDatabaseQueryLogEntry) -> None: ...
+    @staticmethod
+    def log(query: QgsDatabaseQueryLogEntry) -> None: ...
+    @staticmethod
+    def enabled() -> bool: ...
+
+
+class QgsDefaultValue(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, expression: typing.Optional[str] = ..., applyOnUpdate: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDefaultValue') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def isValid(self) -> bool: ...
+    def setApplyOnUpdate(self, applyOnUpdate: bool) -> None: ...
+    def applyOnUpdate(self) -> bool: ...
+    def setExpression(self, expression: typing.Optional[str]) -> None: ...
+    def expression(self) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsDiagramInterpolationSettings(PyQt5.sip.wrapper):
+
+    classificationAttributeExpression = ... # type: typing.Optional[str]
+    classificationAttributeIsExpression = ... # type: bool
+    classificationField = ... # type: typing.Optional[str]
+    lowerSize = ... # type: QtCore.QSizeF
+    lowerValue = ... # type: float
+    upperSize = ... # type: QtCore.QSizeF
+    upperValue = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDiagramInterpolationSettings') -> None: ...
+
+
+class QgsEditorWidgetSetup(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: typing.Optional[str], config: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsEditorWidgetSetup') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def isNull(self) -> bool: ...
+    def config(self) -> dict[str, typing.Any]: ...
+    def type(self) -> str: ...
+
+
+class QgsElevationMap(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, size: QtCore.QSize, devicePixelRatio: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, image: QtGui.QImage) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsElevationMap') -> None: ...
+
+    def noDataValue(self) -> float: ...
+    def isNoData(self, colorRaw: int) -> bool: ...
+    @staticmethod
+    def decodeElevation(colorRaw: int) -> float: ...
+    @staticmethod
+    def encodeElevation(z: float) -> int: ...
+    def isValid(self) -> bool: ...
+    def combine(self, otherElevationMap: 'QgsElevationMap', method: Qgis.ElevationMapCombineMethod) -> None: ...
+    def painter(self) -> typing.Optional[QtGui.QPainter]: ...
+    def rawElevationImage(self) -> QtGui.QImage: ...
+    def applyHillshading(self, image: QtGui.QImage, multiDirectional: bool, altitude: float, azimuth: float, zFactor: float, cellSizeX: float, cellSizeY: float) -> None: ...
+    def applyEyeDomeLighting(self, image: QtGui.QImage, distance: int, strength: float, rendererScale: float) -> None: ...
+
+
+class QgsErrorMessage(PyQt5.sip.wrapper):
+
+    class Format(int):
+        Text = ... # type: QgsErrorMessage.Format
+        Html = ... # type: QgsErrorMessage.Format
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, message: typing.Optional[str], tag: typing.Optional[str] = ..., file: typing.Optional[str] = ..., function: typing.Optional[str] = ..., line: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsErrorMessage') -> None: ...
+
+    def line(self) -> int: ...
+    def function(self) -> str: ...
+    def file(self) -> str: ...
+    def tag(self) -> str: ...
+    def message(self) -> str: ...
+
+
+class QgsError(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, message: typing.Optional[str], tag: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsError') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def messageList(self) -> list[QgsErrorMessage]: ...
+    def clear(self) -> None: ...
+    def summary(self) -> str: ...
+    def message(self, format: QgsErrorMessage.Format = ...) -> str: ...
+    def isEmpty(self) -> bool: ...
+    @typing.overload
+    def append(self, message: typing.Optional[str], tag: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def append(self, message: QgsErrorMessage) -> None: ...
+
+
+class QgsFeedback(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    processedCountChanged: typing.ClassVar[QtCore.pyqtSignal]
+    progressChanged: typing.ClassVar[QtCore.pyqtSignal]
+    canceled: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def setProcessedCount(self, processedCount: int) -> None: ...
+    def processedCount(self) -> int: ...
+    def progress(self) -> float: ...
+    def setProgress(self, progress: float) -> None: ...
+    def isCanceled(self) -> bool: ...
+
+
+class QgsField(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ..., type: QtCore.QMetaType.Type = ..., typeName: typing.Optional[str] = ..., len: int = ..., prec: int = ..., comment: typing.Optional[str] = ..., subType: QtCore.QMetaType.Type = ...) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], type: QtCore.QVariant.Type, typeName: typing.Optional[str] = ..., len: int = ..., prec: int = ..., comment: typing.Optional[str] = ..., subType: QtCore.QVariant.Type = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsField') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def setMergePolicy(self, policy: Qgis.FieldDomainMergePolicy) -> None: ...
+    def mergePolicy(self) -> Qgis.FieldDomainMergePolicy: ...
+    def setDuplicatePolicy(self, policy: Qgis.FieldDuplicatePolicy) -> None: ...
+    def duplicatePolicy(self) -> Qgis.FieldDuplicatePolicy: ...
+    def setSplitPolicy(self, policy: Qgis.FieldDomainSplitPolicy) -> None: ...
+    def splitPolicy(self) -> Qgis.FieldDomainSplitPolicy: ...
+    def isReadOnly(self) -> bool: ...
+    def setReadOnly(self, readOnly: bool) -> None: ...
+    def editorWidgetSetup(self) -> QgsEditorWidgetSetup: ...
+    def setEditorWidgetSetup(self, v: QgsEditorWidgetSetup) -> None: ...
+    def convertCompatible(self, v: typing.Any) -> bool: ...
+    @staticmethod
+    def readableConfigurationFlag(flag: Qgis.FieldConfigurationFlag) -> str: ...
+    def displayString(self, v: typing.Any) -> str: ...
+    def setConfigurationFlags(self, flags: typing.Union[Qgis.FieldConfigurationFlags, Qgis.FieldConfigurationFlag]) -> None: ...
+    def configurationFlags(self) -> Qgis.FieldConfigurationFlags: ...
+    def setAlias(self, alias: typing.Optional[str]) -> None: ...
+    def alias(self) -> str: ...
+    def setConstraints(self, constraints: 'QgsFieldConstraints') -> None: ...
+    def constraints(self) -> 'QgsFieldConstraints': ...
+    def setDefaultValueDefinition(self, defaultValueDefinition: QgsDefaultValue) -> None: ...
+    def defaultValueDefinition(self) -> QgsDefaultValue: ...
+    def setComment(self, comment: typing.Optional[str]) -> None: ...
+    def setPrecision(self, precision: int) -> None: ...
+    def setLength(self, len: int) -> None: ...
+    def setTypeName(self, typeName: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def setSubType(self, subType: QtCore.QMetaType.Type) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def setSubType(self, subType: QtCore.QVariant.Type) -> None: ...
+    @typing.overload
+    def setType(self, type: QtCore.QMetaType.Type) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def setType(self, type: QtCore.QVariant.Type) -> None: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def isDateOrTime(self) -> bool: ...
+    def isNumeric(self) -> bool: ...
+    @typing.overload
+    def setMetadata(self, metadata: dict[int, typing.Any]) -> None: ...
+    @typing.overload
+    def setMetadata(self, property: int, value: typing.Any) -> None: ...
+    @typing.overload
+    def metadata(self) -> dict[int, typing.Any]: ...
+    @typing.overload
+    def metadata(self, property: int) -> typing.Any: ...
+    def comment(self) -> str: ...
+    def precision(self) -> int: ...
+    def length(self) -> int: ...
+    def typeName(self) -> str: ...
+    def subType(self) -> QtCore.QMetaType.Type: ...
+    def type(self) -> QtCore.QMetaType.Type: ...
+    def friendlyTypeString(self) -> str: ...
+    def displayType(self, showConstraints: bool = ...) -> str: ...
+    def displayNameWithAlias(self) -> str: ...
+    def displayName(self) -> str: ...
+    def name(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsFieldConstraints(PyQt5.sip.wrapper):
+
+    class ConstraintStrength(int):
+        ConstraintStrengthNotSet = ... # type: QgsFieldConstraints.ConstraintStrength
+        ConstraintStrengthHard = ... # type: QgsFieldConstraints.ConstraintStrength
+        ConstraintStrengthSoft = ... # type: QgsFieldConstraints.ConstraintStrength
+
+    class ConstraintOrigin(int):
+        ConstraintOriginNotSet = ... # type: QgsFieldConstraints.ConstraintOrigin
+        ConstraintOriginProvider = ... # type: QgsFieldConstraints.ConstraintOrigin
+        ConstraintOriginLayer = ... # type: QgsFieldConstraints.ConstraintOrigin
+
+    class Constraint(int):
+        ConstraintNotNull = ... # type: QgsFieldConstraints.Constraint
+        ConstraintUnique = ... # type: QgsFieldConstraints.Constraint
+        ConstraintExpression = ... # type: QgsFieldConstraints.Constraint
+
+    class Constraints(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __xor__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __ior__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __or__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __iand__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __and__(self, f: typing.Union['QgsFieldConstraints.Constraints', 'QgsFieldConstraints.Constraint']) -> 'QgsFieldConstraints.Constraints': ...
+        def __invert__(self) -> 'QgsFieldConstraints.Constraints': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFieldConstraints') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def setDomainName(self, domain: typing.Optional[str]) -> None: ...
+    def domainName(self) -> str: ...
+    def setConstraintExpression(self, expression: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    def constraintDescription(self) -> str: ...
+    def constraintExpression(self) -> str: ...
+    def removeConstraint(self, constraint: 'QgsFieldConstraints.Constraint') -> None: ...
+    def setConstraint(self, constraint: 'QgsFieldConstraints.Constraint', origin: 'QgsFieldConstraints.ConstraintOrigin' = ...) -> None: ...
+    def setConstraintStrength(self, constraint: 'QgsFieldConstraints.Constraint', strength: 'QgsFieldConstraints.ConstraintStrength') -> None: ...
+    def constraintStrength(self, constraint: 'QgsFieldConstraints.Constraint') -> 'QgsFieldConstraints.ConstraintStrength': ...
+    def constraintOrigin(self, constraint: 'QgsFieldConstraints.Constraint') -> 'QgsFieldConstraints.ConstraintOrigin': ...
+    def constraints(self) -> 'QgsFieldConstraints.Constraints': ...
+
+
+class QgsFields(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsFields') -> None: ...
+    @typing.overload
+    def __init__(self, fields: typing.Any) -> None: ...
+
+    def __setitem__(self, key: int, field: QgsField) -> None: ...
+    @typing.overload
+    @staticmethod
+    def iconForFieldType(type: QtCore.QMetaType.Type, subType: QtCore.QMetaType.Type = ..., typeString: typing.Optional[str] = ...) -> QtGui.QIcon: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def iconForFieldType(type: QtCore.QVariant.Type, subType: QtCore.QVariant.Type, typeString: typing.Optional[str] = ...) -> QtGui.QIcon: ...
+    def iconForField(self, fieldIdx: int, considerOrigin: bool = ...) -> QtGui.QIcon: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def toList(self) -> typing.Any: ...
+    def allAttributesList(self) -> list[int]: ...
+    def lookupField(self, fieldName: typing.Optional[str]) -> int: ...
+    def indexOf(self, fieldName: typing.Optional[str]) -> int: ...
+    def indexFromName(self, fieldName: typing.Optional[str]) -> int: ...
+    def fieldOriginIndex(self, fieldIdx: int) -> int: ...
+    def fieldOrigin(self, fieldIdx: int) -> Qgis.FieldOrigin: ...
+    @typing.overload
+    def field(self, fieldIdx: int) -> QgsField: ...
+    @typing.overload
+    def field(self, name: typing.Optional[str]) -> QgsField: ...
+    def at(self, i: int) -> QgsField: ...
+    @typing.overload
+    def __getitem__(self, i: int) -> QgsField: ...
+    @typing.overload
+    def __getitem__(self, name: typing.Optional[str]) -> QgsField: ...
+    def exists(self, i: int) -> bool: ...
+    def names(self) -> list[str]: ...
+    def size(self) -> int: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def count(self) -> int: ...
+    def isEmpty(self) -> bool: ...
+    def extend(self, other: 'QgsFields') -> None: ...
+    def remove(self, fieldIdx: int) -> None: ...
+    def appendExpressionField(self, field: QgsField, originIndex: int) -> bool: ...
+    def rename(self, fieldIdx: int, name: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def append(self, field: QgsField, origin: Qgis.FieldOrigin = ..., originIndex: int = ...) -> bool: ...
+    @typing.overload
+    def append(self, fields: typing.Any, origin: Qgis.FieldOrigin = ...) -> bool: ...
+    @typing.overload
+    def append(self, fields: 'QgsFields') -> bool: ...
+    def clear(self) -> None: ...
+    FieldOrigin: typing.Type[Qgis.FieldOrigin]
+    OriginUnknown: Qgis.FieldOrigin
+    OriginProvider: Qgis.FieldOrigin
+    OriginJoin: Qgis.FieldOrigin
+    OriginEdit: Qgis.FieldOrigin
+    OriginExpression: Qgis.FieldOrigin
+
+
+class QgsFileFilterGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFileFilterGenerator') -> None: ...
+
+    def createFileFilter(self) -> str: ...
+
+
+class QgsFileUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFileUtils') -> None: ...
+
+    @staticmethod
+    def uniquePath(path: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def splitPathToComponents(path: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def renameDataset(oldPath: typing.Optional[str], newPath: typing.Optional[str], flags: typing.Union[Qgis.FileOperationFlags, Qgis.FileOperationFlag] = ...) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def sidecarFilesForPath(path: typing.Optional[str]) -> set[str]: ...
+    @staticmethod
+    def pathIsSlowDevice(path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def driveType(path: typing.Optional[str]) -> Qgis.DriveType: ...
+    @staticmethod
+    def findFile(file: typing.Optional[str], basepath: typing.Optional[str] = ..., maxClimbs: int = ..., searchCeiling: int = ..., currentDir: typing.Optional[str] = ...) -> list[str]: ...
+    @staticmethod
+    def findClosestExistingPath(path: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def stringToSafeFilename(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def addExtensionFromFilter(fileName: typing.Optional[str], filter: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def ensureFileNameHasExtension(fileName: typing.Optional[str], extensions: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    @staticmethod
+    def fileMatchesFilter(fileName: typing.Optional[str], filter: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def wildcardsFromFilter(filter: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def extensionsFromFilter(filter: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def representFileSize(bytes: int) -> str: ...
+
+
+class QgsFontUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFontUtils') -> None: ...
+
+    @staticmethod
+    def createFont(family: typing.Optional[str], pointSize: int = ..., weight: int = ..., italic: bool = ...) -> QtGui.QFont: ...
+    @staticmethod
+    def setFontFamily(font: QtGui.QFont, family: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def recentFontFamilies() -> list[str]: ...
+    @staticmethod
+    def addRecentFontFamily(family: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def asCSS(font: QtGui.QFont, pointToPixelMultiplier: float = ...) -> str: ...
+    @staticmethod
+    def untranslateNamedStyle(namedStyle: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def translateNamedStyle(namedStyle: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def fromMimeData(data: typing.Optional[QtCore.QMimeData]) -> typing.Tuple[QtGui.QFont, typing.Optional[bool]]: ...
+    @staticmethod
+    def toMimeData(font: QtGui.QFont) -> typing.Optional[QtCore.QMimeData]: ...
+    @staticmethod
+    def setFromXmlChildNode(font: QtGui.QFont, element: QtXml.QDomElement, childNode: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def setFromXmlElement(font: QtGui.QFont, element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def toXmlElement(font: QtGui.QFont, document: QtXml.QDomDocument, elementName: typing.Optional[str]) -> QtXml.QDomElement: ...
+    @staticmethod
+    def getStandardTestFont(style: typing.Optional[str] = ..., pointsize: int = ...) -> QtGui.QFont: ...
+    @staticmethod
+    def loadStandardTestFonts(loadstyles: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @staticmethod
+    def standardTestFontFamily() -> str: ...
+    @staticmethod
+    def updateFontViaStyle(f: QtGui.QFont, fontstyle: typing.Optional[str], fallback: bool = ...) -> bool: ...
+    @staticmethod
+    def fontFamilyMatchOnSystem(family: typing.Optional[str], chosen: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple[bool, typing.Optional[bool]]: ...
+    @staticmethod
+    def resolveFontStyleName(font: QtGui.QFont) -> str: ...
+    @staticmethod
+    def fontFamilyHasStyle(family: typing.Optional[str], style: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def fontFamilyOnSystem(family: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def fontMatchOnSystem(f: QtGui.QFont) -> bool: ...
+
+
+class QgsGmlFeatureClass(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGmlFeatureClass') -> None: ...
+
+    def geometryAttributes(self) -> list[str]: ...
+    def path(self) -> str: ...
+    def fieldIndex(self, name: typing.Optional[str]) -> int: ...
+    def fields(self) -> typing.Any: ...
+
+
+class QgsGmlSchema(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def error(self) -> QgsError: ...
+    def geometryAttributes(self, typeName: typing.Optional[str]) -> list[str]: ...
+    def fields(self, typeName: typing.Optional[str]) -> typing.Any: ...
+    def typeNames(self) -> list[str]: ...
+    def guessSchema(self, data: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> bool: ...
+    def parseXSD(self, xml: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> bool: ...
+
+
+class QgsHstoreUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsHstoreUtils') -> None: ...
+
+    @staticmethod
+    def build(map: dict[str, typing.Any]) -> str: ...
+    @staticmethod
+    def parse(string: typing.Optional[str]) -> dict[str, typing.Any]: ...
+
+
+class QgsHtmlUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsHtmlUtils') -> None: ...
+
+    @staticmethod
+    def buildBulletList(values: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+
+
+class QgsIdentifyContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsIdentifyContext') -> None: ...
+
+    def setZRange(self, range: 'QgsDoubleRange') -> None: ...
+    def zRange(self) -> 'QgsDoubleRange': ...
+    def isTemporal(self) -> bool: ...
+    def temporalRange(self) -> 'QgsDateTimeRange': ...
+    def setTemporalRange(self, range: 'QgsDateTimeRange') -> None: ...
+
+
+class QgsImageCache(QgsAbstractContentCacheBase):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    remoteImageFetched: typing.ClassVar[QtCore.pyqtSignal]
+    def prepareAnimation(self, path: typing.Optional[str]) -> None: ...
+    def nextFrameDelay(self, path: typing.Optional[str], currentFrame: int = ..., blocking: bool = ...) -> int: ...
+    def totalFrameCount(self, path: typing.Optional[str], blocking: bool = ...) -> int: ...
+    def originalSize(self, path: typing.Optional[str], blocking: bool = ...) -> QtCore.QSize: ...
+    def pathAsImage(self, path: typing.Optional[str], size: QtCore.QSize, keepAspectRatio: bool, opacity: float, blocking: bool = ..., targetDpi: float = ..., frameNumber: int = ...) -> typing.Tuple[QtGui.QImage, bool]: ...
+    def maximumSize(self) -> int: ...
+
+
+class QgsInterval(PyQt5.sip.wrapper):
+
+    DAY = ... # type: int
+    HOUR = ... # type: int
+    MINUTE = ... # type: int
+    MONTHS = ... # type: int
+    WEEKS = ... # type: int
+    YEARS = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, seconds: float) -> None: ...
+    @typing.overload
+    def __init__(self, duration: float, unit: Qgis.TemporalUnit) -> None: ...
+    @typing.overload
+    def __init__(self, years: float, months: float, weeks: float, days: float, hours: float, minutes: float, seconds: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsInterval') -> None: ...
+
+    @staticmethod
+    def fromString(string: typing.Optional[str]) -> 'QgsInterval': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def originalUnit(self) -> Qgis.TemporalUnit: ...
+    def originalDuration(self) -> float: ...
+    def setValid(self, valid: bool) -> None: ...
+    def isValid(self) -> bool: ...
+    def setSeconds(self, seconds: float) -> None: ...
+    def seconds(self) -> float: ...
+    def setMinutes(self, minutes: float) -> None: ...
+    def minutes(self) -> float: ...
+    def setHours(self, hours: float) -> None: ...
+    def hours(self) -> float: ...
+    def setDays(self, days: float) -> None: ...
+    def days(self) -> float: ...
+    def setWeeks(self, weeks: float) -> None: ...
+    def weeks(self) -> float: ...
+    def setMonths(self, months: float) -> None: ...
+    def months(self) -> float: ...
+    def setYears(self, years: float) -> None: ...
+    def years(self) -> float: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLocalizedDataPathRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def unregisterPath(self, path: typing.Optional[str]) -> None: ...
+    def registerPath(self, path: typing.Optional[str], position: int = ...) -> None: ...
+    def paths(self) -> list[str]: ...
+    def localizedPath(self, globalPath: typing.Optional[str]) -> str: ...
+    def globalPath(self, localizedPath: typing.Optional[str]) -> str: ...
+
+
+class QgsLogger(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLogger') -> None: ...
+
+    @staticmethod
+    def logFile() -> str: ...
+    @staticmethod
+    def logMessageToFile(message: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def debugLevel() -> int: ...
+    @staticmethod
+    def fatal(msg: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def critical(msg: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def warning(msg: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def debug(msg: typing.Optional[str], debuglevel: int = ..., file: typing.Optional[str] = ..., function: typing.Optional[str] = ..., line: int = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def debug(var: typing.Optional[str], val: int, debuglevel: int = ..., file: typing.Optional[str] = ..., function: typing.Optional[str] = ..., line: int = ...) -> None: ...
+
+
+class QgsScopeLogger(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, file: typing.Optional[str], func: typing.Optional[str], line: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScopeLogger') -> None: ...
+
+
+class QgsMapLayerDependency(PyQt5.sip.wrapper):
+
+    class Origin(int):
+        FromProvider = ... # type: QgsMapLayerDependency.Origin
+        FromUser = ... # type: QgsMapLayerDependency.Origin
+
+    class Type(int):
+        PresenceDependency = ... # type: QgsMapLayerDependency.Type
+        DataDependency = ... # type: QgsMapLayerDependency.Type
+
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], type: 'QgsMapLayerDependency.Type' = ..., origin: 'QgsMapLayerDependency.Origin' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerDependency') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __hash__(self) -> int: ...
+    def __eq__(self, other: object): ...
+    def layerId(self) -> str: ...
+    def origin(self) -> 'QgsMapLayerDependency.Origin': ...
+    def type(self) -> 'QgsMapLayerDependency.Type': ...
+
+
+class QgsTemporalProperty(QtCore.QObject):
+
+    class Flag(int):
+        FlagDontInvalidateCachedRendersWhenRangeChanges = ... # type: QgsTemporalProperty.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __xor__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __ior__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __or__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __iand__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __and__(self, f: typing.Union['QgsTemporalProperty.Flags', 'QgsTemporalProperty.Flag']) -> 'QgsTemporalProperty.Flags': ...
+        def __invert__(self) -> 'QgsTemporalProperty.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., enabled: bool = ...) -> None: ...
+
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def flags(self) -> 'QgsTemporalProperty.Flags': ...
+    def isActive(self) -> bool: ...
+    def setIsActive(self, active: bool) -> None: ...
+
+
+class QgsTemporalRangeObject(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, enabled: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTemporalRangeObject') -> None: ...
+
+    def temporalRange(self) -> 'QgsDateTimeRange': ...
+    def setTemporalRange(self, range: 'QgsDateTimeRange') -> None: ...
+    def isTemporal(self) -> bool: ...
+    def setIsTemporal(self, enabled: bool) -> None: ...
+
+
+class QgsMargins(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, left: float, top: float, right: float, bottom: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMargins') -> None: ...
+
+    def __eq__(self, other: object): ...
+    def __ne__(self, other: object): ...
+    @typing.overload
+    def __add__(self, m2: 'QgsMargins') -> 'QgsMargins': ...
+    @typing.overload
+    def __add__(self, rhs: float) -> 'QgsMargins': ...
+    def __radd__(self, lhs: float) -> 'QgsMargins': ...
+    @typing.overload
+    def __sub__(self, m2: 'QgsMargins') -> 'QgsMargins': ...
+    @typing.overload
+    def __sub__(self, rhs: float) -> 'QgsMargins': ...
+    def __mul__(self, factor: float) -> 'QgsMargins': ...
+    def __rmul__(self, factor: float) -> 'QgsMargins': ...
+    def __truediv__(self, divisor: float) -> 'QgsMargins': ...
+    def __pos__(self) -> 'QgsMargins': ...
+    def __neg__(self) -> 'QgsMargins': ...
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def fromString(string: typing.Optional[str]) -> 'QgsMargins': ...
+    def toString(self) -> str: ...
+    def __itruediv__(self, divisor: float) -> 'QgsMargins': ...
+    def __imul__(self, factor: float) -> 'QgsMargins': ...
+    @typing.overload
+    def __isub__(self, margins: 'QgsMargins') -> 'QgsMargins': ...
+    @typing.overload
+    def __isub__(self, subtrahend: float) -> 'QgsMargins': ...
+    @typing.overload
+    def __iadd__(self, margins: 'QgsMargins') -> 'QgsMargins': ...
+    @typing.overload
+    def __iadd__(self, addend: float) -> 'QgsMargins': ...
+    def setBottom(self, bottom: float) -> None: ...
+    def setRight(self, right: float) -> None: ...
+    def setTop(self, top: float) -> None: ...
+    def setLeft(self, left: float) -> None: ...
+    def bottom(self) -> float: ...
+    def right(self) -> float: ...
+    def top(self) -> float: ...
+    def left(self) -> float: ...
+    def isNull(self) -> bool: ...
+
+
+class QgsMaskRenderSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMaskRenderSettings') -> None: ...
+
+    def setSimplificationTolerance(self, tolerance: float) -> None: ...
+    def simplifyTolerance(self) -> float: ...
+
+
+class QgsMatrix4x4(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, m11: float, m12: float, m13: float, m14: float, m21: float, m22: float, m23: float, m24: float, m31: float, m32: float, m33: float, m34: float, m41: float, m42: float, m43: float, m44: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMatrix4x4') -> None: ...
+
+    @typing.overload
+    def __mul__(self, vector: 'QgsVector3D') -> 'QgsVector3D': ...
+    @typing.overload
+    def __mul__(self, m2: 'QgsMatrix4x4') -> 'QgsMatrix4x4': ...
+    def __repr__(self) -> typing.Any: ...
+    def setToIdentity(self) -> None: ...
+    def isIdentity(self) -> bool: ...
+    def map(self, vector: 'QgsVector3D') -> 'QgsVector3D': ...
+    def translate(self, vector: 'QgsVector3D') -> None: ...
+    def data(self) -> list[float]: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsMessageLog(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    messageReceived: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def logMessage(message: typing.Optional[str], tag: typing.Optional[str] = ..., level: Qgis.MessageLevel = ..., notifyUser: bool = ..., file: typing.Optional[str] = ..., function: typing.Optional[str] = ..., line: int = ...) -> None: ...
+
+
+class QgsMessageLogNotifyBlocker(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+
+class QgsMessageLogConsole(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def logMessage(self, message: typing.Optional[str], tag: typing.Optional[str], level: Qgis.MessageLevel) -> None: ...
+    def formatLogMessage(self, message: typing.Optional[str], tag: typing.Optional[str], level: Qgis.MessageLevel = ...) -> str: ...
+
+
+class QgsMessageOutput(PyQt5.sip.wrapper):
+
+    class MessageType(int):
+        MessageText = ... # type: QgsMessageOutput.MessageType
+        MessageHtml = ... # type: QgsMessageOutput.MessageType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMessageOutput') -> None: ...
+
+    @staticmethod
+    def createMessageOutput() -> typing.Optional['QgsMessageOutput']: ...
+    @typing.overload
+    def showMessage(self, blocking: bool = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def showMessage(title: typing.Optional[str], message: typing.Optional[str], msgType: 'QgsMessageOutput.MessageType') -> None: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def appendMessage(self, message: typing.Optional[str]) -> None: ...
+    def setMessage(self, message: typing.Optional[str], msgType: 'QgsMessageOutput.MessageType') -> None: ...
+
+
+class QgsMessageOutputConsole(QtCore.QObject, QgsMessageOutput):
+
+    def __init__(self) -> None: ...
+
+    destroyed: typing.ClassVar[QtCore.pyqtSignal]
+    def showMessage(self, blocking: bool = ...) -> None: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def appendMessage(self, message: typing.Optional[str]) -> None: ...
+    def setMessage(self, message: typing.Optional[str], msgType: QgsMessageOutput.MessageType) -> None: ...
+
+
+class QgsObjectCustomProperties(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsObjectCustomProperties') -> None: ...
+
+    def writeXml(self, parentNode: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    def readXml(self, parentNode: QtXml.QDomNode, keyStartsWith: typing.Optional[str] = ...) -> None: ...
+    def contains(self, key: typing.Optional[str]) -> bool: ...
+    def remove(self, key: typing.Optional[str]) -> None: ...
+    def value(self, key: typing.Optional[str], defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setValue(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def keys(self) -> list[str]: ...
+
+
+class QgsOfflineEditing(QtCore.QObject):
+
+    class ContainerType(int):
+        SpatiaLite = ... # type: QgsOfflineEditing.ContainerType
+        GPKG = ... # type: QgsOfflineEditing.ContainerType
+
+    class ProgressMode(int):
+        CopyFeatures = ... # type: QgsOfflineEditing.ProgressMode
+        ProcessFeatures = ... # type: QgsOfflineEditing.ProgressMode
+        AddFields = ... # type: QgsOfflineEditing.ProgressMode
+        AddFeatures = ... # type: QgsOfflineEditing.ProgressMode
+        RemoveFeatures = ... # type: QgsOfflineEditing.ProgressMode
+        UpdateFeatures = ... # type: QgsOfflineEditing.ProgressMode
+        UpdateGeometries = ... # type: QgsOfflineEditing.ProgressMode
+
+    def __init__(self) -> None: ...
+
+    warning: typing.ClassVar[QtCore.pyqtSignal]
+    progressStopped: typing.ClassVar[QtCore.pyqtSignal]
+    progressUpdated: typing.ClassVar[QtCore.pyqtSignal]
+    progressModeSet: typing.ClassVar[QtCore.pyqtSignal]
+    layerProgressUpdated: typing.ClassVar[QtCore.pyqtSignal]
+    progressStarted: typing.ClassVar[QtCore.pyqtSignal]
+    def synchronize(self, useTransaction: bool = ...) -> None: ...
+    def isOfflineProject(self) -> bool: ...
+    def convertToOfflineProject(self, offlineDataPath: typing.Optional[str], offlineDbFile: typing.Optional[str], layerIds: collections.abc.Iterable[typing.Optional[str]], onlySelected: bool = ..., containerType: 'QgsOfflineEditing.ContainerType' = ..., layerNameSuffix: typing.Optional[str] = ...) -> bool: ...
+
+
+class QgsPathResolver(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, baseFileName: typing.Optional[str] = ..., attachmentDir: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPathResolver') -> None: ...
+
+    @staticmethod
+    def removePathWriter(id: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setPathWriter(a0: typing.Optional[typing.Callable[..., None]]) -> str: ...
+    @staticmethod
+    def removePathPreprocessor(id: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setPathPreprocessor(a0: typing.Optional[typing.Callable[..., None]]) -> str: ...
+    def readPath(self, filename: typing.Optional[str]) -> str: ...
+    def writePath(self, filename: typing.Optional[str]) -> str: ...
+
+
+class QgsPostgresStringUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPostgresStringUtils') -> None: ...
+
+    @staticmethod
+    def buildArray(list: collections.abc.Iterable[typing.Any]) -> str: ...
+    @staticmethod
+    def parseArray(string: typing.Optional[str]) -> list[typing.Any]: ...
+
+
+class QgsPropertyDefinition(PyQt5.sip.wrapper):
+
+    class DataType(int):
+        DataTypeString = ... # type: QgsPropertyDefinition.DataType
+        DataTypeNumeric = ... # type: QgsPropertyDefinition.DataType
+        DataTypeBoolean = ... # type: QgsPropertyDefinition.DataType
+
+    class StandardPropertyTemplate(int):
+        Boolean = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Integer = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        IntegerPositive = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        IntegerPositiveGreaterZero = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Double = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        DoublePositive = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Double0To1 = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Rotation = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        String = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Opacity = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        RenderUnits = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        ColorWithAlpha = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        ColorNoAlpha = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        PenJoinStyle = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        BlendMode = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Point = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Size = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Size2D = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        LineStyle = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        StrokeWidth = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        FillStyle = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        CapStyle = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        HorizontalAnchor = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        VerticalAnchor = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        SvgPath = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Offset = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        DateTime = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+        Custom = ... # type: QgsPropertyDefinition.StandardPropertyTemplate
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], type: 'QgsPropertyDefinition.StandardPropertyTemplate', origin: typing.Optional[str] = ..., comment: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], dataType: 'QgsPropertyDefinition.DataType', description: typing.Optional[str], helpText: typing.Optional[str], origin: typing.Optional[str] = ..., comment: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPropertyDefinition') -> None: ...
+
+    def supportsAssistant(self) -> bool: ...
+    def standardTemplate(self) -> 'QgsPropertyDefinition.StandardPropertyTemplate': ...
+    def dataType(self) -> 'QgsPropertyDefinition.DataType': ...
+    def setDataType(self, type: 'QgsPropertyDefinition.DataType') -> None: ...
+    def helpText(self) -> str: ...
+    def setComment(self, comment: typing.Optional[str]) -> None: ...
+    def comment(self) -> str: ...
+    def description(self) -> str: ...
+    def setOrigin(self, origin: typing.Optional[str]) -> None: ...
+    def origin(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+
+
+class QgsProviderConnectionModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        ConnectionName = ... # type: QgsProviderConnectionModel.CustomRole
+        Uri = ... # type: QgsProviderConnectionModel.CustomRole
+        Configuration = ... # type: QgsProviderConnectionModel.CustomRole
+        Empty = ... # type: QgsProviderConnectionModel.CustomRole
+
+    def __init__(self, provider: typing.Optional[str], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def allowEmptyConnection(self) -> bool: ...
+    def setAllowEmptyConnection(self, allowEmpty: bool) -> None: ...
+    Role: typing.Type[QgsProviderConnectionModel.CustomRole]
+    RoleConnectionName: QgsProviderConnectionModel.CustomRole
+    RoleUri: QgsProviderConnectionModel.CustomRole
+    RoleConfiguration: QgsProviderConnectionModel.CustomRole
+    RoleEmpty: QgsProviderConnectionModel.CustomRole
+
+
+class QgsScopedProxyProgressTask(PyQt5.sip.wrapper):
+
+    def __init__(self, description: typing.Optional[str]) -> None: ...
+
+    def setProgress(self, progress: float) -> None: ...
+
+
+class QgsPythonRunner(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPythonRunner') -> None: ...
+
+    def setArgvCommand(self, arguments: collections.abc.Iterable[typing.Optional[str]], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    def evalCommand(self, command: typing.Optional[str], result: typing.Optional[str]) -> bool: ...
+    def runFileCommand(self, filename: typing.Optional[str], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    def runCommand(self, command: typing.Optional[str], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    @staticmethod
+    def setInstance(runner: typing.Optional['QgsPythonRunner']) -> None: ...
+    @staticmethod
+    def setArgv(arguments: collections.abc.Iterable[typing.Optional[str]], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    @staticmethod
+    def eval(command: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def runFile(filename: typing.Optional[str], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    @staticmethod
+    def run(command: typing.Optional[str], messageOnError: typing.Optional[str] = ...) -> bool: ...
+    @staticmethod
+    def isValid() -> bool: ...
+
+
+class QgsRangedoubleBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, lower: float, upper: float, includeLower: bool = ..., includeUpper: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, lower: float, upper: float, limits: Qgis.RangeLimits) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRangedoubleBase') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def overlaps(self, other: 'QgsRangedoubleBase') -> bool: ...
+    @typing.overload
+    def contains(self, other: 'QgsRangedoubleBase') -> bool: ...
+    @typing.overload
+    def contains(self, element: float) -> bool: ...
+    def isSingleton(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def rangeLimits(self) -> Qgis.RangeLimits: ...
+    def includeUpper(self) -> bool: ...
+    def includeLower(self) -> bool: ...
+    def upper(self) -> float: ...
+    def lower(self) -> float: ...
+
+
+class QgsDoubleRange(QgsRangedoubleBase):
+
+    @typing.overload
+    def __init__(self, lower: float, upper: float, limits: Qgis.RangeLimits) -> None: ...
+    @typing.overload
+    def __init__(self, lower: float, upper: float, includeLower: bool = ..., includeUpper: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDoubleRange') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def isInfinite(self) -> bool: ...
+
+
+class QgsRangeintBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, lower: int, upper: int, includeLower: bool = ..., includeUpper: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, lower: int, upper: int, limits: Qgis.RangeLimits) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRangeintBase') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def overlaps(self, other: 'QgsRangeintBase') -> bool: ...
+    @typing.overload
+    def contains(self, other: 'QgsRangeintBase') -> bool: ...
+    @typing.overload
+    def contains(self, element: int) -> bool: ...
+    def isSingleton(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def rangeLimits(self) -> Qgis.RangeLimits: ...
+    def includeUpper(self) -> bool: ...
+    def includeLower(self) -> bool: ...
+    def upper(self) -> int: ...
+    def lower(self) -> int: ...
+
+
+class QgsIntRange(QgsRangeintBase):
+
+    @typing.overload
+    def __init__(self, lower: int, upper: int, limits: Qgis.RangeLimits) -> None: ...
+    @typing.overload
+    def __init__(self, lower: int, upper: int, includeLower: bool = ..., includeUpper: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsIntRange') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def isInfinite(self) -> bool: ...
+
+
+class QgsDateRange(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, begin: typing.Union[QtCore.QDate, datetime.date], end: typing.Union[QtCore.QDate, datetime.date], includeBeginning: bool = ..., includeEnd: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDateRange') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def extend(self, other: 'QgsDateRange') -> bool: ...
+    def overlaps(self, other: 'QgsDateRange') -> bool: ...
+    @typing.overload
+    def contains(self, other: 'QgsDateRange') -> bool: ...
+    @typing.overload
+    def contains(self, element: typing.Union[QtCore.QDate, datetime.date]) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def isInfinite(self) -> bool: ...
+    def isInstant(self) -> bool: ...
+    def includeEnd(self) -> bool: ...
+    def includeBeginning(self) -> bool: ...
+    def end(self) -> QtCore.QDate: ...
+    def begin(self) -> QtCore.QDate: ...
+
+
+class QgsDateTimeRange(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, begin: typing.Union[QtCore.QDateTime, datetime.datetime], end: typing.Union[QtCore.QDateTime, datetime.datetime], includeBeginning: bool = ..., includeEnd: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDateTimeRange') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def extend(self, other: 'QgsDateTimeRange') -> bool: ...
+    def overlaps(self, other: 'QgsDateTimeRange') -> bool: ...
+    @typing.overload
+    def contains(self, other: 'QgsDateTimeRange') -> bool: ...
+    @typing.overload
+    def contains(self, element: typing.Union[QtCore.QDateTime, datetime.datetime]) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def isInfinite(self) -> bool: ...
+    def isInstant(self) -> bool: ...
+    def includeEnd(self) -> bool: ...
+    def includeBeginning(self) -> bool: ...
+    def end(self) -> QtCore.QDateTime: ...
+    def begin(self) -> QtCore.QDateTime: ...
+
+
+class QgsReadWriteLocker(PyQt5.sip.wrapper):
+
+    class Mode(int):
+        Read = ... # type: QgsReadWriteLocker.Mode
+        Write = ... # type: QgsReadWriteLocker.Mode
+        Unlocked = ... # type: QgsReadWriteLocker.Mode
+
+    @typing.overload
+    def __init__(self, lock: QtCore.QReadWriteLock, mode: 'QgsReadWriteLocker.Mode') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReadWriteLocker') -> None: ...
+
+    def unlock(self) -> None: ...
+    def changeMode(self, mode: 'QgsReadWriteLocker.Mode') -> None: ...
+
+
+class QgsRunProcess(QtCore.QObject):
+
+    def dialogGone(self) -> None: ...
+    def processExit(self, a0: int, a1: QtCore.QProcess.ExitStatus) -> None: ...
+    def processError(self, a0: QtCore.QProcess.ProcessError) -> None: ...
+    def stderrAvailable(self) -> None: ...
+    def stdoutAvailable(self) -> None: ...
+    @staticmethod
+    def splitCommand(command: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def create(action: typing.Optional[str], capture: bool) -> typing.Optional['QgsRunProcess']: ...
+
+
+class QgsBlockingProcess(QtCore.QObject):
+
+    def __init__(self, program: typing.Optional[str], arguments: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+
+    def processError(self) -> QtCore.QProcess.ProcessError: ...
+    def exitStatus(self) -> QtCore.QProcess.ExitStatus: ...
+    def run(self, feedback: typing.Optional[QgsFeedback] = ...) -> int: ...
+    def setStdErrHandler(self, a0: typing.Optional[typing.Callable[..., None]]) -> None: ...
+    def setStdOutHandler(self, a0: typing.Optional[typing.Callable[..., None]]) -> None: ...
+
+
+class QgsRuntimeProfiler(QtCore.QAbstractItemModel):
+
+    def __init__(self) -> None: ...
+
+    def groupAdded(self, group: typing.Optional[str]) -> None: ...
+    def asText(self, group: typing.Optional[str] = ...) -> str: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    @staticmethod
+    def translateGroupName(group: typing.Optional[str]) -> str: ...
+    def groupIsActive(self, group: typing.Optional[str]) -> bool: ...
+    def groups(self) -> set[str]: ...
+    def totalTime(self, group: typing.Optional[str] = ...) -> float: ...
+    def clear(self, group: typing.Optional[str] = ...) -> None: ...
+    def profileTime(self, name: typing.Optional[str], group: typing.Optional[str] = ...) -> float: ...
+    def record(self, name: typing.Optional[str], time: float, group: typing.Optional[str] = ..., id: typing.Optional[str] = ...) -> None: ...
+    def end(self, group: typing.Optional[str] = ...) -> None: ...
+    def start(self, name: typing.Optional[str], group: typing.Optional[str] = ..., id: typing.Optional[str] = ...) -> None: ...
+    def childGroups(self, parent: typing.Optional[str] = ..., group: typing.Optional[str] = ...) -> list[str]: ...
+    @deprecated("""""")
+    def endGroup(self) -> None: ...
+    @deprecated("""""")
+    def beginGroup(self, name: typing.Optional[str]) -> None: ...
+    profile: typing.Type[ScopedRuntimeProfileContextManager]
+
+
+class QgsScopedRuntimeProfile(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], group: typing.Optional[str] = ..., id: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScopedRuntimeProfile') -> None: ...
+
+    def switchTask(self, name: typing.Optional[str]) -> None: ...
+
+
+class QgsScaleUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScaleUtils') -> None: ...
+
+    @staticmethod
+    def lessThanMaximumScale(scale: float, maxScale: float) -> bool: ...
+    @staticmethod
+    def equalToOrGreaterThanMinimumScale(scale: float, minScale: float) -> bool: ...
+    @staticmethod
+    def loadScaleList(fileName: typing.Optional[str], scales: collections.abc.Iterable[typing.Optional[str]], errorMessage: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def saveScaleList(fileName: typing.Optional[str], scales: collections.abc.Iterable[typing.Optional[str]], errorMessage: typing.Optional[str]) -> bool: ...
+
+
+class QgsSelectionContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSelectionContext') -> None: ...
+
+    def setScale(self, scale: float) -> None: ...
+    def scale(self) -> float: ...
+
+
+class QgsSingleItemModel(QtCore.QAbstractItemModel):
+
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., text: typing.Optional[str] = ..., data: dict[int, typing.Any] = ..., flags: typing.Union[QtCore.Qt.ItemFlags, QtCore.Qt.ItemFlag] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QtCore.QObject], columnData: typing.Any, flags: typing.Union[QtCore.Qt.ItemFlags, QtCore.Qt.ItemFlag] = ...) -> None: ...
+
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+
+
+class QgsSipUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSipUtils') -> None: ...
+
+    @staticmethod
+    def isPyOwned(a0: typing.Any) -> bool: ...
+
+
+class QgsSldExportContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSldExportContext') -> None: ...
+    @typing.overload
+    def __init__(self, options: typing.Union[Qgis.SldExportOptions, Qgis.SldExportOption], vendorExtension: Qgis.SldExportVendorExtension, filePath: typing.Optional[str]) -> None: ...
+
+    def setExtraProperties(self, properties: dict[str, typing.Any]) -> None: ...
+    def extraProperties(self) -> dict[str, typing.Any]: ...
+    def pushWarning(self, warning: typing.Optional[str]) -> None: ...
+    def warnings(self) -> list[str]: ...
+    def pushError(self, error: typing.Optional[str]) -> None: ...
+    def errors(self) -> list[str]: ...
+    def setExportFilePath(self, exportFilePath: typing.Optional[str]) -> None: ...
+    def exportFilePath(self) -> str: ...
+    def setVendorExtension(self, vendorExtension: Qgis.SldExportVendorExtension) -> None: ...
+    def vendorExtensions(self) -> Qgis.SldExportVendorExtension: ...
+    def setExportOptions(self, exportOptions: typing.Union[Qgis.SldExportOptions, Qgis.SldExportOption]) -> None: ...
+    def exportOptions(self) -> Qgis.SldExportOptions: ...
+
+
+class QgsSourceCache(QgsAbstractContentCacheBase):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    remoteSourceFetched: typing.ClassVar[QtCore.pyqtSignal]
+    def localFilePath(self, path: typing.Optional[str], blocking: bool = ...) -> str: ...
+
+
+class QgsSqliteUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSqliteUtils') -> None: ...
+
+    @staticmethod
+    def systemTables() -> list[str]: ...
+    @staticmethod
+    def quotedValue(value: typing.Any) -> str: ...
+    @staticmethod
+    def quotedIdentifier(identifier: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def quotedString(value: typing.Optional[str]) -> str: ...
+
+
+class QgsSQLStatement(PyQt5.sip.wrapper):
+
+    class NodeType(int):
+        ntUnaryOperator = ... # type: QgsSQLStatement.NodeType
+        ntBinaryOperator = ... # type: QgsSQLStatement.NodeType
+        ntInOperator = ... # type: QgsSQLStatement.NodeType
+        ntBetweenOperator = ... # type: QgsSQLStatement.NodeType
+        ntFunction = ... # type: QgsSQLStatement.NodeType
+        ntLiteral = ... # type: QgsSQLStatement.NodeType
+        ntColumnRef = ... # type: QgsSQLStatement.NodeType
+        ntSelectedColumn = ... # type: QgsSQLStatement.NodeType
+        ntSelect = ... # type: QgsSQLStatement.NodeType
+        ntTableDef = ... # type: QgsSQLStatement.NodeType
+        ntJoin = ... # type: QgsSQLStatement.NodeType
+        ntColumnSorted = ... # type: QgsSQLStatement.NodeType
+        ntCast = ... # type: QgsSQLStatement.NodeType
+
+    class JoinType(int):
+        jtDefault = ... # type: QgsSQLStatement.JoinType
+        jtLeft = ... # type: QgsSQLStatement.JoinType
+        jtLeftOuter = ... # type: QgsSQLStatement.JoinType
+        jtRight = ... # type: QgsSQLStatement.JoinType
+        jtRightOuter = ... # type: QgsSQLStatement.JoinType
+        jtCross = ... # type: QgsSQLStatement.JoinType
+        jtInner = ... # type: QgsSQLStatement.JoinType
+        jtFull = ... # type: QgsSQLStatement.JoinType
+
+    class BinaryOperator(int):
+        boOr = ... # type: QgsSQLStatement.BinaryOperator
+        boAnd = ... # type: QgsSQLStatement.BinaryOperator
+        boEQ = ... # type: QgsSQLStatement.BinaryOperator
+        boNE = ... # type: QgsSQLStatement.BinaryOperator
+        boLE = ... # type: QgsSQLStatement.BinaryOperator
+        boGE = ... # type: QgsSQLStatement.BinaryOperator
+        boLT = ... # type: QgsSQLStatement.BinaryOperator
+        boGT = ... # type: QgsSQLStatement.BinaryOperator
+        boLike = ... # type: QgsSQLStatement.BinaryOperator
+        boNotLike = ... # type: QgsSQLStatement.BinaryOperator
+        boILike = ... # type: QgsSQLStatement.BinaryOperator
+        boNotILike = ... # type: QgsSQLStatement.BinaryOperator
+        boIs = ... # type: QgsSQLStatement.BinaryOperator
+        boIsNot = ... # type: QgsSQLStatement.BinaryOperator
+        boPlus = ... # type: QgsSQLStatement.BinaryOperator
+        boMinus = ... # type: QgsSQLStatement.BinaryOperator
+        boMul = ... # type: QgsSQLStatement.BinaryOperator
+        boDiv = ... # type: QgsSQLStatement.BinaryOperator
+        boIntDiv = ... # type: QgsSQLStatement.BinaryOperator
+        boMod = ... # type: QgsSQLStatement.BinaryOperator
+        boPow = ... # type: QgsSQLStatement.BinaryOperator
+        boConcat = ... # type: QgsSQLStatement.BinaryOperator
+
+    class UnaryOperator(int):
+        uoNot = ... # type: QgsSQLStatement.UnaryOperator
+        uoMinus = ... # type: QgsSQLStatement.UnaryOperator
+
+    class Node(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.Node') -> None: ...
+
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+
+    class NodeList(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.NodeList') -> None: ...
+
+        def dump(self) -> str: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.NodeList']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def count(self) -> int: ...
+        def list(self) -> list['QgsSQLStatement.Node']: ...
+        def append(self, node: typing.Optional['QgsSQLStatement.Node']) -> None: ...
+
+    class NodeUnaryOperator('QgsSQLStatement.Node'):
+
+        def __init__(self, op: 'QgsSQLStatement.UnaryOperator', operand: typing.Optional['QgsSQLStatement.Node']) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def operand(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def op(self) -> 'QgsSQLStatement.UnaryOperator': ...
+
+    class NodeBinaryOperator('QgsSQLStatement.Node'):
+
+        def __init__(self, op: 'QgsSQLStatement.BinaryOperator', opLeft: typing.Optional['QgsSQLStatement.Node'], opRight: typing.Optional['QgsSQLStatement.Node']) -> None: ...
+
+        def leftAssociative(self) -> bool: ...
+        def precedence(self) -> int: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def opRight(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def opLeft(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def op(self) -> 'QgsSQLStatement.BinaryOperator': ...
+
+    class NodeInOperator('QgsSQLStatement.Node'):
+
+        def __init__(self, node: typing.Optional['QgsSQLStatement.Node'], list: typing.Optional['QgsSQLStatement.NodeList'], notin: bool = ...) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def list(self) -> typing.Optional['QgsSQLStatement.NodeList']: ...
+        def isNotIn(self) -> bool: ...
+        def node(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+
+    class NodeBetweenOperator('QgsSQLStatement.Node'):
+
+        def __init__(self, node: typing.Optional['QgsSQLStatement.Node'], minVal: typing.Optional['QgsSQLStatement.Node'], maxVal: typing.Optional['QgsSQLStatement.Node'], notBetween: bool = ...) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def maxVal(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def minVal(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def isNotBetween(self) -> bool: ...
+        def node(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+
+    class NodeFunction('QgsSQLStatement.Node'):
+
+        def __init__(self, name: typing.Optional[str], args: typing.Optional['QgsSQLStatement.NodeList']) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def args(self) -> typing.Optional['QgsSQLStatement.NodeList']: ...
+        def name(self) -> str: ...
+
+    class NodeLiteral('QgsSQLStatement.Node'):
+
+        @typing.overload
+        def __init__(self, value: typing.Any) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.NodeLiteral') -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def value(self) -> typing.Any: ...
+
+    class NodeColumnRef('QgsSQLStatement.Node'):
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], star: bool) -> None: ...
+        @typing.overload
+        def __init__(self, tableName: typing.Optional[str], name: typing.Optional[str], star: bool) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.NodeColumnRef') -> None: ...
+
+        def cloneThis(self) -> typing.Optional['QgsSQLStatement.NodeColumnRef']: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def distinct(self) -> bool: ...
+        def star(self) -> bool: ...
+        def name(self) -> str: ...
+        def tableName(self) -> str: ...
+        def setDistinct(self, distinct: bool = ...) -> None: ...
+
+    class NodeSelectedColumn('QgsSQLStatement.Node'):
+
+        def __init__(self, node: typing.Optional['QgsSQLStatement.Node']) -> None: ...
+
+        def cloneThis(self) -> typing.Optional['QgsSQLStatement.NodeSelectedColumn']: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def alias(self) -> str: ...
+        def column(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def setAlias(self, alias: typing.Optional[str]) -> None: ...
+
+    class NodeCast('QgsSQLStatement.Node'):
+
+        def __init__(self, node: typing.Optional['QgsSQLStatement.Node'], type: typing.Optional[str]) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def type(self) -> str: ...
+        def node(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+
+    class NodeTableDef('QgsSQLStatement.Node'):
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], alias: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, schema: typing.Optional[str], name: typing.Optional[str], alias: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.NodeTableDef') -> None: ...
+
+        def cloneThis(self) -> typing.Optional['QgsSQLStatement.NodeTableDef']: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def alias(self) -> str: ...
+        def schema(self) -> str: ...
+        def name(self) -> str: ...
+
+    class NodeJoin('QgsSQLStatement.Node'):
+
+        @typing.overload
+        def __init__(self, tabledef: typing.Optional['QgsSQLStatement.NodeTableDef'], onExpr: typing.Optional['QgsSQLStatement.Node'], type: 'QgsSQLStatement.JoinType') -> None: ...
+        @typing.overload
+        def __init__(self, tabledef: typing.Optional['QgsSQLStatement.NodeTableDef'], usingColumns: collections.abc.Iterable[typing.Optional[str]], type: 'QgsSQLStatement.JoinType') -> None: ...
+
+        def cloneThis(self) -> typing.Optional['QgsSQLStatement.NodeJoin']: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def type(self) -> 'QgsSQLStatement.JoinType': ...
+        def usingColumns(self) -> list[str]: ...
+        def onExpr(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def tableDef(self) -> typing.Optional['QgsSQLStatement.NodeTableDef']: ...
+
+    class NodeColumnSorted('QgsSQLStatement.Node'):
+
+        def __init__(self, column: typing.Optional['QgsSQLStatement.NodeColumnRef'], asc: bool) -> None: ...
+
+        def cloneThis(self) -> typing.Optional['QgsSQLStatement.NodeColumnSorted']: ...
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def ascending(self) -> bool: ...
+        def column(self) -> typing.Optional['QgsSQLStatement.NodeColumnRef']: ...
+
+    class NodeSelect('QgsSQLStatement.Node'):
+
+        def __init__(self, tableList: collections.abc.Iterable['QgsSQLStatement.NodeTableDef'], columns: collections.abc.Iterable['QgsSQLStatement.NodeSelectedColumn'], distinct: bool) -> None: ...
+
+        def clone(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def accept(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+        def dump(self) -> str: ...
+        def nodeType(self) -> 'QgsSQLStatement.NodeType': ...
+        def orderBy(self) -> list['QgsSQLStatement.NodeColumnSorted']: ...
+        def where(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+        def joins(self) -> list['QgsSQLStatement.NodeJoin']: ...
+        def distinct(self) -> bool: ...
+        def columns(self) -> list['QgsSQLStatement.NodeSelectedColumn']: ...
+        def tables(self) -> list['QgsSQLStatement.NodeTableDef']: ...
+        def setOrderBy(self, orderBy: collections.abc.Iterable['QgsSQLStatement.NodeColumnSorted']) -> None: ...
+        def setWhere(self, where: typing.Optional['QgsSQLStatement.Node']) -> None: ...
+        def appendJoin(self, join: typing.Optional['QgsSQLStatement.NodeJoin']) -> None: ...
+        def setJoins(self, joins: collections.abc.Iterable['QgsSQLStatement.NodeJoin']) -> None: ...
+
+    class Visitor(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.Visitor') -> None: ...
+
+        def visit(self, n: typing.Union[QgsSQLStatement.NodeUnaryOperator, QgsSQLStatement.NodeBinaryOperator, QgsSQLStatement.NodeInOperator, QgsSQLStatement.NodeBetweenOperator, QgsSQLStatement.NodeFunction, QgsSQLStatement.NodeLiteral, QgsSQLStatement.NodeColumnRef, QgsSQLStatement.NodeSelectedColumn, QgsSQLStatement.NodeTableDef, QgsSQLStatement.NodeSelect, QgsSQLStatement.NodeJoin, QgsSQLStatement.NodeColumnSorted, QgsSQLStatement.NodeCast]) -> None: ...
+
+    class RecursiveVisitor('QgsSQLStatement.Visitor'):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSQLStatement.RecursiveVisitor') -> None: ...
+
+        @typing.overload
+        def visit(self, n: typing.Union[QgsSQLStatement.NodeUnaryOperator, QgsSQLStatement.NodeBinaryOperator, QgsSQLStatement.NodeInOperator, QgsSQLStatement.NodeBetweenOperator, QgsSQLStatement.NodeFunction]) -> None: ...
+        @typing.overload
+        def visit(self, a0: typing.Union[QgsSQLStatement.NodeLiteral, QgsSQLStatement.NodeColumnRef]) -> None: ...
+        @typing.overload
+        def visit(self, n: 'QgsSQLStatement.NodeSelectedColumn') -> None: ...
+        @typing.overload
+        def visit(self, a0: 'QgsSQLStatement.NodeTableDef') -> None: ...
+        @typing.overload
+        def visit(self, n: typing.Union[QgsSQLStatement.NodeSelect, QgsSQLStatement.NodeJoin, QgsSQLStatement.NodeColumnSorted, QgsSQLStatement.NodeCast]) -> None: ...
+
+    @typing.overload
+    def __init__(self, statement: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSQLStatement') -> None: ...
+    @typing.overload
+    def __init__(self, statement: typing.Optional[str], allowFragments: bool) -> None: ...
+
+    def acceptVisitor(self, v: 'QgsSQLStatement.Visitor') -> None: ...
+    @staticmethod
+    def quotedString(text: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def stripMsQuotedIdentifier(text: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def stripQuotedIdentifier(text: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def quotedIdentifierIfNeeded(name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def quotedIdentifier(name: typing.Optional[str]) -> str: ...
+    def dump(self) -> str: ...
+    def statement(self) -> str: ...
+    def rootNode(self) -> typing.Optional['QgsSQLStatement.Node']: ...
+    def doBasicValidationChecks(self) -> typing.Tuple[bool, str]: ...
+    def parserErrorString(self) -> str: ...
+    def hasParserError(self) -> bool: ...
+
+
+class QgsSQLStatementFragment(QgsSQLStatement):
+
+    @typing.overload
+    def __init__(self, fragment: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSQLStatementFragment') -> None: ...
+
+
+class QgsStatisticalSummary(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, stats: typing.Union[Qgis.Statistics, Qgis.Statistic] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStatisticalSummary') -> None: ...
+
+    @staticmethod
+    def shortName(statistic: Qgis.Statistic) -> str: ...
+    @staticmethod
+    def displayName(statistic: Qgis.Statistic) -> str: ...
+    def interQuartileRange(self) -> float: ...
+    def thirdQuartile(self) -> float: ...
+    def firstQuartile(self) -> float: ...
+    def majority(self) -> float: ...
+    def minority(self) -> float: ...
+    def variety(self) -> int: ...
+    def sampleStDev(self) -> float: ...
+    def stDev(self) -> float: ...
+    def last(self) -> float: ...
+    def first(self) -> float: ...
+    def range(self) -> float: ...
+    def max(self) -> float: ...
+    def min(self) -> float: ...
+    def median(self) -> float: ...
+    def mean(self) -> float: ...
+    def sum(self) -> float: ...
+    def countMissing(self) -> int: ...
+    def count(self) -> int: ...
+    def statistic(self, stat: Qgis.Statistic) -> float: ...
+    def finalize(self) -> None: ...
+    def addVariant(self, value: typing.Any) -> None: ...
+    def addValue(self, value: float) -> None: ...
+    def calculate(self, values: collections.abc.Iterable[float]) -> None: ...
+    def reset(self) -> None: ...
+    def setStatistics(self, stats: typing.Union[Qgis.Statistics, Qgis.Statistic]) -> None: ...
+    def statistics(self) -> Qgis.Statistics: ...
+    Statistic: typing.Type[Qgis.Statistic]
+    Count: Qgis.Statistic
+    CountMissing: Qgis.Statistic
+    Sum: Qgis.Statistic
+    Mean: Qgis.Statistic
+    Median: Qgis.Statistic
+    StDev: Qgis.Statistic
+    StDevSample: Qgis.Statistic
+    Min: Qgis.Statistic
+    Max: Qgis.Statistic
+    Range: Qgis.Statistic
+    Minority: Qgis.Statistic
+    Majority: Qgis.Statistic
+    Variety: Qgis.Statistic
+    FirstQuartile: Qgis.Statistic
+    ThirdQuartile: Qgis.Statistic
+    InterQuartileRange: Qgis.Statistic
+    First: Qgis.Statistic
+    Last: Qgis.Statistic
+    All: Qgis.Statistic
+    Statistics: typing.Type[Qgis.Statistics]
+
+
+class QgsStoredExpression(PyQt5.sip.wrapper):
+
+    class Category(int):
+        FilterExpression = ... # type: QgsStoredExpression.Category
+        DefaultValueExpression = ... # type: QgsStoredExpression.Category
+        All = ... # type: QgsStoredExpression.Category
+
+    expression = ... # type: typing.Optional[str]
+    id = ... # type: typing.Optional[str]
+    name = ... # type: typing.Optional[str]
+    tag = ... # type: 'QgsStoredExpression.Category'
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStoredExpression') -> None: ...
+
+
+class QgsStoredExpressionManager(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def readXml(self, layerNode: QtXml.QDomNode) -> bool: ...
+    def writeXml(self, layerNode: QtXml.QDomNode) -> bool: ...
+    def clearStoredExpressions(self) -> None: ...
+    def findStoredExpressionByExpression(self, expression: typing.Optional[str], tag: QgsStoredExpression.Category = ...) -> QgsStoredExpression: ...
+    def storedExpression(self, id: typing.Optional[str]) -> QgsStoredExpression: ...
+    def storedExpressions(self, tag: QgsStoredExpression.Category = ...) -> list[QgsStoredExpression]: ...
+    def addStoredExpressions(self, storedExpressions: collections.abc.Iterable[QgsStoredExpression]) -> None: ...
+    def updateStoredExpression(self, id: typing.Optional[str], name: typing.Optional[str], expression: typing.Optional[str], tag: QgsStoredExpression.Category) -> None: ...
+    def removeStoredExpression(self, id: typing.Optional[str]) -> None: ...
+    def addStoredExpression(self, name: typing.Optional[str], expression: typing.Optional[str], tag: QgsStoredExpression.Category = ...) -> str: ...
+
+
+class QgsStringStatisticalSummary(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, stats: typing.Union[Qgis.StringStatistics, Qgis.StringStatistic] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStringStatisticalSummary') -> None: ...
+
+    @staticmethod
+    def displayName(statistic: Qgis.StringStatistic) -> str: ...
+    def majority(self) -> str: ...
+    def minority(self) -> str: ...
+    def meanLength(self) -> float: ...
+    def maxLength(self) -> int: ...
+    def minLength(self) -> int: ...
+    def max(self) -> str: ...
+    def min(self) -> str: ...
+    def countMissing(self) -> int: ...
+    def distinctValues(self) -> set[str]: ...
+    def countDistinct(self) -> int: ...
+    def count(self) -> int: ...
+    def statistic(self, stat: Qgis.StringStatistic) -> typing.Any: ...
+    def finalize(self) -> None: ...
+    def addValue(self, value: typing.Any) -> None: ...
+    def addString(self, string: typing.Optional[str]) -> None: ...
+    def calculateFromVariants(self, values: collections.abc.Iterable[typing.Any]) -> None: ...
+    def calculate(self, values: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def reset(self) -> None: ...
+    def setStatistics(self, stats: typing.Union[Qgis.StringStatistics, Qgis.StringStatistic]) -> None: ...
+    def statistics(self) -> Qgis.StringStatistics: ...
+    Statistic: typing.Type[Qgis.StringStatistic]
+    Count: Qgis.StringStatistic
+    CountDistinct: Qgis.StringStatistic
+    CountMissing: Qgis.StringStatistic
+    Min: Qgis.StringStatistic
+    Max: Qgis.StringStatistic
+    MinimumLength: Qgis.StringStatistic
+    MaximumLength: Qgis.StringStatistic
+    MeanLength: Qgis.StringStatistic
+    Minority: Qgis.StringStatistic
+    Majority: Qgis.StringStatistic
+    All: Qgis.StringStatistic
+    Statistics: typing.Type[Qgis.StringStatistics]
+
+
+class QgsStringReplacement(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, match: typing.Optional[str], replacement: typing.Optional[str], caseSensitive: bool = ..., wholeWordOnly: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStringReplacement') -> None: ...
+
+    def __ne__(self, other: object): ...
+    @staticmethod
+    def fromProperties(properties: dict[typing.Optional[str], typing.Optional[str]]) -> 'QgsStringReplacement': ...
+    def properties(self) -> dict[str, str]: ...
+    def __eq__(self, other: object): ...
+    def process(self, input: typing.Optional[str]) -> str: ...
+    def wholeWordOnly(self) -> bool: ...
+    def caseSensitive(self) -> bool: ...
+    def replacement(self) -> str: ...
+    def match(self) -> str: ...
+
+
+class QgsStringReplacementCollection(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, replacements: collections.abc.Iterable[QgsStringReplacement] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStringReplacementCollection') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> None: ...
+    def process(self, input: typing.Optional[str]) -> str: ...
+    def setReplacements(self, replacements: collections.abc.Iterable[QgsStringReplacement]) -> None: ...
+    def replacements(self) -> list[QgsStringReplacement]: ...
+
+
+class QgsStringUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStringUtils') -> None: ...
+
+    @staticmethod
+    def containsByWord(candidate: typing.Optional[str], words: typing.Optional[str], sensitivity: QtCore.Qt.CaseSensitivity = ...) -> bool: ...
+    @staticmethod
+    def truncateMiddleOfString(string: typing.Optional[str], maxLength: int) -> str: ...
+    @staticmethod
+    def qRegExpEscape(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def htmlToMarkdown(html: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def substituteVerticalCharacters(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def wordWrap(string: typing.Optional[str], length: int, useMaxLineLength: bool = ..., customDelimiter: typing.Optional[str] = ...) -> str: ...
+    @staticmethod
+    def isUrl(string: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def insertLinks(string: typing.Optional[str]) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    @staticmethod
+    def fuzzyScore(candidate: typing.Optional[str], search: typing.Optional[str]) -> float: ...
+    @staticmethod
+    def soundex(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def hammingDistance(string1: typing.Optional[str], string2: typing.Optional[str], caseSensitive: bool = ...) -> int: ...
+    @staticmethod
+    def longestCommonSubstring(string1: typing.Optional[str], string2: typing.Optional[str], caseSensitive: bool = ...) -> str: ...
+    @staticmethod
+    def levenshteinDistance(string1: typing.Optional[str], string2: typing.Optional[str], caseSensitive: bool = ...) -> int: ...
+    @staticmethod
+    def ampersandEncode(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def capitalize(string: typing.Optional[str], capitalization: Qgis.Capitalization) -> str: ...
+    Capitalization: typing.Type[Qgis.Capitalization]
+    MixedCase: Qgis.Capitalization
+    AllUppercase: Qgis.Capitalization
+    AllLowercase: Qgis.Capitalization
+    ForceFirstLetterToCapital: Qgis.Capitalization
+    SmallCaps: Qgis.Capitalization
+    TitleCase: Qgis.Capitalization
+    UpperCamelCase: Qgis.Capitalization
+    AllSmallCaps: Qgis.Capitalization
+
+
+class QgsTemporalController(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    updateTemporalRange: typing.ClassVar[QtCore.pyqtSignal]
+
+
+class QgsTileXYZ(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, tc: int = ..., tr: int = ..., tz: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTileXYZ') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def toString(self) -> str: ...
+    def zoomLevel(self) -> int: ...
+    def row(self) -> int: ...
+    def column(self) -> int: ...
+
+
+class QgsTileRange(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, c1: int = ..., c2: int = ..., r1: int = ..., r2: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTileRange') -> None: ...
+
+    def count(self) -> int: ...
+    def endRow(self) -> int: ...
+    def startRow(self) -> int: ...
+    def endColumn(self) -> int: ...
+    def startColumn(self) -> int: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsUnitTypes(PyQt5.sip.wrapper):
+
+    class DistanceValue(PyQt5.sip.wrapper):
+
+        unit = ... # type: Qgis.DistanceUnit
+        value = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsUnitTypes.DistanceValue') -> None: ...
+
+    class AreaValue(PyQt5.sip.wrapper):
+
+        unit = ... # type: Qgis.AreaUnit
+        value = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsUnitTypes.AreaValue') -> None: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsUnitTypes') -> None: ...
+
+    @staticmethod
+    def decodeLayoutUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.LayoutUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeRenderUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.RenderUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def formatArea(area: float, decimals: int, unit: Qgis.AreaUnit, keepBaseUnit: bool = ...) -> str: ...
+    @staticmethod
+    def formatDistance(distance: float, decimals: int, unit: Qgis.DistanceUnit, keepBaseUnit: bool = ...) -> str: ...
+    @staticmethod
+    def scaledArea(area: float, unit: Qgis.AreaUnit, decimals: int, keepBaseUnit: bool = ...) -> 'QgsUnitTypes.AreaValue': ...
+    @staticmethod
+    def scaledDistance(distance: float, unit: Qgis.DistanceUnit, decimals: int, keepBaseUnit: bool = ...) -> 'QgsUnitTypes.DistanceValue': ...
+    @staticmethod
+    def formatAngle(angle: float, decimals: int, unit: Qgis.AngleUnit) -> str: ...
+    @staticmethod
+    def decodeAngleUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.AngleUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def volumeToDistanceUnit(volumeUnit: Qgis.VolumeUnit) -> Qgis.DistanceUnit: ...
+    @staticmethod
+    def distanceToVolumeUnit(distanceUnit: Qgis.DistanceUnit) -> Qgis.VolumeUnit: ...
+    @staticmethod
+    def stringToVolumeUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.VolumeUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeVolumeUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.VolumeUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def stringToTemporalUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.TemporalUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeTemporalUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.TemporalUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def areaToDistanceUnit(areaUnit: Qgis.AreaUnit) -> Qgis.DistanceUnit: ...
+    @staticmethod
+    def distanceToAreaUnit(distanceUnit: Qgis.DistanceUnit) -> Qgis.AreaUnit: ...
+    @staticmethod
+    def stringToAreaUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.AreaUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeAreaUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.AreaUnit, typing.Optional[bool]]: ...
+    @typing.overload
+    @staticmethod
+    def fromUnitToUnitFactor(fromUnit: Qgis.DistanceUnit, toUnit: Qgis.DistanceUnit) -> float: ...
+    @typing.overload
+    @staticmethod
+    def fromUnitToUnitFactor(fromUnit: Qgis.AreaUnit, toUnit: Qgis.AreaUnit) -> float: ...
+    @typing.overload
+    @staticmethod
+    def fromUnitToUnitFactor(fromUnit: Qgis.TemporalUnit, toUnit: Qgis.TemporalUnit) -> float: ...
+    @typing.overload
+    @staticmethod
+    def fromUnitToUnitFactor(fromUnit: Qgis.VolumeUnit, toUnit: Qgis.VolumeUnit) -> float: ...
+    @typing.overload
+    @staticmethod
+    def fromUnitToUnitFactor(fromUnit: Qgis.AngleUnit, toUnit: Qgis.AngleUnit) -> float: ...
+    @staticmethod
+    def stringToDistanceUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.DistanceUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def toAbbreviatedString(unit: typing.Union[Qgis.DistanceUnit, Qgis.AreaUnit, Qgis.TemporalUnit, Qgis.VolumeUnit, Qgis.RenderUnit, Qgis.LayoutUnit]) -> str: ...
+    @staticmethod
+    def toString(unit: typing.Union[Qgis.DistanceUnit, Qgis.AreaUnit, Qgis.TemporalUnit, Qgis.VolumeUnit, Qgis.AngleUnit, Qgis.RenderUnit, Qgis.LayoutUnit]) -> str: ...
+    @staticmethod
+    def decodeDistanceUnit(string: typing.Optional[str]) -> typing.Tuple[Qgis.DistanceUnit, typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeUnit(unit: typing.Union[Qgis.DistanceUnit, Qgis.AreaUnit, Qgis.TemporalUnit, Qgis.VolumeUnit, Qgis.AngleUnit, Qgis.RenderUnit, Qgis.LayoutUnit]) -> str: ...
+    @typing.overload
+    @staticmethod
+    def unitType(unit: typing.Union[Qgis.DistanceUnit, Qgis.AreaUnit, Qgis.VolumeUnit]) -> Qgis.DistanceUnitType: ...
+    @typing.overload
+    @staticmethod
+    def unitType(units: Qgis.LayoutUnit) -> Qgis.LayoutUnitType: ...
+    @staticmethod
+    def decodeUnitType(string: typing.Optional[str]) -> typing.Tuple[Qgis.UnitType, typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeUnitType(type: Qgis.UnitType) -> str: ...
+    SystemOfMeasurement: typing.Type[Qgis.SystemOfMeasurement]
+    UnknownSystem: Qgis.SystemOfMeasurement
+    MetricSystem: Qgis.SystemOfMeasurement
+    ImperialSystem: Qgis.SystemOfMeasurement
+    USCSSystem: Qgis.SystemOfMeasurement
+    UnitType: typing.Type[Qgis.UnitType]
+    TypeDistance: Qgis.UnitType
+    TypeArea: Qgis.UnitType
+    TypeVolume: Qgis.UnitType
+    TypeUnknown: Qgis.UnitType
+    TypeTemporal: Qgis.UnitType
+    DistanceUnit: typing.Type[Qgis.DistanceUnit]
+    DistanceMeters: Qgis.DistanceUnit
+    DistanceKilometers: Qgis.DistanceUnit
+    DistanceFeet: Qgis.DistanceUnit
+    DistanceNauticalMiles: Qgis.DistanceUnit
+    DistanceYards: Qgis.DistanceUnit
+    DistanceMiles: Qgis.DistanceUnit
+    DistanceDegrees: Qgis.DistanceUnit
+    DistanceCentimeters: Qgis.DistanceUnit
+    DistanceMillimeters: Qgis.DistanceUnit
+    Inches: Qgis.DistanceUnit
+    ChainsInternational: Qgis.DistanceUnit
+    ChainsBritishBenoit1895A: Qgis.DistanceUnit
+    ChainsBritishBenoit1895B: Qgis.DistanceUnit
+    ChainsBritishSears1922Truncated: Qgis.DistanceUnit
+    ChainsBritishSears1922: Qgis.DistanceUnit
+    ChainsClarkes: Qgis.DistanceUnit
+    ChainsUSSurvey: Qgis.DistanceUnit
+    FeetBritish1865: Qgis.DistanceUnit
+    FeetBritish1936: Qgis.DistanceUnit
+    FeetBritishBenoit1895A: Qgis.DistanceUnit
+    FeetBritishBenoit1895B: Qgis.DistanceUnit
+    FeetBritishSears1922Truncated: Qgis.DistanceUnit
+    FeetBritishSears1922: Qgis.DistanceUnit
+    FeetClarkes: Qgis.DistanceUnit
+    FeetGoldCoast: Qgis.DistanceUnit
+    FeetIndian: Qgis.DistanceUnit
+    FeetIndian1937: Qgis.DistanceUnit
+    FeetIndian1962: Qgis.DistanceUnit
+    FeetIndian1975: Qgis.DistanceUnit
+    FeetUSSurvey: Qgis.DistanceUnit
+    LinksInternational: Qgis.DistanceUnit
+    LinksBritishBenoit1895A: Qgis.DistanceUnit
+    LinksBritishBenoit1895B: Qgis.DistanceUnit
+    LinksBritishSears1922Truncated: Qgis.DistanceUnit
+    LinksBritishSears1922: Qgis.DistanceUnit
+    LinksClarkes: Qgis.DistanceUnit
+    LinksUSSurvey: Qgis.DistanceUnit
+    YardsBritishBenoit1895A: Qgis.DistanceUnit
+    YardsBritishBenoit1895B: Qgis.DistanceUnit
+    YardsBritishSears1922Truncated: Qgis.DistanceUnit
+    YardsBritishSears1922: Qgis.DistanceUnit
+    YardsClarkes: Qgis.DistanceUnit
+    YardsIndian: Qgis.DistanceUnit
+    YardsIndian1937: Qgis.DistanceUnit
+    YardsIndian1962: Qgis.DistanceUnit
+    YardsIndian1975: Qgis.DistanceUnit
+    MilesUSSurvey: Qgis.DistanceUnit
+    Fathoms: Qgis.DistanceUnit
+    MetersGermanLegal: Qgis.DistanceUnit
+    DistanceUnknownUnit: Qgis.DistanceUnit
+    DistanceUnitType: typing.Type[Qgis.DistanceUnitType]
+    Standard: Qgis.DistanceUnitType
+    Geographic: Qgis.DistanceUnitType
+    UnknownType: Qgis.DistanceUnitType
+    AreaUnit: typing.Type[Qgis.AreaUnit]
+    AreaSquareMeters: Qgis.AreaUnit
+    AreaSquareKilometers: Qgis.AreaUnit
+    AreaSquareFeet: Qgis.AreaUnit
+    AreaSquareYards: Qgis.AreaUnit
+    AreaSquareMiles: Qgis.AreaUnit
+    AreaHectares: Qgis.AreaUnit
+    AreaAcres: Qgis.AreaUnit
+    AreaSquareNauticalMiles: Qgis.AreaUnit
+    AreaSquareDegrees: Qgis.AreaUnit
+    AreaSquareCentimeters: Qgis.AreaUnit
+    AreaSquareMillimeters: Qgis.AreaUnit
+    SquareInches: Qgis.AreaUnit
+    AreaUnknownUnit: Qgis.AreaUnit
+    VolumeUnit: typing.Type[Qgis.VolumeUnit]
+    VolumeCubicMeters: Qgis.VolumeUnit
+    VolumeCubicFeet: Qgis.VolumeUnit
+    VolumeCubicYards: Qgis.VolumeUnit
+    VolumeBarrel: Qgis.VolumeUnit
+    VolumeCubicDecimeter: Qgis.VolumeUnit
+    VolumeLiters: Qgis.VolumeUnit
+    VolumeGallonUS: Qgis.VolumeUnit
+    VolumeCubicInch: Qgis.VolumeUnit
+    VolumeCubicCentimeter: Qgis.VolumeUnit
+    VolumeCubicDegrees: Qgis.VolumeUnit
+    VolumeUnknownUnit: Qgis.VolumeUnit
+    AngleUnit: typing.Type[Qgis.AngleUnit]
+    AngleDegrees: Qgis.AngleUnit
+    AngleRadians: Qgis.AngleUnit
+    AngleGon: Qgis.AngleUnit
+    AngleMinutesOfArc: Qgis.AngleUnit
+    AngleSecondsOfArc: Qgis.AngleUnit
+    AngleTurn: Qgis.AngleUnit
+    AngleMilliradiansSI: Qgis.AngleUnit
+    AngleMilNATO: Qgis.AngleUnit
+    AngleUnknownUnit: Qgis.AngleUnit
+    TemporalUnit: typing.Type[Qgis.TemporalUnit]
+    TemporalMilliseconds: Qgis.TemporalUnit
+    TemporalSeconds: Qgis.TemporalUnit
+    TemporalMinutes: Qgis.TemporalUnit
+    TemporalHours: Qgis.TemporalUnit
+    TemporalDays: Qgis.TemporalUnit
+    TemporalWeeks: Qgis.TemporalUnit
+    TemporalMonths: Qgis.TemporalUnit
+    TemporalYears: Qgis.TemporalUnit
+    TemporalDecades: Qgis.TemporalUnit
+    TemporalCenturies: Qgis.TemporalUnit
+    TemporalIrregularStep: Qgis.TemporalUnit
+    TemporalUnknownUnit: Qgis.TemporalUnit
+    RenderUnit: typing.Type[Qgis.RenderUnit]
+    RenderMillimeters: Qgis.RenderUnit
+    RenderMapUnits: Qgis.RenderUnit
+    RenderPixels: Qgis.RenderUnit
+    RenderPercentage: Qgis.RenderUnit
+    RenderPoints: Qgis.RenderUnit
+    RenderInches: Qgis.RenderUnit
+    RenderUnknownUnit: Qgis.RenderUnit
+    RenderMetersInMapUnits: Qgis.RenderUnit
+    LayoutUnit: typing.Type[Qgis.LayoutUnit]
+    LayoutMillimeters: Qgis.LayoutUnit
+    LayoutCentimeters: Qgis.LayoutUnit
+    LayoutMeters: Qgis.LayoutUnit
+    LayoutInches: Qgis.LayoutUnit
+    LayoutFeet: Qgis.LayoutUnit
+    LayoutPoints: Qgis.LayoutUnit
+    LayoutPicas: Qgis.LayoutUnit
+    LayoutPixels: Qgis.LayoutUnit
+    LayoutUnitType: typing.Type[Qgis.LayoutUnitType]
+    LayoutPaperUnits: Qgis.LayoutUnitType
+    LayoutScreenUnits: Qgis.LayoutUnitType
+
+
+class QgsUnsetAttributeValue(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, defaultValueClause: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsUnsetAttributeValue') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def defaultValueClause(self) -> str: ...
+
+
+class QgsUserProfile(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, folder: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsUserProfile') -> None: ...
+
+    def icon(self) -> QtGui.QIcon: ...
+    def setAlias(self, alias: typing.Optional[str]) -> QgsError: ...
+    def alias(self) -> str: ...
+    def initSettings(self) -> None: ...
+    def name(self) -> str: ...
+    def validate(self) -> QgsError: ...
+    def folder(self) -> str: ...
+
+
+class QgsUserProfileManager(QtCore.QObject):
+
+    def __init__(self, rootLocation: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    profilesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def settings(self) -> typing.Optional[QtCore.QSettings]: ...
+    def loadUserProfile(self, name: typing.Optional[str]) -> None: ...
+    def setActiveUserProfile(self, profile: typing.Optional[str]) -> None: ...
+    def userProfile(self) -> typing.Optional[QgsUserProfile]: ...
+    def deleteProfile(self, name: typing.Optional[str]) -> QgsError: ...
+    def createUserProfile(self, name: typing.Optional[str]) -> QgsError: ...
+    def profileForName(self, name: typing.Optional[str]) -> typing.Optional[QgsUserProfile]: ...
+    def setUserProfileSelectionPolicy(self, policy: Qgis.UserProfileSelectionPolicy) -> None: ...
+    def userProfileSelectionPolicy(self) -> Qgis.UserProfileSelectionPolicy: ...
+    def lastProfileName(self) -> str: ...
+    def setDefaultFromActive(self) -> None: ...
+    def setDefaultProfileName(self, name: typing.Optional[str]) -> None: ...
+    def defaultProfileName(self) -> str: ...
+    def profileExists(self, name: typing.Optional[str]) -> bool: ...
+    def allProfiles(self) -> list[str]: ...
+    def rootLocationIsSet(self) -> bool: ...
+    def isNewProfileNotificationEnabled(self) -> bool: ...
+    def setNewProfileNotificationEnabled(self, enabled: bool) -> None: ...
+    def rootLocation(self) -> str: ...
+    def setRootLocation(self, rootProfileLocation: typing.Optional[str]) -> None: ...
+    def getProfile(self, defaultProfile: typing.Optional[str] = ..., createNew: bool = ..., initSettings: bool = ...) -> typing.Optional[QgsUserProfile]: ...
+    @staticmethod
+    def resolveProfilesFolder(basePath: typing.Optional[str] = ...) -> str: ...
+
+
+class QgsVariantUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVariantUtils') -> None: ...
+
+    @staticmethod
+    def isNumericType(metaType: QtCore.QMetaType.Type) -> bool: ...
+    @staticmethod
+    def isNull(variant: typing.Any) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def typeToDisplayString(type: QtCore.QMetaType.Type, subType: QtCore.QMetaType.Type = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def typeToDisplayString(type: QtCore.QVariant.Type, subType: QtCore.QVariant.Type = ...) -> str: ...
+
+
+class QgsVector(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, x: float, y: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVector') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def toString(self, precision: int = ...) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def normalized(self) -> 'QgsVector': ...
+    def rotateBy(self, rot: float) -> 'QgsVector': ...
+    def crossProduct(self, v: 'QgsVector') -> float: ...
+    @typing.overload
+    def angle(self) -> float: ...
+    @typing.overload
+    def angle(self, v: 'QgsVector') -> float: ...
+    def perpVector(self) -> 'QgsVector': ...
+    def y(self) -> float: ...
+    def x(self) -> float: ...
+    def lengthSquared(self) -> float: ...
+    def length(self) -> float: ...
+    def __isub__(self, other: 'QgsVector') -> 'QgsVector': ...
+    def __sub__(self, other: 'QgsVector') -> 'QgsVector': ...
+    def __iadd__(self, other: 'QgsVector') -> 'QgsVector': ...
+    def __add__(self, other: 'QgsVector') -> 'QgsVector': ...
+    def __truediv__(self, scalar: float) -> 'QgsVector': ...
+    @typing.overload
+    def __mul__(self, scalar: float) -> 'QgsVector': ...
+    @typing.overload
+    def __mul__(self, v: 'QgsVector') -> float: ...
+    def __neg__(self) -> 'QgsVector': ...
+
+
+class QgsVector3D(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, x: float, y: float, z: float) -> None: ...
+    @typing.overload
+    def __init__(self, v: QtGui.QVector3D) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVector3D') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def toVector3D(self) -> QtGui.QVector3D: ...
+    def toString(self, precision: int = ...) -> str: ...
+    @staticmethod
+    def perpendicularPoint(v1: 'QgsVector3D', v2: 'QgsVector3D', vp: 'QgsVector3D') -> 'QgsVector3D': ...
+    def distance(self, other: 'QgsVector3D') -> float: ...
+    def normalize(self) -> None: ...
+    def length(self) -> float: ...
+    @staticmethod
+    def crossProduct(v1: 'QgsVector3D', v2: 'QgsVector3D') -> 'QgsVector3D': ...
+    @staticmethod
+    def dotProduct(v1: 'QgsVector3D', v2: 'QgsVector3D') -> float: ...
+    def __truediv__(self, factor: float) -> 'QgsVector3D': ...
+    def __mul__(self, factor: float) -> 'QgsVector3D': ...
+    def __neg__(self) -> 'QgsVector3D': ...
+    def __sub__(self, other: 'QgsVector3D') -> 'QgsVector3D': ...
+    def __add__(self, other: 'QgsVector3D') -> 'QgsVector3D': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def set(self, x: float, y: float, z: float) -> None: ...
+    def setZ(self, z: float) -> None: ...
+    def setY(self, y: float) -> None: ...
+    def setX(self, x: float) -> None: ...
+    def z(self) -> float: ...
+    def y(self) -> float: ...
+    def x(self) -> float: ...
+    def isNull(self) -> bool: ...
+
+
+class QgsVectorSimplifyMethod(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorSimplifyMethod') -> None: ...
+
+    def maximumScale(self) -> float: ...
+    def setMaximumScale(self, maximumScale: float) -> None: ...
+    def forceLocalOptimization(self) -> bool: ...
+    def setForceLocalOptimization(self, localOptimization: bool) -> None: ...
+    def threshold(self) -> float: ...
+    def setThreshold(self, threshold: float) -> None: ...
+    def tolerance(self) -> float: ...
+    def setTolerance(self, tolerance: float) -> None: ...
+    def simplifyAlgorithm(self) -> Qgis.VectorSimplificationAlgorithm: ...
+    def setSimplifyAlgorithm(self, simplifyAlgorithm: Qgis.VectorSimplificationAlgorithm) -> None: ...
+    def simplifyHints(self) -> Qgis.VectorRenderingSimplificationFlags: ...
+    def setSimplifyHints(self, simplifyHints: typing.Union[Qgis.VectorRenderingSimplificationFlags, Qgis.VectorRenderingSimplificationFlag]) -> None: ...
+    SimplifyAlgorithm: typing.Type[Qgis.VectorSimplificationAlgorithm]
+    Distance: Qgis.VectorSimplificationAlgorithm
+    SnapToGrid: Qgis.VectorSimplificationAlgorithm
+    Visvalingam: Qgis.VectorSimplificationAlgorithm
+    SnappedToGridGlobal: Qgis.VectorSimplificationAlgorithm
+    SimplifyHint: typing.Type[Qgis.VectorRenderingSimplificationFlag]
+    NoSimplification: Qgis.VectorRenderingSimplificationFlag
+    GeometrySimplification: Qgis.VectorRenderingSimplificationFlag
+    AntialiasingSimplification: Qgis.VectorRenderingSimplificationFlag
+    FullSimplification: Qgis.VectorRenderingSimplificationFlag
+    SimplifyHints: typing.Type[Qgis.VectorRenderingSimplificationFlags]
+
+
+class QgsVirtualLayerDefinition(PyQt5.sip.wrapper):
+
+    class SourceLayer(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], ref: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], source: typing.Optional[str], provider: typing.Optional[str], encoding: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVirtualLayerDefinition.SourceLayer') -> None: ...
+
+        def encoding(self) -> str: ...
+        def source(self) -> str: ...
+        def provider(self) -> str: ...
+        def name(self) -> str: ...
+        def reference(self) -> str: ...
+        def isReferenced(self) -> bool: ...
+
+    @typing.overload
+    def __init__(self, filePath: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVirtualLayerDefinition') -> None: ...
+
+    def setSubsetString(self, subsetString: typing.Optional[str]) -> None: ...
+    def subsetString(self) -> str: ...
+    def hasDefinedGeometry(self) -> bool: ...
+    def hasReferencedLayers(self) -> bool: ...
+    def hasSourceLayer(self, name: typing.Optional[str]) -> bool: ...
+    def setFields(self, fields: QgsFields) -> None: ...
+    def fields(self) -> QgsFields: ...
+    def setGeometrySrid(self, srid: int) -> None: ...
+    def geometrySrid(self) -> int: ...
+    def setGeometryWkbType(self, t: Qgis.WkbType) -> None: ...
+    def geometryWkbType(self) -> Qgis.WkbType: ...
+    def setGeometryField(self, geometryField: typing.Optional[str]) -> None: ...
+    def geometryField(self) -> str: ...
+    def isLazy(self) -> bool: ...
+    def setLazy(self, lazy: bool) -> None: ...
+    def setUid(self, uid: typing.Optional[str]) -> None: ...
+    def uid(self) -> str: ...
+    def setFilePath(self, filePath: typing.Optional[str]) -> None: ...
+    def filePath(self) -> str: ...
+    def setQuery(self, query: typing.Optional[str]) -> None: ...
+    def query(self) -> str: ...
+    def sourceLayers(self) -> list['QgsVirtualLayerDefinition.SourceLayer']: ...
+    @typing.overload
+    def addSource(self, name: typing.Optional[str], ref: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def addSource(self, name: typing.Optional[str], source: typing.Optional[str], provider: typing.Optional[str], encoding: typing.Optional[str] = ...) -> None: ...
+    def toString(self) -> str: ...
+    def toUrl(self) -> QtCore.QUrl: ...
+    @staticmethod
+    def fromUrl(url: QtCore.QUrl) -> 'QgsVirtualLayerDefinition': ...
+
+
+class QgsZipUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsZipUtils') -> None: ...
+
+    @staticmethod
+    def files(zip: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def zip(zip: typing.Optional[str], files: collections.abc.Iterable[typing.Optional[str]], overwrite: bool = ...) -> bool: ...
+    @staticmethod
+    def unzip(zip: typing.Optional[str], dir: typing.Optional[str], checkConsistency: bool = ...) -> typing.Tuple[bool, list[str]]: ...
+    @staticmethod
+    def isZipFile(filename: typing.Optional[str]) -> bool: ...
+
+
+GEOCRS_ID = ... # type: int
+GEOSRID = ... # type: int
+GEO_EPSG_CRS_ID = ... # type: int
+
+
+def stringToSymbolLayerReferenceList(a0: typing.Optional[str]) -> list[QgsSymbolLayerReference]: ...
+def symbolLayerReferenceListToString(a0: collections.abc.Iterable[QgsSymbolLayerReference]) -> str: ...
+def compareWkt(a: typing.Optional[str], b: typing.Optional[str], tolerance: float = ...) -> bool: ...
+@deprecated("""""")
+def qgsVsiPrefix(path: typing.Optional[str]) -> str: ...
+def qgsVariantGreaterThan(lhs: typing.Any, rhs: typing.Any) -> bool: ...
+def qgsVariantEqual(lhs: typing.Any, rhs: typing.Any) -> bool: ...
+def qgsVariantLessThan(lhs: typing.Any, rhs: typing.Any) -> bool: ...
+def qgsVariantCompare(lhs: typing.Any, rhs: typing.Any) -> int: ...
+def qgsPermissiveToLongLong(string: typing.Optional[str]) -> typing.Tuple[int, bool]: ...
+def qgsPermissiveToInt(string: typing.Optional[str]) -> typing.Tuple[int, bool]: ...
+def qgsPermissiveToDouble(string: typing.Optional[str]) -> typing.Tuple[float, bool]: ...
+def qgsRound(number: float, places: int) -> float: ...
+def qgsDoubleNearSig(a: float, b: float, significantDigits: int = ...) -> bool: ...
+def qgsFloatNear(a: float, b: float, epsilon: float = ...) -> bool: ...
+def qgsDoubleNear(a: float, b: float, epsilon: float = ...) -> bool: ...
+def qgsNanCompatibleEquals(a: float, b: float) -> bool: ...
+def qgsDoubleToString(a: float, precision: int = ...) -> str: ...
+@typing.overload
+def qHash(variant: typing.Any) -> int: ...
+@typing.overload
+def qHash(id: typing.Union[QgsPointCloudNodeId, QgsSymbolLayerId]) -> int: ...
+@typing.overload
+def qHash(r: QgsSymbolLayerReference) -> int: ...
@@ -0,0 +1,134 @@
+# The PEP 484 type hints stub file for the _core.actions module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextScope, QgsFeature,
+    QgsVectorLayer,
+)
+
+
+class QgsAction(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, type: Qgis.AttributeActionType, description: typing.Optional[str], command: typing.Optional[str], capture: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, type: Qgis.AttributeActionType, description: typing.Optional[str], action: typing.Optional[str], icon: typing.Optional[str], capture: bool, shortTitle: typing.Optional[str] = ..., actionScopes: collections.abc.Iterable[typing.Optional[str]] = ..., notificationMessage: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, id: QtCore.QUuid, type: Qgis.AttributeActionType, description: typing.Optional[str], action: typing.Optional[str], icon: typing.Optional[str], capture: bool, shortTitle: typing.Optional[str] = ..., actionScopes: collections.abc.Iterable[typing.Optional[str]] = ..., notificationMessage: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAction') -> None: ...
+
+    def setCommand(self, newCommand: typing.Optional[str]) -> None: ...
+    def html(self) -> str: ...
+    def expressionContextScope(self) -> QgsExpressionContextScope: ...
+    def setExpressionContextScope(self, scope: QgsExpressionContextScope) -> None: ...
+    def writeXml(self, actionsNode: QtXml.QDomNode) -> None: ...
+    def readXml(self, actionNode: QtXml.QDomNode) -> None: ...
+    def setActionScopes(self, actionScopes: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def actionScopes(self) -> set[str]: ...
+    @typing.overload
+    def run(self, layer: typing.Optional[QgsVectorLayer], feature: QgsFeature, expressionContext: QgsExpressionContext) -> None: ...
+    @typing.overload
+    def run(self, expressionContext: QgsExpressionContext) -> None: ...
+    def runable(self) -> bool: ...
+    def setEnabledOnlyWhenEditable(self, enable: bool) -> None: ...
+    def isEnabledOnlyWhenEditable(self) -> bool: ...
+    def capture(self) -> bool: ...
+    def type(self) -> Qgis.AttributeActionType: ...
+    def notificationMessage(self) -> str: ...
+    def command(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def iconPath(self) -> str: ...
+    def isValid(self) -> bool: ...
+    def id(self) -> QtCore.QUuid: ...
+    def shortTitle(self) -> str: ...
+    def name(self) -> str: ...
+    ActionType: typing.Type[Qgis.AttributeActionType]
+    Generic: Qgis.AttributeActionType
+    GenericPython: Qgis.AttributeActionType
+    Mac: Qgis.AttributeActionType
+    Windows: Qgis.AttributeActionType
+    Unix: Qgis.AttributeActionType
+    OpenUrl: Qgis.AttributeActionType
+    SubmitUrlEncoded: Qgis.AttributeActionType
+    SubmitUrlMultipart: Qgis.AttributeActionType
+
+
+class QgsActionManager(QtCore.QObject):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    def defaultAction(self, actionScope: typing.Optional[str]) -> QgsAction: ...
+    def setDefaultAction(self, actionScope: typing.Optional[str], actionId: QtCore.QUuid) -> None: ...
+    def action(self, id: typing.Optional[typing.Union[QtCore.QUuid, str]]) -> QgsAction: ...
+    def readXml(self, layer_node: QtXml.QDomNode) -> bool: ...
+    def writeXml(self, layer_node: QtXml.QDomNode) -> bool: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def actions(self, actionScope: typing.Optional[str] = ...) -> list[QgsAction]: ...
+    def clearActions(self) -> None: ...
+    def doAction(self, actionId: QtCore.QUuid, feature: QgsFeature, context: QgsExpressionContext) -> None: ...
+    def doActionFeature(self, actionId: QtCore.QUuid, feature: QgsFeature, defaultValueIndex: int = ..., scope: QgsExpressionContextScope = ...) -> None: ...
+    def removeAction(self, actionId: QtCore.QUuid) -> None: ...
+    @typing.overload
+    def addAction(self, type: Qgis.AttributeActionType, name: typing.Optional[str], command: typing.Optional[str], capture: bool = ...) -> QtCore.QUuid: ...
+    @typing.overload
+    def addAction(self, type: Qgis.AttributeActionType, name: typing.Optional[str], command: typing.Optional[str], icon: typing.Optional[str], capture: bool = ...) -> QtCore.QUuid: ...
+    @typing.overload
+    def addAction(self, action: QgsAction) -> None: ...
+
+
+class QgsActionScope(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], title: typing.Optional[str], description: typing.Optional[str], expressionContextScope: QgsExpressionContextScope = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsActionScope') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __hash__(self) -> int: ...
+    def isValid(self) -> bool: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def title(self) -> str: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+    def setExpressionContextScope(self, expressionContextScope: QgsExpressionContextScope) -> None: ...
+    def expressionContextScope(self) -> QgsExpressionContextScope: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsActionScopeRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    actionScopesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def actionScope(self, id: typing.Optional[str]) -> QgsActionScope: ...
+    def unregisterActionScope(self, actionScope: QgsActionScope) -> None: ...
+    def registerActionScope(self, actionScope: QgsActionScope) -> None: ...
+    def actionScopes(self) -> set[QgsActionScope]: ...
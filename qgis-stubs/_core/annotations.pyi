@@ -0,0 +1,651 @@
+# The PEP 484 type hints stub file for the _core.annotations module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFeedback, QgsMargins
+from .callouts import QgsCallout
+from .diagram import QgsMapUnitScale
+from .effects import QgsPaintEffect
+from .geometry import (
+    QgsCurve, QgsCurvePolygon, QgsGeometry, QgsPoint, QgsRectangle,
+    QgsVertexId,
+)
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .project import QgsProject
+from .providers import QgsDataProvider
+from .symbology import (
+    QgsFillSymbol, QgsLineSymbol, QgsMarkerSymbol,
+    QgsStyleEntityVisitorInterface,
+)
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsFeature, QgsMapLayer, QgsMapLayerRenderer, QgsPointXY,
+    QgsReadWriteContext, QgsRenderContext,
+)
+
+
+class QgsRenderedItemDetails(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRenderedItemDetails') -> None: ...
+
+    def setBoundingBox(self, bounds: 'QgsRectangle') -> None: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def layerId(self) -> str: ...
+
+
+class QgsRenderedLayerStatistics(QgsRenderedItemDetails):
+
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], minimum: collections.abc.Iterable[float], maximum: collections.abc.Iterable[float]) -> None: ...
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], minimum: typing.Optional[float] = ..., maximum: typing.Optional[float] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRenderedLayerStatistics') -> None: ...
+
+    @typing.overload
+    def setMaximum(self, maximum: collections.abc.Iterable[float]) -> None: ...
+    @typing.overload
+    def setMaximum(self, index: int, maximum: float) -> bool: ...
+    @typing.overload
+    def setMinimum(self, minimum: collections.abc.Iterable[float]) -> None: ...
+    @typing.overload
+    def setMinimum(self, index: int, minimum: float) -> bool: ...
+    @typing.overload
+    def maximum(self) -> list[float]: ...
+    @typing.overload
+    def maximum(self, index: int) -> float: ...
+    @typing.overload
+    def minimum(self) -> list[float]: ...
+    @typing.overload
+    def minimum(self, index: int) -> float: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsAnnotation(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def copyCommonProperties(self, target: typing.Optional['QgsAnnotation']) -> None: ...
+    def _readXml(self, annotationElem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _writeXml(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def minimumFrameSize(self) -> QtCore.QSizeF: ...
+    def renderAnnotation(self, context: QgsRenderContext, size: QtCore.QSizeF) -> None: ...
+    mapLayerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    moved: typing.ClassVar[QtCore.pyqtSignal]
+    appearanceChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def setAssociatedFeature(self, feature: QgsFeature) -> None: ...
+    def associatedFeature(self) -> QgsFeature: ...
+    def setMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def mapLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def markerSymbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setMarkerSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def readXml(self, itemElem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def render(self, context: QgsRenderContext) -> None: ...
+    def fillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def contentsMargin(self) -> QgsMargins: ...
+    def setContentsMargin(self, margins: QgsMargins) -> None: ...
+    def frameSizeMm(self) -> QtCore.QSizeF: ...
+    def setFrameSizeMm(self, size: QtCore.QSizeF) -> None: ...
+    @deprecated("""""")
+    def frameSize(self) -> QtCore.QSizeF: ...
+    @deprecated("""""")
+    def setFrameSize(self, size: QtCore.QSizeF) -> None: ...
+    def frameOffsetFromReferencePointMm(self) -> QtCore.QPointF: ...
+    def setFrameOffsetFromReferencePointMm(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    @deprecated("""""")
+    def frameOffsetFromReferencePoint(self) -> QtCore.QPointF: ...
+    @deprecated("""""")
+    def setFrameOffsetFromReferencePoint(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setRelativePosition(self, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def relativePosition(self) -> QtCore.QPointF: ...
+    def setMapPositionCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def mapPositionCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setMapPosition(self, position: QgsPointXY) -> None: ...
+    def mapPosition(self) -> QgsPointXY: ...
+    def setHasFixedMapPosition(self, fixed: bool) -> None: ...
+    def hasFixedMapPosition(self) -> bool: ...
+    def setVisible(self, visible: bool) -> None: ...
+    def isVisible(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsAnnotation']: ...
+
+
+class QgsAnnotationItem(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def renderCallout(self, context: QgsRenderContext, rect: QtCore.QRectF, angle: float, calloutContext: 'QgsCallout.QgsCalloutContext', feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def readCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeCommonProperties(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def copyCommonProperties(self, other: typing.Optional['QgsAnnotationItem']) -> None: ...
+    def setOffsetFromCalloutUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetFromCalloutUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetFromCallout(self, offset: QtCore.QSizeF) -> None: ...
+    def offsetFromCallout(self) -> QtCore.QSizeF: ...
+    def setCalloutAnchor(self, anchor: 'QgsGeometry') -> None: ...
+    def calloutAnchor(self) -> 'QgsGeometry': ...
+    def setCallout(self, callout: typing.Optional['QgsCallout']) -> None: ...
+    def callout(self) -> typing.Optional['QgsCallout']: ...
+    def setSymbologyReferenceScale(self, scale: float) -> None: ...
+    def symbologyReferenceScale(self) -> float: ...
+    def setUseSymbologyReferenceScale(self, enabled: bool) -> None: ...
+    def useSymbologyReferenceScale(self) -> bool: ...
+    def nodesV2(self, context: 'QgsAnnotationItemEditContext') -> list['QgsAnnotationItemNode']: ...
+    @deprecated("""""")
+    def nodes(self) -> list['QgsAnnotationItemNode']: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def setZIndex(self, index: int) -> None: ...
+    def zIndex(self) -> int: ...
+    def transientEditResultsV2(self, operation: typing.Optional['QgsAbstractAnnotationItemEditOperation'], context: 'QgsAnnotationItemEditContext') -> typing.Optional['QgsAnnotationItemEditOperationTransientResults']: ...
+    def transientEditResults(self, operation: typing.Optional['QgsAbstractAnnotationItemEditOperation']) -> typing.Optional['QgsAnnotationItemEditOperationTransientResults']: ...
+    def applyEditV2(self, operation: typing.Optional['QgsAbstractAnnotationItemEditOperation'], context: 'QgsAnnotationItemEditContext') -> Qgis.AnnotationItemEditOperationResult: ...
+    @deprecated("""""")
+    def applyEdit(self, operation: typing.Optional['QgsAbstractAnnotationItemEditOperation']) -> Qgis.AnnotationItemEditOperationResult: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    @typing.overload
+    def boundingBox(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self, context: QgsRenderContext) -> 'QgsRectangle': ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsAnnotationItem']: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+
+
+class QgsAnnotationItemEditContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditContext') -> None: ...
+
+    def setRenderContext(self, context: QgsRenderContext) -> None: ...
+    def renderContext(self) -> QgsRenderContext: ...
+    def setCurrentItemBounds(self, bounds: 'QgsRectangle') -> None: ...
+    def currentItemBounds(self) -> 'QgsRectangle': ...
+
+
+class QgsAbstractAnnotationItemEditOperation(PyQt5.sip.wrapper):
+
+    class Type(int):
+        MoveNode = ... # type: QgsAbstractAnnotationItemEditOperation.Type
+        DeleteNode = ... # type: QgsAbstractAnnotationItemEditOperation.Type
+        AddNode = ... # type: QgsAbstractAnnotationItemEditOperation.Type
+        TranslateItem = ... # type: QgsAbstractAnnotationItemEditOperation.Type
+
+    @typing.overload
+    def __init__(self, itemId: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractAnnotationItemEditOperation') -> None: ...
+
+    def itemId(self) -> str: ...
+    def type(self) -> 'QgsAbstractAnnotationItemEditOperation.Type': ...
+
+
+class QgsAnnotationItemEditOperationMoveNode(QgsAbstractAnnotationItemEditOperation):
+
+    @typing.overload
+    def __init__(self, itemId: typing.Optional[str], nodeId: 'QgsVertexId', before: 'QgsPoint', after: 'QgsPoint', translatePixelsX: float = ..., translatePixelsY: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditOperationMoveNode') -> None: ...
+
+    def translationYPixels(self) -> float: ...
+    def translationXPixels(self) -> float: ...
+    def after(self) -> 'QgsPoint': ...
+    def before(self) -> 'QgsPoint': ...
+    def nodeId(self) -> 'QgsVertexId': ...
+    def type(self) -> QgsAbstractAnnotationItemEditOperation.Type: ...
+
+
+class QgsAnnotationItemEditOperationDeleteNode(QgsAbstractAnnotationItemEditOperation):
+
+    @typing.overload
+    def __init__(self, itemId: typing.Optional[str], nodeId: 'QgsVertexId', before: 'QgsPoint') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditOperationDeleteNode') -> None: ...
+
+    def before(self) -> 'QgsPoint': ...
+    def nodeId(self) -> 'QgsVertexId': ...
+    def type(self) -> QgsAbstractAnnotationItemEditOperation.Type: ...
+
+
+class QgsAnnotationItemEditOperationAddNode(QgsAbstractAnnotationItemEditOperation):
+
+    @typing.overload
+    def __init__(self, itemId: typing.Optional[str], point: 'QgsPoint') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditOperationAddNode') -> None: ...
+
+    def point(self) -> 'QgsPoint': ...
+    def type(self) -> QgsAbstractAnnotationItemEditOperation.Type: ...
+
+
+class QgsAnnotationItemEditOperationTranslateItem(QgsAbstractAnnotationItemEditOperation):
+
+    @typing.overload
+    def __init__(self, itemId: typing.Optional[str], translateX: float, translateY: float, translatePixelsX: float = ..., translatePixelsY: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditOperationTranslateItem') -> None: ...
+
+    def translationYPixels(self) -> float: ...
+    def translationXPixels(self) -> float: ...
+    def translationY(self) -> float: ...
+    def translationX(self) -> float: ...
+    def nodeId(self) -> 'QgsVertexId': ...
+    def type(self) -> QgsAbstractAnnotationItemEditOperation.Type: ...
+
+
+class QgsAnnotationItemEditOperationTransientResults(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, representativeGeometry: 'QgsGeometry') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemEditOperationTransientResults') -> None: ...
+
+    def representativeGeometry(self) -> 'QgsGeometry': ...
+
+
+class QgsAnnotationItemNode(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, id: 'QgsVertexId', point: QgsPointXY, type: Qgis.AnnotationItemNodeType, cursor: QtCore.Qt.CursorShape = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemNode') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def setCursor(self, shape: QtCore.Qt.CursorShape) -> None: ...
+    def cursor(self) -> QtCore.Qt.CursorShape: ...
+    def setType(self, type: Qgis.AnnotationItemNodeType) -> None: ...
+    def type(self) -> Qgis.AnnotationItemNodeType: ...
+    def setPoint(self, point: QgsPointXY) -> None: ...
+    def point(self) -> QgsPointXY: ...
+    def id(self) -> 'QgsVertexId': ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsAnnotationItemAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: typing.Optional[str], visibleName: typing.Optional[str], visiblePluralName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAnnotationItemAbstractMetadata') -> None: ...
+
+    def createItem(self) -> typing.Optional[QgsAnnotationItem]: ...
+    def visiblePluralName(self) -> str: ...
+    def visibleName(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsAnnotationItemRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    typeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def itemTypes(self) -> dict[str, str]: ...
+    def createItem(self, type: typing.Optional[str]) -> typing.Optional[QgsAnnotationItem]: ...
+    def addItemType(self, metadata: typing.Optional[QgsAnnotationItemAbstractMetadata]) -> bool: ...
+    def itemMetadata(self, type: typing.Optional[str]) -> typing.Optional[QgsAnnotationItemAbstractMetadata]: ...
+    def populate(self) -> bool: ...
+
+
+class QgsAnnotationLayer(QgsMapLayer):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAnnotationLayer.LayerOptions') -> None: ...
+
+    def __init__(self, name: typing.Optional[str], options: 'QgsAnnotationLayer.LayerOptions') -> None: ...
+
+    def setLinkedVisibilityLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def linkedVisibilityLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def setPaintEffect(self, effect: typing.Optional['QgsPaintEffect']) -> None: ...
+    def paintEffect(self) -> typing.Optional['QgsPaintEffect']: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def htmlMetadata(self) -> str: ...
+    def dataProvider(self) -> typing.Optional['QgsDataProvider']: ...
+    def supportsEditing(self) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory]) -> bool: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory]) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], a3: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def readXml(self, layerNode: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def extent(self) -> 'QgsRectangle': ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def clone(self) -> typing.Optional['QgsAnnotationLayer']: ...
+    def properties(self) -> Qgis.MapLayerProperties: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    @deprecated("""""")
+    def applyEdit(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation]) -> Qgis.AnnotationItemEditOperationResult: ...
+    def itemsInBounds(self, bounds: 'QgsRectangle', context: QgsRenderContext, feedback: typing.Optional[QgsFeedback] = ...) -> list[str]: ...
+    def item(self, id: typing.Optional[str]) -> typing.Optional[QgsAnnotationItem]: ...
+    def items(self) -> typing.Any: ...
+    def isEmpty(self) -> bool: ...
+    def clear(self) -> None: ...
+    def removeItem(self, id: typing.Optional[str]) -> bool: ...
+    def replaceItem(self, id: typing.Optional[str], item: typing.Optional[QgsAnnotationItem]) -> None: ...
+    def addItem(self, item: typing.Optional[QgsAnnotationItem]) -> str: ...
+    def reset(self) -> None: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsAnnotationLineItem(QgsAnnotationItem):
+
+    def __init__(self, curve: typing.Optional['QgsCurve']) -> None: ...
+
+    def setSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setGeometry(self, geometry: typing.Optional['QgsCurve']) -> None: ...
+    def geometry(self) -> typing.Optional['QgsCurve']: ...
+    def clone(self) -> typing.Optional['QgsAnnotationLineItem']: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationLineItem']: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def type(self) -> str: ...
+
+
+class QgsAnnotationLineTextItem(QgsAnnotationItem):
+
+    def __init__(self, text: typing.Optional[str], curve: typing.Optional['QgsCurve']) -> None: ...
+
+    def offsetFromLineMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetFromLineMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetFromLineUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetFromLineUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setOffsetFromLine(self, distance: float) -> None: ...
+    def offsetFromLine(self) -> float: ...
+    def setFormat(self, format: 'QgsTextFormat') -> None: ...
+    def format(self) -> 'QgsTextFormat': ...
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+    def setGeometry(self, geometry: typing.Optional['QgsCurve']) -> None: ...
+    def geometry(self) -> typing.Optional['QgsCurve']: ...
+    def clone(self) -> typing.Optional['QgsAnnotationLineTextItem']: ...
+    @typing.overload
+    def boundingBox(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self, context: QgsRenderContext) -> 'QgsRectangle': ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationLineTextItem']: ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+
+
+class QgsAnnotationMarkerItem(QgsAnnotationItem):
+
+    def __init__(self, point: 'QgsPoint') -> None: ...
+
+    def setSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setGeometry(self, geometry: 'QgsPoint') -> None: ...
+    def geometry(self) -> QgsPointXY: ...
+    @typing.overload
+    def boundingBox(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self, context: QgsRenderContext) -> 'QgsRectangle': ...
+    def clone(self) -> typing.Optional['QgsAnnotationMarkerItem']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationMarkerItem']: ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def type(self) -> str: ...
+
+
+class QgsAnnotationManager(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+
+    annotationAboutToBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    annotationRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    annotationAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def cloneAnnotations(self) -> list[QgsAnnotation]: ...
+    def annotations(self) -> list[QgsAnnotation]: ...
+    def clear(self) -> None: ...
+    def removeAnnotation(self, annotation: typing.Optional[QgsAnnotation]) -> bool: ...
+    def addAnnotation(self, annotation: typing.Optional[QgsAnnotation]) -> bool: ...
+
+
+class QgsAnnotationRectItem(QgsAnnotationItem):
+
+    def __init__(self, bounds: 'QgsRectangle') -> None: ...
+
+    def renderInBounds(self, context: QgsRenderContext, painterRect: QtCore.QRectF, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def readCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeCommonProperties(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def copyCommonProperties(self, other: typing.Optional[QgsAnnotationItem]) -> None: ...
+    def setFrameSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def frameSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setFrameEnabled(self, enabled: bool) -> None: ...
+    def frameEnabled(self) -> bool: ...
+    def setBackgroundSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def backgroundSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setBackgroundEnabled(self, enabled: bool) -> None: ...
+    def backgroundEnabled(self) -> bool: ...
+    def setFixedSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def fixedSizeUnit(self) -> Qgis.RenderUnit: ...
+    def setFixedSize(self, size: QtCore.QSizeF) -> None: ...
+    def fixedSize(self) -> QtCore.QSizeF: ...
+    def setPlacementMode(self, mode: Qgis.AnnotationPlacementMode) -> None: ...
+    def placementMode(self) -> Qgis.AnnotationPlacementMode: ...
+    def setBounds(self, bounds: 'QgsRectangle') -> None: ...
+    def bounds(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self, context: QgsRenderContext) -> 'QgsRectangle': ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+
+
+class QgsAnnotationPictureItem(QgsAnnotationRectItem):
+
+    def __init__(self, format: Qgis.PictureFormat, path: typing.Optional[str], bounds: 'QgsRectangle') -> None: ...
+
+    def renderInBounds(self, context: QgsRenderContext, painterBounds: QtCore.QRectF, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def setLockAspectRatio(self, locked: bool) -> None: ...
+    def lockAspectRatio(self) -> bool: ...
+    def setPath(self, format: Qgis.PictureFormat, path: typing.Optional[str]) -> None: ...
+    def format(self) -> Qgis.PictureFormat: ...
+    def path(self) -> str: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationPictureItem']: ...
+    def clone(self) -> typing.Optional['QgsAnnotationPictureItem']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def type(self) -> str: ...
+
+
+class QgsAnnotationPointTextItem(QgsAnnotationItem):
+
+    def __init__(self, text: typing.Optional[str], point: QgsPointXY) -> None: ...
+
+    def setRotationMode(self, mode: Qgis.SymbolRotationMode) -> None: ...
+    def rotationMode(self) -> Qgis.SymbolRotationMode: ...
+    def setAlignment(self, alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> None: ...
+    def alignment(self) -> QtCore.Qt.Alignment: ...
+    def setAngle(self, angle: float) -> None: ...
+    def angle(self) -> float: ...
+    def setFormat(self, format: 'QgsTextFormat') -> None: ...
+    def format(self) -> 'QgsTextFormat': ...
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+    def setPoint(self, point: QgsPointXY) -> None: ...
+    def point(self) -> QgsPointXY: ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    @typing.overload
+    def boundingBox(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def boundingBox(self, context: QgsRenderContext) -> 'QgsRectangle': ...
+    def clone(self) -> typing.Optional['QgsAnnotationPointTextItem']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationPointTextItem']: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+
+
+class QgsAnnotationPolygonItem(QgsAnnotationItem):
+
+    def __init__(self, polygon: typing.Optional['QgsCurvePolygon']) -> None: ...
+
+    def setSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setGeometry(self, geometry: typing.Optional['QgsCurvePolygon']) -> None: ...
+    def geometry(self) -> typing.Optional['QgsCurvePolygon']: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def clone(self) -> typing.Optional['QgsAnnotationPolygonItem']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationPolygonItem']: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+    def transientEditResultsV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> typing.Optional[QgsAnnotationItemEditOperationTransientResults]: ...
+    def applyEditV2(self, operation: typing.Optional[QgsAbstractAnnotationItemEditOperation], context: QgsAnnotationItemEditContext) -> Qgis.AnnotationItemEditOperationResult: ...
+    def nodesV2(self, context: QgsAnnotationItemEditContext) -> list[QgsAnnotationItemNode]: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def render(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def type(self) -> str: ...
+
+
+class QgsAnnotationRectangleTextItem(QgsAnnotationRectItem):
+
+    def __init__(self, text: typing.Optional[str], bounds: 'QgsRectangle') -> None: ...
+
+    def renderInBounds(self, context: QgsRenderContext, painterBounds: QtCore.QRectF, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def marginsUnit(self) -> Qgis.RenderUnit: ...
+    def setMarginsUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setMargins(self, margins: QgsMargins) -> None: ...
+    def margins(self) -> QgsMargins: ...
+    def setAlignment(self, alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> None: ...
+    def alignment(self) -> QtCore.Qt.Alignment: ...
+    def setFormat(self, format: 'QgsTextFormat') -> None: ...
+    def format(self) -> 'QgsTextFormat': ...
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsAnnotationRectangleTextItem']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsAnnotationRectangleTextItem']: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def flags(self) -> Qgis.AnnotationItemFlags: ...
+    def type(self) -> str: ...
+
+
+class QgsHtmlAnnotation(QgsAnnotation):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def renderAnnotation(self, context: QgsRenderContext, size: QtCore.QSizeF) -> None: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsHtmlAnnotation']: ...
+    def setAssociatedFeature(self, feature: QgsFeature) -> None: ...
+    def readXml(self, itemElem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def htmlSource(self) -> str: ...
+    def setHtmlSource(self, htmlSource: typing.Optional[str]) -> None: ...
+    def sourceFile(self) -> str: ...
+    def setSourceFile(self, htmlFile: typing.Optional[str]) -> None: ...
+    def minimumFrameSize(self) -> QtCore.QSizeF: ...
+    def clone(self) -> typing.Optional['QgsHtmlAnnotation']: ...
+
+
+class QgsRenderedAnnotationItemDetails(QgsRenderedItemDetails):
+
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], itemId: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRenderedAnnotationItemDetails') -> None: ...
+
+    def itemId(self) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsSvgAnnotation(QgsAnnotation):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def renderAnnotation(self, context: QgsRenderContext, size: QtCore.QSizeF) -> None: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsSvgAnnotation']: ...
+    def filePath(self) -> str: ...
+    def setFilePath(self, file: typing.Optional[str]) -> None: ...
+    def readXml(self, itemElem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsSvgAnnotation']: ...
+
+
+class QgsTextAnnotation(QgsAnnotation):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def renderAnnotation(self, context: QgsRenderContext, size: QtCore.QSizeF) -> None: ...
+    @staticmethod
+    def create() -> typing.Optional['QgsTextAnnotation']: ...
+    def readXml(self, itemElem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def setDocument(self, doc: typing.Optional[QtGui.QTextDocument]) -> None: ...
+    def document(self) -> typing.Optional[QtGui.QTextDocument]: ...
+    def clone(self) -> typing.Optional['QgsTextAnnotation']: ...
@@ -0,0 +1,617 @@
+# The PEP 484 type hints stub file for the _core.auth module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+
+
+class QgsAuthCertUtils(PyQt5.sip.wrapper):
+
+    class ConstraintGroup(int):
+        KeyUsage = ... # type: QgsAuthCertUtils.ConstraintGroup
+        ExtendedKeyUsage = ... # type: QgsAuthCertUtils.ConstraintGroup
+
+    class CertUsageType(int):
+        UndeterminedUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        AnyOrUnspecifiedUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        CertAuthorityUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        CertIssuerUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        TlsServerUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        TlsServerEvUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        TlsClientUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        CodeSigningUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        EmailProtectionUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        TimeStampingUsage = ... # type: QgsAuthCertUtils.CertUsageType
+        CRLSigningUsage = ... # type: QgsAuthCertUtils.CertUsageType
+
+    class CertTrustPolicy(int):
+        DefaultTrust = ... # type: QgsAuthCertUtils.CertTrustPolicy
+        Trusted = ... # type: QgsAuthCertUtils.CertTrustPolicy
+        Untrusted = ... # type: QgsAuthCertUtils.CertTrustPolicy
+        NoPolicy = ... # type: QgsAuthCertUtils.CertTrustPolicy
+
+    class CaCertSource(int):
+        SystemRoot = ... # type: QgsAuthCertUtils.CaCertSource
+        FromFile = ... # type: QgsAuthCertUtils.CaCertSource
+        InDatabase = ... # type: QgsAuthCertUtils.CaCertSource
+        Connection = ... # type: QgsAuthCertUtils.CaCertSource
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAuthCertUtils') -> None: ...
+
+    @staticmethod
+    def validatePKIBundle(bundle: 'QgsPkiBundle', useIntermediates: bool = ..., trustRootCa: bool = ...) -> list[str]: ...
+    @staticmethod
+    def validateCertChain(certificateChain: collections.abc.Iterable[QtNetwork.QSslCertificate], hostName: typing.Optional[str] = ..., trustRootCa: bool = ...) -> list[QtNetwork.QSslError]: ...
+    @staticmethod
+    def certIsViable(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certViabilityErrors(cert: QtNetwork.QSslCertificate) -> list[QtNetwork.QSslError]: ...
+    @staticmethod
+    def certIsCurrent(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def sslErrorEnumString(errenum: QtNetwork.QSslError.SslError) -> str: ...
+    @staticmethod
+    def certificateIsSslClient(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certificateIsSslServer(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certificateIsAuthorityOrIssuer(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certificateIsIssuer(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certificateIsAuthority(cert: QtNetwork.QSslCertificate) -> bool: ...
+    @staticmethod
+    def certificateUsageTypes(cert: QtNetwork.QSslCertificate) -> list['QgsAuthCertUtils.CertUsageType']: ...
+    @staticmethod
+    def shaHexForCert(cert: QtNetwork.QSslCertificate, formatted: bool = ...) -> str: ...
+    @staticmethod
+    def getColonDelimited(txt: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def getCertTrustName(trust: 'QgsAuthCertUtils.CertTrustPolicy') -> str: ...
+    @staticmethod
+    def resolvedCertName(cert: QtNetwork.QSslCertificate, issuer: bool = ...) -> str: ...
+    @staticmethod
+    def getCaSourceName(source: 'QgsAuthCertUtils.CaCertSource', single: bool = ...) -> str: ...
+    @staticmethod
+    def pemTextToTempFile(name: typing.Optional[str], pemtext: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> str: ...
+    @staticmethod
+    def certsToPemText(certs: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> QtCore.QByteArray: ...
+    @staticmethod
+    def pkcs12BundleCas(bundlepath: typing.Optional[str], bundlepass: typing.Optional[str] = ...) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def pkcs12BundleToPem(bundlepath: typing.Optional[str], bundlepass: typing.Optional[str] = ..., reencrypt: bool = ...) -> list[str]: ...
+    @staticmethod
+    def pemIsPkcs8(keyPemTxt: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def certKeyBundleToPem(certpath: typing.Optional[str], keypath: typing.Optional[str], keypass: typing.Optional[str] = ..., reencrypt: bool = ...) -> list[str]: ...
+    @staticmethod
+    def casRemoveSelfSigned(caList: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def certsFromString(pemtext: typing.Optional[str]) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def keyFromFile(keypath: typing.Optional[str], keypass: typing.Optional[str] = ..., algtype: typing.Optional[typing.Optional[str]] = ...) -> QtNetwork.QSslKey: ...
+    @staticmethod
+    def casMerge(bundle1: collections.abc.Iterable[QtNetwork.QSslCertificate], bundle2: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def certFromFile(certpath: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    @staticmethod
+    def casFromFile(certspath: typing.Optional[str]) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def certsFromFile(certspath: typing.Optional[str]) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def fileData(path: typing.Optional[str]) -> QtCore.QByteArray: ...
+    @staticmethod
+    def mapDigestToSslConfigs(configs: collections.abc.Iterable['QgsAuthConfigSslServer']) -> dict[str, 'QgsAuthConfigSslServer']: ...
+    @staticmethod
+    def mapDigestToCerts(certs: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> dict[str, QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def getSslProtocolName(protocol: QtNetwork.QSsl.SslProtocol) -> str: ...
+
+
+class QgsAuthMethodConfig(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, method: typing.Optional[str] = ..., version: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAuthMethodConfig') -> None: ...
+
+    def readXml(self, element: QtXml.QDomElement) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    @staticmethod
+    def uriToResource(accessurl: typing.Optional[str], resource: typing.Optional[typing.Optional[str]], withpath: bool = ...) -> bool: ...
+    def clearConfigMap(self) -> None: ...
+    def hasConfig(self, key: typing.Optional[str]) -> bool: ...
+    def configList(self, key: typing.Optional[str]) -> list[str]: ...
+    def config(self, key: typing.Optional[str], defaultvalue: typing.Optional[str] = ...) -> str: ...
+    def removeConfig(self, key: typing.Optional[str]) -> int: ...
+    def setConfigList(self, key: typing.Optional[str], value: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setConfig(self, key: typing.Optional[str], value: typing.Optional[str]) -> None: ...
+    def setConfigMap(self, map: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def configMap(self) -> dict[str, str]: ...
+    def loadConfigString(self, configstr: typing.Optional[str]) -> None: ...
+    def configString(self) -> str: ...
+    def isValid(self, validateid: bool = ...) -> bool: ...
+    def setVersion(self, version: int) -> None: ...
+    def version(self) -> int: ...
+    def setMethod(self, method: typing.Optional[str]) -> None: ...
+    def method(self) -> str: ...
+    def setUri(self, uri: typing.Optional[str]) -> None: ...
+    def uri(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsPkiBundle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, clientCert: QtNetwork.QSslCertificate = ..., clientKey: QtNetwork.QSslKey = ..., caChain: collections.abc.Iterable[QtNetwork.QSslCertificate] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPkiBundle') -> None: ...
+
+    def setCaChain(self, cachain: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> None: ...
+    def caChain(self) -> list[QtNetwork.QSslCertificate]: ...
+    def setClientKey(self, certkey: QtNetwork.QSslKey) -> None: ...
+    def clientKey(self) -> QtNetwork.QSslKey: ...
+    def setClientCert(self, cert: QtNetwork.QSslCertificate) -> None: ...
+    def clientCert(self) -> QtNetwork.QSslCertificate: ...
+    def certId(self) -> str: ...
+    def isValid(self) -> bool: ...
+    def isNull(self) -> bool: ...
+    @staticmethod
+    def fromPkcs12Paths(bundlepath: typing.Optional[str], bundlepass: typing.Optional[str] = ...) -> 'QgsPkiBundle': ...
+    @staticmethod
+    def fromPemPaths(certPath: typing.Optional[str], keyPath: typing.Optional[str], keyPass: typing.Optional[str] = ..., caChain: collections.abc.Iterable[QtNetwork.QSslCertificate] = ...) -> 'QgsPkiBundle': ...
+
+
+class QgsPkiConfigBundle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, config: QgsAuthMethodConfig, cert: QtNetwork.QSslCertificate, certkey: QtNetwork.QSslKey, cachain: collections.abc.Iterable[QtNetwork.QSslCertificate] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPkiConfigBundle') -> None: ...
+
+    def setCaChain(self, caChain: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> None: ...
+    def caChain(self) -> list[QtNetwork.QSslCertificate]: ...
+    def setClientCertKey(self, certkey: QtNetwork.QSslKey) -> None: ...
+    def clientCertKey(self) -> QtNetwork.QSslKey: ...
+    def setClientCert(self, cert: QtNetwork.QSslCertificate) -> None: ...
+    def clientCert(self) -> QtNetwork.QSslCertificate: ...
+    def setConfig(self, config: QgsAuthMethodConfig) -> None: ...
+    def config(self) -> QgsAuthMethodConfig: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsAuthConfigSslServer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAuthConfigSslServer') -> None: ...
+
+    def isNull(self) -> bool: ...
+    def loadConfigString(self, config: typing.Optional[str] = ...) -> None: ...
+    def configString(self) -> str: ...
+    def setQtVersion(self, version: int) -> None: ...
+    def qtVersion(self) -> int: ...
+    def setVersion(self, version: int) -> None: ...
+    def version(self) -> int: ...
+    def setSslPeerVerifyDepth(self, depth: int) -> None: ...
+    def sslPeerVerifyDepth(self) -> int: ...
+    def setSslPeerVerifyMode(self, mode: QtNetwork.QSslSocket.PeerVerifyMode) -> None: ...
+    def sslPeerVerifyMode(self) -> QtNetwork.QSslSocket.PeerVerifyMode: ...
+    def setSslIgnoredErrorEnums(self, errors: typing.Any) -> None: ...
+    def sslIgnoredErrorEnums(self) -> typing.Any: ...
+    def sslIgnoredErrors(self) -> list[QtNetwork.QSslError]: ...
+    def setSslProtocol(self, protocol: QtNetwork.QSsl.SslProtocol) -> None: ...
+    def sslProtocol(self) -> QtNetwork.QSsl.SslProtocol: ...
+    def setSslHostPort(self, hostport: typing.Optional[str]) -> None: ...
+    def sslHostPort(self) -> str: ...
+    def setSslCertificate(self, cert: QtNetwork.QSslCertificate) -> None: ...
+    def sslCertificate(self) -> QtNetwork.QSslCertificate: ...
+
+
+class QgsAuthConfigurationStorage(QtCore.QObject):
+
+    class MasterPasswordConfig(PyQt5.sip.wrapper):
+
+        civ = ... # type: typing.Optional[str]
+        hash = ... # type: typing.Optional[str]
+        salt = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAuthConfigurationStorage.MasterPasswordConfig') -> None: ...
+
+    class SettingParameter(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        type = ... # type: QtCore.QVariant.Type
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAuthConfigurationStorage.SettingParameter') -> None: ...
+
+    def __init__(self, settings: dict[typing.Optional[str], typing.Any]) -> None: ...
+
+    def loggerTag(self) -> str: ...
+    def setError(self, error: typing.Optional[str], level: Qgis.MessageLevel = ...) -> None: ...
+    def setCapabilities(self, capabilities: typing.Union[Qgis.AuthConfigurationStorageCapabilities, Qgis.AuthConfigurationStorageCapability]) -> None: ...
+    sslCertTrustPolicyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    sslCertCustomConfigChanged: typing.ClassVar[QtCore.pyqtSignal]
+    certAuthorityChanged: typing.ClassVar[QtCore.pyqtSignal]
+    certIdentityChanged: typing.ClassVar[QtCore.pyqtSignal]
+    readOnlyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    authSettingsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    masterPasswordChanged: typing.ClassVar[QtCore.pyqtSignal]
+    methodConfigChanged: typing.ClassVar[QtCore.pyqtSignal]
+    storageChanged: typing.ClassVar[QtCore.pyqtSignal]
+    messageLog: typing.ClassVar[QtCore.pyqtSignal]
+    def clearMethodConfigs(self) -> bool: ...
+    def erase(self) -> bool: ...
+    def clearMasterPasswords(self) -> bool: ...
+    def storeMasterPassword(self, config: 'QgsAuthConfigurationStorage.MasterPasswordConfig') -> bool: ...
+    def masterPasswords(self) -> list['QgsAuthConfigurationStorage.MasterPasswordConfig']: ...
+    def certTrustPolicyExists(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def removeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def loadCertTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> QgsAuthCertUtils.CertTrustPolicy: ...
+    def storeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate, policy: QgsAuthCertUtils.CertTrustPolicy) -> bool: ...
+    def caCerts(self) -> list[QtNetwork.QSslCertificate]: ...
+    def caCertsPolicy(self) -> dict[str, QgsAuthCertUtils.CertTrustPolicy]: ...
+    def removeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def certAuthorityExists(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def loadCertAuthority(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    def certAuthorityIds(self) -> list[str]: ...
+    def storeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def removeSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def sslCertCustomConfigExists(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def sslCertCustomConfigIds(self) -> list[str]: ...
+    def sslCertCustomConfigs(self) -> list[QgsAuthConfigSslServer]: ...
+    def loadSslCertCustomConfigByHost(self, hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def loadSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def storeSslCertCustomConfig(self, config: QgsAuthConfigSslServer) -> bool: ...
+    def certIdentityExists(self, id: typing.Optional[str]) -> bool: ...
+    def certIdentityIds(self) -> list[str]: ...
+    def certIdentities(self) -> list[QtNetwork.QSslCertificate]: ...
+    def loadCertIdentityBundle(self, id: typing.Optional[str]) -> tuple[QtNetwork.QSslCertificate, str]: ...
+    def loadCertIdentity(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    @typing.overload
+    def removeCertIdentity(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    @typing.overload
+    def removeCertIdentity(self, id: typing.Optional[str]) -> bool: ...
+    def storeCertIdentity(self, cert: QtNetwork.QSslCertificate, keyPem: typing.Optional[str]) -> bool: ...
+    def authSettingExists(self, key: typing.Optional[str]) -> bool: ...
+    def removeAuthSetting(self, key: typing.Optional[str]) -> bool: ...
+    def loadAuthSetting(self, key: typing.Optional[str]) -> str: ...
+    def storeAuthSetting(self, key: typing.Optional[str], value: typing.Optional[str]) -> bool: ...
+    def methodConfigExists(self, id: typing.Optional[str]) -> bool: ...
+    def removeMethodConfig(self, id: typing.Optional[str]) -> bool: ...
+    def storeMethodConfig(self, config: QgsAuthMethodConfig, payload: typing.Optional[str]) -> bool: ...
+    def loadMethodConfig(self, id: typing.Optional[str], full: bool = ...) -> typing.Tuple[QgsAuthMethodConfig, str]: ...
+    def authMethodConfigsWithPayload(self) -> dict[str, QgsAuthMethodConfig]: ...
+    def authMethodConfigs(self, allowedMethods: collections.abc.Iterable[typing.Optional[str]] = ...) -> dict[str, QgsAuthMethodConfig]: ...
+    def isReadOnly(self) -> bool: ...
+    def setReadOnly(self, readOnly: bool) -> None: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def isEncrypted(self) -> bool: ...
+    def settingsParameters(self) -> list['QgsAuthConfigurationStorage.SettingParameter']: ...
+    def settings(self) -> dict[str, typing.Any]: ...
+    def capabilities(self) -> Qgis.AuthConfigurationStorageCapabilities: ...
+    def isReady(self) -> bool: ...
+    def lastError(self) -> str: ...
+    def initialize(self) -> bool: ...
+    def id(self) -> str: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsAuthConfigurationStorageRegistry(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    storageRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    storageChanged: typing.ClassVar[QtCore.pyqtSignal]
+    storageAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def setStorageOrder(self, orderIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def storage(self, id: typing.Optional[str]) -> typing.Optional[QgsAuthConfigurationStorage]: ...
+    def firstReadyStorageWithCapability(self, capability: Qgis.AuthConfigurationStorageCapability) -> typing.Optional[QgsAuthConfigurationStorage]: ...
+    def readyStoragesWithCapability(self, capability: Qgis.AuthConfigurationStorageCapability) -> list[QgsAuthConfigurationStorage]: ...
+    def readyStorages(self) -> list[QgsAuthConfigurationStorage]: ...
+    def storages(self) -> list[QgsAuthConfigurationStorage]: ...
+    def removeStorage(self, id: typing.Optional[str]) -> bool: ...
+    def addStorage(self, storage: typing.Optional[QgsAuthConfigurationStorage]) -> bool: ...
+
+
+class QgsAuthManager(QtCore.QObject):
+
+    class MessageLevel(int):
+        INFO = ... # type: QgsAuthManager.MessageLevel
+        WARNING = ... # type: QgsAuthManager.MessageLevel
+        CRITICAL = ... # type: QgsAuthManager.MessageLevel
+
+    AUTH_MAN_TAG = ... # type: typing.Optional[str]
+    AUTH_PASSWORD_HELPER_DISPLAY_NAME = ... # type: typing.Optional[str]
+
+    def __init__(self) -> None: ...
+
+    def clearCachedConfig(self, authcfg: typing.Optional[str]) -> None: ...
+    def clearAllCachedConfigs(self) -> None: ...
+    authDatabaseChanged: typing.ClassVar[QtCore.pyqtSignal]
+    authDatabaseEraseRequested: typing.ClassVar[QtCore.pyqtSignal]
+    masterPasswordVerified: typing.ClassVar[QtCore.pyqtSignal]
+    passwordHelperMessageLog: typing.ClassVar[QtCore.pyqtSignal]
+    passwordHelperMessageOut: typing.ClassVar[QtCore.pyqtSignal]
+    messageLog: typing.ClassVar[QtCore.pyqtSignal]
+    messageOut: typing.ClassVar[QtCore.pyqtSignal]
+    passwordHelperSuccess: typing.ClassVar[QtCore.pyqtSignal]
+    passwordHelperFailure: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def passwordHelperDisplayName(titleCase: bool = ...) -> str: ...
+    def passwordHelperSync(self) -> bool: ...
+    def setPasswordHelperEnabled(self, enabled: bool) -> None: ...
+    @staticmethod
+    def passwordHelperEnabled() -> bool: ...
+    def trustedCaCertsPemText(self) -> QtCore.QByteArray: ...
+    def trustedCaCertsCache(self) -> list[QtNetwork.QSslCertificate]: ...
+    def rebuildTrustedCaCertsCache(self) -> bool: ...
+    def untrustedCaCerts(self, trustedCAs: collections.abc.Iterable[QtNetwork.QSslCertificate] = ...) -> list[QtNetwork.QSslCertificate]: ...
+    def trustedCaCerts(self, includeinvalid: bool = ...) -> list[QtNetwork.QSslCertificate]: ...
+    def rebuildCertTrustCache(self) -> bool: ...
+    def certTrustCache(self) -> dict[QgsAuthCertUtils.CertTrustPolicy, list[str]]: ...
+    def defaultCertTrustPolicy(self) -> QgsAuthCertUtils.CertTrustPolicy: ...
+    def setDefaultCertTrustPolicy(self, policy: QgsAuthCertUtils.CertTrustPolicy) -> bool: ...
+    def certificateTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> QgsAuthCertUtils.CertTrustPolicy: ...
+    def removeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def removeCertTrustPolicies(self, certs: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> bool: ...
+    def certTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> QgsAuthCertUtils.CertTrustPolicy: ...
+    def storeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate, policy: QgsAuthCertUtils.CertTrustPolicy) -> bool: ...
+    def rebuildCaCertsCache(self) -> bool: ...
+    def mappedDatabaseCAs(self) -> dict[str, QtNetwork.QSslCertificate]: ...
+    def databaseCAs(self) -> list[QtNetwork.QSslCertificate]: ...
+    def extraFileCAs(self) -> list[QtNetwork.QSslCertificate]: ...
+    @staticmethod
+    def systemRootCAs() -> list[QtNetwork.QSslCertificate]: ...
+    def removeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def existsCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def certAuthority(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    def storeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def storeCertAuthorities(self, certs: collections.abc.Iterable[QtNetwork.QSslCertificate]) -> bool: ...
+    def rebuildIgnoredSslErrorCache(self) -> bool: ...
+    def updateIgnoredSslErrorsCache(self, shahostport: typing.Optional[str], errors: collections.abc.Iterable[QtNetwork.QSslError]) -> bool: ...
+    def updateIgnoredSslErrorsCacheFromConfig(self, config: QgsAuthConfigSslServer) -> bool: ...
+    def dumpIgnoredSslErrorsCache_(self) -> None: ...
+    def removeSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def existsSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def sslCertCustomConfigs(self) -> list[QgsAuthConfigSslServer]: ...
+    def sslCertCustomConfigByHost(self, hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def sslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def storeSslCertCustomConfig(self, config: QgsAuthConfigSslServer) -> bool: ...
+    def removeCertIdentity(self, id: typing.Optional[str]) -> bool: ...
+    def existsCertIdentity(self, id: typing.Optional[str]) -> bool: ...
+    def certIdentityIds(self) -> list[str]: ...
+    def certIdentities(self) -> list[QtNetwork.QSslCertificate]: ...
+    def certIdentityBundleToPem(self, id: typing.Optional[str]) -> list[str]: ...
+    def certIdentity(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    def storeCertIdentity(self, cert: QtNetwork.QSslCertificate, key: QtNetwork.QSslKey) -> bool: ...
+    def initSslCaches(self) -> bool: ...
+    def removeAuthSetting(self, key: typing.Optional[str]) -> bool: ...
+    def existsAuthSetting(self, key: typing.Optional[str]) -> bool: ...
+    def authSetting(self, key: typing.Optional[str], defaultValue: typing.Any = ..., decrypt: bool = ...) -> typing.Any: ...
+    def storeAuthSetting(self, key: typing.Optional[str], value: typing.Any, encrypt: bool = ...) -> bool: ...
+    def updateNetworkProxy(self, proxy: QtNetwork.QNetworkProxy, authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> typing.Tuple[bool, QtNetwork.QNetworkProxy]: ...
+    def updateDataSourceUriItems(self, connectionItems: collections.abc.Iterable[typing.Optional[str]], authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> typing.Tuple[bool, list[str]]: ...
+    def updateNetworkReply(self, reply: typing.Optional[QtNetwork.QNetworkReply], authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> bool: ...
+    def updateNetworkRequest(self, request: QtNetwork.QNetworkRequest, authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> typing.Tuple[bool, QtNetwork.QNetworkRequest]: ...
+    def eraseAuthenticationDatabase(self, backup: bool, backuppath: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def backupAuthenticationDatabase(self, backuppath: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def removeAllAuthenticationConfigs(self) -> bool: ...
+    def importAuthenticationConfigsFromXml(self, filename: typing.Optional[str], password: typing.Optional[str] = ..., overwrite: bool = ...) -> bool: ...
+    def exportAuthenticationConfigsToXml(self, filename: typing.Optional[str], authcfgs: collections.abc.Iterable[typing.Optional[str]], password: typing.Optional[str] = ...) -> bool: ...
+    def removeAuthenticationConfig(self, authcfg: typing.Optional[str]) -> bool: ...
+    def loadAuthenticationConfig(self, authcfg: typing.Optional[str], mconfig: QgsAuthMethodConfig, full: bool = ...) -> typing.Tuple[bool, QgsAuthMethodConfig]: ...
+    def updateAuthenticationConfig(self, config: QgsAuthMethodConfig) -> bool: ...
+    def storeAuthenticationConfig(self, mconfig: QgsAuthMethodConfig, overwrite: bool = ...) -> typing.Tuple[bool, QgsAuthMethodConfig]: ...
+    def configIds(self) -> list[str]: ...
+    def configIdRegex(self) -> str: ...
+    @staticmethod
+    def hasConfigId(txt: typing.Optional[str]) -> bool: ...
+    def configIdUnique(self, id: typing.Optional[str]) -> bool: ...
+    def uniqueConfigId(self) -> str: ...
+    def supportedAuthMethodExpansions(self, authcfg: typing.Optional[str]) -> 'QgsAuthMethod.Expansions': ...
+    def authMethodEditWidget(self, authMethodKey: typing.Optional[str], parent: typing.Optional[QtWidgets.QWidget]) -> typing.Optional[QtWidgets.QWidget]: ...
+    def authMethod(self, authMethodKey: typing.Optional[str]) -> typing.Optional['QgsAuthMethod']: ...
+    def authMethodsKeys(self, dataprovider: typing.Optional[str] = ...) -> list[str]: ...
+    def configAuthMethodKey(self, authcfg: typing.Optional[str]) -> str: ...
+    def configAuthMethod(self, authcfg: typing.Optional[str]) -> typing.Optional['QgsAuthMethod']: ...
+    def updateConfigAuthMethods(self) -> None: ...
+    def availableAuthMethodConfigs(self, dataprovider: typing.Optional[str] = ...) -> dict[str, QgsAuthMethodConfig]: ...
+    def registerCoreAuthMethods(self) -> bool: ...
+    def authManTag(self) -> str: ...
+    def setScheduledAuthDatabaseEraseRequestEmitted(self, emitted: bool) -> None: ...
+    def resetMasterPassword(self, newpass: typing.Optional[str], oldpass: typing.Optional[str], keepbackup: bool, backuppath: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def masterPasswordSame(self, password: typing.Optional[str]) -> bool: ...
+    def clearMasterPassword(self) -> None: ...
+    def masterPasswordHashInDatabase(self) -> bool: ...
+    def masterPasswordIsSet(self) -> bool: ...
+    def verifyMasterPassword(self, compare: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setMasterPassword(self, verify: bool = ...) -> bool: ...
+    @typing.overload
+    def setMasterPassword(self, password: typing.Optional[str], verify: bool = ...) -> bool: ...
+    def authenticationDatabaseUriStripped(self) -> str: ...
+    def authenticationDatabaseUri(self) -> str: ...
+    @staticmethod
+    def isFilesystemBasedDatabase(uri: typing.Optional[str]) -> bool: ...
+    def authenticationDatabasePath(self) -> str: ...
+    def disabledMessage(self) -> str: ...
+    def isDisabled(self) -> bool: ...
+    @deprecated("""""")
+    def authDatabaseServersTable(self) -> str: ...
+    def methodConfigTableName(self) -> str: ...
+    @deprecated("""""")
+    def authDatabaseConfigTable(self) -> str: ...
+    @deprecated("""""")
+    def authDatabaseConnection(self) -> QtSql.QSqlDatabase: ...
+    def authConfigurationStorageRegistry(self) -> typing.Optional[QgsAuthConfigurationStorageRegistry]: ...
+    def ensureInitialized(self) -> bool: ...
+    def setup(self, pluginPath: typing.Optional[str] = ..., authDatabasePath: typing.Optional[str] = ...) -> None: ...
+    @deprecated("""""")
+    def init(self, pluginPath: typing.Optional[str] = ..., authDatabasePath: typing.Optional[str] = ...) -> bool: ...
+
+
+class QgsAuthMethod(QtCore.QObject):
+
+    class Expansion(int):
+        NetworkRequest = ... # type: QgsAuthMethod.Expansion
+        NetworkReply = ... # type: QgsAuthMethod.Expansion
+        DataSourceUri = ... # type: QgsAuthMethod.Expansion
+        GenericDataSourceUri = ... # type: QgsAuthMethod.Expansion
+        NetworkProxy = ... # type: QgsAuthMethod.Expansion
+        All = ... # type: QgsAuthMethod.Expansion
+
+    class Expansions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __xor__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __ior__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __or__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __iand__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __and__(self, f: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> 'QgsAuthMethod.Expansions': ...
+        def __invert__(self) -> 'QgsAuthMethod.Expansions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self) -> None: ...
+
+    def setDataProviders(self, dataproviders: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setExpansions(self, expansions: typing.Union['QgsAuthMethod.Expansions', 'QgsAuthMethod.Expansion']) -> None: ...
+    def setVersion(self, version: int) -> None: ...
+    @staticmethod
+    def authMethodTag() -> str: ...
+    def updateMethodConfig(self, mconfig: QgsAuthMethodConfig) -> None: ...
+    def clearCachedConfig(self, authcfg: typing.Optional[str]) -> None: ...
+    def updateNetworkProxy(self, proxy: QtNetwork.QNetworkProxy, authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> bool: ...
+    def updateDataSourceUriItems(self, connectionItems: collections.abc.Iterable[typing.Optional[str]], authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> bool: ...
+    def updateNetworkReply(self, reply: typing.Optional[QtNetwork.QNetworkReply], authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> bool: ...
+    def updateNetworkRequest(self, request: QtNetwork.QNetworkRequest, authcfg: typing.Optional[str], dataprovider: typing.Optional[str] = ...) -> bool: ...
+    def supportedDataProviders(self) -> list[str]: ...
+    def supportedExpansions(self) -> 'QgsAuthMethod.Expansions': ...
+    def editWidget(self, parent: typing.Optional[QtWidgets.QWidget]) -> typing.Optional[QtWidgets.QWidget]: ...
+    def version(self) -> int: ...
+    def displayDescription(self) -> str: ...
+    def description(self) -> str: ...
+    def key(self) -> str: ...
+
+
+class QgsAuthConfigurationStorageDb(QgsAuthConfigurationStorage):
+
+    @typing.overload
+    def __init__(self, settings: dict[typing.Optional[str], typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str]) -> None: ...
+
+    def checkCapabilities(self) -> None: ...
+    def createCertTables(self) -> bool: ...
+    def createConfigTables(self) -> bool: ...
+    def authDbTransactionQuery(self, query: typing.Optional[QtSql.QSqlQuery]) -> bool: ...
+    def authDbQuery(self, query: typing.Optional[QtSql.QSqlQuery], sql: typing.Optional[str] = ...) -> bool: ...
+    def authDbOpen(self) -> bool: ...
+    def quotedQualifiedIdentifier(self, identifier: typing.Optional[str], isIndex: bool = ...) -> str: ...
+    def tableExists(self, table: typing.Optional[str]) -> bool: ...
+    def masterPasswordTableName(self) -> str: ...
+    def certTrustPolicyTableName(self) -> str: ...
+    def sslCertCustomConfigTableName(self) -> str: ...
+    def certAuthorityTableName(self) -> str: ...
+    def certIdentityTableName(self) -> str: ...
+    def authSettingsTableName(self) -> str: ...
+    def methodConfigTableName(self) -> str: ...
+    def clearMasterPasswords(self) -> bool: ...
+    def storeMasterPassword(self, config: QgsAuthConfigurationStorage.MasterPasswordConfig) -> bool: ...
+    def masterPasswords(self) -> list[QgsAuthConfigurationStorage.MasterPasswordConfig]: ...
+    def certTrustPolicyExists(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def removeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def loadCertTrustPolicy(self, cert: QtNetwork.QSslCertificate) -> QgsAuthCertUtils.CertTrustPolicy: ...
+    def storeCertTrustPolicy(self, cert: QtNetwork.QSslCertificate, policy: QgsAuthCertUtils.CertTrustPolicy) -> bool: ...
+    def caCerts(self) -> list[QtNetwork.QSslCertificate]: ...
+    def caCertsPolicy(self) -> dict[str, QgsAuthCertUtils.CertTrustPolicy]: ...
+    def removeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def certAuthorityExists(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def loadCertAuthority(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    def certAuthorityIds(self) -> list[str]: ...
+    def storeCertAuthority(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    def removeSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def sslCertCustomConfigExists(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> bool: ...
+    def sslCertCustomConfigs(self) -> list[QgsAuthConfigSslServer]: ...
+    def loadSslCertCustomConfigByHost(self, hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def loadSslCertCustomConfig(self, id: typing.Optional[str], hostport: typing.Optional[str]) -> QgsAuthConfigSslServer: ...
+    def sslCertCustomConfigIds(self) -> list[str]: ...
+    def storeSslCertCustomConfig(self, config: QgsAuthConfigSslServer) -> bool: ...
+    def certIdentityExists(self, id: typing.Optional[str]) -> bool: ...
+    def certIdentityIds(self) -> list[str]: ...
+    def certIdentities(self) -> list[QtNetwork.QSslCertificate]: ...
+    def loadCertIdentityBundle(self, id: typing.Optional[str]) -> tuple[QtNetwork.QSslCertificate, str]: ...
+    def loadCertIdentity(self, id: typing.Optional[str]) -> QtNetwork.QSslCertificate: ...
+    @typing.overload
+    def removeCertIdentity(self, cert: QtNetwork.QSslCertificate) -> bool: ...
+    @typing.overload
+    def removeCertIdentity(self, id: typing.Optional[str]) -> bool: ...
+    def storeCertIdentity(self, cert: QtNetwork.QSslCertificate, keyPem: typing.Optional[str]) -> bool: ...
+    def settingsParameters(self) -> list[QgsAuthConfigurationStorage.SettingParameter]: ...
+    def initialize(self) -> bool: ...
+    def isReady(self) -> bool: ...
+    def erase(self) -> bool: ...
+    def clearMethodConfigs(self) -> bool: ...
+    def authSettingExists(self, key: typing.Optional[str]) -> bool: ...
+    def removeAuthSetting(self, key: typing.Optional[str]) -> bool: ...
+    def loadAuthSetting(self, key: typing.Optional[str]) -> str: ...
+    def storeAuthSetting(self, key: typing.Optional[str], value: typing.Optional[str]) -> bool: ...
+    def methodConfigExists(self, id: typing.Optional[str]) -> bool: ...
+    def removeMethodConfig(self, id: typing.Optional[str]) -> bool: ...
+    def storeMethodConfig(self, mconfig: QgsAuthMethodConfig, payload: typing.Optional[str]) -> bool: ...
+    def loadMethodConfig(self, id: typing.Optional[str], full: bool = ...) -> typing.Tuple[QgsAuthMethodConfig, str]: ...
+    def authMethodConfigsWithPayload(self) -> dict[str, QgsAuthMethodConfig]: ...
+    def authMethodConfigs(self, allowedMethods: collections.abc.Iterable[typing.Optional[str]] = ...) -> dict[str, QgsAuthMethodConfig]: ...
+    def id(self) -> str: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
+    def name(self) -> str: ...
+    def authDatabaseConnection(self) -> QtSql.QSqlDatabase: ...
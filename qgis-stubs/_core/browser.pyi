@@ -0,0 +1,622 @@
+# The PEP 484 type hints stub file for the _core.browser module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsField, QgsPathResolver
+from .layertree import QgsLayerTreeNode
+from .mesh import QgsMeshLayer
+from .metadata import QgsLayerMetadata
+from .proj import QgsCoordinateReferenceSystem
+from .project import QgsProject
+from .providers import QgsAbstractDatabaseProviderConnection
+from .raster import QgsRasterLayer
+from .vector import QgsFieldDomain, QgsMapLayer, QgsRelation, QgsVectorLayer
+
+
+class QgsMimeDataUtils(PyQt5.sip.wrapper):
+
+    class Uri(PyQt5.sip.wrapper):
+
+        filePath = ... # type: typing.Optional[str]
+        layerId = ... # type: typing.Optional[str]
+        layerType = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        pId = ... # type: typing.Optional[str]
+        providerKey = ... # type: typing.Optional[str]
+        supportedCrs = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        supportedFormats = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        uri = ... # type: typing.Optional[str]
+        wkbType = ... # type: Qgis.WkbType
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, encData: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMimeDataUtils.Uri') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def mapLayer(self) -> typing.Optional[QgsMapLayer]: ...
+        def meshLayer(self, error: typing.Optional[str]) -> typing.Tuple[typing.Optional['QgsMeshLayer'], bool]: ...
+        def rasterLayer(self, error: typing.Optional[str]) -> typing.Tuple[typing.Optional['QgsRasterLayer'], bool]: ...
+        def vectorLayer(self, error: typing.Optional[str]) -> typing.Tuple[typing.Optional[QgsVectorLayer], bool]: ...
+        def data(self) -> str: ...
+        def isValid(self) -> bool: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMimeDataUtils') -> None: ...
+
+    @staticmethod
+    def hasOriginatedFromCurrentAppInstance(uri: 'QgsMimeDataUtils.Uri') -> bool: ...
+    @staticmethod
+    def layerTreeNodesToUriList(nodes: collections.abc.Iterable['QgsLayerTreeNode']) -> QtCore.QByteArray: ...
+    @staticmethod
+    def decodeUriList(data: typing.Optional[QtCore.QMimeData]) -> list['QgsMimeDataUtils.Uri']: ...
+    @staticmethod
+    def isUriList(data: typing.Optional[QtCore.QMimeData]) -> bool: ...
+    @staticmethod
+    def encodeUriList(layers: collections.abc.Iterable['QgsMimeDataUtils.Uri']) -> typing.Optional[QtCore.QMimeData]: ...
+
+
+class QgsWeakRelation(PyQt5.sip.wrapper):
+
+    class WeakRelationType(int):
+        Referencing = ... # type: QgsWeakRelation.WeakRelationType
+        Referenced = ... # type: QgsWeakRelation.WeakRelationType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, relationId: typing.Optional[str], relationName: typing.Optional[str], strength: Qgis.RelationshipStrength, referencingLayerId: typing.Optional[str], referencingLayerName: typing.Optional[str], referencingLayerSource: typing.Optional[str], referencingLayerProviderKey: typing.Optional[str], referencedLayerId: typing.Optional[str], referencedLayerName: typing.Optional[str], referencedLayerSource: typing.Optional[str], referencedLayerProviderKey: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsWeakRelation') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def writeXml(layer: typing.Optional[QgsVectorLayer], type: 'QgsWeakRelation.WeakRelationType', relation: QgsRelation, node: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    @staticmethod
+    def readXml(layer: typing.Optional[QgsVectorLayer], type: 'QgsWeakRelation.WeakRelationType', node: QtXml.QDomNode, resolver: QgsPathResolver) -> 'QgsWeakRelation': ...
+    def setRelatedTableType(self, type: typing.Optional[str]) -> None: ...
+    def relatedTableType(self) -> str: ...
+    def setBackwardPathLabel(self, label: typing.Optional[str]) -> None: ...
+    def setForwardPathLabel(self, label: typing.Optional[str]) -> None: ...
+    def backwardPathLabel(self) -> str: ...
+    def forwardPathLabel(self) -> str: ...
+    def setCardinality(self, cardinality: Qgis.RelationshipCardinality) -> None: ...
+    def cardinality(self) -> Qgis.RelationshipCardinality: ...
+    def strength(self) -> Qgis.RelationshipStrength: ...
+    def setMappingReferencedLayerFields(self, fields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def mappingReferencedLayerFields(self) -> list[str]: ...
+    def setReferencedLayerFields(self, fields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def referencedLayerFields(self) -> list[str]: ...
+    def setMappingReferencingLayerFields(self, fields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def mappingReferencingLayerFields(self) -> list[str]: ...
+    def setReferencingLayerFields(self, fields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def referencingLayerFields(self) -> list[str]: ...
+    def setMappingTable(self, sourceUri: typing.Optional[str], provider: typing.Optional[str]) -> None: ...
+    def mappingTableName(self) -> str: ...
+    def mappingTableProvider(self) -> str: ...
+    def mappingTableSource(self) -> str: ...
+    def setReferencedLayer(self, sourceUri: typing.Optional[str], provider: typing.Optional[str]) -> None: ...
+    def referencedLayerName(self) -> str: ...
+    def referencedLayerProvider(self) -> str: ...
+    def referencedLayerSource(self) -> str: ...
+    def setReferencingLayer(self, sourceUri: typing.Optional[str], provider: typing.Optional[str]) -> None: ...
+    def referencingLayerName(self) -> str: ...
+    def referencingLayerProvider(self) -> str: ...
+    def referencingLayerSource(self) -> str: ...
+    def name(self) -> str: ...
+    def id(self) -> str: ...
+    def resolvedRelations(self, project: typing.Optional['QgsProject']) -> list[QgsRelation]: ...
+
+
+class QgsBrowserModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        Path = ... # type: QgsBrowserModel.CustomRole
+        Comment = ... # type: QgsBrowserModel.CustomRole
+        Sort = ... # type: QgsBrowserModel.CustomRole
+        ProviderKey = ... # type: QgsBrowserModel.CustomRole
+        LayerMetadata = ... # type: QgsBrowserModel.CustomRole
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def removeRootItems(self) -> None: ...
+    def addRootItems(self) -> None: ...
+    def initialize(self) -> None: ...
+    def hidePath(self, item: typing.Optional['QgsDataItem']) -> None: ...
+    def updateProjectHome(self) -> None: ...
+    def removeFavorite(self, index: QtCore.QModelIndex) -> None: ...
+    def addFavoriteDirectory(self, directory: typing.Optional[str], name: typing.Optional[str] = ...) -> None: ...
+    def itemStateChanged(self, item: typing.Optional['QgsDataItem'], oldState: Qgis.BrowserItemState) -> None: ...
+    def itemDataChanged(self, item: typing.Optional['QgsDataItem']) -> None: ...
+    def endRemoveItems(self) -> None: ...
+    def beginRemoveItems(self, parent: typing.Optional['QgsDataItem'], first: int, last: int) -> None: ...
+    def endInsertItems(self) -> None: ...
+    def beginInsertItems(self, parent: typing.Optional['QgsDataItem'], first: int, last: int) -> None: ...
+    def refreshDrives(self) -> None: ...
+    def reload(self) -> None: ...
+    connectionsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    stateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def rootItems(self) -> list['QgsDataItem']: ...
+    def driveItems(self) -> typing.Any: ...
+    def initialized(self) -> bool: ...
+    @deprecated("""""")
+    def connectItem(self, item: typing.Optional['QgsDataItem']) -> None: ...
+    def findUri(self, uri: typing.Optional[str], index: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def findPath(self, path: typing.Optional[str], matchFlag: QtCore.Qt.MatchFlag = ...) -> QtCore.QModelIndex: ...
+    @typing.overload
+    def refresh(self, path: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def refresh(self, index: QtCore.QModelIndex = ...) -> None: ...
+    def dataItem(self, idx: QtCore.QModelIndex) -> typing.Optional['QgsDataItem']: ...
+    def findItem(self, item: typing.Optional['QgsDataItem'], parent: typing.Optional['QgsDataItem'] = ...) -> QtCore.QModelIndex: ...
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None: ...
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool: ...
+    def hasChildren(self, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def dropMimeData(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction, row: int, column: int, parent: QtCore.QModelIndex) -> bool: ...
+    def mimeData(self, indexes: collections.abc.Iterable[QtCore.QModelIndex]) -> typing.Optional[QtCore.QMimeData]: ...
+    def mimeTypes(self) -> list[str]: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    ItemDataRole: typing.Type[QgsBrowserModel.CustomRole]
+    PathRole: QgsBrowserModel.CustomRole
+    CommentRole: QgsBrowserModel.CustomRole
+    SortRole: QgsBrowserModel.CustomRole
+    ProviderKeyRole: QgsBrowserModel.CustomRole
+    LayerMetadataRole: QgsBrowserModel.CustomRole
+
+
+class QgsBrowserProxyModel(QtCore.QSortFilterProxyModel):
+
+    class FilterSyntax(int):
+        Normal = ... # type: QgsBrowserProxyModel.FilterSyntax
+        Wildcards = ... # type: QgsBrowserProxyModel.FilterSyntax
+        RegularExpression = ... # type: QgsBrowserProxyModel.FilterSyntax
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def hasChildren(self, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+    def setShowLayers(self, showLayers: bool) -> None: ...
+    def showLayers(self) -> bool: ...
+    def setShownDataItemProviderKeyFilter(self, shownItemsFilter: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setHiddenDataItemProviderKeyFilter(self, hiddenItemsFilter: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setLayerType(self, type: Qgis.LayerType) -> None: ...
+    def layerType(self) -> Qgis.LayerType: ...
+    def setFilterByLayerType(self, enabled: bool) -> None: ...
+    def filterByLayerType(self) -> bool: ...
+    def caseSensitivity(self) -> QtCore.Qt.CaseSensitivity: ...
+    def setFilterCaseSensitivity(self, sensitivity: QtCore.Qt.CaseSensitivity) -> None: ...
+    def filterString(self) -> str: ...
+    def setFilterString(self, filter: typing.Optional[str]) -> None: ...
+    def filterSyntax(self) -> 'QgsBrowserProxyModel.FilterSyntax': ...
+    def setFilterSyntax(self, syntax: 'QgsBrowserProxyModel.FilterSyntax') -> None: ...
+    def dataItem(self, index: QtCore.QModelIndex) -> typing.Optional['QgsDataItem']: ...
+    def browserModel(self) -> typing.Optional[QgsBrowserModel]: ...
+    def setBrowserModel(self, model: typing.Optional[QgsBrowserModel]) -> None: ...
+
+
+class QgsDataItem(QtCore.QObject):
+
+    def __init__(self, type: Qgis.BrowserItemType, parent: typing.Optional['QgsDataItem'], name: typing.Optional[str], path: typing.Optional[str], providerKey: typing.Optional[str] = ...) -> None: ...
+
+    def updateIcon(self) -> None: ...
+    connectionsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    stateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    dataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    endRemoveItems: typing.ClassVar[QtCore.pyqtSignal]
+    beginRemoveItems: typing.ClassVar[QtCore.pyqtSignal]
+    endInsertItems: typing.ClassVar[QtCore.pyqtSignal]
+    beginInsertItems: typing.ClassVar[QtCore.pyqtSignal]
+    def childrenCreated(self) -> None: ...
+    def refreshConnections(self, providerKey: typing.Optional[str] = ...) -> None: ...
+    def depopulate(self) -> None: ...
+    def deferredDelete(self) -> bool: ...
+    @typing.overload
+    def refresh(self, children: collections.abc.Iterable['QgsDataItem']) -> None: ...
+    @typing.overload
+    def refresh(self) -> None: ...
+    @typing.overload
+    def populate(self, children: collections.abc.Iterable['QgsDataItem']) -> None: ...
+    @typing.overload
+    def populate(self, foreground: bool = ...) -> None: ...
+    def databaseConnection(self) -> typing.Optional['QgsAbstractDatabaseProviderConnection']: ...
+    def moveToThread(self, targetThread: typing.Optional[QtCore.QThread]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def deleteLater(items: collections.abc.Iterable['QgsDataItem']) -> None: ...
+    @typing.overload
+    def deleteLater(self) -> None: ...
+    def toolTip(self) -> str: ...
+    def setToolTip(self, msg: typing.Optional[str]) -> None: ...
+    def setIconName(self, iconName: typing.Optional[str]) -> None: ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def setSortKey(self, key: typing.Any) -> None: ...
+    def sortKey(self) -> typing.Any: ...
+    @staticmethod
+    def pathComponent(component: typing.Optional[str]) -> str: ...
+    def setProviderKey(self, value: typing.Optional[str]) -> None: ...
+    def providerKey(self) -> str: ...
+    def setPath(self, path: typing.Optional[str]) -> None: ...
+    def path(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def children(self) -> list['QgsDataItem']: ...
+    def setParent(self, parent: typing.Optional['QgsDataItem']) -> None: ...
+    def parent(self) -> typing.Optional['QgsDataItem']: ...
+    def type(self) -> Qgis.BrowserItemType: ...
+    @staticmethod
+    def findItem(items: collections.abc.Iterable['QgsDataItem'], item: typing.Optional['QgsDataItem']) -> int: ...
+    @deprecated("""""")
+    def setCapabilities(self, capabilities: int) -> None: ...
+    def setCapabilitiesV2(self, capabilities: typing.Union[Qgis.BrowserItemCapabilities, Qgis.BrowserItemCapability]) -> None: ...
+    def capabilities2(self) -> Qgis.BrowserItemCapabilities: ...
+    @deprecated("""""")
+    def rename(self, name: typing.Optional[str]) -> bool: ...
+    @deprecated("""""")
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> bool: ...
+    def mimeUris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    @deprecated("""""")
+    def mimeUri(self) -> QgsMimeDataUtils.Uri: ...
+    def hasDragEnabled(self) -> bool: ...
+    def handleDoubleClick(self) -> bool: ...
+    @deprecated("""""")
+    def handleDrop(self, a0: typing.Optional[QtCore.QMimeData], a1: QtCore.Qt.DropAction) -> bool: ...
+    @deprecated("""""")
+    def acceptDrop(self) -> bool: ...
+    def menus(self, parent: typing.Optional[QtWidgets.QWidget]) -> list[QtWidgets.QMenu]: ...
+    def actions(self, parent: typing.Optional[QtWidgets.QWidget]) -> list[QtWidgets.QAction]: ...
+    @deprecated("""""")
+    def paramWidget(self) -> typing.Optional[QtWidgets.QWidget]: ...
+    def equal(self, other: typing.Optional['QgsDataItem']) -> bool: ...
+    def removeChildItem(self, child: typing.Optional['QgsDataItem']) -> typing.Optional['QgsDataItem']: ...
+    def deleteChildItem(self, child: typing.Optional['QgsDataItem']) -> None: ...
+    def addChildItem(self, child: typing.Optional['QgsDataItem'], refresh: bool = ...) -> None: ...
+    def setState(self, state: Qgis.BrowserItemState) -> None: ...
+    def state(self) -> Qgis.BrowserItemState: ...
+    def createChildren(self) -> list['QgsDataItem']: ...
+    def rowCount(self) -> int: ...
+    def layerCollection(self) -> bool: ...
+    def hasChildren(self) -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+    Type: typing.Type[Qgis.BrowserItemType]
+    Collection: Qgis.BrowserItemType
+    Directory: Qgis.BrowserItemType
+    Layer: Qgis.BrowserItemType
+    Error: Qgis.BrowserItemType
+    Favorites: Qgis.BrowserItemType
+    Project: Qgis.BrowserItemType
+    Custom: Qgis.BrowserItemType
+    Fields: Qgis.BrowserItemType
+    Field: Qgis.BrowserItemType
+    State: typing.Type[Qgis.BrowserItemState]
+    NotPopulated: Qgis.BrowserItemState
+    Populating: Qgis.BrowserItemState
+    Populated: Qgis.BrowserItemState
+    Capability: typing.Type[Qgis.BrowserItemCapability]
+    NoCapabilities: Qgis.BrowserItemCapability
+    SetCrs: Qgis.BrowserItemCapability
+    Fertile: Qgis.BrowserItemCapability
+    Fast: Qgis.BrowserItemCapability
+    Collapse: Qgis.BrowserItemCapability
+    Rename: Qgis.BrowserItemCapability
+    Delete: Qgis.BrowserItemCapability
+    ItemRepresentsFile: Qgis.BrowserItemCapability
+    RefreshChildrenWhenItemIsRefreshed: Qgis.BrowserItemCapability
+    ReadOnly: Qgis.BrowserItemCapability
+    Capabilities: typing.Type[Qgis.BrowserItemCapabilities]
+
+
+class QgsDataCollectionItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str] = ..., providerKey: typing.Optional[str] = ...) -> None: ...
+
+    @staticmethod
+    def homeDirIcon(fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> QtGui.QIcon: ...
+    @staticmethod
+    def openDirIcon(fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> QtGui.QIcon: ...
+    def databaseConnection(self) -> typing.Optional['QgsAbstractDatabaseProviderConnection']: ...
+    @staticmethod
+    def iconDataCollection() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconDir(fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> QtGui.QIcon: ...
+    def addChild(self, item: typing.Optional[QgsDataItem]) -> None: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsConnectionsRootItem(QgsDataCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str] = ..., providerKey: typing.Optional[str] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsDatabaseSchemaItem(QgsDataCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str] = ..., providerKey: typing.Optional[str] = ...) -> None: ...
+
+    def databaseConnection(self) -> typing.Optional['QgsAbstractDatabaseProviderConnection']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsErrorItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], error: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsDataItemProvider(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDataItemProvider') -> None: ...
+
+    def handlesDirectoryPath(self, path: typing.Optional[str]) -> bool: ...
+    def createDataItems(self, path: typing.Optional[str], parentItem: typing.Optional[QgsDataItem]) -> list[QgsDataItem]: ...
+    def createDataItem(self, path: typing.Optional[str], parentItem: typing.Optional[QgsDataItem]) -> typing.Optional[QgsDataItem]: ...
+    def capabilities(self) -> Qgis.DataItemProviderCapabilities: ...
+    def dataProviderKey(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsDataItemProviderRegistry(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    providerWillBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    providerAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def dataProviderKey(self, dataItemProviderName: typing.Optional[str]) -> str: ...
+    def removeProvider(self, provider: typing.Optional[QgsDataItemProvider]) -> None: ...
+    def addProvider(self, provider: typing.Optional[QgsDataItemProvider]) -> None: ...
+    def provider(self, providerName: typing.Optional[str]) -> typing.Optional[QgsDataItemProvider]: ...
+    def providers(self) -> list[QgsDataItemProvider]: ...
+
+
+class QgsDirectoryItem(QgsDataCollectionItem):
+
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], dirPath: typing.Optional[str], path: typing.Optional[str], providerKey: typing.Optional[str] = ...) -> None: ...
+
+    def directoryChanged(self) -> None: ...
+    def childrenCreated(self) -> None: ...
+    def setMonitoring(self, monitoring: Qgis.BrowserDirectoryMonitoring) -> None: ...
+    def monitoring(self) -> Qgis.BrowserDirectoryMonitoring: ...
+    def isMonitored(self) -> bool: ...
+    @staticmethod
+    def pathShouldByMonitoredByDefault(path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def monitoringForPath(path: typing.Optional[str]) -> Qgis.BrowserDirectoryMonitoring: ...
+    @staticmethod
+    def hiddenPath(path: typing.Optional[str]) -> bool: ...
+    def mimeUris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    def hasDragEnabled(self) -> bool: ...
+    @deprecated("""""")
+    def paramWidget(self) -> typing.Optional[QtWidgets.QWidget]: ...
+    @staticmethod
+    def setCustomColor(directory: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setIconColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def iconColor(self) -> QtGui.QColor: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def equal(self, other: typing.Optional[QgsDataItem]) -> bool: ...
+    def dirPath(self) -> str: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def setState(self, state: Qgis.BrowserItemState) -> None: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsDirectoryParamWidget(QtWidgets.QTreeWidget):
+
+    def __init__(self, path: typing.Optional[str], parent: typing.Optional[QtWidgets.QWidget] = ...) -> None: ...
+
+    def showHideColumn(self) -> None: ...
+    def mousePressEvent(self, event: typing.Optional[QtGui.QMouseEvent]) -> None: ...
+
+
+class QgsFavoritesItem(QgsDataCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str] = ...) -> None: ...
+
+    def sortKey(self) -> typing.Any: ...
+    @staticmethod
+    def iconFavorites() -> QtGui.QIcon: ...
+    def renameFavorite(self, path: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    def removeDirectory(self, item: typing.Optional[QgsDirectoryItem]) -> None: ...
+    def addDirectory(self, directory: typing.Optional[str], name: typing.Optional[str] = ...) -> None: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsFieldDomainsItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], path: typing.Optional[str], connectionUri: typing.Optional[str], providerKey: typing.Optional[str]) -> None: ...
+
+    def connectionUri(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsFieldDomainItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], domain: typing.Optional['QgsFieldDomain']) -> None: ...
+
+    def fieldDomain(self) -> typing.Optional['QgsFieldDomain']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsFieldsItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], path: typing.Optional[str], connectionUri: typing.Optional[str], providerKey: typing.Optional[str], schema: typing.Optional[str], tableName: typing.Optional[str]) -> None: ...
+
+    def canRenameFields(self) -> bool: ...
+    def tableProperty(self) -> typing.Optional['QgsAbstractDatabaseProviderConnection.TableProperty']: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def connectionUri(self) -> str: ...
+    def tableName(self) -> str: ...
+    def schema(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsFieldItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], field: QgsField) -> None: ...
+
+    def equal(self, other: typing.Optional[QgsDataItem]) -> bool: ...
+    def field(self) -> QgsField: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLayerItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str], uri: typing.Optional[str], layerType: Qgis.BrowserLayerType, providerKey: typing.Optional[str]) -> None: ...
+
+    def setLayerMetadata(self, metadata: 'QgsLayerMetadata') -> None: ...
+    def layerMetadata(self) -> 'QgsLayerMetadata': ...
+    def databaseConnection(self) -> typing.Optional['QgsAbstractDatabaseProviderConnection']: ...
+    def layerName(self) -> str: ...
+    @staticmethod
+    def iconPointCloud() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconVectorTile() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconMesh() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconDefault() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconRaster() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconTable() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPolygon() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconLine() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPoint() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconForWkbType(type: Qgis.WkbType) -> QtGui.QIcon: ...
+    @deprecated("""""")
+    def deleteLayer(self) -> bool: ...
+    @staticmethod
+    def iconName(layerType: Qgis.BrowserLayerType) -> str: ...
+    @staticmethod
+    def layerTypeAsString(layerType: Qgis.BrowserLayerType) -> str: ...
+    def comments(self) -> str: ...
+    def supportedFormats(self) -> list[str]: ...
+    def supportedCrs(self) -> list[str]: ...
+    def uri(self) -> str: ...
+    @staticmethod
+    def typeFromMapLayer(layer: typing.Optional[QgsMapLayer]) -> Qgis.BrowserLayerType: ...
+    def mapLayerType(self) -> Qgis.LayerType: ...
+    def mimeUris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    def hasDragEnabled(self) -> bool: ...
+    def equal(self, other: typing.Optional[QgsDataItem]) -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+    LayerType: typing.Type[Qgis.BrowserLayerType]
+    NoType: Qgis.BrowserLayerType
+    Vector: Qgis.BrowserLayerType
+    Raster: Qgis.BrowserLayerType
+    Point: Qgis.BrowserLayerType
+    Line: Qgis.BrowserLayerType
+    Polygon: Qgis.BrowserLayerType
+    TableLayer: Qgis.BrowserLayerType
+    Database: Qgis.BrowserLayerType
+    Table: Qgis.BrowserLayerType
+    Plugin: Qgis.BrowserLayerType
+    Mesh: Qgis.BrowserLayerType
+    VectorTile: Qgis.BrowserLayerType
+    PointCloud: Qgis.BrowserLayerType
+    TiledScene: Qgis.BrowserLayerType
+
+
+class QgsProjectItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str], providerKey: typing.Optional[str] = ...) -> None: ...
+
+    def mimeUris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    def hasDragEnabled(self) -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsRelationshipsItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], path: typing.Optional[str], connectionUri: typing.Optional[str], providerKey: typing.Optional[str], schema: typing.Optional[str] = ..., tableName: typing.Optional[str] = ...) -> None: ...
+
+    def tableName(self) -> str: ...
+    def schema(self) -> str: ...
+    def connectionUri(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsRelationshipItem(QgsDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsDataItem], relation: QgsWeakRelation) -> None: ...
+
+    def relation(self) -> QgsWeakRelation: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsZipItem(QgsDataCollectionItem):
+
+    sProviderNames = ... # type: collections.abc.Iterable[typing.Optional[str]]
+
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsDataItem], name: typing.Optional[str], filePath: typing.Optional[str], path: typing.Optional[str], providerKey: typing.Optional[str] = ...) -> None: ...
+
+    @staticmethod
+    def iconZip() -> QtGui.QIcon: ...
+    @staticmethod
+    def itemFromFilePath(parent: typing.Optional[QgsDataItem], filePath: typing.Optional[str], name: typing.Optional[str], path: typing.Optional[str]) -> typing.Optional[QgsDataItem]: ...
+    @staticmethod
+    def itemFromPath(parent: typing.Optional[QgsDataItem], path: typing.Optional[str], name: typing.Optional[str]) -> typing.Optional[QgsDataItem]: ...
+    @staticmethod
+    @deprecated("""""")
+    def vsiPrefix(uri: typing.Optional[str]) -> str: ...
+    def mimeUris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    def hasDragEnabled(self) -> bool: ...
+    def getZipFileList(self) -> list[str]: ...
+    def createChildren(self) -> list[QgsDataItem]: ...
+    def __repr__(self) -> typing.Any: ...
@@ -0,0 +1,299 @@
+# The PEP 484 type hints stub file for the _core.callouts module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsMargins, QgsPropertyDefinition
+from .diagram import QgsMapUnitScale
+from .geometry import QgsAbstractGeometry, QgsCurve, QgsGeometry, QgsPoint
+from .labeling import QgsCalloutPosition
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransform
+from .symbology import QgsFillSymbol, QgsLineSymbol, QgsMarkerSymbol
+from .vector import (
+    QgsMapLayer, QgsPropertyCollection, QgsReadWriteContext, QgsRenderContext,
+)
+
+
+class QgsCallout(PyQt5.sip.wrapper):
+
+    class LabelAnchorPoint(int):
+        LabelPointOnExterior = ... # type: QgsCallout.LabelAnchorPoint
+        LabelCentroid = ... # type: QgsCallout.LabelAnchorPoint
+        LabelTopLeft = ... # type: QgsCallout.LabelAnchorPoint
+        LabelTopMiddle = ... # type: QgsCallout.LabelAnchorPoint
+        LabelTopRight = ... # type: QgsCallout.LabelAnchorPoint
+        LabelMiddleLeft = ... # type: QgsCallout.LabelAnchorPoint
+        LabelMiddleRight = ... # type: QgsCallout.LabelAnchorPoint
+        LabelBottomLeft = ... # type: QgsCallout.LabelAnchorPoint
+        LabelBottomMiddle = ... # type: QgsCallout.LabelAnchorPoint
+        LabelBottomRight = ... # type: QgsCallout.LabelAnchorPoint
+
+    class AnchorPoint(int):
+        PoleOfInaccessibility = ... # type: QgsCallout.AnchorPoint
+        PointOnExterior = ... # type: QgsCallout.AnchorPoint
+        PointOnSurface = ... # type: QgsCallout.AnchorPoint
+        Centroid = ... # type: QgsCallout.AnchorPoint
+
+    class DrawOrder(int):
+        OrderBelowAllLabels = ... # type: QgsCallout.DrawOrder
+        OrderBelowIndividualLabels = ... # type: QgsCallout.DrawOrder
+
+    class Property(int):
+        MinimumCalloutLength = ... # type: QgsCallout.Property
+        OffsetFromAnchor = ... # type: QgsCallout.Property
+        OffsetFromLabel = ... # type: QgsCallout.Property
+        DrawCalloutToAllParts = ... # type: QgsCallout.Property
+        AnchorPointPosition = ... # type: QgsCallout.Property
+        LabelAnchorPointPosition = ... # type: QgsCallout.Property
+        OriginX = ... # type: QgsCallout.Property
+        OriginY = ... # type: QgsCallout.Property
+        DestinationX = ... # type: QgsCallout.Property
+        DestinationY = ... # type: QgsCallout.Property
+        Curvature = ... # type: QgsCallout.Property
+        Orientation = ... # type: QgsCallout.Property
+        Margins = ... # type: QgsCallout.Property
+        WedgeWidth = ... # type: QgsCallout.Property
+        CornerRadius = ... # type: QgsCallout.Property
+        BlendMode = ... # type: QgsCallout.Property
+
+    class QgsCalloutContext(PyQt5.sip.wrapper):
+
+        allFeaturePartsLabeled = ... # type: bool
+        originalFeatureCrs = ... # type: 'QgsCoordinateReferenceSystem'
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCallout.QgsCalloutContext') -> None: ...
+
+        def positions(self) -> list['QgsCalloutPosition']: ...
+        def addCalloutPosition(self, position: 'QgsCalloutPosition') -> None: ...
+        def originalFeatureToMapTransform(self, renderContext: QgsRenderContext) -> 'QgsCoordinateTransform': ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCallout') -> None: ...
+
+    def calloutLineToPart(self, labelGeometry: 'QgsGeometry', partGeometry: typing.Optional['QgsAbstractGeometry'], context: QgsRenderContext, calloutContext: 'QgsCallout.QgsCalloutContext') -> typing.Tuple['QgsGeometry', bool]: ...
+    def calloutLabelPoint(self, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsCallout.LabelAnchorPoint', context: QgsRenderContext, calloutContext: 'QgsCallout.QgsCalloutContext') -> typing.Tuple['QgsGeometry', bool]: ...
+    @deprecated("""""")
+    def labelAnchorGeometry(self, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsCallout.LabelAnchorPoint') -> 'QgsGeometry': ...
+    def draw(self, context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: 'QgsCallout.QgsCalloutContext') -> None: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    @staticmethod
+    def decodeLabelAnchorPoint(name: typing.Optional[str]) -> typing.Tuple['QgsCallout.LabelAnchorPoint', typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeLabelAnchorPoint(anchor: 'QgsCallout.LabelAnchorPoint') -> str: ...
+    def setLabelAnchorPoint(self, anchor: 'QgsCallout.LabelAnchorPoint') -> None: ...
+    def labelAnchorPoint(self) -> 'QgsCallout.LabelAnchorPoint': ...
+    @staticmethod
+    def decodeAnchorPoint(name: typing.Optional[str]) -> typing.Tuple['QgsCallout.AnchorPoint', typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeAnchorPoint(anchor: 'QgsCallout.AnchorPoint') -> str: ...
+    def setAnchorPoint(self, anchor: 'QgsCallout.AnchorPoint') -> None: ...
+    def anchorPoint(self) -> 'QgsCallout.AnchorPoint': ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def render(self, context: QgsRenderContext, rect: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: 'QgsCallout.QgsCalloutContext') -> None: ...
+    def drawOrder(self) -> 'QgsCallout.DrawOrder': ...
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext) -> None: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def restoreProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def saveProperties(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def readProperties(self, props: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def properties(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsCallout']: ...
+    def type(self) -> str: ...
+    MinimumCalloutLength: QgsCallout.Property
+    OffsetFromAnchor: QgsCallout.Property
+    OffsetFromLabel: QgsCallout.Property
+    DrawCalloutToAllParts: QgsCallout.Property
+    AnchorPointPosition: QgsCallout.Property
+    LabelAnchorPointPosition: QgsCallout.Property
+    OriginX: QgsCallout.Property
+    OriginY: QgsCallout.Property
+    DestinationX: QgsCallout.Property
+    DestinationY: QgsCallout.Property
+    Curvature: QgsCallout.Property
+    Orientation: QgsCallout.Property
+    Margins: QgsCallout.Property
+    WedgeWidth: QgsCallout.Property
+    CornerRadius: QgsCallout.Property
+    BlendMode: QgsCallout.Property
+
+
+class QgsSimpleLineCallout(QgsCallout):
+
+    def __init__(self) -> None: ...
+
+    def createCalloutLine(self, start: 'QgsPoint', end: 'QgsPoint', context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: QgsCallout.QgsCalloutContext) -> typing.Optional['QgsCurve']: ...
+    def draw(self, context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: QgsCallout.QgsCalloutContext) -> None: ...
+    def setDrawCalloutToAllParts(self, drawToAllParts: bool) -> None: ...
+    def drawCalloutToAllParts(self) -> bool: ...
+    def offsetFromLabelMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetFromLabelMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetFromLabelUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetFromLabelUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setOffsetFromLabel(self, distance: float) -> None: ...
+    def offsetFromLabel(self) -> float: ...
+    def offsetFromAnchorMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetFromAnchorMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetFromAnchorUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetFromAnchorUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setOffsetFromAnchor(self, distance: float) -> None: ...
+    def offsetFromAnchor(self) -> float: ...
+    def minimumLengthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMinimumLengthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def minimumLengthUnit(self) -> Qgis.RenderUnit: ...
+    def setMinimumLengthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setMinimumLength(self, length: float) -> None: ...
+    def minimumLength(self) -> float: ...
+    def setLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def lineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext) -> None: ...
+    def readProperties(self, props: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def properties(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsSimpleLineCallout']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ..., context: QgsReadWriteContext = ...) -> typing.Optional[QgsCallout]: ...
+
+
+class QgsManhattanLineCallout(QgsSimpleLineCallout):
+
+    def __init__(self) -> None: ...
+
+    def createCalloutLine(self, start: 'QgsPoint', end: 'QgsPoint', context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: QgsCallout.QgsCalloutContext) -> typing.Optional['QgsCurve']: ...
+    def clone(self) -> typing.Optional['QgsManhattanLineCallout']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ..., context: QgsReadWriteContext = ...) -> typing.Optional[QgsCallout]: ...
+
+
+class QgsCurvedLineCallout(QgsSimpleLineCallout):
+
+    class Orientation(int):
+        Automatic = ... # type: QgsCurvedLineCallout.Orientation
+        Clockwise = ... # type: QgsCurvedLineCallout.Orientation
+        CounterClockwise = ... # type: QgsCurvedLineCallout.Orientation
+
+    def __init__(self) -> None: ...
+
+    def createCalloutLine(self, start: 'QgsPoint', end: 'QgsPoint', context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: QgsCallout.QgsCalloutContext) -> typing.Optional['QgsCurve']: ...
+    def setOrientation(self, orientation: 'QgsCurvedLineCallout.Orientation') -> None: ...
+    def orientation(self) -> 'QgsCurvedLineCallout.Orientation': ...
+    def setCurvature(self, curvature: float) -> None: ...
+    def curvature(self) -> float: ...
+    def properties(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsCurvedLineCallout']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ..., context: QgsReadWriteContext = ...) -> typing.Optional[QgsCallout]: ...
+
+
+class QgsBalloonCallout(QgsCallout):
+
+    def __init__(self) -> None: ...
+
+    def draw(self, context: QgsRenderContext, bodyBoundingBox: QtCore.QRectF, angle: float, anchor: 'QgsGeometry', calloutContext: QgsCallout.QgsCalloutContext) -> None: ...
+    def cornerRadiusMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setCornerRadiusMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def cornerRadiusUnit(self) -> Qgis.RenderUnit: ...
+    def setCornerRadiusUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setCornerRadius(self, radius: float) -> None: ...
+    def cornerRadius(self) -> float: ...
+    def wedgeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setWedgeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def wedgeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setWedgeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setWedgeWidth(self, width: float) -> None: ...
+    def wedgeWidth(self) -> float: ...
+    def marginsUnit(self) -> Qgis.RenderUnit: ...
+    def setMarginsUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setMargins(self, margins: QgsMargins) -> None: ...
+    def margins(self) -> QgsMargins: ...
+    def offsetFromAnchorMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetFromAnchorMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetFromAnchorUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetFromAnchorUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setOffsetFromAnchor(self, distance: float) -> None: ...
+    def offsetFromAnchor(self) -> float: ...
+    def setMarkerSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def markerSymbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def fillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext) -> None: ...
+    def readProperties(self, props: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def properties(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsBalloonCallout']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ..., context: QgsReadWriteContext = ...) -> typing.Optional[QgsCallout]: ...
+
+
+class QgsCalloutAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str], icon: QtGui.QIcon = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCalloutAbstractMetadata') -> None: ...
+
+    def createCalloutWidget(self, a0: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsCalloutWidget]: ...
+    def createCallout(self, properties: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsCallout]: ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsCalloutMetadata(QgsCalloutAbstractMetadata):
+
+    def __init__(self, a0: 'QgsCalloutMetadata') -> None: ...
+
+    def createCalloutWidget(self, vl: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsCalloutWidget]: ...
+    def createCallout(self, properties: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsCallout]: ...
+
+
+class QgsCalloutRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def defaultCallout() -> typing.Optional[QgsCallout]: ...
+    def calloutTypes(self) -> list[str]: ...
+    @typing.overload
+    def createCallout(self, type: typing.Optional[str], properties: dict[str, typing.Any] = ..., context: QgsReadWriteContext = ...) -> typing.Optional[QgsCallout]: ...
+    @typing.overload
+    def createCallout(self, type: typing.Optional[str], element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsCallout]: ...
+    def addCalloutType(self, metadata: typing.Optional[QgsCalloutAbstractMetadata]) -> bool: ...
+    def calloutMetadata(self, type: typing.Optional[str]) -> typing.Optional[QgsCalloutAbstractMetadata]: ...
@@ -0,0 +1,265 @@
+# The PEP 484 type hints stub file for the _core.classification module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from .processing import QgsProcessingParameterDefinition
+from .symbology import QgsRendererRange
+from .vector import QgsReadWriteContext, QgsVectorLayer
+
+
+class QgsClassificationMethod(PyQt5.sip.wrapper):
+
+    class ClassPosition(int):
+        LowerBound = ... # type: QgsClassificationMethod.ClassPosition
+        Inner = ... # type: QgsClassificationMethod.ClassPosition
+        UpperBound = ... # type: QgsClassificationMethod.ClassPosition
+
+    class MethodProperty(int):
+        NoFlag = ... # type: QgsClassificationMethod.MethodProperty
+        ValuesNotRequired = ... # type: QgsClassificationMethod.MethodProperty
+        SymmetricModeAvailable = ... # type: QgsClassificationMethod.MethodProperty
+        IgnoresClassCount = ... # type: QgsClassificationMethod.MethodProperty
+
+    class MethodProperties(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __xor__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __ior__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __or__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __iand__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __and__(self, f: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty']) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __invert__(self) -> 'QgsClassificationMethod.MethodProperties': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    MAX_PRECISION = ... # type: int
+    MIN_PRECISION = ... # type: int
+
+    @typing.overload
+    def __init__(self, properties: typing.Union['QgsClassificationMethod.MethodProperties', 'QgsClassificationMethod.MethodProperty'] = ..., codeComplexity: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationMethod') -> None: ...
+
+    def addParameter(self, definition: typing.Optional['QgsProcessingParameterDefinition']) -> None: ...
+    def formatNumber(self, value: float) -> str: ...
+    def copyBase(self, c: typing.Optional['QgsClassificationMethod']) -> None: ...
+    def parameterValues(self) -> dict[str, typing.Any]: ...
+    def setParameterValues(self, values: dict[str, typing.Any]) -> None: ...
+    def parameterDefinitions(self) -> list['QgsProcessingParameterDefinition']: ...
+    def parameterDefinition(self, parameterName: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDefinition']: ...
+    @staticmethod
+    def makeBreaksSymmetric(breaks: collections.abc.Iterable[float], symmetryPoint: float, astride: bool) -> list[float]: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsClassificationMethod']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def classesV2(self, layer: typing.Optional[QgsVectorLayer], expression: typing.Optional[str], nclasses: int) -> typing.Tuple[list['QgsClassificationRange'], str]: ...
+    @typing.overload
+    @deprecated("""""")
+    def classes(self, layer: typing.Optional[QgsVectorLayer], expression: typing.Optional[str], nclasses: int) -> list['QgsClassificationRange']: ...
+    @typing.overload
+    def classes(self, values: collections.abc.Iterable[float], nclasses: int) -> list['QgsClassificationRange']: ...
+    @typing.overload
+    def classes(self, minimum: float, maximum: float, nclasses: int) -> list['QgsClassificationRange']: ...
+    @staticmethod
+    def rangesToBreaks(classes: collections.abc.Iterable['QgsClassificationRange']) -> list[float]: ...
+    def setLabelTrimTrailingZeroes(self, trimTrailingZeroes: bool) -> None: ...
+    def labelTrimTrailingZeroes(self) -> bool: ...
+    def setLabelPrecision(self, labelPrecision: int) -> None: ...
+    def labelPrecision(self) -> int: ...
+    def setLabelFormat(self, format: typing.Optional[str]) -> None: ...
+    def labelFormat(self) -> str: ...
+    def setSymmetricMode(self, enabled: bool, symmetryPoint: float = ..., symmetryAstride: bool = ...) -> None: ...
+    def symmetryAstride(self) -> bool: ...
+    def symmetryPoint(self) -> float: ...
+    def symmetricModeEnabled(self) -> bool: ...
+    def symmetricModeAvailable(self) -> bool: ...
+    def codeComplexity(self) -> int: ...
+    def valuesRequired(self) -> bool: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    def labelForRange(self, lowerValue: float, upperValue: float, position: 'QgsClassificationMethod.ClassPosition' = ...) -> str: ...
+    @typing.overload
+    def labelForRange(self, range: 'QgsRendererRange', position: 'QgsClassificationMethod.ClassPosition' = ...) -> str: ...
+    def flags(self) -> 'QgsClassificationMethod.MethodProperties': ...
+    def icon(self) -> QtGui.QIcon: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsClassificationMethod']: ...
+
+
+class QgsClassificationCustom(QgsClassificationMethod):
+
+    METHOD_ID = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationCustom') -> None: ...
+
+    def valuesRequired(self) -> bool: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+
+
+class QgsClassificationEqualInterval(QgsClassificationMethod):
+
+    METHOD_ID = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationEqualInterval') -> None: ...
+
+    def valuesRequired(self) -> bool: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsClassificationFixedInterval(QgsClassificationMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationFixedInterval') -> None: ...
+
+    def valuesRequired(self) -> bool: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+
+
+class QgsClassificationJenks(QgsClassificationMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationJenks') -> None: ...
+
+    def icon(self) -> QtGui.QIcon: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsClassificationLogarithmic(QgsClassificationMethod):
+
+    class NegativeValueHandling(int):
+        NoHandling = ... # type: QgsClassificationLogarithmic.NegativeValueHandling
+        Discard = ... # type: QgsClassificationLogarithmic.NegativeValueHandling
+        PrependBreak = ... # type: QgsClassificationLogarithmic.NegativeValueHandling
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationLogarithmic') -> None: ...
+
+    def valuesRequired(self) -> bool: ...
+    def labelForRange(self, lowerValue: float, upperValue: float, position: QgsClassificationMethod.ClassPosition) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+
+
+class QgsClassificationRange(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, label: typing.Optional[str], lowerBound: float, upperBound: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationRange') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def label(self) -> str: ...
+    def upperBound(self) -> float: ...
+    def lowerBound(self) -> float: ...
+
+
+class QgsClassificationMethodRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationMethodRegistry') -> None: ...
+
+    def icon(self, id: typing.Optional[str]) -> QtGui.QIcon: ...
+    def methodNames(self) -> dict[str, str]: ...
+    def method(self, id: typing.Optional[str]) -> typing.Optional[QgsClassificationMethod]: ...
+    def addMethod(self, method: typing.Optional[QgsClassificationMethod]) -> bool: ...
+
+
+class QgsClassificationPrettyBreaks(QgsClassificationMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationPrettyBreaks') -> None: ...
+
+    def valuesRequired(self) -> bool: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsClassificationQuantile(QgsClassificationMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationQuantile') -> None: ...
+
+    def icon(self) -> QtGui.QIcon: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsClassificationStandardDeviation(QgsClassificationMethod):
+
+    METHOD_ID = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClassificationStandardDeviation') -> None: ...
+
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def labelForRange(self, lowerValue: float, upperValue: float, position: QgsClassificationMethod.ClassPosition) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def clone(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
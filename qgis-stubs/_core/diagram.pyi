@@ -0,0 +1,232 @@
+# The PEP 484 type hints stub file for the _core.diagram module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsDiagramInterpolationSettings
+from .effects import QgsPaintEffect
+from .expression import QgsExpression
+from .layertree import QgsLayerTreeLayer, QgsLayerTreeModelLegendNode
+from .symbology import QgsLineSymbol
+from .vector import (
+    QgsExpressionContext, QgsFeature, QgsReadWriteContext, QgsRenderContext,
+)
+
+
+class QgsDiagramSettings(PyQt5.sip.wrapper):
+
+    class StackedDiagramMode(int):
+        Horizontal = ... # type: QgsDiagramSettings.StackedDiagramMode
+        Vertical = ... # type: QgsDiagramSettings.StackedDiagramMode
+
+    class Direction(int):
+        Clockwise = ... # type: QgsDiagramSettings.Direction
+        Counterclockwise = ... # type: QgsDiagramSettings.Direction
+
+    class DiagramOrientation(int):
+        Up = ... # type: QgsDiagramSettings.DiagramOrientation
+        Down = ... # type: QgsDiagramSettings.DiagramOrientation
+        Left = ... # type: QgsDiagramSettings.DiagramOrientation
+        Right = ... # type: QgsDiagramSettings.DiagramOrientation
+
+    class LabelPlacementMethod(int):
+        Height = ... # type: QgsDiagramSettings.LabelPlacementMethod
+        XHeight = ... # type: QgsDiagramSettings.LabelPlacementMethod
+
+    backgroundColor = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    barWidth = ... # type: float
+    categoryAttributes = ... # type: collections.abc.Iterable[typing.Optional[str]]
+    categoryColors = ... # type: collections.abc.Iterable[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]]
+    categoryLabels = ... # type: collections.abc.Iterable[typing.Optional[str]]
+    diagramOrientation = ... # type: 'QgsDiagramSettings.DiagramOrientation'
+    enabled = ... # type: bool
+    font = ... # type: QtGui.QFont
+    labelPlacementMethod = ... # type: 'QgsDiagramSettings.LabelPlacementMethod'
+    lineSizeScale = ... # type: 'QgsMapUnitScale'
+    lineSizeUnit = ... # type: Qgis.RenderUnit
+    maximumScale = ... # type: float
+    minimumScale = ... # type: float
+    minimumSize = ... # type: float
+    opacity = ... # type: float
+    penColor = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    penWidth = ... # type: float
+    rotationOffset = ... # type: float
+    scaleBasedVisibility = ... # type: bool
+    scaleByArea = ... # type: bool
+    size = ... # type: QtCore.QSizeF
+    sizeScale = ... # type: 'QgsMapUnitScale'
+    sizeType = ... # type: Qgis.RenderUnit
+    stackedDiagramMode = ... # type: 'QgsDiagramSettings.StackedDiagramMode'
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsDiagramSettings') -> None: ...
+
+    def setPaintEffect(self, effect: typing.Optional['QgsPaintEffect']) -> None: ...
+    def paintEffect(self) -> typing.Optional['QgsPaintEffect']: ...
+    def setShowAxis(self, showAxis: bool) -> None: ...
+    def showAxis(self) -> bool: ...
+    def setAxisLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def axisLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def legendItems(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def writeXml(self, rendererElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext' = ...) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext' = ...) -> None: ...
+    def setDirection(self, direction: 'QgsDiagramSettings.Direction') -> None: ...
+    def direction(self) -> 'QgsDiagramSettings.Direction': ...
+    def stackedDiagramSpacingMapUnitScale(self) -> 'QgsMapUnitScale': ...
+    def setStackedDiagramSpacingMapUnitScale(self, scale: 'QgsMapUnitScale') -> None: ...
+    def stackedDiagramSpacingUnit(self) -> Qgis.RenderUnit: ...
+    def setStackedDiagramSpacingUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setStackedDiagramSpacing(self, spacing: float) -> None: ...
+    def stackedDiagramSpacing(self) -> float: ...
+    def spacingMapUnitScale(self) -> 'QgsMapUnitScale': ...
+    def setSpacingMapUnitScale(self, scale: 'QgsMapUnitScale') -> None: ...
+    def spacingUnit(self) -> Qgis.RenderUnit: ...
+    def setSpacingUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setSpacing(self, spacing: float) -> None: ...
+    def spacing(self) -> float: ...
+
+
+class QgsMapUnitScale(PyQt5.sip.wrapper):
+
+    maxScale = ... # type: float
+    maxSizeMM = ... # type: float
+    maxSizeMMEnabled = ... # type: bool
+    minScale = ... # type: float
+    minSizeMM = ... # type: float
+    minSizeMMEnabled = ... # type: bool
+
+    @typing.overload
+    def __init__(self, minScale: float = ..., maxScale: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapUnitScale') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def computeMapUnitsPerPixel(self, c: 'QgsRenderContext') -> float: ...
+    def isNull(self) -> bool: ...
+
+
+class QgsDiagram(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsDiagram') -> None: ...
+
+    def sizeForValue(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def scaledFont(self, s: QgsDiagramSettings, c: QgsRenderContext) -> QtGui.QFont: ...
+    @typing.overload
+    def sizePainterUnits(self, size: QtCore.QSizeF, s: QgsDiagramSettings, c: QgsRenderContext) -> QtCore.QSizeF: ...
+    @typing.overload
+    def sizePainterUnits(self, l: float, s: QgsDiagramSettings, c: QgsRenderContext) -> float: ...
+    def setPenWidth(self, pen: typing.Union[QtGui.QPen, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]], s: QgsDiagramSettings, c: QgsRenderContext) -> None: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def diagramName(self) -> str: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def getExpression(self, expression: typing.Optional[str], context: QgsExpressionContext) -> typing.Optional['QgsExpression']: ...
+    def clearCache(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsDiagram']: ...
+
+
+class QgsHistogramDiagram(QgsDiagram):
+
+    def __init__(self) -> None: ...
+
+    def diagramName(self) -> str: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def clone(self) -> typing.Optional['QgsHistogramDiagram']: ...
+
+
+class QgsPieDiagram(QgsDiagram):
+
+    def __init__(self) -> None: ...
+
+    def diagramName(self) -> str: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def clone(self) -> typing.Optional['QgsPieDiagram']: ...
+
+
+class QgsStackedBarDiagram(QgsDiagram):
+
+    def __init__(self) -> None: ...
+
+    def diagramName(self) -> str: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def clone(self) -> typing.Optional['QgsStackedBarDiagram']: ...
+
+
+class QgsStackedDiagram(QgsDiagram):
+
+    def __init__(self) -> None: ...
+
+    def diagramName(self) -> str: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, is_: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, is_: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def subDiagramPosition(self, newPos: typing.Union[QtCore.QPointF, QtCore.QPoint], c: QgsRenderContext, s: QgsDiagramSettings, subSettings: QgsDiagramSettings) -> None: ...
+    def clone(self) -> typing.Optional['QgsStackedDiagram']: ...
+
+
+class QgsTextDiagram(QgsDiagram):
+
+    class Orientation(int):
+        Horizontal = ... # type: QgsTextDiagram.Orientation
+        Vertical = ... # type: QgsTextDiagram.Orientation
+
+    class Shape(int):
+        Circle = ... # type: QgsTextDiagram.Shape
+        Rectangle = ... # type: QgsTextDiagram.Shape
+        Triangle = ... # type: QgsTextDiagram.Shape
+
+    def __init__(self) -> None: ...
+
+    def diagramName(self) -> str: ...
+    def legendSize(self, value: float, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> float: ...
+    @typing.overload
+    def diagramSize(self, attributes: typing.Any, c: QgsRenderContext, s: QgsDiagramSettings) -> QtCore.QSizeF: ...
+    @typing.overload
+    def diagramSize(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, interpolationSettings: QgsDiagramInterpolationSettings) -> QtCore.QSizeF: ...
+    def renderDiagram(self, feature: QgsFeature, c: QgsRenderContext, s: QgsDiagramSettings, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def clone(self) -> typing.Optional['QgsTextDiagram']: ...
@@ -0,0 +1,575 @@
+# The PEP 484 type hints stub file for the _core.dxf module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDartMeasurement, QgsDoubleRange, QgsElevationMap,
+    QgsMaskRenderSettings, QgsPathResolver, QgsTemporalRangeObject,
+    QgsVectorSimplifyMethod,
+)
+from .diagram import QgsMapUnitScale
+from .geometry import QgsAbstractGeometry, QgsGeometry, QgsPoint, QgsRectangle
+from .labeling import QgsLabelingEngineSettings
+from .layertree import QgsLayerTreeFilterSettings
+from .layout import QgsLayout, QgsMapClippingRegion
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .symbology import QgsSymbol
+from .vector import (
+    QgsExpressionContext, QgsFeature, QgsMapLayer, QgsPointXY,
+    QgsReadWriteContext, QgsRenderContext, QgsVectorLayer,
+)
+
+
+class QgsElevationShadingRenderer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsElevationShadingRenderer') -> None: ...
+
+    def setCombinedElevationMethod(self, method: Qgis.ElevationMapCombineMethod) -> None: ...
+    def combinedElevationMethod(self) -> Qgis.ElevationMapCombineMethod: ...
+    def readXml(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def setLightAzimuth(self, lightAzimuth: float) -> None: ...
+    def lightAzimuth(self) -> float: ...
+    def setLightAltitude(self, lightAltitude: float) -> None: ...
+    def lightAltitude(self) -> float: ...
+    def setHillshadingMultidirectional(self, multiDirectional: bool) -> None: ...
+    def isHillshadingMultidirectional(self) -> bool: ...
+    def setHillshadingZFactor(self, zFactor: float) -> None: ...
+    def hillshadingZFactor(self) -> float: ...
+    def isActiveHillshading(self) -> bool: ...
+    def setActiveHillshading(self, active: bool) -> None: ...
+    def setEyeDomeLightingDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def eyeDomeLightingDistanceUnit(self) -> Qgis.RenderUnit: ...
+    def setEyeDomeLightingDistance(self, distance: float) -> None: ...
+    def eyeDomeLightingDistance(self) -> float: ...
+    def setEyeDomeLightingStrength(self, strength: float) -> None: ...
+    def eyeDomeLightingStrength(self) -> float: ...
+    def isActiveEyeDomeLighting(self) -> bool: ...
+    def setActiveEyeDomeLighting(self, active: bool) -> None: ...
+    def isActive(self) -> bool: ...
+    def setActive(self, active: bool) -> None: ...
+    def renderShading(self, elevation: QgsElevationMap, image: QtGui.QImage, context: 'QgsRenderContext') -> None: ...
+
+
+class QgsMapHitTest(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, settings: 'QgsMapSettings', polygon: 'QgsGeometry' = ..., layerFilterExpression: dict[typing.Optional[str], typing.Optional[str]] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, settings: 'QgsMapSettings', layerFilterExpression: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    @typing.overload
+    def __init__(self, settings: 'QgsLayerTreeFilterSettings') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapHitTest') -> None: ...
+
+    def legendKeyVisible(self, ruleKey: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def symbolVisible(self, symbol: typing.Optional['QgsSymbol'], layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def results(self) -> typing.Any: ...
+    def run(self) -> None: ...
+
+
+class QgsLabelBlockingRegion(PyQt5.sip.wrapper):
+
+    geometry = ... # type: 'QgsGeometry'
+
+    @typing.overload
+    def __init__(self, geometry: 'QgsGeometry') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelBlockingRegion') -> None: ...
+
+
+class QgsMapSettings(QgsTemporalRangeObject):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapSettings') -> None: ...
+
+    def updateDerived(self) -> None: ...
+    def setRasterizedRenderingPolicy(self, policy: Qgis.RasterizedRenderingPolicy) -> None: ...
+    def rasterizedRenderingPolicy(self) -> Qgis.RasterizedRenderingPolicy: ...
+    def setElevationShadingRenderer(self, renderer: QgsElevationShadingRenderer) -> None: ...
+    def elevationShadingRenderer(self) -> QgsElevationShadingRenderer: ...
+    def setCurrentFrame(self, frame: int) -> None: ...
+    def currentFrame(self) -> int: ...
+    def setFrameRate(self, rate: float) -> None: ...
+    def frameRate(self) -> float: ...
+    def setRendererUsage(self, rendererUsage: Qgis.RendererUsage) -> None: ...
+    def rendererUsage(self) -> Qgis.RendererUsage: ...
+    def setZRange(self, range: 'QgsDoubleRange') -> None: ...
+    def zRange(self) -> 'QgsDoubleRange': ...
+    def renderedFeatureHandlers(self) -> list['QgsRenderedFeatureHandlerInterface']: ...
+    def addRenderedFeatureHandler(self, handler: typing.Optional['QgsRenderedFeatureHandlerInterface']) -> None: ...
+    def setMaskSettings(self, settings: 'QgsMaskRenderSettings') -> None: ...
+    def maskSettings(self) -> 'QgsMaskRenderSettings': ...
+    def simplifyMethod(self) -> 'QgsVectorSimplifyMethod': ...
+    def setSimplifyMethod(self, method: 'QgsVectorSimplifyMethod') -> None: ...
+    def clippingRegions(self) -> list[QgsMapClippingRegion]: ...
+    def setClippingRegions(self, regions: collections.abc.Iterable[QgsMapClippingRegion]) -> None: ...
+    def addClippingRegion(self, region: QgsMapClippingRegion) -> None: ...
+    def labelBlockingRegions(self) -> list[QgsLabelBlockingRegion]: ...
+    def setLabelBlockingRegions(self, regions: collections.abc.Iterable[QgsLabelBlockingRegion]) -> None: ...
+    def setLabelBoundaryGeometry(self, boundary: 'QgsGeometry') -> None: ...
+    def labelBoundaryGeometry(self) -> 'QgsGeometry': ...
+    def labelingEngineSettings(self) -> 'QgsLabelingEngineSettings': ...
+    def setLabelingEngineSettings(self, settings: 'QgsLabelingEngineSettings') -> None: ...
+    def segmentationToleranceType(self) -> 'QgsAbstractGeometry.SegmentationToleranceType': ...
+    def setSegmentationToleranceType(self, type: 'QgsAbstractGeometry.SegmentationToleranceType') -> None: ...
+    def segmentationTolerance(self) -> float: ...
+    def setSegmentationTolerance(self, tolerance: float) -> None: ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    def readXml(self, node: QtXml.QDomNode) -> None: ...
+    def fullExtent(self) -> 'QgsRectangle': ...
+    def computeScaleForExtent(self, extent: 'QgsRectangle') -> float: ...
+    def computeExtentForScale(self, center: 'QgsPointXY', scale: float) -> 'QgsRectangle': ...
+    def layerTransform(self, layer: typing.Optional[QgsMapLayer]) -> 'QgsCoordinateTransform': ...
+    @typing.overload
+    def mapToLayerCoordinates(self, layer: typing.Optional[QgsMapLayer], point: 'QgsPointXY') -> 'QgsPointXY': ...
+    @typing.overload
+    def mapToLayerCoordinates(self, layer: typing.Optional[QgsMapLayer], point: 'QgsPoint') -> 'QgsPoint': ...
+    @typing.overload
+    def mapToLayerCoordinates(self, layer: typing.Optional[QgsMapLayer], rect: 'QgsRectangle') -> 'QgsRectangle': ...
+    @typing.overload
+    def layerToMapCoordinates(self, layer: typing.Optional[QgsMapLayer], point: 'QgsPointXY') -> 'QgsPointXY': ...
+    @typing.overload
+    def layerToMapCoordinates(self, layer: typing.Optional[QgsMapLayer], point: 'QgsPoint') -> 'QgsPoint': ...
+    @typing.overload
+    def layerToMapCoordinates(self, layer: typing.Optional[QgsMapLayer], rect: 'QgsRectangle') -> 'QgsRectangle': ...
+    def outputExtentToLayerExtent(self, layer: typing.Optional[QgsMapLayer], extent: 'QgsRectangle') -> 'QgsRectangle': ...
+    def layerExtentToOutputExtent(self, layer: typing.Optional[QgsMapLayer], extent: 'QgsRectangle') -> 'QgsRectangle': ...
+    def layerToMapUnits(self, layer: typing.Optional[QgsMapLayer], referenceExtent: 'QgsRectangle' = ...) -> float: ...
+    def mapToPixel(self) -> 'QgsMapToPixel': ...
+    def setPathResolver(self, resolver: 'QgsPathResolver') -> None: ...
+    def pathResolver(self) -> 'QgsPathResolver': ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def expressionContext(self) -> QgsExpressionContext: ...
+    def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+    def scale(self) -> float: ...
+    def mapUnitsPerPixel(self) -> float: ...
+    def visiblePolygonWithBuffer(self) -> QtGui.QPolygonF: ...
+    def visiblePolygon(self) -> QtGui.QPolygonF: ...
+    def visibleExtent(self) -> 'QgsRectangle': ...
+    def hasValidSettings(self) -> bool: ...
+    def outputImageFormat(self) -> QtGui.QImage.Format: ...
+    def setOutputImageFormat(self, format: QtGui.QImage.Format) -> None: ...
+    def setTextRenderFormat(self, format: Qgis.TextRenderFormat) -> None: ...
+    def textRenderFormat(self) -> Qgis.TextRenderFormat: ...
+    def testFlag(self, flag: Qgis.MapSettingsFlag) -> bool: ...
+    def flags(self) -> Qgis.MapSettingsFlags: ...
+    def setFlag(self, flag: Qgis.MapSettingsFlag, on: bool = ...) -> None: ...
+    def setFlags(self, flags: typing.Union[Qgis.MapSettingsFlags, Qgis.MapSettingsFlag]) -> None: ...
+    def selectionColor(self) -> QtGui.QColor: ...
+    def setSelectionColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def setBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def ellipsoid(self) -> str: ...
+    def setEllipsoid(self, ellipsoid: typing.Optional[str]) -> bool: ...
+    def setScaleMethod(self, method: Qgis.ScaleCalculationMethod) -> None: ...
+    def scaleMethod(self) -> Qgis.ScaleCalculationMethod: ...
+    def mapUnits(self) -> Qgis.DistanceUnit: ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setDestinationCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def clearCustomRenderingFlag(self, flag: typing.Optional[str]) -> None: ...
+    def setCustomRenderingFlag(self, flag: typing.Optional[str], value: typing.Any) -> None: ...
+    def customRenderingFlags(self) -> dict[str, typing.Any]: ...
+    def setCustomRenderFlags(self, customRenderFlags: typing.Optional[str]) -> None: ...
+    def customRenderFlags(self) -> str: ...
+    def setLayerStyleOverrides(self, overrides: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def layerStyleOverrides(self) -> dict[str, str]: ...
+    def setLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layers(self, expandGroupLayers: bool = ...) -> list[QgsMapLayer]: ...
+    def layerIds(self, expandGroupLayers: bool = ...) -> list[str]: ...
+    def magnificationFactor(self) -> float: ...
+    def setMagnificationFactor(self, factor: float, center: typing.Optional['QgsPointXY'] = ...) -> None: ...
+    def setDpiTarget(self, dpi: float) -> None: ...
+    def dpiTarget(self) -> float: ...
+    def setOutputDpi(self, dpi: float) -> None: ...
+    def outputDpi(self) -> float: ...
+    def setRotation(self, rotation: float) -> None: ...
+    def rotation(self) -> float: ...
+    def deviceOutputSize(self) -> QtCore.QSize: ...
+    def setDevicePixelRatio(self, dpr: float) -> None: ...
+    def devicePixelRatio(self) -> float: ...
+    def setOutputSize(self, size: QtCore.QSize) -> None: ...
+    def outputSize(self) -> QtCore.QSize: ...
+    def setExtentBuffer(self, buffer: float) -> None: ...
+    def extentBuffer(self) -> float: ...
+    def setExtent(self, rect: 'QgsRectangle', magnified: bool = ...) -> None: ...
+    def extent(self) -> 'QgsRectangle': ...
+    Flag: typing.Type[Qgis.MapSettingsFlag]
+    Antialiasing: Qgis.MapSettingsFlag
+    DrawEditingInfo: Qgis.MapSettingsFlag
+    ForceVectorOutput: Qgis.MapSettingsFlag
+    UseAdvancedEffects: Qgis.MapSettingsFlag
+    DrawLabeling: Qgis.MapSettingsFlag
+    UseRenderingOptimization: Qgis.MapSettingsFlag
+    DrawSelection: Qgis.MapSettingsFlag
+    DrawSymbolBounds: Qgis.MapSettingsFlag
+    RenderMapTile: Qgis.MapSettingsFlag
+    RenderPartialOutput: Qgis.MapSettingsFlag
+    RenderPreviewJob: Qgis.MapSettingsFlag
+    RenderBlocking: Qgis.MapSettingsFlag
+    LosslessImageRendering: Qgis.MapSettingsFlag
+    Render3DMap: Qgis.MapSettingsFlag
+    HighQualityImageTransforms: Qgis.MapSettingsFlag
+    SkipSymbolRendering: Qgis.MapSettingsFlag
+    ForceRasterMasks: Qgis.MapSettingsFlag
+    RecordProfile: Qgis.MapSettingsFlag
+    AlwaysUseGlobalMasks: Qgis.MapSettingsFlag
+    Flags: typing.Type[Qgis.MapSettingsFlags]
+
+
+class QgsMapToPixel(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, mapUnitsPerPixel: float, centerX: float, centerY: float, widthPixels: int, heightPixels: int, rotation: float) -> None: ...
+    @typing.overload
+    def __init__(self, mapUnitsPerPixel: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapToPixel') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def yCenter(self) -> float: ...
+    def xCenter(self) -> float: ...
+    def showParameters(self) -> str: ...
+    def setParameters(self, mapUnitsPerPixel: float, centerX: float, centerY: float, widthPixels: int, heightPixels: int, rotation: float) -> None: ...
+    def mapRotation(self) -> float: ...
+    def setMapRotation(self, degrees: float, cx: float, cy: float) -> None: ...
+    def mapHeight(self) -> int: ...
+    def mapWidth(self) -> int: ...
+    def mapUnitsPerPixel(self) -> float: ...
+    def setMapUnitsPerPixel(self, mapUnitsPerPixel: float) -> None: ...
+    @deprecated("""""")
+    def toMapPoint(self, x: float, y: float) -> 'QgsPointXY': ...
+    def toMapCoordinatesF(self, x: float, y: float) -> 'QgsPointXY': ...
+    @typing.overload
+    def toMapCoordinates(self, x: int, y: int) -> 'QgsPointXY': ...
+    @typing.overload
+    def toMapCoordinates(self, p: QtCore.QPoint) -> 'QgsPointXY': ...
+    def transformBounds(self, bounds: QtCore.QRectF) -> QtCore.QRectF: ...
+    def transformInPlace(self) -> typing.Tuple[float, float]: ...
+    @typing.overload
+    def transform(self, p: 'QgsPointXY') -> 'QgsPointXY': ...
+    @typing.overload
+    def transform(self, p: typing.Optional['QgsPointXY']) -> None: ...
+    @typing.overload
+    def transform(self, x: float, y: float) -> 'QgsPointXY': ...
+    @typing.overload
+    def transform(self) -> QtGui.QTransform: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    def fromScale(scale: float, mapUnits: Qgis.DistanceUnit, dpi: float = ...) -> 'QgsMapToPixel': ...
+
+
+class QgsMultiRenderChecker(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiRenderChecker') -> None: ...
+
+    @staticmethod
+    def drawBackground(image: typing.Optional[QtGui.QImage]) -> None: ...
+    def controlImagePath(self) -> str: ...
+    def markdownReport(self) -> str: ...
+    def report(self) -> str: ...
+    def runTest(self, testName: typing.Optional[str], mismatchCount: int = ...) -> bool: ...
+    def setSizeTolerance(self, xTolerance: int, yTolerance: int) -> None: ...
+    def setColorTolerance(self, colorTolerance: int) -> None: ...
+    def setMapSettings(self, mapSettings: QgsMapSettings) -> None: ...
+    def setExpectFail(self, expectFail: bool) -> None: ...
+    def setRenderedImage(self, renderedImagePath: typing.Optional[str]) -> None: ...
+    def setControlPathPrefix(self, prefix: typing.Optional[str]) -> None: ...
+    def setFileFunctionLine(self, file: typing.Optional[str], function: typing.Optional[str], line: int) -> None: ...
+    def setControlName(self, name: typing.Optional[str]) -> None: ...
+
+
+class QgsLayoutChecker(QgsMultiRenderChecker):
+
+    @typing.overload
+    def __init__(self, testName: typing.Optional[str], layout: typing.Optional['QgsLayout']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutChecker') -> None: ...
+
+    def testLayout(self, page: int = ..., pixelDiff: int = ..., createReferenceImage: bool = ...) -> typing.Tuple[bool, str]: ...
+    def setSize(self, size: QtCore.QSize) -> None: ...
+
+
+class QgsRenderChecker(PyQt5.sip.wrapper):
+
+    class Flag(int):
+        AvoidExportingRenderedImage = ... # type: QgsRenderChecker.Flag
+        Silent = ... # type: QgsRenderChecker.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __xor__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __ior__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __or__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __iand__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __and__(self, f: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag']) -> 'QgsRenderChecker.Flags': ...
+        def __invert__(self) -> 'QgsRenderChecker.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRenderChecker') -> None: ...
+
+    @staticmethod
+    def sourcePath() -> str: ...
+    def dartMeasurements(self) -> list[QgsDartMeasurement]: ...
+    def enableDashBuffering(self, enable: bool) -> None: ...
+    def expectedImageFile(self) -> str: ...
+    @staticmethod
+    def drawBackground(image: typing.Optional[QtGui.QImage]) -> None: ...
+    @deprecated("""""")
+    def isKnownAnomaly(self, diffImageFile: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def compareImages(self, testName: typing.Optional[str], mismatchCount: int = ..., renderedImageFile: typing.Optional[str] = ..., flags: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag'] = ...) -> bool: ...
+    @typing.overload
+    def compareImages(self, testName: typing.Optional[str], referenceImageFile: typing.Optional[str], renderedImageFile: typing.Optional[str], mismatchCount: int = ..., flags: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag'] = ...) -> bool: ...
+    def runTest(self, testName: typing.Optional[str], mismatchCount: int = ..., flags: typing.Union['QgsRenderChecker.Flags', 'QgsRenderChecker.Flag'] = ...) -> bool: ...
+    def setSizeTolerance(self, xTolerance: int, yTolerance: int) -> None: ...
+    def setColorTolerance(self, colorTolerance: int) -> None: ...
+    def setMapSettings(self, mapSettings: QgsMapSettings) -> None: ...
+    def renderedImage(self) -> str: ...
+    def setExpectFail(self, expectFail: bool) -> None: ...
+    def setRenderedImage(self, imageFileName: typing.Optional[str]) -> None: ...
+    def imageToHash(self, imageFile: typing.Optional[str]) -> str: ...
+    def setControlPathSuffix(self, name: typing.Optional[str]) -> None: ...
+    def setControlPathPrefix(self, name: typing.Optional[str]) -> None: ...
+    def setControlExtension(self, extension: typing.Optional[str]) -> None: ...
+    def setControlName(self, name: typing.Optional[str]) -> None: ...
+    def setElapsedTimeTarget(self, target: int) -> None: ...
+    def elapsedTime(self) -> int: ...
+    def matchTarget(self) -> int: ...
+    def mismatchCount(self) -> int: ...
+    def matchPercent(self) -> float: ...
+    def markdownReport(self, ignoreSuccess: bool = ...) -> str: ...
+    def report(self, ignoreSuccess: bool = ...) -> str: ...
+    def setControlImagePath(self, path: typing.Optional[str]) -> None: ...
+    def controlImagePath(self) -> str: ...
+    @staticmethod
+    def shouldGenerateReport() -> bool: ...
+    @staticmethod
+    def testReportDir() -> QtCore.QDir: ...
+
+
+class QgsRenderedFeatureHandlerInterface(PyQt5.sip.wrapper):
+
+    class RenderedFeatureContext(PyQt5.sip.wrapper):
+
+        renderContext = ... # type: QgsRenderContext
+
+        @typing.overload
+        def __init__(self, renderContext: QgsRenderContext) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRenderedFeatureHandlerInterface.RenderedFeatureContext') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRenderedFeatureHandlerInterface') -> None: ...
+
+    def usedAttributes(self, layer: typing.Optional[QgsVectorLayer], context: QgsRenderContext) -> set[str]: ...
+    def handleRenderedFeature(self, feature: QgsFeature, renderedBounds: 'QgsGeometry', context: 'QgsRenderedFeatureHandlerInterface.RenderedFeatureContext') -> None: ...
+
+
+class QgsDxfExport(PyQt5.sip.wrapper):
+
+    class DxfPolylineFlag(int):
+        Closed = ... # type: QgsDxfExport.DxfPolylineFlag
+        Curve = ... # type: QgsDxfExport.DxfPolylineFlag
+        Spline = ... # type: QgsDxfExport.DxfPolylineFlag
+        Is3DPolyline = ... # type: QgsDxfExport.DxfPolylineFlag
+        Is3DPolygonMesh = ... # type: QgsDxfExport.DxfPolylineFlag
+        PolygonMesh = ... # type: QgsDxfExport.DxfPolylineFlag
+        PolyfaceMesh = ... # type: QgsDxfExport.DxfPolylineFlag
+        ContinuousPattern = ... # type: QgsDxfExport.DxfPolylineFlag
+
+    class HAlign(int):
+        HLeft = ... # type: QgsDxfExport.HAlign
+        HCenter = ... # type: QgsDxfExport.HAlign
+        HRight = ... # type: QgsDxfExport.HAlign
+        HAligned = ... # type: QgsDxfExport.HAlign
+        HMiddle = ... # type: QgsDxfExport.HAlign
+        HFit = ... # type: QgsDxfExport.HAlign
+        Undefined = ... # type: QgsDxfExport.HAlign
+
+    class VAlign(int):
+        VBaseLine = ... # type: QgsDxfExport.VAlign
+        VBottom = ... # type: QgsDxfExport.VAlign
+        VMiddle = ... # type: QgsDxfExport.VAlign
+        VTop = ... # type: QgsDxfExport.VAlign
+        Undefined = ... # type: QgsDxfExport.VAlign
+
+    class ExportResult(int):
+        Success = ... # type: QgsDxfExport.ExportResult
+        InvalidDeviceError = ... # type: QgsDxfExport.ExportResult
+        DeviceNotWritableError = ... # type: QgsDxfExport.ExportResult
+        EmptyExtentError = ... # type: QgsDxfExport.ExportResult
+
+    class Flag(int):
+        FlagNoMText = ... # type: QgsDxfExport.Flag
+        FlagOnlySelectedFeatures = ... # type: QgsDxfExport.Flag
+        FlagHairlineWidthExport = ... # type: QgsDxfExport.Flag
+
+    class DxfLayer(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, vl: typing.Optional[QgsVectorLayer], layerOutputAttributeIndex: int = ..., buildDDBlocks: bool = ..., ddBlocksMaxNumberOfClasses: int = ..., overriddenName: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDxfExport.DxfLayer') -> None: ...
+
+        def overriddenName(self) -> str: ...
+        def dataDefinedBlocksMaximumNumberOfClasses(self) -> int: ...
+        def buildDataDefinedBlocks(self) -> bool: ...
+        def splitLayerAttribute(self) -> str: ...
+        def layerOutputAttributeIndex(self) -> int: ...
+        def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __xor__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __ior__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __or__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __iand__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __and__(self, f: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> 'QgsDxfExport.Flags': ...
+        def __invert__(self) -> 'QgsDxfExport.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class DxfPolylineFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __xor__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __ior__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __or__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __iand__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __and__(self, f: typing.Union['QgsDxfExport.DxfPolylineFlags', 'QgsDxfExport.DxfPolylineFlag']) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __invert__(self) -> 'QgsDxfExport.DxfPolylineFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self) -> None: ...
+
+    def registerDxfLayer(self, layerId: typing.Optional[str], fid: int, layer: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def encodings() -> list[str]: ...
+    @staticmethod
+    def dxfEncoding(name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def dxfLayerName(name: typing.Optional[str]) -> str: ...
+    def clipValueToMapUnitScale(self, scale: QgsMapUnitScale, pixelToMMFactor: float) -> float: ...
+    @staticmethod
+    def mapUnitScaleFactor(scale: float, symbolUnits: Qgis.RenderUnit, mapUnits: Qgis.DistanceUnit, mapUnitsPerPixel: float = ...) -> float: ...
+    def writeMText(self, layer: typing.Optional[str], text: typing.Optional[str], pt: 'QgsPoint', width: float, angle: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def writeTextV2(self, layer: typing.Optional[str], text: typing.Optional[str], pt: 'QgsPoint', size: float, angle: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], hali: 'QgsDxfExport.HAlign' = ..., vali: 'QgsDxfExport.VAlign' = ...) -> None: ...
+    def writeCircleV2(self, layer: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], pt: 'QgsPoint', radius: float, lineStyleName: typing.Optional[str], width: float) -> None: ...
+    def writeFillCircleV2(self, layer: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], pt: 'QgsPoint', radius: float) -> None: ...
+    def writePointV2(self, layer: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], pt: 'QgsPoint') -> None: ...
+    def writeLine(self, pt1: 'QgsPoint', pt2: 'QgsPoint', layer: typing.Optional[str], lineStyleName: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], width: float = ...) -> None: ...
+    def writeHandle(self, code: int = ..., handle: int = ...) -> int: ...
+    def writeString(self, s: typing.Optional[str]) -> None: ...
+    def writeDouble(self, d: float) -> None: ...
+    def writeInt(self, i: int) -> None: ...
+    def writeGroupCode(self, code: int) -> None: ...
+    def writeGroupPointV2(self, code: int, p: 'QgsPoint') -> None: ...
+    @typing.overload
+    def writeGroup(self, code: int, s: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def writeGroup(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], exactMatch: int = ..., rgbCode: int = ..., transparencyCode: int = ...) -> None: ...
+    def writeGroupDouble(self, code: int, d: float) -> None: ...
+    def writeGroupLong(self, code: int, i: int) -> None: ...
+    def writeGroupInt(self, code: int, i: int) -> None: ...
+    @typing.overload
+    def layerName(self, id: typing.Optional[str], f: QgsFeature) -> str: ...
+    @typing.overload
+    def layerName(self, vl: typing.Optional[QgsVectorLayer]) -> str: ...
+    @staticmethod
+    def closestColorMatch(color: int) -> int: ...
+    def force2d(self) -> bool: ...
+    def setForce2d(self, force2d: bool) -> None: ...
+    def layerTitleAsName(self) -> bool: ...
+    def setLayerTitleAsName(self, layerTitleAsName: bool) -> None: ...
+    def extent(self) -> 'QgsRectangle': ...
+    def setExtent(self, r: 'QgsRectangle') -> None: ...
+    def symbologyExport(self) -> Qgis.FeatureSymbologyExport: ...
+    def setSymbologyExport(self, e: Qgis.FeatureSymbologyExport) -> None: ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setDestinationCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def mapUnits(self) -> Qgis.DistanceUnit: ...
+    def symbologyScale(self) -> float: ...
+    def setSymbologyScale(self, scale: float) -> None: ...
+    def feedbackMessage(self) -> str: ...
+    def writeToFile(self, d: typing.Optional[QtCore.QIODevice], codec: typing.Optional[str]) -> 'QgsDxfExport.ExportResult': ...
+    def addLayers(self, layers: collections.abc.Iterable['QgsDxfExport.DxfLayer']) -> None: ...
+    def flags(self) -> 'QgsDxfExport.Flags': ...
+    def setFlags(self, flags: typing.Union['QgsDxfExport.Flags', 'QgsDxfExport.Flag']) -> None: ...
+    def setMapSettings(self, settings: QgsMapSettings) -> None: ...
+    SymbologyExport: typing.Type[Qgis.FeatureSymbologyExport]
+    NoSymbology: Qgis.FeatureSymbologyExport
+    FeatureSymbology: Qgis.FeatureSymbologyExport
+    SymbolLayerSymbology: Qgis.FeatureSymbologyExport
@@ -0,0 +1,399 @@
+# The PEP 484 type hints stub file for the _core.editform module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFields, QgsPropertyDefinition
+from .actions import QgsAction
+from .expression import QgsExpression
+from .project import QgsProject
+from .vector import (
+    QgsPolymorphicRelation, QgsPropertyCollection, QgsReadWriteContext,
+    QgsRelation, QgsRelationContext, QgsVectorLayer,
+)
+
+
+class QgsOptionalQgsExpressionBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, data: 'QgsExpression') -> None: ...
+    @typing.overload
+    def __init__(self, data: 'QgsExpression', enabled: bool) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsOptionalQgsExpressionBase') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def setData(self, data: 'QgsExpression') -> None: ...
+    def data(self) -> 'QgsExpression': ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsOptionalExpression(QgsOptionalQgsExpressionBase):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, expression: 'QgsExpression') -> None: ...
+    @typing.overload
+    def __init__(self, expression: 'QgsExpression', enabled: bool) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsOptionalExpression') -> None: ...
+
+    def readXml(self, element: QtXml.QDomElement) -> None: ...
+    def writeXml(self, element: QtXml.QDomElement) -> None: ...
+
+
+class QgsRelationManager(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+
+    def updateRelationsStatus(self) -> None: ...
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    relationsLoaded: typing.ClassVar[QtCore.pyqtSignal]
+    def setPolymorphicRelations(self, relations: collections.abc.Iterable[QgsPolymorphicRelation]) -> None: ...
+    def removePolymorphicRelation(self, polymorphicRelationId: typing.Optional[str]) -> None: ...
+    def addPolymorphicRelation(self, polymorphicRelation: QgsPolymorphicRelation) -> None: ...
+    def polymorphicRelation(self, polymorphicRelationId: typing.Optional[str]) -> QgsPolymorphicRelation: ...
+    def polymorphicRelations(self) -> dict[str, QgsPolymorphicRelation]: ...
+    @staticmethod
+    def discoverRelations(existingRelations: collections.abc.Iterable[QgsRelation], layers: collections.abc.Iterable[QgsVectorLayer]) -> list[QgsRelation]: ...
+    def referencedRelations(self, layer: typing.Optional[QgsVectorLayer] = ...) -> list[QgsRelation]: ...
+    def referencingRelations(self, layer: typing.Optional[QgsVectorLayer] = ..., fieldIdx: int = ...) -> list[QgsRelation]: ...
+    def clear(self) -> None: ...
+    def relationsByName(self, name: typing.Optional[str]) -> list[QgsRelation]: ...
+    def relation(self, id: typing.Optional[str]) -> QgsRelation: ...
+    @typing.overload
+    def removeRelation(self, id: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def removeRelation(self, relation: QgsRelation) -> None: ...
+    def addRelation(self, relation: QgsRelation) -> None: ...
+    def relations(self) -> dict[str, QgsRelation]: ...
+    def setRelations(self, relations: collections.abc.Iterable[QgsRelation]) -> None: ...
+    def context(self) -> QgsRelationContext: ...
+
+
+class QgsEditFormConfig(PyQt5.sip.wrapper):
+
+    class DataDefinedProperty(int):
+        NoProperty = ... # type: QgsEditFormConfig.DataDefinedProperty
+        AllProperties = ... # type: QgsEditFormConfig.DataDefinedProperty
+        Alias = ... # type: QgsEditFormConfig.DataDefinedProperty
+        Editable = ... # type: QgsEditFormConfig.DataDefinedProperty
+
+    class GroupData(PyQt5.sip.wrapper):
+
+        mFields = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        mName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], fields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsEditFormConfig.GroupData') -> None: ...
+
+    class TabData(PyQt5.sip.wrapper):
+
+        mFields = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        mGroups = ... # type: collections.abc.Iterable['QgsEditFormConfig.GroupData']
+        mName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], fields: collections.abc.Iterable[typing.Optional[str]], groups: collections.abc.Iterable['QgsEditFormConfig.GroupData']) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsEditFormConfig.TabData') -> None: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, o: 'QgsEditFormConfig') -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+
+    def __ne__(self, other: object): ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    def dataDefinedFieldProperties(self, fieldName: typing.Optional[str]) -> QgsPropertyCollection: ...
+    def setDataDefinedFieldProperties(self, fieldName: typing.Optional[str], properties: QgsPropertyCollection) -> None: ...
+    @deprecated("""""")
+    def attributeEditorElementFromDomElement(self, elem: QtXml.QDomElement, parent: typing.Optional['QgsAttributeEditorElement'], layerId: typing.Optional[str] = ..., context: QgsReadWriteContext = ...) -> typing.Optional['QgsAttributeEditorElement']: ...
+    def writeXml(self, node: QtXml.QDomNode, context: QgsReadWriteContext) -> None: ...
+    def readXml(self, node: QtXml.QDomNode, context: QgsReadWriteContext) -> None: ...
+    def setSuppress(self, s: Qgis.AttributeFormSuppression) -> None: ...
+    def suppress(self) -> Qgis.AttributeFormSuppression: ...
+    def setInitCodeSource(self, initCodeSource: Qgis.AttributeFormPythonInitCodeSource) -> None: ...
+    def initCodeSource(self) -> Qgis.AttributeFormPythonInitCodeSource: ...
+    def setInitFilePath(self, filePath: typing.Optional[str]) -> None: ...
+    def initFilePath(self) -> str: ...
+    def setInitCode(self, code: typing.Optional[str]) -> None: ...
+    def initCode(self) -> str: ...
+    def setInitFunction(self, function: typing.Optional[str]) -> None: ...
+    def initFunction(self) -> str: ...
+    def setReuseLastValue(self, index: int, reuse: bool) -> None: ...
+    def reuseLastValue(self, index: int) -> bool: ...
+    def setLabelOnTop(self, idx: int, onTop: bool) -> None: ...
+    def labelOnTop(self, idx: int) -> bool: ...
+    def setReadOnly(self, idx: int, readOnly: bool = ...) -> None: ...
+    def readOnly(self, idx: int) -> bool: ...
+    def removeWidgetConfig(self, widgetName: typing.Optional[str]) -> bool: ...
+    def widgetConfig(self, widgetName: typing.Optional[str]) -> dict[str, typing.Any]: ...
+    def setWidgetConfig(self, widgetName: typing.Optional[str], config: dict[str, typing.Any]) -> bool: ...
+    def setUiForm(self, ui: typing.Optional[str]) -> None: ...
+    def uiForm(self) -> str: ...
+    def setLayout(self, editorLayout: Qgis.AttributeFormLayout) -> None: ...
+    def layout(self) -> Qgis.AttributeFormLayout: ...
+    def invisibleRootContainer(self) -> typing.Optional['QgsAttributeEditorContainer']: ...
+    def clearTabs(self) -> None: ...
+    def tabs(self) -> list['QgsAttributeEditorElement']: ...
+    def addTab(self, data: typing.Optional['QgsAttributeEditorElement']) -> None: ...
+    def __eq__(self, other: object): ...
+    EditorLayout: typing.Type[Qgis.AttributeFormLayout]
+    GeneratedLayout: Qgis.AttributeFormLayout
+    TabLayout: Qgis.AttributeFormLayout
+    UiFileLayout: Qgis.AttributeFormLayout
+    FeatureFormSuppress: typing.Type[Qgis.AttributeFormSuppression]
+    SuppressDefault: Qgis.AttributeFormSuppression
+    SuppressOn: Qgis.AttributeFormSuppression
+    SuppressOff: Qgis.AttributeFormSuppression
+    PythonInitCodeSource: typing.Type[Qgis.AttributeFormPythonInitCodeSource]
+    CodeSourceNone: Qgis.AttributeFormPythonInitCodeSource
+    CodeSourceFile: Qgis.AttributeFormPythonInitCodeSource
+    CodeSourceDialog: Qgis.AttributeFormPythonInitCodeSource
+    CodeSourceEnvironment: Qgis.AttributeFormPythonInitCodeSource
+    NoProperty: QgsEditFormConfig.DataDefinedProperty
+    AllProperties: QgsEditFormConfig.DataDefinedProperty
+    Alias: QgsEditFormConfig.DataDefinedProperty
+    Editable: QgsEditFormConfig.DataDefinedProperty
+
+
+class QgsAttributeEditorElement(PyQt5.sip.wrapper):
+
+    class LabelStyle(PyQt5.sip.wrapper):
+
+        color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+        font = ... # type: QtGui.QFont
+        overrideColor = ... # type: bool
+        overrideFont = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAttributeEditorElement.LabelStyle') -> None: ...
+
+    @typing.overload
+    def __init__(self, type: Qgis.AttributeEditorType, name: typing.Optional[str], parent: typing.Optional['QgsAttributeEditorElement'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorElement') -> None: ...
+
+    def setLabelStyle(self, labelStyle: 'QgsAttributeEditorElement.LabelStyle') -> None: ...
+    def labelStyle(self) -> 'QgsAttributeEditorElement.LabelStyle': ...
+    def setVerticalStretch(self, stretch: int) -> None: ...
+    def verticalStretch(self) -> int: ...
+    def setHorizontalStretch(self, stretch: int) -> None: ...
+    def horizontalStretch(self) -> int: ...
+    def setShowLabel(self, showLabel: bool) -> None: ...
+    def showLabel(self) -> bool: ...
+    def clone(self, parent: typing.Optional['QgsAttributeEditorElement']) -> typing.Optional['QgsAttributeEditorElement']: ...
+    def toDomElement(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def parent(self) -> typing.Optional['QgsAttributeEditorElement']: ...
+    def type(self) -> Qgis.AttributeEditorType: ...
+    def name(self) -> str: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, layerId: typing.Optional[str], fields: QgsFields, context: QgsReadWriteContext, parent: typing.Optional['QgsAttributeEditorElement'] = ...) -> typing.Optional['QgsAttributeEditorElement']: ...
+    AttributeEditorType: typing.Type[Qgis.AttributeEditorType]
+    AeTypeContainer: Qgis.AttributeEditorType
+    AeTypeField: Qgis.AttributeEditorType
+    AeTypeRelation: Qgis.AttributeEditorType
+    AeTypeQmlElement: Qgis.AttributeEditorType
+    AeTypeHtmlElement: Qgis.AttributeEditorType
+    AeTypeAction: Qgis.AttributeEditorType
+    AeTypeTextElement: Qgis.AttributeEditorType
+    AeTypeSpacerElement: Qgis.AttributeEditorType
+    AeTypeInvalid: Qgis.AttributeEditorType
+
+
+class QgsAttributeEditorAction(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, action: QgsAction, parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, uuid: QtCore.QUuid, parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorAction') -> None: ...
+
+    def setAction(self, newAction: QgsAction) -> None: ...
+    def action(self, layer: typing.Optional[QgsVectorLayer]) -> QgsAction: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+
+
+class QgsAttributeEditorContainer(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement], backgroundColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorContainer') -> None: ...
+
+    def setBackgroundColor(self, backgroundColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def setVisibilityExpression(self, visibilityExpression: QgsOptionalExpression) -> None: ...
+    def visibilityExpression(self) -> QgsOptionalExpression: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+    def setColumnCount(self, columnCount: int) -> None: ...
+    def columnCount(self) -> int: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def clear(self) -> None: ...
+    def findElements(self, type: Qgis.AttributeEditorType) -> list[QgsAttributeEditorElement]: ...
+    def children(self) -> list[QgsAttributeEditorElement]: ...
+    def setCollapsed(self, collapsed: bool) -> None: ...
+    def collapsed(self) -> bool: ...
+    @deprecated("""""")
+    def isGroupBox(self) -> bool: ...
+    @deprecated("""""")
+    def setIsGroupBox(self, isGroupBox: bool) -> None: ...
+    def type(self) -> Qgis.AttributeEditorContainerType: ...
+    def setType(self, type: Qgis.AttributeEditorContainerType) -> None: ...
+    def addChildElement(self, element: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+
+
+class QgsAttributeEditorField(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], idx: int, parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorField') -> None: ...
+
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+    def idx(self) -> int: ...
+
+
+class QgsAttributeEditorRelation(QgsAttributeEditorElement):
+
+    class Button(int):
+        Link = ... # type: QgsAttributeEditorRelation.Button
+        Unlink = ... # type: QgsAttributeEditorRelation.Button
+        SaveChildEdits = ... # type: QgsAttributeEditorRelation.Button
+        AddChildFeature = ... # type: QgsAttributeEditorRelation.Button
+        DuplicateChildFeature = ... # type: QgsAttributeEditorRelation.Button
+        DeleteChildFeature = ... # type: QgsAttributeEditorRelation.Button
+        ZoomToChildFeature = ... # type: QgsAttributeEditorRelation.Button
+        AllButtons = ... # type: QgsAttributeEditorRelation.Button
+
+    class Buttons(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __xor__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __ior__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __or__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __iand__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __and__(self, f: typing.Union['QgsAttributeEditorRelation.Buttons', 'QgsAttributeEditorRelation.Button']) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __invert__(self) -> 'QgsAttributeEditorRelation.Buttons': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], relationId: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], relation: QgsRelation, parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, relationId: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, relation: QgsRelation, parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorRelation') -> None: ...
+
+    def setRelationEditorConfiguration(self, config: dict[str, typing.Any]) -> None: ...
+    def relationEditorConfiguration(self) -> dict[str, typing.Any]: ...
+    def setRelationWidgetTypeId(self, relationWidgetTypeId: typing.Optional[str]) -> None: ...
+    def relationWidgetTypeId(self) -> str: ...
+    def setLabel(self, label: typing.Optional[str] = ...) -> None: ...
+    def label(self) -> str: ...
+    def setNmRelationId(self, nmRelationId: typing.Any = ...) -> None: ...
+    def nmRelationId(self) -> typing.Any: ...
+    def setForceSuppressFormPopup(self, forceSuppressFormPopup: bool) -> None: ...
+    def forceSuppressFormPopup(self) -> bool: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+    def init(self, relManager: typing.Optional[QgsRelationManager]) -> bool: ...
+    def relation(self) -> QgsRelation: ...
+
+
+class QgsAttributeEditorHtmlElement(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorHtmlElement') -> None: ...
+
+    def setHtmlCode(self, htmlCode: typing.Optional[str]) -> None: ...
+    def htmlCode(self) -> str: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+
+
+class QgsAttributeEditorTextElement(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorTextElement') -> None: ...
+
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+
+
+class QgsAttributeEditorQmlElement(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorQmlElement') -> None: ...
+
+    def setQmlCode(self, qmlCode: typing.Optional[str]) -> None: ...
+    def qmlCode(self) -> str: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
+
+
+class QgsAttributeEditorSpacerElement(QgsAttributeEditorElement):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional[QgsAttributeEditorElement]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAttributeEditorSpacerElement') -> None: ...
+
+    def setDrawLine(self, drawLine: bool) -> None: ...
+    def drawLine(self) -> bool: ...
+    def clone(self, parent: typing.Optional[QgsAttributeEditorElement]) -> typing.Optional[QgsAttributeEditorElement]: ...
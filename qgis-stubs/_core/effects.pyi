@@ -0,0 +1,429 @@
+# The PEP 484 type hints stub file for the _core.effects module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsColorRamp, QgsFeedback
+from .diagram import QgsMapUnitScale
+from .vector import QgsRenderContext
+
+
+class QgsPaintEffect(PyQt5.sip.wrapper):
+
+    class DrawMode(int):
+        Modifier = ... # type: QgsPaintEffect.DrawMode
+        Render = ... # type: QgsPaintEffect.DrawMode
+        ModifyAndRender = ... # type: QgsPaintEffect.DrawMode
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsPaintEffect') -> None: ...
+
+    @deprecated("""""")
+    def fixQPictureDpi(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    def boundingRect(self, rect: QtCore.QRectF, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def imageOffset(self, context: QgsRenderContext) -> QtCore.QPointF: ...
+    def sourceAsImage(self, context: QgsRenderContext) -> QtGui.QImage: ...
+    def source(self) -> QtGui.QPicture: ...
+    def drawSource(self, painter: QtGui.QPainter) -> None: ...
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def setDrawMode(self, drawMode: 'QgsPaintEffect.DrawMode') -> None: ...
+    def drawMode(self) -> 'QgsPaintEffect.DrawMode': ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def end(self, context: QgsRenderContext) -> None: ...
+    def begin(self, context: QgsRenderContext) -> None: ...
+    def render(self, picture: QtGui.QPicture, context: QgsRenderContext) -> None: ...
+    def saveProperties(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement) -> bool: ...
+    @typing.overload
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def readProperties(self, element: QtXml.QDomElement) -> bool: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+    def clone(self) -> typing.Optional['QgsPaintEffect']: ...
+    def type(self) -> str: ...
+
+
+class QgsBlurEffect(QgsPaintEffect):
+
+    class BlurMethod(int):
+        StackBlur = ... # type: QgsBlurEffect.BlurMethod
+        GaussianBlur = ... # type: QgsBlurEffect.BlurMethod
+
+    def __init__(self) -> None: ...
+
+    def boundingRect(self, rect: QtCore.QRectF, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def blurMethod(self) -> 'QgsBlurEffect.BlurMethod': ...
+    def setBlurMethod(self, method: 'QgsBlurEffect.BlurMethod') -> None: ...
+    def blurMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setBlurMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def blurUnit(self) -> Qgis.RenderUnit: ...
+    def setBlurUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def blurLevel(self) -> float: ...
+    def setBlurLevel(self, level: float) -> None: ...
+    def clone(self) -> typing.Optional['QgsBlurEffect']: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsColorEffect(QgsPaintEffect):
+
+    def __init__(self) -> None: ...
+
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def colorizeStrength(self) -> int: ...
+    def setColorizeStrength(self, colorizeStrength: int) -> None: ...
+    def colorizeColor(self) -> QtGui.QColor: ...
+    def setColorizeColor(self, colorizeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def colorizeOn(self) -> bool: ...
+    def setColorizeOn(self, colorizeOn: bool) -> None: ...
+    def grayscaleMode(self) -> 'QgsImageOperation.GrayscaleMode': ...
+    def setGrayscaleMode(self, grayscaleMode: 'QgsImageOperation.GrayscaleMode') -> None: ...
+    def saturation(self) -> float: ...
+    def setSaturation(self, saturation: float) -> None: ...
+    def contrast(self) -> int: ...
+    def setContrast(self, contrast: int) -> None: ...
+    def brightness(self) -> int: ...
+    def setBrightness(self, brightness: int) -> None: ...
+    def clone(self) -> typing.Optional['QgsColorEffect']: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsEffectStack(QgsPaintEffect):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsEffectStack') -> None: ...
+    @typing.overload
+    def __init__(self, effect: QgsPaintEffect) -> None: ...
+
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def effect(self, index: int) -> typing.Optional[QgsPaintEffect]: ...
+    def count(self) -> int: ...
+    def effectList(self) -> typing.Optional[list[QgsPaintEffect]]: ...
+    def takeEffect(self, index: int) -> typing.Optional[QgsPaintEffect]: ...
+    def changeEffect(self, index: int, effect: typing.Optional[QgsPaintEffect]) -> bool: ...
+    def insertEffect(self, index: int, effect: typing.Optional[QgsPaintEffect]) -> bool: ...
+    def appendEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def readProperties(self, element: QtXml.QDomElement) -> bool: ...
+    @typing.overload
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def saveProperties(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement) -> bool: ...
+    def clone(self) -> typing.Optional['QgsEffectStack']: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsGlowEffect(QgsPaintEffect):
+
+    class GlowColorType(int):
+        SingleColor = ... # type: QgsGlowEffect.GlowColorType
+        ColorRamp = ... # type: QgsGlowEffect.GlowColorType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsGlowEffect') -> None: ...
+
+    def shadeExterior(self) -> bool: ...
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def boundingRect(self, rect: QtCore.QRectF, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def colorType(self) -> 'QgsGlowEffect.GlowColorType': ...
+    def setColorType(self, colorType: 'QgsGlowEffect.GlowColorType') -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def ramp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def blurMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setBlurMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def blurUnit(self) -> Qgis.RenderUnit: ...
+    def setBlurUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def blurLevel(self) -> float: ...
+    def setBlurLevel(self, level: float) -> None: ...
+    def spreadMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSpreadMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def spreadUnit(self) -> Qgis.RenderUnit: ...
+    def setSpreadUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def spread(self) -> float: ...
+    def setSpread(self, spread: float) -> None: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+
+
+class QgsOuterGlowEffect(QgsGlowEffect):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsOuterGlowEffect') -> None: ...
+
+    def shadeExterior(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsOuterGlowEffect']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsInnerGlowEffect(QgsGlowEffect):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsInnerGlowEffect') -> None: ...
+
+    def shadeExterior(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsInnerGlowEffect']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsImageOperation(PyQt5.sip.wrapper):
+
+    class FlipType(int):
+        FlipHorizontal = ... # type: QgsImageOperation.FlipType
+        FlipVertical = ... # type: QgsImageOperation.FlipType
+
+    class GrayscaleMode(int):
+        GrayscaleLightness = ... # type: QgsImageOperation.GrayscaleMode
+        GrayscaleLuminosity = ... # type: QgsImageOperation.GrayscaleMode
+        GrayscaleAverage = ... # type: QgsImageOperation.GrayscaleMode
+        GrayscaleOff = ... # type: QgsImageOperation.GrayscaleMode
+
+    class DistanceTransformProperties(PyQt5.sip.wrapper):
+
+        ramp = ... # type: QgsColorRamp
+        shadeExterior = ... # type: bool
+        spread = ... # type: float
+        useMaxDistance = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsImageOperation.DistanceTransformProperties') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsImageOperation') -> None: ...
+
+    @staticmethod
+    def cropTransparent(image: QtGui.QImage, minSize: QtCore.QSize = ..., center: bool = ...) -> QtGui.QImage: ...
+    @staticmethod
+    def nonTransparentImageRect(image: QtGui.QImage, minSize: QtCore.QSize = ..., center: bool = ...) -> QtCore.QRect: ...
+    @staticmethod
+    def flipImage(image: QtGui.QImage, type: 'QgsImageOperation.FlipType') -> None: ...
+    @staticmethod
+    def gaussianBlur(image: QtGui.QImage, radius: int, feedback: typing.Optional[QgsFeedback] = ...) -> typing.Optional[QtGui.QImage]: ...
+    @staticmethod
+    def stackBlur(image: QtGui.QImage, radius: int, alphaOnly: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @staticmethod
+    def distanceTransform(image: QtGui.QImage, properties: 'QgsImageOperation.DistanceTransformProperties', feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @staticmethod
+    def overlayColor(image: QtGui.QImage, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @staticmethod
+    def multiplyOpacity(image: QtGui.QImage, factor: float, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @staticmethod
+    def adjustHueSaturation(image: QtGui.QImage, saturation: float, colorizeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., colorizeStrength: float = ..., feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @staticmethod
+    def adjustBrightnessContrast(image: QtGui.QImage, brightness: int, contrast: float, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @staticmethod
+    def convertToGrayscale(image: QtGui.QImage, mode: 'QgsImageOperation.GrayscaleMode' = ..., feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+
+
+class QgsDrawSourceEffect(QgsPaintEffect):
+
+    def __init__(self) -> None: ...
+
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsDrawSourceEffect']: ...
+    def type(self) -> str: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsEffectPainter(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, renderContext: QgsRenderContext) -> None: ...
+    @typing.overload
+    def __init__(self, renderContext: QgsRenderContext, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsEffectPainter') -> None: ...
+
+    def setEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+
+
+class QgsPaintEffectAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPaintEffectAbstractMetadata') -> None: ...
+
+    def createWidget(self) -> typing.Optional[QgsPaintEffectWidget]: ...
+    def createPaintEffect(self, map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsPaintEffectRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def isDefaultStack(effect: typing.Optional[QgsPaintEffect]) -> bool: ...
+    @staticmethod
+    def defaultStack() -> typing.Optional[QgsPaintEffect]: ...
+    def effects(self) -> list[str]: ...
+    @typing.overload
+    def createEffect(self, name: typing.Optional[str], properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsPaintEffect]: ...
+    @typing.overload
+    def createEffect(self, element: QtXml.QDomElement) -> typing.Optional[QgsPaintEffect]: ...
+    def addEffectType(self, metadata: typing.Optional[QgsPaintEffectAbstractMetadata]) -> bool: ...
+    def effectMetadata(self, name: typing.Optional[str]) -> typing.Optional[QgsPaintEffectAbstractMetadata]: ...
+
+
+class QgsShadowEffect(QgsPaintEffect):
+
+    def __init__(self) -> None: ...
+
+    def exteriorShadow(self) -> bool: ...
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def boundingRect(self, rect: QtCore.QRectF, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetDistance(self) -> float: ...
+    def setOffsetDistance(self, distance: float) -> None: ...
+    def offsetAngle(self) -> int: ...
+    def setOffsetAngle(self, angle: int) -> None: ...
+    def blurMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setBlurMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def blurUnit(self) -> Qgis.RenderUnit: ...
+    def setBlurUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def blurLevel(self) -> float: ...
+    def setBlurLevel(self, level: float) -> None: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def flags(self) -> Qgis.PaintEffectFlags: ...
+
+
+class QgsDropShadowEffect(QgsShadowEffect):
+
+    def __init__(self) -> None: ...
+
+    def exteriorShadow(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsDropShadowEffect']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsInnerShadowEffect(QgsShadowEffect):
+
+    def __init__(self) -> None: ...
+
+    def exteriorShadow(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsInnerShadowEffect']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
+
+
+class QgsTransformEffect(QgsPaintEffect):
+
+    def __init__(self) -> None: ...
+
+    def boundingRect(self, rect: QtCore.QRectF, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def draw(self, context: QgsRenderContext) -> None: ...
+    def reflectY(self) -> bool: ...
+    def setReflectY(self, reflectY: bool) -> None: ...
+    def reflectX(self) -> bool: ...
+    def setReflectX(self, reflectX: bool) -> None: ...
+    def shearY(self) -> float: ...
+    def setShearY(self, shearY: float) -> None: ...
+    def shearX(self) -> float: ...
+    def setShearX(self, shearX: float) -> None: ...
+    def rotation(self) -> float: ...
+    def setRotation(self, rotation: float) -> None: ...
+    def scaleY(self) -> float: ...
+    def setScaleY(self, scaleY: float) -> None: ...
+    def scaleX(self) -> float: ...
+    def setScaleX(self, scaleX: float) -> None: ...
+    def translateMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setTranslateMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def translateUnit(self) -> Qgis.RenderUnit: ...
+    def setTranslateUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def translateY(self) -> float: ...
+    def setTranslateY(self, translateY: float) -> None: ...
+    def translateX(self) -> float: ...
+    def setTranslateX(self, translateX: float) -> None: ...
+    def clone(self) -> typing.Optional['QgsTransformEffect']: ...
+    def readProperties(self, props: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(map: dict[str, typing.Any]) -> typing.Optional[QgsPaintEffect]: ...
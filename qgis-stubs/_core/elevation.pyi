@@ -0,0 +1,505 @@
+# The PEP 484 type hints stub file for the _core.elevation module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDoubleRange, QgsFeedback, QgsVirtualLayerDefinition,
+)
+from .geometry import QgsCurve, QgsGeometry, QgsPoint
+from .layertree import QgsLayerTreeFilterSettings
+from .mesh import QgsMeshLayer
+from .pointcloud import QgsVectorFileWriter
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .project import QgsProject
+from .raster import QgsRasterLayer
+from .symbology import QgsLineSymbol
+from .vector import (
+    QgsExpressionContext, QgsFeatureSink, QgsMapLayer, QgsReadWriteContext,
+    QgsRenderContext, QgsVectorLayer,
+)
+
+
+class QgsAbstractProfileSource(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractProfileSource') -> None: ...
+
+    def createProfileGenerator(self, request: 'QgsProfileRequest') -> typing.Optional['QgsAbstractProfileGenerator']: ...
+
+
+class QgsTask(QtCore.QObject):
+
+    class SubTaskDependency(int):
+        SubTaskIndependent = ... # type: QgsTask.SubTaskDependency
+        ParentDependsOnSubTask = ... # type: QgsTask.SubTaskDependency
+
+    class Flag(int):
+        CanCancel = ... # type: QgsTask.Flag
+        CancelWithoutPrompt = ... # type: QgsTask.Flag
+        Hidden = ... # type: QgsTask.Flag
+        Silent = ... # type: QgsTask.Flag
+        AllFlags = ... # type: QgsTask.Flag
+
+    class TaskStatus(int):
+        Queued = ... # type: QgsTask.TaskStatus
+        OnHold = ... # type: QgsTask.TaskStatus
+        Running = ... # type: QgsTask.TaskStatus
+        Complete = ... # type: QgsTask.TaskStatus
+        Terminated = ... # type: QgsTask.TaskStatus
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __xor__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __ior__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __or__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __iand__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __and__(self, f: typing.Union['QgsTask.Flags', 'QgsTask.Flag']) -> 'QgsTask.Flags': ...
+        def __invert__(self) -> 'QgsTask.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, description: typing.Optional[str] = ..., flags: typing.Union['QgsTask.Flags', 'QgsTask.Flag'] = ...) -> None: ...
+
+    def setProgress(self, progress: float) -> None: ...
+    def isCanceled(self) -> bool: ...
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    taskTerminated: typing.ClassVar[QtCore.pyqtSignal]
+    taskCompleted: typing.ClassVar[QtCore.pyqtSignal]
+    begun: typing.ClassVar[QtCore.pyqtSignal]
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    progressChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def waitForFinished(self, timeout: int = ...) -> bool: ...
+    def dependentLayers(self) -> list[QgsMapLayer]: ...
+    def setDependentLayers(self, dependentLayers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def addSubTask(self, subTask: typing.Optional['QgsTask'], dependencies: collections.abc.Iterable['QgsTask'] = ..., subTaskDependency: 'QgsTask.SubTaskDependency' = ...) -> None: ...
+    def unhold(self) -> None: ...
+    def hold(self) -> None: ...
+    def cancel(self) -> None: ...
+    def elapsedTime(self) -> int: ...
+    def progress(self) -> float: ...
+    def description(self) -> str: ...
+    def status(self) -> 'QgsTask.TaskStatus': ...
+    def isActive(self) -> bool: ...
+    def canCancel(self) -> bool: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def flags(self) -> 'QgsTask.Flags': ...
+    fromFunction: typing.Type[_fromFunction]
+
+
+class QgsCopyFileTask(QgsTask):
+
+    def __init__(self, source: typing.Optional[str], destination: typing.Optional[str]) -> None: ...
+
+    def destination(self) -> str: ...
+    def errorString(self) -> str: ...
+    def run(self) -> bool: ...
+
+
+class QgsMapHitTestTask(QgsTask):
+
+    def __init__(self, settings: 'QgsLayerTreeFilterSettings') -> None: ...
+
+    def run(self) -> bool: ...
+    def cancel(self) -> None: ...
+    def results(self) -> typing.Any: ...
+
+
+class QgsProxyProgressTask(QgsTask):
+
+    def __init__(self, description: typing.Optional[str], canCancel: bool = ...) -> None: ...
+
+    canceled: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def setProxyProgress(self, progress: float) -> None: ...
+    def run(self) -> bool: ...
+    def finalize(self, result: bool) -> None: ...
+
+
+class QgsTaskWithSerialSubTasks(QgsTask):
+
+    def __init__(self, desc: typing.Optional[str] = ...) -> None: ...
+
+    def run(self) -> bool: ...
+    def cancel(self) -> None: ...
+    def addSubTask(self, subTask: typing.Optional[QgsTask]) -> None: ...
+
+
+class QgsVectorFileWriterTask(QgsTask):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], options: QgsVectorFileWriter.SaveVectorOptions, sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ...) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    writeComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+
+
+class QgsVirtualLayerTask(QgsTask):
+
+    def __init__(self, definition: QgsVirtualLayerDefinition) -> None: ...
+
+    def setExceptionText(self, exceptionText: typing.Optional[str]) -> None: ...
+    def exceptionText(self) -> str: ...
+    def cancel(self) -> None: ...
+    def run(self) -> bool: ...
+    def definition(self) -> QgsVirtualLayerDefinition: ...
+    def takeLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+
+class QgsProfileRenderContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, context: QgsRenderContext) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileRenderContext') -> None: ...
+
+    def setElevationRange(self, range: QgsDoubleRange) -> None: ...
+    def elevationRange(self) -> QgsDoubleRange: ...
+    def setDistanceRange(self, range: QgsDoubleRange) -> None: ...
+    def distanceRange(self) -> QgsDoubleRange: ...
+    def setWorldTransform(self, transform: QtGui.QTransform) -> None: ...
+    def worldTransform(self) -> QtGui.QTransform: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsProfileIdentifyContext(PyQt5.sip.wrapper):
+
+    displayRatioElevationVsDistance = ... # type: float
+    maximumPointDistanceDelta = ... # type: float
+    maximumPointElevationDelta = ... # type: float
+    maximumSurfaceDistanceDelta = ... # type: float
+    maximumSurfaceElevationDelta = ... # type: float
+    project = ... # type: 'QgsProject'
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileIdentifyContext') -> None: ...
+
+
+class QgsProfileIdentifyResults(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsMapLayer] = ..., results: collections.abc.Iterable[dict[str, typing.Any]] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileIdentifyResults') -> None: ...
+
+    def results(self) -> list[dict[str, typing.Any]]: ...
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+
+
+class QgsAbstractProfileResults(PyQt5.sip.wrapper):
+
+    class Feature(PyQt5.sip.wrapper):
+
+        attributes = ... # type: dict[str, typing.Any]
+        geometry = ... # type: 'QgsGeometry'
+        layerIdentifier = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractProfileResults.Feature') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractProfileResults') -> None: ...
+
+    def copyPropertiesFromGenerator(self, generator: typing.Optional['QgsAbstractProfileGenerator']) -> None: ...
+    @typing.overload
+    def identify(self, point: 'QgsProfilePoint', context: QgsProfileIdentifyContext) -> list[QgsProfileIdentifyResults]: ...
+    @typing.overload
+    def identify(self, distanceRange: QgsDoubleRange, elevationRange: QgsDoubleRange, context: QgsProfileIdentifyContext) -> list[QgsProfileIdentifyResults]: ...
+    def snapPoint(self, point: 'QgsProfilePoint', context: 'QgsProfileSnapContext') -> 'QgsProfileSnapResult': ...
+    def zRange(self) -> QgsDoubleRange: ...
+    def renderResults(self, context: QgsProfileRenderContext) -> None: ...
+    def asFeatures(self, type: Qgis.ProfileExportType, feedback: typing.Optional[QgsFeedback] = ...) -> list['QgsAbstractProfileResults.Feature']: ...
+    def asGeometries(self) -> list['QgsGeometry']: ...
+    def sampledPoints(self) -> list['QgsPoint']: ...
+    def distanceToHeightMap(self) -> typing.Any: ...
+    def type(self) -> str: ...
+
+
+class QgsProfileGenerationContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileGenerationContext') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def convertDistanceToPixels(self, size: float, unit: Qgis.RenderUnit) -> float: ...
+    def dpi(self) -> float: ...
+    def setDpi(self, dpi: float) -> None: ...
+    def setElevationRange(self, range: QgsDoubleRange) -> None: ...
+    def elevationRange(self) -> QgsDoubleRange: ...
+    def setDistanceRange(self, range: QgsDoubleRange) -> None: ...
+    def distanceRange(self) -> QgsDoubleRange: ...
+    def setMapUnitsPerDistancePixel(self, units: float) -> None: ...
+    def mapUnitsPerDistancePixel(self) -> float: ...
+    def setMaximumErrorMapUnits(self, error: float) -> None: ...
+    def maximumErrorMapUnits(self) -> float: ...
+
+
+class QgsAbstractProfileGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractProfileGenerator') -> None: ...
+
+    def takeResults(self) -> typing.Optional[QgsAbstractProfileResults]: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def generateProfile(self, context: QgsProfileGenerationContext = ...) -> bool: ...
+    def flags(self) -> Qgis.ProfileGeneratorFlags: ...
+    def sourceId(self) -> str: ...
+
+
+class QgsProfileExporter(PyQt5.sip.wrapper):
+
+    def __init__(self, sources: collections.abc.Iterable[QgsAbstractProfileSource], request: 'QgsProfileRequest', type: Qgis.ProfileExportType) -> None: ...
+
+    def toLayers(self) -> list[QgsVectorLayer]: ...
+    def run(self, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+
+
+class QgsProfileExporterTask(QgsTask):
+
+    class ExportResult(int):
+        Success = ... # type: QgsProfileExporterTask.ExportResult
+        Empty = ... # type: QgsProfileExporterTask.ExportResult
+        DeviceError = ... # type: QgsProfileExporterTask.ExportResult
+        DxfExportFailed = ... # type: QgsProfileExporterTask.ExportResult
+        LayerExportFailed = ... # type: QgsProfileExporterTask.ExportResult
+        Canceled = ... # type: QgsProfileExporterTask.ExportResult
+
+    def __init__(self, sources: collections.abc.Iterable[QgsAbstractProfileSource], request: 'QgsProfileRequest', type: Qgis.ProfileExportType, destination: typing.Optional[str], transformContext: 'QgsCoordinateTransformContext') -> None: ...
+
+    def error(self) -> str: ...
+    def createdFiles(self) -> list[str]: ...
+    def result(self) -> 'QgsProfileExporterTask.ExportResult': ...
+    def takeLayers(self) -> list[QgsVectorLayer]: ...
+    def cancel(self) -> None: ...
+    def run(self) -> bool: ...
+
+
+class QgsProfilePoint(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, distance: float, elevation: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfilePoint') -> None: ...
+
+    def __getitem__(self, a0: int) -> typing.Any: ...
+    def __len__(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def isEmpty(self) -> bool: ...
+    def elevation(self) -> float: ...
+    def distance(self) -> float: ...
+    def setElevation(self, elevation: float) -> None: ...
+    def setDistance(self, distance: float) -> None: ...
+
+
+class QgsProfilePlotRenderer(QtCore.QObject):
+
+    def __init__(self, sources: collections.abc.Iterable[QgsAbstractProfileSource], request: 'QgsProfileRequest') -> None: ...
+
+    generationFinished: typing.ClassVar[QtCore.pyqtSignal]
+    def asFeatures(self, type: Qgis.ProfileExportType, feedback: typing.Optional[QgsFeedback] = ...) -> list[QgsAbstractProfileResults.Feature]: ...
+    @typing.overload
+    def identify(self, point: QgsProfilePoint, context: QgsProfileIdentifyContext) -> list[QgsProfileIdentifyResults]: ...
+    @typing.overload
+    def identify(self, distanceRange: QgsDoubleRange, elevationRange: QgsDoubleRange, context: QgsProfileIdentifyContext) -> list[QgsProfileIdentifyResults]: ...
+    def snapPoint(self, point: QgsProfilePoint, context: 'QgsProfileSnapContext') -> 'QgsProfileSnapResult': ...
+    def renderSubsectionsIndicator(self, context: QgsRenderContext, plotArea: QtCore.QRectF, distanceMin: float, distanceMax: float, zMin: float, zMax: float) -> None: ...
+    def setSubsectionsSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def subsectionsSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    @staticmethod
+    def defaultSubSectionsSymbol() -> typing.Optional['QgsLineSymbol']: ...
+    def render(self, context: QgsRenderContext, width: float, height: float, distanceMin: float, distanceMax: float, zMin: float, zMax: float, sourceId: typing.Optional[str] = ...) -> None: ...
+    def renderToImage(self, width: int, height: int, distanceMin: float, distanceMax: float, zMin: float, zMax: float, sourceId: typing.Optional[str] = ..., devicePixelRatio: float = ...) -> QtGui.QImage: ...
+    def zRange(self) -> QgsDoubleRange: ...
+    def regenerateInvalidatedResults(self) -> None: ...
+    def invalidateResults(self, source: typing.Optional[QgsAbstractProfileSource]) -> bool: ...
+    def replaceSource(self, source: typing.Optional[QgsAbstractProfileSource]) -> None: ...
+    def invalidateAllRefinableSources(self) -> None: ...
+    def setContext(self, context: QgsProfileGenerationContext) -> None: ...
+    def isActive(self) -> bool: ...
+    def waitForFinished(self) -> None: ...
+    def cancelGenerationWithoutBlocking(self) -> None: ...
+    def cancelGeneration(self) -> None: ...
+    def generateSynchronously(self) -> None: ...
+    def startGeneration(self) -> None: ...
+    def sourceIds(self) -> list[str]: ...
+
+
+class QgsProfileRequest(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, curve: typing.Optional['QgsCurve']) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsProfileRequest') -> None: ...
+
+    def setExpressionContext(self, context: QgsExpressionContext) -> 'QgsProfileRequest': ...
+    def expressionContext(self) -> QgsExpressionContext: ...
+    def stepDistance(self) -> float: ...
+    def setStepDistance(self, distance: float) -> 'QgsProfileRequest': ...
+    def terrainProvider(self) -> typing.Optional['QgsAbstractTerrainProvider']: ...
+    def setTerrainProvider(self, provider: typing.Optional['QgsAbstractTerrainProvider']) -> 'QgsProfileRequest': ...
+    def tolerance(self) -> float: ...
+    def setTolerance(self, tolerance: float) -> 'QgsProfileRequest': ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> 'QgsProfileRequest': ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> 'QgsProfileRequest': ...
+    def profileCurve(self) -> typing.Optional['QgsCurve']: ...
+    def setProfileCurve(self, curve: typing.Optional['QgsCurve']) -> 'QgsProfileRequest': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsProfileSnapContext(PyQt5.sip.wrapper):
+
+    displayRatioElevationVsDistance = ... # type: float
+    maximumPointDistanceDelta = ... # type: float
+    maximumPointElevationDelta = ... # type: float
+    maximumSurfaceDistanceDelta = ... # type: float
+    maximumSurfaceElevationDelta = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileSnapContext') -> None: ...
+
+
+class QgsProfileSnapResult(PyQt5.sip.wrapper):
+
+    snappedPoint = ... # type: QgsProfilePoint
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileSnapResult') -> None: ...
+
+    def isValid(self) -> bool: ...
+
+
+class QgsProfileSourceRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProfileSourceRegistry') -> None: ...
+
+    def unregisterProfileSource(self, source: typing.Optional[QgsAbstractProfileSource]) -> None: ...
+    def registerProfileSource(self, source: typing.Optional[QgsAbstractProfileSource]) -> None: ...
+    def profileSources(self) -> list[QgsAbstractProfileSource]: ...
+
+
+class QgsAbstractTerrainProvider(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def readCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def setOffset(self, offset: float) -> None: ...
+    def offset(self) -> float: ...
+    def setScale(self, scale: float) -> None: ...
+    def scale(self) -> float: ...
+    def heightAt(self, x: float, y: float) -> float: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def prepare(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsAbstractTerrainProvider']: ...
+    def type(self) -> str: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def equals(self, other: typing.Optional['QgsAbstractTerrainProvider']) -> bool: ...
+
+
+class QgsFlatTerrainProvider(QgsAbstractTerrainProvider):
+
+    def __init__(self) -> None: ...
+
+    def equals(self, other: typing.Optional[QgsAbstractTerrainProvider]) -> bool: ...
+    def prepare(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsFlatTerrainProvider']: ...
+    def heightAt(self, x: float, y: float) -> float: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def type(self) -> str: ...
+
+
+class QgsRasterDemTerrainProvider(QgsAbstractTerrainProvider):
+
+    def __init__(self) -> None: ...
+
+    def layer(self) -> typing.Optional['QgsRasterLayer']: ...
+    def setLayer(self, layer: typing.Optional['QgsRasterLayer']) -> None: ...
+    def prepare(self) -> None: ...
+    def equals(self, other: typing.Optional[QgsAbstractTerrainProvider]) -> bool: ...
+    def clone(self) -> typing.Optional['QgsRasterDemTerrainProvider']: ...
+    def heightAt(self, x: float, y: float) -> float: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def type(self) -> str: ...
+
+
+class QgsMeshTerrainProvider(QgsAbstractTerrainProvider):
+
+    def __init__(self) -> None: ...
+
+    def layer(self) -> typing.Optional['QgsMeshLayer']: ...
+    def setLayer(self, layer: typing.Optional['QgsMeshLayer']) -> None: ...
+    def prepare(self) -> None: ...
+    def equals(self, other: typing.Optional[QgsAbstractTerrainProvider]) -> bool: ...
+    def clone(self) -> typing.Optional['QgsMeshTerrainProvider']: ...
+    def heightAt(self, x: float, y: float) -> float: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def type(self) -> str: ...
@@ -0,0 +1,896 @@
+# The PEP 484 type hints stub file for the _core.expression module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsField, QgsFields
+from .dxf import QgsMapSettings
+from .geometry import QgsGeometry, QgsPoint, QgsRectangle
+from .layout import (
+    QgsLayout, QgsLayoutAtlas, QgsLayoutItem, QgsLayoutMultiFrame,
+)
+from .mesh import QgsMesh
+from .processing import (
+    QgsProcessingAlgorithm, QgsProcessingContext, QgsProcessingModelAlgorithm,
+)
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .project import QgsProject, QgsSnappingConfig
+from .symbology import QgsSymbol
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextScope, QgsFeature, QgsMapLayer,
+    QgsPointXY, QgsRenderContext, QgsVectorLayer,
+)
+
+
+class QgsCadUtils(PyQt5.sip.wrapper):
+
+    class AlignMapPointConstraint(PyQt5.sip.wrapper):
+
+        locked = ... # type: bool
+        relative = ... # type: bool
+        value = ... # type: float
+
+        @typing.overload
+        def __init__(self, locked: bool = ..., relative: bool = ..., value: float = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCadUtils.AlignMapPointConstraint') -> None: ...
+
+    class AlignMapPointOutput(PyQt5.sip.wrapper):
+
+        edgeMatch = ... # type: 'QgsPointLocator.Match'
+        finalMapPoint = ... # type: 'QgsPointXY'
+        snapMatch = ... # type: 'QgsPointLocator.Match'
+        softLockCommonAngle = ... # type: float
+        softLockLineExtension = ... # type: Qgis.LineExtensionSide
+        softLockX = ... # type: float
+        softLockY = ... # type: float
+        valid = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCadUtils.AlignMapPointOutput') -> None: ...
+
+    class AlignMapPointContext(PyQt5.sip.wrapper):
+
+        angleConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        commonAngleConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        distanceConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        lineExtensionConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        mConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        mapUnitsPerPixel = ... # type: float
+        snappingToFeaturesOverridesCommonAngle = ... # type: bool
+        snappingUtils = ... # type: 'QgsSnappingUtils'
+        xConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        xyVertexConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        yConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+        zConstraint = ... # type: 'QgsCadUtils.AlignMapPointConstraint'
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCadUtils.AlignMapPointContext') -> None: ...
+
+        def _cadPointList(self) -> list['QgsPointXY']: ...
+        def _setCadPointList(self, list: collections.abc.Iterable['QgsPointXY']) -> None: ...
+        def cadPoint(self, index: int) -> 'QgsPoint': ...
+        def setCadPoint(self, index: int, point: 'QgsPoint') -> None: ...
+        def setCadPoints(self, points: collections.abc.Iterable['QgsPoint']) -> None: ...
+        def cadPoints(self) -> list['QgsPoint']: ...
+        @property
+        def cadPointList(self) -> list['QgsPointXY']: ...
+        @cadPointList.setter
+        def cadPointList(self, list: collections.abc.Iterable['QgsPointXY']) -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCadUtils') -> None: ...
+
+    @staticmethod
+    def alignMapPoint(originalMapPoint: 'QgsPointXY', ctx: 'QgsCadUtils.AlignMapPointContext') -> 'QgsCadUtils.AlignMapPointOutput': ...
+
+
+class QgsDistanceArea(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsDistanceArea') -> None: ...
+
+    def splitGeometryAtAntimeridian(self, geometry: 'QgsGeometry') -> 'QgsGeometry': ...
+    def latitudeGeodesicCrossesAntimeridian(self, p1: 'QgsPointXY', p2: 'QgsPointXY') -> typing.Tuple[float, float]: ...
+    def geodesicLine(self, p1: 'QgsPointXY', p2: 'QgsPointXY', interval: float, breakLine: bool = ...) -> typing.Any: ...
+    def computeSpheroidProject(self, p1: 'QgsPointXY', distance: float = ..., azimuth: float = ...) -> 'QgsPointXY': ...
+    def convertAreaMeasurement(self, area: float, toUnits: Qgis.AreaUnit) -> float: ...
+    def convertLengthMeasurement(self, length: float, toUnits: Qgis.DistanceUnit) -> float: ...
+    @staticmethod
+    def formatArea(area: float, decimals: int, unit: Qgis.AreaUnit, keepBaseUnit: bool = ...) -> str: ...
+    @staticmethod
+    def formatDistance(distance: float, decimals: int, unit: Qgis.DistanceUnit, keepBaseUnit: bool = ...) -> str: ...
+    def bearing(self, p1: 'QgsPointXY', p2: 'QgsPointXY') -> float: ...
+    def measurePolygon(self, points: collections.abc.Iterable['QgsPointXY']) -> float: ...
+    def areaUnits(self) -> Qgis.AreaUnit: ...
+    def lengthUnits(self) -> Qgis.DistanceUnit: ...
+    def measureLineProjected(self, p1: 'QgsPointXY', distance: float = ..., azimuth: float = ...) -> typing.Tuple[float, typing.Optional['QgsPointXY']]: ...
+    @typing.overload
+    def measureLine(self, points: collections.abc.Iterable['QgsPointXY']) -> float: ...
+    @typing.overload
+    def measureLine(self, p1: 'QgsPointXY', p2: 'QgsPointXY') -> float: ...
+    def measurePerimeter(self, geometry: 'QgsGeometry') -> float: ...
+    def measureLength(self, geometry: 'QgsGeometry') -> float: ...
+    def measureArea(self, geometry: 'QgsGeometry') -> float: ...
+    def ellipsoidInverseFlattening(self) -> float: ...
+    def ellipsoidSemiMinor(self) -> float: ...
+    def ellipsoidSemiMajor(self) -> float: ...
+    def ellipsoid(self) -> str: ...
+    @typing.overload
+    def setEllipsoid(self, ellipsoid: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def setEllipsoid(self, semiMajor: float, semiMinor: float) -> bool: ...
+    def ellipsoidCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def sourceCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setSourceCrs(self, crs: 'QgsCoordinateReferenceSystem', context: 'QgsCoordinateTransformContext') -> None: ...
+    def willUseEllipsoid(self) -> bool: ...
+
+
+class QgsExpressionFunction(PyQt5.sip.wrapper):
+
+    class Parameter(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], optional: bool = ..., defaultValue: typing.Any = ..., isSubExpression: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpressionFunction.Parameter') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def isSubExpression(self) -> bool: ...
+        def defaultValue(self) -> typing.Any: ...
+        def optional(self) -> bool: ...
+        def name(self) -> str: ...
+
+    @typing.overload
+    def __init__(self, fnname: typing.Optional[str], params: int, group: typing.Optional[str], helpText: typing.Optional[str] = ..., lazyEval: bool = ..., handlesNull: bool = ..., isContextual: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fnname: typing.Optional[str], params: int, groups: collections.abc.Iterable[typing.Optional[str]], helpText: typing.Optional[str] = ..., lazyEval: bool = ..., handlesNull: bool = ..., isContextual: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fnname: typing.Optional[str], params: collections.abc.Iterable['QgsExpressionFunction.Parameter'], group: typing.Optional[str], helpText: typing.Optional[str] = ..., lazyEval: bool = ..., handlesNull: bool = ..., isContextual: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fnname: typing.Optional[str], params: collections.abc.Iterable['QgsExpressionFunction.Parameter'], groups: collections.abc.Iterable[typing.Optional[str]], helpText: typing.Optional[str] = ..., lazyEval: bool = ..., handlesNull: bool = ..., isContextual: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionFunction') -> None: ...
+
+    def __ne__(self, other: object): ...
+    @staticmethod
+    def allParamsStatic(node: typing.Optional['QgsExpressionNodeFunction'], parent: typing.Optional['QgsExpression'], context: typing.Optional['QgsExpressionContext']) -> bool: ...
+    def handlesNull(self) -> bool: ...
+    def __eq__(self, other: object): ...
+    def run(self, args: typing.Optional['QgsExpressionNode.NodeList'], context: typing.Optional['QgsExpressionContext'], parent: typing.Optional['QgsExpression'], node: typing.Optional['QgsExpressionNodeFunction']) -> typing.Any: ...
+    def func(self, values: collections.abc.Iterable[typing.Any], context: typing.Optional['QgsExpressionContext'], parent: typing.Optional['QgsExpression'], node: typing.Optional['QgsExpressionNodeFunction']) -> typing.Any: ...
+    def helpText(self) -> str: ...
+    def groups(self) -> list[str]: ...
+    def group(self) -> str: ...
+    def isDeprecated(self) -> bool: ...
+    def isContextual(self) -> bool: ...
+    def referencedColumns(self, node: typing.Optional['QgsExpressionNodeFunction']) -> set[str]: ...
+    def prepare(self, node: typing.Optional['QgsExpressionNodeFunction'], parent: typing.Optional['QgsExpression'], context: typing.Optional['QgsExpressionContext']) -> bool: ...
+    def isStatic(self, node: typing.Optional['QgsExpressionNodeFunction'], parent: typing.Optional['QgsExpression'], context: typing.Optional['QgsExpressionContext']) -> bool: ...
+    def lazyEval(self) -> bool: ...
+    def aliases(self) -> list[str]: ...
+    def usesGeometry(self, node: typing.Optional['QgsExpressionNodeFunction']) -> bool: ...
+    def parameters(self) -> list['QgsExpressionFunction.Parameter']: ...
+    def minParams(self) -> int: ...
+    def params(self) -> int: ...
+    def name(self) -> str: ...
+
+
+class QgsScopedExpressionFunction(QgsExpressionFunction):
+
+    @typing.overload
+    def __init__(self, fnname: typing.Optional[str], params: typing.Union[int, collections.abc.Iterable[QgsExpressionFunction.Parameter]], group: typing.Optional[str], helpText: typing.Optional[str] = ..., usesGeometry: bool = ..., referencedColumns: collections.abc.Iterable[typing.Optional[str]] = ..., lazyEval: bool = ..., handlesNull: bool = ..., isContextual: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScopedExpressionFunction') -> None: ...
+
+    def isStatic(self, node: typing.Optional['QgsExpressionNodeFunction'], parent: typing.Optional['QgsExpression'], context: typing.Optional['QgsExpressionContext']) -> bool: ...
+    def referencedColumns(self, node: typing.Optional['QgsExpressionNodeFunction']) -> set[str]: ...
+    def usesGeometry(self, node: typing.Optional['QgsExpressionNodeFunction']) -> bool: ...
+    def clone(self) -> typing.Optional['QgsScopedExpressionFunction']: ...
+    def func(self, values: collections.abc.Iterable[typing.Any], context: typing.Optional['QgsExpressionContext'], parent: typing.Optional['QgsExpression'], node: typing.Optional['QgsExpressionNodeFunction']) -> typing.Any: ...
+
+
+class QgsExpressionFieldBuffer(PyQt5.sip.wrapper):
+
+    class ExpressionField(PyQt5.sip.wrapper):
+
+        cachedExpression = ... # type: 'QgsExpression'
+        field = ... # type: 'QgsField'
+
+        @typing.overload
+        def __init__(self, exp: typing.Optional[str], fld: 'QgsField') -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpressionFieldBuffer.ExpressionField') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionFieldBuffer') -> None: ...
+
+    def expressions(self) -> list['QgsExpressionFieldBuffer.ExpressionField']: ...
+    def updateFields(self, flds: 'QgsFields') -> None: ...
+    def readXml(self, layer_node: QtXml.QDomNode) -> None: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, document: QtXml.QDomDocument) -> None: ...
+    def updateExpression(self, index: int, exp: typing.Optional[str]) -> None: ...
+    def renameExpression(self, index: int, name: typing.Optional[str]) -> None: ...
+    def removeExpression(self, index: int) -> None: ...
+    def addExpression(self, exp: typing.Optional[str], fld: 'QgsField') -> None: ...
+
+
+class QgsPointLocator(QtCore.QObject):
+
+    class Type(int):
+        Invalid = ... # type: QgsPointLocator.Type
+        Vertex = ... # type: QgsPointLocator.Type
+        Edge = ... # type: QgsPointLocator.Type
+        Area = ... # type: QgsPointLocator.Type
+        Centroid = ... # type: QgsPointLocator.Type
+        MiddleOfSegment = ... # type: QgsPointLocator.Type
+        LineEndpoint = ... # type: QgsPointLocator.Type
+        All = ... # type: QgsPointLocator.Type
+
+    class Types(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __xor__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __ior__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __or__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __iand__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __and__(self, f: typing.Union['QgsPointLocator.Types', 'QgsPointLocator.Type']) -> 'QgsPointLocator.Types': ...
+        def __invert__(self) -> 'QgsPointLocator.Types': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class Match(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, t: 'QgsPointLocator.Type', vl: typing.Optional[QgsVectorLayer], fid: int, dist: float, pt: 'QgsPointXY', vertexIndex: int = ..., edgePoints: typing.Optional['QgsPointXY'] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPointLocator.Match') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def interpolatedPoint(self, destinationCrs: 'QgsCoordinateReferenceSystem' = ...) -> 'QgsPoint': ...
+        def edgePoints(self) -> typing.Tuple['QgsPointXY', 'QgsPointXY']: ...
+        def featureId(self) -> int: ...
+        def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+        def vertexIndex(self) -> int: ...
+        def point(self) -> 'QgsPointXY': ...
+        def distance(self) -> float: ...
+        def hasLineEndpoint(self) -> bool: ...
+        def hasMiddleSegment(self) -> bool: ...
+        def hasArea(self) -> bool: ...
+        def hasCentroid(self) -> bool: ...
+        def hasEdge(self) -> bool: ...
+        def hasVertex(self) -> bool: ...
+        def isValid(self) -> bool: ...
+        def type(self) -> 'QgsPointLocator.Type': ...
+
+    class MatchFilter(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPointLocator.MatchFilter') -> None: ...
+
+        def acceptMatch(self, match: 'QgsPointLocator.Match') -> bool: ...
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], destinationCrs: 'QgsCoordinateReferenceSystem' = ..., transformContext: 'QgsCoordinateTransformContext' = ..., extent: typing.Optional['QgsRectangle'] = ...) -> None: ...
+
+    def destroyIndex(self) -> None: ...
+    def rebuildIndex(self, maxFeaturesToIndex: int = ...) -> bool: ...
+    initFinished: typing.ClassVar[QtCore.pyqtSignal]
+    def waitForIndexingFinished(self) -> None: ...
+    def isIndexing(self) -> bool: ...
+    def cachedGeometryCount(self) -> int: ...
+    def pointInPolygon(self, point: 'QgsPointXY', relaxed: bool = ..., filter: typing.Optional['QgsPointLocator.MatchFilter'] = ...) -> list['QgsPointLocator.Match']: ...
+    @typing.overload
+    def verticesInRect(self, rect: 'QgsRectangle', filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> list['QgsPointLocator.Match']: ...
+    @typing.overload
+    def verticesInRect(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> list['QgsPointLocator.Match']: ...
+    @typing.overload
+    def edgesInRect(self, rect: 'QgsRectangle', filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> list['QgsPointLocator.Match']: ...
+    @typing.overload
+    def edgesInRect(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> list['QgsPointLocator.Match']: ...
+    def nearestArea(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def nearestEdge(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def nearestLineEndpoints(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def nearestMiddleOfSegment(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def nearestCentroid(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def nearestVertex(self, point: 'QgsPointXY', tolerance: float, filter: typing.Optional['QgsPointLocator.MatchFilter'] = ..., relaxed: bool = ...) -> 'QgsPointLocator.Match': ...
+    def hasIndex(self) -> bool: ...
+    def init(self, maxFeaturesToIndex: int = ..., relaxed: bool = ...) -> bool: ...
+    def setRenderContext(self, context: typing.Optional['QgsRenderContext']) -> None: ...
+    def setExtent(self, extent: typing.Optional['QgsRectangle']) -> None: ...
+    def extent(self) -> typing.Optional['QgsRectangle']: ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+
+class QgsSnappingUtils(QtCore.QObject):
+
+    class IndexingStrategy(int):
+        IndexAlwaysFull = ... # type: QgsSnappingUtils.IndexingStrategy
+        IndexNeverFull = ... # type: QgsSnappingUtils.IndexingStrategy
+        IndexHybrid = ... # type: QgsSnappingUtils.IndexingStrategy
+        IndexExtent = ... # type: QgsSnappingUtils.IndexingStrategy
+
+    class LayerConfig(PyQt5.sip.wrapper):
+
+        layer = ... # type: QgsVectorLayer
+        tolerance = ... # type: float
+        type = ... # type: typing.Union[QgsPointLocator.Types, QgsPointLocator.Type]
+        unit = ... # type: Qgis.MapToolUnit
+
+        @typing.overload
+        def __init__(self, l: typing.Optional[QgsVectorLayer], t: typing.Union[QgsPointLocator.Types, QgsPointLocator.Type], tol: float, u: Qgis.MapToolUnit) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSnappingUtils.LayerConfig') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., enableSnappingForInvisibleFeature: bool = ...) -> None: ...
+
+    def clearAllLocators(self) -> None: ...
+    def prepareIndexProgress(self, index: int) -> None: ...
+    def prepareIndexStarting(self, count: int) -> None: ...
+    configChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def toggleEnabled(self) -> None: ...
+    def setConfig(self, snappingConfig: QgsSnappingConfig) -> None: ...
+    def getExtraSnapLayers(self) -> set[QgsVectorLayer]: ...
+    def removeExtraSnapLayer(self, vl: typing.Optional[QgsVectorLayer]) -> None: ...
+    def addExtraSnapLayer(self, vl: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setEnableSnappingForInvisibleFeature(self, enable: bool) -> None: ...
+    def config(self) -> QgsSnappingConfig: ...
+    def dump(self) -> str: ...
+    def layers(self) -> list['QgsSnappingUtils.LayerConfig']: ...
+    def indexingStrategy(self) -> 'QgsSnappingUtils.IndexingStrategy': ...
+    def setIndexingStrategy(self, strategy: 'QgsSnappingUtils.IndexingStrategy') -> None: ...
+    def currentLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setCurrentLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def mapSettings(self) -> QgsMapSettings: ...
+    def setMapSettings(self, settings: QgsMapSettings) -> None: ...
+    def snapToCurrentLayer(self, point: QtCore.QPoint, type: typing.Union[QgsPointLocator.Types, QgsPointLocator.Type], filter: typing.Optional[QgsPointLocator.MatchFilter] = ...) -> QgsPointLocator.Match: ...
+    @typing.overload
+    def snapToMap(self, point: QtCore.QPoint, filter: typing.Optional[QgsPointLocator.MatchFilter] = ..., relaxed: bool = ...) -> QgsPointLocator.Match: ...
+    @typing.overload
+    def snapToMap(self, pointMap: QgsPointXY, filter: typing.Optional[QgsPointLocator.MatchFilter] = ..., relaxed: bool = ...) -> QgsPointLocator.Match: ...
+    def locatorForLayer(self, vl: typing.Optional[QgsVectorLayer]) -> typing.Optional[QgsPointLocator]: ...
+
+
+class QgsExpression(PyQt5.sip.wrapper):
+
+    class SpatialOperator(int):
+        soBbox = ... # type: QgsExpression.SpatialOperator
+        soIntersects = ... # type: QgsExpression.SpatialOperator
+        soContains = ... # type: QgsExpression.SpatialOperator
+        soCrosses = ... # type: QgsExpression.SpatialOperator
+        soEquals = ... # type: QgsExpression.SpatialOperator
+        soDisjoint = ... # type: QgsExpression.SpatialOperator
+        soOverlaps = ... # type: QgsExpression.SpatialOperator
+        soTouches = ... # type: QgsExpression.SpatialOperator
+        soWithin = ... # type: QgsExpression.SpatialOperator
+
+    class ParserError(PyQt5.sip.wrapper):
+
+        class ParserErrorType(int):
+            Unknown = ... # type: QgsExpression.ParserError.ParserErrorType
+            FunctionUnknown = ... # type: QgsExpression.ParserError.ParserErrorType
+            FunctionWrongArgs = ... # type: QgsExpression.ParserError.ParserErrorType
+            FunctionInvalidParams = ... # type: QgsExpression.ParserError.ParserErrorType
+            FunctionNamedArgsError = ... # type: QgsExpression.ParserError.ParserErrorType
+
+        errorMsg = ... # type: typing.Optional[str]
+        errorType = ... # type: 'QgsExpression.ParserError.ParserErrorType'
+        firstColumn = ... # type: int
+        firstLine = ... # type: int
+        lastColumn = ... # type: int
+        lastLine = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpression.ParserError') -> None: ...
+
+    @typing.overload
+    def __init__(self, expr: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsExpression') -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def attemptReduceToInClause(expressions: collections.abc.Iterable[typing.Optional[str]]) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def isFieldEqualityExpression(expression: typing.Optional[str]) -> typing.Tuple[bool, str, typing.Any]: ...
+    @typing.overload
+    @staticmethod
+    def createFieldEqualityExpression(fieldName: typing.Optional[str], value: typing.Any, fieldType: QtCore.QMetaType.Type = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createFieldEqualityExpression(fieldName: typing.Optional[str], value: typing.Any, fieldType: QtCore.QVariant.Type) -> str: ...
+    @staticmethod
+    def formatPreviewString(value: typing.Any, htmlOutput: bool = ..., maximumPreviewLength: int = ...) -> str: ...
+    @staticmethod
+    def group(group: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def formatVariableHelp(description: typing.Optional[str], showValue: bool = ..., value: typing.Any = ...) -> str: ...
+    @staticmethod
+    def variableHelpText(variableName: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def addVariableHelpText(name: typing.Optional[str], description: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def tags(name: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def helpText(name: typing.Optional[str]) -> str: ...
+    @typing.overload
+    @staticmethod
+    def quotedValue(value: typing.Any) -> str: ...
+    @typing.overload
+    @staticmethod
+    def quotedValue(value: typing.Any, type: QtCore.QMetaType.Type) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def quotedValue(value: typing.Any, type: QtCore.QVariant.Type) -> str: ...
+    @staticmethod
+    def quotedString(text: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def quotedColumnRef(name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def functionCount() -> int: ...
+    @staticmethod
+    def functionIndex(name: typing.Optional[str]) -> int: ...
+    @staticmethod
+    def isFunctionName(name: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def cleanRegisteredFunctions() -> None: ...
+    @staticmethod
+    def unregisterFunction(name: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def registerFunction(function: typing.Optional[QgsExpressionFunction], transferOwnership: bool = ...) -> bool: ...
+    @staticmethod
+    def BuiltinFunctions() -> list[str]: ...
+    @staticmethod
+    def Functions() -> list[QgsExpressionFunction]: ...
+    @staticmethod
+    def evaluateToDouble(text: typing.Optional[str], fallbackValue: float) -> float: ...
+    @staticmethod
+    def replaceExpressionText(action: typing.Optional[str], context: typing.Optional[QgsExpressionContext], distanceArea: typing.Optional[QgsDistanceArea] = ...) -> str: ...
+    def setAreaUnits(self, unit: Qgis.AreaUnit) -> None: ...
+    def areaUnits(self) -> Qgis.AreaUnit: ...
+    def setDistanceUnits(self, unit: Qgis.DistanceUnit) -> None: ...
+    def distanceUnits(self) -> Qgis.DistanceUnit: ...
+    def setGeomCalculator(self, calc: typing.Optional[QgsDistanceArea]) -> None: ...
+    def geomCalculator(self) -> typing.Optional[QgsDistanceArea]: ...
+    def dump(self) -> str: ...
+    def expression(self) -> str: ...
+    def setExpression(self, expression: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def checkExpression(text: typing.Optional[str], context: typing.Optional[QgsExpressionContext]) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def quoteFieldExpression(expression: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> str: ...
+    @staticmethod
+    def expressionToLayerFieldIndex(expression: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> int: ...
+    def isField(self) -> bool: ...
+    def setEvalErrorString(self, str: typing.Optional[str]) -> None: ...
+    def evalErrorString(self) -> str: ...
+    def hasEvalError(self) -> bool: ...
+    @typing.overload
+    def evaluate(self) -> typing.Any: ...
+    @typing.overload
+    def evaluate(self, context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedAttributeIndexes(self, fields: QgsFields) -> typing.Any: ...
+    def referencedFunctions(self) -> set[str]: ...
+    @typing.overload
+    def referencedVariables(self) -> set[str]: ...
+    @typing.overload
+    @staticmethod
+    def referencedVariables(text: typing.Optional[str]) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def prepare(self, context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def rootNode(self) -> typing.Optional['QgsExpressionNode']: ...
+    def parserErrors(self) -> list['QgsExpression.ParserError']: ...
+    def parserErrorString(self) -> str: ...
+    def hasParserError(self) -> bool: ...
+    def isValid(self) -> bool: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsExpressionContextUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionContextUtils') -> None: ...
+
+    @staticmethod
+    def meshExpressionScope(elementType: 'QgsMesh.ElementType') -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def registerContextFunctions() -> None: ...
+    @staticmethod
+    def notificationScope(message: typing.Optional[str] = ...) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def processingModelAlgorithmScope(model: typing.Optional['QgsProcessingModelAlgorithm'], parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def processingAlgorithmScope(algorithm: typing.Optional['QgsProcessingAlgorithm'], parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def createFeatureBasedContext(feature: QgsFeature, fields: QgsFields) -> QgsExpressionContext: ...
+    @staticmethod
+    def setLayoutMultiFrameVariables(frame: typing.Optional['QgsLayoutMultiFrame'], variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setLayoutMultiFrameVariable(frame: typing.Optional['QgsLayoutMultiFrame'], name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def multiFrameScope(frame: typing.Optional['QgsLayoutMultiFrame']) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def setLayoutItemVariables(item: typing.Optional['QgsLayoutItem'], variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setLayoutItemVariable(item: typing.Optional['QgsLayoutItem'], name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def layoutItemScope(item: typing.Optional['QgsLayoutItem']) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def atlasScope(atlas: typing.Optional['QgsLayoutAtlas']) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def setLayoutVariables(layout: typing.Optional['QgsLayout'], variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setLayoutVariable(layout: typing.Optional['QgsLayout'], name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def layoutScope(layout: typing.Optional['QgsLayout']) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def updateSymbolScope(symbol: typing.Optional['QgsSymbol'], symbolScope: typing.Optional[QgsExpressionContextScope] = ...) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def mapLayerPositionScope(position: QgsPointXY) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def mapToolCaptureScope(matches: collections.abc.Iterable[QgsPointLocator.Match]) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def mapSettingsScope(mapSettings: QgsMapSettings) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def setLayerVariables(layer: typing.Optional[QgsMapLayer], variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setLayerVariable(layer: typing.Optional[QgsMapLayer], name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def globalProjectLayerScopes(layer: typing.Optional[QgsMapLayer]) -> list[QgsExpressionContextScope]: ...
+    @staticmethod
+    def layerScope(layer: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def removeProjectVariable(project: typing.Optional['QgsProject'], name: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setProjectVariables(project: typing.Optional['QgsProject'], variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setProjectVariable(project: typing.Optional['QgsProject'], name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def projectScope(project: typing.Optional['QgsProject']) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def removeGlobalVariable(name: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setGlobalVariables(variables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def setGlobalVariable(name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def parentFormScope(formFeature: QgsFeature = ..., formMode: typing.Optional[str] = ...) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def formScope(formFeature: QgsFeature = ..., formMode: typing.Optional[str] = ...) -> typing.Optional[QgsExpressionContextScope]: ...
+    @staticmethod
+    def globalScope() -> typing.Optional[QgsExpressionContextScope]: ...
+
+
+class QgsExpressionNode(PyQt5.sip.wrapper):
+
+    class NodeType(int):
+        ntUnaryOperator = ... # type: QgsExpressionNode.NodeType
+        ntBinaryOperator = ... # type: QgsExpressionNode.NodeType
+        ntInOperator = ... # type: QgsExpressionNode.NodeType
+        ntFunction = ... # type: QgsExpressionNode.NodeType
+        ntLiteral = ... # type: QgsExpressionNode.NodeType
+        ntColumnRef = ... # type: QgsExpressionNode.NodeType
+        ntCondition = ... # type: QgsExpressionNode.NodeType
+        ntIndexOperator = ... # type: QgsExpressionNode.NodeType
+        ntBetweenOperator = ... # type: QgsExpressionNode.NodeType
+
+    class NamedNode(PyQt5.sip.wrapper):
+
+        name = ... # type: typing.Optional[str]
+        node = ... # type: 'QgsExpressionNode'
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], node: typing.Optional['QgsExpressionNode']) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpressionNode.NamedNode') -> None: ...
+
+    class NodeList(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpressionNode.NodeList') -> None: ...
+
+        def dump(self) -> str: ...
+        def clone(self) -> typing.Optional['QgsExpressionNode.NodeList']: ...
+        def names(self) -> list[str]: ...
+        def at(self, i: int) -> typing.Optional['QgsExpressionNode']: ...
+        def list(self) -> list['QgsExpressionNode']: ...
+        def hasNamedNodes(self) -> bool: ...
+        def reserve(self, size: int) -> None: ...
+        def count(self) -> int: ...
+        def append(self, node: typing.Optional[typing.Union[QgsExpressionNode, QgsExpressionNode.NamedNode]]) -> None: ...
+
+    parserFirstColumn = ... # type: int
+    parserFirstLine = ... # type: int
+    parserLastColumn = ... # type: int
+    parserLastLine = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsExpressionNode') -> None: ...
+
+    def effectiveNode(self) -> typing.Optional['QgsExpressionNode']: ...
+    def cachedStaticValue(self) -> typing.Any: ...
+    def hasCachedStaticValue(self) -> bool: ...
+    def prepare(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def clone(self) -> typing.Optional['QgsExpressionNode']: ...
+    def eval(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def dump(self) -> str: ...
+    def nodeType(self) -> 'QgsExpressionNode.NodeType': ...
+
+
+class QgsExpressionNodeUnaryOperator(QgsExpressionNode):
+
+    class UnaryOperator(int):
+        uoNot = ... # type: QgsExpressionNodeUnaryOperator.UnaryOperator
+        uoMinus = ... # type: QgsExpressionNodeUnaryOperator.UnaryOperator
+
+    def __init__(self, op: 'QgsExpressionNodeUnaryOperator.UnaryOperator', operand: typing.Optional[QgsExpressionNode]) -> None: ...
+
+    def text(self) -> str: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def operand(self) -> typing.Optional[QgsExpressionNode]: ...
+    def op(self) -> 'QgsExpressionNodeUnaryOperator.UnaryOperator': ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsExpressionNodeBinaryOperator(QgsExpressionNode):
+
+    class BinaryOperator(int):
+        boOr = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boAnd = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boEQ = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boNE = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boLE = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boGE = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boLT = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boGT = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boRegexp = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boLike = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boNotLike = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boILike = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boNotILike = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boIs = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boIsNot = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boPlus = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boMinus = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boMul = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boDiv = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boIntDiv = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boMod = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boPow = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+        boConcat = ... # type: QgsExpressionNodeBinaryOperator.BinaryOperator
+
+    def __init__(self, op: 'QgsExpressionNodeBinaryOperator.BinaryOperator', opLeft: typing.Optional[QgsExpressionNode], opRight: typing.Optional[QgsExpressionNode]) -> None: ...
+
+    def text(self) -> str: ...
+    def leftAssociative(self) -> bool: ...
+    def precedence(self) -> int: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def opRight(self) -> typing.Optional[QgsExpressionNode]: ...
+    def opLeft(self) -> typing.Optional[QgsExpressionNode]: ...
+    def op(self) -> 'QgsExpressionNodeBinaryOperator.BinaryOperator': ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsExpressionNodeIndexOperator(QgsExpressionNode):
+
+    def __init__(self, container: typing.Optional[QgsExpressionNode], index: typing.Optional[QgsExpressionNode]) -> None: ...
+
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def index(self) -> typing.Optional[QgsExpressionNode]: ...
+    def container(self) -> typing.Optional[QgsExpressionNode]: ...
+
+
+class QgsExpressionNodeBetweenOperator(QgsExpressionNode):
+
+    def __init__(self, node: typing.Optional[QgsExpressionNode], nodeLowerBound: typing.Optional[QgsExpressionNode], nodeHigherBound: typing.Optional[QgsExpressionNode], negate: bool = ...) -> None: ...
+
+    def negate(self) -> bool: ...
+    def higherBound(self) -> typing.Optional[QgsExpressionNode]: ...
+    def lowerBound(self) -> typing.Optional[QgsExpressionNode]: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def node(self) -> typing.Optional[QgsExpressionNode]: ...
+
+
+class QgsExpressionNodeInOperator(QgsExpressionNode):
+
+    def __init__(self, node: typing.Optional[QgsExpressionNode], list: typing.Optional[QgsExpressionNode.NodeList], notin: bool = ...) -> None: ...
+
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def list(self) -> typing.Optional[QgsExpressionNode.NodeList]: ...
+    def isNotIn(self) -> bool: ...
+    def node(self) -> typing.Optional[QgsExpressionNode]: ...
+
+
+class QgsExpressionNodeFunction(QgsExpressionNode):
+
+    def __init__(self, fnIndex: int, args: typing.Optional[QgsExpressionNode.NodeList]) -> None: ...
+
+    @staticmethod
+    def validateParams(fnIndex: int, args: typing.Optional[QgsExpressionNode.NodeList], error: typing.Optional[str]) -> bool: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def args(self) -> typing.Optional[QgsExpressionNode.NodeList]: ...
+    def fnIndex(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsExpressionNodeLiteral(QgsExpressionNode):
+
+    @typing.overload
+    def __init__(self, value: typing.Any) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionNodeLiteral') -> None: ...
+
+    def valueAsString(self) -> str: ...
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def value(self) -> typing.Any: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsExpressionNodeColumnRef(QgsExpressionNode):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionNodeColumnRef') -> None: ...
+
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def dump(self) -> str: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
+    def name(self) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsExpressionNodeCondition(QgsExpressionNode):
+
+    class WhenThen(PyQt5.sip.wrapper):
+
+        def __init__(self, whenExp: typing.Optional[QgsExpressionNode], thenExp: typing.Optional[QgsExpressionNode]) -> None: ...
+
+        def thenExp(self) -> typing.Optional[QgsExpressionNode]: ...
+        def whenExp(self) -> typing.Optional[QgsExpressionNode]: ...
+        def clone(self) -> typing.Optional['QgsExpressionNodeCondition.WhenThen']: ...
+
+    def __init__(self, conditions: typing.Optional[collections.abc.Iterable['QgsExpressionNodeCondition.WhenThen']], elseExp: typing.Optional[QgsExpressionNode] = ...) -> None: ...
+
+    def isStatic(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def clone(self) -> typing.Optional[QgsExpressionNode]: ...
+    def needsGeometry(self) -> bool: ...
+    def referencedFunctions(self) -> set[str]: ...
+    def referencedVariables(self) -> set[str]: ...
+    def referencedColumns(self) -> set[str]: ...
+    def elseExp(self) -> typing.Optional[QgsExpressionNode]: ...
+    def conditions(self) -> list['QgsExpressionNodeCondition.WhenThen']: ...
+    def dump(self) -> str: ...
+    def prepareNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> bool: ...
+    def evalNode(self, parent: typing.Optional[QgsExpression], context: typing.Optional[QgsExpressionContext]) -> typing.Any: ...
+    def nodeType(self) -> QgsExpressionNode.NodeType: ...
@@ -0,0 +1,84 @@
+# The PEP 484 type hints stub file for the _core.externalstorage module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+
+
+class QgsExternalStorage(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExternalStorage') -> None: ...
+
+    def doFetch(self, url: typing.Optional[str], authCfg: typing.Optional[str] = ...) -> typing.Optional['QgsExternalStorageFetchedContent']: ...
+    def doStore(self, filePath: typing.Optional[str], url: typing.Optional[str], authCfg: typing.Optional[str] = ...) -> typing.Optional['QgsExternalStorageStoredContent']: ...
+    def fetch(self, url: typing.Optional[str], authCfg: typing.Optional[str] = ..., fetchingMode: Qgis.ActionStart = ...) -> typing.Optional['QgsExternalStorageFetchedContent']: ...
+    def store(self, filePath: typing.Optional[str], url: typing.Optional[str], authCfg: typing.Optional[str] = ..., storingMode: Qgis.ActionStart = ...) -> typing.Optional['QgsExternalStorageStoredContent']: ...
+    def displayName(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsExternalStorageContent(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def setStatus(self, status: Qgis.ContentStatus) -> None: ...
+    def reportError(self, errorMsg: typing.Optional[str]) -> None: ...
+    canceled: typing.ClassVar[QtCore.pyqtSignal]
+    progressChanged: typing.ClassVar[QtCore.pyqtSignal]
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def errorString(self) -> str: ...
+    def status(self) -> Qgis.ContentStatus: ...
+
+
+class QgsExternalStorageFetchedContent(QgsExternalStorageContent):
+
+    def __init__(self) -> None: ...
+
+    fetched: typing.ClassVar[QtCore.pyqtSignal]
+    def fetch(self) -> None: ...
+    def filePath(self) -> str: ...
+
+
+class QgsExternalStorageStoredContent(QgsExternalStorageContent):
+
+    def __init__(self) -> None: ...
+
+    stored: typing.ClassVar[QtCore.pyqtSignal]
+    def store(self) -> None: ...
+    def url(self) -> str: ...
+
+
+class QgsExternalStorageRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExternalStorageRegistry') -> None: ...
+
+    def unregisterExternalStorage(self, storage: typing.Optional[QgsExternalStorage]) -> None: ...
+    def registerExternalStorage(self, storage: typing.Optional[QgsExternalStorage]) -> None: ...
+    def externalStorages(self) -> list[QgsExternalStorage]: ...
+    def externalStorageFromType(self, type: typing.Optional[str]) -> typing.Optional[QgsExternalStorage]: ...
@@ -0,0 +1,247 @@
+# The PEP 484 type hints stub file for the _core.fieldformatter module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from .project import QgsProject
+from .vector import QgsFeature, QgsVectorLayer
+
+
+class QgsFieldFormatterContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFieldFormatterContext') -> None: ...
+
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+
+
+class QgsFieldFormatter(PyQt5.sip.wrapper):
+
+    class Flag(int):
+        CanProvideAvailableValues = ... # type: QgsFieldFormatter.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __xor__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __ior__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __or__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __iand__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __and__(self, f: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> 'QgsFieldFormatter.Flags': ...
+        def __invert__(self) -> 'QgsFieldFormatter.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFieldFormatter') -> None: ...
+
+    def setFlags(self, flags: typing.Union['QgsFieldFormatter.Flags', 'QgsFieldFormatter.Flag']) -> None: ...
+    def flags(self) -> 'QgsFieldFormatter.Flags': ...
+    def availableValues(self, config: dict[str, typing.Any], countLimit: int, context: QgsFieldFormatterContext) -> list[typing.Any]: ...
+    def createCache(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any]) -> typing.Any: ...
+    def alignmentFlag(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any]) -> QtCore.Qt.AlignmentFlag: ...
+    def sortValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> typing.Any: ...
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsCheckBoxFieldFormatter(QgsFieldFormatter):
+
+    class TextDisplayMethod(int):
+        ShowTrueFalse = ... # type: QgsCheckBoxFieldFormatter.TextDisplayMethod
+        ShowStoredValues = ... # type: QgsCheckBoxFieldFormatter.TextDisplayMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCheckBoxFieldFormatter') -> None: ...
+
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsDateTimeFieldFormatter(QgsFieldFormatter):
+
+    DATETIME_DISPLAY_FORMAT = ... # type: typing.Optional[str]
+    DATETIME_FORMAT = ... # type: typing.Optional[str]
+    DATE_DISPLAY_FORMAT = ... # type: typing.Optional[str]
+    DATE_FORMAT = ... # type: typing.Optional[str]
+    DISPLAY_FOR_ISO_FORMAT = ... # type: typing.Optional[str]
+    QT_ISO_FORMAT = ... # type: typing.Optional[str]
+    TIME_FORMAT = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDateTimeFieldFormatter') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def defaultDisplayFormat(type: QtCore.QMetaType.Type) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def defaultDisplayFormat(type: QtCore.QVariant.Type) -> str: ...
+    @typing.overload
+    @staticmethod
+    def defaultFormat(type: QtCore.QMetaType.Type) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def defaultFormat(type: QtCore.QVariant.Type) -> str: ...
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsFallbackFieldFormatter(QgsFieldFormatter):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFallbackFieldFormatter') -> None: ...
+
+    def id(self) -> str: ...
+
+
+class QgsKeyValueFieldFormatter(QgsFieldFormatter):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsKeyValueFieldFormatter') -> None: ...
+
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsListFieldFormatter(QgsFieldFormatter):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsListFieldFormatter') -> None: ...
+
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsRangeFieldFormatter(QgsFieldFormatter):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRangeFieldFormatter') -> None: ...
+
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsRelationReferenceFieldFormatter(QgsFieldFormatter):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRelationReferenceFieldFormatter') -> None: ...
+
+    def availableValues(self, config: dict[str, typing.Any], countLimit: int, context: QgsFieldFormatterContext) -> list[typing.Any]: ...
+    def createCache(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any]) -> typing.Any: ...
+    def sortValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> typing.Any: ...
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsValueMapFieldFormatter(QgsFieldFormatter):
+
+    NULL_VALUE = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsValueMapFieldFormatter') -> None: ...
+
+    def availableValues(self, config: dict[str, typing.Any], countLimit: int, context: QgsFieldFormatterContext) -> list[typing.Any]: ...
+    def sortValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> typing.Any: ...
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsValueRelationFieldFormatter(QgsFieldFormatter):
+
+    class ValueRelationItem(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        group = ... # type: typing.Any
+        key = ... # type: typing.Any
+        value = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, key: typing.Any, value: typing.Optional[str], description: typing.Optional[str] = ..., group: typing.Any = ...) -> None: ...
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsValueRelationFieldFormatter.ValueRelationItem') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsValueRelationFieldFormatter') -> None: ...
+
+    def availableValues(self, config: dict[str, typing.Any], countLimit: int, context: QgsFieldFormatterContext) -> list[typing.Any]: ...
+    @staticmethod
+    def resolveLayer(config: dict[str, typing.Any], project: typing.Optional['QgsProject']) -> typing.Optional[QgsVectorLayer]: ...
+    @staticmethod
+    def expressionIsUsable(expression: typing.Optional[str], feature: QgsFeature, parentFeature: QgsFeature = ...) -> bool: ...
+    @staticmethod
+    def expressionParentFormVariables(expression: typing.Optional[str]) -> set[str]: ...
+    @staticmethod
+    def expressionParentFormAttributes(expression: typing.Optional[str]) -> set[str]: ...
+    @staticmethod
+    def expressionRequiresParentFormScope(expression: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def expressionFormVariables(expression: typing.Optional[str]) -> set[str]: ...
+    @staticmethod
+    def expressionFormAttributes(expression: typing.Optional[str]) -> set[str]: ...
+    @staticmethod
+    def expressionRequiresFormScope(expression: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def valueToStringList(value: typing.Any) -> list[str]: ...
+    @typing.overload
+    def createCache(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any]) -> typing.Any: ...
+    @typing.overload
+    @staticmethod
+    def createCache(config: dict[str, typing.Any], formFeature: QgsFeature = ..., parentFormFeature: QgsFeature = ...) -> list['QgsValueRelationFieldFormatter.ValueRelationItem']: ...
+    def sortValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> typing.Any: ...
+    def representValue(self, layer: typing.Optional[QgsVectorLayer], fieldIndex: int, config: dict[str, typing.Any], cache: typing.Any, value: typing.Any) -> str: ...
+    def id(self) -> str: ...
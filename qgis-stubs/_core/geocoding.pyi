@@ -0,0 +1,164 @@
+# The PEP 484 type hints stub file for the _core.geocoding module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFeedback, QgsFields
+from .geometry import QgsGeometry, QgsRectangle
+from .locator import QgsLocatorContext, QgsLocatorFilter, QgsLocatorResult
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .vector import QgsFeature
+
+
+class QgsAbstractGeocoderLocatorFilter(QgsLocatorFilter):
+
+    def __init__(self, name: typing.Optional[str], displayName: typing.Optional[str], prefix: typing.Optional[str], geocoder: typing.Optional['QgsGeocoderInterface'], boundingBox: 'QgsRectangle' = ...) -> None: ...
+
+    def geocoderResultToLocatorResult(self, result: 'QgsGeocoderResult') -> 'QgsLocatorResult': ...
+    def locatorResultToGeocoderResult(self, result: 'QgsLocatorResult') -> 'QgsGeocoderResult': ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def geocoder(self) -> typing.Optional['QgsGeocoderInterface']: ...
+    def triggerResult(self, result: 'QgsLocatorResult') -> None: ...
+    def fetchResults(self, string: typing.Optional[str], context: 'QgsLocatorContext', feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def prefix(self) -> str: ...
+    def displayName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsGeocoderInterface(PyQt5.sip.wrapper):
+
+    class Flag(int):
+        GeocodesStrings = ... # type: QgsGeocoderInterface.Flag
+        GeocodesFeatures = ... # type: QgsGeocoderInterface.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __xor__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __ior__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __or__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __iand__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __and__(self, f: typing.Union['QgsGeocoderInterface.Flags', 'QgsGeocoderInterface.Flag']) -> 'QgsGeocoderInterface.Flags': ...
+        def __invert__(self) -> 'QgsGeocoderInterface.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeocoderInterface') -> None: ...
+
+    def geocodeString(self, string: typing.Optional[str], context: 'QgsGeocoderContext', feedback: typing.Optional[QgsFeedback] = ...) -> list['QgsGeocoderResult']: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def appendedFields(self) -> QgsFields: ...
+    def geocodeFeature(self, feature: QgsFeature, context: 'QgsGeocoderContext', feedback: typing.Optional[QgsFeedback] = ...) -> list['QgsGeocoderResult']: ...
+    def flags(self) -> 'QgsGeocoderInterface.Flags': ...
+
+
+class QgsGeocoderContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeocoderContext') -> None: ...
+
+    def setAreaOfInterestCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def areaOfInterestCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setAreaOfInterest(self, area: 'QgsGeometry') -> None: ...
+    def areaOfInterest(self) -> 'QgsGeometry': ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+
+
+class QgsGeocoderResult(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, identifier: typing.Optional[str], geometry: 'QgsGeometry', crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeocoderResult') -> None: ...
+
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setGroup(self, group: typing.Optional[str]) -> None: ...
+    def group(self) -> str: ...
+    def setAdditionalAttributes(self, attributes: dict[str, typing.Any]) -> None: ...
+    def additionalAttributes(self) -> dict[str, typing.Any]: ...
+    def setViewport(self, viewport: 'QgsRectangle') -> None: ...
+    def viewport(self) -> 'QgsRectangle': ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setGeometry(self, geometry: 'QgsGeometry') -> None: ...
+    def geometry(self) -> 'QgsGeometry': ...
+    def identifier(self) -> str: ...
+    def error(self) -> str: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    def errorResult(errorMessage: typing.Optional[str]) -> 'QgsGeocoderResult': ...
+
+
+class QgsNominatimGeocoder(QgsGeocoderInterface):
+
+    @typing.overload
+    def __init__(self, countryCodes: typing.Optional[str] = ..., endpoint: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNominatimGeocoder') -> None: ...
+
+    def setCountryCodes(self, countryCodes: typing.Optional[str]) -> None: ...
+    def countryCodes(self) -> str: ...
+    def setRequestsPerSecond(self, number: float) -> None: ...
+    def requestsPerSecond(self) -> float: ...
+    def setEndpoint(self, endpoint: typing.Optional[str]) -> None: ...
+    def endpoint(self) -> str: ...
+    def jsonToResult(self, json: dict[str, typing.Any]) -> QgsGeocoderResult: ...
+    def requestUrl(self, address: typing.Optional[str], bounds: 'QgsRectangle' = ...) -> QtCore.QUrl: ...
+    def geocodeString(self, string: typing.Optional[str], context: QgsGeocoderContext, feedback: typing.Optional[QgsFeedback] = ...) -> list[QgsGeocoderResult]: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def appendedFields(self) -> QgsFields: ...
+    def flags(self) -> QgsGeocoderInterface.Flags: ...
+
+
+class QgsGoogleMapsGeocoder(QgsGeocoderInterface):
+
+    @typing.overload
+    def __init__(self, apiKey: typing.Optional[str], regionBias: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGoogleMapsGeocoder') -> None: ...
+
+    def setRegion(self, region: typing.Optional[str]) -> None: ...
+    def region(self) -> str: ...
+    def setApiKey(self, key: typing.Optional[str]) -> None: ...
+    def apiKey(self) -> str: ...
+    def setEndpoint(self, endpoint: typing.Optional[str]) -> None: ...
+    def jsonToResult(self, json: dict[str, typing.Any]) -> QgsGeocoderResult: ...
+    def requestUrl(self, address: typing.Optional[str], bounds: 'QgsRectangle' = ...) -> QtCore.QUrl: ...
+    def geocodeString(self, string: typing.Optional[str], context: QgsGeocoderContext, feedback: typing.Optional[QgsFeedback] = ...) -> list[QgsGeocoderResult]: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def appendedFields(self) -> QgsFields: ...
+    def flags(self) -> QgsGeocoderInterface.Flags: ...
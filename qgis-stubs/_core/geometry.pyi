@@ -0,0 +1,2814 @@
+# The PEP 484 type hints stub file for the _core.geometry module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsFeedback, QgsFields, QgsMatrix4x4, QgsMultiPointXY,
+    QgsMultiPolygonXY, QgsMultiPolylineXY, QgsPolygonXY, QgsPolylineXY,
+    QgsVector, QgsVector3D,
+)
+from .dxf import QgsMapSettings, QgsMapToPixel
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransform
+from .vector import QgsFeature, QgsPointXY, QgsVectorLayer
+
+
+class QgsClipper(PyQt5.sip.wrapper):
+
+    class Boundary(int):
+        XMax = ... # type: QgsClipper.Boundary
+        XMin = ... # type: QgsClipper.Boundary
+        YMax = ... # type: QgsClipper.Boundary
+        YMin = ... # type: QgsClipper.Boundary
+        ZMax = ... # type: QgsClipper.Boundary
+        ZMin = ... # type: QgsClipper.Boundary
+
+    MAX_X = ... # type: float
+    MAX_Y = ... # type: float
+    MIN_X = ... # type: float
+    MIN_Y = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClipper') -> None: ...
+
+    @staticmethod
+    def clipLineSegment(left: float, right: float, bottom: float, top: float, x0: float, y0: float, x1: float, y1: float) -> typing.Tuple[bool, float, float, float, float]: ...
+    @staticmethod
+    def clippedLine(curve: typing.Union[QgsCurve, QtGui.QPolygonF], clipExtent: 'QgsRectangle') -> QtGui.QPolygonF: ...
+    @staticmethod
+    def trimPolygon(pts: QtGui.QPolygonF, clipRect: 'QgsRectangle') -> None: ...
+    @staticmethod
+    def trimFeature(x: collections.abc.Iterable[float], y: collections.abc.Iterable[float], shapeOpen: bool) -> None: ...
+
+
+class QgsAbstractGeometrySimplifier(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractGeometrySimplifier') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def isGeneralizableByDeviceBoundingBox(envelope: 'QgsRectangle', mapToPixelTol: float = ...) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def isGeneralizableByDeviceBoundingBox(points: collections.abc.Iterable[typing.Union[QtCore.QPointF, QtCore.QPoint]], mapToPixelTol: float = ...) -> bool: ...
+    @typing.overload
+    def simplify(self, geometry: 'QgsGeometry') -> 'QgsGeometry': ...
+    @typing.overload
+    def simplify(self, geometry: typing.Optional['QgsAbstractGeometry']) -> typing.Optional['QgsAbstractGeometry']: ...
+
+
+class QgsTopologyPreservingSimplifier(QgsAbstractGeometrySimplifier):
+
+    @typing.overload
+    def __init__(self, tolerance: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTopologyPreservingSimplifier') -> None: ...
+
+    @typing.overload
+    def simplify(self, geometry: 'QgsGeometry') -> 'QgsGeometry': ...
+    @typing.overload
+    def simplify(self, geometry: typing.Optional['QgsAbstractGeometry']) -> typing.Optional['QgsAbstractGeometry']: ...
+
+
+class QgsGeometryValidator(QtCore.QThread):
+
+    def __init__(self, geometry: 'QgsGeometry', errors: typing.Optional[collections.abc.Iterable['QgsGeometry.Error']] = ..., method: Qgis.GeometryValidationEngine = ...) -> None: ...
+
+    def addError(self, a0: 'QgsGeometry.Error') -> None: ...
+    validationFinished: typing.ClassVar[QtCore.pyqtSignal]
+    errorFound: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def validateGeometry(geometry: 'QgsGeometry', method: Qgis.GeometryValidationEngine = ...) -> list['QgsGeometry.Error']: ...
+    def stop(self) -> None: ...
+    def run(self) -> None: ...
+
+
+class QgsJsonUtils(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsJsonUtils') -> None: ...
+
+    @staticmethod
+    def geometryFromGeoJson(geometry: typing.Optional[str]) -> 'QgsGeometry': ...
+    @typing.overload
+    @staticmethod
+    def parseArray(json: typing.Optional[str], type: QtCore.QMetaType.Type = ...) -> list[typing.Any]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def parseArray(json: typing.Optional[str], type: QtCore.QVariant.Type) -> list[typing.Any]: ...
+    @staticmethod
+    def exportAttributes(feature: QgsFeature, layer: typing.Optional[QgsVectorLayer] = ..., attributeWidgetCaches: collections.abc.Iterable[typing.Any] = ...) -> str: ...
+    @staticmethod
+    def encodeValue(value: typing.Any) -> str: ...
+    @staticmethod
+    def stringToFields(string: typing.Optional[str], encoding: typing.Optional[QtCore.QTextCodec] = ...) -> QgsFields: ...
+    @staticmethod
+    def stringToFeatureList(string: typing.Optional[str], fields: QgsFields = ..., encoding: typing.Optional[QtCore.QTextCodec] = ...) -> list[QgsFeature]: ...
+
+
+class QgsMapSettingsUtils(PyQt5.sip.wrapper):
+
+    class EffectsCheckFlag(int):
+        IgnoreGeoPdfSupportedEffects = ... # type: QgsMapSettingsUtils.EffectsCheckFlag
+
+    class EffectsCheckFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __xor__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __ior__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __or__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __iand__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __and__(self, f: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag']) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __invert__(self) -> 'QgsMapSettingsUtils.EffectsCheckFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapSettingsUtils') -> None: ...
+
+    @staticmethod
+    def isValidExtent(extent: 'QgsRectangle') -> bool: ...
+    @staticmethod
+    def worldFileContent(mapSettings: QgsMapSettings) -> str: ...
+    @staticmethod
+    def worldFileParameters(mapSettings: QgsMapSettings) -> typing.Tuple[float, float, float, float, float, float]: ...
+    @staticmethod
+    def containsAdvancedEffects(mapSettings: QgsMapSettings, flags: typing.Union['QgsMapSettingsUtils.EffectsCheckFlags', 'QgsMapSettingsUtils.EffectsCheckFlag'] = ...) -> list[str]: ...
+
+
+class QgsMapToPixelSimplifier(QgsAbstractGeometrySimplifier):
+
+    class SimplifyFlag(int):
+        NoFlags = ... # type: QgsMapToPixelSimplifier.SimplifyFlag
+        SimplifyGeometry = ... # type: QgsMapToPixelSimplifier.SimplifyFlag
+        SimplifyEnvelope = ... # type: QgsMapToPixelSimplifier.SimplifyFlag
+
+    @typing.overload
+    def __init__(self, simplifyFlags: int, tolerance: float, simplifyAlgorithm: Qgis.VectorSimplificationAlgorithm = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapToPixelSimplifier') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def isGeneralizableByMapBoundingBox(envelope: 'QgsRectangle', map2pixelTol: float) -> bool: ...
+    @typing.overload
+    def isGeneralizableByMapBoundingBox(self, envelope: 'QgsRectangle') -> bool: ...
+    def setTolerance(self, value: float) -> None: ...
+    @typing.overload
+    def simplify(self, geometry: 'QgsGeometry') -> 'QgsGeometry': ...
+    @typing.overload
+    def simplify(self, geometry: typing.Optional['QgsAbstractGeometry']) -> typing.Optional['QgsAbstractGeometry']: ...
+    def setSimplifyAlgorithm(self, simplifyAlgorithm: Qgis.VectorSimplificationAlgorithm) -> None: ...
+    def simplifyAlgorithm(self) -> Qgis.VectorSimplificationAlgorithm: ...
+    def setSimplifyFlags(self, simplifyFlags: int) -> None: ...
+    def simplifyFlags(self) -> int: ...
+    @staticmethod
+    def equalSnapToGrid(x1: float, y1: float, x2: float, y2: float, gridOriginX: float, gridOriginY: float, gridInverseSizeXY: float) -> bool: ...
+    @staticmethod
+    def calculateLengthSquared2D(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    Distance: Qgis.VectorSimplificationAlgorithm
+    SnapToGrid: Qgis.VectorSimplificationAlgorithm
+    Visvalingam: Qgis.VectorSimplificationAlgorithm
+    SnappedToGridGlobal: Qgis.VectorSimplificationAlgorithm
+
+
+class QgsScaleCalculator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, dpi: float = ..., mapUnits: Qgis.DistanceUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScaleCalculator') -> None: ...
+
+    def calculateGeographicDistanceAtLatitude(self, latitude: float, longitude1: float, longitude2: float) -> float: ...
+    def calculateGeographicDistance(self, mapExtent: 'QgsRectangle') -> float: ...
+    def calculateImageSize(self, mapExtent: 'QgsRectangle', scale: float) -> QtCore.QSizeF: ...
+    def calculate(self, mapExtent: 'QgsRectangle', canvasWidth: float) -> float: ...
+    def mapUnits(self) -> Qgis.DistanceUnit: ...
+    def setMapUnits(self, mapUnits: Qgis.DistanceUnit) -> None: ...
+    def dpi(self) -> float: ...
+    def setDpi(self, dpi: float) -> None: ...
+    def setMethod(self, method: Qgis.ScaleCalculationMethod) -> None: ...
+    def method(self) -> Qgis.ScaleCalculationMethod: ...
+
+
+class QgsTessellator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, originX: float, originY: float, addNormals: bool, invertNormals: bool = ..., addBackFaces: bool = ..., noZ: bool = ..., addTextureCoords: bool = ..., facade: int = ..., textureRotation: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, bounds: 'QgsRectangle', addNormals: bool, invertNormals: bool = ..., addBackFaces: bool = ..., noZ: bool = ..., addTextureCoords: bool = ..., facade: int = ..., textureRotation: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTessellator') -> None: ...
+
+    def error(self) -> str: ...
+    def zMaximum(self) -> float: ...
+    def zMinimum(self) -> float: ...
+    def stride(self) -> int: ...
+    def dataVerticesCount(self) -> int: ...
+    def data(self) -> list[float]: ...
+    def addPolygon(self, polygon: 'QgsPolygon', extrusionHeight: float) -> None: ...
+    def isOutputZUp(self) -> bool: ...
+    def setOutputZUp(self, zUp: bool) -> None: ...
+
+
+class QgsXmlUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsXmlUtils') -> None: ...
+
+    @staticmethod
+    def readVariant(element: QtXml.QDomElement) -> typing.Any: ...
+    @staticmethod
+    def writeVariant(value: typing.Any, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    @staticmethod
+    def writeRectangle(rect: 'QgsRectangle', doc: QtXml.QDomDocument, elementName: typing.Optional[str] = ...) -> QtXml.QDomElement: ...
+    @staticmethod
+    def writeBox3D(box: 'QgsBox3D', doc: QtXml.QDomDocument, elementName: typing.Optional[str] = ...) -> QtXml.QDomElement: ...
+    @staticmethod
+    def writeMapUnits(units: Qgis.DistanceUnit, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    @staticmethod
+    def readBox3D(element: QtXml.QDomElement) -> 'QgsBox3D': ...
+    @staticmethod
+    def readRectangle(element: QtXml.QDomElement) -> 'QgsRectangle': ...
+    @staticmethod
+    def readMapUnits(element: QtXml.QDomElement) -> Qgis.DistanceUnit: ...
+
+
+class QgsAbstractGeometry(PyQt5.sip.wrapper):
+
+    class WkbFlag(int):
+        FlagExportTrianglesAsPolygons = ... # type: QgsAbstractGeometry.WkbFlag
+        FlagExportNanAsDoubleMin = ... # type: QgsAbstractGeometry.WkbFlag
+
+    class AxisOrder(int):
+        XY = ... # type: QgsAbstractGeometry.AxisOrder
+        YX = ... # type: QgsAbstractGeometry.AxisOrder
+
+    class SegmentationToleranceType(int):
+        MaximumAngle = ... # type: QgsAbstractGeometry.SegmentationToleranceType
+        MaximumDifference = ... # type: QgsAbstractGeometry.SegmentationToleranceType
+
+    class WkbFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __xor__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __ior__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __or__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __iand__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __and__(self, f: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag']) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __invert__(self) -> 'QgsAbstractGeometry.WkbFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, geom: 'QgsAbstractGeometry') -> None: ...
+
+    def clearCache(self) -> None: ...
+    def calculateBoundingBox3D(self) -> 'QgsBox3D': ...
+    def calculateBoundingBox(self) -> 'QgsRectangle': ...
+    def setZMTypeFromSubGeometry(self, subggeom: typing.Optional['QgsAbstractGeometry'], baseGeomType: Qgis.WkbType) -> None: ...
+    def childPoint(self, index: int) -> 'QgsPoint': ...
+    def childGeometry(self, index: int) -> typing.Optional['QgsAbstractGeometry']: ...
+    def childCount(self) -> int: ...
+    def hasChildGeometries(self) -> bool: ...
+    def compareToSameClass(self, other: typing.Optional['QgsAbstractGeometry']) -> int: ...
+    def sortIndex(self) -> int: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def vertices(self) -> 'QgsVertexIterator': ...
+    def parts(self) -> 'QgsGeometryPartIterator': ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def simplifiedTypeRef(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def convertTo(self, type: Qgis.WkbType) -> bool: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def partCount(self) -> int: ...
+    def ringCount(self, part: int = ...) -> int: ...
+    def vertexCount(self, part: int = ..., ring: int = ...) -> int: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsAbstractGeometry']: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsAbstractGeometry']: ...
+    def toCurveType(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def segmentize(self, tolerance: float = ..., toleranceType: 'QgsAbstractGeometry.SegmentationToleranceType' = ...) -> typing.Optional['QgsAbstractGeometry']: ...
+    @typing.overload
+    def boundingBoxIntersects(self, rectangle: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, box3d: 'QgsBox3D') -> bool: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def centroid(self) -> 'QgsPoint': ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def area(self) -> float: ...
+    def perimeter(self) -> float: ...
+    def length(self) -> float: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def vertexAt(self, id: 'QgsVertexId') -> 'QgsPoint': ...
+    def nCoordinates(self) -> int: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, 'QgsPoint']: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional['QgsAbstractGeometryTransformer'], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asJson(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: 'QgsAbstractGeometry.AxisOrder' = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: 'QgsAbstractGeometry.AxisOrder' = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag'] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union['QgsAbstractGeometry.WkbFlags', 'QgsAbstractGeometry.WkbFlag'] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def normalize(self) -> None: ...
+    def boundary(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def isMeasure(self) -> bool: ...
+    def is3D(self) -> bool: ...
+    def wktTypeStr(self) -> str: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def geometryType(self) -> str: ...
+    def dimension(self) -> int: ...
+    def boundingBox3D(self) -> 'QgsBox3D': ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def clear(self) -> None: ...
+    def compareTo(self, other: typing.Optional['QgsAbstractGeometry']) -> int: ...
+    def clone(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def fuzzyDistanceEqual(self, other: 'QgsAbstractGeometry', epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: 'QgsAbstractGeometry', epsilon: float = ...) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsVertexIterator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVertexIterator') -> None: ...
+
+    def __next__(self) -> 'QgsPoint': ...
+    def __iter__(self) -> 'QgsVertexIterator': ...
+    def next(self) -> 'QgsPoint': ...
+    def hasNext(self) -> bool: ...
+
+
+class QgsGeometryPartIterator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryPartIterator') -> None: ...
+
+    def __next__(self) -> QgsAbstractGeometry: ...
+    def __iter__(self) -> 'QgsGeometryPartIterator': ...
+    def next(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def hasNext(self) -> bool: ...
+
+
+class QgsGeometryConstPartIterator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryConstPartIterator') -> None: ...
+
+    def __next__(self) -> QgsAbstractGeometry: ...
+    def __iter__(self) -> 'QgsGeometryConstPartIterator': ...
+    def next(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def hasNext(self) -> bool: ...
+
+
+class QgsBox3D(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, x: typing.Optional[typing.Union['QgsPoint', QgsVector3D, 'QgsRectangle', float]] = ..., y: typing.Optional['QgsPoint', QgsVector3D, float] = ..., z: typing.Optional[typing.Union[bool, float]] = ..., x2: typing.Optional[typing.Union[bool, float]] = ..., y2: typing.Optional[float] = ..., z2: typing.Optional[float] = ..., n: typing.Optional[bool] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBox3D') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def __iadd__(self, v: QgsVector3D) -> 'QgsBox3D': ...
+    def __isub__(self, v: QgsVector3D) -> 'QgsBox3D': ...
+    def __add__(self, v: QgsVector3D) -> 'QgsBox3D': ...
+    def __sub__(self, v: QgsVector3D) -> 'QgsBox3D': ...
+    def corners(self) -> list[QgsVector3D]: ...
+    def toString(self, precision: int = ...) -> str: ...
+    def isEmpty(self) -> bool: ...
+    def isNull(self) -> bool: ...
+    def grow(self, delta: float) -> None: ...
+    @typing.overload
+    def scale(self, scaleFactor: float, center: 'QgsPoint' = ...) -> None: ...
+    @typing.overload
+    def scale(self, scaleFactor: float, centerX: float, centerY: float, centerZ: float) -> None: ...
+    def __eq__(self, other: object): ...
+    @typing.overload
+    @deprecated("""""")
+    def distanceTo(self, point: QtGui.QVector3D) -> float: ...
+    @typing.overload
+    def distanceTo(self, point: QgsVector3D) -> float: ...
+    def toRectangle(self) -> 'QgsRectangle': ...
+    @typing.overload
+    def combineWith(self, box: 'QgsBox3D') -> None: ...
+    @typing.overload
+    def combineWith(self, x: float, y: float, z: float) -> None: ...
+    @typing.overload
+    def contains(self, other: 'QgsBox3D') -> bool: ...
+    @typing.overload
+    def contains(self, point: 'QgsPoint') -> bool: ...
+    @typing.overload
+    def contains(self, x: float, y: float, z: float) -> bool: ...
+    def intersects(self, other: 'QgsBox3D') -> bool: ...
+    def is3D(self) -> bool: ...
+    def is2d(self) -> bool: ...
+    def intersect(self, other: 'QgsBox3D') -> 'QgsBox3D': ...
+    def volume(self) -> float: ...
+    def area(self) -> float: ...
+    def center(self) -> QgsVector3D: ...
+    def depth(self) -> float: ...
+    def height(self) -> float: ...
+    def width(self) -> float: ...
+    def normalize(self) -> None: ...
+    def setNull(self) -> None: ...
+    def zMaximum(self) -> float: ...
+    def zMinimum(self) -> float: ...
+    def setZMaximum(self, z: float) -> None: ...
+    def setZMinimum(self, z: float) -> None: ...
+    def yMaximum(self) -> float: ...
+    def yMinimum(self) -> float: ...
+    def setYMaximum(self, y: float) -> None: ...
+    def setYMinimum(self, y: float) -> None: ...
+    def xMaximum(self) -> float: ...
+    def xMinimum(self) -> float: ...
+    def setXMaximum(self, x: float) -> None: ...
+    def setXMinimum(self, x: float) -> None: ...
+    def set(self, xMin: float, yMin: float, zMin: float, xMax: float, yMax: float, zMax: float, normalize: bool = ...) -> None: ...
+
+
+class QgsEllipse(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, center: 'QgsPoint', semiMajorAxis: float, semiMinorAxis: float, azimuth: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsEllipse') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def toString(self, pointPrecision: int = ..., axisPrecision: int = ..., azimuthPrecision: int = ...) -> str: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def orientedBoundingBox(self) -> typing.Optional['QgsPolygon']: ...
+    def toLineString(self, segments: int = ...) -> typing.Optional['QgsLineString']: ...
+    def toPolygon(self, segments: int = ...) -> typing.Optional['QgsPolygon']: ...
+    def points(self, segments: int = ...) -> list['QgsPoint']: ...
+    def quadrant(self) -> list['QgsPoint']: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def eccentricity(self) -> float: ...
+    def foci(self) -> list['QgsPoint']: ...
+    def focusDistance(self) -> float: ...
+    def setAzimuth(self, azimuth: float) -> None: ...
+    def setSemiMinorAxis(self, semiMinorAxis: float) -> None: ...
+    def setSemiMajorAxis(self, semiMajorAxis: float) -> None: ...
+    def setCenter(self, center: 'QgsPoint') -> None: ...
+    def azimuth(self) -> float: ...
+    def semiMinorAxis(self) -> float: ...
+    def semiMajorAxis(self) -> float: ...
+    def center(self) -> 'QgsPoint': ...
+    def isEmpty(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def fromCenter2Points(ptc: 'QgsPoint', pt1: 'QgsPoint', pt2: 'QgsPoint') -> 'QgsEllipse': ...
+    @staticmethod
+    def fromCenterPoint(ptc: 'QgsPoint', pt1: 'QgsPoint') -> 'QgsEllipse': ...
+    @staticmethod
+    def fromExtent(pt1: 'QgsPoint', pt2: 'QgsPoint') -> 'QgsEllipse': ...
+    @staticmethod
+    def fromFoci(pt1: 'QgsPoint', pt2: 'QgsPoint', pt3: 'QgsPoint') -> 'QgsEllipse': ...
+
+
+class QgsCircle(QgsEllipse):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, center: 'QgsPoint', radius: float, azimuth: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCircle') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def calculateSegments(radius: float, parameter: float, minSegments: int, method: Qgis.SegmentCalculationMethod) -> int: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def toString(self, pointPrecision: int = ..., radiusPrecision: int = ..., azimuthPrecision: int = ...) -> str: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def contains(self, point: 'QgsPoint', epsilon: float = ...) -> bool: ...
+    def toCircularString(self, oriented: bool = ...) -> typing.Optional['QgsCircularString']: ...
+    def northQuadrant(self) -> list['QgsPoint']: ...
+    def setRadius(self, radius: float) -> None: ...
+    def radius(self) -> float: ...
+    def setSemiMinorAxis(self, semiMinorAxis: float) -> None: ...
+    def setSemiMajorAxis(self, semiMajorAxis: float) -> None: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def innerTangents(self, other: 'QgsCircle') -> typing.Tuple[int, QgsPointXY, QgsPointXY, QgsPointXY, QgsPointXY]: ...
+    def outerTangents(self, other: 'QgsCircle') -> typing.Tuple[int, QgsPointXY, QgsPointXY, QgsPointXY, QgsPointXY]: ...
+    def tangentToPoint(self, p: QgsPointXY) -> typing.Tuple[bool, QgsPointXY, QgsPointXY]: ...
+    def intersections(self, other: 'QgsCircle', useZ: bool = ...) -> typing.Tuple[int, 'QgsPoint', 'QgsPoint']: ...
+    @staticmethod
+    def minimalCircleFrom3Points(pt1: 'QgsPoint', pt2: 'QgsPoint', pt3: 'QgsPoint', epsilon: float = ...) -> 'QgsCircle': ...
+    @staticmethod
+    def fromExtent(pt1: 'QgsPoint', pt2: 'QgsPoint') -> 'QgsCircle': ...
+    @staticmethod
+    def from3TangentsMulti(pt1_tg1: 'QgsPoint', pt2_tg1: 'QgsPoint', pt1_tg2: 'QgsPoint', pt2_tg2: 'QgsPoint', pt1_tg3: 'QgsPoint', pt2_tg3: 'QgsPoint', epsilon: float = ..., pos: 'QgsPoint' = ...) -> list['QgsCircle']: ...
+    @staticmethod
+    def from3Tangents(pt1_tg1: 'QgsPoint', pt2_tg1: 'QgsPoint', pt1_tg2: 'QgsPoint', pt2_tg2: 'QgsPoint', pt1_tg3: 'QgsPoint', pt2_tg3: 'QgsPoint', epsilon: float = ..., pos: 'QgsPoint' = ...) -> 'QgsCircle': ...
+    @staticmethod
+    def fromCenterPoint(center: 'QgsPoint', pt1: 'QgsPoint') -> 'QgsCircle': ...
+    @staticmethod
+    def fromCenterDiameter(center: 'QgsPoint', diameter: float, azimuth: float = ...) -> 'QgsCircle': ...
+    @staticmethod
+    def from3Points(pt1: 'QgsPoint', pt2: 'QgsPoint', pt3: 'QgsPoint', epsilon: float = ...) -> 'QgsCircle': ...
+    @staticmethod
+    def from2Points(pt1: 'QgsPoint', pt2: 'QgsPoint') -> 'QgsCircle': ...
+
+
+class QgsCurve(QgsAbstractGeometry):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCurve') -> None: ...
+
+    def childPoint(self, index: int) -> 'QgsPoint': ...
+    def childCount(self) -> int: ...
+    def clearCache(self) -> None: ...
+    def scroll(self, firstVertexIndex: int) -> None: ...
+    def orientation(self) -> Qgis.AngularDirection: ...
+    def sinuosity(self) -> float: ...
+    def straightDistance2d(self) -> float: ...
+    def curveSubstring(self, startDistance: float, endDistance: float) -> typing.Optional['QgsCurve']: ...
+    def interpolatePoint(self, distance: float) -> typing.Optional['QgsPoint']: ...
+    def asQPolygonF(self) -> QtGui.QPolygonF: ...
+    def mAt(self, index: int) -> float: ...
+    def zAt(self, index: int) -> float: ...
+    def yAt(self, index: int) -> float: ...
+    def xAt(self, index: int) -> float: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def boundingBox3D(self) -> QgsBox3D: ...
+    def normalize(self) -> None: ...
+    def toCurveType(self) -> typing.Optional['QgsCurve']: ...
+    def vertexAt(self, id: 'QgsVertexId') -> 'QgsPoint': ...
+    def partCount(self) -> int: ...
+    def ringCount(self, part: int = ...) -> int: ...
+    def vertexCount(self, part: int = ..., ring: int = ...) -> int: ...
+    def segmentize(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsCurve']: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def reversed(self) -> typing.Optional['QgsCurve']: ...
+    def indexOf(self, point: 'QgsPoint') -> int: ...
+    def pointAt(self, node: int) -> typing.Tuple[bool, 'QgsPoint', Qgis.VertexType]: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, 'QgsPoint']: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    def sumUpArea(self) -> float: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def numPoints(self) -> int: ...
+    def points(self) -> list['QgsPoint']: ...
+    def drawAsPolygon(self, p: QtGui.QPainter) -> None: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def addToPainterPath(self, path: QtGui.QPainterPath) -> None: ...
+    def curveToLine(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsLineString']: ...
+    def isRing(self) -> bool: ...
+    def isClosed2D(self) -> bool: ...
+    def isClosed(self) -> bool: ...
+    def endPoint(self) -> 'QgsPoint': ...
+    def startPoint(self) -> 'QgsPoint': ...
+    def clone(self) -> typing.Optional['QgsCurve']: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def equals(self, other: 'QgsCurve') -> bool: ...
+    Orientation: typing.Type[Qgis.AngularDirection]
+    Clockwise: Qgis.AngularDirection
+    CounterClockwise: Qgis.AngularDirection
+    NoOrientation: Qgis.AngularDirection
+
+
+class QgsCircularString(QgsCurve):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p1: 'QgsPoint', p2: 'QgsPoint', p3: 'QgsPoint') -> None: ...
+    @typing.overload
+    def __init__(self, x: collections.abc.Iterable[float], y: collections.abc.Iterable[float], z: collections.abc.Iterable[float] = ..., m: collections.abc.Iterable[float] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCircularString') -> None: ...
+
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsCircularString']: ...
+    def scroll(self, firstVertexIndex: int) -> None: ...
+    def mAt(self, index: int) -> float: ...
+    def zAt(self, index: int) -> float: ...
+    def yAt(self, index: int) -> float: ...
+    def xAt(self, index: int) -> float: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def curveSubstring(self, startDistance: float, endDistance: float) -> typing.Optional['QgsCircularString']: ...
+    def interpolatePoint(self, distance: float) -> typing.Optional['QgsPoint']: ...
+    def reversed(self) -> typing.Optional['QgsCircularString']: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def sumUpArea(self) -> float: ...
+    def pointAt(self, node: int, point: 'QgsPoint') -> typing.Tuple[bool, Qgis.VertexType]: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def drawAsPolygon(self, p: QtGui.QPainter) -> None: ...
+    def addToPainterPath(self, path: QtGui.QPainterPath) -> None: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional['QgsAbstractGeometryTransformer'], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional[QgsAbstractGeometry]: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsCircularString']: ...
+    def curveToLine(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsLineString']: ...
+    def endPoint(self) -> 'QgsPoint': ...
+    def startPoint(self) -> 'QgsPoint': ...
+    def length(self) -> float: ...
+    def append(self, string: typing.Optional['QgsCircularString']) -> None: ...
+    def setPoints(self, points: collections.abc.Iterable['QgsPoint']) -> None: ...
+    def points(self) -> list['QgsPoint']: ...
+    def pointN(self, i: int) -> 'QgsPoint': ...
+    def indexOf(self, point: 'QgsPoint') -> int: ...
+    def numPoints(self) -> int: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def isEmpty(self) -> bool: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsCircularString']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def equals(self, other: QgsCurve) -> bool: ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    @staticmethod
+    def fromTwoPointsAndCenter(p1: 'QgsPoint', p2: 'QgsPoint', center: 'QgsPoint', useShortestArc: bool = ...) -> 'QgsCircularString': ...
+
+
+class QgsCompoundCurve(QgsCurve):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, curve: 'QgsCompoundCurve') -> None: ...
+
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsCompoundCurve']: ...
+    def scroll(self, firstVertexIndex: int) -> None: ...
+    def mAt(self, index: int) -> float: ...
+    def zAt(self, index: int) -> float: ...
+    def yAt(self, index: int) -> float: ...
+    def xAt(self, index: int) -> float: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def curveSubstring(self, startDistance: float, endDistance: float) -> typing.Optional['QgsCompoundCurve']: ...
+    def interpolatePoint(self, distance: float) -> typing.Optional['QgsPoint']: ...
+    def reversed(self) -> typing.Optional['QgsCompoundCurve']: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def close(self) -> None: ...
+    def sumUpArea(self) -> float: ...
+    def pointAt(self, node: int, point: 'QgsPoint') -> typing.Tuple[bool, Qgis.VertexType]: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def drawAsPolygon(self, p: QtGui.QPainter) -> None: ...
+    def addToPainterPath(self, path: QtGui.QPainterPath) -> None: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional['QgsAbstractGeometryTransformer'], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def toggleCircularAtVertex(self, position: 'QgsVertexId') -> bool: ...
+    def condenseCurves(self) -> None: ...
+    def addVertex(self, pt: 'QgsPoint') -> None: ...
+    def removeCurve(self, i: int) -> None: ...
+    def addCurve(self, c: typing.Optional[QgsCurve], extendPrevious: bool = ...) -> None: ...
+    def curveAt(self, i: int) -> typing.Optional[QgsCurve]: ...
+    def nCurves(self) -> int: ...
+    def simplifiedTypeRef(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional[QgsAbstractGeometry]: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsCompoundCurve']: ...
+    def curveToLine(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsLineString']: ...
+    def indexOf(self, point: 'QgsPoint') -> int: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def isEmpty(self) -> bool: ...
+    def numPoints(self) -> int: ...
+    def points(self) -> list['QgsPoint']: ...
+    def endPoint(self) -> 'QgsPoint': ...
+    def startPoint(self) -> 'QgsPoint': ...
+    def length(self) -> float: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsCompoundCurve']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def equals(self, other: QgsCurve) -> bool: ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+
+
+class QgsSurface(QgsAbstractGeometry):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSurface') -> None: ...
+
+    def clearCache(self) -> None: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def boundingBox3D(self) -> QgsBox3D: ...
+
+
+class QgsCurvePolygon(QgsSurface):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p: 'QgsCurvePolygon') -> None: ...
+
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def childGeometry(self, index: int) -> typing.Optional[QgsAbstractGeometry]: ...
+    def childCount(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsCurvePolygon']: ...
+    def toCurveType(self) -> typing.Optional['QgsCurvePolygon']: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAt(self, id: 'QgsVertexId') -> 'QgsPoint': ...
+    def partCount(self) -> int: ...
+    def ringCount(self, part: int = ...) -> int: ...
+    def vertexCount(self, part: int = ..., ring: int = ...) -> int: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def segmentize(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, 'QgsPoint']: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def isEmpty(self) -> bool: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def nCoordinates(self) -> int: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional['QgsAbstractGeometryTransformer'], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def forceCounterClockwise(self) -> None: ...
+    def forceClockwise(self) -> None: ...
+    def forceRHR(self) -> None: ...
+    def removeInvalidRings(self) -> None: ...
+    def removeInteriorRings(self, minimumAllowedArea: float = ...) -> None: ...
+    def removeInteriorRing(self, i: int) -> bool: ...
+    def addInteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def setInteriorRings(self, rings: collections.abc.Iterable[QgsCurve]) -> None: ...
+    def setExteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def toPolygon(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsPolygon']: ...
+    def interiorRing(self, i: int) -> QgsCurve: ...
+    def exteriorRing(self) -> typing.Optional[QgsCurve]: ...
+    def numInteriorRings(self) -> int: ...
+    def roundness(self) -> float: ...
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsCurvePolygon']: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsCurvePolygon']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def surfaceToPolygon(self) -> typing.Optional['QgsPolygon']: ...
+    def normalize(self) -> None: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsCurvePolygon']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+
+
+class QgsGeometryParameters(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryParameters') -> None: ...
+
+    def setGridSize(self, size: float) -> None: ...
+    def gridSize(self) -> float: ...
+
+
+class QgsGeometry(PyQt5.sip.wrapper):
+
+    class Error(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, m: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, m: typing.Optional[str], p: QgsPointXY) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsGeometry.Error') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __repr__(self) -> typing.Any: ...
+        def hasWhere(self) -> bool: ...
+        def where(self) -> QgsPointXY: ...
+        def what(self) -> str: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometry') -> None: ...
+    @typing.overload
+    def __init__(self, geom: typing.Optional[QgsAbstractGeometry]) -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def convertPointList(input: collections.abc.Iterable[QgsPointXY], output: collections.abc.Iterable['QgsPoint']) -> None: ...
+    @typing.overload
+    @staticmethod
+    def convertPointList(input: collections.abc.Iterable['QgsPoint'], output: collections.abc.Iterable[QgsPointXY]) -> None: ...
+    @staticmethod
+    def createGeometryEngine(geometry: typing.Optional[QgsAbstractGeometry], precision: float = ..., flags: typing.Union[Qgis.GeosCreationFlags, Qgis.GeosCreationFlag] = ...) -> typing.Optional['QgsGeometryEngine']: ...
+    def smooth(self, iterations: int = ..., offset: float = ..., minimumDistance: float = ..., maxAngle: float = ...) -> 'QgsGeometry': ...
+    @staticmethod
+    def compare(obj1: typing.Any, obj2: typing.Any, epsilon: float = ...) -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def createPolygonFromQPolygonF(polygon: QtGui.QPolygonF) -> typing.Any: ...
+    @staticmethod
+    @deprecated("""""")
+    def createPolylineFromQPolygonF(polygon: QtGui.QPolygonF) -> list[QgsPointXY]: ...
+    @staticmethod
+    def fromQPolygonF(polygon: QtGui.QPolygonF) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromQPointF(point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> 'QgsGeometry': ...
+    def lastError(self) -> str: ...
+    def vertexNrFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def vertexIdFromVertexNr(self, number: int) -> typing.Tuple[bool, 'QgsVertexId']: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def mapToPixel(self, mtp: QgsMapToPixel) -> None: ...
+    def requiresConversionToStraightSegments(self) -> bool: ...
+    def convertToStraightSegment(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> None: ...
+    @staticmethod
+    def polygonize(geometries: collections.abc.Iterable['QgsGeometry']) -> 'QgsGeometry': ...
+    @staticmethod
+    def unaryUnion(geometries: collections.abc.Iterable['QgsGeometry'], parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def normalize(self) -> None: ...
+    def validateGeometry(self, method: Qgis.GeometryValidationEngine = ..., flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> list['QgsGeometry.Error']: ...
+    def forcePolygonCounterClockwise(self) -> 'QgsGeometry': ...
+    def forcePolygonClockwise(self) -> 'QgsGeometry': ...
+    def forceRHR(self) -> 'QgsGeometry': ...
+    def isPolygonClockwise(self) -> bool: ...
+    def isPolygonCounterClockwise(self) -> bool: ...
+    def polygonOrientation(self) -> Qgis.AngularDirection: ...
+    def makeValid(self, method: Qgis.MakeValidMethod = ..., keepCollapsed: bool = ...) -> 'QgsGeometry': ...
+    def avoidIntersectionsV2(self, avoidIntersectionsLayers: collections.abc.Iterable[QgsVectorLayer]) -> Qgis.GeometryOperationResult: ...
+    @deprecated("""""")
+    def avoidIntersections(self, avoidIntersectionsLayers: collections.abc.Iterable[QgsVectorLayer]) -> int: ...
+    def convertGeometryCollectionToSubclass(self, geomType: Qgis.GeometryType) -> bool: ...
+    def convertToSingleType(self) -> bool: ...
+    def convertToCurvedMultiType(self) -> bool: ...
+    def convertToMultiType(self) -> bool: ...
+    def deletePart(self, partNum: int) -> bool: ...
+    def deleteRing(self, ringNum: int, partNum: int = ...) -> bool: ...
+    def asQPolygonF(self) -> QtGui.QPolygonF: ...
+    def asQPointF(self) -> QtCore.QPointF: ...
+    def asGeometryCollection(self) -> list['QgsGeometry']: ...
+    def asMultiPolygon(self) -> QgsMultiPolygonXY: ...
+    def asMultiPolyline(self) -> QgsMultiPolylineXY: ...
+    def asMultiPoint(self) -> QgsMultiPointXY: ...
+    def asPolygon(self) -> QgsPolygonXY: ...
+    def asPolyline(self) -> QgsPolylineXY: ...
+    def asPoint(self) -> QgsPointXY: ...
+    def convertToType(self, destType: Qgis.GeometryType, destMultipart: bool = ...) -> 'QgsGeometry': ...
+    def coerceToType(self, type: Qgis.WkbType, defaultZ: float = ..., defaultM: float = ..., avoidDuplicates: bool = ...) -> list['QgsGeometry']: ...
+    def asJson(self, precision: int = ...) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def randomPointsInPolygon(self, count: int, seed: int = ...) -> QgsPolylineXY: ...
+    def extrude(self, x: float, y: float) -> 'QgsGeometry': ...
+    def symDifference(self, geometry: 'QgsGeometry', parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def difference(self, geometry: 'QgsGeometry', parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def mergeLines(self, parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def combine(self, geometry: 'QgsGeometry', parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def clipped(self, rectangle: 'QgsRectangle') -> 'QgsGeometry': ...
+    def intersection(self, geometry: 'QgsGeometry', parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def interpolateAngle(self, distance: float) -> float: ...
+    def lineLocatePoint(self, point: 'QgsGeometry') -> float: ...
+    def interpolate(self, distance: float) -> 'QgsGeometry': ...
+    def subdivide(self, maxNodes: int = ..., parameters: QgsGeometryParameters = ...) -> 'QgsGeometry': ...
+    def sharedPaths(self, other: 'QgsGeometry') -> 'QgsGeometry': ...
+    def node(self) -> 'QgsGeometry': ...
+    def unionCoverage(self) -> 'QgsGeometry': ...
+    def simplifyCoverageVW(self, tolerance: float, preserveBoundary: bool) -> 'QgsGeometry': ...
+    def validateCoverage(self, gapWidth: float) -> typing.Tuple[Qgis.CoverageValidityResult, typing.Optional['QgsGeometry']]: ...
+    def constrainedDelaunayTriangulation(self) -> 'QgsGeometry': ...
+    def delaunayTriangulation(self, tolerance: float = ..., edgesOnly: bool = ...) -> 'QgsGeometry': ...
+    def voronoiDiagram(self, extent: 'QgsGeometry' = ..., tolerance: float = ..., edgesOnly: bool = ...) -> 'QgsGeometry': ...
+    def concaveHull(self, targetPercent: float, allowHoles: bool = ...) -> 'QgsGeometry': ...
+    def convexHull(self) -> 'QgsGeometry': ...
+    def minimumClearanceLine(self) -> 'QgsGeometry': ...
+    def minimumClearance(self) -> float: ...
+    def minimumWidth(self) -> 'QgsGeometry': ...
+    def largestEmptyCircle(self, tolerance: float, boundary: 'QgsGeometry' = ...) -> 'QgsGeometry': ...
+    def poleOfInaccessibility(self, precision: float) -> typing.Tuple['QgsGeometry', typing.Optional[float]]: ...
+    def pointOnSurface(self) -> 'QgsGeometry': ...
+    def centroid(self) -> 'QgsGeometry': ...
+    def convertToCurves(self, distanceTolerance: float = ..., angleTolerance: float = ...) -> 'QgsGeometry': ...
+    def densifyByDistance(self, distance: float) -> 'QgsGeometry': ...
+    def densifyByCount(self, extraNodesPerSegment: int) -> 'QgsGeometry': ...
+    def simplify(self, tolerance: float) -> 'QgsGeometry': ...
+    def extendLine(self, startDistance: float, endDistance: float) -> 'QgsGeometry': ...
+    def variableWidthBufferByM(self, segments: int) -> 'QgsGeometry': ...
+    def taperedBuffer(self, startWidth: float, endWidth: float, segments: int) -> 'QgsGeometry': ...
+    def singleSidedBuffer(self, distance: float, segments: int, side: Qgis.BufferSide, joinStyle: Qgis.JoinStyle = ..., miterLimit: float = ...) -> 'QgsGeometry': ...
+    def offsetCurve(self, distance: float, segments: int, joinStyle: Qgis.JoinStyle, miterLimit: float) -> 'QgsGeometry': ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int) -> 'QgsGeometry': ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int, endCapStyle: Qgis.EndCapStyle, joinStyle: Qgis.JoinStyle, miterLimit: float) -> 'QgsGeometry': ...
+    def crosses(self, geometry: 'QgsGeometry') -> bool: ...
+    def within(self, geometry: 'QgsGeometry') -> bool: ...
+    def overlaps(self, geometry: 'QgsGeometry') -> bool: ...
+    def touches(self, geometry: 'QgsGeometry') -> bool: ...
+    def disjoint(self, geometry: 'QgsGeometry') -> bool: ...
+    @typing.overload
+    def contains(self, p: typing.Optional[QgsPointXY]) -> bool: ...
+    @typing.overload
+    def contains(self, x: float, y: float) -> bool: ...
+    @typing.overload
+    def contains(self, geometry: 'QgsGeometry') -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, rectangle: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, geometry: 'QgsGeometry') -> bool: ...
+    @typing.overload
+    def intersects(self, rectangle: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def intersects(self, geometry: 'QgsGeometry') -> bool: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ...) -> 'QgsGeometry': ...
+    def applyDashPattern(self, pattern: collections.abc.Iterable[float], startRule: Qgis.DashPatternLineEndingRule = ..., endRule: Qgis.DashPatternLineEndingRule = ..., adjustment: Qgis.DashPatternSizeAdjustment = ..., patternOffset: float = ...) -> 'QgsGeometry': ...
+    def roundWavesRandomized(self, minimumWavelength: float, maximumWavelength: float, minimumAmplitude: float, maximumAmplitude: float, seed: int = ...) -> 'QgsGeometry': ...
+    def roundWaves(self, wavelength: float, amplitude: float, strictWavelength: bool = ...) -> 'QgsGeometry': ...
+    def squareWavesRandomized(self, minimumWavelength: float, maximumWavelength: float, minimumAmplitude: float, maximumAmplitude: float, seed: int = ...) -> 'QgsGeometry': ...
+    def squareWaves(self, wavelength: float, amplitude: float, strictWavelength: bool = ...) -> 'QgsGeometry': ...
+    def triangularWavesRandomized(self, minimumWavelength: float, maximumWavelength: float, minimumAmplitude: float, maximumAmplitude: float, seed: int = ...) -> 'QgsGeometry': ...
+    def triangularWaves(self, wavelength: float, amplitude: float, strictWavelength: bool = ...) -> 'QgsGeometry': ...
+    def orthogonalize(self, tolerance: float = ..., maxIterations: int = ..., angleThreshold: float = ...) -> 'QgsGeometry': ...
+    def minimalEnclosingCircle(self, segments: int = ...) -> typing.Tuple['QgsGeometry', QgsPointXY, float]: ...
+    def orientedMinimumBoundingBox(self) -> typing.Tuple['QgsGeometry', float, float, float, float]: ...
+    def boundingBox3D(self) -> QgsBox3D: ...
+    def boundingBox(self) -> 'QgsRectangle': ...
+    def makeDifference(self, other: 'QgsGeometry') -> 'QgsGeometry': ...
+    def reshapeGeometry(self, reshapeLineString: 'QgsLineString') -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitGeometry(self, splitLine: list[typing.Union['QgsPoint', QgsPointXY]], topological: bool, splitFeature: bool = ...) -> tuple[Qgis.GeometryOperationResult, typing.Union[list['QgsPoint'], list[QgsPointXY]], typing.Union[list['QgsPoint'], list[QgsPointXY]]]: ...
+    @typing.overload
+    def splitGeometry(self, curve: typing.Optional[QgsCurve], preserveCircular: bool, topological: bool, splitFeature: bool = ...) -> typing.Tuple[Qgis.GeometryOperationResult, list['QgsGeometry'], list['QgsPoint']]: ...
+    def rotate(self, rotation: float, center: QgsPointXY) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', direction: Qgis.TransformDirection = ..., transformZ: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> Qgis.GeometryOperationResult: ...
+    def translate(self, dx: float, dy: float, dz: float = ..., dm: float = ...) -> Qgis.GeometryOperationResult: ...
+    def removeInteriorRings(self, minimumAllowedArea: float = ...) -> 'QgsGeometry': ...
+    def addPartGeometry(self, newPart: 'QgsGeometry') -> Qgis.GeometryOperationResult: ...
+    def addPartV2(self, part: typing.Optional[QgsAbstractGeometry], wkbType: Qgis.WkbType = ...) -> Qgis.GeometryOperationResult: ...
+    @deprecated("""""")
+    def addPart(self, part: typing.Optional[QgsAbstractGeometry], geomType: Qgis.GeometryType = ...) -> Qgis.GeometryOperationResult: ...
+    def addPointsV2(self, points: collections.abc.Iterable['QgsPoint'], wkbType: Qgis.WkbType = ...) -> Qgis.GeometryOperationResult: ...
+    @deprecated("""""")
+    def addPoints(self, points: collections.abc.Iterable['QgsPoint'], geomType: Qgis.GeometryType = ...) -> Qgis.GeometryOperationResult: ...
+    def addPointsXYV2(self, points: collections.abc.Iterable[QgsPointXY], wkbType: Qgis.WkbType = ...) -> Qgis.GeometryOperationResult: ...
+    @deprecated("""""")
+    def addPointsXY(self, points: collections.abc.Iterable[QgsPointXY], geomType: Qgis.GeometryType = ...) -> Qgis.GeometryOperationResult: ...
+    def addRing(self, ring: typing.Optional[typing.Union[collections.abc.Iterable[QgsPointXY], QgsCurve]]) -> Qgis.GeometryOperationResult: ...
+    def closestSegmentWithContext(self, point: QgsPointXY, epsilon: float = ...) -> typing.Tuple[float, QgsPointXY, int, typing.Optional[int]]: ...
+    def closestVertexWithContext(self, point: QgsPointXY) -> typing.Tuple[float, int]: ...
+    def shortestLine(self, other: 'QgsGeometry') -> 'QgsGeometry': ...
+    def nearestPoint(self, other: 'QgsGeometry') -> 'QgsGeometry': ...
+    def sqrDistToVertexAt(self, point: QgsPointXY, atVertex: int) -> float: ...
+    def vertexAt(self, atVertex: int) -> 'QgsPoint': ...
+    def toggleCircularAtVertex(self, atVertex: int) -> bool: ...
+    def deleteVertex(self, atVertex: int) -> bool: ...
+    @typing.overload
+    def moveVertex(self, x: float, y: float, atVertex: int) -> bool: ...
+    @typing.overload
+    def moveVertex(self, p: 'QgsPoint', atVertex: int) -> bool: ...
+    def addTopologicalPoint(self, point: 'QgsPoint', snappingTolerance: float = ..., segmentSearchEpsilon: float = ...) -> bool: ...
+    @typing.overload
+    def insertVertex(self, x: float, y: float, beforeVertex: int) -> bool: ...
+    @typing.overload
+    def insertVertex(self, point: 'QgsPoint', beforeVertex: int) -> bool: ...
+    def adjacentVertices(self, atVertex: int) -> typing.Tuple[int, int]: ...
+    def angleAtVertex(self, vertex: int) -> float: ...
+    def distanceToVertex(self, vertex: int) -> float: ...
+    def closestVertex(self, point: QgsPointXY) -> typing.Tuple[QgsPointXY, int, int, int, float]: ...
+    def frechetDistanceDensify(self, geom: 'QgsGeometry', densifyFraction: float) -> float: ...
+    def frechetDistance(self, geom: 'QgsGeometry') -> float: ...
+    def hausdorffDistanceDensify(self, geom: 'QgsGeometry', densifyFraction: float) -> float: ...
+    def hausdorffDistance(self, geom: 'QgsGeometry') -> float: ...
+    def constParts(self) -> QgsGeometryConstPartIterator: ...
+    def parts(self) -> QgsGeometryPartIterator: ...
+    def vertices(self) -> QgsVertexIterator: ...
+    def distance(self, geom: 'QgsGeometry') -> float: ...
+    def length(self) -> float: ...
+    def area(self) -> float: ...
+    def isAxisParallelRectangle(self, maximumDeviation: float, simpleRectanglesOnly: bool = ...) -> bool: ...
+    def isSimple(self) -> bool: ...
+    def isGeosValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> bool: ...
+    def isGeosEqual(self, a0: 'QgsGeometry') -> bool: ...
+    def equals(self, geometry: 'QgsGeometry') -> bool: ...
+    def isMultipart(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def type(self) -> Qgis.GeometryType: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def fromWkb(self, wkb: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> None: ...
+    @staticmethod
+    def createWedgeBufferFromAngles(center: 'QgsPoint', startAngle: float, endAngle: float, outerRadius: float, innerRadius: float = ...) -> 'QgsGeometry': ...
+    @staticmethod
+    def createWedgeBuffer(center: 'QgsPoint', azimuth: float, angularWidth: float, outerRadius: float, innerRadius: float = ...) -> 'QgsGeometry': ...
+    @staticmethod
+    def collectGeometry(geometries: collections.abc.Iterable['QgsGeometry']) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromBox3D(box: QgsBox3D) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromRect(rect: 'QgsRectangle') -> 'QgsGeometry': ...
+    @staticmethod
+    def fromMultiPolygonXY(multipoly: typing.Any) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromPolygonXY(polygon: typing.Any) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromMultiPolylineXY(multiline: typing.Any) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromPolyline(polyline: collections.abc.Iterable['QgsPoint']) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromPolylineXY(polyline: collections.abc.Iterable[QgsPointXY]) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromMultiPointXY(multipoint: collections.abc.Iterable[QgsPointXY]) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromPoint(point: 'QgsPoint') -> 'QgsGeometry': ...
+    @staticmethod
+    def fromPointXY(point: QgsPointXY) -> 'QgsGeometry': ...
+    @staticmethod
+    def fromWkt(wkt: typing.Optional[str]) -> 'QgsGeometry': ...
+    def isNull(self) -> bool: ...
+    @deprecated("""""")
+    def set(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    def get(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def constGet(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    OperationResult: typing.Type[Qgis.GeometryOperationResult]
+    Success: Qgis.GeometryOperationResult
+    NothingHappened: Qgis.GeometryOperationResult
+    InvalidBaseGeometry: Qgis.GeometryOperationResult
+    InvalidInputGeometryType: Qgis.GeometryOperationResult
+    SelectionIsEmpty: Qgis.GeometryOperationResult
+    SelectionIsGreaterThanOne: Qgis.GeometryOperationResult
+    GeometryEngineError: Qgis.GeometryOperationResult
+    LayerNotEditable: Qgis.GeometryOperationResult
+    AddPartSelectedGeometryNotFound: Qgis.GeometryOperationResult
+    AddPartNotMultiGeometry: Qgis.GeometryOperationResult
+    AddRingNotClosed: Qgis.GeometryOperationResult
+    AddRingNotValid: Qgis.GeometryOperationResult
+    AddRingCrossesExistingRings: Qgis.GeometryOperationResult
+    AddRingNotInExistingFeature: Qgis.GeometryOperationResult
+    SplitCannotSplitPoint: Qgis.GeometryOperationResult
+    GeometryTypeHasChanged: Qgis.GeometryOperationResult
+    ValidityFlag: typing.Type[Qgis.GeometryValidityFlag]
+    FlagAllowSelfTouchingHoles: Qgis.GeometryValidityFlag
+    ValidityFlags: typing.Type[Qgis.GeometryValidityFlags]
+    ValidationMethod: typing.Type[Qgis.GeometryValidationEngine]
+    ValidatorQgisInternal: Qgis.GeometryValidationEngine
+    ValidatorGeos: Qgis.GeometryValidationEngine
+    BufferSide: typing.Type[Qgis.BufferSide]
+    SideLeft: Qgis.BufferSide
+    SideRight: Qgis.BufferSide
+    EndCapStyle: typing.Type[Qgis.EndCapStyle]
+    CapRound: Qgis.EndCapStyle
+    CapFlat: Qgis.EndCapStyle
+    CapSquare: Qgis.EndCapStyle
+    JoinStyle: typing.Type[Qgis.JoinStyle]
+    JoinStyleRound: Qgis.JoinStyle
+    JoinStyleMiter: Qgis.JoinStyle
+    JoinStyleBevel: Qgis.JoinStyle
+
+
+class QgsGeometryCollection(QgsAbstractGeometry):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, c: 'QgsGeometryCollection') -> None: ...
+
+    def clearCache(self) -> None: ...
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    def wktOmitChildType(self) -> bool: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def childGeometry(self, index: int) -> typing.Optional[QgsAbstractGeometry]: ...
+    def childCount(self) -> int: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsGeometryCollection']: ...
+    def extractPartsByType(self, type: Qgis.WkbType, useFlatType: bool = ...) -> typing.Optional['QgsGeometryCollection']: ...
+    def __iter__(self) -> QgsGeometryPartIterator: ...
+    def __delitem__(self, index: int) -> None: ...
+    def __getitem__(self, index: int) -> QgsAbstractGeometry: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsGeometryCollection']: ...
+    def simplifiedTypeRef(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def toCurveType(self) -> typing.Optional['QgsGeometryCollection']: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def vertexAt(self, id: 'QgsVertexId') -> 'QgsPoint': ...
+    def partCount(self) -> int: ...
+    def ringCount(self, part: int = ...) -> int: ...
+    def vertexCount(self, part: int = ..., ring: int = ...) -> int: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def segmentize(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def length(self) -> float: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, 'QgsPoint']: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def nCoordinates(self) -> int: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    def boundingBox3D(self) -> QgsBox3D: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional['QgsAbstractGeometryTransformer'], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def normalize(self) -> None: ...
+    def takeGeometries(self) -> list[QgsAbstractGeometry]: ...
+    def removeGeometry(self, nr: int) -> bool: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def reserve(self, size: int) -> None: ...
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsGeometryCollection']: ...
+    def clear(self) -> None: ...
+    def geometryType(self) -> str: ...
+    def dimension(self) -> int: ...
+    def isEmpty(self) -> bool: ...
+    def geometryN(self, n: int) -> QgsAbstractGeometry: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def numGeometries(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsGeometryCollection']: ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsGeometryEngine(PyQt5.sip.wrapper):
+
+    class EngineOperationResult(int):
+        Success = ... # type: QgsGeometryEngine.EngineOperationResult
+        NothingHappened = ... # type: QgsGeometryEngine.EngineOperationResult
+        MethodNotImplemented = ... # type: QgsGeometryEngine.EngineOperationResult
+        EngineError = ... # type: QgsGeometryEngine.EngineOperationResult
+        NodedGeometryError = ... # type: QgsGeometryEngine.EngineOperationResult
+        InvalidBaseGeometry = ... # type: QgsGeometryEngine.EngineOperationResult
+        InvalidInput = ... # type: QgsGeometryEngine.EngineOperationResult
+        SplitCannotSplitPoint = ... # type: QgsGeometryEngine.EngineOperationResult
+
+    @typing.overload
+    def __init__(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryEngine') -> None: ...
+
+    def logError(self, engineName: typing.Optional[str], message: typing.Optional[str]) -> None: ...
+    def setLogErrors(self, enabled: bool) -> None: ...
+    def offsetCurve(self, distance: float, segments: int, joinStyle: Qgis.JoinStyle, miterLimit: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def splitGeometry(self, splitLine: 'QgsLineString', topological: bool, topologyTestPoints: collections.abc.Iterable['QgsPoint'], errorMsg: typing.Optional[typing.Optional[str]] = ..., skipIntersectionCheck: bool = ...) -> typing.Tuple['QgsGeometryEngine.EngineOperationResult', list[QgsGeometry]]: ...
+    def isSimple(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def isEmpty(self, errorMsg: typing.Optional[typing.Optional[str]]) -> bool: ...
+    def isEqual(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def isValid(self, errorMsg: typing.Optional[typing.Optional[str]] = ..., allowSelfTouchingHoles: bool = ..., errorLoc: typing.Optional[QgsGeometry] = ...) -> bool: ...
+    def length(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    def area(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    def relatePattern(self, geom: typing.Optional[QgsAbstractGeometry], pattern: typing.Optional[str], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def relate(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> str: ...
+    def disjoint(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def contains(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def overlaps(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def within(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def crosses(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def touches(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def intersects(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def distanceWithin(self, geom: typing.Optional[QgsAbstractGeometry], maxdistance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def distance(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    def convexHull(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def pointOnSurface(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsPoint']: ...
+    def centroid(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsPoint']: ...
+    def envelope(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def interpolate(self, distance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def simplify(self, tolerance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int, endCapStyle: Qgis.EndCapStyle, joinStyle: Qgis.JoinStyle, miterLimit: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def symDifference(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, geomList: collections.abc.Iterable[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]], parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, geometries: collections.abc.Iterable[QgsGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def difference(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def intersection(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def prepareGeometry(self) -> None: ...
+    def geometryChanged(self) -> None: ...
+
+
+class QgsAbstractGeometryTransformer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractGeometryTransformer') -> None: ...
+
+    def transformPoint(self, x: float, y: float, z: float, m: float) -> typing.Tuple[bool, float, float, float, float]: ...
+
+
+class QgsGeometryUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryUtils') -> None: ...
+
+    @staticmethod
+    def segmentIntersection(p1: 'QgsPoint', p2: 'QgsPoint', q1: 'QgsPoint', q2: 'QgsPoint', tolerance: float = ..., acceptImproperIntersection: bool = ...) -> typing.Tuple[bool, 'QgsPoint', bool]: ...
+    @staticmethod
+    def lineIntersection(p1: 'QgsPoint', v1: QgsVector, p2: 'QgsPoint', v2: QgsVector) -> typing.Tuple[bool, 'QgsPoint']: ...
+    @staticmethod
+    def circleCenterRadius(pt1: 'QgsPoint', pt2: 'QgsPoint', pt3: 'QgsPoint') -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def bisector(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float) -> typing.Tuple[bool, float, float]: ...
+    @staticmethod
+    def angleBisector(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float, dX: float, dY: float) -> typing.Tuple[bool, float, float, float]: ...
+    @staticmethod
+    def pointsAreCollinear(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float, epsilon: float) -> bool: ...
+    @staticmethod
+    def weightedPointInTriangle(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float, weightB: float, weightC: float) -> typing.Tuple[float, float]: ...
+    @staticmethod
+    def pointFractionAlongLine(x1: float, y1: float, x2: float, y2: float, px: float, py: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def triangleArea(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float) -> float: ...
+    @staticmethod
+    def linesIntersection3D(La1: QgsVector3D, La2: QgsVector3D, Lb1: QgsVector3D, Lb2: QgsVector3D) -> typing.Tuple[bool, QgsVector3D]: ...
+    @staticmethod
+    def skewLinesProjection(P1: QgsVector3D, P12: QgsVector3D, P2: QgsVector3D, P22: QgsVector3D, epsilon: float = ...) -> typing.Tuple[bool, QgsVector3D]: ...
+    @staticmethod
+    @deprecated("""""")
+    def skewLinesDistance(P1: QgsVector3D, P12: QgsVector3D, P2: QgsVector3D, P22: QgsVector3D) -> float: ...
+    @staticmethod
+    def perpendicularCenterSegment(centerPointX: float, centerPointY: float, segmentPoint1x: float, segmentPoint1y: float, segmentPoint2x: float, segmentPoint2y: float, segmentLength: float = ...) -> typing.Tuple[float, float, float, float]: ...
+    @staticmethod
+    def closestSideOfRectangle(right: float, bottom: float, left: float, top: float, x: float, y: float) -> int: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def averageAngle(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def averageAngle(a1: float, a2: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def linePerpendicularAngle(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def angleBetweenThreePoints(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def lineAngle(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def normalizedAngle(angle: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def interpolateArcValue(angle: float, a1: float, a2: float, a3: float, zm1: float, zm2: float, zm3: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def sweepAngle(centerX: float, centerY: float, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def circleLength(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    @deprecated("""""")
+    def angleOnCircle(angle: float, angle1: float, angle2: float, angle3: float) -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def circleAngleBetween(angle: float, angle1: float, angle2: float, clockwise: bool) -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def circleClockwise(angle1: float, angle2: float, angle3: float) -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def ccwAngle(dy: float, dx: float) -> float: ...
+    @staticmethod
+    def perpendicularOffsetPointAlongSegment(x1: float, y1: float, x2: float, y2: float, proportion: float, offset: float) -> typing.Tuple[typing.Optional[float], typing.Optional[float]]: ...
+    @staticmethod
+    @deprecated("""""")
+    def sqrDistToLine(ptX: float, ptY: float, x1: float, y1: float, x2: float, y2: float, epsilon: float) -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def distance3D(pt1: 'QgsPoint', pt2: 'QgsPoint') -> float: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def distance2D(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @typing.overload
+    @staticmethod
+    def distance2D(pt1: 'QgsPoint', pt2: 'QgsPoint') -> float: ...
+    @staticmethod
+    def sqrDistance3D(pt1: 'QgsPoint', pt2: 'QgsPoint') -> float: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def sqrDistance2D(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @typing.overload
+    @staticmethod
+    def sqrDistance2D(pt1: 'QgsPoint', pt2: 'QgsPoint') -> float: ...
+    @typing.overload
+    @staticmethod
+    def transferFirstZOrMValueToPoint(points: collections.abc.Iterable['QgsPoint'], point: 'QgsPoint') -> bool: ...
+    @typing.overload
+    @staticmethod
+    def transferFirstZOrMValueToPoint(geom: QgsGeometry, point: 'QgsPoint') -> bool: ...
+    @staticmethod
+    def transferFirstMValueToPoint(points: collections.abc.Iterable['QgsPoint'], point: 'QgsPoint') -> bool: ...
+    @staticmethod
+    def transferFirstZValueToPoint(points: collections.abc.Iterable['QgsPoint'], point: 'QgsPoint') -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def setZValueFromPoints(points: collections.abc.Iterable['QgsPoint'], point: 'QgsPoint') -> bool: ...
+    @staticmethod
+    def perpendicularSegment(p: 'QgsPoint', s1: 'QgsPoint', s2: 'QgsPoint') -> 'QgsLineString': ...
+    @staticmethod
+    def coefficients(pt1: 'QgsPoint', pt2: 'QgsPoint') -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def gradient(pt1: 'QgsPoint', pt2: 'QgsPoint') -> float: ...
+    @staticmethod
+    def interpolatePointOnLineByValue(x1: float, y1: float, v1: float, x2: float, y2: float, v2: float, value: float) -> QgsPointXY: ...
+    @typing.overload
+    @staticmethod
+    def interpolatePointOnLine(x1: float, y1: float, x2: float, y2: float, fraction: float) -> QgsPointXY: ...
+    @typing.overload
+    @staticmethod
+    def interpolatePointOnLine(p1: 'QgsPoint', p2: 'QgsPoint', fraction: float) -> 'QgsPoint': ...
+    @staticmethod
+    def midpoint(pt1: 'QgsPoint', pt2: 'QgsPoint') -> 'QgsPoint': ...
+    @staticmethod
+    def segmentSide(pt1: 'QgsPoint', pt3: 'QgsPoint', pt2: 'QgsPoint') -> int: ...
+    @staticmethod
+    def pointContinuesArc(a1: 'QgsPoint', a2: 'QgsPoint', a3: 'QgsPoint', b: 'QgsPoint', distanceTolerance: float, pointSpacingAngleTolerance: float) -> bool: ...
+    @staticmethod
+    def segmentizeArc(p1: 'QgsPoint', p2: 'QgsPoint', p3: 'QgsPoint', tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ..., hasZ: bool = ..., hasM: bool = ...) -> list['QgsPoint']: ...
+    @staticmethod
+    def circleTangentDirection(tangentPoint: 'QgsPoint', cp1: 'QgsPoint', cp2: 'QgsPoint', cp3: 'QgsPoint') -> float: ...
+    @staticmethod
+    def segmentMidPointFromCenter(p1: 'QgsPoint', p2: 'QgsPoint', center: 'QgsPoint', useShortestArc: bool = ...) -> 'QgsPoint': ...
+    @staticmethod
+    def segmentMidPoint(p1: 'QgsPoint', p2: 'QgsPoint', radius: float, mousePos: 'QgsPoint') -> typing.Tuple[bool, 'QgsPoint']: ...
+    @staticmethod
+    def interpolatePointOnArc(pt1: 'QgsPoint', pt2: 'QgsPoint', pt3: 'QgsPoint', distance: float) -> 'QgsPoint': ...
+    @staticmethod
+    def pointOnLineWithDistance(startPoint: 'QgsPoint', directionPoint: 'QgsPoint', distance: float) -> 'QgsPoint': ...
+    @typing.overload
+    @staticmethod
+    def leftOfLine(point: 'QgsPoint', p1: 'QgsPoint', p2: 'QgsPoint') -> int: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def leftOfLine(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> int: ...
+    @staticmethod
+    def projectPointOnSegment(p: 'QgsPoint', s1: 'QgsPoint', s2: 'QgsPoint') -> 'QgsPoint': ...
+    @staticmethod
+    def circleCircleInnerTangents(center1: QgsPointXY, radius1: float, center2: QgsPointXY, radius2: float) -> typing.Tuple[int, QgsPointXY, QgsPointXY, QgsPointXY, QgsPointXY]: ...
+    @staticmethod
+    def circleCircleOuterTangents(center1: QgsPointXY, radius1: float, center2: QgsPointXY, radius2: float) -> typing.Tuple[int, QgsPointXY, QgsPointXY, QgsPointXY, QgsPointXY]: ...
+    @staticmethod
+    def tangentPointAndCircle(center: QgsPointXY, radius: float, p: QgsPointXY) -> typing.Tuple[bool, QgsPointXY, QgsPointXY]: ...
+    @staticmethod
+    def circleCircleIntersections(center1: QgsPointXY, radius1: float, center2: QgsPointXY, radius2: float) -> typing.Tuple[int, QgsPointXY, QgsPointXY]: ...
+    @staticmethod
+    def lineCircleIntersection(center: QgsPointXY, radius: float, linePoint1: QgsPointXY, linePoint2: QgsPointXY, intersection: QgsPointXY) -> typing.Tuple[bool, QgsPointXY]: ...
+    @staticmethod
+    def distToInfiniteLine(point: 'QgsPoint', linePoint1: 'QgsPoint', linePoint2: 'QgsPoint', epsilon: float = ...) -> float: ...
+    @staticmethod
+    def verticesAtDistance(geometry: QgsAbstractGeometry, distance: float) -> typing.Tuple[bool, 'QgsVertexId', 'QgsVertexId']: ...
+    @staticmethod
+    def distanceToVertex(geom: QgsAbstractGeometry, id: 'QgsVertexId') -> float: ...
+    @staticmethod
+    def closestPoint(geometry: QgsAbstractGeometry, point: 'QgsPoint') -> 'QgsPoint': ...
+    @staticmethod
+    def closestVertex(geom: QgsAbstractGeometry, pt: 'QgsPoint') -> typing.Tuple['QgsPoint', 'QgsVertexId']: ...
+    @staticmethod
+    def extractLineStrings(geom: typing.Optional[QgsAbstractGeometry]) -> list['QgsLineString']: ...
+
+
+class QgsGeometryUtilsBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeometryUtilsBase') -> None: ...
+
+    @staticmethod
+    def azimuth(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    def project(aX: float, aY: float, aZ: float, distance: float, azimuth: float, inclination: float) -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def segmentIntersection(p1x: float, p1y: float, p2x: float, p2y: float, q1x: float, q1y: float, q2x: float, q2y: float, tolerance: float = ..., acceptImproperIntersection: bool = ...) -> typing.Tuple[bool, float, float, bool]: ...
+    @staticmethod
+    def lineIntersection(p1x: float, p1y: float, v1: QgsVector, p2x: float, p2y: float, v2: QgsVector) -> typing.Tuple[bool, float, float]: ...
+    @staticmethod
+    def bisector(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float) -> typing.Tuple[bool, float, float]: ...
+    @staticmethod
+    def angleBisector(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float, dX: float, dY: float) -> typing.Tuple[bool, float, float, float]: ...
+    @staticmethod
+    def pointsAreCollinear(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float, epsilon: float) -> bool: ...
+    @staticmethod
+    def weightedPointInTriangle(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float, weightB: float, weightC: float) -> typing.Tuple[float, float]: ...
+    @staticmethod
+    def pointFractionAlongLine(x1: float, y1: float, x2: float, y2: float, px: float, py: float) -> float: ...
+    @staticmethod
+    def triangleArea(aX: float, aY: float, bX: float, bY: float, cX: float, cY: float) -> float: ...
+    @staticmethod
+    def linesIntersection3D(La1: QgsVector3D, La2: QgsVector3D, Lb1: QgsVector3D, Lb2: QgsVector3D) -> typing.Tuple[bool, QgsVector3D]: ...
+    @staticmethod
+    def skewLinesProjection(P1: QgsVector3D, P12: QgsVector3D, P2: QgsVector3D, P22: QgsVector3D, epsilon: float = ...) -> typing.Tuple[bool, QgsVector3D]: ...
+    @staticmethod
+    def skewLinesDistance(P1: QgsVector3D, P12: QgsVector3D, P2: QgsVector3D, P22: QgsVector3D) -> float: ...
+    @staticmethod
+    def perpendicularCenterSegment(centerPointX: float, centerPointY: float, segmentPoint1x: float, segmentPoint1y: float, segmentPoint2x: float, segmentPoint2y: float, segmentLength: float = ...) -> typing.Tuple[float, float, float, float]: ...
+    @staticmethod
+    def closestSideOfRectangle(right: float, bottom: float, left: float, top: float, x: float, y: float) -> int: ...
+    @typing.overload
+    @staticmethod
+    def averageAngle(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @typing.overload
+    @staticmethod
+    def averageAngle(a1: float, a2: float) -> float: ...
+    @staticmethod
+    def linePerpendicularAngle(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    def angleBetweenThreePoints(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    def lineAngle(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    def normalizedAngle(angle: float) -> float: ...
+    @staticmethod
+    def interpolateArcValue(angle: float, a1: float, a2: float, a3: float, zm1: float, zm2: float, zm3: float) -> float: ...
+    @staticmethod
+    def sweepAngle(centerX: float, centerY: float, x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    def circleLength(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> float: ...
+    @staticmethod
+    def angleOnCircle(angle: float, angle1: float, angle2: float, angle3: float) -> bool: ...
+    @staticmethod
+    def circleAngleBetween(angle: float, angle1: float, angle2: float, clockwise: bool) -> bool: ...
+    @staticmethod
+    def circleClockwise(angle1: float, angle2: float, angle3: float) -> bool: ...
+    @staticmethod
+    def circleCenterRadius(x1: float, y1: float, x2: float, y2: float, x3: float, y3: float) -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def ccwAngle(dy: float, dx: float) -> float: ...
+    @staticmethod
+    def perpendicularOffsetPointAlongSegment(x1: float, y1: float, x2: float, y2: float, proportion: float, offset: float) -> typing.Tuple[typing.Optional[float], typing.Optional[float]]: ...
+    @staticmethod
+    def leftOfLine(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> int: ...
+    @staticmethod
+    def sqrDistToLine(ptX: float, ptY: float, x1: float, y1: float, x2: float, y2: float, epsilon: float) -> typing.Tuple[float, float, float]: ...
+    @staticmethod
+    def distance2D(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    def sqrDistance2D(x1: float, y1: float, x2: float, y2: float) -> float: ...
+    @staticmethod
+    def distance3D(x1: float, y1: float, z1: float, x2: float, y2: float, z2: float) -> float: ...
+    @staticmethod
+    def sqrDistance3D(x1: float, y1: float, z1: float, x2: float, y2: float, z2: float) -> float: ...
+
+
+class QgsGeos(QgsGeometryEngine):
+
+    def __init__(self, geometry: typing.Optional[QgsAbstractGeometry], precision: float = ..., flags: typing.Union[Qgis.GeosCreationFlags, Qgis.GeosCreationFlag] = ...) -> None: ...
+
+    def unionCoverage(self) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def simplifyCoverageVW(self, tolerance: float, preserveBoundary: bool) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def concaveHull(self, targetPercent: float, allowHoles: bool = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def constrainedDelaunayTriangulation(self) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def delaunayTriangulation(self, tolerance: float = ..., edgesOnly: bool = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def voronoiDiagram(self, extent: typing.Optional[QgsAbstractGeometry] = ..., tolerance: float = ..., edgesOnly: bool = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    @typing.overload
+    def lineLocatePoint(self, point: 'QgsPoint') -> typing.Tuple[float, typing.Optional[str]]: ...
+    @typing.overload
+    def lineLocatePoint(self, x: float, y: float) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def shortestLine(self, other: typing.Optional[typing.Union[QgsGeometry, QgsAbstractGeometry]]) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def closestPoint(self, other: QgsGeometry) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def mergeLines(self, parameters: QgsGeometryParameters = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def sharedPaths(self, other: typing.Optional[QgsAbstractGeometry]) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def node(self) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def minimumClearanceLine(self) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def minimumClearance(self) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def minimumWidth(self) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def largestEmptyCircle(self, tolerance: float, boundary: typing.Optional[QgsAbstractGeometry] = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def maximumInscribedCircle(self, tolerance: float) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def singleSidedBuffer(self, distance: float, segments: int, side: Qgis.BufferSide, joinStyle: Qgis.JoinStyle, miterLimit: float) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def offsetCurve(self, distance: float, segments: int, joinStyle: Qgis.JoinStyle, miterLimit: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def splitGeometry(self, splitLine: 'QgsLineString', newGeometries: collections.abc.Iterable[QgsGeometry], topological: bool, topologyTestPoints: collections.abc.Iterable['QgsPoint'], errorMsg: typing.Optional[typing.Optional[str]] = ..., skipIntersectionCheck: bool = ...) -> QgsGeometryEngine.EngineOperationResult: ...
+    def isSimple(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def isEmpty(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def isEqual(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def isValid(self, errorMsg: typing.Optional[typing.Optional[str]] = ..., allowSelfTouchingHoles: bool = ..., errorLoc: typing.Optional[QgsGeometry] = ...) -> bool: ...
+    def length(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    def area(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    def relatePattern(self, geom: typing.Optional[QgsAbstractGeometry], pattern: typing.Optional[str], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def relate(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> str: ...
+    def disjoint(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def overlaps(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def within(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def crosses(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def touches(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def intersects(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def frechetDistanceDensify(self, geometry: typing.Optional[QgsAbstractGeometry], densifyFraction: float) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def frechetDistance(self, geometry: typing.Optional[QgsAbstractGeometry]) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def hausdorffDistanceDensify(self, geometry: typing.Optional[QgsAbstractGeometry], densifyFraction: float) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def hausdorffDistance(self, geometry: typing.Optional[QgsAbstractGeometry]) -> typing.Tuple[float, typing.Optional[str]]: ...
+    @typing.overload
+    def contains(self, x: float, y: float) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    def contains(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def distanceWithin(self, geom: typing.Optional[QgsAbstractGeometry], maxdistance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    @typing.overload
+    def distance(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ...) -> float: ...
+    @typing.overload
+    def distance(self, x: float, y: float) -> typing.Tuple[float, typing.Optional[str]]: ...
+    def convexHull(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def pointOnSurface(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsPoint']: ...
+    def centroid(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsPoint']: ...
+    def envelope(self, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def interpolate(self, distance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def simplify(self, tolerance: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def buffer(self, distance: float, segments: int, endCapStyle: Qgis.EndCapStyle, joinStyle: Qgis.JoinStyle, miterLimit: float, errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def symDifference(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, geomList: collections.abc.Iterable[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]], parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    @typing.overload
+    def combine(self, a0: collections.abc.Iterable[QgsGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def subdivide(self, maxNodes: int, parameters: QgsGeometryParameters = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def clip(self, rectangle: 'QgsRectangle') -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[str]]: ...
+    def difference(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def intersection(self, geom: typing.Optional[QgsAbstractGeometry], errorMsg: typing.Optional[typing.Optional[str]] = ..., parameters: QgsGeometryParameters = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def prepareGeometry(self) -> None: ...
+    def geometryChanged(self) -> None: ...
+    def makeValid(self, method: Qgis.MakeValidMethod = ..., keepCollapsed: bool = ..., errorMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+
+
+class QgsLineSegment2D(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, start: QgsPointXY, end: QgsPointXY) -> None: ...
+    @typing.overload
+    def __init__(self, x1: float, y1: float, x2: float, y2: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLineSegment2D') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def reverse(self) -> None: ...
+    def pointLeftOfLine(self, point: QgsPointXY) -> int: ...
+    def setEnd(self, end: QgsPointXY) -> None: ...
+    def setStart(self, start: QgsPointXY) -> None: ...
+    def setEndY(self, y: float) -> None: ...
+    def setEndX(self, x: float) -> None: ...
+    def setStartY(self, y: float) -> None: ...
+    def setStartX(self, x: float) -> None: ...
+    def end(self) -> QgsPointXY: ...
+    def start(self) -> QgsPointXY: ...
+    def endY(self) -> float: ...
+    def endX(self) -> float: ...
+    def startY(self) -> float: ...
+    def startX(self) -> float: ...
+    def lengthSquared(self) -> float: ...
+    def length(self) -> float: ...
+
+
+class QgsLineString(QgsCurve):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, points: collections.abc.Sequence[typing.Union['QgsPoint', QgsPointXY, collections.abc.Sequence[float]]]) -> None: ...
+    @typing.overload
+    def __init__(self, segment: QgsLineSegment2D) -> None: ...
+    @typing.overload
+    def __init__(self, x: collections.abc.Iterable[float], y: collections.abc.Iterable[float], z: collections.abc.Iterable[float] = ..., m: collections.abc.Iterable[float] = ..., is25DType: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, p1: 'QgsPoint', p2: 'QgsPoint') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLineString') -> None: ...
+
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def lineLocatePointByM(self, m: float, use3DDistance: bool = ...) -> typing.Tuple[bool, float, float, float, float]: ...
+    def interpolateM(self, use3DDistance: bool = ...) -> typing.Optional['QgsLineString']: ...
+    def measuredLine(self, start: float, end: float) -> typing.Optional['QgsLineString']: ...
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    @deprecated("""""")
+    def calculateBoundingBox3d(self) -> QgsBox3D: ...
+    def __delitem__(self, index: int) -> None: ...
+    def __setitem__(self, index: int, point: 'QgsPoint') -> None: ...
+    def __getitem__(self, index: int) -> 'QgsPoint': ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsLineString']: ...
+    def scroll(self, firstVertexIndex: int) -> None: ...
+    def convertTo(self, type: Qgis.WkbType) -> bool: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def sumUpArea(self) -> float: ...
+    def centroid(self) -> 'QgsPoint': ...
+    def pointAt(self, node: int, point: 'QgsPoint') -> typing.Tuple[bool, Qgis.VertexType]: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def curveSubstring(self, startDistance: float, endDistance: float) -> typing.Optional['QgsLineString']: ...
+    def interpolatePoint(self, distance: float) -> typing.Optional['QgsPoint']: ...
+    def reversed(self) -> typing.Optional['QgsLineString']: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def drawAsPolygon(self, p: QtGui.QPainter) -> None: ...
+    def addToPainterPath(self, path: QtGui.QPainterPath) -> None: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional[QgsAbstractGeometryTransformer], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def points(self) -> list['QgsPoint']: ...
+    def nCoordinates(self) -> int: ...
+    def numPoints(self) -> int: ...
+    def curveToLine(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional['QgsLineString']: ...
+    def endPoint(self) -> 'QgsPoint': ...
+    def startPoint(self) -> 'QgsPoint': ...
+    def length3D(self) -> float: ...
+    def splitToDisjointXYParts(self) -> list['QgsLineString']: ...
+    def length(self) -> float: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsLineString']: ...
+    def asQPolygonF(self) -> QtGui.QPolygonF: ...
+    def collectDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> list['QgsVertexId']: ...
+    @typing.overload
+    def boundingBoxIntersects(self, rectangle: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def isClosed2D(self) -> bool: ...
+    def isClosed(self) -> bool: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsLineString']: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def indexOf(self, point: 'QgsPoint') -> int: ...
+    def isEmpty(self) -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsLineString']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def extend(self, startDistance: float, endDistance: float) -> None: ...
+    def toCurveType(self) -> typing.Optional[QgsCompoundCurve]: ...
+    def close(self) -> None: ...
+    def addVertex(self, pt: 'QgsPoint') -> None: ...
+    def append(self, line: typing.Optional['QgsLineString']) -> None: ...
+    def setPoints(self, points: collections.abc.Iterable['QgsPoint']) -> None: ...
+    def setMAt(self, index: int, m: float) -> None: ...
+    def setZAt(self, index: int, z: float) -> None: ...
+    def setYAt(self, index: int, y: float) -> None: ...
+    def setXAt(self, index: int, x: float) -> None: ...
+    def mAt(self, index: int) -> float: ...
+    def zAt(self, index: int) -> float: ...
+    def yAt(self, index: int) -> float: ...
+    def xAt(self, index: int) -> float: ...
+    def pointN(self, i: int) -> 'QgsPoint': ...
+    def equals(self, other: QgsCurve) -> bool: ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    @staticmethod
+    def fromQPolygonF(polygon: QtGui.QPolygonF) -> typing.Optional['QgsLineString']: ...
+    @staticmethod
+    def fromBezierCurve(start: 'QgsPoint', controlPoint1: 'QgsPoint', controlPoint2: 'QgsPoint', end: 'QgsPoint', segments: int = ...) -> typing.Optional['QgsLineString']: ...
+
+
+class QgsMultiCurve(QgsGeometryCollection):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiCurve') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsMultiCurve']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def reversed(self) -> typing.Optional['QgsMultiCurve']: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsMultiCurve']: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def toCurveType(self) -> typing.Optional['QgsMultiCurve']: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsMultiCurve']: ...
+    def geometryType(self) -> str: ...
+    def curveN(self, index: int) -> QgsCurve: ...
+
+
+class QgsMultiLineString(QgsMultiCurve):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, linestrings: collections.abc.Iterable[QgsLineString]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiLineString') -> None: ...
+
+    def wktOmitChildType(self) -> bool: ...
+    def measuredLine(self, start: float, end: float) -> typing.Optional['QgsMultiLineString']: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsMultiLineString']: ...
+    def toCurveType(self) -> typing.Optional[QgsMultiCurve]: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsMultiLineString']: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsMultiLineString']: ...
+    def geometryType(self) -> str: ...
+    def lineStringN(self, index: int) -> QgsLineString: ...
+
+
+class QgsMultiPoint(QgsGeometryCollection):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, points: collections.abc.Sequence[typing.Union['QgsPoint', QgsPointXY, collections.abc.Sequence[float]]]) -> None: ...
+    @typing.overload
+    def __init__(self, x: collections.abc.Iterable[float], y: collections.abc.Iterable[float], z: collections.abc.Iterable[float] = ..., m: collections.abc.Iterable[float] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiPoint') -> None: ...
+
+    def wktOmitChildType(self) -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsMultiPoint']: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsMultiPoint']: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def nCoordinates(self) -> int: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def clear(self) -> None: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def toCurveType(self) -> typing.Optional['QgsMultiPoint']: ...
+    def clone(self) -> typing.Optional['QgsMultiPoint']: ...
+    def geometryType(self) -> str: ...
+    def pointN(self, index: int) -> 'QgsPoint': ...
+
+
+class QgsMultiSurface(QgsGeometryCollection):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiSurface') -> None: ...
+
+    def createEmptyWithSameType(self) -> typing.Optional['QgsMultiSurface']: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsMultiSurface']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def toCurveType(self) -> typing.Optional['QgsMultiSurface']: ...
+    def clone(self) -> typing.Optional['QgsMultiSurface']: ...
+    def clear(self) -> None: ...
+    def geometryType(self) -> str: ...
+    def surfaceN(self, index: int) -> QgsSurface: ...
+
+
+class QgsMultiPolygon(QgsMultiSurface):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, polygons: collections.abc.Iterable['QgsPolygon']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMultiPolygon') -> None: ...
+
+    def wktOmitChildType(self) -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsMultiPolygon']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def toCurveType(self) -> typing.Optional[QgsMultiSurface]: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsMultiPolygon']: ...
+    def insertGeometry(self, g: typing.Optional[QgsAbstractGeometry], index: int) -> bool: ...
+    def addGeometries(self, geometries: collections.abc.Iterable[QgsAbstractGeometry]) -> bool: ...
+    def addGeometry(self, g: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def clone(self) -> typing.Optional['QgsMultiPolygon']: ...
+    def clear(self) -> None: ...
+    def geometryType(self) -> str: ...
+    def polygonN(self, index: int) -> 'QgsPolygon': ...
+
+
+class QgsOrientedBox3D(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, center: collections.abc.Iterable[float], halfAxes: collections.abc.Iterable[float]) -> None: ...
+    @typing.overload
+    def __init__(self, center: QgsVector3D, halfAxes: collections.abc.Iterable[QgsVector3D]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsOrientedBox3D') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def intersects(self, other: 'QgsOrientedBox3D') -> bool: ...
+    def transformed(self, transform: QgsMatrix4x4) -> 'QgsOrientedBox3D': ...
+    def reprojectedExtent(self, ct: 'QgsCoordinateTransform') -> QgsBox3D: ...
+    def size(self) -> QgsVector3D: ...
+    def corners(self) -> list[QgsVector3D]: ...
+    def extent(self) -> QgsBox3D: ...
+    def halfAxes(self) -> list[float]: ...
+    def center(self) -> QgsVector3D: ...
+    def centerZ(self) -> float: ...
+    def centerY(self) -> float: ...
+    def centerX(self) -> float: ...
+    def isNull(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def fromBox3D(box: QgsBox3D) -> 'QgsOrientedBox3D': ...
+
+
+class QgsPoint(QgsAbstractGeometry):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, x: typing.Optional[typing.Union['QgsPoint', typing.Union[QtCore.QPointF, QtCore.QPoint], float]] = ..., y: typing.Optional[float] = ..., z: typing.Optional[float] = ..., m: typing.Optional[float] = ..., wkbType: typing.Optional[int] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPoint') -> None: ...
+
+    def childPoint(self, index: int) -> 'QgsPoint': ...
+    def childCount(self) -> int: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsPoint']: ...
+    def convertTo(self, type: Qgis.WkbType) -> bool: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, rectangle: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def toCurveType(self) -> typing.Optional['QgsPoint']: ...
+    def vertexAt(self, a0: 'QgsVertexId') -> 'QgsPoint': ...
+    def partCount(self) -> int: ...
+    def ringCount(self, a0: int = ...) -> int: ...
+    def vertexCount(self, a0: int = ..., a1: int = ...) -> int: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, 'QgsPoint']: ...
+    def closestSegment(self, pt: 'QgsPoint', epsilon: float = ...) -> typing.Tuple[float, 'QgsPoint', 'QgsVertexId', typing.Optional[int]]: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: 'QgsPoint') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: 'QgsPoint') -> bool: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def nCoordinates(self) -> int: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional[QgsAbstractGeometryTransformer], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, a0: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsPoint']: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsPoint']: ...
+    def clone(self) -> typing.Optional['QgsPoint']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def boundingBox3D(self) -> QgsBox3D: ...
+    def isEmpty(self) -> bool: ...
+    def normalize(self) -> None: ...
+    def __add__(self, v: QgsVector) -> 'QgsPoint': ...
+    def __isub__(self, v: QgsVector) -> 'QgsPoint': ...
+    def __iadd__(self, v: QgsVector) -> 'QgsPoint': ...
+    @typing.overload
+    def __sub__(self, p: 'QgsPoint') -> QgsVector: ...
+    @typing.overload
+    def __sub__(self, v: QgsVector) -> 'QgsPoint': ...
+    def project(self, distance: float, azimuth: float, inclination: float = ...) -> 'QgsPoint': ...
+    def inclination(self, other: 'QgsPoint') -> float: ...
+    def azimuth(self, other: 'QgsPoint') -> float: ...
+    @typing.overload
+    def distanceSquared3D(self, x: float, y: float, z: float) -> float: ...
+    @typing.overload
+    def distanceSquared3D(self, other: 'QgsPoint') -> float: ...
+    @typing.overload
+    def distance3D(self, x: float, y: float, z: float) -> float: ...
+    @typing.overload
+    def distance3D(self, other: 'QgsPoint') -> float: ...
+    @typing.overload
+    def distanceSquared(self, x: float, y: float) -> float: ...
+    @typing.overload
+    def distanceSquared(self, other: 'QgsPoint') -> float: ...
+    @typing.overload
+    def distance(self, x: float, y: float) -> float: ...
+    @typing.overload
+    def distance(self, other: 'QgsPoint') -> float: ...
+    def toQPointF(self) -> QtCore.QPointF: ...
+    def setM(self, m: float) -> None: ...
+    def setZ(self, z: float) -> None: ...
+    def setY(self, y: float) -> None: ...
+    def setX(self, x: float) -> None: ...
+    def m(self) -> float: ...
+    def z(self) -> float: ...
+    def y(self) -> float: ...
+    def x(self) -> float: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+
+
+class QgsPolygon(QgsCurvePolygon):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, exterior: typing.Optional[QgsLineString], rings: collections.abc.Iterable[QgsLineString] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPolygon') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsPolygon']: ...
+    def pointDistanceToBoundary(self, x: float, y: float) -> float: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def setExteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def addInteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def toCurveType(self) -> typing.Optional[QgsCurvePolygon]: ...
+    def surfaceToPolygon(self) -> typing.Optional['QgsPolygon']: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsPolygon']: ...
+    def geometryType(self) -> str: ...
+
+
+class QgsPolyhedralSurface(QgsSurface):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p: 'QgsPolyhedralSurface') -> None: ...
+    @typing.overload
+    def __init__(self, multiPolygon: typing.Optional[QgsMultiPolygon]) -> None: ...
+
+    def calculateBoundingBox3D(self) -> QgsBox3D: ...
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def childGeometry(self, index: int) -> typing.Optional[QgsAbstractGeometry]: ...
+    def childCount(self) -> int: ...
+    def __getitem__(self, index: int) -> QgsPolygon: ...
+    def __len__(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsPolyhedralSurface']: ...
+    def toMultiPolygon(self) -> typing.Optional[QgsMultiPolygon]: ...
+    def toCurveType(self) -> typing.Optional[QgsMultiSurface]: ...
+    def swapXy(self) -> None: ...
+    def dropMValue(self) -> bool: ...
+    def dropZValue(self) -> bool: ...
+    def addMValue(self, mValue: float = ...) -> bool: ...
+    def addZValue(self, zValue: float = ...) -> bool: ...
+    def segmentLength(self, startVertex: 'QgsVertexId') -> float: ...
+    def vertexAt(self, id: 'QgsVertexId') -> QgsPoint: ...
+    def partCount(self) -> int: ...
+    def ringCount(self, part: int = ...) -> int: ...
+    def vertexCount(self, part: int = ..., ring: int = ...) -> int: ...
+    def vertexAngle(self, vertex: 'QgsVertexId') -> float: ...
+    def segmentize(self, tolerance: float = ..., toleranceType: QgsAbstractGeometry.SegmentationToleranceType = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def hasCurvedSegments(self) -> bool: ...
+    def adjacentVertices(self, vertex: 'QgsVertexId') -> typing.Tuple['QgsVertexId', 'QgsVertexId']: ...
+    def nextVertex(self, id: 'QgsVertexId') -> typing.Tuple[bool, QgsPoint]: ...
+    def closestSegment(self, pt: QgsPoint, epsilon: float = ...) -> typing.Tuple[float, QgsPoint, 'QgsVertexId', typing.Optional[int]]: ...
+    def isEmpty(self) -> bool: ...
+    def vertexNumberFromVertexId(self, id: 'QgsVertexId') -> int: ...
+    def nCoordinates(self) -> int: ...
+    def coordinateSequence(self) -> typing.Any: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def moveVertex(self, position: 'QgsVertexId', newPos: QgsPoint) -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: QgsPoint) -> bool: ...
+    @typing.overload
+    def transform(self, ct: 'QgsCoordinateTransform', d: Qgis.TransformDirection = ..., transformZ: bool = ...) -> None: ...
+    @typing.overload
+    def transform(self, t: QtGui.QTransform, zTranslate: float = ..., zScale: float = ..., mTranslate: float = ..., mScale: float = ...) -> None: ...
+    @typing.overload
+    def transform(self, transformer: typing.Optional[QgsAbstractGeometryTransformer], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def draw(self, p: QtGui.QPainter) -> None: ...
+    def asQPainterPath(self) -> QtGui.QPainterPath: ...
+    def removePatch(self, ringIndex: int) -> bool: ...
+    def addPatch(self, patch: typing.Optional[QgsPolygon]) -> None: ...
+    def setPatches(self, patches: collections.abc.Iterable[QgsPolygon]) -> None: ...
+    def patchN(self, i: int) -> QgsPolygon: ...
+    def numPatches(self) -> int: ...
+    def boundingBoxIntersects(self, box3d: QgsBox3D) -> bool: ...
+    def removeDuplicateNodes(self, epsilon: float = ..., useZValues: bool = ...) -> bool: ...
+    def simplifyByDistance(self, tolerance: float) -> typing.Optional['QgsPolyhedralSurface']: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsPolyhedralSurface']: ...
+    def boundary(self) -> typing.Optional[QgsAbstractGeometry]: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def normalize(self) -> None: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asWkt(self, precision: int = ...) -> str: ...
+    def asWkb(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> QtCore.QByteArray: ...
+    def wkbSize(self, flags: typing.Union[QgsAbstractGeometry.WkbFlags, QgsAbstractGeometry.WkbFlag] = ...) -> int: ...
+    def isValid(self, flags: typing.Union[Qgis.GeometryValidityFlags, Qgis.GeometryValidityFlag] = ...) -> typing.Tuple[bool, str]: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsPolyhedralSurface']: ...
+    def dimension(self) -> int: ...
+    def geometryType(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+
+
+class QgsQuadrilateral(PyQt5.sip.wrapper):
+
+    class Point(int):
+        Point1 = ... # type: QgsQuadrilateral.Point
+        Point2 = ... # type: QgsQuadrilateral.Point
+        Point3 = ... # type: QgsQuadrilateral.Point
+        Point4 = ... # type: QgsQuadrilateral.Point
+
+    class ConstructionOption(int):
+        Distance = ... # type: QgsQuadrilateral.ConstructionOption
+        Projected = ... # type: QgsQuadrilateral.ConstructionOption
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p1: QgsPoint, p2: QgsPoint, p3: QgsPoint, p4: QgsPoint) -> None: ...
+    @typing.overload
+    def __init__(self, p1: QgsPointXY, p2: QgsPointXY, p3: QgsPointXY, p4: QgsPointXY) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsQuadrilateral') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def toString(self, pointPrecision: int = ...) -> str: ...
+    def toLineString(self, force2D: bool = ...) -> typing.Optional[QgsLineString]: ...
+    def toPolygon(self, force2D: bool = ...) -> typing.Optional[QgsPolygon]: ...
+    def points(self) -> list[QgsPoint]: ...
+    def setPoints(self, p1: QgsPoint, p2: QgsPoint, p3: QgsPoint, p4: QgsPoint) -> bool: ...
+    def setPoint(self, newPoint: QgsPoint, index: 'QgsQuadrilateral.Point') -> bool: ...
+    def isValid(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def equals(self, other: 'QgsQuadrilateral', epsilon: float = ...) -> bool: ...
+    @staticmethod
+    def fromRectangle(rectangle: 'QgsRectangle') -> 'QgsQuadrilateral': ...
+    @staticmethod
+    def rectangleFromCenterPoint(center: QgsPoint, point: QgsPoint) -> 'QgsQuadrilateral': ...
+    @staticmethod
+    def squareFromDiagonal(p1: QgsPoint, p2: QgsPoint) -> 'QgsQuadrilateral': ...
+    @staticmethod
+    def rectangleFromExtent(p1: QgsPoint, p2: QgsPoint) -> 'QgsQuadrilateral': ...
+    @staticmethod
+    def rectangleFrom3Points(p1: QgsPoint, p2: QgsPoint, p3: QgsPoint, mode: 'QgsQuadrilateral.ConstructionOption') -> 'QgsQuadrilateral': ...
+
+
+class QgsRectangle(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, xMin: float, yMin: float = ..., xMax: float = ..., yMax: float = ..., normalize: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, p1: QgsPointXY, p2: QgsPointXY, normalize: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, qRectF: QtCore.QRectF) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsRectangle') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def snappedToGrid(self, spacing: float) -> 'QgsRectangle': ...
+    def toBox3d(self, zMin: float, zMax: float) -> QgsBox3D: ...
+    def invert(self) -> None: ...
+    def isFinite(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def asPolygon(self) -> str: ...
+    def toString(self, precision: int = ...) -> str: ...
+    def toRectF(self) -> QtCore.QRectF: ...
+    def asWktPolygon(self) -> str: ...
+    def asWktCoordinates(self) -> str: ...
+    def isMaximal(self) -> bool: ...
+    def isNull(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def __iadd__(self, v: QgsVector) -> 'QgsRectangle': ...
+    def __isub__(self, v: QgsVector) -> 'QgsRectangle': ...
+    def __add__(self, v: QgsVector) -> 'QgsRectangle': ...
+    def __sub__(self, v: QgsVector) -> 'QgsRectangle': ...
+    def distance(self, point: QgsPointXY) -> float: ...
+    @typing.overload
+    def combineExtentWith(self, rect: 'QgsRectangle') -> None: ...
+    @typing.overload
+    def combineExtentWith(self, x: float, y: float) -> None: ...
+    @typing.overload
+    def combineExtentWith(self, point: QgsPointXY) -> None: ...
+    @typing.overload
+    def contains(self, rect: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    def contains(self, p: QgsPointXY) -> bool: ...
+    @typing.overload
+    def contains(self, x: float, y: float) -> bool: ...
+    def intersects(self, rect: 'QgsRectangle') -> bool: ...
+    def intersect(self, rect: 'QgsRectangle') -> 'QgsRectangle': ...
+    def buffered(self, width: float) -> 'QgsRectangle': ...
+    def include(self, p: QgsPointXY) -> None: ...
+    def grow(self, delta: float) -> None: ...
+    def scaled(self, scaleFactor: float, center: typing.Optional[QgsPointXY] = ...) -> 'QgsRectangle': ...
+    @typing.overload
+    def scale(self, scaleFactor: float, c: typing.Optional[QgsPointXY] = ...) -> None: ...
+    @typing.overload
+    def scale(self, scaleFactor: float, centerX: float, centerY: float) -> None: ...
+    def center(self) -> QgsPointXY: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def height(self) -> float: ...
+    def width(self) -> float: ...
+    def normalize(self) -> None: ...
+    def yMinimum(self) -> float: ...
+    def yMaximum(self) -> float: ...
+    def xMinimum(self) -> float: ...
+    def xMaximum(self) -> float: ...
+    @deprecated("""""")
+    def setMinimal(self) -> None: ...
+    def setNull(self) -> None: ...
+    def setYMaximum(self, y: float) -> None: ...
+    def setYMinimum(self, y: float) -> None: ...
+    def setXMaximum(self, x: float) -> None: ...
+    def setXMinimum(self, x: float) -> None: ...
+    @typing.overload
+    def set(self, p1: QgsPointXY, p2: QgsPointXY, normalize: bool = ...) -> None: ...
+    @typing.overload
+    def set(self, xMin: float, yMin: float, xMax: float, yMax: float, normalize: bool = ...) -> None: ...
+    @staticmethod
+    def fromCenterAndSize(center: QgsPointXY, width: float, height: float) -> 'QgsRectangle': ...
+    @staticmethod
+    def fromWkt(wkt: typing.Optional[str]) -> 'QgsRectangle': ...
+
+
+class QgsReferencedGeometryBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, crs: 'QgsCoordinateReferenceSystem' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReferencedGeometryBase') -> None: ...
+
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+
+
+class QgsReferencedRectangle(QgsRectangle, QgsReferencedGeometryBase):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, rectangle: QgsRectangle, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReferencedRectangle') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsReferencedPointXY(QgsPointXY, QgsReferencedGeometryBase):
+
+    @typing.overload
+    def __init__(self, point: QgsPointXY, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReferencedPointXY') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsReferencedGeometry(QgsGeometry, QgsReferencedGeometryBase):
+
+    @typing.overload
+    def __init__(self, geometry: QgsGeometry, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReferencedGeometry') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def fromReferencedRect(rectangle: QgsReferencedRectangle) -> 'QgsReferencedGeometry': ...
+    @staticmethod
+    def fromReferencedPointXY(point: QgsReferencedPointXY) -> 'QgsReferencedGeometry': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsRegularPolygon(PyQt5.sip.wrapper):
+
+    class ConstructionOption(int):
+        InscribedCircle = ... # type: QgsRegularPolygon.ConstructionOption
+        CircumscribedCircle = ... # type: QgsRegularPolygon.ConstructionOption
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, center: QgsPoint, radius: float, azimuth: float, numberSides: int, circle: 'QgsRegularPolygon.ConstructionOption') -> None: ...
+    @typing.overload
+    def __init__(self, center: QgsPoint, pt1: QgsPoint, numberSides: int, circle: 'QgsRegularPolygon.ConstructionOption') -> None: ...
+    @typing.overload
+    def __init__(self, pt1: QgsPoint, pt2: QgsPoint, numberSides: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRegularPolygon') -> None: ...
+
+    def length(self) -> float: ...
+    def perimeter(self) -> float: ...
+    def area(self) -> float: ...
+    def centralAngle(self) -> float: ...
+    def interiorAngle(self) -> float: ...
+    def toString(self, pointPrecision: int = ..., radiusPrecision: int = ..., anglePrecision: int = ...) -> str: ...
+    def circumscribedCircle(self) -> QgsCircle: ...
+    def inscribedCircle(self) -> QgsCircle: ...
+    def triangulate(self) -> list['QgsTriangle']: ...
+    def toTriangle(self) -> 'QgsTriangle': ...
+    def toLineString(self) -> typing.Optional[QgsLineString]: ...
+    def toPolygon(self) -> typing.Optional[QgsPolygon]: ...
+    def points(self) -> list[QgsPoint]: ...
+    def setNumberSides(self, numberSides: int) -> None: ...
+    def setFirstVertex(self, firstVertex: QgsPoint) -> None: ...
+    def setRadius(self, radius: float) -> None: ...
+    def setCenter(self, center: QgsPoint) -> None: ...
+    def numberSides(self) -> int: ...
+    def apothem(self) -> float: ...
+    def firstVertex(self) -> QgsPoint: ...
+    def radius(self) -> float: ...
+    def center(self) -> QgsPoint: ...
+    def isEmpty(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsSphere(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, x: float, y: float, z: float, radius: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSphere') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def boundingBox(self) -> QgsBox3D: ...
+    def toCircle(self) -> QgsCircle: ...
+    def surfaceArea(self) -> float: ...
+    def volume(self) -> float: ...
+    def diameter(self) -> float: ...
+    def setRadius(self, radius: float) -> None: ...
+    def radius(self) -> float: ...
+    @typing.overload
+    def setCenter(self, center: QgsPoint) -> None: ...
+    @typing.overload
+    def setCenter(self, x: float, y: float, z: float) -> None: ...
+    def centerZ(self) -> float: ...
+    def centerY(self) -> float: ...
+    def centerX(self) -> float: ...
+    def centerVector(self) -> QgsVector3D: ...
+    def center(self) -> QgsPoint: ...
+    def isEmpty(self) -> bool: ...
+    def isNull(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsTriangle(QgsPolygon):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p1: QgsPoint, p2: QgsPoint, p3: QgsPoint) -> None: ...
+    @typing.overload
+    def __init__(self, p1: QgsPointXY, p2: QgsPointXY, p3: QgsPointXY) -> None: ...
+    @typing.overload
+    def __init__(self, p1: typing.Union[QtCore.QPointF, QtCore.QPoint], p2: typing.Union[QtCore.QPointF, QtCore.QPoint], p3: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTriangle') -> None: ...
+
+    def createEmptyWithSameType(self) -> typing.Optional['QgsTriangle']: ...
+    def inscribedCircle(self) -> QgsCircle: ...
+    def inscribedRadius(self) -> float: ...
+    def inscribedCenter(self) -> QgsPoint: ...
+    def circumscribedCircle(self) -> QgsCircle: ...
+    def circumscribedRadius(self) -> float: ...
+    def circumscribedCenter(self) -> QgsPoint: ...
+    def orthocenter(self, lengthTolerance: float = ...) -> QgsPoint: ...
+    def medial(self) -> 'QgsTriangle': ...
+    def bisectors(self, lengthTolerance: float = ...) -> list[QgsLineString]: ...
+    def medians(self) -> list[QgsLineString]: ...
+    def altitudes(self) -> list[QgsLineString]: ...
+    def isScalene(self, lengthTolerance: float = ...) -> bool: ...
+    def isRight(self, angleTolerance: float = ...) -> bool: ...
+    def isEquilateral(self, lengthTolerance: float = ...) -> bool: ...
+    def isIsocele(self, lengthTolerance: float = ...) -> bool: ...
+    def isDegenerate(self) -> bool: ...
+    def angles(self) -> list[float]: ...
+    def lengths(self) -> list[float]: ...
+    @typing.overload
+    def vertexAt(self, id: 'QgsVertexId') -> QgsPoint: ...
+    @typing.overload
+    def vertexAt(self, atVertex: int) -> QgsPoint: ...
+    def boundary(self) -> typing.Optional[QgsCurve]: ...
+    def setExteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def moveVertex(self, vId: 'QgsVertexId', newPos: QgsPoint) -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: QgsPoint) -> bool: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def addInteriorRing(self, ring: typing.Optional[QgsCurve]) -> None: ...
+    def toCurveType(self) -> typing.Optional[QgsCurvePolygon]: ...
+    def surfaceToPolygon(self) -> typing.Optional[QgsPolygon]: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkbPtr: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsTriangle']: ...
+    def geometryType(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsTriangulatedSurface(QgsPolyhedralSurface):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p: 'QgsTriangulatedSurface') -> None: ...
+
+    def compareToSameClass(self, other: typing.Optional[QgsAbstractGeometry]) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def createEmptyWithSameType(self) -> typing.Optional['QgsTriangulatedSurface']: ...
+    def triangleN(self, index: int) -> QgsPolygon: ...
+    def addTriangle(self, triangle: typing.Optional[QgsTriangle]) -> None: ...
+    def addPatch(self, patch: typing.Optional[QgsPolygon]) -> None: ...
+    def setTriangles(self, triangles: collections.abc.Iterable[QgsTriangle]) -> None: ...
+    def deleteVertex(self, position: 'QgsVertexId') -> bool: ...
+    def insertVertex(self, position: 'QgsVertexId', vertex: QgsPoint) -> bool: ...
+    def snappedToGrid(self, hSpacing: float, vSpacing: float, dSpacing: float = ..., mSpacing: float = ..., removeRedundantPoints: bool = ...) -> typing.Optional['QgsTriangulatedSurface']: ...
+    def normalize(self) -> None: ...
+    def asKml(self, precision: int = ...) -> str: ...
+    def asGml3(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def asGml2(self, doc: QtXml.QDomDocument, precision: int = ..., ns: typing.Optional[str] = ..., axisOrder: QgsAbstractGeometry.AxisOrder = ...) -> QtXml.QDomElement: ...
+    def fromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    def fromWkb(self, wkb: 'QgsConstWkbPtr') -> bool: ...
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsTriangulatedSurface']: ...
+    def geometryType(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def fuzzyDistanceEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+    def fuzzyEqual(self, other: QgsAbstractGeometry, epsilon: float = ...) -> bool: ...
+
+
+class QgsVertexId(PyQt5.sip.wrapper):
+
+    part = ... # type: int
+    ring = ... # type: int
+    type = ... # type: Qgis.VertexType
+    vertex = ... # type: int
+
+    @typing.overload
+    def __init__(self, _part: int = ..., _ring: int = ..., _vertex: int = ..., _type: Qgis.VertexType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVertexId') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def vertexEqual(self, o: 'QgsVertexId') -> bool: ...
+    def ringEqual(self, o: 'QgsVertexId') -> bool: ...
+    def partEqual(self, o: 'QgsVertexId') -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @typing.overload
+    def isValid(self) -> bool: ...
+    @typing.overload
+    def isValid(self, geom: typing.Optional[QgsAbstractGeometry]) -> bool: ...
+    VertexType: typing.Type[Qgis.VertexType]
+    SegmentVertex: Qgis.VertexType
+    CurveVertex: Qgis.VertexType
+
+
+class QgsWkbPtr(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, p: typing.Optional[PyQt5.sip.array[bytes]]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsWkbPtr') -> None: ...
+
+
+class QgsConstWkbPtr(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, p: typing.Optional[PyQt5.sip.array[bytes]]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsConstWkbPtr') -> None: ...
+
+
+class QgsWkbTypes(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsWkbTypes') -> None: ...
+
+    @staticmethod
+    def to25D(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def dropM(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def dropZ(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def addM(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def addZ(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def hasM(type: Qgis.WkbType) -> bool: ...
+    @staticmethod
+    def hasZ(type: Qgis.WkbType) -> bool: ...
+    @staticmethod
+    def geometryDisplayString(type: Qgis.GeometryType) -> str: ...
+    @staticmethod
+    def translatedDisplayString(type: Qgis.WkbType) -> str: ...
+    @staticmethod
+    def displayString(type: Qgis.WkbType) -> str: ...
+    @staticmethod
+    def geometryType(type: Qgis.WkbType) -> Qgis.GeometryType: ...
+    @staticmethod
+    def coordDimensions(type: Qgis.WkbType) -> int: ...
+    @staticmethod
+    def wkbDimensions(type: Qgis.WkbType) -> int: ...
+    @staticmethod
+    def isCurvedType(type: Qgis.WkbType) -> bool: ...
+    @staticmethod
+    def isMultiType(type: Qgis.WkbType) -> bool: ...
+    @staticmethod
+    def isSingleType(type: Qgis.WkbType) -> bool: ...
+    @staticmethod
+    def parseType(wktStr: typing.Optional[str]) -> Qgis.WkbType: ...
+    @staticmethod
+    def zmType(type: Qgis.WkbType, hasZ: bool, hasM: bool) -> Qgis.WkbType: ...
+    @staticmethod
+    def flatType(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def linearType(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def curveType(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def promoteNonPointTypesToMulti(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def multiType(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    @staticmethod
+    def singleType(type: Qgis.WkbType) -> Qgis.WkbType: ...
+    Type: typing.Type[Qgis.WkbType]
+    Unknown: Qgis.WkbType
+    Point: Qgis.WkbType
+    LineString: Qgis.WkbType
+    Polygon: Qgis.WkbType
+    Triangle: Qgis.WkbType
+    MultiPoint: Qgis.WkbType
+    MultiLineString: Qgis.WkbType
+    MultiPolygon: Qgis.WkbType
+    GeometryCollection: Qgis.WkbType
+    CircularString: Qgis.WkbType
+    CompoundCurve: Qgis.WkbType
+    CurvePolygon: Qgis.WkbType
+    MultiCurve: Qgis.WkbType
+    MultiSurface: Qgis.WkbType
+    PolyhedralSurface: Qgis.WkbType
+    TIN: Qgis.WkbType
+    NoGeometry: Qgis.WkbType
+    PointZ: Qgis.WkbType
+    LineStringZ: Qgis.WkbType
+    PolygonZ: Qgis.WkbType
+    TriangleZ: Qgis.WkbType
+    MultiPointZ: Qgis.WkbType
+    MultiLineStringZ: Qgis.WkbType
+    MultiPolygonZ: Qgis.WkbType
+    GeometryCollectionZ: Qgis.WkbType
+    CircularStringZ: Qgis.WkbType
+    CompoundCurveZ: Qgis.WkbType
+    CurvePolygonZ: Qgis.WkbType
+    MultiCurveZ: Qgis.WkbType
+    MultiSurfaceZ: Qgis.WkbType
+    PolyhedralSurfaceZ: Qgis.WkbType
+    TINZ: Qgis.WkbType
+    PointM: Qgis.WkbType
+    LineStringM: Qgis.WkbType
+    PolygonM: Qgis.WkbType
+    TriangleM: Qgis.WkbType
+    MultiPointM: Qgis.WkbType
+    MultiLineStringM: Qgis.WkbType
+    MultiPolygonM: Qgis.WkbType
+    GeometryCollectionM: Qgis.WkbType
+    CircularStringM: Qgis.WkbType
+    CompoundCurveM: Qgis.WkbType
+    CurvePolygonM: Qgis.WkbType
+    MultiCurveM: Qgis.WkbType
+    MultiSurfaceM: Qgis.WkbType
+    PolyhedralSurfaceM: Qgis.WkbType
+    TINM: Qgis.WkbType
+    PointZM: Qgis.WkbType
+    LineStringZM: Qgis.WkbType
+    PolygonZM: Qgis.WkbType
+    MultiPointZM: Qgis.WkbType
+    MultiLineStringZM: Qgis.WkbType
+    MultiPolygonZM: Qgis.WkbType
+    GeometryCollectionZM: Qgis.WkbType
+    CircularStringZM: Qgis.WkbType
+    CompoundCurveZM: Qgis.WkbType
+    CurvePolygonZM: Qgis.WkbType
+    MultiCurveZM: Qgis.WkbType
+    MultiSurfaceZM: Qgis.WkbType
+    PolyhedralSurfaceZM: Qgis.WkbType
+    TINZM: Qgis.WkbType
+    TriangleZM: Qgis.WkbType
+    Point25D: Qgis.WkbType
+    LineString25D: Qgis.WkbType
+    Polygon25D: Qgis.WkbType
+    MultiPoint25D: Qgis.WkbType
+    MultiLineString25D: Qgis.WkbType
+    MultiPolygon25D: Qgis.WkbType
+    GeometryType: typing.Type[Qgis.GeometryType]
+    PointGeometry: Qgis.GeometryType
+    LineGeometry: Qgis.GeometryType
+    PolygonGeometry: Qgis.GeometryType
+    UnknownGeometry: Qgis.GeometryType
+    NullGeometry: Qgis.GeometryType
+
+
+class QgsRay3D(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, origin: QtGui.QVector3D, direction: QtGui.QVector3D) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRay3D') -> None: ...
+
+    def angleToPoint(self, point: QtGui.QVector3D) -> float: ...
+    def isInFront(self, point: QtGui.QVector3D) -> bool: ...
+    def projectedPoint(self, point: QtGui.QVector3D) -> QtGui.QVector3D: ...
+    def setDirection(self, direction: QtGui.QVector3D) -> None: ...
+    def setOrigin(self, origin: QtGui.QVector3D) -> None: ...
+    def direction(self) -> QtGui.QVector3D: ...
+    def origin(self) -> QtGui.QVector3D: ...
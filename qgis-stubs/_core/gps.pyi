@@ -0,0 +1,273 @@
+# The PEP 484 type hints stub file for the _core.gps module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+from .expression import QgsDistanceArea
+from .geometry import QgsGeometry, QgsPoint
+from .proj import QgsCoordinateTransformContext
+from .vector import QgsPointXY, QgsVectorLayer
+
+
+class QgsAbstractBabelFormat(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractBabelFormat') -> None: ...
+
+    @staticmethod
+    def featureTypeToArgument(type: Qgis.GpsFeatureType) -> str: ...
+    def exportCommand(self, babel: typing.Optional[str], featureType: Qgis.GpsFeatureType, input: typing.Optional[str], output: typing.Optional[str], flags: typing.Union[Qgis.BabelCommandFlags, Qgis.BabelCommandFlag] = ...) -> list[str]: ...
+    def importCommand(self, babel: typing.Optional[str], featureType: Qgis.GpsFeatureType, input: typing.Optional[str], output: typing.Optional[str], flags: typing.Union[Qgis.BabelCommandFlags, Qgis.BabelCommandFlag] = ...) -> list[str]: ...
+    def capabilities(self) -> Qgis.BabelFormatCapabilities: ...
+    def name(self) -> str: ...
+
+
+class QgsBabelSimpleImportFormat(QgsAbstractBabelFormat):
+
+    @typing.overload
+    def __init__(self, format: typing.Optional[str], description: typing.Optional[str], capabilities: typing.Union[Qgis.BabelFormatCapabilities, Qgis.BabelFormatCapability], extensions: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBabelSimpleImportFormat') -> None: ...
+
+    def importCommand(self, babel: typing.Optional[str], featureType: Qgis.GpsFeatureType, input: typing.Optional[str], output: typing.Optional[str], flags: typing.Union[Qgis.BabelCommandFlags, Qgis.BabelCommandFlag] = ...) -> list[str]: ...
+    def extensions(self) -> list[str]: ...
+    def description(self) -> str: ...
+
+
+class QgsBabelFormatRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def reloadFromSettings(self) -> None: ...
+    def devices(self) -> typing.Any: ...
+    def deviceFormat(self, name: typing.Optional[str]) -> typing.Optional['QgsBabelGpsDeviceFormat']: ...
+    def deviceNames(self) -> list[str]: ...
+    def importFileFilter(self) -> str: ...
+    def importFormatByDescription(self, description: typing.Optional[str]) -> typing.Optional[QgsBabelSimpleImportFormat]: ...
+    def importFormat(self, name: typing.Optional[str]) -> typing.Optional[QgsBabelSimpleImportFormat]: ...
+    def importFormatNames(self) -> list[str]: ...
+
+
+class QgsBabelGpsDeviceFormat(QgsAbstractBabelFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, waypointDownloadCommand: typing.Optional[str], waypointUploadCommand: typing.Optional[str], routeDownloadCommand: typing.Optional[str], routeUploadCommand: typing.Optional[str], trackDownloadCommand: typing.Optional[str], trackUploadCommand: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBabelGpsDeviceFormat') -> None: ...
+
+    def exportCommand(self, babel: typing.Optional[str], type: Qgis.GpsFeatureType, in_: typing.Optional[str], out: typing.Optional[str], flags: typing.Union[Qgis.BabelCommandFlags, Qgis.BabelCommandFlag] = ...) -> list[str]: ...
+    def importCommand(self, babel: typing.Optional[str], type: Qgis.GpsFeatureType, in_: typing.Optional[str], out: typing.Optional[str], flags: typing.Union[Qgis.BabelCommandFlags, Qgis.BabelCommandFlag] = ...) -> list[str]: ...
+
+
+class QgsGpsConnection(QtCore.QObject):
+
+    class Status(int):
+        NotConnected = ... # type: QgsGpsConnection.Status
+        Connected = ... # type: QgsGpsConnection.Status
+        DataReceived = ... # type: QgsGpsConnection.Status
+        GPSDataReceived = ... # type: QgsGpsConnection.Status
+
+    def __init__(self, dev: typing.Optional[QtCore.QIODevice]) -> None: ...
+
+    def parseData(self) -> None: ...
+    positionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    fixStatusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    nmeaSentenceReceived: typing.ClassVar[QtCore.pyqtSignal]
+    stateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def lastValidLocation(self) -> QgsPoint: ...
+    def currentGPSInformation(self) -> 'QgsGpsInformation': ...
+    def status(self) -> 'QgsGpsConnection.Status': ...
+    def setSource(self, source: typing.Optional[QtCore.QIODevice]) -> None: ...
+    def close(self) -> bool: ...
+    def connect(self) -> bool: ...
+
+
+class QgsNmeaConnection(QgsGpsConnection):
+
+    def __init__(self, device: typing.Optional[QtCore.QIODevice]) -> None: ...
+
+    def processHchdgSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processHdtSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processGstSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processGsaSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processVtgSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processGsvSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processRmcSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processGgaSentence(self, data: typing.Optional[str], len: int) -> None: ...
+    def processStringBuffer(self) -> None: ...
+    def parseData(self) -> None: ...
+
+
+class QgsGpsdConnection(QgsNmeaConnection):
+
+    def __init__(self, host: typing.Optional[str], port: int, device: typing.Optional[str]) -> None: ...
+
+
+class QgsGpsDetector(QtCore.QObject):
+
+    def __init__(self, portName: typing.Optional[str] = ..., useUnsafeSignals: bool = ...) -> None: ...
+
+    detectionFailed: typing.ClassVar[QtCore.pyqtSignal]
+    connectionDetected: typing.ClassVar[QtCore.pyqtSignal]
+    def connDestroyed(self, a0: typing.Optional[QtCore.QObject]) -> None: ...
+    detected: typing.ClassVar[QtCore.pyqtSignal]
+    def advance(self) -> None: ...
+    @staticmethod
+    def availablePorts() -> list[tuple[str, str]]: ...
+    def takeConnection(self) -> typing.Optional[QgsGpsConnection]: ...
+
+
+class QgsGpsInformation(PyQt5.sip.wrapper):
+
+    direction = ... # type: float
+    elevation = ... # type: float
+    elevation_diff = ... # type: float
+    fixMode = ... # type: str
+    fixType = ... # type: int
+    hacc = ... # type: float
+    hdop = ... # type: float
+    hvacc = ... # type: float
+    latitude = ... # type: float
+    longitude = ... # type: float
+    pdop = ... # type: float
+    quality = ... # type: int
+    qualityIndicator = ... # type: Qgis.GpsQualityIndicator
+    satInfoComplete = ... # type: bool
+    satPrn = ... # type: collections.abc.Iterable[int]
+    satellitesInView = ... # type: collections.abc.Iterable['QgsSatelliteInfo']
+    satellitesUsed = ... # type: int
+    speed = ... # type: float
+    status = ... # type: str
+    utcDateTime = ... # type: typing.Union[QtCore.QDateTime, datetime.datetime]
+    utcTime = ... # type: typing.Union[QtCore.QTime, datetime.time]
+    vacc = ... # type: float
+    vdop = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGpsInformation') -> None: ...
+
+    def componentValue(self, component: Qgis.GpsInformationComponent) -> typing.Any: ...
+    def qualityDescription(self) -> str: ...
+    @deprecated("""""")
+    def fixStatus(self) -> Qgis.GpsFixStatus: ...
+    def isValid(self) -> bool: ...
+    def setNavigationStatus(self, status: Qgis.GpsNavigationStatus) -> None: ...
+    def navigationStatus(self) -> Qgis.GpsNavigationStatus: ...
+    def bestFixStatus(self) -> typing.Tuple[Qgis.GpsFixStatus, Qgis.GnssConstellation]: ...
+    def constellationFixStatus(self) -> dict[Qgis.GnssConstellation, Qgis.GpsFixStatus]: ...
+    FixStatus: typing.Type[Qgis.GpsFixStatus]
+    NoData: Qgis.GpsFixStatus
+    NoFix: Qgis.GpsFixStatus
+    Fix2D: Qgis.GpsFixStatus
+    Fix3D: Qgis.GpsFixStatus
+
+
+class QgsGpsLogger(QtCore.QObject):
+
+    def __init__(self, connection: typing.Optional[QgsGpsConnection], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def addTrackVertex(self) -> None: ...
+    distanceAreaChanged: typing.ClassVar[QtCore.pyqtSignal]
+    stateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    trackVertexAdded: typing.ClassVar[QtCore.pyqtSignal]
+    trackReset: typing.ClassVar[QtCore.pyqtSignal]
+    trackIsEmptyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def componentValue(self, component: Qgis.GpsInformationComponent) -> typing.Any: ...
+    def trackDistanceFromStart(self) -> float: ...
+    def totalTrackLength(self) -> float: ...
+    def updateGpsSettings(self) -> None: ...
+    def setAutomaticallyAddTrackVertices(self, enabled: bool) -> None: ...
+    def automaticallyAddTrackVertices(self) -> bool: ...
+    def resetTrack(self) -> None: ...
+    def lastMValue(self) -> float: ...
+    def lastElevation(self) -> float: ...
+    def trackStartTime(self) -> QtCore.QDateTime: ...
+    def lastTimestamp(self) -> QtCore.QDateTime: ...
+    def lastPosition(self) -> QgsPointXY: ...
+    def currentGeometry(self, type: Qgis.WkbType) -> typing.Tuple[QgsGeometry, str]: ...
+    def currentTrack(self) -> list[QgsPoint]: ...
+    def distanceArea(self) -> QgsDistanceArea: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def setEllipsoid(self, ellipsoid: typing.Optional[str]) -> None: ...
+    def setConnection(self, connection: typing.Optional[QgsGpsConnection]) -> None: ...
+    def connection(self) -> typing.Optional[QgsGpsConnection]: ...
+
+
+class QgsQtLocationConnection(QgsGpsConnection):
+
+    def __init__(self) -> None: ...
+
+    def satellitesInUseUpdated(self, satellites: collections.abc.Iterable[QtPositioning.QGeoSatelliteInfo]) -> None: ...
+    def satellitesInViewUpdated(self, satellites: collections.abc.Iterable[QtPositioning.QGeoSatelliteInfo]) -> None: ...
+    def parseData(self) -> None: ...
+    def broadcastConnectionAvailable(self) -> None: ...
+
+
+class QgsGpsConnectionRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def connectionList(self) -> list[QgsGpsConnection]: ...
+    def unregisterConnection(self, c: typing.Optional[QgsGpsConnection]) -> None: ...
+    def registerConnection(self, c: typing.Optional[QgsGpsConnection]) -> None: ...
+
+
+class QgsSatelliteInfo(PyQt5.sip.wrapper):
+
+    azimuth = ... # type: float
+    elevation = ... # type: float
+    id = ... # type: int
+    inUse = ... # type: bool
+    satType = ... # type: str
+    signal = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSatelliteInfo') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def constellation(self) -> Qgis.GnssConstellation: ...
+
+
+class QgsVectorLayerGpsLogger(QgsGpsLogger):
+
+    def __init__(self, connection: typing.Optional[QgsGpsConnection], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def endCurrentTrack(self) -> None: ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def destinationField(self, component: Qgis.GpsInformationComponent) -> str: ...
+    def setDestinationField(self, component: Qgis.GpsInformationComponent, field: typing.Optional[str]) -> None: ...
+    def tracksLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def pointsLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setTracksLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setPointsLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setWriteToEditBuffer(self, buffer: bool) -> None: ...
+    def writeToEditBuffer(self) -> bool: ...
@@ -0,0 +1,1065 @@
+# The PEP 484 type hints stub file for the _core.labeling module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsFields, QgsPropertyDefinition, QgsSldExportContext,
+    QgsStringReplacementCollection,
+)
+from .callouts import QgsCallout
+from .diagram import QgsMapUnitScale
+from .dxf import QgsMapSettings, QgsMapToPixel
+from .expression import QgsExpression
+from .geometry import QgsGeometry, QgsRectangle
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransform
+from .project import QgsProject
+from .symbology import QgsStyleEntityVisitorInterface
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsExpressionContext, QgsFeature, QgsMapLayer, QgsPointXY,
+    QgsPropertyCollection, QgsReadWriteContext, QgsRenderContext,
+    QgsVectorLayer,
+)
+
+
+class QgsScreenProperties(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, screen: typing.Optional[QtGui.QScreen]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScreenProperties') -> None: ...
+
+    def updateRenderContextForScreen(self, context: QgsRenderContext) -> None: ...
+    def setPhysicalDpi(self, dpi: float) -> None: ...
+    def physicalDpi(self) -> float: ...
+    def setDevicePixelRatio(self, ratio: float) -> None: ...
+    def devicePixelRatio(self) -> float: ...
+    def isValid(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsCalloutPosition(PyQt5.sip.wrapper):
+
+    featureId = ... # type: int
+    layerID = ... # type: typing.Optional[str]
+    providerID = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self, id: int, layer: typing.Optional[str], providerId: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCalloutPosition') -> None: ...
+
+    def setDestinationIsPinned(self, pinned: bool) -> None: ...
+    def destinationIsPinned(self) -> bool: ...
+    def setOriginIsPinned(self, pinned: bool) -> None: ...
+    def originIsPinned(self) -> bool: ...
+    def setDestination(self, destination: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def destination(self) -> QtCore.QPointF: ...
+    def setOrigin(self, origin: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def origin(self) -> QtCore.QPointF: ...
+
+
+class QgsLabeling(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabeling') -> None: ...
+    LinePlacementFlag: typing.Type[Qgis.LabelLinePlacementFlag]
+    OnLine: Qgis.LabelLinePlacementFlag
+    AboveLine: Qgis.LabelLinePlacementFlag
+    BelowLine: Qgis.LabelLinePlacementFlag
+    MapOrientation: Qgis.LabelLinePlacementFlag
+    LinePlacementFlags: typing.Type[Qgis.LabelLinePlacementFlags]
+    PolygonPlacementFlag: typing.Type[Qgis.LabelPolygonPlacementFlag]
+    AllowPlacementOutsideOfPolygon: Qgis.LabelPolygonPlacementFlag
+    AllowPlacementInsideOfPolygon: Qgis.LabelPolygonPlacementFlag
+
+
+class QgsLabelCandidate(PyQt5.sip.wrapper):
+
+    cost = ... # type: float
+    rect = ... # type: QtCore.QRectF
+
+    @typing.overload
+    def __init__(self, r: QtCore.QRectF, c: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelCandidate') -> None: ...
+
+
+class QgsLabelingEngineSettings(PyQt5.sip.wrapper):
+
+    class Search(int):
+        Chain = ... # type: QgsLabelingEngineSettings.Search
+        Popmusic_Tabu = ... # type: QgsLabelingEngineSettings.Search
+        Popmusic_Chain = ... # type: QgsLabelingEngineSettings.Search
+        Popmusic_Tabu_Chain = ... # type: QgsLabelingEngineSettings.Search
+        Falp = ... # type: QgsLabelingEngineSettings.Search
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsLabelingEngineSettings') -> None: ...
+
+    def setRules(self, rules: collections.abc.Iterable['QgsAbstractLabelingEngineRule']) -> None: ...
+    def addRule(self, rule: typing.Optional['QgsAbstractLabelingEngineRule']) -> None: ...
+    def rules(self) -> list['QgsAbstractLabelingEngineRule']: ...
+    def setPlacementVersion(self, version: Qgis.LabelPlacementEngineVersion) -> None: ...
+    def placementVersion(self) -> Qgis.LabelPlacementEngineVersion: ...
+    def setUnplacedLabelColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def unplacedLabelColor(self) -> QtGui.QColor: ...
+    def setDefaultTextRenderFormat(self, format: Qgis.TextRenderFormat) -> None: ...
+    def defaultTextRenderFormat(self) -> Qgis.TextRenderFormat: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeSettingsToProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readSettingsFromProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    @deprecated("""""")
+    def searchMethod(self) -> 'QgsLabelingEngineSettings.Search': ...
+    @deprecated("""""")
+    def setSearchMethod(self, s: 'QgsLabelingEngineSettings.Search') -> None: ...
+    @deprecated("""""")
+    def setNumCandidatePositions(self, candPoint: int, candLine: int, candPolygon: int) -> None: ...
+    @deprecated("""""")
+    def numCandidatePositions(self) -> typing.Tuple[int, int, int]: ...
+    def setMaximumPolygonCandidatesPerCmSquared(self, candidates: float) -> None: ...
+    def maximumPolygonCandidatesPerCmSquared(self) -> float: ...
+    def setMaximumLineCandidatesPerCm(self, candidates: float) -> None: ...
+    def maximumLineCandidatesPerCm(self) -> float: ...
+    def setFlag(self, f: Qgis.LabelingFlag, enabled: bool = ...) -> None: ...
+    def testFlag(self, f: Qgis.LabelingFlag) -> bool: ...
+    def flags(self) -> Qgis.LabelingFlags: ...
+    def setFlags(self, flags: typing.Union[Qgis.LabelingFlags, Qgis.LabelingFlag]) -> None: ...
+    def clear(self) -> None: ...
+    Flag: typing.Type[Qgis.LabelingFlag]
+    UseAllLabels: Qgis.LabelingFlag
+    UsePartialCandidates: Qgis.LabelingFlag
+    RenderOutlineLabels: Qgis.LabelingFlag
+    DrawLabelRectOnly: Qgis.LabelingFlag
+    DrawCandidates: Qgis.LabelingFlag
+    DrawUnplacedLabels: Qgis.LabelingFlag
+    CollectUnplacedLabels: Qgis.LabelingFlag
+    DrawLabelMetrics: Qgis.LabelingFlag
+    Flags: typing.Type[Qgis.LabelingFlags]
+    PlacementEngineVersion: typing.Type[Qgis.LabelPlacementEngineVersion]
+    PlacementEngineVersion1: Qgis.LabelPlacementEngineVersion
+    PlacementEngineVersion2: Qgis.LabelPlacementEngineVersion
+
+
+class QgsLabelingResults(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def setMapSettings(self, settings: QgsMapSettings) -> None: ...
+    def calloutsWithinRectangle(self, rectangle: QgsRectangle) -> list[QgsCalloutPosition]: ...
+    def groupedLabelPositions(self, groupId: int) -> list['QgsLabelPosition']: ...
+    def labelsWithinRect(self, r: QgsRectangle) -> list['QgsLabelPosition']: ...
+    def labelsAtPosition(self, p: QgsPointXY) -> list['QgsLabelPosition']: ...
+    def allLabels(self) -> list['QgsLabelPosition']: ...
+
+
+class QgsLabelLineSettings(PyQt5.sip.wrapper):
+
+    class AnchorTextPoint(int):
+        StartOfText = ... # type: QgsLabelLineSettings.AnchorTextPoint
+        CenterOfText = ... # type: QgsLabelLineSettings.AnchorTextPoint
+        EndOfText = ... # type: QgsLabelLineSettings.AnchorTextPoint
+        FollowPlacement = ... # type: QgsLabelLineSettings.AnchorTextPoint
+
+    class AnchorClipping(int):
+        UseVisiblePartsOfLine = ... # type: QgsLabelLineSettings.AnchorClipping
+        UseEntireLine = ... # type: QgsLabelLineSettings.AnchorClipping
+
+    class AnchorType(int):
+        HintOnly = ... # type: QgsLabelLineSettings.AnchorType
+        Strict = ... # type: QgsLabelLineSettings.AnchorType
+
+    class DirectionSymbolPlacement(int):
+        SymbolLeftRight = ... # type: QgsLabelLineSettings.DirectionSymbolPlacement
+        SymbolAbove = ... # type: QgsLabelLineSettings.DirectionSymbolPlacement
+        SymbolBelow = ... # type: QgsLabelLineSettings.DirectionSymbolPlacement
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelLineSettings') -> None: ...
+
+    def setAnchorTextPoint(self, point: 'QgsLabelLineSettings.AnchorTextPoint') -> None: ...
+    def anchorTextPoint(self) -> 'QgsLabelLineSettings.AnchorTextPoint': ...
+    def setAnchorClipping(self, clipping: 'QgsLabelLineSettings.AnchorClipping') -> None: ...
+    def anchorClipping(self) -> 'QgsLabelLineSettings.AnchorClipping': ...
+    def setAnchorType(self, type: 'QgsLabelLineSettings.AnchorType') -> None: ...
+    def anchorType(self) -> 'QgsLabelLineSettings.AnchorType': ...
+    def setLineAnchorPercent(self, percent: float) -> None: ...
+    def lineAnchorPercent(self) -> float: ...
+    def setOverrunDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def overrunDistanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOverrunDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def overrunDistanceUnit(self) -> Qgis.RenderUnit: ...
+    def setOverrunDistance(self, distance: float) -> None: ...
+    def overrunDistance(self) -> float: ...
+    def setDirectionSymbolPlacement(self, placement: 'QgsLabelLineSettings.DirectionSymbolPlacement') -> None: ...
+    def directionSymbolPlacement(self) -> 'QgsLabelLineSettings.DirectionSymbolPlacement': ...
+    def setReverseDirectionSymbol(self, reversed: bool) -> None: ...
+    def reverseDirectionSymbol(self) -> bool: ...
+    def setRightDirectionSymbol(self, symbol: typing.Optional[str]) -> None: ...
+    def rightDirectionSymbol(self) -> str: ...
+    def setLeftDirectionSymbol(self, symbol: typing.Optional[str]) -> None: ...
+    def leftDirectionSymbol(self) -> str: ...
+    def setAddDirectionSymbol(self, enabled: bool) -> None: ...
+    def addDirectionSymbol(self) -> bool: ...
+    def updateDataDefinedProperties(self, properties: QgsPropertyCollection, context: QgsExpressionContext) -> None: ...
+    def setMergeLines(self, merge: bool) -> None: ...
+    def mergeLines(self) -> bool: ...
+    def setPlacementFlags(self, flags: typing.Union[Qgis.LabelLinePlacementFlags, Qgis.LabelLinePlacementFlag]) -> None: ...
+    def placementFlags(self) -> Qgis.LabelLinePlacementFlags: ...
+
+
+class QgsLabelObstacleSettings(PyQt5.sip.wrapper):
+
+    class ObstacleType(int):
+        PolygonInterior = ... # type: QgsLabelObstacleSettings.ObstacleType
+        PolygonBoundary = ... # type: QgsLabelObstacleSettings.ObstacleType
+        PolygonWhole = ... # type: QgsLabelObstacleSettings.ObstacleType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelObstacleSettings') -> None: ...
+
+    def updateDataDefinedProperties(self, properties: QgsPropertyCollection, context: QgsExpressionContext) -> None: ...
+    def obstacleGeometry(self) -> QgsGeometry: ...
+    def setObstacleGeometry(self, obstacleGeom: QgsGeometry) -> None: ...
+    def setType(self, type: 'QgsLabelObstacleSettings.ObstacleType') -> None: ...
+    def type(self) -> 'QgsLabelObstacleSettings.ObstacleType': ...
+    def setFactor(self, factor: float) -> None: ...
+    def factor(self) -> float: ...
+    def setIsObstacle(self, isObstacle: bool) -> None: ...
+    def isObstacle(self) -> bool: ...
+    PolygonInterior: QgsLabelObstacleSettings.ObstacleType
+    PolygonBoundary: QgsLabelObstacleSettings.ObstacleType
+    PolygonWhole: QgsLabelObstacleSettings.ObstacleType
+
+
+class QgsLabelPlacementSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelPlacementSettings') -> None: ...
+
+    def updateDataDefinedProperties(self, properties: QgsPropertyCollection, context: QgsExpressionContext) -> None: ...
+    def setPrioritization(self, prioritization: Qgis.LabelPrioritization) -> None: ...
+    def prioritization(self) -> Qgis.LabelPrioritization: ...
+    def setAllowDegradedPlacement(self, allow: bool) -> None: ...
+    def allowDegradedPlacement(self) -> bool: ...
+    def setOverlapHandling(self, handling: Qgis.LabelOverlapHandling) -> None: ...
+    def overlapHandling(self) -> Qgis.LabelOverlapHandling: ...
+
+
+class QgsLabelPointSettings(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelPointSettings') -> None: ...
+
+    def setMaximumDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def maximumDistanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMaximumDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maximumDistanceUnit(self) -> Qgis.RenderUnit: ...
+    def setMaximumDistance(self, distance: float) -> None: ...
+    def maximumDistance(self) -> float: ...
+    def setPredefinedPositionOrder(self, order: collections.abc.Iterable[Qgis.LabelPredefinedPointPosition]) -> None: ...
+    def predefinedPositionOrder(self) -> list[Qgis.LabelPredefinedPointPosition]: ...
+    def setQuadrant(self, quadrant: Qgis.LabelQuadrantPosition) -> None: ...
+    def quadrant(self) -> Qgis.LabelQuadrantPosition: ...
+    def updateDataDefinedProperties(self, properties: QgsPropertyCollection, context: QgsExpressionContext) -> None: ...
+
+
+class QgsLabelPosition(PyQt5.sip.wrapper):
+
+    cornerPoints = ... # type: collections.abc.Iterable[QgsPointXY]
+    featureId = ... # type: int
+    groupedLabelId = ... # type: int
+    height = ... # type: float
+    isDiagram = ... # type: bool
+    isPinned = ... # type: bool
+    isUnplaced = ... # type: bool
+    labelFont = ... # type: QtGui.QFont
+    labelGeometry = ... # type: QgsGeometry
+    labelRect = ... # type: QgsRectangle
+    labelText = ... # type: typing.Optional[str]
+    layerID = ... # type: typing.Optional[str]
+    providerID = ... # type: typing.Optional[str]
+    rotation = ... # type: float
+    upsideDown = ... # type: bool
+    width = ... # type: float
+
+    @typing.overload
+    def __init__(self, id: int, r: float, corners: collections.abc.Iterable[QgsPointXY], rect: QgsRectangle, w: float, h: float, layer: typing.Optional[str], labeltext: typing.Optional[str], labelfont: QtGui.QFont, upside_down: bool, diagram: bool = ..., pinned: bool = ..., providerId: typing.Optional[str] = ..., labelGeometry: QgsGeometry = ..., isUnplaced: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelPosition') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLabelSearchTree(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def setMapSettings(self, settings: QgsMapSettings) -> None: ...
+    def calloutsInRectangle(self, rectangle: QgsRectangle) -> list[QgsCalloutPosition]: ...
+    def allLabels(self) -> list[QgsLabelPosition]: ...
+    @deprecated("""""")
+    def clear(self) -> None: ...
+
+
+class QgsLabelThinningSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLabelThinningSettings') -> None: ...
+
+    def updateDataDefinedProperties(self, properties: QgsPropertyCollection, context: QgsExpressionContext) -> None: ...
+    def setAllowDuplicateRemoval(self, allow: bool) -> None: ...
+    def allowDuplicateRemoval(self) -> bool: ...
+    def minimumDistanceToDuplicateMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMinimumDistanceToDuplicateMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def minimumDistanceToDuplicateUnit(self) -> Qgis.RenderUnit: ...
+    def setMinimumDistanceToDuplicateUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setMinimumDistanceToDuplicate(self, distance: float) -> None: ...
+    def minimumDistanceToDuplicate(self) -> float: ...
+    def labelMarginDistanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setLabelMarginDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def labelMarginDistanceUnit(self) -> Qgis.RenderUnit: ...
+    def setLabelMarginDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setLabelMarginDistance(self, distance: float) -> None: ...
+    def labelMarginDistance(self) -> float: ...
+    def setMinimumFeatureSize(self, size: float) -> None: ...
+    def minimumFeatureSize(self) -> float: ...
+    def setMaximumNumberLabels(self, number: int) -> None: ...
+    def maximumNumberLabels(self) -> int: ...
+    def setLimitNumberLabelsEnabled(self, enabled: bool) -> None: ...
+    def limitNumberOfLabelsEnabled(self) -> bool: ...
+
+
+class QgsPalLayerSettings(PyQt5.sip.wrapper):
+
+    class Property(int):
+        Size = ... # type: QgsPalLayerSettings.Property
+        Bold = ... # type: QgsPalLayerSettings.Property
+        Italic = ... # type: QgsPalLayerSettings.Property
+        Underline = ... # type: QgsPalLayerSettings.Property
+        Color = ... # type: QgsPalLayerSettings.Property
+        Strikeout = ... # type: QgsPalLayerSettings.Property
+        Family = ... # type: QgsPalLayerSettings.Property
+        FontStyle = ... # type: QgsPalLayerSettings.Property
+        FontSizeUnit = ... # type: QgsPalLayerSettings.Property
+        FontTransp = ... # type: QgsPalLayerSettings.Property
+        FontOpacity = ... # type: QgsPalLayerSettings.Property
+        FontCase = ... # type: QgsPalLayerSettings.Property
+        FontLetterSpacing = ... # type: QgsPalLayerSettings.Property
+        FontWordSpacing = ... # type: QgsPalLayerSettings.Property
+        FontBlendMode = ... # type: QgsPalLayerSettings.Property
+        FontStretchFactor = ... # type: QgsPalLayerSettings.Property
+        MultiLineWrapChar = ... # type: QgsPalLayerSettings.Property
+        AutoWrapLength = ... # type: QgsPalLayerSettings.Property
+        MultiLineHeight = ... # type: QgsPalLayerSettings.Property
+        MultiLineAlignment = ... # type: QgsPalLayerSettings.Property
+        TextOrientation = ... # type: QgsPalLayerSettings.Property
+        TabStopDistance = ... # type: QgsPalLayerSettings.Property
+        DirSymbDraw = ... # type: QgsPalLayerSettings.Property
+        DirSymbLeft = ... # type: QgsPalLayerSettings.Property
+        DirSymbRight = ... # type: QgsPalLayerSettings.Property
+        DirSymbPlacement = ... # type: QgsPalLayerSettings.Property
+        DirSymbReverse = ... # type: QgsPalLayerSettings.Property
+        NumFormat = ... # type: QgsPalLayerSettings.Property
+        NumDecimals = ... # type: QgsPalLayerSettings.Property
+        NumPlusSign = ... # type: QgsPalLayerSettings.Property
+        BufferDraw = ... # type: QgsPalLayerSettings.Property
+        BufferSize = ... # type: QgsPalLayerSettings.Property
+        BufferUnit = ... # type: QgsPalLayerSettings.Property
+        BufferColor = ... # type: QgsPalLayerSettings.Property
+        BufferTransp = ... # type: QgsPalLayerSettings.Property
+        BufferOpacity = ... # type: QgsPalLayerSettings.Property
+        BufferJoinStyle = ... # type: QgsPalLayerSettings.Property
+        BufferBlendMode = ... # type: QgsPalLayerSettings.Property
+        MaskEnabled = ... # type: QgsPalLayerSettings.Property
+        MaskBufferSize = ... # type: QgsPalLayerSettings.Property
+        MaskBufferUnit = ... # type: QgsPalLayerSettings.Property
+        MaskOpacity = ... # type: QgsPalLayerSettings.Property
+        MaskJoinStyle = ... # type: QgsPalLayerSettings.Property
+        ShapeDraw = ... # type: QgsPalLayerSettings.Property
+        ShapeKind = ... # type: QgsPalLayerSettings.Property
+        ShapeSVGFile = ... # type: QgsPalLayerSettings.Property
+        ShapeSizeType = ... # type: QgsPalLayerSettings.Property
+        ShapeSizeX = ... # type: QgsPalLayerSettings.Property
+        ShapeSizeY = ... # type: QgsPalLayerSettings.Property
+        ShapeSizeUnits = ... # type: QgsPalLayerSettings.Property
+        ShapeRotationType = ... # type: QgsPalLayerSettings.Property
+        ShapeRotation = ... # type: QgsPalLayerSettings.Property
+        ShapeOffset = ... # type: QgsPalLayerSettings.Property
+        ShapeOffsetUnits = ... # type: QgsPalLayerSettings.Property
+        ShapeRadii = ... # type: QgsPalLayerSettings.Property
+        ShapeRadiiUnits = ... # type: QgsPalLayerSettings.Property
+        ShapeTransparency = ... # type: QgsPalLayerSettings.Property
+        ShapeOpacity = ... # type: QgsPalLayerSettings.Property
+        ShapeBlendMode = ... # type: QgsPalLayerSettings.Property
+        ShapeFillColor = ... # type: QgsPalLayerSettings.Property
+        ShapeStrokeColor = ... # type: QgsPalLayerSettings.Property
+        ShapeStrokeWidth = ... # type: QgsPalLayerSettings.Property
+        ShapeStrokeWidthUnits = ... # type: QgsPalLayerSettings.Property
+        ShapeJoinStyle = ... # type: QgsPalLayerSettings.Property
+        ShadowDraw = ... # type: QgsPalLayerSettings.Property
+        ShadowUnder = ... # type: QgsPalLayerSettings.Property
+        ShadowOffsetAngle = ... # type: QgsPalLayerSettings.Property
+        ShadowOffsetDist = ... # type: QgsPalLayerSettings.Property
+        ShadowOffsetUnits = ... # type: QgsPalLayerSettings.Property
+        ShadowRadius = ... # type: QgsPalLayerSettings.Property
+        ShadowRadiusUnits = ... # type: QgsPalLayerSettings.Property
+        ShadowTransparency = ... # type: QgsPalLayerSettings.Property
+        ShadowOpacity = ... # type: QgsPalLayerSettings.Property
+        ShadowScale = ... # type: QgsPalLayerSettings.Property
+        ShadowColor = ... # type: QgsPalLayerSettings.Property
+        ShadowBlendMode = ... # type: QgsPalLayerSettings.Property
+        CentroidWhole = ... # type: QgsPalLayerSettings.Property
+        OffsetQuad = ... # type: QgsPalLayerSettings.Property
+        OffsetXY = ... # type: QgsPalLayerSettings.Property
+        OffsetUnits = ... # type: QgsPalLayerSettings.Property
+        LabelDistance = ... # type: QgsPalLayerSettings.Property
+        MaximumDistance = ... # type: QgsPalLayerSettings.Property
+        DistanceUnits = ... # type: QgsPalLayerSettings.Property
+        OffsetRotation = ... # type: QgsPalLayerSettings.Property
+        CurvedCharAngleInOut = ... # type: QgsPalLayerSettings.Property
+        PositionX = ... # type: QgsPalLayerSettings.Property
+        PositionY = ... # type: QgsPalLayerSettings.Property
+        PositionPoint = ... # type: QgsPalLayerSettings.Property
+        Hali = ... # type: QgsPalLayerSettings.Property
+        Vali = ... # type: QgsPalLayerSettings.Property
+        Rotation = ... # type: QgsPalLayerSettings.Property
+        LabelRotation = ... # type: QgsPalLayerSettings.Property
+        RepeatDistance = ... # type: QgsPalLayerSettings.Property
+        RepeatDistanceUnit = ... # type: QgsPalLayerSettings.Property
+        Priority = ... # type: QgsPalLayerSettings.Property
+        PredefinedPositionOrder = ... # type: QgsPalLayerSettings.Property
+        LinePlacementOptions = ... # type: QgsPalLayerSettings.Property
+        OverrunDistance = ... # type: QgsPalLayerSettings.Property
+        LabelAllParts = ... # type: QgsPalLayerSettings.Property
+        PolygonLabelOutside = ... # type: QgsPalLayerSettings.Property
+        LineAnchorPercent = ... # type: QgsPalLayerSettings.Property
+        LineAnchorClipping = ... # type: QgsPalLayerSettings.Property
+        LineAnchorType = ... # type: QgsPalLayerSettings.Property
+        LineAnchorTextPoint = ... # type: QgsPalLayerSettings.Property
+        ScaleVisibility = ... # type: QgsPalLayerSettings.Property
+        MinScale = ... # type: QgsPalLayerSettings.Property
+        MinimumScale = ... # type: QgsPalLayerSettings.Property
+        MaxScale = ... # type: QgsPalLayerSettings.Property
+        MaximumScale = ... # type: QgsPalLayerSettings.Property
+        FontLimitPixel = ... # type: QgsPalLayerSettings.Property
+        FontMinPixel = ... # type: QgsPalLayerSettings.Property
+        FontMaxPixel = ... # type: QgsPalLayerSettings.Property
+        IsObstacle = ... # type: QgsPalLayerSettings.Property
+        ObstacleFactor = ... # type: QgsPalLayerSettings.Property
+        ZIndex = ... # type: QgsPalLayerSettings.Property
+        CalloutDraw = ... # type: QgsPalLayerSettings.Property
+        AllowDegradedPlacement = ... # type: QgsPalLayerSettings.Property
+        OverlapHandling = ... # type: QgsPalLayerSettings.Property
+        LabelMarginDistance = ... # type: QgsPalLayerSettings.Property
+        RemoveDuplicateLabels = ... # type: QgsPalLayerSettings.Property
+        RemoveDuplicateLabelDistance = ... # type: QgsPalLayerSettings.Property
+        Show = ... # type: QgsPalLayerSettings.Property
+        AlwaysShow = ... # type: QgsPalLayerSettings.Property
+
+    angleOffset = ... # type: float
+    autoWrapLength = ... # type: int
+    centroidInside = ... # type: bool
+    centroidWhole = ... # type: bool
+    ct = ... # type: 'QgsCoordinateTransform'
+    decimals = ... # type: int
+    dist = ... # type: float
+    distMapUnitScale = ... # type: QgsMapUnitScale
+    distUnits = ... # type: Qgis.RenderUnit
+    drawLabels = ... # type: bool
+    extentGeom = ... # type: QgsGeometry
+    fieldIndex = ... # type: int
+    fieldName = ... # type: typing.Optional[str]
+    fitInPolygonOnly = ... # type: bool
+    fontLimitPixelSize = ... # type: bool
+    fontMaxPixelSize = ... # type: int
+    fontMinPixelSize = ... # type: int
+    formatNumbers = ... # type: bool
+    geometryGenerator = ... # type: typing.Optional[str]
+    geometryGeneratorEnabled = ... # type: bool
+    geometryGeneratorType = ... # type: Qgis.GeometryType
+    isExpression = ... # type: bool
+    labelOffsetMapUnitScale = ... # type: QgsMapUnitScale
+    labelPerPart = ... # type: bool
+    layerType = ... # type: Qgis.GeometryType
+    mCurFeat = ... # type: QgsFeature
+    mCurFields = ... # type: QgsFields
+    mFeatsRegPal = ... # type: int
+    mFeatsSendingToPal = ... # type: int
+    mFeaturesToLabel = ... # type: int
+    maxCurvedCharAngleIn = ... # type: float
+    maxCurvedCharAngleOut = ... # type: float
+    maximumScale = ... # type: float
+    minimumScale = ... # type: float
+    multilineAlign = ... # type: Qgis.LabelMultiLineAlignment
+    offsetType = ... # type: Qgis.LabelOffsetType
+    offsetUnits = ... # type: Qgis.RenderUnit
+    placement = ... # type: Qgis.LabelPlacement
+    plusSign = ... # type: bool
+    preserveRotation = ... # type: bool
+    previewBkgrdColor = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    priority = ... # type: int
+    ptOne = ... # type: QgsPointXY
+    ptZero = ... # type: QgsPointXY
+    repeatDistance = ... # type: float
+    repeatDistanceMapUnitScale = ... # type: QgsMapUnitScale
+    repeatDistanceUnit = ... # type: Qgis.RenderUnit
+    scaleVisibility = ... # type: bool
+    substitutions = ... # type: QgsStringReplacementCollection
+    upsidedownLabels = ... # type: Qgis.UpsideDownLabelHandling
+    useMaxLineLengthForAutoWrap = ... # type: bool
+    useSubstitutions = ... # type: bool
+    wrapChar = ... # type: typing.Optional[str]
+    xOffset = ... # type: float
+    xform = ... # type: QgsMapToPixel
+    yOffset = ... # type: float
+    zIndex = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, s: 'QgsPalLayerSettings') -> None: ...
+
+    @staticmethod
+    def fromMimeData(data: typing.Optional[QtCore.QMimeData]) -> typing.Tuple['QgsPalLayerSettings', typing.Optional[bool]]: ...
+    def toMimeData(self) -> typing.Optional[QtCore.QMimeData]: ...
+    def setUnplacedVisibility(self, visibility: Qgis.UnplacedLabelVisibility) -> None: ...
+    def unplacedVisibility(self) -> Qgis.UnplacedLabelVisibility: ...
+    @staticmethod
+    def labelSettingsPreviewPixmap(settings: 'QgsPalLayerSettings', size: QtCore.QSize, previewText: typing.Optional[str] = ..., padding: int = ..., screen: QgsScreenProperties = ...) -> QtGui.QPixmap: ...
+    def setPlacementSettings(self, settings: QgsLabelPlacementSettings) -> None: ...
+    def placementSettings(self) -> QgsLabelPlacementSettings: ...
+    def setThinningSettings(self, settings: QgsLabelThinningSettings) -> None: ...
+    def thinningSettings(self) -> QgsLabelThinningSettings: ...
+    def setObstacleSettings(self, settings: QgsLabelObstacleSettings) -> None: ...
+    def obstacleSettings(self) -> QgsLabelObstacleSettings: ...
+    def setPointSettings(self, settings: QgsLabelPointSettings) -> None: ...
+    def pointSettings(self) -> QgsLabelPointSettings: ...
+    def setLineSettings(self, settings: QgsLabelLineSettings) -> None: ...
+    def lineSettings(self) -> QgsLabelLineSettings: ...
+    def setCallout(self, callout: typing.Optional[QgsCallout]) -> None: ...
+    def callout(self) -> typing.Optional[QgsCallout]: ...
+    def setFormat(self, format: 'QgsTextFormat') -> None: ...
+    def format(self) -> 'QgsTextFormat': ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def registerFeature(self, f: QgsFeature, context: QgsRenderContext) -> None: ...
+    @deprecated("""""")
+    def calculateLabelSize(self, fm: typing.Optional[QtGui.QFontMetricsF], text: typing.Optional[str], f: typing.Optional[QgsFeature] = ..., context: typing.Optional[QgsRenderContext] = ...) -> typing.Tuple[float, float, typing.Optional[float], typing.Optional[float]]: ...
+    def legendString(self) -> str: ...
+    def setLegendString(self, legendString: typing.Optional[str]) -> None: ...
+    def setRotationUnit(self, angleUnit: Qgis.AngleUnit) -> None: ...
+    def rotationUnit(self) -> Qgis.AngleUnit: ...
+    def setPolygonPlacementFlags(self, flags: typing.Union[Qgis.LabelPolygonPlacementFlags, Qgis.LabelPolygonPlacementFlag]) -> None: ...
+    def polygonPlacementFlags(self) -> Qgis.LabelPolygonPlacementFlags: ...
+    def getLabelExpression(self) -> typing.Optional[QgsExpression]: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext) -> None: ...
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def prepare(self, context: QgsRenderContext, attributeNames: collections.abc.Iterable[typing.Optional[str]], fields: QgsFields, mapSettings: QgsMapSettings, crs: 'QgsCoordinateReferenceSystem') -> typing.Tuple[bool, set[str]]: ...
+    Placement: typing.Type[Qgis.LabelPlacement]
+    AroundPoint: Qgis.LabelPlacement
+    OverPoint: Qgis.LabelPlacement
+    Line: Qgis.LabelPlacement
+    Curved: Qgis.LabelPlacement
+    Horizontal: Qgis.LabelPlacement
+    Free: Qgis.LabelPlacement
+    OrderedPositionsAroundPoint: Qgis.LabelPlacement
+    PerimeterCurved: Qgis.LabelPlacement
+    OutsidePolygons: Qgis.LabelPlacement
+    PredefinedPointPosition: typing.Type[Qgis.LabelPredefinedPointPosition]
+    TopLeft: Qgis.LabelPredefinedPointPosition
+    TopSlightlyLeft: Qgis.LabelPredefinedPointPosition
+    TopMiddle: Qgis.LabelPredefinedPointPosition
+    TopSlightlyRight: Qgis.LabelPredefinedPointPosition
+    TopRight: Qgis.LabelPredefinedPointPosition
+    MiddleLeft: Qgis.LabelPredefinedPointPosition
+    MiddleRight: Qgis.LabelPredefinedPointPosition
+    BottomLeft: Qgis.LabelPredefinedPointPosition
+    BottomSlightlyLeft: Qgis.LabelPredefinedPointPosition
+    BottomMiddle: Qgis.LabelPredefinedPointPosition
+    BottomSlightlyRight: Qgis.LabelPredefinedPointPosition
+    BottomRight: Qgis.LabelPredefinedPointPosition
+    OffsetType: typing.Type[Qgis.LabelOffsetType]
+    FromPoint: Qgis.LabelOffsetType
+    FromSymbolBounds: Qgis.LabelOffsetType
+    QuadrantPosition: typing.Type[Qgis.LabelQuadrantPosition]
+    QuadrantAboveLeft: Qgis.LabelQuadrantPosition
+    QuadrantAbove: Qgis.LabelQuadrantPosition
+    QuadrantAboveRight: Qgis.LabelQuadrantPosition
+    QuadrantLeft: Qgis.LabelQuadrantPosition
+    QuadrantOver: Qgis.LabelQuadrantPosition
+    QuadrantRight: Qgis.LabelQuadrantPosition
+    QuadrantBelowLeft: Qgis.LabelQuadrantPosition
+    QuadrantBelow: Qgis.LabelQuadrantPosition
+    QuadrantBelowRight: Qgis.LabelQuadrantPosition
+    UpsideDownLabels: typing.Type[Qgis.UpsideDownLabelHandling]
+    Upright: Qgis.UpsideDownLabelHandling
+    ShowDefined: Qgis.UpsideDownLabelHandling
+    ShowAll: Qgis.UpsideDownLabelHandling
+    MultiLineAlign: typing.Type[Qgis.LabelMultiLineAlignment]
+    MultiLeft: Qgis.LabelMultiLineAlignment
+    MultiCenter: Qgis.LabelMultiLineAlignment
+    MultiRight: Qgis.LabelMultiLineAlignment
+    MultiFollowPlacement: Qgis.LabelMultiLineAlignment
+    MultiJustify: Qgis.LabelMultiLineAlignment
+    Size: QgsPalLayerSettings.Property
+    Bold: QgsPalLayerSettings.Property
+    Italic: QgsPalLayerSettings.Property
+    Underline: QgsPalLayerSettings.Property
+    Color: QgsPalLayerSettings.Property
+    Strikeout: QgsPalLayerSettings.Property
+    Family: QgsPalLayerSettings.Property
+    FontStyle: QgsPalLayerSettings.Property
+    FontSizeUnit: QgsPalLayerSettings.Property
+    FontTransp: QgsPalLayerSettings.Property
+    FontOpacity: QgsPalLayerSettings.Property
+    FontCase: QgsPalLayerSettings.Property
+    FontLetterSpacing: QgsPalLayerSettings.Property
+    FontWordSpacing: QgsPalLayerSettings.Property
+    FontBlendMode: QgsPalLayerSettings.Property
+    FontStretchFactor: QgsPalLayerSettings.Property
+    MultiLineWrapChar: QgsPalLayerSettings.Property
+    AutoWrapLength: QgsPalLayerSettings.Property
+    MultiLineHeight: QgsPalLayerSettings.Property
+    MultiLineAlignment: QgsPalLayerSettings.Property
+    TextOrientation: QgsPalLayerSettings.Property
+    TabStopDistance: QgsPalLayerSettings.Property
+    DirSymbDraw: QgsPalLayerSettings.Property
+    DirSymbLeft: QgsPalLayerSettings.Property
+    DirSymbRight: QgsPalLayerSettings.Property
+    DirSymbPlacement: QgsPalLayerSettings.Property
+    DirSymbReverse: QgsPalLayerSettings.Property
+    NumFormat: QgsPalLayerSettings.Property
+    NumDecimals: QgsPalLayerSettings.Property
+    NumPlusSign: QgsPalLayerSettings.Property
+    BufferDraw: QgsPalLayerSettings.Property
+    BufferSize: QgsPalLayerSettings.Property
+    BufferUnit: QgsPalLayerSettings.Property
+    BufferColor: QgsPalLayerSettings.Property
+    BufferTransp: QgsPalLayerSettings.Property
+    BufferOpacity: QgsPalLayerSettings.Property
+    BufferJoinStyle: QgsPalLayerSettings.Property
+    BufferBlendMode: QgsPalLayerSettings.Property
+    MaskEnabled: QgsPalLayerSettings.Property
+    MaskBufferSize: QgsPalLayerSettings.Property
+    MaskBufferUnit: QgsPalLayerSettings.Property
+    MaskOpacity: QgsPalLayerSettings.Property
+    MaskJoinStyle: QgsPalLayerSettings.Property
+    ShapeDraw: QgsPalLayerSettings.Property
+    ShapeKind: QgsPalLayerSettings.Property
+    ShapeSVGFile: QgsPalLayerSettings.Property
+    ShapeSizeType: QgsPalLayerSettings.Property
+    ShapeSizeX: QgsPalLayerSettings.Property
+    ShapeSizeY: QgsPalLayerSettings.Property
+    ShapeSizeUnits: QgsPalLayerSettings.Property
+    ShapeRotationType: QgsPalLayerSettings.Property
+    ShapeRotation: QgsPalLayerSettings.Property
+    ShapeOffset: QgsPalLayerSettings.Property
+    ShapeOffsetUnits: QgsPalLayerSettings.Property
+    ShapeRadii: QgsPalLayerSettings.Property
+    ShapeRadiiUnits: QgsPalLayerSettings.Property
+    ShapeTransparency: QgsPalLayerSettings.Property
+    ShapeOpacity: QgsPalLayerSettings.Property
+    ShapeBlendMode: QgsPalLayerSettings.Property
+    ShapeFillColor: QgsPalLayerSettings.Property
+    ShapeStrokeColor: QgsPalLayerSettings.Property
+    ShapeStrokeWidth: QgsPalLayerSettings.Property
+    ShapeStrokeWidthUnits: QgsPalLayerSettings.Property
+    ShapeJoinStyle: QgsPalLayerSettings.Property
+    ShadowDraw: QgsPalLayerSettings.Property
+    ShadowUnder: QgsPalLayerSettings.Property
+    ShadowOffsetAngle: QgsPalLayerSettings.Property
+    ShadowOffsetDist: QgsPalLayerSettings.Property
+    ShadowOffsetUnits: QgsPalLayerSettings.Property
+    ShadowRadius: QgsPalLayerSettings.Property
+    ShadowRadiusUnits: QgsPalLayerSettings.Property
+    ShadowTransparency: QgsPalLayerSettings.Property
+    ShadowOpacity: QgsPalLayerSettings.Property
+    ShadowScale: QgsPalLayerSettings.Property
+    ShadowColor: QgsPalLayerSettings.Property
+    ShadowBlendMode: QgsPalLayerSettings.Property
+    CentroidWhole: QgsPalLayerSettings.Property
+    OffsetQuad: QgsPalLayerSettings.Property
+    OffsetXY: QgsPalLayerSettings.Property
+    OffsetUnits: QgsPalLayerSettings.Property
+    LabelDistance: QgsPalLayerSettings.Property
+    MaximumDistance: QgsPalLayerSettings.Property
+    DistanceUnits: QgsPalLayerSettings.Property
+    OffsetRotation: QgsPalLayerSettings.Property
+    CurvedCharAngleInOut: QgsPalLayerSettings.Property
+    PositionX: QgsPalLayerSettings.Property
+    PositionY: QgsPalLayerSettings.Property
+    PositionPoint: QgsPalLayerSettings.Property
+    Hali: QgsPalLayerSettings.Property
+    Vali: QgsPalLayerSettings.Property
+    Rotation: QgsPalLayerSettings.Property
+    LabelRotation: QgsPalLayerSettings.Property
+    RepeatDistance: QgsPalLayerSettings.Property
+    RepeatDistanceUnit: QgsPalLayerSettings.Property
+    Priority: QgsPalLayerSettings.Property
+    PredefinedPositionOrder: QgsPalLayerSettings.Property
+    LinePlacementOptions: QgsPalLayerSettings.Property
+    OverrunDistance: QgsPalLayerSettings.Property
+    LabelAllParts: QgsPalLayerSettings.Property
+    PolygonLabelOutside: QgsPalLayerSettings.Property
+    LineAnchorPercent: QgsPalLayerSettings.Property
+    LineAnchorClipping: QgsPalLayerSettings.Property
+    LineAnchorType: QgsPalLayerSettings.Property
+    LineAnchorTextPoint: QgsPalLayerSettings.Property
+    ScaleVisibility: QgsPalLayerSettings.Property
+    MinScale: QgsPalLayerSettings.Property
+    MinimumScale: QgsPalLayerSettings.Property
+    MaxScale: QgsPalLayerSettings.Property
+    MaximumScale: QgsPalLayerSettings.Property
+    FontLimitPixel: QgsPalLayerSettings.Property
+    FontMinPixel: QgsPalLayerSettings.Property
+    FontMaxPixel: QgsPalLayerSettings.Property
+    IsObstacle: QgsPalLayerSettings.Property
+    ObstacleFactor: QgsPalLayerSettings.Property
+    ZIndex: QgsPalLayerSettings.Property
+    CalloutDraw: QgsPalLayerSettings.Property
+    AllowDegradedPlacement: QgsPalLayerSettings.Property
+    OverlapHandling: QgsPalLayerSettings.Property
+    LabelMarginDistance: QgsPalLayerSettings.Property
+    RemoveDuplicateLabels: QgsPalLayerSettings.Property
+    RemoveDuplicateLabelDistance: QgsPalLayerSettings.Property
+    Show: QgsPalLayerSettings.Property
+    AlwaysShow: QgsPalLayerSettings.Property
+    LinePlacementFlags: typing.Type[_LinePlacementFlags]
+    OnLine: QgsPalLayerSettings.LinePlacementFlags
+    AboveLine: QgsPalLayerSettings.LinePlacementFlags
+    BelowLine: QgsPalLayerSettings.LinePlacementFlags
+    MapOrientation: QgsPalLayerSettings.LinePlacementFlags
+    DirectionSymbols: typing.Type[_DirectionSymbols]
+    SymbolLeftRight: QgsPalLayerSettings.DirectionSymbols
+    SymbolAbove: QgsPalLayerSettings.DirectionSymbols
+    SymbolBelow: QgsPalLayerSettings.DirectionSymbols
+    ObstacleType: typing.Type[QgsLabelObstacleSettings.ObstacleType]
+    PolygonInterior: QgsLabelObstacleSettings.ObstacleType
+    PolygonBoundary: QgsLabelObstacleSettings.ObstacleType
+    PolygonWhole: QgsLabelObstacleSettings.ObstacleType
+
+
+class QgsPalLabeling(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPalLabeling') -> None: ...
+
+    @staticmethod
+    def splitToGraphemes(text: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def splitToLines(text: typing.Optional[str], wrapCharacter: typing.Optional[str], autoWrapLength: int = ..., useMaxLineLengthWhenAutoWrapping: bool = ...) -> list[str]: ...
+    @staticmethod
+    def geometryRequiresPreparation(geometry: QgsGeometry, context: QgsRenderContext, ct: 'QgsCoordinateTransform', clipGeometry: QgsGeometry = ..., mergeLines: bool = ...) -> bool: ...
+    @staticmethod
+    def prepareGeometry(geometry: QgsGeometry, context: QgsRenderContext, ct: 'QgsCoordinateTransform', clipGeometry: QgsGeometry = ..., mergeLines: bool = ...) -> QgsGeometry: ...
+    @staticmethod
+    def staticWillUseLayer(layer: typing.Optional[QgsMapLayer]) -> bool: ...
+
+
+class QgsAbstractVectorLayerLabeling(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @typing.overload
+    @deprecated("""""")
+    def writeTextSymbolizer(self, parent: QtXml.QDomNode, settings: QgsPalLayerSettings, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeTextSymbolizer(self, parent: QtXml.QDomNode, settings: QgsPalLayerSettings, context: QgsSldExportContext) -> bool: ...
+    @staticmethod
+    def defaultSettingsForLayer(layer: typing.Optional[QgsVectorLayer]) -> QgsPalLayerSettings: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, parent: QtXml.QDomNode, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, parent: QtXml.QDomNode, context: QgsSldExportContext) -> bool: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsAbstractVectorLayerLabeling']: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def setSettings(self, settings: typing.Optional[QgsPalLayerSettings], providerId: typing.Optional[str] = ...) -> None: ...
+    def settings(self, providerId: typing.Optional[str] = ...) -> QgsPalLayerSettings: ...
+    def subProviders(self) -> list[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsAbstractVectorLayerLabeling']: ...
+    def type(self) -> str: ...
+
+
+class QgsRuleBasedLabeling(QgsAbstractVectorLayerLabeling):
+
+    class Rule(PyQt5.sip.wrapper):
+
+        class RegisterResult(int):
+            Filtered = ... # type: QgsRuleBasedLabeling.Rule.RegisterResult
+            Inactive = ... # type: QgsRuleBasedLabeling.Rule.RegisterResult
+            Registered = ... # type: QgsRuleBasedLabeling.Rule.RegisterResult
+
+        def __init__(self, settings: typing.Optional[QgsPalLayerSettings], maximumScale: float = ..., minimumScale: float = ..., filterExp: typing.Optional[str] = ..., description: typing.Optional[str] = ..., elseRule: bool = ...) -> None: ...
+
+        def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+        def hasNonDefaultCompositionMode(self) -> bool: ...
+        def requiresAdvancedEffects(self) -> bool: ...
+        def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+        @staticmethod
+        def create(ruleElem: QtXml.QDomElement, context: QgsReadWriteContext, reuseId: bool = ...) -> typing.Optional['QgsRuleBasedLabeling.Rule']: ...
+        def clone(self, resetRuleKey: bool = ...) -> typing.Optional['QgsRuleBasedLabeling.Rule']: ...
+        def findRuleByKey(self, key: typing.Optional[str]) -> typing.Optional['QgsRuleBasedLabeling.Rule']: ...
+        def removeChildAt(self, i: int) -> None: ...
+        def insertChild(self, i: int, rule: typing.Optional['QgsRuleBasedLabeling.Rule']) -> None: ...
+        def appendChild(self, rule: typing.Optional['QgsRuleBasedLabeling.Rule']) -> None: ...
+        def parent(self) -> typing.Optional['QgsRuleBasedLabeling.Rule']: ...
+        def descendants(self) -> list['QgsRuleBasedLabeling.Rule']: ...
+        def children(self) -> list['QgsRuleBasedLabeling.Rule']: ...
+        def setRuleKey(self, key: typing.Optional[str]) -> None: ...
+        def setIsElse(self, iselse: bool) -> None: ...
+        def setActive(self, state: bool) -> None: ...
+        def setDescription(self, description: typing.Optional[str]) -> None: ...
+        def setFilterExpression(self, filterExp: typing.Optional[str]) -> None: ...
+        def setMaximumScale(self, scale: float) -> None: ...
+        def setMinimumScale(self, scale: float) -> None: ...
+        def setSettings(self, settings: typing.Optional[QgsPalLayerSettings]) -> None: ...
+        def ruleKey(self) -> str: ...
+        def isElse(self) -> bool: ...
+        def active(self) -> bool: ...
+        def description(self) -> str: ...
+        def filterExpression(self) -> str: ...
+        def minimumScale(self) -> float: ...
+        def maximumScale(self) -> float: ...
+        def dependsOnScale(self) -> bool: ...
+        def settings(self) -> typing.Optional[QgsPalLayerSettings]: ...
+
+    def __init__(self, root: typing.Optional['QgsRuleBasedLabeling.Rule']) -> None: ...
+
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, parent: QtXml.QDomNode, properties: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, parent: QtXml.QDomNode, context: QgsSldExportContext) -> bool: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def setSettings(self, settings: typing.Optional[QgsPalLayerSettings], providerId: typing.Optional[str] = ...) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def settings(self, providerId: typing.Optional[str] = ...) -> QgsPalLayerSettings: ...
+    def subProviders(self) -> list[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsRuleBasedLabeling']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsRuleBasedLabeling']: ...
+    def rootRule(self) -> typing.Optional['QgsRuleBasedLabeling.Rule']: ...
+
+
+class QgsVectorLayerSimpleLabeling(QgsAbstractVectorLayerLabeling):
+
+    def __init__(self, settings: QgsPalLayerSettings) -> None: ...
+
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsVectorLayerSimpleLabeling']: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, parent: QtXml.QDomNode, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, parent: QtXml.QDomNode, context: QgsSldExportContext) -> bool: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def setSettings(self, settings: typing.Optional[QgsPalLayerSettings], providerId: typing.Optional[str] = ...) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def settings(self, providerId: typing.Optional[str] = ...) -> QgsPalLayerSettings: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional[QgsAbstractVectorLayerLabeling]: ...
+    def type(self) -> str: ...
+
+
+class QgsLabelingEngineContext(PyQt5.sip.wrapper):
+
+    def __init__(self, renderContext: QgsRenderContext) -> None: ...
+
+    def setMapBoundaryGeometry(self, geometry: QgsGeometry) -> None: ...
+    def mapBoundaryGeometry(self) -> QgsGeometry: ...
+    def setExtent(self, extent: QgsRectangle) -> None: ...
+    def extent(self) -> QgsRectangle: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsAbstractLabelingEngineRule(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractLabelingEngineRule') -> None: ...
+
+    def copyCommonProperties(self, other: typing.Optional['QgsAbstractLabelingEngineRule']) -> None: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def prepare(self, context: QgsRenderContext) -> bool: ...
+    def setActive(self, active: bool) -> None: ...
+    def active(self) -> bool: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def description(self) -> str: ...
+    def isAvailable(self) -> bool: ...
+    def displayType(self) -> str: ...
+    def id(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsAbstractLabelingEngineRule']: ...
+
+
+class QgsAbstractLabelingEngineRuleDistanceFromFeature(QgsAbstractLabelingEngineRule):
+
+    def __init__(self) -> None: ...
+
+    def copyCommonProperties(self, other: typing.Optional[QgsAbstractLabelingEngineRule]) -> None: ...
+    def setCost(self, cost: float) -> None: ...
+    def cost(self) -> float: ...
+    def setDistanceUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def distanceUnit(self) -> Qgis.RenderUnit: ...
+    def setDistance(self, distance: float) -> None: ...
+    def distance(self) -> float: ...
+    def setTargetLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def targetLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setLabeledLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def labeledLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def isAvailable(self) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def prepare(self, context: QgsRenderContext) -> bool: ...
+
+
+class QgsLabelingEngineRuleMinimumDistanceLabelToFeature(QgsAbstractLabelingEngineRuleDistanceFromFeature):
+
+    def __init__(self) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def description(self) -> str: ...
+    def displayType(self) -> str: ...
+    def id(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLabelingEngineRuleMinimumDistanceLabelToFeature']: ...
+
+
+class QgsLabelingEngineRuleMaximumDistanceLabelToFeature(QgsAbstractLabelingEngineRuleDistanceFromFeature):
+
+    def __init__(self) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def description(self) -> str: ...
+    def displayType(self) -> str: ...
+    def id(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLabelingEngineRuleMaximumDistanceLabelToFeature']: ...
+
+
+class QgsLabelingEngineRuleMinimumDistanceLabelToLabel(QgsAbstractLabelingEngineRule):
+
+    def __init__(self) -> None: ...
+
+    def setDistanceUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def distanceUnit(self) -> Qgis.RenderUnit: ...
+    def setDistance(self, distance: float) -> None: ...
+    def distance(self) -> float: ...
+    def setTargetLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def targetLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def setLabeledLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def labeledLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def __repr__(self) -> typing.Any: ...
+    def prepare(self, context: QgsRenderContext) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def isAvailable(self) -> bool: ...
+    def description(self) -> str: ...
+    def displayType(self) -> str: ...
+    def id(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLabelingEngineRuleMinimumDistanceLabelToLabel']: ...
+
+
+class QgsLabelingEngineRuleAvoidLabelOverlapWithFeature(QgsAbstractLabelingEngineRule):
+
+    def __init__(self) -> None: ...
+
+    def setTargetLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def targetLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setLabeledLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def labeledLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def __repr__(self) -> typing.Any: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def prepare(self, context: QgsRenderContext) -> bool: ...
+    def description(self) -> str: ...
+    def displayType(self) -> str: ...
+    def id(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLabelingEngineRuleAvoidLabelOverlapWithFeature']: ...
+
+
+class QgsLabelingEngineRuleRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def removeRule(self, id: typing.Optional[str]) -> None: ...
+    def addRule(self, rule: typing.Optional[QgsAbstractLabelingEngineRule]) -> bool: ...
+    def create(self, id: typing.Optional[str]) -> typing.Optional[QgsAbstractLabelingEngineRule]: ...
+    def isAvailable(self, id: typing.Optional[str]) -> bool: ...
+    def displayType(self, id: typing.Optional[str]) -> str: ...
+    def ruleIds(self) -> list[str]: ...
@@ -0,0 +1,1192 @@
+# The PEP 484 type hints stub file for the _core.layertree module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsColorRamp
+from .dxf import QgsMapSettings
+from .geometry import QgsGeometry, QgsReferencedGeometry
+from .labeling import QgsPalLayerSettings, QgsScreenProperties
+from .numericformats import QgsNumericFormat
+from .project import QgsProject
+from .symbology import (
+    QgsLegendSymbolItem, QgsLineSymbol, QgsMarkerSymbol, QgsSymbol,
+)
+from .textrenderer import (
+    QgsTextDocument, QgsTextDocumentMetrics, QgsTextFormat,
+)
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextScope, QgsGroupLayer,
+    QgsMapLayer, QgsMapLayerServerProperties, QgsPointXY, QgsReadWriteContext,
+    QgsRenderContext,
+)
+
+
+class QgsDataDefinedSizeLegend(PyQt5.sip.wrapper):
+
+    class VerticalAlignment(int):
+        AlignCenter = ... # type: QgsDataDefinedSizeLegend.VerticalAlignment
+        AlignBottom = ... # type: QgsDataDefinedSizeLegend.VerticalAlignment
+
+    class LegendType(int):
+        LegendSeparated = ... # type: QgsDataDefinedSizeLegend.LegendType
+        LegendCollapsed = ... # type: QgsDataDefinedSizeLegend.LegendType
+
+    class SizeClass(PyQt5.sip.wrapper):
+
+        label = ... # type: typing.Optional[str]
+        size = ... # type: float
+
+        @typing.overload
+        def __init__(self, size: float, label: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDataDefinedSizeLegend.SizeClass') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsDataDefinedSizeLegend') -> None: ...
+
+    def writeXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    @staticmethod
+    def readXml(elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> typing.Optional['QgsDataDefinedSizeLegend']: ...
+    def collapsedLegendImage(self, context: 'QgsRenderContext', backgroundColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., paddingMM: float = ...) -> QtGui.QImage: ...
+    def drawCollapsedLegend(self, context: 'QgsRenderContext') -> typing.Tuple[typing.Optional[QtCore.QSizeF], typing.Optional[float]]: ...
+    def legendSymbolList(self) -> list['QgsLegendSymbolItem']: ...
+    def updateFromSymbolAndProperty(self, symbol: typing.Optional['QgsMarkerSymbol'], ddSize: 'QgsProperty') -> None: ...
+    def textAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def setTextAlignment(self, flag: QtCore.Qt.AlignmentFlag) -> None: ...
+    def textColor(self) -> QtGui.QColor: ...
+    def setTextColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def font(self) -> QtGui.QFont: ...
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    def verticalAlignment(self) -> 'QgsDataDefinedSizeLegend.VerticalAlignment': ...
+    def setVerticalAlignment(self, vAlign: 'QgsDataDefinedSizeLegend.VerticalAlignment') -> None: ...
+    def title(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def classes(self) -> list['QgsDataDefinedSizeLegend.SizeClass']: ...
+    def setClasses(self, classes: collections.abc.Iterable['QgsDataDefinedSizeLegend.SizeClass']) -> None: ...
+    def sizeScaleTransformer(self) -> typing.Optional['QgsSizeScaleTransformer']: ...
+    def setSizeScaleTransformer(self, transformer: typing.Optional['QgsSizeScaleTransformer']) -> None: ...
+    def lineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def legendType(self) -> 'QgsDataDefinedSizeLegend.LegendType': ...
+    def setLegendType(self, type: 'QgsDataDefinedSizeLegend.LegendType') -> None: ...
+
+
+class QgsLegendRenderer(PyQt5.sip.wrapper):
+
+    def __init__(self, legendModel: typing.Optional['QgsLayerTreeModel'], settings: 'QgsLegendSettings') -> None: ...
+
+    @staticmethod
+    def nodeLegendStyle(node: typing.Optional['QgsLayerTreeNode'], model: typing.Optional['QgsLayerTreeModel']) -> Qgis.LegendComponent: ...
+    @staticmethod
+    def setNodeLegendStyle(node: typing.Optional['QgsLayerTreeNode'], style: Qgis.LegendComponent) -> None: ...
+    def exportLegendToJson(self, context: 'QgsRenderContext') -> dict[str, QtCore.QJsonValue]: ...
+    @typing.overload
+    @deprecated("""""")
+    def drawLegend(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    @typing.overload
+    def drawLegend(self, context: 'QgsRenderContext') -> None: ...
+    def legendSize(self) -> QtCore.QSizeF: ...
+    def setLegendSize(self, s: QtCore.QSizeF) -> None: ...
+    def minimumSize(self, renderContext: typing.Optional['QgsRenderContext'] = ...) -> QtCore.QSizeF: ...
+    def proxyModel(self) -> typing.Optional['QgsLayerTreeFilterProxyModel']: ...
+
+
+class QgsLegendSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLegendSettings') -> None: ...
+
+    def setAutoWrapLinesAfter(self, length: float) -> None: ...
+    def autoWrapLinesAfter(self) -> float: ...
+    def setJsonRenderFlags(self, jsonRenderFlags: typing.Union[Qgis.LegendJsonRenderFlags, Qgis.LegendJsonRenderFlag]) -> None: ...
+    def jsonRenderFlags(self) -> Qgis.LegendJsonRenderFlags: ...
+    def fontDescentMillimeters(self, font: QtGui.QFont) -> float: ...
+    def fontAscentMillimeters(self, font: QtGui.QFont) -> float: ...
+    def fontHeightCharacterMM(self, font: QtGui.QFont, c: str) -> float: ...
+    def textWidthMillimeters(self, font: QtGui.QFont, text: typing.Optional[str]) -> float: ...
+    def pixelFontSize(self, pointSize: float) -> float: ...
+    def scaledFontPixelSize(self, font: QtGui.QFont) -> QtGui.QFont: ...
+    @typing.overload
+    def drawText(self, p: typing.Optional[QtGui.QPainter], x: float, y: float, text: typing.Optional[str], font: QtGui.QFont) -> None: ...
+    @typing.overload
+    def drawText(self, p: typing.Optional[QtGui.QPainter], rect: QtCore.QRectF, text: typing.Optional[str], font: QtGui.QFont, halignment: QtCore.Qt.AlignmentFlag = ..., valignment: QtCore.Qt.AlignmentFlag = ..., flags: int = ...) -> None: ...
+    def splitStringForWrapping(self, stringToSplt: typing.Optional[str]) -> list[str]: ...
+    def evaluateItemText(self, text: typing.Optional[str], context: QgsExpressionContext) -> list[str]: ...
+    @deprecated("""""")
+    def setDpi(self, dpi: int) -> None: ...
+    @deprecated("""""")
+    def dpi(self) -> int: ...
+    @deprecated("""""")
+    def setMapUnitsPerPixel(self, mapUnitsPerPixel: float) -> None: ...
+    @deprecated("""""")
+    def mapUnitsPerPixel(self) -> float: ...
+    @deprecated("""""")
+    def setMapScale(self, scale: float) -> None: ...
+    @deprecated("""""")
+    def mapScale(self) -> float: ...
+    @deprecated("""""")
+    def setUseAdvancedEffects(self, use: bool) -> None: ...
+    @deprecated("""""")
+    def useAdvancedEffects(self) -> bool: ...
+    @deprecated("""""")
+    def setMmPerMapUnit(self, mmPerMapUnit: float) -> None: ...
+    @deprecated("""""")
+    def mmPerMapUnit(self) -> float: ...
+    def setLineSpacing(self, s: float) -> None: ...
+    @deprecated("""""")
+    def lineSpacing(self) -> float: ...
+    def synchronousLegendRequests(self) -> bool: ...
+    def setSynchronousLegendRequests(self, b: bool) -> None: ...
+    def setWmsLegendSize(self, s: QtCore.QSizeF) -> None: ...
+    def wmsLegendSize(self) -> QtCore.QSizeF: ...
+    def setRasterStrokeWidth(self, width: float) -> None: ...
+    def rasterStrokeWidth(self) -> float: ...
+    def setRasterStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def rasterStrokeColor(self) -> QtGui.QColor: ...
+    def setDrawRasterStroke(self, enabled: bool) -> None: ...
+    def drawRasterStroke(self) -> bool: ...
+    def symbolAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def setSymbolAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def setMinimumSymbolSize(self, size: float) -> None: ...
+    def minimumSymbolSize(self) -> float: ...
+    def setMaximumSymbolSize(self, size: float) -> None: ...
+    def maximumSymbolSize(self) -> float: ...
+    def setSymbolSize(self, s: QtCore.QSizeF) -> None: ...
+    def symbolSize(self) -> QtCore.QSizeF: ...
+    @deprecated("""""")
+    def setLayerFontColor(self, fontColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def layerFontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFontColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fontColor(self) -> QtGui.QColor: ...
+    def setEqualColumnWidth(self, s: bool) -> None: ...
+    def equalColumnWidth(self) -> bool: ...
+    def setSplitLayer(self, s: bool) -> None: ...
+    def splitLayer(self) -> bool: ...
+    def setColumnCount(self, c: int) -> None: ...
+    def columnCount(self) -> int: ...
+    def setColumnSpace(self, s: float) -> None: ...
+    def columnSpace(self) -> float: ...
+    def wrapChar(self) -> str: ...
+    def setWrapChar(self, t: typing.Optional[str]) -> None: ...
+    def setBoxSpace(self, s: float) -> None: ...
+    def boxSpace(self) -> float: ...
+    def setStyle(self, s: Qgis.LegendComponent, style: 'QgsLegendStyle') -> None: ...
+    def style(self, s: Qgis.LegendComponent) -> 'QgsLegendStyle': ...
+    def setTitleAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def titleAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def title(self) -> str: ...
+    def setTitle(self, t: typing.Optional[str]) -> None: ...
+    def updateDataDefinedProperties(self, context: 'QgsRenderContext') -> None: ...
+
+
+class QgsLegendStyle(PyQt5.sip.wrapper):
+
+    class Side(int):
+        Top = ... # type: QgsLegendStyle.Side
+        Bottom = ... # type: QgsLegendStyle.Side
+        Left = ... # type: QgsLegendStyle.Side
+        Right = ... # type: QgsLegendStyle.Side
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLegendStyle') -> None: ...
+
+    @staticmethod
+    def styleLabel(s: Qgis.LegendComponent) -> str: ...
+    @staticmethod
+    def styleFromName(styleName: typing.Optional[str]) -> Qgis.LegendComponent: ...
+    @staticmethod
+    def styleName(s: Qgis.LegendComponent) -> str: ...
+    def updateDataDefinedProperties(self, context: 'QgsRenderContext') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext' = ...) -> None: ...
+    def writeXml(self, name: typing.Optional[str], elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext' = ...) -> None: ...
+    def setIndent(self, indent: float) -> None: ...
+    def indent(self) -> float: ...
+    def setAlignment(self, alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> None: ...
+    def alignment(self) -> QtCore.Qt.Alignment: ...
+    @typing.overload
+    def setMargin(self, side: 'QgsLegendStyle.Side', margin: float) -> None: ...
+    @typing.overload
+    def setMargin(self, margin: float) -> None: ...
+    def margin(self, side: 'QgsLegendStyle.Side') -> float: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    @deprecated("""""")
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    @deprecated("""""")
+    def font(self) -> QtGui.QFont: ...
+    Style: typing.Type[Qgis.LegendComponent]
+    Undefined: Qgis.LegendComponent
+    Hidden: Qgis.LegendComponent
+    Title: Qgis.LegendComponent
+    Group: Qgis.LegendComponent
+    Subgroup: Qgis.LegendComponent
+    Symbol: Qgis.LegendComponent
+    SymbolLabel: Qgis.LegendComponent
+
+
+class QgsMapLayerLegendUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerLegendUtils') -> None: ...
+
+    @staticmethod
+    def applyLayerNodeProperties(nodeLayer: typing.Optional['QgsLayerTreeLayer'], nodes: collections.abc.Iterable['QgsLayerTreeModelLegendNode']) -> None: ...
+    @staticmethod
+    def legendNodeColumnBreak(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> bool: ...
+    @staticmethod
+    def setLegendNodeColumnBreak(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, columnBreakBeforeNode: bool) -> None: ...
+    @staticmethod
+    def legendNodeColorRampSettings(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> typing.Optional['QgsColorRampLegendNodeSettings']: ...
+    @staticmethod
+    def setLegendNodeColorRampSettings(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, settings: typing.Optional['QgsColorRampLegendNodeSettings']) -> None: ...
+    @staticmethod
+    def legendNodeCustomSymbol(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> typing.Optional['QgsSymbol']: ...
+    @staticmethod
+    def setLegendNodeCustomSymbol(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    @staticmethod
+    def legendNodeSymbolSize(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> QtCore.QSizeF: ...
+    @staticmethod
+    def setLegendNodeSymbolSize(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, size: QtCore.QSizeF) -> None: ...
+    @staticmethod
+    def legendNodePatchShape(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> 'QgsLegendPatchShape': ...
+    @staticmethod
+    def setLegendNodePatchShape(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, shape: 'QgsLegendPatchShape') -> None: ...
+    @staticmethod
+    def hasLegendNodeUserLabel(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> bool: ...
+    @staticmethod
+    def legendNodeUserLabel(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int) -> str: ...
+    @staticmethod
+    def setLegendNodeUserLabel(nodeLayer: typing.Optional['QgsLayerTreeLayer'], originalIndex: int, newLabel: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def hasLegendNodeOrder(nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> bool: ...
+    @staticmethod
+    def legendNodeOrder(nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list[int]: ...
+    @staticmethod
+    def setLegendNodeOrder(nodeLayer: typing.Optional['QgsLayerTreeLayer'], order: collections.abc.Iterable[int]) -> None: ...
+
+
+class QgsProperty(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsProperty') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def convertToTransformer(self) -> bool: ...
+    def transformer(self) -> typing.Optional['QgsPropertyTransformer']: ...
+    def setTransformer(self, transformer: typing.Optional['QgsPropertyTransformer']) -> None: ...
+    def loadVariant(self, property: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def valueAsBool(self, context: QgsExpressionContext, defaultValue: bool = ...) -> typing.Tuple[bool, typing.Optional[bool]]: ...
+    def valueAsInt(self, context: QgsExpressionContext, defaultValue: int = ...) -> typing.Tuple[int, typing.Optional[bool]]: ...
+    def valueAsDouble(self, context: QgsExpressionContext, defaultValue: float = ...) -> typing.Tuple[float, typing.Optional[bool]]: ...
+    def valueAsColor(self, context: QgsExpressionContext, defaultColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> typing.Tuple[QtGui.QColor, typing.Optional[bool]]: ...
+    def valueAsString(self, context: QgsExpressionContext, defaultString: typing.Optional[str] = ...) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    def valueAsDateTime(self, context: QgsExpressionContext, defaultDateTime: typing.Union[QtCore.QDateTime, datetime.datetime] = ...) -> typing.Tuple[QtCore.QDateTime, typing.Optional[bool]]: ...
+    def value(self, context: QgsExpressionContext, defaultValue: typing.Any = ...) -> typing.Tuple[typing.Any, typing.Optional[bool]]: ...
+    def isProjectColor(self) -> bool: ...
+    def referencedFields(self, context: QgsExpressionContext = ..., ignoreContext: bool = ...) -> set[str]: ...
+    def prepare(self, context: QgsExpressionContext = ...) -> bool: ...
+    def asExpression(self) -> str: ...
+    def expressionString(self) -> str: ...
+    def setExpressionString(self, expression: typing.Optional[str]) -> None: ...
+    def field(self) -> str: ...
+    def setField(self, field: typing.Optional[str]) -> None: ...
+    def staticValue(self) -> typing.Any: ...
+    def setStaticValue(self, value: typing.Any) -> None: ...
+    def setActive(self, active: bool) -> None: ...
+    def isStaticValueInContext(self, context: QgsExpressionContext) -> typing.Tuple[bool, typing.Any]: ...
+    def isActive(self) -> bool: ...
+    def propertyType(self) -> Qgis.PropertyType: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def fromValue(value: typing.Any, isActive: bool = ...) -> 'QgsProperty': ...
+    @staticmethod
+    def fromField(fieldName: typing.Optional[str], isActive: bool = ...) -> 'QgsProperty': ...
+    @staticmethod
+    def fromExpression(expression: typing.Optional[str], isActive: bool = ...) -> 'QgsProperty': ...
+    @staticmethod
+    def variantMapToPropertyMap(variantMap: dict[str, typing.Any]) -> dict[str, 'QgsProperty']: ...
+    @staticmethod
+    def propertyMapToVariantMap(propertyMap: dict[typing.Optional[str], 'QgsProperty']) -> dict[str, typing.Any]: ...
+    Type: typing.Type[Qgis.PropertyType]
+    InvalidProperty: Qgis.PropertyType
+    StaticProperty: Qgis.PropertyType
+    FieldBasedProperty: Qgis.PropertyType
+    ExpressionBasedProperty: Qgis.PropertyType
+
+
+class QgsCurveTransform(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, controlPoints: collections.abc.Iterable[QgsPointXY]) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsCurveTransform') -> None: ...
+
+    def loadVariant(self, transformer: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def writeXml(self, transformElem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+    @typing.overload
+    def y(self, x: float) -> float: ...
+    @typing.overload
+    def y(self, x: collections.abc.Iterable[float]) -> list[float]: ...
+    def removeControlPoint(self, x: float, y: float) -> None: ...
+    def addControlPoint(self, x: float, y: float) -> None: ...
+    def setControlPoints(self, points: collections.abc.Iterable[QgsPointXY]) -> None: ...
+    def controlPoints(self) -> list[QgsPointXY]: ...
+
+
+class QgsPropertyTransformer(PyQt5.sip.wrapper):
+
+    class Type(int):
+        GenericNumericTransformer = ... # type: QgsPropertyTransformer.Type
+        SizeScaleTransformer = ... # type: QgsPropertyTransformer.Type
+        ColorRampTransformer = ... # type: QgsPropertyTransformer.Type
+
+    @typing.overload
+    def __init__(self, minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsPropertyTransformer') -> None: ...
+
+    def transformNumeric(self, input: float) -> float: ...
+    @staticmethod
+    def fromExpression(expression: typing.Optional[str]) -> typing.Tuple[typing.Optional['QgsPropertyTransformer'], str, str]: ...
+    def toExpression(self, baseExpression: typing.Optional[str]) -> str: ...
+    def transform(self, context: QgsExpressionContext, value: typing.Any) -> typing.Any: ...
+    def setCurveTransform(self, transform: typing.Optional[QgsCurveTransform]) -> None: ...
+    def curveTransform(self) -> typing.Optional[QgsCurveTransform]: ...
+    def setMaxValue(self, max: float) -> None: ...
+    def maxValue(self) -> float: ...
+    def setMinValue(self, min: float) -> None: ...
+    def minValue(self) -> float: ...
+    def toVariant(self) -> typing.Any: ...
+    def loadVariant(self, transformer: typing.Any) -> bool: ...
+    def clone(self) -> typing.Optional['QgsPropertyTransformer']: ...
+    def transformerType(self) -> 'QgsPropertyTransformer.Type': ...
+    @staticmethod
+    def create(type: 'QgsPropertyTransformer.Type') -> typing.Optional['QgsPropertyTransformer']: ...
+
+
+class QgsGenericNumericTransformer(QgsPropertyTransformer):
+
+    @typing.overload
+    def __init__(self, minValue: float = ..., maxValue: float = ..., minOutput: float = ..., maxOutput: float = ..., nullOutput: float = ..., exponent: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGenericNumericTransformer') -> None: ...
+
+    def setExponent(self, exponent: float) -> None: ...
+    def exponent(self) -> float: ...
+    def setNullOutputValue(self, size: float) -> None: ...
+    def nullOutputValue(self) -> float: ...
+    def setMaxOutputValue(self, size: float) -> None: ...
+    def maxOutputValue(self) -> float: ...
+    def setMinOutputValue(self, size: float) -> None: ...
+    def minOutputValue(self) -> float: ...
+    def value(self, input: float) -> float: ...
+    @staticmethod
+    def fromExpression(expression: typing.Optional[str]) -> typing.Tuple[typing.Optional['QgsGenericNumericTransformer'], str, str]: ...
+    def toExpression(self, baseExpression: typing.Optional[str]) -> str: ...
+    def transform(self, context: QgsExpressionContext, value: typing.Any) -> typing.Any: ...
+    def loadVariant(self, definition: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsGenericNumericTransformer']: ...
+    def transformerType(self) -> QgsPropertyTransformer.Type: ...
+
+
+class QgsSizeScaleTransformer(QgsPropertyTransformer):
+
+    class ScaleType(int):
+        Linear = ... # type: QgsSizeScaleTransformer.ScaleType
+        Area = ... # type: QgsSizeScaleTransformer.ScaleType
+        Flannery = ... # type: QgsSizeScaleTransformer.ScaleType
+        Exponential = ... # type: QgsSizeScaleTransformer.ScaleType
+
+    @typing.overload
+    def __init__(self, type: 'QgsSizeScaleTransformer.ScaleType' = ..., minValue: float = ..., maxValue: float = ..., minSize: float = ..., maxSize: float = ..., nullSize: float = ..., exponent: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSizeScaleTransformer') -> None: ...
+
+    def setType(self, type: 'QgsSizeScaleTransformer.ScaleType') -> None: ...
+    def type(self) -> 'QgsSizeScaleTransformer.ScaleType': ...
+    def setExponent(self, exponent: float) -> None: ...
+    def exponent(self) -> float: ...
+    def setNullSize(self, size: float) -> None: ...
+    def nullSize(self) -> float: ...
+    def setMaxSize(self, size: float) -> None: ...
+    def maxSize(self) -> float: ...
+    def setMinSize(self, size: float) -> None: ...
+    def minSize(self) -> float: ...
+    def size(self, value: float) -> float: ...
+    @staticmethod
+    def fromExpression(expression: typing.Optional[str]) -> typing.Tuple[typing.Optional['QgsSizeScaleTransformer'], str, str]: ...
+    def toExpression(self, baseExpression: typing.Optional[str]) -> str: ...
+    def transform(self, context: QgsExpressionContext, value: typing.Any) -> typing.Any: ...
+    def loadVariant(self, definition: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsSizeScaleTransformer']: ...
+    def transformerType(self) -> QgsPropertyTransformer.Type: ...
+
+
+class QgsColorRampTransformer(QgsPropertyTransformer):
+
+    @typing.overload
+    def __init__(self, minValue: float = ..., maxValue: float = ..., ramp: typing.Optional[QgsColorRamp] = ..., nullColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., rampName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsColorRampTransformer') -> None: ...
+
+    def setRampName(self, name: typing.Optional[str]) -> None: ...
+    def rampName(self) -> str: ...
+    def setNullColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def nullColor(self) -> QtGui.QColor: ...
+    def setColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def colorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def color(self, value: float) -> QtGui.QColor: ...
+    def toExpression(self, baseExpression: typing.Optional[str]) -> str: ...
+    def transform(self, context: QgsExpressionContext, value: typing.Any) -> typing.Any: ...
+    def loadVariant(self, definition: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsColorRampTransformer']: ...
+    def transformerType(self) -> QgsPropertyTransformer.Type: ...
+
+
+class QgsLayerTreeModelLegendNode(QtCore.QObject):
+
+    class NodeTypes(int):
+        SimpleLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        SymbolLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        RasterSymbolLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        ImageLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        WmsLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        DataDefinedSizeLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        EmbeddedWidget = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+        ColorRampLegend = ... # type: QgsLayerTreeModelLegendNode.NodeTypes
+
+    class CustomRole(int):
+        RuleKey = ... # type: QgsLayerTreeModelLegendNode.CustomRole
+        ParentRuleKey = ... # type: QgsLayerTreeModelLegendNode.CustomRole
+        NodeType = ... # type: QgsLayerTreeModelLegendNode.CustomRole
+        IsDataDefinedSize = ... # type: QgsLayerTreeModelLegendNode.CustomRole
+
+    class ItemContext(PyQt5.sip.wrapper):
+
+        columnLeft = ... # type: float
+        columnRight = ... # type: float
+        context = ... # type: QgsRenderContext
+        labelXOffset = ... # type: float
+        maxSiblingSymbolWidth = ... # type: float
+        painter = ... # type: QtGui.QPainter
+        patchShape = ... # type: 'QgsLegendPatchShape'
+        patchSize = ... # type: QtCore.QSizeF
+        point = ... # type: typing.Union[QtCore.QPointF, QtCore.QPoint]
+        screenProperties = ... # type: QgsScreenProperties
+        textDocument = ... # type: 'QgsTextDocument'
+        textDocumentMetrics = ... # type: 'QgsTextDocumentMetrics'
+        top = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerTreeModelLegendNode.ItemContext') -> None: ...
+
+    class ItemMetrics(PyQt5.sip.wrapper):
+
+        labelSize = ... # type: QtCore.QSizeF
+        symbolSize = ... # type: QtCore.QSizeF
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerTreeModelLegendNode.ItemMetrics') -> None: ...
+
+    def __init__(self, nodeL: typing.Optional['QgsLayerTreeLayer'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def createTemporaryRenderContext(self) -> typing.Optional[QgsRenderContext]: ...
+    sizeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    dataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def toggleAllItems(self) -> None: ...
+    def uncheckAllItems(self) -> None: ...
+    def checkAllItems(self) -> None: ...
+    def __repr__(self) -> typing.Any: ...
+    def drawSymbolText(self, settings: QgsLegendSettings, ctx: typing.Optional['QgsLayerTreeModelLegendNode.ItemContext'], symbolSize: QtCore.QSizeF) -> QtCore.QSizeF: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional['QgsLayerTreeModelLegendNode.ItemContext'], itemHeight: float) -> QtCore.QSizeF: ...
+    def exportToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def draw(self, settings: QgsLegendSettings, ctx: 'QgsLayerTreeModelLegendNode.ItemContext') -> 'QgsLayerTreeModelLegendNode.ItemMetrics': ...
+    def invalidateMapBasedData(self) -> None: ...
+    def isScaleOK(self, scale: float) -> bool: ...
+    def columnBreak(self) -> bool: ...
+    def setColumnBreak(self, breakBeforeNode: bool) -> None: ...
+    def setUserPatchSize(self, size: QtCore.QSizeF) -> None: ...
+    def userPatchSize(self) -> QtCore.QSizeF: ...
+    def setUserLabel(self, userLabel: typing.Optional[str]) -> None: ...
+    def userLabel(self) -> str: ...
+    def setEmbeddedInParent(self, embedded: bool) -> None: ...
+    def isEmbeddedInParent(self) -> bool: ...
+    def setData(self, value: typing.Any, role: int) -> bool: ...
+    def data(self, role: int) -> typing.Any: ...
+    def flags(self) -> QtCore.Qt.ItemFlags: ...
+    def model(self) -> typing.Optional['QgsLayerTreeModel']: ...
+    def layerNode(self) -> typing.Optional['QgsLayerTreeLayer']: ...
+    LegendNodeRoles: typing.Type[QgsLayerTreeModelLegendNode.CustomRole]
+    RuleKeyRole: QgsLayerTreeModelLegendNode.CustomRole
+    ParentRuleKeyRole: QgsLayerTreeModelLegendNode.CustomRole
+    NodeTypeRole: QgsLayerTreeModelLegendNode.CustomRole
+    IsDataDefinedSizeRole: QgsLayerTreeModelLegendNode.CustomRole
+
+
+class QgsColorRampLegendNode(QgsLayerTreeModelLegendNode):
+
+    @typing.overload
+    def __init__(self, nodeLayer: typing.Optional['QgsLayerTreeLayer'], ramp: typing.Optional[QgsColorRamp], minimumLabel: typing.Optional[str], maximumLabel: typing.Optional[str], parent: typing.Optional[QtCore.QObject] = ..., key: typing.Optional[str] = ..., parentKey: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, nodeLayer: typing.Optional['QgsLayerTreeLayer'], ramp: typing.Optional[QgsColorRamp], settings: 'QgsColorRampLegendNodeSettings', minimumValue: float, maximumValue: float, parent: typing.Optional[QtCore.QObject] = ..., key: typing.Optional[str] = ..., parentKey: typing.Optional[str] = ...) -> None: ...
+
+    def setSettings(self, settings: 'QgsColorRampLegendNodeSettings') -> None: ...
+    def settings(self) -> 'QgsColorRampLegendNodeSettings': ...
+    def ramp(self) -> typing.Optional[QgsColorRamp]: ...
+    def iconSize(self) -> QtCore.QSize: ...
+    def setIconSize(self, size: QtCore.QSize) -> None: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbolText(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], symbolSize: QtCore.QSizeF) -> QtCore.QSizeF: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsColorRampLegendNodeSettings(PyQt5.sip.wrapper):
+
+    class Direction(int):
+        MinimumToMaximum = ... # type: QgsColorRampLegendNodeSettings.Direction
+        MaximumToMinimum = ... # type: QgsColorRampLegendNodeSettings.Direction
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsColorRampLegendNodeSettings') -> None: ...
+
+    def setUseContinuousLegend(self, useContinuousLegend: bool) -> None: ...
+    def useContinuousLegend(self) -> bool: ...
+    def setOrientation(self, orientation: QtCore.Qt.Orientation) -> None: ...
+    def orientation(self) -> QtCore.Qt.Orientation: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setSuffix(self, suffix: typing.Optional[str]) -> None: ...
+    def suffix(self) -> str: ...
+    def setPrefix(self, prefix: typing.Optional[str]) -> None: ...
+    def prefix(self) -> str: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def setNumericFormat(self, format: typing.Optional['QgsNumericFormat']) -> None: ...
+    def numericFormat(self) -> typing.Optional['QgsNumericFormat']: ...
+    def setMaximumLabel(self, label: typing.Optional[str]) -> None: ...
+    def maximumLabel(self) -> str: ...
+    def setMinimumLabel(self, label: typing.Optional[str]) -> None: ...
+    def minimumLabel(self) -> str: ...
+    def setDirection(self, direction: 'QgsColorRampLegendNodeSettings.Direction') -> None: ...
+    def direction(self) -> 'QgsColorRampLegendNodeSettings.Direction': ...
+
+
+class QgsLayerTreeNode(QtCore.QObject):
+
+    class NodeType(int):
+        NodeGroup = ... # type: QgsLayerTreeNode.NodeType
+        NodeLayer = ... # type: QgsLayerTreeNode.NodeType
+
+    @typing.overload
+    def __init__(self, t: 'QgsLayerTreeNode.NodeType', checked: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsLayerTreeNode') -> None: ...
+
+    def removeChildrenPrivate(self, from_: int, count: int, destroy: bool = ...) -> None: ...
+    def insertChildrenPrivate(self, index: int, nodes: collections.abc.Iterable['QgsLayerTreeNode']) -> None: ...
+    def writeCommonXml(self, element: QtXml.QDomElement) -> None: ...
+    def readCommonXml(self, element: QtXml.QDomElement) -> None: ...
+    nameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    expandedChanged: typing.ClassVar[QtCore.pyqtSignal]
+    customPropertyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    visibilityChanged: typing.ClassVar[QtCore.pyqtSignal]
+    removedChildren: typing.ClassVar[QtCore.pyqtSignal]
+    willRemoveChildren: typing.ClassVar[QtCore.pyqtSignal]
+    addedChildren: typing.ClassVar[QtCore.pyqtSignal]
+    willAddChildren: typing.ClassVar[QtCore.pyqtSignal]
+    def takeChild(self, node: typing.Optional['QgsLayerTreeNode']) -> bool: ...
+    def customProperties(self) -> list[str]: ...
+    def removeCustomProperty(self, key: typing.Optional[str]) -> None: ...
+    def customProperty(self, key: typing.Optional[str], defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setCustomProperty(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def setExpanded(self, expanded: bool) -> None: ...
+    def isExpanded(self) -> bool: ...
+    def depth(self) -> int: ...
+    def checkedLayers(self) -> list[QgsMapLayer]: ...
+    def isItemVisibilityUncheckedRecursive(self) -> bool: ...
+    def isItemVisibilityCheckedRecursive(self) -> bool: ...
+    def setItemVisibilityCheckedParentRecursive(self, checked: bool) -> None: ...
+    def setItemVisibilityCheckedRecursive(self, checked: bool) -> None: ...
+    def setItemVisibilityChecked(self, checked: bool) -> None: ...
+    def itemVisibilityChecked(self) -> bool: ...
+    def isVisible(self) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject'], looseMatching: bool = ...) -> None: ...
+    def clone(self) -> typing.Optional['QgsLayerTreeNode']: ...
+    def dump(self) -> str: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsLayerTreeNode']: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, project: typing.Optional['QgsProject']) -> typing.Optional['QgsLayerTreeNode']: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def children(self) -> list['QgsLayerTreeNode']: ...
+    def parent(self) -> typing.Optional['QgsLayerTreeNode']: ...
+    def nodeType(self) -> 'QgsLayerTreeNode.NodeType': ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLayerTreeGroup(QgsLayerTreeNode):
+
+    def __init__(self, name: typing.Optional[str] = ..., checked: bool = ...) -> None: ...
+
+    def updateChildVisibilityMutuallyExclusive(self) -> None: ...
+    def nodeVisibilityChanged(self, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def hasWmsTimeDimension(self) -> bool: ...
+    def setHasWmsTimeDimension(self, hasWmsTimeDimension: bool) -> None: ...
+    def serverProperties(self) -> typing.Optional[QgsMapLayerServerProperties]: ...
+    def convertToGroupLayer(self, options: QgsGroupLayer.LayerOptions) -> typing.Optional[QgsGroupLayer]: ...
+    def setGroupLayer(self, layer: typing.Optional[QgsGroupLayer]) -> None: ...
+    def groupLayer(self) -> typing.Optional[QgsGroupLayer]: ...
+    def setIsMutuallyExclusive(self, enabled: bool, initialChildIndex: int = ...) -> None: ...
+    def isMutuallyExclusive(self) -> bool: ...
+    def setItemVisibilityCheckedRecursive(self, checked: bool) -> None: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject'], looseMatching: bool = ...) -> None: ...
+    def clone(self) -> typing.Optional['QgsLayerTreeGroup']: ...
+    def dump(self) -> str: ...
+    def readChildrenFromXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsLayerTreeGroup']: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, project: typing.Optional['QgsProject'], context: QgsReadWriteContext) -> typing.Optional['QgsLayerTreeGroup']: ...
+    def findGroups(self, recursive: bool = ...) -> list['QgsLayerTreeGroup']: ...
+    def findGroup(self, name: typing.Optional[str]) -> typing.Optional['QgsLayerTreeGroup']: ...
+    def findLayerIds(self) -> list[str]: ...
+    def reorderGroupLayers(self, order: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def findLayers(self) -> list['QgsLayerTreeLayer']: ...
+    @typing.overload
+    def findLayer(self, layer: typing.Optional[QgsMapLayer]) -> typing.Optional['QgsLayerTreeLayer']: ...
+    @typing.overload
+    def findLayer(self, layerId: typing.Optional[str]) -> typing.Optional['QgsLayerTreeLayer']: ...
+    def removeAllChildren(self) -> None: ...
+    def removeChildrenGroupWithoutLayers(self) -> None: ...
+    def removeChildren(self, from_: int, count: int) -> None: ...
+    def removeLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def removeChildNode(self, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def addChildNode(self, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def insertChildNode(self, index: int, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def insertChildNodes(self, index: int, nodes: collections.abc.Iterable[QgsLayerTreeNode]) -> None: ...
+    def addLayer(self, layer: typing.Optional[QgsMapLayer]) -> typing.Optional['QgsLayerTreeLayer']: ...
+    def insertLayer(self, index: int, layer: typing.Optional[QgsMapLayer]) -> typing.Optional['QgsLayerTreeLayer']: ...
+    def addGroup(self, name: typing.Optional[str]) -> typing.Optional['QgsLayerTreeGroup']: ...
+    def insertGroup(self, index: int, name: typing.Optional[str]) -> typing.Optional['QgsLayerTreeGroup']: ...
+    def setName(self, n: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLayerTree(QgsLayerTreeGroup):
+
+    def __init__(self) -> None: ...
+
+    hasCustomLayerOrderChanged: typing.ClassVar[QtCore.pyqtSignal]
+    layerOrderChanged: typing.ClassVar[QtCore.pyqtSignal]
+    customLayerOrderChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def clear(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsLayerTree']: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def readLayerOrderFromXml(self, doc: QtXml.QDomElement) -> None: ...
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsLayerTree']: ...
+    def setHasCustomLayerOrder(self, hasCustomLayerOrder: bool) -> None: ...
+    def hasCustomLayerOrder(self) -> bool: ...
+    def layerOrder(self) -> list[QgsMapLayer]: ...
+    def setCustomLayerOrderByIds(self, customLayerOrder: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setCustomLayerOrder(self, customLayerOrder: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def customLayerOrder(self) -> list[QgsMapLayer]: ...
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def isLayer(node: typing.Optional[QgsLayerTreeNode]) -> bool: ...
+    @staticmethod
+    def isGroup(node: typing.Optional[QgsLayerTreeNode]) -> bool: ...
+
+
+class QgsLayerTreeFilterSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsLayerTreeFilterSettings') -> None: ...
+
+    def layers(self) -> list[QgsMapLayer]: ...
+    def combinedVisibleExtentForLayer(self, layer: typing.Optional[QgsMapLayer]) -> QgsGeometry: ...
+    def addVisibleExtentForLayer(self, layer: typing.Optional[QgsMapLayer], polygon: QgsReferencedGeometry) -> None: ...
+    def setFlags(self, flags: typing.Union[Qgis.LayerTreeFilterFlags, Qgis.LayerTreeFilterFlag]) -> None: ...
+    def flags(self) -> Qgis.LayerTreeFilterFlags: ...
+    def setFilterPolygon(self, polygon: QgsGeometry) -> None: ...
+    def filterPolygon(self) -> QgsGeometry: ...
+    def layerFilterExpression(self, layerId: typing.Optional[str]) -> str: ...
+    def setLayerFilterExpressionsFromLayerTree(self, tree: typing.Optional[QgsLayerTree]) -> None: ...
+    def setLayerFilterExpressions(self, expressions: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def layerFilterExpressions(self) -> dict[str, str]: ...
+    def mapSettings(self) -> QgsMapSettings: ...
+
+
+class QgsLayerTreeLayer(QgsLayerTreeNode):
+
+    class LegendNodesSplitBehavior(int):
+        UseDefaultLegendSetting = ... # type: QgsLayerTreeLayer.LegendNodesSplitBehavior
+        AllowSplittingLegendNodesOverMultipleColumns = ... # type: QgsLayerTreeLayer.LegendNodesSplitBehavior
+        PreventSplittingLegendNodesOverMultipleColumns = ... # type: QgsLayerTreeLayer.LegendNodesSplitBehavior
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], name: typing.Optional[str] = ..., source: typing.Optional[str] = ..., provider: typing.Optional[str] = ...) -> None: ...
+
+    def attachToLayer(self) -> None: ...
+    layerWillBeUnloaded: typing.ClassVar[QtCore.pyqtSignal]
+    layerLoaded: typing.ClassVar[QtCore.pyqtSignal]
+    def setLegendSplitBehavior(self, behavior: 'QgsLayerTreeLayer.LegendNodesSplitBehavior') -> None: ...
+    def legendSplitBehavior(self) -> 'QgsLayerTreeLayer.LegendNodesSplitBehavior': ...
+    def setPatchSize(self, size: QtCore.QSizeF) -> None: ...
+    def patchSize(self) -> QtCore.QSizeF: ...
+    def setPatchShape(self, shape: 'QgsLegendPatchShape') -> None: ...
+    def patchShape(self) -> 'QgsLegendPatchShape': ...
+    def labelExpression(self) -> str: ...
+    def setLabelExpression(self, expression: typing.Optional[str]) -> None: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject'], looseMatching: bool = ...) -> None: ...
+    def clone(self) -> typing.Optional['QgsLayerTreeLayer']: ...
+    def dump(self) -> str: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsLayerTreeLayer']: ...
+    @typing.overload
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, project: typing.Optional['QgsProject'], context: QgsReadWriteContext) -> typing.Optional['QgsLayerTreeLayer']: ...
+    def useLayerName(self) -> bool: ...
+    def setUseLayerName(self, use: bool = ...) -> None: ...
+    def setName(self, n: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+    def layerId(self) -> str: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsLayerTreeModel(QtCore.QAbstractItemModel):
+
+    class Flag(int):
+        ShowLegend = ... # type: QgsLayerTreeModel.Flag
+        ShowLegendAsTree = ... # type: QgsLayerTreeModel.Flag
+        DeferredLegendInvalidation = ... # type: QgsLayerTreeModel.Flag
+        UseEmbeddedWidgets = ... # type: QgsLayerTreeModel.Flag
+        UseTextFormatting = ... # type: QgsLayerTreeModel.Flag
+        AllowNodeReorder = ... # type: QgsLayerTreeModel.Flag
+        AllowNodeRename = ... # type: QgsLayerTreeModel.Flag
+        AllowNodeChangeVisibility = ... # type: QgsLayerTreeModel.Flag
+        AllowLegendChangeState = ... # type: QgsLayerTreeModel.Flag
+        ActionHierarchical = ... # type: QgsLayerTreeModel.Flag
+        UseThreadedHitTest = ... # type: QgsLayerTreeModel.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __xor__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __ior__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __or__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __iand__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __and__(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> 'QgsLayerTreeModel.Flags': ...
+        def __invert__(self) -> 'QgsLayerTreeModel.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, rootNode: typing.Optional[QgsLayerTree], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def legendInvalidateMapBasedData(self) -> None: ...
+    def legendCleanup(self) -> None: ...
+    def legendIconEmbeddedInParent(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> QtGui.QIcon: ...
+    def legendEmbeddedInParent(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> bool: ...
+    def legendNodeFlags(self, node: typing.Optional[QgsLayerTreeModelLegendNode]) -> QtCore.Qt.ItemFlags: ...
+    def legendNodeData(self, node: typing.Optional[QgsLayerTreeModelLegendNode], role: int) -> typing.Any: ...
+    def legendParent(self, legendNode: typing.Optional[QgsLayerTreeModelLegendNode]) -> QtCore.QModelIndex: ...
+    def legendNodeIndex(self, row: int, column: int, node: typing.Optional[QgsLayerTreeModelLegendNode]) -> QtCore.QModelIndex: ...
+    def legendRootIndex(self, row: int, column: int, nL: typing.Optional[QgsLayerTreeLayer]) -> QtCore.QModelIndex: ...
+    def legendNodeRowCount(self, node: typing.Optional[QgsLayerTreeModelLegendNode]) -> int: ...
+    def legendRootRowCount(self, nL: typing.Optional[QgsLayerTreeLayer]) -> int: ...
+    def indexOfParentLayerTreeNode(self, parentNode: typing.Optional[QgsLayerTreeNode]) -> QtCore.QModelIndex: ...
+    def filterLegendNodes(self, nodes: collections.abc.Iterable[QgsLayerTreeModelLegendNode]) -> list[QgsLayerTreeModelLegendNode]: ...
+    @staticmethod
+    def iconGroup() -> QtGui.QIcon: ...
+    def refreshScaleBasedLayers(self, index: QtCore.QModelIndex = ..., previousScale: float = ...) -> None: ...
+    def recursivelyEmitDataChanged(self, index: QtCore.QModelIndex = ...) -> None: ...
+    def disconnectFromRootNode(self) -> None: ...
+    def connectToRootNode(self) -> None: ...
+    def disconnectFromLayers(self, parentGroup: typing.Optional[QgsLayerTreeGroup]) -> None: ...
+    def connectToLayers(self, parentGroup: typing.Optional[QgsLayerTreeGroup]) -> None: ...
+    def disconnectFromLayer(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> None: ...
+    def connectToLayer(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> None: ...
+    def addLegendToLayer(self, nodeL: typing.Optional[QgsLayerTreeLayer]) -> None: ...
+    def removeLegendFromLayer(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> None: ...
+    def invalidateLegendMapBasedData(self) -> None: ...
+    def legendNodeDataChanged(self) -> None: ...
+    def layerNeedsUpdate(self) -> None: ...
+    def layerFlagsChanged(self) -> None: ...
+    def layerLegendChanged(self) -> None: ...
+    def nodeLayerWillBeUnloaded(self) -> None: ...
+    def nodeLayerLoaded(self) -> None: ...
+    def nodeCustomPropertyChanged(self, node: typing.Optional[QgsLayerTreeNode], key: typing.Optional[str]) -> None: ...
+    def nodeNameChanged(self, node: typing.Optional[QgsLayerTreeNode], name: typing.Optional[str]) -> None: ...
+    def nodeVisibilityChanged(self, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def nodeRemovedChildren(self) -> None: ...
+    def nodeWillRemoveChildren(self, node: typing.Optional[QgsLayerTreeNode], indexFrom: int, indexTo: int) -> None: ...
+    def nodeAddedChildren(self, node: typing.Optional[QgsLayerTreeNode], indexFrom: int, indexTo: int) -> None: ...
+    def nodeWillAddChildren(self, node: typing.Optional[QgsLayerTreeNode], indexFrom: int, indexTo: int) -> None: ...
+    hitTestCompleted: typing.ClassVar[QtCore.pyqtSignal]
+    hitTestStarted: typing.ClassVar[QtCore.pyqtSignal]
+    messageEmitted: typing.ClassVar[QtCore.pyqtSignal]
+    def hitTestInProgress(self) -> bool: ...
+    def waitForHitTestBlocking(self) -> None: ...
+    @staticmethod
+    def scaleIconSize(standardSize: int) -> int: ...
+    def targetScreenProperties(self) -> set[QgsScreenProperties]: ...
+    def addTargetScreenProperties(self, properties: QgsScreenProperties) -> None: ...
+    def setLayerStyleOverrides(self, overrides: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def layerStyleOverrides(self) -> dict[str, str]: ...
+    def legendMapViewData(self) -> typing.Tuple[typing.Optional[float], typing.Optional[int], typing.Optional[float]]: ...
+    def setLegendMapViewData(self, mapUnitsPerPixel: float, dpi: int, scale: float) -> None: ...
+    def filterSettings(self) -> typing.Optional[QgsLayerTreeFilterSettings]: ...
+    def setFilterSettings(self, settings: typing.Optional[QgsLayerTreeFilterSettings] = ...) -> None: ...
+    def legendFilterMapSettings(self) -> typing.Optional[QgsMapSettings]: ...
+    @deprecated("""""")
+    def setLegendFilter(self, settings: typing.Optional[QgsMapSettings], useExtent: bool = ..., polygon: QgsGeometry = ..., useExpressions: bool = ...) -> None: ...
+    @deprecated("""""")
+    def setLegendFilterByMap(self, settings: typing.Optional[QgsMapSettings]) -> None: ...
+    def legendFilterByScale(self) -> float: ...
+    def setLegendFilterByScale(self, scale: float) -> None: ...
+    def autoCollapseLegendNodes(self) -> int: ...
+    def setAutoCollapseLegendNodes(self, nodeCount: int) -> None: ...
+    def layerTreeNodeFont(self, nodeType: int) -> QtGui.QFont: ...
+    def setLayerTreeNodeFont(self, nodeType: int, font: QtGui.QFont) -> None: ...
+    def setCurrentIndex(self, currentIndex: QtCore.QModelIndex) -> None: ...
+    def currentIndex(self) -> QtCore.QModelIndex: ...
+    def refreshLayerLegend(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> None: ...
+    def setRootGroup(self, newRootGroup: typing.Optional[QgsLayerTree]) -> None: ...
+    def rootGroup(self) -> typing.Optional[QgsLayerTree]: ...
+    def findLegendNode(self, layerId: typing.Optional[str], ruleKey: typing.Optional[str]) -> typing.Optional[QgsLayerTreeModelLegendNode]: ...
+    def legendNodeEmbeddedInParent(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> typing.Optional[QgsLayerTreeModelLegendNode]: ...
+    def layerOriginalLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def layerLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], skipNodeEmbeddedInParent: bool = ...) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendNode2index(self, legendNode: typing.Optional[QgsLayerTreeModelLegendNode]) -> QtCore.QModelIndex: ...
+    @staticmethod
+    def index2legendNode(index: QtCore.QModelIndex) -> typing.Optional[QgsLayerTreeModelLegendNode]: ...
+    def indexes2nodes(self, list: collections.abc.Iterable[QtCore.QModelIndex], skipInternal: bool = ...) -> list[QgsLayerTreeNode]: ...
+    def node2index(self, node: typing.Optional[QgsLayerTreeNode]) -> QtCore.QModelIndex: ...
+    def index2node(self, index: QtCore.QModelIndex) -> typing.Optional[QgsLayerTreeNode]: ...
+    def testFlag(self, f: 'QgsLayerTreeModel.Flag') -> bool: ...
+    def setFlag(self, f: 'QgsLayerTreeModel.Flag', on: bool = ...) -> None: ...
+    def setFlags(self, f: typing.Union['QgsLayerTreeModel.Flags', 'QgsLayerTreeModel.Flag']) -> None: ...
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def dropMimeData(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction, row: int, column: int, parent: QtCore.QModelIndex) -> bool: ...
+    def mimeData(self, indexes: collections.abc.Iterable[QtCore.QModelIndex]) -> typing.Optional[QtCore.QMimeData]: ...
+    def mimeTypes(self) -> list[str]: ...
+    def supportedDropActions(self) -> QtCore.Qt.DropActions: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    @typing.overload
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    @typing.overload
+    def flags(self) -> 'QgsLayerTreeModel.Flags': ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+
+
+class QgsSymbolLegendNode(QgsLayerTreeModelLegendNode):
+
+    MAXIMUM_SIZE = ... # type: float
+    MINIMUM_SIZE = ... # type: float
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], item: 'QgsLegendSymbolItem', parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def createSymbolScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def evaluateLabel(self, context: QgsExpressionContext = ..., label: typing.Optional[str] = ...) -> str: ...
+    def setCustomSymbol(self, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def customSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def setPatchShape(self, shape: 'QgsLegendPatchShape') -> None: ...
+    def patchShape(self) -> 'QgsLegendPatchShape': ...
+    def symbolLabel(self) -> str: ...
+    def setTextOnSymbolTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textOnSymbolTextFormat(self) -> 'QgsTextFormat': ...
+    def setTextOnSymbolLabel(self, label: typing.Optional[str]) -> None: ...
+    def textOnSymbolLabel(self) -> str: ...
+    def setSymbol(self, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsSymbol']: ...
+    @typing.overload
+    def minimumIconSize(self) -> QtCore.QSize: ...
+    @typing.overload
+    def minimumIconSize(self, context: typing.Optional[QgsRenderContext]) -> QtCore.QSize: ...
+    def iconSize(self) -> QtCore.QSize: ...
+    def setIconSize(self, sz: QtCore.QSize) -> None: ...
+    def invalidateMapBasedData(self) -> None: ...
+    def isScaleOK(self, scale: float) -> bool: ...
+    def setUserLabel(self, userLabel: typing.Optional[str]) -> None: ...
+    def setEmbeddedInParent(self, embedded: bool) -> None: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def setData(self, value: typing.Any, role: int) -> bool: ...
+    def data(self, role: int) -> typing.Any: ...
+    def flags(self) -> QtCore.Qt.ItemFlags: ...
+
+
+class QgsSimpleLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], label: typing.Optional[str], icon: QtGui.QIcon = ..., parent: typing.Optional[QtCore.QObject] = ..., key: typing.Optional[str] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsImageLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], img: QtGui.QImage, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsRasterSymbolLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], label: typing.Optional[str], parent: typing.Optional[QtCore.QObject] = ..., isCheckable: bool = ..., ruleKey: typing.Optional[str] = ..., parentRuleKey: typing.Optional[str] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def isCheckable(self) -> bool: ...
+    def ruleKey(self) -> str: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def setData(self, value: typing.Any, role: int) -> bool: ...
+    def data(self, role: int) -> typing.Any: ...
+    def flags(self) -> QtCore.Qt.ItemFlags: ...
+
+
+class QgsWmsLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def getLegendGraphicBlocking(self) -> QtGui.QImage: ...
+    def invalidateMapBasedData(self) -> None: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsDataDefinedSizeLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], settings: QgsDataDefinedSizeLegend, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def draw(self, settings: QgsLegendSettings, ctx: QgsLayerTreeModelLegendNode.ItemContext) -> QgsLayerTreeModelLegendNode.ItemMetrics: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsVectorLabelLegendNode(QgsLayerTreeModelLegendNode):
+
+    def __init__(self, nodeLayer: typing.Optional[QgsLayerTreeLayer], labelSettings: QgsPalLayerSettings, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def exportSymbolToJson(self, settings: QgsLegendSettings, context: QgsRenderContext) -> dict[str, QtCore.QJsonValue]: ...
+    def drawSymbol(self, settings: QgsLegendSettings, ctx: typing.Optional[QgsLayerTreeModelLegendNode.ItemContext], itemHeight: float) -> QtCore.QSizeF: ...
+    def data(self, role: int) -> typing.Any: ...
+
+
+class QgsLayerTreeRegistryBridge(QtCore.QObject):
+
+    class InsertionPoint(PyQt5.sip.wrapper):
+
+        group = ... # type: QgsLayerTreeGroup
+        position = ... # type: int
+
+        @typing.overload
+        def __init__(self, group: typing.Optional[QgsLayerTreeGroup], position: int) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerTreeRegistryBridge.InsertionPoint') -> None: ...
+
+    def __init__(self, root: typing.Optional[QgsLayerTreeGroup], project: typing.Optional['QgsProject'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def removeLayersFromRegistry(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def groupRemovedChildren(self) -> None: ...
+    def groupWillRemoveChildren(self, node: typing.Optional[QgsLayerTreeNode], indexFrom: int, indexTo: int) -> None: ...
+    def layersWillBeRemoved(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def layersAdded(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    addedLayersToLayerTree: typing.ClassVar[QtCore.pyqtSignal]
+    def layerInsertionMethod(self) -> Qgis.LayerTreeInsertionMethod: ...
+    def setLayerInsertionMethod(self, method: Qgis.LayerTreeInsertionMethod) -> None: ...
+    def layerInsertionPoint(self) -> 'QgsLayerTreeRegistryBridge.InsertionPoint': ...
+    @typing.overload
+    @deprecated("""""")
+    def setLayerInsertionPoint(self, parentGroup: typing.Optional[QgsLayerTreeGroup], index: int) -> None: ...
+    @typing.overload
+    def setLayerInsertionPoint(self, insertionPoint: 'QgsLayerTreeRegistryBridge.InsertionPoint') -> None: ...
+    def newLayersVisible(self) -> bool: ...
+    def setNewLayersVisible(self, enabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+
+
+class QgsLayerTreeFilterProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+    def setLayerChecked(self, layer: typing.Optional[QgsMapLayer], checked: bool) -> None: ...
+    def isLayerChecked(self, layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    def setFilterText(self, filterText: typing.Optional[str] = ...) -> None: ...
+    def nodeShown(self, node: typing.Optional[QgsLayerTreeNode]) -> bool: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def sibling(self, row: int, column: int, idx: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def flags(self, idx: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def columnCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def setFilters(self, filters: typing.Union[Qgis.LayerFilters, Qgis.LayerFilter]) -> None: ...
+    def setShowPrivateLayers(self, showPrivate: bool) -> None: ...
+    def showPrivateLayers(self) -> bool: ...
+    def setLayerTreeModel(self, layerTreeModel: typing.Optional[QgsLayerTreeModel]) -> None: ...
+    def layerTreeModel(self) -> typing.Optional[QgsLayerTreeModel]: ...
+    def mapLayer(self, idx: QtCore.QModelIndex) -> typing.Optional[QgsMapLayer]: ...
+    def checkedLayers(self) -> list[QgsMapLayer]: ...
+    def setCheckedLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+
+
+class QgsLayerTreeUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerTreeUtils') -> None: ...
+
+    @staticmethod
+    def insertLayerAtOptimalPlacement(group: typing.Optional[QgsLayerTreeGroup], layer: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsLayerTreeLayer]: ...
+    @staticmethod
+    def firstGroupWithoutCustomProperty(group: typing.Optional[QgsLayerTreeGroup], property: typing.Optional[str]) -> typing.Optional[QgsLayerTreeGroup]: ...
+    @staticmethod
+    def countMapLayerInTree(tree: typing.Optional[QgsLayerTreeNode], layer: typing.Optional[QgsMapLayer]) -> int: ...
+    @staticmethod
+    def collectMapLayersRecursive(nodes: collections.abc.Iterable[QgsLayerTreeNode]) -> set[QgsMapLayer]: ...
+    @staticmethod
+    def insertLayerBelow(group: typing.Optional[QgsLayerTreeGroup], refLayer: typing.Optional[QgsMapLayer], layerToInsert: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsLayerTreeLayer]: ...
+    @staticmethod
+    def hasLegendFilterExpression(group: QgsLayerTreeGroup) -> bool: ...
+    @staticmethod
+    def legendFilterByExpression(layer: QgsLayerTreeLayer) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    @staticmethod
+    def setLegendFilterByExpression(layer: QgsLayerTreeLayer, expr: typing.Optional[str], enabled: bool = ...) -> None: ...
+    @staticmethod
+    def invisibleLayerList(node: typing.Optional[QgsLayerTreeNode]) -> list[str]: ...
+    @staticmethod
+    def updateEmbeddedGroupsProjectPath(group: typing.Optional[QgsLayerTreeGroup], project: typing.Optional['QgsProject']) -> None: ...
+    @staticmethod
+    def replaceChildrenOfEmbeddedGroups(group: typing.Optional[QgsLayerTreeGroup]) -> None: ...
+    @staticmethod
+    def storeOriginalLayersProperties(group: typing.Optional[QgsLayerTreeGroup], doc: typing.Optional[QtXml.QDomDocument]) -> None: ...
+    @staticmethod
+    def removeInvalidLayers(group: typing.Optional[QgsLayerTreeGroup]) -> None: ...
+    @staticmethod
+    def layersModified(layerNodes: collections.abc.Iterable[QgsLayerTreeLayer]) -> bool: ...
+    @staticmethod
+    def layersEditable(layerNodes: collections.abc.Iterable[QgsLayerTreeLayer], ignoreLayersWhichCannotBeToggled: bool = ...) -> bool: ...
+    @staticmethod
+    def checkStateFromXml(txt: typing.Optional[str]) -> QtCore.Qt.CheckState: ...
+    @staticmethod
+    def checkStateToXml(state: QtCore.Qt.CheckState) -> str: ...
+    @staticmethod
+    def writeOldLegend(doc: QtXml.QDomDocument, root: typing.Optional[QgsLayerTreeGroup], hasCustomOrder: bool, order: collections.abc.Iterable[QgsMapLayer]) -> QtXml.QDomElement: ...
+    @staticmethod
+    def readOldLegendLayerOrder(legendElem: QtXml.QDomElement, order: collections.abc.Iterable[typing.Optional[str]]) -> typing.Tuple[bool, bool]: ...
+    @staticmethod
+    def readOldLegend(root: typing.Optional[QgsLayerTreeGroup], legendElem: QtXml.QDomElement) -> bool: ...
+
+
+class QgsLegendPatchShape(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, type: Qgis.SymbolType, geometry: QgsGeometry, preserveAspectRatio: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLegendPatchShape') -> None: ...
+
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def toQPolygonF(self, type: Qgis.SymbolType, size: QtCore.QSizeF) -> typing.Any: ...
+    def scaledGeometry(self, size: QtCore.QSizeF) -> QgsGeometry: ...
+    def setScaleToOutputSize(self, scale: bool) -> None: ...
+    def scaleToOutputSize(self) -> bool: ...
+    def setPreserveAspectRatio(self, preserve: bool) -> None: ...
+    def preserveAspectRatio(self) -> bool: ...
+    def setGeometry(self, geometry: QgsGeometry) -> None: ...
+    def geometry(self) -> QgsGeometry: ...
+    def setSymbolType(self, type: Qgis.SymbolType) -> None: ...
+    def symbolType(self) -> Qgis.SymbolType: ...
+    def isNull(self) -> bool: ...
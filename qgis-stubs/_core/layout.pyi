@@ -0,0 +1,3415 @@
+# The PEP 484 type hints stub file for the _core.layout module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDoubleRange, QgsFeedback, QgsMargins, QgsMaskRenderSettings,
+    QgsPathResolver, QgsPropertyDefinition, QgsTemporalRangeObject,
+    QgsVectorSimplifyMethod,
+)
+from .dxf import QgsMapSettings, QgsRenderedFeatureHandlerInterface
+from .elevation import QgsProfileRequest
+from .geometry import QgsCurve, QgsGeometry, QgsRectangle
+from .labeling import QgsLabelingResults
+from .layertree import (
+    QgsLayerTree, QgsLayerTreeModel, QgsLayerTreeNode, QgsLegendSettings,
+    QgsLegendStyle, QgsProperty,
+)
+from .maprenderer import QgsMapRendererJob
+from .numericformats import QgsNumericFormat
+from .plot import Qgs2DPlot
+from .proj import QgsCoordinateReferenceSystem
+from .project import QgsProject
+from .scalebar import QgsScaleBarRenderer
+from .symbology import (
+    QgsFillSymbol, QgsLineSymbol, QgsMarkerSymbol,
+    QgsStyleEntityVisitorInterface, QgsSymbol,
+)
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextGenerator,
+    QgsExpressionContextScope, QgsFeature, QgsFeatureRequest, QgsMapLayer,
+    QgsPropertyCollection, QgsReadWriteContext, QgsRenderContext,
+    QgsVectorLayer,
+)
+
+
+class QgsConditionalStyle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsConditionalStyle') -> None: ...
+    @typing.overload
+    def __init__(self, rule: typing.Optional[str]) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, node: QtXml.QDomNode, context: 'QgsReadWriteContext') -> bool: ...
+    @staticmethod
+    def compressStyles(styles: collections.abc.Iterable['QgsConditionalStyle']) -> 'QgsConditionalStyle': ...
+    @staticmethod
+    def matchingConditionalStyle(styles: collections.abc.Iterable['QgsConditionalStyle'], value: typing.Any, context: 'QgsExpressionContext') -> 'QgsConditionalStyle': ...
+    @staticmethod
+    def matchingConditionalStyles(styles: collections.abc.Iterable['QgsConditionalStyle'], value: typing.Any, context: 'QgsExpressionContext') -> list['QgsConditionalStyle']: ...
+    def isValid(self) -> bool: ...
+    def rule(self) -> str: ...
+    def font(self) -> QtGui.QFont: ...
+    def validBackgroundColor(self) -> bool: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def validTextColor(self) -> bool: ...
+    def textColor(self) -> QtGui.QColor: ...
+    def symbol(self) -> typing.Optional['QgsSymbol']: ...
+    def icon(self) -> QtGui.QPixmap: ...
+    def name(self) -> str: ...
+    def displayText(self) -> str: ...
+    def setSymbol(self, value: typing.Optional['QgsSymbol']) -> None: ...
+    def setFont(self, value: QtGui.QFont) -> None: ...
+    def setTextColor(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setBackgroundColor(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setRule(self, value: typing.Optional[str]) -> None: ...
+    def setName(self, value: typing.Optional[str]) -> None: ...
+    def renderPreview(self, size: QtCore.QSize = ...) -> QtGui.QPixmap: ...
+    def matches(self, value: typing.Any, context: 'QgsExpressionContext') -> bool: ...
+
+
+class QgsFeatureFilterProvider(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFeatureFilterProvider') -> None: ...
+
+    def clone(self) -> typing.Optional['QgsFeatureFilterProvider']: ...
+    def layerAttributes(self, layer: typing.Optional[QgsVectorLayer], attributes: collections.abc.Iterable[typing.Optional[str]]) -> list[str]: ...
+    def filterFeatures(self, layer: typing.Optional[QgsVectorLayer], featureRequest: 'QgsFeatureRequest') -> None: ...
+
+
+class QgsMapClippingRegion(PyQt5.sip.wrapper):
+
+    class FeatureClippingType(int):
+        ClipToIntersection = ... # type: QgsMapClippingRegion.FeatureClippingType
+        ClipPainterOnly = ... # type: QgsMapClippingRegion.FeatureClippingType
+        NoClipping = ... # type: QgsMapClippingRegion.FeatureClippingType
+
+    @typing.overload
+    def __init__(self, geometry: 'QgsGeometry') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapClippingRegion') -> None: ...
+
+    def appliesToLayer(self, layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    def restrictedLayers(self) -> list[QgsMapLayer]: ...
+    def setRestrictedLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def setRestrictToLayers(self, enabled: bool) -> None: ...
+    def restrictToLayers(self) -> bool: ...
+    def setFeatureClip(self, type: 'QgsMapClippingRegion.FeatureClippingType') -> None: ...
+    def featureClip(self) -> 'QgsMapClippingRegion.FeatureClippingType': ...
+    def setGeometry(self, geometry: 'QgsGeometry') -> None: ...
+    def geometry(self) -> 'QgsGeometry': ...
+
+
+class QgsMapClippingUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapClippingUtils') -> None: ...
+
+    @staticmethod
+    def calculateLabelIntersectionGeometry(regions: collections.abc.Iterable[QgsMapClippingRegion], context: 'QgsRenderContext') -> typing.Tuple['QgsGeometry', bool]: ...
+    @staticmethod
+    def calculatePainterClipRegion(regions: collections.abc.Iterable[QgsMapClippingRegion], context: 'QgsRenderContext', layerType: Qgis.LayerType) -> typing.Tuple[QtGui.QPainterPath, bool]: ...
+    @staticmethod
+    def calculateFeatureIntersectionGeometry(regions: collections.abc.Iterable[QgsMapClippingRegion], context: 'QgsRenderContext') -> typing.Tuple['QgsGeometry', bool]: ...
+    @staticmethod
+    def calculateFeatureRequestGeometry(regions: collections.abc.Iterable[QgsMapClippingRegion], context: 'QgsRenderContext') -> typing.Tuple['QgsGeometry', bool]: ...
+    @staticmethod
+    def collectClippingRegionsForLayer(context: 'QgsRenderContext', layer: typing.Optional[QgsMapLayer]) -> list[QgsMapClippingRegion]: ...
+
+
+class QgsAbstractLayoutIterator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractLayoutIterator') -> None: ...
+
+    def filePath(self, baseFilePath: typing.Optional[str], extension: typing.Optional[str]) -> str: ...
+    def next(self) -> bool: ...
+    def count(self) -> int: ...
+    def endRender(self) -> bool: ...
+    def beginRender(self) -> bool: ...
+    def layout(self) -> typing.Optional['QgsLayout']: ...
+
+
+class QgsReportSectionContext(PyQt5.sip.wrapper):
+
+    currentLayer = ... # type: QgsVectorLayer
+    feature = ... # type: QgsFeature
+    fieldFilters = ... # type: dict[str, typing.Any]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReportSectionContext') -> None: ...
+
+
+class QgsAbstractReportSection(QgsAbstractLayoutIterator):
+
+    class SubSection(int):
+        Header = ... # type: QgsAbstractReportSection.SubSection
+        Body = ... # type: QgsAbstractReportSection.SubSection
+        Children = ... # type: QgsAbstractReportSection.SubSection
+        Footer = ... # type: QgsAbstractReportSection.SubSection
+        End = ... # type: QgsAbstractReportSection.SubSection
+
+    def __init__(self, parentSection: typing.Optional['QgsAbstractReportSection'] = ...) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setParentSection(self, parent: typing.Optional['QgsAbstractReportSection']) -> None: ...
+    def copyCommonProperties(self, destination: typing.Optional['QgsAbstractReportSection']) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def reloadSettings(self) -> None: ...
+    def readXml(self, sectionElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def context(self) -> QgsReportSectionContext: ...
+    def setContext(self, context: QgsReportSectionContext) -> None: ...
+    def removeChildAt(self, index: int) -> None: ...
+    def removeChild(self, section: typing.Optional['QgsAbstractReportSection']) -> None: ...
+    def insertChild(self, index: int, section: typing.Optional['QgsAbstractReportSection']) -> None: ...
+    def appendChild(self, section: typing.Optional['QgsAbstractReportSection']) -> None: ...
+    def childSection(self, index: int) -> typing.Optional['QgsAbstractReportSection']: ...
+    def childSections(self) -> list['QgsAbstractReportSection']: ...
+    def row(self) -> int: ...
+    def childCount(self) -> int: ...
+    def setFooter(self, footer: typing.Optional['QgsLayout']) -> None: ...
+    def footer(self) -> typing.Optional['QgsLayout']: ...
+    def setFooterEnabled(self, enabled: bool) -> None: ...
+    def footerEnabled(self) -> bool: ...
+    def setHeader(self, header: typing.Optional['QgsLayout']) -> None: ...
+    def header(self) -> typing.Optional['QgsLayout']: ...
+    def setHeaderEnabled(self, enabled: bool) -> None: ...
+    def headerEnabled(self) -> bool: ...
+    def nextBody(self) -> typing.Tuple[typing.Optional['QgsLayout'], bool]: ...
+    def prepareFooter(self) -> bool: ...
+    def prepareHeader(self) -> bool: ...
+    def reset(self) -> None: ...
+    def endRender(self) -> bool: ...
+    def next(self) -> bool: ...
+    def beginRender(self) -> bool: ...
+    def layout(self) -> typing.Optional['QgsLayout']: ...
+    def filePath(self, baseFilePath: typing.Optional[str], extension: typing.Optional[str]) -> str: ...
+    def count(self) -> int: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def parentSection(self) -> typing.Optional['QgsAbstractReportSection']: ...
+    def clone(self) -> typing.Optional['QgsAbstractReportSection']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsLayoutUndoObjectInterface(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutUndoObjectInterface') -> None: ...
+
+    def createCommand(self, text: typing.Optional[str], id: int = ..., parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+
+
+class QgsLayout(QtWidgets.QGraphicsScene, QgsExpressionContextGenerator, QgsLayoutUndoObjectInterface):
+
+    class UndoCommand(int):
+        UndoLayoutDpi = ... # type: QgsLayout.UndoCommand
+        UndoNone = ... # type: QgsLayout.UndoCommand
+
+    class ZValues(int):
+        ZPage = ... # type: QgsLayout.ZValues
+        ZItem = ... # type: QgsLayout.ZValues
+        ZGrid = ... # type: QgsLayout.ZValues
+        ZGuide = ... # type: QgsLayout.ZValues
+        ZSmartGuide = ... # type: QgsLayout.ZValues
+        ZMouseHandles = ... # type: QgsLayout.ZValues
+        ZViewTool = ... # type: QgsLayout.ZValues
+        ZSnapIndicator = ... # type: QgsLayout.ZValues
+
+    def __init__(self, project: typing.Optional['QgsProject']) -> None: ...
+
+    itemAdded: typing.ClassVar[QtCore.pyqtSignal]
+    backgroundTaskCountChanged: typing.ClassVar[QtCore.pyqtSignal]
+    refreshed: typing.ClassVar[QtCore.pyqtSignal]
+    selectedItemChanged: typing.ClassVar[QtCore.pyqtSignal]
+    variablesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def updateBounds(self) -> None: ...
+    def refresh(self) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def ungroupItems(self, group: typing.Optional['QgsLayoutItemGroup']) -> list['QgsLayoutItem']: ...
+    def groupItems(self, items: collections.abc.Iterable['QgsLayoutItem']) -> typing.Optional['QgsLayoutItemGroup']: ...
+    def createCommand(self, text: typing.Optional[str], id: int = ..., parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+    def undoStack(self) -> typing.Optional['QgsLayoutUndoStack']: ...
+    def addItemsFromXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext, position: typing.Optional[typing.Union[QtCore.QPointF, QtCore.QPoint]] = ..., pasteInPlace: bool = ...) -> list['QgsLayoutItem']: ...
+    def readXml(self, layoutElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def loadFromTemplate(self, document: QtXml.QDomDocument, context: QgsReadWriteContext, clearExisting: bool = ...) -> typing.Tuple[list['QgsLayoutItem'], typing.Optional[bool]]: ...
+    def saveAsTemplate(self, path: typing.Optional[str], context: QgsReadWriteContext) -> bool: ...
+    def multiFrames(self) -> list['QgsLayoutMultiFrame']: ...
+    def removeMultiFrame(self, multiFrame: typing.Optional['QgsLayoutMultiFrame']) -> None: ...
+    def addMultiFrame(self, multiFrame: typing.Optional['QgsLayoutMultiFrame']) -> None: ...
+    def removeLayoutItem(self, item: typing.Optional['QgsLayoutItem']) -> None: ...
+    def addLayoutItem(self, item: typing.Optional['QgsLayoutItem']) -> None: ...
+    def pageItemBounds(self, page: int, visibleOnly: bool = ...) -> QtCore.QRectF: ...
+    def layoutBounds(self, ignorePages: bool = ..., margin: float = ...) -> QtCore.QRectF: ...
+    def pageCollection(self) -> typing.Optional['QgsLayoutPageCollection']: ...
+    def setReferenceMap(self, map: typing.Optional['QgsLayoutItemMap']) -> None: ...
+    def referenceMap(self) -> typing.Optional['QgsLayoutItemMap']: ...
+    def customProperties(self) -> list[str]: ...
+    def removeCustomProperty(self, key: typing.Optional[str]) -> None: ...
+    def customProperty(self, key: typing.Optional[str], defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setCustomProperty(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def guides(self) -> 'QgsLayoutGuideCollection': ...
+    def reloadSettings(self) -> None: ...
+    def gridSettings(self) -> 'QgsLayoutGridSettings': ...
+    def snapper(self) -> 'QgsLayoutSnapper': ...
+    def reportContext(self) -> 'QgsLayoutReportContext': ...
+    def renderContext(self) -> 'QgsLayoutRenderContext': ...
+    @typing.overload
+    def convertFromLayoutUnits(self, length: float, unit: Qgis.LayoutUnit) -> 'QgsLayoutMeasurement': ...
+    @typing.overload
+    def convertFromLayoutUnits(self, size: QtCore.QSizeF, unit: Qgis.LayoutUnit) -> 'QgsLayoutSize': ...
+    @typing.overload
+    def convertFromLayoutUnits(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], unit: Qgis.LayoutUnit) -> 'QgsLayoutPoint': ...
+    @typing.overload
+    def convertToLayoutUnits(self, measurement: 'QgsLayoutMeasurement') -> float: ...
+    @typing.overload
+    def convertToLayoutUnits(self, size: 'QgsLayoutSize') -> QtCore.QSizeF: ...
+    @typing.overload
+    def convertToLayoutUnits(self, point: 'QgsLayoutPoint') -> QtCore.QPointF: ...
+    def units(self) -> Qgis.LayoutUnit: ...
+    def setUnits(self, units: Qgis.LayoutUnit) -> None: ...
+    @typing.overload
+    def layoutItemAt(self, position: typing.Union[QtCore.QPointF, QtCore.QPoint], ignoreLocked: bool = ..., searchTolerance: float = ...) -> typing.Optional['QgsLayoutItem']: ...
+    @typing.overload
+    def layoutItemAt(self, position: typing.Union[QtCore.QPointF, QtCore.QPoint], belowItem: typing.Optional['QgsLayoutItem'], ignoreLocked: bool = ..., searchTolerance: float = ...) -> typing.Optional['QgsLayoutItem']: ...
+    def multiFrameByUuid(self, uuid: typing.Optional[str], includeTemplateUuids: bool = ...) -> typing.Optional['QgsLayoutMultiFrame']: ...
+    def itemById(self, id: typing.Optional[str]) -> typing.Optional['QgsLayoutItem']: ...
+    def itemByTemplateUuid(self, uuid: typing.Optional[str]) -> typing.Optional['QgsLayoutItem']: ...
+    def itemByUuid(self, uuid: typing.Optional[str], includeTemplateUuids: bool = ...) -> typing.Optional['QgsLayoutItem']: ...
+    def updateZValues(self, addUndoCommands: bool = ...) -> None: ...
+    def moveItemToBottom(self, item: typing.Optional['QgsLayoutItem'], deferUpdate: bool = ...) -> bool: ...
+    def moveItemToTop(self, item: typing.Optional['QgsLayoutItem'], deferUpdate: bool = ...) -> bool: ...
+    def lowerItem(self, item: typing.Optional['QgsLayoutItem'], deferUpdate: bool = ...) -> bool: ...
+    def raiseItem(self, item: typing.Optional['QgsLayoutItem'], deferUpdate: bool = ...) -> bool: ...
+    def deselectAll(self) -> None: ...
+    def setSelectedItem(self, item: typing.Optional['QgsLayoutItem']) -> None: ...
+    def selectedLayoutItems(self, includeLockedItems: bool = ...) -> list['QgsLayoutItem']: ...
+    def itemsModel(self) -> typing.Optional['QgsLayoutModel']: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def clear(self) -> None: ...
+    def initializeDefaults(self) -> None: ...
+    def clone(self) -> typing.Optional['QgsLayout']: ...
+
+
+class QgsLayoutAligner(PyQt5.sip.wrapper):
+
+    class Resize(int):
+        ResizeNarrowest = ... # type: QgsLayoutAligner.Resize
+        ResizeWidest = ... # type: QgsLayoutAligner.Resize
+        ResizeShortest = ... # type: QgsLayoutAligner.Resize
+        ResizeTallest = ... # type: QgsLayoutAligner.Resize
+        ResizeToSquare = ... # type: QgsLayoutAligner.Resize
+
+    class Distribution(int):
+        DistributeLeft = ... # type: QgsLayoutAligner.Distribution
+        DistributeHCenter = ... # type: QgsLayoutAligner.Distribution
+        DistributeHSpace = ... # type: QgsLayoutAligner.Distribution
+        DistributeRight = ... # type: QgsLayoutAligner.Distribution
+        DistributeTop = ... # type: QgsLayoutAligner.Distribution
+        DistributeVCenter = ... # type: QgsLayoutAligner.Distribution
+        DistributeVSpace = ... # type: QgsLayoutAligner.Distribution
+        DistributeBottom = ... # type: QgsLayoutAligner.Distribution
+
+    class Alignment(int):
+        AlignLeft = ... # type: QgsLayoutAligner.Alignment
+        AlignHCenter = ... # type: QgsLayoutAligner.Alignment
+        AlignRight = ... # type: QgsLayoutAligner.Alignment
+        AlignTop = ... # type: QgsLayoutAligner.Alignment
+        AlignVCenter = ... # type: QgsLayoutAligner.Alignment
+        AlignBottom = ... # type: QgsLayoutAligner.Alignment
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutAligner') -> None: ...
+
+    @staticmethod
+    def resizeItems(layout: typing.Optional[QgsLayout], items: collections.abc.Iterable['QgsLayoutItem'], resize: 'QgsLayoutAligner.Resize') -> None: ...
+    @staticmethod
+    def distributeItems(layout: typing.Optional[QgsLayout], items: collections.abc.Iterable['QgsLayoutItem'], distribution: 'QgsLayoutAligner.Distribution') -> None: ...
+    @staticmethod
+    def alignItems(layout: typing.Optional[QgsLayout], items: collections.abc.Iterable['QgsLayoutItem'], alignment: 'QgsLayoutAligner.Alignment') -> None: ...
+
+
+class QgsLayoutSerializableObject(QgsLayoutUndoObjectInterface):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutSerializableObject') -> None: ...
+
+    def createCommand(self, text: typing.Optional[str], id: int, parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+    def readXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+
+
+class QgsLayoutAtlas(QtCore.QObject, QgsAbstractLayoutIterator, QgsLayoutSerializableObject, QgsExpressionContextGenerator):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    renderEnded: typing.ClassVar[QtCore.pyqtSignal]
+    renderBegun: typing.ClassVar[QtCore.pyqtSignal]
+    featureChanged: typing.ClassVar[QtCore.pyqtSignal]
+    numberFeaturesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    messagePushed: typing.ClassVar[QtCore.pyqtSignal]
+    coverageLayerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    toggled: typing.ClassVar[QtCore.pyqtSignal]
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def refreshCurrentFeature(self) -> None: ...
+    def seekTo(self, feature: typing.Union[int, QgsFeature]) -> bool: ...
+    def first(self) -> bool: ...
+    def last(self) -> bool: ...
+    def previous(self) -> bool: ...
+    def next(self) -> bool: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def currentFeatureNumber(self) -> int: ...
+    def filePath(self, baseFilePath: typing.Optional[str], extension: typing.Optional[str]) -> str: ...
+    def count(self) -> int: ...
+    def endRender(self) -> bool: ...
+    def beginRender(self) -> bool: ...
+    def updateFeatures(self) -> int: ...
+    def setFilterExpression(self, expression: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def filterExpression(self) -> str: ...
+    def setFilterFeatures(self, filtered: bool) -> None: ...
+    def filterFeatures(self) -> bool: ...
+    def setSortExpression(self, expression: typing.Optional[str]) -> None: ...
+    def sortExpression(self) -> str: ...
+    def setSortAscending(self, ascending: bool) -> None: ...
+    def sortAscending(self) -> bool: ...
+    def setSortFeatures(self, enabled: bool) -> None: ...
+    def sortFeatures(self) -> bool: ...
+    def nameForPage(self, page: int) -> str: ...
+    def setPageNameExpression(self, expression: typing.Optional[str]) -> None: ...
+    def pageNameExpression(self) -> str: ...
+    def setCoverageLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def coverageLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def currentFilename(self) -> str: ...
+    def setFilenameExpression(self, expression: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def filenameExpression(self) -> str: ...
+    def setHideCoverage(self, hide: bool) -> None: ...
+    def hideCoverage(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def readXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+
+
+class QgsLayoutEffect(QtWidgets.QGraphicsEffect):
+
+    def __init__(self) -> None: ...
+
+    def draw(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    @deprecated("""""")
+    def compositionMode(self) -> QtGui.QPainter.CompositionMode: ...
+    @deprecated("""""")
+    def setCompositionMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+
+
+class QgsLayoutExporter(PyQt5.sip.wrapper):
+
+    class ExportResult(int):
+        Success = ... # type: QgsLayoutExporter.ExportResult
+        Canceled = ... # type: QgsLayoutExporter.ExportResult
+        MemoryError = ... # type: QgsLayoutExporter.ExportResult
+        FileError = ... # type: QgsLayoutExporter.ExportResult
+        PrintError = ... # type: QgsLayoutExporter.ExportResult
+        SvgLayerError = ... # type: QgsLayoutExporter.ExportResult
+        IteratorError = ... # type: QgsLayoutExporter.ExportResult
+
+    class PageExportDetails(PyQt5.sip.wrapper):
+
+        baseName = ... # type: typing.Optional[str]
+        directory = ... # type: typing.Optional[str]
+        extension = ... # type: typing.Optional[str]
+        page = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutExporter.PageExportDetails') -> None: ...
+
+    class ImageExportSettings(PyQt5.sip.wrapper):
+
+        cropMargins = ... # type: QgsMargins
+        cropToContents = ... # type: bool
+        dpi = ... # type: float
+        exportMetadata = ... # type: bool
+        flags = ... # type: typing.Union[Qgis.LayoutRenderFlags, Qgis.LayoutRenderFlag]
+        generateWorldFile = ... # type: bool
+        imageSize = ... # type: QtCore.QSize
+        pages = ... # type: collections.abc.Iterable[int]
+        predefinedMapScales = ... # type: collections.abc.Iterable[float]
+        quality = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutExporter.ImageExportSettings') -> None: ...
+
+    class PdfExportSettings(PyQt5.sip.wrapper):
+
+        appendGeoreference = ... # type: bool
+        dpi = ... # type: float
+        exportLayersAsSeperateFiles = ... # type: bool
+        exportMetadata = ... # type: bool
+        exportThemes = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        flags = ... # type: typing.Union[Qgis.LayoutRenderFlags, Qgis.LayoutRenderFlag]
+        forceVectorOutput = ... # type: bool
+        includeGeoPdfFeatures = ... # type: bool
+        predefinedMapScales = ... # type: collections.abc.Iterable[float]
+        rasterizeWholeImage = ... # type: bool
+        simplifyGeometries = ... # type: bool
+        textRenderFormat = ... # type: Qgis.TextRenderFormat
+        useIso32000ExtensionFormatGeoreferencing = ... # type: bool
+        useOgcBestPracticeFormatGeoreferencing = ... # type: bool
+        writeGeoPdf = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutExporter.PdfExportSettings') -> None: ...
+
+    class PrintExportSettings(PyQt5.sip.wrapper):
+
+        dpi = ... # type: float
+        flags = ... # type: typing.Union[Qgis.LayoutRenderFlags, Qgis.LayoutRenderFlag]
+        predefinedMapScales = ... # type: collections.abc.Iterable[float]
+        rasterizeWholeImage = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutExporter.PrintExportSettings') -> None: ...
+
+    class SvgExportSettings(PyQt5.sip.wrapper):
+
+        cropMargins = ... # type: QgsMargins
+        cropToContents = ... # type: bool
+        dpi = ... # type: float
+        exportAsLayers = ... # type: bool
+        exportLabelsToSeparateLayers = ... # type: bool
+        exportMetadata = ... # type: bool
+        flags = ... # type: typing.Union[Qgis.LayoutRenderFlags, Qgis.LayoutRenderFlag]
+        forceVectorOutput = ... # type: bool
+        predefinedMapScales = ... # type: collections.abc.Iterable[float]
+        simplifyGeometries = ... # type: bool
+        textRenderFormat = ... # type: Qgis.TextRenderFormat
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutExporter.SvgExportSettings') -> None: ...
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutExporter') -> None: ...
+
+    def generateFileName(self, details: 'QgsLayoutExporter.PageExportDetails') -> str: ...
+    @staticmethod
+    def containsAdvancedEffects(layout: typing.Optional[QgsLayout]) -> bool: ...
+    @staticmethod
+    def requiresRasterization(layout: typing.Optional[QgsLayout]) -> bool: ...
+    @typing.overload
+    def computeWorldFileParameters(self, dpi: float = ...) -> typing.Tuple[float, float, float, float, float, float]: ...
+    @typing.overload
+    def computeWorldFileParameters(self, region: QtCore.QRectF, dpi: float = ...) -> typing.Tuple[float, float, float, float, float, float]: ...
+    def georeferenceOutput(self, file: typing.Optional[str], referenceMap: typing.Optional['QgsLayoutItemMap'] = ..., exportRegion: QtCore.QRectF = ..., dpi: float = ...) -> bool: ...
+    def labelingResults(self) -> typing.Any: ...
+    def errorMessage(self) -> str: ...
+    def errorFile(self) -> str: ...
+    @typing.overload
+    def exportToSvg(self, filePath: typing.Optional[str], settings: 'QgsLayoutExporter.SvgExportSettings') -> 'QgsLayoutExporter.ExportResult': ...
+    @typing.overload
+    @staticmethod
+    def exportToSvg(iterator: typing.Optional[QgsAbstractLayoutIterator], baseFilePath: typing.Optional[str], settings: 'QgsLayoutExporter.SvgExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple['QgsLayoutExporter.ExportResult', str]: ...
+    @typing.overload
+    def print(self, printer: QtPrintSupport.QPrinter, settings: 'QgsLayoutExporter.PrintExportSettings') -> 'QgsLayoutExporter.ExportResult': ...
+    @typing.overload
+    @staticmethod
+    def print(iterator: typing.Optional[QgsAbstractLayoutIterator], printer: QtPrintSupport.QPrinter, settings: 'QgsLayoutExporter.PrintExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple['QgsLayoutExporter.ExportResult', str]: ...
+    @staticmethod
+    def exportToPdfs(iterator: typing.Optional[QgsAbstractLayoutIterator], baseFilePath: typing.Optional[str], settings: 'QgsLayoutExporter.PdfExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple['QgsLayoutExporter.ExportResult', str]: ...
+    @typing.overload
+    def exportToPdf(self, filePath: typing.Optional[str], settings: 'QgsLayoutExporter.PdfExportSettings') -> 'QgsLayoutExporter.ExportResult': ...
+    @typing.overload
+    @staticmethod
+    def exportToPdf(iterator: typing.Optional[QgsAbstractLayoutIterator], fileName: typing.Optional[str], settings: 'QgsLayoutExporter.PdfExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple['QgsLayoutExporter.ExportResult', str]: ...
+    @typing.overload
+    def exportToImage(self, filePath: typing.Optional[str], settings: 'QgsLayoutExporter.ImageExportSettings') -> 'QgsLayoutExporter.ExportResult': ...
+    @typing.overload
+    @staticmethod
+    def exportToImage(iterator: typing.Optional[QgsAbstractLayoutIterator], baseFilePath: typing.Optional[str], extension: typing.Optional[str], settings: 'QgsLayoutExporter.ImageExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple['QgsLayoutExporter.ExportResult', str]: ...
+    def renderRegionToImage(self, region: QtCore.QRectF, imageSize: QtCore.QSize = ..., dpi: float = ...) -> QtGui.QImage: ...
+    def renderRegion(self, painter: typing.Optional[QtGui.QPainter], region: QtCore.QRectF) -> None: ...
+    def renderPageToImage(self, page: int, imageSize: QtCore.QSize = ..., dpi: float = ...) -> QtGui.QImage: ...
+    def renderPage(self, painter: typing.Optional[QtGui.QPainter], page: int) -> None: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+
+
+class QgsLayoutObject(QtCore.QObject, QgsExpressionContextGenerator):
+
+    class PropertyValueType(int):
+        EvaluatedValue = ... # type: QgsLayoutObject.PropertyValueType
+        OriginalValue = ... # type: QgsLayoutObject.PropertyValueType
+
+    class DataDefinedProperty(int):
+        NoProperty = ... # type: QgsLayoutObject.DataDefinedProperty
+        AllProperties = ... # type: QgsLayoutObject.DataDefinedProperty
+        TestProperty = ... # type: QgsLayoutObject.DataDefinedProperty
+        PresetPaperSize = ... # type: QgsLayoutObject.DataDefinedProperty
+        PaperWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        PaperHeight = ... # type: QgsLayoutObject.DataDefinedProperty
+        NumPages = ... # type: QgsLayoutObject.DataDefinedProperty
+        PaperOrientation = ... # type: QgsLayoutObject.DataDefinedProperty
+        PageNumber = ... # type: QgsLayoutObject.DataDefinedProperty
+        PositionX = ... # type: QgsLayoutObject.DataDefinedProperty
+        PositionY = ... # type: QgsLayoutObject.DataDefinedProperty
+        ItemWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        ItemHeight = ... # type: QgsLayoutObject.DataDefinedProperty
+        ItemRotation = ... # type: QgsLayoutObject.DataDefinedProperty
+        Transparency = ... # type: QgsLayoutObject.DataDefinedProperty
+        Opacity = ... # type: QgsLayoutObject.DataDefinedProperty
+        BlendMode = ... # type: QgsLayoutObject.DataDefinedProperty
+        ExcludeFromExports = ... # type: QgsLayoutObject.DataDefinedProperty
+        FrameColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        BackgroundColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        MarginLeft = ... # type: QgsLayoutObject.DataDefinedProperty
+        MarginTop = ... # type: QgsLayoutObject.DataDefinedProperty
+        MarginRight = ... # type: QgsLayoutObject.DataDefinedProperty
+        MarginBottom = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapRotation = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapScale = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapXMin = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapYMin = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapXMax = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapYMax = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapAtlasMargin = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapLayers = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapStylePreset = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapLabelMargin = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridEnabled = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridIntervalX = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridIntervalY = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridOffsetX = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridOffsetY = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameSize = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameMargin = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridLabelDistance = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridCrossSize = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameLineThickness = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridAnnotationDisplayLeft = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridAnnotationDisplayRight = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridAnnotationDisplayTop = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridAnnotationDisplayBottom = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameDivisionsLeft = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameDivisionsRight = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameDivisionsTop = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapGridFrameDivisionsBottom = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapCrs = ... # type: QgsLayoutObject.DataDefinedProperty
+        StartDateTime = ... # type: QgsLayoutObject.DataDefinedProperty
+        EndDateTime = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapZRangeLower = ... # type: QgsLayoutObject.DataDefinedProperty
+        MapZRangeUpper = ... # type: QgsLayoutObject.DataDefinedProperty
+        PictureSource = ... # type: QgsLayoutObject.DataDefinedProperty
+        PictureSvgBackgroundColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        PictureSvgStrokeColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        PictureSvgStrokeWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        SourceUrl = ... # type: QgsLayoutObject.DataDefinedProperty
+        LegendTitle = ... # type: QgsLayoutObject.DataDefinedProperty
+        LegendColumnCount = ... # type: QgsLayoutObject.DataDefinedProperty
+        LegendAutoWrapWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarLeftSegments = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarRightSegments = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarSegmentWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarMinimumWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarMaximumWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarHeight = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarRightSegmentSubdivisions = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarSubdivisionHeight = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarFillColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarFillColor2 = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarLineColor = ... # type: QgsLayoutObject.DataDefinedProperty
+        ScalebarLineWidth = ... # type: QgsLayoutObject.DataDefinedProperty
+        AttributeTableSourceLayer = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileTolerance = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileDistanceMajorInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileDistanceMinorInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileDistanceLabelInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileElevationMajorInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileElevationMinorInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileElevationLabelInterval = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileMinimumDistance = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileMaximumDistance = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileMinimumElevation = ... # type: QgsLayoutObject.DataDefinedProperty
+        ElevationProfileMaximumElevation = ... # type: QgsLayoutObject.DataDefinedProperty
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readObjectPropertiesFromElement(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeObjectPropertiesToElement(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def refresh(self) -> None: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def customProperties(self) -> list[str]: ...
+    def removeCustomProperty(self, key: typing.Optional[str]) -> None: ...
+    def customProperty(self, key: typing.Optional[str], defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setCustomProperty(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    @staticmethod
+    def propertyAssociatesWithParentMultiframe(property: 'QgsLayoutObject.DataDefinedProperty') -> bool: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    NoProperty: QgsLayoutObject.DataDefinedProperty
+    AllProperties: QgsLayoutObject.DataDefinedProperty
+    TestProperty: QgsLayoutObject.DataDefinedProperty
+    PresetPaperSize: QgsLayoutObject.DataDefinedProperty
+    PaperWidth: QgsLayoutObject.DataDefinedProperty
+    PaperHeight: QgsLayoutObject.DataDefinedProperty
+    NumPages: QgsLayoutObject.DataDefinedProperty
+    PaperOrientation: QgsLayoutObject.DataDefinedProperty
+    PageNumber: QgsLayoutObject.DataDefinedProperty
+    PositionX: QgsLayoutObject.DataDefinedProperty
+    PositionY: QgsLayoutObject.DataDefinedProperty
+    ItemWidth: QgsLayoutObject.DataDefinedProperty
+    ItemHeight: QgsLayoutObject.DataDefinedProperty
+    ItemRotation: QgsLayoutObject.DataDefinedProperty
+    Transparency: QgsLayoutObject.DataDefinedProperty
+    Opacity: QgsLayoutObject.DataDefinedProperty
+    BlendMode: QgsLayoutObject.DataDefinedProperty
+    ExcludeFromExports: QgsLayoutObject.DataDefinedProperty
+    FrameColor: QgsLayoutObject.DataDefinedProperty
+    BackgroundColor: QgsLayoutObject.DataDefinedProperty
+    MarginLeft: QgsLayoutObject.DataDefinedProperty
+    MarginTop: QgsLayoutObject.DataDefinedProperty
+    MarginRight: QgsLayoutObject.DataDefinedProperty
+    MarginBottom: QgsLayoutObject.DataDefinedProperty
+    MapRotation: QgsLayoutObject.DataDefinedProperty
+    MapScale: QgsLayoutObject.DataDefinedProperty
+    MapXMin: QgsLayoutObject.DataDefinedProperty
+    MapYMin: QgsLayoutObject.DataDefinedProperty
+    MapXMax: QgsLayoutObject.DataDefinedProperty
+    MapYMax: QgsLayoutObject.DataDefinedProperty
+    MapAtlasMargin: QgsLayoutObject.DataDefinedProperty
+    MapLayers: QgsLayoutObject.DataDefinedProperty
+    MapStylePreset: QgsLayoutObject.DataDefinedProperty
+    MapLabelMargin: QgsLayoutObject.DataDefinedProperty
+    MapGridEnabled: QgsLayoutObject.DataDefinedProperty
+    MapGridIntervalX: QgsLayoutObject.DataDefinedProperty
+    MapGridIntervalY: QgsLayoutObject.DataDefinedProperty
+    MapGridOffsetX: QgsLayoutObject.DataDefinedProperty
+    MapGridOffsetY: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameSize: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameMargin: QgsLayoutObject.DataDefinedProperty
+    MapGridLabelDistance: QgsLayoutObject.DataDefinedProperty
+    MapGridCrossSize: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameLineThickness: QgsLayoutObject.DataDefinedProperty
+    MapGridAnnotationDisplayLeft: QgsLayoutObject.DataDefinedProperty
+    MapGridAnnotationDisplayRight: QgsLayoutObject.DataDefinedProperty
+    MapGridAnnotationDisplayTop: QgsLayoutObject.DataDefinedProperty
+    MapGridAnnotationDisplayBottom: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameDivisionsLeft: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameDivisionsRight: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameDivisionsTop: QgsLayoutObject.DataDefinedProperty
+    MapGridFrameDivisionsBottom: QgsLayoutObject.DataDefinedProperty
+    MapCrs: QgsLayoutObject.DataDefinedProperty
+    StartDateTime: QgsLayoutObject.DataDefinedProperty
+    EndDateTime: QgsLayoutObject.DataDefinedProperty
+    MapZRangeLower: QgsLayoutObject.DataDefinedProperty
+    MapZRangeUpper: QgsLayoutObject.DataDefinedProperty
+    PictureSource: QgsLayoutObject.DataDefinedProperty
+    PictureSvgBackgroundColor: QgsLayoutObject.DataDefinedProperty
+    PictureSvgStrokeColor: QgsLayoutObject.DataDefinedProperty
+    PictureSvgStrokeWidth: QgsLayoutObject.DataDefinedProperty
+    SourceUrl: QgsLayoutObject.DataDefinedProperty
+    LegendTitle: QgsLayoutObject.DataDefinedProperty
+    LegendColumnCount: QgsLayoutObject.DataDefinedProperty
+    LegendAutoWrapWidth: QgsLayoutObject.DataDefinedProperty
+    ScalebarLeftSegments: QgsLayoutObject.DataDefinedProperty
+    ScalebarRightSegments: QgsLayoutObject.DataDefinedProperty
+    ScalebarSegmentWidth: QgsLayoutObject.DataDefinedProperty
+    ScalebarMinimumWidth: QgsLayoutObject.DataDefinedProperty
+    ScalebarMaximumWidth: QgsLayoutObject.DataDefinedProperty
+    ScalebarHeight: QgsLayoutObject.DataDefinedProperty
+    ScalebarRightSegmentSubdivisions: QgsLayoutObject.DataDefinedProperty
+    ScalebarSubdivisionHeight: QgsLayoutObject.DataDefinedProperty
+    ScalebarFillColor: QgsLayoutObject.DataDefinedProperty
+    ScalebarFillColor2: QgsLayoutObject.DataDefinedProperty
+    ScalebarLineColor: QgsLayoutObject.DataDefinedProperty
+    ScalebarLineWidth: QgsLayoutObject.DataDefinedProperty
+    AttributeTableSourceLayer: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileTolerance: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileDistanceMajorInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileDistanceMinorInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileDistanceLabelInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileElevationMajorInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileElevationMinorInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileElevationLabelInterval: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileMinimumDistance: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileMaximumDistance: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileMinimumElevation: QgsLayoutObject.DataDefinedProperty
+    ElevationProfileMaximumElevation: QgsLayoutObject.DataDefinedProperty
+
+
+class QgsLayoutItem(QgsLayoutObject, QtWidgets.QGraphicsRectItem, QgsLayoutUndoObjectInterface):
+
+    class ExportLayerBehavior(int):
+        CanGroupWithAnyOtherItem = ... # type: QgsLayoutItem.ExportLayerBehavior
+        CanGroupWithItemsOfSameType = ... # type: QgsLayoutItem.ExportLayerBehavior
+        MustPlaceInOwnLayer = ... # type: QgsLayoutItem.ExportLayerBehavior
+        ItemContainsSubLayers = ... # type: QgsLayoutItem.ExportLayerBehavior
+
+    class Flag(int):
+        FlagOverridesPaint = ... # type: QgsLayoutItem.Flag
+        FlagProvidesClipPath = ... # type: QgsLayoutItem.Flag
+        FlagDisableSceneCaching = ... # type: QgsLayoutItem.Flag
+
+    class UndoCommand(int):
+        UndoNone = ... # type: QgsLayoutItem.UndoCommand
+        UndoIncrementalMove = ... # type: QgsLayoutItem.UndoCommand
+        UndoIncrementalResize = ... # type: QgsLayoutItem.UndoCommand
+        UndoStrokeColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoStrokeWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoBackgroundColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoOpacity = ... # type: QgsLayoutItem.UndoCommand
+        UndoMarginLeft = ... # type: QgsLayoutItem.UndoCommand
+        UndoMarginTop = ... # type: QgsLayoutItem.UndoCommand
+        UndoMarginBottom = ... # type: QgsLayoutItem.UndoCommand
+        UndoMarginRight = ... # type: QgsLayoutItem.UndoCommand
+        UndoSetId = ... # type: QgsLayoutItem.UndoCommand
+        UndoRotation = ... # type: QgsLayoutItem.UndoCommand
+        UndoExportLayerName = ... # type: QgsLayoutItem.UndoCommand
+        UndoShapeStyle = ... # type: QgsLayoutItem.UndoCommand
+        UndoShapeCornerRadius = ... # type: QgsLayoutItem.UndoCommand
+        UndoNodeMove = ... # type: QgsLayoutItem.UndoCommand
+        UndoAtlasMargin = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapRotation = ... # type: QgsLayoutItem.UndoCommand
+        UndoZoomContent = ... # type: QgsLayoutItem.UndoCommand
+        UndoOverviewStyle = ... # type: QgsLayoutItem.UndoCommand
+        UndoGridFramePenColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridFrameFill1Color = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridFrameFill2Color = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapAnnotationDistance = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridAnnotationFontColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridLineSymbol = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridMarkerSymbol = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapGridIntervalRange = ... # type: QgsLayoutItem.UndoCommand
+        UndoMapLabelMargin = ... # type: QgsLayoutItem.UndoCommand
+        UndoPictureRotation = ... # type: QgsLayoutItem.UndoCommand
+        UndoPictureFillColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoPictureStrokeColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoPictureStrokeWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoPictureNorthOffset = ... # type: QgsLayoutItem.UndoCommand
+        UndoLabelText = ... # type: QgsLayoutItem.UndoCommand
+        UndoLabelFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoLabelMargin = ... # type: QgsLayoutItem.UndoCommand
+        UndoLabelFontColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendText = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendColumnCount = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendSymbolWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendSymbolHeight = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendMaxSymbolSize = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendMinSymbolSize = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendWmsLegendWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendWmsLegendHeight = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendTitleSpaceBottom = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendGroupSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendGroupIndent = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendSubgroupIndent = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendLayerSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendSymbolSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendIconSymbolSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendFontColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendBoxSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendColumnSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendLineSpacing = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendRasterStrokeWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendRasterStrokeColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendTitleFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendGroupFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendLayerFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendItemFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoLegendAutoWrapAfter = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarLineWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarSegmentSize = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarSegmentsLeft = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarSegments = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarHeight = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarSubdivisions = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarSubdivisionsHeight = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarFontColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarFillColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarFillColor2 = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarStrokeColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarUnitText = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarMapUnitsSegment = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarLabelBarSize = ... # type: QgsLayoutItem.UndoCommand
+        UndoScaleBarBoxContentSpace = ... # type: QgsLayoutItem.UndoCommand
+        UndoArrowStrokeWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoArrowHeadWidth = ... # type: QgsLayoutItem.UndoCommand
+        UndoArrowHeadFillColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoArrowHeadStrokeColor = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileTolerance = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileChartBackground = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileChartBorder = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileDistanceMajorGridlines = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileDistanceMinorGridlines = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileDistanceFormat = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileDistanceFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileDistanceLabels = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileElevationMajorGridlines = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileElevationMinorGridlines = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileElevationFormat = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileElevationFont = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileElevationLabels = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileMinimumDistance = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileMaximumDistance = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileMinimumElevation = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileMaximumElevation = ... # type: QgsLayoutItem.UndoCommand
+        UndoElevationProfileSubsectionLines = ... # type: QgsLayoutItem.UndoCommand
+        UndoCustomCommand = ... # type: QgsLayoutItem.UndoCommand
+
+    class ReferencePoint(int):
+        UpperLeft = ... # type: QgsLayoutItem.ReferencePoint
+        UpperMiddle = ... # type: QgsLayoutItem.ReferencePoint
+        UpperRight = ... # type: QgsLayoutItem.ReferencePoint
+        MiddleLeft = ... # type: QgsLayoutItem.ReferencePoint
+        Middle = ... # type: QgsLayoutItem.ReferencePoint
+        MiddleRight = ... # type: QgsLayoutItem.ReferencePoint
+        LowerLeft = ... # type: QgsLayoutItem.ReferencePoint
+        LowerMiddle = ... # type: QgsLayoutItem.ReferencePoint
+        LowerRight = ... # type: QgsLayoutItem.ReferencePoint
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __xor__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __ior__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __or__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __iand__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __and__(self, f: typing.Union['QgsLayoutItem.Flags', 'QgsLayoutItem.Flag']) -> 'QgsLayoutItem.Flags': ...
+        def __invert__(self) -> 'QgsLayoutItem.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ExportLayerDetail(PyQt5.sip.wrapper):
+
+        compositionMode = ... # type: QtGui.QPainter.CompositionMode
+        groupName = ... # type: typing.Optional[str]
+        mapLayerId = ... # type: typing.Optional[str]
+        mapTheme = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        opacity = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayoutItem.ExportLayerDetail') -> None: ...
+
+    def __init__(self, layout: typing.Optional[QgsLayout], manageZValue: bool = ...) -> None: ...
+
+    def applyDataDefinedSize(self, size: 'QgsLayoutSize') -> 'QgsLayoutSize': ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def topLeftToReferencePoint(self, point: 'QgsLayoutPoint') -> 'QgsLayoutPoint': ...
+    def positionAtReferencePoint(self, reference: 'QgsLayoutItem.ReferencePoint') -> QtCore.QPointF: ...
+    def adjustPointForReferencePosition(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], size: QtCore.QSizeF, reference: 'QgsLayoutItem.ReferencePoint') -> QtCore.QPointF: ...
+    def refreshBlendMode(self) -> None: ...
+    def refreshBackgroundColor(self, updateItem: bool = ...) -> None: ...
+    def refreshFrame(self, updateItem: bool = ...) -> None: ...
+    def refreshOpacity(self, updateItem: bool = ...) -> None: ...
+    def refreshItemRotation(self, origin: typing.Optional[typing.Union[QtCore.QPointF, QtCore.QPoint]] = ...) -> None: ...
+    def refreshItemPosition(self) -> None: ...
+    def refreshItemSize(self) -> None: ...
+    def applyItemSizeConstraint(self, targetSize: QtCore.QSizeF) -> QtCore.QSizeF: ...
+    def setMinimumSize(self, size: 'QgsLayoutSize') -> None: ...
+    def setFixedSize(self, size: 'QgsLayoutSize') -> None: ...
+    def drawRefreshingOverlay(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem]) -> None: ...
+    def drawBackground(self, context: QgsRenderContext) -> None: ...
+    def drawFrame(self, context: QgsRenderContext) -> None: ...
+    def framePath(self) -> QtGui.QPainterPath: ...
+    def draw(self, context: 'QgsLayoutItemRenderContext') -> None: ...
+    def drawDebugRect(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    clipPathChanged: typing.ClassVar[QtCore.pyqtSignal]
+    backgroundTaskCountChanged: typing.ClassVar[QtCore.pyqtSignal]
+    sizePositionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    rotationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    lockChanged: typing.ClassVar[QtCore.pyqtSignal]
+    frameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def rotateItem(self, angle: float, transformOrigin: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setItemRotation(self, rotation: float, adjustPosition: bool = ...) -> None: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def redraw(self) -> None: ...
+    def invalidateCache(self) -> None: ...
+    def refresh(self) -> None: ...
+    def isRefreshing(self) -> bool: ...
+    def clipPath(self) -> QgsGeometry: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def shouldDrawItem(self) -> bool: ...
+    def cancelCommand(self) -> None: ...
+    def endCommand(self) -> None: ...
+    def beginCommand(self, commandText: typing.Optional[str], command: 'QgsLayoutItem.UndoCommand' = ...) -> None: ...
+    def zoomContent(self, factor: float, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setMoveContentPreviewOffset(self, dx: float, dy: float) -> None: ...
+    def moveContent(self, dx: float, dy: float) -> None: ...
+    def rectWithFrame(self) -> QtCore.QRectF: ...
+    def estimatedFrameBleed(self) -> float: ...
+    def requiresRasterization(self) -> bool: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def setExcludeFromExports(self, exclude: bool) -> None: ...
+    def excludeFromExports(self) -> bool: ...
+    def setItemOpacity(self, opacity: float) -> None: ...
+    def itemOpacity(self) -> float: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def backgroundColor(self, useDataDefined: bool = ...) -> QtGui.QColor: ...
+    def setBackgroundEnabled(self, drawBackground: bool) -> None: ...
+    def hasBackground(self) -> bool: ...
+    def setFrameJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def frameJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def frameStrokeWidth(self) -> 'QgsLayoutMeasurement': ...
+    def setFrameStrokeWidth(self, width: 'QgsLayoutMeasurement') -> None: ...
+    def frameStrokeColor(self) -> QtGui.QColor: ...
+    def setFrameStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setFrameEnabled(self, drawFrame: bool) -> None: ...
+    def frameEnabled(self) -> bool: ...
+    def createCommand(self, text: typing.Optional[str], id: int, parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readXml(self, itemElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def itemRotation(self) -> float: ...
+    def sizeWithUnits(self) -> 'QgsLayoutSize': ...
+    def pagePositionWithUnits(self) -> 'QgsLayoutPoint': ...
+    def pagePos(self) -> QtCore.QPointF: ...
+    def page(self) -> int: ...
+    def positionWithUnits(self) -> 'QgsLayoutPoint': ...
+    def attemptMoveBy(self, deltaX: float, deltaY: float) -> None: ...
+    def attemptSetSceneRect(self, rect: QtCore.QRectF, includesFrame: bool = ...) -> None: ...
+    def attemptMove(self, point: 'QgsLayoutPoint', useReferencePoint: bool = ..., includesFrame: bool = ..., page: int = ...) -> None: ...
+    def attemptResize(self, size: 'QgsLayoutSize', includesFrame: bool = ...) -> None: ...
+    def minimumSize(self) -> 'QgsLayoutSize': ...
+    def fixedSize(self) -> 'QgsLayoutSize': ...
+    def referencePoint(self) -> 'QgsLayoutItem.ReferencePoint': ...
+    def setReferencePoint(self, point: 'QgsLayoutItem.ReferencePoint') -> None: ...
+    def paint(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], pWidget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def exportLayerDetails(self) -> 'QgsLayoutItem.ExportLayerDetail': ...
+    def nextExportPart(self) -> bool: ...
+    def stopLayeredExport(self) -> None: ...
+    def startLayeredExport(self) -> None: ...
+    @deprecated("""""")
+    def numberExportLayers(self) -> int: ...
+    def exportLayerBehavior(self) -> 'QgsLayoutItem.ExportLayerBehavior': ...
+    def setParentGroup(self, group: typing.Optional['QgsLayoutItemGroup']) -> None: ...
+    def parentGroup(self) -> typing.Optional['QgsLayoutItemGroup']: ...
+    def isGroupMember(self) -> bool: ...
+    def isLocked(self) -> bool: ...
+    def setLocked(self, locked: bool) -> None: ...
+    def setVisibility(self, visible: bool) -> None: ...
+    def setSelected(self, selected: bool) -> None: ...
+    def displayName(self) -> str: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+    def itemFlags(self) -> 'QgsLayoutItem.Flags': ...
+    def uuid(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    def cleanup(self) -> None: ...
+
+
+class QgsLayoutFrame(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout], multiFrame: typing.Optional['QgsLayoutMultiFrame']) -> None: ...
+
+    def readPropertiesFromElement(self, itemElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def drawBackground(self, context: QgsRenderContext) -> None: ...
+    def drawFrame(self, context: QgsRenderContext) -> None: ...
+    def draw(self, context: 'QgsLayoutItemRenderContext') -> None: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def isEmpty(self) -> bool: ...
+    def setHideBackgroundIfEmpty(self, hideBackgroundIfEmpty: bool) -> None: ...
+    def hideBackgroundIfEmpty(self) -> bool: ...
+    def setHidePageIfEmpty(self, hidePageIfEmpty: bool) -> None: ...
+    def hidePageIfEmpty(self) -> bool: ...
+    def extent(self) -> QtCore.QRectF: ...
+    def fixedSize(self) -> 'QgsLayoutSize': ...
+    def minimumSize(self) -> 'QgsLayoutSize': ...
+    def multiFrame(self) -> typing.Optional['QgsLayoutMultiFrame']: ...
+    def setContentSection(self, section: QtCore.QRectF) -> None: ...
+    def cleanup(self) -> None: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutFrame']: ...
+
+
+class QgsLayoutGridSettings(QgsLayoutSerializableObject):
+
+    class Style(int):
+        StyleLines = ... # type: QgsLayoutGridSettings.Style
+        StyleDots = ... # type: QgsLayoutGridSettings.Style
+        StyleCrosses = ... # type: QgsLayoutGridSettings.Style
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutGridSettings') -> None: ...
+
+    def readXml(self, gridElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def loadFromSettings(self) -> None: ...
+    def style(self) -> 'QgsLayoutGridSettings.Style': ...
+    def setStyle(self, style: 'QgsLayoutGridSettings.Style') -> None: ...
+    def pen(self) -> QtGui.QPen: ...
+    def setPen(self, pen: typing.Union[QtGui.QPen, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]]) -> None: ...
+    def offset(self) -> 'QgsLayoutPoint': ...
+    def setOffset(self, offset: 'QgsLayoutPoint') -> None: ...
+    def resolution(self) -> 'QgsLayoutMeasurement': ...
+    def setResolution(self, resolution: 'QgsLayoutMeasurement') -> None: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+
+
+class QgsLayoutGuide(QtCore.QObject):
+
+    def __init__(self, orientation: QtCore.Qt.Orientation, position: 'QgsLayoutMeasurement', page: typing.Optional['QgsLayoutItemPage']) -> None: ...
+
+    positionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setLayoutPosition(self, position: float) -> None: ...
+    def layoutPosition(self) -> float: ...
+    def item(self) -> typing.Optional[QtWidgets.QGraphicsLineItem]: ...
+    def update(self) -> None: ...
+    def setPage(self, page: typing.Optional['QgsLayoutItemPage']) -> None: ...
+    def page(self) -> typing.Optional['QgsLayoutItemPage']: ...
+    def setPosition(self, position: 'QgsLayoutMeasurement') -> None: ...
+    def position(self) -> 'QgsLayoutMeasurement': ...
+    def orientation(self) -> QtCore.Qt.Orientation: ...
+    def setLayout(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+
+
+class QgsLayoutGuideCollection(QtCore.QAbstractTableModel, QgsLayoutSerializableObject):
+
+    class CustomRole(int):
+        Orientation = ... # type: QgsLayoutGuideCollection.CustomRole
+        Position = ... # type: QgsLayoutGuideCollection.CustomRole
+        Units = ... # type: QgsLayoutGuideCollection.CustomRole
+        Page = ... # type: QgsLayoutGuideCollection.CustomRole
+        LayoutPosition = ... # type: QgsLayoutGuideCollection.CustomRole
+
+    def __init__(self, layout: typing.Optional[QgsLayout], pageCollection: typing.Optional['QgsLayoutPageCollection']) -> None: ...
+
+    def readXml(self, collectionElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setVisible(self, visible: bool) -> None: ...
+    def visible(self) -> bool: ...
+    def guidesOnPage(self, page: int) -> list[QgsLayoutGuide]: ...
+    @typing.overload
+    def guides(self) -> list[QgsLayoutGuide]: ...
+    @typing.overload
+    def guides(self, orientation: QtCore.Qt.Orientation, page: int = ...) -> list[QgsLayoutGuide]: ...
+    def update(self) -> None: ...
+    def applyGuidesToAllOtherPages(self, sourcePage: int) -> None: ...
+    def clear(self) -> None: ...
+    def setGuideLayoutPosition(self, guide: typing.Optional[QgsLayoutGuide], position: float) -> None: ...
+    def removeGuide(self, guide: typing.Optional[QgsLayoutGuide]) -> None: ...
+    def addGuide(self, guide: typing.Optional[QgsLayoutGuide]) -> None: ...
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, a0: QtCore.QModelIndex) -> int: ...
+    def rowCount(self, a0: QtCore.QModelIndex) -> int: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+    Roles: typing.Type[QgsLayoutGuideCollection.CustomRole]
+    OrientationRole: QgsLayoutGuideCollection.CustomRole
+    PositionRole: QgsLayoutGuideCollection.CustomRole
+    UnitsRole: QgsLayoutGuideCollection.CustomRole
+    PageRole: QgsLayoutGuideCollection.CustomRole
+    LayoutPositionRole: QgsLayoutGuideCollection.CustomRole
+
+
+class QgsLayoutGuideProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject], orientation: QtCore.Qt.Orientation, page: int) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+    def setPage(self, page: int) -> None: ...
+
+
+class QgsLayoutItemRenderContext(PyQt5.sip.wrapper):
+
+    def __init__(self, context: QgsRenderContext, viewScaleFactor: float = ...) -> None: ...
+
+    def viewScaleFactor(self) -> float: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsLayoutMultiFrame(QgsLayoutObject, QgsLayoutUndoObjectInterface):
+
+    class UndoCommand(int):
+        UndoHtmlBreakDistance = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoHtmlSource = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoHtmlStylesheet = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableCellStyle = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableMaximumFeatures = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableMargin = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableHeaderFontColor = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableContentFontColor = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableGridStrokeWidth = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableGridColor = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoTableBackgroundColor = ... # type: QgsLayoutMultiFrame.UndoCommand
+        UndoNone = ... # type: QgsLayoutMultiFrame.UndoCommand
+
+    class ResizeMode(int):
+        UseExistingFrames = ... # type: QgsLayoutMultiFrame.ResizeMode
+        ExtendToNextPage = ... # type: QgsLayoutMultiFrame.ResizeMode
+        RepeatOnEveryPage = ... # type: QgsLayoutMultiFrame.ResizeMode
+        RepeatUntilFinished = ... # type: QgsLayoutMultiFrame.ResizeMode
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    contentsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def recalculateFrameRects(self) -> None: ...
+    def recalculateFrameSizes(self) -> None: ...
+    def update(self) -> None: ...
+    def refresh(self) -> None: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def cancelCommand(self) -> None: ...
+    def endCommand(self) -> None: ...
+    def beginCommand(self, commandText: typing.Optional[str], command: 'QgsLayoutMultiFrame.UndoCommand' = ...) -> None: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def createCommand(self, text: typing.Optional[str], id: int, parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+    def displayName(self) -> str: ...
+    def createNewFrame(self, currentFrame: typing.Optional[QgsLayoutFrame], pos: typing.Union[QtCore.QPointF, QtCore.QPoint], size: QtCore.QSizeF) -> typing.Optional[QgsLayoutFrame]: ...
+    def frameIndex(self, frame: typing.Optional[QgsLayoutFrame]) -> int: ...
+    def frame(self, index: int) -> typing.Optional[QgsLayoutFrame]: ...
+    def frameCount(self) -> int: ...
+    def frames(self) -> list[QgsLayoutFrame]: ...
+    def readXml(self, itemElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext, includeFrames: bool = ...) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext, includeFrames: bool = ...) -> bool: ...
+    def resizeMode(self) -> 'QgsLayoutMultiFrame.ResizeMode': ...
+    def setResizeMode(self, mode: 'QgsLayoutMultiFrame.ResizeMode') -> None: ...
+    def deleteFrames(self) -> None: ...
+    def removeFrame(self, index: int, removeEmptyPages: bool = ...) -> None: ...
+    def findNearbyPageBreak(self, yPos: float) -> float: ...
+    def addFrame(self, frame: typing.Optional[QgsLayoutFrame], recalcFrameSizes: bool = ...) -> None: ...
+    def render(self, context: QgsLayoutItemRenderContext, renderExtent: QtCore.QRectF, frameIndex: int) -> None: ...
+    def minFrameSize(self, frameIndex: int = ...) -> QtCore.QSizeF: ...
+    def fixedFrameSize(self, frameIndex: int = ...) -> QtCore.QSizeF: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    def totalSize(self) -> QtCore.QSizeF: ...
+    def uuid(self) -> str: ...
+
+
+class QgsLayoutTable(QgsLayoutMultiFrame):
+
+    class CellStyleGroup(int):
+        OddColumns = ... # type: QgsLayoutTable.CellStyleGroup
+        EvenColumns = ... # type: QgsLayoutTable.CellStyleGroup
+        OddRows = ... # type: QgsLayoutTable.CellStyleGroup
+        EvenRows = ... # type: QgsLayoutTable.CellStyleGroup
+        FirstColumn = ... # type: QgsLayoutTable.CellStyleGroup
+        LastColumn = ... # type: QgsLayoutTable.CellStyleGroup
+        HeaderRow = ... # type: QgsLayoutTable.CellStyleGroup
+        FirstRow = ... # type: QgsLayoutTable.CellStyleGroup
+        LastRow = ... # type: QgsLayoutTable.CellStyleGroup
+
+    class WrapBehavior(int):
+        TruncateText = ... # type: QgsLayoutTable.WrapBehavior
+        WrapText = ... # type: QgsLayoutTable.WrapBehavior
+
+    class EmptyTableMode(int):
+        HeadersOnly = ... # type: QgsLayoutTable.EmptyTableMode
+        HideTable = ... # type: QgsLayoutTable.EmptyTableMode
+        ShowMessage = ... # type: QgsLayoutTable.EmptyTableMode
+
+    class HeaderMode(int):
+        FirstFrame = ... # type: QgsLayoutTable.HeaderMode
+        AllFrames = ... # type: QgsLayoutTable.HeaderMode
+        NoHeaders = ... # type: QgsLayoutTable.HeaderMode
+
+    class HeaderHAlignment(int):
+        FollowColumn = ... # type: QgsLayoutTable.HeaderHAlignment
+        HeaderLeft = ... # type: QgsLayoutTable.HeaderHAlignment
+        HeaderCenter = ... # type: QgsLayoutTable.HeaderHAlignment
+        HeaderRight = ... # type: QgsLayoutTable.HeaderHAlignment
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def verticalAlignmentForCell(self, row: int, column: int) -> QtCore.Qt.Alignment: ...
+    def horizontalAlignmentForCell(self, row: int, column: int) -> QtCore.Qt.Alignment: ...
+    def textFormatForHeader(self, column: int) -> 'QgsTextFormat': ...
+    def textFormatForCell(self, row: int, column: int) -> 'QgsTextFormat': ...
+    def contentsContainsRow(self, contents: typing.Any, row: collections.abc.Iterable[typing.Any]) -> bool: ...
+    def recalculateTableSize(self) -> None: ...
+    def drawHorizontalGridLines(self, context: QgsLayoutItemRenderContext, firstRow: int, lastRow: int, drawHeaderLines: bool) -> None: ...
+    def rowRange(self, context: QgsRenderContext, frameIndex: int) -> tuple[int, int]: ...
+    @typing.overload
+    def rowsVisible(self, context: QgsRenderContext, frameHeight: float, firstRow: int, includeHeader: bool, includeEmptyRows: bool) -> int: ...
+    @typing.overload
+    def rowsVisible(self, context: QgsRenderContext, frameIndex: int, firstRow: int, includeEmptyRows: bool) -> int: ...
+    def totalHeight(self) -> float: ...
+    def totalWidth(self) -> float: ...
+    def calculateMaxRowHeights(self) -> bool: ...
+    def calculateMaxColumnWidths(self) -> bool: ...
+    def recalculateFrameSizes(self) -> None: ...
+    def refreshAttributes(self) -> None: ...
+    def refresh(self) -> None: ...
+    def render(self, context: QgsLayoutItemRenderContext, renderExtent: QtCore.QRectF, frameIndex: int) -> None: ...
+    def totalSize(self) -> QtCore.QSizeF: ...
+    def readPropertiesFromElement(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def minFrameSize(self, frameIndex: int = ...) -> QtCore.QSizeF: ...
+    def fixedFrameSize(self, frameIndex: int = ...) -> QtCore.QSizeF: ...
+    def contents(self) -> typing.Any: ...
+    def columnSpan(self, row: int, column: int) -> int: ...
+    def rowSpan(self, row: int, column: int) -> int: ...
+    def scopeForCell(self, row: int, column: int) -> typing.Optional[QgsExpressionContextScope]: ...
+    def conditionalCellStyle(self, row: int, column: int) -> QgsConditionalStyle: ...
+    def getTableContents(self, contents: typing.Any) -> bool: ...
+    def cellStyle(self, group: 'QgsLayoutTable.CellStyleGroup') -> typing.Optional['QgsLayoutTableStyle']: ...
+    def setCellStyle(self, group: 'QgsLayoutTable.CellStyleGroup', style: 'QgsLayoutTableStyle') -> None: ...
+    def setSortColumns(self, sortColumns: collections.abc.Iterable['QgsLayoutTableColumn']) -> None: ...
+    def sortColumns(self) -> list['QgsLayoutTableColumn']: ...
+    def setColumns(self, columns: collections.abc.Iterable['QgsLayoutTableColumn']) -> None: ...
+    def columns(self) -> list['QgsLayoutTableColumn']: ...
+    def wrapBehavior(self) -> 'QgsLayoutTable.WrapBehavior': ...
+    def setWrapBehavior(self, behavior: 'QgsLayoutTable.WrapBehavior') -> None: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def setBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def verticalGrid(self) -> bool: ...
+    def setVerticalGrid(self, verticalGrid: bool) -> None: ...
+    def horizontalGrid(self) -> bool: ...
+    def setHorizontalGrid(self, horizontalGrid: bool) -> None: ...
+    def gridColor(self) -> QtGui.QColor: ...
+    def setGridColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def gridStrokeWidth(self) -> float: ...
+    def setGridStrokeWidth(self, width: float) -> None: ...
+    def showGrid(self) -> bool: ...
+    def setShowGrid(self, showGrid: bool) -> None: ...
+    def contentTextFormat(self) -> 'QgsTextFormat': ...
+    def setContentTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    @deprecated("""""")
+    def contentFontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setContentFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def contentFont(self) -> QtGui.QFont: ...
+    @deprecated("""""")
+    def setContentFont(self, font: QtGui.QFont) -> None: ...
+    def headerMode(self) -> 'QgsLayoutTable.HeaderMode': ...
+    def setHeaderMode(self, mode: 'QgsLayoutTable.HeaderMode') -> None: ...
+    def headerHAlignment(self) -> 'QgsLayoutTable.HeaderHAlignment': ...
+    def setHeaderHAlignment(self, alignment: 'QgsLayoutTable.HeaderHAlignment') -> None: ...
+    def headerTextFormat(self) -> 'QgsTextFormat': ...
+    def setHeaderTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    @deprecated("""""")
+    def headerFontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setHeaderFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def headerFont(self) -> QtGui.QFont: ...
+    @deprecated("""""")
+    def setHeaderFont(self, font: QtGui.QFont) -> None: ...
+    def showEmptyRows(self) -> bool: ...
+    def setShowEmptyRows(self, showEmpty: bool) -> None: ...
+    def emptyTableMessage(self) -> str: ...
+    def setEmptyTableMessage(self, message: typing.Optional[str]) -> None: ...
+    def emptyTableBehavior(self) -> 'QgsLayoutTable.EmptyTableMode': ...
+    def setEmptyTableBehavior(self, mode: 'QgsLayoutTable.EmptyTableMode') -> None: ...
+    def cellMargin(self) -> float: ...
+    def setCellMargin(self, margin: float) -> None: ...
+
+
+class QgsLayoutItemAttributeTable(QgsLayoutTable):
+
+    class ContentSource(int):
+        LayerAttributes = ... # type: QgsLayoutItemAttributeTable.ContentSource
+        AtlasFeature = ... # type: QgsLayoutItemAttributeTable.ContentSource
+        RelationChildren = ... # type: QgsLayoutItemAttributeTable.ContentSource
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setUseConditionalStyling(self, enabled: bool) -> None: ...
+    def useConditionalStyling(self) -> bool: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def scopeForCell(self, row: int, column: int) -> typing.Optional[QgsExpressionContextScope]: ...
+    def textFormatForCell(self, row: int, column: int) -> 'QgsTextFormat': ...
+    def conditionalCellStyle(self, row: int, column: int) -> QgsConditionalStyle: ...
+    def getTableContents(self, contents: typing.Any) -> bool: ...
+    def wrapString(self) -> str: ...
+    def setWrapString(self, wrapString: typing.Optional[str]) -> None: ...
+    def setDisplayedFields(self, fields: collections.abc.Iterable[typing.Optional[str]], refresh: bool = ...) -> None: ...
+    def setFeatureFilter(self, expression: typing.Optional[str]) -> None: ...
+    def featureFilter(self) -> str: ...
+    def setFilterFeatures(self, filter: bool) -> None: ...
+    def filterFeatures(self) -> bool: ...
+    def filterToAtlasFeature(self) -> bool: ...
+    def setFilterToAtlasFeature(self, filterToAtlas: bool) -> None: ...
+    def displayOnlyVisibleFeatures(self) -> bool: ...
+    def setDisplayOnlyVisibleFeatures(self, visibleOnly: bool) -> None: ...
+    def uniqueRowsOnly(self) -> bool: ...
+    def setUniqueRowsOnly(self, uniqueOnly: bool) -> None: ...
+    def maximumNumberOfFeatures(self) -> int: ...
+    def setMaximumNumberOfFeatures(self, features: int) -> None: ...
+    def map(self) -> typing.Optional['QgsLayoutItemMap']: ...
+    def setMap(self, map: typing.Optional['QgsLayoutItemMap']) -> None: ...
+    def resetColumns(self) -> None: ...
+    def relationId(self) -> str: ...
+    def setRelationId(self, id: typing.Optional[str]) -> None: ...
+    def vectorLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setVectorLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def sourceLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def source(self) -> 'QgsLayoutItemAttributeTable.ContentSource': ...
+    def setSource(self, source: 'QgsLayoutItemAttributeTable.ContentSource') -> None: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemAttributeTable']: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemElevationProfile(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    previewRefreshed: typing.ClassVar[QtCore.pyqtSignal]
+    def invalidateCache(self) -> None: ...
+    def refresh(self) -> None: ...
+    def setSubsectionsSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def subsectionsSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setDistanceUnit(self, unit: Qgis.DistanceUnit) -> None: ...
+    def distanceUnit(self) -> Qgis.DistanceUnit: ...
+    def paint(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], pWidget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def profileRequest(self) -> QgsProfileRequest: ...
+    def setAtlasDriven(self, enabled: bool) -> None: ...
+    def atlasDriven(self) -> bool: ...
+    def tolerance(self) -> float: ...
+    def setTolerance(self, tolerance: float) -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def profileCurve(self) -> typing.Optional[QgsCurve]: ...
+    def setProfileCurve(self, curve: typing.Optional[QgsCurve]) -> None: ...
+    def setLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layers(self) -> list[QgsMapLayer]: ...
+    def plot(self) -> typing.Optional['Qgs2DPlot']: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def requiresRasterization(self) -> bool: ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemElevationProfile']: ...
+
+
+class QgsLayoutItemGroup(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, itemElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def rectWithFrame(self) -> QtCore.QRectF: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def paint(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], pWidget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def attemptResize(self, size: 'QgsLayoutSize', includesFrame: bool = ...) -> None: ...
+    def attemptMove(self, point: 'QgsLayoutPoint', useReferencePoint: bool = ..., includesFrame: bool = ..., page: int = ...) -> None: ...
+    def setVisibility(self, visible: bool) -> None: ...
+    def items(self) -> list[QgsLayoutItem]: ...
+    def removeItems(self) -> None: ...
+    def addItem(self, item: typing.Optional[QgsLayoutItem]) -> None: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemGroup']: ...
+    def displayName(self) -> str: ...
+    def type(self) -> int: ...
+    def cleanup(self) -> None: ...
+
+
+class QgsLayoutItemHtml(QgsLayoutMultiFrame):
+
+    class ContentMode(int):
+        Url = ... # type: QgsLayoutItemHtml.ContentMode
+        ManualHtml = ... # type: QgsLayoutItemHtml.ContentMode
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def recalculateFrameSizes(self) -> None: ...
+    def loadHtml(self, useCache: bool = ..., context: typing.Optional[QgsExpressionContext] = ...) -> None: ...
+    def findNearbyPageBreak(self, yPos: float) -> float: ...
+    def render(self, context: QgsLayoutItemRenderContext, renderExtent: QtCore.QRectF, frameIndex: int) -> None: ...
+    def totalSize(self) -> QtCore.QSizeF: ...
+    def displayName(self) -> str: ...
+    def userStylesheetEnabled(self) -> bool: ...
+    def setUserStylesheetEnabled(self, enabled: bool) -> None: ...
+    def userStylesheet(self) -> str: ...
+    def setUserStylesheet(self, stylesheet: typing.Optional[str]) -> None: ...
+    def maxBreakDistance(self) -> float: ...
+    def setMaxBreakDistance(self, distance: float) -> None: ...
+    def setUseSmartBreaks(self, useSmartBreaks: bool) -> None: ...
+    def useSmartBreaks(self) -> bool: ...
+    def setEvaluateExpressions(self, evaluateExpressions: bool) -> None: ...
+    def evaluateExpressions(self) -> bool: ...
+    def html(self) -> str: ...
+    def setHtml(self, html: typing.Optional[str]) -> None: ...
+    def url(self) -> QtCore.QUrl: ...
+    def setUrl(self, url: QtCore.QUrl) -> None: ...
+    def contentMode(self) -> 'QgsLayoutItemHtml.ContentMode': ...
+    def setContentMode(self, mode: 'QgsLayoutItemHtml.ContentMode') -> None: ...
+    @staticmethod
+    def createFromLabel(label: typing.Optional['QgsLayoutItemLabel']) -> typing.Optional['QgsLayoutItemHtml']: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemHtml']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemLabel(QgsLayoutItem):
+
+    class Mode(int):
+        ModeFont = ... # type: QgsLayoutItemLabel.Mode
+        ModeHtml = ... # type: QgsLayoutItemLabel.Mode
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def convertToStaticText(self) -> None: ...
+    def refresh(self) -> None: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setFrameStrokeWidth(self, strokeWidth: 'QgsLayoutMeasurement') -> None: ...
+    def setFrameEnabled(self, drawFrame: bool) -> None: ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    @deprecated("""""")
+    def fontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setMarginY(self, margin: float) -> None: ...
+    def setMarginX(self, margin: float) -> None: ...
+    def setMargin(self, margin: float) -> None: ...
+    def marginY(self) -> float: ...
+    def marginX(self) -> float: ...
+    def setVAlign(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def setHAlign(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def hAlign(self) -> QtCore.Qt.AlignmentFlag: ...
+    def vAlign(self) -> QtCore.Qt.AlignmentFlag: ...
+    @deprecated("""""")
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    @deprecated("""""")
+    def font(self) -> QtGui.QFont: ...
+    def setMode(self, mode: 'QgsLayoutItemLabel.Mode') -> None: ...
+    def mode(self) -> 'QgsLayoutItemLabel.Mode': ...
+    def currentText(self) -> str: ...
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+    def sizeForText(self) -> QtCore.QSizeF: ...
+    @typing.overload
+    def adjustSizeToText(self) -> None: ...
+    @typing.overload
+    def adjustSizeToText(self, referencePoint: QgsLayoutItem.ReferencePoint) -> None: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemLabel']: ...
+
+
+class QgsLegendModel(QgsLayerTreeModel):
+
+    @typing.overload
+    def __init__(self, rootNode: typing.Optional[QgsLayerTree], parent: typing.Optional[QtCore.QObject] = ..., layout: typing.Optional['QgsLayoutItemLegend'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, rootNode: typing.Optional[QgsLayerTree], layout: typing.Optional['QgsLayoutItemLegend']) -> None: ...
+
+    refreshLegend: typing.ClassVar[QtCore.pyqtSignal]
+    def clearCachedData(self, node: typing.Optional[QgsLayerTreeNode]) -> None: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+
+
+class QgsLayoutItemLegend(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def invalidateCache(self) -> None: ...
+    def refresh(self) -> None: ...
+    def isRefreshing(self) -> bool: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def paint(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], pWidget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def legendSettings(self) -> QgsLegendSettings: ...
+    def updateFilterByMap(self, redraw: bool = ...) -> None: ...
+    def updateLegend(self) -> None: ...
+    def themeName(self) -> str: ...
+    def filterByMapItems(self) -> list['QgsLayoutItemMap']: ...
+    def setFilterByMapItems(self, maps: collections.abc.Iterable['QgsLayoutItemMap']) -> None: ...
+    def linkedMap(self) -> typing.Optional['QgsLayoutItemMap']: ...
+    def setLinkedMap(self, map: typing.Optional['QgsLayoutItemMap']) -> None: ...
+    def setAutoWrapLinesAfter(self, length: float) -> None: ...
+    def autoWrapLinesAfter(self) -> float: ...
+    def setRasterStrokeWidth(self, width: float) -> None: ...
+    def rasterStrokeWidth(self) -> float: ...
+    def setRasterStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def rasterStrokeColor(self) -> QtGui.QColor: ...
+    def setDrawRasterStroke(self, enabled: bool) -> None: ...
+    def drawRasterStroke(self) -> bool: ...
+    def setEqualColumnWidth(self, equalize: bool) -> None: ...
+    def equalColumnWidth(self) -> bool: ...
+    def setSplitLayer(self, enabled: bool) -> None: ...
+    def splitLayer(self) -> bool: ...
+    def setColumnCount(self, count: int) -> None: ...
+    def columnCount(self) -> int: ...
+    def wrapString(self) -> str: ...
+    def setWrapString(self, string: typing.Optional[str]) -> None: ...
+    def setWmsLegendHeight(self, height: float) -> None: ...
+    def wmsLegendHeight(self) -> float: ...
+    def setWmsLegendWidth(self, width: float) -> None: ...
+    def wmsLegendWidth(self) -> float: ...
+    def setSymbolHeight(self, height: float) -> None: ...
+    def symbolHeight(self) -> float: ...
+    def symbolAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def setSymbolAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def setMinimumSymbolSize(self, size: float) -> None: ...
+    def minimumSymbolSize(self) -> float: ...
+    def setMaximumSymbolSize(self, size: float) -> None: ...
+    def maximumSymbolSize(self) -> float: ...
+    def setSymbolWidth(self, width: float) -> None: ...
+    def symbolWidth(self) -> float: ...
+    @deprecated("""""")
+    def setFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fontColor(self) -> QtGui.QColor: ...
+    def setColumnSpace(self, spacing: float) -> None: ...
+    def columnSpace(self) -> float: ...
+    def setBoxSpace(self, space: float) -> None: ...
+    def boxSpace(self) -> float: ...
+    @deprecated("""""")
+    def setLineSpacing(self, spacing: float) -> None: ...
+    @deprecated("""""")
+    def lineSpacing(self) -> float: ...
+    @typing.overload
+    def setStyleMargin(self, component: Qgis.LegendComponent, margin: float) -> None: ...
+    @typing.overload
+    def setStyleMargin(self, component: Qgis.LegendComponent, side: QgsLegendStyle.Side, margin: float) -> None: ...
+    @deprecated("""""")
+    def setStyleFont(self, component: Qgis.LegendComponent, font: QtGui.QFont) -> None: ...
+    @deprecated("""""")
+    def styleFont(self, component: Qgis.LegendComponent) -> QtGui.QFont: ...
+    def setStyle(self, component: Qgis.LegendComponent, style: QgsLegendStyle) -> None: ...
+    def style(self, s: Qgis.LegendComponent) -> QgsLegendStyle: ...
+    def rstyle(self, s: Qgis.LegendComponent) -> QgsLegendStyle: ...
+    def setTitleAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def titleAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def title(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def legendFilterOutAtlas(self) -> bool: ...
+    def setLegendFilterOutAtlas(self, doFilter: bool) -> None: ...
+    def legendFilterByMapEnabled(self) -> bool: ...
+    def setLegendFilterByMapEnabled(self, enabled: bool) -> None: ...
+    def autoUpdateModel(self) -> bool: ...
+    def setAutoUpdateModel(self, autoUpdate: bool) -> None: ...
+    def model(self) -> typing.Optional[QgsLegendModel]: ...
+    def resizeToContents(self) -> bool: ...
+    def setResizeToContents(self, enabled: bool) -> None: ...
+    def adjustBoxSize(self) -> None: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def requiresRasterization(self) -> bool: ...
+    def displayName(self) -> str: ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemLegend']: ...
+
+
+class QgsLayoutItemManualTable(QgsLayoutTable):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def columnSpan(self, row: int, column: int) -> int: ...
+    def rowSpan(self, row: int, column: int) -> int: ...
+    def verticalAlignmentForCell(self, row: int, column: int) -> QtCore.Qt.Alignment: ...
+    def horizontalAlignmentForCell(self, row: int, column: int) -> QtCore.Qt.Alignment: ...
+    def textFormatForCell(self, row: int, column: int) -> 'QgsTextFormat': ...
+    def textFormatForHeader(self, column: int) -> 'QgsTextFormat': ...
+    def calculateMaxRowHeights(self) -> bool: ...
+    def readPropertiesFromElement(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setHeaders(self, headers: collections.abc.Iterable['QgsLayoutTableColumn']) -> None: ...
+    def headers(self) -> list['QgsLayoutTableColumn']: ...
+    def setIncludeTableHeader(self, included: bool) -> None: ...
+    def includeTableHeader(self) -> bool: ...
+    def setColumnWidths(self, widths: collections.abc.Iterable[float]) -> None: ...
+    def columnWidths(self) -> list[float]: ...
+    def setRowHeights(self, heights: collections.abc.Iterable[float]) -> None: ...
+    def rowHeights(self) -> list[float]: ...
+    def tableContents(self) -> typing.Any: ...
+    def setTableContents(self, contents: typing.Any) -> None: ...
+    def conditionalCellStyle(self, row: int, column: int) -> QgsConditionalStyle: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemManualTable']: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemMapAtlasClippingSettings(QtCore.QObject):
+
+    def __init__(self, map: typing.Optional['QgsLayoutItemMap'] = ...) -> None: ...
+
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setLayersToClip(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layersToClip(self) -> list[QgsMapLayer]: ...
+    def setRestrictToLayers(self, enabled: bool) -> None: ...
+    def restrictToLayers(self) -> bool: ...
+    def setForceLabelsInsideFeature(self, forceInside: bool) -> None: ...
+    def forceLabelsInsideFeature(self) -> bool: ...
+    def setFeatureClippingType(self, type: QgsMapClippingRegion.FeatureClippingType) -> None: ...
+    def featureClippingType(self) -> QgsMapClippingRegion.FeatureClippingType: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+
+
+class QgsLayoutItemMapItemClipPathSettings(QtCore.QObject):
+
+    def __init__(self, map: typing.Optional['QgsLayoutItemMap'] = ...) -> None: ...
+
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def setForceLabelsInsideClipPath(self, forceInside: bool) -> None: ...
+    def forceLabelsInsideClipPath(self) -> bool: ...
+    def setFeatureClippingType(self, type: QgsMapClippingRegion.FeatureClippingType) -> None: ...
+    def featureClippingType(self) -> QgsMapClippingRegion.FeatureClippingType: ...
+    def sourceItem(self) -> typing.Optional[QgsLayoutItem]: ...
+    def setSourceItem(self, item: typing.Optional[QgsLayoutItem]) -> None: ...
+    def toMapClippingRegion(self) -> QgsMapClippingRegion: ...
+    def clipPathInMapItemCoordinates(self) -> QgsGeometry: ...
+    def clippedMapExtent(self) -> QgsGeometry: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def isActive(self) -> bool: ...
+
+
+class QgsLayoutItemMap(QgsLayoutItem, QgsTemporalRangeObject):
+
+    class MapItemFlag(int):
+        ShowPartialLabels = ... # type: QgsLayoutItemMap.MapItemFlag
+        ShowUnplacedLabels = ... # type: QgsLayoutItemMap.MapItemFlag
+
+    class AtlasScalingMode(int):
+        Fixed = ... # type: QgsLayoutItemMap.AtlasScalingMode
+        Predefined = ... # type: QgsLayoutItemMap.AtlasScalingMode
+        Auto = ... # type: QgsLayoutItemMap.AtlasScalingMode
+
+    class MapItemFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __xor__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __ior__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __or__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __iand__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __and__(self, f: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __invert__(self) -> 'QgsLayoutItemMap.MapItemFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def updateBoundingRect(self) -> None: ...
+    def invalidateCache(self) -> None: ...
+    def refresh(self) -> None: ...
+    previewRefreshed: typing.ClassVar[QtCore.pyqtSignal]
+    crsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    themeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    layerStyleOverridesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    preparedForAtlas: typing.ClassVar[QtCore.pyqtSignal]
+    mapRotationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    extentChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def requestedExtent(self) -> QgsRectangle: ...
+    def mapToItemCoords(self, mapCoords: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> QtCore.QPointF: ...
+    def transformedMapPolygon(self) -> QtGui.QPolygonF: ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    def isDrawing(self) -> bool: ...
+    def framePath(self) -> QtGui.QPainterPath: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def estimatedFrameBleed(self) -> float: ...
+    def setZRange(self, range: QgsDoubleRange) -> None: ...
+    def zRange(self) -> QgsDoubleRange: ...
+    def zRangeEnabled(self) -> bool: ...
+    def setZRangeEnabled(self, enabled: bool) -> None: ...
+    def itemClippingSettings(self) -> typing.Optional[QgsLayoutItemMapItemClipPathSettings]: ...
+    def atlasClippingSettings(self) -> typing.Optional[QgsLayoutItemMapAtlasClippingSettings]: ...
+    def layoutToMapCoordsTransform(self) -> QtGui.QTransform: ...
+    def removeRenderedFeatureHandler(self, handler: typing.Optional[QgsRenderedFeatureHandlerInterface]) -> None: ...
+    def addRenderedFeatureHandler(self, handler: typing.Optional[QgsRenderedFeatureHandlerInterface]) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def previewLabelingResults(self) -> typing.Optional[QgsLabelingResults]: ...
+    def renderingErrors(self) -> list['QgsMapRendererJob.Error']: ...
+    def isLabelBlockingItem(self, item: typing.Optional[QgsLayoutItem]) -> bool: ...
+    def removeLabelBlockingItem(self, item: typing.Optional[QgsLayoutItem]) -> None: ...
+    def addLabelBlockingItem(self, item: typing.Optional[QgsLayoutItem]) -> None: ...
+    def layersToRender(self, context: typing.Optional[QgsExpressionContext] = ...) -> list[QgsMapLayer]: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def mapSettings(self, extent: QgsRectangle, size: QtCore.QSizeF, dpi: float, includeLayerSettings: bool) -> QgsMapSettings: ...
+    def mapUnitsToLayoutUnits(self) -> float: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def setLabelMargin(self, margin: 'QgsLayoutMeasurement') -> None: ...
+    def labelMargin(self) -> 'QgsLayoutMeasurement': ...
+    def overview(self) -> typing.Optional['QgsLayoutItemMapOverview']: ...
+    def overviews(self) -> typing.Optional['QgsLayoutItemMapOverviewStack']: ...
+    def grid(self) -> typing.Optional['QgsLayoutItemMapGrid']: ...
+    def grids(self) -> typing.Optional['QgsLayoutItemMapGridStack']: ...
+    def setAtlasMargin(self, margin: float) -> None: ...
+    def atlasMargin(self, valueType: QgsLayoutObject.PropertyValueType = ...) -> float: ...
+    def setAtlasScalingMode(self, mode: 'QgsLayoutItemMap.AtlasScalingMode') -> None: ...
+    def atlasScalingMode(self) -> 'QgsLayoutItemMap.AtlasScalingMode': ...
+    def setAtlasDriven(self, enabled: bool) -> None: ...
+    def atlasDriven(self) -> bool: ...
+    def drawAnnotations(self) -> bool: ...
+    def setDrawAnnotations(self, draw: bool) -> None: ...
+    def mapRotation(self, valueType: QgsLayoutObject.PropertyValueType = ...) -> float: ...
+    def setMapRotation(self, rotation: float) -> None: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def requiresRasterization(self) -> bool: ...
+    def containsWmsLayer(self) -> bool: ...
+    def zoomContent(self, factor: float, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setMoveContentPreviewOffset(self, dx: float, dy: float) -> None: ...
+    def moveContent(self, dx: float, dy: float) -> None: ...
+    def setFollowVisibilityPresetName(self, name: typing.Optional[str]) -> None: ...
+    def followVisibilityPresetName(self) -> str: ...
+    def setFollowVisibilityPreset(self, follow: bool) -> None: ...
+    def followVisibilityPreset(self) -> bool: ...
+    def storeCurrentLayerStyles(self) -> None: ...
+    def setLayerStyleOverrides(self, overrides: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def layerStyleOverrides(self) -> dict[str, str]: ...
+    def setKeepLayerStyles(self, enabled: bool) -> None: ...
+    def keepLayerStyles(self) -> bool: ...
+    def setLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layers(self) -> list[QgsMapLayer]: ...
+    def setKeepLayerSet(self, enabled: bool) -> None: ...
+    def keepLayerSet(self) -> bool: ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def presetCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def visibleExtentPolygon(self) -> QtGui.QPolygonF: ...
+    def extent(self) -> QgsRectangle: ...
+    def zoomToExtent(self, extent: QgsRectangle) -> None: ...
+    def setExtent(self, extent: QgsRectangle) -> None: ...
+    def setScale(self, scale: float, forceUpdate: bool = ...) -> None: ...
+    def scale(self) -> float: ...
+    def setFrameStrokeWidth(self, width: 'QgsLayoutMeasurement') -> None: ...
+    def exportLayerDetails(self) -> QgsLayoutItem.ExportLayerDetail: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def nextExportPart(self) -> bool: ...
+    def stopLayeredExport(self) -> None: ...
+    def startLayeredExport(self) -> None: ...
+    @deprecated("""""")
+    def numberExportLayers(self) -> int: ...
+    def paint(self, painter: typing.Optional[QtGui.QPainter], itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], pWidget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemMap']: ...
+    def displayName(self) -> str: ...
+    def assignFreeId(self) -> None: ...
+    def setMapFlags(self, flags: typing.Union['QgsLayoutItemMap.MapItemFlags', 'QgsLayoutItemMap.MapItemFlag']) -> None: ...
+    def mapFlags(self) -> 'QgsLayoutItemMap.MapItemFlags': ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemMapItemStack(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutItemMapItemStack') -> None: ...
+
+    def removeItems(self) -> None: ...
+    def asList(self) -> list['QgsLayoutItemMapItem']: ...
+    def moveItemDown(self, itemId: typing.Optional[str]) -> None: ...
+    def moveItemUp(self, itemId: typing.Optional[str]) -> None: ...
+    def removeItem(self, itemId: typing.Optional[str]) -> None: ...
+    def addItem(self, item: typing.Optional['QgsLayoutItemMapItem']) -> None: ...
+    @typing.overload
+    def item(self, index: int) -> typing.Optional['QgsLayoutItemMapItem']: ...
+    @typing.overload
+    def item(self, itemId: typing.Optional[str]) -> typing.Optional['QgsLayoutItemMapItem']: ...
+    def hasEnabledItems(self) -> bool: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    def drawItems(self, painter: typing.Optional[QtGui.QPainter], ignoreStacking: bool = ...) -> None: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def size(self) -> int: ...
+
+
+class QgsLayoutItemMapGridStack(QgsLayoutItemMapItemStack):
+
+    @typing.overload
+    def __init__(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutItemMapGridStack') -> None: ...
+
+    def calculateMaxGridExtension(self) -> typing.Tuple[float, float, float, float]: ...
+    def maxGridExtension(self) -> float: ...
+    def readXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def asList(self) -> list['QgsLayoutItemMapGrid']: ...
+    def __getitem__(self, index: int) -> 'QgsLayoutItemMapGrid': ...
+    @typing.overload
+    def grid(self, gridId: typing.Optional[str]) -> typing.Optional['QgsLayoutItemMapGrid']: ...
+    @typing.overload
+    def grid(self, index: int) -> typing.Optional['QgsLayoutItemMapGrid']: ...
+    def moveGridDown(self, gridId: typing.Optional[str]) -> None: ...
+    def moveGridUp(self, gridId: typing.Optional[str]) -> None: ...
+    def removeGrid(self, gridId: typing.Optional[str]) -> None: ...
+    def addGrid(self, grid: typing.Optional['QgsLayoutItemMapGrid']) -> None: ...
+
+
+class QgsLayoutItemMapItem(QgsLayoutObject):
+
+    class StackingPosition(int):
+        StackBelowMap = ... # type: QgsLayoutItemMapItem.StackingPosition
+        StackBelowMapLayer = ... # type: QgsLayoutItemMapItem.StackingPosition
+        StackAboveMapLayer = ... # type: QgsLayoutItemMapItem.StackingPosition
+        StackBelowMapLabels = ... # type: QgsLayoutItemMapItem.StackingPosition
+        StackAboveMapLabels = ... # type: QgsLayoutItemMapItem.StackingPosition
+
+    def __init__(self, name: typing.Optional[str], map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def mapLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def setStackingLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def stackingLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def setStackingPosition(self, position: 'QgsLayoutItemMapItem.StackingPosition') -> None: ...
+    def stackingPosition(self) -> 'QgsLayoutItemMapItem.StackingPosition': ...
+    def usesAdvancedEffects(self) -> bool: ...
+    def enabled(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def name(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+    def map(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+
+
+class QgsLayoutItemMapGrid(QgsLayoutItemMapItem):
+
+    class AnnotationCoordinate(int):
+        Longitude = ... # type: QgsLayoutItemMapGrid.AnnotationCoordinate
+        Latitude = ... # type: QgsLayoutItemMapGrid.AnnotationCoordinate
+
+    class FrameSideFlag(int):
+        FrameLeft = ... # type: QgsLayoutItemMapGrid.FrameSideFlag
+        FrameRight = ... # type: QgsLayoutItemMapGrid.FrameSideFlag
+        FrameTop = ... # type: QgsLayoutItemMapGrid.FrameSideFlag
+        FrameBottom = ... # type: QgsLayoutItemMapGrid.FrameSideFlag
+
+    class TickLengthMode(int):
+        OrthogonalTicks = ... # type: QgsLayoutItemMapGrid.TickLengthMode
+        NormalizedTicks = ... # type: QgsLayoutItemMapGrid.TickLengthMode
+
+    class FrameStyle(int):
+        NoFrame = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        Zebra = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        InteriorTicks = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        ExteriorTicks = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        InteriorExteriorTicks = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        LineBorder = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        LineBorderNautical = ... # type: QgsLayoutItemMapGrid.FrameStyle
+        ZebraNautical = ... # type: QgsLayoutItemMapGrid.FrameStyle
+
+    class BorderSide(int):
+        Left = ... # type: QgsLayoutItemMapGrid.BorderSide
+        Right = ... # type: QgsLayoutItemMapGrid.BorderSide
+        Bottom = ... # type: QgsLayoutItemMapGrid.BorderSide
+        Top = ... # type: QgsLayoutItemMapGrid.BorderSide
+
+    class AnnotationFormat(int):
+        Decimal = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinute = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinuteSecond = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DecimalWithSuffix = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinuteNoSuffix = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinutePadded = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinuteSecondNoSuffix = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        DegreeMinuteSecondPadded = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+        CustomFormat = ... # type: QgsLayoutItemMapGrid.AnnotationFormat
+
+    class AnnotationDirection(int):
+        Horizontal = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        Vertical = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        VerticalDescending = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        BoundaryDirection = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        AboveTick = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        OnTick = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+        UnderTick = ... # type: QgsLayoutItemMapGrid.AnnotationDirection
+
+    class AnnotationPosition(int):
+        InsideMapFrame = ... # type: QgsLayoutItemMapGrid.AnnotationPosition
+        OutsideMapFrame = ... # type: QgsLayoutItemMapGrid.AnnotationPosition
+
+    class DisplayMode(int):
+        ShowAll = ... # type: QgsLayoutItemMapGrid.DisplayMode
+        LatitudeOnly = ... # type: QgsLayoutItemMapGrid.DisplayMode
+        LongitudeOnly = ... # type: QgsLayoutItemMapGrid.DisplayMode
+        HideAll = ... # type: QgsLayoutItemMapGrid.DisplayMode
+
+    class GridStyle(int):
+        Solid = ... # type: QgsLayoutItemMapGrid.GridStyle
+        Cross = ... # type: QgsLayoutItemMapGrid.GridStyle
+        Markers = ... # type: QgsLayoutItemMapGrid.GridStyle
+        FrameAnnotationsOnly = ... # type: QgsLayoutItemMapGrid.GridStyle
+
+    class GridUnit(int):
+        MapUnit = ... # type: QgsLayoutItemMapGrid.GridUnit
+        MM = ... # type: QgsLayoutItemMapGrid.GridUnit
+        CM = ... # type: QgsLayoutItemMapGrid.GridUnit
+        DynamicPageSizeBased = ... # type: QgsLayoutItemMapGrid.GridUnit
+
+    class FrameSideFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __xor__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __ior__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __or__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __iand__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __and__(self, f: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __invert__(self) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, name: typing.Optional[str], map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+
+    crsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def copyProperties(self, other: typing.Optional['QgsLayoutItemMapGrid']) -> None: ...
+    def refresh(self) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def frameFillColor2(self) -> QtGui.QColor: ...
+    def setFrameFillColor2(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def frameFillColor1(self) -> QtGui.QColor: ...
+    def setFrameFillColor1(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def framePenColor(self) -> QtGui.QColor: ...
+    def setFramePenColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def framePenSize(self) -> float: ...
+    def setFramePenSize(self, width: float) -> None: ...
+    def frameMargin(self) -> float: ...
+    def setFrameMargin(self, margin: float) -> None: ...
+    def rotatedAnnotationsMarginToCorner(self) -> float: ...
+    def setRotatedAnnotationsMarginToCorner(self, margin: float) -> None: ...
+    def rotatedAnnotationsMinimumAngle(self) -> float: ...
+    def setRotatedAnnotationsMinimumAngle(self, angle: float) -> None: ...
+    def rotatedAnnotationsLengthMode(self) -> 'QgsLayoutItemMapGrid.TickLengthMode': ...
+    def setRotatedAnnotationsLengthMode(self, mode: 'QgsLayoutItemMapGrid.TickLengthMode') -> None: ...
+    def rotatedAnnotationsEnabled(self) -> bool: ...
+    def setRotatedAnnotationsEnabled(self, state: bool) -> None: ...
+    def rotatedTicksMarginToCorner(self) -> float: ...
+    def setRotatedTicksMarginToCorner(self, margin: float) -> None: ...
+    def rotatedTicksMinimumAngle(self) -> float: ...
+    def setRotatedTicksMinimumAngle(self, angle: float) -> None: ...
+    def rotatedTicksLengthMode(self) -> 'QgsLayoutItemMapGrid.TickLengthMode': ...
+    def setRotatedTicksLengthMode(self, mode: 'QgsLayoutItemMapGrid.TickLengthMode') -> None: ...
+    def rotatedTicksEnabled(self) -> bool: ...
+    def setRotatedTicksEnabled(self, state: bool) -> None: ...
+    def frameWidth(self) -> float: ...
+    def setFrameWidth(self, width: float) -> None: ...
+    def testFrameSideFlag(self, flag: 'QgsLayoutItemMapGrid.FrameSideFlag') -> bool: ...
+    def frameSideFlags(self) -> 'QgsLayoutItemMapGrid.FrameSideFlags': ...
+    def setFrameSideFlag(self, flag: 'QgsLayoutItemMapGrid.FrameSideFlag', on: bool = ...) -> None: ...
+    def setFrameSideFlags(self, flags: typing.Union['QgsLayoutItemMapGrid.FrameSideFlags', 'QgsLayoutItemMapGrid.FrameSideFlag']) -> None: ...
+    def frameDivisions(self, side: 'QgsLayoutItemMapGrid.BorderSide') -> 'QgsLayoutItemMapGrid.DisplayMode': ...
+    def setFrameDivisions(self, divisions: 'QgsLayoutItemMapGrid.DisplayMode', side: 'QgsLayoutItemMapGrid.BorderSide') -> None: ...
+    def frameStyle(self) -> 'QgsLayoutItemMapGrid.FrameStyle': ...
+    def setFrameStyle(self, style: 'QgsLayoutItemMapGrid.FrameStyle') -> None: ...
+    def annotationExpression(self) -> str: ...
+    def setAnnotationExpression(self, expression: typing.Optional[str]) -> None: ...
+    def annotationFormat(self) -> 'QgsLayoutItemMapGrid.AnnotationFormat': ...
+    def setAnnotationFormat(self, format: 'QgsLayoutItemMapGrid.AnnotationFormat') -> None: ...
+    def annotationDirection(self, border: 'QgsLayoutItemMapGrid.BorderSide') -> 'QgsLayoutItemMapGrid.AnnotationDirection': ...
+    @typing.overload
+    def setAnnotationDirection(self, direction: 'QgsLayoutItemMapGrid.AnnotationDirection', side: 'QgsLayoutItemMapGrid.BorderSide') -> None: ...
+    @typing.overload
+    def setAnnotationDirection(self, direction: 'QgsLayoutItemMapGrid.AnnotationDirection') -> None: ...
+    def annotationFrameDistance(self) -> float: ...
+    def setAnnotationFrameDistance(self, distance: float) -> None: ...
+    def annotationPosition(self, side: 'QgsLayoutItemMapGrid.BorderSide') -> 'QgsLayoutItemMapGrid.AnnotationPosition': ...
+    def setAnnotationPosition(self, position: 'QgsLayoutItemMapGrid.AnnotationPosition', side: 'QgsLayoutItemMapGrid.BorderSide') -> None: ...
+    def annotationDisplay(self, border: 'QgsLayoutItemMapGrid.BorderSide') -> 'QgsLayoutItemMapGrid.DisplayMode': ...
+    def setAnnotationDisplay(self, display: 'QgsLayoutItemMapGrid.DisplayMode', border: 'QgsLayoutItemMapGrid.BorderSide') -> None: ...
+    def annotationPrecision(self) -> int: ...
+    def setAnnotationPrecision(self, precision: int) -> None: ...
+    @deprecated("""""")
+    def annotationFontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setAnnotationFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def annotationFont(self) -> QtGui.QFont: ...
+    @deprecated("""""")
+    def setAnnotationFont(self, font: QtGui.QFont) -> None: ...
+    def annotationTextFormat(self) -> 'QgsTextFormat': ...
+    def setAnnotationTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def annotationEnabled(self) -> bool: ...
+    def setAnnotationEnabled(self, enabled: bool) -> None: ...
+    def markerSymbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setMarkerSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def lineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def setGridLineColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setGridLineWidth(self, width: float) -> None: ...
+    def crossLength(self) -> float: ...
+    def setCrossLength(self, length: float) -> None: ...
+    def style(self) -> 'QgsLayoutItemMapGrid.GridStyle': ...
+    def setStyle(self, style: 'QgsLayoutItemMapGrid.GridStyle') -> None: ...
+    def setMaximumIntervalWidth(self, width: float) -> None: ...
+    def maximumIntervalWidth(self) -> float: ...
+    def setMinimumIntervalWidth(self, width: float) -> None: ...
+    def minimumIntervalWidth(self) -> float: ...
+    def offsetY(self) -> float: ...
+    def setOffsetY(self, offset: float) -> None: ...
+    def offsetX(self) -> float: ...
+    def setOffsetX(self, offset: float) -> None: ...
+    def intervalY(self) -> float: ...
+    def setIntervalY(self, interval: float) -> None: ...
+    def intervalX(self) -> float: ...
+    def setIntervalX(self, interval: float) -> None: ...
+    def units(self) -> 'QgsLayoutItemMapGrid.GridUnit': ...
+    def setUnits(self, unit: 'QgsLayoutItemMapGrid.GridUnit') -> None: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def calculateMaxExtension(self) -> typing.Tuple[float, float, float, float]: ...
+    def maxExtension(self) -> float: ...
+    def usesAdvancedEffects(self) -> bool: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def readXml(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+
+
+class QgsLayoutItemMapOverviewStack(QgsLayoutItemMapItemStack):
+
+    @typing.overload
+    def __init__(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutItemMapOverviewStack') -> None: ...
+
+    def modifyMapLayerList(self, layers: collections.abc.Iterable[QgsMapLayer]) -> list[QgsMapLayer]: ...
+    def readXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def asList(self) -> list['QgsLayoutItemMapOverview']: ...
+    def __getitem__(self, index: int) -> 'QgsLayoutItemMapOverview': ...
+    @typing.overload
+    def overview(self, overviewId: typing.Optional[str]) -> typing.Optional['QgsLayoutItemMapOverview']: ...
+    @typing.overload
+    def overview(self, index: int) -> typing.Optional['QgsLayoutItemMapOverview']: ...
+    def moveOverviewDown(self, overviewId: typing.Optional[str]) -> None: ...
+    def moveOverviewUp(self, overviewId: typing.Optional[str]) -> None: ...
+    def removeOverview(self, overviewId: typing.Optional[str]) -> None: ...
+    def addOverview(self, overview: typing.Optional['QgsLayoutItemMapOverview']) -> None: ...
+
+
+class QgsLayoutItemMapOverview(QgsLayoutItemMapItem):
+
+    def __init__(self, name: typing.Optional[str], map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+
+    def overviewExtentChanged(self) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def mapLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def asMapLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def connectSignals(self) -> None: ...
+    def setCentered(self, centered: bool) -> None: ...
+    def centered(self) -> bool: ...
+    def setInverted(self, inverted: bool) -> None: ...
+    def inverted(self) -> bool: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def frameSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setFrameSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def linkedMap(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setLinkedMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def usesAdvancedEffects(self) -> bool: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readXml(self, itemElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, elem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+
+
+class QgsLayoutItemMarker(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def finalizeRestoreFromXml(self) -> None: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def fixedSize(self) -> 'QgsLayoutSize': ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    def setNorthOffset(self, offset: float) -> None: ...
+    def northOffset(self) -> float: ...
+    def setNorthMode(self, mode: 'QgsLayoutNorthArrowHandler.NorthMode') -> None: ...
+    def northMode(self) -> 'QgsLayoutNorthArrowHandler.NorthMode': ...
+    def northArrowRotation(self) -> float: ...
+    def linkedMap(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setLinkedMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def symbol(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def setSymbol(self, symbol: typing.Optional['QgsMarkerSymbol']) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemMarker']: ...
+
+
+class QgsLayoutNodesItem(QgsLayoutItem):
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, polygon: QtGui.QPolygonF, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def updateBoundingRect(self) -> None: ...
+    def updateSceneRect(self) -> None: ...
+    def computeDistance(self, pt1: typing.Union[QtCore.QPointF, QtCore.QPoint], pt2: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> float: ...
+    def rescaleToFitBoundingBox(self) -> None: ...
+    def _writeXmlStyle(self, doc: QtXml.QDomDocument, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _readXmlStyle(self, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _draw(self, context: QgsLayoutItemRenderContext, itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem] = ...) -> None: ...
+    def _removeNode(self, nodeIndex: int) -> bool: ...
+    def _addNode(self, nodeIndex: int, newNode: typing.Union[QtCore.QPointF, QtCore.QPoint], radius: float) -> bool: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def isValid(self) -> bool: ...
+    def estimatedFrameBleed(self) -> float: ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    def deselectNode(self) -> None: ...
+    def selectedNode(self) -> int: ...
+    def setSelectedNode(self, index: int) -> bool: ...
+    def nodesSize(self) -> int: ...
+    def removeNode(self, index: int) -> bool: ...
+    def nodePosition(self, index: int, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> bool: ...
+    def nodeAtPosition(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], searchInRadius: bool = ..., radius: float = ...) -> int: ...
+    def moveNode(self, index: int, node: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> bool: ...
+    def setDisplayNodes(self, display: bool = ...) -> None: ...
+    def addNode(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], checkArea: bool = ..., radius: float = ...) -> bool: ...
+    def nodes(self) -> QtGui.QPolygonF: ...
+    def setNodes(self, nodes: QtGui.QPolygonF) -> None: ...
+
+
+class QgsLayoutItemPage(QgsLayoutItem):
+
+    class UndoCommand(int):
+        UndoPageSymbol = ... # type: QgsLayoutItemPage.UndoCommand
+
+    class Orientation(int):
+        Portrait = ... # type: QgsLayoutItemPage.Orientation
+        Landscape = ... # type: QgsLayoutItemPage.Orientation
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, itemElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def drawBackground(self, context: QgsRenderContext) -> None: ...
+    def drawFrame(self, context: QgsRenderContext) -> None: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def redraw(self) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def createCommand(self, text: typing.Optional[str], id: int, parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> typing.Optional['QgsAbstractLayoutUndoCommand']: ...
+    def attemptResize(self, size: 'QgsLayoutSize', includesFrame: bool = ...) -> None: ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    @staticmethod
+    def decodePageOrientation(string: typing.Optional[str]) -> typing.Tuple['QgsLayoutItemPage.Orientation', typing.Optional[bool]]: ...
+    def pageStyleSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setPageStyleSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def orientation(self) -> 'QgsLayoutItemPage.Orientation': ...
+    def pageSize(self) -> 'QgsLayoutSize': ...
+    def pageLayout(self) -> QtGui.QPageLayout: ...
+    @typing.overload
+    def setPageSize(self, size: 'QgsLayoutSize') -> None: ...
+    @typing.overload
+    def setPageSize(self, size: typing.Optional[str], orientation: 'QgsLayoutItemPage.Orientation' = ...) -> bool: ...
+    def displayName(self) -> str: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemPage']: ...
+
+
+class QgsLayoutItemPicture(QgsLayoutItem):
+
+    class NorthMode(int):
+        GridNorth = ... # type: QgsLayoutItemPicture.NorthMode
+        TrueNorth = ... # type: QgsLayoutItemPicture.NorthMode
+
+    class ResizeMode(int):
+        Zoom = ... # type: QgsLayoutItemPicture.ResizeMode
+        Stretch = ... # type: QgsLayoutItemPicture.ResizeMode
+        Clip = ... # type: QgsLayoutItemPicture.ResizeMode
+        ZoomResizeFrame = ... # type: QgsLayoutItemPicture.ResizeMode
+        FrameToImageSize = ... # type: QgsLayoutItemPicture.ResizeMode
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def applyItemSizeConstraint(self, targetSize: QtCore.QSizeF) -> QtCore.QSizeF: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    pictureRotationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def recalculateSize(self) -> None: ...
+    def refreshPicture(self, context: typing.Optional[QgsExpressionContext] = ...) -> None: ...
+    def setResizeMode(self, mode: 'QgsLayoutItemPicture.ResizeMode') -> None: ...
+    def setPictureRotation(self, rotation: float) -> None: ...
+    def setSvgDynamicParameters(self, parameters: dict[typing.Optional[str], QgsProperty]) -> None: ...
+    def svgDynamicParameters(self) -> dict[str, QgsProperty]: ...
+    def evaluatedPath(self) -> str: ...
+    def isMissingImage(self) -> bool: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def setMode(self, mode: Qgis.PictureFormat) -> None: ...
+    def originalMode(self) -> Qgis.PictureFormat: ...
+    def mode(self) -> Qgis.PictureFormat: ...
+    def setSvgStrokeWidth(self, width: float) -> None: ...
+    def svgStrokeWidth(self) -> float: ...
+    def setSvgStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def svgStrokeColor(self) -> QtGui.QColor: ...
+    def setSvgFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def svgFillColor(self) -> QtGui.QColor: ...
+    def pictureAnchor(self) -> QgsLayoutItem.ReferencePoint: ...
+    def setPictureAnchor(self, anchor: QgsLayoutItem.ReferencePoint) -> None: ...
+    def resizeMode(self) -> 'QgsLayoutItemPicture.ResizeMode': ...
+    def setNorthOffset(self, offset: float) -> None: ...
+    def northOffset(self) -> float: ...
+    def setNorthMode(self, mode: 'QgsLayoutItemPicture.NorthMode') -> None: ...
+    def northMode(self) -> 'QgsLayoutItemPicture.NorthMode': ...
+    def linkedMap(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setLinkedMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def pictureRotation(self) -> float: ...
+    def picturePath(self) -> str: ...
+    def setPicturePath(self, path: typing.Optional[str], format: Qgis.PictureFormat = ...) -> None: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemPicture']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    Format: typing.Type[Qgis.PictureFormat]
+    FormatSVG: Qgis.PictureFormat
+    FormatRaster: Qgis.PictureFormat
+    FormatUnknown: Qgis.PictureFormat
+
+
+class QgsLayoutItemPolygon(QgsLayoutNodesItem):
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, polygon: QtGui.QPolygonF, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def _writeXmlStyle(self, doc: QtXml.QDomDocument, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _readXmlStyle(self, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _draw(self, context: QgsLayoutItemRenderContext, itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem] = ...) -> None: ...
+    def _removeNode(self, nodeIndex: int) -> bool: ...
+    def _addNode(self, indexPoint: int, newPoint: typing.Union[QtCore.QPointF, QtCore.QPoint], radius: float) -> bool: ...
+    def setSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def isValid(self) -> bool: ...
+    def clipPath(self) -> QgsGeometry: ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemPolygon']: ...
+
+
+class QgsLayoutItemPolyline(QgsLayoutNodesItem):
+
+    class MarkerMode(int):
+        NoMarker = ... # type: QgsLayoutItemPolyline.MarkerMode
+        ArrowHead = ... # type: QgsLayoutItemPolyline.MarkerMode
+        SvgMarker = ... # type: QgsLayoutItemPolyline.MarkerMode
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, polyline: QtGui.QPolygonF, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def updateBoundingRect(self) -> None: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def _writeXmlStyle(self, doc: QtXml.QDomDocument, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _readXmlStyle(self, elmt: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def _draw(self, context: QgsLayoutItemRenderContext, itemStyle: typing.Optional[QtWidgets.QStyleOptionGraphicsItem] = ...) -> None: ...
+    def _removeNode(self, nodeIndex: int) -> bool: ...
+    def _addNode(self, indexPoint: int, newPoint: typing.Union[QtCore.QPointF, QtCore.QPoint], radius: float) -> bool: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def arrowHeadStrokeWidth(self) -> float: ...
+    def setArrowHeadStrokeWidth(self, width: float) -> None: ...
+    def setArrowHeadFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def arrowHeadFillColor(self) -> QtGui.QColor: ...
+    def setArrowHeadStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def arrowHeadStrokeColor(self) -> QtGui.QColor: ...
+    def endSvgMarkerPath(self) -> str: ...
+    def setEndSvgMarkerPath(self, path: typing.Optional[str]) -> None: ...
+    def startSvgMarkerPath(self) -> str: ...
+    def setStartSvgMarkerPath(self, path: typing.Optional[str]) -> None: ...
+    def arrowHeadWidth(self) -> float: ...
+    def setArrowHeadWidth(self, width: float) -> None: ...
+    def setEndMarker(self, mode: 'QgsLayoutItemPolyline.MarkerMode') -> None: ...
+    def endMarker(self) -> 'QgsLayoutItemPolyline.MarkerMode': ...
+    def setStartMarker(self, mode: 'QgsLayoutItemPolyline.MarkerMode') -> None: ...
+    def startMarker(self) -> 'QgsLayoutItemPolyline.MarkerMode': ...
+    def setSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def symbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def isValid(self) -> bool: ...
+    def shape(self) -> QtGui.QPainterPath: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemPolyline']: ...
+
+
+class QgsLayoutItemAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: int, visibleName: typing.Optional[str], visiblePluralName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutItemAbstractMetadata') -> None: ...
+
+    def resolvePaths(self, properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createItem(self, layout: typing.Optional[QgsLayout]) -> typing.Optional[QgsLayoutItem]: ...
+    def visiblePluralName(self) -> str: ...
+    def visibleName(self) -> str: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutMultiFrameAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: int, visibleName: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutMultiFrameAbstractMetadata') -> None: ...
+
+    def resolvePaths(self, properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createMultiFrame(self, layout: typing.Optional[QgsLayout]) -> typing.Optional[QgsLayoutMultiFrame]: ...
+    def visibleName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemRegistry(QtCore.QObject):
+
+    class ItemType(int):
+        LayoutItem = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutGroup = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutPage = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutMap = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutPicture = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutLabel = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutLegend = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutShape = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutPolygon = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutPolyline = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutScaleBar = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutFrame = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutHtml = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutAttributeTable = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutTextTable = ... # type: QgsLayoutItemRegistry.ItemType
+        Layout3DMap = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutManualTable = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutMarker = ... # type: QgsLayoutItemRegistry.ItemType
+        LayoutElevationProfile = ... # type: QgsLayoutItemRegistry.ItemType
+        PluginItem = ... # type: QgsLayoutItemRegistry.ItemType
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    multiFrameTypeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    typeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def itemTypes(self) -> dict[int, str]: ...
+    def resolvePaths(self, type: int, properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createMultiFrame(self, type: int, layout: typing.Optional[QgsLayout]) -> typing.Optional[QgsLayoutMultiFrame]: ...
+    def createItem(self, type: int, layout: typing.Optional[QgsLayout]) -> typing.Optional[QgsLayoutItem]: ...
+    def addLayoutMultiFrameType(self, metadata: typing.Optional[QgsLayoutMultiFrameAbstractMetadata]) -> bool: ...
+    def addLayoutItemType(self, metadata: typing.Optional[QgsLayoutItemAbstractMetadata]) -> bool: ...
+    def multiFrameMetadata(self, type: int) -> typing.Optional[QgsLayoutMultiFrameAbstractMetadata]: ...
+    def itemMetadata(self, type: int) -> typing.Optional[QgsLayoutItemAbstractMetadata]: ...
+    def populate(self) -> bool: ...
+
+
+class QgsLayoutItemScaleBar(QgsLayoutItem):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def exportLayerBehavior(self) -> QgsLayoutItem.ExportLayerBehavior: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def finalizeRestoreFromXml(self) -> None: ...
+    def refreshDataDefinedProperty(self, property: QgsLayoutObject.DataDefinedProperty = ...) -> None: ...
+    def update(self) -> None: ...
+    def setMethod(self, method: Qgis.ScaleCalculationMethod) -> None: ...
+    def method(self) -> Qgis.ScaleCalculationMethod: ...
+    def setNumericFormat(self, format: typing.Optional['QgsNumericFormat']) -> None: ...
+    def numericFormat(self) -> typing.Optional['QgsNumericFormat']: ...
+    def style(self) -> str: ...
+    def setStyle(self, name: typing.Optional[str]) -> None: ...
+    def resizeToMinimumWidth(self) -> None: ...
+    def applyDefaultSize(self, units: Qgis.DistanceUnit = ...) -> None: ...
+    def guessUnits(self) -> Qgis.DistanceUnit: ...
+    def applyDefaultRendererSettings(self, renderer: typing.Optional['QgsScaleBarRenderer']) -> bool: ...
+    def applyDefaultSettings(self) -> None: ...
+    @deprecated("""""")
+    def setLineCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    @deprecated("""""")
+    def lineCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    @deprecated("""""")
+    def setLineJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    @deprecated("""""")
+    def lineJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setUnits(self, units: Qgis.DistanceUnit) -> None: ...
+    def units(self) -> Qgis.DistanceUnit: ...
+    def setAlignment(self, alignment: Qgis.ScaleBarAlignment) -> None: ...
+    def alignment(self) -> Qgis.ScaleBarAlignment: ...
+    def setLabelHorizontalPlacement(self, placement: Qgis.ScaleBarDistanceLabelHorizontalPlacement) -> None: ...
+    def labelHorizontalPlacement(self) -> Qgis.ScaleBarDistanceLabelHorizontalPlacement: ...
+    def setLabelVerticalPlacement(self, placement: Qgis.ScaleBarDistanceLabelVerticalPlacement) -> None: ...
+    def labelVerticalPlacement(self) -> Qgis.ScaleBarDistanceLabelVerticalPlacement: ...
+    def setBoxContentSpace(self, space: float) -> None: ...
+    def boxContentSpace(self) -> float: ...
+    def setLabelBarSpace(self, space: float) -> None: ...
+    def labelBarSpace(self) -> float: ...
+    def linkedMap(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setLinkedMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def setHeight(self, height: float) -> None: ...
+    def height(self) -> float: ...
+    @deprecated("""""")
+    def brush2(self) -> QtGui.QBrush: ...
+    @deprecated("""""")
+    def brush(self) -> QtGui.QBrush: ...
+    @deprecated("""""")
+    def pen(self) -> QtGui.QPen: ...
+    @deprecated("""""")
+    def setLineWidth(self, width: float) -> None: ...
+    @deprecated("""""")
+    def lineWidth(self) -> float: ...
+    @deprecated("""""")
+    def setLineColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def lineColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFillColor2(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fillColor2(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fillColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    @deprecated("""""")
+    def font(self) -> QtGui.QFont: ...
+    def setAlternateFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def alternateFillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def fillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setSubdivisionLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def subdivisionLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setDivisionLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def divisionLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def lineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setUnitLabel(self, label: typing.Optional[str]) -> None: ...
+    def unitLabel(self) -> str: ...
+    def setMapUnitsPerScaleBarUnit(self, units: float) -> None: ...
+    def mapUnitsPerScaleBarUnit(self) -> float: ...
+    def setMaximumBarWidth(self, maxWidth: float) -> None: ...
+    def maximumBarWidth(self) -> float: ...
+    def setMinimumBarWidth(self, minWidth: float) -> None: ...
+    def minimumBarWidth(self) -> float: ...
+    def setSegmentSizeMode(self, mode: Qgis.ScaleBarSegmentSizeMode) -> None: ...
+    def segmentSizeMode(self) -> Qgis.ScaleBarSegmentSizeMode: ...
+    def setUnitsPerSegment(self, units: float) -> None: ...
+    def unitsPerSegment(self) -> float: ...
+    def setSubdivisionsHeight(self, height: float) -> None: ...
+    def subdivisionsHeight(self) -> float: ...
+    def setNumberOfSubdivisions(self, subdivisions: int) -> None: ...
+    def numberOfSubdivisions(self) -> int: ...
+    def setNumberOfSegmentsLeft(self, segments: int) -> None: ...
+    def numberOfSegmentsLeft(self) -> int: ...
+    def setNumberOfSegments(self, segments: int) -> None: ...
+    def numberOfSegments(self) -> int: ...
+    def minimumSize(self) -> 'QgsLayoutSize': ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemScaleBar']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutItemShape(QgsLayoutItem):
+
+    class Shape(int):
+        Ellipse = ... # type: QgsLayoutItemShape.Shape
+        Rectangle = ... # type: QgsLayoutItemShape.Shape
+        Triangle = ... # type: QgsLayoutItemShape.Shape
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def draw(self, context: QgsLayoutItemRenderContext) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def estimatedFrameBleed(self) -> float: ...
+    def boundingRect(self) -> QtCore.QRectF: ...
+    def clipPath(self) -> QgsGeometry: ...
+    def cornerRadius(self) -> 'QgsLayoutMeasurement': ...
+    def setCornerRadius(self, radius: 'QgsLayoutMeasurement') -> None: ...
+    def symbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def setShapeType(self, type: 'QgsLayoutItemShape.Shape') -> None: ...
+    def shapeType(self) -> 'QgsLayoutItemShape.Shape': ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def displayName(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def type(self) -> int: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemShape']: ...
+
+
+class QgsLayoutItemTextTable(QgsLayoutTable):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    def getTableContents(self, contents: typing.Any) -> bool: ...
+    def setContents(self, contents: collections.abc.Iterable[collections.abc.Iterable[typing.Optional[str]]]) -> None: ...
+    def addRow(self, row: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @staticmethod
+    def create(layout: typing.Optional[QgsLayout]) -> typing.Optional['QgsLayoutItemTextTable']: ...
+    def displayName(self) -> str: ...
+    def type(self) -> int: ...
+
+
+class QgsLayoutManager(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+
+    layoutRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    layoutAboutToBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layoutRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layoutAdded: typing.ClassVar[QtCore.pyqtSignal]
+    layoutAboutToBeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def generateUniqueTitle(self, type: 'QgsMasterLayoutInterface.Type' = ...) -> str: ...
+    def duplicateLayout(self, layout: typing.Optional['QgsMasterLayoutInterface'], newName: typing.Optional[str]) -> typing.Optional['QgsMasterLayoutInterface']: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+    def layoutByName(self, name: typing.Optional[str]) -> typing.Optional['QgsMasterLayoutInterface']: ...
+    def printLayouts(self) -> list['QgsPrintLayout']: ...
+    def layouts(self) -> list['QgsMasterLayoutInterface']: ...
+    def clear(self) -> None: ...
+    def removeLayout(self, layout: typing.Optional['QgsMasterLayoutInterface']) -> bool: ...
+    def addLayout(self, layout: typing.Optional['QgsMasterLayoutInterface']) -> bool: ...
+
+
+class QgsLayoutManagerModel(QtCore.QAbstractListModel):
+
+    class CustomRole(int):
+        Layout = ... # type: QgsLayoutManagerModel.CustomRole
+
+    def __init__(self, manager: typing.Optional[QgsLayoutManager], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def allowEmptyLayout(self) -> bool: ...
+    def setAllowEmptyLayout(self, allowEmpty: bool) -> None: ...
+    def indexFromLayout(self, layout: typing.Optional['QgsMasterLayoutInterface']) -> QtCore.QModelIndex: ...
+    def layoutFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional['QgsMasterLayoutInterface']: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def rowCount(self, parent: QtCore.QModelIndex) -> int: ...
+    Role: typing.Type[QgsLayoutManagerModel.CustomRole]
+    LayoutRole: QgsLayoutManagerModel.CustomRole
+
+
+class QgsLayoutManagerProxyModel(QtCore.QSortFilterProxyModel):
+
+    class Filter(int):
+        FilterPrintLayouts = ... # type: QgsLayoutManagerProxyModel.Filter
+        FilterReports = ... # type: QgsLayoutManagerProxyModel.Filter
+
+    class Filters(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __xor__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __ior__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __or__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __iand__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __and__(self, f: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __invert__(self) -> 'QgsLayoutManagerProxyModel.Filters': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setFilterString(self, filter: typing.Optional[str]) -> None: ...
+    def filterString(self) -> str: ...
+    def setFilters(self, filters: typing.Union['QgsLayoutManagerProxyModel.Filters', 'QgsLayoutManagerProxyModel.Filter']) -> None: ...
+    def filters(self) -> 'QgsLayoutManagerProxyModel.Filters': ...
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+
+
+class QgsLayoutMeasurement(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, length: float, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutMeasurement') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __itruediv__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __truediv__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __imul__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __mul__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __isub__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __sub__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __iadd__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __add__(self, v: float) -> 'QgsLayoutMeasurement': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def decodeMeasurement(string: typing.Optional[str]) -> 'QgsLayoutMeasurement': ...
+    def encodeMeasurement(self) -> str: ...
+    def setUnits(self, units: Qgis.LayoutUnit) -> None: ...
+    def units(self) -> Qgis.LayoutUnit: ...
+    def setLength(self, length: float) -> None: ...
+    def length(self) -> float: ...
+
+
+class QgsLayoutMeasurementConverter(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutMeasurementConverter') -> None: ...
+
+    @typing.overload
+    def convert(self, measurement: QgsLayoutMeasurement, targetUnits: Qgis.LayoutUnit) -> QgsLayoutMeasurement: ...
+    @typing.overload
+    def convert(self, size: 'QgsLayoutSize', targetUnits: Qgis.LayoutUnit) -> 'QgsLayoutSize': ...
+    @typing.overload
+    def convert(self, point: 'QgsLayoutPoint', targetUnits: Qgis.LayoutUnit) -> 'QgsLayoutPoint': ...
+    def dpi(self) -> float: ...
+    def setDpi(self, dpi: float) -> None: ...
+
+
+class QgsLayoutModel(QtCore.QAbstractItemModel):
+
+    class Columns(int):
+        Visibility = ... # type: QgsLayoutModel.Columns
+        LockStatus = ... # type: QgsLayoutModel.Columns
+        ItemId = ... # type: QgsLayoutModel.Columns
+
+    def __init__(self, layout: typing.Optional[QgsLayout], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def indexForItem(self, item: typing.Optional[QgsLayoutItem], column: int = ...) -> QtCore.QModelIndex: ...
+    def itemFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional[QgsLayoutItem]: ...
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def dropMimeData(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction, row: int, column: int, parent: QtCore.QModelIndex) -> bool: ...
+    def mimeData(self, indexes: collections.abc.Iterable[QtCore.QModelIndex]) -> typing.Optional[QtCore.QMimeData]: ...
+    def mimeTypes(self) -> list[str]: ...
+    def supportedDropActions(self) -> QtCore.Qt.DropActions: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int) -> bool: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+
+
+class QgsLayoutProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, layout: typing.Optional[QgsLayout], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+    def itemFlags(self) -> QgsLayoutItem.Flags: ...
+    def setItemFlags(self, flags: typing.Union[QgsLayoutItem.Flags, QgsLayoutItem.Flag]) -> None: ...
+    def allowEmptyItem(self) -> bool: ...
+    def setAllowEmptyItem(self, allowEmpty: bool) -> None: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def itemFromSourceIndex(self, sourceIndex: QtCore.QModelIndex) -> typing.Optional[QgsLayoutItem]: ...
+    def sourceLayerModel(self) -> typing.Optional[QgsLayoutModel]: ...
+    def exceptedItemList(self) -> list[QgsLayoutItem]: ...
+    def setExceptedItemList(self, items: collections.abc.Iterable[QgsLayoutItem]) -> None: ...
+    def setFilterType(self, filter: QgsLayoutItemRegistry.ItemType) -> None: ...
+    def filterType(self) -> QgsLayoutItemRegistry.ItemType: ...
+
+
+class QgsLayoutNorthArrowHandler(QtCore.QObject):
+
+    class NorthMode(int):
+        GridNorth = ... # type: QgsLayoutNorthArrowHandler.NorthMode
+        TrueNorth = ... # type: QgsLayoutNorthArrowHandler.NorthMode
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    arrowRotationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setNorthOffset(self, offset: float) -> None: ...
+    def northOffset(self) -> float: ...
+    def setNorthMode(self, mode: 'QgsLayoutNorthArrowHandler.NorthMode') -> None: ...
+    def northMode(self) -> 'QgsLayoutNorthArrowHandler.NorthMode': ...
+    def linkedMap(self) -> typing.Optional[QgsLayoutItemMap]: ...
+    def setLinkedMap(self, map: typing.Optional[QgsLayoutItemMap]) -> None: ...
+    def arrowRotation(self) -> float: ...
+
+
+class QgsLayoutPageCollection(QtCore.QObject, QgsLayoutSerializableObject):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    pageAboutToBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def redraw(self) -> None: ...
+    def applyPropertiesToAllOtherPages(self, sourcePage: int) -> None: ...
+    def guides(self) -> QgsLayoutGuideCollection: ...
+    def readXml(self, collectionElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def resizeToContents(self, margins: QgsMargins, marginUnits: Qgis.LayoutUnit) -> None: ...
+    def pageShadowWidth(self) -> float: ...
+    def spaceBetweenPages(self) -> float: ...
+    def positionOnPage(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> QtCore.QPointF: ...
+    def pagePositionToAbsolute(self, page: int, position: 'QgsLayoutPoint') -> 'QgsLayoutPoint': ...
+    def pagePositionToLayoutPosition(self, page: int, position: 'QgsLayoutPoint') -> QtCore.QPointF: ...
+    def pageAtPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> typing.Optional[QgsLayoutItemPage]: ...
+    def predictPageNumberForPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> int: ...
+    def pageNumberForPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> int: ...
+    def hasUniformPageSizes(self) -> bool: ...
+    def maximumPageSize(self) -> QtCore.QSizeF: ...
+    def maximumPageWidth(self) -> float: ...
+    def reflow(self) -> None: ...
+    def endPageSizeChange(self) -> None: ...
+    def beginPageSizeChange(self) -> None: ...
+    @deprecated("""""")
+    def pageStyleSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setPageStyleSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def takePage(self, page: typing.Optional[QgsLayoutItemPage]) -> typing.Optional[QgsLayoutItemPage]: ...
+    def clear(self) -> None: ...
+    @typing.overload
+    def deletePage(self, pageNumber: int) -> None: ...
+    @typing.overload
+    def deletePage(self, page: typing.Optional[QgsLayoutItemPage]) -> None: ...
+    def insertPage(self, page: typing.Optional[QgsLayoutItemPage], beforePage: int) -> None: ...
+    def extendByNewPage(self) -> typing.Optional[QgsLayoutItemPage]: ...
+    def addPage(self, page: typing.Optional[QgsLayoutItemPage]) -> None: ...
+    def shouldExportPage(self, page: int) -> bool: ...
+    def itemsOnPage(self, page: int) -> list[QgsLayoutItem]: ...
+    def pageIsEmpty(self, page: int) -> bool: ...
+    def visiblePageNumbers(self, region: QtCore.QRectF) -> list[int]: ...
+    def visiblePages(self, region: QtCore.QRectF) -> list[QgsLayoutItemPage]: ...
+    def pageNumber(self, page: typing.Optional[QgsLayoutItemPage]) -> int: ...
+    def page(self, pageNumber: int) -> typing.Optional[QgsLayoutItemPage]: ...
+    def pageCount(self) -> int: ...
+    def pages(self) -> list[QgsLayoutItemPage]: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+
+
+class QgsLayoutPoint(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, x: float, y: float, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutPoint') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __itruediv__(self, v: float) -> 'QgsLayoutPoint': ...
+    def __truediv__(self, v: float) -> 'QgsLayoutPoint': ...
+    def __imul__(self, v: float) -> 'QgsLayoutPoint': ...
+    def __mul__(self, v: float) -> 'QgsLayoutPoint': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def decodePoint(string: typing.Optional[str]) -> 'QgsLayoutPoint': ...
+    def encodePoint(self) -> str: ...
+    def toQPointF(self) -> QtCore.QPointF: ...
+    def isNull(self) -> bool: ...
+    def setUnits(self, units: Qgis.LayoutUnit) -> None: ...
+    def units(self) -> Qgis.LayoutUnit: ...
+    def setY(self, y: float) -> None: ...
+    def y(self) -> float: ...
+    def setX(self, x: float) -> None: ...
+    def x(self) -> float: ...
+    def setPoint(self, x: float, y: float) -> None: ...
+
+
+class QgsLayoutRenderContext(QtCore.QObject):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    predefinedScalesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    dpiChanged: typing.ClassVar[QtCore.pyqtSignal]
+    flagsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setFeatureFilterProvider(self, featureFilterProvider: typing.Optional[QgsFeatureFilterProvider]) -> None: ...
+    def featureFilterProvider(self) -> typing.Optional[QgsFeatureFilterProvider]: ...
+    def predefinedScales(self) -> list[float]: ...
+    def setPredefinedScales(self, scales: collections.abc.Iterable[float]) -> None: ...
+    def setExportThemes(self, themes: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def exportThemes(self) -> list[str]: ...
+    def setMaskSettings(self, settings: QgsMaskRenderSettings) -> None: ...
+    def maskSettings(self) -> QgsMaskRenderSettings: ...
+    def simplifyMethod(self) -> QgsVectorSimplifyMethod: ...
+    def setSimplifyMethod(self, method: QgsVectorSimplifyMethod) -> None: ...
+    def setTextRenderFormat(self, format: Qgis.TextRenderFormat) -> None: ...
+    def textRenderFormat(self) -> Qgis.TextRenderFormat: ...
+    @deprecated("""""")
+    def currentExportLayer(self) -> int: ...
+    @deprecated("""""")
+    def setCurrentExportLayer(self, layer: int = ...) -> None: ...
+    def pagesVisible(self) -> bool: ...
+    def setPagesVisible(self, visible: bool) -> None: ...
+    def setBoundingBoxesVisible(self, visible: bool) -> None: ...
+    def boundingBoxesVisible(self) -> bool: ...
+    def setGridVisible(self, visible: bool) -> None: ...
+    def gridVisible(self) -> bool: ...
+    def isPreviewRender(self) -> bool: ...
+    def measurementConverter(self) -> QgsLayoutMeasurementConverter: ...
+    def selectionColor(self) -> QtGui.QColor: ...
+    def setSelectionColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def dpi(self) -> float: ...
+    def setDpi(self, dpi: float) -> None: ...
+    def setRasterizedRenderingPolicy(self, policy: Qgis.RasterizedRenderingPolicy) -> None: ...
+    def rasterizedRenderingPolicy(self) -> Qgis.RasterizedRenderingPolicy: ...
+    def renderContextFlags(self) -> Qgis.RenderContextFlags: ...
+    def testFlag(self, flag: Qgis.LayoutRenderFlag) -> bool: ...
+    def flags(self) -> Qgis.LayoutRenderFlags: ...
+    def setFlag(self, flag: Qgis.LayoutRenderFlag, on: bool = ...) -> None: ...
+    def setFlags(self, flags: typing.Union[Qgis.LayoutRenderFlags, Qgis.LayoutRenderFlag]) -> None: ...
+    Flag: typing.Type[Qgis.LayoutRenderFlag]
+    FlagDebug: Qgis.LayoutRenderFlag
+    FlagOutlineOnly: Qgis.LayoutRenderFlag
+    FlagAntialiasing: Qgis.LayoutRenderFlag
+    FlagUseAdvancedEffects: Qgis.LayoutRenderFlag
+    FlagForceVectorOutput: Qgis.LayoutRenderFlag
+    FlagHideCoverageLayer: Qgis.LayoutRenderFlag
+    FlagDrawSelection: Qgis.LayoutRenderFlag
+    FlagDisableTiledRasterLayerRenders: Qgis.LayoutRenderFlag
+    FlagRenderLabelsByMapLayer: Qgis.LayoutRenderFlag
+    FlagLosslessImageRendering: Qgis.LayoutRenderFlag
+    FlagSynchronousLegendGraphics: Qgis.LayoutRenderFlag
+    FlagAlwaysUseGlobalMasks: Qgis.LayoutRenderFlag
+    Flags: typing.Type[Qgis.LayoutRenderFlags]
+
+
+class QgsLayoutReportContext(QtCore.QObject):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    layerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    @deprecated("""""")
+    def predefinedScales(self) -> list[float]: ...
+    @deprecated("""""")
+    def setPredefinedScales(self, scales: collections.abc.Iterable[float]) -> None: ...
+    def setLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def currentGeometry(self, crs: 'QgsCoordinateReferenceSystem' = ...) -> QgsGeometry: ...
+    def feature(self) -> QgsFeature: ...
+    def setFeature(self, feature: QgsFeature) -> None: ...
+
+
+class QgsLayoutSize(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, width: float, height: float, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, size: QtCore.QSizeF, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, units: Qgis.LayoutUnit = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutSize') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __itruediv__(self, v: float) -> 'QgsLayoutSize': ...
+    def __truediv__(self, v: float) -> 'QgsLayoutSize': ...
+    def __imul__(self, v: float) -> 'QgsLayoutSize': ...
+    def __mul__(self, v: float) -> 'QgsLayoutSize': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def decodeSize(string: typing.Optional[str]) -> 'QgsLayoutSize': ...
+    def encodeSize(self) -> str: ...
+    def toQSizeF(self) -> QtCore.QSizeF: ...
+    def isEmpty(self) -> bool: ...
+    def setUnits(self, units: Qgis.LayoutUnit) -> None: ...
+    def units(self) -> Qgis.LayoutUnit: ...
+    def setHeight(self, height: float) -> None: ...
+    def height(self) -> float: ...
+    def setWidth(self, width: float) -> None: ...
+    def width(self) -> float: ...
+    def setSize(self, width: float, height: float) -> None: ...
+
+
+class QgsLayoutSnapper(QgsLayoutSerializableObject):
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutSnapper') -> None: ...
+
+    def readXml(self, gridElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def snapPointsToItems(self, points: collections.abc.Iterable[float], orientation: QtCore.Qt.Orientation, scaleFactor: float, ignoreItems: collections.abc.Iterable[QgsLayoutItem], snapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ...) -> typing.Tuple[float, bool]: ...
+    def snapPointToItems(self, original: float, orientation: QtCore.Qt.Orientation, scaleFactor: float, ignoreItems: collections.abc.Iterable[QgsLayoutItem], snapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ...) -> typing.Tuple[float, bool]: ...
+    def snapPointsToGuides(self, points: collections.abc.Iterable[float], orientation: QtCore.Qt.Orientation, scaleFactor: float) -> typing.Tuple[float, bool]: ...
+    def snapPointToGuides(self, original: float, orientation: QtCore.Qt.Orientation, scaleFactor: float) -> typing.Tuple[float, bool]: ...
+    def snapPointsToGrid(self, points: collections.abc.Iterable[typing.Union[QtCore.QPointF, QtCore.QPoint]], scaleFactor: float) -> typing.Tuple[QtCore.QPointF, bool, bool]: ...
+    def snapPointToGrid(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], scaleFactor: float) -> typing.Tuple[QtCore.QPointF, bool, bool]: ...
+    def snapRect(self, rect: QtCore.QRectF, scaleFactor: float, horizontalSnapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ..., verticalSnapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ..., ignoreItems: typing.Optional[collections.abc.Iterable[QgsLayoutItem]] = ...) -> typing.Tuple[QtCore.QRectF, bool]: ...
+    def snapPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], scaleFactor: float, horizontalSnapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ..., verticalSnapLine: typing.Optional[QtWidgets.QGraphicsLineItem] = ..., ignoreItems: typing.Optional[collections.abc.Iterable[QgsLayoutItem]] = ...) -> typing.Tuple[QtCore.QPointF, bool]: ...
+    def setSnapToItems(self, enabled: bool) -> None: ...
+    def snapToItems(self) -> bool: ...
+    def setSnapToGuides(self, enabled: bool) -> None: ...
+    def snapToGuides(self) -> bool: ...
+    def setSnapToGrid(self, enabled: bool) -> None: ...
+    def snapToGrid(self) -> bool: ...
+    def snapTolerance(self) -> int: ...
+    def setSnapTolerance(self, snapTolerance: int) -> None: ...
+    def layout(self) -> typing.Optional[QgsLayout]: ...
+    def stringType(self) -> str: ...
+
+
+class QgsLayoutTableStyle(PyQt5.sip.wrapper):
+
+    cellBackgroundColor = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+    enabled = ... # type: bool
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutTableStyle') -> None: ...
+
+    def readXml(self, styleElem: QtXml.QDomElement) -> bool: ...
+    def writeXml(self, styleElem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+
+
+class QgsLayoutTableColumn(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, heading: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutTableColumn') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def __eq__(self, other: object): ...
+    @deprecated("""""")
+    def clone(self) -> typing.Optional['QgsLayoutTableColumn']: ...
+    @deprecated("""""")
+    def setSortByRank(self, rank: int) -> None: ...
+    @deprecated("""""")
+    def sortByRank(self) -> int: ...
+    def setSortOrder(self, order: QtCore.Qt.SortOrder) -> None: ...
+    def sortOrder(self) -> QtCore.Qt.SortOrder: ...
+    def setAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def attribute(self) -> str: ...
+    def setVAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def vAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def setHAlignment(self, alignment: QtCore.Qt.AlignmentFlag) -> None: ...
+    def hAlignment(self) -> QtCore.Qt.AlignmentFlag: ...
+    def setHeading(self, heading: typing.Optional[str]) -> None: ...
+    def heading(self) -> str: ...
+    def setWidth(self, width: float) -> None: ...
+    def width(self) -> float: ...
+    def readXml(self, columnElem: QtXml.QDomElement) -> bool: ...
+    def writeXml(self, columnElem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+
+
+class QgsAbstractLayoutUndoCommand(QtWidgets.QUndoCommand):
+
+    def __init__(self, text: typing.Optional[str], id: int = ..., parent: typing.Optional[QtWidgets.QUndoCommand] = ...) -> None: ...
+
+    def setAfterState(self, stateDoc: QtXml.QDomDocument) -> None: ...
+    def restoreState(self, stateDoc: QtXml.QDomDocument) -> None: ...
+    def saveState(self, stateDoc: QtXml.QDomDocument) -> None: ...
+    def containsChange(self) -> bool: ...
+    def afterState(self) -> QtXml.QDomDocument: ...
+    def beforeState(self) -> QtXml.QDomDocument: ...
+    def saveAfterState(self) -> None: ...
+    def saveBeforeState(self) -> None: ...
+    def id(self) -> int: ...
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsLayoutUndoStack(QtCore.QObject):
+
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+
+    undoRedoOccurredForItems: typing.ClassVar[QtCore.pyqtSignal]
+    def push(self, command: typing.Optional[QtWidgets.QUndoCommand]) -> None: ...
+    def isBlocked(self) -> bool: ...
+    def blockCommands(self, blocked: bool) -> None: ...
+    def notifyUndoRedoOccurred(self, item: typing.Optional[QgsLayoutItem]) -> None: ...
+    def stack(self) -> typing.Optional[QtWidgets.QUndoStack]: ...
+    def cancelCommand(self) -> None: ...
+    def endCommand(self) -> None: ...
+    def beginCommand(self, object: typing.Optional[QgsLayoutUndoObjectInterface], commandText: typing.Optional[str], id: int = ...) -> None: ...
+    def endMacro(self) -> None: ...
+    def beginMacro(self, commandText: typing.Optional[str]) -> None: ...
+
+
+class QgsLayoutUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutUtils') -> None: ...
+
+    @staticmethod
+    def predefinedScales(layout: typing.Optional[QgsLayout]) -> list[float]: ...
+    @staticmethod
+    def itemIsAClippingSource(item: typing.Optional[QgsLayoutItem]) -> bool: ...
+    @staticmethod
+    def calculatePrettySize(minimumSize: float, maximumSize: float) -> float: ...
+    @staticmethod
+    def mapLayerFromString(string: typing.Optional[str], project: typing.Optional['QgsProject']) -> typing.Optional[QgsMapLayer]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def scaleFactorFromItemStyle(style: typing.Optional[QtWidgets.QStyleOptionGraphicsItem]) -> float: ...
+    @typing.overload
+    @staticmethod
+    def scaleFactorFromItemStyle(style: typing.Optional[QtWidgets.QStyleOptionGraphicsItem], painter: typing.Optional[QtGui.QPainter]) -> float: ...
+    @staticmethod
+    def decodePaperOrientation(string: typing.Optional[str]) -> typing.Tuple[QgsLayoutItemPage.Orientation, bool]: ...
+    @staticmethod
+    def largestRotatedRectWithinBounds(originalRect: QtCore.QRectF, boundsRect: QtCore.QRectF, rotation: float) -> QtCore.QRectF: ...
+    @typing.overload
+    @staticmethod
+    def drawText(painter: typing.Optional[QtGui.QPainter], position: typing.Union[QtCore.QPointF, QtCore.QPoint], text: typing.Optional[str], font: QtGui.QFont, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def drawText(painter: typing.Optional[QtGui.QPainter], rectangle: QtCore.QRectF, text: typing.Optional[str], font: QtGui.QFont, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., halignment: QtCore.Qt.AlignmentFlag = ..., valignment: QtCore.Qt.AlignmentFlag = ..., flags: int = ...) -> None: ...
+    @staticmethod
+    def textHeightMM(font: QtGui.QFont, text: typing.Optional[str], multiLineHeight: float = ...) -> float: ...
+    @staticmethod
+    def textWidthMM(font: QtGui.QFont, text: typing.Optional[str]) -> float: ...
+    @staticmethod
+    def fontHeightCharacterMM(font: QtGui.QFont, character: str) -> float: ...
+    @staticmethod
+    def fontHeightMM(font: QtGui.QFont) -> float: ...
+    @staticmethod
+    def fontDescentMM(font: QtGui.QFont) -> float: ...
+    @staticmethod
+    def fontAscentMM(font: QtGui.QFont) -> float: ...
+    @staticmethod
+    def scaledFontPixelSize(font: QtGui.QFont) -> QtGui.QFont: ...
+    @staticmethod
+    def relativePosition(position: float, beforeMin: float, beforeMax: float, afterMin: float, afterMax: float) -> float: ...
+    @staticmethod
+    def relativeResizeRect(rectToResize: QtCore.QRectF, boundsBefore: QtCore.QRectF, boundsAfter: QtCore.QRectF) -> None: ...
+    @staticmethod
+    def createRenderContextForLayout(layout: typing.Optional[QgsLayout], painter: typing.Optional[QtGui.QPainter], dpi: float = ...) -> QgsRenderContext: ...
+    @staticmethod
+    def createRenderContextForMap(map: typing.Optional[QgsLayoutItemMap], painter: typing.Optional[QtGui.QPainter], dpi: float = ...) -> QgsRenderContext: ...
+    @staticmethod
+    def snappedAngle(angle: float) -> float: ...
+    @staticmethod
+    def normalizedAngle(angle: float, allowNegative: bool = ...) -> float: ...
+    @staticmethod
+    def rotate(angle: float) -> typing.Tuple[float, float]: ...
+
+
+class QgsMasterLayoutInterface(PyQt5.sip.wrapper):
+
+    class Type(int):
+        PrintLayout = ... # type: QgsMasterLayoutInterface.Type
+        Report = ... # type: QgsMasterLayoutInterface.Type
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMasterLayoutInterface') -> None: ...
+
+    def layoutAccept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def updateSettings(self) -> None: ...
+    def readLayoutXml(self, layoutElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeLayoutXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def layoutProject(self) -> typing.Optional['QgsProject']: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def name(self) -> str: ...
+    def layoutType(self) -> 'QgsMasterLayoutInterface.Type': ...
+    def clone(self) -> typing.Optional['QgsMasterLayoutInterface']: ...
+
+
+class QgsPageSize(PyQt5.sip.wrapper):
+
+    displayName = ... # type: typing.Optional[str]
+    name = ... # type: typing.Optional[str]
+    size = ... # type: QgsLayoutSize
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], size: QgsLayoutSize, displayName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, size: QgsLayoutSize) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPageSize') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsPageSizeRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPageSizeRegistry') -> None: ...
+
+    def decodePageSize(self, string: typing.Optional[str], size: QgsPageSize) -> bool: ...
+    @typing.overload
+    def find(self, name: typing.Optional[str]) -> list[QgsPageSize]: ...
+    @typing.overload
+    def find(self, size: QgsLayoutSize) -> str: ...
+    def entries(self) -> list[QgsPageSize]: ...
+    def add(self, size: QgsPageSize) -> None: ...
+
+
+class QgsPrintLayout(QgsLayout, QgsMasterLayoutInterface):
+
+    def __init__(self, project: typing.Optional['QgsProject']) -> None: ...
+
+    nameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def layoutAccept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def updateSettings(self) -> None: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    def readLayoutXml(self, layoutElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeLayoutXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, layoutElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def atlas(self) -> typing.Optional[QgsLayoutAtlas]: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def layoutType(self) -> QgsMasterLayoutInterface.Type: ...
+    def layoutProject(self) -> typing.Optional['QgsProject']: ...
+    def clone(self) -> typing.Optional['QgsPrintLayout']: ...
+
+
+class QgsReport(QtCore.QObject, QgsAbstractReportSection, QgsMasterLayoutInterface):
+
+    def __init__(self, project: typing.Optional['QgsProject']) -> None: ...
+
+    nameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def layoutAccept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def updateSettings(self) -> None: ...
+    def readLayoutXml(self, layoutElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeLayoutXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsReport']: ...
+    def layoutProject(self) -> typing.Optional['QgsProject']: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
+    def layoutType(self) -> QgsMasterLayoutInterface.Type: ...
+
+
+class QgsReportSectionFieldGroup(QgsAbstractReportSection):
+
+    class SectionVisibility(int):
+        IncludeWhenFeaturesFound = ... # type: QgsReportSectionFieldGroup.SectionVisibility
+        AlwaysInclude = ... # type: QgsReportSectionFieldGroup.SectionVisibility
+
+    def __init__(self, parentSection: typing.Optional[QgsAbstractReportSection] = ...) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def reloadSettings(self) -> None: ...
+    def setParentSection(self, parentSection: typing.Optional[QgsAbstractReportSection]) -> None: ...
+    def reset(self) -> None: ...
+    def nextBody(self) -> typing.Tuple[typing.Optional[QgsLayout], bool]: ...
+    def prepareFooter(self) -> bool: ...
+    def prepareHeader(self) -> bool: ...
+    def beginRender(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsReportSectionFieldGroup']: ...
+    def setFooterVisibility(self, visibility: 'QgsReportSectionFieldGroup.SectionVisibility') -> None: ...
+    def footerVisibility(self) -> 'QgsReportSectionFieldGroup.SectionVisibility': ...
+    def setHeaderVisibility(self, visibility: 'QgsReportSectionFieldGroup.SectionVisibility') -> None: ...
+    def headerVisibility(self) -> 'QgsReportSectionFieldGroup.SectionVisibility': ...
+    def setSortAscending(self, sortAscending: bool) -> None: ...
+    def sortAscending(self) -> bool: ...
+    def setField(self, field: typing.Optional[str]) -> None: ...
+    def field(self) -> str: ...
+    def setLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setBodyEnabled(self, enabled: bool) -> None: ...
+    def bodyEnabled(self) -> bool: ...
+    def setBody(self, body: typing.Optional[QgsLayout]) -> None: ...
+    def body(self) -> typing.Optional[QgsLayout]: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsReportSectionLayout(QgsAbstractReportSection):
+
+    def __init__(self, parentSection: typing.Optional[QgsAbstractReportSection] = ...) -> None: ...
+
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def reloadSettings(self) -> None: ...
+    def nextBody(self) -> typing.Tuple[typing.Optional[QgsLayout], bool]: ...
+    def beginRender(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsReportSectionLayout']: ...
+    def setBodyEnabled(self, enabled: bool) -> None: ...
+    def bodyEnabled(self) -> bool: ...
+    def setBody(self, body: typing.Optional[QgsLayout]) -> None: ...
+    def body(self) -> typing.Optional[QgsLayout]: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def description(self) -> str: ...
+    def type(self) -> str: ...
@@ -0,0 +1,239 @@
+# The PEP 484 type hints stub file for the _core.locator module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFeedback
+from .geometry import QgsRectangle
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+
+
+class QgsLocatorFilter(QtCore.QObject):
+
+    class Flag(int):
+        FlagFast = ... # type: QgsLocatorFilter.Flag
+
+    class Priority(int):
+        Highest = ... # type: QgsLocatorFilter.Priority
+        High = ... # type: QgsLocatorFilter.Priority
+        Medium = ... # type: QgsLocatorFilter.Priority
+        Low = ... # type: QgsLocatorFilter.Priority
+        Lowest = ... # type: QgsLocatorFilter.Priority
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __xor__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __ior__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __or__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __iand__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __and__(self, f: typing.Union['QgsLocatorFilter.Flags', 'QgsLocatorFilter.Flag']) -> 'QgsLocatorFilter.Flags': ...
+        def __invert__(self) -> 'QgsLocatorFilter.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    resultFetched: typing.ClassVar[QtCore.pyqtSignal]
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    def setFetchResultsDelay(self, delay: int) -> None: ...
+    def fetchResultsDelay(self) -> int: ...
+    def logMessage(self, message: typing.Optional[str], level: Qgis.MessageLevel = ...) -> None: ...
+    def openConfigWidget(self, parent: typing.Optional[QtWidgets.QWidget] = ...) -> None: ...
+    def hasConfigWidget(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    @staticmethod
+    def fuzzyScore(candidate: typing.Optional[str], search: typing.Optional[str]) -> float: ...
+    @staticmethod
+    def stringMatches(candidate: typing.Optional[str], search: typing.Optional[str]) -> bool: ...
+    def activePrefix(self) -> str: ...
+    def setUseWithoutPrefix(self, useWithoutPrefix: bool) -> None: ...
+    def useWithoutPrefix(self) -> bool: ...
+    def clearPreviousResults(self) -> None: ...
+    def triggerResultFromAction(self, result: 'QgsLocatorResult', actionId: int) -> None: ...
+    def resultDeselected(self, result: 'QgsLocatorResult') -> None: ...
+    def resultSelected(self, result: 'QgsLocatorResult') -> None: ...
+    def triggerResult(self, result: 'QgsLocatorResult') -> None: ...
+    def fetchResults(self, string: typing.Optional[str], context: 'QgsLocatorContext', feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def prepare(self, string: typing.Optional[str], context: 'QgsLocatorContext') -> list[str]: ...
+    def prefix(self) -> str: ...
+    def priority(self) -> 'QgsLocatorFilter.Priority': ...
+    def flags(self) -> 'QgsLocatorFilter.Flags': ...
+    def description(self) -> str: ...
+    def displayName(self) -> str: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLocatorFilter']: ...
+
+
+class QgsLocator(QtCore.QObject):
+
+    CORE_FILTERS = ... # type: collections.abc.Iterable[typing.Optional[str]]
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    searchPrepared: typing.ClassVar[QtCore.pyqtSignal]
+    foundResult: typing.ClassVar[QtCore.pyqtSignal]
+    def completionList(self) -> list[str]: ...
+    def clearPreviousResults(self) -> None: ...
+    def isRunning(self) -> bool: ...
+    def cancelWithoutBlocking(self) -> None: ...
+    def cancel(self) -> None: ...
+    def fetchResults(self, string: typing.Optional[str], context: 'QgsLocatorContext', feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    def prefixedFilters(self) -> typing.Any: ...
+    def filters(self, prefix: typing.Optional[str] = ...) -> list[QgsLocatorFilter]: ...
+    def deregisterFilter(self, filter: typing.Optional[QgsLocatorFilter]) -> None: ...
+    def registerFilter(self, filter: typing.Optional[QgsLocatorFilter]) -> None: ...
+
+
+class QgsLocatorContext(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+    targetExtent = ... # type: QgsRectangle
+    targetExtentCrs = ... # type: 'QgsCoordinateReferenceSystem'
+    transformContext = ... # type: 'QgsCoordinateTransformContext'
+    usingPrefix = ... # type: bool
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLocatorContext') -> None: ...
+
+
+class QgsLocatorResult(PyQt5.sip.wrapper):
+
+    class ResultAction(PyQt5.sip.wrapper):
+
+        iconPath = ... # type: typing.Optional[str]
+        id = ... # type: int
+        text = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, id: int, text: typing.Optional[str], iconPath: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLocatorResult.ResultAction') -> None: ...
+
+    actions = ... # type: collections.abc.Iterable['QgsLocatorResult.ResultAction']
+    description = ... # type: typing.Optional[str]
+    displayString = ... # type: typing.Optional[str]
+    filter = ... # type: QgsLocatorFilter
+    group = ... # type: typing.Optional[str]
+    groupScore = ... # type: float
+    icon = ... # type: QtGui.QIcon
+    score = ... # type: float
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, filter: typing.Optional[QgsLocatorFilter], displayString: typing.Optional[str], userData: typing.Any = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLocatorResult') -> None: ...
+
+    def setUserData(self, userData: typing.Any) -> None: ...
+    def _userData(self) -> typing.Any: ...
+
+
+class QgsLocatorModel(QtCore.QAbstractTableModel):
+
+    class CustomRole(int):
+        ResultData = ... # type: QgsLocatorModel.CustomRole
+        ResultType = ... # type: QgsLocatorModel.CustomRole
+        ResultFilterPriority = ... # type: QgsLocatorModel.CustomRole
+        ResultScore = ... # type: QgsLocatorModel.CustomRole
+        ResultFilterName = ... # type: QgsLocatorModel.CustomRole
+        ResultFilterGroupSorting = ... # type: QgsLocatorModel.CustomRole
+        ResultFilterGroupTitle = ... # type: QgsLocatorModel.CustomRole
+        ResultFilterGroupScore = ... # type: QgsLocatorModel.CustomRole
+        ResultActions = ... # type: QgsLocatorModel.CustomRole
+
+    NoGroup = ... # type: int
+    UnorderedGroup = ... # type: int
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def addResult(self, result: QgsLocatorResult) -> None: ...
+    def roleNames(self) -> dict[int, QtCore.QByteArray]: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def deferredClear(self) -> None: ...
+    def clear(self) -> None: ...
+    Role: typing.Type[QgsLocatorModel.CustomRole]
+    ResultDataRole: QgsLocatorModel.CustomRole
+    ResultTypeRole: QgsLocatorModel.CustomRole
+    ResultFilterPriorityRole: QgsLocatorModel.CustomRole
+    ResultScoreRole: QgsLocatorModel.CustomRole
+    ResultFilterNameRole: QgsLocatorModel.CustomRole
+    ResultFilterGroupSortingRole: QgsLocatorModel.CustomRole
+    ResultFilterGroupTitle: QgsLocatorModel.CustomRole
+    ResultFilterGroupScore: QgsLocatorModel.CustomRole
+    ResultActionsRole: QgsLocatorModel.CustomRole
+
+
+class QgsLocatorAutomaticModel(QgsLocatorModel):
+
+    def __init__(self, locator: typing.Optional[QgsLocator]) -> None: ...
+
+    def createContext(self) -> QgsLocatorContext: ...
+    def search(self, string: typing.Optional[str]) -> None: ...
+    def locator(self) -> typing.Optional[QgsLocator]: ...
+
+
+class QgsLocatorProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+
+
+class QgsLocatorModelBridge(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def selectionChanged(self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection) -> None: ...
+    def updateCanvasCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def updateCanvasExtent(self, extent: QgsRectangle) -> None: ...
+    def invalidateResults(self) -> None: ...
+    resultsCleared: typing.ClassVar[QtCore.pyqtSignal]
+    isRunningChanged: typing.ClassVar[QtCore.pyqtSignal]
+    resultAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def triggerResult(self, index: QtCore.QModelIndex, actionId: int = ...) -> None: ...
+    def isRunning(self) -> bool: ...
+    def hasQueueRequested(self) -> bool: ...
+    def proxyModel(self) -> typing.Optional[QgsLocatorProxyModel]: ...
+    def locator(self) -> typing.Optional[QgsLocator]: ...
+    def performSearch(self, text: typing.Optional[str]) -> None: ...
@@ -0,0 +1,233 @@
+# The PEP 484 type hints stub file for the _core.maprenderer module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import QgsDateTimeRange, QgsFeedback, QgsInterval
+from .annotations import (
+    QgsAnnotation, QgsRenderedAnnotationItemDetails, QgsRenderedItemDetails,
+)
+from .dxf import QgsMapSettings, QgsMapToPixel
+from .elevation import QgsTask
+from .geometry import QgsRectangle
+from .labeling import QgsLabelingResults
+from .layout import QgsFeatureFilterProvider
+from .project import QgsProject
+from .vector import QgsMapLayer, QgsRenderContext
+
+
+class QgsMapDecoration(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapDecoration') -> None: ...
+
+    def setDisplayName(self, name: typing.Optional[str]) -> None: ...
+    def hasFixedMapPosition(self) -> bool: ...
+    def displayName(self) -> str: ...
+    def render(self, mapSettings: 'QgsMapSettings', context: 'QgsRenderContext') -> None: ...
+
+
+class QgsTemporalUtils(PyQt5.sip.wrapper):
+
+    class AnimationExportSettings(PyQt5.sip.wrapper):
+
+        animationRange = ... # type: QgsDateTimeRange
+        availableTemporalRanges = ... # type: collections.abc.Iterable[QgsDateTimeRange]
+        decorations = ... # type: collections.abc.Iterable[QgsMapDecoration]
+        fileNameTemplate = ... # type: typing.Optional[str]
+        frameDuration = ... # type: QgsInterval
+        frameRate = ... # type: float
+        outputDirectory = ... # type: typing.Optional[str]
+        temporalRangeCumulative = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTemporalUtils.AnimationExportSettings') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTemporalUtils') -> None: ...
+
+    @staticmethod
+    def calculateDateTimesFromISO8601(string: typing.Optional[str], maxValues: int = ...) -> typing.Tuple[list[QtCore.QDateTime], bool, bool]: ...
+    @staticmethod
+    def calculateDateTimesUsingDuration(start: typing.Union[QtCore.QDateTime, datetime.datetime], end: typing.Union[QtCore.QDateTime, datetime.datetime], duration: typing.Optional[str], maxValues: int = ...) -> typing.Tuple[list[QtCore.QDateTime], bool, bool]: ...
+    @staticmethod
+    def calculateFrameTime(start: typing.Union[QtCore.QDateTime, datetime.datetime], frame: int, interval: QgsInterval) -> QtCore.QDateTime: ...
+    @staticmethod
+    def exportAnimation(mapSettings: QgsMapSettings, settings: 'QgsTemporalUtils.AnimationExportSettings', feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def usedTemporalRangesForProject(project: typing.Optional['QgsProject']) -> list[QgsDateTimeRange]: ...
+    @staticmethod
+    def calculateTemporalRangeForProject(project: typing.Optional['QgsProject']) -> QgsDateTimeRange: ...
+
+
+class QgsMapRendererCache(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def invalidateCacheForLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def clearCacheImage(self, cacheKey: typing.Optional[str]) -> None: ...
+    def dependentLayers(self, cacheKey: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    def transformedCacheImage(self, cacheKey: typing.Optional[str], mtp: QgsMapToPixel) -> QtGui.QImage: ...
+    def cacheImage(self, cacheKey: typing.Optional[str]) -> QtGui.QImage: ...
+    def hasAnyCacheImage(self, cacheKey: typing.Optional[str], minimumScaleThreshold: float = ..., maximumScaleThreshold: float = ...) -> bool: ...
+    def hasCacheImage(self, cacheKey: typing.Optional[str]) -> bool: ...
+    def setCacheImageWithParameters(self, cacheKey: typing.Optional[str], image: QtGui.QImage, extent: QgsRectangle, mapToPixel: QgsMapToPixel, dependentLayers: collections.abc.Iterable[QgsMapLayer] = ...) -> None: ...
+    def setCacheImage(self, cacheKey: typing.Optional[str], image: QtGui.QImage, dependentLayers: collections.abc.Iterable[QgsMapLayer] = ...) -> None: ...
+    def updateParameters(self, extent: QgsRectangle, mtp: QgsMapToPixel) -> bool: ...
+    @deprecated("""""")
+    def init(self, extent: QgsRectangle, scale: float) -> bool: ...
+    def clear(self) -> None: ...
+
+
+class QgsMapRendererJob(QtCore.QObject):
+
+    class Error(PyQt5.sip.wrapper):
+
+        layerID = ... # type: typing.Optional[str]
+        message = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, lid: typing.Optional[str], msg: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMapRendererJob.Error') -> None: ...
+
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+
+    def labelingHasNonDefaultCompositionModes(self) -> bool: ...
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    layerRendered: typing.ClassVar[QtCore.pyqtSignal]
+    layerRenderingStarted: typing.ClassVar[QtCore.pyqtSignal]
+    renderingLayersFinished: typing.ClassVar[QtCore.pyqtSignal]
+    def mapSettings(self) -> QgsMapSettings: ...
+    def renderingTime(self) -> int: ...
+    def setCache(self, cache: typing.Optional[QgsMapRendererCache]) -> None: ...
+    def errors(self) -> list['QgsMapRendererJob.Error']: ...
+    def featureFilterProvider(self) -> typing.Optional[QgsFeatureFilterProvider]: ...
+    def setFeatureFilterProvider(self, f: typing.Optional[QgsFeatureFilterProvider]) -> None: ...
+    def takeRenderedItemResults(self) -> typing.Optional['QgsRenderedItemResults']: ...
+    def takeLabelingResults(self) -> typing.Optional[QgsLabelingResults]: ...
+    def layersRedrawnFromCache(self) -> list[str]: ...
+    def usedCachedLabels(self) -> bool: ...
+    def isActive(self) -> bool: ...
+    def waitForFinished(self) -> None: ...
+    def cancelWithoutBlocking(self) -> None: ...
+    def cancel(self) -> None: ...
+    def start(self) -> None: ...
+
+
+class QgsMapRendererAbstractCustomPainterJob(QgsMapRendererJob):
+
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+
+    def preparePainter(self, painter: typing.Optional[QtGui.QPainter], backgroundColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+
+
+class QgsMapRendererCustomPainterJob(QgsMapRendererAbstractCustomPainterJob):
+
+    def __init__(self, settings: QgsMapSettings, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+
+    def renderPrepared(self) -> None: ...
+    def prepare(self) -> None: ...
+    def renderSynchronously(self) -> None: ...
+    def waitForFinishedWithEventLoop(self, flags: typing.Union[QtCore.QEventLoop.ProcessEventsFlags, QtCore.QEventLoop.ProcessEventsFlag] = ...) -> None: ...
+    def takeLabelingResults(self) -> typing.Optional[QgsLabelingResults]: ...
+    def usedCachedLabels(self) -> bool: ...
+    def isActive(self) -> bool: ...
+    def waitForFinished(self) -> None: ...
+    def cancelWithoutBlocking(self) -> None: ...
+    def cancel(self) -> None: ...
+
+
+class QgsMapRendererQImageJob(QgsMapRendererJob):
+
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+
+    def renderedImage(self) -> QtGui.QImage: ...
+
+
+class QgsMapRendererParallelJob(QgsMapRendererQImageJob):
+
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+
+    def renderedImage(self) -> QtGui.QImage: ...
+    def takeLabelingResults(self) -> typing.Optional[QgsLabelingResults]: ...
+    def usedCachedLabels(self) -> bool: ...
+    def isActive(self) -> bool: ...
+    def waitForFinished(self) -> None: ...
+    def cancelWithoutBlocking(self) -> None: ...
+    def cancel(self) -> None: ...
+
+
+class QgsMapRendererSequentialJob(QgsMapRendererQImageJob):
+
+    def __init__(self, settings: QgsMapSettings) -> None: ...
+
+    def internalFinished(self) -> None: ...
+    def renderedImage(self) -> QtGui.QImage: ...
+    def takeLabelingResults(self) -> typing.Optional[QgsLabelingResults]: ...
+    def usedCachedLabels(self) -> bool: ...
+    def isActive(self) -> bool: ...
+    def waitForFinished(self) -> None: ...
+    def cancelWithoutBlocking(self) -> None: ...
+    def cancel(self) -> None: ...
+
+
+class QgsMapRendererTask(QgsTask):
+
+    class ErrorType(int):
+        ImageAllocationFail = ... # type: QgsMapRendererTask.ErrorType
+        ImageSaveFail = ... # type: QgsMapRendererTask.ErrorType
+        ImageUnsupportedFormat = ... # type: QgsMapRendererTask.ErrorType
+
+    @typing.overload
+    def __init__(self, ms: QgsMapSettings, fileName: typing.Optional[str], fileFormat: typing.Optional[str] = ..., forceRaster: bool = ..., flags: typing.Union[QgsTask.Flags, QgsTask.Flag] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, ms: QgsMapSettings, p: typing.Optional[QtGui.QPainter]) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    renderingComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def setExportMetadata(self, exportMetadata: bool) -> None: ...
+    def setSaveWorldFile(self, save: bool) -> None: ...
+    def addDecorations(self, decorations: collections.abc.Iterable[QgsMapDecoration]) -> None: ...
+    def addAnnotations(self, annotations: collections.abc.Iterable[QgsAnnotation]) -> None: ...
+
+
+class QgsRenderedItemResults(PyQt5.sip.wrapper):
+
+    def __init__(self, extent: QgsRectangle = ...) -> None: ...
+
+    def eraseResultsFromLayers(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @typing.overload
+    def transferResults(self, other: typing.Optional['QgsRenderedItemResults'], layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @typing.overload
+    def transferResults(self, other: typing.Optional['QgsRenderedItemResults']) -> None: ...
+    def appendResults(self, results: collections.abc.Iterable[QgsRenderedItemDetails], context: QgsRenderContext) -> None: ...
+    def renderedAnnotationItemsInBounds(self, bounds: QgsRectangle) -> list[QgsRenderedAnnotationItemDetails]: ...
+    def renderedItems(self) -> list[QgsRenderedItemDetails]: ...
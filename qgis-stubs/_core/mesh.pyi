@@ -0,0 +1,1220 @@
+# The PEP 484 type hints stub file for the _core.mesh module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDataProviderTemporalCapabilities, QgsDateTimeRange,
+    QgsDoubleRange, QgsFeedback, QgsInterval,
+)
+from .elevation import (
+    QgsAbstractProfileGenerator, QgsAbstractProfileSource, QgsProfileRequest,
+)
+from .expression import QgsExpression
+from .geometry import QgsGeometry, QgsPoint, QgsRectangle
+from .labeling import QgsPalLayerSettings
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .project import QgsProject
+from .providers import QgsDataProvider, QgsMeshDriverMetadata
+from .raster import QgsColorRampShader, QgsRasterBlock, QgsRasterBlockFeedback
+from .symbology import (
+    QgsFillSymbol, QgsInterpolatedLineColor, QgsInterpolatedLineWidth,
+    QgsLineSymbol, QgsStyleEntityVisitorInterface,
+)
+from .vector import (
+    QgsMapLayer, QgsMapLayerElevationProperties, QgsMapLayerRenderer,
+    QgsMapLayerTemporalProperties, QgsPointXY, QgsReadWriteContext,
+    QgsRenderContext,
+)
+
+
+class QgsMesh3DAveragingMethod(PyQt5.sip.wrapper):
+
+    class Method(int):
+        MultiLevelsAveragingMethod = ... # type: QgsMesh3DAveragingMethod.Method
+        SigmaAveragingMethod = ... # type: QgsMesh3DAveragingMethod.Method
+        RelativeHeightAveragingMethod = ... # type: QgsMesh3DAveragingMethod.Method
+        ElevationAveragingMethod = ... # type: QgsMesh3DAveragingMethod.Method
+
+    @typing.overload
+    def __init__(self, method: 'QgsMesh3DAveragingMethod.Method') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMesh3DAveragingMethod') -> None: ...
+
+    def method(self) -> 'QgsMesh3DAveragingMethod.Method': ...
+    def clone(self) -> typing.Optional['QgsMesh3DAveragingMethod']: ...
+    @typing.overload
+    @staticmethod
+    def equals(a: typing.Optional['QgsMesh3DAveragingMethod'], b: typing.Optional['QgsMesh3DAveragingMethod']) -> bool: ...
+    @typing.overload
+    def equals(self, other: typing.Optional['QgsMesh3DAveragingMethod']) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    @staticmethod
+    def createFromXml(elem: QtXml.QDomElement) -> typing.Optional['QgsMesh3DAveragingMethod']: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def calculate(self, block3d: 'QgsMesh3DDataBlock', feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsMeshDataBlock': ...
+
+
+class QgsMeshMultiLevelsAveragingMethod(QgsMesh3DAveragingMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, startLevel: int, endLevel: int, countedFromTop: bool) -> None: ...
+    @typing.overload
+    def __init__(self, verticalLevel: int, countedFromTop: bool) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshMultiLevelsAveragingMethod') -> None: ...
+
+    def isSingleLevel(self) -> bool: ...
+    def countedFromTop(self) -> bool: ...
+    def endVerticalLevel(self) -> int: ...
+    def startVerticalLevel(self) -> int: ...
+    def clone(self) -> typing.Optional[QgsMesh3DAveragingMethod]: ...
+    def equals(self, other: typing.Optional[QgsMesh3DAveragingMethod]) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+
+
+class QgsMeshSigmaAveragingMethod(QgsMesh3DAveragingMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, startFraction: float, endFraction: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshSigmaAveragingMethod') -> None: ...
+
+    def endFraction(self) -> float: ...
+    def startFraction(self) -> float: ...
+    def clone(self) -> typing.Optional[QgsMesh3DAveragingMethod]: ...
+    def equals(self, other: typing.Optional[QgsMesh3DAveragingMethod]) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+
+
+class QgsMeshRelativeHeightAveragingMethod(QgsMesh3DAveragingMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, startHeight: float, endHeight: float, countedFromTop: bool) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRelativeHeightAveragingMethod') -> None: ...
+
+    def countedFromTop(self) -> bool: ...
+    def endHeight(self) -> float: ...
+    def startHeight(self) -> float: ...
+    def clone(self) -> typing.Optional[QgsMesh3DAveragingMethod]: ...
+    def equals(self, other: typing.Optional[QgsMesh3DAveragingMethod]) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+
+
+class QgsMeshElevationAveragingMethod(QgsMesh3DAveragingMethod):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, startElevation: float, endElevation: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshElevationAveragingMethod') -> None: ...
+
+    def endElevation(self) -> float: ...
+    def startElevation(self) -> float: ...
+    def clone(self) -> typing.Optional[QgsMesh3DAveragingMethod]: ...
+    def equals(self, other: typing.Optional[QgsMesh3DAveragingMethod]) -> bool: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+
+
+class QgsMeshEditingError(PyQt5.sip.wrapper):
+
+    elementIndex = ... # type: int
+    errorType = ... # type: Qgis.MeshEditingErrorType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, type: Qgis.MeshEditingErrorType, elementIndex: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshEditingError') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsMeshEditor(QtCore.QObject):
+
+    def __init__(self, meshLayer: typing.Optional['QgsMeshLayer']) -> None: ...
+
+    meshEdited: typing.ClassVar[QtCore.pyqtSignal]
+    def addVertexWithDelaunayRefinement(self, vertex: QgsPoint, tolerance: float) -> None: ...
+    def maximumVerticesPerFace(self) -> int: ...
+    def validVerticesCount(self) -> int: ...
+    def validFacesCount(self) -> int: ...
+    def edgeIsClose(self, point: QgsPointXY, tolerance: float) -> typing.Tuple[bool, int, int]: ...
+    def checkConsistency(self, error: QgsMeshEditingError) -> bool: ...
+    def isVertexFree(self, vertexIndex: int) -> bool: ...
+    def isVertexOnBoundary(self, vertexIndex: int) -> bool: ...
+    def freeVerticesIndexes(self) -> list[int]: ...
+    def reindex(self, renumbering: bool) -> bool: ...
+    def isModified(self) -> bool: ...
+    def extent(self) -> QgsRectangle: ...
+    def stopEditing(self) -> None: ...
+    def advancedEdit(self, editing: typing.Optional['QgsMeshAdvancedEditing']) -> None: ...
+    def changeCoordinates(self, verticesIndexes: collections.abc.Iterable[int], newCoordinates: collections.abc.Iterable[QgsPoint]) -> None: ...
+    def changeXYValues(self, verticesIndexes: collections.abc.Iterable[int], newValues: collections.abc.Iterable[QgsPointXY]) -> None: ...
+    def changeZValues(self, verticesIndexes: collections.abc.Iterable[int], newValues: collections.abc.Iterable[float]) -> None: ...
+    def removeVerticesFillHoles(self, verticesToRemoveIndexes: collections.abc.Iterable[int]) -> list[int]: ...
+    def removeVerticesWithoutFillHoles(self, verticesToRemoveIndexes: collections.abc.Iterable[int]) -> QgsMeshEditingError: ...
+    def addPointsAsVertices(self, point: collections.abc.Iterable[QgsPoint], tolerance: float) -> int: ...
+    def splitFaces(self, faceIndexes: collections.abc.Iterable[int]) -> int: ...
+    def faceCanBeSplit(self, faceIndex: int) -> bool: ...
+    def merge(self, vertexIndex1: int, vertexIndex2: int) -> None: ...
+    def canBeMerged(self, vertexIndex1: int, vertexIndex2: int) -> bool: ...
+    def flipEdge(self, vertexIndex1: int, vertexIndex2: int) -> None: ...
+    def edgeCanBeFlipped(self, vertexIndex1: int, vertexIndex2: int) -> bool: ...
+    def removeFaces(self, facesToRemove: collections.abc.Iterable[int]) -> QgsMeshEditingError: ...
+    def addFace(self, vertexIndexes: collections.abc.Iterable[int]) -> QgsMeshEditingError: ...
+    def isFaceGeometricallyCompatible(self, face: collections.abc.Iterable[int]) -> bool: ...
+    def faceCanBeAdded(self, face: collections.abc.Iterable[int]) -> bool: ...
+    def fixError(self, error: QgsMeshEditingError) -> bool: ...
+    def initializeWithErrorsFix(self) -> QgsMeshEditingError: ...
+    def initialize(self) -> QgsMeshEditingError: ...
+    def createZValueDatasetGroup(self) -> typing.Optional['QgsMeshDatasetGroup']: ...
+
+
+class QgsMesh(PyQt5.sip.wrapper):
+
+    class ElementType(int):
+        Vertex = ... # type: QgsMesh.ElementType
+        Edge = ... # type: QgsMesh.ElementType
+        Face = ... # type: QgsMesh.ElementType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMesh') -> None: ...
+
+    @staticmethod
+    def compareFaces(face1: collections.abc.Iterable[int], face2: collections.abc.Iterable[int]) -> bool: ...
+    def clear(self) -> None: ...
+    def edge(self, index: int) -> tuple[int, int]: ...
+    def face(self, index: int) -> list[int]: ...
+    def vertex(self, index: int) -> QgsPoint: ...
+    def edgeCount(self) -> int: ...
+    def faceCount(self) -> int: ...
+    def vertexCount(self) -> int: ...
+    def contains(self, type: 'QgsMesh.ElementType') -> bool: ...
+
+
+class QgsMeshDataSourceInterface(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDataSourceInterface') -> None: ...
+
+    def saveMeshFrame(self, mesh: QgsMesh) -> bool: ...
+    def populateMesh(self, mesh: typing.Optional[QgsMesh]) -> None: ...
+    def maximumVerticesCountPerFace(self) -> int: ...
+    def edgeCount(self) -> int: ...
+    def faceCount(self) -> int: ...
+    def vertexCount(self) -> int: ...
+    def contains(self, type: QgsMesh.ElementType) -> bool: ...
+
+
+class QgsMeshDatasetSourceInterface(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetSourceInterface') -> None: ...
+
+    def datasetIndexInTimeInterval(self, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime], groupIndex: int, time1: int, time2: int) -> list['QgsMeshDatasetIndex']: ...
+    def datasetIndexAtTime(self, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime], groupIndex: int, time: int, method: 'QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod') -> 'QgsMeshDatasetIndex': ...
+    @typing.overload
+    @deprecated("""""")
+    def persistDatasetGroup(self, path: typing.Optional[str], meta: 'QgsMeshDatasetGroupMetadata', datasetValues: collections.abc.Iterable['QgsMeshDataBlock'], datasetActive: collections.abc.Iterable['QgsMeshDataBlock'], times: collections.abc.Iterable[float]) -> bool: ...
+    @typing.overload
+    def persistDatasetGroup(self, outputFilePath: typing.Optional[str], outputDriver: typing.Optional[str], meta: 'QgsMeshDatasetGroupMetadata', datasetValues: collections.abc.Iterable['QgsMeshDataBlock'], datasetActive: collections.abc.Iterable['QgsMeshDataBlock'], times: collections.abc.Iterable[float]) -> bool: ...
+    @typing.overload
+    def persistDatasetGroup(self, outputFilePath: typing.Optional[str], outputDriver: typing.Optional[str], source: typing.Optional['QgsMeshDatasetSourceInterface'], datasetGroupIndex: int) -> bool: ...
+    def areFacesActive(self, index: 'QgsMeshDatasetIndex', faceIndex: int, count: int) -> 'QgsMeshDataBlock': ...
+    def isFaceActive(self, index: 'QgsMeshDatasetIndex', faceIndex: int) -> bool: ...
+    def dataset3dValues(self, index: 'QgsMeshDatasetIndex', faceIndex: int, count: int) -> 'QgsMesh3DDataBlock': ...
+    def datasetValues(self, index: 'QgsMeshDatasetIndex', valueIndex: int, count: int) -> 'QgsMeshDataBlock': ...
+    def datasetValue(self, index: 'QgsMeshDatasetIndex', valueIndex: int) -> 'QgsMeshDatasetValue': ...
+    def datasetMetadata(self, index: 'QgsMeshDatasetIndex') -> 'QgsMeshDatasetMetadata': ...
+    @typing.overload
+    def datasetGroupMetadata(self, groupIndex: int) -> 'QgsMeshDatasetGroupMetadata': ...
+    @typing.overload
+    def datasetGroupMetadata(self, index: 'QgsMeshDatasetIndex') -> 'QgsMeshDatasetGroupMetadata': ...
+    @typing.overload
+    def datasetCount(self, groupIndex: int) -> int: ...
+    @typing.overload
+    def datasetCount(self, index: 'QgsMeshDatasetIndex') -> int: ...
+    def datasetGroupCount(self) -> int: ...
+    def extraDatasets(self) -> list[str]: ...
+    def addDataset(self, uri: typing.Optional[str]) -> bool: ...
+
+
+class QgsMeshDataProvider(QgsDataProvider, QgsMeshDataSourceInterface, QgsMeshDatasetSourceInterface):
+
+    def __init__(self, uri: typing.Optional[str], providerOptions: QgsDataProvider.ProviderOptions, a2: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+
+    datasetGroupsAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def removeDatasetGroup(self, index: int) -> bool: ...
+    def close(self) -> None: ...
+    def driverMetadata(self) -> 'QgsMeshDriverMetadata': ...
+    def setTemporalUnit(self, unit: Qgis.TemporalUnit) -> None: ...
+    def temporalCapabilities(self) -> typing.Optional['QgsMeshDataProviderTemporalCapabilities']: ...
+
+
+class QgsMeshDataProviderTemporalCapabilities(QgsDataProviderTemporalCapabilities):
+
+    class MatchingTemporalDatasetMethod(int):
+        FindClosestDatasetBeforeStartRangeTime = ... # type: QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod
+        FindClosestDatasetFromStartRangeTime = ... # type: QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDataProviderTemporalCapabilities') -> None: ...
+
+    def firstTimeStepDuration(self, group: int) -> int: ...
+    def clear(self) -> None: ...
+    def datasetTime(self, index: 'QgsMeshDatasetIndex') -> int: ...
+    def temporalUnit(self) -> Qgis.TemporalUnit: ...
+    def setTemporalUnit(self, temporalUnit: Qgis.TemporalUnit) -> None: ...
+    @typing.overload
+    def timeExtent(self) -> QgsDateTimeRange: ...
+    @typing.overload
+    def timeExtent(self, reference: typing.Union[QtCore.QDateTime, datetime.datetime]) -> QgsDateTimeRange: ...
+    def referenceTime(self) -> QtCore.QDateTime: ...
+    def hasReferenceTime(self) -> bool: ...
+    def datasetIndexClosestFromRelativeTime(self, group: int, timeSinceGlobalReference: int) -> 'QgsMeshDatasetIndex': ...
+    def datasetIndexClosestBeforeRelativeTime(self, group: int, timeSinceGlobalReference: int) -> 'QgsMeshDatasetIndex': ...
+
+
+class QgsMeshDatasetIndex(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, group: int = ..., dataset: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetIndex') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def isValid(self) -> bool: ...
+    def dataset(self) -> int: ...
+    def group(self) -> int: ...
+
+
+class QgsMeshDatasetValue(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, x: float, y: float) -> None: ...
+    @typing.overload
+    def __init__(self, scalar: float) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetValue') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def y(self) -> float: ...
+    def x(self) -> float: ...
+    def scalar(self) -> float: ...
+    def setY(self, y: float) -> None: ...
+    def setX(self, x: float) -> None: ...
+    def set(self, scalar: float) -> None: ...
+
+
+class QgsMeshDataBlock(PyQt5.sip.wrapper):
+
+    class DataType(int):
+        ActiveFlagInteger = ... # type: QgsMeshDataBlock.DataType
+        ScalarDouble = ... # type: QgsMeshDataBlock.DataType
+        Vector2DDouble = ... # type: QgsMeshDataBlock.DataType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, type: 'QgsMeshDataBlock.DataType', count: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDataBlock') -> None: ...
+
+    def setValid(self, valid: bool) -> None: ...
+    def setValues(self, vals: collections.abc.Iterable[float]) -> None: ...
+    def values(self) -> list[float]: ...
+    def setActive(self, vals: collections.abc.Iterable[int]) -> None: ...
+    @typing.overload
+    def active(self, index: int) -> bool: ...
+    @typing.overload
+    def active(self) -> list[int]: ...
+    def value(self, index: int) -> QgsMeshDatasetValue: ...
+    def isValid(self) -> bool: ...
+    def count(self) -> int: ...
+    def type(self) -> 'QgsMeshDataBlock.DataType': ...
+
+
+class QgsMesh3DDataBlock(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, count: int, isVector: bool) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMesh3DDataBlock') -> None: ...
+
+    def setValues(self, doubleBuffer: collections.abc.Iterable[float]) -> None: ...
+    def value(self, volumeIndex: int) -> QgsMeshDatasetValue: ...
+    def values(self) -> list[float]: ...
+    def setFaceToVolumeIndex(self, faceToVolumeIndex: collections.abc.Iterable[int]) -> None: ...
+    def faceToVolumeIndex(self) -> list[int]: ...
+    def setVerticalLevels(self, verticalLevels: collections.abc.Iterable[float]) -> None: ...
+    def verticalLevels(self) -> list[float]: ...
+    def setVerticalLevelsCount(self, verticalLevelsCount: collections.abc.Iterable[int]) -> None: ...
+    def verticalLevelsCount(self) -> list[int]: ...
+    def volumesCount(self) -> int: ...
+    def lastVolumeIndex(self) -> int: ...
+    def firstVolumeIndex(self) -> int: ...
+    def count(self) -> int: ...
+    def isVector(self) -> bool: ...
+    def isValid(self) -> bool: ...
+    def setValid(self, valid: bool) -> None: ...
+
+
+class QgsMeshDatasetGroupMetadata(PyQt5.sip.wrapper):
+
+    class DataType(int):
+        DataOnFaces = ... # type: QgsMeshDatasetGroupMetadata.DataType
+        DataOnVertices = ... # type: QgsMeshDatasetGroupMetadata.DataType
+        DataOnVolumes = ... # type: QgsMeshDatasetGroupMetadata.DataType
+        DataOnEdges = ... # type: QgsMeshDatasetGroupMetadata.DataType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], uri: typing.Optional[str], isScalar: bool, dataType: 'QgsMeshDatasetGroupMetadata.DataType', minimum: float, maximum: float, maximumVerticalLevels: int, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime], isTemporal: bool, extraOptions: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetGroupMetadata') -> None: ...
+
+    def referenceTime(self) -> QtCore.QDateTime: ...
+    def maximumVerticalLevelsCount(self) -> int: ...
+    def maximum(self) -> float: ...
+    def minimum(self) -> float: ...
+    def dataType(self) -> 'QgsMeshDatasetGroupMetadata.DataType': ...
+    def isTemporal(self) -> bool: ...
+    def isScalar(self) -> bool: ...
+    def isVector(self) -> bool: ...
+    def extraOptions(self) -> dict[str, str]: ...
+    def uri(self) -> str: ...
+    def parentQuantityName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsMeshDatasetMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, time: float, isValid: bool, minimum: float, maximum: float, maximumVerticalLevels: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetMetadata') -> None: ...
+
+    def maximumVerticalLevelsCount(self) -> int: ...
+    def maximum(self) -> float: ...
+    def minimum(self) -> float: ...
+    def isValid(self) -> bool: ...
+    def time(self) -> float: ...
+
+
+class QgsMeshDataset(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDataset') -> None: ...
+
+    def valuesCount(self) -> int: ...
+    def metadata(self) -> QgsMeshDatasetMetadata: ...
+    def isActive(self, faceIndex: int) -> bool: ...
+    def areFacesActive(self, faceIndex: int, count: int) -> QgsMeshDataBlock: ...
+    def datasetValues(self, isScalar: bool, valueIndex: int, count: int) -> QgsMeshDataBlock: ...
+    def datasetValue(self, valueIndex: int) -> QgsMeshDatasetValue: ...
+
+
+class QgsMeshDatasetGroup(PyQt5.sip.wrapper):
+
+    class Type(int):
+        Unknown = ... # type: QgsMeshDatasetGroup.Type
+        Persistent = ... # type: QgsMeshDatasetGroup.Type
+        Memory = ... # type: QgsMeshDatasetGroup.Type
+        Virtual = ... # type: QgsMeshDatasetGroup.Type
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], dataType: QgsMeshDatasetGroupMetadata.DataType) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetGroup') -> None: ...
+
+    def setReferenceTime(self, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def description(self) -> str: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def datasetGroupNamesDependentOn(self) -> list[str]: ...
+    def setStatisticObsolete(self) -> None: ...
+    def calculateStatistic(self) -> None: ...
+    def checkValueCountPerDataset(self, count: int) -> bool: ...
+    def setIsScalar(self, isScalar: bool) -> None: ...
+    def isScalar(self) -> bool: ...
+    def extraMetadata(self) -> dict[str, str]: ...
+    def addExtraMetadata(self, key: typing.Optional[str], value: typing.Optional[str]) -> None: ...
+    def setDataType(self, dataType: QgsMeshDatasetGroupMetadata.DataType) -> None: ...
+    def dataType(self) -> QgsMeshDatasetGroupMetadata.DataType: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def setMinimumMaximum(self, min: float, max: float) -> None: ...
+    def maximum(self) -> float: ...
+    def minimum(self) -> float: ...
+    def type(self) -> 'QgsMeshDatasetGroup.Type': ...
+    def dataset(self, index: int) -> typing.Optional[QgsMeshDataset]: ...
+    def datasetCount(self) -> int: ...
+    def datasetMetadata(self, datasetIndex: int) -> QgsMeshDatasetMetadata: ...
+    def groupMetadata(self) -> QgsMeshDatasetGroupMetadata: ...
+    def initialize(self) -> None: ...
+
+
+class QgsMeshDatasetGroupTreeItem(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, defaultName: typing.Optional[str], sourceName: typing.Optional[str], isVector: bool, index: int) -> None: ...
+    @typing.overload
+    def __init__(self, itemElement: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDatasetGroupTreeItem') -> None: ...
+
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def setPersistentDatasetGroup(self, uri: typing.Optional[str]) -> None: ...
+    def setDatasetGroup(self, datasetGroup: typing.Optional[QgsMeshDatasetGroup]) -> None: ...
+    def description(self) -> str: ...
+    def groupIndexDependencies(self) -> list[int]: ...
+    def datasetGroupType(self) -> QgsMeshDatasetGroup.Type: ...
+    def defaultName(self) -> str: ...
+    def setIsEnabled(self, isEnabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def datasetGroupIndex(self) -> int: ...
+    def isVector(self) -> bool: ...
+    def providerName(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def row(self) -> int: ...
+    def parentItem(self) -> typing.Optional['QgsMeshDatasetGroupTreeItem']: ...
+    def enabledDatasetGroupIndexes(self) -> list[int]: ...
+    def totalChildCount(self) -> int: ...
+    def childCount(self) -> int: ...
+    def childFromDatasetGroupIndex(self, index: int) -> typing.Optional['QgsMeshDatasetGroupTreeItem']: ...
+    def child(self, row: int) -> typing.Optional['QgsMeshDatasetGroupTreeItem']: ...
+    def removeChild(self, item: typing.Optional['QgsMeshDatasetGroupTreeItem']) -> None: ...
+    def appendChild(self, item: typing.Optional['QgsMeshDatasetGroupTreeItem']) -> None: ...
+    def clone(self) -> typing.Optional['QgsMeshDatasetGroupTreeItem']: ...
+
+
+class QgsMeshLayer(QgsMapLayer, QgsAbstractProfileSource):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadDefaultStyle = ... # type: bool
+        skipCrsValidation = ... # type: bool
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext' = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMeshLayer.LayerOptions') -> None: ...
+
+    def __init__(self, path: typing.Optional[str] = ..., baseName: typing.Optional[str] = ..., providerLib: typing.Optional[str] = ..., options: 'QgsMeshLayer.LayerOptions' = ...) -> None: ...
+
+    reloaded: typing.ClassVar[QtCore.pyqtSignal]
+    timeSettingsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    activeVectorDatasetGroupChanged: typing.ClassVar[QtCore.pyqtSignal]
+    activeScalarDatasetGroupChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setTransformContext(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    def datasetsPathUnique(self, path: typing.Optional[str]) -> bool: ...
+    def activeScalarDatasetIndex(self, rendererContext: QgsRenderContext) -> QgsMeshDatasetIndex: ...
+    def minimumMaximumActiveScalarDataset(self, extent: QgsRectangle, datasetIndex: QgsMeshDatasetIndex) -> typing.Tuple[bool, float, float]: ...
+    def setLabeling(self, labeling: typing.Optional['QgsAbstractMeshLayerLabeling']) -> None: ...
+    def labeling(self) -> typing.Optional['QgsAbstractMeshLayerLabeling']: ...
+    def setLabelsEnabled(self, enabled: bool) -> None: ...
+    def labelsEnabled(self) -> bool: ...
+    def meshEdgeCount(self) -> int: ...
+    def meshFaceCount(self) -> int: ...
+    def meshVertexCount(self) -> int: ...
+    def contains(self, type: QgsMesh.ElementType) -> bool: ...
+    def isModified(self) -> bool: ...
+    def meshEditor(self) -> typing.Optional[QgsMeshEditor]: ...
+    def reindex(self, transform: 'QgsCoordinateTransform', renumber: bool) -> bool: ...
+    def stopFrameEditing(self, transform: 'QgsCoordinateTransform') -> None: ...
+    def rollBackFrameEditing(self, transform: 'QgsCoordinateTransform', continueEditing: bool = ...) -> bool: ...
+    def commitFrameEditing(self, transform: 'QgsCoordinateTransform', continueEditing: bool = ...) -> bool: ...
+    @typing.overload
+    def startFrameEditing(self, transform: 'QgsCoordinateTransform') -> bool: ...
+    @typing.overload
+    def startFrameEditing(self, transform: 'QgsCoordinateTransform', fixErrors: bool) -> typing.Tuple[bool, QgsMeshEditingError]: ...
+    def datasetRelativeTimeInMilliseconds(self, index: QgsMeshDatasetIndex) -> int: ...
+    def datasetRelativeTime(self, index: QgsMeshDatasetIndex) -> QgsInterval: ...
+    def firstValidTimeStep(self) -> QgsInterval: ...
+    def resetDatasetGroupTreeItem(self) -> None: ...
+    def setDatasetGroupTreeRootItem(self, rootItem: typing.Optional[QgsMeshDatasetGroupTreeItem]) -> None: ...
+    def datasetGroupTreeRootItem(self) -> typing.Optional[QgsMeshDatasetGroupTreeItem]: ...
+    def selectFacesByExpression(self, expression: QgsExpression) -> list[int]: ...
+    def selectVerticesByExpression(self, expression: QgsExpression) -> list[int]: ...
+    def closestElement(self, elementType: QgsMesh.ElementType, point: QgsPointXY, searchRadius: float) -> typing.Tuple[int, QgsPointXY]: ...
+    def snapOnElement(self, elementType: QgsMesh.ElementType, point: QgsPointXY, searchRadius: float) -> QgsPointXY: ...
+    def setTemporalMatchingMethod(self, matchingMethod: QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod) -> None: ...
+    def setReferenceTime(self, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def staticVectorDatasetIndex(self, group: int = ...) -> QgsMeshDatasetIndex: ...
+    def staticScalarDatasetIndex(self, group: int = ...) -> QgsMeshDatasetIndex: ...
+    def activeVectorDatasetAtTime(self, timeRange: QgsDateTimeRange, group: int = ...) -> QgsMeshDatasetIndex: ...
+    def activeScalarDatasetAtTime(self, timeRange: QgsDateTimeRange, group: int = ...) -> QgsMeshDatasetIndex: ...
+    def datasetIndexInRelativeTimeInterval(self, startRelativeTime: QgsInterval, endRelativeTime: QgsInterval, datasetGroupIndex: int) -> list[QgsMeshDatasetIndex]: ...
+    def datasetIndexAtRelativeTime(self, relativeTime: QgsInterval, datasetGroupIndex: int) -> QgsMeshDatasetIndex: ...
+    def datasetIndexAtTime(self, timeRange: QgsDateTimeRange, datasetGroupIndex: int) -> QgsMeshDatasetIndex: ...
+    def dataset1dValue(self, index: QgsMeshDatasetIndex, point: QgsPointXY, searchRadius: float) -> QgsMeshDatasetValue: ...
+    def dataset3dValue(self, index: QgsMeshDatasetIndex, point: QgsPointXY) -> QgsMesh3DDataBlock: ...
+    def areFacesActive(self, index: QgsMeshDatasetIndex, faceIndex: int, count: int) -> QgsMeshDataBlock: ...
+    def isFaceActive(self, index: QgsMeshDatasetIndex, faceIndex: int) -> bool: ...
+    def dataset3dValues(self, index: QgsMeshDatasetIndex, faceIndex: int, count: int) -> QgsMesh3DDataBlock: ...
+    def datasetValues(self, index: QgsMeshDatasetIndex, valueIndex: int, count: int) -> QgsMeshDataBlock: ...
+    @typing.overload
+    def datasetValue(self, index: QgsMeshDatasetIndex, valueIndex: int) -> QgsMeshDatasetValue: ...
+    @typing.overload
+    def datasetValue(self, index: QgsMeshDatasetIndex, point: QgsPointXY, searchRadius: float = ...) -> QgsMeshDatasetValue: ...
+    def datasetMetadata(self, index: QgsMeshDatasetIndex) -> QgsMeshDatasetMetadata: ...
+    def datasetCount(self, index: QgsMeshDatasetIndex) -> int: ...
+    def datasetGroupMetadata(self, index: QgsMeshDatasetIndex) -> QgsMeshDatasetGroupMetadata: ...
+    def enabledDatasetGroupsIndexes(self) -> list[int]: ...
+    def datasetGroupsIndexes(self) -> list[int]: ...
+    def extraDatasetGroupCount(self) -> int: ...
+    def datasetGroupCount(self) -> int: ...
+    def formatTime(self, hours: float) -> str: ...
+    def setTimeSettings(self, settings: 'QgsMeshTimeSettings') -> None: ...
+    def timeSettings(self) -> 'QgsMeshTimeSettings': ...
+    def setRendererSettings(self, settings: 'QgsMeshRendererSettings', repaint: bool = ...) -> None: ...
+    def rendererSettings(self) -> 'QgsMeshRendererSettings': ...
+    def updateTriangularMesh(self, transform: 'QgsCoordinateTransform' = ...) -> None: ...
+    def saveDataset(self, path: typing.Optional[str], datasetGroupIndex: int, driver: typing.Optional[str]) -> bool: ...
+    def removeDatasets(self, name: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def addDatasets(self, path: typing.Optional[str], defaultReferenceTime: typing.Union[QtCore.QDateTime, datetime.datetime] = ...) -> bool: ...
+    @typing.overload
+    def addDatasets(self, datasetGroup: typing.Optional[QgsMeshDatasetGroup]) -> bool: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def supportsEditing(self) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def htmlMetadata(self) -> str: ...
+    def subLayers(self) -> list[str]: ...
+    def reload(self) -> None: ...
+    def elevationProperties(self) -> typing.Optional[QgsMapLayerElevationProperties]: ...
+    def temporalProperties(self) -> typing.Optional[QgsMapLayerTemporalProperties]: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def readXml(self, layer_node: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def decodedSource(self, source: typing.Optional[str], provider: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def createProfileGenerator(self, request: QgsProfileRequest) -> typing.Optional[QgsAbstractProfileGenerator]: ...
+    def profileSource(self) -> typing.Optional[QgsAbstractProfileSource]: ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def extent(self) -> QgsRectangle: ...
+    def clone(self) -> typing.Optional['QgsMeshLayer']: ...
+    def dataProvider(self) -> typing.Optional[QgsMeshDataProvider]: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsMeshLayerElevationProperties(QgsMapLayerElevationProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def setElevationLimit(self, limit: float) -> None: ...
+    def elevationLimit(self) -> float: ...
+    def setProfileSymbology(self, symbology: Qgis.ProfileSurfaceSymbology) -> None: ...
+    def profileSymbology(self) -> Qgis.ProfileSurfaceSymbology: ...
+    def setProfileFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def profileFillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setProfileLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def profileLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setFixedRangePerGroup(self, ranges: dict[int, QgsDoubleRange]) -> None: ...
+    def fixedRangePerGroup(self) -> dict[int, QgsDoubleRange]: ...
+    def setFixedRange(self, range: QgsDoubleRange) -> None: ...
+    def fixedRange(self) -> QgsDoubleRange: ...
+    def setMode(self, mode: Qgis.MeshElevationMode) -> None: ...
+    def mode(self) -> Qgis.MeshElevationMode: ...
+    def flags(self) -> QgsMapLayerElevationProperties.Flags: ...
+    def showByDefaultInElevationProfilePlots(self) -> bool: ...
+    def significantZValues(self, layer: typing.Optional[QgsMapLayer]) -> list[float]: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> QgsDoubleRange: ...
+    def isVisibleInZRange(self, range: QgsDoubleRange, layer: typing.Optional[QgsMapLayer] = ...) -> bool: ...
+    def clone(self) -> typing.Optional['QgsMeshLayerElevationProperties']: ...
+    def htmlSummary(self) -> str: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+
+
+class QgsMeshLayerTemporalProperties(QgsMapLayerTemporalProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., enabled: bool = ...) -> None: ...
+
+    def setAlwaysLoadReferenceTimeFromSource(self, autoReloadFromProvider: bool) -> None: ...
+    def alwaysLoadReferenceTimeFromSource(self) -> bool: ...
+    def setIsValid(self, isValid: bool) -> None: ...
+    def isValid(self) -> bool: ...
+    def setMatchingMethod(self, matchingMethod: QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod) -> None: ...
+    def matchingMethod(self) -> QgsMeshDataProviderTemporalCapabilities.MatchingTemporalDatasetMethod: ...
+    def setReferenceTime(self, referenceTime: typing.Union[QtCore.QDateTime, datetime.datetime], capabilities: typing.Optional[QgsDataProviderTemporalCapabilities]) -> None: ...
+    def referenceTime(self) -> QtCore.QDateTime: ...
+    def timeExtent(self) -> QgsDateTimeRange: ...
+    def setDefaultsFromDataProviderTemporalCapabilities(self, capabilities: typing.Optional[QgsDataProviderTemporalCapabilities]) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+
+
+class QgsMeshRendererMeshSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererMeshSettings') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def setLineWidthUnit(self, lineWidthUnit: Qgis.RenderUnit) -> None: ...
+    def lineWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setLineWidth(self, lineWidth: float) -> None: ...
+    def lineWidth(self) -> float: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+
+
+class QgsMeshRendererScalarSettings(PyQt5.sip.wrapper):
+
+    class DataResamplingMethod(int):
+        NoResampling = ... # type: QgsMeshRendererScalarSettings.DataResamplingMethod
+        NeighbourAverage = ... # type: QgsMeshRendererScalarSettings.DataResamplingMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererScalarSettings') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext = ...) -> QtXml.QDomElement: ...
+    def extent(self) -> Qgis.MeshRangeExtent: ...
+    def setExtent(self, extent: Qgis.MeshRangeExtent) -> None: ...
+    def limits(self) -> Qgis.MeshRangeLimit: ...
+    def setLimits(self, limits: Qgis.MeshRangeLimit) -> None: ...
+    def setEdgeStrokeWidthUnit(self, edgeStrokeWidthUnit: Qgis.RenderUnit) -> None: ...
+    def edgeStrokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setEdgeStrokeWidth(self, strokeWidth: 'QgsInterpolatedLineWidth') -> None: ...
+    def edgeStrokeWidth(self) -> 'QgsInterpolatedLineWidth': ...
+    def setDataResamplingMethod(self, dataResamplingMethod: 'QgsMeshRendererScalarSettings.DataResamplingMethod') -> None: ...
+    def dataResamplingMethod(self) -> 'QgsMeshRendererScalarSettings.DataResamplingMethod': ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setClassificationMinimumMaximum(self, minimum: float, maximum: float) -> None: ...
+    def classificationMaximum(self) -> float: ...
+    def classificationMinimum(self) -> float: ...
+    def setColorRampShader(self, shader: 'QgsColorRampShader') -> None: ...
+    def colorRampShader(self) -> 'QgsColorRampShader': ...
+
+
+class QgsMeshRendererVectorArrowSettings(PyQt5.sip.wrapper):
+
+    class ArrowScalingMethod(int):
+        MinMax = ... # type: QgsMeshRendererVectorArrowSettings.ArrowScalingMethod
+        Scaled = ... # type: QgsMeshRendererVectorArrowSettings.ArrowScalingMethod
+        Fixed = ... # type: QgsMeshRendererVectorArrowSettings.ArrowScalingMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererVectorArrowSettings') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def setArrowHeadLengthRatio(self, arrowHeadLengthRatio: float) -> None: ...
+    def arrowHeadLengthRatio(self) -> float: ...
+    def setArrowHeadWidthRatio(self, arrowHeadWidthRatio: float) -> None: ...
+    def arrowHeadWidthRatio(self) -> float: ...
+    def setFixedShaftLength(self, fixedShaftLength: float) -> None: ...
+    def fixedShaftLength(self) -> float: ...
+    def setScaleFactor(self, scaleFactor: float) -> None: ...
+    def scaleFactor(self) -> float: ...
+    def setMaxShaftLength(self, maxShaftLength: float) -> None: ...
+    def maxShaftLength(self) -> float: ...
+    def setMinShaftLength(self, minShaftLength: float) -> None: ...
+    def minShaftLength(self) -> float: ...
+    def setShaftLengthMethod(self, shaftLengthMethod: 'QgsMeshRendererVectorArrowSettings.ArrowScalingMethod') -> None: ...
+    def shaftLengthMethod(self) -> 'QgsMeshRendererVectorArrowSettings.ArrowScalingMethod': ...
+
+
+class QgsMeshRendererVectorStreamlineSettings(PyQt5.sip.wrapper):
+
+    class SeedingStartPointsMethod(int):
+        MeshGridded = ... # type: QgsMeshRendererVectorStreamlineSettings.SeedingStartPointsMethod
+        Random = ... # type: QgsMeshRendererVectorStreamlineSettings.SeedingStartPointsMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererVectorStreamlineSettings') -> None: ...
+
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def setSeedingDensity(self, seedingDensity: float) -> None: ...
+    def seedingDensity(self) -> float: ...
+    def setSeedingMethod(self, seedingMethod: 'QgsMeshRendererVectorStreamlineSettings.SeedingStartPointsMethod') -> None: ...
+    def seedingMethod(self) -> 'QgsMeshRendererVectorStreamlineSettings.SeedingStartPointsMethod': ...
+
+
+class QgsMeshRendererVectorTracesSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererVectorTracesSettings') -> None: ...
+
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def setMaximumTailLengthUnit(self, maximumTailLengthUnit: Qgis.RenderUnit) -> None: ...
+    def maximumTailLengthUnit(self) -> Qgis.RenderUnit: ...
+    def setParticlesCount(self, value: int) -> None: ...
+    def particlesCount(self) -> int: ...
+    def setMaximumTailLength(self, maximumTailLength: float) -> None: ...
+    def maximumTailLength(self) -> float: ...
+
+
+class QgsMeshRendererVectorWindBarbSettings(PyQt5.sip.wrapper):
+
+    class WindSpeedUnit(int):
+        MetersPerSecond = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+        KilometersPerHour = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+        Knots = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+        MilesPerHour = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+        FeetPerSecond = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+        OtherUnit = ... # type: QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererVectorWindBarbSettings') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def setMagnitudeUnits(self, units: 'QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit') -> None: ...
+    def magnitudeUnits(self) -> 'QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit': ...
+    def setShaftLengthUnits(self, shaftLengthUnit: Qgis.RenderUnit) -> None: ...
+    def shaftLengthUnits(self) -> Qgis.RenderUnit: ...
+    def setShaftLength(self, shaftLength: float) -> None: ...
+    def shaftLength(self) -> float: ...
+    def setMagnitudeMultiplier(self, magnitudeMultiplier: float) -> None: ...
+    def magnitudeMultiplier(self) -> float: ...
+
+
+class QgsMeshRendererVectorSettings(PyQt5.sip.wrapper):
+
+    class Symbology(int):
+        Arrows = ... # type: QgsMeshRendererVectorSettings.Symbology
+        Streamlines = ... # type: QgsMeshRendererVectorSettings.Symbology
+        Traces = ... # type: QgsMeshRendererVectorSettings.Symbology
+        WindBarbs = ... # type: QgsMeshRendererVectorSettings.Symbology
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererVectorSettings') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext = ...) -> QtXml.QDomElement: ...
+    def setWindBarbSettings(self, windBarbSettings: QgsMeshRendererVectorWindBarbSettings) -> None: ...
+    def windBarbSettings(self) -> QgsMeshRendererVectorWindBarbSettings: ...
+    def setTracesSettings(self, tracesSettings: QgsMeshRendererVectorTracesSettings) -> None: ...
+    def tracesSettings(self) -> QgsMeshRendererVectorTracesSettings: ...
+    def setStreamLinesSettings(self, streamLinesSettings: QgsMeshRendererVectorStreamlineSettings) -> None: ...
+    def streamLinesSettings(self) -> QgsMeshRendererVectorStreamlineSettings: ...
+    def setArrowsSettings(self, arrowSettings: QgsMeshRendererVectorArrowSettings) -> None: ...
+    def arrowSettings(self) -> QgsMeshRendererVectorArrowSettings: ...
+    def vectorStrokeColoring(self) -> 'QgsInterpolatedLineColor': ...
+    def setColorRampShader(self, colorRampShader: 'QgsColorRampShader') -> None: ...
+    def colorRampShader(self) -> 'QgsColorRampShader': ...
+    def setColoringMethod(self, coloringMethod: 'QgsInterpolatedLineColor.ColoringMethod') -> None: ...
+    def coloringMethod(self) -> 'QgsInterpolatedLineColor.ColoringMethod': ...
+    def setSymbology(self, symbology: 'QgsMeshRendererVectorSettings.Symbology') -> None: ...
+    def symbology(self) -> 'QgsMeshRendererVectorSettings.Symbology': ...
+    def setUserGridCellHeight(self, height: int) -> None: ...
+    def userGridCellHeight(self) -> int: ...
+    def setUserGridCellWidth(self, width: int) -> None: ...
+    def userGridCellWidth(self) -> int: ...
+    def setOnUserDefinedGrid(self, enabled: bool) -> None: ...
+    def isOnUserDefinedGrid(self) -> bool: ...
+    def setFilterMax(self, filterMax: float) -> None: ...
+    def filterMax(self) -> float: ...
+    def setFilterMin(self, filterMin: float) -> None: ...
+    def filterMin(self) -> float: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setLineWidth(self, lineWidth: float) -> None: ...
+    def lineWidth(self) -> float: ...
+
+
+class QgsMeshRendererSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshRendererSettings') -> None: ...
+
+    def hasSettings(self, datasetGroupIndex: int) -> bool: ...
+    def setActiveVectorDatasetGroup(self, activeVectorDatasetGroup: int) -> None: ...
+    def activeVectorDatasetGroup(self) -> int: ...
+    def setActiveScalarDatasetGroup(self, activeScalarDatasetGroup: int) -> None: ...
+    def activeScalarDatasetGroup(self) -> int: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext = ...) -> QtXml.QDomElement: ...
+    def setAveragingMethod(self, method: typing.Optional[QgsMesh3DAveragingMethod]) -> None: ...
+    def averagingMethod(self) -> typing.Optional[QgsMesh3DAveragingMethod]: ...
+    def removeVectorSettings(self, groupIndex: int) -> bool: ...
+    def hasVectorSettings(self, groupIndex: int) -> bool: ...
+    def setVectorSettings(self, groupIndex: int, settings: QgsMeshRendererVectorSettings) -> None: ...
+    def vectorSettings(self, groupIndex: int) -> QgsMeshRendererVectorSettings: ...
+    def removeScalarSettings(self, groupIndex: int) -> bool: ...
+    def hasScalarSettings(self, groupIndex: int) -> bool: ...
+    def setScalarSettings(self, groupIndex: int, settings: QgsMeshRendererScalarSettings) -> None: ...
+    def scalarSettings(self, groupIndex: int) -> QgsMeshRendererScalarSettings: ...
+    def setEdgeMeshSettings(self, settings: QgsMeshRendererMeshSettings) -> None: ...
+    def edgeMeshSettings(self) -> QgsMeshRendererMeshSettings: ...
+    def setTriangularMeshSettings(self, settings: QgsMeshRendererMeshSettings) -> None: ...
+    def triangularMeshSettings(self) -> QgsMeshRendererMeshSettings: ...
+    def setNativeMeshSettings(self, settings: QgsMeshRendererMeshSettings) -> None: ...
+    def nativeMeshSettings(self) -> QgsMeshRendererMeshSettings: ...
+
+
+class QgsMeshSpatialIndex(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, mesh: QgsMesh, feedback: typing.Optional[QgsFeedback] = ..., elementType: QgsMesh.ElementType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsMeshSpatialIndex') -> None: ...
+
+    def removeFace(self, faceIndex: int, mesh: QgsMesh) -> None: ...
+    def addFace(self, faceIndex: int, mesh: QgsMesh) -> None: ...
+    def elementType(self) -> QgsMesh.ElementType: ...
+    def nearestNeighbor(self, point: QgsPointXY, neighbors: int) -> list[int]: ...
+    def intersects(self, rectangle: QgsRectangle) -> list[int]: ...
+
+
+class QgsMeshTimeSettings(PyQt5.sip.wrapper):
+
+    class TimeUnit(int):
+        seconds = ... # type: QgsMeshTimeSettings.TimeUnit
+        minutes = ... # type: QgsMeshTimeSettings.TimeUnit
+        hours = ... # type: QgsMeshTimeSettings.TimeUnit
+        days = ... # type: QgsMeshTimeSettings.TimeUnit
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshTimeSettings') -> None: ...
+
+    def setAbsoluteTimeFormat(self, absoluteTimeFormat: typing.Optional[str]) -> None: ...
+    def absoluteTimeFormat(self) -> str: ...
+    def setRelativeTimeFormat(self, relativeTimeFormat: typing.Optional[str]) -> None: ...
+    def relativeTimeFormat(self) -> str: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+
+
+class QgsMeshVectorTraceAnimationGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsMeshLayer], rendererContext: QgsRenderContext) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsMeshVectorTraceAnimationGenerator') -> None: ...
+
+    def setTailPersitence(self, p: float) -> None: ...
+    def setMinimumTailLength(self, l: int) -> None: ...
+    def setTailFactor(self, fct: float) -> None: ...
+    def setParticlesSize(self, width: float) -> None: ...
+    def setParticlesColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setParticlesLifeTime(self, particleLifeTime: float) -> None: ...
+    def setMaxSpeedPixel(self, max: int) -> None: ...
+    def setFPS(self, FPS: int) -> None: ...
+    def imageRendered(self) -> QtGui.QImage: ...
+    def seedRandomParticles(self, count: int) -> None: ...
+
+
+class QgsMeshCalculator(PyQt5.sip.wrapper):
+
+    class Result(int):
+        Success = ... # type: QgsMeshCalculator.Result
+        Canceled = ... # type: QgsMeshCalculator.Result
+        CreateOutputError = ... # type: QgsMeshCalculator.Result
+        InputLayerError = ... # type: QgsMeshCalculator.Result
+        ParserError = ... # type: QgsMeshCalculator.Result
+        InvalidDatasets = ... # type: QgsMeshCalculator.Result
+        EvaluateError = ... # type: QgsMeshCalculator.Result
+        MemoryError = ... # type: QgsMeshCalculator.Result
+
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, formulaString: typing.Optional[str], outputFile: typing.Optional[str], outputExtent: QgsRectangle, startTime: float, endTime: float, layer: typing.Optional[QgsMeshLayer]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, formulaString: typing.Optional[str], outputFile: typing.Optional[str], outputMask: QgsGeometry, startTime: float, endTime: float, layer: typing.Optional[QgsMeshLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, formulaString: typing.Optional[str], outputDriver: typing.Optional[str], outputGroupName: typing.Optional[str], outputFile: typing.Optional[str], outputExtent: QgsRectangle, startTime: float, endTime: float, layer: typing.Optional[QgsMeshLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, formulaString: typing.Optional[str], outputDriver: typing.Optional[str], outputGroupName: typing.Optional[str], outputFile: typing.Optional[str], outputMask: QgsGeometry, startTime: float, endTime: float, layer: typing.Optional[QgsMeshLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, formulaString: typing.Optional[str], outputGroupName: typing.Optional[str], outputExtent: QgsRectangle, destination: QgsMeshDatasetGroup.Type, layer: typing.Optional[QgsMeshLayer], startTime: float, endTime: float) -> None: ...
+    @typing.overload
+    def __init__(self, formulaString: typing.Optional[str], outputGroupName: typing.Optional[str], outputMask: QgsGeometry, destination: QgsMeshDatasetGroup.Type, layer: typing.Optional[QgsMeshLayer], startTime: float, endTime: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshCalculator') -> None: ...
+
+    @staticmethod
+    def expressionIsValid(formulaString: typing.Optional[str], layer: typing.Optional[QgsMeshLayer]) -> typing.Tuple['QgsMeshCalculator.Result', 'QgsMeshDriverMetadata.MeshDriverCapability']: ...
+    @staticmethod
+    @deprecated("""""")
+    def expression_valid(formulaString: typing.Optional[str], layer: typing.Optional[QgsMeshLayer]) -> 'QgsMeshCalculator.Result': ...
+    def processCalculation(self, feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsMeshCalculator.Result': ...
+
+
+class QgsTopologicalMesh(PyQt5.sip.wrapper):
+
+    class TopologicalFaces(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTopologicalMesh.TopologicalFaces') -> None: ...
+
+        def vertexToFace(self, vertexIndex: int) -> int: ...
+        def clear(self) -> None: ...
+
+    class Changes(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTopologicalMesh.Changes') -> None: ...
+
+        def clearChanges(self) -> None: ...
+        def isEmpty(self) -> bool: ...
+        def nativeFacesIndexesGeometryChanged(self) -> list[int]: ...
+        def oldVerticesXYValues(self) -> list[QgsPointXY]: ...
+        def newVerticesXYValues(self) -> list[QgsPointXY]: ...
+        def newVerticesZValues(self) -> list[float]: ...
+        def changedCoordinatesVerticesIndexes(self) -> list[int]: ...
+        def verticesToRemoveIndexes(self) -> list[int]: ...
+        def addedVertices(self) -> list[QgsPoint]: ...
+        def removedFaceIndexes(self) -> list[int]: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTopologicalMesh') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def vertexPositionInFace(vertexIndex: int, face: collections.abc.Iterable[int]) -> int: ...
+    @typing.overload
+    @staticmethod
+    def vertexPositionInFace(mesh: QgsMesh, vertexIndex: int, faceIndex: int) -> int: ...
+    @staticmethod
+    def checkTopology(mesh: QgsMesh, maxVerticesPerFace: int) -> QgsMeshEditingError: ...
+    def checkConsistency(self) -> QgsMeshEditingError: ...
+    def renumber(self) -> bool: ...
+    def reindex(self) -> None: ...
+    @staticmethod
+    def counterClockwiseFaces(face: collections.abc.Iterable[int], mesh: typing.Optional[QgsMesh]) -> QgsMeshEditingError: ...
+    def reverseChanges(self, changes: 'QgsTopologicalMesh.Changes') -> None: ...
+    def applyChanges(self, changes: 'QgsTopologicalMesh.Changes') -> None: ...
+    def changeXYValue(self, verticesIndexes: collections.abc.Iterable[int], newValues: collections.abc.Iterable[QgsPointXY]) -> 'QgsTopologicalMesh.Changes': ...
+    def changeZValue(self, verticesIndexes: collections.abc.Iterable[int], newValues: collections.abc.Iterable[float]) -> 'QgsTopologicalMesh.Changes': ...
+    def removeVertices(self, vertices: collections.abc.Iterable[int]) -> 'QgsTopologicalMesh.Changes': ...
+    def removeVertexFillHole(self, vertexIndex: int) -> 'QgsTopologicalMesh.Changes': ...
+    def addFreeVertex(self, vertex: QgsPoint) -> 'QgsTopologicalMesh.Changes': ...
+    def insertVertexInFacesEdge(self, faceIndex: int, position: int, vertex: QgsPoint) -> 'QgsTopologicalMesh.Changes': ...
+    def addVertexInFace(self, faceIndex: int, vertex: QgsPoint) -> 'QgsTopologicalMesh.Changes': ...
+    def splitFace(self, faceIndex: int) -> 'QgsTopologicalMesh.Changes': ...
+    def canBeSplit(self, faceIndex: int) -> bool: ...
+    def merge(self, vertexIndex1: int, vertexIndex2: int) -> 'QgsTopologicalMesh.Changes': ...
+    def canBeMerged(self, vertexIndex1: int, vertexIndex2: int) -> bool: ...
+    def delaunayConditionForEdge(self, vertexIndex1: int, vertexIndex2: int) -> bool: ...
+    def flipEdge(self, vertexIndex1: int, vertexIndex2: int) -> 'QgsTopologicalMesh.Changes': ...
+    def edgeCanBeFlipped(self, vertexIndex1: int, vertexIndex2: int) -> bool: ...
+    def removeFaces(self, facesIndexes: collections.abc.Iterable[int]) -> 'QgsTopologicalMesh.Changes': ...
+    def facesCanBeRemoved(self, facesIndexes: collections.abc.Iterable[int]) -> QgsMeshEditingError: ...
+    def addFaces(self, topologicFaces: 'QgsTopologicalMesh.TopologicalFaces') -> 'QgsTopologicalMesh.Changes': ...
+    def facesCanBeAdded(self, topologicalFaces: 'QgsTopologicalMesh.TopologicalFaces') -> QgsMeshEditingError: ...
+    def freeVerticesIndexes(self) -> list[int]: ...
+    def isVertexFree(self, vertexIndex: int) -> bool: ...
+    def isVertexOnBoundary(self, vertexIndex: int) -> bool: ...
+    def firstFaceLinked(self, vertexIndex: int) -> int: ...
+    def mesh(self) -> typing.Optional[QgsMesh]: ...
+    def facesAroundVertex(self, vertexIndex: int) -> list[int]: ...
+    def neighborsOfFace(self, faceIndex: int) -> list[int]: ...
+    @staticmethod
+    def createTopologicalMesh(mesh: typing.Optional[QgsMesh], maxVerticesPerFace: int, error: QgsMeshEditingError) -> 'QgsTopologicalMesh': ...
+
+
+class QgsMeshAdvancedEditing(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshAdvancedEditing') -> None: ...
+
+    def text(self) -> str: ...
+    def isFinished(self) -> bool: ...
+    def clear(self) -> None: ...
+    def message(self) -> str: ...
+    def setInputFaces(self, faceIndexes: collections.abc.Iterable[int]) -> None: ...
+    def setInputVertices(self, verticesIndexes: collections.abc.Iterable[int]) -> None: ...
+
+
+class QgsMeshEditRefineFaces(QgsMeshAdvancedEditing):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshEditRefineFaces') -> None: ...
+
+    def text(self) -> str: ...
+
+
+class QgsMeshTransformVerticesByExpression(QgsMeshAdvancedEditing):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshTransformVerticesByExpression') -> None: ...
+
+    def setZFromTerrain(self, enable: bool) -> None: ...
+    def transformedVertex(self, layer: typing.Optional[QgsMeshLayer], vertexIndex: int) -> QgsPoint: ...
+    def calculate(self, layer: typing.Optional[QgsMeshLayer], project: typing.Optional['QgsProject'] = ...) -> bool: ...
+    def setExpressions(self, expressionX: typing.Optional[str], expressionY: typing.Optional[str], expressionZ: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+
+
+class QgsMeshEditForceByLine(QgsMeshAdvancedEditing):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshEditForceByLine') -> None: ...
+
+    def setInterpolateZValueOnMesh(self, interpolateZValueOnMesh: bool) -> None: ...
+    def setDefaultZValue(self, defaultZValue: float) -> None: ...
+    def setAddVertexOnIntersection(self, addVertex: bool) -> None: ...
+    def setTolerance(self, tolerance: float) -> None: ...
+    def setInputLine(self, pt1: QgsPoint, pt2: QgsPoint, tolerance: float, newVertexOnIntersection: bool) -> None: ...
+
+
+class QgsMeshEditForceByPolylines(QgsMeshEditForceByLine):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshEditForceByPolylines') -> None: ...
+
+    def addLinesFromGeometries(self, geometries: collections.abc.Iterable[QgsGeometry]) -> None: ...
+    def addLineFromGeometry(self, geom: QgsGeometry) -> None: ...
+    def isFinished(self) -> bool: ...
+    def text(self) -> str: ...
+
+
+class QgsAbstractMeshLayerLabeling(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def defaultSettingsForLayer(layer: typing.Optional[QgsMeshLayer]) -> QgsPalLayerSettings: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def toSld(self, parent: QtXml.QDomNode, props: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsAbstractMeshLayerLabeling']: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def setSettings(self, settings: typing.Optional[QgsPalLayerSettings], providerId: typing.Optional[str] = ...) -> None: ...
+    def settings(self, providerId: typing.Optional[str] = ...) -> QgsPalLayerSettings: ...
+    def subProviders(self) -> list[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsAbstractMeshLayerLabeling']: ...
+    def type(self) -> str: ...
+
+
+class QgsMeshLayerSimpleLabeling(QgsAbstractMeshLayerLabeling):
+
+    def __init__(self, settings: QgsPalLayerSettings, labelFaces: bool = ...) -> None: ...
+
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsMeshLayerSimpleLabeling']: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def setSettings(self, settings: typing.Optional[QgsPalLayerSettings], providerId: typing.Optional[str] = ...) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def settings(self, providerId: typing.Optional[str] = ...) -> QgsPalLayerSettings: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsMeshLayerSimpleLabeling']: ...
+    def type(self) -> str: ...
+
+
+class QgsMeshUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshUtils') -> None: ...
+
+    @staticmethod
+    def exportRasterBlock(layer: QgsMeshLayer, datasetIndex: QgsMeshDatasetIndex, destinationCrs: 'QgsCoordinateReferenceSystem', transformContext: 'QgsCoordinateTransformContext', mapUnitsPerPixel: float, extent: QgsRectangle, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
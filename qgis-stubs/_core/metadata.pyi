@@ -0,0 +1,370 @@
+# The PEP 484 type hints stub file for the _core.metadata module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsDateTimeRange, QgsFeedback
+from .geometry import QgsBox3D, QgsPolygon, QgsRectangle
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .vector import QgsMapLayer
+
+
+class QgsAbstractMetadataBase(PyQt5.sip.wrapper):
+
+    class Address(PyQt5.sip.wrapper):
+
+        address = ... # type: typing.Optional[str]
+        administrativeArea = ... # type: typing.Optional[str]
+        city = ... # type: typing.Optional[str]
+        country = ... # type: typing.Optional[str]
+        postalCode = ... # type: typing.Optional[str]
+        type = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, type: typing.Optional[str] = ..., address: typing.Optional[str] = ..., city: typing.Optional[str] = ..., administrativeArea: typing.Optional[str] = ..., postalCode: typing.Optional[str] = ..., country: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractMetadataBase.Address') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class Contact(PyQt5.sip.wrapper):
+
+        addresses = ... # type: collections.abc.Iterable['QgsAbstractMetadataBase.Address']
+        email = ... # type: typing.Optional[str]
+        fax = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        organization = ... # type: typing.Optional[str]
+        position = ... # type: typing.Optional[str]
+        role = ... # type: typing.Optional[str]
+        voice = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractMetadataBase.Contact') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class Link(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        format = ... # type: typing.Optional[str]
+        mimeType = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        size = ... # type: typing.Optional[str]
+        type = ... # type: typing.Optional[str]
+        url = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str] = ..., type: typing.Optional[str] = ..., url: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractMetadataBase.Link') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractMetadataBase') -> None: ...
+
+    def equals(self, other: 'QgsAbstractMetadataBase') -> bool: ...
+    def combine(self, other: typing.Optional['QgsAbstractMetadataBase']) -> None: ...
+    def writeMetadataXml(self, metadataElement: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readMetadataXml(self, metadataElement: QtXml.QDomElement) -> bool: ...
+    def setDateTime(self, type: Qgis.MetadataDateType, date: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def dateTime(self, type: Qgis.MetadataDateType) -> QtCore.QDateTime: ...
+    def addLink(self, link: 'QgsAbstractMetadataBase.Link') -> None: ...
+    def setLinks(self, links: collections.abc.Iterable['QgsAbstractMetadataBase.Link']) -> None: ...
+    def links(self) -> list['QgsAbstractMetadataBase.Link']: ...
+    def addContact(self, contact: 'QgsAbstractMetadataBase.Contact') -> None: ...
+    def setContacts(self, contacts: collections.abc.Iterable['QgsAbstractMetadataBase.Contact']) -> None: ...
+    def contacts(self) -> list['QgsAbstractMetadataBase.Contact']: ...
+    def setCategories(self, categories: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def categories(self) -> list[str]: ...
+    def keywordVocabularies(self) -> list[str]: ...
+    def removeKeywords(self, vocabulary: typing.Optional[str]) -> bool: ...
+    def addKeywords(self, vocabulary: typing.Optional[str], keywords: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setKeywords(self, keywords: dict[typing.Optional[str], collections.abc.Iterable[typing.Optional[str]]]) -> None: ...
+    @typing.overload
+    def keywords(self) -> dict[str, list[str]]: ...
+    @typing.overload
+    def keywords(self, vocabulary: typing.Optional[str]) -> list[str]: ...
+    def addHistoryItem(self, text: typing.Optional[str]) -> None: ...
+    def setHistory(self, history: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def history(self) -> list[str]: ...
+    def setAbstract(self, abstract: typing.Optional[str]) -> None: ...
+    def abstract(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def title(self) -> str: ...
+    def setType(self, type: typing.Optional[str]) -> None: ...
+    def type(self) -> str: ...
+    def setLanguage(self, language: typing.Optional[str]) -> None: ...
+    def language(self) -> str: ...
+    def setParentIdentifier(self, parentIdentifier: typing.Optional[str]) -> None: ...
+    def parentIdentifier(self) -> str: ...
+    def setIdentifier(self, identifier: typing.Optional[str]) -> None: ...
+    def identifier(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsAbstractMetadataBase']: ...
+
+
+class QgsLayerMetadata(QgsAbstractMetadataBase):
+
+    class SpatialExtent(PyQt5.sip.wrapper):
+
+        bounds = ... # type: QgsBox3D
+        extentCrs = ... # type: QgsCoordinateReferenceSystem
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerMetadata.SpatialExtent') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class Extent(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerMetadata.Extent') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def setTemporalExtents(self, extents: collections.abc.Iterable[QgsDateTimeRange]) -> None: ...
+        def temporalExtents(self) -> list[QgsDateTimeRange]: ...
+        def setSpatialExtents(self, extents: collections.abc.Iterable['QgsLayerMetadata.SpatialExtent']) -> None: ...
+        def spatialExtents(self) -> list['QgsLayerMetadata.SpatialExtent']: ...
+
+    class Constraint(PyQt5.sip.wrapper):
+
+        constraint = ... # type: typing.Optional[str]
+        type = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, constraint: typing.Optional[str] = ..., type: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerMetadata.Constraint') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerMetadata') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def matches(self, searchReList: collections.abc.Iterable[QtCore.QRegularExpression]) -> bool: ...
+    def contains(self, searchString: typing.Optional[str]) -> bool: ...
+    def __eq__(self, other: object): ...
+    def combine(self, other: typing.Optional[QgsAbstractMetadataBase]) -> None: ...
+    def writeMetadataXml(self, metadataElement: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readMetadataXml(self, metadataElement: QtXml.QDomElement) -> bool: ...
+    def readFromLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def saveToLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def setCrs(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def crs(self) -> QgsCoordinateReferenceSystem: ...
+    def setExtent(self, extent: 'QgsLayerMetadata.Extent') -> None: ...
+    def extent(self) -> 'QgsLayerMetadata.Extent': ...
+    def setEncoding(self, encoding: typing.Optional[str]) -> None: ...
+    def encoding(self) -> str: ...
+    def setLicenses(self, licenses: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def licenses(self) -> list[str]: ...
+    def setRights(self, rights: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def rights(self) -> list[str]: ...
+    def setConstraints(self, constraints: collections.abc.Iterable['QgsLayerMetadata.Constraint']) -> None: ...
+    def addConstraint(self, constraint: 'QgsLayerMetadata.Constraint') -> None: ...
+    def constraints(self) -> list['QgsLayerMetadata.Constraint']: ...
+    def setFees(self, fees: typing.Optional[str]) -> None: ...
+    def fees(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsLayerMetadata']: ...
+
+
+class QgsLayerMetadataFormatter(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, metadata: QgsLayerMetadata) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerMetadataFormatter') -> None: ...
+
+    def linksSectionHtml(self) -> str: ...
+    def historySectionHtml(self) -> str: ...
+    def identificationSectionHtml(self) -> str: ...
+    def extentSectionHtml(self, showSpatialExtent: bool = ...) -> str: ...
+    def contactsSectionHtml(self) -> str: ...
+    def accessSectionHtml(self) -> str: ...
+
+
+class QgsAbstractMetadataBaseValidator(PyQt5.sip.wrapper):
+
+    class ValidationResult(PyQt5.sip.wrapper):
+
+        note = ... # type: typing.Optional[str]
+        section = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, section: typing.Optional[str], note: typing.Optional[str], identifier: typing.Any = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractMetadataBaseValidator.ValidationResult') -> None: ...
+
+        def setIdentifier(self, identifier: typing.Any) -> None: ...
+        def _identifier(self) -> typing.Any: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractMetadataBaseValidator') -> None: ...
+
+    def validate(self, metadata: typing.Optional[QgsAbstractMetadataBase]) -> typing.Tuple[bool, list['QgsAbstractMetadataBaseValidator.ValidationResult']]: ...
+
+
+class QgsNativeMetadataBaseValidator(QgsAbstractMetadataBaseValidator):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNativeMetadataBaseValidator') -> None: ...
+
+    def validate(self, metadata: typing.Optional[QgsAbstractMetadataBase]) -> typing.Tuple[bool, list[QgsAbstractMetadataBaseValidator.ValidationResult]]: ...
+
+
+class QgsNativeMetadataValidator(QgsNativeMetadataBaseValidator):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNativeMetadataValidator') -> None: ...
+
+    def validate(self, metadata: typing.Optional[QgsAbstractMetadataBase]) -> typing.Tuple[bool, list[QgsAbstractMetadataBaseValidator.ValidationResult]]: ...
+
+
+class QgsNativeProjectMetadataValidator(QgsNativeMetadataBaseValidator):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNativeProjectMetadataValidator') -> None: ...
+
+    def validate(self, metadata: typing.Optional[QgsAbstractMetadataBase]) -> typing.Tuple[bool, list[QgsAbstractMetadataBaseValidator.ValidationResult]]: ...
+
+
+class QgsMetadataUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMetadataUtils') -> None: ...
+
+    @staticmethod
+    def convertFromEsri(document: QtXml.QDomDocument) -> QgsLayerMetadata: ...
+
+
+class QgsProjectMetadata(QgsAbstractMetadataBase):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectMetadata') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def combine(self, other: typing.Optional[QgsAbstractMetadataBase]) -> None: ...
+    def writeMetadataXml(self, metadataElement: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readMetadataXml(self, metadataElement: QtXml.QDomElement) -> bool: ...
+    def setCreationDateTime(self, creationDateTime: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def creationDateTime(self) -> QtCore.QDateTime: ...
+    def setAuthor(self, author: typing.Optional[str]) -> None: ...
+    def author(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProjectMetadata']: ...
+
+
+class QgsMetadataSearchContext(PyQt5.sip.wrapper):
+
+    transformContext = ... # type: QgsCoordinateTransformContext
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMetadataSearchContext') -> None: ...
+
+
+class QgsLayerMetadataProviderResult(QgsLayerMetadata):
+
+    @typing.overload
+    def __init__(self, metadata: QgsLayerMetadata) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerMetadataProviderResult') -> None: ...
+
+    def setStandardUri(self, standardUri: typing.Optional[str]) -> None: ...
+    def standardUri(self) -> str: ...
+    def setLayerType(self, layerType: Qgis.LayerType) -> None: ...
+    def layerType(self) -> Qgis.LayerType: ...
+    def setDataProviderName(self, dataProviderName: typing.Optional[str]) -> None: ...
+    def dataProviderName(self) -> str: ...
+    def setUri(self, Uri: typing.Optional[str]) -> None: ...
+    def uri(self) -> str: ...
+    def setAuthid(self, authid: typing.Optional[str]) -> None: ...
+    def authid(self) -> str: ...
+    def setGeometryType(self, geometryType: Qgis.GeometryType) -> None: ...
+    def geometryType(self) -> Qgis.GeometryType: ...
+    def setGeographicExtent(self, geographicExtent: QgsPolygon) -> None: ...
+    def geographicExtent(self) -> QgsPolygon: ...
+
+
+class QgsLayerMetadataSearchResults(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerMetadataSearchResults') -> None: ...
+
+    def addError(self, error: typing.Optional[str]) -> None: ...
+    def errors(self) -> list[str]: ...
+    def addMetadata(self, metadata: QgsLayerMetadataProviderResult) -> None: ...
+    def metadata(self) -> list[QgsLayerMetadataProviderResult]: ...
+
+
+class QgsAbstractLayerMetadataProvider(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractLayerMetadataProvider') -> None: ...
+
+    def search(self, searchContext: QgsMetadataSearchContext, searchString: typing.Optional[str] = ..., geographicExtent: QgsRectangle = ..., feedback: typing.Optional[QgsFeedback] = ...) -> QgsLayerMetadataSearchResults: ...
+    def id(self) -> str: ...
+
+
+class QgsLayerMetadataProviderRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def search(self, searchContext: QgsMetadataSearchContext, searchString: typing.Optional[str] = ..., geographicExtent: QgsRectangle = ..., feedback: typing.Optional[QgsFeedback] = ...) -> QgsLayerMetadataSearchResults: ...
+    def layerMetadataProviderFromId(self, id: typing.Optional[str]) -> typing.Optional[QgsAbstractLayerMetadataProvider]: ...
+    def layerMetadataProviders(self) -> list[QgsAbstractLayerMetadataProvider]: ...
+    def unregisterLayerMetadataProvider(self, metadataProvider: typing.Optional[QgsAbstractLayerMetadataProvider]) -> None: ...
+    def registerLayerMetadataProvider(self, metadataProvider: typing.Optional[QgsAbstractLayerMetadataProvider]) -> None: ...
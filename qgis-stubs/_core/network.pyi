@@ -0,0 +1,366 @@
+# The PEP 484 type hints stub file for the _core.network module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFeedback
+from .elevation import QgsTask
+from .settings import QgsSettings
+
+
+class QgsBlockingNetworkRequest(QtCore.QObject):
+
+    class RequestFlag(int):
+        EmptyResponseIsValid = ... # type: QgsBlockingNetworkRequest.RequestFlag
+
+    class ErrorCode(int):
+        NoError = ... # type: QgsBlockingNetworkRequest.ErrorCode
+        NetworkError = ... # type: QgsBlockingNetworkRequest.ErrorCode
+        TimeoutError = ... # type: QgsBlockingNetworkRequest.ErrorCode
+        ServerExceptionError = ... # type: QgsBlockingNetworkRequest.ErrorCode
+
+    class RequestFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __xor__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __ior__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __or__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __iand__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __and__(self, f: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag']) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __invert__(self) -> 'QgsBlockingNetworkRequest.RequestFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self) -> None: ...
+
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    uploadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    downloadFinished: typing.ClassVar[QtCore.pyqtSignal]
+    downloadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    def abort(self) -> None: ...
+    def setAuthCfg(self, authCfg: typing.Optional[str]) -> None: ...
+    def authCfg(self) -> str: ...
+    def reply(self) -> 'QgsNetworkReplyContent': ...
+    def errorMessage(self) -> str: ...
+    def deleteResource(self, request: QtNetwork.QNetworkRequest, feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsBlockingNetworkRequest.ErrorCode': ...
+    def put(self, request: QtNetwork.QNetworkRequest, data: typing.Optional[typing.Union[QtCore.QIODevice, QtCore.QByteArray, bytes, bytearray]], feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsBlockingNetworkRequest.ErrorCode': ...
+    def head(self, request: QtNetwork.QNetworkRequest, forceRefresh: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsBlockingNetworkRequest.ErrorCode': ...
+    def post(self, request: QtNetwork.QNetworkRequest, data: typing.Optional[typing.Union[QtCore.QIODevice, QtCore.QByteArray, bytes, bytearray]], forceRefresh: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsBlockingNetworkRequest.ErrorCode': ...
+    def get(self, request: QtNetwork.QNetworkRequest, forceRefresh: bool = ..., feedback: typing.Optional[QgsFeedback] = ..., requestFlags: typing.Union['QgsBlockingNetworkRequest.RequestFlags', 'QgsBlockingNetworkRequest.RequestFlag'] = ...) -> 'QgsBlockingNetworkRequest.ErrorCode': ...
+
+
+class QgsFileDownloader(QtCore.QObject):
+
+    def __init__(self, url: QtCore.QUrl, outputFileName: typing.Optional[str], authcfg: typing.Optional[str] = ..., delayStart: bool = ..., httpMethod: Qgis.HttpMethod = ..., data: typing.Union[QtCore.QByteArray, bytes, bytearray] = ...) -> None: ...
+
+    def startDownload(self) -> None: ...
+    def cancelDownload(self) -> None: ...
+    downloadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    downloadError: typing.ClassVar[QtCore.pyqtSignal]
+    downloadCanceled: typing.ClassVar[QtCore.pyqtSignal]
+    downloadExited: typing.ClassVar[QtCore.pyqtSignal]
+    downloadCompleted: typing.ClassVar[QtCore.pyqtSignal]
+
+
+class QgsNetworkRequestParameters(PyQt5.sip.wrapper):
+
+    class RequestAttributes(int):
+        AttributeInitiatorClass = ... # type: QgsNetworkRequestParameters.RequestAttributes
+        AttributeInitiatorRequestId = ... # type: QgsNetworkRequestParameters.RequestAttributes
+        AttributeOriginalHeaders = ... # type: QgsNetworkRequestParameters.RequestAttributes
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, operation: QtNetwork.QNetworkAccessManager.Operation, request: QtNetwork.QNetworkRequest, requestId: int, content: typing.Union[QtCore.QByteArray, bytes, bytearray] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNetworkRequestParameters') -> None: ...
+
+    def initiatorRequestId(self) -> typing.Any: ...
+    def initiatorClassName(self) -> str: ...
+    def content(self) -> QtCore.QByteArray: ...
+    def requestId(self) -> int: ...
+    def originatingThreadId(self) -> str: ...
+    def request(self) -> QtNetwork.QNetworkRequest: ...
+    def operation(self) -> QtNetwork.QNetworkAccessManager.Operation: ...
+
+
+class QgsNetworkAccessManager(QtNetwork.QNetworkAccessManager):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def createRequest(self, op: QtNetwork.QNetworkAccessManager.Operation, req: QtNetwork.QNetworkRequest, outgoingData: typing.Optional[QtCore.QIODevice] = ...) -> typing.Optional[QtNetwork.QNetworkReply]: ...
+    cookiesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    authBrowserAborted: typing.ClassVar[QtCore.pyqtSignal]
+    requestEncounteredSslErrors: typing.ClassVar[QtCore.pyqtSignal]
+    requestAuthDetailsAdded: typing.ClassVar[QtCore.pyqtSignal]
+    requestRequiresAuth: typing.ClassVar[QtCore.pyqtSignal]
+    downloadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    requestTimedOut: typing.ClassVar[QtCore.pyqtSignal]
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    requestCreated: typing.ClassVar[QtCore.pyqtSignal]
+    requestAboutToBeCreated: typing.ClassVar[QtCore.pyqtSignal]
+    def preprocessRequest(self, req: typing.Optional[QtNetwork.QNetworkRequest]) -> None: ...
+    def abortAuthBrowser(self) -> None: ...
+    def requestAuthCloseBrowser(self) -> None: ...
+    def requestAuthOpenBrowser(self, url: QtCore.QUrl) -> None: ...
+    @staticmethod
+    def removeReplyPreprocessor(id: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setReplyPreprocessor(a0: typing.Optional[typing.Callable[..., None]]) -> str: ...
+    @staticmethod
+    def removeAdvancedRequestPreprocessor(id: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setAdvancedRequestPreprocessor(a0: typing.Optional[typing.Callable[..., None]]) -> str: ...
+    @staticmethod
+    def removeRequestPreprocessor(id: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setRequestPreprocessor(a0: typing.Optional[typing.Callable[..., None]]) -> str: ...
+    @staticmethod
+    def blockingPost(request: QtNetwork.QNetworkRequest, data: typing.Union[QtCore.QByteArray, bytes, bytearray], authCfg: typing.Optional[str] = ..., forceRefresh: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsNetworkReplyContent': ...
+    @staticmethod
+    def blockingGet(request: QtNetwork.QNetworkRequest, authCfg: typing.Optional[str] = ..., forceRefresh: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsNetworkReplyContent': ...
+    @staticmethod
+    def setTimeout(time: int) -> None: ...
+    @staticmethod
+    def timeout() -> int: ...
+    def useSystemProxy(self) -> bool: ...
+    def setupDefaultProxyAndCache(self, connectionType: QtCore.Qt.ConnectionType = ...) -> None: ...
+    @staticmethod
+    def cacheLoadControlFromName(name: typing.Optional[str]) -> QtNetwork.QNetworkRequest.CacheLoadControl: ...
+    @staticmethod
+    def cacheLoadControlName(control: QtNetwork.QNetworkRequest.CacheLoadControl) -> str: ...
+    def setFallbackProxyAndExcludes(self, proxy: QtNetwork.QNetworkProxy, excludes: collections.abc.Iterable[typing.Optional[str]], noProxyURLs: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def noProxyList(self) -> list[str]: ...
+    def excludeList(self) -> list[str]: ...
+    def fallbackProxy(self) -> QtNetwork.QNetworkProxy: ...
+    def proxyFactories(self) -> list[QtNetwork.QNetworkProxyFactory]: ...
+    def removeProxyFactory(self, factory: typing.Optional[QtNetwork.QNetworkProxyFactory]) -> None: ...
+    def insertProxyFactory(self, factory: typing.Optional[QtNetwork.QNetworkProxyFactory]) -> None: ...
+    @staticmethod
+    def instance(connectionType: QtCore.Qt.ConnectionType = ...) -> typing.Optional['QgsNetworkAccessManager']: ...
+
+
+class QgsNetworkContentFetcher(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    downloadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    def wasCanceled(self) -> bool: ...
+    def cancel(self) -> None: ...
+    def contentAsString(self) -> str: ...
+    def contentDispositionFilename(self) -> str: ...
+    def reply(self) -> typing.Optional[QtNetwork.QNetworkReply]: ...
+    @typing.overload
+    def fetchContent(self, url: QtCore.QUrl, authcfg: typing.Optional[str] = ..., headers: 'QgsHttpHeaders' = ...) -> None: ...
+    @typing.overload
+    def fetchContent(self, request: QtNetwork.QNetworkRequest, authcfg: typing.Optional[str] = ...) -> None: ...
+
+
+class QgsFetchedContent(QtCore.QObject):
+
+    class ContentStatus(int):
+        NotStarted = ... # type: QgsFetchedContent.ContentStatus
+        Downloading = ... # type: QgsFetchedContent.ContentStatus
+        Finished = ... # type: QgsFetchedContent.ContentStatus
+        Failed = ... # type: QgsFetchedContent.ContentStatus
+
+    def __init__(self, url: typing.Optional[str], file: typing.Optional[QtCore.QTemporaryFile] = ..., status: 'QgsFetchedContent.ContentStatus' = ..., authConfig: typing.Optional[str] = ..., headers: 'QgsHttpHeaders' = ...) -> None: ...
+
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    fetched: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def download(self, redownload: bool = ...) -> None: ...
+    def authConfig(self) -> str: ...
+    def error(self) -> QtNetwork.QNetworkReply.NetworkError: ...
+    def status(self) -> 'QgsFetchedContent.ContentStatus': ...
+    def filePath(self) -> str: ...
+
+
+class QgsNetworkContentFetcherRegistry(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def localPath(self, filePathOrUrl: typing.Optional[str]) -> str: ...
+    def fetch(self, url: typing.Optional[str], fetchingMode: Qgis.ActionStart = ..., authConfig: typing.Optional[str] = ..., headers: 'QgsHttpHeaders' = ...) -> typing.Optional[QgsFetchedContent]: ...
+    FetchingMode: typing.Type[Qgis.ActionStart]
+    DownloadLater: Qgis.ActionStart
+    DownloadImmediately: Qgis.ActionStart
+
+
+class QgsNetworkContentFetcherTask(QgsTask):
+
+    @typing.overload
+    def __init__(self, url: QtCore.QUrl, authcfg: typing.Optional[str] = ..., flags: typing.Union[QgsTask.Flags, QgsTask.Flag] = ..., description: typing.Optional[str] = ..., headers: 'QgsHttpHeaders' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, request: QtNetwork.QNetworkRequest, authcfg: typing.Optional[str] = ..., flags: typing.Union[QgsTask.Flags, QgsTask.Flag] = ..., description: typing.Optional[str] = ..., headers: 'QgsHttpHeaders' = ...) -> None: ...
+
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    fetched: typing.ClassVar[QtCore.pyqtSignal]
+    def contentAsString(self) -> str: ...
+    def contentDispositionFilename(self) -> str: ...
+    def reply(self) -> typing.Optional[QtNetwork.QNetworkReply]: ...
+    def cancel(self) -> None: ...
+    def run(self) -> bool: ...
+
+
+class QgsNetworkReplyContent(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, reply: typing.Optional[QtNetwork.QNetworkReply]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNetworkReplyContent') -> None: ...
+
+    @staticmethod
+    def extractFileNameFromContentDispositionHeader(header: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def extractFilenameFromContentDispositionHeader(reply: typing.Optional[QtNetwork.QNetworkReply]) -> str: ...
+    def content(self) -> QtCore.QByteArray: ...
+    def setContent(self, content: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> None: ...
+    def request(self) -> QtNetwork.QNetworkRequest: ...
+    def requestId(self) -> int: ...
+    def rawHeader(self, headerName: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> QtCore.QByteArray: ...
+    def rawHeaderList(self) -> list[QtCore.QByteArray]: ...
+    def hasRawHeader(self, headerName: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> bool: ...
+    def errorString(self) -> str: ...
+    def error(self) -> QtNetwork.QNetworkReply.NetworkError: ...
+    def attribute(self, code: QtNetwork.QNetworkRequest.Attribute) -> typing.Any: ...
+    def clear(self) -> None: ...
+
+
+class QgsNewsFeedModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        Key = ... # type: QgsNewsFeedModel.CustomRole
+        Title = ... # type: QgsNewsFeedModel.CustomRole
+        Content = ... # type: QgsNewsFeedModel.CustomRole
+        ImageUrl = ... # type: QgsNewsFeedModel.CustomRole
+        Image = ... # type: QgsNewsFeedModel.CustomRole
+        Link = ... # type: QgsNewsFeedModel.CustomRole
+        Sticky = ... # type: QgsNewsFeedModel.CustomRole
+
+    def __init__(self, parser: typing.Optional['QgsNewsFeedParser'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    Role: typing.Type[QgsNewsFeedModel.CustomRole]
+    Key: QgsNewsFeedModel.CustomRole
+    Title: QgsNewsFeedModel.CustomRole
+    Content: QgsNewsFeedModel.CustomRole
+    ImageUrl: QgsNewsFeedModel.CustomRole
+    Image: QgsNewsFeedModel.CustomRole
+    Link: QgsNewsFeedModel.CustomRole
+    Sticky: QgsNewsFeedModel.CustomRole
+
+
+class QgsNewsFeedProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parser: typing.Optional['QgsNewsFeedParser'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+
+
+class QgsNewsFeedParser(QtCore.QObject):
+
+    class Entry(PyQt5.sip.wrapper):
+
+        content = ... # type: typing.Optional[str]
+        expiry = ... # type: typing.Union[QtCore.QDateTime, datetime.datetime]
+        image = ... # type: QtGui.QPixmap
+        imageUrl = ... # type: typing.Optional[str]
+        key = ... # type: int
+        link = ... # type: QtCore.QUrl
+        sticky = ... # type: bool
+        title = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsNewsFeedParser.Entry') -> None: ...
+
+    def __init__(self, feedUrl: QtCore.QUrl, authcfg: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    imageFetched: typing.ClassVar[QtCore.pyqtSignal]
+    entryDismissed: typing.ClassVar[QtCore.pyqtSignal]
+    entryUpdated: typing.ClassVar[QtCore.pyqtSignal]
+    entryAdded: typing.ClassVar[QtCore.pyqtSignal]
+    fetched: typing.ClassVar[QtCore.pyqtSignal]
+    def fetch(self) -> None: ...
+    @staticmethod
+    def keyForFeed(baseUrl: typing.Optional[str]) -> str: ...
+    def authcfg(self) -> str: ...
+    def dismissAll(self) -> None: ...
+    def dismissEntry(self, key: int) -> None: ...
+    def entries(self) -> list['QgsNewsFeedParser.Entry']: ...
+
+
+class QgsHttpHeaders(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, headers: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, settings: 'QgsSettings', key: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, element: QtXml.QDomElement) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsHttpHeaders') -> None: ...
+
+    def toSpacedString(self) -> str: ...
+    def keys(self) -> list[str]: ...
+    def insert(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __getitem__(self, key: typing.Optional[str]) -> typing.Any: ...
+    def sanitizeKey(self, key: typing.Optional[str]) -> str: ...
+    def setFromDomElement(self, element: QtXml.QDomElement) -> None: ...
+    def setFromMap(self, map: dict[str, typing.Any]) -> None: ...
+    def setFromUrlQuery(self, uri: QtCore.QUrlQuery) -> None: ...
+    def setFromSettings(self, settings: 'QgsSettings', key: typing.Optional[str] = ...) -> None: ...
+    @deprecated("""""")
+    def updateDomElement(self, el: QtXml.QDomElement) -> bool: ...
+    def updateMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def updateUrlQuery(self, uri: QtCore.QUrlQuery) -> bool: ...
+    def updateNetworkRequest(self, request: QtNetwork.QNetworkRequest) -> bool: ...
+    @deprecated("""""")
+    def updateSettings(self, settings: 'QgsSettings', key: typing.Optional[str] = ...) -> bool: ...
+    def headers(self) -> dict[str, typing.Any]: ...
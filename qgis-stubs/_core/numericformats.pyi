@@ -0,0 +1,335 @@
+# The PEP 484 type hints stub file for the _core.numericformats module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from .vector import QgsExpressionContext, QgsReadWriteContext
+
+
+class QgsLocalDefaultSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLocalDefaultSettings') -> None: ...
+
+    @staticmethod
+    def geographicCoordinateFormat() -> typing.Optional['QgsGeographicCoordinateNumericFormat']: ...
+    @staticmethod
+    def setGeographicCoordinateFormat(format: typing.Optional['QgsGeographicCoordinateNumericFormat']) -> None: ...
+    @staticmethod
+    def bearingFormat() -> typing.Optional['QgsBearingNumericFormat']: ...
+    @staticmethod
+    def setBearingFormat(format: typing.Optional['QgsBearingNumericFormat']) -> None: ...
+
+
+class QgsNumericFormat(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNumericFormat') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> None: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional['QgsNumericFormat']: ...
+    def clone(self) -> typing.Optional['QgsNumericFormat']: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def suggestSampleValue(self) -> float: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsBasicNumericFormat(QgsNumericFormat):
+
+    class RoundingType(int):
+        DecimalPlaces = ... # type: QgsBasicNumericFormat.RoundingType
+        SignificantFigures = ... # type: QgsBasicNumericFormat.RoundingType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBasicNumericFormat') -> None: ...
+
+    def setConfiguration(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def setDecimalSeparator(self, character: str) -> None: ...
+    def decimalSeparator(self) -> str: ...
+    def setThousandsSeparator(self, character: str) -> None: ...
+    def thousandsSeparator(self) -> str: ...
+    def setRoundingType(self, type: 'QgsBasicNumericFormat.RoundingType') -> None: ...
+    def roundingType(self) -> 'QgsBasicNumericFormat.RoundingType': ...
+    def setShowTrailingZeros(self, show: bool) -> None: ...
+    def showTrailingZeros(self) -> bool: ...
+    def setShowPlusSign(self, show: bool) -> None: ...
+    def showPlusSign(self) -> bool: ...
+    def setShowThousandsSeparator(self, show: bool) -> None: ...
+    def showThousandsSeparator(self) -> bool: ...
+    def setNumberDecimalPlaces(self, places: int) -> None: ...
+    def numberDecimalPlaces(self) -> int: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsBearingNumericFormat(QgsBasicNumericFormat):
+
+    class FormatDirectionOption(int):
+        UseRange0To180WithEWDirectionalSuffix = ... # type: QgsBearingNumericFormat.FormatDirectionOption
+        UseRangeNegative180ToPositive180 = ... # type: QgsBearingNumericFormat.FormatDirectionOption
+        UseRange0To360 = ... # type: QgsBearingNumericFormat.FormatDirectionOption
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBearingNumericFormat') -> None: ...
+
+    def setConfiguration(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def setDirectionFormat(self, format: 'QgsBearingNumericFormat.FormatDirectionOption') -> None: ...
+    def directionFormat(self) -> 'QgsBearingNumericFormat.FormatDirectionOption': ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional['QgsBearingNumericFormat']: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def suggestSampleValue(self) -> float: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsGeographicCoordinateNumericFormat(QgsBasicNumericFormat):
+
+    class AngleFormat(int):
+        DegreesMinutesSeconds = ... # type: QgsGeographicCoordinateNumericFormat.AngleFormat
+        DegreesMinutes = ... # type: QgsGeographicCoordinateNumericFormat.AngleFormat
+        DecimalDegrees = ... # type: QgsGeographicCoordinateNumericFormat.AngleFormat
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsGeographicCoordinateNumericFormat') -> None: ...
+
+    def setConfiguration(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def setShowDirectionalSuffix(self, show: bool) -> None: ...
+    def showDirectionalSuffix(self) -> bool: ...
+    def setShowDegreeLeadingZeros(self, show: bool) -> None: ...
+    def showDegreeLeadingZeros(self) -> bool: ...
+    def setShowLeadingZeros(self, show: bool) -> None: ...
+    def showLeadingZeros(self) -> bool: ...
+    def setAngleFormat(self, format: 'QgsGeographicCoordinateNumericFormat.AngleFormat') -> None: ...
+    def angleFormat(self) -> 'QgsGeographicCoordinateNumericFormat.AngleFormat': ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional['QgsGeographicCoordinateNumericFormat']: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def suggestSampleValue(self) -> float: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsCurrencyNumericFormat(QgsBasicNumericFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCurrencyNumericFormat') -> None: ...
+
+    def setSuffix(self, suffix: typing.Optional[str]) -> None: ...
+    def suffix(self) -> str: ...
+    def setPrefix(self, prefix: typing.Optional[str]) -> None: ...
+    def prefix(self) -> str: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def suggestSampleValue(self) -> float: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsExpressionBasedNumericFormat(QgsNumericFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionBasedNumericFormat') -> None: ...
+
+    def expression(self) -> str: ...
+    def setExpression(self, expression: typing.Optional[str]) -> None: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsFallbackNumericFormat(QgsNumericFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFallbackNumericFormat') -> None: ...
+
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsFractionNumericFormat(QgsNumericFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFractionNumericFormat') -> None: ...
+
+    def setConfiguration(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    @staticmethod
+    def toUnicodeSubscript(input: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def toUnicodeSuperscript(input: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def doubleToVulgarFraction(value: float, tolerance: float = ...) -> typing.Tuple[bool, int, int, int]: ...
+    def setThousandsSeparator(self, character: str) -> None: ...
+    def thousandsSeparator(self) -> str: ...
+    def setShowPlusSign(self, show: bool) -> None: ...
+    def showPlusSign(self) -> bool: ...
+    def setShowThousandsSeparator(self, show: bool) -> None: ...
+    def showThousandsSeparator(self) -> bool: ...
+    def setUseUnicodeSuperSubscript(self, enabled: bool) -> None: ...
+    def useUnicodeSuperSubscript(self) -> bool: ...
+    def setUseDedicatedUnicodeCharacters(self, enabled: bool) -> None: ...
+    def useDedicatedUnicodeCharacters(self) -> bool: ...
+    def suggestSampleValue(self) -> float: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: 'QgsNumericFormatContext') -> str: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsNumericFormatContext(PyQt5.sip.wrapper):
+
+    class Interpretation(int):
+        Generic = ... # type: QgsNumericFormatContext.Interpretation
+        Latitude = ... # type: QgsNumericFormatContext.Interpretation
+        Longitude = ... # type: QgsNumericFormatContext.Interpretation
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNumericFormatContext') -> None: ...
+
+    def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+    def expressionContext(self) -> QgsExpressionContext: ...
+    def setInterpretation(self, interpretation: 'QgsNumericFormatContext.Interpretation') -> None: ...
+    def interpretation(self) -> 'QgsNumericFormatContext.Interpretation': ...
+    def setExponential(self, character: str) -> None: ...
+    def exponential(self) -> str: ...
+    def setPositiveSign(self, character: str) -> None: ...
+    def positiveSign(self) -> str: ...
+    def setNegativeSign(self, character: str) -> None: ...
+    def negativeSign(self) -> str: ...
+    def setZeroDigit(self, character: str) -> None: ...
+    def zeroDigit(self) -> str: ...
+    def setPercent(self, character: str) -> None: ...
+    def percent(self) -> str: ...
+    def setDecimalSeparator(self, separator: str) -> None: ...
+    def decimalSeparator(self) -> str: ...
+    def setThousandsSeparator(self, separator: str) -> None: ...
+    def thousandsSeparator(self) -> str: ...
+
+
+class QgsNumericFormatRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNumericFormatRegistry') -> None: ...
+
+    def sortKey(self, id: typing.Optional[str]) -> int: ...
+    def visibleName(self, id: typing.Optional[str]) -> str: ...
+    def fallbackFormat(self) -> typing.Optional[QgsNumericFormat]: ...
+    def createFromXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def create(self, id: typing.Optional[str], configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def format(self, id: typing.Optional[str]) -> typing.Optional[QgsNumericFormat]: ...
+    def removeFormat(self, id: typing.Optional[str]) -> None: ...
+    def addFormat(self, format: typing.Optional[QgsNumericFormat]) -> None: ...
+    def formats(self) -> list[str]: ...
+
+
+class QgsPercentageNumericFormat(QgsBasicNumericFormat):
+
+    class InputValues(int):
+        ValuesArePercentage = ... # type: QgsPercentageNumericFormat.InputValues
+        ValuesAreFractions = ... # type: QgsPercentageNumericFormat.InputValues
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPercentageNumericFormat') -> None: ...
+
+    def setInputValues(self, format: 'QgsPercentageNumericFormat.InputValues') -> None: ...
+    def inputValues(self) -> 'QgsPercentageNumericFormat.InputValues': ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: QgsNumericFormatContext) -> str: ...
+    def suggestSampleValue(self) -> float: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsScientificNumericFormat(QgsBasicNumericFormat):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScientificNumericFormat') -> None: ...
+
+    def setNumberDecimalPlaces(self, places: int) -> None: ...
+    def configuration(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def create(self, configuration: dict[str, typing.Any], context: QgsReadWriteContext) -> typing.Optional[QgsNumericFormat]: ...
+    def clone(self) -> typing.Optional[QgsNumericFormat]: ...
+    def formatDouble(self, value: float, context: QgsNumericFormatContext) -> str: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
@@ -0,0 +1,120 @@
+# The PEP 484 type hints stub file for the _core.painting module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+from .geometry import QgsAbstractGeometry, QgsGeometry
+
+
+class QgsGeometryPaintDevice(QtGui.QPaintDevice):
+
+    def __init__(self, usePathStroker: bool = ...) -> None: ...
+
+    @staticmethod
+    def painterPathToGeometry(path: QtGui.QPainterPath) -> QgsGeometry: ...
+    def geometry(self) -> QgsAbstractGeometry: ...
+    def metric(self, metric: QtGui.QPaintDevice.PaintDeviceMetric) -> int: ...
+    def paintEngine(self) -> typing.Optional[QtGui.QPaintEngine]: ...
+    def setSimplificationTolerance(self, tolerance: float) -> None: ...
+    def setStrokedPathSegments(self, segments: int) -> None: ...
+
+
+class QgsMaskPaintDevice(QtGui.QPaintDevice):
+
+    @deprecated("""""")
+    def __init__(self, usePathStroker: bool = ...) -> None: ...
+
+    @deprecated("""""")
+    def maskPainterPath(self) -> QtGui.QPainterPath: ...
+    def metric(self, metric: QtGui.QPaintDevice.PaintDeviceMetric) -> int: ...
+    def paintEngine(self) -> typing.Optional[QtGui.QPaintEngine]: ...
+
+
+class QgsNullPaintDevice(QtGui.QPaintDevice):
+
+    def __init__(self) -> None: ...
+
+    def setOutputDpi(self, dpi: int) -> None: ...
+    def setOutputSize(self, size: QtCore.QSize) -> None: ...
+    def metric(self, metric: QtGui.QPaintDevice.PaintDeviceMetric) -> int: ...
+    def paintEngine(self) -> typing.Optional[QtGui.QPaintEngine]: ...
+
+
+class QgsPaintEngineHack(QtGui.QPaintEngine):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def fixEngineFlags(engine: typing.Optional[QtGui.QPaintEngine]) -> None: ...
+    def fixFlags(self) -> None: ...
+
+
+class QgsPainting(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPainting') -> None: ...
+
+    @staticmethod
+    def drawPicture(painter: typing.Optional[QtGui.QPainter], point: typing.Union[QtCore.QPointF, QtCore.QPoint], picture: QtGui.QPicture) -> None: ...
+    @staticmethod
+    def applyScaleFixForQPictureDpi(painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    @staticmethod
+    def qtDefaultDpiY() -> int: ...
+    @staticmethod
+    def qtDefaultDpiX() -> int: ...
+    @staticmethod
+    def drawTriangleUsingTexture(painter: typing.Optional[QtGui.QPainter], triangle: QtGui.QPolygonF, textureImage: QtGui.QImage, textureX1: float, textureY1: float, textureX2: float, textureY2: float, textureX3: float, textureY3: float) -> bool: ...
+    @staticmethod
+    def triangleToTriangleTransform(inX1: float, inY1: float, inX2: float, inY2: float, inX3: float, inY3: float, outX1: float, outY1: float, outX2: float, outY2: float, outX3: float, outY3: float) -> typing.Tuple[QtGui.QTransform, bool]: ...
+    @staticmethod
+    def isClippingMode(mode: Qgis.BlendMode) -> bool: ...
+    @staticmethod
+    def getBlendModeEnum(blendMode: QtGui.QPainter.CompositionMode) -> Qgis.BlendMode: ...
+    @staticmethod
+    def getCompositionMode(blendMode: Qgis.BlendMode) -> QtGui.QPainter.CompositionMode: ...
+    BlendMode: typing.Type[Qgis.BlendMode]
+    BlendNormal: Qgis.BlendMode
+    BlendLighten: Qgis.BlendMode
+    BlendScreen: Qgis.BlendMode
+    BlendDodge: Qgis.BlendMode
+    BlendAddition: Qgis.BlendMode
+    BlendDarken: Qgis.BlendMode
+    BlendMultiply: Qgis.BlendMode
+    BlendBurn: Qgis.BlendMode
+    BlendOverlay: Qgis.BlendMode
+    BlendSoftLight: Qgis.BlendMode
+    BlendHardLight: Qgis.BlendMode
+    BlendDifference: Qgis.BlendMode
+    BlendSubtract: Qgis.BlendMode
+    BlendSource: Qgis.BlendMode
+    BlendDestinationOver: Qgis.BlendMode
+    BlendClear: Qgis.BlendMode
+    BlendDestination: Qgis.BlendMode
+    BlendSourceIn: Qgis.BlendMode
+    BlendDestinationIn: Qgis.BlendMode
+    BlendSourceOut: Qgis.BlendMode
+    BlendDestinationOut: Qgis.BlendMode
+    BlendSourceAtop: Qgis.BlendMode
+    BlendDestinationAtop: Qgis.BlendMode
+    BlendXor: Qgis.BlendMode
@@ -0,0 +1,32 @@
+# The PEP 484 type hints stub file for the _core.pdf module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+
+class QgsPdfRenderer(PyQt5.sip.wrapper):
+
+    def __init__(self, path: typing.Optional[str]) -> None: ...
+
+    def render(self, painter: typing.Optional[QtGui.QPainter], painterRect: QtCore.QRectF, pageIndex: int) -> bool: ...
+    def pageMediaBox(self, pageNumber: int) -> QtCore.QRectF: ...
+    def pageCount(self) -> int: ...
+    def path(self) -> str: ...
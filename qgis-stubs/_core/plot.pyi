@@ -0,0 +1,114 @@
+# The PEP 484 type hints stub file for the _core.plot module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsMargins
+from .numericformats import QgsNumericFormat
+from .symbology import QgsFillSymbol, QgsLineSymbol
+from .textrenderer import QgsTextFormat
+from .vector import QgsReadWriteContext, QgsRenderContext
+
+
+class QgsPlot(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPlot') -> None: ...
+
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+
+
+class QgsPlotAxis(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def setLabelSuffixPlacement(self, placement: Qgis.PlotAxisSuffixPlacement) -> None: ...
+    def labelSuffixPlacement(self) -> Qgis.PlotAxisSuffixPlacement: ...
+    def setLabelSuffix(self, suffix: typing.Optional[str]) -> None: ...
+    def labelSuffix(self) -> str: ...
+    def setNumericFormat(self, format: typing.Optional['QgsNumericFormat']) -> None: ...
+    def numericFormat(self) -> typing.Optional['QgsNumericFormat']: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setGridMinorSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def gridMinorSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setGridMajorSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def gridMajorSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setLabelInterval(self, interval: float) -> None: ...
+    def labelInterval(self) -> float: ...
+    def setGridIntervalMajor(self, interval: float) -> None: ...
+    def gridIntervalMajor(self) -> float: ...
+    def setGridIntervalMinor(self, interval: float) -> None: ...
+    def gridIntervalMinor(self) -> float: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+
+
+class Qgs2DPlot(QgsPlot):
+
+    def __init__(self) -> None: ...
+
+    def setMargins(self, margins: QgsMargins) -> None: ...
+    def margins(self) -> QgsMargins: ...
+    def setChartBorderSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def chartBorderSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setChartBackgroundSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def chartBackgroundSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def yAxis(self) -> QgsPlotAxis: ...
+    def xAxis(self) -> QgsPlotAxis: ...
+    def setYMaximum(self, maximum: float) -> None: ...
+    def yMaximum(self) -> float: ...
+    def setXMaximum(self, maximum: float) -> None: ...
+    def xMaximum(self) -> float: ...
+    def setYMinimum(self, minimum: float) -> None: ...
+    def yMinimum(self) -> float: ...
+    def setXMinimum(self, minimum: float) -> None: ...
+    def xMinimum(self) -> float: ...
+    def calculateOptimisedIntervals(self, context: QgsRenderContext) -> None: ...
+    def interiorPlotArea(self, context: QgsRenderContext) -> QtCore.QRectF: ...
+    def setSize(self, size: QtCore.QSizeF) -> None: ...
+    def size(self) -> QtCore.QSizeF: ...
+    def renderContent(self, context: QgsRenderContext, plotArea: QtCore.QRectF) -> None: ...
+    def render(self, context: QgsRenderContext) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+
+
+class QgsPlotDefaultSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPlotDefaultSettings') -> None: ...
+
+    @staticmethod
+    def chartBorderSymbol() -> typing.Optional['QgsFillSymbol']: ...
+    @staticmethod
+    def chartBackgroundSymbol() -> typing.Optional['QgsFillSymbol']: ...
+    @staticmethod
+    def axisGridMinorSymbol() -> typing.Optional['QgsLineSymbol']: ...
+    @staticmethod
+    def axisGridMajorSymbol() -> typing.Optional['QgsLineSymbol']: ...
+    @staticmethod
+    def axisLabelNumericFormat() -> typing.Optional['QgsNumericFormat']: ...
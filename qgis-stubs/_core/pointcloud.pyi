@@ -0,0 +1,1054 @@
+# The PEP 484 type hints stub file for the _core.pointcloud module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDoubleRange, QgsFeedback, QgsField, QgsFields, QgsVector3D,
+)
+from .diagram import QgsMapUnitScale
+from .elevation import (
+    QgsAbstractProfileGenerator, QgsAbstractProfileSource, QgsProfileRequest,
+    QgsTask,
+)
+from .geometry import QgsAbstractGeometry, QgsBox3D, QgsGeometry, QgsRectangle
+from .layertree import QgsLayerTreeLayer, QgsLayerTreeModelLegendNode
+from .metadata import QgsLayerMetadata
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .providers import QgsAbstractDatabaseProviderConnection, QgsDataProvider
+from .raster import QgsColorRampShader, QgsContrastEnhancement
+from .symbology import QgsFeatureRenderer, QgsFillSymbol
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsFeature, QgsFeatureSink, QgsMapLayer, QgsMapLayerElevationProperties,
+    QgsMapLayerRenderer, QgsReadWriteContext, QgsRenderContext, QgsVectorLayer,
+)
+
+
+class QgsVectorFileWriter(QgsFeatureSink):
+
+    class ActionOnExistingFile(int):
+        CreateOrOverwriteFile = ... # type: QgsVectorFileWriter.ActionOnExistingFile
+        CreateOrOverwriteLayer = ... # type: QgsVectorFileWriter.ActionOnExistingFile
+        AppendToLayerNoNewFields = ... # type: QgsVectorFileWriter.ActionOnExistingFile
+        AppendToLayerAddFields = ... # type: QgsVectorFileWriter.ActionOnExistingFile
+
+    class EditionCapability(int):
+        CanAddNewLayer = ... # type: QgsVectorFileWriter.EditionCapability
+        CanAppendToExistingLayer = ... # type: QgsVectorFileWriter.EditionCapability
+        CanAddNewFieldsToExistingLayer = ... # type: QgsVectorFileWriter.EditionCapability
+        CanDeleteLayer = ... # type: QgsVectorFileWriter.EditionCapability
+
+    class VectorFormatOption(int):
+        SortRecommended = ... # type: QgsVectorFileWriter.VectorFormatOption
+        SkipNonSpatialFormats = ... # type: QgsVectorFileWriter.VectorFormatOption
+        SupportsMultipleLayers = ... # type: QgsVectorFileWriter.VectorFormatOption
+
+    class FieldNameSource(int):
+        Original = ... # type: QgsVectorFileWriter.FieldNameSource
+        PreferAlias = ... # type: QgsVectorFileWriter.FieldNameSource
+
+    class WriterError(int):
+        NoError = ... # type: QgsVectorFileWriter.WriterError
+        ErrDriverNotFound = ... # type: QgsVectorFileWriter.WriterError
+        ErrCreateDataSource = ... # type: QgsVectorFileWriter.WriterError
+        ErrCreateLayer = ... # type: QgsVectorFileWriter.WriterError
+        ErrAttributeTypeUnsupported = ... # type: QgsVectorFileWriter.WriterError
+        ErrAttributeCreationFailed = ... # type: QgsVectorFileWriter.WriterError
+        ErrProjection = ... # type: QgsVectorFileWriter.WriterError
+        ErrFeatureWriteFailed = ... # type: QgsVectorFileWriter.WriterError
+        ErrInvalidLayer = ... # type: QgsVectorFileWriter.WriterError
+        ErrSavingMetadata = ... # type: QgsVectorFileWriter.WriterError
+        Canceled = ... # type: QgsVectorFileWriter.WriterError
+
+    class OptionType(int):
+        Set = ... # type: QgsVectorFileWriter.OptionType
+        String = ... # type: QgsVectorFileWriter.OptionType
+        Int = ... # type: QgsVectorFileWriter.OptionType
+        Hidden = ... # type: QgsVectorFileWriter.OptionType
+
+    class Option(PyQt5.sip.wrapper):
+
+        docString = ... # type: typing.Optional[str]
+        type = ... # type: 'QgsVectorFileWriter.OptionType'
+
+        @typing.overload
+        def __init__(self, docString: typing.Optional[str], type: 'QgsVectorFileWriter.OptionType') -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.Option') -> None: ...
+
+    class SetOption('QgsVectorFileWriter.Option'):
+
+        allowNone = ... # type: bool
+        defaultValue = ... # type: typing.Optional[str]
+        values = ... # type: collections.abc.Iterable[typing.Optional[str]]
+
+        @typing.overload
+        def __init__(self, docString: typing.Optional[str], values: collections.abc.Iterable[typing.Optional[str]], defaultValue: typing.Optional[str], allowNone: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.SetOption') -> None: ...
+
+    class StringOption('QgsVectorFileWriter.Option'):
+
+        defaultValue = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, docString: typing.Optional[str], defaultValue: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.StringOption') -> None: ...
+
+    class IntOption('QgsVectorFileWriter.Option'):
+
+        defaultValue = ... # type: int
+
+        @typing.overload
+        def __init__(self, docString: typing.Optional[str], defaultValue: int) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.IntOption') -> None: ...
+
+    class BoolOption('QgsVectorFileWriter.SetOption'):
+
+        @typing.overload
+        def __init__(self, docString: typing.Optional[str], defaultValue: bool) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.BoolOption') -> None: ...
+
+    class HiddenOption('QgsVectorFileWriter.Option'):
+
+        mValue = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, value: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.HiddenOption') -> None: ...
+
+    class MetaData(PyQt5.sip.wrapper):
+
+        compulsoryEncoding = ... # type: typing.Optional[str]
+        driverOptions = ... # type: typing.Any
+        ext = ... # type: typing.Optional[str]
+        glob = ... # type: typing.Optional[str]
+        layerOptions = ... # type: typing.Any
+        longName = ... # type: typing.Optional[str]
+        trLongName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, longName: typing.Optional[str], trLongName: typing.Optional[str], glob: typing.Optional[str], ext: typing.Optional[str], driverOptions: typing.Any, layerOptions: typing.Any, compulsoryEncoding: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.MetaData') -> None: ...
+
+    class VectorFormatOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __xor__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __ior__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __or__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __iand__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __and__(self, f: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption']) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __invert__(self) -> 'QgsVectorFileWriter.VectorFormatOptions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FieldValueConverter(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.FieldValueConverter') -> None: ...
+
+        def clone(self) -> typing.Optional['QgsVectorFileWriter.FieldValueConverter']: ...
+        def convert(self, fieldIdxInLayer: int, value: typing.Any) -> typing.Any: ...
+        def fieldDefinition(self, field: QgsField) -> QgsField: ...
+
+    class EditionCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __xor__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __ior__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __or__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __iand__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __and__(self, f: typing.Union['QgsVectorFileWriter.EditionCapabilities', 'QgsVectorFileWriter.EditionCapability']) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __invert__(self) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SaveVectorOptions(PyQt5.sip.wrapper):
+
+        actionOnExistingFile = ... # type: 'QgsVectorFileWriter.ActionOnExistingFile'
+        attributes = ... # type: collections.abc.Iterable[int]
+        attributesExportNames = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        ct = ... # type: 'QgsCoordinateTransform'
+        datasourceOptions = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        driverName = ... # type: typing.Optional[str]
+        feedback = ... # type: QgsFeedback
+        fieldNameSource = ... # type: 'QgsVectorFileWriter.FieldNameSource'
+        fieldValueConverter = ... # type: 'QgsVectorFileWriter.FieldValueConverter'
+        fileEncoding = ... # type: typing.Optional[str]
+        filterExtent = ... # type: 'QgsRectangle'
+        forceMulti = ... # type: bool
+        includeConstraints = ... # type: bool
+        includeZ = ... # type: bool
+        layerMetadata = ... # type: 'QgsLayerMetadata'
+        layerName = ... # type: typing.Optional[str]
+        layerOptions = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        onlySelectedFeatures = ... # type: bool
+        overrideGeometryType = ... # type: Qgis.WkbType
+        saveMetadata = ... # type: bool
+        setFieldDomains = ... # type: bool
+        skipAttributeCreation = ... # type: bool
+        sourceDatabaseProviderConnection = ... # type: 'QgsAbstractDatabaseProviderConnection'
+        symbologyExport = ... # type: Qgis.FeatureSymbologyExport
+        symbologyScale = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.SaveVectorOptions') -> None: ...
+
+    class FilterFormatDetails(PyQt5.sip.wrapper):
+
+        driverName = ... # type: typing.Optional[str]
+        filterString = ... # type: typing.Optional[str]
+        globs = ... # type: collections.abc.Iterable[typing.Optional[str]]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.FilterFormatDetails') -> None: ...
+
+    class DriverDetails(PyQt5.sip.wrapper):
+
+        driverName = ... # type: typing.Optional[str]
+        longName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorFileWriter.DriverDetails') -> None: ...
+
+    @deprecated("""""")
+    def __init__(self, vectorFileName: typing.Optional[str], fileEncoding: typing.Optional[str], fields: QgsFields, geometryType: Qgis.WkbType, srs: 'QgsCoordinateReferenceSystem' = ..., driverName: typing.Optional[str] = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ..., newFilename: typing.Optional[typing.Optional[str]] = ..., symbologyExport: Qgis.FeatureSymbologyExport = ..., sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ...) -> None: ...
+
+    @staticmethod
+    def areThereNewFieldsToCreate(datasetName: typing.Optional[str], layerName: typing.Optional[str], layer: typing.Optional[QgsVectorLayer], attributes: collections.abc.Iterable[int]) -> bool: ...
+    @staticmethod
+    def targetLayerExists(datasetName: typing.Optional[str], layerName: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def editionCapabilities(datasetName: typing.Optional[str]) -> 'QgsVectorFileWriter.EditionCapabilities': ...
+    @staticmethod
+    def defaultLayerOptions(driverName: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def defaultDatasetOptions(driverName: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def driverMetadata(driverName: typing.Optional[str], driverMetadata: 'QgsVectorFileWriter.MetaData') -> bool: ...
+    def setSymbologyScale(self, scale: float) -> None: ...
+    def symbologyScale(self) -> float: ...
+    def setSymbologyExport(self, symExport: Qgis.FeatureSymbologyExport) -> None: ...
+    def symbologyExport(self) -> Qgis.FeatureSymbologyExport: ...
+    @staticmethod
+    def deleteShapeFile(fileName: typing.Optional[str]) -> bool: ...
+    def sourceFieldIndexToWriterFieldIndex(self) -> typing.Any: ...
+    def addFeatureWithStyle(self, feature: QgsFeature, renderer: typing.Optional['QgsFeatureRenderer'], outputUnit: Qgis.DistanceUnit = ...) -> bool: ...
+    def lastError(self) -> str: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def capabilities(self) -> Qgis.VectorFileWriterCapabilities: ...
+    def driverLongName(self) -> str: ...
+    def driver(self) -> str: ...
+    def errorMessage(self) -> str: ...
+    def hasError(self) -> 'QgsVectorFileWriter.WriterError': ...
+    @staticmethod
+    def convertCodecNameForEncodingOption(codecName: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def filterForDriver(driverName: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def fileFilterString(options: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption'] = ...) -> str: ...
+    @staticmethod
+    def driverForExtension(extension: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def ogrDriverList(options: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption'] = ...) -> list['QgsVectorFileWriter.DriverDetails']: ...
+    @staticmethod
+    def supportsFeatureStyles(driverName: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def supportedFormatExtensions(options: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption'] = ...) -> list[str]: ...
+    @staticmethod
+    def supportedFiltersAndFormats(options: typing.Union['QgsVectorFileWriter.VectorFormatOptions', 'QgsVectorFileWriter.VectorFormatOption'] = ...) -> list['QgsVectorFileWriter.FilterFormatDetails']: ...
+    @staticmethod
+    def writeAsVectorFormatV3(layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], transformContext: 'QgsCoordinateTransformContext', options: 'QgsVectorFileWriter.SaveVectorOptions') -> typing.Tuple['QgsVectorFileWriter.WriterError', typing.Optional[str], typing.Optional[str], typing.Optional[str]]: ...
+    @staticmethod
+    @deprecated("""""")
+    def writeAsVectorFormatV2(layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], transformContext: 'QgsCoordinateTransformContext', options: 'QgsVectorFileWriter.SaveVectorOptions', newFilename: typing.Optional[typing.Optional[str]] = ..., newLayer: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple['QgsVectorFileWriter.WriterError', typing.Optional[str]]: ...
+    @staticmethod
+    def create(fileName: typing.Optional[str], fields: QgsFields, geometryType: Qgis.WkbType, srs: 'QgsCoordinateReferenceSystem', transformContext: 'QgsCoordinateTransformContext', options: 'QgsVectorFileWriter.SaveVectorOptions', sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ..., newFilename: typing.Optional[typing.Optional[str]] = ..., newLayer: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsVectorFileWriter']: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def writeAsVectorFormat(layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], fileEncoding: typing.Optional[str], destCRS: 'QgsCoordinateReferenceSystem' = ..., driverName: typing.Optional[str] = ..., onlySelected: bool = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ..., skipAttributeCreation: bool = ..., newFilename: typing.Optional[typing.Optional[str]] = ..., symbologyExport: Qgis.FeatureSymbologyExport = ..., symbologyScale: float = ..., filterExtent: typing.Optional['QgsRectangle'] = ..., overrideGeometryType: Qgis.WkbType = ..., forceMulti: bool = ..., includeZ: bool = ..., attributes: collections.abc.Iterable[int] = ..., fieldValueConverter: typing.Optional['QgsVectorFileWriter.FieldValueConverter'] = ...) -> typing.Tuple['QgsVectorFileWriter.WriterError', typing.Optional[str]]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def writeAsVectorFormat(layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], fileEncoding: typing.Optional[str], ct: 'QgsCoordinateTransform', driverName: typing.Optional[str] = ..., onlySelected: bool = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ..., skipAttributeCreation: bool = ..., newFilename: typing.Optional[typing.Optional[str]] = ..., symbologyExport: Qgis.FeatureSymbologyExport = ..., symbologyScale: float = ..., filterExtent: typing.Optional['QgsRectangle'] = ..., overrideGeometryType: Qgis.WkbType = ..., forceMulti: bool = ..., includeZ: bool = ..., attributes: collections.abc.Iterable[int] = ..., fieldValueConverter: typing.Optional['QgsVectorFileWriter.FieldValueConverter'] = ...) -> typing.Tuple['QgsVectorFileWriter.WriterError', typing.Optional[str]]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def writeAsVectorFormat(layer: typing.Optional[QgsVectorLayer], fileName: typing.Optional[str], options: 'QgsVectorFileWriter.SaveVectorOptions', newFilename: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple['QgsVectorFileWriter.WriterError', typing.Optional[str]]: ...
+    SymbologyExport: typing.Type[Qgis.FeatureSymbologyExport]
+    NoSymbology: Qgis.FeatureSymbologyExport
+    FeatureSymbology: Qgis.FeatureSymbologyExport
+    SymbolLayerSymbology: Qgis.FeatureSymbologyExport
+
+
+class QgsPointCloudAttribute(PyQt5.sip.wrapper):
+
+    class DataType(int):
+        Char = ... # type: QgsPointCloudAttribute.DataType
+        UChar = ... # type: QgsPointCloudAttribute.DataType
+        Short = ... # type: QgsPointCloudAttribute.DataType
+        UShort = ... # type: QgsPointCloudAttribute.DataType
+        Int32 = ... # type: QgsPointCloudAttribute.DataType
+        UInt32 = ... # type: QgsPointCloudAttribute.DataType
+        Int64 = ... # type: QgsPointCloudAttribute.DataType
+        UInt64 = ... # type: QgsPointCloudAttribute.DataType
+        Float = ... # type: QgsPointCloudAttribute.DataType
+        Double = ... # type: QgsPointCloudAttribute.DataType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], type: 'QgsPointCloudAttribute.DataType') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudAttribute') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    @staticmethod
+    def isNumeric(type: 'QgsPointCloudAttribute.DataType') -> bool: ...
+    def displayType(self) -> str: ...
+    def variantType(self) -> QtCore.QMetaType.Type: ...
+    def type(self) -> 'QgsPointCloudAttribute.DataType': ...
+    def size(self) -> int: ...
+    def name(self) -> str: ...
+
+
+class QgsPointCloudAttributeCollection(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, attributes: collections.abc.Iterable[QgsPointCloudAttribute]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudAttributeCollection') -> None: ...
+
+    def toFields(self) -> QgsFields: ...
+    def pointRecordSize(self) -> int: ...
+    def indexOf(self, name: typing.Optional[str]) -> int: ...
+    def find(self, attributeName: typing.Optional[str]) -> typing.Tuple[typing.Optional[QgsPointCloudAttribute], int]: ...
+    def at(self, index: int) -> QgsPointCloudAttribute: ...
+    def count(self) -> int: ...
+    def attributes(self) -> list[QgsPointCloudAttribute]: ...
+    def extend(self, otherCollection: 'QgsPointCloudAttributeCollection', matchingNames: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def push_back(self, attribute: QgsPointCloudAttribute) -> None: ...
+
+
+class QgsPointCloudRenderer(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def saveCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def restoreCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def copyCommonProperties(self, destination: typing.Optional['QgsPointCloudRenderer']) -> None: ...
+    def addPointToTriangulation(self, x: float, y: float, z: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], context: 'QgsPointCloudRenderContext') -> None: ...
+    @typing.overload
+    def drawPoint(self, x: float, y: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], context: 'QgsPointCloudRenderContext') -> None: ...
+    @typing.overload
+    def drawPoint(self, x: float, y: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], width: int, context: 'QgsPointCloudRenderContext') -> None: ...
+    @staticmethod
+    def pointZ(context: 'QgsPointCloudRenderContext', ptr: typing.Optional[str], i: int) -> float: ...
+    @staticmethod
+    def pointXY(context: 'QgsPointCloudRenderContext', ptr: typing.Optional[str], i: int) -> typing.Tuple[float, float]: ...
+    def zoomOutBehavior(self) -> Qgis.PointCloudZoomOutRenderBehavior: ...
+    def setZoomOutBehavior(self, behavior: Qgis.PointCloudZoomOutRenderBehavior) -> None: ...
+    def labelTextFormat(self) -> 'QgsTextFormat': ...
+    def setLabelTextFormat(self, textFormat: 'QgsTextFormat') -> None: ...
+    def showLabels(self) -> bool: ...
+    def setShowLabels(self, show: bool) -> None: ...
+    def legendRuleKeys(self) -> list[str]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def setHorizontalTriangleFilterUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def horizontalTriangleFilterUnit(self) -> Qgis.RenderUnit: ...
+    def setHorizontalTriangleFilterThreshold(self, threshold: float) -> None: ...
+    def horizontalTriangleFilterThreshold(self) -> float: ...
+    def setHorizontalTriangleFilter(self, enabled: bool) -> None: ...
+    def horizontalTriangleFilter(self) -> bool: ...
+    def setRenderAsTriangles(self, asTriangles: bool) -> None: ...
+    def renderAsTriangles(self) -> bool: ...
+    def setMaximumScreenErrorUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maximumScreenErrorUnit(self) -> Qgis.RenderUnit: ...
+    def setMaximumScreenError(self, error: float) -> None: ...
+    def maximumScreenError(self) -> float: ...
+    def setPointSymbol(self, symbol: Qgis.PointCloudSymbol) -> None: ...
+    def pointSymbol(self) -> Qgis.PointCloudSymbol: ...
+    def setDrawOrder2d(self, order: Qgis.PointCloudDrawOrder) -> None: ...
+    def drawOrder2d(self) -> Qgis.PointCloudDrawOrder: ...
+    def pointSizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setPointSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def pointSizeUnit(self) -> Qgis.RenderUnit: ...
+    def setPointSizeUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def pointSize(self) -> float: ...
+    def setPointSize(self, size: float) -> None: ...
+    def checkLegendItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def stopRender(self, context: 'QgsPointCloudRenderContext') -> None: ...
+    def startRender(self, context: 'QgsPointCloudRenderContext') -> None: ...
+    def usedAttributes(self, context: 'QgsPointCloudRenderContext') -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def load(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsPointCloudRenderer']: ...
+    def willRenderPoint(self, pointAttributes: dict[typing.Optional[str], typing.Any]) -> bool: ...
+    def renderBlock(self, block: typing.Optional['QgsPointCloudBlock'], context: 'QgsPointCloudRenderContext') -> None: ...
+    def clone(self) -> typing.Optional['QgsPointCloudRenderer']: ...
+    def type(self) -> str: ...
+    PointSymbol: typing.Type[Qgis.PointCloudSymbol]
+    Square: Qgis.PointCloudSymbol
+    Circle: Qgis.PointCloudSymbol
+    DrawOrder: typing.Type[Qgis.PointCloudDrawOrder]
+    Default: Qgis.PointCloudDrawOrder
+    BottomToTop: Qgis.PointCloudDrawOrder
+    TopToBottom: Qgis.PointCloudDrawOrder
+
+
+class QgsPointCloudAttributeByRampRenderer(QgsPointCloudRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setMaximum(self, maximum: float) -> None: ...
+    def maximum(self) -> float: ...
+    def setMinimum(self, minimum: float) -> None: ...
+    def minimum(self) -> float: ...
+    def setColorRampShader(self, shader: 'QgsColorRampShader') -> None: ...
+    def colorRampShader(self) -> 'QgsColorRampShader': ...
+    def setAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def attribute(self) -> str: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def usedAttributes(self, context: 'QgsPointCloudRenderContext') -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def renderBlock(self, block: typing.Optional['QgsPointCloudBlock'], context: 'QgsPointCloudRenderContext') -> None: ...
+    def clone(self) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def type(self) -> str: ...
+
+
+class QgsPointCloudAttributeModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        AttributeName = ... # type: QgsPointCloudAttributeModel.CustomRole
+        AttributeIndex = ... # type: QgsPointCloudAttributeModel.CustomRole
+        AttributeSize = ... # type: QgsPointCloudAttributeModel.CustomRole
+        AttributeType = ... # type: QgsPointCloudAttributeModel.CustomRole
+        IsEmpty = ... # type: QgsPointCloudAttributeModel.CustomRole
+        IsNumeric = ... # type: QgsPointCloudAttributeModel.CustomRole
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    @staticmethod
+    def iconForAttributeType(type: QgsPointCloudAttribute.DataType) -> QtGui.QIcon: ...
+    @staticmethod
+    def attributeToolTip(attribute: QgsPointCloudAttribute) -> str: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def allowEmptyAttributeName(self) -> bool: ...
+    def indexFromName(self, name: typing.Optional[str]) -> QtCore.QModelIndex: ...
+    def setAllowEmptyAttributeName(self, allowEmpty: bool) -> None: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def setAttributes(self, attributes: QgsPointCloudAttributeCollection) -> None: ...
+    def layer(self) -> typing.Optional['QgsPointCloudLayer']: ...
+    def setLayer(self, layer: typing.Optional['QgsPointCloudLayer']) -> None: ...
+    FieldRoles: typing.Type[QgsPointCloudAttributeModel.CustomRole]
+    AttributeNameRole: QgsPointCloudAttributeModel.CustomRole
+    AttributeIndexRole: QgsPointCloudAttributeModel.CustomRole
+    AttributeSizeRole: QgsPointCloudAttributeModel.CustomRole
+    AttributeTypeRole: QgsPointCloudAttributeModel.CustomRole
+    IsEmptyRole: QgsPointCloudAttributeModel.CustomRole
+    IsNumericRole: QgsPointCloudAttributeModel.CustomRole
+
+
+class QgsPointCloudAttributeProxyModel(QtCore.QSortFilterProxyModel):
+
+    class Filter(int):
+        Char = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        Short = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        Int32 = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        Float = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        Double = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        Numeric = ... # type: QgsPointCloudAttributeProxyModel.Filter
+        AllTypes = ... # type: QgsPointCloudAttributeProxyModel.Filter
+
+    class Filters(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __xor__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __ior__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __or__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __iand__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __and__(self, f: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __invert__(self) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, source: typing.Optional[QgsPointCloudAttributeModel], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def filters(self) -> 'QgsPointCloudAttributeProxyModel.Filters': ...
+    def setFilters(self, filters: typing.Union['QgsPointCloudAttributeProxyModel.Filters', 'QgsPointCloudAttributeProxyModel.Filter']) -> typing.Optional['QgsPointCloudAttributeProxyModel']: ...
+    def sourceAttributeModel(self) -> typing.Optional[QgsPointCloudAttributeModel]: ...
+
+
+class QgsPointCloudCategory(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, value: int, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], label: typing.Optional[str], render: bool = ..., pointSize: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudCategory') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def setRenderState(self, render: bool) -> None: ...
+    def renderState(self) -> bool: ...
+    def setLabel(self, label: typing.Optional[str]) -> None: ...
+    def setPointSize(self, size: float) -> None: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setValue(self, value: int) -> None: ...
+    def label(self) -> str: ...
+    def pointSize(self) -> float: ...
+    def color(self) -> QtGui.QColor: ...
+    def value(self) -> int: ...
+    def __eq__(self, other: object): ...
+
+
+class QgsPointCloudClassifiedRenderer(QgsPointCloudRenderer):
+
+    def __init__(self, attributeName: typing.Optional[str] = ..., categories: collections.abc.Iterable[QgsPointCloudCategory] = ...) -> None: ...
+
+    def addCategory(self, category: QgsPointCloudCategory) -> None: ...
+    def setCategories(self, categories: collections.abc.Iterable[QgsPointCloudCategory]) -> None: ...
+    def categories(self) -> list[QgsPointCloudCategory]: ...
+    def setAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def attribute(self) -> str: ...
+    @staticmethod
+    def defaultCategories() -> list[QgsPointCloudCategory]: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def checkLegendItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendRuleKeys(self) -> list[str]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def usedAttributes(self, context: 'QgsPointCloudRenderContext') -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def willRenderPoint(self, pointAttributes: dict[str, typing.Any]) -> bool: ...
+    def renderBlock(self, block: typing.Optional['QgsPointCloudBlock'], context: 'QgsPointCloudRenderContext') -> None: ...
+    def clone(self) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def type(self) -> str: ...
+
+
+class QgsPointCloudExtentRenderer(QgsPointCloudRenderer):
+
+    def __init__(self, symbol: typing.Optional['QgsFillSymbol'] = ...) -> None: ...
+
+    def renderLabel(self, extent: QtCore.QRectF, text: typing.Optional[str], context: 'QgsPointCloudRenderContext') -> None: ...
+    def setFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def fillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    @staticmethod
+    def defaultFillSymbol() -> typing.Optional['QgsFillSymbol']: ...
+    def renderExtent(self, extent: QgsGeometry, context: 'QgsPointCloudRenderContext') -> None: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def stopRender(self, context: 'QgsPointCloudRenderContext') -> None: ...
+    def startRender(self, context: 'QgsPointCloudRenderContext') -> None: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def renderBlock(self, block: typing.Optional['QgsPointCloudBlock'], context: 'QgsPointCloudRenderContext') -> None: ...
+    def clone(self) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def type(self) -> str: ...
+
+
+class QgsPointCloudBlock(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, count: int, attributes: QgsPointCloudAttributeCollection, data: typing.Union[QtCore.QByteArray, bytes, bytearray], scale: QgsVector3D, offset: QgsVector3D) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudBlock') -> None: ...
+
+    def setPointCount(self, size: int) -> None: ...
+    def offset(self) -> QgsVector3D: ...
+    def scale(self) -> QgsVector3D: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def pointRecordSize(self) -> int: ...
+    def pointCount(self) -> int: ...
+    def data(self) -> typing.Optional[str]: ...
+    def clone(self) -> typing.Optional['QgsPointCloudBlock']: ...
+
+
+class QgsPointCloudLayer(QgsMapLayer, QgsAbstractProfileSource):
+
+    class PointCloudStatisticsCalculationState(int):
+        NotStarted = ... # type: QgsPointCloudLayer.PointCloudStatisticsCalculationState
+        Calculating = ... # type: QgsPointCloudLayer.PointCloudStatisticsCalculationState
+        Calculated = ... # type: QgsPointCloudLayer.PointCloudStatisticsCalculationState
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadDefaultStyle = ... # type: bool
+        skipCrsValidation = ... # type: bool
+        skipIndexGeneration = ... # type: bool
+        skipStatisticsCalculation = ... # type: bool
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext' = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPointCloudLayer.LayerOptions') -> None: ...
+
+    def __init__(self, uri: typing.Optional[str] = ..., baseName: typing.Optional[str] = ..., providerLib: typing.Optional[str] = ..., options: 'QgsPointCloudLayer.LayerOptions' = ...) -> None: ...
+
+    chunkAttributeValuesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    statisticsCalculationStateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    raiseError: typing.ClassVar[QtCore.pyqtSignal]
+    subsetStringChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def index(self) -> 'QgsPointCloudIndex': ...
+    def rollBack(self) -> bool: ...
+    def commitError(self) -> str: ...
+    def commitChanges(self, stopEditing: bool = ...) -> bool: ...
+    def startEditing(self) -> bool: ...
+    def statisticsCalculationState(self) -> 'QgsPointCloudLayer.PointCloudStatisticsCalculationState': ...
+    def statistics(self) -> 'QgsPointCloudStatistics': ...
+    def convertRenderer3DFromRenderer2D(self) -> bool: ...
+    def sync3DRendererTo2DRenderer(self) -> bool: ...
+    def setSync3DRendererTo2DRenderer(self, sync: bool) -> None: ...
+    def subsetString(self) -> str: ...
+    def setSubsetString(self, subset: typing.Optional[str]) -> bool: ...
+    def setRenderer(self, renderer: typing.Optional[QgsPointCloudRenderer]) -> None: ...
+    def renderer(self) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def pointCount(self) -> int: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def elevationProperties(self) -> typing.Optional[QgsMapLayerElevationProperties]: ...
+    def htmlMetadata(self) -> str: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def decodedSource(self, source: typing.Optional[str], dataProvider: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def setTransformContext(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeXml(self, layerNode: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def readXml(self, layerNode: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def isModified(self) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def supportsEditing(self) -> bool: ...
+    def dataProvider(self) -> typing.Optional['QgsPointCloudDataProvider']: ...
+    def createProfileGenerator(self, request: QgsProfileRequest) -> typing.Optional[QgsAbstractProfileGenerator]: ...
+    def profileSource(self) -> typing.Optional[QgsAbstractProfileSource]: ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def extent(self) -> QgsRectangle: ...
+    def clone(self) -> typing.Optional['QgsPointCloudLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsPointCloudLayerElevationProperties(QgsMapLayerElevationProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def setRespectLayerColors(self, enabled: bool) -> None: ...
+    def respectLayerColors(self) -> bool: ...
+    def pointSizeUnit(self) -> Qgis.RenderUnit: ...
+    def setPointSizeUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def pointSize(self) -> float: ...
+    def setPointSize(self, size: float) -> None: ...
+    def setApplyOpacityByDistanceEffect(self, apply: bool) -> None: ...
+    def applyOpacityByDistanceEffect(self) -> bool: ...
+    def setPointColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def pointColor(self) -> QtGui.QColor: ...
+    def setPointSymbol(self, symbol: Qgis.PointCloudSymbol) -> None: ...
+    def pointSymbol(self) -> Qgis.PointCloudSymbol: ...
+    def setMaximumScreenErrorUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maximumScreenErrorUnit(self) -> Qgis.RenderUnit: ...
+    def setMaximumScreenError(self, error: float) -> None: ...
+    def maximumScreenError(self) -> float: ...
+    def showByDefaultInElevationProfilePlots(self) -> bool: ...
+    def significantZValues(self, layer: typing.Optional[QgsMapLayer]) -> list[float]: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> QgsDoubleRange: ...
+    def isVisibleInZRange(self, range: QgsDoubleRange, layer: typing.Optional[QgsMapLayer] = ...) -> bool: ...
+    def htmlSummary(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsPointCloudLayerElevationProperties']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+
+
+class QgsPointCloudNodeId(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, _d: int, _x: int, _y: int, _z: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudNodeId') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def z(self) -> int: ...
+    def y(self) -> int: ...
+    def x(self) -> int: ...
+    def d(self) -> int: ...
+    def toString(self) -> str: ...
+    @staticmethod
+    def fromString(str: typing.Optional[str]) -> 'QgsPointCloudNodeId': ...
+    def parentNode(self) -> 'QgsPointCloudNodeId': ...
+    def __eq__(self, other: object): ...
+    def isValid(self) -> bool: ...
+
+
+class QgsPointCloudNode(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, id: QgsPointCloudNodeId, pointCount: int, childIds: collections.abc.Iterable[QgsPointCloudNodeId], error: float, bounds: QgsBox3D) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudNode') -> None: ...
+
+    @typing.overload
+    def bounds(self) -> QgsBox3D: ...
+    @typing.overload
+    @staticmethod
+    def bounds(rootBounds: QgsBox3D, id: QgsPointCloudNodeId) -> QgsBox3D: ...
+    def error(self) -> float: ...
+    def children(self) -> list[QgsPointCloudNodeId]: ...
+    def pointCount(self) -> int: ...
+    def id(self) -> QgsPointCloudNodeId: ...
+
+
+class QgsPointCloudIndex(PyQt5.sip.wrapper):
+
+    def updatedNodes(self) -> list[QgsPointCloudNodeId]: ...
+    def isModified(self) -> bool: ...
+    def commitChanges(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def extraMetadata(self) -> dict[str, typing.Any]: ...
+    def subsetString(self) -> str: ...
+    def setSubsetString(self, subset: typing.Optional[str]) -> bool: ...
+    def span(self) -> int: ...
+    def offset(self) -> QgsVector3D: ...
+    def scale(self) -> QgsVector3D: ...
+    def rootNodeBounds(self) -> QgsBox3D: ...
+    def zMax(self) -> float: ...
+    def zMin(self) -> float: ...
+    def extent(self) -> QgsRectangle: ...
+    def updateNodeData(self, data: dict[QgsPointCloudNodeId, typing.Union[QtCore.QByteArray, bytes, bytearray]]) -> bool: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def getNode(self, id: QgsPointCloudNodeId) -> QgsPointCloudNode: ...
+    def hasNode(self, id: QgsPointCloudNodeId) -> bool: ...
+    def root(self) -> QgsPointCloudNodeId: ...
+    def writeStatistics(self, stats: 'QgsPointCloudStatistics') -> bool: ...
+    def metadataStatistics(self) -> 'QgsPointCloudStatistics': ...
+    def originalMetadata(self) -> dict[str, typing.Any]: ...
+    def pointCount(self) -> int: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def accessType(self) -> Qgis.PointCloudAccessType: ...
+    def error(self) -> str: ...
+    def isValid(self) -> bool: ...
+    def load(self, fileName: typing.Optional[str]) -> None: ...
+    def __int__(self) -> bool: ...
+
+
+class QgsPointCloudDataProvider(QgsDataProvider):
+
+    class PointCloudIndexGenerationState(int):
+        NotIndexed = ... # type: QgsPointCloudDataProvider.PointCloudIndexGenerationState
+        Indexing = ... # type: QgsPointCloudDataProvider.PointCloudIndexGenerationState
+        Indexed = ... # type: QgsPointCloudDataProvider.PointCloudIndexGenerationState
+
+    class Capability(int):
+        NoCapabilities = ... # type: QgsPointCloudDataProvider.Capability
+        ReadLayerMetadata = ... # type: QgsPointCloudDataProvider.Capability
+        WriteLayerMetadata = ... # type: QgsPointCloudDataProvider.Capability
+        CreateRenderer = ... # type: QgsPointCloudDataProvider.Capability
+        ContainSubIndexes = ... # type: QgsPointCloudDataProvider.Capability
+        ChangeAttributeValues = ... # type: QgsPointCloudDataProvider.Capability
+
+    class Capabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __xor__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __ior__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __or__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __iand__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __and__(self, f: typing.Union['QgsPointCloudDataProvider.Capabilities', 'QgsPointCloudDataProvider.Capability']) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __invert__(self) -> 'QgsPointCloudDataProvider.Capabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, uri: typing.Optional[str], providerOptions: QgsDataProvider.ProviderOptions, flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+
+    indexGenerationStateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def translatedDataFormatIds() -> dict[int, str]: ...
+    @staticmethod
+    def dataFormatIds() -> dict[int, str]: ...
+    @staticmethod
+    def translatedLasClassificationCodes() -> dict[int, str]: ...
+    @staticmethod
+    def lasClassificationCodes() -> dict[int, str]: ...
+    def setSubsetString(self, subset: typing.Optional[str], updateFeatureCount: bool = ...) -> bool: ...
+    def subsetString(self) -> str: ...
+    def subsetStringHelpUrl(self) -> str: ...
+    def subsetStringDialect(self) -> str: ...
+    def supportsSubsetString(self) -> bool: ...
+    def metadataStatistics(self) -> 'QgsPointCloudStatistics': ...
+    def createRenderer(self, configuration: dict[str, typing.Any] = ...) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def originalMetadata(self) -> dict[str, typing.Any]: ...
+    def polygonBounds(self) -> QgsGeometry: ...
+    def pointCount(self) -> int: ...
+    def hasValidIndex(self) -> bool: ...
+    def index(self) -> QgsPointCloudIndex: ...
+    def indexingState(self) -> 'QgsPointCloudDataProvider.PointCloudIndexGenerationState': ...
+    def generateIndex(self) -> None: ...
+    def loadIndex(self) -> None: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def capabilities(self) -> 'QgsPointCloudDataProvider.Capabilities': ...
+    def identify(self, maxErrorInMapCoords: float, extentGeometry: QgsGeometry, extentZRange: QgsDoubleRange = ..., pointsLimit: int = ...) -> list: ...
+
+
+class QgsPointCloudRenderContext(PyQt5.sip.wrapper):
+
+    def __init__(self, context: QgsRenderContext, scale: QgsVector3D, offset: QgsVector3D, zValueScale: float, zValueFixedOffset: float, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def zValueFixedOffset(self) -> float: ...
+    def zValueScale(self) -> float: ...
+    def zOffset(self) -> int: ...
+    def yOffset(self) -> int: ...
+    def xOffset(self) -> int: ...
+    def pointRecordSize(self) -> int: ...
+    def setAttributes(self, attributes: QgsPointCloudAttributeCollection) -> None: ...
+    def attributes(self) -> QgsPointCloudAttributeCollection: ...
+    def incrementPointsRendered(self, count: int) -> None: ...
+    def pointsRendered(self) -> int: ...
+    def setOffset(self, offset: QgsVector3D) -> None: ...
+    def offset(self) -> QgsVector3D: ...
+    def setScale(self, scale: QgsVector3D) -> None: ...
+    def scale(self) -> QgsVector3D: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsPointCloudRendererAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str], icon: QtGui.QIcon = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudRendererAbstractMetadata') -> None: ...
+
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsPointCloudRendererMetadata(QgsPointCloudRendererAbstractMetadata):
+
+    def __init__(self, a0: 'QgsPointCloudRendererMetadata') -> None: ...
+
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+
+
+class QgsPointCloudRendererRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def classificationAttributeCategories(layer: typing.Optional[QgsPointCloudLayer]) -> list[QgsPointCloudCategory]: ...
+    @staticmethod
+    def defaultRenderer(layer: typing.Optional[QgsPointCloudLayer]) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def renderersList(self) -> list[str]: ...
+    def rendererMetadata(self, rendererName: typing.Optional[str]) -> typing.Optional[QgsPointCloudRendererAbstractMetadata]: ...
+    def removeRenderer(self, rendererName: typing.Optional[str]) -> bool: ...
+    def addRenderer(self, metadata: typing.Optional[QgsPointCloudRendererAbstractMetadata]) -> bool: ...
+
+
+class QgsPointCloudRgbRenderer(QgsPointCloudRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setBlueContrastEnhancement(self, enhancement: typing.Optional['QgsContrastEnhancement']) -> None: ...
+    def blueContrastEnhancement(self) -> typing.Optional['QgsContrastEnhancement']: ...
+    def setGreenContrastEnhancement(self, enhancement: typing.Optional['QgsContrastEnhancement']) -> None: ...
+    def greenContrastEnhancement(self) -> typing.Optional['QgsContrastEnhancement']: ...
+    def setRedContrastEnhancement(self, enhancement: typing.Optional['QgsContrastEnhancement']) -> None: ...
+    def redContrastEnhancement(self) -> typing.Optional['QgsContrastEnhancement']: ...
+    def setBlueAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def blueAttribute(self) -> str: ...
+    def setGreenAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def greenAttribute(self) -> str: ...
+    def setRedAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def redAttribute(self) -> str: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def usedAttributes(self, context: QgsPointCloudRenderContext) -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def renderBlock(self, block: typing.Optional[QgsPointCloudBlock], context: QgsPointCloudRenderContext) -> None: ...
+    def clone(self) -> typing.Optional[QgsPointCloudRenderer]: ...
+    def type(self) -> str: ...
+
+
+class QgsPointCloudLayerExporter(PyQt5.sip.wrapper):
+
+    class ExportFormat(int):
+        Memory = ... # type: QgsPointCloudLayerExporter.ExportFormat
+        Las = ... # type: QgsPointCloudLayerExporter.ExportFormat
+        Gpkg = ... # type: QgsPointCloudLayerExporter.ExportFormat
+        Shp = ... # type: QgsPointCloudLayerExporter.ExportFormat
+        Dxf = ... # type: QgsPointCloudLayerExporter.ExportFormat
+        Csv = ... # type: QgsPointCloudLayerExporter.ExportFormat
+
+    def __init__(self, layer: typing.Optional[QgsPointCloudLayer]) -> None: ...
+
+    def lastError(self) -> str: ...
+    def takeExportedLayer(self) -> typing.Optional[QgsMapLayer]: ...
+    def doExport(self) -> None: ...
+    def prepareExport(self) -> None: ...
+    def setActionOnExistingFile(self, action: QgsVectorFileWriter.ActionOnExistingFile) -> None: ...
+    def pointsLimit(self) -> int: ...
+    def setPointsLimit(self, limit: int) -> None: ...
+    def format(self) -> 'QgsPointCloudLayerExporter.ExportFormat': ...
+    def setFormat(self, format: 'QgsPointCloudLayerExporter.ExportFormat') -> bool: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem', context: 'QgsCoordinateTransformContext' = ...) -> None: ...
+    def attributes(self) -> list[str]: ...
+    def setAllAttributes(self) -> None: ...
+    def setNoAttributes(self) -> None: ...
+    def setAttributes(self, attributes: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def setFeedback(self, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def zRange(self) -> QgsDoubleRange: ...
+    def setZRange(self, zRange: QgsDoubleRange) -> None: ...
+    @typing.overload
+    def setFilterGeometry(self, geometry: typing.Optional[QgsAbstractGeometry]) -> None: ...
+    @typing.overload
+    def setFilterGeometry(self, layer: typing.Optional[QgsMapLayer], selectedFeaturesOnly: bool = ...) -> None: ...
+    def filterExtent(self) -> QgsRectangle: ...
+    def setFilterExtent(self, extent: QgsRectangle) -> None: ...
+    def layerName(self) -> str: ...
+    def setLayerName(self, name: typing.Optional[str]) -> None: ...
+    def fileName(self) -> str: ...
+    def setFileName(self, filename: typing.Optional[str]) -> None: ...
+
+
+class QgsPointCloudLayerExporterTask(QgsTask):
+
+    def __init__(self, exporter: typing.Optional[QgsPointCloudLayerExporter]) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    exportComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+
+
+class QgsPointCloudAttributeStatistics(PyQt5.sip.wrapper):
+
+    count = ... # type: int
+    maximum = ... # type: float
+    mean = ... # type: float
+    minimum = ... # type: float
+    stDev = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudAttributeStatistics') -> None: ...
+
+    def singleClassCount(self, cls: int) -> int: ...
+
+
+class QgsPointCloudStatistics(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPointCloudStatistics') -> None: ...
+
+    @staticmethod
+    def fromStatisticsJson(stats: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> 'QgsPointCloudStatistics': ...
+    def toStatisticsJson(self) -> QtCore.QByteArray: ...
+    def combineWith(self, stats: 'QgsPointCloudStatistics') -> None: ...
+    def stDev(self, attribute: typing.Optional[str]) -> float: ...
+    def mean(self, attribute: typing.Optional[str]) -> float: ...
+    def maximum(self, attribute: typing.Optional[str]) -> float: ...
+    def minimum(self, attribute: typing.Optional[str]) -> float: ...
+    def classesOf(self, attribute: typing.Optional[str]) -> list[int]: ...
+    def statisticsOf(self, attribute: typing.Optional[str]) -> QgsPointCloudAttributeStatistics: ...
+    @typing.overload
+    def clear(self) -> None: ...
+    @typing.overload
+    def clear(self, attributes: collections.abc.Iterable[QgsPointCloudAttribute]) -> None: ...
+    def sampledPointsCount(self) -> int: ...
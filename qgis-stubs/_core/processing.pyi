@@ -0,0 +1,2910 @@
+# The PEP 484 type hints stub file for the _core.processing module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsAlignRasterData, QgsDateTimeRange, QgsFeedback, QgsFields,
+    QgsFileFilterGenerator, QgsPropertyDefinition,
+)
+from .annotations import QgsAnnotationLayer
+from .dxf import QgsDxfExport
+from .elevation import QgsTask
+from .geometry import QgsGeometry, QgsRectangle
+from .layertree import QgsProperty
+from .layout import QgsLayoutItem, QgsPrintLayout
+from .mesh import (
+    QgsMeshDatasetGroupMetadata, QgsMeshDatasetIndex, QgsMeshLayer,
+)
+from .pointcloud import QgsPointCloudLayer
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .project import QgsProject
+from .raster import QgsRasterLayer
+from .tiledscene import QgsTiledSceneLayer
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextScope, QgsFeature,
+    QgsFeatureIterator, QgsFeatureRequest, QgsFeatureSink, QgsFeatureSource,
+    QgsMapLayer, QgsMapLayerStore, QgsPluginLayer, QgsPointXY, QgsVectorLayer,
+)
+from .vectortile import QgsVectorTileLayer, QgsVectorTileWriter
+
+
+class QgsRemappingSinkDefinition(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRemappingSinkDefinition') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def setDestinationFields(self, fields: QgsFields) -> None: ...
+    def destinationFields(self) -> QgsFields: ...
+    def setDestinationWkbType(self, type: Qgis.WkbType) -> None: ...
+    def destinationWkbType(self) -> Qgis.WkbType: ...
+    def setDestinationCrs(self, destination: 'QgsCoordinateReferenceSystem') -> None: ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setSourceCrs(self, source: 'QgsCoordinateReferenceSystem') -> None: ...
+    def sourceCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def addMappedField(self, destinationField: typing.Optional[str], property: QgsProperty) -> None: ...
+    def setFieldMap(self, map: dict[typing.Optional[str], QgsProperty]) -> None: ...
+    def fieldMap(self) -> dict[str, QgsProperty]: ...
+
+
+class QgsProcessingAlgorithm(PyQt5.sip.wrapper):
+
+    class VectorProperties(PyQt5.sip.wrapper):
+
+        availability = ... # type: Qgis.ProcessingPropertyAvailability
+        crs = ... # type: QgsCoordinateReferenceSystem
+        fields = ... # type: QgsFields
+        wkbType = ... # type: Qgis.WkbType
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProcessingAlgorithm.VectorProperties') -> None: ...
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def writeFeatureError(sink: typing.Optional[QgsFeatureSink], parameters: dict[str, typing.Any], name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def invalidPointCloudError(parameters: dict[str, typing.Any], name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def invalidSinkError(parameters: dict[str, typing.Any], name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def invalidRasterError(parameters: dict[str, typing.Any], name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def invalidSourceError(parameters: dict[str, typing.Any], name: typing.Optional[str]) -> str: ...
+    def parameterAsAnnotationLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional[QgsAnnotationLayer]: ...
+    def parameterAsPointCloudLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', flags: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag'] = ...) -> typing.Optional[QgsPointCloudLayer]: ...
+    def parameterAsDateTime(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QtCore.QDateTime: ...
+    def parameterAsDatabaseTableName(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsSchema(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsConnectionName(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsColor(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QtGui.QColor: ...
+    def parameterAsLayoutItem(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', layout: typing.Optional[QgsPrintLayout]) -> typing.Optional[QgsLayoutItem]: ...
+    def parameterAsLayout(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional[QgsPrintLayout]: ...
+    def parameterAsStrings(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[str]: ...
+    @deprecated("""""")
+    def parameterAsFields(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[str]: ...
+    def parameterAsRange(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[float]: ...
+    def parameterAsFileList(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[str]: ...
+    def parameterAsLayerList(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', flags: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag'] = ...) -> list[QgsMapLayer]: ...
+    def parameterAsMatrix(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[typing.Any]: ...
+    def parameterAsFile(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsGeometryCrs(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QgsCoordinateReferenceSystem: ...
+    def parameterAsGeometry(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', crs: QgsCoordinateReferenceSystem = ...) -> QgsGeometry: ...
+    def parameterAsPointCrs(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QgsCoordinateReferenceSystem: ...
+    def parameterAsPoint(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', crs: QgsCoordinateReferenceSystem = ...) -> QgsPointXY: ...
+    def parameterAsExtentCrs(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QgsCoordinateReferenceSystem: ...
+    def parameterAsExtentGeometry(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', crs: QgsCoordinateReferenceSystem = ...) -> QgsGeometry: ...
+    def parameterAsExtent(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', crs: QgsCoordinateReferenceSystem = ...) -> QgsRectangle: ...
+    def parameterAsCrs(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> QgsCoordinateReferenceSystem: ...
+    def parameterAsVectorLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional[QgsVectorLayer]: ...
+    def parameterAsFileOutput(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsOutputLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsMeshLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional[QgsMeshLayer]: ...
+    def parameterAsRasterLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional['QgsRasterLayer']: ...
+    def parameterAsLayer(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional[QgsMapLayer]: ...
+    def parameterAsCompatibleSourceLayerPathAndLayerName(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str] = ..., feedback: typing.Optional['QgsProcessingFeedback'] = ...) -> typing.Tuple[str, typing.Optional[str]]: ...
+    def parameterAsCompatibleSourceLayerPath(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str] = ..., feedback: typing.Optional['QgsProcessingFeedback'] = ...) -> str: ...
+    def parameterAsSource(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> typing.Optional['QgsProcessingFeatureSource']: ...
+    def parameterAsSink(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext', fields: QgsFields, geometryType: Qgis.WkbType = ..., crs: QgsCoordinateReferenceSystem = ..., sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ..., createOptions: dict[str, typing.Any] = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional[QgsFeatureSink], str]: ...
+    def parameterAsBoolean(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> bool: ...
+    def parameterAsBool(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> bool: ...
+    def parameterAsEnumStrings(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[str]: ...
+    def parameterAsEnumString(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsEnums(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[int]: ...
+    def parameterAsEnum(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> int: ...
+    def parameterAsInts(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> list[int]: ...
+    def parameterAsInt(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> int: ...
+    def parameterAsDouble(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> float: ...
+    def parameterAsExpression(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def parameterAsString(self, parameters: dict[str, typing.Any], name: typing.Optional[str], context: 'QgsProcessingContext') -> str: ...
+    def postProcessAlgorithm(self, context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> dict[str, typing.Any]: ...
+    def processAlgorithm(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> dict[str, typing.Any]: ...
+    def prepareAlgorithm(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> bool: ...
+    def addOutput(self, outputDefinition: typing.Optional['QgsProcessingOutputDefinition']) -> bool: ...
+    def removeParameter(self, name: typing.Optional[str]) -> None: ...
+    def addParameter(self, parameterDefinition: typing.Optional['QgsProcessingParameterDefinition'], createOutput: bool = ...) -> bool: ...
+    def initAlgorithm(self, configuration: dict[str, typing.Any] = ...) -> None: ...
+    def createInstance(self) -> typing.Optional['QgsProcessingAlgorithm']: ...
+    def supportInPlaceEdit(self, layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    def setProvider(self, provider: typing.Optional['QgsProcessingProvider']) -> None: ...
+    def asMap(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> dict[str, typing.Any]: ...
+    def asQgisProcessCommand(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> typing.Tuple[str, bool]: ...
+    def asPythonCommand(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> str: ...
+    def validateInputCrs(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> bool: ...
+    def createExpressionContext(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', source: typing.Optional['QgsProcessingFeatureSource'] = ...) -> QgsExpressionContext: ...
+    def createCustomParametersWidget(self, parent: typing.Optional[QtWidgets.QWidget] = ...) -> typing.Optional[QtWidgets.QWidget]: ...
+    def postProcess(self, context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback'], runResult: bool = ...) -> dict[str, typing.Any]: ...
+    def runPrepared(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> dict[str, typing.Any]: ...
+    def prepare(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> bool: ...
+    def run(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback'], configuration: dict[str, typing.Any] = ..., catchExceptions: bool = ...) -> typing.Tuple[dict[str, typing.Any], typing.Optional[bool]]: ...
+    def sinkProperties(self, sink: typing.Optional[str], parameters: dict[str, typing.Any], context: 'QgsProcessingContext', sourceProperties: dict[typing.Optional[str], 'QgsProcessingAlgorithm.VectorProperties']) -> 'QgsProcessingAlgorithm.VectorProperties': ...
+    def hasHtmlOutputs(self) -> bool: ...
+    def outputDefinition(self, name: typing.Optional[str]) -> typing.Optional['QgsProcessingOutputDefinition']: ...
+    def outputDefinitions(self) -> list['QgsProcessingOutputDefinition']: ...
+    def destinationParameterDefinitions(self) -> list['QgsProcessingParameterDefinition']: ...
+    def countVisibleParameters(self) -> int: ...
+    def parameterDefinition(self, name: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDefinition']: ...
+    def parameterDefinitions(self) -> list['QgsProcessingParameterDefinition']: ...
+    def provider(self) -> typing.Optional['QgsProcessingProvider']: ...
+    def autogenerateParameterValues(self, existingParameters: dict[str, typing.Any], changedParameter: typing.Optional[str], mode: Qgis.ProcessingMode) -> dict[str, typing.Any]: ...
+    def preprocessParameters(self, parameters: dict[str, typing.Any]) -> dict[str, typing.Any]: ...
+    def checkParameterValues(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def canExecute(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def flags(self) -> Qgis.ProcessingAlgorithmFlags: ...
+    def groupId(self) -> str: ...
+    def group(self) -> str: ...
+    def svgIconPath(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def documentationFlags(self) -> Qgis.ProcessingAlgorithmDocumentationFlags: ...
+    def helpUrl(self) -> str: ...
+    @deprecated("""""")
+    def helpString(self) -> str: ...
+    def shortHelpString(self) -> str: ...
+    def tags(self) -> list[str]: ...
+    def shortDescription(self) -> str: ...
+    def displayName(self) -> str: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def create(self, configuration: dict[str, typing.Any] = ...) -> typing.Optional['QgsProcessingAlgorithm']: ...
+    Flag: typing.Type[Qgis.ProcessingAlgorithmFlag]
+    FlagHideFromToolbox: Qgis.ProcessingAlgorithmFlag
+    FlagHideFromModeler: Qgis.ProcessingAlgorithmFlag
+    FlagSupportsBatch: Qgis.ProcessingAlgorithmFlag
+    FlagCanCancel: Qgis.ProcessingAlgorithmFlag
+    FlagRequiresMatchingCrs: Qgis.ProcessingAlgorithmFlag
+    FlagNoThreading: Qgis.ProcessingAlgorithmFlag
+    FlagDisplayNameIsLiteral: Qgis.ProcessingAlgorithmFlag
+    FlagSupportsInPlaceEdits: Qgis.ProcessingAlgorithmFlag
+    FlagKnownIssues: Qgis.ProcessingAlgorithmFlag
+    FlagCustomException: Qgis.ProcessingAlgorithmFlag
+    FlagPruneModelBranchesBasedOnAlgorithmResults: Qgis.ProcessingAlgorithmFlag
+    FlagSkipGenericModelLogging: Qgis.ProcessingAlgorithmFlag
+    FlagNotAvailableInStandaloneTool: Qgis.ProcessingAlgorithmFlag
+    FlagRequiresProject: Qgis.ProcessingAlgorithmFlag
+    SecurityRisk: Qgis.ProcessingAlgorithmFlag
+    FlagDeprecated: Qgis.ProcessingAlgorithmFlag
+    Flags: typing.Type[Qgis.ProcessingAlgorithmFlags]
+    PropertyAvailability: typing.Type[Qgis.ProcessingPropertyAvailability]
+    NotAvailable: Qgis.ProcessingPropertyAvailability
+    Available: Qgis.ProcessingPropertyAvailability
+
+
+class QgsProcessingModelAlgorithm(QgsProcessingAlgorithm):
+
+    class VariableDefinition(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        source = ... # type: 'QgsProcessingModelChildParameterSource'
+        value = ... # type: typing.Any
+
+        @typing.overload
+        def __init__(self, value: typing.Any = ..., source: 'QgsProcessingModelChildParameterSource' = ..., description: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProcessingModelAlgorithm.VariableDefinition') -> None: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    def __init__(self, name: typing.Optional[str] = ..., group: typing.Optional[str] = ..., groupId: typing.Optional[str] = ...) -> None: ...
+
+    def processAlgorithm(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> dict[str, typing.Any]: ...
+    def createInstance(self) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    @staticmethod
+    def safeName(name: typing.Optional[str], capitalize: bool = ...) -> str: ...
+    def modelParameterFromChildIdAndOutputName(self, childId: typing.Optional[str], childOutputName: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDefinition']: ...
+    def setDesignerParameterValues(self, values: dict[str, typing.Any]) -> None: ...
+    def designerParameterValues(self) -> dict[str, typing.Any]: ...
+    def setVariables(self, variables: dict[str, typing.Any]) -> None: ...
+    def variables(self) -> dict[str, typing.Any]: ...
+    def createExpressionContextScopeForChildAlgorithm(self, childId: typing.Optional[str], context: 'QgsProcessingContext', modelParameters: dict[str, typing.Any] = ..., results: dict[str, typing.Any] = ...) -> typing.Optional[QgsExpressionContextScope]: ...
+    def variablesForChildAlgorithm(self, childId: typing.Optional[str], context: typing.Optional['QgsProcessingContext'] = ..., modelParameters: dict[str, typing.Any] = ..., results: dict[str, typing.Any] = ...) -> dict[str, 'QgsProcessingModelAlgorithm.VariableDefinition']: ...
+    @typing.overload
+    def availableSourcesForChild(self, childId: typing.Optional[str], param: typing.Optional['QgsProcessingParameterDefinition']) -> list['QgsProcessingModelChildParameterSource']: ...
+    @typing.overload
+    def availableSourcesForChild(self, childId: typing.Optional[str], parameterTypes: collections.abc.Iterable[typing.Optional[str]] = ..., outputTypes: collections.abc.Iterable[typing.Optional[str]] = ..., dataTypes: collections.abc.Iterable[int] = ...) -> list['QgsProcessingModelChildParameterSource']: ...
+    def asPythonCode(self, outputType: 'QgsProcessing.PythonOutputType', indentSize: int) -> list[str]: ...
+    def modelNameMatchesFilePath(self) -> bool: ...
+    def setSourceFilePath(self, path: typing.Optional[str]) -> None: ...
+    def sourceFilePath(self) -> str: ...
+    def setHelpContent(self, contents: dict[str, typing.Any]) -> None: ...
+    def helpContent(self) -> dict[str, typing.Any]: ...
+    def loadVariant(self, variant: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def fromFile(self, path: typing.Optional[str]) -> bool: ...
+    def toFile(self, path: typing.Optional[str]) -> bool: ...
+    def removeGroupBox(self, uuid: typing.Optional[str]) -> None: ...
+    def groupBoxes(self) -> list['QgsProcessingModelGroupBox']: ...
+    def addGroupBox(self, groupBox: 'QgsProcessingModelGroupBox') -> None: ...
+    def updateDestinationParameters(self) -> None: ...
+    def setOutputGroup(self, group: typing.Optional[str]) -> None: ...
+    def outputGroup(self) -> str: ...
+    def setOutputOrder(self, order: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def orderedOutputs(self) -> list['QgsProcessingModelOutput']: ...
+    def setParameterOrder(self, order: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def orderedParameters(self) -> list['QgsProcessingModelParameter']: ...
+    def parameterComponent(self, name: typing.Optional[str]) -> 'QgsProcessingModelParameter': ...
+    def setParameterComponent(self, component: 'QgsProcessingModelParameter') -> None: ...
+    def setParameterComponents(self, parameterComponents: dict[typing.Optional[str], 'QgsProcessingModelParameter']) -> None: ...
+    def parameterComponents(self) -> dict[str, 'QgsProcessingModelParameter']: ...
+    def otherParametersDependOnParameter(self, name: typing.Optional[str]) -> bool: ...
+    def childAlgorithmsDependOnParameter(self, name: typing.Optional[str]) -> bool: ...
+    def changeParameterName(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def removeModelParameter(self, name: typing.Optional[str]) -> None: ...
+    def updateModelParameter(self, definition: typing.Optional['QgsProcessingParameterDefinition']) -> None: ...
+    def addModelParameter(self, definition: typing.Optional['QgsProcessingParameterDefinition'], component: 'QgsProcessingModelParameter') -> None: ...
+    def validateChildAlgorithm(self, childId: typing.Optional[str]) -> typing.Tuple[bool, list[str]]: ...
+    def availableDependenciesForChildAlgorithm(self, childId: typing.Optional[str]) -> list['QgsProcessingModelChildDependency']: ...
+    def dependsOnChildAlgorithms(self, childId: typing.Optional[str]) -> set[str]: ...
+    def dependentChildAlgorithms(self, childId: typing.Optional[str], conditionalBranch: typing.Optional[str] = ...) -> set[str]: ...
+    def activateChildAlgorithm(self, id: typing.Optional[str]) -> bool: ...
+    def deactivateChildAlgorithm(self, id: typing.Optional[str]) -> None: ...
+    def removeChildAlgorithm(self, id: typing.Optional[str]) -> bool: ...
+    def childAlgorithm(self, id: typing.Optional[str]) -> 'QgsProcessingModelChildAlgorithm': ...
+    def addChildAlgorithm(self, algorithm: 'QgsProcessingModelChildAlgorithm') -> str: ...
+    def setChildAlgorithm(self, algorithm: 'QgsProcessingModelChildAlgorithm') -> None: ...
+    def setChildAlgorithms(self, childAlgorithms: dict[typing.Optional[str], 'QgsProcessingModelChildAlgorithm']) -> None: ...
+    def childAlgorithms(self) -> dict[str, 'QgsProcessingModelChildAlgorithm']: ...
+    def validate(self) -> typing.Tuple[bool, list[str]]: ...
+    def setGroup(self, group: typing.Optional[str]) -> None: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def createExpressionContext(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', source: typing.Optional['QgsProcessingFeatureSource'] = ...) -> QgsExpressionContext: ...
+    def asPythonCommand(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> str: ...
+    def canExecute(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def helpUrl(self) -> str: ...
+    def shortDescription(self) -> str: ...
+    def shortHelpString(self) -> str: ...
+    def svgIconPath(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def groupId(self) -> str: ...
+    def group(self) -> str: ...
+    def displayName(self) -> str: ...
+    def name(self) -> str: ...
+    def flags(self) -> Qgis.ProcessingAlgorithmFlags: ...
+    def initAlgorithm(self, configuration: dict[str, typing.Any] = ...) -> None: ...
+
+
+class QgsProcessingModelComponent(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsProcessingModelComponent') -> None: ...
+
+    def copyNonDefinitionProperties(self, other: 'QgsProcessingModelComponent') -> None: ...
+    def restoreCommonProperties(self, map: dict[str, typing.Any]) -> None: ...
+    def saveCommonProperties(self, map: dict[str, typing.Any]) -> None: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelComponent']: ...
+    def setComment(self, comment: 'QgsProcessingModelComment') -> None: ...
+    def comment(self) -> typing.Optional['QgsProcessingModelComment']: ...
+    def setLinksCollapsed(self, edge: QtCore.Qt.Edge, collapsed: bool) -> None: ...
+    def linksCollapsed(self, edge: QtCore.Qt.Edge) -> bool: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setSize(self, size: QtCore.QSizeF) -> None: ...
+    def size(self) -> QtCore.QSizeF: ...
+    def setPosition(self, position: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def position(self) -> QtCore.QPointF: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+
+
+class QgsProcessingModelChildAlgorithm(QgsProcessingModelComponent):
+
+    @typing.overload
+    def __init__(self, algorithmId: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsProcessingModelChildAlgorithm') -> None: ...
+
+    def setComment(self, comment: 'QgsProcessingModelComment') -> None: ...
+    def comment(self) -> typing.Optional['QgsProcessingModelComment']: ...
+    def asPythonCode(self, outputType: 'QgsProcessing.PythonOutputType', extraParameters: dict[typing.Optional[str], typing.Optional[str]], currentIndent: int, indentSize: int, friendlyChildNames: dict[typing.Optional[str], typing.Optional[str]], friendlyOutputNames: dict[typing.Optional[str], typing.Optional[str]]) -> list[str]: ...
+    def loadVariant(self, child: typing.Any) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def removeModelOutput(self, name: typing.Optional[str]) -> bool: ...
+    def setModelOutputs(self, outputs: dict[typing.Optional[str], 'QgsProcessingModelOutput']) -> None: ...
+    def modelOutput(self, name: typing.Optional[str]) -> 'QgsProcessingModelOutput': ...
+    def modelOutputs(self) -> dict[str, 'QgsProcessingModelOutput']: ...
+    def setDependencies(self, dependencies: collections.abc.Iterable['QgsProcessingModelChildDependency']) -> None: ...
+    def dependencies(self) -> list['QgsProcessingModelChildDependency']: ...
+    def setActive(self, active: bool) -> None: ...
+    def isActive(self) -> bool: ...
+    def addParameterSources(self, name: typing.Optional[str], source: collections.abc.Iterable['QgsProcessingModelChildParameterSource']) -> None: ...
+    def setParameterSources(self, sources: typing.Any) -> None: ...
+    def parameterSources(self) -> typing.Any: ...
+    def algorithm(self) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    def setConfiguration(self, configuration: dict[str, typing.Any]) -> None: ...
+    def configuration(self) -> dict[str, typing.Any]: ...
+    def reattach(self) -> bool: ...
+    def setAlgorithmId(self, algorithmId: typing.Optional[str]) -> bool: ...
+    def algorithmId(self) -> str: ...
+    def generateChildId(self, model: QgsProcessingModelAlgorithm) -> None: ...
+    def setChildId(self, id: typing.Optional[str]) -> None: ...
+    def childId(self) -> str: ...
+    def copyNonDefinitionPropertiesFromModel(self, model: typing.Optional[QgsProcessingModelAlgorithm]) -> None: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelChildAlgorithm']: ...
+
+
+class QgsProcessingModelChildDependency(PyQt5.sip.wrapper):
+
+    childId = ... # type: typing.Optional[str]
+    conditionalBranch = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self, childId: typing.Optional[str] = ..., conditionalBranch: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelChildDependency') -> None: ...
+
+    def __ge__(self, other: 'QgsProcessingModelChildDependency') -> bool: ...
+    def __lt__(self, other: 'QgsProcessingModelChildDependency') -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+
+
+class QgsProcessingModelChildParameterSource(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelChildParameterSource') -> None: ...
+
+    def friendlyIdentifier(self, model: typing.Optional[QgsProcessingModelAlgorithm]) -> str: ...
+    def asPythonComment(self, definition: typing.Optional['QgsProcessingParameterDefinition']) -> str: ...
+    def asPythonCode(self, outputType: 'QgsProcessing.PythonOutputType', definition: typing.Optional['QgsProcessingParameterDefinition'], friendlyChildNames: dict[typing.Optional[str], typing.Optional[str]]) -> str: ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def setExpressionText(self, text: typing.Optional[str]) -> None: ...
+    def expressionText(self) -> str: ...
+    def setExpression(self, expression: typing.Optional[str]) -> None: ...
+    def expression(self) -> str: ...
+    def setOutputName(self, name: typing.Optional[str]) -> None: ...
+    def outputName(self) -> str: ...
+    def setOutputChildId(self, id: typing.Optional[str]) -> None: ...
+    def outputChildId(self) -> str: ...
+    def setParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parameterName(self) -> str: ...
+    def setStaticValue(self, value: typing.Any) -> None: ...
+    def staticValue(self) -> typing.Any: ...
+    def setSource(self, source: Qgis.ProcessingModelChildParameterSource) -> None: ...
+    def source(self) -> Qgis.ProcessingModelChildParameterSource: ...
+    @staticmethod
+    def fromExpressionText(text: typing.Optional[str]) -> 'QgsProcessingModelChildParameterSource': ...
+    @staticmethod
+    def fromExpression(expression: typing.Optional[str]) -> 'QgsProcessingModelChildParameterSource': ...
+    @staticmethod
+    def fromChildOutput(childId: typing.Optional[str], outputName: typing.Optional[str]) -> 'QgsProcessingModelChildParameterSource': ...
+    @staticmethod
+    def fromModelParameter(parameterName: typing.Optional[str]) -> 'QgsProcessingModelChildParameterSource': ...
+    @staticmethod
+    def fromStaticValue(value: typing.Any) -> 'QgsProcessingModelChildParameterSource': ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsProcessingModelComment(QgsProcessingModelComponent):
+
+    @typing.overload
+    def __init__(self, description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelComment') -> None: ...
+
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelComment']: ...
+
+
+class QgsProcessingModelGroupBox(QgsProcessingModelComponent):
+
+    @typing.overload
+    def __init__(self, description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelGroupBox') -> None: ...
+
+    def uuid(self) -> str: ...
+    def loadVariant(self, map: dict[str, typing.Any], ignoreUuid: bool = ...) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelGroupBox']: ...
+
+
+class QgsProcessingModelOutput(QgsProcessingModelComponent):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ..., description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelOutput') -> None: ...
+
+    def setComment(self, comment: QgsProcessingModelComment) -> None: ...
+    def comment(self) -> typing.Optional[QgsProcessingModelComment]: ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def setChildOutputName(self, name: typing.Optional[str]) -> None: ...
+    def childOutputName(self) -> str: ...
+    def setChildId(self, id: typing.Optional[str]) -> None: ...
+    def childId(self) -> str: ...
+    def setMandatory(self, mandatory: bool) -> None: ...
+    def isMandatory(self) -> bool: ...
+    def setDefaultValue(self, value: typing.Any) -> None: ...
+    def defaultValue(self) -> typing.Any: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelOutput']: ...
+
+
+class QgsProcessingModelParameter(QgsProcessingModelComponent):
+
+    @typing.overload
+    def __init__(self, parameterName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelParameter') -> None: ...
+
+    def setComment(self, comment: QgsProcessingModelComment) -> None: ...
+    def comment(self) -> typing.Optional[QgsProcessingModelComment]: ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def setParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parameterName(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingModelParameter']: ...
+
+
+class QgsProcessingModelChildAlgorithmResult(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelChildAlgorithmResult') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def setHtmlLog(self, log: typing.Optional[str]) -> None: ...
+    def htmlLog(self) -> str: ...
+    def setOutputs(self, outputs: dict[str, typing.Any]) -> None: ...
+    def outputs(self) -> dict[str, typing.Any]: ...
+    def setInputs(self, inputs: dict[str, typing.Any]) -> None: ...
+    def inputs(self) -> dict[str, typing.Any]: ...
+    def setExecutionStatus(self, status: Qgis.ProcessingModelChildAlgorithmExecutionStatus) -> None: ...
+    def executionStatus(self) -> Qgis.ProcessingModelChildAlgorithmExecutionStatus: ...
+
+
+class QgsProcessingModelResult(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingModelResult') -> None: ...
+
+    def executedChildIds(self) -> set[str]: ...
+    def childResults(self) -> dict[str, QgsProcessingModelChildAlgorithmResult]: ...
+    def mergeWith(self, other: 'QgsProcessingModelResult') -> None: ...
+    def clear(self) -> None: ...
+
+
+class QgsProcessing(PyQt5.sip.wrapper):
+
+    class LayerOptionsFlag(int):
+        SkipIndexGeneration = ... # type: QgsProcessing.LayerOptionsFlag
+
+    class PythonOutputType(int):
+        PythonQgsProcessingAlgorithmSubclass = ... # type: QgsProcessing.PythonOutputType
+
+    class LayerOptionsFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __xor__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __ior__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __or__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __iand__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __and__(self, f: typing.Union['QgsProcessing.LayerOptionsFlags', 'QgsProcessing.LayerOptionsFlag']) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __invert__(self) -> 'QgsProcessing.LayerOptionsFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    TEMPORARY_OUTPUT = ... # type: typing.Optional[str]
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessing') -> None: ...
+
+    @staticmethod
+    def documentationFlagToString(flag: Qgis.ProcessingAlgorithmDocumentationFlag) -> str: ...
+    @staticmethod
+    def sourceTypeToString(type: Qgis.ProcessingSourceType) -> str: ...
+    SourceType: typing.Type[Qgis.ProcessingSourceType]
+    TypeMapLayer: Qgis.ProcessingSourceType
+    TypeVectorAnyGeometry: Qgis.ProcessingSourceType
+    TypeVectorPoint: Qgis.ProcessingSourceType
+    TypeVectorLine: Qgis.ProcessingSourceType
+    TypeVectorPolygon: Qgis.ProcessingSourceType
+    TypeRaster: Qgis.ProcessingSourceType
+    TypeFile: Qgis.ProcessingSourceType
+    TypeVector: Qgis.ProcessingSourceType
+    TypeMesh: Qgis.ProcessingSourceType
+    TypePlugin: Qgis.ProcessingSourceType
+    TypePointCloud: Qgis.ProcessingSourceType
+    TypeAnnotation: Qgis.ProcessingSourceType
+    TypeVectorTile: Qgis.ProcessingSourceType
+    TiledScene: Qgis.ProcessingSourceType
+    PythonQgsProcessingAlgorithmSubclass: QgsProcessing.PythonOutputType
+
+
+class QgsProcessingFeatureBasedAlgorithm(QgsProcessingAlgorithm):
+
+    def __init__(self) -> None: ...
+
+    def sinkProperties(self, sink: typing.Optional[str], parameters: dict[str, typing.Any], context: 'QgsProcessingContext', sourceProperties: dict[typing.Optional[str], QgsProcessingAlgorithm.VectorProperties]) -> QgsProcessingAlgorithm.VectorProperties: ...
+    def prepareSource(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext') -> None: ...
+    def request(self) -> QgsFeatureRequest: ...
+    def processAlgorithm(self, parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> dict[str, typing.Any]: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def initParameters(self, configuration: dict[str, typing.Any] = ...) -> None: ...
+    def outputCrs(self, inputCrs: QgsCoordinateReferenceSystem) -> QgsCoordinateReferenceSystem: ...
+    def outputFields(self, inputFields: QgsFields) -> QgsFields: ...
+    def outputWkbType(self, inputWkbType: Qgis.WkbType) -> Qgis.WkbType: ...
+    def sinkFlags(self) -> QgsFeatureSink.SinkFlags: ...
+    def sourceFlags(self) -> Qgis.ProcessingFeatureSourceFlags: ...
+    def outputLayerType(self) -> Qgis.ProcessingSourceType: ...
+    def inputLayerTypes(self) -> list[int]: ...
+    def outputName(self) -> str: ...
+    def initAlgorithm(self, configuration: dict[str, typing.Any] = ...) -> None: ...
+    def inputParameterDescription(self) -> str: ...
+    def inputParameterName(self) -> str: ...
+    def supportInPlaceEdit(self, layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    def processFeature(self, feature: QgsFeature, context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback']) -> list[QgsFeature]: ...
+    def flags(self) -> Qgis.ProcessingAlgorithmFlags: ...
+
+
+class QgsProcessingAlgRunnerTask(QgsTask):
+
+    def __init__(self, algorithm: typing.Optional[QgsProcessingAlgorithm], parameters: dict[str, typing.Any], context: 'QgsProcessingContext', feedback: typing.Optional['QgsProcessingFeedback'] = ..., flags: typing.Union[QgsTask.Flags, QgsTask.Flag] = ...) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    executed: typing.ClassVar[QtCore.pyqtSignal]
+    def algorithmCanceled(self) -> bool: ...
+    def cancel(self) -> None: ...
+
+
+class QgsProcessingFeedback(QgsFeedback):
+
+    def __init__(self, logFeedback: bool = ...) -> None: ...
+
+    def textLog(self) -> str: ...
+    def htmlLog(self) -> str: ...
+    def pushFormattedResults(self, algorithm: typing.Optional[QgsProcessingAlgorithm], context: 'QgsProcessingContext', results: dict[str, typing.Any]) -> None: ...
+    def pushVersionInfo(self, provider: typing.Optional['QgsProcessingProvider'] = ...) -> None: ...
+    def pushConsoleInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushDebugInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushCommandInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushFormattedMessage(self, html: typing.Optional[str], text: typing.Optional[str]) -> None: ...
+    def pushInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushWarning(self, warning: typing.Optional[str]) -> None: ...
+    def reportError(self, error: typing.Optional[str], fatalError: bool = ...) -> None: ...
+    def setProgressText(self, text: typing.Optional[str]) -> None: ...
+
+
+class QgsProcessingMultiStepFeedback(QgsProcessingFeedback):
+
+    def __init__(self, steps: int, feedback: typing.Optional[QgsProcessingFeedback]) -> None: ...
+
+    def textLog(self) -> str: ...
+    def htmlLog(self) -> str: ...
+    def pushFormattedMessage(self, html: typing.Optional[str], text: typing.Optional[str]) -> None: ...
+    def pushConsoleInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushDebugInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushCommandInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushInfo(self, info: typing.Optional[str]) -> None: ...
+    def pushWarning(self, warning: typing.Optional[str]) -> None: ...
+    def reportError(self, error: typing.Optional[str], fatalError: bool = ...) -> None: ...
+    def setProgressText(self, text: typing.Optional[str]) -> None: ...
+    def setCurrentStep(self, step: int) -> None: ...
+
+
+class QgsProcessingBatchFeedback(QgsProcessingMultiStepFeedback):
+
+    def __init__(self, tasks: int, feedback: typing.Optional[QgsProcessingFeedback]) -> None: ...
+
+    def popErrors(self) -> list[str]: ...
+    def reportError(self, error: typing.Optional[str], fatalError: bool = ...) -> None: ...
+
+
+class QgsProcessingContext(PyQt5.sip.wrapper):
+
+    class ProcessArgumentFlag(int):
+        IncludeProjectPath = ... # type: QgsProcessingContext.ProcessArgumentFlag
+
+    class Flag(int):
+        Unused = ... # type: QgsProcessingContext.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __xor__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __ior__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __or__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __iand__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __and__(self, f: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> 'QgsProcessingContext.Flags': ...
+        def __invert__(self) -> 'QgsProcessingContext.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class LayerDetails(PyQt5.sip.wrapper):
+
+        forceName = ... # type: bool
+        groupName = ... # type: typing.Optional[str]
+        layerSortKey = ... # type: int
+        layerTypeHint = ... # type: 'QgsProcessingUtils.LayerHint'
+        name = ... # type: typing.Optional[str]
+        outputName = ... # type: typing.Optional[str]
+        project = ... # type: 'QgsProject'
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], project: typing.Optional['QgsProject'], outputName: typing.Optional[str] = ..., layerTypeHint: 'QgsProcessingUtils.LayerHint' = ...) -> None: ...
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProcessingContext.LayerDetails') -> None: ...
+
+        def setOutputLayerName(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+        def setPostProcessor(self, processor: typing.Optional['QgsProcessingLayerPostProcessorInterface']) -> None: ...
+        def postProcessor(self) -> typing.Optional['QgsProcessingLayerPostProcessorInterface']: ...
+
+    class ProcessArgumentFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __xor__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __ior__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __or__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __iand__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __and__(self, f: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag']) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __invert__(self) -> 'QgsProcessingContext.ProcessArgumentFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self) -> None: ...
+
+    def clearModelResult(self) -> None: ...
+    def modelResult(self) -> QgsProcessingModelResult: ...
+    def asQgisProcessArguments(self, flags: typing.Union['QgsProcessingContext.ProcessArgumentFlags', 'QgsProcessingContext.ProcessArgumentFlag'] = ...) -> list[str]: ...
+    def exportToMap(self) -> dict[str, typing.Any]: ...
+    def setMaximumThreads(self, threads: int) -> None: ...
+    def maximumThreads(self) -> int: ...
+    def setTemporaryFolder(self, folder: typing.Optional[str]) -> None: ...
+    def temporaryFolder(self) -> str: ...
+    def setLogLevel(self, level: Qgis.ProcessingLogLevel) -> None: ...
+    def logLevel(self) -> Qgis.ProcessingLogLevel: ...
+    def setPreferredRasterFormat(self, format: typing.Optional[str]) -> None: ...
+    def preferredRasterFormat(self) -> str: ...
+    def setPreferredVectorFormat(self, format: typing.Optional[str]) -> None: ...
+    def preferredVectorFormat(self) -> str: ...
+    def takeResultLayer(self, id: typing.Optional[str]) -> typing.Optional[QgsMapLayer]: ...
+    def getMapLayer(self, identifier: typing.Optional[str]) -> typing.Optional[QgsMapLayer]: ...
+    def takeResultsFrom(self, context: 'QgsProcessingContext') -> None: ...
+    def pushToThread(self, thread: typing.Optional[QtCore.QThread]) -> None: ...
+    def thread(self) -> typing.Optional[QtCore.QThread]: ...
+    def setFeedback(self, feedback: typing.Optional[QgsProcessingFeedback]) -> None: ...
+    def feedback(self) -> typing.Optional[QgsProcessingFeedback]: ...
+    def setDefaultEncoding(self, encoding: typing.Optional[str]) -> None: ...
+    def defaultEncoding(self) -> str: ...
+    def setTransformErrorCallback(self, a0: typing.Optional[typing.Callable[..., None]]) -> None: ...
+    def setInvalidGeometryCallback(self, a0: typing.Optional[typing.Callable[..., None]]) -> None: ...
+    def setInvalidGeometryCheck(self, check: Qgis.InvalidGeometryCheck) -> None: ...
+    def invalidGeometryCheck(self) -> Qgis.InvalidGeometryCheck: ...
+    def layerToLoadOnCompletionDetails(self, layer: typing.Optional[str]) -> 'QgsProcessingContext.LayerDetails': ...
+    def addLayerToLoadOnCompletion(self, layer: typing.Optional[str], details: 'QgsProcessingContext.LayerDetails') -> None: ...
+    def setLayersToLoadOnCompletion(self, layers: dict[typing.Optional[str], 'QgsProcessingContext.LayerDetails']) -> None: ...
+    def willLoadLayerOnCompletion(self, layer: typing.Optional[str]) -> bool: ...
+    def layersToLoadOnCompletion(self) -> dict[str, 'QgsProcessingContext.LayerDetails']: ...
+    def temporaryLayerStore(self) -> typing.Optional[QgsMapLayerStore]: ...
+    def setCurrentTimeRange(self, currentTimeRange: QgsDateTimeRange) -> None: ...
+    def currentTimeRange(self) -> QgsDateTimeRange: ...
+    def setAreaUnit(self, areaUnit: Qgis.AreaUnit) -> None: ...
+    def areaUnit(self) -> Qgis.AreaUnit: ...
+    def setDistanceUnit(self, unit: Qgis.DistanceUnit) -> None: ...
+    def distanceUnit(self) -> Qgis.DistanceUnit: ...
+    def setEllipsoid(self, ellipsoid: typing.Optional[str]) -> None: ...
+    def ellipsoid(self) -> str: ...
+    def setTransformContext(self, context: QgsCoordinateTransformContext) -> None: ...
+    def transformContext(self) -> QgsCoordinateTransformContext: ...
+    def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+    def expressionContext(self) -> QgsExpressionContext: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def setFlags(self, flags: typing.Union['QgsProcessingContext.Flags', 'QgsProcessingContext.Flag']) -> None: ...
+    def flags(self) -> 'QgsProcessingContext.Flags': ...
+    def copyThreadSafeSettings(self, other: 'QgsProcessingContext') -> None: ...
+    LogLevel: typing.Type[Qgis.ProcessingLogLevel]
+    DefaultLevel: Qgis.ProcessingLogLevel
+    Verbose: Qgis.ProcessingLogLevel
+    ModelDebug: Qgis.ProcessingLogLevel
+
+
+class QgsProcessingLayerPostProcessorInterface(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingLayerPostProcessorInterface') -> None: ...
+
+    def postProcessLayer(self, layer: typing.Optional[QgsMapLayer], context: QgsProcessingContext, feedback: typing.Optional[QgsProcessingFeedback]) -> None: ...
+
+
+class QgsProcessingOutputDefinition(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputDefinition') -> None: ...
+
+    def valueAsFormattedString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def autoCreated(self) -> bool: ...
+    def setAutoCreated(self, autoCreated: bool) -> None: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsProcessingOutputMapLayer(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputMapLayer') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputVectorLayer(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingSourceType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputVectorLayer') -> None: ...
+
+    def setDataType(self, type: Qgis.ProcessingSourceType) -> None: ...
+    def dataType(self) -> Qgis.ProcessingSourceType: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputRasterLayer(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputRasterLayer') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputPointCloudLayer(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputPointCloudLayer') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputMultipleLayers(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputMultipleLayers') -> None: ...
+
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputHtml(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputHtml') -> None: ...
+
+    def valueAsFormattedString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputVariant(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputVariant') -> None: ...
+
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputNumber(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputNumber') -> None: ...
+
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputString(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputString') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputBoolean(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputBoolean') -> None: ...
+
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputFolder(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputFolder') -> None: ...
+
+    def valueAsFormattedString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputFile(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputFile') -> None: ...
+
+    def valueAsFormattedString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputConditionalBranch(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputConditionalBranch') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingOutputVectorTileLayer(QgsProcessingOutputDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputVectorTileLayer') -> None: ...
+
+    def type(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterDefinition(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., help: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDefinition') -> None: ...
+
+    def defaultGuiValueFromSetting(self) -> typing.Any: ...
+    def setAdditionalExpressionContextVariables(self, variables: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def additionalExpressionContextVariables(self) -> list[str]: ...
+    def setDynamicLayerParameterName(self, name: typing.Optional[str]) -> None: ...
+    def dynamicLayerParameterName(self) -> str: ...
+    def setDynamicPropertyDefinition(self, definition: QgsPropertyDefinition) -> None: ...
+    def dynamicPropertyDefinition(self) -> QgsPropertyDefinition: ...
+    def setIsDynamic(self, dynamic: bool) -> None: ...
+    def isDynamic(self) -> bool: ...
+    def toolTip(self) -> str: ...
+    def provider(self) -> typing.Optional['QgsProcessingProvider']: ...
+    def algorithm(self) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def setMetadata(self, metadata: dict[str, typing.Any]) -> None: ...
+    def metadata(self) -> dict[str, typing.Any]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonComment(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def valueAsStringList(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[list[str], bool]: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def setFlags(self, flags: typing.Union[Qgis.ProcessingParameterFlags, Qgis.ProcessingParameterFlag]) -> None: ...
+    def flags(self) -> Qgis.ProcessingParameterFlags: ...
+    def defaultValueForGui(self) -> typing.Any: ...
+    def setGuiDefaultValueOverride(self, value: typing.Any) -> None: ...
+    def guiDefaultValueOverride(self) -> typing.Any: ...
+    def setDefaultValue(self, value: typing.Any) -> None: ...
+    def defaultValue(self) -> typing.Any: ...
+    def setHelp(self, help: typing.Optional[str]) -> None: ...
+    def help(self) -> str: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def isDestination(self) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterDefinition']: ...
+    Flag: typing.Type[Qgis.ProcessingParameterFlag]
+    FlagAdvanced: Qgis.ProcessingParameterFlag
+    FlagHidden: Qgis.ProcessingParameterFlag
+    FlagOptional: Qgis.ProcessingParameterFlag
+    FlagIsModelOutput: Qgis.ProcessingParameterFlag
+    Flags: typing.Type[Qgis.ProcessingParameterFlags]
+
+
+class QgsProcessingParameterAggregate(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., parentLayerParameterName: typing.Optional[str] = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterAggregate') -> None: ...
+
+    def setParentLayerParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingParameterDxfLayers(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDxfLayers') -> None: ...
+
+    @staticmethod
+    def layerAsVariantMap(layer: QgsDxfExport.DxfLayer) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def variantMapAsLayer(layerVariantMap: dict[str, typing.Any], context: QgsProcessingContext) -> QgsDxfExport.DxfLayer: ...
+    @staticmethod
+    def parameterAsLayers(layersVariant: typing.Any, context: QgsProcessingContext) -> list[QgsDxfExport.DxfLayer]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingParameterFieldMapping(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., parentLayerParameterName: typing.Optional[str] = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFieldMapping') -> None: ...
+
+    def setParentLayerParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingParameterMeshDatasetGroups(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., meshLayerParameterName: typing.Optional[str] = ..., supportedDataType: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMeshDatasetGroups') -> None: ...
+
+    @staticmethod
+    def valueAsDatasetGroup(value: typing.Any) -> list[int]: ...
+    def isDataTypeSupported(self, dataType: QgsMeshDatasetGroupMetadata.DataType) -> bool: ...
+    def meshLayerParameterName(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingParameterMeshDatasetTime(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., meshLayerParameterName: typing.Optional[str] = ..., datasetGroupParameterName: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMeshDatasetTime') -> None: ...
+
+    @staticmethod
+    def timeValueAsDefinedDateTime(value: typing.Any) -> QtCore.QDateTime: ...
+    @staticmethod
+    def timeValueAsDatasetIndex(value: typing.Any) -> QgsMeshDatasetIndex: ...
+    @staticmethod
+    def valueAsTimeType(value: typing.Any) -> str: ...
+    def datasetGroupParameterName(self) -> str: ...
+    def meshLayerParameterName(self) -> str: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingFeatureSourceDefinition(PyQt5.sip.wrapper):
+
+    featureLimit = ... # type: int
+    filterExpression = ... # type: typing.Optional[str]
+    flags = ... # type: typing.Union[Qgis.ProcessingFeatureSourceDefinitionFlags, Qgis.ProcessingFeatureSourceDefinitionFlag]
+    geometryCheck = ... # type: Qgis.InvalidGeometryCheck
+    selectedFeaturesOnly = ... # type: bool
+    source = ... # type: QgsProperty
+
+    @typing.overload
+    def __init__(self, source: typing.Optional[str] = ..., selectedFeaturesOnly: bool = ..., featureLimit: int = ..., flags: typing.Union[Qgis.ProcessingFeatureSourceDefinitionFlags, Qgis.ProcessingFeatureSourceDefinitionFlag] = ..., geometryCheck: Qgis.InvalidGeometryCheck = ..., filterExpression: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, source: QgsProperty, selectedFeaturesOnly: bool = ..., featureLimit: int = ..., flags: typing.Union[Qgis.ProcessingFeatureSourceDefinitionFlags, Qgis.ProcessingFeatureSourceDefinitionFlag] = ..., geometryCheck: Qgis.InvalidGeometryCheck = ..., filterExpression: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingFeatureSourceDefinition') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    Flag: typing.Type[Qgis.ProcessingFeatureSourceDefinitionFlag]
+    FlagOverrideDefaultGeometryCheck: Qgis.ProcessingFeatureSourceDefinitionFlag
+    FlagCreateIndividualOutputPerInputFeature: Qgis.ProcessingFeatureSourceDefinitionFlag
+    Flags: typing.Type[Qgis.ProcessingFeatureSourceDefinitionFlags]
+
+
+class QgsProcessingOutputLayerDefinition(PyQt5.sip.wrapper):
+
+    createOptions = ... # type: dict[str, typing.Any]
+    destinationName = ... # type: typing.Optional[str]
+    destinationProject = ... # type: 'QgsProject'
+    sink = ... # type: QgsProperty
+
+    @typing.overload
+    def __init__(self, sink: typing.Optional[str] = ..., destinationProject: typing.Optional['QgsProject'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, sink: QgsProperty, destinationProject: typing.Optional['QgsProject'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingOutputLayerDefinition') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def loadVariant(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariant(self) -> typing.Any: ...
+    def setRemappingDefinition(self, definition: QgsRemappingSinkDefinition) -> None: ...
+    def remappingDefinition(self) -> QgsRemappingSinkDefinition: ...
+    def useRemapping(self) -> bool: ...
+
+
+class QgsProcessingParameters(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameters') -> None: ...
+
+    @staticmethod
+    def parameterFromScriptCode(code: typing.Optional[str]) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def descriptionFromName(name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def parameterFromVariantMap(map: dict[str, typing.Any]) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsAnnotationLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional[QgsAnnotationLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsAnnotationLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional[QgsAnnotationLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPointCloudLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> typing.Optional[QgsPointCloudLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPointCloudLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> typing.Optional[QgsPointCloudLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDatabaseTableName(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDatabaseTableName(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSchema(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSchema(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsConnectionName(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsConnectionName(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsColor(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QtGui.QColor: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsColor(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QtGui.QColor: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayoutItem(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, layout: typing.Optional[QgsPrintLayout]) -> typing.Optional[QgsLayoutItem]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayoutItem(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, layout: typing.Optional[QgsPrintLayout]) -> typing.Optional[QgsLayoutItem]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayout(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional[QgsPrintLayout]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayout(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional[QgsPrintLayout]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsStrings(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsStrings(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def parameterAsFields(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def parameterAsFields(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsRange(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[float]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsRange(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[float]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFileList(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFileList(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayerList(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> list[QgsMapLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayerList(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> list[QgsMapLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsMatrix(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[typing.Any]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsMatrix(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[typing.Any]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFile(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFile(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsGeometryCrs(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsGeometryCrs(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsGeometry(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsGeometry: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsGeometry(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsGeometry: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPointCrs(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPointCrs(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPoint(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsPointXY: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsPoint(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsPointXY: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExtentCrs(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExtentCrs(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @staticmethod
+    def parameterAsExtentGeometry(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsGeometry: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExtent(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsRectangle: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExtent(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, crs: QgsCoordinateReferenceSystem = ...) -> QgsRectangle: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsCrs(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsCrs(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsMeshLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional[QgsMeshLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsMeshLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional[QgsMeshLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsVectorLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional[QgsVectorLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsVectorLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional[QgsVectorLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFileOutput(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsFileOutput(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsOutputLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsOutputLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, testOnly: bool = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsRasterLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional['QgsRasterLayer']: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsRasterLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional['QgsRasterLayer']: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayer(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, layerHint: 'QgsProcessingUtils.LayerHint' = ..., flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> typing.Optional[QgsMapLayer]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsLayer(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext, layerHint: 'QgsProcessingUtils.LayerHint' = ..., flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> typing.Optional[QgsMapLayer]: ...
+    @staticmethod
+    def parameterAsCompatibleSourceLayerPathAndLayerName(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str] = ..., feedback: typing.Optional[QgsProcessingFeedback] = ...) -> typing.Tuple[str, typing.Optional[str]]: ...
+    @staticmethod
+    def parameterAsCompatibleSourceLayerPath(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext, compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str] = ..., feedback: typing.Optional[QgsProcessingFeedback] = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSource(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> typing.Optional['QgsProcessingFeatureSource']: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSource(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> typing.Optional['QgsProcessingFeatureSource']: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSink(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], fields: QgsFields, geometryType: Qgis.WkbType, crs: QgsCoordinateReferenceSystem, context: QgsProcessingContext, sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ..., createOptions: dict[str, typing.Any] = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional[QgsFeatureSink], str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsSink(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, fields: QgsFields, geometryType: Qgis.WkbType, crs: QgsCoordinateReferenceSystem, context: QgsProcessingContext, sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ..., createOptions: dict[str, typing.Any] = ..., datasourceOptions: collections.abc.Iterable[typing.Optional[str]] = ..., layerOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional[QgsFeatureSink], str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsBoolean(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsBoolean(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsBool(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsBool(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnumStrings(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnumStrings(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnumString(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnumString(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnums(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[int]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnums(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[int]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnum(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> int: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsEnum(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> int: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsTime(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QtCore.QTime: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsTime(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QtCore.QTime: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDate(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QtCore.QDate: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDate(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QtCore.QDate: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDateTime(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> QtCore.QDateTime: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDateTime(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> QtCore.QDateTime: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsInts(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> list[int]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsInts(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> list[int]: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsInt(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> int: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsInt(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> int: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDouble(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> float: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsDouble(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> float: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExpression(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsExpression(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsString(definition: typing.Optional[QgsProcessingParameterDefinition], parameters: dict[str, typing.Any], context: QgsProcessingContext) -> str: ...
+    @typing.overload
+    @staticmethod
+    def parameterAsString(definition: typing.Optional[QgsProcessingParameterDefinition], value: typing.Any, context: QgsProcessingContext) -> str: ...
+    @staticmethod
+    def isDynamic(parameters: dict[str, typing.Any], name: typing.Optional[str]) -> bool: ...
+
+
+class QgsProcessingParameterBoolean(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterBoolean') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterBoolean']: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterCrs(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterCrs') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterCrs']: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterExtent(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterExtent') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterExtent']: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterPoint(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterPoint') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterPoint']: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterGeometry(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., geometryTypes: collections.abc.Iterable[int] = ..., allowMultipart: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterGeometry') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterGeometry']: ...
+    def setAllowMultipart(self, allowMultipart: bool) -> None: ...
+    def allowMultipart(self) -> bool: ...
+    def setGeometryTypes(self, geometryTypes: collections.abc.Iterable[int]) -> None: ...
+    def geometryTypes(self) -> list[int]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterFile(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., behavior: Qgis.ProcessingFileParameterBehavior = ..., extension: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., fileFilter: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFile') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str], behavior: Qgis.ProcessingFileParameterBehavior = ...) -> typing.Optional['QgsProcessingParameterFile']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setFileFilter(self, filter: typing.Optional[str]) -> None: ...
+    def fileFilter(self) -> str: ...
+    def setExtension(self, extension: typing.Optional[str]) -> None: ...
+    def extension(self) -> str: ...
+    def setBehavior(self, behavior: Qgis.ProcessingFileParameterBehavior) -> None: ...
+    def behavior(self) -> Qgis.ProcessingFileParameterBehavior: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    Behavior: typing.Type[Qgis.ProcessingFileParameterBehavior]
+    File: Qgis.ProcessingFileParameterBehavior
+    Folder: Qgis.ProcessingFileParameterBehavior
+
+
+class QgsProcessingParameterMatrix(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., numberRows: int = ..., hasFixedNumberRows: bool = ..., headers: collections.abc.Iterable[typing.Optional[str]] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMatrix') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterMatrix']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setHasFixedNumberRows(self, hasFixedNumberRows: bool) -> None: ...
+    def hasFixedNumberRows(self) -> bool: ...
+    def setNumberRows(self, rows: int) -> None: ...
+    def numberRows(self) -> int: ...
+    def setHeaders(self, headers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def headers(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterMultipleLayers(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., layerType: Qgis.ProcessingSourceType = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMultipleLayers') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterMultipleLayers']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setMinimumNumberInputs(self, minimum: int) -> None: ...
+    def minimumNumberInputs(self) -> int: ...
+    def setLayerType(self, type: Qgis.ProcessingSourceType) -> None: ...
+    def layerType(self) -> Qgis.ProcessingSourceType: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterNumber(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingNumberParameterType = ..., defaultValue: typing.Any = ..., optional: bool = ..., minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterNumber') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterNumber']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDataType(self, type: Qgis.ProcessingNumberParameterType) -> None: ...
+    def dataType(self) -> Qgis.ProcessingNumberParameterType: ...
+    def setMaximum(self, maximum: float) -> None: ...
+    def maximum(self) -> float: ...
+    def setMinimum(self, minimum: float) -> None: ...
+    def minimum(self) -> float: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def toolTip(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    Type: typing.Type[Qgis.ProcessingNumberParameterType]
+    Integer: Qgis.ProcessingNumberParameterType
+    Double: Qgis.ProcessingNumberParameterType
+
+
+class QgsProcessingParameterDistance(QgsProcessingParameterNumber):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentParameterName: typing.Optional[str] = ..., optional: bool = ..., minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDistance') -> None: ...
+
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultUnit(self, unit: Qgis.DistanceUnit) -> None: ...
+    def defaultUnit(self) -> Qgis.DistanceUnit: ...
+    def setParentParameterName(self, parentParameterName: typing.Optional[str]) -> None: ...
+    def parentParameterName(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterDistance']: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterArea(QgsProcessingParameterNumber):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentParameterName: typing.Optional[str] = ..., optional: bool = ..., minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterArea') -> None: ...
+
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultUnit(self, unit: Qgis.AreaUnit) -> None: ...
+    def defaultUnit(self) -> Qgis.AreaUnit: ...
+    def setParentParameterName(self, parentParameterName: typing.Optional[str]) -> None: ...
+    def parentParameterName(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterArea']: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterVolume(QgsProcessingParameterNumber):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentParameterName: typing.Optional[str] = ..., optional: bool = ..., minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterVolume') -> None: ...
+
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultUnit(self, unit: Qgis.VolumeUnit) -> None: ...
+    def defaultUnit(self) -> Qgis.VolumeUnit: ...
+    def setParentParameterName(self, parentParameterName: typing.Optional[str]) -> None: ...
+    def parentParameterName(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterVolume']: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterDuration(QgsProcessingParameterNumber):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., minValue: float = ..., maxValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDuration') -> None: ...
+
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultUnit(self, unit: Qgis.TemporalUnit) -> None: ...
+    def defaultUnit(self) -> Qgis.TemporalUnit: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterDuration']: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterScale(QgsProcessingParameterNumber):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterScale') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterScale']: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsProcessingParameterScale']: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterRange(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingNumberParameterType = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterRange') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterRange']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDataType(self, dataType: Qgis.ProcessingNumberParameterType) -> None: ...
+    def dataType(self) -> Qgis.ProcessingNumberParameterType: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterRasterLayer(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterRasterLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterRasterLayer']: ...
+    def createFileFilter(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterEnum(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., options: collections.abc.Iterable[typing.Optional[str]] = ..., allowMultiple: bool = ..., defaultValue: typing.Any = ..., optional: bool = ..., usesStaticStrings: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterEnum') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterEnum']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setUsesStaticStrings(self, usesStaticStrings: bool) -> None: ...
+    def usesStaticStrings(self) -> bool: ...
+    def setAllowMultiple(self, allowMultiple: bool) -> None: ...
+    def allowMultiple(self) -> bool: ...
+    def setOptions(self, options: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def options(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonComment(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterString(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., multiLine: bool = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterString') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterString']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setMultiLine(self, multiLine: bool) -> None: ...
+    def multiLine(self) -> bool: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterAuthConfig(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterAuthConfig') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterAuthConfig']: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterExpression(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentLayerParameterName: typing.Optional[str] = ..., optional: bool = ..., type: Qgis.ExpressionType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterExpression') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterExpression']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setExpressionType(self, type: Qgis.ExpressionType) -> None: ...
+    def expressionType(self) -> Qgis.ExpressionType: ...
+    def setParentLayerParameterName(self, parentLayerParameterName: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterLimitedDataTypes(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, types: collections.abc.Iterable[int] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterLimitedDataTypes') -> None: ...
+
+    def setDataTypes(self, types: collections.abc.Iterable[int]) -> None: ...
+    def dataTypes(self) -> list[int]: ...
+
+
+class QgsProcessingParameterVectorLayer(QgsProcessingParameterDefinition, QgsProcessingParameterLimitedDataTypes, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., types: collections.abc.Iterable[int] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterVectorLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterVectorLayer']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterMeshLayer(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMeshLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterMeshLayer']: ...
+    def createFileFilter(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterMapLayer(QgsProcessingParameterDefinition, QgsProcessingParameterLimitedDataTypes, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., types: collections.abc.Iterable[int] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMapLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterMapLayer']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterField(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentLayerParameterName: typing.Optional[str] = ..., type: Qgis.ProcessingFieldParameterDataType = ..., allowMultiple: bool = ..., optional: bool = ..., defaultToAllFields: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterField') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterField']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultToAllFields(self, enabled: bool) -> None: ...
+    def defaultToAllFields(self) -> bool: ...
+    def setAllowMultiple(self, allowMultiple: bool) -> None: ...
+    def allowMultiple(self) -> bool: ...
+    def setDataType(self, type: Qgis.ProcessingFieldParameterDataType) -> None: ...
+    def dataType(self) -> Qgis.ProcessingFieldParameterDataType: ...
+    def setParentLayerParameterName(self, parentLayerParameterName: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    DataType: typing.Type[Qgis.ProcessingFieldParameterDataType]
+    Any: Qgis.ProcessingFieldParameterDataType
+    Numeric: Qgis.ProcessingFieldParameterDataType
+    String: Qgis.ProcessingFieldParameterDataType
+    DateTime: Qgis.ProcessingFieldParameterDataType
+    Binary: Qgis.ProcessingFieldParameterDataType
+    Boolean: Qgis.ProcessingFieldParameterDataType
+
+
+class QgsProcessingParameterFeatureSource(QgsProcessingParameterDefinition, QgsProcessingParameterLimitedDataTypes, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., types: collections.abc.Iterable[int] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFeatureSource') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterFeatureSource']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingDestinationParameter(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingDestinationParameter') -> None: ...
+
+    def originalProvider(self) -> typing.Optional['QgsProcessingProvider']: ...
+    def setCreateByDefault(self, createByDefault: bool) -> None: ...
+    def createByDefault(self) -> bool: ...
+    def isSupportedOutputValue(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[bool, str]: ...
+    def generateTemporaryDestination(self, context: typing.Optional[QgsProcessingContext] = ...) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def setSupportsNonFileBasedOutput(self, supportsNonFileBasedOutput: bool) -> None: ...
+    def supportsNonFileBasedOutput(self) -> bool: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def isDestination(self) -> bool: ...
+
+
+class QgsProcessingParameterFeatureSink(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingSourceType = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ..., supportsAppend: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFeatureSink') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterFeatureSink']: ...
+    def generateTemporaryDestination(self, context: typing.Optional[QgsProcessingContext] = ...) -> str: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setSupportsAppend(self, supportsAppend: bool) -> None: ...
+    def supportsAppend(self) -> bool: ...
+    def setDataType(self, type: Qgis.ProcessingSourceType) -> None: ...
+    def hasGeometry(self) -> bool: ...
+    def dataType(self) -> Qgis.ProcessingSourceType: ...
+    def supportedOutputVectorLayerExtensions(self) -> list[str]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterVectorDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingSourceType = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterVectorDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterVectorDestination']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDataType(self, type: Qgis.ProcessingSourceType) -> None: ...
+    def hasGeometry(self) -> bool: ...
+    def dataType(self) -> Qgis.ProcessingSourceType: ...
+    def supportedOutputVectorLayerExtensions(self) -> list[str]: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterRasterDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterRasterDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterRasterDestination']: ...
+    def supportedOutputRasterLayerExtensions(self) -> list[str]: ...
+    def createFileFilter(self) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterFileDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., fileFilter: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFileDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterFileDestination']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setFileFilter(self, filter: typing.Optional[str]) -> None: ...
+    def fileFilter(self) -> str: ...
+    def createFileFilter(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterFolderDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterFolderDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterFolderDestination']: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterBand(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentLayerParameterName: typing.Optional[str] = ..., optional: bool = ..., allowMultiple: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterBand') -> None: ...
+
+    def setAllowMultiple(self, allowMultiple: bool) -> None: ...
+    def allowMultiple(self) -> bool: ...
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterBand']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setParentLayerParameterName(self, parentLayerParameterName: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterLayout(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterLayout') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterLayout']: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterLayoutItem(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentLayoutParameterName: typing.Optional[str] = ..., itemType: int = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterLayoutItem') -> None: ...
+
+    def setItemType(self, type: int) -> None: ...
+    def itemType(self) -> int: ...
+    def setParentLayoutParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentLayoutParameterName(self) -> str: ...
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterLayoutItem']: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterColor(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., opacityEnabled: bool = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterColor') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterColor']: ...
+    def setOpacityEnabled(self, enabled: bool) -> None: ...
+    def opacityEnabled(self) -> bool: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterCoordinateOperation(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., sourceCrsParameterName: typing.Optional[str] = ..., destinationCrsParameterName: typing.Optional[str] = ..., staticSourceCrs: typing.Any = ..., staticDestinationCrs: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterCoordinateOperation') -> None: ...
+
+    def setDestinationCrs(self, crs: typing.Any) -> None: ...
+    def destinationCrs(self) -> typing.Any: ...
+    def setSourceCrs(self, crs: typing.Any) -> None: ...
+    def sourceCrs(self) -> typing.Any: ...
+    def setDestinationCrsParameterName(self, name: typing.Optional[str]) -> None: ...
+    def destinationCrsParameterName(self) -> str: ...
+    def setSourceCrsParameterName(self, name: typing.Optional[str]) -> None: ...
+    def sourceCrsParameterName(self) -> str: ...
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterCoordinateOperation']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterMapTheme(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterMapTheme') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterMapTheme']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterDateTime(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., type: Qgis.ProcessingDateTimeParameterDataType = ..., defaultValue: typing.Any = ..., optional: bool = ..., minValue: typing.Union[QtCore.QDateTime, datetime.datetime] = ..., maxValue: typing.Union[QtCore.QDateTime, datetime.datetime] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDateTime') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDateTime']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDataType(self, type: Qgis.ProcessingDateTimeParameterDataType) -> None: ...
+    def dataType(self) -> Qgis.ProcessingDateTimeParameterDataType: ...
+    def setMaximum(self, maximum: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def maximum(self) -> QtCore.QDateTime: ...
+    def setMinimum(self, minimum: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def minimum(self) -> QtCore.QDateTime: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def toolTip(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    Type: typing.Type[Qgis.ProcessingDateTimeParameterDataType]
+    DateTime: Qgis.ProcessingDateTimeParameterDataType
+    Date: Qgis.ProcessingDateTimeParameterDataType
+    Time: Qgis.ProcessingDateTimeParameterDataType
+
+
+class QgsProcessingParameterProviderConnection(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], provider: typing.Optional[str], defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterProviderConnection') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterProviderConnection']: ...
+    def setProviderId(self, provider: typing.Optional[str]) -> None: ...
+    def providerId(self) -> str: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterDatabaseSchema(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], connectionParameterName: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDatabaseSchema') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDatabaseSchema']: ...
+    def setParentConnectionParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentConnectionParameterName(self) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterDatabaseTable(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], connectionParameterName: typing.Optional[str] = ..., schemaParameterName: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., allowNewTableNames: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterDatabaseTable') -> None: ...
+
+    def setAllowNewTableNames(self, allowed: bool) -> None: ...
+    def allowNewTableNames(self) -> bool: ...
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterDatabaseTable']: ...
+    def setParentSchemaParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentSchemaParameterName(self) -> str: ...
+    def setParentConnectionParameterName(self, name: typing.Optional[str]) -> None: ...
+    def parentConnectionParameterName(self) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterPointCloudLayer(QgsProcessingParameterDefinition, QgsFileFilterGenerator):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterPointCloudLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterPointCloudLayer']: ...
+    def createFileFilter(self) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterAnnotationLayer(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterAnnotationLayer') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterAnnotationLayer']: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterPointCloudDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterPointCloudDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterPointCloudDestination']: ...
+    def supportedOutputPointCloudLayerExtensions(self) -> list[str]: ...
+    def createFileFilter(self) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterPointCloudAttribute(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., parentLayerParameterName: typing.Optional[str] = ..., allowMultiple: bool = ..., optional: bool = ..., defaultToAllAttributes: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterPointCloudAttribute') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterPointCloudAttribute']: ...
+    def fromVariantMap(self, map: dict[str, typing.Any]) -> bool: ...
+    def toVariantMap(self) -> dict[str, typing.Any]: ...
+    def setDefaultToAllAttributes(self, enabled: bool) -> None: ...
+    def defaultToAllAttributes(self) -> bool: ...
+    def setAllowMultiple(self, allowMultiple: bool) -> None: ...
+    def allowMultiple(self) -> bool: ...
+    def setParentLayerParameterName(self, parentLayerParameterName: typing.Optional[str]) -> None: ...
+    def parentLayerParameterName(self) -> str: ...
+    def dependsOnOtherParameters(self) -> list[str]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def asScriptCode(self) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterVectorTileDestination(QgsProcessingDestinationParameter):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ..., defaultValue: typing.Any = ..., optional: bool = ..., createByDefault: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterVectorTileDestination') -> None: ...
+
+    @staticmethod
+    def fromScriptCode(name: typing.Optional[str], description: typing.Optional[str], isOptional: bool, definition: typing.Optional[str]) -> typing.Optional['QgsProcessingParameterVectorTileDestination']: ...
+    def supportedOutputVectorTileLayerExtensions(self) -> list[str]: ...
+    def createFileFilter(self) -> str: ...
+    def defaultFileExtension(self) -> str: ...
+    def toOutputDefinition(self) -> typing.Optional[QgsProcessingOutputDefinition]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    @staticmethod
+    def typeName() -> str: ...
+
+
+class QgsProcessingParameterTinInputLayers(QgsProcessingParameterDefinition):
+
+    class InputLayer(PyQt5.sip.wrapper):
+
+        attributeIndex = ... # type: int
+        source = ... # type: typing.Optional[str]
+        type = ... # type: Qgis.ProcessingTinInputLayerType
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProcessingParameterTinInputLayers.InputLayer') -> None: ...
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterTinInputLayers') -> None: ...
+
+    @staticmethod
+    def typeName() -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    Type: typing.Type[Qgis.ProcessingTinInputLayerType]
+    Vertices: Qgis.ProcessingTinInputLayerType
+    StructureLines: Qgis.ProcessingTinInputLayerType
+    BreakLines: Qgis.ProcessingTinInputLayerType
+
+
+class QgsProcessingParameterType(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterType') -> None: ...
+
+    def acceptedDataTypes(self, parameter: typing.Optional[QgsProcessingParameterDefinition]) -> list[int]: ...
+    def acceptedOutputTypes(self) -> list[str]: ...
+    def acceptedParameterTypes(self) -> list[str]: ...
+    def acceptedStringValues(self) -> list[str]: ...
+    def acceptedPythonTypes(self) -> list[str]: ...
+    def metadata(self) -> dict[str, typing.Any]: ...
+    def flags(self) -> Qgis.ProcessingParameterTypeFlags: ...
+    def id(self) -> str: ...
+    def className(self) -> str: ...
+    def pythonImportString(self) -> str: ...
+    def name(self) -> str: ...
+    def description(self) -> str: ...
+    def create(self, name: typing.Optional[str]) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+    ParameterFlag: typing.Type[Qgis.ProcessingParameterTypeFlag]
+    ExposeToModeler: Qgis.ProcessingParameterTypeFlag
+    ParameterFlags: typing.Type[Qgis.ProcessingParameterTypeFlags]
+
+
+class QgsProcessingParameterVectorTileWriterLayers(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterVectorTileWriterLayers') -> None: ...
+
+    @staticmethod
+    def layerAsVariantMap(layer: 'QgsVectorTileWriter.Layer') -> dict[str, typing.Any]: ...
+    @staticmethod
+    def variantMapAsLayer(layerVariantMap: dict[str, typing.Any], context: QgsProcessingContext) -> 'QgsVectorTileWriter.Layer': ...
+    @staticmethod
+    def parameterAsLayers(layersVariant: typing.Any, context: QgsProcessingContext) -> list['QgsVectorTileWriter.Layer']: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingParameterAlignRasterLayers(QgsProcessingParameterDefinition):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingParameterAlignRasterLayers') -> None: ...
+
+    @staticmethod
+    def itemAsVariantMap(item: QgsAlignRasterData.RasterItem) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def variantMapAsItem(layerVariantMap: dict[str, typing.Any], context: QgsProcessingContext) -> QgsAlignRasterData.RasterItem: ...
+    @staticmethod
+    def parameterAsItems(layersVariant: typing.Any, context: QgsProcessingContext) -> list[QgsAlignRasterData.RasterItem]: ...
+    @staticmethod
+    def typeName() -> str: ...
+    def valueAsJsonObject(self, value: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    def valueAsString(self, value: typing.Any, context: QgsProcessingContext) -> typing.Tuple[str, bool]: ...
+    def asPythonString(self, outputType: QgsProcessing.PythonOutputType = ...) -> str: ...
+    def valueAsPythonString(self, value: typing.Any, context: QgsProcessingContext) -> str: ...
+    def checkValueIsAcceptable(self, input: typing.Any, context: typing.Optional[QgsProcessingContext] = ...) -> bool: ...
+    def type(self) -> str: ...
+    def clone(self) -> typing.Optional[QgsProcessingParameterDefinition]: ...
+
+
+class QgsProcessingProvider(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def addAlgorithm(self, algorithm: typing.Optional[QgsProcessingAlgorithm]) -> bool: ...
+    def loadAlgorithms(self) -> None: ...
+    algorithmsLoaded: typing.ClassVar[QtCore.pyqtSignal]
+    def algorithm(self, name: typing.Optional[str]) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    def algorithms(self) -> list[QgsProcessingAlgorithm]: ...
+    def refreshAlgorithms(self) -> None: ...
+    def unload(self) -> None: ...
+    def load(self) -> bool: ...
+    def supportsNonFileBasedOutput(self) -> bool: ...
+    def defaultVectorTileFileExtension(self) -> str: ...
+    def defaultPointCloudFileExtension(self) -> str: ...
+    def defaultRasterFileExtension(self) -> str: ...
+    def defaultVectorFileExtension(self, hasGeometry: bool = ...) -> str: ...
+    def isSupportedOutputValue(self, outputValue: typing.Any, parameter: typing.Optional[QgsProcessingDestinationParameter], context: QgsProcessingContext) -> typing.Tuple[bool, str]: ...
+    def supportedOutputTableExtensions(self) -> list[str]: ...
+    def supportedOutputVectorTileLayerExtensions(self) -> list[str]: ...
+    def supportedOutputPointCloudLayerExtensions(self) -> list[str]: ...
+    def supportedOutputVectorLayerExtensions(self) -> list[str]: ...
+    def supportedOutputRasterLayerExtensions(self) -> list[str]: ...
+    def isActive(self) -> bool: ...
+    def warningMessage(self) -> str: ...
+    def canBeActivated(self) -> bool: ...
+    def versionInfo(self) -> str: ...
+    def longName(self) -> str: ...
+    def name(self) -> str: ...
+    def helpId(self) -> str: ...
+    def id(self) -> str: ...
+    def flags(self) -> Qgis.ProcessingProviderFlags: ...
+    def svgIconPath(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    Flag: typing.Type[Qgis.ProcessingProviderFlag]
+    FlagDeemphasiseSearchResults: Qgis.ProcessingProviderFlag
+    FlagCompatibleWithVirtualRaster: Qgis.ProcessingProviderFlag
+    Flags: typing.Type[Qgis.ProcessingProviderFlags]
+
+
+class QgsProcessingAlgorithmInformation(PyQt5.sip.wrapper):
+
+    displayName = ... # type: typing.Optional[str]
+    icon = ... # type: QtGui.QIcon
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingAlgorithmInformation') -> None: ...
+
+
+class QgsProcessingRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    parameterTypeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    parameterTypeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    providerRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    providerAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def parameterTypes(self) -> list[QgsProcessingParameterType]: ...
+    def parameterType(self, id: typing.Optional[str]) -> typing.Optional[QgsProcessingParameterType]: ...
+    def removeParameterType(self, type: typing.Optional[QgsProcessingParameterType]) -> None: ...
+    def addParameterType(self, type: typing.Optional[QgsProcessingParameterType]) -> bool: ...
+    def addAlgorithmAlias(self, aliasId: typing.Optional[str], actualId: typing.Optional[str]) -> None: ...
+    def createAlgorithmById(self, id: typing.Optional[str], configuration: dict[str, typing.Any] = ...) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    def algorithmById(self, id: typing.Optional[str]) -> typing.Optional[QgsProcessingAlgorithm]: ...
+    def algorithmInformation(self, id: typing.Optional[str]) -> QgsProcessingAlgorithmInformation: ...
+    def algorithms(self) -> list[QgsProcessingAlgorithm]: ...
+    def providerById(self, id: typing.Optional[str]) -> typing.Optional[QgsProcessingProvider]: ...
+    @typing.overload
+    def removeProvider(self, provider: typing.Optional[QgsProcessingProvider]) -> bool: ...
+    @typing.overload
+    def removeProvider(self, providerId: typing.Optional[str]) -> bool: ...
+    def addProvider(self, provider: typing.Optional[QgsProcessingProvider]) -> bool: ...
+    def providers(self) -> list[QgsProcessingProvider]: ...
+
+
+class QgsProcessingUtils(PyQt5.sip.wrapper):
+
+    class LayerHint(int):
+        UnknownType = ... # type: QgsProcessingUtils.LayerHint
+        Vector = ... # type: QgsProcessingUtils.LayerHint
+        Raster = ... # type: QgsProcessingUtils.LayerHint
+        Mesh = ... # type: QgsProcessingUtils.LayerHint
+        PointCloud = ... # type: QgsProcessingUtils.LayerHint
+        Annotation = ... # type: QgsProcessingUtils.LayerHint
+        VectorTile = ... # type: QgsProcessingUtils.LayerHint
+        TiledScene = ... # type: QgsProcessingUtils.LayerHint
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingUtils') -> None: ...
+
+    @staticmethod
+    def resolveDefaultEncoding(defaultEncoding: typing.Optional[str] = ...) -> str: ...
+    @staticmethod
+    def preprocessQgisProcessParameters(parameters: dict[str, typing.Any], error: typing.Optional[str]) -> typing.Tuple[dict[str, typing.Any], bool]: ...
+    @staticmethod
+    def removePointerValuesFromMap(map: dict[str, typing.Any]) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def defaultVectorTileExtension() -> str: ...
+    @staticmethod
+    def defaultPointCloudExtension() -> str: ...
+    @staticmethod
+    def defaultRasterExtension() -> str: ...
+    @staticmethod
+    def defaultVectorExtension() -> str: ...
+    @staticmethod
+    def indicesToFields(indices: collections.abc.Iterable[int], fields: QgsFields) -> QgsFields: ...
+    @staticmethod
+    def fieldNamesToIndices(fieldNames: collections.abc.Iterable[typing.Optional[str]], fields: QgsFields) -> list[int]: ...
+    @staticmethod
+    def combineFields(fieldsA: QgsFields, fieldsB: QgsFields, fieldsBPrefix: typing.Optional[str] = ...) -> QgsFields: ...
+    @staticmethod
+    def convertToCompatibleFormatAndLayerName(layer: typing.Optional[QgsVectorLayer], selectedFeaturesOnly: bool, baseName: typing.Optional[str], compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str], context: QgsProcessingContext, feedback: typing.Optional[QgsProcessingFeedback], featureLimit: int = ..., filterExpression: typing.Optional[str] = ...) -> typing.Tuple[str, str]: ...
+    @staticmethod
+    def convertToCompatibleFormat(layer: typing.Optional[QgsVectorLayer], selectedFeaturesOnly: bool, baseName: typing.Optional[str], compatibleFormats: collections.abc.Iterable[typing.Optional[str]], preferredFormat: typing.Optional[str], context: QgsProcessingContext, feedback: typing.Optional[QgsProcessingFeedback], featureLimit: int = ..., filterExpression: typing.Optional[str] = ...) -> str: ...
+    @staticmethod
+    def outputDefinitionIndex(algorithm: typing.Optional[QgsProcessingAlgorithm], name: typing.Optional[str]) -> int: ...
+    @staticmethod
+    def formatHelpMapAsHtml(map: dict[str, typing.Any], algorithm: typing.Optional[QgsProcessingAlgorithm]) -> str: ...
+    @staticmethod
+    def generateTempFilename(basename: typing.Optional[str], context: typing.Optional[QgsProcessingContext] = ...) -> str: ...
+    @staticmethod
+    def tempFolder(context: typing.Optional[QgsProcessingContext] = ...) -> str: ...
+    @staticmethod
+    def generateIteratingDestination(input: typing.Any, id: typing.Any, context: QgsProcessingContext) -> typing.Any: ...
+    @typing.overload
+    @staticmethod
+    def combineLayerExtents(layers: collections.abc.Iterable[QgsMapLayer], crs: QgsCoordinateReferenceSystem, context: QgsProcessingContext) -> QgsRectangle: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def combineLayerExtents(layers: collections.abc.Iterable[QgsMapLayer], crs: QgsCoordinateReferenceSystem = ...) -> QgsRectangle: ...
+    @staticmethod
+    def createFeatureSink(destination: typing.Optional[str], context: QgsProcessingContext, fields: QgsFields, geometryType: Qgis.WkbType, crs: QgsCoordinateReferenceSystem, createOptions: dict[str, typing.Any] = ...) -> typing.Tuple[typing.Optional[QgsFeatureSink], str]: ...
+    @staticmethod
+    def stringToPythonLiteral(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def variantToPythonLiteral(value: typing.Any) -> str: ...
+    @staticmethod
+    def layerToStringIdentifier(layer: typing.Optional[QgsMapLayer], layerName: typing.Optional[str] = ...) -> str: ...
+    @staticmethod
+    def normalizeLayerSource(source: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def variantToCrs(value: typing.Any, context: QgsProcessingContext, fallbackValue: typing.Any = ...) -> QgsCoordinateReferenceSystem: ...
+    @staticmethod
+    def variantToSource(value: typing.Any, context: QgsProcessingContext, fallbackValue: typing.Any = ...) -> typing.Optional['QgsProcessingFeatureSource']: ...
+    @staticmethod
+    def mapLayerFromString(string: typing.Optional[str], context: QgsProcessingContext, allowLoadingNewLayers: bool = ..., typeHint: 'QgsProcessingUtils.LayerHint' = ..., flags: typing.Union[QgsProcessing.LayerOptionsFlags, QgsProcessing.LayerOptionsFlag] = ...) -> typing.Optional[QgsMapLayer]: ...
+    @staticmethod
+    def decodeProviderKeyAndUri(string: typing.Optional[str]) -> typing.Tuple[bool, str, str]: ...
+    @staticmethod
+    def encodeProviderKeyAndUri(providerKey: typing.Optional[str], uri: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def compatibleLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list[QgsMapLayer]: ...
+    @staticmethod
+    def compatibleTiledSceneLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list['QgsTiledSceneLayer']: ...
+    @staticmethod
+    def compatibleVectorTileLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list['QgsVectorTileLayer']: ...
+    @staticmethod
+    def compatibleAnnotationLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list[QgsAnnotationLayer]: ...
+    @staticmethod
+    def compatiblePointCloudLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list[QgsPointCloudLayer]: ...
+    @staticmethod
+    def compatiblePluginLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list[QgsPluginLayer]: ...
+    @staticmethod
+    def compatibleMeshLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list[QgsMeshLayer]: ...
+    @staticmethod
+    def compatibleVectorLayers(project: typing.Optional['QgsProject'], sourceTypes: collections.abc.Iterable[int] = ..., sort: bool = ...) -> list[QgsVectorLayer]: ...
+    @staticmethod
+    def compatibleRasterLayers(project: typing.Optional['QgsProject'], sort: bool = ...) -> list['QgsRasterLayer']: ...
+    UnknownType: QgsProcessingUtils.LayerHint
+    Vector: QgsProcessingUtils.LayerHint
+    Raster: QgsProcessingUtils.LayerHint
+    Mesh: QgsProcessingUtils.LayerHint
+    PointCloud: QgsProcessingUtils.LayerHint
+    Annotation: QgsProcessingUtils.LayerHint
+    VectorTile: QgsProcessingUtils.LayerHint
+    TiledScene: QgsProcessingUtils.LayerHint
+
+
+class QgsProcessingFeatureSource(QgsFeatureSource):
+
+    @typing.overload
+    def __init__(self, originalSource: typing.Optional[QgsFeatureSource], context: QgsProcessingContext, ownsOriginalSource: bool = ..., featureLimit: int = ..., filterExpression: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProcessingFeatureSource') -> None: ...
+
+    def invalidGeometryCheck(self) -> Qgis.InvalidGeometryCheck: ...
+    def setInvalidGeometryCheck(self, method: Qgis.InvalidGeometryCheck) -> None: ...
+    def createExpressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def hasSpatialIndex(self) -> Qgis.SpatialIndexPresence: ...
+    def allFeatureIds(self) -> typing.Any: ...
+    def sourceExtent(self) -> QgsRectangle: ...
+    def maximumValue(self, fieldIndex: int) -> typing.Any: ...
+    def minimumValue(self, fieldIndex: int) -> typing.Any: ...
+    def uniqueValues(self, fieldIndex: int, limit: int = ...) -> set[typing.Any]: ...
+    def sourceName(self) -> str: ...
+    def featureCount(self) -> int: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def fields(self) -> QgsFields: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def hasFeatures(self) -> Qgis.FeatureAvailability: ...
+    @typing.overload
+    def getFeatures(self, request: QgsFeatureRequest, flags: typing.Union[Qgis.ProcessingFeatureSourceFlags, Qgis.ProcessingFeatureSourceFlag]) -> QgsFeatureIterator: ...
+    @typing.overload
+    def getFeatures(self, request: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+    Flag: typing.Type[Qgis.ProcessingFeatureSourceFlag]
+    FlagSkipGeometryValidityChecks: Qgis.ProcessingFeatureSourceFlag
+    Flags: typing.Type[Qgis.ProcessingFeatureSourceFlags]
@@ -0,0 +1,625 @@
+# The PEP 484 type hints stub file for the _core.proj module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsFields, QgsVector3D
+from .geometry import QgsPoint, QgsRectangle
+from .project import QgsProject
+from .vector import QgsMapLayer, QgsPointXY, QgsReadWriteContext
+
+
+class QgsBearingUtils(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBearingUtils') -> None: ...
+
+    @staticmethod
+    def bearingTrueNorth(crs: 'QgsCoordinateReferenceSystem', transformContext: 'QgsCoordinateTransformContext', point: 'QgsPointXY') -> float: ...
+
+
+class QgsGml(QtCore.QObject):
+
+    def __init__(self, typeName: typing.Optional[str], geometryAttribute: typing.Optional[str], fields: QgsFields) -> None: ...
+
+    dataProgressAndSteps: typing.ClassVar[QtCore.pyqtSignal]
+    totalStepsUpdate: typing.ClassVar[QtCore.pyqtSignal]
+    dataReadProgress: typing.ClassVar[QtCore.pyqtSignal]
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def idsMap(self) -> typing.Any: ...
+    def featuresMap(self) -> typing.Any: ...
+    def getFeatures(self, data: typing.Union[QtCore.QByteArray, bytes, bytearray], extent: typing.Optional['QgsRectangle'] = ...) -> typing.Tuple[int, typing.Optional[Qgis.WkbType]]: ...
+    def getFeaturesUri(self, uri: typing.Optional[str], extent: typing.Optional['QgsRectangle'] = ..., userName: typing.Optional[str] = ..., password: typing.Optional[str] = ..., authcfg: typing.Optional[str] = ...) -> typing.Tuple[int, typing.Optional[Qgis.WkbType]]: ...
+
+
+class QgsMapLayerFactory(PyQt5.sip.wrapper):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadAllStoredStyles = ... # type: bool
+        loadDefaultStyle = ... # type: bool
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMapLayerFactory.LayerOptions') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerFactory') -> None: ...
+
+    @staticmethod
+    def createLayer(uri: typing.Optional[str], name: typing.Optional[str], type: Qgis.LayerType, options: 'QgsMapLayerFactory.LayerOptions', provider: typing.Optional[str] = ...) -> typing.Optional[QgsMapLayer]: ...
+    @staticmethod
+    def typeToString(type: Qgis.LayerType) -> str: ...
+    @staticmethod
+    def typeFromString(string: typing.Optional[str]) -> typing.Tuple[Qgis.LayerType, bool]: ...
+
+
+class QgsCelestialBody(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCelestialBody') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def authority(self) -> str: ...
+    def name(self) -> str: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsCoordinateReferenceSystem(PyQt5.sip.wrapper):
+
+    class CrsType(int):
+        InternalCrsId = ... # type: QgsCoordinateReferenceSystem.CrsType
+        PostgisCrsId = ... # type: QgsCoordinateReferenceSystem.CrsType
+        EpsgCrsId = ... # type: QgsCoordinateReferenceSystem.CrsType
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, definition: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, id: int, type: 'QgsCoordinateReferenceSystem.CrsType' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, srs: 'QgsCoordinateReferenceSystem') -> None: ...
+
+    @staticmethod
+    def invalidateCache() -> None: ...
+    @staticmethod
+    @deprecated("""""")
+    def clearRecentCoordinateReferenceSystems() -> None: ...
+    @staticmethod
+    @deprecated("""""")
+    def removeRecentCoordinateReferenceSystem(crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @staticmethod
+    @deprecated("""""")
+    def pushRecentCoordinateReferenceSystem(crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @staticmethod
+    @deprecated("""""")
+    def recentCoordinateReferenceSystems() -> list['QgsCoordinateReferenceSystem']: ...
+    @staticmethod
+    @deprecated("""""")
+    def recentProjections() -> list[str]: ...
+    def __repr__(self) -> typing.Any: ...
+    def geographicCrsAuthId(self) -> str: ...
+    def hasVerticalAxis(self) -> bool: ...
+    def verticalCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def horizontalCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def toGeocentricCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def toGeographicCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def nativeFormat(self) -> Qgis.CrsDefinitionFormat: ...
+    def setNativeFormat(self, format: Qgis.CrsDefinitionFormat) -> None: ...
+    def saveAsUserCrs(self, name: typing.Optional[str], nativeFormat: Qgis.CrsDefinitionFormat = ...) -> int: ...
+    @staticmethod
+    def syncDatabase() -> int: ...
+    def validationHint(self) -> str: ...
+    def setValidationHint(self, html: typing.Optional[str]) -> None: ...
+    def updateDefinition(self) -> None: ...
+    def toOgcUrn(self) -> str: ...
+    def toOgcUri(self) -> str: ...
+    def bounds(self) -> QgsRectangle: ...
+    def mapUnits(self) -> Qgis.DistanceUnit: ...
+    def axisOrdering(self) -> list[Qgis.CrsAxisDirection]: ...
+    def hasAxisInverted(self) -> bool: ...
+    def operation(self) -> 'QgsProjOperation': ...
+    def factors(self, point: QgsPoint) -> 'QgsProjectionFactors': ...
+    def coordinateEpoch(self) -> float: ...
+    def setCoordinateEpoch(self, epoch: float) -> None: ...
+    def celestialBodyName(self) -> str: ...
+    def datumEnsemble(self) -> 'QgsDatumEnsemble': ...
+    def isDynamic(self) -> bool: ...
+    def isGeographic(self) -> bool: ...
+    def isDeprecated(self) -> bool: ...
+    def type(self) -> Qgis.CrsType: ...
+    def toProj(self) -> str: ...
+    @deprecated("""""")
+    def toProj4(self) -> str: ...
+    def toWkt(self, variant: Qgis.CrsWktVariant = ..., multiline: bool = ..., indentationWidth: int = ...) -> str: ...
+    def ellipsoidAcronym(self) -> str: ...
+    def projectionAcronym(self) -> str: ...
+    def userFriendlyIdentifier(self, type: Qgis.CrsIdentifierType = ...) -> str: ...
+    def description(self) -> str: ...
+    def authid(self) -> str: ...
+    def postgisSrid(self) -> int: ...
+    def srsid(self) -> int: ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, node: QtXml.QDomNode) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @deprecated("""""")
+    def findMatchingProj(self) -> int: ...
+    def validate(self) -> None: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    @deprecated("""""")
+    def setupESRIWktFix() -> None: ...
+    def createFromUserInput(self, definition: typing.Optional[str]) -> bool: ...
+    def createFromString(self, definition: typing.Optional[str]) -> bool: ...
+    def createFromProj(self, projString: typing.Optional[str]) -> bool: ...
+    @deprecated("""""")
+    def createFromProj4(self, projString: typing.Optional[str]) -> bool: ...
+    def createFromSrsId(self, srsId: int) -> bool: ...
+    def createFromWkt(self, wkt: typing.Optional[str]) -> bool: ...
+    @deprecated("""""")
+    def createFromSrid(self, srid: int) -> bool: ...
+    def createFromOgcWmsCrs(self, crs: typing.Optional[str]) -> bool: ...
+    @deprecated("""""")
+    def createFromId(self, id: int, type: 'QgsCoordinateReferenceSystem.CrsType' = ...) -> bool: ...
+    @staticmethod
+    def createGeocentricCrs(ellipsoid: typing.Optional[str]) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def createCompoundCrs(horizontalCrs: 'QgsCoordinateReferenceSystem', verticalCrs: 'QgsCoordinateReferenceSystem') -> typing.Tuple['QgsCoordinateReferenceSystem', str]: ...
+    @staticmethod
+    def fromSrsId(srsId: int) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def fromWkt(wkt: typing.Optional[str]) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def fromProj(proj: typing.Optional[str]) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    @deprecated("""""")
+    def fromProj4(proj4: typing.Optional[str]) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def fromEpsgId(epsg: int) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def fromOgcWmsCrs(ogcCrs: typing.Optional[str]) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def validSrsIds() -> typing.Any: ...
+    IdentifierType: typing.Type[Qgis.CrsIdentifierType]
+    ShortString: Qgis.CrsIdentifierType
+    MediumString: Qgis.CrsIdentifierType
+    FullString: Qgis.CrsIdentifierType
+    WktVariant: typing.Type[Qgis.CrsWktVariant]
+    WKT1_GDAL: Qgis.CrsWktVariant
+    WKT1_ESRI: Qgis.CrsWktVariant
+    WKT2_2015: Qgis.CrsWktVariant
+    WKT2_2015_SIMPLIFIED: Qgis.CrsWktVariant
+    WKT2_2019: Qgis.CrsWktVariant
+    WKT2_2019_SIMPLIFIED: Qgis.CrsWktVariant
+    WKT_PREFERRED: Qgis.CrsWktVariant
+    WKT_PREFERRED_SIMPLIFIED: Qgis.CrsWktVariant
+    WKT_PREFERRED_GDAL: Qgis.CrsWktVariant
+    Format: typing.Type[Qgis.CrsDefinitionFormat]
+    FormatWkt: Qgis.CrsDefinitionFormat
+    FormatProj: Qgis.CrsDefinitionFormat
+    WKT2_2018: Qgis.CrsWktVariant
+    WKT2_2018_SIMPLIFIED: Qgis.CrsWktVariant
+
+
+class QgsCoordinateReferenceSystemRegistry(QtCore.QObject):
+
+    class UserCrsDetails(PyQt5.sip.wrapper):
+
+        crs = ... # type: QgsCoordinateReferenceSystem
+        id = ... # type: int
+        name = ... # type: typing.Optional[str]
+        proj = ... # type: typing.Optional[str]
+        wkt = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCoordinateReferenceSystemRegistry.UserCrsDetails') -> None: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    recentCrsCleared: typing.ClassVar[QtCore.pyqtSignal]
+    recentCrsRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    recentCrsPushed: typing.ClassVar[QtCore.pyqtSignal]
+    crsDefinitionsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    userCrsRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    userCrsAdded: typing.ClassVar[QtCore.pyqtSignal]
+    userCrsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def clearRecent(self) -> None: ...
+    def removeRecent(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def pushRecent(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def recentCrs(self) -> list[QgsCoordinateReferenceSystem]: ...
+    def authorities(self) -> set[str]: ...
+    def celestialBodies(self) -> list[QgsCelestialBody]: ...
+    def projOperations(self) -> dict[str, 'QgsProjOperation']: ...
+    def removeUserCrs(self, id: int) -> bool: ...
+    def updateUserCrs(self, id: int, crs: QgsCoordinateReferenceSystem, name: typing.Optional[str], nativeFormat: Qgis.CrsDefinitionFormat = ...) -> bool: ...
+    def addUserCrs(self, crs: QgsCoordinateReferenceSystem, name: typing.Optional[str], nativeFormat: Qgis.CrsDefinitionFormat = ...) -> int: ...
+    def userCrsList(self) -> list['QgsCoordinateReferenceSystemRegistry.UserCrsDetails']: ...
+
+
+class QgsCoordinateReferenceSystemUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCoordinateReferenceSystemUtils') -> None: ...
+
+    @staticmethod
+    def translateProjection(projection: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def crsTypeToString(type: Qgis.CrsType) -> str: ...
+    @staticmethod
+    def axisDirectionToAbbreviatedString(axis: Qgis.CrsAxisDirection) -> str: ...
+    @staticmethod
+    def defaultCoordinateOrderForCrs(crs: QgsCoordinateReferenceSystem) -> Qgis.CoordinateOrder: ...
+
+
+class QgsCoordinateTransform(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem, context: 'QgsCoordinateTransformContext', flags: typing.Union[Qgis.CoordinateTransformationFlags, Qgis.CoordinateTransformationFlag] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem, project: typing.Optional['QgsProject'], flags: typing.Union[Qgis.CoordinateTransformationFlags, Qgis.CoordinateTransformationFlag] = ...) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem, sourceDatumTransformId: int, destinationDatumTransformId: int) -> None: ...
+    @typing.overload
+    def __init__(self, o: 'QgsCoordinateTransform') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def scaleFactor(self, referenceExtent: QgsRectangle) -> float: ...
+    @staticmethod
+    def invalidateCache() -> None: ...
+    @deprecated("""""")
+    def setDestinationDatumTransformId(self, datumId: int) -> None: ...
+    @deprecated("""""")
+    def destinationDatumTransformId(self) -> int: ...
+    @deprecated("""""")
+    def setSourceDatumTransformId(self, datumId: int) -> None: ...
+    @deprecated("""""")
+    def sourceDatumTransformId(self) -> int: ...
+    def fallbackOperationOccurred(self) -> bool: ...
+    def disableFallbackOperationHandler(self, disabled: bool) -> None: ...
+    def setBallparkTransformsAreAppropriate(self, appropriate: bool) -> None: ...
+    def allowFallbackTransforms(self) -> bool: ...
+    def setAllowFallbackTransforms(self, allowed: bool) -> None: ...
+    def setCoordinateOperation(self, operation: typing.Optional[str]) -> None: ...
+    def instantiatedCoordinateOperationDetails(self) -> 'QgsDatumTransform.TransformDetails': ...
+    def coordinateOperation(self) -> str: ...
+    def hasVerticalComponent(self) -> bool: ...
+    def isShortCircuited(self) -> bool: ...
+    def transformCoords(self, numPoint: int, direction: Qgis.TransformDirection = ...) -> typing.Tuple[typing.Optional[float], typing.Optional[float], typing.Optional[float]]: ...
+    def transformPolygon(self, polygon: QtGui.QPolygonF, direction: Qgis.TransformDirection = ...) -> None: ...
+    def transformInPlace(self, direction: Qgis.TransformDirection = ...) -> typing.Tuple[float, float, float]: ...
+    def transformBoundingBox(self, rectangle: QgsRectangle, direction: Qgis.TransformDirection = ..., handle180Crossover: bool = ...) -> QgsRectangle: ...
+    @typing.overload
+    def transform(self, point: QgsPointXY, direction: Qgis.TransformDirection = ...) -> QgsPointXY: ...
+    @typing.overload
+    def transform(self, x: float, y: float, direction: Qgis.TransformDirection = ...) -> QgsPointXY: ...
+    @typing.overload
+    def transform(self, point: QgsVector3D, direction: Qgis.TransformDirection = ...) -> QgsVector3D: ...
+    @typing.overload
+    def transform(self, rectangle: QgsRectangle, direction: Qgis.TransformDirection = ...) -> QgsRectangle: ...
+    def destinationCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def context(self) -> 'QgsCoordinateTransformContext': ...
+    def setContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def setDestinationCrs(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def setSourceCrs(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    def isTransformationPossible(source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    TransformDirection: typing.Type[Qgis.TransformDirection]
+    ForwardTransform: Qgis.TransformDirection
+    ReverseTransform: Qgis.TransformDirection
+
+
+class QgsCoordinateTransformContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, rhs: 'QgsCoordinateTransformContext') -> None: ...
+
+    def writeSettings(self) -> None: ...
+    def readSettings(self) -> None: ...
+    def writeXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Tuple[bool, list[str]]: ...
+    def mustReverseCoordinateOperation(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> bool: ...
+    def allowFallbackTransform(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> bool: ...
+    def calculateCoordinateOperation(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> str: ...
+    @deprecated("""""")
+    def calculateDatumTransforms(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> 'QgsDatumTransform.TransformPair': ...
+    def hasTransform(self, source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> bool: ...
+    def removeCoordinateOperation(self, sourceCrs: QgsCoordinateReferenceSystem, destinationCrs: QgsCoordinateReferenceSystem) -> None: ...
+    @deprecated("""""")
+    def removeSourceDestinationDatumTransform(self, sourceCrs: QgsCoordinateReferenceSystem, destinationCrs: QgsCoordinateReferenceSystem) -> None: ...
+    def addCoordinateOperation(self, sourceCrs: QgsCoordinateReferenceSystem, destinationCrs: QgsCoordinateReferenceSystem, coordinateOperationProjString: typing.Optional[str], allowFallback: bool = ...) -> bool: ...
+    @deprecated("""""")
+    def addSourceDestinationDatumTransform(self, sourceCrs: QgsCoordinateReferenceSystem, destinationCrs: QgsCoordinateReferenceSystem, sourceTransformId: int, destinationTransformId: int) -> bool: ...
+    def coordinateOperations(self) -> typing.Any: ...
+    @deprecated("""""")
+    def sourceDestinationDatumTransforms(self) -> typing.Any: ...
+    def clear(self) -> None: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsDatumEnsembleMember(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDatumEnsembleMember') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def code(self) -> str: ...
+    def authority(self) -> str: ...
+    def remarks(self) -> str: ...
+    def scope(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsDatumEnsemble(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDatumEnsemble') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def members(self) -> list[QgsDatumEnsembleMember]: ...
+    def remarks(self) -> str: ...
+    def scope(self) -> str: ...
+    def code(self) -> str: ...
+    def authority(self) -> str: ...
+    def accuracy(self) -> float: ...
+    def name(self) -> str: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsDatumTransform(PyQt5.sip.wrapper):
+
+    class TransformPair(PyQt5.sip.wrapper):
+
+        destinationTransformId = ... # type: int
+        sourceTransformId = ... # type: int
+
+        @typing.overload
+        def __init__(self, sourceTransformId: int = ..., destinationTransformId: int = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDatumTransform.TransformPair') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class TransformInfo(PyQt5.sip.wrapper):
+
+        datumTransformId = ... # type: int
+        deprecated = ... # type: bool
+        destinationCrsAuthId = ... # type: typing.Optional[str]
+        destinationCrsDescription = ... # type: typing.Optional[str]
+        epsgCode = ... # type: int
+        preferred = ... # type: bool
+        remarks = ... # type: typing.Optional[str]
+        scope = ... # type: typing.Optional[str]
+        sourceCrsAuthId = ... # type: typing.Optional[str]
+        sourceCrsDescription = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDatumTransform.TransformInfo') -> None: ...
+
+    class GridDetails(PyQt5.sip.wrapper):
+
+        directDownload = ... # type: bool
+        fullName = ... # type: typing.Optional[str]
+        isAvailable = ... # type: bool
+        openLicense = ... # type: bool
+        packageName = ... # type: typing.Optional[str]
+        shortName = ... # type: typing.Optional[str]
+        url = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDatumTransform.GridDetails') -> None: ...
+
+    class SingleOperationDetails(PyQt5.sip.wrapper):
+
+        areaOfUse = ... # type: typing.Optional[str]
+        authority = ... # type: typing.Optional[str]
+        code = ... # type: typing.Optional[str]
+        remarks = ... # type: typing.Optional[str]
+        scope = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDatumTransform.SingleOperationDetails') -> None: ...
+
+    class TransformDetails(PyQt5.sip.wrapper):
+
+        accuracy = ... # type: float
+        areaOfUse = ... # type: typing.Optional[str]
+        authority = ... # type: typing.Optional[str]
+        bounds = ... # type: QgsRectangle
+        code = ... # type: typing.Optional[str]
+        grids = ... # type: collections.abc.Iterable['QgsDatumTransform.GridDetails']
+        isAvailable = ... # type: bool
+        name = ... # type: typing.Optional[str]
+        operationDetails = ... # type: collections.abc.Iterable['QgsDatumTransform.SingleOperationDetails']
+        proj = ... # type: typing.Optional[str]
+        remarks = ... # type: typing.Optional[str]
+        scope = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDatumTransform.TransformDetails') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDatumTransform') -> None: ...
+
+    @staticmethod
+    @deprecated("""""")
+    def datumTransformInfo(datumTransformId: int) -> 'QgsDatumTransform.TransformInfo': ...
+    @staticmethod
+    @deprecated("""""")
+    def projStringToDatumTransformId(string: typing.Optional[str]) -> int: ...
+    @staticmethod
+    @deprecated("""""")
+    def datumTransformToProj(datumTransformId: int) -> str: ...
+    @staticmethod
+    @deprecated("""""")
+    def datumTransformations(source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem) -> list['QgsDatumTransform.TransformPair']: ...
+    @staticmethod
+    def operations(source: QgsCoordinateReferenceSystem, destination: QgsCoordinateReferenceSystem, includeSuperseded: bool = ...) -> list['QgsDatumTransform.TransformDetails']: ...
+
+
+class QgsEllipsoidUtils(PyQt5.sip.wrapper):
+
+    class EllipsoidParameters(PyQt5.sip.wrapper):
+
+        crs = ... # type: QgsCoordinateReferenceSystem
+        inverseFlattening = ... # type: float
+        semiMajor = ... # type: float
+        semiMinor = ... # type: float
+        useCustomParameters = ... # type: bool
+        valid = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsEllipsoidUtils.EllipsoidParameters') -> None: ...
+
+    class EllipsoidDefinition(PyQt5.sip.wrapper):
+
+        acronym = ... # type: typing.Optional[str]
+        celestialBodyName = ... # type: typing.Optional[str]
+        description = ... # type: typing.Optional[str]
+        parameters = ... # type: 'QgsEllipsoidUtils.EllipsoidParameters'
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsEllipsoidUtils.EllipsoidDefinition') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsEllipsoidUtils') -> None: ...
+
+    @staticmethod
+    def celestialBodies() -> list[QgsCelestialBody]: ...
+    @staticmethod
+    def acronyms() -> list[str]: ...
+    @staticmethod
+    def definitions() -> list['QgsEllipsoidUtils.EllipsoidDefinition']: ...
+    @staticmethod
+    def ellipsoidParameters(ellipsoid: typing.Optional[str]) -> 'QgsEllipsoidUtils.EllipsoidParameters': ...
+
+
+class QgsProjOperation(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjOperation') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def details(self) -> str: ...
+    def description(self) -> str: ...
+    def id(self) -> str: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsProjUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjUtils') -> None: ...
+
+    @staticmethod
+    def searchPaths() -> list[str]: ...
+    @staticmethod
+    def ignfDatabaseDate() -> QtCore.QDate: ...
+    @staticmethod
+    def ignfDatabaseVersion() -> str: ...
+    @staticmethod
+    def esriDatabaseDate() -> QtCore.QDate: ...
+    @staticmethod
+    def esriDatabaseVersion() -> str: ...
+    @staticmethod
+    def epsgRegistryDate() -> QtCore.QDate: ...
+    @staticmethod
+    def epsgRegistryVersion() -> str: ...
+    @staticmethod
+    def projVersionMinor() -> int: ...
+    @staticmethod
+    def projVersionMajor() -> int: ...
+
+
+class QgsProjectionFactors(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectionFactors') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def dyDphi(self) -> float: ...
+    def dyDlam(self) -> float: ...
+    def dxDphi(self) -> float: ...
+    def dxDlam(self) -> float: ...
+    def tissotSemiminor(self) -> float: ...
+    def tissotSemimajor(self) -> float: ...
+    def meridianConvergence(self) -> float: ...
+    def meridianParallelAngle(self) -> float: ...
+    def angularDistortion(self) -> float: ...
+    def arealScale(self) -> float: ...
+    def parallelScale(self) -> float: ...
+    def meridionalScale(self) -> float: ...
+    def isValid(self) -> bool: ...
@@ -0,0 +1,1577 @@
+# The PEP 484 type hints stub file for the _core.project module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._3d import Qgs3DRendererRegistry, Qgs3DSymbolRegistry
+from ._ungrouped import (
+    Qgis, QgsColorRamp, QgsColorSchemeRegistry, QgsDatabaseQueryLog,
+    QgsDateTimeRange, QgsDoubleRange, QgsImageCache,
+    QgsLocalizedDataPathRegistry, QgsMessageLog, QgsPathResolver,
+    QgsRuntimeProfiler, QgsSourceCache,
+)
+from .actions import QgsActionScopeRegistry
+from .annotations import (
+    QgsAnnotationItemRegistry, QgsAnnotationLayer, QgsAnnotationManager,
+)
+from .auth import QgsAuthConfigurationStorageRegistry, QgsAuthManager
+from .browser import QgsDataItemProviderRegistry
+from .callouts import QgsCalloutRegistry
+from .classification import QgsClassificationMethodRegistry
+from .dxf import QgsElevationShadingRenderer
+from .editform import QgsAttributeEditorContainer, QgsRelationManager
+from .effects import QgsPaintEffectRegistry
+from .elevation import (
+    QgsAbstractTerrainProvider, QgsProfileSourceRegistry, QgsTask,
+)
+from .externalstorage import QgsExternalStorageRegistry
+from .fieldformatter import QgsFieldFormatter
+from .geometry import QgsReferencedRectangle
+from .gps import QgsBabelFormatRegistry, QgsGpsConnectionRegistry
+from .labeling import QgsLabelingEngineRuleRegistry, QgsLabelingEngineSettings
+from .layertree import (
+    QgsLayerTree, QgsLayerTreeGroup, QgsLayerTreeModel,
+    QgsLayerTreeRegistryBridge,
+)
+from .layout import (
+    QgsLayoutItemRegistry, QgsLayoutManager, QgsPageSizeRegistry,
+)
+from .metadata import QgsLayerMetadataProviderRegistry, QgsProjectMetadata
+from .network import QgsNetworkContentFetcherRegistry
+from .numericformats import (
+    QgsBearingNumericFormat, QgsGeographicCoordinateNumericFormat,
+    QgsNumericFormatRegistry,
+)
+from .pointcloud import QgsPointCloudRendererRegistry
+from .processing import QgsProcessingRegistry
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateReferenceSystemRegistry,
+    QgsCoordinateTransformContext,
+)
+from .providers import QgsAbstractProviderConnection
+from .raster import QgsRasterLayer
+from .scalebar import QgsScaleBarRendererRegistry
+from .sensor import QgsSensorManager, QgsSensorRegistry
+from .settings import QgsSettingsRegistryCore
+from .symbology import (
+    QgsCombinedStyleModel, QgsRendererRegistry, QgsStyle,
+    QgsStyleEntityVisitorInterface, QgsStyleModel, QgsSvgCache, QgsSymbol,
+    QgsSymbolLayerRegistry,
+)
+from .textrenderer import QgsFontManager, QgsTextFormat
+from .tiledscene import QgsTiledSceneRendererRegistry
+from .validity import QgsValidityCheckRegistry
+from .vector import (
+    QgsAuxiliaryStorage, QgsExpressionContext, QgsExpressionContextGenerator,
+    QgsExpressionContextScope, QgsExpressionContextScopeGenerator, QgsMapLayer,
+    QgsMapLayerStore, QgsPluginLayer, QgsPropertyCollection,
+    QgsReadWriteContext, QgsVectorLayer, QgsVectorLayerEditBufferGroup,
+)
+
+
+class QgsApplication(QtWidgets.QApplication):
+
+    class endian_t(int):
+        XDR = ... # type: QgsApplication.endian_t
+        NDR = ... # type: QgsApplication.endian_t
+
+    class Cursor(int):
+        ZoomIn = ... # type: QgsApplication.Cursor
+        ZoomOut = ... # type: QgsApplication.Cursor
+        Identify = ... # type: QgsApplication.Cursor
+        CrossHair = ... # type: QgsApplication.Cursor
+        CapturePoint = ... # type: QgsApplication.Cursor
+        Select = ... # type: QgsApplication.Cursor
+        Sampler = ... # type: QgsApplication.Cursor
+
+    class StyleSheetType(int):
+        Qt = ... # type: QgsApplication.StyleSheetType
+        WebBrowser = ... # type: QgsApplication.StyleSheetType
+
+    QGIS_APPLICATION_NAME = ... # type: str
+    QGIS_ORGANIZATION_DOMAIN = ... # type: str
+    QGIS_ORGANIZATION_NAME = ... # type: str
+
+    def __init__(self, argv: list, GUIenabled: bool, profileFolder: typing.Optional[str] = ..., platformName: typing.Optional[str] = ...) -> None: ...
+
+    localeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    requestForTranslatableObjects: typing.ClassVar[QtCore.pyqtSignal]
+    nullRepresentationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    customVariablesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def collectTranslatableObjects(self, translationContext: typing.Optional['QgsTranslationContext']) -> None: ...
+    def translation(self) -> str: ...
+    @staticmethod
+    def setTranslation(translation: typing.Optional[str]) -> None: ...
+    def maxConcurrentConnectionsPerPool(self) -> int: ...
+    @staticmethod
+    def scaleIconSize(standardSize: int, applyDevicePixelRatio: bool = ...) -> int: ...
+    @staticmethod
+    def setCustomVariable(name: typing.Optional[str], value: typing.Any) -> None: ...
+    @staticmethod
+    def setCustomVariables(customVariables: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def customVariables() -> dict[str, typing.Any]: ...
+    @staticmethod
+    def setNullRepresentation(nullRepresentation: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def nullRepresentation() -> str: ...
+    @staticmethod
+    def localizedDataPathRegistry() -> typing.Optional['QgsLocalizedDataPathRegistry']: ...
+    @staticmethod
+    def profileSourceRegistry() -> typing.Optional['QgsProfileSourceRegistry']: ...
+    @staticmethod
+    def externalStorageRegistry() -> typing.Optional['QgsExternalStorageRegistry']: ...
+    @staticmethod
+    def layerMetadataProviderRegistry() -> typing.Optional['QgsLayerMetadataProviderRegistry']: ...
+    @staticmethod
+    def projectStorageRegistry() -> typing.Optional['QgsProjectStorageRegistry']: ...
+    @staticmethod
+    def labelingEngineRuleRegistry() -> typing.Optional['QgsLabelingEngineRuleRegistry']: ...
+    @staticmethod
+    def scaleBarRendererRegistry() -> typing.Optional['QgsScaleBarRendererRegistry']: ...
+    @staticmethod
+    def symbol3DRegistry() -> typing.Optional['Qgs3DSymbolRegistry']: ...
+    @staticmethod
+    def renderer3DRegistry() -> typing.Optional['Qgs3DRendererRegistry']: ...
+    @staticmethod
+    def fieldFormatterRegistry() -> typing.Optional['QgsFieldFormatterRegistry']: ...
+    @staticmethod
+    def numericFormatRegistry() -> typing.Optional['QgsNumericFormatRegistry']: ...
+    @staticmethod
+    def profiler() -> typing.Optional['QgsRuntimeProfiler']: ...
+    @staticmethod
+    def connectionRegistry() -> typing.Optional['QgsConnectionRegistry']: ...
+    @staticmethod
+    def actionScopeRegistry() -> typing.Optional['QgsActionScopeRegistry']: ...
+    @staticmethod
+    def pageSizeRegistry() -> typing.Optional['QgsPageSizeRegistry']: ...
+    @staticmethod
+    def processingRegistry() -> typing.Optional['QgsProcessingRegistry']: ...
+    @staticmethod
+    def authConfigurationStorageRegistry() -> typing.Optional['QgsAuthConfigurationStorageRegistry']: ...
+    @staticmethod
+    def authManager() -> typing.Optional['QgsAuthManager']: ...
+    @staticmethod
+    def messageLog() -> typing.Optional['QgsMessageLog']: ...
+    @staticmethod
+    def sensorRegistry() -> typing.Optional['QgsSensorRegistry']: ...
+    @staticmethod
+    def fontManager() -> typing.Optional['QgsFontManager']: ...
+    @staticmethod
+    def defaultStyleModel() -> typing.Optional['QgsStyleModel']: ...
+    @staticmethod
+    def databaseQueryLog() -> typing.Optional['QgsDatabaseQueryLog']: ...
+    @staticmethod
+    def recentStyleHandler() -> typing.Optional['QgsRecentStyleHandler']: ...
+    @staticmethod
+    def bookmarkManager() -> typing.Optional['QgsBookmarkManager']: ...
+    @staticmethod
+    def classificationMethodRegistry() -> typing.Optional['QgsClassificationMethodRegistry']: ...
+    @staticmethod
+    def pluginLayerRegistry() -> typing.Optional['QgsPluginLayerRegistry']: ...
+    @staticmethod
+    def gpsBabelFormatRegistry() -> typing.Optional['QgsBabelFormatRegistry']: ...
+    @staticmethod
+    def gpsConnectionRegistry() -> typing.Optional['QgsGpsConnectionRegistry']: ...
+    @staticmethod
+    def annotationItemRegistry() -> typing.Optional['QgsAnnotationItemRegistry']: ...
+    @staticmethod
+    def layoutItemRegistry() -> typing.Optional['QgsLayoutItemRegistry']: ...
+    @staticmethod
+    def calloutRegistry() -> typing.Optional['QgsCalloutRegistry']: ...
+    @staticmethod
+    def symbolLayerRegistry() -> typing.Optional['QgsSymbolLayerRegistry']: ...
+    @staticmethod
+    def validityCheckRegistry() -> typing.Optional['QgsValidityCheckRegistry']: ...
+    @staticmethod
+    def networkContentFetcherRegistry() -> typing.Optional['QgsNetworkContentFetcherRegistry']: ...
+    @staticmethod
+    def sourceCache() -> typing.Optional['QgsSourceCache']: ...
+    @staticmethod
+    def imageCache() -> typing.Optional['QgsImageCache']: ...
+    @staticmethod
+    def svgCache() -> typing.Optional['QgsSvgCache']: ...
+    @staticmethod
+    def coordinateReferenceSystemRegistry() -> typing.Optional['QgsCoordinateReferenceSystemRegistry']: ...
+    @staticmethod
+    def dataItemProviderRegistry() -> typing.Optional['QgsDataItemProviderRegistry']: ...
+    @staticmethod
+    def tiledSceneRendererRegistry() -> typing.Optional['QgsTiledSceneRendererRegistry']: ...
+    @staticmethod
+    def pointCloudRendererRegistry() -> typing.Optional['QgsPointCloudRendererRegistry']: ...
+    @staticmethod
+    def rendererRegistry() -> typing.Optional['QgsRendererRegistry']: ...
+    @staticmethod
+    def paintEffectRegistry() -> typing.Optional['QgsPaintEffectRegistry']: ...
+    @staticmethod
+    def colorSchemeRegistry() -> typing.Optional['QgsColorSchemeRegistry']: ...
+    @staticmethod
+    @deprecated("""""")
+    def settingsRegistryCore() -> typing.Optional['QgsSettingsRegistryCore']: ...
+    @staticmethod
+    def taskManager() -> typing.Optional['QgsTaskManager']: ...
+    @staticmethod
+    def setMaxThreads(maxThreads: int) -> None: ...
+    @staticmethod
+    def maxThreads() -> int: ...
+    @staticmethod
+    def setSkippedGdalDrivers(skippedGdalDrivers: collections.abc.Iterable[typing.Optional[str]], deferredSkippedGdalDrivers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @staticmethod
+    def deferredSkippedGdalDrivers() -> list[str]: ...
+    @staticmethod
+    def registerGdalDriversFromSettings() -> None: ...
+    @staticmethod
+    def applyGdalSkippedDrivers() -> None: ...
+    @staticmethod
+    def skippedGdalDrivers() -> list[str]: ...
+    @staticmethod
+    def restoreGdalDriver(driver: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def skipGdalDriver(driver: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def buildOutputPath() -> str: ...
+    @staticmethod
+    def buildSourcePath() -> str: ...
+    @staticmethod
+    def isRunningFromBuildDir() -> bool: ...
+    @staticmethod
+    def relativePathToAbsolutePath(rpath: typing.Optional[str], targetPath: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def absolutePathToRelativePath(apath: typing.Optional[str], targetPath: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def registerOgrDrivers() -> None: ...
+    @staticmethod
+    def showSettings() -> str: ...
+    @staticmethod
+    def reportStyleSheet(styleSheetType: 'QgsApplication.StyleSheetType' = ...) -> str: ...
+    @staticmethod
+    def endian() -> 'QgsApplication.endian_t': ...
+    @staticmethod
+    def appIconPath() -> str: ...
+    @staticmethod
+    def exitQgis() -> None: ...
+    @staticmethod
+    def createThemeFolder() -> bool: ...
+    @staticmethod
+    def createDatabase(errorMessage: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    @staticmethod
+    def initQgis() -> None: ...
+    @staticmethod
+    def setAuthDatabaseDirPath(authDbDirPath: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setDefaultSvgPaths(pathList: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @staticmethod
+    def setPkgDataPath(pkgDataPath: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setPluginPath(pluginPath: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setPrefixPath(prefixPath: typing.Optional[str], useDefaultPaths: bool = ...) -> None: ...
+    @staticmethod
+    def qmlImportPath() -> str: ...
+    @staticmethod
+    def libexecPath() -> str: ...
+    @staticmethod
+    def libraryPath() -> str: ...
+    @staticmethod
+    def defaultThemesFolder() -> str: ...
+    @staticmethod
+    def defaultStylePath() -> str: ...
+    @staticmethod
+    def userThemesFolder() -> str: ...
+    @staticmethod
+    def setLocale(locale: QtCore.QLocale) -> None: ...
+    @staticmethod
+    def locale() -> str: ...
+    @staticmethod
+    def applicationFullName() -> str: ...
+    @staticmethod
+    def platform() -> str: ...
+    @staticmethod
+    def systemMemorySizeMb() -> int: ...
+    @staticmethod
+    def osName() -> str: ...
+    @staticmethod
+    def userFullName() -> str: ...
+    @staticmethod
+    def userLoginName() -> str: ...
+    @staticmethod
+    def shortNameRegularExpression() -> QtCore.QRegularExpression: ...
+    @staticmethod
+    def userStylePath() -> str: ...
+    @staticmethod
+    def getThemePixmap(name: typing.Optional[str], foreColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., backColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., size: int = ...) -> QtGui.QPixmap: ...
+    @staticmethod
+    def getThemeCursor(cursor: 'QgsApplication.Cursor') -> QtGui.QCursor: ...
+    @staticmethod
+    def getThemeIcon(name: typing.Optional[str], fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPath(iconFile: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def defaultThemePath() -> str: ...
+    @staticmethod
+    def activeThemePath() -> str: ...
+    @staticmethod
+    def pkgDataPath() -> str: ...
+    @staticmethod
+    def pluginPath() -> str: ...
+    @staticmethod
+    def prefixPath() -> str: ...
+    @staticmethod
+    def systemEnvVars() -> dict[str, str]: ...
+    @staticmethod
+    def layoutTemplatePaths() -> list[str]: ...
+    @staticmethod
+    def svgPaths() -> list[str]: ...
+    @staticmethod
+    def setSvgPaths(svgPaths: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @staticmethod
+    def srsDatabaseFilePath() -> str: ...
+    @staticmethod
+    def iconsPath() -> str: ...
+    @staticmethod
+    def splashPath() -> str: ...
+    @staticmethod
+    def qgisAuthDatabaseUri() -> str: ...
+    @staticmethod
+    @deprecated("""""")
+    def qgisAuthDatabaseFilePath() -> str: ...
+    @staticmethod
+    def qgisUserDatabaseFilePath() -> str: ...
+    @staticmethod
+    def qgisSettingsDirPath() -> str: ...
+    @staticmethod
+    def qgisMasterDatabaseFilePath() -> str: ...
+    @staticmethod
+    def metadataPath() -> str: ...
+    @staticmethod
+    def i18nPath() -> str: ...
+    @staticmethod
+    def licenceFilePath() -> str: ...
+    @staticmethod
+    def translatorsFilePath() -> str: ...
+    @staticmethod
+    def serverResourcesPath() -> str: ...
+    @staticmethod
+    def donorsFilePath() -> str: ...
+    @staticmethod
+    def sponsorsFilePath() -> str: ...
+    @staticmethod
+    def developersMapFilePath() -> str: ...
+    @staticmethod
+    def contributorsFilePath() -> str: ...
+    @staticmethod
+    def authorsFilePath() -> str: ...
+    @staticmethod
+    def uiThemes() -> dict[str, str]: ...
+    @staticmethod
+    def setUITheme(themeName: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def themeName() -> str: ...
+    @staticmethod
+    def resolvePkgPath() -> str: ...
+    @staticmethod
+    def setThemeName(themeName: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setFileOpenEventReceiver(receiver: typing.Optional[QtCore.QObject]) -> None: ...
+    def notify(self, receiver: typing.Optional[QtCore.QObject], event: typing.Optional[QtCore.QEvent]) -> bool: ...
+    def event(self, event: typing.Optional[QtCore.QEvent]) -> bool: ...
+    @staticmethod
+    def instance() -> typing.Optional['QgsApplication']: ...
+
+
+class QgsBookmark(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBookmark') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    @staticmethod
+    def fromXml(element: QtXml.QDomElement, doc: QtXml.QDomDocument) -> 'QgsBookmark': ...
+    def setRotation(self, rotation: float) -> None: ...
+    def rotation(self) -> float: ...
+    def setExtent(self, extent: 'QgsReferencedRectangle') -> None: ...
+    def extent(self) -> 'QgsReferencedRectangle': ...
+    def setGroup(self, group: typing.Optional[str]) -> None: ...
+    def group(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+
+
+class QgsBookmarkManager(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    bookmarkChanged: typing.ClassVar[QtCore.pyqtSignal]
+    bookmarkAboutToBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    bookmarkRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    bookmarkAdded: typing.ClassVar[QtCore.pyqtSignal]
+    bookmarkAboutToBeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def importFromFile(self, path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def exportToFile(path: typing.Optional[str], managers: collections.abc.Iterable['QgsBookmarkManager'], group: typing.Optional[str] = ...) -> bool: ...
+    def moveBookmark(self, id: typing.Optional[str], destination: typing.Optional['QgsBookmarkManager']) -> bool: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
+    def bookmarksByGroup(self, group: typing.Optional[str]) -> list[QgsBookmark]: ...
+    def bookmarkById(self, id: typing.Optional[str]) -> QgsBookmark: ...
+    def bookmarks(self) -> list[QgsBookmark]: ...
+    def renameGroup(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def groups(self) -> list[str]: ...
+    def clear(self) -> None: ...
+    def updateBookmark(self, bookmark: QgsBookmark) -> bool: ...
+    def removeBookmark(self, id: typing.Optional[str]) -> bool: ...
+    def addBookmark(self, bookmark: QgsBookmark) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    def initialize(self, filePath: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def createProjectBasedManager(project: typing.Optional['QgsProject']) -> typing.Optional['QgsBookmarkManager']: ...
+
+
+class QgsBookmarkManagerModel(QtCore.QAbstractTableModel):
+
+    class Columns(int):
+        ColumnName = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnGroup = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnXMin = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnYMin = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnXMax = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnYMax = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnRotation = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnCrs = ... # type: QgsBookmarkManagerModel.Columns
+        ColumnStore = ... # type: QgsBookmarkManagerModel.Columns
+
+    class CustomRole(int):
+        Extent = ... # type: QgsBookmarkManagerModel.CustomRole
+        Name = ... # type: QgsBookmarkManagerModel.CustomRole
+        Id = ... # type: QgsBookmarkManagerModel.CustomRole
+        Group = ... # type: QgsBookmarkManagerModel.CustomRole
+        Rotation = ... # type: QgsBookmarkManagerModel.CustomRole
+
+    def __init__(self, manager: typing.Optional[QgsBookmarkManager], projectManager: typing.Optional[QgsBookmarkManager] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def insertRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    CustomRoles: typing.Type[QgsBookmarkManagerModel.CustomRole]
+    RoleExtent: QgsBookmarkManagerModel.CustomRole
+    RoleName: QgsBookmarkManagerModel.CustomRole
+    RoleId: QgsBookmarkManagerModel.CustomRole
+    RoleGroup: QgsBookmarkManagerModel.CustomRole
+    RoleRotation: QgsBookmarkManagerModel.CustomRole
+
+
+class QgsBookmarkManagerProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, manager: typing.Optional[QgsBookmarkManager], projectManager: typing.Optional[QgsBookmarkManager] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+
+class QgsConnectionRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def createConnection(self, name: typing.Optional[str]) -> typing.Optional['QgsAbstractProviderConnection']: ...
+
+
+class QgsFieldFormatterRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    fieldFormatterRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    fieldFormatterAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def fallbackFieldFormatter(self) -> typing.Optional[QgsFieldFormatter]: ...
+    def fieldFormatter(self, id: typing.Optional[str]) -> typing.Optional[QgsFieldFormatter]: ...
+    @typing.overload
+    def removeFieldFormatter(self, formatter: typing.Optional[QgsFieldFormatter]) -> None: ...
+    @typing.overload
+    def removeFieldFormatter(self, id: typing.Optional[str]) -> None: ...
+    def addFieldFormatter(self, formatter: typing.Optional[QgsFieldFormatter]) -> None: ...
+
+
+class QgsMapLayerModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        LayerId = ... # type: QgsMapLayerModel.CustomRole
+        Layer = ... # type: QgsMapLayerModel.CustomRole
+        Empty = ... # type: QgsMapLayerModel.CustomRole
+        Additional = ... # type: QgsMapLayerModel.CustomRole
+
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., project: typing.Optional['QgsProject'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, layers: collections.abc.Iterable[QgsMapLayer], parent: typing.Optional[QtCore.QObject] = ..., project: typing.Optional['QgsProject'] = ...) -> None: ...
+
+    def addLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def removeLayers(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @staticmethod
+    def iconForLayer(layer: typing.Optional[QgsMapLayer]) -> QtGui.QIcon: ...
+    def supportedDropActions(self) -> QtCore.Qt.DropActions: ...
+    def dropMimeData(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction, row: int, column: int, parent: QtCore.QModelIndex) -> bool: ...
+    def mimeData(self, indexes: collections.abc.Iterable[QtCore.QModelIndex]) -> typing.Optional[QtCore.QMimeData]: ...
+    def canDropMimeData(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction, row: int, column: int, parent: QtCore.QModelIndex) -> bool: ...
+    def mimeTypes(self) -> list[str]: ...
+    def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def insertRows(self, row: int, count: int, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def additionalLayers(self) -> list[QgsMapLayer]: ...
+    def setAdditionalLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def additionalItems(self) -> list[str]: ...
+    def setAdditionalItems(self, items: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def layerFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional[QgsMapLayer]: ...
+    def indexFromLayer(self, layer: typing.Optional[QgsMapLayer]) -> QtCore.QModelIndex: ...
+    def itemsCheckable(self) -> bool: ...
+    def setLayersChecked(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layersChecked(self, checkState: QtCore.Qt.CheckState = ...) -> list[QgsMapLayer]: ...
+    def showCrs(self) -> bool: ...
+    def setShowCrs(self, showCrs: bool) -> None: ...
+    def allowEmptyLayer(self) -> bool: ...
+    def setAllowEmptyLayer(self, allowEmpty: bool, text: typing.Optional[str] = ..., icon: QtGui.QIcon = ...) -> None: ...
+    def checkAll(self, checkState: QtCore.Qt.CheckState) -> None: ...
+    def itemsCanBeReordered(self) -> bool: ...
+    def setItemsCanBeReordered(self, allow: bool) -> None: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def setItemsCheckable(self, checkable: bool) -> None: ...
+    ItemDataRole: typing.Type[QgsMapLayerModel.CustomRole]
+    LayerIdRole: QgsMapLayerModel.CustomRole
+    LayerRole: QgsMapLayerModel.CustomRole
+    EmptyRole: QgsMapLayerModel.CustomRole
+    AdditionalRole: QgsMapLayerModel.CustomRole
+
+
+class QgsMapThemeCollection(QtCore.QObject):
+
+    class MapThemeLayerRecord(PyQt5.sip.wrapper):
+
+        checkedLegendItems = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        currentStyle = ... # type: typing.Optional[str]
+        expandedLayerNode = ... # type: bool
+        expandedLegendItems = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        isVisible = ... # type: bool
+        usingCurrentStyle = ... # type: bool
+        usingLegendItems = ... # type: bool
+
+        @typing.overload
+        def __init__(self, l: typing.Optional[QgsMapLayer] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMapThemeCollection.MapThemeLayerRecord') -> None: ...
+
+        def setLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+        def layer(self) -> typing.Optional[QgsMapLayer]: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class MapThemeRecord(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsMapThemeCollection.MapThemeRecord') -> None: ...
+
+        def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> None: ...
+        @staticmethod
+        def readXml(element: QtXml.QDomElement, project: typing.Optional['QgsProject']) -> 'QgsMapThemeCollection.MapThemeRecord': ...
+        def setCheckedGroupNodes(self, checkedGroupNodes: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+        def setExpandedGroupNodes(self, expandedGroupNodes: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+        def checkedGroupNodes(self) -> set[str]: ...
+        def expandedGroupNodes(self) -> set[str]: ...
+        def setHasCheckedStateInfo(self, hasInfo: bool) -> None: ...
+        def setHasExpandedStateInfo(self, hasInfo: bool) -> None: ...
+        def hasCheckedStateInfo(self) -> bool: ...
+        def hasExpandedStateInfo(self) -> bool: ...
+        def addLayerRecord(self, record: 'QgsMapThemeCollection.MapThemeLayerRecord') -> None: ...
+        def removeLayerRecord(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+        def setLayerRecords(self, records: collections.abc.Iterable['QgsMapThemeCollection.MapThemeLayerRecord']) -> None: ...
+        def layerRecords(self) -> list['QgsMapThemeCollection.MapThemeLayerRecord']: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+
+    projectChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapThemeRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    mapThemeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapThemesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def masterVisibleLayers(self) -> list[QgsMapLayer]: ...
+    def masterLayerOrder(self) -> list[QgsMapLayer]: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def applyTheme(self, name: typing.Optional[str], root: typing.Optional['QgsLayerTreeGroup'], model: typing.Optional['QgsLayerTreeModel']) -> None: ...
+    @staticmethod
+    def createThemeFromCurrentState(root: typing.Optional['QgsLayerTreeGroup'], model: typing.Optional['QgsLayerTreeModel']) -> 'QgsMapThemeCollection.MapThemeRecord': ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> None: ...
+    def readXml(self, doc: QtXml.QDomDocument) -> None: ...
+    def mapThemeStyleOverrides(self, name: typing.Optional[str]) -> dict[str, str]: ...
+    def mapThemeVisibleLayers(self, name: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    def mapThemeVisibleLayerIds(self, name: typing.Optional[str]) -> list[str]: ...
+    def mapThemeState(self, name: typing.Optional[str]) -> 'QgsMapThemeCollection.MapThemeRecord': ...
+    def mapThemes(self) -> list[str]: ...
+    def clear(self) -> None: ...
+    def renameMapTheme(self, name: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeMapTheme(self, name: typing.Optional[str]) -> None: ...
+    def update(self, name: typing.Optional[str], state: 'QgsMapThemeCollection.MapThemeRecord') -> None: ...
+    def insert(self, name: typing.Optional[str], state: 'QgsMapThemeCollection.MapThemeRecord') -> None: ...
+    def hasMapTheme(self, name: typing.Optional[str]) -> bool: ...
+
+
+class QgsPluginLayerType(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsPluginLayerType') -> None: ...
+
+    def showLayerProperties(self, layer: typing.Optional[QgsPluginLayer]) -> bool: ...
+    @typing.overload
+    def createLayer(self) -> typing.Optional[QgsPluginLayer]: ...
+    @typing.overload
+    def createLayer(self, uri: typing.Optional[str]) -> typing.Optional[QgsPluginLayer]: ...
+    def name(self) -> str: ...
+
+
+class QgsPluginLayerRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def createLayer(self, typeName: typing.Optional[str], uri: typing.Optional[str] = ...) -> typing.Optional[QgsPluginLayer]: ...
+    def pluginLayerType(self, typeName: typing.Optional[str]) -> typing.Optional[QgsPluginLayerType]: ...
+    def removePluginLayerType(self, typeName: typing.Optional[str]) -> bool: ...
+    def addPluginLayerType(self, pluginLayerType: typing.Optional[QgsPluginLayerType]) -> bool: ...
+    def pluginLayerTypes(self) -> list[str]: ...
+
+
+class QgsRecentStyleHandler(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def recentSymbol(self, identifier: typing.Optional[str]) -> typing.Optional['QgsSymbol']: ...
+    def pushRecentSymbol(self, identifier: typing.Optional[str], symbol: typing.Optional['QgsSymbol']) -> None: ...
+
+
+class QgsSnappingConfig(PyQt5.sip.wrapper):
+
+    class ScaleDependencyMode(int):
+        Disabled = ... # type: QgsSnappingConfig.ScaleDependencyMode
+        Global = ... # type: QgsSnappingConfig.ScaleDependencyMode
+        PerLayer = ... # type: QgsSnappingConfig.ScaleDependencyMode
+
+    class SnappingType(int):
+        Vertex = ... # type: QgsSnappingConfig.SnappingType
+        VertexAndSegment = ... # type: QgsSnappingConfig.SnappingType
+        Segment = ... # type: QgsSnappingConfig.SnappingType
+
+    class IndividualLayerSettings(PyQt5.sip.wrapper):
+
+        @typing.overload
+        @deprecated("""""")
+        def __init__(self, enabled: bool, type: 'QgsSnappingConfig.SnappingType', tolerance: float, units: Qgis.MapToolUnit) -> None: ...
+        @typing.overload
+        def __init__(self, enabled: bool, type: typing.Union[Qgis.SnappingTypes, Qgis.SnappingType], tolerance: float, units: Qgis.MapToolUnit, minScale: float = ..., maxScale: float = ...) -> None: ...
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsSnappingConfig.IndividualLayerSettings') -> None: ...
+
+        def __eq__(self, other: object): ...
+        def __ne__(self, other: object): ...
+        def setMaximumScale(self, maxScale: float) -> None: ...
+        def maximumScale(self) -> float: ...
+        def setMinimumScale(self, minScale: float) -> None: ...
+        def minimumScale(self) -> float: ...
+        def setUnits(self, units: Qgis.MapToolUnit) -> None: ...
+        def units(self) -> Qgis.MapToolUnit: ...
+        def setTolerance(self, tolerance: float) -> None: ...
+        def tolerance(self) -> float: ...
+        def setTypeFlag(self, type: typing.Union[Qgis.SnappingTypes, Qgis.SnappingType]) -> None: ...
+        @deprecated("""""")
+        def setType(self, type: 'QgsSnappingConfig.SnappingType') -> None: ...
+        @deprecated("""""")
+        def type(self) -> 'QgsSnappingConfig.SnappingType': ...
+        def typeFlag(self) -> Qgis.SnappingTypes: ...
+        def setEnabled(self, enabled: bool) -> None: ...
+        def enabled(self) -> bool: ...
+        def valid(self) -> bool: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSnappingConfig') -> None: ...
+
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def removeLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> bool: ...
+    def addLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> bool: ...
+    def writeProject(self, doc: QtXml.QDomDocument) -> None: ...
+    def readProject(self, doc: QtXml.QDomDocument) -> None: ...
+    def __ne__(self, other: object): ...
+    def clearIndividualLayerSettings(self) -> None: ...
+    def setIndividualLayerSettings(self, vl: typing.Optional[QgsVectorLayer], individualLayerSettings: 'QgsSnappingConfig.IndividualLayerSettings') -> None: ...
+    @typing.overload
+    def individualLayerSettings(self) -> dict: ...
+    @typing.overload
+    def individualLayerSettings(self, vl: typing.Optional[QgsVectorLayer]) -> 'QgsSnappingConfig.IndividualLayerSettings': ...
+    def setSelfSnapping(self, enabled: bool) -> None: ...
+    def selfSnapping(self) -> bool: ...
+    def setIntersectionSnapping(self, enabled: bool) -> None: ...
+    def intersectionSnapping(self) -> bool: ...
+    def setUnits(self, units: Qgis.MapToolUnit) -> None: ...
+    def units(self) -> Qgis.MapToolUnit: ...
+    def scaleDependencyMode(self) -> 'QgsSnappingConfig.ScaleDependencyMode': ...
+    def setScaleDependencyMode(self, mode: 'QgsSnappingConfig.ScaleDependencyMode') -> None: ...
+    def setMaximumScale(self, maxScale: float) -> None: ...
+    def maximumScale(self) -> float: ...
+    def setMinimumScale(self, minScale: float) -> None: ...
+    def minimumScale(self) -> float: ...
+    def setTolerance(self, tolerance: float) -> None: ...
+    def tolerance(self) -> float: ...
+    def setTypeFlag(self, type: typing.Union[Qgis.SnappingTypes, Qgis.SnappingType]) -> None: ...
+    def setType(self, type: 'QgsSnappingConfig.SnappingType') -> None: ...
+    @deprecated("""""")
+    def type(self) -> 'QgsSnappingConfig.SnappingType': ...
+    def typeFlag(self) -> Qgis.SnappingTypes: ...
+    def setMode(self, mode: Qgis.SnappingMode) -> None: ...
+    def mode(self) -> Qgis.SnappingMode: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def reset(self) -> None: ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    @deprecated("""""")
+    def snappingTypeFlagToIcon(type: Qgis.SnappingType) -> QtGui.QIcon: ...
+    @staticmethod
+    def snappingTypeToIcon(type: Qgis.SnappingType) -> QtGui.QIcon: ...
+    @staticmethod
+    @deprecated("""""")
+    def snappingTypeFlagToString(type: Qgis.SnappingType) -> str: ...
+    @staticmethod
+    def snappingTypeToString(type: Qgis.SnappingType) -> str: ...
+    SnappingMode: typing.Type[Qgis.SnappingMode]
+    ActiveLayer: Qgis.SnappingMode
+    AllLayers: Qgis.SnappingMode
+    AdvancedConfiguration: Qgis.SnappingMode
+    SnappingTypes: typing.Type[Qgis.SnappingType]
+    NoSnapFlag: Qgis.SnappingType
+    VertexFlag: Qgis.SnappingType
+    SegmentFlag: Qgis.SnappingType
+    AreaFlag: Qgis.SnappingType
+    CentroidFlag: Qgis.SnappingType
+    MiddleOfSegmentFlag: Qgis.SnappingType
+    LineEndpointFlag: Qgis.SnappingType
+    SnappingTypeFlag: typing.Type[Qgis.SnappingTypes]
+
+
+class QgsTaskManager(QtCore.QObject):
+
+    class TaskDefinition(PyQt5.sip.wrapper):
+
+        dependentTasks = ... # type: collections.abc.Iterable[QgsTask]
+        task = ... # type: QgsTask
+
+        @typing.overload
+        def __init__(self, task: typing.Optional[QgsTask], dependentTasks: collections.abc.Iterable[QgsTask] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTaskManager.TaskDefinition') -> None: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    taskTriggered: typing.ClassVar[QtCore.pyqtSignal]
+    countActiveTasksChanged: typing.ClassVar[QtCore.pyqtSignal]
+    allTasksFinished: typing.ClassVar[QtCore.pyqtSignal]
+    taskAboutToBeDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    taskAdded: typing.ClassVar[QtCore.pyqtSignal]
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    finalTaskProgressChanged: typing.ClassVar[QtCore.pyqtSignal]
+    progressChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def triggerTask(self, task: typing.Optional[QgsTask]) -> None: ...
+    def countActiveTasks(self, includeHidden: bool = ...) -> int: ...
+    def activeTasks(self) -> list[QgsTask]: ...
+    def tasksDependentOnLayer(self, layer: typing.Optional[QgsMapLayer]) -> list[QgsTask]: ...
+    def dependentLayers(self, taskId: int) -> list[QgsMapLayer]: ...
+    def dependenciesSatisfied(self, taskId: int) -> bool: ...
+    def cancelAll(self) -> None: ...
+    def taskId(self, task: typing.Optional[QgsTask]) -> int: ...
+    def count(self) -> int: ...
+    def tasks(self) -> list[QgsTask]: ...
+    def task(self, id: int) -> typing.Optional[QgsTask]: ...
+    def addTask(self, task: typing.Optional[typing.Union[QgsTask, QgsTaskManager.TaskDefinition]], priority: int = ...) -> int: ...
+    def threadPool(self) -> typing.Optional[QtCore.QThreadPool]: ...
+
+
+class QgsTransactionGroup(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    commitError: typing.ClassVar[QtCore.pyqtSignal]
+    def isEmpty(self) -> bool: ...
+    def providerKey(self) -> str: ...
+    def connString(self) -> str: ...
+    def modified(self) -> bool: ...
+    def layers(self) -> set[QgsVectorLayer]: ...
+    def addLayer(self, layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+
+
+class QgsTranslationContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTranslationContext') -> None: ...
+
+    def writeTsFile(self, locale: typing.Optional[str]) -> None: ...
+    def registerTranslation(self, context: typing.Optional[str], source: typing.Optional[str]) -> None: ...
+    def setFileName(self, fileName: typing.Optional[str]) -> None: ...
+    def fileName(self) -> str: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def project(self) -> typing.Optional['QgsProject']: ...
+
+
+class QgsProjectTranslator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectTranslator') -> None: ...
+
+    def translate(self, context: typing.Optional[str], sourceText: typing.Optional[str], disambiguation: typing.Optional[str] = ..., n: int = ...) -> str: ...
+
+
+class QgsProject(QtCore.QObject, QgsExpressionContextGenerator, QgsExpressionContextScopeGenerator, QgsProjectTranslator):
+
+    class DataDefinedServerProperty(int):
+        NoProperty = ... # type: QgsProject.DataDefinedServerProperty
+        AllProperties = ... # type: QgsProject.DataDefinedServerProperty
+        WMSOnlineResource = ... # type: QgsProject.DataDefinedServerProperty
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., capabilities: typing.Union[Qgis.ProjectCapabilities, Qgis.ProjectCapability] = ...) -> None: ...
+
+    def rollBack(self, stopEditing: bool = ..., vectorLayer: typing.Optional[QgsVectorLayer] = ...) -> typing.Tuple[bool, list[str]]: ...
+    def commitChanges(self, stopEditing: bool = ..., vectorLayer: typing.Optional[QgsVectorLayer] = ...) -> typing.Tuple[bool, list[str]]: ...
+    def startEditing(self, vectorLayer: typing.Optional[QgsVectorLayer] = ...) -> bool: ...
+    def dataDefinedServerProperties(self) -> QgsPropertyCollection: ...
+    def setDataDefinedServerProperties(self, properties: QgsPropertyCollection) -> None: ...
+    def registerTranslatableObjects(self, translationContext: typing.Optional[QgsTranslationContext]) -> None: ...
+    def registerTranslatableContainers(self, translationContext: typing.Optional[QgsTranslationContext], parent: typing.Optional[QgsAttributeEditorContainer], layerId: typing.Optional[str]) -> None: ...
+    def setPresetHomePath(self, path: typing.Optional[str]) -> None: ...
+    def setDirty(self, b: bool = ...) -> None: ...
+    def setSnappingConfig(self, snappingConfig: QgsSnappingConfig) -> None: ...
+    elevationShadingRendererChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapScalesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    dirtySet: typing.ClassVar[QtCore.pyqtSignal]
+    isDirtyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    legendLayersAdded: typing.ClassVar[QtCore.pyqtSignal]
+    layerWasAdded: typing.ClassVar[QtCore.pyqtSignal]
+    layersAdded: typing.ClassVar[QtCore.pyqtSignal]
+    removeAll: typing.ClassVar[QtCore.pyqtSignal]
+    layerRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layersRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layerWillBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layersWillBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    selectionColorChanged: typing.ClassVar[QtCore.pyqtSignal]
+    backgroundColorChanged: typing.ClassVar[QtCore.pyqtSignal]
+    projectColorsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    metadataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    labelingEngineSettingsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapThemeCollectionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    avoidIntersectionsLayersChanged: typing.ClassVar[QtCore.pyqtSignal]
+    topologicalEditingChanged: typing.ClassVar[QtCore.pyqtSignal]
+    transactionGroupsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    transactionModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    missingDatumTransforms: typing.ClassVar[QtCore.pyqtSignal]
+    transformContextChanged: typing.ClassVar[QtCore.pyqtSignal]
+    scaleMethodChanged: typing.ClassVar[QtCore.pyqtSignal]
+    areaUnitsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    distanceUnitsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    ellipsoidChanged: typing.ClassVar[QtCore.pyqtSignal]
+    verticalCrsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    crs3DChanged: typing.ClassVar[QtCore.pyqtSignal]
+    crsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    customVariablesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    avoidIntersectionsModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    snappingConfigChanged: typing.ClassVar[QtCore.pyqtSignal]
+    homePathChanged: typing.ClassVar[QtCore.pyqtSignal]
+    fileNameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    titleChanged: typing.ClassVar[QtCore.pyqtSignal]
+    nonIdentifiableLayersChanged: typing.ClassVar[QtCore.pyqtSignal]
+    loadingLayerMessageReceived: typing.ClassVar[QtCore.pyqtSignal]
+    loadingLayer: typing.ClassVar[QtCore.pyqtSignal]
+    layerLoaded: typing.ClassVar[QtCore.pyqtSignal]
+    readVersionMismatchOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    oldProjectVersionWarning: typing.ClassVar[QtCore.pyqtSignal]
+    projectSaved: typing.ClassVar[QtCore.pyqtSignal]
+    writeMapLayer: typing.ClassVar[QtCore.pyqtSignal]
+    readMapLayer: typing.ClassVar[QtCore.pyqtSignal]
+    writeProject: typing.ClassVar[QtCore.pyqtSignal]
+    readProjectWithContext: typing.ClassVar[QtCore.pyqtSignal]
+    readProject: typing.ClassVar[QtCore.pyqtSignal]
+    aboutToBeCleared: typing.ClassVar[QtCore.pyqtSignal]
+    cleared: typing.ClassVar[QtCore.pyqtSignal]
+    def __repr__(self) -> typing.Any: ...
+    def setElevationShadingRenderer(self, elevationShadingRenderer: QgsElevationShadingRenderer) -> None: ...
+    def elevationShadingRenderer(self) -> QgsElevationShadingRenderer: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def translate(self, context: typing.Optional[str], sourceText: typing.Optional[str], disambiguation: typing.Optional[str] = ..., n: int = ...) -> str: ...
+    def generateTsFile(self, locale: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def useProjectScales(self) -> bool: ...
+    @deprecated("""""")
+    def setUseProjectScales(self, enabled: bool) -> None: ...
+    @deprecated("""""")
+    def mapScales(self) -> list[float]: ...
+    @deprecated("""""")
+    def setMapScales(self, scales: collections.abc.Iterable[float]) -> None: ...
+    def selectionColor(self) -> QtGui.QColor: ...
+    def setSelectionColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def setBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setProjectColors(self, colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]]) -> None: ...
+    def setRequiredLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def requiredLayers(self) -> set[QgsMapLayer]: ...
+    def setMetadata(self, metadata: QgsProjectMetadata) -> None: ...
+    def metadata(self) -> QgsProjectMetadata: ...
+    def resolveAttachmentIdentifier(self, identifier: typing.Optional[str]) -> str: ...
+    def attachmentIdentifier(self, attachedFile: typing.Optional[str]) -> str: ...
+    def removeAttachedFile(self, path: typing.Optional[str]) -> bool: ...
+    def attachedFiles(self) -> list[str]: ...
+    def createAttachedFile(self, nameTemplate: typing.Optional[str]) -> str: ...
+    def auxiliaryStorage(self) -> typing.Optional[QgsAuxiliaryStorage]: ...
+    @deprecated("""""")
+    def trustLayerMetadata(self) -> bool: ...
+    @deprecated("""""")
+    def setTrustLayerMetadata(self, trust: bool) -> None: ...
+    def defaultCrsForNewLayers(self) -> QgsCoordinateReferenceSystem: ...
+    def reloadAllLayers(self) -> None: ...
+    def removeAllMapLayers(self) -> None: ...
+    def mainAnnotationLayer(self) -> typing.Optional[QgsAnnotationLayer]: ...
+    def takeMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsMapLayer]: ...
+    @typing.overload
+    def removeMapLayer(self, layerId: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def removeMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def removeMapLayers(self, layers: typing.Union[list[QgsVectorLayer], list[str]]) -> None: ...
+    def addMapLayer(self, mapLayer: typing.Optional[QgsMapLayer], addToLegend: bool = ...) -> typing.Optional[QgsMapLayer]: ...
+    def addMapLayers(self, mapLayers: collections.abc.Iterable[QgsMapLayer], addToLegend: bool = ...) -> list[QgsMapLayer]: ...
+    def isZipped(self) -> bool: ...
+    def mapLayers(self, validOnly: bool = ...) -> typing.Any: ...
+    def mapLayersByShortName(self, shortName: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    def mapLayersByName(self, layerName: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    def mapLayer(self, layerId: typing.Optional[str]) -> typing.Optional[QgsMapLayer]: ...
+    def validCount(self) -> int: ...
+    def count(self) -> int: ...
+    def layerStore(self) -> typing.Optional[QgsMapLayerStore]: ...
+    def labelingEngineSettings(self) -> QgsLabelingEngineSettings: ...
+    def setLabelingEngineSettings(self, settings: QgsLabelingEngineSettings) -> None: ...
+    def setCustomVariables(self, customVariables: dict[str, typing.Any]) -> None: ...
+    def customVariables(self) -> dict[str, typing.Any]: ...
+    def avoidIntersectionsMode(self) -> Qgis.AvoidIntersectionsMode: ...
+    def setAvoidIntersectionsMode(self, mode: Qgis.AvoidIntersectionsMode) -> None: ...
+    def setAvoidIntersectionsLayers(self, layers: collections.abc.Iterable[QgsVectorLayer]) -> None: ...
+    def avoidIntersectionsLayers(self) -> list[QgsVectorLayer]: ...
+    def snappingConfig(self) -> QgsSnappingConfig: ...
+    def createExpressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def createExpressionContext(self) -> QgsExpressionContext: ...
+    @deprecated("""""")
+    def setEvaluateDefaultValues(self, evaluateDefaultValues: bool) -> None: ...
+    @deprecated("""""")
+    def evaluateDefaultValues(self) -> bool: ...
+    def editBufferGroup(self) -> typing.Optional['QgsVectorLayerEditBufferGroup']: ...
+    def transactionGroup(self, providerKey: typing.Optional[str], connString: typing.Optional[str]) -> typing.Optional[QgsTransactionGroup]: ...
+    def setTransactionMode(self, transactionMode: Qgis.TransactionMode) -> bool: ...
+    def transactionMode(self) -> Qgis.TransactionMode: ...
+    @deprecated("""""")
+    def setAutoTransaction(self, autoTransaction: bool) -> None: ...
+    @deprecated("""""")
+    def autoTransaction(self) -> bool: ...
+    def nonIdentifiableLayers(self) -> list[str]: ...
+    @typing.overload
+    def setNonIdentifiableLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    @typing.overload
+    def setNonIdentifiableLayers(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def annotationManager(self) -> typing.Optional[QgsAnnotationManager]: ...
+    def mapThemeCollection(self) -> typing.Optional[QgsMapThemeCollection]: ...
+    def layerTreeRegistryBridge(self) -> typing.Optional[QgsLayerTreeRegistryBridge]: ...
+    def layerTreeRoot(self) -> typing.Optional[QgsLayerTree]: ...
+    def gpsSettings(self) -> typing.Optional['QgsProjectGpsSettings']: ...
+    def displaySettings(self) -> typing.Optional['QgsProjectDisplaySettings']: ...
+    def elevationProperties(self) -> typing.Optional['QgsProjectElevationProperties']: ...
+    def timeSettings(self) -> typing.Optional['QgsProjectTimeSettings']: ...
+    def styleSettings(self) -> typing.Optional['QgsProjectStyleSettings']: ...
+    def viewSettings(self) -> typing.Optional['QgsProjectViewSettings']: ...
+    def sensorManager(self) -> typing.Optional['QgsSensorManager']: ...
+    def bookmarkManager(self) -> typing.Optional[QgsBookmarkManager]: ...
+    def viewsManager(self) -> typing.Optional['QgsMapViewsManager']: ...
+    def layoutManager(self) -> typing.Optional[QgsLayoutManager]: ...
+    def relationManager(self) -> typing.Optional[QgsRelationManager]: ...
+    def presetHomePath(self) -> str: ...
+    def homePath(self) -> str: ...
+    def setScaleMethod(self, method: Qgis.ScaleCalculationMethod) -> None: ...
+    def scaleMethod(self) -> Qgis.ScaleCalculationMethod: ...
+    def setAreaUnits(self, unit: Qgis.AreaUnit) -> None: ...
+    def areaUnits(self) -> Qgis.AreaUnit: ...
+    def setDistanceUnits(self, unit: Qgis.DistanceUnit) -> None: ...
+    def distanceUnits(self) -> Qgis.DistanceUnit: ...
+    def topologicalEditing(self) -> bool: ...
+    def setTopologicalEditing(self, enabled: bool) -> None: ...
+    def createEmbeddedGroup(self, groupName: typing.Optional[str], projectFilePath: typing.Optional[str], invisibleLayers: collections.abc.Iterable[typing.Optional[str]], flags: typing.Union[Qgis.ProjectReadFlags, Qgis.ProjectReadFlag] = ...) -> typing.Optional[QgsLayerTreeGroup]: ...
+    def layerIsEmbedded(self, id: typing.Optional[str]) -> str: ...
+    def setBadLayerHandler(self, handler: typing.Optional['QgsProjectBadLayerHandler']) -> None: ...
+    def error(self) -> str: ...
+    def readPath(self, filename: typing.Optional[str]) -> str: ...
+    def writePath(self, filename: typing.Optional[str]) -> str: ...
+    def pathResolver(self) -> QgsPathResolver: ...
+    def dumpProperties(self) -> None: ...
+    def subkeyList(self, scope: typing.Optional[str], key: typing.Optional[str]) -> list[str]: ...
+    def entryList(self, scope: typing.Optional[str], key: typing.Optional[str]) -> list[str]: ...
+    def removeEntry(self, scope: typing.Optional[str], key: typing.Optional[str]) -> bool: ...
+    def readBoolEntry(self, scope: typing.Optional[str], key: typing.Optional[str], def_: bool = ...) -> typing.Tuple[bool, typing.Optional[bool]]: ...
+    def readDoubleEntry(self, scope: typing.Optional[str], key: typing.Optional[str], def_: float = ...) -> typing.Tuple[float, typing.Optional[bool]]: ...
+    def readNumEntry(self, scope: typing.Optional[str], key: typing.Optional[str], def_: int = ...) -> typing.Tuple[int, typing.Optional[bool]]: ...
+    def readEntry(self, scope: typing.Optional[str], key: typing.Optional[str], def_: typing.Optional[str] = ...) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    def readListEntry(self, scope: typing.Optional[str], key: typing.Optional[str], def_: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[list[str], typing.Optional[bool]]: ...
+    def writeEntry(self, scope: typing.Optional[str], key: typing.Optional[str], value: typing.Optional[typing.Union[int, str, collections.abc.Iterable[typing.Optional[str]]]]) -> bool: ...
+    def writeEntryDouble(self, scope: typing.Optional[str], key: typing.Optional[str], value: float) -> bool: ...
+    def writeEntryBool(self, scope: typing.Optional[str], key: typing.Optional[str], value: bool) -> bool: ...
+    @typing.overload
+    def write(self, filename: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def write(self) -> bool: ...
+    def readLayer(self, layerNode: QtXml.QDomNode) -> bool: ...
+    @typing.overload
+    def read(self, filename: typing.Optional[str], flags: typing.Union[Qgis.ProjectReadFlags, Qgis.ProjectReadFlag] = ...) -> bool: ...
+    @typing.overload
+    def read(self, flags: typing.Union[Qgis.ProjectReadFlags, Qgis.ProjectReadFlag] = ...) -> bool: ...
+    def clear(self) -> None: ...
+    def setTransformContext(self, context: QgsCoordinateTransformContext) -> None: ...
+    def transformContext(self) -> QgsCoordinateTransformContext: ...
+    def setVerticalCrs(self, crs: QgsCoordinateReferenceSystem) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def verticalCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def setEllipsoid(self, ellipsoid: typing.Optional[str]) -> None: ...
+    def ellipsoid(self) -> str: ...
+    def setCrs(self, crs: QgsCoordinateReferenceSystem, adjustEllipsoid: bool = ...) -> None: ...
+    def crs3D(self) -> QgsCoordinateReferenceSystem: ...
+    def crs(self) -> QgsCoordinateReferenceSystem: ...
+    def setFilePathStorage(self, type: Qgis.FilePathType) -> None: ...
+    def filePathStorage(self) -> Qgis.FilePathType: ...
+    def baseName(self) -> str: ...
+    def absolutePath(self) -> str: ...
+    def absoluteFilePath(self) -> str: ...
+    def lastModified(self) -> QtCore.QDateTime: ...
+    def projectStorage(self) -> typing.Optional['QgsProjectStorage']: ...
+    @deprecated("""""")
+    def fileInfo(self) -> QtCore.QFileInfo: ...
+    def originalPath(self) -> str: ...
+    def setOriginalPath(self, path: typing.Optional[str]) -> None: ...
+    def fileName(self) -> str: ...
+    def setFileName(self, name: typing.Optional[str]) -> None: ...
+    def isDirty(self) -> bool: ...
+    def lastSaveVersion(self) -> 'QgsProjectVersion': ...
+    def lastSaveDateTime(self) -> QtCore.QDateTime: ...
+    def saveUserFullName(self) -> str: ...
+    def saveUser(self) -> str: ...
+    def setFlag(self, flag: Qgis.ProjectFlag, enabled: bool = ...) -> None: ...
+    def setFlags(self, flags: typing.Union[Qgis.ProjectFlags, Qgis.ProjectFlag]) -> None: ...
+    def flags(self) -> Qgis.ProjectFlags: ...
+    def capabilities(self) -> Qgis.ProjectCapabilities: ...
+    def title(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def setInstance(project: typing.Optional['QgsProject']) -> None: ...
+    @staticmethod
+    def instance() -> typing.Optional['QgsProject']: ...
+    AvoidIntersectionsMode: typing.Type[Qgis.AvoidIntersectionsMode]
+    AllowIntersections: Qgis.AvoidIntersectionsMode
+    AvoidIntersectionsCurrentLayer: Qgis.AvoidIntersectionsMode
+    AvoidIntersectionsLayers: Qgis.AvoidIntersectionsMode
+    FileFormat: typing.Type[Qgis.ProjectFileFormat]
+    Qgz: Qgis.ProjectFileFormat
+    Qgs: Qgis.ProjectFileFormat
+    ReadFlag: typing.Type[Qgis.ProjectReadFlag]
+    FlagDontResolveLayers: Qgis.ProjectReadFlag
+    FlagDontLoadLayouts: Qgis.ProjectReadFlag
+    FlagTrustLayerMetadata: Qgis.ProjectReadFlag
+    FlagDontStoreOriginalStyles: Qgis.ProjectReadFlag
+    FlagDontLoad3DViews: Qgis.ProjectReadFlag
+    DontLoadProjectStyles: Qgis.ProjectReadFlag
+    ForceReadOnlyLayers: Qgis.ProjectReadFlag
+    DontUpgradeAnnotations: Qgis.ProjectReadFlag
+    ReadFlags: typing.Type[Qgis.ProjectReadFlags]
+    NoProperty: QgsProject.DataDefinedServerProperty
+    AllProperties: QgsProject.DataDefinedServerProperty
+    WMSOnlineResource: QgsProject.DataDefinedServerProperty
+    blockDirtying: typing.Type[ProjectDirtyBlocker]
+
+
+class QgsProjectDirtyBlocker(PyQt5.sip.wrapper):
+
+    def __init__(self, project: typing.Optional[QgsProject]) -> None: ...
+
+
+class QgsProjectBadLayerHandler(PyQt5.sip.wrapper):
+
+    class ProviderType(int):
+        IS_FILE = ... # type: QgsProjectBadLayerHandler.ProviderType
+        IS_DATABASE = ... # type: QgsProjectBadLayerHandler.ProviderType
+        IS_URL = ... # type: QgsProjectBadLayerHandler.ProviderType
+        IS_Unknown = ... # type: QgsProjectBadLayerHandler.ProviderType
+
+    class DataType(int):
+        IS_VECTOR = ... # type: QgsProjectBadLayerHandler.DataType
+        IS_RASTER = ... # type: QgsProjectBadLayerHandler.DataType
+        IS_BOGUS = ... # type: QgsProjectBadLayerHandler.DataType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectBadLayerHandler') -> None: ...
+
+    def setDataSource(self, layerNode: QtXml.QDomNode, dataSource: typing.Optional[str]) -> None: ...
+    def providerType(self, layerNode: QtXml.QDomNode) -> 'QgsProjectBadLayerHandler.ProviderType': ...
+    def dataSource(self, layerNode: QtXml.QDomNode) -> str: ...
+    def dataType(self, layerNode: QtXml.QDomNode) -> 'QgsProjectBadLayerHandler.DataType': ...
+    def handleBadLayers(self, layers: collections.abc.Iterable[QtXml.QDomNode]) -> None: ...
+
+
+class QgsProjectDisplaySettings(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    coordinateCrsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    coordinateCustomCrsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    coordinateAxisOrderChanged: typing.ClassVar[QtCore.pyqtSignal]
+    coordinateTypeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    geographicCoordinateFormatChanged: typing.ClassVar[QtCore.pyqtSignal]
+    bearingFormatChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def coordinateCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def setCoordinateCustomCrs(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+    def coordinateCustomCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def setCoordinateAxisOrder(self, order: Qgis.CoordinateOrder) -> None: ...
+    def coordinateAxisOrder(self) -> Qgis.CoordinateOrder: ...
+    def setCoordinateType(self, type: Qgis.CoordinateDisplayType) -> None: ...
+    def coordinateType(self) -> Qgis.CoordinateDisplayType: ...
+    def geographicCoordinateFormat(self) -> typing.Optional[QgsGeographicCoordinateNumericFormat]: ...
+    def setGeographicCoordinateFormat(self, format: typing.Optional[QgsGeographicCoordinateNumericFormat]) -> None: ...
+    def bearingFormat(self) -> typing.Optional[QgsBearingNumericFormat]: ...
+    def setBearingFormat(self, format: typing.Optional[QgsBearingNumericFormat]) -> None: ...
+    def reset(self) -> None: ...
+
+
+class QgsProjectElevationProperties(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    elevationRangeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def setInvertElevationFilter(self, invert: bool) -> None: ...
+    def setElevationFilterRangeSize(self, size: float) -> None: ...
+    def setElevationRange(self, range: QgsDoubleRange) -> None: ...
+    def invertElevationFilter(self) -> bool: ...
+    def elevationFilterRangeSize(self) -> float: ...
+    def elevationRange(self) -> QgsDoubleRange: ...
+    def setTerrainProvider(self, provider: typing.Optional[QgsAbstractTerrainProvider]) -> None: ...
+    def terrainProvider(self) -> typing.Optional[QgsAbstractTerrainProvider]: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def resolveReferences(self, project: typing.Optional[QgsProject]) -> None: ...
+    def reset(self) -> None: ...
+
+
+class QgsProjectFileTransform(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, domDocument: QtXml.QDomDocument, version: 'QgsProjectVersion') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectFileTransform') -> None: ...
+
+    @staticmethod
+    def fixOldSymbolLayerReferences(mapLayers: typing.Any) -> None: ...
+    def currentVersion(self) -> 'QgsProjectVersion': ...
+    def dom(self) -> QtXml.QDomDocument: ...
+    @staticmethod
+    def convertRasterProperties(doc: QtXml.QDomDocument, parentNode: QtXml.QDomNode, rasterPropertiesElem: QtXml.QDomElement, rlayer: typing.Optional['QgsRasterLayer']) -> None: ...
+    def dump(self) -> None: ...
+    def updateRevision(self, version: 'QgsProjectVersion') -> bool: ...
+
+
+class QgsProjectGpsSettings(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    destinationTimeStampFieldChanged: typing.ClassVar[QtCore.pyqtSignal]
+    destinationLayerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    destinationFollowsActiveLayerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    automaticallyCommitFeaturesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    automaticallyAddTrackVerticesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setDestinationTimeStampField(self, layer: typing.Optional[QgsVectorLayer], field: typing.Optional[str]) -> None: ...
+    def setDestinationLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setDestinationFollowsActiveLayer(self, follow: bool) -> None: ...
+    def setAutomaticallyCommitFeatures(self, enabled: bool) -> None: ...
+    def setAutomaticallyAddTrackVertices(self, enabled: bool) -> None: ...
+    def destinationTimeStampField(self) -> str: ...
+    def destinationTimeStampFields(self) -> dict[str, str]: ...
+    def destinationLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def destinationFollowsActiveLayer(self) -> bool: ...
+    def automaticallyCommitFeatures(self) -> bool: ...
+    def automaticallyAddTrackVertices(self) -> bool: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def reset(self) -> None: ...
+    def resolveReferences(self, project: typing.Optional[QgsProject]) -> None: ...
+
+
+class QgsProjectProperty(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectProperty') -> None: ...
+
+    def value(self) -> typing.Any: ...
+    def writeXml(self, nodeName: typing.Optional[str], element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, keyNode: QtXml.QDomNode) -> bool: ...
+    def isLeaf(self) -> bool: ...
+    def isValue(self) -> bool: ...
+    def isKey(self) -> bool: ...
+    def dump(self, tabs: int = ...) -> None: ...
+
+
+class QgsProjectPropertyValue(QgsProjectProperty):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, value: typing.Any) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectPropertyValue') -> None: ...
+
+    def writeXml(self, nodeName: typing.Optional[str], element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, keyNode: QtXml.QDomNode) -> bool: ...
+    def dump(self, tabs: int = ...) -> None: ...
+    def isLeaf(self) -> bool: ...
+    def value(self) -> typing.Any: ...
+    def isValue(self) -> bool: ...
+    def isKey(self) -> bool: ...
+
+
+class QgsProjectPropertyKey(QgsProjectProperty):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectPropertyKey') -> None: ...
+
+    def find(self, propertyName: typing.Optional[str]) -> typing.Optional[QgsProjectProperty]: ...
+    def clearKeys(self) -> None: ...
+    def clear(self) -> None: ...
+    def subkeyList(self, entries: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def entryList(self, entries: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def isLeaf(self) -> bool: ...
+    def isValue(self) -> bool: ...
+    def isKey(self) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def count(self) -> int: ...
+    def writeXml(self, nodeName: typing.Optional[str], element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, keyNode: QtXml.QDomNode) -> bool: ...
+    def dump(self, tabs: int = ...) -> None: ...
+    @typing.overload
+    def setValue(self, name: typing.Optional[str], value: typing.Any) -> typing.Optional[QgsProjectPropertyValue]: ...
+    @typing.overload
+    def setValue(self, value: typing.Any) -> typing.Optional[QgsProjectPropertyValue]: ...
+    def removeKey(self, keyName: typing.Optional[str]) -> None: ...
+    def addKey(self, keyName: typing.Optional[str]) -> typing.Optional['QgsProjectPropertyKey']: ...
+    def value(self) -> typing.Any: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+
+
+class QgsProjectServerValidator(PyQt5.sip.wrapper):
+
+    class ValidationError(int):
+        DuplicatedNames = ... # type: QgsProjectServerValidator.ValidationError
+        LayerShortName = ... # type: QgsProjectServerValidator.ValidationError
+        LayerEncoding = ... # type: QgsProjectServerValidator.ValidationError
+        ProjectShortName = ... # type: QgsProjectServerValidator.ValidationError
+        ProjectRootNameConflict = ... # type: QgsProjectServerValidator.ValidationError
+
+    class ValidationResult(PyQt5.sip.wrapper):
+
+        error = ... # type: 'QgsProjectServerValidator.ValidationError'
+        identifier = ... # type: typing.Any
+
+        @typing.overload
+        def __init__(self, error: 'QgsProjectServerValidator.ValidationError', identifier: typing.Any) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProjectServerValidator.ValidationResult') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectServerValidator') -> None: ...
+
+    @staticmethod
+    def validate(project: typing.Optional[QgsProject]) -> typing.Tuple[bool, list['QgsProjectServerValidator.ValidationResult']]: ...
+    @staticmethod
+    def displayValidationError(error: 'QgsProjectServerValidator.ValidationError') -> str: ...
+
+
+class QgsProjectStorage(PyQt5.sip.wrapper):
+
+    class Metadata(PyQt5.sip.wrapper):
+
+        lastModified = ... # type: typing.Union[QtCore.QDateTime, datetime.datetime]
+        name = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProjectStorage.Metadata') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectStorage') -> None: ...
+
+    @deprecated("""""")
+    def showSaveGui(self) -> str: ...
+    @deprecated("""""")
+    def showLoadGui(self) -> str: ...
+    @deprecated("""""")
+    def visibleName(self) -> str: ...
+    def filePath(self, uri: typing.Optional[str]) -> str: ...
+    def readProjectStorageMetadata(self, uri: typing.Optional[str]) -> typing.Tuple[bool, 'QgsProjectStorage.Metadata']: ...
+    def renameProject(self, uri: typing.Optional[str], uriNew: typing.Optional[str]) -> bool: ...
+    def removeProject(self, uri: typing.Optional[str]) -> bool: ...
+    def writeProject(self, uri: typing.Optional[str], device: typing.Optional[QtCore.QIODevice], context: QgsReadWriteContext) -> bool: ...
+    def readProject(self, uri: typing.Optional[str], device: typing.Optional[QtCore.QIODevice], context: QgsReadWriteContext) -> bool: ...
+    def listProjects(self, uri: typing.Optional[str]) -> list[str]: ...
+    def isSupportedUri(self, uri: typing.Optional[str]) -> bool: ...
+    def type(self) -> str: ...
+
+
+class QgsProjectStorageRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectStorageRegistry') -> None: ...
+
+    def unregisterProjectStorage(self, storage: typing.Optional[QgsProjectStorage]) -> None: ...
+    def registerProjectStorage(self, storage: typing.Optional[QgsProjectStorage]) -> None: ...
+    def projectStorages(self) -> list[QgsProjectStorage]: ...
+    def projectStorageFromUri(self, uri: typing.Optional[str]) -> typing.Optional[QgsProjectStorage]: ...
+    def projectStorageFromType(self, type: typing.Optional[str]) -> typing.Optional[QgsProjectStorage]: ...
+
+
+class QgsProjectStyleSettings(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional[QgsProject] = ...) -> None: ...
+
+    styleDatabasesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def combinedStyleModel(self) -> typing.Optional['QgsCombinedStyleModel']: ...
+    def setStyleDatabasePaths(self, paths: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def addStyleDatabasePath(self, path: typing.Optional[str]) -> None: ...
+    def styleAtPath(self, path: typing.Optional[str]) -> typing.Optional['QgsStyle']: ...
+    def styles(self) -> list['QgsStyle']: ...
+    def styleDatabasePaths(self) -> list[str]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext, flags: typing.Union[Qgis.ProjectReadFlags, Qgis.ProjectReadFlag] = ...) -> bool: ...
+    def colorSpace(self) -> QtGui.QColorSpace: ...
+    def setColorSpace(self, colorSpace: QtGui.QColorSpace) -> None: ...
+    def colorModel(self) -> Qgis.ColorModel: ...
+    def setColorModel(self, colorModel: Qgis.ColorModel) -> None: ...
+    def projectStyle(self) -> typing.Optional['QgsStyle']: ...
+    def setProjectStyle(self, style: typing.Optional['QgsStyle']) -> None: ...
+    def removeProjectStyle(self) -> None: ...
+    def reset(self) -> None: ...
+    def setDefaultSymbolOpacity(self, opacity: float) -> None: ...
+    def defaultSymbolOpacity(self) -> float: ...
+    def setRandomizeDefaultSymbolColor(self, randomized: bool) -> None: ...
+    def randomizeDefaultSymbolColor(self) -> bool: ...
+    def setDefaultTextFormat(self, textFormat: 'QgsTextFormat') -> None: ...
+    def defaultTextFormat(self) -> 'QgsTextFormat': ...
+    def setDefaultColorRamp(self, colorRamp: typing.Optional[QgsColorRamp]) -> None: ...
+    def defaultColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setDefaultSymbol(self, symbolType: Qgis.SymbolType, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def defaultSymbol(self, symbolType: Qgis.SymbolType) -> typing.Optional['QgsSymbol']: ...
+
+
+class QgsProjectStyleDatabaseModel(QtCore.QAbstractListModel):
+
+    class CustomRole(int):
+        Style = ... # type: QgsProjectStyleDatabaseModel.CustomRole
+        Path = ... # type: QgsProjectStyleDatabaseModel.CustomRole
+
+    def __init__(self, settings: typing.Optional[QgsProjectStyleSettings], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def showDefaultStyle(self) -> bool: ...
+    def setShowDefaultStyle(self, show: bool) -> None: ...
+    def indexFromStyle(self, style: typing.Optional['QgsStyle']) -> QtCore.QModelIndex: ...
+    def styleFromIndex(self, index: QtCore.QModelIndex) -> typing.Optional['QgsStyle']: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def rowCount(self, parent: QtCore.QModelIndex) -> int: ...
+    Role: typing.Type[QgsProjectStyleDatabaseModel.CustomRole]
+    StyleRole: QgsProjectStyleDatabaseModel.CustomRole
+    PathRole: QgsProjectStyleDatabaseModel.CustomRole
+
+
+class QgsProjectStyleDatabaseProxyModel(QtCore.QSortFilterProxyModel):
+
+    class Filter(int):
+        FilterHideReadOnly = ... # type: QgsProjectStyleDatabaseProxyModel.Filter
+
+    class Filters(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __xor__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __ior__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __or__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __iand__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __and__(self, f: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __invert__(self) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, model: typing.Optional[QgsProjectStyleDatabaseModel], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setFilters(self, filters: typing.Union['QgsProjectStyleDatabaseProxyModel.Filters', 'QgsProjectStyleDatabaseProxyModel.Filter']) -> None: ...
+    def filters(self) -> 'QgsProjectStyleDatabaseProxyModel.Filters': ...
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool: ...
+
+
+class QgsProjectTimeSettings(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    temporalRangeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setTotalMovieFrames(self, frames: int) -> None: ...
+    def totalMovieFrames(self) -> int: ...
+    def isTemporalRangeCumulative(self) -> bool: ...
+    def setIsTemporalRangeCumulative(self, state: bool) -> None: ...
+    def framesPerSecond(self) -> float: ...
+    def setFramesPerSecond(self, rate: float) -> None: ...
+    def setTimeStep(self, step: float) -> None: ...
+    def timeStep(self) -> float: ...
+    def setTimeStepUnit(self, unit: Qgis.TemporalUnit) -> None: ...
+    def timeStepUnit(self) -> Qgis.TemporalUnit: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def setTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def temporalRange(self) -> QgsDateTimeRange: ...
+    def reset(self) -> None: ...
+
+
+class QgsProjectUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectUtils') -> None: ...
+
+    @staticmethod
+    def layerIsContainedInGroupLayer(project: typing.Optional[QgsProject], layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    @staticmethod
+    def updateLayerPath(project: typing.Optional[QgsProject], oldPath: typing.Optional[str], newPath: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def layersMatchingPath(project: typing.Optional[QgsProject], path: typing.Optional[str]) -> list[QgsMapLayer]: ...
+
+
+class QgsProjectVersion(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, major: int, minor: int, sub: int, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, string: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProjectVersion') -> None: ...
+
+    def __le__(self, other: 'QgsProjectVersion') -> bool: ...
+    def __lt__(self, other: 'QgsProjectVersion') -> bool: ...
+    def __gt__(self, other: 'QgsProjectVersion') -> bool: ...
+    def __ge__(self, other: 'QgsProjectVersion') -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def isNull(self) -> bool: ...
+    def text(self) -> str: ...
+    def subVersion(self) -> int: ...
+    def minorVersion(self) -> int: ...
+    def majorVersion(self) -> int: ...
+
+
+class QgsProjectViewSettings(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional[QgsProject] = ...) -> None: ...
+
+    presetFullExtentChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapScalesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def setDefaultRotation(self, rotation: float) -> None: ...
+    def defaultRotation(self) -> float: ...
+    def useProjectScales(self) -> bool: ...
+    def setUseProjectScales(self, enabled: bool) -> None: ...
+    def mapScales(self) -> list[float]: ...
+    def setMapScales(self, scales: collections.abc.Iterable[float]) -> None: ...
+    def fullExtent(self) -> QgsReferencedRectangle: ...
+    def setPresetFullExtent(self, extent: QgsReferencedRectangle) -> None: ...
+    def presetFullExtent(self) -> QgsReferencedRectangle: ...
+    def setDefaultViewExtent(self, extent: QgsReferencedRectangle) -> None: ...
+    def defaultViewExtent(self) -> QgsReferencedRectangle: ...
+    def reset(self) -> None: ...
+
+
+class QgsMapViewsManager(QtCore.QObject):
+
+    def __init__(self, project: typing.Optional[QgsProject]) -> None: ...
+
+    views3DListChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def rename3DView(self, oldTitle: typing.Optional[str], newTitle: typing.Optional[str]) -> None: ...
+    def remove3DView(self, name: typing.Optional[str]) -> None: ...
+    def clear(self) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument) -> bool: ...
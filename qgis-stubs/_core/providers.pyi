@@ -0,0 +1,1236 @@
+# The PEP 484 type hints stub file for the _core.providers module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDataProviderElevationProperties,
+    QgsDataProviderTemporalCapabilities, QgsError, QgsErrorMessage,
+    QgsFeedback, QgsField, QgsFields,
+)
+from .browser import QgsDataItemProvider, QgsMimeDataUtils, QgsWeakRelation
+from .elevation import QgsTask
+from .geometry import QgsAbstractGeometry, QgsBox3D, QgsGeometry, QgsRectangle
+from .labeling import QgsAbstractVectorLayerLabeling
+from .mesh import QgsMesh
+from .metadata import (
+    QgsLayerMetadata, QgsLayerMetadataProviderResult, QgsMetadataSearchContext,
+)
+from .network import QgsHttpHeaders
+from .proj import QgsCoordinateReferenceSystem, QgsCoordinateTransformContext
+from .raster import QgsRasterDataProvider
+from .symbology import QgsFeatureRenderer, QgsSymbol
+from .vector import (
+    QgsDataSourceUri, QgsFeature, QgsFieldDomain, QgsMapLayer,
+    QgsReadWriteContext, QgsVectorDataProvider, QgsVectorLayer,
+)
+
+
+class QgsDatabaseSchemaModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        Empty = ... # type: QgsDatabaseSchemaModel.CustomRole
+
+    @typing.overload
+    def __init__(self, provider: typing.Optional[str], connection: typing.Optional[str], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, connection: typing.Optional['QgsAbstractDatabaseProviderConnection'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def refresh(self) -> None: ...
+    def allowEmptySchema(self) -> bool: ...
+    def setAllowEmptySchema(self, allowEmpty: bool) -> None: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    Role: typing.Type[QgsDatabaseSchemaModel.CustomRole]
+    RoleEmpty: QgsDatabaseSchemaModel.CustomRole
+
+
+class QgsDatabaseTableModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        TableName = ... # type: QgsDatabaseTableModel.CustomRole
+        Schema = ... # type: QgsDatabaseTableModel.CustomRole
+        TableFlags = ... # type: QgsDatabaseTableModel.CustomRole
+        Comment = ... # type: QgsDatabaseTableModel.CustomRole
+        CustomInfo = ... # type: QgsDatabaseTableModel.CustomRole
+        WkbType = ... # type: QgsDatabaseTableModel.CustomRole
+        Crs = ... # type: QgsDatabaseTableModel.CustomRole
+        Empty = ... # type: QgsDatabaseTableModel.CustomRole
+
+    @typing.overload
+    def __init__(self, provider: typing.Optional[str], connection: typing.Optional[str], schema: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, connection: typing.Optional['QgsAbstractDatabaseProviderConnection'], schema: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def refresh(self) -> None: ...
+    def allowEmptyTable(self) -> bool: ...
+    def setAllowEmptyTable(self, allowEmpty: bool) -> None: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    Role: typing.Type[QgsDatabaseTableModel.CustomRole]
+    RoleTableName: QgsDatabaseTableModel.CustomRole
+    RoleSchema: QgsDatabaseTableModel.CustomRole
+    RoleTableFlags: QgsDatabaseTableModel.CustomRole
+    RoleComment: QgsDatabaseTableModel.CustomRole
+    RoleCustomInfo: QgsDatabaseTableModel.CustomRole
+    RoleWkbType: QgsDatabaseTableModel.CustomRole
+    RoleCrs: QgsDatabaseTableModel.CustomRole
+    RoleEmpty: QgsDatabaseTableModel.CustomRole
+
+
+class QgsQueryResultModel(QtCore.QAbstractTableModel):
+
+    def __init__(self, queryResult: 'QgsAbstractDatabaseProviderConnection.QueryResult', parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    fetchingStarted: typing.ClassVar[QtCore.pyqtSignal]
+    fetchMoreRows: typing.ClassVar[QtCore.pyqtSignal]
+    fetchingComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    def rowsReady(self, rows: typing.Any) -> None: ...
+    def queryResult(self) -> 'QgsAbstractDatabaseProviderConnection.QueryResult': ...
+    def columns(self) -> list[str]: ...
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool: ...
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int) -> typing.Any: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex) -> int: ...
+
+
+class QgsTransaction(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    dirtied: typing.ClassVar[QtCore.pyqtSignal]
+    afterRollbackToSavepoint: typing.ClassVar[QtCore.pyqtSignal]
+    afterRollback: typing.ClassVar[QtCore.pyqtSignal]
+    def lastSavePointIsDirty(self) -> bool: ...
+    def savePoints(self) -> list[str]: ...
+    def dirtyLastSavePoint(self) -> None: ...
+    def rollbackToSavepoint(self, name: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    def createSavepoint(self) -> typing.Tuple[str, str]: ...
+    @typing.overload
+    def createSavepoint(self, savePointId: typing.Optional[str]) -> typing.Tuple[str, str]: ...
+    @staticmethod
+    def supportsTransaction(layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def executeSql(self, sql: typing.Optional[str], isDirty: bool = ..., name: typing.Optional[str] = ...) -> typing.Tuple[bool, str]: ...
+    def rollback(self) -> typing.Tuple[bool, str]: ...
+    def commit(self) -> typing.Tuple[bool, str]: ...
+    def begin(self, statementTimeout: int = ...) -> typing.Tuple[bool, str]: ...
+    def addLayer(self, layer: typing.Optional[QgsVectorLayer], addLayersInEditMode: bool = ...) -> bool: ...
+    def connectionString(self) -> str: ...
+    @typing.overload
+    @staticmethod
+    def create(connString: typing.Optional[str], providerKey: typing.Optional[str]) -> typing.Optional['QgsTransaction']: ...
+    @typing.overload
+    @staticmethod
+    def create(layers: collections.abc.Iterable[QgsVectorLayer]) -> typing.Optional['QgsTransaction']: ...
+
+
+class QgsDataProvider(QtCore.QObject):
+
+    class ProviderProperty(int):
+        EvaluateDefaultValues = ... # type: QgsDataProvider.ProviderProperty
+        CustomData = ... # type: QgsDataProvider.ProviderProperty
+
+    class ProviderOptions(PyQt5.sip.wrapper):
+
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsDataProvider.ProviderOptions') -> None: ...
+
+    def __init__(self, uri: typing.Optional[str] = ..., providerOptions: 'QgsDataProvider.ProviderOptions' = ..., flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+
+    def setError(self, error: QgsError) -> None: ...
+    def appendError(self, message: QgsErrorMessage) -> None: ...
+    notify: typing.ClassVar[QtCore.pyqtSignal]
+    dataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    fullExtentCalculated: typing.ClassVar[QtCore.pyqtSignal]
+    def styleStorageCapabilities(self) -> Qgis.ProviderStyleStorageCapabilities: ...
+    @staticmethod
+    def sublayerSeparator() -> str: ...
+    def writeLayerMetadata(self, metadata: 'QgsLayerMetadata') -> bool: ...
+    def layerMetadata(self) -> 'QgsLayerMetadata': ...
+    def setListening(self, isListening: bool) -> None: ...
+    def providerProperty(self, property: 'QgsDataProvider.ProviderProperty', defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setProviderProperty(self, property: 'QgsDataProvider.ProviderProperty', value: typing.Any) -> None: ...
+    def leaveUpdateMode(self) -> bool: ...
+    def enterUpdateMode(self) -> bool: ...
+    def invalidateConnections(self, connection: typing.Optional[str]) -> None: ...
+    def error(self) -> QgsError: ...
+    def dataTimestamp(self) -> QtCore.QDateTime: ...
+    def timestamp(self) -> QtCore.QDateTime: ...
+    def reloadData(self) -> None: ...
+    def fileRasterFilters(self) -> str: ...
+    def fileVectorFilters(self) -> str: ...
+    def description(self) -> str: ...
+    def name(self) -> str: ...
+    def setSubLayerVisibility(self, name: typing.Optional[str], vis: bool) -> None: ...
+    def setLayerOrder(self, layers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def subLayerCount(self) -> int: ...
+    def subLayerStyles(self) -> list[str]: ...
+    def subLayers(self) -> list[str]: ...
+    def subsetString(self) -> str: ...
+    def supportsSubsetString(self) -> bool: ...
+    def setSubsetString(self, subset: typing.Optional[str], updateFeatureCount: bool = ...) -> bool: ...
+    def subsetStringHelpUrl(self) -> str: ...
+    def subsetStringDialect(self) -> str: ...
+    def updateExtents(self) -> None: ...
+    def isValid(self) -> bool: ...
+    def extent3D(self) -> QgsBox3D: ...
+    def extent(self) -> QgsRectangle: ...
+    def elevationProperties(self) -> typing.Optional[QgsDataProviderElevationProperties]: ...
+    def temporalCapabilities(self) -> typing.Optional[QgsDataProviderTemporalCapabilities]: ...
+    def flags(self) -> Qgis.DataProviderFlags: ...
+    def uri(self) -> QgsDataSourceUri: ...
+    def setUri(self, uri: typing.Optional[typing.Union[QgsDataSourceUri, str]]) -> None: ...
+    def htmlMetadata(self) -> str: ...
+    def dataComment(self) -> str: ...
+    def dataSourceUri(self, expandAuthConfig: bool = ...) -> str: ...
+    def setDataSourceUri(self, uri: typing.Optional[str]) -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    ReadFlag: typing.Type[Qgis.DataProviderReadFlag]
+    FlagTrustDataSource: Qgis.DataProviderReadFlag
+    SkipFeatureCount: Qgis.DataProviderReadFlag
+    FlagLoadDefaultStyle: Qgis.DataProviderReadFlag
+    SkipGetExtent: Qgis.DataProviderReadFlag
+    SkipFullScan: Qgis.DataProviderReadFlag
+    ForceReadOnly: Qgis.DataProviderReadFlag
+    SkipCredentialsRequest: Qgis.DataProviderReadFlag
+    ParallelThreadLoading: Qgis.DataProviderReadFlag
+    ReadFlags: typing.Type[Qgis.DataProviderReadFlags]
+    DataCapability: typing.Type[Qgis.DataItemProviderCapability]
+    NoDataCapabilities: Qgis.DataItemProviderCapability
+    File: Qgis.DataItemProviderCapability
+    Dir: Qgis.DataItemProviderCapability
+    Database: Qgis.DataItemProviderCapability
+    Net: Qgis.DataItemProviderCapability
+    DataCapabilities: typing.Type[Qgis.DataItemProviderCapabilities]
+
+
+class QgsAbstractDbTableModel(QtGui.QStandardItemModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setSql(self, index: QtCore.QModelIndex, sql: typing.Optional[str]) -> None: ...
+    def searchableColumn(self, column: int) -> bool: ...
+    def defaultSearchColumn(self) -> int: ...
+    def columns(self) -> list[str]: ...
+
+
+class QgsAbstractProviderConnection(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], configuration: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractProviderConnection') -> None: ...
+
+    def setConfiguration(self, configuration: dict[str, typing.Any]) -> None: ...
+    def configuration(self) -> dict[str, typing.Any]: ...
+    def setUri(self, uri: typing.Optional[str]) -> None: ...
+    def uri(self) -> str: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def remove(self, name: typing.Optional[str]) -> None: ...
+    def store(self, name: typing.Optional[str]) -> None: ...
+
+
+class QgsAbstractDatabaseProviderConnection(QgsAbstractProviderConnection):
+
+    class GeometryColumnCapability(int):
+        Z = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        M = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        SinglePart = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        Curves = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        SinglePoint = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        SingleLineString = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        SinglePolygon = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+        PolyhedralSurfaces = ... # type: QgsAbstractDatabaseProviderConnection.GeometryColumnCapability
+
+    class Capability(int):
+        CreateVectorTable = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DropRasterTable = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DropVectorTable = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RenameVectorTable = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RenameRasterTable = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        CreateSchema = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DropSchema = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RenameSchema = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        ExecuteSql = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        Vacuum = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        Tables = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        Schemas = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        SqlLayers = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        TableExists = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        Spatial = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        CreateSpatialIndex = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        SpatialIndexExists = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DeleteSpatialIndex = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DeleteField = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DeleteFieldCascade = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        AddField = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        ListFieldDomains = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RetrieveFieldDomain = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        SetFieldDomain = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        AddFieldDomain = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RenameField = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        RetrieveRelationships = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        AddRelationship = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        UpdateRelationship = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        DeleteRelationship = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+        MoveTableToSchema = ... # type: QgsAbstractDatabaseProviderConnection.Capability
+
+    class TableFlag(int):
+        Aspatial = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        Vector = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        Raster = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        View = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        MaterializedView = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        Foreign = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+        IncludeSystemTables = ... # type: QgsAbstractDatabaseProviderConnection.TableFlag
+
+    class TableFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __xor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __ior__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __or__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __iand__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __and__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __invert__(self) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class QueryResult(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.QueryResult') -> None: ...
+
+        def setQueryExecutionTime(self, queryExecutionTime: float) -> None: ...
+        def queryExecutionTime(self) -> float: ...
+        def __next__(self) -> typing.Any: ...
+        def __iter__(self) -> 'QgsAbstractDatabaseProviderConnection.QueryResult': ...
+        def rowCount(self) -> int: ...
+        def fetchedRowCount(self) -> int: ...
+        def nextRow(self) -> list[typing.Any]: ...
+        def hasNextRow(self) -> bool: ...
+        def rows(self, feedback: typing.Optional[QgsFeedback] = ...) -> typing.Any: ...
+        def columns(self) -> list[str]: ...
+
+    class SqlVectorLayerOptions(PyQt5.sip.wrapper):
+
+        disableSelectAtId = ... # type: bool
+        filter = ... # type: typing.Optional[str]
+        geometryColumn = ... # type: typing.Optional[str]
+        layerName = ... # type: typing.Optional[str]
+        primaryKeyColumns = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        sql = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions') -> None: ...
+
+    class TableProperty(PyQt5.sip.wrapper):
+
+        class GeometryColumnType(PyQt5.sip.wrapper):
+
+            crs = ... # type: QgsCoordinateReferenceSystem
+            wkbType = ... # type: Qgis.WkbType
+
+            @typing.overload
+            def __init__(self) -> None: ...
+            @typing.overload
+            def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.TableProperty.GeometryColumnType') -> None: ...
+
+            def __ne__(self, other: object): ...
+            def __eq__(self, other: object): ...
+            def __repr__(self) -> typing.Any: ...
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.TableProperty') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def maxCoordinateDimensions(self) -> int: ...
+        def setFlag(self, flag: 'QgsAbstractDatabaseProviderConnection.TableFlag') -> None: ...
+        def setGeometryColumnCount(self, geometryColumnCount: int) -> None: ...
+        def geometryColumnCount(self) -> int: ...
+        def setInfo(self, info: dict[str, typing.Any]) -> None: ...
+        def info(self) -> dict[str, typing.Any]: ...
+        def setComment(self, comment: typing.Optional[str]) -> None: ...
+        def comment(self) -> str: ...
+        def setFlags(self, flags: typing.Union['QgsAbstractDatabaseProviderConnection.TableFlags', 'QgsAbstractDatabaseProviderConnection.TableFlag']) -> None: ...
+        def flags(self) -> 'QgsAbstractDatabaseProviderConnection.TableFlags': ...
+        def crsList(self) -> list[QgsCoordinateReferenceSystem]: ...
+        def setPrimaryKeyColumns(self, primaryKeyColumns: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+        def primaryKeyColumns(self) -> list[str]: ...
+        def setGeometryColumn(self, geometryColumn: typing.Optional[str]) -> None: ...
+        def geometryColumn(self) -> str: ...
+        def setSchema(self, schema: typing.Optional[str]) -> None: ...
+        def schema(self) -> str: ...
+        def at(self, index: int) -> 'QgsAbstractDatabaseProviderConnection.TableProperty': ...
+        def defaultName(self) -> str: ...
+        def setGeometryColumnTypes(self, geometryColumnTypes: collections.abc.Iterable['QgsAbstractDatabaseProviderConnection.TableProperty.GeometryColumnType']) -> None: ...
+        def geometryColumnTypes(self) -> list['QgsAbstractDatabaseProviderConnection.TableProperty.GeometryColumnType']: ...
+        def addGeometryColumnType(self, type: Qgis.WkbType, crs: QgsCoordinateReferenceSystem) -> None: ...
+        def setTableName(self, name: typing.Optional[str]) -> None: ...
+        def tableName(self) -> str: ...
+        def __repr__(self) -> typing.Any: ...
+
+    class SpatialIndexOptions(PyQt5.sip.wrapper):
+
+        geometryColumnName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.SpatialIndexOptions') -> None: ...
+
+    class Capabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __xor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __ior__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __or__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __iand__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __and__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.Capabilities', 'QgsAbstractDatabaseProviderConnection.Capability']) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __invert__(self) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class GeometryColumnCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __xor__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __ior__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __or__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __iand__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __and__(self, f: typing.Union['QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities', 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapability']) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __invert__(self) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class VectorLayerExporterOptions(PyQt5.sip.wrapper):
+
+        geometryColumn = ... # type: typing.Optional[str]
+        layerName = ... # type: typing.Optional[str]
+        primaryKeyColumns = ... # type: collections.abc.Iterable[typing.Optional[str]]
+        schema = ... # type: typing.Optional[str]
+        wkbType = ... # type: Qgis.WkbType
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection.VectorLayerExporterOptions') -> None: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], configuration: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractDatabaseProviderConnection') -> None: ...
+
+    def checkCapability(self, capability: typing.Union[QgsAbstractDatabaseProviderConnection.Capability, Qgis.DatabaseProviderConnectionCapability2]) -> None: ...
+    def searchLayerMetadata(self, searchContext: QgsMetadataSearchContext, searchString: typing.Optional[str] = ..., geographicExtent: QgsRectangle = ..., feedback: typing.Optional[QgsFeedback] = ...) -> list[QgsLayerMetadataProviderResult]: ...
+    def queryBuilder(self) -> typing.Optional['QgsProviderSqlQueryBuilder']: ...
+    def deleteRelationship(self, relationship: QgsWeakRelation) -> None: ...
+    def updateRelationship(self, relationship: QgsWeakRelation) -> None: ...
+    def addRelationship(self, relationship: QgsWeakRelation) -> None: ...
+    def relationships(self, schema: typing.Optional[str] = ..., tableName: typing.Optional[str] = ...) -> list[QgsWeakRelation]: ...
+    def relatedTableTypes(self) -> list[str]: ...
+    def supportedRelationshipCapabilities(self) -> Qgis.RelationshipCapabilities: ...
+    def supportedRelationshipStrengths(self) -> list[Qgis.RelationshipStrength]: ...
+    def supportedRelationshipCardinalities(self) -> list[Qgis.RelationshipCardinality]: ...
+    def moveTableToSchema(self, sourceSchema: typing.Optional[str], tableName: typing.Optional[str], targetSchema: typing.Optional[str]) -> None: ...
+    def setFieldComment(self, fieldName: typing.Optional[str], schema: typing.Optional[str], tableName: typing.Optional[str], comment: typing.Optional[str]) -> None: ...
+    def setTableComment(self, schema: typing.Optional[str], tableName: typing.Optional[str], comment: typing.Optional[str]) -> None: ...
+    def setFieldAlias(self, fieldName: typing.Optional[str], schema: typing.Optional[str], tableName: typing.Optional[str], alias: typing.Optional[str]) -> None: ...
+    def addFieldDomain(self, domain: 'QgsFieldDomain', schema: typing.Optional[str]) -> None: ...
+    def setFieldDomainName(self, fieldName: typing.Optional[str], schema: typing.Optional[str], tableName: typing.Optional[str], domainName: typing.Optional[str]) -> None: ...
+    def fieldDomain(self, name: typing.Optional[str]) -> typing.Optional['QgsFieldDomain']: ...
+    def supportedFieldDomainTypes(self) -> list[Qgis.FieldDomainType]: ...
+    def fieldDomainNames(self) -> list[str]: ...
+    def defaultGeometryColumnName(self) -> str: ...
+    def defaultPrimaryKeyColumnName(self) -> str: ...
+    def illegalFieldNames(self) -> set[str]: ...
+    def sqlDictionary(self) -> dict[Qgis.SqlKeywordCategory, list[list[str]]]: ...
+    def providerKey(self) -> str: ...
+    def nativeTypes(self) -> list['QgsVectorDataProvider.NativeType']: ...
+    def fields(self, schema: typing.Optional[str], table: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> QgsFields: ...
+    def schemas(self) -> list[str]: ...
+    def tables(self, schema: typing.Optional[str] = ..., flags: int = ...) -> list['QgsAbstractDatabaseProviderConnection.TableProperty']: ...
+    def table(self, schema: typing.Optional[str], table: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsAbstractDatabaseProviderConnection.TableProperty': ...
+    def deleteSpatialIndex(self, schema: typing.Optional[str], name: typing.Optional[str], geometryColumn: typing.Optional[str]) -> None: ...
+    def spatialIndexExists(self, schema: typing.Optional[str], name: typing.Optional[str], geometryColumn: typing.Optional[str]) -> bool: ...
+    def createSpatialIndex(self, schema: typing.Optional[str], name: typing.Optional[str], options: 'QgsAbstractDatabaseProviderConnection.SpatialIndexOptions' = ...) -> None: ...
+    def vacuum(self, schema: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    def execSql(self, sql: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> 'QgsAbstractDatabaseProviderConnection.QueryResult': ...
+    def sqlOptions(self, layerSource: typing.Optional[str]) -> 'QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions': ...
+    def validateSqlVectorLayer(self, options: 'QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions') -> typing.Tuple[bool, str]: ...
+    def createSqlVectorLayer(self, options: 'QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions') -> typing.Optional[QgsVectorLayer]: ...
+    def executeSql(self, sql: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> typing.Any: ...
+    def renameSchema(self, name: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def renameField(self, schema: typing.Optional[str], tableName: typing.Optional[str], name: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def addField(self, field: QgsField, schema: typing.Optional[str], tableName: typing.Optional[str]) -> None: ...
+    def deleteField(self, fieldName: typing.Optional[str], schema: typing.Optional[str], tableName: typing.Optional[str], force: bool = ...) -> None: ...
+    def dropSchema(self, name: typing.Optional[str], force: bool = ...) -> None: ...
+    def createSchema(self, name: typing.Optional[str]) -> None: ...
+    def renameRasterTable(self, schema: typing.Optional[str], name: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def renameVectorTable(self, schema: typing.Optional[str], name: typing.Optional[str], newName: typing.Optional[str]) -> None: ...
+    def dropRasterTable(self, schema: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    def dropVectorTable(self, schema: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    def tableExists(self, schema: typing.Optional[str], name: typing.Optional[str]) -> bool: ...
+    def createVectorLayerExporterDestinationUri(self, options: 'QgsAbstractDatabaseProviderConnection.VectorLayerExporterOptions') -> typing.Tuple[str, dict[str, typing.Any]]: ...
+    def createVectorTable(self, schema: typing.Optional[str], name: typing.Optional[str], fields: QgsFields, wkbType: Qgis.WkbType, srs: QgsCoordinateReferenceSystem, overwrite: bool, options: typing.Optional[dict[typing.Optional[str], typing.Any]]) -> None: ...
+    def tableUri(self, schema: typing.Optional[str], name: typing.Optional[str]) -> str: ...
+    def sqlLayerDefinitionCapabilities(self) -> Qgis.SqlLayerDefinitionCapabilities: ...
+    def tableImportCapabilities(self) -> Qgis.DatabaseProviderTableImportCapabilities: ...
+    def geometryColumnCapabilities(self) -> 'QgsAbstractDatabaseProviderConnection.GeometryColumnCapabilities': ...
+    def capabilities2(self) -> Qgis.DatabaseProviderConnectionCapabilities2: ...
+    def capabilities(self) -> 'QgsAbstractDatabaseProviderConnection.Capabilities': ...
+    Aspatial: QgsAbstractDatabaseProviderConnection.TableFlag
+    Vector: QgsAbstractDatabaseProviderConnection.TableFlag
+    Raster: QgsAbstractDatabaseProviderConnection.TableFlag
+    View: QgsAbstractDatabaseProviderConnection.TableFlag
+    MaterializedView: QgsAbstractDatabaseProviderConnection.TableFlag
+    Foreign: QgsAbstractDatabaseProviderConnection.TableFlag
+    IncludeSystemTables: QgsAbstractDatabaseProviderConnection.TableFlag
+
+
+class QgsMeshDriverMetadata(PyQt5.sip.wrapper):
+
+    class MeshDriverCapability(int):
+        CanWriteFaceDatasets = ... # type: QgsMeshDriverMetadata.MeshDriverCapability
+        CanWriteVertexDatasets = ... # type: QgsMeshDriverMetadata.MeshDriverCapability
+        CanWriteEdgeDatasets = ... # type: QgsMeshDriverMetadata.MeshDriverCapability
+        CanWriteMeshData = ... # type: QgsMeshDriverMetadata.MeshDriverCapability
+
+    class MeshDriverCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __xor__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __ior__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __or__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __iand__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __and__(self, f: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability']) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __invert__(self) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], capabilities: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability'], writeDatasetOnFileSuffix: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], capabilities: typing.Union['QgsMeshDriverMetadata.MeshDriverCapabilities', 'QgsMeshDriverMetadata.MeshDriverCapability'], writeDatasetOnFileSuffix: typing.Optional[str], writeMeshFrameOnFileSuffix: typing.Optional[str], maxVerticesPerface: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMeshDriverMetadata') -> None: ...
+
+    def maximumVerticesCountPerFace(self) -> int: ...
+    def writeMeshFrameOnFileSuffix(self) -> str: ...
+    def writeDatasetOnFileSuffix(self) -> str: ...
+    def description(self) -> str: ...
+    def name(self) -> str: ...
+    def capabilities(self) -> 'QgsMeshDriverMetadata.MeshDriverCapabilities': ...
+
+
+class QgsProviderMetadata(QtCore.QObject):
+
+    class ProviderCapability(int):
+        FileBasedUris = ... # type: QgsProviderMetadata.ProviderCapability
+        SaveLayerMetadata = ... # type: QgsProviderMetadata.ProviderCapability
+        ParallelCreateProvider = ... # type: QgsProviderMetadata.ProviderCapability
+
+    class ProviderMetadataCapability(int):
+        PriorityForUri = ... # type: QgsProviderMetadata.ProviderMetadataCapability
+        LayerTypesForUri = ... # type: QgsProviderMetadata.ProviderMetadataCapability
+        QuerySublayers = ... # type: QgsProviderMetadata.ProviderMetadataCapability
+        CreateDatabase = ... # type: QgsProviderMetadata.ProviderMetadataCapability
+
+    class ProviderMetadataCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __xor__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __ior__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __or__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __iand__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __and__(self, f: typing.Union['QgsProviderMetadata.ProviderMetadataCapabilities', 'QgsProviderMetadata.ProviderMetadataCapability']) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __invert__(self) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ProviderCapabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __xor__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __ior__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __or__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __iand__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __and__(self, f: typing.Union['QgsProviderMetadata.ProviderCapabilities', 'QgsProviderMetadata.ProviderCapability']) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __invert__(self) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, key: typing.Optional[str], description: typing.Optional[str], library: typing.Optional[str] = ...) -> None: ...
+
+    connectionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    connectionDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    connectionCreated: typing.ClassVar[QtCore.pyqtSignal]
+    def __repr__(self) -> typing.Any: ...
+    def saveConnection(self, connection: typing.Optional[QgsAbstractProviderConnection], name: typing.Optional[str]) -> None: ...
+    def deleteConnection(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def createConnection(self, uri: typing.Optional[str], configuration: dict[str, typing.Any]) -> typing.Optional[QgsAbstractProviderConnection]: ...
+    @typing.overload
+    def createConnection(self, name: typing.Optional[str]) -> typing.Optional[QgsAbstractProviderConnection]: ...
+    def findConnection(self, name: typing.Optional[str], cached: bool = ...) -> typing.Optional[QgsAbstractProviderConnection]: ...
+    def dbConnections(self, cached: bool = ...) -> typing.Any: ...
+    def connections(self, cached: bool = ...) -> typing.Any: ...
+    def createTransaction(self, connString: typing.Optional[str]) -> typing.Optional[QgsTransaction]: ...
+    def createDb(self, dbPath: typing.Optional[str], errCause: typing.Optional[str]) -> bool: ...
+    def saveLayerMetadata(self, uri: typing.Optional[str], metadata: QgsLayerMetadata) -> typing.Tuple[bool, str]: ...
+    def loadStoredStyle(self, uri: typing.Optional[str], styleName: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def loadStyle(self, uri: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def saveStyle(self, uri: typing.Optional[str], qmlStyle: typing.Optional[str], sldStyle: typing.Optional[str], styleName: typing.Optional[str], styleDescription: typing.Optional[str], uiFileContent: typing.Optional[str], useAsDefault: bool, errCause: typing.Optional[str]) -> bool: ...
+    def deleteStyleById(self, uri: typing.Optional[str], styleId: typing.Optional[str], errCause: typing.Optional[str]) -> bool: ...
+    def getStyleById(self, uri: typing.Optional[str], styleId: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def styleExists(self, uri: typing.Optional[str], styleId: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def listStyles(self, uri: typing.Optional[str], ids: collections.abc.Iterable[typing.Optional[str]], names: collections.abc.Iterable[typing.Optional[str]], descriptions: collections.abc.Iterable[typing.Optional[str]], errCause: typing.Optional[str]) -> int: ...
+    def dataItemProviders(self) -> list[QgsDataItemProvider]: ...
+    def cleanUri(self, uri: typing.Optional[str], flags: typing.Union[Qgis.UriCleaningFlags, Qgis.UriCleaningFlag] = ...) -> str: ...
+    def relativeToAbsoluteUri(self, uri: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def absoluteToRelativeUri(self, uri: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodeUri(self, parts: dict[str, typing.Any]) -> str: ...
+    def decodeUri(self, uri: typing.Optional[str]) -> dict[str, typing.Any]: ...
+    def pyramidResamplingMethods(self) -> list[tuple[str, str]]: ...
+    @typing.overload
+    def createMeshData(self, mesh: QgsMesh, fileName: typing.Optional[str], driverName: typing.Optional[str], crs: QgsCoordinateReferenceSystem, metadata: dict[typing.Optional[str], typing.Optional[str]] = ...) -> bool: ...
+    @typing.overload
+    def createMeshData(self, mesh: QgsMesh, uri: typing.Optional[str], crs: QgsCoordinateReferenceSystem, metadata: dict[typing.Optional[str], typing.Optional[str]] = ...) -> bool: ...
+    def createRasterDataProvider(self, uri: typing.Optional[str], format: typing.Optional[str], nBands: int, type: Qgis.DataType, width: int, height: int, crs: QgsCoordinateReferenceSystem, createOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional['QgsRasterDataProvider'], typing.Optional[float]]: ...
+    def createDatabase(self, uri: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    @staticmethod
+    def boolParameter(uri: dict[str, typing.Any], parameter: typing.Optional[str], defaultValue: bool = ...) -> bool: ...
+    @staticmethod
+    def setBoolParameter(uri: dict[str, typing.Any], parameter: typing.Optional[str], value: typing.Any) -> None: ...
+    def createProvider(self, uri: typing.Optional[str], options: QgsDataProvider.ProviderOptions, flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> typing.Optional[QgsDataProvider]: ...
+    def suggestGroupNameForUri(self, uri: typing.Optional[str]) -> str: ...
+    def querySublayers(self, uri: typing.Optional[str], flags: typing.Union[Qgis.SublayerQueryFlags, Qgis.SublayerQueryFlag] = ..., feedback: typing.Optional[QgsFeedback] = ...) -> list['QgsProviderSublayerDetails']: ...
+    def sidecarFilesForUri(self, uri: typing.Optional[str]) -> list[str]: ...
+    def uriIsBlocklisted(self, uri: typing.Optional[str]) -> bool: ...
+    def validLayerTypesForUri(self, uri: typing.Optional[str]) -> list[Qgis.LayerType]: ...
+    def priorityForUri(self, uri: typing.Optional[str]) -> int: ...
+    def meshDriversMetadata(self) -> list[QgsMeshDriverMetadata]: ...
+    def filters(self, type: Qgis.FileFilterType) -> str: ...
+    def cleanupProvider(self) -> None: ...
+    def initProvider(self) -> None: ...
+    @deprecated("""""")
+    def library(self) -> str: ...
+    def supportedLayerTypes(self) -> list[Qgis.LayerType]: ...
+    def providerCapabilities(self) -> 'QgsProviderMetadata.ProviderCapabilities': ...
+    def capabilities(self) -> 'QgsProviderMetadata.ProviderMetadataCapabilities': ...
+    def icon(self) -> QtGui.QIcon: ...
+    def description(self) -> str: ...
+    def key(self) -> str: ...
+    FilterType: typing.Type[Qgis.FileFilterType]
+    FilterVector: Qgis.FileFilterType
+    FilterRaster: Qgis.FileFilterType
+    FilterMesh: Qgis.FileFilterType
+    FilterMeshDataset: Qgis.FileFilterType
+    FilterPointCloud: Qgis.FileFilterType
+    VectorTile: Qgis.FileFilterType
+    TiledScene: Qgis.FileFilterType
+
+
+class QgsProviderRegistry(PyQt5.sip.wrapper):
+
+    class WidgetMode(int):
+        Standalone = ... # type: QgsProviderRegistry.WidgetMode
+        Embedded = ... # type: QgsProviderRegistry.WidgetMode
+        Manager = ... # type: QgsProviderRegistry.WidgetMode
+
+    class ProviderCandidateDetails(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, metadata: typing.Optional[QgsProviderMetadata], layerTypes: collections.abc.Iterable[Qgis.LayerType]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProviderRegistry.ProviderCandidateDetails') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def layerTypes(self) -> list[Qgis.LayerType]: ...
+        def metadata(self) -> typing.Optional[QgsProviderMetadata]: ...
+
+    class UnusableUriDetails(PyQt5.sip.wrapper):
+
+        detailedWarning = ... # type: typing.Optional[str]
+        layerTypes = ... # type: collections.abc.Iterable[Qgis.LayerType]
+        uri = ... # type: typing.Optional[str]
+        warning = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, uri: typing.Optional[str] = ..., warning: typing.Optional[str] = ..., layerTypes: collections.abc.Iterable[Qgis.LayerType] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProviderRegistry.UnusableUriDetails') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+
+    class UnusableUriHandlerInterface(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProviderRegistry.UnusableUriHandlerInterface') -> None: ...
+
+        def details(self, uri: typing.Optional[str]) -> 'QgsProviderRegistry.UnusableUriDetails': ...
+        def matchesUri(self, uri: typing.Optional[str]) -> bool: ...
+
+    def __init__(self, a0: 'QgsProviderRegistry') -> None: ...
+
+    def registerProvider(self, providerMetadata: typing.Optional[QgsProviderMetadata]) -> bool: ...
+    @deprecated("""""")
+    def registerGuis(self, widget: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def protocolDrivers(self) -> str: ...
+    def directoryDrivers(self) -> str: ...
+    def databaseDrivers(self) -> str: ...
+    def fileTiledSceneFilters(self) -> str: ...
+    def fileVectorTileFilters(self) -> str: ...
+    def filePointCloudFilters(self) -> str: ...
+    def fileMeshDatasetFilters(self) -> str: ...
+    def fileMeshFilters(self) -> str: ...
+    def fileRasterFilters(self) -> str: ...
+    def fileVectorFilters(self) -> str: ...
+    def querySublayers(self, uri: typing.Optional[str], flags: typing.Union[Qgis.SublayerQueryFlags, Qgis.SublayerQueryFlag] = ..., feedback: typing.Optional[QgsFeedback] = ...) -> list['QgsProviderSublayerDetails']: ...
+    def uriIsBlocklisted(self, uri: typing.Optional[str]) -> bool: ...
+    def shouldDeferUriForOtherProviders(self, uri: typing.Optional[str], providerKey: typing.Optional[str]) -> bool: ...
+    def handleUnusableUri(self, uri: typing.Optional[str]) -> typing.Tuple[bool, 'QgsProviderRegistry.UnusableUriDetails']: ...
+    def registerUnusableUriHandler(self, handler: typing.Optional['QgsProviderRegistry.UnusableUriHandlerInterface']) -> bool: ...
+    def preferredProvidersForUri(self, uri: typing.Optional[str]) -> list['QgsProviderRegistry.ProviderCandidateDetails']: ...
+    def providersForLayerType(self, type: Qgis.LayerType) -> set[str]: ...
+    def providerMetadata(self, providerKey: typing.Optional[str]) -> typing.Optional[QgsProviderMetadata]: ...
+    def providerList(self) -> list[str]: ...
+    @deprecated("""""")
+    def createProviderLibrary(self, providerKey: typing.Optional[str]) -> typing.Optional[QtCore.QLibrary]: ...
+    @deprecated("""""")
+    def function(self, providerKey: typing.Optional[str], functionName: typing.Optional[str]) -> typing.Optional[PyQt5.sip.voidptr]: ...
+    def createTransaction(self, providerKey: typing.Optional[str], connString: typing.Optional[str]) -> typing.Optional[QgsTransaction]: ...
+    def createDb(self, providerKey: typing.Optional[str], dbPath: typing.Optional[str], errCause: typing.Optional[str]) -> bool: ...
+    def saveLayerMetadata(self, providerKey: typing.Optional[str], uri: typing.Optional[str], metadata: QgsLayerMetadata) -> typing.Tuple[bool, str]: ...
+    def loadStoredStyle(self, providerKey: typing.Optional[str], uri: typing.Optional[str], styleName: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def loadStyle(self, providerKey: typing.Optional[str], uri: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def saveStyle(self, providerKey: typing.Optional[str], uri: typing.Optional[str], qmlStyle: typing.Optional[str], sldStyle: typing.Optional[str], styleName: typing.Optional[str], styleDescription: typing.Optional[str], uiFileContent: typing.Optional[str], useAsDefault: bool, errCause: typing.Optional[str]) -> bool: ...
+    def deleteStyleById(self, providerKey: typing.Optional[str], uri: typing.Optional[str], styleId: typing.Optional[str], errCause: typing.Optional[str]) -> bool: ...
+    def getStyleById(self, providerKey: typing.Optional[str], uri: typing.Optional[str], styleId: typing.Optional[str], errCause: typing.Optional[str]) -> str: ...
+    def styleExists(self, providerKey: typing.Optional[str], uri: typing.Optional[str], styleId: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def listStyles(self, providerKey: typing.Optional[str], uri: typing.Optional[str], ids: collections.abc.Iterable[typing.Optional[str]], names: collections.abc.Iterable[typing.Optional[str]], descriptions: collections.abc.Iterable[typing.Optional[str]], errCause: typing.Optional[str]) -> int: ...
+    def dataItemProviders(self, providerKey: typing.Optional[str]) -> list[QgsDataItemProvider]: ...
+    @deprecated("""""")
+    def createSelectionWidget(self, providerKey: typing.Optional[str], parent: typing.Optional[QtWidgets.QWidget] = ..., fl: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = ..., widgetMode: 'QgsProviderRegistry.WidgetMode' = ...) -> typing.Optional[QtWidgets.QWidget]: ...
+    def relativeToAbsoluteUri(self, providerKey: typing.Optional[str], uri: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def absoluteToRelativeUri(self, providerKey: typing.Optional[str], uri: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodeUri(self, providerKey: typing.Optional[str], parts: dict[str, typing.Any]) -> str: ...
+    def decodeUri(self, providerKey: typing.Optional[str], uri: typing.Optional[str]) -> dict[str, typing.Any]: ...
+    def pyramidResamplingMethods(self, providerKey: typing.Optional[str]) -> list[tuple[str, str]]: ...
+    def createRasterDataProvider(self, providerKey: typing.Optional[str], uri: typing.Optional[str], format: typing.Optional[str], nBands: int, type: Qgis.DataType, width: int, height: int, crs: QgsCoordinateReferenceSystem, createOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional['QgsRasterDataProvider'], typing.Optional[float]]: ...
+    @deprecated("""""")
+    def providerCapabilities(self, providerKey: typing.Optional[str]) -> Qgis.DataItemProviderCapabilities: ...
+    def createProvider(self, providerKey: typing.Optional[str], dataSource: typing.Optional[str], options: QgsDataProvider.ProviderOptions = ..., flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> typing.Optional[QgsDataProvider]: ...
+    def setLibraryDirectory(self, path: QtCore.QDir) -> None: ...
+    def libraryDirectory(self) -> QtCore.QDir: ...
+    def pluginList(self, asHtml: bool = ...) -> str: ...
+    @deprecated("""""")
+    def library(self, providerKey: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def instance(pluginPath: typing.Optional[str] = ...) -> typing.Optional['QgsProviderRegistry']: ...
+
+
+class QgsProviderSqlQueryBuilder(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProviderSqlQueryBuilder') -> None: ...
+
+    def quoteIdentifier(self, identifier: typing.Optional[str]) -> str: ...
+    def createLimitQueryForTable(self, schema: typing.Optional[str], name: typing.Optional[str], limit: int = ...) -> str: ...
+
+
+class QgsProviderSublayerDetails(PyQt5.sip.wrapper):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadAllStoredStyle = ... # type: bool
+        loadDefaultStyle = ... # type: bool
+        transformContext = ... # type: QgsCoordinateTransformContext
+
+        @typing.overload
+        def __init__(self, transformContext: QgsCoordinateTransformContext) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProviderSublayerDetails.LayerOptions') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProviderSublayerDetails') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def toMimeUri(self) -> QgsMimeDataUtils.Uri: ...
+    def skippedContainerScan(self) -> bool: ...
+    def setSkippedContainerScan(self, skipped: bool) -> None: ...
+    def setLayerNumber(self, number: int) -> None: ...
+    def layerNumber(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def setGeometryColumnName(self, name: typing.Optional[str]) -> None: ...
+    def geometryColumnName(self) -> str: ...
+    def setWkbType(self, type: Qgis.WkbType) -> None: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def setFeatureCount(self, count: int) -> None: ...
+    def featureCount(self) -> int: ...
+    def setPath(self, path: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def path(self) -> list[str]: ...
+    def setDriverName(self, driver: typing.Optional[str]) -> None: ...
+    def driverName(self) -> str: ...
+    def setFlags(self, newFlags: typing.Union[Qgis.SublayerFlags, Qgis.SublayerFlag]) -> None: ...
+    def flags(self) -> Qgis.SublayerFlags: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def toLayer(self, options: 'QgsProviderSublayerDetails.LayerOptions') -> typing.Optional[QgsMapLayer]: ...
+    def setUri(self, uri: typing.Optional[str]) -> None: ...
+    def uri(self) -> str: ...
+    def setType(self, type: Qgis.LayerType) -> None: ...
+    def type(self) -> Qgis.LayerType: ...
+    def setProviderKey(self, key: typing.Optional[str]) -> None: ...
+    def providerKey(self) -> str: ...
+
+
+class QgsProviderSublayerModel(QtCore.QAbstractItemModel):
+
+    class Column(int):
+        Name = ... # type: QgsProviderSublayerModel.Column
+        Description = ... # type: QgsProviderSublayerModel.Column
+
+    class Role(int):
+        ProviderKey = ... # type: QgsProviderSublayerModel.Role
+        LayerType = ... # type: QgsProviderSublayerModel.Role
+        Uri = ... # type: QgsProviderSublayerModel.Role
+        Name = ... # type: QgsProviderSublayerModel.Role
+        Description = ... # type: QgsProviderSublayerModel.Role
+        Path = ... # type: QgsProviderSublayerModel.Role
+        FeatureCount = ... # type: QgsProviderSublayerModel.Role
+        WkbType = ... # type: QgsProviderSublayerModel.Role
+        GeometryColumnName = ... # type: QgsProviderSublayerModel.Role
+        LayerNumber = ... # type: QgsProviderSublayerModel.Role
+        IsNonLayerItem = ... # type: QgsProviderSublayerModel.Role
+        NonLayerItemType = ... # type: QgsProviderSublayerModel.Role
+        Flags = ... # type: QgsProviderSublayerModel.Role
+
+    class NonLayerItem(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsProviderSublayerModel.NonLayerItem') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def setIcon(self, icon: QtGui.QIcon) -> None: ...
+        def icon(self) -> QtGui.QIcon: ...
+        def setUri(self, uri: typing.Optional[str]) -> None: ...
+        def uri(self) -> str: ...
+        def setDescription(self, description: typing.Optional[str]) -> None: ...
+        def description(self) -> str: ...
+        def setName(self, name: typing.Optional[str]) -> None: ...
+        def name(self) -> str: ...
+        def setType(self, type: typing.Optional[str]) -> None: ...
+        def type(self) -> str: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def rowCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def addNonLayerItem(self, item: 'QgsProviderSublayerModel.NonLayerItem') -> None: ...
+    def indexToNonLayerItem(self, index: QtCore.QModelIndex) -> 'QgsProviderSublayerModel.NonLayerItem': ...
+    def indexToSublayer(self, index: QtCore.QModelIndex) -> QgsProviderSublayerDetails: ...
+    def sublayerDetails(self) -> list[QgsProviderSublayerDetails]: ...
+    def setSublayerDetails(self, details: collections.abc.Iterable[QgsProviderSublayerDetails]) -> None: ...
+
+
+class QgsProviderSublayerProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, source_left: QtCore.QModelIndex, source_right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def setIncludeEmptyLayers(self, include: bool) -> None: ...
+    def includeEmptyLayers(self) -> bool: ...
+    def setIncludeSystemTables(self, include: bool) -> None: ...
+    def includeSystemTables(self) -> bool: ...
+    def setFilterString(self, filter: typing.Optional[str]) -> None: ...
+    def filterString(self) -> str: ...
+
+
+class QgsProviderSublayerTask(QgsTask):
+
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], includeSystemTables: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], providerKey: typing.Optional[str], includeSystemTables: bool = ...) -> None: ...
+
+    def run(self) -> bool: ...
+    def cancel(self) -> None: ...
+    def results(self) -> list[QgsProviderSublayerDetails]: ...
+
+
+class QgsProviderUtils(PyQt5.sip.wrapper):
+
+    class SublayerCompletenessFlag(int):
+        IgnoreUnknownFeatureCount = ... # type: QgsProviderUtils.SublayerCompletenessFlag
+        IgnoreUnknownGeometryType = ... # type: QgsProviderUtils.SublayerCompletenessFlag
+
+    class SublayerCompletenessFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __xor__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __ior__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __or__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __iand__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __and__(self, f: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag']) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __invert__(self) -> 'QgsProviderUtils.SublayerCompletenessFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProviderUtils') -> None: ...
+
+    @staticmethod
+    def suggestLayerNameFromFilePath(path: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def sublayerDetailsAreIncomplete(details: collections.abc.Iterable[QgsProviderSublayerDetails], flags: typing.Union['QgsProviderUtils.SublayerCompletenessFlags', 'QgsProviderUtils.SublayerCompletenessFlag'] = ...) -> bool: ...
+
+
+class QgsArcGisPortalUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsArcGisPortalUtils') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def retrieveGroupItemsOfType(contentUrl: typing.Optional[str], groupId: typing.Optional[str], authcfg: typing.Optional[str], itemTypes: collections.abc.Iterable[int], requestHeaders: QgsHttpHeaders = ..., feedback: typing.Optional[QgsFeedback] = ..., pageSize: int = ..., urlPrefix: typing.Optional[str] = ..., forceRefresh: bool = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def retrieveGroupItemsOfType(contentUrl: typing.Optional[str], groupId: typing.Optional[str], authcfg: typing.Optional[str], itemTypes: collections.abc.Iterable[int], requestHeaders: dict[typing.Optional[str], typing.Any], feedback: typing.Optional[QgsFeedback] = ..., pageSize: int = ..., urlPrefix: typing.Optional[str] = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    def retrieveGroupContent(contentUrl: typing.Optional[str], groupId: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: QgsHttpHeaders = ..., feedback: typing.Optional[QgsFeedback] = ..., pageSize: int = ..., urlPrefix: typing.Optional[str] = ..., forceRefresh: bool = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def retrieveGroupContent(contentUrl: typing.Optional[str], groupId: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: dict[typing.Optional[str], typing.Any], feedback: typing.Optional[QgsFeedback] = ..., pageSize: int = ..., urlPrefix: typing.Optional[str] = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    def retrieveUserGroups(communityUrl: typing.Optional[str], user: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: QgsHttpHeaders = ..., feedback: typing.Optional[QgsFeedback] = ..., urlPrefix: typing.Optional[str] = ..., forceRefresh: bool = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def retrieveUserGroups(communityUrl: typing.Optional[str], user: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: dict[typing.Optional[str], typing.Any], feedback: typing.Optional[QgsFeedback] = ..., urlPrefix: typing.Optional[str] = ...) -> typing.Tuple[list[typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    def retrieveUserInfo(communityUrl: typing.Optional[str], user: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: QgsHttpHeaders = ..., feedback: typing.Optional[QgsFeedback] = ..., urlPrefix: typing.Optional[str] = ..., forceRefresh: bool = ...) -> typing.Tuple[dict[str, typing.Any], str, str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def retrieveUserInfo(communityUrl: typing.Optional[str], user: typing.Optional[str], authcfg: typing.Optional[str], requestHeaders: dict[typing.Optional[str], typing.Any], feedback: typing.Optional[QgsFeedback] = ..., urlPrefix: typing.Optional[str] = ...) -> typing.Tuple[dict[str, typing.Any], str, str]: ...
+    ItemType: typing.Type[Qgis.ArcGisRestServiceType]
+    FeatureService: Qgis.ArcGisRestServiceType
+    MapService: Qgis.ArcGisRestServiceType
+    ImageService: Qgis.ArcGisRestServiceType
+    GlobeServer: Qgis.ArcGisRestServiceType
+    GPServer: Qgis.ArcGisRestServiceType
+    GeocodeServer: Qgis.ArcGisRestServiceType
+    Unknown: Qgis.ArcGisRestServiceType
+
+
+class QgsArcGisRestContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsArcGisRestContext') -> None: ...
+
+    def objectIdFieldName(self) -> str: ...
+    def setObjectIdFieldName(self, name: typing.Optional[str]) -> None: ...
+    def timeZone(self) -> QtCore.QTimeZone: ...
+    def setTimeZone(self, zone: QtCore.QTimeZone) -> None: ...
+
+
+class QgsArcGisRestUtils(PyQt5.sip.wrapper):
+
+    class FeatureToJsonFlag(int):
+        IncludeGeometry = ... # type: QgsArcGisRestUtils.FeatureToJsonFlag
+        IncludeNonObjectIdAttributes = ... # type: QgsArcGisRestUtils.FeatureToJsonFlag
+        SkipUnsetAttributes = ... # type: QgsArcGisRestUtils.FeatureToJsonFlag
+
+    class FeatureToJsonFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __xor__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __ior__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __or__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __iand__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __and__(self, f: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag']) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __invert__(self) -> 'QgsArcGisRestUtils.FeatureToJsonFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsArcGisRestUtils') -> None: ...
+
+    @staticmethod
+    def serviceTypeFromString(type: typing.Optional[str]) -> Qgis.ArcGisRestServiceType: ...
+    @staticmethod
+    def fieldDefinitionToJson(field: QgsField) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def variantToAttributeValue(variant: typing.Any, expectedType: QtCore.QMetaType.Type, context: QgsArcGisRestContext) -> typing.Any: ...
+    @staticmethod
+    def featureToJson(feature: QgsFeature, context: QgsArcGisRestContext, crs: QgsCoordinateReferenceSystem = ..., flags: typing.Union['QgsArcGisRestUtils.FeatureToJsonFlags', 'QgsArcGisRestUtils.FeatureToJsonFlag'] = ...) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def convertRectangle(value: typing.Any) -> QgsRectangle: ...
+    @staticmethod
+    def crsToJson(crs: QgsCoordinateReferenceSystem) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def geometryToJson(geometry: QgsGeometry, context: QgsArcGisRestContext, crs: QgsCoordinateReferenceSystem = ...) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def convertDateTime(value: typing.Any) -> QtCore.QDateTime: ...
+    @staticmethod
+    def convertFillStyle(style: typing.Optional[str]) -> QtCore.Qt.BrushStyle: ...
+    @staticmethod
+    def convertLineStyle(style: typing.Optional[str]) -> QtCore.Qt.PenStyle: ...
+    @staticmethod
+    def convertColor(data: typing.Any) -> QtGui.QColor: ...
+    @staticmethod
+    def convertLabelingExpression(string: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def convertLabeling(data: collections.abc.Iterable[typing.Any]) -> typing.Optional[QgsAbstractVectorLayerLabeling]: ...
+    @staticmethod
+    def convertRenderer(rendererData: dict[str, typing.Any]) -> typing.Optional['QgsFeatureRenderer']: ...
+    @staticmethod
+    def convertSymbol(definition: dict[str, typing.Any]) -> typing.Optional['QgsSymbol']: ...
+    @staticmethod
+    def convertSpatialReference(spatialReferenceMap: dict[str, typing.Any]) -> QgsCoordinateReferenceSystem: ...
+    @staticmethod
+    def convertGeometry(geometry: dict[str, typing.Any], esriGeometryType: typing.Optional[str], hasM: bool, hasZ: bool, allowCurves: bool = ...) -> typing.Tuple[typing.Optional[QgsAbstractGeometry], typing.Optional[QgsCoordinateReferenceSystem]]: ...
+    @staticmethod
+    def convertGeometryType(type: typing.Optional[str]) -> Qgis.WkbType: ...
+    @staticmethod
+    def convertFieldType(type: typing.Optional[str]) -> QtCore.QMetaType.Type: ...
+
+
+class QgsMemoryProviderUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMemoryProviderUtils') -> None: ...
+
+    @staticmethod
+    def createMemoryLayer(name: typing.Optional[str], fields: QgsFields, geometryType: Qgis.WkbType = ..., crs: QgsCoordinateReferenceSystem = ..., loadDefaultStyle: bool = ...) -> typing.Optional[QgsVectorLayer]: ...
+
+
+class QgsSensorThingsUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSensorThingsUtils') -> None: ...
+
+    @staticmethod
+    def asQueryString(baseType: Qgis.SensorThingsEntity, expansions: collections.abc.Iterable['QgsSensorThingsExpansionDefinition']) -> str: ...
+    @staticmethod
+    def relationshipCardinality(baseType: Qgis.SensorThingsEntity, relatedType: Qgis.SensorThingsEntity) -> typing.Tuple[Qgis.RelationshipCardinality, bool]: ...
+    @staticmethod
+    def expandableTargets(type: Qgis.SensorThingsEntity) -> list[Qgis.SensorThingsEntity]: ...
+    @staticmethod
+    def availableGeometryTypes(uri: typing.Optional[str], type: Qgis.SensorThingsEntity, feedback: typing.Optional[QgsFeedback] = ..., authCfg: typing.Optional[str] = ...) -> list[Qgis.GeometryType]: ...
+    @staticmethod
+    def combineFilters(filters: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    @staticmethod
+    def filterForExtent(geometryField: typing.Optional[str], extent: QgsRectangle) -> str: ...
+    @staticmethod
+    def filterForWkbType(entityType: Qgis.SensorThingsEntity, wkbType: Qgis.WkbType) -> str: ...
+    @staticmethod
+    def geometryTypeForEntity(type: Qgis.SensorThingsEntity) -> Qgis.GeometryType: ...
+    @staticmethod
+    def entityTypeHasGeometry(type: Qgis.SensorThingsEntity) -> bool: ...
+    @staticmethod
+    def geometryFieldForEntityType(type: Qgis.SensorThingsEntity) -> str: ...
+    @staticmethod
+    def fieldsForExpandedEntityType(baseType: Qgis.SensorThingsEntity, expandedTypes: collections.abc.Iterable[Qgis.SensorThingsEntity]) -> QgsFields: ...
+    @staticmethod
+    def fieldsForEntityType(type: Qgis.SensorThingsEntity, includeRangeFieldProxies: bool = ...) -> QgsFields: ...
+    @staticmethod
+    def propertiesForEntityType(type: Qgis.SensorThingsEntity) -> list[str]: ...
+    @staticmethod
+    def entityToSetString(type: Qgis.SensorThingsEntity) -> str: ...
+    @staticmethod
+    def entitySetStringToEntity(type: typing.Optional[str]) -> Qgis.SensorThingsEntity: ...
+    @staticmethod
+    def displayString(type: Qgis.SensorThingsEntity, plural: bool = ...) -> str: ...
+    @staticmethod
+    def stringToEntity(type: typing.Optional[str]) -> Qgis.SensorThingsEntity: ...
+
+
+class QgsSensorThingsExpansionDefinition(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, childEntity: Qgis.SensorThingsEntity = ..., orderBy: typing.Optional[str] = ..., sortOrder: QtCore.Qt.SortOrder = ..., limit: int = ..., filter: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSensorThingsExpansionDefinition') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def asQueryString(self, parentEntityType: Qgis.SensorThingsEntity, additionalOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> str: ...
+    @staticmethod
+    def fromString(string: typing.Optional[str]) -> 'QgsSensorThingsExpansionDefinition': ...
+    def toString(self) -> str: ...
+    def setFilter(self, filter: typing.Optional[str]) -> None: ...
+    def filter(self) -> str: ...
+    def setLimit(self, limit: int) -> None: ...
+    def limit(self) -> int: ...
+    def setSortOrder(self, order: QtCore.Qt.SortOrder) -> None: ...
+    def sortOrder(self) -> QtCore.Qt.SortOrder: ...
+    def setOrderBy(self, field: typing.Optional[str]) -> None: ...
+    def orderBy(self) -> str: ...
+    def setChildEntity(self, entity: Qgis.SensorThingsEntity) -> None: ...
+    def childEntity(self) -> Qgis.SensorThingsEntity: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    def defaultDefinitionForEntity(entity: Qgis.SensorThingsEntity) -> 'QgsSensorThingsExpansionDefinition': ...
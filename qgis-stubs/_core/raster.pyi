@@ -0,0 +1,2074 @@
+# The PEP 484 type hints stub file for the _core.raster module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsColorRamp, QgsDataProviderElevationProperties,
+    QgsDataProviderTemporalCapabilities, QgsDateTimeRange, QgsDoubleRange,
+    QgsError, QgsFeedback, QgsFields, QgsGradientColorRamp, QgsInterval,
+    QgsPropertyDefinition, QgsSldExportContext, QgsTemporalProperty,
+)
+from .dxf import QgsMapSettings, QgsMapToPixel
+from .elevation import (
+    QgsAbstractProfileGenerator, QgsAbstractProfileSource, QgsProfileRequest,
+    QgsTask,
+)
+from .geometry import QgsPoint, QgsRectangle
+from .labeling import QgsLabelPlacementSettings, QgsLabelThinningSettings
+from .layertree import (
+    QgsColorRampLegendNodeSettings, QgsLayerTreeLayer,
+    QgsLayerTreeModelLegendNode,
+)
+from .numericformats import QgsNumericFormat
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .providers import QgsDataProvider
+from .symbology import (
+    QgsFillSymbol, QgsLineSymbol, QgsStyleEntityVisitorInterface,
+)
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsExpressionContext, QgsFeature, QgsMapLayer,
+    QgsMapLayerElevationProperties, QgsMapLayerRenderer,
+    QgsMapLayerTemporalProperties, QgsPointXY, QgsPropertyCollection,
+    QgsReadWriteContext, QgsRenderContext,
+)
+
+
+class QgsRasterAttributeTable(PyQt5.sip.wrapper):
+
+    class UsageInformation(PyQt5.sip.wrapper):
+
+        allowedTypes = ... # type: collections.abc.Iterable[QtCore.QMetaType.Type]
+        description = ... # type: typing.Optional[str]
+        isColor = ... # type: bool
+        isRamp = ... # type: bool
+        maybeClass = ... # type: bool
+        required = ... # type: bool
+        supported = ... # type: bool
+        unique = ... # type: bool
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterAttributeTable.UsageInformation') -> None: ...
+
+    class Field(PyQt5.sip.wrapper):
+
+        name = ... # type: typing.Optional[str]
+        type = ... # type: QtCore.QMetaType.Type
+        usage = ... # type: Qgis.RasterAttributeTableFieldUsage
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str], usage: Qgis.RasterAttributeTableFieldUsage, type: QtCore.QMetaType.Type) -> None: ...
+        @typing.overload
+        @deprecated("""""")
+        def __init__(self, name: typing.Optional[str], usage: Qgis.RasterAttributeTableFieldUsage, type: QtCore.QVariant.Type) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterAttributeTable.Field') -> None: ...
+
+        def isRamp(self) -> bool: ...
+        def isColor(self) -> bool: ...
+
+    class MinMaxClass(PyQt5.sip.wrapper):
+
+        color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+        minMaxValues = ... # type: collections.abc.Iterable[float]
+        name = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterAttributeTable.MinMaxClass') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterAttributeTable') -> None: ...
+
+    @staticmethod
+    def usageInformation() -> dict[int, 'QgsRasterAttributeTable.UsageInformation']: ...
+    @staticmethod
+    def createFromRaster(rasterLayer: typing.Optional['QgsRasterLayer']) -> typing.Tuple[typing.Optional['QgsRasterAttributeTable'], typing.Optional[int]]: ...
+    @staticmethod
+    def valueAndColorFieldUsages() -> list[Qgis.RasterAttributeTableFieldUsage]: ...
+    @staticmethod
+    def usageName(fieldusage: Qgis.RasterAttributeTableFieldUsage) -> str: ...
+    def filePath(self) -> str: ...
+    @staticmethod
+    def guessFieldUsage(name: typing.Optional[str], type: typing.Union[QtCore.QMetaType.Type, QtCore.QVariant.Type]) -> Qgis.RasterAttributeTableFieldUsage: ...
+    def orderedRows(self) -> typing.Any: ...
+    def createRenderer(self, provider: typing.Optional['QgsRasterDataProvider'], bandNumber: int, classificationColumn: int = ...) -> typing.Optional['QgsRasterRenderer']: ...
+    def colorRamp(self, labelColumn: int = ...) -> typing.Tuple[QgsGradientColorRamp, list[str]]: ...
+    def minMaxClasses(self, classificationColumn: int = ...) -> list['QgsRasterAttributeTable.MinMaxClass']: ...
+    def row(self, matchValue: float) -> list[typing.Any]: ...
+    def maximumValue(self) -> float: ...
+    def minimumValue(self) -> float: ...
+    def value(self, row: int, column: int) -> typing.Any: ...
+    def setValue(self, row: int, column: int, value: typing.Any) -> bool: ...
+    def fieldsByUsage(self, fieldUsage: Qgis.RasterAttributeTableFieldUsage) -> list['QgsRasterAttributeTable.Field']: ...
+    def fieldByName(self, name: typing.Optional[str]) -> typing.Tuple['QgsRasterAttributeTable.Field', typing.Optional[bool]]: ...
+    def data(self) -> typing.Any: ...
+    def readFromFile(self, path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def writeToFile(self, path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def appendRow(self, data: collections.abc.Iterable[typing.Any]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def removeRow(self, position: int = ...) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def insertRow(self, position: int, rowData: collections.abc.Iterable[typing.Any]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def removeField(self, name: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    def appendField(self, name: typing.Optional[str], usage: Qgis.RasterAttributeTableFieldUsage, type: typing.Union[QtCore.QMetaType.Type, QtCore.QVariant.Type]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    def appendField(self, field: 'QgsRasterAttributeTable.Field') -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def insertRamp(self, position: int) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def setFieldUsage(self, fieldIndex: int, usage: Qgis.RasterAttributeTableFieldUsage) -> bool: ...
+    def insertColor(self, position: int) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    def insertField(self, position: int, field: 'QgsRasterAttributeTable.Field') -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    def insertField(self, position: int, name: typing.Optional[str], usage: Qgis.RasterAttributeTableFieldUsage, type: QtCore.QMetaType.Type) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    @typing.overload
+    @deprecated("""""")
+    def insertField(self, position: int, name: typing.Optional[str], usage: Qgis.RasterAttributeTableFieldUsage, type: QtCore.QVariant.Type) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def isValid(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def setDirty(self, isDirty: bool) -> None: ...
+    def isDirty(self) -> bool: ...
+    def qgisFeatures(self) -> list[QgsFeature]: ...
+    def qgisFields(self) -> QgsFields: ...
+    def fields(self) -> list['QgsRasterAttributeTable.Field']: ...
+    def ramp(self, row: int) -> QgsGradientColorRamp: ...
+    def color(self, row: int) -> QtGui.QColor: ...
+    def usages(self) -> list[int]: ...
+    def setRamp(self, row: int, colorMin: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], colorMax: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> bool: ...
+    def hasRamp(self) -> bool: ...
+    def setColor(self, row: int, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> bool: ...
+    def hasColor(self) -> bool: ...
+    def type(self) -> Qgis.RasterAttributeTableType: ...
+
+
+class QgsRasterResampler(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterResampler') -> None: ...
+
+    def tileBufferPixels(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsRasterResampler']: ...
+    def type(self) -> str: ...
+    @deprecated("""""")
+    def resample(self, srcImage: QtGui.QImage, dstImage: QtGui.QImage) -> None: ...
+
+
+class QgsRasterResamplerV2(QgsRasterResampler):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterResamplerV2') -> None: ...
+
+    def resampleV2(self, source: QtGui.QImage, size: QtCore.QSize) -> QtGui.QImage: ...
+
+
+class QgsBilinearRasterResampler(QgsRasterResamplerV2):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsBilinearRasterResampler') -> None: ...
+
+    def tileBufferPixels(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsBilinearRasterResampler']: ...
+    def type(self) -> str: ...
+    def resampleV2(self, source: QtGui.QImage, size: QtCore.QSize) -> QtGui.QImage: ...
+    @deprecated("""""")
+    def resample(self, srcImage: QtGui.QImage, dstImage: QtGui.QImage) -> None: ...
+
+
+class QgsRasterInterface(PyQt5.sip.wrapper):
+
+    def __init__(self, input: typing.Optional['QgsRasterInterface'] = ...) -> None: ...
+
+    @typing.overload
+    @deprecated("""""")
+    def initStatistics(self, statistics: 'QgsRasterBandStats', bandNo: int, stats: int, boundingBox: QgsRectangle = ..., binCount: int = ...) -> None: ...
+    @typing.overload
+    def initStatistics(self, statistics: 'QgsRasterBandStats', bandNo: int, stats: typing.Union[Qgis.RasterBandStatistics, Qgis.RasterBandStatistic] = ..., boundingBox: QgsRectangle = ..., binCount: int = ...) -> None: ...
+    def initHistogram(self, histogram: 'QgsRasterHistogram', bandNo: int, binCount: int, minimum: typing.Any = ..., maximum: typing.Any = ..., boundingBox: QgsRectangle = ..., sampleSize: int = ..., includeOutOfRange: bool = ...) -> None: ...
+    def readXml(self, filterElem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def cumulativeCut(self, bandNo: int, lowerCount: float, upperCount: float, extent: QgsRectangle = ..., sampleSize: int = ...) -> typing.Tuple[float, float]: ...
+    def hasHistogram(self, bandNo: int, binCount: int, minimum: typing.Any = ..., maximum: typing.Any = ..., extent: QgsRectangle = ..., sampleSize: int = ..., includeOutOfRange: bool = ...) -> bool: ...
+    def histogram(self, bandNo: int, binCount: int = ..., minimum: typing.Any = ..., maximum: typing.Any = ..., extent: QgsRectangle = ..., sampleSize: int = ..., includeOutOfRange: bool = ..., feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> 'QgsRasterHistogram': ...
+    @typing.overload
+    @deprecated("""""")
+    def hasStatistics(self, bandNo: int, stats: int, extent: QgsRectangle = ..., sampleSize: int = ...) -> bool: ...
+    @typing.overload
+    def hasStatistics(self, bandNo: int, stats: typing.Union[Qgis.RasterBandStatistics, Qgis.RasterBandStatistic] = ..., extent: QgsRectangle = ..., sampleSize: int = ...) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def bandStatistics(self, bandNo: int, stats: int, extent: QgsRectangle = ..., sampleSize: int = ..., feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> 'QgsRasterBandStats': ...
+    @typing.overload
+    def bandStatistics(self, bandNo: int, stats: typing.Union[Qgis.RasterBandStatistics, Qgis.RasterBandStatistic] = ..., extent: QgsRectangle = ..., sampleSize: int = ..., feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> 'QgsRasterBandStats': ...
+    def sourceInput(self) -> typing.Optional['QgsRasterInterface']: ...
+    def setOn(self, on: bool) -> None: ...
+    def on(self) -> bool: ...
+    def input(self) -> typing.Optional['QgsRasterInterface']: ...
+    def setInput(self, input: typing.Optional['QgsRasterInterface']) -> bool: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    def displayBandName(self, bandNumber: int) -> str: ...
+    def colorInterpretationName(self, bandNumber: int) -> str: ...
+    def generateBandName(self, bandNumber: int) -> str: ...
+    def ySize(self) -> int: ...
+    def xSize(self) -> int: ...
+    def yBlockSize(self) -> int: ...
+    def xBlockSize(self) -> int: ...
+    def bandCount(self) -> int: ...
+    def dataTypeSize(self, bandNo: int) -> int: ...
+    def extent(self) -> QgsRectangle: ...
+    def sourceDataType(self, bandNo: int) -> Qgis.DataType: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    @deprecated("""""")
+    def capabilitiesString(self) -> str: ...
+    def capabilities(self) -> Qgis.RasterInterfaceCapabilities: ...
+    def clone(self) -> typing.Optional['QgsRasterInterface']: ...
+    Capability: typing.Type[Qgis.RasterInterfaceCapability]
+    NoCapabilities: Qgis.RasterInterfaceCapability
+    Size: Qgis.RasterInterfaceCapability
+    Create: Qgis.RasterInterfaceCapability
+    Remove: Qgis.RasterInterfaceCapability
+    BuildPyramids: Qgis.RasterInterfaceCapability
+    Identify: Qgis.RasterInterfaceCapability
+    IdentifyValue: Qgis.RasterInterfaceCapability
+    IdentifyText: Qgis.RasterInterfaceCapability
+    IdentifyHtml: Qgis.RasterInterfaceCapability
+    IdentifyFeature: Qgis.RasterInterfaceCapability
+    Prefetch: Qgis.RasterInterfaceCapability
+
+
+class QgsBrightnessContrastFilter(QgsRasterInterface):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+
+    def readXml(self, filterElem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def gamma(self) -> float: ...
+    def setGamma(self, gamma: float) -> None: ...
+    def contrast(self) -> int: ...
+    def setContrast(self, contrast: int) -> None: ...
+    def brightness(self) -> int: ...
+    def setBrightness(self, brightness: int) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsBrightnessContrastFilter']: ...
+
+
+class QgsContrastEnhancementFunction(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, a0: Qgis.DataType, a1: float, a2: float) -> None: ...
+    @typing.overload
+    def __init__(self, f: 'QgsContrastEnhancementFunction') -> None: ...
+
+    def minimumValue(self) -> float: ...
+    def maximumValue(self) -> float: ...
+    def setMinimumValue(self, value: float) -> None: ...
+    def setMaximumValue(self, value: float) -> None: ...
+    def isValueInDisplayableRange(self, value: float) -> bool: ...
+    def enhance(self, value: float) -> int: ...
+
+
+class QgsClipToMinMaxEnhancement(QgsContrastEnhancementFunction):
+
+    @typing.overload
+    def __init__(self, a0: Qgis.DataType, a1: float, a2: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsClipToMinMaxEnhancement') -> None: ...
+
+    def isValueInDisplayableRange(self, a0: float) -> bool: ...
+    def enhance(self, a0: float) -> int: ...
+
+
+class QgsRasterShaderFunction(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, minimumValue: float = ..., maximumValue: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterShaderFunction') -> None: ...
+
+    def setLabelPrecision(self, labelPrecision: int) -> None: ...
+    def labelPrecision(self) -> int: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def maximumValue(self) -> float: ...
+    def minimumValue(self) -> float: ...
+    def minimumMaximumRange(self) -> float: ...
+    @typing.overload
+    def shade(self, value: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    @typing.overload
+    def shade(self, redValue: float, greenValue: float, blueValue: float, alphaValue: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    def setMinimumValue(self, value: float) -> None: ...
+    def setMaximumValue(self, value: float) -> None: ...
+
+
+class QgsColorRampShader(QgsRasterShaderFunction):
+
+    class ColorRampItem(PyQt5.sip.wrapper):
+
+        color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+        label = ... # type: typing.Optional[str]
+        value = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, val: float, col: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], lbl: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsColorRampShader.ColorRampItem') -> None: ...
+
+        def __ge__(self, other: 'QgsColorRampShader.ColorRampItem') -> bool: ...
+        def __eq__(self, other: object): ...
+        def __ne__(self, other: object): ...
+        def __lt__(self, other: 'QgsColorRampShader.ColorRampItem') -> bool: ...
+
+    @typing.overload
+    def __init__(self, minimumValue: float = ..., maximumValue: float = ..., colorRamp: typing.Optional[QgsColorRamp] = ..., type: Qgis.ShaderInterpolationMethod = ..., classificationMode: Qgis.ShaderClassificationMethod = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsColorRampShader') -> None: ...
+
+    def setLegendSettings(self, settings: typing.Optional[QgsColorRampLegendNodeSettings]) -> None: ...
+    def legendSettings(self) -> typing.Optional[QgsColorRampLegendNodeSettings]: ...
+    def clip(self) -> bool: ...
+    def setClip(self, clip: bool) -> None: ...
+    def classificationMode(self) -> Qgis.ShaderClassificationMethod: ...
+    def setClassificationMode(self, classificationMode: Qgis.ShaderClassificationMethod) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext = ...) -> QtXml.QDomElement: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    @typing.overload
+    def shade(self, value: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    @typing.overload
+    def shade(self, redValue: float, greenValue: float, blueValue: float, alphaValue: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    def classifyColorRampV2(self, band: int = ..., extent: QgsRectangle = ..., input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+    def classifyColorRamp(self, classes: int = ..., band: int = ..., extent: QgsRectangle = ..., input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+    def setSourceColorRamp(self, colorramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def createColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def sourceColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def isEmpty(self) -> bool: ...
+    @typing.overload
+    def setColorRampType(self, colorRampType: Qgis.ShaderInterpolationMethod) -> None: ...
+    @typing.overload
+    def setColorRampType(self, type: typing.Optional[str]) -> None: ...
+    def setColorRampItemList(self, list: collections.abc.Iterable['QgsColorRampShader.ColorRampItem']) -> None: ...
+    def colorRampTypeAsQString(self) -> str: ...
+    def colorRampType(self) -> Qgis.ShaderInterpolationMethod: ...
+    def colorRampItemList(self) -> list['QgsColorRampShader.ColorRampItem']: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    Type: typing.Type[Qgis.ShaderInterpolationMethod]
+    Interpolated: Qgis.ShaderInterpolationMethod
+    Discrete: Qgis.ShaderInterpolationMethod
+    Exact: Qgis.ShaderInterpolationMethod
+    ClassificationMode: typing.Type[Qgis.ShaderClassificationMethod]
+    Continuous: Qgis.ShaderClassificationMethod
+    EqualInterval: Qgis.ShaderClassificationMethod
+    Quantile: Qgis.ShaderClassificationMethod
+
+
+class QgsContrastEnhancement(PyQt5.sip.wrapper):
+
+    class ContrastEnhancementAlgorithm(int):
+        NoEnhancement = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+        StretchToMinimumMaximum = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+        StretchAndClipToMinimumMaximum = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+        ClipToMinimumMaximum = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+        UserDefinedEnhancement = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+
+    @typing.overload
+    def __init__(self, datatype: Qgis.DataType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, ce: 'QgsContrastEnhancement') -> None: ...
+
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def setMinimumValue(self, value: float, generateTable: bool = ...) -> None: ...
+    def setMaximumValue(self, value: float, generateTable: bool = ...) -> None: ...
+    def setContrastEnhancementFunction(self, function: typing.Optional[QgsContrastEnhancementFunction]) -> None: ...
+    def setContrastEnhancementAlgorithm(self, algorithm: 'QgsContrastEnhancement.ContrastEnhancementAlgorithm', generateTable: bool = ...) -> None: ...
+    def isValueInDisplayableRange(self, value: float) -> bool: ...
+    def enhanceContrast(self, value: float) -> int: ...
+    def contrastEnhancementAlgorithm(self) -> 'QgsContrastEnhancement.ContrastEnhancementAlgorithm': ...
+    def minimumValue(self) -> float: ...
+    def maximumValue(self) -> float: ...
+    @staticmethod
+    def contrastEnhancementAlgorithmFromString(contrastEnhancementString: typing.Optional[str]) -> 'QgsContrastEnhancement.ContrastEnhancementAlgorithm': ...
+    @staticmethod
+    def contrastEnhancementAlgorithmString(algorithm: 'QgsContrastEnhancement.ContrastEnhancementAlgorithm') -> str: ...
+    @staticmethod
+    def minimumValuePossible(dataType: Qgis.DataType) -> float: ...
+    @staticmethod
+    def maximumValuePossible(dataType: Qgis.DataType) -> float: ...
+
+
+class QgsCubicRasterResampler(QgsRasterResamplerV2):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCubicRasterResampler') -> None: ...
+
+    def tileBufferPixels(self) -> int: ...
+    def type(self) -> str: ...
+    @deprecated("""""")
+    def resample(self, srcImage: QtGui.QImage, dstImage: QtGui.QImage) -> None: ...
+    def resampleV2(self, source: QtGui.QImage, size: QtCore.QSize) -> QtGui.QImage: ...
+    def clone(self) -> typing.Optional['QgsCubicRasterResampler']: ...
+
+
+class QgsExifTools(PyQt5.sip.wrapper):
+
+    class GeoTagDetails(PyQt5.sip.wrapper):
+
+        elevation = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExifTools.GeoTagDetails') -> None: ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExifTools') -> None: ...
+
+    @staticmethod
+    def tagImage(imagePath: typing.Optional[str], tag: typing.Optional[str], value: typing.Any) -> bool: ...
+    @staticmethod
+    def geoTagImage(imagePath: typing.Optional[str], location: QgsPointXY, details: 'QgsExifTools.GeoTagDetails' = ...) -> bool: ...
+    @staticmethod
+    def hasGeoTag(imagePath: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def getGeoTag(imagePath: typing.Optional[str]) -> typing.Tuple[QgsPoint, bool]: ...
+    @staticmethod
+    def readTag(imagePath: typing.Optional[str], key: typing.Optional[str]) -> typing.Any: ...
+    @staticmethod
+    def readTags(imagePath: typing.Optional[str]) -> dict[str, typing.Any]: ...
+
+
+class QgsRasterRenderer(QgsRasterInterface):
+
+    NODATA_COLOR = ... # type: int
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface] = ..., type: typing.Optional[str] = ...) -> None: ...
+
+    def renderColorForNodataPixel(self) -> int: ...
+    def _writeXml(self, doc: QtXml.QDomDocument, rasterRendererElem: QtXml.QDomElement) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def setMinMaxOrigin(self, origin: 'QgsRasterMinMaxOrigin') -> None: ...
+    def minMaxOrigin(self) -> 'QgsRasterMinMaxOrigin': ...
+    def usesBands(self) -> list[int]: ...
+    def copyCommonProperties(self, other: typing.Optional['QgsRasterRenderer'], copyMinMaxOrigin: bool = ...) -> None: ...
+    def readXml(self, rendererElem: QtXml.QDomElement) -> None: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def alphaBand(self) -> int: ...
+    def setAlphaBand(self, band: int) -> None: ...
+    def rasterTransparency(self) -> typing.Optional['QgsRasterTransparency']: ...
+    def setRasterTransparency(self, t: typing.Optional['QgsRasterTransparency']) -> None: ...
+    def setNodataColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def nodataColor(self) -> QtGui.QColor: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def usesTransparency(self) -> bool: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def canCreateRasterAttributeTable(self) -> bool: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def type(self) -> str: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsRasterRenderer']: ...
+
+
+class QgsHillshadeRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], band: int, lightAzimuth: float, lightAltitude: float) -> None: ...
+
+    def setMultiDirectional(self, isMultiDirectional: bool) -> None: ...
+    def setZFactor(self, zfactor: float) -> None: ...
+    def setAltitude(self, altitude: float) -> None: ...
+    def setAzimuth(self, azimuth: float) -> None: ...
+    def multiDirectional(self) -> bool: ...
+    def zFactor(self) -> float: ...
+    def altitude(self) -> float: ...
+    def azimuth(self) -> float: ...
+    def setInputBand(self, band: int) -> bool: ...
+    @deprecated("""""")
+    def setBand(self, bandNo: int) -> None: ...
+    @deprecated("""""")
+    def band(self) -> int: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def inputBand(self) -> int: ...
+    def usesBands(self) -> list[int]: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsHillshadeRenderer']: ...
+
+
+class QgsHueSaturationFilter(QgsRasterInterface):
+
+    class GrayscaleMode(int):
+        GrayscaleOff = ... # type: QgsHueSaturationFilter.GrayscaleMode
+        GrayscaleLightness = ... # type: QgsHueSaturationFilter.GrayscaleMode
+        GrayscaleLuminosity = ... # type: QgsHueSaturationFilter.GrayscaleMode
+        GrayscaleAverage = ... # type: QgsHueSaturationFilter.GrayscaleMode
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+
+    def readXml(self, filterElem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def colorizeStrength(self) -> int: ...
+    def setColorizeStrength(self, colorizeStrength: int) -> None: ...
+    def colorizeColor(self) -> QtGui.QColor: ...
+    def setColorizeColor(self, colorizeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def colorizeOn(self) -> bool: ...
+    def setColorizeOn(self, colorizeOn: bool) -> None: ...
+    def grayscaleMode(self) -> 'QgsHueSaturationFilter.GrayscaleMode': ...
+    def setGrayscaleMode(self, grayscaleMode: 'QgsHueSaturationFilter.GrayscaleMode') -> None: ...
+    def invertColors(self) -> bool: ...
+    def setInvertColors(self, invertColors: bool) -> None: ...
+    def saturation(self) -> int: ...
+    def setSaturation(self, saturation: int) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsHueSaturationFilter']: ...
+
+
+class QgsLinearMinMaxEnhancement(QgsContrastEnhancementFunction):
+
+    @typing.overload
+    def __init__(self, a0: Qgis.DataType, a1: float, a2: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLinearMinMaxEnhancement') -> None: ...
+
+    def enhance(self, a0: float) -> int: ...
+
+
+class QgsLinearMinMaxEnhancementWithClip(QgsContrastEnhancementFunction):
+
+    @typing.overload
+    def __init__(self, a0: Qgis.DataType, a1: float, a2: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLinearMinMaxEnhancementWithClip') -> None: ...
+
+    def isValueInDisplayableRange(self, a0: float) -> bool: ...
+    def enhance(self, a0: float) -> int: ...
+
+
+class QgsMultiBandColorRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], redBand: int, greenBand: int, blueBand: int, redEnhancement: typing.Optional[QgsContrastEnhancement] = ..., greenEnhancement: typing.Optional[QgsContrastEnhancement] = ..., blueEnhancement: typing.Optional[QgsContrastEnhancement] = ...) -> None: ...
+
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def usesBands(self) -> list[int]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def setBlueContrastEnhancement(self, ce: typing.Optional[QgsContrastEnhancement]) -> None: ...
+    def blueContrastEnhancement(self) -> typing.Optional[QgsContrastEnhancement]: ...
+    def setGreenContrastEnhancement(self, ce: typing.Optional[QgsContrastEnhancement]) -> None: ...
+    def greenContrastEnhancement(self) -> typing.Optional[QgsContrastEnhancement]: ...
+    def setRedContrastEnhancement(self, ce: typing.Optional[QgsContrastEnhancement]) -> None: ...
+    def redContrastEnhancement(self) -> typing.Optional[QgsContrastEnhancement]: ...
+    def setBlueBand(self, band: int) -> None: ...
+    def blueBand(self) -> int: ...
+    def setGreenBand(self, band: int) -> None: ...
+    def greenBand(self) -> int: ...
+    def setRedBand(self, band: int) -> None: ...
+    def redBand(self) -> int: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsMultiBandColorRenderer']: ...
+
+
+class QgsPalettedRasterRenderer(QgsRasterRenderer):
+
+    class Class(PyQt5.sip.wrapper):
+
+        color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+        label = ... # type: typing.Optional[str]
+        value = ... # type: float
+
+        @typing.overload
+        def __init__(self, value: float, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., label: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPalettedRasterRenderer.Class') -> None: ...
+
+    class MultiValueClass(PyQt5.sip.wrapper):
+
+        color = ... # type: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]
+        label = ... # type: typing.Optional[str]
+        values = ... # type: collections.abc.Iterable[typing.Any]
+
+        @typing.overload
+        def __init__(self, values: collections.abc.Iterable[typing.Any], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., label: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPalettedRasterRenderer.MultiValueClass') -> None: ...
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], bandNumber: int, classes: collections.abc.Iterable['QgsPalettedRasterRenderer.Class']) -> None: ...
+
+    @staticmethod
+    def classDataFromRaster(raster: typing.Optional[QgsRasterInterface], bandNumber: int, ramp: typing.Optional[QgsColorRamp] = ..., feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> list['QgsPalettedRasterRenderer.Class']: ...
+    @staticmethod
+    def classDataToString(classes: collections.abc.Iterable['QgsPalettedRasterRenderer.Class']) -> str: ...
+    @staticmethod
+    def classDataFromFile(path: typing.Optional[str]) -> list['QgsPalettedRasterRenderer.Class']: ...
+    @staticmethod
+    def classDataFromString(string: typing.Optional[str]) -> list['QgsPalettedRasterRenderer.Class']: ...
+    @staticmethod
+    def rasterAttributeTableToClassData(attributeTable: typing.Optional[QgsRasterAttributeTable], classificationColumn: int = ..., ramp: typing.Optional[QgsColorRamp] = ...) -> list['QgsPalettedRasterRenderer.MultiValueClass']: ...
+    @staticmethod
+    def colorTableToClassData(table: collections.abc.Iterable[QgsColorRampShader.ColorRampItem]) -> list['QgsPalettedRasterRenderer.Class']: ...
+    def sourceColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setSourceColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def usesBands(self) -> list[int]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    @deprecated("""""")
+    def band(self) -> int: ...
+    def setLabel(self, idx: float, label: typing.Optional[str]) -> None: ...
+    def label(self, idx: float) -> str: ...
+    def setMultiValueClasses(self, classes: collections.abc.Iterable['QgsPalettedRasterRenderer.MultiValueClass']) -> None: ...
+    def canCreateRasterAttributeTable(self) -> bool: ...
+    def multiValueClasses(self) -> list['QgsPalettedRasterRenderer.MultiValueClass']: ...
+    def classes(self) -> list['QgsPalettedRasterRenderer.Class']: ...
+    def nColors(self) -> int: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional['QgsRasterBlock']: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsPalettedRasterRenderer']: ...
+
+
+class QgsRaster(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRaster') -> None: ...
+
+    @staticmethod
+    def representableValue(value: float, dataType: Qgis.DataType) -> float: ...
+    ColorInterpretation: typing.Type[Qgis.RasterColorInterpretation]
+    UndefinedColorInterpretation: Qgis.RasterColorInterpretation
+    GrayIndex: Qgis.RasterColorInterpretation
+    PaletteIndex: Qgis.RasterColorInterpretation
+    RedBand: Qgis.RasterColorInterpretation
+    GreenBand: Qgis.RasterColorInterpretation
+    BlueBand: Qgis.RasterColorInterpretation
+    AlphaBand: Qgis.RasterColorInterpretation
+    HueBand: Qgis.RasterColorInterpretation
+    SaturationBand: Qgis.RasterColorInterpretation
+    LightnessBand: Qgis.RasterColorInterpretation
+    CyanBand: Qgis.RasterColorInterpretation
+    MagentaBand: Qgis.RasterColorInterpretation
+    YellowBand: Qgis.RasterColorInterpretation
+    BlackBand: Qgis.RasterColorInterpretation
+    YCbCr_YBand: Qgis.RasterColorInterpretation
+    YCbCr_CbBand: Qgis.RasterColorInterpretation
+    YCbCr_CrBand: Qgis.RasterColorInterpretation
+    ContinuousPalette: Qgis.RasterColorInterpretation
+    PanBand: Qgis.RasterColorInterpretation
+    CoastalBand: Qgis.RasterColorInterpretation
+    RedEdgeBand: Qgis.RasterColorInterpretation
+    NIRBand: Qgis.RasterColorInterpretation
+    SWIRBand: Qgis.RasterColorInterpretation
+    MWIRBand: Qgis.RasterColorInterpretation
+    LWIRBand: Qgis.RasterColorInterpretation
+    TIRBand: Qgis.RasterColorInterpretation
+    OtherIRBand: Qgis.RasterColorInterpretation
+    SAR_Ka_Band: Qgis.RasterColorInterpretation
+    SAR_K_Band: Qgis.RasterColorInterpretation
+    SAR_Ku_Band: Qgis.RasterColorInterpretation
+    SAR_X_Band: Qgis.RasterColorInterpretation
+    SAR_C_Band: Qgis.RasterColorInterpretation
+    SAR_S_Band: Qgis.RasterColorInterpretation
+    SAR_L_Band: Qgis.RasterColorInterpretation
+    SAR_P_Band: Qgis.RasterColorInterpretation
+    DrawingStyle: typing.Type[Qgis.RasterDrawingStyle]
+    UndefinedDrawingStyle: Qgis.RasterDrawingStyle
+    SingleBandGray: Qgis.RasterDrawingStyle
+    SingleBandPseudoColor: Qgis.RasterDrawingStyle
+    PalettedColor: Qgis.RasterDrawingStyle
+    PalettedSingleBandGray: Qgis.RasterDrawingStyle
+    PalettedSingleBandPseudoColor: Qgis.RasterDrawingStyle
+    PalettedMultiBandColor: Qgis.RasterDrawingStyle
+    MultiBandSingleBandGray: Qgis.RasterDrawingStyle
+    MultiBandSingleBandPseudoColor: Qgis.RasterDrawingStyle
+    MultiBandColor: Qgis.RasterDrawingStyle
+    SingleBandColorDataStyle: Qgis.RasterDrawingStyle
+    RasterPyramidsFormat: typing.Type[Qgis.RasterPyramidFormat]
+    PyramidsGTiff: Qgis.RasterPyramidFormat
+    PyramidsInternal: Qgis.RasterPyramidFormat
+    PyramidsErdas: Qgis.RasterPyramidFormat
+    RasterBuildPyramids: typing.Type[Qgis.RasterBuildPyramidOption]
+    PyramidsFlagNo: Qgis.RasterBuildPyramidOption
+    PyramidsFlagYes: Qgis.RasterBuildPyramidOption
+    PyramidsCopyExisting: Qgis.RasterBuildPyramidOption
+    IdentifyFormat: typing.Type[Qgis.RasterIdentifyFormat]
+    IdentifyFormatUndefined: Qgis.RasterIdentifyFormat
+    IdentifyFormatValue: Qgis.RasterIdentifyFormat
+    IdentifyFormatText: Qgis.RasterIdentifyFormat
+    IdentifyFormatHtml: Qgis.RasterIdentifyFormat
+    IdentifyFormatFeature: Qgis.RasterIdentifyFormat
+
+
+class QgsRasterBandStats(PyQt5.sip.wrapper):
+
+    bandNumber = ... # type: int
+    elementCount = ... # type: int
+    extent = ... # type: QgsRectangle
+    height = ... # type: int
+    maximumValue = ... # type: float
+    mean = ... # type: float
+    minimumValue = ... # type: float
+    range = ... # type: float
+    statsGathered = ... # type: typing.Union[Qgis.RasterBandStatistics, Qgis.RasterBandStatistic]
+    stdDev = ... # type: float
+    sum = ... # type: float
+    sumOfSquares = ... # type: float
+    width = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterBandStats') -> None: ...
+
+    def contains(self, s: 'QgsRasterBandStats') -> bool: ...
+    Stats: typing.Type[Qgis.RasterBandStatistic]
+    NoStatistic: Qgis.RasterBandStatistic
+    Min: Qgis.RasterBandStatistic
+    Max: Qgis.RasterBandStatistic
+    Range: Qgis.RasterBandStatistic
+    Sum: Qgis.RasterBandStatistic
+    Mean: Qgis.RasterBandStatistic
+    StdDev: Qgis.RasterBandStatistic
+    SumOfSquares: Qgis.RasterBandStatistic
+    All: Qgis.RasterBandStatistic
+
+
+class QgsRasterBlock(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, dataType: Qgis.DataType, width: int, height: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterBlock') -> None: ...
+
+    def minimumMaximum(self) -> typing.Tuple[bool, float, int, int, float, int, int]: ...
+    def maximum(self) -> typing.Tuple[bool, float, int, int]: ...
+    def minimum(self) -> typing.Tuple[bool, float, int, int]: ...
+    def height(self) -> int: ...
+    def width(self) -> int: ...
+    @staticmethod
+    def subRect(extent: QgsRectangle, width: int, height: int, subExtent: QgsRectangle) -> QtCore.QRect: ...
+    def toString(self) -> str: ...
+    def setError(self, error: QgsError) -> None: ...
+    def error(self) -> QgsError: ...
+    def applyScaleOffset(self, scale: float, offset: float) -> None: ...
+    def applyNoDataValues(self, rangeList: collections.abc.Iterable['QgsRasterRange']) -> None: ...
+    def setImage(self, image: typing.Optional[QtGui.QImage]) -> bool: ...
+    def image(self) -> QtGui.QImage: ...
+    def convert(self, destDataType: Qgis.DataType) -> bool: ...
+    @staticmethod
+    def printValue(value: float, localized: bool = ...) -> str: ...
+    def setData(self, data: typing.Union[QtCore.QByteArray, bytes, bytearray], offset: int = ...) -> None: ...
+    def data(self) -> QtCore.QByteArray: ...
+    def fill(self, value: float) -> None: ...
+    @typing.overload
+    def setIsData(self, row: int, column: int) -> None: ...
+    @typing.overload
+    def setIsData(self, index: int) -> None: ...
+    def setIsNoDataExcept(self, exceptRect: QtCore.QRect) -> bool: ...
+    @typing.overload
+    def setIsNoData(self, row: int, column: int) -> bool: ...
+    @typing.overload
+    def setIsNoData(self, index: int) -> bool: ...
+    @typing.overload
+    def setIsNoData(self) -> bool: ...
+    @typing.overload
+    def setColor(self, row: int, column: int, color: int) -> bool: ...
+    @typing.overload
+    def setColor(self, index: int, color: int) -> bool: ...
+    @typing.overload
+    def setValue(self, row: int, column: int, value: float) -> bool: ...
+    @typing.overload
+    def setValue(self, index: int, value: float) -> bool: ...
+    @typing.overload
+    def isNoData(self, row: int, column: int) -> bool: ...
+    @typing.overload
+    def isNoData(self, index: int) -> bool: ...
+    @typing.overload
+    def color(self, row: int, column: int) -> int: ...
+    @typing.overload
+    def color(self, index: int) -> int: ...
+    @typing.overload
+    def value(self, row: int, column: int) -> float: ...
+    @typing.overload
+    def value(self, index: int) -> float: ...
+    @staticmethod
+    def valueBytes(dataType: Qgis.DataType, value: float) -> QtCore.QByteArray: ...
+    def noDataValue(self) -> float: ...
+    def resetNoDataValue(self) -> None: ...
+    def setNoDataValue(self, noDataValue: float) -> None: ...
+    def hasNoData(self) -> bool: ...
+    def hasNoDataValue(self) -> bool: ...
+    @staticmethod
+    def typeWithNoDataValue(dataType: Qgis.DataType) -> typing.Tuple[Qgis.DataType, typing.Optional[float]]: ...
+    def dataType(self) -> Qgis.DataType: ...
+    @staticmethod
+    def typeIsColor(type: Qgis.DataType) -> bool: ...
+    @staticmethod
+    def typeIsComplex(type: Qgis.DataType) -> bool: ...
+    @staticmethod
+    def typeIsNumeric(type: Qgis.DataType) -> bool: ...
+    def dataTypeSize(self) -> int: ...
+    @staticmethod
+    def typeSize(dataType: Qgis.DataType) -> int: ...
+    def isEmpty(self) -> bool: ...
+    def setValid(self, valid: bool) -> None: ...
+    def isValid(self) -> bool: ...
+    def reset(self, dataType: Qgis.DataType, width: int, height: int) -> bool: ...
+
+
+class QgsRasterChecker(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterChecker') -> None: ...
+
+    def runTest(self, verifiedKey: typing.Optional[str], verifiedUri: typing.Optional[str], expectedKey: typing.Optional[str], expectedUri: typing.Optional[str]) -> bool: ...
+    def report(self) -> str: ...
+
+
+class QgsRasterContourRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface]) -> None: ...
+
+    def setDownscale(self, scale: float) -> None: ...
+    def downscale(self) -> float: ...
+    def setContourIndexSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def contourIndexSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setContourIndexInterval(self, interval: float) -> None: ...
+    def contourIndexInterval(self) -> float: ...
+    def setContourSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def contourSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setContourInterval(self, interval: float) -> None: ...
+    def contourInterval(self) -> float: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def usesBands(self) -> list[int]: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsRasterContourRenderer']: ...
+
+
+class QgsImageFetcher(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    error: typing.ClassVar[QtCore.pyqtSignal]
+    progress: typing.ClassVar[QtCore.pyqtSignal]
+    finish: typing.ClassVar[QtCore.pyqtSignal]
+    def start(self) -> None: ...
+
+
+class QgsRasterDataProvider(QgsDataProvider, QgsRasterInterface):
+
+    class TransformType(int):
+        TransformImageToLayer = ... # type: QgsRasterDataProvider.TransformType
+        TransformLayerToImage = ... # type: QgsRasterDataProvider.TransformType
+
+    class VirtualRasterInputLayers(PyQt5.sip.wrapper):
+
+        name = ... # type: typing.Optional[str]
+        provider = ... # type: typing.Optional[str]
+        uri = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterDataProvider.VirtualRasterInputLayers') -> None: ...
+
+    class VirtualRasterParameters(PyQt5.sip.wrapper):
+
+        crs = ... # type: QgsCoordinateReferenceSystem
+        extent = ... # type: QgsRectangle
+        formula = ... # type: typing.Optional[str]
+        height = ... # type: int
+        rInputLayers = ... # type: collections.abc.Iterable['QgsRasterDataProvider.VirtualRasterInputLayers']
+        width = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterDataProvider.VirtualRasterParameters') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], providerOptions: QgsDataProvider.ProviderOptions = ..., flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+
+    def copyBaseSettings(self, other: 'QgsRasterDataProvider') -> None: ...
+    def userNoDataValuesContains(self, bandNo: int, value: float) -> bool: ...
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def bandDescription(self, bandNumber: int) -> str: ...
+    def readNativeAttributeTable(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def writeNativeAttributeTable(self) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def readFileBasedAttributeTable(self, bandNumber: int, path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def writeFileBasedAttributeTable(self, bandNumber: int, path: typing.Optional[str]) -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def removeAttributeTable(self, bandNumber: int) -> None: ...
+    def setAttributeTable(self, bandNumber: int, attributeTable: typing.Optional[QgsRasterAttributeTable]) -> None: ...
+    def attributeTable(self, bandNumber: int) -> typing.Optional[QgsRasterAttributeTable]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def readXml(self, filterElem: QtXml.QDomElement) -> None: ...
+    def maxOversampling(self) -> float: ...
+    def setMaxOversampling(self, factor: float) -> bool: ...
+    def zoomedOutResamplingMethod(self) -> Qgis.RasterResamplingMethod: ...
+    def setZoomedOutResamplingMethod(self, method: Qgis.RasterResamplingMethod) -> bool: ...
+    def zoomedInResamplingMethod(self) -> Qgis.RasterResamplingMethod: ...
+    def setZoomedInResamplingMethod(self, method: Qgis.RasterResamplingMethod) -> bool: ...
+    def isProviderResamplingEnabled(self) -> bool: ...
+    def enableProviderResampling(self, enable: bool) -> bool: ...
+    def transformCoordinates(self, point: QgsPoint, type: 'QgsRasterDataProvider.TransformType') -> QgsPoint: ...
+    def ignoreExtents(self) -> bool: ...
+    def nativeResolutions(self) -> list[float]: ...
+    def stepHeight(self) -> int: ...
+    def stepWidth(self) -> int: ...
+    @staticmethod
+    def identifyFormatToCapability(format: Qgis.RasterIdentifyFormat) -> Qgis.RasterInterfaceCapability: ...
+    @staticmethod
+    def identifyFormatLabel(format: Qgis.RasterIdentifyFormat) -> str: ...
+    @staticmethod
+    def identifyFormatFromName(formatName: typing.Optional[str]) -> Qgis.RasterIdentifyFormat: ...
+    @staticmethod
+    def identifyFormatName(format: Qgis.RasterIdentifyFormat) -> str: ...
+    def validatePyramidsConfigOptions(self, pyramidsFormat: Qgis.RasterPyramidFormat, configOptions: collections.abc.Iterable[typing.Optional[str]], fileFormat: typing.Optional[str]) -> str: ...
+    def validateCreationOptions(self, createOptions: collections.abc.Iterable[typing.Optional[str]], format: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def encodeVirtualRasterProviderUri(parts: 'QgsRasterDataProvider.VirtualRasterParameters') -> str: ...
+    @staticmethod
+    def decodeVirtualRasterProviderUri(uri: typing.Optional[str]) -> typing.Tuple['QgsRasterDataProvider.VirtualRasterParameters', typing.Optional[bool]]: ...
+    @staticmethod
+    def pyramidResamplingMethods(providerKey: typing.Optional[str]) -> list[tuple[str, str]]: ...
+    def remove(self) -> bool: ...
+    def setNoDataValue(self, bandNo: int, noDataValue: float) -> bool: ...
+    @staticmethod
+    def create(providerKey: typing.Optional[str], uri: typing.Optional[str], format: typing.Optional[str], nBands: int, type: Qgis.DataType, width: int, height: int, crs: QgsCoordinateReferenceSystem, createOptions: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[typing.Optional['QgsRasterDataProvider'], typing.Optional[float]]: ...
+    def writeBlock(self, block: typing.Optional[QgsRasterBlock], band: int, xOffset: int = ..., yOffset: int = ...) -> bool: ...
+    def write(self, data: typing.Optional[PyQt5.sip.voidptr], band: int, width: int, height: int, xOffset: int, yOffset: int) -> bool: ...
+    def setEditable(self, enabled: bool) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def dataTimestamp(self) -> QtCore.QDateTime: ...
+    def timestamp(self) -> QtCore.QDateTime: ...
+    def setDpi(self, dpi: int) -> None: ...
+    def dpi(self) -> int: ...
+    def lastErrorFormat(self) -> str: ...
+    def lastError(self) -> str: ...
+    def lastErrorTitle(self) -> str: ...
+    def sample(self, point: QgsPointXY, band: int, boundingBox: QgsRectangle = ..., width: int = ..., height: int = ..., dpi: int = ...) -> typing.Tuple[float, typing.Optional[bool]]: ...
+    def identify(self, point: QgsPointXY, format: Qgis.RasterIdentifyFormat, boundingBox: QgsRectangle = ..., width: int = ..., height: int = ..., dpi: int = ...) -> 'QgsRasterIdentifyResult': ...
+    def hasPyramids(self) -> bool: ...
+    def buildPyramidList(self, overviewList: collections.abc.Iterable[int] = ...) -> list['QgsRasterPyramid']: ...
+    def buildPyramids(self, pyramidList: collections.abc.Iterable['QgsRasterPyramid'], resamplingMethod: typing.Optional[str] = ..., format: Qgis.RasterPyramidFormat = ..., configOptions: collections.abc.Iterable[typing.Optional[str]] = ..., feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> str: ...
+    def getLegendGraphicFetcher(self, mapSettings: typing.Optional[QgsMapSettings]) -> typing.Optional[QgsImageFetcher]: ...
+    def supportsLegendGraphic(self) -> bool: ...
+    def elevationProperties(self) -> typing.Optional['QgsRasterDataProviderElevationProperties']: ...
+    def temporalCapabilities(self) -> typing.Optional['QgsRasterDataProviderTemporalCapabilities']: ...
+    def subLayers(self) -> list[str]: ...
+    def colorTable(self, bandNo: int) -> list[QgsColorRampShader.ColorRampItem]: ...
+    def userNoDataValues(self, bandNo: int) -> list['QgsRasterRange']: ...
+    def setUserNoDataValue(self, bandNo: int, noData: collections.abc.Iterable['QgsRasterRange']) -> None: ...
+    def sourceNoDataValue(self, bandNo: int) -> float: ...
+    def setUseSourceNoDataValue(self, bandNo: int, use: bool) -> None: ...
+    def useSourceNoDataValue(self, bandNo: int) -> bool: ...
+    def sourceHasNoDataValue(self, bandNo: int) -> bool: ...
+    def block(self, bandNo: int, boundingBox: QgsRectangle, width: int, height: int, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    def maximumTileSize(self) -> QtCore.QSize: ...
+    def bandOffset(self, bandNo: int) -> float: ...
+    def bandScale(self, bandNo: int) -> float: ...
+    def colorInterpretationName(self, bandNo: int) -> str: ...
+    def reload(self) -> bool: ...
+    def colorName(self, colorInterpretation: Qgis.RasterColorInterpretation) -> str: ...
+    def colorInterpretation(self, bandNo: int) -> Qgis.RasterColorInterpretation: ...
+    def sourceDataType(self, bandNo: int) -> Qgis.DataType: ...
+    def fields(self) -> QgsFields: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def extent(self) -> QgsRectangle: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def providerCapabilities(self) -> Qgis.RasterProviderCapabilities: ...
+    def clone(self) -> typing.Optional['QgsRasterDataProvider']: ...
+    ResamplingMethod: typing.Type[Qgis.RasterResamplingMethod]
+    Nearest: Qgis.RasterResamplingMethod
+    Bilinear: Qgis.RasterResamplingMethod
+    Cubic: Qgis.RasterResamplingMethod
+    CubicSpline: Qgis.RasterResamplingMethod
+    Lanczos: Qgis.RasterResamplingMethod
+    Average: Qgis.RasterResamplingMethod
+    Mode: Qgis.RasterResamplingMethod
+    Gauss: Qgis.RasterResamplingMethod
+    ProviderCapability: typing.Type[Qgis.RasterProviderCapability]
+    NoProviderCapabilities: Qgis.RasterProviderCapability
+    ReadLayerMetadata: Qgis.RasterProviderCapability
+    WriteLayerMetadata: Qgis.RasterProviderCapability
+    ProviderHintBenefitsFromResampling: Qgis.RasterProviderCapability
+    ProviderHintCanPerformProviderResampling: Qgis.RasterProviderCapability
+    ReloadData: Qgis.RasterProviderCapability
+    DpiDependentData: Qgis.RasterProviderCapability
+    NativeRasterAttributeTable: Qgis.RasterProviderCapability
+    BuildPyramids: Qgis.RasterProviderCapability
+    ProviderCapabilities: typing.Type[Qgis.RasterProviderCapabilities]
+
+
+class QgsRasterDataProviderElevationProperties(QgsDataProviderElevationProperties):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterDataProviderElevationProperties') -> None: ...
+
+
+class QgsRasterDataProviderTemporalCapabilities(QgsDataProviderTemporalCapabilities):
+
+    @typing.overload
+    def __init__(self, enabled: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterDataProviderTemporalCapabilities') -> None: ...
+
+    def setDefaultInterval(self, interval: QgsInterval) -> None: ...
+    def defaultInterval(self) -> QgsInterval: ...
+    def requestedTemporalRange(self) -> QgsDateTimeRange: ...
+    def availableReferenceTemporalRange(self) -> QgsDateTimeRange: ...
+    def setAvailableReferenceTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def allAvailableTemporalRanges(self) -> list[QgsDateTimeRange]: ...
+    def setAllAvailableTemporalRanges(self, ranges: collections.abc.Iterable[QgsDateTimeRange]) -> None: ...
+    def availableTemporalRange(self) -> QgsDateTimeRange: ...
+    def setAvailableTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def setIntervalHandlingMethod(self, method: Qgis.TemporalIntervalMatchMethod) -> None: ...
+    def intervalHandlingMethod(self) -> Qgis.TemporalIntervalMatchMethod: ...
+    def setFlags(self, flags: typing.Union[Qgis.RasterTemporalCapabilityFlags, Qgis.RasterTemporalCapabilityFlag]) -> None: ...
+    def flags(self) -> Qgis.RasterTemporalCapabilityFlags: ...
+    IntervalHandlingMethod: typing.Type[Qgis.TemporalIntervalMatchMethod]
+    MatchUsingWholeRange: Qgis.TemporalIntervalMatchMethod
+    MatchExactUsingStartOfRange: Qgis.TemporalIntervalMatchMethod
+    MatchExactUsingEndOfRange: Qgis.TemporalIntervalMatchMethod
+    FindClosestMatchToStartOfRange: Qgis.TemporalIntervalMatchMethod
+    FindClosestMatchToEndOfRange: Qgis.TemporalIntervalMatchMethod
+
+
+class QgsRasterDrawer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, iterator: typing.Optional['QgsRasterIterator'], dpiTarget: float) -> None: ...
+    @typing.overload
+    def __init__(self, iterator: typing.Optional['QgsRasterIterator']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterDrawer') -> None: ...
+
+    @typing.overload
+    def draw(self, p: typing.Optional[QtGui.QPainter], viewPort: typing.Optional['QgsRasterViewPort'], qgsMapToPixel: typing.Optional[QgsMapToPixel], feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> None: ...
+    @typing.overload
+    def draw(self, context: QgsRenderContext, viewPort: typing.Optional['QgsRasterViewPort'], feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> None: ...
+
+
+class QgsRasterFileWriter(PyQt5.sip.wrapper):
+
+    class RasterFormatOption(int):
+        SortRecommended = ... # type: QgsRasterFileWriter.RasterFormatOption
+
+    class RasterFormatOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __xor__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __ior__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __or__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __iand__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __and__(self, f: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption']) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __invert__(self) -> 'QgsRasterFileWriter.RasterFormatOptions': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class FilterFormatDetails(PyQt5.sip.wrapper):
+
+        driverName = ... # type: typing.Optional[str]
+        filterString = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterFileWriter.FilterFormatDetails') -> None: ...
+
+    @typing.overload
+    def __init__(self, outputUrl: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterFileWriter') -> None: ...
+
+    @staticmethod
+    def extensionsForFormat(format: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def driverForExtension(extension: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def supportedFormatExtensions(options: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption'] = ...) -> list[str]: ...
+    @staticmethod
+    def supportedFiltersAndFormats(options: typing.Union['QgsRasterFileWriter.RasterFormatOptions', 'QgsRasterFileWriter.RasterFormatOption'] = ...) -> list['QgsRasterFileWriter.FilterFormatDetails']: ...
+    @staticmethod
+    def filterForDriver(driverName: typing.Optional[str]) -> str: ...
+    def pyramidsConfigOptions(self) -> list[str]: ...
+    def setPyramidsConfigOptions(self, list: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setCreationOptions(self, options: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def creationOptions(self) -> list[str]: ...
+    @deprecated("""""")
+    def createOptions(self) -> list[str]: ...
+    @deprecated("""""")
+    def setCreateOptions(self, list: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def maxTileHeight(self) -> int: ...
+    def setMaxTileHeight(self, h: int) -> None: ...
+    def setPyramidsFormat(self, f: Qgis.RasterPyramidFormat) -> None: ...
+    def pyramidsFormat(self) -> Qgis.RasterPyramidFormat: ...
+    def setPyramidsResampling(self, str: typing.Optional[str]) -> None: ...
+    def pyramidsResampling(self) -> str: ...
+    def setPyramidsList(self, list: collections.abc.Iterable[int]) -> None: ...
+    def pyramidsList(self) -> list[int]: ...
+    def setBuildPyramidsFlag(self, f: Qgis.RasterBuildPyramidOption) -> None: ...
+    def buildPyramidsFlag(self) -> Qgis.RasterBuildPyramidOption: ...
+    def maxTileWidth(self) -> int: ...
+    def setMaxTileWidth(self, w: int) -> None: ...
+    def tiledMode(self) -> bool: ...
+    def setTiledMode(self, t: bool) -> None: ...
+    def outputProviderKey(self) -> str: ...
+    def setOutputProviderKey(self, key: typing.Optional[str]) -> None: ...
+    def outputFormat(self) -> str: ...
+    def setOutputFormat(self, format: typing.Optional[str]) -> None: ...
+    def outputUrl(self) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeRaster(self, pipe: typing.Optional['QgsRasterPipe'], nCols: int, nRows: int, outputExtent: QgsRectangle, crs: QgsCoordinateReferenceSystem, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> Qgis.RasterFileWriterResult: ...
+    @typing.overload
+    def writeRaster(self, pipe: typing.Optional['QgsRasterPipe'], nCols: int, nRows: int, outputExtent: QgsRectangle, crs: QgsCoordinateReferenceSystem, transformContext: QgsCoordinateTransformContext, feedback: typing.Optional['QgsRasterBlockFeedback'] = ...) -> Qgis.RasterFileWriterResult: ...
+    def createMultiBandRaster(self, dataType: Qgis.DataType, width: int, height: int, extent: QgsRectangle, crs: QgsCoordinateReferenceSystem, nBands: int) -> typing.Optional[QgsRasterDataProvider]: ...
+    def createOneBandRaster(self, dataType: Qgis.DataType, width: int, height: int, extent: QgsRectangle, crs: QgsCoordinateReferenceSystem) -> typing.Optional[QgsRasterDataProvider]: ...
+    Mode: typing.Type[Qgis.RasterExportType]
+    Raw: Qgis.RasterExportType
+    Image: Qgis.RasterExportType
+    WriterError: typing.Type[Qgis.RasterFileWriterResult]
+    NoError: Qgis.RasterFileWriterResult
+    SourceProviderError: Qgis.RasterFileWriterResult
+    DestProviderError: Qgis.RasterFileWriterResult
+    CreateDatasourceError: Qgis.RasterFileWriterResult
+    WriteError: Qgis.RasterFileWriterResult
+    NoDataConflict: Qgis.RasterFileWriterResult
+    WriteCanceled: Qgis.RasterFileWriterResult
+
+
+class QgsRasterFileWriterTask(QgsTask):
+
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, writer: QgsRasterFileWriter, pipe: typing.Optional['QgsRasterPipe'], columns: int, rows: int, outputExtent: QgsRectangle, crs: QgsCoordinateReferenceSystem) -> None: ...
+    @typing.overload
+    def __init__(self, writer: QgsRasterFileWriter, pipe: typing.Optional['QgsRasterPipe'], columns: int, rows: int, outputExtent: QgsRectangle, crs: QgsCoordinateReferenceSystem, transformContext: QgsCoordinateTransformContext) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    writeComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+
+
+class QgsRasterHistogram(PyQt5.sip.wrapper):
+
+    bandNumber = ... # type: int
+    binCount = ... # type: int
+    extent = ... # type: QgsRectangle
+    height = ... # type: int
+    histogramVector = ... # type: collections.abc.Iterable[int]
+    includeOutOfRange = ... # type: bool
+    maximum = ... # type: float
+    minimum = ... # type: float
+    nonNullCount = ... # type: int
+    valid = ... # type: bool
+    width = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterHistogram') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsRasterIdentifyResult(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, format: Qgis.RasterIdentifyFormat, results: dict[int, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self, error: QgsError) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterIdentifyResult') -> None: ...
+
+    def setError(self, error: QgsError) -> None: ...
+    def error(self) -> QgsError: ...
+    def params(self) -> dict[str, typing.Any]: ...
+    def setParams(self, params: dict[typing.Optional[str], typing.Any]) -> None: ...
+    def results(self) -> dict[int, typing.Any]: ...
+    def format(self) -> Qgis.RasterIdentifyFormat: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsRasterBlockFeedback(QgsFeedback):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setRenderContext(self, renderContext: QgsRenderContext) -> None: ...
+    def renderContext(self) -> QgsRenderContext: ...
+    def errors(self) -> list[str]: ...
+    def appendError(self, error: typing.Optional[str]) -> None: ...
+    def setRenderPartialOutput(self, enable: bool) -> None: ...
+    def renderPartialOutput(self) -> bool: ...
+    def setPreviewOnly(self, preview: bool) -> None: ...
+    def isPreviewOnly(self) -> bool: ...
+    def onNewData(self) -> None: ...
+
+
+class QgsRasterIterator(PyQt5.sip.wrapper):
+
+    DEFAULT_MAXIMUM_TILE_HEIGHT = ... # type: int
+    DEFAULT_MAXIMUM_TILE_WIDTH = ... # type: int
+
+    @typing.overload
+    def __init__(self, input: typing.Optional[QgsRasterInterface], tileOverlapPixels: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterIterator') -> None: ...
+
+    def progress(self, bandNumber: int) -> float: ...
+    def blockCount(self) -> int: ...
+    def blockCountHeight(self) -> int: ...
+    def blockCountWidth(self) -> int: ...
+    def maximumTileHeight(self) -> int: ...
+    def setMaximumTileHeight(self, h: int) -> None: ...
+    def maximumTileWidth(self) -> int: ...
+    def setMaximumTileWidth(self, w: int) -> None: ...
+    def input(self) -> typing.Optional[QgsRasterInterface]: ...
+    def stopRasterRead(self, bandNumber: int) -> None: ...
+    def readNextRasterPart(self, bandNumber: int) -> typing.Tuple[bool, int, int, typing.Optional[QgsRasterBlock], int, int]: ...
+    def next(self, bandNumber: int) -> typing.Tuple[bool, int, int, int, int, QgsRectangle]: ...
+    def startRasterRead(self, bandNumber: int, nCols: int, nRows: int, extent: QgsRectangle, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> None: ...
+    @staticmethod
+    def subRegion(rasterExtent: QgsRectangle, rasterWidth: int, rasterHeight: int, subRegion: QgsRectangle, resamplingFactor: int = ...) -> typing.Tuple[QgsRectangle, int, int, int, int]: ...
+    def snapToPixelFactor(self) -> int: ...
+    def setSnapToPixelFactor(self, factor: int) -> None: ...
+
+
+class QgsAbstractRasterLayerLabeling(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def toSld(self, parent: QtXml.QDomNode, props: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def createFromElement(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsAbstractRasterLayerLabeling']: ...
+    def isInScaleRange(self, scale: float) -> bool: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsAbstractRasterLayerLabeling']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def defaultLabelingForLayer(layer: typing.Optional['QgsRasterLayer']) -> typing.Optional['QgsAbstractRasterLayerLabeling']: ...
+
+
+class QgsRasterLayerSimpleLabeling(QgsAbstractRasterLayerLabeling):
+
+    def __init__(self) -> None: ...
+
+    def setResampleOver(self, pixels: int) -> None: ...
+    def resampleOver(self) -> int: ...
+    def setResampleMethod(self, method: Qgis.RasterResamplingMethod) -> None: ...
+    def resampleMethod(self) -> Qgis.RasterResamplingMethod: ...
+    def isInScaleRange(self, scale: float) -> bool: ...
+    def hasScaleBasedVisibility(self) -> bool: ...
+    def setScaleBasedVisibility(self, enabled: bool) -> None: ...
+    def setMinimumScale(self, scale: float) -> None: ...
+    def minimumScale(self) -> float: ...
+    def setMaximumScale(self, scale: float) -> None: ...
+    def maximumScale(self) -> float: ...
+    def setZIndex(self, index: float) -> None: ...
+    def zIndex(self) -> float: ...
+    def setThinningSettings(self, settings: QgsLabelThinningSettings) -> None: ...
+    def thinningSettings(self) -> QgsLabelThinningSettings: ...
+    def setPlacementSettings(self, settings: QgsLabelPlacementSettings) -> None: ...
+    def placementSettings(self) -> QgsLabelPlacementSettings: ...
+    def setPriority(self, priority: float) -> None: ...
+    def priority(self) -> float: ...
+    def setBand(self, band: int) -> None: ...
+    def band(self) -> int: ...
+    def setNumericFormat(self, format: typing.Optional[QgsNumericFormat]) -> None: ...
+    def numericFormat(self) -> typing.Optional[QgsNumericFormat]: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsRasterLayerSimpleLabeling']: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def requiresAdvancedEffects(self) -> bool: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional['QgsRasterLayerSimpleLabeling']: ...
+    def type(self) -> str: ...
+
+
+class QgsRasterLayer(QgsMapLayer, QgsAbstractProfileSource):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadDefaultStyle = ... # type: bool
+        skipCrsValidation = ... # type: bool
+        transformContext = ... # type: QgsCoordinateTransformContext
+
+        @typing.overload
+        def __init__(self, loadDefaultStyle: bool = ..., transformContext: QgsCoordinateTransformContext = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterLayer.LayerOptions') -> None: ...
+
+    MULTIPLE_BAND_MULTI_BYTE_ENHANCEMENT_ALGORITHM = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+    MULTIPLE_BAND_MULTI_BYTE_MIN_MAX_LIMITS = ... # type: Qgis.RasterRangeLimit
+    MULTIPLE_BAND_SINGLE_BYTE_ENHANCEMENT_ALGORITHM = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+    MULTIPLE_BAND_SINGLE_BYTE_MIN_MAX_LIMITS = ... # type: Qgis.RasterRangeLimit
+    SAMPLE_SIZE = ... # type: float
+    SINGLE_BAND_ENHANCEMENT_ALGORITHM = ... # type: QgsContrastEnhancement.ContrastEnhancementAlgorithm
+    SINGLE_BAND_MIN_MAX_LIMITS = ... # type: Qgis.RasterRangeLimit
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], baseName: typing.Optional[str] = ..., providerType: typing.Optional[str] = ..., options: 'QgsRasterLayer.LayerOptions' = ...) -> None: ...
+
+    def decodedSource(self, source: typing.Optional[str], provider: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, a0: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readXml(self, layer_node: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    subsetStringChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setTransformContext(self, transformContext: QgsCoordinateTransformContext) -> None: ...
+    def showStatusMessage(self, message: typing.Optional[str]) -> None: ...
+    def elevationProperties(self) -> typing.Optional[QgsMapLayerElevationProperties]: ...
+    def temporalProperties(self) -> typing.Optional[QgsMapLayerTemporalProperties]: ...
+    def ignoreExtents(self) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSld(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], props: dict[str, typing.Any] = ...) -> bool: ...
+    @typing.overload
+    def writeSld(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsSldExportContext) -> bool: ...
+    def setLabeling(self, labeling: typing.Optional[QgsAbstractRasterLayerLabeling]) -> None: ...
+    def labeling(self) -> typing.Optional[QgsAbstractRasterLayerLabeling]: ...
+    def setLabelsEnabled(self, enabled: bool) -> None: ...
+    def labelsEnabled(self) -> bool: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def timestamp(self) -> QtCore.QDateTime: ...
+    def setSubLayerVisibility(self, name: typing.Optional[str], vis: bool) -> None: ...
+    def setLayerOrder(self, layers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def previewAsImage(self, size: QtCore.QSize, bgColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., format: QtGui.QImage.Format = ...) -> QtGui.QImage: ...
+    def subLayers(self) -> list[str]: ...
+    def setDefaultContrastEnhancement(self) -> None: ...
+    def setSubsetString(self, subset: typing.Optional[str]) -> bool: ...
+    def subsetString(self) -> str: ...
+    def setContrastEnhancement(self, algorithm: QgsContrastEnhancement.ContrastEnhancementAlgorithm, limits: Qgis.RasterRangeLimit = ..., extent: QgsRectangle = ..., sampleSize: int = ..., generateLookupTableFlag: bool = ...) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def rasterUnitsPerPixelY(self) -> float: ...
+    def rasterUnitsPerPixelX(self) -> float: ...
+    def paletteAsPixmap(self, bandNumber: int = ...) -> QtGui.QPixmap: ...
+    def properties(self) -> Qgis.MapLayerProperties: ...
+    def htmlMetadata(self) -> str: ...
+    def isSpatial(self) -> bool: ...
+    @deprecated("""""")
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def draw(self, theQPainter: typing.Optional[QtGui.QPainter], myRasterViewPort: typing.Optional['QgsRasterViewPort'], qgsMapToPixel: typing.Optional[QgsMapToPixel] = ...) -> None: ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def reload(self) -> None: ...
+    def constDataProvider(self) -> typing.Optional[QgsRasterDataProvider]: ...
+    def dataProvider(self) -> typing.Optional[QgsRasterDataProvider]: ...
+    def canCreateRasterAttributeTable(self) -> bool: ...
+    def attributeTableCount(self) -> int: ...
+    def attributeTable(self, bandNumber: int) -> typing.Optional[QgsRasterAttributeTable]: ...
+    def bandName(self, bandNoInt: int) -> str: ...
+    def bandCount(self) -> int: ...
+    def height(self) -> int: ...
+    def width(self) -> int: ...
+    def pipe(self) -> typing.Optional['QgsRasterPipe']: ...
+    def resamplingStage(self) -> Qgis.RasterResamplingStage: ...
+    def setResamplingStage(self, stage: Qgis.RasterResamplingStage) -> None: ...
+    def hueSaturationFilter(self) -> typing.Optional[QgsHueSaturationFilter]: ...
+    def brightnessFilter(self) -> typing.Optional[QgsBrightnessContrastFilter]: ...
+    def resampleFilter(self) -> typing.Optional['QgsRasterResampleFilter']: ...
+    def renderer(self) -> typing.Optional[QgsRasterRenderer]: ...
+    def setRenderer(self, renderer: typing.Optional[QgsRasterRenderer]) -> None: ...
+    def rasterType(self) -> Qgis.RasterLayerType: ...
+    @typing.overload
+    @deprecated("""""")
+    def setDataProvider(self, provider: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def setDataProvider(self, provider: typing.Optional[str], options: QgsDataProvider.ProviderOptions, flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+    @staticmethod
+    def lastModified(name: typing.Optional[str]) -> QtCore.QDateTime: ...
+    @typing.overload
+    @staticmethod
+    def isValidRasterFileName(fileNameQString: typing.Optional[str], retError: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def isValidRasterFileName(fileNameQString: typing.Optional[str]) -> bool: ...
+    def createProfileGenerator(self, request: QgsProfileRequest) -> typing.Optional[QgsAbstractProfileGenerator]: ...
+    def profileSource(self) -> typing.Optional[QgsAbstractProfileSource]: ...
+    def clone(self) -> typing.Optional['QgsRasterLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+    LayerType: typing.Type[Qgis.RasterLayerType]
+    GrayOrUndefined: Qgis.RasterLayerType
+    Palette: Qgis.RasterLayerType
+    Multiband: Qgis.RasterLayerType
+    ColorLayer: Qgis.RasterLayerType
+
+
+class QgsRasterLayerElevationProperties(QgsMapLayerElevationProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    @staticmethod
+    def layerLooksLikeDem(layer: typing.Optional[QgsRasterLayer]) -> bool: ...
+    def setElevationLimit(self, limit: float) -> None: ...
+    def elevationLimit(self) -> float: ...
+    def setProfileSymbology(self, symbology: Qgis.ProfileSurfaceSymbology) -> None: ...
+    def profileSymbology(self) -> Qgis.ProfileSurfaceSymbology: ...
+    def setProfileFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def profileFillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setProfileLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def profileLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def bandForElevationRange(self, layer: typing.Optional[QgsRasterLayer], range: QgsDoubleRange) -> int: ...
+    def elevationRangeForPixelValue(self, layer: typing.Optional[QgsRasterLayer], band: int, pixelValue: float) -> QgsDoubleRange: ...
+    def setFixedRangePerBand(self, ranges: dict[int, QgsDoubleRange]) -> None: ...
+    def fixedRangePerBand(self) -> dict[int, QgsDoubleRange]: ...
+    def setFixedRange(self, range: QgsDoubleRange) -> None: ...
+    def fixedRange(self) -> QgsDoubleRange: ...
+    def setBandNumber(self, band: int) -> None: ...
+    def bandNumber(self) -> int: ...
+    def setMode(self, mode: Qgis.RasterElevationMode) -> None: ...
+    def mode(self) -> Qgis.RasterElevationMode: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def flags(self) -> QgsMapLayerElevationProperties.Flags: ...
+    def showByDefaultInElevationProfilePlots(self) -> bool: ...
+    def significantZValues(self, layer: typing.Optional[QgsMapLayer]) -> list[float]: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> QgsDoubleRange: ...
+    def isVisibleInZRange(self, range: QgsDoubleRange, layer: typing.Optional[QgsMapLayer] = ...) -> bool: ...
+    def htmlSummary(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsRasterLayerElevationProperties']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+
+
+class QgsRasterLayerTemporalProperties(QgsMapLayerTemporalProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., enabled: bool = ...) -> None: ...
+
+    def setDefaultsFromDataProviderTemporalCapabilities(self, capabilities: typing.Optional[QgsDataProviderTemporalCapabilities]) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def setTemporalRepresentationScale(self, scale: QgsInterval) -> None: ...
+    def temporalRepresentationScale(self) -> QgsInterval: ...
+    def setTemporalRepresentationOffset(self, offset: typing.Union[QtCore.QDateTime, datetime.datetime]) -> None: ...
+    def temporalRepresentationOffset(self) -> QtCore.QDateTime: ...
+    def setBandNumber(self, number: int) -> None: ...
+    def bandNumber(self) -> int: ...
+    def filteredBandsForTemporalRange(self, layer: typing.Optional[QgsRasterLayer], range: QgsDateTimeRange) -> list[int]: ...
+    def bandForTemporalRange(self, layer: typing.Optional[QgsRasterLayer], range: QgsDateTimeRange) -> int: ...
+    def setFixedRangePerBand(self, ranges: dict[int, QgsDateTimeRange]) -> None: ...
+    def fixedRangePerBand(self) -> dict[int, QgsDateTimeRange]: ...
+    def fixedTemporalRange(self) -> QgsDateTimeRange: ...
+    def setFixedTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def setIntervalHandlingMethod(self, method: Qgis.TemporalIntervalMatchMethod) -> None: ...
+    def intervalHandlingMethod(self) -> Qgis.TemporalIntervalMatchMethod: ...
+    def flags(self) -> QgsTemporalProperty.Flags: ...
+    def setMode(self, mode: Qgis.RasterTemporalMode) -> None: ...
+    def mode(self) -> Qgis.RasterTemporalMode: ...
+    def allTemporalRanges(self, layer: typing.Optional[QgsMapLayer]) -> list[QgsDateTimeRange]: ...
+    def isVisibleInTemporalRange(self, range: QgsDateTimeRange) -> bool: ...
+    TemporalMode: typing.Type[Qgis.RasterTemporalMode]
+    ModeFixedTemporalRange: Qgis.RasterTemporalMode
+    ModeTemporalRangeFromDataProvider: Qgis.RasterTemporalMode
+    ModeRedrawLayerOnly: Qgis.RasterTemporalMode
+    FixedRangePerBand: Qgis.RasterTemporalMode
+    RepresentsTemporalValues: Qgis.RasterTemporalMode
+    FixedDateTime: Qgis.RasterTemporalMode
+
+
+class QgsRasterLayerUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterLayerUtils') -> None: ...
+
+    @staticmethod
+    def alignRasterExtent(extent: QgsRectangle, origin: QgsPointXY, pixelSizeX: float, pixelSizeY: float) -> QgsRectangle: ...
+    @staticmethod
+    def renderedBandForElevationAndTemporalRange(layer: typing.Optional[QgsRasterLayer], temporalRange: QgsDateTimeRange, elevationRange: QgsDoubleRange) -> typing.Tuple[int, bool]: ...
+
+
+class QgsRasterMinMaxOrigin(PyQt5.sip.wrapper):
+
+    CUMULATIVE_CUT_LOWER = ... # type: float
+    CUMULATIVE_CUT_UPPER = ... # type: float
+    DEFAULT_STDDEV_FACTOR = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterMinMaxOrigin') -> None: ...
+
+    def __ne__(self, other: object): ...
+    @staticmethod
+    def statAccuracyFromString(accuracy: typing.Optional[str]) -> Qgis.RasterRangeAccuracy: ...
+    @staticmethod
+    def statAccuracyString(accuracy: Qgis.RasterRangeAccuracy) -> str: ...
+    @staticmethod
+    def extentFromString(extent: typing.Optional[str]) -> Qgis.RasterRangeExtent: ...
+    @staticmethod
+    def extentString(extent: Qgis.RasterRangeExtent) -> str: ...
+    @staticmethod
+    def limitsFromString(limits: typing.Optional[str]) -> Qgis.RasterRangeLimit: ...
+    @staticmethod
+    def limitsString(limits: Qgis.RasterRangeLimit) -> str: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def setStdDevFactor(self, val: float) -> None: ...
+    def setCumulativeCutUpper(self, val: float) -> None: ...
+    def setCumulativeCutLower(self, val: float) -> None: ...
+    def setStatAccuracy(self, accuracy: Qgis.RasterRangeAccuracy) -> None: ...
+    def setExtent(self, extent: Qgis.RasterRangeExtent) -> None: ...
+    def setLimits(self, limits: Qgis.RasterRangeLimit) -> None: ...
+    def stdDevFactor(self) -> float: ...
+    def cumulativeCutUpper(self) -> float: ...
+    def cumulativeCutLower(self) -> float: ...
+    def statAccuracy(self) -> Qgis.RasterRangeAccuracy: ...
+    def extent(self) -> Qgis.RasterRangeExtent: ...
+    def limits(self) -> Qgis.RasterRangeLimit: ...
+    def __eq__(self, other: object): ...
+    Limits: typing.Type[Qgis.RasterRangeLimit]
+    None_: Qgis.RasterRangeLimit
+    MinMax: Qgis.RasterRangeLimit
+    StdDev: Qgis.RasterRangeLimit
+    CumulativeCut: Qgis.RasterRangeLimit
+    Extent: typing.Type[Qgis.RasterRangeExtent]
+    CurrentCanvas: Qgis.RasterRangeExtent
+    UpdatedCanvas: Qgis.RasterRangeExtent
+    StatAccuracy: typing.Type[Qgis.RasterRangeAccuracy]
+    Exact: Qgis.RasterRangeAccuracy
+    Estimated: Qgis.RasterRangeAccuracy
+
+
+class QgsRasterNuller(QgsRasterInterface):
+
+    class NoData(PyQt5.sip.wrapper):
+
+        max = ... # type: float
+        min = ... # type: float
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterNuller.NoData') -> None: ...
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+
+    def setOutputNoDataValue(self, bandNo: int, noData: float) -> None: ...
+    def noData(self, bandNo: int) -> list['QgsRasterRange']: ...
+    def setNoData(self, bandNo: int, noData: collections.abc.Iterable['QgsRasterRange']) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsRasterNuller']: ...
+
+
+class QgsRasterPipe(PyQt5.sip.wrapper):
+
+    class Property(int):
+        RendererOpacity = ... # type: QgsRasterPipe.Property
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    def evaluateDataDefinedProperties(self, context: QgsExpressionContext) -> None: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def resamplingStage(self) -> Qgis.RasterResamplingStage: ...
+    def setResamplingStage(self, stage: Qgis.RasterResamplingStage) -> None: ...
+    def nuller(self) -> typing.Optional[QgsRasterNuller]: ...
+    def projector(self) -> typing.Optional['QgsRasterProjector']: ...
+    def hueSaturationFilter(self) -> typing.Optional[QgsHueSaturationFilter]: ...
+    def brightnessFilter(self) -> typing.Optional[QgsBrightnessContrastFilter]: ...
+    def resampleFilter(self) -> typing.Optional['QgsRasterResampleFilter']: ...
+    def renderer(self) -> typing.Optional[QgsRasterRenderer]: ...
+    def provider(self) -> typing.Optional[QgsRasterDataProvider]: ...
+    def canSetOn(self, idx: int, on: bool) -> bool: ...
+    def setOn(self, idx: int, on: bool) -> bool: ...
+    def last(self) -> typing.Optional[QgsRasterInterface]: ...
+    def at(self, idx: int) -> typing.Optional[QgsRasterInterface]: ...
+    def size(self) -> int: ...
+    @typing.overload
+    def remove(self, idx: int) -> bool: ...
+    @typing.overload
+    def remove(self, interface: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def set(self, interface: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def replace(self, idx: int, interface: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def insert(self, idx: int, interface: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def moveToThread(self, thread: typing.Optional[QtCore.QThread]) -> None: ...
+    Role: typing.Type[Qgis.RasterPipeInterfaceRole]
+    UnknownRole: Qgis.RasterPipeInterfaceRole
+    ProviderRole: Qgis.RasterPipeInterfaceRole
+    RendererRole: Qgis.RasterPipeInterfaceRole
+    BrightnessRole: Qgis.RasterPipeInterfaceRole
+    ResamplerRole: Qgis.RasterPipeInterfaceRole
+    ProjectorRole: Qgis.RasterPipeInterfaceRole
+    NullerRole: Qgis.RasterPipeInterfaceRole
+    HueSaturationRole: Qgis.RasterPipeInterfaceRole
+    ResamplingStage: typing.Type[Qgis.RasterResamplingStage]
+    ResampleFilter: Qgis.RasterResamplingStage
+    Provider: Qgis.RasterResamplingStage
+    RendererOpacity: QgsRasterPipe.Property
+
+
+class QgsRasterProjector(QgsRasterInterface):
+
+    class Precision(int):
+        Approximate = ... # type: QgsRasterProjector.Precision
+        Exact = ... # type: QgsRasterProjector.Precision
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def extentSize(ct: QgsCoordinateTransform, srcExtent: QgsRectangle, srcXSize: int, srcYSize: int) -> typing.Tuple[bool, QgsRectangle, int, int]: ...
+    def destExtentSize(self, srcExtent: QgsRectangle, srcXSize: int, srcYSize: int) -> typing.Tuple[bool, QgsRectangle, int, int]: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    @staticmethod
+    def precisionLabel(precision: 'QgsRasterProjector.Precision') -> str: ...
+    def setPrecision(self, precision: 'QgsRasterProjector.Precision') -> None: ...
+    def precision(self) -> 'QgsRasterProjector.Precision': ...
+    def destinationCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    @typing.overload
+    @deprecated("""""")
+    def setCrs(self, srcCRS: QgsCoordinateReferenceSystem, destCRS: QgsCoordinateReferenceSystem, srcDatumTransform: int = ..., destDatumTransform: int = ...) -> None: ...
+    @typing.overload
+    def setCrs(self, srcCRS: QgsCoordinateReferenceSystem, destCRS: QgsCoordinateReferenceSystem, transformContext: QgsCoordinateTransformContext) -> None: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsRasterProjector']: ...
+
+
+class QgsRasterPyramid(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterPyramid') -> None: ...
+
+    def setBuild(self, build: bool) -> None: ...
+    def getBuild(self) -> bool: ...
+    def setExists(self, exists: bool) -> None: ...
+    def getExists(self) -> bool: ...
+    def getYDim(self) -> int: ...
+    def setYDim(self, dimension: int) -> None: ...
+    def getXDim(self) -> int: ...
+    def setXDim(self, dimension: int) -> None: ...
+    def setLevel(self, level: int) -> None: ...
+    def getLevel(self) -> int: ...
+    @property
+    def build(self) -> bool: ...
+    @build.setter
+    def build(self, build: bool) -> None: ...
+    @property
+    def exists(self) -> bool: ...
+    @exists.setter
+    def exists(self, exists: bool) -> None: ...
+    @property
+    def yDim(self) -> int: ...
+    @yDim.setter
+    def yDim(self, dimension: int) -> None: ...
+    @property
+    def xDim(self) -> int: ...
+    @xDim.setter
+    def xDim(self, dimension: int) -> None: ...
+    @property
+    def level(self) -> int: ...
+    @level.setter
+    def level(self, level: int) -> None: ...
+
+
+class QgsRasterRange(PyQt5.sip.wrapper):
+
+    class BoundsType(int):
+        IncludeMinAndMax = ... # type: QgsRasterRange.BoundsType
+        IncludeMax = ... # type: QgsRasterRange.BoundsType
+        IncludeMin = ... # type: QgsRasterRange.BoundsType
+        Exclusive = ... # type: QgsRasterRange.BoundsType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, min: float, max: float, bounds: 'QgsRasterRange.BoundsType' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterRange') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def asText(self) -> str: ...
+    def overlaps(self, other: 'QgsRasterRange') -> bool: ...
+    @typing.overload
+    def contains(self, value: float) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def contains(value: float, rangeList: collections.abc.Iterable['QgsRasterRange']) -> bool: ...
+    def __eq__(self, other: object): ...
+    def setBounds(self, type: 'QgsRasterRange.BoundsType') -> None: ...
+    def setMax(self, max: float) -> float: ...
+    def setMin(self, min: float) -> float: ...
+    def bounds(self) -> 'QgsRasterRange.BoundsType': ...
+    def max(self) -> float: ...
+    def min(self) -> float: ...
+
+
+class QgsRasterRendererRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterRendererRegistry') -> None: ...
+
+    def defaultRendererForDrawingStyle(self, drawingStyle: Qgis.RasterDrawingStyle, provider: typing.Optional[QgsRasterDataProvider]) -> typing.Optional[QgsRasterRenderer]: ...
+    def rendererCapabilities(self, rendererName: typing.Optional[str]) -> Qgis.RasterRendererCapabilities: ...
+    def renderersList(self) -> list[str]: ...
+
+
+class QgsRasterRendererUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterRendererUtils') -> None: ...
+
+    @staticmethod
+    def saveColorMapFile(path: typing.Optional[str], items: collections.abc.Iterable[QgsColorRampShader.ColorRampItem], type: Qgis.ShaderInterpolationMethod) -> bool: ...
+    @staticmethod
+    def parseColorMapFile(path: typing.Optional[str]) -> typing.Tuple[bool, list[QgsColorRampShader.ColorRampItem], Qgis.ShaderInterpolationMethod, list[str]]: ...
+
+
+class QgsRasterResampleFilter(QgsRasterInterface):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface] = ...) -> None: ...
+
+    def readXml(self, filterElem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def maxOversampling(self) -> float: ...
+    def setMaxOversampling(self, os: float) -> None: ...
+    def zoomedOutResampler(self) -> typing.Optional[QgsRasterResampler]: ...
+    def setZoomedOutResampler(self, r: typing.Optional[QgsRasterResampler]) -> None: ...
+    def zoomedInResampler(self) -> typing.Optional[QgsRasterResampler]: ...
+    def setZoomedInResampler(self, r: typing.Optional[QgsRasterResampler]) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    def dataType(self, bandNo: int) -> Qgis.DataType: ...
+    def bandCount(self) -> int: ...
+    def clone(self) -> typing.Optional['QgsRasterResampleFilter']: ...
+
+
+class QgsRasterShader(PyQt5.sip.wrapper):
+
+    def __init__(self, minimumValue: float = ..., maximumValue: float = ...) -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parent: QtXml.QDomElement, context: QgsReadWriteContext = ...) -> None: ...
+    def setMinimumValue(self, value: float) -> None: ...
+    def setMaximumValue(self, value: float) -> None: ...
+    def setRasterShaderFunction(self, function: typing.Optional[QgsRasterShaderFunction]) -> None: ...
+    @typing.overload
+    def shade(self, value: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    @typing.overload
+    def shade(self, redValue: float, greenValue: float, blueValue: float, alphaValue: float) -> typing.Tuple[bool, typing.Optional[int], typing.Optional[int], typing.Optional[int], typing.Optional[int]]: ...
+    def rasterShaderFunction(self) -> typing.Optional[QgsRasterShaderFunction]: ...
+    def minimumValue(self) -> float: ...
+    def maximumValue(self) -> float: ...
+
+
+class QgsRasterTransparency(PyQt5.sip.wrapper):
+
+    class TransparentThreeValuePixel(PyQt5.sip.wrapper):
+
+        blue = ... # type: float
+        fuzzyToleranceBlue = ... # type: float
+        fuzzyToleranceGreen = ... # type: float
+        fuzzyToleranceRed = ... # type: float
+        green = ... # type: float
+        opacity = ... # type: float
+        red = ... # type: float
+
+        @typing.overload
+        def __init__(self, red: float = ..., green: float = ..., blue: float = ..., opacity: float = ..., fuzzyToleranceRed: float = ..., fuzzyToleranceGreen: float = ..., fuzzyToleranceBlue: float = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterTransparency.TransparentThreeValuePixel') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    class TransparentSingleValuePixel(PyQt5.sip.wrapper):
+
+        includeMaximum = ... # type: bool
+        includeMinimum = ... # type: bool
+        max = ... # type: float
+        min = ... # type: float
+        opacity = ... # type: float
+
+        @typing.overload
+        def __init__(self, minimum: float = ..., maximum: float = ..., opacity: float = ..., includeMinimum: bool = ..., includeMaximum: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRasterTransparency.TransparentSingleValuePixel') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterTransparency') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def isEmpty(self) -> bool: ...
+    def opacityForRgbValues(self, redValue: float, greenValue: float, blueValue: float) -> float: ...
+    def opacityForValue(self, value: float) -> float: ...
+    @typing.overload
+    @deprecated("""""")
+    def alphaValue(self, value: float, globalTransparency: int = ...) -> int: ...
+    @typing.overload
+    @deprecated("""""")
+    def alphaValue(self, redValue: float, greenValue: float, blueValue: float, globalTransparency: int = ...) -> int: ...
+    def setTransparentThreeValuePixelList(self, newList: collections.abc.Iterable['QgsRasterTransparency.TransparentThreeValuePixel']) -> None: ...
+    def setTransparentSingleValuePixelList(self, newList: collections.abc.Iterable['QgsRasterTransparency.TransparentSingleValuePixel']) -> None: ...
+    @typing.overload
+    def initializeTransparentPixelList(self, value: float) -> None: ...
+    @typing.overload
+    def initializeTransparentPixelList(self, redValue: float, greenValue: float, blueValue: float) -> None: ...
+    def transparentThreeValuePixelList(self) -> list['QgsRasterTransparency.TransparentThreeValuePixel']: ...
+    def transparentSingleValuePixelList(self) -> list['QgsRasterTransparency.TransparentSingleValuePixel']: ...
+
+
+class QgsRasterViewPort(PyQt5.sip.wrapper):
+
+    mBottomRightPoint = ... # type: QgsPointXY
+    mDestCRS = ... # type: QgsCoordinateReferenceSystem
+    mDrawnExtent = ... # type: QgsRectangle
+    mHeight = ... # type: int
+    mSrcCRS = ... # type: QgsCoordinateReferenceSystem
+    mTopLeftPoint = ... # type: QgsPointXY
+    mTransformContext = ... # type: QgsCoordinateTransformContext
+    mWidth = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRasterViewPort') -> None: ...
+
+
+class QgsSingleBandColorDataRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], band: int) -> None: ...
+
+    def usesBands(self) -> list[int]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    def setInput(self, input: typing.Optional[QgsRasterInterface]) -> bool: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsSingleBandColorDataRenderer']: ...
+
+
+class QgsSingleBandGrayRenderer(QgsRasterRenderer):
+
+    class Gradient(int):
+        BlackToWhite = ... # type: QgsSingleBandGrayRenderer.Gradient
+        WhiteToBlack = ... # type: QgsSingleBandGrayRenderer.Gradient
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], grayBand: int) -> None: ...
+
+    def setLegendSettings(self, settings: typing.Optional[QgsColorRampLegendNodeSettings]) -> None: ...
+    def legendSettings(self) -> typing.Optional[QgsColorRampLegendNodeSettings]: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def usesBands(self) -> list[int]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def gradient(self) -> 'QgsSingleBandGrayRenderer.Gradient': ...
+    def setGradient(self, gradient: 'QgsSingleBandGrayRenderer.Gradient') -> None: ...
+    def setContrastEnhancement(self, ce: typing.Optional[QgsContrastEnhancement]) -> None: ...
+    def contrastEnhancement(self) -> typing.Optional[QgsContrastEnhancement]: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    @deprecated("""""")
+    def setGrayBand(self, band: int) -> None: ...
+    @deprecated("""""")
+    def grayBand(self) -> int: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsSingleBandGrayRenderer']: ...
+
+
+class QgsSingleBandPseudoColorRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], band: int = ..., shader: typing.Optional[QgsRasterShader] = ...) -> None: ...
+
+    def setClassificationMax(self, max: float) -> None: ...
+    def setClassificationMin(self, min: float) -> None: ...
+    def classificationMax(self) -> float: ...
+    def classificationMin(self) -> float: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    @deprecated("""""")
+    def setBand(self, bandNo: int) -> None: ...
+    @deprecated("""""")
+    def band(self) -> int: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def usesBands(self) -> list[int]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendSymbologyItems(self) -> list[tuple[str, QtGui.QColor]]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def createShader(self, colorRamp: typing.Optional[QgsColorRamp] = ..., colorRampType: Qgis.ShaderInterpolationMethod = ..., classificationMode: Qgis.ShaderClassificationMethod = ..., classes: int = ..., clip: bool = ..., extent: QgsRectangle = ...) -> None: ...
+    def canCreateRasterAttributeTable(self) -> bool: ...
+    def constShader(self) -> typing.Optional[QgsRasterShader]: ...
+    def shader(self) -> typing.Optional[QgsRasterShader]: ...
+    def setShader(self, shader: typing.Optional[QgsRasterShader]) -> None: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsSingleBandPseudoColorRenderer']: ...
+
+
+class QgsRasterSingleColorRenderer(QgsRasterRenderer):
+
+    def __init__(self, input: typing.Optional[QgsRasterInterface], band: int, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+
+    def usesBands(self) -> list[int]: ...
+    def setInputBand(self, band: int) -> bool: ...
+    def inputBand(self) -> int: ...
+    def writeXml(self, doc: QtXml.QDomDocument, parentElem: QtXml.QDomElement) -> None: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def block(self, bandNo: int, extent: QgsRectangle, width: int, height: int, feedback: typing.Optional[QgsRasterBlockFeedback] = ...) -> typing.Optional[QgsRasterBlock]: ...
+    @staticmethod
+    def create(elem: QtXml.QDomElement, input: typing.Optional[QgsRasterInterface]) -> typing.Optional[QgsRasterRenderer]: ...
+    def flags(self) -> Qgis.RasterRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsRasterSingleColorRenderer']: ...
@@ -0,0 +1,351 @@
+# The PEP 484 type hints stub file for the _core.scalebar module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+from .numericformats import QgsNumericFormat
+from .symbology import QgsFillSymbol, QgsLineSymbol
+from .textrenderer import QgsTextFormat
+from .vector import QgsRenderContext
+
+
+class QgsScaleBarRenderer(PyQt5.sip.wrapper):
+
+    class Flag(int):
+        FlagUsesLineSymbol = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesFillSymbol = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesAlternateFillSymbol = ... # type: QgsScaleBarRenderer.Flag
+        FlagRespectsUnits = ... # type: QgsScaleBarRenderer.Flag
+        FlagRespectsMapUnitsPerScaleBarUnit = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesUnitLabel = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesSegments = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesLabelBarSpace = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesLabelVerticalPlacement = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesLabelHorizontalPlacement = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesAlignment = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesSubdivisions = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesDivisionSymbol = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesSubdivisionSymbol = ... # type: QgsScaleBarRenderer.Flag
+        FlagUsesSubdivisionsHeight = ... # type: QgsScaleBarRenderer.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __xor__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __ior__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __or__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __iand__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __and__(self, f: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']) -> 'QgsScaleBarRenderer.Flags': ...
+        def __invert__(self) -> 'QgsScaleBarRenderer.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ScaleBarContext(PyQt5.sip.wrapper):
+
+        flags = ... # type: typing.Union['QgsScaleBarRenderer.Flags', 'QgsScaleBarRenderer.Flag']
+        scale = ... # type: float
+        segmentWidth = ... # type: float
+        size = ... # type: QtCore.QSizeF
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsScaleBarRenderer.ScaleBarContext') -> None: ...
+
+        def isValid(self) -> bool: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScaleBarRenderer') -> None: ...
+
+    def segmentWidths(self, scaleContext: 'QgsScaleBarRenderer.ScaleBarContext', settings: 'QgsScaleBarSettings') -> list[float]: ...
+    @typing.overload
+    @deprecated("""""")
+    def segmentPositions(self, scaleContext: 'QgsScaleBarRenderer.ScaleBarContext', settings: 'QgsScaleBarSettings') -> list[float]: ...
+    @typing.overload
+    def segmentPositions(self, context: QgsRenderContext, scaleContext: 'QgsScaleBarRenderer.ScaleBarContext', settings: 'QgsScaleBarSettings') -> list[float]: ...
+    @typing.overload
+    @deprecated("""""")
+    def firstLabelXOffset(self, settings: 'QgsScaleBarSettings') -> float: ...
+    @typing.overload
+    def firstLabelXOffset(self, settings: 'QgsScaleBarSettings', context: QgsRenderContext, scaleContext: 'QgsScaleBarRenderer.ScaleBarContext') -> float: ...
+    def firstLabelString(self, settings: 'QgsScaleBarSettings') -> str: ...
+    def drawDefaultLabels(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: 'QgsScaleBarRenderer.ScaleBarContext') -> None: ...
+    def applyDefaultSettings(self, settings: 'QgsScaleBarSettings') -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def calculateBoxSize(self, settings: 'QgsScaleBarSettings', scaleContext: 'QgsScaleBarRenderer.ScaleBarContext') -> QtCore.QSizeF: ...
+    @typing.overload
+    def calculateBoxSize(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: 'QgsScaleBarRenderer.ScaleBarContext') -> QtCore.QSizeF: ...
+    def draw(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: 'QgsScaleBarRenderer.ScaleBarContext') -> None: ...
+    def clone(self) -> typing.Optional['QgsScaleBarRenderer']: ...
+    def sortKey(self) -> int: ...
+    def flags(self) -> 'QgsScaleBarRenderer.Flags': ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+    @deprecated("""""")
+    def name(self) -> str: ...
+
+
+class QgsDoubleBoxScaleBarRenderer(QgsScaleBarRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDoubleBoxScaleBarRenderer') -> None: ...
+
+    def applyDefaultSettings(self, settings: 'QgsScaleBarSettings') -> bool: ...
+    def draw(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsDoubleBoxScaleBarRenderer']: ...
+    def sortKey(self) -> int: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsHollowScaleBarRenderer(QgsScaleBarRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsHollowScaleBarRenderer') -> None: ...
+
+    def applyDefaultSettings(self, settings: 'QgsScaleBarSettings') -> bool: ...
+    def draw(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsHollowScaleBarRenderer']: ...
+    def sortKey(self) -> int: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsNumericScaleBarRenderer(QgsScaleBarRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsNumericScaleBarRenderer') -> None: ...
+
+    @typing.overload
+    def calculateBoxSize(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> QtCore.QSizeF: ...
+    @typing.overload
+    @deprecated("""""")
+    def calculateBoxSize(self, settings: 'QgsScaleBarSettings', scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> QtCore.QSizeF: ...
+    def draw(self, context: QgsRenderContext, settings: 'QgsScaleBarSettings', scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsNumericScaleBarRenderer']: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsScaleBarRendererRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsScaleBarRendererRegistry') -> None: ...
+
+    def sortKey(self, id: typing.Optional[str]) -> int: ...
+    def visibleName(self, id: typing.Optional[str]) -> str: ...
+    def renderer(self, id: typing.Optional[str]) -> typing.Optional[QgsScaleBarRenderer]: ...
+    def removeRenderer(self, id: typing.Optional[str]) -> None: ...
+    def addRenderer(self, renderer: typing.Optional[QgsScaleBarRenderer]) -> None: ...
+    def sortedRendererList(self) -> list[str]: ...
+    def renderers(self) -> list[str]: ...
+
+
+class QgsScaleBarSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsScaleBarSettings') -> None: ...
+
+    def setNumericFormat(self, format: typing.Optional[QgsNumericFormat]) -> None: ...
+    def numericFormat(self) -> typing.Optional[QgsNumericFormat]: ...
+    @deprecated("""""")
+    def setLineCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    @deprecated("""""")
+    def lineCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    @deprecated("""""")
+    def setLineJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    @deprecated("""""")
+    def lineJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setAlignment(self, alignment: Qgis.ScaleBarAlignment) -> None: ...
+    def alignment(self) -> Qgis.ScaleBarAlignment: ...
+    def setBoxContentSpace(self, space: float) -> None: ...
+    def boxContentSpace(self) -> float: ...
+    def setLabelHorizontalPlacement(self, placement: Qgis.ScaleBarDistanceLabelHorizontalPlacement) -> None: ...
+    def labelHorizontalPlacement(self) -> Qgis.ScaleBarDistanceLabelHorizontalPlacement: ...
+    def setLabelVerticalPlacement(self, placement: Qgis.ScaleBarDistanceLabelVerticalPlacement) -> None: ...
+    def labelVerticalPlacement(self) -> Qgis.ScaleBarDistanceLabelVerticalPlacement: ...
+    def setLabelBarSpace(self, space: float) -> None: ...
+    def labelBarSpace(self) -> float: ...
+    def setHeight(self, height: float) -> None: ...
+    def height(self) -> float: ...
+    @deprecated("""""")
+    def setBrush2(self, brush: typing.Union[QtGui.QBrush, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], QtGui.QGradient]) -> None: ...
+    @deprecated("""""")
+    def brush2(self) -> QtGui.QBrush: ...
+    @deprecated("""""")
+    def setBrush(self, brush: typing.Union[QtGui.QBrush, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], QtGui.QGradient]) -> None: ...
+    @deprecated("""""")
+    def brush(self) -> QtGui.QBrush: ...
+    def setAlternateFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def alternateFillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setFillSymbol(self, symbol: typing.Optional['QgsFillSymbol']) -> None: ...
+    def fillSymbol(self) -> typing.Optional['QgsFillSymbol']: ...
+    def setSubdivisionLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def subdivisionLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setDivisionLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def divisionLineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    def setLineSymbol(self, symbol: typing.Optional['QgsLineSymbol']) -> None: ...
+    def lineSymbol(self) -> typing.Optional['QgsLineSymbol']: ...
+    @deprecated("""""")
+    def setPen(self, pen: typing.Union[QtGui.QPen, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]]) -> None: ...
+    @deprecated("""""")
+    def pen(self) -> QtGui.QPen: ...
+    @deprecated("""""")
+    def setLineWidth(self, width: float) -> None: ...
+    @deprecated("""""")
+    def lineWidth(self) -> float: ...
+    @deprecated("""""")
+    def setLineColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def lineColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFillColor2(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fillColor2(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fillColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFontColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def fontColor(self) -> QtGui.QColor: ...
+    @deprecated("""""")
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    @deprecated("""""")
+    def font(self) -> QtGui.QFont: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setUnitLabel(self, label: typing.Optional[str]) -> None: ...
+    def unitLabel(self) -> str: ...
+    def setMapUnitsPerScaleBarUnit(self, units: float) -> None: ...
+    def mapUnitsPerScaleBarUnit(self) -> float: ...
+    def setUnits(self, units: Qgis.DistanceUnit) -> None: ...
+    def units(self) -> Qgis.DistanceUnit: ...
+    def setMaximumBarWidth(self, width: float) -> None: ...
+    def maximumBarWidth(self) -> float: ...
+    def setMinimumBarWidth(self, width: float) -> None: ...
+    def minimumBarWidth(self) -> float: ...
+    def setSegmentSizeMode(self, mode: Qgis.ScaleBarSegmentSizeMode) -> None: ...
+    def segmentSizeMode(self) -> Qgis.ScaleBarSegmentSizeMode: ...
+    def setUnitsPerSegment(self, units: float) -> None: ...
+    def unitsPerSegment(self) -> float: ...
+    def setSubdivisionsHeight(self, height: float) -> None: ...
+    def subdivisionsHeight(self) -> float: ...
+    def setNumberOfSubdivisions(self, subdivisions: int) -> None: ...
+    def numberOfSubdivisions(self) -> int: ...
+    def setNumberOfSegmentsLeft(self, segments: int) -> None: ...
+    def numberOfSegmentsLeft(self) -> int: ...
+    def setNumberOfSegments(self, segments: int) -> None: ...
+    def numberOfSegments(self) -> int: ...
+    Alignment: typing.Type[Qgis.ScaleBarAlignment]
+    AlignLeft: Qgis.ScaleBarAlignment
+    AlignMiddle: Qgis.ScaleBarAlignment
+    AlignRight: Qgis.ScaleBarAlignment
+    SegmentSizeMode: typing.Type[Qgis.ScaleBarSegmentSizeMode]
+    SegmentSizeFixed: Qgis.ScaleBarSegmentSizeMode
+    SegmentSizeFitWidth: Qgis.ScaleBarSegmentSizeMode
+    LabelVerticalPlacement: typing.Type[Qgis.ScaleBarDistanceLabelVerticalPlacement]
+    LabelAboveSegment: Qgis.ScaleBarDistanceLabelVerticalPlacement
+    LabelBelowSegment: Qgis.ScaleBarDistanceLabelVerticalPlacement
+    LabelHorizontalPlacement: typing.Type[Qgis.ScaleBarDistanceLabelHorizontalPlacement]
+    LabelCenteredEdge: Qgis.ScaleBarDistanceLabelHorizontalPlacement
+    LabelCenteredSegment: Qgis.ScaleBarDistanceLabelHorizontalPlacement
+
+
+class QgsSingleBoxScaleBarRenderer(QgsScaleBarRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSingleBoxScaleBarRenderer') -> None: ...
+
+    def applyDefaultSettings(self, settings: QgsScaleBarSettings) -> bool: ...
+    def draw(self, context: QgsRenderContext, settings: QgsScaleBarSettings, scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsSingleBoxScaleBarRenderer']: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsSteppedLineScaleBarRenderer(QgsScaleBarRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSteppedLineScaleBarRenderer') -> None: ...
+
+    def draw(self, context: QgsRenderContext, settings: QgsScaleBarSettings, scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsSteppedLineScaleBarRenderer']: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsTicksScaleBarRenderer(QgsScaleBarRenderer):
+
+    class TickPosition(int):
+        TicksUp = ... # type: QgsTicksScaleBarRenderer.TickPosition
+        TicksDown = ... # type: QgsTicksScaleBarRenderer.TickPosition
+        TicksMiddle = ... # type: QgsTicksScaleBarRenderer.TickPosition
+
+    @typing.overload
+    def __init__(self, position: 'QgsTicksScaleBarRenderer.TickPosition' = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTicksScaleBarRenderer') -> None: ...
+
+    def tickPosition(self) -> 'QgsTicksScaleBarRenderer.TickPosition': ...
+    def setTickPosition(self, position: 'QgsTicksScaleBarRenderer.TickPosition') -> None: ...
+    def draw(self, context: QgsRenderContext, settings: QgsScaleBarSettings, scaleContext: QgsScaleBarRenderer.ScaleBarContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsTicksScaleBarRenderer']: ...
+    def flags(self) -> QgsScaleBarRenderer.Flags: ...
+    def sortKey(self) -> int: ...
+    def visibleName(self) -> str: ...
+    def id(self) -> str: ...
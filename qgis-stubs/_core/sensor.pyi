@@ -0,0 +1,207 @@
+# The PEP 484 type hints stub file for the _core.sensor module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+
+
+class QgsSensorModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        SensorType = ... # type: QgsSensorModel.CustomRole
+        SensorId = ... # type: QgsSensorModel.CustomRole
+        SensorName = ... # type: QgsSensorModel.CustomRole
+        SensorStatus = ... # type: QgsSensorModel.CustomRole
+        SensorLastValue = ... # type: QgsSensorModel.CustomRole
+        SensorLastTimestamp = ... # type: QgsSensorModel.CustomRole
+        Sensor = ... # type: QgsSensorModel.CustomRole
+
+    class Column(int):
+        Name = ... # type: QgsSensorModel.Column
+        LastValue = ... # type: QgsSensorModel.Column
+
+    def __init__(self, manager: typing.Optional['QgsSensorManager'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    Role: typing.Type[QgsSensorModel.CustomRole]
+    SensorType: QgsSensorModel.CustomRole
+    SensorId: QgsSensorModel.CustomRole
+    SensorName: QgsSensorModel.CustomRole
+    SensorStatus: QgsSensorModel.CustomRole
+    SensorLastValue: QgsSensorModel.CustomRole
+    SensorLastTimestamp: QgsSensorModel.CustomRole
+    Sensor: QgsSensorModel.CustomRole
+
+
+class QgsSensorManager(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    sensorErrorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    sensorDataCaptured: typing.ClassVar[QtCore.pyqtSignal]
+    sensorStatusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    sensorNameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    sensorRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    sensorAboutToBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    sensorAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def writeXml(self, document: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def sensorsData(self) -> dict[str, 'QgsAbstractSensor.SensorData']: ...
+    def sensorData(self, name: typing.Optional[str]) -> 'QgsAbstractSensor.SensorData': ...
+    def sensorNames(self) -> list[str]: ...
+    def removeSensor(self, id: typing.Optional[str]) -> bool: ...
+    def addSensor(self, sensor: typing.Optional['QgsAbstractSensor']) -> None: ...
+    def sensor(self, id: typing.Optional[str]) -> typing.Optional['QgsAbstractSensor']: ...
+    def sensors(self) -> list['QgsAbstractSensor']: ...
+    def clear(self) -> None: ...
+
+
+class QgsSensorAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, type: typing.Optional[str], visibleName: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSensorAbstractMetadata') -> None: ...
+
+    def createSensor(self, parent: typing.Optional[QtCore.QObject]) -> typing.Optional['QgsAbstractSensor']: ...
+    def visibleName(self) -> str: ...
+    def type(self) -> str: ...
+
+
+class QgsSensorRegistry(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    sensorAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def sensorTypes(self) -> dict[str, str]: ...
+    def createSensor(self, type: typing.Optional[str], parent: typing.Optional[QtCore.QObject] = ...) -> typing.Optional['QgsAbstractSensor']: ...
+    def removeSensorType(self, type: typing.Optional[str]) -> bool: ...
+    def addSensorType(self, metadata: typing.Optional[QgsSensorAbstractMetadata]) -> bool: ...
+    def sensorMetadata(self, type: typing.Optional[str]) -> typing.Optional[QgsSensorAbstractMetadata]: ...
+    def populate(self) -> bool: ...
+
+
+class QgsAbstractSensor(QtCore.QObject):
+
+    class SensorData(PyQt5.sip.wrapper):
+
+        lastTimestamp = ... # type: typing.Union[QtCore.QDateTime, datetime.datetime]
+        lastValue = ... # type: typing.Any
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAbstractSensor.SensorData') -> None: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def handleDisconnect(self) -> None: ...
+    def handleConnect(self) -> None: ...
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    dataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    nameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def readXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def writeXml(self, parentElement: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def errorString(self) -> str: ...
+    def setData(self, data: 'QgsAbstractSensor.SensorData') -> None: ...
+    def data(self) -> 'QgsAbstractSensor.SensorData': ...
+    def disconnectSensor(self) -> None: ...
+    def connectSensor(self) -> None: ...
+    def setStatus(self, status: Qgis.DeviceConnectionStatus) -> None: ...
+    def status(self) -> Qgis.DeviceConnectionStatus: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def type(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsIODeviceSensor(QgsAbstractSensor):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def parseData(self) -> None: ...
+    def initIODevice(self, device: typing.Optional[QtCore.QIODevice]) -> None: ...
+    def iODevice(self) -> typing.Optional[QtCore.QIODevice]: ...
+
+
+class QgsTcpSocketSensor(QgsIODeviceSensor):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def handleDisconnect(self) -> None: ...
+    def handleConnect(self) -> None: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def setPort(self, port: int) -> None: ...
+    def port(self) -> int: ...
+    def setHostName(self, hostName: typing.Optional[str]) -> None: ...
+    def hostName(self) -> str: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(parent: typing.Optional[QtCore.QObject]) -> typing.Optional['QgsTcpSocketSensor']: ...
+
+
+class QgsUdpSocketSensor(QgsIODeviceSensor):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def handleDisconnect(self) -> None: ...
+    def handleConnect(self) -> None: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def setPort(self, port: int) -> None: ...
+    def port(self) -> int: ...
+    def setHostName(self, hostName: typing.Optional[str]) -> None: ...
+    def hostName(self) -> str: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(parent: typing.Optional[QtCore.QObject]) -> typing.Optional['QgsUdpSocketSensor']: ...
+
+
+class QgsSerialPortSensor(QgsIODeviceSensor):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def parseData(self) -> None: ...
+    def handleDisconnect(self) -> None: ...
+    def handleConnect(self) -> None: ...
+    def readPropertiesFromElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def writePropertiesToElement(self, element: QtXml.QDomElement, document: QtXml.QDomDocument) -> bool: ...
+    def setDelimiter(self, delimiter: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> None: ...
+    def delimiter(self) -> QtCore.QByteArray: ...
+    def setBaudRate(self, baudRate: QtSerialPort.QSerialPort.BaudRate) -> None: ...
+    def baudRate(self) -> QtSerialPort.QSerialPort.BaudRate: ...
+    def setPortName(self, portName: typing.Optional[str]) -> None: ...
+    def portName(self) -> str: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def create(parent: typing.Optional[QtCore.QObject]) -> typing.Optional['QgsSerialPortSensor']: ...
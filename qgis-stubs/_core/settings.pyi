@@ -0,0 +1,639 @@
+# The PEP 484 type hints stub file for the _core.settings module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis
+
+
+class QgsSettings(QtCore.QObject):
+
+    class Section(int):
+        NoSection = ... # type: QgsSettings.Section
+        Core = ... # type: QgsSettings.Section
+        Gui = ... # type: QgsSettings.Section
+        Server = ... # type: QgsSettings.Section
+        Plugins = ... # type: QgsSettings.Section
+        Auth = ... # type: QgsSettings.Section
+        App = ... # type: QgsSettings.Section
+        Providers = ... # type: QgsSettings.Section
+        Expressions = ... # type: QgsSettings.Section
+        Misc = ... # type: QgsSettings.Section
+        Gps = ... # type: QgsSettings.Section
+
+    @typing.overload
+    def __init__(self, organization: typing.Optional[str], application: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, scope: QtCore.QSettings.Scope, organization: typing.Optional[str], application: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, format: QtCore.QSettings.Format, scope: QtCore.QSettings.Scope, organization: typing.Optional[str], application: typing.Optional[str] = ..., parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fileName: typing.Optional[str], format: QtCore.QSettings.Format, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def clear(self) -> None: ...
+    def prefixedKey(self, key: typing.Optional[str], section: 'QgsSettings.Section') -> str: ...
+    def remove(self, key: typing.Optional[str], section: 'QgsSettings.Section' = ...) -> None: ...
+    def sync(self) -> None: ...
+    def fileName(self) -> str: ...
+    def contains(self, key: typing.Optional[str], section: 'QgsSettings.Section' = ...) -> bool: ...
+    def value(self, key: typing.Optional[str], defaultValue: typing.Any = ..., type: typing.Any = ..., section: 'QgsSettings.Section' = ...) -> typing.Any: ...
+    def setValue(self, key: typing.Optional[str], value: typing.Any, section: 'QgsSettings.Section' = ...) -> None: ...
+    def origin(self, key: typing.Optional[str]) -> Qgis.SettingsOrigin: ...
+    def setArrayIndex(self, i: int) -> None: ...
+    def endArray(self) -> None: ...
+    def beginWriteArray(self, prefix: typing.Optional[str], size: int = ...) -> None: ...
+    def beginReadArray(self, prefix: typing.Optional[str]) -> int: ...
+    @staticmethod
+    def setGlobalSettingsPath(path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def globalSettingsPath() -> str: ...
+    def globalChildGroups(self) -> list[str]: ...
+    def childGroups(self, origin: Qgis.SettingsOrigin = ...) -> list[str]: ...
+    def childKeys(self) -> list[str]: ...
+    def allKeys(self) -> list[str]: ...
+    def group(self) -> str: ...
+    def endGroup(self) -> None: ...
+    def beginGroup(self, prefix: typing.Optional[str], section: 'QgsSettings.Section' = ...) -> None: ...
+    enumValue: typing.Type[_qgssettings_enum_value]
+    setEnumValue: typing.Type[_qgssettings_set_enum_value]
+    flagValue: typing.Type[_qgssettings_flag_value]
+
+
+class QgsSettingsEntryBase(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBase') -> None: ...
+
+    def hasChanged(self) -> bool: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    def parent(self) -> typing.Optional['QgsSettingsTreeNode']: ...
+    def copyValueToKeyIfChanged(self, key: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def copyValueToKey(self, key: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    @typing.overload
+    def copyValueFromKey(self, key: typing.Optional[str], removeSettingAtKey: bool = ...) -> bool: ...
+    @typing.overload
+    def copyValueFromKey(self, key: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]], removeSettingAtKey: bool = ...) -> bool: ...
+    @typing.overload
+    def formerValueAsVariant(self, dynamicKeyPart: typing.Optional[str]) -> typing.Any: ...
+    @typing.overload
+    def formerValueAsVariant(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    def description(self) -> str: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+    def defaultValueAsVariant(self) -> typing.Any: ...
+    @typing.overload
+    def valueAsVariantWithDefaultOverride(self, defaultValueOverride: typing.Any, dynamicKeyPart: typing.Optional[str] = ...) -> typing.Any: ...
+    @typing.overload
+    def valueAsVariantWithDefaultOverride(self, defaultValueOverride: typing.Any, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    @typing.overload
+    def valueAsVariant(self, dynamicKeyPart: typing.Optional[str] = ...) -> typing.Any: ...
+    @typing.overload
+    def valueAsVariant(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    @typing.overload
+    @deprecated("""""")
+    def valueAsVariant(self, dynamicKeyPart: typing.Optional[str], useDefaultValueOverride: bool, defaultValueOverride: typing.Any) -> typing.Any: ...
+    @typing.overload
+    @deprecated("""""")
+    def valueAsVariant(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]], useDefaultValueOverride: bool, defaultValueOverride: typing.Any) -> typing.Any: ...
+    @typing.overload
+    def setVariantValue(self, value: typing.Any, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setVariantValue(self, value: typing.Any, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def section(self) -> int: ...
+    @typing.overload
+    def remove(self, dynamicKeyPart: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def remove(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def origin(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> Qgis.SettingsOrigin: ...
+    @typing.overload
+    def exists(self, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def exists(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def options(self) -> Qgis.SettingsOptions: ...
+    def hasDynamicKey(self) -> bool: ...
+    def definitionKey(self) -> str: ...
+    def keyIsValid(self, key: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def key(self, dynamicKeyPart: typing.Optional[str] = ...) -> str: ...
+    @typing.overload
+    def key(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    def name(self) -> str: ...
+    def typeId(self) -> str: ...
+    @staticmethod
+    def dynamicKeyPartToList(dynamicKeyPart: typing.Optional[str]) -> list[str]: ...
+    SettingsType: typing.Type[Qgis.SettingsType]
+    Custom: Qgis.SettingsType
+    Variant: Qgis.SettingsType
+    String: Qgis.SettingsType
+    StringList: Qgis.SettingsType
+    VariantMap: Qgis.SettingsType
+    Bool: Qgis.SettingsType
+    Integer: Qgis.SettingsType
+    Double: Qgis.SettingsType
+    EnumFlag: Qgis.SettingsType
+    Color: Qgis.SettingsType
+
+
+@deprecated("")
+class QgsSettingsEntryGroup(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, settings: collections.abc.Iterable[QgsSettingsEntryBase]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryGroup') -> None: ...
+
+    @typing.overload
+    def removeAllChildrenSettings(self, dynamicKeyPart: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def removeAllChildrenSettings(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def removeAllSettingsAtBaseKey(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def settings(self) -> list[QgsSettingsEntryBase]: ...
+    def baseKey(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]] = ...) -> str: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsSettingsEntryBaseTemplateQVariantBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateQVariantBase') -> None: ...
+
+    def checkValuePrivate(self, value: typing.Any) -> bool: ...
+    def convertToVariant(self, value: typing.Any) -> typing.Any: ...
+    def setValuePrivate(self, value: typing.Any, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> typing.Any: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> typing.Any: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    def defaultValue(self) -> typing.Any: ...
+    @typing.overload
+    def setValue(self, value: typing.Any, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: typing.Any, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Any, dynamicKeyPart: typing.Optional[str] = ...) -> typing.Any: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Any, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> typing.Any: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryVariant(QgsSettingsEntryBaseTemplateQVariantBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: typing.Any = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryVariant') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> typing.Any: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+    def valueAs(self, type: typing.Any) -> typing.Any: ...
+
+
+class QgsSettingsEntryBaseTemplateQStringBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateQStringBase') -> None: ...
+
+    def checkValuePrivate(self, value: typing.Optional[str]) -> bool: ...
+    def convertToVariant(self, value: typing.Optional[str]) -> typing.Any: ...
+    def setValuePrivate(self, value: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> str: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> str: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    def defaultValue(self) -> str: ...
+    @typing.overload
+    def setValue(self, value: typing.Optional[str], dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Optional[str], dynamicKeyPart: typing.Optional[str] = ...) -> str: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Optional[str], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> str: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> str: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryString(QgsSettingsEntryBaseTemplateQStringBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Optional[str] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minLength: int = ..., maxLength: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: typing.Optional[str] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minLength: int = ..., maxLength: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryString') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> str: ...
+    def maxLength(self) -> int: ...
+    def minLength(self) -> int: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplateQStringListBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateQStringListBase') -> None: ...
+
+    def checkValuePrivate(self, value: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertToVariant(self, value: collections.abc.Iterable[typing.Optional[str]]) -> typing.Any: ...
+    def setValuePrivate(self, value: collections.abc.Iterable[typing.Optional[str]], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> list[str]: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> list[str]: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> list[str]: ...
+    def defaultValue(self) -> list[str]: ...
+    @typing.overload
+    def setValue(self, value: collections.abc.Iterable[typing.Optional[str]], dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: collections.abc.Iterable[typing.Optional[str]], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: collections.abc.Iterable[typing.Optional[str]], dynamicKeyPart: typing.Optional[str] = ...) -> list[str]: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: collections.abc.Iterable[typing.Optional[str]], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> list[str]: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> list[str]: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> list[str]: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryStringList(QgsSettingsEntryBaseTemplateQStringListBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: collections.abc.Iterable[typing.Optional[str]] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: collections.abc.Iterable[typing.Optional[str]] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryStringList') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> list[str]: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplateboolBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateboolBase') -> None: ...
+
+    def checkValuePrivate(self, value: bool) -> bool: ...
+    def convertToVariant(self, value: bool) -> typing.Any: ...
+    def setValuePrivate(self, value: bool, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> bool: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def defaultValue(self) -> bool: ...
+    @typing.overload
+    def setValue(self, value: bool, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: bool, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: bool, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: bool, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBool(QgsSettingsEntryBaseTemplateboolBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: bool = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: bool = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBool') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> bool: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplateintBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateintBase') -> None: ...
+
+    def checkValuePrivate(self, value: int) -> bool: ...
+    def convertToVariant(self, value: int) -> typing.Any: ...
+    def setValuePrivate(self, value: int, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> int: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> int: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> int: ...
+    def defaultValue(self) -> int: ...
+    @typing.overload
+    def setValue(self, value: int, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: int, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: int, dynamicKeyPart: typing.Optional[str] = ...) -> int: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: int, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> int: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> int: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> int: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryInteger(QgsSettingsEntryBaseTemplateintBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: int = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minValue: int = ..., maxValue: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: int = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minValue: int = ..., maxValue: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryInteger') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> int: ...
+    def maxValue(self) -> int: ...
+    def minValue(self) -> int: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplatedoubleBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplatedoubleBase') -> None: ...
+
+    def checkValuePrivate(self, value: float) -> bool: ...
+    def convertToVariant(self, value: float) -> typing.Any: ...
+    def setValuePrivate(self, value: float, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> float: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> float: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> float: ...
+    def defaultValue(self) -> float: ...
+    @typing.overload
+    def setValue(self, value: float, dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: float, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: float, dynamicKeyPart: typing.Optional[str] = ...) -> float: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: float, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> float: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> float: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> float: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryDouble(QgsSettingsEntryBaseTemplatedoubleBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: float = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minValue: float = ..., maxValue: float = ..., displayDecimals: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: float, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., minValue: float = ..., maxValue: float = ..., displayDecimals: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryDouble') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> float: ...
+    def displayHintDecimals(self) -> int: ...
+    def setDisplayHintDecimals(self, displayHintDecimals: int) -> None: ...
+    def maxValue(self) -> float: ...
+    def minValue(self) -> float: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplateQColorBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateQColorBase') -> None: ...
+
+    def checkValuePrivate(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> bool: ...
+    def convertToVariant(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Any: ...
+    def setValuePrivate(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> QtGui.QColor: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> QtGui.QColor: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> QtGui.QColor: ...
+    def defaultValue(self) -> QtGui.QColor: ...
+    @typing.overload
+    def setValue(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], dynamicKeyPart: typing.Optional[str] = ...) -> QtGui.QColor: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> QtGui.QColor: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> QtGui.QColor: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> QtGui.QColor: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryColor(QgsSettingsEntryBaseTemplateQColorBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., allowAlpha: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ..., allowAlpha: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryColor') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> QtGui.QColor: ...
+    def allowAlpha(self) -> bool: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryBaseTemplateQVariantMapBase(QgsSettingsEntryBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], section: typing.Optional[str], defaultValue: typing.Any, description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryBaseTemplateQVariantMapBase') -> None: ...
+
+    def checkValuePrivate(self, value: dict[str, typing.Any]) -> bool: ...
+    def convertToVariant(self, value: dict[str, typing.Any]) -> typing.Any: ...
+    def setValuePrivate(self, value: dict[str, typing.Any], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def convertFromVariant(self, value: typing.Any) -> dict[str, typing.Any]: ...
+    def checkValueVariant(self, value: typing.Any) -> bool: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPart: typing.Optional[str] = ...) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def formerValue(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> dict[str, typing.Any]: ...
+    def defaultValue(self) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def setValue(self, value: dict[str, typing.Any], dynamicKeyPart: typing.Optional[str] = ...) -> bool: ...
+    @typing.overload
+    def setValue(self, value: dict[str, typing.Any], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: dict[str, typing.Any], dynamicKeyPart: typing.Optional[str] = ...) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def valueWithDefaultOverride(self, defaultValueOverride: dict[str, typing.Any], dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def value(self, dynamicKeyPart: typing.Optional[str] = ...) -> dict[str, typing.Any]: ...
+    @typing.overload
+    def value(self, dynamicKeyPartList: collections.abc.Iterable[typing.Optional[str]]) -> dict[str, typing.Any]: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsEntryVariantMap(QgsSettingsEntryBaseTemplateQVariantMapBase):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], parent: typing.Optional['QgsSettingsTreeNode'], defaultValue: dict[str, typing.Any] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], pluginName: typing.Optional[str], defaultValue: dict[str, typing.Any] = ..., description: typing.Optional[str] = ..., options: typing.Union[Qgis.SettingsOptions, Qgis.SettingsOption] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsEntryVariantMap') -> None: ...
+
+    def convertFromVariant(self, value: typing.Any) -> dict[str, typing.Any]: ...
+    def settingsType(self) -> Qgis.SettingsType: ...
+
+
+class QgsSettingsRegistry(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsRegistry') -> None: ...
+
+    @deprecated("""""")
+    def addSettingsEntryGroup(self, settingsGroup: typing.Optional[QgsSettingsEntryGroup]) -> None: ...
+    def addSettingsEntry(self, settingsEntry: typing.Optional[QgsSettingsEntryBase]) -> bool: ...
+    def subRegistries(self) -> list['QgsSettingsRegistry']: ...
+    def removeSubRegistry(self, settingsRegistry: typing.Optional['QgsSettingsRegistry']) -> None: ...
+    def addSubRegistry(self, settingsRegistry: typing.Optional['QgsSettingsRegistry']) -> None: ...
+    def settingsEntry(self, key: typing.Optional[str], searchChildRegistries: bool = ...) -> typing.Optional[QgsSettingsEntryBase]: ...
+    def settingEntries(self) -> list[QgsSettingsEntryBase]: ...
+
+
+class QgsSettingsRegistryCore(QgsSettingsRegistry):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsRegistryCore') -> None: ...
+
+
+class QgsSettingsTree(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSettingsTree') -> None: ...
+
+    @staticmethod
+    def unregisterPluginTreeNode(pluginName: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def createPluginTreeNode(pluginName: typing.Optional[str]) -> typing.Optional['QgsSettingsTreeNode']: ...
+    @staticmethod
+    def node(key: typing.Optional[str]) -> typing.Optional['QgsSettingsTreeNode']: ...
+    @staticmethod
+    def treeRoot() -> typing.Optional['QgsSettingsTreeNode']: ...
+
+
+class QgsSettingsTreeNode(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    def registerChildNode(self, node: typing.Optional['QgsSettingsTreeNode']) -> None: ...
+    def __repr__(self) -> typing.Any: ...
+    def namedNodesCount(self) -> int: ...
+    def completeKey(self) -> str: ...
+    def key(self) -> str: ...
+    def parent(self) -> typing.Optional['QgsSettingsTreeNode']: ...
+    def childSetting(self, key: typing.Optional[str]) -> typing.Optional[QgsSettingsEntryBase]: ...
+    def childrenSettings(self) -> list[QgsSettingsEntryBase]: ...
+    def childNode(self, key: typing.Optional[str]) -> typing.Optional['QgsSettingsTreeNode']: ...
+    def childrenNodes(self) -> list['QgsSettingsTreeNode']: ...
+    def unregisterChildNode(self, node: typing.Optional['QgsSettingsTreeNode']) -> None: ...
+    def unregisterChildSetting(self, setting: typing.Optional[QgsSettingsEntryBase], deleteSettingValues: bool = ..., parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def registerChildSetting(self, setting: typing.Optional[QgsSettingsEntryBase], key: typing.Optional[str]) -> None: ...
+    def type(self) -> Qgis.SettingsTreeNodeType: ...
+    def createNamedListNode(self, key: typing.Optional[str], options: typing.Union[Qgis.SettingsTreeNodeOptions, Qgis.SettingsTreeNodeOption] = ...) -> typing.Optional['QgsSettingsTreeNamedListNode']: ...
+    def createChildNode(self, key: typing.Optional[str]) -> typing.Optional['QgsSettingsTreeNode']: ...
+
+
+class QgsSettingsTreeNamedListNode(QgsSettingsTreeNode):
+
+    def initNamedList(self, options: typing.Union[Qgis.SettingsTreeNodeOptions, Qgis.SettingsTreeNodeOption]) -> None: ...
+    def selectedItemSetting(self) -> typing.Optional[QgsSettingsEntryString]: ...
+    def deleteAllItems(self, parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def deleteItem(self, item: typing.Optional[str], parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    def selectedItem(self, parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> str: ...
+    def setSelectedItem(self, item: typing.Optional[str], parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+    @typing.overload
+    def items(self, parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> list[str]: ...
+    @typing.overload
+    def items(self, origin: Qgis.SettingsOrigin, parentsNamedItems: collections.abc.Iterable[typing.Optional[str]] = ...) -> list[str]: ...
@@ -0,0 +1,288 @@
+# The PEP 484 type hints stub file for the _core.stac module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsDateTimeRange
+from .browser import QgsMimeDataUtils
+from .geometry import QgsBox3D, QgsGeometry, QgsRectangle
+from .network import QgsHttpHeaders
+from .providers import QgsAbstractProviderConnection
+
+
+class QgsStacAsset(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, href: typing.Optional[str], title: typing.Optional[str], description: typing.Optional[str], mediaType: typing.Optional[str], roles: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacAsset') -> None: ...
+
+    def uri(self) -> QgsMimeDataUtils.Uri: ...
+    def formatName(self) -> str: ...
+    def isCloudOptimized(self) -> bool: ...
+    def roles(self) -> list[str]: ...
+    def mediaType(self) -> str: ...
+    def description(self) -> str: ...
+    def title(self) -> str: ...
+    def href(self) -> str: ...
+
+
+class QgsStacObject(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], version: typing.Optional[str], links: collections.abc.Iterable['QgsStacLink']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacObject') -> None: ...
+
+    def parentUrl(self) -> str: ...
+    def rootUrl(self) -> str: ...
+    def url(self) -> str: ...
+    def setLinks(self, links: collections.abc.Iterable['QgsStacLink']) -> None: ...
+    def links(self) -> list['QgsStacLink']: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def id(self) -> str: ...
+    def setStacExtensions(self, stacExtensions: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def stacExtensions(self) -> list[str]: ...
+    def setStacVersion(self, stacVersion: typing.Optional[str]) -> None: ...
+    def stacVersion(self) -> str: ...
+    def toHtml(self) -> str: ...
+    def type(self) -> Qgis.StacObjectType: ...
+
+
+class QgsStacCatalog(QgsStacObject):
+
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], version: typing.Optional[str], description: typing.Optional[str], links: collections.abc.Iterable['QgsStacLink']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacCatalog') -> None: ...
+
+    def conformsTo(self, conformanceClass: typing.Optional[str]) -> bool: ...
+    def addConformanceClass(self, conformanceClass: typing.Optional[str]) -> None: ...
+    def setConformanceClasses(self, conformanceClasses: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def title(self) -> str: ...
+    def toHtml(self) -> str: ...
+    def type(self) -> Qgis.StacObjectType: ...
+
+
+class QgsStacCollection(QgsStacCatalog):
+
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], version: typing.Optional[str], description: typing.Optional[str], links: collections.abc.Iterable['QgsStacLink'], license: typing.Optional[str], extent: 'QgsStacExtent') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacCollection') -> None: ...
+
+    def setAssets(self, assets: dict[typing.Optional[str], QgsStacAsset]) -> None: ...
+    def assets(self) -> dict[str, QgsStacAsset]: ...
+    def setSummaries(self, summaries: dict[str, typing.Any]) -> None: ...
+    def summaries(self) -> dict[str, typing.Any]: ...
+    def setExtent(self, extent: 'QgsStacExtent') -> None: ...
+    def extent(self) -> 'QgsStacExtent': ...
+    def setProviders(self, providers: collections.abc.Iterable['QgsStacProvider']) -> None: ...
+    def providers(self) -> list['QgsStacProvider']: ...
+    def setLicense(self, license: typing.Optional[str]) -> None: ...
+    def license(self) -> str: ...
+    def setKeywords(self, keywords: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def keywords(self) -> list[str]: ...
+    def toHtml(self) -> str: ...
+    def type(self) -> Qgis.StacObjectType: ...
+
+
+class QgsStacCollectionList(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, collections: collections.abc.Iterable[QgsStacCollection], links: collections.abc.Iterable['QgsStacLink'], numberMatched: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacCollectionList') -> None: ...
+
+    def prevUrl(self) -> QtCore.QUrl: ...
+    def nextUrl(self) -> QtCore.QUrl: ...
+    def rootUrl(self) -> QtCore.QUrl: ...
+    def url(self) -> QtCore.QUrl: ...
+    def numberMatched(self) -> int: ...
+    def numberReturned(self) -> int: ...
+    def takeCollections(self) -> list[QgsStacCollection]: ...
+    def collections(self) -> list[QgsStacCollection]: ...
+
+
+class QgsStacConnection(QgsAbstractProviderConnection):
+
+    class Data(PyQt5.sip.wrapper):
+
+        authCfg = ... # type: typing.Optional[str]
+        httpHeaders = ... # type: QgsHttpHeaders
+        password = ... # type: typing.Optional[str]
+        url = ... # type: typing.Optional[str]
+        username = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsStacConnection.Data') -> None: ...
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], configuration: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacConnection') -> None: ...
+
+    @staticmethod
+    def setSelectedConnection(connName: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def selectedConnection() -> str: ...
+    @staticmethod
+    def addConnection(name: typing.Optional[str], conn: 'QgsStacConnection.Data') -> None: ...
+    @staticmethod
+    def deleteConnection(name: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def connection(name: typing.Optional[str]) -> 'QgsStacConnection.Data': ...
+    @staticmethod
+    def connectionList() -> list[str]: ...
+    @staticmethod
+    def decodedUri(uri: typing.Optional[str]) -> 'QgsStacConnection.Data': ...
+    @staticmethod
+    def encodedUri(conn: 'QgsStacConnection.Data') -> str: ...
+    def remove(self, name: typing.Optional[str]) -> None: ...
+    def store(self, name: typing.Optional[str]) -> None: ...
+
+
+class QgsStacController(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    finishedCollectionsRequest: typing.ClassVar[QtCore.pyqtSignal]
+    finishedItemCollectionRequest: typing.ClassVar[QtCore.pyqtSignal]
+    finishedStacObjectRequest: typing.ClassVar[QtCore.pyqtSignal]
+    def setAuthCfg(self, authCfg: typing.Optional[str]) -> None: ...
+    def authCfg(self) -> str: ...
+    def takeCollections(self, requestId: int) -> typing.Optional[QgsStacCollectionList]: ...
+    def takeItemCollection(self, requestId: int) -> typing.Optional['QgsStacItemCollection']: ...
+    def cancelPendingAsyncRequests(self) -> None: ...
+    def fetchCollectionsAsync(self, url: QtCore.QUrl) -> int: ...
+    def fetchItemCollectionAsync(self, url: QtCore.QUrl) -> int: ...
+    def fetchStacObjectAsync(self, url: QtCore.QUrl) -> int: ...
+    def fetchCollections(self, url: QtCore.QUrl, error: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional[QgsStacCollectionList]: ...
+    def fetchItemCollection(self, url: QtCore.QUrl, error: typing.Optional[typing.Optional[str]] = ...) -> typing.Optional['QgsStacItemCollection']: ...
+    def openLocalItem(self, fileName: typing.Optional[str]) -> typing.Optional['QgsStacItem']: ...
+    def openLocalCollection(self, fileName: typing.Optional[str]) -> typing.Optional[QgsStacCollection]: ...
+    def openLocalCatalog(self, fileName: typing.Optional[str]) -> typing.Optional[QgsStacCatalog]: ...
+
+
+class QgsStacExtent(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacExtent') -> None: ...
+
+    def hasDetailedTemporalExtents(self) -> bool: ...
+    def hasDetailedSpatialExtents(self) -> bool: ...
+    def detailedTemporalExtents(self) -> list[QgsDateTimeRange]: ...
+    def detailedSpatialExtents(self) -> list[QgsBox3D]: ...
+    def temporalExtent(self) -> QgsDateTimeRange: ...
+    def addDetailedTemporalExtent(self, extent: QgsDateTimeRange) -> None: ...
+    def setTemporalExtent(self, extent: QgsDateTimeRange) -> None: ...
+    def spatialExtent(self) -> QgsBox3D: ...
+    def addDetailedSpatialExtent(self, extent: typing.Union[QgsBox3D, QgsRectangle]) -> None: ...
+    def setSpatialExtent(self, extent: typing.Union[QgsBox3D, QgsRectangle]) -> None: ...
+
+
+class QgsStacItemCollection(PyQt5.sip.wrapper):
+
+    def __init__(self, items: collections.abc.Iterable['QgsStacItem'], links: collections.abc.Iterable['QgsStacLink'], numberMatched: int = ...) -> None: ...
+
+    def numberMatched(self) -> int: ...
+    def numberReturned(self) -> int: ...
+    def nextUrl(self) -> QtCore.QUrl: ...
+    def collectionUrl(self) -> QtCore.QUrl: ...
+    def parentUrl(self) -> QtCore.QUrl: ...
+    def rootUrl(self) -> QtCore.QUrl: ...
+    def url(self) -> QtCore.QUrl: ...
+    def takeItems(self) -> list['QgsStacItem']: ...
+    def items(self) -> list['QgsStacItem']: ...
+
+
+class QgsStacItem(QgsStacObject):
+
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], version: typing.Optional[str], geometry: QgsGeometry, properties: dict[str, typing.Any], links: collections.abc.Iterable['QgsStacLink'], assets: dict[typing.Optional[str], QgsStacAsset], bbox: QgsBox3D) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacItem') -> None: ...
+
+    def uris(self) -> list[QgsMimeDataUtils.Uri]: ...
+    def description(self) -> str: ...
+    def title(self) -> str: ...
+    def dateTimeRange(self) -> QgsDateTimeRange: ...
+    def hasDateTimeRange(self) -> bool: ...
+    def dateTime(self) -> QtCore.QDateTime: ...
+    def setCollection(self, collection: typing.Optional[str]) -> None: ...
+    def collection(self) -> str: ...
+    def setAssets(self, assets: dict[typing.Optional[str], QgsStacAsset]) -> None: ...
+    def assets(self) -> dict[str, QgsStacAsset]: ...
+    def setProperties(self, properties: dict[str, typing.Any]) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def setBoundingBox(self, bbox: QgsBox3D) -> None: ...
+    def boundingBox(self) -> QgsBox3D: ...
+    def setGeometry(self, geometry: QgsGeometry) -> None: ...
+    def geometry(self) -> QgsGeometry: ...
+    def toHtml(self) -> str: ...
+    def type(self) -> Qgis.StacObjectType: ...
+
+
+class QgsStacLink(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, href: typing.Optional[str], relation: typing.Optional[str], mediaType: typing.Optional[str], title: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacLink') -> None: ...
+
+    def title(self) -> str: ...
+    def mediaType(self) -> str: ...
+    def relation(self) -> str: ...
+    def href(self) -> str: ...
+
+
+class QgsStacParser(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def error(self) -> str: ...
+    def type(self) -> Qgis.StacObjectType: ...
+    def collections(self) -> typing.Optional[QgsStacCollectionList]: ...
+    def catalog(self) -> typing.Optional[QgsStacCatalog]: ...
+    def setBaseUrl(self, url: QtCore.QUrl) -> None: ...
+    def setData(self, data: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> None: ...
+
+
+class QgsStacProvider(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], roles: collections.abc.Iterable[typing.Optional[str]], url: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStacProvider') -> None: ...
+
+    def url(self) -> str: ...
+    def roles(self) -> list[str]: ...
+    def description(self) -> str: ...
+    def name(self) -> str: ...
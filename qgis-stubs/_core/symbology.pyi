@@ -0,0 +1,4375 @@
+# The PEP 484 type hints stub file for the _core.symbology module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._3d import QgsAbstract3DSymbol
+from ._ungrouped import (
+    Qgis, QgsAbstractContentCacheBase, QgsColorRamp, QgsCptCityColorRamp,
+    QgsFields, QgsPathResolver, QgsPropertyDefinition, QgsSldExportContext,
+)
+from .classification import QgsClassificationMethod, QgsClassificationRange
+from .diagram import QgsMapUnitScale
+from .dxf import QgsDxfExport
+from .effects import QgsPaintEffect
+from .expression import QgsExpression
+from .geometry import (
+    QgsAbstractGeometry, QgsCurve, QgsGeometry, QgsPoint, QgsPolygon,
+    QgsRectangle,
+)
+from .labeling import QgsPalLayerSettings, QgsScreenProperties
+from .layertree import (
+    QgsColorRampLegendNodeSettings, QgsDataDefinedSizeLegend,
+    QgsLayerTreeLayer, QgsLayerTreeModelLegendNode, QgsLegendPatchShape,
+    QgsProperty,
+)
+from .numericformats import QgsNumericFormat
+from .project import QgsProject
+from .raster import QgsColorRampShader
+from .textrenderer import QgsTextFormat
+from .vector import (
+    QgsExpressionContext, QgsExpressionContextScope, QgsFeature,
+    QgsFeatureRequest, QgsMapLayer, QgsPointXY, QgsPropertyCollection,
+    QgsReadWriteContext, QgsRenderContext, QgsVectorLayer,
+)
+
+
+class QgsFeatureRenderer(PyQt5.sip.wrapper):
+
+    class Capability(int):
+        SymbolLevels = ... # type: QgsFeatureRenderer.Capability
+        MoreSymbolsPerFeature = ... # type: QgsFeatureRenderer.Capability
+        Filter = ... # type: QgsFeatureRenderer.Capability
+        ScaleDependent = ... # type: QgsFeatureRenderer.Capability
+
+    class Property(int):
+        HeatmapRadius = ... # type: QgsFeatureRenderer.Property
+        HeatmapMaximum = ... # type: QgsFeatureRenderer.Property
+
+    class Capabilities(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __xor__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __ior__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __or__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __iand__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __and__(self, f: typing.Union['QgsFeatureRenderer.Capabilities', 'QgsFeatureRenderer.Capability']) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __invert__(self) -> 'QgsFeatureRenderer.Capabilities': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, type: typing.Optional[str]) -> None: ...
+
+    @staticmethod
+    def convertSymbolRotation(symbol: typing.Optional['QgsSymbol'], field: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def convertSymbolSizeScale(symbol: typing.Optional['QgsSymbol'], method: Qgis.ScaleMethod, field: typing.Optional[str]) -> None: ...
+    def saveRendererData(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    @staticmethod
+    def _getPoint(context: QgsRenderContext, point: QgsPoint) -> QtCore.QPointF: ...
+    def renderVertexMarkerPolygon(self, pts: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: QgsRenderContext) -> None: ...
+    def renderVertexMarkerPolyline(self, pts: QtGui.QPolygonF, context: QgsRenderContext) -> None: ...
+    def renderVertexMarker(self, pt: typing.Union[QtCore.QPointF, QtCore.QPoint], context: QgsRenderContext) -> None: ...
+    def renderFeatureWithSymbol(self, feature: QgsFeature, symbol: typing.Optional['QgsSymbol'], context: QgsRenderContext, layer: int, selected: bool, drawVertexMarker: bool) -> None: ...
+    def maximumExtentBuffer(self, context: QgsRenderContext) -> float: ...
+    def copyRendererData(self, destRenderer: typing.Optional['QgsFeatureRenderer']) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def embeddedRenderer(self) -> typing.Optional['QgsFeatureRenderer']: ...
+    def setEmbeddedRenderer(self, subRenderer: typing.Optional['QgsFeatureRenderer']) -> None: ...
+    def setOrderByEnabled(self, enabled: bool) -> None: ...
+    def orderByEnabled(self) -> bool: ...
+    def setOrderBy(self, orderBy: QgsFeatureRequest.OrderBy) -> None: ...
+    def orderBy(self) -> QgsFeatureRequest.OrderBy: ...
+    def setReferenceScale(self, scale: float) -> None: ...
+    def referenceScale(self) -> float: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def setDataDefinedProperty(self, key: 'QgsFeatureRenderer.Property', property: QgsProperty) -> None: ...
+    def setForceRasterRender(self, forceRaster: bool) -> None: ...
+    def forceRasterRender(self) -> bool: ...
+    def setPaintEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def paintEffect(self) -> typing.Optional[QgsPaintEffect]: ...
+    def modifyRequestExtent(self, extent: QgsRectangle, context: QgsRenderContext) -> None: ...
+    def originalSymbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def symbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def willRenderFeature(self, feature: QgsFeature, context: QgsRenderContext) -> bool: ...
+    def setVertexMarkerAppearance(self, type: Qgis.VertexMarkerType, size: float) -> None: ...
+    def legendClassificationAttribute(self) -> str: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def legendSymbolItems(self) -> list['QgsLegendSymbolItem']: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def legendKeys(self) -> set[str]: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    @staticmethod
+    def loadSld(node: QtXml.QDomNode, geomType: Qgis.GeometryType, errorMessage: typing.Optional[str]) -> typing.Optional['QgsFeatureRenderer']: ...
+    def writeSld(self, doc: QtXml.QDomDocument, styleName: typing.Optional[str], props: dict[str, typing.Any] = ...) -> QtXml.QDomElement: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def load(symbologyElem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsFeatureRenderer']: ...
+    def setUsingSymbolLevels(self, usingSymbolLevels: bool) -> None: ...
+    def usingSymbolLevels(self) -> bool: ...
+    def symbols(self, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+    def capabilities(self) -> 'QgsFeatureRenderer.Capabilities': ...
+    def dump(self) -> str: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def clone(self) -> typing.Optional['QgsFeatureRenderer']: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usesEmbeddedSymbols(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def filter(self, fields: QgsFields = ...) -> str: ...
+    def canSkipRender(self) -> bool: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def type(self) -> str: ...
+    @staticmethod
+    def defaultRenderer(geomType: Qgis.GeometryType) -> typing.Optional['QgsFeatureRenderer']: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+
+
+class Qgs25DRenderer(QgsFeatureRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setShadowEnabled(self, value: bool) -> None: ...
+    def shadowEnabled(self) -> bool: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['Qgs25DRenderer']: ...
+    def setShadowSpread(self, shadowSpread: float) -> None: ...
+    def shadowSpread(self) -> float: ...
+    def setShadowColor(self, shadowColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def shadowColor(self) -> QtGui.QColor: ...
+    def wallShadingEnabled(self) -> bool: ...
+    def setWallShadingEnabled(self, enabled: bool) -> None: ...
+    def setWallColor(self, wallColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def wallColor(self) -> QtGui.QColor: ...
+    def setRoofColor(self, roofColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def roofColor(self) -> QtGui.QColor: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def symbols(self, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def clone(self) -> typing.Optional[QgsFeatureRenderer]: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+
+
+class QgsSymbolLayer(PyQt5.sip.wrapper):
+
+    class Property(int):
+        Size = ... # type: QgsSymbolLayer.Property
+        Angle = ... # type: QgsSymbolLayer.Property
+        Name = ... # type: QgsSymbolLayer.Property
+        FillColor = ... # type: QgsSymbolLayer.Property
+        StrokeColor = ... # type: QgsSymbolLayer.Property
+        StrokeWidth = ... # type: QgsSymbolLayer.Property
+        StrokeStyle = ... # type: QgsSymbolLayer.Property
+        Offset = ... # type: QgsSymbolLayer.Property
+        Character = ... # type: QgsSymbolLayer.Property
+        Width = ... # type: QgsSymbolLayer.Property
+        Height = ... # type: QgsSymbolLayer.Property
+        PreserveAspectRatio = ... # type: QgsSymbolLayer.Property
+        FillStyle = ... # type: QgsSymbolLayer.Property
+        JoinStyle = ... # type: QgsSymbolLayer.Property
+        SecondaryColor = ... # type: QgsSymbolLayer.Property
+        LineAngle = ... # type: QgsSymbolLayer.Property
+        LineDistance = ... # type: QgsSymbolLayer.Property
+        GradientType = ... # type: QgsSymbolLayer.Property
+        CoordinateMode = ... # type: QgsSymbolLayer.Property
+        GradientSpread = ... # type: QgsSymbolLayer.Property
+        GradientReference1X = ... # type: QgsSymbolLayer.Property
+        GradientReference1Y = ... # type: QgsSymbolLayer.Property
+        GradientReference2X = ... # type: QgsSymbolLayer.Property
+        GradientReference2Y = ... # type: QgsSymbolLayer.Property
+        GradientReference1IsCentroid = ... # type: QgsSymbolLayer.Property
+        GradientReference2IsCentroid = ... # type: QgsSymbolLayer.Property
+        BlurRadius = ... # type: QgsSymbolLayer.Property
+        ShapeburstUseWholeShape = ... # type: QgsSymbolLayer.Property
+        ShapeburstMaxDistance = ... # type: QgsSymbolLayer.Property
+        ShapeburstIgnoreRings = ... # type: QgsSymbolLayer.Property
+        File = ... # type: QgsSymbolLayer.Property
+        DistanceX = ... # type: QgsSymbolLayer.Property
+        DistanceY = ... # type: QgsSymbolLayer.Property
+        DisplacementX = ... # type: QgsSymbolLayer.Property
+        DisplacementY = ... # type: QgsSymbolLayer.Property
+        Opacity = ... # type: QgsSymbolLayer.Property
+        CustomDash = ... # type: QgsSymbolLayer.Property
+        CapStyle = ... # type: QgsSymbolLayer.Property
+        Placement = ... # type: QgsSymbolLayer.Property
+        Interval = ... # type: QgsSymbolLayer.Property
+        OffsetAlongLine = ... # type: QgsSymbolLayer.Property
+        AverageAngleLength = ... # type: QgsSymbolLayer.Property
+        HorizontalAnchor = ... # type: QgsSymbolLayer.Property
+        VerticalAnchor = ... # type: QgsSymbolLayer.Property
+        LayerEnabled = ... # type: QgsSymbolLayer.Property
+        ArrowWidth = ... # type: QgsSymbolLayer.Property
+        ArrowStartWidth = ... # type: QgsSymbolLayer.Property
+        ArrowHeadLength = ... # type: QgsSymbolLayer.Property
+        ArrowHeadThickness = ... # type: QgsSymbolLayer.Property
+        ArrowHeadType = ... # type: QgsSymbolLayer.Property
+        ArrowType = ... # type: QgsSymbolLayer.Property
+        OffsetX = ... # type: QgsSymbolLayer.Property
+        OffsetY = ... # type: QgsSymbolLayer.Property
+        PointCount = ... # type: QgsSymbolLayer.Property
+        RandomSeed = ... # type: QgsSymbolLayer.Property
+        ClipPoints = ... # type: QgsSymbolLayer.Property
+        DensityArea = ... # type: QgsSymbolLayer.Property
+        FontFamily = ... # type: QgsSymbolLayer.Property
+        FontStyle = ... # type: QgsSymbolLayer.Property
+        DashPatternOffset = ... # type: QgsSymbolLayer.Property
+        TrimStart = ... # type: QgsSymbolLayer.Property
+        TrimEnd = ... # type: QgsSymbolLayer.Property
+        LineStartWidthValue = ... # type: QgsSymbolLayer.Property
+        LineEndWidthValue = ... # type: QgsSymbolLayer.Property
+        LineStartColorValue = ... # type: QgsSymbolLayer.Property
+        LineEndColorValue = ... # type: QgsSymbolLayer.Property
+        MarkerClipping = ... # type: QgsSymbolLayer.Property
+        RandomOffsetX = ... # type: QgsSymbolLayer.Property
+        RandomOffsetY = ... # type: QgsSymbolLayer.Property
+        LineClipping = ... # type: QgsSymbolLayer.Property
+        SkipMultiples = ... # type: QgsSymbolLayer.Property
+        ShowMarker = ... # type: QgsSymbolLayer.Property
+
+    def __init__(self, type: Qgis.SymbolType, locked: bool = ...) -> None: ...
+
+    def shouldRenderUsingSelectionColor(self, context: 'QgsSymbolRenderContext') -> bool: ...
+    def removeMasks(self, context: QgsRenderContext, recursive: bool) -> None: ...
+    def copyPaintEffect(self, destLayer: typing.Optional['QgsSymbolLayer']) -> None: ...
+    def copyDataDefinedProperties(self, destLayer: typing.Optional['QgsSymbolLayer']) -> None: ...
+    def restoreOldDataDefinedProperties(self, stringMap: dict[str, typing.Any]) -> None: ...
+    def installMasks(self, context: QgsRenderContext, recursive: bool, rect: QtCore.QRectF = ...) -> bool: ...
+    def id(self) -> str: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def prepareMasks(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def masks(self) -> list['QgsSymbolLayerReference']: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def prepareExpressions(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def setPaintEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def paintEffect(self) -> typing.Optional[QgsPaintEffect]: ...
+    def dxfBrushStyle(self) -> QtCore.Qt.BrushStyle: ...
+    def dxfBrushColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def dxfPenStyle(self) -> QtCore.Qt.PenStyle: ...
+    def dxfCustomDashPattern(self) -> typing.Tuple[list[float], Qgis.RenderUnit]: ...
+    def dxfAngle(self, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def dxfOffset(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfSize(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfWidth(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def writeDxf(self, e: QgsDxfExport, mmMapUnitScaleFactor: float, layerName: typing.Optional[str], context: 'QgsSymbolRenderContext', shift: typing.Union[QtCore.QPointF, QtCore.QPoint] = ...) -> bool: ...
+    def setDataDefinedProperty(self, key: 'QgsSymbolLayer.Property', property: QgsProperty) -> None: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def renderingPass(self) -> int: ...
+    def setRenderingPass(self, renderingPass: int) -> None: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def isLocked(self) -> bool: ...
+    def setLocked(self, locked: bool) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def isCompatibleWithSymbol(self, symbol: typing.Optional['QgsSymbol']) -> bool: ...
+    def type(self) -> Qgis.SymbolType: ...
+    def setSubSymbol(self, symbol: typing.Optional['QgsSymbol']) -> bool: ...
+    def subSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def ogrFeatureStyle(self, mmScaleFactor: float, mapUnitScaleFactor: float) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSymbolLayer']: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setUserFlags(self, flags: typing.Union[Qgis.SymbolLayerUserFlags, Qgis.SymbolLayerUserFlag]) -> None: ...
+    def userFlags(self) -> Qgis.SymbolLayerUserFlags: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    PropertySize: QgsSymbolLayer.Property
+    PropertyAngle: QgsSymbolLayer.Property
+    PropertyName: QgsSymbolLayer.Property
+    PropertyFillColor: QgsSymbolLayer.Property
+    PropertyStrokeColor: QgsSymbolLayer.Property
+    PropertyStrokeWidth: QgsSymbolLayer.Property
+    PropertyStrokeStyle: QgsSymbolLayer.Property
+    PropertyOffset: QgsSymbolLayer.Property
+    PropertyCharacter: QgsSymbolLayer.Property
+    PropertyWidth: QgsSymbolLayer.Property
+    PropertyHeight: QgsSymbolLayer.Property
+    PropertyPreserveAspectRatio: QgsSymbolLayer.Property
+    PropertyFillStyle: QgsSymbolLayer.Property
+    PropertyJoinStyle: QgsSymbolLayer.Property
+    PropertySecondaryColor: QgsSymbolLayer.Property
+    PropertyLineAngle: QgsSymbolLayer.Property
+    PropertyLineDistance: QgsSymbolLayer.Property
+    PropertyGradientType: QgsSymbolLayer.Property
+    PropertyCoordinateMode: QgsSymbolLayer.Property
+    PropertyGradientSpread: QgsSymbolLayer.Property
+    PropertyGradientReference1X: QgsSymbolLayer.Property
+    PropertyGradientReference1Y: QgsSymbolLayer.Property
+    PropertyGradientReference2X: QgsSymbolLayer.Property
+    PropertyGradientReference2Y: QgsSymbolLayer.Property
+    PropertyGradientReference1IsCentroid: QgsSymbolLayer.Property
+    PropertyGradientReference2IsCentroid: QgsSymbolLayer.Property
+    PropertyBlurRadius: QgsSymbolLayer.Property
+    PropertyShapeburstUseWholeShape: QgsSymbolLayer.Property
+    PropertyShapeburstMaxDistance: QgsSymbolLayer.Property
+    PropertyShapeburstIgnoreRings: QgsSymbolLayer.Property
+    PropertyFile: QgsSymbolLayer.Property
+    PropertyDistanceX: QgsSymbolLayer.Property
+    PropertyDistanceY: QgsSymbolLayer.Property
+    PropertyDisplacementX: QgsSymbolLayer.Property
+    PropertyDisplacementY: QgsSymbolLayer.Property
+    PropertyOpacity: QgsSymbolLayer.Property
+    PropertyCustomDash: QgsSymbolLayer.Property
+    PropertyCapStyle: QgsSymbolLayer.Property
+    PropertyPlacement: QgsSymbolLayer.Property
+    PropertyInterval: QgsSymbolLayer.Property
+    PropertyOffsetAlongLine: QgsSymbolLayer.Property
+    PropertyAverageAngleLength: QgsSymbolLayer.Property
+    PropertyHorizontalAnchor: QgsSymbolLayer.Property
+    PropertyVerticalAnchor: QgsSymbolLayer.Property
+    PropertyLayerEnabled: QgsSymbolLayer.Property
+    PropertyArrowWidth: QgsSymbolLayer.Property
+    PropertyArrowStartWidth: QgsSymbolLayer.Property
+    PropertyArrowHeadLength: QgsSymbolLayer.Property
+    PropertyArrowHeadThickness: QgsSymbolLayer.Property
+    PropertyArrowHeadType: QgsSymbolLayer.Property
+    PropertyArrowType: QgsSymbolLayer.Property
+    PropertyOffsetX: QgsSymbolLayer.Property
+    PropertyOffsetY: QgsSymbolLayer.Property
+    PropertyPointCount: QgsSymbolLayer.Property
+    PropertyRandomSeed: QgsSymbolLayer.Property
+    PropertyClipPoints: QgsSymbolLayer.Property
+    PropertyDensityArea: QgsSymbolLayer.Property
+    PropertyFontFamily: QgsSymbolLayer.Property
+    PropertyFontStyle: QgsSymbolLayer.Property
+    PropertyDashPatternOffset: QgsSymbolLayer.Property
+    PropertyTrimStart: QgsSymbolLayer.Property
+    PropertyTrimEnd: QgsSymbolLayer.Property
+    PropertyLineStartWidthValue: QgsSymbolLayer.Property
+    PropertyLineEndWidthValue: QgsSymbolLayer.Property
+    PropertyLineStartColorValue: QgsSymbolLayer.Property
+    PropertyLineEndColorValue: QgsSymbolLayer.Property
+    PropertyMarkerClipping: QgsSymbolLayer.Property
+    PropertyRandomOffsetX: QgsSymbolLayer.Property
+    PropertyRandomOffsetY: QgsSymbolLayer.Property
+    PropertyLineClipping: QgsSymbolLayer.Property
+    SkipMultiples: QgsSymbolLayer.Property
+    ShowMarker: QgsSymbolLayer.Property
+
+
+class QgsLineSymbolLayer(QgsSymbolLayer):
+
+    class RenderRingFilter(int):
+        AllRings = ... # type: QgsLineSymbolLayer.RenderRingFilter
+        ExteriorRingOnly = ... # type: QgsLineSymbolLayer.RenderRingFilter
+        InteriorRingsOnly = ... # type: QgsLineSymbolLayer.RenderRingFilter
+
+    def __init__(self, locked: bool = ...) -> None: ...
+
+    def setRingFilter(self, filter: 'QgsLineSymbolLayer.RenderRingFilter') -> None: ...
+    def ringFilter(self) -> 'QgsLineSymbolLayer.RenderRingFilter': ...
+    def widthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def widthUnit(self) -> Qgis.RenderUnit: ...
+    def setWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setOffset(self, offset: float) -> None: ...
+    def offset(self) -> float: ...
+    @typing.overload
+    def width(self) -> float: ...
+    @typing.overload
+    def width(self, context: QgsRenderContext) -> float: ...
+    def setWidth(self, width: float) -> None: ...
+    def renderPolygonStroke(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def dxfWidth(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+
+
+class QgsArrowSymbolLayer(QgsLineSymbolLayer):
+
+    class ArrowType(int):
+        ArrowPlain = ... # type: QgsArrowSymbolLayer.ArrowType
+        ArrowLeftHalf = ... # type: QgsArrowSymbolLayer.ArrowType
+        ArrowRightHalf = ... # type: QgsArrowSymbolLayer.ArrowType
+
+    class HeadType(int):
+        HeadSingle = ... # type: QgsArrowSymbolLayer.HeadType
+        HeadReversed = ... # type: QgsArrowSymbolLayer.HeadType
+        HeadDouble = ... # type: QgsArrowSymbolLayer.HeadType
+
+    def __init__(self) -> None: ...
+
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def setArrowType(self, type: 'QgsArrowSymbolLayer.ArrowType') -> None: ...
+    def arrowType(self) -> 'QgsArrowSymbolLayer.ArrowType': ...
+    def setHeadType(self, type: 'QgsArrowSymbolLayer.HeadType') -> None: ...
+    def headType(self) -> 'QgsArrowSymbolLayer.HeadType': ...
+    def setIsRepeated(self, isRepeated: bool) -> None: ...
+    def isRepeated(self) -> bool: ...
+    def setIsCurved(self, isCurved: bool) -> None: ...
+    def isCurved(self) -> bool: ...
+    def setHeadThicknessUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def headThicknessUnitScale(self) -> QgsMapUnitScale: ...
+    def setHeadThicknessUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def headThicknessUnit(self) -> Qgis.RenderUnit: ...
+    def setHeadThickness(self, thickness: float) -> None: ...
+    def headThickness(self) -> float: ...
+    def setHeadLengthUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def headLengthUnitScale(self) -> QgsMapUnitScale: ...
+    def setHeadLengthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def headLengthUnit(self) -> Qgis.RenderUnit: ...
+    def setHeadLength(self, length: float) -> None: ...
+    def headLength(self) -> float: ...
+    def setArrowStartWidthUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def arrowStartWidthUnitScale(self) -> QgsMapUnitScale: ...
+    def setArrowStartWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def arrowStartWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setArrowStartWidth(self, width: float) -> None: ...
+    def arrowStartWidth(self) -> float: ...
+    def setArrowWidthUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def arrowWidthUnitScale(self) -> QgsMapUnitScale: ...
+    def setArrowWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def arrowWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setArrowWidth(self, width: float) -> None: ...
+    def arrowWidth(self) -> float: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def setSubSymbol(self, symbol: typing.Optional['QgsSymbol']) -> bool: ...
+    def subSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def clone(self) -> typing.Optional['QgsArrowSymbolLayer']: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsRendererCategory(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, value: typing.Any, symbol: typing.Optional['QgsSymbol'], label: typing.Optional[str], render: bool = ..., uuid: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, cat: 'QgsRendererCategory') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, classAttribute: typing.Optional[str], context: QgsSldExportContext) -> bool: ...
+    def dump(self) -> str: ...
+    def setRenderState(self, render: bool) -> None: ...
+    def renderState(self) -> bool: ...
+    def setLabel(self, label: typing.Optional[str]) -> None: ...
+    def setSymbol(self, s: typing.Optional['QgsSymbol']) -> None: ...
+    def setValue(self, value: typing.Any) -> None: ...
+    def label(self) -> str: ...
+    def symbol(self) -> typing.Optional['QgsSymbol']: ...
+    def value(self) -> typing.Any: ...
+    def uuid(self) -> str: ...
+
+
+class QgsCategorizedSymbolRenderer(QgsFeatureRenderer):
+
+    def __init__(self, attrName: typing.Optional[str] = ..., categories: collections.abc.Iterable[QgsRendererCategory] = ...) -> None: ...
+
+    def symbolForValue2(self, value: typing.Any) -> typing.Tuple[typing.Optional['QgsSymbol'], bool]: ...
+    @deprecated("""""")
+    def symbolForValue(self, value: typing.Any) -> typing.Optional['QgsSymbol']: ...
+    @deprecated("""""")
+    def skipRender(self) -> typing.Optional['QgsSymbol']: ...
+    def rebuildHash(self) -> None: ...
+    @staticmethod
+    def displayString(value: typing.Any, precision: int = ...) -> str: ...
+    @staticmethod
+    def createCategories(values: collections.abc.Iterable[typing.Any], symbol: typing.Optional['QgsSymbol'], layer: typing.Optional[QgsVectorLayer] = ..., fieldName: typing.Optional[str] = ...) -> list[QgsRendererCategory]: ...
+    def matchToSymbols(self, style: typing.Optional['QgsStyle'], type: Qgis.SymbolType, caseSensitive: bool = ..., useTolerantMatch: bool = ...) -> typing.Tuple[int, list[typing.Any], list[str]]: ...
+    def dataDefinedSizeLegend(self) -> typing.Optional[QgsDataDefinedSizeLegend]: ...
+    def setDataDefinedSizeLegend(self, settings: typing.Optional[QgsDataDefinedSizeLegend]) -> None: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer], layer: typing.Optional[QgsVectorLayer] = ...) -> typing.Optional['QgsCategorizedSymbolRenderer']: ...
+    def legendClassificationAttribute(self) -> str: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def updateColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def setSourceColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def sourceColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setSourceSymbol(self, sym: typing.Optional['QgsSymbol']) -> None: ...
+    def sourceSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def legendSymbolItems(self) -> list['QgsLegendSymbolItem']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def setClassAttribute(self, attr: typing.Optional[str]) -> None: ...
+    def classAttribute(self) -> str: ...
+    def sortByLabel(self, order: QtCore.Qt.SortOrder = ...) -> None: ...
+    def sortByValue(self, order: QtCore.Qt.SortOrder = ...) -> None: ...
+    def moveCategory(self, from_: int, to: int) -> None: ...
+    def deleteAllCategories(self) -> None: ...
+    def deleteCategory(self, catIndex: int) -> bool: ...
+    def addCategory(self, category: QgsRendererCategory) -> None: ...
+    def updateCategoryRenderState(self, catIndex: int, render: bool) -> bool: ...
+    def updateCategoryLabel(self, catIndex: int, label: typing.Optional[str]) -> bool: ...
+    def updateCategorySymbol(self, catIndex: int, symbol: typing.Optional['QgsSymbol']) -> bool: ...
+    def updateCategoryValue(self, catIndex: int, value: typing.Any) -> bool: ...
+    def categoryIndexForLabel(self, val: typing.Optional[str]) -> int: ...
+    def categoryIndexForValue(self, val: typing.Any) -> int: ...
+    def categories(self) -> list[QgsRendererCategory]: ...
+    def updateSymbols(self, sym: typing.Optional['QgsSymbol']) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def symbols(self, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def filter(self, fields: QgsFields = ...) -> str: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsCategorizedSymbolRenderer']: ...
+    def dump(self) -> str: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+
+
+class QgsColorBrewerPalette(PyQt5.sip.wrapper):
+
+    BREWER_STRING = ... # type: str
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorBrewerPalette') -> None: ...
+
+    @staticmethod
+    def listSchemeVariants(schemeName: typing.Optional[str]) -> list[int]: ...
+    @staticmethod
+    def listSchemes() -> list[str]: ...
+    @staticmethod
+    def listSchemeColors(schemeName: typing.Optional[str], colors: int) -> list[QtGui.QColor]: ...
+
+
+class QgsCombinedStyleModel(QtCore.QConcatenateTablesProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def addTargetScreenProperties(self, properties: QgsScreenProperties) -> None: ...
+    def addDesiredIconSize(self, size: QtCore.QSize) -> None: ...
+    def styles(self) -> list['QgsStyle']: ...
+    def removeStyle(self, style: typing.Optional['QgsStyle']) -> None: ...
+    def addDefaultStyle(self) -> None: ...
+    def addStyle(self, style: typing.Optional['QgsStyle']) -> None: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+
+
+class QgsCptCityArchive(PyQt5.sip.wrapper):
+
+    def __init__(self, archiveName: typing.Optional[str] = ..., baseDir: typing.Optional[str] = ...) -> None: ...
+
+    def selectionItems(self) -> list['QgsCptCityDataItem']: ...
+    def rootItems(self) -> list['QgsCptCityDataItem']: ...
+    @staticmethod
+    def archiveRegistry() -> typing.Any: ...
+    @staticmethod
+    def defaultArchive() -> typing.Optional['QgsCptCityArchive']: ...
+    @staticmethod
+    def clearArchives() -> None: ...
+    @staticmethod
+    def initDefaultArchive() -> None: ...
+    @staticmethod
+    def initArchive(archiveName: typing.Optional[str], archiveBaseDir: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def initArchives(loadAll: bool = ...) -> None: ...
+    def archiveName(self) -> str: ...
+    def isEmpty(self) -> bool: ...
+    @staticmethod
+    def description(fileName: typing.Optional[str]) -> dict[str, str]: ...
+    @staticmethod
+    def copyingInfo(fileName: typing.Optional[str]) -> dict[str, str]: ...
+    @staticmethod
+    def findFileName(target: typing.Optional[str], startDir: typing.Optional[str], baseDir: typing.Optional[str]) -> str: ...
+    def descFileName(self, dirName: typing.Optional[str]) -> str: ...
+    def copyingFileName(self, dirName: typing.Optional[str]) -> str: ...
+    def setBaseDir(self, dirName: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def defaultBaseDir() -> str: ...
+    @typing.overload
+    def baseDir(self) -> str: ...
+    @typing.overload
+    @staticmethod
+    def baseDir(archiveName: typing.Optional[str]) -> str: ...
+
+
+class QgsCptCityDataItem(QtCore.QObject):
+
+    class Type(int):
+        ColorRamp = ... # type: QgsCptCityDataItem.Type
+        Collection = ... # type: QgsCptCityDataItem.Type
+        Directory = ... # type: QgsCptCityDataItem.Type
+        Selection = ... # type: QgsCptCityDataItem.Type
+        AllRamps = ... # type: QgsCptCityDataItem.Type
+
+    def __init__(self, type: 'QgsCptCityDataItem.Type', parent: typing.Optional['QgsCptCityDataItem'], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+
+    endRemoveItems: typing.ClassVar[QtCore.pyqtSignal]
+    beginRemoveItems: typing.ClassVar[QtCore.pyqtSignal]
+    endInsertItems: typing.ClassVar[QtCore.pyqtSignal]
+    beginInsertItems: typing.ClassVar[QtCore.pyqtSignal]
+    def isValid(self) -> bool: ...
+    def toolTip(self) -> str: ...
+    def setToolTip(self, msg: typing.Optional[str]) -> None: ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def shortInfo(self) -> str: ...
+    def info(self) -> str: ...
+    def path(self) -> str: ...
+    def name(self) -> str: ...
+    @typing.overload
+    def icon(self) -> QtGui.QIcon: ...
+    @typing.overload
+    def icon(self, size: QtCore.QSize) -> QtGui.QIcon: ...
+    def children(self) -> list['QgsCptCityDataItem']: ...
+    def setParent(self, parent: typing.Optional['QgsCptCityDataItem']) -> None: ...
+    def parent(self) -> typing.Optional['QgsCptCityDataItem']: ...
+    def type(self) -> 'QgsCptCityDataItem.Type': ...
+    @staticmethod
+    def findItem(items: collections.abc.Iterable['QgsCptCityDataItem'], item: typing.Optional['QgsCptCityDataItem']) -> int: ...
+    @deprecated("""""")
+    def handleDrop(self, data: typing.Optional[QtCore.QMimeData], action: QtCore.Qt.DropAction) -> bool: ...
+    @deprecated("""""")
+    def acceptDrop(self) -> bool: ...
+    @deprecated("""""")
+    def paramWidget(self) -> typing.Optional[QtWidgets.QWidget]: ...
+    def equal(self, other: typing.Optional['QgsCptCityDataItem']) -> bool: ...
+    def removeChildItem(self, child: typing.Optional['QgsCptCityDataItem']) -> typing.Optional['QgsCptCityDataItem']: ...
+    def deleteChildItem(self, child: typing.Optional['QgsCptCityDataItem']) -> None: ...
+    def addChildItem(self, child: typing.Optional['QgsCptCityDataItem'], refresh: bool = ...) -> None: ...
+    def isPopulated(self) -> bool: ...
+    def populate(self) -> None: ...
+    def createChildren(self) -> list['QgsCptCityDataItem']: ...
+    def refresh(self) -> None: ...
+    def leafCount(self) -> int: ...
+    def rowCount(self) -> int: ...
+    def hasChildren(self) -> bool: ...
+
+
+class QgsCptCityColorRampItem(QgsCptCityDataItem):
+
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str], variantName: typing.Optional[str] = ..., initialize: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str], variantList: collections.abc.Iterable[typing.Optional[str]], initialize: bool = ...) -> None: ...
+
+    def init(self) -> None: ...
+    @typing.overload
+    def icon(self) -> QtGui.QIcon: ...
+    @typing.overload
+    def icon(self, size: QtCore.QSize) -> QtGui.QIcon: ...
+    def ramp(self) -> QgsCptCityColorRamp: ...
+    def leafCount(self) -> int: ...
+    def equal(self, other: typing.Optional[QgsCptCityDataItem]) -> bool: ...
+
+
+class QgsCptCityCollectionItem(QgsCptCityDataItem):
+
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+
+    def childrenRamps(self, recursive: bool) -> list[QgsCptCityDataItem]: ...
+    def addChild(self, item: typing.Optional[QgsCptCityDataItem]) -> None: ...
+    def setPopulated(self) -> None: ...
+
+
+class QgsCptCityDirectoryItem(QgsCptCityCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+
+    def dirEntries(self) -> list[str]: ...
+    def rampsMap(self) -> dict[str, list[str]]: ...
+    @staticmethod
+    def dataItem(parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> typing.Optional[QgsCptCityDataItem]: ...
+    def equal(self, other: typing.Optional[QgsCptCityDataItem]) -> bool: ...
+    def createChildren(self) -> list[QgsCptCityDataItem]: ...
+
+
+class QgsCptCitySelectionItem(QgsCptCityCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], path: typing.Optional[str]) -> None: ...
+
+    def parseXml(self) -> None: ...
+    def selectionsList(self) -> list[str]: ...
+    def equal(self, other: typing.Optional[QgsCptCityDataItem]) -> bool: ...
+    def createChildren(self) -> list[QgsCptCityDataItem]: ...
+
+
+class QgsCptCityAllRampsItem(QgsCptCityCollectionItem):
+
+    def __init__(self, parent: typing.Optional[QgsCptCityDataItem], name: typing.Optional[str], items: collections.abc.Iterable[QgsCptCityDataItem]) -> None: ...
+
+    def createChildren(self) -> list[QgsCptCityDataItem]: ...
+
+
+class QgsCptCityBrowserModel(QtCore.QAbstractItemModel):
+
+    class ViewType(int):
+        Authors = ... # type: QgsCptCityBrowserModel.ViewType
+        Selections = ... # type: QgsCptCityBrowserModel.ViewType
+        List = ... # type: QgsCptCityBrowserModel.ViewType
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., archive: typing.Optional[QgsCptCityArchive] = ..., Type: 'QgsCptCityBrowserModel.ViewType' = ...) -> None: ...
+
+    def removeRootItems(self) -> None: ...
+    def addRootItems(self) -> None: ...
+    def endRemoveItems(self) -> None: ...
+    def beginRemoveItems(self, parent: typing.Optional[QgsCptCityDataItem], first: int, last: int) -> None: ...
+    def endInsertItems(self) -> None: ...
+    def beginInsertItems(self, parent: typing.Optional[QgsCptCityDataItem], first: int, last: int) -> None: ...
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None: ...
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool: ...
+    def connectItem(self, item: typing.Optional[QgsCptCityDataItem]) -> None: ...
+    def findPath(self, path: typing.Optional[str]) -> QtCore.QModelIndex: ...
+    @typing.overload
+    def refresh(self, path: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def refresh(self, index: QtCore.QModelIndex = ...) -> None: ...
+    def reload(self) -> None: ...
+    def hasChildren(self, parent: QtCore.QModelIndex = ...) -> bool: ...
+    def dataItem(self, idx: QtCore.QModelIndex) -> typing.Optional[QgsCptCityDataItem]: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def findItem(self, item: typing.Optional[QgsCptCityDataItem], parent: typing.Optional[QgsCptCityDataItem] = ...) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def data(self, index: QtCore.QModelIndex, role: int = ...) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+
+
+class QgsMarkerSymbolLayer(QgsSymbolLayer):
+
+    def __init__(self, locked: bool = ...) -> None: ...
+
+    @staticmethod
+    def _rotatedOffset(offset: typing.Union[QtCore.QPointF, QtCore.QPoint], angle: float) -> QtCore.QPointF: ...
+    def markerOffset2(self, context: 'QgsSymbolRenderContext', width: float, height: float, widthUnit: Qgis.RenderUnit, heightUnit: Qgis.RenderUnit, widthMapUnitScale: QgsMapUnitScale, heightMapUnitScale: QgsMapUnitScale) -> typing.Tuple[float, float]: ...
+    def markerOffsetWithWidthAndHeight(self, context: 'QgsSymbolRenderContext', width: float, height: float) -> typing.Tuple[float, float]: ...
+    def markerOffset(self, context: 'QgsSymbolRenderContext') -> typing.Tuple[float, float]: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def dxfAngle(self, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfSize(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def verticalAnchorPoint(self) -> Qgis.VerticalAnchorPoint: ...
+    def setVerticalAnchorPoint(self, v: Qgis.VerticalAnchorPoint) -> None: ...
+    def horizontalAnchorPoint(self) -> Qgis.HorizontalAnchorPoint: ...
+    def setHorizontalAnchorPoint(self, h: Qgis.HorizontalAnchorPoint) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def scaleMethod(self) -> Qgis.ScaleMethod: ...
+    def setScaleMethod(self, scaleMethod: Qgis.ScaleMethod) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def size(self) -> float: ...
+    def setSize(self, size: float) -> None: ...
+    def setLineAngle(self, lineAngle: float) -> None: ...
+    def angle(self) -> float: ...
+    def setAngle(self, angle: float) -> None: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    HorizontalAnchorPoint: typing.Type[Qgis.HorizontalAnchorPoint]
+    Left: Qgis.HorizontalAnchorPoint
+    HCenter: Qgis.HorizontalAnchorPoint
+    Right: Qgis.HorizontalAnchorPoint
+    VerticalAnchorPoint: typing.Type[Qgis.VerticalAnchorPoint]
+    Top: Qgis.VerticalAnchorPoint
+    VCenter: Qgis.VerticalAnchorPoint
+    Bottom: Qgis.VerticalAnchorPoint
+    Baseline: Qgis.VerticalAnchorPoint
+
+
+class QgsEllipseSymbolLayer(QgsMarkerSymbolLayer):
+
+    class Shape(int):
+        Circle = ... # type: QgsEllipseSymbolLayer.Shape
+        Rectangle = ... # type: QgsEllipseSymbolLayer.Shape
+        Diamond = ... # type: QgsEllipseSymbolLayer.Shape
+        Cross = ... # type: QgsEllipseSymbolLayer.Shape
+        Arrow = ... # type: QgsEllipseSymbolLayer.Shape
+        HalfArc = ... # type: QgsEllipseSymbolLayer.Shape
+        Triangle = ... # type: QgsEllipseSymbolLayer.Shape
+        RightHalfTriangle = ... # type: QgsEllipseSymbolLayer.Shape
+        LeftHalfTriangle = ... # type: QgsEllipseSymbolLayer.Shape
+        SemiCircle = ... # type: QgsEllipseSymbolLayer.Shape
+        ThirdCircle = ... # type: QgsEllipseSymbolLayer.Shape
+        QuarterCircle = ... # type: QgsEllipseSymbolLayer.Shape
+        Pentagon = ... # type: QgsEllipseSymbolLayer.Shape
+        Hexagon = ... # type: QgsEllipseSymbolLayer.Shape
+        Octagon = ... # type: QgsEllipseSymbolLayer.Shape
+        Star = ... # type: QgsEllipseSymbolLayer.Shape
+
+    def __init__(self) -> None: ...
+
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def symbolHeightMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSymbolHeightMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def symbolHeightUnit(self) -> Qgis.RenderUnit: ...
+    def setSymbolHeightUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def symbolWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSymbolWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def symbolWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setSymbolWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setStrokeColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def setFillColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setStrokeWidth(self, w: float) -> None: ...
+    def setPenCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    def penCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setStrokeStyle(self, strokeStyle: QtCore.Qt.PenStyle) -> None: ...
+    def strokeStyle(self) -> QtCore.Qt.PenStyle: ...
+    def symbolHeight(self) -> float: ...
+    def setSymbolHeight(self, h: float) -> None: ...
+    def symbolWidth(self) -> float: ...
+    def setSymbolWidth(self, w: float) -> None: ...
+    def setSize(self, size: float) -> None: ...
+    @staticmethod
+    def encodeShape(shape: 'QgsEllipseSymbolLayer.Shape') -> str: ...
+    @staticmethod
+    def decodeShape(name: typing.Optional[str]) -> typing.Tuple['QgsEllipseSymbolLayer.Shape', typing.Optional[bool]]: ...
+    def setShape(self, shape: 'QgsEllipseSymbolLayer.Shape') -> None: ...
+    def shape(self) -> 'QgsEllipseSymbolLayer.Shape': ...
+    @deprecated("""""")
+    def symbolName(self) -> str: ...
+    @deprecated("""""")
+    def setSymbolName(self, name: typing.Optional[str]) -> None: ...
+    def writeDxf(self, e: QgsDxfExport, mmMapUnitScaleFactor: float, layerName: typing.Optional[str], context: 'QgsSymbolRenderContext', shift: typing.Union[QtCore.QPointF, QtCore.QPoint] = ...) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsEllipseSymbolLayer']: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def shapeIsFilled(shape: 'QgsEllipseSymbolLayer.Shape') -> bool: ...
+    @staticmethod
+    def availableShapes() -> list['QgsEllipseSymbolLayer.Shape']: ...
+
+
+class QgsEmbeddedSymbolRenderer(QgsFeatureRenderer):
+
+    def __init__(self, defaultSymbol: typing.Optional['QgsSymbol']) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsEmbeddedSymbolRenderer']: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def setDefaultSymbol(self, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def defaultSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def symbols(self, context: QgsRenderContext) -> list['QgsSymbol']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    def clone(self) -> typing.Optional['QgsEmbeddedSymbolRenderer']: ...
+    def usesEmbeddedSymbols(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional['QgsSymbol']: ...
+
+
+class QgsFeatureRendererGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFeatureRendererGenerator') -> None: ...
+
+    def createRenderer(self) -> typing.Optional[QgsFeatureRenderer]: ...
+    def level(self) -> float: ...
+    def id(self) -> str: ...
+
+
+class QgsSymbol(PyQt5.sip.wrapper):
+
+    class Property(int):
+        Opacity = ... # type: QgsSymbol.Property
+        ExtentBuffer = ... # type: QgsSymbol.Property
+
+    def __init__(self, type: Qgis.SymbolType, layers: collections.abc.Iterable[QgsSymbolLayer]) -> None: ...
+
+    def renderVertexMarker(self, pt: typing.Union[QtCore.QPointF, QtCore.QPoint], context: QgsRenderContext, currentVertexMarkerType: Qgis.VertexMarkerType, currentVertexMarkerSize: float) -> None: ...
+    def renderUsingLayer(self, layer: typing.Optional[QgsSymbolLayer], context: 'QgsSymbolRenderContext', geometryType: Qgis.GeometryType = ..., points: typing.Optional[QtGui.QPolygonF] = ..., rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]] = ...) -> None: ...
+    def copyCommonProperties(self, other: typing.Optional['QgsSymbol']) -> None: ...
+    def cloneLayers(self) -> list[QgsSymbolLayer]: ...
+    @staticmethod
+    def _getPolygon(pts: QtGui.QPolygonF, holes: collections.abc.Iterable[QtGui.QPolygonF], context: QgsRenderContext, polygon: QgsPolygon, clipToExtent: bool = ..., correctRingOrientation: bool = ...) -> None: ...
+    @staticmethod
+    def _getPolygonRing(context: QgsRenderContext, curve: QgsCurve, clipToExtent: bool, isExteriorRing: bool = ..., correctRingOrientation: bool = ...) -> QtGui.QPolygonF: ...
+    @staticmethod
+    def _getLineString(context: QgsRenderContext, curve: QgsCurve, clipToExtent: bool = ...) -> QtGui.QPolygonF: ...
+    @staticmethod
+    def _getPoint(context: QgsRenderContext, point: QgsPoint) -> QtCore.QPointF: ...
+    def setExtentBufferSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def extentBufferSizeUnit(self) -> Qgis.RenderUnit: ...
+    def setExtentBuffer(self, extentBuffer: float) -> None: ...
+    def extentBuffer(self) -> float: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ...) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ...) -> None: ...
+    def symbolRenderContext(self) -> typing.Optional['QgsSymbolRenderContext']: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ..., currentVertexMarkerType: Qgis.VertexMarkerType = ..., currentVertexMarkerSize: float = ...) -> None: ...
+    @deprecated("""""")
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    @deprecated("""""")
+    def setLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def setDataDefinedProperty(self, key: 'QgsSymbol.Property', property: QgsProperty) -> None: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def setAnimationSettings(self, settings: 'QgsSymbolAnimationSettings') -> None: ...
+    def animationSettings(self) -> 'QgsSymbolAnimationSettings': ...
+    def setBufferSettings(self, settings: typing.Optional['QgsSymbolBufferSettings']) -> None: ...
+    def bufferSettings(self) -> typing.Optional['QgsSymbolBufferSettings']: ...
+    def forceRHR(self) -> bool: ...
+    def setForceRHR(self, force: bool) -> None: ...
+    def clipFeaturesToExtent(self) -> bool: ...
+    def setClipFeaturesToExtent(self, clipFeaturesToExtent: bool) -> None: ...
+    def flags(self) -> Qgis.SymbolFlags: ...
+    def setFlags(self, flags: typing.Union[Qgis.SymbolFlags, Qgis.SymbolFlag]) -> None: ...
+    def renderHints(self) -> Qgis.SymbolRenderHints: ...
+    def setRenderHints(self, hints: typing.Union[Qgis.SymbolRenderHints, Qgis.SymbolRenderHint]) -> None: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSymbol']: ...
+    def dump(self) -> str: ...
+    @deprecated("""""")
+    def bigSymbolPreviewImage(self, expressionContext: typing.Optional[QgsExpressionContext] = ..., flags: int = ...) -> QtGui.QImage: ...
+    def bigSymbolPreviewImageV2(self, expressionContext: typing.Optional[QgsExpressionContext] = ..., flags: typing.Union[Qgis.SymbolPreviewFlags, Qgis.SymbolPreviewFlag] = ..., screen: QgsScreenProperties = ...) -> QtGui.QImage: ...
+    def asImage(self, size: QtCore.QSize, customContext: typing.Optional[QgsRenderContext] = ...) -> QtGui.QImage: ...
+    def exportImage(self, path: typing.Optional[str], format: typing.Optional[str], size: QtCore.QSize) -> None: ...
+    def drawPreviewIcon(self, painter: typing.Optional[QtGui.QPainter], size: QtCore.QSize, customContext: typing.Optional[QgsRenderContext] = ..., selected: bool = ..., expressionContext: typing.Optional[QgsExpressionContext] = ..., patchShape: typing.Optional[QgsLegendPatchShape] = ..., screen: QgsScreenProperties = ...) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields = ...) -> None: ...
+    def changeSymbolLayer(self, index: int, layer: typing.Optional[QgsSymbolLayer]) -> bool: ...
+    def takeSymbolLayer(self, index: int) -> typing.Optional[QgsSymbolLayer]: ...
+    def deleteSymbolLayer(self, index: int) -> bool: ...
+    def appendSymbolLayer(self, layer: typing.Optional[QgsSymbolLayer]) -> bool: ...
+    def insertSymbolLayer(self, index: int, layer: typing.Optional[QgsSymbolLayer]) -> bool: ...
+    def __delitem__(self, index: int) -> None: ...
+    def __getitem__(self, index: int) -> QgsSymbolLayer: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def symbolLayerCount(self) -> int: ...
+    def symbolLayer(self, layer: int) -> QgsSymbolLayer: ...
+    def symbolLayers(self) -> list[QgsSymbolLayer]: ...
+    def type(self) -> Qgis.SymbolType: ...
+    @staticmethod
+    def defaultSymbol(geomType: Qgis.GeometryType) -> typing.Optional['QgsSymbol']: ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, QgsPropertyDefinition]: ...
+    @staticmethod
+    def symbolTypeForGeometryType(type: Qgis.GeometryType) -> Qgis.SymbolType: ...
+    @staticmethod
+    def symbolTypeToString(type: Qgis.SymbolType) -> str: ...
+    SymbolType: typing.Type[Qgis.SymbolType]
+    Marker: Qgis.SymbolType
+    Line: Qgis.SymbolType
+    Fill: Qgis.SymbolType
+    Hybrid: Qgis.SymbolType
+    ScaleMethod: typing.Type[Qgis.ScaleMethod]
+    ScaleArea: Qgis.ScaleMethod
+    ScaleDiameter: Qgis.ScaleMethod
+    RenderHint: typing.Type[Qgis.SymbolRenderHint]
+    DynamicRotation: Qgis.SymbolRenderHint
+    IsSymbolLayerSubSymbol: Qgis.SymbolRenderHint
+    ForceVectorRendering: Qgis.SymbolRenderHint
+    ExcludeSymbolBuffers: Qgis.SymbolRenderHint
+    RenderHints: typing.Type[Qgis.SymbolRenderHints]
+    PreviewFlag: typing.Type[Qgis.SymbolPreviewFlag]
+    FlagIncludeCrosshairsForMarkerSymbols: Qgis.SymbolPreviewFlag
+    SymbolPreviewFlags: typing.Type[Qgis.SymbolPreviewFlags]
+    PropertyOpacity: QgsSymbol.Property
+    ExtentBuffer: QgsSymbol.Property
+    PreviewFlags: typing.Type[Qgis.SymbolPreviewFlags]
+
+
+class QgsFillSymbol(QgsSymbol):
+
+    def __init__(self, layers: collections.abc.Iterable[QgsSymbolLayer] = ...) -> None: ...
+
+    def clone(self) -> typing.Optional['QgsFillSymbol']: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], f: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def setAngle(self, angle: float) -> None: ...
+    @staticmethod
+    def createSimple(properties: dict[str, typing.Any]) -> typing.Optional['QgsFillSymbol']: ...
+
+
+class QgsFillSymbolLayer(QgsSymbolLayer):
+
+    def __init__(self, locked: bool = ...) -> None: ...
+
+    def _renderPolygon(self, p: typing.Optional[QtGui.QPainter], points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def toTiledPatternImage(self) -> QtGui.QImage: ...
+    def angle(self) -> float: ...
+    def setAngle(self, angle: float) -> None: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+
+
+class QgsSimpleFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., style: QtCore.Qt.BrushStyle = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeStyle: QtCore.Qt.PenStyle = ..., strokeWidth: float = ..., penJoinStyle: QtCore.Qt.PenJoinStyle = ...) -> None: ...
+
+    def toTiledPatternImage(self) -> QtGui.QImage: ...
+    def dxfBrushStyle(self) -> QtCore.Qt.BrushStyle: ...
+    def dxfBrushColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def dxfPenStyle(self) -> QtCore.Qt.PenStyle: ...
+    def dxfAngle(self, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def dxfWidth(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setStrokeWidth(self, strokeWidth: float) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setStrokeStyle(self, strokeStyle: QtCore.Qt.PenStyle) -> None: ...
+    def strokeStyle(self) -> QtCore.Qt.PenStyle: ...
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def setStrokeColor(self, strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setBrushStyle(self, style: QtCore.Qt.BrushStyle) -> None: ...
+    def brushStyle(self) -> QtCore.Qt.BrushStyle: ...
+    def ogrFeatureStyle(self, mmScaleFactor: float, mapUnitScaleFactor: float) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSimpleFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsGradientFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., gradientColorType: Qgis.GradientColorSource = ..., gradientType: Qgis.GradientType = ..., coordinateMode: Qgis.SymbolCoordinateReference = ..., gradientSpread: Qgis.GradientSpread = ...) -> None: ...
+
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def referencePoint2IsCentroid(self) -> bool: ...
+    def setReferencePoint2IsCentroid(self, isCentroid: bool) -> None: ...
+    def referencePoint2(self) -> QtCore.QPointF: ...
+    def setReferencePoint2(self, referencePoint: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def referencePoint1IsCentroid(self) -> bool: ...
+    def setReferencePoint1IsCentroid(self, isCentroid: bool) -> None: ...
+    def referencePoint1(self) -> QtCore.QPointF: ...
+    def setReferencePoint1(self, referencePoint: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def setGradientSpread(self, gradientSpread: Qgis.GradientSpread) -> None: ...
+    def gradientSpread(self) -> Qgis.GradientSpread: ...
+    def setCoordinateMode(self, coordinateMode: Qgis.SymbolCoordinateReference) -> None: ...
+    def coordinateMode(self) -> Qgis.SymbolCoordinateReference: ...
+    def setColor2(self, color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color2(self) -> QtGui.QColor: ...
+    def setColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def colorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setGradientColorType(self, gradientColorType: Qgis.GradientColorSource) -> None: ...
+    def gradientColorType(self) -> Qgis.GradientColorSource: ...
+    def setGradientType(self, gradientType: Qgis.GradientType) -> None: ...
+    def gradientType(self) -> Qgis.GradientType: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def clone(self) -> typing.Optional['QgsGradientFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    GradientColorType: typing.Type[Qgis.GradientColorSource]
+    SimpleTwoColor: Qgis.GradientColorSource
+    ColorRamp: Qgis.GradientColorSource
+    GradientType: typing.Type[Qgis.GradientType]
+    Linear: Qgis.GradientType
+    Radial: Qgis.GradientType
+    Conical: Qgis.GradientType
+    GradientCoordinateMode: typing.Type[Qgis.SymbolCoordinateReference]
+    Feature: Qgis.SymbolCoordinateReference
+    Viewport: Qgis.SymbolCoordinateReference
+    GradientSpread: typing.Type[Qgis.GradientSpread]
+    Pad: Qgis.GradientSpread
+    Reflect: Qgis.GradientSpread
+    Repeat: Qgis.GradientSpread
+
+
+class QgsShapeburstFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., colorType: Qgis.GradientColorSource = ..., blurRadius: int = ..., useWholeShape: bool = ..., maxDistance: float = ...) -> None: ...
+
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def ignoreRings(self) -> bool: ...
+    def setIgnoreRings(self, ignoreRings: bool) -> None: ...
+    def color2(self) -> QtGui.QColor: ...
+    def setColor2(self, color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def colorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def colorType(self) -> Qgis.GradientColorSource: ...
+    def setColorType(self, colorType: Qgis.GradientColorSource) -> None: ...
+    def distanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceUnit(self) -> Qgis.RenderUnit: ...
+    def setDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maxDistance(self) -> float: ...
+    def setMaxDistance(self, maxDistance: float) -> None: ...
+    def useWholeShape(self) -> bool: ...
+    def setUseWholeShape(self, useWholeShape: bool) -> None: ...
+    def blurRadius(self) -> int: ...
+    def setBlurRadius(self, blurRadius: int) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def clone(self) -> typing.Optional['QgsShapeburstFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    ShapeburstColorType: typing.Type[Qgis.GradientColorSource]
+    SimpleTwoColor: Qgis.GradientColorSource
+    ColorRamp: Qgis.GradientColorSource
+
+
+class QgsImageFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def applyBrushTransformFromContext(self, context: typing.Optional['QgsSymbolRenderContext'] = ...) -> bool: ...
+    def applyDataDefinedSettings(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def dxfPenStyle(self) -> QtCore.Qt.PenStyle: ...
+    def dxfWidth(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def coordinateReference(self) -> Qgis.SymbolCoordinateReference: ...
+    def setCoordinateReference(self, coordinateReference: Qgis.SymbolCoordinateReference) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+
+
+class QgsRasterFillSymbolLayer(QgsImageFillSymbolLayer):
+
+    def __init__(self, imageFilePath: typing.Optional[str] = ...) -> None: ...
+
+    def applyBrushTransformFromContext(self, context: typing.Optional['QgsSymbolRenderContext'] = ...) -> bool: ...
+    def applyDataDefinedSettings(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    @deprecated("""""")
+    def widthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    @deprecated("""""")
+    def setWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    @deprecated("""""")
+    def widthUnit(self) -> Qgis.RenderUnit: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    @deprecated("""""")
+    def setWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def height(self) -> float: ...
+    def setHeight(self, height: float) -> None: ...
+    def width(self) -> float: ...
+    def setWidth(self, width: float) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def coordinateMode(self) -> Qgis.SymbolCoordinateReference: ...
+    def setCoordinateMode(self, mode: Qgis.SymbolCoordinateReference) -> None: ...
+    def imageFilePath(self) -> str: ...
+    def setImageFilePath(self, imagePath: typing.Optional[str]) -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def usesMapUnits(self) -> bool: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def clone(self) -> typing.Optional['QgsRasterFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def resolvePaths(properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    FillCoordinateMode: typing.Type[Qgis.SymbolCoordinateReference]
+    Feature: Qgis.SymbolCoordinateReference
+    Viewport: Qgis.SymbolCoordinateReference
+
+
+class QgsSVGFillSymbolLayer(QgsImageFillSymbolLayer):
+
+    @typing.overload
+    def __init__(self, svgFilePath: typing.Optional[str], width: float = ..., rotation: float = ...) -> None: ...
+    @typing.overload
+    def __init__(self, svgData: typing.Union[QtCore.QByteArray, bytes, bytearray], width: float = ..., rotation: float = ...) -> None: ...
+
+    def applyDataDefinedSettings(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def setParameters(self, parameters: dict[typing.Optional[str], QgsProperty]) -> None: ...
+    def parameters(self) -> dict[str, QgsProperty]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def svgStrokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSvgStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def svgStrokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setSvgStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def patternWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setPatternWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def patternWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setPatternWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def svgStrokeWidth(self) -> float: ...
+    def setSvgStrokeWidth(self, w: float) -> None: ...
+    def svgStrokeColor(self) -> QtGui.QColor: ...
+    def setSvgStrokeColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def svgFillColor(self) -> QtGui.QColor: ...
+    def setSvgFillColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def patternWidth(self) -> float: ...
+    def setPatternWidth(self, width: float) -> None: ...
+    def svgFilePath(self) -> str: ...
+    def setSvgFilePath(self, svgPath: typing.Optional[str]) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def dxfColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def usesMapUnits(self) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSVGFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def resolvePaths(properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsLinePatternFillSymbolLayer(QgsImageFillSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def applyDataDefinedSettings(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setClipMode(self, mode: Qgis.LineClipMode) -> None: ...
+    def clipMode(self) -> Qgis.LineClipMode: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def lineWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setLineWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def lineWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setLineWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def distanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceUnit(self) -> Qgis.RenderUnit: ...
+    def setDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offset(self) -> float: ...
+    def setOffset(self, offset: float) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def lineWidth(self) -> float: ...
+    def setLineWidth(self, w: float) -> None: ...
+    def distance(self) -> float: ...
+    def setDistance(self, d: float) -> None: ...
+    def lineAngle(self) -> float: ...
+    def setLineAngle(self, a: float) -> None: ...
+    def ogrFeatureStyleWidth(self, widthScaleFactor: float) -> str: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def toTiledPatternImage(self) -> QtGui.QImage: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsLinePatternFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsPointPatternFillSymbolLayer(QgsImageFillSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def applyDataDefinedSettings(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def setSeed(self, seed: int) -> None: ...
+    def seed(self) -> int: ...
+    def setRandomDeviationYMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def setRandomDeviationXMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def randomDeviationYMapUnitScale(self) -> QgsMapUnitScale: ...
+    def randomDeviationXMapUnitScale(self) -> QgsMapUnitScale: ...
+    def randomDeviationYUnit(self) -> Qgis.RenderUnit: ...
+    def setRandomDeviationYUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def randomDeviationXUnit(self) -> Qgis.RenderUnit: ...
+    def setRandomDeviationXUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maximumRandomDeviationY(self) -> float: ...
+    def setMaximumRandomDeviationY(self, deviation: float) -> None: ...
+    def maximumRandomDeviationX(self) -> float: ...
+    def setMaximumRandomDeviationX(self, deviation: float) -> None: ...
+    def setClipMode(self, mode: Qgis.MarkerClipMode) -> None: ...
+    def clipMode(self) -> Qgis.MarkerClipMode: ...
+    def offsetYMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetYMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetYUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetYUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetXMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetXMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetXUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetXUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetY(self) -> float: ...
+    def setOffsetY(self, offset: float) -> None: ...
+    def offsetX(self) -> float: ...
+    def setOffsetX(self, offset: float) -> None: ...
+    def displacementYMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDisplacementYMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def displacementYUnit(self) -> Qgis.RenderUnit: ...
+    def setDisplacementYUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDisplacementY(self, d: float) -> None: ...
+    def displacementY(self) -> float: ...
+    def displacementXMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDisplacementXMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def displacementXUnit(self) -> Qgis.RenderUnit: ...
+    def setDisplacementXUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDisplacementX(self, d: float) -> None: ...
+    def displacementX(self) -> float: ...
+    def distanceYMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceYMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceYUnit(self) -> Qgis.RenderUnit: ...
+    def setDistanceYUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDistanceY(self, d: float) -> None: ...
+    def distanceY(self) -> float: ...
+    def distanceXMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceXMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceXUnit(self) -> Qgis.RenderUnit: ...
+    def setDistanceXUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDistanceX(self, d: float) -> None: ...
+    def distanceX(self) -> float: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def toTiledPatternImage(self) -> QtGui.QImage: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsPointPatternFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsRandomMarkerFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self, pointCount: int = ..., method: Qgis.PointCountMethod = ..., densityArea: float = ..., seed: int = ...) -> None: ...
+
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def densityAreaUnitScale(self) -> QgsMapUnitScale: ...
+    def setDensityAreaUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def densityAreaUnit(self) -> Qgis.RenderUnit: ...
+    def setDensityAreaUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDensityArea(self, area: float) -> None: ...
+    def densityArea(self) -> float: ...
+    def setCountMethod(self, method: Qgis.PointCountMethod) -> None: ...
+    def countMethod(self) -> Qgis.PointCountMethod: ...
+    def setClipPoints(self, clipped: bool) -> None: ...
+    def clipPoints(self) -> bool: ...
+    def setSeed(self, seed: int) -> None: ...
+    def seed(self) -> int: ...
+    def setPointCount(self, count: int) -> None: ...
+    def pointCount(self) -> int: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsRandomMarkerFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    CountMethod: typing.Type[Qgis.PointCountMethod]
+    AbsoluteCount: Qgis.PointCountMethod
+    DensityBasedCount: Qgis.PointCountMethod
+
+
+class QgsCentroidFillSymbolLayer(QgsFillSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def setClipOnCurrentPartOnly(self, clipOnCurrentPartOnly: bool) -> None: ...
+    def clipOnCurrentPartOnly(self) -> bool: ...
+    def setClipPoints(self, clipPoints: bool) -> None: ...
+    def clipPoints(self) -> bool: ...
+    def pointOnAllParts(self) -> bool: ...
+    def setPointOnAllParts(self, pointOnAllParts: bool) -> None: ...
+    def pointOnSurface(self) -> bool: ...
+    def setPointOnSurface(self, pointOnSurface: bool) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsCentroidFillSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygon(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsGeometryGeneratorSymbolLayer(QgsSymbolLayer):
+
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def render(self, context: 'QgsSymbolRenderContext', geometryType: Qgis.GeometryType = ..., points: typing.Optional[QtGui.QPolygonF] = ..., rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]] = ...) -> None: ...
+    def isCompatibleWithSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setUnits(self, units: Qgis.RenderUnit) -> None: ...
+    def units(self) -> Qgis.RenderUnit: ...
+    def geometryExpression(self) -> str: ...
+    def setGeometryExpression(self, exp: typing.Optional[str]) -> None: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional[QgsSymbolLayer]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def color(self) -> QtGui.QColor: ...
+    def usesMapUnits(self) -> bool: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def symbolType(self) -> Qgis.SymbolType: ...
+    def setSymbolType(self, symbolType: Qgis.SymbolType) -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any]) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsGraduatedSymbolRenderer(QgsFeatureRenderer):
+
+    class Mode(int):
+        EqualInterval = ... # type: QgsGraduatedSymbolRenderer.Mode
+        Quantile = ... # type: QgsGraduatedSymbolRenderer.Mode
+        Jenks = ... # type: QgsGraduatedSymbolRenderer.Mode
+        StdDev = ... # type: QgsGraduatedSymbolRenderer.Mode
+        Pretty = ... # type: QgsGraduatedSymbolRenderer.Mode
+        Custom = ... # type: QgsGraduatedSymbolRenderer.Mode
+
+    def __init__(self, attrName: typing.Optional[str] = ..., ranges: collections.abc.Iterable['QgsRendererRange'] = ...) -> None: ...
+
+    def legendKeyForValue(self, value: float) -> str: ...
+    def symbolForValue(self, value: float) -> typing.Optional[QgsSymbol]: ...
+    def rangeForValue(self, value: float) -> typing.Optional['QgsRendererRange']: ...
+    def updateRangeLabels(self) -> None: ...
+    def dataDefinedSizeLegend(self) -> typing.Optional[QgsDataDefinedSizeLegend]: ...
+    def setDataDefinedSizeLegend(self, settings: typing.Optional[QgsDataDefinedSizeLegend]) -> None: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsGraduatedSymbolRenderer']: ...
+    def legendClassificationAttribute(self) -> str: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def setGraduatedMethod(self, method: Qgis.GraduatedMethod) -> None: ...
+    def graduatedMethod(self) -> Qgis.GraduatedMethod: ...
+    def maxSymbolSize(self) -> float: ...
+    def minSymbolSize(self) -> float: ...
+    def setSymbolSizes(self, minSize: float, maxSize: float) -> None: ...
+    def updateSymbols(self, sym: typing.Optional[QgsSymbol]) -> None: ...
+    def updateColorRamp(self, ramp: typing.Optional[QgsColorRamp] = ...) -> None: ...
+    def setSourceColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def sourceColorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setSourceSymbol(self, sym: typing.Optional[QgsSymbol]) -> None: ...
+    def sourceSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def legendSymbolItems(self) -> list['QgsLegendSymbolItem']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    @staticmethod
+    @deprecated("""""")
+    def createRenderer(vlayer: typing.Optional[QgsVectorLayer], attrName: typing.Optional[str], classes: int, mode: 'QgsGraduatedSymbolRenderer.Mode', symbol: typing.Optional[QgsSymbol], ramp: typing.Optional[QgsColorRamp], legendFormat: 'QgsRendererRangeLabelFormat' = ..., useSymmetricMode: bool = ..., symmetryPoint: float = ..., listForCboPrettyBreaks: collections.abc.Iterable[typing.Optional[str]] = ..., astride: bool = ...) -> typing.Optional['QgsGraduatedSymbolRenderer']: ...
+    def calculateLabelPrecision(self, updateRanges: bool = ...) -> None: ...
+    @deprecated("""""")
+    def setLabelFormat(self, labelFormat: 'QgsRendererRangeLabelFormat', updateRanges: bool = ...) -> None: ...
+    @deprecated("""""")
+    def labelFormat(self) -> 'QgsRendererRangeLabelFormat': ...
+    @typing.overload
+    @deprecated("""""")
+    def updateClasses(self, vlayer: typing.Optional[QgsVectorLayer], mode: 'QgsGraduatedSymbolRenderer.Mode', nclasses: int, useSymmetricMode: bool = ..., symmetryPoint: float = ..., astride: bool = ...) -> None: ...
+    @typing.overload
+    def updateClasses(self, vl: typing.Optional[QgsVectorLayer], nclasses: int) -> str: ...
+    @staticmethod
+    @deprecated("""""")
+    def calcEqualIntervalBreaks(minimum: float, maximum: float, classes: int, useSymmetricMode: bool, symmetryPoint: float, astride: bool) -> list[float]: ...
+    @staticmethod
+    @deprecated("""""")
+    def makeBreaksSymmetric(breaks: collections.abc.Iterable[float], symmetryPoint: float, astride: bool) -> list[float]: ...
+    @deprecated("""""")
+    def setAstride(self, astride: bool) -> None: ...
+    @deprecated("""""")
+    def astride(self) -> bool: ...
+    @deprecated("""""")
+    def setSymmetryPoint(self, symmetryPoint: float) -> None: ...
+    @deprecated("""""")
+    def symmetryPoint(self) -> float: ...
+    @deprecated("""""")
+    def setUseSymmetricMode(self, useSymmetricMode: bool) -> None: ...
+    @deprecated("""""")
+    def useSymmetricMode(self) -> bool: ...
+    @deprecated("""""")
+    def setMode(self, mode: 'QgsGraduatedSymbolRenderer.Mode') -> None: ...
+    @deprecated("""""")
+    def mode(self) -> 'QgsGraduatedSymbolRenderer.Mode': ...
+    def setClassificationMethod(self, method: typing.Optional[QgsClassificationMethod]) -> None: ...
+    def classificationMethod(self) -> typing.Optional[QgsClassificationMethod]: ...
+    def sortByLabel(self, order: QtCore.Qt.SortOrder = ...) -> None: ...
+    def sortByValue(self, order: QtCore.Qt.SortOrder = ...) -> None: ...
+    def rangesHaveGaps(self) -> bool: ...
+    def rangesOverlap(self) -> bool: ...
+    def moveClass(self, from_: int, to: int) -> None: ...
+    def deleteAllClasses(self) -> None: ...
+    def deleteClass(self, idx: int) -> None: ...
+    def addBreak(self, breakValue: float, updateSymbols: bool = ...) -> None: ...
+    def addClassLowerUpper(self, lower: float, upper: float) -> None: ...
+    def addClassRange(self, range: 'QgsRendererRange') -> None: ...
+    def addClass(self, symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def updateRangeRenderState(self, rangeIndex: int, render: bool) -> bool: ...
+    def updateRangeLowerValue(self, rangeIndex: int, value: float) -> bool: ...
+    def updateRangeUpperValue(self, rangeIndex: int, value: float) -> bool: ...
+    def updateRangeLabel(self, rangeIndex: int, label: typing.Optional[str]) -> bool: ...
+    def updateRangeSymbol(self, rangeIndex: int, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def ranges(self) -> list['QgsRendererRange']: ...
+    def setClassAttribute(self, attr: typing.Optional[str]) -> None: ...
+    def classAttribute(self) -> str: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsGraduatedSymbolRenderer']: ...
+    def dump(self) -> str: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+    GraduatedMethod: typing.Type[Qgis.GraduatedMethod]
+    GraduatedColor: Qgis.GraduatedMethod
+    GraduatedSize: Qgis.GraduatedMethod
+
+
+class QgsHeatmapRenderer(QgsFeatureRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setWeightExpression(self, expression: typing.Optional[str]) -> None: ...
+    def weightExpression(self) -> str: ...
+    def setRenderQuality(self, quality: int) -> None: ...
+    def renderQuality(self) -> float: ...
+    def setMaximumValue(self, value: float) -> None: ...
+    def maximumValue(self) -> float: ...
+    def setRadiusMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def radiusMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setRadiusUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def radiusUnit(self) -> Qgis.RenderUnit: ...
+    def setRadius(self, radius: float) -> None: ...
+    def radius(self) -> float: ...
+    def setLegendSettings(self, settings: QgsColorRampLegendNodeSettings) -> None: ...
+    def legendSettings(self) -> QgsColorRampLegendNodeSettings: ...
+    def setColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def colorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def modifyRequestExtent(self, extent: QgsRectangle, context: QgsRenderContext) -> None: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsHeatmapRenderer']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def dump(self) -> str: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def clone(self) -> typing.Optional['QgsHeatmapRenderer']: ...
+
+
+class QgsInterpolatedLineColor(PyQt5.sip.wrapper):
+
+    class ColoringMethod(int):
+        SingleColor = ... # type: QgsInterpolatedLineColor.ColoringMethod
+        ColorRamp = ... # type: QgsInterpolatedLineColor.ColoringMethod
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, colorRampShader: QgsColorRampShader) -> None: ...
+    @typing.overload
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsInterpolatedLineColor') -> None: ...
+
+    def graduatedColors(self, value1: float, value2: float, breakValues: collections.abc.Iterable[float], breakColors: collections.abc.Iterable[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]], gradients: collections.abc.Iterable[QtGui.QLinearGradient]) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def singleColor(self) -> QtGui.QColor: ...
+    def colorRampShader(self) -> QgsColorRampShader: ...
+    def coloringMethod(self) -> 'QgsInterpolatedLineColor.ColoringMethod': ...
+    def setColoringMethod(self, coloringMethod: 'QgsInterpolatedLineColor.ColoringMethod') -> None: ...
+    def color(self, magnitude: float) -> QtGui.QColor: ...
+    @typing.overload
+    def setColor(self, colorRampShader: QgsColorRampShader) -> None: ...
+    @typing.overload
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+
+
+class QgsInterpolatedLineWidth(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsInterpolatedLineWidth') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def strokeWidth(self, value: float) -> float: ...
+    def setFixedStrokeWidth(self, fixedWidth: float) -> None: ...
+    def fixedStrokeWidth(self) -> float: ...
+    def setIsVariableWidth(self, isVariableWidth: bool) -> None: ...
+    def isVariableWidth(self) -> bool: ...
+    def setUseAbsoluteValue(self, useAbsoluteValue: bool) -> None: ...
+    def useAbsoluteValue(self) -> bool: ...
+    def setIgnoreOutOfRange(self, ignoreOutOfRange: bool) -> None: ...
+    def ignoreOutOfRange(self) -> bool: ...
+    def setMaximumWidth(self, maximumWidth: float) -> None: ...
+    def maximumWidth(self) -> float: ...
+    def setMinimumWidth(self, minimumWidth: float) -> None: ...
+    def minimumWidth(self) -> float: ...
+    def setMaximumValue(self, maximumValue: float) -> None: ...
+    def maximumValue(self) -> float: ...
+    def setMinimumValue(self, minimumValue: float) -> None: ...
+    def minimumValue(self) -> float: ...
+
+
+class QgsInterpolatedLineRenderer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsInterpolatedLineRenderer') -> None: ...
+
+    def setSelected(self, selected: bool) -> None: ...
+    def renderInDeviceCoordinates(self, valueColor1: float, valueColor2: float, valueWidth1: float, valueWidth2: float, point1: typing.Union[QtCore.QPointF, QtCore.QPoint], point2: typing.Union[QtCore.QPointF, QtCore.QPoint], context: QgsRenderContext) -> None: ...
+    @typing.overload
+    def render(self, value1: float, value2: float, point1: QgsPointXY, point2: QgsPointXY, context: QgsRenderContext) -> None: ...
+    @typing.overload
+    def render(self, valueColor1: float, valueColor2: float, valueWidth1: float, valueWidth2: float, point1: QgsPointXY, point2: QgsPointXY, context: QgsRenderContext) -> None: ...
+    def interpolatedColor(self) -> QgsInterpolatedLineColor: ...
+    def setInterpolatedColor(self, strokeColoring: QgsInterpolatedLineColor) -> None: ...
+    def widthUnit(self) -> Qgis.RenderUnit: ...
+    def setWidthUnit(self, strokeWidthUnit: Qgis.RenderUnit) -> None: ...
+    def interpolatedLineWidth(self) -> QgsInterpolatedLineWidth: ...
+    def setInterpolatedWidth(self, strokeWidth: QgsInterpolatedLineWidth) -> None: ...
+
+
+class QgsInterpolatedLineSymbolLayer(QgsLineSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def interpolatedColor(self) -> QgsInterpolatedLineColor: ...
+    def setInterpolatedColor(self, interpolatedLineColor: QgsInterpolatedLineColor) -> None: ...
+    @deprecated("""""")
+    def endValueExpressionForColor(self) -> str: ...
+    @deprecated("""""")
+    def startValueExpressionForColor(self) -> str: ...
+    @deprecated("""""")
+    def setExpressionsStringForColor(self, start: typing.Optional[str], end: typing.Optional[str]) -> None: ...
+    def interpolatedWidth(self) -> QgsInterpolatedLineWidth: ...
+    def setInterpolatedWidth(self, interpolatedLineWidth: QgsInterpolatedLineWidth) -> None: ...
+    def widthUnit(self) -> Qgis.RenderUnit: ...
+    def setWidthUnit(self, strokeWidthUnit: Qgis.RenderUnit) -> None: ...
+    @deprecated("""""")
+    def endValueExpressionForWidth(self) -> str: ...
+    @deprecated("""""")
+    def startValueExpressionForWidth(self) -> str: ...
+    @deprecated("""""")
+    def setExpressionsStringForWidth(self, start: typing.Optional[str], end: typing.Optional[str]) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsInterpolatedLineSymbolLayer']: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any]) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsMergedFeatureRenderer(QgsFeatureRenderer):
+
+    class GeometryOperation(int):
+        Merge = ... # type: QgsMergedFeatureRenderer.GeometryOperation
+        InvertOnly = ... # type: QgsMergedFeatureRenderer.GeometryOperation
+        MergeAndInvert = ... # type: QgsMergedFeatureRenderer.GeometryOperation
+
+    @typing.overload
+    def __init__(self, embeddedRenderer: typing.Optional[QgsFeatureRenderer]) -> None: ...
+    @typing.overload
+    def __init__(self, type: typing.Optional[str], embeddedRenderer: typing.Optional[QgsFeatureRenderer]) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsMergedFeatureRenderer']: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def embeddedRenderer(self) -> typing.Optional[QgsFeatureRenderer]: ...
+    def setEmbeddedRenderer(self, subRenderer: typing.Optional[QgsFeatureRenderer]) -> None: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def willRenderFeature(self, feature: QgsFeature, context: QgsRenderContext) -> bool: ...
+    def legendSymbolItems(self) -> list['QgsLegendSymbolItem']: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def originalSymbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def symbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def dump(self) -> str: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def clone(self) -> typing.Optional['QgsMergedFeatureRenderer']: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+
+
+class QgsInvertedPolygonRenderer(QgsMergedFeatureRenderer):
+
+    def __init__(self, embeddedRenderer: typing.Optional[QgsFeatureRenderer] = ...) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsInvertedPolygonRenderer']: ...
+    def setPreprocessingEnabled(self, enabled: bool) -> None: ...
+    def preprocessingEnabled(self) -> bool: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def dump(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsInvertedPolygonRenderer']: ...
+
+
+class QgsLegendSymbolItem(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, symbol: typing.Optional[QgsSymbol], label: typing.Optional[str], ruleKey: typing.Optional[str], checkable: bool = ..., scaleMinDenom: int = ..., scaleMaxDenom: int = ..., level: int = ..., parentRuleKey: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsLegendSymbolItem') -> None: ...
+
+    def userData(self, key: int) -> typing.Any: ...
+    def setUserData(self, key: int, value: typing.Any) -> None: ...
+    def dataDefinedSizeLegendSettings(self) -> typing.Optional[QgsDataDefinedSizeLegend]: ...
+    def setDataDefinedSizeLegendSettings(self, settings: typing.Optional[QgsDataDefinedSizeLegend]) -> None: ...
+    def setSymbol(self, s: typing.Optional[QgsSymbol]) -> None: ...
+    def parentRuleKey(self) -> str: ...
+    def level(self) -> int: ...
+    def scaleMaxDenom(self) -> int: ...
+    def scaleMinDenom(self) -> int: ...
+    def isScaleOK(self, scale: float) -> bool: ...
+    def legacyRuleKey(self) -> typing.Optional[QgsSymbol]: ...
+    def isCheckable(self) -> bool: ...
+    def ruleKey(self) -> str: ...
+    def label(self) -> str: ...
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+
+
+class QgsLinearReferencingSymbolLayer(QgsLineSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def averageAngleMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setAverageAngleMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def averageAngleUnit(self) -> Qgis.RenderUnit: ...
+    def setAverageAngleUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setAverageAngleLength(self, length: float) -> None: ...
+    def averageAngleLength(self) -> float: ...
+    def setLabelSource(self, source: Qgis.LinearReferencingLabelSource) -> None: ...
+    def labelSource(self) -> Qgis.LinearReferencingLabelSource: ...
+    def setPlacement(self, placement: Qgis.LinearReferencingPlacement) -> None: ...
+    def placement(self) -> Qgis.LinearReferencingPlacement: ...
+    def setShowMarker(self, show: bool) -> None: ...
+    def showMarker(self) -> bool: ...
+    def setLabelOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def labelOffsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setLabelOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def labelOffsetUnit(self) -> Qgis.RenderUnit: ...
+    def setLabelOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def labelOffset(self) -> QtCore.QPointF: ...
+    def setRotateLabels(self, rotate: bool) -> None: ...
+    def rotateLabels(self) -> bool: ...
+    def setSkipMultiplesOf(self, multiple: float) -> None: ...
+    def skipMultiplesOf(self) -> float: ...
+    def setInterval(self, interval: float) -> None: ...
+    def interval(self) -> float: ...
+    def setNumericFormat(self, format: typing.Optional[QgsNumericFormat]) -> None: ...
+    def numericFormat(self) -> typing.Optional[QgsNumericFormat]: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsLinearReferencingSymbolLayer']: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsLineSymbol(QgsSymbol):
+
+    def __init__(self, layers: collections.abc.Iterable[QgsSymbolLayer] = ...) -> None: ...
+
+    def clone(self) -> typing.Optional['QgsLineSymbol']: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, f: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def dataDefinedWidth(self) -> QgsProperty: ...
+    def setDataDefinedWidth(self, property: QgsProperty) -> None: ...
+    @typing.overload
+    def width(self) -> float: ...
+    @typing.overload
+    def width(self, context: QgsRenderContext) -> float: ...
+    def setWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setWidth(self, width: float) -> None: ...
+    @staticmethod
+    def createSimple(properties: dict[str, typing.Any]) -> typing.Optional['QgsLineSymbol']: ...
+
+
+class QgsSimpleLineSymbolLayer(QgsLineSymbolLayer):
+
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., width: float = ..., penStyle: QtCore.Qt.PenStyle = ...) -> None: ...
+
+    def setTweakDashPatternOnCorners(self, enabled: bool) -> None: ...
+    def tweakDashPatternOnCorners(self) -> bool: ...
+    def setAlignDashPattern(self, enabled: bool) -> None: ...
+    def alignDashPattern(self) -> bool: ...
+    def setDrawInsidePolygon(self, drawInsidePolygon: bool) -> None: ...
+    def drawInsidePolygon(self) -> bool: ...
+    def setTrimDistanceEndMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def trimDistanceEndMapUnitScale(self) -> QgsMapUnitScale: ...
+    def trimDistanceEndUnit(self) -> Qgis.RenderUnit: ...
+    def setTrimDistanceEndUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setTrimDistanceEnd(self, distance: float) -> None: ...
+    def trimDistanceEnd(self) -> float: ...
+    def setTrimDistanceStartMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def trimDistanceStartMapUnitScale(self) -> QgsMapUnitScale: ...
+    def trimDistanceStartUnit(self) -> Qgis.RenderUnit: ...
+    def setTrimDistanceStartUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setTrimDistanceStart(self, distance: float) -> None: ...
+    def trimDistanceStart(self) -> float: ...
+    def setDashPatternOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def dashPatternOffsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def dashPatternOffsetUnit(self) -> Qgis.RenderUnit: ...
+    def setDashPatternOffsetUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setDashPatternOffset(self, offset: float) -> None: ...
+    def dashPatternOffset(self) -> float: ...
+    def setCustomDashVector(self, vector: collections.abc.Iterable[float]) -> None: ...
+    def customDashVector(self) -> list[float]: ...
+    def setCustomDashPatternMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def customDashPatternMapUnitScale(self) -> QgsMapUnitScale: ...
+    def customDashPatternUnit(self) -> Qgis.RenderUnit: ...
+    def setCustomDashPatternUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setUseCustomDashPattern(self, b: bool) -> None: ...
+    def useCustomDashPattern(self) -> bool: ...
+    def setPenCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    def penCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setPenStyle(self, style: QtCore.Qt.PenStyle) -> None: ...
+    def penStyle(self) -> QtCore.Qt.PenStyle: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def dxfColor(self, context: 'QgsSymbolRenderContext') -> QtGui.QColor: ...
+    def dxfOffset(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfWidth(self, e: QgsDxfExport, context: 'QgsSymbolRenderContext') -> float: ...
+    def dxfPenStyle(self) -> QtCore.Qt.PenStyle: ...
+    def dxfCustomDashPattern(self) -> typing.Tuple[list[float], Qgis.RenderUnit]: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def ogrFeatureStyle(self, mmScaleFactor: float, mapUnitScaleFactor: float) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSimpleLineSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolygonStroke(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsTemplatedLineSymbolLayerBase(QgsLineSymbolLayer):
+
+    def __init__(self, rotateSymbol: bool = ..., interval: float = ...) -> None: ...
+
+    @staticmethod
+    def setCommonProperties(destLayer: typing.Optional['QgsTemplatedLineSymbolLayerBase'], properties: dict[str, typing.Any]) -> None: ...
+    def copyTemplateSymbolProperties(self, destLayer: typing.Optional['QgsTemplatedLineSymbolLayerBase']) -> None: ...
+    def renderSymbol(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], feature: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def setSymbolAngle(self, angle: float) -> None: ...
+    def symbolAngle(self) -> float: ...
+    def setSymbolLineAngle(self, angle: float) -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def canCauseArtifactsBetweenAdjacentTiles(self) -> bool: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def renderPolygonStroke(self, points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]], context: 'QgsSymbolRenderContext') -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def averageAngleMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setAverageAngleMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def averageAngleUnit(self) -> Qgis.RenderUnit: ...
+    def setAverageAngleUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setAverageAngleLength(self, length: float) -> None: ...
+    def averageAngleLength(self) -> float: ...
+    def setOffsetAlongLineMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetAlongLineMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetAlongLineUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def offsetAlongLineUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetAlongLine(self, offsetAlongLine: float) -> None: ...
+    def offsetAlongLine(self) -> float: ...
+    def setPlaceOnEveryPart(self, respect: bool) -> None: ...
+    def placeOnEveryPart(self) -> bool: ...
+    def setPlacements(self, placements: typing.Union[Qgis.MarkerLinePlacements, Qgis.MarkerLinePlacement]) -> None: ...
+    def placements(self) -> Qgis.MarkerLinePlacements: ...
+    @deprecated("""""")
+    def setPlacement(self, placement: Qgis.MarkerLinePlacement) -> None: ...
+    @deprecated("""""")
+    def placement(self) -> Qgis.MarkerLinePlacement: ...
+    def intervalMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setIntervalMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def intervalUnit(self) -> Qgis.RenderUnit: ...
+    def setIntervalUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setInterval(self, interval: float) -> None: ...
+    def interval(self) -> float: ...
+    def setRotateSymbols(self, rotate: bool) -> None: ...
+    def rotateSymbols(self) -> bool: ...
+    Placement: typing.Type[Qgis.MarkerLinePlacement]
+    Interval: Qgis.MarkerLinePlacement
+    Vertex: Qgis.MarkerLinePlacement
+    LastVertex: Qgis.MarkerLinePlacement
+    FirstVertex: Qgis.MarkerLinePlacement
+    CentralPoint: Qgis.MarkerLinePlacement
+    CurvePoint: Qgis.MarkerLinePlacement
+    SegmentCenter: Qgis.MarkerLinePlacement
+    InnerVertices: Qgis.MarkerLinePlacement
+
+
+class QgsMarkerLineSymbolLayer(QgsTemplatedLineSymbolLayerBase):
+
+    def __init__(self, rotateMarker: bool = ..., interval: float = ...) -> None: ...
+
+    def renderSymbol(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], feature: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def setSymbolAngle(self, angle: float) -> None: ...
+    def symbolAngle(self) -> float: ...
+    def setSymbolLineAngle(self, angle: float) -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    @deprecated("""""")
+    def setRotateMarker(self, rotate: bool) -> None: ...
+    @deprecated("""""")
+    def rotateMarker(self) -> bool: ...
+    def setDataDefinedProperty(self, key: QgsSymbolLayer.Property, property: QgsProperty) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def usesMapUnits(self) -> bool: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    @typing.overload
+    def width(self) -> float: ...
+    @typing.overload
+    def width(self, context: QgsRenderContext) -> float: ...
+    def setWidth(self, width: float) -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsMarkerLineSymbolLayer']: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    Interval: Qgis.MarkerLinePlacement
+    Vertex: Qgis.MarkerLinePlacement
+    LastVertex: Qgis.MarkerLinePlacement
+    FirstVertex: Qgis.MarkerLinePlacement
+    CentralPoint: Qgis.MarkerLinePlacement
+    CurvePoint: Qgis.MarkerLinePlacement
+
+
+class QgsHashedLineSymbolLayer(QgsTemplatedLineSymbolLayerBase):
+
+    def __init__(self, rotateSymbol: bool = ..., interval: float = ...) -> None: ...
+
+    def renderSymbol(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], feature: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def setSymbolAngle(self, angle: float) -> None: ...
+    def symbolAngle(self) -> float: ...
+    def setSymbolLineAngle(self, angle: float) -> None: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def hashLengthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setHashLengthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def hashLengthUnit(self) -> Qgis.RenderUnit: ...
+    def setHashLengthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setHashLength(self, length: float) -> None: ...
+    def hashLength(self) -> float: ...
+    def setHashAngle(self, angle: float) -> None: ...
+    def hashAngle(self) -> float: ...
+    def usesMapUnits(self) -> bool: ...
+    def setDataDefinedProperty(self, key: QgsSymbolLayer.Property, property: QgsProperty) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    @typing.overload
+    def width(self) -> float: ...
+    @typing.overload
+    def width(self, context: QgsRenderContext) -> float: ...
+    def setWidth(self, width: float) -> None: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def clone(self) -> typing.Optional['QgsHashedLineSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsAbstractBrushedLineSymbolLayer(QgsLineSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def renderPolylineUsingBrush(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext', brush: typing.Union[QtGui.QBrush, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], QtGui.QGradient], patternThickness: float, patternLength: float) -> None: ...
+    def setPenCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    def penCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+
+
+class QgsRasterLineSymbolLayer(QgsAbstractBrushedLineSymbolLayer):
+
+    def __init__(self, path: typing.Optional[str] = ...) -> None: ...
+
+    def color(self) -> QtGui.QColor: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def clone(self) -> typing.Optional['QgsRasterLineSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setPath(self, path: typing.Optional[str]) -> None: ...
+    def path(self) -> str: ...
+    @staticmethod
+    def resolvePaths(properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsLineburstSymbolLayer(QgsAbstractBrushedLineSymbolLayer):
+
+    def __init__(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+
+    def setColor2(self, color2: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color2(self) -> QtGui.QColor: ...
+    def setColorRamp(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    def colorRamp(self) -> typing.Optional[QgsColorRamp]: ...
+    def setGradientColorType(self, gradientColorType: Qgis.GradientColorSource) -> None: ...
+    def gradientColorType(self) -> Qgis.GradientColorSource: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def clone(self) -> typing.Optional['QgsLineburstSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsFilledLineSymbolLayer(QgsLineSymbolLayer):
+
+    def __init__(self, width: float = ..., fillSymbol: typing.Optional[QgsFillSymbol] = ...) -> None: ...
+
+    def setPenCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    def penCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def clone(self) -> typing.Optional['QgsFilledLineSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPolyline(self, points: QtGui.QPolygonF, context: 'QgsSymbolRenderContext') -> None: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsMapInfoSymbolConversionContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapInfoSymbolConversionContext') -> None: ...
+
+    def clearWarnings(self) -> None: ...
+    def warnings(self) -> list[str]: ...
+    def pushWarning(self, warning: typing.Optional[str]) -> None: ...
+
+
+class QgsMapInfoSymbolConverter(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapInfoSymbolConverter') -> None: ...
+
+    @staticmethod
+    def convertMarkerSymbol(identifier: int, context: QgsMapInfoSymbolConversionContext, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], size: float, sizeUnit: Qgis.RenderUnit) -> typing.Optional['QgsMarkerSymbol']: ...
+    @staticmethod
+    def convertFillSymbol(identifier: int, context: QgsMapInfoSymbolConversionContext, foreColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], backColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> typing.Optional[QgsFillSymbol]: ...
+    @staticmethod
+    def convertLineSymbol(identifier: int, context: QgsMapInfoSymbolConversionContext, foreColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], size: float, sizeUnit: Qgis.RenderUnit, interleaved: bool = ...) -> typing.Optional[QgsLineSymbol]: ...
+
+
+class QgsMarkerSymbol(QgsSymbol):
+
+    def __init__(self, layers: collections.abc.Iterable[QgsSymbolLayer] = ...) -> None: ...
+
+    def clone(self) -> typing.Optional['QgsMarkerSymbol']: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: QgsRenderContext, feature: QgsFeature = ...) -> QtCore.QRectF: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], f: typing.Optional[QgsFeature], context: QgsRenderContext, layer: int = ..., selected: bool = ...) -> None: ...
+    def scaleMethod(self) -> Qgis.ScaleMethod: ...
+    def setScaleMethod(self, scaleMethod: Qgis.ScaleMethod) -> None: ...
+    def dataDefinedSize(self) -> QgsProperty: ...
+    def setDataDefinedSize(self, property: QgsProperty) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    @typing.overload
+    def size(self) -> float: ...
+    @typing.overload
+    def size(self, context: QgsRenderContext) -> float: ...
+    def setSize(self, size: float) -> None: ...
+    def setLineAngle(self, lineAngle: float) -> None: ...
+    def dataDefinedAngle(self) -> QgsProperty: ...
+    def setDataDefinedAngle(self, property: QgsProperty) -> None: ...
+    def angle(self) -> float: ...
+    def setAngle(self, symbolAngle: float) -> None: ...
+    @staticmethod
+    def createSimple(properties: dict[str, typing.Any]) -> typing.Optional['QgsMarkerSymbol']: ...
+
+
+class QgsSimpleMarkerSymbolLayerBase(QgsMarkerSymbolLayer):
+
+    def __init__(self, shape: Qgis.MarkerShape = ..., size: float = ..., angle: float = ..., scaleMethod: Qgis.ScaleMethod = ...) -> None: ...
+
+    def calculateOffsetAndRotation(self, context: 'QgsSymbolRenderContext', scaledSize: float, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> typing.Tuple[bool, float]: ...
+    def calculateSize(self, context: 'QgsSymbolRenderContext') -> typing.Tuple[float, bool]: ...
+    def shapeToPolygon(self, shape: Qgis.MarkerShape, polygon: QtGui.QPolygonF) -> bool: ...
+    def prepareMarkerPath(self, symbol: Qgis.MarkerShape) -> bool: ...
+    def prepareMarkerShape(self, shape: Qgis.MarkerShape) -> bool: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    @staticmethod
+    def encodeShape(shape: Qgis.MarkerShape) -> str: ...
+    @staticmethod
+    def decodeShape(name: typing.Optional[str]) -> typing.Tuple[Qgis.MarkerShape, typing.Optional[bool]]: ...
+    def setShape(self, shape: Qgis.MarkerShape) -> None: ...
+    def shape(self) -> Qgis.MarkerShape: ...
+    @staticmethod
+    def shapeIsFilled(shape: Qgis.MarkerShape) -> bool: ...
+    @staticmethod
+    def availableShapes() -> list[Qgis.MarkerShape]: ...
+    Shape: typing.Type[Qgis.MarkerShape]
+    Square: Qgis.MarkerShape
+    Diamond: Qgis.MarkerShape
+    Pentagon: Qgis.MarkerShape
+    Hexagon: Qgis.MarkerShape
+    Triangle: Qgis.MarkerShape
+    EquilateralTriangle: Qgis.MarkerShape
+    Star: Qgis.MarkerShape
+    Arrow: Qgis.MarkerShape
+    Circle: Qgis.MarkerShape
+    Cross: Qgis.MarkerShape
+    CrossFill: Qgis.MarkerShape
+    Cross2: Qgis.MarkerShape
+    Line: Qgis.MarkerShape
+    ArrowHead: Qgis.MarkerShape
+    ArrowHeadFilled: Qgis.MarkerShape
+    SemiCircle: Qgis.MarkerShape
+    ThirdCircle: Qgis.MarkerShape
+    QuarterCircle: Qgis.MarkerShape
+    QuarterSquare: Qgis.MarkerShape
+    HalfSquare: Qgis.MarkerShape
+    DiagonalHalfSquare: Qgis.MarkerShape
+    RightHalfTriangle: Qgis.MarkerShape
+    LeftHalfTriangle: Qgis.MarkerShape
+    Octagon: Qgis.MarkerShape
+    SquareWithCorners: Qgis.MarkerShape
+    AsteriskFill: Qgis.MarkerShape
+    HalfArc: Qgis.MarkerShape
+    ThirdArc: Qgis.MarkerShape
+    QuarterArc: Qgis.MarkerShape
+    ParallelogramRight: Qgis.MarkerShape
+    ParallelogramLeft: Qgis.MarkerShape
+    Trapezoid: Qgis.MarkerShape
+    Shield: Qgis.MarkerShape
+    DiamondStar: Qgis.MarkerShape
+    Heart: Qgis.MarkerShape
+    Decagon: Qgis.MarkerShape
+    RoundedSquare: Qgis.MarkerShape
+
+
+class QgsSimpleMarkerSymbolLayer(QgsSimpleMarkerSymbolLayerBase):
+
+    def __init__(self, shape: Qgis.MarkerShape = ..., size: float = ..., angle: float = ..., scaleMethod: Qgis.ScaleMethod = ..., color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., penJoinStyle: QtCore.Qt.PenJoinStyle = ...) -> None: ...
+
+    def prepareCache(self, context: 'QgsSymbolRenderContext') -> bool: ...
+    def drawMarker(self, p: typing.Optional[QtGui.QPainter], context: 'QgsSymbolRenderContext') -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidthUnit(self, u: Qgis.RenderUnit) -> None: ...
+    def setStrokeWidth(self, w: float) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setPenCapStyle(self, style: QtCore.Qt.PenCapStyle) -> None: ...
+    def penCapStyle(self) -> QtCore.Qt.PenCapStyle: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setStrokeStyle(self, strokeStyle: QtCore.Qt.PenStyle) -> None: ...
+    def strokeStyle(self) -> QtCore.Qt.PenStyle: ...
+    def setStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def usesMapUnits(self) -> bool: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def writeDxf(self, e: QgsDxfExport, mmMapUnitScaleFactor: float, layerName: typing.Optional[str], context: 'QgsSymbolRenderContext', shift: typing.Union[QtCore.QPointF, QtCore.QPoint] = ...) -> bool: ...
+    def ogrFeatureStyle(self, mmScaleFactor: float, mapUnitScaleFactor: float) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSimpleMarkerSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsFilledMarkerSymbolLayer(QgsSimpleMarkerSymbolLayerBase):
+
+    def __init__(self, shape: Qgis.MarkerShape = ..., size: float = ..., angle: float = ..., scaleMethod: Qgis.ScaleMethod = ...) -> None: ...
+
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def estimateMaxBleed(self, context: QgsRenderContext) -> float: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def clone(self) -> typing.Optional['QgsFilledMarkerSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def stopFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def startFeatureRender(self, feature: QgsFeature, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsSvgMarkerSymbolLayer(QgsMarkerSymbolLayer):
+
+    def __init__(self, path: typing.Optional[str], size: float = ..., angle: float = ..., scaleMethod: Qgis.ScaleMethod = ...) -> None: ...
+
+    def calculateAspectRatio(self, context: 'QgsSymbolRenderContext', scaledSize: float) -> typing.Tuple[float, bool]: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def prepareExpressions(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def writeDxf(self, e: QgsDxfExport, mmMapUnitScaleFactor: float, layerName: typing.Optional[str], context: 'QgsSymbolRenderContext', shift: typing.Union[QtCore.QPointF, QtCore.QPoint] = ...) -> bool: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def setParameters(self, parameters: dict[typing.Optional[str], QgsProperty]) -> None: ...
+    def parameters(self) -> dict[str, QgsProperty]: ...
+    def setStrokeWidth(self, w: float) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setStrokeColor(self, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def setFixedAspectRatio(self, ratio: float) -> None: ...
+    def fixedAspectRatio(self) -> float: ...
+    def setPreservedAspectRatio(self, par: bool) -> bool: ...
+    def preservedAspectRatio(self) -> bool: ...
+    def updateDefaultAspectRatio(self) -> float: ...
+    def defaultAspectRatio(self) -> float: ...
+    def setPath(self, path: typing.Optional[str]) -> None: ...
+    def path(self) -> str: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSvgMarkerSymbolLayer']: ...
+    def usesMapUnits(self) -> bool: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def resolvePaths(properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsRasterMarkerSymbolLayer(QgsMarkerSymbolLayer):
+
+    def __init__(self, path: typing.Optional[str] = ..., size: float = ..., angle: float = ..., scaleMethod: Qgis.ScaleMethod = ...) -> None: ...
+
+    def copyCommonProperties(self, other: typing.Optional['QgsRasterMarkerSymbolLayer']) -> None: ...
+    def setCommonProperties(self, properties: dict[str, typing.Any]) -> None: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def setFixedAspectRatio(self, ratio: float) -> None: ...
+    def fixedAspectRatio(self) -> float: ...
+    def setPreservedAspectRatio(self, par: bool) -> bool: ...
+    def preservedAspectRatio(self) -> bool: ...
+    def updateDefaultAspectRatio(self) -> float: ...
+    def defaultAspectRatio(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setPath(self, path: typing.Optional[str]) -> None: ...
+    def path(self) -> str: ...
+    def calculateAspectRatio(self, context: 'QgsSymbolRenderContext', scaledSize: float) -> typing.Tuple[float, bool]: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def color(self) -> QtGui.QColor: ...
+    def usesMapUnits(self) -> bool: ...
+    def clone(self) -> typing.Optional['QgsRasterMarkerSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def resolvePaths(properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsFontMarkerSymbolLayer(QgsMarkerSymbolLayer):
+
+    def __init__(self, fontFamily: typing.Optional[str] = ..., chr: typing.Optional[str] = ..., pointSize: float = ..., color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., angle: float = ...) -> None: ...
+
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def setPenJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def penJoinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidth(self, width: float) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setCharacter(self, chr: typing.Optional[str]) -> None: ...
+    def character(self) -> str: ...
+    def setFontStyle(self, style: typing.Optional[str]) -> None: ...
+    def fontStyle(self) -> str: ...
+    def setFontFamily(self, family: typing.Optional[str]) -> None: ...
+    def fontFamily(self) -> str: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def writeSldMarker(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsFontMarkerSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def flags(self) -> Qgis.SymbolLayerFlags: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def resolveFonts(properties: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsAnimatedMarkerSymbolLayer(QgsRasterMarkerSymbolLayer):
+
+    def __init__(self, path: typing.Optional[str] = ..., size: float = ..., angle: float = ...) -> None: ...
+
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def frameRate(self) -> float: ...
+    def setFrameRate(self, rate: float) -> None: ...
+    def clone(self) -> typing.Optional['QgsAnimatedMarkerSymbolLayer']: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsMaskMarkerSymbolLayer(QgsMarkerSymbolLayer):
+
+    def __init__(self) -> None: ...
+
+    def setMasks(self, maskedLayers: collections.abc.Iterable['QgsSymbolLayerReference']) -> None: ...
+    def clearMasks(self) -> None: ...
+    def masks(self) -> list['QgsSymbolLayerReference']: ...
+    def enabled(self) -> bool: ...
+    def drawPreviewIcon(self, context: 'QgsSymbolRenderContext', size: QtCore.QSize) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def usesMapUnits(self) -> bool: ...
+    def bounds(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> QtCore.QRectF: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext') -> None: ...
+    def stopRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def startRender(self, context: 'QgsSymbolRenderContext') -> None: ...
+    def layerType(self) -> str: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def clone(self) -> typing.Optional['QgsMaskMarkerSymbolLayer']: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsNullSymbolRenderer(QgsFeatureRenderer):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsNullSymbolRenderer']: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def clone(self) -> typing.Optional[QgsFeatureRenderer]: ...
+    def dump(self) -> str: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def willRenderFeature(self, feature: QgsFeature, context: QgsRenderContext) -> bool: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+
+
+class QgsPointDistanceRenderer(QgsFeatureRenderer):
+
+    class GroupedFeature(PyQt5.sip.wrapper):
+
+        feature = ... # type: QgsFeature
+        isSelected = ... # type: bool
+        label = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, feature: QgsFeature, symbol: typing.Optional[QgsMarkerSymbol], isSelected: bool, label: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsPointDistanceRenderer.GroupedFeature') -> None: ...
+
+        def symbol(self) -> typing.Optional[QgsMarkerSymbol]: ...
+
+    def __init__(self, rendererName: typing.Optional[str], labelAttributeName: typing.Optional[str] = ...) -> None: ...
+
+    def drawLabels(self, centerPoint: typing.Union[QtCore.QPointF, QtCore.QPoint], context: 'QgsSymbolRenderContext', labelShifts: collections.abc.Iterable[typing.Union[QtCore.QPointF, QtCore.QPoint]], group: collections.abc.Iterable['QgsPointDistanceRenderer.GroupedFeature']) -> None: ...
+    def toleranceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setToleranceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def toleranceUnit(self) -> Qgis.RenderUnit: ...
+    def setToleranceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def tolerance(self) -> float: ...
+    def setTolerance(self, distance: float) -> None: ...
+    def labelColor(self) -> QtGui.QColor: ...
+    def setLabelColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def minimumLabelScale(self) -> float: ...
+    def setMinimumLabelScale(self, scale: float) -> None: ...
+    def labelFont(self) -> QtGui.QFont: ...
+    def setLabelFont(self, font: QtGui.QFont) -> None: ...
+    def labelAttributeName(self) -> str: ...
+    def setLabelAttributeName(self, name: typing.Optional[str]) -> None: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def filter(self, fields: QgsFields = ...) -> str: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def embeddedRenderer(self) -> typing.Optional[QgsFeatureRenderer]: ...
+    def setEmbeddedRenderer(self, r: typing.Optional[QgsFeatureRenderer]) -> None: ...
+    def legendSymbolItems(self) -> list[QgsLegendSymbolItem]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def willRenderFeature(self, feature: QgsFeature, context: QgsRenderContext) -> bool: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def originalSymbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def symbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+
+
+class QgsPointClusterRenderer(QgsPointDistanceRenderer):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsPointClusterRenderer']: ...
+    def setClusterSymbol(self, symbol: typing.Optional[QgsMarkerSymbol]) -> None: ...
+    def clusterSymbol(self) -> typing.Optional[QgsMarkerSymbol]: ...
+    @staticmethod
+    def create(symbologyElem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def clone(self) -> typing.Optional['QgsPointClusterRenderer']: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+
+
+class QgsPointDisplacementRenderer(QgsPointDistanceRenderer):
+
+    class Placement(int):
+        Ring = ... # type: QgsPointDisplacementRenderer.Placement
+        ConcentricRings = ... # type: QgsPointDisplacementRenderer.Placement
+        Grid = ... # type: QgsPointDisplacementRenderer.Placement
+
+    def __init__(self, labelAttributeName: typing.Optional[str] = ...) -> None: ...
+
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsPointDisplacementRenderer']: ...
+    def setCenterSymbol(self, symbol: typing.Optional[QgsMarkerSymbol]) -> None: ...
+    def centerSymbol(self) -> typing.Optional[QgsMarkerSymbol]: ...
+    def setPlacement(self, placement: 'QgsPointDisplacementRenderer.Placement') -> None: ...
+    def placement(self) -> 'QgsPointDisplacementRenderer.Placement': ...
+    def labelDistanceFactor(self) -> float: ...
+    def setLabelDistanceFactor(self, factor: float) -> None: ...
+    def circleRadiusAddition(self) -> float: ...
+    def setCircleRadiusAddition(self, distance: float) -> None: ...
+    def circleColor(self) -> QtGui.QColor: ...
+    def setCircleColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def circleWidth(self) -> float: ...
+    def setCircleWidth(self, width: float) -> None: ...
+    @staticmethod
+    def create(symbologyElem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def clone(self) -> typing.Optional['QgsPointDisplacementRenderer']: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+
+
+class QgsSymbolLevelItem(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, symbol: typing.Optional[QgsSymbol], layer: int) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSymbolLevelItem') -> None: ...
+
+    def layer(self) -> int: ...
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+
+
+class QgsRendererRange(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, range: QgsClassificationRange, symbol: typing.Optional[QgsSymbol], render: bool = ..., uuid: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, lowerValue: float, upperValue: float, symbol: typing.Optional[QgsSymbol], label: typing.Optional[str], render: bool = ..., uuid: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, range: 'QgsRendererRange') -> None: ...
+
+    def __ge__(self, other: 'QgsRendererRange') -> bool: ...
+    def __getitem__(self, a0: int) -> typing.Any: ...
+    def __repr__(self) -> typing.Any: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any], firstRange: bool = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, classAttribute: typing.Optional[str], context: QgsSldExportContext, firstRange: bool = ...) -> bool: ...
+    def dump(self) -> str: ...
+    def setRenderState(self, render: bool) -> None: ...
+    def renderState(self) -> bool: ...
+    def setUpperValue(self, upperValue: float) -> None: ...
+    def setLowerValue(self, lowerValue: float) -> None: ...
+    def setLabel(self, label: typing.Optional[str]) -> None: ...
+    def setSymbol(self, s: typing.Optional[QgsSymbol]) -> None: ...
+    def label(self) -> str: ...
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+    def upperValue(self) -> float: ...
+    def lowerValue(self) -> float: ...
+    def uuid(self) -> str: ...
+    def __lt__(self, other: 'QgsRendererRange') -> bool: ...
+
+
+@deprecated("")
+class QgsRendererRangeLabelFormat(PyQt5.sip.wrapper):
+
+    MAX_PRECISION = ... # type: int
+    MIN_PRECISION = ... # type: int
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, format: typing.Optional[str], precision: int = ..., trimTrailingZeroes: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRendererRangeLabelFormat') -> None: ...
+
+    def saveToDomElement(self, element: QtXml.QDomElement) -> None: ...
+    def setFromDomElement(self, element: QtXml.QDomElement) -> None: ...
+    def formatNumber(self, value: float) -> str: ...
+    def labelForRange(self, range: QgsRendererRange) -> str: ...
+    def labelForLowerUpper(self, lower: float, upper: float) -> str: ...
+    def setTrimTrailingZeroes(self, trimTrailingZeroes: bool) -> None: ...
+    def trimTrailingZeroes(self) -> bool: ...
+    def setPrecision(self, precision: int) -> None: ...
+    def precision(self) -> int: ...
+    def setFormat(self, format: typing.Optional[str]) -> None: ...
+    def format(self) -> str: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsRendererAbstractMetadata(PyQt5.sip.wrapper):
+
+    class LayerType(int):
+        PointLayer = ... # type: QgsRendererAbstractMetadata.LayerType
+        LineLayer = ... # type: QgsRendererAbstractMetadata.LayerType
+        PolygonLayer = ... # type: QgsRendererAbstractMetadata.LayerType
+        All = ... # type: QgsRendererAbstractMetadata.LayerType
+
+    class LayerTypes(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __xor__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __ior__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __or__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __iand__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __and__(self, f: typing.Union['QgsRendererAbstractMetadata.LayerTypes', 'QgsRendererAbstractMetadata.LayerType']) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __invert__(self) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str], icon: QtGui.QIcon = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRendererAbstractMetadata') -> None: ...
+
+    def createRendererFromSld(self, elem: QtXml.QDomElement, geomType: Qgis.GeometryType) -> typing.Optional[QgsFeatureRenderer]: ...
+    def createRendererWidget(self, layer: typing.Optional[QgsVectorLayer], style: typing.Optional['QgsStyle'], oldRenderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional[QgsRendererWidget]: ...
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def compatibleLayerTypes(self) -> 'QgsRendererAbstractMetadata.LayerTypes': ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsRendererMetadata(QgsRendererAbstractMetadata):
+
+    def __init__(self, a0: 'QgsRendererMetadata') -> None: ...
+
+    def compatibleLayerTypes(self) -> QgsRendererAbstractMetadata.LayerTypes: ...
+    def createRendererFromSld(self, elem: QtXml.QDomElement, geomType: Qgis.GeometryType) -> typing.Optional[QgsFeatureRenderer]: ...
+    def createRendererWidget(self, layer: typing.Optional[QgsVectorLayer], style: typing.Optional['QgsStyle'], renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional[QgsRendererWidget]: ...
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+
+
+class QgsRendererRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @typing.overload
+    def renderersList(self, layerTypes: typing.Union[QgsRendererAbstractMetadata.LayerTypes, QgsRendererAbstractMetadata.LayerType] = ...) -> list[str]: ...
+    @typing.overload
+    def renderersList(self, layer: typing.Optional[QgsVectorLayer]) -> list[str]: ...
+    def rendererMetadata(self, rendererName: typing.Optional[str]) -> typing.Optional[QgsRendererAbstractMetadata]: ...
+    def removeRenderer(self, rendererName: typing.Optional[str]) -> bool: ...
+    def addRenderer(self, metadata: typing.Optional[QgsRendererAbstractMetadata]) -> bool: ...
+
+
+class QgsRuleBasedRenderer(QgsFeatureRenderer):
+
+    class FeatureFlags(int):
+        FeatIsSelected = ... # type: QgsRuleBasedRenderer.FeatureFlags
+        FeatDrawMarkers = ... # type: QgsRuleBasedRenderer.FeatureFlags
+
+    class FeatureToRender(PyQt5.sip.wrapper):
+
+        feat = ... # type: QgsFeature
+        flags = ... # type: int
+
+        @typing.overload
+        def __init__(self, _f: QgsFeature, _flags: int) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRuleBasedRenderer.FeatureToRender') -> None: ...
+
+    class RenderJob(PyQt5.sip.wrapper):
+
+        ftr = ... # type: 'QgsRuleBasedRenderer.FeatureToRender'
+        symbol = ... # type: QgsSymbol
+
+        @typing.overload
+        def __init__(self, _ftr: 'QgsRuleBasedRenderer.FeatureToRender', _s: typing.Optional[QgsSymbol]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsRuleBasedRenderer.RenderJob') -> None: ...
+
+    class RenderLevel(PyQt5.sip.wrapper):
+
+        jobs = ... # type: collections.abc.Iterable['QgsRuleBasedRenderer.RenderJob']
+        zIndex = ... # type: int
+
+        @typing.overload
+        def __init__(self, z: int) -> None: ...
+        @typing.overload
+        def __init__(self, other: 'QgsRuleBasedRenderer.RenderLevel') -> None: ...
+
+    class Rule(PyQt5.sip.wrapper):
+
+        class RenderResult(int):
+            Filtered = ... # type: QgsRuleBasedRenderer.Rule.RenderResult
+            Inactive = ... # type: QgsRuleBasedRenderer.Rule.RenderResult
+            Rendered = ... # type: QgsRuleBasedRenderer.Rule.RenderResult
+
+        def __init__(self, symbol: typing.Optional[QgsSymbol], maximumScale: int = ..., minimumScale: int = ..., filterExp: typing.Optional[str] = ..., label: typing.Optional[str] = ..., description: typing.Optional[str] = ..., elseRule: bool = ...) -> None: ...
+
+        def initFilter(self) -> None: ...
+        def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+        def isElse(self) -> bool: ...
+        def setIsElse(self, iselse: bool) -> None: ...
+        def findRuleByKey(self, key: typing.Optional[str]) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def takeChildAt(self, i: int) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def takeChild(self, rule: typing.Optional['QgsRuleBasedRenderer.Rule']) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def removeChildAt(self, i: int) -> None: ...
+        def removeChild(self, rule: typing.Optional['QgsRuleBasedRenderer.Rule']) -> None: ...
+        def insertChild(self, i: int, rule: typing.Optional['QgsRuleBasedRenderer.Rule']) -> None: ...
+        def appendChild(self, rule: typing.Optional['QgsRuleBasedRenderer.Rule']) -> None: ...
+        def parent(self) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def descendants(self) -> list['QgsRuleBasedRenderer.Rule']: ...
+        def children(self) -> list['QgsRuleBasedRenderer.Rule']: ...
+        @staticmethod
+        def create(ruleElem: QtXml.QDomElement, symbolMap: typing.Any, reuseId: bool = ...) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def stopRender(self, context: QgsRenderContext) -> None: ...
+        def rulesForFeature(self, feature: QgsFeature, context: typing.Optional[QgsRenderContext] = ..., onlyActive: bool = ...) -> list['QgsRuleBasedRenderer.Rule']: ...
+        def legendKeysForFeature(self, feature: QgsFeature, context: typing.Optional[QgsRenderContext] = ...) -> set[str]: ...
+        def symbolsForFeature(self, feature: QgsFeature, context: typing.Optional[QgsRenderContext] = ...) -> list[QgsSymbol]: ...
+        def willRenderFeature(self, feature: QgsFeature, context: typing.Optional[QgsRenderContext] = ...) -> bool: ...
+        def renderFeature(self, featToRender: 'QgsRuleBasedRenderer.FeatureToRender', context: QgsRenderContext, renderQueue: collections.abc.Iterable['QgsRuleBasedRenderer.RenderLevel']) -> 'QgsRuleBasedRenderer.Rule.RenderResult': ...
+        def collectZLevels(self) -> typing.Any: ...
+        def hasActiveChildren(self) -> bool: ...
+        def startRender(self, context: QgsRenderContext, fields: QgsFields, filter: typing.Optional[str]) -> bool: ...
+        def save(self, doc: QtXml.QDomDocument, symbolMap: typing.Any) -> QtXml.QDomElement: ...
+        @staticmethod
+        def createFromSld(element: QtXml.QDomElement, geomType: Qgis.GeometryType) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        @typing.overload
+        @deprecated("""""")
+        def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+        @typing.overload
+        def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+        def clone(self) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+        def setActive(self, state: bool) -> None: ...
+        def setDescription(self, description: typing.Optional[str]) -> None: ...
+        def setFilterExpression(self, filterExp: typing.Optional[str]) -> None: ...
+        def setMaximumScale(self, scale: float) -> None: ...
+        def setMinimumScale(self, scale: float) -> None: ...
+        def setLabel(self, label: typing.Optional[str]) -> None: ...
+        def setSymbol(self, sym: typing.Optional[QgsSymbol]) -> None: ...
+        def setRuleKey(self, key: typing.Optional[str]) -> None: ...
+        def ruleKey(self) -> str: ...
+        def active(self) -> bool: ...
+        def description(self) -> str: ...
+        def filterExpression(self) -> str: ...
+        def filter(self) -> typing.Optional[QgsExpression]: ...
+        def minimumScale(self) -> float: ...
+        def maximumScale(self) -> float: ...
+        def dependsOnScale(self) -> bool: ...
+        def label(self) -> str: ...
+        def symbol(self) -> typing.Optional[QgsSymbol]: ...
+        def isScaleOK(self, scale: float) -> bool: ...
+        def isFilterOK(self, f: QgsFeature, context: typing.Optional[QgsRenderContext] = ...) -> bool: ...
+        def legendSymbolItems(self, currentLevel: int = ...) -> list[QgsLegendSymbolItem]: ...
+        def symbols(self, context: QgsRenderContext = ...) -> list[QgsSymbol]: ...
+        def needsGeometry(self) -> bool: ...
+        def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+        def dump(self, indent: int = ...) -> str: ...
+
+    @typing.overload
+    def __init__(self, root: typing.Optional['QgsRuleBasedRenderer.Rule']) -> None: ...
+    @typing.overload
+    def __init__(self, defaultSymbol: typing.Optional[QgsSymbol]) -> None: ...
+
+    @staticmethod
+    def convertToDataDefinedSymbology(symbol: typing.Optional[QgsSymbol], sizeScaleField: typing.Optional[str], rotationField: typing.Optional[str] = ...) -> None: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer], layer: typing.Optional[QgsVectorLayer] = ...) -> typing.Optional['QgsRuleBasedRenderer']: ...
+    @staticmethod
+    def refineRuleScales(initialRule: typing.Optional['QgsRuleBasedRenderer.Rule'], scales: collections.abc.Iterable[int]) -> None: ...
+    @staticmethod
+    def refineRuleRanges(initialRule: typing.Optional['QgsRuleBasedRenderer.Rule'], r: typing.Optional[QgsGraduatedSymbolRenderer]) -> None: ...
+    @staticmethod
+    def refineRuleCategories(initialRule: typing.Optional['QgsRuleBasedRenderer.Rule'], r: typing.Optional[QgsCategorizedSymbolRenderer]) -> None: ...
+    def rootRule(self) -> typing.Optional['QgsRuleBasedRenderer.Rule']: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def originalSymbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def symbolsForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def willRenderFeature(self, feature: QgsFeature, context: QgsRenderContext) -> bool: ...
+    def dump(self) -> str: ...
+    def legendSymbolItems(self) -> list[QgsLegendSymbolItem]: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def checkLegendSymbolItem(self, key: typing.Optional[str], state: bool = ...) -> None: ...
+    def legendSymbolItemChecked(self, key: typing.Optional[str]) -> bool: ...
+    def legendSymbolItemsCheckable(self) -> bool: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement, geomType: Qgis.GeometryType) -> typing.Optional[QgsFeatureRenderer]: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsRuleBasedRenderer']: ...
+    def filterNeedsGeometry(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def filter(self, fields: QgsFields = ...) -> str: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def canSkipRender(self) -> bool: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def renderFeature(self, feature: QgsFeature, context: QgsRenderContext, layer: int = ..., selected: bool = ..., drawVertexMarker: bool = ...) -> bool: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+
+
+class QgsSingleSymbolRenderer(QgsFeatureRenderer):
+
+    def __init__(self, symbol: typing.Optional[QgsSymbol]) -> None: ...
+
+    def dataDefinedSizeLegend(self) -> typing.Optional[QgsDataDefinedSizeLegend]: ...
+    def setDataDefinedSizeLegend(self, settings: typing.Optional[QgsDataDefinedSizeLegend]) -> None: ...
+    @staticmethod
+    def convertFromRenderer(renderer: typing.Optional[QgsFeatureRenderer]) -> typing.Optional['QgsSingleSymbolRenderer']: ...
+    def setLegendSymbolItem(self, key: typing.Optional[str], symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def legendKeyToExpression(self, key: typing.Optional[str], layer: typing.Optional[QgsVectorLayer]) -> typing.Tuple[str, bool]: ...
+    def legendKeysForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> set[str]: ...
+    def legendSymbolItems(self) -> list[QgsLegendSymbolItem]: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsFeatureRenderer]: ...
+    def symbols(self, context: QgsRenderContext) -> list[QgsSymbol]: ...
+    def capabilities(self) -> QgsFeatureRenderer.Capabilities: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement, geomType: Qgis.GeometryType) -> typing.Optional[QgsFeatureRenderer]: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any] = ...) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def clone(self) -> typing.Optional['QgsSingleSymbolRenderer']: ...
+    def dump(self) -> str: ...
+    def setSymbol(self, s: typing.Optional[QgsSymbol]) -> None: ...
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def startRender(self, context: QgsRenderContext, fields: QgsFields) -> None: ...
+    def originalSymbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def symbolForFeature(self, feature: QgsFeature, context: QgsRenderContext) -> typing.Optional[QgsSymbol]: ...
+    def flags(self) -> Qgis.FeatureRendererFlags: ...
+
+
+class QgsStyle(QtCore.QObject):
+
+    class TextFormatContext(int):
+        Labeling = ... # type: QgsStyle.TextFormatContext
+
+    class StyleEntity(int):
+        SymbolEntity = ... # type: QgsStyle.StyleEntity
+        TagEntity = ... # type: QgsStyle.StyleEntity
+        ColorrampEntity = ... # type: QgsStyle.StyleEntity
+        SmartgroupEntity = ... # type: QgsStyle.StyleEntity
+        TextFormatEntity = ... # type: QgsStyle.StyleEntity
+        LabelSettingsEntity = ... # type: QgsStyle.StyleEntity
+        LegendPatchShapeEntity = ... # type: QgsStyle.StyleEntity
+        Symbol3DEntity = ... # type: QgsStyle.StyleEntity
+
+    class SmartGroupTableColumn(int):
+        Id = ... # type: QgsStyle.SmartGroupTableColumn
+        Name = ... # type: QgsStyle.SmartGroupTableColumn
+        XML = ... # type: QgsStyle.SmartGroupTableColumn
+
+    class LabelSettingsTableColumn(int):
+        Id = ... # type: QgsStyle.LabelSettingsTableColumn
+        Name = ... # type: QgsStyle.LabelSettingsTableColumn
+        XML = ... # type: QgsStyle.LabelSettingsTableColumn
+        FavoriteId = ... # type: QgsStyle.LabelSettingsTableColumn
+
+    class TextFormatTableColumn(int):
+        Id = ... # type: QgsStyle.TextFormatTableColumn
+        Name = ... # type: QgsStyle.TextFormatTableColumn
+        XML = ... # type: QgsStyle.TextFormatTableColumn
+        FavoriteId = ... # type: QgsStyle.TextFormatTableColumn
+
+    class ColorRampTableColumn(int):
+        Id = ... # type: QgsStyle.ColorRampTableColumn
+        Name = ... # type: QgsStyle.ColorRampTableColumn
+        XML = ... # type: QgsStyle.ColorRampTableColumn
+        FavoriteId = ... # type: QgsStyle.ColorRampTableColumn
+
+    class TagmapTableColumn(int):
+        TagId = ... # type: QgsStyle.TagmapTableColumn
+        SymbolId = ... # type: QgsStyle.TagmapTableColumn
+
+    class TagTableColumn(int):
+        Id = ... # type: QgsStyle.TagTableColumn
+        Name = ... # type: QgsStyle.TagTableColumn
+
+    class SymbolTableColumn(int):
+        Id = ... # type: QgsStyle.SymbolTableColumn
+        Name = ... # type: QgsStyle.SymbolTableColumn
+        XML = ... # type: QgsStyle.SymbolTableColumn
+        FavoriteId = ... # type: QgsStyle.SymbolTableColumn
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    rebuildIconPreviews: typing.ClassVar[QtCore.pyqtSignal]
+    labelSettingsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    labelSettingsRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    labelSettingsAdded: typing.ClassVar[QtCore.pyqtSignal]
+    labelSettingsRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    textFormatChanged: typing.ClassVar[QtCore.pyqtSignal]
+    textFormatRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    textFormatAdded: typing.ClassVar[QtCore.pyqtSignal]
+    textFormatRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    rampChanged: typing.ClassVar[QtCore.pyqtSignal]
+    rampRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    rampAdded: typing.ClassVar[QtCore.pyqtSignal]
+    rampRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    symbolRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    symbolRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    entityChanged: typing.ClassVar[QtCore.pyqtSignal]
+    entityRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    entityRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    entityAdded: typing.ClassVar[QtCore.pyqtSignal]
+    favoritedChanged: typing.ClassVar[QtCore.pyqtSignal]
+    entityTagsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    groupsModified: typing.ClassVar[QtCore.pyqtSignal]
+    symbolChanged: typing.ClassVar[QtCore.pyqtSignal]
+    symbolSaved: typing.ClassVar[QtCore.pyqtSignal]
+    aboutToBeDestroyed: typing.ClassVar[QtCore.pyqtSignal]
+    initialized: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def isXmlStyleFile(path: typing.Optional[str]) -> bool: ...
+    def importXml(self, filename: typing.Optional[str]) -> bool: ...
+    def exportXml(self, filename: typing.Optional[str]) -> bool: ...
+    def symbolsOfSmartgroup(self, type: 'QgsStyle.StyleEntity', id: int) -> list[str]: ...
+    def smartgroupOperator(self, id: int) -> str: ...
+    def smartgroup(self, id: int) -> dict[str, list[str]]: ...
+    def smartgroupNames(self) -> list[str]: ...
+    def smartgroupsListMap(self) -> dict[int, str]: ...
+    def tag(self, id: int) -> str: ...
+    def symbolHasTag(self, type: 'QgsStyle.StyleEntity', symbol: typing.Optional[str], tag: typing.Optional[str]) -> bool: ...
+    def isFavorite(self, type: 'QgsStyle.StyleEntity', name: typing.Optional[str]) -> bool: ...
+    def tagsOfSymbol(self, type: 'QgsStyle.StyleEntity', symbol: typing.Optional[str]) -> list[str]: ...
+    def findSymbols(self, type: 'QgsStyle.StyleEntity', qword: typing.Optional[str]) -> list[str]: ...
+    def setFileName(self, filename: typing.Optional[str]) -> None: ...
+    def fileName(self) -> str: ...
+    def errorString(self) -> str: ...
+    @deprecated("""""")
+    def save(self, filename: typing.Optional[str] = ...) -> bool: ...
+    def load(self, filename: typing.Optional[str]) -> bool: ...
+    def createTables(self) -> None: ...
+    def createMemoryDatabase(self) -> bool: ...
+    def createDatabase(self, filename: typing.Optional[str]) -> bool: ...
+    def symbol3DNames(self) -> list[str]: ...
+    def renameSymbol3D(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def saveSymbol3D(self, name: typing.Optional[str], symbol: typing.Optional[QgsAbstract3DSymbol], favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @staticmethod
+    def defaultTextFormatForProject(project: typing.Optional[QgsProject], context: 'QgsStyle.TextFormatContext' = ...) -> 'QgsTextFormat': ...
+    def defaultTextFormat(self, context: 'QgsStyle.TextFormatContext' = ...) -> 'QgsTextFormat': ...
+    def defaultPatchAsQPolygonF(self, type: Qgis.SymbolType, size: QtCore.QSizeF) -> typing.Any: ...
+    def defaultPatch(self, type: Qgis.SymbolType, size: QtCore.QSizeF) -> QgsLegendPatchShape: ...
+    def previewSymbolForPatchShape(self, shape: QgsLegendPatchShape) -> typing.Optional[QgsSymbol]: ...
+    def legendPatchShapeNames(self) -> list[str]: ...
+    def renameLegendPatchShape(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def saveLegendPatchShape(self, name: typing.Optional[str], shape: QgsLegendPatchShape, favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def renameLabelSettings(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeLabelSettings(self, name: typing.Optional[str]) -> bool: ...
+    def saveLabelSettings(self, name: typing.Optional[str], settings: QgsPalLayerSettings, favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def renameTextFormat(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeTextFormat(self, name: typing.Optional[str]) -> bool: ...
+    def saveTextFormat(self, name: typing.Optional[str], format: 'QgsTextFormat', favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def renameColorRamp(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeColorRamp(self, name: typing.Optional[str]) -> bool: ...
+    def saveColorRamp(self, name: typing.Optional[str], ramp: typing.Optional[QgsColorRamp], favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def saveSymbol(self, name: typing.Optional[str], symbol: typing.Optional[QgsSymbol], favorite: bool, tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def removeEntityByName(self, type: 'QgsStyle.StyleEntity', name: typing.Optional[str]) -> bool: ...
+    def remove(self, type: 'QgsStyle.StyleEntity', id: int) -> bool: ...
+    def rename(self, type: 'QgsStyle.StyleEntity', id: int, newName: typing.Optional[str]) -> bool: ...
+    def removeFavorite(self, type: 'QgsStyle.StyleEntity', name: typing.Optional[str]) -> bool: ...
+    def addFavorite(self, type: 'QgsStyle.StyleEntity', name: typing.Optional[str]) -> bool: ...
+    def symbolsWithTag(self, type: 'QgsStyle.StyleEntity', tagid: int) -> list[str]: ...
+    def symbolsOfFavorite(self, type: 'QgsStyle.StyleEntity') -> list[str]: ...
+    def allNames(self, type: 'QgsStyle.StyleEntity') -> list[str]: ...
+    def smartgroupId(self, smartgroup: typing.Optional[str]) -> int: ...
+    def tagId(self, tag: typing.Optional[str]) -> int: ...
+    def entityId(self, type: 'QgsStyle.StyleEntity', name: typing.Optional[str]) -> int: ...
+    def symbolId(self, name: typing.Optional[str]) -> int: ...
+    def symbolNames(self) -> list[str]: ...
+    def symbolCount(self) -> int: ...
+    def symbolRef(self, name: typing.Optional[str]) -> typing.Optional[QgsSymbol]: ...
+    def symbol(self, name: typing.Optional[str]) -> typing.Optional[QgsSymbol]: ...
+    def renameSymbol(self, oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def renameEntity(self, type: 'QgsStyle.StyleEntity', oldName: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeSymbol(self, name: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def detagSymbol(self, type: 'QgsStyle.StyleEntity', symbol: typing.Optional[str], tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @typing.overload
+    def detagSymbol(self, type: 'QgsStyle.StyleEntity', symbol: typing.Optional[str]) -> bool: ...
+    def tagSymbol(self, type: 'QgsStyle.StyleEntity', symbol: typing.Optional[str], tags: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    @staticmethod
+    def defaultStyle(initialize: bool = ...) -> typing.Optional['QgsStyle']: ...
+    def labelSettingsId(self, name: typing.Optional[str]) -> int: ...
+    def labelSettingsNames(self) -> list[str]: ...
+    def labelSettingsCount(self) -> int: ...
+    def labelSettingsLayerType(self, name: typing.Optional[str]) -> Qgis.GeometryType: ...
+    def symbol3DCompatibleGeometryTypes(self, name: typing.Optional[str]) -> list[Qgis.GeometryType]: ...
+    def symbol3DCount(self) -> int: ...
+    def symbol3D(self, name: typing.Optional[str]) -> typing.Optional[QgsAbstract3DSymbol]: ...
+    def legendPatchShapeSymbolType(self, name: typing.Optional[str]) -> Qgis.SymbolType: ...
+    def legendPatchShapesCount(self) -> int: ...
+    def legendPatchShape(self, name: typing.Optional[str]) -> QgsLegendPatchShape: ...
+    def labelSettings(self, name: typing.Optional[str]) -> QgsPalLayerSettings: ...
+    def textFormatId(self, name: typing.Optional[str]) -> int: ...
+    def textFormatNames(self) -> list[str]: ...
+    def textFormatCount(self) -> int: ...
+    def textFormat(self, name: typing.Optional[str]) -> 'QgsTextFormat': ...
+    def colorrampId(self, name: typing.Optional[str]) -> int: ...
+    def colorRampRef(self, name: typing.Optional[str]) -> typing.Optional[QgsColorRamp]: ...
+    def colorRampNames(self) -> list[str]: ...
+    def colorRampCount(self) -> int: ...
+    def colorRamp(self, name: typing.Optional[str]) -> typing.Optional[QgsColorRamp]: ...
+    def clear(self) -> None: ...
+    def tags(self) -> list[str]: ...
+    def addSmartgroup(self, name: typing.Optional[str], op: typing.Optional[str], matchTag: collections.abc.Iterable[typing.Optional[str]], noMatchTag: collections.abc.Iterable[typing.Optional[str]], matchName: collections.abc.Iterable[typing.Optional[str]], noMatchName: collections.abc.Iterable[typing.Optional[str]]) -> int: ...
+    def addTag(self, tagName: typing.Optional[str]) -> int: ...
+    def addSymbol3D(self, name: typing.Optional[str], symbol: typing.Optional[QgsAbstract3DSymbol], update: bool = ...) -> bool: ...
+    def addLegendPatchShape(self, name: typing.Optional[str], shape: QgsLegendPatchShape, update: bool = ...) -> bool: ...
+    def addLabelSettings(self, name: typing.Optional[str], settings: QgsPalLayerSettings, update: bool = ...) -> bool: ...
+    def addTextFormat(self, name: typing.Optional[str], format: 'QgsTextFormat', update: bool = ...) -> bool: ...
+    def addColorRamp(self, name: typing.Optional[str], colorRamp: typing.Optional[QgsColorRamp], update: bool = ...) -> bool: ...
+    def addSymbol(self, name: typing.Optional[str], symbol: typing.Optional[QgsSymbol], update: bool = ...) -> bool: ...
+    def addEntity(self, name: typing.Optional[str], entity: typing.Optional['QgsStyleEntityInterface'], update: bool = ...) -> bool: ...
+    def setReadOnly(self, readOnly: bool) -> None: ...
+    def isReadOnly(self) -> bool: ...
+    def isInitialized(self) -> bool: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+
+
+class QgsStyleEntityInterface(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleEntityInterface') -> None: ...
+
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleSymbolEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, symbol: typing.Optional[QgsSymbol]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleSymbolEntity') -> None: ...
+
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleColorRampEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, ramp: typing.Optional[QgsColorRamp]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleColorRampEntity') -> None: ...
+
+    def ramp(self) -> typing.Optional[QgsColorRamp]: ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleTextFormatEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, format: 'QgsTextFormat') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleTextFormatEntity') -> None: ...
+
+    def format(self) -> 'QgsTextFormat': ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleLabelSettingsEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, settings: QgsPalLayerSettings) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleLabelSettingsEntity') -> None: ...
+
+    def settings(self) -> QgsPalLayerSettings: ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleLegendPatchShapeEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, shape: QgsLegendPatchShape) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleLegendPatchShapeEntity') -> None: ...
+
+    def shape(self) -> QgsLegendPatchShape: ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleSymbol3DEntity(QgsStyleEntityInterface):
+
+    @typing.overload
+    def __init__(self, symbol: typing.Optional[QgsAbstract3DSymbol]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleSymbol3DEntity') -> None: ...
+
+    def symbol(self) -> typing.Optional[QgsAbstract3DSymbol]: ...
+    def type(self) -> QgsStyle.StyleEntity: ...
+
+
+class QgsStyleEntityVisitorInterface(PyQt5.sip.wrapper):
+
+    class NodeType(int):
+        Project = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        Layer = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        SymbolRule = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        Layouts = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        PrintLayout = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        LayoutItem = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        Report = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        ReportHeader = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        ReportFooter = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        ReportSection = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        Annotations = ... # type: QgsStyleEntityVisitorInterface.NodeType
+        Annotation = ... # type: QgsStyleEntityVisitorInterface.NodeType
+
+    class StyleLeaf(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        entity = ... # type: QgsStyleEntityInterface
+        identifier = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, entity: typing.Optional[QgsStyleEntityInterface], identifier: typing.Optional[str] = ..., description: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsStyleEntityVisitorInterface.StyleLeaf') -> None: ...
+
+    class Node(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        identifier = ... # type: typing.Optional[str]
+        type = ... # type: 'QgsStyleEntityVisitorInterface.NodeType'
+
+        @typing.overload
+        def __init__(self, type: 'QgsStyleEntityVisitorInterface.NodeType', identifier: typing.Optional[str], description: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsStyleEntityVisitorInterface.Node') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsStyleEntityVisitorInterface') -> None: ...
+
+    def visitExit(self, node: 'QgsStyleEntityVisitorInterface.Node') -> bool: ...
+    def visitEnter(self, node: 'QgsStyleEntityVisitorInterface.Node') -> bool: ...
+    def visit(self, entity: 'QgsStyleEntityVisitorInterface.StyleLeaf') -> bool: ...
+
+
+class QgsStyleModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        Type = ... # type: QgsStyleModel.CustomRole
+        Tag = ... # type: QgsStyleModel.CustomRole
+        EntityName = ... # type: QgsStyleModel.CustomRole
+        SymbolType = ... # type: QgsStyleModel.CustomRole
+        IsFavorite = ... # type: QgsStyleModel.CustomRole
+        LayerType = ... # type: QgsStyleModel.CustomRole
+        CompatibleGeometryTypes = ... # type: QgsStyleModel.CustomRole
+        StyleName = ... # type: QgsStyleModel.CustomRole
+        StyleFileName = ... # type: QgsStyleModel.CustomRole
+        IsTitle = ... # type: QgsStyleModel.CustomRole
+
+    class Column(int):
+        Name = ... # type: QgsStyleModel.Column
+        Tags = ... # type: QgsStyleModel.Column
+
+    def __init__(self, style: typing.Optional[QgsStyle], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def addTargetScreenProperties(self, properties: QgsScreenProperties) -> None: ...
+    def addDesiredIconSize(self, size: QtCore.QSize) -> None: ...
+    def columnCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, index: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = ...) -> typing.Any: ...
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags: ...
+    def setData(self, index: QtCore.QModelIndex, value: typing.Any, role: int = ...) -> bool: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def style(self) -> typing.Optional[QgsStyle]: ...
+    Role: typing.Type[QgsStyleModel.CustomRole]
+    TypeRole: QgsStyleModel.CustomRole
+    TagRole: QgsStyleModel.CustomRole
+    EntityName: QgsStyleModel.CustomRole
+    SymbolTypeRole: QgsStyleModel.CustomRole
+    IsFavoriteRole: QgsStyleModel.CustomRole
+    LayerTypeRole: QgsStyleModel.CustomRole
+    CompatibleGeometryTypesRole: QgsStyleModel.CustomRole
+    StyleName: QgsStyleModel.CustomRole
+    StyleFileName: QgsStyleModel.CustomRole
+    IsTitleRole: QgsStyleModel.CustomRole
+
+
+class QgsStyleProxyModel(QtCore.QSortFilterProxyModel):
+
+    @typing.overload
+    def __init__(self, style: typing.Optional[QgsStyle], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, model: typing.Optional[typing.Union[QgsStyleModel, QgsCombinedStyleModel]], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setFilterString(self, filter: typing.Optional[str]) -> None: ...
+    def addTargetScreenProperties(self, properties: QgsScreenProperties) -> None: ...
+    def addDesiredIconSize(self, size: QtCore.QSize) -> None: ...
+    def setFavoritesOnly(self, favoritesOnly: bool) -> None: ...
+    def favoritesOnly(self) -> bool: ...
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def smartGroupId(self) -> int: ...
+    def setSmartGroupId(self, id: int) -> None: ...
+    def tagString(self) -> str: ...
+    def setTagString(self, tag: typing.Optional[str]) -> None: ...
+    def tagId(self) -> int: ...
+    def setTagId(self, id: int) -> None: ...
+    def setLayerType(self, type: Qgis.GeometryType) -> None: ...
+    def layerType(self) -> Qgis.GeometryType: ...
+    def setSymbolTypeFilterEnabled(self, enabled: bool) -> None: ...
+    def symbolTypeFilterEnabled(self) -> bool: ...
+    def setSymbolType(self, type: Qgis.SymbolType) -> None: ...
+    def symbolType(self) -> Qgis.SymbolType: ...
+    def setEntityFilterEnabled(self, enabled: bool) -> None: ...
+    def entityFilterEnabled(self) -> bool: ...
+    def setEntityFilter(self, filter: QgsStyle.StyleEntity) -> None: ...
+    def entityFilter(self) -> QgsStyle.StyleEntity: ...
+    def filterString(self) -> str: ...
+
+
+class QgsSvgCache(QgsAbstractContentCacheBase):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def checkReply(self, reply: typing.Optional[QtNetwork.QNetworkReply], path: typing.Optional[str]) -> bool: ...
+    remoteSvgFetched: typing.ClassVar[QtCore.pyqtSignal]
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def svgContent(self, path: typing.Optional[str], size: float, fill: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], stroke: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float, widthScaleFactor: float, fixedAspectRatio: float = ..., blocking: bool = ..., parameters: dict[typing.Optional[str], typing.Optional[str]] = ...) -> QtCore.QByteArray: ...
+    def getImageData(self, path: typing.Optional[str], blocking: bool = ...) -> QtCore.QByteArray: ...
+    def containsParamsV3(self, path: typing.Optional[str], defaultFillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], defaultStrokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], blocking: bool = ...) -> typing.Tuple[bool, bool, bool, bool, float, bool, bool, bool, bool, float, bool, bool, float]: ...
+    def containsParams(self, path: typing.Optional[str], defaultFillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], defaultStrokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], blocking: bool = ...) -> typing.Tuple[bool, bool, bool, float]: ...
+    def svgViewboxSize(self, path: typing.Optional[str], size: float, fill: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], stroke: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float, widthScaleFactor: float, fixedAspectRatio: float = ..., blocking: bool = ..., parameters: dict[typing.Optional[str], typing.Optional[str]] = ...) -> QtCore.QSizeF: ...
+    def svgAsPicture(self, path: typing.Optional[str], size: float, fill: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], stroke: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float, widthScaleFactor: float, forceVectorOutput: bool = ..., fixedAspectRatio: float = ..., blocking: bool = ..., parameters: dict[typing.Optional[str], typing.Optional[str]] = ...) -> QtGui.QPicture: ...
+    def svgAsImage(self, path: typing.Optional[str], size: float, fill: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], stroke: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float, widthScaleFactor: float, fixedAspectRatio: float = ..., blocking: bool = ..., parameters: dict[typing.Optional[str], typing.Optional[str]] = ...) -> typing.Tuple[QtGui.QImage, bool]: ...
+
+
+class QgsSymbolAnimationSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSymbolAnimationSettings') -> None: ...
+
+    def frameRate(self) -> float: ...
+    def setFrameRate(self, rate: float) -> None: ...
+    def isAnimated(self) -> bool: ...
+    def setIsAnimated(self, animated: bool) -> None: ...
+
+
+class QgsSymbolBufferSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSymbolBufferSettings') -> None: ...
+
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def setFillSymbol(self, symbol: typing.Optional[QgsFillSymbol]) -> None: ...
+    def fillSymbol(self) -> typing.Optional[QgsFillSymbol]: ...
+    def setJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def joinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSize(self, size: float) -> None: ...
+    def size(self) -> float: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+
+
+class QgsSymbolLayerId(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], index: int) -> None: ...
+    @typing.overload
+    def __init__(self, key: typing.Optional[str], indexPath: collections.abc.Iterable[int]) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSymbolLayerId') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __ge__(self, other: 'QgsSymbolLayerId') -> bool: ...
+    def __repr__(self) -> typing.Any: ...
+    def __lt__(self, other: 'QgsSymbolLayerId') -> bool: ...
+    def __eq__(self, other: object): ...
+    def symbolLayerIndexPath(self) -> list[int]: ...
+    def symbolKey(self) -> str: ...
+
+
+class QgsSymbolLayerReference(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, layerId: typing.Optional[str], symbolLayer: QgsSymbolLayerId) -> None: ...
+    @typing.overload
+    def __init__(self, layerId: typing.Optional[str], symbolLayerId: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSymbolLayerReference') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def __eq__(self, other: object): ...
+    def symbolLayerIdV2(self) -> str: ...
+    @deprecated("""""")
+    def symbolLayerId(self) -> QgsSymbolLayerId: ...
+    def layerId(self) -> str: ...
+
+
+class QgsSymbolLayerAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str], type: Qgis.SymbolType) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSymbolLayerAbstractMetadata') -> None: ...
+
+    def resolveFonts(self, properties: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def resolvePaths(self, properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createSymbolLayerFromSld(self, a0: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    def createSymbolLayerWidget(self, a0: typing.Optional[QgsVectorLayer]) -> typing.Optional[QgsSymbolLayerWidget]: ...
+    def createSymbolLayer(self, map: dict[str, typing.Any]) -> typing.Optional[QgsSymbolLayer]: ...
+    def type(self) -> Qgis.SymbolType: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsSymbolLayerMetadata(QgsSymbolLayerAbstractMetadata):
+
+    def __init__(self, a0: 'QgsSymbolLayerMetadata') -> None: ...
+
+    def resolveFonts(self, properties: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def resolvePaths(self, properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createSymbolLayerFromSld(self, elem: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    def createSymbolLayerWidget(self, vl: typing.Optional[QgsVectorLayer]) -> typing.Optional[QgsSymbolLayerWidget]: ...
+    def createSymbolLayer(self, map: dict[str, typing.Any]) -> typing.Optional[QgsSymbolLayer]: ...
+
+
+class QgsSymbolLayerRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def defaultSymbolLayer(type: Qgis.SymbolType) -> typing.Optional[QgsSymbolLayer]: ...
+    def symbolLayersForType(self, type: Qgis.SymbolType) -> list[str]: ...
+    def resolveFonts(self, name: typing.Optional[str], properties: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def resolvePaths(self, name: typing.Optional[str], properties: dict[str, typing.Any], pathResolver: QgsPathResolver, saving: bool) -> None: ...
+    def createSymbolLayerFromSld(self, name: typing.Optional[str], element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    def createSymbolLayer(self, name: typing.Optional[str], properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
+    def removeSymbolLayerType(self, metadata: typing.Optional[QgsSymbolLayerAbstractMetadata]) -> bool: ...
+    def addSymbolLayerType(self, metadata: typing.Optional[QgsSymbolLayerAbstractMetadata]) -> bool: ...
+    def symbolLayerMetadata(self, name: typing.Optional[str]) -> typing.Optional[QgsSymbolLayerAbstractMetadata]: ...
+
+
+class QgsSymbolLayerUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSymbolLayerUtils') -> None: ...
+
+    @staticmethod
+    def collectSymbolLayerClipGeometries(context: QgsRenderContext, symbolLayerId: typing.Optional[str], bounds: QtCore.QRectF) -> list[QgsGeometry]: ...
+    @staticmethod
+    def clearSymbolLayerMasks(symbol: typing.Optional[QgsSymbol]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def resetSymbolLayerIds(symbol: typing.Optional[QgsSymbol]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def resetSymbolLayerIds(symbolLayer: typing.Optional[QgsSymbolLayer]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def clearSymbolLayerIds(symbol: typing.Optional[QgsSymbol]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def clearSymbolLayerIds(symbolLayer: typing.Optional[QgsSymbolLayer]) -> None: ...
+    @staticmethod
+    def tileSize(width: int, height: int, angleRad: float) -> typing.Tuple[QtCore.QSize, float]: ...
+    @staticmethod
+    def evaluatePropertiesMap(propertiesMap: dict[typing.Optional[str], QgsProperty], context: QgsExpressionContext) -> dict[str, str]: ...
+    @staticmethod
+    def restrictedSizeSymbol(s: typing.Optional[QgsSymbol], minSize: float, maxSize: float, context: typing.Optional[QgsRenderContext]) -> typing.Tuple[typing.Optional[QgsSymbol], float, float, typing.Optional[bool]]: ...
+    @staticmethod
+    def rendererFrameRate(renderer: typing.Optional[QgsFeatureRenderer]) -> float: ...
+    @staticmethod
+    def toSymbolLayerPointers(renderer: typing.Optional[QgsFeatureRenderer], symbolLayerIds: collections.abc.Iterable[QgsSymbolLayerId]) -> set[QgsSymbolLayer]: ...
+    @staticmethod
+    def getSvgParametricPath(basePath: typing.Optional[str], fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def parametricSvgToSld(doc: QtXml.QDomDocument, graphicElem: QtXml.QDomElement, path: typing.Optional[str], fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], size: float, strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float) -> None: ...
+    @typing.overload
+    @staticmethod
+    def parametricSvgToSld(doc: QtXml.QDomDocument, graphicElem: QtXml.QDomElement, path: typing.Optional[str], fillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], size: float, strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeWidth: float, context: QgsSldExportContext) -> None: ...
+    @staticmethod
+    def mergeScaleDependencies(mScaleMinDenom: float, mScaleMaxDenom: float, props: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def applyScaleDependency(doc: QtXml.QDomDocument, ruleElem: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @staticmethod
+    def rescaleArrayUom(array: collections.abc.Iterable[float], unit: Qgis.RenderUnit, props: dict[str, typing.Any]) -> list[float]: ...
+    @staticmethod
+    def rescalePointUom(point: typing.Union[QtCore.QPointF, QtCore.QPoint], unit: Qgis.RenderUnit, props: dict[str, typing.Any]) -> QtCore.QPointF: ...
+    @staticmethod
+    def rescaleUom(size: float, unit: Qgis.RenderUnit, props: dict[str, typing.Any]) -> float: ...
+    @staticmethod
+    def prettyBreaks(minimum: float, maximum: float, classes: int) -> list[float]: ...
+    @staticmethod
+    def fieldOrExpressionFromExpression(expression: typing.Optional[QgsExpression]) -> str: ...
+    @staticmethod
+    def fieldOrExpressionToExpression(fieldOrExpression: typing.Optional[str]) -> typing.Optional[QgsExpression]: ...
+    @staticmethod
+    def appendPolyline(target: QtGui.QPolygonF, line: QtGui.QPolygonF) -> None: ...
+    @staticmethod
+    def isSharpCorner(p1: typing.Union[QtCore.QPointF, QtCore.QPoint], p2: typing.Union[QtCore.QPointF, QtCore.QPoint], p3: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> bool: ...
+    @staticmethod
+    def polylineSubstring(polyline: QtGui.QPolygonF, startOffset: float, endOffset: float) -> QtGui.QPolygonF: ...
+    @staticmethod
+    def polylineLength(polyline: QtGui.QPolygonF) -> float: ...
+    @staticmethod
+    def pointInPolygon(points: QtGui.QPolygonF, point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> bool: ...
+    @staticmethod
+    def polygonPointOnSurface(points: QtGui.QPolygonF, rings: typing.Optional[collections.abc.Iterable[QtGui.QPolygonF]] = ...) -> QtCore.QPointF: ...
+    @staticmethod
+    def polygonCentroid(points: QtGui.QPolygonF) -> QtCore.QPointF: ...
+    @staticmethod
+    def toQPolygonF(geometry: typing.Optional[typing.Union[QgsGeometry, QgsAbstractGeometry]], type: Qgis.SymbolType) -> typing.Any: ...
+    @staticmethod
+    def svgSymbolPathToName(path: typing.Optional[str], pathResolver: QgsPathResolver) -> str: ...
+    @staticmethod
+    def svgSymbolNameToPath(name: typing.Optional[str], pathResolver: QgsPathResolver) -> str: ...
+    @staticmethod
+    def listSvgFilesAt(directory: typing.Optional[str]) -> list[str]: ...
+    @staticmethod
+    def listSvgFiles() -> list[str]: ...
+    @staticmethod
+    def pointOnLineWithDistance(startPoint: typing.Union[QtCore.QPointF, QtCore.QPoint], directionPoint: typing.Union[QtCore.QPointF, QtCore.QPoint], distance: float) -> QtCore.QPointF: ...
+    @staticmethod
+    def sortVariantList(list: collections.abc.Iterable[typing.Any], order: QtCore.Qt.SortOrder) -> None: ...
+    @staticmethod
+    def condenseFillAndOutline(fill: typing.Optional[QgsFillSymbolLayer], outline: typing.Optional[QgsLineSymbolLayer]) -> bool: ...
+    @staticmethod
+    def premultiplyColor(rgb: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], alpha: int) -> None: ...
+    @staticmethod
+    def blurImageInPlace(image: QtGui.QImage, rect: QtCore.QRect, radius: int, alphaOnly: bool) -> None: ...
+    @staticmethod
+    def multiplyImageOpacity(image: typing.Optional[QtGui.QImage], opacity: float) -> None: ...
+    @staticmethod
+    def parseColorWithAlpha(colorStr: typing.Optional[str], strictEval: bool = ...) -> typing.Tuple[QtGui.QColor, bool]: ...
+    @staticmethod
+    def parseColor(colorStr: typing.Optional[str], strictEval: bool = ...) -> QtGui.QColor: ...
+    @staticmethod
+    def importColorsFromGpl(file: QtCore.QFile, name: typing.Optional[str]) -> typing.Tuple[list[tuple[QtGui.QColor, str]], bool]: ...
+    @staticmethod
+    def saveColorsToGpl(file: QtCore.QFile, paletteName: typing.Optional[str], colors: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]]) -> bool: ...
+    @staticmethod
+    def colorListToMimeData(colorList: collections.abc.Iterable[tuple[typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], typing.Optional[str]]], allFormats: bool = ...) -> typing.Optional[QtCore.QMimeData]: ...
+    @staticmethod
+    def colorListFromMimeData(data: typing.Optional[QtCore.QMimeData]) -> list[tuple[QtGui.QColor, str]]: ...
+    @staticmethod
+    def colorFromMimeData(data: typing.Optional[QtCore.QMimeData]) -> typing.Tuple[QtGui.QColor, bool]: ...
+    @staticmethod
+    def colorToMimeData(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Optional[QtCore.QMimeData]: ...
+    @staticmethod
+    def parseColorList(colorStr: typing.Optional[str]) -> list[QtGui.QColor]: ...
+    @staticmethod
+    def colorToName(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> str: ...
+    @staticmethod
+    def colorRampToVariant(name: typing.Optional[str], ramp: typing.Optional[QgsColorRamp]) -> typing.Any: ...
+    @staticmethod
+    def saveColorRamp(name: typing.Optional[str], ramp: typing.Optional[QgsColorRamp], doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def loadColorRamp(element: QtXml.QDomElement) -> typing.Optional[QgsColorRamp]: ...
+    @typing.overload
+    @staticmethod
+    def loadColorRamp(value: typing.Any) -> typing.Optional[QgsColorRamp]: ...
+    @staticmethod
+    def symbolFromMimeData(data: typing.Optional[QtCore.QMimeData]) -> typing.Optional[QgsSymbol]: ...
+    @staticmethod
+    def symbolToMimeData(symbol: typing.Optional[QgsSymbol]) -> typing.Optional[QtCore.QMimeData]: ...
+    @staticmethod
+    def clearSymbolMap(symbols: typing.Any) -> None: ...
+    @staticmethod
+    def saveSymbols(symbols: typing.Any, tagName: typing.Optional[str], doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def loadSymbols(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Any: ...
+    @staticmethod
+    def saveProperties(props: dict[str, typing.Any], doc: QtXml.QDomDocument, element: QtXml.QDomElement) -> None: ...
+    @staticmethod
+    def parseProperties(element: QtXml.QDomElement) -> dict[str, typing.Any]: ...
+    @staticmethod
+    def getVendorOptionList(element: QtXml.QDomElement) -> dict[str, str]: ...
+    @staticmethod
+    def createVendorOptionElement(doc: QtXml.QDomDocument, name: typing.Optional[str], value: typing.Optional[str]) -> QtXml.QDomElement: ...
+    @staticmethod
+    def getSvgParameterList(element: QtXml.QDomElement) -> dict[str, str]: ...
+    @staticmethod
+    def createSvgParameterElement(doc: QtXml.QDomDocument, name: typing.Optional[str], value: typing.Optional[str]) -> QtXml.QDomElement: ...
+    @staticmethod
+    def functionFromSldElement(element: QtXml.QDomElement, function: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createFunctionElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, function: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def createFunctionElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, function: typing.Optional[str], context: QgsSldExportContext) -> bool: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createExpressionElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, function: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def createExpressionElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, function: typing.Optional[str], context: QgsSldExportContext) -> bool: ...
+    @staticmethod
+    def geometryFromSldElement(element: QtXml.QDomElement, geomFunc: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createGeometryElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, geomFunc: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def createGeometryElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, geomFunc: typing.Optional[str], context: QgsSldExportContext) -> None: ...
+    @staticmethod
+    def onlineResourceFromSldElement(element: QtXml.QDomElement, path: typing.Optional[str], format: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def createOnlineResourceElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, path: typing.Optional[str], format: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def createAnchorPointElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, anchor: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    @staticmethod
+    def displacementFromSldElement(element: QtXml.QDomElement, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> bool: ...
+    @staticmethod
+    def createDisplacementElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    @staticmethod
+    def opacityFromSldElement(element: QtXml.QDomElement, alphaFunc: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createOpacityElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, alphaFunc: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def createOpacityElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, alphaFunc: typing.Optional[str], context: QgsSldExportContext) -> None: ...
+    @staticmethod
+    def rotationFromSldElement(element: QtXml.QDomElement, rotationFunc: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def createRotationElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, rotationFunc: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @staticmethod
+    def createRotationElement(doc: QtXml.QDomDocument, element: QtXml.QDomElement, rotationFunc: typing.Optional[str], context: QgsSldExportContext) -> None: ...
+    @staticmethod
+    def ogrFeatureStyleBrush(fillColr: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> str: ...
+    @staticmethod
+    def ogrFeatureStylePen(width: float, mmScaleFactor: float, mapUnitsScaleFactor: float, c: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], joinStyle: QtCore.Qt.PenJoinStyle = ..., capStyle: QtCore.Qt.PenCapStyle = ..., offset: float = ..., dashPattern: typing.Optional[collections.abc.Iterable[float]] = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def labelTextToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, label: typing.Optional[str], font: QtGui.QFont, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., size: float = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def labelTextToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, label: typing.Optional[str], font: QtGui.QFont, context: QgsSldExportContext, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., size: float = ...) -> None: ...
+    @staticmethod
+    def externalMarkerFromSld(element: QtXml.QDomElement, path: typing.Optional[str], format: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Tuple[bool, int, float]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def externalMarkerToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, path: typing.Optional[str], format: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., size: float = ...) -> typing.Optional[int]: ...
+    @typing.overload
+    @staticmethod
+    def externalMarkerToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, path: typing.Optional[str], format: typing.Optional[str], context: QgsSldExportContext, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ..., size: float = ...) -> typing.Optional[int]: ...
+    @staticmethod
+    def wellKnownMarkerFromSld2(element: QtXml.QDomElement, name: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Tuple[bool, QtCore.Qt.PenStyle, float, float]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def wellKnownMarkerToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, name: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeStyle: QtCore.Qt.PenStyle, strokeWidth: float = ..., size: float = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def wellKnownMarkerToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, name: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], strokeStyle: QtCore.Qt.PenStyle, context: QgsSldExportContext, strokeWidth: float = ..., size: float = ...) -> None: ...
+    @staticmethod
+    def externalGraphicFromSld(element: QtXml.QDomElement, path: typing.Optional[str], mime: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Tuple[bool, float]: ...
+    @staticmethod
+    def externalGraphicToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, path: typing.Optional[str], mime: typing.Optional[str], color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], size: float = ...) -> None: ...
+    @staticmethod
+    def lineFromSld(element: QtXml.QDomElement, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], customDashPattern: typing.Optional[collections.abc.Iterable[float]] = ...) -> typing.Tuple[bool, QtCore.Qt.PenStyle, float, typing.Optional[QtCore.Qt.PenJoinStyle], typing.Optional[QtCore.Qt.PenCapStyle], typing.Optional[float]]: ...
+    @staticmethod
+    def fillFromSld(element: QtXml.QDomElement, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Tuple[bool, QtCore.Qt.BrushStyle]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def fillToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, brushStyle: QtCore.Qt.BrushStyle, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def fillToSld(doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext, brushStyle: QtCore.Qt.BrushStyle, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> None: ...
+    @staticmethod
+    def needRasterImageFill(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needSvgFill(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needPointPatternFill(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needLinePatternFill(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needMarkerLine(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needEllipseMarker(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needRasterMarker(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needSvgMarker(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def needFontMarker(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def hasWellKnownMark(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def hasExternalGraphicV2(element: QtXml.QDomElement, format: typing.Optional[str] = ...) -> bool: ...
+    @staticmethod
+    def hasExternalGraphic(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def convertPolygonSymbolizerToPointMarker(element: QtXml.QDomElement, layerList: collections.abc.Iterable[QgsSymbolLayer]) -> bool: ...
+    @staticmethod
+    def createMarkerLayerFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def createLineLayerFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def createFillLayerFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def createSymbolLayerListFromSld(element: QtXml.QDomElement, geomType: Qgis.GeometryType, layers: collections.abc.Iterable[QgsSymbolLayer]) -> bool: ...
+    @staticmethod
+    def symbolProperties(symbol: typing.Optional[QgsSymbol]) -> str: ...
+    @staticmethod
+    def saveSymbol(symbolName: typing.Optional[str], symbol: typing.Optional[QgsSymbol], doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def loadSymbolLayer(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def loadSymbol(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsSymbol]: ...
+    @staticmethod
+    def estimateMaxSymbolBleed(symbol: typing.Optional[QgsSymbol], context: QgsRenderContext) -> float: ...
+    @staticmethod
+    def drawVertexMarker(x: float, y: float, p: QtGui.QPainter, type: Qgis.VertexMarkerType, markerSize: int) -> None: ...
+    @staticmethod
+    def drawStippledBackground(painter: typing.Optional[QtGui.QPainter], rect: QtCore.QRect) -> None: ...
+    @staticmethod
+    def colorRampPreviewPixmap(ramp: typing.Optional[QgsColorRamp], size: QtCore.QSize, padding: int = ..., direction: QtCore.Qt.Orientation = ..., flipDirection: bool = ..., drawTransparentBackground: bool = ...) -> QtGui.QPixmap: ...
+    @staticmethod
+    def colorRampPreviewIcon(ramp: typing.Optional[QgsColorRamp], size: QtCore.QSize, padding: int = ...) -> QtGui.QIcon: ...
+    @staticmethod
+    def symbolLayerPreviewIcon(layer: typing.Optional[QgsSymbolLayer], u: Qgis.RenderUnit, size: QtCore.QSize, scale: QgsMapUnitScale = ..., parentSymbolType: Qgis.SymbolType = ..., mapLayer: typing.Optional[QgsMapLayer] = ..., screen: QgsScreenProperties = ...) -> QtGui.QIcon: ...
+    @staticmethod
+    def symbolLayerPreviewPicture(layer: typing.Optional[QgsSymbolLayer], units: Qgis.RenderUnit, size: QtCore.QSize, scale: QgsMapUnitScale = ..., parentSymbolType: Qgis.SymbolType = ...) -> QtGui.QPicture: ...
+    @staticmethod
+    def symbolPreviewPixmap(symbol: typing.Optional[QgsSymbol], size: QtCore.QSize, padding: int = ..., customContext: typing.Optional[QgsRenderContext] = ..., selected: bool = ..., expressionContext: typing.Optional[QgsExpressionContext] = ..., shape: typing.Optional[QgsLegendPatchShape] = ..., screen: QgsScreenProperties = ...) -> QtGui.QPixmap: ...
+    @staticmethod
+    def symbolPreviewIcon(symbol: typing.Optional[QgsSymbol], size: QtCore.QSize, padding: int = ..., shape: typing.Optional[QgsLegendPatchShape] = ..., screen: QgsScreenProperties = ...) -> QtGui.QIcon: ...
+    @staticmethod
+    def decodeBlendMode(s: typing.Optional[str]) -> QtGui.QPainter.CompositionMode: ...
+    @staticmethod
+    def decodeScaleMethod(str: typing.Optional[str]) -> Qgis.ScaleMethod: ...
+    @staticmethod
+    def encodeScaleMethod(scaleMethod: Qgis.ScaleMethod) -> str: ...
+    @staticmethod
+    def sizeInPixelsFromSldUom(uom: typing.Optional[str], size: float) -> float: ...
+    @staticmethod
+    def decodeSldUom(str: typing.Optional[str]) -> typing.Tuple[Qgis.RenderUnit, typing.Optional[float]]: ...
+    @staticmethod
+    def encodeSldUom(unit: Qgis.RenderUnit) -> typing.Tuple[str, typing.Optional[float]]: ...
+    @staticmethod
+    def decodeSldRealVector(s: typing.Optional[str]) -> list[float]: ...
+    @staticmethod
+    def encodeSldRealVector(v: collections.abc.Iterable[float]) -> str: ...
+    @staticmethod
+    def decodeRealVector(s: typing.Optional[str]) -> list[float]: ...
+    @staticmethod
+    def encodeRealVector(v: collections.abc.Iterable[float]) -> str: ...
+    @staticmethod
+    def decodeMapUnitScale(str: typing.Optional[str]) -> QgsMapUnitScale: ...
+    @staticmethod
+    def encodeMapUnitScale(mapUnitScale: QgsMapUnitScale) -> str: ...
+    @staticmethod
+    def toSize(value: typing.Any) -> typing.Tuple[QtCore.QSizeF, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeSize(string: typing.Optional[str]) -> QtCore.QSizeF: ...
+    @staticmethod
+    def encodeSize(size: QtCore.QSizeF) -> str: ...
+    @staticmethod
+    def toPoint(value: typing.Any) -> typing.Tuple[QtCore.QPointF, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodePoint(string: typing.Optional[str]) -> QtCore.QPointF: ...
+    @staticmethod
+    def encodePoint(point: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> str: ...
+    @staticmethod
+    def encodeLineClipMode(mode: Qgis.LineClipMode) -> str: ...
+    @staticmethod
+    def decodeLineClipMode(string: typing.Optional[str]) -> typing.Tuple[Qgis.LineClipMode, typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeMarkerClipMode(mode: Qgis.MarkerClipMode) -> str: ...
+    @staticmethod
+    def decodeMarkerClipMode(string: typing.Optional[str]) -> typing.Tuple[Qgis.MarkerClipMode, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeArrowType(value: typing.Any) -> typing.Tuple[QgsArrowSymbolLayer.ArrowType, typing.Optional[bool]]: ...
+    @staticmethod
+    def decodeArrowHeadType(value: typing.Any) -> typing.Tuple[QgsArrowSymbolLayer.HeadType, typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeCoordinateReference(coordinateReference: Qgis.SymbolCoordinateReference) -> str: ...
+    @staticmethod
+    def decodeCoordinateReference(string: typing.Optional[str]) -> typing.Tuple[Qgis.SymbolCoordinateReference, typing.Optional[bool]]: ...
+    @staticmethod
+    def hasSldSymbolizer(element: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def penJoinStyleToJoinStyle(style: QtCore.Qt.PenJoinStyle) -> Qgis.JoinStyle: ...
+    @staticmethod
+    def penCapStyleToEndCapStyle(style: QtCore.Qt.PenCapStyle) -> Qgis.EndCapStyle: ...
+    @staticmethod
+    def decodeSldBrushStyle(str: typing.Optional[str]) -> QtCore.Qt.BrushStyle: ...
+    @staticmethod
+    def encodeSldBrushStyle(style: QtCore.Qt.BrushStyle) -> str: ...
+    @staticmethod
+    def decodeBrushStyle(str: typing.Optional[str]) -> QtCore.Qt.BrushStyle: ...
+    @staticmethod
+    def encodeBrushStyle(style: QtCore.Qt.BrushStyle) -> str: ...
+    @staticmethod
+    def decodeSldLineCapStyle(str: typing.Optional[str]) -> QtCore.Qt.PenCapStyle: ...
+    @staticmethod
+    def encodeSldLineCapStyle(style: QtCore.Qt.PenCapStyle) -> str: ...
+    @staticmethod
+    def decodeSldLineJoinStyle(str: typing.Optional[str]) -> QtCore.Qt.PenJoinStyle: ...
+    @staticmethod
+    def encodeSldLineJoinStyle(style: QtCore.Qt.PenJoinStyle) -> str: ...
+    @staticmethod
+    def decodePenCapStyle(str: typing.Optional[str]) -> QtCore.Qt.PenCapStyle: ...
+    @staticmethod
+    def encodePenCapStyle(style: QtCore.Qt.PenCapStyle) -> str: ...
+    @staticmethod
+    def decodePenJoinStyle(str: typing.Optional[str]) -> QtCore.Qt.PenJoinStyle: ...
+    @staticmethod
+    def encodePenJoinStyle(style: QtCore.Qt.PenJoinStyle) -> str: ...
+    @staticmethod
+    def decodePenStyle(str: typing.Optional[str]) -> QtCore.Qt.PenStyle: ...
+    @staticmethod
+    def encodePenStyle(style: QtCore.Qt.PenStyle) -> str: ...
+    @staticmethod
+    def decodeSldFontWeight(str: typing.Optional[str]) -> int: ...
+    @staticmethod
+    def encodeSldFontWeight(weight: int) -> str: ...
+    @staticmethod
+    def decodeSldFontStyle(str: typing.Optional[str]) -> QtGui.QFont.Style: ...
+    @staticmethod
+    def encodeSldFontStyle(style: QtGui.QFont.Style) -> str: ...
+    @staticmethod
+    def decodeSldAlpha(str: typing.Optional[str]) -> int: ...
+    @staticmethod
+    def encodeSldAlpha(alpha: int) -> str: ...
+    @staticmethod
+    def decodeColor(str: typing.Optional[str]) -> QtGui.QColor: ...
+    @staticmethod
+    def encodeColor(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> str: ...
+    VertexMarkerType: typing.Type[Qgis.VertexMarkerType]
+    SemiTransparentCircle: Qgis.VertexMarkerType
+    Cross: Qgis.VertexMarkerType
+    NoMarker: Qgis.VertexMarkerType
+
+
+class QgsSymbolRenderContext(PyQt5.sip.wrapper):
+
+    def __init__(self, c: QgsRenderContext, u: Qgis.RenderUnit, opacity: float = ..., selected: bool = ..., renderHints: typing.Union[Qgis.SymbolRenderHints, Qgis.SymbolRenderHint] = ..., f: typing.Optional[QgsFeature] = ..., fields: QgsFields = ..., mapUnitScale: QgsMapUnitScale = ...) -> None: ...
+
+    def setPatchShape(self, shape: QgsLegendPatchShape) -> None: ...
+    def patchShape(self) -> typing.Optional[QgsLegendPatchShape]: ...
+    def setExpressionContextScope(self, contextScope: typing.Optional[QgsExpressionContextScope]) -> None: ...
+    def expressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    @deprecated("""""")
+    def outputPixelSize(self, size: float) -> float: ...
+    @deprecated("""""")
+    def outputLineWidth(self, width: float) -> float: ...
+    def setGeometryPartNum(self, num: int) -> None: ...
+    def geometryPartNum(self) -> int: ...
+    def setGeometryPartCount(self, count: int) -> None: ...
+    def geometryPartCount(self) -> int: ...
+    def fields(self) -> QgsFields: ...
+    def originalGeometryType(self) -> Qgis.GeometryType: ...
+    def setOriginalGeometryType(self, type: Qgis.GeometryType) -> None: ...
+    def feature(self) -> typing.Optional[QgsFeature]: ...
+    def setFeature(self, f: typing.Optional[QgsFeature]) -> None: ...
+    def setRenderHint(self, hint: Qgis.SymbolRenderHint, enabled: bool = ...) -> None: ...
+    def setRenderHints(self, hints: typing.Union[Qgis.SymbolRenderHints, Qgis.SymbolRenderHint]) -> None: ...
+    def forceVectorRendering(self) -> bool: ...
+    def renderHints(self) -> Qgis.SymbolRenderHints: ...
+    def setSelected(self, selected: bool) -> None: ...
+    def selected(self) -> bool: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    @deprecated("""""")
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    @deprecated("""""")
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    @deprecated("""""")
+    def setOutputUnit(self, u: Qgis.RenderUnit) -> None: ...
+    @deprecated("""""")
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOriginalValueVariable(self, value: typing.Any) -> None: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsVectorFieldSymbolLayer(QgsMarkerSymbolLayer):
+
+    class AngleUnits(int):
+        Degrees = ... # type: QgsVectorFieldSymbolLayer.AngleUnits
+        Radians = ... # type: QgsVectorFieldSymbolLayer.AngleUnits
+
+    class AngleOrientation(int):
+        ClockwiseFromNorth = ... # type: QgsVectorFieldSymbolLayer.AngleOrientation
+        CounterclockwiseFromEast = ... # type: QgsVectorFieldSymbolLayer.AngleOrientation
+
+    class VectorFieldType(int):
+        Cartesian = ... # type: QgsVectorFieldSymbolLayer.VectorFieldType
+        Polar = ... # type: QgsVectorFieldSymbolLayer.VectorFieldType
+        Height = ... # type: QgsVectorFieldSymbolLayer.VectorFieldType
+
+    def __init__(self) -> None: ...
+
+    def bounds(self, a0: typing.Union[QtCore.QPointF, QtCore.QPoint], a1: QgsSymbolRenderContext) -> QtCore.QRectF: ...
+    def distanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def distanceUnit(self) -> Qgis.RenderUnit: ...
+    def setDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def mapUnitScale(self) -> QgsMapUnitScale: ...
+    def setMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def outputUnit(self) -> Qgis.RenderUnit: ...
+    def setOutputUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def angleUnits(self) -> 'QgsVectorFieldSymbolLayer.AngleUnits': ...
+    def setAngleUnits(self, units: 'QgsVectorFieldSymbolLayer.AngleUnits') -> None: ...
+    def angleOrientation(self) -> 'QgsVectorFieldSymbolLayer.AngleOrientation': ...
+    def setAngleOrientation(self, orientation: 'QgsVectorFieldSymbolLayer.AngleOrientation') -> None: ...
+    def vectorFieldType(self) -> 'QgsVectorFieldSymbolLayer.VectorFieldType': ...
+    def setVectorFieldType(self, type: 'QgsVectorFieldSymbolLayer.VectorFieldType') -> None: ...
+    def scale(self) -> float: ...
+    def setScale(self, s: float) -> None: ...
+    def yAttribute(self) -> str: ...
+    def setYAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def xAttribute(self) -> str: ...
+    def setXAttribute(self, attribute: typing.Optional[str]) -> None: ...
+    def hasDataDefinedProperties(self) -> bool: ...
+    def usedAttributes(self, context: QgsRenderContext) -> set[str]: ...
+    def drawPreviewIcon(self, context: QgsSymbolRenderContext, size: QtCore.QSize) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, props: dict[str, typing.Any]) -> None: ...
+    @typing.overload
+    def toSld(self, doc: QtXml.QDomDocument, element: QtXml.QDomElement, context: QgsSldExportContext) -> bool: ...
+    def usesMapUnits(self) -> bool: ...
+    def properties(self) -> dict[str, typing.Any]: ...
+    def clone(self) -> typing.Optional['QgsVectorFieldSymbolLayer']: ...
+    def stopRender(self, context: QgsSymbolRenderContext) -> None: ...
+    def startRender(self, context: QgsSymbolRenderContext) -> None: ...
+    def renderPoint(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint], context: QgsSymbolRenderContext) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def subSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setSubSymbol(self, symbol: typing.Optional[QgsSymbol]) -> bool: ...
+    def layerType(self) -> str: ...
+    @staticmethod
+    def createFromSld(element: QtXml.QDomElement) -> typing.Optional[QgsSymbolLayer]: ...
+    @staticmethod
+    def create(properties: dict[str, typing.Any] = ...) -> typing.Optional[QgsSymbolLayer]: ...
@@ -0,0 +1,702 @@
+# The PEP 484 type hints stub file for the _core.textrenderer module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import Qgis, QgsMargins
+from .diagram import QgsMapUnitScale
+from .effects import QgsPaintEffect
+from .labeling import QgsScreenProperties
+from .symbology import QgsFillSymbol, QgsMarkerSymbol, QgsSymbolLayerReference
+from .vector import (
+    QgsPropertyCollection, QgsReadWriteContext, QgsRenderContext,
+    QgsVectorLayer,
+)
+
+
+class QgsFontDownloadDetails(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, family: typing.Optional[str], fontUrls: collections.abc.Iterable[typing.Optional[str]], licenseUrl: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFontDownloadDetails') -> None: ...
+
+    def licenseUrl(self) -> str: ...
+    def fontUrls(self) -> list[str]: ...
+    def standardizedFamily(self) -> str: ...
+    def family(self) -> str: ...
+    def isValid(self) -> bool: ...
+    @staticmethod
+    def standardizeFamily(family: typing.Optional[str]) -> str: ...
+
+
+class QgsFontManager(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    fontDownloadErrorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    fontDownloaded: typing.ClassVar[QtCore.pyqtSignal]
+    def removeUserFont(self, path: typing.Optional[str]) -> bool: ...
+    def userFontToFamilyMap(self) -> dict[str, list[str]]: ...
+    def addUserFontDirectory(self, directory: typing.Optional[str]) -> None: ...
+    def installFontsFromData(self, data: typing.Union[QtCore.QByteArray, bytes, bytearray], filename: typing.Optional[str] = ..., extension: typing.Optional[str] = ...) -> typing.Tuple[bool, str, list[str], str]: ...
+    @typing.overload
+    @deprecated("""""")
+    def downloadAndInstallFont(self, url: QtCore.QUrl, identifier: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def downloadAndInstallFont(self, details: QgsFontDownloadDetails, identifier: typing.Optional[str] = ...) -> None: ...
+    def detailsForFontDownload(self, family: typing.Optional[str]) -> typing.Tuple[QgsFontDownloadDetails, str]: ...
+    @deprecated("""""")
+    def urlForFontDownload(self, family: typing.Optional[str]) -> typing.Tuple[str, str]: ...
+    def enableFontDownloadsForSession(self) -> None: ...
+    def tryToDownloadFontFamily(self, family: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def processFontFamilyName(self, name: typing.Optional[str]) -> str: ...
+    def setFontFamilyReplacements(self, replacements: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def addFontFamilyReplacement(self, original: typing.Optional[str], replacement: typing.Optional[str]) -> None: ...
+    def fontFamilyReplacements(self) -> dict[str, str]: ...
+
+
+class QgsTextBackgroundSettings(PyQt5.sip.wrapper):
+
+    class RotationType(int):
+        RotationSync = ... # type: QgsTextBackgroundSettings.RotationType
+        RotationOffset = ... # type: QgsTextBackgroundSettings.RotationType
+        RotationFixed = ... # type: QgsTextBackgroundSettings.RotationType
+
+    class SizeType(int):
+        SizeBuffer = ... # type: QgsTextBackgroundSettings.SizeType
+        SizeFixed = ... # type: QgsTextBackgroundSettings.SizeType
+        SizePercent = ... # type: QgsTextBackgroundSettings.SizeType
+
+    class ShapeType(int):
+        ShapeRectangle = ... # type: QgsTextBackgroundSettings.ShapeType
+        ShapeSquare = ... # type: QgsTextBackgroundSettings.ShapeType
+        ShapeEllipse = ... # type: QgsTextBackgroundSettings.ShapeType
+        ShapeCircle = ... # type: QgsTextBackgroundSettings.ShapeType
+        ShapeSVG = ... # type: QgsTextBackgroundSettings.ShapeType
+        ShapeMarkerSymbol = ... # type: QgsTextBackgroundSettings.ShapeType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTextBackgroundSettings') -> None: ...
+
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def updateDataDefinedProperties(self, context: QgsRenderContext, properties: QgsPropertyCollection) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def readFromLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setPaintEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def paintEffect(self) -> typing.Optional[QgsPaintEffect]: ...
+    def setJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def joinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setStrokeWidthMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def strokeWidthMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setStrokeWidthUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def strokeWidthUnit(self) -> Qgis.RenderUnit: ...
+    def setStrokeWidth(self, width: float) -> None: ...
+    def strokeWidth(self) -> float: ...
+    def setStrokeColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def strokeColor(self) -> QtGui.QColor: ...
+    def setFillColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def fillColor(self) -> QtGui.QColor: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setRadiiMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def radiiMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setRadiiUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def radiiUnit(self) -> Qgis.RenderUnit: ...
+    def setRadii(self, radii: QtCore.QSizeF) -> None: ...
+    def radii(self) -> QtCore.QSizeF: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffset(self, offset: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def offset(self) -> QtCore.QPointF: ...
+    def setRotation(self, rotation: float) -> None: ...
+    def rotation(self) -> float: ...
+    def setRotationType(self, type: 'QgsTextBackgroundSettings.RotationType') -> None: ...
+    def rotationType(self) -> 'QgsTextBackgroundSettings.RotationType': ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSize(self, size: QtCore.QSizeF) -> None: ...
+    def size(self) -> QtCore.QSizeF: ...
+    def setSizeType(self, type: 'QgsTextBackgroundSettings.SizeType') -> None: ...
+    def sizeType(self) -> 'QgsTextBackgroundSettings.SizeType': ...
+    def setFillSymbol(self, symbol: typing.Optional[QgsFillSymbol]) -> None: ...
+    def fillSymbol(self) -> typing.Optional[QgsFillSymbol]: ...
+    def setMarkerSymbol(self, symbol: typing.Optional[QgsMarkerSymbol]) -> None: ...
+    def markerSymbol(self) -> typing.Optional[QgsMarkerSymbol]: ...
+    def setSvgFile(self, file: typing.Optional[str]) -> None: ...
+    def svgFile(self) -> str: ...
+    def setType(self, type: 'QgsTextBackgroundSettings.ShapeType') -> None: ...
+    def type(self) -> 'QgsTextBackgroundSettings.ShapeType': ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsTextBlock(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, fragment: 'QgsTextFragment') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextBlock') -> None: ...
+
+    def __getitem__(self, index: int) -> 'QgsTextFragment': ...
+    def at(self, index: int) -> 'QgsTextFragment': ...
+    def __len__(self) -> int: ...
+    def hasBackgrounds(self) -> bool: ...
+    def applyCapitalization(self, capitalization: Qgis.Capitalization) -> None: ...
+    def setBlockFormat(self, format: 'QgsTextBlockFormat') -> None: ...
+    def blockFormat(self) -> 'QgsTextBlockFormat': ...
+    def size(self) -> int: ...
+    def empty(self) -> bool: ...
+    def clear(self) -> None: ...
+    def insert(self, index: int, fragment: 'QgsTextFragment') -> None: ...
+    def append(self, fragment: 'QgsTextFragment') -> None: ...
+    def reserve(self, count: int) -> None: ...
+    def toPlainText(self) -> str: ...
+    @staticmethod
+    def fromPlainText(text: typing.Optional[str], format: 'QgsTextCharacterFormat' = ...) -> 'QgsTextBlock': ...
+
+
+class QgsTextBlockFormat(PyQt5.sip.wrapper):
+
+    class BooleanValue(int):
+        NotSet = ... # type: QgsTextBlockFormat.BooleanValue
+        SetTrue = ... # type: QgsTextBlockFormat.BooleanValue
+        SetFalse = ... # type: QgsTextBlockFormat.BooleanValue
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, format: QtGui.QTextBlockFormat) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextBlockFormat') -> None: ...
+
+    def updateFontForFormat(self, font: QtGui.QFont, context: QgsRenderContext, scaleFactor: float = ...) -> None: ...
+    def setBackgroundImagePath(self, path: typing.Optional[str]) -> None: ...
+    def backgroundImagePath(self) -> str: ...
+    def setBackgroundBrush(self, brush: typing.Union[QtGui.QBrush, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], QtGui.QGradient]) -> None: ...
+    def backgroundBrush(self) -> QtGui.QBrush: ...
+    def hasBackground(self) -> bool: ...
+    def setMargins(self, margins: QgsMargins) -> None: ...
+    def margins(self) -> QgsMargins: ...
+    def setLineHeightPercentage(self, height: float) -> None: ...
+    def lineHeightPercentage(self) -> float: ...
+    def setLineHeight(self, height: float) -> None: ...
+    def lineHeight(self) -> float: ...
+    def setHorizontalAlignment(self, alignment: Qgis.TextHorizontalAlignment) -> None: ...
+    def horizontalAlignment(self) -> Qgis.TextHorizontalAlignment: ...
+    def setHasHorizontalAlignmentSet(self, set: bool) -> None: ...
+    def hasHorizontalAlignmentSet(self) -> bool: ...
+    def overrideWith(self, other: 'QgsTextBlockFormat') -> None: ...
+
+
+class QgsTextBufferSettings(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTextBufferSettings') -> None: ...
+
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def updateDataDefinedProperties(self, context: QgsRenderContext, properties: QgsPropertyCollection) -> None: ...
+    def setPaintEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def paintEffect(self) -> typing.Optional[QgsPaintEffect]: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def readFromLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def joinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setFillBufferInterior(self, fill: bool) -> None: ...
+    def fillBufferInterior(self) -> bool: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSize(self, size: float) -> None: ...
+    def size(self) -> float: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsTextCharacterFormat(PyQt5.sip.wrapper):
+
+    class BooleanValue(int):
+        NotSet = ... # type: QgsTextCharacterFormat.BooleanValue
+        SetTrue = ... # type: QgsTextCharacterFormat.BooleanValue
+        SetFalse = ... # type: QgsTextCharacterFormat.BooleanValue
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, format: QtGui.QTextCharFormat) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextCharacterFormat') -> None: ...
+
+    def updateFontForFormat(self, font: QtGui.QFont, context: QgsRenderContext, scaleFactor: float = ...) -> None: ...
+    def setBackgroundImagePath(self, path: typing.Optional[str]) -> None: ...
+    def backgroundImagePath(self) -> str: ...
+    def setBackgroundBrush(self, brush: typing.Union[QtGui.QBrush, typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], QtGui.QGradient]) -> None: ...
+    def backgroundBrush(self) -> QtGui.QBrush: ...
+    def hasBackground(self) -> bool: ...
+    def setVerticalAlignment(self, alignment: Qgis.TextCharacterVerticalAlignment) -> None: ...
+    def verticalAlignment(self) -> Qgis.TextCharacterVerticalAlignment: ...
+    def setHasVerticalAlignmentSet(self, set: bool) -> None: ...
+    def hasVerticalAlignmentSet(self) -> bool: ...
+    def setImageSize(self, size: QtCore.QSizeF) -> None: ...
+    def imageSize(self) -> QtCore.QSizeF: ...
+    def setImagePath(self, path: typing.Optional[str]) -> None: ...
+    def imagePath(self) -> str: ...
+    def setOverline(self, enabled: 'QgsTextCharacterFormat.BooleanValue') -> None: ...
+    def overline(self) -> 'QgsTextCharacterFormat.BooleanValue': ...
+    def setUnderline(self, enabled: 'QgsTextCharacterFormat.BooleanValue') -> None: ...
+    def underline(self) -> 'QgsTextCharacterFormat.BooleanValue': ...
+    def setStrikeOut(self, enabled: 'QgsTextCharacterFormat.BooleanValue') -> None: ...
+    def strikeOut(self) -> 'QgsTextCharacterFormat.BooleanValue': ...
+    def setItalic(self, enabled: 'QgsTextCharacterFormat.BooleanValue') -> None: ...
+    def italic(self) -> 'QgsTextCharacterFormat.BooleanValue': ...
+    def setWordSpacing(self, spacing: float) -> None: ...
+    def wordSpacing(self) -> float: ...
+    def setFontWeight(self, fontWeight: int) -> None: ...
+    def fontWeight(self) -> int: ...
+    def setFamily(self, family: typing.Optional[str]) -> None: ...
+    def family(self) -> str: ...
+    def setFontPercentageSize(self, size: float) -> None: ...
+    def fontPercentageSize(self) -> float: ...
+    def setFontPointSize(self, size: float) -> None: ...
+    def fontPointSize(self) -> float: ...
+    def setTextColor(self, textColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def textColor(self) -> QtGui.QColor: ...
+    def overrideWith(self, other: 'QgsTextCharacterFormat') -> None: ...
+
+
+class QgsTextDocument(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, block: QgsTextBlock) -> None: ...
+    @typing.overload
+    def __init__(self, fragment: 'QgsTextFragment') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextDocument') -> None: ...
+
+    def hasBackgrounds(self) -> bool: ...
+    def applyCapitalization(self, capitalization: Qgis.Capitalization) -> None: ...
+    def splitLines(self, wrapCharacter: typing.Optional[str], autoWrapLength: int = ..., useMaxLineLengthWhenAutoWrapping: bool = ...) -> None: ...
+    def toPlainText(self) -> list[str]: ...
+    def __len__(self) -> int: ...
+    def size(self) -> int: ...
+    def __getitem__(self, index: int) -> QgsTextBlock: ...
+    def at(self, index: int) -> QgsTextBlock: ...
+    def reserve(self, count: int) -> None: ...
+    def insert(self, index: int, block: QgsTextBlock) -> None: ...
+    def append(self, block: QgsTextBlock) -> None: ...
+    @staticmethod
+    def fromTextAndFormat(lines: collections.abc.Iterable[typing.Optional[str]], format: 'QgsTextFormat') -> 'QgsTextDocument': ...
+    @staticmethod
+    def fromHtml(lines: collections.abc.Iterable[typing.Optional[str]]) -> 'QgsTextDocument': ...
+    @staticmethod
+    def fromPlainText(lines: collections.abc.Iterable[typing.Optional[str]]) -> 'QgsTextDocument': ...
+
+
+class QgsTextDocumentRenderContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextDocumentRenderContext') -> None: ...
+
+    def setMaximumWidth(self, width: float) -> None: ...
+    def maximumWidth(self) -> float: ...
+    def setFlags(self, flags: typing.Union[Qgis.TextRendererFlags, Qgis.TextRendererFlag]) -> None: ...
+    def flags(self) -> Qgis.TextRendererFlags: ...
+
+
+class QgsTextDocumentMetrics(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextDocumentMetrics') -> None: ...
+
+    def blockRightMargin(self, blockIndex: int) -> float: ...
+    def blockLeftMargin(self, blockIndex: int) -> float: ...
+    def blockVerticalMargin(self, blockIndex: int) -> float: ...
+    def ascentOffset(self) -> float: ...
+    def fragmentFont(self, blockIndex: int, fragmentIndex: int) -> QtGui.QFont: ...
+    def blockMaximumAscent(self, blockIndex: int) -> float: ...
+    def blockMaximumDescent(self, blockIndex: int) -> float: ...
+    def blockMaximumCharacterWidth(self, blockIndex: int) -> float: ...
+    def verticalOrientationXOffset(self, blockIndex: int) -> float: ...
+    def fragmentDescent(self, blockIndex: int, fragmentIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def fragmentAscent(self, blockIndex: int, fragmentIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def fragmentFixedHeight(self, blockIndex: int, fragmentIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def fragmentVerticalOffset(self, blockIndex: int, fragmentIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def fragmentHorizontalAdvance(self, blockIndex: int, fragmentIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def baselineOffset(self, blockIndex: int, mode: Qgis.TextLayoutMode) -> float: ...
+    def firstLineCapHeight(self) -> float: ...
+    def blockHeight(self, blockIndex: int) -> float: ...
+    def blockWidth(self, blockIndex: int) -> float: ...
+    def outerBounds(self, mode: Qgis.TextLayoutMode, orientation: Qgis.TextOrientation) -> QtCore.QRectF: ...
+    def documentSize(self, mode: Qgis.TextLayoutMode, orientation: Qgis.TextOrientation) -> QtCore.QSizeF: ...
+    def document(self) -> QgsTextDocument: ...
+    def isNullFontSize(self) -> bool: ...
+    @staticmethod
+    def calculateMetrics(document: QgsTextDocument, format: 'QgsTextFormat', context: QgsRenderContext, scaleFactor: float = ..., documentContext: QgsTextDocumentRenderContext = ...) -> 'QgsTextDocumentMetrics': ...
+
+
+class QgsTextFormat(PyQt5.sip.wrapper):
+
+    class Tab(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, position: float) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTextFormat.Tab') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __repr__(self) -> typing.Any: ...
+        def __eq__(self, other: object): ...
+        def position(self) -> float: ...
+        def setPosition(self, position: float) -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTextFormat') -> None: ...
+
+    def asCSS(self, pointToPixelMultiplier: float = ...) -> str: ...
+    @staticmethod
+    def textFormatPreviewPixmap(format: 'QgsTextFormat', size: QtCore.QSize, previewText: typing.Optional[str] = ..., padding: int = ..., screen: QgsScreenProperties = ...) -> QtGui.QPixmap: ...
+    def updateDataDefinedProperties(self, context: QgsRenderContext) -> None: ...
+    def setDataDefinedProperties(self, collection: QgsPropertyCollection) -> None: ...
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def resolvedFontFamily(self) -> str: ...
+    def fontFound(self) -> bool: ...
+    def hasNonDefaultCompositionMode(self) -> bool: ...
+    def containsAdvancedEffects(self) -> bool: ...
+    @staticmethod
+    def fromMimeData(data: typing.Optional[QtCore.QMimeData]) -> typing.Tuple['QgsTextFormat', typing.Optional[bool]]: ...
+    def toQFont(self) -> QtGui.QFont: ...
+    @staticmethod
+    def fromQFont(font: QtGui.QFont) -> 'QgsTextFormat': ...
+    def toMimeData(self) -> typing.Optional[QtCore.QMimeData]: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def readFromLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setPreviewBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def previewBackgroundColor(self) -> QtGui.QColor: ...
+    def setAllowHtmlFormatting(self, allow: bool) -> None: ...
+    def allowHtmlFormatting(self) -> bool: ...
+    def setCapitalization(self, capitalization: Qgis.Capitalization) -> None: ...
+    def capitalization(self) -> Qgis.Capitalization: ...
+    def setOrientation(self, orientation: Qgis.TextOrientation) -> None: ...
+    def orientation(self) -> Qgis.TextOrientation: ...
+    def setTabStopDistanceMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def tabStopDistanceMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setTabStopDistanceUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def tabStopDistanceUnit(self) -> Qgis.RenderUnit: ...
+    def setTabPositions(self, positions: collections.abc.Iterable['QgsTextFormat.Tab']) -> None: ...
+    def tabPositions(self) -> list['QgsTextFormat.Tab']: ...
+    def setTabStopDistance(self, distance: float) -> None: ...
+    def tabStopDistance(self) -> float: ...
+    def setLineHeightUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def lineHeightUnit(self) -> Qgis.RenderUnit: ...
+    def setLineHeight(self, height: float) -> None: ...
+    def lineHeight(self) -> float: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setStretchFactor(self, factor: int) -> None: ...
+    def stretchFactor(self) -> int: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def multiplyOpacity(self, opacityFactor: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSize(self, size: float) -> None: ...
+    def size(self) -> float: ...
+    def setFamilies(self, families: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def families(self) -> list[str]: ...
+    def setForcedItalic(self, forced: bool) -> None: ...
+    def forcedItalic(self) -> bool: ...
+    def setForcedBold(self, forced: bool) -> None: ...
+    def forcedBold(self) -> bool: ...
+    def setNamedStyle(self, style: typing.Optional[str]) -> None: ...
+    def namedStyle(self) -> str: ...
+    def setFont(self, font: QtGui.QFont) -> None: ...
+    def scaledFont(self, context: QgsRenderContext, scaleFactor: float = ...) -> QtGui.QFont: ...
+    def font(self) -> QtGui.QFont: ...
+    def setMask(self, maskSettings: 'QgsTextMaskSettings') -> None: ...
+    def mask(self) -> 'QgsTextMaskSettings': ...
+    def setShadow(self, shadowSettings: 'QgsTextShadowSettings') -> None: ...
+    def shadow(self) -> 'QgsTextShadowSettings': ...
+    def setBackground(self, backgroundSettings: QgsTextBackgroundSettings) -> None: ...
+    def background(self) -> QgsTextBackgroundSettings: ...
+    def setBuffer(self, bufferSettings: QgsTextBufferSettings) -> None: ...
+    def buffer(self) -> QgsTextBufferSettings: ...
+    def setValid(self) -> None: ...
+    def isValid(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    TextOrientation: typing.Type[Qgis.TextOrientation]
+    HorizontalOrientation: Qgis.TextOrientation
+    VerticalOrientation: Qgis.TextOrientation
+    RotationBasedOrientation: Qgis.TextOrientation
+
+
+class QgsTextFragment(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, text: typing.Optional[str] = ..., format: QgsTextCharacterFormat = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fragment: QtGui.QTextFragment) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextFragment') -> None: ...
+
+    def applyCapitalization(self, capitalization: Qgis.Capitalization) -> None: ...
+    def horizontalAdvance(self, font: QtGui.QFont, context: QgsRenderContext, fontHasBeenUpdatedForFragment: bool = ..., scaleFactor: float = ...) -> float: ...
+    def isImage(self) -> bool: ...
+    def setCharacterFormat(self, format: QgsTextCharacterFormat) -> None: ...
+    def characterFormat(self) -> QgsTextCharacterFormat: ...
+    def isWhitespace(self) -> bool: ...
+    def isTab(self) -> bool: ...
+    def setText(self, text: typing.Optional[str]) -> None: ...
+    def text(self) -> str: ...
+
+
+class QgsTextMaskSettings(PyQt5.sip.wrapper):
+
+    class MaskType(int):
+        MaskBuffer = ... # type: QgsTextMaskSettings.MaskType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTextMaskSettings') -> None: ...
+
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def updateDataDefinedProperties(self, context: QgsRenderContext, properties: QgsPropertyCollection) -> None: ...
+    def setMaskedSymbolLayers(self, maskedLayers: collections.abc.Iterable[QgsSymbolLayerReference]) -> None: ...
+    def maskedSymbolLayers(self) -> list[QgsSymbolLayerReference]: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def setPaintEffect(self, effect: typing.Optional[QgsPaintEffect]) -> None: ...
+    def paintEffect(self) -> typing.Optional[QgsPaintEffect]: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setJoinStyle(self, style: QtCore.Qt.PenJoinStyle) -> None: ...
+    def joinStyle(self) -> QtCore.Qt.PenJoinStyle: ...
+    def setSizeMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def sizeMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setSizeUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def sizeUnit(self) -> Qgis.RenderUnit: ...
+    def setSize(self, size: float) -> None: ...
+    def size(self) -> float: ...
+    def setType(self, type: 'QgsTextMaskSettings.MaskType') -> None: ...
+    def type(self) -> 'QgsTextMaskSettings.MaskType': ...
+    def setEnabled(self, a0: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsTextRenderer(PyQt5.sip.wrapper):
+
+    FONT_WORKAROUND_SCALE = ... # type: float
+    SUPERSCRIPT_SUBSCRIPT_FONT_SIZE_SCALING_FACTOR = ... # type: float
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextRenderer') -> None: ...
+
+    @staticmethod
+    def calculateScaleFactorForFormat(context: QgsRenderContext, format: QgsTextFormat) -> float: ...
+    @staticmethod
+    def wrappedText(context: QgsRenderContext, text: typing.Optional[str], width: float, format: QgsTextFormat) -> list[str]: ...
+    @staticmethod
+    def textRequiresWrapping(context: QgsRenderContext, text: typing.Optional[str], width: float, format: QgsTextFormat) -> bool: ...
+    @typing.overload
+    @staticmethod
+    def textHeight(context: QgsRenderContext, format: QgsTextFormat, textLines: collections.abc.Iterable[typing.Optional[str]], mode: Qgis.TextLayoutMode = ..., fontMetrics: typing.Optional[QtGui.QFontMetricsF] = ..., flags: typing.Union[Qgis.TextRendererFlags, Qgis.TextRendererFlag] = ..., maxLineWidth: float = ...) -> float: ...
+    @typing.overload
+    @staticmethod
+    def textHeight(context: QgsRenderContext, format: QgsTextFormat, character: str, includeEffects: bool = ...) -> float: ...
+    @staticmethod
+    def textWidth(context: QgsRenderContext, format: QgsTextFormat, textLines: collections.abc.Iterable[typing.Optional[str]], fontMetrics: typing.Optional[QtGui.QFontMetricsF] = ...) -> float: ...
+    @staticmethod
+    def fontMetrics(context: QgsRenderContext, format: QgsTextFormat, scaleFactor: float = ...) -> QtGui.QFontMetricsF: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def drawPart(rect: QtCore.QRectF, rotation: float, alignment: Qgis.TextHorizontalAlignment, textLines: collections.abc.Iterable[typing.Optional[str]], context: QgsRenderContext, format: QgsTextFormat, part: Qgis.TextComponent, drawAsOutlines: bool = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def drawPart(origin: typing.Union[QtCore.QPointF, QtCore.QPoint], rotation: float, alignment: Qgis.TextHorizontalAlignment, textLines: collections.abc.Iterable[typing.Optional[str]], context: QgsRenderContext, format: QgsTextFormat, part: Qgis.TextComponent, drawAsOutlines: bool = ...) -> None: ...
+    @staticmethod
+    def drawDocumentOnLine(line: QtGui.QPolygonF, format: QgsTextFormat, document: QgsTextDocument, context: QgsRenderContext, offsetAlongLine: float = ..., offsetFromLine: float = ..., flags: typing.Union[Qgis.CurvedTextFlags, Qgis.CurvedTextFlag] = ...) -> None: ...
+    @staticmethod
+    def drawTextOnLine(line: QtGui.QPolygonF, text: typing.Optional[str], context: QgsRenderContext, format: QgsTextFormat, offsetAlongLine: float = ..., offsetFromLine: float = ..., flags: typing.Union[Qgis.CurvedTextFlags, Qgis.CurvedTextFlag] = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def drawDocument(rect: QtCore.QRectF, format: QgsTextFormat, document: QgsTextDocument, metrics: QgsTextDocumentMetrics, context: QgsRenderContext, horizontalAlignment: Qgis.TextHorizontalAlignment = ..., verticalAlignment: Qgis.TextVerticalAlignment = ..., rotation: float = ..., mode: Qgis.TextLayoutMode = ..., flags: typing.Union[Qgis.TextRendererFlags, Qgis.TextRendererFlag] = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def drawDocument(point: typing.Union[QtCore.QPointF, QtCore.QPoint], format: QgsTextFormat, document: QgsTextDocument, metrics: QgsTextDocumentMetrics, context: QgsRenderContext, alignment: Qgis.TextHorizontalAlignment, rotation: float, mode: Qgis.TextLayoutMode = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def drawText(rect: QtCore.QRectF, rotation: float, alignment: Qgis.TextHorizontalAlignment, textLines: collections.abc.Iterable[typing.Optional[str]], context: QgsRenderContext, format: QgsTextFormat, drawAsOutlines: bool = ..., vAlignment: Qgis.TextVerticalAlignment = ..., flags: typing.Union[Qgis.TextRendererFlags, Qgis.TextRendererFlag] = ..., mode: Qgis.TextLayoutMode = ...) -> None: ...
+    @typing.overload
+    @staticmethod
+    def drawText(point: typing.Union[QtCore.QPointF, QtCore.QPoint], rotation: float, alignment: Qgis.TextHorizontalAlignment, textLines: collections.abc.Iterable[typing.Optional[str]], context: QgsRenderContext, format: QgsTextFormat, drawAsOutlines: bool = ...) -> None: ...
+    @staticmethod
+    def sizeToPixel(size: float, c: QgsRenderContext, unit: Qgis.RenderUnit, mapUnitScale: QgsMapUnitScale = ...) -> int: ...
+    @staticmethod
+    def convertQtVAlignment(alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> Qgis.TextVerticalAlignment: ...
+    @staticmethod
+    def convertQtHAlignment(alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> Qgis.TextHorizontalAlignment: ...
+    DrawMode: typing.Type[Qgis.TextLayoutMode]
+    Rect: Qgis.TextLayoutMode
+    Point: Qgis.TextLayoutMode
+    Label: Qgis.TextLayoutMode
+    RectangleCapHeightBased: Qgis.TextLayoutMode
+    RectangleAscentBased: Qgis.TextLayoutMode
+    TextPart: typing.Type[Qgis.TextComponent]
+    Text: Qgis.TextComponent
+    Buffer: Qgis.TextComponent
+    Background: Qgis.TextComponent
+    Shadow: Qgis.TextComponent
+    HAlignment: typing.Type[Qgis.TextHorizontalAlignment]
+    AlignLeft: Qgis.TextHorizontalAlignment
+    AlignCenter: Qgis.TextHorizontalAlignment
+    AlignRight: Qgis.TextHorizontalAlignment
+    AlignJustify: Qgis.TextHorizontalAlignment
+    VAlignment: typing.Type[Qgis.TextVerticalAlignment]
+    AlignTop: Qgis.TextVerticalAlignment
+    AlignVCenter: Qgis.TextVerticalAlignment
+    AlignBottom: Qgis.TextVerticalAlignment
+
+
+class QgsTextRendererUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTextRendererUtils') -> None: ...
+
+    @staticmethod
+    def decodeTextOrientation(name: typing.Optional[str]) -> typing.Tuple[Qgis.TextOrientation, typing.Optional[bool]]: ...
+    @staticmethod
+    def encodeTextOrientation(orientation: Qgis.TextOrientation) -> str: ...
+    @staticmethod
+    def decodeShadowPlacementType(string: typing.Optional[str]) -> 'QgsTextShadowSettings.ShadowPlacement': ...
+    @staticmethod
+    def decodeBackgroundRotationType(string: typing.Optional[str]) -> QgsTextBackgroundSettings.RotationType: ...
+    @staticmethod
+    def decodeBackgroundSizeType(string: typing.Optional[str]) -> QgsTextBackgroundSettings.SizeType: ...
+    @staticmethod
+    def decodeShapeType(string: typing.Optional[str]) -> QgsTextBackgroundSettings.ShapeType: ...
+    CurvedTextFlag: typing.Type[Qgis.CurvedTextFlag]
+    TruncateStringWhenLineIsTooShort: Qgis.CurvedTextFlag
+    UseBaselinePlacement: Qgis.CurvedTextFlag
+    UprightCharactersOnly: Qgis.CurvedTextFlag
+    ExtendLineToFitText: Qgis.CurvedTextFlag
+    CurvedTextFlags: typing.Type[Qgis.CurvedTextFlags]
+
+
+class QgsTextShadowSettings(PyQt5.sip.wrapper):
+
+    class ShadowPlacement(int):
+        ShadowLowest = ... # type: QgsTextShadowSettings.ShadowPlacement
+        ShadowText = ... # type: QgsTextShadowSettings.ShadowPlacement
+        ShadowBuffer = ... # type: QgsTextShadowSettings.ShadowPlacement
+        ShadowShape = ... # type: QgsTextShadowSettings.ShadowPlacement
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTextShadowSettings') -> None: ...
+
+    def referencedFields(self, context: QgsRenderContext) -> set[str]: ...
+    def updateDataDefinedProperties(self, context: QgsRenderContext, properties: QgsPropertyCollection) -> None: ...
+    def writeXml(self, doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def readFromLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def setBlendMode(self, mode: QtGui.QPainter.CompositionMode) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def color(self) -> QtGui.QColor: ...
+    def setScale(self, scale: int) -> None: ...
+    def scale(self) -> int: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def opacity(self) -> float: ...
+    def setBlurAlphaOnly(self, alphaOnly: bool) -> None: ...
+    def blurAlphaOnly(self) -> bool: ...
+    def setBlurRadiusMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def blurRadiusMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setBlurRadiusUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def blurRadiusUnit(self) -> Qgis.RenderUnit: ...
+    def setBlurRadius(self, blurRadius: float) -> None: ...
+    def blurRadius(self) -> float: ...
+    def setOffsetGlobal(self, global_: bool) -> None: ...
+    def offsetGlobal(self) -> bool: ...
+    def setOffsetMapUnitScale(self, scale: QgsMapUnitScale) -> None: ...
+    def offsetMapUnitScale(self) -> QgsMapUnitScale: ...
+    def setOffsetUnit(self, units: Qgis.RenderUnit) -> None: ...
+    def offsetUnit(self) -> Qgis.RenderUnit: ...
+    def setOffsetDistance(self, distance: float) -> None: ...
+    def offsetDistance(self) -> float: ...
+    def setOffsetAngle(self, angle: int) -> None: ...
+    def offsetAngle(self) -> int: ...
+    def setShadowPlacement(self, placement: 'QgsTextShadowSettings.ShadowPlacement') -> None: ...
+    def shadowPlacement(self) -> 'QgsTextShadowSettings.ShadowPlacement': ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def enabled(self) -> bool: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
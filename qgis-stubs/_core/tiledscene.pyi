@@ -0,0 +1,340 @@
+# The PEP 484 type hints stub file for the _core.tiledscene module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsDoubleRange, QgsFeedback, QgsMatrix4x4, QgsVector3D,
+)
+from .geometry import (
+    QgsAbstractGeometry, QgsBox3D, QgsOrientedBox3D, QgsRectangle, QgsSphere,
+)
+from .layertree import QgsLayerTreeLayer, QgsLayerTreeModelLegendNode
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .providers import QgsDataProvider
+from .symbology import QgsFillSymbol, QgsLineSymbol
+from .vector import (
+    QgsMapLayer, QgsMapLayerElevationProperties, QgsMapLayerRenderer,
+    QgsReadWriteContext, QgsRenderContext,
+)
+
+
+class QgsCesiumUtils(PyQt5.sip.wrapper):
+
+    class B3DMContents(PyQt5.sip.wrapper):
+
+        gltf = ... # type: typing.Union[QtCore.QByteArray, bytes, bytearray]
+        rtcCenter = ... # type: QgsVector3D
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCesiumUtils.B3DMContents') -> None: ...
+
+    class TileContents(PyQt5.sip.wrapper):
+
+        gltf = ... # type: typing.Union[QtCore.QByteArray, bytes, bytearray]
+        rtcCenter = ... # type: QgsVector3D
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsCesiumUtils.TileContents') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCesiumUtils') -> None: ...
+
+    @staticmethod
+    def extractGltfFromTileContent(tileContent: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> 'QgsCesiumUtils.TileContents': ...
+    @staticmethod
+    def extractGltfFromB3dm(tileContent: typing.Union[QtCore.QByteArray, bytes, bytearray]) -> 'QgsCesiumUtils.B3DMContents': ...
+    @staticmethod
+    def transformSphere(sphere: QgsSphere, transform: QgsMatrix4x4) -> QgsSphere: ...
+    @staticmethod
+    def parseSphere(sphere: collections.abc.Iterable[typing.Any]) -> QgsSphere: ...
+    @staticmethod
+    def parseBox(box: collections.abc.Iterable[typing.Any]) -> QgsOrientedBox3D: ...
+    @staticmethod
+    def parseRegion(region: collections.abc.Iterable[typing.Any]) -> QgsBox3D: ...
+
+
+class QgsTiledSceneBoundingVolume(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, box: QgsOrientedBox3D = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTiledSceneBoundingVolume') -> None: ...
+
+    def box(self) -> QgsOrientedBox3D: ...
+    def intersects(self, box: QgsOrientedBox3D) -> bool: ...
+    def transform(self, transform: QgsMatrix4x4) -> None: ...
+    def as2DGeometry(self, transform: QgsCoordinateTransform = ..., direction: Qgis.TransformDirection = ...) -> typing.Optional[QgsAbstractGeometry]: ...
+    def bounds(self, transform: QgsCoordinateTransform = ..., direction: Qgis.TransformDirection = ...) -> QgsBox3D: ...
+
+
+class QgsTiledSceneDataProvider(QgsDataProvider):
+
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str], providerOptions: QgsDataProvider.ProviderOptions, flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTiledSceneDataProvider') -> None: ...
+
+    def zRange(self) -> QgsDoubleRange: ...
+    def index(self) -> 'QgsTiledSceneIndex': ...
+    def boundingVolume(self) -> QgsTiledSceneBoundingVolume: ...
+    def sceneCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def clone(self) -> typing.Optional['QgsTiledSceneDataProvider']: ...
+    def capabilities(self) -> Qgis.TiledSceneProviderCapabilities: ...
+
+
+class QgsTiledSceneIndex(PyQt5.sip.wrapper):
+
+    def __init__(self, other: 'QgsTiledSceneIndex') -> None: ...
+
+    def retrieveContent(self, uri: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> QtCore.QByteArray: ...
+    def fetchHierarchy(self, id: int, feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def childAvailability(self, id: int) -> Qgis.TileChildrenAvailability: ...
+    def getTiles(self, request: 'QgsTiledSceneRequest') -> list[int]: ...
+    def childTileIds(self, id: int) -> list[int]: ...
+    def parentTileId(self, id: int) -> int: ...
+    def getTile(self, id: int) -> 'QgsTiledSceneTile': ...
+    def rootTile(self) -> 'QgsTiledSceneTile': ...
+    def isValid(self) -> bool: ...
+
+
+class QgsTiledSceneLayer(QgsMapLayer):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        loadDefaultStyle = ... # type: bool
+        skipCrsValidation = ... # type: bool
+        transformContext = ... # type: QgsCoordinateTransformContext
+
+        @typing.overload
+        def __init__(self, transformContext: QgsCoordinateTransformContext = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsTiledSceneLayer.LayerOptions') -> None: ...
+
+    def __init__(self, uri: typing.Optional[str] = ..., baseName: typing.Optional[str] = ..., provider: typing.Optional[str] = ..., options: 'QgsTiledSceneLayer.LayerOptions' = ...) -> None: ...
+
+    def setRenderer(self, renderer: typing.Optional['QgsTiledSceneRenderer']) -> None: ...
+    def renderer(self) -> typing.Optional['QgsTiledSceneRenderer']: ...
+    def properties(self) -> Qgis.MapLayerProperties: ...
+    def elevationProperties(self) -> typing.Optional[QgsMapLayerElevationProperties]: ...
+    def loadDefaultMetadata(self) -> typing.Tuple[str, bool]: ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def htmlMetadata(self) -> str: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def decodedSource(self, source: typing.Optional[str], dataProvider: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def setTransformContext(self, transformContext: QgsCoordinateTransformContext) -> None: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeXml(self, layerNode: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def readXml(self, layerNode: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def dataProvider(self) -> typing.Optional[QgsTiledSceneDataProvider]: ...
+    def extent(self) -> QgsRectangle: ...
+    def clone(self) -> typing.Optional['QgsTiledSceneLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsTiledSceneLayerElevationProperties(QgsMapLayerElevationProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def significantZValues(self, layer: typing.Optional[QgsMapLayer]) -> list[float]: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> QgsDoubleRange: ...
+    def htmlSummary(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsTiledSceneLayerElevationProperties']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+
+
+class QgsTiledSceneRenderContext(PyQt5.sip.wrapper):
+
+    def __init__(self, context: QgsRenderContext, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+
+    def textureCoordinates(self) -> typing.Tuple[float, float, float, float, float, float]: ...
+    def setTextureCoordinates(self, textureX1: float, textureY1: float, textureX2: float, textureY2: float, textureX3: float, textureY3: float) -> None: ...
+    def setTextureImage(self, image: QtGui.QImage) -> None: ...
+    def textureImage(self) -> QtGui.QImage: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def renderContext(self) -> QgsRenderContext: ...
+
+
+class QgsTiledSceneRenderer(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def saveCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def restoreCommonProperties(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def copyCommonProperties(self, destination: typing.Optional['QgsTiledSceneRenderer']) -> None: ...
+    def renderLine(self, context: QgsTiledSceneRenderContext, line: QtGui.QPolygonF) -> None: ...
+    def renderTriangle(self, context: QgsTiledSceneRenderContext, triangle: QtGui.QPolygonF) -> None: ...
+    def legendRuleKeys(self) -> list[str]: ...
+    def createLegendNodes(self, nodeLayer: typing.Optional[QgsLayerTreeLayer]) -> list[QgsLayerTreeModelLegendNode]: ...
+    def stopRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def startRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def isTileBorderRenderingEnabled(self) -> bool: ...
+    def setTileBorderRenderingEnabled(self, enabled: bool) -> None: ...
+    def setMaximumScreenErrorUnit(self, unit: Qgis.RenderUnit) -> None: ...
+    def maximumScreenErrorUnit(self) -> Qgis.RenderUnit: ...
+    def setMaximumScreenError(self, error: float) -> None: ...
+    def maximumScreenError(self) -> float: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    @staticmethod
+    def load(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional['QgsTiledSceneRenderer']: ...
+    def flags(self) -> Qgis.TiledSceneRendererFlags: ...
+    def clone(self) -> typing.Optional['QgsTiledSceneRenderer']: ...
+    def type(self) -> str: ...
+
+
+class QgsTiledSceneRendererAbstractMetadata(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], visibleName: typing.Optional[str], icon: QtGui.QIcon = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTiledSceneRendererAbstractMetadata') -> None: ...
+
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def setIcon(self, icon: QtGui.QIcon) -> None: ...
+    def icon(self) -> QtGui.QIcon: ...
+    def visibleName(self) -> str: ...
+    def name(self) -> str: ...
+
+
+class QgsTiledSceneRendererMetadata(QgsTiledSceneRendererAbstractMetadata):
+
+    def __init__(self, a0: 'QgsTiledSceneRendererMetadata') -> None: ...
+
+    def createRenderer(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsTiledSceneRenderer]: ...
+
+
+class QgsTiledSceneRendererRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def defaultRenderer(layer: typing.Optional[QgsTiledSceneLayer]) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def renderersList(self) -> list[str]: ...
+    def rendererMetadata(self, rendererName: typing.Optional[str]) -> typing.Optional[QgsTiledSceneRendererAbstractMetadata]: ...
+    def removeRenderer(self, rendererName: typing.Optional[str]) -> bool: ...
+    def addRenderer(self, metadata: typing.Optional[QgsTiledSceneRendererAbstractMetadata]) -> bool: ...
+
+
+class QgsTiledSceneRequest(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTiledSceneRequest') -> None: ...
+
+    def setParentTileId(self, id: int) -> None: ...
+    def parentTileId(self) -> int: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def setFeedback(self, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def setRequiredGeometricError(self, error: float) -> None: ...
+    def requiredGeometricError(self) -> float: ...
+    def setFilterBox(self, box: QgsOrientedBox3D) -> None: ...
+    def filterBox(self) -> QgsOrientedBox3D: ...
+    def flags(self) -> Qgis.TiledSceneRequestFlags: ...
+    def setFlags(self, flags: typing.Union[Qgis.TiledSceneRequestFlags, Qgis.TiledSceneRequestFlag]) -> None: ...
+
+
+class QgsTiledSceneTextureRenderer(QgsTiledSceneRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setFillSymbol(self, symbol: typing.Optional[QgsFillSymbol]) -> None: ...
+    def fillSymbol(self) -> typing.Optional[QgsFillSymbol]: ...
+    @staticmethod
+    def createDefaultFillSymbol() -> typing.Optional[QgsFillSymbol]: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def stopRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def startRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def renderLine(self, context: QgsTiledSceneRenderContext, line: QtGui.QPolygonF) -> None: ...
+    def renderTriangle(self, context: QgsTiledSceneRenderContext, triangle: QtGui.QPolygonF) -> None: ...
+    def flags(self) -> Qgis.TiledSceneRendererFlags: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def type(self) -> str: ...
+
+
+class QgsTiledSceneTile(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, id: int) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTiledSceneTile') -> None: ...
+
+    def setMetadata(self, metadata: dict[str, typing.Any]) -> None: ...
+    def metadata(self) -> dict[str, typing.Any]: ...
+    def setBaseUrl(self, baseUrl: QtCore.QUrl) -> None: ...
+    def baseUrl(self) -> QtCore.QUrl: ...
+    def setGeometricError(self, error: float) -> None: ...
+    def geometricError(self) -> float: ...
+    def setResources(self, resources: dict[str, typing.Any]) -> None: ...
+    def resources(self) -> dict[str, typing.Any]: ...
+    def transform(self) -> typing.Optional[QgsMatrix4x4]: ...
+    def setTransform(self, transform: QgsMatrix4x4) -> None: ...
+    def boundingVolume(self) -> QgsTiledSceneBoundingVolume: ...
+    def setBoundingVolume(self, volume: QgsTiledSceneBoundingVolume) -> None: ...
+    def setRefinementProcess(self, process: Qgis.TileRefinementProcess) -> None: ...
+    def refinementProcess(self) -> Qgis.TileRefinementProcess: ...
+    def id(self) -> int: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsTiledSceneWireframeRenderer(QgsTiledSceneRenderer):
+
+    def __init__(self) -> None: ...
+
+    def setUseTextureColors(self, enabled: bool) -> None: ...
+    def useTextureColors(self) -> bool: ...
+    def setLineSymbol(self, symbol: typing.Optional[QgsLineSymbol]) -> None: ...
+    def lineSymbol(self) -> typing.Optional[QgsLineSymbol]: ...
+    @staticmethod
+    def createDefaultLineSymbol() -> typing.Optional[QgsLineSymbol]: ...
+    def setFillSymbol(self, symbol: typing.Optional[QgsFillSymbol]) -> None: ...
+    def fillSymbol(self) -> typing.Optional[QgsFillSymbol]: ...
+    @staticmethod
+    def createDefaultFillSymbol() -> typing.Optional[QgsFillSymbol]: ...
+    @staticmethod
+    def create(element: QtXml.QDomElement, context: QgsReadWriteContext) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def flags(self) -> Qgis.TiledSceneRendererFlags: ...
+    def stopRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def startRender(self, context: QgsTiledSceneRenderContext) -> None: ...
+    def renderLine(self, context: QgsTiledSceneRenderContext, line: QtGui.QPolygonF) -> None: ...
+    def renderTriangle(self, context: QgsTiledSceneRenderContext, triangle: QtGui.QPolygonF) -> None: ...
+    def save(self, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def clone(self) -> typing.Optional[QgsTiledSceneRenderer]: ...
+    def type(self) -> str: ...
@@ -0,0 +1,101 @@
+# The PEP 484 type hints stub file for the _core.validity module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import QgsFeedback
+from .layout import QgsLayout
+
+
+class QgsValidityCheckResult(PyQt5.sip.wrapper):
+
+    class Type(int):
+        Warning = ... # type: QgsValidityCheckResult.Type
+        Critical = ... # type: QgsValidityCheckResult.Type
+
+    checkId = ... # type: typing.Optional[str]
+    detailedDescription = ... # type: typing.Optional[str]
+    title = ... # type: typing.Optional[str]
+    type = ... # type: 'QgsValidityCheckResult.Type'
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsValidityCheckResult') -> None: ...
+
+
+class QgsAbstractValidityCheck(PyQt5.sip.wrapper):
+
+    class Type(int):
+        LayoutCheck = ... # type: QgsAbstractValidityCheck.Type
+        UserCheck = ... # type: QgsAbstractValidityCheck.Type
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractValidityCheck') -> None: ...
+
+    def runCheck(self, context: typing.Optional['QgsValidityCheckContext'], feedback: typing.Optional[QgsFeedback]) -> list[QgsValidityCheckResult]: ...
+    def prepareCheck(self, context: typing.Optional['QgsValidityCheckContext'], feedback: typing.Optional[QgsFeedback]) -> bool: ...
+    def checkType(self) -> int: ...
+    def id(self) -> str: ...
+    def create(self) -> typing.Optional['QgsAbstractValidityCheck']: ...
+    TypeLayoutCheck: QgsAbstractValidityCheck.Type
+    TypeUserCheck: QgsAbstractValidityCheck.Type
+
+
+class QgsValidityCheckContext(PyQt5.sip.wrapper):
+
+    class ContextType(int):
+        TypeLayoutContext = ... # type: QgsValidityCheckContext.ContextType
+        TypeUserContext = ... # type: QgsValidityCheckContext.ContextType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsValidityCheckContext') -> None: ...
+
+    def type(self) -> int: ...
+
+
+class QgsLayoutValidityCheckContext(QgsValidityCheckContext):
+
+    layout = ... # type: QgsLayout
+
+    @typing.overload
+    def __init__(self, layout: typing.Optional[QgsLayout]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayoutValidityCheckContext') -> None: ...
+
+    def type(self) -> int: ...
+
+
+class QgsValidityCheckRegistry(PyQt5.sip.wrapper):
+
+    def __init__(self) -> None: ...
+
+    def runChecks(self, type: int, context: typing.Optional[QgsValidityCheckContext], feedback: typing.Optional[QgsFeedback]) -> list[QgsValidityCheckResult]: ...
+    def removeCheck(self, check: typing.Optional[QgsAbstractValidityCheck]) -> None: ...
+    def addCheck(self, check: typing.Optional[QgsAbstractValidityCheck]) -> None: ...
+    @typing.overload
+    def checks(self) -> list[QgsAbstractValidityCheck]: ...
+    @typing.overload
+    def checks(self, type: int) -> list[QgsAbstractValidityCheck]: ...
@@ -0,0 +1,4813 @@
+# The PEP 484 type hints stub file for the _core.vector module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._3d import QgsAbstract3DRenderer
+from ._ungrouped import (
+    Qgis, QgsAttributeTableConfig, QgsDataProviderElevationProperties,
+    QgsDataProviderTemporalCapabilities, QgsDateTimeRange, QgsDefaultValue,
+    QgsDoubleRange, QgsEditorWidgetSetup, QgsElevationMap, QgsError,
+    QgsErrorMessage, QgsFeedback, QgsField, QgsFieldConstraints, QgsFields,
+    QgsInterval, QgsMapLayerDependency, QgsMaskRenderSettings,
+    QgsObjectCustomProperties, QgsPathResolver, QgsPropertyDefinition,
+    QgsSldExportContext, QgsStoredExpressionManager, QgsTemporalController,
+    QgsTemporalProperty, QgsTemporalRangeObject, QgsVector,
+    QgsVectorSimplifyMethod, QgsVirtualLayerDefinition,
+)
+from .actions import QgsActionManager
+from .annotations import QgsRenderedItemDetails
+from .callouts import QgsCallout
+from .diagram import QgsDiagram, QgsDiagramSettings, QgsMapUnitScale
+from .dxf import (
+    QgsMapSettings, QgsMapToPixel, QgsRenderedFeatureHandlerInterface,
+)
+from .editform import QgsEditFormConfig
+from .effects import QgsPaintEffect
+from .elevation import (
+    QgsAbstractProfileGenerator, QgsAbstractProfileSource, QgsProfileRequest,
+    QgsTask,
+)
+from .expression import (
+    QgsDistanceArea, QgsExpression, QgsExpressionFunction,
+    QgsScopedExpressionFunction,
+)
+from .geometry import (
+    QgsAbstractGeometry, QgsAbstractGeometrySimplifier, QgsBox3D, QgsCurve,
+    QgsGeometry, QgsPoint, QgsRectangle, QgsReferencedRectangle,
+)
+from .labeling import QgsAbstractVectorLayerLabeling, QgsPalLayerSettings
+from .layertree import (
+    QgsDataDefinedSizeLegend, QgsLayerTreeGroup, QgsLayerTreeLayer,
+    QgsLayerTreeModelLegendNode, QgsLayerTreeNode, QgsLayerTreeRegistryBridge,
+    QgsProperty,
+)
+from .layout import (
+    QgsConditionalStyle, QgsFeatureFilterProvider, QgsMapClippingRegion,
+)
+from .mesh import QgsMeshLayer
+from .metadata import QgsLayerMetadata
+from .network import QgsHttpHeaders
+from .numericformats import QgsNumericFormat
+from .pointcloud import QgsPointCloudLayer
+from .processing import QgsRemappingSinkDefinition
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .project import QgsMapLayerModel, QgsProject, QgsProjectTranslator
+from .providers import (
+    QgsAbstractDatabaseProviderConnection, QgsDataProvider,
+    QgsProviderMetadata, QgsTransaction,
+)
+from .raster import QgsRasterLayer
+from .symbology import (
+    QgsFeatureRenderer, QgsFeatureRendererGenerator, QgsFillSymbol,
+    QgsLineSymbol, QgsMarkerSymbol, QgsStyleEntityVisitorInterface, QgsSymbol,
+    QgsSymbolLayer, QgsSymbolLayerReference,
+)
+from .textrenderer import QgsTextFormat
+
+
+class QgsAggregateCalculator(PyQt5.sip.wrapper):
+
+    class AggregateInfo(PyQt5.sip.wrapper):
+
+        function = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        supportedTypes = ... # type: collections.abc.Iterable[QtCore.QMetaType.Type]
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAggregateCalculator.AggregateInfo') -> None: ...
+
+    class AggregateParameters(PyQt5.sip.wrapper):
+
+        delimiter = ... # type: typing.Optional[str]
+        filter = ... # type: typing.Optional[str]
+        orderBy = ... # type: 'QgsFeatureRequest.OrderBy'
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsAggregateCalculator.AggregateParameters') -> None: ...
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional['QgsVectorLayer']) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAggregateCalculator') -> None: ...
+
+    @staticmethod
+    def aggregates() -> list['QgsAggregateCalculator.AggregateInfo']: ...
+    @staticmethod
+    def displayName(aggregate: Qgis.Aggregate) -> str: ...
+    @staticmethod
+    def stringToAggregate(string: typing.Optional[str]) -> typing.Tuple[Qgis.Aggregate, typing.Optional[bool]]: ...
+    def calculate(self, aggregate: Qgis.Aggregate, fieldOrExpression: typing.Optional[str], context: typing.Optional['QgsExpressionContext'] = ..., feedback: typing.Optional['QgsFeedback'] = ...) -> typing.Tuple[typing.Any, typing.Optional[bool]]: ...
+    def delimiter(self) -> str: ...
+    def setDelimiter(self, delimiter: typing.Optional[str]) -> None: ...
+    def filter(self) -> str: ...
+    def setFidsFilter(self, fids: typing.Any) -> None: ...
+    def setFilter(self, filterExpression: typing.Optional[str]) -> None: ...
+    def setParameters(self, parameters: 'QgsAggregateCalculator.AggregateParameters') -> None: ...
+    def layer(self) -> typing.Optional['QgsVectorLayer']: ...
+    def lastError(self) -> str: ...
+    Aggregate: typing.Type[Qgis.Aggregate]
+    Count: Qgis.Aggregate
+    CountDistinct: Qgis.Aggregate
+    CountMissing: Qgis.Aggregate
+    Min: Qgis.Aggregate
+    Max: Qgis.Aggregate
+    Sum: Qgis.Aggregate
+    Mean: Qgis.Aggregate
+    Median: Qgis.Aggregate
+    StDev: Qgis.Aggregate
+    StDevSample: Qgis.Aggregate
+    Range: Qgis.Aggregate
+    Minority: Qgis.Aggregate
+    Majority: Qgis.Aggregate
+    FirstQuartile: Qgis.Aggregate
+    ThirdQuartile: Qgis.Aggregate
+    InterQuartileRange: Qgis.Aggregate
+    StringMinimumLength: Qgis.Aggregate
+    StringMaximumLength: Qgis.Aggregate
+    StringConcatenate: Qgis.Aggregate
+    GeometryCollect: Qgis.Aggregate
+    ArrayAggregate: Qgis.Aggregate
+    StringConcatenateUnique: Qgis.Aggregate
+
+
+class QgsMapLayer(QtCore.QObject):
+
+    class SaveStyleResult(int):
+        Success = ... # type: QgsMapLayer.SaveStyleResult
+        QmlGenerationFailed = ... # type: QgsMapLayer.SaveStyleResult
+        SldGenerationFailed = ... # type: QgsMapLayer.SaveStyleResult
+        DatabaseWriteFailed = ... # type: QgsMapLayer.SaveStyleResult
+
+    class ReadFlag(int):
+        FlagDontResolveLayers = ... # type: QgsMapLayer.ReadFlag
+        FlagTrustLayerMetadata = ... # type: QgsMapLayer.ReadFlag
+        FlagReadExtentFromXml = ... # type: QgsMapLayer.ReadFlag
+        FlagForceReadOnly = ... # type: QgsMapLayer.ReadFlag
+
+    class StyleCategory(int):
+        LayerConfiguration = ... # type: QgsMapLayer.StyleCategory
+        Symbology = ... # type: QgsMapLayer.StyleCategory
+        Symbology3D = ... # type: QgsMapLayer.StyleCategory
+        Labeling = ... # type: QgsMapLayer.StyleCategory
+        Fields = ... # type: QgsMapLayer.StyleCategory
+        Forms = ... # type: QgsMapLayer.StyleCategory
+        Actions = ... # type: QgsMapLayer.StyleCategory
+        MapTips = ... # type: QgsMapLayer.StyleCategory
+        Diagrams = ... # type: QgsMapLayer.StyleCategory
+        AttributeTable = ... # type: QgsMapLayer.StyleCategory
+        Rendering = ... # type: QgsMapLayer.StyleCategory
+        CustomProperties = ... # type: QgsMapLayer.StyleCategory
+        GeometryOptions = ... # type: QgsMapLayer.StyleCategory
+        Relations = ... # type: QgsMapLayer.StyleCategory
+        Temporal = ... # type: QgsMapLayer.StyleCategory
+        Legend = ... # type: QgsMapLayer.StyleCategory
+        Elevation = ... # type: QgsMapLayer.StyleCategory
+        Notes = ... # type: QgsMapLayer.StyleCategory
+        AllStyleCategories = ... # type: QgsMapLayer.StyleCategory
+
+    class LayerFlag(int):
+        Identifiable = ... # type: QgsMapLayer.LayerFlag
+        Removable = ... # type: QgsMapLayer.LayerFlag
+        Searchable = ... # type: QgsMapLayer.LayerFlag
+        Private = ... # type: QgsMapLayer.LayerFlag
+
+    class PropertyType(int):
+        Style = ... # type: QgsMapLayer.PropertyType
+        Metadata = ... # type: QgsMapLayer.PropertyType
+
+    class LayerFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __xor__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __ior__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __or__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __iand__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __and__(self, f: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> 'QgsMapLayer.LayerFlags': ...
+        def __invert__(self) -> 'QgsMapLayer.LayerFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class StyleCategories(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __xor__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __ior__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __or__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __iand__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __and__(self, f: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> 'QgsMapLayer.StyleCategories': ...
+        def __invert__(self) -> 'QgsMapLayer.StyleCategories': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class ReadFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __xor__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __ior__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __or__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __iand__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __and__(self, f: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> 'QgsMapLayer.ReadFlags': ...
+        def __invert__(self) -> 'QgsMapLayer.ReadFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class SaveStyleResults(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __xor__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __ior__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __or__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __iand__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __and__(self, f: typing.Union['QgsMapLayer.SaveStyleResults', 'QgsMapLayer.SaveStyleResult']) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __invert__(self) -> 'QgsMapLayer.SaveStyleResults': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, type: Qgis.LayerType = ..., name: typing.Optional[str] = ..., source: typing.Optional[str] = ...) -> None: ...
+
+    def hasDependencyCycle(self, a0: collections.abc.Iterable['QgsMapLayerDependency']) -> bool: ...
+    def invalidateWgs84Extent(self) -> None: ...
+    def setError(self, error: 'QgsError') -> None: ...
+    def appendError(self, error: 'QgsErrorMessage') -> None: ...
+    def setProviderType(self, providerType: typing.Optional[str]) -> None: ...
+    def readCommonStyle(self, layerElement: QtXml.QDomElement, context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> None: ...
+    def writeCommonStyle(self, layerElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> None: ...
+    def writeStyleManager(self, layerNode: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    def readStyleManager(self, layerNode: QtXml.QDomNode) -> None: ...
+    def writeCustomProperties(self, layerNode: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    def readCustomProperties(self, layerNode: QtXml.QDomNode, keyStartsWith: typing.Optional[str] = ...) -> None: ...
+    def decodedSource(self, source: typing.Optional[str], dataProvider: typing.Optional[str], context: 'QgsReadWriteContext') -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: 'QgsReadWriteContext') -> str: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, document: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, layer_node: QtXml.QDomNode, context: 'QgsReadWriteContext') -> bool: ...
+    def setValid(self, valid: bool) -> None: ...
+    def setExtent3D(self, box: 'QgsBox3D') -> None: ...
+    def setExtent(self, rect: 'QgsRectangle') -> None: ...
+    mapTipsEnabledChanged: typing.ClassVar[QtCore.pyqtSignal]
+    mapTipTemplateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    layerModified: typing.ClassVar[QtCore.pyqtSignal]
+    editingStopped: typing.ClassVar[QtCore.pyqtSignal]
+    editingStarted: typing.ClassVar[QtCore.pyqtSignal]
+    customPropertyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    isValidChanged: typing.ClassVar[QtCore.pyqtSignal]
+    styleLoaded: typing.ClassVar[QtCore.pyqtSignal]
+    dataSourceChanged: typing.ClassVar[QtCore.pyqtSignal]
+    flagsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    metadataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    autoRefreshIntervalChanged: typing.ClassVar[QtCore.pyqtSignal]
+    willBeDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    dependenciesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    configChanged: typing.ClassVar[QtCore.pyqtSignal]
+    request3DUpdate: typing.ClassVar[QtCore.pyqtSignal]
+    renderer3DChanged: typing.ClassVar[QtCore.pyqtSignal]
+    legendChanged: typing.ClassVar[QtCore.pyqtSignal]
+    styleChanged: typing.ClassVar[QtCore.pyqtSignal]
+    rendererChanged: typing.ClassVar[QtCore.pyqtSignal]
+    opacityChanged: typing.ClassVar[QtCore.pyqtSignal]
+    blendModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    dataChanged: typing.ClassVar[QtCore.pyqtSignal]
+    recalculateExtents: typing.ClassVar[QtCore.pyqtSignal]
+    repaintRequested: typing.ClassVar[QtCore.pyqtSignal]
+    verticalCrsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    crs3DChanged: typing.ClassVar[QtCore.pyqtSignal]
+    crsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    nameChanged: typing.ClassVar[QtCore.pyqtSignal]
+    idChanged: typing.ClassVar[QtCore.pyqtSignal]
+    statusChanged: typing.ClassVar[QtCore.pyqtSignal]
+    beforeResolveReferences: typing.ClassVar[QtCore.pyqtSignal]
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def __repr__(self) -> typing.Any: ...
+    def setTransformContext(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    def setRefreshOnNofifyMessage(self, message: typing.Optional[str]) -> None: ...
+    def setRefreshOnNotifyEnabled(self, enabled: bool) -> None: ...
+    def setDependencies(self, layers: collections.abc.Iterable['QgsMapLayerDependency']) -> bool: ...
+    def emitStyleChanged(self) -> None: ...
+    def trigger3DUpdate(self) -> None: ...
+    def triggerRepaint(self, deferredUpdate: bool = ...) -> None: ...
+    def setScaleBasedVisibility(self, enabled: bool) -> None: ...
+    def setMaximumScale(self, scale: float) -> None: ...
+    def setMinimumScale(self, scale: float) -> None: ...
+    @staticmethod
+    def providerReadFlags(layerNode: QtXml.QDomNode, layerReadFlags: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag']) -> Qgis.DataProviderReadFlags: ...
+    def mapTipsEnabled(self) -> bool: ...
+    def setMapTipsEnabled(self, enabled: bool) -> None: ...
+    def setMapTipTemplate(self, mapTipTemplate: typing.Optional[str]) -> None: ...
+    def mapTipTemplate(self) -> str: ...
+    def hasMapTips(self) -> bool: ...
+    def setLegendPlaceholderImage(self, imgPath: typing.Optional[str]) -> None: ...
+    def legendPlaceholderImage(self) -> str: ...
+    def profileSource(self) -> typing.Optional['QgsAbstractProfileSource']: ...
+    def elevationProperties(self) -> typing.Optional['QgsMapLayerElevationProperties']: ...
+    def temporalProperties(self) -> typing.Optional['QgsMapLayerTemporalProperties']: ...
+    def selectionProperties(self) -> typing.Optional['QgsMapLayerSelectionProperties']: ...
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    @staticmethod
+    def generateId(layerName: typing.Optional[str]) -> str: ...
+    def setOriginalXmlProperties(self, originalXmlProperties: typing.Optional[str]) -> None: ...
+    def originalXmlProperties(self) -> str: ...
+    def isRefreshOnNotifyEnabled(self) -> bool: ...
+    def refreshOnNotifyMessage(self) -> str: ...
+    def dependencies(self) -> set['QgsMapLayerDependency']: ...
+    def timestamp(self) -> QtCore.QDateTime: ...
+    def htmlMetadata(self) -> str: ...
+    def setMetadata(self, metadata: 'QgsLayerMetadata') -> None: ...
+    def metadata(self) -> 'QgsLayerMetadata': ...
+    def setAutoRefreshMode(self, mode: Qgis.AutoRefreshMode) -> None: ...
+    @deprecated("""""")
+    def setAutoRefreshEnabled(self, enabled: bool) -> None: ...
+    def setAutoRefreshInterval(self, interval: int) -> None: ...
+    def autoRefreshInterval(self) -> int: ...
+    def autoRefreshMode(self) -> Qgis.AutoRefreshMode: ...
+    @deprecated("""""")
+    def hasAutoRefreshEnabled(self) -> bool: ...
+    def hasScaleBasedVisibility(self) -> bool: ...
+    def maximumScale(self) -> float: ...
+    def minimumScale(self) -> float: ...
+    def isInScaleRange(self, scale: float) -> bool: ...
+    def renderer3D(self) -> typing.Optional['QgsAbstract3DRenderer']: ...
+    def setRenderer3D(self, renderer: typing.Optional['QgsAbstract3DRenderer']) -> None: ...
+    def styleManager(self) -> typing.Optional['QgsMapLayerStyleManager']: ...
+    def legend(self) -> typing.Optional['QgsMapLayerLegend']: ...
+    def setLegend(self, legend: typing.Optional['QgsMapLayerLegend']) -> None: ...
+    @deprecated("""""")
+    def legendUrlFormat(self) -> str: ...
+    @deprecated("""""")
+    def setLegendUrlFormat(self, legendUrlFormat: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def legendUrl(self) -> str: ...
+    @deprecated("""""")
+    def setLegendUrl(self, legendUrl: typing.Optional[str]) -> None: ...
+    def undoStackStyles(self) -> typing.Optional[QtWidgets.QUndoStack]: ...
+    def undoStack(self) -> typing.Optional[QtWidgets.QUndoStack]: ...
+    def providerType(self) -> str: ...
+    @typing.overload
+    def setDataSource(self, dataSource: typing.Optional[str], baseName: typing.Optional[str] = ..., provider: typing.Optional[str] = ..., loadDefaultStyleFlag: bool = ...) -> None: ...
+    @typing.overload
+    def setDataSource(self, dataSource: typing.Optional[str], baseName: typing.Optional[str], provider: typing.Optional[str], options: 'QgsDataProvider.ProviderOptions', loadDefaultStyleFlag: bool = ...) -> None: ...
+    @typing.overload
+    def setDataSource(self, dataSource: typing.Optional[str], baseName: typing.Optional[str], provider: typing.Optional[str], options: 'QgsDataProvider.ProviderOptions', flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag]) -> None: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> bool: ...
+    def readSld(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str]) -> bool: ...
+    def loadSldStyle(self, uri: typing.Optional[str]) -> typing.Tuple[str, bool]: ...
+    def saveSldStyleV2(self, exportContext: 'QgsSldExportContext') -> typing.Tuple[str, bool]: ...
+    def saveSldStyle(self, uri: typing.Optional[str]) -> typing.Tuple[str, bool]: ...
+    def saveNamedStyle(self, uri: typing.Optional[str], categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> typing.Tuple[str, bool]: ...
+    @typing.overload
+    def saveDefaultStyle(self, categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory']) -> typing.Tuple[str, bool]: ...
+    @typing.overload
+    @deprecated("""""")
+    def saveDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def exportSldStyleV3(self, exportContext: 'QgsSldExportContext') -> QtXml.QDomDocument: ...
+    @deprecated("""""")
+    def exportSldStyleV2(self, doc: QtXml.QDomDocument, errorMsg: typing.Optional[str], exportContext: 'QgsSldExportContext') -> None: ...
+    @deprecated("""""")
+    def exportSldStyle(self, doc: QtXml.QDomDocument, errorMsg: typing.Optional[str]) -> None: ...
+    def exportNamedStyle(self, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext' = ..., categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> str: ...
+    def importNamedStyle(self, doc: QtXml.QDomDocument, categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> typing.Tuple[bool, str]: ...
+    def loadNamedStyleFromDatabase(self, db: typing.Optional[str], uri: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def styleURI(self) -> str: ...
+    def importNamedMetadata(self, document: QtXml.QDomDocument, errorMessage: typing.Optional[str]) -> bool: ...
+    def loadNamedMetadataFromDatabase(self, db: typing.Optional[str], uri: typing.Optional[str], qmd: typing.Optional[str]) -> bool: ...
+    def loadDefaultMetadata(self) -> typing.Tuple[str, bool]: ...
+    def loadNamedMetadata(self, uri: typing.Optional[str]) -> typing.Tuple[str, bool]: ...
+    def saveNamedMetadata(self, uri: typing.Optional[str]) -> typing.Tuple[str, bool]: ...
+    def saveDefaultMetadata(self) -> typing.Tuple[str, bool]: ...
+    def exportNamedMetadata(self, doc: QtXml.QDomDocument, errorMsg: typing.Optional[str]) -> None: ...
+    def metadataUri(self) -> str: ...
+    @staticmethod
+    def formatLayerName(name: typing.Optional[str]) -> str: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def setVerticalCrs(self, crs: 'QgsCoordinateReferenceSystem') -> typing.Tuple[bool, typing.Optional[str]]: ...
+    def setCrs(self, srs: 'QgsCoordinateReferenceSystem', emitSignal: bool = ...) -> None: ...
+    def crs3D(self) -> 'QgsCoordinateReferenceSystem': ...
+    def verticalCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def error(self) -> 'QgsError': ...
+    def removeCustomProperty(self, key: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def loadNamedStyle(self, theURI: typing.Optional[str], loadFromLocalDb: bool, categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ..., flags: typing.Union[Qgis.LoadStyleFlags, Qgis.LoadStyleFlag] = ...) -> typing.Tuple[str, bool]: ...
+    @typing.overload
+    def loadNamedStyle(self, uri: typing.Optional[str], categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ..., flags: typing.Union[Qgis.LoadStyleFlags, Qgis.LoadStyleFlag] = ...) -> typing.Tuple[str, bool]: ...
+    def saveStyleToDatabaseV2(self, name: typing.Optional[str], description: typing.Optional[str], useAsDefault: bool, uiFileContent: typing.Optional[str], categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> typing.Tuple['QgsMapLayer.SaveStyleResults', str]: ...
+    @deprecated("""""")
+    def saveStyleToDatabase(self, name: typing.Optional[str], description: typing.Optional[str], useAsDefault: bool, uiFileContent: typing.Optional[str], categories: typing.Union['QgsMapLayer.StyleCategories', 'QgsMapLayer.StyleCategory'] = ...) -> str: ...
+    def deleteStyleFromDatabase(self, styleId: typing.Optional[str]) -> typing.Tuple[bool, str]: ...
+    def getStyleFromDatabase(self, styleId: typing.Optional[str]) -> typing.Tuple[str, str]: ...
+    def listStylesInDatabase(self) -> typing.Tuple[int, list[str], list[str], list[str], str]: ...
+    def customProperties(self) -> 'QgsObjectCustomProperties': ...
+    def setCustomProperties(self, properties: 'QgsObjectCustomProperties') -> None: ...
+    def customProperty(self, value: typing.Optional[str], defaultValue: typing.Any = ...) -> typing.Any: ...
+    def setCustomProperty(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def customPropertyKeys(self) -> list[str]: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def writeLayerXml(self, layerElement: QtXml.QDomElement, document: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readLayerXml(self, layerElement: QtXml.QDomElement, context: 'QgsReadWriteContext', flags: typing.Union['QgsMapLayer.ReadFlags', 'QgsMapLayer.ReadFlag'] = ..., preloadedProvider: typing.Optional['QgsDataProvider'] = ...) -> bool: ...
+    def isTemporary(self) -> bool: ...
+    def isSpatial(self) -> bool: ...
+    def isModified(self) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def supportsEditing(self) -> bool: ...
+    def setSubLayerVisibility(self, name: typing.Optional[str], visible: bool) -> None: ...
+    def setLayerOrder(self, layers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def subLayers(self) -> list[str]: ...
+    def source(self) -> str: ...
+    def publicSource(self, hidePassword: bool = ...) -> str: ...
+    def isValid(self) -> bool: ...
+    def wgs84Extent(self, forceRecalculate: bool = ...) -> 'QgsRectangle': ...
+    def extent3D(self) -> 'QgsBox3D': ...
+    def extent(self) -> 'QgsRectangle': ...
+    def createMapRenderer(self, rendererContext: 'QgsRenderContext') -> typing.Optional['QgsMapLayerRenderer']: ...
+    def reload(self) -> None: ...
+    def readOnly(self) -> bool: ...
+    def opacity(self) -> float: ...
+    def setOpacity(self, opacity: float) -> None: ...
+    def blendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setBlendMode(self, blendMode: QtGui.QPainter.CompositionMode) -> None: ...
+    @deprecated("""""")
+    def metadataUrlFormat(self) -> str: ...
+    @deprecated("""""")
+    def setMetadataUrlFormat(self, metaUrlFormat: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def metadataUrlType(self) -> str: ...
+    @deprecated("""""")
+    def setMetadataUrlType(self, metaUrlType: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def metadataUrl(self) -> str: ...
+    @deprecated("""""")
+    def setMetadataUrl(self, metaUrl: typing.Optional[str]) -> None: ...
+    def serverProperties(self) -> typing.Optional['QgsMapLayerServerProperties']: ...
+    @deprecated("""""")
+    def attributionUrl(self) -> str: ...
+    @deprecated("""""")
+    def setAttributionUrl(self, attribUrl: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def attribution(self) -> str: ...
+    @deprecated("""""")
+    def setAttribution(self, attrib: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def dataUrlFormat(self) -> str: ...
+    @deprecated("""""")
+    def setDataUrlFormat(self, dataUrlFormat: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def dataUrl(self) -> str: ...
+    @deprecated("""""")
+    def setDataUrl(self, dataUrl: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def keywordList(self) -> str: ...
+    @deprecated("""""")
+    def setKeywordList(self, keywords: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def abstract(self) -> str: ...
+    @deprecated("""""")
+    def setAbstract(self, abstract: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def title(self) -> str: ...
+    @deprecated("""""")
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def shortName(self) -> str: ...
+    @deprecated("""""")
+    def setShortName(self, shortName: typing.Optional[str]) -> None: ...
+    def providerMetadata(self) -> typing.Optional['QgsProviderMetadata']: ...
+    def dataProvider(self) -> typing.Optional['QgsDataProvider']: ...
+    def name(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def setId(self, id: typing.Optional[str]) -> bool: ...
+    def id(self) -> str: ...
+    @staticmethod
+    def extensionPropertyType(type: 'QgsMapLayer.PropertyType') -> str: ...
+    def properties(self) -> Qgis.MapLayerProperties: ...
+    def setFlags(self, flags: typing.Union['QgsMapLayer.LayerFlags', 'QgsMapLayer.LayerFlag']) -> None: ...
+    def flags(self) -> 'QgsMapLayer.LayerFlags': ...
+    def type(self) -> Qgis.LayerType: ...
+    @typing.overload
+    def clone(self) -> typing.Optional['QgsMapLayer']: ...
+    @typing.overload
+    def clone(self, layer: typing.Optional['QgsMapLayer']) -> None: ...
+    LayerType: typing.Type[Qgis.LayerType]
+    VectorLayer: Qgis.LayerType
+    RasterLayer: Qgis.LayerType
+    PluginLayer: Qgis.LayerType
+    MeshLayer: Qgis.LayerType
+    VectorTileLayer: Qgis.LayerType
+    AnnotationLayer: Qgis.LayerType
+    PointCloudLayer: Qgis.LayerType
+    GroupLayer: Qgis.LayerType
+    TiledScene: Qgis.LayerType
+
+
+class QgsExpressionContextGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionContextGenerator') -> None: ...
+
+    def createExpressionContext(self) -> 'QgsExpressionContext': ...
+
+
+class QgsExpressionContextScopeGenerator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsExpressionContextScopeGenerator') -> None: ...
+
+    def createExpressionContextScope(self) -> typing.Optional['QgsExpressionContextScope']: ...
+
+
+class QgsFeatureSink(PyQt5.sip.wrapper):
+
+    class Flag(int):
+        FastInsert = ... # type: QgsFeatureSink.Flag
+        RollBackOnErrors = ... # type: QgsFeatureSink.Flag
+
+    class SinkFlag(int):
+        RegeneratePrimaryKey = ... # type: QgsFeatureSink.SinkFlag
+
+    class SinkFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __xor__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __ior__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __or__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __iand__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __and__(self, f: typing.Union['QgsFeatureSink.SinkFlags', 'QgsFeatureSink.SinkFlag']) -> 'QgsFeatureSink.SinkFlags': ...
+        def __invert__(self) -> 'QgsFeatureSink.SinkFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __xor__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __ior__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __or__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __iand__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __and__(self, f: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag']) -> 'QgsFeatureSink.Flags': ...
+        def __invert__(self) -> 'QgsFeatureSink.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFeatureSink') -> None: ...
+
+    def lastError(self) -> str: ...
+    def flushBuffer(self) -> bool: ...
+    @typing.overload
+    def addFeatures(self, features: collections.abc.Iterable['QgsFeature'], flags: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag'] = ...) -> bool: ...
+    @typing.overload
+    def addFeatures(self, iterator: 'QgsFeatureIterator', flags: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag'] = ...) -> bool: ...
+    def addFeature(self, feature: 'QgsFeature', flags: typing.Union['QgsFeatureSink.Flags', 'QgsFeatureSink.Flag'] = ...) -> bool: ...
+    def finalize(self) -> None: ...
+
+
+class QgsFeatureSource(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFeatureSource') -> None: ...
+
+    def hasSpatialIndex(self) -> Qgis.SpatialIndexPresence: ...
+    def materialize(self, request: 'QgsFeatureRequest', feedback: typing.Optional['QgsFeedback'] = ...) -> typing.Optional['QgsVectorLayer']: ...
+    def allFeatureIds(self) -> typing.Any: ...
+    def sourceExtent3D(self) -> 'QgsBox3D': ...
+    def sourceExtent(self) -> 'QgsRectangle': ...
+    def maximumValue(self, fieldIndex: int) -> typing.Any: ...
+    def minimumValue(self, fieldIndex: int) -> typing.Any: ...
+    def uniqueValues(self, fieldIndex: int, limit: int = ...) -> set[typing.Any]: ...
+    def hasFeatures(self) -> Qgis.FeatureAvailability: ...
+    def featureCount(self) -> int: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def fields(self) -> 'QgsFields': ...
+    def sourceCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def sourceName(self) -> str: ...
+    def getFeatures(self, request: 'QgsFeatureRequest' = ...) -> 'QgsFeatureIterator': ...
+    SpatialIndexPresence: typing.Type[Qgis.SpatialIndexPresence]
+    SpatialIndexUnknown: Qgis.SpatialIndexPresence
+    SpatialIndexNotPresent: Qgis.SpatialIndexPresence
+    SpatialIndexPresent: Qgis.SpatialIndexPresence
+    FeatureAvailability: typing.Type[Qgis.FeatureAvailability]
+    NoFeaturesAvailable: Qgis.FeatureAvailability
+    FeaturesAvailable: Qgis.FeatureAvailability
+    FeaturesMaybeAvailable: Qgis.FeatureAvailability
+
+
+class QgsVectorLayer(QgsMapLayer, QgsExpressionContextGenerator, QgsExpressionContextScopeGenerator, QgsFeatureSink, QgsFeatureSource, QgsAbstractProfileSource):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        fallbackCrs = ... # type: 'QgsCoordinateReferenceSystem'
+        fallbackWkbType = ... # type: Qgis.WkbType
+        forceReadOnly = ... # type: bool
+        loadAllStoredStyles = ... # type: bool
+        loadDefaultStyle = ... # type: bool
+        readExtentFromXml = ... # type: bool
+        skipCrsValidation = ... # type: bool
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, loadDefaultStyle: bool = ..., readExtentFromXml: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext', loadDefaultStyle: bool = ..., readExtentFromXml: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayer.LayerOptions') -> None: ...
+
+    class DeleteContext(PyQt5.sip.wrapper):
+
+        cascade = ... # type: bool
+        project = ... # type: 'QgsProject'
+
+        @typing.overload
+        def __init__(self, cascade: bool = ..., project: typing.Optional['QgsProject'] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayer.DeleteContext') -> None: ...
+
+        def handledFeatures(self, layer: typing.Optional['QgsVectorLayer']) -> typing.Any: ...
+        def handledLayers(self, includeAuxiliaryLayers: bool = ...) -> list['QgsVectorLayer']: ...
+
+    def __init__(self, path: typing.Optional[str] = ..., baseName: typing.Optional[str] = ..., providerLib: typing.Optional[str] = ..., options: 'QgsVectorLayer.LayerOptions' = ...) -> None: ...
+
+    def setExtent3D(self, rect: 'QgsBox3D') -> None: ...
+    def setExtent(self, rect: 'QgsRectangle') -> None: ...
+    symbolFeatureCountMapChanged: typing.ClassVar[QtCore.pyqtSignal]
+    supportsEditingChanged: typing.ClassVar[QtCore.pyqtSignal]
+    readOnlyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    editFormConfigChanged: typing.ClassVar[QtCore.pyqtSignal]
+    raiseError: typing.ClassVar[QtCore.pyqtSignal]
+    displayExpressionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    writeCustomSymbology: typing.ClassVar[QtCore.pyqtSignal]
+    readCustomSymbology: typing.ClassVar[QtCore.pyqtSignal]
+    editCommandDestroyed: typing.ClassVar[QtCore.pyqtSignal]
+    editCommandEnded: typing.ClassVar[QtCore.pyqtSignal]
+    editCommandStarted: typing.ClassVar[QtCore.pyqtSignal]
+    featureBlendModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    labelingFontNotFound: typing.ClassVar[QtCore.pyqtSignal]
+    committedGeometriesChanges: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributeValuesChanges: typing.ClassVar[QtCore.pyqtSignal]
+    committedFeaturesRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    committedFeaturesAdded: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributesAdded: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributesDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    geometryChanged: typing.ClassVar[QtCore.pyqtSignal]
+    attributeValueChanged: typing.ClassVar[QtCore.pyqtSignal]
+    subsetStringChanged: typing.ClassVar[QtCore.pyqtSignal]
+    updatedFields: typing.ClassVar[QtCore.pyqtSignal]
+    featuresDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    featureDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    featureAdded: typing.ClassVar[QtCore.pyqtSignal]
+    beforeRemovingExpressionField: typing.ClassVar[QtCore.pyqtSignal]
+    attributeDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    beforeAddingExpressionField: typing.ClassVar[QtCore.pyqtSignal]
+    attributeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    afterRollBack: typing.ClassVar[QtCore.pyqtSignal]
+    afterCommitChanges: typing.ClassVar[QtCore.pyqtSignal]
+    beforeRollBack: typing.ClassVar[QtCore.pyqtSignal]
+    beforeCommitChanges: typing.ClassVar[QtCore.pyqtSignal]
+    beforeEditingStarted: typing.ClassVar[QtCore.pyqtSignal]
+    beforeModifiedCheck: typing.ClassVar[QtCore.pyqtSignal]
+    allowCommitChanged: typing.ClassVar[QtCore.pyqtSignal]
+    selectionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def accept(self, visitor: typing.Optional['QgsStyleEntityVisitorInterface']) -> bool: ...
+    def hasSpatialIndex(self) -> Qgis.SpatialIndexPresence: ...
+    def setTransformContext(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    def startEditing(self) -> bool: ...
+    def updateExtents(self, force: bool = ...) -> None: ...
+    def reselect(self) -> None: ...
+    def removeSelection(self) -> None: ...
+    @typing.overload
+    def deselect(self, featureId: int) -> None: ...
+    @typing.overload
+    def deselect(self, featureIds: typing.Any) -> None: ...
+    @typing.overload
+    def select(self, featureId: int) -> None: ...
+    @typing.overload
+    def select(self, featureIds: typing.Any) -> None: ...
+    def storedExpressionManager(self) -> typing.Optional['QgsStoredExpressionManager']: ...
+    def geometryOptions(self) -> typing.Optional['QgsGeometryOptions']: ...
+    def isEditCommandActive(self) -> bool: ...
+    def readExtentFromXml(self) -> bool: ...
+    def setReadExtentFromXml(self, readExtentFromXml: bool) -> None: ...
+    def setEditFormConfig(self, editFormConfig: 'QgsEditFormConfig') -> None: ...
+    def editFormConfig(self) -> 'QgsEditFormConfig': ...
+    def createExpressionContextScope(self) -> typing.Optional['QgsExpressionContextScope']: ...
+    def createExpressionContext(self) -> 'QgsExpressionContext': ...
+    def setAttributeTableConfig(self, attributeTableConfig: QgsAttributeTableConfig) -> None: ...
+    def attributeTableConfig(self) -> QgsAttributeTableConfig: ...
+    def conditionalStyles(self) -> typing.Optional['QgsConditionalLayerStyles']: ...
+    def simplifyDrawingCanbeApplied(self, renderContext: 'QgsRenderContext', simplifyHint: Qgis.VectorRenderingSimplificationFlag) -> bool: ...
+    def simplifyMethod(self) -> 'QgsVectorSimplifyMethod': ...
+    def setSimplifyMethod(self, simplifyMethod: 'QgsVectorSimplifyMethod') -> None: ...
+    def htmlMetadata(self) -> str: ...
+    def featureBlendMode(self) -> QtGui.QPainter.CompositionMode: ...
+    def setFeatureBlendMode(self, blendMode: QtGui.QPainter.CompositionMode) -> None: ...
+    def aggregate(self, aggregate: Qgis.Aggregate, fieldOrExpression: typing.Optional[str], parameters: QgsAggregateCalculator.AggregateParameters = ..., context: typing.Optional['QgsExpressionContext'] = ..., fids: typing.Optional[typing.Any] = ..., feedback: typing.Optional['QgsFeedback'] = ...) -> typing.Tuple[typing.Any, typing.Optional[bool]]: ...
+    def minimumAndMaximumValue(self, index: int) -> typing.Tuple[typing.Any, typing.Any]: ...
+    def maximumValue(self, index: int) -> typing.Any: ...
+    def minimumValue(self, index: int) -> typing.Any: ...
+    def uniqueStringsMatching(self, index: int, substring: typing.Optional[str], limit: int = ..., feedback: typing.Optional['QgsFeedback'] = ...) -> list[str]: ...
+    def uniqueValues(self, fieldIndex: int, limit: int = ...) -> set[typing.Any]: ...
+    def editorWidgetSetup(self, index: int) -> 'QgsEditorWidgetSetup': ...
+    def setEditorWidgetSetup(self, index: int, setup: 'QgsEditorWidgetSetup') -> None: ...
+    def fieldConfigurationFlags(self, index: int) -> Qgis.FieldConfigurationFlags: ...
+    def setFieldConfigurationFlag(self, index: int, flag: Qgis.FieldConfigurationFlag, active: bool) -> None: ...
+    def setFieldConfigurationFlags(self, index: int, flags: typing.Union[Qgis.FieldConfigurationFlags, Qgis.FieldConfigurationFlag]) -> None: ...
+    def setConstraintExpression(self, index: int, expression: typing.Optional[str], description: typing.Optional[str] = ...) -> None: ...
+    def constraintDescription(self, index: int) -> str: ...
+    def constraintExpression(self, index: int) -> str: ...
+    def removeFieldConstraint(self, index: int, constraint: 'QgsFieldConstraints.Constraint') -> None: ...
+    def setFieldConstraint(self, index: int, constraint: 'QgsFieldConstraints.Constraint', strength: 'QgsFieldConstraints.ConstraintStrength' = ...) -> None: ...
+    def fieldConstraintsAndStrength(self, fieldIndex: int) -> dict['QgsFieldConstraints.Constraint', 'QgsFieldConstraints.ConstraintStrength']: ...
+    def fieldConstraints(self, fieldIndex: int) -> 'QgsFieldConstraints.Constraints': ...
+    def defaultValueDefinition(self, index: int) -> 'QgsDefaultValue': ...
+    def setDefaultValueDefinition(self, index: int, definition: 'QgsDefaultValue') -> None: ...
+    def defaultValue(self, index: int, feature: 'QgsFeature' = ..., context: typing.Optional['QgsExpressionContext'] = ...) -> typing.Any: ...
+    def updateFields(self) -> None: ...
+    @staticmethod
+    def drawVertexMarker(x: float, y: float, p: QtGui.QPainter, type: Qgis.VertexMarkerType, vertexSize: int) -> None: ...
+    def destroyEditCommand(self) -> None: ...
+    def endEditCommand(self) -> None: ...
+    def beginEditCommand(self, text: typing.Optional[str]) -> None: ...
+    def editBuffer(self) -> typing.Optional['QgsVectorLayerEditBuffer']: ...
+    def referencingRelations(self, idx: int) -> list['QgsRelation']: ...
+    def rollBack(self, deleteBuffer: bool = ...) -> bool: ...
+    def commitErrors(self) -> list[str]: ...
+    def commitChanges(self, stopEditing: bool = ...) -> bool: ...
+    def deleteFeatures(self, fids: typing.Any, context: typing.Optional['QgsVectorLayer.DeleteContext'] = ...) -> bool: ...
+    def deleteFeature(self, fid: int, context: typing.Optional['QgsVectorLayer.DeleteContext'] = ...) -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable['QgsFeature'], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def deleteAttributes(self, attrs: collections.abc.Iterable[int]) -> bool: ...
+    def deleteAttribute(self, attr: int) -> bool: ...
+    @deprecated("""""")
+    def setExcludeAttributesWfs(self, att: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @deprecated("""""")
+    def excludeAttributesWfs(self) -> set[str]: ...
+    @deprecated("""""")
+    def setExcludeAttributesWms(self, att: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @deprecated("""""")
+    def excludeAttributesWms(self) -> set[str]: ...
+    def setFieldMergePolicy(self, index: int, policy: Qgis.FieldDomainMergePolicy) -> None: ...
+    def setFieldDuplicatePolicy(self, index: int, policy: Qgis.FieldDuplicatePolicy) -> None: ...
+    def setFieldSplitPolicy(self, index: int, policy: Qgis.FieldDomainSplitPolicy) -> None: ...
+    def attributeAliases(self) -> dict[str, str]: ...
+    def attributeDisplayName(self, index: int) -> str: ...
+    def attributeAlias(self, index: int) -> str: ...
+    def renameAttribute(self, index: int, newName: typing.Optional[str]) -> bool: ...
+    def removeFieldAlias(self, index: int) -> None: ...
+    def setFieldAlias(self, index: int, aliasString: typing.Optional[str]) -> None: ...
+    def addAttribute(self, field: 'QgsField') -> bool: ...
+    def changeAttributeValues(self, fid: int, newValues: dict[int, typing.Any], oldValues: dict[int, typing.Any] = ..., skipDefaultValues: bool = ..., context: typing.Optional['QgsVectorLayerToolsContext'] = ...) -> bool: ...
+    def changeAttributeValue(self, fid: int, field: int, newValue: typing.Any, oldValue: typing.Any = ..., skipDefaultValues: bool = ..., context: typing.Optional['QgsVectorLayerToolsContext'] = ...) -> bool: ...
+    def changeGeometry(self, fid: int, geometry: 'QgsGeometry', skipDefaultValue: bool = ...) -> bool: ...
+    def supportsEditing(self) -> bool: ...
+    def setReadOnly(self, readonly: bool = ...) -> bool: ...
+    def primaryKeyAttributes(self) -> list[int]: ...
+    def attributeList(self) -> list[int]: ...
+    def fields(self) -> 'QgsFields': ...
+    def sourceExtent3D(self) -> 'QgsBox3D': ...
+    def extent3D(self) -> 'QgsBox3D': ...
+    def sourceExtent(self) -> 'QgsRectangle': ...
+    def extent(self) -> 'QgsRectangle': ...
+    def createMapRenderer(self, rendererContext: 'QgsRenderContext') -> typing.Optional['QgsMapLayerRenderer']: ...
+    def reload(self) -> None: ...
+    def isAuxiliaryField(self, index: int) -> typing.Tuple[bool, int]: ...
+    def isModified(self) -> bool: ...
+    def isSpatial(self) -> bool: ...
+    def isEditable(self) -> bool: ...
+    def setLabeling(self, labeling: typing.Optional['QgsAbstractVectorLayerLabeling']) -> None: ...
+    def labeling(self) -> typing.Optional['QgsAbstractVectorLayerLabeling']: ...
+    @typing.overload
+    def addTopologicalPoints(self, geom: 'QgsGeometry') -> int: ...
+    @typing.overload
+    @deprecated("""""")
+    def addTopologicalPoints(self, p: 'QgsPointXY') -> int: ...
+    @typing.overload
+    def addTopologicalPoints(self, p: 'QgsPoint') -> int: ...
+    @typing.overload
+    def addTopologicalPoints(self, ps: collections.abc.Iterable['QgsPoint']) -> int: ...
+    @typing.overload
+    @deprecated("""""")
+    def splitFeatures(self, splitLine: collections.abc.Iterable['QgsPointXY'], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitFeatures(self, splitLine: collections.abc.Iterable['QgsPoint'], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitFeatures(self, curve: typing.Optional['QgsCurve'], preserveCircular: bool = ..., topologicalEditing: bool = ...) -> typing.Tuple[Qgis.GeometryOperationResult, list['QgsPoint']]: ...
+    @typing.overload
+    @deprecated("""""")
+    def splitParts(self, splitLine: collections.abc.Iterable['QgsPointXY'], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitParts(self, splitLine: collections.abc.Iterable['QgsPoint'], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    def translateFeature(self, featureId: int, dx: float, dy: float) -> int: ...
+    def addCurvedPart(self, ring: typing.Optional['QgsCurve']) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    @deprecated("""""")
+    def addPartV2(self, ring: collections.abc.Iterable['QgsPointXY']) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def addPartV2(self, ring: collections.abc.Iterable['QgsPoint']) -> Qgis.GeometryOperationResult: ...
+    @deprecated("""""")
+    def addPart(self, ring: collections.abc.Iterable['QgsPointXY']) -> Qgis.GeometryOperationResult: ...
+    def addCurvedRing(self, ring: typing.Optional['QgsCurve']) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    @typing.overload
+    @deprecated("""""")
+    def addRing(self, ring: collections.abc.Iterable['QgsPointXY']) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    @typing.overload
+    def addRing(self, ring: collections.abc.Iterable['QgsPoint']) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    def deleteSelectedFeatures(self, context: typing.Optional['QgsVectorLayer.DeleteContext'] = ...) -> typing.Tuple[bool, typing.Optional[int]]: ...
+    def deleteVertex(self, featureId: int, vertex: int) -> Qgis.VectorEditResult: ...
+    def moveVertexV2(self, p: 'QgsPoint', atFeatureId: int, atVertex: int) -> bool: ...
+    def moveVertex(self, x: float, y: float, atFeatureId: int, atVertex: int) -> bool: ...
+    @typing.overload
+    def insertVertex(self, x: float, y: float, atFeatureId: int, beforeVertex: int) -> bool: ...
+    @typing.overload
+    def insertVertex(self, point: 'QgsPoint', atFeatureId: int, beforeVertex: int) -> bool: ...
+    def updateFeature(self, feature: 'QgsFeature', skipDefaultValues: bool = ...) -> bool: ...
+    def addFeature(self, feature: 'QgsFeature', flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def getGeometry(self, fid: int) -> 'QgsGeometry': ...
+    def getFeature(self, fid: int) -> 'QgsFeature': ...
+    @typing.overload
+    def getFeatures(self, request: 'QgsFeatureRequest' = ...) -> 'QgsFeatureIterator': ...
+    @typing.overload
+    def getFeatures(self, expression: typing.Optional[str]) -> 'QgsFeatureIterator': ...
+    @typing.overload
+    def getFeatures(self, fids: typing.Any) -> 'QgsFeatureIterator': ...
+    @typing.overload
+    def getFeatures(self, rectangle: 'QgsRectangle') -> 'QgsFeatureIterator': ...
+    def subsetString(self) -> str: ...
+    def setSubsetString(self, subset: typing.Optional[str]) -> bool: ...
+    def countSymbolFeatures(self, storeSymbolFids: bool = ...) -> typing.Optional['QgsVectorLayerFeatureCounter']: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def hasFeatures(self) -> Qgis.FeatureAvailability: ...
+    def symbolFeatureIds(self, legendKey: typing.Optional[str]) -> typing.Any: ...
+    @typing.overload
+    def featureCount(self, legendKey: typing.Optional[str]) -> int: ...
+    @typing.overload
+    def featureCount(self) -> int: ...
+    def readSld(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def writeSld(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], props: dict[str, typing.Any] = ...) -> bool: ...
+    @typing.overload
+    def writeSld(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: 'QgsSldExportContext') -> bool: ...
+    def writeStyle(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readStyle(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, layerNode: QtXml.QDomNode, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def auxiliaryLayer(self) -> typing.Optional['QgsAuxiliaryLayer']: ...
+    def setAuxiliaryLayer(self, layer: typing.Optional['QgsAuxiliaryLayer'] = ...) -> None: ...
+    def loadAuxiliaryLayer(self, storage: 'QgsAuxiliaryStorage', key: typing.Optional[str] = ...) -> bool: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def decodedSource(self, source: typing.Optional[str], provider: typing.Optional[str], context: 'QgsReadWriteContext') -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: 'QgsReadWriteContext') -> str: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, layer_node: QtXml.QDomNode, context: 'QgsReadWriteContext') -> bool: ...
+    def sourceName(self) -> str: ...
+    def sourceCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def geometryType(self) -> Qgis.GeometryType: ...
+    def featureRendererGenerators(self) -> list['QgsFeatureRendererGenerator']: ...
+    def removeFeatureRendererGenerator(self, id: typing.Optional[str]) -> None: ...
+    def addFeatureRendererGenerator(self, generator: typing.Optional['QgsFeatureRendererGenerator']) -> None: ...
+    def setRenderer(self, r: typing.Optional['QgsFeatureRenderer']) -> None: ...
+    def renderer(self) -> typing.Optional['QgsFeatureRenderer']: ...
+    def diagramLayerSettings(self) -> typing.Optional['QgsDiagramLayerSettings']: ...
+    def setDiagramLayerSettings(self, s: 'QgsDiagramLayerSettings') -> None: ...
+    def diagramRenderer(self) -> typing.Optional['QgsDiagramRenderer']: ...
+    def setDiagramRenderer(self, r: typing.Optional['QgsDiagramRenderer']) -> None: ...
+    def diagramsEnabled(self) -> bool: ...
+    def setLabelsEnabled(self, enabled: bool) -> None: ...
+    def labelsEnabled(self) -> bool: ...
+    def boundingBoxOfSelected(self) -> 'QgsRectangle': ...
+    def selectedFeatureIds(self) -> typing.Any: ...
+    def getSelectedFeatures(self, request: 'QgsFeatureRequest' = ...) -> 'QgsFeatureIterator': ...
+    def selectedFeatures(self) -> list['QgsFeature']: ...
+    def invertSelectionInRectangle(self, rect: 'QgsRectangle') -> None: ...
+    def selectAll(self) -> None: ...
+    def invertSelection(self) -> None: ...
+    def modifySelection(self, selectIds: typing.Any, deselectIds: typing.Any) -> None: ...
+    def selectByIds(self, ids: typing.Any, behavior: Qgis.SelectBehavior = ...) -> None: ...
+    def selectByExpression(self, expression: typing.Optional[str], behavior: Qgis.SelectBehavior = ..., context: typing.Optional['QgsExpressionContext'] = ...) -> None: ...
+    def selectByRect(self, rect: 'QgsRectangle', behavior: Qgis.SelectBehavior = ...) -> None: ...
+    def selectedFeatureCount(self) -> int: ...
+    def actions(self) -> typing.Optional['QgsActionManager']: ...
+    def updateExpressionField(self, index: int, exp: typing.Optional[str]) -> None: ...
+    def expressionField(self, index: int) -> str: ...
+    def removeExpressionField(self, index: int) -> None: ...
+    def addExpressionField(self, exp: typing.Optional[str], fld: 'QgsField') -> int: ...
+    def dependencies(self) -> set['QgsMapLayerDependency']: ...
+    def setDependencies(self, layers: collections.abc.Iterable['QgsMapLayerDependency']) -> bool: ...
+    def vectorJoins(self) -> list['QgsVectorLayerJoinInfo']: ...
+    def joinBuffer(self) -> typing.Optional['QgsVectorLayerJoinBuffer']: ...
+    def removeJoin(self, joinLayerId: typing.Optional[str]) -> bool: ...
+    def addJoin(self, joinInfo: 'QgsVectorLayerJoinInfo') -> bool: ...
+    def setCoordinateSystem(self) -> None: ...
+    def setProviderEncoding(self, encoding: typing.Optional[str]) -> None: ...
+    def createProfileGenerator(self, request: 'QgsProfileRequest') -> typing.Optional['QgsAbstractProfileGenerator']: ...
+    def profileSource(self) -> typing.Optional[QgsAbstractProfileSource]: ...
+    def elevationProperties(self) -> typing.Optional['QgsMapLayerElevationProperties']: ...
+    def temporalProperties(self) -> typing.Optional['QgsMapLayerTemporalProperties']: ...
+    def selectionProperties(self) -> typing.Optional['QgsMapLayerSelectionProperties']: ...
+    def dataProvider(self) -> typing.Optional['QgsVectorDataProvider']: ...
+    def hasMapTips(self) -> bool: ...
+    def displayExpression(self) -> str: ...
+    def setDisplayExpression(self, displayExpression: typing.Optional[str]) -> None: ...
+    def displayField(self) -> str: ...
+    def dataComment(self) -> str: ...
+    def vectorLayerTypeFlags(self) -> Qgis.VectorLayerTypeFlags: ...
+    def isSqlQuery(self) -> bool: ...
+    def capabilitiesString(self) -> str: ...
+    def storageType(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsVectorLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+    SelectBehavior: typing.Type[Qgis.SelectBehavior]
+    SetSelection: Qgis.SelectBehavior
+    AddToSelection: Qgis.SelectBehavior
+    IntersectSelection: Qgis.SelectBehavior
+    RemoveFromSelection: Qgis.SelectBehavior
+    EditResult: typing.Type[Qgis.VectorEditResult]
+    Success: Qgis.VectorEditResult
+    EmptyGeometry: Qgis.VectorEditResult
+    EditFailed: Qgis.VectorEditResult
+    FetchFeatureFailed: Qgis.VectorEditResult
+    InvalidLayer: Qgis.VectorEditResult
+    VertexMarkerType: typing.Type[Qgis.VertexMarkerType]
+    SemiTransparentCircle: Qgis.VertexMarkerType
+    Cross: Qgis.VertexMarkerType
+    NoMarker: Qgis.VertexMarkerType
+
+
+class QgsAuxiliaryLayer(QgsVectorLayer):
+
+    def __init__(self, pkField: typing.Optional[str], filename: typing.Optional[str], table: typing.Optional[str], vlayer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    @staticmethod
+    def propertyDefinitionFromField(field: 'QgsField') -> 'QgsPropertyDefinition': ...
+    @staticmethod
+    def nameFromProperty(def_: 'QgsPropertyDefinition', joined: bool = ...) -> str: ...
+    @typing.overload
+    @staticmethod
+    def createAuxiliaryField(definition: 'QgsPropertyDefinition') -> 'QgsField': ...
+    @typing.overload
+    @staticmethod
+    def createAuxiliaryField(field: 'QgsField') -> 'QgsField': ...
+    @staticmethod
+    def createProperty(property: typing.Union[QgsPalLayerSettings.Property, QgsDiagramLayerSettings.Property, QgsCallout.Property], vlayer: typing.Optional[QgsVectorLayer], overwriteExisting: bool = ...) -> int: ...
+    def propertyDefinitionFromIndex(self, index: int) -> 'QgsPropertyDefinition': ...
+    def propertyFromIndex(self, index: int) -> int: ...
+    def indexOfPropertyDefinition(self, definition: 'QgsPropertyDefinition') -> int: ...
+    def isHiddenProperty(self, index: int) -> bool: ...
+    def deleteAttribute(self, attr: int) -> bool: ...
+    def save(self) -> bool: ...
+    def auxiliaryFields(self) -> 'QgsFields': ...
+    def addAuxiliaryField(self, definition: 'QgsPropertyDefinition') -> bool: ...
+    def exists(self, definition: 'QgsPropertyDefinition') -> bool: ...
+    def joinInfo(self) -> 'QgsVectorLayerJoinInfo': ...
+    def clear(self) -> bool: ...
+    def toSpatialLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def clone(self, layer: typing.Optional[QgsVectorLayer]) -> typing.Optional['QgsAuxiliaryLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsAuxiliaryStorage(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, project: 'QgsProject', copy: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, filename: typing.Optional[str] = ..., copy: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAuxiliaryStorage') -> None: ...
+
+    @staticmethod
+    def exists(project: 'QgsProject') -> bool: ...
+    @staticmethod
+    def extension() -> str: ...
+    @staticmethod
+    def duplicateTable(uri: 'QgsDataSourceUri', newTable: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def deleteTable(uri: 'QgsDataSourceUri') -> bool: ...
+    def createAuxiliaryLayer(self, field: 'QgsField', layer: typing.Optional[QgsVectorLayer]) -> typing.Optional[QgsAuxiliaryLayer]: ...
+    def save(self) -> bool: ...
+    @typing.overload
+    def saveAs(self, filename: typing.Optional[str]) -> bool: ...
+    @typing.overload
+    def saveAs(self, project: 'QgsProject') -> bool: ...
+    def errorString(self) -> str: ...
+    def currentFileName(self) -> str: ...
+    def fileName(self) -> str: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsAbstractFeatureIterator(PyQt5.sip.wrapper):
+
+    class RequestToSourceCrsResult(int):
+        Success = ... # type: QgsAbstractFeatureIterator.RequestToSourceCrsResult
+        DistanceWithinMustBeCheckedManually = ... # type: QgsAbstractFeatureIterator.RequestToSourceCrsResult
+
+    class CompileStatus(int):
+        NoCompilation = ... # type: QgsAbstractFeatureIterator.CompileStatus
+        PartiallyCompiled = ... # type: QgsAbstractFeatureIterator.CompileStatus
+        Compiled = ... # type: QgsAbstractFeatureIterator.CompileStatus
+
+    @typing.overload
+    def __init__(self, request: 'QgsFeatureRequest') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractFeatureIterator') -> None: ...
+
+    def prepareSimplification(self, simplifyMethod: 'QgsSimplifyMethod') -> bool: ...
+    def deref(self) -> None: ...
+    def ref(self) -> None: ...
+    def updateRequestToSourceCrs(self, request: 'QgsFeatureRequest', transform: 'QgsCoordinateTransform') -> 'QgsAbstractFeatureIterator.RequestToSourceCrsResult': ...
+    def filterRectToSourceCrs(self, transform: 'QgsCoordinateTransform') -> 'QgsRectangle': ...
+    def geometryToDestinationCrs(self, feature: 'QgsFeature', transform: 'QgsCoordinateTransform') -> None: ...
+    def nextFeatureFilterFids(self, f: 'QgsFeature') -> bool: ...
+    def nextFeatureFilterExpression(self, f: 'QgsFeature') -> bool: ...
+    def fetchFeature(self, f: 'QgsFeature') -> bool: ...
+    def compileFailed(self) -> bool: ...
+    def isValid(self) -> bool: ...
+    def compileStatus(self) -> 'QgsAbstractFeatureIterator.CompileStatus': ...
+    def close(self) -> bool: ...
+    def rewind(self) -> bool: ...
+    def nextFeature(self, f: 'QgsFeature') -> bool: ...
+
+
+class QgsCachedFeatureIterator(QgsAbstractFeatureIterator):
+
+    def __init__(self, vlCache: typing.Optional['QgsVectorLayerCache'], featureRequest: 'QgsFeatureRequest') -> None: ...
+
+    def nextFeatureFilterFids(self, f: 'QgsFeature') -> bool: ...
+    def fetchFeature(self, f: 'QgsFeature') -> bool: ...
+    def close(self) -> bool: ...
+    def rewind(self) -> bool: ...
+
+
+class QgsCachedFeatureWriterIterator(QgsAbstractFeatureIterator):
+
+    @typing.overload
+    def __init__(self, vlCache: typing.Optional['QgsVectorLayerCache'], featureRequest: 'QgsFeatureRequest') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCachedFeatureWriterIterator') -> None: ...
+
+    def fetchFeature(self, f: 'QgsFeature') -> bool: ...
+    def close(self) -> bool: ...
+    def rewind(self) -> bool: ...
+
+
+class QgsAbstractCacheIndex(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractCacheIndex') -> None: ...
+
+    def getCacheIterator(self, featureIterator: 'QgsFeatureIterator', featureRequest: 'QgsFeatureRequest') -> bool: ...
+    def requestCompleted(self, featureRequest: 'QgsFeatureRequest', fids: typing.Any) -> None: ...
+    def flush(self) -> None: ...
+    def flushFeature(self, fid: int) -> None: ...
+
+
+class QgsCacheIndexFeatureId(QgsAbstractCacheIndex):
+
+    def __init__(self, a0: typing.Optional[typing.Union[QgsVectorLayerCache, QgsCacheIndexFeatureId]]) -> None: ...
+
+    def getCacheIterator(self, featureIterator: 'QgsFeatureIterator', featureRequest: 'QgsFeatureRequest') -> bool: ...
+    def requestCompleted(self, featureRequest: 'QgsFeatureRequest', fids: typing.Any) -> None: ...
+    def flush(self) -> None: ...
+    def flushFeature(self, fid: int) -> None: ...
+
+
+class QgsColorUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsColorUtils') -> None: ...
+
+    @staticmethod
+    def saveIccProfile(colorSpace: QtGui.QColorSpace, iccProfileFilePath: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def iccProfile(iccProfileFilePath: typing.Optional[str]) -> typing.Tuple[QtGui.QColorSpace, str]: ...
+    @staticmethod
+    def colorFromString(string: typing.Optional[str]) -> QtGui.QColor: ...
+    @staticmethod
+    def colorToString(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> str: ...
+    @staticmethod
+    def readXml(element: QtXml.QDomElement, identifier: typing.Optional[str], context: 'QgsReadWriteContext') -> QtGui.QColor: ...
+    @staticmethod
+    def writeXml(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], identifier: typing.Optional[str], document: QtXml.QDomDocument, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+
+
+class QgsConditionalLayerStyles(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    def rulesNeedGeometry(self) -> bool: ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, node: QtXml.QDomNode, context: 'QgsReadWriteContext') -> bool: ...
+    def fieldStyles(self, fieldName: typing.Optional[str]) -> list['QgsConditionalStyle']: ...
+    def setFieldStyles(self, fieldName: typing.Optional[str], styles: collections.abc.Iterable['QgsConditionalStyle']) -> None: ...
+    def constraintFailureStyles(self, strength: 'QgsFieldConstraints.ConstraintStrength') -> 'QgsConditionalStyle': ...
+    def setRowStyles(self, styles: collections.abc.Iterable['QgsConditionalStyle']) -> None: ...
+    def rowStyles(self) -> list['QgsConditionalStyle']: ...
+
+
+class QgsCoordinateFormatter(PyQt5.sip.wrapper):
+
+    class FormatFlag(int):
+        FlagDegreesUseStringSuffix = ... # type: QgsCoordinateFormatter.FormatFlag
+        FlagDegreesPadMinutesSeconds = ... # type: QgsCoordinateFormatter.FormatFlag
+
+    class Format(int):
+        FormatPair = ... # type: QgsCoordinateFormatter.Format
+        FormatDegreesMinutesSeconds = ... # type: QgsCoordinateFormatter.Format
+        FormatDegreesMinutes = ... # type: QgsCoordinateFormatter.Format
+        FormatDecimalDegrees = ... # type: QgsCoordinateFormatter.Format
+
+    class FormatFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __xor__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __ior__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __or__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __iand__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __and__(self, f: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag']) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __invert__(self) -> 'QgsCoordinateFormatter.FormatFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCoordinateFormatter') -> None: ...
+
+    @staticmethod
+    def separator() -> str: ...
+    @staticmethod
+    def asPair(x: float, y: float, precision: int = ..., order: Qgis.CoordinateOrder = ...) -> str: ...
+    @staticmethod
+    def format(point: 'QgsPointXY', format: 'QgsCoordinateFormatter.Format', precision: int = ..., flags: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag'] = ..., order: Qgis.CoordinateOrder = ...) -> str: ...
+    @staticmethod
+    def formatY(y: float, format: 'QgsCoordinateFormatter.Format', precision: int = ..., flags: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag'] = ...) -> str: ...
+    @staticmethod
+    def formatX(x: float, format: 'QgsCoordinateFormatter.Format', precision: int = ..., flags: typing.Union['QgsCoordinateFormatter.FormatFlags', 'QgsCoordinateFormatter.FormatFlag'] = ...) -> str: ...
+
+
+class QgsDataSourceUri(PyQt5.sip.wrapper):
+
+    class SslMode(int):
+        SslPrefer = ... # type: QgsDataSourceUri.SslMode
+        SslDisable = ... # type: QgsDataSourceUri.SslMode
+        SslAllow = ... # type: QgsDataSourceUri.SslMode
+        SslRequire = ... # type: QgsDataSourceUri.SslMode
+        SslVerifyCa = ... # type: QgsDataSourceUri.SslMode
+        SslVerifyFull = ... # type: QgsDataSourceUri.SslMode
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, uri: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsDataSourceUri') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def setHttpHeaders(self, headers: 'QgsHttpHeaders') -> None: ...
+    def httpHeader(self, key: typing.Optional[str]) -> str: ...
+    def httpHeaders(self) -> 'QgsHttpHeaders': ...
+    def parameterKeys(self) -> set[str]: ...
+    def setGeometryColumn(self, geometryColumn: typing.Optional[str]) -> None: ...
+    def setTable(self, table: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def encodeSslMode(sslMode: 'QgsDataSourceUri.SslMode') -> str: ...
+    @staticmethod
+    def decodeSslMode(sslMode: typing.Optional[str]) -> 'QgsDataSourceUri.SslMode': ...
+    def setSrid(self, srid: typing.Optional[str]) -> None: ...
+    def srid(self) -> str: ...
+    def setWkbType(self, type: Qgis.WkbType) -> None: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def setKeyColumn(self, column: typing.Optional[str]) -> None: ...
+    def keyColumn(self) -> str: ...
+    def service(self) -> str: ...
+    def setService(self, service: typing.Optional[str]) -> None: ...
+    def sslMode(self) -> 'QgsDataSourceUri.SslMode': ...
+    def setSslMode(self, mode: 'QgsDataSourceUri.SslMode') -> None: ...
+    def password(self) -> str: ...
+    def setDriver(self, driver: typing.Optional[str]) -> None: ...
+    def driver(self) -> str: ...
+    def port(self) -> str: ...
+    def setPort(self, port: typing.Optional[str]) -> None: ...
+    def database(self) -> str: ...
+    def host(self) -> str: ...
+    def setHost(self, host: typing.Optional[str]) -> None: ...
+    def setSql(self, sql: typing.Optional[str]) -> None: ...
+    def setSchema(self, schema: typing.Optional[str]) -> None: ...
+    def clearSchema(self) -> None: ...
+    def selectAtIdDisabled(self) -> bool: ...
+    def disableSelectAtId(self, flag: bool) -> None: ...
+    def useEstimatedMetadata(self) -> bool: ...
+    def setUseEstimatedMetadata(self, flag: bool) -> None: ...
+    def geometryColumn(self) -> str: ...
+    def sql(self) -> str: ...
+    def table(self) -> str: ...
+    def schema(self) -> str: ...
+    def username(self) -> str: ...
+    def authConfigId(self) -> str: ...
+    @staticmethod
+    def removePassword(aUri: typing.Optional[str], hide: bool = ...) -> str: ...
+    def setPassword(self, password: typing.Optional[str]) -> None: ...
+    def setUsername(self, username: typing.Optional[str]) -> None: ...
+    def setAuthConfigId(self, authcfg: typing.Optional[str]) -> None: ...
+    def setDataSource(self, aSchema: typing.Optional[str], aTable: typing.Optional[str], aGeometryColumn: typing.Optional[str], aSql: typing.Optional[str] = ..., aKeyColumn: typing.Optional[str] = ...) -> None: ...
+    def setDatabase(self, database: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def setConnection(self, aHost: typing.Optional[str], aPort: typing.Optional[str], aDatabase: typing.Optional[str], aUsername: typing.Optional[str], aPassword: typing.Optional[str], sslmode: 'QgsDataSourceUri.SslMode' = ..., authConfigId: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def setConnection(self, aService: typing.Optional[str], aDatabase: typing.Optional[str], aUsername: typing.Optional[str], aPassword: typing.Optional[str], sslmode: 'QgsDataSourceUri.SslMode' = ..., authConfigId: typing.Optional[str] = ...) -> None: ...
+    def hasParam(self, key: typing.Optional[str]) -> bool: ...
+    def params(self, key: typing.Optional[str]) -> list[str]: ...
+    def param(self, key: typing.Optional[str]) -> str: ...
+    def removeParam(self, key: typing.Optional[str]) -> int: ...
+    def setParamList(self, key: typing.Optional[str], value: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def setParam(self, key: typing.Optional[str], value: typing.Optional[str]) -> None: ...
+    def quotedTablename(self) -> str: ...
+    def setEncodedUri(self, uri: typing.Optional[str]) -> None: ...
+    def encodedUri(self) -> QtCore.QByteArray: ...
+    def uri(self, expandAuthConfig: bool = ...) -> str: ...
+    def connectionInfo(self, expandAuthConfig: bool = ...) -> str: ...
+
+
+class QgsDiagramLayerSettings(PyQt5.sip.wrapper):
+
+    class DiagramType(int):
+        Single = ... # type: QgsDiagramLayerSettings.DiagramType
+        Stacked = ... # type: QgsDiagramLayerSettings.DiagramType
+
+    class Property(int):
+        BackgroundColor = ... # type: QgsDiagramLayerSettings.Property
+        StrokeColor = ... # type: QgsDiagramLayerSettings.Property
+        StrokeWidth = ... # type: QgsDiagramLayerSettings.Property
+        PositionX = ... # type: QgsDiagramLayerSettings.Property
+        PositionY = ... # type: QgsDiagramLayerSettings.Property
+        Distance = ... # type: QgsDiagramLayerSettings.Property
+        Priority = ... # type: QgsDiagramLayerSettings.Property
+        ZIndex = ... # type: QgsDiagramLayerSettings.Property
+        IsObstacle = ... # type: QgsDiagramLayerSettings.Property
+        Show = ... # type: QgsDiagramLayerSettings.Property
+        AlwaysShow = ... # type: QgsDiagramLayerSettings.Property
+        StartAngle = ... # type: QgsDiagramLayerSettings.Property
+
+    class LinePlacementFlag(int):
+        OnLine = ... # type: QgsDiagramLayerSettings.LinePlacementFlag
+        AboveLine = ... # type: QgsDiagramLayerSettings.LinePlacementFlag
+        BelowLine = ... # type: QgsDiagramLayerSettings.LinePlacementFlag
+        MapOrientation = ... # type: QgsDiagramLayerSettings.LinePlacementFlag
+
+    class Placement(int):
+        AroundPoint = ... # type: QgsDiagramLayerSettings.Placement
+        OverPoint = ... # type: QgsDiagramLayerSettings.Placement
+        Line = ... # type: QgsDiagramLayerSettings.Placement
+        Curved = ... # type: QgsDiagramLayerSettings.Placement
+        Horizontal = ... # type: QgsDiagramLayerSettings.Placement
+        Free = ... # type: QgsDiagramLayerSettings.Placement
+
+    class LinePlacementFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __xor__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __ior__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __or__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __iand__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __and__(self, f: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __invert__(self) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, rh: 'QgsDiagramLayerSettings') -> None: ...
+
+    def setDataDefinedProperties(self, collection: 'QgsPropertyCollection') -> None: ...
+    def dataDefinedProperties(self) -> 'QgsPropertyCollection': ...
+    def referencedFields(self, context: 'QgsExpressionContext' = ...) -> set[str]: ...
+    def prepare(self, context: 'QgsExpressionContext' = ...) -> bool: ...
+    def writeXml(self, layerElem: QtXml.QDomElement, doc: QtXml.QDomDocument) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement) -> None: ...
+    def setShowAllDiagrams(self, showAllDiagrams: bool) -> None: ...
+    def showAllDiagrams(self) -> bool: ...
+    def setCoordinateTransform(self, transform: 'QgsCoordinateTransform') -> None: ...
+    def coordinateTransform(self) -> 'QgsCoordinateTransform': ...
+    def setRenderer(self, diagramRenderer: typing.Optional['QgsDiagramRenderer']) -> None: ...
+    def renderer(self) -> typing.Optional['QgsDiagramRenderer']: ...
+    def setDistance(self, distance: float) -> None: ...
+    def distance(self) -> float: ...
+    def setIsObstacle(self, isObstacle: bool) -> None: ...
+    def isObstacle(self) -> bool: ...
+    def setZIndex(self, index: float) -> None: ...
+    def zIndex(self) -> float: ...
+    def setPriority(self, value: int) -> None: ...
+    def priority(self) -> int: ...
+    def setLinePlacementFlags(self, flags: typing.Union['QgsDiagramLayerSettings.LinePlacementFlags', 'QgsDiagramLayerSettings.LinePlacementFlag']) -> None: ...
+    def linePlacementFlags(self) -> 'QgsDiagramLayerSettings.LinePlacementFlags': ...
+    def setPlacement(self, value: 'QgsDiagramLayerSettings.Placement') -> None: ...
+    def placement(self) -> 'QgsDiagramLayerSettings.Placement': ...
+    @staticmethod
+    def propertyDefinitions() -> dict[int, 'QgsPropertyDefinition']: ...
+    BackgroundColor: QgsDiagramLayerSettings.Property
+    StrokeColor: QgsDiagramLayerSettings.Property
+    StrokeWidth: QgsDiagramLayerSettings.Property
+    PositionX: QgsDiagramLayerSettings.Property
+    PositionY: QgsDiagramLayerSettings.Property
+    Distance: QgsDiagramLayerSettings.Property
+    Priority: QgsDiagramLayerSettings.Property
+    ZIndex: QgsDiagramLayerSettings.Property
+    IsObstacle: QgsDiagramLayerSettings.Property
+    Show: QgsDiagramLayerSettings.Property
+    AlwaysShow: QgsDiagramLayerSettings.Property
+    StartAngle: QgsDiagramLayerSettings.Property
+
+
+class QgsDiagramRenderer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsDiagramRenderer') -> None: ...
+
+    def _writeXml(self, rendererElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def _readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    @staticmethod
+    def dpiPaintDevice(a0: typing.Optional[QtGui.QPainter]) -> int: ...
+    def convertSizeToMapUnits(self, size: QtCore.QSizeF, context: 'QgsRenderContext') -> None: ...
+    def diagramSize(self, feature: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def setAttributeLegend(self, enabled: bool) -> None: ...
+    def attributeLegend(self) -> bool: ...
+    def legendItems(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def writeXml(self, layerElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    @typing.overload
+    def diagramSettings(self) -> list[QgsDiagramSettings]: ...
+    @typing.overload
+    def diagramSettings(self, feature: 'QgsFeature', c: 'QgsRenderContext', s: QgsDiagramSettings) -> bool: ...
+    def diagram(self) -> typing.Optional['QgsDiagram']: ...
+    def setDiagram(self, d: typing.Optional['QgsDiagram']) -> None: ...
+    def renderDiagram(self, feature: 'QgsFeature', c: 'QgsRenderContext', pos: typing.Union[QtCore.QPointF, QtCore.QPoint], properties: 'QgsPropertyCollection' = ...) -> None: ...
+    def referencedFields(self, context: 'QgsExpressionContext' = ...) -> set[str]: ...
+    def diagramAttributes(self) -> list[str]: ...
+    def rendererName(self) -> str: ...
+    def sizeMapUnits(self, feature: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def clone(self) -> typing.Optional['QgsDiagramRenderer']: ...
+
+
+class QgsSingleCategoryDiagramRenderer(QgsDiagramRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSingleCategoryDiagramRenderer') -> None: ...
+
+    def diagramSize(self, a0: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def legendItems(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def writeXml(self, layerElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    @typing.overload
+    def diagramSettings(self) -> list[QgsDiagramSettings]: ...
+    @typing.overload
+    def diagramSettings(self, feature: 'QgsFeature', c: 'QgsRenderContext', s: QgsDiagramSettings) -> bool: ...
+    def setDiagramSettings(self, s: QgsDiagramSettings) -> None: ...
+    def diagramAttributes(self) -> list[str]: ...
+    def rendererName(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsSingleCategoryDiagramRenderer']: ...
+
+
+class QgsLinearlyInterpolatedDiagramRenderer(QgsDiagramRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsLinearlyInterpolatedDiagramRenderer') -> None: ...
+
+    def diagramSize(self, a0: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def dataDefinedSizeLegend(self) -> typing.Optional[QgsDataDefinedSizeLegend]: ...
+    def setDataDefinedSizeLegend(self, settings: typing.Optional[QgsDataDefinedSizeLegend]) -> None: ...
+    def legendItems(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def writeXml(self, layerElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def setClassificationAttributeIsExpression(self, isExpression: bool) -> None: ...
+    def classificationAttributeIsExpression(self) -> bool: ...
+    def setClassificationAttributeExpression(self, expression: typing.Optional[str]) -> None: ...
+    def classificationAttributeExpression(self) -> str: ...
+    def setClassificationField(self, field: typing.Optional[str]) -> None: ...
+    def classificationField(self) -> str: ...
+    def upperSize(self) -> QtCore.QSizeF: ...
+    def setUpperSize(self, s: QtCore.QSizeF) -> None: ...
+    def lowerSize(self) -> QtCore.QSizeF: ...
+    def setLowerSize(self, s: QtCore.QSizeF) -> None: ...
+    def upperValue(self) -> float: ...
+    def setUpperValue(self, val: float) -> None: ...
+    def lowerValue(self) -> float: ...
+    def setLowerValue(self, val: float) -> None: ...
+    def rendererName(self) -> str: ...
+    def referencedFields(self, context: 'QgsExpressionContext' = ...) -> set[str]: ...
+    def diagramAttributes(self) -> list[str]: ...
+    def setDiagramSettings(self, s: QgsDiagramSettings) -> None: ...
+    @typing.overload
+    def diagramSettings(self) -> list[QgsDiagramSettings]: ...
+    @typing.overload
+    def diagramSettings(self, feature: 'QgsFeature', c: 'QgsRenderContext', s: QgsDiagramSettings) -> bool: ...
+    def clone(self) -> typing.Optional['QgsLinearlyInterpolatedDiagramRenderer']: ...
+
+
+class QgsStackedDiagramRenderer(QgsDiagramRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsStackedDiagramRenderer') -> None: ...
+
+    def diagramSize(self, a0: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def rendererCount(self) -> int: ...
+    def renderer(self, index: int) -> typing.Optional[QgsDiagramRenderer]: ...
+    def addRenderer(self, renderer: typing.Optional[QgsDiagramRenderer]) -> None: ...
+    def renderers(self, sortByDiagramMode: bool = ...) -> list[QgsDiagramRenderer]: ...
+    def legendItems(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def _writeXmlSubRenderers(self, rendererElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def _readXmlSubRenderers(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def writeXml(self, layerElem: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def rendererName(self) -> str: ...
+    def diagramAttributes(self) -> list[str]: ...
+    def setDiagramSettings(self, s: QgsDiagramSettings) -> None: ...
+    @typing.overload
+    def diagramSettings(self) -> list[QgsDiagramSettings]: ...
+    @typing.overload
+    def diagramSettings(self, feature: 'QgsFeature', c: 'QgsRenderContext', s: QgsDiagramSettings) -> bool: ...
+    def renderDiagram(self, feature: 'QgsFeature', c: 'QgsRenderContext', pos: typing.Union[QtCore.QPointF, QtCore.QPoint], properties: 'QgsPropertyCollection' = ...) -> None: ...
+    def sizeMapUnits(self, feature: 'QgsFeature', c: 'QgsRenderContext') -> QtCore.QSizeF: ...
+    def clone(self) -> typing.Optional['QgsStackedDiagramRenderer']: ...
+
+
+class QgsElevationUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsElevationUtils') -> None: ...
+
+    @staticmethod
+    def enableElevationForLayer(layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    @staticmethod
+    def canEnableElevationForLayer(layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    @staticmethod
+    def significantZValuesForLayers(layers: collections.abc.Iterable[QgsMapLayer]) -> list[float]: ...
+    @staticmethod
+    def significantZValuesForProject(project: typing.Optional['QgsProject']) -> list[float]: ...
+    @staticmethod
+    def calculateZRangeForProject(project: typing.Optional['QgsProject']) -> 'QgsDoubleRange': ...
+
+
+class QgsExpressionContextScope(PyQt5.sip.wrapper):
+
+    class StaticVariable(PyQt5.sip.wrapper):
+
+        description = ... # type: typing.Optional[str]
+        isStatic = ... # type: bool
+        name = ... # type: typing.Optional[str]
+        readOnly = ... # type: bool
+        value = ... # type: typing.Any
+
+        @typing.overload
+        def __init__(self, name: typing.Optional[str] = ..., value: typing.Any = ..., readOnly: bool = ..., isStatic: bool = ..., description: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsExpressionContextScope.StaticVariable') -> None: ...
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsExpressionContextScope') -> None: ...
+
+    def layerStores(self) -> list['QgsMapLayerStore']: ...
+    def addLayerStore(self, store: typing.Optional['QgsMapLayerStore']) -> None: ...
+    def removeHiddenVariable(self, hiddenVariable: typing.Optional[str]) -> None: ...
+    def addHiddenVariable(self, hiddenVariable: typing.Optional[str]) -> None: ...
+    def setHiddenVariables(self, hiddenVariables: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def hiddenVariables(self) -> list[str]: ...
+    def writeXml(self, element: QtXml.QDomElement, document: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def setFields(self, fields: 'QgsFields') -> None: ...
+    def removeGeometry(self) -> None: ...
+    def setGeometry(self, geometry: 'QgsGeometry') -> None: ...
+    def geometry(self) -> 'QgsGeometry': ...
+    def hasGeometry(self) -> bool: ...
+    def removeFeature(self) -> None: ...
+    def setFeature(self, feature: 'QgsFeature') -> None: ...
+    def feature(self) -> 'QgsFeature': ...
+    def hasFeature(self) -> bool: ...
+    def addFunction(self, name: typing.Optional[str], function: typing.Optional[QgsScopedExpressionFunction]) -> None: ...
+    def functionNames(self) -> list[str]: ...
+    def function(self, name: typing.Optional[str]) -> typing.Optional[QgsExpressionFunction]: ...
+    def hasFunction(self, name: typing.Optional[str]) -> bool: ...
+    def variableCount(self) -> int: ...
+    def description(self, name: typing.Optional[str]) -> str: ...
+    def isStatic(self, name: typing.Optional[str]) -> bool: ...
+    def isReadOnly(self, name: typing.Optional[str]) -> bool: ...
+    def filteredVariableNames(self) -> list[str]: ...
+    def variableNames(self) -> list[str]: ...
+    def variable(self, name: typing.Optional[str]) -> typing.Any: ...
+    def hasVariable(self, name: typing.Optional[str]) -> bool: ...
+    def removeVariable(self, name: typing.Optional[str]) -> bool: ...
+    def addVariable(self, variable: 'QgsExpressionContextScope.StaticVariable') -> None: ...
+    def setVariable(self, name: typing.Optional[str], value: typing.Any, isStatic: bool = ...) -> None: ...
+    def name(self) -> str: ...
+
+
+class QgsExpressionContext(PyQt5.sip.wrapper):
+
+    EXPR_CLUSTER_COLOR = ... # type: typing.Optional[str]
+    EXPR_CLUSTER_SIZE = ... # type: typing.Optional[str]
+    EXPR_FIELDS = ... # type: typing.Optional[str]
+    EXPR_GEOMETRY_PART_COUNT = ... # type: typing.Optional[str]
+    EXPR_GEOMETRY_PART_NUM = ... # type: typing.Optional[str]
+    EXPR_GEOMETRY_POINT_COUNT = ... # type: typing.Optional[str]
+    EXPR_GEOMETRY_POINT_NUM = ... # type: typing.Optional[str]
+    EXPR_GEOMETRY_RING_NUM = ... # type: typing.Optional[str]
+    EXPR_ORIGINAL_VALUE = ... # type: typing.Optional[str]
+    EXPR_SYMBOL_ANGLE = ... # type: typing.Optional[str]
+    EXPR_SYMBOL_COLOR = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, scopes: collections.abc.Iterable[QgsExpressionContextScope]) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsExpressionContext') -> None: ...
+
+    def uniqueHash(self, variables: collections.abc.Iterable[typing.Optional[str]] = ...) -> typing.Tuple[str, bool]: ...
+    def feedback(self) -> typing.Optional['QgsFeedback']: ...
+    def setFeedback(self, feedback: typing.Optional['QgsFeedback']) -> None: ...
+    def loadedLayerStore(self) -> typing.Optional['QgsMapLayerStore']: ...
+    def setLoadedLayerStore(self, store: typing.Optional['QgsMapLayerStore']) -> None: ...
+    def layerStores(self) -> list['QgsMapLayerStore']: ...
+    def clearCachedValues(self) -> None: ...
+    def cachedValue(self, key: typing.Optional[str]) -> typing.Any: ...
+    def hasCachedValue(self, key: typing.Optional[str]) -> bool: ...
+    def setCachedValue(self, key: typing.Optional[str], value: typing.Any) -> None: ...
+    def setOriginalValueVariable(self, value: typing.Any) -> None: ...
+    def fields(self) -> 'QgsFields': ...
+    def setFields(self, fields: 'QgsFields') -> None: ...
+    def geometry(self) -> 'QgsGeometry': ...
+    def hasGeometry(self) -> bool: ...
+    def setGeometry(self, geometry: 'QgsGeometry') -> None: ...
+    def feature(self) -> 'QgsFeature': ...
+    def hasFeature(self) -> bool: ...
+    def setFeature(self, feature: 'QgsFeature') -> None: ...
+    def popScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def appendScopes(self, scopes: collections.abc.Iterable[QgsExpressionContextScope]) -> None: ...
+    def appendScope(self, scope: typing.Optional[QgsExpressionContextScope]) -> None: ...
+    def scopeCount(self) -> int: ...
+    def function(self, name: typing.Optional[str]) -> typing.Optional[QgsExpressionFunction]: ...
+    def functionNames(self) -> list[str]: ...
+    def hasFunction(self, name: typing.Optional[str]) -> bool: ...
+    def description(self, name: typing.Optional[str]) -> str: ...
+    def isReadOnly(self, name: typing.Optional[str]) -> bool: ...
+    def filteredVariableNames(self) -> list[str]: ...
+    def variableNames(self) -> list[str]: ...
+    @typing.overload
+    def indexOfScope(self, scope: typing.Optional[QgsExpressionContextScope]) -> int: ...
+    @typing.overload
+    def indexOfScope(self, scopeName: typing.Optional[str]) -> int: ...
+    def scopes(self) -> list[QgsExpressionContextScope]: ...
+    def lastScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def scope(self, index: int) -> typing.Optional[QgsExpressionContextScope]: ...
+    def activeScopeForVariable(self, name: typing.Optional[str]) -> typing.Optional[QgsExpressionContextScope]: ...
+    def setHighlightedFunctions(self, names: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def isHighlightedFunction(self, name: typing.Optional[str]) -> bool: ...
+    def setHighlightedVariables(self, variableNames: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def highlightedVariables(self) -> list[str]: ...
+    def isHighlightedVariable(self, name: typing.Optional[str]) -> bool: ...
+    def variablesToMap(self) -> dict[str, typing.Any]: ...
+    def variable(self, name: typing.Optional[str]) -> typing.Any: ...
+    def hasVariable(self, name: typing.Optional[str]) -> bool: ...
+
+
+class QgsFeature(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, id: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fields: 'QgsFields', id: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, rhs: 'QgsFeature') -> None: ...
+
+    def approximateMemoryUsage(self) -> int: ...
+    def fieldNameIndex(self, fieldName: typing.Optional[str]) -> int: ...
+    def setEmbeddedSymbol(self, symbol: typing.Optional['QgsSymbol']) -> None: ...
+    def embeddedSymbol(self) -> typing.Optional['QgsSymbol']: ...
+    def isUnsetValue(self, fieldIdx: int) -> bool: ...
+    @typing.overload
+    def attribute(self, name: typing.Optional[str]) -> typing.Any: ...
+    @typing.overload
+    def attribute(self, fieldIdx: int) -> typing.Any: ...
+    def fields(self) -> 'QgsFields': ...
+    def setFields(self, fields: 'QgsFields', initAttributes: bool = ...) -> None: ...
+    def clearGeometry(self) -> None: ...
+    def setGeometry(self, geometry: typing.Optional[typing.Union[QgsGeometry, QgsAbstractGeometry]]) -> None: ...
+    def geometry(self) -> 'QgsGeometry': ...
+    def hasGeometry(self) -> bool: ...
+    def setValid(self, validity: bool) -> None: ...
+    def isValid(self) -> bool: ...
+    @typing.overload
+    def deleteAttribute(self, field: int) -> None: ...
+    @typing.overload
+    def deleteAttribute(self, name: typing.Optional[str]) -> bool: ...
+    def padAttributes(self, count: int) -> None: ...
+    def resizeAttributes(self, fieldCount: int) -> None: ...
+    def initAttributes(self, fieldCount: int) -> None: ...
+    @typing.overload
+    def setAttribute(self, field: int, attr: typing.Optional[typing.Union[bool, int, float, str, typing.Any]]) -> bool: ...
+    @typing.overload
+    def setAttribute(self, name: typing.Optional[str], value: typing.Optional[typing.Union[bool, int, float, str, typing.Any]]) -> None: ...
+    def setAttributes(self, attrs: typing.Any) -> None: ...
+    def attributeCount(self) -> int: ...
+    def attributeMap(self) -> dict[str, typing.Optional[object]]: ...
+    def attributes(self) -> typing.Any: ...
+    def setId(self, id: int) -> None: ...
+    def id(self) -> int: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __hash__(self) -> int: ...
+    @typing.overload
+    def __delitem__(self, key: int) -> None: ...
+    @typing.overload
+    def __delitem__(self, name: typing.Optional[str]) -> None: ...
+    def __setitem__(self, key: typing.Optional[typing.Union[int, str]], value: typing.Optional[typing.Union[bool, int, float, str, typing.Any]]) -> None: ...
+    @typing.overload
+    def __getitem__(self, key: int) -> typing.Any: ...
+    @typing.overload
+    def __getitem__(self, name: typing.Optional[str]) -> typing.Any: ...
+    def __iter__(self) -> typing.Any: ...
+
+
+class QgsFeaturePickerModelBase(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        IdentifierValue = ... # type: QgsFeaturePickerModelBase.CustomRole
+        IdentifierValues = ... # type: QgsFeaturePickerModelBase.CustomRole
+        Value = ... # type: QgsFeaturePickerModelBase.CustomRole
+        Feature = ... # type: QgsFeaturePickerModelBase.CustomRole
+        FeatureId = ... # type: QgsFeaturePickerModelBase.CustomRole
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setExtraIdentifierValueUnguarded(self, identifierValue: typing.Any) -> None: ...
+    def requestToReloadCurrentFeature(self, request: 'QgsFeatureRequest') -> None: ...
+    def setExtraIdentifierValue(self, extraIdentifierValue: typing.Any) -> None: ...
+    def extraIdentifierValue(self) -> typing.Any: ...
+    fetchLimitChanged: typing.ClassVar[QtCore.pyqtSignal]
+    fetchGeometryChanged: typing.ClassVar[QtCore.pyqtSignal]
+    allowNullChanged: typing.ClassVar[QtCore.pyqtSignal]
+    endUpdate: typing.ClassVar[QtCore.pyqtSignal]
+    beginUpdate: typing.ClassVar[QtCore.pyqtSignal]
+    extraValueDoesNotExistChanged: typing.ClassVar[QtCore.pyqtSignal]
+    extraIdentifierValueIndexChanged: typing.ClassVar[QtCore.pyqtSignal]
+    extraIdentifierValueChanged: typing.ClassVar[QtCore.pyqtSignal]
+    filterJobCompleted: typing.ClassVar[QtCore.pyqtSignal]
+    isLoadingChanged: typing.ClassVar[QtCore.pyqtSignal]
+    parentFormFeatureChanged: typing.ClassVar[QtCore.pyqtSignal]
+    formFeatureChanged: typing.ClassVar[QtCore.pyqtSignal]
+    filterExpressionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    filterValueChanged: typing.ClassVar[QtCore.pyqtSignal]
+    displayExpressionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    sourceLayerChanged: typing.ClassVar[QtCore.pyqtSignal]
+    currentFeatureChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setFetchLimit(self, fetchLimit: int) -> None: ...
+    def fetchLimit(self) -> int: ...
+    def setFetchGeometry(self, fetchGeometry: bool) -> None: ...
+    def fetchGeometry(self) -> bool: ...
+    def setAllowNull(self, allowNull: bool) -> None: ...
+    def allowNull(self) -> bool: ...
+    def extraValueDoesNotExist(self) -> bool: ...
+    def extraIdentifierValueIndex(self) -> int: ...
+    def setExtraIdentifierValueToNull(self) -> None: ...
+    def isLoading(self) -> bool: ...
+    def setParentFormFeature(self, feature: QgsFeature) -> None: ...
+    def parentFormFeature(self) -> QgsFeature: ...
+    def setFormFeature(self, feature: QgsFeature) -> None: ...
+    def formFeature(self) -> QgsFeature: ...
+    def setFilterExpression(self, filterExpression: typing.Optional[str]) -> None: ...
+    def filterExpression(self) -> str: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def setFilterValue(self, filterValue: typing.Optional[str]) -> None: ...
+    def filterValue(self) -> str: ...
+    def setDisplayExpression(self, displayExpression: typing.Optional[str]) -> None: ...
+    def displayExpression(self) -> str: ...
+    def setSourceLayer(self, sourceLayer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def sourceLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    Role: typing.Type[QgsFeaturePickerModelBase.CustomRole]
+    IdentifierValueRole: QgsFeaturePickerModelBase.CustomRole
+    IdentifierValuesRole: QgsFeaturePickerModelBase.CustomRole
+    ValueRole: QgsFeaturePickerModelBase.CustomRole
+    FeatureRole: QgsFeaturePickerModelBase.CustomRole
+    FeatureIdRole: QgsFeaturePickerModelBase.CustomRole
+
+
+class QgsFeaturePickerModel(QgsFeaturePickerModelBase):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    featureChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def feature(self) -> QgsFeature: ...
+    def setFeature(self, fid: int) -> None: ...
+    def setExtraIdentifierValueToNull(self) -> None: ...
+
+
+class QgsFeatureFilterModel(QgsFeaturePickerModelBase):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    extraIdentifierValuesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    identifierFieldsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setExtraIdentifierValues(self, extraIdentifierValues: collections.abc.Iterable[typing.Any]) -> None: ...
+    def extraIdentifierValues(self) -> list[typing.Any]: ...
+    def setExtraIdentifierValueToNull(self) -> None: ...
+    def setIdentifierFields(self, identifierFields: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def identifierFields(self) -> list[str]: ...
+    def identifierField(self) -> str: ...
+
+
+class QgsFeatureIterator(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, iter: typing.Optional[QgsAbstractFeatureIterator]) -> None: ...
+    @typing.overload
+    def __init__(self, fi: 'QgsFeatureIterator') -> None: ...
+
+    def compileFailed(self) -> bool: ...
+    def compileStatus(self) -> QgsAbstractFeatureIterator.CompileStatus: ...
+    def isClosed(self) -> bool: ...
+    def isValid(self) -> bool: ...
+    def close(self) -> bool: ...
+    def rewind(self) -> bool: ...
+    def nextFeature(self, f: QgsFeature) -> bool: ...
+    def __next__(self) -> QgsFeature: ...
+    def __iter__(self) -> 'QgsFeatureIterator': ...
+
+
+class QgsFeatureRequest(PyQt5.sip.wrapper):
+
+    class OrderByClause(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, expression: typing.Optional[str], ascending: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, expression: typing.Optional[str], ascending: bool, nullsfirst: bool) -> None: ...
+        @typing.overload
+        def __init__(self, expression: 'QgsExpression', ascending: bool = ...) -> None: ...
+        @typing.overload
+        def __init__(self, expression: 'QgsExpression', ascending: bool, nullsfirst: bool) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsFeatureRequest.OrderByClause') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def dump(self) -> str: ...
+        def setNullsFirst(self, nullsFirst: bool) -> None: ...
+        def nullsFirst(self) -> bool: ...
+        def setAscending(self, ascending: bool) -> None: ...
+        def ascending(self) -> bool: ...
+        def prepare(self, context: typing.Optional[QgsExpressionContext]) -> bool: ...
+        def expression(self) -> 'QgsExpression': ...
+
+    class OrderBy(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, other: collections.abc.Iterable['QgsFeatureRequest.OrderByClause']) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsFeatureRequest.OrderBy') -> None: ...
+
+        def dump(self) -> str: ...
+        def usedAttributeIndices(self, fields: 'QgsFields') -> typing.Any: ...
+        def usedAttributes(self) -> set[str]: ...
+        def load(self, elem: QtXml.QDomElement) -> None: ...
+        def save(self, elem: QtXml.QDomElement) -> None: ...
+        def list(self) -> list['QgsFeatureRequest.OrderByClause']: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    ALL_ATTRIBUTES = ... # type: typing.Optional[str]
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, fid: int) -> None: ...
+    @typing.overload
+    def __init__(self, fids: typing.Any) -> None: ...
+    @typing.overload
+    def __init__(self, rectangle: 'QgsRectangle') -> None: ...
+    @typing.overload
+    def __init__(self, expr: 'QgsExpression', context: QgsExpressionContext = ...) -> None: ...
+    @typing.overload
+    def __init__(self, rh: 'QgsFeatureRequest') -> None: ...
+
+    def feedback(self) -> typing.Optional['QgsFeedback']: ...
+    def setFeedback(self, feedback: typing.Optional['QgsFeedback']) -> None: ...
+    def setRequestMayBeNested(self, requestMayBeNested: bool) -> 'QgsFeatureRequest': ...
+    def requestMayBeNested(self) -> bool: ...
+    def setTimeout(self, timeout: int) -> 'QgsFeatureRequest': ...
+    def timeout(self) -> int: ...
+    @deprecated("""""")
+    def setConnectionTimeout(self, connectionTimeout: int) -> 'QgsFeatureRequest': ...
+    @deprecated("""""")
+    def connectionTimeout(self) -> int: ...
+    def acceptFeature(self, feature: QgsFeature) -> bool: ...
+    def setTransformErrorCallback(self, a0: typing.Optional[typing.Callable[..., None]]) -> 'QgsFeatureRequest': ...
+    def setDestinationCrs(self, crs: 'QgsCoordinateReferenceSystem', context: 'QgsCoordinateTransformContext') -> 'QgsFeatureRequest': ...
+    def setCoordinateTransform(self, transform: 'QgsCoordinateTransform') -> 'QgsFeatureRequest': ...
+    def calculateTransform(self, sourceCrs: 'QgsCoordinateReferenceSystem') -> 'QgsCoordinateTransform': ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def coordinateTransform(self) -> 'QgsCoordinateTransform': ...
+    def simplifyMethod(self) -> 'QgsSimplifyMethod': ...
+    def setSimplifyMethod(self, simplifyMethod: 'QgsSimplifyMethod') -> 'QgsFeatureRequest': ...
+    def subsetOfAttributes(self) -> list[int]: ...
+    def setNoAttributes(self) -> 'QgsFeatureRequest': ...
+    @typing.overload
+    def setSubsetOfAttributes(self, attrs: collections.abc.Iterable[int]) -> 'QgsFeatureRequest': ...
+    @typing.overload
+    def setSubsetOfAttributes(self, attrNames: collections.abc.Iterable[typing.Optional[str]], fields: 'QgsFields') -> 'QgsFeatureRequest': ...
+    def flags(self) -> Qgis.FeatureRequestFlags: ...
+    def setFlags(self, flags: typing.Union[Qgis.FeatureRequestFlags, Qgis.FeatureRequestFlag]) -> 'QgsFeatureRequest': ...
+    def limit(self) -> int: ...
+    def setLimit(self, limit: int) -> 'QgsFeatureRequest': ...
+    def setOrderBy(self, orderBy: 'QgsFeatureRequest.OrderBy') -> 'QgsFeatureRequest': ...
+    def orderBy(self) -> 'QgsFeatureRequest.OrderBy': ...
+    @typing.overload
+    def addOrderBy(self, expression: typing.Optional[str], ascending: bool = ...) -> 'QgsFeatureRequest': ...
+    @typing.overload
+    def addOrderBy(self, expression: typing.Optional[str], ascending: bool, nullsfirst: bool) -> 'QgsFeatureRequest': ...
+    def disableFilter(self) -> 'QgsFeatureRequest': ...
+    def setExpressionContext(self, context: QgsExpressionContext) -> 'QgsFeatureRequest': ...
+    def expressionContext(self) -> typing.Optional[QgsExpressionContext]: ...
+    def combineFilterExpression(self, expression: typing.Optional[str]) -> 'QgsFeatureRequest': ...
+    def filterExpression(self) -> typing.Optional['QgsExpression']: ...
+    def setFilterExpression(self, expression: typing.Optional[str]) -> 'QgsFeatureRequest': ...
+    def setInvalidGeometryCallback(self, a0: typing.Optional[typing.Callable[..., None]]) -> 'QgsFeatureRequest': ...
+    def invalidGeometryCheck(self) -> Qgis.InvalidGeometryCheck: ...
+    def setInvalidGeometryCheck(self, check: Qgis.InvalidGeometryCheck) -> 'QgsFeatureRequest': ...
+    def filterFids(self) -> typing.Any: ...
+    def setFilterFids(self, fids: typing.Any) -> 'QgsFeatureRequest': ...
+    def filterFid(self) -> int: ...
+    def setFilterFid(self, fid: int) -> 'QgsFeatureRequest': ...
+    def distanceWithin(self) -> float: ...
+    def referenceGeometry(self) -> 'QgsGeometry': ...
+    def setDistanceWithin(self, geometry: 'QgsGeometry', distance: float) -> 'QgsFeatureRequest': ...
+    def filterRect(self) -> 'QgsRectangle': ...
+    def setFilterRect(self, rectangle: 'QgsRectangle') -> 'QgsFeatureRequest': ...
+    def spatialFilterType(self) -> Qgis.SpatialFilterType: ...
+    def filterType(self) -> Qgis.FeatureRequestFilterType: ...
+    def compare(self, other: 'QgsFeatureRequest') -> bool: ...
+    Flag: typing.Type[Qgis.FeatureRequestFlag]
+    NoFlags: Qgis.FeatureRequestFlag
+    NoGeometry: Qgis.FeatureRequestFlag
+    SubsetOfAttributes: Qgis.FeatureRequestFlag
+    ExactIntersect: Qgis.FeatureRequestFlag
+    IgnoreStaticNodesDuringExpressionCompilation: Qgis.FeatureRequestFlag
+    EmbeddedSymbols: Qgis.FeatureRequestFlag
+    Flags: typing.Type[Qgis.FeatureRequestFlags]
+    FilterType: typing.Type[Qgis.FeatureRequestFilterType]
+    FilterNone: Qgis.FeatureRequestFilterType
+    FilterFid: Qgis.FeatureRequestFilterType
+    FilterExpression: Qgis.FeatureRequestFilterType
+    FilterFids: Qgis.FeatureRequestFilterType
+    InvalidGeometryCheck: typing.Type[Qgis.InvalidGeometryCheck]
+    GeometryNoCheck: Qgis.InvalidGeometryCheck
+    GeometrySkipInvalid: Qgis.InvalidGeometryCheck
+    GeometryAbortOnInvalid: Qgis.InvalidGeometryCheck
+
+
+class QgsAbstractFeatureSource(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractFeatureSource') -> None: ...
+
+    def iteratorClosed(self, it: typing.Optional[QgsAbstractFeatureIterator]) -> None: ...
+    def iteratorOpened(self, it: typing.Optional[QgsAbstractFeatureIterator]) -> None: ...
+    def getFeatures(self, request: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+
+
+class QgsFeatureStore(QgsFeatureSink):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, fields: 'QgsFields', crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFeatureStore') -> None: ...
+
+    def params(self) -> dict[str, typing.Any]: ...
+    def setParams(self, parameters: dict[typing.Optional[str], typing.Any]) -> None: ...
+    def features(self) -> list[QgsFeature]: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def count(self) -> int: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setFields(self, fields: 'QgsFields') -> None: ...
+    def fields(self) -> 'QgsFields': ...
+
+
+class QgsFieldModel(QtCore.QAbstractItemModel):
+
+    class CustomRole(int):
+        FieldName = ... # type: QgsFieldModel.CustomRole
+        FieldIndex = ... # type: QgsFieldModel.CustomRole
+        Expression = ... # type: QgsFieldModel.CustomRole
+        IsExpression = ... # type: QgsFieldModel.CustomRole
+        ExpressionValidity = ... # type: QgsFieldModel.CustomRole
+        FieldType = ... # type: QgsFieldModel.CustomRole
+        FieldOrigin = ... # type: QgsFieldModel.CustomRole
+        IsEmpty = ... # type: QgsFieldModel.CustomRole
+        EditorWidgetType = ... # type: QgsFieldModel.CustomRole
+        JoinedFieldIsEditable = ... # type: QgsFieldModel.CustomRole
+        FieldIsWidgetEditable = ... # type: QgsFieldModel.CustomRole
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def updateModel(self) -> None: ...
+    def setLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def fields(self) -> 'QgsFields': ...
+    def setFields(self, fields: 'QgsFields') -> None: ...
+    @staticmethod
+    def fieldToolTipExtended(field: QgsField, layer: typing.Optional[QgsVectorLayer]) -> str: ...
+    @staticmethod
+    def fieldToolTip(field: QgsField) -> str: ...
+    def data(self, index: QtCore.QModelIndex, role: int) -> typing.Any: ...
+    def columnCount(self, parent: QtCore.QModelIndex) -> int: ...
+    def rowCount(self, parent: QtCore.QModelIndex = ...) -> int: ...
+    def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex: ...
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = ...) -> QtCore.QModelIndex: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def removeExpression(self) -> None: ...
+    def setExpression(self, expression: typing.Optional[str]) -> None: ...
+    def isField(self, expression: typing.Optional[str]) -> bool: ...
+    def allowEmptyFieldName(self) -> bool: ...
+    def setAllowEmptyFieldName(self, allowEmpty: bool) -> None: ...
+    def allowExpression(self) -> bool: ...
+    def setAllowExpression(self, allowExpression: bool) -> None: ...
+    def indexFromName(self, fieldName: typing.Optional[str]) -> QtCore.QModelIndex: ...
+    FieldRoles: typing.Type[QgsFieldModel.CustomRole]
+    FieldNameRole: QgsFieldModel.CustomRole
+    FieldIndexRole: QgsFieldModel.CustomRole
+    ExpressionRole: QgsFieldModel.CustomRole
+    IsExpressionRole: QgsFieldModel.CustomRole
+    ExpressionValidityRole: QgsFieldModel.CustomRole
+    FieldTypeRole: QgsFieldModel.CustomRole
+    FieldOriginRole: QgsFieldModel.CustomRole
+    IsEmptyRole: QgsFieldModel.CustomRole
+    EditorWidgetType: QgsFieldModel.CustomRole
+    JoinedFieldIsEditable: QgsFieldModel.CustomRole
+    FieldIsWidgetEditable: QgsFieldModel.CustomRole
+
+
+class QgsFieldProxyModel(QtCore.QSortFilterProxyModel):
+
+    class Filter(int):
+        String = ... # type: QgsFieldProxyModel.Filter
+        Int = ... # type: QgsFieldProxyModel.Filter
+        LongLong = ... # type: QgsFieldProxyModel.Filter
+        Double = ... # type: QgsFieldProxyModel.Filter
+        Numeric = ... # type: QgsFieldProxyModel.Filter
+        Date = ... # type: QgsFieldProxyModel.Filter
+        Time = ... # type: QgsFieldProxyModel.Filter
+        HideReadOnly = ... # type: QgsFieldProxyModel.Filter
+        DateTime = ... # type: QgsFieldProxyModel.Filter
+        Binary = ... # type: QgsFieldProxyModel.Filter
+        Boolean = ... # type: QgsFieldProxyModel.Filter
+        OriginProvider = ... # type: QgsFieldProxyModel.Filter
+        AllTypes = ... # type: QgsFieldProxyModel.Filter
+
+    class Filters(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __xor__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __ior__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __or__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __iand__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __and__(self, f: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> 'QgsFieldProxyModel.Filters': ...
+        def __invert__(self) -> 'QgsFieldProxyModel.Filters': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def filters(self) -> 'QgsFieldProxyModel.Filters': ...
+    def setFilters(self, filters: typing.Union['QgsFieldProxyModel.Filters', 'QgsFieldProxyModel.Filter']) -> typing.Optional['QgsFieldProxyModel']: ...
+    def sourceFieldModel(self) -> typing.Optional[QgsFieldModel]: ...
+
+
+class QgsGeometryOptions(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    geometryPrecisionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    removeDuplicateNodesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    geometryChecksChanged: typing.ClassVar[QtCore.pyqtSignal]
+    checkConfigurationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def readXml(self, node: QtXml.QDomNode) -> None: ...
+    def writeXml(self, node: QtXml.QDomNode) -> None: ...
+    def setCheckConfiguration(self, checkId: typing.Optional[str], checkConfiguration: dict[str, typing.Any]) -> None: ...
+    def checkConfiguration(self, checkId: typing.Optional[str]) -> dict[str, typing.Any]: ...
+    def setGeometryChecks(self, geometryChecks: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def geometryChecks(self) -> list[str]: ...
+    def apply(self, geometry: 'QgsGeometry') -> None: ...
+    def isActive(self) -> bool: ...
+    def setGeometryPrecision(self, value: float) -> None: ...
+    def geometryPrecision(self) -> float: ...
+    def setRemoveDuplicateNodes(self, value: bool) -> None: ...
+    def removeDuplicateNodes(self) -> bool: ...
+
+
+class QgsGroupLayer(QgsMapLayer):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsGroupLayer.LayerOptions') -> None: ...
+
+    def __init__(self, name: typing.Optional[str], options: 'QgsGroupLayer.LayerOptions') -> None: ...
+
+    def prepareLayersForRemovalFromGroup(self) -> None: ...
+    def setPaintEffect(self, effect: typing.Optional['QgsPaintEffect']) -> None: ...
+    def paintEffect(self) -> typing.Optional['QgsPaintEffect']: ...
+    def childLayers(self) -> list[QgsMapLayer]: ...
+    def setChildLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def resolveReferences(self, project: typing.Optional['QgsProject']) -> None: ...
+    def htmlMetadata(self) -> str: ...
+    def dataProvider(self) -> typing.Optional['QgsDataProvider']: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], a3: 'QgsReadWriteContext', categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> bool: ...
+    def readXml(self, layerNode: QtXml.QDomNode, context: 'QgsReadWriteContext') -> bool: ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def extent(self) -> 'QgsRectangle': ...
+    def createMapRenderer(self, rendererContext: 'QgsRenderContext') -> typing.Optional['QgsMapLayerRenderer']: ...
+    def clone(self) -> typing.Optional['QgsGroupLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsHistogram(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsHistogram') -> None: ...
+
+    def counts(self, bins: int) -> list[int]: ...
+    def binEdges(self, bins: int) -> list[float]: ...
+    def optimalNumberBins(self) -> int: ...
+    def optimalBinWidth(self) -> float: ...
+    @typing.overload
+    def setValues(self, values: collections.abc.Iterable[float]) -> None: ...
+    @typing.overload
+    def setValues(self, layer: typing.Optional[QgsVectorLayer], fieldOrExpression: typing.Optional[str], feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+
+
+class QgsIconUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsIconUtils') -> None: ...
+
+    @staticmethod
+    def iconForLayerType(type: Qgis.LayerType) -> QtGui.QIcon: ...
+    @staticmethod
+    def iconForLayer(layer: typing.Optional[QgsMapLayer]) -> QtGui.QIcon: ...
+    @staticmethod
+    def iconTiledScene() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPointCloud() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconVectorTile() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconMesh() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconDefaultLayer() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconRaster() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconTable() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconGeometryCollection() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPolygon() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconLine() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconPoint() -> QtGui.QIcon: ...
+    @staticmethod
+    def iconForGeometryType(typeGroup: Qgis.GeometryType) -> QtGui.QIcon: ...
+    @staticmethod
+    def iconForWkbType(type: Qgis.WkbType) -> QtGui.QIcon: ...
+
+
+class QgsJsonExporter(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, vectorLayer: typing.Optional[QgsVectorLayer] = ..., precision: int = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsJsonExporter') -> None: ...
+
+    def setDestinationCrs(self, destinationCrs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def exportFeatures(self, features: collections.abc.Iterable[QgsFeature], indent: int = ...) -> str: ...
+    def exportFeature(self, feature: QgsFeature, extraProperties: dict[str, typing.Any] = ..., id: typing.Any = ..., indent: int = ...) -> str: ...
+    def useFieldFormatters(self) -> bool: ...
+    def setUseFieldFormatters(self, useFieldFormatters: bool) -> None: ...
+    def excludedAttributes(self) -> list[int]: ...
+    def setExcludedAttributes(self, attributes: collections.abc.Iterable[int]) -> None: ...
+    def attributes(self) -> list[int]: ...
+    def setAttributes(self, attributes: collections.abc.Iterable[int]) -> None: ...
+    def setTransformGeometries(self, activate: bool) -> None: ...
+    def sourceCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setSourceCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def vectorLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setVectorLayer(self, vectorLayer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def attributeDisplayName(self) -> bool: ...
+    def setAttributeDisplayName(self, displayName: bool) -> None: ...
+    def includeRelated(self) -> bool: ...
+    def setIncludeRelated(self, includeRelated: bool) -> None: ...
+    def includeAttributes(self) -> bool: ...
+    def setIncludeAttributes(self, includeAttributes: bool) -> None: ...
+    def includeGeometry(self) -> bool: ...
+    def setIncludeGeometry(self, includeGeometry: bool) -> None: ...
+    def precision(self) -> int: ...
+    def setPrecision(self, precision: int) -> None: ...
+
+
+class QgsLayerDefinition(PyQt5.sip.wrapper):
+
+    class DependencySorter(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, doc: QtXml.QDomDocument) -> None: ...
+        @typing.overload
+        def __init__(self, fileName: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsLayerDefinition.DependencySorter') -> None: ...
+
+        def isLayerDependent(self, layerId: typing.Optional[str]) -> bool: ...
+        def hasMissingDependency(self) -> bool: ...
+        def hasCycle(self) -> bool: ...
+        def sortedLayerIds(self) -> list[str]: ...
+        def sortedLayerNodes(self) -> list[QtXml.QDomNode]: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerDefinition') -> None: ...
+
+    @typing.overload
+    @staticmethod
+    def loadLayerDefinitionLayers(document: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> list[QgsMapLayer]: ...
+    @typing.overload
+    @staticmethod
+    def loadLayerDefinitionLayers(qlrfile: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    @staticmethod
+    def exportLayerDefinitionLayers(layers: collections.abc.Iterable[QgsMapLayer], context: 'QgsReadWriteContext') -> QtXml.QDomDocument: ...
+    @typing.overload
+    @staticmethod
+    def exportLayerDefinition(path: typing.Optional[str], selectedTreeNodes: collections.abc.Iterable['QgsLayerTreeNode']) -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    @staticmethod
+    def exportLayerDefinition(path: typing.Optional[str], selectedTreeNodes: collections.abc.Iterable['QgsLayerTreeNode'], pathType: Qgis.FilePathType) -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    @staticmethod
+    def exportLayerDefinition(doc: QtXml.QDomDocument, selectedTreeNodes: collections.abc.Iterable['QgsLayerTreeNode'], context: 'QgsReadWriteContext') -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    @staticmethod
+    def loadLayerDefinition(path: typing.Optional[str], project: typing.Optional['QgsProject'], rootGroup: typing.Optional['QgsLayerTreeGroup'], insertMethod: Qgis.LayerTreeInsertionMethod = ..., insertPoint: typing.Optional['QgsLayerTreeRegistryBridge.InsertionPoint'] = ...) -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    @staticmethod
+    def loadLayerDefinition(doc: QtXml.QDomDocument, project: typing.Optional['QgsProject'], rootGroup: typing.Optional['QgsLayerTreeGroup'], context: 'QgsReadWriteContext', insertMethod: Qgis.LayerTreeInsertionMethod = ..., insertPoint: typing.Optional['QgsLayerTreeRegistryBridge.InsertionPoint'] = ...) -> typing.Tuple[bool, str]: ...
+
+
+class QgsLayerNotesUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsLayerNotesUtils') -> None: ...
+
+    @staticmethod
+    def removeNotes(layer: typing.Optional[QgsMapLayer]) -> None: ...
+    @staticmethod
+    def layerHasNotes(layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    @staticmethod
+    def setLayerNotes(layer: typing.Optional[QgsMapLayer], notes: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def layerNotes(layer: typing.Optional[QgsMapLayer]) -> str: ...
+
+
+class QgsMapLayerLegend(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    itemsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def defaultPointCloudLegend(layer: typing.Optional['QgsPointCloudLayer']) -> typing.Optional['QgsMapLayerLegend']: ...
+    @staticmethod
+    def defaultMeshLegend(ml: typing.Optional['QgsMeshLayer']) -> typing.Optional['QgsMapLayerLegend']: ...
+    @staticmethod
+    def defaultRasterLegend(rl: typing.Optional['QgsRasterLayer']) -> typing.Optional['QgsMapLayerLegend']: ...
+    @staticmethod
+    def defaultVectorLegend(vl: typing.Optional[QgsVectorLayer]) -> typing.Optional['QgsMapLayerLegend']: ...
+    def createLayerTreeModelLegendNodes(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def writeXml(self, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+
+
+class QgsDefaultVectorLayerLegend(QgsMapLayerLegend):
+
+    def __init__(self, vl: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    def writeXml(self, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> QtXml.QDomElement: ...
+    def readXml(self, elem: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def createLayerTreeModelLegendNodes(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+    def setTextOnSymbolContent(self, content: dict[typing.Optional[str], typing.Optional[str]]) -> None: ...
+    def textOnSymbolContent(self) -> dict[str, str]: ...
+    def setTextOnSymbolTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textOnSymbolTextFormat(self) -> 'QgsTextFormat': ...
+    def setShowLabelLegend(self, enabled: bool) -> None: ...
+    def showLabelLegend(self) -> bool: ...
+    def setTextOnSymbolEnabled(self, enabled: bool) -> None: ...
+    def textOnSymbolEnabled(self) -> bool: ...
+
+
+class QgsDefaultRasterLayerLegend(QgsMapLayerLegend):
+
+    def __init__(self, rl: typing.Optional['QgsRasterLayer']) -> None: ...
+
+    def createLayerTreeModelLegendNodes(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+
+
+class QgsDefaultMeshLayerLegend(QgsMapLayerLegend):
+
+    def __init__(self, ml: typing.Optional['QgsMeshLayer']) -> None: ...
+
+    def createLayerTreeModelLegendNodes(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+
+
+class QgsDefaultPointCloudLayerLegend(QgsMapLayerLegend):
+
+    def __init__(self, layer: typing.Optional['QgsPointCloudLayer']) -> None: ...
+
+    def createLayerTreeModelLegendNodes(self, nodeLayer: typing.Optional['QgsLayerTreeLayer']) -> list['QgsLayerTreeModelLegendNode']: ...
+
+
+class QgsMapLayerProxyModel(QtCore.QSortFilterProxyModel):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def setFilterString(self, filter: typing.Optional[str]) -> None: ...
+    def lessThan(self, left: QtCore.QModelIndex, right: QtCore.QModelIndex) -> bool: ...
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool: ...
+    def acceptsLayer(self, layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    def filterString(self) -> str: ...
+    def excludedProviders(self) -> list[str]: ...
+    def setExcludedProviders(self, providers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def exceptedLayerIds(self) -> list[str]: ...
+    def setExceptedLayerIds(self, ids: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def exceptedLayerList(self) -> list[QgsMapLayer]: ...
+    def setExceptedLayerList(self, exceptList: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def layerAllowlist(self) -> list[QgsMapLayer]: ...
+    @deprecated("""""")
+    def layerWhitelist(self) -> list[QgsMapLayer]: ...
+    def setLayerAllowlist(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    @deprecated("""""")
+    def setLayerWhitelist(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    @staticmethod
+    def layerMatchesFilters(layer: typing.Optional[QgsMapLayer], filters: typing.Union[Qgis.LayerFilters, Qgis.LayerFilter]) -> bool: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def filters(self) -> Qgis.LayerFilters: ...
+    @typing.overload
+    def setFilters(self, filters: typing.Union[Qgis.LayerFilters, Qgis.LayerFilter]) -> typing.Optional['QgsMapLayerProxyModel']: ...
+    @typing.overload
+    @deprecated("""""")
+    def setFilters(self, filters: int) -> None: ...
+    def sourceLayerModel(self) -> typing.Optional[QgsMapLayerModel]: ...
+    Filter: typing.Type[Qgis.LayerFilter]
+    RasterLayer: Qgis.LayerFilter
+    NoGeometry: Qgis.LayerFilter
+    PointLayer: Qgis.LayerFilter
+    LineLayer: Qgis.LayerFilter
+    PolygonLayer: Qgis.LayerFilter
+    HasGeometry: Qgis.LayerFilter
+    VectorLayer: Qgis.LayerFilter
+    PluginLayer: Qgis.LayerFilter
+    WritableLayer: Qgis.LayerFilter
+    MeshLayer: Qgis.LayerFilter
+    VectorTileLayer: Qgis.LayerFilter
+    PointCloudLayer: Qgis.LayerFilter
+    AnnotationLayer: Qgis.LayerFilter
+    TiledSceneLayer: Qgis.LayerFilter
+    All: Qgis.LayerFilter
+    SpatialLayer: Qgis.LayerFilter
+
+
+class QgsMapLayerRenderer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layerID: typing.Optional[str], context: typing.Optional['QgsRenderContext'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerRenderer') -> None: ...
+
+    def appendRenderedItemDetails(self, details: typing.Optional['QgsRenderedItemDetails']) -> None: ...
+    def takeRenderedItemDetails(self) -> list['QgsRenderedItemDetails']: ...
+    def isReadyToCompose(self) -> bool: ...
+    def renderContext(self) -> typing.Optional['QgsRenderContext']: ...
+    def layerId(self) -> str: ...
+    def errors(self) -> list[str]: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def flags(self) -> Qgis.MapLayerRendererFlags: ...
+    def forceRasterRender(self) -> bool: ...
+    def render(self) -> bool: ...
+
+
+class QgsServerMetadataUrlProperties(PyQt5.sip.wrapper):
+
+    class MetadataUrl(PyQt5.sip.wrapper):
+
+        format = ... # type: typing.Optional[str]
+        type = ... # type: typing.Optional[str]
+        url = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, url: typing.Optional[str] = ..., type: typing.Optional[str] = ..., format: typing.Optional[str] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsServerMetadataUrlProperties.MetadataUrl') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsServerMetadataUrlProperties') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+    def addMetadataUrl(self, metaUrl: 'QgsServerMetadataUrlProperties.MetadataUrl') -> None: ...
+    def setMetadataUrls(self, metaUrls: collections.abc.Iterable['QgsServerMetadataUrlProperties.MetadataUrl']) -> None: ...
+    def metadataUrls(self) -> list['QgsServerMetadataUrlProperties.MetadataUrl']: ...
+
+
+class QgsServerWmsDimensionProperties(PyQt5.sip.wrapper):
+
+    class PredefinedWmsDimensionName(int):
+        TIME = ... # type: QgsServerWmsDimensionProperties.PredefinedWmsDimensionName
+        DATE = ... # type: QgsServerWmsDimensionProperties.PredefinedWmsDimensionName
+        ELEVATION = ... # type: QgsServerWmsDimensionProperties.PredefinedWmsDimensionName
+
+    class WmsDimensionInfo(PyQt5.sip.wrapper):
+
+        class DefaultDisplay(int):
+            AllValues = ... # type: QgsServerWmsDimensionProperties.WmsDimensionInfo.DefaultDisplay
+            MinValue = ... # type: QgsServerWmsDimensionProperties.WmsDimensionInfo.DefaultDisplay
+            MaxValue = ... # type: QgsServerWmsDimensionProperties.WmsDimensionInfo.DefaultDisplay
+            ReferenceValue = ... # type: QgsServerWmsDimensionProperties.WmsDimensionInfo.DefaultDisplay
+
+        defaultDisplayType = ... # type: int
+        endFieldName = ... # type: typing.Optional[str]
+        fieldName = ... # type: typing.Optional[str]
+        name = ... # type: typing.Optional[str]
+        referenceValue = ... # type: typing.Any
+        unitSymbol = ... # type: typing.Optional[str]
+        units = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, dimName: typing.Optional[str], dimFieldName: typing.Optional[str], dimEndFieldName: typing.Optional[str] = ..., dimUnits: typing.Optional[str] = ..., dimUnitSymbol: typing.Optional[str] = ..., dimDefaultDisplayType: int = ..., dimReferenceValue: typing.Any = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsServerWmsDimensionProperties.WmsDimensionInfo') -> None: ...
+
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsServerWmsDimensionProperties') -> None: ...
+
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+    def wmsDimensions(self) -> list['QgsServerWmsDimensionProperties.WmsDimensionInfo']: ...
+    def setWmsDimensions(self, dimensions: collections.abc.Iterable['QgsServerWmsDimensionProperties.WmsDimensionInfo']) -> None: ...
+    def removeWmsDimension(self, wmsDimName: typing.Optional[str]) -> bool: ...
+    def addWmsDimension(self, wmsDimInfo: 'QgsServerWmsDimensionProperties.WmsDimensionInfo') -> bool: ...
+    @staticmethod
+    def wmsDimensionDefaultDisplayLabels() -> dict[int, str]: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsMapLayerServerProperties(QgsServerMetadataUrlProperties, QgsServerWmsDimensionProperties):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsMapLayer] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerServerProperties') -> None: ...
+
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+    def legendUrlFormat(self) -> str: ...
+    def setLegendUrlFormat(self, legendUrlFormat: typing.Optional[str]) -> None: ...
+    def legendUrl(self) -> str: ...
+    def setLegendUrl(self, legendUrl: typing.Optional[str]) -> None: ...
+    def attributionUrl(self) -> str: ...
+    def setAttributionUrl(self, url: typing.Optional[str]) -> None: ...
+    def attribution(self) -> str: ...
+    def setAttribution(self, attrib: typing.Optional[str]) -> None: ...
+    def dataUrlFormat(self) -> str: ...
+    def setDataUrlFormat(self, dataUrlFormat: typing.Optional[str]) -> None: ...
+    def dataUrl(self) -> str: ...
+    def setDataUrl(self, dataUrl: typing.Optional[str]) -> None: ...
+    def keywordList(self) -> str: ...
+    def setKeywordList(self, keywords: typing.Optional[str]) -> None: ...
+    def abstract(self) -> str: ...
+    def setAbstract(self, abstract: typing.Optional[str]) -> None: ...
+    def wfsTitle(self) -> str: ...
+    def title(self) -> str: ...
+    def setWfsTitle(self, title: typing.Optional[str]) -> None: ...
+    def setTitle(self, title: typing.Optional[str]) -> None: ...
+    def shortName(self) -> str: ...
+    def setShortName(self, name: typing.Optional[str]) -> None: ...
+    def reset(self) -> None: ...
+    def readXml(self, layer_node: QtXml.QDomNode) -> None: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, document: QtXml.QDomDocument) -> None: ...
+    def copyTo(self, properties: typing.Optional['QgsMapLayerServerProperties']) -> None: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsVectorLayerServerProperties(QgsMapLayerServerProperties):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorLayerServerProperties') -> None: ...
+
+
+class QgsMapLayerStore(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    layerWasAdded: typing.ClassVar[QtCore.pyqtSignal]
+    layersAdded: typing.ClassVar[QtCore.pyqtSignal]
+    allLayersRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layerRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layersRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layerWillBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    layersWillBeRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    def transferLayersFromStore(self, other: typing.Optional['QgsMapLayerStore']) -> None: ...
+    def removeAllMapLayers(self) -> None: ...
+    def takeMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsMapLayer]: ...
+    @typing.overload
+    def removeMapLayer(self, id: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def removeMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def removeMapLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> None: ...
+    def removeMapLayersById(self, layerIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def addMapLayer(self, layer: typing.Optional[QgsMapLayer]) -> typing.Optional[QgsMapLayer]: ...
+    def addMapLayers(self, layers: collections.abc.Iterable[QgsMapLayer]) -> list[QgsMapLayer]: ...
+    def validMapLayers(self) -> typing.Any: ...
+    def mapLayers(self) -> typing.Any: ...
+    def mapLayersByName(self, name: typing.Optional[str]) -> list[QgsMapLayer]: ...
+    def mapLayer(self, id: typing.Optional[str]) -> typing.Optional[QgsMapLayer]: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def validCount(self) -> int: ...
+    def count(self) -> int: ...
+
+
+class QgsMapLayerStyle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, xmlData: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerStyle') -> None: ...
+
+    def writeXml(self, styleElement: QtXml.QDomElement) -> None: ...
+    def readXml(self, styleElement: QtXml.QDomElement) -> None: ...
+    def writeToLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def readFromLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def xmlData(self) -> str: ...
+    def clear(self) -> None: ...
+    def isValid(self) -> bool: ...
+
+
+class QgsMapLayerStyleOverride(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerStyleOverride') -> None: ...
+
+    def setOverrideStyle(self, style: typing.Optional[str]) -> None: ...
+
+
+class QgsMapLayerStyleManager(QtCore.QObject):
+
+    def __init__(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+
+    currentStyleChanged: typing.ClassVar[QtCore.pyqtSignal]
+    styleRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    styleRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    styleAdded: typing.ClassVar[QtCore.pyqtSignal]
+    def copyStylesFrom(self, other: typing.Optional['QgsMapLayerStyleManager']) -> None: ...
+    @staticmethod
+    def isDefault(styleName: typing.Optional[str]) -> bool: ...
+    def restoreOverrideStyle(self) -> bool: ...
+    def setOverrideStyle(self, styleDef: typing.Optional[str]) -> bool: ...
+    def setCurrentStyle(self, name: typing.Optional[str]) -> bool: ...
+    def currentStyle(self) -> str: ...
+    def renameStyle(self, name: typing.Optional[str], newName: typing.Optional[str]) -> bool: ...
+    def removeStyle(self, name: typing.Optional[str]) -> bool: ...
+    def addStyleFromLayer(self, name: typing.Optional[str]) -> bool: ...
+    def addStyle(self, name: typing.Optional[str], style: QgsMapLayerStyle) -> bool: ...
+    def style(self, name: typing.Optional[str]) -> QgsMapLayerStyle: ...
+    def mapLayerStyles(self) -> dict[str, QgsMapLayerStyle]: ...
+    def styles(self) -> list[str]: ...
+    def writeXml(self, mgrElement: QtXml.QDomElement) -> None: ...
+    def readXml(self, mgrElement: QtXml.QDomElement) -> None: ...
+    def reset(self) -> None: ...
+    def layer(self) -> typing.Optional[QgsMapLayer]: ...
+
+
+class QgsMapLayerElevationProperties(QtCore.QObject):
+
+    class Flag(int):
+        FlagDontInvalidateCachedRendersWhenRangeChanges = ... # type: QgsMapLayerElevationProperties.Flag
+
+    class Property(int):
+        ZOffset = ... # type: QgsMapLayerElevationProperties.Property
+        ExtrusionHeight = ... # type: QgsMapLayerElevationProperties.Property
+        RasterPerBandLowerElevation = ... # type: QgsMapLayerElevationProperties.Property
+        RasterPerBandUpperElevation = ... # type: QgsMapLayerElevationProperties.Property
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __xor__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __ior__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __or__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __iand__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __and__(self, f: typing.Union['QgsMapLayerElevationProperties.Flags', 'QgsMapLayerElevationProperties.Flag']) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __invert__(self) -> 'QgsMapLayerElevationProperties.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def copyCommonProperties(self, other: typing.Optional['QgsMapLayerElevationProperties']) -> None: ...
+    def readCommonProperties(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> None: ...
+    def writeCommonProperties(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> None: ...
+    profileGenerationPropertyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    profileRenderingPropertyChanged: typing.ClassVar[QtCore.pyqtSignal]
+    zScaleChanged: typing.ClassVar[QtCore.pyqtSignal]
+    zOffsetChanged: typing.ClassVar[QtCore.pyqtSignal]
+    changed: typing.ClassVar[QtCore.pyqtSignal]
+    @staticmethod
+    def propertyDefinitions() -> dict[int, 'QgsPropertyDefinition']: ...
+    def setDataDefinedProperties(self, collection: 'QgsPropertyCollection') -> None: ...
+    def dataDefinedProperties(self) -> 'QgsPropertyCollection': ...
+    def setZScale(self, scale: float) -> None: ...
+    def zScale(self) -> float: ...
+    def setZOffset(self, offset: float) -> None: ...
+    def zOffset(self) -> float: ...
+    def showByDefaultInElevationProfilePlots(self) -> bool: ...
+    def significantZValues(self, layer: typing.Optional[QgsMapLayer]) -> list[float]: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> 'QgsDoubleRange': ...
+    def flags(self) -> 'QgsMapLayerElevationProperties.Flags': ...
+    def isVisibleInZRange(self, range: 'QgsDoubleRange', layer: typing.Optional[QgsMapLayer] = ...) -> bool: ...
+    def clone(self) -> typing.Optional['QgsMapLayerElevationProperties']: ...
+    def htmlSummary(self) -> str: ...
+    def setDefaultsFromLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+    ZOffset: QgsMapLayerElevationProperties.Property
+    ExtrusionHeight: QgsMapLayerElevationProperties.Property
+    RasterPerBandLowerElevation: QgsMapLayerElevationProperties.Property
+    RasterPerBandUpperElevation: QgsMapLayerElevationProperties.Property
+
+
+class QgsMapLayerSelectionProperties(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def clone(self) -> typing.Optional['QgsMapLayerSelectionProperties']: ...
+    def readXml(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> QtXml.QDomElement: ...
+
+
+class QgsMapLayerTemporalProperties(QgsTemporalProperty):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject], enabled: bool = ...) -> None: ...
+
+    def allTemporalRanges(self, layer: typing.Optional[QgsMapLayer]) -> list['QgsDateTimeRange']: ...
+    def setDefaultsFromDataProviderTemporalCapabilities(self, capabilities: typing.Optional[QgsDataProviderTemporalCapabilities]) -> None: ...
+    def isVisibleInTemporalRange(self, range: 'QgsDateTimeRange') -> bool: ...
+    def readXml(self, element: QtXml.QDomElement, context: 'QgsReadWriteContext') -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: 'QgsReadWriteContext') -> QtXml.QDomElement: ...
+
+
+class QgsMapLayerUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapLayerUtils') -> None: ...
+
+    @staticmethod
+    def isOpenStreetMapLayer(layer: typing.Optional[QgsMapLayer]) -> bool: ...
+    @staticmethod
+    def launderLayerName(name: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def sortLayersByType(layers: collections.abc.Iterable[QgsMapLayer], order: collections.abc.Iterable[Qgis.LayerType]) -> list[QgsMapLayer]: ...
+    @staticmethod
+    def updateLayerSourcePath(layer: typing.Optional[QgsMapLayer], newPath: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def layerSourceMatchesPath(layer: typing.Optional[QgsMapLayer], path: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def databaseConnection(layer: typing.Optional[QgsMapLayer]) -> typing.Optional['QgsAbstractDatabaseProviderConnection']: ...
+    @staticmethod
+    def combinedExtent(layers: collections.abc.Iterable[QgsMapLayer], crs: 'QgsCoordinateReferenceSystem', transformContext: 'QgsCoordinateTransformContext') -> 'QgsRectangle': ...
+
+
+class QgsMaskIdProvider(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMaskIdProvider') -> None: ...
+
+    def size(self) -> int: ...
+    def maskId(self, labelLayerId: typing.Optional[str] = ..., labelRuleId: typing.Optional[str] = ...) -> int: ...
+    def insertLabelLayer(self, layerId: typing.Optional[str], ruleId: typing.Optional[str], maskedSymbolLayers: collections.abc.Iterable['QgsSymbolLayerReference']) -> int: ...
+
+
+class QgsOgcUtils(PyQt5.sip.wrapper):
+
+    class FilterVersion(int):
+        FILTER_OGC_1_0 = ... # type: QgsOgcUtils.FilterVersion
+        FILTER_OGC_1_1 = ... # type: QgsOgcUtils.FilterVersion
+        FILTER_FES_2_0 = ... # type: QgsOgcUtils.FilterVersion
+
+    class GMLVersion(int):
+        GML_2_1_2 = ... # type: QgsOgcUtils.GMLVersion
+        GML_3_1_0 = ... # type: QgsOgcUtils.GMLVersion
+        GML_3_2_1 = ... # type: QgsOgcUtils.GMLVersion
+
+    class Context(PyQt5.sip.wrapper):
+
+        layer = ... # type: QgsMapLayer
+        transformContext = ... # type: 'QgsCoordinateTransformContext'
+
+        @typing.overload
+        def __init__(self, layer: typing.Optional[QgsMapLayer] = ..., transformContext: 'QgsCoordinateTransformContext' = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsOgcUtils.Context') -> None: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsOgcUtils') -> None: ...
+
+    @staticmethod
+    def elseFilterExpression(doc: QtXml.QDomDocument) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def expressionToOgcExpression(exp: 'QgsExpression', doc: QtXml.QDomDocument, errorMessage: typing.Optional[typing.Optional[str]] = ..., requiresFilterElement: bool = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def expressionToOgcExpression(exp: 'QgsExpression', doc: QtXml.QDomDocument, gmlVersion: 'QgsOgcUtils.GMLVersion', filterVersion: 'QgsOgcUtils.FilterVersion', geometryName: typing.Optional[str], srsName: typing.Optional[str], honourAxisOrientation: bool, invertAxisOrientation: bool, errorMessage: typing.Optional[typing.Optional[str]] = ..., requiresFilterElement: bool = ..., fieldNameToXPathMap: dict[typing.Optional[str], typing.Optional[str]] = ..., namespacePrefixToUriMap: dict[typing.Optional[str], typing.Optional[str]] = ...) -> QtXml.QDomElement: ...
+    @staticmethod
+    def expressionToOgcFilter(exp: 'QgsExpression', doc: QtXml.QDomDocument, errorMessage: typing.Optional[typing.Optional[str]] = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def expressionFromOgcFilter(element: QtXml.QDomElement, layer: typing.Optional[QgsVectorLayer] = ...) -> typing.Optional['QgsExpression']: ...
+    @typing.overload
+    @staticmethod
+    def expressionFromOgcFilter(element: QtXml.QDomElement, version: 'QgsOgcUtils.FilterVersion', layer: typing.Optional[QgsVectorLayer] = ...) -> typing.Optional['QgsExpression']: ...
+    @staticmethod
+    def colorFromOgcFill(fillElement: QtXml.QDomElement) -> QtGui.QColor: ...
+    @typing.overload
+    @staticmethod
+    def rectangleToGMLEnvelope(env: typing.Optional['QgsRectangle'], doc: QtXml.QDomDocument, precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def rectangleToGMLEnvelope(env: typing.Optional['QgsRectangle'], doc: QtXml.QDomDocument, srsName: typing.Optional[str], invertAxisOrientation: bool, precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def rectangleToGMLBox(box: typing.Optional['QgsRectangle'], doc: QtXml.QDomDocument, precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def rectangleToGMLBox(box: typing.Optional['QgsRectangle'], doc: QtXml.QDomDocument, srsName: typing.Optional[str], invertAxisOrientation: bool, precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def geometryToGML(geometry: 'QgsGeometry', doc: QtXml.QDomDocument, gmlVersion: 'QgsOgcUtils.GMLVersion', srsName: typing.Optional[str], invertAxisOrientation: bool, gmlIdBase: typing.Optional[str], precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def geometryToGML(geometry: 'QgsGeometry', doc: QtXml.QDomDocument, format: typing.Optional[str], precision: int = ...) -> QtXml.QDomElement: ...
+    @typing.overload
+    @staticmethod
+    def geometryToGML(geometry: 'QgsGeometry', doc: QtXml.QDomDocument, precision: int = ...) -> QtXml.QDomElement: ...
+    @staticmethod
+    def rectangleFromGMLEnvelope(envelopeNode: QtXml.QDomNode) -> 'QgsRectangle': ...
+    @staticmethod
+    def rectangleFromGMLBox(boxNode: QtXml.QDomNode) -> 'QgsRectangle': ...
+    @typing.overload
+    @staticmethod
+    def geometryFromGML(xmlString: typing.Optional[str], context: 'QgsOgcUtils.Context' = ...) -> 'QgsGeometry': ...
+    @typing.overload
+    @staticmethod
+    def geometryFromGML(geometryNode: QtXml.QDomNode, context: 'QgsOgcUtils.Context' = ...) -> 'QgsGeometry': ...
+
+
+class QgsOwsConnection(QtCore.QObject):
+
+    def __init__(self, service: typing.Optional[str], connName: typing.Optional[str]) -> None: ...
+
+    @staticmethod
+    def setSelectedConnection(service: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def selectedConnection(service: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def deleteConnection(service: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+    @staticmethod
+    def connectionList(service: typing.Optional[str]) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def addWfsConnectionSettings(uri: QgsDataSourceUri, settingsKey: typing.Optional[str]) -> QgsDataSourceUri: ...
+    @typing.overload
+    @staticmethod
+    def addWfsConnectionSettings(uri: QgsDataSourceUri, service: typing.Optional[str], connName: typing.Optional[str]) -> QgsDataSourceUri: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def addWmsWcsConnectionSettings(uri: QgsDataSourceUri, settingsKey: typing.Optional[str]) -> QgsDataSourceUri: ...
+    @typing.overload
+    @staticmethod
+    def addWmsWcsConnectionSettings(uri: QgsDataSourceUri, service: typing.Optional[str], connName: typing.Optional[str]) -> QgsDataSourceUri: ...
+    def uri(self) -> QgsDataSourceUri: ...
+    def service(self) -> str: ...
+    def connectionInfo(self) -> str: ...
+    def connectionName(self) -> str: ...
+
+
+class QgsPluginLayer(QgsMapLayer):
+
+    def __init__(self, layerType: typing.Optional[str], layerName: typing.Optional[str] = ...) -> None: ...
+
+    def icon(self) -> QtGui.QIcon: ...
+    def dataProvider(self) -> typing.Optional['QgsDataProvider']: ...
+    def setSource(self, source: typing.Optional[str]) -> None: ...
+    def setExtent(self, extent: 'QgsRectangle') -> None: ...
+    def pluginLayerType(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsPluginLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsPointXY(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, p: 'QgsPointXY') -> None: ...
+    @typing.overload
+    def __init__(self, x: float, y: float) -> None: ...
+    @typing.overload
+    def __init__(self, point: typing.Union[QtCore.QPointF, QtCore.QPoint, QgsPoint]) -> None: ...
+
+    def __hash__(self) -> int: ...
+    def __getitem__(self, a0: int) -> typing.Any: ...
+    def __len__(self) -> int: ...
+    def __repr__(self) -> typing.Any: ...
+    def __itruediv__(self, scalar: float) -> 'QgsPointXY': ...
+    def __imul__(self, scalar: float) -> 'QgsPointXY': ...
+    def __truediv__(self, scalar: float) -> 'QgsPointXY': ...
+    def __mul__(self, scalar: float) -> 'QgsPointXY': ...
+    def __add__(self, v: 'QgsVector') -> 'QgsPointXY': ...
+    def __isub__(self, v: 'QgsVector') -> 'QgsPointXY': ...
+    def __iadd__(self, v: 'QgsVector') -> 'QgsPointXY': ...
+    @typing.overload
+    def __sub__(self, p: 'QgsPointXY') -> 'QgsVector': ...
+    @typing.overload
+    def __sub__(self, v: 'QgsVector') -> 'QgsPointXY': ...
+    def multiply(self, scalar: float) -> None: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def distanceCompare(self, other: 'QgsPointXY', epsilon: float = ...) -> bool: ...
+    def compare(self, other: 'QgsPointXY', epsilon: float = ...) -> bool: ...
+    def isEmpty(self) -> bool: ...
+    def project(self, distance: float, bearing: float) -> 'QgsPointXY': ...
+    def azimuth(self, other: 'QgsPointXY') -> float: ...
+    def sqrDistToSegment(self, x1: float, y1: float, x2: float, y2: float, epsilon: float = ...) -> typing.Tuple[float, 'QgsPointXY']: ...
+    @typing.overload
+    def distance(self, x: float, y: float) -> float: ...
+    @typing.overload
+    def distance(self, other: 'QgsPointXY') -> float: ...
+    @typing.overload
+    def sqrDist(self, x: float, y: float) -> float: ...
+    @typing.overload
+    def sqrDist(self, other: 'QgsPointXY') -> float: ...
+    def asWkt(self) -> str: ...
+    def toString(self, precision: int = ...) -> str: ...
+    def toQPointF(self) -> QtCore.QPointF: ...
+    def y(self) -> float: ...
+    def x(self) -> float: ...
+    def set(self, x: float, y: float) -> None: ...
+    def setY(self, y: float) -> None: ...
+    def setX(self, x: float) -> None: ...
+
+
+class QgsAbstractPropertyCollection(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractPropertyCollection') -> None: ...
+
+    def loadVariant(self, configuration: typing.Any, definitions: dict[int, QgsPropertyDefinition]) -> bool: ...
+    def toVariant(self, definitions: dict[int, QgsPropertyDefinition]) -> typing.Any: ...
+    def readXml(self, collectionElem: QtXml.QDomElement, definitions: dict[int, QgsPropertyDefinition]) -> bool: ...
+    def writeXml(self, collectionElem: QtXml.QDomElement, definitions: dict[int, QgsPropertyDefinition]) -> bool: ...
+    def hasDynamicProperties(self) -> bool: ...
+    def hasActiveProperties(self) -> bool: ...
+    def isActive(self, key: int) -> bool: ...
+    def referencedFields(self, context: QgsExpressionContext = ..., ignoreContext: bool = ...) -> set[str]: ...
+    def prepare(self, context: QgsExpressionContext = ...) -> bool: ...
+    def valueAsBool(self, key: int, context: QgsExpressionContext, defaultValue: bool = ...) -> typing.Tuple[bool, typing.Optional[bool]]: ...
+    def valueAsInt(self, key: int, context: QgsExpressionContext, defaultValue: int = ...) -> typing.Tuple[int, typing.Optional[bool]]: ...
+    def valueAsDouble(self, key: int, context: QgsExpressionContext, defaultValue: float = ...) -> typing.Tuple[float, typing.Optional[bool]]: ...
+    def valueAsColor(self, key: int, context: QgsExpressionContext, defaultColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor] = ...) -> typing.Tuple[QtGui.QColor, typing.Optional[bool]]: ...
+    def valueAsString(self, key: int, context: QgsExpressionContext, defaultString: typing.Optional[str] = ...) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    def valueAsDateTime(self, key: int, context: QgsExpressionContext, defaultDateTime: typing.Union[QtCore.QDateTime, datetime.datetime] = ...) -> typing.Tuple[QtCore.QDateTime, typing.Optional[bool]]: ...
+    def value(self, key: int, context: QgsExpressionContext, defaultValue: typing.Any = ...) -> typing.Any: ...
+    def property(self, key: int) -> QgsProperty: ...
+    def hasProperty(self, key: int) -> bool: ...
+    def clear(self) -> None: ...
+    def propertyKeys(self) -> typing.Any: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+
+
+class QgsPropertyCollection(QgsAbstractPropertyCollection):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsPropertyCollection') -> None: ...
+
+    @typing.overload
+    def setProperty(self, key: int, property: QgsProperty) -> None: ...
+    @typing.overload
+    def setProperty(self, key: int, value: typing.Any) -> None: ...
+    def loadVariant(self, configuration: typing.Any, definitions: dict[int, QgsPropertyDefinition]) -> bool: ...
+    def toVariant(self, definitions: dict[int, QgsPropertyDefinition]) -> typing.Any: ...
+    def hasDynamicProperties(self) -> bool: ...
+    def hasActiveProperties(self) -> bool: ...
+    def isActive(self, key: int) -> bool: ...
+    def referencedFields(self, context: QgsExpressionContext = ..., ignoreContext: bool = ...) -> set[str]: ...
+    def prepare(self, context: QgsExpressionContext = ...) -> bool: ...
+    def value(self, key: int, context: QgsExpressionContext, defaultValue: typing.Any = ...) -> typing.Any: ...
+    def property(self, key: int) -> QgsProperty: ...
+    def hasProperty(self, key: int) -> bool: ...
+    def clear(self) -> None: ...
+    def propertyKeys(self) -> typing.Any: ...
+    def count(self) -> int: ...
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+
+
+class QgsPropertyCollectionStack(QgsAbstractPropertyCollection):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsPropertyCollectionStack') -> None: ...
+
+    def loadVariant(self, collection: typing.Any, definitions: dict[int, QgsPropertyDefinition]) -> bool: ...
+    def toVariant(self, definitions: dict[int, QgsPropertyDefinition]) -> typing.Any: ...
+    def hasProperty(self, key: int) -> bool: ...
+    def propertyKeys(self) -> typing.Any: ...
+    def prepare(self, context: QgsExpressionContext = ...) -> bool: ...
+    def referencedFields(self, context: QgsExpressionContext = ..., ignoreContext: bool = ...) -> set[str]: ...
+    def value(self, key: int, context: QgsExpressionContext, defaultValue: typing.Any = ...) -> typing.Any: ...
+    def property(self, key: int) -> QgsProperty: ...
+    def isActive(self, key: int) -> bool: ...
+    def hasDynamicProperties(self) -> bool: ...
+    def hasActiveProperties(self) -> bool: ...
+    def collection(self, name: typing.Optional[str]) -> typing.Optional[QgsPropertyCollection]: ...
+    def at(self, index: int) -> typing.Optional[QgsPropertyCollection]: ...
+    def appendCollection(self, collection: typing.Optional[QgsPropertyCollection]) -> None: ...
+    def clear(self) -> None: ...
+    def count(self) -> int: ...
+
+
+class QgsProxyFeatureSink(QgsFeatureSink):
+
+    @typing.overload
+    def __init__(self, sink: typing.Optional[QgsFeatureSink]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsProxyFeatureSink') -> None: ...
+
+    def destinationSink(self) -> typing.Optional[QgsFeatureSink]: ...
+    def finalize(self) -> None: ...
+    def flushBuffer(self) -> bool: ...
+    def lastError(self) -> str: ...
+    @typing.overload
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    @typing.overload
+    def addFeatures(self, iterator: QgsFeatureIterator, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+
+
+class QgsReadWriteContext(PyQt5.sip.wrapper):
+
+    class ReadWriteMessage(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, message: typing.Optional[str] = ..., level: Qgis.MessageLevel = ..., categories: collections.abc.Iterable[typing.Optional[str]] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsReadWriteContext.ReadWriteMessage') -> None: ...
+
+        def __repr__(self) -> typing.Any: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def categories(self) -> list[str]: ...
+        def level(self) -> Qgis.MessageLevel: ...
+        def message(self) -> str: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReadWriteContext') -> None: ...
+
+    def setTransformContext(self, transformContext: 'QgsCoordinateTransformContext') -> None: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def setProjectTranslator(self, projectTranslator: typing.Optional['QgsProjectTranslator']) -> None: ...
+    def projectTranslator(self) -> typing.Optional['QgsProjectTranslator']: ...
+    def takeMessages(self) -> list['QgsReadWriteContext.ReadWriteMessage']: ...
+    def _enterCategory(self, category: typing.Optional[str], details: typing.Optional[str] = ...) -> 'QgsReadWriteContextCategoryPopper': ...
+    def pushMessage(self, message: typing.Optional[str], level: Qgis.MessageLevel = ...) -> None: ...
+    def setPathResolver(self, resolver: QgsPathResolver) -> None: ...
+    def pathResolver(self) -> QgsPathResolver: ...
+    enterCategory: typing.Type[ReadWriteContextEnterCategory]
+
+
+class QgsReadWriteContextCategoryPopper(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, context: QgsReadWriteContext) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsReadWriteContextCategoryPopper') -> None: ...
+
+
+class QgsRelation(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, context: 'QgsRelationContext') -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsRelation') -> None: ...
+
+    @staticmethod
+    def strengthToDisplayString(strength: Qgis.RelationshipStrength) -> str: ...
+    @staticmethod
+    def cardinalityToDisplayString(cardinality: Qgis.RelationshipCardinality) -> str: ...
+    def type(self) -> Qgis.RelationshipType: ...
+    def polymorphicRelation(self) -> 'QgsPolymorphicRelation': ...
+    def polymorphicRelationId(self) -> str: ...
+    def setPolymorphicRelationId(self, polymorphicRelationId: typing.Optional[str]) -> None: ...
+    def updateRelationStatus(self) -> None: ...
+    def resolveReferencingField(self, referencedField: typing.Optional[str]) -> str: ...
+    def resolveReferencedField(self, referencingField: typing.Optional[str]) -> str: ...
+    def hasEqualDefinition(self, other: 'QgsRelation') -> bool: ...
+    def validationError(self) -> str: ...
+    def isValid(self) -> bool: ...
+    def referencingFieldsAllowNull(self) -> bool: ...
+    def referencingFields(self) -> list[int]: ...
+    def referencedFields(self) -> list[int]: ...
+    def fieldPairs(self) -> dict[str, str]: ...
+    def referencedLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def referencedLayerId(self) -> str: ...
+    def referencingLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def referencingLayerId(self) -> str: ...
+    def generateId(self) -> None: ...
+    def id(self) -> str: ...
+    def strength(self) -> Qgis.RelationshipStrength: ...
+    def name(self) -> str: ...
+    def getReferencedFeature(self, feature: QgsFeature) -> QgsFeature: ...
+    @typing.overload
+    def getReferencedFeatureRequest(self, attributes: typing.Any) -> QgsFeatureRequest: ...
+    @typing.overload
+    def getReferencedFeatureRequest(self, feature: QgsFeature) -> QgsFeatureRequest: ...
+    def getRelatedFeaturesFilter(self, feature: QgsFeature) -> str: ...
+    def getRelatedFeaturesRequest(self, feature: QgsFeature) -> QgsFeatureRequest: ...
+    def getRelatedFeatures(self, feature: QgsFeature) -> QgsFeatureIterator: ...
+    def addFieldPair(self, referencingField: typing.Optional[str], referencedField: typing.Optional[str]) -> None: ...
+    def setReferencedLayer(self, id: typing.Optional[str]) -> None: ...
+    def setReferencingLayer(self, id: typing.Optional[str]) -> None: ...
+    def setStrength(self, strength: Qgis.RelationshipStrength) -> None: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    @staticmethod
+    def createFromXml(node: QtXml.QDomNode, context: QgsReadWriteContext, relationContext: 'QgsRelationContext' = ...) -> 'QgsRelation': ...
+    RelationType: typing.Type[Qgis.RelationshipType]
+    Normal: Qgis.RelationshipType
+    Generated: Qgis.RelationshipType
+    RelationStrength: typing.Type[Qgis.RelationshipStrength]
+    Association: Qgis.RelationshipStrength
+    Composition: Qgis.RelationshipStrength
+
+
+class QgsPolymorphicRelation(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, context: 'QgsRelationContext') -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsPolymorphicRelation') -> None: ...
+
+    def setRelationStrength(self, relationStrength: Qgis.RelationshipStrength) -> None: ...
+    def strength(self) -> Qgis.RelationshipStrength: ...
+    def layerRepresentation(self, layer: typing.Optional[QgsVectorLayer]) -> str: ...
+    def generateRelations(self) -> list[QgsRelation]: ...
+    def referencedLayerIds(self) -> list[str]: ...
+    def setReferencedLayerIds(self, childRelationIds: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def referencedLayerExpression(self) -> str: ...
+    def setReferencedLayerExpression(self, expression: typing.Optional[str]) -> None: ...
+    def referencedLayerField(self) -> str: ...
+    def setReferencedLayerField(self, referencedLayerField: typing.Optional[str]) -> None: ...
+    def updateRelationStatus(self) -> None: ...
+    def hasEqualDefinition(self, other: 'QgsPolymorphicRelation') -> bool: ...
+    def isValid(self) -> bool: ...
+    def referencingFields(self) -> list[int]: ...
+    def referencedFields(self, layerId: typing.Optional[str]) -> list[int]: ...
+    def fieldPairs(self) -> dict[str, str]: ...
+    def referencingLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def referencingLayerId(self) -> str: ...
+    def generateId(self) -> None: ...
+    def id(self) -> str: ...
+    def name(self) -> str: ...
+    def addFieldPair(self, referencingField: typing.Optional[str], referencedField: typing.Optional[str]) -> None: ...
+    def setReferencingLayer(self, id: typing.Optional[str]) -> None: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def setId(self, id: typing.Optional[str]) -> None: ...
+    def writeXml(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument) -> None: ...
+    @staticmethod
+    def createFromXml(node: QtXml.QDomNode, context: QgsReadWriteContext, relationContext: 'QgsRelationContext' = ...) -> 'QgsPolymorphicRelation': ...
+
+
+class QgsRelationContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, project: typing.Optional['QgsProject'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsRelationContext') -> None: ...
+
+    def project(self) -> typing.Optional['QgsProject']: ...
+
+
+class QgsRemappingProxyFeatureSink(QgsFeatureSink):
+
+    @typing.overload
+    def __init__(self, mappingDefinition: QgsRemappingSinkDefinition, sink: typing.Optional[QgsFeatureSink]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsRemappingProxyFeatureSink') -> None: ...
+
+    def destinationSink(self) -> typing.Optional[QgsFeatureSink]: ...
+    def lastError(self) -> str: ...
+    @typing.overload
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    @typing.overload
+    def addFeatures(self, iterator: QgsFeatureIterator, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def remapFeature(self, feature: QgsFeature) -> list[QgsFeature]: ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+
+
+class QgsRenderContext(QgsTemporalRangeObject):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, rh: 'QgsRenderContext') -> None: ...
+
+    def setElevationMap(self, map: typing.Optional[QgsElevationMap]) -> None: ...
+    def elevationMap(self) -> typing.Optional[QgsElevationMap]: ...
+    def setCurrentFrame(self, frame: int) -> None: ...
+    def currentFrame(self) -> int: ...
+    def setFrameRate(self, rate: float) -> None: ...
+    def frameRate(self) -> float: ...
+    def setRendererUsage(self, usage: Qgis.RendererUsage) -> None: ...
+    def rendererUsage(self) -> Qgis.RendererUsage: ...
+    def setRasterizedRenderingPolicy(self, policy: Qgis.RasterizedRenderingPolicy) -> None: ...
+    def rasterizedRenderingPolicy(self) -> Qgis.RasterizedRenderingPolicy: ...
+    def imageFormat(self) -> QtGui.QImage.Format: ...
+    def setImageFormat(self, format: QtGui.QImage.Format) -> None: ...
+    def deviceOutputSize(self) -> QtCore.QSize: ...
+    def setDevicePixelRatio(self, ratio: float) -> None: ...
+    def devicePixelRatio(self) -> float: ...
+    def setOutputSize(self, size: QtCore.QSize) -> None: ...
+    def outputSize(self) -> QtCore.QSize: ...
+    def setZRange(self, range: QgsDoubleRange) -> None: ...
+    def zRange(self) -> QgsDoubleRange: ...
+    def symbolLayerClipGeometries(self, symbolLayerId: typing.Optional[str]) -> list['QgsGeometry']: ...
+    def symbolLayerHasClipGeometries(self, symbolLayerId: typing.Optional[str]) -> bool: ...
+    def addSymbolLayerClipGeometry(self, symbolLayerId: typing.Optional[str], geometry: 'QgsGeometry') -> None: ...
+    @deprecated("""""")
+    def symbolLayerClipPaths(self, symbolLayerId: typing.Optional[str]) -> list[QtGui.QPainterPath]: ...
+    @deprecated("""""")
+    def addSymbolLayerClipPath(self, symbolLayerId: typing.Optional[str], path: QtGui.QPainterPath) -> None: ...
+    def setMaskSettings(self, settings: QgsMaskRenderSettings) -> None: ...
+    def maskSettings(self) -> QgsMaskRenderSettings: ...
+    def setTextureOrigin(self, origin: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    def textureOrigin(self) -> QtCore.QPointF: ...
+    def setFeatureClipGeometry(self, geometry: 'QgsGeometry') -> None: ...
+    def featureClipGeometry(self) -> 'QgsGeometry': ...
+    def clippingRegions(self) -> list[QgsMapClippingRegion]: ...
+    def clearCustomProperty(self, property: typing.Optional[str]) -> None: ...
+    @deprecated("""""")
+    def clearCustomRenderingFlag(self, flag: typing.Optional[str]) -> None: ...
+    def setCustomProperty(self, property: typing.Optional[str], value: typing.Any) -> None: ...
+    @deprecated("""""")
+    def setCustomRenderingFlag(self, flag: typing.Optional[str], value: typing.Any) -> None: ...
+    def customProperties(self) -> dict[str, typing.Any]: ...
+    @deprecated("""""")
+    def customRenderingFlags(self) -> dict[str, typing.Any]: ...
+    def isGuiPreview(self) -> bool: ...
+    def setIsGuiPreview(self, preview: bool) -> None: ...
+    def currentMaskId(self) -> int: ...
+    def setCurrentMaskId(self, id: int) -> None: ...
+    def maskIdProvider(self) -> typing.Optional[QgsMaskIdProvider]: ...
+    def setMaskIdProvider(self, provider: typing.Optional[QgsMaskIdProvider]) -> None: ...
+    def hasRenderedFeatureHandlers(self) -> bool: ...
+    def renderedFeatureHandlers(self) -> list['QgsRenderedFeatureHandlerInterface']: ...
+    def setTextRenderFormat(self, format: Qgis.TextRenderFormat) -> None: ...
+    def textRenderFormat(self) -> Qgis.TextRenderFormat: ...
+    def convertMetersToMapUnits(self, meters: float) -> float: ...
+    def convertFromMapUnits(self, sizeInMapUnits: float, outputUnit: Qgis.RenderUnit) -> float: ...
+    def convertToMapUnits(self, size: float, unit: Qgis.RenderUnit, scale: QgsMapUnitScale = ...) -> float: ...
+    def convertFromPainterUnits(self, size: float, unit: Qgis.RenderUnit) -> float: ...
+    def convertToPainterUnits(self, size: float, unit: Qgis.RenderUnit, scale: QgsMapUnitScale = ..., property: Qgis.RenderSubcomponentProperty = ...) -> float: ...
+    def segmentationToleranceType(self) -> 'QgsAbstractGeometry.SegmentationToleranceType': ...
+    def setSegmentationToleranceType(self, type: 'QgsAbstractGeometry.SegmentationToleranceType') -> None: ...
+    def segmentationTolerance(self) -> float: ...
+    def setSegmentationTolerance(self, tolerance: float) -> None: ...
+    def featureFilterProvider(self) -> typing.Optional[QgsFeatureFilterProvider]: ...
+    def setFeatureFilterProvider(self, ffp: typing.Optional[QgsFeatureFilterProvider]) -> None: ...
+    def setGeometry(self, geometry: typing.Optional['QgsAbstractGeometry']) -> None: ...
+    def geometry(self) -> typing.Optional['QgsAbstractGeometry']: ...
+    def expressionContext(self) -> QgsExpressionContext: ...
+    def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+    def setVectorSimplifyMethod(self, simplifyMethod: 'QgsVectorSimplifyMethod') -> None: ...
+    def vectorSimplifyMethod(self) -> 'QgsVectorSimplifyMethod': ...
+    def setUseRenderingOptimization(self, enabled: bool) -> None: ...
+    def useRenderingOptimization(self) -> bool: ...
+    def setShowSelection(self, showSelection: bool) -> None: ...
+    def setSelectionColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    @deprecated("""""")
+    def setForceVectorOutput(self, force: bool) -> None: ...
+    def setMaskPainter(self, p: typing.Optional[QtGui.QPainter], id: int = ...) -> None: ...
+    def setPreviewRenderPainter(self, painter: typing.Optional[QtGui.QPainter]) -> None: ...
+    def setPainter(self, p: typing.Optional[QtGui.QPainter]) -> None: ...
+    def setSymbologyReferenceScale(self, scale: float) -> None: ...
+    def setRendererScale(self, scale: float) -> None: ...
+    def setDpiTarget(self, dpi: float) -> None: ...
+    def setScaleFactor(self, factor: float) -> None: ...
+    def setDistanceArea(self, distanceArea: QgsDistanceArea) -> None: ...
+    def setRenderingStopped(self, stopped: bool) -> None: ...
+    def setDrawEditingInformation(self, b: bool) -> None: ...
+    def setMapExtent(self, extent: 'QgsRectangle') -> None: ...
+    def setExtent(self, extent: 'QgsRectangle') -> None: ...
+    def setMapToPixel(self, mtp: QgsMapToPixel) -> None: ...
+    def setCoordinateTransform(self, t: 'QgsCoordinateTransform') -> None: ...
+    def showSelection(self) -> bool: ...
+    def selectionColor(self) -> QtGui.QColor: ...
+    def symbologyReferenceScale(self) -> float: ...
+    def rendererScale(self) -> float: ...
+    def drawEditingInformation(self) -> bool: ...
+    @deprecated("""""")
+    def setUseAdvancedEffects(self, enabled: bool) -> None: ...
+    @deprecated("""""")
+    def useAdvancedEffects(self) -> bool: ...
+    @deprecated("""""")
+    def forceVectorOutput(self) -> bool: ...
+    def feedback(self) -> typing.Optional[QgsFeedback]: ...
+    def setFeedback(self, feedback: typing.Optional[QgsFeedback]) -> None: ...
+    def renderingStopped(self) -> bool: ...
+    def dpiTarget(self) -> float: ...
+    def scaleFactor(self) -> float: ...
+    def mapToPixel(self) -> QgsMapToPixel: ...
+    def mapExtent(self) -> 'QgsRectangle': ...
+    def extent(self) -> 'QgsRectangle': ...
+    def setPathResolver(self, resolver: QgsPathResolver) -> None: ...
+    def pathResolver(self) -> QgsPathResolver: ...
+    def setTransformContext(self, context: 'QgsCoordinateTransformContext') -> None: ...
+    def transformContext(self) -> 'QgsCoordinateTransformContext': ...
+    def distanceArea(self) -> QgsDistanceArea: ...
+    def coordinateTransform(self) -> 'QgsCoordinateTransform': ...
+    def isSymbolLayerEnabled(self, layer: typing.Optional['QgsSymbolLayer']) -> bool: ...
+    def disabledSymbolLayersV2(self) -> set[str]: ...
+    @deprecated("""""")
+    def disabledSymbolLayers(self) -> set['QgsSymbolLayer']: ...
+    def setDisabledSymbolLayersV2(self, symbolLayers: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @deprecated("""""")
+    def setDisabledSymbolLayers(self, symbolLayers: collections.abc.Iterable['QgsSymbolLayer']) -> None: ...
+    def maskPainter(self, id: int = ...) -> typing.Optional[QtGui.QPainter]: ...
+    def setPainterFlagsUsingContext(self, painter: typing.Optional[QtGui.QPainter] = ...) -> None: ...
+    def previewRenderPainter(self) -> typing.Optional[QtGui.QPainter]: ...
+    def painter(self) -> typing.Optional[QtGui.QPainter]: ...
+    @staticmethod
+    def fromQPainter(painter: typing.Optional[QtGui.QPainter]) -> 'QgsRenderContext': ...
+    @staticmethod
+    def fromMapSettings(mapSettings: QgsMapSettings) -> 'QgsRenderContext': ...
+    def testFlag(self, flag: Qgis.RenderContextFlag) -> bool: ...
+    def flags(self) -> Qgis.RenderContextFlags: ...
+    def setFlag(self, flag: Qgis.RenderContextFlag, on: bool = ...) -> None: ...
+    def setFlags(self, flags: typing.Union[Qgis.RenderContextFlags, Qgis.RenderContextFlag]) -> None: ...
+    Flag: typing.Type[Qgis.RenderContextFlag]
+    DrawEditingInfo: Qgis.RenderContextFlag
+    ForceVectorOutput: Qgis.RenderContextFlag
+    UseAdvancedEffects: Qgis.RenderContextFlag
+    UseRenderingOptimization: Qgis.RenderContextFlag
+    DrawSelection: Qgis.RenderContextFlag
+    DrawSymbolBounds: Qgis.RenderContextFlag
+    RenderMapTile: Qgis.RenderContextFlag
+    Antialiasing: Qgis.RenderContextFlag
+    RenderPartialOutput: Qgis.RenderContextFlag
+    RenderPreviewJob: Qgis.RenderContextFlag
+    RenderBlocking: Qgis.RenderContextFlag
+    RenderSymbolPreview: Qgis.RenderContextFlag
+    LosslessImageRendering: Qgis.RenderContextFlag
+    ApplyScalingWorkaroundForTextRendering: Qgis.RenderContextFlag
+    Render3DMap: Qgis.RenderContextFlag
+    ApplyClipAfterReprojection: Qgis.RenderContextFlag
+    RenderingSubSymbol: Qgis.RenderContextFlag
+    HighQualityImageTransforms: Qgis.RenderContextFlag
+    SkipSymbolRendering: Qgis.RenderContextFlag
+    RecordProfile: Qgis.RenderContextFlag
+    AlwaysUseGlobalMasks: Qgis.RenderContextFlag
+    DisableSymbolClippingToExtent: Qgis.RenderContextFlag
+    RenderLayerTree: Qgis.RenderContextFlag
+    Flags: typing.Type[Qgis.RenderContextFlags]
+    TextRenderFormat: typing.Type[Qgis.TextRenderFormat]
+    TextFormatAlwaysOutlines: Qgis.TextRenderFormat
+    TextFormatAlwaysText: Qgis.TextRenderFormat
+    PreferText: Qgis.TextRenderFormat
+
+
+class QgsSimplifyMethod(PyQt5.sip.wrapper):
+
+    class MethodType(int):
+        NoSimplification = ... # type: QgsSimplifyMethod.MethodType
+        OptimizeForRendering = ... # type: QgsSimplifyMethod.MethodType
+        PreserveTopology = ... # type: QgsSimplifyMethod.MethodType
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSimplifyMethod') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    @staticmethod
+    def createGeometrySimplifier(simplifyMethod: 'QgsSimplifyMethod') -> typing.Optional[QgsAbstractGeometrySimplifier]: ...
+    def forceLocalOptimization(self) -> bool: ...
+    def setForceLocalOptimization(self, localOptimization: bool) -> None: ...
+    def threshold(self) -> float: ...
+    def setThreshold(self, threshold: float) -> None: ...
+    def tolerance(self) -> float: ...
+    def setTolerance(self, tolerance: float) -> None: ...
+    def methodType(self) -> 'QgsSimplifyMethod.MethodType': ...
+    def setMethodType(self, methodType: 'QgsSimplifyMethod.MethodType') -> None: ...
+
+
+class QgsSpatialIndex(QgsFeatureSink):
+
+    class Flag(int):
+        FlagStoreFeatureGeometries = ... # type: QgsSpatialIndex.Flag
+
+    class Flags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __xor__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __ior__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __or__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __iand__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __and__(self, f: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag']) -> 'QgsSpatialIndex.Flags': ...
+        def __invert__(self) -> 'QgsSpatialIndex.Flags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self, flags: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, fi: QgsFeatureIterator, feedback: typing.Optional[QgsFeedback] = ..., flags: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, source: QgsFeatureSource, feedback: typing.Optional[QgsFeedback] = ..., flags: typing.Union['QgsSpatialIndex.Flags', 'QgsSpatialIndex.Flag'] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSpatialIndex') -> None: ...
+
+    def refs(self) -> int: ...
+    def geometry(self, id: int) -> 'QgsGeometry': ...
+    @typing.overload
+    def nearestNeighbor(self, point: QgsPointXY, neighbors: int = ..., maxDistance: float = ...) -> list[int]: ...
+    @typing.overload
+    def nearestNeighbor(self, geometry: 'QgsGeometry', neighbors: int = ..., maxDistance: float = ...) -> list[int]: ...
+    def intersects(self, rectangle: 'QgsRectangle') -> list[int]: ...
+    @typing.overload
+    def deleteFeature(self, feature: QgsFeature) -> bool: ...
+    @typing.overload
+    def deleteFeature(self, id: int, bounds: 'QgsRectangle') -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    @typing.overload
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    @typing.overload
+    def addFeature(self, id: int, bounds: 'QgsRectangle') -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def insertFeature(self, feature: QgsFeature) -> bool: ...
+    @typing.overload
+    @deprecated("""""")
+    def insertFeature(self, id: int, bounds: 'QgsRectangle') -> bool: ...
+
+
+class QgsSpatialIndexKDBush(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, fi: QgsFeatureIterator, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, source: QgsFeatureSource, feedback: typing.Optional[QgsFeedback] = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsSpatialIndexKDBush') -> None: ...
+
+    def size(self) -> int: ...
+    def within(self, point: QgsPointXY, radius: float) -> list['QgsSpatialIndexKDBushData']: ...
+    def intersects(self, rectangle: 'QgsRectangle') -> list['QgsSpatialIndexKDBushData']: ...
+
+
+class QgsSpatialIndexKDBushData(PyQt5.sip.wrapper):
+
+    id = ... # type: int
+
+    @typing.overload
+    def __init__(self, id: int, x: float, y: float) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsSpatialIndexKDBushData') -> None: ...
+
+    def point(self) -> QgsPointXY: ...
+
+
+class QgsTableCell(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, content: typing.Any = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsTableCell') -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def setProperties(self, properties: dict[str, typing.Any], context: QgsReadWriteContext) -> None: ...
+    def properties(self, context: QgsReadWriteContext) -> dict[str, typing.Any]: ...
+    def columnSpan(self) -> int: ...
+    def rowSpan(self) -> int: ...
+    def setSpan(self, rowSpan: int, columnSpan: int) -> None: ...
+    def setVerticalAlignment(self, alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> None: ...
+    def verticalAlignment(self) -> QtCore.Qt.Alignment: ...
+    def setHorizontalAlignment(self, alignment: typing.Union[QtCore.Qt.Alignment, QtCore.Qt.AlignmentFlag]) -> None: ...
+    def horizontalAlignment(self) -> QtCore.Qt.Alignment: ...
+    def setNumericFormat(self, format: typing.Optional['QgsNumericFormat']) -> None: ...
+    def numericFormat(self) -> typing.Optional['QgsNumericFormat']: ...
+    def setTextFormat(self, format: 'QgsTextFormat') -> None: ...
+    def textFormat(self) -> 'QgsTextFormat': ...
+    def setForegroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def foregroundColor(self) -> QtGui.QColor: ...
+    def setBackgroundColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def backgroundColor(self) -> QtGui.QColor: ...
+    def setContent(self, content: typing.Any) -> None: ...
+    def content(self) -> typing.Any: ...
+
+
+class QgsTemporalNavigationObject(QgsTemporalController, QgsExpressionContextScopeGenerator):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def skipToEnd(self) -> None: ...
+    def rewindToStart(self) -> None: ...
+    def previous(self) -> None: ...
+    def next(self) -> None: ...
+    def playBackward(self) -> None: ...
+    def playForward(self) -> None: ...
+    def pause(self) -> None: ...
+    def play(self) -> None: ...
+    totalMovieFramesChanged: typing.ClassVar[QtCore.pyqtSignal]
+    temporalFrameDurationChanged: typing.ClassVar[QtCore.pyqtSignal]
+    temporalExtentsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    navigationModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    stateChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setTotalMovieFrames(self, frames: int) -> None: ...
+    def totalMovieFrames(self) -> int: ...
+    def createExpressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def findBestFrameNumberForFrameStart(self, frameStart: typing.Union[QtCore.QDateTime, datetime.datetime]) -> int: ...
+    def setLooping(self, loop: bool) -> None: ...
+    def isLooping(self) -> bool: ...
+    def totalFrameCount(self) -> int: ...
+    def temporalRangeCumulative(self) -> bool: ...
+    def setTemporalRangeCumulative(self, state: bool) -> None: ...
+    def framesPerSecond(self) -> float: ...
+    def setFramesPerSecond(self, rate: float) -> None: ...
+    def dateTimeRangeForFrameNumber(self, frame: int) -> QgsDateTimeRange: ...
+    def frameDuration(self) -> QgsInterval: ...
+    def setFrameDuration(self, duration: QgsInterval) -> None: ...
+    def currentFrameNumber(self) -> int: ...
+    def setCurrentFrameNumber(self, frame: int) -> None: ...
+    def availableTemporalRanges(self) -> list[QgsDateTimeRange]: ...
+    def setAvailableTemporalRanges(self, ranges: collections.abc.Iterable[QgsDateTimeRange]) -> None: ...
+    def temporalExtents(self) -> QgsDateTimeRange: ...
+    def setTemporalExtents(self, extents: QgsDateTimeRange) -> None: ...
+    def navigationMode(self) -> Qgis.TemporalNavigationMode: ...
+    def setNavigationMode(self, mode: Qgis.TemporalNavigationMode) -> None: ...
+    def animationState(self) -> Qgis.AnimationState: ...
+    def setAnimationState(self, state: Qgis.AnimationState) -> None: ...
+    NavigationMode: typing.Type[Qgis.TemporalNavigationMode]
+    NavigationOff: Qgis.TemporalNavigationMode
+    Animated: Qgis.TemporalNavigationMode
+    FixedRange: Qgis.TemporalNavigationMode
+    Movie: Qgis.TemporalNavigationMode
+    AnimationState: typing.Type[Qgis.AnimationState]
+    Forward: Qgis.AnimationState
+    Reverse: Qgis.AnimationState
+    Idle: Qgis.AnimationState
+
+
+class QgsTestUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTestUtils') -> None: ...
+
+    @staticmethod
+    def compareDomElements(element1: QtXml.QDomElement, element2: QtXml.QDomElement) -> bool: ...
+    @staticmethod
+    def testProviderIteratorThreadSafety(provider: typing.Optional['QgsVectorDataProvider'], request: QgsFeatureRequest = ...) -> bool: ...
+
+
+class QgsTolerance(PyQt5.sip.wrapper):
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTolerance') -> None: ...
+
+    @staticmethod
+    def toleranceInMapUnits(tolerance: float, layer: typing.Optional[QgsMapLayer], mapSettings: QgsMapSettings, units: Qgis.MapToolUnit = ...) -> float: ...
+    @staticmethod
+    def toleranceInProjectUnits(tolerance: float, layer: typing.Optional[QgsMapLayer], mapSettings: QgsMapSettings, units: Qgis.MapToolUnit) -> float: ...
+    @staticmethod
+    def defaultTolerance(layer: typing.Optional[QgsMapLayer], mapSettings: QgsMapSettings) -> float: ...
+    @typing.overload
+    @staticmethod
+    def vertexSearchRadius(mapSettings: QgsMapSettings) -> float: ...
+    @typing.overload
+    @staticmethod
+    def vertexSearchRadius(layer: typing.Optional[QgsMapLayer], mapSettings: QgsMapSettings) -> float: ...
+    UnitType: typing.Type[Qgis.MapToolUnit]
+    LayerUnits: Qgis.MapToolUnit
+    Pixels: Qgis.MapToolUnit
+    ProjectUnits: Qgis.MapToolUnit
+
+
+class QgsTracer(QtCore.QObject):
+
+    class PathError(int):
+        ErrNone = ... # type: QgsTracer.PathError
+        ErrTooManyFeatures = ... # type: QgsTracer.PathError
+        ErrPoint1 = ... # type: QgsTracer.PathError
+        ErrPoint2 = ... # type: QgsTracer.PathError
+        ErrNoPath = ... # type: QgsTracer.PathError
+
+    def __init__(self) -> None: ...
+
+    def invalidateGraph(self) -> None: ...
+    def configure(self) -> None: ...
+    def addPointsOnIntersectionsEnabled(self) -> bool: ...
+    def setAddPointsOnIntersectionsEnabled(self, enable: bool) -> None: ...
+    def isPointSnapped(self, pt: QgsPointXY) -> bool: ...
+    def findShortestPath(self, p1: QgsPointXY, p2: QgsPointXY) -> typing.Tuple[list[QgsPointXY], typing.Optional['QgsTracer.PathError']]: ...
+    def hasTopologyProblem(self) -> bool: ...
+    def isInitialized(self) -> bool: ...
+    def init(self) -> bool: ...
+    def setMaxFeatureCount(self, count: int) -> None: ...
+    def maxFeatureCount(self) -> int: ...
+    def setOffsetParameters(self, quadSegments: int, joinStyle: int, miterLimit: float) -> None: ...
+    def offsetParameters(self) -> typing.Tuple[int, int, float]: ...
+    def setOffset(self, offset: float) -> None: ...
+    def offset(self) -> float: ...
+    def setExtent(self, extent: 'QgsRectangle') -> None: ...
+    def extent(self) -> 'QgsRectangle': ...
+    def setRenderContext(self, renderContext: typing.Optional[QgsRenderContext]) -> None: ...
+    def setDestinationCrs(self, crs: 'QgsCoordinateReferenceSystem', context: 'QgsCoordinateTransformContext') -> None: ...
+    def destinationCrs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def setLayers(self, layers: collections.abc.Iterable[QgsVectorLayer]) -> None: ...
+    def layers(self) -> list[QgsVectorLayer]: ...
+
+
+class QgsVectorLayerTools(QtCore.QObject):
+
+    def __init__(self) -> None: ...
+
+    def project(self) -> typing.Optional['QgsProject']: ...
+    def setProject(self, project: typing.Optional['QgsProject']) -> None: ...
+    def setForceSuppressFormPopup(self, forceSuppressFormPopup: bool) -> None: ...
+    def forceSuppressFormPopup(self) -> bool: ...
+    def copyMoveFeatures(self, layer: typing.Optional[QgsVectorLayer], request: QgsFeatureRequest, dx: float = ..., dy: float = ..., topologicalEditing: bool = ..., topologicalLayer: typing.Optional[QgsVectorLayer] = ..., childrenInfoMsg: typing.Optional[typing.Optional[str]] = ...) -> typing.Tuple[bool, QgsFeatureRequest, typing.Optional[str]]: ...
+    def saveEdits(self, layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def stopEditing(self, layer: typing.Optional[QgsVectorLayer], allowCancel: bool = ...) -> bool: ...
+    def startEditing(self, layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def addFeatureV2(self, layer: typing.Optional[QgsVectorLayer], defaultValues: dict[int, typing.Any] = ..., defaultGeometry: 'QgsGeometry' = ..., context: 'QgsVectorLayerToolsContext' = ...) -> typing.Tuple[bool, typing.Optional[QgsFeature]]: ...
+    def addFeature(self, layer: typing.Optional[QgsVectorLayer], defaultValues: dict[int, typing.Any] = ..., defaultGeometry: 'QgsGeometry' = ..., parentWidget: typing.Optional[QtWidgets.QWidget] = ..., showModal: bool = ..., hideParent: bool = ...) -> typing.Tuple[bool, typing.Optional[QgsFeature]]: ...
+
+
+class QgsTrackedVectorLayerTools(QgsVectorLayerTools):
+
+    def __init__(self) -> None: ...
+
+    def rollback(self) -> None: ...
+    def setVectorLayerTools(self, tools: typing.Optional[QgsVectorLayerTools]) -> None: ...
+    def copyMoveFeatures(self, layer: typing.Optional[QgsVectorLayer], request: QgsFeatureRequest, dx: float = ..., dy: float = ..., errorMsg: typing.Optional[typing.Optional[str]] = ..., topologicalEditing: bool = ..., topologicalLayer: typing.Optional[QgsVectorLayer] = ..., childrenInfoMsg: typing.Optional[typing.Optional[str]] = ...) -> bool: ...
+    def saveEdits(self, layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def stopEditing(self, layer: typing.Optional[QgsVectorLayer], allowCancel: bool) -> bool: ...
+    def startEditing(self, layer: typing.Optional[QgsVectorLayer]) -> bool: ...
+    def addFeatureV2(self, layer: typing.Optional[QgsVectorLayer], defaultValues: dict[int, typing.Any], defaultGeometry: 'QgsGeometry', context: 'QgsVectorLayerToolsContext') -> typing.Tuple[bool, typing.Optional[QgsFeature]]: ...
+
+
+class QgsVirtualLayerDefinitionUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVirtualLayerDefinitionUtils') -> None: ...
+
+    @staticmethod
+    def fromJoinedLayer(joinedLayer: typing.Optional[QgsVectorLayer]) -> QgsVirtualLayerDefinition: ...
+
+
+class QgsFieldDomain(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QMetaType.Type) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QVariant.Type) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsFieldDomain') -> None: ...
+
+    def setMergePolicy(self, policy: Qgis.FieldDomainMergePolicy) -> None: ...
+    def mergePolicy(self) -> Qgis.FieldDomainMergePolicy: ...
+    def setSplitPolicy(self, policy: Qgis.FieldDomainSplitPolicy) -> None: ...
+    def splitPolicy(self) -> Qgis.FieldDomainSplitPolicy: ...
+    @typing.overload
+    def setFieldType(self, type: QtCore.QMetaType.Type) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def setFieldType(self, type: QtCore.QVariant.Type) -> None: ...
+    def fieldType(self) -> QtCore.QMetaType.Type: ...
+    def setDescription(self, description: typing.Optional[str]) -> None: ...
+    def description(self) -> str: ...
+    def setName(self, name: typing.Optional[str]) -> None: ...
+    def name(self) -> str: ...
+    def typeName(self) -> str: ...
+    def type(self) -> Qgis.FieldDomainType: ...
+    def clone(self) -> typing.Optional['QgsFieldDomain']: ...
+
+
+class QgsCodedValue(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, code: typing.Any, value: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsCodedValue') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def __eq__(self, other: object): ...
+    def __repr__(self) -> typing.Any: ...
+    def value(self) -> str: ...
+    def code(self) -> typing.Any: ...
+
+
+class QgsCodedFieldDomain(QgsFieldDomain):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QMetaType.Type, values: collections.abc.Iterable[QgsCodedValue]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QVariant.Type, values: collections.abc.Iterable[QgsCodedValue]) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def setValues(self, values: collections.abc.Iterable[QgsCodedValue]) -> None: ...
+    def values(self) -> list[QgsCodedValue]: ...
+    def clone(self) -> typing.Optional['QgsCodedFieldDomain']: ...
+    def typeName(self) -> str: ...
+    def type(self) -> Qgis.FieldDomainType: ...
+
+
+class QgsRangeFieldDomain(QgsFieldDomain):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QMetaType.Type, minimum: typing.Any, minimumIsInclusive: bool, maximum: typing.Any, maximumIsInclusive: bool) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QVariant.Type, minimum: typing.Any, minimumIsInclusive: bool, maximum: typing.Any, maximumIsInclusive: bool) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def setMaximumIsInclusive(self, inclusive: bool) -> None: ...
+    def maximumIsInclusive(self) -> bool: ...
+    def setMaximum(self, maximum: typing.Any) -> None: ...
+    def maximum(self) -> typing.Any: ...
+    def setMinimumIsInclusive(self, inclusive: bool) -> None: ...
+    def minimumIsInclusive(self) -> bool: ...
+    def setMinimum(self, minimum: typing.Any) -> None: ...
+    def minimum(self) -> typing.Any: ...
+    def clone(self) -> typing.Optional['QgsRangeFieldDomain']: ...
+    def typeName(self) -> str: ...
+    def type(self) -> Qgis.FieldDomainType: ...
+
+
+class QgsGlobFieldDomain(QgsFieldDomain):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QMetaType.Type, glob: typing.Optional[str]) -> None: ...
+    @typing.overload
+    @deprecated("""""")
+    def __init__(self, name: typing.Optional[str], description: typing.Optional[str], fieldType: QtCore.QVariant.Type, glob: typing.Optional[str]) -> None: ...
+
+    def __repr__(self) -> typing.Any: ...
+    def setGlob(self, glob: typing.Optional[str]) -> None: ...
+    def glob(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsGlobFieldDomain']: ...
+    def typeName(self) -> str: ...
+    def type(self) -> Qgis.FieldDomainType: ...
+
+
+class QgsVectorDataProvider(QgsDataProvider, QgsFeatureSink, QgsFeatureSource):
+
+    class NativeType(PyQt5.sip.wrapper):
+
+        mMaxLen = ... # type: int
+        mMaxPrec = ... # type: int
+        mMinLen = ... # type: int
+        mMinPrec = ... # type: int
+        mSubType = ... # type: QtCore.QMetaType.Type
+        mType = ... # type: QtCore.QMetaType.Type
+        mTypeDesc = ... # type: typing.Optional[str]
+        mTypeName = ... # type: typing.Optional[str]
+
+        @typing.overload
+        def __init__(self, typeDesc: typing.Optional[str], typeName: typing.Optional[str], type: QtCore.QMetaType.Type, minLen: int = ..., maxLen: int = ..., minPrec: int = ..., maxPrec: int = ..., subType: QtCore.QMetaType.Type = ...) -> None: ...
+        @typing.overload
+        def __init__(self, typeDesc: typing.Optional[str], typeName: typing.Optional[str], type: QtCore.QVariant.Type, minLen: int = ..., maxLen: int = ..., minPrec: int = ..., maxPrec: int = ..., subType: QtCore.QVariant.Type = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorDataProvider.NativeType') -> None: ...
+
+    EditingCapabilities = ... # type: int
+
+    def __init__(self, uri: typing.Optional[str] = ..., providerOptions: QgsDataProvider.ProviderOptions = ..., flags: typing.Union[Qgis.DataProviderReadFlags, Qgis.DataProviderReadFlag] = ...) -> None: ...
+
+    def textEncoding(self) -> typing.Optional[QtCore.QTextCodec]: ...
+    def setNativeTypes(self, nativeTypes: collections.abc.Iterable['QgsVectorDataProvider.NativeType']) -> None: ...
+    @typing.overload
+    def convertToProviderType(self, geom: QgsGeometry) -> QgsGeometry: ...
+    @typing.overload
+    @staticmethod
+    def convertToProviderType(geometry: QgsGeometry, providerGeometryType: Qgis.WkbType) -> QgsGeometry: ...
+    def pushError(self, msg: typing.Optional[str]) -> None: ...
+    def fillMinMaxCache(self) -> None: ...
+    def clearMinMaxCache(self) -> None: ...
+    raiseError: typing.ClassVar[QtCore.pyqtSignal]
+    def elevationProperties(self) -> typing.Optional[QgsDataProviderElevationProperties]: ...
+    def temporalCapabilities(self) -> typing.Optional['QgsVectorDataProviderTemporalCapabilities']: ...
+    def handlePostCloneOperations(self, source: typing.Optional['QgsVectorDataProvider']) -> None: ...
+    def hasMetadata(self) -> bool: ...
+    def translateMetadataValue(self, mdKey: typing.Optional[str], value: typing.Any) -> str: ...
+    def translateMetadataKey(self, mdKey: typing.Optional[str]) -> str: ...
+    def metadata(self) -> dict[str, typing.Any]: ...
+    def discoverRelations(self, target: typing.Optional[QgsVectorLayer], layers: collections.abc.Iterable[QgsVectorLayer]) -> list[QgsRelation]: ...
+    def dependencies(self) -> set[QgsMapLayerDependency]: ...
+    @deprecated("""""")
+    def forceReload(self) -> None: ...
+    def transaction(self) -> typing.Optional[QgsTransaction]: ...
+    @typing.overload
+    @staticmethod
+    def convertValue(type: QtCore.QMetaType.Type, value: typing.Optional[str]) -> typing.Any: ...
+    @typing.overload
+    @staticmethod
+    @deprecated("""""")
+    def convertValue(type: QtCore.QVariant.Type, value: typing.Optional[str]) -> typing.Any: ...
+    def createLabeling(self, configuration: dict[str, typing.Any] = ...) -> typing.Optional[QgsAbstractVectorLayerLabeling]: ...
+    def createRenderer(self, configuration: dict[str, typing.Any] = ...) -> typing.Optional[QgsFeatureRenderer]: ...
+    def errors(self) -> list[str]: ...
+    def clearErrors(self) -> None: ...
+    def hasErrors(self) -> bool: ...
+    @staticmethod
+    def availableEncodings() -> list[str]: ...
+    def doesStrictFeatureTypeCheck(self) -> bool: ...
+    def nativeTypes(self) -> list['QgsVectorDataProvider.NativeType']: ...
+    def supportedType(self, field: QgsField) -> bool: ...
+    @deprecated("""""")
+    def palAttributeIndexNames(self) -> dict[int, str]: ...
+    def geometryColumnName(self) -> str: ...
+    def pkAttributeIndexes(self) -> list[int]: ...
+    def attributeIndexes(self) -> list[int]: ...
+    def fieldNameMap(self) -> typing.Any: ...
+    def fieldNameIndex(self, fieldName: typing.Optional[str]) -> int: ...
+    def encoding(self) -> str: ...
+    def setEncoding(self, e: typing.Optional[str]) -> None: ...
+    def attributeEditCapabilities(self) -> Qgis.VectorDataProviderAttributeEditCapabilities: ...
+    def capabilitiesString(self) -> str: ...
+    def capabilities(self) -> Qgis.VectorProviderCapabilities: ...
+    def createAttributeIndex(self, field: int) -> bool: ...
+    def createSpatialIndex(self) -> bool: ...
+    def changeGeometryValues(self, geometry_map: typing.Any) -> bool: ...
+    def skipConstraintCheck(self, fieldIndex: int, constraint: QgsFieldConstraints.Constraint, value: typing.Any = ...) -> bool: ...
+    def fieldConstraints(self, fieldIndex: int) -> QgsFieldConstraints.Constraints: ...
+    def defaultValueClause(self, fieldIndex: int) -> str: ...
+    def defaultValue(self, fieldIndex: int) -> typing.Any: ...
+    def changeFeatures(self, attr_map: typing.Any, geometry_map: typing.Any) -> bool: ...
+    def changeAttributeValues(self, attr_map: typing.Any) -> bool: ...
+    def renameAttributes(self, renamedAttributes: dict[int, typing.Optional[str]]) -> bool: ...
+    def deleteAttributes(self, attributes: typing.Any) -> bool: ...
+    def addAttributes(self, attributes: typing.Any) -> bool: ...
+    def cancelReload(self) -> bool: ...
+    def truncate(self) -> bool: ...
+    def deleteFeatures(self, id: typing.Any) -> bool: ...
+    def lastError(self) -> str: ...
+    def addFeatures(self, flist: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> typing.Tuple[bool, list[QgsFeature]]: ...
+    def enumValues(self, index: int) -> list[str]: ...
+    def aggregate(self, aggregate: Qgis.Aggregate, index: int, parameters: QgsAggregateCalculator.AggregateParameters, context: typing.Optional[QgsExpressionContext], fids: typing.Optional[typing.Any] = ...) -> typing.Tuple[typing.Any, bool]: ...
+    def uniqueStringsMatching(self, index: int, substring: typing.Optional[str], limit: int = ..., feedback: typing.Optional[QgsFeedback] = ...) -> list[str]: ...
+    def maximumValue(self, index: int) -> typing.Any: ...
+    def minimumValue(self, index: int) -> typing.Any: ...
+    def dataComment(self) -> str: ...
+    def sourceName(self) -> str: ...
+    def sourceExtent3D(self) -> QgsBox3D: ...
+    def sourceExtent(self) -> QgsRectangle: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def fields(self) -> QgsFields: ...
+    def hasFeatures(self) -> Qgis.FeatureAvailability: ...
+    def vectorLayerTypeFlags(self) -> Qgis.VectorLayerTypeFlags: ...
+    def isSqlQuery(self) -> bool: ...
+    def empty(self) -> bool: ...
+    def featureCount(self) -> int: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def getFeatures(self, request: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+    def storageType(self) -> str: ...
+    def featureSource(self) -> typing.Optional[QgsAbstractFeatureSource]: ...
+    Capability: typing.Type[Qgis.VectorProviderCapability]
+    NoCapabilities: Qgis.VectorProviderCapability
+    AddFeatures: Qgis.VectorProviderCapability
+    DeleteFeatures: Qgis.VectorProviderCapability
+    ChangeAttributeValues: Qgis.VectorProviderCapability
+    AddAttributes: Qgis.VectorProviderCapability
+    DeleteAttributes: Qgis.VectorProviderCapability
+    CreateSpatialIndex: Qgis.VectorProviderCapability
+    SelectAtId: Qgis.VectorProviderCapability
+    ChangeGeometries: Qgis.VectorProviderCapability
+    SelectEncoding: Qgis.VectorProviderCapability
+    CreateAttributeIndex: Qgis.VectorProviderCapability
+    SimplifyGeometries: Qgis.VectorProviderCapability
+    SimplifyGeometriesWithTopologicalValidation: Qgis.VectorProviderCapability
+    TransactionSupport: Qgis.VectorProviderCapability
+    CircularGeometries: Qgis.VectorProviderCapability
+    ChangeFeatures: Qgis.VectorProviderCapability
+    RenameAttributes: Qgis.VectorProviderCapability
+    FastTruncate: Qgis.VectorProviderCapability
+    ReadLayerMetadata: Qgis.VectorProviderCapability
+    WriteLayerMetadata: Qgis.VectorProviderCapability
+    CancelSupport: Qgis.VectorProviderCapability
+    CreateRenderer: Qgis.VectorProviderCapability
+    CreateLabeling: Qgis.VectorProviderCapability
+    ReloadData: Qgis.VectorProviderCapability
+    FeatureSymbology: Qgis.VectorProviderCapability
+    EditingCapabilities: Qgis.VectorProviderCapability
+    Capabilities: typing.Type[Qgis.VectorProviderCapabilities]
+    FeatureCountState: typing.Type[Qgis.FeatureCountState]
+    Uncounted: Qgis.FeatureCountState
+    UnknownCount: Qgis.FeatureCountState
+
+
+class QgsVectorDataProviderTemporalCapabilities(QgsDataProviderTemporalCapabilities):
+
+    @typing.overload
+    def __init__(self, enabled: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorDataProviderTemporalCapabilities') -> None: ...
+
+    def setEndField(self, field: typing.Optional[str]) -> None: ...
+    def endField(self) -> str: ...
+    def setStartField(self, field: typing.Optional[str]) -> None: ...
+    def startField(self) -> str: ...
+    def availableTemporalRange(self) -> QgsDateTimeRange: ...
+    def setAvailableTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def setMode(self, mode: Qgis.VectorDataProviderTemporalMode) -> None: ...
+    def mode(self) -> Qgis.VectorDataProviderTemporalMode: ...
+    TemporalMode: typing.Type[Qgis.VectorDataProviderTemporalMode]
+    ProviderHasFixedTemporalRange: Qgis.VectorDataProviderTemporalMode
+    ProviderStoresFeatureDateTimeInstantInField: Qgis.VectorDataProviderTemporalMode
+    ProviderStoresFeatureDateTimeStartAndEndInSeparateFields: Qgis.VectorDataProviderTemporalMode
+
+
+class QgsVectorLayerCache(QtCore.QObject):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], cacheSize: int, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    invalidated: typing.ClassVar[QtCore.pyqtSignal]
+    featureAdded: typing.ClassVar[QtCore.pyqtSignal]
+    attributeValueChanged: typing.ClassVar[QtCore.pyqtSignal]
+    cachedLayerDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    finished: typing.ClassVar[QtCore.pyqtSignal]
+    def checkInformationCovered(self, featureRequest: QgsFeatureRequest) -> bool: ...
+    def featureRemoved(self, fid: int) -> None: ...
+    def requestCompleted(self, featureRequest: QgsFeatureRequest, fids: typing.Any) -> None: ...
+    def featureCount(self) -> int: ...
+    def __bool__(self) -> bool: ...
+    def __len__(self) -> int: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def fields(self) -> QgsFields: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def removeCachedFeature(self, fid: int) -> bool: ...
+    def completeFeatureAtId(self, featureId: int, skipCache: bool = ...) -> typing.Tuple[bool, QgsFeature]: ...
+    def featureAtIdWithAllAttributes(self, featureId: int, skipCache: bool = ...) -> typing.Tuple[bool, QgsFeature]: ...
+    def featureAtId(self, featureId: int, skipCache: bool = ...) -> typing.Tuple[bool, QgsFeature]: ...
+    def cachedFeatureIds(self) -> typing.Any: ...
+    def isFidCached(self, fid: int) -> bool: ...
+    def getFeature(self, fid: int) -> QgsFeature: ...
+    @typing.overload
+    def getFeatures(self, featureRequest: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+    @typing.overload
+    def getFeatures(self, expression: typing.Optional[str]) -> QgsFeatureIterator: ...
+    @typing.overload
+    def getFeatures(self, fids: typing.Any) -> QgsFeatureIterator: ...
+    @typing.overload
+    def getFeatures(self, rectangle: QgsRectangle) -> QgsFeatureIterator: ...
+    def addCacheIndex(self, cacheIndex: typing.Optional[QgsAbstractCacheIndex]) -> None: ...
+    def hasFullCache(self) -> bool: ...
+    def setFullCache(self, fullCache: bool) -> None: ...
+    def setCacheAddedAttributes(self, cacheAddedAttributes: bool) -> None: ...
+    def cacheSubsetOfAttributes(self) -> list[int]: ...
+    def setCacheSubsetOfAttributes(self, attributes: collections.abc.Iterable[int]) -> None: ...
+    def cacheGeometry(self) -> bool: ...
+    def setCacheGeometry(self, cacheGeometry: bool) -> None: ...
+    def cacheSize(self) -> int: ...
+    def setCacheSize(self, cacheSize: int) -> None: ...
+
+
+class QgsVectorLayerEditBuffer(QtCore.QObject):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    @typing.overload
+    def __init__(self) -> None: ...
+
+    def updateLayerFields(self) -> None: ...
+    def updateAttributeMapIndex(self, attrs: dict[int, typing.Any], index: int, offset: int) -> None: ...
+    def handleAttributeDeleted(self, index: int) -> None: ...
+    def handleAttributeAdded(self, index: int, field: QgsField) -> None: ...
+    def updateChangedAttributes(self, f: QgsFeature) -> None: ...
+    def updateFeatureGeometry(self, f: QgsFeature) -> None: ...
+    committedGeometriesChanges: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributeValuesChanges: typing.ClassVar[QtCore.pyqtSignal]
+    committedFeaturesRemoved: typing.ClassVar[QtCore.pyqtSignal]
+    committedFeaturesAdded: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributesRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributesAdded: typing.ClassVar[QtCore.pyqtSignal]
+    committedAttributesDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    attributeRenamed: typing.ClassVar[QtCore.pyqtSignal]
+    attributeDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    attributeAdded: typing.ClassVar[QtCore.pyqtSignal]
+    attributeValueChanged: typing.ClassVar[QtCore.pyqtSignal]
+    geometryChanged: typing.ClassVar[QtCore.pyqtSignal]
+    featureDeleted: typing.ClassVar[QtCore.pyqtSignal]
+    featureAdded: typing.ClassVar[QtCore.pyqtSignal]
+    layerModified: typing.ClassVar[QtCore.pyqtSignal]
+    def undoIndexChanged(self, index: int) -> None: ...
+    def setEditBufferGroup(self, editBufferGroup: typing.Optional['QgsVectorLayerEditBufferGroup']) -> None: ...
+    def editBufferGroup(self) -> typing.Optional['QgsVectorLayerEditBufferGroup']: ...
+    def isFeatureDeleted(self, id: int) -> bool: ...
+    def deletedFeatureIds(self) -> typing.Any: ...
+    def isFeatureGeometryChanged(self, id: int) -> bool: ...
+    def changedGeometries(self) -> typing.Any: ...
+    def addedAttributes(self) -> typing.Any: ...
+    def isAttributeDeleted(self, index: int) -> bool: ...
+    def deletedAttributeIds(self) -> list[int]: ...
+    def isFeatureAttributesChanged(self, id: int) -> bool: ...
+    def changedAttributeValues(self) -> typing.Any: ...
+    def isFeatureAdded(self, id: int) -> bool: ...
+    def allAddedOrEditedFeatures(self) -> typing.Any: ...
+    def addedFeatures(self) -> typing.Any: ...
+    def rollBack(self) -> None: ...
+    def commitChanges(self, commitErrors: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def renameAttribute(self, attr: int, newName: typing.Optional[str]) -> bool: ...
+    def deleteAttribute(self, attr: int) -> bool: ...
+    def addAttribute(self, field: QgsField) -> bool: ...
+    def changeAttributeValues(self, fid: int, newValues: dict[int, typing.Any], oldValues: dict[int, typing.Any]) -> bool: ...
+    def changeAttributeValue(self, fid: int, field: int, newValue: typing.Any, oldValue: typing.Any = ...) -> bool: ...
+    def changeGeometry(self, fid: int, geom: QgsGeometry) -> bool: ...
+    def deleteFeatures(self, fid: typing.Any) -> bool: ...
+    def deleteFeature(self, fid: int) -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature]) -> bool: ...
+    def addFeature(self, f: QgsFeature) -> bool: ...
+    def isModified(self) -> bool: ...
+
+
+class QgsVectorLayerEditBufferGroup(QtCore.QObject):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    def isEditing(self) -> bool: ...
+    def rollBack(self, stopEditing: bool = ...) -> typing.Tuple[bool, list[str]]: ...
+    def commitChanges(self, stopEditing: bool = ...) -> typing.Tuple[bool, list[str]]: ...
+    def startEditing(self) -> bool: ...
+    def modifiedLayers(self) -> set[QgsVectorLayer]: ...
+    def layers(self) -> set[QgsVectorLayer]: ...
+    def clear(self) -> None: ...
+    def removeLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def addLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+
+class QgsVectorLayerEditPassthrough(QgsVectorLayerEditBuffer):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    def update(self, transaction: typing.Optional[QgsTransaction], sql: typing.Optional[str], name: typing.Optional[str]) -> bool: ...
+    def rollBack(self) -> None: ...
+    def commitChanges(self, commitErrors: collections.abc.Iterable[typing.Optional[str]]) -> bool: ...
+    def renameAttribute(self, attr: int, newName: typing.Optional[str]) -> bool: ...
+    def deleteAttribute(self, attr: int) -> bool: ...
+    def addAttribute(self, field: QgsField) -> bool: ...
+    def changeAttributeValues(self, fid: int, newValues: dict[int, typing.Any], oldValues: dict[int, typing.Any]) -> bool: ...
+    def changeAttributeValue(self, fid: int, field: int, newValue: typing.Any, oldValue: typing.Any = ...) -> bool: ...
+    def changeGeometry(self, fid: int, geom: QgsGeometry) -> bool: ...
+    def deleteFeatures(self, fids: typing.Any) -> bool: ...
+    def deleteFeature(self, fid: int) -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature]) -> bool: ...
+    def addFeature(self, f: QgsFeature) -> bool: ...
+    def isModified(self) -> bool: ...
+
+
+class QgsVectorLayerEditUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorLayerEditUtils') -> None: ...
+
+    def mergeFeatures(self, targetFeatureId: int, mergeFeatureIds: typing.Any, mergeAttributes: typing.Any, unionGeometry: QgsGeometry) -> typing.Tuple[bool, str]: ...
+    @typing.overload
+    def addTopologicalPoints(self, geom: QgsGeometry) -> int: ...
+    @typing.overload
+    def addTopologicalPoints(self, p: typing.Union[QgsPointXY, QgsPoint]) -> int: ...
+    @typing.overload
+    def addTopologicalPoints(self, ps: collections.abc.Iterable[QgsPoint]) -> int: ...
+    @typing.overload
+    @deprecated("""""")
+    def splitFeatures(self, splitLine: collections.abc.Iterable[QgsPointXY], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitFeatures(self, splitLine: collections.abc.Iterable[QgsPoint], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitFeatures(self, curve: typing.Optional[QgsCurve], preserveCircular: bool = ..., topologicalEditing: bool = ...) -> typing.Tuple[Qgis.GeometryOperationResult, list[QgsPoint]]: ...
+    @typing.overload
+    @deprecated("""""")
+    def splitParts(self, splitLine: collections.abc.Iterable[QgsPointXY], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def splitParts(self, splitLine: collections.abc.Iterable[QgsPoint], topologicalEditing: bool = ...) -> Qgis.GeometryOperationResult: ...
+    def translateFeature(self, featureId: int, dx: float, dy: float) -> int: ...
+    def addCurvedPart(self, ring: typing.Optional[QgsCurve], featureId: int) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    @deprecated("""""")
+    def addPart(self, ring: collections.abc.Iterable[QgsPointXY], featureId: int) -> Qgis.GeometryOperationResult: ...
+    @typing.overload
+    def addPart(self, ring: collections.abc.Iterable[QgsPoint], featureId: int) -> Qgis.GeometryOperationResult: ...
+    def addCurvedRing(self, ring: typing.Optional[QgsCurve], targetFeatureIds: typing.Any = ...) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    def addRingV2(self, ring: typing.Optional[QgsCurve], targetFeatureIds: typing.Any = ...) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[typing.Any]]: ...
+    @typing.overload
+    @deprecated("""""")
+    def addRing(self, ring: collections.abc.Iterable[QgsPointXY], targetFeatureIds: typing.Any = ...) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    @typing.overload
+    def addRing(self, ring: collections.abc.Iterable[QgsPoint], targetFeatureIds: typing.Any = ...) -> typing.Tuple[Qgis.GeometryOperationResult, typing.Optional[int]]: ...
+    def deleteVertex(self, featureId: int, vertex: int) -> Qgis.VectorEditResult: ...
+    def moveVertexV2(self, p: QgsPoint, atFeatureId: int, atVertex: int) -> bool: ...
+    def moveVertex(self, x: float, y: float, atFeatureId: int, atVertex: int) -> bool: ...
+    @typing.overload
+    def insertVertex(self, x: float, y: float, atFeatureId: int, beforeVertex: int) -> bool: ...
+    @typing.overload
+    def insertVertex(self, point: QgsPoint, atFeatureId: int, beforeVertex: int) -> bool: ...
+
+
+class QgsVectorLayerElevationProperties(QgsMapLayerElevationProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject]) -> None: ...
+
+    def setShowMarkerSymbolInSurfacePlots(self, show: bool) -> None: ...
+    def showMarkerSymbolInSurfacePlots(self) -> bool: ...
+    def setElevationLimit(self, limit: float) -> None: ...
+    def elevationLimit(self) -> float: ...
+    def setProfileSymbology(self, symbology: Qgis.ProfileSurfaceSymbology) -> None: ...
+    def profileSymbology(self) -> Qgis.ProfileSurfaceSymbology: ...
+    def setProfileMarkerSymbol(self, symbol: typing.Optional[QgsMarkerSymbol]) -> None: ...
+    def profileMarkerSymbol(self) -> typing.Optional[QgsMarkerSymbol]: ...
+    def setProfileFillSymbol(self, symbol: typing.Optional[QgsFillSymbol]) -> None: ...
+    def profileFillSymbol(self) -> typing.Optional[QgsFillSymbol]: ...
+    def setProfileLineSymbol(self, symbol: typing.Optional[QgsLineSymbol]) -> None: ...
+    def profileLineSymbol(self) -> typing.Optional[QgsLineSymbol]: ...
+    def setRespectLayerSymbology(self, enabled: bool) -> None: ...
+    def respectLayerSymbology(self) -> bool: ...
+    def setCustomTolerance(self, tolerance: float) -> None: ...
+    def customTolerance(self) -> float: ...
+    def setCustomToleranceEnabled(self, enabled: bool) -> None: ...
+    def customToleranceEnabled(self) -> bool: ...
+    def setExtrusionHeight(self, height: float) -> None: ...
+    def extrusionHeight(self) -> float: ...
+    def setExtrusionEnabled(self, enabled: bool) -> None: ...
+    def extrusionEnabled(self) -> bool: ...
+    def setType(self, type: Qgis.VectorProfileType) -> None: ...
+    def type(self) -> Qgis.VectorProfileType: ...
+    def setBinding(self, binding: Qgis.AltitudeBinding) -> None: ...
+    def binding(self) -> Qgis.AltitudeBinding: ...
+    def setClamping(self, clamping: Qgis.AltitudeClamping) -> None: ...
+    def clamping(self) -> Qgis.AltitudeClamping: ...
+    def showByDefaultInElevationProfilePlots(self) -> bool: ...
+    def calculateZRange(self, layer: typing.Optional[QgsMapLayer]) -> QgsDoubleRange: ...
+    def isVisibleInZRange(self, range: QgsDoubleRange, layer: typing.Optional[QgsMapLayer] = ...) -> bool: ...
+    def htmlSummary(self) -> str: ...
+    def clone(self) -> typing.Optional['QgsVectorLayerElevationProperties']: ...
+    def setDefaultsFromLayer(self, layer: typing.Optional[QgsMapLayer]) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def hasElevation(self) -> bool: ...
+
+
+class QgsVectorLayerExporter(QgsFeatureSink):
+
+    class OutputField(PyQt5.sip.wrapper):
+
+        expression = ... # type: typing.Optional[str]
+        field = ... # type: QgsField
+
+        @typing.overload
+        def __init__(self, field: QgsField, expression: typing.Optional[str]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayerExporter.OutputField') -> None: ...
+
+    class ExportOptions(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayerExporter.ExportOptions') -> None: ...
+
+        def setOutputFields(self, fields: collections.abc.Iterable['QgsVectorLayerExporter.OutputField']) -> None: ...
+        def outputFields(self) -> list['QgsVectorLayerExporter.OutputField']: ...
+        def expressionContext(self) -> QgsExpressionContext: ...
+        def setExpressionContext(self, context: QgsExpressionContext) -> None: ...
+        def filterExpression(self) -> str: ...
+        def setFilterExpression(self, expression: typing.Optional[str]) -> None: ...
+        def extent(self) -> QgsReferencedRectangle: ...
+        def setExtent(self, extent: QgsReferencedRectangle) -> None: ...
+        def destinationCrs(self) -> QgsCoordinateReferenceSystem: ...
+        def setDestinationCrs(self, crs: QgsCoordinateReferenceSystem) -> None: ...
+        def transformContext(self) -> QgsCoordinateTransformContext: ...
+        def setTransformContext(self, context: QgsCoordinateTransformContext) -> None: ...
+        def selectedOnly(self) -> bool: ...
+        def setSelectedOnly(self, selected: bool) -> None: ...
+
+    def __init__(self, uri: typing.Optional[str], provider: typing.Optional[str], fields: QgsFields, geometryType: Qgis.WkbType, crs: QgsCoordinateReferenceSystem, overwrite: bool = ..., options: dict[typing.Optional[str], typing.Any] = ..., sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ...) -> None: ...
+
+    def flushBuffer(self) -> bool: ...
+    def lastError(self) -> str: ...
+    def addFeature(self, feature: QgsFeature, flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def attributeEditCapabilities(self) -> Qgis.VectorDataProviderAttributeEditCapabilities: ...
+    def errorCount(self) -> int: ...
+    def errorMessage(self) -> str: ...
+    def errorCode(self) -> Qgis.VectorExportResult: ...
+    @typing.overload
+    @staticmethod
+    def exportLayer(layer: typing.Optional[QgsVectorLayer], uri: typing.Optional[str], providerKey: typing.Optional[str], destCRS: QgsCoordinateReferenceSystem, onlySelected: bool = ..., options: dict[typing.Optional[str], typing.Any] = ..., feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple[Qgis.VectorExportResult, typing.Optional[str]]: ...
+    @typing.overload
+    @staticmethod
+    def exportLayer(layer: typing.Optional[QgsVectorLayer], uri: typing.Optional[str], providerKey: typing.Optional[str], exportOptions: 'QgsVectorLayerExporter.ExportOptions', providerOptions: dict[typing.Optional[str], typing.Any] = ..., feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple[Qgis.VectorExportResult, typing.Optional[str]]: ...
+    ExportError: typing.Type[Qgis.VectorExportResult]
+    NoError: Qgis.VectorExportResult
+    ErrCreateDataSource: Qgis.VectorExportResult
+    ErrCreateLayer: Qgis.VectorExportResult
+    ErrAttributeTypeUnsupported: Qgis.VectorExportResult
+    ErrAttributeCreationFailed: Qgis.VectorExportResult
+    ErrProjection: Qgis.VectorExportResult
+    ErrFeatureWriteFailed: Qgis.VectorExportResult
+    ErrInvalidLayer: Qgis.VectorExportResult
+    ErrInvalidProvider: Qgis.VectorExportResult
+    ErrProviderUnsupportedFeature: Qgis.VectorExportResult
+    ErrConnectionFailed: Qgis.VectorExportResult
+    ErrUserCanceled: Qgis.VectorExportResult
+
+
+class QgsVectorLayerExporterTask(QgsTask):
+
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], uri: typing.Optional[str], providerKey: typing.Optional[str], destinationCrs: QgsCoordinateReferenceSystem, options: dict[typing.Optional[str], typing.Any] = ..., ownsLayer: bool = ...) -> None: ...
+    @typing.overload
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], uri: typing.Optional[str], providerKey: typing.Optional[str], exportOptions: QgsVectorLayerExporter.ExportOptions, providerOptions: dict[typing.Optional[str], typing.Any] = ..., ownsLayer: bool = ...) -> None: ...
+
+    def finished(self, result: bool) -> None: ...
+    def run(self) -> bool: ...
+    errorOccurred: typing.ClassVar[QtCore.pyqtSignal]
+    exportComplete: typing.ClassVar[QtCore.pyqtSignal]
+    def cancel(self) -> None: ...
+    @staticmethod
+    def withLayerOwnership(layer: typing.Optional[QgsVectorLayer], uri: typing.Optional[str], providerKey: typing.Optional[str], destinationCrs: QgsCoordinateReferenceSystem, options: dict[typing.Optional[str], typing.Any] = ...) -> typing.Optional['QgsVectorLayerExporterTask']: ...
+
+
+class QgsVectorLayerFeatureCounter(QgsTask):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer], context: QgsExpressionContext = ..., storeSymbolFids: bool = ...) -> None: ...
+
+    symbolsCounted: typing.ClassVar[QtCore.pyqtSignal]
+    def featureIds(self, symbolkey: typing.Optional[str]) -> typing.Any: ...
+    def featureCount(self, legendKey: typing.Optional[str]) -> int: ...
+    def cancel(self) -> None: ...
+    def run(self) -> bool: ...
+
+
+class QgsVectorLayerFeatureSource(QgsAbstractFeatureSource):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    def id(self) -> str: ...
+    def crs(self) -> QgsCoordinateReferenceSystem: ...
+    def fields(self) -> QgsFields: ...
+    def getFeatures(self, request: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+
+
+class QgsAbstractFeatureIteratorFromSourceQgsVectorLayerFeatureSourceBase(QgsAbstractFeatureIterator):
+
+    @typing.overload
+    def __init__(self, source: typing.Optional[QgsVectorLayerFeatureSource], ownSource: bool, request: QgsFeatureRequest) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsAbstractFeatureIteratorFromSourceQgsVectorLayerFeatureSourceBase') -> None: ...
+
+    def iteratorClosed(self) -> None: ...
+
+
+class QgsVectorLayerFeatureIterator(QgsAbstractFeatureIteratorFromSourceQgsVectorLayerFeatureSourceBase):
+
+    class FetchJoinInfo(PyQt5.sip.wrapper):
+
+        attributes = ... # type: collections.abc.Iterable[int]
+        indexOffset = ... # type: int
+        joinField = ... # type: int
+        joinInfo = ... # type: 'QgsVectorLayerJoinInfo'
+        targetField = ... # type: int
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayerFeatureIterator.FetchJoinInfo') -> None: ...
+
+        def addJoinedAttributesDirect(self, f: QgsFeature, joinValue: typing.Any) -> None: ...
+        def addJoinedAttributesCached(self, f: QgsFeature, joinValue: typing.Any) -> None: ...
+
+    def __init__(self, source: typing.Optional[QgsVectorLayerFeatureSource], ownSource: bool, request: QgsFeatureRequest) -> None: ...
+
+    def prepareSimplification(self, simplifyMethod: QgsSimplifyMethod) -> bool: ...
+    def nextFeatureFilterExpression(self, f: QgsFeature) -> bool: ...
+    def fetchFeature(self, feature: QgsFeature) -> bool: ...
+    def isValid(self) -> bool: ...
+    def close(self) -> bool: ...
+    def rewind(self) -> bool: ...
+
+
+class QgsVectorLayerSelectedFeatureSource(QgsFeatureSource, QgsExpressionContextScopeGenerator):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+    def hasSpatialIndex(self) -> Qgis.SpatialIndexPresence: ...
+    def createExpressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def sourceName(self) -> str: ...
+    def featureCount(self) -> int: ...
+    def wkbType(self) -> Qgis.WkbType: ...
+    def fields(self) -> QgsFields: ...
+    def sourceCrs(self) -> QgsCoordinateReferenceSystem: ...
+    def getFeatures(self, request: QgsFeatureRequest = ...) -> QgsFeatureIterator: ...
+
+
+class QgsVectorLayerJoinBuffer(QtCore.QObject, QgsFeatureSink):
+
+    def __init__(self, layer: typing.Optional[QgsVectorLayer] = ...) -> None: ...
+
+    joinedFieldsChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def deleteFeatures(self, fids: typing.Any, context: typing.Optional[QgsVectorLayer.DeleteContext] = ...) -> bool: ...
+    def deleteFeature(self, fid: int, context: typing.Optional[QgsVectorLayer.DeleteContext] = ...) -> bool: ...
+    def changeAttributeValues(self, fid: int, newValues: dict[int, typing.Any], oldValues: dict[int, typing.Any] = ...) -> bool: ...
+    def changeAttributeValue(self, fid: int, field: int, newValue: typing.Any, oldValue: typing.Any = ...) -> bool: ...
+    def addFeatures(self, features: collections.abc.Iterable[QgsFeature], flags: typing.Union[QgsFeatureSink.Flags, QgsFeatureSink.Flag] = ...) -> bool: ...
+    def clone(self) -> typing.Optional['QgsVectorLayerJoinBuffer']: ...
+    def isAuxiliaryJoin(self, info: 'QgsVectorLayerJoinInfo') -> bool: ...
+    def targetedFeatureOf(self, info: typing.Optional['QgsVectorLayerJoinInfo'], feature: QgsFeature) -> QgsFeature: ...
+    def joinedFeatureOf(self, info: typing.Optional['QgsVectorLayerJoinInfo'], feature: QgsFeature) -> QgsFeature: ...
+    def joinsWhereFieldIsId(self, field: QgsField) -> list['QgsVectorLayerJoinInfo']: ...
+    @typing.overload
+    @staticmethod
+    def joinSubsetIndices(joinLayer: typing.Optional[QgsVectorLayer], joinFieldsSubset: collections.abc.Iterable[typing.Optional[str]]) -> list[int]: ...
+    @typing.overload
+    @staticmethod
+    def joinSubsetIndices(joinLayerFields: QgsFields, joinFieldsSubset: collections.abc.Iterable[typing.Optional[str]]) -> list[int]: ...
+    def joinedFieldsOffset(self, info: typing.Optional['QgsVectorLayerJoinInfo'], fields: QgsFields) -> int: ...
+    def joinForFieldIndex(self, index: int, fields: QgsFields) -> typing.Tuple[typing.Optional['QgsVectorLayerJoinInfo'], int]: ...
+    def vectorJoins(self) -> list['QgsVectorLayerJoinInfo']: ...
+    def containsJoins(self) -> bool: ...
+    def resolveReferences(self, project: typing.Optional[QgsProject]) -> None: ...
+    def readXml(self, layer_node: QtXml.QDomNode) -> None: ...
+    def writeXml(self, layer_node: QtXml.QDomNode, document: QtXml.QDomDocument) -> None: ...
+    def createJoinCaches(self) -> None: ...
+    def updateFields(self, fields: QgsFields) -> None: ...
+    def removeJoin(self, joinLayerId: typing.Optional[str]) -> bool: ...
+    def addJoin(self, joinInfo: 'QgsVectorLayerJoinInfo') -> bool: ...
+
+
+class QgsVectorLayerJoinInfo(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorLayerJoinInfo') -> None: ...
+
+    def __ne__(self, other: object): ...
+    def setJoinFieldNamesSubset(self, fieldNamesSubset: typing.Optional[collections.abc.Iterable[typing.Optional[str]]]) -> None: ...
+    def __eq__(self, other: object): ...
+    @typing.overload
+    @staticmethod
+    def joinFieldNamesSubset(info: 'QgsVectorLayerJoinInfo', blocklisted: bool = ...) -> list[str]: ...
+    @typing.overload
+    @staticmethod
+    def joinFieldNamesSubset(info: 'QgsVectorLayerJoinInfo', joinLayerFields: QgsFields, blocklisted: bool = ...) -> list[str]: ...
+    @typing.overload
+    def joinFieldNamesSubset(self) -> typing.Optional[list[str]]: ...
+    def hasSubset(self, blocklisted: bool = ...) -> bool: ...
+    def joinFieldNamesBlockList(self) -> list[str]: ...
+    def setJoinFieldNamesBlockList(self, list: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    @deprecated("""""")
+    def joinFieldNamesBlackList(self) -> list[str]: ...
+    @deprecated("""""")
+    def setJoinFieldNamesBlackList(self, blackList: collections.abc.Iterable[typing.Optional[str]]) -> None: ...
+    def extractJoinedFeature(self, feature: QgsFeature) -> QgsFeature: ...
+    def prefixedFieldName(self, field: QgsField) -> str: ...
+    def setCascadedDelete(self, enabled: bool) -> None: ...
+    def hasCascadedDelete(self) -> bool: ...
+    def setUpsertOnEdit(self, enabled: bool) -> None: ...
+    def hasUpsertOnEdit(self) -> bool: ...
+    def setEditable(self, enabled: bool) -> None: ...
+    def isEditable(self) -> bool: ...
+    def setDynamicFormEnabled(self, enabled: bool) -> None: ...
+    def isDynamicFormEnabled(self) -> bool: ...
+    def isUsingMemoryCache(self) -> bool: ...
+    def setUsingMemoryCache(self, enabled: bool) -> None: ...
+    def prefix(self) -> str: ...
+    def setPrefix(self, prefix: typing.Optional[str]) -> None: ...
+    def joinFieldName(self) -> str: ...
+    def setJoinFieldName(self, fieldName: typing.Optional[str]) -> None: ...
+    def targetFieldName(self) -> str: ...
+    def setTargetFieldName(self, fieldName: typing.Optional[str]) -> None: ...
+    def joinLayerId(self) -> str: ...
+    def setJoinLayerId(self, layerId: typing.Optional[str]) -> None: ...
+    def joinLayer(self) -> typing.Optional[QgsVectorLayer]: ...
+    def setJoinLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+
+
+class QgsVectorLayerSelectionProperties(QgsMapLayerSelectionProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
+
+    selectionSymbolChanged: typing.ClassVar[QtCore.pyqtSignal]
+    selectionColorChanged: typing.ClassVar[QtCore.pyqtSignal]
+    selectionRenderingModeChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def setSelectionSymbol(self, symbol: typing.Optional[QgsSymbol]) -> None: ...
+    def selectionSymbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setSelectionColor(self, color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> None: ...
+    def selectionColor(self) -> QtGui.QColor: ...
+    def setSelectionRenderingMode(self, mode: Qgis.SelectionRenderingMode) -> None: ...
+    def selectionRenderingMode(self) -> Qgis.SelectionRenderingMode: ...
+    def clone(self) -> typing.Optional['QgsVectorLayerSelectionProperties']: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+
+
+class QgsVectorLayerTemporalContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorLayerTemporalContext') -> None: ...
+
+    def setLayer(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+
+class QgsVectorLayerTemporalProperties(QgsMapLayerTemporalProperties):
+
+    def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., enabled: bool = ...) -> None: ...
+
+    def setDefaultsFromDataProviderTemporalCapabilities(self, capabilities: typing.Optional[QgsDataProviderTemporalCapabilities]) -> None: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def writeXml(self, element: QtXml.QDomElement, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def guessDefaultsFromFields(self, fields: QgsFields) -> None: ...
+    def createFilterString(self, context: QgsVectorLayerTemporalContext, range: QgsDateTimeRange) -> str: ...
+    def setAccumulateFeatures(self, accumulate: bool) -> None: ...
+    def accumulateFeatures(self) -> bool: ...
+    def setFixedDuration(self, duration: float) -> None: ...
+    def fixedDuration(self) -> float: ...
+    def setDurationUnits(self, units: Qgis.TemporalUnit) -> None: ...
+    def durationUnits(self) -> Qgis.TemporalUnit: ...
+    def setDurationField(self, field: typing.Optional[str]) -> None: ...
+    def durationField(self) -> str: ...
+    def setEndExpression(self, endExpression: typing.Optional[str]) -> None: ...
+    def endExpression(self) -> str: ...
+    def setStartExpression(self, expression: typing.Optional[str]) -> None: ...
+    def startExpression(self) -> str: ...
+    def setEndField(self, field: typing.Optional[str]) -> None: ...
+    def endField(self) -> str: ...
+    def setStartField(self, field: typing.Optional[str]) -> None: ...
+    def startField(self) -> str: ...
+    def fixedTemporalRange(self) -> QgsDateTimeRange: ...
+    def setFixedTemporalRange(self, range: QgsDateTimeRange) -> None: ...
+    def flags(self) -> QgsTemporalProperty.Flags: ...
+    def setLimitMode(self, mode: Qgis.VectorTemporalLimitMode) -> None: ...
+    def limitMode(self) -> Qgis.VectorTemporalLimitMode: ...
+    def setMode(self, mode: Qgis.VectorTemporalMode) -> None: ...
+    def mode(self) -> Qgis.VectorTemporalMode: ...
+    def isVisibleInTemporalRange(self, range: QgsDateTimeRange) -> bool: ...
+    TemporalMode: typing.Type[Qgis.VectorTemporalMode]
+    ModeFixedTemporalRange: Qgis.VectorTemporalMode
+    ModeFeatureDateTimeInstantFromField: Qgis.VectorTemporalMode
+    ModeFeatureDateTimeStartAndEndFromFields: Qgis.VectorTemporalMode
+    ModeFeatureDateTimeStartAndDurationFromFields: Qgis.VectorTemporalMode
+    ModeFeatureDateTimeStartAndEndFromExpressions: Qgis.VectorTemporalMode
+    ModeRedrawLayerOnly: Qgis.VectorTemporalMode
+
+
+class QgsVectorLayerToolsContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsVectorLayerToolsContext') -> None: ...
+
+    def setHideParent(self, hide: bool) -> None: ...
+    def hideParent(self) -> bool: ...
+    def setShowModal(self, modal: bool) -> None: ...
+    def showModal(self) -> bool: ...
+    def setParentWidget(self, parent: typing.Optional[QtWidgets.QWidget]) -> None: ...
+    def parentWidget(self) -> typing.Optional[QtWidgets.QWidget]: ...
+    def additionalExpressionContextScope(self) -> typing.Optional[QgsExpressionContextScope]: ...
+    def setAdditionalExpressionContextScope(self, scope: typing.Optional[QgsExpressionContextScope]) -> None: ...
+    def expressionContext(self) -> typing.Optional[QgsExpressionContext]: ...
+    def setExpressionContext(self, context: typing.Optional[QgsExpressionContext]) -> None: ...
+
+
+class QgsVectorLayerUndoCommand(QtWidgets.QUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer]) -> None: ...
+
+    def mergeWith(self, a0: typing.Optional[QtWidgets.QUndoCommand]) -> bool: ...
+    def id(self) -> int: ...
+    def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+
+class QgsVectorLayerUndoCommandAddFeature(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], f: QgsFeature) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandDeleteFeature(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandChangeGeometry(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int, newGeom: QgsGeometry) -> None: ...
+
+    def mergeWith(self, other: typing.Optional[QtWidgets.QUndoCommand]) -> bool: ...
+    def id(self) -> int: ...
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandChangeAttribute(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int, fieldIndex: int, newValue: typing.Any, oldValue: typing.Any) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandAddAttribute(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], field: QgsField) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandDeleteAttribute(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fieldIndex: int) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoCommandRenameAttribute(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fieldIndex: int, newName: typing.Optional[str]) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommand(QgsVectorLayerUndoCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], text: typing.Optional[str], autocreate: bool = ...) -> None: ...
+
+    def errorMessage(self) -> str: ...
+    def setErrorMessage(self, errorMessage: typing.Optional[str]) -> None: ...
+    def setError(self) -> None: ...
+    def setSavePoint(self, savePointId: typing.Optional[str] = ...) -> bool: ...
+    def rollBackToSavePoint(self) -> bool: ...
+    def hasError(self) -> bool: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandAddFeatures(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], features: collections.abc.Iterable[QgsFeature]) -> None: ...
+
+    def features(self) -> list[QgsFeature]: ...
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandDeleteFeatures(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fids: typing.Any) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandChangeGeometry(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int, geom: QgsGeometry) -> None: ...
+
+    def mergeWith(self, other: typing.Optional[QtWidgets.QUndoCommand]) -> bool: ...
+    def id(self) -> int: ...
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandChangeAttribute(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int, field: int, newValue: typing.Any) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandChangeAttributes(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], fid: int, newValues: dict[int, typing.Any], oldValues: dict[int, typing.Any] = ...) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandAddAttribute(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], field: QgsField) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandDeleteAttribute(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], attr: int) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandRenameAttribute(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], attr: int, newName: typing.Optional[str]) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUndoPassthroughCommandUpdate(QgsVectorLayerUndoPassthroughCommand):
+
+    def __init__(self, buffer: typing.Optional[QgsVectorLayerEditBuffer], transaction: typing.Optional[QgsTransaction], sql: typing.Optional[str], name: typing.Optional[str]) -> None: ...
+
+    def redo(self) -> None: ...
+    def undo(self) -> None: ...
+
+
+class QgsVectorLayerUtils(PyQt5.sip.wrapper):
+
+    class CascadedFeatureFlag(int):
+        IgnoreAuxiliaryLayers = ... # type: QgsVectorLayerUtils.CascadedFeatureFlag
+
+    class QgsDuplicateFeatureContext(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayerUtils.QgsDuplicateFeatureContext') -> None: ...
+
+        def duplicatedFeatures(self, layer: typing.Optional[QgsVectorLayer]) -> typing.Any: ...
+        def layers(self) -> list[QgsVectorLayer]: ...
+
+    class QgsFeatureData(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, geometry: QgsGeometry = ..., attributes: dict[int, typing.Any] = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorLayerUtils.QgsFeatureData') -> None: ...
+
+        def attributes(self) -> dict[int, typing.Any]: ...
+        def geometry(self) -> QgsGeometry: ...
+
+    class CascadedFeatureFlags(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self) -> None: ...
+        @typing.overload
+        def __init__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> None: ...
+
+        def __hash__(self) -> int: ...
+        def __bool__(self) -> bool: ...
+        def __ne__(self, other: object): ...
+        def __eq__(self, other: object): ...
+        def __ixor__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __xor__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __ior__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __or__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __iand__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __and__(self, f: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag']) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __invert__(self) -> 'QgsVectorLayerUtils.CascadedFeatureFlags': ...
+        def __index__(self) -> int: ...
+        def __int__(self) -> int: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorLayerUtils') -> None: ...
+
+    @staticmethod
+    def guessFriendlyIdentifierField(fields: QgsFields) -> str: ...
+    @staticmethod
+    def guessFriendlyIdentifierFieldV2(fields: QgsFields) -> typing.Tuple[str, typing.Optional[bool]]: ...
+    @staticmethod
+    def impactsCascadeFeatures(layer: typing.Optional[QgsVectorLayer], fids: typing.Any, project: typing.Optional[QgsProject], flags: typing.Union['QgsVectorLayerUtils.CascadedFeatureFlags', 'QgsVectorLayerUtils.CascadedFeatureFlag'] = ...) -> typing.Tuple[bool, 'QgsVectorLayerUtils.QgsDuplicateFeatureContext']: ...
+    @staticmethod
+    def getFeatureDisplayString(layer: typing.Optional[QgsVectorLayer], feature: QgsFeature) -> str: ...
+    @staticmethod
+    def fieldEditabilityDependsOnFeature(layer: typing.Optional[QgsVectorLayer], fieldIndex: int) -> bool: ...
+    @staticmethod
+    def fieldIsReadOnly(layer: typing.Optional[QgsVectorLayer], fieldIndex: int) -> bool: ...
+    @staticmethod
+    def fieldIsEditable(layer: typing.Optional[QgsVectorLayer], fieldIndex: int, feature: QgsFeature) -> bool: ...
+    @staticmethod
+    def makeFeaturesCompatible(features: collections.abc.Iterable[QgsFeature], layer: typing.Optional[QgsVectorLayer], sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ...) -> list[QgsFeature]: ...
+    @staticmethod
+    def makeFeatureCompatible(feature: QgsFeature, layer: typing.Optional[QgsVectorLayer], sinkFlags: typing.Union[QgsFeatureSink.SinkFlags, QgsFeatureSink.SinkFlag] = ...) -> list[QgsFeature]: ...
+    @staticmethod
+    def matchAttributesToFields(feature: QgsFeature, fields: QgsFields) -> None: ...
+    @staticmethod
+    def duplicateFeature(layer: typing.Optional[QgsVectorLayer], feature: QgsFeature, project: typing.Optional[QgsProject], maxDepth: int = ...) -> typing.Tuple[QgsFeature, 'QgsVectorLayerUtils.QgsDuplicateFeatureContext']: ...
+    @staticmethod
+    def createFeatures(layer: typing.Optional[QgsVectorLayer], featuresData: collections.abc.Iterable['QgsVectorLayerUtils.QgsFeatureData'], context: typing.Optional[QgsExpressionContext] = ...) -> list[QgsFeature]: ...
+    @staticmethod
+    def createFeature(layer: typing.Optional[QgsVectorLayer], geometry: QgsGeometry = ..., attributes: dict[int, typing.Any] = ..., context: typing.Optional[QgsExpressionContext] = ...) -> QgsFeature: ...
+    @staticmethod
+    def validateAttribute(layer: typing.Optional[QgsVectorLayer], feature: QgsFeature, attributeIndex: int, strength: QgsFieldConstraints.ConstraintStrength = ..., origin: QgsFieldConstraints.ConstraintOrigin = ...) -> typing.Tuple[bool, list[str]]: ...
+    @staticmethod
+    def attributeHasConstraints(layer: typing.Optional[QgsVectorLayer], attributeIndex: int) -> bool: ...
+    @staticmethod
+    def createUniqueValueFromCache(layer: typing.Optional[QgsVectorLayer], fieldIndex: int, existingValues: collections.abc.Iterable[typing.Any], seed: typing.Any = ...) -> typing.Any: ...
+    @staticmethod
+    def createUniqueValue(layer: typing.Optional[QgsVectorLayer], fieldIndex: int, seed: typing.Any = ...) -> typing.Any: ...
+    @staticmethod
+    def valueExists(layer: typing.Optional[QgsVectorLayer], fieldIndex: int, value: typing.Any, ignoreIds: typing.Any = ...) -> bool: ...
+    @staticmethod
+    def getDoubleValues(layer: typing.Optional[QgsVectorLayer], fieldOrExpression: typing.Optional[str], selectedOnly: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple[list[float], bool, typing.Optional[int]]: ...
+    @staticmethod
+    def getValues(layer: typing.Optional[QgsVectorLayer], fieldOrExpression: typing.Optional[str], selectedOnly: bool = ..., feedback: typing.Optional[QgsFeedback] = ...) -> typing.Tuple[list[typing.Any], bool]: ...
+    @staticmethod
+    def getValuesIterator(layer: typing.Optional[QgsVectorLayer], fieldOrExpression: typing.Optional[str], selectedOnly: bool) -> typing.Tuple[QgsFeatureIterator, bool]: ...
@@ -0,0 +1,559 @@
+# The PEP 484 type hints stub file for the _core.vectortile module.
+#
+# Split from _core.pyi by scripts/split_stub_by_group.py.
+
+
+import collections.abc
+import collections, re, typing
+try:
+    from warnings import deprecated
+except ImportError:
+    pass
+import PyQt5.sip
+from PyQt5 import QtCore
+from PyQt5 import QtXml
+from PyQt5 import QtNetwork
+from PyQt5 import QtGui
+from PyQt5 import QtWidgets
+from PyQt5 import QtSql
+from PyQt5 import QtPrintSupport
+from PyQt5 import QtPositioning
+from PyQt5 import QtSerialPort
+import datetime
+
+from ._ungrouped import (
+    Qgis, QgsFeedback, QgsFields, QgsSelectionContext, QgsTileRange,
+    QgsTileXYZ,
+)
+from .dxf import QgsMapToPixel
+from .geometry import QgsGeometry, QgsRectangle
+from .labeling import QgsPalLayerSettings
+from .layertree import QgsProperty
+from .metadata import QgsLayerMetadata
+from .proj import (
+    QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+)
+from .project import QgsProject
+from .providers import QgsDataProvider
+from .raster import QgsRasterLayer
+from .symbology import QgsSymbol
+from .vector import (
+    QgsFeature, QgsMapLayer, QgsMapLayerRenderer, QgsPointXY,
+    QgsPropertyCollection, QgsReadWriteContext, QgsRenderContext,
+    QgsVectorLayer,
+)
+
+
+class QgsTileMatrix(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTileMatrix') -> None: ...
+
+    def isRootTileMatrix(self) -> bool: ...
+    def mapToTileCoordinates(self, mapPoint: QgsPointXY) -> QtCore.QPointF: ...
+    def tileRangeFromExtent(self, mExtent: 'QgsRectangle') -> QgsTileRange: ...
+    def tileCenter(self, id: QgsTileXYZ) -> QgsPointXY: ...
+    def tileExtent(self, id: QgsTileXYZ) -> 'QgsRectangle': ...
+    def setScale(self, scale: float) -> None: ...
+    def scale(self) -> float: ...
+    def extent(self) -> 'QgsRectangle': ...
+    def matrixHeight(self) -> int: ...
+    def matrixWidth(self) -> int: ...
+    def setZoomLevel(self, level: int) -> None: ...
+    def zoomLevel(self) -> int: ...
+    def setCrs(self, crs: 'QgsCoordinateReferenceSystem') -> None: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    @staticmethod
+    def fromTileMatrix(zoomLevel: int, tileMatrix: 'QgsTileMatrix') -> 'QgsTileMatrix': ...
+    @staticmethod
+    def fromCustomDef(zoomLevel: int, crs: 'QgsCoordinateReferenceSystem', z0TopLeftPoint: QgsPointXY, z0Dimension: float, z0MatrixWidth: int = ..., z0MatrixHeight: int = ...) -> 'QgsTileMatrix': ...
+    @staticmethod
+    def fromWebMercator(zoomLevel: int) -> 'QgsTileMatrix': ...
+
+
+class QgsTileMatrixSet(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsTileMatrixSet') -> None: ...
+
+    def tilesInRange(self, range: QgsTileRange, zoomLevel: int) -> list[QgsTileXYZ]: ...
+    def setScaleToTileZoomMethod(self, method: Qgis.ScaleToTileZoomLevelMethod) -> None: ...
+    def scaleToTileZoomMethod(self) -> Qgis.ScaleToTileZoomLevelMethod: ...
+    def writeXml(self, document: QtXml.QDomDocument, context: QgsReadWriteContext) -> QtXml.QDomElement: ...
+    def readXml(self, element: QtXml.QDomElement, context: QgsReadWriteContext) -> bool: ...
+    def calculateTileScaleForMap(self, actualMapScale: float, mapCrs: 'QgsCoordinateReferenceSystem', mapExtent: 'QgsRectangle', mapSize: QtCore.QSize, mapDpi: float) -> float: ...
+    def scaleForRenderContext(self, context: QgsRenderContext) -> float: ...
+    def scaleToZoomLevel(self, scale: float, clamp: bool = ...) -> int: ...
+    def scaleToZoom(self, scale: float) -> float: ...
+    def crs(self) -> 'QgsCoordinateReferenceSystem': ...
+    def tileAvailability(self, id: QgsTileXYZ) -> Qgis.TileAvailability: ...
+    def dropMatricesOutsideZoomRange(self, minimumZoom: int, maximumZoom: int) -> None: ...
+    def maximumZoom(self) -> int: ...
+    def minimumZoom(self) -> int: ...
+    def addMatrix(self, matrix: QgsTileMatrix) -> None: ...
+    def setRootMatrix(self, matrix: QgsTileMatrix) -> None: ...
+    def rootMatrix(self) -> QgsTileMatrix: ...
+    def tileMatrix(self, zoom: int) -> QgsTileMatrix: ...
+    def addGoogleCrs84QuadTiles(self, minimumZoom: int = ..., maximumZoom: int = ...) -> None: ...
+    def isEmpty(self) -> bool: ...
+
+
+class QgsMapBoxGlStyleConversionContext(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapBoxGlStyleConversionContext') -> None: ...
+
+    def setLayerId(self, value: typing.Optional[str]) -> None: ...
+    def layerId(self) -> str: ...
+    def setSprites(self, image: QtGui.QImage, definitions: typing.Optional[typing.Union[dict[str, typing.Any], str]], category: typing.Optional[str] = ...) -> None: ...
+    def spriteDefinitions(self, category: typing.Optional[str] = ...) -> dict[str, typing.Any]: ...
+    def spriteImage(self, category: typing.Optional[str] = ...) -> QtGui.QImage: ...
+    def spriteCategories(self) -> list[str]: ...
+    def setPixelSizeConversionFactor(self, sizeConversionFactor: float) -> None: ...
+    def pixelSizeConversionFactor(self) -> float: ...
+    def setTargetUnit(self, targetUnit: Qgis.RenderUnit) -> None: ...
+    def targetUnit(self) -> Qgis.RenderUnit: ...
+    def clearWarnings(self) -> None: ...
+    def warnings(self) -> list[str]: ...
+    def pushWarning(self, warning: typing.Optional[str]) -> None: ...
+
+
+class QgsMapBoxGlStyleAbstractSource(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapBoxGlStyleAbstractSource') -> None: ...
+
+    def name(self) -> str: ...
+    def setFromJson(self, json: dict[str, typing.Any], context: typing.Optional[QgsMapBoxGlStyleConversionContext]) -> bool: ...
+    def type(self) -> Qgis.MapBoxGlStyleSourceType: ...
+
+
+class QgsMapBoxGlStyleRasterSource(QgsMapBoxGlStyleAbstractSource):
+
+    @typing.overload
+    def __init__(self, name: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapBoxGlStyleRasterSource') -> None: ...
+
+    def toRasterLayer(self) -> typing.Optional[QgsRasterLayer]: ...
+    def tiles(self) -> list[str]: ...
+    def tileSize(self) -> int: ...
+    def maximumZoom(self) -> int: ...
+    def minimumZoom(self) -> int: ...
+    def attribution(self) -> str: ...
+    def setFromJson(self, json: dict[str, typing.Any], context: typing.Optional[QgsMapBoxGlStyleConversionContext]) -> bool: ...
+    def type(self) -> Qgis.MapBoxGlStyleSourceType: ...
+
+
+class QgsMapBoxGlStyleRasterSubLayer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, id: typing.Optional[str], source: typing.Optional[str]) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsMapBoxGlStyleRasterSubLayer') -> None: ...
+
+    def dataDefinedProperties(self) -> QgsPropertyCollection: ...
+    def source(self) -> str: ...
+    def id(self) -> str: ...
+
+
+class QgsMapBoxGlStyleConverter(PyQt5.sip.wrapper):
+
+    class PropertyType(int):
+        Color = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+        Numeric = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+        Opacity = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+        Point = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+        NumericArray = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+        DashArray = ... # type: QgsMapBoxGlStyleConverter.PropertyType
+
+    class Result(int):
+        Success = ... # type: QgsMapBoxGlStyleConverter.Result
+        NoLayerList = ... # type: QgsMapBoxGlStyleConverter.Result
+
+    staticMetaObject = ... # type: QtCore.QMetaObject
+
+    def __init__(self) -> None: ...
+
+    @staticmethod
+    def retrieveSpriteAsBase64WithProperties(value: typing.Any, context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple[str, QtCore.QSize, str, str]: ...
+    @staticmethod
+    def retrieveSpriteAsBase64(value: typing.Any, context: QgsMapBoxGlStyleConversionContext) -> str: ...
+    @staticmethod
+    def retrieveSprite(name: typing.Optional[str], context: QgsMapBoxGlStyleConversionContext, spriteSize: QtCore.QSize) -> QtGui.QImage: ...
+    @staticmethod
+    def parseExpression(expression: collections.abc.Iterable[typing.Any], context: QgsMapBoxGlStyleConversionContext, colorExpected: bool = ...) -> str: ...
+    @staticmethod
+    def parseJoinStyle(style: typing.Optional[str]) -> QtCore.Qt.PenJoinStyle: ...
+    @staticmethod
+    def parseCapStyle(style: typing.Optional[str]) -> QtCore.Qt.PenCapStyle: ...
+    @staticmethod
+    def interpolateExpression(zoomMin: float, zoomMax: float, valueMin: typing.Any, valueMax: typing.Any, base: float, multiplier: float = ..., contextPtr: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> str: ...
+    @staticmethod
+    def colorAsHslaComponents(color: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor]) -> typing.Tuple[int, int, int, int]: ...
+    @staticmethod
+    def parseColor(color: typing.Any, context: QgsMapBoxGlStyleConversionContext) -> QtGui.QColor: ...
+    @staticmethod
+    def parseColorExpression(colorExpression: typing.Any, context: QgsMapBoxGlStyleConversionContext) -> str: ...
+    @staticmethod
+    def parseInterpolateListByZoom(json: collections.abc.Iterable[typing.Any], type: 'QgsMapBoxGlStyleConverter.PropertyType', context: QgsMapBoxGlStyleConversionContext, multiplier: float = ..., maxOpacity: int = ...) -> typing.Tuple[QgsProperty, typing.Optional[QtGui.QColor], typing.Optional[float]]: ...
+    @staticmethod
+    def parseStepList(json: collections.abc.Iterable[typing.Any], type: 'QgsMapBoxGlStyleConverter.PropertyType', context: QgsMapBoxGlStyleConversionContext, multiplier: float = ..., maxOpacity: int = ...) -> typing.Tuple[QgsProperty, typing.Optional[QtGui.QColor], typing.Optional[float]]: ...
+    @staticmethod
+    def parseMatchList(json: collections.abc.Iterable[typing.Any], type: 'QgsMapBoxGlStyleConverter.PropertyType', context: QgsMapBoxGlStyleConversionContext, multiplier: float = ..., maxOpacity: int = ...) -> typing.Tuple[QgsProperty, typing.Optional[QtGui.QColor], typing.Optional[float]]: ...
+    @staticmethod
+    def parseValueList(json: collections.abc.Iterable[typing.Any], type: 'QgsMapBoxGlStyleConverter.PropertyType', context: QgsMapBoxGlStyleConversionContext, multiplier: float = ..., maxOpacity: int = ...) -> typing.Tuple[QgsProperty, typing.Optional[QtGui.QColor], typing.Optional[float]]: ...
+    @staticmethod
+    def parseLabelStops(stops: collections.abc.Iterable[typing.Any], context: QgsMapBoxGlStyleConversionContext) -> str: ...
+    @staticmethod
+    def parseStringStops(stops: collections.abc.Iterable[typing.Any], context: QgsMapBoxGlStyleConversionContext, conversionMap: dict[str, typing.Any]) -> typing.Tuple[str, typing.Optional[str]]: ...
+    @staticmethod
+    def parseStops(base: float, stops: collections.abc.Iterable[typing.Any], multiplier: float, context: QgsMapBoxGlStyleConversionContext) -> str: ...
+    @staticmethod
+    def parseArrayStops(stops: collections.abc.Iterable[typing.Any], context: QgsMapBoxGlStyleConversionContext, multiplier: float = ...) -> str: ...
+    @staticmethod
+    def parsePointStops(base: float, stops: collections.abc.Iterable[typing.Any], context: QgsMapBoxGlStyleConversionContext, multiplier: float = ...) -> str: ...
+    @staticmethod
+    def parseInterpolateStringByZoom(json: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext, conversionMap: dict[str, typing.Any]) -> typing.Tuple[QgsProperty, typing.Optional[str]]: ...
+    @staticmethod
+    def parseInterpolatePointByZoom(json: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext, multiplier: float = ...) -> typing.Tuple[QgsProperty, typing.Optional[QtCore.QPointF]]: ...
+    @staticmethod
+    def parseOpacityStops(base: float, stops: collections.abc.Iterable[typing.Any], maxOpacity: int, context: QgsMapBoxGlStyleConversionContext) -> str: ...
+    @staticmethod
+    def parseInterpolateOpacityByZoom(json: dict[str, typing.Any], maxOpacity: int, contextPtr: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> QgsProperty: ...
+    @staticmethod
+    def parseInterpolateByZoom(json: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext, multiplier: float = ...) -> typing.Tuple[QgsProperty, typing.Optional[float]]: ...
+    @staticmethod
+    def parseInterpolateColorByZoom(json: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple[QgsProperty, typing.Optional[QtGui.QColor]]: ...
+    @staticmethod
+    def parseSymbolLayerAsRenderer(jsonLayer: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple[bool, 'QgsVectorTileBasicRendererStyle']: ...
+    @staticmethod
+    def parseSymbolLayer(jsonLayer: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple['QgsVectorTileBasicRendererStyle', bool, 'QgsVectorTileBasicLabelingStyle', bool]: ...
+    @staticmethod
+    def parseCircleLayer(jsonLayer: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple[bool, 'QgsVectorTileBasicRendererStyle']: ...
+    @staticmethod
+    def parseLineLayer(jsonLayer: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext) -> typing.Tuple[bool, 'QgsVectorTileBasicRendererStyle']: ...
+    @staticmethod
+    def parseFillLayer(jsonLayer: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext, isBackgroundStyle: bool = ...) -> typing.Tuple[bool, 'QgsVectorTileBasicRendererStyle']: ...
+    def parseLayers(self, layers: collections.abc.Iterable[typing.Any], context: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> None: ...
+    def parseRasterSource(self, source: dict[str, typing.Any], name: typing.Optional[str], context: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> None: ...
+    def parseSources(self, sources: dict[str, typing.Any], context: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> None: ...
+    def createSubLayers(self) -> list[QgsMapLayer]: ...
+    def rasterSubLayers(self) -> list[QgsMapBoxGlStyleRasterSubLayer]: ...
+    def sources(self) -> list[QgsMapBoxGlStyleAbstractSource]: ...
+    def labeling(self) -> typing.Optional['QgsVectorTileLabeling']: ...
+    def renderer(self) -> typing.Optional['QgsVectorTileRenderer']: ...
+    def warnings(self) -> list[str]: ...
+    def errorMessage(self) -> str: ...
+    def convert(self, style: typing.Optional[typing.Union[dict[str, typing.Any], str]], context: typing.Optional[QgsMapBoxGlStyleConversionContext] = ...) -> 'QgsMapBoxGlStyleConverter.Result': ...
+
+
+class QgsVectorTileBasicLabelingStyle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileBasicLabelingStyle') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def isActive(self, zoomLevel: int) -> bool: ...
+    def maxZoomLevel(self) -> int: ...
+    def setMaxZoomLevel(self, maxZoom: int) -> None: ...
+    def minZoomLevel(self) -> int: ...
+    def setMinZoomLevel(self, minZoom: int) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def filterExpression(self) -> str: ...
+    def setFilterExpression(self, expr: typing.Optional[str]) -> None: ...
+    def geometryType(self) -> Qgis.GeometryType: ...
+    def setGeometryType(self, geomType: Qgis.GeometryType) -> None: ...
+    def layerName(self) -> str: ...
+    def setLayerName(self, name: typing.Optional[str]) -> None: ...
+    def styleName(self) -> str: ...
+    def setStyleName(self, name: typing.Optional[str]) -> None: ...
+    def labelSettings(self) -> QgsPalLayerSettings: ...
+    def setLabelSettings(self, settings: QgsPalLayerSettings) -> None: ...
+
+
+class QgsVectorTileLabeling(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileLabeling') -> None: ...
+
+    def resolveReferences(self, project: QgsProject) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def clone(self) -> typing.Optional['QgsVectorTileLabeling']: ...
+    def type(self) -> str: ...
+
+
+class QgsVectorTileBasicLabeling(QgsVectorTileLabeling):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileBasicLabeling') -> None: ...
+
+    def style(self, index: int) -> QgsVectorTileBasicLabelingStyle: ...
+    def setStyle(self, index: int, style: QgsVectorTileBasicLabelingStyle) -> None: ...
+    def styles(self) -> list[QgsVectorTileBasicLabelingStyle]: ...
+    def setStyles(self, styles: collections.abc.Iterable[QgsVectorTileBasicLabelingStyle]) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def clone(self) -> typing.Optional[QgsVectorTileLabeling]: ...
+    def type(self) -> str: ...
+
+
+class QgsVectorTileBasicRendererStyle(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, stName: typing.Optional[str] = ..., laName: typing.Optional[str] = ..., geomType: Qgis.GeometryType = ...) -> None: ...
+    @typing.overload
+    def __init__(self, other: 'QgsVectorTileBasicRendererStyle') -> None: ...
+
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def isActive(self, zoomLevel: int) -> bool: ...
+    def maxZoomLevel(self) -> int: ...
+    def setMaxZoomLevel(self, maxZoom: int) -> None: ...
+    def minZoomLevel(self) -> int: ...
+    def setMinZoomLevel(self, minZoom: int) -> None: ...
+    def isEnabled(self) -> bool: ...
+    def setEnabled(self, enabled: bool) -> None: ...
+    def symbol(self) -> typing.Optional[QgsSymbol]: ...
+    def setSymbol(self, sym: typing.Optional[QgsSymbol]) -> None: ...
+    def filterExpression(self) -> str: ...
+    def setFilterExpression(self, expr: typing.Optional[str]) -> None: ...
+    def geometryType(self) -> Qgis.GeometryType: ...
+    def setGeometryType(self, geomType: Qgis.GeometryType) -> None: ...
+    def layerName(self) -> str: ...
+    def setLayerName(self, name: typing.Optional[str]) -> None: ...
+    def styleName(self) -> str: ...
+    def setStyleName(self, name: typing.Optional[str]) -> None: ...
+
+
+class QgsVectorTileRenderer(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileRenderer') -> None: ...
+
+    def resolveReferences(self, project: QgsProject) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def renderSelectedFeatures(self, selection: collections.abc.Iterable[QgsFeature], context: QgsRenderContext) -> None: ...
+    def willRenderFeature(self, feature: QgsFeature, tileZoom: int, layerName: typing.Optional[str], context: QgsRenderContext) -> bool: ...
+    def renderTile(self, tile: 'QgsVectorTileRendererData', context: QgsRenderContext) -> None: ...
+    def renderBackground(self, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def requiredLayers(self, context: QgsRenderContext, tileZoom: int) -> set[str]: ...
+    def startRender(self, context: QgsRenderContext, tileZoom: int, tileRange: QgsTileRange) -> None: ...
+    def clone(self) -> typing.Optional['QgsVectorTileRenderer']: ...
+    def type(self) -> str: ...
+
+
+class QgsVectorTileBasicRenderer(QgsVectorTileRenderer):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileBasicRenderer') -> None: ...
+
+    @staticmethod
+    def simpleStyleWithRandomColors() -> list[QgsVectorTileBasicRendererStyle]: ...
+    @staticmethod
+    def simpleStyle(polygonFillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], polygonStrokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], polygonStrokeWidth: float, lineStrokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], lineStrokeWidth: float, pointFillColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], pointStrokeColor: typing.Union[QtGui.QColor, QtCore.Qt.GlobalColor], pointSize: float) -> list[QgsVectorTileBasicRendererStyle]: ...
+    def style(self, index: int) -> QgsVectorTileBasicRendererStyle: ...
+    def setStyle(self, index: int, style: QgsVectorTileBasicRendererStyle) -> None: ...
+    def styles(self) -> list[QgsVectorTileBasicRendererStyle]: ...
+    def setStyles(self, styles: collections.abc.Iterable[QgsVectorTileBasicRendererStyle]) -> None: ...
+    def readXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def writeXml(self, elem: QtXml.QDomElement, context: QgsReadWriteContext) -> None: ...
+    def willRenderFeature(self, feature: QgsFeature, tileZoom: int, layerName: typing.Optional[str], context: QgsRenderContext) -> bool: ...
+    def renderSelectedFeatures(self, selection: collections.abc.Iterable[QgsFeature], context: QgsRenderContext) -> None: ...
+    def renderTile(self, tile: 'QgsVectorTileRendererData', context: QgsRenderContext) -> None: ...
+    def renderBackground(self, context: QgsRenderContext) -> None: ...
+    def stopRender(self, context: QgsRenderContext) -> None: ...
+    def requiredLayers(self, context: QgsRenderContext, tileZoom: int) -> set[str]: ...
+    def startRender(self, context: QgsRenderContext, tileZoom: int, tileRange: QgsTileRange) -> None: ...
+    def clone(self) -> typing.Optional['QgsVectorTileBasicRenderer']: ...
+    def type(self) -> str: ...
+
+
+class QgsVectorTileLayer(QgsMapLayer):
+
+    class LayerOptions(PyQt5.sip.wrapper):
+
+        transformContext = ... # type: QgsCoordinateTransformContext
+
+        @typing.overload
+        def __init__(self, transformContext: QgsCoordinateTransformContext = ...) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorTileLayer.LayerOptions') -> None: ...
+
+    def __init__(self, path: typing.Optional[str] = ..., baseName: typing.Optional[str] = ..., options: 'QgsVectorTileLayer.LayerOptions' = ...) -> None: ...
+
+    selectionChanged: typing.ClassVar[QtCore.pyqtSignal]
+    def removeSelection(self) -> None: ...
+    def selectByGeometry(self, geometry: QgsGeometry, context: QgsSelectionContext, behavior: Qgis.SelectBehavior = ..., relationship: Qgis.SelectGeometryRelationship = ..., flags: typing.Union[Qgis.SelectionFlags, Qgis.SelectionFlag] = ..., renderContext: typing.Optional[QgsRenderContext] = ...) -> None: ...
+    def selectedFeatureCount(self) -> int: ...
+    def selectedFeatures(self) -> list[QgsFeature]: ...
+    def isTileBorderRenderingEnabled(self) -> bool: ...
+    def setTileBorderRenderingEnabled(self, enabled: bool) -> None: ...
+    def setLabelsEnabled(self, enabled: bool) -> None: ...
+    def labelsEnabled(self) -> bool: ...
+    def labeling(self) -> typing.Optional[QgsVectorTileLabeling]: ...
+    def setLabeling(self, labeling: typing.Optional[QgsVectorTileLabeling]) -> None: ...
+    def renderer(self) -> typing.Optional[QgsVectorTileRenderer]: ...
+    def setRenderer(self, r: typing.Optional[QgsVectorTileRenderer]) -> None: ...
+    def sourceMaxZoom(self) -> int: ...
+    def sourceMinZoom(self) -> int: ...
+    def sourcePath(self) -> str: ...
+    def sourceType(self) -> str: ...
+    def tileMatrixSet(self) -> 'QgsVectorTileMatrixSet': ...
+    def htmlMetadata(self) -> str: ...
+    def decodedSource(self, source: typing.Optional[str], provider: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def encodedSource(self, source: typing.Optional[str], context: QgsReadWriteContext) -> str: ...
+    def loadDefaultMetadata(self) -> typing.Tuple[str, bool]: ...
+    def loadDefaultStyleAndSubLayers(self, error: typing.Optional[str], warnings: collections.abc.Iterable[typing.Optional[str]]) -> typing.Tuple[bool, list[QgsMapLayer]]: ...
+    def properties(self) -> Qgis.MapLayerProperties: ...
+    def loadDefaultStyle(self) -> typing.Tuple[str, bool]: ...
+    def setTransformContext(self, transformContext: QgsCoordinateTransformContext) -> None: ...
+    def writeSymbology(self, node: QtXml.QDomNode, doc: QtXml.QDomDocument, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def readSymbology(self, node: QtXml.QDomNode, errorMessage: typing.Optional[str], context: QgsReadWriteContext, categories: typing.Union[QgsMapLayer.StyleCategories, QgsMapLayer.StyleCategory] = ...) -> bool: ...
+    def writeXml(self, layerNode: QtXml.QDomNode, doc: QtXml.QDomDocument, context: QgsReadWriteContext) -> bool: ...
+    def readXml(self, layerNode: QtXml.QDomNode, context: QgsReadWriteContext) -> bool: ...
+    def createMapRenderer(self, rendererContext: QgsRenderContext) -> typing.Optional[QgsMapLayerRenderer]: ...
+    def dataProvider(self) -> typing.Optional[QgsDataProvider]: ...
+    def clone(self) -> typing.Optional['QgsVectorTileLayer']: ...
+    def __repr__(self) -> typing.Any: ...
+
+
+class QgsVectorTileMatrixSet(QgsTileMatrixSet):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileMatrixSet') -> None: ...
+
+    def fromEsriJson(self, json: dict[str, typing.Any], rootTileMap: dict[str, typing.Any] = ...) -> bool: ...
+    @staticmethod
+    def fromWebMercator(minimumZoom: int = ..., maximumZoom: int = ...) -> 'QgsVectorTileMatrixSet': ...
+
+
+class QgsVectorTileRendererData(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self, id: QgsTileXYZ) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileRendererData') -> None: ...
+
+    def layerFeatures(self, layerName: typing.Optional[str]) -> list[QgsFeature]: ...
+    def layers(self) -> list[str]: ...
+    def fields(self) -> dict[str, QgsFields]: ...
+    def setFields(self, fields: dict[typing.Optional[str], QgsFields]) -> None: ...
+    def renderZoomLevel(self) -> int: ...
+    def setRenderZoomLevel(self, level: int) -> None: ...
+    def tilePolygon(self) -> QtGui.QPolygon: ...
+    def setTilePolygon(self, polygon: QtGui.QPolygon) -> None: ...
+    def id(self) -> QgsTileXYZ: ...
+
+
+class QgsVectorTileUtils(PyQt5.sip.wrapper):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileUtils') -> None: ...
+
+    @staticmethod
+    def resolveMapboxUri(uri: typing.Optional[str], accessToken: typing.Optional[str]) -> str: ...
+    @staticmethod
+    def loadSprites(styleDefinition: dict[str, typing.Any], context: QgsMapBoxGlStyleConversionContext, styleUrl: typing.Optional[str] = ...) -> None: ...
+    @staticmethod
+    def checkXYZUrlTemplate(url: typing.Optional[str]) -> bool: ...
+    @staticmethod
+    def formatXYZUrlTemplate(url: typing.Optional[str], tile: QgsTileXYZ, tileMatrix: QgsTileMatrix) -> str: ...
+    @staticmethod
+    def makeVectorLayerForTile(mvt: typing.Optional[QgsVectorTileLayer], tileID: QgsTileXYZ, layerName: typing.Optional[str]) -> typing.Optional[QgsVectorLayer]: ...
+    @staticmethod
+    def scaleToZoomLevel(mapScale: float, sourceMinZoom: int, sourceMaxZoom: int, z0Scale: float = ...) -> int: ...
+    @staticmethod
+    def scaleToZoom(mapScale: float, z0Scale: float = ...) -> float: ...
+    @staticmethod
+    def makeQgisFields(flds: collections.abc.Iterable[typing.Optional[str]]) -> QgsFields: ...
+    @staticmethod
+    def tilePolygon(id: QgsTileXYZ, ct: QgsCoordinateTransform, tm: QgsTileMatrix, mtp: QgsMapToPixel) -> QtGui.QPolygon: ...
+    @staticmethod
+    def sortTilesByDistanceFromCenter(tiles: collections.abc.Iterable[QgsTileXYZ], center: typing.Union[QtCore.QPointF, QtCore.QPoint]) -> None: ...
+    @staticmethod
+    def updateUriSources(uri: typing.Optional[str], forceUpdate: bool = ...) -> str: ...
+
+
+class QgsVectorTileWriter(PyQt5.sip.wrapper):
+
+    class Layer(PyQt5.sip.wrapper):
+
+        @typing.overload
+        def __init__(self, layer: typing.Optional[QgsVectorLayer]) -> None: ...
+        @typing.overload
+        def __init__(self, a0: 'QgsVectorTileWriter.Layer') -> None: ...
+
+        def setMaxZoom(self, maxzoom: int) -> None: ...
+        def maxZoom(self) -> int: ...
+        def setMinZoom(self, minzoom: int) -> None: ...
+        def minZoom(self) -> int: ...
+        def setLayerName(self, name: typing.Optional[str]) -> None: ...
+        def layerName(self) -> str: ...
+        def setFilterExpression(self, expr: typing.Optional[str]) -> None: ...
+        def filterExpression(self) -> str: ...
+        def layer(self) -> typing.Optional[QgsVectorLayer]: ...
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, a0: 'QgsVectorTileWriter') -> None: ...
+
+    def writeSingleTile(self, tileID: QgsTileXYZ, feedback: typing.Optional[QgsFeedback] = ..., buffer: int = ..., resolution: int = ...) -> QtCore.QByteArray: ...
+    def fullExtent(self) -> QgsRectangle: ...
+    def errorMessage(self) -> str: ...
+    def writeTiles(self, feedback: typing.Optional[QgsFeedback] = ...) -> bool: ...
+    def setRootTileMatrix(self, tileMatrix: QgsTileMatrix) -> bool: ...
+    def setTransformContext(self, transformContext: QgsCoordinateTransformContext) -> None: ...
+    def setMetadata(self, metadata: dict[str, typing.Any]) -> None: ...
+    def setLayers(self, layers: collections.abc.Iterable['QgsVectorTileWriter.Layer']) -> None: ...
+    def setMaxZoom(self, maxZoom: int) -> None: ...
+    def setMinZoom(self, minZoom: int) -> None: ...
+    def setExtent(self, extent: QgsRectangle) -> None: ...
+    def setDestinationUri(self, uri: typing.Optional[str]) -> None: ...
+
+
+class QgsVtpkTiles(PyQt5.sip.wrapper):
+
+    def __init__(self, filename: typing.Optional[str]) -> None: ...
+
+    def tileData(self, z: int, x: int, y: int) -> QtCore.QByteArray: ...
+    def extent(self, context: QgsCoordinateTransformContext) -> QgsRectangle: ...
+    def crs(self) -> QgsCoordinateReferenceSystem: ...
+    def matrixSet(self) -> QgsVectorTileMatrixSet: ...
+    def rootTileMap(self) -> dict[str, typing.Any]: ...
+    def layerMetadata(self) -> QgsLayerMetadata: ...
+    def spriteImage(self) -> QtGui.QImage: ...
+    def spriteDefinition(self) -> dict[str, typing.Any]: ...
+    def styleDefinition(self) -> dict[str, typing.Any]: ...
+    def metadata(self) -> dict[str, typing.Any]: ...
+    def isOpen(self) -> bool: ...
+    def open(self) -> bool: ...
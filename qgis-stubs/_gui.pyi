@@ -6232,9 +6232,7 @@ class QgsActionMenu(QtWidgets.QMenu):
         @typing.overload
         def __init__(self) -> None: ...
         @typing.overload
-        def __init__(self, action: _core.QgsAction, featureId: int, mapLayer: typing.Optional[_core.QgsMapLayer]) -> None: ...
-        @typing.overload
-        def __init__(self, action: typing.Optional['QgsMapLayerAction'], featureId: int, mapLayer: typing.Optional[_core.QgsMapLayer]) -> None: ...
+        def __init__(self, action: typing.Optional[typing.Union[_core.QgsAction, QgsMapLayerAction]], featureId: int, mapLayer: typing.Optional[_core.QgsMapLayer]) -> None: ...
         @typing.overload
         def __init__(self, a0: 'QgsActionMenu.ActionData') -> None: ...
 
@@ -9496,9 +9494,7 @@ class QgsMapTool(QtCore.QObject):
     def toCanvasCoordinates(self, point: _core.QgsPointXY) -> QtCore.QPoint: ...
     def toMapCoordinatesV2(self, layer: typing.Optional[_core.QgsMapLayer], point: _core.QgsPoint) -> _core.QgsPoint: ...
     @typing.overload
-    def toLayerCoordinates(self, layer: typing.Optional[_core.QgsMapLayer], point: QtCore.QPoint) -> _core.QgsPointXY: ...
-    @typing.overload
-    def toLayerCoordinates(self, layer: typing.Optional[_core.QgsMapLayer], point: _core.QgsPointXY) -> _core.QgsPointXY: ...
+    def toLayerCoordinates(self, layer: typing.Optional[_core.QgsMapLayer], point: typing.Union[QtCore.QPoint, _core.QgsPointXY]) -> _core.QgsPointXY: ...
     @typing.overload
     def toLayerCoordinates(self, layer: typing.Optional[_core.QgsMapLayer], rect: _core.QgsRectangle) -> _core.QgsRectangle: ...
     def toLayerCoordinatesV2(self, layer: typing.Optional[_core.QgsMapLayer], point: _core.QgsPoint) -> _core.QgsPoint: ...
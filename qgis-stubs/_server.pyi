@@ -483,9 +483,7 @@ class QgsServerRequest(PyQt5.sip.wrapper):
     @typing.overload
     def __init__(self) -> None: ...
     @typing.overload
-    def __init__(self, url: typing.Optional[str], method: 'QgsServerRequest.Method' = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ...) -> None: ...
-    @typing.overload
-    def __init__(self, url: QtCore.QUrl, method: 'QgsServerRequest.Method' = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ...) -> None: ...
+    def __init__(self, url: typing.Optional[typing.Union[str, QtCore.QUrl]], method: 'QgsServerRequest.Method' = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ...) -> None: ...
     @typing.overload
     def __init__(self, other: 'QgsServerRequest') -> None: ...
 
@@ -518,9 +516,7 @@ class QgsServerRequest(PyQt5.sip.wrapper):
 class QgsBufferServerRequest(QgsServerRequest):
 
     @typing.overload
-    def __init__(self, url: typing.Optional[str], method: QgsServerRequest.Method = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ..., data: typing.Optional[typing.Union[QtCore.QByteArray, bytes, bytearray]] = ...) -> None: ...
-    @typing.overload
-    def __init__(self, url: QtCore.QUrl, method: QgsServerRequest.Method = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ..., data: typing.Optional[typing.Union[QtCore.QByteArray, bytes, bytearray]] = ...) -> None: ...
+    def __init__(self, url: typing.Optional[typing.Union[str, QtCore.QUrl]], method: QgsServerRequest.Method = ..., headers: dict[typing.Optional[str], typing.Optional[str]] = ..., data: typing.Optional[typing.Union[QtCore.QByteArray, bytes, bytearray]] = ...) -> None: ...
     @typing.overload
     def __init__(self, a0: 'QgsBufferServerRequest') -> None: ...
 
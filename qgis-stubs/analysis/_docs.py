@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Docstrings of the qgis.analysis bindings, installed by qgis.analysis.load_docs()
+
+This file has been generated by scripts/extract_docstrings.py
+It is not aimed to be manually edited
+"""
+
+DOCS = (
+    ('QgsAlignRaster.RA_NearestNeighbour', 'Nearest neighbour (select on one input pixel)'),
+    ('QgsAlignRaster.RA_Bilinear', 'Bilinear (2x2 kernel)'),
+    ('QgsAlignRaster.RA_Cubic', 'Cubic Convolution Approximation (4x4 kernel)'),
+    ('QgsAlignRaster.RA_CubicSpline', 'Cubic B-Spline Approximation (4x4 kernel)'),
+    ('QgsAlignRaster.RA_Lanczos', 'Lanczos windowed sinc interpolation (6x6 kernel)'),
+    ('QgsAlignRaster.RA_Average', 'Average (computes the average of all non-NODATA contributing pixels)'),
+    ('QgsAlignRaster.RA_Mode', 'Mode (selects the value which appears most often of all the sampled points)'),
+    ('QgsAlignRaster.RA_Max', 'Maximum (selects the maximum of all non-NODATA contributing pixels)'),
+    ('QgsAlignRaster.RA_Min', 'Minimum (selects the minimum of all non-NODATA contributing pixels)'),
+    ('QgsAlignRaster.RA_Median', 'Median (selects the median of all non-NODATA contributing pixels)'),
+    ('QgsAlignRaster.RA_Q1', 'First quartile (selects the first quartile of all non-NODATA contributing pixels)'),
+    ('QgsAlignRaster.RA_Q3', 'Third quartile (selects the third quartile of all non-NODATA contributing pixels)'),
+    ('QgsZonalStatistics.Count', 'Pixel count'),
+    ('QgsZonalStatistics.Sum', 'Sum of pixel values'),
+    ('QgsZonalStatistics.Mean', 'Mean of pixel values'),
+    ('QgsZonalStatistics.Median', 'Median of pixel values'),
+    ('QgsZonalStatistics.StDev', 'Standard deviation of pixel values'),
+    ('QgsZonalStatistics.Min', 'Min of pixel values'),
+    ('QgsZonalStatistics.Max', 'Max of pixel values'),
+    ('QgsZonalStatistics.Range', 'Range of pixel values (max - min)'),
+    ('QgsZonalStatistics.Minority', 'Minority of pixel values'),
+    ('QgsZonalStatistics.Majority', 'Majority of pixel values'),
+    ('QgsZonalStatistics.Variety', 'Variety (count of distinct) pixel values'),
+    ('QgsZonalStatistics.Variance', 'Variance of pixel values'),
+    ('QgsZonalStatistics.All', 'All statistics'),
+    ('QgsZonalStatistics.Default', 'Default statistics'),
+    ('QgsZonalStatistics.Success', 'Success'),
+    ('QgsZonalStatistics.LayerTypeWrong', 'Layer is not a polygon layer'),
+    ('QgsZonalStatistics.LayerInvalid', 'Layer is invalid'),
+    ('QgsZonalStatistics.RasterInvalid', 'Raster layer is invalid'),
+    ('QgsZonalStatistics.RasterBandInvalid', 'The raster band does not exist on the raster layer'),
+    ('QgsZonalStatistics.FailedToCreateField', 'Output fields could not be created'),
+    ('QgsZonalStatistics.Canceled', 'Algorithm was canceled'),
+    ('QgsAlignRaster.RasterInfo', 'Utility class for gathering information about rasters'),
+    ('QgsAlignRaster.ProgressHandler', 'Helper struct to be sub-classed for progress reporting'),
+    ('QgsGcpPoint.PointType.Source', 'Source point'),
+    ('QgsGcpPoint.PointType.Destination', 'Destination point'),
+    ('QgsGcpPoint.PointType', 'Coordinate point types\n\n* ``Source``: Source point\n* ``Destination``: Destination point\n\n'),
+    ('QgsGcpTransformerInterface.TransformMethod.Linear', 'Linear transform'),
+    ('QgsGcpTransformerInterface.TransformMethod.Helmert', 'Helmert transform'),
+    ('QgsGcpTransformerInterface.TransformMethod.PolynomialOrder1', 'Polynomial order 1'),
+    ('QgsGcpTransformerInterface.TransformMethod.PolynomialOrder2', 'Polyonmial order 2'),
+    ('QgsGcpTransformerInterface.TransformMethod.PolynomialOrder3', 'Polynomial order'),
+    ('QgsGcpTransformerInterface.TransformMethod.ThinPlateSpline', 'Thin plate splines'),
+    ('QgsGcpTransformerInterface.TransformMethod.Projective', 'Projective'),
+    ('QgsGcpTransformerInterface.TransformMethod.InvalidTransform', 'Invalid transform'),
+    ('QgsGcpTransformerInterface.TransformMethod', 'Available transformation methods.\n\n* ``Linear``: Linear transform\n* ``Helmert``: Helmert transform\n* ``PolynomialOrder1``: Polynomial order 1\n* ``PolynomialOrder2``: Polyonmial order 2\n* ``PolynomialOrder3``: Polynomial order\n* ``ThinPlateSpline``: Thin plate splines\n* ``Projective``: Projective\n* ``InvalidTransform``: Invalid transform\n\n'),
+    ('QgsGeometryCheck.Result.Success', 'Operation completed successfully'),
+    ('QgsGeometryCheck.Result.Canceled', 'User canceled calculation'),
+    ('QgsGeometryCheck.Result.DuplicatedUniqueId', 'Found duplicated unique ID value'),
+    ('QgsGeometryCheck.Result.InvalidReferenceLayer', 'Missed or invalid reference layer'),
+    ('QgsGeometryCheck.Result.GeometryOverlayError', 'Error performing geometry overlay operation'),
+    ('QgsGeometryCheck.Result', '\n.. versionadded:: 4.0\n\n* ``Success``: Operation completed successfully\n* ``Canceled``: User canceled calculation\n* ``DuplicatedUniqueId``: Found duplicated unique ID value\n* ``InvalidReferenceLayer``: Missed or invalid reference layer\n* ``GeometryOverlayError``: Error performing geometry overlay operation\n\n'),
+    ('QgsGeometryCheck.Change', 'Descripts a change to fix a geometry.\n\n.. versionadded:: 3.4'),
+    ('QgsGeometryCheck.LayerFeatureIds', 'A list of layers and feature ids for each of these layers.\nIn C++, the member `ids` can be accessed directly.\nIn Python some accessor methods will need to be written.\n\n.. versionadded:: 3.4'),
+    ('QgsInterpolator.SourcePoints', 'Point source'),
+    ('QgsInterpolator.SourceStructureLines', 'Structure lines'),
+    ('QgsInterpolator.SourceBreakLines', 'Break lines'),
+    ('QgsInterpolator.SourceType', 'Describes the type of input data\n\n* ``Points``: Point source\n\n  Available as ``QgsInterpolator.SourcePoints`` in older QGIS releases.\n\n* ``StructureLines``: Structure lines\n\n  Available as ``QgsInterpolator.SourceStructureLines`` in older QGIS releases.\n\n* ``BreakLines``: Break lines\n\n  Available as ``QgsInterpolator.SourceBreakLines`` in older QGIS releases.\n\n\n'),
+    ('QgsInterpolator.ValueAttribute', "Take value from feature's attribute"),
+    ('QgsInterpolator.ValueZ', "Use feature's geometry Z values for interpolation"),
+    ('QgsInterpolator.ValueM', "Use feature's geometry M values for interpolation"),
+    ('QgsInterpolator.ValueSource', "Source for interpolated values from features\n\n* ``Attribute``: Take value from feature's attribute\n\n  Available as ``QgsInterpolator.ValueAttribute`` in older QGIS releases.\n\n* ``Z``: Use feature's geometry Z values for interpolation\n\n  Available as ``QgsInterpolator.ValueZ`` in older QGIS releases.\n\n* ``M``: Use feature's geometry M values for interpolation\n\n  Available as ``QgsInterpolator.ValueM`` in older QGIS releases.\n\n\n"),
+    ('QgsInterpolator.Result.Success', 'Operation was successful'),
+    ('QgsInterpolator.Result.Canceled', 'Operation was manually canceled'),
+    ('QgsInterpolator.Result.InvalidSource', 'Operation failed due to invalid source'),
+    ('QgsInterpolator.Result.FeatureGeometryError', 'Operation failed due to invalid feature geometry'),
+    ('QgsInterpolator.Result', 'Result of an interpolation operation\n\n* ``Success``: Operation was successful\n* ``Canceled``: Operation was manually canceled\n* ``InvalidSource``: Operation failed due to invalid source\n* ``FeatureGeometryError``: Operation failed due to invalid feature geometry\n\n'),
+    ('QgsInterpolatorVertexData', 'Interpolation data for an individual source vertex.'),
+    ('QgsInterpolator.LayerData', 'A source together with the information about interpolation attribute / z-coordinate interpolation and the type (point, structure line, breakline)'),
+    ('QgsKernelDensityEstimation.KernelQuartic', 'Quartic kernel'),
+    ('QgsKernelDensityEstimation.KernelTriangular', 'Triangular kernel'),
+    ('QgsKernelDensityEstimation.KernelUniform', 'Uniform (flat) kernel'),
+    ('QgsKernelDensityEstimation.KernelTriweight', 'Triweight kernel'),
+    ('QgsKernelDensityEstimation.KernelEpanechnikov', 'Epanechnikov kernel'),
+    ('QgsKernelDensityEstimation.KernelShape', 'Kernel shape type\n\n* ``Quartic``: Quartic kernel\n\n  Available as ``QgsKernelDensityEstimation.KernelQuartic`` in older QGIS releases.\n\n* ``Triangular``: Triangular kernel\n\n  Available as ``QgsKernelDensityEstimation.KernelTriangular`` in older QGIS releases.\n\n* ``Uniform``: Uniform (flat) kernel\n\n  Available as ``QgsKernelDensityEstimation.KernelUniform`` in older QGIS releases.\n\n* ``Triweight``: Triweight kernel\n\n  Available as ``QgsKernelDensityEstimation.KernelTriweight`` in older QGIS releases.\n\n* ``Epanechnikov``: Epanechnikov kernel\n\n  Available as ``QgsKernelDensityEstimation.KernelEpanechnikov`` in older QGIS releases.\n\n\n'),
+    ('QgsKernelDensityEstimation.OutputRaw', 'Output the raw KDE values'),
+    ('QgsKernelDensityEstimation.OutputScaled', 'Output mathematically correct scaled values'),
+    ('QgsKernelDensityEstimation.OutputValues', 'Output values type\n\n* ``Raw``: Output the raw KDE values\n\n  Available as ``QgsKernelDensityEstimation.OutputRaw`` in older QGIS releases.\n\n* ``Scaled``: Output mathematically correct scaled values\n\n  Available as ``QgsKernelDensityEstimation.OutputScaled`` in older QGIS releases.\n\n\n'),
+    ('QgsKernelDensityEstimation.Success', 'Operation completed successfully'),
+    ('QgsKernelDensityEstimation.DriverError', 'Could not open the driver for the specified format'),
+    ('QgsKernelDensityEstimation.InvalidParameters', 'Input parameters were not valid'),
+    ('QgsKernelDensityEstimation.FileCreationError', 'Error creating output file'),
+    ('QgsKernelDensityEstimation.RasterIoError', 'Error writing to raster'),
+    ('QgsKernelDensityEstimation.Result', 'Result of operation\n\n* ``Success``: Operation completed successfully\n* ``DriverError``: Could not open the driver for the specified format\n* ``InvalidParameters``: Input parameters were not valid\n* ``FileCreationError``: Error creating output file\n* ``RasterIoError``: Error writing to raster\n\n'),
+    ('QgsKernelDensityEstimation.Parameters', 'KDE parameters'),
+    ('QgsNineCellFilter.Result.Success', 'Operation completed successfully'),
+    ('QgsNineCellFilter.Result.InputLayerError', 'Error reading input file'),
+    ('QgsNineCellFilter.Result.DriverError', 'Could not open the driver for the specified format'),
+    ('QgsNineCellFilter.Result.CreateOutputError', 'Error creating output file'),
+    ('QgsNineCellFilter.Result.InputBandError', 'Error reading input raster band'),
+    ('QgsNineCellFilter.Result.OutputBandError', 'Error reading output raster band'),
+    ('QgsNineCellFilter.Result.RasterSizeError', 'Raster height is too small (need at least 3 rows)'),
+    ('QgsNineCellFilter.Result.Canceled', 'User canceled calculation'),
+    ('QgsNineCellFilter.Result', '\n.. versionadded:: 3.44\n\n* ``Success``: Operation completed successfully\n* ``InputLayerError``: Error reading input file\n* ``DriverError``: Could not open the driver for the specified format\n* ``CreateOutputError``: Error creating output file\n* ``InputBandError``: Error reading input raster band\n* ``OutputBandError``: Error reading output raster band\n* ``RasterSizeError``: Raster height is too small (need at least 3 rows)\n* ``Canceled``: User canceled calculation\n\n'),
+    ('QgsRasterCalculator.Success', 'Calculation successful'),
+    ('QgsRasterCalculator.CreateOutputError', 'Error creating output data file'),
+    ('QgsRasterCalculator.InputLayerError', 'Error reading input layer'),
+    ('QgsRasterCalculator.Canceled', 'User canceled calculation'),
+    ('QgsRasterCalculator.ParserError', 'Error parsing formula'),
+    ('QgsRasterCalculator.MemoryError', 'Error allocating memory for result'),
+    ('QgsRasterCalculator.BandError', 'Invalid band number for input'),
+    ('QgsRasterCalculator.CalculationError', 'Error occurred while performing calculation'),
+    ('QgsRasterCalculator.OpenCLKernelBuildError', 'Error building OpenCL kernel'),
+    ('QgsRasterCalculator.Result', 'Result of the calculation\n\n* ``Success``: Calculation successful\n* ``CreateOutputError``: Error creating output data file\n* ``InputLayerError``: Error reading input layer\n* ``Canceled``: User canceled calculation\n* ``ParserError``: Error parsing formula\n* ``MemoryError``: Error allocating memory for result\n* ``BandError``: Invalid band number for input\n* ``CalculationError``: Error occurred while performing calculation\n* ``OpenCLKernelBuildError``: Error building OpenCL kernel\n\n'),
+    ('QgsTinInterpolator.Linear', 'Linear interpolation'),
+    ('QgsTinInterpolator.CloughTocher', 'Clough-Tocher interpolation'),
+    ('QgsTinInterpolator.TinInterpolation', 'Indicates the type of interpolation to be performed\n\n* ``Linear``: Linear interpolation\n* ``CloughTocher``: Clough-Tocher interpolation\n\n'),
+    ('QgsVectorWarperTask.Result.Success', 'Warping completed successfully'),
+    ('QgsVectorWarperTask.Result.Canceled', 'Task was canceled before completion'),
+    ('QgsVectorWarperTask.Result.Error', 'An error occurred while warping'),
+    ('QgsVectorWarperTask.Result', 'Task results\n\n* ``Success``: Warping completed successfully\n* ``Canceled``: Task was canceled before completion\n* ``Error``: An error occurred while warping\n\n'),
+)
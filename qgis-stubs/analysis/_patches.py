@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Generated class patches of the qgis.analysis bindings, applied on import
+
+This file has been generated by scripts/build_patch_tables.py
+It is not aimed to be manually edited
+"""
+
+PATCHES = (
+    ('src/analysis/processing/qgsalgorithmbatchgeocode.h', (
+        ('QgsBatchGeocodeAlgorithm', (('__overridden_methods__', ('initParameters', 'tags', 'group', 'groupId', 'inputLayerTypes', 'supportInPlaceEdit', 'outputName', 'prepareAlgorithm', 'processFeature', 'outputCrs', 'outputFields', 'outputWkbType')), ('__group__', ('processing',)))),
+    )),
+    ('src/analysis/raster/qgsalignraster.h', (
+        ('QgsAlignRaster', ('suggestedWarpOutput', ('__abstract_methods__', ('progress',)), ('__group__', ('raster',)))),
+        ('QgsAlignRaster.RasterInfo', (('__group__', ('raster',)),)),
+        ('QgsAlignRaster.ProgressHandler', (('__group__', ('raster',)),)),
+    )),
+    ('src/analysis/qgsanalysis.h', (
+        ('QgsAnalysis', ('instance', 'geometryCheckRegistry')),
+    )),
+    ('src/analysis/raster/qgsaspectfilter.h', (
+        ('QgsAspectFilter', (('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/raster/qgsderivativefilter.h', (
+        ('QgsDerivativeFilter', (('__abstract_methods__', ('processNineCellWindow',)), ('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsfeaturepool.h', (
+        ('QgsFeaturePool', (('__abstract_methods__', ('updateFeature', 'deleteFeature')), ('__group__', ('vector', 'geometry_checker')))),
+    )),
+    ('src/analysis/georeferencing/qgsgcpgeometrytransformer.h', (
+        ('QgsGcpGeometryTransformer', (('__overridden_methods__', ('transformPoint',)), ('__group__', ('georeferencing',)))),
+    )),
+    ('src/analysis/georeferencing/qgsgcppoint.h', (
+        ('QgsGcpPoint', (('__group__', ('georeferencing',)),)),
+    )),
+    ('src/analysis/georeferencing/qgsgcptransformer.h', (
+        ('QgsGcpTransformerInterface', ('methodToString', 'create', 'createFromParameters', ('__abstract_methods__', ('clone', 'updateParametersFromGcps', 'minimumGcpCount', 'method')), ('__group__', ('georeferencing',)))),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheck.h', (
+        ('QgsGeometryCheck.Change', (('__attribute_docs__', (('what', 'What level this change affects.'), ('type', 'What action this change performs.'), ('vidx', 'The index of the part / ring / vertex, depending on :py:func:`what`.'))), ('__annotations__', (('what', 'QgsGeometryCheck.ChangeWhat'), ('type', 'QgsGeometryCheck.ChangeType'), ('vidx', 'QgsVertexId'))), ('__group__', ('vector', 'geometry_checker')))),
+        ('QgsGeometryCheck', (('__virtual_methods__', ('prepare', 'isCompatible', 'flags', 'collectErrors', 'availableResolutionMethods', 'resolutionMethods')), ('__abstract_methods__', ('compatibleGeometryTypes', 'description', 'id', 'checkType')), ('__group__', ('vector', 'geometry_checker')))),
+        ('QgsGeometryCheck.LayerFeatureIds', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckcontext.h', (
+        ('QgsGeometryCheckContext', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckerror.h', (
+        ('QgsGeometryCheckError', (('__virtual_methods__', ('contextBoundingBox', 'affectedAreaBBox', 'description', 'isEqual', 'closeMatch', 'update', 'icon')), ('__group__', ('vector', 'geometry_checker')))),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckerutils.h', (
+        ('QgsGeometryCheckerUtils', (('__group__', ('vector', 'geometry_checker')),)),
+        ('QgsGeometryCheckerUtils.LayerFeature', (('__group__', ('vector', 'geometry_checker')),)),
+        ('QgsGeometryCheckerUtils.LayerFeatures', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckfactory.h', (
+        ('QgsGeometryCheckFactory', (('__abstract_methods__', ('createGeometryCheck', 'id', 'description', 'isCompatible', 'flags', 'checkType')), ('__group__', ('vector', 'geometry_checker')))),
+        ('QgsGeometryCheckFactoryT', (('__overridden_methods__', ('createGeometryCheck', 'description', 'id', 'isCompatible', 'flags', 'checkType')), ('__group__', ('vector', 'geometry_checker')))),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckregistry.h', (
+        ('QgsGeometryCheckRegistry', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/vector/geometry_checker/qgsgeometrycheckresolutionmethod.h', (
+        ('QgsGeometryCheckResolutionMethod', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/vector/qgsgeometrysnapper.h', (
+        ('QgsGeometrySnapper', (('__attribute_docs__', (('featureSnapped', 'Emitted each time a feature has been processed when calling\n:py:func:`~QgsGeometrySnapper.snapFeatures`\n'),)), ('__group__', ('vector',)))),
+        ('QgsInternalGeometrySnapper', (('__group__', ('vector',)),)),
+    )),
+    ('src/analysis/vector/qgsgeometrysnappersinglesource.h', (
+        ('QgsGeometrySnapperSingleSource', ('run', ('__group__', ('vector',)))),
+    )),
+    ('src/analysis/network/qgsgraph.h', (
+        ('QgsGraphEdge', (('__group__', ('network',)),)),
+        ('QgsGraphVertex', (('__group__', ('network',)),)),
+        ('QgsGraph', (('__group__', ('network',)),)),
+    )),
+    ('src/analysis/network/qgsgraphanalyzer.h', (
+        ('QgsGraphAnalyzer', ('dijkstra', 'shortestTree', ('__group__', ('network',)))),
+    )),
+    ('src/analysis/network/qgsgraphbuilder.h', (
+        ('QgsGraphBuilder', (('__overridden_methods__', ('addVertex', 'addEdge')), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/network/qgsgraphbuilderinterface.h', (
+        ('QgsGraphBuilderInterface', (('__virtual_methods__', ('addVertex', 'addEdge')), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/network/qgsgraphdirector.h', (
+        ('QgsGraphDirector', (('__virtual_methods__', ('makeGraph',)), ('__abstract_methods__', ('name',)), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/interpolation/qgsgridfilewriter.h', (
+        ('QgsGridFileWriter', (('__group__', ('interpolation',)),)),
+    )),
+    ('src/analysis/raster/qgshillshadefilter.h', (
+        ('QgsHillshadeFilter', (('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/interpolation/qgsidwinterpolator.h', (
+        ('QgsIDWInterpolator', (('__overridden_methods__', ('interpolatePoint',)), ('__group__', ('interpolation',)))),
+    )),
+    ('src/analysis/interpolation/qgsinterpolator.h', (
+        ('QgsInterpolator', (('__abstract_methods__', ('interpolatePoint',)), ('__group__', ('interpolation',)))),
+    )),
+    ('src/analysis/raster/qgskde.h', (
+        ('QgsKernelDensityEstimation', (('__group__', ('raster',)),)),
+    )),
+    ('src/analysis/mesh/qgsmeshcontours.h', (
+        ('QgsMeshContours', (('__group__', ('mesh',)),)),
+    )),
+    ('src/analysis/mesh/qgsmeshtriangulation.h', (
+        ('QgsMeshZValueDatasetGroup', (('__overridden_methods__', ('initialize', 'datasetMetadata', 'datasetCount', 'dataset', 'type', 'writeXml')), ('__group__', ('mesh',)))),
+        ('QgsMeshEditingDelaunayTriangulation', (('__overridden_methods__', ('text',)), ('__group__', ('mesh',)))),
+        ('QgsMeshTriangulation', (('__group__', ('mesh',)),)),
+    )),
+    ('src/analysis/processing/qgsnativealgorithms.h', (
+        ('QgsNativeAlgorithms', (('__overridden_methods__', ('icon', 'svgIconPath', 'id', 'helpId', 'name', 'supportsNonFileBasedOutput', 'flags', 'loadAlgorithms')), ('__group__', ('processing',)))),
+    )),
+    ('src/analysis/network/qgsnetworkdistancestrategy.h', (
+        ('QgsNetworkDistanceStrategy', (('__overridden_methods__', ('cost',)), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/network/qgsnetworkspeedstrategy.h', (
+        ('QgsNetworkSpeedStrategy', (('__overridden_methods__', ('cost', 'requiredAttributes')), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/network/qgsnetworkstrategy.h', (
+        ('QgsNetworkStrategy', (('__virtual_methods__', ('requiredAttributes',)), ('__abstract_methods__', ('cost',)), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/raster/qgsninecellfilter.h', (
+        ('QgsNineCellFilter', (('__abstract_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/processing/pdal/qgspdalalgorithms.h', (
+        ('QgsPdalAlgorithms', (('__overridden_methods__', ('icon', 'svgIconPath', 'id', 'helpId', 'name', 'supportsNonFileBasedOutput', 'supportedOutputVectorLayerExtensions', 'supportedOutputRasterLayerExtensions', 'supportedOutputPointCloudLayerExtensions', 'loadAlgorithms')), ('__group__', ('processing', 'pdal')))),
+    )),
+    ('src/analysis/raster/qgsrastercalcnode.h', (
+        ('QgsRasterCalcNode', ('parseRasterCalcString', ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/raster/qgsrastercalculator.h', (
+        ('QgsRasterCalculator', (('__group__', ('raster',)),)),
+    )),
+    ('src/analysis/raster/qgsrastermatrix.h', (
+        ('QgsRasterMatrix', (('__group__', ('raster',)),)),
+    )),
+    ('src/analysis/raster/qgsrelief.h', (
+        ('QgsRelief', (('__group__', ('raster',)),)),
+        ('QgsRelief.ReliefColor', (('__group__', ('raster',)),)),
+    )),
+    ('src/analysis/raster/qgsruggednessfilter.h', (
+        ('QgsRuggednessFilter', (('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/vector/geometry_checker/qgssinglegeometrycheck.h', (
+        ('QgsSingleGeometryCheckError', (('__virtual_methods__', ('update', 'isEqual', 'description')), ('__group__', ('vector', 'geometry_checker')))),
+        ('QgsSingleGeometryCheck', (('__virtual_methods__', ('collectErrors',)), ('__abstract_methods__', ('processGeometry',)), ('__group__', ('vector', 'geometry_checker')))),
+        ('QgsGeometryCheckErrorSingle', (('__group__', ('vector', 'geometry_checker')),)),
+    )),
+    ('src/analysis/raster/qgsslopefilter.h', (
+        ('QgsSlopeFilter', (('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/interpolation/qgstininterpolator.h', (
+        ('QgsTinInterpolator', ('triangulationFields', ('__overridden_methods__', ('interpolatePoint',)), ('__group__', ('interpolation',)))),
+    )),
+    ('src/analysis/raster/qgstotalcurvaturefilter.h', (
+        ('QgsTotalCurvatureFilter', (('__overridden_methods__', ('processNineCellWindow',)), ('__group__', ('raster',)))),
+    )),
+    ('src/analysis/network/qgsvectorlayerdirector.h', (
+        ('QgsVectorLayerDirector', (('__overridden_methods__', ('makeGraph', 'name')), ('__group__', ('network',)))),
+    )),
+    ('src/analysis/georeferencing/qgsvectorwarper.h', (
+        ('QgsVectorWarperTask', (('__overridden_methods__', ('cancel', 'run')), ('__group__', ('georeferencing',)))),
+        ('QgsVectorWarper', (('__group__', ('georeferencing',)),)),
+    )),
+    ('src/analysis/vector/qgszonalstatistics.h', (
+        ('QgsZonalStatistics', ('displayName', 'shortName', ('__group__', ('vector',)))),
+    )),
+)
@@ -0,0 +1,2881 @@
+# -*- coding: utf-8 -*-
+"""
+Docstrings of the qgis.core bindings, installed by qgis.core.load_docs()
+
+This file has been generated by scripts/extract_docstrings.py
+It is not aimed to be manually edited
+"""
+
+DOCS = (
+    ('Qgis.AuthConfigurationStorageCapability.ClearStorage', 'Can clear all configurations from storage'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadConfiguration', 'Can read an authentication configuration'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateConfiguration', 'Can update an authentication configuration'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteConfiguration', 'Can deleet an authentication configuration'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateConfiguration', 'Can create a new authentication configuration'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadCertificateIdentity', 'Can read a certificate identity'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateCertificateIdentity', 'Can update a certificate identity'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteCertificateIdentity', 'Can delete a certificate identity'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateCertificateIdentity', 'Can create a new certificate identity'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadSslCertificateCustomConfig', 'Can read a SSL certificate custom config'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateSslCertificateCustomConfig', 'Can update a SSL certificate custom config'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteSslCertificateCustomConfig', 'Can delete a SSL certificate custom config'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateSslCertificateCustomConfig', 'Can create a new SSL certificate custom config'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadCertificateAuthority', 'Can read a certificate authority'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateCertificateAuthority', 'Can update a certificate authority'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteCertificateAuthority', 'Can delete a certificate authority'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateCertificateAuthority', 'Can create a new certificate authority'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadCertificateTrustPolicy', 'Can read a certificate trust policy'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateCertificateTrustPolicy', 'Can update a certificate trust policy'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteCertificateTrustPolicy', 'Can delete a certificate trust policy'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateCertificateTrustPolicy', 'Can create a new certificate trust policy'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadMasterPassword', 'Can read the master password'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateMasterPassword', 'Can update the master password'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteMasterPassword', 'Can delete the master password'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateMasterPassword', 'Can create a new master password'),
+    ('Qgis.AuthConfigurationStorageCapability.ReadSetting', 'Can read the authentication settings'),
+    ('Qgis.AuthConfigurationStorageCapability.UpdateSetting', 'Can update the authentication setting'),
+    ('Qgis.AuthConfigurationStorageCapability.DeleteSetting', 'Can delete the authentication setting'),
+    ('Qgis.AuthConfigurationStorageCapability.CreateSetting', 'Can create a new authentication setting'),
+    ('Qgis.AuthConfigurationStorageCapability', 'Authentication configuration storage capabilities.\n\n.. versionadded:: 3.40\n\n* ``ClearStorage``: Can clear all configurations from storage\n* ``ReadConfiguration``: Can read an authentication configuration\n* ``UpdateConfiguration``: Can update an authentication configuration\n* ``DeleteConfiguration``: Can deleet an authentication configuration\n* ``CreateConfiguration``: Can create a new authentication configuration\n* ``ReadCertificateIdentity``: Can read a certificate identity\n* ``UpdateCertificateIdentity``: Can update a certificate identity\n* ``DeleteCertificateIdentity``: Can delete a certificate identity\n* ``CreateCertificateIdentity``: Can create a new certificate identity\n* ``ReadSslCertificateCustomConfig``: Can read a SSL certificate custom config\n* ``UpdateSslCertificateCustomConfig``: Can update a SSL certificate custom config\n* ``DeleteSslCertificateCustomConfig``: Can delete a SSL certificate custom config\n* ``CreateSslCertificateCustomConfig``: Can create a new SSL certificate custom config\n* ``ReadCertificateAuthority``: Can read a certificate authority\n* ``UpdateCertificateAuthority``: Can update a certificate authority\n* ``DeleteCertificateAuthority``: Can delete a certificate authority\n* ``CreateCertificateAuthority``: Can create a new certificate authority\n* ``ReadCertificateTrustPolicy``: Can read a certificate trust policy\n* ``UpdateCertificateTrustPolicy``: Can update a certificate trust policy\n* ``DeleteCertificateTrustPolicy``: Can delete a certificate trust policy\n* ``CreateCertificateTrustPolicy``: Can create a new certificate trust policy\n* ``ReadMasterPassword``: Can read the master password\n* ``UpdateMasterPassword``: Can update the master password\n* ``DeleteMasterPassword``: Can delete the master password\n* ``CreateMasterPassword``: Can create a new master password\n* ``ReadSetting``: Can read the authentication settings\n* ``UpdateSetting``: Can update the authentication setting\n* ``DeleteSetting``: Can delete the authentication setting\n* ``CreateSetting``: Can create a new authentication setting\n\n'),
+    ('QgsMapLayer.VectorLayer', 'Vector layer'),
+    ('QgsMapLayer.RasterLayer', 'Raster layer'),
+    ('QgsMapLayer.PluginLayer', 'Plugin based layer'),
+    ('QgsMapLayer.MeshLayer', 'Mesh layer. Added in QGIS 3.2'),
+    ('QgsMapLayer.VectorTileLayer', 'Vector tile layer. Added in QGIS 3.14'),
+    ('QgsMapLayer.AnnotationLayer', 'Contains freeform, georeferenced annotations. Added in QGIS 3.16'),
+    ('QgsMapLayer.PointCloudLayer', 'Point cloud layer. Added in QGIS 3.18'),
+    ('QgsMapLayer.GroupLayer', 'Composite group layer. Added in QGIS 3.24'),
+    ('QgsMapLayer.TiledScene', 'Tiled scene layer. Added in QGIS 3.34'),
+    ('Qgis.LayerType', 'Types of layers that can be added to a map\n\n.. versionadded:: 3.30.\n\n* ``Vector``: Vector layer\n\n  Available as ``QgsMapLayer.VectorLayer`` in older QGIS releases.\n\n* ``Raster``: Raster layer\n\n  Available as ``QgsMapLayer.RasterLayer`` in older QGIS releases.\n\n* ``Plugin``: Plugin based layer\n\n  Available as ``QgsMapLayer.PluginLayer`` in older QGIS releases.\n\n* ``Mesh``: Mesh layer. Added in QGIS 3.2\n\n  Available as ``QgsMapLayer.MeshLayer`` in older QGIS releases.\n\n* ``VectorTile``: Vector tile layer. Added in QGIS 3.14\n\n  Available as ``QgsMapLayer.VectorTileLayer`` in older QGIS releases.\n\n* ``Annotation``: Contains freeform, georeferenced annotations. Added in QGIS 3.16\n\n  Available as ``QgsMapLayer.AnnotationLayer`` in older QGIS releases.\n\n* ``PointCloud``: Point cloud layer. Added in QGIS 3.18\n\n  Available as ``QgsMapLayer.PointCloudLayer`` in older QGIS releases.\n\n* ``Group``: Composite group layer. Added in QGIS 3.24\n\n  Available as ``QgsMapLayer.GroupLayer`` in older QGIS releases.\n\n* ``TiledScene``: Tiled scene layer. Added in QGIS 3.34\n\n'),
+    ('QgsMapLayerProxyModel.RasterLayer', ''),
+    ('QgsMapLayerProxyModel.NoGeometry', ''),
+    ('QgsMapLayerProxyModel.PointLayer', ''),
+    ('QgsMapLayerProxyModel.LineLayer', ''),
+    ('QgsMapLayerProxyModel.PolygonLayer', ''),
+    ('QgsMapLayerProxyModel.HasGeometry', ''),
+    ('QgsMapLayerProxyModel.VectorLayer', ''),
+    ('QgsMapLayerProxyModel.PluginLayer', ''),
+    ('QgsMapLayerProxyModel.WritableLayer', ''),
+    ('QgsMapLayerProxyModel.MeshLayer', 'QgsMeshLayer \n.. versionadded:: 3.6'),
+    ('QgsMapLayerProxyModel.VectorTileLayer', 'QgsVectorTileLayer \n.. versionadded:: 3.14'),
+    ('QgsMapLayerProxyModel.PointCloudLayer', 'QgsPointCloudLayer \n.. versionadded:: 3.18'),
+    ('QgsMapLayerProxyModel.AnnotationLayer', 'QgsAnnotationLayer \n.. versionadded:: 3.22'),
+    ('QgsMapLayerProxyModel.TiledSceneLayer', 'QgsTiledSceneLayer \n.. versionadded:: 3.34'),
+    ('QgsMapLayerProxyModel.All', 'All layers'),
+    ('QgsMapLayerProxyModel.SpatialLayer', 'All spatial layers. \n.. versionadded:: 3.24'),
+    ('Qgis.LayerFilter', 'Filter for layers\n\n.. versionadded:: 3.34.\n\n* ``RasterLayer``: \n* ``NoGeometry``: \n* ``PointLayer``: \n* ``LineLayer``: \n* ``PolygonLayer``: \n* ``HasGeometry``: \n* ``VectorLayer``: \n* ``PluginLayer``: \n* ``WritableLayer``: \n* ``MeshLayer``: QgsMeshLayer\n\n  .. versionadded:: 3.6\n\n* ``VectorTileLayer``: QgsVectorTileLayer\n\n  .. versionadded:: 3.14\n\n* ``PointCloudLayer``: QgsPointCloudLayer\n\n  .. versionadded:: 3.18\n\n* ``AnnotationLayer``: QgsAnnotationLayer\n\n  .. versionadded:: 3.22\n\n* ``TiledSceneLayer``: QgsTiledSceneLayer\n\n  .. versionadded:: 3.34\n\n* ``All``: All layers\n* ``SpatialLayer``: All spatial layers.\n\n  .. versionadded:: 3.24\n\n\n'),
+    ('Qgis.LoadStyleFlag.IgnoreMissingStyleErrors', "If the style is missing, then don't flag it as an error. This flag can be used when the caller is not certain that a style exists, and accordingly a failure to find the style does not indicate an issue with loading the style itself."),
+    ('Qgis.LoadStyleFlag', "Flags for loading layer styles.\n\n.. versionadded:: 3.38\n\n* ``IgnoreMissingStyleErrors``: If the style is missing, then don't flag it as an error. This flag can be used when the caller is not certain that a style exists, and accordingly a failure to find the style does not indicate an issue with loading the style itself.\n\n"),
+    ('QgsWkbTypes.Unknown', 'Unknown'),
+    ('QgsWkbTypes.Point', 'Point'),
+    ('QgsWkbTypes.LineString', 'LineString'),
+    ('QgsWkbTypes.Polygon', 'Polygon'),
+    ('QgsWkbTypes.Triangle', 'Triangle'),
+    ('QgsWkbTypes.MultiPoint', 'MultiPoint'),
+    ('QgsWkbTypes.MultiLineString', 'MultiLineString'),
+    ('QgsWkbTypes.MultiPolygon', 'MultiPolygon'),
+    ('QgsWkbTypes.GeometryCollection', 'GeometryCollection'),
+    ('QgsWkbTypes.CircularString', 'CircularString'),
+    ('QgsWkbTypes.CompoundCurve', 'CompoundCurve'),
+    ('QgsWkbTypes.CurvePolygon', 'CurvePolygon'),
+    ('QgsWkbTypes.MultiCurve', 'MultiCurve'),
+    ('QgsWkbTypes.MultiSurface', 'MultiSurface'),
+    ('QgsWkbTypes.PolyhedralSurface', 'PolyhedralSurface \n.. versionadded:: 3.40'),
+    ('QgsWkbTypes.TIN', 'TIN \n.. versionadded:: 3.40'),
+    ('QgsWkbTypes.NoGeometry', 'No geometry'),
+    ('QgsWkbTypes.PointZ', 'PointZ'),
+    ('QgsWkbTypes.LineStringZ', 'LineStringZ'),
+    ('QgsWkbTypes.PolygonZ', 'PolygonZ'),
+    ('QgsWkbTypes.TriangleZ', 'TriangleZ'),
+    ('QgsWkbTypes.MultiPointZ', 'MultiPointZ'),
+    ('QgsWkbTypes.MultiLineStringZ', 'MultiLineStringZ'),
+    ('QgsWkbTypes.MultiPolygonZ', 'MultiPolygonZ'),
+    ('QgsWkbTypes.GeometryCollectionZ', 'GeometryCollectionZ'),
+    ('QgsWkbTypes.CircularStringZ', 'CircularStringZ'),
+    ('QgsWkbTypes.CompoundCurveZ', 'CompoundCurveZ'),
+    ('QgsWkbTypes.CurvePolygonZ', 'CurvePolygonZ'),
+    ('QgsWkbTypes.MultiCurveZ', 'MultiCurveZ'),
+    ('QgsWkbTypes.MultiSurfaceZ', 'MultiSurfaceZ'),
+    ('QgsWkbTypes.PolyhedralSurfaceZ', 'PolyhedralSurfaceZ'),
+    ('QgsWkbTypes.TINZ', 'TINZ'),
+    ('QgsWkbTypes.PointM', 'PointM'),
+    ('QgsWkbTypes.LineStringM', 'LineStringM'),
+    ('QgsWkbTypes.PolygonM', 'PolygonM'),
+    ('QgsWkbTypes.TriangleM', 'TriangleM'),
+    ('QgsWkbTypes.MultiPointM', 'MultiPointM'),
+    ('QgsWkbTypes.MultiLineStringM', 'MultiLineStringM'),
+    ('QgsWkbTypes.MultiPolygonM', 'MultiPolygonM'),
+    ('QgsWkbTypes.GeometryCollectionM', 'GeometryCollectionM'),
+    ('QgsWkbTypes.CircularStringM', 'CircularStringM'),
+    ('QgsWkbTypes.CompoundCurveM', 'CompoundCurveM'),
+    ('QgsWkbTypes.CurvePolygonM', 'CurvePolygonM'),
+    ('QgsWkbTypes.MultiCurveM', 'MultiCurveM'),
+    ('QgsWkbTypes.MultiSurfaceM', 'MultiSurfaceM'),
+    ('QgsWkbTypes.PolyhedralSurfaceM', 'PolyhedralSurfaceM'),
+    ('QgsWkbTypes.TINM', 'TINM'),
+    ('QgsWkbTypes.PointZM', 'PointZM'),
+    ('QgsWkbTypes.LineStringZM', 'LineStringZM'),
+    ('QgsWkbTypes.PolygonZM', 'PolygonZM'),
+    ('QgsWkbTypes.MultiPointZM', 'MultiPointZM'),
+    ('QgsWkbTypes.MultiLineStringZM', 'MultiLineStringZM'),
+    ('QgsWkbTypes.MultiPolygonZM', 'MultiPolygonZM'),
+    ('QgsWkbTypes.GeometryCollectionZM', 'GeometryCollectionZM'),
+    ('QgsWkbTypes.CircularStringZM', 'CircularStringZM'),
+    ('QgsWkbTypes.CompoundCurveZM', 'CompoundCurveZM'),
+    ('QgsWkbTypes.CurvePolygonZM', 'CurvePolygonZM'),
+    ('QgsWkbTypes.MultiCurveZM', 'MultiCurveZM'),
+    ('QgsWkbTypes.MultiSurfaceZM', 'MultiSurfaceZM'),
+    ('QgsWkbTypes.PolyhedralSurfaceZM', 'PolyhedralSurfaceM'),
+    ('QgsWkbTypes.TINZM', 'TINZM'),
+    ('QgsWkbTypes.TriangleZM', 'TriangleZM'),
+    ('QgsWkbTypes.Point25D', 'Point25D'),
+    ('QgsWkbTypes.LineString25D', 'LineString25D'),
+    ('QgsWkbTypes.Polygon25D', 'Polygon25D'),
+    ('QgsWkbTypes.MultiPoint25D', 'MultiPoint25D'),
+    ('QgsWkbTypes.MultiLineString25D', 'MultiLineString25D'),
+    ('QgsWkbTypes.MultiPolygon25D', 'MultiPolygon25D'),
+    ('Qgis.WkbType', 'The WKB type describes the number of dimensions a geometry has\n\n- Point\n- LineString\n- Polygon\n\nas well as the number of dimensions for each individual vertex\n\n- X (always)\n- Y (always)\n- Z (optional)\n- M (measurement value, optional)\n\nit also has values for multi types, collections, unknown geometry,\nnull geometry, no geometry and curve support.\n\nThese classes of geometry are often used for data sources to\ncommunicate what kind of geometry should be expected for a given\ngeometry field. It is also used for tools or algorithms to decide\nif they should be available for a given geometry type or act in\na different mode.\n\n.. note::\n\n   Prior to 3.30 this was available as :py:class:`QgsWkbTypes`.Type.\n\n.. versionadded:: 3.30\n\n* ``Unknown``: Unknown\n* ``Point``: Point\n* ``LineString``: LineString\n* ``Polygon``: Polygon\n* ``Triangle``: Triangle\n* ``MultiPoint``: MultiPoint\n* ``MultiLineString``: MultiLineString\n* ``MultiPolygon``: MultiPolygon\n* ``GeometryCollection``: GeometryCollection\n* ``CircularString``: CircularString\n* ``CompoundCurve``: CompoundCurve\n* ``CurvePolygon``: CurvePolygon\n* ``MultiCurve``: MultiCurve\n* ``MultiSurface``: MultiSurface\n* ``PolyhedralSurface``: PolyhedralSurface\n\n  .. versionadded:: 3.40\n\n* ``TIN``: TIN\n\n  .. versionadded:: 3.40\n\n* ``NoGeometry``: No geometry\n* ``PointZ``: PointZ\n* ``LineStringZ``: LineStringZ\n* ``PolygonZ``: PolygonZ\n* ``TriangleZ``: TriangleZ\n* ``MultiPointZ``: MultiPointZ\n* ``MultiLineStringZ``: MultiLineStringZ\n* ``MultiPolygonZ``: MultiPolygonZ\n* ``GeometryCollectionZ``: GeometryCollectionZ\n* ``CircularStringZ``: CircularStringZ\n* ``CompoundCurveZ``: CompoundCurveZ\n* ``CurvePolygonZ``: CurvePolygonZ\n* ``MultiCurveZ``: MultiCurveZ\n* ``MultiSurfaceZ``: MultiSurfaceZ\n* ``PolyhedralSurfaceZ``: PolyhedralSurfaceZ\n* ``TINZ``: TINZ\n* ``PointM``: PointM\n* ``LineStringM``: LineStringM\n* ``PolygonM``: PolygonM\n* ``TriangleM``: TriangleM\n* ``MultiPointM``: MultiPointM\n* ``MultiLineStringM``: MultiLineStringM\n* ``MultiPolygonM``: MultiPolygonM\n* ``GeometryCollectionM``: GeometryCollectionM\n* ``CircularStringM``: CircularStringM\n* ``CompoundCurveM``: CompoundCurveM\n* ``CurvePolygonM``: CurvePolygonM\n* ``MultiCurveM``: MultiCurveM\n* ``MultiSurfaceM``: MultiSurfaceM\n* ``PolyhedralSurfaceM``: PolyhedralSurfaceM\n* ``TINM``: TINM\n* ``PointZM``: PointZM\n* ``LineStringZM``: LineStringZM\n* ``PolygonZM``: PolygonZM\n* ``MultiPointZM``: MultiPointZM\n* ``MultiLineStringZM``: MultiLineStringZM\n* ``MultiPolygonZM``: MultiPolygonZM\n* ``GeometryCollectionZM``: GeometryCollectionZM\n* ``CircularStringZM``: CircularStringZM\n* ``CompoundCurveZM``: CompoundCurveZM\n* ``CurvePolygonZM``: CurvePolygonZM\n* ``MultiCurveZM``: MultiCurveZM\n* ``MultiSurfaceZM``: MultiSurfaceZM\n* ``PolyhedralSurfaceZM``: PolyhedralSurfaceM\n* ``TINZM``: TINZM\n* ``TriangleZM``: TriangleZM\n* ``Point25D``: Point25D\n* ``LineString25D``: LineString25D\n* ``Polygon25D``: Polygon25D\n* ``MultiPoint25D``: MultiPoint25D\n* ``MultiLineString25D``: MultiLineString25D\n* ``MultiPolygon25D``: MultiPolygon25D\n\n'),
+    ('QgsWkbTypes.PointGeometry', 'Points'),
+    ('QgsWkbTypes.LineGeometry', 'Lines'),
+    ('QgsWkbTypes.PolygonGeometry', 'Polygons'),
+    ('QgsWkbTypes.UnknownGeometry', 'Unknown types'),
+    ('QgsWkbTypes.NullGeometry', 'No geometry'),
+    ('Qgis.GeometryType', 'The geometry types are used to group Qgis.WkbType in a\ncoarse way.\n\n.. note::\n\n   Prior to 3.30 this was available as :py:class:`QgsWkbTypes`.GeometryType.\n\n.. versionadded:: 3.30\n\n* ``Point``: Points\n\n  Available as ``QgsWkbTypes.PointGeometry`` in older QGIS releases.\n\n* ``Line``: Lines\n\n  Available as ``QgsWkbTypes.LineGeometry`` in older QGIS releases.\n\n* ``Polygon``: Polygons\n\n  Available as ``QgsWkbTypes.PolygonGeometry`` in older QGIS releases.\n\n* ``Unknown``: Unknown types\n\n  Available as ``QgsWkbTypes.UnknownGeometry`` in older QGIS releases.\n\n* ``Null``: No geometry\n\n  Available as ``QgsWkbTypes.NullGeometry`` in older QGIS releases.\n\n\n'),
+    ('Qgis.UnknownDataType', 'Unknown or unspecified type'),
+    ('Qgis.Byte', 'Eight bit unsigned integer (quint8)'),
+    ('Qgis.Int8', 'Eight bit signed integer (qint8) (added in QGIS 3.30)'),
+    ('Qgis.UInt16', 'Sixteen bit unsigned integer (quint16)'),
+    ('Qgis.Int16', 'Sixteen bit signed integer (qint16)'),
+    ('Qgis.UInt32', 'Thirty two bit unsigned integer (quint32)'),
+    ('Qgis.Int32', 'Thirty two bit signed integer (qint32)'),
+    ('Qgis.Float32', 'Thirty two bit floating point (float)'),
+    ('Qgis.Float64', 'Sixty four bit floating point (double)'),
+    ('Qgis.CInt16', 'Complex Int16'),
+    ('Qgis.CInt32', 'Complex Int32'),
+    ('Qgis.CFloat32', 'Complex Float32'),
+    ('Qgis.CFloat64', 'Complex Float64'),
+    ('Qgis.ARGB32', 'Color, alpha, red, green, blue, 4 bytes the same as QImage.Format_ARGB32'),
+    ('Qgis.ARGB32_Premultiplied', 'Color, alpha, red, green, blue, 4 bytes  the same as QImage.Format_ARGB32_Premultiplied'),
+    ('Qgis.DataType', 'Raster data types.\nThis is modified and extended copy of GDALDataType.\n\n* ``UnknownDataType``: Unknown or unspecified type\n* ``Byte``: Eight bit unsigned integer (quint8)\n* ``Int8``: Eight bit signed integer (qint8) (added in QGIS 3.30)\n* ``UInt16``: Sixteen bit unsigned integer (quint16)\n* ``Int16``: Sixteen bit signed integer (qint16)\n* ``UInt32``: Thirty two bit unsigned integer (quint32)\n* ``Int32``: Thirty two bit signed integer (qint32)\n* ``Float32``: Thirty two bit floating point (float)\n* ``Float64``: Sixty four bit floating point (double)\n* ``CInt16``: Complex Int16\n* ``CInt32``: Complex Int32\n* ``CFloat32``: Complex Float32\n* ``CFloat64``: Complex Float64\n* ``ARGB32``: Color, alpha, red, green, blue, 4 bytes the same as QImage.Format_ARGB32\n* ``ARGB32_Premultiplied``: Color, alpha, red, green, blue, 4 bytes  the same as QImage.Format_ARGB32_Premultiplied\n\n'),
+    ('Qgis.CaptureTechnique.StraightSegments', 'Default capture mode - capture occurs with straight line segments'),
+    ('Qgis.CaptureTechnique.CircularString', 'Capture in circular strings'),
+    ('Qgis.CaptureTechnique.Streaming', 'Streaming points digitizing mode (points are automatically added as the mouse cursor moves).'),
+    ('Qgis.CaptureTechnique.Shape', 'Digitize shapes.'),
+    ('Qgis.CaptureTechnique', 'Capture technique.\n\n.. versionadded:: 3.26\n\n* ``StraightSegments``: Default capture mode - capture occurs with straight line segments\n* ``CircularString``: Capture in circular strings\n* ``Streaming``: Streaming points digitizing mode (points are automatically added as the mouse cursor moves).\n* ``Shape``: Digitize shapes.\n\n'),
+    ('Qgis.VectorLayerTypeFlag.SqlQuery', 'SQL query layer'),
+    ('Qgis.VectorLayerTypeFlag', 'Vector layer type flags.\n\n.. versionadded:: 3.24\n\n* ``SqlQuery``: SQL query layer\n\n'),
+    ('Qgis.Never', 'Python embedded never run'),
+    ('Qgis.Ask', 'User is prompt before running'),
+    ('Qgis.SessionOnly', 'Only during this session'),
+    ('Qgis.Always', 'Python embedded is always run'),
+    ('Qgis.NotForThisSession', 'Python embedded will not be run for this session'),
+    ('Qgis.PythonEmbeddedMode', 'Authorisation to run Python Embedded in projects\n\n.. versionadded:: 3.40\n\n* ``Never``: Python embedded never run\n* ``Ask``: User is prompt before running\n* ``SessionOnly``: Only during this session\n* ``Always``: Python embedded is always run\n* ``NotForThisSession``: Python embedded will not be run for this session\n\n'),
+    ('Qgis.PythonEmbeddedType.Macro', ''),
+    ('Qgis.PythonEmbeddedType.ExpressionFunction', ''),
+    ('Qgis.PythonEmbeddedType', 'Type of Python Embedded in projects\n\n.. versionadded:: 3.40\n\n* ``Macro``: \n* ``ExpressionFunction``: \n\n'),
+    ('QgsDataProvider.FlagTrustDataSource', 'Trust datasource config (primary key unicity, geometry type and srid, etc). Improves provider load time by skipping expensive checks like primary key unicity, geometry type and srid and by using estimated metadata on data load \n.. versionadded:: 3.16'),
+    ('QgsDataProvider.SkipFeatureCount', 'Make featureCount() return -1 to indicate unknown, and subLayers() to return a unknown feature count as well. Since QGIS 3.18. Only implemented by OGR provider at time of writing.'),
+    ('QgsDataProvider.FlagLoadDefaultStyle', "Reset the layer's style to the default for the datasource"),
+    ('QgsDataProvider.SkipGetExtent', 'Skip the extent from provider'),
+    ('QgsDataProvider.SkipFullScan', 'Skip expensive full scan on files (i.e. on delimited text) \n.. versionadded:: 3.24'),
+    ('QgsDataProvider.ForceReadOnly', 'Open layer in a read-only mode \n.. versionadded:: 3.28'),
+    ('QgsDataProvider.SkipCredentialsRequest', 'Skip credentials if the provided one are not valid, let the provider be invalid, avoiding to block the thread creating the provider if it is not the main thread \n.. versionadded:: 3.32'),
+    ('QgsDataProvider.ParallelThreadLoading', 'Provider is created in a parallel thread than the one where it will live \n.. versionadded:: 3.32.1'),
+    ('Qgis.DataProviderReadFlag', "Flags which control data provider construction.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsDataProvider`.ReadFlag\n\n.. versionadded:: 3.40\n\n* ``TrustDataSource``: Trust datasource config (primary key unicity, geometry type and srid, etc). Improves provider load time by skipping expensive checks like primary key unicity, geometry type and srid and by using estimated metadata on data load\n\n  .. versionadded:: 3.16\n\n\n  Available as ``QgsDataProvider.FlagTrustDataSource`` in older QGIS releases.\n\n* ``SkipFeatureCount``: Make featureCount() return -1 to indicate unknown, and subLayers() to return a unknown feature count as well. Since QGIS 3.18. Only implemented by OGR provider at time of writing.\n* ``LoadDefaultStyle``: Reset the layer's style to the default for the datasource\n\n  Available as ``QgsDataProvider.FlagLoadDefaultStyle`` in older QGIS releases.\n\n* ``SkipGetExtent``: Skip the extent from provider\n* ``SkipFullScan``: Skip expensive full scan on files (i.e. on delimited text)\n\n  .. versionadded:: 3.24\n\n* ``ForceReadOnly``: Open layer in a read-only mode\n\n  .. versionadded:: 3.28\n\n* ``SkipCredentialsRequest``: Skip credentials if the provided one are not valid, let the provider be invalid, avoiding to block the thread creating the provider if it is not the main thread\n\n  .. versionadded:: 3.32\n\n* ``ParallelThreadLoading``: Provider is created in a parallel thread than the one where it will live\n\n  .. versionadded:: 3.32.1\n\n\n"),
+    ('QgsVectorDataProvider.NoCapabilities', 'Provider has no capabilities'),
+    ('QgsVectorDataProvider.AddFeatures', 'Allows adding features'),
+    ('QgsVectorDataProvider.DeleteFeatures', 'Allows deletion of features'),
+    ('QgsVectorDataProvider.ChangeAttributeValues', 'Allows modification of attribute values'),
+    ('QgsVectorDataProvider.AddAttributes', 'Allows addition of new attributes (fields)'),
+    ('QgsVectorDataProvider.DeleteAttributes', 'Allows deletion of attributes (fields)'),
+    ('QgsVectorDataProvider.CreateSpatialIndex', 'Allows creation of spatial index'),
+    ('QgsVectorDataProvider.SelectAtId', 'Fast access to features using their ID'),
+    ('QgsVectorDataProvider.ChangeGeometries', 'Allows modifications of geometries'),
+    ('QgsVectorDataProvider.SelectEncoding', 'Allows user to select encoding'),
+    ('QgsVectorDataProvider.CreateAttributeIndex', "Can create indexes on provider's fields"),
+    ('QgsVectorDataProvider.SimplifyGeometries', 'Supports simplification of geometries on provider side according to a distance tolerance'),
+    ('QgsVectorDataProvider.SimplifyGeometriesWithTopologicalValidation', 'Supports topological simplification of geometries on provider side according to a distance tolerance'),
+    ('QgsVectorDataProvider.TransactionSupport', 'Supports transactions'),
+    ('QgsVectorDataProvider.CircularGeometries', 'Supports circular geometry types (circularstring, compoundcurve, curvepolygon)'),
+    ('QgsVectorDataProvider.ChangeFeatures', 'Supports joint updates for attributes and geometry. Providers supporting this should still define ChangeGeometries | ChangeAttributeValues.'),
+    ('QgsVectorDataProvider.RenameAttributes', 'Supports renaming attributes (fields) \n.. versionadded:: 2.16'),
+    ('QgsVectorDataProvider.FastTruncate', 'Supports fast truncation of the layer (removing all features) \n.. versionadded:: 3.0'),
+    ('QgsVectorDataProvider.ReadLayerMetadata', 'Provider can read layer metadata from data store. Since QGIS 3.0. See QgsDataProvider.layerMetadata()'),
+    ('QgsVectorDataProvider.WriteLayerMetadata', 'Provider can write layer metadata to the data store. Since QGIS 3.0. See QgsDataProvider.writeLayerMetadata()'),
+    ('QgsVectorDataProvider.CancelSupport', 'Supports interruption of pending queries from a separated thread \n.. versionadded:: 3.2'),
+    ('QgsVectorDataProvider.CreateRenderer', 'Provider can create feature renderers using backend-specific formatting information. Since QGIS 3.2. See QgsVectorDataProvider.createRenderer().'),
+    ('QgsVectorDataProvider.CreateLabeling', 'Provider can set labeling settings using backend-specific formatting information. Since QGIS 3.6. See QgsVectorDataProvider.createLabeling().'),
+    ('QgsVectorDataProvider.ReloadData', 'Provider is able to force reload data'),
+    ('QgsVectorDataProvider.FeatureSymbology', 'Provider is able retrieve embedded symbology associated with individual features \n.. versionadded:: 3.20'),
+    ('QgsVectorDataProvider.EditingCapabilities', 'Bitmask of all editing capabilities'),
+    ('Qgis.VectorProviderCapability', "Vector data provider capabilities.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsVectorDataProvider`.Capability\n\n.. versionadded:: 3.40\n\n* ``NoCapabilities``: Provider has no capabilities\n* ``AddFeatures``: Allows adding features\n* ``DeleteFeatures``: Allows deletion of features\n* ``ChangeAttributeValues``: Allows modification of attribute values\n* ``AddAttributes``: Allows addition of new attributes (fields)\n* ``DeleteAttributes``: Allows deletion of attributes (fields)\n* ``CreateSpatialIndex``: Allows creation of spatial index\n* ``SelectAtId``: Fast access to features using their ID\n* ``ChangeGeometries``: Allows modifications of geometries\n* ``SelectEncoding``: Allows user to select encoding\n* ``CreateAttributeIndex``: Can create indexes on provider's fields\n* ``SimplifyGeometries``: Supports simplification of geometries on provider side according to a distance tolerance\n* ``SimplifyGeometriesWithTopologicalValidation``: Supports topological simplification of geometries on provider side according to a distance tolerance\n* ``TransactionSupport``: Supports transactions\n* ``CircularGeometries``: Supports circular geometry types (circularstring, compoundcurve, curvepolygon)\n* ``ChangeFeatures``: Supports joint updates for attributes and geometry. Providers supporting this should still define ChangeGeometries | ChangeAttributeValues.\n* ``RenameAttributes``: Supports renaming attributes (fields)\n\n  .. versionadded:: 2.16\n\n* ``FastTruncate``: Supports fast truncation of the layer (removing all features)\n\n  .. versionadded:: 3.0\n\n* ``ReadLayerMetadata``: Provider can read layer metadata from data store. Since QGIS 3.0. See QgsDataProvider.layerMetadata()\n* ``WriteLayerMetadata``: Provider can write layer metadata to the data store. Since QGIS 3.0. See QgsDataProvider.writeLayerMetadata()\n* ``CancelSupport``: Supports interruption of pending queries from a separated thread\n\n  .. versionadded:: 3.2\n\n* ``CreateRenderer``: Provider can create feature renderers using backend-specific formatting information. Since QGIS 3.2. See QgsVectorDataProvider.createRenderer().\n* ``CreateLabeling``: Provider can set labeling settings using backend-specific formatting information. Since QGIS 3.6. See QgsVectorDataProvider.createLabeling().\n* ``ReloadData``: Provider is able to force reload data\n* ``FeatureSymbology``: Provider is able retrieve embedded symbology associated with individual features\n\n  .. versionadded:: 3.20\n\n* ``EditingCapabilities``: Bitmask of all editing capabilities\n\n"),
+    ('QgsVectorDataProvider.Uncounted', 'Feature count not yet computed'),
+    ('QgsVectorDataProvider.UnknownCount', 'Provider returned an unknown feature count'),
+    ('Qgis.FeatureCountState', 'Enumeration of feature count states\n\n.. versionadded:: 3.20\n\n* ``Uncounted``: Feature count not yet computed\n* ``UnknownCount``: Provider returned an unknown feature count\n\n'),
+    ('QgsFeatureSource.SpatialIndexUnknown', 'Spatial index presence cannot be determined, index may or may not exist'),
+    ('QgsFeatureSource.SpatialIndexNotPresent', 'No spatial index exists for the source'),
+    ('QgsFeatureSource.SpatialIndexPresent', 'A valid spatial index exists for the source'),
+    ('Qgis.SpatialIndexPresence', 'Enumeration of spatial index presence states.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsFeatureSource`.SpatialIndexPresence\n\n.. versionadded:: 3.36\n\n* ``Unknown``: Spatial index presence cannot be determined, index may or may not exist\n\n  Available as ``QgsFeatureSource.SpatialIndexUnknown`` in older QGIS releases.\n\n* ``NotPresent``: No spatial index exists for the source\n\n  Available as ``QgsFeatureSource.SpatialIndexNotPresent`` in older QGIS releases.\n\n* ``Present``: A valid spatial index exists for the source\n\n  Available as ``QgsFeatureSource.SpatialIndexPresent`` in older QGIS releases.\n\n\n'),
+    ('QgsFeatureSource.NoFeaturesAvailable', 'There are certainly no features available in this source'),
+    ('QgsFeatureSource.FeaturesAvailable', 'There is at least one feature available in this source'),
+    ('QgsFeatureSource.FeaturesMaybeAvailable', 'There may be features available in this source'),
+    ('Qgis.FeatureAvailability', 'Possible return value for :py:func:`QgsFeatureSource.hasFeatures()` to determine if a source is empty.\n\nIt is implemented as a three-value logic, so it can return if\nthere are features available for sure, if there are no features\navailable for sure or if there might be features available but\nthere is no guarantee for this.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsFeatureSource`.FeatureAvailability\n\n.. versionadded:: 3.36\n\n* ``NoFeaturesAvailable``: There are certainly no features available in this source\n* ``FeaturesAvailable``: There is at least one feature available in this source\n* ``FeaturesMaybeAvailable``: There may be features available in this source\n\n'),
+    ('Qgis.VectorDataProviderAttributeEditCapability.EditAlias', 'Allows editing aliases'),
+    ('Qgis.VectorDataProviderAttributeEditCapability.EditComment', 'Allows editing comments'),
+    ('Qgis.VectorDataProviderAttributeEditCapability', 'Attribute editing capabilities which may be supported by vector data providers.\n\n.. versionadded:: 3.32\n\n* ``EditAlias``: Allows editing aliases\n* ``EditComment``: Allows editing comments\n\n'),
+    ('QgsSymbol.Marker', 'Marker symbol'),
+    ('QgsSymbol.Line', 'Line symbol'),
+    ('QgsSymbol.Fill', 'Fill symbol'),
+    ('QgsSymbol.Hybrid', 'Hybrid symbol'),
+    ('Qgis.SymbolType', 'Symbol types\n\n.. versionadded:: 3.20\n\n* ``Marker``: Marker symbol\n* ``Line``: Line symbol\n* ``Fill``: Fill symbol\n* ``Hybrid``: Hybrid symbol\n\n'),
+    ('QgsSymbol.ScaleArea', 'Calculate scale by the area'),
+    ('QgsSymbol.ScaleDiameter', 'Calculate scale by the diameter'),
+    ('Qgis.ScaleMethod', 'Scale methods\n\n.. versionadded:: 3.20\n\n* ``ScaleArea``: Calculate scale by the area\n* ``ScaleDiameter``: Calculate scale by the diameter\n\n'),
+    ('QgsSettingsEntryBase.Custom', 'Custom implementation'),
+    ('QgsSettingsEntryBase.Variant', 'Generic variant'),
+    ('QgsSettingsEntryBase.String', 'String'),
+    ('QgsSettingsEntryBase.StringList', 'List of strings'),
+    ('QgsSettingsEntryBase.VariantMap', 'Map of strings'),
+    ('QgsSettingsEntryBase.Bool', 'Boolean'),
+    ('QgsSettingsEntryBase.Integer', 'Integer'),
+    ('QgsSettingsEntryBase.Double', 'Double precision number'),
+    ('QgsSettingsEntryBase.EnumFlag', 'Enum or Flag'),
+    ('QgsSettingsEntryBase.Color', 'Color'),
+    ('Qgis.SettingsType', 'Types of settings entries\n\n.. versionadded:: 3.26\n\n* ``Custom``: Custom implementation\n* ``Variant``: Generic variant\n* ``String``: String\n* ``StringList``: List of strings\n* ``VariantMap``: Map of strings\n* ``Bool``: Boolean\n* ``Integer``: Integer\n* ``Double``: Double precision number\n* ``EnumFlag``: Enum or Flag\n* ``Color``: Color\n\n'),
+    ('Qgis.SettingsTreeNodeType.Root', 'Root Node'),
+    ('Qgis.SettingsTreeNodeType.Standard', 'Normal Node'),
+    ('Qgis.SettingsTreeNodeType.NamedList', 'Named List Node'),
+    ('Qgis.SettingsTreeNodeType', 'Type of tree node\n\n.. versionadded:: 3.30\n\n* ``Root``: Root Node\n* ``Standard``: Normal Node\n* ``NamedList``: Named List Node\n\n'),
+    ('Qgis.SettingsTreeNodeOption.NamedListSelectedItemSetting', 'Creates a setting to store which is the current item'),
+    ('Qgis.SettingsTreeNodeOption', 'Options for named list nodes\n\n.. versionadded:: 3.30\n\n* ``NamedListSelectedItemSetting``: Creates a setting to store which is the current item\n\n'),
+    ('QgsProperty.InvalidProperty', 'Invalid (not set) property'),
+    ('QgsProperty.StaticProperty', 'Static property'),
+    ('QgsProperty.FieldBasedProperty', 'Field based property'),
+    ('QgsProperty.ExpressionBasedProperty', 'Expression based property'),
+    ('Qgis.PropertyType', 'Property types\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProperty`.Type\n\n.. versionadded:: 3.36\n\n* ``Invalid``: Invalid (not set) property\n\n  Available as ``QgsProperty.InvalidProperty`` in older QGIS releases.\n\n* ``Static``: Static property\n\n  Available as ``QgsProperty.StaticProperty`` in older QGIS releases.\n\n* ``Field``: Field based property\n\n  Available as ``QgsProperty.FieldBasedProperty`` in older QGIS releases.\n\n* ``Expression``: Expression based property\n\n  Available as ``QgsProperty.ExpressionBasedProperty`` in older QGIS releases.\n\n\n'),
+    ('Qgis.SldExportOption.NoOptions', 'Default SLD export'),
+    ('Qgis.SldExportOption.Svg', 'Export complex styles to separate SVG files for better compatibility with OGC servers'),
+    ('Qgis.SldExportOption.Png', 'Export complex styles to separate PNG files for better compatibility with OGC servers'),
+    ('Qgis.SldExportOption', 'SLD export options\n\n.. versionadded:: 3.30\n\n* ``NoOptions``: Default SLD export\n* ``Svg``: Export complex styles to separate SVG files for better compatibility with OGC servers\n* ``Png``: Export complex styles to separate PNG files for better compatibility with OGC servers\n\n'),
+    ('Qgis.SldExportVendorExtension.NoVendorExtension', 'No vendor extensions'),
+    ('Qgis.SldExportVendorExtension.GeoServerVendorExtension', 'Use GeoServer vendor extensions when required'),
+    ('Qgis.SldExportVendorExtension.DeegreeVendorExtension', 'Use Deegree vendor extensions when required'),
+    ('Qgis.SldExportVendorExtension', 'SLD export vendor extensions, allow the use of vendor extensions when exporting to SLD.\n\n.. versionadded:: 3.30\n\n* ``NoVendorExtension``: No vendor extensions\n* ``GeoServerVendorExtension``: Use GeoServer vendor extensions when required\n* ``DeegreeVendorExtension``: Use Deegree vendor extensions when required\n\n'),
+    ('Qgis.SettingsOption.SaveFormerValue', 'Save the former value of the settings'),
+    ('Qgis.SettingsOption.SaveEnumFlagAsInt', 'The enum/flag will be saved as an integer value instead of text'),
+    ('Qgis.SettingsOption', 'Settings options\n\n.. versionadded:: 3.26\n\n* ``SaveFormerValue``: Save the former value of the settings\n* ``SaveEnumFlagAsInt``: The enum/flag will be saved as an integer value instead of text\n\n'),
+    ('QgsSnappingConfig.ActiveLayer', 'On the active layer'),
+    ('QgsSnappingConfig.AllLayers', 'On all vector layers'),
+    ('QgsSnappingConfig.AdvancedConfiguration', 'On a per layer configuration basis'),
+    ('Qgis.SnappingMode', 'SnappingMode defines on which layer the snapping is performed\n\n.. versionadded:: 3.26\n\n* ``ActiveLayer``: On the active layer\n* ``AllLayers``: On all vector layers\n* ``AdvancedConfiguration``: On a per layer configuration basis\n\n'),
+    ('QgsSnappingConfig.NoSnapFlag', 'No snapping'),
+    ('QgsSnappingConfig.VertexFlag', 'On vertices'),
+    ('QgsSnappingConfig.SegmentFlag', 'On segments'),
+    ('QgsSnappingConfig.AreaFlag', 'On Area'),
+    ('QgsSnappingConfig.CentroidFlag', 'On centroid'),
+    ('QgsSnappingConfig.MiddleOfSegmentFlag', 'On Middle segment'),
+    ('QgsSnappingConfig.LineEndpointFlag', 'Start or end points of lines, or first vertex in polygon rings only \n.. versionadded:: 3.20'),
+    ('Qgis.SnappingType', 'SnappingTypeFlag defines on what object the snapping is performed\n\n.. versionadded:: 3.26\n\n* ``NoSnap``: No snapping\n\n  Available as ``QgsSnappingConfig.NoSnapFlag`` in older QGIS releases.\n\n* ``Vertex``: On vertices\n\n  Available as ``QgsSnappingConfig.VertexFlag`` in older QGIS releases.\n\n* ``Segment``: On segments\n\n  Available as ``QgsSnappingConfig.SegmentFlag`` in older QGIS releases.\n\n* ``Area``: On Area\n\n  Available as ``QgsSnappingConfig.AreaFlag`` in older QGIS releases.\n\n* ``Centroid``: On centroid\n\n  Available as ``QgsSnappingConfig.CentroidFlag`` in older QGIS releases.\n\n* ``MiddleOfSegment``: On Middle segment\n\n  Available as ``QgsSnappingConfig.MiddleOfSegmentFlag`` in older QGIS releases.\n\n* ``LineEndpoint``: Start or end points of lines, or first vertex in polygon rings only\n\n  .. versionadded:: 3.20\n\n\n  Available as ``QgsSnappingConfig.LineEndpointFlag`` in older QGIS releases.\n\n\n'),
+    ('QgsSymbol.DynamicRotation', 'Rotation of symbol may be changed during rendering and symbol should not be cached'),
+    ('QgsSymbol.IsSymbolLayerSubSymbol', 'Symbol is being rendered as a sub-symbol of a QgsSymbolLayer \n.. versionadded:: 3.38'),
+    ('QgsSymbol.ForceVectorRendering', 'Symbol must be rendered using vector methods, and optimisations like pre-rendered images must be disabled \n.. versionadded:: 3.40'),
+    ('QgsSymbol.ExcludeSymbolBuffers', 'Do not render symbol buffers. \n.. versionadded:: 3.40'),
+    ('Qgis.SymbolRenderHint', 'Flags controlling behavior of symbols during rendering\n\n.. versionadded:: 3.20\n\n* ``DynamicRotation``: Rotation of symbol may be changed during rendering and symbol should not be cached\n* ``IsSymbolLayerSubSymbol``: Symbol is being rendered as a sub-symbol of a QgsSymbolLayer\n\n  .. versionadded:: 3.38\n\n* ``ForceVectorRendering``: Symbol must be rendered using vector methods, and optimisations like pre-rendered images must be disabled\n\n  .. versionadded:: 3.40\n\n* ``ExcludeSymbolBuffers``: Do not render symbol buffers.\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('Qgis.SymbolRotationMode.RespectMapRotation', 'Entity is rotated along with the map'),
+    ('Qgis.SymbolRotationMode.IgnoreMapRotation', 'Entity ignores map rotation'),
+    ('Qgis.SymbolRotationMode', 'Modes for handling how symbol and text entity rotation is handled when maps are rotated.\n\n.. versionadded:: 3.32\n\n* ``RespectMapRotation``: Entity is rotated along with the map\n* ``IgnoreMapRotation``: Entity ignores map rotation\n\n'),
+    ('QgsMarkerSymbolLayer.Left', 'Align to left side of symbol'),
+    ('QgsMarkerSymbolLayer.HCenter', 'Align to horizontal center of symbol'),
+    ('QgsMarkerSymbolLayer.Right', 'Align to right side of symbol'),
+    ('Qgis.HorizontalAnchorPoint', 'Marker symbol horizontal anchor points.\n\n.. note::\n\n   Prior to QGIS 3.44 this was available as :py:class:`QgsMarkerSymbolLayer`.HorizontalAnchorPoint\n\n.. versionadded:: 3.44\n\n* ``Left``: Align to left side of symbol\n* ``Center``: Align to horizontal center of symbol\n\n  Available as ``QgsMarkerSymbolLayer.HCenter`` in older QGIS releases.\n\n* ``Right``: Align to right side of symbol\n\n'),
+    ('QgsMarkerSymbolLayer.Top', 'Align to top of symbol'),
+    ('QgsMarkerSymbolLayer.VCenter', 'Align to vertical center of symbol'),
+    ('QgsMarkerSymbolLayer.Bottom', 'Align to bottom of symbol'),
+    ('QgsMarkerSymbolLayer.Baseline', 'Align to baseline of symbol, e.g. font baseline for font marker symbol layers. Treated as Bottom if no baseline is available for the symbol layer type. \n.. versionadded:: 3.44'),
+    ('Qgis.VerticalAnchorPoint', 'Marker symbol vertical anchor points.\n\n.. note::\n\n   Prior to QGIS 3.44 this was available as :py:class:`QgsMarkerSymbolLayer`.VerticalAnchorPoint\n\n.. versionadded:: 3.44\n\n* ``Top``: Align to top of symbol\n* ``Center``: Align to vertical center of symbol\n\n  Available as ``QgsMarkerSymbolLayer.VCenter`` in older QGIS releases.\n\n* ``Bottom``: Align to bottom of symbol\n* ``Baseline``: Align to baseline of symbol, e.g. font baseline for font marker symbol layers. Treated as Bottom if no baseline is available for the symbol layer type.\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('Qgis.FeatureRendererFlag.AffectsLabeling', 'If present, indicates that the renderer will participate in the map labeling problem'),
+    ('Qgis.FeatureRendererFlag', 'Flags controlling behavior of vector feature renderers.\n\n.. versionadded:: 3.40\n\n* ``AffectsLabeling``: If present, indicates that the renderer will participate in the map labeling problem\n\n'),
+    ('Qgis.SymbolFlag.RendererShouldUseSymbolLevels', 'If present, indicates that a QgsFeatureRenderer using the symbol should use symbol levels for best results'),
+    ('Qgis.SymbolFlag.AffectsLabeling', 'If present, indicates that the symbol will participate in the map labeling problem \n.. versionadded:: 3.40'),
+    ('Qgis.SymbolFlag', 'Flags controlling behavior of symbols\n\n.. versionadded:: 3.20\n\n* ``RendererShouldUseSymbolLevels``: If present, indicates that a QgsFeatureRenderer using the symbol should use symbol levels for best results\n* ``AffectsLabeling``: If present, indicates that the symbol will participate in the map labeling problem\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('QgsSymbol.FlagIncludeCrosshairsForMarkerSymbols', 'Include a crosshairs reference image in the background of marker symbol previews'),
+    ('Qgis.SymbolPreviewFlag', 'Flags for controlling how symbol preview images are generated.\n\n.. versionadded:: 3.20\n\n* ``FlagIncludeCrosshairsForMarkerSymbols``: Include a crosshairs reference image in the background of marker symbol previews\n\n'),
+    ('Qgis.SymbolLayerFlag.DisableFeatureClipping', 'If present, indicates that features should never be clipped to the map extent during rendering'),
+    ('Qgis.SymbolLayerFlag.CanCalculateMaskGeometryPerFeature', "If present, indicates that mask geometry can safely be calculated per feature for the symbol layer. This avoids using the entire symbol layer's mask geometry for every feature rendered, considerably simplifying vector exports and resulting in much smaller file sizes. \n.. versionadded:: 3.38"),
+    ('Qgis.SymbolLayerFlag.AffectsLabeling', 'If present, indicates that the symbol layer will participate in the map labeling problem \n.. versionadded:: 3.40'),
+    ('Qgis.SymbolLayerFlag', "Flags controlling behavior of symbol layers\n\n.. note::\n\n   These differ from Qgis.SymbolLayerUserFlag in that Qgis.SymbolLayerFlag flags are used to reflect the inbuilt properties\n   of a symbol layer type, whereas Qgis.SymbolLayerUserFlag are optional, user controlled flags which can be toggled\n   for a symbol layer.\n\n.. versionadded:: 3.22\n\n* ``DisableFeatureClipping``: If present, indicates that features should never be clipped to the map extent during rendering\n* ``CanCalculateMaskGeometryPerFeature``: If present, indicates that mask geometry can safely be calculated per feature for the symbol layer. This avoids using the entire symbol layer's mask geometry for every feature rendered, considerably simplifying vector exports and resulting in much smaller file sizes.\n\n  .. versionadded:: 3.38\n\n* ``AffectsLabeling``: If present, indicates that the symbol layer will participate in the map labeling problem\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('Qgis.SymbolLayerUserFlag.DisableSelectionRecoloring', 'If present, indicates that the symbol layer should not be recolored when rendering selected features'),
+    ('Qgis.SymbolLayerUserFlag', 'User-specified flags controlling behavior of symbol layers.\n\n.. note::\n\n   These differ from Qgis.SymbolLayerFlag in that Qgis.SymbolLayerFlag flags are used to reflect the inbuilt properties\n   of a symbol layer type, whereas Qgis.SymbolLayerUserFlag are optional, user controlled flags which can be toggled\n   for a symbol layer.\n\n.. versionadded:: 3.34\n\n* ``DisableSelectionRecoloring``: If present, indicates that the symbol layer should not be recolored when rendering selected features\n\n'),
+    ('QgsDataItem.Collection', 'A collection of items'),
+    ('QgsDataItem.Directory', 'Represents a file directory'),
+    ('QgsDataItem.Layer', 'Represents a map layer'),
+    ('QgsDataItem.Error', 'Contains an error message'),
+    ('QgsDataItem.Favorites', 'Represents a favorite item'),
+    ('QgsDataItem.Project', 'Represents a QGIS project'),
+    ('QgsDataItem.Custom', 'Custom item type'),
+    ('QgsDataItem.Fields', 'Collection of fields'),
+    ('QgsDataItem.Field', 'Vector layer field'),
+    ('Qgis.BrowserItemType', 'Browser item types.\n\n.. versionadded:: 3.20\n\n* ``Collection``: A collection of items\n* ``Directory``: Represents a file directory\n* ``Layer``: Represents a map layer\n* ``Error``: Contains an error message\n* ``Favorites``: Represents a favorite item\n* ``Project``: Represents a QGIS project\n* ``Custom``: Custom item type\n* ``Fields``: Collection of fields\n* ``Field``: Vector layer field\n\n'),
+    ('QgsDataItem.NotPopulated', 'Children not yet created'),
+    ('QgsDataItem.Populating', 'Creating children in separate thread (populating or refreshing)'),
+    ('QgsDataItem.Populated', 'Children created'),
+    ('Qgis.BrowserItemState', 'Browser item states.\n\n.. versionadded:: 3.20\n\n* ``NotPopulated``: Children not yet created\n* ``Populating``: Creating children in separate thread (populating or refreshing)\n* ``Populated``: Children created\n\n'),
+    ('QgsDataItem.NoCapabilities', 'Item has no capabilities'),
+    ('QgsDataItem.SetCrs', 'Can set CRS on layer or group of layers. deprecated since QGIS 3.6 -- no longer used by QGIS and will be removed in QGIS 4.0'),
+    ('QgsDataItem.Fertile', 'Can create children. Even items without this capability may have children, but cannot create them, it means that children are created by item ancestors.'),
+    ('QgsDataItem.Fast', 'CreateChildren() is fast enough to be run in main thread when refreshing items, most root items (wms,wfs,wcs,postgres...) are considered fast because they are reading data only from QgsSettings'),
+    ('QgsDataItem.Collapse', 'The collapse/expand status for this items children should be ignored in order to avoid undesired network connections (wms etc.)'),
+    ('QgsDataItem.Rename', 'Item can be renamed'),
+    ('QgsDataItem.Delete', 'Item can be deleted'),
+    ('QgsDataItem.ItemRepresentsFile', "Item's path() directly represents a file on disk \n.. versionadded:: 3.22"),
+    ('QgsDataItem.RefreshChildrenWhenItemIsRefreshed', 'When the item is refreshed, all its populated children will also be refreshed in turn \n.. versionadded:: 3.26'),
+    ('QgsDataItem.ReadOnly', 'Item is read only \n.. versionadded:: 3.40'),
+    ('Qgis.BrowserItemCapability', "Browser item capabilities.\n\n.. versionadded:: 3.20\n\n* ``NoCapabilities``: Item has no capabilities\n* ``SetCrs``: Can set CRS on layer or group of layers. deprecated since QGIS 3.6 -- no longer used by QGIS and will be removed in QGIS 4.0\n* ``Fertile``: Can create children. Even items without this capability may have children, but cannot create them, it means that children are created by item ancestors.\n* ``Fast``: CreateChildren() is fast enough to be run in main thread when refreshing items, most root items (wms,wfs,wcs,postgres...) are considered fast because they are reading data only from QgsSettings\n* ``Collapse``: The collapse/expand status for this items children should be ignored in order to avoid undesired network connections (wms etc.)\n* ``Rename``: Item can be renamed\n* ``Delete``: Item can be deleted\n* ``ItemRepresentsFile``: Item's path() directly represents a file on disk\n\n  .. versionadded:: 3.22\n\n* ``RefreshChildrenWhenItemIsRefreshed``: When the item is refreshed, all its populated children will also be refreshed in turn\n\n  .. versionadded:: 3.26\n\n* ``ReadOnly``: Item is read only\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('QgsDataProvider.NoDataCapabilities', 'No capabilities'),
+    ('QgsDataProvider.File', 'Can provides items which corresponds to files'),
+    ('QgsDataProvider.Dir', 'Can provides items which corresponds to directories'),
+    ('QgsDataProvider.Database', 'Can provides items which corresponds to databases'),
+    ('QgsDataProvider.Net', 'Network/internet source'),
+    ('Qgis.DataItemProviderCapability', 'Capabilities for data item providers.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsDataProvider`.DataCapability\n\n.. versionadded:: 3.36\n\n* ``NoCapabilities``: No capabilities\n\n  Available as ``QgsDataProvider.NoDataCapabilities`` in older QGIS releases.\n\n* ``Files``: Can provides items which corresponds to files\n\n  Available as ``QgsDataProvider.File`` in older QGIS releases.\n\n* ``Directories``: Can provides items which corresponds to directories\n\n  Available as ``QgsDataProvider.Dir`` in older QGIS releases.\n\n* ``Databases``: Can provides items which corresponds to databases\n\n  Available as ``QgsDataProvider.Database`` in older QGIS releases.\n\n* ``NetworkSources``: Network/internet source\n\n  Available as ``QgsDataProvider.Net`` in older QGIS releases.\n\n\n'),
+    ('QgsLayerItem.NoType', 'No type'),
+    ('QgsLayerItem.Vector', 'Generic vector layer'),
+    ('QgsLayerItem.Raster', 'Raster layer'),
+    ('QgsLayerItem.Point', 'Vector point layer'),
+    ('QgsLayerItem.Line', 'Vector line layer'),
+    ('QgsLayerItem.Polygon', 'Vector polygon layer'),
+    ('QgsLayerItem.TableLayer', 'Vector non-spatial layer'),
+    ('QgsLayerItem.Database', 'Database layer'),
+    ('QgsLayerItem.Table', 'Database table'),
+    ('QgsLayerItem.Plugin', 'Plugin based layer'),
+    ('QgsLayerItem.Mesh', 'Mesh layer'),
+    ('QgsLayerItem.VectorTile', 'Vector tile layer'),
+    ('QgsLayerItem.PointCloud', 'Point cloud layer'),
+    ('QgsLayerItem.TiledScene', 'Tiled scene layer \n.. versionadded:: 3.34'),
+    ('Qgis.BrowserLayerType', 'Browser item layer types\n\n.. versionadded:: 3.20\n\n* ``NoType``: No type\n* ``Vector``: Generic vector layer\n* ``Raster``: Raster layer\n* ``Point``: Vector point layer\n* ``Line``: Vector line layer\n* ``Polygon``: Vector polygon layer\n* ``TableLayer``: Vector non-spatial layer\n* ``Database``: Database layer\n* ``Table``: Database table\n* ``Plugin``: Plugin based layer\n* ``Mesh``: Mesh layer\n* ``VectorTile``: Vector tile layer\n* ``PointCloud``: Point cloud layer\n* ``TiledScene``: Tiled scene layer\n\n  .. versionadded:: 3.34\n\n\n'),
+    ('Qgis.BrowserDirectoryMonitoring.Default', 'Use default logic to determine whether directory should be monitored'),
+    ('Qgis.BrowserDirectoryMonitoring.NeverMonitor', 'Never monitor the directory, regardless of the default logic'),
+    ('Qgis.BrowserDirectoryMonitoring.AlwaysMonitor', 'Always monitor the directory, regardless of the default logic'),
+    ('Qgis.BrowserDirectoryMonitoring', 'Browser directory item monitoring switches.\n\n.. versionadded:: 3.20\n\n* ``Default``: Use default logic to determine whether directory should be monitored\n* ``NeverMonitor``: Never monitor the directory, regardless of the default logic\n* ``AlwaysMonitor``: Always monitor the directory, regardless of the default logic\n\n'),
+    ('Qgis.HttpMethod.Get', 'GET method'),
+    ('Qgis.HttpMethod.Post', 'POST method'),
+    ('Qgis.HttpMethod.Head', 'HEAD method. \n.. versionadded:: 3.44'),
+    ('Qgis.HttpMethod.Put', 'PUT method. \n.. versionadded:: 3.44'),
+    ('Qgis.HttpMethod.Delete', 'DELETE method. \n.. versionadded:: 3.44'),
+    ('Qgis.HttpMethod', 'Different methods of HTTP requests\n\n.. versionadded:: 3.22\n\n* ``Get``: GET method\n* ``Post``: POST method\n* ``Head``: HEAD method.\n\n  .. versionadded:: 3.44\n\n* ``Put``: PUT method.\n\n  .. versionadded:: 3.44\n\n* ``Delete``: DELETE method.\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('QgsVectorLayerExporter.NoError', 'No errors were encountered'),
+    ('QgsVectorLayerExporter.ErrCreateDataSource', 'Could not create the destination data source'),
+    ('QgsVectorLayerExporter.ErrCreateLayer', 'Could not create destination layer'),
+    ('QgsVectorLayerExporter.ErrAttributeTypeUnsupported', 'Source layer has an attribute type which could not be handled by destination'),
+    ('QgsVectorLayerExporter.ErrAttributeCreationFailed', 'Destination provider was unable to create an attribute'),
+    ('QgsVectorLayerExporter.ErrProjection', 'An error occurred while reprojecting features to destination CRS'),
+    ('QgsVectorLayerExporter.ErrFeatureWriteFailed', 'An error occurred while writing a feature to the destination'),
+    ('QgsVectorLayerExporter.ErrInvalidLayer', 'Could not access newly created destination layer'),
+    ('QgsVectorLayerExporter.ErrInvalidProvider', 'Could not find a matching provider key'),
+    ('QgsVectorLayerExporter.ErrProviderUnsupportedFeature', 'Provider does not support creation of empty layers'),
+    ('QgsVectorLayerExporter.ErrConnectionFailed', 'Could not connect to destination'),
+    ('QgsVectorLayerExporter.ErrUserCanceled', 'User canceled the export'),
+    ('Qgis.VectorExportResult', 'Vector layer export result codes.\n\n.. versionadded:: 3.20\n\n* ``Success``: No errors were encountered\n\n  Available as ``QgsVectorLayerExporter.NoError`` in older QGIS releases.\n\n* ``ErrorCreatingDataSource``: Could not create the destination data source\n\n  Available as ``QgsVectorLayerExporter.ErrCreateDataSource`` in older QGIS releases.\n\n* ``ErrorCreatingLayer``: Could not create destination layer\n\n  Available as ``QgsVectorLayerExporter.ErrCreateLayer`` in older QGIS releases.\n\n* ``ErrorAttributeTypeUnsupported``: Source layer has an attribute type which could not be handled by destination\n\n  Available as ``QgsVectorLayerExporter.ErrAttributeTypeUnsupported`` in older QGIS releases.\n\n* ``ErrorAttributeCreationFailed``: Destination provider was unable to create an attribute\n\n  Available as ``QgsVectorLayerExporter.ErrAttributeCreationFailed`` in older QGIS releases.\n\n* ``ErrorProjectingFeatures``: An error occurred while reprojecting features to destination CRS\n\n  Available as ``QgsVectorLayerExporter.ErrProjection`` in older QGIS releases.\n\n* ``ErrorFeatureWriteFailed``: An error occurred while writing a feature to the destination\n\n  Available as ``QgsVectorLayerExporter.ErrFeatureWriteFailed`` in older QGIS releases.\n\n* ``ErrorInvalidLayer``: Could not access newly created destination layer\n\n  Available as ``QgsVectorLayerExporter.ErrInvalidLayer`` in older QGIS releases.\n\n* ``ErrorInvalidProvider``: Could not find a matching provider key\n\n  Available as ``QgsVectorLayerExporter.ErrInvalidProvider`` in older QGIS releases.\n\n* ``ErrorProviderUnsupportedFeature``: Provider does not support creation of empty layers\n\n  Available as ``QgsVectorLayerExporter.ErrProviderUnsupportedFeature`` in older QGIS releases.\n\n* ``ErrorConnectionFailed``: Could not connect to destination\n\n  Available as ``QgsVectorLayerExporter.ErrConnectionFailed`` in older QGIS releases.\n\n* ``UserCanceled``: User canceled the export\n\n  Available as ``QgsVectorLayerExporter.ErrUserCanceled`` in older QGIS releases.\n\n\n'),
+    ('Qgis.VectorFileWriterCapability.FieldAliases', 'Writer can support field aliases'),
+    ('Qgis.VectorFileWriterCapability.FieldComments', 'Writer can support field comments'),
+    ('Qgis.VectorFileWriterCapability', 'Capabilities supported by a :py:class:`QgsVectorFileWriter` object.\n\n.. versionadded:: 3.32\n\n* ``FieldAliases``: Writer can support field aliases\n* ``FieldComments``: Writer can support field comments\n\n'),
+    ('Qgis.SqlLayerDefinitionCapability.SubsetStringFilter', 'SQL layer definition supports subset string filter'),
+    ('Qgis.SqlLayerDefinitionCapability.GeometryColumn', 'SQL layer definition supports geometry column'),
+    ('Qgis.SqlLayerDefinitionCapability.PrimaryKeys', 'SQL layer definition supports primary keys'),
+    ('Qgis.SqlLayerDefinitionCapability.UnstableFeatureIds', 'SQL layer definition supports disabling select at id'),
+    ('Qgis.SqlLayerDefinitionCapability', 'SqlLayerDefinitionCapability enum lists the arguments supported by the provider when creating SQL query layers.\n\n.. versionadded:: 3.22\n\n* ``SubsetStringFilter``: SQL layer definition supports subset string filter\n* ``GeometryColumn``: SQL layer definition supports geometry column\n* ``PrimaryKeys``: SQL layer definition supports primary keys\n* ``UnstableFeatureIds``: SQL layer definition supports disabling select at id\n\n'),
+    ('Qgis.SqlKeywordCategory.Keyword', 'SQL keyword'),
+    ('Qgis.SqlKeywordCategory.Constant', 'SQL constant'),
+    ('Qgis.SqlKeywordCategory.Function', 'SQL generic function'),
+    ('Qgis.SqlKeywordCategory.Geospatial', 'SQL spatial function'),
+    ('Qgis.SqlKeywordCategory.Operator', 'SQL operator'),
+    ('Qgis.SqlKeywordCategory.Math', 'SQL math function'),
+    ('Qgis.SqlKeywordCategory.Aggregate', 'SQL aggregate function'),
+    ('Qgis.SqlKeywordCategory.String', 'SQL string function'),
+    ('Qgis.SqlKeywordCategory.Identifier', 'SQL identifier'),
+    ('Qgis.SqlKeywordCategory', 'SqlKeywordCategory enum represents the categories of the SQL keywords used by the SQL query editor.\n\n.. note::\n\n   The category has currently no usage, but it was planned for future uses.\n\n.. versionadded:: 3.22\n\n* ``Keyword``: SQL keyword\n* ``Constant``: SQL constant\n* ``Function``: SQL generic function\n* ``Geospatial``: SQL spatial function\n* ``Operator``: SQL operator\n* ``Math``: SQL math function\n* ``Aggregate``: SQL aggregate function\n* ``String``: SQL string function\n* ``Identifier``: SQL identifier\n\n'),
+    ('Qgis.DriveType.Unknown', 'Unknown type'),
+    ('Qgis.DriveType.Invalid', 'Invalid path'),
+    ('Qgis.DriveType.Removable', 'Removable drive'),
+    ('Qgis.DriveType.Fixed', 'Fixed drive'),
+    ('Qgis.DriveType.Remote', 'Remote drive'),
+    ('Qgis.DriveType.CdRom', 'CD-ROM'),
+    ('Qgis.DriveType.RamDisk', 'RAM disk'),
+    ('Qgis.DriveType.Cloud', 'Cloud storage -- files may be remote or locally stored, depending on user configuration'),
+    ('Qgis.DriveType', 'Drive types\n\n.. versionadded:: 3.20\n\n* ``Unknown``: Unknown type\n* ``Invalid``: Invalid path\n* ``Removable``: Removable drive\n* ``Fixed``: Fixed drive\n* ``Remote``: Remote drive\n* ``CdRom``: CD-ROM\n* ``RamDisk``: RAM disk\n* ``Cloud``: Cloud storage -- files may be remote or locally stored, depending on user configuration\n\n'),
+    ('QgsNetworkContentFetcherRegistry.DownloadLater', 'Do not start immediately the action'),
+    ('QgsNetworkContentFetcherRegistry.DownloadImmediately', 'Action will start immediately'),
+    ('Qgis.ActionStart', 'Enum to determine when an operation would begin\n\n.. versionadded:: 3.22\n\n* ``Deferred``: Do not start immediately the action\n\n  Available as ``QgsNetworkContentFetcherRegistry.DownloadLater`` in older QGIS releases.\n\n* ``Immediate``: Action will start immediately\n\n  Available as ``QgsNetworkContentFetcherRegistry.DownloadImmediately`` in older QGIS releases.\n\n\n'),
+    ('Qgis.UnplacedLabelVisibility.FollowEngineSetting', 'Respect the label engine setting'),
+    ('Qgis.UnplacedLabelVisibility.NeverShow', 'Never show unplaced labels, regardless of the engine setting'),
+    ('Qgis.UnplacedLabelVisibility', 'Unplaced label visibility.\n\n.. versionadded:: 3.20\n\n* ``FollowEngineSetting``: Respect the label engine setting\n* ``NeverShow``: Never show unplaced labels, regardless of the engine setting\n\n'),
+    ('Qgis.LabelOverlapHandling.PreventOverlap', 'Do not allow labels to overlap other labels'),
+    ('Qgis.LabelOverlapHandling.AllowOverlapIfRequired', 'Avoids overlapping labels when possible, but permit overlaps if labels for features cannot otherwise be placed'),
+    ('Qgis.LabelOverlapHandling.AllowOverlapAtNoCost', 'Labels may freely overlap other labels, at no cost'),
+    ('Qgis.LabelOverlapHandling', 'Label overlap handling.\n\n.. versionadded:: 3.26\n\n* ``PreventOverlap``: Do not allow labels to overlap other labels\n* ``AllowOverlapIfRequired``: Avoids overlapping labels when possible, but permit overlaps if labels for features cannot otherwise be placed\n* ``AllowOverlapAtNoCost``: Labels may freely overlap other labels, at no cost\n\n'),
+    ('Qgis.LabelPrioritization.PreferCloser', 'Prefer closer labels, falling back to alternate positions before larger distances'),
+    ('Qgis.LabelPrioritization.PreferPositionOrdering', 'Prefer labels follow position ordering, falling back to more distance labels before alternate positions'),
+    ('Qgis.LabelPrioritization', 'Label prioritization.\n\n.. versionadded:: 3.38\n\n* ``PreferCloser``: Prefer closer labels, falling back to alternate positions before larger distances\n* ``PreferPositionOrdering``: Prefer labels follow position ordering, falling back to more distance labels before alternate positions\n\n'),
+    ('QgsPalLayerSettings.AroundPoint', 'Arranges candidates in a circle around a point (or centroid of a polygon). Applies to point or polygon layers only.'),
+    ('QgsPalLayerSettings.Line', "Arranges candidates parallel to a generalised line representing the feature or parallel to a polygon's perimeter. Applies to line or polygon layers only."),
+    ('QgsPalLayerSettings.Curved', 'Arranges candidates following the curvature of a line feature. Applies to line layers only.'),
+    ('QgsPalLayerSettings.Horizontal', 'Arranges horizontal candidates scattered throughout a polygon feature. Applies to polygon layers only.'),
+    ('QgsPalLayerSettings.Free', "Arranges candidates scattered throughout a polygon feature. Candidates are rotated to respect the polygon's orientation. Applies to polygon layers only."),
+    ('QgsPalLayerSettings.OrderedPositionsAroundPoint', 'Candidates are placed in predefined positions around a point. Preference is given to positions with greatest cartographic appeal, e.g., top right, bottom right, etc. Applies to point layers only.'),
+    ('QgsPalLayerSettings.PerimeterCurved', "Arranges candidates following the curvature of a polygon's boundary. Applies to polygon layers only."),
+    ('QgsPalLayerSettings.OutsidePolygons', 'Candidates are placed outside of polygon boundaries. Applies to polygon layers only \n.. versionadded:: 3.14'),
+    ('Qgis.LabelPlacement', "Placement modes which determine how label candidates are generated for a feature.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.Placement\n\n.. versionadded:: 3.26\n\n* ``AroundPoint``: Arranges candidates in a circle around a point (or centroid of a polygon). Applies to point or polygon layers only.\n* ``OverPoint``: Arranges candidates over a point (or centroid of a polygon), or at a preset offset from the point. Applies to point or polygon layers only.\n* ``Line``: Arranges candidates parallel to a generalised line representing the feature or parallel to a polygon's perimeter. Applies to line or polygon layers only.\n* ``Curved``: Arranges candidates following the curvature of a line feature. Applies to line layers only.\n* ``Horizontal``: Arranges horizontal candidates scattered throughout a polygon feature. Applies to polygon layers only.\n* ``Free``: Arranges candidates scattered throughout a polygon feature. Candidates are rotated to respect the polygon's orientation. Applies to polygon layers only.\n* ``OrderedPositionsAroundPoint``: Candidates are placed in predefined positions around a point. Preference is given to positions with greatest cartographic appeal, e.g., top right, bottom right, etc. Applies to point layers only.\n* ``PerimeterCurved``: Arranges candidates following the curvature of a polygon's boundary. Applies to polygon layers only.\n* ``OutsidePolygons``: Candidates are placed outside of polygon boundaries. Applies to polygon layers only\n\n  .. versionadded:: 3.14\n\n\n"),
+    ('QgsPalLayerSettings.TopLeft', 'Label on top-left of point'),
+    ('QgsPalLayerSettings.TopSlightlyLeft', 'Label on top of point, slightly left of center'),
+    ('QgsPalLayerSettings.TopMiddle', 'Label directly above point'),
+    ('QgsPalLayerSettings.TopSlightlyRight', 'Label on top of point, slightly right of center'),
+    ('QgsPalLayerSettings.TopRight', 'Label on top-right of point'),
+    ('QgsPalLayerSettings.MiddleLeft', 'Label on left of point'),
+    ('QgsPalLayerSettings.MiddleRight', 'Label on right of point'),
+    ('QgsPalLayerSettings.BottomLeft', 'Label on bottom-left of point'),
+    ('QgsPalLayerSettings.BottomSlightlyLeft', 'Label below point, slightly left of center'),
+    ('QgsPalLayerSettings.BottomMiddle', 'Label directly below point'),
+    ('QgsPalLayerSettings.BottomSlightlyRight', 'Label below point, slightly right of center'),
+    ('QgsPalLayerSettings.BottomRight', 'Label on bottom right of point'),
+    ('QgsPalLayerSettings.OverPoint', 'Label directly centered over point \n.. versionadded:: 3.38'),
+    ('Qgis.LabelPredefinedPointPosition', 'Positions for labels when using the Qgis.LabelPlacement.OrderedPositionsAroundPoint placement mode.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.PredefinedPointPosition\n\n.. versionadded:: 3.26\n\n* ``TopLeft``: Label on top-left of point\n* ``TopSlightlyLeft``: Label on top of point, slightly left of center\n* ``TopMiddle``: Label directly above point\n* ``TopSlightlyRight``: Label on top of point, slightly right of center\n* ``TopRight``: Label on top-right of point\n* ``MiddleLeft``: Label on left of point\n* ``MiddleRight``: Label on right of point\n* ``BottomLeft``: Label on bottom-left of point\n* ``BottomSlightlyLeft``: Label below point, slightly left of center\n* ``BottomMiddle``: Label directly below point\n* ``BottomSlightlyRight``: Label below point, slightly right of center\n* ``BottomRight``: Label on bottom right of point\n* ``OverPoint``: Label directly centered over point\n\n  .. versionadded:: 3.38\n\n\n'),
+    ('QgsPalLayerSettings.FromPoint', 'Offset distance applies from point geometry'),
+    ('QgsPalLayerSettings.FromSymbolBounds', 'Offset distance applies from rendered symbol bounds'),
+    ('Qgis.LabelOffsetType', 'Behavior modifier for label offset and distance, only applies in some\nlabel placement modes.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.OffsetType\n\n.. versionadded:: 3.26\n\n* ``FromPoint``: Offset distance applies from point geometry\n* ``FromSymbolBounds``: Offset distance applies from rendered symbol bounds\n\n'),
+    ('QgsPalLayerSettings.QuadrantAboveLeft', 'Above left'),
+    ('QgsPalLayerSettings.QuadrantAbove', 'Above center'),
+    ('QgsPalLayerSettings.QuadrantAboveRight', 'Above right'),
+    ('QgsPalLayerSettings.QuadrantLeft', 'Left middle'),
+    ('QgsPalLayerSettings.QuadrantOver', 'Center middle'),
+    ('QgsPalLayerSettings.QuadrantRight', 'Right middle'),
+    ('QgsPalLayerSettings.QuadrantBelowLeft', 'Below left'),
+    ('QgsPalLayerSettings.QuadrantBelow', 'Below center'),
+    ('QgsPalLayerSettings.QuadrantBelowRight', 'Below right'),
+    ('Qgis.LabelQuadrantPosition', 'Label quadrant positions\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.QuadrantPosition\n\n.. versionadded:: 3.26\n\n* ``AboveLeft``: Above left\n\n  Available as ``QgsPalLayerSettings.QuadrantAboveLeft`` in older QGIS releases.\n\n* ``Above``: Above center\n\n  Available as ``QgsPalLayerSettings.QuadrantAbove`` in older QGIS releases.\n\n* ``AboveRight``: Above right\n\n  Available as ``QgsPalLayerSettings.QuadrantAboveRight`` in older QGIS releases.\n\n* ``Left``: Left middle\n\n  Available as ``QgsPalLayerSettings.QuadrantLeft`` in older QGIS releases.\n\n* ``Over``: Center middle\n\n  Available as ``QgsPalLayerSettings.QuadrantOver`` in older QGIS releases.\n\n* ``Right``: Right middle\n\n  Available as ``QgsPalLayerSettings.QuadrantRight`` in older QGIS releases.\n\n* ``BelowLeft``: Below left\n\n  Available as ``QgsPalLayerSettings.QuadrantBelowLeft`` in older QGIS releases.\n\n* ``Below``: Below center\n\n  Available as ``QgsPalLayerSettings.QuadrantBelow`` in older QGIS releases.\n\n* ``BelowRight``: Below right\n\n  Available as ``QgsPalLayerSettings.QuadrantBelowRight`` in older QGIS releases.\n\n\n'),
+    ('QgsLabeling.OnLine', 'Labels can be placed directly over a line feature.'),
+    ('QgsLabeling.AboveLine', 'Labels can be placed above a line feature. Unless MapOrientation is also specified this mode respects the direction of the line feature, so a line from right to left labels will have labels placed placed below the line feature.'),
+    ('QgsLabeling.BelowLine', 'Labels can be placed below a line feature. Unless MapOrientation is also specified this mode respects the direction of the line feature, so a line from right to left labels will have labels placed placed above the line feature.'),
+    ('QgsLabeling.MapOrientation', "Signifies that the AboveLine and BelowLine flags should respect the map's orientation rather than the feature's orientation. For example, AboveLine will always result in label's being placed above a line, regardless of the line's direction."),
+    ('Qgis.LabelLinePlacementFlag', "Line placement flags, which control how candidates are generated for a linear feature.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsLabeling`.LinePlacementFlag\n\n.. versionadded:: 3.32\n\n* ``OnLine``: Labels can be placed directly over a line feature.\n* ``AboveLine``: Labels can be placed above a line feature. Unless MapOrientation is also specified this mode respects the direction of the line feature, so a line from right to left labels will have labels placed placed below the line feature.\n* ``BelowLine``: Labels can be placed below a line feature. Unless MapOrientation is also specified this mode respects the direction of the line feature, so a line from right to left labels will have labels placed placed above the line feature.\n* ``MapOrientation``: Signifies that the AboveLine and BelowLine flags should respect the map's orientation rather than the feature's orientation. For example, AboveLine will always result in label's being placed above a line, regardless of the line's direction.\n\n"),
+    ('QgsLabeling.AllowPlacementOutsideOfPolygon', 'Labels can be placed outside of a polygon feature'),
+    ('QgsLabeling.AllowPlacementInsideOfPolygon', 'Labels can be placed inside a polygon feature'),
+    ('Qgis.LabelPolygonPlacementFlag', 'Polygon placement flags, which control how candidates are generated for a polygon feature.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsLabeling`.PolygonPlacementFlag\n\n.. versionadded:: 3.32\n\n* ``AllowPlacementOutsideOfPolygon``: Labels can be placed outside of a polygon feature\n* ``AllowPlacementInsideOfPolygon``: Labels can be placed inside a polygon feature\n\n'),
+    ('QgsPalLayerSettings.Upright', 'Upside-down labels (90 <= angle < 270) are shown upright'),
+    ('QgsPalLayerSettings.ShowDefined', 'Show upside down when rotation is layer- or data-defined'),
+    ('QgsPalLayerSettings.ShowAll', 'Show upside down for all labels, including dynamic ones'),
+    ('Qgis.UpsideDownLabelHandling', 'Handling techniques for upside down labels.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.UpsideDownLabels\n\n.. versionadded:: 3.26\n\n* ``FlipUpsideDownLabels``: Upside-down labels (90 <= angle < 270) are shown upright\n\n  Available as ``QgsPalLayerSettings.Upright`` in older QGIS releases.\n\n* ``AllowUpsideDownWhenRotationIsDefined``: Show upside down when rotation is layer- or data-defined\n\n  Available as ``QgsPalLayerSettings.ShowDefined`` in older QGIS releases.\n\n* ``AlwaysAllowUpsideDown``: Show upside down for all labels, including dynamic ones\n\n  Available as ``QgsPalLayerSettings.ShowAll`` in older QGIS releases.\n\n\n'),
+    ('QgsPalLayerSettings.MultiLeft', 'Left align'),
+    ('QgsPalLayerSettings.MultiCenter', 'Center align'),
+    ('QgsPalLayerSettings.MultiRight', 'Right align'),
+    ('QgsPalLayerSettings.MultiFollowPlacement', 'Alignment follows placement of label, e.g., labels to the left of a feature will be drawn with right alignment'),
+    ('QgsPalLayerSettings.MultiJustify', 'Justified'),
+    ('Qgis.LabelMultiLineAlignment', 'Text alignment for multi-line labels.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsPalLayerSettings`.MultiLineAlign\n\n.. versionadded:: 3.26\n\n* ``Left``: Left align\n\n  Available as ``QgsPalLayerSettings.MultiLeft`` in older QGIS releases.\n\n* ``Center``: Center align\n\n  Available as ``QgsPalLayerSettings.MultiCenter`` in older QGIS releases.\n\n* ``Right``: Right align\n\n  Available as ``QgsPalLayerSettings.MultiRight`` in older QGIS releases.\n\n* ``FollowPlacement``: Alignment follows placement of label, e.g., labels to the left of a feature will be drawn with right alignment\n\n  Available as ``QgsPalLayerSettings.MultiFollowPlacement`` in older QGIS releases.\n\n* ``Justify``: Justified\n\n  Available as ``QgsPalLayerSettings.MultiJustify`` in older QGIS releases.\n\n\n'),
+    ('Qgis.FileFilterType', 'Type of file filters\n\nPrior to QGIS 3.32 this was available as :py:class:`QgsProviderMetadata`.FilterType\n\n.. versionadded:: 3.32\n\n* ``Vector``: Vector layers\n\n  Available as ``QgsProviderMetadata.FilterVector`` in older QGIS releases.\n\n* ``Raster``: Raster layers\n\n  Available as ``QgsProviderMetadata.FilterRaster`` in older QGIS releases.\n\n* ``Mesh``: Mesh layers\n\n  Available as ``QgsProviderMetadata.FilterMesh`` in older QGIS releases.\n\n* ``MeshDataset``: Mesh datasets\n\n  Available as ``QgsProviderMetadata.FilterMeshDataset`` in older QGIS releases.\n\n* ``PointCloud``: Point clouds\n\n  .. versionadded:: 3.18\n\n\n  Available as ``QgsProviderMetadata.FilterPointCloud`` in older QGIS releases.\n\n* ``VectorTile``: Vector tile layers\n\n  .. versionadded:: 3.32\n\n* ``TiledScene``: Tiled scene layers\n\n  .. versionadded:: 3.34\n\n\n'),
+    ('Qgis.UriCleaningFlag.RemoveCredentials', 'Completely remove credentials (eg passwords) from the URI. This flag is not compatible with the RedactCredentials flag.'),
+    ('Qgis.UriCleaningFlag.RedactCredentials', "Replace the value of credentials (eg passwords) with 'xxxxxxxx'. This flag is not compatible with the RemoveCredentials flag."),
+    ('Qgis.UriCleaningFlag', "Flags for cleaning layer URIs.\n\n.. versionadded:: 3.42\n\n* ``RemoveCredentials``: Completely remove credentials (eg passwords) from the URI. This flag is not compatible with the RedactCredentials flag.\n* ``RedactCredentials``: Replace the value of credentials (eg passwords) with 'xxxxxxxx'. This flag is not compatible with the RemoveCredentials flag.\n\n"),
+    ('Qgis.SublayerQueryFlag.FastScan', 'Indicates that the provider must scan for sublayers using the fastest possible approach -- e.g. by first checking that a uri has an extension which is known to be readable by the provider'),
+    ('Qgis.SublayerQueryFlag.ResolveGeometryType', 'Attempt to resolve the geometry type for vector sublayers'),
+    ('Qgis.SublayerQueryFlag.CountFeatures', 'Count features in vector sublayers'),
+    ('Qgis.SublayerQueryFlag.IncludeSystemTables', 'Include system or internal tables (these are not included by default)'),
+    ('Qgis.SublayerQueryFlag.OpenLayersToResolveDescriptions', 'Attempt to open layers in order to resolve layer descriptions. May be slow and should never be done in a UI blocking call. \n.. versionadded:: 4.0'),
+    ('Qgis.SublayerQueryFlag', 'Flags which control how data providers will scan for sublayers in a dataset.\n\n.. versionadded:: 3.22\n\n* ``FastScan``: Indicates that the provider must scan for sublayers using the fastest possible approach -- e.g. by first checking that a uri has an extension which is known to be readable by the provider\n* ``ResolveGeometryType``: Attempt to resolve the geometry type for vector sublayers\n* ``CountFeatures``: Count features in vector sublayers\n* ``IncludeSystemTables``: Include system or internal tables (these are not included by default)\n* ``OpenLayersToResolveDescriptions``: Attempt to open layers in order to resolve layer descriptions. May be slow and should never be done in a UI blocking call.\n\n  .. versionadded:: 4.0\n\n\n'),
+    ('Qgis.SublayerFlag.SystemTable', 'Sublayer is a system or internal table, which should be hidden by default'),
+    ('Qgis.SublayerFlag', 'Flags which reflect the properties of sublayers in a dataset.\n\n.. versionadded:: 3.22\n\n* ``SystemTable``: Sublayer is a system or internal table, which should be hidden by default\n\n'),
+    ('QgsColorRampShader.Interpolated', 'Interpolates the color between two class breaks linearly'),
+    ('QgsColorRampShader.Discrete', 'Assigns the color of the higher class for every pixel between two class breaks'),
+    ('QgsColorRampShader.Exact', 'Assigns the color of the exact matching value in the color ramp item list'),
+    ('Qgis.ShaderInterpolationMethod', 'Color ramp shader interpolation methods.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsColorRampShader`.Type\n\n.. versionadded:: 3.38\n\n* ``Linear``: Interpolates the color between two class breaks linearly\n\n  Available as ``QgsColorRampShader.Interpolated`` in older QGIS releases.\n\n* ``Discrete``: Assigns the color of the higher class for every pixel between two class breaks\n* ``Exact``: Assigns the color of the exact matching value in the color ramp item list\n\n'),
+    ('QgsColorRampShader.Continuous', 'Uses breaks from color palette'),
+    ('QgsColorRampShader.EqualInterval', 'Uses equal interval'),
+    ('QgsColorRampShader.Quantile', 'Uses quantile (i.e. equal pixel) count'),
+    ('Qgis.ShaderClassificationMethod', 'Color ramp shader classification methods.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsColorRampShader`.ClassificationMode\n\n.. versionadded:: 3.38\n\n* ``Continuous``: Uses breaks from color palette\n* ``EqualInterval``: Uses equal interval\n* ``Quantile``: Uses quantile (i.e. equal pixel) count\n\n'),
+    ('QgsRasterPipe.UnknownRole', 'Unknown role'),
+    ('QgsRasterPipe.ProviderRole', 'Data provider role'),
+    ('QgsRasterPipe.RendererRole', 'Raster renderer role'),
+    ('QgsRasterPipe.BrightnessRole', 'Brightness filter role'),
+    ('QgsRasterPipe.ResamplerRole', 'Resampler role'),
+    ('QgsRasterPipe.ProjectorRole', 'Projector role'),
+    ('QgsRasterPipe.NullerRole', 'Raster nuller role'),
+    ('QgsRasterPipe.HueSaturationRole', 'Hue/saturation filter role (also applies grayscale/color inversion)'),
+    ('Qgis.RasterPipeInterfaceRole', 'Raster pipe interface roles.\n\n.. versionadded:: 3.22\n\n* ``Unknown``: Unknown role\n\n  Available as ``QgsRasterPipe.UnknownRole`` in older QGIS releases.\n\n* ``Provider``: Data provider role\n\n  Available as ``QgsRasterPipe.ProviderRole`` in older QGIS releases.\n\n* ``Renderer``: Raster renderer role\n\n  Available as ``QgsRasterPipe.RendererRole`` in older QGIS releases.\n\n* ``Brightness``: Brightness filter role\n\n  Available as ``QgsRasterPipe.BrightnessRole`` in older QGIS releases.\n\n* ``Resampler``: Resampler role\n\n  Available as ``QgsRasterPipe.ResamplerRole`` in older QGIS releases.\n\n* ``Projector``: Projector role\n\n  Available as ``QgsRasterPipe.ProjectorRole`` in older QGIS releases.\n\n* ``Nuller``: Raster nuller role\n\n  Available as ``QgsRasterPipe.NullerRole`` in older QGIS releases.\n\n* ``HueSaturation``: Hue/saturation filter role (also applies grayscale/color inversion)\n\n  Available as ``QgsRasterPipe.HueSaturationRole`` in older QGIS releases.\n\n\n'),
+    ('QgsRasterPipe.ResampleFilter', 'Resampling occurs in ResamplingFilter'),
+    ('QgsRasterPipe.Provider', 'Resampling occurs in Provider'),
+    ('Qgis.RasterResamplingStage', 'Stage at which raster resampling occurs.\n\n.. versionadded:: 3.22\n\n* ``ResampleFilter``: Resampling occurs in ResamplingFilter\n* ``Provider``: Resampling occurs in Provider\n\n'),
+    ('QgsRasterDataProvider.Nearest', 'Nearest-neighbour resampling'),
+    ('QgsRasterDataProvider.Bilinear', 'Bilinear (2x2 kernel) resampling'),
+    ('QgsRasterDataProvider.Cubic', 'Cubic Convolution Approximation (4x4 kernel) resampling'),
+    ('QgsRasterDataProvider.CubicSpline', 'Cubic B-Spline Approximation (4x4 kernel)'),
+    ('QgsRasterDataProvider.Lanczos', 'Lanczos windowed sinc interpolation (6x6 kernel)'),
+    ('QgsRasterDataProvider.Average', 'Average resampling'),
+    ('QgsRasterDataProvider.Mode', 'Mode (selects the value which appears most often of all the sampled points)'),
+    ('QgsRasterDataProvider.Gauss', 'Gauss blurring'),
+    ('Qgis.RasterResamplingMethod', 'Resampling method for raster provider-level resampling.\n\n.. note::\n\n   Prior to QGIS 3.42 this was available as :py:class:`QgsRasterDataProvider`.ResamplingMethod\n\n.. versionadded:: 3.42\n\n* ``Nearest``: Nearest-neighbour resampling\n* ``Bilinear``: Bilinear (2x2 kernel) resampling\n* ``Cubic``: Cubic Convolution Approximation (4x4 kernel) resampling\n* ``CubicSpline``: Cubic B-Spline Approximation (4x4 kernel)\n* ``Lanczos``: Lanczos windowed sinc interpolation (6x6 kernel)\n* ``Average``: Average resampling\n* ``Mode``: Mode (selects the value which appears most often of all the sampled points)\n* ``Gauss``: Gauss blurring\n\n'),
+    ('Qgis.RasterRendererFlag.InternalLayerOpacityHandling', "The renderer internally handles the raster layer's opacity, so the default layer level opacity handling should not be applied."),
+    ('Qgis.RasterRendererFlag.UseNoDataForOutOfRangePixels', "Out of range pixels (eg those values outside of the rendered map's z range filter) should be set using additional nodata values instead of additional transparency values \n.. versionadded:: 3.38"),
+    ('Qgis.RasterRendererFlag', "Flags which control behavior of raster renderers.\n\n.. versionadded:: 3.28\n\n* ``InternalLayerOpacityHandling``: The renderer internally handles the raster layer's opacity, so the default layer level opacity handling should not be applied.\n* ``UseNoDataForOutOfRangePixels``: Out of range pixels (eg those values outside of the rendered map's z range filter) should be set using additional nodata values instead of additional transparency values\n\n  .. versionadded:: 3.38\n\n\n"),
+    ('Qgis.RasterRendererCapability.UsesMultipleBands', 'The renderer utilizes multiple raster bands for color data (note that alpha bands are not considered for this capability)'),
+    ('Qgis.RasterRendererCapability', 'Raster renderer capabilities.\n\n.. versionadded:: 3.48\n\n* ``UsesMultipleBands``: The renderer utilizes multiple raster bands for color data (note that alpha bands are not considered for this capability)\n\n'),
+    ('QgsRasterMinMaxOrigin.MinMax', 'Real min-max values'),
+    ('QgsRasterMinMaxOrigin.StdDev', 'Range is [ mean - stdDevFactor() * stddev, mean + stdDevFactor() * stddev ]'),
+    ('QgsRasterMinMaxOrigin.CumulativeCut', 'Range is [ min + cumulativeCutLower() * (max - min), min + cumulativeCutUpper() * (max - min) ]'),
+    ('Qgis.RasterRangeLimit', 'Describes the limits used to compute raster ranges (min/max values).\n\n.. note::\n\n   Prior to QGIS 3.42 this was available as :py:class:`QgsRasterMinMaxOrigin`.Limits\n\n.. versionadded:: 3.42\n\n* ``NotSet``: User defined\n\n  Available as ``QgsRasterMinMaxOrigin.None_`` in older QGIS releases.\n\n* ``MinimumMaximum``: Real min-max values\n\n  Available as ``QgsRasterMinMaxOrigin.MinMax`` in older QGIS releases.\n\n* ``StdDev``: Range is [ mean - stdDevFactor() * stddev, mean + stdDevFactor() * stddev ]\n* ``CumulativeCut``: Range is [ min + cumulativeCutLower() * (max - min), min + cumulativeCutUpper() * (max - min) ]\n\n'),
+    ('QgsRasterMinMaxOrigin.None_', 'Whole raster is used to compute statistics'),
+    ('QgsRasterMinMaxOrigin.CurrentCanvas', 'Current extent of the canvas (at the time of computation) is used to compute statistics'),
+    ('QgsRasterMinMaxOrigin.UpdatedCanvas', 'Constantly updated extent of the canvas is used to compute statistics'),
+    ('Qgis.RasterRangeExtent', 'Describes the extent used to compute raster ranges (min/max values).\n\n.. note::\n\n   Prior to QGIS 3.42 this was available as :py:class:`QgsRasterMinMaxOrigin`.Extent\n\n.. versionadded:: 3.42\n\n* ``WholeRaster``: Whole raster is used to compute statistics\n\n  Available as ``QgsRasterMinMaxOrigin.None_`` in older QGIS releases.\n\n* ``FixedCanvas``: Current extent of the canvas (at the time of computation) is used to compute statistics\n\n  Available as ``QgsRasterMinMaxOrigin.CurrentCanvas`` in older QGIS releases.\n\n* ``UpdatedCanvas``: Constantly updated extent of the canvas is used to compute statistics\n\n'),
+    ('QgsRasterMinMaxOrigin.Exact', 'Exact statistics'),
+    ('QgsRasterMinMaxOrigin.Estimated', 'Approximated statistics'),
+    ('Qgis.RasterRangeAccuracy', 'Describes the accuracy used to compute raster ranges (min/max values).\n\n.. note::\n\n   Prior to QGIS 3.42 this was available as :py:class:`QgsRasterMinMaxOrigin`.StatAccuracy\n\n.. versionadded:: 3.42\n\n* ``Exact``: Exact statistics\n* ``Estimated``: Approximated statistics\n\n'),
+    ('Qgis.RasterAttributeTableFieldUsage.Generic', 'Field usage Generic'),
+    ('Qgis.RasterAttributeTableFieldUsage.PixelCount', 'Field usage PixelCount'),
+    ('Qgis.RasterAttributeTableFieldUsage.Name', 'Field usage Name'),
+    ('Qgis.RasterAttributeTableFieldUsage.Min', 'Field usage Min'),
+    ('Qgis.RasterAttributeTableFieldUsage.Max', 'Field usage Max'),
+    ('Qgis.RasterAttributeTableFieldUsage.MinMax', 'Field usage MinMax'),
+    ('Qgis.RasterAttributeTableFieldUsage.Red', 'Field usage Red'),
+    ('Qgis.RasterAttributeTableFieldUsage.Green', 'Field usage Green'),
+    ('Qgis.RasterAttributeTableFieldUsage.Blue', 'Field usage Blue'),
+    ('Qgis.RasterAttributeTableFieldUsage.Alpha', 'Field usage Alpha'),
+    ('Qgis.RasterAttributeTableFieldUsage.RedMin', 'Field usage RedMin'),
+    ('Qgis.RasterAttributeTableFieldUsage.GreenMin', 'Field usage GreenMin'),
+    ('Qgis.RasterAttributeTableFieldUsage.BlueMin', 'Field usage BlueMin'),
+    ('Qgis.RasterAttributeTableFieldUsage.AlphaMin', 'Field usage AlphaMin'),
+    ('Qgis.RasterAttributeTableFieldUsage.RedMax', 'Field usage RedMax'),
+    ('Qgis.RasterAttributeTableFieldUsage.GreenMax', 'Field usage GreenMax'),
+    ('Qgis.RasterAttributeTableFieldUsage.BlueMax', 'Field usage BlueMax'),
+    ('Qgis.RasterAttributeTableFieldUsage.AlphaMax', 'Field usage AlphaMax'),
+    ('Qgis.RasterAttributeTableFieldUsage.MaxCount', 'Not used by QGIS: GDAL Maximum GFU value (equals to GFU_AlphaMax+1 currently)'),
+    ('Qgis.RasterAttributeTableFieldUsage', 'The RasterAttributeTableFieldUsage enum represents the usage of a Raster Attribute Table field.\n\n.. note::\n\n   Directly mapped from GDALRATFieldUsage enum values.\n\n.. versionadded:: 3.30\n\n* ``Generic``: Field usage Generic\n* ``PixelCount``: Field usage PixelCount\n* ``Name``: Field usage Name\n* ``Min``: Field usage Min\n* ``Max``: Field usage Max\n* ``MinMax``: Field usage MinMax\n* ``Red``: Field usage Red\n* ``Green``: Field usage Green\n* ``Blue``: Field usage Blue\n* ``Alpha``: Field usage Alpha\n* ``RedMin``: Field usage RedMin\n* ``GreenMin``: Field usage GreenMin\n* ``BlueMin``: Field usage BlueMin\n* ``AlphaMin``: Field usage AlphaMin\n* ``RedMax``: Field usage RedMax\n* ``GreenMax``: Field usage GreenMax\n* ``BlueMax``: Field usage BlueMax\n* ``AlphaMax``: Field usage AlphaMax\n* ``MaxCount``: Not used by QGIS: GDAL Maximum GFU value (equals to GFU_AlphaMax+1 currently)\n\n'),
+    ('Qgis.RasterAttributeTableType.Thematic', ''),
+    ('Qgis.RasterAttributeTableType.Athematic', ''),
+    ('Qgis.RasterAttributeTableType', 'The RasterAttributeTableType enum represents the type of RAT.\nnote Directly mapped from GDALRATTableType enum values.\n\n.. versionadded:: 3.30\n\n* ``Thematic``: \n* ``Athematic``: \n\n'),
+    ('QgsRasterFileWriter.Raw', 'Raw data'),
+    ('QgsRasterFileWriter.Image', 'Rendered image'),
+    ('Qgis.RasterExportType', 'Raster file export types.\n\nPrior to QGIS 3.32 this was available as :py:class:`QgsRasterFileWriter`.Mode\n\n.. versionadded:: 3.32\n\n* ``Raw``: Raw data\n* ``RenderedImage``: Rendered image\n\n  Available as ``QgsRasterFileWriter.Image`` in older QGIS releases.\n\n\n'),
+    ('QgsRasterFileWriter.NoError', 'Successful export'),
+    ('QgsRasterFileWriter.SourceProviderError', 'Source data provider error'),
+    ('QgsRasterFileWriter.DestProviderError', 'Destination data provider error'),
+    ('QgsRasterFileWriter.CreateDatasourceError', 'Data source creation error'),
+    ('QgsRasterFileWriter.WriteError', 'Write error'),
+    ('QgsRasterFileWriter.NoDataConflict', "Internal error if a value used for 'no data' was found in input"),
+    ('QgsRasterFileWriter.WriteCanceled', 'Writing was manually canceled'),
+    ('Qgis.RasterFileWriterResult', "Raster file export results.\n\nPrior to QGIS 3.32 this was available as :py:class:`QgsRasterFileWriter`.WriterError\n\n.. versionadded:: 3.32\n\n* ``Success``: Successful export\n\n  Available as ``QgsRasterFileWriter.NoError`` in older QGIS releases.\n\n* ``SourceProviderError``: Source data provider error\n* ``DestinationProviderError``: Destination data provider error\n\n  Available as ``QgsRasterFileWriter.DestProviderError`` in older QGIS releases.\n\n* ``CreateDatasourceError``: Data source creation error\n* ``WriteError``: Write error\n* ``NoDataConflict``: Internal error if a value used for 'no data' was found in input\n* ``Canceled``: Writing was manually canceled\n\n  Available as ``QgsRasterFileWriter.WriteCanceled`` in older QGIS releases.\n\n\n"),
+    ('Qgis.MeshEditingErrorType.NoError', 'No type'),
+    ('Qgis.MeshEditingErrorType.InvalidFace', 'An error occurs due to an invalid face (for example, vertex indexes are unordered)'),
+    ('Qgis.MeshEditingErrorType.TooManyVerticesInFace', 'A face has more vertices than the maximum number supported per face'),
+    ('Qgis.MeshEditingErrorType.FlatFace', 'A flat face is present'),
+    ('Qgis.MeshEditingErrorType.UniqueSharedVertex', 'A least two faces share only one vertices'),
+    ('Qgis.MeshEditingErrorType.InvalidVertex', 'An error occurs due to an invalid vertex (for example, vertex index is out of range the available vertex)'),
+    ('Qgis.MeshEditingErrorType.ManifoldFace', 'ManifoldFace'),
+    ('Qgis.MeshEditingErrorType', 'Type of error that can occur during mesh frame editing.\n\n.. versionadded:: 3.22\n\n* ``NoError``: No type\n* ``InvalidFace``: An error occurs due to an invalid face (for example, vertex indexes are unordered)\n* ``TooManyVerticesInFace``: A face has more vertices than the maximum number supported per face\n* ``FlatFace``: A flat face is present\n* ``UniqueSharedVertex``: A least two faces share only one vertices\n* ``InvalidVertex``: An error occurs due to an invalid vertex (for example, vertex index is out of range the available vertex)\n* ``ManifoldFace``: ManifoldFace\n\n'),
+    ('Qgis.FilePathType.Absolute', 'Absolute path'),
+    ('Qgis.FilePathType.Relative', 'Relative path'),
+    ('Qgis.FilePathType', 'File path types.\n\n.. versionadded:: 3.22\n\n* ``Absolute``: Absolute path\n* ``Relative``: Relative path\n\n'),
+    ('Qgis.SublayerPromptMode.AlwaysAsk', 'Always ask users to select from available sublayers, if sublayers are present'),
+    ('Qgis.SublayerPromptMode.AskExcludingRasterBands', 'Ask users to select from available sublayers, unless only raster bands are present'),
+    ('Qgis.SublayerPromptMode.NeverAskSkip', "Never ask users to select sublayers, instead don't load anything"),
+    ('Qgis.SublayerPromptMode.NeverAskLoadAll', 'Never ask users to select sublayers, instead automatically load all available sublayers'),
+    ('Qgis.SublayerPromptMode', "Specifies how to handle layer sources with multiple sublayers.\n\n.. versionadded:: 3.22\n\n* ``AlwaysAsk``: Always ask users to select from available sublayers, if sublayers are present\n* ``AskExcludingRasterBands``: Ask users to select from available sublayers, unless only raster bands are present\n* ``NeverAskSkip``: Never ask users to select sublayers, instead don't load anything\n* ``NeverAskLoadAll``: Never ask users to select sublayers, instead automatically load all available sublayers\n\n"),
+    ('QgsFields.OriginUnknown', 'The field origin has not been specified'),
+    ('QgsFields.OriginProvider', 'Field originates from the underlying data provider of the vector layer'),
+    ('QgsFields.OriginJoin', 'Field originates from a joined layer'),
+    ('QgsFields.OriginEdit', 'Field has been temporarily added in editing mode'),
+    ('QgsFields.OriginExpression', 'Field is calculated from an expression'),
+    ('Qgis.FieldOrigin', 'Field origin.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsFields`.FieldOrigin\n\n.. versionadded:: 3.38\n\n* ``Unknown``: The field origin has not been specified\n\n  Available as ``QgsFields.OriginUnknown`` in older QGIS releases.\n\n* ``Provider``: Field originates from the underlying data provider of the vector layer\n\n  Available as ``QgsFields.OriginProvider`` in older QGIS releases.\n\n* ``Join``: Field originates from a joined layer\n\n  Available as ``QgsFields.OriginJoin`` in older QGIS releases.\n\n* ``Edit``: Field has been temporarily added in editing mode\n\n  Available as ``QgsFields.OriginEdit`` in older QGIS releases.\n\n* ``Expression``: Field is calculated from an expression\n\n  Available as ``QgsFields.OriginExpression`` in older QGIS releases.\n\n\n'),
+    ('Qgis.FieldConfigurationFlag.NoFlag', 'No flag is defined'),
+    ('Qgis.FieldConfigurationFlag.NotSearchable', 'Defines if the field is searchable (used in the locator search for instance)'),
+    ('Qgis.FieldConfigurationFlag.HideFromWms', 'Field is not available if layer is served as WMS from QGIS server'),
+    ('Qgis.FieldConfigurationFlag.HideFromWfs', 'Field is not available if layer is served as WFS from QGIS server'),
+    ('Qgis.FieldConfigurationFlag', 'Configuration flags for fields\nThese flags are meant to be user-configurable\nand are not describing any information from the data provider.\n\n.. note::\n\n   FieldConfigurationFlag are expressed in the negative forms so that default flags is NoFlag.\n\n.. versionadded:: 3.34\n\n* ``NoFlag``: No flag is defined\n* ``NotSearchable``: Defines if the field is searchable (used in the locator search for instance)\n* ``HideFromWms``: Field is not available if layer is served as WMS from QGIS server\n* ``HideFromWfs``: Field is not available if layer is served as WFS from QGIS server\n\n'),
+    ('Qgis.FieldMetadataProperty.GeometryCrs', 'Available for geometry field types with a specific associated coordinate reference system (as a QgsCoordinateReferenceSystem value)'),
+    ('Qgis.FieldMetadataProperty.GeometryWkbType', 'Available for geometry field types which accept geometries of a specific WKB type only (as a QgsWkbTypes.Type value)'),
+    ('Qgis.FieldMetadataProperty.CustomProperty', 'Starting point for custom user set properties'),
+    ('Qgis.FieldMetadataProperty', 'Standard field metadata values.\n\n.. versionadded:: 3.30\n\n* ``GeometryCrs``: Available for geometry field types with a specific associated coordinate reference system (as a QgsCoordinateReferenceSystem value)\n* ``GeometryWkbType``: Available for geometry field types which accept geometries of a specific WKB type only (as a QgsWkbTypes.Type value)\n* ``CustomProperty``: Starting point for custom user set properties\n\n'),
+    ('Qgis.SelectionRenderingMode.Default', 'Use default symbol and selection colors'),
+    ('Qgis.SelectionRenderingMode.CustomColor', 'Use default symbol with a custom selection color'),
+    ('Qgis.SelectionRenderingMode.CustomSymbol', 'Use a custom symbol'),
+    ('Qgis.SelectionRenderingMode', 'Specifies how a selection should be rendered.\n\n.. versionadded:: 3.34\n\n* ``Default``: Use default symbol and selection colors\n* ``CustomColor``: Use default symbol with a custom selection color\n* ``CustomSymbol``: Use a custom symbol\n\n'),
+    ('QgsVectorLayer.SetSelection', 'Set selection, removing any existing selection'),
+    ('QgsVectorLayer.AddToSelection', 'Add selection to current selection'),
+    ('QgsVectorLayer.IntersectSelection', 'Modify current selection to include only select features which match'),
+    ('QgsVectorLayer.RemoveFromSelection', 'Remove from current selection'),
+    ('Qgis.SelectBehavior', 'Specifies how a selection should be applied.\n\n.. versionadded:: 3.22\n\n* ``SetSelection``: Set selection, removing any existing selection\n* ``AddToSelection``: Add selection to current selection\n* ``IntersectSelection``: Modify current selection to include only select features which match\n* ``RemoveFromSelection``: Remove from current selection\n\n'),
+    ('Qgis.SelectGeometryRelationship.Intersect', 'Select where features intersect the reference geometry'),
+    ('Qgis.SelectGeometryRelationship.Within', 'Select where features are within the reference geometry'),
+    ('Qgis.SelectGeometryRelationship', 'Geometry relationship test to apply for selecting features.\n\n.. versionadded:: 3.28\n\n* ``Intersect``: Select where features intersect the reference geometry\n* ``Within``: Select where features are within the reference geometry\n\n'),
+    ('Qgis.SelectionFlag.SingleFeatureSelection', 'Select only a single feature, picking the "best" match for the selection geometry'),
+    ('Qgis.SelectionFlag.ToggleSelection', 'Enables a "toggle" selection mode, where previously selected matching features will be deselected and previously deselected features will be selected. This flag works only when the SingleFeatureSelection flag is also set.'),
+    ('Qgis.SelectionFlag', 'Flags which control feature selection behavior.\n\n.. versionadded:: 3.28\n\n* ``SingleFeatureSelection``: Select only a single feature, picking the "best" match for the selection geometry\n* ``ToggleSelection``: Enables a "toggle" selection mode, where previously selected matching features will be deselected and previously deselected features will be selected. This flag works only when the SingleFeatureSelection flag is also set.\n\n'),
+    ('QgsVectorLayer.Success', 'Edit operation was successful'),
+    ('QgsVectorLayer.EmptyGeometry', 'Edit operation resulted in an empty geometry'),
+    ('QgsVectorLayer.EditFailed', 'Edit operation failed'),
+    ('QgsVectorLayer.FetchFeatureFailed', 'Unable to fetch requested feature'),
+    ('QgsVectorLayer.InvalidLayer', 'Edit failed due to invalid layer'),
+    ('Qgis.VectorEditResult', 'Specifies the result of a vector layer edit operation\n\n.. versionadded:: 3.22\n\n* ``Success``: Edit operation was successful\n* ``EmptyGeometry``: Edit operation resulted in an empty geometry\n* ``EditFailed``: Edit operation failed\n* ``FetchFeatureFailed``: Unable to fetch requested feature\n* ``InvalidLayer``: Edit failed due to invalid layer\n\n'),
+    ('QgsSymbolLayerUtils.SemiTransparentCircle', 'Semi-transparent circle marker'),
+    ('QgsSymbolLayerUtils.Cross', 'Cross marker'),
+    ('QgsSymbolLayerUtils.NoMarker', 'No marker'),
+    ('Qgis.VertexMarkerType', 'Editing vertex markers, used for showing vertices during a edit operation.\n\n.. versionadded:: 3.22\n\n* ``SemiTransparentCircle``: Semi-transparent circle marker\n* ``Cross``: Cross marker\n* ``NoMarker``: No marker\n\n'),
+    ('Qgis.ContentStatus.NotStarted', 'Content fetching/storing has not started yet'),
+    ('Qgis.ContentStatus.Running', 'Content fetching/storing is in progress'),
+    ('Qgis.ContentStatus.Finished', 'Content fetching/storing is finished and successful'),
+    ('Qgis.ContentStatus.Failed', 'Content fetching/storing has failed'),
+    ('Qgis.ContentStatus.Canceled', 'Content fetching/storing has been canceled'),
+    ('Qgis.ContentStatus', 'Status for fetched or stored content\n\n.. versionadded:: 3.22\n\n* ``NotStarted``: Content fetching/storing has not started yet\n* ``Running``: Content fetching/storing is in progress\n* ``Finished``: Content fetching/storing is finished and successful\n* ``Failed``: Content fetching/storing has failed\n* ``Canceled``: Content fetching/storing has been canceled\n\n'),
+    ('Qgis.GpsConnectionType.Automatic', 'Automatically detected GPS device connection'),
+    ('Qgis.GpsConnectionType.Internal', 'Internal GPS device'),
+    ('Qgis.GpsConnectionType.Serial', 'Serial port GPS device'),
+    ('Qgis.GpsConnectionType.Gpsd', 'GPSD device'),
+    ('Qgis.GpsConnectionType', 'GPS connection types.\n\n.. versionadded:: 3.30\n\n* ``Automatic``: Automatically detected GPS device connection\n* ``Internal``: Internal GPS device\n* ``Serial``: Serial port GPS device\n* ``Gpsd``: GPSD device\n\n'),
+    ('Qgis.Disconnected', 'Device is disconnected'),
+    ('Qgis.Connecting', 'Device is connecting'),
+    ('Qgis.Connected', 'Device is successfully connected'),
+    ('Qgis.DeviceConnectionStatus', 'GPS connection status.\n\n.. versionadded:: 3.30\n\n* ``Disconnected``: Device is disconnected\n* ``Connecting``: Device is connecting\n* ``Connected``: Device is successfully connected\n\n'),
+    ('QgsGpsInformation.NoData', 'No fix data available'),
+    ('QgsGpsInformation.NoFix', 'GPS is not fixed'),
+    ('QgsGpsInformation.Fix2D', '2D fix'),
+    ('QgsGpsInformation.Fix3D', '3D fix'),
+    ('Qgis.GpsFixStatus', 'GPS fix status.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsGpsInformation`.FixStatus\n\n.. versionadded:: 3.30\n\n* ``NoData``: No fix data available\n* ``NoFix``: GPS is not fixed\n* ``Fix2D``: 2D fix\n* ``Fix3D``: 3D fix\n\n'),
+    ('Qgis.GnssConstellation.Unknown', 'Unknown/other system'),
+    ('Qgis.GnssConstellation.Gps', 'Global Positioning System (GPS)'),
+    ('Qgis.GnssConstellation.Glonass', 'Global Navigation Satellite System (GLONASS)'),
+    ('Qgis.GnssConstellation.Galileo', 'Galileo'),
+    ('Qgis.GnssConstellation.BeiDou', 'BeiDou'),
+    ('Qgis.GnssConstellation.Qzss', 'Quasi Zenith Satellite System (QZSS)'),
+    ('Qgis.GnssConstellation.Navic', 'Indian Regional Navigation Satellite System (IRNSS) / NAVIC'),
+    ('Qgis.GnssConstellation.Sbas', 'SBAS'),
+    ('Qgis.GnssConstellation', 'GNSS constellation\n\n.. versionadded:: 3.30\n\n* ``Unknown``: Unknown/other system\n* ``Gps``: Global Positioning System (GPS)\n* ``Glonass``: Global Navigation Satellite System (GLONASS)\n* ``Galileo``: Galileo\n* ``BeiDou``: BeiDou\n* ``Qzss``: Quasi Zenith Satellite System (QZSS)\n* ``Navic``: Indian Regional Navigation Satellite System (IRNSS) / NAVIC\n* ``Sbas``: SBAS\n\n'),
+    ('Qgis.GpsQualityIndicator.Unknown', 'Unknown'),
+    ('Qgis.GpsQualityIndicator.Invalid', 'Invalid'),
+    ('Qgis.GpsQualityIndicator.GPS', 'Standalone'),
+    ('Qgis.GpsQualityIndicator.DGPS', 'Differential GPS'),
+    ('Qgis.GpsQualityIndicator.PPS', 'PPS'),
+    ('Qgis.GpsQualityIndicator.RTK', 'Real-time-kynematic'),
+    ('Qgis.GpsQualityIndicator.FloatRTK', 'Float real-time-kynematic'),
+    ('Qgis.GpsQualityIndicator.Estimated', 'Estimated'),
+    ('Qgis.GpsQualityIndicator.Manual', 'Manual input mode'),
+    ('Qgis.GpsQualityIndicator.Simulation', 'Simulation mode'),
+    ('Qgis.GpsQualityIndicator', 'GPS signal quality indicator\n\n.. versionadded:: 3.22.6\n\n* ``Unknown``: Unknown\n* ``Invalid``: Invalid\n* ``GPS``: Standalone\n* ``DGPS``: Differential GPS\n* ``PPS``: PPS\n* ``RTK``: Real-time-kynematic\n* ``FloatRTK``: Float real-time-kynematic\n* ``Estimated``: Estimated\n* ``Manual``: Manual input mode\n* ``Simulation``: Simulation mode\n\n'),
+    ('Qgis.GpsNavigationStatus.NotValid', 'Navigation status not valid'),
+    ('Qgis.GpsNavigationStatus.Safe', 'Safe'),
+    ('Qgis.GpsNavigationStatus.Caution', 'Caution'),
+    ('Qgis.GpsNavigationStatus.Unsafe', 'Unsafe'),
+    ('Qgis.GpsNavigationStatus', 'GPS navigation status.\n\n.. versionadded:: 3.38\n\n* ``NotValid``: Navigation status not valid\n* ``Safe``: Safe\n* ``Caution``: Caution\n* ``Unsafe``: Unsafe\n\n'),
+    ('Qgis.GpsInformationComponent.Location', '2D location (latitude/longitude), as a QgsPointXY value'),
+    ('Qgis.GpsInformationComponent.Altitude', 'Altitude/elevation above or below the mean sea level'),
+    ('Qgis.GpsInformationComponent.GroundSpeed', 'Ground speed'),
+    ('Qgis.GpsInformationComponent.Bearing', 'Bearing measured in degrees clockwise from true north to the direction of travel'),
+    ('Qgis.GpsInformationComponent.TotalTrackLength', 'Total distance of current GPS track (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.TrackDistanceFromStart', 'Direct distance from first vertex in current GPS track to last vertex (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.Pdop', 'Dilution of precision'),
+    ('Qgis.GpsInformationComponent.Hdop', 'Horizontal dilution of precision'),
+    ('Qgis.GpsInformationComponent.Vdop', 'Vertical dilution of precision'),
+    ('Qgis.GpsInformationComponent.HorizontalAccuracy', 'Horizontal accuracy in meters'),
+    ('Qgis.GpsInformationComponent.VerticalAccuracy', 'Vertical accuracy in meters'),
+    ('Qgis.GpsInformationComponent.HvAccuracy', '3D RMS'),
+    ('Qgis.GpsInformationComponent.SatellitesUsed', 'Count of satellites used in obtaining the fix'),
+    ('Qgis.GpsInformationComponent.Timestamp', 'Timestamp'),
+    ('Qgis.GpsInformationComponent.TrackStartTime', 'Timestamp at start of current track (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.TrackEndTime', 'Timestamp at end (current point) of current track (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.TrackDistanceSinceLastPoint', 'Distance since last recorded location (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.TrackTimeSinceLastPoint', 'Time since last recorded location (available from QgsGpsLogger class only)'),
+    ('Qgis.GpsInformationComponent.GeoidalSeparation', 'Geoidal separation, the difference between the WGS-84 Earth ellipsoid and mean-sea-level (geoid), "-" means mean-sea-level below ellipsoid'),
+    ('Qgis.GpsInformationComponent.EllipsoidAltitude', 'Altitude/elevation above or below the WGS-84 Earth ellipsoid'),
+    ('Qgis.GpsInformationComponent', 'GPS information component.\n\n.. versionadded:: 3.30\n\n* ``Location``: 2D location (latitude/longitude), as a QgsPointXY value\n* ``Altitude``: Altitude/elevation above or below the mean sea level\n* ``GroundSpeed``: Ground speed\n* ``Bearing``: Bearing measured in degrees clockwise from true north to the direction of travel\n* ``TotalTrackLength``: Total distance of current GPS track (available from QgsGpsLogger class only)\n* ``TrackDistanceFromStart``: Direct distance from first vertex in current GPS track to last vertex (available from QgsGpsLogger class only)\n* ``Pdop``: Dilution of precision\n* ``Hdop``: Horizontal dilution of precision\n* ``Vdop``: Vertical dilution of precision\n* ``HorizontalAccuracy``: Horizontal accuracy in meters\n* ``VerticalAccuracy``: Vertical accuracy in meters\n* ``HvAccuracy``: 3D RMS\n* ``SatellitesUsed``: Count of satellites used in obtaining the fix\n* ``Timestamp``: Timestamp\n* ``TrackStartTime``: Timestamp at start of current track (available from QgsGpsLogger class only)\n* ``TrackEndTime``: Timestamp at end (current point) of current track (available from QgsGpsLogger class only)\n* ``TrackDistanceSinceLastPoint``: Distance since last recorded location (available from QgsGpsLogger class only)\n* ``TrackTimeSinceLastPoint``: Time since last recorded location (available from QgsGpsLogger class only)\n* ``GeoidalSeparation``: Geoidal separation, the difference between the WGS-84 Earth ellipsoid and mean-sea-level (geoid), "-" means mean-sea-level below ellipsoid\n* ``EllipsoidAltitude``: Altitude/elevation above or below the WGS-84 Earth ellipsoid\n\n'),
+    ('Qgis.BabelFormatCapability.Import', 'Format supports importing'),
+    ('Qgis.BabelFormatCapability.Export', 'Format supports exporting'),
+    ('Qgis.BabelFormatCapability.Waypoints', 'Format supports waypoints'),
+    ('Qgis.BabelFormatCapability.Routes', 'Format supports routes'),
+    ('Qgis.BabelFormatCapability.Tracks', 'Format supports tracks'),
+    ('Qgis.BabelFormatCapability', 'Babel GPS format capabilities.\n\n.. versionadded:: 3.22\n\n* ``Import``: Format supports importing\n* ``Export``: Format supports exporting\n* ``Waypoints``: Format supports waypoints\n* ``Routes``: Format supports routes\n* ``Tracks``: Format supports tracks\n\n'),
+    ('Qgis.BabelCommandFlag.QuoteFilePaths', 'File paths should be enclosed in quotations and escaped'),
+    ('Qgis.BabelCommandFlag', 'Babel command flags, which control how commands and arguments\nare generated for executing GPSBabel processes.\n\n.. versionadded:: 3.22\n\n* ``QuoteFilePaths``: File paths should be enclosed in quotations and escaped\n\n'),
+    ('Qgis.GpsFeatureType.Waypoint', 'Waypoint'),
+    ('Qgis.GpsFeatureType.Route', 'Route'),
+    ('Qgis.GpsFeatureType.Track', 'Track'),
+    ('Qgis.GpsFeatureType', 'GPS feature types.\n\n.. versionadded:: 3.22\n\n* ``Waypoint``: Waypoint\n* ``Route``: Route\n* ``Track``: Track\n\n'),
+    ('QgsGeometry.Success', 'Operation succeeded'),
+    ('QgsGeometry.NothingHappened', 'Nothing happened, without any error'),
+    ('QgsGeometry.InvalidBaseGeometry', 'The base geometry on which the operation is done is invalid or empty'),
+    ('QgsGeometry.InvalidInputGeometryType', 'The input geometry (ring, part, split line, etc.) has not the correct geometry type'),
+    ('QgsGeometry.SelectionIsEmpty', 'No features were selected'),
+    ('QgsGeometry.SelectionIsGreaterThanOne', 'More than one features were selected'),
+    ('QgsGeometry.GeometryEngineError', 'Geometry engine misses a method implemented or an error occurred in the geometry engine'),
+    ('QgsGeometry.LayerNotEditable', 'Cannot edit layer'),
+    ('QgsGeometry.AddPartSelectedGeometryNotFound', 'The selected geometry cannot be found'),
+    ('QgsGeometry.AddPartNotMultiGeometry', 'The source geometry is not multi'),
+    ('QgsGeometry.AddRingNotClosed', 'The input ring is not closed'),
+    ('QgsGeometry.AddRingNotValid', 'The input ring is not valid'),
+    ('QgsGeometry.AddRingCrossesExistingRings', 'The input ring crosses existing rings (it is not disjoint)'),
+    ('QgsGeometry.AddRingNotInExistingFeature', "The input ring doesn't have any existing ring to fit into"),
+    ('QgsGeometry.SplitCannotSplitPoint', 'Cannot split points'),
+    ('QgsGeometry.GeometryTypeHasChanged', 'Operation has changed geometry type'),
+    ('Qgis.GeometryOperationResult', "Success or failure of a geometry operation.\n\nThis enum gives details about cause of failure.\n\n.. versionadded:: 3.22\n\n* ``Success``: Operation succeeded\n* ``NothingHappened``: Nothing happened, without any error\n* ``InvalidBaseGeometry``: The base geometry on which the operation is done is invalid or empty\n* ``InvalidInputGeometryType``: The input geometry (ring, part, split line, etc.) has not the correct geometry type\n* ``SelectionIsEmpty``: No features were selected\n* ``SelectionIsGreaterThanOne``: More than one features were selected\n* ``GeometryEngineError``: Geometry engine misses a method implemented or an error occurred in the geometry engine\n* ``LayerNotEditable``: Cannot edit layer\n* ``AddPartSelectedGeometryNotFound``: The selected geometry cannot be found\n* ``AddPartNotMultiGeometry``: The source geometry is not multi\n* ``AddRingNotClosed``: The input ring is not closed\n* ``AddRingNotValid``: The input ring is not valid\n* ``AddRingCrossesExistingRings``: The input ring crosses existing rings (it is not disjoint)\n* ``AddRingNotInExistingFeature``: The input ring doesn't have any existing ring to fit into\n* ``SplitCannotSplitPoint``: Cannot split points\n* ``GeometryTypeHasChanged``: Operation has changed geometry type\n\n"),
+    ('QgsGeometry.FlagAllowSelfTouchingHoles', 'Indicates that self-touching holes are permitted. OGC validity states that self-touching holes are NOT permitted, whilst other vendor validity checks (e.g. ESRI) permit self-touching holes.'),
+    ('Qgis.GeometryValidityFlag', 'Geometry validity check flags.\n\n.. versionadded:: 3.22\n\n* ``AllowSelfTouchingHoles``: Indicates that self-touching holes are permitted. OGC validity states that self-touching holes are NOT permitted, whilst other vendor validity checks (e.g. ESRI) permit self-touching holes.\n\n  Available as ``QgsGeometry.FlagAllowSelfTouchingHoles`` in older QGIS releases.\n\n\n'),
+    ('QgsGeometry.ValidatorQgisInternal', 'Use internal QgsGeometryValidator method'),
+    ('QgsGeometry.ValidatorGeos', 'Use GEOS validation methods'),
+    ('Qgis.GeometryValidationEngine', 'Available engines for validating geometries.\n\n.. versionadded:: 3.22\n\n* ``QgisInternal``: Use internal QgsGeometryValidator method\n\n  Available as ``QgsGeometry.ValidatorQgisInternal`` in older QGIS releases.\n\n* ``Geos``: Use GEOS validation methods\n\n  Available as ``QgsGeometry.ValidatorGeos`` in older QGIS releases.\n\n\n'),
+    ('QgsGeometry.SideLeft', 'Buffer to left of line'),
+    ('QgsGeometry.SideRight', 'Buffer to right of line'),
+    ('Qgis.BufferSide', 'Side of line to buffer.\n\n.. versionadded:: 3.22\n\n* ``Left``: Buffer to left of line\n\n  Available as ``QgsGeometry.SideLeft`` in older QGIS releases.\n\n* ``Right``: Buffer to right of line\n\n  Available as ``QgsGeometry.SideRight`` in older QGIS releases.\n\n\n'),
+    ('QgsGeometry.CapRound', 'Round cap'),
+    ('QgsGeometry.CapFlat', 'Flat cap (in line with start/end of line)'),
+    ('QgsGeometry.CapSquare', 'Square cap (extends past start/end of line by buffer distance)'),
+    ('Qgis.EndCapStyle', 'End cap styles for buffers.\n\n.. versionadded:: 3.22\n\n* ``Round``: Round cap\n\n  Available as ``QgsGeometry.CapRound`` in older QGIS releases.\n\n* ``Flat``: Flat cap (in line with start/end of line)\n\n  Available as ``QgsGeometry.CapFlat`` in older QGIS releases.\n\n* ``Square``: Square cap (extends past start/end of line by buffer distance)\n\n  Available as ``QgsGeometry.CapSquare`` in older QGIS releases.\n\n\n'),
+    ('QgsGeometry.JoinStyleRound', 'Use rounded joins'),
+    ('QgsGeometry.JoinStyleMiter', 'Use mitered joins'),
+    ('QgsGeometry.JoinStyleBevel', 'Use beveled joins'),
+    ('Qgis.JoinStyle', 'Join styles for buffers.\n\n.. versionadded:: 3.22\n\n* ``Round``: Use rounded joins\n\n  Available as ``QgsGeometry.JoinStyleRound`` in older QGIS releases.\n\n* ``Miter``: Use mitered joins\n\n  Available as ``QgsGeometry.JoinStyleMiter`` in older QGIS releases.\n\n* ``Bevel``: Use beveled joins\n\n  Available as ``QgsGeometry.JoinStyleBevel`` in older QGIS releases.\n\n\n'),
+    ('Qgis.GeosCreationFlag.RejectOnInvalidSubGeometry', "Don't allow geometries with invalid sub-geometries to be created"),
+    ('Qgis.GeosCreationFlag.SkipEmptyInteriorRings', 'Skip any empty polygon interior ring'),
+    ('Qgis.GeosCreationFlag', "Flags which control geos geometry creation behavior.\n\n.. versionadded:: 3.40\n\n* ``RejectOnInvalidSubGeometry``: Don't allow geometries with invalid sub-geometries to be created\n* ``SkipEmptyInteriorRings``: Skip any empty polygon interior ring\n\n"),
+    ('Qgis.CoverageValidityResult.Invalid', 'Coverage is invalid. Invalidity includes polygons that overlap, that have gaps smaller than the gap width, or non-polygonal entries in the input collection.'),
+    ('Qgis.CoverageValidityResult.Valid', 'Coverage is valid'),
+    ('Qgis.CoverageValidityResult.Error', 'An exception occurred while determining validity'),
+    ('Qgis.CoverageValidityResult', 'Coverage validity results.\n\n.. versionadded:: 3.36\n\n* ``Invalid``: Coverage is invalid. Invalidity includes polygons that overlap, that have gaps smaller than the gap width, or non-polygonal entries in the input collection.\n* ``Valid``: Coverage is valid\n* ``Error``: An exception occurred while determining validity\n\n'),
+    ('Qgis.MakeValidMethod.Linework', 'Combines all rings into a set of noded lines and then extracts valid polygons from that linework.'),
+    ('Qgis.MakeValidMethod.Structure', 'Structured method, first makes all rings valid and then merges shells and subtracts holes from shells to generate valid result. Assumes that holes and shells are correctly categorized. Requires GEOS 3.10+.'),
+    ('Qgis.MakeValidMethod', 'Algorithms to use when repairing invalid geometries.\n\n.. versionadded:: 3.28\n\n* ``Linework``: Combines all rings into a set of noded lines and then extracts valid polygons from that linework.\n* ``Structure``: Structured method, first makes all rings valid and then merges shells and subtracts holes from shells to generate valid result. Assumes that holes and shells are correctly categorized. Requires GEOS 3.10+.\n\n'),
+    ('QgsFeatureRequest.NoFlags', 'No flags are set'),
+    ('QgsFeatureRequest.NoGeometry', 'Geometry is not required. It may still be returned if e.g. required for a filter condition.'),
+    ('QgsFeatureRequest.SubsetOfAttributes', 'Fetch only a subset of attributes (setSubsetOfAttributes sets this flag)'),
+    ('QgsFeatureRequest.ExactIntersect', 'Use exact geometry intersection (slower) instead of bounding boxes'),
+    ('QgsFeatureRequest.IgnoreStaticNodesDuringExpressionCompilation', 'If a feature request uses a filter expression which can be partially precalculated due to static nodes in the expression, setting this flag will prevent these precalculated values from being utilized during compilation of the filter for the backend provider. This flag significantly slows down feature requests and should be used for debugging purposes only. \n.. versionadded:: 3.18'),
+    ('QgsFeatureRequest.EmbeddedSymbols', 'Retrieve any embedded feature symbology \n.. versionadded:: 3.20'),
+    ('Qgis.FeatureRequestFlag', 'Flags for controlling feature requests.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsFeatureRequest`.Flag\n\n.. versionadded:: 3.36\n\n* ``NoFlags``: No flags are set\n* ``NoGeometry``: Geometry is not required. It may still be returned if e.g. required for a filter condition.\n* ``SubsetOfAttributes``: Fetch only a subset of attributes (setSubsetOfAttributes sets this flag)\n* ``ExactIntersect``: Use exact geometry intersection (slower) instead of bounding boxes\n* ``IgnoreStaticNodesDuringExpressionCompilation``: If a feature request uses a filter expression which can be partially precalculated due to static nodes in the expression, setting this flag will prevent these precalculated values from being utilized during compilation of the filter for the backend provider. This flag significantly slows down feature requests and should be used for debugging purposes only.\n\n  .. versionadded:: 3.18\n\n* ``EmbeddedSymbols``: Retrieve any embedded feature symbology\n\n  .. versionadded:: 3.20\n\n\n'),
+    ('QgsFeatureRequest.FilterNone', 'No filter is applied'),
+    ('QgsFeatureRequest.FilterFid', 'Filter using feature ID'),
+    ('QgsFeatureRequest.FilterExpression', 'Filter using expression'),
+    ('QgsFeatureRequest.FilterFids', 'Filter using feature IDs'),
+    ('Qgis.FeatureRequestFilterType', 'Types of feature request filters.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsFeatureRequest`.FilterType\n\n.. versionadded:: 3.36\n\n* ``NoFilter``: No filter is applied\n\n  Available as ``QgsFeatureRequest.FilterNone`` in older QGIS releases.\n\n* ``Fid``: Filter using feature ID\n\n  Available as ``QgsFeatureRequest.FilterFid`` in older QGIS releases.\n\n* ``Expression``: Filter using expression\n\n  Available as ``QgsFeatureRequest.FilterExpression`` in older QGIS releases.\n\n* ``Fids``: Filter using feature IDs\n\n  Available as ``QgsFeatureRequest.FilterFids`` in older QGIS releases.\n\n\n'),
+    ('QgsFeatureRequest.GeometryNoCheck', 'No invalid geometry checking'),
+    ('QgsFeatureRequest.GeometrySkipInvalid', 'Skip any features with invalid geometry. This requires a slow geometry validity check for every feature.'),
+    ('QgsFeatureRequest.GeometryAbortOnInvalid', 'Close iterator on encountering any features with invalid geometry. This requires a slow geometry validity check for every feature.'),
+    ('Qgis.InvalidGeometryCheck', 'Methods for handling of features with invalid geometries\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsFeatureRequest`.InvalidGeometryCheck\n\n.. versionadded:: 3.36\n\n* ``NoCheck``: No invalid geometry checking\n\n  Available as ``QgsFeatureRequest.GeometryNoCheck`` in older QGIS releases.\n\n* ``SkipInvalid``: Skip any features with invalid geometry. This requires a slow geometry validity check for every feature.\n\n  Available as ``QgsFeatureRequest.GeometrySkipInvalid`` in older QGIS releases.\n\n* ``AbortOnInvalid``: Close iterator on encountering any features with invalid geometry. This requires a slow geometry validity check for every feature.\n\n  Available as ``QgsFeatureRequest.GeometryAbortOnInvalid`` in older QGIS releases.\n\n\n'),
+    ('Qgis.SpatialFilterType.NoFilter', 'No spatial filtering of features'),
+    ('Qgis.SpatialFilterType.BoundingBox', 'Filter using a bounding box'),
+    ('Qgis.SpatialFilterType.DistanceWithin', 'Filter by distance to reference geometry'),
+    ('Qgis.SpatialFilterType', 'Feature request spatial filter types.\n\n.. versionadded:: 3.22\n\n* ``NoFilter``: No spatial filtering of features\n* ``BoundingBox``: Filter using a bounding box\n* ``DistanceWithin``: Filter by distance to reference geometry\n\n'),
+    ('Qgis.FileOperationFlag.IncludeMetadataFile', 'Indicates that any associated .qmd metadata file should be included with the operation'),
+    ('Qgis.FileOperationFlag.IncludeStyleFile', 'Indicates that any associated .qml styling file should be included with the operation'),
+    ('Qgis.FileOperationFlag', 'File operation flags.\n\n.. versionadded:: 3.22\n\n* ``IncludeMetadataFile``: Indicates that any associated .qmd metadata file should be included with the operation\n* ``IncludeStyleFile``: Indicates that any associated .qml styling file should be included with the operation\n\n'),
+    ('Qgis.MapLayerProperty.UsersCannotToggleEditing', 'Indicates that users are not allowed to toggle editing for this layer. Note that this does not imply that the layer is non-editable (see isEditable(), supportsEditing() ), rather that the editable status of the layer cannot be changed by users manually \n.. versionadded:: 3.22'),
+    ('Qgis.MapLayerProperty.IsBasemapLayer', "Layer is considered a 'basemap' layer, and certain properties of the layer should be ignored when calculating project-level properties. For instance, the extent of basemap layers is ignored when calculating the extent of a project, as these layers are typically global and extend outside of a project's area of interest \n.. versionadded:: 3.26"),
+    ('Qgis.MapLayerProperty.Is3DBasemapLayer', "Layer is considered a '3D basemap' layer. This flag is similar to IsBasemapLayer, but reserved for layers which contain 3D data \n.. versionadded:: 3.44"),
+    ('Qgis.MapLayerProperty', "Generic map layer properties.\n\n.. versionadded:: 3.22\n\n* ``UsersCannotToggleEditing``: Indicates that users are not allowed to toggle editing for this layer. Note that this does not imply that the layer is non-editable (see isEditable(), supportsEditing() ), rather that the editable status of the layer cannot be changed by users manually\n\n  .. versionadded:: 3.22\n\n* ``IsBasemapLayer``: Layer is considered a 'basemap' layer, and certain properties of the layer should be ignored when calculating project-level properties. For instance, the extent of basemap layers is ignored when calculating the extent of a project, as these layers are typically global and extend outside of a project's area of interest\n\n  .. versionadded:: 3.26\n\n* ``Is3DBasemapLayer``: Layer is considered a '3D basemap' layer. This flag is similar to IsBasemapLayer, but reserved for layers which contain 3D data\n\n  .. versionadded:: 3.44\n\n\n"),
+    ('Qgis.AutoRefreshMode.Disabled', 'Automatic refreshing is disabled'),
+    ('Qgis.AutoRefreshMode.ReloadData', 'Reload data (and draw the new data)'),
+    ('Qgis.AutoRefreshMode.RedrawOnly', 'Redraw current data only'),
+    ('Qgis.AutoRefreshMode', 'Map layer automatic refresh modes.\n\n.. versionadded:: 3.34\n\n* ``Disabled``: Automatic refreshing is disabled\n* ``ReloadData``: Reload data (and draw the new data)\n* ``RedrawOnly``: Redraw current data only\n\n'),
+    ('Qgis.DataProviderFlag.IsBasemapSource', "Associated source should be considered a 'basemap' layer. See Qgis.MapLayerProperty.IsBasemapLayer."),
+    ('Qgis.DataProviderFlag.FastExtent2D', "Provider's 2D extent retrieval via QgsDataProvider.extent() is always guaranteed to be trivial/fast to calculate \n.. versionadded:: 3.38"),
+    ('Qgis.DataProviderFlag.FastExtent3D', "Provider's 3D extent retrieval via QgsDataProvider.extent3D() is always guaranteed to be trivial/fast to calculate \n.. versionadded:: 3.38"),
+    ('Qgis.DataProviderFlag.Is3DBasemapSource', "Associated source should be considered a '3D basemap' layer. See Qgis.MapLayerProperty.Is3DBasemapLayer. \n.. versionadded:: 3.44"),
+    ('Qgis.DataProviderFlag', "Generic data provider flags.\n\n.. versionadded:: 3.26\n\n* ``IsBasemapSource``: Associated source should be considered a 'basemap' layer. See Qgis.MapLayerProperty.IsBasemapLayer.\n* ``FastExtent2D``: Provider's 2D extent retrieval via QgsDataProvider.extent() is always guaranteed to be trivial/fast to calculate\n\n  .. versionadded:: 3.38\n\n* ``FastExtent3D``: Provider's 3D extent retrieval via QgsDataProvider.extent3D() is always guaranteed to be trivial/fast to calculate\n\n  .. versionadded:: 3.38\n\n* ``Is3DBasemapSource``: Associated source should be considered a '3D basemap' layer. See Qgis.MapLayerProperty.Is3DBasemapLayer.\n\n  .. versionadded:: 3.44\n\n\n"),
+    ('Qgis.CrsType.Unknown', 'Unknown type'),
+    ('Qgis.CrsType.Geodetic', 'Geodetic CRS'),
+    ('Qgis.CrsType.Geocentric', 'Geocentric CRS'),
+    ('Qgis.CrsType.Geographic2d', '2D geographic CRS'),
+    ('Qgis.CrsType.Geographic3d', '3D geopraphic CRS'),
+    ('Qgis.CrsType.Vertical', 'Vertical CRS'),
+    ('Qgis.CrsType.Projected', 'Projected CRS'),
+    ('Qgis.CrsType.Compound', 'Compound (horizontal + vertical) CRS'),
+    ('Qgis.CrsType.Temporal', 'Temporal CRS'),
+    ('Qgis.CrsType.Engineering', 'Engineering CRS'),
+    ('Qgis.CrsType.Bound', 'Bound CRS'),
+    ('Qgis.CrsType.Other', 'Other type'),
+    ('Qgis.CrsType.DerivedProjected', 'Derived projected CRS'),
+    ('Qgis.CrsType', "Coordinate reference system types.\n\nContains a subset of Proj's PJ_TYPE enum, specifically the types which relate to CRS types.\n\n.. versionadded:: 3.34\n\n* ``Unknown``: Unknown type\n* ``Geodetic``: Geodetic CRS\n* ``Geocentric``: Geocentric CRS\n* ``Geographic2d``: 2D geographic CRS\n* ``Geographic3d``: 3D geopraphic CRS\n* ``Vertical``: Vertical CRS\n* ``Projected``: Projected CRS\n* ``Compound``: Compound (horizontal + vertical) CRS\n* ``Temporal``: Temporal CRS\n* ``Engineering``: Engineering CRS\n* ``Bound``: Bound CRS\n* ``Other``: Other type\n* ``DerivedProjected``: Derived projected CRS\n\n"),
+    ('Qgis.CrsAxisDirection.North', 'North'),
+    ('Qgis.CrsAxisDirection.NorthNorthEast', 'North North East'),
+    ('Qgis.CrsAxisDirection.NorthEast', 'North East'),
+    ('Qgis.CrsAxisDirection.EastNorthEast', 'East North East'),
+    ('Qgis.CrsAxisDirection.East', 'East'),
+    ('Qgis.CrsAxisDirection.EastSouthEast', 'East South East'),
+    ('Qgis.CrsAxisDirection.SouthEast', 'South East'),
+    ('Qgis.CrsAxisDirection.SouthSouthEast', 'South South East'),
+    ('Qgis.CrsAxisDirection.South', 'South'),
+    ('Qgis.CrsAxisDirection.SouthSouthWest', 'South South West'),
+    ('Qgis.CrsAxisDirection.SouthWest', 'South West'),
+    ('Qgis.CrsAxisDirection.WestSouthWest', 'West South West'),
+    ('Qgis.CrsAxisDirection.West', 'West'),
+    ('Qgis.CrsAxisDirection.WestNorthWest', 'West North West'),
+    ('Qgis.CrsAxisDirection.NorthWest', 'North West'),
+    ('Qgis.CrsAxisDirection.NorthNorthWest', 'North North West'),
+    ('Qgis.CrsAxisDirection.GeocentricX', 'Geocentric (X)'),
+    ('Qgis.CrsAxisDirection.GeocentricY', 'Geocentric (Y)'),
+    ('Qgis.CrsAxisDirection.GeocentricZ', 'Geocentric (Z)'),
+    ('Qgis.CrsAxisDirection.Up', 'Up'),
+    ('Qgis.CrsAxisDirection.Down', 'Down'),
+    ('Qgis.CrsAxisDirection.Forward', 'Forward'),
+    ('Qgis.CrsAxisDirection.Aft', 'Aft'),
+    ('Qgis.CrsAxisDirection.Port', 'Port'),
+    ('Qgis.CrsAxisDirection.Starboard', 'Starboard'),
+    ('Qgis.CrsAxisDirection.Clockwise', 'Clockwise'),
+    ('Qgis.CrsAxisDirection.CounterClockwise', 'Counter clockwise'),
+    ('Qgis.CrsAxisDirection.ColumnPositive', 'Column positive'),
+    ('Qgis.CrsAxisDirection.ColumnNegative', 'Column negative'),
+    ('Qgis.CrsAxisDirection.RowPositive', 'Row positive'),
+    ('Qgis.CrsAxisDirection.RowNegative', 'Row negative'),
+    ('Qgis.CrsAxisDirection.DisplayRight', 'Display right'),
+    ('Qgis.CrsAxisDirection.DisplayLeft', 'Display left'),
+    ('Qgis.CrsAxisDirection.DisplayUp', 'Display up'),
+    ('Qgis.CrsAxisDirection.DisplayDown', 'Display down'),
+    ('Qgis.CrsAxisDirection.Future', 'Future'),
+    ('Qgis.CrsAxisDirection.Past', 'Past'),
+    ('Qgis.CrsAxisDirection.Towards', 'Towards'),
+    ('Qgis.CrsAxisDirection.AwayFrom', 'Away from'),
+    ('Qgis.CrsAxisDirection.Unspecified', 'Unspecified'),
+    ('Qgis.CrsAxisDirection', 'Coordinate reference system axis directions.\n\nFrom "Geographic information — Well-known text representation of coordinate reference systems", section 7.5.1.\n\n.. versionadded:: 3.26\n\n* ``North``: North\n* ``NorthNorthEast``: North North East\n* ``NorthEast``: North East\n* ``EastNorthEast``: East North East\n* ``East``: East\n* ``EastSouthEast``: East South East\n* ``SouthEast``: South East\n* ``SouthSouthEast``: South South East\n* ``South``: South\n* ``SouthSouthWest``: South South West\n* ``SouthWest``: South West\n* ``WestSouthWest``: West South West\n* ``West``: West\n* ``WestNorthWest``: West North West\n* ``NorthWest``: North West\n* ``NorthNorthWest``: North North West\n* ``GeocentricX``: Geocentric (X)\n* ``GeocentricY``: Geocentric (Y)\n* ``GeocentricZ``: Geocentric (Z)\n* ``Up``: Up\n* ``Down``: Down\n* ``Forward``: Forward\n* ``Aft``: Aft\n* ``Port``: Port\n* ``Starboard``: Starboard\n* ``Clockwise``: Clockwise\n* ``CounterClockwise``: Counter clockwise\n* ``ColumnPositive``: Column positive\n* ``ColumnNegative``: Column negative\n* ``RowPositive``: Row positive\n* ``RowNegative``: Row negative\n* ``DisplayRight``: Display right\n* ``DisplayLeft``: Display left\n* ``DisplayUp``: Display up\n* ``DisplayDown``: Display down\n* ``Future``: Future\n* ``Past``: Past\n* ``Towards``: Towards\n* ``AwayFrom``: Away from\n* ``Unspecified``: Unspecified\n\n'),
+    ('Qgis.CoordinateOrder.Default', "Respect the default axis ordering for the CRS, as defined in the CRS's parameters"),
+    ('Qgis.CoordinateOrder.XY', 'Easting/Northing (or Longitude/Latitude for geographic CRS)'),
+    ('Qgis.CoordinateOrder.YX', 'Northing/Easting (or Latitude/Longitude for geographic CRS)'),
+    ('Qgis.CoordinateOrder', "Order of coordinates.\n\n.. versionadded:: 3.26\n\n* ``Default``: Respect the default axis ordering for the CRS, as defined in the CRS's parameters\n* ``XY``: Easting/Northing (or Longitude/Latitude for geographic CRS)\n* ``YX``: Northing/Easting (or Latitude/Longitude for geographic CRS)\n\n"),
+    ('QgsCoordinateReferenceSystem.ShortString', 'A heavily abbreviated string, for use when a compact representation is required'),
+    ('QgsCoordinateReferenceSystem.MediumString', 'A medium-length string, recommended for general purpose use'),
+    ('QgsCoordinateReferenceSystem.FullString', 'Full definition -- possibly a very lengthy string, e.g. with no truncation of custom WKT definitions'),
+    ('Qgis.CrsIdentifierType', 'Available identifier string types for representing coordinate reference systems\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsCoordinateReferenceSystem`.IdentifierType\n\n.. versionadded:: 3.36\n\n* ``ShortString``: A heavily abbreviated string, for use when a compact representation is required\n* ``MediumString``: A medium-length string, recommended for general purpose use\n* ``FullString``: Full definition -- possibly a very lengthy string, e.g. with no truncation of custom WKT definitions\n\n'),
+    ('QgsCoordinateReferenceSystem.WKT1_GDAL', 'WKT1 as traditionally output by GDAL, deriving from OGC 01-009. A notable departure from WKT1_GDAL with respect to OGC 01-009 is that in WKT1_GDAL, the unit of the PRIMEM value is always degrees.'),
+    ('QgsCoordinateReferenceSystem.WKT1_ESRI', 'WKT1 as traditionally output by ESRI software, deriving from OGC 99-049.'),
+    ('QgsCoordinateReferenceSystem.WKT2_2015', 'Full WKT2 string, conforming to ISO 19162:2015(E) / OGC 12-063r5 with all possible nodes and new keyword names.'),
+    ('QgsCoordinateReferenceSystem.WKT2_2015_SIMPLIFIED', 'Same as WKT2_2015 with the following exceptions: UNIT keyword used. ID node only on top element. No ORDER element in AXIS element. PRIMEM node omitted if it is Greenwich.  ELLIPSOID.UNIT node omitted if it is UnitOfMeasure.METRE. PARAMETER.UNIT / PRIMEM.UNIT omitted if same as AXIS. AXIS.UNIT omitted and replaced by a common GEODCRS.UNIT if they are all the same on all axis.'),
+    ('QgsCoordinateReferenceSystem.WKT2_2019', 'Full WKT2 string, conforming to ISO 19162:2019 / OGC 18-010, with all possible nodes and new keyword names. Non-normative list of differences: WKT2_2019 uses GEOGCRS / BASEGEOGCRS keywords for GeographicCRS.'),
+    ('QgsCoordinateReferenceSystem.WKT2_2019_SIMPLIFIED', 'WKT2_2019 with the simplification rule of WKT2_SIMPLIFIED'),
+    ('QgsCoordinateReferenceSystem.WKT_PREFERRED', 'Preferred format, matching the most recent WKT ISO standard. Currently an alias to WKT2_2019, but may change in future versions.'),
+    ('QgsCoordinateReferenceSystem.WKT_PREFERRED_SIMPLIFIED', 'Preferred simplified format, matching the most recent WKT ISO standard. Currently an alias to WKT2_2019_SIMPLIFIED, but may change in future versions.'),
+    ('QgsCoordinateReferenceSystem.WKT_PREFERRED_GDAL', 'Preferred format for conversion of CRS to WKT for use with the GDAL library.'),
+    ('Qgis.CrsWktVariant', 'Coordinate reference system WKT formatting variants.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsCoordinateReferenceSystem`.WktVariant\n\n.. versionadded:: 3.36\n\n* ``Wkt1Gdal``: WKT1 as traditionally output by GDAL, deriving from OGC 01-009. A notable departure from WKT1_GDAL with respect to OGC 01-009 is that in WKT1_GDAL, the unit of the PRIMEM value is always degrees.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT1_GDAL`` in older QGIS releases.\n\n* ``Wkt1Esri``: WKT1 as traditionally output by ESRI software, deriving from OGC 99-049.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT1_ESRI`` in older QGIS releases.\n\n* ``Wkt2_2015``: Full WKT2 string, conforming to ISO 19162:2015(E) / OGC 12-063r5 with all possible nodes and new keyword names.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT2_2015`` in older QGIS releases.\n\n* ``Wkt2_2015Simplified``: Same as WKT2_2015 with the following exceptions: UNIT keyword used. ID node only on top element. No ORDER element in AXIS element. PRIMEM node omitted if it is Greenwich.  ELLIPSOID.UNIT node omitted if it is UnitOfMeasure.METRE. PARAMETER.UNIT / PRIMEM.UNIT omitted if same as AXIS. AXIS.UNIT omitted and replaced by a common GEODCRS.UNIT if they are all the same on all axis.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT2_2015_SIMPLIFIED`` in older QGIS releases.\n\n* ``Wkt2_2019``: Full WKT2 string, conforming to ISO 19162:2019 / OGC 18-010, with all possible nodes and new keyword names. Non-normative list of differences: WKT2_2019 uses GEOGCRS / BASEGEOGCRS keywords for GeographicCRS.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT2_2019`` in older QGIS releases.\n\n* ``Wkt2_2019Simplified``: WKT2_2019 with the simplification rule of WKT2_SIMPLIFIED\n\n  Available as ``QgsCoordinateReferenceSystem.WKT2_2019_SIMPLIFIED`` in older QGIS releases.\n\n* ``Preferred``: Preferred format, matching the most recent WKT ISO standard. Currently an alias to WKT2_2019, but may change in future versions.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT_PREFERRED`` in older QGIS releases.\n\n* ``PreferredSimplified``: Preferred simplified format, matching the most recent WKT ISO standard. Currently an alias to WKT2_2019_SIMPLIFIED, but may change in future versions.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT_PREFERRED_SIMPLIFIED`` in older QGIS releases.\n\n* ``PreferredGdal``: Preferred format for conversion of CRS to WKT for use with the GDAL library.\n\n  Available as ``QgsCoordinateReferenceSystem.WKT_PREFERRED_GDAL`` in older QGIS releases.\n\n\n'),
+    ('Qgis.Axis.X', 'X-axis'),
+    ('Qgis.Axis.Y', 'Y-axis'),
+    ('Qgis.Axis.Z', 'Z-axis'),
+    ('Qgis.Axis', 'Cartesian axes.\n\n.. versionadded:: 3.34\n\n* ``X``: X-axis\n* ``Y``: Y-axis\n* ``Z``: Z-axis\n\n'),
+    ('Qgis.AnnotationItemFlag.ScaleDependentBoundingBox', "Item's bounding box will vary depending on map scale"),
+    ('Qgis.AnnotationItemFlag.SupportsReferenceScale', 'Item supports reference scale based rendering \n.. versionadded:: 3.40'),
+    ('Qgis.AnnotationItemFlag.SupportsCallouts', 'Item supports callouts \n.. versionadded:: 3.40'),
+    ('Qgis.AnnotationItemFlag', "Flags for annotation items.\n\n.. versionadded:: 3.22\n\n* ``ScaleDependentBoundingBox``: Item's bounding box will vary depending on map scale\n* ``SupportsReferenceScale``: Item supports reference scale based rendering\n\n  .. versionadded:: 3.40\n\n* ``SupportsCallouts``: Item supports callouts\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('Qgis.AnnotationPlacementMode.SpatialBounds', 'Item is rendered inside fixed spatial bounds, and size will depend on map scale'),
+    ('Qgis.AnnotationPlacementMode.FixedSize', "Item is rendered at a fixed size, regardless of map scale. Item's location is georeferenced to a spatial location."),
+    ('Qgis.AnnotationPlacementMode.RelativeToMapFrame', "Items size and placement is relative to the map's frame, and the item will always be rendered in the same visible location regardless of map extent or scale."),
+    ('Qgis.AnnotationPlacementMode', "Annotation item placement modes.\n\n.. versionadded:: 3.40\n\n* ``SpatialBounds``: Item is rendered inside fixed spatial bounds, and size will depend on map scale\n* ``FixedSize``: Item is rendered at a fixed size, regardless of map scale. Item's location is georeferenced to a spatial location.\n* ``RelativeToMapFrame``: Items size and placement is relative to the map's frame, and the item will always be rendered in the same visible location regardless of map extent or scale.\n\n"),
+    ('Qgis.AnnotationItemGuiFlag.FlagNoCreationTools', 'Do not show item creation tools for the item type'),
+    ('Qgis.AnnotationItemGuiFlag', 'Flags for controlling how an annotation item behaves in the GUI.\n\n.. versionadded:: 3.22\n\n* ``FlagNoCreationTools``: Do not show item creation tools for the item type\n\n'),
+    ('Qgis.AnnotationItemNodeType.VertexHandle', 'Node is a handle for manipulating vertices'),
+    ('Qgis.AnnotationItemNodeType.CalloutHandle', 'Node is a handle for manipulating callouts \n.. versionadded:: 3.40'),
+    ('Qgis.AnnotationItemNodeType', 'Annotation item node types.\n\n.. versionadded:: 3.22\n\n* ``VertexHandle``: Node is a handle for manipulating vertices\n* ``CalloutHandle``: Node is a handle for manipulating callouts\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('Qgis.AnnotationItemEditOperationResult.Success', 'Item was modified successfully'),
+    ('Qgis.AnnotationItemEditOperationResult.Invalid', 'Operation has invalid parameters for the item, no change occurred'),
+    ('Qgis.AnnotationItemEditOperationResult.ItemCleared', 'The operation results in the item being cleared, and the item should be removed from the layer as a result'),
+    ('Qgis.AnnotationItemEditOperationResult', 'Results from an edit operation on an annotation item.\n\n.. versionadded:: 3.22\n\n* ``Success``: Item was modified successfully\n* ``Invalid``: Operation has invalid parameters for the item, no change occurred\n* ``ItemCleared``: The operation results in the item being cleared, and the item should be removed from the layer as a result\n\n'),
+    ('QgsTemporalNavigationObject.NavigationOff', 'Temporal navigation is disabled'),
+    ('QgsTemporalNavigationObject.Animated', 'Temporal navigation relies on frames within a datetime range'),
+    ('QgsTemporalNavigationObject.FixedRange', 'Temporal navigation relies on a fixed datetime range'),
+    ('QgsTemporalNavigationObject.Movie', 'Movie mode -- behaves like a video player, with a fixed frame duration and no temporal range \n.. versionadded:: 3.36'),
+    ('Qgis.TemporalNavigationMode', 'Temporal navigation modes.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsTemporalNavigationObject`.NavigationMode\n\n.. versionadded:: 3.36\n\n* ``Disabled``: Temporal navigation is disabled\n\n  Available as ``QgsTemporalNavigationObject.NavigationOff`` in older QGIS releases.\n\n* ``Animated``: Temporal navigation relies on frames within a datetime range\n* ``FixedRange``: Temporal navigation relies on a fixed datetime range\n* ``Movie``: Movie mode -- behaves like a video player, with a fixed frame duration and no temporal range\n\n  .. versionadded:: 3.36\n\n\n'),
+    ('QgsTemporalNavigationObject.Forward', 'Animation is playing forward.'),
+    ('QgsTemporalNavigationObject.Reverse', 'Animation is playing in reverse.'),
+    ('QgsTemporalNavigationObject.Idle', 'Animation is paused.'),
+    ('Qgis.AnimationState', 'Animation states.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsTemporalNavigationObject`.AnimationState\n\n.. versionadded:: 3.36\n\n* ``Forward``: Animation is playing forward.\n* ``Reverse``: Animation is playing in reverse.\n* ``Idle``: Animation is paused.\n\n'),
+    ('Qgis.PlaybackOperation.SkipToStart', 'Jump to start of playback'),
+    ('Qgis.PlaybackOperation.PreviousFrame', 'Step to previous frame'),
+    ('Qgis.PlaybackOperation.PlayReverse', 'Play in reverse'),
+    ('Qgis.PlaybackOperation.Pause', 'Pause playback'),
+    ('Qgis.PlaybackOperation.PlayForward', 'Play forward'),
+    ('Qgis.PlaybackOperation.NextFrame', 'Step to next frame'),
+    ('Qgis.PlaybackOperation.SkipToEnd', 'Jump to end of playback'),
+    ('Qgis.PlaybackOperation', 'Media playback operations.\n\n.. versionadded:: 3.36\n\n* ``SkipToStart``: Jump to start of playback\n* ``PreviousFrame``: Step to previous frame\n* ``PlayReverse``: Play in reverse\n* ``Pause``: Pause playback\n* ``PlayForward``: Play forward\n* ``NextFrame``: Step to next frame\n* ``SkipToEnd``: Jump to end of playback\n\n'),
+    ('QgsVectorLayerTemporalProperties.ModeFixedTemporalRange', 'Mode when temporal properties have fixed start and end datetimes.'),
+    ('QgsVectorLayerTemporalProperties.ModeFeatureDateTimeInstantFromField', 'Mode when features have a datetime instant taken from a single field'),
+    ('QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromFields', 'Mode when features have separate fields for start and end times'),
+    ('QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndDurationFromFields', 'Mode when features have a field for start time and a field for event duration'),
+    ('QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromExpressions', 'Mode when features use expressions for start and end times'),
+    ('QgsVectorLayerTemporalProperties.ModeRedrawLayerOnly', "Redraw the layer when temporal range changes, but don't apply any filtering. Useful when symbology or rule based renderer expressions depend on the time range."),
+    ('Qgis.VectorTemporalMode', "Vector layer temporal feature modes\n\n.. versionadded:: 3.22\n\n* ``FixedTemporalRange``: Mode when temporal properties have fixed start and end datetimes.\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeFixedTemporalRange`` in older QGIS releases.\n\n* ``FeatureDateTimeInstantFromField``: Mode when features have a datetime instant taken from a single field\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeFeatureDateTimeInstantFromField`` in older QGIS releases.\n\n* ``FeatureDateTimeStartAndEndFromFields``: Mode when features have separate fields for start and end times\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromFields`` in older QGIS releases.\n\n* ``FeatureDateTimeStartAndDurationFromFields``: Mode when features have a field for start time and a field for event duration\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndDurationFromFields`` in older QGIS releases.\n\n* ``FeatureDateTimeStartAndEndFromExpressions``: Mode when features use expressions for start and end times\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromExpressions`` in older QGIS releases.\n\n* ``RedrawLayerOnly``: Redraw the layer when temporal range changes, but don't apply any filtering. Useful when symbology or rule based renderer expressions depend on the time range.\n\n  Available as ``QgsVectorLayerTemporalProperties.ModeRedrawLayerOnly`` in older QGIS releases.\n\n\n"),
+    ('Qgis.VectorTemporalLimitMode.IncludeBeginExcludeEnd', 'Default mode: include the Begin limit, but exclude the End limit'),
+    ('Qgis.VectorTemporalLimitMode.IncludeBeginIncludeEnd', 'Mode to include both limits of the filtering timeframe'),
+    ('Qgis.VectorTemporalLimitMode', 'Mode for the handling of the limits of the filtering timeframe for vector features\n\n.. versionadded:: 3.22\n\n* ``IncludeBeginExcludeEnd``: Default mode: include the Begin limit, but exclude the End limit\n* ``IncludeBeginIncludeEnd``: Mode to include both limits of the filtering timeframe\n\n'),
+    ('QgsVectorDataProviderTemporalCapabilities.ProviderHasFixedTemporalRange', 'Entire dataset from provider has a fixed start and end datetime.'),
+    ('QgsVectorDataProviderTemporalCapabilities.ProviderStoresFeatureDateTimeInstantInField', 'Dataset has feature datetime instants stored in a single field'),
+    ('QgsVectorDataProviderTemporalCapabilities.ProviderStoresFeatureDateTimeStartAndEndInSeparateFields', 'Dataset stores feature start and end datetimes in separate fields'),
+    ('Qgis.VectorDataProviderTemporalMode', 'Vector data provider temporal handling modes.\n\n.. versionadded:: 3.22\n\n* ``HasFixedTemporalRange``: Entire dataset from provider has a fixed start and end datetime.\n\n  Available as ``QgsVectorDataProviderTemporalCapabilities.ProviderHasFixedTemporalRange`` in older QGIS releases.\n\n* ``StoresFeatureDateTimeInstantInField``: Dataset has feature datetime instants stored in a single field\n\n  Available as ``QgsVectorDataProviderTemporalCapabilities.ProviderStoresFeatureDateTimeInstantInField`` in older QGIS releases.\n\n* ``StoresFeatureDateTimeStartAndEndInSeparateFields``: Dataset stores feature start and end datetimes in separate fields\n\n  Available as ``QgsVectorDataProviderTemporalCapabilities.ProviderStoresFeatureDateTimeStartAndEndInSeparateFields`` in older QGIS releases.\n\n\n'),
+    ('QgsRasterLayerTemporalProperties.ModeFixedTemporalRange', 'Mode when temporal properties have fixed start and end datetimes.'),
+    ('QgsRasterLayerTemporalProperties.ModeTemporalRangeFromDataProvider', 'Mode when raster layer delegates temporal range handling to the dataprovider.'),
+    ('QgsRasterLayerTemporalProperties.ModeRedrawLayerOnly', "Redraw the layer when temporal range changes, but don't apply any filtering. Useful when raster symbology expressions depend on the time range. \n.. versionadded:: 3.22"),
+    ('QgsRasterLayerTemporalProperties.FixedRangePerBand', 'Layer has a fixed temporal range per band \n.. versionadded:: 3.38'),
+    ('QgsRasterLayerTemporalProperties.RepresentsTemporalValues', 'Pixel values represent an datetime'),
+    ('QgsRasterLayerTemporalProperties.FixedDateTime', 'Layer has a fixed date time instant. \n.. versionadded:: 3.44'),
+    ('Qgis.RasterTemporalMode', "Raster layer temporal modes\n\n.. versionadded:: 3.22\n\n* ``FixedTemporalRange``: Mode when temporal properties have fixed start and end datetimes.\n\n  Available as ``QgsRasterLayerTemporalProperties.ModeFixedTemporalRange`` in older QGIS releases.\n\n* ``TemporalRangeFromDataProvider``: Mode when raster layer delegates temporal range handling to the dataprovider.\n\n  Available as ``QgsRasterLayerTemporalProperties.ModeTemporalRangeFromDataProvider`` in older QGIS releases.\n\n* ``RedrawLayerOnly``: Redraw the layer when temporal range changes, but don't apply any filtering. Useful when raster symbology expressions depend on the time range.\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsRasterLayerTemporalProperties.ModeRedrawLayerOnly`` in older QGIS releases.\n\n* ``FixedRangePerBand``: Layer has a fixed temporal range per band\n\n  .. versionadded:: 3.38\n\n* ``RepresentsTemporalValues``: Pixel values represent an datetime\n* ``FixedDateTime``: Layer has a fixed date time instant.\n\n  .. versionadded:: 3.44\n\n\n"),
+    ('QgsRasterDataProviderTemporalCapabilities.MatchUsingWholeRange', 'Use an exact match to the whole temporal range'),
+    ('QgsRasterDataProviderTemporalCapabilities.MatchExactUsingStartOfRange', 'Match the start of the temporal range to a corresponding layer or band, and only use exact matching results'),
+    ('QgsRasterDataProviderTemporalCapabilities.MatchExactUsingEndOfRange', 'Match the end of the temporal range to a corresponding layer or band, and only use exact matching results'),
+    ('QgsRasterDataProviderTemporalCapabilities.FindClosestMatchToStartOfRange', 'Match the start of the temporal range to the least previous closest datetime.'),
+    ('QgsRasterDataProviderTemporalCapabilities.FindClosestMatchToEndOfRange', 'Match the end of the temporal range to the least previous closest datetime.'),
+    ('Qgis.TemporalIntervalMatchMethod', 'Method to use when resolving a temporal range to a data provider layer or band.\n\n.. versionadded:: 3.22\n\n* ``MatchUsingWholeRange``: Use an exact match to the whole temporal range\n* ``MatchExactUsingStartOfRange``: Match the start of the temporal range to a corresponding layer or band, and only use exact matching results\n* ``MatchExactUsingEndOfRange``: Match the end of the temporal range to a corresponding layer or band, and only use exact matching results\n* ``FindClosestMatchToStartOfRange``: Match the start of the temporal range to the least previous closest datetime.\n* ``FindClosestMatchToEndOfRange``: Match the end of the temporal range to the least previous closest datetime.\n\n'),
+    ('Qgis.RasterTemporalCapabilityFlag.RequestedTimesMustExactlyMatchAllAvailableTemporalRanges', 'If present, indicates that the provider must only request temporal values which are exact matches for the values present in QgsRasterDataProviderTemporalCapabilities.allAvailableTemporalRanges().'),
+    ('Qgis.RasterTemporalCapabilityFlag', 'Flags for raster layer temporal capabilities.\n\n.. versionadded:: 3.28\n\n* ``RequestedTimesMustExactlyMatchAllAvailableTemporalRanges``: If present, indicates that the provider must only request temporal values which are exact matches for the values present in QgsRasterDataProviderTemporalCapabilities.allAvailableTemporalRanges().\n\n'),
+    ('QgsCoordinateTransform.ForwardTransform', 'Forward transform (from source to destination)'),
+    ('QgsCoordinateTransform.ReverseTransform', 'Reverse/inverse transform (from destination to source)'),
+    ('Qgis.TransformDirection', 'Indicates the direction (forward or inverse) of a transform.\n\n.. versionadded:: 3.22\n\n* ``Forward``: Forward transform (from source to destination)\n\n  Available as ``QgsCoordinateTransform.ForwardTransform`` in older QGIS releases.\n\n* ``Reverse``: Reverse/inverse transform (from destination to source)\n\n  Available as ``QgsCoordinateTransform.ReverseTransform`` in older QGIS releases.\n\n\n'),
+    ('Qgis.CoordinateTransformationFlag.BallparkTransformsAreAppropriate', 'Indicates that approximate "ballpark" results are appropriate for this coordinate transform. See QgsCoordinateTransform.setBallparkTransformsAreAppropriate() for further details.'),
+    ('Qgis.CoordinateTransformationFlag.IgnoreImpossibleTransformations', 'Indicates that impossible transformations (such as those which attempt to transform between two different celestial bodies) should be silently handled and marked as invalid. See QgsCoordinateTransform.isTransformationPossible() and QgsCoordinateTransform.isValid().'),
+    ('Qgis.CoordinateTransformationFlag', 'Flags which adjust the coordinate transformations behave.\n\n.. versionadded:: 3.26\n\n* ``BallparkTransformsAreAppropriate``: Indicates that approximate "ballpark" results are appropriate for this coordinate transform. See QgsCoordinateTransform.setBallparkTransformsAreAppropriate() for further details.\n* ``IgnoreImpossibleTransformations``: Indicates that impossible transformations (such as those which attempt to transform between two different celestial bodies) should be silently handled and marked as invalid. See QgsCoordinateTransform.isTransformationPossible() and QgsCoordinateTransform.isValid().\n\n'),
+    ('Qgis.RasterizedRenderingPolicy.Default', 'Allow raster-based rendering in situations where it is required for correct rendering or where it will be faster than vector based rendering.'),
+    ('Qgis.RasterizedRenderingPolicy.PreferVector', 'Prefer vector-based rendering, when the result will still be visually near-identical to a raster-based render. The render may be slower or result in larger output file sizes.'),
+    ('Qgis.RasterizedRenderingPolicy.ForceVector', 'Always force vector-based rendering, even when the result will be visually different to a raster-based render. For example, this policy will ignore effects which require flattened rasters during renders such as layer-wide opacity or blend modes.'),
+    ('Qgis.RasterizedRenderingPolicy', 'Policies controlling when rasterisation of content during renders is permitted.\n\n.. versionadded:: 3.44\n\n* ``Default``: Allow raster-based rendering in situations where it is required for correct rendering or where it will be faster than vector based rendering.\n* ``PreferVector``: Prefer vector-based rendering, when the result will still be visually near-identical to a raster-based render. The render may be slower or result in larger output file sizes.\n* ``ForceVector``: Always force vector-based rendering, even when the result will be visually different to a raster-based render. For example, this policy will ignore effects which require flattened rasters during renders such as layer-wide opacity or blend modes.\n\n'),
+    ('QgsMapSettings.Antialiasing', 'Enable anti-aliasing for map rendering'),
+    ('QgsMapSettings.DrawEditingInfo', 'Enable drawing of vertex markers for layers in editing mode'),
+    ('QgsMapSettings.ForceVectorOutput', 'Vector graphics should not be cached and drawn as raster images. \n.. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.'),
+    ('QgsMapSettings.UseAdvancedEffects', 'Enable layer opacity and blending effects \n.. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.'),
+    ('QgsMapSettings.DrawLabeling', 'Enable drawing of labels on top of the map'),
+    ('QgsMapSettings.UseRenderingOptimization', 'Enable vector simplification and other rendering optimizations'),
+    ('QgsMapSettings.DrawSelection', 'Whether vector selections should be shown in the rendered map'),
+    ('QgsMapSettings.DrawSymbolBounds', 'Draw bounds of symbols (for debugging/testing)'),
+    ('QgsMapSettings.RenderMapTile', 'Draw map such that there are no problems between adjacent tiles'),
+    ('QgsMapSettings.RenderPartialOutput', 'Whether to make extra effort to update map image with partially rendered layers (better for interactive map canvas). Added in QGIS 3.0'),
+    ('QgsMapSettings.RenderPreviewJob', "Render is a 'canvas preview' render, and shortcuts should be taken to ensure fast rendering"),
+    ('QgsMapSettings.RenderBlocking', 'Render and load remote sources in the same thread to ensure rendering remote sources (svg and images). WARNING: this flag must NEVER be used from GUI based applications (like the main QGIS application) or crashes will result. Only for use in external scripts or QGIS server.'),
+    ('QgsMapSettings.LosslessImageRendering', 'Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF). This flag only works with builds based on Qt 5.13 or later.'),
+    ('QgsMapSettings.Render3DMap', 'Render is for a 3D map'),
+    ('QgsMapSettings.HighQualityImageTransforms', 'Enable high quality image transformations, which results in better appearance of scaled or rotated raster components of a map \n.. versionadded:: 3.24'),
+    ('QgsMapSettings.SkipSymbolRendering', 'Disable symbol rendering while still drawing labels if enabled \n.. versionadded:: 3.24'),
+    ('QgsMapSettings.ForceRasterMasks', 'Force symbol masking to be applied using a raster method. This is considerably faster when compared to the vector method, but results in a inferior quality output. \n.. versionadded:: 3.26.1'),
+    ('QgsMapSettings.RecordProfile', 'Enable run-time profiling while rendering \n.. versionadded:: 3.34'),
+    ('QgsMapSettings.AlwaysUseGlobalMasks', 'When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex vector exports in all current Qt versions. This flag only applies to vector map exports. \n.. versionadded:: 3.38'),
+    ('Qgis.MapSettingsFlag', 'Flags which adjust the way maps are rendered.\n\n.. versionadded:: 3.22\n\n* ``Antialiasing``: Enable anti-aliasing for map rendering\n* ``DrawEditingInfo``: Enable drawing of vertex markers for layers in editing mode\n* ``ForceVectorOutput``: Vector graphics should not be cached and drawn as raster images.\n\n  .. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.\n\n* ``UseAdvancedEffects``: Enable layer opacity and blending effects\n\n  .. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.\n\n* ``DrawLabeling``: Enable drawing of labels on top of the map\n* ``UseRenderingOptimization``: Enable vector simplification and other rendering optimizations\n* ``DrawSelection``: Whether vector selections should be shown in the rendered map\n* ``DrawSymbolBounds``: Draw bounds of symbols (for debugging/testing)\n* ``RenderMapTile``: Draw map such that there are no problems between adjacent tiles\n* ``RenderPartialOutput``: Whether to make extra effort to update map image with partially rendered layers (better for interactive map canvas). Added in QGIS 3.0\n* ``RenderPreviewJob``: Render is a \'canvas preview\' render, and shortcuts should be taken to ensure fast rendering\n* ``RenderBlocking``: Render and load remote sources in the same thread to ensure rendering remote sources (svg and images). WARNING: this flag must NEVER be used from GUI based applications (like the main QGIS application) or crashes will result. Only for use in external scripts or QGIS server.\n* ``LosslessImageRendering``: Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF). This flag only works with builds based on Qt 5.13 or later.\n* ``Render3DMap``: Render is for a 3D map\n* ``HighQualityImageTransforms``: Enable high quality image transformations, which results in better appearance of scaled or rotated raster components of a map\n\n  .. versionadded:: 3.24\n\n* ``SkipSymbolRendering``: Disable symbol rendering while still drawing labels if enabled\n\n  .. versionadded:: 3.24\n\n* ``ForceRasterMasks``: Force symbol masking to be applied using a raster method. This is considerably faster when compared to the vector method, but results in a inferior quality output.\n\n  .. versionadded:: 3.26.1\n\n* ``RecordProfile``: Enable run-time profiling while rendering\n\n  .. versionadded:: 3.34\n\n* ``AlwaysUseGlobalMasks``: When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex vector exports in all current Qt versions. This flag only applies to vector map exports.\n\n  .. versionadded:: 3.38\n\n\n'),
+    ('QgsRenderContext.DrawEditingInfo', 'Enable drawing of vertex markers for layers in editing mode'),
+    ('QgsRenderContext.ForceVectorOutput', 'Vector graphics should not be cached and drawn as raster images \n.. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.'),
+    ('QgsRenderContext.UseAdvancedEffects', 'Enable layer opacity and blending effects \n.. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.'),
+    ('QgsRenderContext.UseRenderingOptimization', 'Enable vector simplification and other rendering optimizations'),
+    ('QgsRenderContext.DrawSelection', 'Whether vector selections should be shown in the rendered map'),
+    ('QgsRenderContext.DrawSymbolBounds', 'Draw bounds of symbols (for debugging/testing)'),
+    ('QgsRenderContext.RenderMapTile', 'Draw map such that there are no problems between adjacent tiles'),
+    ('QgsRenderContext.Antialiasing', 'Use antialiasing while drawing'),
+    ('QgsRenderContext.RenderPartialOutput', 'Whether to make extra effort to update map image with partially rendered layers (better for interactive map canvas). Added in QGIS 3.0'),
+    ('QgsRenderContext.RenderPreviewJob', "Render is a 'canvas preview' render, and shortcuts should be taken to ensure fast rendering"),
+    ('QgsRenderContext.RenderBlocking', 'Render and load remote sources in the same thread to ensure rendering remote sources (svg and images). WARNING: this flag must NEVER be used from GUI based applications (like the main QGIS application) or crashes will result. Only for use in external scripts or QGIS server.'),
+    ('QgsRenderContext.RenderSymbolPreview', 'The render is for a symbol preview only and map based properties may not be available, so care should be taken to handle map unit based sizes in an appropriate way.'),
+    ('QgsRenderContext.LosslessImageRendering', 'Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF). This flag only works with builds based on Qt 5.13 or later.'),
+    ('QgsRenderContext.ApplyScalingWorkaroundForTextRendering', 'Whether a scaling workaround designed to stablise the rendering of small font sizes (or for painters scaled out by a large amount) when rendering text. Generally this is recommended, but it may incur some performance cost.'),
+    ('QgsRenderContext.Render3DMap', 'Render is for a 3D map'),
+    ('QgsRenderContext.ApplyClipAfterReprojection', "Feature geometry clipping to mapExtent() must be performed after the geometries are transformed using coordinateTransform(). Usually feature geometry clipping occurs using the extent() in the layer's CRS prior to geometry transformation, but in some cases when extent() could not be accurately calculated it is necessary to clip geometries to mapExtent() AFTER transforming them using coordinateTransform()."),
+    ('QgsRenderContext.RenderingSubSymbol', 'Set whenever a sub-symbol of a parent symbol is currently being rendered. Can be used during symbol and symbol layer rendering to determine whether the symbol being rendered is a subsymbol. \n.. versionadded:: 3.24'),
+    ('QgsRenderContext.HighQualityImageTransforms', 'Enable high quality image transformations, which results in better appearance of scaled or rotated raster components of a map \n.. versionadded:: 3.24'),
+    ('QgsRenderContext.SkipSymbolRendering', 'Disable symbol rendering while still drawing labels if enabled \n.. versionadded:: 3.24'),
+    ('QgsRenderContext.RecordProfile', 'Enable run-time profiling while rendering \n.. versionadded:: 3.34'),
+    ('QgsRenderContext.AlwaysUseGlobalMasks', 'When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex vector exports in all current Qt versions. This flag only applies to vector map exports. \n.. versionadded:: 3.38'),
+    ('QgsRenderContext.DisableSymbolClippingToExtent', 'Force symbol clipping to map extent to be disabled in all situations. This will result in slower rendering, and should only be used in situations where the feature clipping is always undesirable. \n.. versionadded:: 3.40'),
+    ('QgsRenderContext.RenderLayerTree', 'The render is for a layer tree display where map based properties are not available and where avoidance of long rendering freeze is crucial \n.. versionadded:: 3.44'),
+    ('Qgis.RenderContextFlag', 'Flags which affect rendering operations.\n\n.. versionadded:: 3.22\n\n* ``DrawEditingInfo``: Enable drawing of vertex markers for layers in editing mode\n* ``ForceVectorOutput``: Vector graphics should not be cached and drawn as raster images\n\n  .. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.\n\n* ``UseAdvancedEffects``: Enable layer opacity and blending effects\n\n  .. deprecated:: 3.44. Use Qgis.RasterizedRenderingPolicy instead.\n\n* ``UseRenderingOptimization``: Enable vector simplification and other rendering optimizations\n* ``DrawSelection``: Whether vector selections should be shown in the rendered map\n* ``DrawSymbolBounds``: Draw bounds of symbols (for debugging/testing)\n* ``RenderMapTile``: Draw map such that there are no problems between adjacent tiles\n* ``Antialiasing``: Use antialiasing while drawing\n* ``RenderPartialOutput``: Whether to make extra effort to update map image with partially rendered layers (better for interactive map canvas). Added in QGIS 3.0\n* ``RenderPreviewJob``: Render is a \'canvas preview\' render, and shortcuts should be taken to ensure fast rendering\n* ``RenderBlocking``: Render and load remote sources in the same thread to ensure rendering remote sources (svg and images). WARNING: this flag must NEVER be used from GUI based applications (like the main QGIS application) or crashes will result. Only for use in external scripts or QGIS server.\n* ``RenderSymbolPreview``: The render is for a symbol preview only and map based properties may not be available, so care should be taken to handle map unit based sizes in an appropriate way.\n* ``LosslessImageRendering``: Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF). This flag only works with builds based on Qt 5.13 or later.\n* ``ApplyScalingWorkaroundForTextRendering``: Whether a scaling workaround designed to stablise the rendering of small font sizes (or for painters scaled out by a large amount) when rendering text. Generally this is recommended, but it may incur some performance cost.\n* ``Render3DMap``: Render is for a 3D map\n* ``ApplyClipAfterReprojection``: Feature geometry clipping to mapExtent() must be performed after the geometries are transformed using coordinateTransform(). Usually feature geometry clipping occurs using the extent() in the layer\'s CRS prior to geometry transformation, but in some cases when extent() could not be accurately calculated it is necessary to clip geometries to mapExtent() AFTER transforming them using coordinateTransform().\n* ``RenderingSubSymbol``: Set whenever a sub-symbol of a parent symbol is currently being rendered. Can be used during symbol and symbol layer rendering to determine whether the symbol being rendered is a subsymbol.\n\n  .. versionadded:: 3.24\n\n* ``HighQualityImageTransforms``: Enable high quality image transformations, which results in better appearance of scaled or rotated raster components of a map\n\n  .. versionadded:: 3.24\n\n* ``SkipSymbolRendering``: Disable symbol rendering while still drawing labels if enabled\n\n  .. versionadded:: 3.24\n\n* ``RecordProfile``: Enable run-time profiling while rendering\n\n  .. versionadded:: 3.34\n\n* ``AlwaysUseGlobalMasks``: When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex vector exports in all current Qt versions. This flag only applies to vector map exports.\n\n  .. versionadded:: 3.38\n\n* ``DisableSymbolClippingToExtent``: Force symbol clipping to map extent to be disabled in all situations. This will result in slower rendering, and should only be used in situations where the feature clipping is always undesirable.\n\n  .. versionadded:: 3.40\n\n* ``RenderLayerTree``: The render is for a layer tree display where map based properties are not available and where avoidance of long rendering freeze is crucial\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('Qgis.MapLayerRendererFlag.RenderPartialOutputs', 'The renderer benefits from rendering temporary in-progress preview renders. These are temporary results which will be used for the layer during rendering in-progress compositions, which will differ from the final layer render. They can be used for showing overlays or other information to users which help inform them about what is actually occurring during a slow layer render, but where these overlays and additional content is not wanted in the final layer renders. Another use case is rendering unsorted results as soon as they are available, before doing a final sorted render of the entire layer contents.'),
+    ('Qgis.MapLayerRendererFlag.RenderPartialOutputOverPreviousCachedImage', 'When rendering temporary in-progress preview renders, these preview renders can be drawn over any previously cached layer render we have for the same region. This can allow eg a low-resolution zoomed in version of the last map render to be used as a base painting surface to overdraw with incremental preview render outputs. If not set, an empty image will be used as the starting point for the render preview image.'),
+    ('Qgis.MapLayerRendererFlag.AffectsLabeling', 'The layer rendering will interact with the map labeling \n.. versionadded:: 3.40'),
+    ('Qgis.MapLayerRendererFlag', 'Flags which control how map layer renderers behave.\n\n.. versionadded:: 3.34\n\n* ``RenderPartialOutputs``: The renderer benefits from rendering temporary in-progress preview renders. These are temporary results which will be used for the layer during rendering in-progress compositions, which will differ from the final layer render. They can be used for showing overlays or other information to users which help inform them about what is actually occurring during a slow layer render, but where these overlays and additional content is not wanted in the final layer renders. Another use case is rendering unsorted results as soon as they are available, before doing a final sorted render of the entire layer contents.\n* ``RenderPartialOutputOverPreviousCachedImage``: When rendering temporary in-progress preview renders, these preview renders can be drawn over any previously cached layer render we have for the same region. This can allow eg a low-resolution zoomed in version of the last map render to be used as a base painting surface to overdraw with incremental preview render outputs. If not set, an empty image will be used as the starting point for the render preview image.\n* ``AffectsLabeling``: The layer rendering will interact with the map labeling\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('Qgis.PaintEffectFlag.RequiresRasterization', 'The effect requires raster-based rendering.'),
+    ('Qgis.PaintEffectFlag', 'Flags which control how paint effects behave.\n\n.. versionadded:: 3.44\n\n* ``RequiresRasterization``: The effect requires raster-based rendering.\n\n'),
+    ('QgsRenderContext.TextFormatAlwaysOutlines', 'Always render text using path objects (AKA outlines/curves). This setting guarantees the best quality rendering, even when using a raster paint surface (where sub-pixel path based text rendering is superior to sub-pixel text-based rendering). The downside is that text is converted to paths only, so users cannot open created vector outputs for post-processing in other applications and retain text editability.  This setting also guarantees complete compatibility with the full range of formatting options available through QgsTextRenderer and QgsTextFormat, some of which may not be possible to reproduce when using a vector-based paint surface and TextFormatAlwaysText mode. A final benefit to this setting is that vector exports created using text as outlines do not require all users to have the original fonts installed in order to display the text in its original style.'),
+    ('QgsRenderContext.TextFormatAlwaysText', "Always render text as text objects. While this mode preserves text objects as text for post-processing in external vector editing applications, it can result in rendering artifacts or poor quality rendering, depending on the text format settings. Even with raster based paint devices, TextFormatAlwaysText can result in inferior rendering quality to TextFormatAlwaysOutlines. When rendering using TextFormatAlwaysText to a vector based device (e.g. PDF or SVG), care must be taken to ensure that the required fonts are available to users when opening the created files, or default fallback fonts will be used to display the output instead. (Although PDF exports MAY automatically embed some fonts when possible, depending on the user's platform)."),
+    ('QgsRenderContext.PreferText', "Render text as text objects, unless doing so results in rendering artifacts or poor quality rendering (depending on text format settings). When rendering using TextFormatAlwaysText to a vector based device (e.g. PDF or SVG), care must be taken to ensure that the required fonts are available to users when opening the created files, or default fallback fonts will be used to display the output instead. (Although PDF exports MAY automatically embed some fonts when possible, depending on the user's platform). \n.. versionadded:: 3.40"),
+    ('Qgis.TextRenderFormat', "Options for rendering text.\n\n.. versionadded:: 3.22\n\n* ``AlwaysOutlines``: Always render text using path objects (AKA outlines/curves). This setting guarantees the best quality rendering, even when using a raster paint surface (where sub-pixel path based text rendering is superior to sub-pixel text-based rendering). The downside is that text is converted to paths only, so users cannot open created vector outputs for post-processing in other applications and retain text editability.  This setting also guarantees complete compatibility with the full range of formatting options available through QgsTextRenderer and QgsTextFormat, some of which may not be possible to reproduce when using a vector-based paint surface and TextFormatAlwaysText mode. A final benefit to this setting is that vector exports created using text as outlines do not require all users to have the original fonts installed in order to display the text in its original style.\n\n  Available as ``QgsRenderContext.TextFormatAlwaysOutlines`` in older QGIS releases.\n\n* ``AlwaysText``: Always render text as text objects. While this mode preserves text objects as text for post-processing in external vector editing applications, it can result in rendering artifacts or poor quality rendering, depending on the text format settings. Even with raster based paint devices, TextFormatAlwaysText can result in inferior rendering quality to TextFormatAlwaysOutlines. When rendering using TextFormatAlwaysText to a vector based device (e.g. PDF or SVG), care must be taken to ensure that the required fonts are available to users when opening the created files, or default fallback fonts will be used to display the output instead. (Although PDF exports MAY automatically embed some fonts when possible, depending on the user's platform).\n\n  Available as ``QgsRenderContext.TextFormatAlwaysText`` in older QGIS releases.\n\n* ``PreferText``: Render text as text objects, unless doing so results in rendering artifacts or poor quality rendering (depending on text format settings). When rendering using TextFormatAlwaysText to a vector based device (e.g. PDF or SVG), care must be taken to ensure that the required fonts are available to users when opening the created files, or default fallback fonts will be used to display the output instead. (Although PDF exports MAY automatically embed some fonts when possible, depending on the user's platform).\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('QgsLabelingEngineSettings.UseAllLabels', 'Whether to draw all labels even if there would be collisions'),
+    ('QgsLabelingEngineSettings.UsePartialCandidates', 'Whether to use also label candidates that are partially outside of the map view'),
+    ('QgsLabelingEngineSettings.RenderOutlineLabels', 'Whether to render labels as text or outlines. Deprecated and of QGIS 3.4.3 - use defaultTextRenderFormat() instead.'),
+    ('QgsLabelingEngineSettings.DrawLabelRectOnly', 'Whether to only draw the label rect and not the actual label text (used for unit tests)'),
+    ('QgsLabelingEngineSettings.DrawCandidates', 'Whether to draw rectangles of generated candidates (good for debugging)'),
+    ('QgsLabelingEngineSettings.DrawUnplacedLabels', 'Whether to render unplaced labels as an indicator/warning for users'),
+    ('QgsLabelingEngineSettings.CollectUnplacedLabels', 'Whether unplaced labels should be collected in the labeling results (regardless of whether they are being rendered) \n.. versionadded:: 3.20'),
+    ('QgsLabelingEngineSettings.DrawLabelMetrics', 'Whether to render label metric guides (for debugging) \n.. versionadded:: 3.30'),
+    ('Qgis.LabelingFlag', 'Various flags that affect drawing and placement of labels.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsLabelingEngineSettings`.Flag\n\n.. versionadded:: 3.30\n\n* ``UseAllLabels``: Whether to draw all labels even if there would be collisions\n* ``UsePartialCandidates``: Whether to use also label candidates that are partially outside of the map view\n* ``RenderOutlineLabels``: Whether to render labels as text or outlines. Deprecated and of QGIS 3.4.3 - use defaultTextRenderFormat() instead.\n* ``DrawLabelRectOnly``: Whether to only draw the label rect and not the actual label text (used for unit tests)\n* ``DrawCandidates``: Whether to draw rectangles of generated candidates (good for debugging)\n* ``DrawUnplacedLabels``: Whether to render unplaced labels as an indicator/warning for users\n* ``CollectUnplacedLabels``: Whether unplaced labels should be collected in the labeling results (regardless of whether they are being rendered)\n\n  .. versionadded:: 3.20\n\n* ``DrawLabelMetrics``: Whether to render label metric guides (for debugging)\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('QgsLabelingEngineSettings.PlacementEngineVersion1', 'Version 1, matches placement from QGIS <= 3.10.1'),
+    ('QgsLabelingEngineSettings.PlacementEngineVersion2', 'Version 2 (default for new projects since QGIS 3.12)'),
+    ('Qgis.LabelPlacementEngineVersion', 'Labeling placement engine version.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsLabelingEngineSettings`.PlacementEngineVersion\n\n.. versionadded:: 3.30\n\n* ``Version1``: Version 1, matches placement from QGIS <= 3.10.1\n\n  Available as ``QgsLabelingEngineSettings.PlacementEngineVersion1`` in older QGIS releases.\n\n* ``Version2``: Version 2 (default for new projects since QGIS 3.12)\n\n  Available as ``QgsLabelingEngineSettings.PlacementEngineVersion2`` in older QGIS releases.\n\n\n'),
+    ('QgsTextFormat.HorizontalOrientation', 'Horizontally oriented text'),
+    ('QgsTextFormat.VerticalOrientation', 'Vertically oriented text'),
+    ('QgsTextFormat.RotationBasedOrientation', 'Horizontally or vertically oriented text based on rotation (only available for map labeling)'),
+    ('Qgis.TextOrientation', 'Text orientations.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsTextFormat`.TextOrientation\n\n.. versionadded:: 3.28\n\n* ``Horizontal``: Horizontally oriented text\n\n  Available as ``QgsTextFormat.HorizontalOrientation`` in older QGIS releases.\n\n* ``Vertical``: Vertically oriented text\n\n  Available as ``QgsTextFormat.VerticalOrientation`` in older QGIS releases.\n\n* ``RotationBased``: Horizontally or vertically oriented text based on rotation (only available for map labeling)\n\n  Available as ``QgsTextFormat.RotationBasedOrientation`` in older QGIS releases.\n\n\n'),
+    ('QgsTextRenderer.Rect', 'Text within rectangle layout mode'),
+    ('QgsTextRenderer.Point', 'Text at point of origin layout mode'),
+    ('QgsTextRenderer.Label', 'Labeling-specific layout mode'),
+    ('QgsTextRenderer.RectangleCapHeightBased', 'Similar to Rectangle mode, but uses cap height only when calculating font heights for the first line of text, and cap height + descent for subsequent lines of text \n.. versionadded:: 3.30'),
+    ('QgsTextRenderer.RectangleAscentBased', 'Similar to Rectangle mode, but uses ascents only when calculating font and line heights. \n.. versionadded:: 3.30'),
+    ('Qgis.TextLayoutMode', 'Text layout modes.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsTextRenderer`.DrawMode\n\n.. versionadded:: 3.28\n\n* ``Rectangle``: Text within rectangle layout mode\n\n  Available as ``QgsTextRenderer.Rect`` in older QGIS releases.\n\n* ``Point``: Text at point of origin layout mode\n* ``Labeling``: Labeling-specific layout mode\n\n  Available as ``QgsTextRenderer.Label`` in older QGIS releases.\n\n* ``RectangleCapHeightBased``: Similar to Rectangle mode, but uses cap height only when calculating font heights for the first line of text, and cap height + descent for subsequent lines of text\n\n  .. versionadded:: 3.30\n\n* ``RectangleAscentBased``: Similar to Rectangle mode, but uses ascents only when calculating font and line heights.\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('QgsTextRenderer.Text', 'Text component'),
+    ('QgsTextRenderer.Buffer', 'Buffer component'),
+    ('QgsTextRenderer.Background', 'Background shape'),
+    ('QgsTextRenderer.Shadow', 'Drop shadow'),
+    ('Qgis.TextComponent', 'Text components.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsTextRenderer`.TextPart\n\n.. versionadded:: 3.28\n\n* ``Text``: Text component\n* ``Buffer``: Buffer component\n* ``Background``: Background shape\n* ``Shadow``: Drop shadow\n\n'),
+    ('QgsTextRenderer.AlignLeft', 'Left align'),
+    ('QgsTextRenderer.AlignCenter', 'Center align'),
+    ('QgsTextRenderer.AlignRight', 'Right align'),
+    ('QgsTextRenderer.AlignJustify', 'Justify align'),
+    ('Qgis.TextHorizontalAlignment', 'Text horizontal alignment.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsTextRenderer`.HAlignment\n\n.. versionadded:: 3.28\n\n* ``Left``: Left align\n\n  Available as ``QgsTextRenderer.AlignLeft`` in older QGIS releases.\n\n* ``Center``: Center align\n\n  Available as ``QgsTextRenderer.AlignCenter`` in older QGIS releases.\n\n* ``Right``: Right align\n\n  Available as ``QgsTextRenderer.AlignRight`` in older QGIS releases.\n\n* ``Justify``: Justify align\n\n  Available as ``QgsTextRenderer.AlignJustify`` in older QGIS releases.\n\n\n'),
+    ('QgsTextRenderer.AlignTop', 'Align to top'),
+    ('QgsTextRenderer.AlignVCenter', 'Center align'),
+    ('QgsTextRenderer.AlignBottom', 'Align to bottom'),
+    ('Qgis.TextVerticalAlignment', 'Text vertical alignment.\n\nThis enum controls vertical alignment of text in a predefined rectangular\nbounding box. See also Qgis.TextCharacterVerticalAlignment.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsTextRenderer`.VAlignment\n\n.. versionadded:: 3.28\n\n* ``Top``: Align to top\n\n  Available as ``QgsTextRenderer.AlignTop`` in older QGIS releases.\n\n* ``VerticalCenter``: Center align\n\n  Available as ``QgsTextRenderer.AlignVCenter`` in older QGIS releases.\n\n* ``Bottom``: Align to bottom\n\n  Available as ``QgsTextRenderer.AlignBottom`` in older QGIS releases.\n\n\n'),
+    ('Qgis.TextCharacterVerticalAlignment.Normal', 'Adjacent characters are positioned in the standard way for text in the writing system in use'),
+    ('Qgis.TextCharacterVerticalAlignment.SuperScript', 'Characters are placed above the base line for normal text.'),
+    ('Qgis.TextCharacterVerticalAlignment.SubScript', 'Characters are placed below the base line for normal text.'),
+    ('Qgis.TextCharacterVerticalAlignment', 'Text vertical alignment for characters.\n\nThis enum controls vertical alignment of individual characters within a block\nof text.\n\n.. versionadded:: 3.30\n\n* ``Normal``: Adjacent characters are positioned in the standard way for text in the writing system in use\n* ``SuperScript``: Characters are placed above the base line for normal text.\n* ``SubScript``: Characters are placed below the base line for normal text.\n\n'),
+    ('QgsTextRendererUtils.TruncateStringWhenLineIsTooShort', 'When a string is too long for the line, truncate characters instead of aborting the placement'),
+    ('QgsTextRendererUtils.UseBaselinePlacement', 'Generate placement based on the character baselines instead of centers'),
+    ('QgsTextRendererUtils.UprightCharactersOnly', 'Permit upright characters only. If not present then upside down text placement is permitted.'),
+    ('QgsTextRendererUtils.ExtendLineToFitText', "When a string is too long for the line, extend the line's final segment to fit the entire string. \n.. versionadded:: 4.0"),
+    ('Qgis.CurvedTextFlag', "Flags controlling behavior of curved text generation.\n\n.. versionadded:: 4.0.\n\n* ``TruncateStringWhenLineIsTooShort``: When a string is too long for the line, truncate characters instead of aborting the placement\n* ``UseBaselinePlacement``: Generate placement based on the character baselines instead of centers\n* ``UprightCharactersOnly``: Permit upright characters only. If not present then upside down text placement is permitted.\n* ``ExtendLineToFitText``: When a string is too long for the line, extend the line's final segment to fit the entire string.\n\n  .. versionadded:: 4.0\n\n\n"),
+    ('QgsVectorSimplifyMethod.Distance', 'The simplification uses the distance between points to remove duplicate points'),
+    ('QgsVectorSimplifyMethod.SnapToGrid', 'The simplification uses a grid (similar to ST_SnapToGrid) to remove duplicate points'),
+    ('QgsVectorSimplifyMethod.Visvalingam', 'The simplification gives each point in a line an importance weighting, so that least important points are removed first'),
+    ('QgsVectorSimplifyMethod.SnappedToGridGlobal', 'Snap to a global grid based on the tolerance. Good for consistent results for incoming vertices, regardless of their feature'),
+    ('Qgis.VectorSimplificationAlgorithm', 'Simplification algorithms for vector features.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsVectorSimplifyMethod`.SimplifyAlgorithm\n\n.. versionadded:: 3.38\n\n* ``Distance``: The simplification uses the distance between points to remove duplicate points\n* ``SnapToGrid``: The simplification uses a grid (similar to ST_SnapToGrid) to remove duplicate points\n* ``Visvalingam``: The simplification gives each point in a line an importance weighting, so that least important points are removed first\n* ``SnappedToGridGlobal``: Snap to a global grid based on the tolerance. Good for consistent results for incoming vertices, regardless of their feature\n\n'),
+    ('QgsVectorSimplifyMethod.NoSimplification', 'No simplification can be applied'),
+    ('QgsVectorSimplifyMethod.GeometrySimplification', 'The geometries can be simplified using the current map2pixel context state'),
+    ('QgsVectorSimplifyMethod.AntialiasingSimplification', "The geometries can be rendered with 'AntiAliasing' disabled because of it is '1-pixel size'"),
+    ('QgsVectorSimplifyMethod.FullSimplification', 'All simplification hints can be applied ( Geometry + AA-disabling )'),
+    ('Qgis.VectorRenderingSimplificationFlag', "Simplification flags for vector feature rendering.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsVectorSimplifyMethod`.SimplifyHint\n\n.. versionadded:: 3.38\n\n* ``NoSimplification``: No simplification can be applied\n* ``GeometrySimplification``: The geometries can be simplified using the current map2pixel context state\n* ``AntialiasingSimplification``: The geometries can be rendered with 'AntiAliasing' disabled because of it is '1-pixel size'\n* ``FullSimplification``: All simplification hints can be applied ( Geometry + AA-disabling )\n\n"),
+    ('Qgis.RenderSubcomponentProperty.Generic', 'Generic subcomponent property'),
+    ('Qgis.RenderSubcomponentProperty.ShadowOffset', 'Shadow offset'),
+    ('Qgis.RenderSubcomponentProperty.BlurSize', 'Blur size'),
+    ('Qgis.RenderSubcomponentProperty.GlowSpread', 'Glow spread size'),
+    ('Qgis.RenderSubcomponentProperty', 'Rendering subcomponent properties.\n\n.. versionadded:: 3.22\n\n* ``Generic``: Generic subcomponent property\n* ``ShadowOffset``: Shadow offset\n* ``BlurSize``: Blur size\n* ``GlowSpread``: Glow spread size\n\n'),
+    ('QgsVertexId.SegmentVertex', 'The actual start or end point of a segment'),
+    ('QgsVertexId.CurveVertex', 'An intermediate point on a segment defining the curvature of the segment'),
+    ('Qgis.VertexType', 'Types of vertex.\n\n.. versionadded:: 3.22\n\n* ``Segment``: The actual start or end point of a segment\n\n  Available as ``QgsVertexId.SegmentVertex`` in older QGIS releases.\n\n* ``Curve``: An intermediate point on a segment defining the curvature of the segment\n\n  Available as ``QgsVertexId.CurveVertex`` in older QGIS releases.\n\n\n'),
+    ('QgsSimpleMarkerSymbolLayerBase.Square', 'Square'),
+    ('QgsSimpleMarkerSymbolLayerBase.Diamond', 'Diamond'),
+    ('QgsSimpleMarkerSymbolLayerBase.Pentagon', 'Pentagon'),
+    ('QgsSimpleMarkerSymbolLayerBase.Hexagon', 'Hexagon'),
+    ('QgsSimpleMarkerSymbolLayerBase.Triangle', 'Triangle'),
+    ('QgsSimpleMarkerSymbolLayerBase.EquilateralTriangle', 'Equilateral triangle'),
+    ('QgsSimpleMarkerSymbolLayerBase.Star', 'Star'),
+    ('QgsSimpleMarkerSymbolLayerBase.Arrow', 'Arrow'),
+    ('QgsSimpleMarkerSymbolLayerBase.Circle', 'Circle'),
+    ('QgsSimpleMarkerSymbolLayerBase.Cross', 'Cross (lines only)'),
+    ('QgsSimpleMarkerSymbolLayerBase.CrossFill', 'Solid filled cross'),
+    ('QgsSimpleMarkerSymbolLayerBase.Cross2', "Rotated cross (lines only), 'x' shape"),
+    ('QgsSimpleMarkerSymbolLayerBase.Line', 'Vertical line'),
+    ('QgsSimpleMarkerSymbolLayerBase.ArrowHead', 'Right facing arrow head (unfilled, lines only)'),
+    ('QgsSimpleMarkerSymbolLayerBase.ArrowHeadFilled', 'Right facing filled arrow head'),
+    ('QgsSimpleMarkerSymbolLayerBase.SemiCircle', 'Semi circle (top half)'),
+    ('QgsSimpleMarkerSymbolLayerBase.ThirdCircle', 'One third circle (top left third)'),
+    ('QgsSimpleMarkerSymbolLayerBase.QuarterCircle', 'Quarter circle (top left quarter)'),
+    ('QgsSimpleMarkerSymbolLayerBase.QuarterSquare', 'Quarter square (top left quarter)'),
+    ('QgsSimpleMarkerSymbolLayerBase.HalfSquare', 'Half square (left half)'),
+    ('QgsSimpleMarkerSymbolLayerBase.DiagonalHalfSquare', 'Diagonal half square (bottom left half)'),
+    ('QgsSimpleMarkerSymbolLayerBase.RightHalfTriangle', 'Right half of triangle'),
+    ('QgsSimpleMarkerSymbolLayerBase.LeftHalfTriangle', 'Left half of triangle'),
+    ('QgsSimpleMarkerSymbolLayerBase.Octagon', 'Octagon \n.. versionadded:: 3.18'),
+    ('QgsSimpleMarkerSymbolLayerBase.SquareWithCorners', 'A square with diagonal corners \n.. versionadded:: 3.18'),
+    ('QgsSimpleMarkerSymbolLayerBase.AsteriskFill', 'A filled asterisk shape \n.. versionadded:: 3.18'),
+    ('QgsSimpleMarkerSymbolLayerBase.HalfArc', 'A line-only half arc \n.. versionadded:: 3.20'),
+    ('QgsSimpleMarkerSymbolLayerBase.ThirdArc', 'A line-only one third arc \n.. versionadded:: 3.20'),
+    ('QgsSimpleMarkerSymbolLayerBase.QuarterArc', 'A line-only one quarter arc \n.. versionadded:: 3.20'),
+    ('QgsSimpleMarkerSymbolLayerBase.ParallelogramRight', 'Parallelogram that slants right \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.ParallelogramLeft', 'Parallelogram that slants left \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.Trapezoid', 'Trapezoid \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.Shield', 'A shape consisting of a triangle attached to a rectangle \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.DiamondStar', 'A 4-sided star \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.Heart', 'Heart \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.Decagon', 'Decagon \n.. versionadded:: 3.28'),
+    ('QgsSimpleMarkerSymbolLayerBase.RoundedSquare', 'A square with rounded corners \n.. versionadded:: 3.28'),
+    ('Qgis.MarkerShape', "Marker shapes.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsSimpleMarkerSymbolLayerBase`.Shape\n\n.. versionadded:: 3.24\n\n* ``Square``: Square\n* ``Diamond``: Diamond\n* ``Pentagon``: Pentagon\n* ``Hexagon``: Hexagon\n* ``Triangle``: Triangle\n* ``EquilateralTriangle``: Equilateral triangle\n* ``Star``: Star\n* ``Arrow``: Arrow\n* ``Circle``: Circle\n* ``Cross``: Cross (lines only)\n* ``CrossFill``: Solid filled cross\n* ``Cross2``: Rotated cross (lines only), 'x' shape\n* ``Line``: Vertical line\n* ``ArrowHead``: Right facing arrow head (unfilled, lines only)\n* ``ArrowHeadFilled``: Right facing filled arrow head\n* ``SemiCircle``: Semi circle (top half)\n* ``ThirdCircle``: One third circle (top left third)\n* ``QuarterCircle``: Quarter circle (top left quarter)\n* ``QuarterSquare``: Quarter square (top left quarter)\n* ``HalfSquare``: Half square (left half)\n* ``DiagonalHalfSquare``: Diagonal half square (bottom left half)\n* ``RightHalfTriangle``: Right half of triangle\n* ``LeftHalfTriangle``: Left half of triangle\n* ``Octagon``: Octagon\n\n  .. versionadded:: 3.18\n\n* ``SquareWithCorners``: A square with diagonal corners\n\n  .. versionadded:: 3.18\n\n* ``AsteriskFill``: A filled asterisk shape\n\n  .. versionadded:: 3.18\n\n* ``HalfArc``: A line-only half arc\n\n  .. versionadded:: 3.20\n\n* ``ThirdArc``: A line-only one third arc\n\n  .. versionadded:: 3.20\n\n* ``QuarterArc``: A line-only one quarter arc\n\n  .. versionadded:: 3.20\n\n* ``ParallelogramRight``: Parallelogram that slants right\n\n  .. versionadded:: 3.28\n\n* ``ParallelogramLeft``: Parallelogram that slants left\n\n  .. versionadded:: 3.28\n\n* ``Trapezoid``: Trapezoid\n\n  .. versionadded:: 3.28\n\n* ``Shield``: A shape consisting of a triangle attached to a rectangle\n\n  .. versionadded:: 3.28\n\n* ``DiamondStar``: A 4-sided star\n\n  .. versionadded:: 3.28\n\n* ``Heart``: Heart\n\n  .. versionadded:: 3.28\n\n* ``Decagon``: Decagon\n\n  .. versionadded:: 3.28\n\n* ``RoundedSquare``: A square with rounded corners\n\n  .. versionadded:: 3.28\n\n\n"),
+    ('QgsTemplatedLineSymbolLayerBase.Interval', 'Place symbols at regular intervals'),
+    ('QgsTemplatedLineSymbolLayerBase.Vertex', 'Place symbols on every vertex in the line'),
+    ('QgsTemplatedLineSymbolLayerBase.LastVertex', 'Place symbols on the last vertex in the line'),
+    ('QgsTemplatedLineSymbolLayerBase.FirstVertex', 'Place symbols on the first vertex in the line'),
+    ('QgsTemplatedLineSymbolLayerBase.CentralPoint', 'Place symbols at the mid point of the line'),
+    ('QgsTemplatedLineSymbolLayerBase.CurvePoint', 'Place symbols at every virtual curve point in the line (used when rendering curved geometry types only)'),
+    ('QgsTemplatedLineSymbolLayerBase.SegmentCenter', 'Place symbols at the center of every line segment'),
+    ('QgsTemplatedLineSymbolLayerBase.InnerVertices', 'Inner vertices (i.e. all vertices except the first and last vertex) \n.. versionadded:: 3.24'),
+    ('Qgis.MarkerLinePlacement', 'Defines how/where the symbols should be placed on a line.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsTemplatedLineSymbolLayerBase`.Placement\n\n.. versionadded:: 3.24\n\n* ``Interval``: Place symbols at regular intervals\n* ``Vertex``: Place symbols on every vertex in the line\n* ``LastVertex``: Place symbols on the last vertex in the line\n* ``FirstVertex``: Place symbols on the first vertex in the line\n* ``CentralPoint``: Place symbols at the mid point of the line\n* ``CurvePoint``: Place symbols at every virtual curve point in the line (used when rendering curved geometry types only)\n* ``SegmentCenter``: Place symbols at the center of every line segment\n* ``InnerVertices``: Inner vertices (i.e. all vertices except the first and last vertex)\n\n  .. versionadded:: 3.24\n\n\n'),
+    ('Qgis.LinearReferencingPlacement.IntervalCartesian2D', 'Place labels at regular intervals, using Cartesian distance calculations on a 2D plane'),
+    ('Qgis.LinearReferencingPlacement.IntervalZ', 'Place labels at regular intervals, linearly interpolated using Z values'),
+    ('Qgis.LinearReferencingPlacement.IntervalM', 'Place labels at regular intervals, linearly interpolated using M values'),
+    ('Qgis.LinearReferencingPlacement.Vertex', 'Place labels on every vertex in the line'),
+    ('Qgis.LinearReferencingPlacement', 'Defines how/where the labels should be placed in a linear referencing symbol layer.\n\n.. versionadded:: 3.40\n\n* ``IntervalCartesian2D``: Place labels at regular intervals, using Cartesian distance calculations on a 2D plane\n* ``IntervalZ``: Place labels at regular intervals, linearly interpolated using Z values\n* ``IntervalM``: Place labels at regular intervals, linearly interpolated using M values\n* ``Vertex``: Place labels on every vertex in the line\n\n'),
+    ('Qgis.LinearReferencingLabelSource.CartesianDistance2D', 'Distance along line, calculated using Cartesian calculations on a 2D plane.'),
+    ('Qgis.LinearReferencingLabelSource.Z', 'Z values'),
+    ('Qgis.LinearReferencingLabelSource.M', 'M values'),
+    ('Qgis.LinearReferencingLabelSource', 'Defines what quantity to use for the labels shown in a linear referencing symbol layer.\n\n.. versionadded:: 3.40\n\n* ``CartesianDistance2D``: Distance along line, calculated using Cartesian calculations on a 2D plane.\n* ``Z``: Z values\n* ``M``: M values\n\n'),
+    ('QgsGradientFillSymbolLayer.SimpleTwoColor', 'Simple two color gradient'),
+    ('QgsGradientFillSymbolLayer.ColorRamp', 'Gradient color ramp'),
+    ('Qgis.GradientColorSource', 'Gradient color sources.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsGradientFillSymbolLayer`.GradientColorType\n\n.. versionadded:: 3.24\n\n* ``SimpleTwoColor``: Simple two color gradient\n* ``ColorRamp``: Gradient color ramp\n\n'),
+    ('QgsGradientFillSymbolLayer.Linear', 'Linear gradient'),
+    ('QgsGradientFillSymbolLayer.Radial', 'Radial (circular) gradient'),
+    ('QgsGradientFillSymbolLayer.Conical', 'Conical (polar) gradient'),
+    ('Qgis.GradientType', 'Gradient types.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsGradientFillSymbolLayer`.GradientType\n\n.. versionadded:: 3.24\n\n* ``Linear``: Linear gradient\n* ``Radial``: Radial (circular) gradient\n* ``Conical``: Conical (polar) gradient\n\n'),
+    ('QgsGradientFillSymbolLayer.Feature', 'Relative to feature/shape being rendered'),
+    ('QgsGradientFillSymbolLayer.Viewport', 'Relative to the whole viewport/output device'),
+    ('Qgis.SymbolCoordinateReference', 'Symbol coordinate reference modes.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsGradientFillSymbolLayer`.GradientCoordinateMode\n\n.. versionadded:: 3.24\n\n* ``Feature``: Relative to feature/shape being rendered\n* ``Viewport``: Relative to the whole viewport/output device\n\n'),
+    ('QgsGradientFillSymbolLayer.Pad', 'Pad out gradient using colors at endpoint of gradient'),
+    ('QgsGradientFillSymbolLayer.Reflect', 'Reflect gradient'),
+    ('QgsGradientFillSymbolLayer.Repeat', 'Repeat gradient'),
+    ('Qgis.GradientSpread', 'Gradient spread options, which control how gradients are rendered outside of their\nstart and end points.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsGradientFillSymbolLayer`.GradientSpread\n\n.. versionadded:: 3.24\n\n* ``Pad``: Pad out gradient using colors at endpoint of gradient\n* ``Reflect``: Reflect gradient\n* ``Repeat``: Repeat gradient\n\n'),
+    ('QgsRandomMarkerFillSymbolLayer.AbsoluteCount', 'The point count is used as an absolute count of markers'),
+    ('QgsRandomMarkerFillSymbolLayer.DensityBasedCount', 'The point count is part of a marker density count'),
+    ('Qgis.PointCountMethod', 'Methods which define the number of points randomly filling a polygon.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsRandomMarkerFillSymbolLayer`.CountMethod\n\n.. versionadded:: 3.24\n\n* ``Absolute``: The point count is used as an absolute count of markers\n\n  Available as ``QgsRandomMarkerFillSymbolLayer.AbsoluteCount`` in older QGIS releases.\n\n* ``DensityBased``: The point count is part of a marker density count\n\n  Available as ``QgsRandomMarkerFillSymbolLayer.DensityBasedCount`` in older QGIS releases.\n\n\n'),
+    ('Qgis.MarkerClipMode.NoClipping', 'No clipping, render complete markers'),
+    ('Qgis.MarkerClipMode.Shape', 'Clip to polygon shape'),
+    ('Qgis.MarkerClipMode.CentroidWithin', 'Render complete markers wherever their centroid falls within the polygon shape'),
+    ('Qgis.MarkerClipMode.CompletelyWithin', 'Render complete markers wherever the completely fall within the polygon shape'),
+    ('Qgis.MarkerClipMode', 'Marker clipping modes.\n\n.. versionadded:: 3.24\n\n* ``NoClipping``: No clipping, render complete markers\n* ``Shape``: Clip to polygon shape\n* ``CentroidWithin``: Render complete markers wherever their centroid falls within the polygon shape\n* ``CompletelyWithin``: Render complete markers wherever the completely fall within the polygon shape\n\n'),
+    ('Qgis.LineClipMode.ClipPainterOnly', 'Applying clipping on the painter only (i.e. line endpoints will coincide with polygon bounding box, but will not be part of the visible portion of the line)'),
+    ('Qgis.LineClipMode.ClipToIntersection', 'Clip lines to intersection with polygon shape (slower) (i.e. line endpoints will coincide with polygon exterior)'),
+    ('Qgis.LineClipMode.NoClipping', "Lines are not clipped, will extend to shape's bounding box."),
+    ('Qgis.LineClipMode', "Line clipping modes.\n\n.. versionadded:: 3.24\n\n* ``ClipPainterOnly``: Applying clipping on the painter only (i.e. line endpoints will coincide with polygon bounding box, but will not be part of the visible portion of the line)\n* ``ClipToIntersection``: Clip lines to intersection with polygon shape (slower) (i.e. line endpoints will coincide with polygon exterior)\n* ``NoClipping``: Lines are not clipped, will extend to shape's bounding box.\n\n"),
+    ('Qgis.DashPatternLineEndingRule.NoRule', 'No special rule'),
+    ('Qgis.DashPatternLineEndingRule.FullDash', 'Start or finish the pattern with a full dash'),
+    ('Qgis.DashPatternLineEndingRule.HalfDash', 'Start or finish the pattern with a half length dash'),
+    ('Qgis.DashPatternLineEndingRule.FullGap', 'Start or finish the pattern with a full gap'),
+    ('Qgis.DashPatternLineEndingRule.HalfGap', 'Start or finish the pattern with a half length gap'),
+    ('Qgis.DashPatternLineEndingRule', 'Dash pattern line ending rules.\n\n.. versionadded:: 3.24\n\n* ``NoRule``: No special rule\n* ``FullDash``: Start or finish the pattern with a full dash\n* ``HalfDash``: Start or finish the pattern with a half length dash\n* ``FullGap``: Start or finish the pattern with a full gap\n* ``HalfGap``: Start or finish the pattern with a half length gap\n\n'),
+    ('Qgis.DashPatternSizeAdjustment.ScaleBothDashAndGap', 'Both the dash and gap lengths are adjusted equally'),
+    ('Qgis.DashPatternSizeAdjustment.ScaleDashOnly', 'Only dash lengths are adjusted'),
+    ('Qgis.DashPatternSizeAdjustment.ScaleGapOnly', 'Only gap lengths are adjusted'),
+    ('Qgis.DashPatternSizeAdjustment', 'Dash pattern size adjustment options.\n\n.. versionadded:: 3.24\n\n* ``ScaleBothDashAndGap``: Both the dash and gap lengths are adjusted equally\n* ``ScaleDashOnly``: Only dash lengths are adjusted\n* ``ScaleGapOnly``: Only gap lengths are adjusted\n\n'),
+    ('QgsGraduatedSymbolRenderer.GraduatedColor', 'Alter color of symbols'),
+    ('QgsGraduatedSymbolRenderer.GraduatedSize', 'Alter size of symbols'),
+    ('Qgis.GraduatedMethod', 'Methods for modifying symbols by range in a graduated symbol renderer.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsGraduatedSymbolRenderer`.GraduatedMethod\n\n.. versionadded:: 3.26\n\n* ``Color``: Alter color of symbols\n\n  Available as ``QgsGraduatedSymbolRenderer.GraduatedColor`` in older QGIS releases.\n\n* ``Size``: Alter size of symbols\n\n  Available as ``QgsGraduatedSymbolRenderer.GraduatedSize`` in older QGIS releases.\n\n\n'),
+    ('Qgis.PlotAxisSuffixPlacement.NoLabels', 'Do not place suffixes'),
+    ('Qgis.PlotAxisSuffixPlacement.EveryLabel', 'Place suffix after every value label'),
+    ('Qgis.PlotAxisSuffixPlacement.FirstLabel', 'Place suffix after the first label value only'),
+    ('Qgis.PlotAxisSuffixPlacement.LastLabel', 'Place suffix after the last label value only'),
+    ('Qgis.PlotAxisSuffixPlacement.FirstAndLastLabels', 'Place suffix after the first and last label values only'),
+    ('Qgis.PlotAxisSuffixPlacement', 'Placement options for suffixes in the labels for axis of plots.\n\n.. versionadded:: 3.32\n\n* ``NoLabels``: Do not place suffixes\n* ``EveryLabel``: Place suffix after every value label\n* ``FirstLabel``: Place suffix after the first label value only\n* ``LastLabel``: Place suffix after the last label value only\n* ``FirstAndLastLabels``: Place suffix after the first and last label values only\n\n'),
+    ('Qgis.DpiMode.All', 'All'),
+    ('Qgis.DpiMode.Off', 'Off'),
+    ('Qgis.DpiMode.QGIS', 'QGIS'),
+    ('Qgis.DpiMode.UMN', 'UMN'),
+    ('Qgis.DpiMode.GeoServer', 'GeoServer'),
+    ('Qgis.DpiMode', 'DpiMode enum\n\n.. versionadded:: 3.26\n\n* ``All``: All\n* ``Off``: Off\n* ``QGIS``: QGIS\n* ``UMN``: UMN\n* ``GeoServer``: GeoServer\n\n'),
+    ('Qgis.TilePixelRatio.Undefined', 'Undefined (not scale)'),
+    ('Qgis.TilePixelRatio.StandardDpi', 'Standard (96 DPI)'),
+    ('Qgis.TilePixelRatio.HighDpi', 'High (192 DPI)'),
+    ('Qgis.TilePixelRatio', 'DpiMode enum\n\n.. versionadded:: 3.30\n\n* ``Undefined``: Undefined (not scale)\n* ``StandardDpi``: Standard (96 DPI)\n* ``HighDpi``: High (192 DPI)\n\n'),
+    ('QgsStringUtils.MixedCase', 'Mixed case, ie no change'),
+    ('QgsStringUtils.AllUppercase', 'Convert all characters to uppercase'),
+    ('QgsStringUtils.AllLowercase', 'Convert all characters to lowercase'),
+    ('QgsStringUtils.ForceFirstLetterToCapital', 'Convert just the first letter of each word to uppercase, leave the rest untouched'),
+    ('QgsStringUtils.SmallCaps', 'Mixed case small caps \n.. versionadded:: 3.24'),
+    ('QgsStringUtils.TitleCase', 'Simple title case conversion - does not fully grammatically parse the text and uses simple rules only. Note that this method does not convert any characters to lowercase, it only uppercases required letters. Callers must ensure that input strings are already lowercased.'),
+    ('QgsStringUtils.UpperCamelCase', 'Convert the string to upper camel case. Note that this method does not unaccent characters.'),
+    ('QgsStringUtils.AllSmallCaps', 'Force all characters to small caps \n.. versionadded:: 3.24'),
+    ('Qgis.Capitalization', 'String capitalization options.\n\n.. note::\n\n   Prior to QGIS 3.24 this was available as :py:class:`QgsStringUtils`.Capitalization\n\n.. versionadded:: 3.24\n\n* ``MixedCase``: Mixed case, ie no change\n* ``AllUppercase``: Convert all characters to uppercase\n* ``AllLowercase``: Convert all characters to lowercase\n* ``ForceFirstLetterToCapital``: Convert just the first letter of each word to uppercase, leave the rest untouched\n* ``SmallCaps``: Mixed case small caps\n\n  .. versionadded:: 3.24\n\n* ``TitleCase``: Simple title case conversion - does not fully grammatically parse the text and uses simple rules only. Note that this method does not convert any characters to lowercase, it only uppercases required letters. Callers must ensure that input strings are already lowercased.\n* ``UpperCamelCase``: Convert the string to upper camel case. Note that this method does not unaccent characters.\n* ``AllSmallCaps``: Force all characters to small caps\n\n  .. versionadded:: 3.24\n\n\n'),
+    ('Qgis.TextRendererFlag.WrapLines', 'Automatically wrap long lines of text'),
+    ('Qgis.TextRendererFlag', 'Flags which control the behavior of rendering text.\n\n.. versionadded:: 3.24\n\n* ``WrapLines``: Automatically wrap long lines of text\n\n'),
+    ('Qgis.ScaleToTileZoomLevelMethod.MapBox', 'Uses a scale doubling approach to account for hi-DPI tiles, and rounds to the nearest tile level for the map scale'),
+    ('Qgis.ScaleToTileZoomLevelMethod.Esri', 'No scale doubling, always rounds down when matching to available tile levels'),
+    ('Qgis.ScaleToTileZoomLevelMethod', 'Available methods for converting map scales to tile zoom levels.\n\n.. versionadded:: 3.26\n\n* ``MapBox``: Uses a scale doubling approach to account for hi-DPI tiles, and rounds to the nearest tile level for the map scale\n* ``Esri``: No scale doubling, always rounds down when matching to available tile levels\n\n'),
+    ('QgsCurve.Clockwise', 'Clockwise direction'),
+    ('QgsCurve.CounterClockwise', 'Counter-clockwise direction'),
+    ('QgsCurve.NoOrientation', 'Unknown orientation or sentinel value'),
+    ('Qgis.AngularDirection', 'Angular directions.\n\n.. versionadded:: 3.24\n\n* ``Clockwise``: Clockwise direction\n* ``CounterClockwise``: Counter-clockwise direction\n* ``NoOrientation``: Unknown orientation or sentinel value\n\n'),
+    ('Qgis.RendererUsage.View', 'Renderer used for displaying on screen'),
+    ('Qgis.RendererUsage.Export', 'Renderer used for printing or exporting to a file'),
+    ('Qgis.RendererUsage.Unknown', 'Renderer used for unknown usage'),
+    ('Qgis.RendererUsage', 'Usage of the renderer.\n\n.. versionadded:: 3.24\n\n* ``View``: Renderer used for displaying on screen\n* ``Export``: Renderer used for printing or exporting to a file\n* ``Unknown``: Renderer used for unknown usage\n\n'),
+    ('Qgis.MapCanvasFlag.ShowMainAnnotationLayer', "The project's main annotation layer should be rendered in the canvas"),
+    ('Qgis.MapCanvasFlag', "Flags controlling behavior of map canvases.\n\n.. versionadded:: 3.40\n\n* ``ShowMainAnnotationLayer``: The project's main annotation layer should be rendered in the canvas\n\n"),
+    ('Qgis.ViewSyncModeFlag.Sync3DTo2D', 'Synchronize 3D view camera to the main map canvas extent'),
+    ('Qgis.ViewSyncModeFlag.Sync2DTo3D', 'Update the 2D main canvas extent to include the viewed area from the 3D view'),
+    ('Qgis.ViewSyncModeFlag', 'Synchronization of 2D map canvas and 3D view\n\n.. versionadded:: 3.26\n\n* ``Sync3DTo2D``: Synchronize 3D view camera to the main map canvas extent\n* ``Sync2DTo3D``: Update the 2D main canvas extent to include the viewed area from the 3D view\n\n'),
+    ('Qgis.MapRecenteringMode.Always', 'Always recenter map'),
+    ('Qgis.MapRecenteringMode.WhenOutsideVisibleExtent', 'Only recenter map when new center would be outside of current visible extent'),
+    ('Qgis.MapRecenteringMode.Never', 'Never recenter map'),
+    ('Qgis.MapRecenteringMode', 'Modes for recentering map canvases.\n\n.. versionadded:: 3.30\n\n* ``Always``: Always recenter map\n* ``WhenOutsideVisibleExtent``: Only recenter map when new center would be outside of current visible extent\n* ``Never``: Never recenter map\n\n'),
+    ('Qgis.HistoryProviderBackend.LocalProfile', 'Local profile'),
+    ('Qgis.HistoryProviderBackend', 'History provider backends.\n\n.. versionadded:: 3.24\n\n* ``LocalProfile``: Local profile\n\n'),
+    ('Qgis.QueryStorageBackend.LocalProfile', 'Local user profile'),
+    ('Qgis.QueryStorageBackend.CurrentProject', 'Current QGIS project'),
+    ('Qgis.QueryStorageBackend', 'Stored query storage backends.\n\n.. versionadded:: 3.44\n\n* ``LocalProfile``: Local user profile\n* ``CurrentProject``: Current QGIS project\n\n'),
+    ('QgsProcessing.TypeMapLayer', 'Any map layer type (raster, vector, mesh, point cloud, annotation or plugin layer)'),
+    ('QgsProcessing.TypeVectorAnyGeometry', 'Any vector layer with geometry'),
+    ('QgsProcessing.TypeVectorPoint', 'Vector point layers'),
+    ('QgsProcessing.TypeVectorLine', 'Vector line layers'),
+    ('QgsProcessing.TypeVectorPolygon', 'Vector polygon layers'),
+    ('QgsProcessing.TypeRaster', 'Raster layers'),
+    ('QgsProcessing.TypeFile', 'Files (i.e. non map layer sources, such as text files)'),
+    ('QgsProcessing.TypeVector', 'Tables (i.e. vector layers with or without geometry). When used for a sink this indicates the sink has no geometry.'),
+    ('QgsProcessing.TypeMesh', 'Mesh layers \n.. versionadded:: 3.6'),
+    ('QgsProcessing.TypePlugin', 'Plugin layers \n.. versionadded:: 3.22'),
+    ('QgsProcessing.TypePointCloud', 'Point cloud layers \n.. versionadded:: 3.22'),
+    ('QgsProcessing.TypeAnnotation', 'Annotation layers \n.. versionadded:: 3.22'),
+    ('QgsProcessing.TypeVectorTile', 'Vector tile layers \n.. versionadded:: 3.32'),
+    ('QgsProcessing.TiledScene', 'Tiled scene layers \n.. versionadded:: 4.0'),
+    ('Qgis.ProcessingSourceType', 'Processing data source types.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessing`.SourceType\n\n.. versionadded:: 3.36\n\n* ``MapLayer``: Any map layer type (raster, vector, mesh, point cloud, annotation or plugin layer)\n\n  Available as ``QgsProcessing.TypeMapLayer`` in older QGIS releases.\n\n* ``VectorAnyGeometry``: Any vector layer with geometry\n\n  Available as ``QgsProcessing.TypeVectorAnyGeometry`` in older QGIS releases.\n\n* ``VectorPoint``: Vector point layers\n\n  Available as ``QgsProcessing.TypeVectorPoint`` in older QGIS releases.\n\n* ``VectorLine``: Vector line layers\n\n  Available as ``QgsProcessing.TypeVectorLine`` in older QGIS releases.\n\n* ``VectorPolygon``: Vector polygon layers\n\n  Available as ``QgsProcessing.TypeVectorPolygon`` in older QGIS releases.\n\n* ``Raster``: Raster layers\n\n  Available as ``QgsProcessing.TypeRaster`` in older QGIS releases.\n\n* ``File``: Files (i.e. non map layer sources, such as text files)\n\n  Available as ``QgsProcessing.TypeFile`` in older QGIS releases.\n\n* ``Vector``: Tables (i.e. vector layers with or without geometry). When used for a sink this indicates the sink has no geometry.\n\n  Available as ``QgsProcessing.TypeVector`` in older QGIS releases.\n\n* ``Mesh``: Mesh layers\n\n  .. versionadded:: 3.6\n\n\n  Available as ``QgsProcessing.TypeMesh`` in older QGIS releases.\n\n* ``Plugin``: Plugin layers\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsProcessing.TypePlugin`` in older QGIS releases.\n\n* ``PointCloud``: Point cloud layers\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsProcessing.TypePointCloud`` in older QGIS releases.\n\n* ``Annotation``: Annotation layers\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsProcessing.TypeAnnotation`` in older QGIS releases.\n\n* ``VectorTile``: Vector tile layers\n\n  .. versionadded:: 3.32\n\n\n  Available as ``QgsProcessing.TypeVectorTile`` in older QGIS releases.\n\n* ``TiledScene``: Tiled scene layers\n\n  .. versionadded:: 4.0\n\n\n'),
+    ('QgsProcessingProvider.FlagDeemphasiseSearchResults', 'Algorithms should be de-emphasised in the search results when searching for algorithms. Use for low-priority providers or those with substantial known issues.'),
+    ('QgsProcessingProvider.FlagCompatibleWithVirtualRaster', "The processing provider's algorithms can work with QGIS virtualraster data provider \n.. versionadded:: 3.36"),
+    ('Qgis.ProcessingProviderFlag', "Flags indicating how and when an processing provider operates and should be exposed to users.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingProvider`.Flag\n\n.. versionadded:: 3.36\n\n* ``DeemphasiseSearchResults``: Algorithms should be de-emphasised in the search results when searching for algorithms. Use for low-priority providers or those with substantial known issues.\n\n  Available as ``QgsProcessingProvider.FlagDeemphasiseSearchResults`` in older QGIS releases.\n\n* ``CompatibleWithVirtualRaster``: The processing provider's algorithms can work with QGIS virtualraster data provider\n\n  .. versionadded:: 3.36\n\n\n  Available as ``QgsProcessingProvider.FlagCompatibleWithVirtualRaster`` in older QGIS releases.\n\n\n"),
+    ('QgsProcessingAlgorithm.FlagHideFromToolbox', 'Algorithm should be hidden from the toolbox'),
+    ('QgsProcessingAlgorithm.FlagHideFromModeler', 'Algorithm should be hidden from the modeler'),
+    ('QgsProcessingAlgorithm.FlagSupportsBatch', 'Algorithm supports batch mode'),
+    ('QgsProcessingAlgorithm.FlagCanCancel', 'Algorithm can be canceled'),
+    ('QgsProcessingAlgorithm.FlagRequiresMatchingCrs', 'Algorithm requires that all input layers have matching coordinate reference systems'),
+    ('QgsProcessingAlgorithm.FlagNoThreading', 'Algorithm is not thread safe and cannot be run in a background thread, e.g. for algorithms which manipulate the current project, layer selections, or with external dependencies which are not thread-safe.'),
+    ('QgsProcessingAlgorithm.FlagDisplayNameIsLiteral', "Algorithm's display name is a static literal string, and should not be translated or automatically formatted. For use with algorithms named after commands, e.g. GRASS 'v.in.ogr'."),
+    ('QgsProcessingAlgorithm.FlagSupportsInPlaceEdits', 'Algorithm supports in-place editing'),
+    ('QgsProcessingAlgorithm.FlagKnownIssues', 'Algorithm has known issues'),
+    ('QgsProcessingAlgorithm.FlagCustomException', "Algorithm raises custom exception notices, don't use the standard ones"),
+    ('QgsProcessingAlgorithm.FlagPruneModelBranchesBasedOnAlgorithmResults', 'Algorithm results will cause remaining model branches to be pruned based on the results of running the algorithm'),
+    ('QgsProcessingAlgorithm.FlagSkipGenericModelLogging', 'When running as part of a model, the generic algorithm setup and results logging should be skipped'),
+    ('QgsProcessingAlgorithm.FlagNotAvailableInStandaloneTool', 'Algorithm should not be available from the standalone "qgis_process" tool. Used to flag algorithms which make no sense outside of the QGIS application, such as "select by..." style algorithms.'),
+    ('QgsProcessingAlgorithm.FlagRequiresProject', 'The algorithm requires that a valid QgsProject is available from the processing context in order to execute'),
+    ('QgsProcessingAlgorithm.SecurityRisk', 'The algorithm represents a potential security risk if executed with untrusted inputs. \n.. versionadded:: 3.40'),
+    ('QgsProcessingAlgorithm.FlagDeprecated', 'Algorithm is deprecated'),
+    ('Qgis.ProcessingAlgorithmFlag', 'Flags indicating how and when an algorithm operates and should be exposed to users.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingAlgorithm`.Flag\n\n.. versionadded:: 3.36\n\n* ``HideFromToolbox``: Algorithm should be hidden from the toolbox\n\n  Available as ``QgsProcessingAlgorithm.FlagHideFromToolbox`` in older QGIS releases.\n\n* ``HideFromModeler``: Algorithm should be hidden from the modeler\n\n  Available as ``QgsProcessingAlgorithm.FlagHideFromModeler`` in older QGIS releases.\n\n* ``SupportsBatch``: Algorithm supports batch mode\n\n  Available as ``QgsProcessingAlgorithm.FlagSupportsBatch`` in older QGIS releases.\n\n* ``CanCancel``: Algorithm can be canceled\n\n  Available as ``QgsProcessingAlgorithm.FlagCanCancel`` in older QGIS releases.\n\n* ``RequiresMatchingCrs``: Algorithm requires that all input layers have matching coordinate reference systems\n\n  Available as ``QgsProcessingAlgorithm.FlagRequiresMatchingCrs`` in older QGIS releases.\n\n* ``NoThreading``: Algorithm is not thread safe and cannot be run in a background thread, e.g. for algorithms which manipulate the current project, layer selections, or with external dependencies which are not thread-safe.\n\n  Available as ``QgsProcessingAlgorithm.FlagNoThreading`` in older QGIS releases.\n\n* ``DisplayNameIsLiteral``: Algorithm\'s display name is a static literal string, and should not be translated or automatically formatted. For use with algorithms named after commands, e.g. GRASS \'v.in.ogr\'.\n\n  Available as ``QgsProcessingAlgorithm.FlagDisplayNameIsLiteral`` in older QGIS releases.\n\n* ``SupportsInPlaceEdits``: Algorithm supports in-place editing\n\n  Available as ``QgsProcessingAlgorithm.FlagSupportsInPlaceEdits`` in older QGIS releases.\n\n* ``KnownIssues``: Algorithm has known issues\n\n  Available as ``QgsProcessingAlgorithm.FlagKnownIssues`` in older QGIS releases.\n\n* ``CustomException``: Algorithm raises custom exception notices, don\'t use the standard ones\n\n  Available as ``QgsProcessingAlgorithm.FlagCustomException`` in older QGIS releases.\n\n* ``PruneModelBranchesBasedOnAlgorithmResults``: Algorithm results will cause remaining model branches to be pruned based on the results of running the algorithm\n\n  Available as ``QgsProcessingAlgorithm.FlagPruneModelBranchesBasedOnAlgorithmResults`` in older QGIS releases.\n\n* ``SkipGenericModelLogging``: When running as part of a model, the generic algorithm setup and results logging should be skipped\n\n  Available as ``QgsProcessingAlgorithm.FlagSkipGenericModelLogging`` in older QGIS releases.\n\n* ``NotAvailableInStandaloneTool``: Algorithm should not be available from the standalone "qgis_process" tool. Used to flag algorithms which make no sense outside of the QGIS application, such as "select by..." style algorithms.\n\n  Available as ``QgsProcessingAlgorithm.FlagNotAvailableInStandaloneTool`` in older QGIS releases.\n\n* ``RequiresProject``: The algorithm requires that a valid QgsProject is available from the processing context in order to execute\n\n  Available as ``QgsProcessingAlgorithm.FlagRequiresProject`` in older QGIS releases.\n\n* ``SecurityRisk``: The algorithm represents a potential security risk if executed with untrusted inputs.\n\n  .. versionadded:: 3.40\n\n* ``Deprecated``: Algorithm is deprecated\n\n  Available as ``QgsProcessingAlgorithm.FlagDeprecated`` in older QGIS releases.\n\n\n'),
+    ('Qgis.ProcessingAlgorithmDocumentationFlag.RegeneratesPrimaryKey', 'Algorithm always drops any existing primary keys or FID values and regenerates them in outputs'),
+    ('Qgis.ProcessingAlgorithmDocumentationFlag.RegeneratesPrimaryKeyInSomeScenarios', 'Algorithm may drop the existing primary keys or FID values in some scenarios, depending on algorithm inputs and parameters'),
+    ('Qgis.ProcessingAlgorithmDocumentationFlag', 'Flags describing algorithm behavior for documentation purposes.\n\n.. versionadded:: 3.40\n\n* ``RegeneratesPrimaryKey``: Algorithm always drops any existing primary keys or FID values and regenerates them in outputs\n* ``RegeneratesPrimaryKeyInSomeScenarios``: Algorithm may drop the existing primary keys or FID values in some scenarios, depending on algorithm inputs and parameters\n\n'),
+    ('QgsProcessingAlgorithm.NotAvailable', 'Properties are not available'),
+    ('QgsProcessingAlgorithm.Available', 'Properties are available'),
+    ('Qgis.ProcessingPropertyAvailability', 'Property availability, used for :py:class:`QgsProcessingAlgorithm`.VectorProperties\nin order to determine if properties are available or not.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingAlgorithm`.PropertyAvailability\n\n.. versionadded:: 3.36\n\n* ``NotAvailable``: Properties are not available\n* ``Available``: Properties are available\n\n'),
+    ('QgsProcessingContext.DefaultLevel', 'Default logging level'),
+    ('QgsProcessingContext.Verbose', 'Verbose logging'),
+    ('QgsProcessingContext.ModelDebug', 'Model debug level logging. Includes verbose logging and other outputs useful for debugging models \n.. versionadded:: 3.34'),
+    ('Qgis.ProcessingLogLevel', 'Logging level for algorithms to use when pushing feedback messages.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingContext`.LogLevel\n\n.. versionadded:: 3.36\n\n* ``DefaultLevel``: Default logging level\n* ``Verbose``: Verbose logging\n* ``ModelDebug``: Model debug level logging. Includes verbose logging and other outputs useful for debugging models\n\n  .. versionadded:: 3.34\n\n\n'),
+    ('Qgis.ProcessingMode.Standard', 'Standard (single-run) algorithm mode'),
+    ('Qgis.ProcessingMode.Batch', 'Batch processing mode'),
+    ('Qgis.ProcessingMode.Modeler', 'Modeler mode'),
+    ('Qgis.ProcessingMode', 'Types of modes which Processing widgets can be created for.\n\n.. note::\n\n   Prior to QGIS 3.44 this was available as :py:class:`QgsProcessingGui`.WidgetType\n\n.. versionadded:: 3.44\n\n* ``Standard``: Standard (single-run) algorithm mode\n* ``Batch``: Batch processing mode\n* ``Modeler``: Modeler mode\n\n'),
+    ('QgsProcessingFeatureSourceDefinition.FlagOverrideDefaultGeometryCheck', 'If set, the default geometry check method (as dictated by QgsProcessingContext) will be overridden for this source'),
+    ('QgsProcessingFeatureSourceDefinition.FlagCreateIndividualOutputPerInputFeature', 'If set, every feature processed from this source will be placed into its own individually created output destination. Support for this flag depends on how an algorithm is executed.'),
+    ('Qgis.ProcessingFeatureSourceDefinitionFlag', 'Flags which control behavior for a Processing feature source.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingFeatureSourceDefinition`.Flag\n\n.. versionadded:: 3.36\n\n* ``OverrideDefaultGeometryCheck``: If set, the default geometry check method (as dictated by QgsProcessingContext) will be overridden for this source\n\n  Available as ``QgsProcessingFeatureSourceDefinition.FlagOverrideDefaultGeometryCheck`` in older QGIS releases.\n\n* ``CreateIndividualOutputPerInputFeature``: If set, every feature processed from this source will be placed into its own individually created output destination. Support for this flag depends on how an algorithm is executed.\n\n  Available as ``QgsProcessingFeatureSourceDefinition.FlagCreateIndividualOutputPerInputFeature`` in older QGIS releases.\n\n\n'),
+    ('QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks', 'Invalid geometry checks should always be skipped. This flag can be useful for algorithms which always require invalid geometries, regardless of any user settings (e.g. "repair geometry" type algorithms).'),
+    ('Qgis.ProcessingFeatureSourceFlag', 'Flags which control how :py:class:`QgsProcessingFeatureSource` fetches features.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingFeatureSource`.Flag\n\n.. versionadded:: 3.36\n\n* ``SkipGeometryValidityChecks``: Invalid geometry checks should always be skipped. This flag can be useful for algorithms which always require invalid geometries, regardless of any user settings (e.g. "repair geometry" type algorithms).\n\n  Available as ``QgsProcessingFeatureSource.FlagSkipGeometryValidityChecks`` in older QGIS releases.\n\n\n'),
+    ('QgsProcessingParameterType.ExposeToModeler', 'Is this parameter available in the modeler. Is set to on by default.'),
+    ('Qgis.ProcessingParameterTypeFlag', 'Flags which dictate the behavior of Processing parameter types.\n\nEach parameter type can offer a number of additional flags to fine tune its behavior\nand capabilities.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterType`.ParameterFlag\n\n.. versionadded:: 3.36\n\n* ``ExposeToModeler``: Is this parameter available in the modeler. Is set to on by default.\n\n'),
+    ('QgsProcessingParameterDefinition.FlagAdvanced', 'Parameter is an advanced parameter which should be hidden from users by default'),
+    ('QgsProcessingParameterDefinition.FlagHidden', 'Parameter is hidden and should not be shown to users'),
+    ('QgsProcessingParameterDefinition.FlagOptional', 'Parameter is optional'),
+    ('QgsProcessingParameterDefinition.FlagIsModelOutput', 'Destination parameter is final output. The parameter name will be used.'),
+    ('Qgis.ProcessingParameterFlag', 'Flags which dictate the behavior of Processing parameters.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterDefinition`.Flag\n\n.. versionadded:: 3.36\n\n* ``Advanced``: Parameter is an advanced parameter which should be hidden from users by default\n\n  Available as ``QgsProcessingParameterDefinition.FlagAdvanced`` in older QGIS releases.\n\n* ``Hidden``: Parameter is hidden and should not be shown to users\n\n  Available as ``QgsProcessingParameterDefinition.FlagHidden`` in older QGIS releases.\n\n* ``Optional``: Parameter is optional\n\n  Available as ``QgsProcessingParameterDefinition.FlagOptional`` in older QGIS releases.\n\n* ``IsModelOutput``: Destination parameter is final output. The parameter name will be used.\n\n  Available as ``QgsProcessingParameterDefinition.FlagIsModelOutput`` in older QGIS releases.\n\n\n'),
+    ('QgsProcessingParameterFile.File', 'Parameter is a single file'),
+    ('QgsProcessingParameterFile.Folder', 'Parameter is a folder'),
+    ('Qgis.ProcessingFileParameterBehavior', 'Flags which dictate the behavior of :py:class:`QgsProcessingParameterFile`.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterFile`.Behavior\n\n.. versionadded:: 3.36\n\n* ``File``: Parameter is a single file\n* ``Folder``: Parameter is a folder\n\n'),
+    ('QgsProcessingParameterNumber.Integer', 'Integer values'),
+    ('QgsProcessingParameterNumber.Double', 'Double/float values'),
+    ('Qgis.ProcessingNumberParameterType', 'Processing numeric parameter data types.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterNumber`.Type\n\n.. versionadded:: 3.36\n\n* ``Integer``: Integer values\n* ``Double``: Double/float values\n\n'),
+    ('QgsProcessingParameterField.Any', 'Accepts any field'),
+    ('QgsProcessingParameterField.Numeric', 'Accepts numeric fields'),
+    ('QgsProcessingParameterField.String', 'Accepts string fields'),
+    ('QgsProcessingParameterField.DateTime', 'Accepts datetime fields'),
+    ('QgsProcessingParameterField.Binary', 'Accepts binary fields, since QGIS 3.34'),
+    ('QgsProcessingParameterField.Boolean', 'Accepts boolean fields, since QGIS 3.34'),
+    ('Qgis.ProcessingFieldParameterDataType', 'Processing field parameter data types.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterField`.DataType\n\n.. versionadded:: 3.36\n\n* ``Any``: Accepts any field\n* ``Numeric``: Accepts numeric fields\n* ``String``: Accepts string fields\n* ``DateTime``: Accepts datetime fields\n* ``Binary``: Accepts binary fields, since QGIS 3.34\n* ``Boolean``: Accepts boolean fields, since QGIS 3.34\n\n'),
+    ('QgsProcessingParameterDateTime.DateTime', 'Datetime values'),
+    ('QgsProcessingParameterDateTime.Date', 'Date values'),
+    ('QgsProcessingParameterDateTime.Time', 'Time values'),
+    ('Qgis.ProcessingDateTimeParameterDataType', 'Processing date time parameter data types.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterDateTime`.Type\n\n.. versionadded:: 3.36\n\n* ``DateTime``: Datetime values\n* ``Date``: Date values\n* ``Time``: Time values\n\n'),
+    ('Qgis.ProcessingModelChildParameterSource.ModelParameter', 'Parameter value is taken from a parent model parameter'),
+    ('Qgis.ProcessingModelChildParameterSource.ChildOutput', 'Parameter value is taken from an output generated by a child algorithm'),
+    ('Qgis.ProcessingModelChildParameterSource.StaticValue', 'Parameter value is a static value'),
+    ('Qgis.ProcessingModelChildParameterSource.Expression', 'Parameter value is taken from an expression, evaluated just before the algorithm runs'),
+    ('Qgis.ProcessingModelChildParameterSource.ExpressionText', 'Parameter value is taken from a text with expressions, evaluated just before the algorithm runs'),
+    ('Qgis.ProcessingModelChildParameterSource.ModelOutput', 'Parameter value is linked to an output parameter for the model'),
+    ('Qgis.ProcessingModelChildParameterSource', 'Processing model child parameter sources.\n\n.. versionadded:: 3.34\n\n* ``ModelParameter``: Parameter value is taken from a parent model parameter\n* ``ChildOutput``: Parameter value is taken from an output generated by a child algorithm\n* ``StaticValue``: Parameter value is a static value\n* ``Expression``: Parameter value is taken from an expression, evaluated just before the algorithm runs\n* ``ExpressionText``: Parameter value is taken from a text with expressions, evaluated just before the algorithm runs\n* ``ModelOutput``: Parameter value is linked to an output parameter for the model\n\n'),
+    ('Qgis.ProcessingModelChildAlgorithmExecutionStatus.NotExecuted', 'Child has not been executed'),
+    ('Qgis.ProcessingModelChildAlgorithmExecutionStatus.Success', 'Child was successfully executed'),
+    ('Qgis.ProcessingModelChildAlgorithmExecutionStatus.Failed', 'Child encountered an error while executing'),
+    ('Qgis.ProcessingModelChildAlgorithmExecutionStatus', 'Reflects the status of a child algorithm in a Processing model.\n\n.. versionadded:: 3.38\n\n* ``NotExecuted``: Child has not been executed\n* ``Success``: Child was successfully executed\n* ``Failed``: Child encountered an error while executing\n\n'),
+    ('QgsProcessingParameterTinInputLayers.Vertices', 'Input that adds only vertices'),
+    ('QgsProcessingParameterTinInputLayers.StructureLines', 'Input that adds add structure lines'),
+    ('QgsProcessingParameterTinInputLayers.BreakLines', 'Input that adds vertices and break lines'),
+    ('Qgis.ProcessingTinInputLayerType', 'Defines the type of input layer for a Processing TIN input.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsProcessingParameterTinInputLayers`.Type\n\n.. versionadded:: 3.36\n\n* ``Vertices``: Input that adds only vertices\n* ``StructureLines``: Input that adds add structure lines\n* ``BreakLines``: Input that adds vertices and break lines\n\n'),
+    ('QgsCoordinateReferenceSystem.FormatWkt', 'WKT format (always recommended over proj string format)'),
+    ('QgsCoordinateReferenceSystem.FormatProj', 'Proj string format'),
+    ('Qgis.CrsDefinitionFormat', 'CRS definition formats.\n\n.. versionadded:: 3.24\n\n* ``Wkt``: WKT format (always recommended over proj string format)\n\n  Available as ``QgsCoordinateReferenceSystem.FormatWkt`` in older QGIS releases.\n\n* ``Proj``: Proj string format\n\n  Available as ``QgsCoordinateReferenceSystem.FormatProj`` in older QGIS releases.\n\n\n'),
+    ('Qgis.FieldDomainSplitPolicy.DefaultValue', 'Use default field value'),
+    ('Qgis.FieldDomainSplitPolicy.Duplicate', 'Duplicate original value'),
+    ('Qgis.FieldDomainSplitPolicy.GeometryRatio', 'New values are computed by the ratio of their area/length compared to the area/length of the original feature'),
+    ('Qgis.FieldDomainSplitPolicy.UnsetField', 'Clears the field value so that the data provider backend will populate using any backend triggers or similar logic \n.. versionadded:: 3.30'),
+    ('Qgis.FieldDomainSplitPolicy', 'Split policy for field domains.\n\nWhen a feature is split into multiple parts, defines how the value of attributes\nfollowing the domain are computed.\n\n.. versionadded:: 3.26\n\n* ``DefaultValue``: Use default field value\n* ``Duplicate``: Duplicate original value\n* ``GeometryRatio``: New values are computed by the ratio of their area/length compared to the area/length of the original feature\n* ``UnsetField``: Clears the field value so that the data provider backend will populate using any backend triggers or similar logic\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('Qgis.FieldDomainMergePolicy.DefaultValue', 'Use default field value'),
+    ('Qgis.FieldDomainMergePolicy.Sum', 'Sum of values'),
+    ('Qgis.FieldDomainMergePolicy.GeometryWeighted', 'New values are computed as the weighted average of the source values'),
+    ('Qgis.FieldDomainMergePolicy.UnsetField', 'Clears the field value so that the data provider backend will populate using any backend triggers or similar logic \n.. versionadded:: 3.44'),
+    ('Qgis.FieldDomainMergePolicy.LargestGeometry', 'Use value from the feature with the largest geometry \n.. versionadded:: 3.44'),
+    ('Qgis.FieldDomainMergePolicy.MinimumValue', 'Use the minimum value from the features-to-be-merged \n.. versionadded:: 3.44'),
+    ('Qgis.FieldDomainMergePolicy.MaximumValue', 'Use the maximum value from the features-to-be-merged \n.. versionadded:: 3.44'),
+    ('Qgis.FieldDomainMergePolicy.SetToNull', 'Use a null value \n.. versionadded:: 3.44'),
+    ('Qgis.FieldDomainMergePolicy', 'Merge policy for field domains.\n\nWhen a feature is built by merging multiple features, defines how the value of\nattributes following the domain are computed.\n\n.. versionadded:: 3.26\n\n* ``DefaultValue``: Use default field value\n* ``Sum``: Sum of values\n* ``GeometryWeighted``: New values are computed as the weighted average of the source values\n* ``UnsetField``: Clears the field value so that the data provider backend will populate using any backend triggers or similar logic\n\n  .. versionadded:: 3.44\n\n* ``LargestGeometry``: Use value from the feature with the largest geometry\n\n  .. versionadded:: 3.44\n\n* ``MinimumValue``: Use the minimum value from the features-to-be-merged\n\n  .. versionadded:: 3.44\n\n* ``MaximumValue``: Use the maximum value from the features-to-be-merged\n\n  .. versionadded:: 3.44\n\n* ``SetToNull``: Use a null value\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('Qgis.FieldDuplicatePolicy.DefaultValue', 'Use default field value'),
+    ('Qgis.FieldDuplicatePolicy.Duplicate', 'Duplicate original value'),
+    ('Qgis.FieldDuplicatePolicy.UnsetField', 'Clears the field value so that the data provider backend will populate using any backend triggers or similar logic \n.. versionadded:: 3.30'),
+    ('Qgis.FieldDuplicatePolicy', 'Duplicate policy for fields.\n\nWhen a feature is duplicated, defines how the value of attributes are computed.\n\n.. versionadded:: 3.38\n\n* ``DefaultValue``: Use default field value\n* ``Duplicate``: Duplicate original value\n* ``UnsetField``: Clears the field value so that the data provider backend will populate using any backend triggers or similar logic\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('Qgis.FieldDomainType.Coded', 'Coded field domain'),
+    ('Qgis.FieldDomainType.Range', 'Numeric range field domain (min/max)'),
+    ('Qgis.FieldDomainType.Glob', 'Glob string pattern field domain'),
+    ('Qgis.FieldDomainType', 'Types of field domain\n\n.. versionadded:: 3.26\n\n* ``Coded``: Coded field domain\n* ``Range``: Numeric range field domain (min/max)\n* ``Glob``: Glob string pattern field domain\n\n'),
+    ('Qgis.TransactionMode.Disabled', 'Edits are buffered locally and sent to the provider when toggling layer editing mode.'),
+    ('Qgis.TransactionMode.AutomaticGroups', 'Automatic transactional editing means that on supported datasources (postgres and geopackage databases) the edit state of all tables that originate from the same database are synchronized and executed in a server side transaction.'),
+    ('Qgis.TransactionMode.BufferedGroups', 'Buffered transactional editing means that all editable layers in the buffered transaction group are toggled synchronously and all edits are saved in a local edit buffer. Saving changes is executed within a single transaction on all layers (per provider).'),
+    ('Qgis.TransactionMode', 'Transaction mode.\n\n.. versionadded:: 3.26\n\n* ``Disabled``: Edits are buffered locally and sent to the provider when toggling layer editing mode.\n* ``AutomaticGroups``: Automatic transactional editing means that on supported datasources (postgres and geopackage databases) the edit state of all tables that originate from the same database are synchronized and executed in a server side transaction.\n* ``BufferedGroups``: Buffered transactional editing means that all editable layers in the buffered transaction group are toggled synchronously and all edits are saved in a local edit buffer. Saving changes is executed within a single transaction on all layers (per provider).\n\n'),
+    ('Qgis.AltitudeClamping.Absolute', 'Elevation is taken directly from feature and is independent of terrain height (final elevation = feature elevation)'),
+    ('Qgis.AltitudeClamping.Relative', 'Elevation is relative to terrain height (final elevation = terrain elevation + feature elevation)'),
+    ('Qgis.AltitudeClamping.Terrain', 'Elevation is clamped to terrain (final elevation = terrain elevation)'),
+    ('Qgis.AltitudeClamping', 'Altitude clamping.\n\n.. versionadded:: 3.26\n\n* ``Absolute``: Elevation is taken directly from feature and is independent of terrain height (final elevation = feature elevation)\n* ``Relative``: Elevation is relative to terrain height (final elevation = terrain elevation + feature elevation)\n* ``Terrain``: Elevation is clamped to terrain (final elevation = terrain elevation)\n\n'),
+    ('Qgis.AltitudeBinding.Vertex', 'Clamp every vertex of feature'),
+    ('Qgis.AltitudeBinding.Centroid', 'Clamp just centroid of feature'),
+    ('Qgis.AltitudeBinding', 'Altitude binding.\n\n.. versionadded:: 3.26\n\n* ``Vertex``: Clamp every vertex of feature\n* ``Centroid``: Clamp just centroid of feature\n\n'),
+    ('Qgis.RangeLimits.IncludeBoth', 'Both lower and upper values are included in the range'),
+    ('Qgis.RangeLimits.IncludeLowerExcludeUpper', 'Lower value is included in the range, upper value is excluded'),
+    ('Qgis.RangeLimits.ExcludeLowerIncludeUpper', 'Lower value is excluded from the range, upper value in inccluded'),
+    ('Qgis.RangeLimits.ExcludeBoth', 'Both lower and upper values are excluded from the range'),
+    ('Qgis.RangeLimits', 'Describes how the limits of a range are handled.\n\n.. versionadded:: 3.38\n\n* ``IncludeBoth``: Both lower and upper values are included in the range\n* ``IncludeLowerExcludeUpper``: Lower value is included in the range, upper value is excluded\n* ``ExcludeLowerIncludeUpper``: Lower value is excluded from the range, upper value in inccluded\n* ``ExcludeBoth``: Both lower and upper values are excluded from the range\n\n'),
+    ('Qgis.RasterElevationMode.FixedElevationRange', 'Layer has a fixed elevation range'),
+    ('Qgis.RasterElevationMode.RepresentsElevationSurface', 'Pixel values represent an elevation surface'),
+    ('Qgis.RasterElevationMode.FixedRangePerBand', 'Layer has a fixed (manually specified) elevation range per band'),
+    ('Qgis.RasterElevationMode.DynamicRangePerBand', 'Layer has a elevation range per band, calculated dynamically from an expression'),
+    ('Qgis.RasterElevationMode', 'Raster layer elevation modes.\n\n.. versionadded:: 3.38\n\n* ``FixedElevationRange``: Layer has a fixed elevation range\n* ``RepresentsElevationSurface``: Pixel values represent an elevation surface\n* ``FixedRangePerBand``: Layer has a fixed (manually specified) elevation range per band\n* ``DynamicRangePerBand``: Layer has a elevation range per band, calculated dynamically from an expression\n\n'),
+    ('Qgis.MeshElevationMode.FixedElevationRange', 'Layer has a fixed elevation range'),
+    ('Qgis.MeshElevationMode.FromVertices', 'Elevation should be taken from mesh vertices'),
+    ('Qgis.MeshElevationMode.FixedRangePerGroup', 'Layer has a fixed (manually specified) elevation range per group'),
+    ('Qgis.MeshElevationMode', 'Mesh layer elevation modes.\n\n.. versionadded:: 3.38\n\n* ``FixedElevationRange``: Layer has a fixed elevation range\n* ``FromVertices``: Elevation should be taken from mesh vertices\n* ``FixedRangePerGroup``: Layer has a fixed (manually specified) elevation range per group\n\n'),
+    ('Qgis.BetweenLineConstraint.NoConstraint', 'No additional constraint'),
+    ('Qgis.BetweenLineConstraint.Perpendicular', 'Perpendicular'),
+    ('Qgis.BetweenLineConstraint.Parallel', 'Parallel'),
+    ('Qgis.BetweenLineConstraint', 'Between line constraints which can be enabled\n\n.. versionadded:: 3.26\n\n* ``NoConstraint``: No additional constraint\n* ``Perpendicular``: Perpendicular\n* ``Parallel``: Parallel\n\n'),
+    ('Qgis.LineExtensionSide.BeforeVertex', 'Lock to previous vertex'),
+    ('Qgis.LineExtensionSide.AfterVertex', 'Lock to next vertex'),
+    ('Qgis.LineExtensionSide.NoVertex', "Don't lock to vertex"),
+    ('Qgis.LineExtensionSide', "Designates whether the line extension constraint is currently soft locked\nwith the previous or next vertex of the locked one.\n\n.. versionadded:: 3.26\n\n* ``BeforeVertex``: Lock to previous vertex\n* ``AfterVertex``: Lock to next vertex\n* ``NoVertex``: Don't lock to vertex\n\n"),
+    ('Qgis.CadConstraintType.Generic', 'Generic value'),
+    ('Qgis.CadConstraintType.Angle', 'Angle value'),
+    ('Qgis.CadConstraintType.Distance', 'Distance value'),
+    ('Qgis.CadConstraintType.XCoordinate', 'X Coordinate value'),
+    ('Qgis.CadConstraintType.YCoordinate', 'Y Coordinate value'),
+    ('Qgis.CadConstraintType.ZValue', 'Z value'),
+    ('Qgis.CadConstraintType.MValue', 'M value'),
+    ('Qgis.CadConstraintType', 'Advanced digitizing constraint type.\n\n.. versionadded:: 3.32\n\n* ``Generic``: Generic value\n* ``Angle``: Angle value\n* ``Distance``: Distance value\n* ``XCoordinate``: X Coordinate value\n* ``YCoordinate``: Y Coordinate value\n* ``ZValue``: Z value\n* ``MValue``: M value\n\n'),
+    ('Qgis.ProjectFlag.EvaluateDefaultValuesOnProviderSide', 'If set, default values for fields will be evaluated on the provider side when features from the project are created instead of when they are committed.'),
+    ('Qgis.ProjectFlag.TrustStoredLayerStatistics', 'If set, then layer statistics (such as the layer extent) will be read from values stored in the project instead of requesting updated values from the data provider. Additionally, when this flag is set, primary key unicity is not checked for views and materialized views with Postgres provider.'),
+    ('Qgis.ProjectFlag.RememberLayerEditStatusBetweenSessions', 'If set, then any layers set to be editable will be stored in the project and immediately made editable whenever that project is restored'),
+    ('Qgis.ProjectFlag.RememberAttributeTableWindowsBetweenSessions', 'If set, then any open attribute tables will be stored in the project and immediately reopened when the project is restored'),
+    ('Qgis.ProjectFlag', 'Flags which control the behavior of :py:class:`QgsProjects`.\n\n.. versionadded:: 3.26\n\n* ``EvaluateDefaultValuesOnProviderSide``: If set, default values for fields will be evaluated on the provider side when features from the project are created instead of when they are committed.\n* ``TrustStoredLayerStatistics``: If set, then layer statistics (such as the layer extent) will be read from values stored in the project instead of requesting updated values from the data provider. Additionally, when this flag is set, primary key unicity is not checked for views and materialized views with Postgres provider.\n* ``RememberLayerEditStatusBetweenSessions``: If set, then any layers set to be editable will be stored in the project and immediately made editable whenever that project is restored\n* ``RememberAttributeTableWindowsBetweenSessions``: If set, then any open attribute tables will be stored in the project and immediately reopened when the project is restored\n\n'),
+    ('Qgis.PlotToolFlag.ShowContextMenu', 'Show a context menu when right-clicking with the tool.'),
+    ('Qgis.PlotToolFlag', 'Flags that control the way the :py:class:`QgsPlotTools` operate.\n\n.. versionadded:: 3.26\n\n* ``ShowContextMenu``: Show a context menu when right-clicking with the tool.\n\n'),
+    ('Qgis.Point3DShape.Cylinder', 'Cylinder'),
+    ('Qgis.Point3DShape.Sphere', 'Sphere'),
+    ('Qgis.Point3DShape.Cone', 'Cone'),
+    ('Qgis.Point3DShape.Cube', 'Cube'),
+    ('Qgis.Point3DShape.Torus', 'Torus'),
+    ('Qgis.Point3DShape.Plane', 'Flat plane'),
+    ('Qgis.Point3DShape.ExtrudedText', 'Extruded text'),
+    ('Qgis.Point3DShape.Model', 'Model'),
+    ('Qgis.Point3DShape.Billboard', 'Billboard'),
+    ('Qgis.Point3DShape', '3D point shape types.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as :py:class:`QgsPoint3DSymbol`.Shape\n\n.. versionadded:: 3.36\n\n* ``Cylinder``: Cylinder\n* ``Sphere``: Sphere\n* ``Cone``: Cone\n* ``Cube``: Cube\n* ``Torus``: Torus\n* ``Plane``: Flat plane\n* ``ExtrudedText``: Extruded text\n* ``Model``: Model\n* ``Billboard``: Billboard\n\n'),
+    ('Qgis.LightSourceType.Point', 'Point light source'),
+    ('Qgis.LightSourceType.Directional', 'Directional light source'),
+    ('Qgis.LightSourceType', 'Light source types for 3D scenes.\n\n.. versionadded:: 3.26\n\n* ``Point``: Point light source\n* ``Directional``: Directional light source\n\n'),
+    ('Qgis.NavigationMode.TerrainBased', 'The default navigation based on the terrain'),
+    ('Qgis.NavigationMode.Walk', 'Uses WASD keys or arrows to navigate in walking (first person) manner'),
+    ('Qgis.NavigationMode.GlobeTerrainBased', 'Navigation similar to TerrainBased, but for use with globe  \n.. versionadded:: 3.44'),
+    ('Qgis.NavigationMode', 'The navigation mode used by 3D cameras.\n\n.. versionadded:: 3.30\n\n* ``TerrainBased``: The default navigation based on the terrain\n* ``Walk``: Uses WASD keys or arrows to navigate in walking (first person) manner\n* ``GlobeTerrainBased``: Navigation similar to TerrainBased, but for use with globe\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('Qgis.SceneMode.Local', 'Local scene based on a projected CRS'),
+    ('Qgis.SceneMode.Globe', 'Scene is represented as a globe using a geocentric CRS'),
+    ('Qgis.SceneMode', 'The 3D scene mode used in 3D map views.\n\n.. versionadded:: 3.44\n\n* ``Local``: Local scene based on a projected CRS\n* ``Globe``: Scene is represented as a globe using a geocentric CRS\n\n'),
+    ('Qgis.VerticalAxisInversion.Never', 'Never invert vertical axis movements'),
+    ('Qgis.VerticalAxisInversion.WhenDragging', 'Invert vertical axis movements when dragging in first person modes'),
+    ('Qgis.VerticalAxisInversion.Always', 'Always invert vertical axis movements'),
+    ('Qgis.VerticalAxisInversion', 'Vertical axis inversion options for 3D views.\n\n.. versionadded:: 3.30\n\n* ``Never``: Never invert vertical axis movements\n* ``WhenDragging``: Invert vertical axis movements when dragging in first person modes\n* ``Always``: Always invert vertical axis movements\n\n'),
+    ('Qgis.ProfileSurfaceSymbology.Line', 'The elevation surface will be rendered using a line symbol'),
+    ('Qgis.ProfileSurfaceSymbology.FillBelow', 'The elevation surface will be rendered using a fill symbol below the surface level'),
+    ('Qgis.ProfileSurfaceSymbology.FillAbove', 'The elevation surface will be rendered using a fill symbol above the surface level \n.. versionadded:: 3.32'),
+    ('Qgis.ProfileSurfaceSymbology', 'Surface symbology type for elevation profile plots.\n\n.. versionadded:: 3.26\n\n* ``Line``: The elevation surface will be rendered using a line symbol\n* ``FillBelow``: The elevation surface will be rendered using a fill symbol below the surface level\n* ``FillAbove``: The elevation surface will be rendered using a fill symbol above the surface level\n\n  .. versionadded:: 3.32\n\n\n'),
+    ('Qgis.VectorProfileType.IndividualFeatures', 'Treat each feature as an individual object (eg buildings)'),
+    ('Qgis.VectorProfileType.ContinuousSurface', 'The features should be treated as representing values on a continuous surface (eg contour lines)'),
+    ('Qgis.VectorProfileType', 'Types of elevation profiles to generate for vector sources.\n\n.. versionadded:: 3.26\n\n* ``IndividualFeatures``: Treat each feature as an individual object (eg buildings)\n* ``ContinuousSurface``: The features should be treated as representing values on a continuous surface (eg contour lines)\n\n'),
+    ('Qgis.ProfileGeneratorFlag.RespectsMaximumErrorMapUnit', 'Generated profile respects the QgsProfileGenerationContext.maximumErrorMapUnits() property.'),
+    ('Qgis.ProfileGeneratorFlag.RespectsDistanceRange', 'Generated profile respects the QgsProfileGenerationContext.distanceRange() property.'),
+    ('Qgis.ProfileGeneratorFlag.RespectsElevationRange', 'Generated profile respects the QgsProfileGenerationContext.elevationRange() property.'),
+    ('Qgis.ProfileGeneratorFlag', 'Flags that control the way the :py:class:`QgsAbstractProfileGenerator` operate.\n\n.. versionadded:: 3.26\n\n* ``RespectsMaximumErrorMapUnit``: Generated profile respects the QgsProfileGenerationContext.maximumErrorMapUnits() property.\n* ``RespectsDistanceRange``: Generated profile respects the QgsProfileGenerationContext.distanceRange() property.\n* ``RespectsElevationRange``: Generated profile respects the QgsProfileGenerationContext.elevationRange() property.\n\n'),
+    ('Qgis.ProfileExportType.Features3D', 'Export profiles as 3D features, with elevation values stored in exported geometry Z values'),
+    ('Qgis.ProfileExportType.Profile2D', 'Export profiles as 2D profile lines, with elevation stored in exported geometry Y dimension and distance in X dimension'),
+    ('Qgis.ProfileExportType.DistanceVsElevationTable', 'Export profiles as a table of sampled distance vs elevation values'),
+    ('Qgis.ProfileExportType', 'Types of export for elevation profiles.\n\n.. versionadded:: 3.32\n\n* ``Features3D``: Export profiles as 3D features, with elevation values stored in exported geometry Z values\n* ``Profile2D``: Export profiles as 2D profile lines, with elevation stored in exported geometry Y dimension and distance in X dimension\n* ``DistanceVsElevationTable``: Export profiles as a table of sampled distance vs elevation values\n\n'),
+    ('QgsPointCloudRenderer.Square', 'Renders points as squares'),
+    ('QgsPointCloudRenderer.Circle', 'Renders points as circles'),
+    ('Qgis.PointCloudSymbol', 'Rendering symbols for point cloud points.\n\n.. versionadded:: 3.26\n\n* ``Square``: Renders points as squares\n* ``Circle``: Renders points as circles\n\n'),
+    ('QgsPointCloudRenderer.Default', 'Draw points in the order they are stored'),
+    ('QgsPointCloudRenderer.BottomToTop', 'Draw points with larger Z values last'),
+    ('QgsPointCloudRenderer.TopToBottom', 'Draw points with larger Z values first'),
+    ('Qgis.PointCloudDrawOrder', 'Pointcloud rendering order for 2d views\n\n/since QGIS 3.26\n\n* ``Default``: Draw points in the order they are stored\n* ``BottomToTop``: Draw points with larger Z values last\n* ``TopToBottom``: Draw points with larger Z values first\n\n'),
+    ('QgsProject.AllowIntersections', 'Overlap with any feature allowed when digitizing new features'),
+    ('QgsProject.AvoidIntersectionsCurrentLayer', 'Overlap with features from the active layer when digitizing new features not allowed'),
+    ('QgsProject.AvoidIntersectionsLayers', 'Overlap with features from a specified list of layers when digitizing new features not allowed'),
+    ('Qgis.AvoidIntersectionsMode', 'Flags which control how intersections of pre-existing feature are handled when digitizing new features.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsProject`.AvoidIntersectionsMode\n\n.. versionadded:: 3.26\n\n* ``AllowIntersections``: Overlap with any feature allowed when digitizing new features\n* ``AvoidIntersectionsCurrentLayer``: Overlap with features from the active layer when digitizing new features not allowed\n* ``AvoidIntersectionsLayers``: Overlap with features from a specified list of layers when digitizing new features not allowed\n\n'),
+    ('QgsProject.Qgz', 'Archive file format, supports auxiliary data'),
+    ('QgsProject.Qgs', 'Project saved in a clear text, does not support auxiliary data'),
+    ('Qgis.ProjectFileFormat', 'Flags which control project read behavior.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsProject`.FileFormat\n\n.. versionadded:: 3.26\n\n* ``Qgz``: Archive file format, supports auxiliary data\n* ``Qgs``: Project saved in a clear text, does not support auxiliary data\n\n'),
+    ('QgsProject.FlagDontResolveLayers', "Don't resolve layer paths (i.e. don't load any layer content). Dramatically improves project read time if the actual data from the layers is not required."),
+    ('QgsProject.FlagDontLoadLayouts', "Don't load print layouts. Improves project read time if layouts are not required, and allows projects to be safely read in background threads (since print layouts are not thread safe)."),
+    ('QgsProject.FlagTrustLayerMetadata', "Trust layer metadata. Improves project read time. Do not use it if layers' extent is not fixed during the project's use by QGIS and QGIS Server."),
+    ('QgsProject.FlagDontStoreOriginalStyles', 'Skip the initial XML style storage for layers. Useful for minimising project load times in non-interactive contexts.'),
+    ('QgsProject.FlagDontLoad3DViews', 'Skip loading 3D views \n.. versionadded:: 3.26'),
+    ('QgsProject.DontLoadProjectStyles', 'Skip loading project style databases (deprecated -- use ProjectCapability.ProjectStyles flag instead)'),
+    ('QgsProject.ForceReadOnlyLayers', 'Open layers in a read-only mode. \n.. versionadded:: 3.28'),
+    ('QgsProject.DontUpgradeAnnotations', "Don't upgrade old annotation items to QgsAnnotationItem \n.. versionadded:: 3.40"),
+    ('Qgis.ProjectReadFlag', "Flags which control project read behavior.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsProject`.ReadFlag\n\n.. versionadded:: 3.26\n\n* ``DontResolveLayers``: Don't resolve layer paths (i.e. don't load any layer content). Dramatically improves project read time if the actual data from the layers is not required.\n\n  Available as ``QgsProject.FlagDontResolveLayers`` in older QGIS releases.\n\n* ``DontLoadLayouts``: Don't load print layouts. Improves project read time if layouts are not required, and allows projects to be safely read in background threads (since print layouts are not thread safe).\n\n  Available as ``QgsProject.FlagDontLoadLayouts`` in older QGIS releases.\n\n* ``TrustLayerMetadata``: Trust layer metadata. Improves project read time. Do not use it if layers' extent is not fixed during the project's use by QGIS and QGIS Server.\n\n  Available as ``QgsProject.FlagTrustLayerMetadata`` in older QGIS releases.\n\n* ``DontStoreOriginalStyles``: Skip the initial XML style storage for layers. Useful for minimising project load times in non-interactive contexts.\n\n  Available as ``QgsProject.FlagDontStoreOriginalStyles`` in older QGIS releases.\n\n* ``DontLoad3DViews``: Skip loading 3D views\n\n  .. versionadded:: 3.26\n\n\n  Available as ``QgsProject.FlagDontLoad3DViews`` in older QGIS releases.\n\n* ``DontLoadProjectStyles``: Skip loading project style databases (deprecated -- use ProjectCapability.ProjectStyles flag instead)\n* ``ForceReadOnlyLayers``: Open layers in a read-only mode.\n\n  .. versionadded:: 3.28\n\n* ``DontUpgradeAnnotations``: Don't upgrade old annotation items to QgsAnnotationItem\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('Qgis.ProjectCapability.ProjectStyles', 'Enable the project embedded style library. Enabling this flag can increase the time required to clear and load projects.'),
+    ('Qgis.ProjectCapability', 'Flags which control project capabilities.\n\nThese flags are specific upfront on creation of a :py:class:`QgsProject` object, and can\nbe used to selectively enable potentially costly functionality for the project.\n\n.. versionadded:: 3.26.1\n\n* ``ProjectStyles``: Enable the project embedded style library. Enabling this flag can increase the time required to clear and load projects.\n\n'),
+    ('Qgis.MapBoxGlStyleSourceType.Vector', 'Vector source'),
+    ('Qgis.MapBoxGlStyleSourceType.Raster', 'Raster source'),
+    ('Qgis.MapBoxGlStyleSourceType.RasterDem', 'Raster DEM source'),
+    ('Qgis.MapBoxGlStyleSourceType.GeoJson', 'GeoJSON source'),
+    ('Qgis.MapBoxGlStyleSourceType.Image', 'Image source'),
+    ('Qgis.MapBoxGlStyleSourceType.Video', 'Video source'),
+    ('Qgis.MapBoxGlStyleSourceType.Unknown', 'Other/unknown source type'),
+    ('Qgis.MapBoxGlStyleSourceType', 'Available MapBox GL style source types.\n\n.. versionadded:: 3.28\n\n* ``Vector``: Vector source\n* ``Raster``: Raster source\n* ``RasterDem``: Raster DEM source\n* ``GeoJson``: GeoJSON source\n* ``Image``: Image source\n* ``Video``: Video source\n* ``Unknown``: Other/unknown source type\n\n'),
+    ('QgsArcGisPortalUtils.FeatureService', 'FeatureServer'),
+    ('QgsArcGisPortalUtils.MapService', 'MapServer'),
+    ('QgsArcGisPortalUtils.ImageService', 'ImageServer'),
+    ('QgsArcGisPortalUtils.GlobeServer', 'GlobeServer'),
+    ('QgsArcGisPortalUtils.GPServer', 'GPServer'),
+    ('QgsArcGisPortalUtils.GeocodeServer', 'GeocodeServer'),
+    ('QgsArcGisPortalUtils.Unknown', 'Other unknown/unsupported type'),
+    ('Qgis.ArcGisRestServiceType', 'Available ArcGIS REST service types.\n\n.. note::\n\n   Prior to QGIS 3.26 this was available as :py:class:`QgsArcGisPortalUtils`.ItemType.\n\n.. versionadded:: 3.28\n\n* ``FeatureServer``: FeatureServer\n\n  Available as ``QgsArcGisPortalUtils.FeatureService`` in older QGIS releases.\n\n* ``MapServer``: MapServer\n\n  Available as ``QgsArcGisPortalUtils.MapService`` in older QGIS releases.\n\n* ``ImageServer``: ImageServer\n\n  Available as ``QgsArcGisPortalUtils.ImageService`` in older QGIS releases.\n\n* ``GlobeServer``: GlobeServer\n* ``GPServer``: GPServer\n* ``GeocodeServer``: GeocodeServer\n* ``Unknown``: Other unknown/unsupported type\n\n'),
+    ('QgsRelation.Normal', 'A normal relation'),
+    ('QgsRelation.Generated', 'A generated relation is a child of a polymorphic relation'),
+    ('Qgis.RelationshipType', 'Relationship types.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsRelation`.RelationType.\n\n.. versionadded:: 3.28\n\n* ``Normal``: A normal relation\n* ``Generated``: A generated relation is a child of a polymorphic relation\n\n'),
+    ('QgsRelation.Association', 'Loose relation, related elements are not part of the parent and a parent copy will not copy any children.'),
+    ('QgsRelation.Composition', 'Fix relation, related elements are part of the parent and a parent copy will copy any children or delete of parent will delete children'),
+    ('Qgis.RelationshipStrength', 'Relationship strength.\n\n.. note::\n\n   Prior to QGIS 3.28 this was available as :py:class:`QgsRelation`.RelationStrength.\n\n.. versionadded:: 3.28\n\n* ``Association``: Loose relation, related elements are not part of the parent and a parent copy will not copy any children.\n* ``Composition``: Fix relation, related elements are part of the parent and a parent copy will copy any children or delete of parent will delete children\n\n'),
+    ('Qgis.RelationshipCardinality.OneToOne', 'One to one relationship'),
+    ('Qgis.RelationshipCardinality.OneToMany', 'One to many relationship'),
+    ('Qgis.RelationshipCardinality.ManyToOne', 'Many to one relationship'),
+    ('Qgis.RelationshipCardinality.ManyToMany', 'Many to many relationship'),
+    ('Qgis.RelationshipCardinality', 'Relationship cardinality.\n\n.. versionadded:: 3.28\n\n* ``OneToOne``: One to one relationship\n* ``OneToMany``: One to many relationship\n* ``ManyToOne``: Many to one relationship\n* ``ManyToMany``: Many to many relationship\n\n'),
+    ('Qgis.RelationshipCapability.MultipleFieldKeys', 'Supports multiple field keys (as opposed to a singular field)'),
+    ('Qgis.RelationshipCapability.ForwardPathLabel', 'Supports forward path labels'),
+    ('Qgis.RelationshipCapability.BackwardPathLabel', 'Supports backward path labels'),
+    ('Qgis.RelationshipCapability', 'Relationship capabilities.\n\n.. versionadded:: 3.30\n\n* ``MultipleFieldKeys``: Supports multiple field keys (as opposed to a singular field)\n* ``ForwardPathLabel``: Supports forward path labels\n* ``BackwardPathLabel``: Supports backward path labels\n\n'),
+    ('Qgis.CoordinateDisplayType.MapCrs', 'Map CRS'),
+    ('Qgis.CoordinateDisplayType.MapGeographic', 'Map Geographic CRS equivalent (stays unchanged if the map CRS is geographic)'),
+    ('Qgis.CoordinateDisplayType.CustomCrs', 'Custom CRS'),
+    ('Qgis.CoordinateDisplayType', 'Formats for displaying coordinates\n\n.. versionadded:: 3.28\n\n* ``MapCrs``: Map CRS\n* ``MapGeographic``: Map Geographic CRS equivalent (stays unchanged if the map CRS is geographic)\n* ``CustomCrs``: Custom CRS\n\n'),
+    ('Qgis.SettingsOrigin.Any', 'From any origin'),
+    ('Qgis.SettingsOrigin.Global', 'Global settings are stored in `qgis_global_settings.ini`'),
+    ('Qgis.SettingsOrigin.Local', 'Local settings are stored in the user profile'),
+    ('Qgis.SettingsOrigin', 'The setting origin describes where a setting is stored.\n\n.. versionadded:: 3.30\n\n* ``Any``: From any origin\n* ``Global``: Global settings are stored in `qgis_global_settings.ini`\n* ``Local``: Local settings are stored in the user profile\n\n'),
+    ('Qgis.ScriptLanguage.Css', 'CSS'),
+    ('Qgis.ScriptLanguage.QgisExpression', 'QGIS expressions'),
+    ('Qgis.ScriptLanguage.Html', 'HTML'),
+    ('Qgis.ScriptLanguage.JavaScript', 'JavaScript'),
+    ('Qgis.ScriptLanguage.Json', 'JSON'),
+    ('Qgis.ScriptLanguage.Python', 'Python'),
+    ('Qgis.ScriptLanguage.R', 'R Stats'),
+    ('Qgis.ScriptLanguage.Sql', 'SQL'),
+    ('Qgis.ScriptLanguage.Batch', 'Windows batch files'),
+    ('Qgis.ScriptLanguage.Bash', 'Bash scripts'),
+    ('Qgis.ScriptLanguage.Unknown', 'Unknown/other language'),
+    ('Qgis.ScriptLanguage', 'Scripting languages.\n\n.. versionadded:: 3.30\n\n* ``Css``: CSS\n* ``QgisExpression``: QGIS expressions\n* ``Html``: HTML\n* ``JavaScript``: JavaScript\n* ``Json``: JSON\n* ``Python``: Python\n* ``R``: R Stats\n* ``Sql``: SQL\n* ``Batch``: Windows batch files\n* ``Bash``: Bash scripts\n* ``Unknown``: Unknown/other language\n\n'),
+    ('Qgis.ScriptLanguageCapability.Reformat', 'Language supports automatic code reformatting'),
+    ('Qgis.ScriptLanguageCapability.CheckSyntax', 'Language supports syntax checking'),
+    ('Qgis.ScriptLanguageCapability.ToggleComment', 'Language supports comment toggling'),
+    ('Qgis.ScriptLanguageCapability', 'Script language capabilities.\n\nThe flags reflect the support capabilities of a scripting language.\n\n.. versionadded:: 3.32\n\n* ``Reformat``: Language supports automatic code reformatting\n* ``CheckSyntax``: Language supports syntax checking\n* ``ToggleComment``: Language supports comment toggling\n\n'),
+    ('Qgis.LayerTreeInsertionMethod.AboveInsertionPoint', 'Layers are added in the tree above the insertion point'),
+    ('Qgis.LayerTreeInsertionMethod.TopOfTree', 'Layers are added at the top of the layer tree'),
+    ('Qgis.LayerTreeInsertionMethod.OptimalInInsertionGroup', "Layers are added at optimal locations across the insertion point's group"),
+    ('Qgis.LayerTreeInsertionMethod', "Layer tree insertion methods\n\n.. versionadded:: 3.30\n\n* ``AboveInsertionPoint``: Layers are added in the tree above the insertion point\n* ``TopOfTree``: Layers are added at the top of the layer tree\n* ``OptimalInInsertionGroup``: Layers are added at optimal locations across the insertion point's group\n\n"),
+    ('Qgis.LayerTreeFilterFlag.SkipVisibilityCheck', 'If set, the standard visibility check should be skipped'),
+    ('Qgis.LayerTreeFilterFlag', 'Layer tree filter flags.\n\n.. versionadded:: 3.32\n\n* ``SkipVisibilityCheck``: If set, the standard visibility check should be skipped\n\n'),
+    ('QgsLegendStyle.Undefined', 'Should not happen, only if corrupted project file'),
+    ('QgsLegendStyle.Hidden', 'Special style, item is hidden including margins around'),
+    ('QgsLegendStyle.Title', 'Legend title'),
+    ('QgsLegendStyle.Group', 'Legend group title'),
+    ('QgsLegendStyle.Subgroup', 'Legend subgroup title'),
+    ('QgsLegendStyle.Symbol', 'Symbol icon (excluding label)'),
+    ('QgsLegendStyle.SymbolLabel', 'Symbol label (excluding icon)'),
+    ('Qgis.LegendComponent', 'Component of legends which can be styled.\n\nPrior to QGIS 3.42 this was available as :py:class:`QgsLegendStyle`.Style\n\n.. versionadded:: 3.42\n\n* ``Undefined``: Should not happen, only if corrupted project file\n* ``Hidden``: Special style, item is hidden including margins around\n* ``Title``: Legend title\n* ``Group``: Legend group title\n* ``Subgroup``: Legend subgroup title\n* ``Symbol``: Symbol icon (excluding label)\n* ``SymbolLabel``: Symbol label (excluding icon)\n\n'),
+    ('Qgis.LegendJsonRenderFlag.ShowRuleDetails', 'If set, the rule expression of a rule based renderer legend item will be added to the JSON'),
+    ('Qgis.LegendJsonRenderFlag', 'Legend JSON export flags.\n\nFlags to control JSON attributes when exporting a legend in JSON format.\n\n.. versionadded:: 3.36\n\n* ``ShowRuleDetails``: If set, the rule expression of a rule based renderer legend item will be added to the JSON\n\n'),
+    ('Qgis.ActionType.Invalid', 'Invalid'),
+    ('Qgis.ActionType.MapLayerAction', 'Standard actions (defined by core or plugins), corresponds to QgsMapLayerAction class.'),
+    ('Qgis.ActionType.AttributeAction', 'Custom actions (manually defined in layer properties), corresponds to QgsAction class.'),
+    ('Qgis.ActionType', 'Action types.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsActionMenu`.ActionType\n\n.. versionadded:: 3.30\n\n* ``Invalid``: Invalid\n* ``MapLayerAction``: Standard actions (defined by core or plugins), corresponds to QgsMapLayerAction class.\n* ``AttributeAction``: Custom actions (manually defined in layer properties), corresponds to QgsAction class.\n\n'),
+    ('Qgis.MapLayerActionTarget.Layer', 'Action targets a complete layer'),
+    ('Qgis.MapLayerActionTarget.SingleFeature', 'Action targets a single feature from a layer'),
+    ('Qgis.MapLayerActionTarget.MultipleFeatures', 'Action targets multiple features from a layer'),
+    ('Qgis.MapLayerActionTarget.AllActions', ''),
+    ('Qgis.MapLayerActionTarget', 'Map layer action targets.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsMapLayerAction`.Target\n\n.. versionadded:: 3.30\n\n* ``Layer``: Action targets a complete layer\n* ``SingleFeature``: Action targets a single feature from a layer\n* ``MultipleFeatures``: Action targets multiple features from a layer\n* ``AllActions``: \n\n'),
+    ('Qgis.MapLayerActionFlag.EnabledOnlyWhenEditable', 'Action should be shown only for editable layers'),
+    ('Qgis.MapLayerActionFlag.EnableOnlyWhenHasGeometry', 'Action should be shown only for layers with geometry, \n.. versionadded:: 3.42'),
+    ('Qgis.MapLayerActionFlag', 'Map layer action flags.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsMapLayerAction`.Flag\n\n.. versionadded:: 3.30\n\n* ``EnabledOnlyWhenEditable``: Action should be shown only for editable layers\n* ``EnableOnlyWhenHasGeometry``: Action should be shown only for layers with geometry,\n\n  .. versionadded:: 3.42\n\n\n'),
+    ('QgsAction.Generic', 'Generic'),
+    ('QgsAction.GenericPython', 'Python'),
+    ('QgsAction.Mac', 'MacOS specific'),
+    ('QgsAction.Windows', 'Windows specific'),
+    ('QgsAction.Unix', 'Unix specific'),
+    ('QgsAction.OpenUrl', 'Open URL action'),
+    ('QgsAction.SubmitUrlEncoded', 'POST data to an URL, using "application/x-www-form-urlencoded" or "application/json" if the body is valid JSON \n.. versionadded:: 3.24'),
+    ('QgsAction.SubmitUrlMultipart', 'POST data to an URL using "multipart/form-data"  \n.. versionadded:: 3.24'),
+    ('Qgis.AttributeActionType', 'Attribute action types.\n\nPrior to QGIS 3.30 this was available as :py:class:`QgsAction`.ActionType\n\n.. versionadded:: 3.30\n\n* ``Generic``: Generic\n* ``GenericPython``: Python\n* ``Mac``: MacOS specific\n* ``Windows``: Windows specific\n* ``Unix``: Unix specific\n* ``OpenUrl``: Open URL action\n* ``SubmitUrlEncoded``: POST data to an URL, using "application/x-www-form-urlencoded" or "application/json" if the body is valid JSON\n\n  .. versionadded:: 3.24\n\n* ``SubmitUrlMultipart``: POST data to an URL using "multipart/form-data"\n\n  .. versionadded:: 3.24\n\n\n'),
+    ('Qgis.MetadataDateType.Created', 'Date created'),
+    ('Qgis.MetadataDateType.Published', 'Date published'),
+    ('Qgis.MetadataDateType.Revised', 'Date revised'),
+    ('Qgis.MetadataDateType.Superseded', 'Date superseded'),
+    ('Qgis.MetadataDateType', 'Date types for metadata.\n\n.. versionadded:: 3.30\n\n* ``Created``: Date created\n* ``Published``: Date published\n* ``Revised``: Date revised\n* ``Superseded``: Date superseded\n\n'),
+    ('QgsRaster.UndefinedColorInterpretation', 'Undefined'),
+    ('QgsRaster.GrayIndex', 'Grayscale'),
+    ('QgsRaster.PaletteIndex', 'Paletted (see associated color table)'),
+    ('QgsRaster.RedBand', 'Red band of RGBA image, or red spectral band [0.62 - 0.69 um]'),
+    ('QgsRaster.GreenBand', 'Green band of RGBA image, or green spectral band [0.51 - 0.60 um]'),
+    ('QgsRaster.BlueBand', 'Blue band of RGBA image, or blue spectral band [0.45 - 0.53 um]'),
+    ('QgsRaster.AlphaBand', 'Alpha (0=transparent, 255=opaque)'),
+    ('QgsRaster.HueBand', 'Hue band of HLS image'),
+    ('QgsRaster.SaturationBand', 'Saturation band of HLS image'),
+    ('QgsRaster.LightnessBand', 'Lightness band of HLS image'),
+    ('QgsRaster.CyanBand', 'Cyan band of CMYK image'),
+    ('QgsRaster.MagentaBand', 'Magenta band of CMYK image'),
+    ('QgsRaster.YellowBand', 'Yellow band of CMYK image, or yellow spectral band [0.58 - 0.62 um]'),
+    ('QgsRaster.BlackBand', 'Black band of CMLY image'),
+    ('QgsRaster.YCbCr_YBand', 'Y Luminance'),
+    ('QgsRaster.YCbCr_CbBand', 'Cb Chroma'),
+    ('QgsRaster.YCbCr_CrBand', 'Cr Chroma'),
+    ('QgsRaster.ContinuousPalette', 'Continuous palette, QGIS addition, GRASS'),
+    ('QgsRaster.PanBand', 'Panchromatic band [0.40 - 1.00 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.CoastalBand', 'Coastal band [0.40 - 0.45 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.RedEdgeBand', 'Red-edge band [0.69 - 0.79 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.NIRBand', 'Near-InfraRed (NIR) band [0.75 - 1.40 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SWIRBand', 'Short-Wavelength InfraRed (SWIR) band [1.40 - 3.00 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.MWIRBand', 'Mid-Wavelength InfraRed (MWIR) band [3.00 - 8.00 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.LWIRBand', 'Long-Wavelength InfraRed (LWIR) band [8.00 - 15 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.TIRBand', 'Thermal InfraRed (TIR) band (MWIR or LWIR) [3 - 15 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.OtherIRBand', 'Other infrared band [0.75 - 1000 um] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_Ka_Band', 'Synthetic Aperture Radar (SAR) Ka band [0.8 - 1.1 cm / 27 - 40 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_K_Band', 'Synthetic Aperture Radar (SAR) K band [1.1 - 1.7 cm / 18 - 27 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_Ku_Band', 'Synthetic Aperture Radar (SAR) Ku band [1.7 - 2.4 cm / 12 - 18 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_X_Band', 'Synthetic Aperture Radar (SAR) X band [2.4 - 3.8 cm / 8 - 12 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_C_Band', 'Synthetic Aperture Radar (SAR) C band [3.8 - 7.5 cm / 4 - 8 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_S_Band', 'Synthetic Aperture Radar (SAR) S band [7.5 - 15 cm / 2 - 4 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_L_Band', 'Synthetic Aperture Radar (SAR) L band [15 - 30 cm / 1 - 2 GHz] \n.. versionadded:: 3.40'),
+    ('QgsRaster.SAR_P_Band', 'Synthetic Aperture Radar (SAR) P band [30 - 100 cm / 0.3 - 1 GHz] \n.. versionadded:: 3.40'),
+    ('Qgis.RasterColorInterpretation', 'Raster color interpretation.\n\nThis is a modified copy of the GDAL GDALColorInterp enum.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRaster`.ColorInterpretation\n\n.. versionadded:: 3.30\n\n* ``Undefined``: Undefined\n\n  Available as ``QgsRaster.UndefinedColorInterpretation`` in older QGIS releases.\n\n* ``GrayIndex``: Grayscale\n* ``PaletteIndex``: Paletted (see associated color table)\n* ``RedBand``: Red band of RGBA image, or red spectral band [0.62 - 0.69 um]\n* ``GreenBand``: Green band of RGBA image, or green spectral band [0.51 - 0.60 um]\n* ``BlueBand``: Blue band of RGBA image, or blue spectral band [0.45 - 0.53 um]\n* ``AlphaBand``: Alpha (0=transparent, 255=opaque)\n* ``HueBand``: Hue band of HLS image\n* ``SaturationBand``: Saturation band of HLS image\n* ``LightnessBand``: Lightness band of HLS image\n* ``CyanBand``: Cyan band of CMYK image\n* ``MagentaBand``: Magenta band of CMYK image\n* ``YellowBand``: Yellow band of CMYK image, or yellow spectral band [0.58 - 0.62 um]\n* ``BlackBand``: Black band of CMLY image\n* ``YCbCr_YBand``: Y Luminance\n* ``YCbCr_CbBand``: Cb Chroma\n* ``YCbCr_CrBand``: Cr Chroma\n* ``ContinuousPalette``: Continuous palette, QGIS addition, GRASS\n* ``PanBand``: Panchromatic band [0.40 - 1.00 um]\n\n  .. versionadded:: 3.40\n\n* ``CoastalBand``: Coastal band [0.40 - 0.45 um]\n\n  .. versionadded:: 3.40\n\n* ``RedEdgeBand``: Red-edge band [0.69 - 0.79 um]\n\n  .. versionadded:: 3.40\n\n* ``NIRBand``: Near-InfraRed (NIR) band [0.75 - 1.40 um]\n\n  .. versionadded:: 3.40\n\n* ``SWIRBand``: Short-Wavelength InfraRed (SWIR) band [1.40 - 3.00 um]\n\n  .. versionadded:: 3.40\n\n* ``MWIRBand``: Mid-Wavelength InfraRed (MWIR) band [3.00 - 8.00 um]\n\n  .. versionadded:: 3.40\n\n* ``LWIRBand``: Long-Wavelength InfraRed (LWIR) band [8.00 - 15 um]\n\n  .. versionadded:: 3.40\n\n* ``TIRBand``: Thermal InfraRed (TIR) band (MWIR or LWIR) [3 - 15 um]\n\n  .. versionadded:: 3.40\n\n* ``OtherIRBand``: Other infrared band [0.75 - 1000 um]\n\n  .. versionadded:: 3.40\n\n* ``SAR_Ka_Band``: Synthetic Aperture Radar (SAR) Ka band [0.8 - 1.1 cm / 27 - 40 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_K_Band``: Synthetic Aperture Radar (SAR) K band [1.1 - 1.7 cm / 18 - 27 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_Ku_Band``: Synthetic Aperture Radar (SAR) Ku band [1.7 - 2.4 cm / 12 - 18 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_X_Band``: Synthetic Aperture Radar (SAR) X band [2.4 - 3.8 cm / 8 - 12 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_C_Band``: Synthetic Aperture Radar (SAR) C band [3.8 - 7.5 cm / 4 - 8 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_S_Band``: Synthetic Aperture Radar (SAR) S band [7.5 - 15 cm / 2 - 4 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_L_Band``: Synthetic Aperture Radar (SAR) L band [15 - 30 cm / 1 - 2 GHz]\n\n  .. versionadded:: 3.40\n\n* ``SAR_P_Band``: Synthetic Aperture Radar (SAR) P band [30 - 100 cm / 0.3 - 1 GHz]\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('QgsRasterLayer.GrayOrUndefined', 'Gray or undefined'),
+    ('QgsRasterLayer.Palette', 'Palette'),
+    ('QgsRasterLayer.Multiband', 'Multi band'),
+    ('QgsRasterLayer.ColorLayer', 'Single band containing color data'),
+    ('Qgis.RasterLayerType', 'Raster layer types.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRasterLayer`.LayerType\n\n.. versionadded:: 3.30\n\n* ``GrayOrUndefined``: Gray or undefined\n* ``Palette``: Palette\n* ``MultiBand``: Multi band\n\n  Available as ``QgsRasterLayer.Multiband`` in older QGIS releases.\n\n* ``SingleBandColorData``: Single band containing color data\n\n  Available as ``QgsRasterLayer.ColorLayer`` in older QGIS releases.\n\n\n'),
+    ('QgsRaster.UndefinedDrawingStyle', 'Undefined'),
+    ('QgsRaster.SingleBandGray', 'A single band image drawn as a range of gray colors'),
+    ('QgsRaster.SingleBandPseudoColor', 'A single band image drawn using a pseudocolor algorithm'),
+    ('QgsRaster.PalettedColor', 'A "Palette" image drawn using color table'),
+    ('QgsRaster.PalettedSingleBandGray', 'A "Palette" layer drawn in gray scale'),
+    ('QgsRaster.PalettedSingleBandPseudoColor', 'A "Palette" layerdrawn using a pseudocolor algorithm'),
+    ('QgsRaster.PalettedMultiBandColor', 'Currently not supported'),
+    ('QgsRaster.MultiBandSingleBandGray', 'A layer containing 2 or more bands, but a single band drawn as a range of gray colors'),
+    ('QgsRaster.MultiBandSingleBandPseudoColor', 'A layer containing 2 or more bands, but a single band drawn using a pseudocolor algorithm'),
+    ('QgsRaster.MultiBandColor', 'A layer containing 2 or more bands, mapped to RGB color space. In the case of a multiband with only two bands, one band will be mapped to more than one color.'),
+    ('QgsRaster.SingleBandColorDataStyle', 'ARGB values rendered directly'),
+    ('Qgis.RasterDrawingStyle', 'Raster drawing styles.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRaster`.DrawingStyle\n\n.. versionadded:: 3.30\n\n* ``Undefined``: Undefined\n\n  Available as ``QgsRaster.UndefinedDrawingStyle`` in older QGIS releases.\n\n* ``SingleBandGray``: A single band image drawn as a range of gray colors\n* ``SingleBandPseudoColor``: A single band image drawn using a pseudocolor algorithm\n* ``PalettedColor``: A "Palette" image drawn using color table\n* ``PalettedSingleBandGray``: A "Palette" layer drawn in gray scale\n* ``PalettedSingleBandPseudoColor``: A "Palette" layerdrawn using a pseudocolor algorithm\n* ``PalettedMultiBandColor``: Currently not supported\n* ``MultiBandSingleBandGray``: A layer containing 2 or more bands, but a single band drawn as a range of gray colors\n* ``MultiBandSingleBandPseudoColor``: A layer containing 2 or more bands, but a single band drawn using a pseudocolor algorithm\n* ``MultiBandColor``: A layer containing 2 or more bands, mapped to RGB color space. In the case of a multiband with only two bands, one band will be mapped to more than one color.\n* ``SingleBandColorData``: ARGB values rendered directly\n\n  Available as ``QgsRaster.SingleBandColorDataStyle`` in older QGIS releases.\n\n\n'),
+    ('QgsRaster.PyramidsGTiff', 'Geotiff .ovr (external)'),
+    ('QgsRaster.PyramidsInternal', 'Internal'),
+    ('QgsRaster.PyramidsErdas', 'Erdas Image .aux (external)'),
+    ('Qgis.RasterPyramidFormat', 'Raster pyramid formats.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRaster`.RasterPyramidsFormat\n\n.. versionadded:: 3.30\n\n* ``GeoTiff``: Geotiff .ovr (external)\n\n  Available as ``QgsRaster.PyramidsGTiff`` in older QGIS releases.\n\n* ``Internal``: Internal\n\n  Available as ``QgsRaster.PyramidsInternal`` in older QGIS releases.\n\n* ``Erdas``: Erdas Image .aux (external)\n\n  Available as ``QgsRaster.PyramidsErdas`` in older QGIS releases.\n\n\n'),
+    ('QgsRaster.PyramidsFlagNo', 'Never'),
+    ('QgsRaster.PyramidsFlagYes', 'Yes'),
+    ('QgsRaster.PyramidsCopyExisting', 'Copy existing'),
+    ('Qgis.RasterBuildPyramidOption', 'Raster pyramid building options.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRaster`.RasterBuildPyramids\n\n.. versionadded:: 3.30\n\n* ``No``: Never\n\n  Available as ``QgsRaster.PyramidsFlagNo`` in older QGIS releases.\n\n* ``Yes``: Yes\n\n  Available as ``QgsRaster.PyramidsFlagYes`` in older QGIS releases.\n\n* ``CopyExisting``: Copy existing\n\n  Available as ``QgsRaster.PyramidsCopyExisting`` in older QGIS releases.\n\n\n'),
+    ('QgsRaster.IdentifyFormatUndefined', 'Undefined'),
+    ('QgsRaster.IdentifyFormatValue', 'Numerical pixel value'),
+    ('QgsRaster.IdentifyFormatText', 'WMS text'),
+    ('QgsRaster.IdentifyFormatHtml', 'WMS HTML'),
+    ('QgsRaster.IdentifyFormatFeature', 'WMS GML/JSON -> feature'),
+    ('Qgis.RasterIdentifyFormat', 'Raster identify formats.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsRaster`.IdentifyFormat\n\n.. versionadded:: 3.30\n\n* ``Undefined``: Undefined\n\n  Available as ``QgsRaster.IdentifyFormatUndefined`` in older QGIS releases.\n\n* ``Value``: Numerical pixel value\n\n  Available as ``QgsRaster.IdentifyFormatValue`` in older QGIS releases.\n\n* ``Text``: WMS text\n\n  Available as ``QgsRaster.IdentifyFormatText`` in older QGIS releases.\n\n* ``Html``: WMS HTML\n\n  Available as ``QgsRaster.IdentifyFormatHtml`` in older QGIS releases.\n\n* ``Feature``: WMS GML/JSON -> feature\n\n  Available as ``QgsRaster.IdentifyFormatFeature`` in older QGIS releases.\n\n\n'),
+    ('QgsRasterInterface.NoCapabilities', 'No capabilities'),
+    ('QgsRasterInterface.Size', 'Original data source size (and thus resolution) is known, it is not always available, for example for WMS'),
+    ('QgsRasterInterface.Create', 'Create new datasets (Unused and deprecated -- will be removed in QGIS 4)'),
+    ('QgsRasterInterface.Remove', 'Delete datasets (Unused and deprecated -- will be removed in QGIS 4)'),
+    ('QgsRasterInterface.BuildPyramids', 'Supports building of pyramids (overviews) (Deprecated since QGIS 3.38 -- use RasterProviderCapability.BuildPyramids instead)'),
+    ('QgsRasterInterface.Identify', 'At least one identify format supported'),
+    ('QgsRasterInterface.IdentifyValue', 'Numerical values'),
+    ('QgsRasterInterface.IdentifyText', 'WMS text'),
+    ('QgsRasterInterface.IdentifyHtml', 'WMS HTML'),
+    ('QgsRasterInterface.IdentifyFeature', 'WMS GML -> feature'),
+    ('QgsRasterInterface.Prefetch', 'Allow prefetching of out-of-view images'),
+    ('Qgis.RasterInterfaceCapability', 'Raster interface capabilities.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsRasterInterface`.Capability\n\n.. versionadded:: 3.38\n\n* ``NoCapabilities``: No capabilities\n* ``Size``: Original data source size (and thus resolution) is known, it is not always available, for example for WMS\n* ``Create``: Create new datasets (Unused and deprecated -- will be removed in QGIS 4)\n* ``Remove``: Delete datasets (Unused and deprecated -- will be removed in QGIS 4)\n* ``BuildPyramids``: Supports building of pyramids (overviews) (Deprecated since QGIS 3.38 -- use RasterProviderCapability.BuildPyramids instead)\n* ``Identify``: At least one identify format supported\n* ``IdentifyValue``: Numerical values\n* ``IdentifyText``: WMS text\n* ``IdentifyHtml``: WMS HTML\n* ``IdentifyFeature``: WMS GML -> feature\n* ``Prefetch``: Allow prefetching of out-of-view images\n\n'),
+    ('QgsRasterDataProvider.NoProviderCapabilities', 'Provider has no capabilities'),
+    ('QgsRasterDataProvider.ReadLayerMetadata', 'Provider can read layer metadata from data store. Since QGIS 3.0. See QgsDataProvider.layerMetadata()'),
+    ('QgsRasterDataProvider.WriteLayerMetadata', 'Provider can write layer metadata to the data store. Since QGIS 3.0. See QgsDataProvider.writeLayerMetadata()'),
+    ('QgsRasterDataProvider.ProviderHintBenefitsFromResampling', 'Provider benefits from resampling and should apply user default resampling settings \n.. versionadded:: 3.10'),
+    ('QgsRasterDataProvider.ProviderHintCanPerformProviderResampling', 'Provider can perform resampling (to be opposed to post rendering resampling) \n.. versionadded:: 3.16'),
+    ('QgsRasterDataProvider.ReloadData', 'Is able to force reload data / clear local caches. Since QGIS 3.18, see QgsDataProvider.reloadProviderData()'),
+    ('QgsRasterDataProvider.DpiDependentData', "Provider's rendering is dependent on requested pixel size of the viewport \n.. versionadded:: 3.20"),
+    ('QgsRasterDataProvider.NativeRasterAttributeTable', 'Indicates that the provider supports native raster attribute table \n.. versionadded:: 3.30'),
+    ('QgsRasterDataProvider.BuildPyramids', 'Supports building of pyramids (overviews) (since QGIS 3.38 -- this is a replacement for RasterInterfaceCapability.BuildPyramids)'),
+    ('Qgis.RasterProviderCapability', "Raster data provider capabilities.\n\n.. note::\n\n   Prior to QGIS 3.38 this was available as :py:class:`QgsRasterDataProvider`.ProviderCapability\n\n.. versionadded:: 3.38\n\n* ``NoProviderCapabilities``: Provider has no capabilities\n* ``ReadLayerMetadata``: Provider can read layer metadata from data store. Since QGIS 3.0. See QgsDataProvider.layerMetadata()\n* ``WriteLayerMetadata``: Provider can write layer metadata to the data store. Since QGIS 3.0. See QgsDataProvider.writeLayerMetadata()\n* ``ProviderHintBenefitsFromResampling``: Provider benefits from resampling and should apply user default resampling settings\n\n  .. versionadded:: 3.10\n\n* ``ProviderHintCanPerformProviderResampling``: Provider can perform resampling (to be opposed to post rendering resampling)\n\n  .. versionadded:: 3.16\n\n* ``ReloadData``: Is able to force reload data / clear local caches. Since QGIS 3.18, see QgsDataProvider.reloadProviderData()\n* ``DpiDependentData``: Provider's rendering is dependent on requested pixel size of the viewport\n\n  .. versionadded:: 3.20\n\n* ``NativeRasterAttributeTable``: Indicates that the provider supports native raster attribute table\n\n  .. versionadded:: 3.30\n\n* ``BuildPyramids``: Supports building of pyramids (overviews) (since QGIS 3.38 -- this is a replacement for RasterInterfaceCapability.BuildPyramids)\n\n"),
+    ('Qgis.ElevationMapCombineMethod.HighestElevation', 'Keep the highest elevation if it is not null'),
+    ('Qgis.ElevationMapCombineMethod.NewerElevation', 'Keep the new elevation regardless of its value if it is not null'),
+    ('Qgis.ElevationMapCombineMethod', 'Methods used to select the elevation when two elevation maps are combined\n\n.. versionadded:: 3.30\n\n* ``HighestElevation``: Keep the highest elevation if it is not null\n* ``NewerElevation``: Keep the new elevation regardless of its value if it is not null\n\n'),
+    ('QgsPainting.BlendNormal', 'Normal'),
+    ('QgsPainting.BlendLighten', 'Lighten'),
+    ('QgsPainting.BlendScreen', 'Screen'),
+    ('QgsPainting.BlendDodge', 'Dodge'),
+    ('QgsPainting.BlendAddition', 'Addition'),
+    ('QgsPainting.BlendDarken', 'Darken'),
+    ('QgsPainting.BlendMultiply', 'Multiple'),
+    ('QgsPainting.BlendBurn', 'Burn'),
+    ('QgsPainting.BlendOverlay', 'Overlay'),
+    ('QgsPainting.BlendSoftLight', 'Soft light'),
+    ('QgsPainting.BlendHardLight', 'Hard light'),
+    ('QgsPainting.BlendDifference', 'Difference'),
+    ('QgsPainting.BlendSubtract', 'Subtract'),
+    ('QgsPainting.BlendSource', 'Source'),
+    ('QgsPainting.BlendDestinationOver', 'Destination over'),
+    ('QgsPainting.BlendClear', 'Clear'),
+    ('QgsPainting.BlendDestination', 'Destination'),
+    ('QgsPainting.BlendSourceIn', 'Source in'),
+    ('QgsPainting.BlendDestinationIn', 'Destination in'),
+    ('QgsPainting.BlendSourceOut', 'Source out'),
+    ('QgsPainting.BlendDestinationOut', 'Destination out'),
+    ('QgsPainting.BlendSourceAtop', 'Source atop'),
+    ('QgsPainting.BlendDestinationAtop', 'Destination atop'),
+    ('QgsPainting.BlendXor', 'XOR'),
+    ('Qgis.BlendMode', 'Blending modes defining the available composition modes that can\nbe used when painting.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsPainting`.BlendMode.\n\n.. versionadded:: 3.30\n\n* ``Normal``: Normal\n\n  Available as ``QgsPainting.BlendNormal`` in older QGIS releases.\n\n* ``Lighten``: Lighten\n\n  Available as ``QgsPainting.BlendLighten`` in older QGIS releases.\n\n* ``Screen``: Screen\n\n  Available as ``QgsPainting.BlendScreen`` in older QGIS releases.\n\n* ``Dodge``: Dodge\n\n  Available as ``QgsPainting.BlendDodge`` in older QGIS releases.\n\n* ``Addition``: Addition\n\n  Available as ``QgsPainting.BlendAddition`` in older QGIS releases.\n\n* ``Darken``: Darken\n\n  Available as ``QgsPainting.BlendDarken`` in older QGIS releases.\n\n* ``Multiply``: Multiple\n\n  Available as ``QgsPainting.BlendMultiply`` in older QGIS releases.\n\n* ``Burn``: Burn\n\n  Available as ``QgsPainting.BlendBurn`` in older QGIS releases.\n\n* ``Overlay``: Overlay\n\n  Available as ``QgsPainting.BlendOverlay`` in older QGIS releases.\n\n* ``SoftLight``: Soft light\n\n  Available as ``QgsPainting.BlendSoftLight`` in older QGIS releases.\n\n* ``HardLight``: Hard light\n\n  Available as ``QgsPainting.BlendHardLight`` in older QGIS releases.\n\n* ``Difference``: Difference\n\n  Available as ``QgsPainting.BlendDifference`` in older QGIS releases.\n\n* ``Subtract``: Subtract\n\n  Available as ``QgsPainting.BlendSubtract`` in older QGIS releases.\n\n* ``Source``: Source\n\n  Available as ``QgsPainting.BlendSource`` in older QGIS releases.\n\n* ``DestinationOver``: Destination over\n\n  Available as ``QgsPainting.BlendDestinationOver`` in older QGIS releases.\n\n* ``Clear``: Clear\n\n  Available as ``QgsPainting.BlendClear`` in older QGIS releases.\n\n* ``Destination``: Destination\n\n  Available as ``QgsPainting.BlendDestination`` in older QGIS releases.\n\n* ``SourceIn``: Source in\n\n  Available as ``QgsPainting.BlendSourceIn`` in older QGIS releases.\n\n* ``DestinationIn``: Destination in\n\n  Available as ``QgsPainting.BlendDestinationIn`` in older QGIS releases.\n\n* ``SourceOut``: Source out\n\n  Available as ``QgsPainting.BlendSourceOut`` in older QGIS releases.\n\n* ``DestinationOut``: Destination out\n\n  Available as ``QgsPainting.BlendDestinationOut`` in older QGIS releases.\n\n* ``SourceAtop``: Source atop\n\n  Available as ``QgsPainting.BlendSourceAtop`` in older QGIS releases.\n\n* ``DestinationAtop``: Destination atop\n\n  Available as ``QgsPainting.BlendDestinationAtop`` in older QGIS releases.\n\n* ``Xor``: XOR\n\n  Available as ``QgsPainting.BlendXor`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.UnknownSystem', 'Unknown system of measurement'),
+    ('QgsUnitTypes.MetricSystem', 'International System of Units (SI)'),
+    ('QgsUnitTypes.ImperialSystem', 'British Imperial'),
+    ('QgsUnitTypes.USCSSystem', 'United States customary system'),
+    ('Qgis.SystemOfMeasurement', 'Systems of unit measurement.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.SystemOfMeasurement.\n\n.. versionadded:: 3.30\n\n* ``Unknown``: Unknown system of measurement\n\n  Available as ``QgsUnitTypes.UnknownSystem`` in older QGIS releases.\n\n* ``Metric``: International System of Units (SI)\n\n  Available as ``QgsUnitTypes.MetricSystem`` in older QGIS releases.\n\n* ``Imperial``: British Imperial\n\n  Available as ``QgsUnitTypes.ImperialSystem`` in older QGIS releases.\n\n* ``USCS``: United States customary system\n\n  Available as ``QgsUnitTypes.USCSSystem`` in older QGIS releases.\n\n\n'),
+    ('QgsTolerance.LayerUnits', 'Layer unit value'),
+    ('QgsTolerance.Pixels', 'Pixels unit of tolerance'),
+    ('QgsTolerance.ProjectUnits', 'Map (project) units'),
+    ('Qgis.MapToolUnit', 'Type of unit of tolerance value from settings.\nFor map (project) units, use MapToolUnit.Project.\n\n.. versionadded:: 3.32\n\n* ``Layer``: Layer unit value\n\n  Available as ``QgsTolerance.LayerUnits`` in older QGIS releases.\n\n* ``Pixels``: Pixels unit of tolerance\n* ``Project``: Map (project) units\n\n  Available as ``QgsTolerance.ProjectUnits`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.TypeDistance', 'Distance unit'),
+    ('QgsUnitTypes.TypeArea', 'Area unit'),
+    ('QgsUnitTypes.TypeVolume', 'Volume unit'),
+    ('QgsUnitTypes.TypeUnknown', 'Unknown unit type'),
+    ('QgsUnitTypes.TypeTemporal', 'Temporal unit'),
+    ('Qgis.UnitType', 'Unit types.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.UnitType.\n\n.. versionadded:: 3.30\n\n* ``Distance``: Distance unit\n\n  Available as ``QgsUnitTypes.TypeDistance`` in older QGIS releases.\n\n* ``Area``: Area unit\n\n  Available as ``QgsUnitTypes.TypeArea`` in older QGIS releases.\n\n* ``Volume``: Volume unit\n\n  Available as ``QgsUnitTypes.TypeVolume`` in older QGIS releases.\n\n* ``Unknown``: Unknown unit type\n\n  Available as ``QgsUnitTypes.TypeUnknown`` in older QGIS releases.\n\n* ``Temporal``: Temporal unit\n\n  Available as ``QgsUnitTypes.TypeTemporal`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.DistanceMeters', 'Meters'),
+    ('QgsUnitTypes.DistanceKilometers', 'Kilometers'),
+    ('QgsUnitTypes.DistanceFeet', 'Imperial feet'),
+    ('QgsUnitTypes.DistanceNauticalMiles', 'Nautical miles'),
+    ('QgsUnitTypes.DistanceYards', 'Imperial yards'),
+    ('QgsUnitTypes.DistanceMiles', 'Terrestrial miles'),
+    ('QgsUnitTypes.DistanceDegrees', 'Degrees, for planar geographic CRS distance measurements'),
+    ('QgsUnitTypes.DistanceCentimeters', 'Centimeters'),
+    ('QgsUnitTypes.DistanceMillimeters', 'Millimeters'),
+    ('QgsUnitTypes.Inches', 'Inches \n.. versionadded:: 3.32'),
+    ('QgsUnitTypes.ChainsInternational', 'International chains \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.ChainsBritishBenoit1895A', 'British chains (Benoit 1895 A) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.ChainsBritishBenoit1895B', 'British chains (Benoit 1895 B) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.ChainsBritishSears1922Truncated', 'British chains (Sears 1922 truncated) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.ChainsBritishSears1922', 'British chains (Sears 1922) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.ChainsClarkes', "Clarke's chains \n.. versionadded:: 3.40"),
+    ('QgsUnitTypes.ChainsUSSurvey', 'US Survey chains \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritish1865', 'British feet (1865) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritish1936', 'British feet (1936) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritishBenoit1895A', 'British feet (Benoit 1895 A) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritishBenoit1895B', 'British feet (Benoit 1895 B) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritishSears1922Truncated', 'British feet (Sears 1922 truncated) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetBritishSears1922', 'British feet (Sears 1922) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetClarkes', "Clarke's feet \n.. versionadded:: 3.40"),
+    ('QgsUnitTypes.FeetGoldCoast', 'Gold Coast feet \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetIndian', 'Indian (geodetic) feet \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetIndian1937', 'Indian feet (1937) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetIndian1962', 'Indian feet (1962) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetIndian1975', 'Indian feet (1975) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.FeetUSSurvey', 'US Survey feet \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksInternational', 'International links \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksBritishBenoit1895A', 'British links (Benoit 1895 A) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksBritishBenoit1895B', 'British links (Benoit 1895 B) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksBritishSears1922Truncated', 'British links (Sears 1922 truncated) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksBritishSears1922', 'British links (Sears 1922) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.LinksClarkes', "Clarke's links \n.. versionadded:: 3.40"),
+    ('QgsUnitTypes.LinksUSSurvey', 'US Survey links \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsBritishBenoit1895A', 'British yards (Benoit 1895 A) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsBritishBenoit1895B', 'British yards (Benoit 1895 B) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsBritishSears1922Truncated', 'British yards (Sears 1922 truncated) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsBritishSears1922', 'British yards (Sears 1922) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsClarkes', "Clarke's yards \n.. versionadded:: 3.40"),
+    ('QgsUnitTypes.YardsIndian', 'Indian yards \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsIndian1937', 'Indian yards (1937) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsIndian1962', 'Indian yards (1962) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.YardsIndian1975', 'Indian yards (1975) \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.MilesUSSurvey', 'US Survey miles \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.Fathoms', 'Fathoms \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.MetersGermanLegal', 'German legal meter \n.. versionadded:: 3.40'),
+    ('QgsUnitTypes.DistanceUnknownUnit', 'Unknown distance unit'),
+    ('Qgis.DistanceUnit', "Units of distance\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.DistanceUnit.\n\n.. versionadded:: 3.30\n\n* ``Meters``: Meters\n\n  Available as ``QgsUnitTypes.DistanceMeters`` in older QGIS releases.\n\n* ``Kilometers``: Kilometers\n\n  Available as ``QgsUnitTypes.DistanceKilometers`` in older QGIS releases.\n\n* ``Feet``: Imperial feet\n\n  Available as ``QgsUnitTypes.DistanceFeet`` in older QGIS releases.\n\n* ``NauticalMiles``: Nautical miles\n\n  Available as ``QgsUnitTypes.DistanceNauticalMiles`` in older QGIS releases.\n\n* ``Yards``: Imperial yards\n\n  Available as ``QgsUnitTypes.DistanceYards`` in older QGIS releases.\n\n* ``Miles``: Terrestrial miles\n\n  Available as ``QgsUnitTypes.DistanceMiles`` in older QGIS releases.\n\n* ``Degrees``: Degrees, for planar geographic CRS distance measurements\n\n  Available as ``QgsUnitTypes.DistanceDegrees`` in older QGIS releases.\n\n* ``Centimeters``: Centimeters\n\n  Available as ``QgsUnitTypes.DistanceCentimeters`` in older QGIS releases.\n\n* ``Millimeters``: Millimeters\n\n  Available as ``QgsUnitTypes.DistanceMillimeters`` in older QGIS releases.\n\n* ``Inches``: Inches\n\n  .. versionadded:: 3.32\n\n* ``ChainsInternational``: International chains\n\n  .. versionadded:: 3.40\n\n* ``ChainsBritishBenoit1895A``: British chains (Benoit 1895 A)\n\n  .. versionadded:: 3.40\n\n* ``ChainsBritishBenoit1895B``: British chains (Benoit 1895 B)\n\n  .. versionadded:: 3.40\n\n* ``ChainsBritishSears1922Truncated``: British chains (Sears 1922 truncated)\n\n  .. versionadded:: 3.40\n\n* ``ChainsBritishSears1922``: British chains (Sears 1922)\n\n  .. versionadded:: 3.40\n\n* ``ChainsClarkes``: Clarke's chains\n\n  .. versionadded:: 3.40\n\n* ``ChainsUSSurvey``: US Survey chains\n\n  .. versionadded:: 3.40\n\n* ``FeetBritish1865``: British feet (1865)\n\n  .. versionadded:: 3.40\n\n* ``FeetBritish1936``: British feet (1936)\n\n  .. versionadded:: 3.40\n\n* ``FeetBritishBenoit1895A``: British feet (Benoit 1895 A)\n\n  .. versionadded:: 3.40\n\n* ``FeetBritishBenoit1895B``: British feet (Benoit 1895 B)\n\n  .. versionadded:: 3.40\n\n* ``FeetBritishSears1922Truncated``: British feet (Sears 1922 truncated)\n\n  .. versionadded:: 3.40\n\n* ``FeetBritishSears1922``: British feet (Sears 1922)\n\n  .. versionadded:: 3.40\n\n* ``FeetClarkes``: Clarke's feet\n\n  .. versionadded:: 3.40\n\n* ``FeetGoldCoast``: Gold Coast feet\n\n  .. versionadded:: 3.40\n\n* ``FeetIndian``: Indian (geodetic) feet\n\n  .. versionadded:: 3.40\n\n* ``FeetIndian1937``: Indian feet (1937)\n\n  .. versionadded:: 3.40\n\n* ``FeetIndian1962``: Indian feet (1962)\n\n  .. versionadded:: 3.40\n\n* ``FeetIndian1975``: Indian feet (1975)\n\n  .. versionadded:: 3.40\n\n* ``FeetUSSurvey``: US Survey feet\n\n  .. versionadded:: 3.40\n\n* ``LinksInternational``: International links\n\n  .. versionadded:: 3.40\n\n* ``LinksBritishBenoit1895A``: British links (Benoit 1895 A)\n\n  .. versionadded:: 3.40\n\n* ``LinksBritishBenoit1895B``: British links (Benoit 1895 B)\n\n  .. versionadded:: 3.40\n\n* ``LinksBritishSears1922Truncated``: British links (Sears 1922 truncated)\n\n  .. versionadded:: 3.40\n\n* ``LinksBritishSears1922``: British links (Sears 1922)\n\n  .. versionadded:: 3.40\n\n* ``LinksClarkes``: Clarke's links\n\n  .. versionadded:: 3.40\n\n* ``LinksUSSurvey``: US Survey links\n\n  .. versionadded:: 3.40\n\n* ``YardsBritishBenoit1895A``: British yards (Benoit 1895 A)\n\n  .. versionadded:: 3.40\n\n* ``YardsBritishBenoit1895B``: British yards (Benoit 1895 B)\n\n  .. versionadded:: 3.40\n\n* ``YardsBritishSears1922Truncated``: British yards (Sears 1922 truncated)\n\n  .. versionadded:: 3.40\n\n* ``YardsBritishSears1922``: British yards (Sears 1922)\n\n  .. versionadded:: 3.40\n\n* ``YardsClarkes``: Clarke's yards\n\n  .. versionadded:: 3.40\n\n* ``YardsIndian``: Indian yards\n\n  .. versionadded:: 3.40\n\n* ``YardsIndian1937``: Indian yards (1937)\n\n  .. versionadded:: 3.40\n\n* ``YardsIndian1962``: Indian yards (1962)\n\n  .. versionadded:: 3.40\n\n* ``YardsIndian1975``: Indian yards (1975)\n\n  .. versionadded:: 3.40\n\n* ``MilesUSSurvey``: US Survey miles\n\n  .. versionadded:: 3.40\n\n* ``Fathoms``: Fathoms\n\n  .. versionadded:: 3.40\n\n* ``MetersGermanLegal``: German legal meter\n\n  .. versionadded:: 3.40\n\n* ``Unknown``: Unknown distance unit\n\n  Available as ``QgsUnitTypes.DistanceUnknownUnit`` in older QGIS releases.\n\n\n"),
+    ('QgsUnitTypes.Standard', 'Unit is a standard measurement unit'),
+    ('QgsUnitTypes.Geographic', 'Unit is a geographic (e.g., degree based) unit'),
+    ('QgsUnitTypes.UnknownType', 'Unknown unit type'),
+    ('Qgis.DistanceUnitType', 'Types of distance units\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.DistanceUnitType.\n\n.. versionadded:: 3.30\n\n* ``Standard``: Unit is a standard measurement unit\n* ``Geographic``: Unit is a geographic (e.g., degree based) unit\n* ``Unknown``: Unknown unit type\n\n  Available as ``QgsUnitTypes.UnknownType`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.AreaSquareMeters', 'Square meters'),
+    ('QgsUnitTypes.AreaSquareKilometers', 'Square kilometers'),
+    ('QgsUnitTypes.AreaSquareFeet', 'Square feet'),
+    ('QgsUnitTypes.AreaSquareYards', 'Square yards'),
+    ('QgsUnitTypes.AreaSquareMiles', 'Square miles'),
+    ('QgsUnitTypes.AreaHectares', 'Hectares'),
+    ('QgsUnitTypes.AreaAcres', 'Acres'),
+    ('QgsUnitTypes.AreaSquareNauticalMiles', 'Square nautical miles'),
+    ('QgsUnitTypes.AreaSquareDegrees', 'Square degrees, for planar geographic CRS area measurements'),
+    ('QgsUnitTypes.AreaSquareCentimeters', 'Square centimeters'),
+    ('QgsUnitTypes.AreaSquareMillimeters', 'Square millimeters'),
+    ('QgsUnitTypes.SquareInches', 'Square inches \n.. versionadded:: 3.32'),
+    ('QgsUnitTypes.AreaUnknownUnit', 'Unknown areal unit'),
+    ('Qgis.AreaUnit', 'Units of area\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.AreaUnit.\n\n.. versionadded:: 3.30\n\n* ``SquareMeters``: Square meters\n\n  Available as ``QgsUnitTypes.AreaSquareMeters`` in older QGIS releases.\n\n* ``SquareKilometers``: Square kilometers\n\n  Available as ``QgsUnitTypes.AreaSquareKilometers`` in older QGIS releases.\n\n* ``SquareFeet``: Square feet\n\n  Available as ``QgsUnitTypes.AreaSquareFeet`` in older QGIS releases.\n\n* ``SquareYards``: Square yards\n\n  Available as ``QgsUnitTypes.AreaSquareYards`` in older QGIS releases.\n\n* ``SquareMiles``: Square miles\n\n  Available as ``QgsUnitTypes.AreaSquareMiles`` in older QGIS releases.\n\n* ``Hectares``: Hectares\n\n  Available as ``QgsUnitTypes.AreaHectares`` in older QGIS releases.\n\n* ``Acres``: Acres\n\n  Available as ``QgsUnitTypes.AreaAcres`` in older QGIS releases.\n\n* ``SquareNauticalMiles``: Square nautical miles\n\n  Available as ``QgsUnitTypes.AreaSquareNauticalMiles`` in older QGIS releases.\n\n* ``SquareDegrees``: Square degrees, for planar geographic CRS area measurements\n\n  Available as ``QgsUnitTypes.AreaSquareDegrees`` in older QGIS releases.\n\n* ``SquareCentimeters``: Square centimeters\n\n  Available as ``QgsUnitTypes.AreaSquareCentimeters`` in older QGIS releases.\n\n* ``SquareMillimeters``: Square millimeters\n\n  Available as ``QgsUnitTypes.AreaSquareMillimeters`` in older QGIS releases.\n\n* ``SquareInches``: Square inches\n\n  .. versionadded:: 3.32\n\n* ``Unknown``: Unknown areal unit\n\n  Available as ``QgsUnitTypes.AreaUnknownUnit`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.VolumeCubicMeters', 'Cubic meters'),
+    ('QgsUnitTypes.VolumeCubicFeet', 'Cubic feet'),
+    ('QgsUnitTypes.VolumeCubicYards', 'Cubic yards'),
+    ('QgsUnitTypes.VolumeBarrel', 'Barrels'),
+    ('QgsUnitTypes.VolumeCubicDecimeter', 'Cubic decimeters'),
+    ('QgsUnitTypes.VolumeLiters', 'Litres'),
+    ('QgsUnitTypes.VolumeGallonUS', 'US Gallons'),
+    ('QgsUnitTypes.VolumeCubicInch', 'Cubic inches'),
+    ('QgsUnitTypes.VolumeCubicCentimeter', 'Cubic Centimeters'),
+    ('QgsUnitTypes.VolumeCubicDegrees', 'Cubic degrees, for planar geographic CRS volume measurements'),
+    ('QgsUnitTypes.VolumeUnknownUnit', 'Unknown volume unit'),
+    ('Qgis.VolumeUnit', 'Units of volume.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.VolumeUnit.\n\n.. versionadded:: 3.30\n\n* ``CubicMeters``: Cubic meters\n\n  Available as ``QgsUnitTypes.VolumeCubicMeters`` in older QGIS releases.\n\n* ``CubicFeet``: Cubic feet\n\n  Available as ``QgsUnitTypes.VolumeCubicFeet`` in older QGIS releases.\n\n* ``CubicYards``: Cubic yards\n\n  Available as ``QgsUnitTypes.VolumeCubicYards`` in older QGIS releases.\n\n* ``Barrel``: Barrels\n\n  Available as ``QgsUnitTypes.VolumeBarrel`` in older QGIS releases.\n\n* ``CubicDecimeter``: Cubic decimeters\n\n  Available as ``QgsUnitTypes.VolumeCubicDecimeter`` in older QGIS releases.\n\n* ``Liters``: Litres\n\n  Available as ``QgsUnitTypes.VolumeLiters`` in older QGIS releases.\n\n* ``GallonUS``: US Gallons\n\n  Available as ``QgsUnitTypes.VolumeGallonUS`` in older QGIS releases.\n\n* ``CubicInch``: Cubic inches\n\n  Available as ``QgsUnitTypes.VolumeCubicInch`` in older QGIS releases.\n\n* ``CubicCentimeter``: Cubic Centimeters\n\n  Available as ``QgsUnitTypes.VolumeCubicCentimeter`` in older QGIS releases.\n\n* ``CubicDegrees``: Cubic degrees, for planar geographic CRS volume measurements\n\n  Available as ``QgsUnitTypes.VolumeCubicDegrees`` in older QGIS releases.\n\n* ``Unknown``: Unknown volume unit\n\n  Available as ``QgsUnitTypes.VolumeUnknownUnit`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.AngleDegrees', 'Degrees'),
+    ('QgsUnitTypes.AngleRadians', 'Square kilometers'),
+    ('QgsUnitTypes.AngleGon', 'Gon/gradian'),
+    ('QgsUnitTypes.AngleMinutesOfArc', 'Minutes of arc'),
+    ('QgsUnitTypes.AngleSecondsOfArc', 'Seconds of arc'),
+    ('QgsUnitTypes.AngleTurn', 'Turn/revolutions'),
+    ('QgsUnitTypes.AngleMilliradiansSI', 'Angular milliradians (SI definition, 1/1000 of radian)'),
+    ('QgsUnitTypes.AngleMilNATO', 'Angular mil (NATO definition, 6400 mil = 2PI radians)'),
+    ('QgsUnitTypes.AngleUnknownUnit', 'Unknown angle unit'),
+    ('Qgis.AngleUnit', 'Units of angles.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.AngleUnit.\n\n.. versionadded:: 3.30\n\n* ``Degrees``: Degrees\n\n  Available as ``QgsUnitTypes.AngleDegrees`` in older QGIS releases.\n\n* ``Radians``: Square kilometers\n\n  Available as ``QgsUnitTypes.AngleRadians`` in older QGIS releases.\n\n* ``Gon``: Gon/gradian\n\n  Available as ``QgsUnitTypes.AngleGon`` in older QGIS releases.\n\n* ``MinutesOfArc``: Minutes of arc\n\n  Available as ``QgsUnitTypes.AngleMinutesOfArc`` in older QGIS releases.\n\n* ``SecondsOfArc``: Seconds of arc\n\n  Available as ``QgsUnitTypes.AngleSecondsOfArc`` in older QGIS releases.\n\n* ``Turn``: Turn/revolutions\n\n  Available as ``QgsUnitTypes.AngleTurn`` in older QGIS releases.\n\n* ``MilliradiansSI``: Angular milliradians (SI definition, 1/1000 of radian)\n\n  Available as ``QgsUnitTypes.AngleMilliradiansSI`` in older QGIS releases.\n\n* ``MilNATO``: Angular mil (NATO definition, 6400 mil = 2PI radians)\n\n  Available as ``QgsUnitTypes.AngleMilNATO`` in older QGIS releases.\n\n* ``Unknown``: Unknown angle unit\n\n  Available as ``QgsUnitTypes.AngleUnknownUnit`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.TemporalMilliseconds', 'Milliseconds'),
+    ('QgsUnitTypes.TemporalSeconds', 'Seconds'),
+    ('QgsUnitTypes.TemporalMinutes', 'Minutes'),
+    ('QgsUnitTypes.TemporalHours', 'Hours'),
+    ('QgsUnitTypes.TemporalDays', 'Days'),
+    ('QgsUnitTypes.TemporalWeeks', 'Weeks'),
+    ('QgsUnitTypes.TemporalMonths', 'Months'),
+    ('QgsUnitTypes.TemporalYears', 'Years'),
+    ('QgsUnitTypes.TemporalDecades', 'Decades'),
+    ('QgsUnitTypes.TemporalCenturies', 'Centuries'),
+    ('QgsUnitTypes.TemporalIrregularStep', "Special 'irregular step' time unit, used for temporal data which uses irregular, non-real-world unit steps \n.. versionadded:: 3.20"),
+    ('QgsUnitTypes.TemporalUnknownUnit', 'Unknown time unit'),
+    ('Qgis.TemporalUnit', "Temporal units.\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.TemporalUnit.\n\n.. versionadded:: 3.30\n\n* ``Milliseconds``: Milliseconds\n\n  Available as ``QgsUnitTypes.TemporalMilliseconds`` in older QGIS releases.\n\n* ``Seconds``: Seconds\n\n  Available as ``QgsUnitTypes.TemporalSeconds`` in older QGIS releases.\n\n* ``Minutes``: Minutes\n\n  Available as ``QgsUnitTypes.TemporalMinutes`` in older QGIS releases.\n\n* ``Hours``: Hours\n\n  Available as ``QgsUnitTypes.TemporalHours`` in older QGIS releases.\n\n* ``Days``: Days\n\n  Available as ``QgsUnitTypes.TemporalDays`` in older QGIS releases.\n\n* ``Weeks``: Weeks\n\n  Available as ``QgsUnitTypes.TemporalWeeks`` in older QGIS releases.\n\n* ``Months``: Months\n\n  Available as ``QgsUnitTypes.TemporalMonths`` in older QGIS releases.\n\n* ``Years``: Years\n\n  Available as ``QgsUnitTypes.TemporalYears`` in older QGIS releases.\n\n* ``Decades``: Decades\n\n  Available as ``QgsUnitTypes.TemporalDecades`` in older QGIS releases.\n\n* ``Centuries``: Centuries\n\n  Available as ``QgsUnitTypes.TemporalCenturies`` in older QGIS releases.\n\n* ``IrregularStep``: Special 'irregular step' time unit, used for temporal data which uses irregular, non-real-world unit steps\n\n  .. versionadded:: 3.20\n\n\n  Available as ``QgsUnitTypes.TemporalIrregularStep`` in older QGIS releases.\n\n* ``Unknown``: Unknown time unit\n\n  Available as ``QgsUnitTypes.TemporalUnknownUnit`` in older QGIS releases.\n\n\n"),
+    ('QgsUnitTypes.RenderMillimeters', 'Millimeters'),
+    ('QgsUnitTypes.RenderMapUnits', 'Map units'),
+    ('QgsUnitTypes.RenderPixels', 'Pixels'),
+    ('QgsUnitTypes.RenderPercentage', 'Percentage of another measurement (e.g., canvas size, feature size)'),
+    ('QgsUnitTypes.RenderPoints', 'Points (e.g., for font sizes)'),
+    ('QgsUnitTypes.RenderInches', 'Inches'),
+    ('QgsUnitTypes.RenderUnknownUnit', 'Mixed or unknown units'),
+    ('QgsUnitTypes.RenderMetersInMapUnits', 'Meters value as Map units'),
+    ('Qgis.RenderUnit', 'Rendering size units\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.RenderUnit.\n\n.. versionadded:: 3.30\n\n* ``Millimeters``: Millimeters\n\n  Available as ``QgsUnitTypes.RenderMillimeters`` in older QGIS releases.\n\n* ``MapUnits``: Map units\n\n  Available as ``QgsUnitTypes.RenderMapUnits`` in older QGIS releases.\n\n* ``Pixels``: Pixels\n\n  Available as ``QgsUnitTypes.RenderPixels`` in older QGIS releases.\n\n* ``Percentage``: Percentage of another measurement (e.g., canvas size, feature size)\n\n  Available as ``QgsUnitTypes.RenderPercentage`` in older QGIS releases.\n\n* ``Points``: Points (e.g., for font sizes)\n\n  Available as ``QgsUnitTypes.RenderPoints`` in older QGIS releases.\n\n* ``Inches``: Inches\n\n  Available as ``QgsUnitTypes.RenderInches`` in older QGIS releases.\n\n* ``Unknown``: Mixed or unknown units\n\n  Available as ``QgsUnitTypes.RenderUnknownUnit`` in older QGIS releases.\n\n* ``MetersInMapUnits``: Meters value as Map units\n\n  Available as ``QgsUnitTypes.RenderMetersInMapUnits`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.LayoutMillimeters', 'Millimeters'),
+    ('QgsUnitTypes.LayoutCentimeters', 'Centimeters'),
+    ('QgsUnitTypes.LayoutMeters', 'Meters'),
+    ('QgsUnitTypes.LayoutInches', 'Inches'),
+    ('QgsUnitTypes.LayoutFeet', 'Feet'),
+    ('QgsUnitTypes.LayoutPoints', 'Typographic points'),
+    ('QgsUnitTypes.LayoutPicas', 'Typographic picas'),
+    ('QgsUnitTypes.LayoutPixels', 'Pixels'),
+    ('Qgis.LayoutUnit', 'Layout measurement units\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.LayoutUnit.\n\n.. versionadded:: 3.30\n\n* ``Millimeters``: Millimeters\n\n  Available as ``QgsUnitTypes.LayoutMillimeters`` in older QGIS releases.\n\n* ``Centimeters``: Centimeters\n\n  Available as ``QgsUnitTypes.LayoutCentimeters`` in older QGIS releases.\n\n* ``Meters``: Meters\n\n  Available as ``QgsUnitTypes.LayoutMeters`` in older QGIS releases.\n\n* ``Inches``: Inches\n\n  Available as ``QgsUnitTypes.LayoutInches`` in older QGIS releases.\n\n* ``Feet``: Feet\n\n  Available as ``QgsUnitTypes.LayoutFeet`` in older QGIS releases.\n\n* ``Points``: Typographic points\n\n  Available as ``QgsUnitTypes.LayoutPoints`` in older QGIS releases.\n\n* ``Picas``: Typographic picas\n\n  Available as ``QgsUnitTypes.LayoutPicas`` in older QGIS releases.\n\n* ``Pixels``: Pixels\n\n  Available as ``QgsUnitTypes.LayoutPixels`` in older QGIS releases.\n\n\n'),
+    ('QgsUnitTypes.LayoutPaperUnits', 'Unit is a paper based measurement unit'),
+    ('QgsUnitTypes.LayoutScreenUnits', 'Unit is a screen based measurement unit'),
+    ('Qgis.LayoutUnitType', 'Types of layout units\n\n.. note::\n\n   Prior to QGIS 3.30 this was available as :py:class:`QgsUnitTypes`.LayoutUnitType.\n\n.. versionadded:: 3.30\n\n* ``PaperUnits``: Unit is a paper based measurement unit\n\n  Available as ``QgsUnitTypes.LayoutPaperUnits`` in older QGIS releases.\n\n* ``ScreenUnits``: Unit is a screen based measurement unit\n\n  Available as ``QgsUnitTypes.LayoutScreenUnits`` in older QGIS releases.\n\n\n'),
+    ('QgsLayoutRenderContext.FlagDebug', 'Debug/testing mode, items are drawn as solid rectangles.'),
+    ('QgsLayoutRenderContext.FlagOutlineOnly', 'Render items as outlines only.'),
+    ('QgsLayoutRenderContext.FlagAntialiasing', 'Use antialiasing when drawing items.'),
+    ('QgsLayoutRenderContext.FlagUseAdvancedEffects', 'Enable advanced effects such as blend modes. \n.. deprecated:: 3.44. Use rasterizedRenderingPolicy() instead.'),
+    ('QgsLayoutRenderContext.FlagForceVectorOutput', 'Force output in vector format where possible, even if items require rasterization to keep their correct appearance. \n.. deprecated:: 3.44. Use rasterizedRenderingPolicy() instead.'),
+    ('QgsLayoutRenderContext.FlagHideCoverageLayer', 'Hide coverage layer in outputs'),
+    ('QgsLayoutRenderContext.FlagDrawSelection', 'Draw selection'),
+    ('QgsLayoutRenderContext.FlagDisableTiledRasterLayerRenders', 'If set, then raster layers will not be drawn as separate tiles. This may improve the appearance in exported files, at the cost of much higher memory usage during exports.'),
+    ('QgsLayoutRenderContext.FlagRenderLabelsByMapLayer', 'When rendering map items to multi-layered exports, render labels belonging to different layers into separate export layers'),
+    ('QgsLayoutRenderContext.FlagLosslessImageRendering', 'Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF).'),
+    ('QgsLayoutRenderContext.FlagSynchronousLegendGraphics', 'Query legend graphics synchronously.'),
+    ('QgsLayoutRenderContext.FlagAlwaysUseGlobalMasks', 'When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex layout exports in all current Qt versions. This flag only applies to vector layout exports. \n.. versionadded:: 3.38'),
+    ('Qgis.LayoutRenderFlag', 'Flags for controlling how a layout is rendered.\n\n.. note::\n\n   Prior to QGIS 3.44 this was available as :py:class:`QgsLayoutRenderContext`.Flag\n\n.. versionadded:: 3.44\n\n* ``Debug``: Debug/testing mode, items are drawn as solid rectangles.\n\n  Available as ``QgsLayoutRenderContext.FlagDebug`` in older QGIS releases.\n\n* ``OutlineOnly``: Render items as outlines only.\n\n  Available as ``QgsLayoutRenderContext.FlagOutlineOnly`` in older QGIS releases.\n\n* ``Antialiasing``: Use antialiasing when drawing items.\n\n  Available as ``QgsLayoutRenderContext.FlagAntialiasing`` in older QGIS releases.\n\n* ``UseAdvancedEffects``: Enable advanced effects such as blend modes.\n\n  .. deprecated:: 3.44. Use rasterizedRenderingPolicy() instead.\n\n\n  Available as ``QgsLayoutRenderContext.FlagUseAdvancedEffects`` in older QGIS releases.\n\n* ``ForceVectorOutput``: Force output in vector format where possible, even if items require rasterization to keep their correct appearance.\n\n  .. deprecated:: 3.44. Use rasterizedRenderingPolicy() instead.\n\n\n  Available as ``QgsLayoutRenderContext.FlagForceVectorOutput`` in older QGIS releases.\n\n* ``HideCoverageLayer``: Hide coverage layer in outputs\n\n  Available as ``QgsLayoutRenderContext.FlagHideCoverageLayer`` in older QGIS releases.\n\n* ``DrawSelection``: Draw selection\n\n  Available as ``QgsLayoutRenderContext.FlagDrawSelection`` in older QGIS releases.\n\n* ``DisableTiledRasterLayerRenders``: If set, then raster layers will not be drawn as separate tiles. This may improve the appearance in exported files, at the cost of much higher memory usage during exports.\n\n  Available as ``QgsLayoutRenderContext.FlagDisableTiledRasterLayerRenders`` in older QGIS releases.\n\n* ``RenderLabelsByMapLayer``: When rendering map items to multi-layered exports, render labels belonging to different layers into separate export layers\n\n  Available as ``QgsLayoutRenderContext.FlagRenderLabelsByMapLayer`` in older QGIS releases.\n\n* ``LosslessImageRendering``: Render images losslessly whenever possible, instead of the default lossy jpeg rendering used for some destination devices (e.g. PDF).\n\n  Available as ``QgsLayoutRenderContext.FlagLosslessImageRendering`` in older QGIS releases.\n\n* ``SynchronousLegendGraphics``: Query legend graphics synchronously.\n\n  Available as ``QgsLayoutRenderContext.FlagSynchronousLegendGraphics`` in older QGIS releases.\n\n* ``AlwaysUseGlobalMasks``: When applying clipping paths for selective masking, always use global ("entire map") paths, instead of calculating local clipping paths per rendered feature. This results in considerably more complex layout exports in all current Qt versions. This flag only applies to vector layout exports.\n\n  .. versionadded:: 3.38\n\n\n  Available as ``QgsLayoutRenderContext.FlagAlwaysUseGlobalMasks`` in older QGIS releases.\n\n\n'),
+    ('QgsLayoutItemPicture.FormatSVG', 'SVG image'),
+    ('QgsLayoutItemPicture.FormatRaster', 'Raster image'),
+    ('QgsLayoutItemPicture.FormatUnknown', 'Invalid or unknown image type'),
+    ('Qgis.PictureFormat', 'Picture formats.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsLayoutItemPicture`.Format.\n\n.. versionadded:: 3.40\n\n* ``SVG``: SVG image\n\n  Available as ``QgsLayoutItemPicture.FormatSVG`` in older QGIS releases.\n\n* ``Raster``: Raster image\n\n  Available as ``QgsLayoutItemPicture.FormatRaster`` in older QGIS releases.\n\n* ``Unknown``: Invalid or unknown image type\n\n  Available as ``QgsLayoutItemPicture.FormatUnknown`` in older QGIS releases.\n\n\n'),
+    ('Qgis.ScaleCalculationMethod.HorizontalTop', 'Calculate horizontally, across top of map'),
+    ('Qgis.ScaleCalculationMethod.HorizontalMiddle', 'Calculate horizontally, across midle of map'),
+    ('Qgis.ScaleCalculationMethod.HorizontalBottom', 'Calculate horizontally, across bottom of map'),
+    ('Qgis.ScaleCalculationMethod.HorizontalAverage', 'Calculate horizontally, using the average of the top, middle and bottom scales'),
+    ('Qgis.ScaleCalculationMethod.AtEquator', 'Always calculate the scale at the equator, regardless of the actual visible map extent. This method can be used to provide a consistent, static scale for maps in geographic reference systems, regardless of the latitudes actually visible in the map (permitting consistent appearance of these maps when rendering relies on scale based visibility or calculations). This method is only applicable when calculating scales with a degree based reference system. \n.. versionadded:: 3.44'),
+    ('Qgis.ScaleCalculationMethod', 'Scale calculation logic.\n\n.. versionadded:: 3.40\n\n* ``HorizontalTop``: Calculate horizontally, across top of map\n* ``HorizontalMiddle``: Calculate horizontally, across midle of map\n* ``HorizontalBottom``: Calculate horizontally, across bottom of map\n* ``HorizontalAverage``: Calculate horizontally, using the average of the top, middle and bottom scales\n* ``AtEquator``: Always calculate the scale at the equator, regardless of the actual visible map extent. This method can be used to provide a consistent, static scale for maps in geographic reference systems, regardless of the latitudes actually visible in the map (permitting consistent appearance of these maps when rendering relies on scale based visibility or calculations). This method is only applicable when calculating scales with a degree based reference system.\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('QgsScaleBarSettings.AlignLeft', 'Left aligned'),
+    ('QgsScaleBarSettings.AlignMiddle', 'Center aligned'),
+    ('QgsScaleBarSettings.AlignRight', 'Right aligned'),
+    ('Qgis.ScaleBarAlignment', 'Scalebar alignment.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsScaleBarSettings`.Alignment.\n\n.. versionadded:: 3.40\n\n* ``Left``: Left aligned\n\n  Available as ``QgsScaleBarSettings.AlignLeft`` in older QGIS releases.\n\n* ``Middle``: Center aligned\n\n  Available as ``QgsScaleBarSettings.AlignMiddle`` in older QGIS releases.\n\n* ``Right``: Right aligned\n\n  Available as ``QgsScaleBarSettings.AlignRight`` in older QGIS releases.\n\n\n'),
+    ('QgsScaleBarSettings.SegmentSizeFixed', 'Scale bar segment size is fixed to a map unit'),
+    ('QgsScaleBarSettings.SegmentSizeFitWidth', 'Scale bar segment size is calculated to fit a size range'),
+    ('Qgis.ScaleBarSegmentSizeMode', 'Modes for setting size for scale bar segments.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsScaleBarSettings`.SegmentSizeMode.\n\n.. versionadded:: 3.40\n\n* ``Fixed``: Scale bar segment size is fixed to a map unit\n\n  Available as ``QgsScaleBarSettings.SegmentSizeFixed`` in older QGIS releases.\n\n* ``FitWidth``: Scale bar segment size is calculated to fit a size range\n\n  Available as ``QgsScaleBarSettings.SegmentSizeFitWidth`` in older QGIS releases.\n\n\n'),
+    ('QgsScaleBarSettings.LabelAboveSegment', 'Labels are drawn above the scalebar'),
+    ('QgsScaleBarSettings.LabelBelowSegment', 'Labels are drawn below the scalebar'),
+    ('Qgis.ScaleBarDistanceLabelVerticalPlacement', 'Scale bar distance label vertical placement.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsScaleBarSettings`.LabelVerticalPlacement.\n\n.. versionadded:: 3.40\n\n* ``AboveSegment``: Labels are drawn above the scalebar\n\n  Available as ``QgsScaleBarSettings.LabelAboveSegment`` in older QGIS releases.\n\n* ``BelowSegment``: Labels are drawn below the scalebar\n\n  Available as ``QgsScaleBarSettings.LabelBelowSegment`` in older QGIS releases.\n\n\n'),
+    ('QgsScaleBarSettings.LabelCenteredEdge', "Labels are drawn centered relative to segment's edge"),
+    ('QgsScaleBarSettings.LabelCenteredSegment', 'Labels are drawn centered relative to segment'),
+    ('Qgis.ScaleBarDistanceLabelHorizontalPlacement', "Scale bar distance label horizontal placement.\n\n.. note::\n\n   Prior to QGIS 3.40 this was available as :py:class:`QgsScaleBarSettings`.LabelHorizontalPlacement.\n\n.. versionadded:: 3.40\n\n* ``CenteredEdge``: Labels are drawn centered relative to segment's edge\n\n  Available as ``QgsScaleBarSettings.LabelCenteredEdge`` in older QGIS releases.\n\n* ``CenteredSegment``: Labels are drawn centered relative to segment\n\n  Available as ``QgsScaleBarSettings.LabelCenteredSegment`` in older QGIS releases.\n\n\n"),
+    ('Qgis.InputControllerType.Map2D', '2D map controller'),
+    ('Qgis.InputControllerType.Map3D', '3D map controller'),
+    ('Qgis.InputControllerType', 'Input controller types.\n\n.. versionadded:: 3.34\n\n* ``Map2D``: 2D map controller\n* ``Map3D``: 3D map controller\n\n'),
+    ('Qgis.PostgresRelKind.NotSet', 'Not set'),
+    ('Qgis.PostgresRelKind.Unknown', 'Unknown'),
+    ('Qgis.PostgresRelKind.OrdinaryTable', 'Ordinary table'),
+    ('Qgis.PostgresRelKind.Index', 'Index'),
+    ('Qgis.PostgresRelKind.Sequence', 'Sequence'),
+    ('Qgis.PostgresRelKind.View', 'View'),
+    ('Qgis.PostgresRelKind.MaterializedView', 'Materialized view'),
+    ('Qgis.PostgresRelKind.CompositeType', 'Composition type'),
+    ('Qgis.PostgresRelKind.ToastTable', 'TOAST table'),
+    ('Qgis.PostgresRelKind.ForeignTable', 'Foreign table'),
+    ('Qgis.PostgresRelKind.PartitionedTable', 'Partitioned table'),
+    ('Qgis.PostgresRelKind', 'Postgres database relkind options.\n\n.. versionadded:: 3.32\n\n* ``NotSet``: Not set\n* ``Unknown``: Unknown\n* ``OrdinaryTable``: Ordinary table\n* ``Index``: Index\n* ``Sequence``: Sequence\n* ``View``: View\n* ``MaterializedView``: Materialized view\n* ``CompositeType``: Composition type\n* ``ToastTable``: TOAST table\n* ``ForeignTable``: Foreign table\n* ``PartitionedTable``: Partitioned table\n\n'),
+    ('Qgis.DatabaseProviderConnectionCapability2.SetFieldComment', 'Can set comments for fields via setFieldComment()'),
+    ('Qgis.DatabaseProviderConnectionCapability2.SetFieldAlias', 'Can set aliases for fields via setFieldAlias()'),
+    ('Qgis.DatabaseProviderConnectionCapability2.SetTableComment', 'Can set comments for tables via setTableComment() \n.. versionadded:: 3.44'),
+    ('Qgis.DatabaseProviderConnectionCapability2', 'The Capability enum represents the extended operations supported by the connection.\n\n.. versionadded:: 3.32\n\n* ``SetFieldComment``: Can set comments for fields via setFieldComment()\n* ``SetFieldAlias``: Can set aliases for fields via setFieldAlias()\n* ``SetTableComment``: Can set comments for tables via setTableComment()\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('Qgis.DatabaseProviderTableImportCapability.SetGeometryColumnName', 'Can set the name of the geometry column'),
+    ('Qgis.DatabaseProviderTableImportCapability.SetPrimaryKeyName', 'Can set the name of the primary key column'),
+    ('Qgis.DatabaseProviderTableImportCapability', 'Represents capabilities of a database provider connection when importing table data.\n\n.. versionadded:: 3.44\n\n* ``SetGeometryColumnName``: Can set the name of the geometry column\n* ``SetPrimaryKeyName``: Can set the name of the primary key column\n\n'),
+    ('Qgis.ProviderStyleStorageCapability.SaveToDatabase', ''),
+    ('Qgis.ProviderStyleStorageCapability.LoadFromDatabase', ''),
+    ('Qgis.ProviderStyleStorageCapability.DeleteFromDatabase', ''),
+    ('Qgis.ProviderStyleStorageCapability', 'The StorageCapability enum represents the style storage operations supported by the provider.\n\n.. versionadded:: 3.34\n\n* ``SaveToDatabase``: \n* ``LoadFromDatabase``: \n* ``DeleteFromDatabase``: \n\n'),
+    ('Qgis.UserProfileSelectionPolicy.LastProfile', 'Open the last closed profile (only mode supported prior to QGIS 3.32)'),
+    ('Qgis.UserProfileSelectionPolicy.DefaultProfile', 'Open a specific profile'),
+    ('Qgis.UserProfileSelectionPolicy.AskUser', 'Let the user choose which profile to open'),
+    ('Qgis.UserProfileSelectionPolicy', 'User profile selection policy.\n\n.. versionadded:: 3.32\n\n* ``LastProfile``: Open the last closed profile (only mode supported prior to QGIS 3.32)\n* ``DefaultProfile``: Open a specific profile\n* ``AskUser``: Let the user choose which profile to open\n\n'),
+    ('QgsAttributeEditorElement.AeTypeContainer', 'A container'),
+    ('QgsAttributeEditorElement.AeTypeField', 'A field'),
+    ('QgsAttributeEditorElement.AeTypeRelation', 'A relation'),
+    ('QgsAttributeEditorElement.AeTypeQmlElement', 'A QML element'),
+    ('QgsAttributeEditorElement.AeTypeHtmlElement', 'A HTML element'),
+    ('QgsAttributeEditorElement.AeTypeAction', 'A layer action element \n.. versionadded:: 3.22'),
+    ('QgsAttributeEditorElement.AeTypeTextElement', 'A text element \n.. versionadded:: 3.30'),
+    ('QgsAttributeEditorElement.AeTypeSpacerElement', 'A spacer element \n.. versionadded:: 3.30'),
+    ('QgsAttributeEditorElement.AeTypeInvalid', 'Invalid'),
+    ('Qgis.AttributeEditorType', 'Attribute editor types.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsAttributeEditorElement`.AttributeEditorType.\n\n.. versionadded:: 3.32\n\n* ``Container``: A container\n\n  Available as ``QgsAttributeEditorElement.AeTypeContainer`` in older QGIS releases.\n\n* ``Field``: A field\n\n  Available as ``QgsAttributeEditorElement.AeTypeField`` in older QGIS releases.\n\n* ``Relation``: A relation\n\n  Available as ``QgsAttributeEditorElement.AeTypeRelation`` in older QGIS releases.\n\n* ``QmlElement``: A QML element\n\n  Available as ``QgsAttributeEditorElement.AeTypeQmlElement`` in older QGIS releases.\n\n* ``HtmlElement``: A HTML element\n\n  Available as ``QgsAttributeEditorElement.AeTypeHtmlElement`` in older QGIS releases.\n\n* ``Action``: A layer action element\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsAttributeEditorElement.AeTypeAction`` in older QGIS releases.\n\n* ``TextElement``: A text element\n\n  .. versionadded:: 3.30\n\n\n  Available as ``QgsAttributeEditorElement.AeTypeTextElement`` in older QGIS releases.\n\n* ``SpacerElement``: A spacer element\n\n  .. versionadded:: 3.30\n\n\n  Available as ``QgsAttributeEditorElement.AeTypeSpacerElement`` in older QGIS releases.\n\n* ``Invalid``: Invalid\n\n  Available as ``QgsAttributeEditorElement.AeTypeInvalid`` in older QGIS releases.\n\n\n'),
+    ('Qgis.AttributeEditorContainerType.GroupBox', 'A group box'),
+    ('Qgis.AttributeEditorContainerType.Tab', 'A tab widget'),
+    ('Qgis.AttributeEditorContainerType.Row', 'A row of editors (horizontal layout)'),
+    ('Qgis.AttributeEditorContainerType', 'Attribute editor container types.\n\n.. versionadded:: 3.32\n\n* ``GroupBox``: A group box\n* ``Tab``: A tab widget\n* ``Row``: A row of editors (horizontal layout)\n\n'),
+    ('QgsEditFormConfig.GeneratedLayout', 'Autogenerate a simple tabular layout for the form'),
+    ('QgsEditFormConfig.TabLayout', '"Drag and drop" layout. Needs to be configured.'),
+    ('QgsEditFormConfig.UiFileLayout', 'Load a .ui file for the layout. Needs to be configured.'),
+    ('Qgis.AttributeFormLayout', 'Available form types for layout of the attribute form editor.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsEditFormConfig`.EditorLayout.\n\n.. versionadded:: 3.32\n\n* ``AutoGenerated``: Autogenerate a simple tabular layout for the form\n\n  Available as ``QgsEditFormConfig.GeneratedLayout`` in older QGIS releases.\n\n* ``DragAndDrop``: "Drag and drop" layout. Needs to be configured.\n\n  Available as ``QgsEditFormConfig.TabLayout`` in older QGIS releases.\n\n* ``UiFile``: Load a .ui file for the layout. Needs to be configured.\n\n  Available as ``QgsEditFormConfig.UiFileLayout`` in older QGIS releases.\n\n\n'),
+    ('QgsEditFormConfig.SuppressDefault', 'Use the application-wide setting.'),
+    ('QgsEditFormConfig.SuppressOn', 'Always suppress feature form.'),
+    ('QgsEditFormConfig.SuppressOff', 'Never suppress feature form.'),
+    ('Qgis.AttributeFormSuppression', 'Available form types for layout of the attribute form editor.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsEditFormConfig`.FeatureFormSuppress.\n\n.. versionadded:: 3.32\n\n* ``Default``: Use the application-wide setting.\n\n  Available as ``QgsEditFormConfig.SuppressDefault`` in older QGIS releases.\n\n* ``On``: Always suppress feature form.\n\n  Available as ``QgsEditFormConfig.SuppressOn`` in older QGIS releases.\n\n* ``Off``: Never suppress feature form.\n\n  Available as ``QgsEditFormConfig.SuppressOff`` in older QGIS releases.\n\n\n'),
+    ('QgsEditFormConfig.CodeSourceNone', 'Do not use Python code at all'),
+    ('QgsEditFormConfig.CodeSourceFile', 'Load the Python code from an external file'),
+    ('QgsEditFormConfig.CodeSourceDialog', 'Use the Python code provided in the dialog'),
+    ('QgsEditFormConfig.CodeSourceEnvironment', 'Use the Python code available in the Python environment'),
+    ('Qgis.AttributeFormPythonInitCodeSource', 'The Python init code source for attribute forms.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsEditFormConfig`.PythonInitCodeSource.\n\n.. versionadded:: 3.32\n\n* ``NoSource``: Do not use Python code at all\n\n  Available as ``QgsEditFormConfig.CodeSourceNone`` in older QGIS releases.\n\n* ``File``: Load the Python code from an external file\n\n  Available as ``QgsEditFormConfig.CodeSourceFile`` in older QGIS releases.\n\n* ``Dialog``: Use the Python code provided in the dialog\n\n  Available as ``QgsEditFormConfig.CodeSourceDialog`` in older QGIS releases.\n\n* ``Environment``: Use the Python code available in the Python environment\n\n  Available as ``QgsEditFormConfig.CodeSourceEnvironment`` in older QGIS releases.\n\n\n'),
+    ('Qgis.ExpressionType.Qgis', 'Native QGIS expression'),
+    ('Qgis.ExpressionType.PointCloud', 'Point cloud expression'),
+    ('Qgis.ExpressionType.RasterCalculator', 'Raster calculator expression \n.. versionadded:: 3.34'),
+    ('Qgis.ExpressionType', 'Expression types\n\n.. versionadded:: 3.32\n\n* ``Qgis``: Native QGIS expression\n* ``PointCloud``: Point cloud expression\n* ``RasterCalculator``: Raster calculator expression\n\n  .. versionadded:: 3.34\n\n\n'),
+    ('QgsVectorFileWriter.NoSymbology', 'Export only data'),
+    ('QgsVectorFileWriter.FeatureSymbology', 'Keeps the number of features and export symbology per feature'),
+    ('QgsVectorFileWriter.SymbolLayerSymbology', 'Exports one feature per symbol layer (considering symbol levels)'),
+    ('Qgis.FeatureSymbologyExport', 'Options for exporting features considering their symbology.\n\n.. note::\n\n   Prior to QGIS 3.32 this was available as :py:class:`QgsVectorFileWriter`.SymbologyExport.\n\n.. versionadded:: 3.32\n\n* ``NoSymbology``: Export only data\n* ``PerFeature``: Keeps the number of features and export symbology per feature\n\n  Available as ``QgsVectorFileWriter.FeatureSymbology`` in older QGIS releases.\n\n* ``PerSymbolLayer``: Exports one feature per symbol layer (considering symbol levels)\n\n  Available as ``QgsVectorFileWriter.SymbolLayerSymbology`` in older QGIS releases.\n\n\n'),
+    ('Qgis.VectorTileProviderFlag.AlwaysUseTileMatrixSetFromProvider', 'Vector tile layer must always use the tile matrix set from the data provider, and should never store, restore or override the definition of this matrix set.'),
+    ('Qgis.VectorTileProviderFlag', 'Flags for vector tile data providers.\n\n.. versionadded:: 3.32\n\n* ``AlwaysUseTileMatrixSetFromProvider``: Vector tile layer must always use the tile matrix set from the data provider, and should never store, restore or override the definition of this matrix set.\n\n'),
+    ('Qgis.VectorTileProviderCapability.ReadLayerMetadata', 'Provider can read layer metadata from data store. See QgsDataProvider.layerMetadata()'),
+    ('Qgis.VectorTileProviderCapability', 'Enumeration with capabilities that vector tile data providers might implement.\n\n.. versionadded:: 3.32\n\n* ``ReadLayerMetadata``: Provider can read layer metadata from data store. See QgsDataProvider.layerMetadata()\n\n'),
+    ('Qgis.TileAvailability.Available', 'Tile is available within the matrix'),
+    ('Qgis.TileAvailability.NotAvailable', 'Tile is not available within the matrix, e.g. there is no content for the tile'),
+    ('Qgis.TileAvailability.AvailableNoChildren', "Tile is available within the matrix, and is known to have no children (ie no higher zoom level tiles exist covering this tile's region)"),
+    ('Qgis.TileAvailability.UseLowerZoomLevelTile', 'Tile is not available at the requested zoom level, it should be replaced by a tile from a lower zoom level instead182'),
+    ('Qgis.TileAvailability', "Possible availability states for a tile within a tile matrix.\n\n.. versionadded:: 3.32\n\n* ``Available``: Tile is available within the matrix\n* ``NotAvailable``: Tile is not available within the matrix, e.g. there is no content for the tile\n* ``AvailableNoChildren``: Tile is available within the matrix, and is known to have no children (ie no higher zoom level tiles exist covering this tile's region)\n* ``UseLowerZoomLevelTile``: Tile is not available at the requested zoom level, it should be replaced by a tile from a lower zoom level instead182\n\n"),
+    ('Qgis.TiledSceneProviderCapability.ReadLayerMetadata', 'Provider can read layer metadata from data store. See QgsDataProvider.layerMetadata()'),
+    ('Qgis.TiledSceneProviderCapability', 'Tiled scene data provider capabilities.\n\n.. versionadded:: 3.34\n\n* ``ReadLayerMetadata``: Provider can read layer metadata from data store. See QgsDataProvider.layerMetadata()\n\n'),
+    ('Qgis.TiledSceneBoundingVolumeType.Region', 'Region type'),
+    ('Qgis.TiledSceneBoundingVolumeType.OrientedBox', 'Oriented bounding box (rotated box)'),
+    ('Qgis.TiledSceneBoundingVolumeType.Sphere', 'Sphere'),
+    ('Qgis.TiledSceneBoundingVolumeType', 'Tiled scene bounding volume types.\n\n.. versionadded:: 3.34\n\n* ``Region``: Region type\n* ``OrientedBox``: Oriented bounding box (rotated box)\n* ``Sphere``: Sphere\n\n'),
+    ('Qgis.TileRefinementProcess.Replacement', 'When tile is refined then its children should be used in place of itself.'),
+    ('Qgis.TileRefinementProcess.Additive', 'When tile is refined its content should be used alongside its children simultaneously.'),
+    ('Qgis.TileRefinementProcess', 'Tiled scene tile refinement processes.\n\nRefinement determines the process by which a lower resolution parent tile\nrenders when its higher resolution children are selected to be rendered.\n\n.. versionadded:: 3.34\n\n* ``Replacement``: When tile is refined then its children should be used in place of itself.\n* ``Additive``: When tile is refined its content should be used alongside its children simultaneously.\n\n'),
+    ('Qgis.TileChildrenAvailability.NoChildren', 'Tile is known to have no children'),
+    ('Qgis.TileChildrenAvailability.Available', 'Tile children are already available'),
+    ('Qgis.TileChildrenAvailability.NeedFetching', 'Tile has children, but they are not yet available and must be fetched'),
+    ('Qgis.TileChildrenAvailability', "Possible availability states for a tile's children.\n\n.. versionadded:: 3.34\n\n* ``NoChildren``: Tile is known to have no children\n* ``Available``: Tile children are already available\n* ``NeedFetching``: Tile has children, but they are not yet available and must be fetched\n\n"),
+    ('Qgis.TiledSceneRequestFlag.NoHierarchyFetch', 'Do not allow hierarchy fetching when hierarchy is not currently available. Avoids network requests, but may result in an incomplete tile set. If set, then callers will need to manually perform hierarchy fetches as required.'),
+    ('Qgis.TiledSceneRequestFlag', 'Flags which control how tiled scene requests behave.\n\n.. versionadded:: 3.34\n\n* ``NoHierarchyFetch``: Do not allow hierarchy fetching when hierarchy is not currently available. Avoids network requests, but may result in an incomplete tile set. If set, then callers will need to manually perform hierarchy fetches as required.\n\n'),
+    ('Qgis.TiledSceneRendererFlag.RequiresTextures', 'Renderer requires textures'),
+    ('Qgis.TiledSceneRendererFlag.ForceRasterRender', 'Layer should always be rendered as a raster image'),
+    ('Qgis.TiledSceneRendererFlag.RendersTriangles', 'Renderer can render triangle primitives'),
+    ('Qgis.TiledSceneRendererFlag.RendersLines', 'Renderer can render line primitives'),
+    ('Qgis.TiledSceneRendererFlag', 'Flags which control how tiled scene 2D renderers behave.\n\n.. versionadded:: 3.34\n\n* ``RequiresTextures``: Renderer requires textures\n* ``ForceRasterRender``: Layer should always be rendered as a raster image\n* ``RendersTriangles``: Renderer can render triangle primitives\n* ``RendersLines``: Renderer can render line primitives\n\n'),
+    ('Qgis.GdalResampleAlgorithm.RA_NearestNeighbour', 'Nearest neighbour (select on one input pixel)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Bilinear', 'Bilinear (2x2 kernel)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Cubic', 'Cubic Convolution Approximation (4x4 kernel)'),
+    ('Qgis.GdalResampleAlgorithm.RA_CubicSpline', 'Cubic B-Spline Approximation (4x4 kernel)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Lanczos', 'Lanczos windowed sinc interpolation (6x6 kernel)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Average', 'Average (computes the average of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Mode', 'Mode (selects the value which appears most often of all the sampled points)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Max', 'Maximum (selects the maximum of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Min', 'Minimum (selects the minimum of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Median', 'Median (selects the median of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Q1', 'First quartile (selects the first quartile of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm.RA_Q3', 'Third quartile (selects the third quartile of all non-NODATA contributing pixels)'),
+    ('Qgis.GdalResampleAlgorithm', "Resampling algorithm to be used (equivalent to GDAL's enum GDALResampleAlg)\n\n.. note::\n\n   RA_Max, RA_Min, RA_Median, RA_Q1 and RA_Q3 are available on GDAL >= 2.0 builds only\n\n.. versionadded:: 3.34\n\n* ``RA_NearestNeighbour``: Nearest neighbour (select on one input pixel)\n* ``RA_Bilinear``: Bilinear (2x2 kernel)\n* ``RA_Cubic``: Cubic Convolution Approximation (4x4 kernel)\n* ``RA_CubicSpline``: Cubic B-Spline Approximation (4x4 kernel)\n* ``RA_Lanczos``: Lanczos windowed sinc interpolation (6x6 kernel)\n* ``RA_Average``: Average (computes the average of all non-NODATA contributing pixels)\n* ``RA_Mode``: Mode (selects the value which appears most often of all the sampled points)\n* ``RA_Max``: Maximum (selects the maximum of all non-NODATA contributing pixels)\n* ``RA_Min``: Minimum (selects the minimum of all non-NODATA contributing pixels)\n* ``RA_Median``: Median (selects the median of all non-NODATA contributing pixels)\n* ``RA_Q1``: First quartile (selects the first quartile of all non-NODATA contributing pixels)\n* ``RA_Q3``: Third quartile (selects the third quartile of all non-NODATA contributing pixels)\n\n"),
+    ('Qgis.VsiHandlerType.Invalid', 'Invalid type, i.e. not a valid VSI handler'),
+    ('Qgis.VsiHandlerType.Archive', 'File archive type (e.g. vsizip)'),
+    ('Qgis.VsiHandlerType.Network', 'Generic network types (e.g. vsicurl)'),
+    ('Qgis.VsiHandlerType.Cloud', 'Specific cloud provider types (e.g. vsis3)'),
+    ('Qgis.VsiHandlerType.Memory', 'In-memory types (e.g. vsimem)'),
+    ('Qgis.VsiHandlerType.Other', 'All other types'),
+    ('Qgis.VsiHandlerType', 'GDAL VSI handler types.\n\n.. versionadded:: 3.40\n\n* ``Invalid``: Invalid type, i.e. not a valid VSI handler\n* ``Archive``: File archive type (e.g. vsizip)\n* ``Network``: Generic network types (e.g. vsicurl)\n* ``Cloud``: Specific cloud provider types (e.g. vsis3)\n* ``Memory``: In-memory types (e.g. vsimem)\n* ``Other``: All other types\n\n'),
+    ('Qgis.ZonalStatistic.Count', 'Pixel count'),
+    ('Qgis.ZonalStatistic.Sum', 'Sum of pixel values'),
+    ('Qgis.ZonalStatistic.Mean', 'Mean of pixel values'),
+    ('Qgis.ZonalStatistic.Median', 'Median of pixel values'),
+    ('Qgis.ZonalStatistic.StDev', 'Standard deviation of pixel values'),
+    ('Qgis.ZonalStatistic.Min', 'Min of pixel values'),
+    ('Qgis.ZonalStatistic.Max', 'Max of pixel values'),
+    ('Qgis.ZonalStatistic.Range', 'Range of pixel values (max - min)'),
+    ('Qgis.ZonalStatistic.Minority', 'Minority of pixel values'),
+    ('Qgis.ZonalStatistic.Majority', 'Majority of pixel values'),
+    ('Qgis.ZonalStatistic.Variety', 'Variety (count of distinct) pixel values'),
+    ('Qgis.ZonalStatistic.Variance', 'Variance of pixel values'),
+    ('Qgis.ZonalStatistic.MinimumPoint', 'Pixel centroid for minimum pixel value \n.. versionadded:: 3.42'),
+    ('Qgis.ZonalStatistic.MaximumPoint', 'Pixel centroid for maximum pixel value \n.. versionadded:: 3.42'),
+    ('Qgis.ZonalStatistic.All', 'All statistics. For QGIS 3.x this includes ONLY numeric statistics, but for 4.0 this will be extended to included non-numeric statistics. Consider using AllNumeric instead.'),
+    ('Qgis.ZonalStatistic.AllNumeric', 'All numeric statistics \n.. versionadded:: 3.42'),
+    ('Qgis.ZonalStatistic.Default', 'Default statistics'),
+    ('Qgis.ZonalStatistic', 'Statistics to be calculated during a zonal statistics operation.\n\n.. versionadded:: 3.36.\n\n* ``Count``: Pixel count\n* ``Sum``: Sum of pixel values\n* ``Mean``: Mean of pixel values\n* ``Median``: Median of pixel values\n* ``StDev``: Standard deviation of pixel values\n* ``Min``: Min of pixel values\n* ``Max``: Max of pixel values\n* ``Range``: Range of pixel values (max - min)\n* ``Minority``: Minority of pixel values\n* ``Majority``: Majority of pixel values\n* ``Variety``: Variety (count of distinct) pixel values\n* ``Variance``: Variance of pixel values\n* ``MinimumPoint``: Pixel centroid for minimum pixel value\n\n  .. versionadded:: 3.42\n\n* ``MaximumPoint``: Pixel centroid for maximum pixel value\n\n  .. versionadded:: 3.42\n\n* ``All``: All statistics. For QGIS 3.x this includes ONLY numeric statistics, but for 4.0 this will be extended to included non-numeric statistics. Consider using AllNumeric instead.\n* ``AllNumeric``: All numeric statistics\n\n  .. versionadded:: 3.42\n\n* ``Default``: Default statistics\n\n'),
+    ('Qgis.ZonalStatisticResult.Success', 'Success'),
+    ('Qgis.ZonalStatisticResult.LayerTypeWrong', 'Layer is not a polygon layer'),
+    ('Qgis.ZonalStatisticResult.LayerInvalid', 'Layer is invalid'),
+    ('Qgis.ZonalStatisticResult.RasterInvalid', 'Raster layer is invalid'),
+    ('Qgis.ZonalStatisticResult.RasterBandInvalid', 'The raster band does not exist on the raster layer'),
+    ('Qgis.ZonalStatisticResult.FailedToCreateField', 'Output fields could not be created'),
+    ('Qgis.ZonalStatisticResult.Canceled', 'Algorithm was canceled'),
+    ('Qgis.ZonalStatisticResult', 'Zonal statistics result codes.\n\n.. versionadded:: 3.36.\n\n* ``Success``: Success\n* ``LayerTypeWrong``: Layer is not a polygon layer\n* ``LayerInvalid``: Layer is invalid\n* ``RasterInvalid``: Raster layer is invalid\n* ``RasterBandInvalid``: The raster band does not exist on the raster layer\n* ``FailedToCreateField``: Output fields could not be created\n* ``Canceled``: Algorithm was canceled\n\n'),
+    ('QgsAggregateCalculator.Count', 'Count'),
+    ('QgsAggregateCalculator.CountDistinct', 'Number of distinct values'),
+    ('QgsAggregateCalculator.CountMissing', 'Number of missing (null) values'),
+    ('QgsAggregateCalculator.Min', 'Min of values'),
+    ('QgsAggregateCalculator.Max', 'Max of values'),
+    ('QgsAggregateCalculator.Sum', 'Sum of values'),
+    ('QgsAggregateCalculator.Mean', 'Mean of values (numeric fields only)'),
+    ('QgsAggregateCalculator.Median', 'Median of values (numeric fields only)'),
+    ('QgsAggregateCalculator.StDev', 'Standard deviation of values (numeric fields only)'),
+    ('QgsAggregateCalculator.StDevSample', 'Sample standard deviation of values (numeric fields only)'),
+    ('QgsAggregateCalculator.Range', 'Range of values (max - min) (numeric and datetime fields only)'),
+    ('QgsAggregateCalculator.Minority', 'Minority of values'),
+    ('QgsAggregateCalculator.Majority', 'Majority of values'),
+    ('QgsAggregateCalculator.FirstQuartile', 'First quartile (numeric fields only)'),
+    ('QgsAggregateCalculator.ThirdQuartile', 'Third quartile (numeric fields only)'),
+    ('QgsAggregateCalculator.InterQuartileRange', 'Inter quartile range (IQR) (numeric fields only)'),
+    ('QgsAggregateCalculator.StringMinimumLength', 'Minimum length of string (string fields only)'),
+    ('QgsAggregateCalculator.StringMaximumLength', 'Maximum length of string (string fields only)'),
+    ('QgsAggregateCalculator.StringConcatenate', 'Concatenate values with a joining string (string fields only). Specify the delimiter using setDelimiter().'),
+    ('QgsAggregateCalculator.GeometryCollect', 'Create a multipart geometry from aggregated geometries'),
+    ('QgsAggregateCalculator.ArrayAggregate', 'Create an array of values'),
+    ('QgsAggregateCalculator.StringConcatenateUnique', 'Concatenate unique values with a joining string (string fields only). Specify the delimiter using setDelimiter().'),
+    ('Qgis.Aggregate', 'Available aggregates to calculate. Not all aggregates are available for all field\ntypes.\n\n.. versionadded:: 3.36.\n\n* ``Count``: Count\n* ``CountDistinct``: Number of distinct values\n* ``CountMissing``: Number of missing (null) values\n* ``Min``: Min of values\n* ``Max``: Max of values\n* ``Sum``: Sum of values\n* ``Mean``: Mean of values (numeric fields only)\n* ``Median``: Median of values (numeric fields only)\n* ``StDev``: Standard deviation of values (numeric fields only)\n* ``StDevSample``: Sample standard deviation of values (numeric fields only)\n* ``Range``: Range of values (max - min) (numeric and datetime fields only)\n* ``Minority``: Minority of values\n* ``Majority``: Majority of values\n* ``FirstQuartile``: First quartile (numeric fields only)\n* ``ThirdQuartile``: Third quartile (numeric fields only)\n* ``InterQuartileRange``: Inter quartile range (IQR) (numeric fields only)\n* ``StringMinimumLength``: Minimum length of string (string fields only)\n* ``StringMaximumLength``: Maximum length of string (string fields only)\n* ``StringConcatenate``: Concatenate values with a joining string (string fields only). Specify the delimiter using setDelimiter().\n* ``GeometryCollect``: Create a multipart geometry from aggregated geometries\n* ``ArrayAggregate``: Create an array of values\n* ``StringConcatenateUnique``: Concatenate unique values with a joining string (string fields only). Specify the delimiter using setDelimiter().\n\n'),
+    ('QgsStatisticalSummary.Count', 'Count'),
+    ('QgsStatisticalSummary.CountMissing', 'Number of missing (null) values'),
+    ('QgsStatisticalSummary.Sum', 'Sum of values'),
+    ('QgsStatisticalSummary.Mean', 'Mean of values'),
+    ('QgsStatisticalSummary.Median', 'Median of values'),
+    ('QgsStatisticalSummary.StDev', 'Standard deviation of values'),
+    ('QgsStatisticalSummary.StDevSample', 'Sample standard deviation of values'),
+    ('QgsStatisticalSummary.Min', 'Min of values'),
+    ('QgsStatisticalSummary.Max', 'Max of values'),
+    ('QgsStatisticalSummary.Range', 'Range of values (max - min)'),
+    ('QgsStatisticalSummary.Minority', 'Minority of values'),
+    ('QgsStatisticalSummary.Majority', 'Majority of values'),
+    ('QgsStatisticalSummary.Variety', 'Variety (count of distinct) values'),
+    ('QgsStatisticalSummary.FirstQuartile', 'First quartile'),
+    ('QgsStatisticalSummary.ThirdQuartile', 'Third quartile'),
+    ('QgsStatisticalSummary.InterQuartileRange', 'Inter quartile range (IQR)'),
+    ('QgsStatisticalSummary.First', 'First value \n.. versionadded:: 3.6'),
+    ('QgsStatisticalSummary.Last', 'Last value \n.. versionadded:: 3.6'),
+    ('QgsStatisticalSummary.All', 'All statistics'),
+    ('Qgis.Statistic', 'Available generic statistics.\n\n.. versionadded:: 3.36.\n\n* ``Count``: Count\n* ``CountMissing``: Number of missing (null) values\n* ``Sum``: Sum of values\n* ``Mean``: Mean of values\n* ``Median``: Median of values\n* ``StDev``: Standard deviation of values\n* ``StDevSample``: Sample standard deviation of values\n* ``Min``: Min of values\n* ``Max``: Max of values\n* ``Range``: Range of values (max - min)\n* ``Minority``: Minority of values\n* ``Majority``: Majority of values\n* ``Variety``: Variety (count of distinct) values\n* ``FirstQuartile``: First quartile\n* ``ThirdQuartile``: Third quartile\n* ``InterQuartileRange``: Inter quartile range (IQR)\n* ``First``: First value\n\n  .. versionadded:: 3.6\n\n* ``Last``: Last value\n\n  .. versionadded:: 3.6\n\n* ``All``: All statistics\n\n'),
+    ('QgsDateTimeStatisticalSummary.Count', 'Count'),
+    ('QgsDateTimeStatisticalSummary.CountDistinct', 'Number of distinct datetime values'),
+    ('QgsDateTimeStatisticalSummary.CountMissing', 'Number of missing (null) values'),
+    ('QgsDateTimeStatisticalSummary.Min', 'Minimum (earliest) datetime value'),
+    ('QgsDateTimeStatisticalSummary.Max', 'Maximum (latest) datetime value'),
+    ('QgsDateTimeStatisticalSummary.Range', 'Interval between earliest and latest datetime value'),
+    ('QgsDateTimeStatisticalSummary.All', 'All statistics'),
+    ('Qgis.DateTimeStatistic', 'Available date/time statistics.\n\n.. versionadded:: 3.36.\n\n* ``Count``: Count\n* ``CountDistinct``: Number of distinct datetime values\n* ``CountMissing``: Number of missing (null) values\n* ``Min``: Minimum (earliest) datetime value\n* ``Max``: Maximum (latest) datetime value\n* ``Range``: Interval between earliest and latest datetime value\n* ``All``: All statistics\n\n'),
+    ('QgsStringStatisticalSummary.Count', 'Count'),
+    ('QgsStringStatisticalSummary.CountDistinct', 'Number of distinct string values'),
+    ('QgsStringStatisticalSummary.CountMissing', 'Number of missing (null) values'),
+    ('QgsStringStatisticalSummary.Min', 'Minimum string value'),
+    ('QgsStringStatisticalSummary.Max', 'Maximum string value'),
+    ('QgsStringStatisticalSummary.MinimumLength', 'Minimum length of string'),
+    ('QgsStringStatisticalSummary.MaximumLength', 'Maximum length of string'),
+    ('QgsStringStatisticalSummary.MeanLength', 'Mean length of strings'),
+    ('QgsStringStatisticalSummary.Minority', 'Minority of strings'),
+    ('QgsStringStatisticalSummary.Majority', 'Majority of strings'),
+    ('QgsStringStatisticalSummary.All', 'All statistics'),
+    ('Qgis.StringStatistic', 'Available string statistics.\n\n.. versionadded:: 3.36.\n\n* ``Count``: Count\n* ``CountDistinct``: Number of distinct string values\n* ``CountMissing``: Number of missing (null) values\n* ``Min``: Minimum string value\n* ``Max``: Maximum string value\n* ``MinimumLength``: Minimum length of string\n* ``MaximumLength``: Maximum length of string\n* ``MeanLength``: Mean length of strings\n* ``Minority``: Minority of strings\n* ``Majority``: Majority of strings\n* ``All``: All statistics\n\n'),
+    ('QgsRasterBandStats.NoStatistic', 'No statistic'),
+    ('QgsRasterBandStats.Min', 'Minimum'),
+    ('QgsRasterBandStats.Max', 'Maximum'),
+    ('QgsRasterBandStats.Range', 'Range'),
+    ('QgsRasterBandStats.Sum', 'Sum'),
+    ('QgsRasterBandStats.Mean', 'Mean'),
+    ('QgsRasterBandStats.StdDev', 'Standard deviation'),
+    ('QgsRasterBandStats.SumOfSquares', 'Sum of squares'),
+    ('QgsRasterBandStats.All', 'All available statistics'),
+    ('Qgis.RasterBandStatistic', 'Available raster band statistics.\n\n.. versionadded:: 3.36.\n\n* ``NoStatistic``: No statistic\n* ``Min``: Minimum\n* ``Max``: Maximum\n* ``Range``: Range\n* ``Sum``: Sum\n* ``Mean``: Mean\n* ``StdDev``: Standard deviation\n* ``SumOfSquares``: Sum of squares\n* ``All``: All available statistics\n\n'),
+    ('Qgis.SensorThingsEntity.Invalid', 'An invalid/unknown entity'),
+    ('Qgis.SensorThingsEntity.Thing', 'A Thing is an object of the physical world (physical things) or the information world (virtual things) that is capable of being identified and integrated into communication networks'),
+    ('Qgis.SensorThingsEntity.Location', 'A Location entity locates the Thing or the Things it associated with. A Thing’s Location entity is defined as the last known location of the Thing'),
+    ('Qgis.SensorThingsEntity.HistoricalLocation', 'A Thing’s HistoricalLocation entity set provides the times of the current (i.e., last known) and previous locations of the Thing'),
+    ('Qgis.SensorThingsEntity.Datastream', 'A Datastream groups a collection of Observations measuring the same ObservedProperty and produced by the same Sensor'),
+    ('Qgis.SensorThingsEntity.Sensor', 'A Sensor is an instrument that observes a property or phenomenon with the goal of producing an estimate of the value of the property'),
+    ('Qgis.SensorThingsEntity.ObservedProperty', 'An ObservedProperty specifies the phenomenon of an Observation'),
+    ('Qgis.SensorThingsEntity.Observation', 'An Observation is the act of measuring or otherwise determining the value of a property'),
+    ('Qgis.SensorThingsEntity.FeatureOfInterest', 'In the context of the Internet of Things, many Observations’ FeatureOfInterest can be the Location of the Thing. For example, the FeatureOfInterest of a wifi-connect thermostat can be the Location of the thermostat (i.e., the living room where the thermostat is located in). In the case of remote sensing, the FeatureOfInterest can be the geographical area or volume that is being sensed'),
+    ('Qgis.SensorThingsEntity.MultiDatastream', 'A MultiDatastream groups a collection of Observations and the Observations in a MultiDatastream have a complex result type. Implemented in the SensorThings version 1.1 "MultiDatastream extension". \n.. versionadded:: 3.38'),
+    ('Qgis.SensorThingsEntity', 'OGC SensorThings API entity types.\n\n.. versionadded:: 3.36\n\n* ``Invalid``: An invalid/unknown entity\n* ``Thing``: A Thing is an object of the physical world (physical things) or the information world (virtual things) that is capable of being identified and integrated into communication networks\n* ``Location``: A Location entity locates the Thing or the Things it associated with. A Thing’s Location entity is defined as the last known location of the Thing\n* ``HistoricalLocation``: A Thing’s HistoricalLocation entity set provides the times of the current (i.e., last known) and previous locations of the Thing\n* ``Datastream``: A Datastream groups a collection of Observations measuring the same ObservedProperty and produced by the same Sensor\n* ``Sensor``: A Sensor is an instrument that observes a property or phenomenon with the goal of producing an estimate of the value of the property\n* ``ObservedProperty``: An ObservedProperty specifies the phenomenon of an Observation\n* ``Observation``: An Observation is the act of measuring or otherwise determining the value of a property\n* ``FeatureOfInterest``: In the context of the Internet of Things, many Observations’ FeatureOfInterest can be the Location of the Thing. For example, the FeatureOfInterest of a wifi-connect thermostat can be the Location of the thermostat (i.e., the living room where the thermostat is located in). In the case of remote sensing, the FeatureOfInterest can be the geographical area or volume that is being sensed\n* ``MultiDatastream``: A MultiDatastream groups a collection of Observations and the Observations in a MultiDatastream have a complex result type. Implemented in the SensorThings version 1.1 "MultiDatastream extension".\n\n  .. versionadded:: 3.38\n\n\n'),
+    ('Qgis.ColorModel.Rgb', 'RGB color model'),
+    ('Qgis.ColorModel.Cmyk', 'CMYK color model'),
+    ('Qgis.ColorModel', 'Color model types\n\n.. versionadded:: 3.40\n\n* ``Rgb``: RGB color model\n* ``Cmyk``: CMYK color model\n\n'),
+    ('Qgis.DocumentationApi.PyQgis', 'PyQgis API documentation'),
+    ('Qgis.DocumentationApi.PyQgisSearch', 'Search in PyQgis API documentation'),
+    ('Qgis.DocumentationApi.CppQgis', 'C++ QGIS API documentation'),
+    ('Qgis.DocumentationApi.Qt', 'Qt API documentation'),
+    ('Qgis.DocumentationApi', 'Documentation API\n\n.. versionadded:: 3.42\n\n* ``PyQgis``: PyQgis API documentation\n* ``PyQgisSearch``: Search in PyQgis API documentation\n* ``CppQgis``: C++ QGIS API documentation\n* ``Qt``: Qt API documentation\n\n'),
+    ('Qgis.DocumentationBrowser.DeveloperToolsPanel', 'Embedded webview in the DevTools panel'),
+    ('Qgis.DocumentationBrowser.SystemWebBrowser', 'Default system web browser'),
+    ('Qgis.DocumentationBrowser', 'Documentation API browser\n\n.. versionadded:: 3.42\n\n* ``DeveloperToolsPanel``: Embedded webview in the DevTools panel\n* ``SystemWebBrowser``: Default system web browser\n\n'),
+    ('Qgis.MouseHandlesAction.MoveItem', 'Move item'),
+    ('Qgis.MouseHandlesAction.ResizeUp', 'Resize up (Top handle)'),
+    ('Qgis.MouseHandlesAction.ResizeDown', 'Resize down (Bottom handle)'),
+    ('Qgis.MouseHandlesAction.ResizeLeft', 'Resize left (Left handle)'),
+    ('Qgis.MouseHandlesAction.ResizeRight', 'Resize right (Right handle)'),
+    ('Qgis.MouseHandlesAction.ResizeLeftUp', 'Resize left up (Top left handle)'),
+    ('Qgis.MouseHandlesAction.ResizeRightUp', 'Resize right up (Top right handle)'),
+    ('Qgis.MouseHandlesAction.ResizeLeftDown', 'Resize left down (Bottom left handle)'),
+    ('Qgis.MouseHandlesAction.ResizeRightDown', 'Resize right down (Bottom right handle)'),
+    ('Qgis.MouseHandlesAction.SelectItem', 'Select item'),
+    ('Qgis.MouseHandlesAction.NoAction', 'No action'),
+    ('Qgis.MouseHandlesAction', 'Action to be performed by the mouse handles\n\n.. versionadded:: 3.42\n\n* ``MoveItem``: Move item\n* ``ResizeUp``: Resize up (Top handle)\n* ``ResizeDown``: Resize down (Bottom handle)\n* ``ResizeLeft``: Resize left (Left handle)\n* ``ResizeRight``: Resize right (Right handle)\n* ``ResizeLeftUp``: Resize left up (Top left handle)\n* ``ResizeRightUp``: Resize right up (Top right handle)\n* ``ResizeLeftDown``: Resize left down (Bottom left handle)\n* ``ResizeRightDown``: Resize right down (Bottom right handle)\n* ``SelectItem``: Select item\n* ``NoAction``: No action\n\n'),
+    ('Qgis.MeshRangeLimit.NotSet', 'User defined'),
+    ('Qgis.MeshRangeLimit.MinimumMaximum', 'Real min-max values'),
+    ('Qgis.MeshRangeLimit', 'Describes the limits used to compute mesh ranges (min/max values).\n\n.. versionadded:: 3.42\n\n* ``NotSet``: User defined\n* ``MinimumMaximum``: Real min-max values\n\n'),
+    ('Qgis.MeshRangeExtent.WholeMesh', 'Whole mesh is used to compute statistics'),
+    ('Qgis.MeshRangeExtent.FixedCanvas', 'Current extent of the canvas (at the time of computation) is used to compute statistics'),
+    ('Qgis.MeshRangeExtent.UpdatedCanvas', 'Constantly updated extent of the canvas is used to compute statistics'),
+    ('Qgis.MeshRangeExtent', 'Describes the extent used to compute mesh ranges (min/max values).\n\n.. versionadded:: 3.42\n\n* ``WholeMesh``: Whole mesh is used to compute statistics\n* ``FixedCanvas``: Current extent of the canvas (at the time of computation) is used to compute statistics\n* ``UpdatedCanvas``: Constantly updated extent of the canvas is used to compute statistics\n\n'),
+    ('Qgis.PointCloudAccessType.Local', 'Local means the source is a local file on the machine'),
+    ('Qgis.PointCloudAccessType.Remote', "Remote means it's loaded through a protocol like HTTP"),
+    ('Qgis.PointCloudAccessType', "The access type of the data, local is for local files and remote for remote files (over HTTP).\n\n.. seealso:: :py:class:`QgsPointCloudIndex`\n\n.. versionadded:: 3.42\n\n* ``Local``: Local means the source is a local file on the machine\n* ``Remote``: Remote means it's loaded through a protocol like HTTP\n\n"),
+    ('Qgis.PointCloudZoomOutRenderBehavior.RenderExtents', 'Render only point cloud extents when zoomed out'),
+    ('Qgis.PointCloudZoomOutRenderBehavior.RenderOverview', 'Render overview point cloud when zoomed out'),
+    ('Qgis.PointCloudZoomOutRenderBehavior.RenderOverviewAndExtents', 'Render point cloud extents over overview point cloud'),
+    ('Qgis.PointCloudZoomOutRenderBehavior', 'Point cloud zoom out options\n\n.. versionadded:: 3.42\n\n* ``RenderExtents``: Render only point cloud extents when zoomed out\n* ``RenderOverview``: Render overview point cloud when zoomed out\n* ``RenderOverviewAndExtents``: Render point cloud extents over overview point cloud\n\n'),
+    ('Qgis.SegmentCalculationMethod.Standard', 'Standard sagitta-based calculation'),
+    ('Qgis.SegmentCalculationMethod.Adaptive', 'Adaptive calculation based on radius size'),
+    ('Qgis.SegmentCalculationMethod.AreaError', 'Calculation based on area error'),
+    ('Qgis.SegmentCalculationMethod.ConstantDensity', 'Simple calculation with constant segment density'),
+    ('Qgis.SegmentCalculationMethod', 'brief Method used to calculate the number of segments for circle approximation\n\n.. versionadded:: 3.44\n\n* ``Standard``: Standard sagitta-based calculation\n* ``Adaptive``: Adaptive calculation based on radius size\n* ``AreaError``: Calculation based on area error\n* ``ConstantDensity``: Simple calculation with constant segment density\n\n'),
+    ('Qgis.StacObjectType.Unknown', 'Type is not known'),
+    ('Qgis.StacObjectType.Catalog', 'STAC catalog'),
+    ('Qgis.StacObjectType.Collection', 'STAC collection'),
+    ('Qgis.StacObjectType.Item', 'STAC item'),
+    ('Qgis.StacObjectType', 'Available types of stac objects\n\n.. versionadded:: 3.44\n\n* ``Unknown``: Type is not known\n* ``Catalog``: STAC catalog\n* ``Collection``: STAC collection\n* ``Item``: STAC item\n\n'),
+    ('QgsAbstract3DSymbol.PropertyHeight', 'Height (altitude)'),
+    ('QgsAbstract3DSymbol.PropertyExtrusionHeight', 'Extrusion height (zero means no extrusion)'),
+    ('QgsAbstract3DSymbol.Property', 'Data definable properties.\n\n* ``Height``: Height (altitude)\n\n  Available as ``QgsAbstract3DSymbol.PropertyHeight`` in older QGIS releases.\n\n* ``ExtrusionHeight``: Extrusion height (zero means no extrusion)\n\n  Available as ``QgsAbstract3DSymbol.PropertyExtrusionHeight`` in older QGIS releases.\n\n\n'),
+    ('QgsAbstractDatabaseProviderConnection.Aspatial', 'Aspatial table (it does not contain any geometry column)'),
+    ('QgsAbstractDatabaseProviderConnection.Vector', 'Vector table (it does contain one geometry column)'),
+    ('QgsAbstractDatabaseProviderConnection.Raster', 'Raster table'),
+    ('QgsAbstractDatabaseProviderConnection.View', 'View table'),
+    ('QgsAbstractDatabaseProviderConnection.MaterializedView', 'Materialized view table'),
+    ('QgsAbstractDatabaseProviderConnection.Foreign', 'Foreign data wrapper'),
+    ('QgsAbstractDatabaseProviderConnection.IncludeSystemTables', 'Include system tables \n.. versionadded:: 3.30'),
+    ('QgsAbstractDatabaseProviderConnection.TableFlag', 'Flags for table properties.\n\nFlags can be useful for filtering the tables returned\nfrom :py:func:`~QgsAbstractDatabaseProviderConnection.tables`.\n\n* ``Aspatial``: Aspatial table (it does not contain any geometry column)\n* ``Vector``: Vector table (it does contain one geometry column)\n* ``Raster``: Raster table\n* ``View``: View table\n* ``MaterializedView``: Materialized view table\n* ``Foreign``: Foreign data wrapper\n* ``IncludeSystemTables``: Include system tables\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions', 'The SqlVectorLayerOptions stores all information required to create a SQL (query) layer.\n\n.. seealso:: :py:func:`createSqlVectorLayer`\n\n.. versionadded:: 3.22'),
+    ('QgsAbstractDatabaseProviderConnection.SpatialIndexOptions', 'The SpatialIndexOptions contains extra options relating to spatial index creation.\n\n.. versionadded:: 3.14'),
+    ('QgsAbstractDatabaseProviderConnection.VectorLayerExporterOptions', 'Stores all information required to create a :py:class:`QgsVectorLayerExporter` for the backend.\n\n.. seealso:: :py:func:`createVectorLayerExporterDestinationUri`\n\n.. versionadded:: 3.44'),
+    ('QgsAbstractDatabaseProviderConnection.QueryResult', 'The QueryResult class represents the result of a query executed by :py:func:`~QgsAbstractDatabaseProviderConnection.execSql`\n\nIt encapsulates an iterator over the result rows and a list of the column names.\n\nRows can be retrieved by iterating over the result with :py:func:`~QgsAbstractDatabaseProviderConnection.hasNextRow` and :py:func:`~QgsAbstractDatabaseProviderConnection.nextRow`\nor by calling :py:func:`~QgsAbstractDatabaseProviderConnection.rows` that will internally iterate over the results and return\nthe whole result list.\n\n.. versionadded:: 3.18'),
+    ('QgsAbstractDatabaseProviderConnection.TableProperty', 'The TableProperty class represents a database table or view.\n\nIn case the table is a vector spatial table and it has multiple\ngeometry columns, separate entries for each geometry column must\nbe created.\n\nIn case the table is a vector spatial table and the geometry column\ncan contain multiple geometry types and/or CRSs, a clone of the property\nfor the individual geometry type/CRS can be retrieved with at(i)'),
+    ('QgsAbstractDatabaseProviderConnection.TableProperty.GeometryColumnType', 'The GeometryColumnType struct represents the combination\nof geometry type and CRS for the table geometry column.'),
+    ('QgsMetadataSearchContext', 'Metadata search context\n\n.. versionadded:: 3.28'),
+    ('QgsAbstractMetadataBase.Address', 'Metadata address structure.\n\n.. versionadded:: 3.2'),
+    ('QgsAbstractMetadataBase.Contact', 'Metadata contact structure.\n\n.. versionadded:: 3.2'),
+    ('QgsAbstractMetadataBase.Link', 'Metadata link structure.\n\n.. versionadded:: 3.2'),
+    ('QgsAbstractProfileResults.Feature', 'Encapsulates information about a feature exported from the profile results.\n\n.. versionadded:: 3.32'),
+    ('QgsAbstractSensor.SensorData', 'Contains details of a sensor data capture'),
+    ('QgsAbstractValidityCheck.TypeLayoutCheck', 'Print layout validity check, triggered on exporting a print layout'),
+    ('QgsAbstractValidityCheck.TypeUserCheck', 'Starting point for custom user types'),
+    ('QgsAbstractValidityCheck.Type', 'Check types\n\n* ``LayoutCheck``: Print layout validity check, triggered on exporting a print layout\n\n  Available as ``QgsAbstractValidityCheck.TypeLayoutCheck`` in older QGIS releases.\n\n* ``UserCheck``: Starting point for custom user types\n\n  Available as ``QgsAbstractValidityCheck.TypeUserCheck`` in older QGIS releases.\n\n\n'),
+    ('QgsAggregateCalculator.AggregateInfo', 'Structured information about the available aggregates.'),
+    ('QgsAggregateCalculator.AggregateParameters', 'A bundle of parameters controlling aggregate calculation'),
+    ('QgsAlignRasterData.RasterItem', 'Definition of one raster layer for alignment'),
+    ('QgsAbstractAnnotationItemEditOperation.Type.MoveNode', 'Move a node'),
+    ('QgsAbstractAnnotationItemEditOperation.Type.DeleteNode', 'Delete a node'),
+    ('QgsAbstractAnnotationItemEditOperation.Type.AddNode', 'Add a node'),
+    ('QgsAbstractAnnotationItemEditOperation.Type.TranslateItem', 'Translate (move) an item'),
+    ('QgsAbstractAnnotationItemEditOperation.Type', 'Operation type\n\n* ``MoveNode``: Move a node\n* ``DeleteNode``: Delete a node\n* ``AddNode``: Add a node\n* ``TranslateItem``: Translate (move) an item\n\n'),
+    ('QgsAnnotationLayer.LayerOptions', 'Setting options for loading annotation layers.\n\n.. versionadded:: 3.16'),
+    ('QgsArcGisRestUtils.FeatureToJsonFlag.IncludeGeometry', 'Whether to include the geometry definition'),
+    ('QgsArcGisRestUtils.FeatureToJsonFlag.IncludeNonObjectIdAttributes', 'Whether to include any non-objectId attributes'),
+    ('QgsArcGisRestUtils.FeatureToJsonFlag.SkipUnsetAttributes', 'Skip unset attributes. \n.. versionadded:: 3.44'),
+    ('QgsArcGisRestUtils.FeatureToJsonFlag', 'Flags which control the behavior of converting features to JSON.\n\n.. versionadded:: 3.28\n\n* ``IncludeGeometry``: Whether to include the geometry definition\n* ``IncludeNonObjectIdAttributes``: Whether to include any non-objectId attributes\n* ``SkipUnsetAttributes``: Skip unset attributes.\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('QgsAttributeEditorElement.LabelStyle', 'The TabStyle struct defines color and font overrides for form fields, tabs and groups labels.\n\n.. versionadded:: 3.26'),
+    ('QgsAttributeTableConfig.ColumnConfig', 'Defines the configuration of a column in the attribute table.'),
+    ('QgsAuthConfigurationStorage.MasterPasswordConfig', 'Structure that holds the (encrypted) master password elements.'),
+    ('QgsAuthConfigurationStorage.SettingParameter', 'Storage configuration setting parameter.'),
+    ('QgsBlockingNetworkRequest.RequestFlag.EmptyResponseIsValid', 'Do not generate an error if getting an empty response (e.g. HTTP 204)'),
+    ('QgsBlockingNetworkRequest.RequestFlag', 'Request flags\n\n.. versionadded:: 3.40\n\n* ``EmptyResponseIsValid``: Do not generate an error if getting an empty response (e.g. HTTP 204)\n\n'),
+    ('QgsBookmarkManagerModel.RoleExtent', 'Bookmark extent as a QgsReferencedRectangle'),
+    ('QgsBookmarkManagerModel.RoleName', 'Bookmark name'),
+    ('QgsBookmarkManagerModel.RoleId', 'Bookmark ID'),
+    ('QgsBookmarkManagerModel.RoleGroup', 'Bookmark group'),
+    ('QgsBookmarkManagerModel.RoleRotation', 'Bookmark map rotation'),
+    ('QgsBookmarkManagerModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsBookmarkManagerModel.CustomRoles\n\n.. versionadded:: 3.36\n\n* ``Extent``: Bookmark extent as a QgsReferencedRectangle\n\n  Available as ``QgsBookmarkManagerModel.RoleExtent`` in older QGIS releases.\n\n* ``Name``: Bookmark name\n\n  Available as ``QgsBookmarkManagerModel.RoleName`` in older QGIS releases.\n\n* ``Id``: Bookmark ID\n\n  Available as ``QgsBookmarkManagerModel.RoleId`` in older QGIS releases.\n\n* ``Group``: Bookmark group\n\n  Available as ``QgsBookmarkManagerModel.RoleGroup`` in older QGIS releases.\n\n* ``Rotation``: Bookmark map rotation\n\n  Available as ``QgsBookmarkManagerModel.RoleRotation`` in older QGIS releases.\n\n\n'),
+    ('QgsBrowserModel.PathRole', 'Item path used to access path in the tree, see QgsDataItem.mPath'),
+    ('QgsBrowserModel.CommentRole', 'Item comment'),
+    ('QgsBrowserModel.SortRole', 'Custom sort role, see QgsDataItem.sortKey()'),
+    ('QgsBrowserModel.ProviderKeyRole', 'Data item provider key that created the item, see QgsDataItem.providerKey() \n.. versionadded:: 3.12'),
+    ('QgsBrowserModel.LayerMetadataRole', ''),
+    ('QgsBrowserModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsBrowserModel.ItemDataRole\n\n.. versionadded:: 3.36\n\n* ``Path``: Item path used to access path in the tree, see QgsDataItem.mPath\n\n  Available as ``QgsBrowserModel.PathRole`` in older QGIS releases.\n\n* ``Comment``: Item comment\n\n  Available as ``QgsBrowserModel.CommentRole`` in older QGIS releases.\n\n* ``Sort``: Custom sort role, see QgsDataItem.sortKey()\n\n  Available as ``QgsBrowserModel.SortRole`` in older QGIS releases.\n\n* ``ProviderKey``: Data item provider key that created the item, see QgsDataItem.providerKey()\n\n  .. versionadded:: 3.12\n\n\n  Available as ``QgsBrowserModel.ProviderKeyRole`` in older QGIS releases.\n\n* ``LayerMetadata``: \n\n  Available as ``QgsBrowserModel.LayerMetadataRole`` in older QGIS releases.\n\n\n'),
+    ('QgsCallout.MinimumCalloutLength', 'Minimum length of callouts'),
+    ('QgsCallout.OffsetFromAnchor', 'Distance to offset lines from anchor points'),
+    ('QgsCallout.OffsetFromLabel', 'Distance to offset lines from label area'),
+    ('QgsCallout.DrawCalloutToAllParts', 'Whether callout lines should be drawn to all feature parts'),
+    ('QgsCallout.AnchorPointPosition', "Feature's anchor point position"),
+    ('QgsCallout.LabelAnchorPointPosition', "Label's anchor point position"),
+    ('QgsCallout.OriginX', 'X-coordinate of callout origin (label anchor) \n.. versionadded:: 3.20'),
+    ('QgsCallout.OriginY', 'Y-coordinate of callout origin (label anchor) \n.. versionadded:: 3.20'),
+    ('QgsCallout.DestinationX', 'X-coordinate of callout destination (feature anchor) \n.. versionadded:: 3.20'),
+    ('QgsCallout.DestinationY', 'Y-coordinate of callout destination (feature anchor) \n.. versionadded:: 3.20'),
+    ('QgsCallout.Curvature', 'Curvature of curved line callouts \n.. versionadded:: 3.20'),
+    ('QgsCallout.Orientation', 'Orientation of curved line callouts \n.. versionadded:: 3.20'),
+    ('QgsCallout.Margins', 'Margin from text \n.. versionadded:: 3.20'),
+    ('QgsCallout.WedgeWidth', 'Balloon callout wedge width \n.. versionadded:: 3.20'),
+    ('QgsCallout.CornerRadius', 'Balloon callout corner radius \n.. versionadded:: 3.20'),
+    ('QgsCallout.BlendMode', 'Callout blend mode \n.. versionadded:: 3.20'),
+    ('QgsCallout.Property', "Data definable properties.\n\n* ``MinimumCalloutLength``: Minimum length of callouts\n* ``OffsetFromAnchor``: Distance to offset lines from anchor points\n* ``OffsetFromLabel``: Distance to offset lines from label area\n* ``DrawCalloutToAllParts``: Whether callout lines should be drawn to all feature parts\n* ``AnchorPointPosition``: Feature's anchor point position\n* ``LabelAnchorPointPosition``: Label's anchor point position\n* ``OriginX``: X-coordinate of callout origin (label anchor)\n\n  .. versionadded:: 3.20\n\n* ``OriginY``: Y-coordinate of callout origin (label anchor)\n\n  .. versionadded:: 3.20\n\n* ``DestinationX``: X-coordinate of callout destination (feature anchor)\n\n  .. versionadded:: 3.20\n\n* ``DestinationY``: Y-coordinate of callout destination (feature anchor)\n\n  .. versionadded:: 3.20\n\n* ``Curvature``: Curvature of curved line callouts\n\n  .. versionadded:: 3.20\n\n* ``Orientation``: Orientation of curved line callouts\n\n  .. versionadded:: 3.20\n\n* ``Margins``: Margin from text\n\n  .. versionadded:: 3.20\n\n* ``WedgeWidth``: Balloon callout wedge width\n\n  .. versionadded:: 3.20\n\n* ``CornerRadius``: Balloon callout corner radius\n\n  .. versionadded:: 3.20\n\n* ``BlendMode``: Callout blend mode\n\n  .. versionadded:: 3.20\n\n\n"),
+    ('QgsCesiumUtils.B3DMContents', 'Encapsulates the contents of a B3DM file.'),
+    ('QgsCesiumUtils.TileContents', 'Encapsulates the contents of a 3D tile.'),
+    ('QgsGeographicCoordinateNumericFormat.AngleFormat.DegreesMinutesSeconds', "Degrees, minutes and seconds, eg 30 degrees 45'30"),
+    ('QgsGeographicCoordinateNumericFormat.AngleFormat.DegreesMinutes', "Degrees and decimal minutes, eg 30 degrees 45.55'"),
+    ('QgsGeographicCoordinateNumericFormat.AngleFormat.DecimalDegrees', 'Decimal degrees, eg 30.7555 degrees'),
+    ('QgsGeographicCoordinateNumericFormat.AngleFormat', "Angle format options.\n\n* ``DegreesMinutesSeconds``: Degrees, minutes and seconds, eg 30 degrees 45'30\n* ``DegreesMinutes``: Degrees and decimal minutes, eg 30 degrees 45.55'\n* ``DecimalDegrees``: Decimal degrees, eg 30.7555 degrees\n\n"),
+    ('QgsDatabaseSchemaModel.RoleEmpty', 'Entry is an empty entry'),
+    ('QgsDatabaseSchemaModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsDatabaseSchemaModel.Role\n\n.. versionadded:: 3.36\n\n* ``Empty``: Entry is an empty entry\n\n  Available as ``QgsDatabaseSchemaModel.RoleEmpty`` in older QGIS releases.\n\n\n'),
+    ('QgsDatabaseTableModel.RoleTableName', 'Table name'),
+    ('QgsDatabaseTableModel.RoleSchema', 'Table schema'),
+    ('QgsDatabaseTableModel.RoleTableFlags', 'Table flags role'),
+    ('QgsDatabaseTableModel.RoleComment', 'Comment role'),
+    ('QgsDatabaseTableModel.RoleCustomInfo', 'Custom info variant map role'),
+    ('QgsDatabaseTableModel.RoleWkbType', 'WKB type for primary (first) geometry column in table'),
+    ('QgsDatabaseTableModel.RoleCrs', 'CRS for primary (first) geometry column in table'),
+    ('QgsDatabaseTableModel.RoleEmpty', 'Entry is an empty entry'),
+    ('QgsDatabaseTableModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsDatabaseTableModel.Role\n\n.. versionadded:: 3.36\n\n* ``TableName``: Table name\n\n  Available as ``QgsDatabaseTableModel.RoleTableName`` in older QGIS releases.\n\n* ``Schema``: Table schema\n\n  Available as ``QgsDatabaseTableModel.RoleSchema`` in older QGIS releases.\n\n* ``TableFlags``: Table flags role\n\n  Available as ``QgsDatabaseTableModel.RoleTableFlags`` in older QGIS releases.\n\n* ``Comment``: Comment role\n\n  Available as ``QgsDatabaseTableModel.RoleComment`` in older QGIS releases.\n\n* ``CustomInfo``: Custom info variant map role\n\n  Available as ``QgsDatabaseTableModel.RoleCustomInfo`` in older QGIS releases.\n\n* ``WkbType``: WKB type for primary (first) geometry column in table\n\n  Available as ``QgsDatabaseTableModel.RoleWkbType`` in older QGIS releases.\n\n* ``Crs``: CRS for primary (first) geometry column in table\n\n  Available as ``QgsDatabaseTableModel.RoleCrs`` in older QGIS releases.\n\n* ``Empty``: Entry is an empty entry\n\n  Available as ``QgsDatabaseTableModel.RoleEmpty`` in older QGIS releases.\n\n\n'),
+    ('QgsDataDefinedSizeLegend.SizeClass', 'Definition of one class for the legend'),
+    ('QgsDataProvider.ProviderOptions', 'Setting options for creating vector data providers.\n\n.. note::\n\n   coordinateTransformContext was added in QGIS 3.8\n\n.. versionadded:: 3.2'),
+    ('QgsDatumTransform.TransformPair', 'Contains datum transform information.\n\n.. deprecated:: 3.40\n\n   Not used for builds based on Proj >= 6.0.'),
+    ('QgsDatumTransform.TransformInfo', 'Contains datum transform information.\n\n.. deprecated:: 3.40\n\n   Not used on builds based on Proj >= 6.0.'),
+    ('QgsDatumTransform.GridDetails', 'Contains information about a projection transformation grid file.\n\n.. versionadded:: 3.8'),
+    ('QgsDatumTransform.SingleOperationDetails', 'Contains information about a single coordinate operation.\n\n.. note::\n\n   Only used in builds based on on Proj >= 6.2\n\n.. versionadded:: 3.10'),
+    ('QgsDatumTransform.TransformDetails', 'Contains information about a coordinate transformation operation.\n\n.. note::\n\n   Only used in builds based on on Proj >= 6.0\n\n.. versionadded:: 3.8'),
+    ('QgsDiagramLayerSettings.BackgroundColor', 'Diagram background color'),
+    ('QgsDiagramLayerSettings.StrokeColor', 'Stroke color'),
+    ('QgsDiagramLayerSettings.StrokeWidth', 'Stroke width'),
+    ('QgsDiagramLayerSettings.PositionX', 'X-coordinate data defined diagram position'),
+    ('QgsDiagramLayerSettings.PositionY', 'Y-coordinate data defined diagram position'),
+    ('QgsDiagramLayerSettings.Distance', 'Distance to diagram from feature'),
+    ('QgsDiagramLayerSettings.Priority', 'Diagram priority (between 0 and 10)'),
+    ('QgsDiagramLayerSettings.ZIndex', 'Z-index for diagram ordering'),
+    ('QgsDiagramLayerSettings.IsObstacle', 'Whether diagram features act as obstacles for other diagrams/labels'),
+    ('QgsDiagramLayerSettings.Show', 'Whether to show the diagram'),
+    ('QgsDiagramLayerSettings.AlwaysShow', 'Whether the diagram should always be shown, even if it overlaps other diagrams/labels'),
+    ('QgsDiagramLayerSettings.StartAngle', 'Angle offset for pie diagram'),
+    ('QgsDiagramLayerSettings.Property', 'Data definable properties.\n\n* ``BackgroundColor``: Diagram background color\n* ``StrokeColor``: Stroke color\n* ``StrokeWidth``: Stroke width\n* ``PositionX``: X-coordinate data defined diagram position\n* ``PositionY``: Y-coordinate data defined diagram position\n* ``Distance``: Distance to diagram from feature\n* ``Priority``: Diagram priority (between 0 and 10)\n* ``ZIndex``: Z-index for diagram ordering\n* ``IsObstacle``: Whether diagram features act as obstacles for other diagrams/labels\n* ``Show``: Whether to show the diagram\n* ``AlwaysShow``: Whether the diagram should always be shown, even if it overlaps other diagrams/labels\n* ``StartAngle``: Angle offset for pie diagram\n\n'),
+    ('QgsDxfExport.ExportResult.Success', 'Successful export'),
+    ('QgsDxfExport.ExportResult.InvalidDeviceError', 'Invalid device error'),
+    ('QgsDxfExport.ExportResult.DeviceNotWritableError', 'Device not writable error'),
+    ('QgsDxfExport.ExportResult.EmptyExtentError', 'Empty extent, no extent given and no extent could be derived from layers'),
+    ('QgsDxfExport.ExportResult', 'The result of an export as dxf operation\n\n.. versionadded:: 3.10.1\n\n* ``Success``: Successful export\n* ``InvalidDeviceError``: Invalid device error\n* ``DeviceNotWritableError``: Device not writable error\n* ``EmptyExtentError``: Empty extent, no extent given and no extent could be derived from layers\n\n'),
+    ('QgsDxfExport.VAlign.VBaseLine', 'Top (0)'),
+    ('QgsDxfExport.VAlign.VBottom', 'Bottom (1)'),
+    ('QgsDxfExport.VAlign.VMiddle', 'Middle (2)'),
+    ('QgsDxfExport.VAlign.VTop', 'Top (3)'),
+    ('QgsDxfExport.VAlign.Undefined', 'Undefined'),
+    ('QgsDxfExport.VAlign', 'Vertical alignments.\n\n* ``VBaseLine``: Top (0)\n* ``VBottom``: Bottom (1)\n* ``VMiddle``: Middle (2)\n* ``VTop``: Top (3)\n* ``Undefined``: Undefined\n\n'),
+    ('QgsDxfExport.HAlign.HLeft', 'Left (0)'),
+    ('QgsDxfExport.HAlign.HCenter', 'Centered (1)'),
+    ('QgsDxfExport.HAlign.HRight', 'Right (2)'),
+    ('QgsDxfExport.HAlign.HAligned', 'Aligned = (3) (if VAlign==0)'),
+    ('QgsDxfExport.HAlign.HMiddle', 'Middle = (4) (if VAlign==0)'),
+    ('QgsDxfExport.HAlign.HFit', 'Fit into point = (5) (if VAlign==0)'),
+    ('QgsDxfExport.HAlign.Undefined', 'Undefined'),
+    ('QgsDxfExport.HAlign', 'Horizontal alignments.\n\n* ``HLeft``: Left (0)\n* ``HCenter``: Centered (1)\n* ``HRight``: Right (2)\n* ``HAligned``: Aligned = (3) (if VAlign==0)\n* ``HMiddle``: Middle = (4) (if VAlign==0)\n* ``HFit``: Fit into point = (5) (if VAlign==0)\n* ``Undefined``: Undefined\n\n'),
+    ('QgsDxfExport.DxfLayer', 'Layers and optional attribute index to split\ninto multiple layers using attribute value as layer name.'),
+    ('QgsEditFormConfig.NoProperty', 'No property'),
+    ('QgsEditFormConfig.AllProperties', 'All properties for item'),
+    ('QgsEditFormConfig.Alias', 'Alias'),
+    ('QgsEditFormConfig.Editable', 'Editable state \n.. versionadded:: 3.30'),
+    ('QgsEditFormConfig.DataDefinedProperty', 'Data defined properties.\nForm data defined overrides are stored in a property collection\nand they can be retrieved using the indexes specified in this\nenum.\n\n.. versionadded:: 3.14\n\n* ``NoProperty``: No property\n* ``AllProperties``: All properties for item\n* ``Alias``: Alias\n* ``Editable``: Editable state\n\n  .. versionadded:: 3.30\n\n\n'),
+    ('QgsEllipsoidUtils.EllipsoidParameters', 'Contains parameters for an ellipsoid.'),
+    ('QgsEllipsoidUtils.EllipsoidDefinition', 'Contains definition of an ellipsoid.'),
+    ('QgsExpression.ParserError', 'Details about any parser errors that were found when parsing the expression.'),
+    ('QgsExpressionContextScope.StaticVariable', 'Single variable definition for use within a QgsExpressionContextScope.'),
+    ('QgsExpressionNode.NamedNode', 'Named node'),
+    ('QgsAbstractFeatureIterator.RequestToSourceCrsResult.Success', 'Request was successfully updated to the source CRS, or no changes were required'),
+    ('QgsAbstractFeatureIterator.RequestToSourceCrsResult.DistanceWithinMustBeCheckedManually', 'The distance within request cannot be losslessly updated to the source CRS, and callers will need to take appropriate steps to handle the distance within requirement manually during feature iteration'),
+    ('QgsAbstractFeatureIterator.RequestToSourceCrsResult', 'Possible results from the :py:func:`~QgsAbstractFeatureIterator.updateRequestToSourceCrs` method.\n\n.. versionadded:: 3.22\n\n* ``Success``: Request was successfully updated to the source CRS, or no changes were required\n* ``DistanceWithinMustBeCheckedManually``: The distance within request cannot be losslessly updated to the source CRS, and callers will need to take appropriate steps to handle the distance within requirement manually during feature iteration\n\n'),
+    ('QgsFeaturePickerModelBase.IdentifierValueRole', 'Used to retrieve the identifier value (primary key) of a feature. \n.. deprecated:: 3.40. Use IdentifierValuesRole instead.'),
+    ('QgsFeaturePickerModelBase.IdentifierValuesRole', 'Used to retrieve the identifierValues (primary keys) of a feature.'),
+    ('QgsFeaturePickerModelBase.ValueRole', 'Used to retrieve the displayExpression of a feature.'),
+    ('QgsFeaturePickerModelBase.FeatureRole', "Used to retrieve the feature, it might be incomplete if the request doesn't fetch all attributes or geometry."),
+    ('QgsFeaturePickerModelBase.FeatureIdRole', 'Used to retrieve the id of a feature.'),
+    ('QgsFeaturePickerModelBase.CustomRole', "Extra roles that can be used to fetch data from this model.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsFeaturePickerModelBase.Role\n\n.. versionadded:: 3.36\n\n* ``IdentifierValue``: Used to retrieve the identifier value (primary key) of a feature.\n\n  .. deprecated:: 3.40. Use IdentifierValuesRole instead.\n\n\n  Available as ``QgsFeaturePickerModelBase.IdentifierValueRole`` in older QGIS releases.\n\n* ``IdentifierValues``: Used to retrieve the identifierValues (primary keys) of a feature.\n\n  Available as ``QgsFeaturePickerModelBase.IdentifierValuesRole`` in older QGIS releases.\n\n* ``Value``: Used to retrieve the displayExpression of a feature.\n\n  Available as ``QgsFeaturePickerModelBase.ValueRole`` in older QGIS releases.\n\n* ``Feature``: Used to retrieve the feature, it might be incomplete if the request doesn't fetch all attributes or geometry.\n\n  Available as ``QgsFeaturePickerModelBase.FeatureRole`` in older QGIS releases.\n\n* ``FeatureId``: Used to retrieve the id of a feature.\n\n  Available as ``QgsFeaturePickerModelBase.FeatureIdRole`` in older QGIS releases.\n\n\n"),
+    ('QgsFieldModel.FieldNameRole', 'Return field name if index corresponds to a field'),
+    ('QgsFieldModel.FieldIndexRole', 'Return field index if index corresponds to a field'),
+    ('QgsFieldModel.ExpressionRole', 'Return field name or expression'),
+    ('QgsFieldModel.IsExpressionRole', 'Return if index corresponds to an expression'),
+    ('QgsFieldModel.ExpressionValidityRole', 'Return if expression is valid or not'),
+    ('QgsFieldModel.FieldTypeRole', 'Return the field type (if a field, return QVariant if expression)'),
+    ('QgsFieldModel.FieldOriginRole', 'Return the field origin (if a field, returns QVariant if expression)'),
+    ('QgsFieldModel.IsEmptyRole', 'Return if the index corresponds to the empty value'),
+    ('QgsFieldModel.EditorWidgetType', 'Editor widget type'),
+    ('QgsFieldModel.JoinedFieldIsEditable', '``True`` if a joined field is editable (returns QVariant if not a joined field)'),
+    ('QgsFieldModel.FieldIsWidgetEditable', '``True`` if a is editable from the widget'),
+    ('QgsFieldModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsFieldModel.FieldRoles\n\n.. versionadded:: 3.36\n\n* ``FieldName``: Return field name if index corresponds to a field\n\n  Available as ``QgsFieldModel.FieldNameRole`` in older QGIS releases.\n\n* ``FieldIndex``: Return field index if index corresponds to a field\n\n  Available as ``QgsFieldModel.FieldIndexRole`` in older QGIS releases.\n\n* ``Expression``: Return field name or expression\n\n  Available as ``QgsFieldModel.ExpressionRole`` in older QGIS releases.\n\n* ``IsExpression``: Return if index corresponds to an expression\n\n  Available as ``QgsFieldModel.IsExpressionRole`` in older QGIS releases.\n\n* ``ExpressionValidity``: Return if expression is valid or not\n\n  Available as ``QgsFieldModel.ExpressionValidityRole`` in older QGIS releases.\n\n* ``FieldType``: Return the field type (if a field, return QVariant if expression)\n\n  Available as ``QgsFieldModel.FieldTypeRole`` in older QGIS releases.\n\n* ``FieldOrigin``: Return the field origin (if a field, returns QVariant if expression)\n\n  Available as ``QgsFieldModel.FieldOriginRole`` in older QGIS releases.\n\n* ``IsEmpty``: Return if the index corresponds to the empty value\n\n  Available as ``QgsFieldModel.IsEmptyRole`` in older QGIS releases.\n\n* ``EditorWidgetType``: Editor widget type\n* ``JoinedFieldIsEditable``: ``True`` if a joined field is editable (returns QVariant if not a joined field)\n* ``FieldIsWidgetEditable``: ``True`` if a is editable from the widget\n\n'),
+    ('QgsGeocoderInterface.Flag.GeocodesStrings', 'Can geocode string input values'),
+    ('QgsGeocoderInterface.Flag.GeocodesFeatures', 'Can geocode QgsFeature input values'),
+    ('QgsGeocoderInterface.Flag', 'Capability flags for the geocoder.\n\n* ``GeocodesStrings``: Can geocode string input values\n* ``GeocodesFeatures``: Can geocode QgsFeature input values\n\n'),
+    ('QgsGroupLayer.LayerOptions', 'Setting options for loading group layers.\n\n.. versionadded:: 3.16'),
+    ('QgsImageOperation.DistanceTransformProperties', 'Struct for storing properties of a distance transform operation'),
+    ('QgsLabelLineSettings.DirectionSymbolPlacement.SymbolLeftRight', 'Place direction symbols on left/right of label'),
+    ('QgsLabelLineSettings.DirectionSymbolPlacement.SymbolAbove', 'Place direction symbols on above label'),
+    ('QgsLabelLineSettings.DirectionSymbolPlacement.SymbolBelow', 'Place direction symbols on below label'),
+    ('QgsLabelLineSettings.DirectionSymbolPlacement', 'Placement options for direction symbols.\n\n* ``SymbolLeftRight``: Place direction symbols on left/right of label\n* ``SymbolAbove``: Place direction symbols on above label\n* ``SymbolBelow``: Place direction symbols on below label\n\n'),
+    ('QgsLabelLineSettings.AnchorType.HintOnly', 'Line anchor is a hint for preferred placement only, but other placements close to the hint are permitted'),
+    ('QgsLabelLineSettings.AnchorType.Strict', 'Line anchor is a strict placement, and other placements are not permitted'),
+    ('QgsLabelLineSettings.AnchorType', 'Line anchor types\n\n* ``HintOnly``: Line anchor is a hint for preferred placement only, but other placements close to the hint are permitted\n* ``Strict``: Line anchor is a strict placement, and other placements are not permitted\n\n'),
+    ('QgsLabelLineSettings.AnchorClipping.UseVisiblePartsOfLine', 'Only visible parts of lines are considered when calculating the line anchor for labels'),
+    ('QgsLabelLineSettings.AnchorClipping.UseEntireLine', 'Entire original feature line geometry is used when calculating the line anchor for labels'),
+    ('QgsLabelLineSettings.AnchorClipping', 'Clipping behavior for line anchor calculation.\n\n.. versionadded:: 3.20\n\n* ``UseVisiblePartsOfLine``: Only visible parts of lines are considered when calculating the line anchor for labels\n* ``UseEntireLine``: Entire original feature line geometry is used when calculating the line anchor for labels\n\n'),
+    ('QgsLabelLineSettings.AnchorTextPoint.StartOfText', 'Anchor using start of text'),
+    ('QgsLabelLineSettings.AnchorTextPoint.CenterOfText', 'Anchor using center of text'),
+    ('QgsLabelLineSettings.AnchorTextPoint.EndOfText', 'Anchor using end of text'),
+    ('QgsLabelLineSettings.AnchorTextPoint.FollowPlacement', 'Automatically set the anchor point based on the lineAnchorPercent() value. Values <25% will use the start of text, values > 75% will use the end of text, and values in between will use the center of the text'),
+    ('QgsLabelLineSettings.AnchorTextPoint', 'Anchor point of label text.\n\n.. versionadded:: 3.26\n\n* ``StartOfText``: Anchor using start of text\n* ``CenterOfText``: Anchor using center of text\n* ``EndOfText``: Anchor using end of text\n* ``FollowPlacement``: Automatically set the anchor point based on the lineAnchorPercent() value. Values <25% will use the start of text, values > 75% will use the end of text, and values in between will use the center of the text\n\n'),
+    ('QgsLabelObstacleSettings.PolygonInterior', 'Avoid placing labels over interior of polygon (prefer placing labels totally outside or just slightly inside polygon)'),
+    ('QgsLabelObstacleSettings.PolygonBoundary', 'Avoid placing labels over boundary of polygon (prefer placing outside or completely inside polygon)'),
+    ('QgsLabelObstacleSettings.PolygonWhole', 'Avoid placing labels over ANY part of polygon. Where PolygonInterior will prefer to place labels with the smallest area of intersection between the label and the polygon, PolygonWhole will penalise any label which intersects with the polygon by an equal amount, so that placing labels over any part of the polygon is avoided'),
+    ('QgsLabelObstacleSettings.ObstacleType', 'Valid obstacle types, which affect how features within the layer will act as obstacles\nfor labels.\n\n* ``PolygonInterior``: Avoid placing labels over interior of polygon (prefer placing labels totally outside or just slightly inside polygon)\n* ``PolygonBoundary``: Avoid placing labels over boundary of polygon (prefer placing outside or completely inside polygon)\n* ``PolygonWhole``: Avoid placing labels over ANY part of polygon. Where PolygonInterior will prefer to place labels with the smallest area of intersection between the label and the polygon, PolygonWhole will penalise any label which intersects with the polygon by an equal amount, so that placing labels over any part of the polygon is avoided\n\n'),
+    ('QgsLayerMetadata.SpatialExtent', 'Metadata spatial extent structure.'),
+    ('QgsLayerMetadata.Constraint', 'Metadata constraint structure.'),
+    ('QgsLayerMetadata.Extent', 'Metadata extent structure.'),
+    ('QgsLayerTreeModelLegendNode.RuleKeyRole', 'Rule key of the node (QString)'),
+    ('QgsLayerTreeModelLegendNode.ParentRuleKeyRole', 'Rule key of the parent legend node - for legends with tree hierarchy (QString). Added in 2.8'),
+    ('QgsLayerTreeModelLegendNode.NodeTypeRole', 'Type of node. Added in 3.16'),
+    ('QgsLayerTreeModelLegendNode.IsDataDefinedSizeRole', 'Set when a node is related to data defined size (title or separated legend items). Added in 3.38'),
+    ('QgsLayerTreeModelLegendNode.CustomRole', 'Legend node data roles\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsLayerTreeModelLegendNode.LegendNodeRoles\n\n.. versionadded:: 3.36\n\n* ``RuleKey``: Rule key of the node (QString)\n\n  Available as ``QgsLayerTreeModelLegendNode.RuleKeyRole`` in older QGIS releases.\n\n* ``ParentRuleKey``: Rule key of the parent legend node - for legends with tree hierarchy (QString). Added in 2.8\n\n  Available as ``QgsLayerTreeModelLegendNode.ParentRuleKeyRole`` in older QGIS releases.\n\n* ``NodeType``: Type of node. Added in 3.16\n\n  Available as ``QgsLayerTreeModelLegendNode.NodeTypeRole`` in older QGIS releases.\n\n* ``IsDataDefinedSize``: Set when a node is related to data defined size (title or separated legend items). Added in 3.38\n\n  Available as ``QgsLayerTreeModelLegendNode.IsDataDefinedSizeRole`` in older QGIS releases.\n\n\n'),
+    ('QgsLayerTreeRegistryBridge.InsertionPoint', 'A structure to define the insertion point to the layer tree.\nThis represents the current layer tree group and index where newly added map layers should be inserted into.\n\n.. versionadded:: 3.10'),
+    ('QgsLayoutExporter.PageExportDetails', 'Contains details of a page being exported by the class'),
+    ('QgsLayoutExporter.ImageExportSettings', 'Contains settings relating to exporting layouts to raster images'),
+    ('QgsLayoutExporter.PdfExportSettings', 'Contains settings relating to exporting layouts to PDF'),
+    ('QgsLayoutExporter.PrintExportSettings', 'Contains settings relating to printing layouts'),
+    ('QgsLayoutExporter.SvgExportSettings', 'Contains settings relating to exporting layouts to SVG'),
+    ('QgsLayoutGuideCollection.OrientationRole', 'Guide orientation role'),
+    ('QgsLayoutGuideCollection.PositionRole', 'Guide position role'),
+    ('QgsLayoutGuideCollection.UnitsRole', 'Guide position units role'),
+    ('QgsLayoutGuideCollection.PageRole', 'Guide page role'),
+    ('QgsLayoutGuideCollection.LayoutPositionRole', 'Guide position in layout coordinates'),
+    ('QgsLayoutGuideCollection.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsLayoutGuideCollection.Roles\n\n.. versionadded:: 3.36\n\n* ``Orientation``: Guide orientation role\n\n  Available as ``QgsLayoutGuideCollection.OrientationRole`` in older QGIS releases.\n\n* ``Position``: Guide position role\n\n  Available as ``QgsLayoutGuideCollection.PositionRole`` in older QGIS releases.\n\n* ``Units``: Guide position units role\n\n  Available as ``QgsLayoutGuideCollection.UnitsRole`` in older QGIS releases.\n\n* ``Page``: Guide page role\n\n  Available as ``QgsLayoutGuideCollection.PageRole`` in older QGIS releases.\n\n* ``LayoutPosition``: Guide position in layout coordinates\n\n  Available as ``QgsLayoutGuideCollection.LayoutPositionRole`` in older QGIS releases.\n\n\n'),
+    ('QgsLayoutItem.ExportLayerDetail', 'Contains details of a particular export layer relating to a layout item.\n\n.. versionadded:: 3.10'),
+    ('QgsLayoutManagerModel.LayoutRole', 'Layout object'),
+    ('QgsLayoutManagerModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsLayoutManagerModel.Role\n\n.. versionadded:: 3.36\n\n* ``Layout``: Layout object\n\n  Available as ``QgsLayoutManagerModel.LayoutRole`` in older QGIS releases.\n\n\n'),
+    ('QgsLayoutObject.NoProperty', 'No property'),
+    ('QgsLayoutObject.AllProperties', 'All properties for item'),
+    ('QgsLayoutObject.TestProperty', 'Dummy property with no effect on item'),
+    ('QgsLayoutObject.PresetPaperSize', 'Preset paper size for composition'),
+    ('QgsLayoutObject.PaperWidth', 'Paper width (deprecated)'),
+    ('QgsLayoutObject.PaperHeight', 'Paper height (deprecated)'),
+    ('QgsLayoutObject.NumPages', 'Number of pages in composition (deprecated)'),
+    ('QgsLayoutObject.PaperOrientation', 'Paper orientation'),
+    ('QgsLayoutObject.PageNumber', 'Page number for item placement'),
+    ('QgsLayoutObject.PositionX', 'X position on page'),
+    ('QgsLayoutObject.PositionY', 'Y position on page'),
+    ('QgsLayoutObject.ItemWidth', 'Width of item'),
+    ('QgsLayoutObject.ItemHeight', 'Height of item'),
+    ('QgsLayoutObject.ItemRotation', 'Rotation of item'),
+    ('QgsLayoutObject.Transparency', 'Item transparency (deprecated)'),
+    ('QgsLayoutObject.Opacity', 'Item opacity'),
+    ('QgsLayoutObject.BlendMode', 'Item blend mode'),
+    ('QgsLayoutObject.ExcludeFromExports', 'Exclude item from exports'),
+    ('QgsLayoutObject.FrameColor', 'Item frame color'),
+    ('QgsLayoutObject.BackgroundColor', 'Item background color'),
+    ('QgsLayoutObject.MarginLeft', 'Left margin \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.MarginTop', 'Top margin \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.MarginRight', 'Right margin \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.MarginBottom', 'Bottom margin \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.MapRotation', 'Map rotation'),
+    ('QgsLayoutObject.MapScale', 'Map scale'),
+    ('QgsLayoutObject.MapXMin', 'Map extent x minimum'),
+    ('QgsLayoutObject.MapYMin', 'Map extent y minimum'),
+    ('QgsLayoutObject.MapXMax', 'Map extent x maximum'),
+    ('QgsLayoutObject.MapYMax', 'Map extent y maximum'),
+    ('QgsLayoutObject.MapAtlasMargin', 'Map atlas margin'),
+    ('QgsLayoutObject.MapLayers', 'Map layer set'),
+    ('QgsLayoutObject.MapStylePreset', 'Layer and style map theme'),
+    ('QgsLayoutObject.MapLabelMargin', 'Map label margin'),
+    ('QgsLayoutObject.MapGridEnabled', 'Map grid enabled'),
+    ('QgsLayoutObject.MapGridIntervalX', 'Map grid interval X'),
+    ('QgsLayoutObject.MapGridIntervalY', 'Map grid interval Y'),
+    ('QgsLayoutObject.MapGridOffsetX', 'Map grid offset X'),
+    ('QgsLayoutObject.MapGridOffsetY', 'Map grid offset Y'),
+    ('QgsLayoutObject.MapGridFrameSize', 'Map grid frame size'),
+    ('QgsLayoutObject.MapGridFrameMargin', 'Map grid frame margin'),
+    ('QgsLayoutObject.MapGridLabelDistance', 'Map grid label distance'),
+    ('QgsLayoutObject.MapGridCrossSize', 'Map grid cross size'),
+    ('QgsLayoutObject.MapGridFrameLineThickness', 'Map grid frame line thickness'),
+    ('QgsLayoutObject.MapGridAnnotationDisplayLeft', 'Map annotation display left'),
+    ('QgsLayoutObject.MapGridAnnotationDisplayRight', 'Map annotation display right'),
+    ('QgsLayoutObject.MapGridAnnotationDisplayTop', 'Map annotation display top'),
+    ('QgsLayoutObject.MapGridAnnotationDisplayBottom', 'Map annotation display bottom'),
+    ('QgsLayoutObject.MapGridFrameDivisionsLeft', 'Map frame division display left'),
+    ('QgsLayoutObject.MapGridFrameDivisionsRight', 'Map frame division display right'),
+    ('QgsLayoutObject.MapGridFrameDivisionsTop', 'Map frame division display top'),
+    ('QgsLayoutObject.MapGridFrameDivisionsBottom', 'Map frame division display bottom'),
+    ('QgsLayoutObject.MapCrs', 'Map CRS'),
+    ('QgsLayoutObject.StartDateTime', "Temporal range's start DateTime"),
+    ('QgsLayoutObject.EndDateTime', "Temporal range's end DateTime"),
+    ('QgsLayoutObject.MapZRangeLower', 'Map frame Z-range lower value \n.. versionadded:: 3.38'),
+    ('QgsLayoutObject.MapZRangeUpper', 'Map frame Z-range lower value \n.. versionadded:: 3.38'),
+    ('QgsLayoutObject.PictureSource', 'Picture source url'),
+    ('QgsLayoutObject.PictureSvgBackgroundColor', 'SVG background color'),
+    ('QgsLayoutObject.PictureSvgStrokeColor', 'SVG stroke color'),
+    ('QgsLayoutObject.PictureSvgStrokeWidth', 'SVG stroke width'),
+    ('QgsLayoutObject.SourceUrl', 'Html source url'),
+    ('QgsLayoutObject.LegendTitle', 'Legend title'),
+    ('QgsLayoutObject.LegendColumnCount', 'Legend column count'),
+    ('QgsLayoutObject.LegendAutoWrapWidth', 'Legend text automatic wrapping width \n.. versionadded:: 3.44'),
+    ('QgsLayoutObject.ScalebarLeftSegments', 'Number of segments on the left of 0 \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarRightSegments', 'Number of segments on the right of 0 \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarSegmentWidth', 'Scalebar width in map units of a single segment \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarMinimumWidth', 'Scalebar segment minimum width \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarMaximumWidth', 'Scalebar segment maximum width \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarHeight', 'Scalebar height \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarRightSegmentSubdivisions', 'Number of subdivisions per segment on right of 0 \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarSubdivisionHeight', 'Scalebar subdivision height \n.. versionadded:: 3.26'),
+    ('QgsLayoutObject.ScalebarFillColor', 'Scalebar fill color (deprecated, use data defined properties on scalebar fill symbol 1 instead)'),
+    ('QgsLayoutObject.ScalebarFillColor2', 'Scalebar secondary fill color (deprecated, use data defined properties on scalebar fill symbol 2 instead)'),
+    ('QgsLayoutObject.ScalebarLineColor', 'Scalebar line color (deprecated, use data defined properties on scalebar line symbol instead)'),
+    ('QgsLayoutObject.ScalebarLineWidth', 'Scalebar line width (deprecated, use data defined properties on scalebar line symbol instead)'),
+    ('QgsLayoutObject.AttributeTableSourceLayer', 'Attribute table source layer'),
+    ('QgsLayoutObject.ElevationProfileTolerance', 'Tolerance distance for elevation profiles \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileDistanceMajorInterval', 'Major grid line interval for elevation profile distance axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileDistanceMinorInterval', 'Minor grid line interval for elevation profile distance axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileDistanceLabelInterval', 'Label interval for elevation profile distance axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileElevationMajorInterval', 'Major grid line interval for elevation profile elevation axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileElevationMinorInterval', 'Minor grid line interval for elevation profile elevation axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileElevationLabelInterval', 'Label interval for elevation profile elevation axis \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileMinimumDistance', 'Minimum distance value for elevation profile \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileMaximumDistance', 'Maximum distance value for elevation profile \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileMinimumElevation', 'Minimum elevation value for elevation profile \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.ElevationProfileMaximumElevation', 'Maximum elevation value for elevation profile \n.. versionadded:: 3.30'),
+    ('QgsLayoutObject.DataDefinedProperty', "Data defined properties for different item types\n\n* ``NoProperty``: No property\n* ``AllProperties``: All properties for item\n* ``TestProperty``: Dummy property with no effect on item\n* ``PresetPaperSize``: Preset paper size for composition\n* ``PaperWidth``: Paper width (deprecated)\n* ``PaperHeight``: Paper height (deprecated)\n* ``NumPages``: Number of pages in composition (deprecated)\n* ``PaperOrientation``: Paper orientation\n* ``PageNumber``: Page number for item placement\n* ``PositionX``: X position on page\n* ``PositionY``: Y position on page\n* ``ItemWidth``: Width of item\n* ``ItemHeight``: Height of item\n* ``ItemRotation``: Rotation of item\n* ``Transparency``: Item transparency (deprecated)\n* ``Opacity``: Item opacity\n* ``BlendMode``: Item blend mode\n* ``ExcludeFromExports``: Exclude item from exports\n* ``FrameColor``: Item frame color\n* ``BackgroundColor``: Item background color\n* ``MarginLeft``: Left margin\n\n  .. versionadded:: 3.30\n\n* ``MarginTop``: Top margin\n\n  .. versionadded:: 3.30\n\n* ``MarginRight``: Right margin\n\n  .. versionadded:: 3.30\n\n* ``MarginBottom``: Bottom margin\n\n  .. versionadded:: 3.30\n\n* ``MapRotation``: Map rotation\n* ``MapScale``: Map scale\n* ``MapXMin``: Map extent x minimum\n* ``MapYMin``: Map extent y minimum\n* ``MapXMax``: Map extent x maximum\n* ``MapYMax``: Map extent y maximum\n* ``MapAtlasMargin``: Map atlas margin\n* ``MapLayers``: Map layer set\n* ``MapStylePreset``: Layer and style map theme\n* ``MapLabelMargin``: Map label margin\n* ``MapGridEnabled``: Map grid enabled\n* ``MapGridIntervalX``: Map grid interval X\n* ``MapGridIntervalY``: Map grid interval Y\n* ``MapGridOffsetX``: Map grid offset X\n* ``MapGridOffsetY``: Map grid offset Y\n* ``MapGridFrameSize``: Map grid frame size\n* ``MapGridFrameMargin``: Map grid frame margin\n* ``MapGridLabelDistance``: Map grid label distance\n* ``MapGridCrossSize``: Map grid cross size\n* ``MapGridFrameLineThickness``: Map grid frame line thickness\n* ``MapGridAnnotationDisplayLeft``: Map annotation display left\n* ``MapGridAnnotationDisplayRight``: Map annotation display right\n* ``MapGridAnnotationDisplayTop``: Map annotation display top\n* ``MapGridAnnotationDisplayBottom``: Map annotation display bottom\n* ``MapGridFrameDivisionsLeft``: Map frame division display left\n* ``MapGridFrameDivisionsRight``: Map frame division display right\n* ``MapGridFrameDivisionsTop``: Map frame division display top\n* ``MapGridFrameDivisionsBottom``: Map frame division display bottom\n* ``MapCrs``: Map CRS\n* ``StartDateTime``: Temporal range's start DateTime\n* ``EndDateTime``: Temporal range's end DateTime\n* ``MapZRangeLower``: Map frame Z-range lower value\n\n  .. versionadded:: 3.38\n\n* ``MapZRangeUpper``: Map frame Z-range lower value\n\n  .. versionadded:: 3.38\n\n* ``PictureSource``: Picture source url\n* ``PictureSvgBackgroundColor``: SVG background color\n* ``PictureSvgStrokeColor``: SVG stroke color\n* ``PictureSvgStrokeWidth``: SVG stroke width\n* ``SourceUrl``: Html source url\n* ``LegendTitle``: Legend title\n* ``LegendColumnCount``: Legend column count\n* ``LegendAutoWrapWidth``: Legend text automatic wrapping width\n\n  .. versionadded:: 3.44\n\n* ``ScalebarLeftSegments``: Number of segments on the left of 0\n\n  .. versionadded:: 3.26\n\n* ``ScalebarRightSegments``: Number of segments on the right of 0\n\n  .. versionadded:: 3.26\n\n* ``ScalebarSegmentWidth``: Scalebar width in map units of a single segment\n\n  .. versionadded:: 3.26\n\n* ``ScalebarMinimumWidth``: Scalebar segment minimum width\n\n  .. versionadded:: 3.26\n\n* ``ScalebarMaximumWidth``: Scalebar segment maximum width\n\n  .. versionadded:: 3.26\n\n* ``ScalebarHeight``: Scalebar height\n\n  .. versionadded:: 3.26\n\n* ``ScalebarRightSegmentSubdivisions``: Number of subdivisions per segment on right of 0\n\n  .. versionadded:: 3.26\n\n* ``ScalebarSubdivisionHeight``: Scalebar subdivision height\n\n  .. versionadded:: 3.26\n\n* ``ScalebarFillColor``: Scalebar fill color (deprecated, use data defined properties on scalebar fill symbol 1 instead)\n* ``ScalebarFillColor2``: Scalebar secondary fill color (deprecated, use data defined properties on scalebar fill symbol 2 instead)\n* ``ScalebarLineColor``: Scalebar line color (deprecated, use data defined properties on scalebar line symbol instead)\n* ``ScalebarLineWidth``: Scalebar line width (deprecated, use data defined properties on scalebar line symbol instead)\n* ``AttributeTableSourceLayer``: Attribute table source layer\n* ``ElevationProfileTolerance``: Tolerance distance for elevation profiles\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileDistanceMajorInterval``: Major grid line interval for elevation profile distance axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileDistanceMinorInterval``: Minor grid line interval for elevation profile distance axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileDistanceLabelInterval``: Label interval for elevation profile distance axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileElevationMajorInterval``: Major grid line interval for elevation profile elevation axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileElevationMinorInterval``: Minor grid line interval for elevation profile elevation axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileElevationLabelInterval``: Label interval for elevation profile elevation axis\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileMinimumDistance``: Minimum distance value for elevation profile\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileMaximumDistance``: Maximum distance value for elevation profile\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileMinimumElevation``: Minimum elevation value for elevation profile\n\n  .. versionadded:: 3.30\n\n* ``ElevationProfileMaximumElevation``: Maximum elevation value for elevation profile\n\n  .. versionadded:: 3.30\n\n\n"),
+    ('QgsLocatorResult.ResultAction', 'The ResultAction stores basic information for additional\nactions to be used in a locator widget for the result.\nThey could be used in a context menu for instance.\n\n.. versionadded:: 3.6'),
+    ('QgsLocatorModel.ResultDataRole', 'QgsLocatorResult data'),
+    ('QgsLocatorModel.ResultTypeRole', 'Result type'),
+    ('QgsLocatorModel.ResultFilterPriorityRole', 'Result priority, used by QgsLocatorProxyModel for sorting roles.'),
+    ('QgsLocatorModel.ResultScoreRole', 'Result match score, used by QgsLocatorProxyModel for sorting roles.'),
+    ('QgsLocatorModel.ResultFilterNameRole', 'Associated filter name which created the result'),
+    ('QgsLocatorModel.ResultFilterGroupSortingRole', 'Custom value for sorting \n.. deprecated:: 3.40. No longer used.'),
+    ('QgsLocatorModel.ResultFilterGroupTitle', 'Group title'),
+    ('QgsLocatorModel.ResultFilterGroupScore', 'Group score'),
+    ('QgsLocatorModel.ResultActionsRole', 'The actions to be shown for the given result in a context menu'),
+    ('QgsLocatorModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsLocatorModel.Role\n\n.. versionadded:: 3.36\n\n* ``ResultData``: QgsLocatorResult data\n\n  Available as ``QgsLocatorModel.ResultDataRole`` in older QGIS releases.\n\n* ``ResultType``: Result type\n\n  Available as ``QgsLocatorModel.ResultTypeRole`` in older QGIS releases.\n\n* ``ResultFilterPriority``: Result priority, used by QgsLocatorProxyModel for sorting roles.\n\n  Available as ``QgsLocatorModel.ResultFilterPriorityRole`` in older QGIS releases.\n\n* ``ResultScore``: Result match score, used by QgsLocatorProxyModel for sorting roles.\n\n  Available as ``QgsLocatorModel.ResultScoreRole`` in older QGIS releases.\n\n* ``ResultFilterName``: Associated filter name which created the result\n\n  Available as ``QgsLocatorModel.ResultFilterNameRole`` in older QGIS releases.\n\n* ``ResultFilterGroupSorting``: Custom value for sorting\n\n  .. deprecated:: 3.40. No longer used.\n\n\n  Available as ``QgsLocatorModel.ResultFilterGroupSortingRole`` in older QGIS releases.\n\n* ``ResultFilterGroupTitle``: Group title\n* ``ResultFilterGroupScore``: Group score\n* ``ResultActions``: The actions to be shown for the given result in a context menu\n\n  Available as ``QgsLocatorModel.ResultActionsRole`` in older QGIS releases.\n\n\n'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.Color', 'Color property'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.Numeric', 'Numeric property (e.g. line width, text size)'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.Opacity', 'Opacity property'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.Point', 'Point/offset property'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.NumericArray', 'Numeric array for dash arrays or such'),
+    ('QgsMapBoxGlStyleConverter.PropertyType.DashArray', 'Dash array. Like numeric array, but must be even length array. Odd length arrays are considered as having an additional 0 value. \n.. versionadded:: 4.2'),
+    ('QgsMapBoxGlStyleConverter.PropertyType', 'Property types, for interpolated value conversion\n\n.. warning::\n\n   This is private API only, and may change in future QGIS versions\n\n* ``Color``: Color property\n* ``Numeric``: Numeric property (e.g. line width, text size)\n* ``Opacity``: Opacity property\n* ``Point``: Point/offset property\n* ``NumericArray``: Numeric array for dash arrays or such\n* ``DashArray``: Dash array. Like numeric array, but must be even length array. Odd length arrays are considered as having an additional 0 value.\n\n  .. versionadded:: 4.2\n\n\n'),
+    ('QgsMapClippingRegion.FeatureClippingType.ClipToIntersection', 'Clip the geometry of these features to the region prior to rendering (i.e. feature boundaries will follow the clip region)'),
+    ('QgsMapClippingRegion.FeatureClippingType.ClipPainterOnly', 'Applying clipping on the painter only (i.e. feature boundaries will be unchanged, but may be invisible where the feature falls outside the clipping region)'),
+    ('QgsMapClippingRegion.FeatureClippingType.NoClipping', 'Only render features which intersect the clipping region, but do not clip these features to the region'),
+    ('QgsMapClippingRegion.FeatureClippingType', 'Feature clipping behavior, which controls how features from vector layers\nwill be clipped.\n\n* ``ClipToIntersection``: Clip the geometry of these features to the region prior to rendering (i.e. feature boundaries will follow the clip region)\n* ``ClipPainterOnly``: Applying clipping on the painter only (i.e. feature boundaries will be unchanged, but may be invisible where the feature falls outside the clipping region)\n* ``NoClipping``: Only render features which intersect the clipping region, but do not clip these features to the region\n\n'),
+    ('QgsMapLayer.SaveStyleResult.Success', 'Both QML and SLD formats were successfully written to the database.'),
+    ('QgsMapLayer.SaveStyleResult.QmlGenerationFailed', 'Generation of the QML failed, and was not written to the database.'),
+    ('QgsMapLayer.SaveStyleResult.SldGenerationFailed', 'Generation of the SLD failed, and was not written to the database.'),
+    ('QgsMapLayer.SaveStyleResult.DatabaseWriteFailed', 'An error occurred when attempting to write to the database.'),
+    ('QgsMapLayer.SaveStyleResult', 'Results of saving styles to database.\n\n.. versionadded:: 4.0\n\n* ``Success``: Both QML and SLD formats were successfully written to the database.\n* ``QmlGenerationFailed``: Generation of the QML failed, and was not written to the database.\n* ``SldGenerationFailed``: Generation of the SLD failed, and was not written to the database.\n* ``DatabaseWriteFailed``: An error occurred when attempting to write to the database.\n\n'),
+    ('QgsMapLayerElevationProperties.ZOffset', 'Z offset'),
+    ('QgsMapLayerElevationProperties.ExtrusionHeight', 'Extrusion height'),
+    ('QgsMapLayerElevationProperties.RasterPerBandLowerElevation', 'Lower elevation for each raster band \n.. versionadded:: 3.38'),
+    ('QgsMapLayerElevationProperties.RasterPerBandUpperElevation', 'Upper elevation for each raster band \n.. versionadded:: 3.38'),
+    ('QgsMapLayerElevationProperties.Property', 'Data definable properties.\n\n.. versionadded:: 3.26\n\n* ``ZOffset``: Z offset\n* ``ExtrusionHeight``: Extrusion height\n* ``RasterPerBandLowerElevation``: Lower elevation for each raster band\n\n  .. versionadded:: 3.38\n\n* ``RasterPerBandUpperElevation``: Upper elevation for each raster band\n\n  .. versionadded:: 3.38\n\n\n'),
+    ('QgsMapLayerFactory.LayerOptions', 'Setting options for loading layers.\n\n.. versionadded:: 3.22'),
+    ('QgsMapLayerModel.LayerIdRole', 'Stores the map layer ID'),
+    ('QgsMapLayerModel.LayerRole', 'Stores pointer to the map layer itself'),
+    ('QgsMapLayerModel.EmptyRole', 'True if index corresponds to the empty (not set) value'),
+    ('QgsMapLayerModel.AdditionalRole', 'True if index corresponds to an additional (non map layer) item'),
+    ('QgsMapLayerModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsMapLayerModel.ItemDataRole\n\n.. versionadded:: 3.36\n\n* ``LayerId``: Stores the map layer ID\n\n  Available as ``QgsMapLayerModel.LayerIdRole`` in older QGIS releases.\n\n* ``Layer``: Stores pointer to the map layer itself\n\n  Available as ``QgsMapLayerModel.LayerRole`` in older QGIS releases.\n\n* ``Empty``: True if index corresponds to the empty (not set) value\n\n  Available as ``QgsMapLayerModel.EmptyRole`` in older QGIS releases.\n\n* ``Additional``: True if index corresponds to an additional (non map layer) item\n\n  Available as ``QgsMapLayerModel.AdditionalRole`` in older QGIS releases.\n\n\n'),
+    ('QgsServerMetadataUrlProperties.MetadataUrl', 'MetadataUrl structure.\nMetadataUrl is a link to the detailed, standardized metadata about the data.'),
+    ('QgsServerWmsDimensionProperties.WmsDimensionInfo', 'Setting to define QGIS Server WMS Dimension.\n\n.. versionadded:: 3.10'),
+    ('QgsMapSettingsUtils.EffectsCheckFlag.IgnoreGeoPdfSupportedEffects', 'Ignore advanced effects which are supported in geospatial PDF exports'),
+    ('QgsMapSettingsUtils.EffectsCheckFlag', 'Flags for controlling the behavior of :py:func:`~QgsMapSettingsUtils.containsAdvancedEffects`\n\n.. versionadded:: 3.14\n\n* ``IgnoreGeoPdfSupportedEffects``: Ignore advanced effects which are supported in geospatial PDF exports\n\n'),
+    ('QgsMesh', '\nMesh - vertices, edges and faces\n\n.. versionadded:: 3.6'),
+    ('QgsMeshLayer.LayerOptions', 'Setting options for loading mesh layers.'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.MetersPerSecond', 'Meters per second'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.KilometersPerHour', 'Kilometers per hour'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.Knots', 'Knots (Nautical miles per hour)'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.MilesPerHour', 'Miles per hour'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.FeetPerSecond', 'Feet per second'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit.OtherUnit', 'Other unit'),
+    ('QgsMeshRendererVectorWindBarbSettings.WindSpeedUnit', 'Wind speed units. Wind barbs use knots so we use this enum for preset conversion values\n\n* ``MetersPerSecond``: Meters per second\n* ``KilometersPerHour``: Kilometers per hour\n* ``Knots``: Knots (Nautical miles per hour)\n* ``MilesPerHour``: Miles per hour\n* ``FeetPerSecond``: Feet per second\n* ``OtherUnit``: Other unit\n\n'),
+    ('QgsNewsFeedModel.Key', 'Entry unique key'),
+    ('QgsNewsFeedModel.Title', 'Entry title'),
+    ('QgsNewsFeedModel.Content', 'Entry content'),
+    ('QgsNewsFeedModel.ImageUrl', 'Optional entry image URL'),
+    ('QgsNewsFeedModel.Image', 'Optional entry image'),
+    ('QgsNewsFeedModel.Link', 'Optional entry URL link'),
+    ('QgsNewsFeedModel.Sticky', 'Whether entry is sticky'),
+    ('QgsNewsFeedModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsNewsFeedModel.Role\n\n.. versionadded:: 3.36\n\n* ``Key``: Entry unique key\n* ``Title``: Entry title\n* ``Content``: Entry content\n* ``ImageUrl``: Optional entry image URL\n* ``Image``: Optional entry image\n* ``Link``: Optional entry URL link\n* ``Sticky``: Whether entry is sticky\n\n'),
+    ('QgsNumericFormatContext.Interpretation.Generic', 'Generic'),
+    ('QgsNumericFormatContext.Interpretation.Latitude', 'Latitude values'),
+    ('QgsNumericFormatContext.Interpretation.Longitude', 'Longitude values'),
+    ('QgsNumericFormatContext.Interpretation', 'Interpretation of numeric values.\n\n.. versionadded:: 3.26\n\n* ``Generic``: Generic\n* ``Latitude``: Latitude values\n* ``Longitude``: Longitude values\n\n'),
+    ('QgsOgcUtils.Context', 'The Context struct stores the current layer and coordinate transform context.\n\n.. versionadded:: 3.14'),
+    ('QgsPalettedRasterRenderer.Class', 'Properties of a single value class'),
+    ('QgsPalLayerSettings.Size', 'Label size'),
+    ('QgsPalLayerSettings.Bold', 'Use bold style'),
+    ('QgsPalLayerSettings.Italic', 'Use italic style'),
+    ('QgsPalLayerSettings.Underline', 'Use underline'),
+    ('QgsPalLayerSettings.Color', 'Text color'),
+    ('QgsPalLayerSettings.Strikeout', 'Use strikeout'),
+    ('QgsPalLayerSettings.Family', 'Font family'),
+    ('QgsPalLayerSettings.FontStyle', 'Font style name'),
+    ('QgsPalLayerSettings.FontSizeUnit', 'Font size units'),
+    ('QgsPalLayerSettings.FontTransp', 'Text transparency (deprecated)'),
+    ('QgsPalLayerSettings.FontOpacity', 'Text opacity'),
+    ('QgsPalLayerSettings.FontCase', 'Label text case'),
+    ('QgsPalLayerSettings.FontLetterSpacing', 'Letter spacing'),
+    ('QgsPalLayerSettings.FontWordSpacing', 'Word spacing'),
+    ('QgsPalLayerSettings.FontBlendMode', 'Text blend mode'),
+    ('QgsPalLayerSettings.FontStretchFactor', 'Font stretch factor, since QGIS 3.24'),
+    ('QgsPalLayerSettings.MultiLineWrapChar', ''),
+    ('QgsPalLayerSettings.AutoWrapLength', ''),
+    ('QgsPalLayerSettings.MultiLineHeight', ''),
+    ('QgsPalLayerSettings.MultiLineAlignment', ''),
+    ('QgsPalLayerSettings.TextOrientation', ''),
+    ('QgsPalLayerSettings.TabStopDistance', 'Tab stop distance, since QGIS 3.38'),
+    ('QgsPalLayerSettings.DirSymbDraw', ''),
+    ('QgsPalLayerSettings.DirSymbLeft', ''),
+    ('QgsPalLayerSettings.DirSymbRight', ''),
+    ('QgsPalLayerSettings.DirSymbPlacement', ''),
+    ('QgsPalLayerSettings.DirSymbReverse', ''),
+    ('QgsPalLayerSettings.NumFormat', ''),
+    ('QgsPalLayerSettings.NumDecimals', ''),
+    ('QgsPalLayerSettings.NumPlusSign', ''),
+    ('QgsPalLayerSettings.BufferDraw', ''),
+    ('QgsPalLayerSettings.BufferSize', ''),
+    ('QgsPalLayerSettings.BufferUnit', ''),
+    ('QgsPalLayerSettings.BufferColor', ''),
+    ('QgsPalLayerSettings.BufferTransp', 'Buffer transparency (deprecated)'),
+    ('QgsPalLayerSettings.BufferOpacity', 'Buffer opacity'),
+    ('QgsPalLayerSettings.BufferJoinStyle', ''),
+    ('QgsPalLayerSettings.BufferBlendMode', ''),
+    ('QgsPalLayerSettings.MaskEnabled', 'Whether the mask is enabled'),
+    ('QgsPalLayerSettings.MaskBufferSize', 'Mask buffer size'),
+    ('QgsPalLayerSettings.MaskBufferUnit', 'Mask buffer size unit'),
+    ('QgsPalLayerSettings.MaskOpacity', 'Mask opacity'),
+    ('QgsPalLayerSettings.MaskJoinStyle', 'Mask join style'),
+    ('QgsPalLayerSettings.ShapeDraw', ''),
+    ('QgsPalLayerSettings.ShapeKind', ''),
+    ('QgsPalLayerSettings.ShapeSVGFile', ''),
+    ('QgsPalLayerSettings.ShapeSizeType', ''),
+    ('QgsPalLayerSettings.ShapeSizeX', ''),
+    ('QgsPalLayerSettings.ShapeSizeY', ''),
+    ('QgsPalLayerSettings.ShapeSizeUnits', ''),
+    ('QgsPalLayerSettings.ShapeRotationType', ''),
+    ('QgsPalLayerSettings.ShapeRotation', ''),
+    ('QgsPalLayerSettings.ShapeOffset', ''),
+    ('QgsPalLayerSettings.ShapeOffsetUnits', ''),
+    ('QgsPalLayerSettings.ShapeRadii', ''),
+    ('QgsPalLayerSettings.ShapeRadiiUnits', ''),
+    ('QgsPalLayerSettings.ShapeTransparency', 'Shape transparency (deprecated)'),
+    ('QgsPalLayerSettings.ShapeOpacity', 'Shape opacity'),
+    ('QgsPalLayerSettings.ShapeBlendMode', ''),
+    ('QgsPalLayerSettings.ShapeFillColor', ''),
+    ('QgsPalLayerSettings.ShapeStrokeColor', ''),
+    ('QgsPalLayerSettings.ShapeStrokeWidth', ''),
+    ('QgsPalLayerSettings.ShapeStrokeWidthUnits', ''),
+    ('QgsPalLayerSettings.ShapeJoinStyle', ''),
+    ('QgsPalLayerSettings.ShadowDraw', ''),
+    ('QgsPalLayerSettings.ShadowUnder', ''),
+    ('QgsPalLayerSettings.ShadowOffsetAngle', ''),
+    ('QgsPalLayerSettings.ShadowOffsetDist', ''),
+    ('QgsPalLayerSettings.ShadowOffsetUnits', ''),
+    ('QgsPalLayerSettings.ShadowRadius', ''),
+    ('QgsPalLayerSettings.ShadowRadiusUnits', ''),
+    ('QgsPalLayerSettings.ShadowTransparency', 'Shadow transparency (deprecated)'),
+    ('QgsPalLayerSettings.ShadowOpacity', 'Shadow opacity'),
+    ('QgsPalLayerSettings.ShadowScale', ''),
+    ('QgsPalLayerSettings.ShadowColor', ''),
+    ('QgsPalLayerSettings.ShadowBlendMode', ''),
+    ('QgsPalLayerSettings.CentroidWhole', ''),
+    ('QgsPalLayerSettings.OffsetQuad', ''),
+    ('QgsPalLayerSettings.OffsetXY', ''),
+    ('QgsPalLayerSettings.OffsetUnits', ''),
+    ('QgsPalLayerSettings.LabelDistance', ''),
+    ('QgsPalLayerSettings.MaximumDistance', 'Maximum distance of label from feature'),
+    ('QgsPalLayerSettings.DistanceUnits', ''),
+    ('QgsPalLayerSettings.OffsetRotation', ''),
+    ('QgsPalLayerSettings.CurvedCharAngleInOut', ''),
+    ('QgsPalLayerSettings.PositionX', 'X-coordinate data defined label position'),
+    ('QgsPalLayerSettings.PositionY', 'Y-coordinate data defined label position'),
+    ('QgsPalLayerSettings.PositionPoint', 'Point-coordinate data defined label position'),
+    ('QgsPalLayerSettings.Hali', 'Horizontal alignment for data defined label position (Left, Center, Right)'),
+    ('QgsPalLayerSettings.Vali', 'Vertical alignment for data defined label position (Bottom, Base, Half, Cap, Top)'),
+    ('QgsPalLayerSettings.Rotation', 'Label rotation (deprecated, for old project compatibility only)'),
+    ('QgsPalLayerSettings.LabelRotation', 'Label rotation'),
+    ('QgsPalLayerSettings.RepeatDistance', ''),
+    ('QgsPalLayerSettings.RepeatDistanceUnit', ''),
+    ('QgsPalLayerSettings.Priority', ''),
+    ('QgsPalLayerSettings.PredefinedPositionOrder', ''),
+    ('QgsPalLayerSettings.LinePlacementOptions', 'Line placement flags'),
+    ('QgsPalLayerSettings.OverrunDistance', 'Distance which labels can extend past either end of linear features'),
+    ('QgsPalLayerSettings.LabelAllParts', 'Whether all parts of multi-part features should be labeled'),
+    ('QgsPalLayerSettings.PolygonLabelOutside', 'Whether labels outside a polygon feature are permitted, or should be forced \n.. versionadded:: 3.14'),
+    ('QgsPalLayerSettings.LineAnchorPercent', 'Portion along line at which labels should be anchored \n.. versionadded:: 3.16'),
+    ('QgsPalLayerSettings.LineAnchorClipping', 'Clipping mode for line anchor calculation \n.. versionadded:: 3.20'),
+    ('QgsPalLayerSettings.LineAnchorType', 'Line anchor type \n.. versionadded:: 3.26'),
+    ('QgsPalLayerSettings.LineAnchorTextPoint', 'Line anchor text point \n.. versionadded:: 3.26'),
+    ('QgsPalLayerSettings.ScaleVisibility', ''),
+    ('QgsPalLayerSettings.MinScale', 'Min scale (deprecated, for old project compatibility only)'),
+    ('QgsPalLayerSettings.MinimumScale', 'Minimum map scale (ie most "zoomed out")'),
+    ('QgsPalLayerSettings.MaxScale', 'Max scale (deprecated, for old project compatibility only)'),
+    ('QgsPalLayerSettings.MaximumScale', 'Maximum map scale (ie most "zoomed in")'),
+    ('QgsPalLayerSettings.FontLimitPixel', ''),
+    ('QgsPalLayerSettings.FontMinPixel', ''),
+    ('QgsPalLayerSettings.FontMaxPixel', ''),
+    ('QgsPalLayerSettings.IsObstacle', ''),
+    ('QgsPalLayerSettings.ObstacleFactor', ''),
+    ('QgsPalLayerSettings.ZIndex', ''),
+    ('QgsPalLayerSettings.CalloutDraw', 'Show callout'),
+    ('QgsPalLayerSettings.AllowDegradedPlacement', 'Allow degraded label placements \n.. versionadded:: 3.26'),
+    ('QgsPalLayerSettings.OverlapHandling', 'Overlap handling technique \n.. versionadded:: 3.26'),
+    ('QgsPalLayerSettings.LabelMarginDistance', 'Minimum distance from labels for this feature to other labels \n.. versionadded:: 3.44'),
+    ('QgsPalLayerSettings.RemoveDuplicateLabels', 'Whether this feature can cause removal of duplicate labels \n.. versionadded:: 3.44'),
+    ('QgsPalLayerSettings.RemoveDuplicateLabelDistance', 'Minimum distance from labels for this feature to other labels with duplicate text \n.. versionadded:: 3.44'),
+    ('QgsPalLayerSettings.Show', ''),
+    ('QgsPalLayerSettings.AlwaysShow', ''),
+    ('QgsPalLayerSettings.Property', 'Data definable properties.\n\n* ``Size``: Label size\n* ``Bold``: Use bold style\n* ``Italic``: Use italic style\n* ``Underline``: Use underline\n* ``Color``: Text color\n* ``Strikeout``: Use strikeout\n* ``Family``: Font family\n* ``FontStyle``: Font style name\n* ``FontSizeUnit``: Font size units\n* ``FontTransp``: Text transparency (deprecated)\n* ``FontOpacity``: Text opacity\n* ``FontCase``: Label text case\n* ``FontLetterSpacing``: Letter spacing\n* ``FontWordSpacing``: Word spacing\n* ``FontBlendMode``: Text blend mode\n* ``FontStretchFactor``: Font stretch factor, since QGIS 3.24\n* ``MultiLineWrapChar``: \n* ``AutoWrapLength``: \n* ``MultiLineHeight``: \n* ``MultiLineAlignment``: \n* ``TextOrientation``: \n* ``TabStopDistance``: Tab stop distance, since QGIS 3.38\n* ``DirSymbDraw``: \n* ``DirSymbLeft``: \n* ``DirSymbRight``: \n* ``DirSymbPlacement``: \n* ``DirSymbReverse``: \n* ``NumFormat``: \n* ``NumDecimals``: \n* ``NumPlusSign``: \n* ``BufferDraw``: \n* ``BufferSize``: \n* ``BufferUnit``: \n* ``BufferColor``: \n* ``BufferTransp``: Buffer transparency (deprecated)\n* ``BufferOpacity``: Buffer opacity\n* ``BufferJoinStyle``: \n* ``BufferBlendMode``: \n* ``MaskEnabled``: Whether the mask is enabled\n* ``MaskBufferSize``: Mask buffer size\n* ``MaskBufferUnit``: Mask buffer size unit\n* ``MaskOpacity``: Mask opacity\n* ``MaskJoinStyle``: Mask join style\n* ``ShapeDraw``: \n* ``ShapeKind``: \n* ``ShapeSVGFile``: \n* ``ShapeSizeType``: \n* ``ShapeSizeX``: \n* ``ShapeSizeY``: \n* ``ShapeSizeUnits``: \n* ``ShapeRotationType``: \n* ``ShapeRotation``: \n* ``ShapeOffset``: \n* ``ShapeOffsetUnits``: \n* ``ShapeRadii``: \n* ``ShapeRadiiUnits``: \n* ``ShapeTransparency``: Shape transparency (deprecated)\n* ``ShapeOpacity``: Shape opacity\n* ``ShapeBlendMode``: \n* ``ShapeFillColor``: \n* ``ShapeStrokeColor``: \n* ``ShapeStrokeWidth``: \n* ``ShapeStrokeWidthUnits``: \n* ``ShapeJoinStyle``: \n* ``ShadowDraw``: \n* ``ShadowUnder``: \n* ``ShadowOffsetAngle``: \n* ``ShadowOffsetDist``: \n* ``ShadowOffsetUnits``: \n* ``ShadowRadius``: \n* ``ShadowRadiusUnits``: \n* ``ShadowTransparency``: Shadow transparency (deprecated)\n* ``ShadowOpacity``: Shadow opacity\n* ``ShadowScale``: \n* ``ShadowColor``: \n* ``ShadowBlendMode``: \n* ``CentroidWhole``: \n* ``OffsetQuad``: \n* ``OffsetXY``: \n* ``OffsetUnits``: \n* ``LabelDistance``: \n* ``MaximumDistance``: Maximum distance of label from feature\n* ``DistanceUnits``: \n* ``OffsetRotation``: \n* ``CurvedCharAngleInOut``: \n* ``PositionX``: X-coordinate data defined label position\n* ``PositionY``: Y-coordinate data defined label position\n* ``PositionPoint``: Point-coordinate data defined label position\n* ``Hali``: Horizontal alignment for data defined label position (Left, Center, Right)\n* ``Vali``: Vertical alignment for data defined label position (Bottom, Base, Half, Cap, Top)\n* ``Rotation``: Label rotation (deprecated, for old project compatibility only)\n* ``LabelRotation``: Label rotation\n* ``RepeatDistance``: \n* ``RepeatDistanceUnit``: \n* ``Priority``: \n* ``PredefinedPositionOrder``: \n* ``LinePlacementOptions``: Line placement flags\n* ``OverrunDistance``: Distance which labels can extend past either end of linear features\n* ``LabelAllParts``: Whether all parts of multi-part features should be labeled\n* ``PolygonLabelOutside``: Whether labels outside a polygon feature are permitted, or should be forced\n\n  .. versionadded:: 3.14\n\n* ``LineAnchorPercent``: Portion along line at which labels should be anchored\n\n  .. versionadded:: 3.16\n\n* ``LineAnchorClipping``: Clipping mode for line anchor calculation\n\n  .. versionadded:: 3.20\n\n* ``LineAnchorType``: Line anchor type\n\n  .. versionadded:: 3.26\n\n* ``LineAnchorTextPoint``: Line anchor text point\n\n  .. versionadded:: 3.26\n\n* ``ScaleVisibility``: \n* ``MinScale``: Min scale (deprecated, for old project compatibility only)\n* ``MinimumScale``: Minimum map scale (ie most "zoomed out")\n* ``MaxScale``: Max scale (deprecated, for old project compatibility only)\n* ``MaximumScale``: Maximum map scale (ie most "zoomed in")\n* ``FontLimitPixel``: \n* ``FontMinPixel``: \n* ``FontMaxPixel``: \n* ``IsObstacle``: \n* ``ObstacleFactor``: \n* ``ZIndex``: \n* ``CalloutDraw``: Show callout\n* ``AllowDegradedPlacement``: Allow degraded label placements\n\n  .. versionadded:: 3.26\n\n* ``OverlapHandling``: Overlap handling technique\n\n  .. versionadded:: 3.26\n\n* ``LabelMarginDistance``: Minimum distance from labels for this feature to other labels\n\n  .. versionadded:: 3.44\n\n* ``RemoveDuplicateLabels``: Whether this feature can cause removal of duplicate labels\n\n  .. versionadded:: 3.44\n\n* ``RemoveDuplicateLabelDistance``: Minimum distance from labels for this feature to other labels with duplicate text\n\n  .. versionadded:: 3.44\n\n* ``Show``: \n* ``AlwaysShow``: \n\n'),
+    ('QgsPointCloudAttributeModel.AttributeNameRole', 'Attribute name'),
+    ('QgsPointCloudAttributeModel.AttributeIndexRole', 'Attribute index if index corresponds to an attribute'),
+    ('QgsPointCloudAttributeModel.AttributeSizeRole', 'Attribute size'),
+    ('QgsPointCloudAttributeModel.AttributeTypeRole', 'Attribute type, see QgsPointCloudAttribute.DataType'),
+    ('QgsPointCloudAttributeModel.IsEmptyRole', '``True`` if the index corresponds to the empty value'),
+    ('QgsPointCloudAttributeModel.IsNumericRole', '``True`` if the index corresponds to a numeric attributre'),
+    ('QgsPointCloudAttributeModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsPointCloudAttributeModel.FieldRoles\n\n.. versionadded:: 3.36\n\n* ``AttributeName``: Attribute name\n\n  Available as ``QgsPointCloudAttributeModel.AttributeNameRole`` in older QGIS releases.\n\n* ``AttributeIndex``: Attribute index if index corresponds to an attribute\n\n  Available as ``QgsPointCloudAttributeModel.AttributeIndexRole`` in older QGIS releases.\n\n* ``AttributeSize``: Attribute size\n\n  Available as ``QgsPointCloudAttributeModel.AttributeSizeRole`` in older QGIS releases.\n\n* ``AttributeType``: Attribute type, see QgsPointCloudAttribute.DataType\n\n  Available as ``QgsPointCloudAttributeModel.AttributeTypeRole`` in older QGIS releases.\n\n* ``IsEmpty``: ``True`` if the index corresponds to the empty value\n\n  Available as ``QgsPointCloudAttributeModel.IsEmptyRole`` in older QGIS releases.\n\n* ``IsNumeric``: ``True`` if the index corresponds to a numeric attributre\n\n  Available as ``QgsPointCloudAttributeModel.IsNumericRole`` in older QGIS releases.\n\n\n'),
+    ('QgsPointCloudLayer.PointCloudStatisticsCalculationState.NotStarted', 'The statistics calculation task has not been started'),
+    ('QgsPointCloudLayer.PointCloudStatisticsCalculationState.Calculating', 'The statistics calculation task is running'),
+    ('QgsPointCloudLayer.PointCloudStatisticsCalculationState.Calculated', 'The statistics calculation task is done and statistics are available'),
+    ('QgsPointCloudLayer.PointCloudStatisticsCalculationState', 'Point cloud statistics calculation task\n\n.. versionadded:: 3.26\n\n* ``NotStarted``: The statistics calculation task has not been started\n* ``Calculating``: The statistics calculation task is running\n* ``Calculated``: The statistics calculation task is done and statistics are available\n\n'),
+    ('QgsPointCloudLayer.LayerOptions', 'Setting options for loading point cloud layers.'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Memory', 'Memory layer'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Las', 'LAS/LAZ point cloud'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Gpkg', 'Geopackage'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Shp', 'ESRI ShapeFile'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Dxf', 'AutoCAD dxf'),
+    ('QgsPointCloudLayerExporter.ExportFormat.Csv', 'Comma separated values'),
+    ('QgsPointCloudLayerExporter.ExportFormat', 'Supported export formats for point clouds\n\n* ``Memory``: Memory layer\n* ``Las``: LAS/LAZ point cloud\n* ``Gpkg``: Geopackage\n* ``Shp``: ESRI ShapeFile\n* ``Dxf``: AutoCAD dxf\n* ``Csv``: Comma separated values\n\n'),
+    ('QgsPointCloudAttributeStatistics', '\nStores statistics of one attribute of a point cloud dataset.\n\n.. versionadded:: 3.26'),
+    ('QgsPointDistanceRenderer.GroupedFeature', 'Contains properties for a feature within a clustered group.'),
+    ('QgsPointLocator.MatchFilter', 'Interface that allows rejection of some matches in intersection queries\n(e.g. a match can only belong to a particular feature / match must not be a particular point).\nImplement the interface and pass its instance to QgsPointLocator or QgsSnappingUtils methods.'),
+    ('QgsProcessing.PythonOutputType.PythonQgsProcessingAlgorithmSubclass', 'Full Python QgsProcessingAlgorithm subclass'),
+    ('QgsProcessing.PythonOutputType', 'Available Python output types\n\n* ``PythonQgsProcessingAlgorithmSubclass``: Full Python QgsProcessingAlgorithm subclass\n\n'),
+    ('QgsProcessing.LayerOptionsFlag.SkipIndexGeneration', 'Do not generate index when creating a layer. Makes sense only for point cloud layers'),
+    ('QgsProcessing.LayerOptionsFlag', 'Layer options flags\n\n.. versionadded:: 3.32\n\n* ``SkipIndexGeneration``: Do not generate index when creating a layer. Makes sense only for point cloud layers\n\n'),
+    ('QgsProcessingAlgorithm.VectorProperties', 'Properties of a vector source or sink used in an algorithm.\n\n.. versionadded:: 3.14'),
+    ('QgsProcessingContext.ProcessArgumentFlag.IncludeProjectPath', 'Include the associated project path argument'),
+    ('QgsProcessingContext.ProcessArgumentFlag', 'Flags controlling the results given by :py:func:`~QgsProcessingContext.asQgisProcessArguments`.\n\n.. versionadded:: 3.24\n\n* ``IncludeProjectPath``: Include the associated project path argument\n\n'),
+    ('QgsProcessingParameterTinInputLayers.InputLayer', 'Used to store input layer Id and other associated parameters'),
+    ('QgsProcessingUtils.LayerHint.UnknownType', 'Unknown layer type'),
+    ('QgsProcessingUtils.LayerHint.Vector', 'Vector layer type'),
+    ('QgsProcessingUtils.LayerHint.Raster', 'Raster layer type'),
+    ('QgsProcessingUtils.LayerHint.Mesh', 'Mesh layer type, since QGIS 3.6'),
+    ('QgsProcessingUtils.LayerHint.PointCloud', 'Point cloud layer type, since QGIS 3.22'),
+    ('QgsProcessingUtils.LayerHint.Annotation', 'Annotation layer type, since QGIS 3.22'),
+    ('QgsProcessingUtils.LayerHint.VectorTile', 'Vector tile layer type, since QGIS 3.32'),
+    ('QgsProcessingUtils.LayerHint.TiledScene', 'Tiled scene layer type, since QGIS 3.34'),
+    ('QgsProcessingUtils.LayerHint', 'Layer type hints.\n\n.. versionadded:: 3.4\n\n* ``UnknownType``: Unknown layer type\n* ``Vector``: Vector layer type\n* ``Raster``: Raster layer type\n* ``Mesh``: Mesh layer type, since QGIS 3.6\n* ``PointCloud``: Point cloud layer type, since QGIS 3.22\n* ``Annotation``: Annotation layer type, since QGIS 3.22\n* ``VectorTile``: Vector tile layer type, since QGIS 3.32\n* ``TiledScene``: Tiled scene layer type, since QGIS 3.34\n\n'),
+    ('QgsProfileExporterTask.ExportResult.Success', 'Successful export'),
+    ('QgsProfileExporterTask.ExportResult.Empty', 'Results were empty'),
+    ('QgsProfileExporterTask.ExportResult.DeviceError', 'Could not open output file device'),
+    ('QgsProfileExporterTask.ExportResult.DxfExportFailed', 'Generic error when outputting to DXF'),
+    ('QgsProfileExporterTask.ExportResult.LayerExportFailed', 'Generic error when outputting to files'),
+    ('QgsProfileExporterTask.ExportResult.Canceled', 'Export was canceled'),
+    ('QgsProfileExporterTask.ExportResult', 'Results of exporting the profile.\n\n* ``Success``: Successful export\n* ``Empty``: Results were empty\n* ``DeviceError``: Could not open output file device\n* ``DxfExportFailed``: Generic error when outputting to DXF\n* ``LayerExportFailed``: Generic error when outputting to files\n* ``Canceled``: Export was canceled\n\n'),
+    ('QgsProject.NoProperty', 'No property'),
+    ('QgsProject.AllProperties', 'All properties for item'),
+    ('QgsProject.WMSOnlineResource', 'Alias'),
+    ('QgsProject.DataDefinedServerProperty', 'Data defined properties.\nOverrides of user defined server parameters are stored in a\nproperty collection and they can be retrieved using the\nindexes specified in this enum.\n\n.. versionadded:: 3.14\n\n* ``NoProperty``: No property\n* ``AllProperties``: All properties for item\n* ``WMSOnlineResource``: Alias\n\n'),
+    ('QgsProjectServerValidator.ValidationResult', 'Contains the parameters describing a project validation failure.'),
+    ('QgsProjectStyleDatabaseModel.StyleRole', 'Style object'),
+    ('QgsProjectStyleDatabaseModel.PathRole', 'Style path'),
+    ('QgsProjectStyleDatabaseModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsProjectStyleDatabaseModel.Role\n\n.. versionadded:: 3.36\n\n* ``Style``: Style object\n\n  Available as ``QgsProjectStyleDatabaseModel.StyleRole`` in older QGIS releases.\n\n* ``Path``: Style path\n\n  Available as ``QgsProjectStyleDatabaseModel.PathRole`` in older QGIS releases.\n\n\n'),
+    ('QgsProjectStyleDatabaseProxyModel.Filter.FilterHideReadOnly', 'Hide read-only style databases'),
+    ('QgsProjectStyleDatabaseProxyModel.Filter', 'Available filter flags for filtering the model\n\n* ``FilterHideReadOnly``: Hide read-only style databases\n\n'),
+    ('QgsProviderConnectionModel.RoleConnectionName', 'Connection name'),
+    ('QgsProviderConnectionModel.RoleUri', 'Connection URI string'),
+    ('QgsProviderConnectionModel.RoleConfiguration', 'Connection configuration variant map'),
+    ('QgsProviderConnectionModel.RoleEmpty', 'Entry is an empty entry'),
+    ('QgsProviderConnectionModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsProviderConnectionModel.Role\n\n.. versionadded:: 3.36\n\n* ``ConnectionName``: Connection name\n\n  Available as ``QgsProviderConnectionModel.RoleConnectionName`` in older QGIS releases.\n\n* ``Uri``: Connection URI string\n\n  Available as ``QgsProviderConnectionModel.RoleUri`` in older QGIS releases.\n\n* ``Configuration``: Connection configuration variant map\n\n  Available as ``QgsProviderConnectionModel.RoleConfiguration`` in older QGIS releases.\n\n* ``Empty``: Entry is an empty entry\n\n  Available as ``QgsProviderConnectionModel.RoleEmpty`` in older QGIS releases.\n\n\n'),
+    ('QgsProviderSublayerDetails.LayerOptions', 'Setting options for loading layers.'),
+    ('QgsProviderSublayerModel.Role.ProviderKey', 'Provider key'),
+    ('QgsProviderSublayerModel.Role.LayerType', 'Layer type'),
+    ('QgsProviderSublayerModel.Role.Uri', 'Layer URI'),
+    ('QgsProviderSublayerModel.Role.Name', 'Layer name'),
+    ('QgsProviderSublayerModel.Role.Description', 'Layer description'),
+    ('QgsProviderSublayerModel.Role.Path', 'Layer path'),
+    ('QgsProviderSublayerModel.Role.FeatureCount', 'Feature count (for vector sublayers)'),
+    ('QgsProviderSublayerModel.Role.WkbType', 'WKB geometry type (for vector sublayers)'),
+    ('QgsProviderSublayerModel.Role.GeometryColumnName', 'Geometry column name (for vector sublayers)'),
+    ('QgsProviderSublayerModel.Role.LayerNumber', 'Layer number'),
+    ('QgsProviderSublayerModel.Role.IsNonLayerItem', '``True`` if item is a non-sublayer item (e.g. an embedded project)'),
+    ('QgsProviderSublayerModel.Role.NonLayerItemType', 'Item type (for non-sublayer items)'),
+    ('QgsProviderSublayerModel.Role.Flags', 'Sublayer flags'),
+    ('QgsProviderSublayerModel.Role', 'Custom model roles\n\n* ``ProviderKey``: Provider key\n* ``LayerType``: Layer type\n* ``Uri``: Layer URI\n* ``Name``: Layer name\n* ``Description``: Layer description\n* ``Path``: Layer path\n* ``FeatureCount``: Feature count (for vector sublayers)\n* ``WkbType``: WKB geometry type (for vector sublayers)\n* ``GeometryColumnName``: Geometry column name (for vector sublayers)\n* ``LayerNumber``: Layer number\n* ``IsNonLayerItem``: ``True`` if item is a non-sublayer item (e.g. an embedded project)\n* ``NonLayerItemType``: Item type (for non-sublayer items)\n* ``Flags``: Sublayer flags\n\n'),
+    ('QgsProviderSublayerModel.Column.Name', 'Layer name'),
+    ('QgsProviderSublayerModel.Column.Description', 'Layer description'),
+    ('QgsProviderSublayerModel.Column', 'Model columns\n\n* ``Name``: Layer name\n* ``Description``: Layer description\n\n'),
+    ('QgsProviderUtils.SublayerCompletenessFlag.IgnoreUnknownFeatureCount', 'Indicates that an unknown feature count should not be considered as incomplete'),
+    ('QgsProviderUtils.SublayerCompletenessFlag.IgnoreUnknownGeometryType', 'Indicates that an unknown geometry type should not be considered as incomplete'),
+    ('QgsProviderUtils.SublayerCompletenessFlag', 'Flags which control how :py:func:`QgsProviderUtils.sublayerDetailsAreIncomplete()` tests for completeness.\n\n* ``IgnoreUnknownFeatureCount``: Indicates that an unknown feature count should not be considered as incomplete\n* ``IgnoreUnknownGeometryType``: Indicates that an unknown geometry type should not be considered as incomplete\n\n'),
+    ('QgsRasterDataProvider.VirtualRasterInputLayers', 'Struct that stores information of the raster used in :py:class:`QgsVirtualRasterProvider` for the calculations,\nthis struct is  stored in the DecodedUriParameters\n\n.. note::\n\n   used by :py:class:`QgsVirtualRasterProvider` only'),
+    ('QgsRasterDataProvider.VirtualRasterParameters', 'Struct that stores the information about the parameters that should be given to the\n:py:class:`QgsVirtualRasterProvider` through the :py:class:`QgsRasterDataProvider`.DecodedUriParameters\n\n.. note::\n\n   used by :py:class:`QgsVirtualRasterProvider` only'),
+    ('QgsRasterFileWriter.FilterFormatDetails', 'Details of available filters and formats.'),
+    ('QgsRasterLayer.LayerOptions', 'Setting options for loading raster layers.'),
+    ('QgsRasterPipe.RendererOpacity', 'Raster renderer global opacity'),
+    ('QgsRasterPipe.Property', 'Data definable properties.\n\n.. versionadded:: 3.22\n\n* ``RendererOpacity``: Raster renderer global opacity\n\n'),
+    ('QgsRasterTransparency.TransparentThreeValuePixel', 'Defines the transparency for a RGB pixel value.'),
+    ('QgsRasterTransparency.TransparentSingleValuePixel', 'Defines the transparency for a range of single-band pixel values.'),
+    ('QgsRasterViewPort', 'This class provides details of the viewable area that a raster will\nbe rendered into.\n\nThe qgsrasterviewport class sets up a viewport / area of interest to be used\nby rasterlayer draw functions at the point of drawing to the screen.'),
+    ('QgsReadWriteContext.ReadWriteMessage', 'Struct for QgsReadWriteContext error or warning messages\n\n.. versionadded:: 3.2'),
+    ('QgsRenderChecker.Flag.AvoidExportingRenderedImage', 'Avoids exporting rendered images to reports'),
+    ('QgsRenderChecker.Flag.Silent', "Don't output non-critical messages to console \n.. versionadded:: 3.40"),
+    ('QgsRenderChecker.Flag', "Render checker flags.\n\n.. versionadded:: 3.28\n\n* ``AvoidExportingRenderedImage``: Avoids exporting rendered images to reports\n* ``Silent``: Don't output non-critical messages to console\n\n  .. versionadded:: 3.40\n\n\n"),
+    ('QgsFeatureRenderer.Property.HeatmapRadius', 'Heatmap renderer radius'),
+    ('QgsFeatureRenderer.Property.HeatmapMaximum', 'Heatmap maximum value'),
+    ('QgsFeatureRenderer.Property', 'Data definable properties for renderers.\n\n.. versionadded:: 3.38\n\n* ``HeatmapRadius``: Heatmap renderer radius\n* ``HeatmapMaximum``: Heatmap maximum value\n\n'),
+    ('QgsRuleBasedRenderer.RenderJob', 'A QgsRuleBasedRenderer rendering job, consisting of a feature to be rendered with a particular symbol.'),
+    ('QgsRuleBasedRenderer.RenderLevel', 'Render level: a list of jobs to be drawn at particular level for a QgsRuleBasedRenderer.'),
+    ('QgsRuleBasedRenderer.FeatureToRender', 'Feature for rendering by a QgsRuleBasedRenderer. Contains a QgsFeature and some flags.'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesLineSymbol', 'Renderer utilizes the scalebar line symbol (see QgsScaleBarSettings.lineSymbol() )'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesFillSymbol', 'Renderer utilizes the scalebar fill symbol (see QgsScaleBarSettings.fillSymbol() )'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesAlternateFillSymbol', 'Renderer utilizes the alternate scalebar fill symbol (see QgsScaleBarSettings.alternateFillSymbol() )'),
+    ('QgsScaleBarRenderer.Flag.FlagRespectsUnits', 'Renderer respects the QgsScaleBarSettings.units() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagRespectsMapUnitsPerScaleBarUnit', 'Renderer respects the QgsScaleBarSettings.mapUnitsPerScaleBarUnit() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesUnitLabel', 'Renderer uses the QgsScaleBarSettings.unitLabel() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesSegments', 'Renderer uses the scalebar segments'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesLabelBarSpace', 'Renderer uses the QgsScaleBarSettings.labelBarSpace() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesLabelVerticalPlacement', 'Renderer uses the QgsScaleBarSettings.labelVerticalPlacement() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesLabelHorizontalPlacement', 'Renderer uses the QgsScaleBarSettings.labelHorizontalPlacement() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesAlignment', 'Renderer uses the QgsScaleBarSettings.alignment() setting'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesSubdivisions', 'Renderer uses the scalebar subdivisions (see QgsScaleBarSettings.numberOfSubdivisions() )'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesDivisionSymbol', 'Renderer utilizes the scalebar division symbol (see QgsScaleBarSettings.divisionLineSymbol() )'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesSubdivisionSymbol', 'Renderer utilizes the scalebar subdivision symbol (see QgsScaleBarSettings.subdivisionLineSymbol() )'),
+    ('QgsScaleBarRenderer.Flag.FlagUsesSubdivisionsHeight', 'Renderer uses the scalebar subdivisions height (see QgsScaleBarSettings.subdivisionsHeight() )'),
+    ('QgsScaleBarRenderer.Flag', 'Flags which control scalebar renderer behavior.\n\n.. versionadded:: 3.14\n\n* ``FlagUsesLineSymbol``: Renderer utilizes the scalebar line symbol (see QgsScaleBarSettings.lineSymbol() )\n* ``FlagUsesFillSymbol``: Renderer utilizes the scalebar fill symbol (see QgsScaleBarSettings.fillSymbol() )\n* ``FlagUsesAlternateFillSymbol``: Renderer utilizes the alternate scalebar fill symbol (see QgsScaleBarSettings.alternateFillSymbol() )\n* ``FlagRespectsUnits``: Renderer respects the QgsScaleBarSettings.units() setting\n* ``FlagRespectsMapUnitsPerScaleBarUnit``: Renderer respects the QgsScaleBarSettings.mapUnitsPerScaleBarUnit() setting\n* ``FlagUsesUnitLabel``: Renderer uses the QgsScaleBarSettings.unitLabel() setting\n* ``FlagUsesSegments``: Renderer uses the scalebar segments\n* ``FlagUsesLabelBarSpace``: Renderer uses the QgsScaleBarSettings.labelBarSpace() setting\n* ``FlagUsesLabelVerticalPlacement``: Renderer uses the QgsScaleBarSettings.labelVerticalPlacement() setting\n* ``FlagUsesLabelHorizontalPlacement``: Renderer uses the QgsScaleBarSettings.labelHorizontalPlacement() setting\n* ``FlagUsesAlignment``: Renderer uses the QgsScaleBarSettings.alignment() setting\n* ``FlagUsesSubdivisions``: Renderer uses the scalebar subdivisions (see QgsScaleBarSettings.numberOfSubdivisions() )\n* ``FlagUsesDivisionSymbol``: Renderer utilizes the scalebar division symbol (see QgsScaleBarSettings.divisionLineSymbol() )\n* ``FlagUsesSubdivisionSymbol``: Renderer utilizes the scalebar subdivision symbol (see QgsScaleBarSettings.subdivisionLineSymbol() )\n* ``FlagUsesSubdivisionsHeight``: Renderer uses the scalebar subdivisions height (see QgsScaleBarSettings.subdivisionsHeight() )\n\n'),
+    ('QgsScaleBarRenderer.ScaleBarContext', 'Contains parameters regarding scalebar calculations.\n\n.. note::\n\n   The need to attribute the parameters vary depending on the targeted scalebar.'),
+    ('QgsSensorModel.Column.Name', 'Name'),
+    ('QgsSensorModel.Column.LastValue', 'Last value'),
+    ('QgsSensorModel.Column', 'Model columns\n\n* ``Name``: Name\n* ``LastValue``: Last value\n\n'),
+    ('QgsSensorModel.SensorType', 'Sensor type'),
+    ('QgsSensorModel.SensorId', 'Sensor id'),
+    ('QgsSensorModel.SensorName', 'Sensor name'),
+    ('QgsSensorModel.SensorStatus', 'Sensor status (disconnected, connected, etc.)'),
+    ('QgsSensorModel.SensorLastValue', 'Sensor last captured value'),
+    ('QgsSensorModel.SensorLastTimestamp', 'Sensor timestamp of last captured value'),
+    ('QgsSensorModel.Sensor', 'Sensor object pointer'),
+    ('QgsSensorModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsSensorModel.Role\n\n.. versionadded:: 3.36\n\n* ``SensorType``: Sensor type\n* ``SensorId``: Sensor id\n* ``SensorName``: Sensor name\n* ``SensorStatus``: Sensor status (disconnected, connected, etc.)\n* ``SensorLastValue``: Sensor last captured value\n* ``SensorLastTimestamp``: Sensor timestamp of last captured value\n* ``Sensor``: Sensor object pointer\n\n'),
+    ('QgsSnappingUtils.LayerConfig', 'Configures how a certain layer should be handled in a snapping operation'),
+    ('QgsStacConnection.Data', 'Represents decoded data of a connection'),
+    ('QgsStyle.SymbolTableColumn.Id', 'Symbol ID'),
+    ('QgsStyle.SymbolTableColumn.Name', 'Symbol Name'),
+    ('QgsStyle.SymbolTableColumn.XML', 'Symbol definition (as XML)'),
+    ('QgsStyle.SymbolTableColumn.FavoriteId', 'Symbol is favorite flag'),
+    ('QgsStyle.SymbolTableColumn', 'Columns available in the Symbols table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Symbol ID\n* ``Name``: Symbol Name\n* ``XML``: Symbol definition (as XML)\n* ``FavoriteId``: Symbol is favorite flag\n\n'),
+    ('QgsStyle.TagTableColumn.Id', 'Tag ID'),
+    ('QgsStyle.TagTableColumn.Name', 'Tag name'),
+    ('QgsStyle.TagTableColumn', 'Columns available in the Tags table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Tag ID\n* ``Name``: Tag name\n\n'),
+    ('QgsStyle.TagmapTableColumn.TagId', 'Tag ID'),
+    ('QgsStyle.TagmapTableColumn.SymbolId', 'Symbol ID'),
+    ('QgsStyle.TagmapTableColumn', 'Columns available in the tag to symbol table.\n\n.. versionadded:: 3.40.\n\n* ``TagId``: Tag ID\n* ``SymbolId``: Symbol ID\n\n'),
+    ('QgsStyle.ColorRampTableColumn.Id', 'Color ramp ID'),
+    ('QgsStyle.ColorRampTableColumn.Name', 'Color ramp name'),
+    ('QgsStyle.ColorRampTableColumn.XML', 'Color ramp definition (as XML)'),
+    ('QgsStyle.ColorRampTableColumn.FavoriteId', 'Color ramp is favorite flag'),
+    ('QgsStyle.ColorRampTableColumn', 'Columns available in the color ramp table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Color ramp ID\n* ``Name``: Color ramp name\n* ``XML``: Color ramp definition (as XML)\n* ``FavoriteId``: Color ramp is favorite flag\n\n'),
+    ('QgsStyle.TextFormatTableColumn.Id', 'Text format ID'),
+    ('QgsStyle.TextFormatTableColumn.Name', 'Text format name'),
+    ('QgsStyle.TextFormatTableColumn.XML', 'Text format definition (as XML)'),
+    ('QgsStyle.TextFormatTableColumn.FavoriteId', 'Text format is favorite flag'),
+    ('QgsStyle.TextFormatTableColumn', 'Columns available in the text format table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Text format ID\n* ``Name``: Text format name\n* ``XML``: Text format definition (as XML)\n* ``FavoriteId``: Text format is favorite flag\n\n'),
+    ('QgsStyle.LabelSettingsTableColumn.Id', 'Label settings ID'),
+    ('QgsStyle.LabelSettingsTableColumn.Name', 'Label settings name'),
+    ('QgsStyle.LabelSettingsTableColumn.XML', 'Label settings definition (as XML)'),
+    ('QgsStyle.LabelSettingsTableColumn.FavoriteId', 'Label settings is favorite flag'),
+    ('QgsStyle.LabelSettingsTableColumn', 'Columns available in the label settings table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Label settings ID\n* ``Name``: Label settings name\n* ``XML``: Label settings definition (as XML)\n* ``FavoriteId``: Label settings is favorite flag\n\n'),
+    ('QgsStyle.SmartGroupTableColumn.Id', 'Smart group ID'),
+    ('QgsStyle.SmartGroupTableColumn.Name', 'Smart group name'),
+    ('QgsStyle.SmartGroupTableColumn.XML', 'Smart group definition (as XML)'),
+    ('QgsStyle.SmartGroupTableColumn', 'Columns available in the smart group table.\n\n.. versionadded:: 3.40.\n\n* ``Id``: Smart group ID\n* ``Name``: Smart group name\n* ``XML``: Smart group definition (as XML)\n\n'),
+    ('QgsStyle.TextFormatContext.Labeling', 'Text format used in labeling'),
+    ('QgsStyle.TextFormatContext', 'Text format context.\n\n.. versionadded:: 3.20\n\n* ``Labeling``: Text format used in labeling\n\n'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Project', 'QGIS Project node'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Layer', 'Map layer'),
+    ('QgsStyleEntityVisitorInterface.NodeType.SymbolRule', 'Rule based symbology or label child rule'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Layouts', 'Layout collection'),
+    ('QgsStyleEntityVisitorInterface.NodeType.PrintLayout', 'An individual print layout'),
+    ('QgsStyleEntityVisitorInterface.NodeType.LayoutItem', 'Individual item in a print layout'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Report', 'A QGIS print report'),
+    ('QgsStyleEntityVisitorInterface.NodeType.ReportHeader', 'Report header section'),
+    ('QgsStyleEntityVisitorInterface.NodeType.ReportFooter', 'Report footer section'),
+    ('QgsStyleEntityVisitorInterface.NodeType.ReportSection', 'Report sub section'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Annotations', 'Annotations collection'),
+    ('QgsStyleEntityVisitorInterface.NodeType.Annotation', 'An individual annotation'),
+    ('QgsStyleEntityVisitorInterface.NodeType', 'Describes the types of nodes which may be visited by the visitor.\n\n* ``Project``: QGIS Project node\n* ``Layer``: Map layer\n* ``SymbolRule``: Rule based symbology or label child rule\n* ``Layouts``: Layout collection\n* ``PrintLayout``: An individual print layout\n* ``LayoutItem``: Individual item in a print layout\n* ``Report``: A QGIS print report\n* ``ReportHeader``: Report header section\n* ``ReportFooter``: Report footer section\n* ``ReportSection``: Report sub section\n* ``Annotations``: Annotations collection\n* ``Annotation``: An individual annotation\n\n'),
+    ('QgsStyleEntityVisitorInterface.StyleLeaf', 'Contains information relating to the style entity currently being visited.'),
+    ('QgsStyleEntityVisitorInterface.Node', 'Contains information relating to a node (i.e. a group of symbols or other nodes)\nbeing visited.'),
+    ('QgsStyleModel.TypeRole', 'Style entity type, see QgsStyle.StyleEntity'),
+    ('QgsStyleModel.TagRole', 'String list of tags'),
+    ('QgsStyleModel.EntityName', 'Entity name \n.. versionadded:: 3.26'),
+    ('QgsStyleModel.SymbolTypeRole', 'Symbol type (for symbol or legend patch shape entities)'),
+    ('QgsStyleModel.IsFavoriteRole', 'Whether entity is flagged as a favorite'),
+    ('QgsStyleModel.LayerTypeRole', 'Layer type (for label settings entities)'),
+    ('QgsStyleModel.CompatibleGeometryTypesRole', 'Compatible layer geometry types (for 3D symbols)'),
+    ('QgsStyleModel.StyleName', 'Name of associated QgsStyle (QgsStyle.name()) \n.. versionadded:: 3.26'),
+    ('QgsStyleModel.StyleFileName', 'File name of associated QgsStyle (QgsStyle.fileName()) \n.. versionadded:: 3.26'),
+    ('QgsStyleModel.IsTitleRole', 'True if the index corresponds to a title item \n.. versionadded:: 3.26'),
+    ('QgsStyleModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsStyleModel.Role\n\n.. versionadded:: 3.36\n\n* ``Type``: Style entity type, see QgsStyle.StyleEntity\n\n  Available as ``QgsStyleModel.TypeRole`` in older QGIS releases.\n\n* ``Tag``: String list of tags\n\n  Available as ``QgsStyleModel.TagRole`` in older QGIS releases.\n\n* ``EntityName``: Entity name\n\n  .. versionadded:: 3.26\n\n* ``SymbolType``: Symbol type (for symbol or legend patch shape entities)\n\n  Available as ``QgsStyleModel.SymbolTypeRole`` in older QGIS releases.\n\n* ``IsFavorite``: Whether entity is flagged as a favorite\n\n  Available as ``QgsStyleModel.IsFavoriteRole`` in older QGIS releases.\n\n* ``LayerType``: Layer type (for label settings entities)\n\n  Available as ``QgsStyleModel.LayerTypeRole`` in older QGIS releases.\n\n* ``CompatibleGeometryTypes``: Compatible layer geometry types (for 3D symbols)\n\n  Available as ``QgsStyleModel.CompatibleGeometryTypesRole`` in older QGIS releases.\n\n* ``StyleName``: Name of associated QgsStyle (QgsStyle.name())\n\n  .. versionadded:: 3.26\n\n* ``StyleFileName``: File name of associated QgsStyle (QgsStyle.fileName())\n\n  .. versionadded:: 3.26\n\n* ``IsTitle``: True if the index corresponds to a title item\n\n  .. versionadded:: 3.26\n\n\n  Available as ``QgsStyleModel.IsTitleRole`` in older QGIS releases.\n\n\n'),
+    ('QgsSymbol.PropertyOpacity', 'Opacity'),
+    ('QgsSymbol.ExtentBuffer', 'Extent buffer \n.. versionadded:: 3.42'),
+    ('QgsSymbol.Property', 'Data definable properties.\n\n.. versionadded:: 3.18\n\n* ``Opacity``: Opacity\n\n  Available as ``QgsSymbol.PropertyOpacity`` in older QGIS releases.\n\n* ``ExtentBuffer``: Extent buffer\n\n  .. versionadded:: 3.42\n\n\n'),
+    ('QgsSymbolLayer.PropertySize', 'Symbol size'),
+    ('QgsSymbolLayer.PropertyAngle', 'Symbol angle'),
+    ('QgsSymbolLayer.PropertyName', 'Name, eg shape name for simple markers'),
+    ('QgsSymbolLayer.PropertyFillColor', 'Fill color'),
+    ('QgsSymbolLayer.PropertyStrokeColor', 'Stroke color'),
+    ('QgsSymbolLayer.PropertyStrokeWidth', 'Stroke width'),
+    ('QgsSymbolLayer.PropertyStrokeStyle', 'Stroke style (eg solid, dashed)'),
+    ('QgsSymbolLayer.PropertyOffset', 'Symbol offset'),
+    ('QgsSymbolLayer.PropertyCharacter', 'Character, eg for font marker symbol layers'),
+    ('QgsSymbolLayer.PropertyWidth', 'Symbol width'),
+    ('QgsSymbolLayer.PropertyHeight', 'Symbol height'),
+    ('QgsSymbolLayer.PropertyPreserveAspectRatio', 'Preserve aspect ratio between width and height'),
+    ('QgsSymbolLayer.PropertyFillStyle', 'Fill style (eg solid, dots)'),
+    ('QgsSymbolLayer.PropertyJoinStyle', 'Line join style'),
+    ('QgsSymbolLayer.PropertySecondaryColor', 'Secondary color (eg for gradient fills)'),
+    ('QgsSymbolLayer.PropertyLineAngle', 'Line angle, or angle of hash lines for hash line symbols'),
+    ('QgsSymbolLayer.PropertyLineDistance', 'Distance between lines, or length of lines for hash line symbols'),
+    ('QgsSymbolLayer.PropertyGradientType', 'Gradient fill type'),
+    ('QgsSymbolLayer.PropertyCoordinateMode', 'Gradient coordinate mode'),
+    ('QgsSymbolLayer.PropertyGradientSpread', 'Gradient spread mode'),
+    ('QgsSymbolLayer.PropertyGradientReference1X', 'Gradient reference point 1 x'),
+    ('QgsSymbolLayer.PropertyGradientReference1Y', 'Gradient reference point 1 y'),
+    ('QgsSymbolLayer.PropertyGradientReference2X', 'Gradient reference point 2 x'),
+    ('QgsSymbolLayer.PropertyGradientReference2Y', 'Gradient reference point 2 y'),
+    ('QgsSymbolLayer.PropertyGradientReference1IsCentroid', 'Gradient reference point 1 is centroid'),
+    ('QgsSymbolLayer.PropertyGradientReference2IsCentroid', 'Gradient reference point 2 is centroid'),
+    ('QgsSymbolLayer.PropertyBlurRadius', 'Shapeburst blur radius'),
+    ('QgsSymbolLayer.PropertyShapeburstUseWholeShape', 'Shapeburst use whole shape'),
+    ('QgsSymbolLayer.PropertyShapeburstMaxDistance', 'Shapeburst fill from edge distance'),
+    ('QgsSymbolLayer.PropertyShapeburstIgnoreRings', 'Shapeburst ignore rings'),
+    ('QgsSymbolLayer.PropertyFile', 'Filename, eg for svg files'),
+    ('QgsSymbolLayer.PropertyDistanceX', 'Horizontal distance between points'),
+    ('QgsSymbolLayer.PropertyDistanceY', 'Vertical distance between points'),
+    ('QgsSymbolLayer.PropertyDisplacementX', 'Horizontal displacement'),
+    ('QgsSymbolLayer.PropertyDisplacementY', 'Vertical displacement'),
+    ('QgsSymbolLayer.PropertyOpacity', 'Opacity'),
+    ('QgsSymbolLayer.PropertyCustomDash', 'Custom dash pattern'),
+    ('QgsSymbolLayer.PropertyCapStyle', 'Line cap style'),
+    ('QgsSymbolLayer.PropertyPlacement', 'Line marker placement'),
+    ('QgsSymbolLayer.PropertyInterval', 'Line marker interval'),
+    ('QgsSymbolLayer.PropertyOffsetAlongLine', 'Offset along line'),
+    ('QgsSymbolLayer.PropertyAverageAngleLength', 'Length to average symbol angles over'),
+    ('QgsSymbolLayer.PropertyHorizontalAnchor', 'Horizontal anchor point'),
+    ('QgsSymbolLayer.PropertyVerticalAnchor', 'Vertical anchor point'),
+    ('QgsSymbolLayer.PropertyLayerEnabled', 'Whether symbol layer is enabled'),
+    ('QgsSymbolLayer.PropertyArrowWidth', 'Arrow tail width'),
+    ('QgsSymbolLayer.PropertyArrowStartWidth', 'Arrow tail start width'),
+    ('QgsSymbolLayer.PropertyArrowHeadLength', 'Arrow head length'),
+    ('QgsSymbolLayer.PropertyArrowHeadThickness', 'Arrow head thickness'),
+    ('QgsSymbolLayer.PropertyArrowHeadType', 'Arrow head type'),
+    ('QgsSymbolLayer.PropertyArrowType', 'Arrow type'),
+    ('QgsSymbolLayer.PropertyOffsetX', 'Horizontal offset'),
+    ('QgsSymbolLayer.PropertyOffsetY', 'Vertical offset'),
+    ('QgsSymbolLayer.PropertyPointCount', 'Point count'),
+    ('QgsSymbolLayer.PropertyRandomSeed', 'Random number seed'),
+    ('QgsSymbolLayer.PropertyClipPoints', 'Whether markers should be clipped to polygon boundaries'),
+    ('QgsSymbolLayer.PropertyDensityArea', 'Density area'),
+    ('QgsSymbolLayer.PropertyFontFamily', 'Font family'),
+    ('QgsSymbolLayer.PropertyFontStyle', 'Font style'),
+    ('QgsSymbolLayer.PropertyDashPatternOffset', 'Dash pattern offset,'),
+    ('QgsSymbolLayer.PropertyTrimStart', 'Trim distance from start of line \n.. versionadded:: 3.20'),
+    ('QgsSymbolLayer.PropertyTrimEnd', 'Trim distance from end of line \n.. versionadded:: 3.20'),
+    ('QgsSymbolLayer.PropertyLineStartWidthValue', 'Start line width for interpolated line renderer \n.. versionadded:: 3.22'),
+    ('QgsSymbolLayer.PropertyLineEndWidthValue', 'End line width for interpolated line renderer \n.. versionadded:: 3.22'),
+    ('QgsSymbolLayer.PropertyLineStartColorValue', 'Start line color for interpolated line renderer \n.. versionadded:: 3.22'),
+    ('QgsSymbolLayer.PropertyLineEndColorValue', 'End line color for interpolated line renderer \n.. versionadded:: 3.22'),
+    ('QgsSymbolLayer.PropertyMarkerClipping', 'Marker clipping mode \n.. versionadded:: 3.24'),
+    ('QgsSymbolLayer.PropertyRandomOffsetX', 'Random offset X \n.. versionadded:: 3.24'),
+    ('QgsSymbolLayer.PropertyRandomOffsetY', 'Random offset Y \n.. versionadded:: 3.24'),
+    ('QgsSymbolLayer.PropertyLineClipping', 'Line clipping mode \n.. versionadded:: 3.24'),
+    ('QgsSymbolLayer.SkipMultiples', 'Skip multiples of \n.. versionadded:: 3.40'),
+    ('QgsSymbolLayer.ShowMarker', 'Show markers \n.. versionadded:: 3.40'),
+    ('QgsSymbolLayer.Property', 'Data definable properties.\n\n* ``Size``: Symbol size\n\n  Available as ``QgsSymbolLayer.PropertySize`` in older QGIS releases.\n\n* ``Angle``: Symbol angle\n\n  Available as ``QgsSymbolLayer.PropertyAngle`` in older QGIS releases.\n\n* ``Name``: Name, eg shape name for simple markers\n\n  Available as ``QgsSymbolLayer.PropertyName`` in older QGIS releases.\n\n* ``FillColor``: Fill color\n\n  Available as ``QgsSymbolLayer.PropertyFillColor`` in older QGIS releases.\n\n* ``StrokeColor``: Stroke color\n\n  Available as ``QgsSymbolLayer.PropertyStrokeColor`` in older QGIS releases.\n\n* ``StrokeWidth``: Stroke width\n\n  Available as ``QgsSymbolLayer.PropertyStrokeWidth`` in older QGIS releases.\n\n* ``StrokeStyle``: Stroke style (eg solid, dashed)\n\n  Available as ``QgsSymbolLayer.PropertyStrokeStyle`` in older QGIS releases.\n\n* ``Offset``: Symbol offset\n\n  Available as ``QgsSymbolLayer.PropertyOffset`` in older QGIS releases.\n\n* ``Character``: Character, eg for font marker symbol layers\n\n  Available as ``QgsSymbolLayer.PropertyCharacter`` in older QGIS releases.\n\n* ``Width``: Symbol width\n\n  Available as ``QgsSymbolLayer.PropertyWidth`` in older QGIS releases.\n\n* ``Height``: Symbol height\n\n  Available as ``QgsSymbolLayer.PropertyHeight`` in older QGIS releases.\n\n* ``PreserveAspectRatio``: Preserve aspect ratio between width and height\n\n  Available as ``QgsSymbolLayer.PropertyPreserveAspectRatio`` in older QGIS releases.\n\n* ``FillStyle``: Fill style (eg solid, dots)\n\n  Available as ``QgsSymbolLayer.PropertyFillStyle`` in older QGIS releases.\n\n* ``JoinStyle``: Line join style\n\n  Available as ``QgsSymbolLayer.PropertyJoinStyle`` in older QGIS releases.\n\n* ``SecondaryColor``: Secondary color (eg for gradient fills)\n\n  Available as ``QgsSymbolLayer.PropertySecondaryColor`` in older QGIS releases.\n\n* ``LineAngle``: Line angle, or angle of hash lines for hash line symbols\n\n  Available as ``QgsSymbolLayer.PropertyLineAngle`` in older QGIS releases.\n\n* ``LineDistance``: Distance between lines, or length of lines for hash line symbols\n\n  Available as ``QgsSymbolLayer.PropertyLineDistance`` in older QGIS releases.\n\n* ``GradientType``: Gradient fill type\n\n  Available as ``QgsSymbolLayer.PropertyGradientType`` in older QGIS releases.\n\n* ``CoordinateMode``: Gradient coordinate mode\n\n  Available as ``QgsSymbolLayer.PropertyCoordinateMode`` in older QGIS releases.\n\n* ``GradientSpread``: Gradient spread mode\n\n  Available as ``QgsSymbolLayer.PropertyGradientSpread`` in older QGIS releases.\n\n* ``GradientReference1X``: Gradient reference point 1 x\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference1X`` in older QGIS releases.\n\n* ``GradientReference1Y``: Gradient reference point 1 y\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference1Y`` in older QGIS releases.\n\n* ``GradientReference2X``: Gradient reference point 2 x\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference2X`` in older QGIS releases.\n\n* ``GradientReference2Y``: Gradient reference point 2 y\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference2Y`` in older QGIS releases.\n\n* ``GradientReference1IsCentroid``: Gradient reference point 1 is centroid\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference1IsCentroid`` in older QGIS releases.\n\n* ``GradientReference2IsCentroid``: Gradient reference point 2 is centroid\n\n  Available as ``QgsSymbolLayer.PropertyGradientReference2IsCentroid`` in older QGIS releases.\n\n* ``BlurRadius``: Shapeburst blur radius\n\n  Available as ``QgsSymbolLayer.PropertyBlurRadius`` in older QGIS releases.\n\n* ``ShapeburstUseWholeShape``: Shapeburst use whole shape\n\n  Available as ``QgsSymbolLayer.PropertyShapeburstUseWholeShape`` in older QGIS releases.\n\n* ``ShapeburstMaxDistance``: Shapeburst fill from edge distance\n\n  Available as ``QgsSymbolLayer.PropertyShapeburstMaxDistance`` in older QGIS releases.\n\n* ``ShapeburstIgnoreRings``: Shapeburst ignore rings\n\n  Available as ``QgsSymbolLayer.PropertyShapeburstIgnoreRings`` in older QGIS releases.\n\n* ``File``: Filename, eg for svg files\n\n  Available as ``QgsSymbolLayer.PropertyFile`` in older QGIS releases.\n\n* ``DistanceX``: Horizontal distance between points\n\n  Available as ``QgsSymbolLayer.PropertyDistanceX`` in older QGIS releases.\n\n* ``DistanceY``: Vertical distance between points\n\n  Available as ``QgsSymbolLayer.PropertyDistanceY`` in older QGIS releases.\n\n* ``DisplacementX``: Horizontal displacement\n\n  Available as ``QgsSymbolLayer.PropertyDisplacementX`` in older QGIS releases.\n\n* ``DisplacementY``: Vertical displacement\n\n  Available as ``QgsSymbolLayer.PropertyDisplacementY`` in older QGIS releases.\n\n* ``Opacity``: Opacity\n\n  Available as ``QgsSymbolLayer.PropertyOpacity`` in older QGIS releases.\n\n* ``CustomDash``: Custom dash pattern\n\n  Available as ``QgsSymbolLayer.PropertyCustomDash`` in older QGIS releases.\n\n* ``CapStyle``: Line cap style\n\n  Available as ``QgsSymbolLayer.PropertyCapStyle`` in older QGIS releases.\n\n* ``Placement``: Line marker placement\n\n  Available as ``QgsSymbolLayer.PropertyPlacement`` in older QGIS releases.\n\n* ``Interval``: Line marker interval\n\n  Available as ``QgsSymbolLayer.PropertyInterval`` in older QGIS releases.\n\n* ``OffsetAlongLine``: Offset along line\n\n  Available as ``QgsSymbolLayer.PropertyOffsetAlongLine`` in older QGIS releases.\n\n* ``AverageAngleLength``: Length to average symbol angles over\n\n  Available as ``QgsSymbolLayer.PropertyAverageAngleLength`` in older QGIS releases.\n\n* ``HorizontalAnchor``: Horizontal anchor point\n\n  Available as ``QgsSymbolLayer.PropertyHorizontalAnchor`` in older QGIS releases.\n\n* ``VerticalAnchor``: Vertical anchor point\n\n  Available as ``QgsSymbolLayer.PropertyVerticalAnchor`` in older QGIS releases.\n\n* ``LayerEnabled``: Whether symbol layer is enabled\n\n  Available as ``QgsSymbolLayer.PropertyLayerEnabled`` in older QGIS releases.\n\n* ``ArrowWidth``: Arrow tail width\n\n  Available as ``QgsSymbolLayer.PropertyArrowWidth`` in older QGIS releases.\n\n* ``ArrowStartWidth``: Arrow tail start width\n\n  Available as ``QgsSymbolLayer.PropertyArrowStartWidth`` in older QGIS releases.\n\n* ``ArrowHeadLength``: Arrow head length\n\n  Available as ``QgsSymbolLayer.PropertyArrowHeadLength`` in older QGIS releases.\n\n* ``ArrowHeadThickness``: Arrow head thickness\n\n  Available as ``QgsSymbolLayer.PropertyArrowHeadThickness`` in older QGIS releases.\n\n* ``ArrowHeadType``: Arrow head type\n\n  Available as ``QgsSymbolLayer.PropertyArrowHeadType`` in older QGIS releases.\n\n* ``ArrowType``: Arrow type\n\n  Available as ``QgsSymbolLayer.PropertyArrowType`` in older QGIS releases.\n\n* ``OffsetX``: Horizontal offset\n\n  Available as ``QgsSymbolLayer.PropertyOffsetX`` in older QGIS releases.\n\n* ``OffsetY``: Vertical offset\n\n  Available as ``QgsSymbolLayer.PropertyOffsetY`` in older QGIS releases.\n\n* ``PointCount``: Point count\n\n  Available as ``QgsSymbolLayer.PropertyPointCount`` in older QGIS releases.\n\n* ``RandomSeed``: Random number seed\n\n  Available as ``QgsSymbolLayer.PropertyRandomSeed`` in older QGIS releases.\n\n* ``ClipPoints``: Whether markers should be clipped to polygon boundaries\n\n  Available as ``QgsSymbolLayer.PropertyClipPoints`` in older QGIS releases.\n\n* ``DensityArea``: Density area\n\n  Available as ``QgsSymbolLayer.PropertyDensityArea`` in older QGIS releases.\n\n* ``FontFamily``: Font family\n\n  Available as ``QgsSymbolLayer.PropertyFontFamily`` in older QGIS releases.\n\n* ``FontStyle``: Font style\n\n  Available as ``QgsSymbolLayer.PropertyFontStyle`` in older QGIS releases.\n\n* ``DashPatternOffset``: Dash pattern offset,\n\n  Available as ``QgsSymbolLayer.PropertyDashPatternOffset`` in older QGIS releases.\n\n* ``TrimStart``: Trim distance from start of line\n\n  .. versionadded:: 3.20\n\n\n  Available as ``QgsSymbolLayer.PropertyTrimStart`` in older QGIS releases.\n\n* ``TrimEnd``: Trim distance from end of line\n\n  .. versionadded:: 3.20\n\n\n  Available as ``QgsSymbolLayer.PropertyTrimEnd`` in older QGIS releases.\n\n* ``LineStartWidthValue``: Start line width for interpolated line renderer\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsSymbolLayer.PropertyLineStartWidthValue`` in older QGIS releases.\n\n* ``LineEndWidthValue``: End line width for interpolated line renderer\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsSymbolLayer.PropertyLineEndWidthValue`` in older QGIS releases.\n\n* ``LineStartColorValue``: Start line color for interpolated line renderer\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsSymbolLayer.PropertyLineStartColorValue`` in older QGIS releases.\n\n* ``LineEndColorValue``: End line color for interpolated line renderer\n\n  .. versionadded:: 3.22\n\n\n  Available as ``QgsSymbolLayer.PropertyLineEndColorValue`` in older QGIS releases.\n\n* ``MarkerClipping``: Marker clipping mode\n\n  .. versionadded:: 3.24\n\n\n  Available as ``QgsSymbolLayer.PropertyMarkerClipping`` in older QGIS releases.\n\n* ``RandomOffsetX``: Random offset X\n\n  .. versionadded:: 3.24\n\n\n  Available as ``QgsSymbolLayer.PropertyRandomOffsetX`` in older QGIS releases.\n\n* ``RandomOffsetY``: Random offset Y\n\n  .. versionadded:: 3.24\n\n\n  Available as ``QgsSymbolLayer.PropertyRandomOffsetY`` in older QGIS releases.\n\n* ``LineClipping``: Line clipping mode\n\n  .. versionadded:: 3.24\n\n\n  Available as ``QgsSymbolLayer.PropertyLineClipping`` in older QGIS releases.\n\n* ``SkipMultiples``: Skip multiples of\n\n  .. versionadded:: 3.40\n\n* ``ShowMarker``: Show markers\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('QgsTaskManager.TaskDefinition', 'Definition of a task for inclusion in the manager.'),
+    ('QgsTemporalUtils.AnimationExportSettings', 'Contains settings relating to exporting animations'),
+    ('QgsTextBlockFormat.BooleanValue.NotSet', 'Property is not set'),
+    ('QgsTextBlockFormat.BooleanValue.SetTrue', 'Property is set and ``True``'),
+    ('QgsTextBlockFormat.BooleanValue.SetFalse', 'Property is set and ``False``'),
+    ('QgsTextBlockFormat.BooleanValue', 'Status values for boolean format properties\n\n* ``NotSet``: Property is not set\n* ``SetTrue``: Property is set and ``True``\n* ``SetFalse``: Property is set and ``False``\n\n'),
+    ('QgsTextCharacterFormat.BooleanValue.NotSet', 'Property is not set'),
+    ('QgsTextCharacterFormat.BooleanValue.SetTrue', 'Property is set and ``True``'),
+    ('QgsTextCharacterFormat.BooleanValue.SetFalse', 'Property is set and ``False``'),
+    ('QgsTextCharacterFormat.BooleanValue', 'Status values for boolean format properties\n\n* ``NotSet``: Property is not set\n* ``SetTrue``: Property is set and ``True``\n* ``SetFalse``: Property is set and ``False``\n\n'),
+    ('QgsTiledSceneLayer.LayerOptions', 'Setting options for loading tiled scene layers.'),
+    ('QgsUnitTypes.DistanceValue', 'A combination of distance value and unit.'),
+    ('QgsUnitTypes.AreaValue', 'A combination of area value and unit.'),
+    ('QgsVectorFileWriter.FilterFormatDetails', 'Details of available filters and formats.'),
+    ('QgsVectorFileWriter.DriverDetails', 'Details of available driver formats.'),
+    ('QgsVectorLayer.LayerOptions', 'Setting options for loading vector layers.'),
+    ('QgsVectorLayer.DeleteContext', 'Context for cascade delete features\n\n.. versionadded:: 3.14'),
+    ('QgsVectorLayerExporter.OutputField', 'Encapsulates output field definition.\n\n.. versionadded:: 3.44'),
+    ('QgsVectorLayerFeatureIterator.FetchJoinInfo', 'Join information prepared for fast attribute id mapping in :py:func:`QgsVectorLayerJoinBuffer.updateFeatureAttributes()`.\nCreated in the :py:func:`~QgsVectorLayerFeatureIterator.select` method of :py:class:`QgsVectorLayerJoinBuffer` for the joins that contain fetched attributes'),
+    ('QgsVectorTileLayer.LayerOptions', 'Setting options for loading vector tile layers.\n\n.. versionadded:: 3.22'),
+    ('QgsVertexId', 'Utility class for identifying a unique vertex within a geometry.'),
+    ('QgsDateRange', 'Stores a date range.\n\nInvalid dates as the beginning or end are permitted. In this case, the bound is\nconsidered to be infinite. E.g.\n\n.. code-block:: python\n\n    # a range containing all dates before 2017-1-1\n    QgsDateRange(QDate(),QDate(2017,1,1))\n\n    # a range containing all dates after 2017-1-1\n    QgsDateRange(QDate(2017,1,1),QDate())\n\n\n.. seealso:: :py:class:`QgsDateTimeRange`\n\nQgsDateRange(begin: Union[QDate, datetime.date], end: Union[QDate, datetime.date], includeBeginning: bool = True, includeEnd: bool = True)\nConstructor for QgsDateRange. The ``begin`` and ``end`` are\nspecified, and optionally whether or not these bounds are included in\nthe range.\n\nQgsDateRange(QgsDateRange)\nCopy constructor.\n'),
+    ('QgsDateTimeRange', 'Stores a range of date times.\n\nInvalid date times as the beginning or end are permitted. In this case, the bound is\nconsidered to be infinite. E.g.\n\n.. code-block:: python\n\n    # a range containing all dates before 2017-1-1\n    QgsDateTimeRange(QDateTime(),QDateTime(2017,1,1))\n\n    # a range containing all dates after 2017-1-1\n    QgsDateTimeRange(QDateTime(2017,1,1),QDateTime())\n\n\n.. seealso:: :py:class:`QgsDateRange`\n\nQgsDateTimeRange(begin: Union[QDateTime, datetime.datetime], end: Union[QDateTime, datetime.datetime], includeBeginning: bool = True, includeEnd: bool = True)\nConstructor for QgsDateTimeRange. The ``begin`` and ``end`` are\nspecified, and optionally whether or not these bounds are included in\nthe range.\n\nQgsDateTimeRange(QgsDateTimeRange)\nCopy constructor.\n'),
+    ('QgsVectorLayer.SemiTransparentCircle', 'Semi-transparent circle marker'),
+    ('QgsVectorLayer.Cross', 'Cross marker'),
+    ('QgsVectorLayer.NoMarker', 'No marker'),
+    ('QgsMapLayerType.VectorLayer', 'Vector layer'),
+    ('QgsMapLayerType.RasterLayer', 'Raster layer'),
+    ('QgsMapLayerType.PluginLayer', 'Plugin based layer'),
+    ('QgsMapLayerType.MeshLayer', 'Mesh layer. Added in QGIS 3.2'),
+    ('QgsMapLayerType.VectorTileLayer', 'Vector tile layer. Added in QGIS 3.14'),
+    ('QgsMapLayerType.AnnotationLayer', 'Contains freeform, georeferenced annotations. Added in QGIS 3.16'),
+    ('QgsMapLayerType.PointCloudLayer', 'Point cloud layer. Added in QGIS 3.18'),
+    ('QgsMapLayerType.GroupLayer', 'Composite group layer. Added in QGIS 3.24'),
+    ('QgsCoordinateReferenceSystem.WKT2_2018', 'Alias for WKT2_2019'),
+    ('QgsCoordinateReferenceSystem.WKT2_2018_SIMPLIFIED', 'Alias for WKT2_2019_SIMPLIFIED'),
+    ('QgsCsException', 'Custom exception class for Coordinate Reference System related exceptions.'),
+    ('QgsProcessingException', 'Custom exception class for processing related exceptions.'),
+    ('QgsProviderConnectionException', 'Custom exception class for provider connection related exceptions.'),
+    ('QgsNotSupportedException', 'Custom exception class which is raised when an operation is not supported.'),
+    ('QgsSettingsException', 'Custom exception class for settings related exceptions.'),
+    ('QgsException', 'Defines a QGIS exception class.'),
+    ('QgsRasterBlock.as_numpy', "\nReturns the block data as a numpy array.\n\nIf `use_masking` is `True` then the returned array will be a numpy masked array, masking the raster block's nodata values.\n\n:raises QgsNotSupportedException: if numpy is not available on the system\n\n.. versionadded:: 3.40\n"),
+    ('QgsRasterLayer.as_numpy', "\nReturns the layer data as a numpy array.\n\nIf `use_masking` is `True` then the returned arrays will be numpy masked arrays, masking the raster block's nodata values.\n\nIf `bands` is provided, only the specified bands will be included in the returned array; otherwise, all bands will be used.\n\n:raises QgsNotSupportedException: if numpy is not available on the system\n\n.. versionadded:: 3.40\n"),
+    ('QgsGeometry.as_numpy', '\nReturns the geometry data as a numpy array or list of numpy arrays.\n\n:raises QgsNotSupportedException: if numpy is not available on the system\n\n.. versionadded:: 3.40\n'),
+    ('QgsGeometry.as_shapely', '\nReturns the geometry data as a shapely object.\n\n:raises QgsNotSupportedException: if shapely is not available on the system\n\n.. versionadded:: 3.40\n'),
+    ('QgsGeometry.from_shapely', '\nCreates a new geometry from a shapely object.\n\n:raises QgsNotSupportedException: if shapely is not available on the system\n\n.. versionadded:: 3.44\n'),
+)
@@ -0,0 +1,2705 @@
+# -*- coding: utf-8 -*-
+"""
+Generated class patches of the qgis.core bindings, applied on import
+
+This file has been generated by scripts/build_patch_tables.py
+It is not aimed to be manually edited
+"""
+
+PATCHES = (
+    ('src/core/symbology/qgs25drenderer.h', (
+        ('Qgs25DRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('save', 'flags', 'startRender', 'stopRender', 'usedAttributes', 'clone', 'symbolForFeature', 'symbols', 'accept')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/./3d/qgs3drendererregistry.h', (
+        ('Qgs3DRendererAbstractMetadata', (('__abstract_methods__', ('createRenderer',)), ('__group__', ('3d',)))),
+        ('Qgs3DRendererRegistry', (('__group__', ('3d',)),)),
+    )),
+    ('src/core/./3d/qgs3dsymbolregistry.h', (
+        ('Qgs3DSymbolAbstractMetadata', (('__abstract_methods__', ('create',)), ('__group__', ('3d',)))),
+        ('Qgs3DSymbolRegistry', (('__group__', ('3d',)),)),
+    )),
+    ('src/core/./3d/qgsabstract3drenderer.h', (
+        ('QgsAbstract3DRenderer', (('__virtual_methods__', ('resolveReferences',)), ('__abstract_methods__', ('type', 'clone', 'writeXml', 'readXml')), ('__group__', ('3d',)))),
+    )),
+    ('src/core/./3d/qgsabstract3dsymbol.h', (
+        ('QgsAbstract3DSymbol', (('__virtual_methods__', ('compatibleGeometryTypes', 'setDefaultPropertiesFromLayer', 'copyBaseSettings')), ('__abstract_methods__', ('type', 'clone', 'writeXml', 'readXml')), ('__group__', ('3d',)))),
+    )),
+    ('src/core/qgsabstractcontentcache.h', (
+        ('QgsAbstractContentCacheBase', (('__attribute_docs__', (('remoteContentFetched', 'Emitted when the cache has finished retrieving content from a remote\n``url``.\n'),)), 'parseBase64DataUrl', 'parseEmbeddedStringData', 'isBase64Data', ('__virtual_methods__', ('invalidateCacheEntry', 'checkReply', 'onRemoteContentFetched')), ('__signal_arguments__', (('remoteContentFetched', ('url: str',)),)))),
+    )),
+    ('src/core/providers/qgsabstractdatabaseproviderconnection.h', (
+        ('QgsAbstractDatabaseProviderConnection', (('__virtual_methods__', ('geometryColumnCapabilities', 'sqlLayerDefinitionCapabilities', 'tableUri', 'createVectorTable', 'createVectorLayerExporterDestinationUri', 'tableExists', 'dropVectorTable', 'dropRasterTable', 'renameVectorTable', 'renameRasterTable', 'createSchema', 'dropSchema', 'deleteField', 'addField', 'renameField', 'renameSchema', 'executeSql', 'createSqlVectorLayer', 'validateSqlVectorLayer', 'sqlOptions', 'execSql', 'vacuum', 'createSpatialIndex', 'spatialIndexExists', 'deleteSpatialIndex', 'table', 'SIP_THROW', 'fields', 'sqlDictionary', 'illegalFieldNames', 'defaultPrimaryKeyColumnName', 'defaultGeometryColumnName', 'supportedFieldDomainTypes', 'fieldDomain', 'setFieldDomainName', 'addFieldDomain', 'setFieldAlias', 'setTableComment', 'setFieldComment', 'moveTableToSchema', 'supportedRelationshipCapabilities', 'relatedTableTypes', 'relationships', 'addRelationship', 'updateRelationship', 'deleteRelationship', 'queryBuilder', 'searchLayerMetadata')), ('__abstract_methods__', ('tableImportCapabilities', 'nativeTypes')), ('__group__', ('providers',)))),
+        ('QgsAbstractDatabaseProviderConnection.QueryResult', (('__group__', ('providers',)),)),
+        ('QgsAbstractDatabaseProviderConnection.TableProperty', (('__group__', ('providers',)),)),
+        ('QgsAbstractDatabaseProviderConnection.TableProperty.GeometryColumnType', (('__group__', ('providers',)),)),
+    )),
+    ('src/core/providers/qgsabstractdbtablemodel.h', (
+        ('QgsAbstractDbTableModel', (('__virtual_methods__', ('searchableColumn',)), ('__abstract_methods__', ('columns', 'defaultSearchColumn', 'setSql')), ('__group__', ('providers',)))),
+    )),
+    ('src/core/geocoding/qgsabstractgeocoderlocatorfilter.h', (
+        ('QgsAbstractGeocoderLocatorFilter', (('__overridden_methods__', ('name', 'displayName', 'prefix', 'fetchResults', 'triggerResult')), ('__group__', ('geocoding',)))),
+    )),
+    ('src/core/geometry/qgsabstractgeometry.h', (
+        ('QgsAbstractGeometry', (('__virtual_methods__', ('compareTo', 'boundingBox', 'nCoordinates', 'closestSegment', 'length', 'perimeter', 'area', 'centroid', 'isEmpty', 'hasCurvedSegments', 'boundingBoxIntersects', 'segmentize', 'convertTo', 'hasChildGeometries', 'childCount', 'childGeometry', 'childPoint', 'calculateBoundingBox', 'calculateBoundingBox3D', 'clearCache')), ('__abstract_methods__', ('operator==', 'operator!=', 'fuzzyEqual', 'fuzzyDistanceEqual', 'clone', 'clear', 'boundingBox3D', 'dimension', 'geometryType', 'boundary', 'normalize', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'transform', 'draw', 'asQPainterPath', 'vertexNumberFromVertexId', 'nextVertex', 'adjacentVertices', 'coordinateSequence', 'vertexAt', 'closestSegment', 'insertVertex', 'moveVertex', 'deleteVertex', 'segmentLength', 'toCurveType', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'vertexAngle', 'vertexCount', 'ringCount', 'partCount', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'isValid', 'createEmptyWithSameType', 'compareToSameClass')), ('__group__', ('geometry',)))),
+        ('QgsVertexIterator', (('__group__', ('geometry',)),)),
+        ('QgsGeometryPartIterator', (('__group__', ('geometry',)),)),
+        ('QgsGeometryConstPartIterator', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/metadata/qgsabstractlayermetadataprovider.h', (
+        ('QgsMetadataSearchContext', (('__attribute_docs__', (('transformContext', 'Coordinate transform context'),)), ('__annotations__', (('transformContext', 'QgsCoordinateTransformContext'),)), ('__group__', ('metadata',)))),
+        ('QgsAbstractLayerMetadataProvider', (('__abstract_methods__', ('id', 'search')), ('__group__', ('metadata',)))),
+        ('QgsLayerMetadataProviderResult', (('__group__', ('metadata',)),)),
+        ('QgsLayerMetadataSearchResults', (('__group__', ('metadata',)),)),
+    )),
+    ('src/core/layout/qgsabstractlayoutiterator.h', (
+        ('QgsAbstractLayoutIterator', (('__abstract_methods__', ('layout', 'beginRender', 'endRender', 'count', 'next', 'filePath')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/metadata/qgsabstractmetadatabase.h', (
+        ('QgsAbstractMetadataBase', (('__virtual_methods__', ('readMetadataXml', 'writeMetadataXml', 'combine')), ('__abstract_methods__', ('clone',)), ('__group__', ('metadata',)))),
+    )),
+    ('src/core/./3d/qgsabstractpointcloud3drenderer.h', (
+        ('QgsAbstractPointCloud3DRenderer', (('__abstract_methods__', ('convertFrom2DRenderer',)), ('__group__', ('3d',)))),
+    )),
+    ('src/core/elevation/qgsabstractprofilegenerator.h', (
+        ('QgsAbstractProfileResults', (('__virtual_methods__', ('asFeatures', 'snapPoint', 'identify', 'copyPropertiesFromGenerator')), ('__abstract_methods__', ('type', 'distanceToHeightMap', 'sampledPoints', 'asGeometries', 'renderResults', 'zRange')), ('__group__', ('elevation',)))),
+        ('QgsAbstractProfileGenerator', (('__virtual_methods__', ('flags',)), ('__abstract_methods__', ('sourceId', 'generateProfile', 'feedback', 'takeResults')), ('__group__', ('elevation',)))),
+        ('QgsProfileRenderContext', (('__group__', ('elevation',)),)),
+        ('QgsProfileIdentifyResults', (('__group__', ('elevation',)),)),
+        ('QgsProfileGenerationContext', (('__group__', ('elevation',)),)),
+    )),
+    ('src/core/elevation/qgsabstractprofilesource.h', (
+        ('QgsAbstractProfileSource', (('__abstract_methods__', ('createProfileGenerator',)), ('__group__', ('elevation',)))),
+    )),
+    ('src/core/providers/qgsabstractproviderconnection.h', (
+        ('QgsAbstractProviderConnection', (('__virtual_methods__', ('icon',)), ('__abstract_methods__', ('store', 'remove')), ('__group__', ('providers',)))),
+    )),
+    ('src/core/layout/qgsabstractreportsection.h', (
+        ('QgsReportSectionContext', (('__attribute_docs__', (('feature', 'Current feature'), ('currentLayer', 'Current coverage layer'), ('fieldFilters', 'Current field filters'))), ('__annotations__', (('feature', 'QgsFeature'), ('currentLayer', 'QgsVectorLayer'), ('fieldFilters', 'Dict[str, object]'))), ('__group__', ('layout',)))),
+        ('QgsAbstractReportSection', (('__virtual_methods__', ('reset', 'prepareHeader', 'prepareFooter', 'nextBody', 'reloadSettings', 'setParentSection', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__abstract_methods__', ('type', 'description', 'icon', 'clone')), ('__overridden_methods__', ('count', 'filePath', 'layout', 'beginRender', 'next', 'endRender')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/sensor/qgsabstractsensor.h', (
+        ('QgsAbstractSensor.SensorData', (('__attribute_docs__', (('lastValue', 'Last captured sensor value stored as a QVariant.\n\n.. note::\n\n   The member can store multiple values if the sensor passes on a QVariantMap.'), ('lastTimestamp', 'Timestamp of last captured sensor value'))), ('__annotations__', (('lastValue', 'object'), ('lastTimestamp', 'QDateTime'))), ('__group__', ('sensor',)))),
+        ('QgsAbstractSensor', (('__attribute_docs__', (('nameChanged', 'Emitted when the sensor name has changed.\n'), ('statusChanged', 'Emitted when the sensor status has changed.\n'), ('dataChanged', 'Emitted when the captured sensor data has changed.\n'), ('errorOccurred', 'Emitted when an error has occurred. The ``errorString`` describes the\nerror.\n'))), ('__virtual_methods__', ('type', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__abstract_methods__', ('handleConnect', 'handleDisconnect')), ('__signal_arguments__', (('errorOccurred', ('errorString: str',)),)), ('__group__', ('sensor',)))),
+    )),
+    ('src/core/validity/qgsabstractvaliditycheck.h', (
+        ('QgsAbstractValidityCheck', (('__virtual_methods__', ('prepareCheck',)), ('__abstract_methods__', ('create', 'id', 'checkType', 'runCheck')), ('__group__', ('validity',)))),
+    )),
+    ('src/core/actions/qgsaction.h', (
+        ('QgsAction', (('__group__', ('actions',)),)),
+    )),
+    ('src/core/actions/qgsactionmanager.h', (
+        ('QgsActionManager', (('__group__', ('actions',)),)),
+    )),
+    ('src/core/actions/qgsactionscope.h', (
+        ('QgsActionScope', (('__group__', ('actions',)),)),
+    )),
+    ('src/core/actions/qgsactionscoperegistry.h', (
+        ('QgsActionScopeRegistry', (('__attribute_docs__', (('actionScopesChanged', 'Emitted whenever a new action scope is registered or an action scope is\nunregistered.\n'),)), ('__group__', ('actions',)))),
+    )),
+    ('src/core/qgsaggregatecalculator.h', (
+        ('QgsAggregateCalculator', ('stringToAggregate', 'displayName', 'aggregates')),
+    )),
+    ('src/core/qgsanimatedicon.h', (
+        ('QgsAnimatedIcon', (('__attribute_docs__', (('frameChanged', 'Emitted when the icon changed. You should use connectFrameChanged\ninstead of connecting to this signal directly. Connecting to this signal\ndirectly will cause the animation not to be started.\n\n.. seealso:: :py:func:`connectFrameChanged`\n'),)),)),
+    )),
+    ('src/core/annotations/qgsannotation.h', (
+        ('QgsAnnotation', (('__attribute_docs__', (('appearanceChanged', "Emitted whenever the annotation's appearance changes\n"), ('moved', "Emitted when the annotation's position has changed and items need to be\nmoved to reflect this.\n"), ('mapLayerChanged', 'Emitted when the map layer associated with the annotation changes.\n'))), ('__virtual_methods__', ('setAssociatedFeature', 'accept', 'minimumFrameSize')), ('__abstract_methods__', ('clone', 'writeXml', 'readXml', 'renderAnnotation')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationitem.h', (
+        ('QgsAnnotationItem', (('__virtual_methods__', ('flags', 'applyEdit', 'applyEditV2', 'transientEditResults', 'transientEditResultsV2', 'nodes', 'nodesV2', 'copyCommonProperties', 'writeCommonProperties', 'readCommonProperties')), ('__abstract_methods__', ('clone', 'type', 'boundingBox', 'render', 'writeXml', 'readXml')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationitemeditoperation.h', (
+        ('QgsAbstractAnnotationItemEditOperation', (('__abstract_methods__', ('type',)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemEditOperationMoveNode', (('__overridden_methods__', ('type',)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemEditOperationDeleteNode', (('__overridden_methods__', ('type',)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemEditOperationAddNode', (('__overridden_methods__', ('type',)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemEditOperationTranslateItem', (('__overridden_methods__', ('type',)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemEditContext', (('__group__', ('annotations',)),)),
+        ('QgsAnnotationItemEditOperationTransientResults', (('__group__', ('annotations',)),)),
+    )),
+    ('src/core/annotations/qgsannotationitemnode.h', (
+        ('QgsAnnotationItemNode', (('__group__', ('annotations',)),)),
+    )),
+    ('src/core/annotations/qgsannotationitemregistry.h', (
+        ('QgsAnnotationItemRegistry', (('__attribute_docs__', (('typeAdded', 'Emitted whenever a new item type is added to the registry, with the\nspecified ``type`` and visible ``name``.\n'),)), ('__signal_arguments__', (('typeAdded', ('type: str', 'name: str')),)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemAbstractMetadata', (('__abstract_methods__', ('createItem',)), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationlayer.h', (
+        ('QgsAnnotationLayer.LayerOptions', (('__attribute_docs__', (('transformContext', 'Coordinate transform context'),)), ('__annotations__', (('transformContext', 'QgsCoordinateTransformContext'),)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationLayer', (('__overridden_methods__', ('properties', 'clone', 'createMapRenderer', 'extent', 'setTransformContext', 'readXml', 'writeXml', 'writeSymbology', 'readSymbology', 'writeStyle', 'readStyle', 'isEditable', 'supportsEditing', 'dataProvider', 'htmlMetadata', 'resolveReferences')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationlineitem.h', (
+        ('QgsAnnotationLineItem', ('create', ('__overridden_methods__', ('type', 'render', 'writeXml', 'nodesV2', 'applyEditV2', 'transientEditResultsV2', 'flags', 'readXml', 'boundingBox', 'clone')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationlinetextitem.h', (
+        ('QgsAnnotationLineTextItem', ('create', ('__overridden_methods__', ('flags', 'type', 'render', 'writeXml', 'nodesV2', 'applyEditV2', 'transientEditResultsV2', 'readXml', 'boundingBox', 'clone')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationmanager.h', (
+        ('QgsAnnotationManager', (('__attribute_docs__', (('annotationAdded', 'Emitted when a annotation has been added to the manager\n'), ('annotationRemoved', 'Emitted when an annotation was removed from the manager\n'), ('annotationAboutToBeRemoved', 'Emitted when an annotation is about to be removed from the manager\n'))), ('__signal_arguments__', (('annotationAdded', ('annotation: QgsAnnotation',)), ('annotationAboutToBeRemoved', ('annotation: QgsAnnotation',)))), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationmarkeritem.h', (
+        ('QgsAnnotationMarkerItem', ('create', ('__overridden_methods__', ('type', 'render', 'writeXml', 'flags', 'nodesV2', 'applyEditV2', 'transientEditResultsV2', 'readXml', 'clone', 'boundingBox')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationpictureitem.h', (
+        ('QgsAnnotationPictureItem', ('create', ('__overridden_methods__', ('type', 'writeXml', 'readXml', 'clone', 'renderInBounds')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationpointtextitem.h', (
+        ('QgsAnnotationPointTextItem', ('create', ('__overridden_methods__', ('flags', 'type', 'render', 'writeXml', 'readXml', 'clone', 'boundingBox', 'nodesV2', 'applyEditV2', 'transientEditResultsV2')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationpolygonitem.h', (
+        ('QgsAnnotationPolygonItem', ('create', ('__overridden_methods__', ('type', 'render', 'writeXml', 'nodesV2', 'applyEditV2', 'transientEditResultsV2', 'flags', 'readXml', 'clone', 'boundingBox')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationrectangletextitem.h', (
+        ('QgsAnnotationRectangleTextItem', ('create', ('__overridden_methods__', ('type', 'flags', 'writeXml', 'readXml', 'clone', 'renderInBounds')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/annotations/qgsannotationrectitem.h', (
+        ('QgsAnnotationRectItem', (('__abstract_methods__', ('renderInBounds',)), ('__overridden_methods__', ('flags', 'render', 'nodesV2', 'applyEditV2', 'transientEditResultsV2', 'boundingBox', 'copyCommonProperties', 'writeCommonProperties', 'readCommonProperties')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/qgsapplication.h', (
+        ('QgsApplication', (('__attribute_docs__', (('customVariablesChanged', 'Emitted whenever a custom global variable changes.\n'), ('nullRepresentationChanged', 'Emitted when the string representing the `NULL` value is changed.\n\n.. seealso:: :py:func:`setNullRepresentation`\n\n.. seealso:: :py:func:`nullRepresentation`\n'), ('requestForTranslatableObjects', 'Emitted when project strings which require translation are being\ncollected for inclusion in a .ts file. In order to register translatable\nstrings, connect to this signal and register the strings within the\nspecified ``translationContext``.\n\n.. versionadded:: 3.4\n'), ('localeChanged', 'Emitted when project locale has been changed.\n\n.. versionadded:: 3.22.2\n'))), 'instance', 'setFileOpenEventReceiver', 'setThemeName', 'resolvePkgPath', 'themeName', 'setUITheme', 'uiThemes', 'authorsFilePath', 'contributorsFilePath', 'developersMapFilePath', 'sponsorsFilePath', 'donorsFilePath', 'serverResourcesPath', 'translatorsFilePath', 'licenceFilePath', 'i18nPath', 'metadataPath', 'qgisMasterDatabaseFilePath', 'qgisSettingsDirPath', 'qgisUserDatabaseFilePath', 'qgisAuthDatabaseFilePath', 'qgisAuthDatabaseUri', 'splashPath', 'iconsPath', 'srsDatabaseFilePath', 'setSvgPaths', 'svgPaths', 'layoutTemplatePaths', 'systemEnvVars', 'prefixPath', 'pluginPath', 'pkgDataPath', 'activeThemePath', 'defaultThemePath', 'iconPath', 'getThemeIcon', 'getThemeCursor', 'getThemePixmap', 'userStylePath', 'shortNameRegularExpression', 'userLoginName', 'userFullName', 'osName', 'systemMemorySizeMb', 'platform', 'applicationFullName', 'locale', 'setLocale', 'userThemesFolder', 'defaultStylePath', 'defaultThemesFolder', 'libraryPath', 'libexecPath', 'qmlImportPath', 'setPrefixPath', 'setPluginPath', 'setPkgDataPath', 'setDefaultSvgPaths', 'setAuthDatabaseDirPath', 'initQgis', 'createDatabase', 'createThemeFolder', 'exitQgis', 'appIconPath', 'endian', 'reportStyleSheet', 'showSettings', 'registerOgrDrivers', 'absolutePathToRelativePath', 'relativePathToAbsolutePath', 'isRunningFromBuildDir', 'buildSourcePath', 'buildOutputPath', 'skipGdalDriver', 'restoreGdalDriver', 'skippedGdalDrivers', 'applyGdalSkippedDrivers', 'registerGdalDriversFromSettings', 'deferredSkippedGdalDrivers', 'setSkippedGdalDrivers', 'maxThreads', 'setMaxThreads', 'taskManager', 'settingsRegistryCore', 'colorSchemeRegistry', 'paintEffectRegistry', 'rendererRegistry', 'pointCloudRendererRegistry', 'tiledSceneRendererRegistry', 'dataItemProviderRegistry', 'coordinateReferenceSystemRegistry', 'svgCache', 'imageCache', 'sourceCache', 'networkContentFetcherRegistry', 'validityCheckRegistry', 'symbolLayerRegistry', 'calloutRegistry', 'layoutItemRegistry', 'annotationItemRegistry', 'gpsConnectionRegistry', 'gpsBabelFormatRegistry', 'pluginLayerRegistry', 'classificationMethodRegistry', 'bookmarkManager', 'recentStyleHandler', 'databaseQueryLog', 'defaultStyleModel', 'fontManager', 'sensorRegistry', 'messageLog', 'authManager', 'authConfigurationStorageRegistry', 'processingRegistry', 'pageSizeRegistry', 'actionScopeRegistry', 'connectionRegistry', 'profiler', 'numericFormatRegistry', 'fieldFormatterRegistry', 'renderer3DRegistry', 'symbol3DRegistry', 'scaleBarRendererRegistry', 'labelingEngineRuleRegistry', 'projectStorageRegistry', 'layerMetadataProviderRegistry', 'externalStorageRegistry', 'profileSourceRegistry', 'localizedDataPathRegistry', 'nullRepresentation', 'setNullRepresentation', 'customVariables', 'setCustomVariables', 'setCustomVariable', 'scaleIconSize', 'setTranslation', ('__overridden_methods__', ('event', 'notify')), ('__signal_arguments__', (('requestForTranslatableObjects', ('translationContext: QgsTranslationContext',)),)))),
+    )),
+    ('src/core/providers/arcgis/qgsarcgisportalutils.h', (
+        ('QgsArcGisPortalUtils', ('retrieveUserInfo', 'retrieveUserGroups', 'retrieveGroupContent', 'retrieveGroupItemsOfType', ('__group__', ('providers', 'arcgis')))),
+    )),
+    ('src/core/providers/arcgis/qgsarcgisrestutils.h', (
+        ('QgsArcGisRestUtils', ('convertFieldType', 'convertGeometryType', 'convertGeometry', 'convertSpatialReference', 'convertSymbol', 'convertRenderer', 'convertLabeling', 'convertLabelingExpression', 'convertColor', 'convertLineStyle', 'convertFillStyle', 'convertDateTime', 'geometryToJson', 'crsToJson', 'convertRectangle', 'featureToJson', 'variantToAttributeValue', 'fieldDefinitionToJson', 'serviceTypeFromString', ('__group__', ('providers', 'arcgis')))),
+        ('QgsArcGisRestContext', (('__group__', ('providers', 'arcgis')),)),
+    )),
+    ('src/core/qgsarchive.h', (
+        ('QgsArchive', (('__virtual_methods__', ('unzip',)),)),
+        ('QgsProjectArchive', (('__overridden_methods__', ('unzip',)),)),
+    )),
+    ('src/core/symbology/qgsarrowsymbollayer.h', (
+        ('QgsArrowSymbolLayer', ('create', ('__overridden_methods__', ('clone', 'subSymbol', 'setSubSymbol', 'usedAttributes', 'hasDataDefinedProperties', 'usesMapUnits', 'setOutputUnit', 'properties', 'layerType', 'startRender', 'stopRender', 'startFeatureRender', 'stopFeatureRender', 'renderPolyline', 'setColor', 'color', 'canCauseArtifactsBetweenAdjacentTiles')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/editform/qgsattributeeditoraction.h', (
+        ('QgsAttributeEditorAction', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorcontainer.h', (
+        ('QgsAttributeEditorContainer', (('__virtual_methods__', ('addChildElement', 'setIsGroupBox', 'isGroupBox', 'findElements')), ('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorelement.h', (
+        ('QgsAttributeEditorElement', ('create', ('__abstract_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorfield.h', (
+        ('QgsAttributeEditorField', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorhtmlelement.h', (
+        ('QgsAttributeEditorHtmlElement', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorqmlelement.h', (
+        ('QgsAttributeEditorQmlElement', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorrelation.h', (
+        ('QgsAttributeEditorRelation', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditorspacerelement.h', (
+        ('QgsAttributeEditorSpacerElement', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/editform/qgsattributeeditortextelement.h', (
+        ('QgsAttributeEditorTextElement', (('__overridden_methods__', ('clone',)), ('__group__', ('editform',)))),
+    )),
+    ('src/core/auth/qgsauthcertutils.h', (
+        ('QgsAuthCertUtils', ('getSslProtocolName', 'mapDigestToCerts', 'mapDigestToSslConfigs', 'fileData', 'certsFromFile', 'casFromFile', 'certFromFile', 'casMerge', 'keyFromFile', 'certsFromString', 'casRemoveSelfSigned', 'certKeyBundleToPem', 'pemIsPkcs8', 'pkcs12BundleToPem', 'pkcs12BundleCas', 'certsToPemText', 'pemTextToTempFile', 'getCaSourceName', 'resolvedCertName', 'getCertTrustName', 'getColonDelimited', 'shaHexForCert', 'certificateUsageTypes', 'certificateIsAuthority', 'certificateIsIssuer', 'certificateIsAuthorityOrIssuer', 'certificateIsSslServer', 'certificateIsSslClient', 'sslErrorEnumString', 'certIsCurrent', 'certViabilityErrors', 'certIsViable', 'validateCertChain', 'validatePKIBundle', ('__group__', ('auth',)))),
+    )),
+    ('src/core/auth/qgsauthconfig.h', (
+        ('QgsAuthMethodConfig', ('uriToResource', ('__group__', ('auth',)))),
+        ('QgsPkiBundle', (('__group__', ('auth',)),)),
+        ('QgsPkiConfigBundle', (('__group__', ('auth',)),)),
+        ('QgsAuthConfigSslServer', (('__group__', ('auth',)),)),
+    )),
+    ('src/core/auth/qgsauthconfigurationstorage.h', (
+        ('QgsAuthConfigurationStorage', (('__attribute_docs__', (('messageLog', 'Custom logging signal to relay to console output and\n:py:class:`QgsMessageLog`\n\n:param message: Message to send\n:param tag: Associated tag (title)\n:param level: Message log level\n\n.. seealso:: :py:class:`QgsMessageLog`\n'), ('storageChanged', 'Emitted when the storage was updated.\n\n:param id: The storage id\n\n.. note::\n\n   This is a generic changed signal and it is normally\n   emitted together with the dedicated signals which are\n   provided for specific changes on the individual tables.\n'), ('methodConfigChanged', 'Emitted when the storage method config table was changed.\n'), ('masterPasswordChanged', 'Emitted when the storage master password table was changed.\n'), ('authSettingsChanged', 'Emitted when the storage auth settings table was changed.\n'), ('readOnlyChanged', 'Emitted when the storage read-only status was changed.\n'), ('certIdentityChanged', 'Emitted when the storage cert identity table was changed.\n'), ('certAuthorityChanged', 'Emitted when the storage cert authority table was changed.\n'), ('sslCertCustomConfigChanged', 'Emitted when the storage ssl cert custom config table was changed.\n'), ('sslCertTrustPolicyChanged', 'Emitted when the storage ssl cert trust policy table was changed.\n'))), ('__virtual_methods__', ('initialize', 'lastError', 'setReadOnly', 'isReadOnly', 'loggerTag')), ('__abstract_methods__', ('name', 'type', 'description', 'id', 'isReady', 'settingsParameters', 'authMethodConfigs', 'SIP_THROW', 'loadMethodConfig', 'storeMethodConfig', 'removeMethodConfig', 'methodConfigExists', 'storeAuthSetting', 'loadAuthSetting', 'removeAuthSetting', 'authSettingExists', 'storeCertIdentity', 'removeCertIdentity', 'certIdentityExists', 'storeSslCertCustomConfig', 'sslCertCustomConfigExists', 'removeSslCertCustomConfig', 'storeCertAuthority', 'certAuthorityExists', 'removeCertAuthority', 'storeCertTrustPolicy', 'loadCertTrustPolicy', 'removeCertTrustPolicy', 'certTrustPolicyExists', 'storeMasterPassword')), ('__signal_arguments__', (('messageLog', ('message: str', 'tag: str = QStringLiteral( "Authentication" )', 'level: Qgis.MessageLevel = Qgis.MessageLevel.Info')), ('storageChanged', ('id: str',)), ('readOnlyChanged', ('readOnly: bool',)))), ('__group__', ('auth',)))),
+        ('QgsAuthConfigurationStorage.MasterPasswordConfig', (('__group__', ('auth',)),)),
+        ('QgsAuthConfigurationStorage.SettingParameter', (('__group__', ('auth',)),)),
+    )),
+    ('src/core/auth/qgsauthconfigurationstoragedb.h', (
+        ('QgsAuthConfigurationStorageDb', (('__virtual_methods__', ('methodConfigTableName', 'authSettingsTableName', 'certIdentityTableName', 'certAuthorityTableName', 'sslCertCustomConfigTableName', 'certTrustPolicyTableName', 'masterPasswordTableName', 'tableExists', 'quotedQualifiedIdentifier', 'checkCapabilities')), ('__overridden_methods__', ('name', 'type', 'description', 'id', 'authMethodConfigs', 'authMethodConfigsWithPayload', 'loadMethodConfig', 'storeMethodConfig', 'removeMethodConfig', 'methodConfigExists', 'storeAuthSetting', 'loadAuthSetting', 'removeAuthSetting', 'authSettingExists', 'clearMethodConfigs', 'erase', 'isReady', 'initialize', 'settingsParameters', 'storeCertIdentity', 'removeCertIdentity', 'loadCertIdentity', 'loadCertIdentityBundle', 'certIdentities', 'certIdentityIds', 'certIdentityExists', 'storeSslCertCustomConfig', 'sslCertCustomConfigIds', 'loadSslCertCustomConfig', 'loadSslCertCustomConfigByHost', 'sslCertCustomConfigs', 'sslCertCustomConfigExists', 'removeSslCertCustomConfig', 'storeCertAuthority', 'certAuthorityIds', 'loadCertAuthority', 'certAuthorityExists', 'removeCertAuthority', 'caCertsPolicy', 'caCerts', 'storeCertTrustPolicy', 'loadCertTrustPolicy', 'removeCertTrustPolicy', 'certTrustPolicyExists', 'masterPasswords', 'storeMasterPassword', 'clearMasterPasswords')), ('__group__', ('auth',)))),
+    )),
+    ('src/core/auth/qgsauthconfigurationstorageregistry.h', (
+        ('QgsAuthConfigurationStorageRegistry', (('__attribute_docs__', (('storageAdded', 'Emitted after a storage was added\n\n:param id: The id of the added storage\n'), ('storageChanged', 'Emitted after a storage was changed\n\n:param id: The id of the changed storage\n'), ('storageRemoved', 'Emitted after a storage was removed\n\n:param id: The id of the removed storage\n'))), ('__signal_arguments__', (('storageAdded', ('id: str',)), ('storageChanged', ('id: str',)), ('storageRemoved', ('id: str',)))), ('__group__', ('auth',)))),
+    )),
+    ('src/core/auth/qgsauthmethod.h', (
+        ('QgsAuthMethod', ('authMethodTag', ('__virtual_methods__', ('editWidget', 'updateNetworkRequest', 'updateNetworkReply', 'updateDataSourceUriItems', 'updateNetworkProxy')), ('__abstract_methods__', ('key', 'description', 'displayDescription', 'clearCachedConfig', 'updateMethodConfig')), ('__group__', ('auth',)))),
+    )),
+    ('src/core/qgsauxiliarystorage.h', (
+        ('QgsAuxiliaryLayer', ('createProperty', 'createAuxiliaryField', 'nameFromProperty', 'propertyDefinitionFromField', ('__overridden_methods__', ('deleteAttribute',)))),
+        ('QgsAuxiliaryStorage', ('deleteTable', 'duplicateTable', 'extension', 'exists')),
+    )),
+    ('src/core/gps/qgsbabelformat.h', (
+        ('QgsAbstractBabelFormat', ('featureTypeToArgument', ('__virtual_methods__', ('importCommand', 'exportCommand')), ('__group__', ('gps',)))),
+        ('QgsBabelSimpleImportFormat', (('__overridden_methods__', ('importCommand',)), ('__group__', ('gps',)))),
+    )),
+    ('src/core/gps/qgsbabelformatregistry.h', (
+        ('QgsBabelFormatRegistry', (('__group__', ('gps',)),)),
+    )),
+    ('src/core/gps/qgsbabelgpsdevice.h', (
+        ('QgsBabelGpsDeviceFormat', (('__overridden_methods__', ('importCommand', 'exportCommand')), ('__group__', ('gps',)))),
+    )),
+    ('src/core/numericformats/qgsbasicnumericformat.h', (
+        ('QgsBasicNumericFormat', (('__virtual_methods__', ('setNumberDecimalPlaces', 'setConfiguration')), ('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/numericformats/qgsbearingnumericformat.h', (
+        ('QgsBearingNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'suggestSampleValue', 'formatDouble', 'clone', 'create', 'configuration', 'setConfiguration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/qgsbearingutils.h', (
+        ('QgsBearingUtils', ('bearingTrueNorth',)),
+    )),
+    ('src/core/raster/qgsbilinearrasterresampler.h', (
+        ('QgsBilinearRasterResampler', (('__overridden_methods__', ('resample', 'resampleV2', 'type', 'clone', 'tileBufferPixels')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/network/qgsblockingnetworkrequest.h', (
+        ('QgsBlockingNetworkRequest', (('__attribute_docs__', (('downloadProgress', 'Emitted when when data arrives during a request.\n'), ('downloadFinished', 'Emitted once a request has finished downloading.\n\n.. deprecated:: 3.40\n\n   Use the :py:func:`~QgsBlockingNetworkRequest.finished` signal instead.\n'), ('uploadProgress', 'Emitted when when data are sent during a request.\n\n.. versionadded:: 3.22\n'), ('finished', 'Emitted once a request has finished.\n'))), ('__signal_arguments__', (('downloadProgress', ('bytesReceived: int', 'bytesTotal: int')), ('uploadProgress', ('bytesReceived: int', 'bytesTotal: int')))), ('__group__', ('network',)))),
+    )),
+    ('src/core/effects/qgsblureffect.h', (
+        ('QgsBlurEffect', ('create', ('__overridden_methods__', ('flags', 'type', 'properties', 'readProperties', 'clone', 'draw', 'boundingRect')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/qgsbookmarkmanager.h', (
+        ('QgsBookmarkManager', (('__attribute_docs__', (('bookmarkAboutToBeAdded', 'Emitted when a bookmark is about to be added to the manager\n'), ('bookmarkAdded', 'Emitted when a bookmark has been added to the manager\n'), ('bookmarkRemoved', 'Emitted when a bookmark was removed from the manager\n'), ('bookmarkAboutToBeRemoved', 'Emitted when a bookmark is about to be removed from the manager\n'), ('bookmarkChanged', 'Emitted when a bookmark is changed\n'))), 'createProjectBasedManager', 'exportToFile', ('__signal_arguments__', (('bookmarkAboutToBeAdded', ('id: str',)), ('bookmarkAdded', ('id: str',)), ('bookmarkRemoved', ('id: str',)), ('bookmarkAboutToBeRemoved', ('id: str',)), ('bookmarkChanged', ('id: str',)))))),
+        ('QgsBookmark', ('fromXml',)),
+    )),
+    ('src/core/qgsbookmarkmodel.h', (
+        ('QgsBookmarkManagerModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'flags', 'setData', 'insertRows', 'removeRows', 'headerData')),)),
+    )),
+    ('src/core/geometry/qgsbox3d.h', (
+        ('QgsBox3D', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/raster/qgsbrightnesscontrastfilter.h', (
+        ('QgsBrightnessContrastFilter', (('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'setInput', 'block', 'writeXml', 'readXml')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/browser/qgsbrowsermodel.h', (
+        ('QgsBrowserModel', (('__attribute_docs__', (('stateChanged', 'Emitted when item children fetch was finished\n'), ('connectionsChanged', 'Emitted when connections for the specified ``providerKey`` have changed\nin the browser.\n\nForwarded to the widget and used to notify the provider dialogs of a\nchanged connection.\n'))), ('__overridden_methods__', ('flags', 'data', 'setData', 'headerData', 'rowCount', 'columnCount', 'index', 'parent', 'mimeTypes', 'mimeData', 'dropMimeData', 'hasChildren', 'canFetchMore', 'fetchMore')), ('__signal_arguments__', (('stateChanged', ('index: QModelIndex', 'oldState: Qgis.BrowserItemState')), ('connectionsChanged', ('providerKey: str',)))), ('__group__', ('browser',)))),
+    )),
+    ('src/core/browser/qgsbrowserproxymodel.h', (
+        ('QgsBrowserProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'hasChildren')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgscachedfeatureiterator.h', (
+        ('QgsCachedFeatureIterator', (('__overridden_methods__', ('rewind', 'close', 'fetchFeature', 'nextFeatureFilterFids')),)),
+        ('QgsCachedFeatureWriterIterator', (('__overridden_methods__', ('rewind', 'close', 'fetchFeature')),)),
+    )),
+    ('src/core/qgscacheindex.h', (
+        ('QgsAbstractCacheIndex', (('__virtual_methods__', ('requestCompleted',)), ('__abstract_methods__', ('flushFeature', 'flush', 'getCacheIterator')))),
+    )),
+    ('src/core/qgscacheindexfeatureid.h', (
+        ('QgsCacheIndexFeatureId', (('__overridden_methods__', ('flushFeature', 'flush', 'requestCompleted', 'getCacheIterator')),)),
+    )),
+    ('src/core/qgscadutils.h', (
+        ('QgsCadUtils', ('alignMapPoint',)),
+    )),
+    ('src/core/callouts/qgscallout.h', (
+        ('QgsCallout', ('propertyDefinitions', 'encodeAnchorPoint', 'decodeAnchorPoint', 'encodeLabelAnchorPoint', 'decodeLabelAnchorPoint', ('__virtual_methods__', ('properties', 'readProperties', 'saveProperties', 'restoreProperties', 'startRender', 'stopRender', 'referencedFields', 'drawOrder')), ('__abstract_methods__', ('type', 'clone', 'draw')), ('__group__', ('callouts',)))),
+        ('QgsSimpleLineCallout', ('create', ('__virtual_methods__', ('createCalloutLine',)), ('__overridden_methods__', ('type', 'clone', 'properties', 'readProperties', 'startRender', 'stopRender', 'referencedFields', 'draw')), ('__group__', ('callouts',)))),
+        ('QgsManhattanLineCallout', ('create', ('__overridden_methods__', ('type', 'clone', 'createCalloutLine')), ('__group__', ('callouts',)))),
+        ('QgsCurvedLineCallout', ('create', ('__overridden_methods__', ('type', 'clone', 'properties', 'createCalloutLine')), ('__group__', ('callouts',)))),
+        ('QgsBalloonCallout', ('create', ('__overridden_methods__', ('type', 'clone', 'properties', 'readProperties', 'startRender', 'stopRender', 'referencedFields', 'draw')), ('__group__', ('callouts',)))),
+    )),
+    ('src/core/callouts/qgscalloutsregistry.h', (
+        ('QgsCalloutRegistry', ('defaultCallout', ('__group__', ('callouts',)))),
+        ('QgsCalloutAbstractMetadata', (('__virtual_methods__', ('createCalloutWidget',)), ('__abstract_methods__', ('createCallout',)), ('__group__', ('callouts',)))),
+        ('QgsCalloutMetadata', (('__overridden_methods__', ('createCallout', 'createCalloutWidget')), ('__group__', ('callouts',)))),
+    )),
+    ('src/core/symbology/qgscategorizedsymbolrenderer.h', (
+        ('QgsCategorizedSymbolRenderer', ('create', 'convertFromRenderer', 'createCategories', 'displayString', ('__overridden_methods__', ('flags', 'symbolForFeature', 'originalSymbolForFeature', 'startRender', 'stopRender', 'usedAttributes', 'filterNeedsGeometry', 'dump', 'clone', 'toSld', 'capabilities', 'filter', 'symbols', 'accept', 'save', 'legendSymbolItems', 'legendKeysForFeature', 'legendKeyToExpression', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'setLegendSymbolItem', 'checkLegendSymbolItem', 'legendClassificationAttribute')), ('__group__', ('symbology',)))),
+        ('QgsRendererCategory', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/proj/qgscelestialbody.h', (
+        ('QgsCelestialBody', (('__group__', ('proj',)),)),
+    )),
+    ('src/core/tiledscene/qgscesiumutils.h', (
+        ('QgsCesiumUtils.B3DMContents', (('__attribute_docs__', (('gltf', 'GLTF binary content'), ('rtcCenter', 'Optional RTC center'))), ('__annotations__', (('gltf', 'QByteArray'), ('rtcCenter', 'QgsVector3D'))), ('__group__', ('tiledscene',)))),
+        ('QgsCesiumUtils.TileContents', (('__attribute_docs__', (('gltf', 'GLTF binary content'), ('rtcCenter', 'Center position of relative-to-center coordinates (when used)'))), ('__annotations__', (('gltf', 'QByteArray'), ('rtcCenter', 'QgsVector3D'))), ('__group__', ('tiledscene',)))),
+        ('QgsCesiumUtils', ('parseRegion', 'parseBox', 'parseSphere', 'transformSphere', 'extractGltfFromB3dm', 'extractGltfFromTileContent', ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/fieldformatter/qgscheckboxfieldformatter.h', (
+        ('QgsCheckBoxFieldFormatter', (('__overridden_methods__', ('id', 'representValue')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/geometry/qgscircle.h', (
+        ('QgsCircle', ('from2Points', 'from3Points', 'fromCenterDiameter', 'fromCenterPoint', 'from3Tangents', 'from3TangentsMulti', 'fromExtent', 'minimalCircleFrom3Points', 'calculateSegments', 'calculateSegmentsStandard', 'calculateSegmentsAdaptive', 'calculateSegmentsByAreaError', 'calculateSegmentsByConstant', ('__overridden_methods__', ('area', 'perimeter', 'setSemiMajorAxis', 'setSemiMinorAxis', 'boundingBox', 'toString')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgscircularstring.h', (
+        ('QgsCircularString', ('fromTwoPointsAndCenter', ('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'equals', 'geometryType', 'dimension', 'clone', 'clear', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'isEmpty', 'isValid', 'numPoints', 'indexOf', 'points', 'length', 'startPoint', 'endPoint', 'curveToLine', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'draw', 'transform', 'addToPainterPath', 'drawAsPolygon', 'insertVertex', 'moveVertex', 'deleteVertex', 'closestSegment', 'pointAt', 'sumUpArea', 'hasCurvedSegments', 'vertexAngle', 'segmentLength', 'reversed', 'interpolatePoint', 'curveSubstring', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'xAt', 'yAt', 'zAt', 'mAt', 'scroll', 'createEmptyWithSameType', 'compareToSameClass', 'calculateBoundingBox3D')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/classification/qgsclassificationcustom.h', (
+        ('QgsClassificationCustom', (('__overridden_methods__', ('clone', 'name', 'id', 'valuesRequired')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationequalinterval.h', (
+        ('QgsClassificationEqualInterval', (('__overridden_methods__', ('name', 'id', 'clone', 'icon', 'valuesRequired')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationfixedinterval.h', (
+        ('QgsClassificationFixedInterval', (('__overridden_methods__', ('clone', 'name', 'id', 'icon', 'valuesRequired')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationjenks.h', (
+        ('QgsClassificationJenks', (('__overridden_methods__', ('name', 'id', 'clone', 'icon')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationlogarithmic.h', (
+        ('QgsClassificationLogarithmic', (('__overridden_methods__', ('clone', 'name', 'id', 'icon', 'labelForRange', 'valuesRequired')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationmethod.h', (
+        ('QgsClassificationMethod', ('rangesToBreaks', 'create', 'makeBreaksSymmetric', ('__virtual_methods__', ('icon', 'writeXml', 'readXml', 'valuesRequired')), ('__abstract_methods__', ('clone', 'name', 'id')), ('__group__', ('classification',)))),
+        ('QgsClassificationRange', (('__group__', ('classification',)),)),
+    )),
+    ('src/core/classification/qgsclassificationmethodregistry.h', (
+        ('QgsClassificationMethodRegistry', (('__group__', ('classification',)),)),
+    )),
+    ('src/core/classification/qgsclassificationprettybreaks.h', (
+        ('QgsClassificationPrettyBreaks', (('__overridden_methods__', ('name', 'id', 'clone', 'icon', 'valuesRequired')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationquantile.h', (
+        ('QgsClassificationQuantile', (('__overridden_methods__', ('name', 'id', 'clone', 'icon')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/classification/qgsclassificationstandarddeviation.h', (
+        ('QgsClassificationStandardDeviation', (('__overridden_methods__', ('name', 'id', 'clone', 'icon', 'labelForRange', 'writeXml', 'readXml')), ('__group__', ('classification',)))),
+    )),
+    ('src/core/raster/qgscliptominmaxenhancement.h', (
+        ('QgsClipToMinMaxEnhancement', (('__overridden_methods__', ('enhance', 'isValueInDisplayableRange')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/symbology/qgscolorbrewerpalette.h', (
+        ('QgsColorBrewerPalette', ('listSchemeColors', 'listSchemes', 'listSchemeVariants', ('__group__', ('symbology',)))),
+    )),
+    ('src/core/effects/qgscoloreffect.h', (
+        ('QgsColorEffect', ('create', ('__overridden_methods__', ('flags', 'type', 'properties', 'readProperties', 'clone', 'draw')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/qgscolorramp.h', (
+        ('QgsColorRamp', ('rampTypes', ('__virtual_methods__', ('invert',)), ('__abstract_methods__', ('count', 'value', 'color', 'type', 'clone', 'properties')))),
+    )),
+    ('src/core/qgscolorrampimpl.h', (
+        ('QgsGradientColorRamp', ('create', 'typeString', ('__overridden_methods__', ('count', 'value', 'color', 'type', 'invert', 'clone', 'properties')))),
+        ('QgsLimitedRandomColorRamp', ('create', 'typeString', 'randomColors', ('__overridden_methods__', ('value', 'color', 'type', 'clone', 'properties', 'count')))),
+        ('QgsRandomColorRamp', ('typeString', ('__virtual_methods__', ('setTotalColorCount',)), ('__overridden_methods__', ('count', 'value', 'color', 'type', 'clone', 'properties')))),
+        ('QgsPresetSchemeColorRamp', ('create', 'typeString', ('__overridden_methods__', ('setColors', 'value', 'color', 'type', 'invert', 'clone', 'properties', 'count', 'schemeName', 'fetchColors', 'isEditable')))),
+        ('QgsColorBrewerColorRamp', ('create', 'typeString', 'listSchemeNames', 'listSchemeVariants', ('__overridden_methods__', ('value', 'color', 'type', 'invert', 'clone', 'properties', 'count')))),
+        ('QgsCptCityColorRamp', ('create', 'typeString', ('__overridden_methods__', ('type', 'invert', 'clone', 'properties')))),
+    )),
+    ('src/core/layertree/qgscolorramplegendnode.h', (
+        ('QgsColorRampLegendNode', (('__overridden_methods__', ('data', 'drawSymbol', 'drawSymbolText', 'exportSymbolToJson')), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgscolorramplegendnodesettings.h', (
+        ('QgsColorRampLegendNodeSettings', (('__group__', ('layertree',)),)),
+    )),
+    ('src/core/raster/qgscolorrampshader.h', (
+        ('QgsColorRampShader', (('__overridden_methods__', ('shade', 'legendSymbologyItems')), ('__group__', ('raster',)))),
+        ('QgsColorRampShader.ColorRampItem', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/qgscolorscheme.h', (
+        ('QgsRecentColorScheme', ('addRecentColor', 'lastUsedColor', ('__overridden_methods__', ('schemeName', 'flags', 'fetchColors', 'clone')))),
+        ('QgsColorScheme', (('__virtual_methods__', ('flags', 'fetchColors', 'isEditable', 'setColors')), ('__abstract_methods__', ('schemeName', 'fetchColors', 'clone')))),
+        ('QgsGplColorScheme', (('__abstract_methods__', ('gplFilePath',)), ('__overridden_methods__', ('fetchColors', 'setColors')))),
+        ('QgsUserColorScheme', (('__overridden_methods__', ('schemeName', 'clone', 'isEditable', 'flags', 'gplFilePath')),)),
+        ('QgsCustomColorScheme', (('__overridden_methods__', ('schemeName', 'flags', 'fetchColors', 'isEditable', 'setColors', 'clone')),)),
+        ('QgsProjectColorScheme', (('__overridden_methods__', ('schemeName', 'flags', 'fetchColors', 'isEditable', 'setColors', 'clone')),)),
+    )),
+    ('src/core/qgscolorutils.h', (
+        ('QgsColorUtils', ('writeXml', 'readXml', 'colorToString', 'colorFromString', 'iccProfile', 'saveIccProfile')),
+    )),
+    ('src/core/symbology/qgscombinedstylemodel.h', (
+        ('QgsCombinedStyleModel', (('__overridden_methods__', ('headerData',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgscommandlineutils.h', (
+        ('QgsCommandLineUtils', ('allVersions',)),
+    )),
+    ('src/core/geometry/qgscompoundcurve.h', (
+        ('QgsCompoundCurve', (('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'equals', 'geometryType', 'dimension', 'clone', 'clear', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'length', 'startPoint', 'endPoint', 'points', 'numPoints', 'isEmpty', 'isValid', 'indexOf', 'curveToLine', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'boundingBoxIntersects', 'simplifiedTypeRef', 'draw', 'transform', 'addToPainterPath', 'drawAsPolygon', 'insertVertex', 'moveVertex', 'deleteVertex', 'closestSegment', 'pointAt', 'sumUpArea', 'hasCurvedSegments', 'vertexAngle', 'segmentLength', 'reversed', 'interpolatePoint', 'curveSubstring', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'xAt', 'yAt', 'zAt', 'mAt', 'scroll', 'createEmptyWithSameType', 'compareToSameClass', 'calculateBoundingBox3D')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsconditionalstyle.h', (
+        ('QgsConditionalLayerStyles', (('__attribute_docs__', (('changed', 'Emitted when the conditional styles are changed.\n\n.. versionadded:: 3.10\n'),)),)),
+        ('QgsConditionalStyle', ('matchingConditionalStyles', 'matchingConditionalStyle', 'compressStyles')),
+    )),
+    ('src/core/browser/qgsconnectionsitem.h', (
+        ('QgsConnectionsRootItem', (('__group__', ('browser',)),)),
+    )),
+    ('src/core/raster/qgscontrastenhancement.h', (
+        ('QgsContrastEnhancement', ('maximumValuePossible', 'minimumValuePossible', 'contrastEnhancementAlgorithmString', 'contrastEnhancementAlgorithmFromString', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgscontrastenhancementfunction.h', (
+        ('QgsContrastEnhancementFunction', (('__virtual_methods__', ('enhance', 'isValueInDisplayableRange')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/qgscoordinateformatter.h', (
+        ('QgsCoordinateFormatter', ('formatX', 'formatY', 'format', 'asPair', 'separator')),
+    )),
+    ('src/core/numericformats/qgscoordinatenumericformat.h', (
+        ('QgsGeographicCoordinateNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'suggestSampleValue', 'formatDouble', 'clone', 'create', 'configuration', 'setConfiguration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/proj/qgscoordinatereferencesystem.h', (
+        ('QgsCoordinateReferenceSystem', ('validSrsIds', 'fromOgcWmsCrs', 'fromEpsgId', 'fromProj4', 'fromProj', 'fromWkt', 'fromSrsId', 'createCompoundCrs', 'createGeocentricCrs', 'setupESRIWktFix', 'syncDatabase', 'recentProjections', 'recentCoordinateReferenceSystems', 'pushRecentCoordinateReferenceSystem', 'removeRecentCoordinateReferenceSystem', 'clearRecentCoordinateReferenceSystems', 'invalidateCache', ('__group__', ('proj',)))),
+    )),
+    ('src/core/proj/qgscoordinatereferencesystemregistry.h', (
+        ('QgsCoordinateReferenceSystemRegistry', (('__attribute_docs__', (('userCrsChanged', 'Emitted whenever an existing user CRS definition is changed.\n\nThe ``id`` argument specifies the ID of the user CRS which has been\nchanged.\n\nObjects which store :py:class:`QgsCoordinateReferenceSystem` members\nshould connect to this signal and update any stored CRS definitions to\nensure that they always use the current definition of any user defined\nCRSes.\n\n.. seealso:: :py:func:`crsDefinitionsChanged`\n\n.. seealso:: :py:func:`userCrsAdded`\n'), ('userCrsAdded', 'Emitted whenever a new user CRS definition is added.\n\nThe ``id`` argument specifies the ID of the user CRS which has been\nchanged.\n\n.. seealso:: :py:func:`userCrsChanged`\n\n.. seealso:: :py:func:`crsDefinitionsChanged`\n'), ('userCrsRemoved', 'Emitted when the user CRS with matching ``id`` is removed from the\ndatabase.\n\n.. seealso:: :py:func:`removeUserCrs`\n'), ('crsDefinitionsChanged', 'Emitted whenever an operation has caused any of the known CRS\ndefinitions (including user-defined CRS) to change.\n'), ('recentCrsPushed', 'Emitted when a recently used CRS has been pushed to the top of the\nrecent CRS list.\n\n.. seealso:: :py:func:`pushRecent`\n\n.. versionadded:: 3.36\n'), ('recentCrsRemoved', 'Emitted when a recently used CRS has been removed from the recent CRS\nlist.\n\n.. seealso:: :py:func:`removeRecent`\n\n.. versionadded:: 3.36\n'), ('recentCrsCleared', 'Emitted when the list of recently used CRS has been cleared.\n\n.. seealso:: :py:func:`clearRecent`\n\n.. versionadded:: 3.36\n'))), ('__signal_arguments__', (('userCrsChanged', ('id: str',)), ('userCrsAdded', ('id: str',)), ('userCrsRemoved', ('id: int',)), ('recentCrsPushed', ('crs: QgsCoordinateReferenceSystem',)), ('recentCrsRemoved', ('crs: QgsCoordinateReferenceSystem',)))), ('__group__', ('proj',)))),
+    )),
+    ('src/core/proj/qgscoordinatereferencesystemutils.h', (
+        ('QgsCoordinateReferenceSystemUtils', ('defaultCoordinateOrderForCrs', 'axisDirectionToAbbreviatedString', 'crsTypeToString', 'translateProjection', ('__group__', ('proj',)))),
+    )),
+    ('src/core/proj/qgscoordinatetransform.h', (
+        ('QgsCoordinateTransform', ('isTransformationPossible', 'invalidateCache', ('__group__', ('proj',)))),
+    )),
+    ('src/core/proj/qgscoordinatetransformcontext.h', (
+        ('QgsCoordinateTransformContext', (('__group__', ('proj',)),)),
+    )),
+    ('src/core/qgscopyfiletask.h', (
+        ('QgsCopyFileTask', (('__overridden_methods__', ('run',)),)),
+    )),
+    ('src/core/symbology/qgscptcityarchive.h', (
+        ('QgsCptCityDataItem', (('__attribute_docs__', (('beginInsertItems', 'Emitted before child items are added to this item.\n\nThis signal *must* be followed by\n:py:func:`~QgsCptCityDataItem.endInsertItems`.\n\n:param parent: the parent item having children added\n:param first: index of first child item to be added\n:param last: index last child item, after the addition has occurred\n\n.. seealso:: :py:func:`endInsertItems`\n'), ('endInsertItems', 'Emitted after child items have been added to this data item.\n\nThis signal will always be preceded by\n:py:func:`~QgsCptCityDataItem.beginInsertItems`.\n\n.. seealso:: :py:func:`beginInsertItems`\n'), ('beginRemoveItems', 'Emitted before child items are removed from this data item.\n\nThis signal *must* be followed by\n:py:func:`~QgsCptCityDataItem.endRemoveItems`.\n\n:param parent: the parent item having children removed\n:param first: index of first child item to be removed\n:param last: index of the last child item to be removed\n\n.. seealso:: :py:func:`endRemoveItems`\n'), ('endRemoveItems', 'Emitted after child items have been removed from this data item.\n\nThis signal will always be preceded by\n:py:func:`~QgsCptCityDataItem.beginRemoveItems`.\n\n.. seealso:: :py:func:`beginRemoveItems`\n'))), 'findItem', ('__virtual_methods__', ('leafCount', 'refresh', 'createChildren', 'populate', 'addChildItem', 'deleteChildItem', 'removeChildItem', 'equal', 'paramWidget', 'acceptDrop', 'handleDrop', 'icon')), ('__signal_arguments__', (('beginInsertItems', ('parent: QgsCptCityDataItem', 'first: int', 'last: int')), ('beginRemoveItems', ('parent: QgsCptCityDataItem', 'first: int', 'last: int')))), ('__group__', ('symbology',)))),
+        ('QgsCptCityArchive', ('defaultBaseDir', 'findFileName', 'copyingInfo', 'description', 'initArchives', 'initArchive', 'initDefaultArchive', 'clearArchives', 'defaultArchive', 'archiveRegistry', ('__group__', ('symbology',)))),
+        ('QgsCptCityDirectoryItem', ('dataItem', ('__overridden_methods__', ('createChildren', 'equal')), ('__group__', ('symbology',)))),
+        ('QgsCptCityColorRampItem', (('__overridden_methods__', ('equal', 'leafCount', 'icon')), ('__group__', ('symbology',)))),
+        ('QgsCptCitySelectionItem', (('__overridden_methods__', ('createChildren', 'equal')), ('__group__', ('symbology',)))),
+        ('QgsCptCityAllRampsItem', (('__overridden_methods__', ('createChildren',)), ('__group__', ('symbology',)))),
+        ('QgsCptCityBrowserModel', (('__overridden_methods__', ('flags', 'data', 'headerData', 'rowCount', 'columnCount', 'index', 'parent', 'hasChildren', 'canFetchMore', 'fetchMore')), ('__group__', ('symbology',)))),
+        ('QgsCptCityCollectionItem', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/qgscredentials.h', (
+        ('QgsCredentialsNone', (('__attribute_docs__', (('destroyed', "signals that object will be destroyed and shouldn't be used anymore\n"),)), ('__overridden_methods__', ('request', 'requestMasterPassword')))),
+        ('QgsCredentialsConsole', (('__attribute_docs__', (('destroyed', "signals that object will be destroyed and shouldn't be used anymore\n"),)), ('__overridden_methods__', ('request', 'requestMasterPassword')))),
+        ('QgsCredentials', ('instance', ('__abstract_methods__', ('request', 'requestMasterPassword')))),
+    )),
+    ('src/core/raster/qgscubicrasterresampler.h', (
+        ('QgsCubicRasterResampler', (('__overridden_methods__', ('clone', 'resampleV2', 'resample', 'type', 'tileBufferPixels')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/numericformats/qgscurrencynumericformat.h', (
+        ('QgsCurrencyNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'suggestSampleValue', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/geometry/qgscurve.h', (
+        ('QgsCurve', (('__virtual_methods__', ('isClosed', 'isClosed2D', 'isRing', 'asQPolygonF')), ('__abstract_methods__', ('equals', 'clone', 'startPoint', 'endPoint', 'curveToLine', 'addToPainterPath', 'drawAsPolygon', 'points', 'numPoints', 'sumUpArea', 'pointAt', 'indexOf', 'reversed', 'xAt', 'yAt', 'zAt', 'mAt', 'interpolatePoint', 'curveSubstring', 'scroll')), ('__overridden_methods__', ('operator==', 'operator!=', 'clone', 'asQPainterPath', 'coordinateSequence', 'nextVertex', 'adjacentVertices', 'vertexNumberFromVertexId', 'boundary', 'asKml', 'segmentize', 'vertexCount', 'ringCount', 'partCount', 'vertexAt', 'toCurveType', 'normalize', 'boundingBox3D', 'isValid', 'clearCache', 'childCount', 'childPoint')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgscurvepolygon.h', (
+        ('QgsCurvePolygon', (('__virtual_methods__', ('surfaceToPolygon', 'toPolygon', 'setExteriorRing', 'addInteriorRing')), ('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'operator==', 'operator!=', 'geometryType', 'dimension', 'clone', 'clear', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'normalize', 'area', 'perimeter', 'boundary', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'boundingBoxIntersects', 'asQPainterPath', 'draw', 'transform', 'insertVertex', 'moveVertex', 'deleteVertex', 'coordinateSequence', 'nCoordinates', 'vertexNumberFromVertexId', 'isEmpty', 'closestSegment', 'nextVertex', 'adjacentVertices', 'hasCurvedSegments', 'segmentize', 'vertexAngle', 'vertexCount', 'ringCount', 'partCount', 'vertexAt', 'segmentLength', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'toCurveType', 'createEmptyWithSameType', 'childCount', 'childGeometry', 'compareToSameClass', 'calculateBoundingBox3D')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/browser/qgsdatabaseschemaitem.h', (
+        ('QgsDatabaseSchemaItem', (('__overridden_methods__', ('databaseConnection',)), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsdatabaseschemamodel.h', (
+        ('QgsDatabaseSchemaModel', (('__overridden_methods__', ('parent', 'rowCount', 'columnCount', 'data', 'index')),)),
+    )),
+    ('src/core/qgsdatabasetablemodel.h', (
+        ('QgsDatabaseTableModel', (('__overridden_methods__', ('parent', 'rowCount', 'columnCount', 'data', 'index')),)),
+    )),
+    ('src/core/browser/qgsdatacollectionitem.h', (
+        ('QgsDataCollectionItem', ('iconDir', 'iconDataCollection', 'openDirIcon', 'homeDirIcon', ('__overridden_methods__', ('databaseConnection',)), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsdatadefinedsizelegend.h', (
+        ('QgsDataDefinedSizeLegend', ('readXml',)),
+    )),
+    ('src/core/browser/qgsdataitem.h', (
+        ('QgsDataItem', (('__attribute_docs__', (('beginInsertItems', 'Emitted before child items are added to this data item.\n\nThis signal *must* be followed by\n:py:func:`~QgsDataItem.endInsertItems`.\n\n:param parent: the parent item having children added, will always be\n               this object\n:param first: index of first child item to be added\n:param last: index last child item, after the addition has occurred\n\n.. seealso:: :py:func:`endInsertItems`\n'), ('endInsertItems', 'Emitted after child items have been added to this data item.\n\nThis signal will always be preceded by\n:py:func:`~QgsDataItem.beginInsertItems`.\n\n.. seealso:: :py:func:`beginInsertItems`\n'), ('beginRemoveItems', 'Emitted before child items are removed from this data item.\n\nThis signal *must* be followed by\n:py:func:`~QgsDataItem.endRemoveItems`.\n\n:param parent: the parent item having children removed, will always be\n               this object\n:param first: index of first child item to be removed\n:param last: index of the last child item to be removed\n\n.. seealso:: :py:func:`endRemoveItems`\n'), ('endRemoveItems', 'Emitted after child items have been removed from this data item.\n\nThis signal will always be preceded by\n:py:func:`~QgsDataItem.beginRemoveItems`.\n\n.. seealso:: :py:func:`beginRemoveItems`\n'), ('dataChanged', 'Emitted when data changes for an ``item``.\n'), ('stateChanged', "Emitted when an item's state is changed.\n"), ('connectionsChanged', 'Emitted when the connections of the provider with the specified\n``providerKey`` have changed.\n\nThis signal is normally forwarded to the app in order to refresh the\nconnection item in the provider dialogs and to refresh the connection\nitems in the other open browsers.\n'))), 'findItem', 'pathComponent', ('__virtual_methods__', ('layerCollection', 'createChildren', 'setState', 'addChildItem', 'deleteChildItem', 'removeChildItem', 'equal', 'paramWidget', 'actions', 'menus', 'acceptDrop', 'handleDrop', 'handleDoubleClick', 'hasDragEnabled', 'mimeUri', 'mimeUris', 'setCrs', 'rename', 'capabilities2', 'SIP_PYNAME', 'icon', 'sortKey', 'databaseConnection', 'populate', 'refresh', 'depopulate', 'refreshConnections', 'childrenCreated')), ('__signal_arguments__', (('beginInsertItems', ('parent: QgsDataItem', 'first: int', 'last: int')), ('beginRemoveItems', ('parent: QgsDataItem', 'first: int', 'last: int')), ('dataChanged', ('item: QgsDataItem',)), ('stateChanged', ('item: QgsDataItem', 'oldState: Qgis.BrowserItemState')), ('connectionsChanged', ('providerKey: Optional[str] = None',)))), ('__group__', ('browser',)))),
+        ('QgsErrorItem', (('__group__', ('browser',)),)),
+    )),
+    ('src/core/browser/qgsdataitemprovider.h', (
+        ('QgsDataItemProvider', (('__virtual_methods__', ('dataProviderKey', 'createDataItems', 'handlesDirectoryPath')), ('__abstract_methods__', ('name', 'capabilities', 'createDataItem')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/browser/qgsdataitemproviderregistry.h', (
+        ('QgsDataItemProviderRegistry', (('__attribute_docs__', (('providerAdded', 'Emitted when a new data item provider has been added.\n\n.. versionadded:: 3.14\n'), ('providerWillBeRemoved', 'Emitted when a data item provider is about to be removed\n\n.. versionadded:: 3.14\n'))), ('__signal_arguments__', (('providerAdded', ('provider: QgsDataItemProvider',)), ('providerWillBeRemoved', ('provider: QgsDataItemProvider',)))), ('__group__', ('browser',)))),
+    )),
+    ('src/core/providers/qgsdataprovider.h', (
+        ('QgsDataProvider.ProviderOptions', (('__attribute_docs__', (('transformContext', 'Coordinate transform context'),)), ('__annotations__', (('transformContext', 'QgsCoordinateTransformContext'),)), ('__group__', ('providers',)))),
+        ('QgsDataProvider', (('__attribute_docs__', (('fullExtentCalculated', 'Emitted whenever a deferred extent calculation is completed by the\nprovider.\n\nLayers should connect to this signal and update their cached extents\nwhenever it is emitted.\n'), ('dataChanged', "Emitted whenever a change is made to the data provider which may have\ncaused changes in the provider's data OUTSIDE of QGIS.\n\nWhen emitted from a :py:class:`QgsVectorDataProvider`, any cached\ninformation such as feature ids should be invalidated.\n\n.. warning::\n\n   This signal is NOT emitted when changes are made to a provider\n   from INSIDE QGIS -- e.g. when adding features to a vector layer, deleting features\n   or modifying existing features. Instead, the specific :py:class:`QgsVectorLayer` signals\n   should be used to detect these operations.\n"), ('notify', 'Emitted when the datasource issues a notification.\n\n.. seealso:: :py:func:`setListening`\n'))), 'sublayerSeparator', ('__virtual_methods__', ('setDataSourceUri', 'dataSourceUri', 'dataComment', 'htmlMetadata', 'flags', 'temporalCapabilities', 'elevationProperties', 'extent3D', 'updateExtents', 'subsetStringDialect', 'subsetStringHelpUrl', 'setSubsetString', 'supportsSubsetString', 'subsetString', 'subLayers', 'subLayerStyles', 'subLayerCount', 'setLayerOrder', 'setSubLayerVisibility', 'fileVectorFilters', 'fileRasterFilters', 'reloadData', 'timestamp', 'dataTimestamp', 'error', 'invalidateConnections', 'enterUpdateMode', 'leaveUpdateMode', 'setListening', 'layerMetadata', 'writeLayerMetadata', 'styleStorageCapabilities')), ('__abstract_methods__', ('crs', 'extent', 'isValid', 'name', 'description')), ('__signal_arguments__', (('notify', ('msg: str',)),)), ('__group__', ('providers',)))),
+    )),
+    ('src/core/qgsdataproviderelevationproperties.h', (
+        ('QgsDataProviderElevationProperties', (('__virtual_methods__', ('containsElevationData', 'setContainsElevationData')),)),
+    )),
+    ('src/core/qgsdatasourceuri.h', (
+        ('QgsDataSourceUri', ('removePassword', 'decodeSslMode', 'encodeSslMode')),
+    )),
+    ('src/core/fieldformatter/qgsdatetimefieldformatter.h', (
+        ('QgsDateTimeFieldFormatter', ('defaultFormat', 'defaultDisplayFormat', ('__overridden_methods__', ('id', 'representValue')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/qgsdatetimestatisticalsummary.h', (
+        ('QgsDateTimeStatisticalSummary', ('displayName',)),
+    )),
+    ('src/core/proj/qgsdatums.h', (
+        ('QgsDatumEnsembleMember', (('__group__', ('proj',)),)),
+        ('QgsDatumEnsemble', (('__group__', ('proj',)),)),
+    )),
+    ('src/core/proj/qgsdatumtransform.h', (
+        ('QgsDatumTransform', ('operations', 'datumTransformations', 'datumTransformToProj', 'projStringToDatumTransformId', 'datumTransformInfo', ('__group__', ('proj',)))),
+    )),
+    ('src/core/qgsdbfilterproxymodel.h', (
+        ('QgsDatabaseFilterProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)),)),
+    )),
+    ('src/core/qgsdbquerylog.h', (
+        ('QgsDatabaseQueryLog', ('enabled', 'log', 'finished')),
+    )),
+    ('src/core/diagram/qgsdiagram.h', (
+        ('QgsDiagram', (('__abstract_methods__', ('clone', 'renderDiagram', 'diagramName', 'diagramSize', 'legendSize')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/qgsdiagramrenderer.h', (
+        ('QgsDiagramRenderer', ('dpiPaintDevice', ('__virtual_methods__', ('sizeMapUnits', 'referencedFields', 'renderDiagram', 'legendItems')), ('__abstract_methods__', ('clone', 'rendererName', 'diagramAttributes', 'diagramSettings', 'readXml', 'writeXml', 'diagramSize')))),
+        ('QgsSingleCategoryDiagramRenderer', (('__overridden_methods__', ('clone', 'rendererName', 'diagramAttributes', 'diagramSettings', 'readXml', 'writeXml', 'legendItems', 'diagramSize')),)),
+        ('QgsLinearlyInterpolatedDiagramRenderer', (('__overridden_methods__', ('clone', 'diagramSettings', 'diagramAttributes', 'referencedFields', 'rendererName', 'readXml', 'writeXml', 'legendItems', 'diagramSize')),)),
+        ('QgsStackedDiagramRenderer', (('__overridden_methods__', ('clone', 'sizeMapUnits', 'renderDiagram', 'diagramSettings', 'diagramAttributes', 'rendererName', 'readXml', 'writeXml', 'legendItems', 'diagramSize')),)),
+    )),
+    ('src/core/browser/qgsdirectoryitem.h', (
+        ('QgsDirectoryItem', ('setCustomColor', 'hiddenPath', 'monitoringForPath', 'pathShouldByMonitoredByDefault', ('__overridden_methods__', ('setState', 'createChildren', 'equal', 'icon', 'paramWidget', 'hasDragEnabled', 'mimeUris', 'childrenCreated')), ('__group__', ('browser',)))),
+        ('QgsDirectoryParamWidget', (('__overridden_methods__', ('mousePressEvent',)), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsdistancearea.h', (
+        ('QgsDistanceArea', ('formatDistance', 'formatArea')),
+    )),
+    ('src/core/scalebar/qgsdoubleboxscalebarrenderer.h', (
+        ('QgsDoubleBoxScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'flags', 'sortKey', 'clone', 'draw', 'applyDefaultSettings')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/dxf/qgsdxfexport.h', (
+        ('QgsDxfExport', ('closestColorMatch', 'mapUnitScaleFactor', 'dxfLayerName', 'dxfEncoding', 'encodings', ('__group__', ('dxf',)))),
+        ('QgsDxfExport.DxfLayer', (('__group__', ('dxf',)),)),
+    )),
+    ('src/core/editform/qgseditformconfig.h', (
+        ('QgsEditFormConfig', (('__group__', ('editform',)),)),
+        ('QgsEditFormConfig.GroupData', (('__group__', ('editform',)),)),
+        ('QgsEditFormConfig.TabData', (('__group__', ('editform',)),)),
+    )),
+    ('src/core/effects/qgseffectstack.h', (
+        ('QgsEffectStack', ('create', ('__overridden_methods__', ('flags', 'type', 'clone', 'saveProperties', 'readProperties', 'properties', 'draw')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/qgselevationmap.h', (
+        ('QgsElevationMap', ('encodeElevation', 'decodeElevation')),
+    )),
+    ('src/core/qgselevationutils.h', (
+        ('QgsElevationUtils', ('calculateZRangeForProject', 'significantZValuesForProject', 'significantZValuesForLayers', 'canEnableElevationForLayer', 'enableElevationForLayer')),
+    )),
+    ('src/core/geometry/qgsellipse.h', (
+        ('QgsEllipse', ('fromFoci', 'fromExtent', 'fromCenterPoint', 'fromCenter2Points', ('__virtual_methods__', ('isEmpty', 'setSemiMajorAxis', 'setSemiMinorAxis', 'focusDistance', 'foci', 'eccentricity', 'area', 'perimeter', 'quadrant', 'points', 'toPolygon', 'toLineString', 'orientedBoundingBox', 'boundingBox', 'toString')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/symbology/qgsellipsesymbollayer.h', (
+        ('QgsEllipseSymbolLayer', ('availableShapes', 'shapeIsFilled', 'create', 'createFromSld', 'decodeShape', 'encodeShape', ('__overridden_methods__', ('renderPoint', 'layerType', 'flags', 'startRender', 'stopRender', 'clone', 'properties', 'toSld', 'writeSldMarker', 'writeDxf', 'setSize', 'setFillColor', 'fillColor', 'setStrokeColor', 'strokeColor', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'bounds')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/proj/qgsellipsoidutils.h', (
+        ('QgsEllipsoidUtils', ('ellipsoidParameters', 'definitions', 'acronyms', 'celestialBodies', ('__group__', ('proj',)))),
+    )),
+    ('src/core/symbology/qgsembeddedsymbolrenderer.h', (
+        ('QgsEmbeddedSymbolRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('symbolForFeature', 'originalSymbolForFeature', 'startRender', 'renderFeature', 'stopRender', 'usedAttributes', 'usesEmbeddedSymbols', 'clone', 'capabilities', 'save', 'symbols')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/raster/qgsexiftools.h', (
+        ('QgsExifTools', ('readTags', 'readTag', 'getGeoTag', 'hasGeoTag', 'geoTagImage', 'tagImage', ('__group__', ('raster',)))),
+    )),
+    ('src/core/expression/qgsexpression.h', (
+        ('QgsExpression', ('expressionToLayerFieldIndex', 'quoteFieldExpression', 'checkExpression', 'replaceExpressionText', 'evaluateToDouble', 'registerFunction', 'unregisterFunction', 'cleanRegisteredFunctions', 'isFunctionName', 'functionIndex', 'functionCount', 'quotedColumnRef', 'quotedString', 'quotedValue', 'helpText', 'tags', 'addVariableHelpText', 'variableHelpText', 'formatVariableHelp', 'group', 'formatPreviewString', 'createFieldEqualityExpression', 'isFieldEqualityExpression', 'attemptReduceToInClause', ('__group__', ('expression',)))),
+    )),
+    ('src/core/numericformats/qgsexpressionbasednumericformat.h', (
+        ('QgsExpressionBasedNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/qgsexpressioncontext.h', (
+        ('QgsScopedExpressionFunction', (('__abstract_methods__', ('func', 'clone')), ('__overridden_methods__', ('func', 'usesGeometry', 'referencedColumns', 'isStatic')))),
+    )),
+    ('src/core/qgsexpressioncontextgenerator.h', (
+        ('QgsExpressionContextGenerator', (('__abstract_methods__', ('createExpressionContext',)),)),
+    )),
+    ('src/core/qgsexpressioncontextscopegenerator.h', (
+        ('QgsExpressionContextScopeGenerator', (('__abstract_methods__', ('createExpressionContextScope',)),)),
+    )),
+    ('src/core/expression/qgsexpressioncontextutils.h', (
+        ('QgsExpressionContextUtils', ('globalScope', 'formScope', 'parentFormScope', 'setGlobalVariable', 'setGlobalVariables', 'removeGlobalVariable', 'projectScope', 'setProjectVariable', 'setProjectVariables', 'removeProjectVariable', 'layerScope', 'globalProjectLayerScopes', 'setLayerVariable', 'setLayerVariables', 'mapSettingsScope', 'mapToolCaptureScope', 'mapLayerPositionScope', 'updateSymbolScope', 'layoutScope', 'setLayoutVariable', 'setLayoutVariables', 'atlasScope', 'layoutItemScope', 'setLayoutItemVariable', 'setLayoutItemVariables', 'multiFrameScope', 'setLayoutMultiFrameVariable', 'setLayoutMultiFrameVariables', 'createFeatureBasedContext', 'processingAlgorithmScope', 'processingModelAlgorithmScope', 'notificationScope', 'registerContextFunctions', 'meshExpressionScope', ('__group__', ('expression',)))),
+    )),
+    ('src/core/expression/qgsexpressionfunction.h', (
+        ('QgsExpressionFunction', ('allParamsStatic', ('__virtual_methods__', ('usesGeometry', 'aliases', 'isStatic', 'prepare', 'referencedColumns', 'isDeprecated', 'run', 'handlesNull')), ('__abstract_methods__', ('func',)), ('__group__', ('expression',)))),
+        ('QgsExpressionFunction.Parameter', (('__group__', ('expression',)),)),
+    )),
+    ('src/core/expression/qgsexpressionnode.h', (
+        ('QgsExpressionNode.NodeList', (('__virtual_methods__', ('dump',)), ('__group__', ('expression',)))),
+    )),
+    ('src/core/expression/qgsexpressionnodeimpl.h', (
+        ('QgsExpressionNodeFunction', ('validateParams', ('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeUnaryOperator', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeBinaryOperator', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'needsGeometry', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeIndexOperator', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'needsGeometry', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeBetweenOperator', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeInOperator', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeLiteral', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeColumnRef', (('__overridden_methods__', ('nodeType', 'prepareNode', 'evalNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'needsGeometry', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeCondition', (('__overridden_methods__', ('nodeType', 'evalNode', 'prepareNode', 'dump', 'referencedColumns', 'referencedVariables', 'referencedFunctions', 'needsGeometry', 'clone', 'isStatic')), ('__group__', ('expression',)))),
+        ('QgsExpressionNodeCondition.WhenThen', (('__group__', ('expression',)),)),
+    )),
+    ('src/core/externalstorage/qgsexternalstorage.h', (
+        ('QgsExternalStorageContent', (('__attribute_docs__', (('errorOccurred', 'The signal is emitted when an error occurred. ``errorString`` is a\ntextual description of the error\n'), ('progressChanged', 'The signal is emitted whenever content fetching/storing estimated\nprogression value ``progress`` has changed. ``progress`` value is\nbetween 0 and 100.\n'), ('canceled', 'The signal is emitted when content fetching/storing has been canceled\n'))), ('__virtual_methods__', ('cancel',)), ('__signal_arguments__', (('errorOccurred', ('errorString: str',)), ('progressChanged', ('progress: float',)))), ('__group__', ('externalstorage',)))),
+        ('QgsExternalStorageFetchedContent', (('__attribute_docs__', (('fetched', 'The signal is emitted when the resource has successfully been fetched\n'),)), ('__abstract_methods__', ('filePath', 'fetch')), ('__group__', ('externalstorage',)))),
+        ('QgsExternalStorageStoredContent', (('__attribute_docs__', (('stored', 'The signal is emitted when the resource has successfully been stored\n'),)), ('__abstract_methods__', ('url', 'store')), ('__group__', ('externalstorage',)))),
+        ('QgsExternalStorage', (('__abstract_methods__', ('type', 'displayName', 'doStore', 'doFetch')), ('__group__', ('externalstorage',)))),
+    )),
+    ('src/core/externalstorage/qgsexternalstorageregistry.h', (
+        ('QgsExternalStorageRegistry', (('__group__', ('externalstorage',)),)),
+    )),
+    ('src/core/fieldformatter/qgsfallbackfieldformatter.h', (
+        ('QgsFallbackFieldFormatter', (('__overridden_methods__', ('id',)), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/numericformats/qgsfallbacknumericformat.h', (
+        ('QgsFallbackNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/browser/qgsfavoritesitem.h', (
+        ('QgsFavoritesItem', ('iconFavorites', ('__overridden_methods__', ('createChildren', 'sortKey')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsfeaturefiltermodel.h', (
+        ('QgsFeatureFilterModel', (('__attribute_docs__', (('identifierFieldsChanged', 'The identifier field should be a unique field that can be used to\nidentify individual features. It is normally set to the primary key of\nthe layer.\n'), ('extraIdentifierValuesChanged', 'Allows specifying one value that does not need to match the filter\ncriteria but will still be available in the model.\n'))), ('__overridden_methods__', ('setExtraIdentifierValueToNull', 'requestToReloadCurrentFeature')))),
+    )),
+    ('src/core/qgsfeaturefilterprovider.h', (
+        ('QgsFeatureFilterProvider', (('__abstract_methods__', ('filterFeatures', 'layerAttributes', 'clone')),)),
+    )),
+    ('src/core/qgsfeatureiterator.h', (
+        ('QgsAbstractFeatureIterator', (('__virtual_methods__', ('nextFeature', 'isValid', 'nextFeatureFilterExpression', 'nextFeatureFilterFids', 'prepareSimplification')), ('__abstract_methods__', ('rewind', 'close', 'fetchFeature')))),
+    )),
+    ('src/core/qgsfeaturepickermodel.h', (
+        ('QgsFeaturePickerModel', (('__attribute_docs__', (('featureChanged', 'Emitted when the current feature changes\n'),)), ('__overridden_methods__', ('setExtraIdentifierValueToNull',)), ('__signal_arguments__', (('featureChanged', ('feature: QgsFeature',)),)))),
+    )),
+    ('src/core/qgsfeaturepickermodelbase.h', (
+        ('QgsFeaturePickerModelBase', (('__attribute_docs__', (('currentFeatureChanged', 'Emitted when the current feature in the model has changed This emitted\nboth when the extra value changes and when the extra value status\nchanges. It allows being notified when the feature is fetched after the\nextra value has been set.\n\n.. versionadded:: 3.16.5\n'), ('sourceLayerChanged', 'The source layer from which features will be fetched.\n'), ('displayExpressionChanged', 'The display expression will be used for\n\n- displaying values in the combobox\n- filtering based on filterValue\n'), ('filterValueChanged', 'This value will be used to filter the features available from this\nmodel. Whenever a substring of the displayExpression of a feature\nmatches the filter value, it will be accessible by this model.\n'), ('filterExpressionChanged', 'An additional filter expression to apply, next to the filterValue. Can\nbe used for spatial filtering etc.\n'), ('formFeatureChanged', 'An attribute form feature to be used alongside the filter expression.\n\n.. versionadded:: 3.42.2\n'), ('parentFormFeatureChanged', 'A parent attribute form feature to be used alongside the filter\nexpression.\n\n.. versionadded:: 3.42.2\n'), ('isLoadingChanged', 'Indicator if the model is currently performing any feature iteration in\nthe background.\n'), ('filterJobCompleted', 'Indicates that a filter job has been completed and new data may be\navailable.\n'), ('extraIdentifierValueChanged', 'Allows specifying one value that does not need to match the filter\ncriteria but will still be available in the model.\n'), ('extraIdentifierValueIndexChanged', 'The index at which the extra identifier value is available within the\nmodel.\n'), ('extraValueDoesNotExistChanged', 'Notification whether the model has ``found`` a feature tied to the\nextraIdentifierValue or not.\n'), ('beginUpdate', 'Notification that the model is about to be changed because a job was\ncompleted.\n'), ('endUpdate', 'Notification that the model change is finished. Will always be emitted\nin sync with beginUpdate.\n'), ('allowNullChanged', 'Add a NULL entry to the list.\n'), ('fetchGeometryChanged', 'Emitted when the fetching of the geometry changes\n'), ('fetchLimitChanged', 'Emitted when the fetching limit for the feature request changes\n'))), ('__abstract_methods__', ('setExtraIdentifierValueToNull', 'requestToReloadCurrentFeature')), ('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data')), ('__signal_arguments__', (('extraIdentifierValueIndexChanged', ('index: int',)), ('extraValueDoesNotExistChanged', ('found: bool',)))))),
+    )),
+    ('src/core/symbology/qgsfeaturerenderergenerator.h', (
+        ('QgsFeatureRendererGenerator', (('__virtual_methods__', ('level',)), ('__abstract_methods__', ('id', 'createRenderer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgsfeaturerequest.h', (
+        ('QgsAbstractFeatureSource', (('__abstract_methods__', ('getFeatures',)),)),
+    )),
+    ('src/core/qgsfeaturesink.h', (
+        ('QgsFeatureSink', (('__virtual_methods__', ('finalize', 'addFeature', 'flushBuffer', 'lastError')), ('__abstract_methods__', ('addFeatures',)))),
+    )),
+    ('src/core/qgsfeaturesource.h', (
+        ('QgsFeatureSource', (('__virtual_methods__', ('hasFeatures', 'uniqueValues', 'minimumValue', 'maximumValue', 'sourceExtent', 'sourceExtent3D', 'allFeatureIds', 'hasSpatialIndex')), ('__abstract_methods__', ('getFeatures', 'sourceName', 'sourceCrs', 'fields', 'wkbType', 'featureCount')))),
+    )),
+    ('src/core/qgsfeaturestore.h', (
+        ('QgsFeatureStore', (('__overridden_methods__', ('addFeature', 'addFeatures')),)),
+    )),
+    ('src/core/qgsfeedback.h', (
+        ('QgsFeedback', (('__attribute_docs__', (('canceled', 'Internal routines can connect to this signal if they use event loop\n'), ('progressChanged', 'Emitted when the feedback object reports a progress change. Depending on\nhow the feedback object is used progress reporting may not be supported.\nThe ``progress`` argument is in percentage and ranges from 0-100.\n\n.. seealso:: :py:func:`setProgress`\n\n.. seealso:: :py:func:`progress`\n'), ('processedCountChanged', 'Emitted when the feedback object reports a change in the number of\nprocessed objects. Depending on how the feedback object is used\nprocessed count reporting may not be supported. The ``processedCount``\nargument is an unsigned long integer and starts from 0.\n\n.. seealso:: :py:func:`setProgress`\n\n.. seealso:: :py:func:`progress`\n\n.. versionadded:: 3.24\n'))), ('__signal_arguments__', (('progressChanged', ('progress: float',)), ('processedCountChanged', ('processedCount: int',)))))),
+    )),
+    ('src/core/qgsfield.h', (
+        ('QgsField', ('readableConfigurationFlag',)),
+    )),
+    ('src/core/vector/qgsfielddomain.h', (
+        ('QgsFieldDomain', (('__abstract_methods__', ('clone', 'type', 'typeName')), ('__group__', ('vector',)))),
+        ('QgsCodedFieldDomain', (('__overridden_methods__', ('type', 'typeName', 'clone')), ('__group__', ('vector',)))),
+        ('QgsRangeFieldDomain', (('__overridden_methods__', ('type', 'typeName', 'clone')), ('__group__', ('vector',)))),
+        ('QgsGlobFieldDomain', (('__overridden_methods__', ('type', 'typeName', 'clone')), ('__group__', ('vector',)))),
+        ('QgsCodedValue', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/browser/qgsfielddomainsitem.h', (
+        ('QgsFieldDomainsItem', (('__overridden_methods__', ('createChildren', 'icon')), ('__group__', ('browser',)))),
+        ('QgsFieldDomainItem', (('__overridden_methods__', ('icon',)), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsfieldformatter.h', (
+        ('QgsFieldFormatter', (('__virtual_methods__', ('representValue', 'sortValue', 'alignmentFlag', 'createCache', 'availableValues')), ('__abstract_methods__', ('id',)))),
+    )),
+    ('src/core/qgsfieldformatterregistry.h', (
+        ('QgsFieldFormatterRegistry', (('__attribute_docs__', (('fieldFormatterAdded', 'Will be emitted after a new field formatter has been added.\n'), ('fieldFormatterRemoved', 'Will be emitted just before a field formatter is removed and deleted.\n'))), ('__signal_arguments__', (('fieldFormatterAdded', ('formatter: QgsFieldFormatter',)), ('fieldFormatterRemoved', ('formatter: QgsFieldFormatter',)))))),
+    )),
+    ('src/core/qgsfieldmodel.h', (
+        ('QgsFieldModel', ('fieldToolTip', 'fieldToolTipExtended', ('__virtual_methods__', ('updateModel',)), ('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data')))),
+    )),
+    ('src/core/qgsfieldproxymodel.h', (
+        ('QgsFieldProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')),)),
+    )),
+    ('src/core/qgsfields.h', (
+        ('QgsFields', ('iconForFieldType',)),
+    )),
+    ('src/core/browser/qgsfieldsitem.h', (
+        ('QgsFieldsItem', (('__overridden_methods__', ('createChildren', 'icon')), ('__group__', ('browser',)))),
+        ('QgsFieldItem', (('__overridden_methods__', ('icon', 'equal')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/network/qgsfiledownloader.h', (
+        ('QgsFileDownloader', (('__attribute_docs__', (('downloadCompleted', 'Emitted when the download has completed successfully\n'), ('downloadExited', 'Emitted always when the downloader exits\n'), ('downloadCanceled', 'Emitted when the download was canceled by the user.\n\n.. seealso:: :py:func:`cancelDownload`\n'), ('downloadError', 'Emitted when an error makes the download fail\n'), ('downloadProgress', 'Emitted when data are ready to be processed\n'))), ('__signal_arguments__', (('downloadCompleted', ('url: QUrl',)), ('downloadError', ('errorMessages: List[str]',)), ('downloadProgress', ('bytesReceived: int', 'bytesTotal: int')))), ('__group__', ('network',)))),
+    )),
+    ('src/core/qgsfilefiltergenerator.h', (
+        ('QgsFileFilterGenerator', (('__abstract_methods__', ('createFileFilter',)),)),
+    )),
+    ('src/core/qgsfileutils.h', (
+        ('QgsFileUtils', ('representFileSize', 'extensionsFromFilter', 'wildcardsFromFilter', 'fileMatchesFilter', 'ensureFileNameHasExtension', 'addExtensionFromFilter', 'stringToSafeFilename', 'findClosestExistingPath', 'findFile', 'driveType', 'pathIsSlowDevice', 'sidecarFilesForPath', 'renameDataset', 'splitPathToComponents', 'uniquePath')),
+    )),
+    ('src/core/symbology/qgsfillsymbol.h', (
+        ('QgsFillSymbol', ('createSimple', ('__overridden_methods__', ('clone',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgsfillsymbollayer.h', (
+        ('QgsSimpleFillSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'toSld', 'ogrFeatureStyle', 'strokeColor', 'setStrokeColor', 'fillColor', 'setFillColor', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'estimateMaxBleed', 'dxfWidth', 'dxfColor', 'dxfAngle', 'dxfPenStyle', 'dxfBrushColor', 'dxfBrushStyle', 'toTiledPatternImage')), ('__group__', ('symbology',)))),
+        ('QgsGradientFillSymbolLayer', ('create', ('__overridden_methods__', ('flags', 'layerType', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'estimateMaxBleed', 'canCauseArtifactsBetweenAdjacentTiles', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale')), ('__group__', ('symbology',)))),
+        ('QgsShapeburstFillSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'estimateMaxBleed', 'canCauseArtifactsBetweenAdjacentTiles', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale')), ('__group__', ('symbology',)))),
+        ('QgsRasterFillSymbolLayer', ('create', 'createFromSld', 'resolvePaths', ('__overridden_methods__', ('layerType', 'flags', 'renderPolygon', 'startRender', 'stopRender', 'properties', 'clone', 'estimateMaxBleed', 'usesMapUnits', 'color', 'setOutputUnit', 'subSymbol', 'setSubSymbol', 'applyDataDefinedSettings', 'applyBrushTransformFromContext')), ('__group__', ('symbology',)))),
+        ('QgsSVGFillSymbolLayer', ('create', 'createFromSld', 'resolvePaths', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'toSld', 'usesMapUnits', 'subSymbol', 'setSubSymbol', 'estimateMaxBleed', 'dxfColor', 'usedAttributes', 'hasDataDefinedProperties', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'applyDataDefinedSettings')), ('__group__', ('symbology',)))),
+        ('QgsLinePatternFillSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'toSld', 'toTiledPatternImage', 'estimateMaxBleed', 'setColor', 'color', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'setSubSymbol', 'subSymbol', 'usedAttributes', 'hasDataDefinedProperties', 'startFeatureRender', 'stopFeatureRender', 'applyDataDefinedSettings')), ('__group__', ('symbology',)))),
+        ('QgsPointPatternFillSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'startFeatureRender', 'stopFeatureRender', 'renderPolygon', 'properties', 'clone', 'toSld', 'toTiledPatternImage', 'estimateMaxBleed', 'setSubSymbol', 'subSymbol', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'usedAttributes', 'hasDataDefinedProperties', 'setColor', 'color', 'applyDataDefinedSettings')), ('__group__', ('symbology',)))),
+        ('QgsRandomMarkerFillSymbolLayer', ('create', ('__virtual_methods__', ('setSubSymbol',)), ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'canCauseArtifactsBetweenAdjacentTiles', 'setColor', 'color', 'subSymbol', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'usedAttributes', 'hasDataDefinedProperties', 'startFeatureRender', 'stopFeatureRender')), ('__group__', ('symbology',)))),
+        ('QgsCentroidFillSymbolLayer', ('create', 'createFromSld', ('__virtual_methods__', ('setSubSymbol',)), ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'renderPolygon', 'properties', 'clone', 'toSld', 'setColor', 'color', 'subSymbol', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'usedAttributes', 'hasDataDefinedProperties', 'canCauseArtifactsBetweenAdjacentTiles', 'startFeatureRender', 'stopFeatureRender')), ('__group__', ('symbology',)))),
+        ('QgsImageFillSymbolLayer', (('__virtual_methods__', ('applyDataDefinedSettings', 'applyBrushTransformFromContext')), ('__overridden_methods__', ('renderPolygon', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'dxfWidth', 'dxfPenStyle', 'properties')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/textrenderer/qgsfontmanager.h', (
+        ('QgsFontManager', (('__attribute_docs__', (('fontDownloaded', 'Emitted when a font has downloaded and been locally loaded.\n\nThe ``families`` list specifies the font families contained in the\ndownloaded font.\n\nIf found, the ``licenseDetails`` string will be populated with\ncorresponding font license details.\n\n.. seealso:: :py:func:`downloadAndInstallFont`\n\n.. seealso:: :py:func:`fontDownloadErrorOccurred`\n'), ('fontDownloadErrorOccurred', 'Emitted when an error occurs during font downloading.\n\n.. seealso:: :py:func:`downloadAndInstallFont`\n\n.. seealso:: :py:func:`fontDownloaded`\n'))), ('__signal_arguments__', (('fontDownloaded', ('families: List[str]', 'licenseDetails: str')), ('fontDownloadErrorOccurred', ('url: QUrl', 'identifier: str', 'error: str')))), ('__group__', ('textrenderer',)))),
+        ('QgsFontDownloadDetails', ('standardizeFamily', ('__group__', ('textrenderer',)))),
+    )),
+    ('src/core/qgsfontutils.h', (
+        ('QgsFontUtils', ('fontMatchOnSystem', 'fontFamilyOnSystem', 'fontFamilyHasStyle', 'resolveFontStyleName', 'fontFamilyMatchOnSystem', 'updateFontViaStyle', 'standardTestFontFamily', 'loadStandardTestFonts', 'getStandardTestFont', 'toXmlElement', 'setFromXmlElement', 'setFromXmlChildNode', 'toMimeData', 'fromMimeData', 'translateNamedStyle', 'untranslateNamedStyle', 'asCSS', 'addRecentFontFamily', 'recentFontFamilies', 'setFontFamily', 'createFont')),
+    )),
+    ('src/core/numericformats/qgsfractionnumericformat.h', (
+        ('QgsFractionNumericFormat', ('doubleToVulgarFraction', 'toUnicodeSuperscript', 'toUnicodeSubscript', ('__virtual_methods__', ('setConfiguration',)), ('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'formatDouble', 'clone', 'create', 'configuration', 'suggestSampleValue')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/geocoding/qgsgeocoder.h', (
+        ('QgsGeocoderInterface', (('__virtual_methods__', ('geocodeFeature', 'appendedFields', 'wkbType', 'geocodeString')), ('__abstract_methods__', ('flags',)), ('__group__', ('geocoding',)))),
+    )),
+    ('src/core/geocoding/qgsgeocodercontext.h', (
+        ('QgsGeocoderContext', (('__group__', ('geocoding',)),)),
+    )),
+    ('src/core/geocoding/qgsgeocoderresult.h', (
+        ('QgsGeocoderResult', ('errorResult', ('__group__', ('geocoding',)))),
+    )),
+    ('src/core/geometry/qgsgeometry.h', (
+        ('QgsGeometry', ('fromWkt', 'fromPointXY', 'fromPoint', 'fromMultiPointXY', 'fromPolylineXY', 'fromPolyline', 'fromMultiPolylineXY', 'fromPolygonXY', 'fromMultiPolygonXY', 'fromRect', 'fromBox3D', 'collectGeometry', 'createWedgeBuffer', 'createWedgeBufferFromAngles', 'unaryUnion', 'polygonize', 'fromQPointF', 'fromQPolygonF', 'createPolylineFromQPolygonF', 'createPolygonFromQPolygonF', 'compare', 'createGeometryEngine', 'convertPointList', ('__group__', ('geometry',)))),
+        ('QgsGeometryParameters', (('__group__', ('geometry',)),)),
+        ('QgsGeometry.Error', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/geometry/qgsgeometrycollection.h', (
+        ('QgsGeometryCollection', (('__virtual_methods__', ('addGeometry', 'addGeometries', 'insertGeometry', 'removeGeometry', 'wktOmitChildType')), ('__overridden_methods__', ('operator==', 'operator!=', 'fuzzyEqual', 'fuzzyDistanceEqual', 'clone', 'isEmpty', 'dimension', 'geometryType', 'clear', 'snappedToGrid', 'removeDuplicateNodes', 'boundary', 'adjacentVertices', 'vertexNumberFromVertexId', 'boundingBoxIntersects', 'normalize', 'transform', 'draw', 'asQPainterPath', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'boundingBox3D', 'coordinateSequence', 'nCoordinates', 'closestSegment', 'nextVertex', 'insertVertex', 'moveVertex', 'deleteVertex', 'length', 'area', 'perimeter', 'hasCurvedSegments', 'segmentize', 'vertexAngle', 'segmentLength', 'vertexCount', 'ringCount', 'partCount', 'vertexAt', 'isValid', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'toCurveType', 'simplifiedTypeRef', 'simplifyByDistance', 'createEmptyWithSameType', 'childCount', 'childGeometry', 'compareToSameClass', 'calculateBoundingBox3D', 'clearCache')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsgeometryengine.h', (
+        ('QgsGeometryEngine', (('__virtual_methods__', ('splitGeometry',)), ('__abstract_methods__', ('geometryChanged', 'prepareGeometry', 'intersection', 'difference', 'combine', 'symDifference', 'buffer', 'simplify', 'interpolate', 'envelope', 'centroid', 'pointOnSurface', 'convexHull', 'distance', 'distanceWithin', 'intersects', 'touches', 'crosses', 'within', 'overlaps', 'contains', 'disjoint', 'relate', 'relatePattern', 'area', 'length', 'isValid', 'isEqual', 'isEmpty', 'isSimple', 'offsetCurve')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/symbology/qgsgeometrygeneratorsymbollayer.h', (
+        ('QgsGeometryGeneratorSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'startFeatureRender', 'stopFeatureRender', 'usesMapUnits', 'color', 'outputUnit', 'setOutputUnit', 'mapUnitScale', 'clone', 'properties', 'drawPreviewIcon', 'subSymbol', 'setSubSymbol', 'usedAttributes', 'hasDataDefinedProperties', 'isCompatibleWithSymbol', 'setColor')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgsgeometryoptions.h', (
+        ('QgsGeometryOptions', (('__attribute_docs__', (('checkConfigurationChanged', 'Access the configuration for the check ``checkId``.\n\n.. versionadded:: 3.4\n'), ('geometryChecksChanged', 'A list of activated geometry checks.\n\n.. versionadded:: 3.4\n'), ('removeDuplicateNodesChanged', 'Automatically remove duplicate nodes on all geometries which are edited\non this layer.\n\n.. versionadded:: 3.4\n'), ('geometryPrecisionChanged', 'The precision in which geometries on this layer should be saved.\nGeometries which are edited on this layer will be rounded to multiples\nof this value (snap to grid). Set to 0.0 to disable.\n\n.. versionadded:: 3.4\n'))),)),
+    )),
+    ('src/core/painting/qgsgeometrypaintdevice.h', (
+        ('QgsGeometryPaintDevice', ('painterPathToGeometry', ('__overridden_methods__', ('paintEngine', 'metric')), ('__group__', ('painting',)))),
+    )),
+    ('src/core/qgsgeometrysimplifier.h', (
+        ('QgsAbstractGeometrySimplifier', ('isGeneralizableByDeviceBoundingBox', ('__abstract_methods__', ('simplify',)))),
+        ('QgsTopologyPreservingSimplifier', (('__overridden_methods__', ('simplify',)),)),
+    )),
+    ('src/core/geometry/qgsgeometrytransformer.h', (
+        ('QgsAbstractGeometryTransformer', (('__abstract_methods__', ('transformPoint',)), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsgeometryutils.h', (
+        ('QgsGeometryUtils', ('extractLineStrings', 'closestVertex', 'closestPoint', 'distanceToVertex', 'verticesAtDistance', 'distToInfiniteLine', 'lineCircleIntersection', 'circleCircleIntersections', 'tangentPointAndCircle', 'circleCircleOuterTangents', 'circleCircleInnerTangents', 'projectPointOnSegment', 'leftOfLine', 'interpolatePointOnArc', 'segmentMidPoint', 'segmentMidPointFromCenter', 'circleTangentDirection', 'segmentizeArc', 'pointContinuesArc', 'segmentSide', 'midpoint', 'interpolatePointOnLine', 'interpolatePointOnLineByValue', 'gradient', 'coefficients', 'perpendicularSegment', 'setZValueFromPoints', 'transferFirstZValueToPoint', 'transferFirstMValueToPoint', 'transferFirstZOrMValueToPoint', 'sqrDistance2D', 'sqrDistance3D', 'distance2D', 'distance3D', 'sqrDistToLine', 'perpendicularOffsetPointAlongSegment', 'ccwAngle', 'circleClockwise', 'circleAngleBetween', 'angleOnCircle', 'circleLength', 'sweepAngle', 'interpolateArcValue', 'normalizedAngle', 'lineAngle', 'angleBetweenThreePoints', 'linePerpendicularAngle', 'averageAngle', 'closestSideOfRectangle', 'perpendicularCenterSegment', 'skewLinesDistance', 'skewLinesProjection', 'linesIntersection3D', 'triangleArea', 'pointFractionAlongLine', 'weightedPointInTriangle', 'pointsAreCollinear', 'angleBisector', 'bisector', 'circleCenterRadius', 'lineIntersection', 'segmentIntersection', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsgeometryutils_base.h', (
+        ('QgsGeometryUtilsBase', ('sqrDistance3D', 'distance3D', 'sqrDistance2D', 'distance2D', 'sqrDistToLine', 'leftOfLine', 'perpendicularOffsetPointAlongSegment', 'ccwAngle', 'circleCenterRadius', 'circleClockwise', 'circleAngleBetween', 'angleOnCircle', 'circleLength', 'sweepAngle', 'interpolateArcValue', 'normalizedAngle', 'lineAngle', 'angleBetweenThreePoints', 'linePerpendicularAngle', 'averageAngle', 'closestSideOfRectangle', 'perpendicularCenterSegment', 'skewLinesDistance', 'skewLinesProjection', 'linesIntersection3D', 'triangleArea', 'pointFractionAlongLine', 'weightedPointInTriangle', 'pointsAreCollinear', 'angleBisector', 'bisector', 'lineIntersection', 'segmentIntersection', 'project', 'azimuth', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsgeometryvalidator.h', (
+        ('QgsGeometryValidator', (('__attribute_docs__', (('errorFound', 'Sent when an error has been found during the validation process.\n\nThe ``error`` contains details about the error.\n'), ('validationFinished', 'Sent when the validation is finished.\n\nThe result is in a human readable ``summary``, mentioning if the\nvalidation has been aborted, successfully been validated or how many\nerrors have been found.\n\n.. versionadded:: 3.6\n'))), 'validateGeometry', ('__overridden_methods__', ('run',)), ('__signal_arguments__', (('errorFound', ('error: QgsGeometry.Error',)), ('validationFinished', ('summary: str',)))))),
+    )),
+    ('src/core/geometry/qgsgeos.h', (
+        ('QgsGeos', (('__overridden_methods__', ('geometryChanged', 'prepareGeometry', 'intersection', 'difference', 'combine', 'symDifference', 'buffer', 'simplify', 'interpolate', 'envelope', 'centroid', 'pointOnSurface', 'convexHull', 'distance', 'distanceWithin', 'intersects', 'touches', 'crosses', 'within', 'overlaps', 'contains', 'disjoint', 'relate', 'relatePattern', 'area', 'length', 'isValid', 'isEqual', 'isEmpty', 'isSimple', 'splitGeometry', 'offsetCurve')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/effects/qgsgloweffect.h', (
+        ('QgsOuterGlowEffect', ('create', ('__overridden_methods__', ('type', 'clone', 'shadeExterior')), ('__group__', ('effects',)))),
+        ('QgsInnerGlowEffect', ('create', ('__overridden_methods__', ('type', 'clone', 'shadeExterior')), ('__group__', ('effects',)))),
+        ('QgsGlowEffect', (('__abstract_methods__', ('shadeExterior',)), ('__overridden_methods__', ('flags', 'properties', 'readProperties', 'boundingRect', 'draw')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/qgsgml.h', (
+        ('QgsGml', (('__attribute_docs__', (('dataReadProgress', 'Emitted when data reading progresses.\n\n:param progress: specifies the number of bytes processed so far\n'), ('totalStepsUpdate', 'Emitted when the total number of bytes to read changes.\n\n:param totalSteps: specifies the total number of bytes which must be\n                   processed\n'), ('dataProgressAndSteps', 'Emitted when data reading progresses or the total number of bytes to\nread changes.\n\n:param progress: specifies the number of bytes processed so far\n:param totalSteps: specifies the total number of bytes which must be\n                   processed\n'))), ('__signal_arguments__', (('dataReadProgress', ('progress: int',)), ('totalStepsUpdate', ('totalSteps: int',)), ('dataProgressAndSteps', ('progress: int', 'totalSteps: int')))))),
+    )),
+    ('src/core/geocoding/qgsgooglemapsgeocoder.h', (
+        ('QgsGoogleMapsGeocoder', (('__overridden_methods__', ('flags', 'appendedFields', 'wkbType', 'geocodeString')), ('__group__', ('geocoding',)))),
+    )),
+    ('src/core/gps/qgsgpsconnection.h', (
+        ('QgsGpsConnection', (('__attribute_docs__', (('stateChanged', 'Emitted whenever the GPS state is changed.\n'), ('nmeaSentenceReceived', 'Emitted whenever the GPS device receives a raw NMEA sentence.\n'), ('fixStatusChanged', 'Emitted when the GPS device fix status is changed.\n\n.. versionadded:: 3.30\n'), ('positionChanged', 'Emitted when the GPS position changes.\n\nThis signal is only emitted when the new GPS location is considered\nvalid (see :py:func:`QgsGpsInformation.isValid()`).\n\n.. versionadded:: 3.30\n'))), ('__abstract_methods__', ('parseData',)), ('__signal_arguments__', (('stateChanged', ('info: QgsGpsInformation',)), ('nmeaSentenceReceived', ('substring: str',)), ('fixStatusChanged', ('status: Qgis.GpsFixStatus',)), ('positionChanged', ('point: QgsPoint',)))), ('__group__', ('gps',)))),
+    )),
+    ('src/core/gps/qgsgpsconnectionregistry.h', (
+        ('QgsGpsConnectionRegistry', (('__group__', ('gps',)),)),
+    )),
+    ('src/core/gps/qgsgpsdconnection.h', (
+        ('QgsGpsdConnection', (('__group__', ('gps',)),)),
+    )),
+    ('src/core/gps/qgsgpsdetector.h', (
+        ('QgsGpsDetector', (('__attribute_docs__', (('connectionDetected', 'Emitted when a GPS connection is successfully detected.\n\nCall :py:func:`~QgsGpsDetector.takeConnection` to take ownership of the\ndetected connection.\n\n.. versionadded:: 3.38\n'), ('detected', 'Emitted when the GPS connection has been detected. A single connection\nmust listen for this signal and immediately take ownership of the\n``connection`` object.\n\n.. deprecated:: 3.40\n\n   This signal is dangerous and extremely unsafe! It is recommended to instead set the ``useUnsafeSignals`` parameter to ``False`` in the QgsGpsDetector constructor and use the safe :py:func:`~QgsGpsDetector.connectionDetected` signal instead.\n'), ('detectionFailed', 'Emitted when the detector could not find a valid GPS connection.\n'))), 'availablePorts', ('__group__', ('gps',)))),
+    )),
+    ('src/core/gps/qgsgpslogger.h', (
+        ('QgsGpsLogger', (('__attribute_docs__', (('trackIsEmptyChanged', 'Emitted whenever the current track changes from being empty to non-empty\nor vice versa.\n'), ('trackReset', 'Emitted whenever the current track is reset.\n'), ('trackVertexAdded', 'Emitted whenever a new vertex is added to the track.\n\nThe ``vertex`` point will be in WGS84 coordinate reference system.\n'), ('stateChanged', 'Emitted whenever the associated GPS device state is changed.\n'), ('distanceAreaChanged', 'Emitted whenever the distance area used to calculate track distances is\nchanged.\n'))), ('__virtual_methods__', ('setTransformContext',)), ('__signal_arguments__', (('trackIsEmptyChanged', ('isEmpty: bool',)), ('trackVertexAdded', ('vertex: QgsPoint',)), ('stateChanged', ('info: QgsGpsInformation',)))), ('__group__', ('gps',)))),
+    )),
+    ('src/core/symbology/qgsgraduatedsymbolrenderer.h', (
+        ('QgsGraduatedSymbolRenderer', ('makeBreaksSymmetric', 'calcEqualIntervalBreaks', 'createRenderer', 'create', 'convertFromRenderer', ('__overridden_methods__', ('flags', 'symbolForFeature', 'originalSymbolForFeature', 'startRender', 'stopRender', 'usedAttributes', 'filterNeedsGeometry', 'dump', 'clone', 'toSld', 'capabilities', 'symbols', 'accept', 'save', 'legendSymbolItems', 'legendKeysForFeature', 'legendKeyToExpression', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'checkLegendSymbolItem', 'setLegendSymbolItem', 'legendClassificationAttribute')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgsgrouplayer.h', (
+        ('QgsGroupLayer.LayerOptions', (('__attribute_docs__', (('transformContext', 'Coordinate transform context'),)), ('__annotations__', (('transformContext', 'QgsCoordinateTransformContext'),)))),
+        ('QgsGroupLayer', (('__overridden_methods__', ('clone', 'createMapRenderer', 'extent', 'setTransformContext', 'readXml', 'writeXml', 'writeSymbology', 'readSymbology', 'dataProvider', 'htmlMetadata', 'resolveReferences')),)),
+    )),
+    ('src/core/symbology/qgsheatmaprenderer.h', (
+        ('QgsHeatmapRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('clone', 'startRender', 'renderFeature', 'stopRender', 'symbolForFeature', 'symbols', 'dump', 'usedAttributes', 'save', 'accept', 'createLegendNodes', 'modifyRequestExtent')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/raster/qgshillshaderenderer.h', (
+        ('QgsHillshadeRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'writeXml', 'block', 'usesBands', 'inputBand', 'toSld', 'setInputBand')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/diagram/qgshistogramdiagram.h', (
+        ('QgsHistogramDiagram', (('__overridden_methods__', ('clone', 'renderDiagram', 'diagramSize', 'legendSize', 'diagramName')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/scalebar/qgshollowscalebarrenderer.h', (
+        ('QgsHollowScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'flags', 'sortKey', 'clone', 'draw', 'applyDefaultSettings')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/qgshstoreutils.h', (
+        ('QgsHstoreUtils', ('parse', 'build')),
+    )),
+    ('src/core/annotations/qgshtmlannotation.h', (
+        ('QgsHtmlAnnotation', ('create', ('__overridden_methods__', ('clone', 'minimumFrameSize', 'writeXml', 'readXml', 'setAssociatedFeature', 'renderAnnotation')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/qgshtmlutils.h', (
+        ('QgsHtmlUtils', ('buildBulletList',)),
+    )),
+    ('src/core/network/qgshttpheaders.h', (
+        ('QgsHttpHeaders', (('__group__', ('network',)),)),
+    )),
+    ('src/core/raster/qgshuesaturationfilter.h', (
+        ('QgsHueSaturationFilter', (('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'setInput', 'block', 'writeXml', 'readXml')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/qgsiconutils.h', (
+        ('QgsIconUtils', ('iconForWkbType', 'iconForGeometryType', 'iconPoint', 'iconLine', 'iconPolygon', 'iconGeometryCollection', 'iconTable', 'iconRaster', 'iconDefaultLayer', 'iconMesh', 'iconVectorTile', 'iconPointCloud', 'iconTiledScene', 'iconForLayer', 'iconForLayerType')),
+    )),
+    ('src/core/qgsimagecache.h', (
+        ('QgsImageCache', (('__attribute_docs__', (('remoteImageFetched', 'Emitted when the cache has finished retrieving an image file from a\nremote ``url``.\n'),)), ('__signal_arguments__', (('remoteImageFetched', ('url: str',)),)))),
+    )),
+    ('src/core/effects/qgsimageoperation.h', (
+        ('QgsImageOperation', ('convertToGrayscale', 'adjustBrightnessContrast', 'adjustHueSaturation', 'multiplyOpacity', 'overlayColor', 'distanceTransform', 'stackBlur', 'gaussianBlur', 'flipImage', 'nonTransparentImageRect', 'cropTransparent', ('__group__', ('effects',)))),
+    )),
+    ('src/core/symbology/qgsinterpolatedlinerenderer.h', (
+        ('QgsInterpolatedLineSymbolLayer', ('create', ('__overridden_methods__', ('flags', 'layerType', 'startRender', 'stopRender', 'clone', 'properties', 'drawPreviewIcon', 'color', 'startFeatureRender', 'stopFeatureRender', 'renderPolyline', 'canCauseArtifactsBetweenAdjacentTiles')), ('__group__', ('symbology',)))),
+        ('QgsInterpolatedLineColor', (('__group__', ('symbology',)),)),
+        ('QgsInterpolatedLineWidth', (('__group__', ('symbology',)),)),
+        ('QgsInterpolatedLineRenderer', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/symbology/qgsinvertedpolygonrenderer.h', (
+        ('QgsInvertedPolygonRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('clone', 'dump', 'save')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/sensor/qgsiodevicesensor.h', (
+        ('QgsTcpSocketSensor', ('create', ('__overridden_methods__', ('type', 'writePropertiesToElement', 'readPropertiesFromElement', 'handleConnect', 'handleDisconnect')), ('__group__', ('sensor',)))),
+        ('QgsUdpSocketSensor', ('create', ('__overridden_methods__', ('type', 'writePropertiesToElement', 'readPropertiesFromElement', 'handleConnect', 'handleDisconnect')), ('__group__', ('sensor',)))),
+        ('QgsSerialPortSensor', ('create', ('__overridden_methods__', ('type', 'writePropertiesToElement', 'readPropertiesFromElement', 'handleConnect', 'handleDisconnect', 'parseData')), ('__group__', ('sensor',)))),
+        ('QgsIODeviceSensor', (('__virtual_methods__', ('parseData',)), ('__group__', ('sensor',)))),
+    )),
+    ('src/core/qgsjsonutils.h', (
+        ('QgsJsonUtils', ('stringToFeatureList', 'stringToFields', 'encodeValue', 'exportAttributes', 'parseArray', 'geometryFromGeoJson')),
+    )),
+    ('src/core/fieldformatter/qgskeyvaluefieldformatter.h', (
+        ('QgsKeyValueFieldFormatter', (('__overridden_methods__', ('id', 'representValue')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/labeling/qgslabeling.h', (
+        ('QgsLabeling', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelingengine.h', (
+        ('QgsLabelCandidate', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/rules/qgslabelingenginerule.h', (
+        ('QgsAbstractLabelingEngineRule', (('__virtual_methods__', ('isAvailable', 'description', 'resolveReferences', 'copyCommonProperties')), ('__abstract_methods__', ('clone', 'id', 'displayType', 'prepare', 'writeXml', 'readXml')), ('__group__', ('labeling', 'rules')))),
+        ('QgsLabelingEngineContext', (('__group__', ('labeling', 'rules')),)),
+    )),
+    ('src/core/labeling/rules/qgslabelingenginerule_impl.h', (
+        ('QgsAbstractLabelingEngineRuleDistanceFromFeature', (('__overridden_methods__', ('prepare', 'writeXml', 'readXml', 'resolveReferences', 'isAvailable', 'copyCommonProperties')), ('__group__', ('labeling', 'rules')))),
+        ('QgsLabelingEngineRuleMinimumDistanceLabelToFeature', (('__overridden_methods__', ('clone', 'id', 'displayType', 'description')), ('__group__', ('labeling', 'rules')))),
+        ('QgsLabelingEngineRuleMaximumDistanceLabelToFeature', (('__overridden_methods__', ('clone', 'id', 'displayType', 'description')), ('__group__', ('labeling', 'rules')))),
+        ('QgsLabelingEngineRuleMinimumDistanceLabelToLabel', (('__overridden_methods__', ('clone', 'id', 'displayType', 'description', 'isAvailable', 'writeXml', 'readXml', 'resolveReferences', 'prepare')), ('__group__', ('labeling', 'rules')))),
+        ('QgsLabelingEngineRuleAvoidLabelOverlapWithFeature', (('__overridden_methods__', ('clone', 'id', 'displayType', 'description', 'prepare', 'writeXml', 'readXml', 'resolveReferences')), ('__group__', ('labeling', 'rules')))),
+    )),
+    ('src/core/labeling/rules/qgslabelingengineruleregistry.h', (
+        ('QgsLabelingEngineRuleRegistry', (('__group__', ('labeling', 'rules')),)),
+    )),
+    ('src/core/labeling/qgslabelingenginesettings.h', (
+        ('QgsLabelingEngineSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelingresults.h', (
+        ('QgsLabelingResults', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabellinesettings.h', (
+        ('QgsLabelLineSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelobstaclesettings.h', (
+        ('QgsLabelObstacleSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelplacementsettings.h', (
+        ('QgsLabelPlacementSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelpointsettings.h', (
+        ('QgsLabelPointSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelsearchtree.h', (
+        ('QgsLabelSearchTree', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/labeling/qgslabelthinningsettings.h', (
+        ('QgsLabelThinningSettings', (('__group__', ('labeling',)),)),
+    )),
+    ('src/core/qgslayerdefinition.h', (
+        ('QgsLayerDefinition', ('loadLayerDefinition', 'exportLayerDefinition', 'exportLayerDefinitionLayers', 'loadLayerDefinitionLayers')),
+    )),
+    ('src/core/browser/qgslayeritem.h', (
+        ('QgsLayerItem', ('typeFromMapLayer', 'layerTypeAsString', 'iconName', 'iconForWkbType', 'iconPoint', 'iconLine', 'iconPolygon', 'iconTable', 'iconRaster', 'iconDefault', 'iconMesh', 'iconVectorTile', 'iconPointCloud', ('__virtual_methods__', ('comments', 'deleteLayer', 'layerName')), ('__overridden_methods__', ('equal', 'hasDragEnabled', 'mimeUris', 'databaseConnection')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/metadata/qgslayermetadata.h', (
+        ('QgsLayerMetadata.SpatialExtent', (('__attribute_docs__', (('extentCrs', 'Coordinate reference system for spatial extent.\nThe CRS should match the CRS defined in the QgsLayerMetadata CRS property.\n\n.. seealso:: :py:func:`QgsLayerMetadata.crs`\n\n.. seealso:: :py:func:`spatial`'), ('bounds', 'Geospatial extent of the resource. X and Y coordinates are in the\nCRS defined by the metadata (see extentCrs).\n\nWhile the spatial extent can include a Z dimension, this is not\ncompulsory.\n\n.. seealso:: :py:func:`extentCrs`'))), ('__annotations__', (('extentCrs', 'QgsCoordinateReferenceSystem'), ('bounds', 'QgsBox3D'))), ('__group__', ('metadata',)))),
+        ('QgsLayerMetadata', (('__overridden_methods__', ('clone', 'readMetadataXml', 'writeMetadataXml', 'combine')), ('__group__', ('metadata',)))),
+        ('QgsLayerMetadata.Extent', (('__group__', ('metadata',)),)),
+    )),
+    ('src/core/metadata/qgslayermetadataformatter.h', (
+        ('QgsLayerMetadataFormatter', (('__group__', ('metadata',)),)),
+    )),
+    ('src/core/metadata/qgslayermetadataproviderregistry.h', (
+        ('QgsLayerMetadataProviderRegistry', (('__group__', ('metadata',)),)),
+    )),
+    ('src/core/metadata/qgslayermetadatavalidator.h', (
+        ('QgsAbstractMetadataBaseValidator', (('__abstract_methods__', ('validate',)), ('__group__', ('metadata',)))),
+        ('QgsNativeMetadataBaseValidator', (('__overridden_methods__', ('validate',)), ('__group__', ('metadata',)))),
+        ('QgsNativeMetadataValidator', (('__overridden_methods__', ('validate',)), ('__group__', ('metadata',)))),
+        ('QgsNativeProjectMetadataValidator', (('__overridden_methods__', ('validate',)), ('__group__', ('metadata',)))),
+    )),
+    ('src/core/qgslayernotesutils.h', (
+        ('QgsLayerNotesUtils', ('layerNotes', 'setLayerNotes', 'layerHasNotes', 'removeNotes')),
+    )),
+    ('src/core/layertree/qgslayertree.h', (
+        ('QgsLayerTree', (('__attribute_docs__', (('customLayerOrderChanged', 'Emitted when the custom layer order has changed.\n'), ('layerOrderChanged', 'Emitted when the layer order has changed.\n'), ('hasCustomLayerOrderChanged', 'Emitted when the hasCustomLayerOrder flag changes.\n\n.. seealso:: :py:func:`hasCustomLayerOrder`\n'))), 'isGroup', 'isLayer', 'readXml', ('__overridden_methods__', ('writeXml', 'clone')), ('__signal_arguments__', (('hasCustomLayerOrderChanged', ('hasCustomLayerOrder: bool',)),)), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreefilterproxymodel.h', (
+        ('QgsLayerTreeFilterProxyModel', (('__virtual_methods__', ('setFilterText', 'isLayerChecked', 'setLayerChecked')), ('__overridden_methods__', ('columnCount', 'flags', 'index', 'parent', 'sibling', 'data', 'setData', 'filterAcceptsRow')), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreefiltersettings.h', (
+        ('QgsLayerTreeFilterSettings', (('__group__', ('layertree',)),)),
+    )),
+    ('src/core/layertree/qgslayertreegroup.h', (
+        ('QgsLayerTreeGroup', ('readXml', ('__overridden_methods__', ('name', 'setName', 'writeXml', 'dump', 'clone', 'resolveReferences', 'setItemVisibilityCheckedRecursive')), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreelayer.h', (
+        ('QgsLayerTreeLayer', (('__attribute_docs__', (('layerLoaded', 'Emitted when a previously unavailable layer got loaded.\n'), ('layerWillBeUnloaded', 'Emitted when a previously available layer got unloaded (from layer\nregistry).\n'))), 'readXml', ('__overridden_methods__', ('name', 'setName', 'writeXml', 'dump', 'clone', 'resolveReferences')), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreemodel.h', (
+        ('QgsLayerTreeModel', (('__attribute_docs__', (('messageEmitted', 'Emits a message than can be displayed to the user in a GUI class\n\n.. versionadded:: 3.14\n'), ('hitTestStarted', 'Emitted when a hit test for visible legend items starts.\n\n.. seealso:: :py:func:`hitTestInProgress`\n\n.. seealso:: :py:func:`hitTestCompleted`\n\n.. versionadded:: 3.32\n'), ('hitTestCompleted', 'Emitted when a hit test for visible legend items completes.\n\n.. seealso:: :py:func:`hitTestInProgress`\n\n.. seealso:: :py:func:`hitTestStarted`\n\n.. versionadded:: 3.32\n'))), 'index2legendNode', 'scaleIconSize', 'iconGroup', ('__overridden_methods__', ('rowCount', 'columnCount', 'index', 'parent', 'data', 'flags', 'setData', 'supportedDropActions', 'mimeTypes', 'mimeData', 'dropMimeData', 'removeRows')), ('__signal_arguments__', (('messageEmitted', ('message: str', 'level: Qgis.MessageLevel = Qgis.MessageLevel.Info', 'duration: int = 5')),)), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreemodellegendnode.h', (
+        ('QgsLayerTreeModelLegendNode', (('__attribute_docs__', (('dataChanged', 'Emitted on internal data change so the layer tree model can forward the\nsignal to views\n'), ('sizeChanged', 'Emitted when the size of this node changes.\n\n.. versionadded:: 3.16\n'))), ('__virtual_methods__', ('flags', 'setData', 'isEmbeddedInParent', 'setEmbeddedInParent', 'userLabel', 'setUserLabel', 'userPatchSize', 'setUserPatchSize', 'setColumnBreak', 'columnBreak', 'isScaleOK', 'invalidateMapBasedData', 'draw', 'drawSymbol', 'exportSymbolToJson', 'drawSymbolText')), ('__abstract_methods__', ('data',)), ('__group__', ('layertree',)))),
+        ('QgsSymbolLegendNode', (('__overridden_methods__', ('flags', 'data', 'setData', 'drawSymbol', 'exportSymbolToJson', 'setEmbeddedInParent', 'setUserLabel', 'isScaleOK', 'invalidateMapBasedData')), ('__group__', ('layertree',)))),
+        ('QgsSimpleLegendNode', (('__overridden_methods__', ('data',)), ('__group__', ('layertree',)))),
+        ('QgsImageLegendNode', (('__overridden_methods__', ('data', 'drawSymbol', 'exportSymbolToJson')), ('__group__', ('layertree',)))),
+        ('QgsRasterSymbolLegendNode', (('__overridden_methods__', ('flags', 'data', 'setData', 'drawSymbol', 'exportSymbolToJson')), ('__group__', ('layertree',)))),
+        ('QgsWmsLegendNode', (('__overridden_methods__', ('data', 'drawSymbol', 'exportSymbolToJson', 'invalidateMapBasedData')), ('__group__', ('layertree',)))),
+        ('QgsDataDefinedSizeLegendNode', (('__overridden_methods__', ('data', 'draw')), ('__group__', ('layertree',)))),
+        ('QgsVectorLabelLegendNode', (('__overridden_methods__', ('data', 'drawSymbol', 'exportSymbolToJson')), ('__group__', ('layertree',)))),
+        ('QgsLayerTreeModelLegendNode.ItemMetrics', (('__group__', ('layertree',)),)),
+    )),
+    ('src/core/layertree/qgslayertreenode.h', (
+        ('QgsLayerTreeNode', (('__attribute_docs__', (('willAddChildren', 'Emitted when one or more nodes will be added to a node within the tree\n'), ('addedChildren', 'Emitted when one or more nodes have been added to a node within the tree\n'), ('willRemoveChildren', 'Emitted when one or more nodes will be removed from a node within the\ntree\n'), ('removedChildren', 'Emitted when one or more nodes has been removed from a node within the\ntree\n'), ('visibilityChanged', 'Emitted when check state of a node within the tree has been changed\n'), ('customPropertyChanged', 'Emitted when a custom property of a node within the tree has been\nchanged or removed\n'), ('expandedChanged', 'Emitted when the collapsed/expanded state of a node within the tree has\nbeen changed\n'), ('nameChanged', 'Emitted when the name of the node is changed\n'))), 'readXml', ('__virtual_methods__', ('setItemVisibilityCheckedRecursive',)), ('__abstract_methods__', ('name', 'setName', 'writeXml', 'dump', 'clone', 'resolveReferences')), ('__signal_arguments__', (('willAddChildren', ('node: QgsLayerTreeNode', 'indexFrom: int', 'indexTo: int')), ('addedChildren', ('node: QgsLayerTreeNode', 'indexFrom: int', 'indexTo: int')), ('willRemoveChildren', ('node: QgsLayerTreeNode', 'indexFrom: int', 'indexTo: int')), ('removedChildren', ('node: QgsLayerTreeNode', 'indexFrom: int', 'indexTo: int')), ('visibilityChanged', ('node: QgsLayerTreeNode',)), ('customPropertyChanged', ('node: QgsLayerTreeNode', 'key: str')), ('expandedChanged', ('node: QgsLayerTreeNode', 'expanded: bool')), ('nameChanged', ('node: QgsLayerTreeNode', 'name: str')))), ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layertree/qgslayertreeregistrybridge.h', (
+        ('QgsLayerTreeRegistryBridge', (('__attribute_docs__', (('addedLayersToLayerTree', 'Tell others we have just added layers to the tree (used in QGIS to\nauto-select first newly added layer)\n'),)), ('__signal_arguments__', (('addedLayersToLayerTree', ('layers: List[QgsMapLayer]',)),)), ('__group__', ('layertree',)))),
+        ('QgsLayerTreeRegistryBridge.InsertionPoint', (('__group__', ('layertree',)),)),
+    )),
+    ('src/core/layertree/qgslayertreeutils.h', (
+        ('QgsLayerTreeUtils', ('readOldLegend', 'readOldLegendLayerOrder', 'writeOldLegend', 'checkStateToXml', 'checkStateFromXml', 'layersEditable', 'layersModified', 'removeInvalidLayers', 'storeOriginalLayersProperties', 'replaceChildrenOfEmbeddedGroups', 'updateEmbeddedGroupsProjectPath', 'invisibleLayerList', 'setLegendFilterByExpression', 'legendFilterByExpression', 'hasLegendFilterExpression', 'insertLayerBelow', 'collectMapLayersRecursive', 'countMapLayerInTree', 'firstGroupWithoutCustomProperty', 'insertLayerAtOptimalPlacement', ('__group__', ('layertree',)))),
+    )),
+    ('src/core/layout/qgslayout.h', (
+        ('QgsLayout', (('__attribute_docs__', (('changed', 'Emitted when properties of the layout change. This signal is only\nemitted for settings directly managed by the layout, and is not emitted\nwhen child items change.\n'), ('variablesChanged', 'Emitted whenever the expression variables stored in the layout have been\nchanged.\n'), ('selectedItemChanged', 'Emitted whenever the selected item changes. If ``None``, no item is\nselected.\n'), ('refreshed', 'Emitted when the layout has been refreshed and items should also be\nrefreshed and updated.\n'), ('backgroundTaskCountChanged', 'Emitted whenever the ``total`` number of background tasks running in\nitems from the layout changes.\n\n.. versionadded:: 3.10\n'), ('itemAdded', 'Emitted when an ``item`` was added to the layout.\n\n.. versionadded:: 3.20\n'))), ('__virtual_methods__', ('writeXml', 'readXml')), ('__overridden_methods__', ('createExpressionContext', 'createCommand')), ('__signal_arguments__', (('selectedItemChanged', ('selected: QgsLayoutItem',)), ('backgroundTaskCountChanged', ('total: int',)), ('itemAdded', ('item: QgsLayoutItem',)))), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutaligner.h', (
+        ('QgsLayoutAligner', ('alignItems', 'distributeItems', 'resizeItems', ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutatlas.h', (
+        ('QgsLayoutAtlas', (('__attribute_docs__', (('changed', 'Emitted when one of the atlas parameters changes.\n'), ('toggled', 'Emitted when atlas is enabled or disabled.\n'), ('coverageLayerChanged', 'Emitted when the coverage layer for the atlas changes.\n'), ('messagePushed', 'Emitted when the atlas has an updated status bar ``message``.\n'), ('numberFeaturesChanged', 'Emitted when the number of features for the atlas changes.\n'), ('featureChanged', 'Emitted when the current atlas ``feature`` changes.\n'), ('renderBegun', 'Emitted when atlas rendering has begun.\n'), ('renderEnded', 'Emitted when atlas rendering has ended.\n'))), ('__overridden_methods__', ('stringType', 'layout', 'writeXml', 'readXml', 'beginRender', 'endRender', 'count', 'filePath', 'createExpressionContext', 'next')), ('__signal_arguments__', (('toggled', ('enabled: bool',)), ('coverageLayerChanged', ('layer: QgsVectorLayer',)), ('messagePushed', ('message: str',)), ('numberFeaturesChanged', ('numFeatures: int',)), ('featureChanged', ('feature: QgsFeature',)))), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayouteffect.h', (
+        ('QgsLayoutEffect', (('__overridden_methods__', ('draw',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutexporter.h', (
+        ('QgsLayoutExporter', ('exportToPdfs', 'requiresRasterization', 'containsAdvancedEffects', ('__virtual_methods__', ('generateFileName',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutframe.h', (
+        ('QgsLayoutFrame', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'cleanup', 'minimumSize', 'fixedSize', 'createExpressionContext', 'exportLayerBehavior', 'draw', 'drawFrame', 'drawBackground', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutgridsettings.h', (
+        ('QgsLayoutGridSettings', (('__overridden_methods__', ('stringType', 'layout', 'writeXml', 'readXml')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutguidecollection.h', (
+        ('QgsLayoutGuide', (('__attribute_docs__', (('positionChanged', "Emitted when the guide's position is changed.\n"),)), ('__group__', ('layout',)))),
+        ('QgsLayoutGuideCollection', (('__overridden_methods__', ('stringType', 'layout', 'rowCount', 'columnCount', 'data', 'setData', 'flags', 'headerData', 'removeRows', 'writeXml', 'readXml')), ('__group__', ('layout',)))),
+        ('QgsLayoutGuideProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitem.h', (
+        ('QgsLayoutItem', (('__attribute_docs__', (('frameChanged', "Emitted if the item's frame style changes.\n"), ('lockChanged', "Emitted if the item's lock status changes.\n\n.. seealso:: :py:func:`isLocked`\n\n.. seealso:: :py:func:`setLocked`\n"), ('rotationChanged', 'Emitted on item rotation change.\n'), ('sizePositionChanged', "Emitted when the item's size or position changes.\n"), ('backgroundTaskCountChanged', 'Emitted whenever the number of background tasks an item is executing\nchanges.\n\n.. versionadded:: 3.10\n'), ('clipPathChanged', "Emitted when the item's clipping path has changed.\n\n.. seealso:: :py:func:`clipPath`\n\n.. versionadded:: 3.16\n"))), ('__virtual_methods__', ('cleanup', 'icon', 'uuid', 'itemFlags', 'setId', 'displayName', 'setSelected', 'setVisibility', 'exportLayerBehavior', 'numberExportLayers', 'startLayeredExport', 'stopLayeredExport', 'nextExportPart', 'exportLayerDetails', 'fixedSize', 'minimumSize', 'attemptResize', 'attemptMove', 'finalizeRestoreFromXml', 'setFrameEnabled', 'setFrameStrokeWidth', 'containsAdvancedEffects', 'requiresRasterization', 'estimatedFrameBleed', 'rectWithFrame', 'moveContent', 'setMoveContentPreviewOffset', 'zoomContent', 'accept', 'clipPath', 'isRefreshing', 'invalidateCache', 'redraw', 'refreshDataDefinedProperty', 'setItemRotation', 'rotateItem', 'drawDebugRect', 'framePath', 'drawFrame', 'drawBackground', 'setFixedSize', 'setMinimumSize', 'applyItemSizeConstraint', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__abstract_methods__', ('draw',)), ('__overridden_methods__', ('type', 'paint', 'createCommand', 'createExpressionContext', 'refresh')), ('__signal_arguments__', (('rotationChanged', ('newRotation: float',)), ('backgroundTaskCountChanged', ('count: int',)))), ('__group__', ('layout',)))),
+        ('QgsLayoutItemRenderContext', (('__group__', ('layout',)),)),
+    )),
+    ('src/core/layout/qgslayoutitemattributetable.h', (
+        ('QgsLayoutItemAttributeTable', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'getTableContents', 'conditionalCellStyle', 'textFormatForCell', 'scopeForCell', 'createExpressionContext', 'finalizeRestoreFromXml', 'refreshDataDefinedProperty', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemelevationprofile.h', (
+        ('QgsLayoutItemElevationProfile', (('__attribute_docs__', (('previewRefreshed', "Emitted whenever the item's preview has been refreshed.\n\n.. versionadded:: 3.34\n"),)), 'create', ('__overridden_methods__', ('type', 'icon', 'refreshDataDefinedProperty', 'itemFlags', 'requiresRasterization', 'containsAdvancedEffects', 'paint', 'refresh', 'invalidateCache', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemgroup.h', (
+        ('QgsLayoutItemGroup', ('create', ('__overridden_methods__', ('cleanup', 'type', 'displayName', 'setVisibility', 'attemptMove', 'attemptResize', 'paint', 'finalizeRestoreFromXml', 'exportLayerBehavior', 'rectWithFrame', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemhtml.h', (
+        ('QgsLayoutItemHtml', ('create', 'createFromLabel', ('__overridden_methods__', ('type', 'icon', 'displayName', 'totalSize', 'render', 'findNearbyPageBreak', 'recalculateFrameSizes', 'refreshDataDefinedProperty', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemlabel.h', (
+        ('QgsLayoutItemLabel', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'boundingRect', 'setFrameEnabled', 'setFrameStrokeWidth', 'refresh', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemlegend.h', (
+        ('QgsLegendModel', (('__attribute_docs__', (('refreshLegend', 'Emitted to refresh the legend.\n\n.. versionadded:: 3.10\n'),)), ('__overridden_methods__', ('data', 'flags')), ('__group__', ('layout',)))),
+        ('QgsLayoutItemLegend', ('create', ('__overridden_methods__', ('type', 'icon', 'itemFlags', 'displayName', 'requiresRasterization', 'containsAdvancedEffects', 'paint', 'finalizeRestoreFromXml', 'createExpressionContext', 'exportLayerBehavior', 'accept', 'isRefreshing', 'refresh', 'invalidateCache', 'refreshDataDefinedProperty', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmanualtable.h', (
+        ('QgsLayoutItemManualTable', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'conditionalCellStyle', 'writePropertiesToElement', 'readPropertiesFromElement', 'calculateMaxRowHeights', 'textFormatForHeader', 'textFormatForCell', 'horizontalAlignmentForCell', 'verticalAlignmentForCell', 'rowSpan', 'columnSpan')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmap.h', (
+        ('QgsLayoutItemMapAtlasClippingSettings', (('__attribute_docs__', (('changed', 'Emitted when the atlas clipping settings are changed.\n'),)), ('__group__', ('layout',)))),
+        ('QgsLayoutItemMapItemClipPathSettings', (('__attribute_docs__', (('changed', 'Emitted when the item clipping settings are changed.\n'),)), ('__group__', ('layout',)))),
+        ('QgsLayoutItemMap', (('__attribute_docs__', (('extentChanged', "Emitted when the map's extent changes.\n\n.. seealso:: :py:func:`setExtent`\n\n.. seealso:: :py:func:`extent`\n"), ('mapRotationChanged', "Emitted when the map's rotation changes.\n\n.. seealso:: :py:func:`setMapRotation`\n\n.. seealso:: :py:func:`mapRotation`\n"), ('preparedForAtlas', 'Emitted when the map has been prepared for atlas rendering, just before\nactual rendering\n'), ('layerStyleOverridesChanged', 'Emitted when layer style overrides are changed... a means to let\nassociated legend items know they should update\n'), ('themeChanged', "Emitted when the map's associated ``theme`` is changed.\n\n.. note::\n\n   This signal is not emitted when the definition of the theme changes, only the map\n   is linked to a different theme then it previously was.\n\n.. versionadded:: 3.14\n"), ('crsChanged', "Emitted when the map's coordinate reference system is changed.\n\n.. versionadded:: 3.18\n"), ('previewRefreshed', "Emitted whenever the item's map preview has been refreshed.\n\n.. versionadded:: 3.20\n"))), 'create', ('__overridden_methods__', ('type', 'icon', 'itemFlags', 'displayName', 'paint', 'numberExportLayers', 'startLayeredExport', 'stopLayeredExport', 'nextExportPart', 'exportLayerBehavior', 'exportLayerDetails', 'setFrameStrokeWidth', 'moveContent', 'setMoveContentPreviewOffset', 'zoomContent', 'requiresRasterization', 'containsAdvancedEffects', 'createExpressionContext', 'finalizeRestoreFromXml', 'accept', 'estimatedFrameBleed', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement', 'framePath', 'boundingRect', 'refresh', 'invalidateCache', 'refreshDataDefinedProperty')), ('__signal_arguments__', (('mapRotationChanged', ('newRotation: float',)), ('themeChanged', ('theme: str',)))), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmapgrid.h', (
+        ('QgsLayoutItemMapGrid', (('__attribute_docs__', (('crsChanged', "Emitted whenever the grid's CRS is changed.\n\n.. versionadded:: 3.18\n"),)), ('__overridden_methods__', ('draw', 'writeXml', 'readXml', 'usesAdvancedEffects', 'setEnabled', 'createExpressionContext', 'accept', 'refresh')), ('__group__', ('layout',)))),
+        ('QgsLayoutItemMapGridStack', (('__overridden_methods__', ('readXml',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmapitem.h', (
+        ('QgsLayoutItemMapItem', (('__virtual_methods__', ('writeXml', 'readXml', 'finalizeRestoreFromXml', 'setEnabled', 'usesAdvancedEffects', 'accept', 'mapLayer')), ('__abstract_methods__', ('draw',)), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('layout',)))),
+        ('QgsLayoutItemMapItemStack', (('__virtual_methods__', ('writeXml', 'finalizeRestoreFromXml')), ('__abstract_methods__', ('readXml',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmapoverview.h', (
+        ('QgsLayoutItemMapOverviewStack', (('__overridden_methods__', ('readXml',)), ('__group__', ('layout',)))),
+        ('QgsLayoutItemMapOverview', (('__overridden_methods__', ('draw', 'writeXml', 'readXml', 'finalizeRestoreFromXml', 'usesAdvancedEffects', 'mapLayer', 'accept')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemmarker.h', (
+        ('QgsLayoutItemMarker', ('create', ('__overridden_methods__', ('type', 'icon', 'boundingRect', 'fixedSize', 'accept', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement', 'finalizeRestoreFromXml')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemnodeitem.h', (
+        ('QgsLayoutNodesItem', (('__virtual_methods__', ('updateBoundingRect',)), ('__abstract_methods__', ('isValid', '_addNode', '_removeNode', '_draw', '_readXmlStyle', '_writeXmlStyle')), ('__overridden_methods__', ('boundingRect', 'estimatedFrameBleed', 'draw', 'itemFlags', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitempage.h', (
+        ('QgsLayoutItemPage', ('create', 'decodePageOrientation', ('__overridden_methods__', ('type', 'displayName', 'boundingRect', 'attemptResize', 'createCommand', 'exportLayerBehavior', 'accept', 'redraw', 'draw', 'drawFrame', 'drawBackground', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitempicture.h', (
+        ('QgsLayoutItemPicture', (('__attribute_docs__', (('pictureRotationChanged', 'Emitted on picture rotation change\n'),)), 'create', ('__overridden_methods__', ('type', 'icon', 'finalizeRestoreFromXml', 'refreshDataDefinedProperty', 'draw', 'applyItemSizeConstraint', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__signal_arguments__', (('pictureRotationChanged', ('newRotation: float',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitempolygon.h', (
+        ('QgsLayoutItemPolygon', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'accept', 'itemFlags', 'clipPath', 'isValid', '_addNode', '_removeNode', '_draw', '_readXmlStyle', '_writeXmlStyle')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitempolyline.h', (
+        ('QgsLayoutItemPolyline', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'shape', 'isValid', 'accept', '_addNode', '_removeNode', '_draw', '_readXmlStyle', '_writeXmlStyle', 'writePropertiesToElement', 'readPropertiesFromElement', 'updateBoundingRect')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemregistry.h', (
+        ('QgsLayoutItemRegistry', (('__attribute_docs__', (('typeAdded', 'Emitted whenever a new item type is added to the registry, with the\nspecified ``type`` and visible ``name``.\n'), ('multiFrameTypeAdded', 'Emitted whenever a new multiframe type is added to the registry, with\nthe specified ``type`` and visible ``name``.\n'))), ('__signal_arguments__', (('typeAdded', ('type: int', 'name: str')), ('multiFrameTypeAdded', ('type: int', 'name: str')))), ('__group__', ('layout',)))),
+        ('QgsLayoutItemAbstractMetadata', (('__virtual_methods__', ('resolvePaths',)), ('__abstract_methods__', ('createItem',)), ('__group__', ('layout',)))),
+        ('QgsLayoutMultiFrameAbstractMetadata', (('__virtual_methods__', ('icon', 'resolvePaths')), ('__abstract_methods__', ('createMultiFrame',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemscalebar.h', (
+        ('QgsLayoutItemScaleBar', ('create', ('__overridden_methods__', ('type', 'icon', 'minimumSize', 'refreshDataDefinedProperty', 'finalizeRestoreFromXml', 'accept', 'exportLayerBehavior', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemshape.h', (
+        ('QgsLayoutItemShape', ('create', ('__overridden_methods__', ('type', 'icon', 'displayName', 'itemFlags', 'clipPath', 'boundingRect', 'estimatedFrameBleed', 'accept', 'draw', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutitemtexttable.h', (
+        ('QgsLayoutItemTextTable', ('create', ('__overridden_methods__', ('type', 'displayName', 'getTableContents')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutmanager.h', (
+        ('QgsLayoutManager', (('__attribute_docs__', (('layoutAboutToBeAdded', 'Emitted when a layout is about to be added to the manager\n'), ('layoutAdded', 'Emitted when a layout has been added to the manager\n'), ('layoutRemoved', 'Emitted when a layout was removed from the manager\n'), ('layoutAboutToBeRemoved', 'Emitted when a layout is about to be removed from the manager\n'), ('layoutRenamed', 'Emitted when a layout is renamed\n'))), ('__signal_arguments__', (('layoutAboutToBeAdded', ('name: str',)), ('layoutAdded', ('name: str',)), ('layoutRemoved', ('name: str',)), ('layoutAboutToBeRemoved', ('name: str',)), ('layoutRenamed', ('layout: QgsMasterLayoutInterface', 'newName: str')))), ('__group__', ('layout',)))),
+        ('QgsLayoutManagerModel', (('__overridden_methods__', ('rowCount', 'data', 'setData', 'flags')), ('__group__', ('layout',)))),
+        ('QgsLayoutManagerProxyModel', (('__overridden_methods__', ('lessThan', 'filterAcceptsRow')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutmeasurement.h', (
+        ('QgsLayoutMeasurement', ('decodeMeasurement', ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutmeasurementconverter.h', (
+        ('QgsLayoutMeasurementConverter', (('__group__', ('layout',)),)),
+    )),
+    ('src/core/layout/qgslayoutmodel.h', (
+        ('QgsLayoutModel', (('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data', 'flags', 'setData', 'headerData', 'supportedDropActions', 'mimeTypes', 'mimeData', 'dropMimeData', 'removeRows')), ('__group__', ('layout',)))),
+        ('QgsLayoutProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutmultiframe.h', (
+        ('QgsLayoutMultiFrame', (('__attribute_docs__', (('contentsChanged', 'Emitted when the contents of the multi frame have changed and the frames\nmust be redrawn.\n'),)), ('__virtual_methods__', ('icon', 'fixedFrameSize', 'minFrameSize', 'addFrame', 'findNearbyPageBreak', 'displayName', 'finalizeRestoreFromXml', 'recalculateFrameSizes', 'refreshDataDefinedProperty', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__abstract_methods__', ('totalSize', 'type', 'render')), ('__overridden_methods__', ('createCommand', 'createExpressionContext', 'refresh')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutnortharrowhandler.h', (
+        ('QgsLayoutNorthArrowHandler', (('__attribute_docs__', (('arrowRotationChanged', 'Emitted on arrow rotation change\n'),)), ('__signal_arguments__', (('arrowRotationChanged', ('newRotation: float',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutobject.h', (
+        ('QgsLayoutObject', (('__attribute_docs__', (('changed', "Emitted when the object's properties change.\n"),)), 'propertyAssociatesWithParentMultiframe', ('__virtual_methods__', ('refresh',)), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutpagecollection.h', (
+        ('QgsLayoutPageCollection', (('__attribute_docs__', (('changed', 'Emitted when pages are added or removed from the collection.\n'), ('pageAboutToBeRemoved', 'Emitted just before a page is removed from the collection.\n\nPage numbers in collections begin at 0 - so a page number of 0 indicates\nthe first page.\n'))), ('__overridden_methods__', ('stringType', 'layout', 'writeXml', 'readXml')), ('__signal_arguments__', (('pageAboutToBeRemoved', ('pageNumber: int',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutpoint.h', (
+        ('QgsLayoutPoint', ('decodePoint', ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutrendercontext.h', (
+        ('QgsLayoutRenderContext', (('__attribute_docs__', (('flagsChanged', "Emitted whenever the context's ``flags`` change.\n\n.. seealso:: :py:func:`setFlags`\n"), ('dpiChanged', "Emitted when the context's DPI is changed.\n"), ('predefinedScalesChanged', 'Emitted when the list of predefined scales changes.\n\n.. seealso:: :py:func:`predefinedScales`\n\n.. versionadded:: 3.10\n'))), ('__signal_arguments__', (('flagsChanged', ('flags: Qgis.LayoutRenderFlags',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutreportcontext.h', (
+        ('QgsLayoutReportContext', (('__attribute_docs__', (('layerChanged', "Emitted when the context's ``layer`` is changed.\n"), ('changed', 'Emitted certain settings in the context is changed, e.g. by setting a\nnew feature or vector layer for the context.\n'))), ('__signal_arguments__', (('layerChanged', ('layer: QgsVectorLayer',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutserializableobject.h', (
+        ('QgsLayoutSerializableObject', (('__abstract_methods__', ('stringType', 'layout', 'writeXml', 'readXml')), ('__overridden_methods__', ('createCommand',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutsize.h', (
+        ('QgsLayoutSize', ('decodeSize', ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutsnapper.h', (
+        ('QgsLayoutSnapper', (('__overridden_methods__', ('stringType', 'layout', 'writeXml', 'readXml')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayouttable.h', (
+        ('QgsLayoutTable', (('__virtual_methods__', ('conditionalCellStyle', 'scopeForCell', 'rowSpan', 'columnSpan', 'refreshAttributes', 'calculateMaxColumnWidths', 'calculateMaxRowHeights', 'textFormatForCell', 'textFormatForHeader', 'horizontalAlignmentForCell', 'verticalAlignmentForCell')), ('__abstract_methods__', ('getTableContents',)), ('__overridden_methods__', ('fixedFrameSize', 'minFrameSize', 'writePropertiesToElement', 'readPropertiesFromElement', 'totalSize', 'render', 'refresh', 'recalculateFrameSizes')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayouttablecolumn.h', (
+        ('QgsLayoutTableColumn', (('__group__', ('layout',)),)),
+    )),
+    ('src/core/layout/qgslayoutundocommand.h', (
+        ('QgsAbstractLayoutUndoCommand', (('__virtual_methods__', ('containsChange',)), ('__abstract_methods__', ('saveState', 'restoreState')), ('__overridden_methods__', ('undo', 'redo', 'id')), ('__group__', ('layout',)))),
+        ('QgsLayoutUndoObjectInterface', (('__abstract_methods__', ('createCommand',)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoutundostack.h', (
+        ('QgsLayoutUndoStack', (('__attribute_docs__', (('undoRedoOccurredForItems', 'Emitted when an undo or redo action has occurred, which affected a set\nof layout ``itemUuids``.\n'),)), ('__signal_arguments__', (('undoRedoOccurredForItems', ('itemUuids: Set[str]',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgslayoututils.h', (
+        ('QgsLayoutUtils', ('rotate', 'normalizedAngle', 'snappedAngle', 'createRenderContextForMap', 'createRenderContextForLayout', 'relativeResizeRect', 'relativePosition', 'scaledFontPixelSize', 'fontAscentMM', 'fontDescentMM', 'fontHeightMM', 'fontHeightCharacterMM', 'textWidthMM', 'textHeightMM', 'drawText', 'largestRotatedRectWithinBounds', 'decodePaperOrientation', 'scaleFactorFromItemStyle', 'mapLayerFromString', 'calculatePrettySize', 'itemIsAClippingSource', 'predefinedScales', ('__group__', ('layout',)))),
+    )),
+    ('src/core/layertree/qgslegendpatchshape.h', (
+        ('QgsLegendPatchShape', (('__group__', ('layertree',)),)),
+    )),
+    ('src/core/qgslegendrenderer.h', (
+        ('QgsLegendRenderer', ('setNodeLegendStyle', 'nodeLegendStyle')),
+    )),
+    ('src/core/qgslegendstyle.h', (
+        ('QgsLegendStyle', ('styleName', 'styleFromName', 'styleLabel')),
+    )),
+    ('src/core/symbology/qgslegendsymbolitem.h', (
+        ('QgsLegendSymbolItem', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/raster/qgslinearminmaxenhancement.h', (
+        ('QgsLinearMinMaxEnhancement', (('__overridden_methods__', ('enhance',)), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgslinearminmaxenhancementwithclip.h', (
+        ('QgsLinearMinMaxEnhancementWithClip', (('__overridden_methods__', ('enhance', 'isValueInDisplayableRange')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/symbology/qgslinearreferencingsymbollayer.h', (
+        ('QgsLinearReferencingSymbolLayer', ('create', ('__overridden_methods__', ('clone', 'properties', 'layerType', 'flags', 'subSymbol', 'setSubSymbol', 'startRender', 'stopRender', 'renderPolyline')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/geometry/qgslinesegment.h', (
+        ('QgsLineSegment2D', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/geometry/qgslinestring.h', (
+        ('QgsLineString', ('fromBezierCurve', 'fromQPolygonF', ('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'equals', 'xAt', 'yAt', 'zAt', 'mAt', 'toCurveType', 'geometryType', 'dimension', 'clone', 'clear', 'isEmpty', 'indexOf', 'isValid', 'snappedToGrid', 'removeDuplicateNodes', 'isClosed', 'isClosed2D', 'boundingBoxIntersects', 'asQPolygonF', 'simplifyByDistance', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'length', 'startPoint', 'endPoint', 'curveToLine', 'numPoints', 'nCoordinates', 'points', 'draw', 'transform', 'addToPainterPath', 'drawAsPolygon', 'insertVertex', 'moveVertex', 'deleteVertex', 'reversed', 'interpolatePoint', 'curveSubstring', 'closestSegment', 'pointAt', 'centroid', 'sumUpArea', 'vertexAngle', 'segmentLength', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'convertTo', 'scroll', 'createEmptyWithSameType', 'calculateBoundingBox3D', 'compareToSameClass')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/symbology/qgslinesymbol.h', (
+        ('QgsLineSymbol', ('createSimple', ('__overridden_methods__', ('clone',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgslinesymbollayer.h', (
+        ('QgsSimpleLineSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPolyline', 'renderPolygonStroke', 'properties', 'clone', 'toSld', 'ogrFeatureStyle', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'estimateMaxBleed', 'dxfCustomDashPattern', 'dxfPenStyle', 'dxfWidth', 'dxfOffset', 'dxfColor', 'canCauseArtifactsBetweenAdjacentTiles')), ('__group__', ('symbology',)))),
+        ('QgsTemplatedLineSymbolLayerBase', ('setCommonProperties', ('__virtual_methods__', ('renderPolygonStroke', 'outputUnit', 'setMapUnitScale', 'mapUnitScale')), ('__abstract_methods__', ('setSymbolLineAngle', 'symbolAngle', 'setSymbolAngle', 'renderSymbol')), ('__overridden_methods__', ('renderPolyline', 'setOutputUnit', 'properties', 'canCauseArtifactsBetweenAdjacentTiles', 'startFeatureRender', 'stopFeatureRender')), ('__group__', ('symbology',)))),
+        ('QgsMarkerLineSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'clone', 'toSld', 'setColor', 'color', 'subSymbol', 'setSubSymbol', 'setWidth', 'width', 'estimateMaxBleed', 'setOutputUnit', 'usesMapUnits', 'usedAttributes', 'hasDataDefinedProperties', 'setDataDefinedProperty', 'renderPolyline', 'setSymbolLineAngle', 'symbolAngle', 'setSymbolAngle', 'renderSymbol')), ('__group__', ('symbology',)))),
+        ('QgsHashedLineSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'properties', 'clone', 'setColor', 'color', 'subSymbol', 'setSubSymbol', 'setWidth', 'width', 'estimateMaxBleed', 'setOutputUnit', 'usedAttributes', 'hasDataDefinedProperties', 'setDataDefinedProperty', 'usesMapUnits', 'renderPolyline', 'setSymbolLineAngle', 'symbolAngle', 'setSymbolAngle', 'renderSymbol')), ('__group__', ('symbology',)))),
+        ('QgsRasterLineSymbolLayer', ('create', 'resolvePaths', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPolyline', 'properties', 'clone', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'estimateMaxBleed', 'color')), ('__group__', ('symbology',)))),
+        ('QgsLineburstSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPolyline', 'properties', 'clone', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'estimateMaxBleed')), ('__group__', ('symbology',)))),
+        ('QgsFilledLineSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'startFeatureRender', 'stopFeatureRender', 'renderPolyline', 'properties', 'clone', 'subSymbol', 'setSubSymbol', 'hasDataDefinedProperties', 'setColor', 'color', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'estimateMaxBleed', 'usedAttributes')), ('__group__', ('symbology',)))),
+        ('QgsAbstractBrushedLineSymbolLayer', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/fieldformatter/qgslistfieldformatter.h', (
+        ('QgsListFieldFormatter', (('__overridden_methods__', ('id', 'representValue')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/qgslocaldefaultsettings.h', (
+        ('QgsLocalDefaultSettings', ('setBearingFormat', 'bearingFormat', 'setGeographicCoordinateFormat', 'geographicCoordinateFormat')),
+    )),
+    ('src/core/locator/qgslocator.h', (
+        ('QgsLocator', (('__attribute_docs__', (('CORE_FILTERS', 'List of core filters (i.e. not plugin filters)'), ('foundResult', 'Emitted whenever a filter encounters a matching ``result`` after the\n:py:func:`~QgsLocator.fetchResults` method is called.\n'), ('searchPrepared', 'Emitted when locator has prepared the search\n(:py:func:`QgsLocatorFilter.prepare`) before the search is actually\nperformed\n\n.. versionadded:: 3.16\n'), ('finished', 'Emitted when locator has finished a query, either as a result of\nsuccessful completion or early cancellation.\n'))), ('__annotations__', (('CORE_FILTERS', 'List[str]'),)), ('__signal_arguments__', (('foundResult', ('result: QgsLocatorResult',)),)), ('__group__', ('locator',)))),
+    )),
+    ('src/core/locator/qgslocatorfilter.h', (
+        ('QgsLocatorFilter', (('__attribute_docs__', (('finished', 'Emitted when the filter finishes fetching results.\n'), ('resultFetched', 'Should be emitted by filters whenever they encounter a matching result\nduring within their :py:func:`~QgsLocatorFilter.fetchResults`\nimplementation.\n'))), 'stringMatches', 'fuzzyScore', ('__virtual_methods__', ('description', 'flags', 'priority', 'prefix', 'prepare', 'resultSelected', 'resultDeselected', 'triggerResultFromAction', 'clearPreviousResults', 'hasConfigWidget', 'openConfigWidget')), ('__abstract_methods__', ('clone', 'name', 'displayName', 'fetchResults', 'triggerResult')), ('__signal_arguments__', (('resultFetched', ('result: QgsLocatorResult',)),)), ('__group__', ('locator',)))),
+        ('QgsLocatorResult.ResultAction', (('__group__', ('locator',)),)),
+    )),
+    ('src/core/locator/qgslocatormodel.h', (
+        ('QgsLocatorAutomaticModel', (('__virtual_methods__', ('createContext',)), ('__group__', ('locator',)))),
+        ('QgsLocatorModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'flags', 'roleNames')), ('__group__', ('locator',)))),
+        ('QgsLocatorProxyModel', (('__overridden_methods__', ('lessThan',)), ('__group__', ('locator',)))),
+    )),
+    ('src/core/locator/qgslocatormodelbridge.h', (
+        ('QgsLocatorModelBridge', (('__attribute_docs__', (('resultAdded', 'Emitted when a result is added\n'), ('isRunningChanged', 'Emitted when the running status changes\n'), ('resultsCleared', 'Emitted when the results are cleared\n'))), ('__group__', ('locator',)))),
+    )),
+    ('src/core/qgslogger.h', (
+        ('QgsLogger', ('warning', 'critical', 'fatal', 'debugLevel', 'logMessageToFile', 'logFile')),
+    )),
+    ('src/core/vectortile/qgsmapboxglstyleconverter.h', (
+        ('QgsMapBoxGlStyleConverter', ('parseFillLayer', 'parseLineLayer', 'parseCircleLayer', 'parseSymbolLayer', 'parseSymbolLayerAsRenderer', 'parseInterpolateColorByZoom', 'parseInterpolateByZoom', 'parseInterpolateOpacityByZoom', 'parseOpacityStops', 'parseInterpolatePointByZoom', 'parseInterpolateStringByZoom', 'parsePointStops', 'parseArrayStops', 'parseStops', 'parseStringStops', 'parseLabelStops', 'parseValueList', 'parseMatchList', 'parseStepList', 'parseInterpolateListByZoom', 'parseColorExpression', 'parseColor', 'colorAsHslaComponents', 'interpolateExpression', 'parseCapStyle', 'parseJoinStyle', 'parseExpression', 'retrieveSprite', 'retrieveSpriteAsBase64', 'retrieveSpriteAsBase64WithProperties', ('__group__', ('vectortile',)))),
+        ('QgsMapBoxGlStyleAbstractSource', (('__abstract_methods__', ('type', 'setFromJson')), ('__group__', ('vectortile',)))),
+        ('QgsMapBoxGlStyleRasterSource', (('__overridden_methods__', ('type', 'setFromJson')), ('__group__', ('vectortile',)))),
+        ('QgsMapBoxGlStyleConversionContext', (('__group__', ('vectortile',)),)),
+        ('QgsMapBoxGlStyleRasterSubLayer', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/qgsmapclippingutils.h', (
+        ('QgsMapClippingUtils', ('collectClippingRegionsForLayer', 'calculateFeatureRequestGeometry', 'calculateFeatureIntersectionGeometry', 'calculatePainterClipRegion', 'calculateLabelIntersectionGeometry')),
+    )),
+    ('src/core/qgsmapdecoration.h', (
+        ('QgsMapDecoration', (('__virtual_methods__', ('hasFixedMapPosition',)), ('__abstract_methods__', ('render',)))),
+    )),
+    ('src/core/qgsmaphittest.h', (
+        ('QgsMapHitTestTask', (('__overridden_methods__', ('cancel', 'run')),)),
+    )),
+    ('src/core/symbology/qgsmapinfosymbolconverter.h', (
+        ('QgsMapInfoSymbolConverter', ('convertLineSymbol', 'convertFillSymbol', 'convertMarkerSymbol', ('__group__', ('symbology',)))),
+        ('QgsMapInfoSymbolConversionContext', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/qgsmaplayer.h', (
+        ('QgsMapLayer', (('__attribute_docs__', (('beforeResolveReferences', 'Emitted when all layers are loaded and references can be resolved, just\nbefore the references of this layer are resolved.\n\n.. versionadded:: 3.10\n'), ('statusChanged', 'Emit a signal with status (e.g. to be caught by QgisApp and display a\nmsg on status bar)\n'), ('idChanged', "Emitted when the layer's ID has been changed.\n\n.. seealso:: :py:func:`id`\n\n.. seealso:: :py:func:`setId`\n\n.. versionadded:: 3.38\n"), ('nameChanged', 'Emitted when the name has been changed\n'), ('crsChanged', 'Emitted when the :py:func:`~QgsMapLayer.crs` of the layer has changed.\n\n.. seealso:: :py:func:`crs`\n\n.. seealso:: :py:func:`setCrs`\n\n.. seealso:: :py:func:`verticalCrsChanged`\n\n.. seealso:: :py:func:`crs3DChanged`\n'), ('crs3DChanged', 'Emitted when the :py:func:`~QgsMapLayer.crs3D` of the layer has changed.\n\n.. seealso:: :py:func:`crs3D`\n\n.. seealso:: :py:func:`crsChanged`\n\n.. seealso:: :py:func:`verticalCrsChanged`\n\n.. versionadded:: 3.38\n'), ('verticalCrsChanged', 'Emitted when the :py:func:`~QgsMapLayer.verticalCrs` of the layer has\nchanged.\n\nThis signal will be emitted whenever the vertical CRS of the layer is\nchanged, either as a direct result of a call to\n:py:func:`~QgsMapLayer.setVerticalCrs` or when\n:py:func:`~QgsMapLayer.setCrs` is called with a compound CRS.\n\n.. seealso:: :py:func:`crsChanged`\n\n.. seealso:: :py:func:`crs3DChanged`\n\n.. seealso:: :py:func:`setCrs`\n\n.. seealso:: :py:func:`setVerticalCrs`\n\n.. seealso:: :py:func:`verticalCrs`\n\n.. versionadded:: 3.38\n'), ('repaintRequested', 'By emitting this signal the layer tells that either appearance or\ncontent have been changed and any view showing the rendered layer should\nrefresh itself. If ``deferredUpdate`` is ``True`` then the layer will\nonly be repainted when the canvas is next re-rendered, and will not\ntrigger any canvas redraws itself.\n'), ('recalculateExtents', 'This is used to send a request that any mapcanvas using this layer\nupdate its extents\n'), ('dataChanged', 'Data of layer changed\n'), ('blendModeChanged', 'Signal emitted when the blend mode is changed, through\n:py:func:`QgsMapLayer.setBlendMode()`\n'), ('opacityChanged', "Emitted when the layer's opacity is changed, where ``opacity`` is a\nvalue between 0 (transparent) and 1 (opaque).\n\n.. seealso:: :py:func:`setOpacity`\n\n.. seealso:: :py:func:`opacity`\n\n.. note::\n\n   Prior to QGIS 3.18, this signal was available for vector layers only\n\n.. versionadded:: 3.18\n"), ('rendererChanged', 'Signal emitted when renderer is changed.\n\n.. seealso:: :py:func:`styleChanged`\n'), ('styleChanged', "Signal emitted whenever a change affects the layer's style. Ie this may\nbe triggered by renderer changes, label style changes, or other style\nchanges such as blend mode or layer opacity changes.\n\n.. warning::\n\n   This signal should never be manually emitted. Instead call the :py:func:`~QgsMapLayer.emitStyleChanged` method\n   to ensure that the signal is only emitted when appropriate.\n\n.. seealso:: :py:func:`rendererChanged`\n"), ('legendChanged', 'Signal emitted when legend of the layer has changed\n'), ('renderer3DChanged', 'Signal emitted when 3D renderer associated with the layer has changed.\n'), ('request3DUpdate', 'Signal emitted when a layer requires an update in any 3D maps.\n\n.. versionadded:: 3.18\n'), ('configChanged', 'Emitted whenever the configuration is changed. The project listens to\nthis signal to be marked as dirty.\n'), ('dependenciesChanged', 'Emitted when dependencies are changed.\n'), ('willBeDeleted', 'Emitted in the destructor when the layer is about to be deleted, but it\nis still in a perfectly valid state: the last chance for other pieces of\ncode for some cleanup if they use the layer.\n'), ('autoRefreshIntervalChanged', 'Emitted when the auto refresh interval changes.\n\n.. seealso:: :py:func:`setAutoRefreshInterval`\n'), ('metadataChanged', "Emitted when the layer's metadata is changed.\n\n.. seealso:: :py:func:`setMetadata`\n\n.. seealso:: :py:func:`metadata`\n"), ('flagsChanged', "Emitted when layer's flags have been modified.\n\n.. seealso:: :py:func:`setFlags`\n\n.. seealso:: :py:func:`flags`\n\n.. versionadded:: 3.4\n"), ('dataSourceChanged', "Emitted whenever the layer's data source has been changed.\n\n.. seealso:: :py:func:`setDataSource`\n\n.. versionadded:: 3.5\n"), ('styleLoaded', 'Emitted when a style has been loaded\n\n:param categories: style categories\n\n.. versionadded:: 3.12\n'), ('isValidChanged', 'Emitted when the validity of this layer changed.\n\n.. versionadded:: 3.16\n'), ('customPropertyChanged', 'Emitted when a custom property of the layer has been changed or removed.\n\n.. versionadded:: 3.18\n'), ('editingStarted', 'Emitted when editing on this layer has started.\n\n.. versionadded:: 3.22\n'), ('editingStopped', 'Emitted when edited changes have been successfully written to the data\nprovider.\n\n.. versionadded:: 3.22\n'), ('layerModified', 'Emitted when modifications has been done on layer\n\n.. versionadded:: 3.22\n'), ('mapTipTemplateChanged', 'Emitted when the map tip template changes\n\n.. versionadded:: 3.30\n'), ('mapTipsEnabledChanged', 'Emitted when map tips are enabled or disabled for the layer.\n\n.. seealso:: :py:func:`setMapTipsEnabled`\n\n.. versionadded:: 3.32\n'))), 'extensionPropertyType', 'formatLayerName', 'generateId', 'providerReadFlags', ('__virtual_methods__', ('properties', 'dataProvider', 'setOpacity', 'opacity', 'reload', 'extent', 'extent3D', 'subLayers', 'setLayerOrder', 'setSubLayerVisibility', 'supportsEditing', 'isEditable', 'isModified', 'isSpatial', 'isTemporary', 'resolveReferences', 'listStylesInDatabase', 'getStyleFromDatabase', 'deleteStyleFromDatabase', 'saveStyleToDatabase', 'loadNamedStyle', 'error', 'metadataUri', 'saveDefaultMetadata', 'loadNamedMetadata', 'loadDefaultMetadata', 'styleURI', 'loadDefaultStyle', 'loadNamedStyleFromDatabase', 'importNamedStyle', 'exportNamedStyle', 'exportSldStyle', 'exportSldStyleV2', 'exportSldStyleV3', 'saveDefaultStyle', 'saveNamedStyle', 'saveSldStyle', 'saveSldStyleV2', 'loadSldStyle', 'readSld', 'readSymbology', 'readStyle', 'writeSymbology', 'writeStyle', 'setMetadata', 'htmlMetadata', 'timestamp', 'dependencies', 'accept', 'selectionProperties', 'temporalProperties', 'elevationProperties', 'profileSource', 'hasMapTips', 'setDependencies', 'setExtent', 'setExtent3D', 'readXml', 'writeXml', 'encodedSource', 'decodedSource')), ('__abstract_methods__', ('clone', 'createMapRenderer', 'readSymbology', 'writeSymbology', 'setTransformContext')), ('__signal_arguments__', (('beforeResolveReferences', ('project: QgsProject',)), ('statusChanged', ('status: str',)), ('idChanged', ('id: str',)), ('repaintRequested', ('deferredUpdate: bool = False',)), ('blendModeChanged', ('blendMode: QPainter.CompositionMode',)), ('opacityChanged', ('opacity: float',)), ('autoRefreshIntervalChanged', ('interval: int',)), ('styleLoaded', ('categories: QgsMapLayer.StyleCategories',)), ('customPropertyChanged', ('key: str',)))))),
+    )),
+    ('src/core/qgsmaplayerelevationproperties.h', (
+        ('QgsMapLayerElevationProperties', (('__attribute_docs__', (('changed', 'Emitted when any of the elevation properties have changed.\n\nSee :py:func:`~QgsMapLayerElevationProperties.renderingPropertyChanged`\nand\n:py:func:`~QgsMapLayerElevationProperties.profileGenerationPropertyChanged`\nfor more fine-grained signals.\n'), ('zOffsetChanged', 'Emitted when the z offset changes.\n\n.. versionadded:: 3.26\n'), ('zScaleChanged', 'Emitted when the z scale changes.\n\n.. versionadded:: 3.26\n'), ('profileRenderingPropertyChanged', 'Emitted when any of the elevation properties which relate solely to\npresentation of elevation results have changed.\n\n.. seealso:: :py:func:`changed`\n\n.. seealso:: :py:func:`profileGenerationPropertyChanged`\n\n.. versionadded:: 3.26\n'), ('profileGenerationPropertyChanged', 'Emitted when any of the elevation properties which relate solely to\ngeneration of elevation profiles have changed.\n\n.. seealso:: :py:func:`changed`\n\n.. seealso:: :py:func:`profileRenderingPropertyChanged`\n\n.. versionadded:: 3.26\n'))), 'propertyDefinitions', ('__virtual_methods__', ('hasElevation', 'setDefaultsFromLayer', 'htmlSummary', 'isVisibleInZRange', 'flags', 'calculateZRange', 'significantZValues', 'showByDefaultInElevationProfilePlots')), ('__abstract_methods__', ('writeXml', 'readXml', 'clone')))),
+    )),
+    ('src/core/qgsmaplayerfactory.h', (
+        ('QgsMapLayerFactory', ('typeFromString', 'typeToString', 'createLayer')),
+    )),
+    ('src/core/qgsmaplayerlegend.h', (
+        ('QgsMapLayerLegend', (('__attribute_docs__', (('itemsChanged', 'Emitted when existing items/nodes got invalid and should be replaced by\nnew ones\n'),)), 'defaultVectorLegend', 'defaultRasterLegend', 'defaultMeshLegend', 'defaultPointCloudLegend', ('__virtual_methods__', ('readXml', 'writeXml')), ('__abstract_methods__', ('createLayerTreeModelLegendNodes',)))),
+        ('QgsMapLayerLegendUtils', ('setLegendNodeOrder', 'legendNodeOrder', 'hasLegendNodeOrder', 'setLegendNodeUserLabel', 'legendNodeUserLabel', 'hasLegendNodeUserLabel', 'setLegendNodePatchShape', 'legendNodePatchShape', 'setLegendNodeSymbolSize', 'legendNodeSymbolSize', 'setLegendNodeCustomSymbol', 'legendNodeCustomSymbol', 'setLegendNodeColorRampSettings', 'legendNodeColorRampSettings', 'setLegendNodeColumnBreak', 'legendNodeColumnBreak', 'applyLayerNodeProperties')),
+        ('QgsDefaultVectorLayerLegend', (('__overridden_methods__', ('createLayerTreeModelLegendNodes', 'readXml', 'writeXml')),)),
+        ('QgsDefaultRasterLayerLegend', (('__overridden_methods__', ('createLayerTreeModelLegendNodes',)),)),
+        ('QgsDefaultMeshLayerLegend', (('__overridden_methods__', ('createLayerTreeModelLegendNodes',)),)),
+        ('QgsDefaultPointCloudLayerLegend', (('__overridden_methods__', ('createLayerTreeModelLegendNodes',)),)),
+    )),
+    ('src/core/qgsmaplayermodel.h', (
+        ('QgsMapLayerModel', ('iconForLayer', ('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data', 'setData', 'flags', 'insertRows', 'removeRows', 'mimeTypes', 'canDropMimeData', 'mimeData', 'dropMimeData', 'supportedDropActions')))),
+    )),
+    ('src/core/qgsmaplayerproxymodel.h', (
+        ('QgsMapLayerProxyModel', ('layerMatchesFilters', ('__overridden_methods__', ('filterAcceptsRow', 'lessThan')))),
+    )),
+    ('src/core/qgsmaplayerrenderer.h', (
+        ('QgsMapLayerRenderer', (('__virtual_methods__', ('forceRasterRender', 'flags', 'feedback')), ('__abstract_methods__', ('render',)))),
+    )),
+    ('src/core/qgsmaplayerselectionproperties.h', (
+        ('QgsMapLayerSelectionProperties', (('__abstract_methods__', ('writeXml', 'readXml', 'clone')),)),
+    )),
+    ('src/core/qgsmaplayerserverproperties.h', (
+        ('QgsServerWmsDimensionProperties', ('wmsDimensionDefaultDisplayLabels',)),
+        ('QgsMapLayerServerProperties', (('__overridden_methods__', ('layer',)),)),
+    )),
+    ('src/core/qgsmaplayerstore.h', (
+        ('QgsMapLayerStore', (('__attribute_docs__', (('layersWillBeRemoved', 'Emitted when one or more layers are about to be removed from the store.\n\n:param layers: A list of layers which are to be removed.\n\n.. seealso:: :py:func:`layerWillBeRemoved`\n\n.. seealso:: :py:func:`layersRemoved`\n'), ('layerWillBeRemoved', 'Emitted when a layer is about to be removed from the store.\n\n:param layer: The layer to be removed.\n\n.. note::\n\n   Consider using :py:func:`~QgsMapLayerStore.layersWillBeRemoved` instead.\n\n.. seealso:: :py:func:`layersWillBeRemoved`\n\n.. seealso:: :py:func:`layerRemoved`\n'), ('layersRemoved', 'Emitted after one or more layers were removed from the store.\n\n:param layerIds: A list of IDs of the layers which were removed.\n\n.. seealso:: :py:func:`layersWillBeRemoved`\n'), ('layerRemoved', 'Emitted after a layer was removed from the store.\n\n:param layerId: The ID of the layer removed.\n\n.. note::\n\n   Consider using :py:func:`~QgsMapLayerStore.layersRemoved` instead\n\n.. seealso:: :py:func:`layerWillBeRemoved`\n'), ('allLayersRemoved', 'Emitted when all layers are removed, before\n:py:func:`~QgsMapLayerStore.layersWillBeRemoved` and\n:py:func:`~QgsMapLayerStore.layerWillBeRemoved` signals are emitted. The\n:py:func:`~QgsMapLayerStore.layersWillBeRemoved` and\n:py:func:`~QgsMapLayerStore.layerWillBeRemoved` signals will still be\nemitted following this signal. You can use this signal to do easy (and\nfast) cleanup.\n'), ('layersAdded', 'Emitted when one or more layers were added to the store.\n\n:param layers: List of layers which have been added.\n\n.. seealso:: :py:func:`layerWasAdded`\n'), ('layerWasAdded', 'Emitted when a ``layer`` was added to the store.\n\n.. note::\n\n   Consider using :py:func:`~QgsMapLayerStore.layersAdded` instead\n\n.. seealso:: :py:func:`layersAdded`\n'))), ('__signal_arguments__', (('layersWillBeRemoved', ('layers: List[QgsMapLayer]',)), ('layerWillBeRemoved', ('layer: QgsMapLayer',)), ('layersRemoved', ('layerIds: List[str]',)), ('layerRemoved', ('layerId: str',)), ('layersAdded', ('layers: List[QgsMapLayer]',)), ('layerWasAdded', ('layer: QgsMapLayer',)))))),
+    )),
+    ('src/core/qgsmaplayerstylemanager.h', (
+        ('QgsMapLayerStyleManager', (('__attribute_docs__', (('styleAdded', 'Emitted when a new style has been added\n'), ('styleRemoved', 'Emitted when a style has been removed\n'), ('styleRenamed', 'Emitted when a style has been renamed\n'), ('currentStyleChanged', 'Emitted when the current style has been changed\n'))), 'isDefault', ('__signal_arguments__', (('styleAdded', ('name: str',)), ('styleRemoved', ('name: str',)), ('styleRenamed', ('oldName: str', 'newName: str')), ('currentStyleChanged', ('currentName: str',)))))),
+    )),
+    ('src/core/qgsmaplayertemporalproperties.h', (
+        ('QgsMapLayerTemporalProperties', (('__virtual_methods__', ('isVisibleInTemporalRange', 'allTemporalRanges')), ('__abstract_methods__', ('writeXml', 'readXml', 'setDefaultsFromDataProviderTemporalCapabilities')))),
+    )),
+    ('src/core/qgsmaplayerutils.h', (
+        ('QgsMapLayerUtils', ('combinedExtent', 'databaseConnection', 'layerSourceMatchesPath', 'updateLayerSourcePath', 'sortLayersByType', 'launderLayerName', 'isOpenStreetMapLayer')),
+    )),
+    ('src/core/maprenderer/qgsmaprenderercache.h', (
+        ('QgsMapRendererCache', (('__group__', ('maprenderer',)),)),
+    )),
+    ('src/core/maprenderer/qgsmaprenderercustompainterjob.h', (
+        ('QgsMapRendererCustomPainterJob', (('__overridden_methods__', ('cancel', 'cancelWithoutBlocking', 'waitForFinished', 'isActive', 'usedCachedLabels', 'takeLabelingResults')), ('__group__', ('maprenderer',)))),
+        ('QgsMapRendererAbstractCustomPainterJob', (('__group__', ('maprenderer',)),)),
+    )),
+    ('src/core/maprenderer/qgsmaprendererjob.h', (
+        ('QgsMapRendererJob', (('__attribute_docs__', (('renderingLayersFinished', 'Emitted when the layers are rendered. Rendering labels is not yet done.\nIf the fully rendered layer including labels is required use\n:py:func:`~QgsMapRendererJob.finished` instead.\n'), ('layerRenderingStarted', 'Emitted just before rendering starts for a particular layer.\n\n.. note::\n\n   the :py:class:`QgsMapRendererParallelJob` subclass does not emit this signal.\n\n.. versionadded:: 3.24\n'), ('layerRendered', 'Emitted when a layer has completed rendering.\n\n.. note::\n\n   the :py:class:`QgsMapRendererParallelJob` subclass does not emit this signal.\n\n.. versionadded:: 3.24\n'), ('finished', 'emitted when asynchronous rendering is finished (or canceled).\n'))), ('__abstract_methods__', ('cancel', 'cancelWithoutBlocking', 'waitForFinished', 'isActive', 'usedCachedLabels', 'takeLabelingResults')), ('__signal_arguments__', (('layerRenderingStarted', ('layerId: str',)), ('layerRendered', ('layerId: str',)))), ('__group__', ('maprenderer',)))),
+        ('QgsMapRendererQImageJob', (('__abstract_methods__', ('renderedImage',)), ('__group__', ('maprenderer',)))),
+        ('QgsMapRendererJob.Error', (('__group__', ('maprenderer',)),)),
+    )),
+    ('src/core/maprenderer/qgsmaprendererparalleljob.h', (
+        ('QgsMapRendererParallelJob', (('__overridden_methods__', ('cancel', 'cancelWithoutBlocking', 'waitForFinished', 'isActive', 'usedCachedLabels', 'takeLabelingResults', 'renderedImage')), ('__group__', ('maprenderer',)))),
+    )),
+    ('src/core/maprenderer/qgsmaprenderersequentialjob.h', (
+        ('QgsMapRendererSequentialJob', (('__overridden_methods__', ('cancel', 'cancelWithoutBlocking', 'waitForFinished', 'isActive', 'usedCachedLabels', 'takeLabelingResults', 'renderedImage')), ('__group__', ('maprenderer',)))),
+    )),
+    ('src/core/maprenderer/qgsmaprenderertask.h', (
+        ('QgsMapRendererTask', (('__attribute_docs__', (('renderingComplete', 'Emitted when the map rendering is successfully completed.\n'), ('errorOccurred', 'Emitted when map rendering failed.\n'))), ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__signal_arguments__', (('errorOccurred', ('error: int',)),)), ('__group__', ('maprenderer',)))),
+    )),
+    ('src/core/qgsmapsettings.h', (
+        ('QgsLabelBlockingRegion', (('__attribute_docs__', (('geometry', 'Geometry of region to avoid placing labels within (in destination map coordinates and CRS)'),)), ('__annotations__', (('geometry', 'QgsGeometry'),)))),
+    )),
+    ('src/core/qgsmapsettingsutils.h', (
+        ('QgsMapSettingsUtils', ('containsAdvancedEffects', 'worldFileParameters', 'worldFileContent', 'isValidExtent')),
+    )),
+    ('src/core/qgsmapthemecollection.h', (
+        ('QgsMapThemeCollection', (('__attribute_docs__', (('mapThemesChanged', 'Emitted when map themes within the collection are changed.\n'), ('mapThemeChanged', 'Emitted when a map theme changes definition.\n'), ('mapThemeRenamed', 'Emitted when a map theme within the collection is renamed.\n\n.. versionadded:: 3.14\n'), ('projectChanged', 'Emitted when the project changes\n\n.. seealso:: :py:func:`project`\n\n.. seealso:: :py:func:`setProject`\n'))), 'createThemeFromCurrentState', ('__signal_arguments__', (('mapThemeChanged', ('theme: str',)), ('mapThemeRenamed', ('name: str', 'newName: str')))))),
+        ('QgsMapThemeCollection.MapThemeRecord', ('readXml',)),
+    )),
+    ('src/core/qgsmaptopixel.h', (
+        ('QgsMapToPixel', ('fromScale',)),
+    )),
+    ('src/core/qgsmaptopixelgeometrysimplifier.h', (
+        ('QgsMapToPixelSimplifier', ('calculateLengthSquared2D', 'equalSnapToGrid', ('__overridden_methods__', ('simplify',)))),
+    )),
+    ('src/core/project/qgsmapviewsmanager.h', (
+        ('QgsMapViewsManager', (('__attribute_docs__', (('views3DListChanged', 'Emitted when the views list has changed (whenever a view was removed,\nadded, renamed..)\n'),)), ('__group__', ('project',)))),
+    )),
+    ('src/core/qgsmargins.h', (
+        ('QgsMargins', ('fromString',)),
+    )),
+    ('src/core/symbology/qgsmarkersymbol.h', (
+        ('QgsMarkerSymbol', ('createSimple', ('__overridden_methods__', ('clone',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgsmarkersymbollayer.h', (
+        ('QgsSimpleMarkerSymbolLayerBase', ('availableShapes', 'shapeIsFilled', 'decodeShape', 'encodeShape', ('__abstract_methods__', ('draw',)), ('__overridden_methods__', ('startRender', 'stopRender', 'renderPoint', 'bounds')), ('__group__', ('symbology',)))),
+        ('QgsSimpleMarkerSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'renderPoint', 'properties', 'clone', 'toSld', 'writeSldMarker', 'ogrFeatureStyle', 'writeDxf', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'usesMapUnits', 'bounds', 'fillColor', 'setFillColor', 'setColor', 'color', 'strokeColor', 'setStrokeColor', 'draw')), ('__group__', ('symbology',)))),
+        ('QgsFilledMarkerSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'startRender', 'stopRender', 'startFeatureRender', 'stopFeatureRender', 'properties', 'clone', 'subSymbol', 'setSubSymbol', 'estimateMaxBleed', 'usedAttributes', 'hasDataDefinedProperties', 'setColor', 'color', 'usesMapUnits', 'setOutputUnit', 'draw')), ('__group__', ('symbology',)))),
+        ('QgsSvgMarkerSymbolLayer', ('create', 'createFromSld', 'resolvePaths', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPoint', 'properties', 'usesMapUnits', 'clone', 'toSld', 'writeSldMarker', 'fillColor', 'setFillColor', 'strokeColor', 'setStrokeColor', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'writeDxf', 'bounds', 'prepareExpressions', 'usedAttributes')), ('__group__', ('symbology',)))),
+        ('QgsRasterMarkerSymbolLayer', ('create', 'createFromSld', 'resolvePaths', ('__overridden_methods__', ('layerType', 'flags', 'renderPoint', 'properties', 'clone', 'usesMapUnits', 'color', 'writeSldMarker', 'setMapUnitScale', 'mapUnitScale', 'bounds')), ('__group__', ('symbology',)))),
+        ('QgsFontMarkerSymbolLayer', ('create', 'createFromSld', 'resolveFonts', ('__overridden_methods__', ('layerType', 'flags', 'startRender', 'stopRender', 'renderPoint', 'properties', 'clone', 'toSld', 'writeSldMarker', 'usesMapUnits', 'setOutputUnit', 'strokeColor', 'setStrokeColor', 'bounds')), ('__group__', ('symbology',)))),
+        ('QgsAnimatedMarkerSymbolLayer', ('create', ('__overridden_methods__', ('layerType', 'properties', 'clone', 'startRender')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/painting/qgsmaskpaintdevice.h', (
+        ('QgsMaskPaintDevice', (('__overridden_methods__', ('paintEngine', 'metric')), ('__group__', ('painting',)))),
+    )),
+    ('src/core/symbology/qgsmasksymbollayer.h', (
+        ('QgsMaskMarkerSymbolLayer', ('create', ('__overridden_methods__', ('clone', 'subSymbol', 'setSubSymbol', 'usedAttributes', 'hasDataDefinedProperties', 'properties', 'layerType', 'startRender', 'stopRender', 'renderPoint', 'bounds', 'usesMapUnits', 'setOutputUnit', 'color', 'drawPreviewIcon', 'masks')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/layout/qgsmasterlayoutinterface.h', (
+        ('QgsMasterLayoutInterface', (('__virtual_methods__', ('layoutAccept',)), ('__abstract_methods__', ('clone', 'layoutType', 'name', 'icon', 'setName', 'layoutProject', 'writeLayoutXml', 'readLayoutXml', 'updateSettings')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/providers/memory/qgsmemoryproviderutils.h', (
+        ('QgsMemoryProviderUtils', ('createMemoryLayer', ('__group__', ('providers', 'memory')))),
+    )),
+    ('src/core/symbology/qgsmergedfeaturerenderer.h', (
+        ('QgsMergedFeatureRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('clone', 'startRender', 'flags', 'renderFeature', 'stopRender', 'dump', 'usedAttributes', 'filterNeedsGeometry', 'capabilities', 'symbols', 'symbolForFeature', 'originalSymbolForFeature', 'symbolsForFeature', 'originalSymbolsForFeature', 'legendKeysForFeature', 'legendKeyToExpression', 'legendSymbolItems', 'willRenderFeature', 'save', 'setEmbeddedRenderer', 'embeddedRenderer', 'setLegendSymbolItem', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'checkLegendSymbolItem', 'accept')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/mesh/qgsmesh3daveraging.h', (
+        ('QgsMesh3DAveragingMethod', ('createFromXml', ('__abstract_methods__', ('writeXml', 'readXml', 'equals', 'clone')), ('__group__', ('mesh',)))),
+        ('QgsMeshMultiLevelsAveragingMethod', (('__overridden_methods__', ('writeXml', 'readXml', 'equals', 'clone')), ('__group__', ('mesh',)))),
+        ('QgsMeshSigmaAveragingMethod', (('__overridden_methods__', ('writeXml', 'readXml', 'equals', 'clone')), ('__group__', ('mesh',)))),
+        ('QgsMeshRelativeHeightAveragingMethod', (('__overridden_methods__', ('writeXml', 'readXml', 'equals', 'clone')), ('__group__', ('mesh',)))),
+        ('QgsMeshElevationAveragingMethod', (('__overridden_methods__', ('writeXml', 'readXml', 'equals', 'clone')), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshadvancedediting.h', (
+        ('QgsMeshAdvancedEditing', (('__virtual_methods__', ('isFinished', 'text')), ('__group__', ('mesh',)))),
+        ('QgsMeshEditRefineFaces', (('__overridden_methods__', ('text',)), ('__group__', ('mesh',)))),
+        ('QgsMeshTransformVerticesByExpression', (('__overridden_methods__', ('text',)), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshcalculator.h', (
+        ('QgsMeshCalculator', ('expression_valid', 'expressionIsValid', ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshdataprovider.h', (
+        ('QgsMeshDataProvider', (('__attribute_docs__', (('datasetGroupsAdded', 'Emitted when some new dataset groups have been added\n'),)), ('__virtual_methods__', ('driverMetadata',)), ('__abstract_methods__', ('close', 'removeDatasetGroup')), ('__overridden_methods__', ('temporalCapabilities',)), ('__signal_arguments__', (('datasetGroupsAdded', ('count: int',)),)), ('__group__', ('mesh',)))),
+        ('QgsMesh', ('compareFaces', ('__group__', ('mesh',)))),
+        ('QgsMeshDataSourceInterface', (('__virtual_methods__', ('maximumVerticesCountPerFace',)), ('__abstract_methods__', ('vertexCount', 'faceCount', 'edgeCount', 'populateMesh', 'saveMeshFrame')), ('__group__', ('mesh',)))),
+        ('QgsMeshDatasetSourceInterface', (('__virtual_methods__', ('persistDatasetGroup',)), ('__abstract_methods__', ('addDataset', 'extraDatasets', 'datasetGroupCount', 'datasetCount', 'datasetGroupMetadata', 'datasetMetadata', 'datasetValue', 'datasetValues', 'dataset3dValues', 'isFaceActive', 'areFacesActive', 'persistDatasetGroup')), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshdataprovidertemporalcapabilities.h', (
+        ('QgsMeshDataProviderTemporalCapabilities', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshdataset.h', (
+        ('QgsMeshDatasetGroup', (('__virtual_methods__', ('datasetGroupNamesDependentOn', 'description')), ('__abstract_methods__', ('initialize', 'datasetMetadata', 'datasetCount', 'dataset', 'type', 'writeXml')), ('__group__', ('mesh',)))),
+        ('QgsMeshDataset', (('__abstract_methods__', ('datasetValue', 'datasetValues', 'areFacesActive', 'isActive', 'metadata', 'valuesCount')), ('__group__', ('mesh',)))),
+        ('QgsMeshDatasetIndex', (('__group__', ('mesh',)),)),
+        ('QgsMeshDatasetValue', (('__group__', ('mesh',)),)),
+        ('QgsMeshDataBlock', (('__group__', ('mesh',)),)),
+        ('QgsMesh3DDataBlock', (('__group__', ('mesh',)),)),
+        ('QgsMeshDatasetGroupMetadata', (('__group__', ('mesh',)),)),
+        ('QgsMeshDatasetMetadata', (('__group__', ('mesh',)),)),
+        ('QgsMeshDatasetGroupTreeItem', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmesheditor.h', (
+        ('QgsMeshEditor', (('__attribute_docs__', (('meshEdited', 'Emitted when the mesh is edited\n'),)), ('__group__', ('mesh',)))),
+        ('QgsMeshEditingError', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshforcebypolylines.h', (
+        ('QgsMeshEditForceByPolylines', (('__overridden_methods__', ('text', 'isFinished')), ('__group__', ('mesh',)))),
+        ('QgsMeshEditForceByLine', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshlayer.h', (
+        ('QgsMeshLayer', (('__attribute_docs__', (('activeScalarDatasetGroupChanged', 'Emitted when active scalar group dataset is changed\n\n.. versionadded:: 3.14\n'), ('activeVectorDatasetGroupChanged', 'Emitted when active vector group dataset is changed\n\n.. versionadded:: 3.14\n'), ('timeSettingsChanged', 'Emitted when time format is changed\n\n.. versionadded:: 3.8\n'), ('reloaded', 'Emitted when the mesh layer is reloaded, see\n:py:func:`~QgsMeshLayer.reload`\n\n.. versionadded:: 3.28\n'))), ('__virtual_methods__', ('loadDefaultStyle',)), ('__overridden_methods__', ('dataProvider', 'clone', 'extent', 'createMapRenderer', 'profileSource', 'createProfileGenerator', 'readSymbology', 'writeSymbology', 'writeStyle', 'readStyle', 'encodedSource', 'decodedSource', 'readXml', 'writeXml', 'temporalProperties', 'elevationProperties', 'reload', 'subLayers', 'htmlMetadata', 'isEditable', 'supportsEditing', 'isModified', 'setTransformContext')), ('__signal_arguments__', (('activeScalarDatasetGroupChanged', ('index: int',)), ('activeVectorDatasetGroupChanged', ('index: int',)))), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshlayerelevationproperties.h', (
+        ('QgsMeshLayerElevationProperties', (('__overridden_methods__', ('hasElevation', 'writeXml', 'readXml', 'htmlSummary', 'clone', 'isVisibleInZRange', 'calculateZRange', 'significantZValues', 'showByDefaultInElevationProfilePlots', 'flags')), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshlayerlabeling.h', (
+        ('QgsAbstractMeshLayerLabeling', ('create', 'defaultSettingsForLayer', ('__virtual_methods__', ('subProviders', 'multiplyOpacity', 'toSld', 'accept')), ('__abstract_methods__', ('type', 'clone', 'save', 'settings', 'setSettings', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode')), ('__group__', ('mesh',)))),
+        ('QgsMeshLayerSimpleLabeling', ('create', ('__overridden_methods__', ('type', 'clone', 'save', 'settings', 'accept', 'setSettings', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode', 'multiplyOpacity')), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshlayertemporalproperties.h', (
+        ('QgsMeshLayerTemporalProperties', (('__overridden_methods__', ('writeXml', 'readXml', 'setDefaultsFromDataProviderTemporalCapabilities')), ('__group__', ('mesh',)))),
+    )),
+    ('src/core/mesh/qgsmeshrenderersettings.h', (
+        ('QgsMeshRendererMeshSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererScalarSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererVectorArrowSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererVectorStreamlineSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererVectorTracesSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererVectorWindBarbSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererVectorSettings', (('__group__', ('mesh',)),)),
+        ('QgsMeshRendererSettings', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshspatialindex.h', (
+        ('QgsMeshSpatialIndex', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshtimesettings.h', (
+        ('QgsMeshTimeSettings', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshtracerenderer.h', (
+        ('QgsMeshVectorTraceAnimationGenerator', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/mesh/qgsmeshutils.h', (
+        ('QgsMeshUtils', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/qgsmessagelog.h', (
+        ('QgsMessageLog', (('__attribute_docs__', (('messageReceived', 'Emitted whenever the log receives a message which is not a\n:py:class:`Qgis`.MessageLevel.Info level message and which has the\n``notifyUser`` flag as ``True``.\n\nIf :py:class:`QgsMessageLogNotifyBlocker` objects have been created then\nthis signal may be temporarily suppressed.\n\n.. seealso:: :py:class:`QgsMessageLogNotifyBlocker`\n'),)), 'logMessage', ('__signal_arguments__', (('messageReceived', ('received: bool',)),)))),
+        ('QgsMessageLogConsole', (('__virtual_methods__', ('logMessage',)),)),
+    )),
+    ('src/core/qgsmessageoutput.h', (
+        ('QgsMessageOutputConsole', (('__attribute_docs__', (('destroyed', "signals that object will be destroyed and shouldn't be used anymore\n"),)), ('__overridden_methods__', ('setMessage', 'appendMessage', 'setTitle', 'showMessage')))),
+        ('QgsMessageOutput', ('createMessageOutput', ('__abstract_methods__', ('setMessage', 'appendMessage', 'setTitle', 'showMessage')))),
+    )),
+    ('src/core/metadata/qgsmetadatautils.h', (
+        ('QgsMetadataUtils', ('convertFromEsri', ('__group__', ('metadata',)))),
+    )),
+    ('src/core/qgsmimedatautils.h', (
+        ('QgsMimeDataUtils', ('encodeUriList', 'isUriList', 'decodeUriList', 'layerTreeNodesToUriList', 'hasOriginatedFromCurrentAppInstance')),
+    )),
+    ('src/core/raster/qgsmultibandcolorrenderer.h', (
+        ('QgsMultiBandColorRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'block', 'writeXml', 'usesBands', 'createLegendNodes', 'toSld')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/geometry/qgsmulticurve.h', (
+        ('QgsMultiCurve', (('__overridden_methods__', ('geometryType', 'clone', 'clear', 'toCurveType', 'fromWkt', 'asGml2', 'asGml3', 'addGeometry', 'addGeometries', 'insertGeometry', 'simplifyByDistance', 'boundary', 'createEmptyWithSameType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsmultilinestring.h', (
+        ('QgsMultiLineString', (('__overridden_methods__', ('geometryType', 'clone', 'clear', 'fromWkt', 'asGml2', 'asGml3', 'addGeometry', 'addGeometries', 'insertGeometry', 'simplifyByDistance', 'toCurveType', 'createEmptyWithSameType', 'wktOmitChildType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsmultipoint.h', (
+        ('QgsMultiPoint', (('__overridden_methods__', ('geometryType', 'clone', 'toCurveType', 'fromWkt', 'clear', 'asGml2', 'asGml3', 'nCoordinates', 'addGeometry', 'addGeometries', 'insertGeometry', 'boundary', 'vertexNumberFromVertexId', 'segmentLength', 'isValid', 'simplifyByDistance', 'createEmptyWithSameType', 'wktOmitChildType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsmultipolygon.h', (
+        ('QgsMultiPolygon', (('__overridden_methods__', ('geometryType', 'clear', 'clone', 'fromWkt', 'asGml2', 'asGml3', 'addGeometry', 'addGeometries', 'insertGeometry', 'simplifyByDistance', 'toCurveType', 'boundary', 'createEmptyWithSameType', 'wktOmitChildType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsmultirenderchecker.h', (
+        ('QgsMultiRenderChecker', ('drawBackground',)),
+    )),
+    ('src/core/geometry/qgsmultisurface.h', (
+        ('QgsMultiSurface', (('__overridden_methods__', ('geometryType', 'clear', 'clone', 'toCurveType', 'fromWkt', 'asGml2', 'asGml3', 'addGeometry', 'addGeometries', 'insertGeometry', 'boundary', 'simplifyByDistance', 'createEmptyWithSameType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/network/qgsnetworkaccessmanager.h', (
+        ('QgsNetworkAccessManager', (('__attribute_docs__', (('requestAboutToBeCreated', "Emitted when a network request is about to be created.\n\nThis signal is propagated to the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about requests created in any thread.\n\n.. seealso:: :py:func:`requestCreated`\n\n.. seealso:: :py:func:`finished`\n\n.. seealso:: :py:func:`requestTimedOut`\n\n.. versionadded:: 3.6\n"), ('requestCreated', '.. deprecated:: 3.40\n\n   Use the thread-safe requestAboutToBeCreated( :py:class:`QgsNetworkRequestParameters` ) signal instead.\n'), ('finished', "Emitted whenever a pending network reply is finished.\n\nThe ``reply`` parameter will contain a\n:py:class:`QgsNetworkReplyContent` object, containing all the useful\ninformation relating to the reply, including headers and reply content.\n\nThis signal is propagated to the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about requests created in any thread.\n\n.. seealso:: :py:func:`requestAboutToBeCreated`\n\n.. seealso:: :py:func:`requestTimedOut`\n\n.. versionadded:: 3.6\n"), ('requestTimedOut', 'Emitted when a request times out.\n'), ('downloadProgress', "Emitted when a network reply receives a progress report.\n\nThe ``requestId`` argument reflects the unique ID identifying the\noriginal request which the progress report relates to.\n\nThe ``bytesReceived`` parameter indicates the number of bytes received,\nwhile ``bytesTotal`` indicates the total number of bytes expected to be\ndownloaded. If the number of bytes to be downloaded is not known,\n``bytesTotal`` will be -1.\n\nThis signal is propagated to the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about requests created in any thread.\n\n.. versionadded:: 3.6\n"), ('requestRequiresAuth', "Emitted when a network request prompts an authentication request.\n\nThe ``requestId`` argument reflects the unique ID identifying the\noriginal request which the authentication relates to.\n\nThis signal is propagated to the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about authentication requests from any\nthread.\n\nThis signal is for debugging and logging purposes only, and cannot be\nused to respond to the requests. See\n:py:class:`QgsNetworkAuthenticationHandler` for details on how to handle\nauthentication requests.\n\n.. seealso:: :py:func:`requestAuthDetailsAdded`\n\n.. versionadded:: 3.6\n"), ('requestAuthDetailsAdded', "Emitted when network authentication details have been added to a\nrequest.\n\nThe ``requestId`` argument reflects the unique ID identifying the\noriginal request which the authentication relates to.\n\nThis signal is always sent from the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about authentication requests from any\nthread.\n\nThis signal is for debugging and logging purposes only, and should not\nbe used to respond to the requests. See\n:py:class:`QgsNetworkAuthenticationHandler` for details on how to handle\nauthentication requests.\n\n.. seealso:: :py:func:`requestRequiresAuth`\n\n.. versionadded:: 3.6\n"), ('requestEncounteredSslErrors', "Emitted when a network request encounters SSL ``errors``.\n\nThe ``requestId`` argument reflects the unique ID identifying the\noriginal request which the SSL error relates to.\n\nThis signal is propagated to the main thread QgsNetworkAccessManager\ninstance, so it is necessary only to connect to the main thread's signal\nin order to receive notifications about SSL errors from any thread.\n\nThis signal is for debugging and logging purposes only, and cannot be\nused to respond to the errors. See :py:class:`QgsSslErrorHandler` for\ndetails on how to handle SSL errors and potentially ignore them.\n\n.. versionadded:: 3.6\n"), ('authBrowserAborted', 'Emitted when external browser logins are to be aborted.\n\n.. versionadded:: 3.20\n'), ('cookiesChanged', 'Emitted when the cookies changed.\n\n.. versionadded:: 3.22\n'))), 'instance', 'cacheLoadControlName', 'cacheLoadControlFromName', 'timeout', 'setTimeout', 'blockingGet', 'blockingPost', 'setRequestPreprocessor', 'removeRequestPreprocessor', 'setAdvancedRequestPreprocessor', 'removeAdvancedRequestPreprocessor', 'setReplyPreprocessor', 'removeReplyPreprocessor', ('__overridden_methods__', ('createRequest',)), ('__signal_arguments__', (('requestAboutToBeCreated', ('request: QgsNetworkRequestParameters',)), ('requestCreated', ('request: QgsNetworkRequestParameters',)), ('finished', ('reply: QgsNetworkReplyContent',)), ('requestTimedOut', ('reply: QNetworkReply',)), ('downloadProgress', ('requestId: int', 'bytesReceived: int', 'bytesTotal: int')), ('requestRequiresAuth', ('requestId: int', 'realm: str')), ('requestAuthDetailsAdded', ('requestId: int', 'realm: str', 'user: str', 'password: str')), ('requestEncounteredSslErrors', ('requestId: int', 'errors: List[QSslError]')), ('cookiesChanged', ('cookies: List[QNetworkCookie]',)))), ('__group__', ('network',)))),
+        ('QgsNetworkRequestParameters', (('__group__', ('network',)),)),
+    )),
+    ('src/core/network/qgsnetworkcontentfetcher.h', (
+        ('QgsNetworkContentFetcher', (('__attribute_docs__', (('finished', 'Emitted when content has loaded\n'), ('downloadProgress', 'Emitted when data is received.\n\n.. versionadded:: 3.2\n'), ('errorOccurred', 'Emitted when an error with ``code`` error occurred while processing the\nrequest ``errorMsg`` is a textual description of the error\n\n.. versionadded:: 3.22\n'))), ('__signal_arguments__', (('downloadProgress', ('bytesReceived: int', 'bytesTotal: int')), ('errorOccurred', ('code: QNetworkReply.NetworkError', 'errorMsg: str')))), ('__group__', ('network',)))),
+    )),
+    ('src/core/network/qgsnetworkcontentfetcherregistry.h', (
+        ('QgsFetchedContent', (('__attribute_docs__', (('fetched', 'Emitted when the file is fetched and accessible\n'), ('errorOccurred', 'Emitted when an error with ``code`` error occurred while processing the\nrequest ``errorMsg`` is a textual description of the error\n\n.. versionadded:: 3.22\n'))), ('__signal_arguments__', (('errorOccurred', ('code: QNetworkReply.NetworkError', 'errorMsg: str')),)), ('__group__', ('network',)))),
+        ('QgsNetworkContentFetcherRegistry', (('__group__', ('network',)),)),
+    )),
+    ('src/core/network/qgsnetworkcontentfetchertask.h', (
+        ('QgsNetworkContentFetcherTask', (('__attribute_docs__', (('fetched', 'Emitted when the network content has been fetched, regardless of whether\nthe fetch was successful or not.\n\nUsers of QgsNetworkContentFetcherTask should connect to this signal, and\nfrom the associated slot they can then safely access the network\n:py:func:`~QgsNetworkContentFetcherTask.reply` without danger of the\ntask being first removed by the :py:class:`QgsTaskManager`.\n'), ('errorOccurred', 'Emitted when an error with ``code`` error occurred while processing the\nrequest ``errorMsg`` is a textual description of the error\n\n.. versionadded:: 3.22\n'))), ('__overridden_methods__', ('run', 'cancel')), ('__signal_arguments__', (('errorOccurred', ('code: QNetworkReply.NetworkError', 'errorMsg: str')),)), ('__group__', ('network',)))),
+    )),
+    ('src/core/network/qgsnetworkreply.h', (
+        ('QgsNetworkReplyContent', ('extractFilenameFromContentDispositionHeader', 'extractFileNameFromContentDispositionHeader', ('__group__', ('network',)))),
+    )),
+    ('src/core/network/qgsnewsfeedmodel.h', (
+        ('QgsNewsFeedModel', (('__overridden_methods__', ('data', 'flags', 'index', 'parent', 'rowCount', 'columnCount')), ('__group__', ('network',)))),
+        ('QgsNewsFeedProxyModel', (('__overridden_methods__', ('lessThan',)), ('__group__', ('network',)))),
+    )),
+    ('src/core/network/qgsnewsfeedparser.h', (
+        ('QgsNewsFeedParser', (('__attribute_docs__', (('fetched', 'Emitted when ``entries`` have been fetched from the feed.\n\n.. seealso:: :py:func:`fetch`\n'), ('entryAdded', 'Emitted whenever a new ``entry`` is available from the feed (as a result\nof a call to :py:func:`~QgsNewsFeedParser.fetch`).\n\n.. seealso:: :py:func:`fetch`\n'), ('entryUpdated', 'Emitted whenever an existing ``entry`` is available from the feed (as a\nresult of a call to :py:func:`~QgsNewsFeedParser.fetch`).\n\n.. seealso:: :py:func:`fetch`\n\n.. versionadded:: 3.36\n'), ('entryDismissed', 'Emitted whenever an ``entry`` is dismissed (as a result of a call to\n:py:func:`~QgsNewsFeedParser.dismissEntry`).\n\n.. seealso:: :py:func:`dismissEntry`\n'), ('imageFetched', 'Emitted when the image attached to the entry with the specified ``key``\nhas been fetched and is now available.\n'))), 'keyForFeed', ('__signal_arguments__', (('fetched', ('entries: List[QgsNewsFeedParser.Entry]',)), ('entryAdded', ('entry: QgsNewsFeedParser.Entry',)), ('entryUpdated', ('entry: QgsNewsFeedParser.Entry',)), ('entryDismissed', ('entry: QgsNewsFeedParser.Entry',)), ('imageFetched', ('key: int', 'pixmap: QPixmap')))), ('__group__', ('network',)))),
+    )),
+    ('src/core/gps/qgsnmeaconnection.h', (
+        ('QgsNmeaConnection', (('__overridden_methods__', ('parseData',)), ('__group__', ('gps',)))),
+    )),
+    ('src/core/geocoding/qgsnominatimgeocoder.h', (
+        ('QgsNominatimGeocoder', (('__overridden_methods__', ('flags', 'appendedFields', 'wkbType', 'geocodeString')), ('__group__', ('geocoding',)))),
+    )),
+    ('src/core/painting/qgsnullpainterdevice.h', (
+        ('QgsNullPaintDevice', (('__overridden_methods__', ('paintEngine', 'metric')), ('__group__', ('painting',)))),
+    )),
+    ('src/core/symbology/qgsnullsymbolrenderer.h', (
+        ('QgsNullSymbolRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('symbolForFeature', 'originalSymbolForFeature', 'renderFeature', 'stopRender', 'willRenderFeature', 'usedAttributes', 'dump', 'clone', 'symbols', 'save')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/numericformats/qgsnumericformat.h', (
+        ('QgsNumericFormat', (('__virtual_methods__', ('sortKey', 'suggestSampleValue')), ('__abstract_methods__', ('id', 'visibleName', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+        ('QgsNumericFormatContext', (('__group__', ('numericformats',)),)),
+    )),
+    ('src/core/numericformats/qgsnumericformatregistry.h', (
+        ('QgsNumericFormatRegistry', (('__group__', ('numericformats',)),)),
+    )),
+    ('src/core/scalebar/qgsnumericscalebarrenderer.h', (
+        ('QgsNumericScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'flags', 'clone', 'draw', 'calculateBoxSize')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/qgsofflineediting.h', (
+        ('QgsOfflineEditing', (('__attribute_docs__', (('progressStarted', 'Emitted when the process has started.\n'), ('layerProgressUpdated', 'Emitted whenever a new layer is being processed. It is possible to\nestimate the progress of the complete operation by comparing the index\nof the current ``layer`` to the total amount ``numLayers``.\n'), ('progressModeSet', 'Emitted when the mode for the progress of the current operation is set.\n\n:param mode: progress mode\n:param maximum: total number of entities to process in the current\n                operation\n'), ('progressUpdated', 'Emitted with the progress of the current mode\n\n:param progress: current index of processed entities\n'), ('progressStopped', 'Emitted when the processing of all layers has finished\n'), ('warning', 'Emitted when a warning needs to be displayed.\n\n:param title: title string for message\n:param message: A descriptive message for the warning\n'))), ('__signal_arguments__', (('layerProgressUpdated', ('layer: int', 'numLayers: int')), ('progressModeSet', ('mode: QgsOfflineEditing.ProgressMode', 'maximum: int')), ('progressUpdated', ('progress: int',)), ('warning', ('title: str', 'message: str')))))),
+    )),
+    ('src/core/qgsogcutils.h', (
+        ('QgsOgcUtils', ('geometryFromGML', 'rectangleFromGMLBox', 'rectangleFromGMLEnvelope', 'geometryToGML', 'rectangleToGMLBox', 'rectangleToGMLEnvelope', 'colorFromOgcFill', 'expressionFromOgcFilter', 'expressionToOgcExpression', 'elseFilterExpression')),
+    )),
+    ('src/core/geometry/qgsorientedbox3d.h', (
+        ('QgsOrientedBox3D', ('fromBox3D', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsowsconnection.h', (
+        ('QgsOwsConnection', ('addWmsWcsConnectionSettings', 'addWfsConnectionSettings', 'connectionList', 'deleteConnection', 'selectedConnection', 'setSelectedConnection')),
+    )),
+    ('src/core/layout/qgspagesizeregistry.h', (
+        ('QgsPageSizeRegistry', (('__group__', ('layout',)),)),
+    )),
+    ('src/core/effects/qgspainteffect.h', (
+        ('QgsDrawSourceEffect', ('create', ('__overridden_methods__', ('flags', 'type', 'clone', 'properties', 'readProperties', 'draw')), ('__group__', ('effects',)))),
+        ('QgsPaintEffect', (('__virtual_methods__', ('flags', 'saveProperties', 'render', 'begin', 'end', 'boundingRect')), ('__abstract_methods__', ('type', 'clone', 'properties', 'readProperties', 'draw')), ('__group__', ('effects',)))),
+        ('QgsEffectPainter', (('__group__', ('effects',)),)),
+    )),
+    ('src/core/effects/qgspainteffectregistry.h', (
+        ('QgsPaintEffectRegistry', ('defaultStack', 'isDefaultStack', ('__group__', ('effects',)))),
+        ('QgsPaintEffectAbstractMetadata', (('__virtual_methods__', ('createWidget',)), ('__abstract_methods__', ('createPaintEffect',)), ('__group__', ('effects',)))),
+    )),
+    ('src/core/painting/qgspaintenginehack.h', (
+        ('QgsPaintEngineHack', ('fixEngineFlags', ('__group__', ('painting',)))),
+    )),
+    ('src/core/painting/qgspainting.h', (
+        ('QgsPainting', ('getCompositionMode', 'getBlendModeEnum', 'isClippingMode', 'triangleToTriangleTransform', 'drawTriangleUsingTexture', 'qtDefaultDpiX', 'qtDefaultDpiY', 'applyScaleFixForQPictureDpi', 'drawPicture', ('__group__', ('painting',)))),
+    )),
+    ('src/core/raster/qgspalettedrasterrenderer.h', (
+        ('QgsPalettedRasterRenderer', ('create', 'colorTableToClassData', 'rasterAttributeTableToClassData', 'classDataFromString', 'classDataFromFile', 'classDataToString', 'classDataFromRaster', ('__overridden_methods__', ('clone', 'flags', 'block', 'canCreateRasterAttributeTable', 'inputBand', 'setInputBand', 'writeXml', 'legendSymbologyItems', 'createLegendNodes', 'usesBands', 'toSld', 'accept')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/labeling/qgspallabeling.h', (
+        ('QgsPalLabeling', ('staticWillUseLayer', 'prepareGeometry', 'geometryRequiresPreparation', 'splitToLines', 'splitToGraphemes', ('__group__', ('labeling',)))),
+    )),
+    ('src/core/qgspathresolver.h', (
+        ('QgsPathResolver', ('setPathPreprocessor', 'removePathPreprocessor', 'setPathWriter', 'removePathWriter')),
+    )),
+    ('src/core/pdf/qgspdfrenderer.h', (
+        ('QgsPdfRenderer', (('__group__', ('pdf',)),)),
+    )),
+    ('src/core/numericformats/qgspercentagenumericformat.h', (
+        ('QgsPercentageNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'suggestSampleValue', 'formatDouble', 'clone', 'create', 'configuration')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/diagram/qgspiediagram.h', (
+        ('QgsPieDiagram', (('__overridden_methods__', ('clone', 'renderDiagram', 'diagramSize', 'legendSize', 'diagramName')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/plot/qgsplot.h', (
+        ('QgsPlotDefaultSettings', ('axisLabelNumericFormat', 'axisGridMajorSymbol', 'axisGridMinorSymbol', 'chartBackgroundSymbol', 'chartBorderSymbol', ('__group__', ('plot',)))),
+        ('QgsPlot', (('__virtual_methods__', ('writeXml', 'readXml')), ('__group__', ('plot',)))),
+        ('Qgs2DPlot', (('__virtual_methods__', ('renderContent',)), ('__overridden_methods__', ('writeXml', 'readXml')), ('__group__', ('plot',)))),
+        ('QgsPlotAxis', (('__group__', ('plot',)),)),
+    )),
+    ('src/core/qgspluginlayer.h', (
+        ('QgsPluginLayer', (('__virtual_methods__', ('icon',)), ('__abstract_methods__', ('clone',)), ('__overridden_methods__', ('clone', 'setExtent', 'dataProvider')))),
+    )),
+    ('src/core/qgspluginlayerregistry.h', (
+        ('QgsPluginLayerType', (('__virtual_methods__', ('createLayer', 'showLayerProperties')),)),
+    )),
+    ('src/core/geometry/qgspoint.h', (
+        ('QgsPoint', (('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'operator==', 'operator!=', 'normalize', 'isEmpty', 'boundingBox3D', 'geometryType', 'dimension', 'clone', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'clear', 'fromWkb', 'fromWkt', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'draw', 'asQPainterPath', 'transform', 'coordinateSequence', 'nCoordinates', 'vertexNumberFromVertexId', 'boundary', 'isValid', 'insertVertex', 'moveVertex', 'deleteVertex', 'closestSegment', 'nextVertex', 'adjacentVertices', 'vertexAngle', 'vertexCount', 'ringCount', 'partCount', 'vertexAt', 'toCurveType', 'segmentLength', 'boundingBoxIntersects', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'convertTo', 'createEmptyWithSameType', 'compareToSameClass', 'childCount', 'childPoint')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudattribute.h', (
+        ('QgsPointCloudAttribute', ('isNumeric', ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudAttributeCollection', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointcloudattributebyramprenderer.h', (
+        ('QgsPointCloudAttributeByRampRenderer', ('create', ('__overridden_methods__', ('type', 'clone', 'renderBlock', 'save', 'usedAttributes', 'createLegendNodes')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudattributemodel.h', (
+        ('QgsPointCloudAttributeModel', ('attributeToolTip', 'iconForAttributeType', ('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data')), ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudAttributeProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudblock.h', (
+        ('QgsPointCloudBlock', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointcloudclassifiedrenderer.h', (
+        ('QgsPointCloudClassifiedRenderer', ('create', 'defaultCategories', ('__overridden_methods__', ('type', 'clone', 'renderBlock', 'willRenderPoint', 'save', 'usedAttributes', 'createLegendNodes', 'legendRuleKeys', 'legendItemChecked', 'checkLegendItem')), ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudCategory', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointclouddataprovider.h', (
+        ('QgsPointCloudDataProvider', (('__attribute_docs__', (('indexGenerationStateChanged', 'Emitted when point cloud generation state is changed\n'),)), 'lasClassificationCodes', 'translatedLasClassificationCodes', 'dataFormatIds', 'translatedDataFormatIds', ('__virtual_methods__', ('capabilities', 'index', 'polygonBounds', 'originalMetadata', 'createRenderer')), ('__abstract_methods__', ('attributes', 'loadIndex', 'generateIndex', 'indexingState', 'pointCount')), ('__overridden_methods__', ('supportsSubsetString', 'subsetStringDialect', 'subsetStringHelpUrl', 'subsetString', 'setSubsetString')), ('__signal_arguments__', (('indexGenerationStateChanged', ('state: QgsPointCloudDataProvider.PointCloudIndexGenerationState',)),)), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudextentrenderer.h', (
+        ('QgsPointCloudExtentRenderer', ('create', 'defaultFillSymbol', ('__overridden_methods__', ('type', 'clone', 'renderBlock', 'save', 'startRender', 'stopRender', 'createLegendNodes')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudindex.h', (
+        ('QgsPointCloudNodeId', ('fromString', ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudNode', (('__group__', ('pointcloud',)),)),
+        ('QgsPointCloudIndex', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointcloudlayer.h', (
+        ('QgsPointCloudLayer', (('__attribute_docs__', (('subsetStringChanged', "Emitted when the layer's subset string has changed.\n\n.. versionadded:: 3.26\n"), ('raiseError', 'Signals an error related to this point cloud layer.\n\n.. versionadded:: 3.26\n'), ('statisticsCalculationStateChanged', 'Emitted when statistics calculation state has changed\n\n.. versionadded:: 3.26\n'), ('chunkAttributeValuesChanged', 'Emitted when a node gets some attribute values of some points changed\n\n.. versionadded:: 3.42\n'))), ('__virtual_methods__', ('readStyle', 'writeStyle', 'loadDefaultStyle')), ('__overridden_methods__', ('clone', 'extent', 'createMapRenderer', 'profileSource', 'createProfileGenerator', 'dataProvider', 'supportsEditing', 'isEditable', 'isModified', 'readXml', 'writeXml', 'readSymbology', 'writeSymbology', 'setTransformContext', 'encodedSource', 'decodedSource', 'htmlMetadata', 'elevationProperties')), ('__signal_arguments__', (('raiseError', ('msg: str',)), ('statisticsCalculationStateChanged', ('state: QgsPointCloudLayer.PointCloudStatisticsCalculationState',)), ('chunkAttributeValuesChanged', ('n: QgsPointCloudNodeId',)))), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudlayerelevationproperties.h', (
+        ('QgsPointCloudLayerElevationProperties', (('__overridden_methods__', ('hasElevation', 'writeXml', 'readXml', 'clone', 'htmlSummary', 'isVisibleInZRange', 'calculateZRange', 'significantZValues', 'showByDefaultInElevationProfilePlots')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudlayerexporter.h', (
+        ('QgsPointCloudLayerExporterTask', (('__attribute_docs__', (('exportComplete', 'Emitted when exporting the layer is successfully completed.\n'),)), ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudLayerExporter', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointcloudrenderer.h', (
+        ('QgsPointCloudRenderer', ('load', 'pointXY', 'pointZ', ('__virtual_methods__', ('willRenderPoint', 'usedAttributes', 'startRender', 'stopRender', 'legendItemChecked', 'checkLegendItem', 'createLegendNodes', 'legendRuleKeys')), ('__abstract_methods__', ('type', 'clone', 'renderBlock', 'save')), ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudRenderContext', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/pointcloud/qgspointcloudrendererregistry.h', (
+        ('QgsPointCloudRendererRegistry', ('defaultRenderer', 'classificationAttributeCategories', ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudRendererAbstractMetadata', (('__abstract_methods__', ('createRenderer',)), ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudRendererMetadata', (('__overridden_methods__', ('createRenderer',)), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudrgbrenderer.h', (
+        ('QgsPointCloudRgbRenderer', ('create', ('__overridden_methods__', ('type', 'clone', 'renderBlock', 'save', 'usedAttributes')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/core/pointcloud/qgspointcloudstatistics.h', (
+        ('QgsPointCloudStatistics', ('fromStatisticsJson', ('__group__', ('pointcloud',)))),
+        ('QgsPointCloudAttributeStatistics', (('__group__', ('pointcloud',)),)),
+    )),
+    ('src/core/symbology/qgspointclusterrenderer.h', (
+        ('QgsPointClusterRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('flags', 'clone', 'startRender', 'stopRender', 'save', 'usedAttributes', 'accept', 'drawGroup')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgspointdisplacementrenderer.h', (
+        ('QgsPointDisplacementRenderer', ('create', 'convertFromRenderer', ('__overridden_methods__', ('flags', 'clone', 'startRender', 'stopRender', 'save', 'usedAttributes', 'accept', 'drawGroup')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgspointdistancerenderer.h', (
+        ('QgsPointDistanceRenderer', (('__abstract_methods__', ('drawGroup',)), ('__overridden_methods__', ('toSld', 'renderFeature', 'usedAttributes', 'filterNeedsGeometry', 'capabilities', 'symbols', 'symbolForFeature', 'originalSymbolForFeature', 'symbolsForFeature', 'originalSymbolsForFeature', 'legendKeysForFeature', 'legendKeyToExpression', 'willRenderFeature', 'startRender', 'stopRender', 'legendSymbolItems', 'setEmbeddedRenderer', 'embeddedRenderer', 'setLegendSymbolItem', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'checkLegendSymbolItem', 'filter', 'accept')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgspointlocator.h', (
+        ('QgsPointLocator', (('__attribute_docs__', (('initFinished', 'Emitted whenever index has been built and initialization is finished\n\n:param ok: ``False`` if the creation of index has been prematurely\n           stopped due to the limit of features, otherwise ``True``\n'),)), ('__abstract_methods__', ('acceptMatch',)), ('__signal_arguments__', (('initFinished', ('ok: bool',)),)))),
+    )),
+    ('src/core/geometry/qgspolygon.h', (
+        ('QgsPolygon', (('__overridden_methods__', ('geometryType', 'clone', 'clear', 'fromWkb', 'wkbSize', 'asWkb', 'asWkt', 'surfaceToPolygon', 'toCurveType', 'addInteriorRing', 'setExteriorRing', 'boundary', 'createEmptyWithSameType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgspolyhedralsurface.h', (
+        ('QgsPolyhedralSurface', (('__virtual_methods__', ('setPatches', 'addPatch')), ('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'operator==', 'operator!=', 'geometryType', 'dimension', 'clone', 'clear', 'fromWkb', 'fromWkt', 'isValid', 'wkbSize', 'asWkb', 'asWkt', 'asGml2', 'asGml3', 'asKml', 'normalize', 'area', 'perimeter', 'boundary', 'snappedToGrid', 'simplifyByDistance', 'removeDuplicateNodes', 'boundingBoxIntersects', 'asQPainterPath', 'draw', 'transform', 'insertVertex', 'moveVertex', 'deleteVertex', 'coordinateSequence', 'nCoordinates', 'vertexNumberFromVertexId', 'isEmpty', 'closestSegment', 'nextVertex', 'adjacentVertices', 'hasCurvedSegments', 'segmentize', 'vertexAngle', 'vertexCount', 'ringCount', 'partCount', 'vertexAt', 'segmentLength', 'addZValue', 'addMValue', 'dropZValue', 'dropMValue', 'swapXy', 'toCurveType', 'createEmptyWithSameType', 'childCount', 'childGeometry', 'compareToSameClass', 'calculateBoundingBox3D')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgspolymorphicrelation.h', (
+        ('QgsPolymorphicRelation', ('createFromXml',)),
+    )),
+    ('src/core/qgspostgresstringutils.h', (
+        ('QgsPostgresStringUtils', ('parseArray', 'buildArray')),
+    )),
+    ('src/core/layout/qgsprintlayout.h', (
+        ('QgsPrintLayout', (('__attribute_docs__', (('nameChanged', "Emitted when the layout's name is changed.\n\n.. seealso:: :py:func:`setName`\n"),)), ('__overridden_methods__', ('clone', 'layoutProject', 'layoutType', 'icon', 'name', 'setName', 'writeXml', 'readXml', 'writeLayoutXml', 'readLayoutXml', 'createExpressionContext', 'updateSettings', 'layoutAccept')), ('__signal_arguments__', (('nameChanged', ('name: str',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/processing/qgsprocessingalgorithm.h', (
+        ('QgsProcessingAlgorithm.VectorProperties', (('__attribute_docs__', (('fields', 'Fields'), ('wkbType', 'Geometry (WKB) type'), ('crs', 'Coordinate Reference System'), ('availability', 'Availability of the properties. By default properties are not available.'))), ('__annotations__', (('fields', 'QgsFields'), ('wkbType', 'Qgis.WkbType'), ('crs', 'QgsCoordinateReferenceSystem'), ('availability', 'Qgis.ProcessingPropertyAvailability'))), ('__group__', ('processing',)))),
+        ('QgsProcessingAlgorithm', ('invalidSourceError', 'invalidRasterError', 'invalidSinkError', 'invalidPointCloudError', 'writeFeatureError', ('__virtual_methods__', ('shortDescription', 'tags', 'shortHelpString', 'helpString', 'helpUrl', 'documentationFlags', 'icon', 'svgIconPath', 'group', 'groupId', 'flags', 'canExecute', 'checkParameterValues', 'preprocessParameters', 'autogenerateParameterValues', 'sinkProperties', 'createCustomParametersWidget', 'createExpressionContext', 'validateInputCrs', 'asPythonCommand', 'asQgisProcessCommand', 'asMap', 'supportInPlaceEdit', 'prepareAlgorithm', 'postProcessAlgorithm')), ('__abstract_methods__', ('name', 'displayName', 'createInstance', 'initAlgorithm', 'processAlgorithm')), ('__group__', ('processing',)))),
+        ('QgsProcessingFeatureBasedAlgorithm', (('__virtual_methods__', ('inputParameterName', 'inputParameterDescription', 'inputLayerTypes', 'outputLayerType', 'sourceFlags', 'sinkFlags', 'outputWkbType', 'outputFields', 'outputCrs', 'initParameters', 'request')), ('__abstract_methods__', ('processFeature', 'outputName')), ('__overridden_methods__', ('flags', 'supportInPlaceEdit', 'initAlgorithm', 'processAlgorithm', 'sinkProperties')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingalgrunnertask.h', (
+        ('QgsProcessingAlgRunnerTask', (('__attribute_docs__', (('executed', 'Emitted when the algorithm has finished execution. If the algorithm\ncompleted execution without errors then ``successful`` will be ``True``.\nThe ``results`` argument contains the results reported by the algorithm.\n'),)), ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__signal_arguments__', (('executed', ('successful: bool', 'results: Dict[str, object]')),)), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingbatch.h', (
+        ('QgsProcessingBatchFeedback', (('__overridden_methods__', ('reportError',)), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingcontext.h', (
+        ('QgsProcessingLayerPostProcessorInterface', (('__abstract_methods__', ('postProcessLayer',)), ('__group__', ('processing',)))),
+        ('QgsProcessingContext', (('__group__', ('processing',)),)),
+    )),
+    ('src/core/processing/qgsprocessingfeedback.h', (
+        ('QgsProcessingFeedback', (('__virtual_methods__', ('setProgressText', 'reportError', 'pushWarning', 'pushInfo', 'pushFormattedMessage', 'pushCommandInfo', 'pushDebugInfo', 'pushConsoleInfo', 'htmlLog', 'textLog')), ('__group__', ('processing',)))),
+        ('QgsProcessingMultiStepFeedback', (('__overridden_methods__', ('setProgressText', 'reportError', 'pushWarning', 'pushInfo', 'pushCommandInfo', 'pushDebugInfo', 'pushConsoleInfo', 'pushFormattedMessage', 'htmlLog', 'textLog')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelalgorithm.h', (
+        ('QgsProcessingModelAlgorithm', ('safeName', ('__overridden_methods__', ('initAlgorithm', 'flags', 'name', 'displayName', 'group', 'groupId', 'icon', 'svgIconPath', 'shortHelpString', 'shortDescription', 'helpUrl', 'canExecute', 'asPythonCommand', 'createExpressionContext', 'createInstance', 'processAlgorithm')), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelchildalgorithm.h', (
+        ('QgsProcessingModelChildAlgorithm', (('__overridden_methods__', ('clone', 'comment', 'setComment')), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelchildparametersource.h', (
+        ('QgsProcessingModelChildParameterSource', ('fromStaticValue', 'fromModelParameter', 'fromChildOutput', 'fromExpression', 'fromExpressionText', ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelcomment.h', (
+        ('QgsProcessingModelComment', (('__overridden_methods__', ('clone',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelcomponent.h', (
+        ('QgsProcessingModelComponent', (('__virtual_methods__', ('comment', 'setComment')), ('__abstract_methods__', ('clone',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelgroupbox.h', (
+        ('QgsProcessingModelGroupBox', (('__overridden_methods__', ('clone',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodeloutput.h', (
+        ('QgsProcessingModelOutput', (('__overridden_methods__', ('clone', 'comment', 'setComment')), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelparameter.h', (
+        ('QgsProcessingModelParameter', (('__overridden_methods__', ('clone', 'comment', 'setComment')), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/core/processing/models/qgsprocessingmodelresult.h', (
+        ('QgsProcessingModelChildAlgorithmResult', (('__group__', ('processing', 'models')),)),
+        ('QgsProcessingModelResult', (('__group__', ('processing', 'models')),)),
+    )),
+    ('src/core/processing/qgsprocessingoutputs.h', (
+        ('QgsProcessingOutputMapLayer', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputVectorLayer', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputRasterLayer', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputPointCloudLayer', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputMultipleLayers', ('typeName', ('__overridden_methods__', ('type', 'valueAsString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputHtml', ('typeName', ('__overridden_methods__', ('type', 'valueAsFormattedString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputVariant', ('typeName', ('__overridden_methods__', ('type', 'valueAsString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputNumber', ('typeName', ('__overridden_methods__', ('type', 'valueAsString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputString', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputBoolean', ('typeName', ('__overridden_methods__', ('type', 'valueAsString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputFolder', ('typeName', ('__overridden_methods__', ('type', 'valueAsFormattedString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputFile', ('typeName', ('__overridden_methods__', ('type', 'valueAsFormattedString')), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputConditionalBranch', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputVectorTileLayer', ('typeName', ('__overridden_methods__', ('type',)), ('__group__', ('processing',)))),
+        ('QgsProcessingOutputDefinition', (('__virtual_methods__', ('valueAsString', 'valueAsFormattedString')), ('__abstract_methods__', ('type',)), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparameteraggregate.h', (
+        ('QgsProcessingParameterAggregate', ('typeName', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparameteralignrasterlayers.h', (
+        ('QgsProcessingParameterAlignRasterLayers', ('typeName', 'parameterAsItems', 'variantMapAsItem', 'itemAsVariantMap', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'valueAsString', 'valueAsJsonObject')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparameterdxflayers.h', (
+        ('QgsProcessingParameterDxfLayers', ('typeName', 'parameterAsLayers', 'variantMapAsLayer', 'layerAsVariantMap', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'valueAsString', 'valueAsJsonObject')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparameterfieldmap.h', (
+        ('QgsProcessingParameterFieldMapping', ('typeName', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparametermeshdataset.h', (
+        ('QgsProcessingParameterMeshDatasetGroups', ('typeName', 'valueAsDatasetGroup', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'dependsOnOtherParameters', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMeshDatasetTime', ('typeName', 'valueAsTimeType', 'timeValueAsDatasetIndex', 'timeValueAsDefinedDateTime', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'dependsOnOtherParameters', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparameters.h', (
+        ('QgsProcessingParameters', ('isDynamic', 'parameterAsString', 'parameterAsExpression', 'parameterAsDouble', 'parameterAsInt', 'parameterAsInts', 'parameterAsDateTime', 'parameterAsDate', 'parameterAsTime', 'parameterAsEnum', 'parameterAsEnums', 'parameterAsEnumString', 'parameterAsEnumStrings', 'parameterAsBool', 'parameterAsBoolean', 'parameterAsSink', 'parameterAsSource', 'parameterAsCompatibleSourceLayerPath', 'parameterAsCompatibleSourceLayerPathAndLayerName', 'parameterAsLayer', 'parameterAsRasterLayer', 'parameterAsOutputLayer', 'parameterAsFileOutput', 'parameterAsVectorLayer', 'parameterAsMeshLayer', 'parameterAsCrs', 'parameterAsExtent', 'parameterAsExtentGeometry', 'parameterAsExtentCrs', 'parameterAsPoint', 'parameterAsPointCrs', 'parameterAsGeometry', 'parameterAsGeometryCrs', 'parameterAsFile', 'parameterAsMatrix', 'parameterAsLayerList', 'parameterAsFileList', 'parameterAsRange', 'parameterAsFields', 'parameterAsStrings', 'parameterAsLayout', 'parameterAsLayoutItem', 'parameterAsColor', 'parameterAsConnectionName', 'parameterAsSchema', 'parameterAsDatabaseTableName', 'parameterAsPointCloudLayer', 'parameterAsAnnotationLayer', 'parameterFromVariantMap', 'descriptionFromName', 'parameterFromScriptCode', ('__group__', ('processing',)))),
+        ('QgsProcessingParameterBoolean', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterCrs', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterExtent', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterPoint', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterGeometry', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterFile', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'asScriptCode', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMatrix', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMultipleLayers', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'asScriptCode', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterNumber', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toolTip', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDistance', ('typeName', ('__overridden_methods__', ('clone', 'type', 'dependsOnOtherParameters', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterArea', ('typeName', ('__overridden_methods__', ('clone', 'type', 'dependsOnOtherParameters', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterVolume', ('typeName', ('__overridden_methods__', ('clone', 'type', 'dependsOnOtherParameters', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDuration', ('typeName', ('__overridden_methods__', ('clone', 'type', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterScale', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'asPythonString')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterRange', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterRasterLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterEnum', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsPythonComment', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterString', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterAuthConfig', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterExpression', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'dependsOnOtherParameters', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterVectorLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMeshLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMapLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'asScriptCode', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterField', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'dependsOnOtherParameters', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterFeatureSource', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'asScriptCode', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterFeatureSink', ('typeName', 'fromScriptCode', ('__virtual_methods__', ('supportedOutputVectorLayerExtensions',)), ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'toOutputDefinition', 'defaultFileExtension', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap', 'generateTemporaryDestination')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterVectorDestination', ('typeName', 'fromScriptCode', ('__virtual_methods__', ('supportedOutputVectorLayerExtensions',)), ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'toOutputDefinition', 'defaultFileExtension', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterRasterDestination', ('typeName', 'fromScriptCode', ('__virtual_methods__', ('supportedOutputRasterLayerExtensions',)), ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toOutputDefinition', 'defaultFileExtension', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterFileDestination', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toOutputDefinition', 'defaultFileExtension', 'asPythonString', 'createFileFilter', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterFolderDestination', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'toOutputDefinition', 'defaultFileExtension')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterBand', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'dependsOnOtherParameters', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterLayout', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode', 'asPythonString')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterLayoutItem', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterColor', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'checkValueIsAcceptable', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterCoordinateOperation', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'dependsOnOtherParameters', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterMapTheme', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDateTime', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toolTip', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterProviderConnection', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDatabaseSchema', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDatabaseTable', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterPointCloudLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterAnnotationLayer', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterPointCloudDestination', ('typeName', 'fromScriptCode', ('__virtual_methods__', ('supportedOutputPointCloudLayerExtensions',)), ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toOutputDefinition', 'defaultFileExtension', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterPointCloudAttribute', ('typeName', 'fromScriptCode', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asScriptCode', 'asPythonString', 'dependsOnOtherParameters', 'toVariantMap', 'fromVariantMap')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterVectorTileDestination', ('typeName', 'fromScriptCode', ('__virtual_methods__', ('supportedOutputVectorTileLayerExtensions',)), ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'toOutputDefinition', 'defaultFileExtension', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDefinition', (('__virtual_methods__', ('isDestination', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsJsonObject', 'valueAsString', 'valueAsStringList', 'valueAsPythonComment', 'asScriptCode', 'asPythonString', 'toVariantMap', 'fromVariantMap', 'dependsOnOtherParameters', 'toolTip')), ('__abstract_methods__', ('clone', 'type')), ('__group__', ('processing',)))),
+        ('QgsProcessingDestinationParameter', (('__virtual_methods__', ('generateTemporaryDestination', 'isSupportedOutputValue')), ('__abstract_methods__', ('toOutputDefinition', 'defaultFileExtension')), ('__overridden_methods__', ('isDestination', 'toVariantMap', 'fromVariantMap', 'asPythonString', 'createFileFilter')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterLimitedDataTypes', (('__group__', ('processing',)),)),
+    )),
+    ('src/core/processing/qgsprocessingparametertininputlayers.h', (
+        ('QgsProcessingParameterTinInputLayers', ('typeName', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'valueAsString', 'valueAsJsonObject', 'asPythonString')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterTinInputLayers.InputLayer', (('__group__', ('processing',)),)),
+    )),
+    ('src/core/processing/qgsprocessingparametertype.h', (
+        ('QgsProcessingParameterType', (('__virtual_methods__', ('pythonImportString', 'className', 'flags', 'metadata', 'acceptedPythonTypes', 'acceptedStringValues', 'acceptedDataTypes')), ('__abstract_methods__', ('create', 'description', 'name', 'id', 'acceptedParameterTypes', 'acceptedOutputTypes')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingparametervectortilewriterlayers.h', (
+        ('QgsProcessingParameterVectorTileWriterLayers', ('typeName', 'parameterAsLayers', 'variantMapAsLayer', 'layerAsVariantMap', ('__overridden_methods__', ('clone', 'type', 'checkValueIsAcceptable', 'valueAsPythonString', 'asPythonString')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingprovider.h', (
+        ('QgsProcessingProvider', (('__attribute_docs__', (('algorithmsLoaded', 'Emitted when the provider has loaded (or refreshed) its list of\navailable algorithms.\n\n.. seealso:: :py:func:`refreshAlgorithms`\n'),)), ('__virtual_methods__', ('icon', 'svgIconPath', 'flags', 'helpId', 'longName', 'versionInfo', 'canBeActivated', 'warningMessage', 'isActive', 'supportedOutputRasterLayerExtensions', 'supportedOutputVectorLayerExtensions', 'supportedOutputPointCloudLayerExtensions', 'supportedOutputVectorTileLayerExtensions', 'supportedOutputTableExtensions', 'isSupportedOutputValue', 'defaultVectorFileExtension', 'defaultRasterFileExtension', 'defaultPointCloudFileExtension', 'defaultVectorTileFileExtension', 'supportsNonFileBasedOutput', 'load', 'unload')), ('__abstract_methods__', ('id', 'name', 'loadAlgorithms')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingregistry.h', (
+        ('QgsProcessingRegistry', (('__attribute_docs__', (('providerAdded', 'Emitted when a provider has been added to the registry.\n'), ('providerRemoved', 'Emitted when a provider is removed from the registry\n'), ('parameterTypeAdded', 'Emitted when a new parameter type has been added to the registry.\n\n.. versionadded:: 3.2\n'), ('parameterTypeRemoved', 'Emitted when a parameter type has been removed from the registry and is\nabout to be deleted.\n\n.. versionadded:: 3.2\n'))), ('__signal_arguments__', (('providerAdded', ('id: str',)), ('providerRemoved', ('id: str',)), ('parameterTypeAdded', ('type: QgsProcessingParameterType',)), ('parameterTypeRemoved', ('type: QgsProcessingParameterType',)))), ('__group__', ('processing',)))),
+    )),
+    ('src/core/processing/qgsprocessingutils.h', (
+        ('QgsProcessingUtils', ('compatibleRasterLayers', 'compatibleVectorLayers', 'compatibleMeshLayers', 'compatiblePluginLayers', 'compatiblePointCloudLayers', 'compatibleAnnotationLayers', 'compatibleVectorTileLayers', 'compatibleTiledSceneLayers', 'compatibleLayers', 'encodeProviderKeyAndUri', 'decodeProviderKeyAndUri', 'mapLayerFromString', 'variantToSource', 'variantToCrs', 'normalizeLayerSource', 'layerToStringIdentifier', 'variantToPythonLiteral', 'stringToPythonLiteral', 'createFeatureSink', 'combineLayerExtents', 'generateIteratingDestination', 'tempFolder', 'generateTempFilename', 'formatHelpMapAsHtml', 'outputDefinitionIndex', 'convertToCompatibleFormat', 'convertToCompatibleFormatAndLayerName', 'combineFields', 'fieldNamesToIndices', 'indicesToFields', 'defaultVectorExtension', 'defaultRasterExtension', 'defaultPointCloudExtension', 'defaultVectorTileExtension', 'removePointerValuesFromMap', 'preprocessQgisProcessParameters', 'resolveDefaultEncoding', ('__group__', ('processing',)))),
+        ('QgsProcessingFeatureSource', (('__overridden_methods__', ('hasFeatures', 'getFeatures', 'sourceCrs', 'fields', 'wkbType', 'featureCount', 'sourceName', 'uniqueValues', 'minimumValue', 'maximumValue', 'sourceExtent', 'allFeatureIds', 'hasSpatialIndex')), ('__group__', ('processing',)))),
+    )),
+    ('src/core/elevation/qgsprofileexporter.h', (
+        ('QgsProfileExporterTask', (('__overridden_methods__', ('run', 'cancel')), ('__group__', ('elevation',)))),
+        ('QgsProfileExporter', (('__group__', ('elevation',)),)),
+    )),
+    ('src/core/elevation/qgsprofilepoint.h', (
+        ('QgsProfilePoint', (('__group__', ('elevation',)),)),
+    )),
+    ('src/core/elevation/qgsprofilerenderer.h', (
+        ('QgsProfilePlotRenderer', (('__attribute_docs__', (('generationFinished', 'Emitted when the profile generation is finished (or canceled).\n'),)), 'defaultSubSectionsSymbol', ('__group__', ('elevation',)))),
+    )),
+    ('src/core/elevation/qgsprofilerequest.h', (
+        ('QgsProfileRequest', (('__group__', ('elevation',)),)),
+    )),
+    ('src/core/elevation/qgsprofilesnapping.h', (
+        ('QgsProfileSnapResult', (('__attribute_docs__', (('snappedPoint', 'Snapped point'),)), ('__annotations__', (('snappedPoint', 'QgsProfilePoint'),)), ('__group__', ('elevation',)))),
+    )),
+    ('src/core/elevation/qgsprofilesourceregistry.h', (
+        ('QgsProfileSourceRegistry', (('__group__', ('elevation',)),)),
+    )),
+    ('src/core/project/qgsproject.h', (
+        ('QgsProject', (('__attribute_docs__', (('cleared', 'Emitted when the project is cleared (and additionally when an open\nproject is cleared just before a new project is read).\n\n.. seealso:: :py:func:`clear`\n\n.. versionadded:: 3.2\n'), ('aboutToBeCleared', 'Emitted when the project is about to be cleared.\n\n.. seealso:: :py:func:`clear`\n\n.. versionadded:: 3.34\n'), ('readProject', 'Emitted when a project is being read.\n'), ('readProjectWithContext', 'Emitted when a project is being read. And passing the /a context\n'), ('writeProject', 'Emitted when the project is being written.\n'), ('readMapLayer', 'Emitted after the basic initialization of a layer from the project file\nis done. You can use this signal to read additional information from the\nproject file.\n\n:param mapLayer: The map layer which is being initialized\n:param layerNode: The layer node from the project file\n'), ('writeMapLayer', 'Emitted when a layer is being saved. You can use this method to save\nadditional information to the layer.\n\n:param mapLayer: The map layer which is being initialized\n:param layerElem: The layer element from the project file\n:param doc: The document\n'), ('projectSaved', 'Emitted when the project file has been written and closed.\n'), ('oldProjectVersionWarning', 'Emitted when an old project file is read.\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsProject.readVersionMismatchOccurred` instead.\n'), ('readVersionMismatchOccurred', 'Emitted when a project is read and the version of QGIS used to save the\nproject differs from the current QGIS version.\n\nThe ``fileVersion`` argument indicates the version of QGIS used to save\nthe project.\n\n.. note::\n\n   Not available in Python bindings\n\n.. versionadded:: 3.26\n'), ('layerLoaded', 'Emitted when a layer from a projects was read.\n\n:param i: current layer\n:param n: number of layers\n'), ('loadingLayer', 'Emitted when a layer is loaded\n'), ('loadingLayerMessageReceived', 'Emitted when loading layers has produced some messages\n\n:param layerName: the layer name\n:param messages: a list of pairs of :py:class:`Qgis`.MessageLevel and\n                 messages\n\n.. versionadded:: 3.2\n'), ('nonIdentifiableLayersChanged', 'Emitted when the list of layer which are excluded from map\nidentification changes\n\n.. deprecated:: 3.4\n'), ('titleChanged', 'Emitted when the title of the project changes.\n\n.. versionadded:: 4.0\n'), ('fileNameChanged', 'Emitted when the file name of the project changes\n'), ('homePathChanged', 'Emitted when the home path of the project changes.\n\n.. seealso:: :py:func:`setPresetHomePath`\n\n.. seealso:: :py:func:`homePath`\n\n.. seealso:: :py:func:`presetHomePath`\n'), ('snappingConfigChanged', 'Emitted whenever the configuration for snapping has changed.\n'), ('avoidIntersectionsModeChanged', 'Emitted whenever the avoid intersections mode has changed.\n\n.. versionadded:: 3.14\n'), ('customVariablesChanged', 'Emitted whenever the expression variables stored in the project have\nbeen changed.\n'), ('crsChanged', 'Emitted when the :py:func:`~QgsProject.crs` of the project has changed.\n\n.. seealso:: :py:func:`crs`\n\n.. seealso:: :py:func:`setCrs`\n\n.. seealso:: :py:func:`verticalCrsChanged`\n\n.. seealso:: :py:func:`ellipsoidChanged`\n'), ('crs3DChanged', 'Emitted when the :py:func:`~QgsProject.crs3D` of the project has\nchanged.\n\n.. seealso:: :py:func:`crs3D`\n\n.. seealso:: :py:func:`crsChanged`\n\n.. seealso:: :py:func:`verticalCrsChanged`\n\n.. seealso:: :py:func:`ellipsoidChanged`\n\n.. versionadded:: 3.38\n'), ('verticalCrsChanged', 'Emitted when the :py:func:`~QgsProject.verticalCrs` of the project has\nchanged.\n\nThis signal will be emitted whenever the vertical CRS of the project is\nchanged, either as a direct result of a call to\n:py:func:`~QgsProject.setVerticalCrs` or when\n:py:func:`~QgsProject.setCrs` is called with a compound CRS.\n\n.. seealso:: :py:func:`crsChanged`\n\n.. seealso:: :py:func:`crs3DChanged`\n\n.. seealso:: :py:func:`setCrs`\n\n.. seealso:: :py:func:`setVerticalCrs`\n\n.. seealso:: :py:func:`verticalCrs`\n\n.. versionadded:: 3.38\n'), ('ellipsoidChanged', 'Emitted when the project ``ellipsoid`` is changed.\n\n.. seealso:: :py:func:`setEllipsoid`\n\n.. seealso:: :py:func:`ellipsoid`\n'), ('distanceUnitsChanged', 'Emitted when the default distance units changes.\n\n.. seealso:: :py:func:`setDistanceUnits`\n\n.. versionadded:: 3.28\n'), ('areaUnitsChanged', 'Emitted when the default area units changes.\n\n.. seealso:: :py:func:`setAreaUnits`\n\n.. versionadded:: 3.28\n'), ('scaleMethodChanged', "Emitted when the project's scale method is changed.\n\n.. seealso:: :py:func:`scaleMethod`\n\n.. seealso:: :py:func:`setScaleMethod`\n\n.. versionadded:: 3.44\n"), ('transformContextChanged', 'Emitted when the project :py:func:`~QgsProject.transformContext` is\nchanged.\n\n.. seealso:: :py:func:`transformContext`\n'), ('missingDatumTransforms', 'Emitted when datum transforms stored in the project are not available\nlocally.\n'), ('transactionModeChanged', 'Emitted when the transaction mode has changed.\n\n.. versionadded:: 3.38\n'), ('transactionGroupsChanged', 'Emitted whenever a new transaction group has been created or a\ntransaction group has been removed.\n'), ('topologicalEditingChanged', 'Emitted when the topological editing flag has changed.\n'), ('avoidIntersectionsLayersChanged', 'Emitted whenever avoidIntersectionsLayers has changed.\n'), ('mapThemeCollectionChanged', 'Emitted when the map theme collection changes. This only happens when\nthe map theme collection is reset. Any pointer previously received from\n:py:func:`~QgsProject.mapThemeCollection` must no longer be used after\nthis signal is emitted. You must still connect to signals from the map\ntheme collection if you want to be notified about new map themes being\nadded and map themes being removed.\n'), ('labelingEngineSettingsChanged', 'Emitted when global configuration of the labeling engine changes.\n'), ('metadataChanged', "Emitted when the project's metadata is changed.\n\n.. seealso:: :py:func:`setMetadata`\n\n.. seealso:: :py:func:`metadata`\n\n.. versionadded:: 3.2\n"), ('projectColorsChanged', "Emitted whenever the project's color scheme has been changed.\n\n.. seealso:: :py:func:`setProjectColors`\n\n.. versionadded:: 3.6\n"), ('backgroundColorChanged', "Emitted whenever the project's canvas background color has been changed.\n\n.. seealso:: :py:func:`setBackgroundColor`\n\n.. versionadded:: 3.10\n"), ('selectionColorChanged', "Emitted whenever the project's selection color has been changed.\n\n.. seealso:: :py:func:`setSelectionColor`\n\n.. versionadded:: 3.10\n"), ('layersWillBeRemoved', 'Emitted when one or more layers are about to be removed from the\nregistry.\n\n:param layers: A list of layers which are to be removed.\n\n.. seealso:: :py:func:`layerWillBeRemoved`\n\n.. seealso:: :py:func:`layersRemoved`\n'), ('layerWillBeRemoved', 'Emitted when a layer is about to be removed from the registry.\n\n:param layer: The layer to be removed.\n\n.. note::\n\n   Consider using :py:func:`~QgsProject.layersWillBeRemoved` instead\n\n.. seealso:: :py:func:`layersWillBeRemoved`\n\n.. seealso:: :py:func:`layerRemoved`\n'), ('layersRemoved', 'Emitted after one or more layers were removed from the registry.\n\n:param layerIds: A list of IDs of the layers which were removed.\n\n.. seealso:: :py:func:`layersWillBeRemoved`\n'), ('layerRemoved', 'Emitted after a layer was removed from the registry.\n\n:param layerId: The ID of the layer removed.\n\n.. note::\n\n   Consider using :py:func:`~QgsProject.layersRemoved` instead\n\n.. seealso:: :py:func:`layerWillBeRemoved`\n'), ('removeAll', 'Emitted when all layers are removed, before\n:py:func:`~QgsProject.layersWillBeRemoved` and\n:py:func:`~QgsProject.layerWillBeRemoved` signals are emitted. The\n:py:func:`~QgsProject.layersWillBeRemoved` and\n:py:func:`~QgsProject.layerWillBeRemoved` signals will still be emitted\nfollowing this signal. You can use this signal to do easy (and fast)\ncleanup.\n'), ('layersAdded', 'Emitted when one or more layers were added to the registry. This signal\nis also emitted for layers added to the registry, but not to the legend.\n\n:param layers: List of layers which have been added.\n\n.. seealso:: :py:func:`legendLayersAdded`\n\n.. seealso:: :py:func:`layerWasAdded`\n'), ('layerWasAdded', 'Emitted when a layer was added to the registry.\n\n.. note::\n\n   Consider using :py:func:`~QgsProject.layersAdded` instead\n\n.. seealso:: :py:func:`layersAdded`\n'), ('legendLayersAdded', 'Emitted, when a layer was added to the registry and the legend. Layers\ncan also be private layers, which are signalled by\n:py:func:`~QgsProject.layersAdded` and\n:py:func:`~QgsProject.layerWasAdded` but will not be advertised by this\nsignal.\n\n:param layers: List of :py:class:`QgsMapLayer` which were added to the\n               legend.\n'), ('isDirtyChanged', 'Emitted when the project dirty status changes.\n\n:param dirty: ``True`` if the project is in a dirty state and has\n              pending unsaved changes.\n\n.. versionadded:: 3.2\n'), ('dirtySet', 'Emitted when setDirty(true) is called.\n\n.. note::\n\n   As opposed to :py:func:`~QgsProject.isDirtyChanged`, this signal is invoked every time setDirty(true)\n   is called, regardless of whether the project was already dirty.\n\n.. versionadded:: 3.20\n'), ('mapScalesChanged', 'Emitted when the list of custom project map scales changes.\n\n.. seealso:: :py:func:`mapScales`\n\n.. seealso:: :py:func:`setMapScales`\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsProject.viewSettings` instead.\n'), ('elevationShadingRendererChanged', 'Emitted when the map shading renderer changes\n\n.. versionadded:: 3.30\n'))), 'instance', 'setInstance', ('__overridden_methods__', ('createExpressionContext', 'createExpressionContextScope', 'translate')), ('__signal_arguments__', (('readProject', ('document: QDomDocument',)), ('readProjectWithContext', ('document: QDomDocument', 'context: QgsReadWriteContext')), ('writeProject', ('document: QDomDocument',)), ('readMapLayer', ('mapLayer: QgsMapLayer', 'layerNode: QDomElement')), ('writeMapLayer', ('mapLayer: QgsMapLayer', 'layerElem: QDomElement', 'doc: QDomDocument')), ('readVersionMismatchOccurred', ('fileVersion: str',)), ('layerLoaded', ('i: int', 'n: int')), ('loadingLayer', ('layerName: str',)), ('loadingLayerMessageReceived', ('layerName: str', 'messages: List[QgsReadWriteContext.ReadWriteMessage]')), ('nonIdentifiableLayersChanged', ('nonIdentifiableLayers: List[str]',)), ('snappingConfigChanged', ('config: QgsSnappingConfig',)), ('ellipsoidChanged', ('ellipsoid: str',)), ('missingDatumTransforms', ('missingTransforms: List[str]',)), ('layersWillBeRemoved', ('layers: List[QgsMapLayer]',)), ('layerWillBeRemoved', ('layer: QgsMapLayer',)), ('layersRemoved', ('layerIds: List[str]',)), ('layerRemoved', ('layerId: str',)), ('layersAdded', ('layers: List[QgsMapLayer]',)), ('layerWasAdded', ('layer: QgsMapLayer',)), ('legendLayersAdded', ('layers: List[QgsMapLayer]',)), ('isDirtyChanged', ('dirty: bool',)))), ('__group__', ('project',)))),
+        ('QgsProjectDirtyBlocker', (('__group__', ('project',)),)),
+    )),
+    ('src/core/project/qgsprojectbadlayerhandler.h', (
+        ('QgsProjectBadLayerHandler', (('__virtual_methods__', ('handleBadLayers',)), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectdisplaysettings.h', (
+        ('QgsProjectDisplaySettings', (('__attribute_docs__', (('bearingFormatChanged', 'Emitted when the bearing format changes.\n\n.. seealso:: :py:func:`setBearingFormat`\n\n.. seealso:: :py:func:`bearingFormat`\n'), ('geographicCoordinateFormatChanged', 'Emitted when the geographic coordinate format changes.\n\n.. seealso:: :py:func:`setGeographicCoordinateFormat`\n\n.. seealso:: :py:func:`geographicCoordinateFormat`\n'), ('coordinateTypeChanged', 'Emitted when the default coordinate format changes.\n\n.. seealso:: :py:func:`setCoordinateType`\n\n.. seealso:: :py:func:`coordinateType`\n\n.. versionadded:: 3.28\n'), ('coordinateAxisOrderChanged', 'Emitted when the default coordinate axis order changes.\n\n.. seealso:: :py:func:`setCoordinateAxisOrder`\n\n.. seealso:: :py:func:`coordinateAxisOrder`\n\n.. versionadded:: 3.28\n'), ('coordinateCustomCrsChanged', 'Emitted when the coordinate custom CRS changes.\n\n.. seealso:: :py:func:`setCoordinateCustomCrs`\n\n.. seealso:: :py:func:`coordinateCustomCrs`\n\n.. versionadded:: 3.28\n'), ('coordinateCrsChanged', 'Emitted when the coordinate CRS changes.\n\n.. seealso:: :py:func:`coordinateCrs`\n\n.. seealso:: :py:func:`coordinateType`\n\n.. versionadded:: 3.28\n'))), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectelevationproperties.h', (
+        ('QgsProjectElevationProperties', (('__attribute_docs__', (('changed', 'Emitted when the elevation properties change.\n'), ('elevationRangeChanged', "Emitted when the project's elevation ``is`` changed.\n\n.. note::\n\n   This is a manual, use-set property, and does not necessarily\n   coincide with the elevation ranges for individual layers in the project.\n\n.. seealso:: :py:func:`elevationRange`\n\n.. seealso:: :py:func:`setElevationRange`\n\n.. versionadded:: 3.38\n"))), ('__signal_arguments__', (('elevationRangeChanged', ('range: QgsDoubleRange',)),)), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectfiletransform.h', (
+        ('QgsProjectFileTransform', ('convertRasterProperties', 'fixOldSymbolLayerReferences', ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectgpssettings.h', (
+        ('QgsProjectGpsSettings', (('__attribute_docs__', (('automaticallyAddTrackVerticesChanged', 'Emitted whenever the\n:py:func:`~QgsProjectGpsSettings.automaticallyAddTrackVertices` setting\nis changed.\n\n.. seealso:: :py:func:`automaticallyAddTrackVertices`\n\n.. seealso:: :py:func:`setAutomaticallyAddTrackVertices`\n'), ('automaticallyCommitFeaturesChanged', 'Emitted whenever the\n:py:func:`~QgsProjectGpsSettings.automaticallyCommitFeatures` setting is\nchanged.\n\n.. seealso:: :py:func:`automaticallyCommitFeatures`\n\n.. seealso:: :py:func:`setAutomaticallyCommitFeatures`\n'), ('destinationFollowsActiveLayerChanged', 'Emitted whenever the\n:py:func:`~QgsProjectGpsSettings.destinationFollowsActiveLayer` setting\nis changed.\n\n.. seealso:: :py:func:`destinationFollowsActiveLayer`\n\n.. seealso:: :py:func:`setDestinationFollowsActiveLayer`\n'), ('destinationLayerChanged', 'Emitted whenever the destination layer for features digitized from GPS\nis changed.\n\n.. seealso:: :py:func:`destinationLayer`\n\n.. seealso:: :py:func:`setDestinationLayer`\n'), ('destinationTimeStampFieldChanged', 'Emitted whenever the destination field for automatic time stamps is\nchanged.\n\nThe ``field`` argument will be an empty string if time stamps should not\nbe automatically saved.\n\n.. seealso:: :py:func:`destinationTimeStampFields`\n\n.. seealso:: :py:func:`destinationTimeStampField`\n\n.. seealso:: :py:func:`setDestinationTimeStampField`\n'))), ('__signal_arguments__', (('automaticallyAddTrackVerticesChanged', ('enabled: bool',)), ('automaticallyCommitFeaturesChanged', ('enabled: bool',)), ('destinationFollowsActiveLayerChanged', ('follows: bool',)), ('destinationLayerChanged', ('layer: QgsVectorLayer',)), ('destinationTimeStampFieldChanged', ('field: str',)))), ('__group__', ('project',)))),
+    )),
+    ('src/core/proj/qgsprojectionfactors.h', (
+        ('QgsProjectionFactors', (('__group__', ('proj',)),)),
+    )),
+    ('src/core/browser/qgsprojectitem.h', (
+        ('QgsProjectItem', (('__overridden_methods__', ('hasDragEnabled', 'mimeUris')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/metadata/qgsprojectmetadata.h', (
+        ('QgsProjectMetadata', (('__overridden_methods__', ('clone', 'readMetadataXml', 'writeMetadataXml', 'combine')), ('__group__', ('metadata',)))),
+    )),
+    ('src/core/project/qgsprojectproperty.h', (
+        ('QgsProjectProperty', (('__virtual_methods__', ('writeXml',)), ('__abstract_methods__', ('dump', 'isKey', 'isValue', 'isLeaf', 'readXml', 'writeXml', 'value')), ('__group__', ('project',)))),
+        ('QgsProjectPropertyKey', (('__virtual_methods__', ('clear', 'clearKeys')), ('__overridden_methods__', ('value', 'dump', 'readXml', 'writeXml', 'isKey', 'isValue', 'isLeaf')), ('__group__', ('project',)))),
+        ('QgsProjectPropertyValue', (('__overridden_methods__', ('isKey', 'isValue', 'value', 'isLeaf', 'dump', 'readXml', 'writeXml')), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectservervalidator.h', (
+        ('QgsProjectServerValidator.ValidationResult', (('__attribute_docs__', (('error', 'Error which occurred during the validation process.'), ('identifier', 'Identifier related to the error. It can be a layer/group name.'))), ('__annotations__', (('error', 'QgsProjectServerValidator.ValidationError'), ('identifier', 'object'))), ('__group__', ('project',)))),
+        ('QgsProjectServerValidator', ('displayValidationError', 'validate', ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectstorage.h', (
+        ('QgsProjectStorage', (('__virtual_methods__', ('isSupportedUri', 'renameProject', 'readProjectStorageMetadata', 'filePath', 'visibleName', 'showLoadGui', 'showSaveGui')), ('__abstract_methods__', ('type', 'listProjects', 'readProject', 'writeProject', 'removeProject')), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectstorageregistry.h', (
+        ('QgsProjectStorageRegistry', (('__group__', ('project',)),)),
+    )),
+    ('src/core/project/qgsprojectstylesettings.h', (
+        ('QgsProjectStyleSettings', (('__attribute_docs__', (('styleDatabasesChanged', 'Emitted whenever the set of style databases associated with the project\nis changed.\n'),)), ('__group__', ('project',)))),
+        ('QgsProjectStyleDatabaseModel', (('__overridden_methods__', ('rowCount', 'data')), ('__group__', ('project',)))),
+        ('QgsProjectStyleDatabaseProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojecttimesettings.h', (
+        ('QgsProjectTimeSettings', (('__attribute_docs__', (('temporalRangeChanged', 'Emitted when the temporal range changes.\n\n.. seealso:: :py:func:`temporalRange`\n\n.. seealso:: :py:func:`setTemporalRange`\n'),)), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojecttranslator.h', (
+        ('QgsProjectTranslator', (('__abstract_methods__', ('translate',)), ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectutils.h', (
+        ('QgsProjectUtils', ('layersMatchingPath', 'updateLayerPath', 'layerIsContainedInGroupLayer', ('__group__', ('project',)))),
+    )),
+    ('src/core/project/qgsprojectversion.h', (
+        ('QgsProjectVersion', (('__group__', ('project',)),)),
+    )),
+    ('src/core/project/qgsprojectviewsettings.h', (
+        ('QgsProjectViewSettings', (('__attribute_docs__', (('mapScalesChanged', 'Emitted when the list of custom project map scales changes.\n\n.. seealso:: :py:func:`mapScales`\n\n.. seealso:: :py:func:`setMapScales`\n'), ('presetFullExtentChanged', 'Emitted whenever the :py:func:`~QgsProjectViewSettings.presetFullExtent`\nis changed.\n\n.. versionadded:: 3.18\n'))), ('__group__', ('project',)))),
+    )),
+    ('src/core/proj/qgsprojoperation.h', (
+        ('QgsProjOperation', (('__group__', ('proj',)),)),
+    )),
+    ('src/core/proj/qgsprojutils.h', (
+        ('QgsProjUtils', ('projVersionMajor', 'projVersionMinor', 'epsgRegistryVersion', 'epsgRegistryDate', 'esriDatabaseVersion', 'esriDatabaseDate', 'ignfDatabaseVersion', 'ignfDatabaseDate', 'searchPaths', ('__group__', ('proj',)))),
+    )),
+    ('src/core/qgsproperty.h', (
+        ('QgsProperty', ('propertyMapToVariantMap', 'variantMapToPropertyMap', 'fromExpression', 'fromField', 'fromValue')),
+    )),
+    ('src/core/qgspropertycollection.h', (
+        ('QgsAbstractPropertyCollection', (('__virtual_methods__', ('writeXml', 'readXml')), ('__abstract_methods__', ('propertyKeys', 'clear', 'hasProperty', 'property', 'value', 'prepare', 'referencedFields', 'isActive', 'hasActiveProperties', 'hasDynamicProperties', 'toVariant', 'loadVariant')))),
+        ('QgsPropertyCollection', (('__virtual_methods__', ('property',)), ('__overridden_methods__', ('propertyKeys', 'clear', 'hasProperty', 'value', 'prepare', 'referencedFields', 'isActive', 'hasActiveProperties', 'hasDynamicProperties', 'toVariant', 'loadVariant')))),
+        ('QgsPropertyCollectionStack', (('__virtual_methods__', ('clear',)), ('__overridden_methods__', ('hasActiveProperties', 'hasDynamicProperties', 'isActive', 'property', 'value', 'referencedFields', 'prepare', 'propertyKeys', 'hasProperty', 'toVariant', 'loadVariant')))),
+    )),
+    ('src/core/qgspropertytransformer.h', (
+        ('QgsPropertyTransformer', ('create', 'fromExpression', ('__virtual_methods__', ('loadVariant', 'toVariant')), ('__abstract_methods__', ('transformerType', 'clone', 'transform', 'toExpression')))),
+        ('QgsGenericNumericTransformer', ('fromExpression', ('__overridden_methods__', ('transformerType', 'clone', 'toVariant', 'loadVariant', 'transform', 'toExpression')))),
+        ('QgsSizeScaleTransformer', ('fromExpression', ('__overridden_methods__', ('transformerType', 'clone', 'toVariant', 'loadVariant', 'transform', 'toExpression')))),
+        ('QgsColorRampTransformer', (('__overridden_methods__', ('transformerType', 'clone', 'toVariant', 'loadVariant', 'transform', 'toExpression')),)),
+    )),
+    ('src/core/qgsproviderconnectionmodel.h', (
+        ('QgsProviderConnectionModel', (('__overridden_methods__', ('parent', 'rowCount', 'columnCount', 'data', 'index')),)),
+    )),
+    ('src/core/providers/qgsprovidermetadata.h', (
+        ('QgsProviderMetadata', (('__attribute_docs__', (('connectionCreated', 'Emitted when a connection with the specified ``name`` is created.\n\n.. note::\n\n   Only providers which implement the connection handling API will emit this signal.\n\n.. versionadded:: 3.14\n'), ('connectionDeleted', 'Emitted when the connection with the specified ``name`` was deleted.\n\n.. note::\n\n   Only providers which implement the connection handling API will emit this signal.\n\n.. versionadded:: 3.14\n'), ('connectionChanged', 'Emitted when the connection with the specified ``name`` is changed, e.g.\nthe settings relating to the connection have been updated.\n\n.. note::\n\n   Only providers which implement the connection handling API will emit this signal.\n\n.. versionadded:: 3.14\n'))), 'setBoolParameter', 'boolParameter', ('__virtual_methods__', ('icon', 'capabilities', 'providerCapabilities', 'initProvider', 'cleanupProvider', 'filters', 'meshDriversMetadata', 'priorityForUri', 'validLayerTypesForUri', 'uriIsBlocklisted', 'sidecarFilesForUri', 'querySublayers', 'suggestGroupNameForUri', 'createProvider', 'createDatabase', 'createRasterDataProvider', 'createMeshData', 'pyramidResamplingMethods', 'decodeUri', 'encodeUri', 'absoluteToRelativeUri', 'relativeToAbsoluteUri', 'cleanUri', 'dataItemProviders', 'listStyles', 'styleExists', 'getStyleById', 'deleteStyleById', 'saveStyle', 'loadStyle', 'loadStoredStyle', 'saveLayerMetadata', 'createDb', 'createTransaction', 'connections', 'createConnection', 'deleteConnection', 'saveConnection')), ('__signal_arguments__', (('connectionCreated', ('name: str',)), ('connectionDeleted', ('name: str',)), ('connectionChanged', ('name: str',)))), ('__group__', ('providers',)))),
+        ('QgsMeshDriverMetadata', (('__group__', ('providers',)),)),
+    )),
+    ('src/core/providers/qgsproviderregistry.h', (
+        ('QgsProviderRegistry', ('instance', ('__group__', ('providers',)))),
+        ('QgsProviderRegistry.UnusableUriHandlerInterface', (('__abstract_methods__', ('matchesUri', 'details')), ('__group__', ('providers',)))),
+        ('QgsProviderRegistry.ProviderCandidateDetails', (('__group__', ('providers',)),)),
+    )),
+    ('src/core/providers/qgsprovidersqlquerybuilder.h', (
+        ('QgsProviderSqlQueryBuilder', (('__virtual_methods__', ('createLimitQueryForTable', 'quoteIdentifier')), ('__group__', ('providers',)))),
+    )),
+    ('src/core/providers/qgsprovidersublayerdetails.h', (
+        ('QgsProviderSublayerDetails', (('__group__', ('providers',)),)),
+    )),
+    ('src/core/providers/qgsprovidersublayermodel.h', (
+        ('QgsProviderSublayerModel', (('__overridden_methods__', ('index', 'parent', 'columnCount', 'rowCount', 'flags', 'data', 'headerData')), ('__group__', ('providers',)))),
+        ('QgsProviderSublayerProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('providers',)))),
+        ('QgsProviderSublayerModel.NonLayerItem', (('__group__', ('providers',)),)),
+    )),
+    ('src/core/providers/qgsprovidersublayertask.h', (
+        ('QgsProviderSublayerTask', (('__overridden_methods__', ('cancel', 'run')), ('__group__', ('providers',)))),
+    )),
+    ('src/core/providers/qgsproviderutils.h', (
+        ('QgsProviderUtils', ('sublayerDetailsAreIncomplete', 'suggestLayerNameFromFilePath', ('__group__', ('providers',)))),
+    )),
+    ('src/core/qgsproxyfeaturesink.h', (
+        ('QgsProxyFeatureSink', (('__overridden_methods__', ('addFeature', 'addFeatures', 'lastError', 'flushBuffer', 'finalize')),)),
+    )),
+    ('src/core/qgsproxyprogresstask.h', (
+        ('QgsProxyProgressTask', (('__attribute_docs__', (('canceled', 'Emitted when the task is canceled.\n\n.. versionadded:: 3.26\n'),)), ('__overridden_methods__', ('run', 'cancel')))),
+    )),
+    ('src/core/qgspythonrunner.h', (
+        ('QgsPythonRunner', ('isValid', 'run', 'runFile', 'eval', 'setArgv', 'setInstance', ('__abstract_methods__', ('runCommand', 'runFileCommand', 'evalCommand', 'setArgvCommand')))),
+    )),
+    ('src/core/gps/qgsqtlocationconnection.h', (
+        ('QgsQtLocationConnection', (('__overridden_methods__', ('parseData',)), ('__group__', ('gps',)))),
+    )),
+    ('src/core/geometry/qgsquadrilateral.h', (
+        ('QgsQuadrilateral', ('rectangleFrom3Points', 'rectangleFromExtent', 'squareFromDiagonal', 'rectangleFromCenterPoint', 'fromRectangle', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsqueryresultmodel.h', (
+        ('QgsQueryResultModel', (('__attribute_docs__', (('fetchingComplete', 'Emitted when rows have been fetched (all of them or a batch if `maxRows`\nwas passed to :py:func:`~QgsQueryResultModel.fetchMoreRows` ) or when\nthe fetching has been stopped (canceled).\n\n.. seealso:: :py:func:`fetchMoreRows`\n'), ('fetchMoreRows', 'Emitted when more rows are requested.\n\n:param maxRows: the number of rows that will be fetched.\n'), ('fetchingStarted', 'Emitted when fetching of rows has started\n'))), ('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'headerData', 'fetchMore', 'canFetchMore')), ('__signal_arguments__', (('fetchMoreRows', ('maxRows: int',)),)))),
+    )),
+    ('src/core/fieldformatter/qgsrangefieldformatter.h', (
+        ('QgsRangeFieldFormatter', (('__overridden_methods__', ('id', 'representValue')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/raster/qgsraster.h', (
+        ('QgsRaster', ('representableValue', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterattributetable.h', (
+        ('QgsRasterAttributeTable.MinMaxClass', (('__attribute_docs__', (('minMaxValues', 'List of values for the class'),)), ('__annotations__', (('minMaxValues', 'List[float]'),)), ('__group__', ('raster',)))),
+        ('QgsRasterAttributeTable', ('guessFieldUsage', 'usageName', 'valueAndColorFieldUsages', 'createFromRaster', 'usageInformation', ('__group__', ('raster',)))),
+        ('QgsRasterAttributeTable.Field', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterblock.h', (
+        ('QgsRasterBlock', ('typeSize', 'typeIsNumeric', 'typeIsComplex', 'typeIsColor', 'typeWithNoDataValue', 'valueBytes', 'printValue', 'subRect', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterchecker.h', (
+        ('QgsRasterChecker', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrastercontourrenderer.h', (
+        ('QgsRasterContourRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'writeXml', 'block', 'usesBands', 'createLegendNodes', 'inputBand', 'setInputBand')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterdataprovider.h', (
+        ('QgsImageFetcher', (('__attribute_docs__', (('finish', 'Emitted when the download completes\n\n:param legend: The downloaded legend image\n'), ('progress', 'Emitted to report progress\n'), ('error', 'Emitted when an error occurs\n'))), ('__abstract_methods__', ('start',)), ('__signal_arguments__', (('finish', ('legend: QImage',)), ('progress', ('received: int', 'total: int')), ('error', ('msg: str',)))), ('__group__', ('raster',)))),
+        ('QgsRasterDataProvider', (('__attribute_docs__', (('statusChanged', 'Emit a message to be displayed on status bar, usually used by network\nproviders (WMS,WCS)\n'),)), 'create', 'pyramidResamplingMethods', 'decodeVirtualRasterProviderUri', 'encodeVirtualRasterProviderUri', 'identifyFormatName', 'identifyFormatFromName', 'identifyFormatLabel', 'identifyFormatToCapability', ('__virtual_methods__', ('providerCapabilities', 'fields', 'colorInterpretation', 'reload', 'bandScale', 'bandOffset', 'maximumTileSize', 'sourceHasNoDataValue', 'useSourceNoDataValue', 'setUseSourceNoDataValue', 'sourceNoDataValue', 'setUserNoDataValue', 'userNoDataValues', 'colorTable', 'supportsLegendGraphic', 'getLegendGraphicFetcher', 'buildPyramids', 'buildPyramidList', 'identify', 'sample', 'lastErrorFormat', 'isEditable', 'setEditable', 'write', 'setNoDataValue', 'remove', 'validateCreationOptions', 'validatePyramidsConfigOptions', 'stepWidth', 'stepHeight', 'nativeResolutions', 'ignoreExtents', 'transformCoordinates', 'enableProviderResampling', 'setZoomedInResamplingMethod', 'setZoomedOutResamplingMethod', 'setMaxOversampling', 'writeNativeAttributeTable', 'readNativeAttributeTable', 'bandDescription')), ('__abstract_methods__', ('clone', 'extent', 'dataType', 'sourceDataType', 'lastErrorTitle', 'lastError')), ('__overridden_methods__', ('clone', 'setInput', 'extent', 'dataType', 'sourceDataType', 'colorInterpretationName', 'block', 'subLayers', 'temporalCapabilities', 'elevationProperties', 'timestamp', 'dataTimestamp', 'readXml', 'writeXml')), ('__group__', ('raster',)))),
+        ('QgsRasterDataProvider.VirtualRasterInputLayers', (('__group__', ('raster',)),)),
+        ('QgsRasterDataProvider.VirtualRasterParameters', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterdataproviderelevationproperties.h', (
+        ('QgsRasterDataProviderElevationProperties', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterdataprovidertemporalcapabilities.h', (
+        ('QgsRasterDataProviderTemporalCapabilities', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterdrawer.h', (
+        ('QgsRasterDrawer', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterfilewriter.h', (
+        ('QgsRasterFileWriter', ('filterForDriver', 'supportedFiltersAndFormats', 'supportedFormatExtensions', 'driverForExtension', 'extensionsForFormat', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterfilewritertask.h', (
+        ('QgsRasterFileWriterTask', (('__attribute_docs__', (('writeComplete', 'Emitted when writing the layer is successfully completed. The\n``outputUrl`` parameter indicates the file path for the written file(s).\n'), ('errorOccurred', 'Emitted when an error occurs which prevented the file being written (or\nif the task is canceled). The writing ``error`` will be reported and a\n``errorMessage`` will be potentially set.\n\n.. versionadded:: 3.10\n'))), ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__signal_arguments__', (('writeComplete', ('outputUrl: str',)), ('errorOccurred', ('error: int', 'errorMessage: str')))), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasteridentifyresult.h', (
+        ('QgsRasterIdentifyResult', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterinterface.h', (
+        ('QgsRasterBlockFeedback', (('__virtual_methods__', ('onNewData',)), ('__group__', ('raster',)))),
+        ('QgsRasterInterface', (('__virtual_methods__', ('capabilities', 'sourceDataType', 'extent', 'xBlockSize', 'yBlockSize', 'xSize', 'ySize', 'generateBandName', 'colorInterpretationName', 'setInput', 'input', 'on', 'setOn', 'sourceInput', 'histogram', 'hasHistogram', 'cumulativeCut', 'writeXml', 'readXml')), ('__abstract_methods__', ('clone', 'dataType', 'bandCount', 'block')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterlabeling.h', (
+        ('QgsAbstractRasterLayerLabeling', ('defaultLabelingForLayer', 'createFromElement', ('__virtual_methods__', ('multiplyOpacity', 'isInScaleRange', 'toSld', 'accept')), ('__abstract_methods__', ('type', 'clone', 'save', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode')), ('__group__', ('raster',)))),
+        ('QgsRasterLayerSimpleLabeling', ('create', ('__overridden_methods__', ('type', 'clone', 'save', 'accept', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode', 'multiplyOpacity', 'isInScaleRange')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterlayerelevationproperties.h', (
+        ('QgsRasterLayerElevationProperties', ('layerLooksLikeDem', ('__overridden_methods__', ('hasElevation', 'writeXml', 'readXml', 'clone', 'htmlSummary', 'isVisibleInZRange', 'calculateZRange', 'significantZValues', 'showByDefaultInElevationProfilePlots', 'flags')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterlayertemporalproperties.h', (
+        ('QgsRasterLayerTemporalProperties', (('__overridden_methods__', ('isVisibleInTemporalRange', 'allTemporalRanges', 'flags', 'writeXml', 'readXml', 'setDefaultsFromDataProviderTemporalCapabilities')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterlayerutils.h', (
+        ('QgsRasterLayerUtils', ('renderedBandForElevationAndTemporalRange', 'alignRasterExtent', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasternuller.h', (
+        ('QgsRasterNuller', (('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'block')), ('__group__', ('raster',)))),
+        ('QgsRasterNuller.NoData', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterpipe.h', (
+        ('QgsRasterPipe', ('propertyDefinitions', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterprojector.h', (
+        ('QgsRasterProjector', ('precisionLabel', 'extentSize', ('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'block')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterpyramid.h', (
+        ('QgsRasterPyramid', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterrange.h', (
+        ('QgsRasterRange', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterrenderer.h', (
+        ('QgsRasterRenderer', (('__virtual_methods__', ('type', 'flags', 'canCreateRasterAttributeTable', 'inputBand', 'setInputBand', 'legendSymbologyItems', 'createLegendNodes', 'usesBands', 'toSld', 'accept')), ('__abstract_methods__', ('clone', 'block')), ('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'setInput', 'block', 'readXml')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterrendererregistry.h', (
+        ('QgsRasterRendererRegistry', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrasterrendererutils.h', (
+        ('QgsRasterRendererUtils', ('parseColorMapFile', 'saveColorMapFile', ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterresamplefilter.h', (
+        ('QgsRasterResampleFilter', (('__overridden_methods__', ('clone', 'bandCount', 'dataType', 'setInput', 'block', 'writeXml', 'readXml')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrasterresampler.h', (
+        ('QgsRasterResampler', (('__virtual_methods__', ('tileBufferPixels',)), ('__abstract_methods__', ('resample', 'type', 'clone')), ('__group__', ('raster',)))),
+        ('QgsRasterResamplerV2', (('__abstract_methods__', ('resampleV2',)), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrastershader.h', (
+        ('QgsRasterShader', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/raster/qgsrastershaderfunction.h', (
+        ('QgsRasterShaderFunction', (('__virtual_methods__', ('setMaximumValue', 'setMinimumValue', 'shade', 'legendSymbologyItems')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrastersinglecolorrenderer.h', (
+        ('QgsRasterSingleColorRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'block', 'writeXml', 'inputBand', 'setInputBand', 'usesBands')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgsrastertransparency.h', (
+        ('QgsRasterTransparency', (('__group__', ('raster',)),)),
+    )),
+    ('src/core/geometry/qgsray3d.h', (
+        ('QgsRay3D', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/geometry/qgsrectangle.h', (
+        ('QgsRectangle', ('fromWkt', 'fromCenterAndSize', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgsreferencedgeometry.h', (
+        ('QgsReferencedGeometry', ('fromReferencedPointXY', 'fromReferencedRect', ('__group__', ('geometry',)))),
+        ('QgsReferencedGeometryBase', (('__group__', ('geometry',)),)),
+        ('QgsReferencedRectangle', (('__group__', ('geometry',)),)),
+        ('QgsReferencedPointXY', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/geometry/qgsregularpolygon.h', (
+        ('QgsRegularPolygon', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/qgsrelation.h', (
+        ('QgsRelation', ('createFromXml', 'cardinalityToDisplayString', 'strengthToDisplayString')),
+    )),
+    ('src/core/qgsrelationmanager.h', (
+        ('QgsRelationManager', (('__attribute_docs__', (('relationsLoaded', 'Emitted when the relations were loaded after reading a project\n'), ('changed', 'Emitted when relations are added or removed to the manager.\n'))), 'discoverRelations')),
+    )),
+    ('src/core/fieldformatter/qgsrelationreferencefieldformatter.h', (
+        ('QgsRelationReferenceFieldFormatter', (('__overridden_methods__', ('id', 'representValue', 'sortValue', 'createCache', 'availableValues')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/browser/qgsrelationshipsitem.h', (
+        ('QgsRelationshipsItem', (('__overridden_methods__', ('createChildren', 'icon')), ('__group__', ('browser',)))),
+        ('QgsRelationshipItem', (('__overridden_methods__', ('icon',)), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsremappingproxyfeaturesink.h', (
+        ('QgsRemappingProxyFeatureSink', (('__overridden_methods__', ('addFeature', 'addFeatures', 'lastError')),)),
+    )),
+    ('src/core/qgsrenderchecker.h', (
+        ('QgsRenderChecker', ('testReportDir', 'shouldGenerateReport', 'drawBackground', 'sourcePath')),
+    )),
+    ('src/core/qgsrendercontext.h', (
+        ('QgsRenderContext', ('fromMapSettings', 'fromQPainter')),
+    )),
+    ('src/core/annotations/qgsrenderedannotationitemdetails.h', (
+        ('QgsRenderedAnnotationItemDetails', (('__group__', ('annotations',)),)),
+    )),
+    ('src/core/qgsrenderedfeaturehandlerinterface.h', (
+        ('QgsRenderedFeatureHandlerInterface', (('__virtual_methods__', ('usedAttributes',)), ('__abstract_methods__', ('handleRenderedFeature',)))),
+    )),
+    ('src/core/maprenderer/qgsrendereditemresults.h', (
+        ('QgsRenderedItemResults', (('__group__', ('maprenderer',)),)),
+    )),
+    ('src/core/symbology/qgsrenderer.h', (
+        ('QgsFeatureRenderer', ('defaultRenderer', 'load', 'loadSld', '_getPoint', 'convertSymbolSizeScale', 'convertSymbolRotation', ('__virtual_methods__', ('originalSymbolForFeature', 'legendKeysForFeature', 'startRender', 'stopRender', 'canSkipRender', 'filter', 'usesEmbeddedSymbols', 'filterNeedsGeometry', 'renderFeature', 'dump', 'capabilities', 'flags', 'symbols', 'save', 'writeSld', 'toSld', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'checkLegendSymbolItem', 'setLegendSymbolItem', 'legendKeyToExpression', 'legendSymbolItems', 'createLegendNodes', 'legendClassificationAttribute', 'willRenderFeature', 'symbolsForFeature', 'originalSymbolsForFeature', 'modifyRequestExtent', 'setEmbeddedRenderer', 'accept')), ('__abstract_methods__', ('symbolForFeature', 'usedAttributes', 'clone')), ('__group__', ('symbology',)))),
+        ('QgsSymbolLevelItem', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/symbology/qgsrendererrange.h', (
+        ('QgsRendererRange', (('__group__', ('symbology',)),)),
+        ('QgsRendererRangeLabelFormat', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/symbology/qgsrendererregistry.h', (
+        ('QgsRendererAbstractMetadata', (('__virtual_methods__', ('compatibleLayerTypes', 'createRendererWidget', 'createRendererFromSld')), ('__abstract_methods__', ('createRenderer',)), ('__group__', ('symbology',)))),
+        ('QgsRendererMetadata', (('__overridden_methods__', ('createRenderer', 'createRendererWidget', 'createRendererFromSld', 'compatibleLayerTypes')), ('__group__', ('symbology',)))),
+        ('QgsRendererRegistry', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/layout/qgsreport.h', (
+        ('QgsReport', (('__attribute_docs__', (('nameChanged', "Emitted when the report's name is changed.\n\n.. seealso:: :py:func:`setName`\n"),)), ('__overridden_methods__', ('layoutType', 'type', 'description', 'icon', 'layoutProject', 'clone', 'name', 'setName', 'writeLayoutXml', 'readLayoutXml', 'updateSettings', 'layoutAccept')), ('__signal_arguments__', (('nameChanged', ('name: str',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgsreportsectionfieldgroup.h', (
+        ('QgsReportSectionFieldGroup', (('__overridden_methods__', ('type', 'description', 'icon', 'clone', 'beginRender', 'prepareHeader', 'prepareFooter', 'nextBody', 'reset', 'setParentSection', 'reloadSettings', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/layout/qgsreportsectionlayout.h', (
+        ('QgsReportSectionLayout', (('__overridden_methods__', ('type', 'description', 'icon', 'clone', 'beginRender', 'nextBody', 'reloadSettings', 'writePropertiesToElement', 'readPropertiesFromElement')), ('__group__', ('layout',)))),
+    )),
+    ('src/core/labeling/qgsrulebasedlabeling.h', (
+        ('QgsRuleBasedLabeling.Rule', ('create', ('__group__', ('labeling',)))),
+        ('QgsRuleBasedLabeling', ('create', ('__overridden_methods__', ('type', 'clone', 'save', 'subProviders', 'settings', 'accept', 'setSettings', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode', 'toSld', 'multiplyOpacity')), ('__group__', ('labeling',)))),
+    )),
+    ('src/core/symbology/qgsrulebasedrenderer.h', (
+        ('QgsRuleBasedRenderer.RenderJob', (('__attribute_docs__', (('ftr', 'Feature to render'), ('symbol', 'Symbol to render feature with (not owned by this object).'))), ('__annotations__', (('ftr', 'QgsRuleBasedRenderer.FeatureToRender'), ('symbol', 'QgsSymbol'))), ('__group__', ('symbology',)))),
+        ('QgsRuleBasedRenderer.RenderLevel', (('__attribute_docs__', (('jobs', 'List of jobs to render, owned by this object.'),)), ('__annotations__', (('jobs', 'List[QgsRuleBasedRenderer.RenderJob]'),)), ('__group__', ('symbology',)))),
+        ('QgsRuleBasedRenderer', ('create', 'createFromSld', 'refineRuleCategories', 'refineRuleRanges', 'refineRuleScales', 'convertFromRenderer', 'convertToDataDefinedSymbology', ('__overridden_methods__', ('symbolForFeature', 'flags', 'renderFeature', 'startRender', 'canSkipRender', 'stopRender', 'filter', 'usedAttributes', 'filterNeedsGeometry', 'clone', 'toSld', 'symbols', 'save', 'legendSymbolItemsCheckable', 'legendSymbolItemChecked', 'checkLegendSymbolItem', 'legendKeyToExpression', 'setLegendSymbolItem', 'legendSymbolItems', 'dump', 'willRenderFeature', 'symbolsForFeature', 'originalSymbolsForFeature', 'legendKeysForFeature', 'capabilities', 'accept')), ('__group__', ('symbology',)))),
+        ('QgsRuleBasedRenderer.Rule', ('createFromSld', 'create', ('__group__', ('symbology',)))),
+        ('QgsRuleBasedRenderer.FeatureToRender', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/qgsrunprocess.h', (
+        ('QgsRunProcess', ('create', 'splitCommand')),
+    )),
+    ('src/core/qgsruntimeprofiler.h', (
+        ('QgsRuntimeProfiler', ('translateGroupName', ('__overridden_methods__', ('rowCount', 'columnCount', 'index', 'parent', 'data', 'headerData')))),
+    )),
+    ('src/core/scalebar/qgsscalebarrenderer.h', (
+        ('QgsScaleBarRenderer', (('__virtual_methods__', ('flags', 'sortKey', 'draw', 'calculateBoxSize', 'applyDefaultSettings')), ('__abstract_methods__', ('id', 'visibleName', 'clone', 'draw')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/scalebar/qgsscalebarrendererregistry.h', (
+        ('QgsScaleBarRendererRegistry', (('__group__', ('scalebar',)),)),
+    )),
+    ('src/core/scalebar/qgsscalebarsettings.h', (
+        ('QgsScaleBarSettings', (('__group__', ('scalebar',)),)),
+    )),
+    ('src/core/qgsscaleutils.h', (
+        ('QgsScaleUtils', ('saveScaleList', 'loadScaleList', 'equalToOrGreaterThanMinimumScale', 'lessThanMaximumScale')),
+    )),
+    ('src/core/numericformats/qgsscientificnumericformat.h', (
+        ('QgsScientificNumericFormat', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'formatDouble', 'clone', 'create', 'configuration', 'setNumberDecimalPlaces')), ('__group__', ('numericformats',)))),
+    )),
+    ('src/core/sensor/qgssensormanager.h', (
+        ('QgsSensorManager', (('__attribute_docs__', (('sensorAdded', 'Emitted when a sensor has been registered.\n'), ('sensorAboutToBeRemoved', 'Emitted when a sensor is about to be removed.\n'), ('sensorRemoved', 'Emitted when a sensor has been removed.\n'), ('sensorNameChanged', 'Emitted when a sensor name has changed.\n'), ('sensorStatusChanged', 'Emitted when a sensor status has changed.\n'), ('sensorDataCaptured', 'Emitted when newly captured data from a sensor has occurred.\n'), ('sensorErrorOccurred', 'Emitted when a sensor error has occurred.\n'))), ('__signal_arguments__', (('sensorAdded', ('id: str',)), ('sensorAboutToBeRemoved', ('id: str',)), ('sensorRemoved', ('id: str',)), ('sensorNameChanged', ('id: str',)), ('sensorStatusChanged', ('id: str',)), ('sensorDataCaptured', ('id: str',)), ('sensorErrorOccurred', ('id: str',)))), ('__group__', ('sensor',)))),
+    )),
+    ('src/core/sensor/qgssensormodel.h', (
+        ('QgsSensorModel', (('__overridden_methods__', ('data', 'setData', 'flags', 'headerData', 'index', 'parent', 'rowCount', 'columnCount')), ('__group__', ('sensor',)))),
+    )),
+    ('src/core/sensor/qgssensorregistry.h', (
+        ('QgsSensorRegistry', (('__attribute_docs__', (('sensorAdded', 'Emitted whenever a new sensor type is added to the registry, with the\nspecified ``type`` and visible ``name``.\n'),)), ('__signal_arguments__', (('sensorAdded', ('type: str', 'name: str')),)), ('__group__', ('sensor',)))),
+        ('QgsSensorAbstractMetadata', (('__abstract_methods__', ('createSensor',)), ('__group__', ('sensor',)))),
+    )),
+    ('src/core/providers/sensorthings/qgssensorthingsutils.h', (
+        ('QgsSensorThingsUtils', ('stringToEntity', 'displayString', 'entitySetStringToEntity', 'entityToSetString', 'propertiesForEntityType', 'fieldsForEntityType', 'fieldsForExpandedEntityType', 'geometryFieldForEntityType', 'entityTypeHasGeometry', 'geometryTypeForEntity', 'filterForWkbType', 'filterForExtent', 'combineFilters', 'availableGeometryTypes', 'expandableTargets', 'relationshipCardinality', 'asQueryString', ('__group__', ('providers', 'sensorthings')))),
+        ('QgsSensorThingsExpansionDefinition', ('defaultDefinitionForEntity', 'fromString', ('__group__', ('providers', 'sensorthings')))),
+    )),
+    ('src/core/settings/qgssettings.h', (
+        ('QgsSettings', ('globalSettingsPath', 'setGlobalSettingsPath', ('__group__', ('settings',)))),
+    )),
+    ('src/core/settings/qgssettingsentry.h', (
+        ('QgsSettingsEntryBase', ('dynamicKeyPartToList', ('__virtual_methods__', ('typeId', 'settingsType', 'checkValueVariant')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryBaseTemplate', (('__virtual_methods__', ('setValuePrivate', 'convertToVariant', 'checkValuePrivate')), ('__abstract_methods__', ('settingsType', 'convertFromVariant')), ('__overridden_methods__', ('settingsType', 'checkValueVariant')), ('__group__', ('settings',)))),
+    )),
+    ('src/core/settings/qgssettingsentrygroup.h', (
+        ('QgsSettingsEntryGroup', (('__group__', ('settings',)),)),
+    )),
+    ('src/core/settings/qgssettingsentryimpl.h', (
+        ('QgsSettingsEntryVariant', (('__overridden_methods__', ('settingsType', 'convertFromVariant')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryString', (('__overridden_methods__', ('settingsType', 'convertFromVariant', 'checkValuePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryStringList', (('__overridden_methods__', ('settingsType', 'convertFromVariant')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryBool', (('__overridden_methods__', ('settingsType', 'convertFromVariant')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryInteger', (('__overridden_methods__', ('settingsType', 'convertFromVariant', 'checkValuePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryDouble', (('__overridden_methods__', ('settingsType', 'convertFromVariant', 'checkValuePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryColor', (('__overridden_methods__', ('settingsType', 'convertFromVariant', 'checkValuePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsEntryVariantMap', (('__overridden_methods__', ('settingsType', 'convertFromVariant')), ('__group__', ('settings',)))),
+    )),
+    ('src/core/settings/qgssettingsregistry.h', (
+        ('QgsSettingsRegistry', (('__group__', ('settings',)),)),
+    )),
+    ('src/core/settings/qgssettingsregistrycore.h', (
+        ('QgsSettingsRegistryCore', (('__group__', ('settings',)),)),
+    )),
+    ('src/core/settings/qgssettingstree.h', (
+        ('QgsSettingsTree', ('treeRoot', 'createPluginTreeNode', 'unregisterPluginTreeNode', ('__group__', ('settings',)))),
+    )),
+    ('src/core/settings/qgssettingstreenode.h', (
+        ('QgsSettingsTreeNode', (('__group__', ('settings',)),)),
+        ('QgsSettingsTreeNamedListNode', (('__group__', ('settings',)),)),
+    )),
+    ('src/core/effects/qgsshadoweffect.h', (
+        ('QgsDropShadowEffect', ('create', ('__overridden_methods__', ('type', 'clone', 'exteriorShadow')), ('__group__', ('effects',)))),
+        ('QgsInnerShadowEffect', ('create', ('__overridden_methods__', ('type', 'clone', 'exteriorShadow')), ('__group__', ('effects',)))),
+        ('QgsShadowEffect', (('__abstract_methods__', ('exteriorShadow',)), ('__overridden_methods__', ('flags', 'properties', 'readProperties', 'boundingRect', 'draw')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/qgssimplifymethod.h', (
+        ('QgsSimplifyMethod', ('createGeometrySimplifier',)),
+    )),
+    ('src/core/raster/qgssinglebandcolordatarenderer.h', (
+        ('QgsSingleBandColorDataRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'setInput', 'inputBand', 'setInputBand', 'block', 'writeXml', 'usesBands')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgssinglebandgrayrenderer.h', (
+        ('QgsSingleBandGrayRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'block', 'inputBand', 'setInputBand', 'writeXml', 'legendSymbologyItems', 'createLegendNodes', 'usesBands', 'toSld')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/raster/qgssinglebandpseudocolorrenderer.h', (
+        ('QgsSingleBandPseudoColorRenderer', ('create', ('__overridden_methods__', ('clone', 'flags', 'block', 'canCreateRasterAttributeTable', 'writeXml', 'legendSymbologyItems', 'createLegendNodes', 'usesBands', 'toSld', 'accept', 'inputBand', 'setInputBand')), ('__group__', ('raster',)))),
+    )),
+    ('src/core/scalebar/qgssingleboxscalebarrenderer.h', (
+        ('QgsSingleBoxScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'flags', 'clone', 'draw', 'applyDefaultSettings')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/qgssingleitemmodel.h', (
+        ('QgsSingleItemModel', (('__overridden_methods__', ('data', 'flags', 'index', 'parent', 'rowCount', 'columnCount')),)),
+    )),
+    ('src/core/symbology/qgssinglesymbolrenderer.h', (
+        ('QgsSingleSymbolRenderer', ('createFromSld', 'create', 'convertFromRenderer', ('__overridden_methods__', ('flags', 'symbolForFeature', 'originalSymbolForFeature', 'startRender', 'stopRender', 'usedAttributes', 'accept', 'dump', 'clone', 'toSld', 'capabilities', 'symbols', 'save', 'legendSymbolItems', 'legendKeysForFeature', 'legendKeyToExpression', 'setLegendSymbolItem')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgssiputils.h', (
+        ('QgsSipUtils', ('isPyOwned',)),
+    )),
+    ('src/core/qgssnappingconfig.h', (
+        ('QgsSnappingConfig', ('snappingTypeToString', 'snappingTypeFlagToString', 'snappingTypeToIcon', 'snappingTypeFlagToIcon')),
+    )),
+    ('src/core/qgssnappingutils.h', (
+        ('QgsSnappingUtils', (('__attribute_docs__', (('configChanged', 'Emitted when the snapping settings object changes.\n'),)), ('__virtual_methods__', ('prepareIndexStarting', 'prepareIndexProgress')), ('__signal_arguments__', (('configChanged', ('snappingConfig: QgsSnappingConfig',)),)))),
+    )),
+    ('src/core/qgssourcecache.h', (
+        ('QgsSourceCache', (('__attribute_docs__', (('remoteSourceFetched', 'Emitted when the cache has finished retrieving a 3D model from a remote\n``url``.\n'),)), ('__signal_arguments__', (('remoteSourceFetched', ('url: str',)),)))),
+    )),
+    ('src/core/qgsspatialindex.h', (
+        ('QgsSpatialIndex', (('__overridden_methods__', ('addFeature', 'addFeatures')),)),
+    )),
+    ('src/core/qgsspatialindexkdbushdata.h', (
+        ('QgsSpatialIndexKDBushData', (('__attribute_docs__', (('id', 'Feature ID'),)), ('__annotations__', (('id', 'QgsFeatureId'),)))),
+    )),
+    ('src/core/geometry/qgssphere.h', (
+        ('QgsSphere', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/qgssqliteutils.h', (
+        ('QgsSqliteUtils', ('quotedString', 'quotedIdentifier', 'quotedValue', 'systemTables')),
+    )),
+    ('src/core/qgssqlstatement.h', (
+        ('QgsSQLStatement', ('quotedIdentifier', 'quotedIdentifierIfNeeded', 'stripQuotedIdentifier', 'stripMsQuotedIdentifier', 'quotedString')),
+        ('QgsSQLStatement.NodeList', (('__virtual_methods__', ('dump',)),)),
+        ('QgsSQLStatement.Node', (('__abstract_methods__', ('nodeType', 'dump', 'clone', 'accept')),)),
+        ('QgsSQLStatement.Visitor', (('__abstract_methods__', ('visit',)),)),
+        ('QgsSQLStatement.NodeUnaryOperator', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeBinaryOperator', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeInOperator', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeBetweenOperator', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeFunction', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeLiteral', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeColumnRef', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeSelectedColumn', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeCast', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeTableDef', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeJoin', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeColumnSorted', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.NodeSelect', (('__overridden_methods__', ('nodeType', 'dump', 'accept', 'clone')),)),
+        ('QgsSQLStatement.RecursiveVisitor', (('__overridden_methods__', ('visit',)),)),
+    )),
+    ('src/core/stac/qgsstacasset.h', (
+        ('QgsStacAsset', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/stac/qgsstaccatalog.h', (
+        ('QgsStacCatalog', (('__overridden_methods__', ('type', 'toHtml')), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstaccollection.h', (
+        ('QgsStacCollection', (('__overridden_methods__', ('type', 'toHtml')), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstaccollectionlist.h', (
+        ('QgsStacCollectionList', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/stac/qgsstacconnection.h', (
+        ('QgsStacConnection', ('encodedUri', 'decodedUri', 'connectionList', 'connection', 'deleteConnection', 'addConnection', 'selectedConnection', 'setSelectedConnection', ('__overridden_methods__', ('store', 'remove')), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstaccontroller.h', (
+        ('QgsStacController', (('__attribute_docs__', (('finishedStacObjectRequest', 'This signal is fired when an async request initiated with\nfetchStacObjectAsync is finished. The parsed STAC object can be\nretrieved using takeStacObject\n\n:param id: The requestId attribute of the finished request\n:param errorMessage: Reason the request or parsing of the STAC object\n                     may have failed\n\n.. seealso:: :py:func:`fetchStacObjectAsync`\n\n.. seealso:: :py:func:`takeStacObject`\n'), ('finishedItemCollectionRequest', 'This signal is fired when an async request initiated with\nfetchItemCollectionAsync is finished. The parsed STAC item collection\ncan be retrieved using takeItemCollection\n\n:param id: The requestId attribute of the finished request\n:param errorMessage: Reason the request or parsing of the STAC item\n                     collection may have failed\n\n.. seealso:: :py:func:`fetchItemCollectionAsync`\n\n.. seealso:: :py:func:`takeItemCollection`\n'), ('finishedCollectionsRequest', 'This signal is fired when an async request initiated with\nfetchCollectionsAsync is finished. The parsed STAC collections\ncollection can be retrieved using takeCollections\n\n:param id: The requestId attribute of the finished request\n:param errorMessage: Reason the request or parsing of the STAC\n                     collections may have failed\n\n.. seealso:: :py:func:`fetchCollectionsAsync`\n\n.. seealso:: :py:func:`takeCollections`\n\n.. versionadded:: 3.42\n'))), ('__signal_arguments__', (('finishedStacObjectRequest', ('id: int', 'errorMessage: str')), ('finishedItemCollectionRequest', ('id: int', 'errorMessage: str')), ('finishedCollectionsRequest', ('id: int', 'errorMessage: str')))), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstacextent.h', (
+        ('QgsStacExtent', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/stac/qgsstacitem.h', (
+        ('QgsStacItem', (('__overridden_methods__', ('type', 'toHtml')), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstacitemcollection.h', (
+        ('QgsStacItemCollection', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/diagram/qgsstackedbardiagram.h', (
+        ('QgsStackedBarDiagram', (('__overridden_methods__', ('clone', 'renderDiagram', 'diagramSize', 'legendSize', 'diagramName')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/diagram/qgsstackeddiagram.h', (
+        ('QgsStackedDiagram', (('__overridden_methods__', ('clone', 'renderDiagram', 'diagramSize', 'legendSize', 'diagramName')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/stac/qgsstaclink.h', (
+        ('QgsStacLink', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/stac/qgsstacobject.h', (
+        ('QgsStacObject', (('__abstract_methods__', ('type', 'toHtml')), ('__group__', ('stac',)))),
+    )),
+    ('src/core/stac/qgsstacparser.h', (
+        ('QgsStacParser', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/stac/qgsstacprovider.h', (
+        ('QgsStacProvider', (('__group__', ('stac',)),)),
+    )),
+    ('src/core/qgsstatisticalsummary.h', (
+        ('QgsStatisticalSummary', ('displayName', 'shortName')),
+    )),
+    ('src/core/scalebar/qgssteppedlinescalebarrenderer.h', (
+        ('QgsSteppedLineScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'flags', 'clone', 'draw')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/qgsstringstatisticalsummary.h', (
+        ('QgsStringStatisticalSummary', ('displayName',)),
+    )),
+    ('src/core/qgsstringutils.h', (
+        ('QgsStringReplacement', ('fromProperties',)),
+        ('QgsStringUtils', ('capitalize', 'ampersandEncode', 'levenshteinDistance', 'longestCommonSubstring', 'hammingDistance', 'soundex', 'fuzzyScore', 'insertLinks', 'isUrl', 'wordWrap', 'substituteVerticalCharacters', 'htmlToMarkdown', 'qRegExpEscape', 'truncateMiddleOfString', 'containsByWord')),
+    )),
+    ('src/core/symbology/qgsstyle.h', (
+        ('QgsStyle', (('__attribute_docs__', (('initialized', 'Emitted when the style database has been fully initialized.\n\nThis signals is only emitted by the :py:func:`QgsStyle.defaultStyle()`\ninstance, and only when the :py:func:`~QgsStyle.defaultStyle` has been\nlazily initialized.\n\n.. versionadded:: 3.36\n'), ('aboutToBeDestroyed', 'Emitted just before the style object is destroyed.\n\nEmitted in the destructor when the style is about to be deleted, but it\nis still in a perfectly valid state: the last chance for other pieces of\ncode for some cleanup if they use the style.\n\n.. versionadded:: 3.26\n'), ('symbolSaved', 'Emitted every time a new symbol has been added to the database. Emitted\nwhenever a symbol has been added to the style and the database has been\nupdated as a result.\n\n.. seealso:: :py:func:`symbolRemoved`\n\n.. seealso:: :py:func:`rampAdded`\n\n.. seealso:: :py:func:`symbolChanged`\n'), ('symbolChanged', "Emitted whenever a symbol's definition is changed. This does not include\nname or tag changes.\n\n.. seealso:: :py:func:`symbolSaved`\n\n.. versionadded:: 3.4\n"), ('groupsModified', 'Emitted every time a tag or smartgroup has been added, removed, or\nrenamed\n'), ('entityTagsChanged', "Emitted whenever an ``entity``'s tags are changed.\n\n.. versionadded:: 3.4\n"), ('favoritedChanged', 'Emitted whenever an ``entity`` is either favorited or un-favorited.\n\n.. versionadded:: 3.4\n'), ('entityAdded', 'Emitted every time a new entity has been added to the database.\n\n.. versionadded:: 3.14\n'), ('entityRemoved', 'Emitted whenever an entity of the specified type is removed from the\nstyle and the database has been updated as a result.\n\n.. versionadded:: 3.14\n'), ('entityRenamed', 'Emitted whenever a entity of the specified type has been renamed from\n``oldName`` to ``newName``\n\n.. versionadded:: 3.14\n'), ('entityChanged', "Emitted whenever an entity's definition is changed. This does not\ninclude name or tag changes.\n\n.. versionadded:: 3.14\n"), ('symbolRemoved', 'Emitted whenever a symbol has been removed from the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`symbolSaved`\n\n.. seealso:: :py:func:`rampRemoved`\n\n.. versionadded:: 3.4\n'), ('symbolRenamed', 'Emitted whenever a symbol has been renamed from ``oldName`` to\n``newName``\n\n.. seealso:: :py:func:`rampRenamed`\n\n.. versionadded:: 3.4\n'), ('rampRenamed', 'Emitted whenever a color ramp has been renamed from ``oldName`` to\n``newName``\n\n.. seealso:: :py:func:`symbolRenamed`\n\n.. versionadded:: 3.4\n'), ('rampAdded', 'Emitted whenever a color ramp has been added to the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`rampRemoved`\n\n.. seealso:: :py:func:`symbolSaved`\n\n.. versionadded:: 3.4\n'), ('rampRemoved', 'Emitted whenever a color ramp has been removed from the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`rampAdded`\n\n.. seealso:: :py:func:`symbolRemoved`\n\n.. versionadded:: 3.4\n'), ('rampChanged', "Emitted whenever a color ramp's definition is changed. This does not\ninclude name or tag changes.\n\n.. seealso:: :py:func:`rampAdded`\n\n.. versionadded:: 3.4\n"), ('textFormatRenamed', 'Emitted whenever a text format has been renamed from ``oldName`` to\n``newName``\n\n.. seealso:: :py:func:`symbolRenamed`\n\n.. versionadded:: 3.10\n'), ('textFormatAdded', 'Emitted whenever a text format has been added to the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`textFormatRemoved`\n\n.. seealso:: :py:func:`symbolSaved`\n\n.. versionadded:: 3.10\n'), ('textFormatRemoved', 'Emitted whenever a text format has been removed from the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`textFormatAdded`\n\n.. seealso:: :py:func:`symbolRemoved`\n\n.. versionadded:: 3.10\n'), ('textFormatChanged', "Emitted whenever a text format's definition is changed. This does not\ninclude name or tag changes.\n\n.. seealso:: :py:func:`textFormatAdded`\n\n.. versionadded:: 3.10\n"), ('labelSettingsRenamed', 'Emitted whenever label settings have been renamed from ``oldName`` to\n``newName``\n\n.. seealso:: :py:func:`symbolRenamed`\n\n.. versionadded:: 3.10\n'), ('labelSettingsAdded', 'Emitted whenever label settings have been added to the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`labelSettingsRemoved`\n\n.. seealso:: :py:func:`symbolSaved`\n\n.. versionadded:: 3.10\n'), ('labelSettingsRemoved', 'Emitted whenever label settings have been removed from the style and the\ndatabase has been updated as a result.\n\n.. seealso:: :py:func:`labelSettingsAdded`\n\n.. seealso:: :py:func:`symbolRemoved`\n\n.. versionadded:: 3.10\n'), ('labelSettingsChanged', "Emitted whenever a label setting's definition is changed. This does not\ninclude name or tag changes.\n\n.. seealso:: :py:func:`labelSettingsAdded`\n\n.. versionadded:: 3.10\n"), ('rebuildIconPreviews', 'Emitted whenever icon previews for entities in the style must be\nrebuilt.\n\n.. versionadded:: 3.26\n'))), 'defaultStyle', 'defaultTextFormatForProject', 'isXmlStyleFile', ('__signal_arguments__', (('symbolSaved', ('name: str', 'symbol: QgsSymbol')), ('symbolChanged', ('name: str',)), ('entityTagsChanged', ('entity: QgsStyle.StyleEntity', 'name: str', 'newTags: List[str]')), ('favoritedChanged', ('entity: QgsStyle.StyleEntity', 'name: str', 'isFavorite: bool')), ('entityAdded', ('entity: QgsStyle.StyleEntity', 'name: str')), ('entityRemoved', ('entity: QgsStyle.StyleEntity', 'name: str')), ('entityRenamed', ('entity: QgsStyle.StyleEntity', 'oldName: str', 'newName: str')), ('entityChanged', ('entity: QgsStyle.StyleEntity', 'name: str')), ('symbolRemoved', ('name: str',)), ('symbolRenamed', ('oldName: str', 'newName: str')), ('rampRenamed', ('oldName: str', 'newName: str')), ('rampAdded', ('name: str',)), ('rampRemoved', ('name: str',)), ('rampChanged', ('name: str',)), ('textFormatRenamed', ('oldName: str', 'newName: str')), ('textFormatAdded', ('name: str',)), ('textFormatRemoved', ('name: str',)), ('textFormatChanged', ('name: str',)), ('labelSettingsRenamed', ('oldName: str', 'newName: str')), ('labelSettingsAdded', ('name: str',)), ('labelSettingsRemoved', ('name: str',)), ('labelSettingsChanged', ('name: str',)))), ('__group__', ('symbology',)))),
+        ('QgsStyleEntityInterface', (('__abstract_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleSymbolEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleColorRampEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleTextFormatEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleLabelSettingsEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleLegendPatchShapeEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+        ('QgsStyleSymbol3DEntity', (('__overridden_methods__', ('type',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgsstyleentityvisitor.h', (
+        ('QgsStyleEntityVisitorInterface', (('__virtual_methods__', ('visit', 'visitEnter', 'visitExit')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgsstylemodel.h', (
+        ('QgsStyleModel', (('__overridden_methods__', ('data', 'setData', 'flags', 'headerData', 'index', 'parent', 'rowCount', 'columnCount')), ('__group__', ('symbology',)))),
+        ('QgsStyleProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/geometry/qgssurface.h', (
+        ('QgsSurface', (('__overridden_methods__', ('boundingBox3D', 'isValid', 'clearCache')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/annotations/qgssvgannotation.h', (
+        ('QgsSvgAnnotation', ('create', ('__overridden_methods__', ('clone', 'writeXml', 'readXml', 'renderAnnotation')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/symbology/qgssvgcache.h', (
+        ('QgsSvgCache', (('__attribute_docs__', (('statusChanged', 'Emit a signal to be caught by qgisapp and display a msg on status bar.\n\n.. deprecated:: 3.6\n\n   No longer emitted.\n'), ('remoteSvgFetched', 'Emitted when the cache has finished retrieving an SVG file from a remote\n``url``.\n\n.. versionadded:: 3.2\n'))), ('__overridden_methods__', ('checkReply',)), ('__signal_arguments__', (('remoteSvgFetched', ('url: str',)),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgssymbol.h', (
+        ('QgsSymbol', ('symbolTypeToString', 'symbolTypeForGeometryType', 'defaultSymbol', '_getPoint', '_getLineString', '_getPolygonRing', '_getPolygon', ('__abstract_methods__', ('clone',)), ('__group__', ('symbology',)))),
+        ('QgsSymbolAnimationSettings', (('__group__', ('symbology',)),)),
+        ('QgsSymbolBufferSettings', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/symbology/qgssymbollayer.h', (
+        ('QgsMarkerSymbolLayer', ('_rotatedOffset', ('__virtual_methods__', ('setSize', 'writeSldMarker')), ('__abstract_methods__', ('renderPoint', 'bounds')), ('__overridden_methods__', ('startRender', 'stopRender', 'drawPreviewIcon', 'toSld', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'dxfSize', 'dxfAngle')), ('__group__', ('symbology',)))),
+        ('QgsSymbolLayer', (('__virtual_methods__', ('flags', 'color', 'setColor', 'setStrokeColor', 'strokeColor', 'setFillColor', 'fillColor', 'startFeatureRender', 'stopFeatureRender', 'toSld', 'ogrFeatureStyle', 'subSymbol', 'setSubSymbol', 'isCompatibleWithSymbol', 'canCauseArtifactsBetweenAdjacentTiles', 'estimateMaxBleed', 'setOutputUnit', 'outputUnit', 'usesMapUnits', 'setMapUnitScale', 'mapUnitScale', 'usedAttributes', 'setDataDefinedProperty', 'writeDxf', 'dxfWidth', 'dxfSize', 'dxfOffset', 'dxfColor', 'dxfAngle', 'dxfCustomDashPattern', 'dxfPenStyle', 'dxfBrushColor', 'dxfBrushStyle', 'prepareExpressions', 'hasDataDefinedProperties', 'masks', 'prepareMasks')), ('__abstract_methods__', ('layerType', 'startRender', 'stopRender', 'clone', 'properties', 'drawPreviewIcon')), ('__group__', ('symbology',)))),
+        ('QgsLineSymbolLayer', (('__virtual_methods__', ('renderPolygonStroke', 'setWidth', 'width')), ('__abstract_methods__', ('renderPolyline',)), ('__overridden_methods__', ('setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'drawPreviewIcon', 'dxfWidth')), ('__group__', ('symbology',)))),
+        ('QgsFillSymbolLayer', (('__virtual_methods__', ('toTiledPatternImage',)), ('__abstract_methods__', ('renderPolygon',)), ('__overridden_methods__', ('drawPreviewIcon',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgssymbollayerreference.h', (
+        ('QgsSymbolLayerId', (('__group__', ('symbology',)),)),
+        ('QgsSymbolLayerReference', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/symbology/qgssymbollayerregistry.h', (
+        ('QgsSymbolLayerRegistry', ('defaultSymbolLayer', ('__group__', ('symbology',)))),
+        ('QgsSymbolLayerAbstractMetadata', (('__virtual_methods__', ('createSymbolLayerWidget', 'createSymbolLayerFromSld', 'resolvePaths', 'resolveFonts')), ('__abstract_methods__', ('createSymbolLayer',)), ('__group__', ('symbology',)))),
+        ('QgsSymbolLayerMetadata', (('__overridden_methods__', ('createSymbolLayer', 'createSymbolLayerWidget', 'createSymbolLayerFromSld', 'resolvePaths', 'resolveFonts')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgssymbollayerutils.h', (
+        ('QgsSymbolLayerUtils', ('encodeColor', 'decodeColor', 'encodeSldAlpha', 'decodeSldAlpha', 'encodeSldFontStyle', 'decodeSldFontStyle', 'encodeSldFontWeight', 'decodeSldFontWeight', 'encodePenStyle', 'decodePenStyle', 'encodePenJoinStyle', 'decodePenJoinStyle', 'encodePenCapStyle', 'decodePenCapStyle', 'encodeSldLineJoinStyle', 'decodeSldLineJoinStyle', 'encodeSldLineCapStyle', 'decodeSldLineCapStyle', 'encodeBrushStyle', 'decodeBrushStyle', 'encodeSldBrushStyle', 'decodeSldBrushStyle', 'penCapStyleToEndCapStyle', 'penJoinStyleToJoinStyle', 'hasSldSymbolizer', 'decodeCoordinateReference', 'encodeCoordinateReference', 'decodeArrowHeadType', 'decodeArrowType', 'decodeMarkerClipMode', 'encodeMarkerClipMode', 'decodeLineClipMode', 'encodeLineClipMode', 'encodePoint', 'decodePoint', 'toPoint', 'encodeSize', 'decodeSize', 'toSize', 'encodeMapUnitScale', 'decodeMapUnitScale', 'encodeRealVector', 'decodeRealVector', 'encodeSldRealVector', 'decodeSldRealVector', 'encodeSldUom', 'decodeSldUom', 'sizeInPixelsFromSldUom', 'encodeScaleMethod', 'decodeScaleMethod', 'decodeBlendMode', 'symbolPreviewIcon', 'symbolPreviewPixmap', 'symbolLayerPreviewPicture', 'symbolLayerPreviewIcon', 'colorRampPreviewIcon', 'colorRampPreviewPixmap', 'drawStippledBackground', 'drawVertexMarker', 'estimateMaxSymbolBleed', 'loadSymbol', 'loadSymbolLayer', 'saveSymbol', 'symbolProperties', 'createSymbolLayerListFromSld', 'createFillLayerFromSld', 'createLineLayerFromSld', 'createMarkerLayerFromSld', 'convertPolygonSymbolizerToPointMarker', 'hasExternalGraphic', 'hasExternalGraphicV2', 'hasWellKnownMark', 'needFontMarker', 'needSvgMarker', 'needRasterMarker', 'needEllipseMarker', 'needMarkerLine', 'needLinePatternFill', 'needPointPatternFill', 'needSvgFill', 'needRasterImageFill', 'fillToSld', 'fillFromSld', 'lineFromSld', 'externalGraphicToSld', 'externalGraphicFromSld', 'wellKnownMarkerToSld', 'wellKnownMarkerFromSld2', 'externalMarkerToSld', 'externalMarkerFromSld', 'labelTextToSld', 'ogrFeatureStylePen', 'ogrFeatureStyleBrush', 'createRotationElement', 'rotationFromSldElement', 'createOpacityElement', 'opacityFromSldElement', 'createDisplacementElement', 'displacementFromSldElement', 'createAnchorPointElement', 'createOnlineResourceElement', 'onlineResourceFromSldElement', 'createGeometryElement', 'geometryFromSldElement', 'createExpressionElement', 'createFunctionElement', 'functionFromSldElement', 'createSvgParameterElement', 'getSvgParameterList', 'createVendorOptionElement', 'getVendorOptionList', 'parseProperties', 'saveProperties', 'loadSymbols', 'saveSymbols', 'clearSymbolMap', 'symbolToMimeData', 'symbolFromMimeData', 'loadColorRamp', 'saveColorRamp', 'colorRampToVariant', 'colorToName', 'parseColorList', 'colorToMimeData', 'colorFromMimeData', 'colorListFromMimeData', 'colorListToMimeData', 'saveColorsToGpl', 'importColorsFromGpl', 'parseColor', 'parseColorWithAlpha', 'multiplyImageOpacity', 'blurImageInPlace', 'premultiplyColor', 'condenseFillAndOutline', 'sortVariantList', 'pointOnLineWithDistance', 'listSvgFiles', 'listSvgFilesAt', 'svgSymbolNameToPath', 'svgSymbolPathToName', 'toQPolygonF', 'polygonCentroid', 'polygonPointOnSurface', 'pointInPolygon', 'polylineLength', 'polylineSubstring', 'isSharpCorner', 'appendPolyline', 'fieldOrExpressionToExpression', 'fieldOrExpressionFromExpression', 'prettyBreaks', 'rescaleUom', 'applyScaleDependency', 'mergeScaleDependencies', 'parametricSvgToSld', 'getSvgParametricPath', 'toSymbolLayerPointers', 'rendererFrameRate', 'restrictedSizeSymbol', 'evaluatePropertiesMap', 'tileSize', 'clearSymbolLayerIds', 'resetSymbolLayerIds', 'clearSymbolLayerMasks', 'collectSymbolLayerClipGeometries', ('__group__', ('symbology',)))),
+    )),
+    ('src/core/symbology/qgssymbolrendercontext.h', (
+        ('QgsSymbolRenderContext', (('__group__', ('symbology',)),)),
+    )),
+    ('src/core/qgstaskmanager.h', (
+        ('QgsTask', (('__attribute_docs__', (('progressChanged', 'Will be emitted by task when its progress changes.\n\n:param progress: percent of progress, from 0.0 - 100.0\n\n.. note::\n\n   derived classes should not emit this signal directly, instead they should call\n   :py:func:`~QgsTask.setProgress`\n'), ('statusChanged', 'Will be emitted by task when its status changes.\n\n:param status: new task status\n\n.. note::\n\n   derived classes should not emit this signal directly, it will automatically\n   be emitted\n'), ('begun', 'Will be emitted by task to indicate its commencement.\n\n.. note::\n\n   derived classes should not emit this signal directly, it will automatically\n   be emitted when the task begins\n'), ('taskCompleted', 'Will be emitted by task to indicate its successful completion.\n\n.. note::\n\n   derived classes should not emit this signal directly, it will automatically\n   be emitted\n'), ('taskTerminated', 'Will be emitted by task if it has terminated for any reason other then\ncompletion (e.g., when a task has been canceled or encountered an\ninternal error).\n\n.. note::\n\n   derived classes should not emit this signal directly, it will automatically\n   be emitted\n'))), ('__virtual_methods__', ('cancel', 'finished')), ('__abstract_methods__', ('run',)), ('__signal_arguments__', (('progressChanged', ('progress: float',)), ('statusChanged', ('status: int',)))))),
+        ('QgsTaskManager.TaskDefinition', (('__attribute_docs__', (('task', 'Task'), ('dependentTasks', 'List of dependent tasks which must be completed before task can run. If any dependent tasks are\ncanceled this task will also be canceled. Dependent tasks must also be added\nto the task manager for proper handling of dependencies.'))), ('__annotations__', (('task', 'QgsTask'), ('dependentTasks', 'QgsTaskList'))))),
+        ('QgsTaskManager', (('__attribute_docs__', (('progressChanged', 'Will be emitted when a task reports a progress change\n\n:param taskId: ID of task\n:param progress: percent of progress, from 0.0 - 100.0\n'), ('finalTaskProgressChanged', 'Will be emitted when only a single task remains to complete and that\ntask has reported a progress change\n\n:param progress: percent of progress, from 0.0 - 100.0\n'), ('statusChanged', 'Will be emitted when a task reports a status change\n\n:param taskId: ID of task\n:param status: new task status\n'), ('taskAdded', 'Emitted when a new task has been added to the manager\n\n:param taskId: ID of task\n'), ('taskAboutToBeDeleted', 'Emitted when a task is about to be deleted\n\n:param taskId: ID of task\n'), ('allTasksFinished', 'Emitted when all tasks are complete\n\n.. seealso:: :py:func:`countActiveTasksChanged`\n'), ('countActiveTasksChanged', 'Emitted when the number of active tasks changes\n\n.. seealso:: :py:func:`countActiveTasks`\n'), ('taskTriggered', 'Emitted when a ``task`` is triggered. This occurs when a user clicks on\nthe task from the QGIS GUI, and can be used to show detailed progress\nreports or re-open a related dialog.\n\n.. seealso:: :py:func:`triggerTask`\n'))), ('__signal_arguments__', (('progressChanged', ('taskId: int', 'progress: float')), ('finalTaskProgressChanged', ('progress: float',)), ('statusChanged', ('taskId: int', 'status: int')), ('taskAdded', ('taskId: int',)), ('taskAboutToBeDeleted', ('taskId: int',)), ('countActiveTasksChanged', ('count: int',)), ('taskTriggered', ('task: QgsTask',)))))),
+        ('QgsTaskWithSerialSubTasks', (('__overridden_methods__', ('cancel', 'run')),)),
+    )),
+    ('src/core/qgstemporalcontroller.h', (
+        ('QgsTemporalController', (('__attribute_docs__', (('updateTemporalRange', 'Signals that a temporal ``range`` has changed and needs to be updated in\nall connected objects.\n'),)), ('__signal_arguments__', (('updateTemporalRange', ('range: QgsDateTimeRange',)),)))),
+    )),
+    ('src/core/qgstemporalnavigationobject.h', (
+        ('QgsTemporalNavigationObject', (('__attribute_docs__', (('stateChanged', 'Emitted whenever the animation ``state`` changes.\n'), ('navigationModeChanged', 'Emitted whenever the navigation ``mode`` changes.\n'), ('temporalExtentsChanged', 'Emitted whenever the temporalExtent ``extent`` changes.\n'), ('temporalFrameDurationChanged', 'Emitted whenever the frameDuration ``interval`` of the controller\nchanges.\n'), ('totalMovieFramesChanged', 'Emitted whenever the total number of ``frames`` in the movie is changed.\n\n.. note::\n\n   This is only used when the :py:func:`~QgsTemporalNavigationObject.navigationMode` is set to :py:class:`Qgis`.TemporalNavigationMode.Movie.\n\n.. seealso:: :py:func:`setTotalMovieFrames`\n\n.. seealso:: :py:func:`totalMovieFrames`\n\n.. versionadded:: 3.36\n'))), ('__overridden_methods__', ('createExpressionContextScope',)), ('__signal_arguments__', (('stateChanged', ('state: Qgis.AnimationState',)), ('navigationModeChanged', ('mode: Qgis.TemporalNavigationMode',)), ('temporalExtentsChanged', ('extent: QgsDateTimeRange',)), ('temporalFrameDurationChanged', ('interval: QgsInterval',)), ('totalMovieFramesChanged', ('frames: int',)))))),
+    )),
+    ('src/core/qgstemporalproperty.h', (
+        ('QgsTemporalProperty', (('__attribute_docs__', (('changed', 'Emitted when the temporal properties have changed.\n'),)), ('__virtual_methods__', ('flags',)))),
+    )),
+    ('src/core/qgstemporalutils.h', (
+        ('QgsTemporalUtils', ('calculateTemporalRangeForProject', 'usedTemporalRangesForProject', 'exportAnimation', 'calculateFrameTime', 'calculateDateTimesUsingDuration', 'calculateDateTimesFromISO8601')),
+    )),
+    ('src/core/elevation/qgsterrainprovider.h', (
+        ('QgsAbstractTerrainProvider', (('__virtual_methods__', ('resolveReferences',)), ('__abstract_methods__', ('equals', 'readXml', 'writeXml', 'type', 'clone', 'prepare', 'crs', 'heightAt')), ('__group__', ('elevation',)))),
+        ('QgsFlatTerrainProvider', (('__overridden_methods__', ('type', 'readXml', 'writeXml', 'crs', 'heightAt', 'clone', 'prepare', 'equals')), ('__group__', ('elevation',)))),
+        ('QgsRasterDemTerrainProvider', (('__overridden_methods__', ('type', 'resolveReferences', 'readXml', 'writeXml', 'crs', 'heightAt', 'clone', 'equals', 'prepare')), ('__group__', ('elevation',)))),
+        ('QgsMeshTerrainProvider', (('__overridden_methods__', ('type', 'resolveReferences', 'readXml', 'writeXml', 'crs', 'heightAt', 'clone', 'equals', 'prepare')), ('__group__', ('elevation',)))),
+    )),
+    ('src/core/qgstestutils.h', (
+        ('QgsTestUtils', ('testProviderIteratorThreadSafety', 'compareDomElements')),
+    )),
+    ('src/core/annotations/qgstextannotation.h', (
+        ('QgsTextAnnotation', ('create', ('__overridden_methods__', ('clone', 'writeXml', 'readXml', 'renderAnnotation')), ('__group__', ('annotations',)))),
+    )),
+    ('src/core/textrenderer/qgstextbackgroundsettings.h', (
+        ('QgsTextBackgroundSettings', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextblock.h', (
+        ('QgsTextBlock', ('fromPlainText', ('__group__', ('textrenderer',)))),
+    )),
+    ('src/core/textrenderer/qgstextblockformat.h', (
+        ('QgsTextBlockFormat', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextbuffersettings.h', (
+        ('QgsTextBufferSettings', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextcharacterformat.h', (
+        ('QgsTextCharacterFormat', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/diagram/qgstextdiagram.h', (
+        ('QgsTextDiagram', (('__overridden_methods__', ('clone', 'renderDiagram', 'diagramSize', 'legendSize', 'diagramName')), ('__group__', ('diagram',)))),
+    )),
+    ('src/core/textrenderer/qgstextdocument.h', (
+        ('QgsTextDocument', ('fromPlainText', 'fromHtml', 'fromTextAndFormat', ('__group__', ('textrenderer',)))),
+    )),
+    ('src/core/textrenderer/qgstextdocumentmetrics.h', (
+        ('QgsTextDocumentMetrics', ('calculateMetrics', ('__group__', ('textrenderer',)))),
+        ('QgsTextDocumentRenderContext', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextformat.h', (
+        ('QgsTextFormat', ('fromQFont', 'fromMimeData', 'textFormatPreviewPixmap', ('__group__', ('textrenderer',)))),
+        ('QgsTextFormat.Tab', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextfragment.h', (
+        ('QgsTextFragment', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextmasksettings.h', (
+        ('QgsTextMaskSettings', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/textrenderer/qgstextrendererutils.h', (
+        ('QgsTextRendererUtils', ('decodeShapeType', 'decodeBackgroundSizeType', 'decodeBackgroundRotationType', 'decodeShadowPlacementType', 'encodeTextOrientation', 'decodeTextOrientation', ('__group__', ('textrenderer',)))),
+    )),
+    ('src/core/textrenderer/qgstextshadowsettings.h', (
+        ('QgsTextShadowSettings', (('__group__', ('textrenderer',)),)),
+    )),
+    ('src/core/scalebar/qgsticksscalebarrenderer.h', (
+        ('QgsTicksScaleBarRenderer', (('__overridden_methods__', ('id', 'visibleName', 'sortKey', 'flags', 'clone', 'draw')), ('__group__', ('scalebar',)))),
+    )),
+    ('src/core/tiledscene/qgstiledsceneboundingvolume.h', (
+        ('QgsTiledSceneBoundingVolume', (('__group__', ('tiledscene',)),)),
+    )),
+    ('src/core/tiledscene/qgstiledscenedataprovider.h', (
+        ('QgsTiledSceneDataProvider', (('__virtual_methods__', ('capabilities', 'zRange')), ('__abstract_methods__', ('clone', 'index')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/tiledscene/qgstiledsceneindex.h', (
+        ('QgsTiledSceneIndex', (('__group__', ('tiledscene',)),)),
+    )),
+    ('src/core/tiledscene/qgstiledscenelayer.h', (
+        ('QgsTiledSceneLayer', (('__virtual_methods__', ('readStyle', 'writeStyle', 'loadDefaultStyle')), ('__overridden_methods__', ('clone', 'extent', 'dataProvider', 'readXml', 'writeXml', 'readSymbology', 'writeSymbology', 'setTransformContext', 'encodedSource', 'decodedSource', 'htmlMetadata', 'createMapRenderer', 'loadDefaultMetadata', 'elevationProperties', 'properties')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/tiledscene/qgstiledscenelayerelevationproperties.h', (
+        ('QgsTiledSceneLayerElevationProperties', (('__overridden_methods__', ('hasElevation', 'writeXml', 'readXml', 'clone', 'htmlSummary', 'calculateZRange', 'significantZValues')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/tiledscene/qgstiledscenerenderer.h', (
+        ('QgsTiledSceneRenderer', ('load', ('__virtual_methods__', ('flags', 'startRender', 'stopRender', 'createLegendNodes', 'legendRuleKeys')), ('__abstract_methods__', ('type', 'clone', 'save', 'renderTriangle', 'renderLine')), ('__group__', ('tiledscene',)))),
+        ('QgsTiledSceneRenderContext', (('__group__', ('tiledscene',)),)),
+    )),
+    ('src/core/tiledscene/qgstiledscenerendererregistry.h', (
+        ('QgsTiledSceneRendererRegistry', ('defaultRenderer', ('__group__', ('tiledscene',)))),
+        ('QgsTiledSceneRendererAbstractMetadata', (('__abstract_methods__', ('createRenderer',)), ('__group__', ('tiledscene',)))),
+        ('QgsTiledSceneRendererMetadata', (('__overridden_methods__', ('createRenderer',)), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/tiledscene/qgstiledscenerequest.h', (
+        ('QgsTiledSceneRequest', (('__group__', ('tiledscene',)),)),
+    )),
+    ('src/core/tiledscene/qgstiledscenetexturerenderer.h', (
+        ('QgsTiledSceneTextureRenderer', ('create', 'createDefaultFillSymbol', ('__overridden_methods__', ('type', 'clone', 'save', 'flags', 'renderTriangle', 'renderLine', 'startRender', 'stopRender')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/tiledscene/qgstiledscenetile.h', (
+        ('QgsTiledSceneTile', (('__group__', ('tiledscene',)),)),
+    )),
+    ('src/core/tiledscene/qgstiledscenewireframerenderer.h', (
+        ('QgsTiledSceneWireframeRenderer', ('create', 'createDefaultFillSymbol', 'createDefaultLineSymbol', ('__overridden_methods__', ('type', 'clone', 'save', 'renderTriangle', 'renderLine', 'startRender', 'stopRender', 'flags')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/core/qgstiles.h', (
+        ('QgsTileMatrix', ('fromWebMercator', 'fromCustomDef', 'fromTileMatrix')),
+        ('QgsTileMatrixSet', (('__virtual_methods__', ('readXml', 'writeXml')),)),
+    )),
+    ('src/core/qgstolerance.h', (
+        ('QgsTolerance', ('vertexSearchRadius', 'defaultTolerance', 'toleranceInProjectUnits', 'toleranceInMapUnits')),
+    )),
+    ('src/core/mesh/qgstopologicalmesh.h', (
+        ('QgsTopologicalMesh', ('createTopologicalMesh', 'counterClockwiseFaces', 'checkTopology', 'vertexPositionInFace', ('__group__', ('mesh',)))),
+        ('QgsTopologicalMesh.TopologicalFaces', (('__group__', ('mesh',)),)),
+        ('QgsTopologicalMesh.Changes', (('__group__', ('mesh',)),)),
+    )),
+    ('src/core/qgstracer.h', (
+        ('QgsTracer', (('__virtual_methods__', ('configure',)),)),
+    )),
+    ('src/core/qgstrackedvectorlayertools.h', (
+        ('QgsTrackedVectorLayerTools', (('__overridden_methods__', ('addFeatureV2', 'startEditing', 'stopEditing', 'saveEdits', 'copyMoveFeatures')),)),
+    )),
+    ('src/core/qgstransaction.h', (
+        ('QgsTransaction', (('__attribute_docs__', (('afterRollback', 'Emitted after a rollback\n'), ('afterRollbackToSavepoint', 'Emitted after a rollback to savepoint\n\n.. versionadded:: 3.42\n'), ('dirtied', 'Emitted if a sql query is executed and the underlying data is modified\n'))), 'create', 'supportsTransaction', ('__virtual_methods__', ('rollbackToSavepoint',)), ('__abstract_methods__', ('executeSql',)), ('__signal_arguments__', (('afterRollbackToSavepoint', ('savepointName: str',)), ('dirtied', ('sql: str', 'name: str')))))),
+    )),
+    ('src/core/qgstransactiongroup.h', (
+        ('QgsTransactionGroup', (('__attribute_docs__', (('commitError', 'Will be emitted whenever there is a commit error\n'),)), ('__signal_arguments__', (('commitError', ('msg: str',)),)))),
+    )),
+    ('src/core/effects/qgstransformeffect.h', (
+        ('QgsTransformEffect', ('create', ('__overridden_methods__', ('type', 'properties', 'readProperties', 'clone', 'draw', 'boundingRect')), ('__group__', ('effects',)))),
+    )),
+    ('src/core/geometry/qgstriangle.h', (
+        ('QgsTriangle', (('__overridden_methods__', ('operator==', 'operator!=', 'geometryType', 'clone', 'clear', 'fromWkb', 'fromWkt', 'asGml3', 'surfaceToPolygon', 'toCurveType', 'addInteriorRing', 'deleteVertex', 'insertVertex', 'moveVertex', 'setExteriorRing', 'boundary', 'vertexAt', 'createEmptyWithSameType')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/geometry/qgstriangulatedsurface.h', (
+        ('QgsTriangulatedSurface', (('__overridden_methods__', ('fuzzyEqual', 'fuzzyDistanceEqual', 'operator==', 'operator!=', 'geometryType', 'clone', 'clear', 'fromWkb', 'fromWkt', 'asGml2', 'asGml3', 'asKml', 'normalize', 'snappedToGrid', 'insertVertex', 'deleteVertex', 'addPatch', 'createEmptyWithSameType', 'compareToSameClass')), ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsunittypes.h', (
+        ('QgsUnitTypes', ('encodeUnitType', 'decodeUnitType', 'unitType', 'encodeUnit', 'decodeDistanceUnit', 'toString', 'toAbbreviatedString', 'stringToDistanceUnit', 'fromUnitToUnitFactor', 'decodeAreaUnit', 'stringToAreaUnit', 'distanceToAreaUnit', 'areaToDistanceUnit', 'decodeTemporalUnit', 'stringToTemporalUnit', 'decodeVolumeUnit', 'stringToVolumeUnit', 'distanceToVolumeUnit', 'volumeToDistanceUnit', 'decodeAngleUnit', 'formatAngle', 'scaledDistance', 'scaledArea', 'formatDistance', 'formatArea', 'decodeRenderUnit', 'decodeLayoutUnit')),
+    )),
+    ('src/core/qgsuserprofilemanager.h', (
+        ('QgsUserProfileManager', (('__attribute_docs__', (('profilesChanged', 'Emitted when the list of profiles is changed.\n\nThis signal will only be emitted when\n:py:func:`~QgsUserProfileManager.isNewProfileNotificationEnabled` is\n``True``. By default new profile notification is disabled.\n\n.. seealso:: :py:func:`isNewProfileNotificationEnabled`\n\n.. seealso:: :py:func:`setNewProfileNotificationEnabled`\n'),)), 'resolveProfilesFolder')),
+    )),
+    ('src/core/validity/qgsvaliditycheckcontext.h', (
+        ('QgsLayoutValidityCheckContext', (('__attribute_docs__', (('layout', 'Pointer to the layout which the check is being run against.'),)), ('__annotations__', (('layout', 'QgsLayout'),)), ('__overridden_methods__', ('type',)), ('__group__', ('validity',)))),
+        ('QgsValidityCheckContext', (('__abstract_methods__', ('type',)), ('__group__', ('validity',)))),
+    )),
+    ('src/core/validity/qgsvaliditycheckregistry.h', (
+        ('QgsValidityCheckRegistry', (('__group__', ('validity',)),)),
+    )),
+    ('src/core/fieldformatter/qgsvaluerelationfieldformatter.h', (
+        ('QgsValueRelationFieldFormatter.ValueRelationItem', (('__attribute_docs__', (('group', 'Value used to regroup items during sorting (since QGIS 3.38)'),)), ('__annotations__', (('group', 'object'),)), ('__group__', ('fieldformatter',)))),
+        ('QgsValueRelationFieldFormatter', ('valueToStringList', 'expressionRequiresFormScope', 'expressionFormAttributes', 'expressionFormVariables', 'expressionRequiresParentFormScope', 'expressionParentFormAttributes', 'expressionParentFormVariables', 'expressionIsUsable', 'resolveLayer', ('__overridden_methods__', ('id', 'representValue', 'sortValue', 'createCache', 'availableValues')), ('__group__', ('fieldformatter',)))),
+    )),
+    ('src/core/qgsvariantutils.h', (
+        ('QgsVariantUtils', ('typeToDisplayString', 'isNull', 'isNumericType')),
+    )),
+    ('src/core/qgsvector3d.h', (
+        ('QgsVector3D', ('dotProduct', 'crossProduct', 'perpendicularPoint')),
+    )),
+    ('src/core/vector/qgsvectordataprovider.h', (
+        ('QgsVectorDataProvider.NativeType', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectordataprovidertemporalcapabilities.h', (
+        ('QgsVectorDataProviderTemporalCapabilities', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/symbology/qgsvectorfieldsymbollayer.h', (
+        ('QgsVectorFieldSymbolLayer', ('create', 'createFromSld', ('__overridden_methods__', ('layerType', 'setSubSymbol', 'subSymbol', 'setColor', 'color', 'renderPoint', 'startRender', 'stopRender', 'clone', 'properties', 'usesMapUnits', 'toSld', 'drawPreviewIcon', 'usedAttributes', 'hasDataDefinedProperties', 'setOutputUnit', 'outputUnit', 'setMapUnitScale', 'mapUnitScale', 'bounds')), ('__group__', ('symbology',)))),
+    )),
+    ('src/core/qgsvectorfilewriter.h', (
+        ('QgsVectorFileWriter', ('create', 'writeAsVectorFormatV2', 'writeAsVectorFormatV3', 'supportedFiltersAndFormats', 'supportedFormatExtensions', 'supportsFeatureStyles', 'ogrDriverList', 'driverForExtension', 'fileFilterString', 'filterForDriver', 'convertCodecNameForEncodingOption', 'deleteShapeFile', 'driverMetadata', 'defaultDatasetOptions', 'defaultLayerOptions', 'editionCapabilities', 'targetLayerExists', 'areThereNewFieldsToCreate', ('__overridden_methods__', ('addFeature', 'addFeatures', 'lastError')))),
+        ('QgsVectorFileWriter.FieldValueConverter', (('__virtual_methods__', ('fieldDefinition', 'convert', 'clone')),)),
+    )),
+    ('src/core/qgsvectorfilewritertask.h', (
+        ('QgsVectorFileWriterTask', (('__attribute_docs__', (('writeComplete', 'Emitted when writing the layer is successfully completed. The\n``newFilename`` parameter indicates the file path for the written file.\n\n.. note::\n\n   this signal is deprecated in favor of :py:func:`~QgsVectorFileWriterTask.completed`.\n'), ('errorOccurred', 'Emitted when an error occurs which prevented the file being written (or\nif the task is canceled). The writing ``error`` and ``errorMessage``\nwill be reported.\n'))), ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__signal_arguments__', (('writeComplete', ('newFilename: str',)), ('errorOccurred', ('error: int', 'errorMessage: str')))))),
+    )),
+    ('src/core/vector/qgsvectorlayer.h', (
+        ('QgsVectorLayer', (('__attribute_docs__', (('selectionChanged', 'Emitted when selection was changed\n\n:param selected: Newly selected feature ids\n:param deselected: Ids of all features which have previously been\n                   selected but are not any more\n:param clearAndSelect: In case this is set to ``True``, the old\n                       selection was dismissed and the new selection\n                       corresponds to selected\n'), ('allowCommitChanged', 'Emitted whenever the :py:func:`~QgsVectorLayer.allowCommit` property of\nthis layer changes.\n\n.. versionadded:: 3.4\n'), ('beforeModifiedCheck', 'Emitted when the layer is checked for modifications. Use for last-minute\nadditions.\n'), ('beforeEditingStarted', 'Emitted before editing on this layer is started.\n'), ('beforeCommitChanges', 'Emitted before changes are committed to the data provider.\n\nThe ``stopEditing`` flag specifies if the editing mode shall be left\nafter this commit.\n'), ('beforeRollBack', 'Emitted before changes are rolled back.\n'), ('afterCommitChanges', 'Emitted after changes are committed to the data provider.\n\n.. versionadded:: 3.16\n'), ('afterRollBack', 'Emitted after changes are rolled back.\n\n.. versionadded:: 3.4\n'), ('attributeAdded', 'Will be emitted, when a new attribute has been added to this vector\nlayer. Applies only to types :py:class:`QgsFields`.OriginEdit,\n:py:class:`QgsFields`.OriginProvider and\n:py:class:`QgsFields`.OriginExpression\n\n:param idx: The index of the new attribute\n\n.. seealso:: :py:func:`updatedFields`\n'), ('beforeAddingExpressionField', 'Will be emitted, when an expression field is going to be added to this\nvector layer. Applies only to types\n:py:class:`QgsFields`.OriginExpression\n\n:param fieldName: The name of the attribute to be added\n'), ('attributeDeleted', 'Will be emitted, when an attribute has been deleted from this vector\nlayer. Applies only to types :py:class:`QgsFields`.OriginEdit,\n:py:class:`QgsFields`.OriginProvider and\n:py:class:`QgsFields`.OriginExpression\n\n:param idx: The index of the deleted attribute\n\n.. seealso:: :py:func:`updatedFields`\n'), ('beforeRemovingExpressionField', 'Will be emitted, when an expression field is going to be deleted from\nthis vector layer. Applies only to types\n:py:class:`QgsFields`.OriginExpression\n\n:param idx: The index of the attribute to be deleted\n'), ('featureAdded', 'Emitted when a new feature has been added to the layer\n\n:param fid: The id of the new feature\n'), ('featureDeleted', 'Emitted when a feature has been deleted.\n\nIf you do expensive operations in a slot connected to this, you should\nprefer to use :py:func:`~QgsVectorLayer.featuresDeleted`.\n\n:param fid: The id of the feature which has been deleted\n'), ('featuresDeleted', 'Emitted when features have been deleted.\n\nIf features are deleted within an edit command, this will only be\nemitted once at the end to allow connected slots to minimize the\noverhead. If features are deleted outside of an edit command, this\nsignal will be emitted once per feature.\n\n:param fids: The feature ids that have been deleted.\n'), ('updatedFields', 'Emitted whenever the fields available from this layer have been changed.\nThis can be due to manually adding attributes or due to a join.\n'), ('subsetStringChanged', "Emitted when the layer's subset string has changed.\n\n.. versionadded:: 3.2\n"), ('attributeValueChanged', 'Emitted whenever an attribute value change is done in the edit buffer.\nNote that at this point the attribute change is not yet saved to the\nprovider.\n\n:param fid: The id of the changed feature\n:param idx: The attribute index of the changed attribute\n:param value: The new value of the attribute\n'), ('geometryChanged', 'Emitted whenever a geometry change is done in the edit buffer. Note that\nat this point the geometry change is not yet saved to the provider.\n\n:param fid: The id of the changed feature\n:param geometry: The new geometry\n'), ('committedAttributesDeleted', 'Emitted when attributes are deleted from the provider if not in\ntransaction mode.\n'), ('committedAttributesAdded', 'Emitted when attributes are added to the provider if not in transaction\nmode.\n'), ('committedFeaturesAdded', 'Emitted when features are added to the provider if not in transaction\nmode.\n'), ('committedFeaturesRemoved', 'Emitted when features are deleted from the provider if not in\ntransaction mode.\n'), ('committedAttributeValuesChanges', 'Emitted when attribute value changes are saved to the provider if not in\ntransaction mode.\n'), ('committedGeometriesChanges', 'Emitted when geometry changes are saved to the provider if not in\ntransaction mode.\n'), ('labelingFontNotFound', 'Emitted when the font family defined for labeling layer is not found on\nsystem\n'), ('featureBlendModeChanged', 'Signal emitted when :py:func:`~QgsVectorLayer.setFeatureBlendMode` is\ncalled\n'), ('editCommandStarted', 'Signal emitted when a new edit command has been started\n\n:param text: Description for this edit command\n'), ('editCommandEnded', 'Signal emitted, when an edit command successfully ended\n\n.. note::\n\n   This does not mean it is also committed, only that it is written\n   to the edit buffer. See :py:func:`~QgsVectorLayer.beforeCommitChanges`\n'), ('editCommandDestroyed', 'Signal emitted, when an edit command is destroyed\n\n.. note::\n\n   This is not a rollback, it is only related to the current edit command.\n   See :py:func:`~QgsVectorLayer.beforeRollBack`\n'), ('readCustomSymbology', 'Signal emitted whenever the symbology (QML-file) for this layer is being\nread. If there is custom style information saved in the file, you can\nconnect to this signal and update the layer style accordingly.\n\n:param element: The XML layer style element.\n\n:param errorMessage: Write error messages into this string.\n'), ('writeCustomSymbology', 'Signal emitted whenever the symbology (QML-file) for this layer is being\nwritten. If there is custom style information you want to save to the\nfile, you can connect to this signal and update the element accordingly.\n\n:param element: The XML element where you can add additional style\n                information to.\n:param doc: The XML document that you can use to create new XML nodes.\n:param errorMessage: Write error messages into this string.\n'), ('displayExpressionChanged', 'Emitted when the display expression changes\n'), ('raiseError', 'Signals an error related to this vector layer.\n'), ('editFormConfigChanged', 'Will be emitted whenever the edit form configuration of this layer\nchanges.\n'), ('readOnlyChanged', 'Emitted when the read only state of this layer is changed. Only applies\nto manually set readonly state, not to the edit mode.\n\n.. seealso:: :py:func:`setReadOnly`\n'), ('supportsEditingChanged', 'Emitted when the read only state or the data provider of this layer is\nchanged.\n\n.. versionadded:: 3.18\n'), ('symbolFeatureCountMapChanged', 'Emitted when the feature count for symbols on this layer has been\nrecalculated.\n'))), 'drawVertexMarker', ('__virtual_methods__', ('hasMapTips', 'dataProvider', 'setDependencies', 'dependencies', 'wkbType', 'sourceCrs', 'sourceName', 'readXml', 'writeXml', 'encodedSource', 'decodedSource', 'resolveReferences', 'readSld', 'hasFeatures', 'loadDefaultStyle', 'setSubsetString', 'subsetString', 'addFeature', 'isEditable', 'isSpatial', 'reload', 'createMapRenderer', 'extent', 'sourceExtent', 'extent3D', 'sourceExtent3D', 'fields', 'deleteAttribute', 'addFeatures', 'uniqueValues', 'minimumValue', 'maximumValue', 'htmlMetadata', 'createExpressionContext', 'createExpressionContextScope', 'updateExtents', 'setExtent', 'setExtent3D')), ('__overridden_methods__', ('clone', 'selectionProperties', 'temporalProperties', 'elevationProperties', 'profileSource', 'createProfileGenerator', 'isModified', 'supportsEditing', 'setTransformContext', 'hasSpatialIndex', 'accept')), ('__signal_arguments__', (('selectionChanged', ('selected: QgsFeatureIds', 'deselected: QgsFeatureIds', 'clearAndSelect: bool')), ('beforeCommitChanges', ('stopEditing: bool',)), ('attributeAdded', ('idx: int',)), ('beforeAddingExpressionField', ('fieldName: str',)), ('attributeDeleted', ('idx: int',)), ('beforeRemovingExpressionField', ('idx: int',)), ('featureAdded', ('fid: QgsFeatureId',)), ('featureDeleted', ('fid: QgsFeatureId',)), ('featuresDeleted', ('fids: QgsFeatureIds',)), ('attributeValueChanged', ('fid: QgsFeatureId', 'idx: int', 'value: object')), ('geometryChanged', ('fid: QgsFeatureId', 'geometry: QgsGeometry')), ('committedAttributesDeleted', ('layerId: str', 'deletedAttributes: QgsAttributeList')), ('committedAttributesAdded', ('layerId: str', 'addedAttributes: List[QgsField]')), ('committedFeaturesAdded', ('layerId: str', 'addedFeatures: QgsFeatureList')), ('committedFeaturesRemoved', ('layerId: str', 'deletedFeatureIds: QgsFeatureIds')), ('committedAttributeValuesChanges', ('layerId: str', 'changedAttributesValues: QgsChangedAttributesMap')), ('committedGeometriesChanges', ('layerId: str', 'changedGeometries: QgsGeometryMap')), ('labelingFontNotFound', ('layer: QgsVectorLayer', 'fontfamily: str')), ('featureBlendModeChanged', ('blendMode: QPainter.CompositionMode',)), ('editCommandStarted', ('text: str',)), ('readCustomSymbology', ('element: QDomElement', 'errorMessage: str')), ('raiseError', ('msg: str',)))), ('__group__', ('vector',)))),
+        ('QgsVectorLayer.DeleteContext', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayercache.h', (
+        ('QgsVectorLayerCache', (('__attribute_docs__', (('finished', 'When filling the cache, this signal gets emitted once the cache is fully\ninitialized.\n'), ('cachedLayerDeleted', 'Is emitted when the cached layer is deleted. Is emitted when the cached\nlayers :py:func:`~QgsVectorLayerCache.layerDelete` signal is being\nemitted, but before the local reference to it has been set to ``None``.\nSo call to :py:func:`~QgsVectorLayerCache.layer` will still return a\nvalid pointer for cleanup purpose.\n'), ('attributeValueChanged', 'Emitted when an attribute is changed. Is re-emitted after the layer\nitself emits this signal. You should connect to this signal, to be sure,\nto not get a cached value if querying the cache.\n'), ('featureAdded', "Emitted when a new feature has been added to the layer and this cache.\nYou should connect to this signal instead of the layers', if you want to\nbe sure that this cache has updated information for the new feature\n\n:param fid: The featureid of the changed feature\n"), ('invalidated', 'The cache has been invalidated and cleared. Note that when a cache is\ninvalidated the :py:func:`~QgsVectorLayerCache.fullCache` setting will\nbe cleared, and a full cache rebuild via setFullCache( ``True`` ) will\nneed to be performed.\n'))), ('__signal_arguments__', (('attributeValueChanged', ('fid: QgsFeatureId', 'field: int', 'value: object')), ('featureAdded', ('fid: QgsFeatureId',)))), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayereditbuffer.h', (
+        ('QgsVectorLayerEditBuffer', (('__attribute_docs__', (('layerModified', 'Emitted when modifications has been done on layer\n'), ('featureAdded', 'Emitted when a feature has been added to the buffer\n'), ('featureDeleted', 'Emitted when a feature was deleted from the buffer\n'), ('geometryChanged', "Emitted when a feature's geometry is changed.\n\n:param fid: feature ID\n:param geom: new feature geometry\n"), ('attributeValueChanged', "Emitted when a feature's attribute value has been changed.\n"), ('attributeAdded', 'Emitted when an attribute was added to the buffer.\n'), ('attributeDeleted', 'Emitted when an attribute was deleted from the buffer.\n'), ('attributeRenamed', 'Emitted when an attribute has been renamed\n\n:param idx: attribute index\n:param newName: new attribute name\n'), ('committedAttributesDeleted', 'Emitted after attribute deletion has been committed to the layer.\n'), ('committedAttributesAdded', 'Emitted after attribute addition has been committed to the layer.\n'), ('committedAttributesRenamed', 'Emitted after committing an attribute rename\n\n:param layerId: ID of layer\n:param renamedAttributes: map of field index to new name\n'), ('committedFeaturesAdded', 'Emitted after feature addition has been committed to the layer.\n'), ('committedFeaturesRemoved', 'Emitted after feature removal has been committed to the layer.\n'), ('committedAttributeValuesChanges', 'Emitted after feature attribute value changes have been committed to the\nlayer.\n'), ('committedGeometriesChanges', 'Emitted after feature geometry changes have been committed to the layer.\n'))), ('__virtual_methods__', ('isModified', 'addFeature', 'addFeatures', 'deleteFeature', 'deleteFeatures', 'changeGeometry', 'changeAttributeValue', 'changeAttributeValues', 'addAttribute', 'deleteAttribute', 'renameAttribute', 'commitChanges', 'rollBack')), ('__signal_arguments__', (('featureAdded', ('fid: QgsFeatureId',)), ('featureDeleted', ('fid: QgsFeatureId',)), ('geometryChanged', ('fid: QgsFeatureId', 'geom: QgsGeometry')), ('attributeValueChanged', ('fid: QgsFeatureId', 'idx: int', 'value: object')), ('attributeAdded', ('idx: int',)), ('attributeDeleted', ('idx: int',)), ('attributeRenamed', ('idx: int', 'newName: str')), ('committedAttributesDeleted', ('layerId: str', 'deletedAttributes: QgsAttributeList')), ('committedAttributesAdded', ('layerId: str', 'addedAttributes: List[QgsField]')), ('committedAttributesRenamed', ('layerId: str', 'renamedAttributes: QgsFieldNameMap')), ('committedFeaturesAdded', ('layerId: str', 'addedFeatures: QgsFeatureList')), ('committedFeaturesRemoved', ('layerId: str', 'deletedFeatureIds: QgsFeatureIds')), ('committedAttributeValuesChanges', ('layerId: str', 'changedAttributesValues: QgsChangedAttributesMap')), ('committedGeometriesChanges', ('layerId: str', 'changedGeometries: QgsGeometryMap')))), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayereditbuffergroup.h', (
+        ('QgsVectorLayerEditBufferGroup', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayereditpassthrough.h', (
+        ('QgsVectorLayerEditPassthrough', (('__overridden_methods__', ('isModified', 'addFeature', 'addFeatures', 'deleteFeature', 'deleteFeatures', 'changeGeometry', 'changeAttributeValue', 'changeAttributeValues', 'addAttribute', 'deleteAttribute', 'renameAttribute', 'commitChanges', 'rollBack')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayereditutils.h', (
+        ('QgsVectorLayerEditUtils', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayerelevationproperties.h', (
+        ('QgsVectorLayerElevationProperties', (('__overridden_methods__', ('hasElevation', 'writeXml', 'readXml', 'setDefaultsFromLayer', 'clone', 'htmlSummary', 'isVisibleInZRange', 'calculateZRange', 'showByDefaultInElevationProfilePlots')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerexporter.h', (
+        ('QgsVectorLayerExporterTask', (('__attribute_docs__', (('exportComplete', 'Emitted when exporting the layer is successfully completed.\n'), ('errorOccurred', 'Emitted when an error occurs which prevented the layer being exported\n(or if the task is canceled). The export ``error`` and ``errorMessage``\nwill be reported.\n'))), 'withLayerOwnership', ('__overridden_methods__', ('cancel', 'run', 'finished')), ('__signal_arguments__', (('errorOccurred', ('error: Qgis.VectorExportResult', 'errorMessage: str')),)), ('__group__', ('vector',)))),
+        ('QgsVectorLayerExporter', ('exportLayer', ('__overridden_methods__', ('addFeatures', 'addFeature', 'lastError', 'flushBuffer')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerExporter.ExportOptions', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayerfeaturecounter.h', (
+        ('QgsVectorLayerFeatureCounter', (('__attribute_docs__', (('symbolsCounted', 'Emitted when the symbols have been counted.\n'),)), ('__overridden_methods__', ('run', 'cancel')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerfeatureiterator.h', (
+        ('QgsVectorLayerFeatureSource', (('__overridden_methods__', ('getFeatures',)), ('__group__', ('vector',)))),
+        ('QgsVectorLayerFeatureIterator', (('__overridden_methods__', ('rewind', 'close', 'isValid', 'fetchFeature', 'nextFeatureFilterExpression', 'prepareSimplification')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerSelectedFeatureSource', (('__overridden_methods__', ('getFeatures', 'sourceCrs', 'fields', 'wkbType', 'featureCount', 'sourceName', 'createExpressionContextScope', 'hasSpatialIndex')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/gps/qgsvectorlayergpslogger.h', (
+        ('QgsVectorLayerGpsLogger', (('__overridden_methods__', ('setTransformContext',)), ('__group__', ('gps',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerjoinbuffer.h', (
+        ('QgsVectorLayerJoinBuffer', (('__attribute_docs__', (('joinedFieldsChanged', "Emitted whenever the list of joined fields changes (e.g. added join or\njoined layer's fields change)\n"),)), 'joinSubsetIndices', ('__overridden_methods__', ('addFeatures',)), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerjoininfo.h', (
+        ('QgsVectorLayerJoinInfo', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/labeling/qgsvectorlayerlabeling.h', (
+        ('QgsAbstractVectorLayerLabeling', ('create', 'defaultSettingsForLayer', ('__virtual_methods__', ('subProviders', 'multiplyOpacity', 'toSld', 'accept', 'writeTextSymbolizer')), ('__abstract_methods__', ('type', 'clone', 'save', 'settings', 'setSettings', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode')), ('__group__', ('labeling',)))),
+        ('QgsVectorLayerSimpleLabeling', ('create', ('__overridden_methods__', ('type', 'clone', 'save', 'settings', 'accept', 'setSettings', 'requiresAdvancedEffects', 'hasNonDefaultCompositionMode', 'toSld', 'multiplyOpacity')), ('__group__', ('labeling',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerselectionproperties.h', (
+        ('QgsVectorLayerSelectionProperties', (('__attribute_docs__', (('selectionRenderingModeChanged', 'Emitted whenever the selection rendering mode changes.\n\n.. versionadded:: 4.0\n'), ('selectionColorChanged', 'Emitted whenever the selection color changes.\n\n.. versionadded:: 4.0\n'), ('selectionSymbolChanged', 'Emitted whenever the selection symbol changes.\n\n.. versionadded:: 4.0\n'))), ('__overridden_methods__', ('writeXml', 'readXml', 'clone')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayertemporalproperties.h', (
+        ('QgsVectorLayerTemporalProperties', (('__overridden_methods__', ('isVisibleInTemporalRange', 'flags', 'writeXml', 'readXml', 'setDefaultsFromDataProviderTemporalCapabilities')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerTemporalContext', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayertools.h', (
+        ('QgsVectorLayerTools', (('__virtual_methods__', ('addFeature', 'addFeatureV2', 'copyMoveFeatures')), ('__abstract_methods__', ('startEditing', 'stopEditing', 'saveEdits')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayertoolscontext.h', (
+        ('QgsVectorLayerToolsContext', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayerundocommand.h', (
+        ('QgsVectorLayerUndoCommand', (('__overridden_methods__', ('id', 'mergeWith')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandAddFeature', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandDeleteFeature', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandChangeGeometry', (('__overridden_methods__', ('undo', 'redo', 'id', 'mergeWith')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandChangeAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandAddAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandDeleteAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoCommandRenameAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+    )),
+    ('src/core/vector/qgsvectorlayerundopassthroughcommand.h', (
+        ('QgsVectorLayerUndoPassthroughCommandAddFeatures', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandDeleteFeatures', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandChangeGeometry', (('__overridden_methods__', ('undo', 'redo', 'id', 'mergeWith')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandChangeAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandChangeAttributes', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandAddAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandDeleteAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandRenameAttribute', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommandUpdate', (('__overridden_methods__', ('undo', 'redo')), ('__group__', ('vector',)))),
+        ('QgsVectorLayerUndoPassthroughCommand', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vector/qgsvectorlayerutils.h', (
+        ('QgsVectorLayerUtils', ('getValuesIterator', 'getValues', 'getDoubleValues', 'valueExists', 'createUniqueValue', 'createUniqueValueFromCache', 'attributeHasConstraints', 'validateAttribute', 'createFeature', 'createFeatures', 'duplicateFeature', 'matchAttributesToFields', 'makeFeatureCompatible', 'makeFeaturesCompatible', 'fieldIsEditable', 'fieldIsReadOnly', 'fieldEditabilityDependsOnFeature', 'getFeatureDisplayString', 'impactsCascadeFeatures', 'guessFriendlyIdentifierField', ('__group__', ('vector',)))),
+        ('QgsVectorLayerUtils.QgsDuplicateFeatureContext', (('__group__', ('vector',)),)),
+        ('QgsVectorLayerUtils.QgsFeatureData', (('__group__', ('vector',)),)),
+    )),
+    ('src/core/vectortile/qgsvectortilebasiclabeling.h', (
+        ('QgsVectorTileBasicLabeling', (('__overridden_methods__', ('type', 'clone', 'writeXml', 'readXml')), ('__group__', ('vectortile',)))),
+        ('QgsVectorTileBasicLabelingStyle', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/vectortile/qgsvectortilebasicrenderer.h', (
+        ('QgsVectorTileBasicRenderer', ('simpleStyle', 'simpleStyleWithRandomColors', ('__overridden_methods__', ('type', 'clone', 'startRender', 'requiredLayers', 'stopRender', 'renderBackground', 'renderTile', 'renderSelectedFeatures', 'willRenderFeature', 'writeXml', 'readXml')), ('__group__', ('vectortile',)))),
+        ('QgsVectorTileBasicRendererStyle', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/vectortile/qgsvectortilelabeling.h', (
+        ('QgsVectorTileLabeling', (('__virtual_methods__', ('resolveReferences',)), ('__abstract_methods__', ('type', 'clone', 'writeXml', 'readXml')), ('__group__', ('vectortile',)))),
+    )),
+    ('src/core/vectortile/qgsvectortilelayer.h', (
+        ('QgsVectorTileLayer.LayerOptions', (('__attribute_docs__', (('transformContext', 'Coordinate transform context'),)), ('__annotations__', (('transformContext', 'QgsCoordinateTransformContext'),)), ('__group__', ('vectortile',)))),
+        ('QgsVectorTileLayer', (('__attribute_docs__', (('selectionChanged', 'Emitted whenever the selected features in the layer are changed.\n\n.. versionadded:: 3.28\n'),)), ('__virtual_methods__', ('encodedSource', 'decodedSource')), ('__overridden_methods__', ('clone', 'dataProvider', 'createMapRenderer', 'readXml', 'writeXml', 'readSymbology', 'writeSymbology', 'setTransformContext', 'loadDefaultStyle', 'properties', 'loadDefaultMetadata', 'htmlMetadata')), ('__group__', ('vectortile',)))),
+    )),
+    ('src/core/vectortile/qgsvectortilematrixset.h', (
+        ('QgsVectorTileMatrixSet', ('fromWebMercator', ('__group__', ('vectortile',)))),
+    )),
+    ('src/core/vectortile/qgsvectortilerenderer.h', (
+        ('QgsVectorTileRenderer', (('__virtual_methods__', ('requiredLayers', 'resolveReferences')), ('__abstract_methods__', ('type', 'clone', 'startRender', 'stopRender', 'renderBackground', 'renderTile', 'willRenderFeature', 'renderSelectedFeatures', 'writeXml', 'readXml')), ('__group__', ('vectortile',)))),
+        ('QgsVectorTileRendererData', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/vectortile/qgsvectortileutils.h', (
+        ('QgsVectorTileUtils', ('updateUriSources', 'sortTilesByDistanceFromCenter', 'tilePolygon', 'makeQgisFields', 'scaleToZoom', 'scaleToZoomLevel', 'makeVectorLayerForTile', 'formatXYZUrlTemplate', 'checkXYZUrlTemplate', 'loadSprites', 'resolveMapboxUri', ('__group__', ('vectortile',)))),
+    )),
+    ('src/core/vectortile/qgsvectortilewriter.h', (
+        ('QgsVectorTileWriter', (('__group__', ('vectortile',)),)),
+        ('QgsVectorTileWriter.Layer', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/qgsvirtuallayerdefinition.h', (
+        ('QgsVirtualLayerDefinition', ('fromUrl',)),
+    )),
+    ('src/core/qgsvirtuallayerdefinitionutils.h', (
+        ('QgsVirtualLayerDefinitionUtils', ('fromJoinedLayer',)),
+    )),
+    ('src/core/qgsvirtuallayertask.h', (
+        ('QgsVirtualLayerTask', (('__overridden_methods__', ('run', 'cancel')),)),
+    )),
+    ('src/core/vectortile/qgsvtpktiles.h', (
+        ('QgsVtpkTiles', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/core/qgsweakrelation.h', (
+        ('QgsWeakRelation', ('readXml', 'writeXml')),
+    )),
+    ('src/core/web/qgswebenginepage.h', (
+        ('QgsWebEnginePage', (('__attribute_docs__', (('loadStarted', 'This signal is emitted when the page starts loading content.\n'), ('loadProgress', 'This signal is emitted when the global ``progress`` status changes.\n\nThe current value is provided by ``progress`` and scales from 0 to 100.\nIt accumulates changes from all the child frames.\n'), ('loadFinished', 'This signal is emitted when the page finishes loading content.\n\nThis signal is independent of script execution or page rendering.\n\n``ok`` will indicate whether the load was successful or any error\noccurred.\n'))), ('__signal_arguments__', (('loadProgress', ('progress: int',)), ('loadFinished', ('ok: bool',)))), ('__group__', ('web',)))),
+    )),
+    ('src/core/geometry/qgswkbptr.h', (
+        ('QgsWkbPtr', (('__group__', ('geometry',)),)),
+        ('QgsConstWkbPtr', (('__group__', ('geometry',)),)),
+    )),
+    ('src/core/geometry/qgswkbtypes.h', (
+        ('QgsWkbTypes', ('singleType', 'multiType', 'promoteNonPointTypesToMulti', 'curveType', 'linearType', 'flatType', 'zmType', 'parseType', 'isSingleType', 'isMultiType', 'isCurvedType', 'wkbDimensions', 'coordDimensions', 'geometryType', 'displayString', 'translatedDisplayString', 'geometryDisplayString', 'hasZ', 'hasM', 'addZ', 'addM', 'dropZ', 'dropM', 'to25D', ('__group__', ('geometry',)))),
+    )),
+    ('src/core/qgsxmlutils.h', (
+        ('QgsXmlUtils', ('readMapUnits', 'readRectangle', 'readBox3D', 'writeMapUnits', 'writeBox3D', 'writeRectangle', 'writeVariant', 'readVariant')),
+    )),
+    ('src/core/browser/qgszipitem.h', (
+        ('QgsZipItem', ('vsiPrefix', 'itemFromPath', 'iconZip', ('__overridden_methods__', ('createChildren', 'hasDragEnabled', 'mimeUris')), ('__group__', ('browser',)))),
+    )),
+    ('src/core/qgsziputils.h', (
+        ('QgsZipUtils', ('isZipFile', 'unzip', 'zip')),
+    )),
+)
@@ -0,0 +1,105 @@
+"""
+***************************************************************************
+    arrowinterop.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import json
+
+import numpy
+import pyarrow
+from PyQt5.QtCore import QVariant
+from qgis._core import QgsFeatureRequest, Qgis
+
+from .qgsfeatureiterator import DEFAULT_BATCH_SIZE, _check_geometry_column, _feature_iterator_to_columns
+
+# Field types whose Arrow type is not inferred from the values
+_ARROW_TYPES = {
+    QVariant.Bool: ("bool_",),
+    QVariant.Int: ("int32",),
+    QVariant.UInt: ("uint32",),
+    QVariant.LongLong: ("int64",),
+    QVariant.ULongLong: ("uint64",),
+    QVariant.Double: ("float64",),
+    QVariant.String: ("string",),
+    QVariant.Date: ("date32",),
+    QVariant.DateTime: ("timestamp", "ms"),
+    QVariant.Time: ("time64", "us"),
+    QVariant.ByteArray: ("binary",),
+}
+
+
+def _layer_as_record_batches(
+    layer, request=None, batch_size=DEFAULT_BATCH_SIZE, fid_column="fid", geometry_column="geometry"
+):
+    """
+    Reads the features of the layer as Apache Arrow record batches.
+
+    The batches have a column of feature ids named ``fid_column`` (unless a field has
+    the same name), one column per field and a ``geometry_column`` of WKB geometries
+    with the ``geoarrow.wkb`` extension metadata, which must not be the name of a field.
+
+    The subset of attributes of the request is honored, and the geometry column is
+    omitted if the request has the NoGeometry flag.
+
+    :param request: an optional QgsFeatureRequest to filter the features
+    :param batch_size: the maximum number of features per batch
+
+    :raises ValueError: if ``geometry_column`` is the name of a field or ``fid_column``
+    :raises QgsNotSupportedException: if numpy or pyarrow is not available on the system
+    """
+    request = QgsFeatureRequest() if request is None else QgsFeatureRequest(request)
+    flags = request.flags()
+    if flags & Qgis.FeatureRequestFlag.SubsetOfAttributes:
+        attributes = request.subsetOfAttributes()
+    else:
+        attributes = None
+    geometry = not flags & Qgis.FeatureRequestFlag.NoGeometry
+    fields = layer.fields()
+    indexes = list(range(fields.count())) if attributes is None else list(attributes)
+
+    schema_fields = []
+    types = {}
+    for index in indexes:
+        field = fields.at(index)
+        arrow_type = _ARROW_TYPES.get(field.type())
+        types[field.name()] = None if arrow_type is None else getattr(pyarrow, arrow_type[0])(*arrow_type[1:])
+    if geometry:
+        _check_geometry_column(types, fid_column, geometry_column)
+    if fid_column not in types:
+        schema_fields.append(pyarrow.field(fid_column, pyarrow.int64(), nullable=False))
+    metadata = {"ARROW:extension:name": "geoarrow.wkb"}
+    crs = layer.crs()
+    if crs.isValid():
+        metadata["ARROW:extension:metadata"] = json.dumps({"crs": crs.authid() or crs.toWkt()})
+
+    schema = None
+    batches = _feature_iterator_to_columns(
+        layer.getFeatures(request), batch_size, fields, attributes, geometry, fid_column, geometry_column
+    )
+    for batch in batches:
+        arrays = []
+        for name, column in batch.items():
+            if name == geometry_column and geometry:
+                arrays.append(pyarrow.array(column, type=pyarrow.binary()))
+            elif isinstance(column, numpy.ma.MaskedArray):
+                arrays.append(pyarrow.array(column.data, mask=numpy.ma.getmaskarray(column), type=types.get(name)))
+            else:
+                arrays.append(pyarrow.array(column, type=types.get(name), from_pandas=False))
+        if schema is None:
+            # Types which are inferred are those of the first batch
+            schema = pyarrow.schema(
+                schema_fields
+                + [pyarrow.field(name, arrays[len(schema_fields) + i].type) for i, name in enumerate(types)]
+                + ([pyarrow.field(geometry_column, pyarrow.binary(), metadata=metadata)] if geometry else [])
+            )
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
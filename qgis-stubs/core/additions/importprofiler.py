@@ -0,0 +1,215 @@
+"""
+***************************************************************************
+    importprofiler.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import ast
+import json
+import os
+import re
+import sys
+import time
+
+PROFILE_ENV = 'QGIS_PROFILE_IMPORTS'
+PROFILE_XOPTION = 'qgis_profile_imports'
+DEFAULT_OUTPUT = 'qgis-import-profile.json'
+# Number of sections per module reported to QgsRuntimeProfiler
+REPORT_LIMIT = 20
+
+_HEADER_RE = re.compile(r'^# The following has been generated automatically from (\S+)$')
+
+_results = {}
+_active = None
+
+
+def output_path():
+    """
+    Returns the path the import profile is written to, or None if import profiling is disabled.
+
+    Profiling is enabled with ``python -X qgis_profile_imports[=path]`` or by setting the
+    ``QGIS_PROFILE_IMPORTS`` environment variable to the path of the JSON file to write.
+    """
+    value = sys._xoptions.get(PROFILE_XOPTION) or os.environ.get(PROFILE_ENV)
+    if not value:
+        return None
+    return DEFAULT_OUTPUT if value is True else value
+
+
+def current_profile():
+    """
+    Returns the :py:class:`ImportProfile` of the module currently being imported, if any.
+    """
+    return _active
+
+
+def section_map(source):
+    """
+    Returns the section name of each line of a runtime module, indexed by line number.
+
+    Statements following a ``# The following has been generated automatically from``
+    comment belong to the section of that header, until the next header or the next
+    blank line between two statements. Other imports form a section each, and other
+    statements are named after the comment above them.
+    """
+    lines = source.splitlines()
+    sections = [None] * (len(lines) + 2)
+    header = None
+    other = '<module>'
+    previous_end = 0
+    for node in ast.parse(source).body:
+        gap = lines[previous_end:node.lineno - 1]
+        if any(not line.strip() for line in gap):
+            header = None
+        for line in gap:
+            match = _HEADER_RE.match(line)
+            if match:
+                header = match.group(1)
+        comments = []
+        for line in reversed(gap):
+            if not line.startswith('#'):
+                break
+            comments.insert(0, line.lstrip('# ').strip())
+        if comments and header is None:
+            other = comments[0]
+        if header is not None:
+            name = header
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom):
+                name = 'import {}{}'.format('.' * node.level, node.module or '')
+            else:
+                name = 'import {}'.format(', '.join(alias.name for alias in node.names))
+        else:
+            name = other
+        end = node.end_lineno or node.lineno
+        for lineno in range(node.lineno, end + 1):
+            sections[lineno] = name
+        previous_end = end
+    return sections
+
+
+def _no_trace(frame, event, arg):
+    return None
+
+
+class ImportProfile:
+    """
+    Records the wall time and the number of net allocated memory blocks of each
+    section of a runtime module while it is being imported.
+    """
+
+    def __init__(self, module, sections):
+        self.module = module
+        self.sections = sections
+        # section name -> [seconds, allocated blocks]
+        self.totals = {}
+        self._stack = []
+        self._current = None
+        self._start = 0.0
+        self._blocks = 0
+        self._started = time.perf_counter()
+        self._previous_trace = None
+        self._previous_profile = None
+
+    def _switch(self, name):
+        now = time.perf_counter()
+        blocks = sys.getallocatedblocks()
+        if self._current is not None:
+            total = self.totals.setdefault(self._current, [0.0, 0])
+            total[0] += now - self._start
+            total[1] += blocks - self._blocks
+        self._current = name
+        self._start = now
+        self._blocks = blocks
+
+    def _trace(self, frame, event, arg):
+        if event == 'line' and not self._stack and frame.f_lineno < len(self.sections):
+            name = self.sections[frame.f_lineno]
+            if name is not None and name != self._current:
+                self._switch(name)
+        return self._trace
+
+    def attach(self, frame):
+        """
+        Starts recording the sections executed by the module level code of ``frame``.
+        """
+        global _active
+        self._previous_trace = sys.gettrace()
+        self._previous_profile = _active
+        # Only the module frame is traced, calls made from it are not
+        sys.settrace(_no_trace)
+        frame.f_trace = self._trace
+        frame.f_trace_lines = True
+        _active = self
+
+    def push(self, name):
+        """
+        Records the following work under the section ``name``, until :py:meth:`pop` is called.
+        """
+        self._stack.append(self._current)
+        self._switch(name)
+
+    def pop(self):
+        self._switch(self._stack.pop())
+
+    def finish(self):
+        """
+        Stops recording, writes the profile of all modules imported so far to the JSON file
+        and reports the slowest sections of this module to QgsRuntimeProfiler.
+        """
+        global _active
+        self._switch(None)
+        sys._getframe(1).f_trace = None
+        sys.settrace(self._previous_trace)
+        # Restore the profile of the module importing this one, if any
+        _active = self._previous_profile
+
+        sections = sorted(
+            ({'name': name, 'seconds': seconds, 'allocated_blocks': blocks}
+             for name, (seconds, blocks) in self.totals.items()),
+            key=lambda section: section['seconds'],
+            reverse=True,
+        )
+        _results[self.module] = {
+            'seconds': time.perf_counter() - self._started,
+            'sections': sections,
+        }
+        path = output_path()
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'modules': _results}, f, indent=1)
+
+        try:
+            from qgis._core import QgsApplication
+        except ImportError:
+            return
+        profiler = QgsApplication.profiler()
+        for section in sections[:REPORT_LIMIT]:
+            profiler.record('{}: {}'.format(self.module, section['name']), section['seconds'], 'startup')
+
+
+def start_import_profile(module):
+    """
+    Starts profiling the import of a runtime module, if import profiling is enabled.
+
+    Must be called from the module level code of the module. Returns the
+    :py:class:`ImportProfile`, whose :py:meth:`~ImportProfile.finish` must be called
+    at the end of the module, or None if profiling is disabled.
+    """
+    if output_path() is None:
+        return None
+    frame = sys._getframe(1)
+    with open(frame.f_code.co_filename, encoding='utf-8') as f:
+        sections = section_map(f.read())
+    profile = ImportProfile(module, sections)
+    profile.attach(frame)
+    return profile
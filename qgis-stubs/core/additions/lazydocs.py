@@ -0,0 +1,103 @@
+"""
+***************************************************************************
+    lazydocs.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import builtins
+import importlib
+import os
+
+LAZY_DOCS_ENV = 'QGIS_LAZY_DOCS'
+
+_PENDING_LOADERS = []
+_original_help = None
+
+
+class DocLoader:
+    """
+    Installs the docstrings of a module's generated bindings from its side table.
+
+    The side table is a module with a ``DOCS`` tuple of ``(dotted target, docstring)``
+    pairs, which are assigned in order to the ``__doc__`` of the targets.
+    Targets which do not exist in this build are skipped.
+    """
+
+    def __init__(self, namespace, table_module):
+        self.namespace = namespace
+        self.table_module = table_module
+        self.loaded = False
+
+    def __call__(self):
+        """
+        Installs the docstrings, if this has not been done yet.
+
+        :return: the number of docstrings installed
+        """
+        if self.loaded:
+            return 0
+        self.loaded = True
+        if self in _PENDING_LOADERS:
+            _PENDING_LOADERS.remove(self)
+
+        docs = importlib.import_module(self.table_module).DOCS
+        count = 0
+        for target, doc in docs:
+            name, *attributes = target.split('.')
+            try:
+                obj = self.namespace[name]
+                for attribute in attributes:
+                    obj = getattr(obj, attribute)
+                obj.__doc__ = doc
+            except (KeyError, AttributeError, TypeError):
+                continue
+            count += 1
+        return count
+
+
+def _help(*args, **kwargs):
+    for loader in list(_PENDING_LOADERS):
+        loader()
+    return _original_help(*args, **kwargs)
+
+
+def _install_help_hook():
+    global _original_help
+    if _original_help is not None:
+        return
+    _original_help = getattr(builtins, 'help', None)
+    if _original_help is None:
+        # e.g. python -S, there is no interactive help to hook into
+        return
+    builtins.help = _help
+
+
+def register_docs(namespace, table_module):
+    """
+    Registers the docstring side table of a module.
+
+    By default the docstrings are installed immediately. If the ``QGIS_LAZY_DOCS``
+    environment variable is set to a non-empty value, installing them is deferred
+    until the returned loader is called (e.g. via :py:func:`qgis.core.load_docs`)
+    or until :py:func:`help` is used for the first time.
+
+    :param namespace: the module globals the targets of the side table are resolved in
+    :param table_module: the name of the side table module
+    :return: the :py:class:`DocLoader` for the module
+    """
+    loader = DocLoader(namespace, table_module)
+    if os.environ.get(LAZY_DOCS_ENV):
+        _PENDING_LOADERS.append(loader)
+        _install_help_hook()
+    else:
+        loader()
+    return loader
@@ -0,0 +1,103 @@
+"""
+***************************************************************************
+    lazyimport.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import importlib
+
+from qgis._core import QgsNotSupportedException
+
+
+class LazyFunction:
+    """
+    A function of a module which depends on an optional library, imported on first use.
+
+    Installed on a class, it behaves like a method, or like a static method if ``static``
+    is True, and replaces itself on the class with the imported function once loaded.
+    Installed in a module namespace, it is called like the function.
+
+    If the optional library is not installed, calling the function raises a
+    QgsNotSupportedException.
+
+    A docstring assigned to the lazy function, e.g. from the docs side table, is
+    copied to the imported function unless the function has its own.
+    """
+
+    def __init__(self, module, name, requirement, qualified_name, owner=None, attribute=None, static=False):
+        self.module = module
+        self.name = name
+        self.requirement = requirement
+        self.qualified_name = qualified_name
+        self.owner = owner
+        self.attribute = attribute
+        self.static = static
+        self.__doc__ = None
+        self._function = None
+
+    def load(self):
+        """
+        Imports the function, or returns one raising QgsNotSupportedException if the
+        optional library is not installed.
+        """
+        if self._function is not None:
+            return self._function
+        try:
+            function = getattr(importlib.import_module(self.module), self.name)
+        except ModuleNotFoundError as e:
+            missing = (e.name or "").split(".")[0]
+            requirements = (self.requirement,) if isinstance(self.requirement, str) else self.requirement
+            if missing not in requirements:
+                raise
+            message = f"{self.qualified_name} is not available, {missing} is not installed on the system"
+
+            def function(*args, **kwargs):
+                raise QgsNotSupportedException(message)
+        else:
+            if function.__doc__ is None:
+                function.__doc__ = self.__doc__
+            if self.owner is not None:
+                setattr(self.owner, self.attribute, staticmethod(function) if self.static else function)
+        self._function = function
+        return function
+
+    def __get__(self, instance, owner=None):
+        # Accessing the attribute on the class does not import the module, so that
+        # the docstrings can be installed without importing the optional library
+        if instance is None or self.static:
+            return self
+        return self.load().__get__(instance, owner)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<lazy function {self.qualified_name}>"
+
+
+def install(owner, attribute, module, name, requirement, static=False):
+    """
+    Installs a :py:class:`LazyFunction` as a method of a class.
+
+    :param owner: the class
+    :param attribute: the name of the method
+    :param module: the module defining the function
+    :param name: the name of the function in the module
+    :param requirement: the top level name of the optional library the module imports,
+        or a tuple of names if it imports several
+    :param static: whether the method is a static method
+    """
+    setattr(
+        owner,
+        attribute,
+        LazyFunction(module, name, requirement, f"{owner.__name__}.{attribute}", owner, attribute, static),
+    )
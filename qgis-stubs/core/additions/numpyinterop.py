@@ -0,0 +1,380 @@
+"""
+***************************************************************************
+    numpyinterop.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import concurrent.futures
+import threading
+import typing
+
+import numpy
+from qgis._core import Qgis, QgsRectangle, QgsWkbTypes
+
+from . import wkb
+
+
+def _qgis_data_type_to_numeric_data_type(dataType: Qgis.DataType) -> typing.Optional[numpy.dtype]:
+    qgis_to_numpy_dtype_dict = {
+        Qgis.DataType.UnknownDataType: None,
+        Qgis.DataType.Byte: numpy.byte,
+        Qgis.DataType.Int8: numpy.int8,
+        Qgis.DataType.UInt16: numpy.uint16,
+        Qgis.DataType.Int16: numpy.int16,
+        Qgis.DataType.UInt32: numpy.uint32,
+        Qgis.DataType.Int32: numpy.int32,
+        Qgis.DataType.Float32: numpy.float32,
+        Qgis.DataType.Float64: numpy.float64,
+        Qgis.DataType.CInt16: None,
+        Qgis.DataType.CInt32: None,
+        Qgis.DataType.CFloat32: numpy.complex64,
+        Qgis.DataType.CFloat64: numpy.complex128,
+        Qgis.DataType.ARGB32: None,
+        Qgis.DataType.ARGB32_Premultiplied: None
+    }
+    return qgis_to_numpy_dtype_dict[dataType]
+
+
+def _raster_block_as_numpy(self, use_masking:bool = True) -> typing.Union[numpy.ndarray, numpy.ma.MaskedArray]:
+    raster_dtype = _qgis_data_type_to_numeric_data_type(self.dataType())
+    if not raster_dtype:
+        raise ValueError(f"The raster block data type '{str(self.dataType())}' is not compatible with NumPy arrays.")
+    src_array = numpy.frombuffer(self.data(), dtype=raster_dtype)
+    src_array = src_array.reshape((self.height(), self.width()))
+    if use_masking:
+        if not self.hasNoDataValue():
+            # Default to 0 as noDataValue if none is set
+            no_data_value = 0
+        else:
+            no_data_value = self.noDataValue()
+        return numpy.ma.masked_equal(src_array, no_data_value)
+    else:
+        return src_array
+
+
+class _RasterBlockNumpyView:
+    """
+    NumPy view of the data of a QgsRasterBlock, see QgsRasterBlock.numpy_view
+    """
+
+    def __init__(self, block, writable: bool = False):
+        raster_dtype = _qgis_data_type_to_numeric_data_type(block.dataType())
+        if not raster_dtype:
+            raise ValueError(f"The raster block data type '{str(block.dataType())}' is not compatible with NumPy arrays.")
+        self.block = block
+        self.writable = writable
+        # The array shares the memory of the QByteArray returned by data(), or of a
+        # bytearray copy of it if the view is writable
+        self._buffer = bytearray(block.data()) if writable else block.data()
+        self.array = numpy.frombuffer(self._buffer, dtype=raster_dtype).reshape((block.height(), block.width()))
+        self._mask = None
+
+    @property
+    def mask(self) -> numpy.ndarray:
+        """
+        Boolean array of the nodata pixels, computed on first access
+        """
+        if self._mask is None:
+            # Default to 0 as noDataValue if none is set
+            no_data_value = self.block.noDataValue() if self.block.hasNoDataValue() else 0
+            if numpy.isnan(no_data_value):
+                self._mask = numpy.isnan(self.array)
+            else:
+                self._mask = self.array == no_data_value
+        return self._mask
+
+    def masked(self) -> numpy.ma.MaskedArray:
+        """
+        Returns a masked array sharing the data of the view, masking the nodata pixels
+        """
+        return numpy.ma.MaskedArray(self.array, mask=self.mask, copy=False)
+
+    def release(self):
+        """
+        Writes the data of a writable view back to the block
+        """
+        if self.writable and self._buffer is not None:
+            self.block.setData(self._buffer)
+        self._buffer = None
+        self.array = None
+        self._mask = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Discard the changes
+            self.writable = False
+        self.release()
+
+
+def _raster_block_numpy_view(self, writable: bool = False) -> _RasterBlockNumpyView:
+    """
+    Returns a view of the block data as a numpy array, without copying it again.
+
+    The `array` attribute of the returned view shares the memory of the block data. It is read-only, unless `writable` is `True`, in which case the changes are written back to the block when the view is released, either with `release()` or when leaving a `with` block:
+
+    .. code-block:: python
+
+        with block.numpy_view(writable=True) as view:
+            view.array[view.mask] = 0
+
+    The `mask` attribute of the view is a boolean array of the nodata pixels, only computed when first used, and `masked()` returns a numpy masked array sharing the data of the view.
+
+    :raises QgsNotSupportedException: if numpy is not available on the system
+    """
+    return _RasterBlockNumpyView(self, writable)
+
+
+def _raster_layer_as_numpy(self, use_masking=True, bands: typing.Optional[typing.List[int]] = None, max_workers: int = 1, tile_height: typing.Optional[int] = None) -> typing.List[typing.Union[numpy.ndarray, numpy.ma.MaskedArray]]:
+    """
+    Returns the layer data as a numpy array.
+
+    If `use_masking` is `True` then the returned arrays will be numpy masked arrays, masking the raster block's nodata values.
+
+    If `bands` is provided, only the specified bands will be included in the returned array; otherwise, all bands will be used.
+
+    If `max_workers` is greater than 1, the bands are read concurrently by as many threads, each with its own clone of the data provider. If `tile_height` is provided, each band is read in tiles of that many rows, which can also be read concurrently.
+
+    :raises QgsNotSupportedException: if numpy is not available on the system
+
+    .. versionadded:: 3.40
+    """
+    provider = self.dataProvider()
+    band_range = list(bands) if bands else list(range(self.bandCount()))
+    width = self.width()
+    height = self.height()
+    extent = self.extent()
+    y_resolution = extent.height() / height
+
+    dtypes = []
+    for band in band_range:
+        raster_dtype = _qgis_data_type_to_numeric_data_type(provider.dataType(band + 1))
+        if not raster_dtype:
+            raise ValueError(f"The raster block data type '{str(provider.dataType(band + 1))}' is not compatible with NumPy arrays.")
+        dtypes.append(raster_dtype)
+
+    # Blocks are written directly into the result, rather than stacked afterwards
+    shape = (len(band_range), height, width)
+    array = numpy.empty(shape, dtype=numpy.result_type(*dtypes))
+    mask = numpy.empty(shape, dtype=bool) if use_masking else None
+    rows = tile_height or height
+    tiles = [(i, band, y0, min(y0 + rows, height)) for i, band in enumerate(band_range) for y0 in range(0, height, rows)]
+
+    parallel = max_workers > 1 and len(tiles) > 1
+    providers = threading.local()
+    clones = []
+
+    def read_tile(tile):
+        i, band, y0, y1 = tile
+        tile_provider = provider
+        if parallel:
+            # Each thread reads from its own clone of the provider
+            tile_provider = getattr(providers, 'provider', None)
+            if tile_provider is None:
+                tile_provider = providers.provider = provider.clone()
+                clones.append(tile_provider)
+        tile_extent = QgsRectangle(extent.xMinimum(), extent.yMaximum() - y1 * y_resolution,
+                                   extent.xMaximum(), extent.yMaximum() - y0 * y_resolution)
+        with tile_provider.block(band + 1, tile_extent, width, y1 - y0).numpy_view() as view:
+            array[i, y0:y1] = view.array
+            if use_masking:
+                mask[i, y0:y1] = view.mask
+
+    if parallel:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            # Provider reads release the GIL
+            for _ in executor.map(read_tile, tiles):
+                pass
+    else:
+        for tile in tiles:
+            read_tile(tile)
+
+    if use_masking:
+        return numpy.ma.MaskedArray(array, mask=mask, copy=False)
+    else:
+        return array
+
+
+class _RasterNumpyBlock(typing.NamedTuple):
+    array: typing.Union[numpy.ndarray, numpy.ma.MaskedArray]
+    column: int
+    row: int
+    extent: QgsRectangle
+
+
+def _raster_layer_iter_numpy_blocks(self, block_size: typing.Union[int, typing.Tuple[int, int]] = 1024, bands: typing.Optional[typing.List[int]] = None, overlap: int = 0, use_masking: bool = True) -> typing.Iterator[_RasterNumpyBlock]:
+    """
+    Iterates over the layer data in tiles of numpy arrays, so that rasters of any size can be processed in bounded memory.
+
+    Each item is a named tuple of the `array` of the tile, with shape `(bands, rows, columns)`, the `column` and `row` of its first pixel in the layer, and its `extent` in layer coordinates.
+
+    `block_size` is the size of the tiles in pixels, either a single value or a `(width, height)` tuple. Tiles are extended by `overlap` pixels on each side, except at the edges of the layer.
+
+    If `bands` is provided, only the specified bands will be included in the arrays; otherwise, all bands will be used.
+
+    If `use_masking` is `True` then the arrays will be numpy masked arrays, masking the raster blocks' nodata values.
+
+    The arrays of all tiles share the same memory, so they must be copied to be kept after the next tile is read.
+
+    .. code-block:: python
+
+        for tile in layer.iter_numpy_blocks(block_size=2048, bands=[0]):
+            total += tile.array.sum()
+
+    :raises QgsNotSupportedException: if numpy is not available on the system
+    """
+    provider = self.dataProvider()
+    band_range = list(bands) if bands else list(range(self.bandCount()))
+    block_width, block_height = (block_size, block_size) if isinstance(block_size, int) else block_size
+    width = self.width()
+    height = self.height()
+    extent = self.extent()
+    x_resolution = extent.width() / width
+    y_resolution = extent.height() / height
+
+    dtypes = []
+    for band in band_range:
+        raster_dtype = _qgis_data_type_to_numeric_data_type(provider.dataType(band + 1))
+        if not raster_dtype:
+            raise ValueError(f"The raster band {band + 1} data type '{str(provider.dataType(band + 1))}' is not compatible with NumPy arrays.")
+        dtypes.append(raster_dtype)
+
+    # Every tile is read into the same buffers
+    shape = (len(band_range), block_height + 2 * overlap, block_width + 2 * overlap)
+    buffer = numpy.empty(shape, dtype=numpy.result_type(*dtypes))
+    mask_buffer = numpy.empty(shape, dtype=bool) if use_masking else None
+
+    for row in range(0, height, block_height):
+        for column in range(0, width, block_width):
+            x0 = max(column - overlap, 0)
+            y0 = max(row - overlap, 0)
+            x1 = min(column + block_width + overlap, width)
+            y1 = min(row + block_height + overlap, height)
+            tile_extent = QgsRectangle(extent.xMinimum() + x0 * x_resolution, extent.yMaximum() - y1 * y_resolution,
+                                       extent.xMinimum() + x1 * x_resolution, extent.yMaximum() - y0 * y_resolution)
+            array = buffer[:, :y1 - y0, :x1 - x0]
+            mask = mask_buffer[:, :y1 - y0, :x1 - x0] if use_masking else None
+            for i, band in enumerate(band_range):
+                with provider.block(band + 1, tile_extent, x1 - x0, y1 - y0).numpy_view() as view:
+                    array[i] = view.array
+                    if use_masking:
+                        mask[i] = view.mask
+            if use_masking:
+                array = numpy.ma.MaskedArray(array, mask=mask, copy=False)
+            yield _RasterNumpyBlock(array, x0, y0, tile_extent)
+
+
+def _qgsgeometry_as_numpy_vertices(self) -> typing.Union[numpy.ndarray, typing.List[numpy.ndarray]]:
+    # Used for the geometries which cannot be decoded from WKB, e.g. curves
+    wkb_type = self.wkbType()
+    hasM = QgsWkbTypes.hasM(wkb_type)
+    hasZ = QgsWkbTypes.hasZ(wkb_type)
+    geometry_type = self.type()
+
+    def get_xyzm_coordinates(pt):
+        if hasZ and hasM:
+            return numpy.array([pt.x(), pt.y(), pt.z(), pt.m()])
+        elif hasZ:
+            return numpy.array([pt.x(), pt.y(), pt.z()])
+        elif hasM:
+            return numpy.array([pt.x(), pt.y(), pt.m()])
+        else:
+            return numpy.array([pt.x(), pt.y()])
+
+    def fill_structure_with_elements(lst: typing.List, elements: typing.List, idx: int=0):
+        for i in range(len(lst)):
+            if isinstance(lst[i], list):
+                idx = fill_structure_with_elements(lst[i], elements, idx)
+            else:
+                lst[i] = numpy.array(elements[idx])
+                idx += 1
+        return idx
+
+    if self.isMultipart():
+        elements = [get_xyzm_coordinates(i) for i in self.vertices()]
+
+        if geometry_type == QgsWkbTypes.PointGeometry:
+            skeleton = self.asMultiPoint()
+            fill_structure_with_elements(skeleton, elements)
+            return skeleton
+
+        elif geometry_type == QgsWkbTypes.LineGeometry:
+            skeleton = self.asMultiPolyline()
+            fill_structure_with_elements(skeleton, elements)
+            return skeleton
+
+        elif geometry_type == QgsWkbTypes.PolygonGeometry:
+            skeleton = self.asMultiPolygon()
+            fill_structure_with_elements(skeleton, elements)
+            return skeleton
+    else:
+        if geometry_type == QgsWkbTypes.PointGeometry:
+            return numpy.array([get_xyzm_coordinates(i) for i in self.vertices()][0])
+        elif geometry_type == QgsWkbTypes.LineGeometry:
+            line = self.vertices()
+            return numpy.array([get_xyzm_coordinates(pt) for pt in line])
+        elif geometry_type == QgsWkbTypes.PolygonGeometry:
+            skeleton = self.asPolygon()
+            elements = [get_xyzm_coordinates(i) for i in self.vertices()]
+            fill_structure_with_elements(skeleton, elements)
+            return numpy.array(skeleton)
+
+
+def _qgsgeometry_as_numpy(self) -> typing.Union[numpy.ndarray, typing.List[numpy.ndarray]]:
+    if self.isNull():
+        return _qgsgeometry_as_numpy_vertices(self)
+    try:
+        geometry_type, coordinates, offsets = wkb.coordinate_arrays(self.asWkb().data())
+    except ValueError:
+        return _qgsgeometry_as_numpy_vertices(self)
+
+    # The parts and rings are views of the coordinates array
+    if geometry_type == wkb.POINT:
+        return coordinates[0]
+    elif geometry_type == wkb.LINESTRING:
+        return coordinates
+    elif geometry_type == wkb.POLYGON:
+        return numpy.array(numpy.split(coordinates, offsets[0][1:-1]))
+    elif geometry_type == wkb.MULTIPOINT:
+        return list(coordinates)
+    elif geometry_type == wkb.MULTILINESTRING:
+        return numpy.split(coordinates, offsets[0][1:-1])
+    else:
+        rings = numpy.split(coordinates, offsets[0][1:-1])
+        return [rings[start:end] for start, end in zip(offsets[1][:-1], offsets[1][1:])]
+
+
+def _qgsgeometry_as_coordinate_arrays(self) -> typing.Tuple[numpy.ndarray, typing.Tuple[numpy.ndarray, ...]]:
+    """
+    Returns the coordinates of the geometry as a single numpy array, with the offsets describing its structure.
+
+    The coordinates are a `(n, dims)` float array, `dims` being 2, 3 or 4 depending on the Z and M values. The offsets are a tuple of integer arrays, like `shapely.to_ragged_array`:
+
+    - point, line string, multi point: no offsets
+    - polygon: the offsets of the rings in the coordinates
+    - multi line string: the offsets of the lines in the coordinates
+    - multi polygon: the offsets of the rings in the coordinates, and the offsets of the parts in the rings
+
+    Curved geometries are segmentized first.
+
+    :raises ValueError: if the geometry is null or a geometry collection
+    :raises QgsNotSupportedException: if numpy is not available on the system
+    """
+    geometry = self.constGet()
+    if geometry is None:
+        raise ValueError('Null geometries cannot be converted to coordinate arrays')
+    if QgsWkbTypes.isCurvedType(geometry.wkbType()):
+        geometry = geometry.segmentize()
+    _, coordinates, offsets = wkb.coordinate_arrays(geometry.asWkb().data())
+    return coordinates, offsets
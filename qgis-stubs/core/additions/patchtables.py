@@ -0,0 +1,92 @@
+"""
+***************************************************************************
+    patchtables.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import importlib
+
+from qgis.core.additions.importprofiler import current_profile
+
+# Metadata attributes holding dicts, which are stored as tuples of pairs
+DICT_ATTRIBUTES = frozenset({'__annotations__', '__attribute_docs__', '__signal_arguments__'})
+
+
+def _thaw(value):
+    if value.__class__ is tuple:
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _resolve(namespace, owner):
+    name, *attributes = owner.split('.')
+    obj = namespace[name]
+    for attribute in attributes:
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def apply_class_patches(obj, operations):
+    """
+    Applies the patches of a single class, in order.
+
+    An operation is either the name of a method to turn into a staticmethod
+    or an ``(attribute, value)`` pair of class metadata. Lists are stored as
+    tuples in the table and dicts as tuples of ``(key, value)`` pairs.
+
+    :raises AttributeError: if a method does not exist in this build, in which case
+        the remaining operations are not applied
+    """
+    for operation in operations:
+        if operation.__class__ is str:
+            setattr(obj, operation, staticmethod(getattr(obj, operation)))
+            continue
+        attribute, value = operation
+        if attribute in DICT_ATTRIBUTES:
+            value = {key: _thaw(v) for key, v in value}
+        else:
+            value = _thaw(value)
+        setattr(obj, attribute, value)
+
+
+def apply_patches(namespace, table_module):
+    """
+    Applies the generated class patches of a module from its patch table.
+
+    The patch table is a module with a ``PATCHES`` tuple of
+    ``(header, ((class, operations), ...))`` sections, where ``header`` is the
+    C++ header the patches were generated from. Each class is handled like the
+    ``try: ... except (NameError, AttributeError): pass`` block it replaces:
+    classes missing from ``namespace`` are skipped without raising, and the
+    patches of a class stop at the first missing method.
+
+    When the import is being profiled, the time spent on each section is recorded
+    under its header.
+
+    :param namespace: the module globals the classes are resolved in
+    :param table_module: the name of the patch table module
+    :return: the number of classes which were patched completely
+    """
+    profile = current_profile()
+    count = 0
+    for header, classes in importlib.import_module(table_module).PATCHES:
+        if profile is not None:
+            profile.push(header)
+        for owner, operations in classes:
+            try:
+                apply_class_patches(_resolve(namespace, owner), operations)
+            except (KeyError, AttributeError):
+                continue
+            count += 1
+        if profile is not None:
+            profile.pop()
+    return count
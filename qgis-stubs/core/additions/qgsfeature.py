@@ -15,8 +15,15 @@
 ***************************************************************************
 """
 
+import itertools
+
 from PyQt5.QtCore import QVariant
 
+from .qgsgeometry import _mapping_geometry
+
+# Number of features whose attributes are normalized at once
+DEFAULT_CHUNK_SIZE = 1024
+
 
 def _mapping_feature(feature):
     geom = feature.geometry()
@@ -29,3 +36,90 @@ def _mapping_feature(feature):
         "properties": properties,
         "geometry": geom.__geo_interface__,
     }
+
+
+def _normalize_column(column):
+    # NULL values are only looked for in the columns holding QVariant values
+    for value in column:
+        if value.__class__ is QVariant:
+            return [None if isinstance(v, QVariant) and v.isNull() else v for v in column]
+    return column
+
+
+def _iter_feature_mappings(features, names=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yields the ``__geo_interface__`` mapping of each feature, handling them in chunks.
+
+    :param features: an iterable of QgsFeature
+    :param names: the field names, by default those of the first feature
+    :param chunk_size: the number of features whose attributes are normalized at once
+    """
+    features = iter(features)
+    while True:
+        chunk = list(itertools.islice(features, chunk_size))
+        if not chunk:
+            return
+        if names is None:
+            names = chunk[0].fields().names()
+        columns = [_normalize_column(column) for column in zip(*(feature.attributes() for feature in chunk))]
+        rows = zip(*columns) if columns else itertools.repeat((), len(chunk))
+        for feature, row in zip(chunk, rows):
+            yield {
+                "type": "Feature",
+                "properties": dict(zip(names, row)),
+                "geometry": _mapping_geometry(feature.geometry()),
+            }
+
+
+class FeatureMappings:
+    """
+    Lazy sequence of the ``__geo_interface__`` mappings of the features of a vector layer.
+
+    Each iteration requests the features again, so the features of large layers are
+    never all held in memory.
+    """
+
+    def __init__(self, layer, request=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.layer = layer
+        self.request = request
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        if self.request is None:
+            features = self.layer.getFeatures()
+        else:
+            features = self.layer.getFeatures(self.request)
+        return _iter_feature_mappings(features, self.layer.fields().names(), self.chunk_size)
+
+    def __len__(self):
+        if self.request is None:
+            return self.layer.featureCount()
+        return sum(1 for _ in self.layer.getFeatures(self.request))
+
+
+def _layer_geo_interface(layer, request=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns the features of the layer as a GeoJSON like FeatureCollection mapping.
+
+    The ``features`` of the collection are a lazy sequence, which requests the features
+    from the layer each time it is iterated.
+
+    :param request: an optional QgsFeatureRequest to filter the features
+    :param chunk_size: the number of features whose attributes are normalized at once
+    """
+    return {"type": "FeatureCollection", "features": FeatureMappings(layer, request, chunk_size)}
+
+
+def _mapping_layer(layer):
+    return _layer_geo_interface(layer)
+
+
+def _feature_iterator_geo_interface(iterator, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns the remaining features of the iterator as a GeoJSON like FeatureCollection mapping.
+
+    The ``features`` of the collection are a generator, which can only be iterated once.
+
+    :param chunk_size: the number of features whose attributes are normalized at once
+    """
+    return {"type": "FeatureCollection", "features": _iter_feature_mappings(iterator, chunk_size=chunk_size)}
@@ -0,0 +1,142 @@
+"""
+***************************************************************************
+    qgsfeatureiterator.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import numpy
+from PyQt5.QtCore import QDate, QDateTime, QTime, QVariant
+from qgis._core import QgsFeature
+
+DEFAULT_BATCH_SIZE = 65536
+
+# Field types stored in numpy arrays of fixed size values, the others are stored as objects
+_NUMPY_TYPES = {
+    QVariant.Bool: "bool",
+    QVariant.Int: "int32",
+    QVariant.UInt: "uint32",
+    QVariant.LongLong: "int64",
+    QVariant.ULongLong: "uint64",
+    QVariant.Double: "float64",
+}
+
+
+def _python_value(value):
+    if value is None:
+        return None
+    cls = value.__class__
+    if cls is QVariant:
+        return None if value.isNull() else value.value()
+    if cls is QDateTime:
+        return value.toPyDateTime() if value.isValid() else None
+    if cls is QDate:
+        return value.toPyDate() if value.isValid() else None
+    if cls is QTime:
+        return value.toPyTime() if value.isValid() else None
+    return value
+
+
+def _column(values, dtype):
+    """
+    Returns the array of the values of a field: a masked array of ``dtype``, masking the
+    NULL values, or an object array with None for NULL values if ``dtype`` is None.
+    """
+    if dtype is None:
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = [_python_value(value) for value in values]
+        return column
+    mask = numpy.fromiter(
+        (value is None or value.__class__ is QVariant for value in values), dtype=bool, count=len(values)
+    )
+    if mask.any():
+        values = [0 if null else value for value, null in zip(values, mask)]
+        return numpy.ma.MaskedArray(numpy.array(values, dtype=dtype), mask=mask)
+    return numpy.ma.MaskedArray(numpy.array(values, dtype=dtype))
+
+
+def _check_geometry_column(names, fid_column, geometry_column):
+    """
+    Raises a ValueError if the geometry column would replace a field or the feature ids.
+    """
+    if geometry_column in names or geometry_column == fid_column:
+        raise ValueError(
+            f"The geometry column name '{geometry_column}' is already used, pass another geometry_column"
+        )
+
+
+def _feature_iterator_to_columns(
+    iterator,
+    batch_size=DEFAULT_BATCH_SIZE,
+    fields=None,
+    attributes=None,
+    geometry=True,
+    fid_column="fid",
+    geometry_column="geometry",
+):
+    """
+    Reads the remaining features of the iterator in batches of columns.
+
+    Each batch is a dict of numpy arrays with one value per feature:
+
+    - the feature ids, under ``fid_column`` unless a field has the same name
+    - one array per field: a masked array masking the NULL values for boolean and
+      numeric fields, otherwise an object array holding None for NULL values, with
+      dates and times converted to :py:mod:`datetime` objects
+    - the geometries as WKB bytes, or None for features without a geometry, under
+      ``geometry_column`` if ``geometry`` is True, which must not be the name of a field
+
+    A single QgsFeature is filled with each feature in turn, rather than creating
+    one Python object per feature.
+
+    :param batch_size: the maximum number of features per batch
+    :param fields: the QgsFields of the features, by default those of the first feature
+    :param attributes: the indexes of the fields to include, by default all of them
+    :param geometry: whether the geometries are included
+
+    :raises ValueError: if ``geometry_column`` is the name of a field or ``fid_column``
+    :raises QgsNotSupportedException: if numpy is not available on the system
+    """
+    feature = QgsFeature()
+    names = None
+    while True:
+        fids = []
+        rows = []
+        wkbs = []
+        while len(fids) < batch_size and iterator.nextFeature(feature):
+            fids.append(feature.id())
+            rows.append(feature.attributes())
+            if geometry:
+                feature_geometry = feature.geometry()
+                wkbs.append(None if feature_geometry.isNull() else feature_geometry.asWkb().data())
+        if not fids:
+            return
+
+        if names is None:
+            if fields is None:
+                fields = feature.fields()
+            indexes = list(range(fields.count())) if attributes is None else list(attributes)
+            names = [fields.at(index).name() for index in indexes]
+            dtypes = [_NUMPY_TYPES.get(fields.at(index).type()) for index in indexes]
+            if geometry:
+                _check_geometry_column(names, fid_column, geometry_column)
+
+        columns = list(zip(*rows))
+        batch = {}
+        if fid_column not in names:
+            batch[fid_column] = numpy.array(fids, dtype=numpy.int64)
+        for index, name, dtype in zip(indexes, names, dtypes):
+            batch[name] = _column(columns[index], dtype)
+        if geometry:
+            column = numpy.empty(len(wkbs), dtype=object)
+            column[:] = wkbs
+            batch[geometry_column] = column
+        yield batch
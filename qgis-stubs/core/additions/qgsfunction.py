@@ -15,19 +15,330 @@
 ***************************************************************************
 """
 
+import collections
+import importlib
 import inspect
+import math
+import os
 import string
+import sys
+import threading
+import time
 import traceback
 
-from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtCore import QCoreApplication, QVariant
 from qgis._core import (
     QgsExpressionFunction,
     QgsExpression,
     QgsMessageLog,
     QgsFeatureRequest,
+    QgsNotSupportedException,
     Qgis,
 )
 
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_PARALLEL_BATCH_SIZE = 64
+STATS_ENV = "QGIS_EXPRESSION_FUNCTION_STATS"
+STATS_PROFILER_GROUP = "pyexpressions"
+
+_MISSING = object()
+# Registered functions with a cache, by name
+_cached_functions = {}
+_sip_unregister_function = QgsExpression.unregisterFunction
+# Function name -> [calls, total seconds, max seconds, exceptions], None if disabled
+_stats = {} if os.environ.get(STATS_ENV) else None
+_stats_lock = threading.Lock()
+# Executor running parallel functions, and the maximum number of batches submitted at once
+_executor = None
+_executor_workers = None
+_executor_lock = threading.Lock()
+# Functions resolved by worker processes, by (module, qualified name)
+_worker_functions = {}
+
+
+class ExpressionFunctionCache:
+    """
+    Bounded, thread-safe LRU cache of the results of an expression function,
+    keyed on the values of its arguments.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(values):
+        """
+        Returns the cache key of argument values, or None if they cannot be cached.
+
+        NULL values are normalized to None. Values are keyed with their type, as equal
+        values of different types (e.g. ``1``, ``1.0`` and ``True``) may give different results.
+        """
+        key = tuple(
+            (None, None) if isinstance(value, QVariant) and value.isNull() else (value.__class__, value)
+            for value in values
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def lookup(self, key):
+        """
+        Returns the cached result for ``key``, or a sentinel if there is none.
+        """
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            self._results.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def store(self, key, result):
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        with self._lock:
+            self._results.clear()
+
+    def info(self):
+        """
+        Returns a dict with the ``hits``, ``misses``, current ``size`` and ``maxsize`` of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._results),
+                "maxsize": self.maxsize,
+            }
+
+
+class ParallelFunctionError(Exception):
+    """
+    Exception raised by a parallel expression function in a worker process.
+    """
+
+    def __init__(self, type_name, message, location, formatted_traceback):
+        super().__init__(f"{type_name}: {message}")
+        self.type_name = type_name
+        # (file name, line number) the exception was raised at
+        self.location = location
+        self.formatted_traceback = formatted_traceback
+
+
+def _python_executable():
+    # Inside the QGIS application, sys.executable is the application itself
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    name = "python.exe" if sys.platform == "win32" else "python3"
+    for directory in (sys.exec_prefix, os.path.join(sys.exec_prefix, "bin")):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    return sys.executable
+
+
+def parallel_executor():
+    """
+    Returns the executor running parallel expression functions.
+
+    Unless one was set with :py:func:`set_parallel_executor`, a process pool with one worker
+    per CPU is created on first use.
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None:
+            import concurrent.futures
+            import multiprocessing
+
+            context = multiprocessing.get_context("spawn")
+            context.set_executable(_python_executable())
+            _executor_workers = os.cpu_count() or 1
+            _executor = concurrent.futures.ProcessPoolExecutor(_executor_workers, mp_context=context)
+        return _executor
+
+
+def set_parallel_executor(executor, max_workers=None):
+    """
+    Sets the executor running parallel expression functions, e.g. a process pool with
+    a custom initializer. The previous executor is not shut down.
+
+    :param executor: a :py:class:`concurrent.futures.Executor`, or None to use the default process pool
+    :param max_workers: the maximum number of batches submitted to the executor at once,
+        by default the number of CPUs
+    """
+    global _executor, _executor_workers
+    with _executor_lock:
+        _executor = executor
+        _executor_workers = max_workers or os.cpu_count() or 1
+
+
+def _function_reference(function):
+    """
+    Returns the ``(module, qualified name)`` parallel functions are imported from by the workers.
+    """
+    module = getattr(function, "__module__", None)
+    qualname = getattr(function, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        raise ValueError(
+            "Parallel expression functions must be defined at the top level of an importable module"
+        )
+    return module, qualname
+
+
+def _error_details(ex):
+    """
+    Returns the ``(type name, message, location, formatted traceback)`` of an exception,
+    as passed to :py:class:`ParallelFunctionError`.
+    """
+    tb = ex.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    location = (tb.tb_frame.f_code.co_filename, tb.tb_lineno) if tb is not None else (None, None)
+    formatted_traceback = "".join(traceback.format_exception(None, ex, ex.__traceback__))
+    return type(ex).__name__, str(ex), location, formatted_traceback
+
+
+def _evaluate_in_worker(reference, params_as_list, rows):
+    # Runs in a worker process: the module of the function is imported there,
+    # so the function is the attribute it was decorated as
+    function = _worker_functions.get(reference)
+    if function is None:
+        module, qualname = reference
+        function = importlib.import_module(module)
+        for name in qualname.split("."):
+            function = getattr(function, name)
+        if isinstance(function, QgsPyExpressionFunction):
+            function = function.function
+        _worker_functions[reference] = function
+
+    results = []
+    for values in rows:
+        try:
+            results.append((True, function(values) if params_as_list else function(*values)))
+        except Exception as ex:
+            results.append((False, _error_details(ex)))
+    return results
+
+
+class _ParallelBatcher:
+    """
+    Groups the calls of a parallel function made by concurrent threads into batches.
+
+    A call made while fewer batches than workers are running is submitted at once. Otherwise
+    calls are queued until a worker is free or ``batch_size`` calls are waiting, and then
+    submitted as a single batch. The calling threads wait without holding the GIL.
+    """
+
+    def __init__(self, reference, params_as_list, batch_size):
+        self.reference = reference
+        self.params_as_list = params_as_list
+        self.batch_size = batch_size
+        self._condition = threading.Condition()
+        # [values, result, done] of the queued calls
+        self._pending = []
+        self._running = 0
+
+    def evaluate(self, rows):
+        """
+        Evaluates rows of argument values in the workers, in batches of ``batch_size``.
+
+        :return: a ``(succeeded, result)`` pair for each row
+        """
+        executor = parallel_executor()
+        rows = [[None if isinstance(value, QVariant) and value.isNull() else value for value in values] for values in rows]
+        futures = [
+            executor.submit(_evaluate_in_worker, self.reference, self.params_as_list, rows[i:i + self.batch_size])
+            for i in range(0, len(rows), self.batch_size)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def call(self, values):
+        entry = [values, None, threading.Event()]
+        with self._condition:
+            self._pending.append(entry)
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+        if leader:
+            self._submit()
+        entry[2].wait()
+
+        succeeded, result = entry[1]
+        if succeeded:
+            return result
+        raise ParallelFunctionError(*result)
+
+    def _submit(self):
+        # Every queued call must get a result whatever happens here, as their threads
+        # wait for it without a timeout
+        batch = None
+        results = []
+        error = None
+        try:
+            parallel_executor()
+            with self._condition:
+                while len(self._pending) < self.batch_size and self._running >= _executor_workers:
+                    self._condition.wait()
+                batch, self._pending = self._pending, []
+                self._running += 1
+            try:
+                results = self.evaluate([entry[0] for entry in batch])
+            finally:
+                with self._condition:
+                    self._running -= 1
+                    self._condition.notify_all()
+        except BaseException as ex:
+            # e.g. the executor cannot be created, the function or its arguments cannot
+            # be pickled, or a worker died
+            error = _error_details(ex)
+            if not isinstance(ex, Exception):
+                raise
+        finally:
+            if batch is None:
+                with self._condition:
+                    batch, self._pending = self._pending, []
+            if error is None and len(results) != len(batch):
+                error = (
+                    "RuntimeError",
+                    f"missing result, the workers returned {len(results)} results for {len(batch)} calls",
+                    (None, None),
+                    "",
+                )
+            if error is not None:
+                results = [(False, error)] * len(batch)
+            for entry, result in zip(batch, results):
+                entry[1] = result
+                entry[2].set()
+
+
+def _block_key(values):
+    # Key of argument values in the results of a block, NULL values are normalized to None
+    return tuple(None if isinstance(value, QVariant) and value.isNull() else value for value in values)
+
+
+def _unregister_function(name):
+    # Replaces QgsExpression.unregisterFunction, invalidating the cache of the function
+    function = _cached_functions.pop(name, None)
+    if function is not None:
+        function.cache.clear()
+    return _sip_unregister_function(name)
+
 
 class QgsPyExpressionFunction(QgsExpressionFunction):
     """Python expression function"""
@@ -42,48 +353,355 @@ class QgsPyExpressionFunction(QgsExpressionFunction):
         referenced_columns=QgsFeatureRequest.ALL_ATTRIBUTES,
         handlesnull=False,
         params_as_list=False,
+        vectorized=False,
+        cache=None,
+        error_limit=None,
+        parallel=None,
     ):
         # Call the parent constructor
         # -1 means that function can take any number of arguments
         QgsExpressionFunction.__init__(self, name, -1, group, helptext)
+        self._name = name
         self.function = function
         self.params_as_list = params_as_list
         self.usesgeometry = usesgeometry
         self.referenced_columns = referenced_columns
         self.handlesnull = handlesnull
+        self.vectorized = vectorized
+        self.cache = ExpressionFunctionCache(cache) if cache else None
+        self.parallel = parallel
+        self.error_limit = error_limit
+        self._errors_lock = threading.Lock()
+        # (exception type, file, line) -> [formatted traceback, count]
+        self._errors = {}
+        # Number of failed calls since the last successful one
+        self._error_count = 0
+        # Set once error_limit is reached
+        self._disabled_message = None
+        # Per thread state of evaluate_in_blocks()
+        self._block = threading.local()
+        self._call = self._make_call()
 
-    def func(self, values, context, parent, node):
-        feature = None
-        if context:
-            feature = context.feature()
+    def _make_call(self):
+        """
+        Returns a callable taking ``(values, context, parent, node)`` which invokes the function.
+
+        The signature of the function is inspected once here rather than on every evaluation,
+        and the returned callable only injects the special parameters the function accepts.
+        """
+        function = self.function
+        params_as_list = self.params_as_list
         try:
-            # Inspect the inner function signature to get the list of parameters
-            parameters = inspect.signature(self.function).parameters
-            kwvalues = {}
+            parameters = inspect.signature(function).parameters
+        except (TypeError, ValueError):
+            parameters = {}
+        wants_context = "context" in parameters
+        wants_feature = "feature" in parameters
+        wants_parent = "parent" in parameters
+
+        wants_special = wants_context or wants_feature or wants_parent
 
+        if self.vectorized:
+            if wants_special:
+                raise ValueError("Vectorized expression functions cannot take the context, feature or parent parameters")
+            if self.cache is not None:
+                raise ValueError("Vectorized expression functions cannot be cached")
+            return self._make_vectorized_call()
+
+        if self.parallel:
+            if wants_special:
+                raise ValueError("Parallel expression functions cannot take the context, feature or parent parameters")
+            if self.cache is not None:
+                raise ValueError("Parallel expression functions cannot be cached")
+            return self._make_parallel_call()
+
+        if self.cache is not None:
+            if wants_special:
+                raise ValueError("Cached expression functions cannot take the context, feature or parent parameters")
+            return self._make_cached_call()
+
+        if not wants_special:
+            if params_as_list:
+                return lambda values, context, parent, node: function(values)
+            return lambda values, context, parent, node: function(*values)
+
+        def call(values, context, parent, node):
             # Handle special parameters
             # those will not be inserted in the arguments list
             # if they are present in the function signature
-            if "context" in parameters:
+            kwvalues = {}
+            if wants_context:
                 kwvalues["context"] = context
-            if "feature" in parameters:
-                kwvalues["feature"] = feature
-            if "parent" in parameters:
+            if wants_feature:
+                kwvalues["feature"] = context.feature() if context else None
+            if wants_parent:
                 kwvalues["parent"] = parent
 
             # In this context, values is a list of the parameters passed to the expression.
-            # If self.params_as_list is True, values is passed as is to the inner function.
-            if self.params_as_list:
-                return self.function(values, **kwvalues)
+            # If params_as_list is True, values is passed as is to the inner function.
+            if params_as_list:
+                return function(values, **kwvalues)
             # Otherwise (default), the parameters are expanded
-            return self.function(*values, **kwvalues)
+            return function(*values, **kwvalues)
+
+        return call
+
+    def _make_cached_call(self):
+        function = self.function
+        params_as_list = self.params_as_list
+        cache = self.cache
+
+        def call(values, context, parent, node):
+            key = cache.key(values)
+            if key is None:
+                return function(values) if params_as_list else function(*values)
+            result = cache.lookup(key)
+            if result is _MISSING:
+                # Results are only cached if the function did not raise
+                result = function(values) if params_as_list else function(*values)
+                cache.store(key, result)
+            return result
+
+        return call
 
+    def _make_vectorized_call(self):
+        try:
+            import numpy
+        except ModuleNotFoundError:
+            raise QgsNotSupportedException(
+                "Vectorized expression functions are not available, numpy is not installed on the system"
+            )
+        function = self.function
+        params_as_list = self.params_as_list
+
+        def evaluate(values):
+            # A single evaluation calls the function with scalars rather than with
+            # arrays of one value
+            values = [None if isinstance(value, QVariant) and value.isNull() else value for value in values]
+            result = function(values) if params_as_list else function(*values)
+            if isinstance(result, numpy.ndarray):
+                if result.size != 1:
+                    raise ValueError(f"{self.name()} returned {result.size} values for 1 row")
+                result = result.reshape(-1)[0]
+            if isinstance(result, numpy.generic):
+                result = result.item()
+            if isinstance(result, float) and math.isnan(result):
+                return None
+            return result
+
+        return self._make_block_call(evaluate)
+
+    def _make_parallel_call(self):
+        self._batcher = _ParallelBatcher(_function_reference(self.function), self.params_as_list, self.parallel)
+        return self._make_block_call(self._batcher.call)
+
+    def _make_block_call(self, evaluate):
+        # Calls evaluate(values), unless evaluate_in_blocks() is evaluating a block of
+        # features: the arguments of the call are then evaluated for the whole block,
+        # and the function is called once for all of them
+        block = self._block
+
+        def call(values, context, parent, node):
+            features = getattr(block, "features", None)
+            if features is None or node is None:
+                return evaluate(values)
+            try:
+                return block.results[_block_key(values)]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable values are evaluated one at a time
+                return evaluate(values)
+            # Calls with the same arguments share their results
+            call_key = node.dump()
+            if call_key not in block.evaluated:
+                block.evaluated.add(call_key)
+                rows = self._block_arguments(node, context, features)
+                block.results.update(self._block_results(rows))
+                try:
+                    return block.results[_block_key(values)]
+                except KeyError:
+                    pass
+            # Failed rows are evaluated again to report their error
+            return evaluate(values)
+
+        return call
+
+    def _block_arguments(self, node, context, features):
+        """
+        Returns the argument values of a call of the function for each feature of a block.
+
+        Features with NULL arguments are skipped unless the function handles NULL values,
+        as the function is not called for them.
+        """
+        args = node.args()
+        arguments = args.list() if args is not None else []
+        current = context.feature()
+        rows = []
+        try:
+            for feature in features:
+                context.setFeature(feature)
+                # Errors are reported by the evaluation of the single feature
+                collector = QgsExpression()
+                values = [argument.eval(collector, context) for argument in arguments]
+                if collector.hasEvalError():
+                    continue
+                if not self.handlesnull and any(
+                    value is None or isinstance(value, QVariant) and value.isNull() for value in values
+                ):
+                    continue
+                rows.append(values)
+        finally:
+            context.setFeature(current)
+        return rows
+
+    def _block_results(self, rows):
+        """
+        Evaluates rows of argument values at once.
+
+        :return: a dict of the results by :py:func:`_block_key` of the values, without
+            the rows which failed or whose values are not hashable
+        """
+        results = {}
+        if not rows:
+            return results
+        if self.parallel:
+            try:
+                evaluated = self._batcher.evaluate(rows)
+            except Exception:
+                evaluated = []
+            evaluated = [result if succeeded else _MISSING for succeeded, result in evaluated]
+        # Variadic calls with differing argument counts are evaluated one at a time
+        elif len({len(values) for values in rows}) == 1:
+            try:
+                evaluated = self.evaluate_rows(rows)
+            except Exception:
+                evaluated = []
+        else:
+            evaluated = []
+        for values, result in zip(rows, evaluated):
+            if result is _MISSING:
+                continue
+            try:
+                results[_block_key(values)] = result
+            except TypeError:
+                pass
+        return results
+
+    def evaluate_rows(self, rows):
+        """
+        Calls a vectorized function once for several sets of argument values.
+
+        The values of each argument are passed as a numpy array, NULL values as None.
+        The function must return an array (or a scalar, which is broadcast) with one
+        value per row. NaN results are returned as None, i.e. NULL.
+
+        :param rows: a list with the argument values of each evaluation
+        :return: a list with the result of each evaluation
+        """
+        import numpy
+
+        columns = [
+            numpy.asarray([None if isinstance(value, QVariant) and value.isNull() else value for value in column])
+            for column in zip(*rows)
+        ]
+        if self.params_as_list:
+            result = self.function(columns)
+        else:
+            result = self.function(*columns)
+        result = numpy.asarray(result)
+        if result.ndim == 0:
+            result = numpy.broadcast_to(result, (len(rows),))
+        if result.shape[:1] != (len(rows),):
+            raise ValueError(
+                f"{self.name()} returned {result.shape[0] if result.ndim else 0} values for {len(rows)} rows"
+            )
+        values = result.tolist() if result.dtype != object else list(result)
+        return [None if isinstance(value, float) and math.isnan(value) else value for value in values]
+
+    def func(self, values, context, parent, node):
+        if self._disabled_message is not None:
+            parent.setEvalErrorString(self._disabled_message)
+            return None
+        if _stats is not None:
+            return self._profiled_func(values, context, parent, node)
+        try:
+            result = self._call(values, context, parent, node)
         except Exception as ex:
-            tb = traceback.format_exception(None, ex, ex.__traceback__)
-            formatted_traceback = "".join(tb)
-            formatted_exception = f"{ex}:<pre>{formatted_traceback}</pre>"
-            parent.setEvalErrorString(formatted_exception)
+            self._set_eval_error(ex, parent)
+            return None
+        if self._error_count:
+            self._error_count = 0
+        return result
+
+    def _profiled_func(self, values, context, parent, node):
+        start = time.perf_counter()
+        failed = False
+        try:
+            result = self._call(values, context, parent, node)
+        except Exception as ex:
+            failed = True
+            self._set_eval_error(ex, parent)
             return None
+        else:
+            if self._error_count:
+                self._error_count = 0
+            return result
+        finally:
+            _record_call(self._name, time.perf_counter() - start, failed)
+
+    def _set_eval_error(self, ex, parent):
+        # Identical failures (same exception type raised at the same location)
+        # are only formatted once, and then counted
+        tb = ex.__traceback__
+        while tb is not None and tb.tb_next is not None:
+            tb = tb.tb_next
+        if isinstance(ex, ParallelFunctionError):
+            key = (ex.type_name, *ex.location)
+        elif tb is not None:
+            key = (type(ex), tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+        else:
+            key = (type(ex), None, None)
+
+        with self._errors_lock:
+            self._error_count += 1
+            entry = self._errors.get(key)
+            if entry is None:
+                if isinstance(ex, ParallelFunctionError):
+                    formatted_traceback = ex.formatted_traceback
+                else:
+                    formatted_traceback = "".join(traceback.format_exception(None, ex, ex.__traceback__))
+                entry = self._errors[key] = [formatted_traceback, 0]
+            entry[1] += 1
+            formatted_traceback, count = entry
+
+            if self.error_limit and self._error_count >= self.error_limit:
+                self._disabled_message = (
+                    f"{self._name} failed {self._error_count} times in a row and is no longer evaluated, "
+                    f"last error: {ex}:<pre>{formatted_traceback}</pre>"
+                )
+
+        if count == 1:
+            formatted_exception = f"{ex}:<pre>{formatted_traceback}</pre>"
+        else:
+            formatted_exception = f"{ex} (same error {count} times):<pre>{formatted_traceback}</pre>"
+        parent.setEvalErrorString(formatted_exception)
+
+    def error_counts(self):
+        """
+        Returns the number of failed calls by ``(exception type, file name, line number)``.
+        """
+        with self._errors_lock:
+            return {key: count for key, (_, count) in self._errors.items()}
+
+    def reset_errors(self):
+        """
+        Forgets previous failures, calling the function again if ``error_limit`` was reached.
+        """
+        with self._errors_lock:
+            self._errors.clear()
+            self._error_count = 0
+            self._disabled_message = None
 
     def usesGeometry(self, node):
         return self.usesgeometry
@@ -95,6 +713,79 @@ class QgsPyExpressionFunction(QgsExpressionFunction):
         return self.handlesnull
 
 
+def _record_call(name, seconds, failed):
+    stats = _stats
+    if stats is None:
+        return
+    with _stats_lock:
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = [0, 0.0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds > entry[2]:
+            entry[2] = seconds
+        if failed:
+            entry[3] += 1
+
+
+def enable_expression_function_stats(enabled=True):
+    """
+    Enables or disables recording statistics of the evaluations of Python expression functions.
+
+    Recording can also be enabled by setting the ``QGIS_EXPRESSION_FUNCTION_STATS`` environment
+    variable. Disabling it discards the statistics recorded so far.
+
+    .. seealso:: :py:func:`expression_function_stats`
+    """
+    global _stats
+    with _stats_lock:
+        if not enabled:
+            _stats = None
+        elif _stats is None:
+            _stats = {}
+
+
+def expression_function_stats(reset=False):
+    """
+    Returns the statistics recorded for each Python expression function, by function name.
+
+    Each entry is a dict with the number of ``calls``, the ``total_seconds`` and ``max_seconds``
+    of a single call, and the number of calls which raised an exception (``exceptions``).
+    Nothing is recorded unless :py:func:`enable_expression_function_stats` was called.
+
+    :param reset: if True, the statistics are cleared after being returned
+    """
+    with _stats_lock:
+        if _stats is None:
+            return {}
+        result = {
+            name: {
+                "calls": calls,
+                "total_seconds": total,
+                "max_seconds": maximum,
+                "exceptions": exceptions,
+            }
+            for name, (calls, total, maximum, exceptions) in _stats.items()
+        }
+        if reset:
+            _stats.clear()
+    return result
+
+
+def record_expression_function_stats(group=STATS_PROFILER_GROUP):
+    """
+    Records the total time of each Python expression function in :py:func:`QgsApplication.profiler`.
+
+    :param group: the QgsRuntimeProfiler group to record the times in
+    """
+    from qgis._core import QgsApplication
+
+    profiler = QgsApplication.profiler()
+    for name, stats in sorted(expression_function_stats().items()):
+        profiler.record(f"{name} ({stats['calls']} calls)", stats["total_seconds"], group)
+
+
 def register_function(
     function,
     args="auto",
@@ -103,6 +794,10 @@ def register_function(
     referenced_columns=[QgsFeatureRequest.ALL_ATTRIBUTES],
     handlesnull=False,
     params_as_list=None,
+    vectorized=False,
+    cache=False,
+    error_limit=None,
+    parallel=False,
     **kwargs,
 ):
     """
@@ -127,6 +822,10 @@ def register_function(
     :param referenced_columns: An array of names of fields on which this expression works. By default ``[QgsFeatureRequest.ALL_ATTRIBUTES]``. Specifying a subset of fields or an empty list will result in a faster execution.
     :param handlesnull: Defines if this expression has custom handling for NULL values. If False, the result will always be NULL as soon as any parameter is NULL. False by default.
     :param params_as_list: If True, the function will receive the expression parameters as a list. If False, the function will receive the parameters as individual arguments. False by default.
+    :param vectorized: If True, the function receives a numpy array of values for each parameter and must return an array with one value per row when evaluated with :py:func:`evaluate_in_blocks`, and scalar values otherwise. It cannot take the special parameters. False by default.
+    :param cache: If True or a maximum number of results, the results of the function are cached in an LRU cache keyed on the parameter values, see :py:class:`ExpressionFunctionCache`. The cache is available as the ``cache`` attribute of the returned function and is cleared when the function is unregistered. Only use it for functions whose result only depends on their parameters, it cannot take the special parameters. False by default.
+    :param parallel: If True or a batch size, the function is run in worker processes, see :py:func:`parallel_executor`. Calls made by concurrent threads, e.g. the rendering of several layers, are sent to the workers in batches and run concurrently, and :py:func:`evaluate_in_blocks` evaluates whole blocks in the workers. Only for pure functions of their parameters defined at the top level of an importable module: they cannot take the special parameters, and their parameters and results must be picklable. False by default.
+    :param error_limit: Number of consecutive failed calls after which the function is no longer called and evaluates to NULL with an error, until ``reset_errors()`` is called on the returned function. A successful call resets the count. As the function then stays disabled for the rest of the session, in every expression using it, only set a limit for functions which cannot recover from failing. Identical errors are only formatted once. None (the default) for no limit.
 
     :Keyword Arguments:
 
@@ -159,6 +858,8 @@ def register_function(
 
     # Legacy: if args was not 'auto', parameters were passed as a list
     params_as_list = params_as_list or args != "auto"
+    cache_size = DEFAULT_CACHE_SIZE if cache is True else cache or None
+    batch_size = DEFAULT_PARALLEL_BATCH_SIZE if parallel is True else parallel or None
     f = QgsPyExpressionFunction(
         function,
         name,
@@ -168,10 +869,16 @@ def register_function(
         referenced_columns,
         handlesnull,
         params_as_list,
+        vectorized,
+        cache_size,
+        error_limit,
+        batch_size,
     )
 
     if register:
         QgsExpression.registerFunction(f)
+        if f.cache is not None:
+            _cached_functions[name] = f
     return f
 
 
@@ -204,6 +911,20 @@ def qgsfunction(args="auto", group="custom", **kwargs):
           Defines if this expression has custom handling for NULL values. If False, the result will always be NULL as soon as any parameter is NULL. False by default.
         * *params_as_list* (``bool``) \since QGIS 3.32 --
           Defines if the parameters are passed to the function as a list. If set the False, they will be expanded. By default False.
+        * *vectorized* (``bool``) --
+          Defines if the function is called with numpy arrays holding the parameter values of several features at once
+          by :py:func:`evaluate_in_blocks`, and with scalar values otherwise. By default False.
+        * *cache* (``bool`` or ``int``) --
+          If True or a maximum number of results, the results of the function are cached by parameter values.
+          Only for functions without the special parameters whose result only depends on their parameters. By default False.
+        * *parallel* (``bool`` or ``int``) --
+          If True or a batch size, the function is run in worker processes, letting concurrent threads make progress.
+          Only for functions without the special parameters defined at the top level of a module,
+          whose result only depends on their parameters. By default False.
+        * *error_limit* (``int``) --
+          Number of consecutive failed calls after which the function is no longer called and evaluates to NULL with
+          an error, in every expression using it, until ``reset_errors()`` is called on the function. A successful call
+          resets the count. Identical errors are only formatted once whatever the limit. By default None, i.e. no limit.
         * *register* (``bool``) --
             Set to False to create the QgsPyExpressionFunction without registering it. Useful for testing puposes. By default True.
         * *name* (``str``) --
@@ -298,9 +1019,100 @@ def qgsfunction(args="auto", group="custom", **kwargs):
     This registers a function called "title_layer_name" in the "custom" group. It takes no parameters,
     but extracts the layer name from the expression context and returns it as a title case string.
 
+    Example 5 (vectorized)
+    ----------------------
+
+    .. code-block:: python
+
+        @qgsfunction(group="custom", vectorized=True)
+        def hypot(x, y):
+            return numpy.hypot(x, y)
+
+    This registers a function called "hypot" in the "custom" group, which receives the values of ``x`` and ``y``
+    as numpy arrays. When the expression is evaluated with :py:func:`evaluate_in_blocks`, it is called once per
+    block of features. Otherwise it is called once per feature with scalar values, which numpy functions accept
+as well.
+
+    Example 6 (parallel)
+    --------------------
+
+    .. code-block:: python
+
+        @qgsfunction(group="custom", parallel=True)
+        def collatz_length(n):
+            steps = 0
+            while n > 1:
+                n = n // 2 if n % 2 == 0 else 3 * n + 1
+                steps += 1
+            return steps
+
+    This registers a function called "collatz_length" in the "custom" group, which is run in worker processes.
+    The module defining it must be importable by the workers, e.g. a plugin module, and it must not access
+    QGIS objects. Map layers rendered in parallel then compute it concurrently rather than one at a time.
+
     """
 
     def wrapper(func):
         return register_function(func, args, group, **kwargs)
 
     return wrapper
+
+
+def evaluate_in_blocks(expression, context, features, block_size=1024):
+    """
+    Evaluates an expression for each feature, calling vectorized Python functions once per block.
+
+    The expression is evaluated once per feature. The first call of a vectorized function in
+    a block evaluates its arguments for every feature of the block, calls the function once
+    with all of them and keeps the results for the following features. Parallel functions are
+    handled the same way, the arguments of the whole block being evaluated by the worker
+    processes at once. The arguments of these functions are thus evaluated once more per
+    feature, including for features which would not reach the call (e.g. in a ``CASE`` branch),
+    so they should be free of side effects.
+
+    This is the only way vectorized and parallel functions are called with several features at
+    once. When the expression is evaluated by QGIS, e.g. by the field calculator or a renderer,
+    they are called once per feature.
+
+    :param expression: the QgsExpression to evaluate
+    :param context: the QgsExpressionContext to evaluate the expression in. Its feature is set to
+        each feature in turn.
+    :param features: an iterable of QgsFeature
+    :param block_size: the number of features to evaluate at once
+
+    :return: a generator yielding the value of the expression for each feature
+    """
+    functions = []
+    for name in expression.referencedFunctions():
+        index = QgsExpression.functionIndex(name)
+        if index < 0:
+            continue
+        function = QgsExpression.Functions()[index]
+        if isinstance(function, QgsPyExpressionFunction) and (function.vectorized or function.parallel):
+            functions.append(function)
+    expression.prepare(context)
+
+    block = []
+    for feature in features:
+        block.append(feature)
+        if len(block) == block_size:
+            yield from _evaluate_block(expression, context, block, functions)
+            block = []
+    if block:
+        yield from _evaluate_block(expression, context, block, functions)
+
+
+def _evaluate_block(expression, context, block, functions):
+    for function in functions:
+        function._block.features = block
+        function._block.results = {}
+        function._block.evaluated = set()
+    try:
+        for feature in block:
+            context.setFeature(feature)
+            yield expression.evaluate(context)
+    finally:
+        for function in functions:
+            function._block.features = None
+            function._block.results = None
+            function._block.evaluated = None
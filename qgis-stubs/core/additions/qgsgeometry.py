@@ -15,13 +15,36 @@
 ***************************************************************************
 """
 
+import json
+
+from .wkb import geometry_mapping
+
 
 def _geometryNonZero(self):
     return not self.isEmpty()
 
 
-def _mapping_geometry(geometry):
-    geo = geometry.asJson()
-    # We have to use eval because exportToGeoJSON() gives us
-    # back a string that looks like a dictionary.
-    return eval(geo)
+def _mapping_geometry(geometry, precision=None, include_z=True, include_m=False):
+    """
+    Returns the geometry as a GeoJSON like mapping, as used by the ``__geo_interface__`` protocol.
+
+    Coordinates are nested lists of floats. Curved geometries are segmentized.
+
+    :param precision: the number of decimals to round the coordinates to, None for no rounding
+    :param include_z: whether the Z values of 3D geometries are included
+    :param include_m: whether the M values of measured geometries are included
+    :return: the mapping, or None for a null geometry
+    """
+    abstract = geometry.constGet()
+    if abstract is None:
+        return None
+    # The mapping is read from the WKB rather than by evaluating the GeoJSON export
+    try:
+        return geometry_mapping(abstract.asWkb().data(), precision, include_z, include_m)
+    except ValueError:
+        pass
+    try:
+        return geometry_mapping(abstract.segmentize().asWkb().data(), precision, include_z, include_m)
+    except ValueError:
+        # e.g. polyhedral surfaces
+        return json.loads(geometry.asJson(17 if precision is None else precision))
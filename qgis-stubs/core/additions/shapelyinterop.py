@@ -0,0 +1,85 @@
+"""
+***************************************************************************
+    shapelyinterop.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import shapely
+import shapely.geometry
+from qgis._core import QgsFeature, QgsGeometry
+
+
+def _geometry_as_shapely(self) -> shapely.geometry.base.BaseGeometry:
+    wkb_qbytearray = self.asWkb()  # Get the geometry in WKB format (QByteArray)
+    shapely_geom = shapely.from_wkb(wkb_qbytearray.data())
+
+    return shapely_geom
+
+
+def _geometry_from_shapely(shapely_geom: shapely.geometry.base.BaseGeometry) -> QgsGeometry:
+    geom = QgsGeometry()
+    geom.fromWkb(shapely_geom.wkb)
+
+    return geom
+
+
+def geometries_to_shapely(geometries):
+    """
+    Converts QgsGeometry objects to a numpy array of shapely objects.
+
+    The WKB of all the geometries is decoded by a single call to `shapely.from_wkb`, which is much faster than calling :py:func:`QgsGeometry.as_shapely` for each geometry. Null geometries are converted to `None`.
+
+    .. code-block:: python
+
+        shapes = geometries_to_shapely(feature.geometry() for feature in layer.getFeatures())
+        areas = shapely.area(shapes)
+
+    :raises QgsNotSupportedException: if shapely is not available on the system
+    """
+    # Null geometries have no WKB, they are converted to None
+    wkbs = [None if geometry.isNull() else geometry.asWkb().data() for geometry in geometries]
+    return shapely.from_wkb(wkbs)
+
+
+def geometries_from_shapely(shapely_geoms):
+    """
+    Converts an array of shapely objects to a list of QgsGeometry objects.
+
+    All the geometries are encoded to WKB by a single call to `shapely.to_wkb`. `None` values are converted to null geometries.
+
+    :raises QgsNotSupportedException: if shapely is not available on the system
+    """
+    result = []
+    for wkb in shapely.to_wkb(shapely_geoms, flavor='iso').ravel():
+        geom = QgsGeometry()
+        if wkb is not None:
+            geom.fromWkb(wkb)
+        result.append(geom)
+
+    return result
+
+
+def _feature_iterator_to_shapely(self):
+    """
+    Returns the geometries of the remaining features of the iterator as a numpy array of shapely objects.
+
+    The WKB of all the geometries is decoded by a single call to `shapely.from_wkb`. Features without a geometry give `None`.
+
+    :raises QgsNotSupportedException: if shapely is not available on the system
+    """
+    feature = QgsFeature()
+    wkbs = []
+    while self.nextFeature(feature):
+        geometry = feature.geometry()
+        wkbs.append(None if geometry.isNull() else geometry.asWkb().data())
+
+    return shapely.from_wkb(wkbs)
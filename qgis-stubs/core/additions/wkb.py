@@ -0,0 +1,251 @@
+"""
+***************************************************************************
+    wkb.py
+    ---------------------
+    Date                 : October 2026
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+
+import struct
+
+# Base WKB geometry types
+POINT = 1
+LINESTRING = 2
+POLYGON = 3
+MULTIPOINT = 4
+MULTILINESTRING = 5
+MULTIPOLYGON = 6
+GEOMETRYCOLLECTION = 7
+
+# EWKB and QGIS 2.5D flags
+_Z_FLAG = 0x80000000
+_M_FLAG = 0x40000000
+
+_UINT32 = {"<": struct.Struct("<I"), ">": struct.Struct(">I")}
+
+
+def read_header(data, offset=0):
+    """
+    Reads the header of a WKB geometry.
+
+    ISO WKB types (e.g. 1001 for PointZ) are supported, as well as the Z and M
+    flags of EWKB and of the QGIS 2.5D types.
+
+    :return: ``(byte order, base type, has Z, has M, offset of the geometry body)``,
+        where the byte order is ``"<"`` or ``">"``
+    """
+    order = "<" if data[offset] == 1 else ">"
+    (code,) = _UINT32[order].unpack_from(data, offset + 1)
+    has_z = bool(code & _Z_FLAG)
+    has_m = bool(code & _M_FLAG)
+    code &= 0x0FFFFFFF
+    flavour = code // 1000
+    has_z = has_z or flavour in (1, 3)
+    has_m = has_m or flavour in (2, 3)
+    return order, code % 1000, has_z, has_m, offset + 5
+
+
+def read_count(data, offset, order):
+    """
+    Reads a point, ring or part count.
+
+    :return: ``(count, offset after the count)``
+    """
+    return _UINT32[order].unpack_from(data, offset)[0], offset + 4
+
+
+def coordinate_arrays(data):
+    """
+    Decodes a WKB point, linestring, polygon or multi geometry into numpy arrays.
+
+    All the coordinates are copied into a single ``(n, dims)`` float64 array, ``dims``
+    being 2, 3 or 4 depending on the Z and M values. The structure of the geometry
+    is described by offset arrays, like ``shapely.to_ragged_array``:
+
+    - point, linestring, multipoint: no offsets
+    - polygon: the offsets of the rings in the coordinates
+    - multilinestring: the offsets of the lines in the coordinates
+    - multipolygon: the offsets of the rings in the coordinates and the offsets
+      of the parts in the rings
+
+    :param data: the WKB, as bytes or any object supporting the buffer protocol
+    :return: ``(base type, coordinates, offsets)``
+    :raises ValueError: for other geometry types, e.g. curves or collections
+    """
+    import numpy
+
+    order, base_type, has_z, has_m, offset = read_header(data)
+    dims = 2 + has_z + has_m
+    point_size = 8 * dims
+    # (byte offset, number of points) of each contiguous run of coordinates
+    segments = []
+    offsets = ()
+
+    if base_type == POINT:
+        segments.append((offset, 1))
+    elif base_type == LINESTRING:
+        count, offset = read_count(data, offset, order)
+        segments.append((offset, count))
+    elif base_type == POLYGON:
+        rings, offset = read_count(data, offset, order)
+        for _ in range(rings):
+            count, offset = read_count(data, offset, order)
+            segments.append((offset, count))
+            offset += count * point_size
+        offsets = (_offsets([count for _, count in segments]),)
+    elif base_type == MULTIPOINT:
+        parts, offset = read_count(data, offset, order)
+        # Points are fixed size records of a header and the coordinates
+        record = numpy.dtype([("header", "V5"), ("coordinates", order + "f8", (dims,))])
+        records = numpy.frombuffer(data, dtype=record, count=parts, offset=offset)
+        return base_type, numpy.array(records["coordinates"], dtype=float).reshape(parts, dims), offsets
+    elif base_type == MULTILINESTRING:
+        parts, offset = read_count(data, offset, order)
+        for _ in range(parts):
+            count, offset = read_count(data, offset + 5, order)
+            segments.append((offset, count))
+            offset += count * point_size
+        offsets = (_offsets([count for _, count in segments]),)
+    elif base_type == MULTIPOLYGON:
+        parts, offset = read_count(data, offset, order)
+        part_rings = []
+        for _ in range(parts):
+            rings, offset = read_count(data, offset + 5, order)
+            part_rings.append(rings)
+            for _ in range(rings):
+                count, offset = read_count(data, offset, order)
+                segments.append((offset, count))
+                offset += count * point_size
+        offsets = (_offsets([count for _, count in segments]), _offsets(part_rings))
+    else:
+        raise ValueError(f"WKB geometry type {base_type} cannot be converted to coordinate arrays")
+
+    coordinates = numpy.empty((sum(count for _, count in segments), dims), dtype=float)
+    dtype = numpy.dtype(order + "f8")
+    position = 0
+    for start, count in segments:
+        coordinates[position:position + count] = numpy.frombuffer(
+            data, dtype=dtype, count=count * dims, offset=start
+        ).reshape(count, dims)
+        position += count
+    return base_type, coordinates, offsets
+
+
+def _offsets(counts):
+    import numpy
+
+    offsets = numpy.zeros(len(counts) + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+_GEOJSON_TYPES = {
+    POINT: "Point",
+    LINESTRING: "LineString",
+    POLYGON: "Polygon",
+    MULTIPOINT: "MultiPoint",
+    MULTILINESTRING: "MultiLineString",
+    MULTIPOLYGON: "MultiPolygon",
+    GEOMETRYCOLLECTION: "GeometryCollection",
+}
+
+
+def geometry_mapping(data, precision=None, include_z=True, include_m=False):
+    """
+    Decodes a WKB geometry into a GeoJSON like mapping of nested lists of floats.
+
+    Only the simple feature types (points, line strings, polygons, their multi
+    variants and collections of them) are supported, curves must be segmentized first.
+
+    :param data: the WKB, as bytes or any object supporting the buffer protocol
+    :param precision: the number of decimals to round the coordinates to, None for no rounding
+    :param include_z: whether the Z values of 3D geometries are included
+    :param include_m: whether the M values of measured geometries are included
+    :raises ValueError: for other geometry types
+    """
+    mapping, _ = _read_mapping(memoryview(data).cast("B"), 0, precision, include_z, include_m)
+    return mapping
+
+
+def _read_mapping(data, offset, precision, include_z, include_m):
+    order, base_type, has_z, has_m, offset = read_header(data, offset)
+    try:
+        geometry_type = _GEOJSON_TYPES[base_type]
+    except KeyError:
+        raise ValueError(f"WKB geometry type {base_type} cannot be converted to a mapping")
+
+    if base_type == GEOMETRYCOLLECTION:
+        count, offset = read_count(data, offset, order)
+        geometries = []
+        for _ in range(count):
+            geometry, offset = _read_mapping(data, offset, precision, include_z, include_m)
+            geometries.append(geometry)
+        return {"type": geometry_type, "geometries": geometries}, offset
+
+    dims = 2 + has_z + has_m
+    point = struct.Struct(order + "d" * dims)
+    # The values of each point which are kept
+    indexes = [0, 1]
+    if has_z and include_z:
+        indexes.append(2)
+    if has_m and include_m:
+        indexes.append(2 + has_z)
+    if len(indexes) == dims and precision is None:
+        convert = list
+    elif precision is None:
+        def convert(values):
+            return [values[i] for i in indexes]
+    else:
+        def convert(values):
+            return [round(values[i], precision) for i in indexes]
+
+    def read_points(offset, count):
+        end = offset + count * point.size
+        return [convert(values) for values in point.iter_unpack(data[offset:end])], end
+
+    def read_rings(offset):
+        rings, offset = read_count(data, offset, order)
+        result = []
+        for _ in range(rings):
+            count, offset = read_count(data, offset, order)
+            ring, offset = read_points(offset, count)
+            result.append(ring)
+        return result, offset
+
+    if base_type == POINT:
+        (coordinates,), offset = read_points(offset, 1)
+        # Empty points have NaN coordinates
+        if all(value != value for value in coordinates):
+            coordinates = []
+    elif base_type == LINESTRING:
+        count, offset = read_count(data, offset, order)
+        coordinates, offset = read_points(offset, count)
+    elif base_type == POLYGON:
+        coordinates, offset = read_rings(offset)
+    elif base_type == MULTIPOINT:
+        parts, offset = read_count(data, offset, order)
+        coordinates = []
+        for _ in range(parts):
+            (part,), offset = read_points(offset + 5, 1)
+            coordinates.append(part)
+    elif base_type == MULTILINESTRING:
+        parts, offset = read_count(data, offset, order)
+        coordinates = []
+        for _ in range(parts):
+            count, offset = read_count(data, offset + 5, order)
+            part, offset = read_points(offset, count)
+            coordinates.append(part)
+    else:
+        parts, offset = read_count(data, offset, order)
+        coordinates = []
+        for _ in range(parts):
+            part, offset = read_rings(offset + 5)
+            coordinates.append(part)
+    return {"type": geometry_type, "coordinates": coordinates}, offset
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Docstrings of the qgis.gui bindings, installed by qgis.gui.load_docs()
+
+This file has been generated by scripts/extract_docstrings.py
+It is not aimed to be manually edited
+"""
+
+DOCS = (
+    ('QgsAbstractMapToolHandler.Context', 'Context of a QgsAbstractMapToolHandler call.\n\n.. versionadded:: 3.16'),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.XCoordinate', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.YCoordinate', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.MCoordinate', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.ZCoordinate', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.Angle', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.CommonAngleSnapping', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.Distance', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem.Bearing', ''),
+    ('QgsAdvancedDigitizingFloater.FloaterItem', 'Available floater items\n\n* ``XCoordinate``: \n* ``YCoordinate``: \n* ``MCoordinate``: \n* ``ZCoordinate``: \n* ``Angle``: \n* ``CommonAngleSnapping``: \n* ``Distance``: \n* ``Bearing``: \n\n'),
+    ('QgsAttributeTableFilterModel.TypeRole', ''),
+    ('QgsAttributeTableFilterModel.CustomRole', 'The additional roles defined by this filter model.\nThe values of these roles start just after the roles defined by\n:py:class:`QgsAttributeTableModel` so they do not conflict.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsAttributeTableFilterModel.Role\n\n.. versionadded:: 3.36\n\n* ``Type``: \n\n  Available as ``QgsAttributeTableFilterModel.TypeRole`` in older QGIS releases.\n\n\n'),
+    ('QgsAttributeTableModel.FeatureIdRole', 'Get the feature id of the feature in this row'),
+    ('QgsAttributeTableModel.FieldIndexRole', 'Get the field index of this column'),
+    ('QgsAttributeTableModel.UserRole', 'Start further roles starting from this role'),
+    ('QgsAttributeTableModel.SortRole', 'Role used for sorting start here'),
+    ('QgsAttributeTableModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsAttributeTableModel.Role\n\n.. versionadded:: 3.36\n\n* ``FeatureId``: Get the feature id of the feature in this row\n\n  Available as ``QgsAttributeTableModel.FeatureIdRole`` in older QGIS releases.\n\n* ``FieldIndex``: Get the field index of this column\n\n  Available as ``QgsAttributeTableModel.FieldIndexRole`` in older QGIS releases.\n\n* ``User``: Start further roles starting from this role\n\n  Available as ``QgsAttributeTableModel.UserRole`` in older QGIS releases.\n\n* ``Sort``: Role used for sorting start here\n\n  Available as ``QgsAttributeTableModel.SortRole`` in older QGIS releases.\n\n\n'),
+    ('QgsCategorizedSymbolRendererWidget.ValueRole', 'Category value'),
+    ('QgsCategorizedSymbolRendererWidget.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsCategorizedSymbolRendererWidget.CustomRoles\n\n.. versionadded:: 3.36\n\n* ``Value``: Category value\n\n  Available as ``QgsCategorizedSymbolRendererWidget.ValueRole`` in older QGIS releases.\n\n\n'),
+    ('QgsCodeEditor.Mode.ScriptEditor', 'Standard mode, allows for display and edit of entire scripts'),
+    ('QgsCodeEditor.Mode.OutputDisplay', 'Read only mode for display of command outputs'),
+    ('QgsCodeEditor.Mode.CommandInput', 'Command input mode'),
+    ('QgsCodeEditor.Mode', 'Code editor modes.\n\n.. versionadded:: 3.30\n\n* ``ScriptEditor``: Standard mode, allows for display and edit of entire scripts\n* ``OutputDisplay``: Read only mode for display of command outputs\n* ``CommandInput``: Command input mode\n\n'),
+    ('QgsCodeEditor.LineNumbers', 'Line numbers'),
+    ('QgsCodeEditor.ErrorIndicators', 'Error indicators'),
+    ('QgsCodeEditor.FoldingControls', 'Folding controls'),
+    ('QgsCodeEditor.MarginRole', 'Margin roles.\n\nThis enum contains the roles which the different numbered margins are used for.\n\n.. versionadded:: 3.16\n\n* ``LineNumbers``: Line numbers\n* ``ErrorIndicators``: Error indicators\n* ``FoldingControls``: Folding controls\n\n'),
+    ('QgsCodeEditor.Flag.CodeFolding', 'Indicates that code folding should be enabled for the editor'),
+    ('QgsCodeEditor.Flag.ImmediatelyUpdateHistory', 'Indicates that the history file should be immediately updated whenever a command is executed, instead of the default behavior of only writing the history on widget close \n.. versionadded:: 3.32'),
+    ('QgsCodeEditor.Flag', 'Flags controlling behavior of code editor\n\n.. versionadded:: 3.28\n\n* ``CodeFolding``: Indicates that code folding should be enabled for the editor\n* ``ImmediatelyUpdateHistory``: Indicates that the history file should be immediately updated whenever a command is executed, instead of the default behavior of only writing the history on widget close\n\n  .. versionadded:: 3.32\n\n\n'),
+    ('QgsCodeEditorColorScheme.ColorRole.Default', 'Default text color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Keyword', 'Keyword color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Class', 'Class color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Method', 'Method color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Decoration', 'Decoration color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Number', 'Number color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Comment', 'Comment color'),
+    ('QgsCodeEditorColorScheme.ColorRole.CommentLine', 'Line comment color'),
+    ('QgsCodeEditorColorScheme.ColorRole.CommentBlock', 'Comment block color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Background', 'Background color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Cursor', 'Cursor color'),
+    ('QgsCodeEditorColorScheme.ColorRole.CaretLine', 'Caret line color'),
+    ('QgsCodeEditorColorScheme.ColorRole.SingleQuote', 'Single quote color'),
+    ('QgsCodeEditorColorScheme.ColorRole.DoubleQuote', 'Double quote color'),
+    ('QgsCodeEditorColorScheme.ColorRole.TripleSingleQuote', 'Triple single quote color'),
+    ('QgsCodeEditorColorScheme.ColorRole.TripleDoubleQuote', 'Triple double quote color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Operator', 'Operator color'),
+    ('QgsCodeEditorColorScheme.ColorRole.QuotedOperator', 'Quoted operator color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Identifier', 'Identifier color'),
+    ('QgsCodeEditorColorScheme.ColorRole.QuotedIdentifier', 'Quoted identifier color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Tag', 'Tag color'),
+    ('QgsCodeEditorColorScheme.ColorRole.UnknownTag', 'Unknown tag'),
+    ('QgsCodeEditorColorScheme.ColorRole.MarginBackground', 'Margin background color'),
+    ('QgsCodeEditorColorScheme.ColorRole.MarginForeground', 'Margin foreground color'),
+    ('QgsCodeEditorColorScheme.ColorRole.SelectionBackground', 'Selection background color'),
+    ('QgsCodeEditorColorScheme.ColorRole.SelectionForeground', 'Selection foreground color'),
+    ('QgsCodeEditorColorScheme.ColorRole.MatchedBraceBackground', 'Matched brace background color'),
+    ('QgsCodeEditorColorScheme.ColorRole.MatchedBraceForeground', 'Matched brace foreground color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Edge', 'Edge color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Fold', 'Fold color'),
+    ('QgsCodeEditorColorScheme.ColorRole.Error', 'Error color'),
+    ('QgsCodeEditorColorScheme.ColorRole.ErrorBackground', 'Error background color'),
+    ('QgsCodeEditorColorScheme.ColorRole.FoldIconForeground', 'Fold icon foreground color'),
+    ('QgsCodeEditorColorScheme.ColorRole.FoldIconHalo', 'Fold icon halo color'),
+    ('QgsCodeEditorColorScheme.ColorRole.IndentationGuide', 'Indentation guide line'),
+    ('QgsCodeEditorColorScheme.ColorRole.SearchMatchBackground', 'Background color for search matches \n.. versionadded:: 3.38'),
+    ('QgsCodeEditorColorScheme.ColorRole', 'Color roles.\n\n* ``Default``: Default text color\n* ``Keyword``: Keyword color\n* ``Class``: Class color\n* ``Method``: Method color\n* ``Decoration``: Decoration color\n* ``Number``: Number color\n* ``Comment``: Comment color\n* ``CommentLine``: Line comment color\n* ``CommentBlock``: Comment block color\n* ``Background``: Background color\n* ``Cursor``: Cursor color\n* ``CaretLine``: Caret line color\n* ``SingleQuote``: Single quote color\n* ``DoubleQuote``: Double quote color\n* ``TripleSingleQuote``: Triple single quote color\n* ``TripleDoubleQuote``: Triple double quote color\n* ``Operator``: Operator color\n* ``QuotedOperator``: Quoted operator color\n* ``Identifier``: Identifier color\n* ``QuotedIdentifier``: Quoted identifier color\n* ``Tag``: Tag color\n* ``UnknownTag``: Unknown tag\n* ``MarginBackground``: Margin background color\n* ``MarginForeground``: Margin foreground color\n* ``SelectionBackground``: Selection background color\n* ``SelectionForeground``: Selection foreground color\n* ``MatchedBraceBackground``: Matched brace background color\n* ``MatchedBraceForeground``: Matched brace foreground color\n* ``Edge``: Edge color\n* ``Fold``: Fold color\n* ``Error``: Error color\n* ``ErrorBackground``: Error background color\n* ``FoldIconForeground``: Fold icon foreground color\n* ``FoldIconHalo``: Fold icon halo color\n* ``IndentationGuide``: Indentation guide line\n* ``SearchMatchBackground``: Background color for search matches\n\n  .. versionadded:: 3.38\n\n\n'),
+    ('QgsColorRampLegendNodeWidget.Capability.Prefix', 'Allow editing legend prefix'),
+    ('QgsColorRampLegendNodeWidget.Capability.Suffix', 'Allow editing legend suffix'),
+    ('QgsColorRampLegendNodeWidget.Capability.NumberFormat', 'Allow editing number format'),
+    ('QgsColorRampLegendNodeWidget.Capability.DefaultMinimum', 'Allow resetting minimum label to default'),
+    ('QgsColorRampLegendNodeWidget.Capability.DefaultMaximum', 'Allow resetting maximum label to default'),
+    ('QgsColorRampLegendNodeWidget.Capability.AllCapabilities', 'All capabilities'),
+    ('QgsColorRampLegendNodeWidget.Capability', 'Capabilities to expose in the widget.\n\n.. versionadded:: 3.38\n\n* ``Prefix``: Allow editing legend prefix\n* ``Suffix``: Allow editing legend suffix\n* ``NumberFormat``: Allow editing number format\n* ``DefaultMinimum``: Allow resetting minimum label to default\n* ``DefaultMaximum``: Allow resetting maximum label to default\n* ``AllCapabilities``: All capabilities\n\n'),
+    ('QgsColorWidget.ComponentUnit.Scaled0to255', 'Values in the range 0-255'),
+    ('QgsColorWidget.ComponentUnit.Percent', 'Percent values in the range 0-100'),
+    ('QgsColorWidget.ComponentUnit.Degree', 'Degree values in the range 0-359'),
+    ('QgsColorWidget.ComponentUnit', 'Specified the color component unit\n\n* ``Scaled0to255``: Values in the range 0-255\n* ``Percent``: Percent values in the range 0-100\n* ``Degree``: Degree values in the range 0-359\n\n'),
+    ('QgsCoordinateOperationWidget.OperationDetails', 'Coordinate operation details'),
+    ('QgsCoordinateReferenceSystemModel.RoleNodeType', "Corresponds to the node's type"),
+    ('QgsCoordinateReferenceSystemModel.RoleName', 'The coordinate reference system name'),
+    ('QgsCoordinateReferenceSystemModel.RoleAuthId', 'The coordinate reference system authority name and id'),
+    ('QgsCoordinateReferenceSystemModel.RoleDeprecated', '``True`` if the CRS is deprecated'),
+    ('QgsCoordinateReferenceSystemModel.RoleType', 'The coordinate reference system type'),
+    ('QgsCoordinateReferenceSystemModel.RoleGroupId', 'The node ID (for group nodes)'),
+    ('QgsCoordinateReferenceSystemModel.RoleWkt', "The coordinate reference system's WKT representation. This is only used for non-standard CRS (i.e. those not present in the database)."),
+    ('QgsCoordinateReferenceSystemModel.RoleProj', "The coordinate reference system's PROJ representation. This is only used for non-standard CRS (i.e. those not present in the database)."),
+    ('QgsCoordinateReferenceSystemModel.Group', 'Group name. \n.. versionadded:: 3.42'),
+    ('QgsCoordinateReferenceSystemModel.Projection', 'Projection name. \n.. versionadded:: 3.42'),
+    ('QgsCoordinateReferenceSystemModel.CustomRole', "Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsCoordinateReferenceSystemModel.Roles\n\n.. versionadded:: 3.36\n\n* ``NodeType``: Corresponds to the node's type\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleNodeType`` in older QGIS releases.\n\n* ``Name``: The coordinate reference system name\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleName`` in older QGIS releases.\n\n* ``AuthId``: The coordinate reference system authority name and id\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleAuthId`` in older QGIS releases.\n\n* ``Deprecated``: ``True`` if the CRS is deprecated\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleDeprecated`` in older QGIS releases.\n\n* ``Type``: The coordinate reference system type\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleType`` in older QGIS releases.\n\n* ``GroupId``: The node ID (for group nodes)\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleGroupId`` in older QGIS releases.\n\n* ``Wkt``: The coordinate reference system's WKT representation. This is only used for non-standard CRS (i.e. those not present in the database).\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleWkt`` in older QGIS releases.\n\n* ``Proj``: The coordinate reference system's PROJ representation. This is only used for non-standard CRS (i.e. those not present in the database).\n\n  Available as ``QgsCoordinateReferenceSystemModel.RoleProj`` in older QGIS releases.\n\n* ``Group``: Group name.\n\n  .. versionadded:: 3.42\n\n* ``Projection``: Projection name.\n\n  .. versionadded:: 3.42\n\n\n"),
+    ('QgsScrollBarHighlight.Priority.Invalid', 'Invalid'),
+    ('QgsScrollBarHighlight.Priority.LowPriority', 'Low priority, rendered below all other highlights'),
+    ('QgsScrollBarHighlight.Priority.NormalPriority', 'Normal priority'),
+    ('QgsScrollBarHighlight.Priority.HighPriority', 'High priority'),
+    ('QgsScrollBarHighlight.Priority.HighestPriority', 'Highest priority, rendered above all other highlights'),
+    ('QgsScrollBarHighlight.Priority', 'Priority, which dictates how overlapping highlights are rendered\n\n* ``Invalid``: Invalid\n* ``LowPriority``: Low priority, rendered below all other highlights\n* ``NormalPriority``: Normal priority\n* ``HighPriority``: High priority\n* ``HighestPriority``: Highest priority, rendered above all other highlights\n\n'),
+    ('QgsFieldMappingModel.ColumnDataIndex.SourceExpression', 'Expression'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationName', 'Destination field name'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationType', 'Destination field type string'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationLength', 'Destination field length'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationPrecision', 'Destination field precision'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationConstraints', 'Destination field constraints'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationAlias', 'Destination alias'),
+    ('QgsFieldMappingModel.ColumnDataIndex.DestinationComment', 'Destination comment'),
+    ('QgsFieldMappingModel.ColumnDataIndex', 'The ColumnDataIndex enum represents the column index for the view\n\n* ``SourceExpression``: Expression\n* ``DestinationName``: Destination field name\n* ``DestinationType``: Destination field type string\n* ``DestinationLength``: Destination field length\n* ``DestinationPrecision``: Destination field precision\n* ``DestinationConstraints``: Destination field constraints\n* ``DestinationAlias``: Destination alias\n* ``DestinationComment``: Destination comment\n\n'),
+    ('QgsFieldMappingModel.Field', 'The Field struct holds information about a mapped field'),
+    ('QgsJsonEditWidget.View.Text', 'JSON data displayed as text.'),
+    ('QgsJsonEditWidget.View.Tree', 'JSON data displayed as tree. Tree view is disabled for invalid JSON data.'),
+    ('QgsJsonEditWidget.View', 'View mode, text or tree.\n\n* ``Text``: JSON data displayed as text.\n* ``Tree``: JSON data displayed as tree. Tree view is disabled for invalid JSON data.\n\n'),
+    ('QgsJsonEditWidget.FormatJson.Indented', 'JSON data formatted with regular indentation'),
+    ('QgsJsonEditWidget.FormatJson.Compact', 'JSON data formatted as a compact one line string'),
+    ('QgsJsonEditWidget.FormatJson.Disabled', 'JSON data is not formatted'),
+    ('QgsJsonEditWidget.FormatJson', 'Format mode in the text view\n\n* ``Indented``: JSON data formatted with regular indentation\n* ``Compact``: JSON data formatted as a compact one line string\n* ``Disabled``: JSON data is not formatted\n\n'),
+    ('QgsLayerMetadataResultsModel.Metadata', 'Layer metadata role'),
+    ('QgsLayerMetadataResultsModel.CustomRole', 'The Roles enum represents the user roles for the model.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsLayerMetadataResultsModel.Roles\n\n.. versionadded:: 3.36\n\n* ``Metadata``: Layer metadata role\n\n'),
+    ('QgsMapCanvasInteractionBlocker.Interaction.MapPanOnSingleClick', 'A map pan interaction caused by a single click and release on the map canvas'),
+    ('QgsMapCanvasInteractionBlocker.Interaction', 'Available interactions to block.\n\n* ``MapPanOnSingleClick``: A map pan interaction caused by a single click and release on the map canvas\n\n'),
+    ('QgsMapLayerConfigWidgetFactory.ParentPage.NoParent', 'Factory creates pages itself, not sub-components'),
+    ('QgsMapLayerConfigWidgetFactory.ParentPage.Temporal', 'Factory creates sub-components of the temporal properties page (only supported for raster layer temporal properties)'),
+    ('QgsMapLayerConfigWidgetFactory.ParentPage', 'Available parent pages, for factories which create a widget which is a sub-component\nof a standard page.\n\n.. versionadded:: 3.20\n\n* ``NoParent``: Factory creates pages itself, not sub-components\n* ``Temporal``: Factory creates sub-components of the temporal properties page (only supported for raster layer temporal properties)\n\n'),
+    ('QgsMapLayerStyleCategoriesModel.Role.NameRole', ''),
+    ('QgsMapLayerStyleCategoriesModel.Role', 'Custom model roles\n\n* ``NameRole``: \n\n'),
+    ('QgsModelDesignerDialog.SaveAction.SaveAsFile', 'Save model as a file'),
+    ('QgsModelDesignerDialog.SaveAction.SaveInProject', 'Save model into project'),
+    ('QgsModelDesignerDialog.SaveAction', 'Save action.\n\n.. versionadded:: 3.24\n\n* ``SaveAsFile``: Save model as a file\n* ``SaveInProject``: Save model into project\n\n'),
+    ('QgsOWSSourceSelect.SupportedFormat', 'Formats supported by provider'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.SourceExpression', 'Expression'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.Aggregate', 'Aggregate name'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.Delimiter', 'Delimiter'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.DestinationName', 'Destination field name'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.DestinationType', 'Destination field type string'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.DestinationLength', 'Destination field length'),
+    ('QgsAggregateMappingModel.ColumnDataIndex.DestinationPrecision', 'Destination field precision'),
+    ('QgsAggregateMappingModel.ColumnDataIndex', 'The ColumnDataIndex enum represents the column index for the view\n\n* ``SourceExpression``: Expression\n* ``Aggregate``: Aggregate name\n* ``Delimiter``: Delimiter\n* ``DestinationName``: Destination field name\n* ``DestinationType``: Destination field type string\n* ``DestinationLength``: Destination field length\n* ``DestinationPrecision``: Destination field precision\n\n'),
+    ('QgsAggregateMappingModel.Aggregate', 'The Aggregate struct holds information about an aggregate column'),
+    ('QgsProcessingAlgorithmDialogBase.DialogMode.Single', 'Single algorithm execution mode'),
+    ('QgsProcessingAlgorithmDialogBase.DialogMode.Batch', 'Batch processing mode'),
+    ('QgsProcessingAlgorithmDialogBase.DialogMode', 'Dialog modes.\n\n.. versionadded:: 3.24\n\n* ``Single``: Single algorithm execution mode\n* ``Batch``: Batch processing mode\n\n'),
+    ('QgsProcessingToolboxModelNode.NodeProvider', 'Provider node'),
+    ('QgsProcessingToolboxModelNode.NodeGroup', 'Group node'),
+    ('QgsProcessingToolboxModelNode.NodeAlgorithm', 'Algorithm node'),
+    ('QgsProcessingToolboxModelNode.NodeRecent', 'Recent algorithms node'),
+    ('QgsProcessingToolboxModelNode.Parameter', 'Parameter node, \n.. versionadded:: 3.44'),
+    ('QgsProcessingToolboxModelNode.ParameterGroup', 'Parameter group node \n.. versionadded:: 3.44'),
+    ('QgsProcessingToolboxModelNode.Favorite', 'Favorites algorithms node, \n.. versionadded:: 3.40'),
+    ('QgsProcessingToolboxModelNode.NodeType', 'Enumeration of possible model node types\n\n* ``Provider``: Provider node\n\n  Available as ``QgsProcessingToolboxModelNode.NodeProvider`` in older QGIS releases.\n\n* ``Group``: Group node\n\n  Available as ``QgsProcessingToolboxModelNode.NodeGroup`` in older QGIS releases.\n\n* ``Algorithm``: Algorithm node\n\n  Available as ``QgsProcessingToolboxModelNode.NodeAlgorithm`` in older QGIS releases.\n\n* ``Recent``: Recent algorithms node\n\n  Available as ``QgsProcessingToolboxModelNode.NodeRecent`` in older QGIS releases.\n\n* ``Parameter``: Parameter node,\n\n  .. versionadded:: 3.44\n\n* ``ParameterGroup``: Parameter group node\n\n  .. versionadded:: 3.44\n\n* ``Favorite``: Favorites algorithms node,\n\n  .. versionadded:: 3.40\n\n\n'),
+    ('QgsProcessingToolboxModel.RoleNodeType', "Corresponds to the node's type"),
+    ('QgsProcessingToolboxModel.RoleAlgorithmFlags', "Returns the node's algorithm flags, for algorithm nodes"),
+    ('QgsProcessingToolboxModel.RoleAlgorithmId', 'Algorithm ID, for algorithm nodes'),
+    ('QgsProcessingToolboxModel.RoleAlgorithmName', 'Untranslated algorithm name, for algorithm nodes'),
+    ('QgsProcessingToolboxModel.RoleAlgorithmShortDescription', 'Short algorithm description, for algorithm nodes'),
+    ('QgsProcessingToolboxModel.RoleAlgorithmTags', 'List of algorithm tags, for algorithm nodes'),
+    ('QgsProcessingToolboxModel.RoleProviderFlags', "Returns the node's provider flags"),
+    ('QgsProcessingToolboxModel.ParameterTypeId', 'Untranslated parameter type unique identifier for parameter nodes \n.. versionadded:: 3.44'),
+    ('QgsProcessingToolboxModel.CustomRole', "Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsProcessingToolboxModel.Roles\n\n.. versionadded:: 3.36\n\n* ``NodeType``: Corresponds to the node's type\n\n  Available as ``QgsProcessingToolboxModel.RoleNodeType`` in older QGIS releases.\n\n* ``AlgorithmFlags``: Returns the node's algorithm flags, for algorithm nodes\n\n  Available as ``QgsProcessingToolboxModel.RoleAlgorithmFlags`` in older QGIS releases.\n\n* ``AlgorithmId``: Algorithm ID, for algorithm nodes\n\n  Available as ``QgsProcessingToolboxModel.RoleAlgorithmId`` in older QGIS releases.\n\n* ``AlgorithmName``: Untranslated algorithm name, for algorithm nodes\n\n  Available as ``QgsProcessingToolboxModel.RoleAlgorithmName`` in older QGIS releases.\n\n* ``AlgorithmShortDescription``: Short algorithm description, for algorithm nodes\n\n  Available as ``QgsProcessingToolboxModel.RoleAlgorithmShortDescription`` in older QGIS releases.\n\n* ``AlgorithmTags``: List of algorithm tags, for algorithm nodes\n\n  Available as ``QgsProcessingToolboxModel.RoleAlgorithmTags`` in older QGIS releases.\n\n* ``ProviderFlags``: Returns the node's provider flags\n\n  Available as ``QgsProcessingToolboxModel.RoleProviderFlags`` in older QGIS releases.\n\n* ``ParameterTypeId``: Untranslated parameter type unique identifier for parameter nodes\n\n  .. versionadded:: 3.44\n\n\n"),
+    ('QgsProcessingToolboxProxyModel.FilterToolbox', 'Filters out any algorithms and content which should not be shown in the toolbox'),
+    ('QgsProcessingToolboxProxyModel.FilterModeler', 'Filters out any algorithms and content which should not be shown in the modeler'),
+    ('QgsProcessingToolboxProxyModel.FilterInPlace', 'Only show algorithms which support in-place edits'),
+    ('QgsProcessingToolboxProxyModel.FilterShowKnownIssues', 'Show algorithms with known issues (hidden by default)'),
+    ('QgsProcessingToolboxProxyModel.Filter', 'Available filter flags for filtering the model\n\n* ``Toolbox``: Filters out any algorithms and content which should not be shown in the toolbox\n\n  Available as ``QgsProcessingToolboxProxyModel.FilterToolbox`` in older QGIS releases.\n\n* ``Modeler``: Filters out any algorithms and content which should not be shown in the modeler\n\n  Available as ``QgsProcessingToolboxProxyModel.FilterModeler`` in older QGIS releases.\n\n* ``InPlace``: Only show algorithms which support in-place edits\n\n  Available as ``QgsProcessingToolboxProxyModel.FilterInPlace`` in older QGIS releases.\n\n* ``ShowKnownIssues``: Show algorithms with known issues (hidden by default)\n\n  Available as ``QgsProcessingToolboxProxyModel.FilterShowKnownIssues`` in older QGIS releases.\n\n\n'),
+    ('QgsProcessingParametersGenerator.Flag.SkipDefaultValueParameters', 'Parameters which are unchanged from their default values should not be included'),
+    ('QgsProcessingParametersGenerator.Flag.SkipValidation', 'Skip validation of parameters. \n.. versionadded:: 3.44'),
+    ('QgsProcessingParametersGenerator.Flag', 'Flags controlling parameter generation.\n\n.. versionadded:: 3.24\n\n* ``SkipDefaultValueParameters``: Parameters which are unchanged from their default values should not be included\n* ``SkipValidation``: Skip validation of parameters.\n\n  .. versionadded:: 3.44\n\n\n'),
+    ('QgsQueryResultWidget.QueryWidgetMode.SqlQueryMode', 'Defaults widget mode for SQL execution and SQL query layer creation.'),
+    ('QgsQueryResultWidget.QueryWidgetMode.QueryLayerUpdateMode', "SQL query layer update mode: the create SQL layer button is renamed to 'Update' and the SQL layer creation group box is expanded."),
+    ('QgsQueryResultWidget.QueryWidgetMode', "The QueryWidgetMode enum represents various modes for the widget appearance.\n\n* ``SqlQueryMode``: Defaults widget mode for SQL execution and SQL query layer creation.\n* ``QueryLayerUpdateMode``: SQL query layer update mode: the create SQL layer button is renamed to 'Update' and the SQL layer creation group box is expanded.\n\n"),
+    ('QgsRecentCoordinateReferenceSystemsModel.RoleCrs', 'Coordinate reference system'),
+    ('QgsRecentCoordinateReferenceSystemsModel.RoleAuthId', 'CRS authority ID'),
+    ('QgsRecentCoordinateReferenceSystemsModel.CustomRole', 'Custom model roles.\n\n* ``Crs``: Coordinate reference system\n\n  Available as ``QgsRecentCoordinateReferenceSystemsModel.RoleCrs`` in older QGIS releases.\n\n* ``AuthId``: CRS authority ID\n\n  Available as ``QgsRecentCoordinateReferenceSystemsModel.RoleAuthId`` in older QGIS releases.\n\n\n'),
+    ('QgsRichTextEditor.Mode.QTextDocument', 'Default mode, exposes the Qt supported HTML/CSS subset'),
+    ('QgsRichTextEditor.Mode.QgsTextRenderer', 'QGIS text renderer mode, exposes the HTML/CSS subset supported by the QgsTextRenderer class'),
+    ('QgsRichTextEditor.Mode.PlainText', 'Plain text mode'),
+    ('QgsRichTextEditor.Mode', 'Widget modes.\n\n.. versionadded:: 3.40\n\n* ``QTextDocument``: Default mode, exposes the Qt supported HTML/CSS subset\n* ``QgsTextRenderer``: QGIS text renderer mode, exposes the HTML/CSS subset supported by the QgsTextRenderer class\n* ``PlainText``: Plain text mode\n\n'),
+    ('QgsSettingsStringComboBoxWrapper.Mode.Text', 'Value is defined as the text entry'),
+    ('QgsSettingsStringComboBoxWrapper.Mode.Data', 'Value is defined as data entry with Qt.UserRole'),
+    ('QgsSettingsStringComboBoxWrapper.Mode', 'Mode to determine if the value is hold in the combo box text or data\n\n* ``Text``: Value is defined as the text entry\n* ``Data``: Value is defined as data entry with Qt.UserRole\n\n'),
+    ('QgsSettingsTreeModel.Column.Name', 'Name'),
+    ('QgsSettingsTreeModel.Column.Value', 'Value'),
+    ('QgsSettingsTreeModel.Column.Description', 'Description'),
+    ('QgsSettingsTreeModel.Column', 'Columns\n\n* ``Name``: Name\n* ``Value``: Value\n* ``Description``: Description\n\n'),
+    ('QgsSourceSelectProvider.Capability.NoCapabilities', 'No capabilities'),
+    ('QgsSourceSelectProvider.Capability.ConfigureFromUri', 'The source select widget can be configured from a URI'),
+    ('QgsSourceSelectProvider.Capability', 'The Capability enum describes the capabilities of the source select implementation.\n\n.. versionadded:: 3.38\n\n* ``NoCapabilities``: No capabilities\n* ``ConfigureFromUri``: The source select widget can be configured from a URI\n\n'),
+    ('QgsSublayersDialog.LayerDefinition', 'A structure that defines layers for the purpose of this dialog'),
+    ('QgsValidityCheckResultsModel.DescriptionRole', 'Result detailed description'),
+    ('QgsValidityCheckResultsModel.CustomRole', 'Custom model roles.\n\n.. note::\n\n   Prior to QGIS 3.36 this was available as QgsValidityCheckResultsModel.Roles\n\n.. versionadded:: 3.36\n\n* ``Description``: Result detailed description\n\n  Available as ``QgsValidityCheckResultsModel.DescriptionRole`` in older QGIS releases.\n\n\n'),
+    ('QgsVectorLayerSaveAsDialog.Option.Symbology', 'Show symbology options'),
+    ('QgsVectorLayerSaveAsDialog.Option.DestinationCrs', 'Show destination CRS (reprojection) option'),
+    ('QgsVectorLayerSaveAsDialog.Option.Fields', 'Show field customization group'),
+    ('QgsVectorLayerSaveAsDialog.Option.AddToCanvas', 'Show add to map option'),
+    ('QgsVectorLayerSaveAsDialog.Option.SelectedOnly', 'Show selected features only option'),
+    ('QgsVectorLayerSaveAsDialog.Option.GeometryType', 'Show geometry group'),
+    ('QgsVectorLayerSaveAsDialog.Option.Extent', 'Show extent group'),
+    ('QgsVectorLayerSaveAsDialog.Option.Metadata', 'Show metadata options'),
+    ('QgsVectorLayerSaveAsDialog.Option.AllOptions', ''),
+    ('QgsVectorLayerSaveAsDialog.Option', 'Available dialog options.\n\n* ``Symbology``: Show symbology options\n* ``DestinationCrs``: Show destination CRS (reprojection) option\n* ``Fields``: Show field customization group\n* ``AddToCanvas``: Show add to map option\n* ``SelectedOnly``: Show selected features only option\n* ``GeometryType``: Show geometry group\n* ``Extent``: Show extent group\n* ``Metadata``: Show metadata options\n* ``AllOptions``: \n\n'),
+    ('QgsWidgetWrapper.RootPath', 'Root path for external resource'),
+    ('QgsWidgetWrapper.DocumentViewerContent', 'Document type for external resource'),
+    ('QgsWidgetWrapper.StorageUrl', 'Storage URL for external resource'),
+    ('QgsWidgetWrapper.Property', 'Data defined properties for different editor widgets.\n\n* ``RootPath``: Root path for external resource\n* ``DocumentViewerContent``: Document type for external resource\n* ``StorageUrl``: Storage URL for external resource\n\n'),
+    ('QgsMapToolCapture.StraightSegments', 'Default capture mode - capture occurs with straight line segments'),
+    ('QgsMapToolCapture.CircularString', 'Capture in circular strings'),
+    ('QgsMapToolCapture.Streaming', 'Streaming points digitizing mode (points are automatically added as the mouse cursor moves).'),
+    ('QgsMapToolCapture.Shape', 'Digitize shapes.'),
+    ('QgsActionMenu.Invalid', 'Invalid'),
+    ('QgsActionMenu.MapLayerAction', 'Standard actions (defined by core or plugins), corresponds to QgsMapLayerAction class.'),
+    ('QgsActionMenu.AttributeAction', 'Custom actions (manually defined in layer properties), corresponds to QgsAction class.'),
+    ('QgsMapLayerAction.Layer', 'Action targets a complete layer'),
+    ('QgsMapLayerAction.SingleFeature', 'Action targets a single feature from a layer'),
+    ('QgsMapLayerAction.MultipleFeatures', 'Action targets multiple features from a layer'),
+    ('QgsMapLayerAction.AllActions', ''),
+    ('QgsMapLayerAction.EnabledOnlyWhenEditable', 'Action should be shown only for editable layers'),
+    ('QgsProcessingGui.Standard', 'Standard (single-run) algorithm mode'),
+    ('QgsProcessingGui.Batch', 'Batch processing mode'),
+    ('QgsProcessingGui.Modeler', 'Modeler mode'),
+)
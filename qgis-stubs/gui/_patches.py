@@ -0,0 +1,1625 @@
+# -*- coding: utf-8 -*-
+"""
+Generated class patches of the qgis.gui bindings, applied on import
+
+This file has been generated by scripts/build_patch_tables.py
+It is not aimed to be manually edited
+"""
+
+PATCHES = (
+    ('src/gui/symbology/characterwidget.h', (
+        ('CharacterWidget', (('__attribute_docs__', (('characterSelected', 'Emitted when a character is selected in the widget.\n'),)), ('__overridden_methods__', ('sizeHint', 'keyPressEvent', 'mouseMoveEvent', 'mousePressEvent', 'paintEvent', 'resizeEvent')), ('__signal_arguments__', (('characterSelected', ('character: QChar',)),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgisinterface.h', (
+        ('QgisInterface', (('__attribute_docs__', (('currentLayerChanged', 'Emitted whenever current (selected) layer changes. The pointer to layer\ncan be ``None`` if no layer is selected.\n'), ('currentThemeChanged', 'Emitted when the current ``theme`` is changed so plugins can change\ntheir tool button icons.\n'), ('layoutDesignerOpened', 'Emitted when a new layout ``designer`` has been opened.\n\n.. seealso:: :py:func:`layoutDesignerWillBeClosed`\n'), ('layoutDesignerWillBeClosed', 'Emitted before a layout ``designer`` is going to be closed and deleted.\n\n.. seealso:: :py:func:`layoutDesignerClosed`\n\n.. seealso:: :py:func:`layoutDesignerOpened`\n'), ('layoutDesignerClosed', 'Emitted after a layout designer window is closed.\n\n.. seealso:: :py:func:`layoutDesignerWillBeClosed`\n\n.. seealso:: :py:func:`layoutDesignerOpened`\n'), ('initializationCompleted', 'Emitted when the initialization is complete.\n'), ('projectRead', 'Emitted when a project file is successfully read.\n\n.. note::\n\n   This is useful for plugins that store properties with project files.\n   A plugin can connect to this signal. When it is emitted the plugin\n   knows to then check the project properties for any relevant state.\n'), ('newProjectCreated', "Emitted when starting an entirely new project.\n\n.. note::\n\n   This is similar to :py:func:`~QgisInterface.projectRead`; plugins might want to be notified\n   that they're in a new project. Yes, :py:func:`~QgisInterface.projectRead` could have been\n   overloaded to be used in the case of new projects instead. However,\n   it's probably more semantically correct to have an entirely separate\n   signal for when this happens.\n"), ('layerSavedAs', 'Emitted when a layer has been saved using save as.\n'))), ('__virtual_methods__', ('actionCircle2Points', 'actionCircle3Points', 'actionCircle3Tangents', 'actionCircle2TangentsPoint', 'actionCircleCenterPoint', 'actionEllipseCenter2Points', 'actionEllipseCenterPoint', 'actionEllipseExtent', 'actionEllipseFoci', 'actionRectangleCenterPoint', 'actionRectangleExtent', 'actionRectangle3PointsDistance', 'actionRectangle3PointsProjected', 'actionRegularPolygon2Points', 'actionRegularPolygonCenterPoint', 'actionRegularPolygonCenterCorner', 'takeAppScreenShots')), ('__abstract_methods__', ('pluginManagerInterface', 'layerTreeView', 'gpsTools', 'addCustomActionForLayerType', 'addCustomActionForLayer', 'removeCustomActionForLayerType', 'mapCanvases', 'createNewMapCanvas', 'closeMapCanvas', 'mapCanvases3D', 'createNewMapCanvas3D', 'closeMapCanvas3D', 'iconSize', 'editableLayers', 'activeLayer', 'mapCanvas', 'activeDecorations', 'layerTreeCanvasBridge', 'mainWindow', 'messageBar', 'openLayoutDesigners', 'defaultStyleSheetOptions', 'defaultStyleSheetFont', 'cadDockWidget', 'projectMenu', 'projectImportExportMenu', 'addProjectImportAction', 'removeProjectImportAction', 'addProjectExportAction', 'removeProjectExportAction', 'projectModelsMenu', 'createProjectModelSubMenu', 'editMenu', 'viewMenu', 'layerMenu', 'newLayerMenu', 'addLayerMenu', 'settingsMenu', 'pluginMenu', 'pluginHelpMenu', 'rasterMenu', 'databaseMenu', 'vectorMenu', 'webMenu', 'meshMenu', 'firstRightStandardMenu', 'windowMenu', 'helpMenu', 'fileToolBar', 'layerToolBar', 'dataSourceManagerToolBar', 'openDataSourceManagerPage', 'mapNavToolToolBar', 'digitizeToolBar', 'advancedDigitizeToolBar', 'shapeDigitizeToolBar', 'attributesToolBar', 'selectionToolBar', 'pluginToolBar', 'helpToolBar', 'rasterToolBar', 'vectorToolBar', 'databaseToolBar', 'webToolBar', 'actionNewProject', 'actionOpenProject', 'actionSaveProject', 'actionSaveProjectAs', 'actionSaveMapAsImage', 'actionProjectProperties', 'actionCreatePrintLayout', 'actionShowLayoutManager', 'actionExit', 'actionCutFeatures', 'actionCopyFeatures', 'actionPasteFeatures', 'actionAddFeature', 'actionDeleteSelected', 'actionMoveFeature', 'actionSplitFeatures', 'actionSplitParts', 'actionAddRing', 'actionAddPart', 'actionSimplifyFeature', 'actionDeleteRing', 'actionDeletePart', 'actionVertexTool', 'actionVertexToolActiveLayer', 'mapToolActionGroup', 'actionPan', 'actionPanToSelected', 'actionZoomIn', 'actionZoomOut', 'actionSelect', 'actionSelectRectangle', 'actionSelectPolygon', 'actionSelectFreehand', 'actionSelectRadius', 'actionIdentify', 'actionFeatureAction', 'actionMeasure', 'actionMeasureArea', 'actionZoomFullExtent', 'actionZoomToLayer', 'actionZoomToLayers', 'actionZoomToSelected', 'actionZoomLast', 'actionZoomNext', 'actionZoomActualSize', 'actionMapTips', 'actionNewBookmark', 'actionShowBookmarks', 'actionDraw', 'actionNewVectorLayer', 'actionAddOgrLayer', 'actionAddRasterLayer', 'actionAddPgLayer', 'actionAddWmsLayer', 'actionAddXyzLayer', 'actionAddVectorTileLayer', 'actionAddPointCloudLayer', 'actionAddAfsLayer', 'actionAddAmsLayer', 'actionCopyLayerStyle', 'actionPasteLayerStyle', 'actionOpenTable', 'actionOpenFieldCalculator', 'actionOpenStatisticalSummary', 'actionToggleEditing', 'actionSaveActiveLayerEdits', 'actionAllEdits', 'actionSaveEdits', 'actionSaveAllEdits', 'actionRollbackEdits', 'actionRollbackAllEdits', 'actionCancelEdits', 'actionCancelAllEdits', 'actionLayerSaveAs', 'actionDuplicateLayer', 'actionLayerProperties', 'actionAddToOverview', 'actionAddAllToOverview', 'actionRemoveAllFromOverview', 'actionHideAllLayers', 'actionShowAllLayers', 'actionHideSelectedLayers', 'actionToggleSelectedLayers', 'actionToggleSelectedLayersIndependently', 'actionHideDeselectedLayers', 'actionShowSelectedLayers', 'actionManagePlugins', 'actionPluginListSeparator', 'actionShowPythonDialog', 'actionToggleFullScreen', 'actionOptions', 'actionCustomProjection', 'actionHelpContents', 'actionQgisHomePage', 'actionCheckQgisVersion', 'actionAbout', 'vectorLayerTools', 'messageTimeout', 'statusBarIface', 'layerTreeInsertionPoint', 'userProfileManager', 'zoomFull', 'zoomToPrevious', 'zoomToNext', 'zoomToActiveLayer', 'addVectorLayer', 'addRasterLayer', 'addMeshLayer', 'addVectorTileLayer', 'addPointCloudLayer', 'addTiledSceneLayer', 'addProject', 'newProject', 'reloadConnections', 'setActiveLayer', 'copySelectionToClipboard', 'pasteFromClipboard', 'addToolBarIcon', 'addToolBarWidget', 'removeToolBarIcon', 'addRasterToolBarWidget', 'addRasterToolBarIcon', 'removeRasterToolBarIcon', 'addVectorToolBarIcon', 'addVectorToolBarWidget', 'removeVectorToolBarIcon', 'addDatabaseToolBarIcon', 'addDatabaseToolBarWidget', 'removeDatabaseToolBarIcon', 'addWebToolBarIcon', 'addWebToolBarWidget', 'removeWebToolBarIcon', 'addToolBar', 'openMessageLog', 'addUserInputWidget', 'showLayoutManager', 'openLayoutDesigner', 'showOptionsDialog', 'showProjectPropertiesDialog', 'buildStyleSheet', 'saveStyleSheetOptions', 'addPluginToMenu', 'removePluginMenu', 'insertAddLayerAction', 'removeAddLayerAction', 'addPluginToDatabaseMenu', 'removePluginDatabaseMenu', 'addPluginToRasterMenu', 'removePluginRasterMenu', 'addPluginToVectorMenu', 'removePluginVectorMenu', 'addPluginToWebMenu', 'removePluginWebMenu', 'addPluginToMeshMenu', 'removePluginMeshMenu', 'addDockWidget', 'addTabifiedDockWidget', 'removeDockWidget', 'showLayerProperties', 'showAttributeTable', 'addWindow', 'removeWindow', 'registerMainWindowAction', 'unregisterMainWindowAction', 'registerMapLayerConfigWidgetFactory', 'unregisterMapLayerConfigWidgetFactory', 'registerOptionsWidgetFactory', 'unregisterOptionsWidgetFactory', 'registerProjectPropertiesWidgetFactory', 'unregisterProjectPropertiesWidgetFactory', 'registerDevToolWidgetFactory', 'unregisterDevToolWidgetFactory', 'showApiDocumentation', 'registerApplicationExitBlocker', 'unregisterApplicationExitBlocker', 'registerMapToolHandler', 'unregisterMapToolHandler', 'registerCustomDropHandler', 'unregisterCustomDropHandler', 'registerCustomProjectOpenHandler', 'unregisterCustomProjectOpenHandler', 'registerCustomLayoutDropHandler', 'unregisterCustomLayoutDropHandler', 'openURL', 'openFeatureForm', 'getFeatureForm', 'preloadForm', 'locatorSearch', 'registerLocatorFilter', 'deregisterLocatorFilter', 'invalidateLocatorResults', 'askForDatumTransform', 'browserModel', 'setGpsPanelConnection', 'blockActiveLayerChanges')), ('__signal_arguments__', (('currentLayerChanged', ('layer: QgsMapLayer',)), ('currentThemeChanged', ('theme: str',)), ('layoutDesignerOpened', ('designer: QgsLayoutDesignerInterface',)), ('layoutDesignerWillBeClosed', ('designer: QgsLayoutDesignerInterface',)), ('layerSavedAs', ('l: QgsMapLayer', 'path: str')))))),
+    )),
+    ('src/gui/symbology/qgs25drendererwidget.h', (
+        ('Qgs25DRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'apply')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/inputcontroller/qgs2dgamepadcontroller.h', (
+        ('QgsGamepad2DMapController', (('__attribute_docs__', (('connectedChanged', 'Emitted when the connection state of the gamepad is changed.\n'), ('axisLeftXChanged', "Emitted when the value of the left thumbstick's X axis is changed.\n\n.. seealso:: :py:func:`axisLeftX`\n"), ('axisLeftYChanged', "Emitted when the value of the left thumbstick's Y axis is changed.\n\n.. seealso:: :py:func:`axisLeftY`\n"), ('axisRightXChanged', "Emitted when the value of the right thumbstick's X axis is changed.\n\n.. seealso:: :py:func:`axisRightX`\n"), ('axisRightYChanged', "Emitted when the value of the right thumbstick's Y axis is changed.\n\n.. seealso:: :py:func:`axisRightY`\n"), ('buttonAChanged', 'Emitted when the state of the A button is changed.\n\n.. seealso:: :py:func:`buttonA`\n'), ('buttonBChanged', 'Emitted when the state of the B button is changed.\n\n.. seealso:: :py:func:`buttonB`\n'), ('buttonXChanged', 'Emitted when the state of the X button is changed.\n\n.. seealso:: :py:func:`buttonX`\n'), ('buttonYChanged', 'Emitted when the state of the Y button is changed.\n\n.. seealso:: :py:func:`buttonY`\n'), ('buttonL1Changed', 'Emitted when the state of the left shoulder button is changed.\n\n.. seealso:: :py:func:`buttonL1`\n'), ('buttonR1Changed', 'Emitted when the state of the right shoulder button is changed.\n\n.. seealso:: :py:func:`buttonR1`\n'), ('buttonL2Changed', 'Emitted when the state of the left trigger button is changed.\n\n.. seealso:: :py:func:`buttonL2`\n'), ('buttonR2Changed', 'Emitted when the state of the right trigger button is changed.\n\n.. seealso:: :py:func:`buttonR2`\n'), ('buttonSelectChanged', 'Emitted when the state of the select button is changed.\n\n.. seealso:: :py:func:`buttonSelect`\n'), ('buttonStartChanged', 'Emitted when the state of the start button is changed.\n\n.. seealso:: :py:func:`buttonStart`\n'), ('buttonL3Changed', 'Emitted when the state of the left stick button is changed.\n\n.. seealso:: :py:func:`buttonL3`\n'), ('buttonR3Changed', 'Emitted when the state of the right stick button is changed.\n\n.. seealso:: :py:func:`buttonR3`\n'), ('buttonUpChanged', 'Emitted when the state of the direction pad up button is changed.\n\n.. seealso:: :py:func:`buttonUp`\n'), ('buttonDownChanged', 'Emitted when the state of the direction pad down button is changed.\n\n.. seealso:: :py:func:`buttonDown`\n'), ('buttonLeftChanged', 'Emitted when the state of the direction pad left button is changed.\n\n.. seealso:: :py:func:`buttonLeft`\n'), ('buttonRightChanged', 'Emitted when the state of the direction pad right button is changed.\n\n.. seealso:: :py:func:`buttonRight`\n'), ('buttonCenterChanged', 'Emitted when the state of the center button is changed.\n\n.. seealso:: :py:func:`buttonCenter`\n'), ('buttonGuideChanged', 'Emitted when the state of the guide button is changed.\n\n.. seealso:: :py:func:`buttonCenter`\n'))), ('__overridden_methods__', ('clone', 'deviceId')), ('__signal_arguments__', (('connectedChanged', ('value: bool',)), ('axisLeftXChanged', ('value: float',)), ('axisLeftYChanged', ('value: float',)), ('axisRightXChanged', ('value: float',)), ('axisRightYChanged', ('value: float',)), ('buttonAChanged', ('value: bool',)), ('buttonBChanged', ('value: bool',)), ('buttonXChanged', ('value: bool',)), ('buttonYChanged', ('value: bool',)), ('buttonL1Changed', ('value: bool',)), ('buttonR1Changed', ('value: bool',)), ('buttonL2Changed', ('value: float',)), ('buttonR2Changed', ('value: float',)), ('buttonSelectChanged', ('value: bool',)), ('buttonStartChanged', ('value: bool',)), ('buttonL3Changed', ('value: bool',)), ('buttonR3Changed', ('value: bool',)), ('buttonUpChanged', ('value: bool',)), ('buttonDownChanged', ('value: bool',)), ('buttonLeftChanged', ('value: bool',)), ('buttonRightChanged', ('value: bool',)), ('buttonCenterChanged', ('value: bool',)), ('buttonGuideChanged', ('value: bool',)))), ('__group__', ('inputcontroller',)))),
+    )),
+    ('src/gui/inputcontroller/qgs2dmapcontroller.h', (
+        ('QgsAbstract2DMapController', (('__overridden_methods__', ('type',)), ('__group__', ('inputcontroller',)))),
+    )),
+    ('src/gui/inputcontroller/qgs3dgamepadcontroller.h', (
+        ('QgsGamepad3DMapController', (('__attribute_docs__', (('connectedChanged', 'Emitted when the connection state of the gamepad is changed.\n'), ('axisLeftXChanged', "Emitted when the value of the left thumbstick's X axis is changed.\n\n.. seealso:: :py:func:`axisLeftX`\n"), ('axisLeftYChanged', "Emitted when the value of the left thumbstick's Y axis is changed.\n\n.. seealso:: :py:func:`axisLeftY`\n"), ('axisRightXChanged', "Emitted when the value of the right thumbstick's X axis is changed.\n\n.. seealso:: :py:func:`axisRightX`\n"), ('axisRightYChanged', "Emitted when the value of the right thumbstick's Y axis is changed.\n\n.. seealso:: :py:func:`axisRightY`\n"), ('buttonAChanged', 'Emitted when the state of the A button is changed.\n\n.. seealso:: :py:func:`buttonA`\n'), ('buttonBChanged', 'Emitted when the state of the B button is changed.\n\n.. seealso:: :py:func:`buttonB`\n'), ('buttonXChanged', 'Emitted when the state of the X button is changed.\n\n.. seealso:: :py:func:`buttonX`\n'), ('buttonYChanged', 'Emitted when the state of the Y button is changed.\n\n.. seealso:: :py:func:`buttonY`\n'), ('buttonL1Changed', 'Emitted when the state of the left shoulder button is changed.\n\n.. seealso:: :py:func:`buttonL1`\n'), ('buttonR1Changed', 'Emitted when the state of the right shoulder button is changed.\n\n.. seealso:: :py:func:`buttonR1`\n'), ('buttonL2Changed', 'Emitted when the state of the left trigger button is changed.\n\n.. seealso:: :py:func:`buttonL2`\n'), ('buttonR2Changed', 'Emitted when the state of the right trigger button is changed.\n\n.. seealso:: :py:func:`buttonR2`\n'), ('buttonSelectChanged', 'Emitted when the state of the select button is changed.\n\n.. seealso:: :py:func:`buttonSelect`\n'), ('buttonStartChanged', 'Emitted when the state of the start button is changed.\n\n.. seealso:: :py:func:`buttonStart`\n'), ('buttonL3Changed', 'Emitted when the state of the left stick button is changed.\n\n.. seealso:: :py:func:`buttonL3`\n'), ('buttonR3Changed', 'Emitted when the state of the right stick button is changed.\n\n.. seealso:: :py:func:`buttonR3`\n'), ('buttonUpChanged', 'Emitted when the state of the direction pad up button is changed.\n\n.. seealso:: :py:func:`buttonUp`\n'), ('buttonDownChanged', 'Emitted when the state of the direction pad down button is changed.\n\n.. seealso:: :py:func:`buttonDown`\n'), ('buttonLeftChanged', 'Emitted when the state of the direction pad left button is changed.\n\n.. seealso:: :py:func:`buttonLeft`\n'), ('buttonRightChanged', 'Emitted when the state of the direction pad right button is changed.\n\n.. seealso:: :py:func:`buttonRight`\n'), ('buttonCenterChanged', 'Emitted when the state of the center button is changed.\n\n.. seealso:: :py:func:`buttonCenter`\n'), ('buttonGuideChanged', 'Emitted when the state of the guide button is changed.\n\n.. seealso:: :py:func:`buttonCenter`\n'))), ('__overridden_methods__', ('clone', 'deviceId')), ('__signal_arguments__', (('connectedChanged', ('value: bool',)), ('axisLeftXChanged', ('value: float',)), ('axisLeftYChanged', ('value: float',)), ('axisRightXChanged', ('value: float',)), ('axisRightYChanged', ('value: float',)), ('buttonAChanged', ('value: bool',)), ('buttonBChanged', ('value: bool',)), ('buttonXChanged', ('value: bool',)), ('buttonYChanged', ('value: bool',)), ('buttonL1Changed', ('value: bool',)), ('buttonR1Changed', ('value: bool',)), ('buttonL2Changed', ('value: float',)), ('buttonR2Changed', ('value: float',)), ('buttonSelectChanged', ('value: bool',)), ('buttonStartChanged', ('value: bool',)), ('buttonL3Changed', ('value: bool',)), ('buttonR3Changed', ('value: bool',)), ('buttonUpChanged', ('value: bool',)), ('buttonDownChanged', ('value: bool',)), ('buttonLeftChanged', ('value: bool',)), ('buttonRightChanged', ('value: bool',)), ('buttonCenterChanged', ('value: bool',)), ('buttonGuideChanged', ('value: bool',)))), ('__group__', ('inputcontroller',)))),
+    )),
+    ('src/gui/inputcontroller/qgs3dmapcontroller.h', (
+        ('QgsAbstract3DMapController', (('__overridden_methods__', ('type',)), ('__group__', ('inputcontroller',)))),
+    )),
+    ('src/gui/qgs3dsymbolwidget.h', (
+        ('Qgs3DSymbolWidget', (('__attribute_docs__', (('changed', 'Emitted when the symbol is changed.\n'),)), ('__abstract_methods__', ('setSymbol', 'symbol', 'symbolType')))),
+    )),
+    ('src/gui/qgsabstractdatasourcewidget.h', (
+        ('QgsAbstractDataSourceWidget', (('__attribute_docs__', (('connectionsChanged', "Emitted when the provider's connections have changed This signal is\nnormally forwarded the app and used to refresh browser items\n"), ('addDatabaseLayers', 'Emitted when a DB layer has been selected for addition\n'), ('addRasterLayer', 'Emitted when a raster layer has been selected for addition\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsAbstractDataSourceWidget.addLayer` instead.\n'), ('addRasterLayers', 'Emitted when one or more GDAL supported layers are selected for addition\n\n:param layersList: list of layers protocol URIs\n\n.. versionadded:: 3.20\n'), ('addVectorLayer', 'Emitted when a vector layer has been selected for addition.\n\nIf ``providerKey`` is not specified, the default provider key associated\nwith the source will be used.\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsAbstractDataSourceWidget.addLayer` instead.\n'), ('addMeshLayer', 'Emitted when a mesh layer has been selected for addition.\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsAbstractDataSourceWidget.addLayer` instead.\n'), ('addVectorTileLayer', 'Emitted when a vector tile layer has been selected for addition.\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsAbstractDataSourceWidget.addLayer` instead.\n'), ('addPointCloudLayer', 'Emitted when a point cloud layer has been selected for addition.\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsAbstractDataSourceWidget.addLayer` instead.\n'), ('addLayer', 'Emitted when a layer has been selected for addition.\n\nThis is a generic method, intended for replacing the specific layer type\nsignals implemented above.\n\n.. warning::\n\n   For QGIS versions < 4.x, the specific layer type added signals must be emitted for vector, raster,\n   mesh, vector tile and point cloud layers in addition to this signal.\n\n.. versionadded:: 3.34\n'), ('addVectorLayers', 'Emitted when one or more OGR supported layers are selected for addition\n\n:param layerList: list of layers protocol URIs\n:param encoding: encoding\n:param dataSourceType: string (can be "file" or "database")\n'), ('replaceVectorLayer', 'Emitted when a layer needs to be replaced\n\n:param oldId: old layer ID\n:param source: URI of the layer\n:param name: of the layer\n:param provider: key\n'), ('progress', 'Emitted when a progress dialog is shown by the provider dialog.\n\n.. deprecated:: 3.4\n\n   This signal is no longer used. Use :py:class:`QgsProxyProgressTask` instead to show progress reports.\n'), ('progressMessage', 'Emitted when a progress dialog is shown by the provider dialog\n'), ('enableButtons', 'Emitted when the ok/add buttons should be enabled/disabled\n'), ('pushMessage', 'Emitted when a ``message`` with ``title`` and ``level`` must be shown to\nthe user using the parent visible message bar\n\n.. versionadded:: 3.14\n'))), ('__virtual_methods__', ('setBrowserModel', 'mapCanvas', 'setMapCanvas', 'refresh', 'addButtonClicked', 'reset', 'configureFromUri')), ('__signal_arguments__', (('addDatabaseLayers', ('paths: List[str]', 'providerKey: str')), ('addRasterLayers', ('layersList: List[str]',)), ('addLayer', ('type: Qgis.LayerType', 'url: str', 'baseName: str', 'providerKey: str')), ('addVectorLayers', ('layerList: List[str]', 'encoding: str', 'dataSourceType: str')), ('replaceVectorLayer', ('oldId: str', 'source: str', 'name: str', 'provider: str')), ('progressMessage', ('message: str',)), ('enableButtons', ('enable: bool',)), ('pushMessage', ('title: str', 'message: str', 'level: Qgis.MessageLevel = Qgis.MessageLevel.Info')))))),
+    )),
+    ('src/gui/providers/qgsabstractdbsourceselect.h', (
+        ('QgsAbstractDbSourceSelect', (('__virtual_methods__', ('settingPath', 'treeviewClicked', 'treeviewDoubleClicked')), ('__abstract_methods__', ('setSql',)), ('__group__', ('providers',)))),
+    )),
+    ('src/gui/inputcontroller/qgsabstractinputcontroller.h', (
+        ('QgsAbstractInputController', (('__abstract_methods__', ('clone', 'deviceId', 'type')), ('__group__', ('inputcontroller',)))),
+    )),
+    ('src/gui/qgsabstractmaptoolhandler.h', (
+        ('QgsAbstractMapToolHandler', (('__virtual_methods__', ('setLayerForTool',)), ('__abstract_methods__', ('isCompatibleWithLayer',)))),
+    )),
+    ('src/gui/qgsabstractrelationeditorwidget.h', (
+        ('QgsAbstractRelationEditorWidget', (('__attribute_docs__', (('relatedFeaturesChanged', 'Emit this signal, whenever the related features changed. This happens\nfor example when related features are added, removed, linked or\nunlinked.\n\n.. versionadded:: 3.22\n'),)), ('__virtual_methods__', ('setEditorContext', 'updateUi', 'setTitle', 'beforeSetRelationFeature', 'afterSetRelationFeature', 'beforeSetRelations', 'afterSetRelations')), ('__abstract_methods__', ('config', 'setConfig', 'parentFormValueChanged')))),
+        ('QgsAbstractRelationEditorConfigWidget', (('__virtual_methods__', ('setNmRelation', 'nmRelation')), ('__abstract_methods__', ('config', 'setConfig')))),
+        ('QgsAbstractRelationEditorWidgetFactory', (('__abstract_methods__', ('type', 'name', 'create', 'configWidget')),)),
+    )),
+    ('src/gui/actions/qgsactionmenu.h', (
+        ('QgsActionMenu', (('__attribute_docs__', (('reinit', 'Emitted after actions have been reloaded.\n'),)), ('__group__', ('actions',)))),
+        ('QgsActionMenu.ActionData', (('__group__', ('actions',)),)),
+    )),
+    ('src/gui/editorwidgets/qgsactionwidgetwrapper.h', (
+        ('QgsActionWidgetWrapper', (('__overridden_methods__', ('valid', 'createWidget', 'initWidget', 'setFeature', 'setEnabled')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsadvanceddigitizingcanvasitem.h', (
+        ('QgsAdvancedDigitizingCanvasItem', (('__overridden_methods__', ('paint', 'updatePosition')),)),
+    )),
+    ('src/gui/qgsadvanceddigitizingdockwidget.h', (
+        ('QgsAdvancedDigitizingDockWidget', (('__attribute_docs__', (('pushWarning', 'Push a warning\n\n:param message: An informative message\n'), ('popWarning', 'Remove any previously emitted warnings (if any)\n'), ('pointChangedV2', 'Sometimes a constraint may change the current point out of a mouse\nevent. This happens normally when a constraint is toggled.\n\n:param point: The last known digitizing point. Can be used to emulate a\n              mouse event.\n\n.. versionadded:: 3.22\n'), ('pointChanged', 'Sometimes a constraint may change the current point out of a mouse\nevent. This happens normally when a constraint is toggled.\n\n:param point: The last known digitizing point. Can be used to emulate a\n              mouse event.\n\n.. deprecated:: 3.22\n\n   No longer used, will be removed in QGIS 4.0. Use :py:func:`~QgsAdvancedDigitizingDockWidget.pointChangedV2` instead.\n'), ('cadEnabledChanged', 'Emitted whenever CAD is enabled or disabled\n\n:param enabled: Whether CAD is enabled or not\n\n.. note::\n\n   unstable API (will likely change).\n\n.. versionadded:: 3.8\n'), ('valueXChanged', 'Emitted whenever the X ``value`` changes (either the mouse moved, or the\nuser changed the input). Could be used by widgets that must reflect the\ncurrent advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('valueYChanged', 'Emitted whenever the Y ``value`` changes (either the mouse moved, or the\nuser changed the input). Could be used by widgets that must reflect the\ncurrent advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('valueZChanged', 'Emitted whenever the Z ``value`` changes (either the mouse moved, or the\nuser changed the input). Could be used by widgets that must reflect the\ncurrent advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('valueMChanged', 'Emitted whenever the M ``value`` changes (either the mouse moved, or the\nuser changed the input). Could be used by widgets that must reflect the\ncurrent advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('valueAngleChanged', 'Emitted whenever the angle ``value`` changes (either the mouse moved, or\nthe user changed the input). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('valueDistanceChanged', 'Emitted whenever the distance ``value`` changes (either the mouse moved,\nor the user changed the input). Could be used by widgets that must\nreflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('valueBearingChanged', 'Emitted whenever the bearing ``value`` changes. Could be used by widgets\nthat must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.32\n'), ('lockXChanged', 'Emitted whenever the X parameter is ``locked``. Could be used by widgets\nthat must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('lockYChanged', 'Emitted whenever the Y parameter is ``locked``. Could be used by widgets\nthat must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('lockZChanged', 'Emitted whenever the Z parameter is ``locked``. Could be used by widgets\nthat must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('lockMChanged', 'Emitted whenever the M parameter is ``locked``. Could be used by widgets\nthat must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('lockAngleChanged', 'Emitted whenever the angle parameter is ``locked``. Could be used by\nwidgets that must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('lockDistanceChanged', 'Emitted whenever the distance parameter is ``locked``. Could be used by\nwidgets that must reflect the current advanced digitizing state.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('relativeXChanged', 'Emitted whenever the X parameter is toggled between absolute and\nrelative. Could be used by widgets that must reflect the current\nadvanced digitizing state.\n\n:param relative: Whether the X parameter is relative or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('relativeYChanged', 'Emitted whenever the Y parameter is toggled between absolute and\nrelative. Could be used by widgets that must reflect the current\nadvanced digitizing state.\n\n:param relative: Whether the Y parameter is relative or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('relativeZChanged', 'Emitted whenever the Z parameter is toggled between absolute and\nrelative. Could be used by widgets that must reflect the current\nadvanced digitizing state.\n\n:param relative: Whether the Z parameter is relative or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('relativeMChanged', 'Emitted whenever the M parameter is toggled between absolute and\nrelative. Could be used by widgets that must reflect the current\nadvanced digitizing state.\n\n:param relative: Whether the M parameter is relative or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('relativeAngleChanged', 'Emitted whenever the angleX parameter is toggled between absolute and\nrelative. Could be used by widgets that must reflect the current\nadvanced digitizing state.\n\n:param relative: Whether the angle parameter is relative or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('softLockLineExtensionChanged', 'Emitted whenever the soft line extension parameter is ``locked``. Could\nbe used by widgets that must reflect the current advanced digitizing\nstate.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.26\n'), ('softLockXyChanged', 'Emitted whenever the soft x/y extension parameter is ``locked``. Could\nbe used by widgets that must reflect the current advanced digitizing\nstate.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.26\n'), ('enabledChangedX', 'Emitted whenever the X field is enabled or disabled. Depending on the\ncontext, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the X parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('enabledChangedY', 'Emitted whenever the Y field is enabled or disabled. Depending on the\ncontext, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the Y parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('enabledChangedZ', 'Emitted whenever the Z field is enabled or disabled. Depending on the\ncontext, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the Z parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('enabledChangedM', 'Emitted whenever the M field is enabled or disabled. Depending on the\ncontext, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the M parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('enabledChangedAngle', 'Emitted whenever the angle field is enabled or disabled. Depending on\nthe context, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the angle parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('enabledChangedDistance', 'Emitted whenever the distance field is enabled or disabled. Depending on\nthe context, some parameters do not make sense (e.g. you need a previous\npoint to define a distance). Could be used by widgets that must reflect\nthe current advanced digitizing state.\n\n:param enabled: Whether the distance parameter is enabled or not.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('focusOnXRequested', 'Emitted whenever the X field should get the focus using the shortcuts\n(X). Could be used by widgets to capture the focus when a field is being\nedited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('focusOnYRequested', 'Emitted whenever the Y field should get the focus using the shortcuts\n(Y). Could be used by widgets to capture the focus when a field is being\nedited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('focusOnZRequested', 'Emitted whenever the Z field should get the focus using the shortcuts\n(Z). Could be used by widgets to capture the focus when a field is being\nedited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('focusOnMRequested', 'Emitted whenever the M field should get the focus using the shortcuts\n(M). Could be used by widgets to capture the focus when a field is being\nedited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.22\n'), ('focusOnAngleRequested', 'Emitted whenever the angle field should get the focus using the\nshortcuts (A). Could be used by widgets to capture the focus when a\nfield is being edited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('focusOnDistanceRequested', 'Emitted whenever the distance field should get the focus using the\nshortcuts (D). Could be used by widgets to capture the focus when a\nfield is being edited.\n\n.. note::\n\n   unstable API (will likely change)\n\n.. versionadded:: 3.8\n'), ('valueCommonAngleSnappingChanged', 'Emitted whenever the snapping to common angle option changes, angle = 0\nmeans that the functionality is disabled.\n\n.. versionadded:: 3.32\n'))), ('__overridden_methods__', ('keyPressEvent',)), ('__signal_arguments__', (('pushWarning', ('message: str',)), ('pointChangedV2', ('point: QgsPoint',)), ('cadEnabledChanged', ('enabled: bool',)), ('valueXChanged', ('value: str',)), ('valueYChanged', ('value: str',)), ('valueZChanged', ('value: str',)), ('valueMChanged', ('value: str',)), ('valueAngleChanged', ('value: str',)), ('valueDistanceChanged', ('value: str',)), ('valueBearingChanged', ('value: str',)), ('lockXChanged', ('locked: bool',)), ('lockYChanged', ('locked: bool',)), ('lockZChanged', ('locked: bool',)), ('lockMChanged', ('locked: bool',)), ('lockAngleChanged', ('locked: bool',)), ('lockDistanceChanged', ('locked: bool',)), ('relativeXChanged', ('relative: bool',)), ('relativeYChanged', ('relative: bool',)), ('relativeZChanged', ('relative: bool',)), ('relativeMChanged', ('relative: bool',)), ('relativeAngleChanged', ('relative: bool',)), ('softLockLineExtensionChanged', ('locked: bool',)), ('softLockXyChanged', ('locked: bool',)), ('enabledChangedX', ('enabled: bool',)), ('enabledChangedY', ('enabled: bool',)), ('enabledChangedZ', ('enabled: bool',)), ('enabledChangedM', ('enabled: bool',)), ('enabledChangedAngle', ('enabled: bool',)), ('enabledChangedDistance', ('enabled: bool',)), ('valueCommonAngleSnappingChanged', ('angle: float',)))))),
+        ('QgsAdvancedDigitizingDockWidget.CadConstraint', ('removeSuffix',)),
+    )),
+    ('src/gui/qgsadvanceddigitizingfloater.h', (
+        ('QgsAdvancedDigitizingFloater', (('__overridden_methods__', ('eventFilter',)),)),
+    )),
+    ('src/gui/qgsadvanceddigitizingtools.h', (
+        ('QgsAdvancedDigitizingTool', (('__attribute_docs__', (('paintRequested', 'Requests a new painting event to the advanced digitizing canvas item.\n'),)), ('__virtual_methods__', ('createWidget', 'paint', 'canvasPressEvent', 'canvasMoveEvent', 'canvasReleaseEvent')))),
+    )),
+    ('src/gui/qgsadvanceddigitizingtoolsregistry.h', (
+        ('QgsAdvancedDigitizingToolAbstractMetadata', (('__virtual_methods__', ('createTool',)),)),
+    )),
+    ('src/gui/qgsaggregatetoolbutton.h', (
+        ('QgsAggregateToolButton', (('__attribute_docs__', (('aggregateChanged', 'The function name of the selected aggregate has changed.\n'), ('activeChanged', 'A function has been selected or deselected.\n'))),)),
+    )),
+    ('src/gui/qgsalignmentcombobox.h', (
+        ('QgsAlignmentComboBox', (('__attribute_docs__', (('changed', 'Emitted when the alignment is changed.\n'),)),)),
+    )),
+    ('src/gui/annotations/qgsannotationitemcommonpropertieswidget.h', (
+        ('QgsAnnotationItemCommonPropertiesWidget', (('__attribute_docs__', (('itemChanged', 'Emitted when the annotation item definition in the widget is changed by\nthe user.\n'),)), ('__group__', ('annotations',)))),
+    )),
+    ('src/gui/annotations/qgsannotationitemguiregistry.h', (
+        ('QgsAnnotationItemGuiRegistry', (('__attribute_docs__', (('typeAdded', 'Emitted whenever a new item type is added to the registry, with the\nspecified ``metadataId``.\n'),)), ('__signal_arguments__', (('typeAdded', ('metadataId: int',)),)), ('__group__', ('annotations',)))),
+        ('QgsAnnotationItemAbstractGuiMetadata', (('__virtual_methods__', ('creationIcon', 'createItemWidget', 'createMapTool', 'createItem', 'newItemAddedToLayer')), ('__group__', ('annotations',)))),
+    )),
+    ('src/gui/annotations/qgsannotationitemwidget.h', (
+        ('QgsAnnotationItemBaseWidget', (('__attribute_docs__', (('itemChanged', 'Emitted when the annotation item definition in the widget is changed by\nthe user.\n'),)), ('__virtual_methods__', ('setLayer', 'setContext', 'focusDefaultWidget', 'setNewItem')), ('__abstract_methods__', ('createItem', 'updateItem')), ('__group__', ('annotations',)))),
+    )),
+    ('src/gui/qgsapplicationexitblockerinterface.h', (
+        ('QgsApplicationExitBlockerInterface', (('__abstract_methods__', ('allowExit',)),)),
+    )),
+    ('src/gui/symbology/qgsarrowsymbollayerwidget.h', (
+        ('QgsArrowSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsattributedialog.h', (
+        ('QgsAttributeDialog', (('__overridden_methods__', ('event', 'showEvent', 'createActionContext', 'accept', 'reject')),)),
+    )),
+    ('src/gui/qgsattributeform.h', (
+        ('QgsAttributeForm', (('__attribute_docs__', (('attributeChanged', 'Notifies about changes of attributes, this signal is not emitted when\nthe value is set back to the original one.\n\n:param attribute: The name of the attribute that changed.\n:param value: The new value of the attribute.\n\n.. deprecated:: 3.0\n'), ('widgetValueChanged', 'Notifies about changes of attributes\n\n:param attribute: The name of the attribute that changed.\n:param value: The new value of the attribute.\n:param attributeChanged: If ``True``, it corresponds to an actual change\n                         of the feature attribute\n'), ('featureSaved', 'Emitted when a feature is changed or added\n'), ('filterExpressionSet', 'Emitted when a filter expression is set using the form.\n\n:param expression: filter expression\n:param type: filter type\n'), ('modeChanged', 'Emitted when the form changes mode.\n\n:param mode: new mode\n'), ('closed', "Emitted when the user selects the close option from the form's button\nbar.\n"), ('zoomToFeatures', 'Emitted when the user chooses to zoom to a filtered set of features.\n'), ('flashFeatures', 'Emitted when the user chooses to flash a filtered set of features.\n'), ('openFilteredFeaturesAttributeTable', 'Emitted when the user chooses to open the attribute table dialog with a\nfiltered set of features.\n\n.. versionadded:: 3.24\n'))), ('__overridden_methods__', ('eventFilter',)), ('__signal_arguments__', (('widgetValueChanged', ('attribute: str', 'value: object', 'attributeChanged: bool')), ('featureSaved', ('feature: QgsFeature',)), ('filterExpressionSet', ('expression: str', 'type: QgsAttributeForm.FilterType')), ('modeChanged', ('mode: QgsAttributeEditorContext.Mode',)), ('zoomToFeatures', ('filter: str',)), ('flashFeatures', ('filter: str',)), ('openFilteredFeaturesAttributeTable', ('filter: str',)))))),
+    )),
+    ('src/gui/qgsattributeformeditorwidget.h', (
+        ('QgsAttributeFormEditorWidget', (('__attribute_docs__', (('valueChanged', "Emitted when the widget's value changes\n\n:param value: new widget value\n\n.. deprecated:: 3.10\n\n   Use :py:func:`~QgsAttributeFormEditorWidget.valuesChanged` instead.\n"), ('valuesChanged', "Emitted when the widget's value changes\n\n:param value: new widget value\n:param additionalFieldValues: of the potential additional fields\n\n.. versionadded:: 3.10\n"))), ('__overridden_methods__', ('createSearchWidgetWrappers',)), ('__signal_arguments__', (('valueChanged', ('value: object',)), ('valuesChanged', ('value: object', 'additionalFieldValues: List[object]')))))),
+    )),
+    ('src/gui/qgsattributeforminterface.h', (
+        ('QgsAttributeFormInterface', (('__virtual_methods__', ('acceptChanges', 'initForm', 'featureChanged')),)),
+    )),
+    ('src/gui/qgsattributeformrelationeditorwidget.h', (
+        ('QgsAttributeFormRelationEditorWidget', (('__overridden_methods__', ('createSearchWidgetWrappers', 'currentFilterExpression')),)),
+    )),
+    ('src/gui/qgsattributeformwidget.h', (
+        ('QgsAttributeFormWidget', (('__virtual_methods__', ('currentFilterExpression',)), ('__abstract_methods__', ('createSearchWidgetWrappers',)))),
+    )),
+    ('src/gui/attributetable/qgsattributetabledelegate.h', (
+        ('QgsAttributeTableDelegate', (('__attribute_docs__', (('actionColumnItemPainted', 'Emitted when an action column item is painted. The consumer of this\nsignal can initialize the index widget.\n\n.. note::\n\n   This signal is emitted repeatedly whenever the item is being painted.\n   It is the consumers responsibility to check if initialization has already\n   happened before.\n'),)), ('__overridden_methods__', ('createEditor', 'paint', 'setModelData', 'setEditorData')), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsattributetablefiltermodel.h', (
+        ('QgsAttributeTableFilterModel', (('__attribute_docs__', (('sortColumnChanged', 'Emitted whenever the sort column is changed\n\n:param column: The sort column\n:param order: The sort order\n'), ('featuresFiltered', 'Emitted when the filtering of the features has been done\n'), ('visibleReloaded', 'Emitted when the the visible features on extend are reloaded (the list\nis created)\n'), ('filterError', 'Emitted when an error occurred while filtering features\n\n.. versionadded:: 3.18\n'))), ('__virtual_methods__', ('setFilteredFeatures',)), ('__overridden_methods__', ('fidToIndex', 'mapToSource', 'mapFromSource', 'flags', 'sort', 'data', 'headerData', 'columnCount', 'filterAcceptsRow', 'lessThan')), ('__signal_arguments__', (('sortColumnChanged', ('column: int', 'order: Qt.SortOrder')), ('filterError', ('errorMessage: str',)))), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsattributetablemodel.h', (
+        ('QgsAttributeTableModel', (('__attribute_docs__', (('modelChanged', 'Emitted when the model has been changed.\n'), ('finished', 'Emitted when the model has completely loaded all features.\n'))), ('__virtual_methods__', ('loadLayer',)), ('__overridden_methods__', ('rowCount', 'columnCount', 'headerData', 'data', 'setData', 'flags', 'removeRows')), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsattributetableview.h', (
+        ('QgsAttributeTableView', (('__attribute_docs__', (('willShowContextMenu', 'Emitted in order to provide a hook to add additional* menu entries to\nthe context menu.\n\n:param menu: If additional QMenuItems are added, they will show up in\n             the context menu.\n:param atIndex: The QModelIndex, to which the context menu belongs.\n                Relative to the source model. In most cases, this will\n                be a :py:class:`QgsAttributeTableFilterModel`\n'), ('columnResized', 'Emitted when a column in the view has been resized.\n\n:param column: column index (starts at 0)\n:param width: new width in pixel\n'), ('finished', '.. deprecated:: 3.40\n\n   No longer used.\n'))), ('__virtual_methods__', ('setModel', 'selectRow', '_q_selectRow')), ('__overridden_methods__', ('eventFilter', 'mousePressEvent', 'mouseReleaseEvent', 'mouseMoveEvent', 'keyPressEvent', 'contextMenuEvent', 'closeEvent', 'selectAll')), ('__signal_arguments__', (('willShowContextMenu', ('menu: QMenu', 'atIndex: QModelIndex')), ('columnResized', ('column: int', 'width: int')))), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/qgsattributetypeloaddialog.h', (
+        ('QgsAttributeTypeLoadDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/auth/qgsauthauthoritieseditor.h', (
+        ('QgsAuthAuthoritiesEditor', (('__overridden_methods__', ('showEvent',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthcertificateinfo.h', (
+        ('QgsAuthCertInfo', (('__group__', ('auth',)),)),
+        ('QgsAuthCertInfoDialog', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthcertificatemanager.h', (
+        ('QgsAuthCertEditors', (('__group__', ('auth',)),)),
+        ('QgsAuthCertManager', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthcerttrustpolicycombobox.h', (
+        ('QgsAuthCertTrustPolicyComboBox', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthconfigeditor.h', (
+        ('QgsAuthConfigEditor', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthconfigselect.h', (
+        ('QgsAuthConfigSelect', (('__attribute_docs__', (('selectedConfigIdChanged', 'Emitted when authentication config is changed or missing\n'), ('selectedConfigIdRemoved', 'Emitted when authentication config is removed\n'))), ('__signal_arguments__', (('selectedConfigIdChanged', ('authcfg: str',)), ('selectedConfigIdRemoved', ('authcfg: str',)))), ('__group__', ('auth',)))),
+        ('QgsAuthConfigUriEdit', ('hasConfigId', ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsautheditorwidgets.h', (
+        ('QgsAuthMethodPlugins', (('__group__', ('auth',)),)),
+        ('QgsAuthEditorWidgets', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthidentitieseditor.h', (
+        ('QgsAuthIdentitiesEditor', (('__overridden_methods__', ('showEvent',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthimportcertdialog.h', (
+        ('QgsAuthImportCertDialog', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthimportidentitydialog.h', (
+        ('QgsAuthImportIdentityDialog', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthmethodedit.h', (
+        ('QgsAuthMethodEdit', (('__attribute_docs__', (('validityChanged', 'Emitted when the configuration validatity changes\n'),)), ('__abstract_methods__', ('validateConfig', 'configMap', 'loadConfig', 'resetConfig', 'clearConfig')), ('__signal_arguments__', (('validityChanged', ('valid: bool',)),)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthserverseditor.h', (
+        ('QgsAuthServersEditor', (('__overridden_methods__', ('showEvent',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthsettingswidget.h', (
+        ('QgsAuthSettingsWidget', (('__attribute_docs__', (('usernameChanged', 'Emitted when the plain text username defined in the dialog is changed.\n\n.. versionadded:: 3.22\n'), ('passwordChanged', 'Emitted when the plain text password defined in the dialog is changed.\n\n.. versionadded:: 3.22\n'), ('configIdChanged', 'Emitted when the auth configuration ID selected in the dialog is\nchanged.\n\n.. versionadded:: 3.22\n'))), 'formattedWarning', ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthsslconfigwidget.h', (
+        ('QgsAuthSslConfigWidget', (('__attribute_docs__', (('configEnabledChanged', 'Emitted when the enabled state of the configuration changes\n'), ('certFoundInAuthDatabase', 'Emitted when an certificate of same SHA hash is found in authentication\ndatabase\n'), ('hostPortValidityChanged', 'Emitted when the validity of the host:port changes\n'), ('readyToSaveChanged', 'Emitted when the configuration can be saved changes\n'))), ('__signal_arguments__', (('configEnabledChanged', ('enabled: bool',)), ('certFoundInAuthDatabase', ('found: bool',)), ('hostPortValidityChanged', ('valid: bool',)), ('readyToSaveChanged', ('cansave: bool',)))), ('__group__', ('auth',)))),
+        ('QgsAuthSslConfigDialog', (('__overridden_methods__', ('accept',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthsslerrorsdialog.h', (
+        ('QgsAuthSslErrorsDialog', (('__group__', ('auth',)),)),
+    )),
+    ('src/gui/auth/qgsauthsslimportdialog.h', (
+        ('QgsAuthSslImportDialog', (('__overridden_methods__', ('accept',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/auth/qgsauthtrustedcasdialog.h', (
+        ('QgsAuthTrustedCAsDialog', (('__overridden_methods__', ('showEvent',)), ('__group__', ('auth',)))),
+    )),
+    ('src/gui/qgsbrowserdockwidget.h', (
+        ('QgsBrowserDockWidget', (('__attribute_docs__', (('openFile', 'Emitted when a file needs to be opened\n'), ('handleDropUriList', 'Emitted when drop uri list needs to be handled\n'), ('connectionsChanged', 'Connections changed in the browser\n'))), ('__signal_arguments__', (('openFile', ('fileName: str', 'fileTypeHint: Optional[str] = None')), ('handleDropUriList', ('uris: QgsMimeDataUtils.UriList',)))))),
+    )),
+    ('src/gui/qgsbrowserguimodel.h', (
+        ('QgsBrowserGuiModel', (('__overridden_methods__', ('flags', 'dropMimeData', 'setData')),)),
+    )),
+    ('src/gui/qgsbrowsertreeview.h', (
+        ('QgsBrowserTreeView', (('__overridden_methods__', ('setModel', 'showEvent', 'hideEvent', 'keyPressEvent', 'rowsInserted')),)),
+    )),
+    ('src/gui/qgsbrowserwidget.h', (
+        ('QgsBrowserWidget', (('__overridden_methods__', ('showEvent',)),)),
+    )),
+    ('src/gui/symbology/qgsbrushstylecombobox.h', (
+        ('QgsBrushStyleComboBox', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/callouts/qgscalloutpanelwidget.h', (
+        ('QgsCalloutPanelWidget', (('__attribute_docs__', (('calloutChanged', 'Emitted when the callout defined by the widget changes\n'),)), ('__group__', ('callouts',)))),
+    )),
+    ('src/gui/callouts/qgscalloutwidget.h', (
+        ('QgsCalloutWidget', (('__attribute_docs__', (('changed', 'Should be emitted whenever configuration changes happened on this symbol\nlayer configuration. If the subsymbol is changed,\n:py:func:`~QgsCalloutWidget.symbolChanged` should be emitted instead.\n'),)), ('__virtual_methods__', ('setContext',)), ('__abstract_methods__', ('setCallout', 'callout', 'setGeometryType')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('callouts',)))),
+    )),
+    ('src/gui/symbology/qgscategorizedsymbolrendererwidget.h', (
+        ('QgsCategorizedSymbolRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext', 'setSymbolLevels', 'pasteSymbolToSelection', 'selectedSymbols', 'refreshSymbolView', 'keyPressEvent')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgscheckablecombobox.h', (
+        ('QgsCheckableComboBox', (('__attribute_docs__', (('checkedItemsChanged', 'Emitted whenever the checked items list changed.\n'),)), ('__overridden_methods__', ('hidePopup', 'eventFilter', 'resizeEvent')), ('__signal_arguments__', (('checkedItemsChanged', ('items: List[str]',)),)))),
+    )),
+    ('src/gui/editorwidgets/qgscheckboxsearchwidgetwrapper.h', (
+        ('QgsCheckboxSearchWidgetWrapper', (('__overridden_methods__', ('applyDirectly', 'expression', 'valid', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'createWidget', 'initWidget', 'setExpression')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditor.h', (
+        ('QgsCodeInterpreter', (('__virtual_methods__', ('currentState',)), ('__abstract_methods__', ('promptForState', 'execCommandImpl')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorcolorscheme.h', (
+        ('QgsCodeEditorColorScheme', (('__group__', ('codeeditors',)),)),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorcolorschemeregistry.h', (
+        ('QgsCodeEditorColorSchemeRegistry', (('__group__', ('codeeditors',)),)),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorcss.h', (
+        ('QgsCodeEditorCSS', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditordockwidget.h', (
+        ('QgsCodeEditorDockWidget', (('__attribute_docs__', (('visibilityChanged', "Emitted when the editor's visibility is changed.\n"),)), ('__signal_arguments__', (('visibilityChanged', ('isVisible: bool',)),)), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorexpression.h', (
+        ('QgsCodeEditorExpression', (('__overridden_methods__', ('language', 'languageCapabilities', 'toggleComment', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorhtml.h', (
+        ('QgsCodeEditorHTML', (('__overridden_methods__', ('language', 'languageCapabilities', 'toggleComment', 'initializeLexer', 'reformatCodeString')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorjs.h', (
+        ('QgsCodeEditorJavascript', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorjson.h', (
+        ('QgsCodeEditorJson', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorpython.h', (
+        ('QgsCodeEditorPython', (('__virtual_methods__', ('showApiDocumentation',)), ('__overridden_methods__', ('language', 'languageCapabilities', 'checkSyntax', 'toggleComment', 'initializeLexer', 'keyPressEvent', 'reformatCodeString', 'populateContextMenu')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorr.h', (
+        ('QgsCodeEditorR', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorshell.h', (
+        ('QgsCodeEditorShell', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorsql.h', (
+        ('QgsCodeEditorSQL', (('__overridden_methods__', ('language', 'initializeLexer')), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/codeeditors/qgscodeeditorwidget.h', (
+        ('QgsCodeEditorWidget', (('__attribute_docs__', (('searchBarToggled', 'Emitted when the visibility of the search bar is changed.\n'), ('filePathChanged', "Emitted when the widget's associated file path is changed.\n\n.. seealso:: :py:func:`setFilePath`\n\n.. seealso:: :py:func:`filePath`\n"), ('loadedExternalChanges', 'Emitted when the widget loads in text from the associated file to bring\nin changes made externally to the file.\n'))), ('__overridden_methods__', ('resizeEvent', 'showEvent', 'eventFilter')), ('__signal_arguments__', (('searchBarToggled', ('visible: bool',)), ('filePathChanged', ('path: str',)))), ('__group__', ('codeeditors',)))),
+    )),
+    ('src/gui/qgscollapsiblegroupbox.h', (
+        ('QgsCollapsibleGroupBoxBasic', (('__attribute_docs__', (('collapsedStateChanged', 'Signal emitted when groupbox collapsed/expanded state is changed, and\nwhen first shown\n'),)), ('__overridden_methods__', ('showEvent', 'mousePressEvent', 'mouseReleaseEvent', 'changeEvent')), ('__signal_arguments__', (('collapsedStateChanged', ('collapsed: bool',)),)))),
+        ('QgsGroupBoxCollapseButton', (('__overridden_methods__', ('mouseReleaseEvent',)),)),
+        ('QgsCollapsibleGroupBox', (('__overridden_methods__', ('showEvent',)),)),
+    )),
+    ('src/gui/qgscolorbrewercolorrampdialog.h', (
+        ('QgsColorBrewerColorRampWidget', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+        ('QgsColorBrewerColorRampDialog', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+    )),
+    ('src/gui/qgscolorbutton.h', (
+        ('QgsColorButton', (('__attribute_docs__', (('colorChanged', 'Emitted whenever a new color is set for the button. The color is always\nvalid. In case the new color is the same no signal is emitted, to avoid\ninfinite loops.\n\n:param color: New color\n'), ('colorClicked', "Emitted when the button is clicked, if the button's behavior is set to\nSignalOnly\n\n:param color: button color\n\n.. seealso:: :py:func:`setBehavior`\n\n.. seealso:: :py:func:`behavior`\n"), ('cleared', 'Emitted when the color is cleared (set to null).\n\n.. seealso:: :py:func:`setToNull`\n\n.. versionadded:: 3.12\n'), ('unlinked', 'Emitted when the color is unlinked, e.g. when it was previously set to\nlink to a project color and is now no longer linked.\n\n.. seealso:: :py:func:`unlink`\n\n.. seealso:: :py:func:`linkToProjectColor`\n\n.. versionadded:: 3.6\n'))), 'createMenuIcon', ('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'event', 'changeEvent', 'showEvent', 'resizeEvent', 'mousePressEvent', 'mouseMoveEvent', 'mouseReleaseEvent', 'keyPressEvent', 'dragEnterEvent', 'dragLeaveEvent', 'dropEvent', 'wheelEvent')), ('__signal_arguments__', (('colorChanged', ('color: QColor',)), ('colorClicked', ('color: QColor',)))))),
+    )),
+    ('src/gui/qgscolordialog.h', (
+        ('QgsColorDialog', (('__attribute_docs__', (('currentColorChanged', "Emitted when the dialog's color changes\n\n:param color: current color\n"),)), 'getColor', ('__overridden_methods__', ('closeEvent',)), ('__signal_arguments__', (('currentColorChanged', ('color: QColor',)),)))),
+    )),
+    ('src/gui/qgscolorrampbutton.h', (
+        ('QgsColorRampButton', (('__attribute_docs__', (('colorRampChanged', 'Emitted whenever a new color ramp is set for the button. The color ramp\nis always valid. In case the new color ramp is the same, no signal is\nemitted to avoid infinite loops.\n'),)), ('__overridden_methods__', ('sizeHint', 'event', 'changeEvent', 'showEvent', 'resizeEvent', 'mousePressEvent')))),
+    )),
+    ('src/gui/raster/qgscolorrampshaderwidget.h', (
+        ('QgsColorRampShaderWidget', (('__attribute_docs__', (('minimumMaximumChangedFromTree', 'Color ramp tree has changed\n'), ('widgetChanged', 'Widget changed\n'), ('classificationModeChanged', 'Classification mode changed\n'))), ('__signal_arguments__', (('minimumMaximumChangedFromTree', ('minimum: float', 'maximum: float')), ('classificationModeChanged', ('mode: Qgis.ShaderClassificationMethod',)))), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgscolorschemelist.h', (
+        ('QgsColorSchemeList', (('__attribute_docs__', (('colorSelected', 'Emitted when a color is selected from the list\n\n:param color: color selected\n'),)), ('__overridden_methods__', ('keyPressEvent', 'mousePressEvent', 'mouseReleaseEvent')), ('__signal_arguments__', (('colorSelected', ('color: QColor',)),)))),
+        ('QgsColorSwatchDelegate', (('__overridden_methods__', ('paint', 'sizeHint', 'editorEvent')),)),
+        ('QgsColorSchemeModel', (('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data', 'flags', 'setData', 'headerData', 'supportedDropActions', 'mimeTypes', 'removeRows', 'insertRows', 'mimeData', 'dropMimeData')),)),
+    )),
+    ('src/gui/qgscolorswatchgrid.h', (
+        ('QgsColorSwatchGrid', (('__attribute_docs__', (('colorChanged', 'Emitted when a color has been selected from the widget\n\n:param color: selected color\n'), ('hovered', 'Emitted when mouse hovers over widget\n'))), ('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'paintEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent', 'keyPressEvent', 'focusInEvent', 'focusOutEvent')), ('__signal_arguments__', (('colorChanged', ('color: QColor',)),)))),
+        ('QgsColorSwatchGridAction', (('__attribute_docs__', (('colorChanged', 'Emitted when a color has been selected from the widget\n\n:param color: selected color\n'),)), ('__signal_arguments__', (('colorChanged', ('color: QColor',)),)))),
+    )),
+    ('src/gui/qgscolorwidgets.h', (
+        ('QgsColorWidget', (('__attribute_docs__', (('colorChanged', "Emitted when the widget's color changes\n\n:param color: new widget color\n"), ('hovered', 'Emitted when mouse hovers over widget.\n'))), 'createDragIcon', 'componentUnit', 'alterColor', 'alterColorF', ('__virtual_methods__', ('setColor', 'setComponent', 'setComponentValue', 'setComponentValueF')), ('__overridden_methods__', ('dragEnterEvent', 'dropEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent')), ('__signal_arguments__', (('colorChanged', ('color: QColor',)),)))),
+        ('QgsColorWidgetAction', (('__attribute_docs__', (('colorChanged', 'Emitted when a color has been selected from the widget\n\n:param color: selected color\n'),)), ('__signal_arguments__', (('colorChanged', ('color: QColor',)),)))),
+        ('QgsColorRampWidget', (('__attribute_docs__', (('valueChanged', "Emitted when the widget's color component value changes\n\n:param value: new value of color component in the range between 0 and\n              the value returned by\n              :py:func:`~QgsColorRampWidget.componentRange`\n\n.. deprecated:: 3.40\n\n   Use :py:func:`~QgsColorRampWidget.valueChangedF` instead.\n"), ('valueChangedF', "Emitted when the widget's color component value changes\n\n:param value: new value of color component in the range 0.0-1.0\n\n.. versionadded:: 3.40\n"))), ('__overridden_methods__', ('sizeHint', 'paintEvent', 'mouseMoveEvent', 'wheelEvent', 'mousePressEvent', 'mouseReleaseEvent', 'keyPressEvent')), ('__signal_arguments__', (('valueChangedF', ('value: float',)),)))),
+        ('QgsColorPreviewWidget', (('__virtual_methods__', ('setColor2',)), ('__overridden_methods__', ('paintEvent', 'sizeHint', 'mousePressEvent', 'mouseReleaseEvent', 'mouseMoveEvent')))),
+        ('QgsColorWheel', (('__overridden_methods__', ('sizeHint', 'paintEvent', 'setColor', 'resizeEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent')),)),
+        ('QgsColorBox', (('__overridden_methods__', ('sizeHint', 'paintEvent', 'setComponent', 'setColor', 'resizeEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent')),)),
+        ('QgsColorSliderWidget', (('__overridden_methods__', ('setComponent', 'setComponentValueF', 'setColor')),)),
+        ('QgsColorTextWidget', (('__overridden_methods__', ('setColor', 'resizeEvent')),)),
+    )),
+    ('src/gui/qgscompoundcolorwidget.h', (
+        ('QgsCompoundColorWidget', (('__attribute_docs__', (('currentColorChanged', "Emitted when the dialog's color changes\n\n:param color: current color\n"),)), 'importUserPaletteFromFile', 'createNewUserPalette', 'removeUserPalette', ('__overridden_methods__', ('hideEvent', 'mousePressEvent', 'mouseMoveEvent', 'mouseReleaseEvent', 'keyPressEvent')), ('__signal_arguments__', (('currentColorChanged', ('color: QColor',)),)))),
+    )),
+    ('src/gui/qgsconfigureshortcutsdialog.h', (
+        ('QgsConfigureShortcutsDialog', (('__overridden_methods__', ('keyPressEvent', 'keyReleaseEvent')),)),
+    )),
+    ('src/gui/proj/qgscoordinateboundspreviewmapwidget.h', (
+        ('QgsCoordinateBoundsPreviewMapWidget', (('__group__', ('proj',)),)),
+    )),
+    ('src/gui/proj/qgscoordinateoperationwidget.h', (
+        ('QgsCoordinateOperationWidget', (('__attribute_docs__', (('operationChanged', 'Emitted when the operation selected in the dialog is changed.\n'), ('operationDoubleClicked', 'Emitted when an operation is double-clicked in the widget.\n'))), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/proj/qgscoordinatereferencesystemmodel.h', (
+        ('QgsCoordinateReferenceSystemModel', (('__overridden_methods__', ('flags', 'data', 'headerData', 'rowCount', 'columnCount', 'index', 'parent')), ('__group__', ('proj',)))),
+        ('QgsCoordinateReferenceSystemProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/symbology/qgscptcitycolorrampdialog.h', (
+        ('QgsCptCityColorRampDialog', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)), ('__overridden_methods__', ('eventFilter',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/annotations/qgscreateannotationitemmaptool.h', (
+        ('QgsCreateAnnotationItemMapToolHandler', (('__attribute_docs__', (('itemCreated', 'Emitted by the tool when a new annotation item has been created.\n\nClients should connect to this signal and call\n:py:func:`~QgsCreateAnnotationItemMapToolHandler.takeCreatedItem` to\ntake the newly created item from the map tool.\n'),)), ('__group__', ('annotations',)))),
+        ('QgsCreateAnnotationItemMapToolInterface', (('__abstract_methods__', ('handler', 'mapTool')), ('__group__', ('annotations',)))),
+    )),
+    ('src/gui/qgscredentialdialog.h', (
+        ('QgsCredentialDialog', (('__overridden_methods__', ('request', 'requestMasterPassword')),)),
+    )),
+    ('src/gui/proj/qgscrsdefinitionwidget.h', (
+        ('QgsCrsDefinitionWidget', (('__attribute_docs__', (('crsChanged', 'Emitted when the CRS defined in the widget is changed.\n'),)), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/qgscurveeditorwidget.h', (
+        ('QgsCurveEditorWidget', (('__attribute_docs__', (('changed', 'Emitted when the widget curve changes\n'),)), ('__overridden_methods__', ('keyPressEvent',)))),
+    )),
+    ('src/gui/qgscustomdrophandler.h', (
+        ('QgsCustomDropHandler', (('__virtual_methods__', ('customUriProviderKey', 'handleCustomUriDrop', 'canHandleMimeData', 'handleMimeData', 'handleMimeDataV2', 'handleFileDrop', 'canHandleCustomUriCanvasDrop', 'handleCustomUriCanvasDrop')),)),
+    )),
+    ('src/gui/layertree/qgscustomlayerorderwidget.h', (
+        ('QgsCustomLayerOrderWidget', (('__group__', ('layertree',)),)),
+    )),
+    ('src/gui/qgscustomprojectopenhandler.h', (
+        ('QgsCustomProjectOpenHandler', (('__virtual_methods__', ('createDocumentThumbnailAfterOpen', 'icon')), ('__abstract_methods__', ('handleProjectOpen', 'filters')))),
+    )),
+    ('src/gui/symbology/qgsdashspacedialog.h', (
+        ('QgsDashSpaceWidget', (('__group__', ('symbology',)),)),
+        ('QgsDashSpaceDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgsdatabaseschemacombobox.h', (
+        ('QgsDatabaseSchemaComboBox', (('__attribute_docs__', (('schemaChanged', 'Emitted whenever the currently selected schema changes.\n'),)), ('__signal_arguments__', (('schemaChanged', ('schema: str',)),)))),
+    )),
+    ('src/gui/qgsdatabasetablecombobox.h', (
+        ('QgsDatabaseTableComboBox', (('__attribute_docs__', (('tableChanged', 'Emitted whenever the currently selected table changes.\n'),)), ('__signal_arguments__', (('tableChanged', ('table: str', 'schema: Optional[str] = None')),)))),
+    )),
+    ('src/gui/symbology/qgsdatadefinedsizelegendwidget.h', (
+        ('QgsDataDefinedSizeLegendWidget', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgsdataitemguiprovider.h', (
+        ('QgsDataItemGuiProvider', ('notify', ('__virtual_methods__', ('populateContextMenu', 'precedenceWhenPopulatingMenus', 'rename', 'deleteLayer', 'handleDoubleClick', 'acceptDrop', 'handleDrop', 'createParamWidget')), ('__abstract_methods__', ('name',)))),
+    )),
+    ('src/gui/qgsdatasourceselectdialog.h', (
+        ('QgsDataSourceSelectWidget', (('__attribute_docs__', (('validationChanged', 'This signal is emitted whenever the validation status of the widget\nchanges.\n\n:param isValid: ``True`` if the current status of the widget is valid\n'), ('selectionChanged', 'Emitted when the current selection changes in the widget.\n'), ('itemTriggered', 'Emitted when an item is triggered, e.g. via a double-click.\n'))), ('__overridden_methods__', ('showEvent', 'dragEnterEvent', 'dropEvent')), ('__signal_arguments__', (('validationChanged', ('isValid: bool',)), ('itemTriggered', ('uri: QgsMimeDataUtils.Uri',)))))),
+    )),
+    ('src/gui/editorwidgets/qgsdatetimeedit.h', (
+        ('QgsDateTimeEdit', (('__attribute_docs__', (('valueChanged', 'Signal emitted whenever the value changes.\n\n:param date: The new date/time value.\n'),)), ('__virtual_methods__', ('emitValueChanged',)), ('__overridden_methods__', ('clear', 'event', 'mousePressEvent', 'focusOutEvent', 'focusInEvent', 'wheelEvent', 'showEvent')), ('__signal_arguments__', (('valueChanged', ('date: QDateTime',)),)), ('__group__', ('editorwidgets',)))),
+        ('QgsTimeEdit', (('__attribute_docs__', (('timeValueChanged', 'Signal emitted whenever the time changes.\n'),)), ('__overridden_methods__', ('emitValueChanged',)), ('__signal_arguments__', (('timeValueChanged', ('time: QTime',)),)), ('__group__', ('editorwidgets',)))),
+        ('QgsDateEdit', (('__attribute_docs__', (('dateValueChanged', 'Signal emitted whenever the date changes.\n'),)), ('__overridden_methods__', ('emitValueChanged',)), ('__signal_arguments__', (('dateValueChanged', ('date: QDate',)),)), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsdatetimesearchwidgetwrapper.h', (
+        ('QgsDateTimeSearchWidgetWrapper', (('__overridden_methods__', ('applyDirectly', 'expression', 'valid', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'createWidget', 'initWidget', 'setExpression')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsdbrelationshipwidget.h', (
+        ('QgsDbRelationWidget', (('__attribute_docs__', (('validityChanged', 'Emitted whenever the validity of the relationship configuration in the\nwidget changes.\n\n.. seealso:: :py:func:`isValid`\n'),)), ('__signal_arguments__', (('validityChanged', ('isValid: bool',)),)))),
+        ('QgsDbRelationDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/editorwidgets/qgsdefaultsearchwidgetwrapper.h', (
+        ('QgsDefaultSearchWidgetWrapper', (('__overridden_methods__', ('expression', 'applyDirectly', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'setExpression', 'createWidget', 'initWidget', 'valid')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsdetaileditemdelegate.h', (
+        ('QgsDetailedItemDelegate', (('__overridden_methods__', ('paint', 'sizeHint')),)),
+    )),
+    ('src/gui/devtools/qgsdevtoolwidget.h', (
+        ('QgsDevToolWidget', (('__group__', ('devtools',)),)),
+    )),
+    ('src/gui/devtools/qgsdevtoolwidgetfactory.h', (
+        ('QgsDevToolWidgetFactory', (('__virtual_methods__', ('icon', 'title')), ('__abstract_methods__', ('createWidget',)), ('__group__', ('devtools',)))),
+    )),
+    ('src/gui/qgsdial.h', (
+        ('QgsDial', (('__overridden_methods__', ('paintEvent',)), ('__signal_arguments__', (('valueChanged', (': object',)),)))),
+    )),
+    ('src/gui/qgsdirectionallightwidget.h', (
+        ('QgsDirectionalLightWidget', (('__attribute_docs__', (('directionChanged', 'Emitted when the direction is changed\n'),)),)),
+    )),
+    ('src/gui/qgsdockwidget.h', (
+        ('QgsDockWidget', (('__attribute_docs__', (('closed', 'Emitted when dock widget is closed.\n\n.. seealso:: :py:func:`closedStateChanged`\n\n.. seealso:: :py:func:`opened`\n'), ('closedStateChanged', 'Emitted when dock widget is closed (or opened).\n\n:param wasClosed: will be ``True`` if dock widget was closed, or\n                  ``False`` if dock widget was opened\n\n.. seealso:: :py:func:`closed`\n\n.. seealso:: :py:func:`openedStateChanged`\n'), ('opened', 'Emitted when dock widget is opened.\n\n.. seealso:: :py:func:`openedStateChanged`\n\n.. seealso:: :py:func:`closed`\n'), ('openedStateChanged', 'Emitted when dock widget is opened (or closed).\n\n:param wasOpened: will be ``True`` if dock widget was opened, or\n                  ``False`` if dock widget was closed\n\n.. seealso:: :py:func:`closedStateChanged`\n\n.. seealso:: :py:func:`opened`\n'))), ('__overridden_methods__', ('closeEvent', 'showEvent')), ('__signal_arguments__', (('closedStateChanged', ('wasClosed: bool',)), ('openedStateChanged', ('wasOpened: bool',)))))),
+    )),
+    ('src/gui/editorwidgets/qgsdoublespinbox.h', (
+        ('QgsDoubleSpinBox', (('__attribute_docs__', (('returnPressed', 'Emitted when the Return or Enter key is used in the line edit.\n\n.. versionadded:: 3.40\n'), ('textEdited', 'Emitted when the the value has been manually edited via line edit.\n\n.. versionadded:: 3.40\n'), ('editingTimeout', 'Emitted when either:\n\n1. 1 second has elapsed since the last value change in the widget (eg last key press or scroll wheel event)\n2. or, immediately after the widget has lost focus after its value was changed.\n\nThis signal can be used to respond semi-instantly to changes in the spin\nbox, without responding too quickly while the user in the middle of\nsetting the value.\n\n.. seealso:: :py:func:`editingTimeoutInterval`\n\n.. versionadded:: 3.42\n'))), ('__overridden_methods__', ('clear', 'valueFromText', 'validate', 'paintEvent', 'stepBy', 'changeEvent', 'wheelEvent', 'focusOutEvent', 'timerEvent')), ('__signal_arguments__', (('textEdited', ('text: str',)), ('editingTimeout', ('value: float',)))), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsdoublevalidator.h', (
+        ('QgsDoubleValidator', ('toDouble', ('__virtual_methods__', ('setRange',)))),
+    )),
+    ('src/gui/attributetable/qgsdualview.h', (
+        ('QgsDualView', (('__attribute_docs__', (('displayExpressionChanged', 'Emitted whenever the display expression is successfully changed\n\n:param expression: The expression that was applied\n'), ('filterChanged', 'Emitted whenever the filter changes\n'), ('filterExpressionSet', 'Emitted when a filter expression is set using the view.\n\n:param expression: filter expression\n:param type: filter type\n'), ('formModeChanged', 'Emitted when the form changes mode.\n\n:param mode: new mode\n'), ('showContextMenuExternally', 'Emitted when selecting context menu on the feature list to create the\ncontext menu individually\n\n:param menu: context menu\n:param fid: feature id of the selected feature\n'))), 'requiredAttributes', ('__overridden_methods__', ('hideEvent',)), ('__signal_arguments__', (('displayExpressionChanged', ('expression: str',)), ('filterExpressionSet', ('expression: str', 'type: QgsAttributeForm.FilterType')), ('formModeChanged', ('mode: QgsAttributeEditorContext.Mode',)), ('showContextMenuExternally', ('menu: QgsActionMenu', 'fid: QgsFeatureId')))), ('__group__', ('attributetable',)))),
+        ('QgsAttributeTableAction', (('__group__', ('attributetable',)),)),
+        ('QgsAttributeTableMapLayerAction', (('__group__', ('attributetable',)),)),
+    )),
+    ('src/gui/editorwidgets/core/qgseditorconfigwidget.h', (
+        ('QgsEditorConfigWidget', (('__attribute_docs__', (('changed', 'Emitted when the configuration of the widget is changed.\n'),)), ('__abstract_methods__', ('config', 'setConfig')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/editorwidgets/core/qgseditorwidgetautoconf.h', (
+        ('QgsEditorWidgetAutoConfPlugin', (('__abstract_methods__', ('editorWidgetSetup',)), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/editorwidgets/core/qgseditorwidgetfactory.h', (
+        ('QgsEditorWidgetFactory', (('__virtual_methods__', ('createSearchWidget', 'isReadOnly', 'fieldScore')), ('__abstract_methods__', ('create', 'configWidget')), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/editorwidgets/core/qgseditorwidgetregistry.h', (
+        ('QgsEditorWidgetRegistry', (('__group__', ('editorwidgets', 'core')),)),
+    )),
+    ('src/gui/editorwidgets/core/qgseditorwidgetwrapper.h', (
+        ('QgsEditorWidgetWrapper', (('__attribute_docs__', (('valueChanged', 'Emit this signal, whenever the value changed.\n\n:param value: The new value\n\n.. deprecated:: 3.10\n\n   Use valuesChanged signal instead.\n'), ('valuesChanged', 'Emit this signal, whenever the value changed. It will also return the\nvalues for the additional fields handled by the widget\n\n:param value: The new value\n:param additionalFieldValues: A map of additional field names with their\n                              corresponding values\n\n.. versionadded:: 3.10\n'), ('constraintStatusChanged', 'Emit this signal when the constraint status changed.\nconstraintStatusChanged\n\n:param constraint: represented as a string\n:param desc: is the constraint description\n:param err: the error represented as a string. Empty if none.\n:param status: \n'), ('constraintResultVisibleChanged', 'Emit this signal when the constraint result visibility changed.\n'))), 'fromWidget', 'isInTable', ('__virtual_methods__', ('additionalFields', 'additionalFieldValues', 'showIndeterminateState', 'setHint', 'setValue', 'parentFormValueChanged', 'updateConstraintWidgetStatus')), ('__abstract_methods__', ('value',)), ('__overridden_methods__', ('setEnabled', 'setFeature')), ('__signal_arguments__', (('valueChanged', ('value: object',)), ('valuesChanged', ('value: object', 'additionalFieldValues: List[object] = []')), ('constraintStatusChanged', ('constraint: str', 'desc: str', 'err: str', 'status: QgsEditorWidgetWrapper.ConstraintResult')), ('constraintResultVisibleChanged', ('visible: bool',)))), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/effects/qgseffectdrawmodecombobox.h', (
+        ('QgsEffectDrawModeComboBox', (('__group__', ('effects',)),)),
+    )),
+    ('src/gui/effects/qgseffectstackpropertieswidget.h', (
+        ('QgsEffectStackCompactWidget', (('__attribute_docs__', (('changed', 'Emitted when the paint effect properties change\n'),)), ('__group__', ('effects',)))),
+        ('QgsEffectStackPropertiesWidget', (('__group__', ('effects',)),)),
+        ('QgsEffectStackPropertiesDialog', (('__group__', ('effects',)),)),
+    )),
+    ('src/gui/elevation/qgselevationcontrollerwidget.h', (
+        ('QgsElevationControllerWidget', (('__attribute_docs__', (('rangeChanged', 'Emitted when the visible range from the widget is changed.\n\n.. seealso:: :py:func:`setRange`\n\n.. seealso:: :py:func:`range`\n'), ('fixedRangeSizeChanged', 'Emitted when the fixed range size is changed from the widget.\n\n.. seealso:: :py:func:`fixedRangeSize`\n\n.. seealso:: :py:func:`setFixedRangeSize`\n'), ('invertedChanged', 'Emitted when the elevation filter slider is inverted.\n\n.. seealso:: :py:func:`setInverted`\n'))), ('__overridden_methods__', ('resizeEvent',)), ('__signal_arguments__', (('rangeChanged', ('range: QgsDoubleRange',)), ('fixedRangeSizeChanged', ('size: float',)), ('invertedChanged', ('inverted: bool',)))), ('__group__', ('elevation',)))),
+        ('QgsElevationControllerSettingsAction', (('__group__', ('elevation',)),)),
+    )),
+    ('src/gui/elevation/qgselevationprofilecanvas.h', (
+        ('QgsElevationProfileCanvas', (('__attribute_docs__', (('activeJobCountChanged', 'Emitted when the number of active background jobs changes.\n'), ('canvasPointHovered', 'Emitted when the mouse hovers over the specified point (in canvas\ncoordinates).\n\nThe ``profilePoint`` argument gives the hovered profile point, which may\nbe snapped.\n'))), ('__overridden_methods__', ('crs', 'toMapCoordinates', 'toCanvasCoordinates', 'resizeEvent', 'paintEvent', 'panContentsBy', 'centerPlotOn', 'scalePlot', 'snapToPlot', 'zoomToRect', 'wheelZoom', 'mouseMoveEvent', 'refresh')), ('__signal_arguments__', (('activeJobCountChanged', ('count: int',)), ('canvasPointHovered', ('point: QgsPointXY', 'profilePoint: QgsProfilePoint')))), ('__group__', ('elevation',)))),
+    )),
+    ('src/gui/symbology/qgsellipsesymbollayerwidget.h', (
+        ('QgsEllipseSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgsembeddedsymbolrendererwidget.h', (
+        ('QgsEmbeddedSymbolRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgserrordialog.h', (
+        ('QgsErrorDialog', ('show',)),
+    )),
+    ('src/gui/qgsexpressionbuilderdialog.h', (
+        ('QgsExpressionBuilderDialog', (('__attribute_docs__', (('allowEvalErrorsChanged', "Allow accepting expressions with evaluation errors. This can be useful\nwhen we are not able to provide an expression context of which we are\nsure it's completely populated.\n"),)), ('__overridden_methods__', ('done', 'accept', 'reject')))),
+    )),
+    ('src/gui/qgsexpressionbuilderwidget.h', (
+        ('QgsExpressionBuilderWidget', (('__attribute_docs__', (('expressionParsed', 'Emitted when the user changes the expression in the widget. Users of\nthis widget should connect to this signal to decide if to let the user\ncontinue.\n\n:param isValid: Is ``True`` if the expression the user has typed is\n                valid.\n'), ('evalErrorChanged', 'Will be set to ``True`` if the current expression text reported an eval\nerror with the context.\n'), ('parserErrorChanged', 'Will be set to ``True`` if the current expression text reported a parser\nerror with the context.\n'))), ('__overridden_methods__', ('showEvent',)), ('__signal_arguments__', (('expressionParsed', ('isValid: bool',)),)))),
+    )),
+    ('src/gui/qgsexpressionhighlighter.h', (
+        ('QgsExpressionHighlighter', (('__overridden_methods__', ('highlightBlock',)),)),
+    )),
+    ('src/gui/qgsexpressionlineedit.h', (
+        ('QgsExpressionLineEdit', (('__attribute_docs__', (('expressionChanged', 'Emitted when the expression is changed.\n\n:param expression: new expression\n'),)), ('__overridden_methods__', ('changeEvent',)), ('__signal_arguments__', (('expressionChanged', ('expression: str',)),)))),
+    )),
+    ('src/gui/qgsexpressionpreviewwidget.h', (
+        ('QgsExpressionPreviewWidget', (('__attribute_docs__', (('expressionParsed', 'Emitted when the user changes the expression in the widget. Users of\nthis widget should connect to this signal to decide if to let the user\ncontinue.\n\n:param isValid: Is ``True`` if the expression the user has typed is\n                valid.\n'), ('evalErrorChanged', 'Will be set to ``True`` if the current expression text reported an eval\nerror with the context.\n'), ('parserErrorChanged', 'Will be set to ``True`` if the current expression text reported a parser\nerror with the context.\n'), ('toolTipChanged', 'Emitted whenever the tool tip changed\n'))), ('__signal_arguments__', (('expressionParsed', ('isValid: bool',)), ('toolTipChanged', ('toolTip: str',)))))),
+    )),
+    ('src/gui/qgsexpressionselectiondialog.h', (
+        ('QgsExpressionSelectionDialog', (('__overridden_methods__', ('closeEvent', 'done')),)),
+    )),
+    ('src/gui/qgsexpressiontreeview.h', (
+        ('QgsExpressionTreeView', (('__attribute_docs__', (('expressionItemDoubleClicked', 'Emitted when a expression item is double clicked\n'), ('currentExpressionItemChanged', 'Emitter when the current expression item changed\n'))), ('__signal_arguments__', (('expressionItemDoubleClicked', ('text: str',)), ('currentExpressionItemChanged', ('item: QgsExpressionItem',)))))),
+        ('QgsExpressionTreeView.MenuProvider', (('__virtual_methods__', ('createContextMenu',)),)),
+        ('QgsExpressionItemSearchProxy', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan')),)),
+    )),
+    ('src/gui/qgsextentgroupbox.h', (
+        ('QgsExtentGroupBox', (('__attribute_docs__', (('extentChanged', "Emitted when the widget's extent is changed.\n"), ('extentLayerChanged', 'Emitted when the extent layer is changed.\n\n.. versionadded:: 3.44\n'))), ('__signal_arguments__', (('extentChanged', ('r: QgsRectangle',)), ('extentLayerChanged', ('layer: QgsMapLayer',)))))),
+    )),
+    ('src/gui/qgsextentwidget.h', (
+        ('QgsExtentWidget', (('__attribute_docs__', (('extentChanged', "Emitted when the widget's extent is changed.\n"), ('validationChanged', "Emitted when the widget's validation state changes.\n"), ('toggleDialogVisibility', 'Emitted when the parent dialog visibility must be changed (e.g. to\npermit access to the map canvas)\n'), ('extentLayerChanged', 'Emitted when the extent layer is changed.\n\n.. versionadded:: 3.44\n'))), ('__overridden_methods__', ('dragEnterEvent', 'dragLeaveEvent', 'dropEvent', 'showEvent')), ('__signal_arguments__', (('extentChanged', ('r: QgsRectangle',)), ('validationChanged', ('valid: bool',)), ('toggleDialogVisibility', ('visible: bool',)), ('extentLayerChanged', ('layer: QgsMapLayer',)))))),
+    )),
+    ('src/gui/qgsexternalresourcewidget.h', (
+        ('QgsExternalResourceWidget', (('__attribute_docs__', (('valueChanged', 'Emitted as soon as the current document changes\n'),)), ('__signal_arguments__', (('valueChanged', ('value: str',)),)))),
+    )),
+    ('src/gui/qgsexternalstoragefilewidget.h', (
+        ('QgsExternalStorageFileWidget', ('createFileWidgetScope', ('__overridden_methods__', ('setReadOnly', 'updateLayout', 'setSelectedFileNames', 'dragEnterEvent', 'dropEvent')))),
+    )),
+    ('src/gui/qgsfeaturelistcombobox.h', (
+        ('QgsFeatureListComboBox', (('__attribute_docs__', (('modelUpdated', 'The underlying model has been updated.\n\n.. versionadded:: 3.2\n'), ('sourceLayerChanged', 'The layer from which features should be listed.\n'), ('displayExpressionChanged', 'The display expression will be used to display features as well as the\nthe value to match the typed text against.\n'), ('filterExpressionChanged', 'An additional expression to further restrict the available features.\nThis can be used to integrate additional spatial or other constraints.\n'), ('formFeatureChanged', 'An attribute form feature to be used alongside the filter expression.\n\n.. versionadded:: 3.42.2\n'), ('parentFormFeatureChanged', 'A parent attribute form feature to be used alongside the filter\nexpression.\n\n.. versionadded:: 3.42.2\n'), ('identifierValueChanged', 'The identifier value of the currently selected feature. A value from the\nidentifierField.\n'), ('identifierFieldChanged', 'Field name that will be used to uniquely identify the current feature.\nNormally the primary key of the layer.\n'), ('allowNullChanged', 'Determines if a NULL value should be available in the list.\n'), ('currentFeatureChanged', 'Emitted when the current feature changes\n\n.. versionadded:: 3.16.5\n'), ('currentFeatureFoundChanged', 'Emitted when the feature picker model changes its feature ``found``\nstate\n\n.. versionadded:: 3.38\n'))), ('__overridden_methods__', ('focusOutEvent', 'keyPressEvent')), ('__signal_arguments__', (('currentFeatureFoundChanged', ('found: bool',)),)))),
+    )),
+    ('src/gui/attributetable/qgsfeaturelistmodel.h', (
+        ('QgsFeatureListModel', (('__virtual_methods__', ('setSourceModel', 'mapToMaster', 'mapFromMaster', 'mapSelectionFromMaster', 'mapSelectionToMaster')), ('__overridden_methods__', ('data', 'flags', 'mapToSource', 'mapFromSource', 'parent', 'columnCount', 'rowCount', 'fidToIndex')), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsfeaturelistview.h', (
+        ('QgsFeatureListView', (('__attribute_docs__', (('currentEditSelectionChanged', 'Emitted whenever the current edit selection has been changed.\n\n:param feat: the feature, which will be edited.\n'), ('currentEditSelectionProgressChanged', 'Emitted whenever the current edit selection has been changed.\n\n:param progress: the position of the feature in the list\n:param count: the number of features in the list\n\n.. versionadded:: 3.8\n'), ('displayExpressionChanged', 'Emitted whenever the display expression is successfully changed\n\n:param expression: The expression that was applied\n'), ('willShowContextMenu', 'Emitted when the context menu is created to add the specific actions to\nit\n\n:param menu: is the already created context menu\n:param atIndex: is the position of the current feature in the model\n'))), ('__virtual_methods__', ('setModel',)), ('__overridden_methods__', ('mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent', 'keyPressEvent', 'contextMenuEvent', 'selectAll')), ('__signal_arguments__', (('currentEditSelectionChanged', ('feat: QgsFeature',)), ('currentEditSelectionProgressChanged', ('progress: int', 'count: int')), ('displayExpressionChanged', ('expression: str',)), ('willShowContextMenu', ('menu: QgsActionMenu', 'atIndex: QModelIndex')))), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsfeaturelistviewdelegate.h', (
+        ('QgsFeatureListViewDelegate', (('__attribute_docs__', (('editButtonClicked', 'Emitted when the edit button is clicked for the feature with matching\n``index``.\n'),)), ('__overridden_methods__', ('sizeHint', 'paint')), ('__signal_arguments__', (('editButtonClicked', ('index: QModelIndex',)),)), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/attributetable/qgsfeaturemodel.h', (
+        ('QgsFeatureModel', (('__abstract_methods__', ('fidToIndex',)), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/qgsfeaturepickerwidget.h', (
+        ('QgsFeaturePickerWidget', (('__attribute_docs__', (('modelUpdated', 'The underlying model has been updated.\n'), ('layerChanged', 'The layer from which features should be listed.\n'), ('displayExpressionChanged', 'The display expression will be used to display features as well as the\nthe value to match the typed text against.\n'), ('filterExpressionChanged', 'An additional expression to further restrict the available features.\nThis can be used to integrate additional spatial or other constraints.\n'), ('featureChanged', 'Sends the feature as soon as it is chosen\n'), ('allowNullChanged', 'Determines if a NULL value should be available in the list.\n'), ('fetchGeometryChanged', 'Emitted when the fetching of the geometry changes\n'), ('fetchLimitChanged', 'Emitted when the fetching limit for the feature request changes\n'), ('showBrowserButtonsChanged', 'Emitted when showing the browser buttons changes\n'))), ('__overridden_methods__', ('focusOutEvent', 'keyPressEvent')), ('__signal_arguments__', (('featureChanged', ('feature: QgsFeature',)),)))),
+    )),
+    ('src/gui/qgsfeatureselectiondlg.h', (
+        ('QgsFeatureSelectionDlg', (('__overridden_methods__', ('keyPressEvent', 'showEvent')),)),
+    )),
+    ('src/gui/attributetable/qgsfeatureselectionmodel.h', (
+        ('QgsFeatureSelectionModel', (('__attribute_docs__', (('requestRepaint', 'Request a repaint of the visible items of connected views. Views using\nthis model should connect to and properly process this signal.\n'),)), ('__virtual_methods__', ('isSelected', 'selectFeatures', 'setFeatureSelectionManager')), ('__overridden_methods__', ('select',)), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/vector/qgsfieldcalculator.h', (
+        ('QgsFieldCalculator', (('__overridden_methods__', ('accept',)), ('__group__', ('vector',)))),
+    )),
+    ('src/gui/qgsfieldcombobox.h', (
+        ('QgsFieldComboBox', (('__attribute_docs__', (('fieldChanged', 'Emitted when the currently selected field changes.\n'),)), ('__signal_arguments__', (('fieldChanged', ('fieldName: str',)),)))),
+    )),
+    ('src/gui/attributetable/qgsfieldconditionalformatwidget.h', (
+        ('QgsFieldConditionalFormatWidget', (('__attribute_docs__', (('rulesUpdated', 'Emitted when the conditional styling rules are updated.\n\nThe ``fieldName`` argument indicates the name of the field whose rules\nhave been modified, or an empty ``fieldName`` indicates that a row-based\nrule was updated.\n'),)), 'defaultPresets', ('__signal_arguments__', (('rulesUpdated', ('fieldName: str',)),)), ('__group__', ('attributetable',)))),
+        ('QgsEditConditionalFormatRuleWidget', (('__attribute_docs__', (('ruleSaved', 'Emitted when a user has opted to save the current rule.\n'), ('ruleDeleted', 'Emitted when a user has opted to deleted the current rule.\n'), ('canceled', 'Emitted when a user has opted to cancel the rule modification.\n'))), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/qgsfielddomainwidget.h', (
+        ('QgsFieldDomainWidget', (('__attribute_docs__', (('validityChanged', 'Emitted whenever the validity of the field domain configuration in the\nwidget changes.\n\n.. seealso:: :py:func:`isValid`\n'),)), ('__signal_arguments__', (('validityChanged', ('isValid: bool',)),)))),
+        ('QgsFieldDomainDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/qgsfieldexpressionwidget.h', (
+        ('QgsFieldExpressionWidget', (('__attribute_docs__', (('fieldChanged', 'fieldChanged signal with indication of the validity of the expression\n'), ('allowEvalErrorsChanged', "Allow accepting expressions with evaluation errors. This can be useful\nwhen we are not able to provide an expression context of which we are\nsure it's completely populated.\n"), ('buttonVisibleChanged', 'Emitted when the button visibility changes\n\n.. versionadded:: 3.36\n'))), ('__overridden_methods__', ('changeEvent', 'eventFilter')), ('__signal_arguments__', (('fieldChanged', ('fieldName: str', 'isValid: bool')),)))),
+    )),
+    ('src/gui/qgsfieldmappingmodel.h', (
+        ('QgsFieldMappingModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'headerData', 'flags', 'setData')),)),
+    )),
+    ('src/gui/qgsfieldmappingwidget.h', (
+        ('QgsFieldMappingWidget', (('__attribute_docs__', (('changed', 'Emitted when the fields defined in the widget are changed.\n'),)),)),
+    )),
+    ('src/gui/qgsfieldvalidator.h', (
+        ('QgsFieldValidator', (('__overridden_methods__', ('validate', 'fixup')),)),
+    )),
+    ('src/gui/qgsfieldvalueslineedit.h', (
+        ('QgsFieldValuesLineEdit', (('__attribute_docs__', (('layerChanged', 'Emitted when the layer associated with the widget changes.\n\n:param layer: vector layer\n'), ('attributeIndexChanged', 'Emitted when the field associated with the widget changes.\n\n:param index: new attribute index for field\n'))), ('__signal_arguments__', (('layerChanged', ('layer: QgsVectorLayer',)), ('attributeIndexChanged', ('index: int',)))))),
+    )),
+    ('src/gui/qgsfilecontentsourcelineedit.h', (
+        ('QgsAbstractFileContentSourceLineEdit', (('__attribute_docs__', (('sourceChanged', 'Emitted whenever the file source is changed in the widget.\n'),)), ('__signal_arguments__', (('sourceChanged', ('source: str',)),)))),
+    )),
+    ('src/gui/qgsfiledownloaderdialog.h', (
+        ('QgsFileDownloaderDialog', (('__attribute_docs__', (('downloadCompleted', 'Emitted when the download has completed successfully\n'), ('downloadExited', 'Emitted always when the downloader exits\n'), ('downloadCanceled', 'Emitted when the download was canceled by the user\n'), ('downloadError', 'Emitted when an error makes the download fail\n'), ('downloadProgress', 'Emitted when data are ready to be processed\n'))), ('__signal_arguments__', (('downloadError', ('errorMessages: List[str]',)), ('downloadProgress', ('bytesReceived: int', 'bytesTotal: int')))))),
+    )),
+    ('src/gui/qgsfilewidget.h', (
+        ('QgsFileWidget', (('__attribute_docs__', (('fileChanged', 'Emitted whenever the current file or directory ``path`` is changed.\n'),)), 'splitFilePaths', 'isMultiFiles', ('__virtual_methods__', ('setReadOnly', 'updateLayout', 'setSelectedFileNames')), ('__overridden_methods__', ('minimumSizeHint',)), ('__signal_arguments__', (('fileChanged', ('path: str',)),)))),
+    )),
+    ('src/gui/qgsfilterlineedit.h', (
+        ('QgsFilterLineEdit', (('__attribute_docs__', (('cleared', 'Emitted when the widget is cleared\n\n.. seealso:: :py:func:`clearValue`\n'), ('valueChanged', 'Same as :py:func:`~QgsFilterLineEdit.textChanged` but with support for\nnull values.\n\n:param value: The current text or null string if it matches the\n              :py:func:`~QgsFilterLineEdit.nullValue` property.\n'), ('showSpinnerChanged', 'Show a spinner icon. This can be used for search boxes to indicate that\nsomething is going on in the background.\n'), ('selectOnFocusChanged', 'Will select all text when this widget receives the focus.\n'))), ('__virtual_methods__', ('clearValue',)), ('__overridden_methods__', ('event', 'focusInEvent', 'mouseReleaseEvent')), ('__signal_arguments__', (('valueChanged', ('value: str',)),)))),
+    )),
+    ('src/gui/qgsfindfilesbypatternwidget.h', (
+        ('QgsFindFilesByPatternWidget', (('__attribute_docs__', (('findComplete', 'Emitted after files are found in the dialog.\n\nThe ``files`` argument contains a list of all matching files found. This\nmay be empty if no matching files were found.\n\n.. seealso:: :py:func:`files`\n'),)), ('__signal_arguments__', (('findComplete', ('files: List[str]',)),)))),
+    )),
+    ('src/gui/qgsfloatingwidget.h', (
+        ('QgsFloatingWidget', (('__attribute_docs__', (('anchorWidgetChanged', 'Emitted when the anchor widget changes\n'), ('anchorPointChanged', 'Emitted when the anchor point changes\n'), ('anchorWidgetPointChanged', 'Emitted when the anchor widget point changes\n'))), ('__overridden_methods__', ('showEvent', 'paintEvent', 'resizeEvent')), ('__signal_arguments__', (('anchorWidgetChanged', ('widget: QWidget',)), ('anchorPointChanged', ('point: QgsFloatingWidget.AnchorPoint',)), ('anchorWidgetPointChanged', ('point: QgsFloatingWidget.AnchorPoint',)))))),
+    )),
+    ('src/gui/qgsfocuswatcher.h', (
+        ('QgsFocusWatcher', (('__attribute_docs__', (('focusChanged', "Emitted when parent object's focus changes.\n\n:param focused: ``True`` if object gained focus, ``False`` if object\n                lost focus\n"), ('focusIn', 'Emitted when parent object gains focus.\n'), ('focusOut', 'Emitted when parent object loses focus.\n'))), ('__overridden_methods__', ('eventFilter',)), ('__signal_arguments__', (('focusChanged', ('focused: bool',)),)))),
+    )),
+    ('src/gui/qgsfontbutton.h', (
+        ('QgsFontButton', (('__attribute_docs__', (('changed', "Emitted when the widget's text format settings are changed.\n"),)), ('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'event', 'changeEvent', 'showEvent', 'resizeEvent', 'mousePressEvent', 'mouseMoveEvent', 'dragEnterEvent', 'dragLeaveEvent', 'dropEvent', 'wheelEvent')))),
+    )),
+    ('src/gui/qgsformannotation.h', (
+        ('QgsFormAnnotation', ('create', ('__overridden_methods__', ('clone', 'minimumFrameSize', 'writeXml', 'readXml', 'setAssociatedFeature', 'renderAnnotation')))),
+    )),
+    ('src/gui/providers/gdal/qgsgdalcredentialoptionswidget.h', (
+        ('QgsGdalCredentialOptionsWidget', (('__attribute_docs__', (('optionsChanged', 'Emitted when the credential options are changed in the widget.\n'),)), ('__group__', ('providers', 'gdal')))),
+    )),
+    ('src/gui/qgsgeocoderlocatorfilter.h', (
+        ('QgsGeocoderLocatorFilter', (('__overridden_methods__', ('clone',)),)),
+    )),
+    ('src/gui/qgsgeometryrubberband.h', (
+        ('QgsGeometryRubberBand', (('__virtual_methods__', ('setGeometry',)), ('__overridden_methods__', ('updatePosition', 'paint')))),
+    )),
+    ('src/gui/qgsgeometrywidget.h', (
+        ('QgsGeometryWidget', (('__attribute_docs__', (('geometryValueChanged', 'Emitted whenever the geometry value of the widget is changed.\n\n.. seealso:: :py:func:`geometryValue`\n\n.. seealso:: :py:func:`setGeometryValue`\n'),)), ('__signal_arguments__', (('geometryValueChanged', ('value: QgsReferencedGeometry',)),)))),
+    )),
+    ('src/gui/qgsgpstoolsinterface.h', (
+        ('QgsGpsToolsInterface', (('__abstract_methods__', ('setGpsPanelConnection', 'createFeatureFromGpsTrack', 'setGpsTrackLineSymbol')),)),
+    )),
+    ('src/gui/qgsgradientcolorrampdialog.h', (
+        ('QgsGradientColorRampDialog', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+    )),
+    ('src/gui/qgsgradientstopeditor.h', (
+        ('QgsGradientStopEditor', (('__attribute_docs__', (('changed', 'Emitted when the gradient ramp is changed by a user\n'), ('selectedStopChanged', 'Emitted when the current selected stop changes.\n\n:param stop: details about newly selected stop\n'))), ('__overridden_methods__', ('sizeHint', 'paintEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseDoubleClickEvent', 'keyPressEvent', 'dragEnterEvent', 'dropEvent')), ('__signal_arguments__', (('selectedStopChanged', ('stop: QgsGradientStop',)),)))),
+    )),
+    ('src/gui/symbology/qgsgraduatedhistogramwidget.h', (
+        ('QgsGraduatedHistogramWidget', (('__attribute_docs__', (('rangesModified', 'Emitted when the user modifies the graduated ranges using the histogram\nwidget.\n\n:param rangesAdded: ``True`` if the user has added ranges, ``False`` if\n                    the user has just modified existing range breaks\n'),)), ('__overridden_methods__', ('drawHistogram',)), ('__signal_arguments__', (('rangesModified', ('rangesAdded: bool',)),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgsgraduatedsymbolrendererwidget.h', (
+        ('QgsGraduatedSymbolRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext', 'setSymbolLevels', 'pasteSymbolToSelection', 'selectedSymbols', 'refreshSymbolView', 'keyPressEvent')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsgroupwmsdatadialog.h', (
+        ('QgsGroupWmsDataDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/qgsgui.h', (
+        ('QgsGui', (('__attribute_docs__', (('optionsChanged', 'This signal is emitted whenever the application options have been\nchanged.\n\nThis signal is a "blanket" signal, and will be emitted whenever the\noptions dialog has been accepted regardless of whether or not individual\nsettings are changed. It is designed as a "last resort" fallback only,\nallowing widgets to respond to possible settings changes.\n\n.. versionadded:: 3.16\n'),)), 'instance', 'settingsRegistryGui', 'editorWidgetRegistry', 'sourceSelectProviderRegistry', 'shortcutsManager', 'layerTreeEmbeddedWidgetRegistry', 'mapLayerActionRegistry', 'layoutItemGuiRegistry', 'annotationItemGuiRegistry', 'advancedDigitizingToolsRegistry', 'processingGuiRegistry', 'numericFormatGuiRegistry', 'codeEditorColorSchemeRegistry', 'processingRecentAlgorithmLog', 'processingFavoriteAlgorithmManager', 'dataItemGuiProviderRegistry', 'projectStorageGuiRegistry', 'providerGuiRegistry', 'sensorGuiRegistry', 'subsetStringEditorProviderRegistry', 'sourceWidgetProviderRegistry', 'relationWidgetRegistry', 'historyProviderRegistry', 'settingsEditorWidgetRegistry', 'enableAutoGeometryRestore', 'windowManager', 'setWindowManager', 'inputControllerManager', 'storedQueryManager', 'higFlags', 'sampleColor', 'findScreenAt', 'hasWebEngine')),
+    )),
+    ('src/gui/symbology/qgsheatmaprendererwidget.h', (
+        ('QgsHeatmapRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgshelp.h', (
+        ('QgsHelp', ('openHelp', 'helpUrl')),
+    )),
+    ('src/gui/qgshighlight.h', (
+        ('QgsHighlight', (('__overridden_methods__', ('updatePosition', 'paint')),)),
+    )),
+    ('src/gui/qgshighlightablelineedit.h', (
+        ('QgsHighlightableLineEdit', (('__overridden_methods__', ('paintEvent',)),)),
+    )),
+    ('src/gui/raster/qgshillshaderendererwidget.h', (
+        ('QgsHillshadeRendererWidget', ('create', ('__overridden_methods__', ('renderer',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgshistogramwidget.h', (
+        ('QgsHistogramWidget', (('__virtual_methods__', ('drawHistogram',)),)),
+    )),
+    ('src/gui/history/qgshistoryentrymodel.h', (
+        ('QgsHistoryEntryModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'index', 'parent', 'data', 'flags')), ('__group__', ('history',)))),
+    )),
+    ('src/gui/history/qgshistoryentrynode.h', (
+        ('QgsHistoryEntryNode', (('__virtual_methods__', ('childCount', 'html', 'createWidget', 'doubleClicked', 'populateContextMenu', 'matchesString')), ('__abstract_methods__', ('data',)), ('__group__', ('history',)))),
+        ('QgsHistoryEntryGroup', (('__virtual_methods__', ('childCount',)), ('__group__', ('history',)))),
+    )),
+    ('src/gui/history/qgshistoryprovider.h', (
+        ('QgsAbstractHistoryProvider', (('__virtual_methods__', ('createNodeForEntry', 'updateNodeForEntry')), ('__abstract_methods__', ('id',)), ('__group__', ('history',)))),
+    )),
+    ('src/gui/history/qgshistoryproviderregistry.h', (
+        ('QgsHistoryProviderRegistry.HistoryEntryOptions', (('__attribute_docs__', (('storageBackends', 'Target storage backends'),)), ('__annotations__', (('storageBackends', 'Qgis.HistoryProviderBackends'),)), ('__group__', ('history',)))),
+        ('QgsHistoryProviderRegistry', (('__attribute_docs__', (('entryAdded', 'Emitted when an ``entry`` is added.\n\n.. versionadded:: 3.32\n'), ('entryUpdated', 'Emitted when an ``entry`` is updated.\n\n.. versionadded:: 3.32\n'), ('historyCleared', 'Emitted when the history is cleared for a ``backend``.\n\nIf ``providerId`` is non-empty then the history has only been cleared\nfor the specified provider.\n\n.. versionadded:: 3.32\n'))), 'userHistoryDbPath', ('__signal_arguments__', (('entryAdded', ('id: int', 'entry: QgsHistoryEntry', 'backend: Qgis.HistoryProviderBackend')), ('entryUpdated', ('id: int', 'entry: Dict[str, object]', 'backend: Qgis.HistoryProviderBackend')), ('historyCleared', ('backend: Qgis.HistoryProviderBackend', 'providerId: str')))), ('__group__', ('history',)))),
+    )),
+    ('src/gui/history/qgshistorywidget.h', (
+        ('QgsHistoryWidget', (('__group__', ('history',)),)),
+    )),
+    ('src/gui/history/qgshistorywidgetcontext.h', (
+        ('QgsHistoryWidgetContext', (('__group__', ('history',)),)),
+    )),
+    ('src/gui/editorwidgets/qgshtmlwidgetwrapper.h', (
+        ('QgsHtmlWidgetWrapper', (('__overridden_methods__', ('valid', 'createWidget', 'initWidget', 'setFeature')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsidentifymenu.h', (
+        ('QgsIdentifyMenu', ('findFeaturesOnCanvas', 'styleHighlight', ('__overridden_methods__', ('closeEvent',)))),
+    )),
+    ('src/gui/attributetable/qgsifeatureselectionmanager.h', (
+        ('QgsIFeatureSelectionManager', (('__attribute_docs__', (('selectionChanged', 'Emitted when selection was changed.\n\n:param selected: Newly selected feature ids\n:param deselected: Ids of all features which have previously been\n                   selected but are not any more\n:param clearAndSelect: In case this is set to ``True``, the old\n                       selection was dismissed and the new selection\n                       corresponds to selected\n'),)), ('__abstract_methods__', ('selectedFeatureCount', 'select', 'deselect', 'setSelectedFeatures')), ('__signal_arguments__', (('selectionChanged', ('selected: QgsFeatureIds', 'deselected: QgsFeatureIds', 'clearAndSelect: bool')),)), ('__group__', ('attributetable',)))),
+    )),
+    ('src/gui/inputcontroller/qgsinputcontrollermanager.h', (
+        ('QgsInputControllerManager', (('__group__', ('inputcontroller',)),)),
+    )),
+    ('src/gui/symbology/qgsinterpolatedlinesymbollayerwidget.h', (
+        ('QgsInterpolatedLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgsinvertedpolygonrendererwidget.h', (
+        ('QgsInvertedPolygonRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'setDockMode')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/editorwidgets/qgsjsoneditwidget.h', (
+        ('QgsJsonEditWidget', (('__group__', ('editorwidgets',)),)),
+    )),
+    ('src/gui/qgskeyvaluewidget.h', (
+        ('QgsKeyValueWidget', (('__overridden_methods__', ('setReadOnly',)),)),
+    )),
+    ('src/gui/labeling/qgslabelingengineruleswidget.h', (
+        ('QgsLabelingEngineRulesWidget', (('__attribute_docs__', (('changed', 'Emitted when the rules configured in the widget are changed.\n'),)), ('__group__', ('labeling',)))),
+        ('QgsLabelingEngineRulesDialog', (('__group__', ('labeling',)),)),
+    )),
+    ('src/gui/labeling/qgslabelingenginerulewidget.h', (
+        ('QgsLabelingEngineRuleWidget', (('__attribute_docs__', (('changed', 'Emitted whenever the configuration of the rule is changed.\n'),)), ('__abstract_methods__', ('setRule', 'rule')), ('__group__', ('labeling',)))),
+    )),
+    ('src/gui/labeling/qgslabellineanchorwidget.h', (
+        ('QgsLabelLineAnchorWidget', (('__overridden_methods__', ('updateDataDefinedProperties',)), ('__group__', ('labeling',)))),
+    )),
+    ('src/gui/labeling/qgslabelobstaclesettingswidget.h', (
+        ('QgsLabelObstacleSettingsWidget', (('__overridden_methods__', ('setGeometryType', 'updateDataDefinedProperties')), ('__group__', ('labeling',)))),
+    )),
+    ('src/gui/labeling/qgslabelremoveduplicatesettingswidget.h', (
+        ('QgsLabelRemoveDuplicatesSettingsWidget', (('__overridden_methods__', ('setGeometryType', 'updateDataDefinedProperties')), ('__group__', ('labeling',)))),
+    )),
+    ('src/gui/labeling/qgslabelsettingswidgetbase.h', (
+        ('QgsLabelSettingsWidgetBase', (('__attribute_docs__', (('changed', 'Emitted when any of the settings described by the widget are changed.\n'), ('auxiliaryFieldCreated', 'Emitted when an auxiliary field is created in the widget.\n'))), ('__virtual_methods__', ('setContext', 'setGeometryType', 'updateDataDefinedProperties')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('labeling',)))),
+        ('QgsLabelSettingsWidgetDialog', (('__group__', ('labeling',)),)),
+    )),
+    ('src/gui/qgslayermetadataresultsmodel.h', (
+        ('QgsLayerMetadataResultsModel', (('__attribute_docs__', (('progressChanged', 'Emitted when the progress changed to ``progress``.\n'),)), ('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'headerData')), ('__signal_arguments__', (('progressChanged', ('progress: int',)),)))),
+    )),
+    ('src/gui/qgslayermetadataresultsproxymodel.h', (
+        ('QgsLayerMetadataResultsProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)),)),
+    )),
+    ('src/gui/qgslayermetadatasearchwidget.h', (
+        ('QgsLayerMetadataSearchWidget', (('__overridden_methods__', ('setMapCanvas', 'refresh', 'addButtonClicked', 'reset', 'showEvent')),)),
+    )),
+    ('src/gui/qgslayerpropertiesdialog.h', (
+        ('QgsLayerPropertiesDialog', (('__virtual_methods__', ('addPropertiesPageFactory', 'rollback')), ('__overridden_methods__', ('optionsStackedWidget_CurrentChanged',)))),
+    )),
+    ('src/gui/symbology/qgslayerpropertieswidget.h', (
+        ('QgsLayerPropertiesWidget', (('__attribute_docs__', (('changed', 'Emitted when the symbol layer configuration is changed in the widget.\n'), ('changeLayer', 'Emitted when the symbol ``layer`` is changed in the widget.\n'))), ('__overridden_methods__', ('setDockMode', 'createExpressionContext')), ('__signal_arguments__', (('changeLayer', ('layer: QgsSymbolLayer',)),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/layertree/qgslayertreeembeddedconfigwidget.h', (
+        ('QgsLayerTreeEmbeddedConfigWidget', (('__group__', ('layertree',)),)),
+    )),
+    ('src/gui/layertree/qgslayertreeembeddedwidgetregistry.h', (
+        ('QgsLayerTreeEmbeddedWidgetProvider', (('__abstract_methods__', ('id', 'name', 'createWidget', 'supportsLayer')), ('__group__', ('layertree',)))),
+        ('QgsLayerTreeEmbeddedWidgetRegistry', (('__group__', ('layertree',)),)),
+    )),
+    ('src/gui/layertree/qgslayertreemapcanvasbridge.h', (
+        ('QgsLayerTreeMapCanvasBridge', (('__attribute_docs__', (('canvasLayersChanged', 'Emitted when the set of layers (or order of layers) visible in the\ncanvas changes.\n'),)), ('__signal_arguments__', (('canvasLayersChanged', ('layers: List[QgsMapLayer]',)),)), ('__group__', ('layertree',)))),
+    )),
+    ('src/gui/layertree/qgslayertreeview.h', (
+        ('QgsLayerTreeView', (('__attribute_docs__', (('currentLayerChanged', 'Emitted when a current layer is changed\n'), ('datasetsDropped', 'Emitted when datasets are dropped onto the layer tree view\n'), ('contextMenuAboutToShow', 'Emitted when the context menu is about to show.\n\nAllows customization of the menu.\n\n.. versionadded:: 3.32\n'))), ('__overridden_methods__', ('setModel', 'contextMenuEvent', 'mouseDoubleClickEvent', 'mouseReleaseEvent', 'keyPressEvent', 'dragEnterEvent', 'dragMoveEvent', 'dropEvent', 'resizeEvent')), ('__signal_arguments__', (('currentLayerChanged', ('layer: QgsMapLayer',)), ('datasetsDropped', ('event: QDropEvent',)), ('contextMenuAboutToShow', ('menu: QMenu',)))), ('__group__', ('layertree',)))),
+        ('QgsLayerTreeViewMenuProvider', (('__abstract_methods__', ('createContextMenu',)), ('__group__', ('layertree',)))),
+        ('QgsLayerTreeProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)), ('__group__', ('layertree',)))),
+    )),
+    ('src/gui/layertree/qgslayertreeviewdefaultactions.h', (
+        ('QgsLayerTreeViewDefaultActions', (('__group__', ('layertree',)),)),
+    )),
+    ('src/gui/layertree/qgslayertreeviewindicator.h', (
+        ('QgsLayerTreeViewIndicator', (('__attribute_docs__', (('clicked', 'Emitted when user clicks on the indicator\n'), ('changed', 'Emitted when the indicator changes state (e.g. icon).\n\n.. versionadded:: 3.10\n'))), ('__signal_arguments__', (('clicked', ('index: QModelIndex',)),)), ('__group__', ('layertree',)))),
+    )),
+    ('src/gui/layout/qgslayoutcombobox.h', (
+        ('QgsLayoutComboBox', (('__attribute_docs__', (('layoutChanged', 'Emitted whenever the currently selected layout changes\n'),)), ('__signal_arguments__', (('layoutChanged', ('layout: QgsMasterLayoutInterface',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutcustomdrophandler.h', (
+        ('QgsLayoutCustomDropHandler', (('__virtual_methods__', ('handleFileDrop', 'handlePaste')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutdesignerinterface.h', (
+        ('QgsLayoutDesignerInterface.ExportResults', (('__attribute_docs__', (('result', 'Result/error code of export.'), ('labelingResults', 'Returns the labeling results for all map items included in the export. Map keys are the item UUIDs (see :py:func:`QgsLayoutItem.uuid()`).\n\nOwnership of the results remains with the layout designer.'))), ('__annotations__', (('result', 'QgsLayoutExporter.ExportResult'), ('labelingResults', 'Dict[str, QgsLabelingResults]'))), ('__group__', ('layout',)))),
+        ('QgsLayoutDesignerInterface', (('__attribute_docs__', (('layoutExported', 'Emitted whenever a layout is exported from the layout designer.\n\nThe results of the export can be retrieved by calling\n:py:func:`~QgsLayoutDesignerInterface.lastExportResults`.\n\n.. versionadded:: 3.20\n'), ('mapPreviewRefreshed', "Emitted when a ``map`` item's preview has been refreshed.\n\n.. versionadded:: 3.20\n"))), ('__abstract_methods__', ('layout', 'masterLayout', 'window', 'view', 'messageBar', 'selectItems', 'setAtlasPreviewEnabled', 'atlasPreviewEnabled', 'setAtlasFeature', 'showItemOptions', 'layoutMenu', 'editMenu', 'viewMenu', 'itemsMenu', 'atlasMenu', 'reportMenu', 'settingsMenu', 'layoutToolbar', 'navigationToolbar', 'actionsToolbar', 'atlasToolbar', 'addDockWidget', 'removeDockWidget', 'activateTool', 'lastExportResults', 'close', 'showRulers')), ('__signal_arguments__', (('mapPreviewRefreshed', ('map: QgsLayoutItemMap',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutitemcombobox.h', (
+        ('QgsLayoutItemComboBox', (('__attribute_docs__', (('itemChanged', 'Emitted whenever the currently selected item changes\n'),)), ('__signal_arguments__', (('itemChanged', ('item: QgsLayoutItem',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutitemguiregistry.h', (
+        ('QgsLayoutItemGuiRegistry', (('__attribute_docs__', (('typeAdded', 'Emitted whenever a new item type is added to the registry, with the\nspecified ``metadataId``.\n'),)), ('__signal_arguments__', (('typeAdded', ('metadataId: int',)),)), ('__group__', ('layout',)))),
+        ('QgsLayoutItemAbstractGuiMetadata', (('__virtual_methods__', ('creationIcon', 'createItemWidget', 'createRubberBand', 'createNodeRubberBand', 'createItem', 'newItemAddedToLayout', 'handleDoubleClick')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutitemwidget.h', (
+        ('QgsLayoutItemBaseWidget', (('__virtual_methods__', ('setReportTypeString', 'setDesignerInterface', 'setMasterLayout', 'setNewItem')), ('__group__', ('layout',)))),
+        ('QgsLayoutConfigObject', (('__group__', ('layout',)),)),
+        ('QgsLayoutItemPropertiesWidget', (('__group__', ('layout',)),)),
+    )),
+    ('src/gui/layout/qgslayoutnewitempropertiesdialog.h', (
+        ('QgsLayoutItemPropertiesDialog', (('__group__', ('layout',)),)),
+    )),
+    ('src/gui/layout/qgslayoutruler.h', (
+        ('QgsLayoutRuler', (('__attribute_docs__', (('cursorPosChanged', 'Emitted when mouse cursor coordinates change\n'),)), ('__overridden_methods__', ('minimumSizeHint', 'paintEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent')), ('__signal_arguments__', (('cursorPosChanged', ('position: QPointF',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutunitscombobox.h', (
+        ('QgsLayoutUnitsComboBox', (('__attribute_docs__', (('changed', 'Emitted when the ``unit`` is changed.\n'),)), ('__signal_arguments__', (('changed', ('unit: int',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutview.h', (
+        ('QgsLayoutView', (('__attribute_docs__', (('layoutSet', 'Emitted when a ``layout`` is set for the view.\n\n.. seealso:: :py:func:`currentLayout`\n\n.. seealso:: :py:func:`setCurrentLayout`\n'), ('toolSet', 'Emitted when the current ``tool`` is changed.\n\n.. seealso:: :py:func:`setTool`\n'), ('zoomLevelChanged', 'Emitted whenever the zoom level of the view is changed.\n'), ('cursorPosChanged', 'Emitted when the mouse cursor coordinates change within the view. The\n``layoutPoint`` argument indicates the cursor position within the layout\ncoordinate system.\n'), ('pageChanged', 'Emitted when the page visible in the view is changed. This signal\nconsiders the page at the center of the view as the current visible\npage.\n\n.. seealso:: :py:func:`currentPage`\n'), ('statusMessage', "Emitted when the view has a ``message`` for display in a parent window's\nstatus bar.\n\n.. seealso:: :py:func:`pushStatusMessage`\n"), ('itemFocused', 'Emitted when an ``item`` is "focused" in the view, i.e. it becomes the\nactive item and should have its properties displayed in any designer\nwindows.\n'), ('willBeDeleted', 'Emitted in the destructor when the view is about to be deleted, but is\nstill in a perfectly valid state.\n'))), ('__overridden_methods__', ('mousePressEvent', 'mouseReleaseEvent', 'mouseMoveEvent', 'mouseDoubleClickEvent', 'wheelEvent', 'keyPressEvent', 'keyReleaseEvent', 'resizeEvent', 'scrollContentsBy', 'dragEnterEvent', 'paintEvent')), ('__signal_arguments__', (('layoutSet', ('layout: QgsLayout',)), ('toolSet', ('tool: QgsLayoutViewTool',)), ('cursorPosChanged', ('layoutPoint: QPointF',)), ('pageChanged', ('page: int',)), ('statusMessage', ('message: str',)), ('itemFocused', ('item: QgsLayoutItem',)))), ('__group__', ('layout',)))),
+        ('QgsLayoutViewMenuProvider', (('__abstract_methods__', ('createContextMenu',)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewmouseevent.h', (
+        ('QgsLayoutViewMouseEvent', (('__group__', ('layout',)),)),
+    )),
+    ('src/gui/layout/qgslayoutviewrubberband.h', (
+        ('QgsLayoutViewRubberBand', (('__attribute_docs__', (('sizeChanged', 'Emitted when the size of the rubber band is changed. The ``size``\nargument gives a translated string describing the new rubber band size,\nwith a format which differs per subclass (e.g. rectangles may describe a\nsize using width and height, while circles may describe a size by\nradius).\n'),)), ('__abstract_methods__', ('create', 'start', 'update', 'finish')), ('__signal_arguments__', (('sizeChanged', ('size: str',)),)), ('__group__', ('layout',)))),
+        ('QgsLayoutViewRectangularRubberBand', (('__overridden_methods__', ('create', 'start', 'update', 'finish')), ('__group__', ('layout',)))),
+        ('QgsLayoutViewEllipticalRubberBand', (('__overridden_methods__', ('create', 'start', 'update', 'finish')), ('__group__', ('layout',)))),
+        ('QgsLayoutViewTriangleRubberBand', (('__overridden_methods__', ('create', 'start', 'update', 'finish')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtool.h', (
+        ('QgsLayoutViewTool', (('__attribute_docs__', (('activated', 'Emitted when the tool is activated.\n'), ('deactivated', 'Emitted when the tool is deactivated.\n'), ('itemFocused', 'Emitted when an ``item`` is "focused" by the tool, i.e. it should become\nthe active item and should have its properties displayed in any designer\nwindows.\n'))), ('__virtual_methods__', ('layoutMoveEvent', 'layoutDoubleClickEvent', 'layoutPressEvent', 'layoutReleaseEvent', 'wheelEvent', 'keyPressEvent', 'keyReleaseEvent', 'activate', 'deactivate', 'ignoredSnapItems')), ('__signal_arguments__', (('itemFocused', ('item: QgsLayoutItem',)),)), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooladditem.h', (
+        ('QgsLayoutViewToolAddItem', (('__attribute_docs__', (('createdItem', 'Emitted when an item has been created using the tool.\n'),)), ('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'activate', 'deactivate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooladdnodeitem.h', (
+        ('QgsLayoutViewToolAddNodeItem', (('__attribute_docs__', (('createdItem', 'Emitted when an item has been created using the tool.\n'),)), ('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'keyPressEvent', 'deactivate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooleditnodes.h', (
+        ('QgsLayoutViewToolEditNodes', (('__overridden_methods__', ('activate', 'layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'layoutDoubleClickEvent', 'keyPressEvent', 'deactivate', 'ignoredSnapItems')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtoolmoveitemcontent.h', (
+        ('QgsLayoutViewToolMoveItemContent', (('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'wheelEvent')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtoolpan.h', (
+        ('QgsLayoutViewToolPan', (('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'deactivate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtoolselect.h', (
+        ('QgsLayoutViewToolSelect', (('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'wheelEvent', 'keyPressEvent', 'deactivate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooltemporarykeypan.h', (
+        ('QgsLayoutViewToolTemporaryKeyPan', (('__overridden_methods__', ('layoutMoveEvent', 'keyReleaseEvent', 'activate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooltemporarykeyzoom.h', (
+        ('QgsLayoutViewToolTemporaryKeyZoom', (('__overridden_methods__', ('layoutReleaseEvent', 'keyPressEvent', 'keyReleaseEvent', 'activate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtooltemporarymousepan.h', (
+        ('QgsLayoutViewToolTemporaryMousePan', (('__overridden_methods__', ('layoutMoveEvent', 'layoutReleaseEvent', 'activate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/layout/qgslayoutviewtoolzoom.h', (
+        ('QgsLayoutViewToolZoom', (('__overridden_methods__', ('layoutPressEvent', 'layoutMoveEvent', 'layoutReleaseEvent', 'keyPressEvent', 'keyReleaseEvent', 'deactivate')), ('__group__', ('layout',)))),
+    )),
+    ('src/gui/qgslegendfilterbutton.h', (
+        ('QgsLegendFilterButton', (('__attribute_docs__', (('expressionTextChanged', 'Emitted when the expression text changes\n'),)),)),
+    )),
+    ('src/gui/qgslegendpatchshapebutton.h', (
+        ('QgsLegendPatchShapeButton', (('__attribute_docs__', (('changed', "Emitted when the shape's settings are changed.\n\n.. seealso:: :py:func:`shape`\n\n.. seealso:: :py:func:`setShape`\n"),)), ('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'changeEvent', 'showEvent', 'resizeEvent', 'mousePressEvent')))),
+    )),
+    ('src/gui/qgslegendpatchshapewidget.h', (
+        ('QgsLegendPatchShapeWidget', (('__attribute_docs__', (('changed', 'Emitted whenever the patch shape defined by the widget is changed.\n'),)),)),
+    )),
+    ('src/gui/qgslimitedrandomcolorrampdialog.h', (
+        ('QgsLimitedRandomColorRampWidget', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+        ('QgsLimitedRandomColorRampDialog', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+    )),
+    ('src/gui/qgslistwidget.h', (
+        ('QgsListWidget', (('__overridden_methods__', ('setReadOnly',)),)),
+    )),
+    ('src/gui/locator/qgslocatorwidget.h', (
+        ('QgsLocatorWidget', (('__attribute_docs__', (('configTriggered', 'Emitted when the configure option is triggered in the widget.\n'),)), ('__overridden_methods__', ('eventFilter',)), ('__group__', ('locator',)))),
+    )),
+    ('src/gui/qgslonglongvalidator.h', (
+        ('QgsLongLongValidator', (('__virtual_methods__', ('setRange',)), ('__overridden_methods__', ('validate',)))),
+    )),
+    ('src/gui/qgsmapcanvas.h', (
+        ('QgsMapCanvas', (('__attribute_docs__', (('xyCoordinates', 'Emits current mouse position\n\n.. note::\n\n   changed in 1.3\n'), ('scaleChanged', 'Emitted when the scale of the map changes\n'), ('scaleLockChanged', 'Emitted when the scale locked state of the map changes\n\n:param locked: true if the scale is locked\n\n.. seealso:: :py:func:`setScaleLocked`\n\n.. versionadded:: 3.18\n'), ('extentsChanged', 'Emitted when the extents of the map change\n'), ('rotationChanged', 'Emitted when the rotation of the map changes\n'), ('magnificationChanged', 'Emitted when the scale of the map changes\n'), ('canvasColorChanged', 'Emitted when canvas background color changes\n'), ('renderComplete', 'Emitted when the canvas has rendered. Passes a pointer to the painter on\nwhich the map was drawn. This is useful for plugins that wish to draw on\nthe map after it has been rendered. Passing the painter allows plugins\nto work when the map is being rendered onto a pixmap other than the\nmapCanvas own pixmap member.\n\n- anything related to rendering progress is not visible outside of map canvas\n- additional drawing shall be done directly within the renderer job or independently as a map canvas item\n'), ('mapCanvasRefreshed', 'Emitted when canvas finished a refresh request.\n'), ('renderStarting', 'Emitted when the canvas is about to be rendered.\n'), ('mapRefreshCanceled', 'Emitted when the pending map refresh has been canceled\n\n.. versionadded:: 3.18\n'), ('layersChanged', 'Emitted when a new set of layers has been received\n'), ('keyPressed', 'Emit key press event\n'), ('keyReleased', 'Emit key release event\n'), ('mapToolSet', 'Emit map tool changed with the old tool\n'), ('selectionChanged', 'Emitted when selection in any ``layer`` gets changed.\n\n.. note::\n\n   Since QGIS 3.28 this signal is emitted for multiple layer types, including :py:class:`QgsVectorLayer` and :py:class:`QgsVectorTileLayer`\n'), ('zoomLastStatusChanged', 'Emitted when zoom last status changed\n'), ('zoomNextStatusChanged', 'Emitted when zoom next status changed\n'), ('destinationCrsChanged', 'Emitted when map CRS has changed\n'), ('transformContextChanged', 'Emitted when the canvas transform context is changed.\n'), ('currentLayerChanged', 'Emitted when the current layer is changed\n'), ('layerStyleOverridesChanged', 'Emitted when the configuration of overridden layer styles changes\n'), ('themeChanged', 'Emitted when the canvas has been assigned a different map theme.\n\n.. seealso:: :py:func:`setTheme`\n'), ('messageEmitted', 'emit a message (usually to be displayed in a message bar)\n'), ('renderErrorOccurred', 'Emitted whenever an error is encountered during a map render operation.\n\nThe ``layer`` argument indicates the associated map layer, if available.\n\n.. versionadded:: 3.10.0\n'), ('panDistanceBearingChanged', 'Emitted whenever the distance or bearing of an in-progress panning\noperation is changed.\n\nThis signal will be emitted during a pan operation as the user moves the\nmap, giving the total distance and bearing between the map position at\nthe start of the pan and the current pan position.\n\n.. versionadded:: 3.12\n'), ('tapAndHoldGestureOccurred', 'Emitted whenever a tap and hold ``gesture`` occurs at the specified map\npoint.\n\n.. versionadded:: 3.12\n'), ('temporalRangeChanged', 'Emitted when the map canvas temporal range changes.\n\n.. versionadded:: 3.14\n'), ('zRangeChanged', 'Emitted when the map canvas z (elevation) range changes.\n\n.. seealso:: :py:func:`zRange`\n\n.. seealso:: :py:func:`setZRange`\n\n.. versionadded:: 3.18\n'), ('contextMenuAboutToShow', 'Emitted before the map canvas context menu will be shown. Can be used to\nextend the context menu.\n\n.. versionadded:: 3.16\n'))), ('__overridden_methods__', ('createExpressionContext', 'event', 'keyPressEvent', 'keyReleaseEvent', 'mouseDoubleClickEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent', 'wheelEvent', 'resizeEvent', 'paintEvent', 'dragEnterEvent', 'viewportEvent', 'dropEvent', 'showEvent')), ('__signal_arguments__', (('xyCoordinates', ('p: QgsPointXY',)), ('scaleChanged', ('scale: float',)), ('scaleLockChanged', ('locked: bool',)), ('rotationChanged', ('rotation: float',)), ('magnificationChanged', ('magnification: float',)), ('renderComplete', ('painter: QPainter',)), ('keyPressed', ('e: QKeyEvent',)), ('keyReleased', ('e: QKeyEvent',)), ('mapToolSet', ('newTool: QgsMapTool', 'oldTool: QgsMapTool')), ('selectionChanged', ('layer: QgsMapLayer',)), ('zoomLastStatusChanged', ('available: bool',)), ('zoomNextStatusChanged', ('available: bool',)), ('currentLayerChanged', ('layer: QgsMapLayer',)), ('themeChanged', ('theme: str',)), ('messageEmitted', ('title: str', 'message: str', 'level: Qgis.MessageLevel = Qgis.MessageLevel.Info')), ('renderErrorOccurred', ('error: str', 'layer: QgsMapLayer')), ('panDistanceBearingChanged', ('distance: float', 'unit: Qgis.DistanceUnit', 'bearing: float')), ('tapAndHoldGestureOccurred', ('mapPoint: QgsPointXY', 'gesture: QTapAndHoldGesture')), ('contextMenuAboutToShow', ('menu: QMenu', 'event: QgsMapMouseEvent')))))),
+    )),
+    ('src/gui/qgsmapcanvasannotationitem.h', (
+        ('QgsMapCanvasAnnotationItem', (('__overridden_methods__', ('updatePosition', 'boundingRect', 'paint')),)),
+    )),
+    ('src/gui/qgsmapcanvasinteractionblocker.h', (
+        ('QgsMapCanvasInteractionBlocker', (('__abstract_methods__', ('blockCanvasInteraction',)),)),
+    )),
+    ('src/gui/qgsmapcanvasitem.h', (
+        ('QgsMapCanvasItem', (('__virtual_methods__', ('updatePosition',)), ('__abstract_methods__', ('paint',)), ('__overridden_methods__', ('paint', 'boundingRect')))),
+    )),
+    ('src/gui/qgsmapcanvassnappingutils.h', (
+        ('QgsMapCanvasSnappingUtils', (('__overridden_methods__', ('prepareIndexStarting', 'prepareIndexProgress')),)),
+    )),
+    ('src/gui/qgsmapcanvastracer.h', (
+        ('QgsMapCanvasTracer', ('tracerForCanvas', ('__overridden_methods__', ('configure',)))),
+    )),
+    ('src/gui/qgsmapcanvasutils.h', (
+        ('QgsMapCanvasUtils', ('zoomToMatchingFeatures', 'flashMatchingFeatures', 'filterForLayer')),
+    )),
+    ('src/gui/actions/qgsmaplayeraction.h', (
+        ('QgsMapLayerAction', (('__attribute_docs__', (('triggeredForFeatures', 'Triggered when action has been run for a specific list of features\n\n.. deprecated:: 3.40\n\n   Use the version with :py:class:`QgsMapLayerActionContext` instead.\n'), ('triggeredForFeature', 'Triggered when action has been run for a specific feature\n\n.. deprecated:: 3.40\n\n   Use the version with :py:class:`QgsMapLayerActionContext` instead.\n'), ('triggeredForLayer', 'Triggered when action has been run for a specific layer\n\n.. deprecated:: 3.40\n\n   Use the version with :py:class:`QgsMapLayerActionContext` instead.\n'), ('triggeredForFeaturesV2', 'Triggered when action has been run for a specific list of features\n\n.. versionadded:: 3.30\n'), ('triggeredForFeatureV2', 'Triggered when action has been run for a specific feature.\n\n.. versionadded:: 3.30\n'), ('triggeredForLayerV2', 'Triggered when action has been run for a specific layer.\n\n.. versionadded:: 3.30\n'))), ('__virtual_methods__', ('canRunUsingLayer', 'triggerForFeatures', 'triggerForFeature', 'triggerForLayer')), ('__signal_arguments__', (('triggeredForFeaturesV2', ('layer: QgsMapLayer', 'featureList: List[QgsFeature]', 'context: QgsMapLayerActionContext')), ('triggeredForFeatureV2', ('layer: QgsMapLayer', 'feature: QgsFeature', 'context: QgsMapLayerActionContext')), ('triggeredForLayerV2', ('layer: QgsMapLayer', 'context: QgsMapLayerActionContext')))), ('__group__', ('actions',)))),
+    )),
+    ('src/gui/actions/qgsmaplayeractioncontext.h', (
+        ('QgsMapLayerActionContext', (('__group__', ('actions',)),)),
+    )),
+    ('src/gui/actions/qgsmaplayeractioncontextgenerator.h', (
+        ('QgsMapLayerActionContextGenerator', (('__abstract_methods__', ('createActionContext',)), ('__group__', ('actions',)))),
+    )),
+    ('src/gui/actions/qgsmaplayeractionregistry.h', (
+        ('QgsMapLayerActionRegistry', (('__attribute_docs__', (('changed', 'Triggered when an action is added or removed from the registry\n'),)), ('__group__', ('actions',)))),
+    )),
+    ('src/gui/qgsmaplayercombobox.h', (
+        ('QgsMapLayerComboBox', (('__attribute_docs__', (('layerChanged', 'Emitted whenever the currently selected layer changes.\n'),)), ('__overridden_methods__', ('dragEnterEvent', 'dragLeaveEvent', 'dropEvent', 'paintEvent')), ('__signal_arguments__', (('layerChanged', ('layer: QgsMapLayer',)),)))),
+    )),
+    ('src/gui/qgsmaplayerconfigwidget.h', (
+        ('QgsMapLayerConfigWidget', (('__virtual_methods__', ('shouldTriggerLayerRepaint', 'syncToLayer', 'setMapLayerConfigWidgetContext', 'focusDefaultWidget')), ('__abstract_methods__', ('apply',)))),
+    )),
+    ('src/gui/qgsmaplayerconfigwidgetfactory.h', (
+        ('QgsMapLayerConfigWidgetFactory', (('__virtual_methods__', ('icon', 'title', 'supportsStyleDock', 'supportLayerPropertiesDialog', 'layerPropertiesPagePositionHint', 'supportsLayer', 'supportsLayerTreeGroup', 'parentPage')), ('__abstract_methods__', ('createWidget',)))),
+    )),
+    ('src/gui/qgsmaplayerstylecategoriesmodel.h', (
+        ('QgsMapLayerStyleCategoriesModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'setData', 'flags')),)),
+        ('QgsCategoryDisplayLabelDelegate', (('__overridden_methods__', ('drawDisplay', 'sizeHint')),)),
+    )),
+    ('src/gui/qgsmaplayerstylemanagerwidget.h', (
+        ('QgsMapLayerStyleManagerWidget', (('__overridden_methods__', ('apply',)),)),
+    )),
+    ('src/gui/qgsmapoverviewcanvas.h', (
+        ('QgsMapOverviewCanvas', (('__overridden_methods__', ('paintEvent', 'showEvent', 'resizeEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent', 'wheelEvent')),)),
+    )),
+    ('src/gui/qgsmaptip.h', (
+        ('QgsMapTip', ('vectorMapTipPreviewText', 'rasterMapTipPreviewText')),
+    )),
+    ('src/gui/maptools/qgsmaptool.h', (
+        ('QgsMapTool', (('__attribute_docs__', (('messageEmitted', 'Emitted when a ``message`` should be shown to the user in the\napplication message bar.\n\n.. seealso:: :py:func:`messageDiscarded`\n'), ('messageDiscarded', 'Emitted when the previous message from the tool should be cleared from\nthe application message bar.\n\n.. seealso:: :py:func:`messageEmitted`\n'), ('activated', 'Emitted when the map tool is activated.\n\n.. seealso:: :py:func:`deactivated`\n'), ('deactivated', 'Emitted when the map tool is deactivated.\n\n.. seealso:: :py:func:`activated`\n'), ('reactivated', 'Emitted when the map tool is activated, while it is already active.\n\n.. versionadded:: 3.32\n'))), 'searchRadiusMM', 'searchRadiusMU', ('__virtual_methods__', ('flags', 'canvasMoveEvent', 'canvasDoubleClickEvent', 'canvasPressEvent', 'canvasReleaseEvent', 'wheelEvent', 'keyPressEvent', 'keyReleaseEvent', 'gestureEvent', 'canvasToolTipEvent', 'setCursor', 'activate', 'deactivate', 'reactivate', 'clean', 'populateContextMenu', 'populateContextMenuWithEvent')), ('__signal_arguments__', (('messageEmitted', ('message: str', 'level: Qgis.MessageLevel = Qgis.MessageLevel.Info')),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptooladvanceddigitizing.h', (
+        ('QgsMapToolAdvancedDigitizing', (('__virtual_methods__', ('layer', 'cadCanvasPressEvent', 'cadCanvasReleaseEvent', 'cadCanvasMoveEvent')), ('__overridden_methods__', ('canvasPressEvent', 'canvasReleaseEvent', 'canvasMoveEvent', 'activate', 'deactivate')), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolcapture.h', (
+        ('QgsMapToolCapture', (('__virtual_methods__', ('capabilities', 'supportsTechnique', 'geometryCaptured', 'pointCaptured', 'lineCaptured', 'polygonCaptured')), ('__overridden_methods__', ('activate', 'deactivate', 'cadCanvasMoveEvent', 'cadCanvasReleaseEvent', 'keyPressEvent', 'clean')), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolcapturelayergeometry.h', (
+        ('QgsMapToolCaptureLayerGeometry', (('__virtual_methods__', ('layerGeometryCaptured', 'layerPointCaptured', 'layerLineCaptured', 'layerPolygonCaptured')), ('__overridden_methods__', ('geometryCaptured',)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptooldigitizefeature.h', (
+        ('QgsMapToolDigitizeFeature', (('__attribute_docs__', (('digitizingCompleted', 'Emitted whenever the digitizing has been successfully completed\n\n:param feature: the new digitized feature\n'), ('digitizingFinished', 'Emitted whenever the digitizing has been ended without digitizing any\nfeature\n'), ('digitizingCanceled', 'Emitted when the digitizing process was interrupted by the user.\n\n.. versionadded:: 3.28\n'))), ('__virtual_methods__', ('layerGeometryCaptured', 'featureDigitized')), ('__overridden_methods__', ('capabilities', 'supportsTechnique', 'cadCanvasReleaseEvent', 'activate', 'deactivate', 'reactivate', 'keyPressEvent')), ('__signal_arguments__', (('digitizingCompleted', ('feature: QgsFeature',)),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptooledit.h', (
+        ('QgsMapToolEdit', ('defaultZValue', 'defaultMValue', 'digitizingStrokeColor', 'digitizingStrokeWidth', 'digitizingFillColor', ('__overridden_methods__', ('flags',)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolemitpoint.h', (
+        ('QgsMapToolEmitPoint', (('__attribute_docs__', (('canvasClicked', 'signal emitted on canvas click\n'),)), ('__overridden_methods__', ('flags', 'canvasMoveEvent', 'canvasPressEvent', 'canvasReleaseEvent')), ('__signal_arguments__', (('canvasClicked', ('point: QgsPointXY', 'button: Qt.MouseButton')),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolextent.h', (
+        ('QgsMapToolExtent', (('__attribute_docs__', (('extentChanged', 'signal emitted on extent change\n'),)), ('__overridden_methods__', ('flags', 'canvasMoveEvent', 'canvasPressEvent', 'canvasReleaseEvent', 'activate', 'deactivate')), ('__signal_arguments__', (('extentChanged', ('extent: QgsRectangle',)),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolidentify.h', (
+        ('QgsMapToolIdentify', (('__attribute_docs__', (('identifyProgress', 'Emitted when the identify action progresses.\n\n:param processed: number of objects processed so far\n:param total: total number of objects to process\n'), ('identifyMessage', 'Emitted when the identify operation needs to show a user-facing message\n\n:param message: Message to show to the user\n'), ('changedRasterResults', 'Emitted when the format of raster ``results`` is changed and need to be\nupdated in user-facing displays.\n'))), ('__overridden_methods__', ('flags', 'canvasMoveEvent', 'canvasPressEvent', 'canvasReleaseEvent', 'activate', 'deactivate')), ('__signal_arguments__', (('identifyProgress', ('processed: int', 'total: int')), ('identifyMessage', ('message: str',)), ('changedRasterResults', ('results: List[QgsMapToolIdentify.IdentifyResult]',)))), ('__group__', ('maptools',)))),
+        ('QgsMapToolIdentify.IdentifyResult', (('__group__', ('maptools',)),)),
+    )),
+    ('src/gui/maptools/qgsmaptoolidentifyfeature.h', (
+        ('QgsMapToolIdentifyFeature', (('__attribute_docs__', (('featureIdentified', 'Emitted when a feature has been identified by its ``id``.\n\n.. deprecated:: 3.40\n\n   Use the signal with a :py:class:`QgsFeature` argument instead.\n'),)), ('__overridden_methods__', ('canvasReleaseEvent', 'keyPressEvent')), ('__signal_arguments__', (('featureIdentified', ('feature: QgsFeature',)),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolpan.h', (
+        ('QgsMapToolPan', (('__attribute_docs__', (('panDistanceBearingChanged', 'Emitted whenever the distance or bearing of an in-progress panning\noperation is changed.\n\nThis signal will be emitted during a pan operation as the user moves the\nmap, giving the total distance and bearing between the map position at\nthe start of the pan and the current pan position.\n\n.. versionadded:: 3.12\n'),)), ('__overridden_methods__', ('activate', 'deactivate', 'flags', 'canvasPressEvent', 'canvasMoveEvent', 'canvasReleaseEvent', 'canvasDoubleClickEvent', 'gestureEvent')), ('__signal_arguments__', (('panDistanceBearingChanged', ('distance: float', 'unit: Qgis.DistanceUnit', 'bearing: float')),)), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/maptools/qgsmaptoolzoom.h', (
+        ('QgsMapToolZoom', (('__overridden_methods__', ('flags', 'canvasMoveEvent', 'canvasPressEvent', 'canvasReleaseEvent', 'keyPressEvent', 'keyReleaseEvent', 'deactivate')), ('__group__', ('maptools',)))),
+    )),
+    ('src/gui/symbology/qgsmasksymbollayerwidget.h', (
+        ('QgsMaskMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsmenuheader.h', (
+        ('QgsMenuHeader', (('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'paintEvent')),)),
+    )),
+    ('src/gui/symbology/qgsmergedfeaturerendererwidget.h', (
+        ('QgsMergedFeatureRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'setDockMode')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/mesh/qgsmeshlayerproperties.h', (
+        ('QgsMeshLayerProperties', (('__virtual_methods__', ('syncToLayer', 'apply', 'rollback')), ('__group__', ('mesh',)))),
+    )),
+    ('src/gui/qgsmessagebar.h', (
+        ('QgsMessageBar', (('__attribute_docs__', (('widgetAdded', 'Emitted whenever an ``item`` is added to the bar.\n'), ('widgetRemoved', 'Emitted whenever an ``item`` was removed from the bar.\n'))), 'createMessage', 'defaultMessageTimeout', ('__overridden_methods__', ('mousePressEvent',)), ('__signal_arguments__', (('widgetAdded', ('item: QgsMessageBarItem',)), ('widgetRemoved', ('item: QgsMessageBarItem',)))))),
+    )),
+    ('src/gui/qgsmessagebaritem.h', (
+        ('QgsMessageBarItem', (('__attribute_docs__', (('styleChanged', "Emitted when the item's message level has changed and the message bar\nstyle will need to be updated as a result.\n"),)), ('__signal_arguments__', (('styleChanged', ('styleSheet: str',)),)))),
+    )),
+    ('src/gui/qgsmessagelogviewer.h', (
+        ('QgsMessageLogViewer', (('__overridden_methods__', ('closeEvent', 'reject', 'eventFilter')),)),
+    )),
+    ('src/gui/qgsmessageviewer.h', (
+        ('QgsMessageViewer', (('__overridden_methods__', ('setMessage', 'appendMessage', 'showMessage', 'setTitle')),)),
+    )),
+    ('src/gui/qgsmetadatawidget.h', (
+        ('QgsMetadataWidget', (('__attribute_docs__', (('titleChanged', 'Emitted when the ``title`` field is changed.\n\n.. seealso:: :py:func:`title`\n\n.. seealso:: :py:func:`setTitle`\n\n.. versionadded:: 3.2\n'),)), 'parseLanguages', 'parseLicenses', 'parseLinkTypes', 'parseMimeTypes', 'parseTypes', ('__signal_arguments__', (('titleChanged', ('title: str',)),)))),
+    )),
+    ('src/gui/processing/models/qgsmodelarrowitem.h', (
+        ('QgsModelArrowItem', (('__overridden_methods__', ('paint',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/gui/processing/models/qgsmodelcomponentgraphicitem.h', (
+        ('QgsModelComponentGraphicItem', (('__attribute_docs__', (('requestModelRepaint', 'Emitted by the item to request a repaint of the parent model scene.\n'), ('aboutToChange', 'Emitted when the definition of the associated component is about to be\nchanged by the item.\n\nThe ``text`` argument gives the translated text describing the change\nabout to occur, and the optional ``id`` can be used to group the\nassociated undo commands.\n'), ('changed', 'Emitted when the definition of the associated component is changed by\nthe item.\n'), ('repaintArrows', 'Emitted when item requests that all connected arrows are repainted.\n'), ('updateArrowPaths', 'Emitted when item requires that all connected arrow paths are\nrecalculated.\n'), ('sizePositionChanged', "Emitted when the item's size or position changes.\n"))), ('__virtual_methods__', ('flags', 'linkPointCount', 'linkPointText', 'editComment', 'canDeleteComponent', 'deleteComponent', 'editComponent', 'strokeStyle', 'titleAlignment', 'iconPicture', 'iconPixmap')), ('__abstract_methods__', ('fillColor', 'strokeColor', 'textColor', 'updateStoredComponentPosition')), ('__overridden_methods__', ('mouseDoubleClickEvent', 'hoverEnterEvent', 'hoverMoveEvent', 'hoverLeaveEvent', 'itemChange', 'boundingRect', 'contains', 'paint')), ('__signal_arguments__', (('aboutToChange', ('text: str', 'id: int = 0')),)), ('__group__', ('processing', 'models')))),
+        ('QgsModelChildAlgorithmGraphicItem', (('__attribute_docs__', (('runFromHere', 'Emitted when the user opts to run the model from this child algorithm.\n\n.. versionadded:: 3.38\n'), ('runSelected', 'Emitted when the user opts to run selected steps from the model.\n\n.. versionadded:: 3.38\n'), ('showPreviousResults', 'Emitted when the user opts to view previous results from this child\nalgorithm.\n\n.. versionadded:: 3.38\n'), ('showLog', 'Emitted when the user opts to view the previous log from this child\nalgorithm.\n\n.. versionadded:: 3.38\n'))), ('__overridden_methods__', ('contextMenuEvent', 'canDeleteComponent', 'fillColor', 'strokeColor', 'textColor', 'iconPixmap', 'iconPicture', 'linkPointCount', 'linkPointText', 'updateStoredComponentPosition', 'deleteComponent')), ('__group__', ('processing', 'models')))),
+        ('QgsModelParameterGraphicItem', (('__overridden_methods__', ('contextMenuEvent', 'canDeleteComponent', 'fillColor', 'strokeColor', 'textColor', 'iconPicture', 'linkPointCount', 'linkPointText', 'updateStoredComponentPosition', 'deleteComponent')), ('__group__', ('processing', 'models')))),
+        ('QgsModelOutputGraphicItem', (('__overridden_methods__', ('canDeleteComponent', 'fillColor', 'strokeColor', 'textColor', 'iconPicture', 'updateStoredComponentPosition', 'deleteComponent')), ('__group__', ('processing', 'models')))),
+        ('QgsModelCommentGraphicItem', (('__overridden_methods__', ('contextMenuEvent', 'canDeleteComponent', 'fillColor', 'strokeColor', 'textColor', 'strokeStyle', 'updateStoredComponentPosition', 'deleteComponent', 'editComponent')), ('__group__', ('processing', 'models')))),
+        ('QgsModelGroupBoxGraphicItem', (('__overridden_methods__', ('contextMenuEvent', 'canDeleteComponent', 'fillColor', 'strokeColor', 'textColor', 'strokeStyle', 'titleAlignment', 'updateStoredComponentPosition', 'deleteComponent', 'editComponent')), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/gui/processing/models/qgsmodeldesignerdialog.h', (
+        ('QgsModelDesignerDialog', (('__abstract_methods__', ('repaintModel', 'addAlgorithm', 'addInput', 'exportAsScriptAlgorithm', 'saveModel', 'createExecutionDialog')), ('__overridden_methods__', ('closeEvent',)), ('__group__', ('processing', 'models')))),
+        ('QgsModelChildDependenciesWidget', (('__group__', ('processing', 'models')),)),
+    )),
+    ('src/gui/processing/models/qgsmodelgraphicitem.h', (
+        ('QgsModelDesignerFlatButtonGraphicItem', (('__attribute_docs__', (('clicked', 'Emitted when the button is clicked.\n'),)), ('__overridden_methods__', ('paint', 'boundingRect', 'hoverEnterEvent', 'hoverLeaveEvent', 'mousePressEvent')), ('__group__', ('processing', 'models')))),
+        ('QgsModelDesignerFoldButtonGraphicItem', (('__attribute_docs__', (('folded', 'Emitted when the button ``folded`` state changes.\n\nIf ``folded`` is ``True``, the button represents the collapsed state for\nthe item.\n'),)), ('__overridden_methods__', ('mousePressEvent',)), ('__signal_arguments__', (('folded', ('folded: bool',)),)), ('__group__', ('processing', 'models')))),
+        ('QgsModelDesignerSocketGraphicItem', (('__overridden_methods__', ('paint',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/gui/processing/models/qgsmodelgraphicsscene.h', (
+        ('QgsModelGraphicsScene', (('__attribute_docs__', (('rebuildRequired', 'Emitted when a change in the model requires a full rebuild of the scene.\n'), ('componentAboutToChange', 'Emitted whenever a component of the model is about to be changed.\n\nThe ``text`` argument gives the translated text describing the change\nabout to occur, and the optional ``id`` can be used to group the\nassociated undo commands.\n'), ('componentChanged', 'Emitted whenever a component of the model is changed.\n'), ('selectedItemChanged', 'Emitted whenever the selected item changes. If ``None``, no item is\nselected.\n'), ('runSelected', 'Emitted when the user opts to run selected steps from the model.\n\n.. versionadded:: 3.38\n'), ('runFromChild', 'Emitted when the user opts to run the part of the model starting from\nthe specified child algorithm.\n\n.. versionadded:: 3.38\n'), ('showChildAlgorithmOutputs', 'Emitted when the user opts to view previous results from the child\nalgorithm with matching ID.\n\n.. versionadded:: 3.38\n'), ('showChildAlgorithmLog', 'Emitted when the user opts to view the previous log from the child\nalgorithm with matching ID.\n\n.. versionadded:: 3.38\n'))), ('__virtual_methods__', ('createParameterGraphicItem', 'createChildAlgGraphicItem', 'createOutputGraphicItem', 'createCommentGraphicItem')), ('__overridden_methods__', ('mousePressEvent',)), ('__signal_arguments__', (('componentAboutToChange', ('text: str', 'id: int = 0')), ('selectedItemChanged', ('selected: QgsModelComponentGraphicItem',)), ('runFromChild', ('childId: str',)), ('showChildAlgorithmOutputs', ('childId: str',)), ('showChildAlgorithmLog', ('childId: str',)))), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/gui/processing/models/qgsmodelgraphicsview.h', (
+        ('QgsModelGraphicsView', (('__attribute_docs__', (('algorithmDropped', 'Emitted when an algorithm is dropped onto the view.\n'), ('inputDropped', 'Emitted when an input parameter is dropped onto the view.\n'), ('itemFocused', 'Emitted when an ``item`` is "focused" in the view, i.e. it becomes the\nactive item and should have its properties displayed in any designer\nwindows.\n'), ('willBeDeleted', 'Emitted in the destructor when the view is about to be deleted, but is\nstill in a perfectly valid state.\n'), ('macroCommandStarted', 'Emitted when a macro command containing a group of interactions is\nstarted in the view.\n'), ('macroCommandEnded', 'Emitted when a macro command containing a group of interactions in the\nview has ended.\n'), ('commandBegun', 'Emitted when an undo command is started in the view.\n'), ('commandEnded', 'Emitted when an undo command in the view has ended.\n'), ('deleteSelectedItems', 'Emitted when the selected items should be deleted;\n'))), ('__overridden_methods__', ('dragEnterEvent', 'dropEvent', 'dragMoveEvent', 'wheelEvent', 'mousePressEvent', 'mouseReleaseEvent', 'mouseMoveEvent', 'mouseDoubleClickEvent', 'keyPressEvent', 'keyReleaseEvent')), ('__signal_arguments__', (('algorithmDropped', ('algorithmId: str', 'pos: QPointF')), ('inputDropped', ('inputId: str', 'pos: QPointF')), ('itemFocused', ('item: QgsModelComponentGraphicItem',)), ('macroCommandStarted', ('text: str',)), ('commandBegun', ('text: str',)))), ('__group__', ('processing', 'models')))),
+        ('QgsModelViewSnapMarker', (('__overridden_methods__', ('paint',)), ('__group__', ('processing', 'models')))),
+    )),
+    ('src/gui/raster/qgsmultibandcolorrendererwidget.h', (
+        ('QgsMultiBandColorRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setMapCanvas', 'min', 'max', 'setMin', 'setMax', 'selectedBand', 'contrastEnhancementAlgorithm', 'setContrastEnhancementAlgorithm', 'doComputations', 'minMaxWidget')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/editorwidgets/qgsmultiedittoolbutton.h', (
+        ('QgsMultiEditToolButton', (('__attribute_docs__', (('setFieldValueTriggered', 'Emitted when the "set field value for all features" option is selected.\n'), ('resetFieldValueTriggered', 'Emitted when the "reset to original values" option is selected.\n'))), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsnewauxiliaryfielddialog.h', (
+        ('QgsNewAuxiliaryFieldDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/qgsnewauxiliarylayerdialog.h', (
+        ('QgsNewAuxiliaryLayerDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/qgsnewdatabasetablenamewidget.h', (
+        ('QgsNewDatabaseTableNameWidget', (('__attribute_docs__', (('validationChanged', 'This signal is emitted whenever the validation status of the widget\nchanges.\n\n:param isValid: ``True`` if the current status of the widget is valid\n'), ('schemaNameChanged', 'This signal is emitted when the user selects a schema (or file path for\nfilesystem-based DBs like spatialite or GPKG).\n\n:param schemaName: the name of the selected schema\n'), ('tableNameChanged', 'This signal is emitted when the user enters a table name\n\n:param tableName: the name of the new table\n'), ('providerKeyChanged', 'This signal is emitted when the selects a data provider or a schema name\nthat has a different data provider than the previously selected one.\n\n:param providerKey: the data provider key of the selected schema\n'), ('uriChanged', 'This signal is emitted when the URI of the new table changes, whether or\nnot it is a valid one.\n\n:param uri: URI string representation\n'), ('accepted', 'Emitted when the OK/accept button is clicked.\n'))), ('__overridden_methods__', ('showEvent',)), ('__signal_arguments__', (('validationChanged', ('isValid: bool',)), ('schemaNameChanged', ('schemaName: str',)), ('tableNameChanged', ('tableName: str',)), ('providerKeyChanged', ('providerKey: str',)), ('uriChanged', ('uri: str',)))))),
+    )),
+    ('src/gui/qgsnewhttpconnection.h', (
+        ('QgsNewHttpConnection', (('__virtual_methods__', ('validate', 'wfsSettingsKey', 'wmsSettingsKey')), ('__overridden_methods__', ('accept', 'showEvent')))),
+    )),
+    ('src/gui/qgsnewmemorylayerdialog.h', (
+        ('QgsNewMemoryLayerDialog', ('runAndCreateLayer', ('__overridden_methods__', ('accept',)))),
+    )),
+    ('src/gui/qgsnewnamedialog.h', (
+        ('QgsNewNameDialog', (('__attribute_docs__', (('newNameChanged', 'Emitted when the name is changed in the dialog.\n\n.. versionadded:: 3.2\n'),)), 'exists', 'fullNames', 'matching')),
+    )),
+    ('src/gui/qgsnewvectorlayerdialog.h', (
+        ('QgsNewVectorLayerDialog', ('runAndCreateLayer', 'execAndCreateLayer', ('__overridden_methods__', ('accept',)))),
+    )),
+    ('src/gui/qgsnewvectortabledialog.h', (
+        ('QgsNewVectorTableDialog', (('__overridden_methods__', ('showEvent',)),)),
+    )),
+    ('src/gui/symbology/qgsnullsymbolrendererwidget.h', (
+        ('QgsNullSymbolRendererWidget', ('create', ('__overridden_methods__', ('renderer',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/numericformats/qgsnumericformatguiregistry.h', (
+        ('QgsNumericFormatConfigurationWidgetFactory', (('__abstract_methods__', ('create',)), ('__group__', ('numericformats',)))),
+        ('QgsNumericFormatGuiRegistry', (('__group__', ('numericformats',)),)),
+    )),
+    ('src/gui/numericformats/qgsnumericformatselectorwidget.h', (
+        ('QgsNumericFormatSelectorWidget', (('__attribute_docs__', (('changed', 'Emitted whenever the format configured55 in the widget is changed.\n'),)), ('__group__', ('numericformats',)))),
+        ('QgsNumericFormatSelectorDialog', (('__group__', ('numericformats',)),)),
+    )),
+    ('src/gui/numericformats/qgsnumericformatwidget.h', (
+        ('QgsNumericFormatWidget', (('__attribute_docs__', (('changed', 'Emitted whenever the configuration of the numeric format is changed.\n'),)), ('__abstract_methods__', ('setFormat', 'format')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('numericformats',)))),
+        ('QgsBasicNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsBearingNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsGeographicCoordinateNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsCurrencyNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsPercentageNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsScientificNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsFractionNumericFormatWidget', (('__overridden_methods__', ('setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsExpressionBasedNumericFormatWidget', (('__overridden_methods__', ('createExpressionContext', 'setFormat', 'format')), ('__group__', ('numericformats',)))),
+        ('QgsBearingNumericFormatDialog', (('__group__', ('numericformats',)),)),
+        ('QgsGeographicCoordinateNumericFormatDialog', (('__group__', ('numericformats',)),)),
+    )),
+    ('src/gui/qgsopacitywidget.h', (
+        ('QgsOpacityWidget', (('__attribute_docs__', (('opacityChanged', 'Emitted when the ``opacity`` is changed in the widget, where ``opacity``\nranges from 0.0 (transparent) to 1.0 (opaque).\n\n.. seealso:: :py:func:`setOpacity`\n\n.. seealso:: :py:func:`opacity`\n'),)), ('__signal_arguments__', (('opacityChanged', ('opacity: float',)),)))),
+    )),
+    ('src/gui/qgsoptionsdialogbase.h', (
+        ('QgsOptionsDialogBase', (('__virtual_methods__', ('updateOptionsListVerticalTabs', 'optionsStackedWidget_CurrentChanged', 'optionsStackedWidget_WidgetRemoved', 'updateWindowTitle')), ('__overridden_methods__', ('showEvent', 'paintEvent')))),
+    )),
+    ('src/gui/qgsoptionsdialoghighlightwidget.h', (
+        ('QgsOptionsDialogHighlightWidget', ('createWidget', ('__abstract_methods__', ('searchText', 'highlightText', 'reset')))),
+    )),
+    ('src/gui/qgsoptionsdialoghighlightwidgetsimpl.h', (
+        ('QgsOptionsDialogHighlightLabel', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+        ('QgsOptionsDialogHighlightCheckBox', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+        ('QgsOptionsDialogHighlightButton', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+        ('QgsOptionsDialogHighlightGroupBox', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+        ('QgsOptionsDialogHighlightTree', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+        ('QgsOptionsDialogHighlightTable', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')),)),
+    )),
+    ('src/gui/qgsoptionswidgetfactory.h', (
+        ('QgsOptionsPageWidget', (('__virtual_methods__', ('helpKey', 'isValid', 'cancel')), ('__abstract_methods__', ('apply',)))),
+        ('QgsOptionsWidgetFactory', (('__virtual_methods__', ('icon', 'title', 'key', 'pagePositionHint', 'path')), ('__abstract_methods__', ('createWidget',)))),
+    )),
+    ('src/gui/qgsorderbydialog.h', (
+        ('QgsOrderByDialog', (('__overridden_methods__', ('eventFilter',)),)),
+    )),
+    ('src/gui/attributetable/qgsorganizetablecolumnsdialog.h', (
+        ('QgsOrganizeTableColumnsDialog', (('__group__', ('attributetable',)),)),
+    )),
+    ('src/gui/qgsoverlaywidgetlayout.h', (
+        ('QgsOverlayWidgetLayout', (('__overridden_methods__', ('count', 'addItem', 'itemAt', 'takeAt', 'sizeHint', 'minimumSize', 'setGeometry')),)),
+    )),
+    ('src/gui/qgsowssourceselect.h', (
+        ('QgsOWSSourceSelect', (('__virtual_methods__', ('providerFormats', 'selectedLayersFormats', 'selectedLayersCrses', 'selectedLayersTimes', 'populateLayerList', 'enableLayersForCrs')), ('__overridden_methods__', ('refresh', 'reset', 'setMapCanvas')))),
+    )),
+    ('src/gui/effects/qgspainteffectpropertieswidget.h', (
+        ('QgsPaintEffectPropertiesWidget', (('__attribute_docs__', (('changed', 'Emitted when paint effect properties changes\n'), ('changeEffect', 'Emitted when paint effect type changes\n'))), ('__signal_arguments__', (('changeEffect', ('effect: QgsPaintEffect',)),)), ('__group__', ('effects',)))),
+    )),
+    ('src/gui/effects/qgspainteffectwidget.h', (
+        ('QgsPaintEffectWidget', (('__attribute_docs__', (('changed', 'Emitted when properties of the effect are changed through the widget\n'),)), ('__abstract_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsDrawSourceWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsBlurWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsShadowEffectWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsGlowWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsTransformWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+        ('QgsColorEffectWidget', ('create', ('__overridden_methods__', ('setPaintEffect',)), ('__group__', ('effects',)))),
+    )),
+    ('src/gui/raster/qgspalettedrendererwidget.h', (
+        ('QgsPalettedRendererWidget', ('create', ('__overridden_methods__', ('renderer',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgspanelwidget.h', (
+        ('QgsPanelWidget', (('__attribute_docs__', (('panelAccepted', 'Emitted when the panel is accepted by the user.\n\n:param panel: The panel widget that was accepted.\n\n.. note::\n\n   This argument is normally raised with emit panelAccepted(this)\n   so that callers can retrieve the widget easier in calling code.\n\n.. note::\n\n   this is emitted only when this panel is accepted, and is not emitted for\n   child panels. For example, if this panel opens a second stacked panel, then this panel\n   will not emit panelAccepted when the second panel is accepted.\n'), ('showPanel', 'Emit when you require a panel to be show in the interface.\n\n:param panel: The panel widget to show.\n\n.. note::\n\n   If you are connected to this signal you should also connect\n   given panels showPanel signal as they can be nested.\n'), ('widgetChanged', 'Emitted when the widget state changes. Connect to this to pull any\nchanges off the widget when needed. As panels are non blocking "dialogs"\nyou should listen to this signal to give the user feedback when\nsomething changes.\n'))), 'findParentPanel', ('__virtual_methods__', ('setDockMode', 'applySizeConstraintsToStack', 'menuButtonTooltip', 'menuButtonMenu')), ('__overridden_methods__', ('keyPressEvent',)), ('__signal_arguments__', (('panelAccepted', ('panel: QgsPanelWidget',)), ('showPanel', ('panel: QgsPanelWidget',)))))),
+    )),
+    ('src/gui/qgspanelwidgetstack.h', (
+        ('QgsPanelWidgetStack', (('__overridden_methods__', ('sizeHint', 'minimumSizeHint', 'mouseReleaseEvent', 'keyPressEvent')),)),
+    )),
+    ('src/gui/symbology/qgspenstylecombobox.h', (
+        ('QgsPenStyleComboBox', (('__group__', ('symbology',)),)),
+        ('QgsPenJoinStyleComboBox', (('__group__', ('symbology',)),)),
+        ('QgsPenCapStyleComboBox', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgspercentagewidget.h', (
+        ('QgsPercentageWidget', (('__attribute_docs__', (('valueChanged', 'Emitted when the ``value`` is changed in the widget, where ``value`` is\na factor which ranges from 0.0 to 1.0.\n\n.. seealso:: :py:func:`setValue`\n\n.. seealso:: :py:func:`value`\n'),)), ('__signal_arguments__', (('valueChanged', ('value: float',)),)))),
+    )),
+    ('src/gui/qgspixmaplabel.h', (
+        ('QgsPixmapLabel', (('__overridden_methods__', ('heightForWidth', 'sizeHint', 'resizeEvent')),)),
+    )),
+    ('src/gui/qgsplaybackcontrollerwidget.h', (
+        ('QgsPlaybackControllerWidget', (('__attribute_docs__', (('operationTriggered', 'Emitted when a playback operation is triggered.\n'),)), ('__signal_arguments__', (('operationTriggered', ('operation: Qgis.PlaybackOperation',)),)))),
+    )),
+    ('src/gui/plot/qgsplotcanvas.h', (
+        ('QgsPlotCanvas', (('__attribute_docs__', (('toolChanged', 'Emitted when the plot tool is changed.\n'), ('plotAreaChanged', 'Emitted whenever the visible area of the plot is changed.\n'), ('contextMenuAboutToShow', 'Emitted before the canvas context menu will be shown. Can be used to\nextend the context menu.\n'), ('willBeDeleted', 'Emitted in the destructor when the canvas is about to be deleted, but is\nstill in a perfectly valid state.\n'))), ('__virtual_methods__', ('crs', 'toMapCoordinates', 'toCanvasCoordinates', 'panContentsBy', 'centerPlotOn', 'scalePlot', 'zoomToRect', 'snapToPlot', 'refresh', 'wheelZoom')), ('__overridden_methods__', ('event', 'keyPressEvent', 'keyReleaseEvent', 'mouseDoubleClickEvent', 'mouseMoveEvent', 'mousePressEvent', 'mouseReleaseEvent', 'wheelEvent', 'resizeEvent', 'viewportEvent')), ('__signal_arguments__', (('toolChanged', ('newTool: QgsPlotTool',)), ('contextMenuAboutToShow', ('menu: QMenu', 'event: QgsPlotMouseEvent')))), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplotcanvasitem.h', (
+        ('QgsPlotCanvasItem', (('__abstract_methods__', ('paint',)), ('__overridden_methods__', ('paint',)), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplotmouseevent.h', (
+        ('QgsPlotMouseEvent', (('__group__', ('plot',)),)),
+    )),
+    ('src/gui/plot/qgsplotrubberband.h', (
+        ('QgsPlotRubberBand', (('__abstract_methods__', ('start', 'update', 'finish')), ('__group__', ('plot',)))),
+        ('QgsPlotRectangularRubberBand', (('__overridden_methods__', ('start', 'update', 'finish')), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplottool.h', (
+        ('QgsPlotTool', (('__attribute_docs__', (('activated', 'Emitted when the tool is activated.\n'), ('deactivated', 'Emitted when the tool is deactivated\n'))), 'constrainPointToRect', ('__virtual_methods__', ('flags', 'plotMoveEvent', 'plotDoubleClickEvent', 'plotPressEvent', 'plotReleaseEvent', 'wheelEvent', 'keyPressEvent', 'keyReleaseEvent', 'gestureEvent', 'canvasToolTipEvent', 'activate', 'deactivate', 'populateContextMenuWithEvent')), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplottoolpan.h', (
+        ('QgsPlotToolPan', (('__overridden_methods__', ('flags', 'plotMoveEvent', 'plotPressEvent', 'plotReleaseEvent', 'deactivate')), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplottoolzoom.h', (
+        ('QgsPlotToolZoom', (('__overridden_methods__', ('plotPressEvent', 'plotMoveEvent', 'plotReleaseEvent', 'keyPressEvent', 'keyReleaseEvent', 'deactivate')), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/plot/qgsplottransienttools.h', (
+        ('QgsPlotToolTemporaryKeyPan', (('__overridden_methods__', ('plotMoveEvent', 'keyReleaseEvent', 'activate')), ('__group__', ('plot',)))),
+        ('QgsPlotToolTemporaryMousePan', (('__overridden_methods__', ('plotMoveEvent', 'plotReleaseEvent', 'activate')), ('__group__', ('plot',)))),
+        ('QgsPlotToolTemporaryKeyZoom', (('__overridden_methods__', ('plotReleaseEvent', 'keyPressEvent', 'keyReleaseEvent', 'activate')), ('__group__', ('plot',)))),
+    )),
+    ('src/gui/qgspluginmanagerinterface.h', (
+        ('QgsPluginManagerInterface', (('__abstract_methods__', ('clearPythonPluginMetadata', 'addPluginMetadata', 'reloadModel', 'clearRepositoryList', 'addToRepositoryList', 'showPluginManager', 'pushMessage')),)),
+    )),
+    ('src/gui/qgspointcloudattributecombobox.h', (
+        ('QgsPointCloudAttributeComboBox', (('__attribute_docs__', (('attributeChanged', 'Emitted when the currently selected attribute changes.\n'),)), ('__signal_arguments__', (('attributeChanged', ('name: str',)),)))),
+    )),
+    ('src/gui/qgspointcloudquerybuilder.h', (
+        ('QgsPointCloudQueryBuilder', (('__overridden_methods__', ('showEvent', 'subsetString', 'setSubsetString', 'accept', 'reject')),)),
+    )),
+    ('src/gui/pointcloud/qgspointcloudrendererpropertieswidget.h', (
+        ('QgsPointCloudRendererPropertiesWidget', (('__overridden_methods__', ('syncToLayer', 'setDockMode', 'apply')), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/gui/pointcloud/qgspointcloudrendererwidget.h', (
+        ('QgsPointCloudRendererWidget', (('__virtual_methods__', ('setContext',)), ('__abstract_methods__', ('renderer',)), ('__group__', ('pointcloud',)))),
+    )),
+    ('src/gui/symbology/qgspointclusterrendererwidget.h', (
+        ('QgsPointClusterRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgspointdisplacementrendererwidget.h', (
+        ('QgsPointDisplacementRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'createExpressionContext')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgspresetcolorrampdialog.h', (
+        ('QgsPresetColorRampWidget', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+        ('QgsPresetColorRampDialog', (('__attribute_docs__', (('changed', 'Emitted when the dialog settings change\n'),)),)),
+    )),
+    ('src/gui/qgsprevieweffect.h', (
+        ('QgsPreviewEffect', (('__overridden_methods__', ('draw',)),)),
+    )),
+    ('src/gui/processing/qgsprocessingaggregatewidgets.h', (
+        ('QgsAggregateMappingWidget', (('__attribute_docs__', (('changed', 'Emitted when the aggregates defined in the widget are changed.\n'),)), ('__group__', ('processing',)))),
+        ('QgsAggregateMappingModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'headerData', 'flags', 'setData')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingalgorithmconfigurationwidget.h', (
+        ('QgsProcessingAlgorithmConfigurationWidget', (('__virtual_methods__', ('setWidgetContext',)), ('__abstract_methods__', ('configuration', 'setConfiguration')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('processing',)))),
+        ('QgsProcessingAlgorithmConfigurationWidgetFactory', (('__abstract_methods__', ('create', 'canCreateFor')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingalgorithmdialogbase.h', (
+        ('QgsProcessingAlgorithmDialogBase', (('__attribute_docs__', (('algorithmAboutToRun', 'Emitted when the algorithm is about to run in the specified ``context``.\n\nThis signal can be used to tweak the ``context`` prior to the algorithm\nexecution.\n\n.. versionadded:: 3.38\n'), ('algorithmFinished', 'Emitted whenever an algorithm has finished executing in the dialog.\n\n.. versionadded:: 3.14\n'))), 'formatStringForLog', ('__virtual_methods__', ('setParameters', 'resetAdditionalGui', 'blockAdditionalControlsWhileRunning', 'isFinalized', 'finished', 'runAlgorithm', 'algExecuted')), ('__overridden_methods__', ('reject', 'closeEvent')), ('__signal_arguments__', (('algorithmAboutToRun', ('context: QgsProcessingContext',)), ('algorithmFinished', ('successful: bool', 'result: Dict[str, object]')))), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingbatchalgorithmdialogbase.h', (
+        ('QgsProcessingBatchAlgorithmDialogBase', (('__abstract_methods__', ('runAsSingle', 'createContext', 'handleAlgorithmResults', 'loadHtmlResults', 'createSummaryTable')), ('__overridden_methods__', ('resetAdditionalGui', 'blockAdditionalControlsWhileRunning', 'algExecuted', 'isFinalized')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingfavoritealgorithmmanager.h', (
+        ('QgsProcessingFavoriteAlgorithmManager', (('__attribute_docs__', (('changed', 'Emitted when the list of favorite algorithms is changed, e.g. when a new\nalgorithm ID is added to the list or an existing algorithm ID is removed\nfrom the list.\n'),)), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingguiregistry.h', (
+        ('QgsProcessingGuiRegistry', (('__group__', ('processing',)),)),
+    )),
+    ('src/gui/processing/qgsprocessingguiutils.h', (
+        ('QgsProcessingGuiUtils', ('configureResultLayerTreeLayer', 'layerTreeResultsGroup', 'addResultLayers', ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessinghistoryprovider.h', (
+        ('QgsProcessingHistoryProvider', (('__attribute_docs__', (('executePython', 'Emitted when the provider needs to execute python ``commands`` in the\nProcessing context.\n\n.. versionadded:: 3.32\n'), ('createTest', 'Emitted when the provider needs to create a Processing test with the\ngiven python ``command``.\n\n.. versionadded:: 3.32\n'))), ('__overridden_methods__', ('id', 'createNodeForEntry', 'updateNodeForEntry')), ('__signal_arguments__', (('executePython', ('commands: str',)), ('createTest', ('command: str',)))), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessinghistorywidget.h', (
+        ('QgsProcessingHistoryWidget', (('__group__', ('processing',)),)),
+        ('QgsProcessingHistoryDialog', (('__group__', ('processing',)),)),
+    )),
+    ('src/gui/processing/qgsprocessingmaplayercombobox.h', (
+        ('QgsProcessingMapLayerComboBox', (('__attribute_docs__', (('valueChanged', 'Emitted whenever the value is changed in the widget.\n'),)), ('__overridden_methods__', ('dragEnterEvent', 'dragLeaveEvent', 'dropEvent')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingmodelerparameterwidget.h', (
+        ('QgsProcessingModelerParameterWidget', (('__virtual_methods__', ('value',)), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingmultipleselectiondialog.h', (
+        ('QgsProcessingMultipleSelectionPanelWidget', (('__attribute_docs__', (('acceptClicked', 'Emitted when the accept button is clicked.\n'), ('selectionChanged', 'Emitted when the selection changes in the widget.\n'))), ('__overridden_methods__', ('dragEnterEvent', 'dropEvent')), ('__group__', ('processing',)))),
+        ('QgsProcessingMultipleInputPanelWidget', (('__overridden_methods__', ('dragEnterEvent', 'dropEvent')), ('__group__', ('processing',)))),
+        ('QgsProcessingMultipleSelectionDialog', (('__group__', ('processing',)),)),
+        ('QgsProcessingMultipleInputDialog', (('__group__', ('processing',)),)),
+    )),
+    ('src/gui/processing/qgsprocessingoutputdestinationwidget.h', (
+        ('QgsProcessingLayerOutputDestinationWidget', (('__attribute_docs__', (('skipOutputChanged', 'Emitted whenever the "skip output" option is toggled in the widget.\n'), ('destinationChanged', 'Emitted whenever the destination value is changed in the widget.\n'))), ('__overridden_methods__', ('dragEnterEvent', 'dragLeaveEvent', 'dropEvent')), ('__signal_arguments__', (('skipOutputChanged', ('skipped: bool',)),)), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingparameterdefinitionwidget.h', (
+        ('QgsProcessingAbstractParameterDefinitionWidget', (('__virtual_methods__', ('setWidgetContext',)), ('__abstract_methods__', ('createParameter',)), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDefinitionDialog', (('__overridden_methods__', ('accept',)), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterDefinitionWidget', (('__group__', ('processing',)),)),
+    )),
+    ('src/gui/processing/qgsprocessingparameterswidget.h', (
+        ('QgsProcessingParametersWidget', (('__virtual_methods__', ('initWidgets',)), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingrecentalgorithmlog.h', (
+        ('QgsProcessingRecentAlgorithmLog', (('__attribute_docs__', (('changed', 'Emitted when the list of recently used algorithms is changed, e.g. when\na new algorithm ID is pushed to the list (see\n:py:func:`~QgsProcessingRecentAlgorithmLog.push`).\n'),)), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingtoolboxmodel.h', (
+        ('QgsProcessingToolboxModel', (('__attribute_docs__', (('recentAlgorithmAdded', 'Emitted whenever recent algorithms are added to the model.\n'), ('favoriteAlgorithmAdded', 'Emitted whenever favorite algorithms are added to the model.\n'))), ('__overridden_methods__', ('flags', 'data', 'rowCount', 'columnCount', 'index', 'parent', 'mimeData')), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelNode', (('__abstract_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelRecentNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelFavoriteNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelParameterGroupNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelProviderNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelGroupNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelAlgorithmNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxModelParameterNode', (('__overridden_methods__', ('nodeType',)), ('__group__', ('processing',)))),
+        ('QgsProcessingToolboxProxyModel', (('__overridden_methods__', ('filterAcceptsRow', 'lessThan', 'data')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingtoolboxtreeview.h', (
+        ('QgsProcessingToolboxTreeView', (('__overridden_methods__', ('reset', 'keyPressEvent')), ('__group__', ('processing',)))),
+    )),
+    ('src/gui/processing/qgsprocessingwidgetwrapper.h', (
+        ('QgsAbstractProcessingParameterWidgetWrapper', (('__attribute_docs__', (('widgetValueHasChanged', 'Emitted whenever the parameter value (as defined by the wrapped widget)\nis changed.\n'),)), ('__virtual_methods__', ('setWidgetContext', 'customProperties', 'registerProcessingContextGenerator', 'postInitialize', 'stretch', 'setDialog', 'createLabel')), ('__abstract_methods__', ('createWidget', 'setWidgetValue', 'widgetValue')), ('__overridden_methods__', ('createExpressionContext',)), ('__signal_arguments__', (('widgetValueHasChanged', ('wrapper: QgsAbstractProcessingParameterWidgetWrapper',)),)), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterWidgetFactoryInterface', (('__virtual_methods__', ('createModelerWidgetWrapper', 'createParameterDefinitionWidget', 'compatibleParameterTypes', 'compatibleOutputTypes', 'compatibleDataTypes', 'modelerExpressionFormatString', 'defaultModelSource')), ('__abstract_methods__', ('parameterType', 'createWidgetWrapper')), ('__group__', ('processing',)))),
+        ('QgsProcessingContextGenerator', (('__abstract_methods__', ('processingContext',)), ('__group__', ('processing',)))),
+        ('QgsProcessingParametersGenerator', (('__abstract_methods__', ('createProcessingParameters',)), ('__group__', ('processing',)))),
+        ('QgsProcessingHiddenWidgetWrapper', (('__overridden_methods__', ('setWidgetValue', 'widgetValue', 'linkedVectorLayer', 'createWidget', 'createLabel')), ('__group__', ('processing',)))),
+        ('QgsProcessingParameterWidgetContext', (('__group__', ('processing',)),)),
+    )),
+    ('src/gui/proj/qgsprojectionselectiondialog.h', (
+        ('QgsCrsSelectionWidget', (('__attribute_docs__', (('crsChanged', 'Emitted when the CRS defined in the widget is changed.\n'), ('crsDoubleClicked', 'Emitted when a CRS entry in the widget is double-clicked.\n'), ('hasValidSelectionChanged', 'Emitted when the widget has a valid selection or not.\n'))), ('__signal_arguments__', (('crsDoubleClicked', ('crs: QgsCoordinateReferenceSystem',)), ('hasValidSelectionChanged', ('isValid: bool',)))), ('__group__', ('proj',)))),
+        ('QgsProjectionSelectionDialog', (('__group__', ('proj',)),)),
+    )),
+    ('src/gui/proj/qgsprojectionselectiontreewidget.h', (
+        ('QgsProjectionSelectionTreeWidget', (('__attribute_docs__', (('crsSelected', 'Emitted when a projection is selected in the widget.\n'), ('initialized', 'Notifies others that the widget is now fully initialized, including\ndeferred selection of projection.\n\n.. deprecated:: 3.40\n\n   No longer emitted.\n'), ('projectionDoubleClicked', 'Emitted when a projection is double clicked in the list.\n'), ('hasValidSelectionChanged', 'Emitted when the selection in the tree is changed from a valid selection\nto an invalid selection, or vice-versa.\n\n.. versionadded:: 3.18\n'))), ('__overridden_methods__', ('resizeEvent', 'eventFilter')), ('__signal_arguments__', (('hasValidSelectionChanged', ('isValid: bool',)),)), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/proj/qgsprojectionselectionwidget.h', (
+        ('QgsProjectionSelectionWidget', (('__attribute_docs__', (('crsChanged', 'Emitted when the selected CRS is changed\n'), ('cleared', 'Emitted when the not set option is selected.\n'))), ('__overridden_methods__', ('dragEnterEvent', 'dragLeaveEvent', 'dropEvent')), ('__signal_arguments__', (('crsChanged', ('crs: QgsCoordinateReferenceSystem',)),)), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/qgsprojectstorageguiprovider.h', (
+        ('QgsProjectStorageGuiProvider', (('__virtual_methods__', ('visibleName', 'showLoadGui', 'showSaveGui')), ('__abstract_methods__', ('type',)))),
+    )),
+    ('src/gui/qgspropertyassistantwidget.h', (
+        ('QgsPropertyAssistantWidget', (('__overridden_methods__', ('setDockMode',)),)),
+    )),
+    ('src/gui/qgspropertyoverridebutton.h', (
+        ('QgsPropertyOverrideButton', (('__attribute_docs__', (('changed', 'Emitted when property definition changes\n'), ('activated', 'Emitted when the activated status of the widget changes\n'), ('createAuxiliaryField', 'Emitted when creating a new auxiliary field\n'))), ('__overridden_methods__', ('mouseReleaseEvent',)), ('__signal_arguments__', (('activated', ('isActive: bool',)),)))),
+    )),
+    ('src/gui/qgsproviderconnectioncombobox.h', (
+        ('QgsProviderConnectionComboBox', (('__attribute_docs__', (('connectionChanged', 'Emitted whenever the currently selected connection changes.\n'),)), ('__signal_arguments__', (('connectionChanged', ('connection: str',)),)))),
+    )),
+    ('src/gui/qgsproviderguimetadata.h', (
+        ('QgsProviderGuiMetadata', (('__virtual_methods__', ('registerGui', 'dataItemGuiProviders', 'projectStorageGuiProviders', 'sourceSelectProviders', 'subsetStringEditorProviders', 'sourceWidgetProviders', 'mapLayerConfigWidgetFactories')),)),
+    )),
+    ('src/gui/qgsproviderguiregistry.h', (
+        ('QgsProviderGuiRegistry', (('__virtual_methods__', ('sourceSelectProviders', 'projectStorageGuiProviders', 'subsetStringEditorProviders', 'sourceWidgetProviders', 'mapLayerConfigWidgetFactories')),)),
+    )),
+    ('src/gui/qgsprovidersourcewidget.h', (
+        ('QgsProviderSourceWidget', (('__attribute_docs__', (('validChanged', 'Emitted whenever the validation status of the widget changes.\n\nIf ``isValid`` is ``False`` then the widget is not valid, and any dialog\nusing the widget should be prevented from being accepted.\n'), ('changed', 'Emitted whenever the configuration of the widget changes.\n\n.. versionadded:: 3.30\n'))), ('__virtual_methods__', ('groupTitle', 'setMapCanvas', 'mapCanvas')), ('__abstract_methods__', ('setSourceUri', 'sourceUri')), ('__signal_arguments__', (('validChanged', ('isValid: bool',)),)))),
+    )),
+    ('src/gui/qgsprovidersourcewidgetprovider.h', (
+        ('QgsProviderSourceWidgetProvider', (('__virtual_methods__', ('name',)), ('__abstract_methods__', ('providerKey', 'canHandleLayer', 'createWidget')))),
+    )),
+    ('src/gui/qgsprovidersublayersdialog.h', (
+        ('QgsProviderSublayersDialog', (('__attribute_docs__', (('layersAdded', 'Emitted when sublayers selected from the dialog should be added to the\nproject.\n'),)), ('__signal_arguments__', (('layersAdded', ('layers: List[QgsProviderSublayerDetails]',)),)))),
+        ('QgsProviderSublayerDialogModel', (('__overridden_methods__', ('data', 'flags')),)),
+    )),
+    ('src/gui/editorwidgets/qgsqmlwidgetwrapper.h', (
+        ('QgsQmlWidgetWrapper', (('__overridden_methods__', ('valid', 'createWidget', 'initWidget', 'setFeature')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsquerybuilder.h', (
+        ('QgsQueryBuilder', ('saveQueryToFile', 'loadQueryFromFile', ('__virtual_methods__', ('test',)), ('__overridden_methods__', ('showEvent', 'subsetString', 'setSubsetString', 'accept', 'reject')))),
+    )),
+    ('src/gui/qgsqueryresultwidget.h', (
+        ('QgsQueryResultWidget', (('__attribute_docs__', (('createSqlVectorLayer', 'Emitted when a new vector SQL (query) layer must be created.\n\n:param providerKey: name of the data provider\n:param connectionUri: the connection URI as returned by\n                      :py:func:`QgsAbstractProviderConnection.uri()`\n:param options: \n'), ('firstResultBatchFetched', 'Emitted when the first batch of results has been fetched.\n\n.. note::\n\n   If the query returns no results this signal is not emitted.\n'))), ('__signal_arguments__', (('createSqlVectorLayer', ('providerKey: str', 'connectionUri: str', 'options: QgsAbstractDatabaseProviderConnection.SqlVectorLayerOptions')),)))),
+        ('QgsQueryResultDialog', (('__overridden_methods__', ('closeEvent',)),)),
+        ('QgsQueryResultMainWindow', (('__overridden_methods__', ('closeEvent',)),)),
+    )),
+    ('src/gui/qgsrangeslider.h', (
+        ('QgsRangeSlider', (('__attribute_docs__', (('rangeChanged', 'Emitted when the range selected in the widget is changed.\n'), ('rangeLimitsChanged', 'Emitted when the limits of values allowed in the widget is changed.\n'), ('fixedRangeSizeChanged', "Emitted when the widget's fixed range size is changed.\n\n.. seealso:: :py:func:`fixedRangeSize`\n\n.. seealso:: :py:func:`setFixedRangeSize`\n\n.. versionadded:: 3.38\n"))), ('__overridden_methods__', ('paintEvent', 'mousePressEvent', 'mouseMoveEvent', 'mouseReleaseEvent', 'keyPressEvent', 'sizeHint', 'minimumSizeHint', 'event')), ('__signal_arguments__', (('rangeChanged', ('minimum: int', 'maximum: int')), ('rangeLimitsChanged', ('minimum: int', 'maximum: int')), ('fixedRangeSizeChanged', ('size: int',)))))),
+    )),
+    ('src/gui/raster/qgsrasterattributetabledialog.h', (
+        ('QgsRasterAttributeTableDialog', (('__overridden_methods__', ('reject',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrasterattributetablemodel.h', (
+        ('QgsRasterAttributeTableModel', (('__overridden_methods__', ('rowCount', 'columnCount', 'data', 'setData', 'headerData', 'flags')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrasterattributetablewidget.h', (
+        ('QgsRasterAttributeTableWidget', (('__attribute_docs__', (('rendererChanged', 'This signal is emitted after a successful classify operation which\nchanged the raster renderer.\n'),)), ('__overridden_methods__', ('setDockMode',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrasterbandcombobox.h', (
+        ('QgsRasterBandComboBox', (('__attribute_docs__', (('bandChanged', 'Emitted when the currently selected band changes.\n'),)), 'displayBandName', ('__signal_arguments__', (('bandChanged', ('band: int',)),)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrastercontourrendererwidget.h', (
+        ('QgsRasterContourRendererWidget', ('create', ('__overridden_methods__', ('renderer',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgsrasterformatsaveoptionswidget.h', (
+        ('QgsRasterFormatSaveOptionsWidget', (('__attribute_docs__', (('optionsChanged', 'Emitted when the options configured in the widget are changed.\n'),)), ('__overridden_methods__', ('showEvent', 'eventFilter')))),
+    )),
+    ('src/gui/raster/qgsrasterhistogramwidget.h', (
+        ('QgsRasterHistogramWidget', (('__overridden_methods__', ('apply',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrasterlayerproperties.h', (
+        ('QgsRasterLayerProperties', (('__virtual_methods__', ('addPropertiesPageFactory', 'optionsStackedWidget_CurrentChanged', 'apply', 'rollback')), ('__overridden_methods__', ('createExpressionContext', 'eventFilter')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgsrasterlayersaveasdialog.h', (
+        ('QgsRasterLayerSaveAsDialog', (('__overridden_methods__', ('accept',)),)),
+    )),
+    ('src/gui/raster/qgsrasterlayertemporalpropertieswidget.h', (
+        ('QgsRasterLayerTemporalPropertiesWidget', (('__group__', ('raster',)),)),
+    )),
+    ('src/gui/raster/qgsrasterminmaxwidget.h', (
+        ('QgsRasterMinMaxWidget', (('__attribute_docs__', (('widgetChanged', 'Emitted when something on the widget has changed. All widgets will fire\nthis event to notify of an internal change.\n'), ('load', 'signal emitted when new min/max values are computed from statistics.\n'))), ('__signal_arguments__', (('load', ('bandNo: int', 'min: float', 'max: float')),)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgsrasterpyramidsoptionswidget.h', (
+        ('QgsRasterPyramidsOptionsWidget', (('__attribute_docs__', (('overviewListChanged', 'Emitted when the list of configured overviews is changed.\n'), ('someValueChanged', 'Emitted when settings are changed in the widget.\n'))),)),
+    )),
+    ('src/gui/raster/qgsrasterrendererwidget.h', (
+        ('QgsRasterRendererWidget', (('__attribute_docs__', (('widgetChanged', 'Emitted when something on the widget has changed. All widgets will fire\nthis event to notify of an internal change.\n'),)), ('__virtual_methods__', ('setMapCanvas', 'min', 'max', 'setMin', 'setMax', 'stdDev', 'setStdDev', 'selectedBand', 'doComputations', 'minMaxWidget', 'contrastEnhancementAlgorithm', 'setContrastEnhancementAlgorithm')), ('__abstract_methods__', ('renderer',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgsrastertransparencywidget.h', (
+        ('QgsRasterTransparencyWidget', (('__overridden_methods__', ('createExpressionContext', 'apply')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/qgsratiolockbutton.h', (
+        ('QgsRatioLockButton', (('__attribute_docs__', (('lockChanged', 'Emitted whenever the lock state changes.\n'),)), ('__overridden_methods__', ('changeEvent', 'showEvent', 'resizeEvent')), ('__signal_arguments__', (('lockChanged', ('locked: bool',)),)))),
+    )),
+    ('src/gui/proj/qgsrecentcoordinatereferencesystemsmodel.h', (
+        ('QgsRecentCoordinateReferenceSystemsModel', (('__overridden_methods__', ('flags', 'data', 'rowCount', 'columnCount', 'index', 'parent')), ('__group__', ('proj',)))),
+        ('QgsRecentCoordinateReferenceSystemsProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)), ('__group__', ('proj',)))),
+    )),
+    ('src/gui/editorwidgets/qgsrelationaggregatesearchwidgetwrapper.h', (
+        ('QgsRelationAggregateSearchWidgetWrapper', (('__overridden_methods__', ('expression', 'valid', 'createWidget', 'applyDirectly', 'setExpression', 'eventFilter')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsrelationeditorwidget.h', (
+        ('QgsRelationEditorWidget', (('__overridden_methods__', ('setEditorContext', 'config', 'setConfig', 'parentFormValueChanged', 'updateUi', 'beforeSetRelationFeature', 'afterSetRelationFeature', 'beforeSetRelations', 'afterSetRelations')),)),
+        ('QgsRelationEditorConfigWidget', (('__overridden_methods__', ('config', 'setConfig')),)),
+    )),
+    ('src/gui/editorwidgets/qgsrelationreferencesearchwidgetwrapper.h', (
+        ('QgsRelationReferenceSearchWidgetWrapper', (('__overridden_methods__', ('applyDirectly', 'expression', 'valid', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'createWidget', 'initWidget', 'setExpression')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsrelationreferencewidget.h', (
+        ('QgsRelationReferenceWidget', (('__attribute_docs__', (('foreignKeyChanged', 'Emitted when the foreign key changed\n\n.. deprecated:: 3.10\n'), ('foreignKeysChanged', 'Emitted when the foreign keys changed\n\n.. versionadded:: 3.10\n'))), ('__overridden_methods__', ('showEvent',)), ('__signal_arguments__', (('foreignKeysChanged', ('keys: List[object]',)),)), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsrelationreferencewidgetwrapper.h', (
+        ('QgsRelationReferenceWidgetWrapper', (('__overridden_methods__', ('createWidget', 'initWidget', 'value', 'valid', 'showIndeterminateState', 'additionalFieldValues', 'additionalFields', 'setEnabled', 'parentFormValueChanged', 'updateConstraintWidgetStatus')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsrelationwidgetwrapper.h', (
+        ('QgsRelationWidgetWrapper', (('__attribute_docs__', (('relatedFeaturesChanged', 'Emit this signal, whenever the related features changed. This happens\nfor example when related features are added, removed, linked or\nunlinked.\n\n.. versionadded:: 3.22\n'),)), ('__overridden_methods__', ('createWidget', 'initWidget', 'valid', 'setFeature')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/symbology/qgsrendererpropertiesdialog.h', (
+        ('QgsRendererPropertiesDialog', (('__attribute_docs__', (('layerVariablesChanged', 'Emitted when expression context variables on the associated vector\nlayers have been changed. Will request the parent dialog to\nre-synchronize with the variables.\n'), ('widgetChanged', 'Emitted when something on the widget has changed. All widgets will fire\nthis event to notify of an internal change.\n'), ('showPanel', 'Emit when you require a panel to be show in the interface.\n\n:param panel: The panel widget to show.\n\n.. note::\n\n   If you are connected to this signal you should also connect\n   given panels showPanel signal as they can be nested.\n'))), ('__overridden_methods__', ('keyPressEvent',)), ('__signal_arguments__', (('showPanel', ('panel: QgsPanelWidget',)),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/raster/qgsrendererrasterpropertieswidget.h', (
+        ('QgsRendererRasterPropertiesWidget', (('__overridden_methods__', ('apply',)), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/symbology/qgsrendererwidget.h', (
+        ('QgsRendererWidget', (('__attribute_docs__', (('layerVariablesChanged', 'Emitted when expression context variables on the associated vector\nlayers have been changed. Will request the parent dialog to\nre-synchronize with the variables.\n'), ('symbolLevelsChanged', 'Emitted when the symbol levels settings have been changed.\n\n.. deprecated:: 3.20\n\n   No longer emitted.\n'))), ('__virtual_methods__', ('setContext', 'selectedSymbols', 'refreshSymbolView', 'setSymbolLevels', 'copy', 'paste', 'pasteSymbolToSelection', 'apply')), ('__abstract_methods__', ('renderer',)), ('__overridden_methods__', ('createExpressionContext', 'setDockMode')), ('__group__', ('symbology',)))),
+        ('QgsDataDefinedValueDialog', (('__abstract_methods__', ('symbolDataDefined', 'value', 'setDataDefined')), ('__group__', ('symbology',)))),
+        ('QgsDataDefinedSizeDialog', (('__overridden_methods__', ('symbolDataDefined', 'value', 'setDataDefined')), ('__group__', ('symbology',)))),
+        ('QgsDataDefinedRotationDialog', (('__overridden_methods__', ('symbolDataDefined', 'value', 'setDataDefined')), ('__group__', ('symbology',)))),
+        ('QgsDataDefinedWidthDialog', (('__overridden_methods__', ('symbolDataDefined', 'value', 'setDataDefined')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsrichtexteditor.h', (
+        ('QgsRichTextEditor', (('__attribute_docs__', (('textChanged', 'Emitted when the text contents are changed.\n\n.. versionadded:: 3.26\n'),)), ('__overridden_methods__', ('focusInEvent',)))),
+    )),
+    ('src/gui/qgsrubberband.h', (
+        ('QgsRubberBand', (('__overridden_methods__', ('updatePosition', 'paint')),)),
+    )),
+    ('src/gui/symbology/qgsrulebasedrendererwidget.h', (
+        ('QgsRuleBasedRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setDockMode', 'setSymbolLevels', 'selectedSymbols', 'refreshSymbolView', 'keyPressEvent', 'copy', 'paste', 'pasteSymbolToSelection')), ('__group__', ('symbology',)))),
+        ('QgsRuleBasedRendererModel', (('__overridden_methods__', ('flags', 'data', 'headerData', 'rowCount', 'columnCount', 'index', 'parent', 'setData', 'supportedDropActions', 'mimeTypes', 'mimeData', 'dropMimeData', 'removeRows')), ('__group__', ('symbology',)))),
+        ('QgsRendererRulePropsWidget', (('__overridden_methods__', ('setDockMode',)), ('__group__', ('symbology',)))),
+        ('QgsRendererRulePropsDialog', (('__overridden_methods__', ('accept',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsscalecombobox.h', (
+        ('QgsScaleComboBox', (('__attribute_docs__', (('scaleChanged', 'Emitted when *user* has finished editing/selecting a new scale. The\n``scale`` value indicates the scale denominator, e.g. 1000.0 for a\n1:1000 map.\n'),)), 'toString', 'toDouble', ('__overridden_methods__', ('showPopup',)), ('__signal_arguments__', (('scaleChanged', ('scale: float',)),)))),
+    )),
+    ('src/gui/qgsscalemethodwidget.h', (
+        ('QgsScaleMethodWidget', (('__attribute_docs__', (('methodChanged', 'Emitted when the selected method is changed.\n'),)),)),
+    )),
+    ('src/gui/qgsscalerangewidget.h', (
+        ('QgsScaleRangeWidget', (('__attribute_docs__', (('rangeChanged', 'Emitted when the scale range set in the widget is changed. The scale\nvalues indicates the scale denominator, e.g. 1000.0 for a 1:1000 map, or\n0 to indicate not set.\n'),)), ('__signal_arguments__', (('rangeChanged', ('min: float', 'max: float')),)))),
+    )),
+    ('src/gui/qgsscalewidget.h', (
+        ('QgsScaleWidget', (('__attribute_docs__', (('scaleChanged', 'Emitted when *user* has finished editing/selecting a new scale. The\n``scale`` value indicates the scale denominator, e.g. 1000.0 for a\n1:1000 map.\n'),)), 'toString', 'toDouble', ('__signal_arguments__', (('scaleChanged', ('scale: float',)),)))),
+    )),
+    ('src/gui/qgsscreenhelper.h', (
+        ('QgsScreenHelper', (('__attribute_docs__', (('screenDpiChanged', 'Emitted whenever the screen ``dpi`` associated with the widget is\nchanged.\n\n.. seealso:: :py:func:`screenDpi`\n'), ('availableGeometryChanged', 'Emitted whenever the available geometry of the screen associated with\nthe widget is changed.\n\n.. seealso:: :py:func:`availableGeometry`\n'))), ('__overridden_methods__', ('eventFilter',)), ('__signal_arguments__', (('screenDpiChanged', ('dpi: float',)), ('availableGeometryChanged', ('geometry: QRect',)))))),
+    )),
+    ('src/gui/qgsscrollarea.h', (
+        ('QgsScrollArea', (('__overridden_methods__', ('wheelEvent', 'resizeEvent')),)),
+    )),
+    ('src/gui/editorwidgets/qgssearchwidgettoolbutton.h', (
+        ('QgsSearchWidgetToolButton', (('__attribute_docs__', (('activeFlagsChanged', 'Emitted when the active flags selected in the widget is changed\n\n:param flags: active flags\n'),)), ('__signal_arguments__', (('activeFlagsChanged', ('flags: QgsSearchWidgetWrapper.FilterFlags',)),)), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/core/qgssearchwidgetwrapper.h', (
+        ('QgsSearchWidgetWrapper', (('__attribute_docs__', (('expressionChanged', 'Emitted whenever the expression changes\n\n:param exp: The new search expression\n'), ('valueChanged', 'Emitted when a user changes the value of the search widget.\n'), ('valueCleared', 'Emitted when a user changes the value of the search widget back to an\nempty, default state.\n'))), 'exclusiveFilterFlags', 'nonExclusiveFilterFlags', 'toString', ('__virtual_methods__', ('supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget')), ('__abstract_methods__', ('expression', 'applyDirectly', 'setExpression')), ('__overridden_methods__', ('setEnabled', 'setFeature')), ('__signal_arguments__', (('expressionChanged', ('exp: str',)),)), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/sensor/qgssensorguiregistry.h', (
+        ('QgsSensorGuiRegistry', (('__attribute_docs__', (('sensorAdded', 'Emitted whenever a new sensor type is added to the registry, with the\nspecified ``type``.\n'),)), ('__signal_arguments__', (('sensorAdded', ('type: str', 'name: str')),)), ('__group__', ('sensor',)))),
+        ('QgsSensorAbstractGuiMetadata', (('__virtual_methods__', ('creationIcon', 'createSensorWidget', 'createSensor')), ('__group__', ('sensor',)))),
+    )),
+    ('src/gui/sensor/qgssensorwidget.h', (
+        ('QgsAbstractSensorWidget', (('__attribute_docs__', (('changed', 'Emitted whenever configuration changes happened on this sensor\nconfiguration.\n'),)), ('__abstract_methods__', ('createSensor', 'updateSensor', 'setSensor')), ('__group__', ('sensor',)))),
+    )),
+    ('src/gui/settings/qgssettingseditorwidgetregistry.h', (
+        ('QgsSettingsEditorWidgetRegistry', (('__group__', ('settings',)),)),
+    )),
+    ('src/gui/settings/qgssettingseditorwidgetwrapper.h', (
+        ('QgsSettingsEditorWidgetWrapper', ('fromWidget', ('__abstract_methods__', ('id', 'createWrapper', 'setWidgetFromSetting', 'setSettingFromWidget', 'variantValueFromWidget', 'setWidgetFromVariant', 'createEditorPrivate', 'configureEditorPrivate', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+    )),
+    ('src/gui/settings/qgssettingseditorwidgetwrapperimpl.h', (
+        ('QgsSettingsEditorWidgetWrapperTemplate', (('__virtual_methods__', ('configureEditorPrivateImplementation',)), ('__abstract_methods__', ('id', 'setSettingFromWidget', 'setWidgetValue', 'valueFromWidget', 'createWrapper')), ('__overridden_methods__', ('id', 'setWidgetFromSetting', 'setSettingFromWidget', 'setWidgetFromVariant', 'variantValueFromWidget', 'createWrapper', 'createEditorPrivate', 'configureEditorPrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsStringLineEditWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsStringComboBoxWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsBoolCheckBoxWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsIntegerSpinBoxWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsDoubleSpinBoxWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+        ('QgsSettingsColorButtonWrapper', (('__overridden_methods__', ('createWrapper', 'id', 'setSettingFromWidget', 'valueFromWidget', 'setWidgetValue', 'configureEditorPrivateImplementation', 'enableAutomaticUpdatePrivate')), ('__group__', ('settings',)))),
+    )),
+    ('src/gui/settings/qgssettingsregistrygui.h', (
+        ('QgsSettingsRegistryGui', (('__group__', ('settings',)),)),
+    )),
+    ('src/gui/settings/qgssettingstreemodel.h', (
+        ('QgsSettingsTreeModel', (('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data', 'headerData', 'flags', 'setData')), ('__group__', ('settings',)))),
+        ('QgsSettingsTreeProxyModel', (('__overridden_methods__', ('filterAcceptsRow',)), ('__group__', ('settings',)))),
+    )),
+    ('src/gui/settings/qgssettingstreewidget.h', (
+        ('QgsSettingsTreeWidget', (('__overridden_methods__', ('searchText', 'highlightText', 'reset')), ('__group__', ('settings',)))),
+    )),
+    ('src/gui/raster/qgssinglebandgrayrendererwidget.h', (
+        ('QgsSingleBandGrayRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setMapCanvas', 'min', 'max', 'setMin', 'setMax', 'selectedBand', 'contrastEnhancementAlgorithm', 'setContrastEnhancementAlgorithm', 'doComputations', 'minMaxWidget')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/raster/qgssinglebandpseudocolorrendererwidget.h', (
+        ('QgsSingleBandPseudoColorRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setMapCanvas', 'doComputations', 'minMaxWidget', 'min', 'max', 'setMin', 'setMax', 'selectedBand')), ('__group__', ('raster',)))),
+    )),
+    ('src/gui/symbology/qgssinglesymbolrendererwidget.h', (
+        ('QgsSingleSymbolRendererWidget', ('create', ('__overridden_methods__', ('renderer', 'setContext', 'setDockMode', 'setSymbolLevels')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsslider.h', (
+        ('QgsSlider', (('__overridden_methods__', ('paintEvent',)), ('__signal_arguments__', (('valueChanged', (': object',)),)))),
+    )),
+    ('src/gui/symbology/qgssmartgroupeditordialog.h', (
+        ('QgsSmartGroupCondition', (('__attribute_docs__', (('removed', 'Emitted when the group with the specified ``id`` is removed.\n'),)), ('__signal_arguments__', (('removed', ('id: int',)),)), ('__group__', ('symbology',)))),
+        ('QgsSmartGroupEditorDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgssnaptogridcanvasitem.h', (
+        ('QgsSnapToGridCanvasItem', (('__overridden_methods__', ('paint',)),)),
+    )),
+    ('src/gui/qgssourceselectprovider.h', (
+        ('QgsSourceSelectProvider', (('__virtual_methods__', ('name', 'toolTip', 'ordering', 'capabilities')), ('__abstract_methods__', ('providerKey', 'text', 'icon', 'createDataSourceWidget')))),
+    )),
+    ('src/gui/qgssourceselectproviderregistry.h', (
+        ('QgsSourceSelectProviderRegistry', (('__attribute_docs__', (('providerAdded', 'Emitted whenever a provider is added to the registry.\n\n.. versionadded:: 3.30\n'), ('providerRemoved', 'Emitted whenever a provider is removed from the registry.\n\n.. versionadded:: 3.30\n'))), ('__signal_arguments__', (('providerAdded', ('name: str',)), ('providerRemoved', ('name: str',)))))),
+    )),
+    ('src/gui/editorwidgets/qgsspacerwidgetwrapper.h', (
+        ('QgsSpacerWidgetWrapper', (('__overridden_methods__', ('valid', 'createWidget', 'setFeature')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsspinbox.h', (
+        ('QgsSpinBox', (('__attribute_docs__', (('returnPressed', 'Emitted when the Return or Enter key is used in the line edit\n\n.. versionadded:: 3.40\n'), ('textEdited', 'Emitted when the the value has been manually edited via line edit.\n\n.. versionadded:: 3.40\n'), ('editingTimeout', 'Emitted when either:\n\n1. 1 second has elapsed since the last value change in the widget (eg last key press or scroll wheel event)\n2. or, immediately after the widget has lost focus after its value was changed.\n\nThis signal can be used to respond semi-instantly to changes in the spin\nbox, without responding too quickly while the user in the middle of\nsetting the value.\n\n.. seealso:: :py:func:`editingTimeoutInterval`\n\n.. versionadded:: 3.42\n'))), ('__overridden_methods__', ('clear', 'valueFromText', 'validate', 'stepBy', 'changeEvent', 'paintEvent', 'wheelEvent', 'timerEvent', 'focusOutEvent')), ('__signal_arguments__', (('textEdited', ('text: str',)), ('editingTimeout', ('value: int',)))), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsstatusbar.h', (
+        ('QgsStatusBar', (('__overridden_methods__', ('changeEvent',)),)),
+    )),
+    ('src/gui/qgsstoredquerymanager.h', (
+        ('QgsStoredQueryManager', (('__attribute_docs__', (('queryAdded', 'Emitted when a query is added to the manager.\n'), ('queryChanged', 'Emitted when an existing query is changed in the manager.\n'), ('queryRemoved', 'Emitted when a query is removed from the manager.\n'))), ('__signal_arguments__', (('queryAdded', ('name: str', 'backend: Qgis.QueryStorageBackend')), ('queryChanged', ('name: str', 'backend: Qgis.QueryStorageBackend')), ('queryRemoved', ('name: str', 'backend: Qgis.QueryStorageBackend')))))),
+    )),
+    ('src/gui/symbology/qgsstyleexportimportdialog.h', (
+        ('QgsStyleExportImportDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/symbology/qgsstylegroupselectiondialog.h', (
+        ('QgsStyleGroupSelectionDialog', (('__attribute_docs__', (('tagSelected', 'tag with tagName has been selected\n'), ('tagDeselected', 'tag with tagName has been deselected\n'), ('smartgroupSelected', 'smartgroup with groupName has been selected\n'), ('smartgroupDeselected', 'smart group with groupName has been deselected\n'), ('allDeselected', 'all deselected\n'), ('allSelected', 'all selected\n'), ('favoritesDeselected', 'Favorites has been deselected\n\n.. versionadded:: 3.14\n'), ('favoritesSelected', 'Favorites has need selected\n\n.. versionadded:: 3.14\n'))), ('__signal_arguments__', (('tagSelected', ('tagName: str',)), ('tagDeselected', ('tagName: str',)), ('smartgroupSelected', ('groupName: str',)), ('smartgroupDeselected', ('groupName: str',)))), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/qgsstyleitemslistwidget.h', (
+        ('QgsStyleItemsListWidget', (('__attribute_docs__', (('selectionChanged', 'Emitted when the selected item is changed in the widget.\n\n:param name: Newly selected item name\n:param type: Newly selected item type\n'), ('selectionChangedWithStylePath', 'Emitted when the selected item is changed in the widget.\n\n:param name: Newly selected item name\n:param type: Newly selected item type\n:param stylePath: file path to associated style database\n\n.. versionadded:: 3.26\n'), ('saveEntity', 'Emitted when the user has opted to save a new entity to the style\ndatabase, by clicking the "Save" button in the widget.\n\nIt is the caller\'s responsibility to handle this in an appropriate\nmanner given the context of the widget.\n'))), ('__overridden_methods__', ('showEvent',)), ('__signal_arguments__', (('selectionChanged', ('name: str', 'type: QgsStyle.StyleEntity')), ('selectionChangedWithStylePath', ('name: str', 'type: QgsStyle.StyleEntity', 'stylePath: str')))))),
+    )),
+    ('src/gui/symbology/qgsstylemanagerdialog.h', (
+        ('QgsStyleManagerDialog', ('addColorRampStatic', ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgsstylesavedialog.h', (
+        ('QgsStyleSaveDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgssublayersdialog.h', (
+        ('QgsSublayersDialog', (('__overridden_methods__', ('exec',)),)),
+    )),
+    ('src/gui/qgssubsetstringeditorinterface.h', (
+        ('QgsSubsetStringEditorInterface', (('__abstract_methods__', ('subsetString', 'setSubsetString')),)),
+    )),
+    ('src/gui/qgssubsetstringeditorprovider.h', (
+        ('QgsSubsetStringEditorProvider', (('__virtual_methods__', ('name', 'canHandleLayerStorageType')), ('__abstract_methods__', ('providerKey', 'canHandleLayer', 'createDialog')))),
+    )),
+    ('src/gui/qgssubstitutionlistwidget.h', (
+        ('QgsSubstitutionListWidget', (('__attribute_docs__', (('substitutionsChanged', 'Emitted when the substitution definitions change.\n'),)), ('__signal_arguments__', (('substitutionsChanged', ('substitutions: QgsStringReplacementCollection',)),)))),
+    )),
+    ('src/gui/symbology/qgssvgselectorwidget.h', (
+        ('QgsSvgSelectorWidget', (('__attribute_docs__', (('svgSelected', 'Emitted when an SVG is selected in the widget.\n'), ('svgParametersChanged', 'Emitted when the parameters have changed\n\n.. versionadded:: 3.18\n'))), ('__signal_arguments__', (('svgSelected', ('path: str',)), ('svgParametersChanged', ('parameters: Dict[str, QgsProperty]',)))), ('__group__', ('symbology',)))),
+        ('QgsSvgSelectorListModel', (('__overridden_methods__', ('rowCount', 'data')), ('__group__', ('symbology',)))),
+        ('QgsSvgSelectorFilterModel', (('__group__', ('symbology',)),)),
+        ('QgsSvgSelectorGroupsModel', (('__group__', ('symbology',)),)),
+        ('QgsSvgSelectorDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/symbology/qgssymbolanimationsettingswidget.h', (
+        ('QgsSymbolAnimationSettingsWidget', (('__group__', ('symbology',)),)),
+        ('QgsSymbolAnimationSettingsDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/symbology/qgssymbolbuffersettingswidget.h', (
+        ('QgsSymbolBufferSettingsWidget', (('__group__', ('symbology',)),)),
+        ('QgsSymbolBufferSettingsDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/qgssymbolbutton.h', (
+        ('QgsSymbolButton', (('__attribute_docs__', (('changed', "Emitted when the symbol's settings are changed.\n\n.. seealso:: :py:func:`symbol`\n\n.. seealso:: :py:func:`setSymbol`\n"),)), ('__overridden_methods__', ('minimumSizeHint', 'sizeHint', 'changeEvent', 'showEvent', 'resizeEvent', 'mousePressEvent', 'mouseMoveEvent', 'mouseReleaseEvent', 'keyPressEvent', 'dragEnterEvent', 'dragLeaveEvent', 'dropEvent', 'wheelEvent')))),
+    )),
+    ('src/gui/symbology/qgssymbollayerwidget.h', (
+        ('QgsSymbolLayerWidget', (('__attribute_docs__', (('changed', 'Should be emitted whenever configuration changes happened on this symbol\nlayer configuration. If the subsymbol is changed,\n:py:func:`~QgsSymbolLayerWidget.symbolChanged` should be emitted\ninstead.\n'), ('symbolChanged', 'Should be emitted whenever the sub symbol changed on this symbol layer\nconfiguration. Normally :py:func:`~QgsSymbolLayerWidget.changed` should\nbe preferred.\n\n.. seealso:: :py:func:`changed`\n'))), ('__virtual_methods__', ('setContext',)), ('__abstract_methods__', ('setSymbolLayer', 'symbolLayer')), ('__overridden_methods__', ('createExpressionContext',)), ('__group__', ('symbology',)))),
+        ('QgsSimpleLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext', 'resizeEvent')), ('__group__', ('symbology',)))),
+        ('QgsSimpleMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsSimpleFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsFilledMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsGradientFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsShapeburstFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsMarkerLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsHashedLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsSvgMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsRasterMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsAnimatedMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsRasterFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsRasterLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsLineburstSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsFilledLineSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsSVGFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsLinePatternFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsPointPatternFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsRandomMarkerFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsFontMarkerSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsCentroidFillSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+        ('QgsLinearReferencingSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer', 'setContext')), ('__group__', ('symbology',)))),
+        ('QgsGeometryGeneratorSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgssymbollevelsdialog.h', (
+        ('QgsSymbolLevelsWidget', (('__group__', ('symbology',)),)),
+        ('QgsSymbolLevelsDialog', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/symbology/qgssymbolselectordialog.h', (
+        ('QgsSymbolSelectorWidget', (('__attribute_docs__', (('symbolModified', 'Emitted when a symbol is modified in the widget.\n'),)), ('__group__', ('symbology',)))),
+        ('QgsSymbolSelectorDialog', (('__attribute_docs__', (('symbolModified', 'Emitted when the symbol defined in the dialog is modified.\n'),)), ('__overridden_methods__', ('keyPressEvent',)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgssymbolslistwidget.h', (
+        ('QgsSymbolsListWidget', (('__attribute_docs__', (('changed', 'Emitted when the symbol is modified in the widget.\n'),)), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/symbology/qgssymbolwidgetcontext.h', (
+        ('QgsSymbolWidgetContext', (('__group__', ('symbology',)),)),
+    )),
+    ('src/gui/tableeditor/qgstableeditordialog.h', (
+        ('QgsTableEditorDialog', (('__attribute_docs__', (('tableChanged', 'Emitted whenever the table contents are changed.\n'), ('includeHeaderChanged', 'Emitted whenever the "include table header" setting is changed.\n'))), ('__overridden_methods__', ('closeEvent',)), ('__signal_arguments__', (('includeHeaderChanged', ('included: bool',)),)), ('__group__', ('tableeditor',)))),
+    )),
+    ('src/gui/tableeditor/qgstableeditorwidget.h', (
+        ('QgsTableEditorWidget', (('__attribute_docs__', (('tableChanged', 'Emitted whenever the table contents are changed.\n'), ('activeCellChanged', 'Emitted whenever the active (or selected) cell changes in the widget.\n'))), ('__overridden_methods__', ('keyPressEvent',)), ('__group__', ('tableeditor',)))),
+    )),
+    ('src/gui/qgstableview.h', (
+        ('QgsTableView', (('__overridden_methods__', ('wheelEvent',)),)),
+    )),
+    ('src/gui/qgstablewidgetbase.h', (
+        ('QgsTableWidgetBase', (('__attribute_docs__', (('valueChanged', 'Emitted each time a key or a value is changed.\n'),)), ('__virtual_methods__', ('setReadOnly',)))),
+    )),
+    ('src/gui/qgstablewidgetitem.h', (
+        ('QgsTableWidgetItem', (('__overridden_methods__', ('operator<',)),)),
+    )),
+    ('src/gui/labeling/qgstabpositionwidget.h', (
+        ('QgsTabPositionWidget', (('__attribute_docs__', (('positionsChanged', 'Emitted when positions are changed in the widget.\n'),)), ('__signal_arguments__', (('positionsChanged', ('positions: List[QgsTextFormat.Tab]',)),)), ('__group__', ('labeling',)))),
+        ('QgsTabPositionDialog', (('__group__', ('labeling',)),)),
+    )),
+    ('src/gui/qgstabwidget.h', (
+        ('QgsTabWidget', (('__overridden_methods__', ('tabInserted', 'tabRemoved')),)),
+    )),
+    ('src/gui/qgstemporalcontrollerwidget.h', (
+        ('QgsTemporalControllerWidget', (('__overridden_methods__', ('applySizeConstraintsToStack', 'keyPressEvent')),)),
+    )),
+    ('src/gui/qgstextformatwidget.h', (
+        ('QgsTextFormatWidget', (('__attribute_docs__', (('widgetChanged', 'Emitted when the text format defined by the widget changes\n'), ('auxiliaryFieldCreated', 'Emitted when an auxiliary field is created in the widget.\n\n.. versionadded:: 3.10\n'))), ('__virtual_methods__', ('setContext', 'setFormatFromStyle', 'saveFormat')), ('__overridden_methods__', ('createExpressionContext',)))),
+        ('QgsTextFormatPanelWidget', (('__overridden_methods__', ('setDockMode',)),)),
+    )),
+    ('src/gui/qgstextpreview.h', (
+        ('QgsTextPreview', (('__overridden_methods__', ('paintEvent',)),)),
+    )),
+    ('src/gui/editorwidgets/qgstextwidgetwrapper.h', (
+        ('QgsTextWidgetWrapper', (('__overridden_methods__', ('valid', 'createWidget', 'initWidget', 'setFeature')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/tiledscene/qgstiledscenerendererpropertieswidget.h', (
+        ('QgsTiledSceneRendererPropertiesWidget', (('__overridden_methods__', ('syncToLayer', 'setDockMode', 'apply')), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/gui/tiledscene/qgstiledscenerendererwidget.h', (
+        ('QgsTiledSceneRendererWidget', (('__virtual_methods__', ('setContext',)), ('__abstract_methods__', ('renderer',)), ('__group__', ('tiledscene',)))),
+    )),
+    ('src/gui/qgstooltipcombobox.h', (
+        ('QgsToolTipComboBox', (('__overridden_methods__', ('event',)),)),
+    )),
+    ('src/gui/qgstreewidgetitem.h', (
+        ('QgsTreeWidgetItemObject', (('__attribute_docs__', (('itemEdited', 'Emitted when the contents of the column in the specified item has been\nedited by the user.\n'),)), ('__overridden_methods__', ('setData',)), ('__signal_arguments__', (('itemEdited', ('item: QTreeWidgetItem', 'column: int')),)))),
+        ('QgsTreeWidgetItem', (('__overridden_methods__', ('operator<',)),)),
+    )),
+    ('src/gui/qgsunitselectionwidget.h', (
+        ('QgsMapUnitScaleWidget', (('__attribute_docs__', (('mapUnitScaleChanged', 'Emitted when the settings in the widget are modified.\n\n:param scale: :py:class:`QgsMapUnitScale` reflecting new settings from\n              the widget\n'),)), ('__signal_arguments__', (('mapUnitScaleChanged', ('scale: QgsMapUnitScale',)),)))),
+        ('QgsUnitSelectionWidget', (('__attribute_docs__', (('changed', 'Emitted when the selected unit is changed, or the definition of the map\nunit scale is changed.\n'),)),)),
+    )),
+    ('src/gui/qgsuserinputwidget.h', (
+        ('QgsUserInputWidget', (('__overridden_methods__', ('paintEvent',)),)),
+    )),
+    ('src/gui/qgsvaliditycheckresultswidget.h', (
+        ('QgsValidityCheckResultsWidget', ('runChecks',)),
+        ('QgsValidityCheckResultsModel', (('__overridden_methods__', ('index', 'parent', 'rowCount', 'columnCount', 'data')),)),
+    )),
+    ('src/gui/editorwidgets/qgsvaluemapsearchwidgetwrapper.h', (
+        ('QgsValueMapSearchWidgetWrapper', (('__overridden_methods__', ('applyDirectly', 'expression', 'valid', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'createWidget', 'initWidget', 'setExpression')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/editorwidgets/qgsvaluerelationsearchwidgetwrapper.h', (
+        ('QgsValueRelationSearchWidgetWrapper', (('__overridden_methods__', ('applyDirectly', 'expression', 'valid', 'supportedFlags', 'defaultFlags', 'createExpression', 'clearWidget', 'setEnabled', 'createWidget', 'initWidget', 'setExpression')), ('__group__', ('editorwidgets',)))),
+    )),
+    ('src/gui/qgsvariableeditorwidget.h', (
+        ('QgsVariableEditorWidget', (('__attribute_docs__', (('scopeChanged', 'Emitted when the user has modified a scope using the widget.\n'),)), ('__overridden_methods__', ('showEvent',)))),
+    )),
+    ('src/gui/symbology/qgsvectorfieldsymbollayerwidget.h', (
+        ('QgsVectorFieldSymbolLayerWidget', ('create', ('__overridden_methods__', ('setSymbolLayer', 'symbolLayer')), ('__group__', ('symbology',)))),
+    )),
+    ('src/gui/vector/qgsvectorlayerproperties.h', (
+        ('QgsVectorLayerProperties', (('__virtual_methods__', ('syncToLayer', 'apply', 'rollback')), ('__overridden_methods__', ('eventFilter', 'optionsStackedWidget_CurrentChanged')), ('__group__', ('vector',)))),
+    )),
+    ('src/gui/ogr/qgsvectorlayersaveasdialog.h', (
+        ('QgsVectorLayerSaveAsDialog', (('__overridden_methods__', ('accept',)), ('__group__', ('ogr',)))),
+    )),
+    ('src/gui/qgsvectorlayertemporalpropertieswidget.h', (
+        ('QgsVectorLayerTemporalPropertiesWidget', (('__overridden_methods__', ('createExpressionContext',)),)),
+    )),
+    ('src/gui/vectortile/qgsvectortilelayerproperties.h', (
+        ('QgsVectorTileLayerProperties', (('__group__', ('vectortile',)),)),
+    )),
+    ('src/gui/qgsvertexmarker.h', (
+        ('QgsVertexMarker', (('__overridden_methods__', ('paint', 'boundingRect', 'updatePosition')),)),
+    )),
+    ('src/gui/qgsvscrollarea.h', (
+        ('QgsVScrollArea', (('__overridden_methods__', ('eventFilter',)),)),
+    )),
+    ('src/gui/editorwidgets/core/qgswidgetwrapper.h', (
+        ('QgsWidgetWrapper', (('__attribute_docs__', (('contextChanged', 'Signal when :py:class:`QgsAttributeEditorContext` mContext changed\n\n.. versionadded:: 3.4\n'),)), 'fromWidget', ('__virtual_methods__', ('initWidget', 'setEnabled')), ('__abstract_methods__', ('valid', 'createWidget', 'setFeature')), ('__group__', ('editorwidgets', 'core')))),
+    )),
+    ('src/gui/qgswindowmanagerinterface.h', (
+        ('QgsWindowManagerInterface', (('__abstract_methods__', ('openStandardDialog',)),)),
+    )),
+)
@@ -21,6 +21,9 @@ __author__ = 'Alessandro Pasotti'
 __date__ = 'October 2014'
 __copyright__ = '(C) 2014, Alessandro Pasotti'
 
+from qgis.core.additions.importprofiler import start_import_profile as _start_import_profile
+_import_profile = _start_import_profile('qgis.server')
+
 from PyQt5 import QtCore     # NOQA
 
 from qgis._server import *  # NOQA
@@ -291,3 +294,6 @@ try:
 except (NameError, AttributeError):
     pass
 
+
+if _import_profile is not None:
+    _import_profile.finish()
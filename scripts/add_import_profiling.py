@@ -0,0 +1,59 @@
+"""Add the import profiling hooks to runtime modules.
+
+Inserts a call to ``qgis.core.additions.importprofiler.start_import_profile``
+before the first import of each runtime ``__init__.py`` and finishes the
+profile at the end of the module. Both are no-ops unless profiling is
+enabled with ``python -X qgis_profile_imports[=path]`` or the
+``QGIS_PROFILE_IMPORTS`` environment variable, in which case the wall time
+and net allocated memory blocks of each section (generated header block,
+import or commented block) are written to a JSON file and the slowest
+sections are recorded in ``QgsApplication.profiler()``.
+"""
+
+import argparse
+import ast
+import pathlib
+
+_PROFILE = '_import_profile'
+
+
+def add_profiling(source: str, module: str) -> str:
+    """Return ``source`` with the profiling hooks added."""
+    tree = ast.parse(source)
+    first_import = next(
+        node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+    lines = source.splitlines(keepends=True)
+    lines[first_import.lineno - 1:first_import.lineno - 1] = [
+        'from qgis.core.additions.importprofiler import start_import_profile as _start_import_profile\n',
+        f"{_PROFILE} = _start_import_profile('{module}')\n",
+        '\n',
+    ]
+    lines.append(
+        f'\nif {_PROFILE} is not None:\n'
+        f'    {_PROFILE}.finish()\n'
+    )
+    return ''.join(lines).rstrip('\n') + '\n'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'modules',
+        type=pathlib.Path,
+        nargs='+',
+        help='Runtime __init__.py files to process (e.g. qgis/core/__init__.py)',
+    )
+    args = parser.parse_args()
+
+    for init in args.modules:
+        source = init.read_text('utf-8')
+        if _PROFILE in source:
+            print(f'{init} already has import profiling hooks.')
+            continue
+        init.write_text(add_profiling(source, f'qgis.{init.parent.name}'), encoding='utf-8')
+        print(f'Added import profiling hooks to {init}.')
+
+
+if __name__ == '__main__':
+    main()
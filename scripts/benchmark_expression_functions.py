@@ -0,0 +1,212 @@
+"""Measure the per-call overhead of Python expression functions.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable). The
+``core/additions/qgsfunction.py`` of this tree is loaded next to the one of
+the installed QGIS, and both are used to register the same set of
+functions, which are then evaluated once per feature:
+
+    plain           f(a, b)
+    feature         f(a, feature)
+    special         f(a, feature, parent, context)
+    params_as_list  f(values) registered with params_as_list=True
+    vectorized      f(a, b) on numpy arrays, registered with vectorized=True
+                    and evaluated with evaluate_in_blocks() (tree only)
+
+The expression ``1 + 2`` is evaluated the same way as a baseline, so the
+overhead of an evaluation of each function is ``time - baseline``.
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import importlib.util
+import json
+import pathlib
+import sys
+import time
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_QGSFUNCTION = _ROOT / 'qgis-stubs' / 'core' / 'additions' / 'qgsfunction.py'
+
+
+def _plain(a, b):
+    return a + b
+
+
+def _feature(a, feature):
+    return a
+
+
+def _special(a, feature, parent, context):
+    return a
+
+
+def _params_as_list(values):
+    return values[0]
+
+
+def _vectorized(a, b):
+    return a + b
+
+
+# case -> (function, expression arguments, register_function keywords)
+CASES: dict[str, tuple[Any, str, dict[str, Any]]] = {
+    'plain': (_plain, '1, 2', {}),
+    'feature': (_feature, '1', {}),
+    'special': (_special, '1', {}),
+    'params_as_list': (_params_as_list, '1, 2', {'params_as_list': True}),
+}
+
+
+def load_implementations() -> dict[str, Any]:
+    """Return the qgsfunction modules to compare by name."""
+    from qgis.core.additions import qgsfunction as installed
+
+    spec = importlib.util.spec_from_file_location('_qgsfunction_tree', _QGSFUNCTION)
+    assert spec is not None and spec.loader is not None
+    tree = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(tree)
+    return {'installed': installed, 'tree': tree}
+
+
+def make_features(count: int) -> list[Any]:
+    from qgis.core import QgsFeature, QgsField, QgsFields
+    from PyQt5.QtCore import QVariant
+
+    fields = QgsFields()
+    fields.append(QgsField('value', QVariant.Int))
+    features = []
+    for i in range(count):
+        feature = QgsFeature(fields, i)
+        feature.setAttributes([i])
+        features.append(feature)
+    return features
+
+
+def time_expression(text: str, features: list[Any], repeat: int) -> float:
+    """Return the best time per evaluation of an expression in seconds."""
+    from qgis.core import QgsExpression, QgsExpressionContext
+
+    expression = QgsExpression(text)
+    if expression.hasParserError():
+        raise ValueError(f'{text}: {expression.parserErrorString()}')
+    context = QgsExpressionContext()
+    expression.prepare(context)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for feature in features:
+            context.setFeature(feature)
+            expression.evaluate(context)
+        best = min(best, time.perf_counter() - start)
+    if expression.hasEvalError():
+        raise RuntimeError(f'{text}: {expression.evalErrorString()}')
+    return best / len(features)
+
+
+def time_blocks(module: Any, text: str, features: list[Any], repeat: int, block_size: int) -> float:
+    """Return the best time per evaluation with ``evaluate_in_blocks()`` in seconds."""
+    from qgis.core import QgsExpression, QgsExpressionContext
+
+    expression = QgsExpression(text)
+    context = QgsExpressionContext()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _value in module.evaluate_in_blocks(expression, context, features, block_size):
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best / len(features)
+
+
+def run(features: int, repeat: int, block_size: int) -> dict[str, Any]:
+    from qgis.core import QgsExpression
+
+    implementations = load_implementations()
+    items = make_features(features)
+    baseline = time_expression('1 + 2', items, repeat)
+    results: dict[str, Any] = {'features': features, 'baseline_us': baseline * 1e6, 'cases': {}}
+    for case, (function, arguments, keywords) in CASES.items():
+        results['cases'][case] = {}
+        for implementation, module in implementations.items():
+            name = f'bench_{implementation}_{case}'
+            module.register_function(function, name=name, **keywords)
+            try:
+                seconds = time_expression(f'{name}({arguments})', items, repeat)
+            finally:
+                QgsExpression.unregisterFunction(name)
+            results['cases'][case][implementation] = {
+                'us_per_call': seconds * 1e6,
+                'overhead_us': (seconds - baseline) * 1e6,
+            }
+
+    tree = implementations['tree']
+    name = 'bench_tree_vectorized'
+    tree.register_function(_vectorized, name=name, vectorized=True)
+    try:
+        seconds = time_blocks(tree, f'{name}("value", 2)', items, repeat, block_size)
+    finally:
+        QgsExpression.unregisterFunction(name)
+    results['cases']['vectorized'] = {
+        'tree': {'us_per_call': seconds * 1e6, 'overhead_us': (seconds - baseline) * 1e6},
+    }
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f'baseline: {results["baseline_us"]:.2f} us per evaluation')
+    print(f'{"case":<16} {"implementation":<14} {"us/call":>9} {"overhead":>9}')
+    for case, implementations in results['cases'].items():
+        for implementation, numbers in implementations.items():
+            print(
+                f'{case:<16} {implementation:<14} '
+                f'{numbers["us_per_call"]:>9.2f} {numbers["overhead_us"]:>9.2f}'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--features',
+        type=int,
+        default=100_000,
+        help='Number of features to evaluate each expression for (default: 100000)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs per expression, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--block-size',
+        type=int,
+        default=1024,
+        help='Block size of the vectorized case (default: 1024)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    from qgis.core import QgsApplication
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        results = run(args.features, args.repeat, args.block_size)
+    finally:
+        app.exitQgis()
+
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Compare the ways of reading the features of a layer into columns.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable) and
+numpy. A memory layer of ``--count`` points with an integer, a double and a
+string field is read with:
+
+    rows        one QgsFeature per row, attributes and WKB appended to lists
+    to_columns  layer.getFeatures().to_columns(batch_size=--batch-size)
+    arrow       layer.as_record_batches(batch_size=--batch-size), if pyarrow
+                is installed
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any
+
+
+def make_layer(count: int) -> Any:
+    from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
+
+    layer = QgsVectorLayer(
+        'Point?crs=EPSG:4326&field=id:integer&field=value:double&field=name:string', 'points', 'memory')
+    features = []
+    for i in range(count):
+        feature = QgsFeature(layer.fields())
+        feature.setAttributes([i, i / 3, f'point {i}' if i % 10 else None])
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(i % 360 - 180, i % 180 - 90)))
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    return layer
+
+
+def read_rows(layer: Any, batch_size: int) -> None:
+    columns: dict[str, list[Any]] = {name: [] for name in layer.fields().names()}
+    geometries = []
+    for feature in layer.getFeatures():
+        for name, value in zip(columns, feature.attributes()):
+            columns[name].append(value)
+        geometries.append(feature.geometry().asWkb().data())
+
+
+def read_columns(layer: Any, batch_size: int) -> None:
+    for _ in layer.getFeatures().to_columns(batch_size=batch_size):
+        pass
+
+
+def read_record_batches(layer: Any, batch_size: int) -> None:
+    for _ in layer.as_record_batches(batch_size=batch_size):
+        pass
+
+
+def run(count: int, batch_size: int, repeat: int) -> dict[str, Any]:
+    readers = {'rows': read_rows, 'to_columns': read_columns}
+    try:
+        import pyarrow  # noqa: F401
+    except ModuleNotFoundError:
+        print('pyarrow is not installed, skipping as_record_batches.', file=sys.stderr)
+    else:
+        readers['arrow'] = read_record_batches
+
+    layer = make_layer(count)
+    results: dict[str, Any] = {'count': count, 'batch_size': batch_size, 'seconds': {}}
+    for name, reader in readers.items():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            reader(layer, batch_size)
+            best = min(best, time.perf_counter() - start)
+        results['seconds'][name] = best
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f'{results["count"]} features, batches of {results["batch_size"]}')
+    print(f'{"reader":<12} {"seconds":>9} {"features/s":>12}')
+    for name, seconds in results['seconds'].items():
+        print(f'{name:<12} {seconds:>9.3f} {results["count"] / seconds:>12.0f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=200_000,
+        help='Number of features of the layer (default: 200000)',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=65_536,
+        help='Number of features per batch (default: 65536)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed reads per reader, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    from qgis.core import QgsApplication
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        results = run(args.count, args.batch_size, args.repeat)
+    finally:
+        app.exitQgis()
+
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
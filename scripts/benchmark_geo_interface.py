@@ -0,0 +1,110 @@
+"""Compare the ways of building QgsGeometry.__geo_interface__.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable).
+``--count`` points, line strings and polygons with ``--vertices`` vertices
+each are converted to GeoJSON like mappings with:
+
+    eval        eval(geometry.asJson()), the implementation used before
+    json        json.loads(geometry.asJson())
+    wkb         geometry.__geo_interface__, read from the WKB of the geometry
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import sys
+import time
+from typing import Any
+
+
+def make_geometries(count: int, vertices: int) -> dict[str, list[Any]]:
+    from qgis.core import QgsGeometry, QgsPointXY
+
+    rng = random.Random(0)
+    points = [QgsGeometry.fromPointXY(QgsPointXY(rng.random(), rng.random())) for _ in range(count)]
+    lines = [
+        QgsGeometry.fromPolylineXY([QgsPointXY(rng.random(), rng.random()) for _ in range(vertices)])
+        for _ in range(count)
+    ]
+    # A buffer has 4 * segments + 1 vertices
+    polygons = [point.buffer(0.1, max(1, vertices // 4)) for point in points]
+    return {'point': points, 'linestring': lines, 'polygon': polygons}
+
+
+def time_conversion(function: Any, geometries: list[Any], repeat: int) -> float:
+    """Return the best time per geometry in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for geometry in geometries:
+            function(geometry)
+        best = min(best, time.perf_counter() - start)
+    return best / len(geometries)
+
+
+def run(count: int, vertices: int, repeat: int) -> dict[str, Any]:
+    conversions = {
+        'eval': lambda geometry: eval(geometry.asJson()),
+        'json': lambda geometry: json.loads(geometry.asJson()),
+        'wkb': lambda geometry: geometry.__geo_interface__,
+    }
+    results: dict[str, Any] = {'count': count, 'vertices': vertices, 'geometries': {}}
+    for kind, geometries in make_geometries(count, vertices).items():
+        # asJson() rounds to 17 decimals, so the last digit may differ
+        if conversions['wkb'](geometries[0]) != conversions['json'](geometries[0]):
+            print(f'The {kind} mappings differ.', file=sys.stderr)
+        results['geometries'][kind] = {
+            name: time_conversion(function, geometries, repeat) * 1e6
+            for name, function in conversions.items()
+        }
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f'{results["count"]} geometries per type, {results["vertices"]} vertices per line or polygon')
+    names = list(next(iter(results['geometries'].values())))
+    print(f'{"geometry":<12} ' + ' '.join(f'{name + " us":>12}' for name in names))
+    for kind, times in results['geometries'].items():
+        print(f'{kind:<12} ' + ' '.join(f'{times[name]:>12.2f}' for name in names))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=10_000,
+        help='Number of geometries per type (default: 10000)',
+    )
+    parser.add_argument(
+        '--vertices',
+        type=int,
+        default=100,
+        help='Number of vertices of the line strings and polygons (default: 100)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs per case, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    results = run(args.count, args.vertices, args.repeat)
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Compare the numpy conversions of QgsGeometry.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable) and
+numpy. Polygons and multipolygons with ``--vertices`` vertices each are
+converted with:
+
+    vertices           the per vertex conversion used before as_numpy was
+                       based on WKB, still used for curved geometries
+    as_numpy           as_numpy(), decoding the WKB of the geometry
+    coordinate_arrays  as_coordinate_arrays()
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any
+
+
+def make_geometries(vertices: int) -> dict[str, Any]:
+    from qgis.core import QgsGeometry, QgsPointXY
+
+    # A buffer has 4 * segments + 1 vertices
+    segments = max(1, vertices // 4)
+    polygon = QgsGeometry.fromPointXY(QgsPointXY(0, 0)).buffer(10, segments)
+    parts = [
+        QgsGeometry.fromPointXY(QgsPointXY(30 * i, 0)).buffer(10, max(1, segments // 4))
+        for i in range(4)
+    ]
+    multipolygon = QgsGeometry.collectGeometry(parts)
+    return {'polygon': polygon, 'multipolygon': multipolygon}
+
+
+def time_call(function: Any, geometry: Any, repeat: int) -> float:
+    """Return the best time of a conversion in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(geometry)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(vertices: list[int], repeat: int) -> dict[str, Any]:
+    from qgis.core.additions.numpyinterop import _qgsgeometry_as_numpy_vertices
+
+    conversions = {
+        'vertices': _qgsgeometry_as_numpy_vertices,
+        'as_numpy': lambda geometry: geometry.as_numpy(),
+        'coordinate_arrays': lambda geometry: geometry.as_coordinate_arrays(),
+    }
+    results: dict[str, Any] = {'geometries': []}
+    for count in vertices:
+        for kind, geometry in make_geometries(count).items():
+            entry = {
+                'geometry': kind,
+                'vertices': geometry.constGet().nCoordinates(),
+                'seconds': {
+                    name: time_call(function, geometry, repeat)
+                    for name, function in conversions.items()
+                },
+            }
+            results['geometries'].append(entry)
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    names = list(results['geometries'][0]['seconds'])
+    print(f'{"geometry":<13} {"vertices":>9} ' + ' '.join(f'{name + " ms":>20}' for name in names))
+    for entry in results['geometries']:
+        print(
+            f'{entry["geometry"]:<13} {entry["vertices"]:>9} '
+            + ' '.join(f'{entry["seconds"][name] * 1000:>20.3f}' for name in names)
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--vertices',
+        type=int,
+        nargs='+',
+        default=[100, 10_000, 100_000],
+        help='Numbers of vertices of the geometries (default: 100 10000 100000)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed conversions per case, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    results = run(args.vertices, args.repeat)
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""Measure parallel Python expression functions with the parallel map renderer.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable). The
+``core/additions/qgsfunction.py`` of this tree is loaded and used to register
+the same CPU bound function twice, once as a regular function and once with
+``parallel=True``. Several memory point layers whose marker size is data
+defined by the function are then rendered with ``QgsMapRendererParallelJob``,
+which renders each layer in its own thread:
+
+    constant    marker size expression without any Python function
+    serial      regular function, the render threads take turns holding the GIL
+    parallel    parallel function, run in worker processes
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import importlib.util
+import json
+import pathlib
+import random
+import sys
+import time
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_QGSFUNCTION = _ROOT / 'qgis-stubs' / 'core' / 'additions' / 'qgsfunction.py'
+_MODULE = '_qgsfunction_tree'
+
+
+def _load_tree() -> Any:
+    # Registered in sys.modules so that the worker processes, which import this
+    # script, can unpickle the functions of the module
+    if _MODULE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(_MODULE, _QGSFUNCTION)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE] = module
+        spec.loader.exec_module(module)
+    return sys.modules[_MODULE]
+
+
+# Also run by the worker processes when they import this script
+_load_tree()
+
+
+def _busy(value, iterations):
+    x = value
+    for _ in range(iterations):
+        x = (x * 1103515245 + 12345) % 2147483648
+    return 1 + x % 3
+
+
+def make_layers(count: int, features: int) -> list[Any]:
+    from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
+
+    rng = random.Random(0)
+    layers = []
+    for i in range(count):
+        layer = QgsVectorLayer('Point?crs=EPSG:4326&field=value:integer', f'points_{i}', 'memory')
+        items = []
+        for j in range(features):
+            feature = QgsFeature(layer.fields())
+            feature.setAttributes([j])
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(rng.uniform(-180, 180), rng.uniform(-90, 90))))
+            items.append(feature)
+        layer.dataProvider().addFeatures(items)
+        layers.append(layer)
+    return layers
+
+
+def set_size_expression(layers: list[Any], expression: str) -> None:
+    from qgis.core import QgsMarkerSymbol, QgsProperty, QgsSingleSymbolRenderer
+
+    for layer in layers:
+        symbol = QgsMarkerSymbol.createSimple({'size': '1'})
+        symbol.setDataDefinedSize(QgsProperty.fromExpression(expression))
+        layer.setRenderer(QgsSingleSymbolRenderer(symbol))
+
+
+def time_render(layers: list[Any], repeat: int) -> float:
+    """Return the best time to render the layers in parallel in seconds."""
+    from qgis.core import QgsMapRendererParallelJob, QgsMapSettings, QgsRectangle
+    from PyQt5.QtCore import QSize
+
+    settings = QgsMapSettings()
+    settings.setLayers(layers)
+    settings.setDestinationCrs(layers[0].crs())
+    settings.setExtent(QgsRectangle(-180, -90, 180, 90))
+    settings.setOutputSize(QSize(1024, 512))
+    best = float('inf')
+    for _ in range(repeat):
+        job = QgsMapRendererParallelJob(settings)
+        start = time.perf_counter()
+        job.start()
+        job.waitForFinished()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(layer_count: int, features: int, iterations: int, repeat: int) -> dict[str, Any]:
+    from qgis.core import QgsExpression
+
+    tree = _load_tree()
+    layers = make_layers(layer_count, features)
+    results: dict[str, Any] = {
+        'layers': layer_count,
+        'features': features,
+        'iterations': iterations,
+        'cases': {},
+    }
+
+    set_size_expression(layers, '1 + "value" % 3')
+    results['cases']['constant'] = time_render(layers, repeat)
+
+    for case, parallel in (('serial', False), ('parallel', True)):
+        name = f'bench_{case}'
+        tree.register_function(_busy, name=name, parallel=parallel)
+        try:
+            set_size_expression(layers, f'{name}("value", {iterations})')
+            if parallel:
+                # Start the worker processes outside of the timed renders
+                time_render(layers, 1)
+            results['cases'][case] = time_render(layers, repeat)
+        finally:
+            QgsExpression.unregisterFunction(name)
+
+    tree.parallel_executor().shutdown()
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(
+        f'{results["layers"]} layers of {results["features"]} features, '
+        f'{results["iterations"]} iterations per call'
+    )
+    print(f'{"case":<10} {"seconds":>9} {"features/s":>12}')
+    total = results['layers'] * results['features']
+    for case, seconds in results['cases'].items():
+        print(f'{case:<10} {seconds:>9.3f} {total / seconds:>12.0f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--layers',
+        type=int,
+        default=8,
+        help='Number of layers rendered in parallel (default: 8)',
+    )
+    parser.add_argument(
+        '--features',
+        type=int,
+        default=5_000,
+        help='Number of features per layer (default: 5000)',
+    )
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=2_000,
+        help='Work done by each call of the function (default: 2000)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed renders per case, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    from qgis.core import QgsApplication
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        results = run(args.layers, args.features, args.iterations, args.repeat)
+    finally:
+        app.exitQgis()
+
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Measure the memory used by the numpy conversions of raster blocks.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable) and
+numpy. A Float32 ``QgsRasterBlock`` of ``--size`` x ``--size`` pixels with
+some nodata pixels is converted to numpy in several ways:
+
+    as_numpy             as_numpy(use_masking=False), a view of data()
+    as_numpy_masked      as_numpy(), a masked copy of data()
+    view                 numpy_view().array
+    view_masked          numpy_view().masked(), sharing the data of the view
+    view_writable        numpy_view(writable=True), written back to the block
+
+Each case runs in its own process, which records the increase of its peak
+resident set size and the peak of the allocations traced by tracemalloc
+(numpy arrays, but not the QByteArray copies made by Qt) during the
+conversion, as well as the time it took.
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+CASES = ['as_numpy', 'as_numpy_masked', 'view', 'view_masked', 'view_writable']
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def make_block(size: int) -> Any:
+    from qgis.core import Qgis, QgsRasterBlock
+
+    block = QgsRasterBlock(Qgis.DataType.Float32, size, size)
+    block.setNoDataValue(-9999)
+    block.fill(1)
+    for i in range(0, size, 7):
+        block.setValue(i, i, -9999)
+    return block
+
+
+def convert(case: str, block: Any) -> Any:
+    if case == 'as_numpy':
+        return block.as_numpy(use_masking=False)
+    if case == 'as_numpy_masked':
+        return block.as_numpy()
+    if case == 'view':
+        return block.numpy_view().array
+    if case == 'view_masked':
+        return block.numpy_view().masked()
+    if case == 'view_writable':
+        with block.numpy_view(writable=True) as view:
+            view.array[view.mask] = 0
+        return None
+    raise ValueError(case)
+
+
+def run_case(case: str, size: int) -> dict[str, Any]:
+    """Run a case in this process."""
+    block = make_block(size)
+    rss = _peak_rss_mb()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = convert(case, block)
+    seconds = time.perf_counter() - start
+    traced = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    del result
+    return {'seconds': seconds, 'peak_rss_mb': _peak_rss_mb() - rss, 'traced_mb': traced}
+
+
+def run(size: int) -> dict[str, Any]:
+    results: dict[str, Any] = {'size': size, 'block_mb': size * size * 4 / 1024 / 1024, 'cases': {}}
+    for case in CASES:
+        output = subprocess.run(
+            [sys.executable, __file__, '--case', case, '--size', str(size)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results['cases'][case] = json.loads(output)
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f'{results["size"]} x {results["size"]} Float32 block ({results["block_mb"]:.0f} MB)')
+    print(f'{"case":<16} {"seconds":>9} {"peak RSS MB":>12} {"traced MB":>10}')
+    for case, numbers in results['cases'].items():
+        print(
+            f'{case:<16} {numbers["seconds"]:>9.3f} '
+            f'{numbers["peak_rss_mb"]:>12.1f} {numbers["traced_mb"]:>10.1f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=10_000,
+        help='Width and height of the block in pixels (default: 10000)',
+    )
+    parser.add_argument(
+        '--case',
+        choices=CASES,
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    if args.case is not None:
+        print(json.dumps(run_case(args.case, args.size)))
+        return
+
+    results = run(args.size)
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Measure the read throughput of QgsRasterLayer.as_numpy on local rasters.
+
+Must be run with a QGIS Python environment (``qgis.core`` importable) and
+numpy. Each raster given on the command line is opened as a GDAL layer and
+read with ``as_numpy(use_masking=False)`` using each combination of
+``--workers`` and ``--tile-heights``:
+
+    workers 1, whole bands    the sequential reads of earlier versions
+    workers N                 bands read by N threads
+    tile height H             each band read in tiles of H rows
+
+Use multi-band files, e.g. GeoTIFFs, large enough that a read takes at least
+a few hundred milliseconds, and run the benchmark twice to measure with a
+warm file system cache.
+
+Results are printed as a table and can be written as JSON with ``--output``.
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from typing import Any
+
+
+def time_read(layer: Any, workers: int, tile_height: int | None, repeat: int) -> float:
+    """Return the best time to read all the bands of a layer in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        layer.as_numpy(use_masking=False, max_workers=workers, tile_height=tile_height)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(paths: list[pathlib.Path], workers: list[int], tile_heights: list[int], repeat: int) -> dict[str, Any]:
+    from qgis.core import QgsRasterLayer
+
+    results: dict[str, Any] = {'rasters': {}}
+    for path in paths:
+        layer = QgsRasterLayer(str(path), path.stem, 'gdal')
+        if not layer.isValid():
+            raise ValueError(f'{path} is not a valid raster')
+        array = layer.as_numpy(use_masking=False)
+        megabytes = array.nbytes / 1024 / 1024
+        del array
+        cases = []
+        for count in workers:
+            for tile_height in [None, *tile_heights]:
+                seconds = time_read(layer, count, tile_height, repeat)
+                cases.append({
+                    'workers': count,
+                    'tile_height': tile_height,
+                    'seconds': seconds,
+                    'mb_per_second': megabytes / seconds,
+                })
+        results['rasters'][str(path)] = {
+            'bands': layer.bandCount(),
+            'width': layer.width(),
+            'height': layer.height(),
+            'megabytes': megabytes,
+            'cases': cases,
+        }
+    return results
+
+
+def print_table(results: dict[str, Any]) -> None:
+    for path, raster in results['rasters'].items():
+        print(
+            f'{path}: {raster["bands"]} bands of {raster["width"]} x {raster["height"]} '
+            f'({raster["megabytes"]:.0f} MB)'
+        )
+        print(f'{"workers":>8} {"tile rows":>10} {"seconds":>9} {"MB/s":>9}')
+        for case in raster['cases']:
+            tile_height = case['tile_height'] or 'band'
+            print(
+                f'{case["workers"]:>8} {tile_height:>10} '
+                f'{case["seconds"]:>9.3f} {case["mb_per_second"]:>9.1f}'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'rasters',
+        type=pathlib.Path,
+        nargs='+',
+        help='Local raster files to read',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs='+',
+        default=[1, 2, 4, 8],
+        help='Numbers of threads to read with (default: 1 2 4 8)',
+    )
+    parser.add_argument(
+        '--tile-heights',
+        type=int,
+        nargs='*',
+        default=[512],
+        help='Tile heights in rows to read with, besides whole bands (default: 512)',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed reads per case, the best is kept (default: 3)',
+    )
+    parser.add_argument(
+        '--output',
+        type=pathlib.Path,
+        help='Write the results as JSON to this file',
+    )
+    args = parser.parse_args()
+
+    from qgis.core import QgsApplication
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        results = run(args.rasters, args.workers, args.tile_heights, args.repeat)
+    finally:
+        app.exitQgis()
+
+    print_table(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+        print(f'Wrote {args.output}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""Measure how expensive the qgis stubs are for type checker users.
+
+Runs mypy and pyright over the cookbook snippets in ``tests/manual`` and over
+a synthetic client project, recording for each checker and workload:
+
+    cold    first run with an empty cache directory
+    warm    second run reusing the cache of the cold run
+
+Each run records wall time and peak RSS (of the checker process and its
+children). In addition, the following per-stub-module numbers are collected:
+
+    size        files, lines and bytes of each stub module
+    parse       wall time of ``ast.parse`` for each stub module
+    mypy        processing time per stub module from ``--timing-stats``
+    pyright     phase totals (tokenize, parse, bind, ...) from ``--stats``
+
+A stub module is either a single ``.pyi`` file (e.g. ``_gui.pyi``) or a stub
+package split into shards (e.g. ``_core/``), in which case the shards are
+aggregated.
+
+Results are written as JSON, by default to ``benchmarks/<version>.json`` so
+that runs for different releases can be compared side by side.
+"""
+
+import argparse
+import ast
+import json
+import os
+import pathlib
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_STUB_MODULES = ('_core', '_gui', '_analysis', '_3d_p', '_server')
+# Runtime package imported by client code -> stub module it re-exports
+_CLIENT_PACKAGES = {
+    'core': '_core',
+    'gui': '_gui',
+    'analysis': '_analysis',
+    '_3d': '_3d_p',
+    'server': '_server',
+}
+_PYRIGHT_STAT_RE = re.compile(r'^([A-Za-z ]+):\s+([\d.]+)sec$')
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def stub_files(stubs: pathlib.Path, module: str) -> list[pathlib.Path]:
+    """Return the files making up a stub module, shards included."""
+    package = stubs / module
+    if package.is_dir():
+        return sorted(package.glob('*.pyi'))
+    return [stubs / f'{module}.pyi']
+
+
+def measure_stubs(stubs: pathlib.Path) -> dict[str, dict[str, Any]]:
+    """Return size and ``ast.parse`` time for each stub module."""
+    results: dict[str, dict[str, Any]] = {}
+    for module in _STUB_MODULES:
+        files = stub_files(stubs, module)
+        sources = [f.read_text('utf-8') for f in files]
+        start = time.perf_counter()
+        for source in sources:
+            ast.parse(source)
+        elapsed = time.perf_counter() - start
+        results[module] = {
+            'files': len(files),
+            'lines': sum(s.count('\n') for s in sources),
+            'bytes': sum(len(s.encode('utf-8')) for s in sources),
+            'parse_seconds': round(elapsed, 4),
+        }
+    return results
+
+
+def write_synthetic_project(
+    stubs: pathlib.Path,
+    target: pathlib.Path,
+    modules: int,
+    seed: int = 0,
+) -> None:
+    """Write a synthetic client project that uses random stub classes.
+
+    Every module imports a handful of classes from each of the runtime
+    packages backed by the benchmarked stub modules and defines functions
+    annotated with them, so that the checker has to resolve and bind them.
+    """
+    rng = random.Random(seed)
+    names: dict[str, list[str]] = {}
+    for package, module in _CLIENT_PACKAGES.items():
+        classes: list[str] = []
+        for file in stub_files(stubs, module):
+            tree = ast.parse(file.read_text('utf-8'))
+            classes.extend(
+                node.name for node in tree.body
+                if isinstance(node, ast.ClassDef) and node.name.startswith('Qgs')
+            )
+        names[package] = sorted(classes)
+
+    target.mkdir(parents=True, exist_ok=True)
+    for i in range(modules):
+        lines: list[str] = []
+        used: list[str] = []
+        for package, classes in names.items():
+            count = 8 if package in ('core', 'gui') else 2
+            picked = sorted(rng.sample(classes, min(count, len(classes))))
+            lines.append(f'from qgis.{package} import {", ".join(picked)}')
+            used.extend(picked)
+        lines.append('')
+        for j, name in enumerate(used):
+            lines.append('')
+            lines.append(f'def use_{j}(value: {name}) -> {name}:')
+            lines.append(f'    other: {name} = value')
+            lines.append('    return other')
+        (target / f'client_{i:04d}.py').write_text('\n'.join(lines) + '\n', 'utf-8')
+
+
+def _run(command: list[str], env: dict[str, str]) -> dict[str, Any]:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    output = process.stdout.read()  # type: ignore
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': round(elapsed, 3),
+        # ru_maxrss is in KiB on Linux and in bytes on macOS
+        'max_rss_kb': usage.ru_maxrss // (1024 if sys.platform == 'darwin' else 1),
+        'exit_code': process.returncode,
+        'output': output,
+    }
+
+
+def bench_mypy(
+    search_path: pathlib.Path,
+    sources: list[pathlib.Path],
+    scratch: pathlib.Path,
+) -> dict[str, Any]:
+    """Run mypy cold and warm over ``sources``."""
+    cache = scratch / 'mypy_cache'
+    stats = scratch / 'mypy_timing.txt'
+    env = dict(os.environ, MYPYPATH=str(search_path))
+    command = [
+        sys.executable, '-m', 'mypy',
+        '--cache-dir', str(cache),
+        '--follow-imports', 'silent',
+        '--no-error-summary',
+        '--timing-stats', str(stats),
+        *map(str, sources),
+    ]
+    shutil.rmtree(cache, ignore_errors=True)
+    cold = _run(command, env)
+    modules: dict[str, int] = {}
+    for line in stats.read_text('utf-8').splitlines():
+        module, _, micros = line.rpartition(' ')
+        for stub in _STUB_MODULES:
+            if module == f'qgis.{stub}' or module.startswith(f'qgis.{stub}.'):
+                modules[stub] = modules.get(stub, 0) + int(micros)
+    warm = _run(command, env)
+    for run in (cold, warm):
+        del run['output']
+    return {
+        'cold': cold,
+        'warm': warm,
+        'module_seconds': {k: round(v / 1e6, 4) for k, v in modules.items()},
+    }
+
+
+def bench_pyright(
+    search_path: pathlib.Path,
+    sources: list[pathlib.Path],
+    scratch: pathlib.Path,
+) -> dict[str, Any]:
+    """Run pyright twice over ``sources``.
+
+    pyright has no persistent cache, so the warm run only benefits from the
+    operating system's file cache.
+    """
+    config = scratch / 'pyrightconfig.json'
+    config.write_text(json.dumps({'extraPaths': [str(search_path)]}), 'utf-8')
+    executable = shutil.which('pyright') or 'pyright'
+    command = [executable, '--stats', '-p', str(config), *map(str, sources)]
+    cold = _run(command, dict(os.environ))
+    warm = _run(command, dict(os.environ))
+    phases: dict[str, float] = {}
+    for line in cold['output'].splitlines():
+        m = _PYRIGHT_STAT_RE.match(line.strip())
+        if m:
+            phases[m.group(1).strip().lower().replace(' ', '_')] = float(m.group(2))
+    for run in (cold, warm):
+        del run['output']
+    return {'cold': cold, 'warm': warm, 'phase_seconds': phases}
+
+
+def checker_version(command: list[str]) -> str | None:
+    """Return the version string of a checker, or None if it is missing."""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--stubs',
+        type=pathlib.Path,
+        default=_ROOT / 'qgis-stubs',
+        help='Stub package directory to benchmark (default: qgis-stubs)',
+    )
+    parser.add_argument(
+        '--checker',
+        choices=('mypy', 'pyright'),
+        action='append',
+        help='Type checker to run; may be repeated (default: both)',
+    )
+    parser.add_argument(
+        '--synthetic-modules',
+        type=int,
+        default=200,
+        help='Number of modules in the synthetic client project (default: 200)',
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=pathlib.Path,
+        help='JSON output file (default: benchmarks/<version>.json)',
+    )
+    args = parser.parse_args()
+
+    pyproject = (_ROOT / 'pyproject.toml').read_text('utf-8')
+    version = _VERSION_RE.search(pyproject).group(1)  # type: ignore
+
+    results: dict[str, Any] = {
+        'version': version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'stubs': measure_stubs(args.stubs),
+        'checkers': {},
+    }
+
+    cookbook = sorted((_ROOT / 'tests' / 'manual' / 'pyqgis_cookbook').glob('*.py'))
+    checkers = {
+        'mypy': ([sys.executable, '-m', 'mypy', '--version'], bench_mypy),
+        'pyright': ([shutil.which('pyright') or 'pyright', '--version'], bench_pyright),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = pathlib.Path(tmp)
+        # The stub package directory is not named after the module it
+        # provides, so expose it to the checkers as ``qgis``.
+        search_path = scratch / 'search'
+        search_path.mkdir()
+        (search_path / 'qgis').symlink_to(args.stubs.resolve(), target_is_directory=True)
+
+        synthetic = scratch / 'synthetic'
+        write_synthetic_project(args.stubs, synthetic, args.synthetic_modules)
+        workloads = {
+            'cookbook': cookbook,
+            'synthetic': sorted(synthetic.glob('*.py')),
+        }
+
+        for name in args.checker or list(checkers):
+            version_command, bench = checkers[name]
+            checker = checker_version(version_command)
+            if checker is None:
+                print(f'Skipping {name}: not installed.')
+                continue
+            results['checkers'][name] = {'version': checker}
+            for workload, sources in workloads.items():
+                print(f'Running {name} on {workload} ({len(sources)} files)...')
+                run_scratch = scratch / f'{name}-{workload}'
+                run_scratch.mkdir()
+                results['checkers'][name][workload] = bench(
+                    search_path, sources, run_scratch)
+
+    output = args.output or _ROOT / 'benchmarks' / f'{version}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + '\n', encoding='utf-8')
+    print(f'Wrote results to {output}.')
+
+
+if __name__ == '__main__':
+    main()
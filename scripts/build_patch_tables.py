@@ -0,0 +1,251 @@
+"""Replace the generated class patch blocks of runtime modules with tables.
+
+sipify emits one block per class into the ``__init__.py`` of qgis.core,
+qgis.gui and qgis.analysis:
+
+    try:
+        QgsZipItem.vsiPrefix = staticmethod(QgsZipItem.vsiPrefix)
+        QgsZipItem.__overridden_methods__ = ['createChildren', 'mimeUris']
+        QgsZipItem.__group__ = ['browser']
+    except (NameError, AttributeError):
+        pass
+
+Blocks which only contain staticmethod patches and metadata assignments of
+literals are removed and written to a ``_patches.py`` table next to the
+module, grouped by the header they were generated from:
+
+    PATCHES = (
+        ('src/core/browser/qgszipitem.h', (
+            ('QgsZipItem', ('vsiPrefix', ('__overridden_methods__', ('createChildren', 'mimeUris')), ('__group__', ('browser',)))),
+        )),
+    )
+
+Lists are stored as tuples and dicts as tuples of pairs, so the whole table
+is a single constant. A call to ``qgis.core.additions.patchtables.apply_patches``,
+which replays the table with the semantics of the original blocks, is
+inserted before the first generated section. Header comments of sections
+left empty are removed as well. Other blocks (e.g. ``__annotations__``
+referring to types) are kept as they are.
+"""
+
+import argparse
+import ast
+import pathlib
+import re
+
+_TABLE_NAME = '_patches.py'
+_APPLY = '_apply_patches'
+_HEADER_RE = re.compile(r'^# The following has been generated automatically from (\S+)$')
+_HANDLER = '(NameError, AttributeError)'
+# Must match qgis.core.additions.patchtables
+_DICT_ATTRIBUTES = frozenset({'__annotations__', '__attribute_docs__', '__signal_arguments__'})
+
+_Operation = str | tuple[str, object]
+
+
+def _dotted(node: ast.expr) -> str | None:
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    names.append(node.id)
+    return '.'.join(reversed(names))
+
+
+def _freeze(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    raise ValueError(value)
+
+
+def _thaw(value: object) -> object:
+    if value.__class__ is tuple:
+        return [_thaw(v) for v in value]  # type: ignore
+    return value
+
+
+def _metadata(attribute: str, value: object) -> tuple[str, object] | None:
+    """Return the table form of a metadata value, or None if it has none."""
+    try:
+        if attribute in _DICT_ATTRIBUTES:
+            if not isinstance(value, dict):
+                return None
+            frozen = tuple((k, _freeze(v)) for k, v in value.items())
+            restored = {k: _thaw(v) for k, v in frozen}
+        else:
+            frozen = _freeze(value)
+            restored = _thaw(frozen)
+    except ValueError:
+        return None
+    if repr(restored) != repr(value):
+        return None
+    return attribute, frozen
+
+
+def _operation(stmt: ast.stmt) -> tuple[str, _Operation] | None:
+    """Return the owner and table operation of a patch statement."""
+    if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+        return None
+    target = stmt.targets[0]
+    if not isinstance(target, ast.Attribute):
+        return None
+    owner = _dotted(target.value)
+    if owner is None:
+        return None
+    value = stmt.value
+    if isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+        if (value.func.id == 'staticmethod' and len(value.args) == 1
+                and not value.keywords and _dotted(value.args[0]) == f'{owner}.{target.attr}'):
+            return owner, target.attr
+        return None
+    if not (target.attr.startswith('__') and target.attr.endswith('__')):
+        return None
+    try:
+        literal = ast.literal_eval(value)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+    metadata = _metadata(target.attr, literal)
+    return None if metadata is None else (owner, metadata)
+
+
+def _block(node: ast.stmt) -> tuple[str, tuple[_Operation, ...]] | None:
+    """Return the table entry of a generated patch block."""
+    if not isinstance(node, ast.Try) or node.orelse or node.finalbody:
+        return None
+    if len(node.handlers) != 1 or node.handlers[0].type is None:
+        return None
+    if ast.unparse(node.handlers[0].type) != _HANDLER:
+        return None
+    owners = set()
+    operations = []
+    for stmt in node.body:
+        result = _operation(stmt)
+        if result is None:
+            return None
+        owners.add(result[0])
+        operations.append(result[1])
+    if len(owners) != 1:
+        return None
+    return owners.pop(), tuple(operations)
+
+
+def build_tables(
+    source: str,
+) -> tuple[str, list[tuple[str, list[tuple[str, tuple[_Operation, ...]]]]]]:
+    """Remove the tabled patch blocks from a module's source.
+
+    Returns the new source and the table sections in order.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    headers = {
+        i + 1: match.group(1)
+        for i, line in enumerate(lines)
+        if (match := _HEADER_RE.match(line.rstrip('\n')))
+    }
+    header_lines = sorted(headers)
+
+    sections: list[tuple[str, list]] = []
+    removed: list[tuple[int, int]] = []
+    # header line -> [statements, statements removed]
+    remaining: dict[int, list[int]] = {}
+    for node in tree.body:
+        owner_header = max((h for h in header_lines if h < node.lineno), default=None)
+        if owner_header is None:
+            continue
+        stats = remaining.setdefault(owner_header, [0, 0])
+        stats[0] += 1
+        entry = _block(node)
+        if entry is None:
+            continue
+        stats[1] += 1
+        header = headers[owner_header]
+        if not sections or sections[-1][0] != header:
+            sections.append((header, []))
+        sections[-1][1].append(entry)
+        removed.append((node.lineno, node.end_lineno or node.lineno))
+
+    for line, (total, count) in remaining.items():
+        if total == count:
+            removed.append((line, line))
+    for start, end in sorted(removed, reverse=True):
+        del lines[start - 1:end]
+    return ''.join(lines), sections
+
+
+def write_table(path: pathlib.Path, module: str, sections: list) -> None:
+    out = [
+        '# -*- coding: utf-8 -*-\n',
+        '"""\n',
+        f'Generated class patches of the {module} bindings, applied on import\n',
+        '\n',
+        'This file has been generated by scripts/build_patch_tables.py\n',
+        'It is not aimed to be manually edited\n',
+        '"""\n',
+        '\n',
+        'PATCHES = (\n',
+    ]
+    for header, classes in sections:
+        out.append(f'    ({header!r}, (\n')
+        out.extend(f'        ({owner!r}, {operations!r}),\n' for owner, operations in classes)
+        out.append('    )),\n')
+    out.append(')\n')
+    path.write_text(''.join(out), encoding='utf-8')
+
+
+def _insert_position(source: str) -> int:
+    """Return the index of the line to insert the apply call before."""
+    for i, line in enumerate(source.splitlines()):
+        if _HEADER_RE.match(line):
+            return i
+    raise ValueError('no generated section found')
+
+
+def build_module(init: pathlib.Path) -> int:
+    """Move the patch blocks of a runtime ``__init__.py`` into its table.
+
+    Returns the number of blocks moved.
+    """
+    source = init.read_text('utf-8')
+    if _APPLY in source:
+        raise ValueError(f'{init} already uses a patch table')
+    module = f'qgis.{init.parent.name}'
+    position = _insert_position(source)
+    source, sections = build_tables(source)
+    count = sum(len(classes) for _, classes in sections)
+    if not count:
+        return 0
+
+    write_table(init.parent / _TABLE_NAME, module, sections)
+    lines = source.splitlines(keepends=True)
+    lines[position:position] = [
+        '# Generated staticmethod and metadata patches are applied from a table\n',
+        f'from qgis.core.additions.patchtables import apply_patches as {_APPLY}\n',
+        f"{_APPLY}(globals(), '{module}._patches')\n",
+    ]
+    init.write_text(''.join(lines), encoding='utf-8')
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'modules',
+        type=pathlib.Path,
+        nargs='+',
+        help='Runtime __init__.py files to process (e.g. qgis/core/__init__.py)',
+    )
+    args = parser.parse_args()
+
+    for init in args.modules:
+        count = build_module(init)
+        print(f'Moved {count} patch blocks from {init} to {init.parent / _TABLE_NAME}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+"""Compact ``@typing.overload`` sets in SIP-generated .pyi stubs.
+
+SIP emits one overload per C++ signature, so many overload sets contain
+entries that a type checker can never select or that only differ in a single
+parameter type. Every overload is a candidate during overload resolution, so
+removing them makes calls on hot classes cheaper to check.
+
+Parameter and return annotations are compared after normalizing unions:
+
+    'QgsPointXY'                    →  QgsPointXY
+    typing.Optional[X]              →  typing.Union[X, None]
+    X | Y, typing.Union[Y, X, X]    →  typing.Union[X, Y]
+
+Within each overload set, three rules are applied until nothing changes:
+
+    duplicate   An overload that is equivalent to an earlier one is removed.
+    dominated   An overload whose parameters all accept a subset of the types
+                accepted by the same parameters of an earlier overload is
+                removed, as the earlier overload always matches first.
+    merged      Two adjacent overloads that only differ in the type of one
+                parameter and have the same return type are merged into one
+                overload accepting the union of both types.
+
+Overloads must have the same parameter names, kinds and defaults as well as
+the same decorators to be compared at all. If a single overload remains, its
+``@typing.overload`` decorator is dropped.
+"""
+
+import argparse
+import ast
+import pathlib
+from dataclasses import dataclass
+from typing import Union
+
+# A normalized type: either a plain dotted name / subscript string or a
+# frozenset of member types for unions.
+_Type = Union[str, frozenset]
+_ANY = 'typing.Any'
+_UNION_NAMES = frozenset({'typing.Union', 'Union'})
+_OPTIONAL_NAMES = frozenset({'typing.Optional', 'Optional'})
+_OVERLOAD_NAMES = frozenset({'typing.overload', 'overload'})
+
+
+@dataclass
+class Stats:
+    """Number of overloads removed by each rule."""
+
+    duplicate: int = 0
+    dominated: int = 0
+    merged: int = 0
+
+    @property
+    def removed(self) -> int:
+        return self.duplicate + self.dominated + self.merged
+
+
+def _members(node: ast.expr) -> list[ast.expr]:
+    """Flatten a union annotation into its member expressions."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        try:
+            parsed = ast.parse(node.value, mode='eval').body
+        except SyntaxError:
+            return [node]
+        return _members(parsed)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _members(node.left) + _members(node.right)
+    if isinstance(node, ast.Subscript):
+        name = ast.unparse(node.value)
+        elements = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        if name in _UNION_NAMES:
+            return [m for e in elements for m in _members(e)]
+        if name in _OPTIONAL_NAMES:
+            return _members(node.slice) + [ast.Constant(None)]
+    return [node]
+
+
+def normalize(node: ast.expr | None) -> _Type:
+    """Return a hashable, order-independent key for an annotation."""
+    if node is None:
+        return ''
+    members = _members(node)
+    if len(members) > 1:
+        keys = frozenset(normalize(m) for m in members)
+        return next(iter(keys)) if len(keys) == 1 else keys
+    (node,) = members
+    if isinstance(node, ast.Subscript):
+        elements = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        args = ', '.join(repr(normalize(e)) for e in elements)
+        return f'{ast.unparse(node.value)}[{args}]'
+    if isinstance(node, ast.List):
+        return f'[{", ".join(repr(normalize(e)) for e in node.elts)}]'
+    return ast.unparse(node)
+
+
+def _as_set(key: _Type) -> frozenset:
+    return key if isinstance(key, frozenset) else frozenset({key})
+
+
+def _accepts(wide: _Type, narrow: _Type) -> bool:
+    wide_set = _as_set(wide)
+    return _ANY in wide_set or _as_set(narrow) <= wide_set
+
+
+@dataclass
+class _Overload:
+    node: ast.FunctionDef
+    start: int
+    decorators: tuple[str, ...]
+    structure: tuple
+    params: list[ast.arg]
+    param_keys: list[_Type]
+    returns: _Type
+
+
+def _parse_overload(node: ast.FunctionDef) -> _Overload:
+    args = node.args
+    params = [*args.posonlyargs, *args.args, *args.kwonlyargs]
+    if args.vararg:
+        params.append(args.vararg)
+    if args.kwarg:
+        params.append(args.kwarg)
+    defaults = [None] * (len(args.posonlyargs) + len(args.args) - len(args.defaults))
+    defaults += args.defaults
+    structure = (
+        tuple(a.arg for a in args.posonlyargs),
+        tuple(a.arg for a in args.args),
+        tuple(d is not None for d in defaults),
+        tuple(a.arg for a in args.kwonlyargs),
+        tuple(d is not None for d in args.kw_defaults),
+        args.vararg.arg if args.vararg else None,
+        args.kwarg.arg if args.kwarg else None,
+    )
+    decorators = tuple(
+        ast.unparse(d) for d in node.decorator_list
+        if ast.unparse(d) not in _OVERLOAD_NAMES
+    )
+    return _Overload(
+        node=node,
+        start=min([node.lineno] + [d.lineno for d in node.decorator_list]),
+        decorators=decorators,
+        structure=structure,
+        params=params,
+        param_keys=[normalize(p.annotation) for p in params],
+        returns=normalize(node.returns),
+    )
+
+
+def _comparable(a: _Overload, b: _Overload) -> bool:
+    return a.decorators == b.decorators and a.structure == b.structure
+
+
+def _dominates(a: _Overload, b: _Overload) -> bool:
+    return _comparable(a, b) and all(
+        _accepts(wide, narrow) for wide, narrow in zip(a.param_keys, b.param_keys))
+
+
+def _format_union(members: list[str]) -> str:
+    values = [m for m in members if m != 'None']
+    inner = values[0] if len(values) == 1 else f'typing.Union[{", ".join(values)}]'
+    return f'typing.Optional[{inner}]' if 'None' in members else inner
+
+
+def _merge(a: _Overload, b: _Overload, line: str) -> str | None:
+    """Return ``a``'s def line accepting the union of both parameter types.
+
+    Returns None if the overloads cannot be merged.
+    """
+    if not _comparable(a, b) or a.returns != b.returns:
+        return None
+    if a.node.lineno != a.node.end_lineno:
+        return None
+    differing = [
+        i for i, (ka, kb) in enumerate(zip(a.param_keys, b.param_keys)) if ka != kb
+    ]
+    if len(differing) != 1:
+        return None
+    index = differing[0]
+    annotation_a = a.params[index].annotation
+    annotation_b = b.params[index].annotation
+    if annotation_a is None or annotation_b is None:
+        return None
+
+    members: list[str] = []
+    seen: set[_Type] = set()
+    for member in _members(annotation_a) + _members(annotation_b):
+        key = normalize(member)
+        if key not in seen:
+            seen.add(key)
+            members.append(ast.unparse(member) if not isinstance(member, ast.Constant)
+                           or member.value is None else repr(member.value))
+    start, end = annotation_a.col_offset, annotation_a.end_col_offset
+    encoded = line.encode('utf-8')
+    return (
+        encoded[:start].decode('utf-8')
+        + _format_union(members)
+        + encoded[end:].decode('utf-8')
+    )
+
+
+def _reparse(line: str, original: ast.FunctionDef) -> ast.FunctionDef:
+    """Parse a rewritten single-line def so that later rules can use it."""
+    # Wrapping indented lines in a block keeps their column offsets intact.
+    source = f'if 1:\n{line}' if line[:1].isspace() else line
+    tree = ast.parse(source)
+    node = tree.body[0]
+    if isinstance(node, ast.If):
+        node = node.body[0]
+    assert isinstance(node, ast.FunctionDef)
+    node.lineno = node.end_lineno = original.lineno
+    node.decorator_list = original.decorator_list
+    return node
+
+
+def _compact_group(
+    group: list[ast.FunctionDef],
+    lines: list[str],
+    stats: Stats,
+) -> list[str] | None:
+    """Return replacement lines for an overload group, or None if unchanged."""
+    overloads = [_parse_overload(node) for node in group]
+    texts = [lines[o.start - 1:o.node.end_lineno] for o in overloads]
+    changed = False
+
+    progress = True
+    while progress and len(overloads) > 1:
+        progress = False
+        for j in range(1, len(overloads)):
+            for i in range(j):
+                a, b = overloads[i], overloads[j]
+                if _comparable(a, b) and a.param_keys == b.param_keys and a.returns == b.returns:
+                    stats.duplicate += 1
+                elif _dominates(a, b):
+                    stats.dominated += 1
+                else:
+                    continue
+                del overloads[j], texts[j]
+                progress = changed = True
+                break
+            if progress:
+                break
+        if progress:
+            continue
+        for i in range(len(overloads) - 1):
+            a, b = overloads[i], overloads[i + 1]
+            merged = _merge(a, b, texts[i][-1])
+            if merged is None:
+                continue
+            overloads[i] = _parse_overload(_reparse(merged, a.node))
+            overloads[i].start = a.start
+            texts[i] = texts[i][:-1] + [merged]
+            del overloads[i + 1], texts[i + 1]
+            stats.merged += 1
+            progress = changed = True
+            break
+
+    if not changed:
+        return None
+    if len(overloads) == 1:
+        texts[0] = [
+            line for line in texts[0]
+            if line.strip().lstrip('@') not in _OVERLOAD_NAMES
+        ]
+    return [line for text in texts for line in text]
+
+
+def _overload_groups(body: list[ast.stmt]) -> list[list[ast.FunctionDef]]:
+    groups: list[list[ast.FunctionDef]] = []
+    current: list[ast.FunctionDef] = []
+    for node in body:
+        is_overload = isinstance(node, ast.FunctionDef) and any(
+            ast.unparse(d) in _OVERLOAD_NAMES for d in node.decorator_list)
+        if is_overload and current and node.name == current[0].name:  # type: ignore
+            current.append(node)  # type: ignore
+            continue
+        if len(current) > 1:
+            groups.append(current)
+        current = [node] if is_overload else []  # type: ignore
+        if isinstance(node, ast.ClassDef):
+            groups.extend(_overload_groups(node.body))
+    if len(current) > 1:
+        groups.append(current)
+    return groups
+
+
+def compact_stub(stub_path: pathlib.Path, stats: Stats) -> int:
+    """Compact all overload sets in a stub file in place.
+
+    Returns the number of overloads removed from the file.
+    """
+    source = stub_path.read_text('utf-8')
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    before = stats.removed
+
+    groups = _overload_groups(tree.body)
+    # Descending order keeps the line numbers of earlier groups valid.
+    groups.sort(key=lambda g: g[0].lineno, reverse=True)
+    for group in groups:
+        replacement = _compact_group(group, lines, stats)
+        if replacement is None:
+            continue
+        start = min([group[0].lineno] + [d.lineno for d in group[0].decorator_list])
+        lines[start - 1:group[-1].end_lineno] = replacement
+
+    removed = stats.removed - before
+    if removed:
+        stub_path.write_text(''.join(lines), encoding='utf-8')
+    return removed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'stubs',
+        type=pathlib.Path,
+        nargs='+',
+        help='.pyi stub files or stub package directories to compact (e.g. qgis/_core/)',
+    )
+    args = parser.parse_args()
+
+    stats = Stats()
+    for path in args.stubs:
+        stubs = sorted(path.glob('*.pyi')) if path.is_dir() else [path]
+        for stub in stubs:
+            count = compact_stub(stub, stats)
+            if count:
+                print(f'Removed {count} overloads from {stub}.')
+
+    print(
+        f'Removed {stats.removed} overloads in total '
+        f'({stats.duplicate} duplicate, {stats.dominated} dominated, '
+        f'{stats.merged} merged).'
+    )
+
+
+if __name__ == '__main__':
+    main()
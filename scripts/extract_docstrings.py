@@ -0,0 +1,238 @@
+"""Move the docstring assignments of runtime modules into side tables.
+
+sipify emits thousands of ``X.Y.__doc__ = "..."`` statements into the
+``__init__.py`` of qgis.core, qgis.gui and qgis.analysis, which are all
+executed on import. This script removes every module-level docstring
+assignment of a string literal (including those in the generated ``try:``
+blocks) and writes them, in their original order, to a ``_docs.py`` side
+table next to the module:
+
+    DOCS = (
+        ('Qgis.LayerType.Vector', 'Vector layer'),
+        ...
+    )
+
+The table is a single constant, so it is loaded from the ``.pyc`` in one go.
+It holds one entry per target, in the order of the last docstring assignment
+of each target.
+
+A docstring assignment whose target (or the owner of the target) is
+reassigned later in the module, e.g. the ``QgsPalLayerSettings.OverPoint``
+alias of two different enum members, documents the object assigned before.
+Such assignments are left in the module, as the table is applied to the
+objects bound at the end of the module.
+A call to ``qgis.core.additions.lazydocs.register_docs`` is appended to the
+module, which installs the docstrings on import or, if ``QGIS_LAZY_DOCS`` is
+set, on the first call to ``help()`` or to the module's ``load_docs()``.
+"""
+
+import argparse
+import ast
+import pathlib
+
+_TABLE_NAME = '_docs.py'
+_REGISTER = '_register_docs'
+
+
+def _dotted_name(node: ast.expr) -> str | None:
+    """Return ``a.b.c`` for a chain of attribute accesses on a name."""
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    names.append(node.id)
+    return '.'.join(reversed(names))
+
+
+def _dotted_target(node: ast.stmt) -> str | None:
+    """Return the dotted owner of a ``<owner>.__doc__ = '...'`` statement."""
+    if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+        return None
+    target = node.targets[0]
+    if not isinstance(target, ast.Attribute) or target.attr != '__doc__':
+        return None
+    if not isinstance(node.value, ast.Constant) or not isinstance(node.value.value, str):
+        return None
+    return _dotted_name(target.value)
+
+
+def _assigned_names(node: ast.stmt) -> list[str]:
+    """Return the dotted names bound by an assignment statement."""
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+        targets = [node.target]
+    else:
+        return []
+    return [name for name in map(_dotted_name, targets) if name is not None]
+
+
+def _is_rebound(target: str, names: set[str]) -> bool:
+    """Return whether ``target`` or one of its owners is in ``names``."""
+    parts = target.split('.')
+    return any('.'.join(parts[:i]) in names for i in range(1, len(parts) + 1))
+
+
+def extract_docs(
+    source: str,
+) -> tuple[str, list[tuple[str, str]]]:
+    """Remove the docstring assignments from a module's source.
+
+    Docstring assignments to targets which are rebound later in the module
+    are kept in place.
+
+    Returns the new source and the ``(target, docstring)`` pairs, one per
+    target, in the order of their last assignment.
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    # Module-level statements and those of the generated try blocks
+    statements: list[tuple[ast.stmt, ast.Try | None]] = []
+    for node in tree.body:
+        if isinstance(node, ast.Try):
+            statements.extend((stmt, node) for stmt in node.body)
+        else:
+            statements.append((node, None))
+
+    # Walk backwards to know the names rebound after each statement
+    rebound: set[str] = set()
+    extracted: list[tuple[ast.stmt, ast.Try | None, str]] = []
+    for stmt, block in reversed(statements):
+        target = _dotted_target(stmt)
+        if target is not None and not _is_rebound(target, rebound):
+            extracted.append((stmt, block, target))
+        elif target is None:
+            rebound.update(_assigned_names(stmt))
+    extracted.reverse()
+
+    docs: dict[str, str] = {}
+    # 1-based inclusive line ranges to drop
+    removed: list[tuple[int, int]] = []
+    emptied: dict[ast.Try, int] = {}
+    for stmt, block, target in extracted:
+        # Keep the position of the last assignment, which is the effective one
+        docs.pop(target, None)
+        docs[target] = stmt.value.value  # type: ignore
+        removed.append((stmt.lineno, stmt.end_lineno or stmt.lineno))
+        if block is not None:
+            emptied[block] = emptied.get(block, 0) + 1
+    for block, count in emptied.items():
+        if count == len(block.body):
+            # Nothing left to guard, drop the whole block
+            removed = [r for r in removed if not block.lineno <= r[0] <= (block.end_lineno or block.lineno)]
+            removed.append((block.lineno, block.end_lineno or block.lineno))
+
+    # A comment introducing only removed statements goes with them, together
+    # with the blank lines separating it from the previous statement
+    removed_nodes = set(removed)
+    for gap_start, nodes in _comment_sections(tree.body, lines):
+        if all((node.lineno, node.end_lineno or node.lineno) in removed_nodes for node in nodes):
+            end = nodes[-1].end_lineno or nodes[-1].lineno
+            removed = [r for r in removed if not gap_start <= r[0] <= end]
+            removed.append((gap_start, end))
+
+    for start, end in sorted(removed, reverse=True):
+        del lines[start - 1:end]
+    return ''.join(lines), list(docs.items())
+
+
+def _comment_sections(
+    nodes: list[ast.stmt],
+    lines: list[str],
+) -> list[tuple[int, list[ast.stmt]]]:
+    """Return the sections of a module introduced by a comment.
+
+    A section holds the statements following a comment, up to the next two
+    consecutive blank lines or the end of the module. Statements followed by
+    another comment first, like the generated ``# --`` separated blocks, are
+    not part of a section. Returns the first line after the previous
+    statement (1-based) and the statements of each section.
+    """
+    sections: list[tuple[int, list[ast.stmt]]] = []
+    current: tuple[int, list[ast.stmt]] | None = None
+    previous_end = 0
+    for node in [*nodes, None]:
+        if node is None:
+            start = len(lines) + 1
+            gap = lines[previous_end:] + ['\n', '\n']
+        else:
+            start = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+            gap = lines[previous_end:start - 1]
+        commented = any(line.startswith('#') for line in gap)
+        separated = any(not line.strip() and not following.strip() for line, following in zip(gap, gap[1:]))
+        if current is not None:
+            if separated and not commented:
+                sections.append(current)
+                current = None
+            elif commented:
+                current = None
+            else:
+                current[1].append(node)
+        if commented and node is not None:
+            current = (previous_end + 1, [node])
+        if node is not None:
+            previous_end = node.end_lineno or node.lineno
+    return sections
+
+
+def write_table(path: pathlib.Path, module: str, docs: list[tuple[str, str]]) -> None:
+    out = [
+        '# -*- coding: utf-8 -*-\n',
+        '"""\n',
+        f'Docstrings of the {module} bindings, installed by {module}.load_docs()\n',
+        '\n',
+        'This file has been generated by scripts/extract_docstrings.py\n',
+        'It is not aimed to be manually edited\n',
+        '"""\n',
+        '\n',
+        'DOCS = (\n',
+    ]
+    out.extend(f'    ({target!r}, {doc!r}),\n' for target, doc in docs)
+    out.append(')\n')
+    path.write_text(''.join(out), encoding='utf-8')
+
+
+def extract_module(init: pathlib.Path) -> int:
+    """Move the docstrings of a runtime ``__init__.py`` into its side table.
+
+    Returns the number of docstrings moved.
+    """
+    source = init.read_text('utf-8')
+    if _REGISTER in source:
+        raise ValueError(f'{init} already uses a docstring side table')
+    module = f'qgis.{init.parent.name}'
+    source, docs = extract_docs(source)
+    if not docs:
+        return 0
+
+    write_table(init.parent / _TABLE_NAME, module, docs)
+    source = source.rstrip('\n') + (
+        '\n\n'
+        '# Docstrings are installed from a side table, lazily if QGIS_LAZY_DOCS is set\n'
+        f'from qgis.core.additions.lazydocs import register_docs as {_REGISTER}\n'
+        f"load_docs = {_REGISTER}(globals(), '{module}._docs')\n"
+    )
+    init.write_text(source, encoding='utf-8')
+    return len(docs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'modules',
+        type=pathlib.Path,
+        nargs='+',
+        help='Runtime __init__.py files to process (e.g. qgis/core/__init__.py)',
+    )
+    args = parser.parse_args()
+
+    for init in args.modules:
+        count = extract_module(init)
+        print(f'Moved {count} docstrings from {init} to {init.parent / _TABLE_NAME}.')
+
+
+if __name__ == '__main__':
+    main()
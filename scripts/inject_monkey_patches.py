@@ -12,19 +12,39 @@ Assignments whose LHS has three or more dotted parts (e.g.
 more parts (e.g. ``.value`` suffix) are silently skipped.
 
 Classes not found as top-level definitions in the target stub are also skipped.
+The target may also be a stub package directory (e.g. ``qgis/_core/`` as
+produced by ``split_stub_by_group.py``), in which case every shard is patched.
+
+With ``--batch``, all module pairs listed in a manifest are patched at once
+in a process pool, using the streaming mode. Each manifest line holds a
+runtime module and its stub, relative to ``--root``::
+
+    core/__init__.py    _core
+    gui/__init__.py     _gui.pyi
+
+In batch mode, patch attributes that the target class already declares with
+the same annotation are skipped, so re-running a batch is a no-op. Attributes
+declared differently are reported as conflicts and not injected, as are
+stubs listed more than once. The exit status is non-zero on any conflict.
 """
 
 import argparse
 import ast
+import os
 import pathlib
 import re
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 # Matches exactly two-part LHS:  ClassName.attr = rhs
 _ASSIGN_RE = re.compile(
     r'^([A-Za-z]\w+)\.([A-Za-z_]\w*)\s*=\s*([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)$'
 )
 _SKIP_ATTRS = frozenset({'is_monkey_patched', '__doc__', 'baseClass'})
+_CLASS_RE = re.compile(r'^class\s+([A-Za-z_]\w*)')
+# Matches a member declared directly in a class body (4-space indent)
+_MEMBER_RE = re.compile(r'^    (?:def\s+|class\s+)?([A-Za-z_]\w*)\s*[:=(]')
 
 
 def parse_patches(
@@ -104,24 +124,272 @@ def inject_into_stub(
     return len(targets)
 
 
+def _scan_line(line: str, depth: int, quote: str | None) -> tuple[int, str | None]:
+    """Update bracket depth and open triple-quote state after ``line``."""
+    if quote is None and '"' not in line and "'" not in line and '#' not in line:
+        # Fast path for the vast majority of stub lines
+        return depth + sum(map(line.count, '([{')) - sum(map(line.count, ')]}')), None
+
+    i = 0
+    n = len(line)
+    while i < n:
+        if quote is not None:
+            end = line.find(quote, i)
+            if end < 0:
+                return depth, quote
+            i = end + 3
+            quote = None
+            continue
+        c = line[i]
+        if c == '#':
+            break
+        if c in '\'"':
+            if line.startswith(c * 3, i):
+                quote = c * 3
+                i += 3
+                continue
+            # Single-quoted strings cannot span lines
+            i += 1
+            while i < n and line[i] != c:
+                i += 2 if line[i] == '\\' else 1
+        elif c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        i += 1
+    return depth, quote
+
+
+def inject_into_stub_streaming(
+    stub_path: pathlib.Path,
+    patches: dict[str, list[tuple[str, str]]],
+) -> int:
+    """Streaming equivalent of :func:`inject_into_stub`.
+
+    Scans the stub line by line and tracks top-level class bodies by
+    indentation instead of parsing the whole file. Blank and comment lines
+    after the last statement of a patched class are held back until the
+    class ends, so the annotations are inserted at the same place as in the
+    AST mode. The output is written incrementally to a temporary file that
+    replaces the stub at the end.
+
+    Returns the number of classes modified.
+    """
+    count = 0
+    current: str | None = None
+    pending: list[str] = []
+    depth = 0
+    quote: str | None = None
+    tmp_path = stub_path.with_name(stub_path.name + '.tmp')
+
+    with open(stub_path, encoding='utf-8') as src, \
+            open(tmp_path, 'w', encoding='utf-8') as dst:
+        for line in src:
+            continuation = depth > 0 or quote is not None
+            depth, quote = _scan_line(line, depth, quote)
+            if continuation:
+                # Part of a multi-line statement; always code
+                dst.writelines(pending)
+                pending.clear()
+                dst.write(line)
+                continue
+
+            stripped = line.lstrip()
+            trivia = not stripped.strip() or stripped.startswith('#')
+            if current is not None:
+                if trivia:
+                    pending.append(line)
+                    continue
+                if not line[0].isspace():
+                    # Dedent to column zero ends the class body
+                    dst.writelines(
+                        f'    {attr}: {annotation}\n'
+                        for attr, annotation in patches[current]
+                    )
+                    current = None
+                dst.writelines(pending)
+                pending.clear()
+
+            if line.startswith('class '):
+                m = _CLASS_RE.match(line)
+                if m and m.group(1) in patches:
+                    current = m.group(1)
+                    count += 1
+            dst.write(line)
+
+        if current is not None:
+            dst.writelines(
+                f'    {attr}: {annotation}\n'
+                for attr, annotation in patches[current]
+            )
+        dst.writelines(pending)
+
+    os.replace(tmp_path, stub_path)
+    return count
+
+
+def _class_members(
+    stub_path: pathlib.Path,
+    class_names: set[str],
+) -> dict[str, dict[str, str]]:
+    """Return ``{class: {member: declaration}}`` for the given top-level classes."""
+    members: dict[str, dict[str, str]] = defaultdict(dict)
+    current: str | None = None
+    with open(stub_path, encoding='utf-8') as src:
+        for line in src:
+            if line.startswith('class '):
+                m = _CLASS_RE.match(line)
+                current = m.group(1) if m and m.group(1) in class_names else None
+            elif line[:1] not in ('', ' ', '\t', '\n', '#'):
+                current = None
+            elif current is not None:
+                m = _MEMBER_RE.match(line)
+                if m:
+                    members[current].setdefault(m.group(1), line.strip())
+    return members
+
+
+def _stub_files(stub: pathlib.Path) -> list[pathlib.Path]:
+    return sorted(stub.glob('*.pyi')) if stub.is_dir() else [stub]
+
+
+def _inject_checked(
+    stub_path: pathlib.Path,
+    patches: dict[str, list[tuple[str, str]]],
+) -> tuple[int, list[str]]:
+    """Inject patches into one stub file, skipping already declared members.
+
+    Returns the number of classes modified and the skipped conflicts.
+    """
+    members = _class_members(stub_path, set(patches))
+    conflicts: list[str] = []
+    checked: dict[str, list[tuple[str, str]]] = {}
+    for class_name, entries in patches.items():
+        existing = members.get(class_name, {})
+        kept = []
+        for attr, annotation in entries:
+            declaration = existing.get(attr)
+            if declaration is None:
+                kept.append((attr, annotation))
+            elif declaration != f'{attr}: {annotation}':
+                conflicts.append(
+                    f'{stub_path}: {class_name}.{attr} is already declared as {declaration!r}')
+        if kept:
+            checked[class_name] = kept
+    return inject_into_stub_streaming(stub_path, checked), conflicts
+
+
+def read_batch_manifest(
+    manifest_path: pathlib.Path,
+    root: pathlib.Path,
+) -> list[tuple[pathlib.Path, pathlib.Path]]:
+    """Return the ``(init, stub)`` pairs listed in a batch manifest."""
+    pairs = []
+    for line in manifest_path.read_text('utf-8').splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        init, stub = line.split()
+        pairs.append((root / init, root / stub))
+    return pairs
+
+
+def inject_batch(
+    pairs: list[tuple[pathlib.Path, pathlib.Path]],
+    jobs: int | None = None,
+) -> tuple[dict[pathlib.Path, int], list[str]]:
+    """Inject patches for several module pairs concurrently.
+
+    Every stub file (or shard of a stub package) is processed by its own
+    worker process.
+
+    Returns the number of classes modified per stub and all conflicts.
+    """
+    conflicts: list[str] = []
+    counts: dict[pathlib.Path, int] = {}
+    tasks: list[tuple[pathlib.Path, pathlib.Path, dict[str, list[tuple[str, str]]]]] = []
+    seen: set[pathlib.Path] = set()
+    for init, stub in pairs:
+        if stub.resolve() in seen:
+            conflicts.append(f'{stub}: listed more than once')
+            continue
+        seen.add(stub.resolve())
+        patches = parse_patches(init)
+        counts[stub] = 0
+        tasks.extend((stub, path, patches) for path in _stub_files(stub))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            (stub, pool.submit(_inject_checked, path, patches))
+            for stub, path, patches in tasks
+        ]
+        for stub, future in futures:
+            count, file_conflicts = future.result()
+            counts[stub] += count
+            conflicts.extend(file_conflicts)
+    return counts, conflicts
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument(
         'init',
         type=pathlib.Path,
+        nargs='?',
         help='Runtime module with monkey-patch assignments (e.g. qgis/core/__init__.py)',
     )
     parser.add_argument(
         'stub',
         type=pathlib.Path,
-        help='.pyi stub file to inject annotations into (e.g. qgis/_core.pyi)',
+        nargs='?',
+        help='.pyi stub file or stub package directory to inject annotations into (e.g. qgis/_core.pyi)',
+    )
+    parser.add_argument(
+        '--streaming',
+        action='store_true',
+        help='Scan the stub line by line instead of parsing it (same output, less memory)',
+    )
+    parser.add_argument(
+        '--batch',
+        type=pathlib.Path,
+        metavar='MANIFEST',
+        help='Patch all module pairs listed in MANIFEST concurrently',
+    )
+    parser.add_argument(
+        '--root',
+        type=pathlib.Path,
+        help='Directory the manifest paths are relative to (default: the manifest directory)',
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Number of worker processes in batch mode (default: CPU count)',
     )
     args = parser.parse_args()
 
+    if args.batch is not None:
+        if args.init is not None or args.stub is not None:
+            parser.error('init and stub cannot be combined with --batch')
+        pairs = read_batch_manifest(args.batch, args.root or args.batch.parent)
+        counts, conflicts = inject_batch(pairs, args.jobs)
+        for stub, count in counts.items():
+            print(f'Injected annotations into {count} classes in {stub}.')
+        print(f'Injected annotations into {sum(counts.values())} classes in total.')
+        for conflict in conflicts:
+            print(f'Conflict: {conflict}', file=sys.stderr)
+        if conflicts:
+            sys.exit(f'{len(conflicts)} conflicts.')
+        return
+
+    if args.init is None or args.stub is None:
+        parser.error('init and stub are required unless --batch is given')
+    inject = inject_into_stub_streaming if args.streaming else inject_into_stub
+
     patches = parse_patches(args.init)
     print(f'Parsed patches for {len(patches)} classes.')
 
-    count = inject_into_stub(args.stub, patches)
+    count = sum(inject(stub, patches) for stub in _stub_files(args.stub))
     print(f'Injected annotations into {count} classes in {args.stub}.')
 
 
@@ -0,0 +1,238 @@
+"""Build and seed prebuilt mypy cache archives for the qgis stubs.
+
+mypy caches the parsed and analysed stubs per project, so every fresh CI
+container spends the bulk of its first run on ``_core`` and ``_gui``. This
+script moves that work to release time:
+
+    build   Run mypy once over all stub modules for each requested Python
+            version and pack the resulting cache entries into one archive
+            per version (``qgis-stubs-<version>-mypy-<mypy>-py<X.Y>.tar.gz``).
+
+    seed    Copy the entries of such an archive into a project's mypy cache
+            directory, skipping entries the project already has.
+
+mypy only reuses cache entries written by the exact same mypy version and
+with the same cache-affecting options (strictness flags, platform, ...).
+``build`` therefore accepts extra mypy arguments after ``--``; use the same
+flags or config file as the project you want to seed. ``seed`` refuses
+archives built by a different mypy version unless ``--force`` is given.
+
+Source file paths recorded in the cache do not need to match: mypy falls back
+to comparing content hashes, which is far cheaper than parsing.
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import re
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+_PYTHON_VERSIONS = ('3.10', '3.11', '3.12', '3.13')
+_ENTRY_MODULE = '_qgis_stubs_cache_entry'
+# Runtime packages re-exporting the large stub modules
+_IMPORTS = ('qgis.core', 'qgis.gui', 'qgis.analysis', 'qgis.server', 'qgis._3d')
+_MANIFEST = 'manifest.json'
+
+
+def _metastore(mypy_args: list[str]):  # type: ignore[no-untyped-def]
+    """Return the metadata store mypy would use for the given arguments."""
+    from mypy import build, main
+
+    _, options = main.process_options([*mypy_args, '-c', 'pass'])
+    try:
+        return build.create_metastore(options, parallel_worker=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Older mypy versions
+        return build.create_metastore(options)  # type: ignore[call-arg]
+
+
+def build_archive(
+    stubs: pathlib.Path,
+    output: pathlib.Path,
+    python_version: str,
+    mypy_args: list[str],
+) -> pathlib.Path:
+    """Build the cache archive for one Python version and return its path."""
+    import mypy.version
+    from mypy.metastore import FilesystemMetadataStore
+
+    pyproject = (_ROOT / 'pyproject.toml').read_text('utf-8')
+    version = _VERSION_RE.search(pyproject).group(1)  # type: ignore
+    mypy_version = mypy.version.__version__
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = pathlib.Path(tmp)
+        # The stub package directory is not named after the module it
+        # provides, so expose it to mypy as ``qgis``.
+        search_path = scratch / 'search'
+        search_path.mkdir()
+        (search_path / 'qgis').symlink_to(stubs.resolve(), target_is_directory=True)
+        entry = scratch / f'{_ENTRY_MODULE}.py'
+        entry.write_text(''.join(f'import {m}\n' for m in _IMPORTS), 'utf-8')
+
+        args = [
+            '--cache-dir', str(scratch / 'cache'),
+            '--python-version', python_version,
+            *mypy_args,
+        ]
+        result = subprocess.run(
+            [sys.executable, '-m', 'mypy', *args, str(entry)],
+            env=dict(os.environ, MYPYPATH=str(search_path)),
+            capture_output=True,
+            text=True,
+        )
+        # Exit code 1 only means type errors were reported
+        if result.returncode not in (0, 1):
+            raise RuntimeError(f'mypy failed:\n{result.stdout}{result.stderr}')
+
+        source = _metastore(args)
+        packed = FilesystemMetadataStore(str(scratch / 'archive' / python_version))
+        count = 0
+        for name in sorted(source.list_all()):
+            if name.startswith(f'{_ENTRY_MODULE}.'):
+                continue
+            packed.write(name, source.read(name), source.getmtime(name))
+            count += 1
+        packed.commit()
+        manifest = {
+            'qgis_stubs': version,
+            'mypy': mypy_version,
+            'python_version': python_version,
+            'mypy_args': mypy_args,
+            'entries': count,
+        }
+        (scratch / 'archive' / _MANIFEST).write_text(
+            json.dumps(manifest, indent=2) + '\n', 'utf-8')
+
+        output.mkdir(parents=True, exist_ok=True)
+        archive = output / f'qgis-stubs-{version}-mypy-{mypy_version}-py{python_version}.tar.gz'
+        with tarfile.open(archive, 'w:gz') as tar:
+            for path in sorted((scratch / 'archive').iterdir()):
+                tar.add(path, arcname=path.name)
+    return archive
+
+
+def seed_cache(
+    archive: pathlib.Path,
+    cache_dir: pathlib.Path,
+    mypy_args: list[str],
+    force: bool = False,
+    overwrite: bool = False,
+) -> int:
+    """Copy the entries of an archive into a mypy cache directory.
+
+    Returns the number of entries written.
+    """
+    import mypy.version
+    from mypy.metastore import FilesystemMetadataStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = pathlib.Path(tmp)
+        with tarfile.open(archive, 'r:gz') as tar:
+            tar.extractall(scratch, filter='data')
+        manifest = json.loads((scratch / _MANIFEST).read_text('utf-8'))
+
+        if manifest['mypy'] != mypy.version.__version__ and not force:
+            raise ValueError(
+                f'{archive.name} was built with mypy {manifest["mypy"]}, but '
+                f'mypy {mypy.version.__version__} is installed; mypy would '
+                'discard the seeded cache')
+
+        python_version = manifest['python_version']
+        packed = FilesystemMetadataStore(str(scratch / python_version))
+        target = _metastore([
+            *mypy_args,
+            '--cache-dir', str(cache_dir),
+            '--python-version', python_version,
+        ])
+        existing = set(target.list_all())
+        count = 0
+        for name in sorted(packed.list_all()):
+            if name in existing and not overwrite:
+                continue
+            target.write(name, packed.read(name), packed.getmtime(name))
+            count += 1
+        target.commit()
+        target.close()
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Build cache archives')
+    build.add_argument(
+        '--stubs',
+        type=pathlib.Path,
+        default=_ROOT / 'qgis-stubs',
+        help='Stub package directory (default: qgis-stubs)',
+    )
+    build.add_argument(
+        '--python-version',
+        nargs='+',
+        default=list(_PYTHON_VERSIONS),
+        help=f'Python versions to build for (default: {" ".join(_PYTHON_VERSIONS)})',
+    )
+    build.add_argument(
+        '-o', '--output',
+        type=pathlib.Path,
+        default=pathlib.Path('dist'),
+        help='Output directory for the archives (default: dist)',
+    )
+
+    seed = subparsers.add_parser('seed', help="Seed a project's mypy cache")
+    seed.add_argument(
+        'archive',
+        type=pathlib.Path,
+        nargs='+',
+        help='Cache archive(s) created by the build command',
+    )
+    seed.add_argument(
+        '--cache-dir',
+        type=pathlib.Path,
+        default=pathlib.Path('.mypy_cache'),
+        help='mypy cache directory to seed (default: .mypy_cache)',
+    )
+    seed.add_argument(
+        '--force',
+        action='store_true',
+        help='Seed even if the archive was built by a different mypy version',
+    )
+    seed.add_argument(
+        '--overwrite',
+        action='store_true',
+        help='Replace entries that already exist in the cache',
+    )
+
+    # Everything after "--" is passed on to mypy
+    argv = sys.argv[1:]
+    mypy_args: list[str] = []
+    if '--' in argv:
+        index = argv.index('--')
+        argv, mypy_args = argv[:index], argv[index + 1:]
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        for python_version in args.python_version:
+            archive = build_archive(args.stubs, args.output, python_version, mypy_args)
+            print(f'Wrote {archive}.')
+    else:
+        for archive in args.archive:
+            try:
+                count = seed_cache(
+                    archive, args.cache_dir, mypy_args, args.force, args.overwrite)
+            except ValueError as ex:
+                parser.exit(1, f'error: {ex}\n')
+            print(f'Seeded {count} entries from {archive} into {args.cache_dir}.')
+
+
+if __name__ == '__main__':
+    main()
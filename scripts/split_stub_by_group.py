@@ -0,0 +1,286 @@
+"""Split a monolithic SIP-generated .pyi stub into per-group shard modules.
+
+The runtime ``__init__.py`` generated by sipify tags most classes with their
+source group, e.g.::
+
+    QgsGeometry.__group__ = ['geometry']
+    QgsProcessingModelAlgorithm.__group__ = ['processing', 'models']
+
+This script uses the first entry of each class's ``__group__`` list to move
+its definition from ``_core.pyi`` into ``_core/<group>.pyi``.
+
+A class without a group goes into the shard of its first grouped base class
+or, failing that, of the first grouped class referencing it or referenced by
+it, so that it is only loaded together with the classes it is used with. Classes that reference no
+grouped class (e.g. ``Qgis``), module-level type aliases, constants and free
+functions go into ``_core/_ungrouped.pyi``, which then only imports the few
+group classes used by the aliases and functions.
+
+Every shard receives a copy of the stub header imports plus explicit imports
+for the names it references from sibling shards. Such imports are not
+re-exported. ``_core/__init__.pyi`` re-exports the public names of every shard
+by name rather than by star imports. pyright then only binds the shards of
+the names that are actually used, although it still parses every shard to
+resolve the imports. mypy always processes the whole import graph.
+
+Group names that are not valid identifiers (e.g. ``3d``) are prefixed with an
+underscore, mirroring the ``qgis._3d`` runtime module.
+"""
+
+import argparse
+import ast
+import pathlib
+import re
+from collections import defaultdict
+
+# Matches ClassName.__group__ = ['group', ...] inside the generated try blocks
+_GROUP_RE = re.compile(r'^\s*([A-Za-z_]\w*)\.__group__\s*=\s*(\[.*\])\s*$')
+_IDENTIFIER_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+_UNGROUPED = '_ungrouped'
+_IMPORT_LINE_WIDTH = 79
+
+
+def parse_groups(init_path: pathlib.Path) -> dict[str, str]:
+    """Parse ``__group__`` assignments from a runtime module.
+
+    Returns ``{ClassName: shard_name}`` using the first listed group of each
+    class. Only top-level classes are considered.
+    """
+    groups: dict[str, str] = {}
+    for line in init_path.read_text('utf-8').splitlines():
+        m = _GROUP_RE.match(line)
+        if not m:
+            continue
+        class_name, value = m.groups()
+        group_list = ast.literal_eval(value)
+        if not group_list or class_name in groups:
+            continue
+        groups[class_name] = shard_name(group_list[0])
+    return groups
+
+
+def shard_name(group: str) -> str:
+    """Return a valid module name for the given group."""
+    name = re.sub(r'\W', '_', group)
+    if not name.isidentifier():
+        name = f'_{name}'
+    return name
+
+
+def _node_names(node: ast.stmt) -> list[str]:
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        return [t.id for t in node.targets if isinstance(t, ast.Name)]
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return []
+
+
+def _node_start(node: ast.stmt) -> int:
+    decorators = getattr(node, 'decorator_list', [])
+    return min([node.lineno] + [d.lineno for d in decorators])
+
+
+def _format_import(module: str, names: list[str]) -> str:
+    line = f'from .{module} import {", ".join(names)}'
+    if len(line) <= _IMPORT_LINE_WIDTH:
+        return line + '\n'
+    out = [f'from .{module} import (\n']
+    current = '   '
+    for name in names:
+        if len(current) + len(name) + 2 > _IMPORT_LINE_WIDTH:
+            out.append(current.rstrip() + '\n')
+            current = '   '
+        current += f' {name},'
+    out.append(current.rstrip() + '\n')
+    out.append(')\n')
+    return ''.join(out)
+
+
+def _base_names(node: ast.ClassDef) -> list[str]:
+    return [base.id for base in node.bases if isinstance(base, ast.Name)]
+
+
+def assign_ungrouped_classes(
+    nodes: list[ast.stmt],
+    lines: list[str],
+    groups: dict[str, str],
+) -> dict[str, str]:
+    """Return ``groups`` extended with a shard for the ungrouped classes.
+
+    An ungrouped class which references grouped classes is assigned to the
+    shard of its first grouped base class, or else to the shard of the first
+    grouped class (in source order) referencing it, or else to the shard of
+    the first grouped class it references. This is repeated until no more
+    classes can be assigned, as assigning a class may give a shard to the
+    classes depending on it.
+    """
+    classes = [node for node in nodes if isinstance(node, ast.ClassDef)]
+    references = {
+        node.name: set(_IDENTIFIER_RE.findall(''.join(lines[_node_start(node) - 1:node.end_lineno])))
+        - {node.name}
+        for node in classes
+    }
+    assigned = dict(groups)
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            if node.name in assigned:
+                continue
+            if not any(name in assigned for name in references[node.name]):
+                # A leaf class, e.g. Qgis, imports nothing from the shards
+                continue
+            shard = next((assigned[base] for base in _base_names(node) if base in assigned), None)
+            if shard is None:
+                shard = next(
+                    (assigned[other.name] for other in classes
+                     if other.name in assigned and node.name in references[other.name]),
+                    None,
+                )
+            if shard is None and not changed:
+                # Only once nothing else can be assigned, as the classes this
+                # class references may still be assigned a shard
+                shard = next(
+                    (assigned[name] for name in _IDENTIFIER_RE.findall(
+                        ''.join(lines[_node_start(node) - 1:node.end_lineno]))
+                     if name != node.name and name in assigned),
+                    None,
+                )
+            if shard is not None:
+                assigned[node.name] = shard
+                changed = True
+    return assigned
+
+
+def split_stub(
+    stub_path: pathlib.Path,
+    groups: dict[str, str],
+) -> dict[str, str]:
+    """Split a stub into shards.
+
+    Returns ``{shard_name: source}`` including the ``__init__`` module.
+    """
+    source = stub_path.read_text('utf-8')
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+
+    # Imports (including the ``try: from warnings import deprecated`` guard
+    # and late ones like ``import datetime``) are copied into every shard.
+    header: list[str] = []
+    body_nodes: list[ast.stmt] = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom, ast.Try)):
+            header.extend(lines[_node_start(node) - 1:node.end_lineno])
+        else:
+            body_nodes.append(node)
+
+    groups = assign_ungrouped_classes(body_nodes, lines, groups)
+    owner: dict[str, str] = {}
+    chunks: dict[str, list[str]] = defaultdict(list)
+    previous_end = 0
+    for node in body_nodes:
+        names = _node_names(node)
+        shard = _UNGROUPED
+        for name in names:
+            if name in owner:
+                # Overloaded free functions must stay together
+                shard = owner[name]
+                break
+            shard = groups.get(name, _UNGROUPED)
+
+        start = _node_start(node)
+        gap = min(2, max(0, start - previous_end - 1))
+        previous_end = node.end_lineno  # type: ignore
+        text = ''.join(lines[start - 1:node.end_lineno])
+        if chunks[shard]:
+            text = '\n' * gap + text
+        chunks[shard].append(text)
+        for name in names:
+            owner[name] = shard
+
+    stub_title = stub_path.stem
+    shards: dict[str, str] = {}
+    for shard, shard_chunks in sorted(chunks.items()):
+        content = ''.join(shard_chunks)
+        referenced = set(_IDENTIFIER_RE.findall(content))
+        imports: dict[str, list[str]] = defaultdict(list)
+        for name in sorted(referenced):
+            other = owner.get(name)
+            if other is not None and other != shard:
+                imports[other].append(name)
+
+        out = [
+            f'# The PEP 484 type hints stub file for the {stub_title}.{shard} '
+            'module.\n',
+            '#\n',
+            f'# Split from {stub_path.name} by scripts/{pathlib.Path(__file__).name}.\n',
+            '\n\n',
+        ]
+        out.extend(header)
+        if imports:
+            out.append('\n')
+            for other in sorted(imports):
+                out.append(_format_import(other, imports[other]))
+        out.append('\n\n')
+        out.append(content)
+        shards[shard] = ''.join(out)
+
+    init = [
+        f'# The PEP 484 type hints stub file for the {stub_title} module.\n',
+        '#\n',
+        f'# Re-exports the group shards split from {stub_path.name} by '
+        f'scripts/{pathlib.Path(__file__).name}.\n',
+        '\n',
+    ]
+    exported: dict[str, list[str]] = defaultdict(list)
+    for name, shard in owner.items():
+        if not name.startswith('_'):
+            exported[shard].append(name)
+    for shard in sorted(exported):
+        init.append(_format_import(shard, [f'{name} as {name}' for name in sorted(exported[shard])]))
+    shards['__init__'] = ''.join(init)
+    return shards
+
+
+def write_shards(output: pathlib.Path, shards: dict[str, str]) -> None:
+    """Write shard sources into a package directory, replacing old shards."""
+    output.mkdir(parents=True, exist_ok=True)
+    for existing in output.glob('*.pyi'):
+        existing.unlink()
+    for name, text in shards.items():
+        (output / f'{name}.pyi').write_text(text, encoding='utf-8')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'init',
+        type=pathlib.Path,
+        help='Runtime module with __group__ assignments (e.g. qgis/core/__init__.py)',
+    )
+    parser.add_argument(
+        'stub',
+        type=pathlib.Path,
+        help='.pyi stub file to split (e.g. qgis/_core.pyi); removed afterwards',
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=pathlib.Path,
+        help='Output package directory (default: stub path without suffix)',
+    )
+    args = parser.parse_args()
+
+    groups = parse_groups(args.init)
+    print(f'Parsed groups for {len(groups)} classes.')
+
+    shards = split_stub(args.stub, groups)
+    output = args.output or args.stub.with_suffix('')
+    write_shards(output, shards)
+    args.stub.unlink()
+    print(f'Split {args.stub} into {len(shards) - 1} shards in {output}.')
+
+
+if __name__ == '__main__':
+    main()
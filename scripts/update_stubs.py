@@ -0,0 +1,288 @@
+"""Merge a freshly extracted QGIS Python tree into qgis-stubs incrementally.
+
+Instead of replacing ``qgis-stubs/`` wholesale, every ``.pyi`` and ``.py``
+file is split into units, and a unit is only overwritten if its generated
+content changed since the previous extraction:
+
+    .pyi    one unit per top-level class or function (overloads share one)
+    .py     one unit per top-level ``try:`` block, class or function
+
+Any statements and comments between two units belong to the following unit.
+The text before the first unit and after the last one form a header and a
+tail unit. Other files form a single unit.
+
+The hashes of the generated units are persisted in a manifest. For each unit
+of the new tree:
+
+    hash unchanged      the current text is kept, preserving hand edits
+    hash changed/new    the generated text replaces the current one
+
+Units only present in the current tree are dropped if they were generated
+before (i.e. removed upstream) and kept otherwise (i.e. added by hand).
+
+Files whose generated content did not change at all are skipped without
+being parsed. Without a manifest every unit counts as changed. Use
+``--write-manifest`` to create one from an existing tree.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import pathlib
+import shutil
+from collections import Counter
+from dataclasses import dataclass
+
+_MANIFEST_VERSION = 1
+_HEADER = '<header>'
+_TAIL = '<tail>'
+_FILE = '<file>'
+
+
+@dataclass
+class Unit:
+    """A named slice of a source file."""
+
+    key: str
+    text: str
+
+    @property
+    def digest(self) -> str:
+        return _digest(self.text)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _try_name(node: ast.Try) -> str:
+    """Return the class patched by a generated ``try:`` block."""
+    for stmt in node.body:
+        targets = getattr(stmt, 'targets', None) or [getattr(stmt, 'target', None)]
+        for target in targets:
+            while isinstance(target, (ast.Attribute, ast.Subscript)):
+                target = target.value
+            if isinstance(target, ast.Name):
+                return target.id
+    return ''
+
+
+def _unit_name(node: ast.stmt, is_stub: bool) -> str | None:
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+        return node.name
+    if isinstance(node, ast.Try) and not is_stub:
+        return f'try:{_try_name(node)}'
+    return None
+
+
+def split_units(path: pathlib.Path, text: str) -> list[Unit]:
+    """Split a file into units in source order."""
+    if path.suffix not in ('.py', '.pyi'):
+        return [Unit(_FILE, text)]
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return [Unit(_FILE, text)]
+
+    lines = text.splitlines(keepends=True)
+    is_stub = path.suffix == '.pyi'
+    units: list[Unit] = []
+    seen: Counter[str] = Counter()
+    start = None
+    previous_end = 0
+    previous_name = None
+    for node in tree.body:
+        name = _unit_name(node, is_stub)
+        if name is None:
+            continue
+        if start is None:
+            decorators = getattr(node, 'decorator_list', [])
+            start = min([node.lineno] + [d.lineno for d in decorators]) - 1
+            units.append(Unit(_HEADER, ''.join(lines[:start])))
+            previous_end = start
+        end = node.end_lineno or node.lineno
+        if is_stub and name == previous_name:
+            # Overloads of a module-level function form a single unit
+            units[-1].text += ''.join(lines[previous_end:end])
+        else:
+            key = f'{name}#{seen[name]}' if seen[name] else name
+            seen[name] += 1
+            units.append(Unit(key, ''.join(lines[previous_end:end])))
+        previous_end = end
+        previous_name = name
+
+    if start is None:
+        return [Unit(_FILE, text)]
+    units.append(Unit(_TAIL, ''.join(lines[previous_end:])))
+    return units
+
+
+def _files(root: pathlib.Path) -> dict[str, pathlib.Path]:
+    return {
+        p.relative_to(root).as_posix(): p
+        for p in sorted(root.rglob('*'))
+        if p.is_file() and '__pycache__' not in p.parts
+    }
+
+
+def _file_entry(path: pathlib.Path, text: str, units: list[Unit] | None = None) -> dict:
+    if units is None:
+        units = split_units(path, text)
+    return {'digest': _digest(text), 'units': {u.key: u.digest for u in units}}
+
+
+def build_manifest(root: pathlib.Path) -> dict[str, dict]:
+    """Return ``{relative_path: {'digest': ..., 'units': {key: digest}}}``."""
+    return {
+        name: _file_entry(path, path.read_text('utf-8'))
+        for name, path in _files(root).items()
+    }
+
+
+def merge_units(
+    new: list[Unit],
+    current: list[Unit],
+    previous: dict[str, str],
+    counts: Counter[str],
+) -> str:
+    """Merge the units of one file and return the resulting text."""
+    current_by_key = {u.key: u for u in current}
+    new_keys = {u.key for u in new}
+
+    # Hand-added units are emitted after the unit they followed before.
+    followers: dict[str | None, list[Unit]] = {}
+    anchor: str | None = None
+    for unit in current:
+        if unit.key not in new_keys:
+            if unit.key in previous:
+                counts['removed'] += 1
+            else:
+                counts['preserved'] += 1
+                followers.setdefault(anchor, []).append(unit)
+                continue
+        anchor = unit.key
+
+    out = [u.text for u in followers.get(None, [])]
+    for unit in new:
+        existing = current_by_key.get(unit.key)
+        if unit.key in previous and previous[unit.key] == unit.digest:
+            if existing is not None:
+                counts['unchanged'] += 1
+                out.append(existing.text)
+            else:
+                # Deleted by hand and unchanged upstream: keep it deleted
+                counts['preserved'] += 1
+        else:
+            counts['updated' if existing is not None else 'added'] += 1
+            out.append(unit.text)
+        out.extend(u.text for u in followers.get(unit.key, []))
+    return ''.join(out)
+
+
+def update_tree(
+    new_root: pathlib.Path,
+    current_root: pathlib.Path,
+    manifest: dict[str, dict],
+) -> tuple[Counter[str], dict[str, dict]]:
+    """Merge ``new_root`` into ``current_root`` in place.
+
+    Returns the counts of each kind of change and the manifest of the new
+    tree.
+    """
+    counts: Counter[str] = Counter()
+    new_manifest: dict[str, dict] = {}
+    new_files = _files(new_root)
+    current_files = _files(current_root)
+
+    for name, path in current_files.items():
+        if name not in new_files and name in manifest:
+            path.unlink()
+            counts['files removed'] += 1
+
+    for name, path in new_files.items():
+        target = current_root / name
+        new_text = path.read_text('utf-8')
+        previous = manifest.get(name)
+        if previous is not None and previous['digest'] == _digest(new_text):
+            new_manifest[name] = previous
+            counts['files unchanged'] += 1
+            continue
+        new_units = split_units(path, new_text)
+        new_manifest[name] = _file_entry(path, new_text, new_units)
+        if name not in current_files:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, target)
+            counts['files added'] += 1
+            continue
+        current_text = target.read_text('utf-8')
+        merged = merge_units(
+            new_units,
+            split_units(target, current_text),
+            previous['units'] if previous is not None else {},
+            counts,
+        )
+        if merged != current_text:
+            target.write_text(merged, encoding='utf-8')
+            counts['files updated'] += 1
+    return counts, new_manifest
+
+
+def _read_manifest(path: pathlib.Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text('utf-8'))
+    if data.get('version') != _MANIFEST_VERSION:
+        return {}
+    return data['files']
+
+
+def _write_manifest(path: pathlib.Path, files: dict[str, dict]) -> None:
+    data = {'version': _MANIFEST_VERSION, 'files': files}
+    path.write_text(json.dumps(data, indent=1, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'new',
+        type=pathlib.Path,
+        nargs='?',
+        help='Freshly extracted (and post-processed) tree (e.g. qgis/)',
+    )
+    parser.add_argument(
+        'current',
+        type=pathlib.Path,
+        help='Tree to update in place (e.g. qgis-stubs/)',
+    )
+    parser.add_argument(
+        '--manifest',
+        type=pathlib.Path,
+        default=pathlib.Path('stubs-manifest.json'),
+        help='Unit hash manifest (default: stubs-manifest.json)',
+    )
+    parser.add_argument(
+        '--write-manifest',
+        action='store_true',
+        help='Only write a manifest for the current tree',
+    )
+    args = parser.parse_args()
+
+    if args.write_manifest:
+        _write_manifest(args.manifest, build_manifest(args.current))
+        print(f'Wrote {args.manifest} for {args.current}.')
+        return
+    if args.new is None:
+        parser.error('the new tree is required unless --write-manifest is given')
+
+    manifest = _read_manifest(args.manifest)
+    if not manifest:
+        print(f'No usable manifest at {args.manifest}; treating all units as changed.')
+    counts, new_manifest = update_tree(args.new, args.current, manifest)
+    _write_manifest(args.manifest, new_manifest)
+    print(', '.join(f'{v} {k}' for k, v in sorted(counts.items())) or 'No changes.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+# The scripts are not a package, import them as top-level modules
+sys.path.insert(0, str(ROOT / 'scripts'))
@@ -0,0 +1,101 @@
+import pytest
+
+from conftest import ROOT
+from extract_docstrings import extract_docs
+
+_SOURCE = '''\
+QgsPalLayerSettings.OverPoint = Qgis.LabelPlacement.OverPoint
+QgsPalLayerSettings.OverPoint.__doc__ = "Placement"
+QgsPalLayerSettings.Line = Qgis.LabelPlacement.Line
+QgsPalLayerSettings.Line.__doc__ = "Line"
+QgsPalLayerSettings.Line.__doc__ = "Line again"
+try:
+    QgsPalLayerSettings.OverPoint = Qgis.LabelPredefinedPointPosition.OverPoint
+    QgsPalLayerSettings.OverPoint.__doc__ = "Position"
+except AttributeError:
+    pass
+try:
+    QgsPalLayerSettings.__doc__ = "Settings"
+except AttributeError:
+    pass
+'''
+
+
+def test_rebound_targets_are_kept_in_module():
+    source, docs = extract_docs(_SOURCE)
+    assert docs == [
+        ('QgsPalLayerSettings.Line', 'Line again'),
+        ('QgsPalLayerSettings.OverPoint', 'Position'),
+        ('QgsPalLayerSettings', 'Settings'),
+    ]
+    assert source == '''\
+QgsPalLayerSettings.OverPoint = Qgis.LabelPlacement.OverPoint
+QgsPalLayerSettings.OverPoint.__doc__ = "Placement"
+QgsPalLayerSettings.Line = Qgis.LabelPlacement.Line
+try:
+    QgsPalLayerSettings.OverPoint = Qgis.LabelPredefinedPointPosition.OverPoint
+except AttributeError:
+    pass
+'''
+
+
+def _doc_table(module: str) -> list[tuple[str, str]]:
+    namespace: dict[str, tuple[tuple[str, str], ...]] = {}
+    exec((ROOT / 'qgis-stubs' / module / '_docs.py').read_text('utf-8'), namespace)
+    return list(namespace['DOCS'])
+
+
+@pytest.mark.parametrize('module', ['core', 'gui', 'analysis'])
+def test_doc_tables_have_one_entry_per_target(module):
+    targets = [target for target, _ in _doc_table(module)]
+    assert len(targets) == len(set(targets))
+
+
+@pytest.mark.parametrize(
+    ('alias', 'first', 'last'),
+    [
+        (
+            'QgsPalLayerSettings.OverPoint',
+            'Arranges candidates over a point (or centroid of a polygon), or at a preset '
+            'offset from the point. Applies to point or polygon layers only.',
+            'Label directly centered over point \n.. versionadded:: 3.38',
+        ),
+        ('QgsRasterMinMaxOrigin.None_', 'User defined', 'Whole raster is used to compute statistics'),
+    ],
+)
+def test_reassigned_aliases_keep_both_docstrings(alias, first, last):
+    # The first docstring documents the member the alias was bound to before
+    # being rebound, so it must stay in the module
+    assert dict(_doc_table('core'))[alias] == last
+    source = (ROOT / 'qgis-stubs' / 'core' / '__init__.py').read_text('utf-8')
+    _, docs = extract_docs(source)
+    assert alias not in dict(docs)
+    assert f'{alias}.__doc__ = "{first}"' in source
+
+
+def test_comment_is_removed_with_the_docstrings_it_introduces():
+    source, _ = extract_docs('''\
+QgsDateRange.__repr__ = _date_range_repr
+
+# add docstrings for QgsDateRange
+
+QgsDateRange.__doc__ = "Range"
+
+
+QgsProperty.__bool__ = _property_bool
+# monkey patching scoped based enum
+# --
+Qgis.Unit.__doc__ = "Unit"
+# --
+Qgis.Unit.baseClass = Qgis
+''')
+    assert source == '''\
+QgsDateRange.__repr__ = _date_range_repr
+
+
+QgsProperty.__bool__ = _property_bool
+# monkey patching scoped based enum
+# --
+# --
+Qgis.Unit.baseClass = Qgis
+'''
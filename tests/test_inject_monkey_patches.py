@@ -0,0 +1,123 @@
+import pathlib
+import shutil
+
+import pytest
+
+from conftest import ROOT
+from inject_monkey_patches import (
+    _stub_files,
+    inject_into_stub,
+    inject_into_stub_streaming,
+    parse_patches,
+    read_batch_manifest,
+)
+
+_STUBS = ROOT / 'qgis-stubs'
+_PAIRS = read_batch_manifest(ROOT / 'scripts' / 'monkey_patch_modules.txt', _STUBS)
+
+
+def _inject_both(
+    tmp_path: pathlib.Path,
+    source: pathlib.Path,
+    patches: dict[str, list[tuple[str, str]]],
+) -> tuple[bytes, bytes, int, int]:
+    ast_path = tmp_path / 'ast' / source.name
+    streaming_path = tmp_path / 'streaming' / source.name
+    for path in (ast_path, streaming_path):
+        path.parent.mkdir(exist_ok=True)
+        shutil.copyfile(source, path)
+    ast_count = inject_into_stub(ast_path, patches)
+    streaming_count = inject_into_stub_streaming(streaming_path, patches)
+    return ast_path.read_bytes(), streaming_path.read_bytes(), ast_count, streaming_count
+
+
+@pytest.mark.parametrize(
+    ('init', 'stub'), _PAIRS, ids=[stub.name for _, stub in _PAIRS])
+def test_streaming_matches_ast_on_stubs(tmp_path, init, stub):
+    patches = parse_patches(init)
+    for path in _stub_files(stub):
+        ast_output, streaming_output, ast_count, streaming_count = _inject_both(
+            tmp_path, path, patches)
+        assert streaming_output == ast_output, path
+        assert streaming_count == ast_count, path
+
+
+_EDGE_CASES = {
+    'nested_classes': '''\
+class Outer:
+    class Inner:
+        class Deepest:
+            x: int
+        y: int
+    def method(self) -> None: ...
+class After: ...
+''',
+    'decorators': '''\
+import typing
+
+@typing.final
+class Decorated:
+    @typing.overload
+    def f(self, a: int) -> None: ...
+    @typing.overload
+    def f(self, a: str) -> None: ...
+
+@typing.final
+class Next:
+    pass
+''',
+    'class_at_eof_without_newline': '''\
+class Last:
+    x: int''',
+    'class_at_eof_with_trailing_blank_lines': '''\
+class Last:
+    x: int
+
+
+''',
+    'trivia_at_class_boundary': '''\
+class First:
+    x: int
+
+    # A comment indented like the body
+
+# A comment at column zero
+
+class Second:
+    y: int
+    # Trailing comment
+''',
+    'multi_line_statements': '''\
+class Strings:
+    """Docstring
+
+class NotAClass:
+"""
+    def f(self, a: int = (
+1)) -> None: ...
+    s: str = 'class Quoted:'  # ) ]
+class Next: ...
+''',
+    'one_line_class': '''\
+class Ellipsis_: ...
+class Pass: pass
+''',
+}
+
+
+@pytest.mark.parametrize('source', _EDGE_CASES.values(), ids=_EDGE_CASES.keys())
+def test_streaming_matches_ast_on_edge_cases(tmp_path, source):
+    patches = {
+        name: [('patched', 'typing.Type[Qgis.GeometryType]'), ('member', 'Qgis.LayerType')]
+        for name in (
+            'Outer', 'Inner', 'After', 'Decorated', 'Next', 'Last', 'First', 'Second',
+            'Strings', 'NotAClass', 'Ellipsis_', 'Pass',
+        )
+    }
+    path = tmp_path / 'stub.pyi'
+    path.write_text(source, encoding='utf-8', newline='')
+    ast_output, streaming_output, ast_count, streaming_count = _inject_both(
+        tmp_path, path, patches)
+    assert ast_count > 0
+    assert streaming_output == ast_output
+    assert streaming_count == ast_count
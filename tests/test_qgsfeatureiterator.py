@@ -0,0 +1,98 @@
+import importlib
+import importlib.util
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip('numpy')
+pytest.importorskip('PyQt5.QtCore')
+pytest.importorskip('qgis._core')
+
+from PyQt5.QtCore import QVariant  # noqa: E402
+from qgis._core import QgsCoordinateReferenceSystem, QgsFeatureRequest, QgsField, QgsFields, QgsGeometry  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def additions():
+    # The modules of this repository rather than the ones of the installed QGIS
+    path = ROOT / 'qgis-stubs' / 'core' / 'additions'
+    spec = importlib.util.spec_from_file_location(
+        '_additions_under_test', path / '__init__.py', submodule_search_locations=[str(path)]
+    )
+    sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+    yield spec.name
+    for name in list(sys.modules):
+        if name == spec.name or name.startswith(f'{spec.name}.'):
+            del sys.modules[name]
+
+
+class _Iterator:
+    """Fills the feature with each row in turn, like QgsFeatureIterator.nextFeature."""
+
+    def __init__(self, fields, rows):
+        self.fields = fields
+        self.rows = list(rows)
+
+    def nextFeature(self, feature):
+        if not self.rows:
+            return False
+        fid, attributes, wkt = self.rows.pop(0)
+        feature.setFields(self.fields, True)
+        feature.setId(fid)
+        feature.setAttributes(attributes)
+        feature.setGeometry(QgsGeometry.fromWkt(wkt))
+        return True
+
+
+class _Layer:
+    def __init__(self, fields, rows):
+        self._fields = fields
+        self.rows = rows
+
+    def fields(self):
+        return self._fields
+
+    def crs(self):
+        return QgsCoordinateReferenceSystem()
+
+    def getFeatures(self, request):
+        return _Iterator(self._fields, self.rows)
+
+
+def _fields(*names):
+    fields = QgsFields()
+    for name in names:
+        fields.append(QgsField(name, QVariant.String))
+    return fields
+
+
+_ROWS = [(1, ['a'], 'Point (1 2)'), (2, ['b'], 'Point (3 4)')]
+
+
+@pytest.mark.parametrize(('field', 'fid_column'), [('geometry', 'fid'), ('name', 'geometry')])
+def test_to_columns_geometry_column_does_not_replace_other_columns(additions, field, fid_column):
+    module = importlib.import_module(f'{additions}.qgsfeatureiterator')
+    with pytest.raises(ValueError, match="'geometry' is already used"):
+        next(module._feature_iterator_to_columns(_Iterator(_fields(field), _ROWS), fid_column=fid_column))
+
+    batch = next(
+        module._feature_iterator_to_columns(_Iterator(_fields(field), _ROWS), fid_column=fid_column, geometry_column='wkb')
+    )
+    assert list(batch) == [fid_column, field, 'wkb']
+    assert list(batch[field]) == ['a', 'b']
+    assert list(batch['wkb']) == [QgsGeometry.fromWkt(wkt).asWkb().data() for _, _, wkt in _ROWS]
+
+
+def test_record_batches_geometry_column_does_not_replace_a_field(additions):
+    pytest.importorskip('pyarrow')
+    module = importlib.import_module(f'{additions}.arrowinterop')
+    layer = _Layer(_fields('geometry'), _ROWS)
+    with pytest.raises(ValueError, match="'geometry' is already used"):
+        next(module._layer_as_record_batches(layer))
+
+    batch = next(module._layer_as_record_batches(layer, geometry_column='wkb'))
+    assert batch.schema.names == ['fid', 'geometry', 'wkb']
+    assert batch.column('geometry').to_pylist() == ['a', 'b']
+    assert batch.schema.field('wkb').metadata == {b'ARROW:extension:name': b'geoarrow.wkb'}
@@ -0,0 +1,140 @@
+import concurrent.futures
+import importlib.util
+import threading
+
+import pytest
+
+from conftest import ROOT
+
+pytest.importorskip('PyQt5.QtCore')
+pytest.importorskip('qgis._core')
+
+
+@pytest.fixture(scope='module')
+def qgsfunction():
+    # The module of this repository rather than the one of the installed QGIS
+    path = ROOT / 'qgis-stubs' / 'core' / 'additions' / 'qgsfunction.py'
+    spec = importlib.util.spec_from_file_location('_qgsfunction_under_test', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Parent:
+    """Records the evaluation error of a call, like QgsExpression."""
+
+    def __init__(self):
+        self.error = None
+
+    def setEvalErrorString(self, error):
+        self.error = error
+
+
+def _evaluate(function, *values):
+    parent = _Parent()
+    return function.func(list(values), None, parent, None), parent.error
+
+
+def test_cache_keys_values_by_type(qgsfunction):
+    calls = []
+
+    def identity(value):
+        calls.append(value)
+        return value
+
+    function = qgsfunction.register_function(identity, cache=True, register=False)
+    assert _evaluate(function, 1) == (1, None)
+    assert _evaluate(function, True) == (True, None)
+    assert _evaluate(function, 1.0) == (1.0, None)
+    assert _evaluate(function, True) == (True, None)
+    assert calls == [1, True, 1.0]
+    assert type(_evaluate(function, 1)[0]) is int
+    assert function.cache.info() == {'hits': 2, 'misses': 3, 'size': 3, 'maxsize': 1024}
+
+
+def _divide(value):
+    return 1 / value
+
+
+def test_no_error_limit_by_default(qgsfunction):
+    function = qgsfunction.register_function(_divide, register=False)
+    for _ in range(2000):
+        assert _evaluate(function, 0)[0] is None
+    assert _evaluate(function, 2) == (0.5, None)
+    assert sum(function.error_counts().values()) == 2000
+
+
+def test_error_limit_counts_consecutive_failures(qgsfunction):
+    function = qgsfunction.register_function(_divide, error_limit=3, register=False)
+    for value in (0, 0, 1, 0, 0, 1):
+        assert _evaluate(function, value)[0] == (1 if value else None)
+    for _ in range(3):
+        _evaluate(function, 0)
+    result, error = _evaluate(function, 1)
+    assert result is None
+    assert 'failed 3 times in a row' in error
+    function.reset_errors()
+    assert _evaluate(function, 1) == (1, None)
+
+
+def _square(value):
+    return value * value
+
+
+class _BrokenExecutor(concurrent.futures.Executor):
+
+    def submit(self, fn, /, *args, **kwargs):
+        raise RuntimeError('the executor is broken')
+
+
+class _LossyExecutor(concurrent.futures.Executor):
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = concurrent.futures.Future()
+        future.set_result([])
+        return future
+
+
+@pytest.mark.parametrize(
+    ('executor', 'message'),
+    [(_BrokenExecutor(), 'the executor is broken'), (_LossyExecutor(), 'missing result')],
+)
+def test_parallel_callers_get_executor_failures(qgsfunction, executor, message):
+    function = qgsfunction.register_function(_square, parallel=4, register=False)
+    qgsfunction.set_parallel_executor(executor, max_workers=1)
+    errors = []
+
+    def call(value):
+        try:
+            function._batcher.call([value])
+        except qgsfunction.ParallelFunctionError as ex:
+            errors.append(ex)
+
+    try:
+        threads = [threading.Thread(target=call, args=(value,)) for value in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not any(thread.is_alive() for thread in threads)
+    finally:
+        qgsfunction.set_parallel_executor(None)
+    assert len(errors) == 16
+    assert all(message in str(error) for error in errors)
+
+
+def test_vectorized_functions_only_replace_null_variants(qgsfunction):
+    pytest.importorskip('numpy')
+    from PyQt5.QtCore import QVariant
+
+    received = []
+
+    def first(value):
+        received.append(value)
+        return 1
+
+    function = qgsfunction.register_function(first, vectorized=True, register=False)
+    value = QVariant(2)
+    assert _evaluate(function, QVariant()) == (1, None)
+    assert _evaluate(function, value) == (1, None)
+    assert received == [None, value]